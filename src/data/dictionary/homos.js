@@ -0,0 +1 @@
+export default [{"word":"homosexual","pos":"adj","definitions":["homosexual"],"pronunciation":"/ˌho.mo.sek.suˈal/","examples":[{"ro":"În lumea animală se observă comportamentul homosexual relativ frecvent la mamifere și la păsări","en":"In the animal world, homosexual behaviour is observed relatively frequent in mammals and birds."}],"forms":{"feminine-singular":"homosexuală","masculine-plural":"homosexuali","feminine-neuter-plural":"homosexuale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"homosexual","error-unrecognized-form-feminine-indefinite-singular":"homosexuală","error-unrecognized-form-indefinite-masculine-plural":"homosexuali","error-unrecognized-form-feminine-indefinite-neuter-plural":"homosexuale","definite-error-unrecognized-form-masculine-neuter-singular":"homosexualul","definite-error-unrecognized-form-feminine-singular":"homosexuala","definite-error-unrecognized-form-masculine-plural":"homosexualii","definite-error-unrecognized-form-feminine-neuter-plural":"homosexualele","alternative":"хомосексуал"}},{"word":"homosexual","pos":"noun","definitions":["homosexual"],"pronunciation":"/ˌho.mo.sek.suˈal/","forms":{"plural":"homosexuali","feminine":"equivalent homosexuală","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"homosexual","accusative-definite-nominative-singular":"homosexualul","accusative-indefinite-nominative-plural":"homosexuali","accusative-definite-nominative-plural":"homosexualii","dative-genitive-indefinite-singular":"homosexual","dative-definite-genitive-singular":"homosexualului","dative-genitive-indefinite-plural":"homosexuali","dative-definite-genitive-plural":"homosexualilor","singular-vocative":"homosexualule","plural-vocative":"homosexualilor","alternative":"хомосексуал"}},{"word":"homosexuala","pos":"adj","definitions":["definite nominative/accusative feminine singular of homosexual"],"pronunciation":"[homoseksuˈala]"},{"word":"homosexuala","pos":"noun","definitions":["definite nominative/accusative singular of homosexuală"],"pronunciation":"[homoseksuˈala]"},{"word":"homosexuală","pos":"adj","definitions":["feminine singular of homosexual"],"pronunciation":"[homoseksuˈalə]"},{"word":"homosexuală","pos":"noun","definitions":["female equivalent of homosexual: a female homosexual"],"pronunciation":"[homoseksuˈalə]","forms":{"plural":"homosexuale","masculine":"equivalent homosexual","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"homosexuală","accusative-definite-nominative-singular":"homosexuala","accusative-indefinite-nominative-plural":"homosexuale","accusative-definite-nominative-plural":"homosexualele","dative-genitive-indefinite-singular":"homosexuale","dative-definite-genitive-singular":"homosexualei","dative-genitive-indefinite-plural":"homosexuale","dative-definite-genitive-plural":"homosexualelor","singular-vocative":"homosexuală","plural-vocative":"homosexualelor"}},{"word":"homosexuale","pos":"adj","definitions":["feminine/neuter plural of homosexual"],"pronunciation":"[homoseksuˈale]"},{"word":"homosexuale","pos":"noun","definitions":["plural of homosexuală"],"pronunciation":"[homoseksuˈale]","gender":"f-p"},{"word":"homosexualei","pos":"adj","definitions":["definite genitive/dative feminine singular of homosexual"],"pronunciation":"[homoseksuˈalej]"},{"word":"homosexualei","pos":"noun","definitions":["definite genitive/dative singular of homosexuală"],"pronunciation":"[homoseksuˈalej]"},{"word":"homosexualele","pos":"adj","definitions":["definite nominative/accusative feminine/neuter plural of homosexual"],"pronunciation":"[homoseksuˈalele]"},{"word":"homosexualele","pos":"noun","definitions":["definite nominative/accusative plural of homosexuală"],"pronunciation":"[homoseksuˈalele]","gender":"f-p"},{"word":"homosexualelor","pos":"adj","definitions":["definite genitive/dative feminine/neuter plural of homosexual"],"pronunciation":"[homoseksuˈalelor]"},{"word":"homosexualelor","pos":"noun","definitions":["definite genitive/dative plural of homosexuală"],"pronunciation":"[homoseksuˈalelor]","gender":"f-p"},{"word":"homosexuali","pos":"adj","definitions":["masculine plural of homosexual"],"pronunciation":"[homoseksuˈalʲ]","examples":[{"ro":"bărbații homosexuali","en":"the homosexual men"}]},{"word":"homosexuali","pos":"noun","definitions":["plural of homosexual homosexuals"],"pronunciation":"[homoseksuˈalʲ]","gender":"m-p"},{"word":"homosexualii","pos":"adj","definitions":["nominative masculine plural of homosexual","accusative masculine plural of homosexual"],"pronunciation":"[ho.mo.se.ksuˈa.liʲ]","examples":[{"ro":"homosexualii băieți vin aici","en":"the homosexual boys are coming here."}]},{"word":"homosexualii","pos":"noun","definitions":["definite nominative plural of homosexual","definite accusative plural of homosexual"],"pronunciation":"[ho.mo.se.ksuˈa.liʲ]","examples":[{"ro":"homosexualii vor să poată să se căsătorească","en":"(the) homosexuals want to be able to get married"}]},{"word":"homosexualilor","pos":"adj","definitions":["genitive masculine plural of homosexual","dative masculine plural of homosexual"],"pronunciation":"[ho.mo.se.ksuˈa.li.lor]","examples":[{"ro":"istoria homosexualilor români","en":"the history of homosexual Romanians"}]},{"word":"homosexualilor","pos":"noun","definitions":["definite genitive plural of homosexual: of the homosexuals","definite dative plural of homosexual: to the homosexuals"],"pronunciation":"[ho.mo.se.ksuˈa.li.lor]","examples":[{"ro":"istoria homosexualilor români","en":"the history of Romanian homosexuals"}]},{"word":"homosexualitate","pos":"noun","definitions":["homosexuality"],"pronunciation":"[homoseksualiˈtate]","examples":[{"ro":"Homosexualitatea este o orientare sexuală caracterizată de atracția estetică, romantică sau sexuală către cineva de același sex.","en":"Homosexuality is a sexual orientation characterized by aesthetic, romantic or sexual attraction toward someone of the same sex."},{"ro":"Estimări ale prevalenței homosexualității exclusive variază de la 1% (unu la sută) la 20% (douăzeci la sută) din populație, de obicei găsind că sunt ceva mai mulți bărbați homosexuali decât lesbiene.","en":"Estimations of the prevalence of exclusive homosexuality range from 1% to 20% of the population, usually finding that there are more homosexual men than lesbians."}],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"homosexualitate","accusative-definite-nominative":"homosexualitatea","dative-genitive-indefinite":"homosexualități","dative-definite-genitive":"homosexualității","vocative":"homosexualitate","alternative":"хомосексуалитате"}},{"word":"homosexualitatea","pos":"noun","definitions":["definite nominative/accusative singular of homosexualitate"],"pronunciation":"/homoseksualiˈtate̯a/","gender":"f","examples":[{"ro":"Homosexualitatea este o orientare sexuală caracterizată de atracția estetică, romantică sau sexuală către cineva de același sex.","en":"Homosexuality is a sexual orientation characterized by the aesthetic, romantic or sexual attraction toward someone of the same sex."}]},{"word":"homosexualității","pos":"noun","definitions":["definite genitive/dative singular of homosexualitate"],"pronunciation":"/homoseksualiˈtətsi/","gender":"f"},{"word":"homosexualul","pos":"adj","definitions":["definite nominative/accusative masculine/neuter singular of homosexual"],"pronunciation":"[ho.mo.se.ksuˈa.lul]"},{"word":"homosexualul","pos":"noun","definitions":["definite nominative singular of homosexual","definite accusative singular of homosexual"],"pronunciation":"[ho.mo.se.ksuˈa.lul]","examples":[{"ro":"a ajuns homosexualu tău favorit!","en":"your favorite homosexual has arrived!"}]},{"word":"homosexualului","pos":"adj","definitions":["definite genitive/dative masculine/neuter singular of homosexual"],"pronunciation":"[ho.mo.se.ksuˈa.lu.luj]"},{"word":"homosexualului","pos":"noun","definitions":["definite genitive/dative singular of homosexual"],"pronunciation":"[ho.mo.se.ksuˈa.lu.luj]"},{"word":"homosferă","pos":"noun","definitions":["homosphere"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"homosferă","accusative-definite-nominative-singular":"homosfera","accusative-indefinite-nominative-plural":"homosfere","accusative-definite-nominative-plural":"homosferele","dative-genitive-indefinite-singular":"homosfere","dative-definite-genitive-singular":"homosferei","dative-genitive-indefinite-plural":"homosfere","dative-definite-genitive-plural":"homosferelor","singular-vocative":"homosferă","plural-vocative":"homosferelor"}},{"word":"homotransplant","pos":"noun","definitions":["homotransplant"],"forms":{"plural":"homotransplanturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"homotransplant","accusative-definite-nominative-singular":"homotransplantul","accusative-indefinite-nominative-plural":"homotransplanturi","accusative-definite-nominative-plural":"homotransplanturile","dative-genitive-indefinite-singular":"homotransplant","dative-definite-genitive-singular":"homotransplantului","dative-genitive-indefinite-plural":"homotransplanturi","dative-definite-genitive-plural":"homotransplanturilor","singular-vocative":"homotransplantule","plural-vocative":"homotransplanturilor"}},{"word":"homozigot","pos":"noun","definitions":["homozygote"],"forms":{"plural":"homozigoți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"homozigot","accusative-definite-nominative-singular":"homozigotul","accusative-indefinite-nominative-plural":"homozigoți","accusative-definite-nominative-plural":"homozigoții","dative-genitive-indefinite-singular":"homozigot","dative-definite-genitive-singular":"homozigotului","dative-genitive-indefinite-plural":"homozigoți","dative-definite-genitive-plural":"homozigoților","singular-vocative":"homozigotule","plural-vocative":"homozigoților"}},{"word":"homunculus","pos":"noun","definitions":["homunculus"],"forms":{"plural":"homunculuși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"homunculus","accusative-definite-nominative-singular":"homunculusul","accusative-indefinite-nominative-plural":"homunculuși","accusative-definite-nominative-plural":"homunculușii","dative-genitive-indefinite-singular":"homunculus","dative-definite-genitive-singular":"homunculusului","dative-genitive-indefinite-plural":"homunculuși","dative-definite-genitive-plural":"homunculușilor","singular-vocative":"homunculusule","plural-vocative":"homunculușilor"}},{"word":"Homuteanovca","pos":"name","definitions":["a village in Gangura, Ialoveni Raion, Moldova"],"gender":"f"},{"word":"Honciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Honciuc"}},{"word":"Hondol","pos":"name","definitions":["a village in Certeju de Sus, Hunedoara County, Romania"],"gender":"m"},{"word":"hondrăni","pos":"verb","definitions":["to babble"],"forms":{"canonical":"a hondrăni 4th conjugation","present-singular-third-person":"hondrănește","participle-past":"hondrănit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hondrăni","gerund":"hondrănind","first-person-indicative-present-singular":"hondrănesc","indicative-present-second-person-singular":"hondrănești","indicative-present-singular-third-person":"hondrănește","first-person-indicative-plural-present":"hondrănim","indicative-plural-present-second-person":"hondrăniți","indicative-plural-present-third-person":"hondrănesc","first-person-imperfect-indicative-singular":"hondrăneam","imperfect-indicative-second-person-singular":"hondrăneai","imperfect-indicative-singular-third-person":"hondrănea","first-person-imperfect-indicative-plural":"hondrăneam","imperfect-indicative-plural-second-person":"hondrăneați","imperfect-indicative-plural-third-person":"hondrăneau","first-person-indicative-perfect-singular":"hondrănii","indicative-perfect-second-person-singular":"hondrăniși","indicative-perfect-singular-third-person":"hondrăni","first-person-indicative-perfect-plural":"hondrănirăm","indicative-perfect-plural-second-person":"hondrănirăți","indicative-perfect-plural-third-person":"hondrăniră","first-person-indicative-pluperfect-singular":"hondrănisem","indicative-pluperfect-second-person-singular":"hondrăniseși","indicative-pluperfect-singular-third-person":"hondrănise","first-person-indicative-pluperfect-plural":"hondrăniserăm","indicative-pluperfect-plural-second-person":"hondrăniserăți","indicative-pluperfect-plural-third-person":"hondrăniseră","first-person-present-singular-subjunctive":"să hondrănesc","present-second-person-singular-subjunctive":"să hondrănești","present-singular-subjunctive-third-person":"să hondrănească","first-person-plural-present-subjunctive":"să hondrănim","plural-present-second-person-subjunctive":"să hondrăniți","plural-present-subjunctive-third-person":"să hondrănească","imperative-second-person-singular":"hondrănește","imperative-plural-second-person":"hondrăniți","imperative-negative-second-person-singular":"nu hondrăni","imperative-negative-plural-second-person":"nu hondrăniți"}},{"word":"Hondrilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hondrilă"}},{"word":"Hondru","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Hondru"}},{"word":"honduriană","pos":"noun","definitions":["female equivalent of hondurian"],"forms":{"plural":"honduriene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"honduriană","accusative-definite-nominative-singular":"honduriana","accusative-indefinite-nominative-plural":"honduriene","accusative-definite-nominative-plural":"hondurienele","dative-genitive-indefinite-singular":"honduriene","dative-definite-genitive-singular":"hondurienei","dative-genitive-indefinite-plural":"honduriene","dative-definite-genitive-plural":"hondurienelor","singular-vocative":"honduriană","plural-vocative":"hondurienelor"}},{"word":"Hong Kong","pos":"name","definitions":["Hong Kong (a city, island and special administrative region in southeastern China)"],"gender":"n"},{"word":"Honțaru","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Honțaru"}},{"word":"Honțișor","pos":"name","definitions":["a village in Gurahonț, Arad County, Romania"],"gender":"m"},{"word":"honved","pos":"noun","definitions":["Hungarian soldier"],"forms":{"plural":"honvezi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"honved","accusative-definite-nominative-singular":"honvedul","accusative-indefinite-nominative-plural":"honvezi","accusative-definite-nominative-plural":"honvezii","dative-genitive-indefinite-singular":"honved","dative-definite-genitive-singular":"honvedului","dative-genitive-indefinite-plural":"honvezi","dative-definite-genitive-plural":"honvezilor","singular-vocative":"honvedule","plural-vocative":"honvezilor"}},{"word":"hopa","pos":"intj","definitions":["alternative form of hop"]},{"word":"hopa-mitică","pos":"noun","definitions":["roly-poly"],"forms":{"plural":"hopa-mitică","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hopa-mitică","accusative-definite-nominative-singular":"hopa-miticăul","accusative-indefinite-nominative-plural":"hopa-mitică","accusative-definite-nominative-plural":"hopa-miticăi","dative-genitive-indefinite-singular":"hopa-mitică","dative-definite-genitive-singular":"hopa-miticăului","dative-genitive-indefinite-plural":"hopa-mitică","dative-definite-genitive-plural":"hopa-miticălor","singular-vocative":"hopa-miticăule","plural-vocative":"hopa-miticălor"}},{"word":"hopai","pos":"intj","definitions":["alternative form of hop"]},{"word":"hopăi","pos":"verb","definitions":["to hop"],"forms":{"canonical":"a hopăi 4th conjugation","present-singular-third-person":"hopăie","participle-past":"hopăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a hopăi","gerund":"hopăind","first-person-indicative-present-singular":"hopăi","indicative-present-second-person-singular":"hopăi","indicative-present-singular-third-person":"hopăie","first-person-indicative-plural-present":"hopăim","indicative-plural-present-second-person":"hopăiți","indicative-plural-present-third-person":"hopăie","first-person-imperfect-indicative-singular":"hopăiam","imperfect-indicative-second-person-singular":"hopăiai","imperfect-indicative-singular-third-person":"hopăia","first-person-imperfect-indicative-plural":"hopăiam","imperfect-indicative-plural-second-person":"hopăiați","imperfect-indicative-plural-third-person":"hopăiau","first-person-indicative-perfect-singular":"hopăii","indicative-perfect-second-person-singular":"hopăiși","indicative-perfect-singular-third-person":"hopăi","first-person-indicative-perfect-plural":"hopăirăm","indicative-perfect-plural-second-person":"hopăirăți","indicative-perfect-plural-third-person":"hopăiră","first-person-indicative-pluperfect-singular":"hopăisem","indicative-pluperfect-second-person-singular":"hopăiseși","indicative-pluperfect-singular-third-person":"hopăise","first-person-indicative-pluperfect-plural":"hopăiserăm","indicative-pluperfect-plural-second-person":"hopăiserăți","indicative-pluperfect-plural-third-person":"hopăiseră","first-person-present-singular-subjunctive":"să hopăi","present-second-person-singular-subjunctive":"să hopăi","present-singular-subjunctive-third-person":"să hopăie","first-person-plural-present-subjunctive":"să hopăim","plural-present-second-person-subjunctive":"să hopăiți","plural-present-subjunctive-third-person":"să hopăie","imperative-second-person-singular":"hopăie","imperative-plural-second-person":"hopăiți","imperative-negative-second-person-singular":"nu hopăi","imperative-negative-plural-second-person":"nu hopăiți"}},{"word":"hopăiță","pos":"noun","definitions":["diminutive of hopaie"],"forms":{"plural":"hopăiți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hopăiță","accusative-definite-nominative-singular":"hopăița","accusative-indefinite-nominative-plural":"hopăiți e","accusative-definite-nominative-plural":"hopăiți ele","dative-genitive-indefinite-singular":"hopăiți e","dative-definite-genitive-singular":"hopăiți ei","dative-genitive-indefinite-plural":"hopăiți e","dative-definite-genitive-plural":"hopăiți elor","singular-vocative":"hopăiță","plural-vocative":"hopăiți elor"}},{"word":"hopcalită","pos":"noun","definitions":["Hopcalite"],"forms":{"plural":"hopcalite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hopcalită","accusative-definite-nominative-singular":"hopcalita","accusative-indefinite-nominative-plural":"hopcalite","accusative-definite-nominative-plural":"hopcalitele","dative-genitive-indefinite-singular":"hopcalite","dative-definite-genitive-singular":"hopcalitei","dative-genitive-indefinite-plural":"hopcalite","dative-definite-genitive-plural":"hopcalitelor","singular-vocative":"hopcalită","plural-vocative":"hopcalitelor"}},{"word":"hoplit","pos":"noun","definitions":["hoplite"],"forms":{"plural":"hopliți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hoplit","accusative-definite-nominative-singular":"hoplitul","accusative-indefinite-nominative-plural":"hopliți","accusative-definite-nominative-plural":"hopliții","dative-genitive-indefinite-singular":"hoplit","dative-definite-genitive-singular":"hoplitului","dative-genitive-indefinite-plural":"hopliți","dative-definite-genitive-plural":"hopliților","singular-vocative":"hoplitule","plural-vocative":"hopliților"}},{"word":"hoplolatrie","pos":"noun","definitions":["hoplolatry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hoplolatrie","accusative-definite-nominative":"hoplolatria","dative-genitive-indefinite":"hoplolatrii","dative-definite-genitive":"hoplolatriei","vocative":"hoplolatrie"}},{"word":"hopurel","pos":"noun","definitions":["diminutive of hopuri"],"forms":{"plural":"hopurele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hopurel","accusative-definite-nominative-singular":"hopurelul","accusative-indefinite-nominative-plural":"hopurele","accusative-definite-nominative-plural":"hopurelele","dative-genitive-indefinite-singular":"hopurel","dative-definite-genitive-singular":"hopurelului","dative-genitive-indefinite-plural":"hopurele","dative-definite-genitive-plural":"hopurelelor","singular-vocative":"hopurelule","plural-vocative":"hopurelelor"}},{"word":"hopuros","pos":"adj","definitions":["bumpy (about roads)"],"forms":{"feminine-singular":"hopuroasă","masculine-plural":"hopuroși","feminine-neuter-plural":"hopuroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hopuros","error-unrecognized-form-feminine-indefinite-singular":"hopuroasă","error-unrecognized-form-indefinite-masculine-plural":"hopuroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"hopuroase","definite-error-unrecognized-form-masculine-neuter-singular":"hopurosul","definite-error-unrecognized-form-feminine-singular":"hopuroasa","definite-error-unrecognized-form-masculine-plural":"hopuroșii","definite-error-unrecognized-form-feminine-neuter-plural":"hopuroasele"}},{"word":"hor","pos":"noun","definitions":["obsolete form of cor"],"forms":{"plural":"horuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hor","accusative-definite-nominative-singular":"horul","accusative-indefinite-nominative-plural":"horuri","accusative-definite-nominative-plural":"horurile","dative-genitive-indefinite-singular":"hor","dative-definite-genitive-singular":"horului","dative-genitive-indefinite-plural":"horuri","dative-definite-genitive-plural":"horurilor","singular-vocative":"horule","plural-vocative":"horurilor"}},{"word":"Hora","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hora"}},{"word":"hora","pos":"noun","definitions":["definite nominative/accusative singular of horă"],"pronunciation":"[ˈhora]","gender":"f"},{"word":"horă","pos":"noun","definitions":["hora (Balkan folk dance)","music of hora","noise, bustle","Corona Borealis"],"forms":{"plural":"hore","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"horă","accusative-definite-nominative-singular":"hora","accusative-indefinite-nominative-plural":"hore","accusative-definite-nominative-plural":"horele","dative-genitive-indefinite-singular":"hore","dative-definite-genitive-singular":"horei","dative-genitive-indefinite-plural":"hore","dative-definite-genitive-plural":"horelor","singular-vocative":"horă","plural-vocative":"horelor"}},{"word":"Hora Mare","pos":"name","definitions":["a village in Cornereva, Caraș-Severin County, Romania"],"gender":"f"},{"word":"Hora Mică","pos":"name","definitions":["a village in Cornereva, Caraș-Severin County, Romania"],"gender":"f"},{"word":"horăi","pos":"verb","definitions":["to snore"],"forms":{"canonical":"a horăi 4th conjugation","present-singular-third-person":"horăie","participle-past":"horăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a horăi","gerund":"horăind","first-person-indicative-present-singular":"horăi","indicative-present-second-person-singular":"horăi","indicative-present-singular-third-person":"horăie","first-person-indicative-plural-present":"horăim","indicative-plural-present-second-person":"horăiți","indicative-plural-present-third-person":"horăie","first-person-imperfect-indicative-singular":"horăiam","imperfect-indicative-second-person-singular":"horăiai","imperfect-indicative-singular-third-person":"horăia","first-person-imperfect-indicative-plural":"horăiam","imperfect-indicative-plural-second-person":"horăiați","imperfect-indicative-plural-third-person":"horăiau","first-person-indicative-perfect-singular":"horăii","indicative-perfect-second-person-singular":"horăiși","indicative-perfect-singular-third-person":"horăi","first-person-indicative-perfect-plural":"horăirăm","indicative-perfect-plural-second-person":"horăirăți","indicative-perfect-plural-third-person":"horăiră","first-person-indicative-pluperfect-singular":"horăisem","indicative-pluperfect-second-person-singular":"horăiseși","indicative-pluperfect-singular-third-person":"horăise","first-person-indicative-pluperfect-plural":"horăiserăm","indicative-pluperfect-plural-second-person":"horăiserăți","indicative-pluperfect-plural-third-person":"horăiseră","first-person-present-singular-subjunctive":"să horăi","present-second-person-singular-subjunctive":"să horăi","present-singular-subjunctive-third-person":"să horăie","first-person-plural-present-subjunctive":"să horăim","plural-present-second-person-subjunctive":"să horăiți","plural-present-subjunctive-third-person":"să horăie","imperative-second-person-singular":"horăie","imperative-plural-second-person":"horăiți","imperative-negative-second-person-singular":"nu horăi","imperative-negative-plural-second-person":"nu horăiți"}},{"word":"Horăiciorul","pos":"name","definitions":["a river in Neamț County, Romania, tributary to the Horăița"],"gender":"m"},{"word":"horăire","pos":"noun","definitions":["snoring"],"forms":{"plural":"horăiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"horăire","accusative-definite-nominative-singular":"horăirea","accusative-indefinite-nominative-plural":"horăiri","accusative-definite-nominative-plural":"horăirile","dative-genitive-indefinite-singular":"horăiri","dative-definite-genitive-singular":"horăirii","dative-genitive-indefinite-plural":"horăiri","dative-definite-genitive-plural":"horăirilor","singular-vocative":"horăire","plural-vocative":"horăirilor"}},{"word":"Horaiț","pos":"name","definitions":["a river in Suceava, Romania, tributary to the Suceava"],"gender":"m"},{"word":"horăit","pos":"noun","definitions":["snoring"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"horăit","accusative-definite-nominative":"horăitul","dative-genitive-indefinite":"horăit","dative-definite-genitive":"horăitului","vocative":"horăitule"}},{"word":"horăit","pos":"verb","definitions":["past participle of horăi"],"forms":{"participle-past":"of horăi"}},{"word":"horaiță","pos":"noun","definitions":["dirt road"],"forms":{"plural":"horaițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"horaiță","accusative-definite-nominative-singular":"horaița","accusative-indefinite-nominative-plural":"horaițe","accusative-definite-nominative-plural":"horaițele","dative-genitive-indefinite-singular":"horaițe","dative-definite-genitive-singular":"horaiței","dative-genitive-indefinite-plural":"horaițe","dative-definite-genitive-plural":"horaițelor","singular-vocative":"horaiță","plural-vocative":"horaițelor"}},{"word":"Horăița","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Almaș"],"gender":"f"},{"word":"horăitură","pos":"noun","definitions":["snoring"],"forms":{"plural":"horăituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"horăitură","accusative-definite-nominative-singular":"horăitura","accusative-indefinite-nominative-plural":"horăituri","accusative-definite-nominative-plural":"horăiturile","dative-genitive-indefinite-singular":"horăituri","dative-definite-genitive-singular":"horăiturii","dative-genitive-indefinite-plural":"horăituri","dative-definite-genitive-plural":"horăiturilor","singular-vocative":"horăitură","plural-vocative":"horăiturilor"}},{"word":"Horăști","pos":"name","definitions":["a locality in Motru, Gorj County, Romania"],"gender":"m"},{"word":"Horațiu","pos":"name","definitions":["a male given name from Latin, equivalent to English Horace"],"gender":"m","forms":{"dative-genitive":"lui Horațiu"}},{"word":"Horbaniuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Horbaniuc"}},{"word":"Horbencu","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Horbencu"}},{"word":"horbodă","pos":"noun","definitions":["alternative form of horbotă"],"forms":{"plural":"horbode","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"horbodă","accusative-definite-nominative-singular":"horboda","accusative-indefinite-nominative-plural":"horbode","accusative-definite-nominative-plural":"horbodele","dative-genitive-indefinite-singular":"horbode","dative-definite-genitive-singular":"horbodei","dative-genitive-indefinite-plural":"horbode","dative-definite-genitive-plural":"horbodelor","singular-vocative":"horbodă","plural-vocative":"horbodelor"}},{"word":"horbot","pos":"noun","definitions":["alternative form of horbotă"],"forms":{"plural":"horbote","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"horbot","accusative-definite-nominative-singular":"horbotul","accusative-indefinite-nominative-plural":"horbote","accusative-definite-nominative-plural":"horbotele","dative-genitive-indefinite-singular":"horbot","dative-definite-genitive-singular":"horbotului","dative-genitive-indefinite-plural":"horbote","dative-definite-genitive-plural":"horbotelor","singular-vocative":"horbotule","plural-vocative":"horbotelor"}},{"word":"horbotă","pos":"noun","definitions":["lace"],"forms":{"plural":"horbote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"horbotă","accusative-definite-nominative-singular":"horbota","accusative-indefinite-nominative-plural":"horbote","accusative-definite-nominative-plural":"horbotele","dative-genitive-indefinite-singular":"horbote","dative-definite-genitive-singular":"horbotei","dative-genitive-indefinite-plural":"horbote","dative-definite-genitive-plural":"horbotelor","singular-vocative":"horbotă","plural-vocative":"horbotelor"}},{"word":"horboțică","pos":"noun","definitions":["diminutive of horbotă"],"forms":{"plural":"horboțele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"horboțică","accusative-definite-nominative-singular":"horboțica","accusative-indefinite-nominative-plural":"horboțice","accusative-definite-nominative-plural":"horboțicele","dative-genitive-indefinite-singular":"horboțice","dative-definite-genitive-singular":"horboțicei","dative-genitive-indefinite-plural":"horboțice","dative-definite-genitive-plural":"horboțicelor","singular-vocative":"horboțică","plural-vocative":"horboțicelor"}},{"word":"horc","pos":"intj","definitions":["alternative form of hor"]},{"word":"horcăi","pos":"verb","definitions":["to snort"],"forms":{"canonical":"a horcăi 4th conjugation","present-singular-third-person":"horcăie","participle-past":"horcăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a horcăi","gerund":"horcăind","first-person-indicative-present-singular":"horcăi","indicative-present-second-person-singular":"horcăi","indicative-present-singular-third-person":"horcăie","first-person-indicative-plural-present":"horcăim","indicative-plural-present-second-person":"horcăiți","indicative-plural-present-third-person":"horcăie","first-person-imperfect-indicative-singular":"horcăiam","imperfect-indicative-second-person-singular":"horcăiai","imperfect-indicative-singular-third-person":"horcăia","first-person-imperfect-indicative-plural":"horcăiam","imperfect-indicative-plural-second-person":"horcăiați","imperfect-indicative-plural-third-person":"horcăiau","first-person-indicative-perfect-singular":"horcăii","indicative-perfect-second-person-singular":"horcăiși","indicative-perfect-singular-third-person":"horcăi","first-person-indicative-perfect-plural":"horcăirăm","indicative-perfect-plural-second-person":"horcăirăți","indicative-perfect-plural-third-person":"horcăiră","first-person-indicative-pluperfect-singular":"horcăisem","indicative-pluperfect-second-person-singular":"horcăiseși","indicative-pluperfect-singular-third-person":"horcăise","first-person-indicative-pluperfect-plural":"horcăiserăm","indicative-pluperfect-plural-second-person":"horcăiserăți","indicative-pluperfect-plural-third-person":"horcăiseră","first-person-present-singular-subjunctive":"să horcăi","present-second-person-singular-subjunctive":"să horcăi","present-singular-subjunctive-third-person":"să horcăie","first-person-plural-present-subjunctive":"să horcăim","plural-present-second-person-subjunctive":"să horcăiți","plural-present-subjunctive-third-person":"să horcăie","imperative-second-person-singular":"horcăie","imperative-plural-second-person":"horcăiți","imperative-negative-second-person-singular":"nu horcăi","imperative-negative-plural-second-person":"nu horcăiți"}},{"word":"horcăială","pos":"noun","definitions":["to snort"],"forms":{"plural":"horcăieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"horcăială","accusative-definite-nominative-singular":"horcăiala","accusative-indefinite-nominative-plural":"horcăiele","accusative-definite-nominative-plural":"horcăielele","dative-genitive-indefinite-singular":"horcăiele","dative-definite-genitive-singular":"horcăielei","dative-genitive-indefinite-plural":"horcăiele","dative-definite-genitive-plural":"horcăielelor","singular-vocative":"horcăială","plural-vocative":"horcăielelor"}},{"word":"horcăire","pos":"noun","definitions":["snort"],"forms":{"plural":"horcăiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"horcăire","accusative-definite-nominative-singular":"horcăirea","accusative-indefinite-nominative-plural":"horcăiri","accusative-definite-nominative-plural":"horcăirile","dative-genitive-indefinite-singular":"horcăiri","dative-definite-genitive-singular":"horcăirii","dative-genitive-indefinite-plural":"horcăiri","dative-definite-genitive-plural":"horcăirilor","singular-vocative":"horcăire","plural-vocative":"horcăirilor"}},{"word":"horcăit","pos":"noun","definitions":["snort"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"horcăit","accusative-definite-nominative":"horcăitul","dative-genitive-indefinite":"horcăit","dative-definite-genitive":"horcăitului","vocative":"horcăitule"}},{"word":"horcăit","pos":"verb","definitions":["past participle of horcăi"],"forms":{"participle-past":"of horcăi"}},{"word":"horcăitură","pos":"noun","definitions":["snort"],"forms":{"plural":"horcăituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"horcăitură","accusative-definite-nominative-singular":"horcăitura","accusative-indefinite-nominative-plural":"horcăituri","accusative-definite-nominative-plural":"horcăiturile","dative-genitive-indefinite-singular":"horcăituri","dative-definite-genitive-singular":"horcăiturii","dative-genitive-indefinite-plural":"horcăituri","dative-definite-genitive-plural":"horcăiturilor","singular-vocative":"horcăitură","plural-vocative":"horcăiturilor"}},{"word":"horcăni","pos":"verb","definitions":["to alternative form of horcăi"],"forms":{"canonical":"a horcăni 4th conjugation","present-singular-third-person":"horcăne","participle-past":"horcănit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a horcăni","gerund":"horcănind","first-person-indicative-present-singular":"horcăn","indicative-present-second-person-singular":"horcăni","indicative-present-singular-third-person":"horcăne","first-person-indicative-plural-present":"horcănim","indicative-plural-present-second-person":"horcăniți","indicative-plural-present-third-person":"horcăn","first-person-imperfect-indicative-singular":"horcăneam","imperfect-indicative-second-person-singular":"horcăneai","imperfect-indicative-singular-third-person":"horcănea","first-person-imperfect-indicative-plural":"horcăneam","imperfect-indicative-plural-second-person":"horcăneați","imperfect-indicative-plural-third-person":"horcăneau","first-person-indicative-perfect-singular":"horcănii","indicative-perfect-second-person-singular":"horcăniși","indicative-perfect-singular-third-person":"horcăni","first-person-indicative-perfect-plural":"horcănirăm","indicative-perfect-plural-second-person":"horcănirăți","indicative-perfect-plural-third-person":"horcăniră","first-person-indicative-pluperfect-singular":"horcănisem","indicative-pluperfect-second-person-singular":"horcăniseși","indicative-pluperfect-singular-third-person":"horcănise","first-person-indicative-pluperfect-plural":"horcăniserăm","indicative-pluperfect-plural-second-person":"horcăniserăți","indicative-pluperfect-plural-third-person":"horcăniseră","first-person-present-singular-subjunctive":"să horcăn","present-second-person-singular-subjunctive":"să horcăni","present-singular-subjunctive-third-person":"să horcănă","first-person-plural-present-subjunctive":"să horcănim","plural-present-second-person-subjunctive":"să horcăniți","plural-present-subjunctive-third-person":"să horcănă","imperative-second-person-singular":"horcăne","imperative-plural-second-person":"horcăniți","imperative-negative-second-person-singular":"nu horcăni","imperative-negative-plural-second-person":"nu horcăniți"}},{"word":"hordă","pos":"noun","definitions":["alternative form of hoardă"],"forms":{"plural":"horde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hordă","accusative-definite-nominative-singular":"horda","accusative-indefinite-nominative-plural":"horde","accusative-definite-nominative-plural":"hordele","dative-genitive-indefinite-singular":"horde","dative-definite-genitive-singular":"hordei","dative-genitive-indefinite-plural":"horde","dative-definite-genitive-plural":"hordelor","singular-vocative":"hordă","plural-vocative":"hordelor"}},{"word":"Hordila","pos":"name","definitions":["a village in Pungești, Vaslui County, Romania"],"gender":"f"},{"word":"Hordilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hordilă"}},{"word":"Hordilești","pos":"name","definitions":["a village in Cozmești, Vaslui County, Romania"],"gender":"m"},{"word":"Hordoniceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hordoniceanu"}},{"word":"Hordou","pos":"name","definitions":["a village in Bistrița-Năsăud County, Romania. Renamed to Coșbuc."],"gender":"m"},{"word":"Hordovan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hordovan"}},{"word":"hore","pos":"noun","definitions":["inflection of horă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈhore]","gender":"f"},{"word":"Horea","pos":"name","definitions":["a commune of Alba County, Romania","a village in Horea, Alba County, Romania","a village in Sanislău, Satu Mare County, Romania","a surname"],"gender":"f"},{"word":"Horeanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Horeanu"}},{"word":"horei","pos":"noun","definitions":["definite genitive/dative singular of horă"],"pronunciation":"[ˈhorej]","gender":"f"},{"word":"Horenciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Horenciuc"}},{"word":"Horescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Horescu"}},{"word":"Horești","pos":"name","definitions":["a village in Horești, Fălești Raion, Moldova","a village in Horești, Ialoveni Raion, Moldova","a commune of Fălești Raion, Moldova","a commune of Ialoveni Raion, Moldova"],"gender":"m"},{"word":"horezean","pos":"adj","definitions":["of, from or relating to Horezu"],"forms":{"feminine-singular":"horezeană","masculine-plural":"horezeni","feminine-neuter-plural":"horezene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"horezean","error-unrecognized-form-feminine-indefinite-singular":"horezeană","error-unrecognized-form-indefinite-masculine-plural":"horezeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"horezene","definite-error-unrecognized-form-masculine-neuter-singular":"horezeanul","definite-error-unrecognized-form-feminine-singular":"horezeana","definite-error-unrecognized-form-masculine-plural":"horezenii","definite-error-unrecognized-form-feminine-neuter-plural":"horezenele"}},{"word":"horezean","pos":"noun","definitions":["native or inhabitant of Horezu (usually male)"],"forms":{"plural":"horezeni","feminine":"equivalent horezeancă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"horezean","accusative-definite-nominative-singular":"horezeanul","accusative-indefinite-nominative-plural":"horezeni","accusative-definite-nominative-plural":"horezenii","dative-genitive-indefinite-singular":"horezean","dative-definite-genitive-singular":"horezeanului","dative-genitive-indefinite-plural":"horezeni","dative-definite-genitive-plural":"horezenilor","singular-vocative":"horezeanule","plural-vocative":"horezenilor"}},{"word":"horezeancă","pos":"noun","definitions":["female equivalent of horezean"],"forms":{"plural":"horezence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"horezeancă","accusative-definite-nominative-singular":"horezeanca","accusative-indefinite-nominative-plural":"horezence","accusative-definite-nominative-plural":"horezencele","dative-genitive-indefinite-singular":"horezence","dative-definite-genitive-singular":"horezencei","dative-genitive-indefinite-plural":"horezence","dative-definite-genitive-plural":"horezencelor","singular-vocative":"horezeancă","plural-vocative":"horezencelor"}},{"word":"Horezeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Horezeanu"}},{"word":"Horezu","pos":"name","definitions":["a village in Turcinești, Gorj County, Romania","a village in Dobrețu, Olt County, Romania","a town in Vâlcea County, Romania"],"gender":"m"},{"word":"Horezu Poenari","pos":"name","definitions":["a village in Valea Stanciului, Dolj County, Romania"],"gender":"m"},{"word":"Horgești","pos":"name","definitions":["a commune of Bacău County, Romania","a village in Horgești, Bacău County, Romania"],"gender":"m"},{"word":"Horghidan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Horghidan"}},{"word":"horhăi","pos":"verb","definitions":["to wander around, to roam"],"forms":{"canonical":"a horhăi 4th conjugation","present-singular-third-person":"horhăie","participle-past":"horhăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a horhăi","gerund":"horhăind","first-person-indicative-present-singular":"horhăi","indicative-present-second-person-singular":"horhăi","indicative-present-singular-third-person":"horhăie","first-person-indicative-plural-present":"horhăim","indicative-plural-present-second-person":"horhăiți","indicative-plural-present-third-person":"horhăie","first-person-imperfect-indicative-singular":"horhăiam","imperfect-indicative-second-person-singular":"horhăiai","imperfect-indicative-singular-third-person":"horhăia","first-person-imperfect-indicative-plural":"horhăiam","imperfect-indicative-plural-second-person":"horhăiați","imperfect-indicative-plural-third-person":"horhăiau","first-person-indicative-perfect-singular":"horhăii","indicative-perfect-second-person-singular":"horhăiși","indicative-perfect-singular-third-person":"horhăi","first-person-indicative-perfect-plural":"horhăirăm","indicative-perfect-plural-second-person":"horhăirăți","indicative-perfect-plural-third-person":"horhăiră","first-person-indicative-pluperfect-singular":"horhăisem","indicative-pluperfect-second-person-singular":"horhăiseși","indicative-pluperfect-singular-third-person":"horhăise","first-person-indicative-pluperfect-plural":"horhăiserăm","indicative-pluperfect-plural-second-person":"horhăiserăți","indicative-pluperfect-plural-third-person":"horhăiseră","first-person-present-singular-subjunctive":"să horhăi","present-second-person-singular-subjunctive":"să horhăi","present-singular-subjunctive-third-person":"să horhăie","first-person-plural-present-subjunctive":"să horhăim","plural-present-second-person-subjunctive":"să horhăiți","plural-present-subjunctive-third-person":"să horhăie","imperative-second-person-singular":"horhăie","imperative-plural-second-person":"horhăiți","imperative-negative-second-person-singular":"nu horhăi","imperative-negative-plural-second-person":"nu horhăiți"}},{"word":"horhăială","pos":"noun","definitions":["wandering"],"forms":{"plural":"horhăieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"horhăială","accusative-definite-nominative-singular":"horhăiala","accusative-indefinite-nominative-plural":"horhăiele","accusative-definite-nominative-plural":"horhăielele","dative-genitive-indefinite-singular":"horhăiele","dative-definite-genitive-singular":"horhăielei","dative-genitive-indefinite-plural":"horhăiele","dative-definite-genitive-plural":"horhăielelor","singular-vocative":"horhăială","plural-vocative":"horhăielelor"}},{"word":"horholină","pos":"noun","definitions":["frivolous woman"],"forms":{"plural":"horholine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"horholină","accusative-definite-nominative-singular":"horholina","accusative-indefinite-nominative-plural":"horholine","accusative-definite-nominative-plural":"horholinele","dative-genitive-indefinite-singular":"horholine","dative-definite-genitive-singular":"horholinei","dative-genitive-indefinite-plural":"horholine","dative-definite-genitive-plural":"horholinelor","singular-vocative":"horholină","plural-vocative":"horholinelor"}},{"word":"hori","pos":"verb","definitions":["to dance"],"forms":{"canonical":"a hori 4th conjugation","present-singular-third-person":"horește","participle-past":"horit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hori","gerund":"horind","first-person-indicative-present-singular":"horesc","indicative-present-second-person-singular":"horești","indicative-present-singular-third-person":"horește","first-person-indicative-plural-present":"horim","indicative-plural-present-second-person":"horiți","indicative-plural-present-third-person":"horesc","first-person-imperfect-indicative-singular":"hoream","imperfect-indicative-second-person-singular":"horeai","imperfect-indicative-singular-third-person":"horea","first-person-imperfect-indicative-plural":"hoream","imperfect-indicative-plural-second-person":"horeați","imperfect-indicative-plural-third-person":"horeau","first-person-indicative-perfect-singular":"horii","indicative-perfect-second-person-singular":"horiși","indicative-perfect-singular-third-person":"hori","first-person-indicative-perfect-plural":"horirăm","indicative-perfect-plural-second-person":"horirăți","indicative-perfect-plural-third-person":"horiră","first-person-indicative-pluperfect-singular":"horisem","indicative-pluperfect-second-person-singular":"horiseși","indicative-pluperfect-singular-third-person":"horise","first-person-indicative-pluperfect-plural":"horiserăm","indicative-pluperfect-plural-second-person":"horiserăți","indicative-pluperfect-plural-third-person":"horiseră","first-person-present-singular-subjunctive":"să horesc","present-second-person-singular-subjunctive":"să horești","present-singular-subjunctive-third-person":"să horească","first-person-plural-present-subjunctive":"să horim","plural-present-second-person-subjunctive":"să horiți","plural-present-subjunctive-third-person":"să horească","imperative-second-person-singular":"horește","imperative-plural-second-person":"horiți","imperative-negative-second-person-singular":"nu hori","imperative-negative-plural-second-person":"nu horiți"}},{"word":"Horia","pos":"name","definitions":["a village in Vladimirescu, Arad County, Romania","a village in Mitoc, Botoșani County, Romania","a village in Surdila-Greci, Brăila County, Romania","a commune of Constanța County, Romania","a village in Horia, Constanța County, Romania"],"gender":"f"},{"word":"horicea","pos":"noun","definitions":["diminutive of horă"],"forms":{"plural":"horicele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"horicea","accusative-definite-nominative-singular":"horiceaua","accusative-indefinite-nominative-plural":"horicele","accusative-definite-nominative-plural":"horicelele","dative-genitive-indefinite-singular":"horicele","dative-definite-genitive-singular":"horicelei","dative-genitive-indefinite-plural":"horicele","dative-definite-genitive-plural":"horicelelor","singular-vocative":"horicea","plural-vocative":"horicelelor"}},{"word":"Horiceanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Horiceanu"}},{"word":"horilcă","pos":"noun","definitions":["alternative form of holercă"],"forms":{"plural":"horilci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"horilcă","accusative-definite-nominative-singular":"horilca","accusative-indefinite-nominative-plural":"horilci","accusative-definite-nominative-plural":"horilcile","dative-genitive-indefinite-singular":"horilci","dative-definite-genitive-singular":"horilcii","dative-genitive-indefinite-plural":"horilci","dative-definite-genitive-plural":"horilcilor","singular-vocative":"horilcă","plural-vocative":"horilcilor"}},{"word":"horincă","pos":"noun","definitions":["alternative form of holercă"],"forms":{"plural":"horinci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"horincă","accusative-definite-nominative-singular":"horinca","accusative-indefinite-nominative-plural":"horinci","accusative-definite-nominative-plural":"horincile","dative-genitive-indefinite-singular":"horinci","dative-definite-genitive-singular":"horincii","dative-genitive-indefinite-plural":"horinci","dative-definite-genitive-plural":"horincilor","singular-vocative":"horincă","plural-vocative":"horincilor"}},{"word":"horincie","pos":"noun","definitions":["distillery"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"horincie","accusative-definite-nominative":"horincia","dative-genitive-indefinite":"horincii","dative-definite-genitive":"horinciei","vocative":"horincie"}},{"word":"horipila","pos":"verb","definitions":["obsolete form of oripila"],"forms":{"canonical":"a horipila 1st conjugation","present-singular-third-person":"horipilează","participle-past":"horipilat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a horipila","gerund":"horipilând","first-person-indicative-present-singular":"horipilez","indicative-present-second-person-singular":"horipilezi","indicative-present-singular-third-person":"horipilează","first-person-indicative-plural-present":"horipilăm","indicative-plural-present-second-person":"horipilați","indicative-plural-present-third-person":"horipilează","first-person-imperfect-indicative-singular":"horipilam","imperfect-indicative-second-person-singular":"horipilai","imperfect-indicative-singular-third-person":"horipila","first-person-imperfect-indicative-plural":"horipilam","imperfect-indicative-plural-second-person":"horipilați","imperfect-indicative-plural-third-person":"horipilau","first-person-indicative-perfect-singular":"horipilai","indicative-perfect-second-person-singular":"horipilași","indicative-perfect-singular-third-person":"horipilă","first-person-indicative-perfect-plural":"horipilarăm","indicative-perfect-plural-second-person":"horipilarăți","indicative-perfect-plural-third-person":"horipilară","first-person-indicative-pluperfect-singular":"horipilasem","indicative-pluperfect-second-person-singular":"horipilaseși","indicative-pluperfect-singular-third-person":"horipilase","first-person-indicative-pluperfect-plural":"horipilaserăm","indicative-pluperfect-plural-second-person":"horipilaserăți","indicative-pluperfect-plural-third-person":"horipilaseră","first-person-present-singular-subjunctive":"să horipilez","present-second-person-singular-subjunctive":"să horipilezi","present-singular-subjunctive-third-person":"să horipileze","first-person-plural-present-subjunctive":"să horipilăm","plural-present-second-person-subjunctive":"să horipilați","plural-present-subjunctive-third-person":"să horipileze","imperative-second-person-singular":"horipilează","imperative-plural-second-person":"horipilați","imperative-negative-second-person-singular":"nu horipila","imperative-negative-plural-second-person":"nu horipilați"}},{"word":"horișoară","pos":"noun","definitions":["diminutive of horă"],"forms":{"plural":"horișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"horișoară","accusative-definite-nominative-singular":"horișoara","accusative-indefinite-nominative-plural":"horișoare","accusative-definite-nominative-plural":"horișoarele","dative-genitive-indefinite-singular":"horișoare","dative-definite-genitive-singular":"horișoarei","dative-genitive-indefinite-plural":"horișoare","dative-definite-genitive-plural":"horișoarelor","singular-vocative":"horișoară","plural-vocative":"horișoarelor"}},{"word":"horitoare","pos":"noun","definitions":["female equivalent of horitor"],"forms":{"plural":"horitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"horitoare","accusative-definite-nominative-singular":"horitoarea","accusative-indefinite-nominative-plural":"horitoare","accusative-definite-nominative-plural":"horitoarele","dative-genitive-indefinite-singular":"horitoare","dative-definite-genitive-singular":"horitoarei","dative-genitive-indefinite-plural":"horitoare","dative-definite-genitive-plural":"horitoarelor","singular-vocative":"horitoare","plural-vocative":"horitoarelor"}},{"word":"horitor","pos":"noun","definitions":["dancer"],"forms":{"plural":"horitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"horitor","accusative-definite-nominative-singular":"horitorul","accusative-indefinite-nominative-plural":"horitori","accusative-definite-nominative-plural":"horitorii","dative-genitive-indefinite-singular":"horitor","dative-definite-genitive-singular":"horitorului","dative-genitive-indefinite-plural":"horitori","dative-definite-genitive-plural":"horitorilor","singular-vocative":"horitorule","plural-vocative":"horitorilor"}},{"word":"Horjești","pos":"name","definitions":["a village in Cărpineni, Hîncești Raion, Moldova"],"gender":"m"},{"word":"Horlacea","pos":"name","definitions":["a village in Sâncraiu, Cluj County, Romania"],"gender":"f"},{"word":"Horlăceni","pos":"name","definitions":["a village in Șendriceni, Botoșani County, Romania"],"gender":"m"},{"word":"Horlești","pos":"name","definitions":["a commune of Iași County, Romania","a village in Horlești, Iași County, Romania","a village in Rediu, Iași County, Romania"],"gender":"m"},{"word":"hormon","pos":"noun","definitions":["hormone"],"forms":{"plural":"hormoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hormon","accusative-definite-nominative-singular":"hormonul","accusative-indefinite-nominative-plural":"hormoni","accusative-definite-nominative-plural":"hormonii","dative-genitive-indefinite-singular":"hormon","dative-definite-genitive-singular":"hormonului","dative-genitive-indefinite-plural":"hormoni","dative-definite-genitive-plural":"hormonilor","singular-vocative":"hormonule","plural-vocative":"hormonilor"}},{"word":"hormon de creștere","pos":"noun","definitions":["growth hormone"],"forms":{"plural":"hormoni de creștere"}},{"word":"hormonal","pos":"adj","definitions":["hormonal"],"forms":{"feminine-singular":"hormonală","masculine-plural":"hormonali","feminine-neuter-plural":"hormonale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hormonal","error-unrecognized-form-feminine-indefinite-singular":"hormonală","error-unrecognized-form-indefinite-masculine-plural":"hormonali","error-unrecognized-form-feminine-indefinite-neuter-plural":"hormonale","definite-error-unrecognized-form-masculine-neuter-singular":"hormonalul","definite-error-unrecognized-form-feminine-singular":"hormonala","definite-error-unrecognized-form-masculine-plural":"hormonalii","definite-error-unrecognized-form-feminine-neuter-plural":"hormonalele"}},{"word":"hormonogeneză","pos":"noun","definitions":["hormonogenesis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hormonogeneză","accusative-definite-nominative-singular":"hormonogeneza","accusative-indefinite-nominative-plural":"hormonogeneze","accusative-definite-nominative-plural":"hormonogenezele","dative-genitive-indefinite-singular":"hormonogeneze","dative-definite-genitive-singular":"hormonogenezei","dative-genitive-indefinite-plural":"hormonogeneze","dative-definite-genitive-plural":"hormonogenezelor","singular-vocative":"hormonogeneză","plural-vocative":"hormonogenezelor"}},{"word":"hormonologie","pos":"noun","definitions":["hormonology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hormonologie","accusative-definite-nominative-singular":"hormonologia","accusative-indefinite-nominative-plural":"hormonologii","accusative-definite-nominative-plural":"hormonologiile","dative-genitive-indefinite-singular":"hormonologii","dative-definite-genitive-singular":"hormonologiei","dative-genitive-indefinite-plural":"hormonologii","dative-definite-genitive-plural":"hormonologiilor","singular-vocative":"hormonologie","plural-vocative":"hormonologiilor"}},{"word":"hormonopoieză","pos":"noun","definitions":["hormonopoiesis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hormonopoieză","accusative-definite-nominative-singular":"hormonopoieza","accusative-indefinite-nominative-plural":"hormonopoieze","accusative-definite-nominative-plural":"hormonopoiezele","dative-genitive-indefinite-singular":"hormonopoieze","dative-definite-genitive-singular":"hormonopoiezei","dative-genitive-indefinite-plural":"hormonopoieze","dative-definite-genitive-plural":"hormonopoiezelor","singular-vocative":"hormonopoieză","plural-vocative":"hormonopoiezelor"}},{"word":"hormonoterapie","pos":"noun","definitions":["hormone therapy"],"forms":{"plural":"hormonoterapii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hormonoterapie","accusative-definite-nominative-singular":"hormonoterapia","accusative-indefinite-nominative-plural":"hormonoterapii","accusative-definite-nominative-plural":"hormonoterapiile","dative-genitive-indefinite-singular":"hormonoterapii","dative-definite-genitive-singular":"hormonoterapiei","dative-genitive-indefinite-plural":"hormonoterapii","dative-definite-genitive-plural":"hormonoterapiilor","singular-vocative":"hormonoterapie","plural-vocative":"hormonoterapiilor"}},{"word":"horn","pos":"noun","definitions":["chimney"],"forms":{"plural":"hornuri"}},{"word":"Hornar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Hornar"}},{"word":"hornar","pos":"noun","definitions":["chimney sweep"],"forms":{"plural":"hornari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hornar","accusative-definite-nominative-singular":"hornarul","accusative-indefinite-nominative-plural":"hornari","accusative-definite-nominative-plural":"hornarii","dative-genitive-indefinite-singular":"hornar","dative-definite-genitive-singular":"hornarului","dative-genitive-indefinite-plural":"hornari","dative-definite-genitive-plural":"hornarilor","singular-vocative":"hornarule","plural-vocative":"hornarilor"}},{"word":"Hornariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Hornariu"}},{"word":"Hornaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Hornaru"}},{"word":"hornblendă","pos":"noun","definitions":["hornblende"],"forms":{"plural":"hornblende","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hornblendă","accusative-definite-nominative-singular":"hornblenda","accusative-indefinite-nominative-plural":"hornblende","accusative-definite-nominative-plural":"hornblendele","dative-genitive-indefinite-singular":"hornblende","dative-definite-genitive-singular":"hornblendei","dative-genitive-indefinite-plural":"hornblende","dative-definite-genitive-plural":"hornblendelor","singular-vocative":"hornblendă","plural-vocative":"hornblendelor"}},{"word":"hornblendit","pos":"noun","definitions":["hornblendite"],"forms":{"plural":"hornblendiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hornblendit","accusative-definite-nominative-singular":"hornblenditul","accusative-indefinite-nominative-plural":"hornblendiți","accusative-definite-nominative-plural":"hornblendiții","dative-genitive-indefinite-singular":"hornblendit","dative-definite-genitive-singular":"hornblenditului","dative-genitive-indefinite-plural":"hornblendiți","dative-definite-genitive-plural":"hornblendiților","singular-vocative":"hornblenditule","plural-vocative":"hornblendiților"}},{"word":"Horneț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Horneț"}},{"word":"horneț","pos":"noun","definitions":["diminutive of horn"],"forms":{"plural":"hornețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"horneț","accusative-definite-nominative-singular":"hornețul","accusative-indefinite-nominative-plural":"hornețe","accusative-definite-nominative-plural":"hornețele","dative-genitive-indefinite-singular":"horneț","dative-definite-genitive-singular":"hornețului","dative-genitive-indefinite-plural":"hornețe","dative-definite-genitive-plural":"hornețelor","singular-vocative":"hornețule","plural-vocative":"hornețelor"}},{"word":"Hornu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hornu"}},{"word":"hornuț","pos":"noun","definitions":["diminutive of horn"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hornuț","accusative-definite-nominative":"hornuțul","dative-genitive-indefinite":"hornuț","dative-definite-genitive":"hornuțului","vocative":"hornuțule"}},{"word":"Horoatu Cehului","pos":"name","definitions":["a village in Cehu Silvaniei, Sălaj County, Romania"],"gender":"m"},{"word":"Horoatu Crasnei","pos":"name","definitions":["a commune of Sălaj County, Romania","a village in Horoatu Crasnei, Sălaj County, Romania"],"gender":"m","forms":{"canonical-masculine":"Horoati Crasnei"}},{"word":"Horobeț","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Horobeț"}},{"word":"Horodca","pos":"name","definitions":["a village in Drăgușenii Noi, Hîncești Raion, Moldova","a village in Horodca, Ialoveni Raion, Moldova","a commune of Ialoveni Raion, Moldova"],"gender":"f"},{"word":"Horodiceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Horodiceanu"}},{"word":"Horodincă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Horodincă"}},{"word":"Horodiște","pos":"name","definitions":["a village in Horodiște, Călărași Raion, Moldova","a village in Horodiște, Dondușeni Raion, Moldova","a village in Horodiște, Rezina Raion, Moldova","a village in Horodiște, Rîșcani Raion, Moldova","a commune of Călărași Raion, Moldova"],"gender":"m"},{"word":"Horodiștea","pos":"name","definitions":["a village in Păltiniș, Botoșani County, Romania","a village in Cotnari, Iași County, Romania"],"gender":"f"},{"word":"Horodișteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Horodișteanu"}},{"word":"Horodnic","pos":"name","definitions":["a river in Suceava County, Romania, tributary to the Suceava"],"gender":"m"},{"word":"Horodnic de Jos","pos":"name","definitions":["a commune of Suceava County, Romania","a village in Horodnic de Jos, Suceava County, Romania"],"gender":"m"},{"word":"Horodnic de Sus","pos":"name","definitions":["a commune of Suceava County, Romania","a village in Horodnic de Sus, Suceava County, Romania"],"gender":"m"},{"word":"Horodniceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Horodniceanu"}},{"word":"Horodniceni","pos":"name","definitions":["a commune of Suceava County, Romania","a village in Horodniceni, Suceava County, Romania"],"gender":"m"},{"word":"Horoghiuca","pos":"name","definitions":["a river in Botoșani, Romania, tributary to the Miletin"],"gender":"f"},{"word":"Horoiata","pos":"name","definitions":["a village in Bogdănești, Vaslui County, Romania"],"gender":"f"},{"word":"Horopciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Horopciuc"}},{"word":"horopsi","pos":"verb","definitions":["alternative form of oropsi"],"forms":{"canonical":"a horopsi 4th conjugation","present-singular-third-person":"horopsește","participle-past":"horopsit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a horopsi","gerund":"horopsind","first-person-indicative-present-singular":"horopsesc","indicative-present-second-person-singular":"horopsești","indicative-present-singular-third-person":"horopsește","first-person-indicative-plural-present":"horopsim","indicative-plural-present-second-person":"horopsiți","indicative-plural-present-third-person":"horopsesc","first-person-imperfect-indicative-singular":"horopseam","imperfect-indicative-second-person-singular":"horopseai","imperfect-indicative-singular-third-person":"horopsea","first-person-imperfect-indicative-plural":"horopseam","imperfect-indicative-plural-second-person":"horopseați","imperfect-indicative-plural-third-person":"horopseau","first-person-indicative-perfect-singular":"horopsii","indicative-perfect-second-person-singular":"horopsiși","indicative-perfect-singular-third-person":"horopsi","first-person-indicative-perfect-plural":"horopsirăm","indicative-perfect-plural-second-person":"horopsirăți","indicative-perfect-plural-third-person":"horopsiră","first-person-indicative-pluperfect-singular":"horopsisem","indicative-pluperfect-second-person-singular":"horopsiseși","indicative-pluperfect-singular-third-person":"horopsise","first-person-indicative-pluperfect-plural":"horopsiserăm","indicative-pluperfect-plural-second-person":"horopsiserăți","indicative-pluperfect-plural-third-person":"horopsiseră","first-person-present-singular-subjunctive":"să horopsesc","present-second-person-singular-subjunctive":"să horopsești","present-singular-subjunctive-third-person":"să horopsească","first-person-plural-present-subjunctive":"să horopsim","plural-present-second-person-subjunctive":"să horopsiți","plural-present-subjunctive-third-person":"să horopsească","imperative-second-person-singular":"horopsește","imperative-plural-second-person":"horopsiți","imperative-negative-second-person-singular":"nu horopsi","imperative-negative-plural-second-person":"nu horopsiți"}},{"word":"horopsit","pos":"adj","definitions":["alternative form of oropsit"],"forms":{"feminine-singular":"horopsită","masculine-plural":"horopsiți","feminine-neuter-plural":"horopsite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"horopsit","error-unrecognized-form-feminine-indefinite-singular":"horopsită","error-unrecognized-form-indefinite-masculine-plural":"horopsiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"horopsite","definite-error-unrecognized-form-masculine-neuter-singular":"horopsitul","definite-error-unrecognized-form-feminine-singular":"horopsita","definite-error-unrecognized-form-masculine-plural":"horopsiții","definite-error-unrecognized-form-feminine-neuter-plural":"horopsitele"}},{"word":"horopter","pos":"noun","definitions":["horopter"],"forms":{"plural":"horoptere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"horopter","accusative-definite-nominative-singular":"horopterul","accusative-indefinite-nominative-plural":"horoptere","accusative-definite-nominative-plural":"horopterele","dative-genitive-indefinite-singular":"horopter","dative-definite-genitive-singular":"horopterului","dative-genitive-indefinite-plural":"horoptere","dative-definite-genitive-plural":"horopterelor","singular-vocative":"horopterule","plural-vocative":"horopterelor"}},{"word":"horoscop","pos":"noun","definitions":["horoscope"],"forms":{"plural":"horoscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"horoscop","accusative-definite-nominative-singular":"horoscopul","accusative-indefinite-nominative-plural":"horoscoape","accusative-definite-nominative-plural":"horoscoapele","dative-genitive-indefinite-singular":"horoscop","dative-definite-genitive-singular":"horoscopului","dative-genitive-indefinite-plural":"horoscoape","dative-definite-genitive-plural":"horoscoapelor","singular-vocative":"horoscopule","plural-vocative":"horoscoapelor"}},{"word":"Horotan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Horotan"}},{"word":"Horozlar","pos":"name","definitions":["a village in Constanța County, in eastern Romania. Renamed to Poiana."],"gender":"m"},{"word":"Horpaz","pos":"name","definitions":["a village in Miroslava, Iași County, Romania"],"gender":"f"},{"word":"horror","pos":"adj","definitions":["horror"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"horror","error-unrecognized-form-feminine-indefinite-singular":"horror","error-unrecognized-form-indefinite-masculine-plural":"horror","error-unrecognized-form-feminine-indefinite-neuter-plural":"horror","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"horror","pos":"noun","definitions":["horror"],"forms":{"plural":"horror","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"horror","accusative-definite-nominative-singular":"horrorul","accusative-indefinite-nominative-plural":"horror","accusative-definite-nominative-plural":"horrorle","dative-genitive-indefinite-singular":"horror","dative-definite-genitive-singular":"horrorului","dative-genitive-indefinite-plural":"horror","dative-definite-genitive-plural":"horrorlor","singular-vocative":"horrorule","plural-vocative":"horrorlor"}},{"word":"horșaf","pos":"noun","definitions":["stewed fruit (made out of plums or cherries)"],"forms":{"plural":"horșafuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"horșaf","accusative-definite-nominative-singular":"horșaful","accusative-indefinite-nominative-plural":"horșafuri","accusative-definite-nominative-plural":"horșafurile","dative-genitive-indefinite-singular":"horșaf","dative-definite-genitive-singular":"horșafului","dative-genitive-indefinite-plural":"horșafuri","dative-definite-genitive-plural":"horșafurilor","singular-vocative":"horșafule","plural-vocative":"horșafurilor"}},{"word":"hortativ","pos":"adj","definitions":["hortative"],"forms":{"feminine-singular":"hortativă","masculine-plural":"hortativi","feminine-neuter-plural":"hortative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hortativ","error-unrecognized-form-feminine-indefinite-singular":"hortativă","error-unrecognized-form-indefinite-masculine-plural":"hortativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"hortative","definite-error-unrecognized-form-masculine-neuter-singular":"hortativul","definite-error-unrecognized-form-feminine-singular":"hortativa","definite-error-unrecognized-form-masculine-plural":"hortativii","definite-error-unrecognized-form-feminine-neuter-plural":"hortativele"}},{"word":"hortensie","pos":"noun","definitions":["hydrangea"],"forms":{"plural":"hortensii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hortensie","accusative-definite-nominative-singular":"hortensia","accusative-indefinite-nominative-plural":"hortensii","accusative-definite-nominative-plural":"hortensiile","dative-genitive-indefinite-singular":"hortensii","dative-definite-genitive-singular":"hortensiei","dative-genitive-indefinite-plural":"hortensii","dative-definite-genitive-plural":"hortensiilor","singular-vocative":"hortensie","plural-vocative":"hortensiilor"}},{"word":"horticol","pos":"adj","definitions":["horticultural"],"forms":{"feminine-singular":"horticolă","masculine-plural":"horticoli","feminine-neuter-plural":"horticole","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"horticol","error-unrecognized-form-feminine-indefinite-singular":"horticolă","error-unrecognized-form-indefinite-masculine-plural":"horticoli","error-unrecognized-form-feminine-indefinite-neuter-plural":"horticole","definite-error-unrecognized-form-masculine-neuter-singular":"horticolul","definite-error-unrecognized-form-feminine-singular":"horticola","definite-error-unrecognized-form-masculine-plural":"horticolii","definite-error-unrecognized-form-feminine-neuter-plural":"horticolele"}},{"word":"horticultoare","pos":"noun","definitions":["female equivalent of horticultor"],"pronunciation":"/hor.ti.kulˈto̯a.re/","forms":{"plural":"horticultoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"horticultoare","accusative-definite-nominative-singular":"horticultoarea","accusative-indefinite-nominative-plural":"horticultoare","accusative-definite-nominative-plural":"horticultoarele","dative-genitive-indefinite-singular":"horticultoare","dative-definite-genitive-singular":"horticultoarei","dative-genitive-indefinite-plural":"horticultoare","dative-definite-genitive-plural":"horticultoarelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"horticultor","pos":"noun","definitions":["horticultor, horticulturist"],"pronunciation":"/hor.ti.kulˈtor/","forms":{"plural":"horticultori","feminine":"equivalent horticultoare","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"horticultor","accusative-definite-nominative-singular":"horticultorul","accusative-indefinite-nominative-plural":"horticultori","accusative-definite-nominative-plural":"horticultorii","dative-genitive-indefinite-singular":"horticultor","dative-definite-genitive-singular":"horticultorului","dative-genitive-indefinite-plural":"horticultori","dative-definite-genitive-plural":"horticultorilor","singular-vocative":"horticultorule","plural-vocative":"horticultorilor"}},{"word":"horticultori","pos":"noun","definitions":["plural of horticultor"],"gender":"m"},{"word":"horticultură","pos":"noun","definitions":["horticulture"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"horticultură","accusative-definite-nominative-singular":"horticultura","accusative-indefinite-nominative-plural":"horticulture","accusative-definite-nominative-plural":"horticulturele","dative-genitive-indefinite-singular":"horticulture","dative-definite-genitive-singular":"horticulturei","dative-genitive-indefinite-plural":"horticulture","dative-definite-genitive-plural":"horticulturelor","singular-vocative":"horticultură","plural-vocative":"horticulturelor"}},{"word":"horțiș","pos":"adj","definitions":["slanting"],"forms":{"feminine-singular":"horțișă","masculine-plural":"horțiși","feminine-neuter-plural":"horțișe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"horțiș","error-unrecognized-form-feminine-indefinite-singular":"horțișă","error-unrecognized-form-indefinite-masculine-plural":"horțiși","error-unrecognized-form-feminine-indefinite-neuter-plural":"horțișe","definite-error-unrecognized-form-masculine-neuter-singular":"horțișul","definite-error-unrecognized-form-feminine-singular":"horțișa","definite-error-unrecognized-form-masculine-plural":"horțișii","definite-error-unrecognized-form-feminine-neuter-plural":"horțișele"}},{"word":"hortum","pos":"noun","definitions":["proboscis"],"forms":{"plural":"hortumuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hortum","accusative-definite-nominative-singular":"hortumul","accusative-indefinite-nominative-plural":"hortumuri","accusative-definite-nominative-plural":"hortumurile","dative-genitive-indefinite-singular":"hortum","dative-definite-genitive-singular":"hortumului","dative-genitive-indefinite-plural":"hortumuri","dative-definite-genitive-plural":"hortumurilor","singular-vocative":"hortumule","plural-vocative":"hortumurilor"}},{"word":"Horvat","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Horvat"}},{"word":"horvat","pos":"noun","definitions":["Croatian"],"forms":{"plural":"horvați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"horvat","accusative-definite-nominative-singular":"horvatul","accusative-indefinite-nominative-plural":"horvați","accusative-definite-nominative-plural":"horvații","dative-genitive-indefinite-singular":"horvat","dative-definite-genitive-singular":"horvatului","dative-genitive-indefinite-plural":"horvați","dative-definite-genitive-plural":"horvaților","singular-vocative":"horvatule","plural-vocative":"horvaților"}},{"word":"Horvatca","pos":"name","definitions":["a river in Brașov County, Romania, tributary to the Timiș"],"gender":"f"},{"word":"Hosasău","pos":"name","definitions":["a village in Leliceni, Harghita County, Romania"],"gender":"m"},{"word":"Hosman","pos":"name","definitions":["a village in Nocrich, Sibiu County, Romania"],"gender":"f"},{"word":"hoștează","pos":"noun","definitions":["a neighborhood on the outskirts of a town, traditionally inhabited by peasants or workers; especially, one of the former Hungarian farming districts of Cluj"],"forms":{"plural":"hoșteze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hoștează","accusative-definite-nominative-singular":"hoșteaza","accusative-indefinite-nominative-plural":"hoșteze","accusative-definite-nominative-plural":"hoștezele","dative-genitive-indefinite-singular":"hoșteze","dative-definite-genitive-singular":"hoștezei","dative-genitive-indefinite-plural":"hoșteze","dative-definite-genitive-plural":"hoștezelor","singular-vocative":"hoștează","plural-vocative":"hoștezelor"}},{"word":"hostie","pos":"noun","definitions":["sacrifice, offering","victim, sacrificial animal","host, The consecrated bread"],"pronunciation":"/ˈhos.ti.e/","forms":{"plural":"hostii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hostie","accusative-definite-nominative-singular":"hostia","accusative-indefinite-nominative-plural":"hostii","accusative-definite-nominative-plural":"hostiile","dative-genitive-indefinite-singular":"hostii","dative-definite-genitive-singular":"hostiei","dative-genitive-indefinite-plural":"hostii","dative-definite-genitive-plural":"hostiilor","singular-vocative":"hostie","plural-vocative":"hostiilor"}},{"word":"hoștină","pos":"noun","definitions":["alternative form of boștină"],"forms":{"plural":"hoștine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hoștină","accusative-definite-nominative-singular":"hoștina","accusative-indefinite-nominative-plural":"hoștine","accusative-definite-nominative-plural":"hoștinele","dative-genitive-indefinite-singular":"hoștine","dative-definite-genitive-singular":"hoștinei","dative-genitive-indefinite-plural":"hoștine","dative-definite-genitive-plural":"hoștinelor","singular-vocative":"hoștină","plural-vocative":"hoștinelor"}},{"word":"Hosu","pos":"name","definitions":["a surname from Hungarian","a river in Covasna, Romania, tributary to the Șugău"],"gender":"m","forms":{"dative-genitive":"lui Hosu"}},{"word":"hoț","pos":"noun","definitions":["thief"],"forms":{"plural":"hoți","feminine":"equivalent hoață","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hoț","accusative-definite-nominative-singular":"hoțul","accusative-indefinite-nominative-plural":"hoți","accusative-definite-nominative-plural":"hoții","dative-genitive-indefinite-singular":"hoț","dative-definite-genitive-singular":"hoțului","dative-genitive-indefinite-plural":"hoți","dative-definite-genitive-plural":"hoților","singular-vocative":"hoțule","plural-vocative":"hoților"}},{"word":"hoț de buzunare","pos":"noun","definitions":["pickpocket"],"forms":{"plural":"hoți de buzunare"}},{"word":"hot dog","pos":"noun","definitions":["hot dog"],"forms":{"plural":"hot dogi"}},{"word":"hotă","pos":"noun","definitions":["kitchen hood"],"pronunciation":"/ˈho.tə/","forms":{"plural":"hote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hotă","accusative-definite-nominative-singular":"hota","accusative-indefinite-nominative-plural":"hote","accusative-definite-nominative-plural":"hotele","dative-genitive-indefinite-singular":"hote","dative-definite-genitive-singular":"hotei","dative-genitive-indefinite-plural":"hote","dative-definite-genitive-plural":"hotelor","singular-vocative":"hotă","plural-vocative":"hotelor"}},{"word":"Hotar","pos":"name","definitions":["a village in Țețchea, Bihor County, Romania"],"gender":"m"},{"word":"hotar","pos":"noun","definitions":["limit","border"],"pronunciation":"/hoˈtar/","forms":{"plural":"hotare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hotar","accusative-definite-nominative-singular":"hotarul","accusative-indefinite-nominative-plural":"hotare","accusative-definite-nominative-plural":"hotarele","dative-genitive-indefinite-singular":"hotar","dative-definite-genitive-singular":"hotarului","dative-genitive-indefinite-plural":"hotare","dative-definite-genitive-plural":"hotarelor","singular-vocative":"hotarule","plural-vocative":"hotarelor"}},{"word":"Hotărani","pos":"name","definitions":["a village in Vânjuleț, Mehedinți County, Romania","a village in Fărcașele, Olt County, Romania"],"gender":"m"},{"word":"hotărâre","pos":"noun","definitions":["decision, determination, resolution"],"forms":{"plural":"hotărâri"}},{"word":"Hotărasa","pos":"name","definitions":["a village in Copăceni, Vâlcea County, Romania"],"gender":"f"},{"word":"hotărât","pos":"adj","definitions":["definite","decided"],"forms":{"feminine-singular":"hotărâtă","masculine-plural":"hotărâți","feminine-neuter-plural":"hotărâte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hotărât","error-unrecognized-form-feminine-indefinite-singular":"hotărâtă","error-unrecognized-form-indefinite-masculine-plural":"hotărâți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hotărâte","definite-error-unrecognized-form-masculine-neuter-singular":"hotărâtul","definite-error-unrecognized-form-feminine-singular":"hotărâta","definite-error-unrecognized-form-masculine-plural":"hotărâții","definite-error-unrecognized-form-feminine-neuter-plural":"hotărâtele"}},{"word":"hotărâtor","pos":"adj","definitions":["decisive"],"forms":{"feminine-singular":"hotărâtoare","masculine-plural":"hotărâtori","feminine-neuter-plural":"hotărâtoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hotărâtor","error-unrecognized-form-feminine-indefinite-singular":"hotărâtoare","error-unrecognized-form-indefinite-masculine-plural":"hotărâtori","error-unrecognized-form-feminine-indefinite-neuter-plural":"hotărâtoare","definite-error-unrecognized-form-masculine-neuter-singular":"hotărâtorul","definite-error-unrecognized-form-feminine-singular":"hotărâtoarea","definite-error-unrecognized-form-masculine-plural":"hotărâtorii","definite-error-unrecognized-form-feminine-neuter-plural":"hotărâtoarele"}},{"word":"Hotărel","pos":"name","definitions":["a village in Lunca, Bihor County, Romania"],"gender":"m"},{"word":"Hotarele","pos":"name","definitions":["a commune of Giurgiu County, Romania","a village in Hotarele, Giurgiu County, Romania","a village in Muereasca, Vâlcea County, Romania"],"gender":"m"},{"word":"hotărî","pos":"verb","definitions":["to decide, to settle"],"pronunciation":"/ho.təˈrɨ/","forms":{"canonical":"a hotărî 4th conjugation","present-singular-third-person":"hotărăște","participle-past":"hotărât","table-tags":"conjugation-4","inflection-template":"ro-conj-î-ăsc","infinitive":"a hotărî","gerund":"hotărând","first-person-indicative-present-singular":"hotărăsc","indicative-present-second-person-singular":"hotărăști","indicative-present-singular-third-person":"hotărăște","first-person-indicative-plural-present":"hotărâm","indicative-plural-present-second-person":"hotărâți","indicative-plural-present-third-person":"hotărăsc","first-person-imperfect-indicative-singular":"hotăram","imperfect-indicative-second-person-singular":"hotărai","imperfect-indicative-singular-third-person":"hotăra","first-person-imperfect-indicative-plural":"hotăram","imperfect-indicative-plural-second-person":"hotărați","imperfect-indicative-plural-third-person":"hotărau","first-person-indicative-perfect-singular":"hotărâi","indicative-perfect-second-person-singular":"hotărâși","indicative-perfect-singular-third-person":"hotărî","first-person-indicative-perfect-plural":"hotărârăm","indicative-perfect-plural-second-person":"hotărârăți","indicative-perfect-plural-third-person":"hotărâră","first-person-indicative-pluperfect-singular":"hotărâsem","indicative-pluperfect-second-person-singular":"hotărâseși","indicative-pluperfect-singular-third-person":"hotărâse","first-person-indicative-pluperfect-plural":"hotărâserăm","indicative-pluperfect-plural-second-person":"hotărâserăți","indicative-pluperfect-plural-third-person":"hotărâseră","first-person-present-singular-subjunctive":"să hotărăsc","present-second-person-singular-subjunctive":"să hotărăști","present-singular-subjunctive-third-person":"să hotărască","first-person-plural-present-subjunctive":"să hotărâm","plural-present-second-person-subjunctive":"să hotărâți","plural-present-subjunctive-third-person":"să hotărască","imperative-second-person-singular":"hotărăște","imperative-plural-second-person":"hotărâți","imperative-negative-second-person-singular":"nu hotărî","imperative-negative-plural-second-person":"nu hotărâți","alternative":"хотэры"}},{"word":"hotarnic","pos":"adj","definitions":["limit, border"],"forms":{"feminine-singular":"hotarnică","masculine-plural":"hotarnici","feminine-neuter-plural":"hotarnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hotarnic","error-unrecognized-form-feminine-indefinite-singular":"hotarnică","error-unrecognized-form-indefinite-masculine-plural":"hotarnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hotarnice","definite-error-unrecognized-form-masculine-neuter-singular":"hotarnicul","definite-error-unrecognized-form-feminine-singular":"hotarnica","definite-error-unrecognized-form-masculine-plural":"hotarnicii","definite-error-unrecognized-form-feminine-neuter-plural":"hotarnicele"}},{"word":"hotărnici","pos":"verb","definitions":["to delimit borders (of a region or a property)"],"forms":{"canonical":"a hotărnici 4th conjugation","present-singular-third-person":"hotărnicește","participle-past":"hotărnicit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hotărnici","gerund":"hotărnicind","first-person-indicative-present-singular":"hotărnicesc","indicative-present-second-person-singular":"hotărnicești","indicative-present-singular-third-person":"hotărnicește","first-person-indicative-plural-present":"hotărnicim","indicative-plural-present-second-person":"hotărniciți","indicative-plural-present-third-person":"hotărnicesc","first-person-imperfect-indicative-singular":"hotărniceam","imperfect-indicative-second-person-singular":"hotărniceai","imperfect-indicative-singular-third-person":"hotărnicea","first-person-imperfect-indicative-plural":"hotărniceam","imperfect-indicative-plural-second-person":"hotărniceați","imperfect-indicative-plural-third-person":"hotărniceau","first-person-indicative-perfect-singular":"hotărnicii","indicative-perfect-second-person-singular":"hotărniciși","indicative-perfect-singular-third-person":"hotărnici","first-person-indicative-perfect-plural":"hotărnicirăm","indicative-perfect-plural-second-person":"hotărnicirăți","indicative-perfect-plural-third-person":"hotărniciră","first-person-indicative-pluperfect-singular":"hotărnicisem","indicative-pluperfect-second-person-singular":"hotărniciseși","indicative-pluperfect-singular-third-person":"hotărnicise","first-person-indicative-pluperfect-plural":"hotărniciserăm","indicative-pluperfect-plural-second-person":"hotărniciserăți","indicative-pluperfect-plural-third-person":"hotărniciseră","first-person-present-singular-subjunctive":"să hotărnicesc","present-second-person-singular-subjunctive":"să hotărnicești","present-singular-subjunctive-third-person":"să hotărnicească","first-person-plural-present-subjunctive":"să hotărnicim","plural-present-second-person-subjunctive":"să hotărniciți","plural-present-subjunctive-third-person":"să hotărnicească","imperative-second-person-singular":"hotărnicește","imperative-plural-second-person":"hotărniciți","imperative-negative-second-person-singular":"nu hotărnici","imperative-negative-plural-second-person":"nu hotărniciți"}},{"word":"hotărnicie","pos":"noun","definitions":["determination"],"forms":{"plural":"hotărnicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hotărnicie","accusative-definite-nominative-singular":"hotărnicia","accusative-indefinite-nominative-plural":"hotărnicii","accusative-definite-nominative-plural":"hotărniciile","dative-genitive-indefinite-singular":"hotărnicii","dative-definite-genitive-singular":"hotărniciei","dative-genitive-indefinite-plural":"hotărnicii","dative-definite-genitive-plural":"hotărniciilor","singular-vocative":"hotărnicie","plural-vocative":"hotărniciilor"}},{"word":"hotărnicire","pos":"noun","definitions":["delimitation, demarcation"],"forms":{"plural":"hotărniciri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hotărnicire","accusative-definite-nominative-singular":"hotărnicirea","accusative-indefinite-nominative-plural":"hotărniciri","accusative-definite-nominative-plural":"hotărnicirile","dative-genitive-indefinite-singular":"hotărniciri","dative-definite-genitive-singular":"hotărnicirii","dative-genitive-indefinite-plural":"hotărniciri","dative-definite-genitive-plural":"hotărnicirilor","singular-vocative":"hotărnicire","plural-vocative":"hotărnicirilor"}},{"word":"Hotăroaia","pos":"name","definitions":["a village in Roșiile, Vâlcea County, Romania"],"gender":"f"},{"word":"Hotăroasa","pos":"name","definitions":["a village in Urdari, Gorj County, Romania"],"gender":"f"},{"word":"Hotaru","pos":"name","definitions":["a village in Grojdibodu, Olt County, Romania","a village in Andreiașu de Jos, Vrancea County, Romania"],"gender":"m"},{"word":"hotarul","pos":"noun","definitions":["definite nominative/accusative singular of hotar"]},{"word":"Hotarului","pos":"name","definitions":["a river in Olt, Romania, tributary to the Iminog"],"gender":"m"},{"word":"hotarului","pos":"noun","definitions":["definite genitive/dative singular of hotar"]},{"word":"hotdog","pos":"noun","definitions":["hotdog"],"forms":{"plural":"hotdogi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hotdog","accusative-definite-nominative-singular":"hotdogul","accusative-indefinite-nominative-plural":"hotdogi","accusative-definite-nominative-plural":"hotdogii","dative-genitive-indefinite-singular":"hotdog","dative-definite-genitive-singular":"hotdogului","dative-genitive-indefinite-plural":"hotdogi","dative-definite-genitive-plural":"hotdogilor","singular-vocative":"hotdogule","plural-vocative":"hotdogilor"}},{"word":"hotel","pos":"noun","definitions":["hotel"],"pronunciation":"/hoˈtel/","forms":{"plural":"hoteluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hotel","accusative-definite-nominative-singular":"hotelul","accusative-indefinite-nominative-plural":"hotele","accusative-definite-nominative-plural":"hotelele","dative-genitive-indefinite-singular":"hotel","dative-definite-genitive-singular":"hotelului","dative-genitive-indefinite-plural":"hotele","dative-definite-genitive-plural":"hotelelor","singular-vocative":"hotelule","plural-vocative":"hotelelor"}},{"word":"hotele","pos":"noun","definitions":["indefinite plural of hotel"],"pronunciation":"[hoˈtele]","gender":"n-p"},{"word":"hotelier","pos":"noun","definitions":["hotelkeeper"],"forms":{"plural":"hotelieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hotelier","accusative-definite-nominative-singular":"hotelierul","accusative-indefinite-nominative-plural":"hotelieri","accusative-definite-nominative-plural":"hotelierii","dative-genitive-indefinite-singular":"hotelier","dative-definite-genitive-singular":"hotelierului","dative-genitive-indefinite-plural":"hotelieri","dative-definite-genitive-plural":"hotelierilor","singular-vocative":"hotelierule","plural-vocative":"hotelierilor"}},{"word":"hotelieră","pos":"noun","definitions":["female equivalent of hotelier"],"forms":{"plural":"hoteliere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hotelieră","accusative-definite-nominative-singular":"hoteliera","accusative-indefinite-nominative-plural":"hoteliere","accusative-definite-nominative-plural":"hotelierele","dative-genitive-indefinite-singular":"hoteliere","dative-definite-genitive-singular":"hotelierei","dative-genitive-indefinite-plural":"hoteliere","dative-definite-genitive-plural":"hotelierelor","singular-vocative":"hotelieră","plural-vocative":"hotelierelor"}},{"word":"Hoteni","pos":"name","definitions":["a village in Ocna Șugatag, Maramureș County, Romania"],"gender":"m"},{"word":"hotentot","pos":"noun","definitions":["Hottentot"],"forms":{"plural":"hotentoți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hotentot","accusative-definite-nominative-singular":"hotentotul","accusative-indefinite-nominative-plural":"hotentoți","accusative-definite-nominative-plural":"hotentoții","dative-genitive-indefinite-singular":"hotentot","dative-definite-genitive-singular":"hotentotului","dative-genitive-indefinite-plural":"hotentoți","dative-definite-genitive-plural":"hotentoților","singular-vocative":"hotentotule","plural-vocative":"hotentoților"}},{"word":"hotentotă","pos":"noun","definitions":["female equivalent of hotentot"],"forms":{"plural":"hotentote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hotentotă","accusative-definite-nominative-singular":"hotentota","accusative-indefinite-nominative-plural":"hotentote","accusative-definite-nominative-plural":"hotentotele","dative-genitive-indefinite-singular":"hotentote","dative-definite-genitive-singular":"hotentotei","dative-genitive-indefinite-plural":"hotentote","dative-definite-genitive-plural":"hotentotelor","singular-vocative":"hotentotă","plural-vocative":"hotentotelor"}},{"word":"hoțesc","pos":"adj","definitions":["thievish"],"forms":{"feminine-singular":"hoțească","plural":"hoțești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hoțesc","error-unrecognized-form-feminine-indefinite-singular":"hoțească","error-unrecognized-form-indefinite-masculine-plural":"hoțești","error-unrecognized-form-feminine-indefinite-neuter-plural":"hoțești","definite-error-unrecognized-form-masculine-neuter-singular":"hoțescul","definite-error-unrecognized-form-feminine-singular":"hoțeasca","definite-error-unrecognized-form-masculine-plural":"hoțeștii","definite-error-unrecognized-form-feminine-neuter-plural":"hoțeștile"}},{"word":"hoțește","pos":"adv","definitions":["thievishly"]},{"word":"hoți","pos":"verb","definitions":["to steal"],"forms":{"canonical":"a hoți 4th conjugation","present-singular-third-person":"hoțește","participle-past":"hoțit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hoți","gerund":"hoțind","first-person-indicative-present-singular":"hoțesc","indicative-present-second-person-singular":"hoțești","indicative-present-singular-third-person":"hoțește","first-person-indicative-plural-present":"hoțim","indicative-plural-present-second-person":"hoțiți","indicative-plural-present-third-person":"hoțesc","first-person-imperfect-indicative-singular":"hoțeam","imperfect-indicative-second-person-singular":"hoțeai","imperfect-indicative-singular-third-person":"hoțea","first-person-imperfect-indicative-plural":"hoțeam","imperfect-indicative-plural-second-person":"hoțeați","imperfect-indicative-plural-third-person":"hoțeau","first-person-indicative-perfect-singular":"hoții","indicative-perfect-second-person-singular":"hoțiși","indicative-perfect-singular-third-person":"hoți","first-person-indicative-perfect-plural":"hoțirăm","indicative-perfect-plural-second-person":"hoțirăți","indicative-perfect-plural-third-person":"hoțiră","first-person-indicative-pluperfect-singular":"hoțisem","indicative-pluperfect-second-person-singular":"hoțiseși","indicative-pluperfect-singular-third-person":"hoțise","first-person-indicative-pluperfect-plural":"hoțiserăm","indicative-pluperfect-plural-second-person":"hoțiserăți","indicative-pluperfect-plural-third-person":"hoțiseră","first-person-present-singular-subjunctive":"să hoțesc","present-second-person-singular-subjunctive":"să hoțești","present-singular-subjunctive-third-person":"să hoțească","first-person-plural-present-subjunctive":"să hoțim","plural-present-second-person-subjunctive":"să hoțiți","plural-present-subjunctive-third-person":"să hoțească","imperative-second-person-singular":"hoțește","imperative-plural-second-person":"hoțiți","imperative-negative-second-person-singular":"nu hoți","imperative-negative-plural-second-person":"nu hoțiți"}},{"word":"hoție","pos":"noun","definitions":["robbery, theft"],"forms":{"plural":"hoții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hoție","accusative-definite-nominative-singular":"hoția","accusative-indefinite-nominative-plural":"hoții","accusative-definite-nominative-plural":"hoțiile","dative-genitive-indefinite-singular":"hoții","dative-definite-genitive-singular":"hoției","dative-genitive-indefinite-plural":"hoții","dative-definite-genitive-plural":"hoțiilor","singular-vocative":"hoție","plural-vocative":"hoțiilor"}},{"word":"hoție la drumul mare","pos":"noun","definitions":["highway robbery"],"forms":{"plural":"hoții la drumul mare"}},{"word":"hoților","pos":"noun","definitions":["definite genitive/dative plural of hoț"]},{"word":"hoțime","pos":"noun","definitions":["thiefdom"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"hoțime","accusative-definite-nominative":"hoțimea","dative-genitive-indefinite":"hoțimi","dative-definite-genitive":"hoțimii","vocative":"hoțime"}},{"word":"hoțiș","pos":"adv","definitions":["thiefly"]},{"word":"hoțit","pos":"noun","definitions":["stealing"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hoțit","accusative-definite-nominative":"hoțitul","dative-genitive-indefinite":"hoțit","dative-definite-genitive":"hoțitului","vocative":"hoțitule"}},{"word":"hoțit","pos":"verb","definitions":["past participle of hoți"],"forms":{"participle-past":"of hoți"}},{"word":"hotline","pos":"noun","definitions":["hotline"]},{"word":"hotnog","pos":"noun","definitions":["commander over 100 soldiers"],"forms":{"plural":"hotnogi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hotnog","accusative-definite-nominative-singular":"hotnogul","accusative-indefinite-nominative-plural":"hotnogi","accusative-definite-nominative-plural":"hotnogii","dative-genitive-indefinite-singular":"hotnog","dative-definite-genitive-singular":"hotnogului","dative-genitive-indefinite-plural":"hotnogi","dative-definite-genitive-plural":"hotnogilor","singular-vocative":"hotnogule","plural-vocative":"hotnogilor"}},{"word":"hotnogi","pos":"noun","definitions":["obsolete form of hotnog"],"forms":{"plural":"hotnogi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hotnogi","accusative-definite-nominative-singular":"hotnogiul","accusative-indefinite-nominative-plural":"hotnogi","accusative-definite-nominative-plural":"hotnogii","dative-genitive-indefinite-singular":"hotnogi","dative-definite-genitive-singular":"hotnogiului","dative-genitive-indefinite-plural":"hotnogi","dative-definite-genitive-plural":"hotnogilor","singular-vocative":"hotnogiule","plural-vocative":"hotnogilor"}},{"word":"hoțoaică","pos":"noun","definitions":["female equivalent of hoț","fruit picker tool"],"forms":{"plural":"hoțoaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hoțoaică","accusative-definite-nominative-singular":"hoțoaica","accusative-indefinite-nominative-plural":"hoțoaice","accusative-definite-nominative-plural":"hoțoaicele","dative-genitive-indefinite-singular":"hoțoaice","dative-definite-genitive-singular":"hoțoaicei","dative-genitive-indefinite-plural":"hoțoaice","dative-definite-genitive-plural":"hoțoaicelor","singular-vocative":"hoțoaică","plural-vocative":"hoțoaicelor"}},{"word":"Hoțoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Hoțoiu"}},{"word":"hoțoman","pos":"noun","definitions":["a thief, a trickster"],"forms":{"plural":"hoțomani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hoțoman","accusative-definite-nominative-singular":"hoțomanul","accusative-indefinite-nominative-plural":"hoțomani","accusative-definite-nominative-plural":"hoțomanii","dative-genitive-indefinite-singular":"hoțoman","dative-definite-genitive-singular":"hoțomanului","dative-genitive-indefinite-plural":"hoțomani","dative-definite-genitive-plural":"hoțomanilor","singular-vocative":"hoțomanule","plural-vocative":"hoțomanilor"}},{"word":"hoțomană","pos":"noun","definitions":["female equivalent of hoțoman"],"forms":{"plural":"hoțomane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hoțomană","accusative-definite-nominative-singular":"hoțomana","accusative-indefinite-nominative-plural":"hoțomane","accusative-definite-nominative-plural":"hoțomanele","dative-genitive-indefinite-singular":"hoțomane","dative-definite-genitive-singular":"hoțomanei","dative-genitive-indefinite-plural":"hoțomane","dative-definite-genitive-plural":"hoțomanelor","singular-vocative":"hoțomană","plural-vocative":"hoțomanelor"}},{"word":"hoțomancă","pos":"noun","definitions":["female thief"],"forms":{"plural":"hoțomance","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hoțomancă","accusative-definite-nominative-singular":"hoțomanca","accusative-indefinite-nominative-plural":"hoțomance","accusative-definite-nominative-plural":"hoțomancele","dative-genitive-indefinite-singular":"hoțomance","dative-definite-genitive-singular":"hoțomancei","dative-genitive-indefinite-plural":"hoțomance","dative-definite-genitive-plural":"hoțomancelor","singular-vocative":"hoțomancă","plural-vocative":"hoțomancelor"}},{"word":"hoțomănește","pos":"adv","definitions":["like a thief"]},{"word":"hoțomănie","pos":"noun","definitions":["thievery"],"forms":{"plural":"hoțomănii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hoțomănie","accusative-definite-nominative-singular":"hoțomănia","accusative-indefinite-nominative-plural":"hoțomănii","accusative-definite-nominative-plural":"hoțomăniile","dative-genitive-indefinite-singular":"hoțomănii","dative-definite-genitive-singular":"hoțomăniei","dative-genitive-indefinite-plural":"hoțomănii","dative-definite-genitive-plural":"hoțomăniilor","singular-vocative":"hoțomănie","plural-vocative":"hoțomăniilor"}},{"word":"Hoțu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Hoțu"}},{"word":"hoțul neprins e negustor cinstit","pos":"proverb","definitions":["one is innocent until proven guilty; one is given the benefit of the doubt"],"forms":{"alternative":"hoțul neprins este negustor cinstit"}},{"word":"house","pos":"noun","definitions":["house music"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"house","accusative-definite-nominative":"houseul","dative-genitive-indefinite":"house","dative-definite-genitive":"houseului","vocative":"houseule"}},{"word":"hovercraft","pos":"noun","definitions":["hovercraft"],"forms":{"plural":"hovercrafturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hovercraft","accusative-definite-nominative-singular":"hovercraftul","accusative-indefinite-nominative-plural":"hovercrafturi","accusative-definite-nominative-plural":"hovercrafturile","dative-genitive-indefinite-singular":"hovercraft","dative-definite-genitive-singular":"hovercraftului","dative-genitive-indefinite-plural":"hovercrafturi","dative-definite-genitive-plural":"hovercrafturilor","singular-vocative":"hovercraftule","plural-vocative":"hovercrafturilor"}},{"word":"hovercraftul","pos":"noun","definitions":["definite nominative/accusative singular of hovercraft"]},{"word":"hovercraftului","pos":"noun","definitions":["definite genitive/dative singular of hovercraft"]},{"word":"hovercrafturi","pos":"noun","definitions":["indefinite nominative/accusative/genitive/dative plural of hovercraft"]},{"word":"hovercrafturile","pos":"noun","definitions":["definite nominative/accusative plural of hovercraft"]},{"word":"hovercrafturilor","pos":"noun","definitions":["definite genitive/dative plural of hovercraft"]},{"word":"Hovrila","pos":"name","definitions":["a locality in Șomcuta Mare, Maramureș County, Romania"],"gender":"f"},{"word":"HR","pos":"name","definitions":["abbreviation of Harghita: a county of Romania"]},{"word":"hrăbor","pos":"adv","definitions":["heroically"]},{"word":"hrăborie","pos":"noun","definitions":["bravery"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hrăborie","accusative-definite-nominative":"hrăboria","dative-genitive-indefinite":"hrăborii","dative-definite-genitive":"hrăboriei","vocative":"hrăborie"}},{"word":"hraconi","pos":"verb","definitions":["to spit"],"forms":{"canonical":"a hraconi 4th conjugation","present-singular-third-person":"hraconește","participle-past":"hraconit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hraconi","gerund":"hraconind","first-person-indicative-present-singular":"hraconesc","indicative-present-second-person-singular":"hraconești","indicative-present-singular-third-person":"hraconește","first-person-indicative-plural-present":"hraconim","indicative-plural-present-second-person":"hraconiți","indicative-plural-present-third-person":"hraconesc","first-person-imperfect-indicative-singular":"hraconeam","imperfect-indicative-second-person-singular":"hraconeai","imperfect-indicative-singular-third-person":"hraconea","first-person-imperfect-indicative-plural":"hraconeam","imperfect-indicative-plural-second-person":"hraconeați","imperfect-indicative-plural-third-person":"hraconeau","first-person-indicative-perfect-singular":"hraconii","indicative-perfect-second-person-singular":"hraconiși","indicative-perfect-singular-third-person":"hraconi","first-person-indicative-perfect-plural":"hraconirăm","indicative-perfect-plural-second-person":"hraconirăți","indicative-perfect-plural-third-person":"hraconiră","first-person-indicative-pluperfect-singular":"hraconisem","indicative-pluperfect-second-person-singular":"hraconiseși","indicative-pluperfect-singular-third-person":"hraconise","first-person-indicative-pluperfect-plural":"hraconiserăm","indicative-pluperfect-plural-second-person":"hraconiserăți","indicative-pluperfect-plural-third-person":"hraconiseră","first-person-present-singular-subjunctive":"să hraconesc","present-second-person-singular-subjunctive":"să hraconești","present-singular-subjunctive-third-person":"să hraconească","first-person-plural-present-subjunctive":"să hraconim","plural-present-second-person-subjunctive":"să hraconiți","plural-present-subjunctive-third-person":"să hraconească","imperative-second-person-singular":"hraconește","imperative-plural-second-person":"hraconiți","imperative-negative-second-person-singular":"nu hraconi","imperative-negative-plural-second-person":"nu hraconiți"}},{"word":"hraconit","pos":"noun","definitions":["phlegm"],"forms":{"plural":"hraconituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hraconit","accusative-definite-nominative-singular":"hraconitul","accusative-indefinite-nominative-plural":"hraconituri","accusative-definite-nominative-plural":"hraconiturile","dative-genitive-indefinite-singular":"hraconit","dative-definite-genitive-singular":"hraconitului","dative-genitive-indefinite-plural":"hraconituri","dative-definite-genitive-plural":"hraconiturilor","singular-vocative":"hraconitule","plural-vocative":"hraconiturilor"}},{"word":"hraconit","pos":"verb","definitions":["past participle of hraconi"],"forms":{"participle-past":"of hraconi"}},{"word":"hram","pos":"noun","definitions":["church (service)","temple","parish fair, dedication day, celebration in honor of a patron saint of a church, kermis","the patron of a church"],"pronunciation":"/ˈhram/","forms":{"plural":"hramuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hram","accusative-definite-nominative-singular":"hramul","accusative-indefinite-nominative-plural":"hramuri","accusative-definite-nominative-plural":"hramurile","dative-genitive-indefinite-singular":"hram","dative-definite-genitive-singular":"hramului","dative-genitive-indefinite-plural":"hramuri","dative-definite-genitive-plural":"hramurilor","singular-vocative":"hramule","plural-vocative":"hramurilor"}},{"word":"hramuri","pos":"noun","definitions":["plural of hram"],"gender":"m-p"},{"word":"hrana","pos":"noun","definitions":["definite nominative/accusative singular of hrană"],"gender":"f"},{"word":"hrană","pos":"noun","definitions":["food"],"pronunciation":"/ˈhra.nə/","forms":{"plural":"hrane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hrană","accusative-definite-nominative-singular":"hrana","accusative-indefinite-nominative-plural":"hrane","accusative-definite-nominative-plural":"hranele","dative-genitive-indefinite-singular":"hrane","dative-definite-genitive-singular":"hranei","dative-genitive-indefinite-plural":"hrane","dative-definite-genitive-plural":"hranelor","singular-vocative":"hrană","plural-vocative":"hranelor"}},{"word":"hrane","pos":"noun","definitions":["plural of hrană"],"gender":"f-p"},{"word":"hranei","pos":"noun","definitions":["definite genitive/dative singular of hrană"]},{"word":"hrăni","pos":"verb","definitions":["to feed, nourish","to nurse, suckle"],"forms":{"canonical":"a hrăni 4th conjugation","present-singular-third-person":"hrănește","participle-past":"hrănit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hrăni","gerund":"hrănind","first-person-indicative-present-singular":"hrănesc","indicative-present-second-person-singular":"hrănești","indicative-present-singular-third-person":"hrănește","first-person-indicative-plural-present":"hrănim","indicative-plural-present-second-person":"hrăniți","indicative-plural-present-third-person":"hrănesc","first-person-imperfect-indicative-singular":"hrăneam","imperfect-indicative-second-person-singular":"hrăneai","imperfect-indicative-singular-third-person":"hrănea","first-person-imperfect-indicative-plural":"hrăneam","imperfect-indicative-plural-second-person":"hrăneați","imperfect-indicative-plural-third-person":"hrăneau","first-person-indicative-perfect-singular":"hrănii","indicative-perfect-second-person-singular":"hrăniși","indicative-perfect-singular-third-person":"hrăni","first-person-indicative-perfect-plural":"hrănirăm","indicative-perfect-plural-second-person":"hrănirăți","indicative-perfect-plural-third-person":"hrăniră","first-person-indicative-pluperfect-singular":"hrănisem","indicative-pluperfect-second-person-singular":"hrăniseși","indicative-pluperfect-singular-third-person":"hrănise","first-person-indicative-pluperfect-plural":"hrăniserăm","indicative-pluperfect-plural-second-person":"hrăniserăți","indicative-pluperfect-plural-third-person":"hrăniseră","first-person-present-singular-subjunctive":"să hrănesc","present-second-person-singular-subjunctive":"să hrănești","present-singular-subjunctive-third-person":"să hrănească","first-person-plural-present-subjunctive":"să hrănim","plural-present-second-person-subjunctive":"să hrăniți","plural-present-subjunctive-third-person":"să hrănească","imperative-second-person-singular":"hrănește","imperative-plural-second-person":"hrăniți","imperative-negative-second-person-singular":"nu hrăni","imperative-negative-plural-second-person":"nu hrăniți"}},{"word":"hranilniță","pos":"noun","definitions":["talisman"],"forms":{"plural":"hranilnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hranilniță","accusative-definite-nominative-singular":"hranilnița","accusative-indefinite-nominative-plural":"hranilnițe","accusative-definite-nominative-plural":"hranilnițele","dative-genitive-indefinite-singular":"hranilnițe","dative-definite-genitive-singular":"hranilniței","dative-genitive-indefinite-plural":"hranilnițe","dative-definite-genitive-plural":"hranilnițelor","singular-vocative":"hranilniță","plural-vocative":"hranilnițelor"}},{"word":"hrănire","pos":"noun","definitions":["feeding","nutrition","nourishment"],"forms":{"plural":"hrăniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hrănire","accusative-definite-nominative-singular":"hrănirea","accusative-indefinite-nominative-plural":"hrăniri","accusative-definite-nominative-plural":"hrănirile","dative-genitive-indefinite-singular":"hrăniri","dative-definite-genitive-singular":"hrănirii","dative-genitive-indefinite-plural":"hrăniri","dative-definite-genitive-plural":"hrănirilor","singular-vocative":"hrănire","plural-vocative":"hrănirilor"}},{"word":"hrănit","pos":"adj","definitions":["nourished"],"forms":{"feminine-singular":"hrănită","masculine-plural":"hrăniți","feminine-neuter-plural":"hrănite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hrănit","error-unrecognized-form-feminine-indefinite-singular":"hrănită","error-unrecognized-form-indefinite-masculine-plural":"hrăniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hrănite","definite-error-unrecognized-form-masculine-neuter-singular":"hrănitul","definite-error-unrecognized-form-feminine-singular":"hrănita","definite-error-unrecognized-form-masculine-plural":"hrăniții","definite-error-unrecognized-form-feminine-neuter-plural":"hrănitele"}},{"word":"hraniță","pos":"noun","definitions":["boundary, border"],"forms":{"plural":"hranițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hraniță","accusative-definite-nominative-singular":"hranița","accusative-indefinite-nominative-plural":"hranițe","accusative-definite-nominative-plural":"hranițele","dative-genitive-indefinite-singular":"hranițe","dative-definite-genitive-singular":"hraniței","dative-genitive-indefinite-plural":"hranițe","dative-definite-genitive-plural":"hranițelor","singular-vocative":"hraniță","plural-vocative":"hranițelor"}},{"word":"hrănitor","pos":"adj","definitions":["nutritious"],"forms":{"feminine-singular":"hrănitoare","masculine-plural":"hrănitori","feminine-neuter-plural":"hrănitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hrănitor","error-unrecognized-form-feminine-indefinite-singular":"hrănitoare","error-unrecognized-form-indefinite-masculine-plural":"hrănitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"hrănitoare","definite-error-unrecognized-form-masculine-neuter-singular":"hrănitorul","definite-error-unrecognized-form-feminine-singular":"hrănitoarea","definite-error-unrecognized-form-masculine-plural":"hrănitorii","definite-error-unrecognized-form-feminine-neuter-plural":"hrănitoarele"}},{"word":"hrano","pos":"noun","definitions":["vocative singular of hrană"],"pronunciation":"[ˈhrano]","gender":"f"},{"word":"hrănuță","pos":"noun","definitions":["diminutive of hrană"],"forms":{"plural":"hrănuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hrănuță","accusative-definite-nominative-singular":"hrănuța","accusative-indefinite-nominative-plural":"hrănuțe","accusative-definite-nominative-plural":"hrănuțele","dative-genitive-indefinite-singular":"hrănuțe","dative-definite-genitive-singular":"hrănuței","dative-genitive-indefinite-plural":"hrănuțe","dative-definite-genitive-plural":"hrănuțelor","singular-vocative":"hrănuță","plural-vocative":"hrănuțelor"}},{"word":"hrăpăreț","pos":"adj","definitions":["wolfish, predatory, wanting to get rich by any means"],"forms":{"feminine-singular":"hrăpăreață","masculine-plural":"hrăpăreți","feminine-neuter-plural":"hrăpărețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hrăpăreț","error-unrecognized-form-feminine-indefinite-singular":"hrăpăreață","error-unrecognized-form-indefinite-masculine-plural":"hrăpăreți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hrăpărețe","definite-error-unrecognized-form-masculine-neuter-singular":"hrăpărețul","definite-error-unrecognized-form-feminine-singular":"hrăpăreața","definite-error-unrecognized-form-masculine-plural":"hrăpăreții","definite-error-unrecognized-form-feminine-neuter-plural":"hrăpărețele"}},{"word":"hrăpăreție","pos":"noun","definitions":["predatoriness"],"forms":{"plural":"hrăpăreții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hrăpăreție","accusative-definite-nominative-singular":"hrăpăreția","accusative-indefinite-nominative-plural":"hrăpăreții","accusative-definite-nominative-plural":"hrăpărețiile","dative-genitive-indefinite-singular":"hrăpăreții","dative-definite-genitive-singular":"hrăpăreției","dative-genitive-indefinite-plural":"hrăpăreții","dative-definite-genitive-plural":"hrăpărețiilor","singular-vocative":"hrăpăreție","plural-vocative":"hrăpărețiilor"}},{"word":"hrăpi","pos":"verb","definitions":["alternative form of răpi"],"forms":{"canonical":"a hrăpi 4th conjugation","present-singular-third-person":"hrăpește","participle-past":"hrăpit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hrăpi","gerund":"hrăpind","first-person-indicative-present-singular":"hrăpesc","indicative-present-second-person-singular":"hrăpești","indicative-present-singular-third-person":"hrăpește","first-person-indicative-plural-present":"hrăpim","indicative-plural-present-second-person":"hrăpiți","indicative-plural-present-third-person":"hrăpesc","first-person-imperfect-indicative-singular":"hrăpeam","imperfect-indicative-second-person-singular":"hrăpeai","imperfect-indicative-singular-third-person":"hrăpea","first-person-imperfect-indicative-plural":"hrăpeam","imperfect-indicative-plural-second-person":"hrăpeați","imperfect-indicative-plural-third-person":"hrăpeau","first-person-indicative-perfect-singular":"hrăpii","indicative-perfect-second-person-singular":"hrăpiși","indicative-perfect-singular-third-person":"hrăpi","first-person-indicative-perfect-plural":"hrăpirăm","indicative-perfect-plural-second-person":"hrăpirăți","indicative-perfect-plural-third-person":"hrăpiră","first-person-indicative-pluperfect-singular":"hrăpisem","indicative-pluperfect-second-person-singular":"hrăpiseși","indicative-pluperfect-singular-third-person":"hrăpise","first-person-indicative-pluperfect-plural":"hrăpiserăm","indicative-pluperfect-plural-second-person":"hrăpiserăți","indicative-pluperfect-plural-third-person":"hrăpiseră","first-person-present-singular-subjunctive":"să hrăpesc","present-second-person-singular-subjunctive":"să hrăpești","present-singular-subjunctive-third-person":"să hrăpească","first-person-plural-present-subjunctive":"să hrăpim","plural-present-second-person-subjunctive":"să hrăpiți","plural-present-subjunctive-third-person":"să hrăpească","imperative-second-person-singular":"hrăpește","imperative-plural-second-person":"hrăpiți","imperative-negative-second-person-singular":"nu hrăpi","imperative-negative-plural-second-person":"nu hrăpiți"}},{"word":"hrăpire","pos":"noun","definitions":["alternative form of răpire"],"forms":{"plural":"hrăpiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hrăpire","accusative-definite-nominative-singular":"hrăpirea","accusative-indefinite-nominative-plural":"hrăpiri","accusative-definite-nominative-plural":"hrăpirile","dative-genitive-indefinite-singular":"hrăpiri","dative-definite-genitive-singular":"hrăpirii","dative-genitive-indefinite-plural":"hrăpiri","dative-definite-genitive-plural":"hrăpirilor","singular-vocative":"hrăpire","plural-vocative":"hrăpirilor"}},{"word":"hreamăt","pos":"noun","definitions":["alternative form of freamăt"],"forms":{"plural":"hreamăte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hreamăt","accusative-definite-nominative-singular":"hreamătul","accusative-indefinite-nominative-plural":"hreamăte","accusative-definite-nominative-plural":"hreamătele","dative-genitive-indefinite-singular":"hreamăt","dative-definite-genitive-singular":"hreamătului","dative-genitive-indefinite-plural":"hreamăte","dative-definite-genitive-plural":"hreamătelor","singular-vocative":"hreamătule","plural-vocative":"hreamătelor"}},{"word":"Hrean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hrean"}},{"word":"hrean","pos":"noun","definitions":["horseradish (plant)","horseradish (condiment)"],"pronunciation":"/hre̯an/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"hrean","accusative-definite-nominative":"hreanul","dative-genitive-indefinite":"hrean","dative-definite-genitive":"hreanului","vocative":"hreanule"}},{"word":"hreaniță","pos":"noun","definitions":["corn rocket (Bunias erucago)"],"forms":{"plural":"hreanițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hreaniță","accusative-definite-nominative-singular":"hreanița","accusative-indefinite-nominative-plural":"hreanițe","accusative-definite-nominative-plural":"hreanițele","dative-genitive-indefinite-singular":"hreanițe","dative-definite-genitive-singular":"hreaniței","dative-genitive-indefinite-plural":"hreanițe","dative-definite-genitive-plural":"hreanițelor","singular-vocative":"hreaniță","plural-vocative":"hreanițelor"}},{"word":"Hreasca","pos":"name","definitions":["a village in Coroiești, Vaslui County, Romania"],"gender":"f"},{"word":"Hreațca","pos":"name","definitions":["a village in Vulturești, Suceava County, Romania"],"gender":"f"},{"word":"Hrebenciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Hrebenciuc"}},{"word":"Hrehorciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Hrehorciuc"}},{"word":"Hrenciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Hrenciuc"}},{"word":"hreniță","pos":"noun","definitions":["field pepperwort (Lepidium campestre)","garden cress (Lepidium campestre)"],"forms":{"plural":"hrenițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hreniță","accusative-definite-nominative-singular":"hrenița","accusative-indefinite-nominative-plural":"hrenițe","accusative-definite-nominative-plural":"hrenițele","dative-genitive-indefinite-singular":"hrenițe","dative-definite-genitive-singular":"hreniței","dative-genitive-indefinite-plural":"hrenițe","dative-definite-genitive-plural":"hrenițelor","singular-vocative":"hreniță","plural-vocative":"hrenițelor"}},{"word":"hrentui","pos":"verb","definitions":["to break down"],"forms":{"canonical":"a hrentui 4th conjugation","present-singular-third-person":"hrentuiește","participle-past":"hrentuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hrentui","gerund":"hrentuind","first-person-indicative-present-singular":"hrentuiesc","indicative-present-second-person-singular":"hrentuiești","indicative-present-singular-third-person":"hrentuiește","first-person-indicative-plural-present":"hrentuim","indicative-plural-present-second-person":"hrentuiți","indicative-plural-present-third-person":"hrentuiesc","first-person-imperfect-indicative-singular":"hrentuiam","imperfect-indicative-second-person-singular":"hrentuiai","imperfect-indicative-singular-third-person":"hrentuia","first-person-imperfect-indicative-plural":"hrentuiam","imperfect-indicative-plural-second-person":"hrentuiați","imperfect-indicative-plural-third-person":"hrentuiau","first-person-indicative-perfect-singular":"hrentuii","indicative-perfect-second-person-singular":"hrentuiși","indicative-perfect-singular-third-person":"hrentui","first-person-indicative-perfect-plural":"hrentuirăm","indicative-perfect-plural-second-person":"hrentuirăți","indicative-perfect-plural-third-person":"hrentuiră","first-person-indicative-pluperfect-singular":"hrentuisem","indicative-pluperfect-second-person-singular":"hrentuiseși","indicative-pluperfect-singular-third-person":"hrentuise","first-person-indicative-pluperfect-plural":"hrentuiserăm","indicative-pluperfect-plural-second-person":"hrentuiserăți","indicative-pluperfect-plural-third-person":"hrentuiseră","first-person-present-singular-subjunctive":"să hrentuiesc","present-second-person-singular-subjunctive":"să hrentuiești","present-singular-subjunctive-third-person":"să hrentuiască","first-person-plural-present-subjunctive":"să hrentuim","plural-present-second-person-subjunctive":"să hrentuiți","plural-present-subjunctive-third-person":"să hrentuiască","imperative-second-person-singular":"hrentuiește","imperative-plural-second-person":"hrentuiți","imperative-negative-second-person-singular":"nu hrentui","imperative-negative-plural-second-person":"nu hrentuiți"}},{"word":"hrentuit","pos":"adj","definitions":["broken down"],"forms":{"feminine-singular":"hrentuită","masculine-plural":"hrentuiți","feminine-neuter-plural":"hrentuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hrentuit","error-unrecognized-form-feminine-indefinite-singular":"hrentuită","error-unrecognized-form-indefinite-masculine-plural":"hrentuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hrentuite","definite-error-unrecognized-form-masculine-neuter-singular":"hrentuitul","definite-error-unrecognized-form-feminine-singular":"hrentuita","definite-error-unrecognized-form-masculine-plural":"hrentuiții","definite-error-unrecognized-form-feminine-neuter-plural":"hrentuitele"}},{"word":"hrentuit","pos":"verb","definitions":["past participle of hrentui"],"forms":{"participle-past":"of hrentui"}},{"word":"hrentuitură","pos":"noun","definitions":["tiredness, fatigue, weariness"],"forms":{"plural":"hrentuituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hrentuitură","accusative-definite-nominative-singular":"hrentuitura","accusative-indefinite-nominative-plural":"hrentuituri","accusative-definite-nominative-plural":"hrentuiturile","dative-genitive-indefinite-singular":"hrentuituri","dative-definite-genitive-singular":"hrentuiturii","dative-genitive-indefinite-plural":"hrentuituri","dative-definite-genitive-plural":"hrentuiturilor","singular-vocative":"hrentuitură","plural-vocative":"hrentuiturilor"}},{"word":"hrepcui","pos":"verb","definitions":["to scythe"],"forms":{"canonical":"a hrepcui 4th conjugation","present-singular-third-person":"hrepcuiește","participle-past":"hrepcuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hrepcui","gerund":"hrepcuind","first-person-indicative-present-singular":"hrepcuiesc","indicative-present-second-person-singular":"hrepcuiești","indicative-present-singular-third-person":"hrepcuiește","first-person-indicative-plural-present":"hrepcuim","indicative-plural-present-second-person":"hrepcuiți","indicative-plural-present-third-person":"hrepcuiesc","first-person-imperfect-indicative-singular":"hrepcuiam","imperfect-indicative-second-person-singular":"hrepcuiai","imperfect-indicative-singular-third-person":"hrepcuia","first-person-imperfect-indicative-plural":"hrepcuiam","imperfect-indicative-plural-second-person":"hrepcuiați","imperfect-indicative-plural-third-person":"hrepcuiau","first-person-indicative-perfect-singular":"hrepcuii","indicative-perfect-second-person-singular":"hrepcuiși","indicative-perfect-singular-third-person":"hrepcui","first-person-indicative-perfect-plural":"hrepcuirăm","indicative-perfect-plural-second-person":"hrepcuirăți","indicative-perfect-plural-third-person":"hrepcuiră","first-person-indicative-pluperfect-singular":"hrepcuisem","indicative-pluperfect-second-person-singular":"hrepcuiseși","indicative-pluperfect-singular-third-person":"hrepcuise","first-person-indicative-pluperfect-plural":"hrepcuiserăm","indicative-pluperfect-plural-second-person":"hrepcuiserăți","indicative-pluperfect-plural-third-person":"hrepcuiseră","first-person-present-singular-subjunctive":"să hrepcuiesc","present-second-person-singular-subjunctive":"să hrepcuiești","present-singular-subjunctive-third-person":"să hrepcuiască","first-person-plural-present-subjunctive":"să hrepcuim","plural-present-second-person-subjunctive":"să hrepcuiți","plural-present-subjunctive-third-person":"să hrepcuiască","imperative-second-person-singular":"hrepcuiește","imperative-plural-second-person":"hrepcuiți","imperative-negative-second-person-singular":"nu hrepcui","imperative-negative-plural-second-person":"nu hrepcuiți"}},{"word":"Hrib","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hrib"}},{"word":"hrib","pos":"noun","definitions":["porcini (Boletus edulis)"],"forms":{"plural":"hribi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hrib","accusative-definite-nominative-singular":"hribul","accusative-indefinite-nominative-plural":"hribi","accusative-definite-nominative-plural":"hribii","dative-genitive-indefinite-singular":"hrib","dative-definite-genitive-singular":"hribului","dative-genitive-indefinite-plural":"hribi","dative-definite-genitive-plural":"hribilor","singular-vocative":"hribule","plural-vocative":"hribilor"}},{"word":"hrincă","pos":"noun","definitions":["piece of bread, piece of mămăligă"],"forms":{"plural":"hrinși"}},{"word":"hrincuță","pos":"noun","definitions":["diminutive of hrincă"],"forms":{"plural":"hrincuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hrincuță","accusative-definite-nominative-singular":"hrincuța","accusative-indefinite-nominative-plural":"hrincuțe","accusative-definite-nominative-plural":"hrincuțele","dative-genitive-indefinite-singular":"hrincuțe","dative-definite-genitive-singular":"hrincuței","dative-genitive-indefinite-plural":"hrincuțe","dative-definite-genitive-plural":"hrincuțelor","singular-vocative":"hrincuță","plural-vocative":"hrincuțelor"}},{"word":"Hrișca","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hrișca"}},{"word":"Hrișcă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hrișcă"}},{"word":"hrișcă","pos":"noun","definitions":["buckwheat"],"pronunciation":"/ˈhriʃ.kə/","forms":{"plural":"hriști","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"hrișcă","accusative-definite-nominative-singular":"hrișca","accusative-indefinite-nominative-plural":"hriști","accusative-definite-nominative-plural":"hriștile","dative-genitive-indefinite-singular":"hriști","dative-definite-genitive-singular":"hriștii","dative-genitive-indefinite-plural":"hriști","dative-definite-genitive-plural":"hriștilor","singular-vocative":"-","plural-vocative":"-"}},{"word":"Hrișcani","pos":"name","definitions":["a village in Vlădeni, Botoșani County, Romania"],"gender":"m"},{"word":"hrișcar","pos":"noun","definitions":["summer chafer (Amphimallon solstitiale)"],"forms":{"plural":"hrișcari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hrișcar","accusative-definite-nominative-singular":"hrișcarul","accusative-indefinite-nominative-plural":"hrișcari","accusative-definite-nominative-plural":"hrișcarii","dative-genitive-indefinite-singular":"hrișcar","dative-definite-genitive-singular":"hrișcarului","dative-genitive-indefinite-plural":"hrișcari","dative-definite-genitive-plural":"hrișcarilor","singular-vocative":"hrișcarule","plural-vocative":"hrișcarilor"}},{"word":"hrismă","pos":"noun","definitions":["chrism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hrismă","accusative-definite-nominative":"hrismăul","dative-genitive-indefinite":"hrismă","dative-definite-genitive":"hrismăului","vocative":"hrismăule"}},{"word":"hrismos","pos":"noun","definitions":["oracle"],"forms":{"plural":"hrismosuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hrismos","accusative-definite-nominative-singular":"hrismosul","accusative-indefinite-nominative-plural":"hrismosuri","accusative-definite-nominative-plural":"hrismosurile","dative-genitive-indefinite-singular":"hrismos","dative-definite-genitive-singular":"hrismosului","dative-genitive-indefinite-plural":"hrismosuri","dative-definite-genitive-plural":"hrismosurilor","singular-vocative":"hrismosule","plural-vocative":"hrismosurilor"}},{"word":"hrisov","pos":"noun","definitions":["chrysobull","charter, deed"],"forms":{"plural":"hrisoave","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hrisov","accusative-definite-nominative-singular":"hrisovul","accusative-indefinite-nominative-plural":"hrisoave","accusative-definite-nominative-plural":"hrisoavele","dative-genitive-indefinite-singular":"hrisov","dative-definite-genitive-singular":"hrisovului","dative-genitive-indefinite-plural":"hrisoave","dative-definite-genitive-plural":"hrisoavelor","singular-vocative":"hrisovule","plural-vocative":"hrisoavelor"}},{"word":"Hrisoverghi","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Hrisoverghi"}},{"word":"Hrist","pos":"name","definitions":["alternative form of Hristos"],"pronunciation":"/hrist/","gender":"m","forms":{"dative-genitive":"lui Hrist"}},{"word":"Hristache","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Hristache"}},{"word":"Hristescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Hristescu"}},{"word":"hriști","pos":"noun","definitions":["plural of hrișcă"]},{"word":"hristian","pos":"adj","definitions":["Christian"],"forms":{"feminine-singular":"hristiană","masculine-plural":"hristieni","feminine-neuter-plural":"hristiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hristian","error-unrecognized-form-feminine-indefinite-singular":"hristiană","error-unrecognized-form-indefinite-masculine-plural":"hristieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"hristiene","definite-error-unrecognized-form-masculine-neuter-singular":"hristianul","definite-error-unrecognized-form-feminine-singular":"hristiana","definite-error-unrecognized-form-masculine-plural":"hristienii","definite-error-unrecognized-form-feminine-neuter-plural":"hristienele"}},{"word":"hristianitate","pos":"noun","definitions":["Christianity"],"forms":{"plural":"hristianitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hristianitate","accusative-definite-nominative-singular":"hristianitatea","accusative-indefinite-nominative-plural":"hristianitatăți","accusative-definite-nominative-plural":"hristianitatățile","dative-genitive-indefinite-singular":"hristianitatăți","dative-definite-genitive-singular":"hristianitatății","dative-genitive-indefinite-plural":"hristianitatăți","dative-definite-genitive-plural":"hristianitatăților","singular-vocative":"hristianitate","plural-vocative":"hristianitatăților"}},{"word":"Hristică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hristică"}},{"word":"Hristici","pos":"name","definitions":["a village in Hristici, Soroca Raion, Moldova","a commune of Soroca Raion, Moldova"],"gender":"m"},{"word":"Hristodorescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Hristodorescu"}},{"word":"Hristoforovca","pos":"name","definitions":["a village in Pîrlița, Ungheni Raion, Moldova"],"gender":"f"},{"word":"hristoitie","pos":"noun","definitions":["a pious life"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hristoitie","accusative-definite-nominative":"hristoitia","dative-genitive-indefinite":"hristoitii","dative-definite-genitive":"hristoitiei","vocative":"hristoitie"}},{"word":"Hristos","pos":"name","definitions":["Christ"],"pronunciation":"/hrisˈtos/","gender":"m","forms":{"dative-genitive":"lui Hristos","alternative":"Cristos"}},{"word":"Hristov","pos":"name","definitions":["a surname from Bulgarian"]},{"word":"Hristu","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Hristu"}},{"word":"Hrițcu","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Hrițcu"}},{"word":"Hrițuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Hrițuc"}},{"word":"Hroniade","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Hroniade"}},{"word":"hronic","pos":"noun","definitions":["chronicle"],"forms":{"plural":"hronice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hronic","accusative-definite-nominative-singular":"hronicul","accusative-indefinite-nominative-plural":"hronice","accusative-definite-nominative-plural":"hronicele","dative-genitive-indefinite-singular":"hronic","dative-definite-genitive-singular":"hronicului","dative-genitive-indefinite-plural":"hronice","dative-definite-genitive-plural":"hronicelor","singular-vocative":"hronicule","plural-vocative":"hronicelor"}},{"word":"hronică","pos":"noun","definitions":["obsolete form of hronic"],"forms":{"plural":"hronici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hronică","accusative-definite-nominative-singular":"hronica","accusative-indefinite-nominative-plural":"hronici","accusative-definite-nominative-plural":"hronicile","dative-genitive-indefinite-singular":"hronici","dative-definite-genitive-singular":"hronicii","dative-genitive-indefinite-plural":"hronici","dative-definite-genitive-plural":"hronicilor","singular-vocative":"hronică","plural-vocative":"hronicilor"}},{"word":"hronicar","pos":"noun","definitions":["chronicler"],"forms":{"plural":"hronicari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hronicar","accusative-definite-nominative-singular":"hronicarul","accusative-indefinite-nominative-plural":"hronicari","accusative-definite-nominative-plural":"hronicarii","dative-genitive-indefinite-singular":"hronicar","dative-definite-genitive-singular":"hronicarului","dative-genitive-indefinite-plural":"hronicari","dative-definite-genitive-plural":"hronicarilor","singular-vocative":"hronicarule","plural-vocative":"hronicarilor"}},{"word":"hronograf","pos":"noun","definitions":["alternative form of cronograf"],"forms":{"plural":"hronografe"}},{"word":"hrubă","pos":"noun","definitions":["cave (used for storing food)","hut, burdei"],"forms":{"plural":"hrube","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hrubă","accusative-definite-nominative-singular":"hruba","accusative-indefinite-nominative-plural":"hrube","accusative-definite-nominative-plural":"hrubele","dative-genitive-indefinite-singular":"hrube","dative-definite-genitive-singular":"hrubei","dative-genitive-indefinite-plural":"hrube","dative-definite-genitive-plural":"hrubelor","singular-vocative":"hrubă","plural-vocative":"hrubelor"}},{"word":"Hrubna Nouă","pos":"name","definitions":["a village in Taxobeni, Fălești Raion, Moldova"],"gender":"f"},{"word":"hrubuliță","pos":"noun","definitions":["diminutive of hrubă"],"forms":{"plural":"hrubulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hrubuliță","accusative-definite-nominative-singular":"hrubulița","accusative-indefinite-nominative-plural":"hrubulițe e","accusative-definite-nominative-plural":"hrubulițe ele","dative-genitive-indefinite-singular":"hrubulițe e","dative-definite-genitive-singular":"hrubulițe ei","dative-genitive-indefinite-plural":"hrubulițe e","dative-definite-genitive-plural":"hrubulițe elor","singular-vocative":"hrubuliță","plural-vocative":"hrubulițe elor"}},{"word":"Hrușca","pos":"name","definitions":["a village in Hrușca, Transnistria, Moldova","a commune of Transnistria, Moldova"],"gender":"f"},{"word":"Hrușcă","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Hrușcă"}},{"word":"Hrușova","pos":"name","definitions":["a village in Hrușova, Criuleni Raion, Moldova","a commune of Criuleni Raion, Moldova"],"gender":"f"},{"word":"htonian","pos":"noun","definitions":["chthonian"],"forms":{"plural":"htonieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"htonian","accusative-definite-nominative-singular":"htonianul","accusative-indefinite-nominative-plural":"htonieni","accusative-definite-nominative-plural":"htonienii","dative-genitive-indefinite-singular":"htonian","dative-definite-genitive-singular":"htonianului","dative-genitive-indefinite-plural":"htonieni","dative-definite-genitive-plural":"htonienilor","singular-vocative":"htonianule","plural-vocative":"htonienilor"}},{"word":"htoniană","pos":"noun","definitions":["female equivalent of htonian"],"forms":{"plural":"htoniene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"htoniană","accusative-definite-nominative-singular":"htoniana","accusative-indefinite-nominative-plural":"htoniene","accusative-definite-nominative-plural":"htonienele","dative-genitive-indefinite-singular":"htoniene","dative-definite-genitive-singular":"htonienei","dative-genitive-indefinite-plural":"htoniene","dative-definite-genitive-plural":"htonienelor","singular-vocative":"htoniană","plural-vocative":"htonienelor"}},{"word":"htonic","pos":"adj","definitions":["chthonic"],"forms":{"feminine-singular":"htonică","masculine-plural":"htonici","feminine-neuter-plural":"htonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"htonic","error-unrecognized-form-feminine-indefinite-singular":"htonică","error-unrecognized-form-indefinite-masculine-plural":"htonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"htonice","definite-error-unrecognized-form-masculine-neuter-singular":"htonicul","definite-error-unrecognized-form-feminine-singular":"htonica","definite-error-unrecognized-form-masculine-plural":"htonicii","definite-error-unrecognized-form-feminine-neuter-plural":"htonicele"}},{"word":"htonism","pos":"noun","definitions":["a chthonic character"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"htonism","accusative-definite-nominative":"htonismul","dative-genitive-indefinite":"htonism","dative-definite-genitive":"htonismului","vocative":"htonismule"}},{"word":"hu","pos":"intj","definitions":["hoot (cry made by an owl)"]},{"word":"Huber","pos":"name","definitions":["a surname from German"],"gender":"m","forms":{"dative-genitive":"lui Huber"}},{"word":"Hubert","pos":"name","definitions":["a surname from German"],"gender":"m","forms":{"dative-genitive":"lui Hubert"}},{"word":"hublou","pos":"noun","definitions":["plane or ship window, porthole"],"forms":{"plural":"hublouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hublou","accusative-definite-nominative-singular":"hubloul","accusative-indefinite-nominative-plural":"hublouri","accusative-definite-nominative-plural":"hublourile","dative-genitive-indefinite-singular":"hublou","dative-definite-genitive-singular":"hubloului","dative-genitive-indefinite-plural":"hublouri","dative-definite-genitive-plural":"hublourilor","singular-vocative":"hubloule","plural-vocative":"hublourilor"}},{"word":"huceag","pos":"noun","definitions":["thicket"],"forms":{"plural":"huceaguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"huceag","accusative-definite-nominative-singular":"huceagul","accusative-indefinite-nominative-plural":"huceaguri","accusative-definite-nominative-plural":"huceagurile","dative-genitive-indefinite-singular":"huceag","dative-definite-genitive-singular":"huceagului","dative-genitive-indefinite-plural":"huceaguri","dative-definite-genitive-plural":"huceagurilor","singular-vocative":"huceagule","plural-vocative":"huceagurilor"}},{"word":"huci","pos":"noun","definitions":["thicket"],"forms":{"plural":"huciuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"huci","accusative-definite-nominative-singular":"huciul","accusative-indefinite-nominative-plural":"huciuri","accusative-definite-nominative-plural":"huciurile","dative-genitive-indefinite-singular":"huci","dative-definite-genitive-singular":"huciului","dative-genitive-indefinite-plural":"huciuri","dative-definite-genitive-plural":"huciurilor","singular-vocative":"huciule","plural-vocative":"huciurilor"}},{"word":"Hudeșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hudeșteanu"}},{"word":"Hudești","pos":"name","definitions":["a commune of Botoșani County, Romania","a village in Hudești, Botoșani County, Romania"],"gender":"m"},{"word":"hudicioară","pos":"noun","definitions":["diminutive of hudiță"],"forms":{"plural":"hudicioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hudicioară","accusative-definite-nominative-singular":"hudicioara","accusative-indefinite-nominative-plural":"hudicioare","accusative-definite-nominative-plural":"hudicioarele","dative-genitive-indefinite-singular":"hudicioare","dative-definite-genitive-singular":"hudicioarei","dative-genitive-indefinite-plural":"hudicioare","dative-definite-genitive-plural":"hudicioarelor","singular-vocative":"hudicioară","plural-vocative":"hudicioarelor"}},{"word":"Hudișteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hudișteanu"}},{"word":"Hudiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hudiță"}},{"word":"hudiță","pos":"noun","definitions":["narrow street"],"forms":{"plural":"hudițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hudiță","accusative-definite-nominative-singular":"hudița","accusative-indefinite-nominative-plural":"hudițe","accusative-definite-nominative-plural":"hudițele","dative-genitive-indefinite-singular":"hudițe","dative-definite-genitive-singular":"hudiței","dative-genitive-indefinite-plural":"hudițe","dative-definite-genitive-plural":"hudițelor","singular-vocative":"hudiță","plural-vocative":"hudițelor"}},{"word":"Hudricești","pos":"name","definitions":["a village in Bistra, Alba County, Romania"],"gender":"m"},{"word":"hudubaie","pos":"noun","definitions":["a large house","a monster"],"forms":{"plural":"hudubăi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hudubaie","accusative-definite-nominative-singular":"hudubaiea","accusative-indefinite-nominative-plural":"hudubăi","accusative-definite-nominative-plural":"hudubăile","dative-genitive-indefinite-singular":"hudubăi","dative-definite-genitive-singular":"hudubăii","dative-genitive-indefinite-plural":"hudubăi","dative-definite-genitive-plural":"hudubăilor","singular-vocative":"hudubaie","plural-vocative":"hudubăilor"}},{"word":"hudubală","pos":"noun","definitions":["home"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"hudubală","accusative-definite-nominative":"hudubala","dative-genitive-indefinite":"hudubale","dative-definite-genitive":"hudubalei","vocative":"hudubală"}},{"word":"hududoi","pos":"noun","definitions":["narrow gorge"],"forms":{"plural":"hududoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hududoi","accusative-definite-nominative-singular":"hududoiul","accusative-indefinite-nominative-plural":"hududoaie","accusative-definite-nominative-plural":"hududoaiele","dative-genitive-indefinite-singular":"hududoi","dative-definite-genitive-singular":"hududoiului","dative-genitive-indefinite-plural":"hududoaie","dative-definite-genitive-plural":"hududoaielor","singular-vocative":"hududoiule","plural-vocative":"hududoaielor"}},{"word":"huduleț","pos":"noun","definitions":["alternative form of huludeț"],"forms":{"plural":"hudulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"huduleț","accusative-definite-nominative-singular":"hudulețul","accusative-indefinite-nominative-plural":"hudulețe","accusative-definite-nominative-plural":"hudulețele","dative-genitive-indefinite-singular":"huduleț","dative-definite-genitive-singular":"hudulețului","dative-genitive-indefinite-plural":"hudulețe","dative-definite-genitive-plural":"hudulețelor","singular-vocative":"hudulețule","plural-vocative":"hudulețelor"}},{"word":"huduță","pos":"noun","definitions":["diminutive of hudă"],"forms":{"plural":"huduțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"huduță","accusative-definite-nominative-singular":"huduța","accusative-indefinite-nominative-plural":"huduțe","accusative-definite-nominative-plural":"huduțele","dative-genitive-indefinite-singular":"huduțe","dative-definite-genitive-singular":"huduței","dative-genitive-indefinite-plural":"huduțe","dative-definite-genitive-plural":"huduțelor","singular-vocative":"huduță","plural-vocative":"huduțelor"}},{"word":"Huedin","pos":"name","definitions":["a town in Cluj County, Romania"],"gender":"m"},{"word":"Hugeanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hugeanu"}},{"word":"hughenot","pos":"noun","definitions":["Huguenot"],"forms":{"plural":"hughenoți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hughenot","accusative-definite-nominative-singular":"hughenotul","accusative-indefinite-nominative-plural":"hughenoți","accusative-definite-nominative-plural":"hughenoții","dative-genitive-indefinite-singular":"hughenot","dative-definite-genitive-singular":"hughenotului","dative-genitive-indefinite-plural":"hughenoți","dative-definite-genitive-plural":"hughenoților","singular-vocative":"hughenotule","plural-vocative":"hughenoților"}},{"word":"hughenotă","pos":"noun","definitions":["female equivalent of hughenot"],"forms":{"plural":"hughenote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hughenotă","accusative-definite-nominative-singular":"hughenota","accusative-indefinite-nominative-plural":"hughenote","accusative-definite-nominative-plural":"hughenotele","dative-genitive-indefinite-singular":"hughenote","dative-definite-genitive-singular":"hughenotei","dative-genitive-indefinite-plural":"hughenote","dative-definite-genitive-plural":"hughenotelor","singular-vocative":"hughenotă","plural-vocative":"hughenotelor"}},{"word":"hugium","pos":"noun","definitions":["assault, attack"],"forms":{"plural":"hugiumuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hugium","accusative-definite-nominative-singular":"hugiumul","accusative-indefinite-nominative-plural":"hugiumuri","accusative-definite-nominative-plural":"hugiumurile","dative-genitive-indefinite-singular":"hugium","dative-definite-genitive-singular":"hugiumului","dative-genitive-indefinite-plural":"hugiumuri","dative-definite-genitive-plural":"hugiumurilor","singular-vocative":"hugiumule","plural-vocative":"hugiumurilor"}},{"word":"huhura","pos":"verb","definitions":["to howl, to hoot"],"pronunciation":"[huhuˈra]","forms":{"canonical":"a huhura 1st conjugation","present-singular-third-person":"huhur","participle-past":"huhurat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a huhura","gerund":"huhurând","first-person-indicative-present-singular":"huhur","indicative-present-second-person-singular":"huhuri","indicative-present-singular-third-person":"huhură","first-person-indicative-plural-present":"huhurăm","indicative-plural-present-second-person":"huhurați","indicative-plural-present-third-person":"huhură","first-person-imperfect-indicative-singular":"huhuram","imperfect-indicative-second-person-singular":"huhurai","imperfect-indicative-singular-third-person":"huhura","first-person-imperfect-indicative-plural":"huhuram","imperfect-indicative-plural-second-person":"huhurați","imperfect-indicative-plural-third-person":"huhurau","first-person-indicative-perfect-singular":"huhurai","indicative-perfect-second-person-singular":"huhurași","indicative-perfect-singular-third-person":"huhură","first-person-indicative-perfect-plural":"huhurarăm","indicative-perfect-plural-second-person":"huhurarăți","indicative-perfect-plural-third-person":"huhurară","first-person-indicative-pluperfect-singular":"huhurasem","indicative-pluperfect-second-person-singular":"huhuraseși","indicative-pluperfect-singular-third-person":"huhurase","first-person-indicative-pluperfect-plural":"huhuraserăm","indicative-pluperfect-plural-second-person":"huhuraserăți","indicative-pluperfect-plural-third-person":"huhuraseră","first-person-present-singular-subjunctive":"să huhur","present-second-person-singular-subjunctive":"să huhuri","present-singular-subjunctive-third-person":"să huhure","first-person-plural-present-subjunctive":"să huhurăm","plural-present-second-person-subjunctive":"să huhurați","plural-present-subjunctive-third-person":"să huhure","imperative-second-person-singular":"huhură","imperative-plural-second-person":"huhurați","imperative-negative-second-person-singular":"nu huhura","imperative-negative-plural-second-person":"nu huhurați","alternative":"хухура"}},{"word":"huhurat","pos":"noun","definitions":["yell"],"forms":{"plural":"huhuraturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"huhurat","accusative-definite-nominative-singular":"huhuratul","accusative-indefinite-nominative-plural":"huhuraturi","accusative-definite-nominative-plural":"huhuraturile","dative-genitive-indefinite-singular":"huhurat","dative-definite-genitive-singular":"huhuratului","dative-genitive-indefinite-plural":"huhuraturi","dative-definite-genitive-plural":"huhuraturilor","singular-vocative":"huhuratule","plural-vocative":"huhuraturilor"}},{"word":"Huhurez","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Huhurez"}},{"word":"huhurez","pos":"noun","definitions":["tawny owl (Strix aluco)"],"forms":{"plural":"huhurezi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"huhurez","accusative-definite-nominative-singular":"huhurezul","accusative-indefinite-nominative-plural":"huhurezi","accusative-definite-nominative-plural":"huhurezii","dative-genitive-indefinite-singular":"huhurez","dative-definite-genitive-singular":"huhurezului","dative-genitive-indefinite-plural":"huhurezi","dative-definite-genitive-plural":"huhurezilor","singular-vocative":"huhurezule","plural-vocative":"huhurezilor"}},{"word":"huhurez mare","pos":"noun","definitions":["Ural owl (Strix uralensis)"],"forms":{"plural":"huhurezi mari"}},{"word":"huhurez mic","pos":"noun","definitions":["tawny owl (Strix aluco)"],"forms":{"plural":"huhurezi mici"}},{"word":"huhureza","pos":"verb","definitions":["to howl, to hoot"],"forms":{"canonical":"a huhureza 1st conjugation","present-singular-third-person":"huhurezează","participle-past":"huhurezat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a huhureza","gerund":"huhurezând","first-person-indicative-present-singular":"huhurezez","indicative-present-second-person-singular":"huhurezezi","indicative-present-singular-third-person":"huhurezează","first-person-indicative-plural-present":"huhurezăm","indicative-plural-present-second-person":"huhurezați","indicative-plural-present-third-person":"huhurezează","first-person-imperfect-indicative-singular":"huhurezam","imperfect-indicative-second-person-singular":"huhurezai","imperfect-indicative-singular-third-person":"huhureza","first-person-imperfect-indicative-plural":"huhurezam","imperfect-indicative-plural-second-person":"huhurezați","imperfect-indicative-plural-third-person":"huhurezau","first-person-indicative-perfect-singular":"huhurezai","indicative-perfect-second-person-singular":"huhurezași","indicative-perfect-singular-third-person":"huhureză","first-person-indicative-perfect-plural":"huhurezarăm","indicative-perfect-plural-second-person":"huhurezarăți","indicative-perfect-plural-third-person":"huhurezară","first-person-indicative-pluperfect-singular":"huhurezasem","indicative-pluperfect-second-person-singular":"huhurezaseși","indicative-pluperfect-singular-third-person":"huhurezase","first-person-indicative-pluperfect-plural":"huhurezaserăm","indicative-pluperfect-plural-second-person":"huhurezaserăți","indicative-pluperfect-plural-third-person":"huhurezaseră","first-person-present-singular-subjunctive":"să huhurezez","present-second-person-singular-subjunctive":"să huhurezezi","present-singular-subjunctive-third-person":"să huhurezeze","first-person-plural-present-subjunctive":"să huhurezăm","plural-present-second-person-subjunctive":"să huhurezați","plural-present-subjunctive-third-person":"să huhurezeze","imperative-second-person-singular":"huhurezează","imperative-plural-second-person":"huhurezați","imperative-negative-second-person-singular":"nu huhureza","imperative-negative-plural-second-person":"nu huhurezați"}},{"word":"huideo","pos":"intj","definitions":["boo (exclamation of disapproval)"]},{"word":"huidui","pos":"verb","definitions":["to hiss, to boo"],"forms":{"canonical":"a huidui 4th conjugation","present-singular-third-person":"huiduiesc","participle-past":"huiduit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a huidui","gerund":"huiduind","first-person-indicative-present-singular":"huiduiesc","indicative-present-second-person-singular":"huiduiești","indicative-present-singular-third-person":"huiduiește","first-person-indicative-plural-present":"huiduim","indicative-plural-present-second-person":"huiduiți","indicative-plural-present-third-person":"huiduiesc","first-person-imperfect-indicative-singular":"huiduiam","imperfect-indicative-second-person-singular":"huiduiai","imperfect-indicative-singular-third-person":"huiduia","first-person-imperfect-indicative-plural":"huiduiam","imperfect-indicative-plural-second-person":"huiduiați","imperfect-indicative-plural-third-person":"huiduiau","first-person-indicative-perfect-singular":"huiduii","indicative-perfect-second-person-singular":"huiduiși","indicative-perfect-singular-third-person":"huidui","first-person-indicative-perfect-plural":"huiduirăm","indicative-perfect-plural-second-person":"huiduirăți","indicative-perfect-plural-third-person":"huiduiră","first-person-indicative-pluperfect-singular":"huiduisem","indicative-pluperfect-second-person-singular":"huiduiseși","indicative-pluperfect-singular-third-person":"huiduise","first-person-indicative-pluperfect-plural":"huiduiserăm","indicative-pluperfect-plural-second-person":"huiduiserăți","indicative-pluperfect-plural-third-person":"huiduiseră","first-person-present-singular-subjunctive":"să huiduiesc","present-second-person-singular-subjunctive":"să huiduiești","present-singular-subjunctive-third-person":"să huiduiască","first-person-plural-present-subjunctive":"să huiduim","plural-present-second-person-subjunctive":"să huiduiți","plural-present-subjunctive-third-person":"să huiduiască","imperative-second-person-singular":"huiduiește","imperative-plural-second-person":"huiduiți","imperative-negative-second-person-singular":"nu huidui","imperative-negative-plural-second-person":"nu huiduiți"}},{"word":"huiduială","pos":"noun","definitions":["booing"],"forms":{"plural":"huiduieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"huiduială","accusative-definite-nominative-singular":"huiduiala","accusative-indefinite-nominative-plural":"huiduieli","accusative-definite-nominative-plural":"huiduielile","dative-genitive-indefinite-singular":"huiduieli","dative-definite-genitive-singular":"huiduielii","dative-genitive-indefinite-plural":"huiduieli","dative-definite-genitive-plural":"huiduielilor","singular-vocative":"huiduială","plural-vocative":"huiduielilor"}},{"word":"huiduire","pos":"noun","definitions":["booing"],"forms":{"plural":"huiduiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"huiduire","accusative-definite-nominative-singular":"huiduirea","accusative-indefinite-nominative-plural":"huiduiri","accusative-definite-nominative-plural":"huiduirile","dative-genitive-indefinite-singular":"huiduiri","dative-definite-genitive-singular":"huiduirii","dative-genitive-indefinite-plural":"huiduiri","dative-definite-genitive-plural":"huiduirilor","singular-vocative":"huiduire","plural-vocative":"huiduirilor"}},{"word":"huiduit","pos":"adj","definitions":["booed"],"forms":{"feminine-singular":"huiduită","masculine-plural":"huiduiți","feminine-neuter-plural":"huiduite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"huiduit","error-unrecognized-form-feminine-indefinite-singular":"huiduită","error-unrecognized-form-indefinite-masculine-plural":"huiduiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"huiduite","definite-error-unrecognized-form-masculine-neuter-singular":"huiduitul","definite-error-unrecognized-form-feminine-singular":"huiduita","definite-error-unrecognized-form-masculine-plural":"huiduiții","definite-error-unrecognized-form-feminine-neuter-plural":"huiduitele"}},{"word":"huiduit","pos":"verb","definitions":["past participle of huidui"],"forms":{"participle-past":"of huidui"}},{"word":"huiduitură","pos":"noun","definitions":["booing"],"forms":{"plural":"huiduituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"huiduitură","accusative-definite-nominative-singular":"huiduitura","accusative-indefinite-nominative-plural":"huiduiture","accusative-definite-nominative-plural":"huiduiturele","dative-genitive-indefinite-singular":"huiduiture","dative-definite-genitive-singular":"huiduiturei","dative-genitive-indefinite-plural":"huiduiture","dative-definite-genitive-plural":"huiduiturelor","singular-vocative":"huiduitură","plural-vocative":"huiduiturelor"}},{"word":"huidumă","pos":"noun","definitions":["a fat person"],"forms":{"plural":"huidume","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"huidumă","accusative-definite-nominative-singular":"huiduma","accusative-indefinite-nominative-plural":"huidume","accusative-definite-nominative-plural":"huidumele","dative-genitive-indefinite-singular":"huidume","dative-definite-genitive-singular":"huidumei","dative-genitive-indefinite-plural":"huidume","dative-definite-genitive-plural":"huidumelor","singular-vocative":"huidumă","plural-vocative":"huidumelor"}},{"word":"huiet","pos":"noun","definitions":["rumbling"],"forms":{"plural":"huiete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"huiet","accusative-definite-nominative-singular":"huietul","accusative-indefinite-nominative-plural":"huiete","accusative-definite-nominative-plural":"huietele","dative-genitive-indefinite-singular":"huiet","dative-definite-genitive-singular":"huietului","dative-genitive-indefinite-plural":"huiete","dative-definite-genitive-plural":"huietelor","singular-vocative":"huietule","plural-vocative":"huietelor"}},{"word":"huilă","pos":"noun","definitions":["coal"],"forms":{"plural":"huile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"huilă","accusative-definite-nominative-singular":"huila","accusative-indefinite-nominative-plural":"huile","accusative-definite-nominative-plural":"huilele","dative-genitive-indefinite-singular":"huile","dative-definite-genitive-singular":"huilei","dative-genitive-indefinite-plural":"huile","dative-definite-genitive-plural":"huilelor","singular-vocative":"huilă","plural-vocative":"huilelor"}},{"word":"huimă","pos":"noun","definitions":["a fat person"],"forms":{"plural":"huime","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"huimă","accusative-definite-nominative-singular":"huima","accusative-indefinite-nominative-plural":"huime","accusative-definite-nominative-plural":"huimele","dative-genitive-indefinite-singular":"huime","dative-definite-genitive-singular":"huimei","dative-genitive-indefinite-plural":"huime","dative-definite-genitive-plural":"huimelor","singular-vocative":"huimă","plural-vocative":"huimelor"}},{"word":"Hulă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hulă"}},{"word":"hulă","pos":"noun","definitions":["blasphemy"],"forms":{"plural":"hule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hulă","accusative-definite-nominative-singular":"hula","accusative-indefinite-nominative-plural":"hule","accusative-definite-nominative-plural":"hulele","dative-genitive-indefinite-singular":"hule","dative-definite-genitive-singular":"hulei","dative-genitive-indefinite-plural":"hule","dative-definite-genitive-plural":"hulelor","singular-vocative":"hulă","plural-vocative":"hulelor"}},{"word":"hulă","pos":"noun","definitions":["swell (of water)"],"forms":{"plural":"hule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hulă","accusative-definite-nominative-singular":"hula","accusative-indefinite-nominative-plural":"hule","accusative-definite-nominative-plural":"hulele","dative-genitive-indefinite-singular":"hule","dative-definite-genitive-singular":"hulei","dative-genitive-indefinite-plural":"hule","dative-definite-genitive-plural":"hulelor","singular-vocative":"hulă","plural-vocative":"hulelor"}},{"word":"hulă","pos":"noun","definitions":["a hill cutting"],"forms":{"plural":"hule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hulă","accusative-definite-nominative-singular":"hula","accusative-indefinite-nominative-plural":"hule","accusative-definite-nominative-plural":"hulele","dative-genitive-indefinite-singular":"hule","dative-definite-genitive-singular":"hulei","dative-genitive-indefinite-plural":"hule","dative-definite-genitive-plural":"hulelor","singular-vocative":"hulă","plural-vocative":"hulelor"}},{"word":"Hulboaca","pos":"name","definitions":["a village in Ghetlova, Orhei Raion, Moldova"],"gender":"f"},{"word":"hulenie","pos":"noun","definitions":["blasphemy"],"forms":{"plural":"hulenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hulenie","accusative-definite-nominative-singular":"hulenia","accusative-indefinite-nominative-plural":"hulenii","accusative-definite-nominative-plural":"huleniile","dative-genitive-indefinite-singular":"hulenii","dative-definite-genitive-singular":"huleniei","dative-genitive-indefinite-plural":"hulenii","dative-definite-genitive-plural":"huleniilor","singular-vocative":"hulenie","plural-vocative":"huleniilor"}},{"word":"huli","pos":"verb","definitions":["to slander","to profane, to blaspheme"],"forms":{"canonical":"a huli 4th conjugation","present-singular-third-person":"hulește","participle-past":"hulit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a huli","gerund":"hulind","first-person-indicative-present-singular":"hulesc","indicative-present-second-person-singular":"hulești","indicative-present-singular-third-person":"hulește","first-person-indicative-plural-present":"hulim","indicative-plural-present-second-person":"huliți","indicative-plural-present-third-person":"hulesc","first-person-imperfect-indicative-singular":"huleam","imperfect-indicative-second-person-singular":"huleai","imperfect-indicative-singular-third-person":"hulea","first-person-imperfect-indicative-plural":"huleam","imperfect-indicative-plural-second-person":"huleați","imperfect-indicative-plural-third-person":"huleau","first-person-indicative-perfect-singular":"hulii","indicative-perfect-second-person-singular":"huliși","indicative-perfect-singular-third-person":"huli","first-person-indicative-perfect-plural":"hulirăm","indicative-perfect-plural-second-person":"hulirăți","indicative-perfect-plural-third-person":"huliră","first-person-indicative-pluperfect-singular":"hulisem","indicative-pluperfect-second-person-singular":"huliseși","indicative-pluperfect-singular-third-person":"hulise","first-person-indicative-pluperfect-plural":"huliserăm","indicative-pluperfect-plural-second-person":"huliserăți","indicative-pluperfect-plural-third-person":"huliseră","first-person-present-singular-subjunctive":"să hulesc","present-second-person-singular-subjunctive":"să hulești","present-singular-subjunctive-third-person":"să hulească","first-person-plural-present-subjunctive":"să hulim","plural-present-second-person-subjunctive":"să huliți","plural-present-subjunctive-third-person":"să hulească","imperative-second-person-singular":"hulește","imperative-plural-second-person":"huliți","imperative-negative-second-person-singular":"nu huli","imperative-negative-plural-second-person":"nu huliți"}},{"word":"huligan","pos":"noun","definitions":["hooligan"],"pronunciation":"[huliˈɡan]","forms":{"plural":"huligani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"huligan","accusative-definite-nominative-singular":"huliganul","accusative-indefinite-nominative-plural":"huligani","accusative-definite-nominative-plural":"huliganii","dative-genitive-indefinite-singular":"huligan","dative-definite-genitive-singular":"huliganului","dative-genitive-indefinite-plural":"huligani","dative-definite-genitive-plural":"huliganilor","singular-vocative":"huliganule","plural-vocative":"huliganilor"}},{"word":"huliganic","pos":"adj","definitions":["hooliganish"],"forms":{"feminine-singular":"huliganică","masculine-plural":"huliganici","feminine-neuter-plural":"huliganice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"huliganic","error-unrecognized-form-feminine-indefinite-singular":"huliganică","error-unrecognized-form-indefinite-masculine-plural":"huliganici","error-unrecognized-form-feminine-indefinite-neuter-plural":"huliganice","definite-error-unrecognized-form-masculine-neuter-singular":"huliganicul","definite-error-unrecognized-form-feminine-singular":"huliganica","definite-error-unrecognized-form-masculine-plural":"huliganicii","definite-error-unrecognized-form-feminine-neuter-plural":"huliganicele"}},{"word":"huliganism","pos":"noun","definitions":["hooliganism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"huliganism","accusative-definite-nominative-singular":"huliganismul","accusative-indefinite-nominative-plural":"huliganisme","accusative-definite-nominative-plural":"huliganismele","dative-genitive-indefinite-singular":"huliganism","dative-definite-genitive-singular":"huliganismului","dative-genitive-indefinite-plural":"huliganisme","dative-definite-genitive-plural":"huliganismelor","singular-vocative":"huliganismule","plural-vocative":"huliganismelor"}},{"word":"hulire","pos":"noun","definitions":["blasphemy"],"forms":{"plural":"huliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hulire","accusative-definite-nominative-singular":"hulirea","accusative-indefinite-nominative-plural":"huliri","accusative-definite-nominative-plural":"hulirile","dative-genitive-indefinite-singular":"huliri","dative-definite-genitive-singular":"hulirii","dative-genitive-indefinite-plural":"huliri","dative-definite-genitive-plural":"hulirilor","singular-vocative":"hulire","plural-vocative":"hulirilor"}},{"word":"hulit","pos":"adj","definitions":["mocked, defamed"],"pronunciation":"/huˈlit/","forms":{"feminine-singular":"hulită","masculine-plural":"huliți","feminine-neuter-plural":"hulite","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"hulit","error-unrecognized-form-feminine-indefinite-singular":"hulită","error-unrecognized-form-indefinite-masculine-plural":"huliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hulite","definite-error-unrecognized-form-masculine-neuter-singular":"hulitul","definite-error-unrecognized-form-feminine-singular":"hulita","definite-error-unrecognized-form-masculine-plural":"huliții","definite-error-unrecognized-form-feminine-neuter-plural":"hulitele"}},{"word":"hulit","pos":"verb","definitions":["past participle of huli"],"pronunciation":"/huˈlit/"},{"word":"hulitoare","pos":"noun","definitions":["female equivalent of hulitor"],"forms":{"plural":"hulitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"hulitoare","accusative-definite-nominative-singular":"hulitoarea","accusative-indefinite-nominative-plural":"hulitoare","accusative-definite-nominative-plural":"hulitoarele","dative-genitive-indefinite-singular":"hulitoare","dative-definite-genitive-singular":"hulitoarei","dative-genitive-indefinite-plural":"hulitoare","dative-definite-genitive-plural":"hulitoarelor","singular-vocative":"hulitoare","plural-vocative":"hulitoarelor"}},{"word":"hulitor","pos":"noun","definitions":["blasphemer"],"forms":{"plural":"hulitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hulitor","accusative-definite-nominative-singular":"hulitorul","accusative-indefinite-nominative-plural":"hulitori","accusative-definite-nominative-plural":"hulitorii","dative-genitive-indefinite-singular":"hulitor","dative-definite-genitive-singular":"hulitorului","dative-genitive-indefinite-plural":"hulitori","dative-definite-genitive-plural":"hulitorilor","singular-vocative":"hulitorule","plural-vocative":"hulitorilor"}},{"word":"hulnic","pos":"adj","definitions":["blasphemer"],"forms":{"feminine-singular":"hulnică","masculine-plural":"hulnici","feminine-neuter-plural":"hulnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hulnic","error-unrecognized-form-feminine-indefinite-singular":"hulnică","error-unrecognized-form-indefinite-masculine-plural":"hulnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hulnice","definite-error-unrecognized-form-masculine-neuter-singular":"hulnicul","definite-error-unrecognized-form-feminine-singular":"hulnica","definite-error-unrecognized-form-masculine-plural":"hulnicii","definite-error-unrecognized-form-feminine-neuter-plural":"hulnicele"}},{"word":"hulpe","pos":"noun","definitions":["alternative form of vulpe"],"forms":{"plural":"hulpi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hulpe","accusative-definite-nominative-singular":"hulpea","accusative-indefinite-nominative-plural":"hulpi","accusative-definite-nominative-plural":"hulpile","dative-genitive-indefinite-singular":"hulpi","dative-definite-genitive-singular":"hulpii","dative-genitive-indefinite-plural":"hulpi","dative-definite-genitive-plural":"hulpilor","singular-vocative":"hulpe","plural-vocative":"hulpilor"}},{"word":"Hulpuș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hulpuș"}},{"word":"hultan","pos":"noun","definitions":["alternative form of vultan"],"forms":{"plural":"hultani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hultan","accusative-definite-nominative-singular":"hultanul","accusative-indefinite-nominative-plural":"hultani","accusative-definite-nominative-plural":"hultanii","dative-genitive-indefinite-singular":"hultan","dative-definite-genitive-singular":"hultanului","dative-genitive-indefinite-plural":"hultani","dative-definite-genitive-plural":"hultanilor","singular-vocative":"hultanule","plural-vocative":"hultanilor"}},{"word":"hultui","pos":"verb","definitions":["alternative form of altoi"],"forms":{"canonical":"a hultui 4th conjugation","present-singular-third-person":"hultuiește","participle-past":"hultuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hultui","gerund":"hultuind","first-person-indicative-present-singular":"hultuiesc","indicative-present-second-person-singular":"hultuiești","indicative-present-singular-third-person":"hultuiește","first-person-indicative-plural-present":"hultuim","indicative-plural-present-second-person":"hultuiți","indicative-plural-present-third-person":"hultuiesc","first-person-imperfect-indicative-singular":"hultuiam","imperfect-indicative-second-person-singular":"hultuiai","imperfect-indicative-singular-third-person":"hultuia","first-person-imperfect-indicative-plural":"hultuiam","imperfect-indicative-plural-second-person":"hultuiați","imperfect-indicative-plural-third-person":"hultuiau","first-person-indicative-perfect-singular":"hultuii","indicative-perfect-second-person-singular":"hultuiși","indicative-perfect-singular-third-person":"hultui","first-person-indicative-perfect-plural":"hultuirăm","indicative-perfect-plural-second-person":"hultuirăți","indicative-perfect-plural-third-person":"hultuiră","first-person-indicative-pluperfect-singular":"hultuisem","indicative-pluperfect-second-person-singular":"hultuiseși","indicative-pluperfect-singular-third-person":"hultuise","first-person-indicative-pluperfect-plural":"hultuiserăm","indicative-pluperfect-plural-second-person":"hultuiserăți","indicative-pluperfect-plural-third-person":"hultuiseră","first-person-present-singular-subjunctive":"să hultuiesc","present-second-person-singular-subjunctive":"să hultuiești","present-singular-subjunctive-third-person":"să hultuiască","first-person-plural-present-subjunctive":"să hultuim","plural-present-second-person-subjunctive":"să hultuiți","plural-present-subjunctive-third-person":"să hultuiască","imperative-second-person-singular":"hultuiește","imperative-plural-second-person":"hultuiți","imperative-negative-second-person-singular":"nu hultui","imperative-negative-plural-second-person":"nu hultuiți"}},{"word":"hultuit","pos":"adj","definitions":["obsolete form of altoit"],"forms":{"feminine-singular":"hultuită","masculine-plural":"hultuiți","feminine-neuter-plural":"hultuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hultuit","error-unrecognized-form-feminine-indefinite-singular":"hultuită","error-unrecognized-form-indefinite-masculine-plural":"hultuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hultuite","definite-error-unrecognized-form-masculine-neuter-singular":"hultuitul","definite-error-unrecognized-form-feminine-singular":"hultuita","definite-error-unrecognized-form-masculine-plural":"hultuiții","definite-error-unrecognized-form-feminine-neuter-plural":"hultuitele"}},{"word":"Hulub","pos":"name","definitions":["a village in Dângeni, Botoșani County, Romania"],"gender":"m"},{"word":"hulub","pos":"noun","definitions":["pigeon"],"forms":{"plural":"hulubi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hulub","accusative-definite-nominative-singular":"hulubul","accusative-indefinite-nominative-plural":"hulubi","accusative-definite-nominative-plural":"hulubii","dative-genitive-indefinite-singular":"hulub","dative-definite-genitive-singular":"hulubului","dative-genitive-indefinite-plural":"hulubi","dative-definite-genitive-plural":"hulubilor","singular-vocative":"hulubule","plural-vocative":"hulubilor"}},{"word":"Huluba","pos":"name","definitions":["a village in Vulturești, Argeș County, Romania","a river in Argeș, Romania, tributary to the Argeșel","a river in Argeș, Romania, tributary to the Râușorul"],"gender":"f"},{"word":"hulubărie","pos":"noun","definitions":["dovecote"],"forms":{"plural":"hulubării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hulubărie","accusative-definite-nominative-singular":"hulubăria","accusative-indefinite-nominative-plural":"hulubării","accusative-definite-nominative-plural":"hulubăriile","dative-genitive-indefinite-singular":"hulubării","dative-definite-genitive-singular":"hulubăriei","dative-genitive-indefinite-plural":"hulubării","dative-definite-genitive-plural":"hulubăriilor","singular-vocative":"hulubărie","plural-vocative":"hulubăriilor"}},{"word":"Hulubaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hulubaș"}},{"word":"hulubaș","pos":"noun","definitions":["diminutive of hulub; small pigeon"],"forms":{"plural":"hulubași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hulubaș","accusative-definite-nominative-singular":"hulubașul","accusative-indefinite-nominative-plural":"hulubași","accusative-definite-nominative-plural":"hulubașii","dative-genitive-indefinite-singular":"hulubaș","dative-definite-genitive-singular":"hulubașului","dative-genitive-indefinite-plural":"hulubași","dative-definite-genitive-plural":"hulubașilor","singular-vocative":"hulubașule","plural-vocative":"hulubașilor"}},{"word":"hulubel","pos":"noun","definitions":["diminutive of hulub; small pigeon"],"forms":{"plural":"hulubei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hulubel","accusative-definite-nominative-singular":"hulubelul","accusative-indefinite-nominative-plural":"hulubeli","accusative-definite-nominative-plural":"hulubelii","dative-genitive-indefinite-singular":"hulubel","dative-definite-genitive-singular":"hulubelului","dative-genitive-indefinite-plural":"hulubeli","dative-definite-genitive-plural":"hulubelilor","singular-vocative":"hulubelule","plural-vocative":"hulubelilor"}},{"word":"huluberniță","pos":"noun","definitions":["dovecote"],"forms":{"plural":"hulubernițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"huluberniță","accusative-definite-nominative-singular":"hulubernița","accusative-indefinite-nominative-plural":"hulubernițe","accusative-definite-nominative-plural":"hulubernițele","dative-genitive-indefinite-singular":"hulubernițe","dative-definite-genitive-singular":"huluberniței","dative-genitive-indefinite-plural":"hulubernițe","dative-definite-genitive-plural":"hulubernițelor","singular-vocative":"huluberniță","plural-vocative":"hulubernițelor"}},{"word":"Hulubescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Hulubescu"}},{"word":"Hulubești","pos":"name","definitions":["a village in Pomârla, Botoșani County, Romania","a commune of Dâmbovița County, Romania","a village in Hulubești, Dâmbovița County, Romania","a village in Călugăreni, Giurgiu County, Romania"],"gender":"m"},{"word":"hulubiță","pos":"noun","definitions":["diminutive of hulub"],"forms":{"plural":"hulubițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hulubiță","accusative-definite-nominative-singular":"hulubița","accusative-indefinite-nominative-plural":"hulubițe","accusative-definite-nominative-plural":"hulubițele","dative-genitive-indefinite-singular":"hulubițe","dative-definite-genitive-singular":"hulubiței","dative-genitive-indefinite-plural":"hulubițe","dative-definite-genitive-plural":"hulubițelor","singular-vocative":"hulubiță","plural-vocative":"hulubițelor"}},{"word":"hulubnic","pos":"noun","definitions":["dovecote"],"forms":{"plural":"hulubnice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hulubnic","accusative-definite-nominative-singular":"hulubnicul","accusative-indefinite-nominative-plural":"hulubnice","accusative-definite-nominative-plural":"hulubnicele","dative-genitive-indefinite-singular":"hulubnic","dative-definite-genitive-singular":"hulubnicului","dative-genitive-indefinite-plural":"hulubnice","dative-definite-genitive-plural":"hulubnicelor","singular-vocative":"hulubnicule","plural-vocative":"hulubnicelor"}},{"word":"Huluboaia","pos":"name","definitions":["a village in Huluboaia, Cahul Raion, Moldova","a commune of Cahul Raion, Moldova"],"gender":"f"},{"word":"hului","pos":"verb","definitions":["alternative form of hurui"],"forms":{"canonical":"a hului 4th conjugation","present-singular-third-person":"huluiește","participle-past":"huluit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hului","gerund":"huluind","first-person-indicative-present-singular":"huluiesc","indicative-present-second-person-singular":"huluiești","indicative-present-singular-third-person":"huluiește","first-person-indicative-plural-present":"huluim","indicative-plural-present-second-person":"huluiți","indicative-plural-present-third-person":"huluiesc","first-person-imperfect-indicative-singular":"huluiam","imperfect-indicative-second-person-singular":"huluiai","imperfect-indicative-singular-third-person":"huluia","first-person-imperfect-indicative-plural":"huluiam","imperfect-indicative-plural-second-person":"huluiați","imperfect-indicative-plural-third-person":"huluiau","first-person-indicative-perfect-singular":"huluii","indicative-perfect-second-person-singular":"huluiși","indicative-perfect-singular-third-person":"hului","first-person-indicative-perfect-plural":"huluirăm","indicative-perfect-plural-second-person":"huluirăți","indicative-perfect-plural-third-person":"huluiră","first-person-indicative-pluperfect-singular":"huluisem","indicative-pluperfect-second-person-singular":"huluiseși","indicative-pluperfect-singular-third-person":"huluise","first-person-indicative-pluperfect-plural":"huluiserăm","indicative-pluperfect-plural-second-person":"huluiserăți","indicative-pluperfect-plural-third-person":"huluiseră","first-person-present-singular-subjunctive":"să huluiesc","present-second-person-singular-subjunctive":"să huluiești","present-singular-subjunctive-third-person":"să huluiască","first-person-plural-present-subjunctive":"să huluim","plural-present-second-person-subjunctive":"să huluiți","plural-present-subjunctive-third-person":"să huluiască","imperative-second-person-singular":"huluiește","imperative-plural-second-person":"huluiți","imperative-negative-second-person-singular":"nu hului","imperative-negative-plural-second-person":"nu huluiți"}},{"word":"huluit","pos":"adj","definitions":["alternative form of huruit"],"forms":{"feminine-singular":"huluită","masculine-plural":"huluiți","feminine-neuter-plural":"huluite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"huluit","error-unrecognized-form-feminine-indefinite-singular":"huluită","error-unrecognized-form-indefinite-masculine-plural":"huluiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"huluite","definite-error-unrecognized-form-masculine-neuter-singular":"huluitul","definite-error-unrecognized-form-feminine-singular":"huluita","definite-error-unrecognized-form-masculine-plural":"huluiții","definite-error-unrecognized-form-feminine-neuter-plural":"huluitele"}},{"word":"Huma","pos":"name","definitions":["a river in Neamț County, Romania, tributary to the Nemțișor"],"gender":"f"},{"word":"huma","pos":"noun","definitions":["definite nominative/accusative singular of humă"],"pronunciation":"[ˈhuma]","gender":"f"},{"word":"Humă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Humă"}},{"word":"humă","pos":"noun","definitions":["clay"],"forms":{"plural":"hume","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"humă","accusative-definite-nominative-singular":"huma","accusative-indefinite-nominative-plural":"hume","accusative-definite-nominative-plural":"humele","dative-genitive-indefinite-singular":"hume","dative-definite-genitive-singular":"humei","dative-genitive-indefinite-plural":"hume","dative-definite-genitive-plural":"humelor","singular-vocative":"humă","plural-vocative":"humelor"}},{"word":"Humăria","pos":"name","definitions":["a river in Iași, Romania, tributary to the Durduc"],"gender":"f"},{"word":"humărie","pos":"noun","definitions":["clay pit"],"forms":{"plural":"humării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"humărie","accusative-definite-nominative-singular":"humăria","accusative-indefinite-nominative-plural":"humării","accusative-definite-nominative-plural":"humăriile","dative-genitive-indefinite-singular":"humării","dative-definite-genitive-singular":"humăriei","dative-genitive-indefinite-plural":"humării","dative-definite-genitive-plural":"humăriilor","singular-vocative":"humărie","plural-vocative":"humăriilor"}},{"word":"hume","pos":"noun","definitions":["inflection of humă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈhume]","gender":"f"},{"word":"humeism","pos":"noun","definitions":["Humeanism"],"forms":{"plural":"humeisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"humeism","accusative-definite-nominative-singular":"humeismul","accusative-indefinite-nominative-plural":"humeisme","accusative-definite-nominative-plural":"humeismele","dative-genitive-indefinite-singular":"humeism","dative-definite-genitive-singular":"humeismului","dative-genitive-indefinite-plural":"humeisme","dative-definite-genitive-plural":"humeismelor","singular-vocative":"humeismule","plural-vocative":"humeismelor"}},{"word":"Humele","pos":"name","definitions":["a village in Ungheni, Argeș County, Romania"],"gender":"m"},{"word":"humeral","pos":"adj","definitions":["humeral"],"forms":{"feminine-singular":"humerală","masculine-plural":"humerali","feminine-neuter-plural":"humerale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"humeral","error-unrecognized-form-feminine-indefinite-singular":"humerală","error-unrecognized-form-indefinite-masculine-plural":"humerali","error-unrecognized-form-feminine-indefinite-neuter-plural":"humerale","definite-error-unrecognized-form-masculine-neuter-singular":"humeralul","definite-error-unrecognized-form-feminine-singular":"humerala","definite-error-unrecognized-form-masculine-plural":"humeralii","definite-error-unrecognized-form-feminine-neuter-plural":"humeralele"}},{"word":"humerus","pos":"noun","definitions":["humerus"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"humerus","accusative-definite-nominative":"humerusul","dative-genitive-indefinite":"humerus","dative-definite-genitive":"humerusului","vocative":"humerusule"}},{"word":"humic","pos":"adj","definitions":["humic"],"forms":{"feminine-singular":"humică","masculine-plural":"humici","feminine-neuter-plural":"humice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"humic","error-unrecognized-form-feminine-indefinite-singular":"humică","error-unrecognized-form-indefinite-masculine-plural":"humici","error-unrecognized-form-feminine-indefinite-neuter-plural":"humice","definite-error-unrecognized-form-masculine-neuter-singular":"humicul","definite-error-unrecognized-form-feminine-singular":"humica","definite-error-unrecognized-form-masculine-plural":"humicii","definite-error-unrecognized-form-feminine-neuter-plural":"humicele"}},{"word":"humificare","pos":"noun","definitions":["humification"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"humificare","accusative-definite-nominative":"humificarea","dative-genitive-indefinite":"humificari","dative-definite-genitive":"humificarii","vocative":"humificare"}},{"word":"humo","pos":"noun","definitions":["vocative singular of humă"],"pronunciation":"[ˈhumo]","gender":"f"},{"word":"humoare","pos":"noun","definitions":["alternative form of umoare"],"forms":{"plural":"humori"}},{"word":"Humor","pos":"name","definitions":["a river in Suceava, Romania, tributary to the Bistrița"],"gender":"m"},{"word":"humor","pos":"noun","definitions":["alternative form of umor"],"forms":{"plural":"humoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"humor","accusative-definite-nominative-singular":"humorul","accusative-indefinite-nominative-plural":"humoare","accusative-definite-nominative-plural":"humoarele","dative-genitive-indefinite-singular":"humor","dative-definite-genitive-singular":"humorului","dative-genitive-indefinite-plural":"humoare","dative-definite-genitive-plural":"humoarelor","singular-vocative":"humorule","plural-vocative":"humoarelor"}},{"word":"humoral","pos":"adj","definitions":["humoral"],"forms":{"feminine-singular":"humorală","masculine-plural":"humorali","feminine-neuter-plural":"humorale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"humoral","error-unrecognized-form-feminine-indefinite-singular":"humorală","error-unrecognized-form-indefinite-masculine-plural":"humorali","error-unrecognized-form-feminine-indefinite-neuter-plural":"humorale","definite-error-unrecognized-form-masculine-neuter-singular":"humoralul","definite-error-unrecognized-form-feminine-singular":"humorala","definite-error-unrecognized-form-masculine-plural":"humoralii","definite-error-unrecognized-form-feminine-neuter-plural":"humoralele"}},{"word":"Humoranu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Humoranu"}},{"word":"Humorean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Humorean"}},{"word":"humorean","pos":"adj","definitions":["from or pertaining to Gura Humorului"],"forms":{"feminine-singular":"humoreană","masculine-plural":"humoreni","feminine-neuter-plural":"humorene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"humorean","error-unrecognized-form-feminine-indefinite-singular":"humoreană","error-unrecognized-form-indefinite-masculine-plural":"humoreni","error-unrecognized-form-feminine-indefinite-neuter-plural":"humorene","definite-error-unrecognized-form-masculine-neuter-singular":"humoreanul","definite-error-unrecognized-form-feminine-singular":"humoreana","definite-error-unrecognized-form-masculine-plural":"humorenii","definite-error-unrecognized-form-feminine-neuter-plural":"humorenele"}},{"word":"humorean","pos":"noun","definitions":["a male inhabitant of Gura Humorului"],"forms":{"plural":"humoreni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"humorean","accusative-definite-nominative-singular":"humoreanul","accusative-indefinite-nominative-plural":"humoreni","accusative-definite-nominative-plural":"humorenii","dative-genitive-indefinite-singular":"humorean","dative-definite-genitive-singular":"humoreanului","dative-genitive-indefinite-plural":"humoreni","dative-definite-genitive-plural":"humorenilor","singular-vocative":"humoreanule","plural-vocative":"humorenilor"}},{"word":"humoreancă","pos":"noun","definitions":["female equivalent of humorean"],"forms":{"plural":"humorence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"humoreancă","accusative-definite-nominative-singular":"humoreanca","accusative-indefinite-nominative-plural":"humorence","accusative-definite-nominative-plural":"humorencele","dative-genitive-indefinite-singular":"humorence","dative-definite-genitive-singular":"humorencei","dative-genitive-indefinite-plural":"humorence","dative-definite-genitive-plural":"humorencelor","singular-vocative":"humoreancă","plural-vocative":"humorencelor"}},{"word":"Humoreanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Humoreanu"}},{"word":"Humoreni","pos":"name","definitions":["a village in Comănești, Suceava County, Romania"],"gender":"m"},{"word":"humorescă","pos":"noun","definitions":["humoresque"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"humorescă","accusative-definite-nominative":"humoresca","dative-genitive-indefinite":"humorești","dative-definite-genitive":"humoreștii","vocative":"humorescă"}},{"word":"Humoria","pos":"name","definitions":["a river in Suceava, Romania, tributary to the Șomuzul Mare"],"gender":"m"},{"word":"humorist","pos":"noun","definitions":["alternative spelling of umorist"],"forms":{"plural":"humoriști","feminine":"equivalent humoristă"}},{"word":"humoristă","pos":"noun","definitions":["female equivalent of humorist"],"forms":{"plural":"humoriste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"humoristă","accusative-definite-nominative-singular":"humorista","accusative-indefinite-nominative-plural":"humoriste","accusative-definite-nominative-plural":"humoristele","dative-genitive-indefinite-singular":"humoriste","dative-definite-genitive-singular":"humoristei","dative-genitive-indefinite-plural":"humoriste","dative-definite-genitive-plural":"humoristelor","singular-vocative":"humoristă","plural-vocative":"humoristelor"}},{"word":"humoriști","pos":"noun","definitions":["plural of humorist"],"gender":"m"},{"word":"humoristic","pos":"adj","definitions":["obsolete form of umoristic"],"forms":{"feminine-singular":"humoristică","masculine-plural":"humoristici","feminine-neuter-plural":"humoristice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"humoristic","error-unrecognized-form-feminine-indefinite-singular":"humoristică","error-unrecognized-form-indefinite-masculine-plural":"humoristici","error-unrecognized-form-feminine-indefinite-neuter-plural":"humoristice","definite-error-unrecognized-form-masculine-neuter-singular":"humoristicul","definite-error-unrecognized-form-feminine-singular":"humoristica","definite-error-unrecognized-form-masculine-plural":"humoristicii","definite-error-unrecognized-form-feminine-neuter-plural":"humoristicele"}},{"word":"humos","pos":"adj","definitions":["clayey"],"forms":{"feminine-singular":"humoasă","masculine-plural":"humoși","feminine-neuter-plural":"humoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"humos","error-unrecognized-form-feminine-indefinite-singular":"humoasă","error-unrecognized-form-indefinite-masculine-plural":"humoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"humoase","definite-error-unrecognized-form-masculine-neuter-singular":"humosul","definite-error-unrecognized-form-feminine-singular":"humoasa","definite-error-unrecognized-form-masculine-plural":"humoșii","definite-error-unrecognized-form-feminine-neuter-plural":"humoasele"}},{"word":"Humosu","pos":"name","definitions":["a village in Sirețel, Iași County, Romania"],"gender":"m"},{"word":"Humulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Humulescu"}},{"word":"Humulești","pos":"name","definitions":["a locality in Târgu Neamț, Neamț County, Romania"],"gender":"m"},{"word":"Humuleștii Noi","pos":"name","definitions":["a locality in Târgu Neamț, Neamț County, Romania"],"gender":"m"},{"word":"humus","pos":"noun","definitions":["humus (in the soil)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"humus","accusative-definite-nominative":"humusul","dative-genitive-indefinite":"humus","dative-definite-genitive":"humusului","vocative":"humusule"}},{"word":"hun","pos":"noun","definitions":["Hun"],"forms":{"plural":"huni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hun","accusative-definite-nominative-singular":"hunul","accusative-indefinite-nominative-plural":"huni","accusative-definite-nominative-plural":"hunii","dative-genitive-indefinite-singular":"hun","dative-definite-genitive-singular":"hunului","dative-genitive-indefinite-plural":"huni","dative-definite-genitive-plural":"hunilor","singular-vocative":"hunule","plural-vocative":"hunilor"}},{"word":"Hunedoara","pos":"name","definitions":["a city in Hunedoara County, Romania","a county of Romania"],"pronunciation":"/huneˈdo̯ara/","gender":"f"},{"word":"Hunedoara Timișană","pos":"name","definitions":["a village in Șagu, Arad County, Romania"],"gender":"f"},{"word":"hunedorean","pos":"noun","definitions":["native or inhabitant of the city of Hunedoara or surrounding Hunedoara County, Romania (usually male)"],"forms":{"plural":"hunedoreni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hunedorean","accusative-definite-nominative-singular":"hunedoreanul","accusative-indefinite-nominative-plural":"hunedoreni","accusative-definite-nominative-plural":"hunedorenii","dative-genitive-indefinite-singular":"hunedorean","dative-definite-genitive-singular":"hunedoreanului","dative-genitive-indefinite-plural":"hunedoreni","dative-definite-genitive-plural":"hunedorenilor","singular-vocative":"hunedoreanule","plural-vocative":"hunedorenilor"}},{"word":"hunedoreană","pos":"noun","definitions":["female equivalent of hunedorean"],"forms":{"plural":"hunedorene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hunedoreană","accusative-definite-nominative-singular":"hunedoreana","accusative-indefinite-nominative-plural":"hunedorene","accusative-definite-nominative-plural":"hunedorenele","dative-genitive-indefinite-singular":"hunedorene","dative-definite-genitive-singular":"hunedorenei","dative-genitive-indefinite-plural":"hunedorene","dative-definite-genitive-plural":"hunedorenelor","singular-vocative":"hunedoreană","plural-vocative":"hunedorenelor"}},{"word":"hunedoreancă","pos":"noun","definitions":["female equivalent of hunedorean"],"forms":{"plural":"hunedorence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hunedoreancă","accusative-definite-nominative-singular":"hunedoreanca","accusative-indefinite-nominative-plural":"hunedorence","accusative-definite-nominative-plural":"hunedorencele","dative-genitive-indefinite-singular":"hunedorence","dative-definite-genitive-singular":"hunedorencei","dative-genitive-indefinite-plural":"hunedorence","dative-definite-genitive-plural":"hunedorencelor","singular-vocative":"hunedoreancă","plural-vocative":"hunedorencelor"}},{"word":"Hunia","pos":"name","definitions":["a village in Maglavit, Dolj County, Romania"],"gender":"f"},{"word":"hunie","pos":"noun","definitions":["funnel"],"forms":{"plural":"hunii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hunie","accusative-definite-nominative-singular":"hunia","accusative-indefinite-nominative-plural":"hunii","accusative-definite-nominative-plural":"huniile","dative-genitive-indefinite-singular":"hunii","dative-definite-genitive-singular":"huniei","dative-genitive-indefinite-plural":"hunii","dative-definite-genitive-plural":"huniilor","singular-vocative":"hunie","plural-vocative":"huniilor"}},{"word":"huo","pos":"intj","definitions":["boo"]},{"word":"hup","pos":"intj","definitions":["alternative form of hop"]},{"word":"Hupca","pos":"name","definitions":["a village in Bogdănești, Vaslui County, Romania"],"gender":"f"},{"word":"hural","pos":"noun","definitions":["khural"],"forms":{"plural":"hurale","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hural","accusative-definite-nominative-singular":"huralul","accusative-indefinite-nominative-plural":"hurale","accusative-definite-nominative-plural":"huralele","dative-genitive-indefinite-singular":"hural","dative-definite-genitive-singular":"huralului","dative-genitive-indefinite-plural":"hurale","dative-definite-genitive-plural":"huralelor","singular-vocative":"huralule","plural-vocative":"huralelor"}},{"word":"hurcaș","pos":"noun","definitions":["hunter"],"forms":{"plural":"hurcași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hurcaș","accusative-definite-nominative-singular":"hurcașul","accusative-indefinite-nominative-plural":"hurcași","accusative-definite-nominative-plural":"hurcașii","dative-genitive-indefinite-singular":"hurcaș","dative-definite-genitive-singular":"hurcașului","dative-genitive-indefinite-plural":"hurcași","dative-definite-genitive-plural":"hurcașilor","singular-vocative":"hurcașule","plural-vocative":"hurcașilor"}},{"word":"hurcuială","pos":"noun","definitions":["hunt"],"forms":{"plural":"hurcuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hurcuială","accusative-definite-nominative-singular":"hurcuiala","accusative-indefinite-nominative-plural":"hurcuiele","accusative-definite-nominative-plural":"hurcuielele","dative-genitive-indefinite-singular":"hurcuiele","dative-definite-genitive-singular":"hurcuielei","dative-genitive-indefinite-plural":"hurcuiele","dative-definite-genitive-plural":"hurcuielelor","singular-vocative":"hurcuială","plural-vocative":"hurcuielelor"}},{"word":"hurcuitoare","pos":"noun","definitions":["hunt"],"forms":{"plural":"hurcuitori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hurcuitoare","accusative-definite-nominative-singular":"hurcuitoarea","accusative-indefinite-nominative-plural":"hurcuitori","accusative-definite-nominative-plural":"hurcuitorile","dative-genitive-indefinite-singular":"hurcuitori","dative-definite-genitive-singular":"hurcuitorii","dative-genitive-indefinite-plural":"hurcuitori","dative-definite-genitive-plural":"hurcuitorilor","singular-vocative":"hurcuitoare","plural-vocative":"hurcuitorilor"}},{"word":"hurculaș","pos":"noun","definitions":["a kind of embroidery"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hurculaș","accusative-definite-nominative":"hurculașul","dative-genitive-indefinite":"hurculaș","dative-definite-genitive":"hurculașului","vocative":"hurculașule"}},{"word":"hurdler","pos":"noun","definitions":["hurdler"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"hurdler","accusative-definite-nominative":"hurdlerul","dative-genitive-indefinite":"hurdler","dative-definite-genitive":"hurdlerului","vocative":"hurdlerule"}},{"word":"hurduca","pos":"verb","definitions":["to shake"],"pronunciation":"/hur.duˈka/","forms":{"canonical":"a hurduca 1st conjugation","present-singular-third-person":"hurducă","participle-past":"hurducat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a hurduca","gerund":"hurducând","first-person-indicative-present-singular":"hurduc","indicative-present-second-person-singular":"hurduci","indicative-present-singular-third-person":"hurducă","first-person-indicative-plural-present":"hurducăm","indicative-plural-present-second-person":"hurducați","indicative-plural-present-third-person":"hurducă","first-person-imperfect-indicative-singular":"hurducam","imperfect-indicative-second-person-singular":"hurducai","imperfect-indicative-singular-third-person":"hurduca","first-person-imperfect-indicative-plural":"hurducam","imperfect-indicative-plural-second-person":"hurducați","imperfect-indicative-plural-third-person":"hurducau","first-person-indicative-perfect-singular":"hurducai","indicative-perfect-second-person-singular":"hurducași","indicative-perfect-singular-third-person":"hurducă","first-person-indicative-perfect-plural":"hurducarăm","indicative-perfect-plural-second-person":"hurducarăți","indicative-perfect-plural-third-person":"hurducară","first-person-indicative-pluperfect-singular":"hurducasem","indicative-pluperfect-second-person-singular":"hurducaseși","indicative-pluperfect-singular-third-person":"hurducase","first-person-indicative-pluperfect-plural":"hurducaserăm","indicative-pluperfect-plural-second-person":"hurducaserăți","indicative-pluperfect-plural-third-person":"hurducaseră","first-person-present-singular-subjunctive":"să hurduc","present-second-person-singular-subjunctive":"să hurduci","present-singular-subjunctive-third-person":"să hurduce","first-person-plural-present-subjunctive":"să hurducăm","plural-present-second-person-subjunctive":"să hurducați","plural-present-subjunctive-third-person":"să hurduce","imperative-second-person-singular":"hurducă","imperative-plural-second-person":"hurducați","imperative-negative-second-person-singular":"nu hurduca","imperative-negative-plural-second-person":"nu hurducați"}},{"word":"hurducăi","pos":"verb","definitions":["to shake"],"forms":{"canonical":"a hurducăi 4th conjugation","present-singular-third-person":"hurducăie","participle-past":"hurducăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a hurducăi","gerund":"hurducăind","first-person-indicative-present-singular":"hurducăi","indicative-present-second-person-singular":"hurducăi","indicative-present-singular-third-person":"hurducăie","first-person-indicative-plural-present":"hurducăim","indicative-plural-present-second-person":"hurducăiți","indicative-plural-present-third-person":"hurducăie","first-person-imperfect-indicative-singular":"hurducăiam","imperfect-indicative-second-person-singular":"hurducăiai","imperfect-indicative-singular-third-person":"hurducăia","first-person-imperfect-indicative-plural":"hurducăiam","imperfect-indicative-plural-second-person":"hurducăiați","imperfect-indicative-plural-third-person":"hurducăiau","first-person-indicative-perfect-singular":"hurducăii","indicative-perfect-second-person-singular":"hurducăiși","indicative-perfect-singular-third-person":"hurducăi","first-person-indicative-perfect-plural":"hurducăirăm","indicative-perfect-plural-second-person":"hurducăirăți","indicative-perfect-plural-third-person":"hurducăiră","first-person-indicative-pluperfect-singular":"hurducăisem","indicative-pluperfect-second-person-singular":"hurducăiseși","indicative-pluperfect-singular-third-person":"hurducăise","first-person-indicative-pluperfect-plural":"hurducăiserăm","indicative-pluperfect-plural-second-person":"hurducăiserăți","indicative-pluperfect-plural-third-person":"hurducăiseră","first-person-present-singular-subjunctive":"să hurducăi","present-second-person-singular-subjunctive":"să hurducăi","present-singular-subjunctive-third-person":"să hurducăie","first-person-plural-present-subjunctive":"să hurducăim","plural-present-second-person-subjunctive":"să hurducăiți","plural-present-subjunctive-third-person":"să hurducăie","imperative-second-person-singular":"hurducăie","imperative-plural-second-person":"hurducăiți","imperative-negative-second-person-singular":"nu hurducăi","imperative-negative-plural-second-person":"nu hurducăiți"}},{"word":"hurducăială","pos":"noun","definitions":["shaking"],"forms":{"plural":"hurducăieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hurducăială","accusative-definite-nominative-singular":"hurducăiala","accusative-indefinite-nominative-plural":"hurducăiele","accusative-definite-nominative-plural":"hurducăielele","dative-genitive-indefinite-singular":"hurducăiele","dative-definite-genitive-singular":"hurducăielei","dative-genitive-indefinite-plural":"hurducăiele","dative-definite-genitive-plural":"hurducăielelor","singular-vocative":"hurducăială","plural-vocative":"hurducăielelor"}},{"word":"hurducătură","pos":"noun","definitions":["shake"],"forms":{"plural":"hurducături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hurducătură","accusative-definite-nominative-singular":"hurducătura","accusative-indefinite-nominative-plural":"hurducături","accusative-definite-nominative-plural":"hurducăturile","dative-genitive-indefinite-singular":"hurducături","dative-definite-genitive-singular":"hurducăturii","dative-genitive-indefinite-plural":"hurducături","dative-definite-genitive-plural":"hurducăturilor","singular-vocative":"hurducătură","plural-vocative":"hurducăturilor"}},{"word":"Hurducești","pos":"name","definitions":["a locality in Strehaia, Mehedinți County, Romania"],"gender":"m"},{"word":"Hurdugașu Mare","pos":"name","definitions":["a river in Harghita, Romania, tributary to the Hurdugașu"],"gender":"m"},{"word":"Hurdugașu Mic","pos":"name","definitions":["a river in Harghita, Romania, tributary to the Hurdugașu"],"gender":"m"},{"word":"hurduitură","pos":"noun","definitions":["rumble"],"forms":{"plural":"hurduituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hurduitură","accusative-definite-nominative-singular":"hurduitura","accusative-indefinite-nominative-plural":"hurduituri","accusative-definite-nominative-plural":"hurduiturile","dative-genitive-indefinite-singular":"hurduituri","dative-definite-genitive-singular":"hurduiturii","dative-genitive-indefinite-plural":"hurduituri","dative-definite-genitive-plural":"hurduiturilor","singular-vocative":"hurduitură","plural-vocative":"hurduiturilor"}},{"word":"hurduzău","pos":"noun","definitions":["thick rope"],"forms":{"plural":"hurduzaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hurduzău","accusative-definite-nominative-singular":"hurduzăuul","accusative-indefinite-nominative-plural":"hurduzaie","accusative-definite-nominative-plural":"hurduzaiele","dative-genitive-indefinite-singular":"hurduzău","dative-definite-genitive-singular":"hurduzăuului","dative-genitive-indefinite-plural":"hurduzaie","dative-definite-genitive-plural":"hurduzaielor","singular-vocative":"hurduzăuule","plural-vocative":"hurduzaielor"}},{"word":"Hurez","pos":"name","definitions":["a village in Beclean, Brașov County, Romania","a village in Horoatu Crasnei, Sălaj County, Romania"],"gender":"m"},{"word":"hurez","pos":"noun","definitions":["alternative form of huhurez"],"forms":{"plural":"hurezi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hurez","accusative-definite-nominative-singular":"hurezul","accusative-indefinite-nominative-plural":"hurezi","accusative-definite-nominative-plural":"hurezii","dative-genitive-indefinite-singular":"hurez","dative-definite-genitive-singular":"hurezului","dative-genitive-indefinite-plural":"hurezi","dative-definite-genitive-plural":"hurezilor","singular-vocative":"hurezule","plural-vocative":"hurezilor"}},{"word":"Hurezan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hurezan"}},{"word":"Hurezani","pos":"name","definitions":["a commune of Gorj County, Romania","a village in Hurezani, Gorj County, Romania"],"gender":"m"},{"word":"Hurezanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hurezanu"}},{"word":"Hurezean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hurezean"}},{"word":"Hurezeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hurezeanu"}},{"word":"Hurezu Mare","pos":"name","definitions":["a village in Supur, Satu Mare County, Romania"],"gender":"m"},{"word":"hurican","pos":"noun","definitions":["hurricane"],"forms":{"plural":"huricane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hurican","accusative-definite-nominative-singular":"huricanul","accusative-indefinite-nominative-plural":"huricane","accusative-definite-nominative-plural":"huricanele","dative-genitive-indefinite-singular":"hurican","dative-definite-genitive-singular":"huricanului","dative-genitive-indefinite-plural":"huricane","dative-definite-genitive-plural":"huricanelor","singular-vocative":"huricanule","plural-vocative":"huricanelor"}},{"word":"hurie","pos":"noun","definitions":["houri"],"forms":{"plural":"hurii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hurie","accusative-definite-nominative-singular":"huria","accusative-indefinite-nominative-plural":"hurii","accusative-definite-nominative-plural":"huriile","dative-genitive-indefinite-singular":"hurii","dative-definite-genitive-singular":"huriei","dative-genitive-indefinite-plural":"hurii","dative-definite-genitive-plural":"huriilor","singular-vocative":"hurie","plural-vocative":"huriilor"}},{"word":"Hurjuieni","pos":"name","definitions":["a village in Gălănești, Suceava County, Romania"],"gender":"m"},{"word":"hurmuz","pos":"noun","definitions":["a glass bead"],"forms":{"plural":"hurmuzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hurmuz","accusative-definite-nominative-singular":"hurmuzul","accusative-indefinite-nominative-plural":"hurmuzi","accusative-definite-nominative-plural":"hurmuzii","dative-genitive-indefinite-singular":"hurmuz","dative-definite-genitive-singular":"hurmuzului","dative-genitive-indefinite-plural":"hurmuzi","dative-definite-genitive-plural":"hurmuzilor","singular-vocative":"hurmuzule","plural-vocative":"hurmuzilor"}},{"word":"Hurmuzache","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Hurmuzache"}},{"word":"Hurmuzescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Hurmuzescu"}},{"word":"huron","pos":"noun","definitions":["Huron person"],"forms":{"plural":"huroni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"huron","accusative-definite-nominative-singular":"huronul","accusative-indefinite-nominative-plural":"huroni","accusative-definite-nominative-plural":"huronii","dative-genitive-indefinite-singular":"huron","dative-definite-genitive-singular":"huronului","dative-genitive-indefinite-plural":"huroni","dative-definite-genitive-plural":"huronilor","singular-vocative":"huronule","plural-vocative":"huronilor"}},{"word":"hursuz","pos":"adj","definitions":["alternative form of ursuz"],"forms":{"feminine-singular":"hursuză","masculine-plural":"hursuzi","feminine-neuter-plural":"hursuze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hursuz","error-unrecognized-form-feminine-indefinite-singular":"hursuză","error-unrecognized-form-indefinite-masculine-plural":"hursuzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"hursuze","definite-error-unrecognized-form-masculine-neuter-singular":"hursuzul","definite-error-unrecognized-form-feminine-singular":"hursuza","definite-error-unrecognized-form-masculine-plural":"hursuzii","definite-error-unrecognized-form-feminine-neuter-plural":"hursuzele"}},{"word":"hursuzlâc","pos":"noun","definitions":["alternative form of ursuzlâc"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hursuzlâc","accusative-definite-nominative":"hursuzlâcul","dative-genitive-indefinite":"hursuzlâc","dative-definite-genitive":"hursuzlâcului","vocative":"hursuzlâcule"}},{"word":"hurtă","pos":"noun","definitions":["randomness"],"forms":{"plural":"hurte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hurtă","accusative-definite-nominative-singular":"hurta","accusative-indefinite-nominative-plural":"hurte","accusative-definite-nominative-plural":"hurtele","dative-genitive-indefinite-singular":"hurte","dative-definite-genitive-singular":"hurtei","dative-genitive-indefinite-plural":"hurte","dative-definite-genitive-plural":"hurtelor","singular-vocative":"hurtă","plural-vocative":"hurtelor"}},{"word":"hurubaș","pos":"noun","definitions":["hutter"],"forms":{"plural":"hurubași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hurubaș","accusative-definite-nominative-singular":"hurubașul","accusative-indefinite-nominative-plural":"hurubași","accusative-definite-nominative-plural":"hurubașii","dative-genitive-indefinite-singular":"hurubaș","dative-definite-genitive-singular":"hurubașului","dative-genitive-indefinite-plural":"hurubași","dative-definite-genitive-plural":"hurubașilor","singular-vocative":"hurubașule","plural-vocative":"hurubașilor"}},{"word":"hurubiște","pos":"noun","definitions":["ramshackle building"],"forms":{"plural":"hurubiști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hurubiște","accusative-definite-nominative-singular":"hurubiștea","accusative-indefinite-nominative-plural":"hurubiști","accusative-definite-nominative-plural":"hurubiștile","dative-genitive-indefinite-singular":"hurubiști","dative-definite-genitive-singular":"hurubiștii","dative-genitive-indefinite-plural":"hurubiști","dative-definite-genitive-plural":"hurubiștilor","singular-vocative":"hurubiște","plural-vocative":"hurubiștilor"}},{"word":"hurui","pos":"verb","definitions":["to rumble"],"forms":{"canonical":"a hurui 4th conjugation","present-singular-third-person":"huruie","participle-past":"huruit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a hurui","gerund":"huruind","first-person-indicative-present-singular":"hurui","indicative-present-second-person-singular":"hurui","indicative-present-singular-third-person":"huruie","first-person-indicative-plural-present":"huruim","indicative-plural-present-second-person":"huruiți","indicative-plural-present-third-person":"huruie","first-person-imperfect-indicative-singular":"huruiam","imperfect-indicative-second-person-singular":"huruiai","imperfect-indicative-singular-third-person":"huruia","first-person-imperfect-indicative-plural":"huruiam","imperfect-indicative-plural-second-person":"huruiați","imperfect-indicative-plural-third-person":"huruiau","first-person-indicative-perfect-singular":"huruii","indicative-perfect-second-person-singular":"huruiși","indicative-perfect-singular-third-person":"hurui","first-person-indicative-perfect-plural":"huruirăm","indicative-perfect-plural-second-person":"huruirăți","indicative-perfect-plural-third-person":"huruiră","first-person-indicative-pluperfect-singular":"huruisem","indicative-pluperfect-second-person-singular":"huruiseși","indicative-pluperfect-singular-third-person":"huruise","first-person-indicative-pluperfect-plural":"huruiserăm","indicative-pluperfect-plural-second-person":"huruiserăți","indicative-pluperfect-plural-third-person":"huruiseră","first-person-present-singular-subjunctive":"să hurui","present-second-person-singular-subjunctive":"să hurui","present-singular-subjunctive-third-person":"să huruie","first-person-plural-present-subjunctive":"să huruim","plural-present-second-person-subjunctive":"să huruiți","plural-present-subjunctive-third-person":"să huruie","imperative-second-person-singular":"huruie","imperative-plural-second-person":"huruiți","imperative-negative-second-person-singular":"nu hurui","imperative-negative-plural-second-person":"nu huruiți"}},{"word":"Huruială","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Huruială"}},{"word":"huruială","pos":"noun","definitions":["rattling"],"forms":{"plural":"huruieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"huruială","accusative-definite-nominative-singular":"huruiala","accusative-indefinite-nominative-plural":"huruieli","accusative-definite-nominative-plural":"huruielile","dative-genitive-indefinite-singular":"huruieli","dative-definite-genitive-singular":"huruielii","dative-genitive-indefinite-plural":"huruieli","dative-definite-genitive-plural":"huruielilor","singular-vocative":"huruială","plural-vocative":"huruielilor"}},{"word":"Huruiești","pos":"name","definitions":["a commune of Bacău County, Romania","a village in Huruiești, Bacău County, Romania"],"gender":"m"},{"word":"huruire","pos":"noun","definitions":["sound of a cart"],"forms":{"plural":"huruiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"huruire","accusative-definite-nominative-singular":"huruirea","accusative-indefinite-nominative-plural":"huruiri","accusative-definite-nominative-plural":"huruirile","dative-genitive-indefinite-singular":"huruiri","dative-definite-genitive-singular":"huruirii","dative-genitive-indefinite-plural":"huruiri","dative-definite-genitive-plural":"huruirilor","singular-vocative":"huruire","plural-vocative":"huruirilor"}},{"word":"huruit","pos":"adj","definitions":["rumble"],"forms":{"feminine-singular":"huruită","masculine-plural":"huruiți","feminine-neuter-plural":"huruite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"huruit","error-unrecognized-form-feminine-indefinite-singular":"huruită","error-unrecognized-form-indefinite-masculine-plural":"huruiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"huruite","definite-error-unrecognized-form-masculine-neuter-singular":"huruitul","definite-error-unrecognized-form-feminine-singular":"huruita","definite-error-unrecognized-form-masculine-plural":"huruiții","definite-error-unrecognized-form-feminine-neuter-plural":"huruitele"}},{"word":"huruitură","pos":"noun","definitions":["rumble"],"forms":{"plural":"huruituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"huruitură","accusative-definite-nominative-singular":"huruitura","accusative-indefinite-nominative-plural":"huruiture","accusative-definite-nominative-plural":"huruiturele","dative-genitive-indefinite-singular":"huruiture","dative-definite-genitive-singular":"huruiturei","dative-genitive-indefinite-plural":"huruiture","dative-definite-genitive-plural":"huruiturelor","singular-vocative":"huruitură","plural-vocative":"huruiturelor"}},{"word":"husa","pos":"noun","definitions":["definite nominative/accusative singular of husă"],"pronunciation":"[ˈhusa]","gender":"f"},{"word":"husă","pos":"noun","definitions":["cover (for protecting various things, such as furniture, devices, cars, etc.)"],"forms":{"plural":"huse"}},{"word":"Husar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Husar"}},{"word":"husar","pos":"noun","definitions":["hussar"],"forms":{"plural":"husari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"husar","accusative-definite-nominative-singular":"husarul","accusative-indefinite-nominative-plural":"husari","accusative-definite-nominative-plural":"husarii","dative-genitive-indefinite-singular":"husar","dative-definite-genitive-singular":"husarului","dative-genitive-indefinite-plural":"husari","dative-definite-genitive-plural":"husarilor","singular-vocative":"husarule","plural-vocative":"husarilor"}},{"word":"Husarciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Husarciuc"}},{"word":"husare","pos":"noun","definitions":["putting a cover on an object"],"forms":{"plural":"husări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"husare","accusative-definite-nominative-singular":"husarea","accusative-indefinite-nominative-plural":"husări","accusative-definite-nominative-plural":"husările","dative-genitive-indefinite-singular":"husări","dative-definite-genitive-singular":"husării","dative-genitive-indefinite-plural":"husări","dative-definite-genitive-plural":"husărilor","singular-vocative":"husare","plural-vocative":"husărilor"}},{"word":"Husarencu","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Husarencu"}},{"word":"husăresc","pos":"adj","definitions":["hussar"],"forms":{"feminine-singular":"husărească","plural":"husărești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"husăresc","error-unrecognized-form-feminine-indefinite-singular":"husărească","error-unrecognized-form-indefinite-masculine-plural":"husărești","error-unrecognized-form-feminine-indefinite-neuter-plural":"husărești","definite-error-unrecognized-form-masculine-neuter-singular":"husărescul","definite-error-unrecognized-form-feminine-singular":"husăreasca","definite-error-unrecognized-form-masculine-plural":"husăreștii","definite-error-unrecognized-form-feminine-neuter-plural":"husăreștile"}},{"word":"Husărescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Husărescu"}},{"word":"husărește","pos":"adv","definitions":["like a Hussar"]},{"word":"husărime","pos":"noun","definitions":["hussars (collectively)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"husărime","accusative-definite-nominative":"husărimea","dative-genitive-indefinite":"husărimi","dative-definite-genitive":"husărimii","vocative":"husărime"}},{"word":"Husariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Husariu"}},{"word":"Husaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Husaru"}},{"word":"husăș","pos":"noun","definitions":["Hungarian silver coin"],"forms":{"plural":"husăși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"husăș","accusative-definite-nominative-singular":"husășul","accusative-indefinite-nominative-plural":"husăși","accusative-definite-nominative-plural":"husășii","dative-genitive-indefinite-singular":"husăș","dative-definite-genitive-singular":"husășului","dative-genitive-indefinite-plural":"husăși","dative-definite-genitive-plural":"husășilor","singular-vocative":"husășule","plural-vocative":"husășilor"}},{"word":"Husasău","pos":"name","definitions":["a village in Sălaj County, Romania. Renamed to Huseni in 1925."],"gender":"m"},{"word":"Husasău de Criș","pos":"name","definitions":["a village in Ineu, Bihor County, Romania"],"gender":"m"},{"word":"Husasău de Tinca","pos":"name","definitions":["a commune of Bihor County, Romania","a village in Husasău de Tinca, Bihor County, Romania"],"gender":"f"},{"word":"huscă","pos":"noun","definitions":["salt obtained by boiling salty springs","a piece of salt"],"forms":{"plural":"huști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"huscă","accusative-definite-nominative-singular":"husca","accusative-indefinite-nominative-plural":"huște","accusative-definite-nominative-plural":"huștele","dative-genitive-indefinite-singular":"huște","dative-definite-genitive-singular":"huștei","dative-genitive-indefinite-plural":"huște","dative-definite-genitive-plural":"huștelor","singular-vocative":"huscă","plural-vocative":"huștelor"}},{"word":"huse","pos":"noun","definitions":["inflection of husă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈhuse]","gender":"f"},{"word":"hușean","pos":"adj","definitions":["from or pertaining to Huși"],"forms":{"feminine-singular":"hușeană","masculine-plural":"hușeni","feminine-neuter-plural":"hușene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hușean","error-unrecognized-form-feminine-indefinite-singular":"hușeană","error-unrecognized-form-indefinite-masculine-plural":"hușeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"hușene","definite-error-unrecognized-form-masculine-neuter-singular":"hușeanul","definite-error-unrecognized-form-feminine-singular":"hușeana","definite-error-unrecognized-form-masculine-plural":"hușenii","definite-error-unrecognized-form-feminine-neuter-plural":"hușenele"}},{"word":"hușean","pos":"noun","definitions":["a male inhabitant of Huși"],"forms":{"plural":"hușeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hușean","accusative-definite-nominative-singular":"hușeanul","accusative-indefinite-nominative-plural":"hușeni","accusative-definite-nominative-plural":"hușenii","dative-genitive-indefinite-singular":"hușean","dative-definite-genitive-singular":"hușeanului","dative-genitive-indefinite-plural":"hușeni","dative-definite-genitive-plural":"hușenilor","singular-vocative":"hușeanule","plural-vocative":"hușenilor"}},{"word":"hușeancă","pos":"noun","definitions":["female equivalent of hușean"],"forms":{"plural":"hușence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hușeancă","accusative-definite-nominative-singular":"hușeanca","accusative-indefinite-nominative-plural":"hușence","accusative-definite-nominative-plural":"hușencele","dative-genitive-indefinite-singular":"hușence","dative-definite-genitive-singular":"hușencei","dative-genitive-indefinite-plural":"hușence","dative-definite-genitive-plural":"hușencelor","singular-vocative":"hușeancă","plural-vocative":"hușencelor"}},{"word":"Huseni","pos":"name","definitions":["a village in Crasna, Sălaj County, Romania"],"gender":"m"},{"word":"Huși","pos":"name","definitions":["a village in Preutești, Suceava County, Romania","a city in Vaslui County, Romania"],"pronunciation":"/huʃʲ/","gender":"m"},{"word":"Husia","pos":"name","definitions":["a village in Jibou, Sălaj County, Romania"],"gender":"f"},{"word":"husit","pos":"noun","definitions":["Hussite"],"forms":{"plural":"husiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"husit","accusative-definite-nominative-singular":"husitul","accusative-indefinite-nominative-plural":"husiți","accusative-definite-nominative-plural":"husiții","dative-genitive-indefinite-singular":"husit","dative-definite-genitive-singular":"husitului","dative-genitive-indefinite-plural":"husiți","dative-definite-genitive-plural":"husiților","singular-vocative":"husitule","plural-vocative":"husiților"}},{"word":"husită","pos":"noun","definitions":["female equivalent of husit"],"forms":{"plural":"husite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"husită","accusative-definite-nominative-singular":"husita","accusative-indefinite-nominative-plural":"husite","accusative-definite-nominative-plural":"husitele","dative-genitive-indefinite-singular":"husite","dative-definite-genitive-singular":"husitei","dative-genitive-indefinite-plural":"husite","dative-definite-genitive-plural":"husitelor","singular-vocative":"husită","plural-vocative":"husitelor"}},{"word":"husitism","pos":"noun","definitions":["Hussitism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"husitism","accusative-definite-nominative-singular":"husitismul","accusative-indefinite-nominative-plural":"husitisme","accusative-definite-nominative-plural":"husitismele","dative-genitive-indefinite-singular":"husitism","dative-definite-genitive-singular":"husitismului","dative-genitive-indefinite-plural":"husitisme","dative-definite-genitive-plural":"husitismelor","singular-vocative":"husitismule","plural-vocative":"husitismelor"}},{"word":"husky siberian","pos":"noun","definitions":["Siberian Husky"],"forms":{"plural":"husky siberieni"}},{"word":"Husmezeu","pos":"name","definitions":["a village in Sălaj County, Romania. Renamed to Valea Lungă in 1925."],"gender":"m"},{"word":"Husnicioara","pos":"name","definitions":["a commune of Mehedinți County, Romania","a village in Husnicioara, Mehedinți County, Romania"],"gender":"f"},{"word":"huso","pos":"noun","definitions":["vocative singular of husă"],"pronunciation":"[ˈhuso]","gender":"f"},{"word":"husos","pos":"noun","definitions":["alternative form of husăș"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"husos","accusative-definite-nominative":"husosul","dative-genitive-indefinite":"husos","dative-definite-genitive":"husosului","vocative":"husosule"}},{"word":"husoș","pos":"noun","definitions":["obsolete form of husăș"],"forms":{"plural":"husoși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"husoș","accusative-definite-nominative-singular":"husoșul","accusative-indefinite-nominative-plural":"husoși","accusative-definite-nominative-plural":"husoșii","dative-genitive-indefinite-singular":"husoș","dative-definite-genitive-singular":"husoșului","dative-genitive-indefinite-plural":"husoși","dative-definite-genitive-plural":"husoșilor","singular-vocative":"husoșule","plural-vocative":"husoșilor"}},{"word":"Huștiu","pos":"name","definitions":["a village in Priponești, Galați County, Romania"],"gender":"m"},{"word":"Huștiuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Huștiuc"}},{"word":"Hususău","pos":"name","definitions":["a village in Alba County, Romania. Renamed to Valea Lungă in 1925."],"gender":"m"},{"word":"Huta","pos":"name","definitions":["a village in Boianu Mare, Bihor County, Romania","a village in Chiuiești, Cluj County, Romania","a village in Buciumi, Sălaj County, Romania"],"gender":"f"},{"word":"Huta Certeze","pos":"name","definitions":["a village in Certeze, Satu Mare County, Romania"],"gender":"f"},{"word":"Huta Voivozi","pos":"name","definitions":["a village in Șinteu, Bihor County, Romania"],"gender":"f"},{"word":"huțană","pos":"noun","definitions":["female equivalent of huțan"],"forms":{"plural":"huțane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"huțană","accusative-definite-nominative-singular":"huțana","accusative-indefinite-nominative-plural":"huțane","accusative-definite-nominative-plural":"huțanele","dative-genitive-indefinite-singular":"huțane","dative-definite-genitive-singular":"huțanei","dative-genitive-indefinite-plural":"huțane","dative-definite-genitive-plural":"huțanelor","singular-vocative":"huțană","plural-vocative":"huțanelor"}},{"word":"huțancă","pos":"noun","definitions":["feminine of huțan"],"forms":{"plural":"huțănci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"huțancă","accusative-definite-nominative-singular":"huțanca","accusative-indefinite-nominative-plural":"huțănci","accusative-definite-nominative-plural":"huțăncile","dative-genitive-indefinite-singular":"huțănci","dative-definite-genitive-singular":"huțăncii","dative-genitive-indefinite-plural":"huțănci","dative-definite-genitive-plural":"huțăncilor","singular-vocative":"huțancă","plural-vocative":"huțăncilor"}},{"word":"Huțani","pos":"name","definitions":["a village in Vlădeni, Botoșani County, Romania"],"gender":"m"},{"word":"Huțul","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Huțul"}},{"word":"huțul","pos":"adj","definitions":["Hutsul"],"forms":{"feminine-singular":"huțulă","masculine-plural":"huțuli","feminine-neuter-plural":"huțule","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"huțul","error-unrecognized-form-feminine-indefinite-singular":"huțulă","error-unrecognized-form-indefinite-masculine-plural":"huțuli","error-unrecognized-form-feminine-indefinite-neuter-plural":"huțule","definite-error-unrecognized-form-masculine-neuter-singular":"huțulul","definite-error-unrecognized-form-feminine-singular":"huțula","definite-error-unrecognized-form-masculine-plural":"huțulii","definite-error-unrecognized-form-feminine-neuter-plural":"huțulele"}},{"word":"huțulă","pos":"noun","definitions":["female equivalent of huțul","Hutsul dialect"],"forms":{"plural":"huțule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"huțulă","accusative-definite-nominative-singular":"huțula","accusative-indefinite-nominative-plural":"huțule","accusative-definite-nominative-plural":"huțulele","dative-genitive-indefinite-singular":"huțule","dative-definite-genitive-singular":"huțulei","dative-genitive-indefinite-plural":"huțule","dative-definite-genitive-plural":"huțulelor","singular-vocative":"huțulă","plural-vocative":"huțulelor"}},{"word":"huțulcă","pos":"noun","definitions":["female equivalent of huțul"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"huțulcă","accusative-definite-nominative":"huțulca","dative-genitive-indefinite":"huțulci","dative-definite-genitive":"huțulcii","vocative":"huțulcă"}},{"word":"Huțuleac","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Huțuleac"}},{"word":"Huțupaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Huțupaș"}},{"word":"hutupi","pos":"verb","definitions":["to wolf down, engorge, gorge"],"forms":{"canonical":"a hutupi 4th conjugation","present-singular-third-person":"hutupește","participle-past":"hutupit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hutupi","gerund":"hutupind","first-person-indicative-present-singular":"hutupesc","indicative-present-second-person-singular":"hutupești","indicative-present-singular-third-person":"hutupește","first-person-indicative-plural-present":"hutupim","indicative-plural-present-second-person":"hutupiți","indicative-plural-present-third-person":"hutupesc","first-person-imperfect-indicative-singular":"hutupeam","imperfect-indicative-second-person-singular":"hutupeai","imperfect-indicative-singular-third-person":"hutupea","first-person-imperfect-indicative-plural":"hutupeam","imperfect-indicative-plural-second-person":"hutupeați","imperfect-indicative-plural-third-person":"hutupeau","first-person-indicative-perfect-singular":"hutupii","indicative-perfect-second-person-singular":"hutupiși","indicative-perfect-singular-third-person":"hutupi","first-person-indicative-perfect-plural":"hutupirăm","indicative-perfect-plural-second-person":"hutupirăți","indicative-perfect-plural-third-person":"hutupiră","first-person-indicative-pluperfect-singular":"hutupisem","indicative-pluperfect-second-person-singular":"hutupiseși","indicative-pluperfect-singular-third-person":"hutupise","first-person-indicative-pluperfect-plural":"hutupiserăm","indicative-pluperfect-plural-second-person":"hutupiserăți","indicative-pluperfect-plural-third-person":"hutupiseră","first-person-present-singular-subjunctive":"să hutupesc","present-second-person-singular-subjunctive":"să hutupești","present-singular-subjunctive-third-person":"să hutupească","first-person-plural-present-subjunctive":"să hutupim","plural-present-second-person-subjunctive":"să hutupiți","plural-present-subjunctive-third-person":"să hutupească","imperative-second-person-singular":"hutupește","imperative-plural-second-person":"hutupiți","imperative-negative-second-person-singular":"nu hutupi","imperative-negative-plural-second-person":"nu hutupiți"}},{"word":"huțuț","pos":"noun","definitions":["diminutive of huță"],"forms":{"plural":"huțuțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"huțuț","accusative-definite-nominative-singular":"huțuțul","accusative-indefinite-nominative-plural":"huțuțuri","accusative-definite-nominative-plural":"huțuțurile","dative-genitive-indefinite-singular":"huțuț","dative-definite-genitive-singular":"huțuțului","dative-genitive-indefinite-plural":"huțuțuri","dative-definite-genitive-plural":"huțuțurilor","singular-vocative":"huțuțule","plural-vocative":"huțuțurilor"}},{"word":"huțuțui","pos":"noun","definitions":["diminutive of huțuț"],"forms":{"plural":"huțuțuie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"huțuțui","accusative-definite-nominative-singular":"huțuțuiul","accusative-indefinite-nominative-plural":"huțuțuie","accusative-definite-nominative-plural":"huțuțuiele","dative-genitive-indefinite-singular":"huțuțui","dative-definite-genitive-singular":"huțuțuiului","dative-genitive-indefinite-plural":"huțuțuie","dative-definite-genitive-plural":"huțuțuielor","singular-vocative":"huțuțuiule","plural-vocative":"huțuțuielor"}},{"word":"Huzdup","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Huzdup"}},{"word":"huzmet","pos":"noun","definitions":["job, service"],"forms":{"plural":"huzmeturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"huzmet","accusative-definite-nominative-singular":"huzmetul","accusative-indefinite-nominative-plural":"huzmeturi","accusative-definite-nominative-plural":"huzmeturile","dative-genitive-indefinite-singular":"huzmet","dative-definite-genitive-singular":"huzmetului","dative-genitive-indefinite-plural":"huzmeturi","dative-definite-genitive-plural":"huzmeturilor","singular-vocative":"huzmetule","plural-vocative":"huzmeturilor"}},{"word":"huzur","pos":"noun","definitions":["life of ease, comfort"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"huzur","accusative-definite-nominative":"huzurul","dative-genitive-indefinite":"huzur","dative-definite-genitive":"huzurului","vocative":"huzurule"}},{"word":"huzuri","pos":"verb","definitions":["to live off the fat of the land"],"forms":{"canonical":"a huzuri 4th conjugation","present-singular-third-person":"huzurește","participle-past":"huzurit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a huzuri","gerund":"huzurind","first-person-indicative-present-singular":"huzuresc","indicative-present-second-person-singular":"huzurești","indicative-present-singular-third-person":"huzurește","first-person-indicative-plural-present":"huzurim","indicative-plural-present-second-person":"huzuriți","indicative-plural-present-third-person":"huzuresc","first-person-imperfect-indicative-singular":"huzuream","imperfect-indicative-second-person-singular":"huzureai","imperfect-indicative-singular-third-person":"huzurea","first-person-imperfect-indicative-plural":"huzuream","imperfect-indicative-plural-second-person":"huzureați","imperfect-indicative-plural-third-person":"huzureau","first-person-indicative-perfect-singular":"huzurii","indicative-perfect-second-person-singular":"huzuriși","indicative-perfect-singular-third-person":"huzuri","first-person-indicative-perfect-plural":"huzurirăm","indicative-perfect-plural-second-person":"huzurirăți","indicative-perfect-plural-third-person":"huzuriră","first-person-indicative-pluperfect-singular":"huzurisem","indicative-pluperfect-second-person-singular":"huzuriseși","indicative-pluperfect-singular-third-person":"huzurise","first-person-indicative-pluperfect-plural":"huzuriserăm","indicative-pluperfect-plural-second-person":"huzuriserăți","indicative-pluperfect-plural-third-person":"huzuriseră","first-person-present-singular-subjunctive":"să huzuresc","present-second-person-singular-subjunctive":"să huzurești","present-singular-subjunctive-third-person":"să huzurească","first-person-plural-present-subjunctive":"să huzurim","plural-present-second-person-subjunctive":"să huzuriți","plural-present-subjunctive-third-person":"să huzurească","imperative-second-person-singular":"huzurește","imperative-plural-second-person":"huzuriți","imperative-negative-second-person-singular":"nu huzuri","imperative-negative-plural-second-person":"nu huzuriți"}},{"word":"huzurul","pos":"noun","definitions":["definite nominative/accusative singular of huzur"]},{"word":"hybris","pos":"noun","definitions":["hubris"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hybris","accusative-definite-nominative":"hybrisul","dative-genitive-indefinite":"hybris","dative-definite-genitive":"hybrisului","vocative":"hybrisule"}},{"word":"Hypnos","pos":"name","definitions":["Hypnos"],"pronunciation":"[ˈhipnos]","gender":"m","forms":{"dative-genitive":"lui Hypnos"}}];
@@ -0,0 +1 @@
+export default {"words":[{"word":"ea","pos":"pron","definitions":["she"],"pronunciation":"/ja/","gender":"f","forms":{"plural":"ele","masculine":"equivalent el","table-tags":"no-table-tags","inflection-template":"l-self","nominative":"ea","accusative-stressed":"ea","accusative-error-unrecognized-form":"o","dative-stressed":"ei","dative-error-unrecognized-form":"îi","genitive":"ei","masculine-possessive-singular":"său","masculine-plural-possessive":"săi","neuter-possessive-singular":"său","neuter-plural-possessive":"sale","feminine-possessive-singular":"sa","feminine-plural-possessive":"sale","accusative-possessive-stressed":"sine","accusative-error-unrecognized-form-possessive":"se","dative-possessive-stressed":"sieși","dative-error-unrecognized-form-possessive":"își","alternative":"я"}},{"word":"ea","pos":"pron","definitions":["her"],"pronunciation":"/ja/","gender":"f","forms":{"alternative":"я"}},{"word":"la","pos":"prep","definitions":["at, in","to, towards"],"pronunciation":"/la/","examples":[{"ro":"Suntem la Paris.","en":"We're in Paris."}],"forms":{"alternative":"ла"}},{"word":"la","pos":"verb","definitions":["to wash (especially the head)"],"pronunciation":"/la/","forms":{"canonical":"a la 1st conjugation","present-singular-third-person":"lă","participle-past":"lăut","subjunctive-third-person":"laie","table-tags":"conjugation-1","inflection-template":"ro-conj-2\n","infinitive":"a la","gerund":"lând","first-person-indicative-present-singular":"lau","indicative-present-second-person-singular":"lai","indicative-present-singular-third-person":"lă","first-person-indicative-plural-present":"lăm","indicative-plural-present-second-person":"lați","indicative-plural-present-third-person":"lau","first-person-imperfect-indicative-singular":"lam","imperfect-indicative-second-person-singular":"lai","imperfect-indicative-singular-third-person":"la","first-person-imperfect-indicative-plural":"lam","imperfect-indicative-plural-second-person":"lați","imperfect-indicative-plural-third-person":"lau","first-person-indicative-perfect-singular":"lăui","indicative-perfect-second-person-singular":"lăuși","indicative-perfect-singular-third-person":"lău","first-person-indicative-perfect-plural":"lăurăm","indicative-perfect-plural-second-person":"lăurăți","indicative-perfect-plural-third-person":"lăură","first-person-indicative-pluperfect-singular":"lăusem","indicative-pluperfect-second-person-singular":"lăuseși","indicative-pluperfect-singular-third-person":"lăuse","first-person-indicative-pluperfect-plural":"lăuserăm","indicative-pluperfect-plural-second-person":"lăuserăți","indicative-pluperfect-plural-third-person":"lăuseră","first-person-present-singular-subjunctive":"să lau","present-second-person-singular-subjunctive":"să lai","present-singular-subjunctive-third-person":"să lea","first-person-plural-present-subjunctive":"să lăm","plural-present-second-person-subjunctive":"să lați","plural-present-subjunctive-third-person":"să lea","imperative-second-person-singular":"lă","imperative-plural-second-person":"lați","imperative-negative-second-person-singular":"nu la","imperative-negative-plural-second-person":"nu lați","alternative-Transylvania":"lăia","alternative":"ла"}},{"word":"nu","pos":"adv","definitions":["no","not"],"pronunciation":"/nu/","forms":{"alternative":"ну"}},{"word":"O","pos":"character","definitions":["The eighteenth letter of the Romanian alphabet, called o and written in the Latin script."],"pronunciation":"/o/","forms":{"lowercase":"o"}},{"word":"o","pos":"character","definitions":["The eighteenth letter of the Romanian alphabet, called o and written in the Latin script."],"pronunciation":"/o/","forms":{"uppercase":"O"}},{"word":"o","pos":"article","definitions":["feminine singular nominative/accusative of un: a/an (indefinite article)"],"pronunciation":"/o/","examples":[{"ro":"O femeie frumoasă","en":"A beautiful woman"}]},{"word":"o","pos":"intj","definitions":["oh"],"pronunciation":"/o/"},{"word":"o","pos":"pron","definitions":["her"],"pronunciation":"/o/","gender":"f","examples":[{"ro":"O cunoști?","en":"Do you know her?"},{"ro":"O cunoști pe Iulia?","en":"Do you know Iulia?"},{"ro":"Am văzut-o ieri la școală.","en":"I saw her yesterday at school."}]},{"word":"o","pos":"verb","definitions":["might"],"pronunciation":"/o/"},{"word":"o","pos":"verb","definitions":["Used to form a variant of the future tense together with the verb in the subjunctive mood."],"pronunciation":"/o/","examples":[{"ro":"O să vedem.","en":"We will see."},{"ro":"El o să facă fasole.","en":"He will make beans."}]},{"word":"eu","pos":"pron","definitions":["I"],"pronunciation":"/jew/","forms":{"table-tags":"no-table-tags","inflection-template":"l-self","nominative":"eu","accusative-stressed":"mine","accusative-error-unrecognized-form":"mă","dative-stressed":"mie","dative-error-unrecognized-form":"îmi","masculine-possessive-singular":"meu","masculine-plural-possessive":"mei","neuter-possessive-singular":"meu","neuter-plural-possessive":"mele","feminine-possessive-singular":"mea","feminine-plural-possessive":"mele","alternative-archaic":"eŭ","alternative-colloquial":"io"}},{"word":"eu","pos":"noun","definitions":["ego"],"pronunciation":"/jew/","forms":{"plural":"euri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eu","accusative-definite-nominative-singular":"eul","accusative-indefinite-nominative-plural":"euri","accusative-definite-nominative-plural":"eurile","dative-genitive-indefinite-singular":"eu","dative-definite-genitive-singular":"eului","dative-genitive-indefinite-plural":"euri","dative-definite-genitive-plural":"eurilor","singular-vocative":"eule","plural-vocative":"eurilor","alternative-archaic":"eŭ","alternative-colloquial":"io"}},{"word":"un","pos":"article","definitions":["a, an (indefinite article)"],"pronunciation":"/un/","forms":{"feminine-singular":"o","plural":"niște","table-tags":"no-table-tags","inflection-template":"g","accusative-masculine-neuter-nominative-singular":"un","accusative-feminine-nominative-singular":"o","accusative-nominative-plural":"niște","dative-genitive-masculine-neuter-singular":"unui","dative-feminine-genitive-singular":"unei","dative-genitive-plural":"unor","alternative":"ун"}},{"word":"el","pos":"pron","definitions":["he"],"pronunciation":"/jel/","gender":"m","forms":{"plural":"ei","feminine":"equivalent ea","table-tags":"no-table-tags","inflection-template":"l-self","nominative":"el","accusative-stressed":"el","accusative-error-unrecognized-form":"îl","dative-stressed":"lui","dative-error-unrecognized-form":"îi","genitive":"lui","masculine-possessive-singular":"său","masculine-plural-possessive":"săi","neuter-possessive-singular":"său","neuter-plural-possessive":"sale","feminine-possessive-singular":"sa","feminine-plural-possessive":"sale","accusative-possessive-stressed":"sine","accusative-error-unrecognized-form-possessive":"se","dative-possessive-stressed":"sie","dative-error-unrecognized-form-possessive":"își","alternative":"ел"}},{"word":"el","pos":"pron","definitions":["him"],"pronunciation":"/jel/","gender":"m","forms":{"alternative":"ел"}},{"word":"fi","pos":"verb","definitions":["to be","to feel (to experience a certain condition)","to be it in a game of tag"],"pronunciation":"/fi/","examples":[{"ro":"Ea este frumoasă.","en":"She is beautiful."},{"ro":"Aceasta este o casă.","en":"This is a house."},{"ro":"Îmi e frig.","en":"I feel cold."}],"forms":{"canonical":"a fi 4th conjugation","present-singular-third-person":"este","error-unknown-tag-informal-present-singular-third-person":"e","participle-past":"fost","subjunctive-third-person":"fie","table-tags":"conjugation-4","inflection-template":"ro-conj","infinitive":"a fi","gerund":"fiind","first-person-indicative-present-singular":"sunt","indicative-present-second-person-singular":"ești","indicative-present-singular-third-person":"este","first-person-indicative-plural-present":"suntem","indicative-plural-present-second-person":"sunteți","indicative-plural-present-third-person":"sunt","first-person-imperfect-indicative-singular":"eram","imperfect-indicative-second-person-singular":"erai","imperfect-indicative-singular-third-person":"era","first-person-imperfect-indicative-plural":"eram","imperfect-indicative-plural-second-person":"erați","imperfect-indicative-plural-third-person":"erau","first-person-indicative-perfect-singular":"fusei","indicative-perfect-second-person-singular":"fuseși","indicative-perfect-singular-third-person":"fuse","first-person-indicative-perfect-plural":"fuserăm","indicative-perfect-plural-second-person":"fuserăți","indicative-perfect-plural-third-person":"fuseră","first-person-indicative-pluperfect-singular":"fusesem","indicative-pluperfect-second-person-singular":"fuseseși","indicative-pluperfect-singular-third-person":"fusese","first-person-indicative-pluperfect-plural":"fuseserăm","indicative-pluperfect-plural-second-person":"fuseserăți","indicative-pluperfect-plural-third-person":"fuseseră","first-person-present-singular-subjunctive":"să fiu","present-second-person-singular-subjunctive":"să fii","present-singular-subjunctive-third-person":"să fie","first-person-plural-present-subjunctive":"să fim","plural-present-second-person-subjunctive":"să fiți","plural-present-subjunctive-third-person":"să fie","imperative-second-person-singular":"fii","imperative-plural-second-person":"fiți","imperative-negative-second-person-singular":"nu fi","imperative-negative-plural-second-person":"nu fiți","alternative":"фи","alternative-dialectal":"hi"}},{"word":"era","pos":"verb","definitions":["third-person singular imperfect indicative of fi: he/she was (being)"],"pronunciation":"[jeˈra]","examples":[{"ro":"el era pierdut","en":"he was lost"},{"ro":"el era sarcastic","en":"he was being sarcastic"}]},{"word":"era","pos":"noun","definitions":["definite nominative/accusative singular of eră"],"pronunciation":"[ˈera]","gender":"f"},{"word":"lui","pos":"pron","definitions":["his"],"pronunciation":"/luj/","gender":"m","examples":[{"ro":"Au ceasul lui?","en":"Do they have his watch?"}],"forms":{"feminine":"equivalent ei","plural":"lor","alternative-informal":"lu'","alternative":"луй"}},{"word":"lui","pos":"pron","definitions":["to him"],"pronunciation":"/luj/","gender":"m","forms":{"feminine":"equivalent ei","plural":"lor","alternative-informal":"lu'","alternative":"луй"}},{"word":"lui","pos":"article","definitions":["genitive/dative article for proper names designating people that morphologically don't permit a suffix"],"pronunciation":"/luj/","examples":[{"ro":"Casa lui Carmen.","en":"Carmen's house."},{"ro":"Asta nu-i place lui Bogdan.","en":"Bogdan doesn't like this."}],"forms":{"alternative-informal":"lu'","alternative":"луй"}},{"word":"E","pos":"character","definitions":["The seventh letter of the Romanian alphabet, called e and written in the Latin script."],"pronunciation":"/e/","forms":{"lowercase":"e"}},{"word":"e","pos":"character","definitions":["The seventh letter of the Romanian alphabet, called e and written in the Latin script."],"pronunciation":"/e/","forms":{"uppercase":"E"}},{"word":"e","pos":"noun","definitions":["The name of the Latin-script letter E/e."],"pronunciation":"/e/","forms":{"plural":"e-uri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"e","accusative-definite-nominative-singular":"e-ul","accusative-indefinite-nominative-plural":"e-uri","accusative-definite-nominative-plural":"e-urile","dative-genitive-indefinite-singular":"e","dative-definite-genitive-singular":"e-ului","dative-genitive-indefinite-plural":"e-uri","dative-definite-genitive-plural":"e-urilor","singular-vocative":"e-ule","plural-vocative":"e-urilor"}},{"word":"e","pos":"intj","definitions":["expression of annoyance, irritation","expression of boredom, indifference","expression of surprise, satisfaction, admiration"]},{"word":"e","pos":"verb","definitions":["third-person singular present indicative of fi"],"pronunciation":"/je/","examples":[{"ro":"El e un copil.","en":"He is a child."}],"forms":{"alternative":"е"}},{"word":"e","pos":"conj","definitions":["and","but"]},{"word":"este","pos":"verb","definitions":["third-person singular present indicative of fi: he/she is"],"pronunciation":"/ˈjes.te/","examples":[{"ro":"Ea este o femeie foarte frumoasă.","en":"She is a very beautiful woman."}],"forms":{"alternative":"есте"}},{"word":"tot","pos":"adv","definitions":["still","nevertheless, still, anyway","anyway (introduces circumstances favourable to the fulfillment of a request)","Indicates that a notion or quality is the same as one previously known.","repeatedly, unceasingly, all the time, habitually, constantly"],"pronunciation":"/tot/","examples":[{"ro":"Mai avem o oră și tot nu suntem gata.","en":"We have an hour left and we still aren’t ready."},{"ro":"Шѝ а҆ꙋѕѫ́н̾дь ꙟ҆пъра́ᲅꙋл꙽ къй ᲅѡ́ᲅ ві́ꙋ ѕѫ́сѫ лꙋй Гар꙽га́ль дарѫ ᲅѡ́ᲅꙋй ві́ꙋ ꙟ҆кѫ а҆че́ль фърмъкъᲅо́рю ;","en":"And the emperor, upon hearing that he’s still alive, said to Gargal: “Is that sorcerer still alive?”"},{"ro":"Бисерика Епископіей нꙋ съ деосъбеще прин алтъ дин челеланте де кѫт прин о клопотницъ де мꙋлцй анй ѫнчепꙋтъ ши тот ѫнчепꙋтъ.","en":"The church of the bishopry is not distinguished from any other in anything but a steeple begun many years ago and still begun.^([sic – meaning unfinished])"}],"forms":{"alternative-regional":"tăt","alternative":"тот"}},{"word":"tot","pos":"det","definitions":["all, the whole","all, every","every","all over"],"pronunciation":"/tot/","examples":[{"ro":"ши мергѫндь а҆фа́рѫ де́ла Фа́раѡ҆́нь ꙟмблѫ то́ть пъмѫнтоуⷧ Є҆ги́петꙋлꙋи .","en":"And Joseph went out from the presence of Pharaoh, and went throughout all the land of Egypt. (Genesis 41:46)"},{"ro":"Îĭ аскᲈnсе тот плаnᲈл съᲈ̆[…]","en":"He had hid his entire plan from him […]"},{"ro":"În sfârșit, s-a hotărât a se duce în toată lumea, să-și caute bărbatul.","en":"In the end, she decided to go out in the entire world to search for her man."}],"forms":{"feminine-singular":"toată","masculine-plural":"toți","feminine-neuter-plural":"toate","table-tags":"no-table-tags","inflection-template":"l-self","accusative-masculine-neuter-nominative-singular":"tot","accusative-feminine-nominative-singular":"toată","accusative-masculine-nominative-plural":"toți","accusative-feminine-neuter-nominative-plural":"toate","dative-genitive-masculine-neuter-singular":"-","dative-feminine-genitive-singular":"-","dative-genitive-masculine-plural":"tuturor","dative-feminine-genitive-neuter-plural":"tuturor","alternative-regional":"tăt","alternative":"тот"}},{"word":"tot","pos":"noun","definitions":["a totality, whole","everything (the crucial part, the crux)"],"pronunciation":"/tot/","examples":[{"ro":"un tot unitar","en":"a unified whole"},{"ro":"Кꙋ пꙋтинцъ есте а ꙟмпърци ꙋн тотꙋл (лꙋкрꙋ ꙟнтрег) ꙟ атѫте пърцй кѫте вом вои.","en":"It is possible to divide a whole (an entire thing) into as many parts as we want."},{"ro":"Carapacea scurtă și groasă, cu 3 pliuri pe laturi, formează împreună cu toracele un tot umflat, net deosebit de abdomenul subțire, cilindric.","en":"The short and thick shell, with 3 indentations on the sides, forms, together with the thorax, a swollen whole, visibly distinct from the thin, cylindrical abdomen."}],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"tot","accusative-definite-nominative":"totul","dative-genitive-indefinite":"tot","dative-definite-genitive":"totului","vocative":"totule","alternative-regional":"tăt","alternative":"тот"}},{"word":"tot","pos":"pron","definitions":["everything","everyone"],"pronunciation":"/tot/","examples":[{"ro":"Tot ce faci contează.","en":"Everything you do matters."},{"ro":"Vă mulțumesc tuturor.","en":"I thank you all."}],"forms":{"table-tags":"no-table-tags","inflection-template":"l-self","accusative-masculine-neuter-nominative-singular":"tot","accusative-feminine-nominative-singular":"toată","accusative-masculine-nominative-plural":"toți","accusative-feminine-neuter-nominative-plural":"toate","dative-genitive-masculine-neuter-singular":"-","dative-feminine-genitive-singular":"-","dative-genitive-masculine-plural":"tuturor","dative-feminine-genitive-neuter-plural":"tuturor","alternative-regional":"tăt","alternative":"тот"}},{"word":"tot","pos":"noun","definitions":["alternative form of tăut (“Slovak”)"],"pronunciation":"/tot/","forms":{"plural":"toți","alternative-regional":"tăt","alternative":"тот"}},{"word":"ei","pos":"pron","definitions":["they (used for an all-male or mixed-sex group)"],"pronunciation":"/ˈjej/","gender":"m-p","forms":{"feminine":"equivalent ele","table-tags":"no-table-tags","inflection-template":"l-self","nominative":"ei","accusative-stressed":"ei","accusative-error-unrecognized-form":"îi","dative-stressed":"lor","dative-error-unrecognized-form":"le","genitive":"lor","masculine-possessive-singular":"lor","masculine-plural-possessive":"lor","neuter-possessive-singular":"lor","neuter-plural-possessive":"lor","feminine-possessive-singular":"lor","feminine-plural-possessive":"lor","accusative-possessive-stressed":"sine","accusative-error-unrecognized-form-possessive":"se","dative-possessive-stressed":"sieși","dative-error-unrecognized-form-possessive":"își"}},{"word":"ei","pos":"pron","definitions":["them (all-male or mixed-sex group)"],"pronunciation":"/ˈjej/","gender":"m"},{"word":"ei","pos":"pron","definitions":["her"],"pronunciation":"/ˈjej/","gender":"f","examples":[{"ro":"Ai cartea ei?","en":"Do you have her book?"}],"forms":{"masculine":"equivalent lui","plural":"lor"}},{"word":"ei","pos":"pron","definitions":["to her"],"pronunciation":"/ˈjej/","gender":"f","forms":{"masculine":"equivalent lui","plural":"lor"}},{"word":"nici","pos":"adv","definitions":["not even"],"pronunciation":"[nitʃʲ]","examples":[{"ro":"Nu-mi place nici unul dintre ei","en":"I don't like even one of them."},{"ro":"N-o să vii cu mine, nici pentru a mânca cea mai delicioasă mâncare din toată lumea?","en":"You won't come with me, not even to eat the best food in the world?"}],"forms":{"alternative-archaic":"nece"}},{"word":"nici","pos":"conj","definitions":["neither... nor"],"pronunciation":"[nitʃʲ]","examples":[{"ro":"Nu vreau nici lapte nici apă","en":"I want neither milk nor water"}],"forms":{"alternative-archaic":"nece"}},{"word":"lua","pos":"verb","definitions":["to take","synonym of cumpăra (“to buy”)","to take (to use up time)","to pass an examination","to come upon somebody"],"pronunciation":"/ˈlwa/","examples":[{"ro":"Aș dori să iau prânzul cu tine.","en":"I would like to have lunch with you."},{"ro":"Ia-mă cu tine.","en":"Take me with you."},{"ro":"Ce vrei să-ți iau de la magazin?","en":"What do you want me to buy you from the store?"}],"forms":{"canonical":"a lua 1st conjugation","present-singular-third-person":"ia","participle-past":"luat","subjunctive-third-person":"ia","regional-subjunctive-third-person":"ieie","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a lua","gerund":"luând","first-person-indicative-present-singular":"iau","indicative-present-second-person-singular":"iei","indicative-present-singular-third-person":"ia","first-person-indicative-plural-present":"luăm","indicative-plural-present-second-person":"luați","indicative-plural-present-third-person":"iau","first-person-imperfect-indicative-singular":"luam","imperfect-indicative-second-person-singular":"luai","imperfect-indicative-singular-third-person":"lua","first-person-imperfect-indicative-plural":"luam","imperfect-indicative-plural-second-person":"luați","imperfect-indicative-plural-third-person":"luau","first-person-indicative-perfect-singular":"luai","indicative-perfect-second-person-singular":"luași","indicative-perfect-singular-third-person":"luă","first-person-indicative-perfect-plural":"luarăm","indicative-perfect-plural-second-person":"luarăți","indicative-perfect-plural-third-person":"luară","first-person-indicative-pluperfect-singular":"luasem","indicative-pluperfect-second-person-singular":"luaseși","indicative-pluperfect-singular-third-person":"luase","first-person-indicative-pluperfect-plural":"luaserăm","indicative-pluperfect-plural-second-person":"luaserăți","indicative-pluperfect-plural-third-person":"luaseră","first-person-present-singular-subjunctive":"să iau","present-second-person-singular-subjunctive":"să iei","present-singular-subjunctive-third-person":"să ia","first-person-plural-present-subjunctive":"să luăm","plural-present-second-person-subjunctive":"să luați","plural-present-subjunctive-third-person":"să ia","imperative-second-person-singular":"ia","imperative-plural-second-person":"luați","imperative-negative-second-person-singular":"nu lua","imperative-negative-plural-second-person":"nu luați","alternative":"луа"}},{"word":"fost","pos":"adj","definitions":["former"],"pronunciation":"/ˈfost/","forms":{"feminine-singular":"fostă","masculine-plural":"foști","feminine-neuter-plural":"foste","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"fost","error-unrecognized-form-feminine-indefinite-singular":"fostă","error-unrecognized-form-indefinite-masculine-plural":"foști","error-unrecognized-form-feminine-indefinite-neuter-plural":"foste","definite-error-unrecognized-form-masculine-neuter-singular":"fostul","definite-error-unrecognized-form-feminine-singular":"fosta","definite-error-unrecognized-form-masculine-plural":"foștii","definite-error-unrecognized-form-feminine-neuter-plural":"fostele"}},{"word":"fost","pos":"noun","definitions":["ex-boyfriend"],"pronunciation":"/ˈfost/","forms":{"plural":"foști","feminine":"equivalent fostă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fost","accusative-definite-nominative-singular":"fostul","accusative-indefinite-nominative-plural":"foști","accusative-definite-nominative-plural":"foștii","dative-genitive-indefinite-singular":"fost","dative-definite-genitive-singular":"fostului","dative-genitive-indefinite-plural":"foști","dative-definite-genitive-plural":"foștilor","singular-vocative":"fostule","plural-vocative":"foștilor"}},{"word":"fost","pos":"verb","definitions":["past participle of fi; been"],"pronunciation":"/ˈfost/","examples":[{"ro":"Am fost la București.","en":"I have been to Bucharest."}]},{"word":"Fata","pos":"name","definitions":["a village in Vedea, Argeș County, Romania"],"gender":"f"},{"word":"fata","pos":"noun","definitions":["definite nominative/accusative singular of fată"],"pronunciation":"[ˈfata]"},{"word":"te","pos":"pron","definitions":["you","yourself"],"pronunciation":"/te/","examples":[{"ro":"Știi cât de mult te iubește?'","en":"Do you know how much he loves you?"}]},{"word":"zise","pos":"noun","definitions":["nominative/accusative plural of zisă"]},{"word":"unde","pos":"adv","definitions":["where"],"pronunciation":"[ˈun.de]","examples":[{"ro":"Unde ai fost ieri?","en":"Where were you yesterday?"}]},{"word":"le","pos":"pron","definitions":["to them (all-male or mixed group)"],"pronunciation":"/le/","gender":"m"},{"word":"le","pos":"pron","definitions":["to them (all-female group)"],"pronunciation":"/le/","gender":"f"},{"word":"le","pos":"pron","definitions":["them (all-female group)"],"pronunciation":"/le/","gender":"m"},{"word":"toate","pos":"det","definitions":["nominative/accusative feminine plural of tot"],"pronunciation":"/ˈto̯a.te/","forms":{"alternative":"тоате"}},{"word":"toate","pos":"pron","definitions":["nominative/accusative feminine plural of tot"],"pronunciation":"/ˈto̯a.te/","forms":{"alternative":"тоате"}},{"word":"tu","pos":"pron","definitions":["you (singular), thou"],"pronunciation":"/tu/","forms":{"table-tags":"no-table-tags","inflection-template":"l-self","nominative":"tu","accusative-stressed":"tine","accusative-error-unrecognized-form":"te","dative-stressed":"ție","dative-error-unrecognized-form":"îți","masculine-possessive-singular":"tău","masculine-plural-possessive":"tăi","neuter-possessive-singular":"tău","neuter-plural-possessive":"tale","feminine-possessive-singular":"ta","feminine-plural-possessive":"tale"}},{"word":"bine","pos":"adv","definitions":["well"],"pronunciation":"/ˈbi.ne/"},{"word":"bine","pos":"adj","definitions":["handsome"],"pronunciation":"/ˈbi.ne/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bine","error-unrecognized-form-feminine-indefinite-singular":"bine","error-unrecognized-form-indefinite-masculine-plural":"bine","error-unrecognized-form-feminine-indefinite-neuter-plural":"bine","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"bine","pos":"noun","definitions":["good","wellbeing"],"pronunciation":"/ˈbi.ne/"},{"word":"va","pos":"verb","definitions":["will"],"pronunciation":"[va]","examples":[{"ro":"va fi aici mai târziu?","en":"will he/she be here later?"}]},{"word":"va","pos":"verb","definitions":["only used in mai va (see usage notes).","go (imperative) (plural vați)"],"pronunciation":"[va]","forms":{"alternative-rare":"vă"}},{"word":"vedea","pos":"verb","definitions":["to see","to watch out, to take care (to)","to be seen, to be visible"],"pronunciation":"/veˈde̯a/","examples":[{"ro":"Văd cu ochii mei.","en":"I see with my eyes."},{"ro":"Vezi ce faci.","en":"Be careful what you do."},{"ro":"Vezi să nu cazi.","en":"Watch out, don't fall."}],"forms":{"canonical":"a vedea 2nd conjugation","present-singular-third-person":"vede","participle-past":"văzut","subjunctive-third-person":"vadă","table-tags":"conjugation-2","inflection-template":"ro-conj-2\n","infinitive":"a vedea","gerund":"văzând","first-person-indicative-present-singular":"văd","indicative-present-second-person-singular":"vezi","indicative-present-singular-third-person":"vede","first-person-indicative-plural-present":"vedem","indicative-plural-present-second-person":"vedeți","indicative-plural-present-third-person":"văd","first-person-imperfect-indicative-singular":"vedeam","imperfect-indicative-second-person-singular":"vedeai","imperfect-indicative-singular-third-person":"vedea","first-person-imperfect-indicative-plural":"vedeam","imperfect-indicative-plural-second-person":"vedeați","imperfect-indicative-plural-third-person":"vedeau","first-person-indicative-perfect-singular":"văzui","indicative-perfect-second-person-singular":"văzuși","indicative-perfect-singular-third-person":"văzu","first-person-indicative-perfect-plural":"văzurăm","indicative-perfect-plural-second-person":"văzurăți","indicative-perfect-plural-third-person":"văzură","first-person-indicative-pluperfect-singular":"văzusem","indicative-pluperfect-second-person-singular":"văzuseși","indicative-pluperfect-singular-third-person":"văzuse","first-person-indicative-pluperfect-plural":"văzuserăm","indicative-pluperfect-plural-second-person":"văzuserăți","indicative-pluperfect-plural-third-person":"văzuseră","first-person-present-singular-subjunctive":"să văd","present-second-person-singular-subjunctive":"să vezi","present-singular-subjunctive-third-person":"să vadă","first-person-plural-present-subjunctive":"să vedem","plural-present-second-person-subjunctive":"să vedeți","plural-present-subjunctive-third-person":"să vadă","imperative-second-person-singular":"vezi","imperative-plural-second-person":"vedeți","imperative-negative-second-person-singular":"nu vedea","imperative-negative-plural-second-person":"nu vedeți"}},{"word":"trei","pos":"num","definitions":["three"],"pronunciation":"/ˈtrej/","forms":{"alternative":"трей"}},{"word":"zice","pos":"verb","definitions":["to say, tell","to call by a name","to tell on someone","to sing"],"pronunciation":"/ˈzi.t͡ʃe/","examples":[{"ro":"Ai înțeles ce am zis?","en":"Did you understand what I said?"},{"ro":"Se zice că vine războiul.","en":"They say war is coming."},{"ro":"Pisicii i-am zis Arpagic.","en":"I called the cat Arpagic."}],"forms":{"canonical":"a zice 3rd conjugation","present-singular-third-person":"zice","participle-past":"zis","subjunctive-third-person":"zică","table-tags":"conjugation-3","inflection-template":"ro-conj-zice","infinitive":"a zice","gerund":"zicând","first-person-indicative-present-singular":"zic","indicative-present-second-person-singular":"zici","indicative-present-singular-third-person":"zice","first-person-indicative-plural-present":"zicem","indicative-plural-present-second-person":"ziceți","indicative-plural-present-third-person":"zic","first-person-imperfect-indicative-singular":"ziceam","imperfect-indicative-second-person-singular":"ziceai","imperfect-indicative-singular-third-person":"zicea","first-person-imperfect-indicative-plural":"ziceam","imperfect-indicative-plural-second-person":"ziceați","imperfect-indicative-plural-third-person":"ziceau","first-person-indicative-perfect-singular":"zisei","indicative-perfect-second-person-singular":"ziseși","indicative-perfect-singular-third-person":"zise","first-person-indicative-perfect-plural":"ziserăm","indicative-perfect-plural-second-person":"ziserăți","indicative-perfect-plural-third-person":"ziseră","first-person-indicative-pluperfect-singular":"zisesem","indicative-pluperfect-second-person-singular":"ziseseși","indicative-pluperfect-singular-third-person":"zisese","first-person-indicative-pluperfect-plural":"ziseserăm","indicative-pluperfect-plural-second-person":"ziseserăți","indicative-pluperfect-plural-third-person":"ziseseră","first-person-present-singular-subjunctive":"să zic","present-second-person-singular-subjunctive":"să zici","present-singular-subjunctive-third-person":"să zică","first-person-plural-present-subjunctive":"să zicem","plural-present-second-person-subjunctive":"să ziceți","plural-present-subjunctive-third-person":"să zică","imperative-second-person-singular":"zi","imperative-plural-second-person":"ziceți","imperative-negative-second-person-singular":"nu zice","imperative-negative-plural-second-person":"nu ziceți"}},{"word":"voi","pos":"pron","definitions":["you (group being addressed)"],"pronunciation":"[voj]","forms":{"table-tags":"no-table-tags","inflection-template":"l-self","nominative":"voi","accusative-stressed":"voi","accusative-error-unrecognized-form":"vă","dative-stressed":"vouă","dative-error-unrecognized-form":"vă","masculine-possessive-singular":"vostru","masculine-plural-possessive":"voștri","neuter-possessive-singular":"vostru","neuter-plural-possessive":"voastre","feminine-possessive-singular":"voastră","feminine-plural-possessive":"voastre"}},{"word":"voi","pos":"pron","definitions":["you (group being addressed)"],"pronunciation":"[voj]"},{"word":"voi","pos":"verb","definitions":["will"],"pronunciation":"[voj]","forms":{"table-tags":"future","inflection-template":"ro-conj-aux","auxiliary":"verb","first-person-indicative-present-singular":"voi","indicative-present-second-person-singular":"vei","indicative-present-singular-third-person":"va","first-person-indicative-plural-present":"vom","indicative-plural-present-second-person":"veți","indicative-plural-present-third-person":"vor"}},{"word":"voi","pos":"verb","definitions":["to want","to want to, intend, be inclined to"],"pronunciation":"[voˈi]","forms":{"canonical":"a voi 4th conjugation","present-singular-third-person":"voiește","participle-past":"voit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a voi","gerund":"voind","first-person-indicative-present-singular":"voiesc","indicative-present-second-person-singular":"voiești","indicative-present-singular-third-person":"voiește","first-person-indicative-plural-present":"voim","indicative-plural-present-second-person":"voiți","indicative-plural-present-third-person":"voiesc","first-person-imperfect-indicative-singular":"voiam","imperfect-indicative-second-person-singular":"voiai","imperfect-indicative-singular-third-person":"voia","first-person-imperfect-indicative-plural":"voiam","imperfect-indicative-plural-second-person":"voiați","imperfect-indicative-plural-third-person":"voiau","first-person-indicative-perfect-singular":"voii","indicative-perfect-second-person-singular":"voiși","indicative-perfect-singular-third-person":"voi","first-person-indicative-perfect-plural":"voirăm","indicative-perfect-plural-second-person":"voirăți","indicative-perfect-plural-third-person":"voiră","first-person-indicative-pluperfect-singular":"voisem","indicative-pluperfect-second-person-singular":"voiseși","indicative-pluperfect-singular-third-person":"voise","first-person-indicative-pluperfect-plural":"voiserăm","indicative-pluperfect-plural-second-person":"voiserăți","indicative-pluperfect-plural-third-person":"voiseră","first-person-present-singular-subjunctive":"să voiesc","present-second-person-singular-subjunctive":"să voiești","present-singular-subjunctive-third-person":"să voiască","first-person-plural-present-subjunctive":"să voim","plural-present-second-person-subjunctive":"să voiți","plural-present-subjunctive-third-person":"să voiască","imperative-second-person-singular":"voiește","imperative-plural-second-person":"voiți","imperative-negative-second-person-singular":"nu voi","imperative-negative-plural-second-person":"nu voiți"}},{"word":"numai","pos":"adv","definitions":["only (no more than)","only (exclusively)","Indicates the subject to be characterised by an abundance of the respective noun: all","almost, nearly, just about (of an event that was close to happening)","suddenly, unexpectedly"],"pronunciation":"/ˈnu.maj/","examples":[{"ro":"și nu numai","en":"and more"},{"ro":"numai că","en":"however, it’s just that"},{"ro":"Trenul merge cu numai 60 km/h.","en":"The train is only going 60 km/h."}],"forms":{"alternative-apocopic-colloquial":"numa'","alternative":"нумай"}},{"word":"numai","pos":"conj","definitions":["but"],"pronunciation":"/ˈnu.maj/","forms":{"alternative-apocopic-colloquial":"numa'","alternative":"нумай"}},{"word":"om","pos":"noun","definitions":["man (male)","human"],"pronunciation":"/ˈom/","forms":{"plural":"oameni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"om","accusative-definite-nominative-singular":"omul","accusative-indefinite-nominative-plural":"oameni","accusative-definite-nominative-plural":"oamenii","dative-genitive-indefinite-singular":"om","dative-definite-genitive-singular":"omului","dative-genitive-indefinite-plural":"oameni","dative-definite-genitive-plural":"oamenilor","singular-vocative":"omule","plural-vocative":"oamenilor","alternative-archaic":"omu"}},{"word":"om","pos":"verb","definitions":["might"],"pronunciation":"/ˈom/","examples":[{"ro":"om merge mâine undeva","en":"we might go somewhere tomorrow"}],"forms":{"alternative-archaic":"omu"}},{"word":"face","pos":"verb","definitions":["to do, act","to make (construct, build, prepare, create, transform)","to cause someone to do something","to make (render a certain way, turn into)","give birth to someone"],"pronunciation":"/ˈfat͡ʃe/","examples":[{"ro":"Fă ce vrei.","en":"Do what you want."},{"ro":"Azi am făcut niște treburi obositoare.","en":"Today I did some tiring things."},{"ro":"Ce faci când ajungi acasă?","en":"What do you do when you get home?"}],"forms":{"canonical":"a face 3rd conjugation","present-singular-third-person":"face","participle-past":"făcut","subjunctive-third-person":"facă","table-tags":"conjugation-3","inflection-template":"ro-conj-2","infinitive":"a face","gerund":"făcând","first-person-indicative-present-singular":"fac","indicative-present-second-person-singular":"faci","indicative-present-singular-third-person":"face","first-person-indicative-plural-present":"facem","indicative-plural-present-second-person":"faceți","indicative-plural-present-third-person":"fac","first-person-imperfect-indicative-singular":"făceam","imperfect-indicative-second-person-singular":"făceai","imperfect-indicative-singular-third-person":"făcea","first-person-imperfect-indicative-plural":"făceam","imperfect-indicative-plural-second-person":"făceați","imperfect-indicative-plural-third-person":"făceau","first-person-indicative-perfect-singular":"făcui","indicative-perfect-second-person-singular":"făcuși","indicative-perfect-singular-third-person":"făcu","first-person-indicative-perfect-plural":"făcurăm","indicative-perfect-plural-second-person":"făcurăți","indicative-perfect-plural-third-person":"făcură","first-person-indicative-pluperfect-singular":"făcusem","indicative-pluperfect-second-person-singular":"făcuseși","indicative-pluperfect-singular-third-person":"făcuse","first-person-indicative-pluperfect-plural":"făcuserăm","indicative-pluperfect-plural-second-person":"făcuserăți","indicative-pluperfect-plural-third-person":"făcuseră","first-person-present-singular-subjunctive":"să fac","present-second-person-singular-subjunctive":"să faci","present-singular-subjunctive-third-person":"să facă","first-person-plural-present-subjunctive":"să facem","plural-present-second-person-subjunctive":"să faceți","plural-present-subjunctive-third-person":"să facă","imperative-second-person-singular":"fă","imperative-plural-second-person":"faceți","imperative-negative-second-person-singular":"nu face","imperative-negative-plural-second-person":"nu faceți"}},{"word":"fără","pos":"prep","definitions":["without","free"],"pronunciation":"[ˈfə.rə]","examples":[{"ro":"Pleacă fără mine.","en":"Go without me."},{"ro":"lapte fără grăsime.","en":"Fat-free milk."}]},{"word":"zi","pos":"noun","definitions":["day"],"pronunciation":"/ˈzi/","forms":{"plural":"zile","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"zi","accusative-definite-nominative-singular":"ziua","accusative-indefinite-nominative-plural":"zile","accusative-definite-nominative-plural":"zilele","dative-genitive-indefinite-singular":"zile","dative-definite-genitive-singular":"zilei","dative-genitive-indefinite-plural":"zile","dative-definite-genitive-plural":"zilelor","singular-vocative":"ziuo","plural-vocative":"zilelor","alternative-obsolete":"d̦i","alternative":"ziuă"}},{"word":"zi","pos":"verb","definitions":["second-person singular imperative of zice"],"pronunciation":"/ˈzi/","forms":{"alternative-obsolete":"d̦i","alternative":"ziuă"}},{"word":"făcut","pos":"adj","definitions":["done; made"],"pronunciation":"[fəˈkut]","forms":{"feminine-singular":"făcută","masculine-plural":"făcuți","feminine-neuter-plural":"făcute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"făcut","error-unrecognized-form-feminine-indefinite-singular":"făcută","error-unrecognized-form-indefinite-masculine-plural":"făcuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"făcute","definite-error-unrecognized-form-masculine-neuter-singular":"făcutul","definite-error-unrecognized-form-feminine-singular":"făcuta","definite-error-unrecognized-form-masculine-plural":"făcuții","definite-error-unrecognized-form-feminine-neuter-plural":"făcutele","alternative-Internet":"fct"}},{"word":"făcut","pos":"verb","definitions":["past participle of face"],"pronunciation":"[fəˈkut]","forms":{"participle-past":"of face","alternative-Internet":"fct"}},{"word":"ne","pos":"pron","definitions":["us"],"pronunciation":"/ne/","examples":[{"ro":"El ne urmează.","en":"He's following us."}],"forms":{"alternative":"нє"}},{"word":"ne","pos":"pron","definitions":["(to) us"],"pronunciation":"/ne/","examples":[{"ro":"Ele ne dau cadouri.","en":"They give us presents."}],"forms":{"alternative":"нє"}},{"word":"fie","pos":"verb","definitions":["third-person singular/plural subjunctive of fi (“to be”)"],"pronunciation":"/ˈfi.e/"},{"word":"fie","pos":"noun","definitions":["daughter"],"pronunciation":"/ˈfi.e/","forms":{"plural":"fii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fie","accusative-definite-nominative-singular":"fia","accusative-indefinite-nominative-plural":"fii","accusative-definite-nominative-plural":"fiile","dative-genitive-indefinite-singular":"fii","dative-definite-genitive-singular":"fiei","dative-genitive-indefinite-plural":"fii","dative-definite-genitive-plural":"fiilor","singular-vocative":"fie","plural-vocative":"fiilor","alternative-obsolete":"fiie"}},{"word":"noi","pos":"pron","definitions":["we"],"pronunciation":"/noj/","forms":{"table-tags":"no-table-tags","inflection-template":"l-self","nominative":"noi","accusative-stressed":"noi","accusative-error-unrecognized-form":"ne","dative-stressed":"nouă","dative-error-unrecognized-form":"ne","masculine-possessive-singular":"nostru","masculine-plural-possessive":"noștri","neuter-possessive-singular":"nostru","neuter-plural-possessive":"noastre","feminine-possessive-singular":"noastră","feminine-plural-possessive":"noastre"}},{"word":"noi","pos":"pron","definitions":["us"],"pronunciation":"/noj/"},{"word":"noi","pos":"adj","definitions":["masculine/feminine/neuter plural nominative/accusative of nou (“new”)"],"pronunciation":"/noj/"},{"word":"facă","pos":"verb","definitions":["third-person singular/plural present subjunctive of face"],"pronunciation":"[ˈfakə]"},{"word":"unul","pos":"pron","definitions":["one"],"pronunciation":"[ˈu.nul]","examples":[{"ro":"Am un frate. Ai unul și tu?","en":"I have a brother. Do you have one, too?"}],"forms":{"feminine-singular":"una","masculine-plural":"unii","feminine-neuter-plural":"unele","table-tags":"no-table-tags","inflection-template":"l-self","accusative-masculine-neuter-nominative-singular":"unul","accusative-feminine-nominative-singular":"una","accusative-masculine-nominative-plural":"unii","accusative-feminine-neuter-nominative-plural":"unele","dative-genitive-masculine-neuter-singular":"unuia","dative-feminine-genitive-singular":"uneia","dative-genitive-masculine-plural":"unora","dative-feminine-genitive-neuter-plural":"unora"}},{"word":"toată","pos":"det","definitions":["nominative/accusative feminine singular of tot"],"pronunciation":"/ˈto̯a.tə/"},{"word":"toată","pos":"pron","definitions":["nominative/accusative feminine singular of tot"],"pronunciation":"/ˈto̯a.tə/"},{"word":"lor","pos":"pron","definitions":["their"],"pronunciation":"/lor/"},{"word":"lor","pos":"pron","definitions":["to them"],"pronunciation":"/lor/"},{"word":"tom","pos":"noun","definitions":["volume"],"forms":{"plural":"tomuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"tom","accusative-definite-nominative-singular":"tomul","accusative-indefinite-nominative-plural":"tomuri","accusative-definite-nominative-plural":"tomurile","dative-genitive-indefinite-singular":"tom","dative-definite-genitive-singular":"tomului","dative-genitive-indefinite-plural":"tomuri","dative-definite-genitive-plural":"tomurilor","singular-vocative":"tomule","plural-vocative":"tomurilor"}},{"word":"ori","pos":"conj","definitions":["or","either"],"pronunciation":"/orʲ/","examples":[{"ro":"\"Viață-n libertate ori moarte\" strigă toți.","en":"\"Life in liberty or death,\" shout all.\n—Deșteaptă-te, române!, the Romanian national anthem"},{"ro":"vreau o banană ori un măr","en":"I want either a banana or an apple."}],"forms":{"alternative":"орь"}},{"word":"ori","pos":"conj","definitions":["while, whereas, on the other hand"],"pronunciation":"/orʲ/","forms":{"alternative":"орь"}},{"word":"ori","pos":"noun","definitions":["plural of oară"],"pronunciation":"/orʲ/","forms":{"alternative":"орь"}},{"word":"erau","pos":"verb","definitions":["third-person plural imperfect indicative of fi: they were"],"pronunciation":"[(j)eˈraw]"},{"word":"veni","pos":"verb","definitions":["to come"],"pronunciation":"/veˈni/","examples":[{"ro":"De unde veniți?","en":"Where do you come from?"}],"forms":{"canonical":"a veni 4th conjugation","present-singular-third-person":"vine","participle-past":"venit","subjunctive-third-person":"vină","table-tags":"conjugation-4","inflection-template":"ro-conj-veni","infinitive":"a veni","gerund":"venind","first-person-indicative-present-singular":"vin","indicative-present-second-person-singular":"vii","indicative-present-singular-third-person":"vine","first-person-indicative-plural-present":"venim","indicative-plural-present-second-person":"veniți","indicative-plural-present-third-person":"vin","first-person-imperfect-indicative-singular":"veneam","imperfect-indicative-second-person-singular":"veneai","imperfect-indicative-singular-third-person":"venea","first-person-imperfect-indicative-plural":"veneam","imperfect-indicative-plural-second-person":"veneați","imperfect-indicative-plural-third-person":"veneau","first-person-indicative-perfect-singular":"venii","indicative-perfect-second-person-singular":"veniși","indicative-perfect-singular-third-person":"veni","first-person-indicative-perfect-plural":"venirăm","indicative-perfect-plural-second-person":"venirăți","indicative-perfect-plural-third-person":"veniră","first-person-indicative-pluperfect-singular":"venisem","indicative-pluperfect-second-person-singular":"veniseși","indicative-pluperfect-singular-third-person":"venise","first-person-indicative-pluperfect-plural":"veniserăm","indicative-pluperfect-plural-second-person":"veniserăți","indicative-pluperfect-plural-third-person":"veniseră","first-person-present-singular-subjunctive":"să vin","present-second-person-singular-subjunctive":"să vii","present-singular-subjunctive-third-person":"să vină","first-person-plural-present-subjunctive":"să venim","plural-present-second-person-subjunctive":"să veniți","plural-present-subjunctive-third-person":"să vină","imperative-second-person-singular":"vino","imperative-plural-second-person":"veniți","imperative-negative-second-person-singular":"nu veni","imperative-negative-plural-second-person":"nu veniți","alternative":"вени"}},{"word":"Noapte","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Noapte"}},{"word":"noapte","pos":"noun","definitions":["night"],"pronunciation":"/ˈno̯ap.te/","forms":{"plural":"nopți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"noapte","accusative-definite-nominative-singular":"noaptea","accusative-indefinite-nominative-plural":"nopți","accusative-definite-nominative-plural":"nopțile","dative-genitive-indefinite-singular":"nopți","dative-definite-genitive-singular":"nopții","dative-genitive-indefinite-plural":"nopți","dative-definite-genitive-plural":"nopților","singular-vocative":"noapte","plural-vocative":"nopților","alternative":"ноапте"}},{"word":"ochii","pos":"noun","definitions":["definite nominative/accusative plural of ochi"]},{"word":"zile","pos":"noun","definitions":["plural of zi"],"pronunciation":"[ˈzile]","gender":"f-p"},{"word":"răspunde","pos":"verb","definitions":["to respond, reply, answer"],"pronunciation":"/rəs.ˈpun.de/","forms":{"canonical":"a răspunde 3rd conjugation","present-singular-third-person":"răspunde","participle-past":"răspuns","subjunctive-third-person":"răspundă","table-tags":"conjugation-3","inflection-template":"ro-conj-e","infinitive":"a răspunde","gerund":"răspunzând","first-person-indicative-present-singular":"răspund","indicative-present-second-person-singular":"răspunzi","indicative-present-singular-third-person":"răspunde","first-person-indicative-plural-present":"răspundem","indicative-plural-present-second-person":"răspundeți","indicative-plural-present-third-person":"răspund","first-person-imperfect-indicative-singular":"răspundeam","imperfect-indicative-second-person-singular":"răspundeai","imperfect-indicative-singular-third-person":"răspundea","first-person-imperfect-indicative-plural":"răspundeam","imperfect-indicative-plural-second-person":"răspundeați","imperfect-indicative-plural-third-person":"răspundeau","first-person-indicative-perfect-singular":"răspunsei","indicative-perfect-second-person-singular":"răspunseși","indicative-perfect-singular-third-person":"răspunse","first-person-indicative-perfect-plural":"răspunserăm","indicative-perfect-plural-second-person":"răspunserăți","indicative-perfect-plural-third-person":"răspunseră","first-person-indicative-pluperfect-singular":"răspunsesem","indicative-pluperfect-second-person-singular":"răspunseseși","indicative-pluperfect-singular-third-person":"răspunsese","first-person-indicative-pluperfect-plural":"răspunseserăm","indicative-pluperfect-plural-second-person":"răspunseserăți","indicative-pluperfect-plural-third-person":"răspunseseră","first-person-present-singular-subjunctive":"să răspund","present-second-person-singular-subjunctive":"să răspunzi","present-singular-subjunctive-third-person":"să răspundă","first-person-plural-present-subjunctive":"să răspundem","plural-present-second-person-subjunctive":"să răspundeți","plural-present-subjunctive-third-person":"să răspundă","imperative-second-person-singular":"răspunde","imperative-plural-second-person":"răspundeți","imperative-negative-second-person-singular":"nu răspunde","imperative-negative-plural-second-person":"nu răspundeți"}},{"word":"bună","pos":"adj","definitions":["nominative/accusative feminine singular of bun"],"pronunciation":"[ˈbunə]"},{"word":"bună","pos":"intj","definitions":["hey! hi!"],"pronunciation":"[ˈbunə]"},{"word":"bun","pos":"adj","definitions":["good"],"pronunciation":"/bun/","examples":[{"ro":"E un om bun, crede-mă.","en":"He is a good man, trust me."},{"ro":"Sunt bun la fotbal.","en":"I am good at football."}],"forms":{"feminine-singular":"bună","masculine-plural":"buni","feminine-neuter-plural":"bune","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bun","error-unrecognized-form-feminine-indefinite-singular":"bună","error-unrecognized-form-indefinite-masculine-plural":"buni","error-unrecognized-form-feminine-indefinite-neuter-plural":"bune","definite-error-unrecognized-form-masculine-neuter-singular":"bunul","definite-error-unrecognized-form-feminine-singular":"buna","definite-error-unrecognized-form-masculine-plural":"bunii","definite-error-unrecognized-form-feminine-neuter-plural":"bunele"}},{"word":"bun","pos":"noun","definitions":["good, asset, possession"],"pronunciation":"/bun/","forms":{"plural":"bunuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bun","accusative-definite-nominative-singular":"bunul","accusative-indefinite-nominative-plural":"bunuri","accusative-definite-nominative-plural":"bunurile","dative-genitive-indefinite-singular":"bun","dative-definite-genitive-singular":"bunului","dative-genitive-indefinite-plural":"bunuri","dative-definite-genitive-plural":"bunurilor","singular-vocative":"bunule","plural-vocative":"bunurilor"}},{"word":"bun","pos":"noun","definitions":["grandfather"],"pronunciation":"/bun/","forms":{"plural":"buni","feminine":"equivalent bună","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bun","accusative-definite-nominative-singular":"bunul","accusative-indefinite-nominative-plural":"buni","accusative-definite-nominative-plural":"bunii","dative-genitive-indefinite-singular":"bun","dative-definite-genitive-singular":"bunului","dative-genitive-indefinite-plural":"buni","dative-definite-genitive-plural":"bunilor","singular-vocative":"bunule","plural-vocative":"bunilor"}},{"word":"trebuie","pos":"verb","definitions":["present indicative of trebui; it is necessary, must, need, have to"],"pronunciation":"[ˈtre.bu.je]","examples":[{"ro":"trebuie să plecăm în curând","en":"we need to leave soon"}],"forms":{"alternative-informal":"tre","alternative":"trebie"}},{"word":"omul","pos":"noun","definitions":["definite nominative/accusative singular of om"],"pronunciation":"/ˈo.mul/"},{"word":"fată","pos":"noun","definitions":["girl","daughter"],"pronunciation":"[ˈfa.tə]","examples":[{"ro":"Ce face fata asta?","en":"What is that girl doing?"},{"ro":"Acele fete vorbesc germană.","en":"Those girls speak German."},{"ro":"E fata mea.","en":"She's my daughter."}],"forms":{"plural":"fete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fată","accusative-definite-nominative-singular":"fata","accusative-indefinite-nominative-plural":"fete","accusative-definite-nominative-plural":"fetele","dative-genitive-indefinite-singular":"fete","dative-definite-genitive-singular":"fetei","dative-genitive-indefinite-plural":"fete","dative-definite-genitive-plural":"fetelor","singular-vocative":"fată","plural-vocative":"fetelor"}},{"word":"nu-i","pos":"contraction","definitions":["contraction of nu + e, literally “is not”: isn't"],"pronunciation":"/ˈnuj/","examples":[{"ro":"Nu-i aici acum. Poți încerca să revii mai târziu.","en":"He isn't here right now. You can try to come back later."}]},{"word":"jos","pos":"adv","definitions":["down"],"pronunciation":"/ʒos/"},{"word":"jos","pos":"adj","definitions":["low","down"],"pronunciation":"/ʒos/","forms":{"feminine-singular":"joasă","masculine-plural":"joși","feminine-neuter-plural":"joase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jos","error-unrecognized-form-feminine-indefinite-singular":"joasă","error-unrecognized-form-indefinite-masculine-plural":"joși","error-unrecognized-form-feminine-indefinite-neuter-plural":"joase","definite-error-unrecognized-form-masculine-neuter-singular":"josul","definite-error-unrecognized-form-feminine-singular":"joasa","definite-error-unrecognized-form-masculine-plural":"joșii","definite-error-unrecognized-form-feminine-neuter-plural":"joasele"}},{"word":"vă","pos":"pron","definitions":["you (group being addressed)"],"pronunciation":"/və/"},{"word":"vă","pos":"pron","definitions":["(to) you (group being addressed)"],"pronunciation":"/və/"},{"word":"zis","pos":"verb","definitions":["past participle of zice"],"forms":{"participle-past":"of zice","table-tags":"no-table-tags","inflection-template":"ro-pp-s","error-unrecognized-form-indefinite-masculine-neuter-singular":"zis","error-unrecognized-form-feminine-indefinite-singular":"zisă","error-unrecognized-form-indefinite-masculine-plural":"ziși","error-unrecognized-form-feminine-indefinite-neuter-plural":"zise","definite-error-unrecognized-form-masculine-neuter-singular":"zisul","definite-error-unrecognized-form-feminine-singular":"zisa","definite-error-unrecognized-form-masculine-plural":"zișii","definite-error-unrecognized-form-feminine-neuter-plural":"zisele"}},{"word":"foarte","pos":"adv","definitions":["very"],"pronunciation":"[ˈfo̯ar.te]","examples":[{"ro":"Ea este foarte frumoasă.","en":"She is very beautiful."},{"ro":"Eu sunt foarte bine, mulțumesc.","en":"I am very well, thank you."},{"ro":"Am uitat să fac ceva foarte important...","en":"I forgot to do something really important..."}]},{"word":"loc","pos":"noun","definitions":["place, location","stead"],"pronunciation":"/lok/","forms":{"plural":"locuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"loc","accusative-definite-nominative-singular":"locul","accusative-indefinite-nominative-plural":"locuri","accusative-definite-nominative-plural":"locurile","dative-genitive-indefinite-singular":"loc","dative-definite-genitive-singular":"locului","dative-genitive-indefinite-plural":"locuri","dative-definite-genitive-plural":"locurilor","singular-vocative":"locule","plural-vocative":"locurilor"}},{"word":"frumoasă","pos":"adj","definitions":["nominative/accusative feminine singular of frumos"],"pronunciation":"[fruˈmo̯asə]"},{"word":"frumoasă","pos":"noun","definitions":["female equivalent of frumos"],"pronunciation":"[fruˈmo̯asə]","forms":{"plural":"frumoase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frumoasă","accusative-definite-nominative-singular":"frumoasa","accusative-indefinite-nominative-plural":"frumoase","accusative-definite-nominative-plural":"frumoasele","dative-genitive-indefinite-singular":"frumoase","dative-definite-genitive-singular":"frumoasei","dative-genitive-indefinite-plural":"frumoase","dative-definite-genitive-plural":"frumoaselor","singular-vocative":"frumoasă","plural-vocative":"frumoaselor"}},{"word":"fiecare","pos":"det","definitions":["every, each"],"pronunciation":"/fi.eˈka.re/","forms":{"table-tags":"no-table-tags","inflection-template":"l-self","accusative-masculine-neuter-nominative-singular":"fiecare","accusative-feminine-nominative-singular":"fiecare","accusative-masculine-nominative-plural":"-","accusative-feminine-neuter-nominative-plural":"-","dative-genitive-masculine-neuter-singular":"fiecărui","dative-feminine-genitive-singular":"fiecărei","dative-genitive-masculine-plural":"fiecăror","dative-feminine-genitive-neuter-plural":"fiecăror","alternative":"fieșcare"}},{"word":"fiecare","pos":"pron","definitions":["everyone, each one"],"pronunciation":"/fi.eˈka.re/","forms":{"table-tags":"no-table-tags","inflection-template":"l-self","accusative-masculine-neuter-nominative-singular":"fiecare","accusative-feminine-nominative-singular":"fiecare","accusative-masculine-nominative-plural":"-","accusative-feminine-neuter-nominative-plural":"-","dative-genitive-masculine-neuter-singular":"fiecăruia","dative-feminine-genitive-singular":"fiecăreia","dative-genitive-masculine-plural":"fiecărora","dative-feminine-genitive-neuter-plural":"fiecărora","alternative":"fieșcare"}},{"word":"nimic","pos":"pron","definitions":["nothing","anything"],"pronunciation":"/niˈmik/","examples":[{"ro":"E ușor a scrie versuri, / Când nimic nu ai a spune [...]","en":"It is easy to write verses, / When you have nothing to say …"}],"forms":{"alternative":"nimica","alternative-regional":"nemică"}},{"word":"Bătrân","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bătrân"}},{"word":"bătrân","pos":"adj","definitions":["old"],"pronunciation":"/bəˈtrɨn/","forms":{"feminine-singular":"bătrână","masculine-plural":"bătrâni","feminine-neuter-plural":"bătrâne","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bătrân","error-unrecognized-form-feminine-indefinite-singular":"bătrână","error-unrecognized-form-indefinite-masculine-plural":"bătrâni","error-unrecognized-form-feminine-indefinite-neuter-plural":"bătrâne","definite-error-unrecognized-form-masculine-neuter-singular":"bătrânul","definite-error-unrecognized-form-feminine-singular":"bătrâna","definite-error-unrecognized-form-masculine-plural":"bătrânii","definite-error-unrecognized-form-feminine-neuter-plural":"bătrânele","alternative":"bătrîn"}},{"word":"bătrân","pos":"noun","definitions":["old man"],"pronunciation":"/bəˈtrɨn/","forms":{"plural":"bătrâni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bătrân","accusative-definite-nominative-singular":"bătrânul","accusative-indefinite-nominative-plural":"bătrâni","accusative-definite-nominative-plural":"bătrânii","dative-genitive-indefinite-singular":"bătrân","dative-definite-genitive-singular":"bătrânului","dative-genitive-indefinite-plural":"bătrâni","dative-definite-genitive-plural":"bătrânilor","singular-vocative":"bătrânule","plural-vocative":"bătrânilor","alternative":"bătrîn"}},{"word":"oameni","pos":"noun","definitions":["plural of om; people"],"pronunciation":"/ˈo̯a.menʲ/","gender":"m-p","forms":{"alternative":"ómeni"}},{"word":"vârtejire","pos":"noun","definitions":["whirlwind"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"vârtejire","accusative-definite-nominative":"vârtejirea","dative-genitive-indefinite":"i","dative-definite-genitive":"ii","vocative":"vârtejire"}},{"word":"Urmă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Urmă"}},{"word":"urmă","pos":"noun","definitions":["footprint, track","mark (visible vestige of a contact or process)","track, trail (mark left behind by a movement)","wake (what follows the passage of something)","trace, vestige (material or immaterial proof of something’s existence)"],"pronunciation":"/ˈur.mə/","examples":[{"ro":"Un vânător cunoaște animalele după urme.","en":"A hunter knows animals by their tracks."},{"ro":"a lăsa o urmă","en":"to leave a mark"},{"ro":"urme de frână","en":"brake marks, skid marks"}],"forms":{"plural":"urme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"urmă","accusative-definite-nominative-singular":"urma","accusative-indefinite-nominative-plural":"urme","accusative-definite-nominative-plural":"urmele","dative-genitive-indefinite-singular":"urme","dative-definite-genitive-singular":"urmei","dative-genitive-indefinite-plural":"urme","dative-definite-genitive-plural":"urmelor","singular-vocative":"urmă","plural-vocative":"urmelor"}},{"word":"urmă","pos":"verb","definitions":["third-person singular simple perfect indicative of urma"],"pronunciation":"/urˈmə/"},{"word":"lumea","pos":"noun","definitions":["definite nominative/accusative singular of lume"],"pronunciation":"/ˈlume̯a/"},{"word":"ține","pos":"verb","definitions":["to hold","to hold on","to be a part of a whole, to be subordinate in a system, to belong","to last for someone","to treasure, to hold dear"],"pronunciation":"/ˈt͡si.ne/","examples":[{"ro":"Pasagerii care stau în picioare în tramvai pot să se țină de bară.","en":"The passengers standing up in the tram may hold on to the pole."},{"ro":"Alaska ține de Statele Unite.","en":"Alaska is part of the United States."},{"ro":"Te mai ține mult supărarea?","en":"Will you be angry for much longer?"}],"forms":{"canonical":"a ține 3rd conjugation","present-singular-third-person":"ține","participle-past":"ținut","subjunctive-third-person":"țină","table-tags":"conjugation-3","inflection-template":"ro-conj-e-ut","infinitive":"a ține","gerund":"ținând","first-person-indicative-present-singular":"țin","indicative-present-second-person-singular":"ții","indicative-present-singular-third-person":"ține","first-person-indicative-plural-present":"ținem","indicative-plural-present-second-person":"țineți","indicative-plural-present-third-person":"țin","first-person-imperfect-indicative-singular":"țineam","imperfect-indicative-second-person-singular":"țineai","imperfect-indicative-singular-third-person":"ținea","first-person-imperfect-indicative-plural":"țineam","imperfect-indicative-plural-second-person":"țineați","imperfect-indicative-plural-third-person":"țineau","first-person-indicative-perfect-singular":"ținui","indicative-perfect-second-person-singular":"ținuși","indicative-perfect-singular-third-person":"ținu","first-person-indicative-perfect-plural":"ținurăm","indicative-perfect-plural-second-person":"ținurăți","indicative-perfect-plural-third-person":"ținură","first-person-indicative-pluperfect-singular":"ținusem","indicative-pluperfect-second-person-singular":"ținuseși","indicative-pluperfect-singular-third-person":"ținuse","first-person-indicative-pluperfect-plural":"ținuserăm","indicative-pluperfect-plural-second-person":"ținuserăți","indicative-pluperfect-plural-third-person":"ținuseră","first-person-present-singular-subjunctive":"să țin","present-second-person-singular-subjunctive":"să ții","present-singular-subjunctive-third-person":"să țină","first-person-plural-present-subjunctive":"să ținem","plural-present-second-person-subjunctive":"să țineți","plural-present-subjunctive-third-person":"să țină","imperative-second-person-singular":"ține","imperative-plural-second-person":"țineți","imperative-negative-second-person-singular":"nu ține","imperative-negative-plural-second-person":"nu țineți","alternative-archaic":"ținea","alternative":"цине"}},{"word":"rămâne","pos":"verb","definitions":["to remain, be left, stay behind","to last"],"pronunciation":"/rəˈmɨ.ne/","forms":{"canonical":"a rămâne 3rd conjugation","present-singular-third-person":"rămâne","participle-past":"rămas","subjunctive-third-person":"rămână","table-tags":"conjugation-3","inflection-template":"ro-conj-2\n","infinitive":"a rămâne","gerund":"rămânând","first-person-indicative-present-singular":"rămân","indicative-present-second-person-singular":"rămâi","indicative-present-singular-third-person":"rămâne","first-person-indicative-plural-present":"rămânem","indicative-plural-present-second-person":"rămâneți","indicative-plural-present-third-person":"rămân","first-person-imperfect-indicative-singular":"rămâneam","imperfect-indicative-second-person-singular":"rămâneai","imperfect-indicative-singular-third-person":"rămânea","first-person-imperfect-indicative-plural":"rămâneam","imperfect-indicative-plural-second-person":"rămâneați","imperfect-indicative-plural-third-person":"rămâneau","first-person-indicative-perfect-singular":"rămăsei","indicative-perfect-second-person-singular":"rămăseși","indicative-perfect-singular-third-person":"rămase","first-person-indicative-perfect-plural":"rămaserăm","indicative-perfect-plural-second-person":"rămaserăți","indicative-perfect-plural-third-person":"rămaseră","first-person-indicative-pluperfect-singular":"rămăsesem","indicative-pluperfect-second-person-singular":"rămăseseși","indicative-pluperfect-singular-third-person":"rămăsese","first-person-indicative-pluperfect-plural":"rămăseserăm","indicative-pluperfect-plural-second-person":"rămăseserăți","indicative-pluperfect-plural-third-person":"rămăseseră","first-person-present-singular-subjunctive":"să rămân","present-second-person-singular-subjunctive":"să rămâi","present-singular-subjunctive-third-person":"să rămână","first-person-plural-present-subjunctive":"să rămânem","plural-present-second-person-subjunctive":"să rămâneți","plural-present-subjunctive-third-person":"să rămână","imperative-second-person-singular":"rămâi","imperative-plural-second-person":"rămâneți","imperative-negative-second-person-singular":"nu rămâne","imperative-negative-plural-second-person":"nu rămâneți","alternative":"rămânea"}},{"word":"trece","pos":"verb","definitions":["to pass through (enter and then leave a region in space)","to pass by","to have passed something (leave behind in one’s path)","to exceed a value","to leave behind, come to terms with something"],"pronunciation":"/ˈtre.t͡ʃe/","examples":[{"ro":"În loc să treacă prin oraș, șoferii pot folosi drumul de centură.","en":"Instead of passing through the city, drivers can use the ring road."},{"ro":"Radiațiile gamma trec prin zece centimetri de plumb.","en":"Gamma radiation passes through ten centimetres of lead."},{"ro":"Hainele nu lasă frigul să treacă.","en":"Clothes do not let the cold pass through."}],"forms":{"canonical":"a trece 3rd conjugation","present-singular-third-person":"trece","participle-past":"trecut","subjunctive-third-person":"treacă","table-tags":"conjugation-3","inflection-template":"ro-conj-e-ut","infinitive":"a trece","gerund":"trecând","first-person-indicative-present-singular":"trec","indicative-present-second-person-singular":"treci","indicative-present-singular-third-person":"trece","first-person-indicative-plural-present":"trecem","indicative-plural-present-second-person":"treceți","indicative-plural-present-third-person":"trec","first-person-imperfect-indicative-singular":"treceam","imperfect-indicative-second-person-singular":"treceai","imperfect-indicative-singular-third-person":"trecea","first-person-imperfect-indicative-plural":"treceam","imperfect-indicative-plural-second-person":"treceați","imperfect-indicative-plural-third-person":"treceau","first-person-indicative-perfect-singular":"trecui","indicative-perfect-second-person-singular":"trecuși","indicative-perfect-singular-third-person":"trecu","first-person-indicative-perfect-plural":"trecurăm","indicative-perfect-plural-second-person":"trecurăți","indicative-perfect-plural-third-person":"trecură","first-person-indicative-pluperfect-singular":"trecusem","indicative-pluperfect-second-person-singular":"trecuseși","indicative-pluperfect-singular-third-person":"trecuse","first-person-indicative-pluperfect-plural":"trecuserăm","indicative-pluperfect-plural-second-person":"trecuserăți","indicative-pluperfect-plural-third-person":"trecuseră","first-person-present-singular-subjunctive":"să trec","present-second-person-singular-subjunctive":"să treci","present-singular-subjunctive-third-person":"să treacă","first-person-plural-present-subjunctive":"să trecem","plural-present-second-person-subjunctive":"să treceți","plural-present-subjunctive-third-person":"să treacă","imperative-second-person-singular":"treci","imperative-plural-second-person":"treceți","imperative-negative-second-person-singular":"nu trece","imperative-negative-plural-second-person":"nu treceți"}},{"word":"vorbă","pos":"noun","definitions":["talk, talking, speaking","word","conversation, discussion","a gathering"],"pronunciation":"/ˈvor.bə/","examples":[{"ro":"a intra în vorbă cu cineva","en":"strike up a conversation with someone"}],"forms":{"plural":"vorbe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"vorbă","accusative-definite-nominative-singular":"vorba","accusative-indefinite-nominative-plural":"vorbe","accusative-definite-nominative-plural":"vorbele","dative-genitive-indefinite-singular":"vorbe","dative-definite-genitive-singular":"vorbei","dative-genitive-indefinite-plural":"vorbe","dative-definite-genitive-plural":"vorbelor","singular-vocative":"vorbă","plural-vocative":"vorbelor"}},{"word":"văzut","pos":"noun","definitions":["seeing"],"pronunciation":"[vəˈzut]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"văzut","accusative-definite-nominative":"văzutul","dative-genitive-indefinite":"văzut","dative-definite-genitive":"văzutului","vocative":"văzutule","alternative-Internet":"vzt"}},{"word":"văzut","pos":"verb","definitions":["past participle of vedea"],"pronunciation":"[vəˈzut]","examples":[{"ro":"Ai văzut acest film?","en":"Have you seen this movie?"}],"forms":{"participle-past":"of vedea","alternative-Internet":"vzt"}},{"word":"Frumos","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Frumos"}},{"word":"frumos","pos":"adj","definitions":["beautiful","handsome"],"pronunciation":"/fruˈmos/","forms":{"feminine-singular":"frumoasă","masculine-plural":"frumoși","feminine-neuter-plural":"frumoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frumos","error-unrecognized-form-feminine-indefinite-singular":"frumoasă","error-unrecognized-form-indefinite-masculine-plural":"frumoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"frumoase","definite-error-unrecognized-form-masculine-neuter-singular":"frumosul","definite-error-unrecognized-form-feminine-singular":"frumoasa","definite-error-unrecognized-form-masculine-plural":"frumoșii","definite-error-unrecognized-form-feminine-neuter-plural":"frumoasele"}},{"word":"frumos","pos":"adv","definitions":["beautifully, nicely"],"pronunciation":"/fruˈmos/"},{"word":"fiul","pos":"noun","definitions":["definite nominative/accusative singular of fiu"]},{"word":"oamenii","pos":"noun","definitions":["definite nominative/accusative plural of om"]},{"word":"fiindcă","pos":"conj","definitions":["because (literally, “being that”)"],"pronunciation":"/fiˈind.kə/","examples":[{"ro":"Nu știu care restaurant e cel mai bun, fiindcă nu locuiesc pe aici.","en":"I don't know which restaurant is the best, being that I don't live around here."}],"forms":{"alternative-dated":"fiind-că","alternative":"фииндкэ"}},{"word":"tine","pos":"pron","definitions":["you"],"pronunciation":"/ˈti.ne/","examples":[{"ro":"te iubesc pe tine","en":"I love you"}],"forms":{"alternative-Internet":"tn"}},{"word":"lucru","pos":"noun","definitions":["thing; object","work, problem, action","belongings"],"pronunciation":"[ˈlukru]","examples":[{"ro":"lucrurile mele","en":"my things; my belongings"}],"forms":{"plural":"lucruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lucru","accusative-definite-nominative-singular":"lucrul","accusative-indefinite-nominative-plural":"lucruri","accusative-definite-nominative-plural":"lucrurile","dative-genitive-indefinite-singular":"lucru","dative-definite-genitive-singular":"lucrului","dative-genitive-indefinite-plural":"lucruri","dative-definite-genitive-plural":"lucrurilor","singular-vocative":"lucrule","plural-vocative":"lucrurilor"}},{"word":"lângă","pos":"prep","definitions":["beside, next to, by, near (to), close to, alongside"],"pronunciation":"/ˈlɨn.ɡə/"},{"word":"umbla","pos":"verb","definitions":["to walk around, wander, scour","to travel, journey","to pace","to circulate"],"pronunciation":"/umˈbla/","forms":{"canonical":"a umbla 1st conjugation","present-singular-third-person":"umblă","participle-past":"umblat","subjunctive-third-person":"umble","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a umbla","gerund":"umblând","first-person-indicative-present-singular":"umblu","indicative-present-second-person-singular":"umbli","indicative-present-singular-third-person":"umblă","first-person-indicative-plural-present":"umblăm","indicative-plural-present-second-person":"umblați","indicative-plural-present-third-person":"umblă","first-person-imperfect-indicative-singular":"umblam","imperfect-indicative-second-person-singular":"umblai","imperfect-indicative-singular-third-person":"umbla","first-person-imperfect-indicative-plural":"umblam","imperfect-indicative-plural-second-person":"umblați","imperfect-indicative-plural-third-person":"umblau","first-person-indicative-perfect-singular":"umblai","indicative-perfect-second-person-singular":"umblași","indicative-perfect-singular-third-person":"umblă","first-person-indicative-perfect-plural":"umblarăm","indicative-perfect-plural-second-person":"umblarăți","indicative-perfect-plural-third-person":"umblară","first-person-indicative-pluperfect-singular":"umblasem","indicative-pluperfect-second-person-singular":"umblaseși","indicative-pluperfect-singular-third-person":"umblase","first-person-indicative-pluperfect-plural":"umblaserăm","indicative-pluperfect-plural-second-person":"umblaserăți","indicative-pluperfect-plural-third-person":"umblaseră","first-person-present-singular-subjunctive":"să umblu","present-second-person-singular-subjunctive":"să umbli","present-singular-subjunctive-third-person":"să umble","first-person-plural-present-subjunctive":"să umblăm","plural-present-second-person-subjunctive":"să umblați","plural-present-subjunctive-third-person":"să umble","imperative-second-person-singular":"umblă","imperative-plural-second-person":"umblați","imperative-negative-second-person-singular":"nu umbla","imperative-negative-plural-second-person":"nu umblați","alternative-obsolete":"âmbla","alternative":"îmbla"}},{"word":"vezi","pos":"verb","definitions":["second-person singular present indicative of vedea","second-person singular present subjunctive of vedea","second-person singular imperative of vedea"],"pronunciation":"/ˈvezʲ/","examples":[{"ro":"acuma vezi?","en":"do you see now?"},{"ro":"haide, vreau să vezi ceva","en":"come on, I want you to see something"}]},{"word":"făcu","pos":"verb","definitions":["third-person singular simple perfect indicative of face"],"pronunciation":"[fəˈku]"},{"word":"vrea","pos":"verb","definitions":["to want","Used to form other tenses.","Used with an infinitive to form the future indicative tense.","Used with fi and a past participle to form the indicative future perfect tense.","Used with fi and a past participle to form the presumptive past tense."],"pronunciation":"/ˈvre̯a/","examples":[{"ro":"Vreau să-l întâlnesc pe prietenul tău Radu.","en":"I want to meet your friend Radu."},{"ro":"Mâine vom merge la teatru.","en":"Tomorrow we will go to the theater."},{"ro":"Când vei începe, eu voi fi terminat deja.","en":"When you will begin, I will have already finished."}],"forms":{"canonical":"a vrea 2nd conjugation","present-singular-third-person":"vrea","participle-past":"vrut","subjunctive-third-person":"vrea","table-tags":"conjugation-2","inflection-template":"ro-conj-2","infinitive":"a vrea","gerund":"vrând","first-person-indicative-present-singular":"vreau","indicative-present-second-person-singular":"vrei","indicative-present-singular-third-person":"vrea","first-person-indicative-plural-present":"vrem","indicative-plural-present-second-person":"vreți","indicative-plural-present-third-person":"vor","first-person-imperfect-indicative-singular":"vream","imperfect-indicative-second-person-singular":"vreai","imperfect-indicative-singular-third-person":"vrea","first-person-imperfect-indicative-plural":"vream","imperfect-indicative-plural-second-person":"vreați","imperfect-indicative-plural-third-person":"vreau","first-person-indicative-perfect-singular":"vrui","indicative-perfect-second-person-singular":"vruși","indicative-perfect-singular-third-person":"vruse","first-person-indicative-perfect-plural":"vrurăm","indicative-perfect-plural-second-person":"vrurăți","indicative-perfect-plural-third-person":"vrură","first-person-indicative-pluperfect-singular":"vrusem","indicative-pluperfect-second-person-singular":"vruseși","indicative-pluperfect-singular-third-person":"vruse","first-person-indicative-pluperfect-plural":"vruserăm","indicative-pluperfect-plural-second-person":"vruserăți","indicative-pluperfect-plural-third-person":"vruseră","first-person-present-singular-subjunctive":"să vreau","present-second-person-singular-subjunctive":"să vrei","present-singular-subjunctive-third-person":"să vrea","first-person-plural-present-subjunctive":"să vrem","plural-present-second-person-subjunctive":"să vreți","plural-present-subjunctive-third-person":"să vrea","imperative-second-person-singular":"vrei","imperative-plural-second-person":"vreți","imperative-negative-second-person-singular":"nu vrea","imperative-negative-plural-second-person":"nu vreți","auxiliary":"verb","alternative":"vroi"}},{"word":"vorba","pos":"noun","definitions":["definite nominative/accusative singular of vorbă"],"gender":"f"},{"word":"una","pos":"num","definitions":["feminine of unu: one"],"pronunciation":"/ˈuna/","gender":"f","forms":{"alternative":"уна"}},{"word":"una","pos":"pron","definitions":["nominative/accusative feminine singular of unul"],"pronunciation":"/ˈuna/","forms":{"alternative":"уна"}},{"word":"vine","pos":"noun","definitions":["plural of vână"],"pronunciation":"/ˈvi.ne/"},{"word":"vine","pos":"verb","definitions":["third-person singular present indicative of veni"],"pronunciation":"/ˈvi.ne/"},{"word":"făcea","pos":"verb","definitions":["third-person singular imperfect indicative of face"],"pronunciation":"[fəˈt͡ʃe̯a]"},{"word":"ziua","pos":"adv","definitions":["during the daytime"],"pronunciation":"/ˈziwa/"},{"word":"ziua","pos":"noun","definitions":["definite nominative/accusative singular of zi"],"pronunciation":"/ˈziwa/"},{"word":"lume","pos":"noun","definitions":["world","people","humanity, mankind","light"],"pronunciation":"/ˈlu.me/","forms":{"plural":"lumi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lume","accusative-definite-nominative-singular":"lumea","accusative-indefinite-nominative-plural":"lumi","accusative-definite-nominative-plural":"lumile","dative-genitive-indefinite-singular":"lumi","dative-definite-genitive-singular":"lumii","dative-genitive-indefinite-plural":"lumi","dative-definite-genitive-plural":"lumilor","singular-vocative":"lume","plural-vocative":"lumilor"}},{"word":"biet","pos":"adj","definitions":["poor, unhappy, sad"],"pronunciation":"/bjet/","examples":[{"ro":"Bietul băiat!","en":"Poor boy!"}],"forms":{"feminine-singular":"biată","masculine-plural":"bieți","feminine-neuter-plural":"biete","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biet","error-unrecognized-form-feminine-indefinite-singular":"biată","error-unrecognized-form-indefinite-masculine-plural":"bieți","error-unrecognized-form-feminine-indefinite-neuter-plural":"biete","definite-error-unrecognized-form-masculine-neuter-singular":"bietul","definite-error-unrecognized-form-feminine-singular":"biata","definite-error-unrecognized-form-masculine-plural":"bieții","definite-error-unrecognized-form-feminine-neuter-plural":"bietele"}},{"word":"fecior","pos":"noun","definitions":["youth, boy, child, unmarried young man"],"forms":{"plural":"feciori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fecior","accusative-definite-nominative-singular":"feciorul","accusative-indefinite-nominative-plural":"feciori","accusative-definite-nominative-plural":"feciorii","dative-genitive-indefinite-singular":"fecior","dative-definite-genitive-singular":"feciorului","dative-genitive-indefinite-plural":"feciori","dative-definite-genitive-plural":"feciorilor","singular-vocative":"feciorule","plural-vocative":"feciorilor","alternative":"ficior"}},{"word":"nimeni","pos":"pron","definitions":["no one, nobody"],"pronunciation":"[ˈnimenʲ]","examples":[{"ro":"Aici nu este nimeni.","en":"There isn't anyone here."}],"forms":{"dative-genitive":"nimănui","alternative":"nimenea"}},{"word":"ele","pos":"pron","definitions":["they (for a group composed completely of females)"],"pronunciation":"/ˈje.le/","gender":"f-p","forms":{"masculine":"equivalent ei","table-tags":"no-table-tags","inflection-template":"l-self","nominative":"ele","accusative-stressed":"ele","accusative-error-unrecognized-form":"le","dative-stressed":"lor","dative-error-unrecognized-form":"le","genitive":"lor","masculine-possessive-singular":"lor","masculine-plural-possessive":"lor","neuter-possessive-singular":"lor","neuter-plural-possessive":"lor","feminine-possessive-singular":"lor","feminine-plural-possessive":"lor","accusative-possessive-stressed":"sine","accusative-error-unrecognized-form-possessive":"se","dative-possessive-stressed":"sieși","dative-error-unrecognized-form-possessive":"își"}},{"word":"ele","pos":"pron","definitions":["them (all-female group)"],"pronunciation":"/ˈje.le/","gender":"f"},{"word":"tocmai","pos":"adv","definitions":["just, precisely, exactly","only, just"],"forms":{"alternative":"tuhma"}},{"word":"tată","pos":"noun","definitions":["father"],"pronunciation":"[ˈta.tə]","examples":[{"ro":"Acesta e tatăl meu.","en":"This is my father."},{"ro":"Contrar credinței populare, copiii au nevoie de tați.","en":"Contrary to popular belief, children need fathers."}],"forms":{"plural":"tați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"tată","accusative-definite-nominative-singular":"tatăl","accusative-indefinite-nominative-plural":"tați","accusative-definite-nominative-plural":"tații","dative-genitive-indefinite-singular":"tată","dative-definite-genitive-singular":"tatălui","dative-genitive-indefinite-plural":"tați","dative-definite-genitive-plural":"taților","singular-vocative":"tată","plural-vocative":"taților"}},{"word":"Rău","pos":"name","definitions":["a river in Bacău County, Romania, tributary to the Bârsănești","a river in Vrancea County, Romania, tributary to the Vulturu"],"gender":"m"},{"word":"rău","pos":"adj","definitions":["bad","wrong","sick"],"pronunciation":"/rəw/","examples":[{"ro":"Nu am mai văzut niciodată un om atât de rău.","en":"I have never seen such a bad man."},{"ro":"(Lui) îi este rău.","en":"He feels sick."}],"forms":{"feminine-singular":"rea","masculine-plural":"răi","feminine-neuter-plural":"rele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"rău","error-unrecognized-form-feminine-indefinite-singular":"rea","error-unrecognized-form-indefinite-masculine-plural":"răi","error-unrecognized-form-feminine-indefinite-neuter-plural":"rele","definite-error-unrecognized-form-masculine-neuter-singular":"răul","definite-error-unrecognized-form-feminine-singular":"reaua","definite-error-unrecognized-form-masculine-plural":"răii","definite-error-unrecognized-form-feminine-neuter-plural":"relele"}},{"word":"rău","pos":"adv","definitions":["badly, poorly"],"pronunciation":"/rəw/"},{"word":"rău","pos":"noun","definitions":["evil"],"pronunciation":"/rəw/","forms":{"plural":"rele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"rău","accusative-definite-nominative-singular":"răuul","accusative-indefinite-nominative-plural":"rele","accusative-definite-nominative-plural":"relele","dative-genitive-indefinite-singular":"rău","dative-definite-genitive-singular":"răuului","dative-genitive-indefinite-plural":"rele","dative-definite-genitive-plural":"relelor","singular-vocative":"răuule","plural-vocative":"relelor"}},{"word":"bani","pos":"noun","definitions":["plural of ban (money)"],"pronunciation":"/banʲ/","gender":"m-p"},{"word":"n-am","pos":"contraction","definitions":["contraction of nu + am"],"pronunciation":"/nam/"},{"word":"Voinic","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Voinic"}},{"word":"voinic","pos":"adj","definitions":["hale, healthy, sturdy, robust, vigorous, stout"],"pronunciation":"/vojˈnik/","forms":{"feminine-singular":"voinică","masculine-plural":"voinici","feminine-neuter-plural":"voinice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"voinic","error-unrecognized-form-feminine-indefinite-singular":"voinică","error-unrecognized-form-indefinite-masculine-plural":"voinici","error-unrecognized-form-feminine-indefinite-neuter-plural":"voinice","definite-error-unrecognized-form-masculine-neuter-singular":"voinicul","definite-error-unrecognized-form-feminine-singular":"voinica","definite-error-unrecognized-form-masculine-plural":"voinicii","definite-error-unrecognized-form-feminine-neuter-plural":"voinicele"}},{"word":"fel","pos":"noun","definitions":["sort, type, kind","manner, style, way","course of a meal"],"pronunciation":"/ˈfel/","examples":[{"ro":"În ce fel?","en":"In what way?"},{"ro":"În felul acesta.","en":"In this way."},{"ro":"Nu e în felul lui să fie neprietenos.","en":"It’s unlike him to be unkind."}],"forms":{"plural":"feluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fel","accusative-definite-nominative-singular":"felul","accusative-indefinite-nominative-plural":"feluri","accusative-definite-nominative-plural":"felurile","dative-genitive-indefinite-singular":"fel","dative-definite-genitive-singular":"felului","dative-genitive-indefinite-plural":"feluri","dative-definite-genitive-plural":"felurilor","singular-vocative":"felule","plural-vocative":"felurilor"}},{"word":"tara","pos":"noun","definitions":["alternative form of tară"],"forms":{"plural":"tarale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-a","accusative-indefinite-nominative-singular":"tara","accusative-definite-nominative-singular":"taraua","accusative-indefinite-nominative-plural":"tarale","accusative-definite-nominative-plural":"taralele","dative-genitive-indefinite-singular":"tarale","dative-definite-genitive-singular":"taralei","dative-genitive-indefinite-plural":"tarale","dative-definite-genitive-plural":"taralelor","singular-vocative":"tara","plural-vocative":"taralelor"}},{"word":"timp","pos":"noun","definitions":["time","weather"],"pronunciation":"/ˈtimp/","forms":{"plural":"timpuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"timp","accusative-definite-nominative-singular":"timpul","accusative-indefinite-nominative-plural":"timpuri","accusative-definite-nominative-plural":"timpurile","dative-genitive-indefinite-singular":"timp","dative-definite-genitive-singular":"timpului","dative-genitive-indefinite-plural":"timpuri","dative-definite-genitive-plural":"timpurilor","singular-vocative":"timpule","plural-vocative":"timpurilor","alternative":"тимп"}},{"word":"Baba","pos":"name","definitions":["a village in Horea, Alba County, Romania","a village in Coroieni, Maramureș County, Romania"],"gender":"f"},{"word":"baba","pos":"noun","definitions":["definite singular of babă"],"pronunciation":"[ˈba.ba]"},{"word":"venit","pos":"verb","definitions":["past participle of veni"],"pronunciation":"/ve.ˈnit/","forms":{"participle-past":"of veni","alternative-rare-regional":"vent"}},{"word":"venit","pos":"noun","definitions":["coming, arrival","income, revenue"],"pronunciation":"/ve.ˈnit/","forms":{"plural":"venituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"venit","accusative-definite-nominative-singular":"venitul","accusative-indefinite-nominative-plural":"venituri","accusative-definite-nominative-plural":"veniturile","dative-genitive-indefinite-singular":"venit","dative-definite-genitive-singular":"venitului","dative-genitive-indefinite-plural":"venituri","dative-definite-genitive-plural":"veniturilor","singular-vocative":"venitule","plural-vocative":"veniturilor","alternative-rare-regional":"vent"}},{"word":"uita","pos":"verb","definitions":["to forget","to look (at)"],"examples":[{"ro":"Mă uit la televizor.","en":"I'm watching TV."}],"forms":{"canonical":"a uita 1st conjugation","present-singular-third-person":"uită","participle-past":"uitat","subjunctive-third-person":"uite","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a uita","gerund":"uitând","first-person-indicative-present-singular":"uit","indicative-present-second-person-singular":"uiți","indicative-present-singular-third-person":"uită","first-person-indicative-plural-present":"uităm","indicative-plural-present-second-person":"uitați","indicative-plural-present-third-person":"uită","first-person-imperfect-indicative-singular":"uitam","imperfect-indicative-second-person-singular":"uitai","imperfect-indicative-singular-third-person":"uita","first-person-imperfect-indicative-plural":"uitam","imperfect-indicative-plural-second-person":"uitați","imperfect-indicative-plural-third-person":"uitau","first-person-indicative-perfect-singular":"uitai","indicative-perfect-second-person-singular":"uitași","indicative-perfect-singular-third-person":"uită","first-person-indicative-perfect-plural":"uitarăm","indicative-perfect-plural-second-person":"uitarăți","indicative-perfect-plural-third-person":"uitară","first-person-indicative-pluperfect-singular":"uitasem","indicative-pluperfect-second-person-singular":"uitaseși","indicative-pluperfect-singular-third-person":"uitase","first-person-indicative-pluperfect-plural":"uitaserăm","indicative-pluperfect-plural-second-person":"uitaserăți","indicative-pluperfect-plural-third-person":"uitaseră","first-person-present-singular-subjunctive":"să uit","present-second-person-singular-subjunctive":"să uiți","present-singular-subjunctive-third-person":"să uite","first-person-plural-present-subjunctive":"să uităm","plural-present-second-person-subjunctive":"să uitați","plural-present-subjunctive-third-person":"să uite","imperative-second-person-singular":"uită","imperative-plural-second-person":"uitați","imperative-negative-second-person-singular":"nu uita","imperative-negative-plural-second-person":"nu uitați"}},{"word":"Nevoie","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nevoie"}},{"word":"nevoie","pos":"noun","definitions":["need, necessity","want, demand"],"pronunciation":"/neˈvo.je/","examples":[{"ro":"Am nevoie de ajutor.","en":"I need help."}],"forms":{"plural":"nevoi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"nevoie","accusative-definite-nominative-singular":"nevoia","accusative-indefinite-nominative-plural":"nevoi","accusative-definite-nominative-plural":"nevoile","dative-genitive-indefinite-singular":"nevoi","dative-definite-genitive-singular":"nevoii","dative-genitive-indefinite-plural":"nevoi","dative-definite-genitive-plural":"nevoilor","singular-vocative":"nevoie","plural-vocative":"nevoilor"}},{"word":"bate","pos":"verb","definitions":["to beat (repeatedly hit for various purposes)","to beat (give a beating)","to have a fight","to defeat","to beat"],"pronunciation":"/ˈba.te/","examples":[{"ro":"a bate la ușă","en":"to knock on the door"},{"ro":"a bate untul","en":"to churn butter"},{"ro":"a bate la mașină","en":"to type on a typewriter"}],"forms":{"canonical":"a bate 3rd conjugation","present-singular-third-person":"bate","participle-past":"bătut","subjunctive-third-person":"bată","table-tags":"conjugation-3","inflection-template":"ro-conj-e-ut","infinitive":"a bate","gerund":"bătând","first-person-indicative-present-singular":"bat","indicative-present-second-person-singular":"bați","indicative-present-singular-third-person":"bate","first-person-indicative-plural-present":"batem","indicative-plural-present-second-person":"bateți","indicative-plural-present-third-person":"bat","first-person-imperfect-indicative-singular":"băteam","imperfect-indicative-second-person-singular":"băteai","imperfect-indicative-singular-third-person":"bătea","first-person-imperfect-indicative-plural":"băteam","imperfect-indicative-plural-second-person":"băteați","imperfect-indicative-plural-third-person":"băteau","first-person-indicative-perfect-singular":"bătui","indicative-perfect-second-person-singular":"bătuși","indicative-perfect-singular-third-person":"bătu","first-person-indicative-perfect-plural":"băturăm","indicative-perfect-plural-second-person":"băturăți","indicative-perfect-plural-third-person":"bătură","first-person-indicative-pluperfect-singular":"bătusem","indicative-pluperfect-second-person-singular":"bătuseși","indicative-pluperfect-singular-third-person":"bătuse","first-person-indicative-pluperfect-plural":"bătuserăm","indicative-pluperfect-plural-second-person":"bătuserăți","indicative-pluperfect-plural-third-person":"bătuseră","first-person-present-singular-subjunctive":"să bat","present-second-person-singular-subjunctive":"să bați","present-singular-subjunctive-third-person":"să bată","first-person-plural-present-subjunctive":"să batem","plural-present-second-person-subjunctive":"să bateți","plural-present-subjunctive-third-person":"să bată","imperative-second-person-singular":"bate","imperative-plural-second-person":"bateți","imperative-negative-second-person-singular":"nu bate","imperative-negative-plural-second-person":"nu bateți","alternative":"бате"}},{"word":"Vreme","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Vreme"}},{"word":"vreme","pos":"noun","definitions":["weather","time"],"forms":{"plural":"vremuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-uri","accusative-indefinite-nominative-singular":"vreme","accusative-definite-nominative-singular":"vremea","accusative-indefinite-nominative-plural":"vremuri","accusative-definite-nominative-plural":"vremurile","dative-genitive-indefinite-singular":"vremi","dative-definite-genitive-singular":"vremii","dative-genitive-indefinite-plural":"vremuri","dative-definite-genitive-plural":"vremurilor","singular-vocative":"vreme","plural-vocative":"vremurilor"}},{"word":"gură","pos":"noun","definitions":["mouth","mouthful"],"pronunciation":"/ˈɡu.rə/","forms":{"plural":"guri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gură","accusative-definite-nominative-singular":"gura","accusative-indefinite-nominative-plural":"guri","accusative-definite-nominative-plural":"gurile","dative-genitive-indefinite-singular":"guri","dative-definite-genitive-singular":"gurii","dative-genitive-indefinite-plural":"guri","dative-definite-genitive-plural":"gurilor","singular-vocative":"gură","plural-vocative":"gurilor"}},{"word":"trăi","pos":"verb","definitions":["to live, to exist","to reside, to dwell"],"pronunciation":"[trəˈi]","forms":{"canonical":"a trăi 4th conjugation","present-singular-third-person":"trăiește","participle-past":"trăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a trăi","gerund":"trăind","first-person-indicative-present-singular":"trăiesc","indicative-present-second-person-singular":"trăiești","indicative-present-singular-third-person":"trăiește","first-person-indicative-plural-present":"trăim","indicative-plural-present-second-person":"trăiți","indicative-plural-present-third-person":"trăiesc","first-person-imperfect-indicative-singular":"trăiam","imperfect-indicative-second-person-singular":"trăiai","imperfect-indicative-singular-third-person":"trăia","first-person-imperfect-indicative-plural":"trăiam","imperfect-indicative-plural-second-person":"trăiați","imperfect-indicative-plural-third-person":"trăiau","first-person-indicative-perfect-singular":"trăii","indicative-perfect-second-person-singular":"trăiși","indicative-perfect-singular-third-person":"trăi","first-person-indicative-perfect-plural":"trăirăm","indicative-perfect-plural-second-person":"trăirăți","indicative-perfect-plural-third-person":"trăiră","first-person-indicative-pluperfect-singular":"trăisem","indicative-pluperfect-second-person-singular":"trăiseși","indicative-pluperfect-singular-third-person":"trăise","first-person-indicative-pluperfect-plural":"trăiserăm","indicative-pluperfect-plural-second-person":"trăiserăți","indicative-pluperfect-plural-third-person":"trăiseră","first-person-present-singular-subjunctive":"să trăiesc","present-second-person-singular-subjunctive":"să trăiești","present-singular-subjunctive-third-person":"să trăiască","first-person-plural-present-subjunctive":"să trăim","plural-present-second-person-subjunctive":"să trăiți","plural-present-subjunctive-third-person":"să trăiască","imperative-second-person-singular":"trăiește","imperative-plural-second-person":"trăiți","imperative-negative-second-person-singular":"nu trăi","imperative-negative-plural-second-person":"nu trăiți"}},{"word":"găsi","pos":"verb","definitions":["to find (locate)","to be situated","to find (consider)"],"pronunciation":"/ɡəˈsi/","examples":[{"ro":"Nu-mi găsesc cheile.","en":"I can't find my keys."}],"forms":{"canonical":"a găsi 4th conjugation","present-singular-third-person":"găsește","participle-past":"găsit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a găsi","gerund":"găsind","first-person-indicative-present-singular":"găsesc","indicative-present-second-person-singular":"găsești","indicative-present-singular-third-person":"găsește","first-person-indicative-plural-present":"găsim","indicative-plural-present-second-person":"găsiți","indicative-plural-present-third-person":"găsesc","first-person-imperfect-indicative-singular":"găseam","imperfect-indicative-second-person-singular":"găseai","imperfect-indicative-singular-third-person":"găsea","first-person-imperfect-indicative-plural":"găseam","imperfect-indicative-plural-second-person":"găseați","imperfect-indicative-plural-third-person":"găseau","first-person-indicative-perfect-singular":"găsii","indicative-perfect-second-person-singular":"găsiși","indicative-perfect-singular-third-person":"găsi","first-person-indicative-perfect-plural":"găsirăm","indicative-perfect-plural-second-person":"găsirăți","indicative-perfect-plural-third-person":"găsiră","first-person-indicative-pluperfect-singular":"găsisem","indicative-pluperfect-second-person-singular":"găsiseși","indicative-pluperfect-singular-third-person":"găsise","first-person-indicative-pluperfect-plural":"găsiserăm","indicative-pluperfect-plural-second-person":"găsiserăți","indicative-pluperfect-plural-third-person":"găsiseră","first-person-present-singular-subjunctive":"să găsesc","present-second-person-singular-subjunctive":"să găsești","present-singular-subjunctive-third-person":"să găsească","first-person-plural-present-subjunctive":"să găsim","plural-present-second-person-subjunctive":"să găsiți","plural-present-subjunctive-third-person":"să găsească","imperative-second-person-singular":"găsește","imperative-plural-second-person":"găsiți","imperative-negative-second-person-singular":"nu găsi","imperative-negative-plural-second-person":"nu găsiți","alternative":"гэси"}},{"word":"Frate","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Frate"}},{"word":"frate","pos":"noun","definitions":["brother","dude"],"pronunciation":"[ˈfra.te]","examples":[{"ro":"Frate, e bună!","en":"Dude, she's hot!"}],"forms":{"plural":"frați","table-tags":"no-table-tags","inflection-template":"ro-noun-m-e","accusative-indefinite-nominative-singular":"frate","accusative-definite-nominative-singular":"fratele","accusative-indefinite-nominative-plural":"frați","accusative-definite-nominative-plural":"frații","dative-genitive-indefinite-singular":"frate","dative-definite-genitive-singular":"fratelui","dative-genitive-indefinite-plural":"frați","dative-definite-genitive-plural":"fraților","singular-vocative":"frate","plural-vocative":"fraților"}},{"word":"gura","pos":"noun","definitions":["definite nominative/accusative singular of gură"],"pronunciation":"/ˈɡu.ra/"},{"word":"gura","pos":"intj","definitions":["zip it!"],"pronunciation":"/ˈɡu.ra/"},{"word":"fetele","pos":"noun","definitions":["definite nominative/accusative plural of fată"],"pronunciation":"[ˈfetele]","gender":"f-p"},{"word":"l-a","pos":"contraction","definitions":["contraction of îl and a"],"pronunciation":"[ la ]","examples":[{"ro":"l-a făcut ea să se plece, când ei i-a spus că nu vrea să mai stă.","en":"She made him leave when he told her he didn't want to stay."}]},{"word":"grăi","pos":"verb","definitions":["to talk, speak","to say"],"forms":{"canonical":"a grăi 4th conjugation","present-singular-third-person":"grăiește","participle-past":"grăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a grăi","gerund":"grăind","first-person-indicative-present-singular":"grăiesc","indicative-present-second-person-singular":"grăiești","indicative-present-singular-third-person":"grăiește","first-person-indicative-plural-present":"grăim","indicative-plural-present-second-person":"grăiți","indicative-plural-present-third-person":"grăiesc","first-person-imperfect-indicative-singular":"grăiam","imperfect-indicative-second-person-singular":"grăiai","imperfect-indicative-singular-third-person":"grăia","first-person-imperfect-indicative-plural":"grăiam","imperfect-indicative-plural-second-person":"grăiați","imperfect-indicative-plural-third-person":"grăiau","first-person-indicative-perfect-singular":"grăii","indicative-perfect-second-person-singular":"grăiși","indicative-perfect-singular-third-person":"grăi","first-person-indicative-perfect-plural":"grăirăm","indicative-perfect-plural-second-person":"grăirăți","indicative-perfect-plural-third-person":"grăiră","first-person-indicative-pluperfect-singular":"grăisem","indicative-pluperfect-second-person-singular":"grăiseși","indicative-pluperfect-singular-third-person":"grăise","first-person-indicative-pluperfect-plural":"grăiserăm","indicative-pluperfect-plural-second-person":"grăiserăți","indicative-pluperfect-plural-third-person":"grăiseră","first-person-present-singular-subjunctive":"să grăiesc","present-second-person-singular-subjunctive":"să grăiești","present-singular-subjunctive-third-person":"să grăiască","first-person-plural-present-subjunctive":"să grăim","plural-present-second-person-subjunctive":"să grăiți","plural-present-subjunctive-third-person":"să grăiască","imperative-second-person-singular":"grăiește","imperative-plural-second-person":"grăiți","imperative-negative-second-person-singular":"nu grăi","imperative-negative-plural-second-person":"nu grăiți"}},{"word":"boi","pos":"noun","definitions":["stature, appearance, mien, habitus"],"pronunciation":"/boj/","forms":{"plural":"boiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"boi","accusative-definite-nominative-singular":"boiul","accusative-indefinite-nominative-plural":"boiuri","accusative-definite-nominative-plural":"boiurile","dative-genitive-indefinite-singular":"boi","dative-definite-genitive-singular":"boiului","dative-genitive-indefinite-plural":"boiuri","dative-definite-genitive-plural":"boiurilor","singular-vocative":"boiule","plural-vocative":"boiurilor","alternative":"бой"}},{"word":"boi","pos":"verb","definitions":["to paint","to put on make-up","to fool"],"pronunciation":"/boj/","forms":{"canonical":"a boi 4th conjugation","present-singular-third-person":"boiește","participle-past":"boit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a boi","gerund":"boind","first-person-indicative-present-singular":"boiesc","indicative-present-second-person-singular":"boiești","indicative-present-singular-third-person":"boiește","first-person-indicative-plural-present":"boim","indicative-plural-present-second-person":"boiți","indicative-plural-present-third-person":"boiesc","first-person-imperfect-indicative-singular":"boiam","imperfect-indicative-second-person-singular":"boiai","imperfect-indicative-singular-third-person":"boia","first-person-imperfect-indicative-plural":"boiam","imperfect-indicative-plural-second-person":"boiați","imperfect-indicative-plural-third-person":"boiau","first-person-indicative-perfect-singular":"boii","indicative-perfect-second-person-singular":"boiși","indicative-perfect-singular-third-person":"boi","first-person-indicative-perfect-plural":"boirăm","indicative-perfect-plural-second-person":"boirăți","indicative-perfect-plural-third-person":"boiră","first-person-indicative-pluperfect-singular":"boisem","indicative-pluperfect-second-person-singular":"boiseși","indicative-pluperfect-singular-third-person":"boise","first-person-indicative-pluperfect-plural":"boiserăm","indicative-pluperfect-plural-second-person":"boiserăți","indicative-pluperfect-plural-third-person":"boiseră","first-person-present-singular-subjunctive":"să boiesc","present-second-person-singular-subjunctive":"să boiești","present-singular-subjunctive-third-person":"să boiască","first-person-plural-present-subjunctive":"să boim","plural-present-second-person-subjunctive":"să boiți","plural-present-subjunctive-third-person":"să boiască","imperative-second-person-singular":"boiește","imperative-plural-second-person":"boiți","imperative-negative-second-person-singular":"nu boi","imperative-negative-plural-second-person":"nu boiți","alternative":"бой"}},{"word":"boi","pos":"noun","definitions":["plural of bou"],"pronunciation":"/boj/","gender":"m","forms":{"alternative":"бой"}},{"word":"rog","pos":"verb","definitions":["first-person singular present indicative/subjunctive of ruga"],"pronunciation":"[roɡ]"},{"word":"ridica","pos":"verb","definitions":["to lift, elevate, raise, hoist, suspend","to increase","to uplift","to get up, stand up, arise","to tower"],"pronunciation":"/ri.diˈka/","examples":[{"ro":"Portdrapelele se ridicau golașe deasupra fileurilor de tenis.","en":"The bare flagpoles towered over the tennis nets."},{"ro":"Veniturile sale se estimează că s-au ridicat la 73,5 milioane dolari în 1986.","en":"His income is estimated to have added up to 73.5 million dollars in 1986."}],"forms":{"canonical":"a ridica 1st conjugation","present-singular-third-person":"ridică","participle-past":"ridicat","subjunctive-third-person":"ridice","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a ridica","gerund":"ridicând","first-person-indicative-present-singular":"ridic","indicative-present-second-person-singular":"ridici","indicative-present-singular-third-person":"ridică","first-person-indicative-plural-present":"ridicăm","indicative-plural-present-second-person":"ridicați","indicative-plural-present-third-person":"ridică","first-person-imperfect-indicative-singular":"ridicam","imperfect-indicative-second-person-singular":"ridicai","imperfect-indicative-singular-third-person":"ridica","first-person-imperfect-indicative-plural":"ridicam","imperfect-indicative-plural-second-person":"ridicați","imperfect-indicative-plural-third-person":"ridicau","first-person-indicative-perfect-singular":"ridicai","indicative-perfect-second-person-singular":"ridicași","indicative-perfect-singular-third-person":"ridică","first-person-indicative-perfect-plural":"ridicarăm","indicative-perfect-plural-second-person":"ridicarăți","indicative-perfect-plural-third-person":"ridicară","first-person-indicative-pluperfect-singular":"ridicasem","indicative-pluperfect-second-person-singular":"ridicaseși","indicative-pluperfect-singular-third-person":"ridicase","first-person-indicative-pluperfect-plural":"ridicaserăm","indicative-pluperfect-plural-second-person":"ridicaserăți","indicative-pluperfect-plural-third-person":"ridicaseră","first-person-present-singular-subjunctive":"să ridic","present-second-person-singular-subjunctive":"să ridici","present-singular-subjunctive-third-person":"să ridice","first-person-plural-present-subjunctive":"să ridicăm","plural-present-second-person-subjunctive":"să ridicați","plural-present-subjunctive-third-person":"să ridice","imperative-second-person-singular":"ridică","imperative-plural-second-person":"ridicați","imperative-negative-second-person-singular":"nu ridica","imperative-negative-plural-second-person":"nu ridicați","alternative-archaic-dialectal":"rădica","alternative-obsolete":"râdica"}},{"word":"fac","pos":"verb","definitions":["first-person singular present indicative/subjunctive of face","third-person plural present indicative of face"],"pronunciation":"/ˈfak/","examples":[{"ro":"Doresc să fac ceva.","en":"I want to do something."}]},{"word":"vede","pos":"noun","definitions":["Vedas (Hindu religious texts)"],"pronunciation":"[ˈvede]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"vede","accusative-definite-nominative":"vedele","dative-genitive-indefinite":"vede","dative-definite-genitive":"vedelor","vocative":"vedelor"}},{"word":"vede","pos":"verb","definitions":["third-person singular present indicative of vedea"],"pronunciation":"[ˈvede]","examples":[{"ro":"Cred că mă vede.","en":"I think he/she sees me."}]},{"word":"ochi","pos":"noun","definitions":["eye","loop","ring in a hob"],"pronunciation":"/okʲ/","examples":[{"ro":"Mă ustură ochii.","en":"My eyes burn/itch."}],"forms":{"plural":"ochi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ochi","accusative-definite-nominative-singular":"ochiul","accusative-indefinite-nominative-plural":"ochi","accusative-definite-nominative-plural":"ochii","dative-genitive-indefinite-singular":"ochi","dative-definite-genitive-singular":"ochiului","dative-genitive-indefinite-plural":"ochi","dative-definite-genitive-plural":"ochilor","singular-vocative":"ochiule","plural-vocative":"ochilor"}},{"word":"ochi","pos":"verb","definitions":["to aim, take aim","to set eyes on, set sights on","to look intently at, stare at","to scan, look about for","to perceive, notice, detect"],"pronunciation":"/oˈki/","forms":{"canonical":"a ochi 4th conjugation","present-singular-third-person":"ochește","participle-past":"ochit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ochi","gerund":"ochind","first-person-indicative-present-singular":"ochesc","indicative-present-second-person-singular":"ochești","indicative-present-singular-third-person":"ochește","first-person-indicative-plural-present":"ochim","indicative-plural-present-second-person":"ochiți","indicative-plural-present-third-person":"ochesc","first-person-imperfect-indicative-singular":"ocheam","imperfect-indicative-second-person-singular":"ocheai","imperfect-indicative-singular-third-person":"ochea","first-person-imperfect-indicative-plural":"ocheam","imperfect-indicative-plural-second-person":"ocheați","imperfect-indicative-plural-third-person":"ocheau","first-person-indicative-perfect-singular":"ochii","indicative-perfect-second-person-singular":"ochiși","indicative-perfect-singular-third-person":"ochi","first-person-indicative-perfect-plural":"ochirăm","indicative-perfect-plural-second-person":"ochirăți","indicative-perfect-plural-third-person":"ochiră","first-person-indicative-pluperfect-singular":"ochisem","indicative-pluperfect-second-person-singular":"ochiseși","indicative-pluperfect-singular-third-person":"ochise","first-person-indicative-pluperfect-plural":"ochiserăm","indicative-pluperfect-plural-second-person":"ochiserăți","indicative-pluperfect-plural-third-person":"ochiseră","first-person-present-singular-subjunctive":"să ochesc","present-second-person-singular-subjunctive":"să ochești","present-singular-subjunctive-third-person":"să ochească","first-person-plural-present-subjunctive":"să ochim","plural-present-second-person-subjunctive":"să ochiți","plural-present-subjunctive-third-person":"să ochească","imperative-second-person-singular":"ochește","imperative-plural-second-person":"ochiți","imperative-negative-second-person-singular":"nu ochi","imperative-negative-plural-second-person":"nu ochiți"}},{"word":"râde","pos":"verb","definitions":["to laugh"],"pronunciation":"/ˈrɨ.de/","forms":{"canonical":"a râde 3rd conjugation","present-singular-third-person":"râde","participle-past":"râs","subjunctive-third-person":"râdă","table-tags":"conjugation-3","inflection-template":"ro-conj-e","infinitive":"a râde","gerund":"râzând","first-person-indicative-present-singular":"râd","indicative-present-second-person-singular":"râzi","indicative-present-singular-third-person":"râde","first-person-indicative-plural-present":"râdem","indicative-plural-present-second-person":"râdeți","indicative-plural-present-third-person":"râd","first-person-imperfect-indicative-singular":"râdeam","imperfect-indicative-second-person-singular":"râdeai","imperfect-indicative-singular-third-person":"râdea","first-person-imperfect-indicative-plural":"râdeam","imperfect-indicative-plural-second-person":"râdeați","imperfect-indicative-plural-third-person":"râdeau","first-person-indicative-perfect-singular":"râsei","indicative-perfect-second-person-singular":"râseși","indicative-perfect-singular-third-person":"râse","first-person-indicative-perfect-plural":"râserăm","indicative-perfect-plural-second-person":"râserăți","indicative-perfect-plural-third-person":"râseră","first-person-indicative-pluperfect-singular":"râsesem","indicative-pluperfect-second-person-singular":"râseseși","indicative-pluperfect-singular-third-person":"râsese","first-person-indicative-pluperfect-plural":"râseserăm","indicative-pluperfect-plural-second-person":"râseserăți","indicative-pluperfect-plural-third-person":"râseseră","first-person-present-singular-subjunctive":"să râd","present-second-person-singular-subjunctive":"să râzi","present-singular-subjunctive-third-person":"să râdă","first-person-plural-present-subjunctive":"să râdem","plural-present-second-person-subjunctive":"să râdeți","plural-present-subjunctive-third-person":"să râdă","imperative-second-person-singular":"râde","imperative-plural-second-person":"râdeți","imperative-negative-second-person-singular":"nu râde","imperative-negative-plural-second-person":"nu râdeți","alternative":"rîde"}},{"word":"te-au","pos":"contraction","definitions":["contraction of te + au"],"pronunciation":"/te̯aw/"},{"word":"fu","pos":"verb","definitions":["third-person singular simple perfect indicative of fi"],"pronunciation":"[fu]"},{"word":"vânt","pos":"noun","definitions":["wind (movement of air)"],"forms":{"plural":"vânturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"vânt","accusative-definite-nominative-singular":"vântul","accusative-indefinite-nominative-plural":"vânturi","accusative-definite-nominative-plural":"vânturile","dative-genitive-indefinite-singular":"vânt","dative-definite-genitive-singular":"vântului","dative-genitive-indefinite-plural":"vânturi","dative-definite-genitive-plural":"vânturilor","singular-vocative":"vântule","plural-vocative":"vânturilor","alternative-archaic":"vênt","alternative":"вынт"}},{"word":"nouă","pos":"num","definitions":["nine"],"pronunciation":"/ˈno.wə/"},{"word":"nouă","pos":"adj","definitions":["indefinite nominative/accusative feminine singular of nou"],"pronunciation":"/ˈno.wə/"},{"word":"nouă","pos":"pron","definitions":["(to) us"],"pronunciation":"/ˈno.wə/"},{"word":"Ou","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ou"}},{"word":"ou","pos":"noun","definitions":["egg","ball (testicle)"],"pronunciation":"/ow/","forms":{"plural":"ouă","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ou","accusative-definite-nominative-singular":"oul","accusative-indefinite-nominative-plural":"ouă","accusative-definite-nominative-plural":"ouăle","dative-genitive-indefinite-singular":"ou","dative-definite-genitive-singular":"oului","dative-genitive-indefinite-plural":"ouă","dative-definite-genitive-plural":"ouălor","singular-vocative":"oule","plural-vocative":"ouălor","alternative":"оу"}},{"word":"vremea","pos":"noun","definitions":["definite nominative/accusative singular of vreme"]},{"word":"Balaur","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Balaur"}},{"word":"balaur","pos":"noun","definitions":["dragon","monster"],"forms":{"plural":"balauri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"balaur","accusative-definite-nominative-singular":"balaurul","accusative-indefinite-nominative-plural":"balauri","accusative-definite-nominative-plural":"balaurii","dative-genitive-indefinite-singular":"balaur","dative-definite-genitive-singular":"balaurului","dative-genitive-indefinite-plural":"balauri","dative-definite-genitive-plural":"balaurilor","singular-vocative":"balaurule","plural-vocative":"balaurilor","alternative":"bălaur"}},{"word":"Boier","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boier"}},{"word":"boier","pos":"noun","definitions":["boyar (a form of nobility or aristocracy), landowner, magnate"],"forms":{"plural":"boieri","feminine":"equivalent boiereasă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boier","accusative-definite-nominative-singular":"boierul","accusative-indefinite-nominative-plural":"boieri","accusative-definite-nominative-plural":"boierii","dative-genitive-indefinite-singular":"boier","dative-definite-genitive-singular":"boierului","dative-genitive-indefinite-plural":"boieri","dative-definite-genitive-plural":"boierilor","singular-vocative":"boierule","plural-vocative":"boierilor"}},{"word":"Zmeu","pos":"name","definitions":["a village in Lungani, Iași County, Romania"],"gender":"m"},{"word":"zmeu","pos":"noun","definitions":["evil giant in Romanian folk stories","dragon","courageous, fearless"],"forms":{"plural":"zmei","table-tags":"no-table-tags","inflection-template":"ro-noun-m-u","accusative-indefinite-nominative-singular":"zmeu","accusative-definite-nominative-singular":"zmeul","accusative-indefinite-nominative-plural":"zmei","accusative-definite-nominative-plural":"zmeii","dative-genitive-indefinite-singular":"zmeu","dative-definite-genitive-singular":"zmeului","dative-genitive-indefinite-plural":"zmei","dative-definite-genitive-plural":"zmeilor","singular-vocative":"zmeule","plural-vocative":"zmeilor","alternative":"smeu"}},{"word":"zmeu","pos":"noun","definitions":["kite"],"forms":{"plural":"zmeie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"zmeu","accusative-definite-nominative-singular":"zmeul","accusative-indefinite-nominative-plural":"zmeie","accusative-definite-nominative-plural":"zmeiele","dative-genitive-indefinite-singular":"zmeu","dative-definite-genitive-singular":"zmeului","dative-genitive-indefinite-plural":"zmeie","dative-definite-genitive-plural":"zmeielor","singular-vocative":"zmeule","plural-vocative":"zmeielor","alternative":"smeu"}},{"word":"gândi","pos":"verb","definitions":["to think (use one’s faculty of thought)","to think (be in thought)","to think about","to think of doing something (to intend)","to think up, invent"],"pronunciation":"/ɡɨnˈdi/","examples":[{"ro":"Mă gândesc să mănânc ceva.","en":"I’m thinking of eating something."}],"forms":{"canonical":"a gândi 4th conjugation","present-singular-third-person":"gândește","participle-past":"gândit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a gândi","gerund":"gândind","first-person-indicative-present-singular":"gândesc","indicative-present-second-person-singular":"gândești","indicative-present-singular-third-person":"gândește","first-person-indicative-plural-present":"gândim","indicative-plural-present-second-person":"gândiți","indicative-plural-present-third-person":"gândesc","first-person-imperfect-indicative-singular":"gândeam","imperfect-indicative-second-person-singular":"gândeai","imperfect-indicative-singular-third-person":"gândea","first-person-imperfect-indicative-plural":"gândeam","imperfect-indicative-plural-second-person":"gândeați","imperfect-indicative-plural-third-person":"gândeau","first-person-indicative-perfect-singular":"gândii","indicative-perfect-second-person-singular":"gândiși","indicative-perfect-singular-third-person":"gândi","first-person-indicative-perfect-plural":"gândirăm","indicative-perfect-plural-second-person":"gândirăți","indicative-perfect-plural-third-person":"gândiră","first-person-indicative-pluperfect-singular":"gândisem","indicative-pluperfect-second-person-singular":"gândiseși","indicative-pluperfect-singular-third-person":"gândise","first-person-indicative-pluperfect-plural":"gândiserăm","indicative-pluperfect-plural-second-person":"gândiserăți","indicative-pluperfect-plural-third-person":"gândiseră","first-person-present-singular-subjunctive":"să gândesc","present-second-person-singular-subjunctive":"să gândești","present-singular-subjunctive-third-person":"să gândească","first-person-plural-present-subjunctive":"să gândim","plural-present-second-person-subjunctive":"să gândiți","plural-present-subjunctive-third-person":"să gândească","imperative-second-person-singular":"gândește","imperative-plural-second-person":"gândiți","imperative-negative-second-person-singular":"nu gândi","imperative-negative-plural-second-person":"nu gândiți"}},{"word":"luat","pos":"noun","definitions":["taking"],"pronunciation":"/lwat/","forms":{"plural":"luaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"luat","accusative-definite-nominative-singular":"luatul","accusative-indefinite-nominative-plural":"luaturi","accusative-definite-nominative-plural":"luaturile","dative-genitive-indefinite-singular":"luat","dative-definite-genitive-singular":"luatului","dative-genitive-indefinite-plural":"luaturi","dative-definite-genitive-plural":"luaturilor","singular-vocative":"luatule","plural-vocative":"luaturilor"}},{"word":"luat","pos":"adj","definitions":["taken"],"pronunciation":"/lwat/","forms":{"feminine-singular":"luată","masculine-plural":"luați","feminine-neuter-plural":"luate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"luat","error-unrecognized-form-feminine-indefinite-singular":"luată","error-unrecognized-form-indefinite-masculine-plural":"luați","error-unrecognized-form-feminine-indefinite-neuter-plural":"luate","definite-error-unrecognized-form-masculine-neuter-singular":"luatul","definite-error-unrecognized-form-feminine-singular":"luata","definite-error-unrecognized-form-masculine-plural":"luații","definite-error-unrecognized-form-feminine-neuter-plural":"luatele"}},{"word":"luat","pos":"verb","definitions":["past participle of lua"],"pronunciation":"/lwat/","forms":{"participle-past":"of lua"}},{"word":"faci","pos":"verb","definitions":["second-person singular present indicative/subjunctive of face"],"pronunciation":"[fat͡ʃʲ]"},{"word":"trecut","pos":"noun","definitions":["past"],"pronunciation":"/treˈkut/"},{"word":"trecut","pos":"adj","definitions":["past","faded, bygone, old, withered"],"pronunciation":"/treˈkut/","forms":{"feminine-singular":"trecută","masculine-plural":"trecuți","feminine-neuter-plural":"trecute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"trecut","error-unrecognized-form-feminine-indefinite-singular":"trecută","error-unrecognized-form-indefinite-masculine-plural":"trecuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"trecute","definite-error-unrecognized-form-masculine-neuter-singular":"trecutul","definite-error-unrecognized-form-feminine-singular":"trecuta","definite-error-unrecognized-form-masculine-plural":"trecuții","definite-error-unrecognized-form-feminine-neuter-plural":"trecutele"}},{"word":"trecut","pos":"verb","definitions":["past participle of trece"],"pronunciation":"/treˈkut/","forms":{"participle-past":"of trece"}},{"word":"vecin","pos":"adj","definitions":["neighboring"],"pronunciation":"/veˈt͡ʃin/","forms":{"feminine-singular":"vecină","masculine-plural":"vecini","feminine-neuter-plural":"vecine","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"vecin","error-unrecognized-form-feminine-indefinite-singular":"vecină","error-unrecognized-form-indefinite-masculine-plural":"vecini","error-unrecognized-form-feminine-indefinite-neuter-plural":"vecine","definite-error-unrecognized-form-masculine-neuter-singular":"vecinul","definite-error-unrecognized-form-feminine-singular":"vecina","definite-error-unrecognized-form-masculine-plural":"vecinii","definite-error-unrecognized-form-feminine-neuter-plural":"vecinele"}},{"word":"vecin","pos":"noun","definitions":["neighbour (a person living on adjacent or nearby land)","in feudal medieval Moldova, name for a serf or peasant who worked the land"],"pronunciation":"/veˈt͡ʃin/","forms":{"plural":"vecini","feminine":"equivalent vecină","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"vecin","accusative-definite-nominative-singular":"vecinul","accusative-indefinite-nominative-plural":"vecini","accusative-definite-nominative-plural":"vecinii","dative-genitive-indefinite-singular":"vecin","dative-definite-genitive-singular":"vecinului","dative-genitive-indefinite-plural":"vecini","dative-definite-genitive-plural":"vecinilor","singular-vocative":"vecinule","plural-vocative":"vecinilor"}},{"word":"vecin","pos":"adj","definitions":["bovine"],"pronunciation":"/veˈt͡ʃin/","forms":{"feminine-singular":"vecină","masculine-plural":"vecini","feminine-neuter-plural":"vecine"}},{"word":"tatăl","pos":"noun","definitions":["definite nominative/accusative singular of tată"],"pronunciation":"[ˈta.təl]","gender":"m"},{"word":"Voia","pos":"name","definitions":["a village in Crângurile, Dâmbovița County, Romania","a village in Balșa, Hunedoara County, Romania"],"gender":"f"},{"word":"voia","pos":"noun","definitions":["definite nominative/accusative singular of voie"]},{"word":"Lung","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lung"}},{"word":"lung","pos":"adj","definitions":["long"],"pronunciation":"/luŋɡ/","examples":[{"ro":"Asta e o stradă foarte lungă!","en":"This is a really long street!"}],"forms":{"feminine-singular":"lungă","plural":"lungi","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lung","error-unrecognized-form-feminine-indefinite-singular":"lungă","error-unrecognized-form-indefinite-masculine-plural":"lungi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lungi","definite-error-unrecognized-form-masculine-neuter-singular":"lungul","definite-error-unrecognized-form-feminine-singular":"lunga","definite-error-unrecognized-form-masculine-plural":"lungii","definite-error-unrecognized-form-feminine-neuter-plural":"lungile"}},{"word":"tânăr","pos":"adj","definitions":["young"],"pronunciation":"[ˈtɨnər]","forms":{"feminine-singular":"tânără","masculine-plural":"tineri","feminine-neuter-plural":"tinere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"tânăr","error-unrecognized-form-feminine-indefinite-singular":"tânără","error-unrecognized-form-indefinite-masculine-plural":"tineri","error-unrecognized-form-feminine-indefinite-neuter-plural":"tinere","definite-error-unrecognized-form-masculine-neuter-singular":"tânărul","definite-error-unrecognized-form-feminine-singular":"tânăra","definite-error-unrecognized-form-masculine-plural":"tinerii","definite-error-unrecognized-form-feminine-neuter-plural":"tinerele","alternative":"tînăr"}},{"word":"tânăr","pos":"noun","definitions":["a youth, young person"],"pronunciation":"[ˈtɨnər]","forms":{"plural":"tineri","feminine":"equivalent tânără","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"tânăr","accusative-definite-nominative-singular":"tânărul","accusative-indefinite-nominative-plural":"tineri","accusative-definite-nominative-plural":"tinerii","dative-genitive-indefinite-singular":"tânăr","dative-definite-genitive-singular":"tânărului","dative-genitive-indefinite-plural":"tineri","dative-definite-genitive-plural":"tinerilor","singular-vocative":"tânărule","plural-vocative":"tinerilor","alternative":"tînăr"}},{"word":"lăsa","pos":"verb","definitions":["to leave","to let, to allow","to drop, let go","to buckle, droop, sag, tilt, show signs of being about to fall","to not mind, not worry"],"pronunciation":"/ləˈsa/","examples":[{"ro":"Am lăsat cartea acasă.","en":"I left the book at home."},{"ro":"L-am lăsat liber.","en":"I set him free."},{"ro":"O să îți las ție casa.","en":"I’ll leave the house to you."}],"forms":{"canonical":"a lăsa 1st conjugation","present-singular-third-person":"lasă","participle-past":"lăsat","subjunctive-third-person":"lase","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a lăsa","gerund":"lăsând","first-person-indicative-present-singular":"las","indicative-present-second-person-singular":"lași","indicative-present-singular-third-person":"lasă","first-person-indicative-plural-present":"lăsăm","indicative-plural-present-second-person":"lăsați","indicative-plural-present-third-person":"lasă","first-person-imperfect-indicative-singular":"lăsam","imperfect-indicative-second-person-singular":"lăsai","imperfect-indicative-singular-third-person":"lăsa","first-person-imperfect-indicative-plural":"lăsam","imperfect-indicative-plural-second-person":"lăsați","imperfect-indicative-plural-third-person":"lăsau","first-person-indicative-perfect-singular":"lăsai","indicative-perfect-second-person-singular":"lăsași","indicative-perfect-singular-third-person":"lăsă","first-person-indicative-perfect-plural":"lăsarăm","indicative-perfect-plural-second-person":"lăsarăți","indicative-perfect-plural-third-person":"lăsară","first-person-indicative-pluperfect-singular":"lăsasem","indicative-pluperfect-second-person-singular":"lăsaseși","indicative-pluperfect-singular-third-person":"lăsase","first-person-indicative-pluperfect-plural":"lăsaserăm","indicative-pluperfect-plural-second-person":"lăsaserăți","indicative-pluperfect-plural-third-person":"lăsaseră","first-person-present-singular-subjunctive":"să las","present-second-person-singular-subjunctive":"să lași","present-singular-subjunctive-third-person":"să lase","first-person-plural-present-subjunctive":"să lăsăm","plural-present-second-person-subjunctive":"să lăsați","plural-present-subjunctive-third-person":"să lase","imperative-second-person-singular":"lasă","imperative-plural-second-person":"lăsați","imperative-negative-second-person-singular":"nu lăsa","imperative-negative-plural-second-person":"nu lăsați"}},{"word":"unui","pos":"article","definitions":["of a","to a"],"pronunciation":"/ˈu.nuj/","examples":[{"ro":"l-a dat unui bărbat","en":"he gave it to a man."}]},{"word":"rămas","pos":"noun","definitions":["the result of remaining; remainder, remnant","inheritance"],"pronunciation":"/rəˈmas/","forms":{"plural":"rămasuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"rămas","accusative-definite-nominative-singular":"rămasul","accusative-indefinite-nominative-plural":"rămasuri","accusative-definite-nominative-plural":"rămasurile","dative-genitive-indefinite-singular":"rămas","dative-definite-genitive-singular":"rămasului","dative-genitive-indefinite-plural":"rămasuri","dative-definite-genitive-plural":"rămasurilor","singular-vocative":"rămasule","plural-vocative":"rămasurilor"}},{"word":"rămas","pos":"adj","definitions":["remaining"],"pronunciation":"/rəˈmas/","forms":{"feminine-singular":"rămasă","masculine-plural":"rămași","feminine-neuter-plural":"rămase"}},{"word":"rămas","pos":"verb","definitions":["past participle of rămâne"],"pronunciation":"/rəˈmas/","forms":{"participle-past":"of rămâne"}},{"word":"unii","pos":"pron","definitions":["nominative/accusative plural masculine of unul"]},{"word":"zău","pos":"intj","definitions":["really, truly","please, I beg you","expresses that one affirms or swears something"],"pronunciation":"/zəw/","forms":{"alternative-obsolete":"d̦ău"}},{"word":"Noroc","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Noroc"}},{"word":"noroc","pos":"noun","definitions":["luck; good fortune"],"pronunciation":"[noˈrok]","forms":{"plural":"noroace","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"noroc","accusative-definite-nominative-singular":"norocul","accusative-indefinite-nominative-plural":"noroace","accusative-definite-nominative-plural":"noroacele","dative-genitive-indefinite-singular":"noroc","dative-definite-genitive-singular":"norocului","dative-genitive-indefinite-plural":"noroace","dative-definite-genitive-plural":"noroacelor","singular-vocative":"norocule","plural-vocative":"noroacelor"}},{"word":"noroc","pos":"intj","definitions":["cheers!","good luck!","bless you!"],"pronunciation":"[noˈrok]"},{"word":"băiat","pos":"noun","definitions":["boy"],"pronunciation":"[bəˈjat]","examples":[{"ro":"Băiatul mănâncă un măr.","en":"The boy is eating an apple."}],"forms":{"plural":"băieți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"băiat","accusative-definite-nominative-singular":"băiatul","accusative-indefinite-nominative-plural":"băieți","accusative-definite-nominative-plural":"băieții","dative-genitive-indefinite-singular":"băiat","dative-definite-genitive-singular":"băiatului","dative-genitive-indefinite-plural":"băieți","dative-definite-genitive-plural":"băieților","singular-vocative":"băiatule","plural-vocative":"băieților"}},{"word":"văzând","pos":"verb","definitions":["gerund of vedea"],"pronunciation":"[vəˈzɨnd]"},{"word":"ta","pos":"det","definitions":["feminine singular of tău (“your”)"],"pronunciation":"/ta/","examples":[{"ro":"Dani are cartea ta.","en":"Dani has your book."}]},{"word":"ta","pos":"pron","definitions":["yours (singular)"],"pronunciation":"/ta/","gender":"f","forms":{"possessive":"pronouns preceded by a"}},{"word":"l-am","pos":"contraction","definitions":["contraction of îl and am"],"pronunciation":"[lam]","examples":[{"ro":"L-am făcut să plece, când mi-a spus că nu vrea să mai steă.","en":"I made him leave when he told me he didn't want to stay."}]},{"word":"vor","pos":"verb","definitions":["third-person plural present indicative of vrea"],"pronunciation":"/vor/","examples":[{"ro":"ce vor să fac eu?","en":"what do they want me to do?"}]},{"word":"vor","pos":"verb","definitions":["will"],"pronunciation":"/vor/","examples":[{"ro":"bănuiesc că vor vrea să fac eu ceva pentru ei","en":"I guess they will want me to do something for them"}]},{"word":"vin","pos":"noun","definitions":["wine"],"pronunciation":"[vin]","examples":[{"ro":"Vezi că te îmbeți dacă bei prea mult din acest vin.","en":"Careful or you'll get drunk if you drink too much of this wine."}],"forms":{"plural":"vinuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"vin","accusative-definite-nominative-singular":"vinul","accusative-indefinite-nominative-plural":"vinuri","accusative-definite-nominative-plural":"vinurile","dative-genitive-indefinite-singular":"vin","dative-definite-genitive-singular":"vinului","dative-genitive-indefinite-plural":"vinuri","dative-definite-genitive-plural":"vinurilor","singular-vocative":"vinule","plural-vocative":"vinurilor"}},{"word":"vin","pos":"verb","definitions":["inflection of veni:","first-person singular present indicative/subjunctive","third-person plural present indicative"],"pronunciation":"[vin]"},{"word":"fete","pos":"noun","definitions":["plural of fată"],"pronunciation":"[ˈfe.te]","gender":"f-p"},{"word":"nu-l","pos":"contraction","definitions":["contraction of nu + îl"],"pronunciation":"/nul/"},{"word":"taie","pos":"verb","definitions":["inflection of tăia:","third-person singular/plural present indicative/subjunctive","second-person singular imperative"]},{"word":"bunic","pos":"noun","definitions":["grandfather","grandparents"],"pronunciation":"/buˈnik/","forms":{"plural":"bunici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bunic","accusative-definite-nominative-singular":"bunicul","accusative-indefinite-nominative-plural":"bunici","accusative-definite-nominative-plural":"bunicii","dative-genitive-indefinite-singular":"bunic","dative-definite-genitive-singular":"bunicului","dative-genitive-indefinite-plural":"bunici","dative-definite-genitive-plural":"bunicilor","singular-vocative":"bunicule","plural-vocative":"bunicilor"}},{"word":"foc","pos":"noun","definitions":["fire, blaze"],"pronunciation":"/fok/","forms":{"plural":"focuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"foc","accusative-definite-nominative-singular":"focul","accusative-indefinite-nominative-plural":"focuri","accusative-definite-nominative-plural":"focurile","dative-genitive-indefinite-singular":"foc","dative-definite-genitive-singular":"focului","dative-genitive-indefinite-plural":"focuri","dative-definite-genitive-plural":"focurilor","singular-vocative":"focule","plural-vocative":"focurilor"}},{"word":"Bucurie","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bucurie"}},{"word":"bucurie","pos":"noun","definitions":["happiness (emotion of being happy)"],"pronunciation":"/bu.kuˈri.e/","forms":{"plural":"bucurii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bucurie","accusative-definite-nominative-singular":"bucuria","accusative-indefinite-nominative-plural":"bucurii","accusative-definite-nominative-plural":"bucuriile","dative-genitive-indefinite-singular":"bucurii","dative-definite-genitive-singular":"bucuriei","dative-genitive-indefinite-plural":"bucurii","dative-definite-genitive-plural":"bucuriilor","singular-vocative":"bucurie","plural-vocative":"bucuriilor"}},{"word":"flori","pos":"noun","definitions":["plural of floare (“flower”)"],"pronunciation":"[ florʲ ]","gender":"f-p"},{"word":"Babă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Babă"}},{"word":"babă","pos":"noun","definitions":["old woman","grandmother","midwife","coward"],"pronunciation":"/ˈba.bə/","forms":{"plural":"babe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"babă","accusative-definite-nominative-singular":"baba","accusative-indefinite-nominative-plural":"babe","accusative-definite-nominative-plural":"babele","dative-genitive-indefinite-singular":"babe","dative-definite-genitive-singular":"babei","dative-genitive-indefinite-plural":"babe","dative-definite-genitive-plural":"babelor","singular-vocative":"babă","plural-vocative":"babelor","alternative":"бабэ"}},{"word":"feciori","pos":"verb","definitions":["to grow up"],"forms":{"canonical":"a feciori 4th conjugation","present-singular-third-person":"feciorește","participle-past":"feciorit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a feciori","gerund":"feciorind","first-person-indicative-present-singular":"fecioresc","indicative-present-second-person-singular":"feciorești","indicative-present-singular-third-person":"feciorește","first-person-indicative-plural-present":"feciorim","indicative-plural-present-second-person":"fecioriți","indicative-plural-present-third-person":"fecioresc","first-person-imperfect-indicative-singular":"fecioream","imperfect-indicative-second-person-singular":"fecioreai","imperfect-indicative-singular-third-person":"feciorea","first-person-imperfect-indicative-plural":"fecioream","imperfect-indicative-plural-second-person":"fecioreați","imperfect-indicative-plural-third-person":"fecioreau","first-person-indicative-perfect-singular":"feciorii","indicative-perfect-second-person-singular":"fecioriși","indicative-perfect-singular-third-person":"feciori","first-person-indicative-perfect-plural":"feciorirăm","indicative-perfect-plural-second-person":"feciorirăți","indicative-perfect-plural-third-person":"fecioriră","first-person-indicative-pluperfect-singular":"feciorisem","indicative-pluperfect-second-person-singular":"fecioriseși","indicative-pluperfect-singular-third-person":"feciorise","first-person-indicative-pluperfect-plural":"fecioriserăm","indicative-pluperfect-plural-second-person":"fecioriserăți","indicative-pluperfect-plural-third-person":"fecioriseră","first-person-present-singular-subjunctive":"să fecioresc","present-second-person-singular-subjunctive":"să feciorești","present-singular-subjunctive-third-person":"să feciorească","first-person-plural-present-subjunctive":"să feciorim","plural-present-second-person-subjunctive":"să fecioriți","plural-present-subjunctive-third-person":"să feciorească","imperative-second-person-singular":"feciorește","imperative-plural-second-person":"fecioriți","imperative-negative-second-person-singular":"nu feciori","imperative-negative-plural-second-person":"nu fecioriți"}},{"word":"noastră","pos":"det","definitions":["feminine singular of nostru; our"],"pronunciation":"/ˈno̯as.trə/","examples":[{"ro":"Țara noastră este țara noastră.","en":"Our country is our country."}],"forms":{"alternative-obsolete":"nóstră","alternative":"ноастрэ"}},{"word":"noastră","pos":"pron","definitions":["feminine singular of nostru"],"pronunciation":"/ˈno̯as.trə/","forms":{"alternative-obsolete":"nóstră","alternative":"ноастрэ"}},{"word":"urma","pos":"verb","definitions":["to follow (go where someone else goes, not in pursuit)","to follow (be someone’s follower or partner)","to follow (go along a physical path or a course of action)","to follow (act in accordance with instructions, examples, methods etc.)","to attend an educational institution, a course or an educational stage"],"pronunciation":"/urˈma/","examples":[{"ro":"Asistenții îl urmează pe doctor în salon.","en":"The assistants follow the doctor into the hospital room."},{"ro":"― In numele legiĭ, eștĭ arestat!… Urmează-mĕ!","en":"“In the name of the law, you are arrested!… Follow me!”"},{"ro":"Expediția a urmat traseul fluviului.","en":"The expedition followed the path of the river."}],"forms":{"canonical":"a urma 1st conjugation","present-singular-third-person":"urmează","participle-past":"urmat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a urma","gerund":"urmând","first-person-indicative-present-singular":"urmez","indicative-present-second-person-singular":"urmezi","indicative-present-singular-third-person":"urmează","first-person-indicative-plural-present":"urmăm","indicative-plural-present-second-person":"urmați","indicative-plural-present-third-person":"urmează","first-person-imperfect-indicative-singular":"urmam","imperfect-indicative-second-person-singular":"urmai","imperfect-indicative-singular-third-person":"urma","first-person-imperfect-indicative-plural":"urmam","imperfect-indicative-plural-second-person":"urmați","imperfect-indicative-plural-third-person":"urmau","first-person-indicative-perfect-singular":"urmai","indicative-perfect-second-person-singular":"urmași","indicative-perfect-singular-third-person":"urmă","first-person-indicative-perfect-plural":"urmarăm","indicative-perfect-plural-second-person":"urmarăți","indicative-perfect-plural-third-person":"urmară","first-person-indicative-pluperfect-singular":"urmasem","indicative-pluperfect-second-person-singular":"urmaseși","indicative-pluperfect-singular-third-person":"urmase","first-person-indicative-pluperfect-plural":"urmaserăm","indicative-pluperfect-plural-second-person":"urmaserăți","indicative-pluperfect-plural-third-person":"urmaseră","first-person-present-singular-subjunctive":"să urmez","present-second-person-singular-subjunctive":"să urmezi","present-singular-subjunctive-third-person":"să urmeze","first-person-plural-present-subjunctive":"să urmăm","plural-present-second-person-subjunctive":"să urmați","plural-present-subjunctive-third-person":"să urmeze","imperative-second-person-singular":"urmează","imperative-plural-second-person":"urmați","imperative-negative-second-person-singular":"nu urma","imperative-negative-plural-second-person":"nu urmați"}},{"word":"urma","pos":"noun","definitions":["definite nominative/accusative singular of urmă (“track; mark”)"],"pronunciation":"/ˈur.ma/"},{"word":"trebui","pos":"verb","definitions":["to be necessary, to need to, to have to","to need, to be in need of"],"pronunciation":"/tre.bu.ˈi/","examples":[{"ro":"Va trebui să fac ceva.","en":"I will have to do something."},{"ro":"Sunt multe lucruri care trebuie făcute.","en":"There are many things that need to be done."},{"ro":"Aceste puncte trebuie fi luate în considerare.","en":"These points have to be taken into consideration."}],"forms":{"canonical":"a trebui 4th conjugation","present-singular-third-person":"trebuie","colloquial-present-singular-third-person":"trebe","present-rare-singular-third-person":"trebuiește","participle-past":"trebuit","table-tags":"conjugation-4","inflection-template":"ro-conj-imp","infinitive":"a trebui","gerund":"trebuind","indicative-present-singular-third-person":"trebuie","imperfect-indicative-singular-third-person":"trebuia","indicative-perfect-singular-third-person":"trebui","indicative-pluperfect-singular-third-person":"trebuise","present-singular-subjunctive-third-person":"să trebuiască","first-person-indicative-present-singular":"trebuiesc","indicative-present-second-person-singular":"trebuiești","first-person-indicative-plural-present":"trebuim","indicative-plural-present-second-person":"trebuiți","indicative-plural-present-third-person":"trebuiesc","first-person-imperfect-indicative-singular":"trebuiam","imperfect-indicative-second-person-singular":"trebuiai","first-person-imperfect-indicative-plural":"trebuiam","imperfect-indicative-plural-second-person":"trebuiați","imperfect-indicative-plural-third-person":"trebuiau","first-person-indicative-perfect-singular":"trebuii","indicative-perfect-second-person-singular":"trebuiși","first-person-indicative-perfect-plural":"trebuirăm","indicative-perfect-plural-second-person":"trebuirăți","indicative-perfect-plural-third-person":"trebuiră","first-person-indicative-pluperfect-singular":"trebuisem","indicative-pluperfect-second-person-singular":"trebuiseși","first-person-indicative-pluperfect-plural":"trebuiserăm","indicative-pluperfect-plural-second-person":"trebuiserăți","indicative-pluperfect-plural-third-person":"trebuiseră","first-person-present-singular-subjunctive":"să trebuiesc","present-second-person-singular-subjunctive":"să trebuiești","first-person-plural-present-subjunctive":"să trebuim","plural-present-second-person-subjunctive":"să trebuiți","plural-present-subjunctive-third-person":"să trebuiască","imperative-second-person-singular":"trebuiește","imperative-plural-second-person":"trebuiți","imperative-negative-second-person-singular":"nu trebui","imperative-negative-plural-second-person":"nu trebuiți"}},{"word":"Floare","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Floare"}},{"word":"floare","pos":"noun","definitions":["flower"],"pronunciation":"/ˈflo̯a.re/","examples":[{"ro":"floare de cireș","en":"cherry blossom"},{"ro":"floare de măr","en":"apple blossom"},{"ro":"floare de portocal","en":"orange blossom"}],"forms":{"plural":"flori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"floare","accusative-definite-nominative-singular":"floarea","accusative-indefinite-nominative-plural":"flori","accusative-definite-nominative-plural":"florile","dative-genitive-indefinite-singular":"flori","dative-definite-genitive-singular":"florii","dative-genitive-indefinite-plural":"flori","dative-definite-genitive-plural":"florilor","singular-vocative":"floare","plural-vocative":"florilor"}},{"word":"vrei","pos":"verb","definitions":["inflection of vrea:","second-person singular present indicative/subjunctive","second-person singular imperative"],"pronunciation":"[vrej]"},{"word":"nostru","pos":"det","definitions":["our"],"pronunciation":"/ˈnos.tru/","forms":{"feminine-singular":"noastră","masculine-plural":"noștri","feminine-neuter-plural":"noastre","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nostru","error-unrecognized-form-feminine-indefinite-singular":"noastră","error-unrecognized-form-indefinite-masculine-plural":"noștri","error-unrecognized-form-feminine-indefinite-neuter-plural":"noastre","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"nostru","pos":"pron","definitions":["ours"],"pronunciation":"/ˈnos.tru/","gender":"m"},{"word":"n-avea","pos":"contraction","definitions":["contraction of nu + avea"],"pronunciation":"/naˈve̯a/"},{"word":"niciodată","pos":"adv","definitions":["never"],"pronunciation":"[ni.t͡ʃoˈda.tə]"},{"word":"zilele","pos":"noun","definitions":["definite nominative/accusative plural of zi"],"pronunciation":"[ˈzilele]","gender":"f-p"},{"word":"locul","pos":"noun","definitions":["definite nominative/accusative singular of loc"]},{"word":"locul","pos":"noun","definitions":["loculus"],"forms":{"plural":"loculi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"locul","accusative-definite-nominative-singular":"loculul","accusative-indefinite-nominative-plural":"loculi","accusative-definite-nominative-plural":"loculii","dative-genitive-indefinite-singular":"locul","dative-definite-genitive-singular":"loculului","dative-genitive-indefinite-plural":"loculi","dative-definite-genitive-plural":"loculilor","singular-vocative":"loculule","plural-vocative":"loculilor"}},{"word":"vei","pos":"verb","definitions":["will"],"pronunciation":"[vej]","examples":[{"ro":"dacă mă duc acuma vei veni cu mine?","en":"if I leave now, will you come with me?"}]},{"word":"Ureche","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ureche"}},{"word":"ureche","pos":"noun","definitions":["ear"],"pronunciation":"/uˈre.ke/","forms":{"plural":"urechi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ureche","accusative-definite-nominative-singular":"urechea","accusative-indefinite-nominative-plural":"urechi","accusative-definite-nominative-plural":"urechile","dative-genitive-indefinite-singular":"urechi","dative-definite-genitive-singular":"urechii","dative-genitive-indefinite-plural":"urechi","dative-definite-genitive-plural":"urechilor","singular-vocative":"ureche","plural-vocative":"urechilor","alternative":"urechie"}},{"word":"trage","pos":"verb","definitions":["to pull, draw, drag","to draw (exert a force on a fluid by means of negative pressure)","to shoot","to draw a line","to weigh (have a weight)"],"pronunciation":"/ˈtra.d͡ʒe/","examples":[{"ro":"a trage cu pușca","en":"to shoot a gun"},{"ro":"Toate cuvintele din propoziția aceasta se trag din limba latină.","en":"All the words in this sentence originate from the Latin language."},{"ro":"De la cine i se trage copilului părul creț?","en":"From whom did the child get his curly hair from?"}],"forms":{"canonical":"a trage 3rd conjugation","present-singular-third-person":"trage","participle-past":"tras","subjunctive-third-person":"tragă","table-tags":"conjugation-3","inflection-template":"ro-conj-e-s","infinitive":"a trage","gerund":"trăgând","first-person-indicative-present-singular":"trag","indicative-present-second-person-singular":"tragi","indicative-present-singular-third-person":"trage","first-person-indicative-plural-present":"tragem","indicative-plural-present-second-person":"trageți","indicative-plural-present-third-person":"trag","first-person-imperfect-indicative-singular":"trăgeam","imperfect-indicative-second-person-singular":"trăgeai","imperfect-indicative-singular-third-person":"trăgea","first-person-imperfect-indicative-plural":"trăgeam","imperfect-indicative-plural-second-person":"trăgeați","imperfect-indicative-plural-third-person":"trăgeau","first-person-indicative-perfect-singular":"trăsei","indicative-perfect-second-person-singular":"trăseși","indicative-perfect-singular-third-person":"trase","first-person-indicative-perfect-plural":"traserăm","indicative-perfect-plural-second-person":"traserăți","indicative-perfect-plural-third-person":"traseră","first-person-indicative-pluperfect-singular":"trăsesem","indicative-pluperfect-second-person-singular":"trăseseși","indicative-pluperfect-singular-third-person":"trăsese","first-person-indicative-pluperfect-plural":"trăseserăm","indicative-pluperfect-plural-second-person":"trăseserăți","indicative-pluperfect-plural-third-person":"trăseseră","first-person-present-singular-subjunctive":"să trag","present-second-person-singular-subjunctive":"să tragi","present-singular-subjunctive-third-person":"să tragă","first-person-plural-present-subjunctive":"să tragem","plural-present-second-person-subjunctive":"să trageți","plural-present-subjunctive-third-person":"să tragă","imperative-second-person-singular":"trage","imperative-plural-second-person":"trageți","imperative-negative-second-person-singular":"nu trage","imperative-negative-plural-second-person":"nu trageți"}},{"word":"focul","pos":"noun","definitions":["definite nominative/accusative singular of foc"]},{"word":"flăcău","pos":"noun","definitions":["lad, youth","bachelor, single or unmarried man"],"pronunciation":"/fləˈkəw/","forms":{"plural":"flăcăi","table-tags":"no-table-tags","inflection-template":"ro-noun-m-u","accusative-indefinite-nominative-singular":"flăcău","accusative-definite-nominative-singular":"flăcăul","accusative-indefinite-nominative-plural":"flăcăi","accusative-definite-nominative-plural":"flăcăii","dative-genitive-indefinite-singular":"flăcău","dative-definite-genitive-singular":"flăcăului","dative-genitive-indefinite-plural":"flăcăi","dative-definite-genitive-plural":"flăcăilor","singular-vocative":"flăcăule","plural-vocative":"flăcăilor"}},{"word":"femeie","pos":"noun","definitions":["woman","married woman, wife","family"],"pronunciation":"[fe.ˈme.je]","examples":[{"ro":"Lot, ieși cu muiarea ta și cu fămeaia ta afară din cetate.","en":"Lot, exit with your wife and your family outside the city."}],"forms":{"plural":"femei","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"femeie","accusative-definite-nominative-singular":"femeia","accusative-indefinite-nominative-plural":"femei","accusative-definite-nominative-plural":"femeile","dative-genitive-indefinite-singular":"femei","dative-definite-genitive-singular":"femeii","dative-genitive-indefinite-plural":"femei","dative-definite-genitive-plural":"femeilor","singular-vocative":"femeie","plural-vocative":"femeilor","alternative-archaic":"fămeaiă","alternative":"fomeie"}},{"word":"timpul","pos":"noun","definitions":["definite nominative/accusative singular of timp"],"pronunciation":"[ˈtim.pul]"},{"word":"greu","pos":"adj","definitions":["heavy","hard, difficult","pregnant"],"pronunciation":"/ɡrew/","examples":[{"ro":"a rămâne grea","en":"to get pregnant"}],"forms":{"feminine-singular":"grea","masculine-plural":"grei","feminine-neuter-plural":"grele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"greu","error-unrecognized-form-feminine-indefinite-singular":"grea","error-unrecognized-form-indefinite-masculine-plural":"grei","error-unrecognized-form-feminine-indefinite-neuter-plural":"grele","definite-error-unrecognized-form-masculine-neuter-singular":"greul","definite-error-unrecognized-form-feminine-singular":"greaua","definite-error-unrecognized-form-masculine-plural":"greii","definite-error-unrecognized-form-feminine-neuter-plural":"grelele"}},{"word":"greu","pos":"noun","definitions":["difficulty or hardship"],"pronunciation":"/ɡrew/","examples":[{"ro":"cu greu","en":"with difficulty"},{"ro":"Greul abia acum începe.","en":"The hard part only begins now."}],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"greu","accusative-definite-nominative":"greul","dative-genitive-indefinite":"greu","dative-definite-genitive":"greului","vocative":"greule"}},{"word":"foame","pos":"noun","definitions":["hunger"],"pronunciation":"/ˈfo̯a.me/","examples":[{"ro":"Mi-e foame.","en":"I'm hungry."},{"ro":"Te rog, dă-mi niște mâncare pentru că mor de foame.","en":"Please, give me some food because I'm dying of hunger."}],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"foame","accusative-definite-nominative":"foamea","dative-genitive-indefinite":"foame","dative-definite-genitive":"foamei","vocative":"foame","alternative":"фоаме"}},{"word":"noaptea","pos":"adv","definitions":["at night"],"pronunciation":"/ˈno̯ap.te̯a/"},{"word":"noaptea","pos":"noun","definitions":["definite nominative/accusative singular of noapte"],"pronunciation":"/ˈno̯ap.te̯a/"},{"word":"gând","pos":"noun","definitions":["thought","care"],"pronunciation":"/ɡɨnd/","forms":{"plural":"gânduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gând","accusative-definite-nominative-singular":"gândul","accusative-indefinite-nominative-plural":"gânduri","accusative-definite-nominative-plural":"gândurile","dative-genitive-indefinite-singular":"gând","dative-definite-genitive-singular":"gândului","dative-genitive-indefinite-plural":"gânduri","dative-definite-genitive-plural":"gândurilor","singular-vocative":"gândule","plural-vocative":"gândurilor"}},{"word":"fii","pos":"noun","definitions":["plural of fiu: sons"],"pronunciation":"[fiː]"},{"word":"fii","pos":"verb","definitions":["second-person singular present subjunctive of fi","second-person singular imperative of fi: be"],"pronunciation":"[fiː]","examples":[{"ro":"fii mai realist!","en":"be more realistic!"}]},{"word":"văd","pos":"verb","definitions":["inflection of vedea:","first-person singular present indicative/subjunctive","third-person plural present indicative"],"pronunciation":"[vəd]"},{"word":"fund","pos":"noun","definitions":["bottom","backside; buttocks","chopping board"],"pronunciation":"[fund]","forms":{"plural":"funduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fund","accusative-definite-nominative-singular":"fundul","accusative-indefinite-nominative-plural":"funduri","accusative-definite-nominative-plural":"fundurile","dative-genitive-indefinite-singular":"fund","dative-definite-genitive-singular":"fundului","dative-genitive-indefinite-plural":"funduri","dative-definite-genitive-plural":"fundurilor","singular-vocative":"fundule","plural-vocative":"fundurilor"}},{"word":"luptă","pos":"noun","definitions":["fight, fighting"],"forms":{"plural":"lupte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luptă","accusative-definite-nominative-singular":"lupta","accusative-indefinite-nominative-plural":"lupte","accusative-definite-nominative-plural":"luptele","dative-genitive-indefinite-singular":"lupte","dative-definite-genitive-singular":"luptei","dative-genitive-indefinite-plural":"lupte","dative-definite-genitive-plural":"luptelor","singular-vocative":"luptă","plural-vocative":"luptelor"}},{"word":"luptă","pos":"verb","definitions":["inflection of lupta:","third-person singular/plural present indicative","third-person singular simple perfect indicative","second-person singular imperative"]},{"word":"uită","pos":"verb","definitions":["third-person singular simple perfect indicative of uita"]},{"word":"n-o","pos":"contraction","definitions":["contraction of nu + o"],"pronunciation":"/no/"},{"word":"totdeauna","pos":"adv","definitions":["always, ever, all the time, at all times"],"examples":[{"ro":"Totdeauna vorbește.","en":"He is always talking."}]},{"word":"fiind","pos":"verb","definitions":["gerund of fi (“being”)"],"pronunciation":"/fiˈind/"},{"word":"Fiu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fiu"}},{"word":"fiu","pos":"noun","definitions":["son"],"pronunciation":"[fiw]","examples":[{"ro":"Eu sunt fiul ei.","en":"I’m her son."},{"ro":"Au doi fii.","en":"They have two sons."},{"ro":"Astăzi e ziua de naștere a fiului meu.","en":"Today is my son’s birthday."}],"forms":{"plural":"fii","table-tags":"no-table-tags","inflection-template":"ro-noun-m-u","accusative-indefinite-nominative-singular":"fiu","accusative-definite-nominative-singular":"fiul","accusative-indefinite-nominative-plural":"fii","accusative-definite-nominative-plural":"fiii","dative-genitive-indefinite-singular":"fiu","dative-definite-genitive-singular":"fiului","dative-genitive-indefinite-plural":"fii","dative-definite-genitive-plural":"fiilor","singular-vocative":"fiule","plural-vocative":"fiilor"}},{"word":"fiu","pos":"verb","definitions":["first-person singular present subjunctive of fi"],"pronunciation":"[fiw]","examples":[{"ro":"O să fiu mai atent.","en":"I will be more careful."}]},{"word":"Verde","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Verde"}},{"word":"verde","pos":"adj","definitions":["green (color/colour)"],"pronunciation":"/ˈver.de/","forms":{"plural":"verzi","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"verde","error-unrecognized-form-feminine-indefinite-singular":"verde","error-unrecognized-form-indefinite-masculine-plural":"verzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"verzi","definite-error-unrecognized-form-masculine-neuter-singular":"verdele","definite-error-unrecognized-form-feminine-singular":"verdea","definite-error-unrecognized-form-masculine-plural":"verzii","definite-error-unrecognized-form-feminine-neuter-plural":"verzile","alternative":"верде"}},{"word":"verde","pos":"noun","definitions":["green (color/colour)","green, marijuana"],"pronunciation":"/ˈver.de/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m-e","accusative-indefinite-nominative":"verde","accusative-definite-nominative":"verdele","dative-genitive-indefinite":"verde","dative-definite-genitive":"verdelui","vocative":"verde","alternative":"верде"}},{"word":"norocul","pos":"noun","definitions":["definite nominative/accusative singular of noroc"]},{"word":"hai","pos":"intj","definitions":["let's"],"pronunciation":"[haj]","examples":[{"ro":"hai să mergem","en":"let's go"}]},{"word":"hotărî","pos":"verb","definitions":["to decide, to settle"],"pronunciation":"/ho.təˈrɨ/","forms":{"canonical":"a hotărî 4th conjugation","present-singular-third-person":"hotărăște","participle-past":"hotărât","table-tags":"conjugation-4","inflection-template":"ro-conj-î-ăsc","infinitive":"a hotărî","gerund":"hotărând","first-person-indicative-present-singular":"hotărăsc","indicative-present-second-person-singular":"hotărăști","indicative-present-singular-third-person":"hotărăște","first-person-indicative-plural-present":"hotărâm","indicative-plural-present-second-person":"hotărâți","indicative-plural-present-third-person":"hotărăsc","first-person-imperfect-indicative-singular":"hotăram","imperfect-indicative-second-person-singular":"hotărai","imperfect-indicative-singular-third-person":"hotăra","first-person-imperfect-indicative-plural":"hotăram","imperfect-indicative-plural-second-person":"hotărați","imperfect-indicative-plural-third-person":"hotărau","first-person-indicative-perfect-singular":"hotărâi","indicative-perfect-second-person-singular":"hotărâși","indicative-perfect-singular-third-person":"hotărî","first-person-indicative-perfect-plural":"hotărârăm","indicative-perfect-plural-second-person":"hotărârăți","indicative-perfect-plural-third-person":"hotărâră","first-person-indicative-pluperfect-singular":"hotărâsem","indicative-pluperfect-second-person-singular":"hotărâseși","indicative-pluperfect-singular-third-person":"hotărâse","first-person-indicative-pluperfect-plural":"hotărâserăm","indicative-pluperfect-plural-second-person":"hotărâserăți","indicative-pluperfect-plural-third-person":"hotărâseră","first-person-present-singular-subjunctive":"să hotărăsc","present-second-person-singular-subjunctive":"să hotărăști","present-singular-subjunctive-third-person":"să hotărască","first-person-plural-present-subjunctive":"să hotărâm","plural-present-second-person-subjunctive":"să hotărâți","plural-present-subjunctive-third-person":"să hotărască","imperative-second-person-singular":"hotărăște","imperative-plural-second-person":"hotărâți","imperative-negative-second-person-singular":"nu hotărî","imperative-negative-plural-second-person":"nu hotărâți","alternative":"хотэры"}},{"word":"totul","pos":"noun","definitions":["definite nominative/accusative singular of tot"],"pronunciation":"/ˈto.tul/"},{"word":"toți","pos":"det","definitions":["nominative/accusative masculine/neuter plural of tot"],"pronunciation":"/tot͡si/"},{"word":"toți","pos":"pron","definitions":["nominative/accusative masculine/neuter plural of tot"],"pronunciation":"/tot͡si/"},{"word":"Nou","pos":"name","definitions":["a village in Roșia, Sibiu County, Romania"],"gender":"m"},{"word":"nou","pos":"adj","definitions":["new"],"pronunciation":"/now/","forms":{"feminine-singular":"nouă","plural":"noi","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nou","error-unrecognized-form-feminine-indefinite-singular":"nouă","error-unrecognized-form-indefinite-masculine-plural":"noi","error-unrecognized-form-feminine-indefinite-neuter-plural":"noi","definite-error-unrecognized-form-masculine-neuter-singular":"noul","definite-error-unrecognized-form-feminine-singular":"noua","definite-error-unrecognized-form-masculine-plural":"noii","definite-error-unrecognized-form-feminine-neuter-plural":"noile","alternative":"ноу"}},{"word":"eram","pos":"verb","definitions":["first-person singular/plural imperfect indicative of fi (“be”): I was; we were"],"pronunciation":"/jeˈram/"},{"word":"tare","pos":"adj","definitions":["hard, tough, solid","strong","loud, strong, powerful","strong, hard","fierce, vehement, intense, vigorous"],"pronunciation":"/ˈta.re/","examples":[{"ro":"Pâinea este foarte tare.","en":"The bread is very hard."},{"ro":"Dar nu vreau să fie iarna când mi-l cumpără pentru că trebuie să aștept prea mult să îl scot din casă. Are remorcă! E super tare!","en":"But I don't want it to be winter when I’m bought it because I have to wait too long to take it out of the house. It has a trailer! It's super cool!"}],"forms":{"plural":"tari","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"tare","error-unrecognized-form-feminine-indefinite-singular":"tare","error-unrecognized-form-indefinite-masculine-plural":"tari","error-unrecognized-form-feminine-indefinite-neuter-plural":"tari","definite-error-unrecognized-form-masculine-neuter-singular":"tarele","definite-error-unrecognized-form-feminine-singular":"tarea","definite-error-unrecognized-form-masculine-plural":"tarii","definite-error-unrecognized-form-feminine-neuter-plural":"tarile"}},{"word":"tare","pos":"adv","definitions":["strongly","fast","very","out loud"],"pronunciation":"/ˈta.re/"},{"word":"vie","pos":"noun","definitions":["vineyard","vine"],"pronunciation":"/ˈvi.e/","forms":{"plural":"vii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"vie","accusative-definite-nominative-singular":"via","accusative-indefinite-nominative-plural":"vii","accusative-definite-nominative-plural":"viile","dative-genitive-indefinite-singular":"vii","dative-definite-genitive-singular":"viei","dative-genitive-indefinite-plural":"vii","dative-definite-genitive-plural":"viilor","singular-vocative":"vie","plural-vocative":"viilor"}},{"word":"vie","pos":"adj","definitions":["indefinite nominative/accusative feminine singular of viu (“living”)"],"pronunciation":"/ˈvi.e/"},{"word":"vie","pos":"verb","definitions":["alternative form of via (“to live”)"],"pronunciation":"/ˈvi.e/","forms":{"canonical":"a vie 3rd conjugation","present-singular-third-person":"vie","participle-past":"vis","subjunctive-third-person":"vie","table-tags":"conjugation-3","inflection-template":"ro-conj-e-s\n","infinitive":"a vie","gerund":"viind","first-person-indicative-present-singular":"viu","indicative-present-second-person-singular":"vii","indicative-present-singular-third-person":"vie","first-person-indicative-plural-present":"viem","indicative-plural-present-second-person":"vieți","indicative-plural-present-third-person":"viu","first-person-imperfect-indicative-singular":"viam","imperfect-indicative-second-person-singular":"viai","imperfect-indicative-singular-third-person":"viea","first-person-imperfect-indicative-plural":"viam","imperfect-indicative-plural-second-person":"viați","imperfect-indicative-plural-third-person":"viau","first-person-indicative-perfect-singular":"vsei","indicative-perfect-second-person-singular":"vseși","indicative-perfect-singular-third-person":"visese","first-person-indicative-perfect-plural":"virăm","indicative-perfect-plural-second-person":"vserăți","indicative-perfect-plural-third-person":"vseră","first-person-indicative-pluperfect-singular":"visem","indicative-pluperfect-second-person-singular":"vseseși","indicative-pluperfect-singular-third-person":"vsese","first-person-indicative-pluperfect-plural":"vseserăm","indicative-pluperfect-plural-second-person":"vseserăți","indicative-pluperfect-plural-third-person":"vseseră","first-person-present-singular-subjunctive":"să viu","present-second-person-singular-subjunctive":"să vii","present-singular-subjunctive-third-person":"să vie","first-person-plural-present-subjunctive":"să viem","plural-present-second-person-subjunctive":"să vieți","plural-present-subjunctive-third-person":"să vie","imperative-second-person-singular":"vii","imperative-plural-second-person":"vieți","imperative-negative-second-person-singular":"nu vie","imperative-negative-plural-second-person":"nu vieți"}},{"word":"făcuse","pos":"verb","definitions":["third-person singular pluperfect indicative of face"],"pronunciation":"[fəˈkuse]"},{"word":"Grădină","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grădină"}},{"word":"grădină","pos":"noun","definitions":["garden"],"pronunciation":"[ɡɾəˈdi.nə]","forms":{"plural":"grădini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"grădină","accusative-definite-nominative-singular":"grădina","accusative-indefinite-nominative-plural":"grădini","accusative-definite-nominative-plural":"grădinile","dative-genitive-indefinite-singular":"grădini","dative-definite-genitive-singular":"grădinii","dative-genitive-indefinite-plural":"grădini","dative-definite-genitive-plural":"grădinilor","singular-vocative":"grădină","plural-vocative":"grădinilor"}},{"word":"unei","pos":"article","definitions":["of a","to a"],"pronunciation":"/ˈu.nej/"},{"word":"tale","pos":"pron","definitions":["feminine plural of tău","neuter plural of tău"],"pronunciation":"[ˈta.le]","examples":[{"ro":"Fiicele tale îmi spuneau despre casa voastră nouă.","en":"Your daughters were telling me about your new house."}]},{"word":"lemn","pos":"noun","definitions":["wood","timber"],"forms":{"plural":"lemne","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lemn","accusative-definite-nominative-singular":"lemnul","accusative-indefinite-nominative-plural":"lemne","accusative-definite-nominative-plural":"lemnele","dative-genitive-indefinite-singular":"lemn","dative-definite-genitive-singular":"lemnului","dative-genitive-indefinite-plural":"lemne","dative-definite-genitive-plural":"lemnelor","singular-vocative":"lemnule","plural-vocative":"lemnelor"}},{"word":"omului","pos":"noun","definitions":["definite dative/genitive singular of om"]},{"word":"frumoase","pos":"adj","definitions":["inflection of frumos:","feminine/neuter plural","genitive/dative feminine singular"],"pronunciation":"[fruˈmo̯ase]"},{"word":"Tău","pos":"name","definitions":["a village in Roșia de Secaș, Alba County, Romania","a village in Zau de Câmpie, Mureș County, Romania"],"gender":"m"},{"word":"tău","pos":"det","definitions":["your (singular)"],"pronunciation":"/təw/","examples":[{"ro":"Care (dintre ei) este fiul tău?","en":"Which (of them) is your son?"}],"forms":{"feminine-singular":"ta","masculine-plural":"tăi","feminine-neuter-plural":"tale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"tău","error-unrecognized-form-feminine-indefinite-singular":"ta","error-unrecognized-form-indefinite-masculine-plural":"tăi","error-unrecognized-form-feminine-indefinite-neuter-plural":"tale","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"tău","pos":"pron","definitions":["yours (singular)"],"pronunciation":"/təw/","gender":"m"},{"word":"tău","pos":"noun","definitions":["pond, mountain lake"],"pronunciation":"/təw/","forms":{"plural":"tăuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"tău","accusative-definite-nominative-singular":"tăul","accusative-indefinite-nominative-plural":"tăuri","accusative-definite-nominative-plural":"tăurile","dative-genitive-indefinite-singular":"tău","dative-definite-genitive-singular":"tăului","dative-genitive-indefinite-plural":"tăuri","dative-definite-genitive-plural":"tăurilor","singular-vocative":"tăule","plural-vocative":"tăurilor"}},{"word":"orice","pos":"det","definitions":["any"],"pronunciation":"/orʲ.ˈt͡ʃe/","examples":[{"ro":"Vorbești destul de bine românește. Orice român te-ar înțelege.","en":"You speak in Romanian quite well. Any Romanian would understand you."}]},{"word":"orice","pos":"pron","definitions":["anything"],"pronunciation":"/orʲ.ˈt͡ʃe/","examples":[{"ro":"Un băiat prost ar face orice pentru o fată frumoasă.","en":"A stupid boy would do anything for a pretty girl."},{"ro":"orice altceva","en":"anything else"}]},{"word":"băiatul","pos":"noun","definitions":["definite nominative/accusative singular of băiat"]},{"word":"lucruri","pos":"noun","definitions":["plural of lucru"],"pronunciation":"/ˈlu.krurʲ/","gender":"n-p"},{"word":"tăt","pos":"adj","definitions":["alternative form of tot (“all, entire”)"],"pronunciation":"/tət/","forms":{"feminine-singular":"tătă","masculine-plural":"tăți","feminine-neuter-plural":"tăte","alternative":"тэт"}},{"word":"tăt","pos":"adv","definitions":["alternative form of tot"],"pronunciation":"/tət/","forms":{"alternative":"тэт"}},{"word":"tăt","pos":"pron","definitions":["alternative form of tot (“everything, everyone”)"],"pronunciation":"/tət/","forms":{"feminine-singular":"tătă","masculine-plural":"tăți","feminine-neuter-plural":"tăte","alternative":"тэт"}},{"word":"Vulpe","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Vulpe"}},{"word":"vulpe","pos":"noun","definitions":["fox"],"pronunciation":"/ˈvul.pe/","forms":{"plural":"vulpi","masculine":"equivalent vulpoi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"vulpe","accusative-definite-nominative-singular":"vulpea","accusative-indefinite-nominative-plural":"vulpi","accusative-definite-nominative-plural":"vulpile","dative-genitive-indefinite-singular":"vulpi","dative-definite-genitive-singular":"vulpii","dative-genitive-indefinite-plural":"vulpi","dative-definite-genitive-plural":"vulpilor","singular-vocative":"vulpe","plural-vocative":"vulpilor","alternative":"hulpe"}},{"word":"harnic","pos":"adj","definitions":["hardworking, industrious, diligent, busy"],"pronunciation":"/ˈhar.nik/","forms":{"feminine-singular":"harnică","masculine-plural":"harnici","feminine-neuter-plural":"harnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"harnic","error-unrecognized-form-feminine-indefinite-singular":"harnică","error-unrecognized-form-indefinite-masculine-plural":"harnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"harnice","definite-error-unrecognized-form-masculine-neuter-singular":"harnicul","definite-error-unrecognized-form-feminine-singular":"harnica","definite-error-unrecognized-form-masculine-plural":"harnicii","definite-error-unrecognized-form-feminine-neuter-plural":"harnicele"}},{"word":"Treabă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Treabă"}},{"word":"treabă","pos":"noun","definitions":["work","business, one's personal affairs","stuff, matter, affair, thing"],"pronunciation":"/ˈtre̯a.bə/","examples":[{"ro":"Nu e treaba ta!","en":"It’s none of your business!"}],"forms":{"plural":"treburi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-uri","accusative-indefinite-nominative-singular":"treabă","accusative-definite-nominative-singular":"treaba","accusative-indefinite-nominative-plural":"treburi","accusative-definite-nominative-plural":"treburile","dative-genitive-indefinite-singular":"trebi","dative-definite-genitive-singular":"trebii","dative-genitive-indefinite-plural":"treburi","dative-definite-genitive-plural":"treburilor","singular-vocative":"treabă","plural-vocative":"treburilor","alternative":"трябэ"}},{"word":"frică","pos":"noun","definitions":["fear"],"pronunciation":"/ˈfrikə/","forms":{"plural":"frici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"frică","accusative-definite-nominative-singular":"frica","accusative-indefinite-nominative-plural":"frici","accusative-definite-nominative-plural":"fricile","dative-genitive-indefinite-singular":"frici","dative-definite-genitive-singular":"fricii","dative-genitive-indefinite-plural":"frici","dative-definite-genitive-plural":"fricilor","singular-vocative":"frică","plural-vocative":"fricilor"}},{"word":"frunte","pos":"noun","definitions":["forehead, brow","the most important or superior part of something","forefront"],"forms":{"plural":"frunți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frunte","accusative-definite-nominative-singular":"fruntea","accusative-indefinite-nominative-plural":"frunți","accusative-definite-nominative-plural":"frunțile","dative-genitive-indefinite-singular":"frunți","dative-definite-genitive-singular":"frunții","dative-genitive-indefinite-plural":"frunți","dative-definite-genitive-plural":"frunților","singular-vocative":"frunte","plural-vocative":"frunților"}},{"word":"lase","pos":"verb","definitions":["third-person singular/plural present subjunctive of lăsa"],"pronunciation":"[ˈlase]"},{"word":"găsit","pos":"noun","definitions":["finding"],"pronunciation":"/ɡəˈsit/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"găsit","accusative-definite-nominative":"găsitul","dative-genitive-indefinite":"găsit","dative-definite-genitive":"găsitului","vocative":"găsitule","alternative":"гэсит"}},{"word":"găsit","pos":"verb","definitions":["past participle of găsi"],"pronunciation":"/ɡəˈsit/","forms":{"participle-past":"of găsi","alternative":"гэсит"}},{"word":"treaba","pos":"noun","definitions":["definite nominative/accusative singular of treabă"]},{"word":"gol","pos":"adj","definitions":["empty","naked","hollow","by itself, without any modification or garnish"],"pronunciation":"/ˈɡol/","examples":[{"ro":"pâine goală","en":"plain bread"}],"forms":{"feminine-singular":"goală","masculine-plural":"goi","feminine-neuter-plural":"goale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gol","error-unrecognized-form-feminine-indefinite-singular":"goală","error-unrecognized-form-indefinite-masculine-plural":"goi","error-unrecognized-form-feminine-indefinite-neuter-plural":"goale","definite-error-unrecognized-form-masculine-neuter-singular":"golul","definite-error-unrecognized-form-feminine-singular":"goala","definite-error-unrecognized-form-masculine-plural":"goii","definite-error-unrecognized-form-feminine-neuter-plural":"goalele"}},{"word":"gol","pos":"noun","definitions":["cavity"],"pronunciation":"/ˈɡol/","forms":{"plural":"goluri"}},{"word":"gol","pos":"noun","definitions":["goal"],"pronunciation":"/ˈɡol/","forms":{"plural":"goluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gol","accusative-definite-nominative-singular":"golul","accusative-indefinite-nominative-plural":"goluri","accusative-definite-nominative-plural":"golurile","dative-genitive-indefinite-singular":"gol","dative-definite-genitive-singular":"golului","dative-genitive-indefinite-plural":"goluri","dative-definite-genitive-plural":"golurilor","singular-vocative":"golule","plural-vocative":"golurilor","alternative-dated":"goal"}},{"word":"vorbești","pos":"verb","definitions":["second-person singular present indicative of vorbi: you speak","second-person singular present subjunctive of vorbi"],"pronunciation":"[vorˈbeʃtʲ]","examples":[{"ro":"nu vrei să vorbești cu mine?","en":"don't you want to talk to me?"}]},{"word":"veste","pos":"noun","definitions":["news, tidings"],"pronunciation":"/ˈves.te/","forms":{"plural":"vești","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"veste","accusative-definite-nominative-singular":"vestea","accusative-indefinite-nominative-plural":"vești","accusative-definite-nominative-plural":"veștile","dative-genitive-indefinite-singular":"vești","dative-definite-genitive-singular":"veștii","dative-genitive-indefinite-plural":"vești","dative-definite-genitive-plural":"veștilor","singular-vocative":"veste","plural-vocative":"veștilor"}},{"word":"lăsat","pos":"noun","definitions":["letting, allowing","leaving, dropping"],"pronunciation":"/ləˈsat/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lăsat","accusative-definite-nominative":"lăsatul","dative-genitive-indefinite":"lăsat","dative-definite-genitive":"lăsatului","vocative":"lăsatule","alternative":"lăsata"}},{"word":"lăsat","pos":"adj","definitions":["dropped, fallen","abandoned, deserted, left behind","bequeathed, bestowed, passed down","lingering, enduring, lasting (about odours, heat, darkness, etc.)","saggy, slack, drooping"],"pronunciation":"/ləˈsat/","forms":{"feminine-singular":"lăsată","masculine-plural":"lăsați","feminine-neuter-plural":"lăsate","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăsat","error-unrecognized-form-feminine-indefinite-singular":"lăsată","error-unrecognized-form-indefinite-masculine-plural":"lăsați","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăsate","definite-error-unrecognized-form-masculine-neuter-singular":"lăsatul","definite-error-unrecognized-form-feminine-singular":"lăsata","definite-error-unrecognized-form-masculine-plural":"lăsații","definite-error-unrecognized-form-feminine-neuter-plural":"lăsatele","alternative":"lăsata"}},{"word":"lăsat","pos":"verb","definitions":["past participle of lăsa"],"pronunciation":"/ləˈsat/","forms":{"alternative":"lăsata"}},{"word":"buni","pos":"adj","definitions":["nominative/accusative masculine plural of bun"],"pronunciation":"/bunʲ/"},{"word":"nevastă","pos":"noun","definitions":["bride","wife"],"pronunciation":"/neˈva.stə/","forms":{"plural":"neveste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nevastă","accusative-definite-nominative-singular":"nevasta","accusative-indefinite-nominative-plural":"neveste","accusative-definite-nominative-plural":"nevestele","dative-genitive-indefinite-singular":"neveste","dative-definite-genitive-singular":"nevestei","dative-genitive-indefinite-plural":"neveste","dative-definite-genitive-plural":"nevestelor","singular-vocative":"nevastă","plural-vocative":"nevestelor"}},{"word":"bade","pos":"noun","definitions":["older brother","older man","a hillbilly, a yokel, a bumpkin; a poorly educated man from the countryside"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-manual","accusative-indefinite-nominative":"bade","accusative-definite-nominative":"badea","dative-genitive-indefinite":"bade","dative-definite-genitive":"badei","vocative":"-"}},{"word":"li","pos":"pron","definitions":["to them"]},{"word":"uitat","pos":"noun","definitions":["forgetting"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"uitat","accusative-definite-nominative":"uitatul","dative-genitive-indefinite":"uitat","dative-definite-genitive":"uitatului","vocative":"uitatule"}},{"word":"uitat","pos":"adj","definitions":["forgotten"],"forms":{"feminine-singular":"uitată","masculine-plural":"uitați","feminine-neuter-plural":"uitate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"uitat","error-unrecognized-form-feminine-indefinite-singular":"uitată","error-unrecognized-form-indefinite-masculine-plural":"uitați","error-unrecognized-form-feminine-indefinite-neuter-plural":"uitate","definite-error-unrecognized-form-masculine-neuter-singular":"uitatul","definite-error-unrecognized-form-feminine-singular":"uitata","definite-error-unrecognized-form-masculine-plural":"uitații","definite-error-unrecognized-form-feminine-neuter-plural":"uitatele"}},{"word":"uitat","pos":"verb","definitions":["past participle of uita"],"forms":{"participle-past":"of uita"}},{"word":"vadă","pos":"verb","definitions":["third-person singular/plural present subjunctive of vedea"],"pronunciation":"[ˈvadə]"},{"word":"le-a","pos":"contraction","definitions":["contraction of le + a"],"pronunciation":"/le̯a/"},{"word":"uscat","pos":"adj","definitions":["dry","dried"],"pronunciation":"/usˈkat/","forms":{"feminine-singular":"uscată","masculine-plural":"uscați","feminine-neuter-plural":"uscate","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"uscat","error-unrecognized-form-feminine-indefinite-singular":"uscată","error-unrecognized-form-indefinite-masculine-plural":"uscați","error-unrecognized-form-feminine-indefinite-neuter-plural":"uscate","definite-error-unrecognized-form-masculine-neuter-singular":"uscatul","definite-error-unrecognized-form-feminine-singular":"uscata","definite-error-unrecognized-form-masculine-plural":"uscații","definite-error-unrecognized-form-feminine-neuter-plural":"uscatele"}},{"word":"uscat","pos":"verb","definitions":["past participle of usca"],"pronunciation":"/usˈkat/"},{"word":"lupta","pos":"verb","definitions":["to battle","to fight (strive against)"],"pronunciation":"/lupˈta/","forms":{"canonical":"a lupta 1st conjugation","present-singular-third-person":"luptă","participle-past":"luptat","subjunctive-third-person":"lupte","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a lupta","gerund":"luptând","first-person-indicative-present-singular":"lupt","indicative-present-second-person-singular":"lupți","indicative-present-singular-third-person":"luptă","first-person-indicative-plural-present":"luptăm","indicative-plural-present-second-person":"luptați","indicative-plural-present-third-person":"luptă","first-person-imperfect-indicative-singular":"luptam","imperfect-indicative-second-person-singular":"luptai","imperfect-indicative-singular-third-person":"lupta","first-person-imperfect-indicative-plural":"luptam","imperfect-indicative-plural-second-person":"luptați","imperfect-indicative-plural-third-person":"luptau","first-person-indicative-perfect-singular":"luptai","indicative-perfect-second-person-singular":"luptași","indicative-perfect-singular-third-person":"luptă","first-person-indicative-perfect-plural":"luptarăm","indicative-perfect-plural-second-person":"luptarăți","indicative-perfect-plural-third-person":"luptară","first-person-indicative-pluperfect-singular":"luptasem","indicative-pluperfect-second-person-singular":"luptaseși","indicative-pluperfect-singular-third-person":"luptase","first-person-indicative-pluperfect-plural":"luptaserăm","indicative-pluperfect-plural-second-person":"luptaserăți","indicative-pluperfect-plural-third-person":"luptaseră","first-person-present-singular-subjunctive":"să lupt","present-second-person-singular-subjunctive":"să lupți","present-singular-subjunctive-third-person":"să lupte","first-person-plural-present-subjunctive":"să luptăm","plural-present-second-person-subjunctive":"să luptați","plural-present-subjunctive-third-person":"să lupte","imperative-second-person-singular":"luptă","imperative-plural-second-person":"luptați","imperative-negative-second-person-singular":"nu lupta","imperative-negative-plural-second-person":"nu luptați"}},{"word":"ne-a","pos":"contraction","definitions":["contraction of ne + a"],"pronunciation":"/ne̯a/"},{"word":"zece","pos":"num","definitions":["ten"],"pronunciation":"/ˈze.t͡ʃe/","forms":{"plural":"zeci","alternative-obsolete":"d̦ece","alternative":"зече"}},{"word":"oamenilor","pos":"noun","definitions":["inflection of om:","definite dative/genitive plural","vocative plural"]},{"word":"vorbiți","pos":"adj","definitions":["masculine plural of vorbit spoken"],"pronunciation":"[vorˈbit͡sʲ]"},{"word":"vorbiți","pos":"verb","definitions":["second-person plural present indicative of vorbi: you speak","second-person plural present subjunctive of vorbi","second-person plural imperative of vorbi: speak; talk"],"pronunciation":"[vorˈbit͡sʲ]"},{"word":"n-ai","pos":"contraction","definitions":["contraction of nu + ai"],"pronunciation":"/naj/"},{"word":"trezi","pos":"verb","definitions":["to get up, wake up","to rouse, awaken"],"forms":{"canonical":"a trezi 4th conjugation","present-singular-third-person":"trezește","participle-past":"trezit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a trezi","gerund":"trezind","first-person-indicative-present-singular":"trezesc","indicative-present-second-person-singular":"trezești","indicative-present-singular-third-person":"trezește","first-person-indicative-plural-present":"trezim","indicative-plural-present-second-person":"treziți","indicative-plural-present-third-person":"trezesc","first-person-imperfect-indicative-singular":"trezeam","imperfect-indicative-second-person-singular":"trezeai","imperfect-indicative-singular-third-person":"trezea","first-person-imperfect-indicative-plural":"trezeam","imperfect-indicative-plural-second-person":"trezeați","imperfect-indicative-plural-third-person":"trezeau","first-person-indicative-perfect-singular":"trezii","indicative-perfect-second-person-singular":"treziși","indicative-perfect-singular-third-person":"trezi","first-person-indicative-perfect-plural":"trezirăm","indicative-perfect-plural-second-person":"trezirăți","indicative-perfect-plural-third-person":"treziră","first-person-indicative-pluperfect-singular":"trezisem","indicative-pluperfect-second-person-singular":"treziseși","indicative-pluperfect-singular-third-person":"trezise","first-person-indicative-pluperfect-plural":"treziserăm","indicative-pluperfect-plural-second-person":"treziserăți","indicative-pluperfect-plural-third-person":"treziseră","first-person-present-singular-subjunctive":"să trezesc","present-second-person-singular-subjunctive":"să trezești","present-singular-subjunctive-third-person":"să trezească","first-person-plural-present-subjunctive":"să trezim","plural-present-second-person-subjunctive":"să treziți","plural-present-subjunctive-third-person":"să trezească","imperative-second-person-singular":"trezește","imperative-plural-second-person":"treziți","imperative-negative-second-person-singular":"nu trezi","imperative-negative-plural-second-person":"nu treziți"}},{"word":"femeia","pos":"noun","definitions":["definite nominative/accusative singular of femeie"],"pronunciation":"/feˈme.ja/"},{"word":"biserică","pos":"noun","definitions":["church"],"pronunciation":"/biˈse.ri.kə/","forms":{"plural":"biserici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"biserică","accusative-definite-nominative-singular":"biserica","accusative-indefinite-nominative-plural":"biserici","accusative-definite-nominative-plural":"bisericile","dative-genitive-indefinite-singular":"biserici","dative-definite-genitive-singular":"bisericii","dative-genitive-indefinite-plural":"biserici","dative-definite-genitive-plural":"bisericilor","singular-vocative":"biserică","plural-vocative":"bisericilor","alternative-obsolete":"băsearecă","alternative":"бисерикэ"}},{"word":"târg","pos":"noun","definitions":["market","market town","fair","trade","agreement"],"forms":{"plural":"târguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"târg","accusative-definite-nominative-singular":"târgul","accusative-indefinite-nominative-plural":"târguri","accusative-definite-nominative-plural":"târgurile","dative-genitive-indefinite-singular":"târg","dative-definite-genitive-singular":"târgului","dative-genitive-indefinite-plural":"târguri","dative-definite-genitive-plural":"târgurilor","singular-vocative":"târgule","plural-vocative":"târgurilor"}},{"word":"vai","pos":"intj","definitions":["alas, woe"],"pronunciation":"/vaj/"},{"word":"babei","pos":"noun","definitions":["definite genitive/dative singular of babă"],"pronunciation":"[ˈbabej]","gender":"f"},{"word":"fetei","pos":"noun","definitions":["definite genitive/dative singular of fată"],"pronunciation":"[ˈfetej]","gender":"f"},{"word":"lasă","pos":"verb","definitions":["inflection of lăsa:","third-person singular/plural present indicative","second-person singular affirmative imperative"],"pronunciation":"/ˈla.sə/"},{"word":"Fântână","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fântână"}},{"word":"fântână","pos":"noun","definitions":["well (for water)","spring, source"],"pronunciation":"/fɨnˈtɨ.nə/","forms":{"plural":"fântâni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fântână","accusative-definite-nominative-singular":"fântâna","accusative-indefinite-nominative-plural":"fântâni","accusative-definite-nominative-plural":"fântânile","dative-genitive-indefinite-singular":"fântâni","dative-definite-genitive-singular":"fântânii","dative-genitive-indefinite-plural":"fântâni","dative-definite-genitive-plural":"fântânilor","singular-vocative":"fântână","plural-vocative":"fântânilor","alternative-obsolete":"fôntână"}},{"word":"gânduri","pos":"noun","definitions":["plural of gând: thoughts"],"pronunciation":"[ˈɡɨn.durʲ]"},{"word":"lega","pos":"verb","definitions":["to tie, bind, connect"],"pronunciation":"/leˈɡa/","forms":{"canonical":"a lega 1st conjugation","present-singular-third-person":"leagă","participle-past":"legat","subjunctive-third-person":"lege","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a lega","gerund":"legând","first-person-indicative-present-singular":"leg","indicative-present-second-person-singular":"legi","indicative-present-singular-third-person":"leagă","first-person-indicative-plural-present":"legăm","indicative-plural-present-second-person":"legați","indicative-plural-present-third-person":"leagă","first-person-imperfect-indicative-singular":"legam","imperfect-indicative-second-person-singular":"legai","imperfect-indicative-singular-third-person":"lega","first-person-imperfect-indicative-plural":"legam","imperfect-indicative-plural-second-person":"legați","imperfect-indicative-plural-third-person":"legau","first-person-indicative-perfect-singular":"legai","indicative-perfect-second-person-singular":"legași","indicative-perfect-singular-third-person":"legă","first-person-indicative-perfect-plural":"legarăm","indicative-perfect-plural-second-person":"legarăți","indicative-perfect-plural-third-person":"legară","first-person-indicative-pluperfect-singular":"legasem","indicative-pluperfect-second-person-singular":"legaseși","indicative-pluperfect-singular-third-person":"legase","first-person-indicative-pluperfect-plural":"legaserăm","indicative-pluperfect-plural-second-person":"legaserăți","indicative-pluperfect-plural-third-person":"legaseră","first-person-present-singular-subjunctive":"să leg","present-second-person-singular-subjunctive":"să legi","present-singular-subjunctive-third-person":"să lege","first-person-plural-present-subjunctive":"să legăm","plural-present-second-person-subjunctive":"să legați","plural-present-subjunctive-third-person":"să lege","imperative-second-person-singular":"leagă","imperative-plural-second-person":"legați","imperative-negative-second-person-singular":"nu lega","imperative-negative-plural-second-person":"nu legați","alternative":"лега"}},{"word":"lei","pos":"noun","definitions":["plural of leu"],"pronunciation":"/lej/","gender":"m-p"},{"word":"Nichifor","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Nichifor"}},{"word":"vază","pos":"noun","definitions":["vase, flower vase, flowerpot"],"pronunciation":"/ˈva.zə/","forms":{"plural":"vaze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"vază","accusative-definite-nominative-singular":"vaza","accusative-indefinite-nominative-plural":"vaze","accusative-definite-nominative-plural":"vazele","dative-genitive-indefinite-singular":"vaze","dative-definite-genitive-singular":"vazei","dative-genitive-indefinite-plural":"vaze","dative-definite-genitive-plural":"vazelor","singular-vocative":"vază","plural-vocative":"vazelor"}},{"word":"vom","pos":"verb","definitions":["will"],"pronunciation":"[vom]","examples":[{"ro":"Vom lua prânzul la ora douăsprezece.","en":"We will have lunch at 12 o'clock."}]},{"word":"vrut","pos":"verb","definitions":["past participle of vrea"],"pronunciation":"/ˈvrut/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"vrut","error-unrecognized-form-feminine-indefinite-singular":"vrută","error-unrecognized-form-indefinite-masculine-plural":"vruți","error-unrecognized-form-feminine-indefinite-neuter-plural":"vrute","definite-error-unrecognized-form-masculine-neuter-singular":"vrutul","definite-error-unrecognized-form-feminine-singular":"vruta","definite-error-unrecognized-form-masculine-plural":"vruții","definite-error-unrecognized-form-feminine-neuter-plural":"vrutele"}},{"word":"joc","pos":"noun","definitions":["game, play","dance"],"pronunciation":"/ʒok/","forms":{"plural":"jocuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"joc","accusative-definite-nominative-singular":"jocul","accusative-indefinite-nominative-plural":"jocuri","accusative-definite-nominative-plural":"jocurile","dative-genitive-indefinite-singular":"joc","dative-definite-genitive-singular":"jocului","dative-genitive-indefinite-plural":"jocuri","dative-definite-genitive-plural":"jocurilor","singular-vocative":"jocule","plural-vocative":"jocurilor"}},{"word":"joc","pos":"verb","definitions":["first-person singular present indicative/subjunctive of juca"],"pronunciation":"/ʒok/"},{"word":"trimite","pos":"verb","definitions":["to send"],"pronunciation":"[triˈmi.te]","forms":{"canonical":"a trimite 3rd conjugation","present-singular-third-person":"trimite","participle-past":"trimis","subjunctive-third-person":"trimită","table-tags":"conjugation-3","inflection-template":"ro-conj-e","infinitive":"a trimite","gerund":"trimițând","first-person-indicative-present-singular":"trimit","indicative-present-second-person-singular":"trimiți","indicative-present-singular-third-person":"trimite","first-person-indicative-plural-present":"trimitem","indicative-plural-present-second-person":"trimiteți","indicative-plural-present-third-person":"trimit","first-person-imperfect-indicative-singular":"trimiteam","imperfect-indicative-second-person-singular":"trimiteai","imperfect-indicative-singular-third-person":"trimitea","first-person-imperfect-indicative-plural":"trimiteam","imperfect-indicative-plural-second-person":"trimiteați","imperfect-indicative-plural-third-person":"trimiteau","first-person-indicative-perfect-singular":"trimisei","indicative-perfect-second-person-singular":"trimiseși","indicative-perfect-singular-third-person":"trimise","first-person-indicative-perfect-plural":"trimiserăm","indicative-perfect-plural-second-person":"trimiserăți","indicative-perfect-plural-third-person":"trimiseră","first-person-indicative-pluperfect-singular":"trimisesem","indicative-pluperfect-second-person-singular":"trimiseseși","indicative-pluperfect-singular-third-person":"trimisese","first-person-indicative-pluperfect-plural":"trimiseserăm","indicative-pluperfect-plural-second-person":"trimiseserăți","indicative-pluperfect-plural-third-person":"trimiseseră","first-person-present-singular-subjunctive":"să trimit","present-second-person-singular-subjunctive":"să trimiți","present-singular-subjunctive-third-person":"să trimită","first-person-plural-present-subjunctive":"să trimitem","plural-present-second-person-subjunctive":"să trimiteți","plural-present-subjunctive-third-person":"să trimită","imperative-second-person-singular":"trimite","imperative-plural-second-person":"trimiteți","imperative-negative-second-person-singular":"nu trimite","imperative-negative-plural-second-person":"nu trimiteți","alternative":"trimete","alternative-archaic":"trămite","alternative-Transylvania-regional":"tremete"}},{"word":"joacă","pos":"noun","definitions":["play"],"pronunciation":"/ˈʒo̯a.kə/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-manual","accusative-indefinite-nominative-singular":"joacă","accusative-definite-nominative-singular":"joaca","accusative-indefinite-nominative-plural":"-","accusative-definite-nominative-plural":"-","dative-genitive-indefinite-singular":"joace","dative-definite-genitive-singular":"joacăi","dative-genitive-indefinite-plural":"-","dative-definite-genitive-plural":"-","singular-vocative":"-","plural-vocative":"-","alternative":"жоакэ"}},{"word":"joacă","pos":"verb","definitions":["inflection of juca (“to play”):","third-person singular/plural indicative present","second-person singular imperative"],"pronunciation":"/ˈʒo̯a.kə/","forms":{"alternative":"жоакэ"}},{"word":"laș","pos":"noun","definitions":["coward, poltroon, dastard"],"pronunciation":"/laʃ/","forms":{"plural":"lași"}},{"word":"laș","pos":"adj","definitions":["cowardly"],"pronunciation":"/laʃ/","forms":{"feminine-singular":"lașă","masculine-plural":"lași","feminine-neuter-plural":"lașe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"laș","error-unrecognized-form-feminine-indefinite-singular":"lașă","error-unrecognized-form-indefinite-masculine-plural":"lași","error-unrecognized-form-feminine-indefinite-neuter-plural":"lașe","definite-error-unrecognized-form-masculine-neuter-singular":"lașul","definite-error-unrecognized-form-feminine-singular":"lașa","definite-error-unrecognized-form-masculine-plural":"lașii","definite-error-unrecognized-form-feminine-neuter-plural":"lașele"}},{"word":"Rece","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Timiș"],"gender":"m"},{"word":"rece","pos":"adj","definitions":["cold"],"pronunciation":"[ˈret͡ʃe]","forms":{"plural":"reci","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"rece","error-unrecognized-form-feminine-indefinite-singular":"rece","error-unrecognized-form-indefinite-masculine-plural":"reci","error-unrecognized-form-feminine-indefinite-neuter-plural":"reci","definite-error-unrecognized-form-masculine-neuter-singular":"recele","definite-error-unrecognized-form-feminine-singular":"recea","definite-error-unrecognized-form-masculine-plural":"recii","definite-error-unrecognized-form-feminine-neuter-plural":"recile","alternative-regional":"răce"}},{"word":"Repede","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Repede"}},{"word":"repede","pos":"adj","definitions":["fast, quick, rapid"],"pronunciation":"/ˈre.pe.de/","forms":{"plural":"repezi","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"repede","error-unrecognized-form-feminine-indefinite-singular":"repede","error-unrecognized-form-indefinite-masculine-plural":"repezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"repezi","definite-error-unrecognized-form-masculine-neuter-singular":"repedele","definite-error-unrecognized-form-feminine-singular":"repedea","definite-error-unrecognized-form-masculine-plural":"repezii","definite-error-unrecognized-form-feminine-neuter-plural":"repezile","alternative":"răpede"}},{"word":"repede","pos":"adv","definitions":["fast, quickly, rapidly"],"pronunciation":"/ˈre.pe.de/","forms":{"alternative":"răpede"}},{"word":"urât","pos":"adj","definitions":["hated","ugly"],"pronunciation":"/uˈrɨt/","forms":{"feminine-singular":"urâtă","masculine-plural":"urâți","feminine-neuter-plural":"urâte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"urât","error-unrecognized-form-feminine-indefinite-singular":"urâtă","error-unrecognized-form-indefinite-masculine-plural":"urâți","error-unrecognized-form-feminine-indefinite-neuter-plural":"urâte","definite-error-unrecognized-form-masculine-neuter-singular":"urâtul","definite-error-unrecognized-form-feminine-singular":"urâta","definite-error-unrecognized-form-masculine-plural":"urâții","definite-error-unrecognized-form-feminine-neuter-plural":"urâtele","alternative-proscribed":"urît"}},{"word":"urât","pos":"verb","definitions":["past participle of urî"],"pronunciation":"/uˈrɨt/","forms":{"alternative-proscribed":"urît"}},{"word":"fereastră","pos":"noun","definitions":["window"],"pronunciation":"/feˈɾe̯as.t̪ɾə/","forms":{"plural":"ferestre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fereastră","accusative-definite-nominative-singular":"fereastra","accusative-indefinite-nominative-plural":"ferestre","accusative-definite-nominative-plural":"ferestrele","dative-genitive-indefinite-singular":"ferestre","dative-definite-genitive-singular":"ferestrei","dative-genitive-indefinite-plural":"ferestre","dative-definite-genitive-plural":"ferestrelor","singular-vocative":"fereastră","plural-vocative":"ferestrelor","alternative":"fereastă"}},{"word":"Negustor","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Negustor"}},{"word":"negustor","pos":"noun","definitions":["merchant, trader, dealer"],"forms":{"plural":"negustori","feminine":"equivalent negustoreasă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"negustor","accusative-definite-nominative-singular":"negustorul","accusative-indefinite-nominative-plural":"negustori","accusative-definite-nominative-plural":"negustorii","dative-genitive-indefinite-singular":"negustor","dative-definite-genitive-singular":"negustorului","dative-genitive-indefinite-plural":"negustori","dative-definite-genitive-plural":"negustorilor","singular-vocative":"negustorule","plural-vocative":"negustorilor","alternative-archaic":"neguțător"}},{"word":"gândul","pos":"noun","definitions":["definite nominative/accusative singular of gând"]},{"word":"naște","pos":"verb","definitions":["to give birth to; to bear","to be born"],"pronunciation":"/ˈnaʃ.te/","examples":[{"ro":"M-am născut în 1988.","en":"I was born in 1988."}],"forms":{"canonical":"a naște 3rd conjugation","present-singular-third-person":"naște","participle-past":"născut","subjunctive-third-person":"nască","table-tags":"conjugation-3","inflection-template":"ro-conj-e-ut","infinitive":"a naște","gerund":"născând","first-person-indicative-present-singular":"nasc","indicative-present-second-person-singular":"naști","indicative-present-singular-third-person":"naște","first-person-indicative-plural-present":"naștem","indicative-plural-present-second-person":"nașteți","indicative-plural-present-third-person":"nasc","first-person-imperfect-indicative-singular":"nășteam","imperfect-indicative-second-person-singular":"nășteai","imperfect-indicative-singular-third-person":"năștea","first-person-imperfect-indicative-plural":"nășteam","imperfect-indicative-plural-second-person":"nășteați","imperfect-indicative-plural-third-person":"nășteau","first-person-indicative-perfect-singular":"născui","indicative-perfect-second-person-singular":"născuși","indicative-perfect-singular-third-person":"născu","first-person-indicative-perfect-plural":"născurăm","indicative-perfect-plural-second-person":"născurăți","indicative-perfect-plural-third-person":"născură","first-person-indicative-pluperfect-singular":"născusem","indicative-pluperfect-second-person-singular":"născuseși","indicative-pluperfect-singular-third-person":"născuse","first-person-indicative-pluperfect-plural":"născuserăm","indicative-pluperfect-plural-second-person":"născuserăți","indicative-pluperfect-plural-third-person":"născuseră","first-person-present-singular-subjunctive":"să nasc","present-second-person-singular-subjunctive":"să naști","present-singular-subjunctive-third-person":"să nască","first-person-plural-present-subjunctive":"să naștem","plural-present-second-person-subjunctive":"să nașteți","plural-present-subjunctive-third-person":"să nască","imperative-second-person-singular":"naște","imperative-plural-second-person":"nașteți","imperative-negative-second-person-singular":"nu naște","imperative-negative-plural-second-person":"nu nașteți","alternative":"наште"}},{"word":"voie","pos":"noun","definitions":["will","permission"],"pronunciation":"/ˈvo.je/","examples":[{"ro":"Nu ai voie să faci așa ceva.","en":"You don't have permission to do something like that."}],"forms":{"plural":"voi","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"voie","accusative-definite-nominative-singular":"voia","accusative-indefinite-nominative-plural":"voi","accusative-definite-nominative-plural":"voile","dative-genitive-indefinite-singular":"voi","dative-definite-genitive-singular":"voii","dative-genitive-indefinite-plural":"voi","dative-definite-genitive-plural":"voilor","singular-vocative":"-","plural-vocative":"-"}},{"word":"zic","pos":"verb","definitions":["inflection of zice:","first-person singular present indicative/subjunctive","third-person plural present indicative"]},{"word":"nevasta","pos":"noun","definitions":["definite nominative/accusative singular of nevastă"],"gender":"f"},{"word":"n-are","pos":"contraction","definitions":["contraction of nu + are; it does not have"],"pronunciation":"/ˈna.re/"},{"word":"opri","pos":"verb","definitions":["to stop the movement of something","to stop one’s own movement","to voluntarily stop a vehicle for less than 5 minutes","to stop, put an end to the progress of something or the actions of someone","to stop an activity of oneself"],"pronunciation":"/oˈpri/","examples":[{"ro":"Tramvaiul a oprit în stație, iar mașinile au trebuit să oprească și ele în spatele lui.","en":"The tram stopped in the station, and the cars also had to stop behind it."},{"ro":"Nu mă pot opri din alunecat.","en":"I can’t stop myself from sliding."},{"ro":"Nu am vândut toate biletele—ți-am oprit unul și ție.","en":"I haven’t sold all the tickets—I kept one for you."}],"forms":{"canonical":"a opri 4th conjugation","present-singular-third-person":"oprește","participle-past":"oprit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a opri","gerund":"oprind","first-person-indicative-present-singular":"opresc","indicative-present-second-person-singular":"oprești","indicative-present-singular-third-person":"oprește","first-person-indicative-plural-present":"oprim","indicative-plural-present-second-person":"opriți","indicative-plural-present-third-person":"opresc","first-person-imperfect-indicative-singular":"opream","imperfect-indicative-second-person-singular":"opreai","imperfect-indicative-singular-third-person":"oprea","first-person-imperfect-indicative-plural":"opream","imperfect-indicative-plural-second-person":"opreați","imperfect-indicative-plural-third-person":"opreau","first-person-indicative-perfect-singular":"oprii","indicative-perfect-second-person-singular":"opriși","indicative-perfect-singular-third-person":"opri","first-person-indicative-perfect-plural":"oprirăm","indicative-perfect-plural-second-person":"oprirăți","indicative-perfect-plural-third-person":"opriră","first-person-indicative-pluperfect-singular":"oprisem","indicative-pluperfect-second-person-singular":"opriseși","indicative-pluperfect-singular-third-person":"oprise","first-person-indicative-pluperfect-plural":"opriserăm","indicative-pluperfect-plural-second-person":"opriserăți","indicative-pluperfect-plural-third-person":"opriseră","first-person-present-singular-subjunctive":"să opresc","present-second-person-singular-subjunctive":"să oprești","present-singular-subjunctive-third-person":"să oprească","first-person-plural-present-subjunctive":"să oprim","plural-present-second-person-subjunctive":"să opriți","plural-present-subjunctive-third-person":"să oprească","imperative-second-person-singular":"oprește","imperative-plural-second-person":"opriți","imperative-negative-second-person-singular":"nu opri","imperative-negative-plural-second-person":"nu opriți"}},{"word":"omule","pos":"noun","definitions":["vocative singular of om"]},{"word":"râs","pos":"noun","definitions":["laughter, laugh"],"pronunciation":"/ˈrɨs/","forms":{"plural":"râsete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"râs","accusative-definite-nominative-singular":"râsul","accusative-indefinite-nominative-plural":"râsete","accusative-definite-nominative-plural":"râsetele","dative-genitive-indefinite-singular":"râs","dative-definite-genitive-singular":"râsului","dative-genitive-indefinite-plural":"râsete","dative-definite-genitive-plural":"râsetelor","singular-vocative":"râsule","plural-vocative":"râsetelor","alternative":"rîs"}},{"word":"râs","pos":"verb","definitions":["past participle of râde"],"pronunciation":"/ˈrɨs/","forms":{"alternative":"rîs"}},{"word":"râs","pos":"noun","definitions":["lynx"],"pronunciation":"/ˈrɨs/","forms":{"plural":"râși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"râs","accusative-definite-nominative-singular":"râsul","accusative-indefinite-nominative-plural":"râși","accusative-definite-nominative-plural":"râșii","dative-genitive-indefinite-singular":"râs","dative-definite-genitive-singular":"râsului","dative-genitive-indefinite-plural":"râși","dative-definite-genitive-plural":"râșilor","singular-vocative":"râsule","plural-vocative":"râșilor","alternative":"rîs"}},{"word":"trecu","pos":"verb","definitions":["third-person singular simple perfect indicative of trece"]},{"word":"unchiaș","pos":"noun","definitions":["greybeard"],"forms":{"plural":"unchiași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"unchiaș","accusative-definite-nominative-singular":"unchiașul","accusative-indefinite-nominative-plural":"unchiași","accusative-definite-nominative-plural":"unchiașii","dative-genitive-indefinite-singular":"unchiaș","dative-definite-genitive-singular":"unchiașului","dative-genitive-indefinite-plural":"unchiași","dative-definite-genitive-plural":"unchiașilor","singular-vocative":"unchiașule","plural-vocative":"unchiașilor"}},{"word":"Trandafir","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Trandafir"}},{"word":"trandafir","pos":"noun","definitions":["rose (flower)","rosebush"],"pronunciation":"[trandaˈfir]","forms":{"plural":"trandafiri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"trandafir","accusative-definite-nominative-singular":"trandafirul","accusative-indefinite-nominative-plural":"trandafiri","accusative-definite-nominative-plural":"trandafirii","dative-genitive-indefinite-singular":"trandafir","dative-definite-genitive-singular":"trandafirului","dative-genitive-indefinite-plural":"trandafiri","dative-definite-genitive-plural":"trandafirilor","singular-vocative":"trandafirule","plural-vocative":"trandafirilor"}},{"word":"buduli","pos":"verb","definitions":["to rummage"],"forms":{"canonical":"a buduli 4th conjugation","present-singular-third-person":"budulește","participle-past":"budulit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a buduli","gerund":"budulind","first-person-indicative-present-singular":"budulesc","indicative-present-second-person-singular":"budulești","indicative-present-singular-third-person":"budulește","first-person-indicative-plural-present":"budulim","indicative-plural-present-second-person":"buduliți","indicative-plural-present-third-person":"budulesc","first-person-imperfect-indicative-singular":"buduleam","imperfect-indicative-second-person-singular":"buduleai","imperfect-indicative-singular-third-person":"budulea","first-person-imperfect-indicative-plural":"buduleam","imperfect-indicative-plural-second-person":"buduleați","imperfect-indicative-plural-third-person":"buduleau","first-person-indicative-perfect-singular":"budulii","indicative-perfect-second-person-singular":"buduliși","indicative-perfect-singular-third-person":"buduli","first-person-indicative-perfect-plural":"budulirăm","indicative-perfect-plural-second-person":"budulirăți","indicative-perfect-plural-third-person":"buduliră","first-person-indicative-pluperfect-singular":"budulisem","indicative-pluperfect-second-person-singular":"buduliseși","indicative-pluperfect-singular-third-person":"budulise","first-person-indicative-pluperfect-plural":"buduliserăm","indicative-pluperfect-plural-second-person":"buduliserăți","indicative-pluperfect-plural-third-person":"buduliseră","first-person-present-singular-subjunctive":"să budulesc","present-second-person-singular-subjunctive":"să budulești","present-singular-subjunctive-third-person":"să budulească","first-person-plural-present-subjunctive":"să budulim","plural-present-second-person-subjunctive":"să buduliți","plural-present-subjunctive-third-person":"să budulească","imperative-second-person-singular":"budulește","imperative-plural-second-person":"buduliți","imperative-negative-second-person-singular":"nu buduli","imperative-negative-plural-second-person":"nu buduliți"}},{"word":"vis","pos":"noun","definitions":["dream; vision"],"forms":{"plural":"visuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"vis","accusative-definite-nominative-singular":"visul","accusative-indefinite-nominative-plural":"visuri","accusative-definite-nominative-plural":"visurile","dative-genitive-indefinite-singular":"vis","dative-definite-genitive-singular":"visului","dative-genitive-indefinite-plural":"visuri","dative-definite-genitive-plural":"visurilor","singular-vocative":"visule","plural-vocative":"visurilor"}},{"word":"ești","pos":"verb","definitions":["second-person singular present indicative of fi: You are."],"pronunciation":"[jeʃtʲ]","examples":[{"ro":"Ești un amic de al lui?","en":"Are you a friend of his?"}],"forms":{"alternative":"ешть"}},{"word":"grea","pos":"adj","definitions":["indefinite nominative/accusative feminine singular of greu (“heavy; hard”)"],"pronunciation":"/ˈɡre̯a/"},{"word":"grea","pos":"verb","definitions":["to rig"],"pronunciation":"/ɡreˈa/","forms":{"canonical":"a grea 1st conjugation","present-singular-third-person":"greează","participle-past":"great","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a grea","gerund":"greând","first-person-indicative-present-singular":"greez","indicative-present-second-person-singular":"greezi","indicative-present-singular-third-person":"greează","first-person-indicative-plural-present":"greăm","indicative-plural-present-second-person":"greați","indicative-plural-present-third-person":"greează","first-person-imperfect-indicative-singular":"gream","imperfect-indicative-second-person-singular":"greai","imperfect-indicative-singular-third-person":"grea","first-person-imperfect-indicative-plural":"gream","imperfect-indicative-plural-second-person":"greați","imperfect-indicative-plural-third-person":"greau","first-person-indicative-perfect-singular":"greai","indicative-perfect-second-person-singular":"greași","indicative-perfect-singular-third-person":"greă","first-person-indicative-perfect-plural":"grearăm","indicative-perfect-plural-second-person":"grearăți","indicative-perfect-plural-third-person":"greară","first-person-indicative-pluperfect-singular":"greasem","indicative-pluperfect-second-person-singular":"greaseși","indicative-pluperfect-singular-third-person":"grease","first-person-indicative-pluperfect-plural":"greaserăm","indicative-pluperfect-plural-second-person":"greaserăți","indicative-pluperfect-plural-third-person":"greaseră","first-person-present-singular-subjunctive":"să greez","present-second-person-singular-subjunctive":"să greezi","present-singular-subjunctive-third-person":"să greeze","first-person-plural-present-subjunctive":"să greăm","plural-present-second-person-subjunctive":"să greați","plural-present-subjunctive-third-person":"să greeze","imperative-second-person-singular":"greează","imperative-plural-second-person":"greați","imperative-negative-second-person-singular":"nu grea","imperative-negative-plural-second-person":"nu greați"}},{"word":"facem","pos":"verb","definitions":["first-person plural present indicative/subjunctive of face"],"pronunciation":"[ˈfat͡ʃem]"},{"word":"viață","pos":"noun","definitions":["life"],"pronunciation":"/ˈvja.t͡sə/","examples":[{"ro":"plin de viață","en":"full of life"},{"ro":"a scăpa cu viață","en":"to escape with one’s life"},{"ro":"a aduce la viață","en":"to bring to life"}],"forms":{"plural":"vieți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"viață","accusative-definite-nominative-singular":"viața","accusative-indefinite-nominative-plural":"vieți","accusative-definite-nominative-plural":"viețile","dative-genitive-indefinite-singular":"vieți","dative-definite-genitive-singular":"vieții","dative-genitive-indefinite-plural":"vieți","dative-definite-genitive-plural":"vieților","singular-vocative":"viață","plural-vocative":"vieților","alternative-archaic":"vieață"}},{"word":"găti","pos":"verb","definitions":["to prepare (oneself or something else)","to cook","to dress up, get ready, adorn oneself","to finish"],"pronunciation":"/ɡəˈti/","forms":{"canonical":"a găti 4th conjugation","present-singular-third-person":"gătește","participle-past":"gătit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a găti","gerund":"gătind","first-person-indicative-present-singular":"gătesc","indicative-present-second-person-singular":"gătești","indicative-present-singular-third-person":"gătește","first-person-indicative-plural-present":"gătim","indicative-plural-present-second-person":"gătiți","indicative-plural-present-third-person":"gătesc","first-person-imperfect-indicative-singular":"găteam","imperfect-indicative-second-person-singular":"găteai","imperfect-indicative-singular-third-person":"gătea","first-person-imperfect-indicative-plural":"găteam","imperfect-indicative-plural-second-person":"găteați","imperfect-indicative-plural-third-person":"găteau","first-person-indicative-perfect-singular":"gătii","indicative-perfect-second-person-singular":"gătiși","indicative-perfect-singular-third-person":"găti","first-person-indicative-perfect-plural":"gătirăm","indicative-perfect-plural-second-person":"gătirăți","indicative-perfect-plural-third-person":"gătiră","first-person-indicative-pluperfect-singular":"gătisem","indicative-pluperfect-second-person-singular":"gătiseși","indicative-pluperfect-singular-third-person":"gătise","first-person-indicative-pluperfect-plural":"gătiserăm","indicative-pluperfect-plural-second-person":"gătiserăți","indicative-pluperfect-plural-third-person":"gătiseră","first-person-present-singular-subjunctive":"să gătesc","present-second-person-singular-subjunctive":"să gătești","present-singular-subjunctive-third-person":"să gătească","first-person-plural-present-subjunctive":"să gătim","plural-present-second-person-subjunctive":"să gătiți","plural-present-subjunctive-third-person":"să gătească","imperative-second-person-singular":"gătește","imperative-plural-second-person":"gătiți","imperative-negative-second-person-singular":"nu găti","imperative-negative-plural-second-person":"nu gătiți","alternative":"găta"}},{"word":"bătrână","pos":"adj","definitions":["indefinite nominative/accusative feminine singular of bătrân"],"pronunciation":"/bəˈtrɨ.nə/","forms":{"alternative":"bătrînă"}},{"word":"bătrână","pos":"noun","definitions":["female equivalent of bătrân: old woman"],"pronunciation":"/bəˈtrɨ.nə/","forms":{"plural":"bătrâne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bătrână","accusative-definite-nominative-singular":"bătrâna","accusative-indefinite-nominative-plural":"bătrâne","accusative-definite-nominative-plural":"bătrânele","dative-genitive-indefinite-singular":"bătrâne","dative-definite-genitive-singular":"bătrânei","dative-genitive-indefinite-plural":"bătrâne","dative-definite-genitive-plural":"bătrânelor","singular-vocative":"bătrână","plural-vocative":"bătrânelor","alternative":"bătrînă"}},{"word":"Jumătate","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jumătate"}},{"word":"jumătate","pos":"noun","definitions":["half"],"pronunciation":"/ʒu.məˈta.te/","forms":{"plural":"jumătăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jumătate","accusative-definite-nominative-singular":"jumătatea","accusative-indefinite-nominative-plural":"jumătăți","accusative-definite-nominative-plural":"jumătățile","dative-genitive-indefinite-singular":"jumătăți","dative-definite-genitive-singular":"jumătății","dative-genitive-indefinite-plural":"jumătăți","dative-definite-genitive-plural":"jumătăților","singular-vocative":"jumătate","plural-vocative":"jumătăților","alternative":"жумэтате","alternative-colloquial":"jumate"}},{"word":"zici","pos":"verb","definitions":["second-person singular present indicative of zice"]},{"word":"Bucura","pos":"name","definitions":["a village in Vânju Mare, Mehedinți County, Romania"],"gender":"f"},{"word":"bucura","pos":"verb","definitions":["to delight, to cheer, to indulge","be / become glad or happy"],"examples":[{"ro":"Cred că aș avea ceva care te va bucura.","en":"I think I might have something that will cheer you up."}],"forms":{"canonical":"a bucura 1st conjugation","present-singular-third-person":"bucură","participle-past":"bucurat","subjunctive-third-person":"bucure","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a bucura","gerund":"bucurând","first-person-indicative-present-singular":"bucur","indicative-present-second-person-singular":"bucuri","indicative-present-singular-third-person":"bucură","first-person-indicative-plural-present":"bucurăm","indicative-plural-present-second-person":"bucurați","indicative-plural-present-third-person":"bucură","first-person-imperfect-indicative-singular":"bucuram","imperfect-indicative-second-person-singular":"bucurai","imperfect-indicative-singular-third-person":"bucura","first-person-imperfect-indicative-plural":"bucuram","imperfect-indicative-plural-second-person":"bucurați","imperfect-indicative-plural-third-person":"bucurau","first-person-indicative-perfect-singular":"bucurai","indicative-perfect-second-person-singular":"bucurași","indicative-perfect-singular-third-person":"bucură","first-person-indicative-perfect-plural":"bucurarăm","indicative-perfect-plural-second-person":"bucurarăți","indicative-perfect-plural-third-person":"bucurară","first-person-indicative-pluperfect-singular":"bucurasem","indicative-pluperfect-second-person-singular":"bucuraseși","indicative-pluperfect-singular-third-person":"bucurase","first-person-indicative-pluperfect-plural":"bucuraserăm","indicative-pluperfect-plural-second-person":"bucuraserăți","indicative-pluperfect-plural-third-person":"bucuraseră","first-person-present-singular-subjunctive":"să bucur","present-second-person-singular-subjunctive":"să bucuri","present-singular-subjunctive-third-person":"să bucure","first-person-plural-present-subjunctive":"să bucurăm","plural-present-second-person-subjunctive":"să bucurați","plural-present-subjunctive-third-person":"să bucure","imperative-second-person-singular":"bucură","imperative-plural-second-person":"bucurați","imperative-negative-second-person-singular":"nu bucura","imperative-negative-plural-second-person":"nu bucurați"}},{"word":"umbra","pos":"noun","definitions":["definite nominative/accusative singular of umbră"],"gender":"f"},{"word":"Vale","pos":"name","definitions":["a village in Aluniș, Cluj County, Romania","a locality in Toplița, Harghita County, Romania","a locality in Săliște, Sibiu County, Romania"],"gender":"m"},{"word":"vale","pos":"noun","definitions":["valley"],"pronunciation":"[ˈvale]","forms":{"plural":"văi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"vale","accusative-definite-nominative-singular":"valea","accusative-indefinite-nominative-plural":"văi","accusative-definite-nominative-plural":"văile","dative-genitive-indefinite-singular":"văi","dative-definite-genitive-singular":"văii","dative-genitive-indefinite-plural":"văi","dative-definite-genitive-plural":"văilor","singular-vocative":"vale","plural-vocative":"văilor"}},{"word":"n-au","pos":"contraction","definitions":["contraction of nu + au"],"pronunciation":"/naw/"},{"word":"zică","pos":"verb","definitions":["third-person singular/plural present subjunctive of zice"],"pronunciation":"/ˈzikə/"},{"word":"Rod","pos":"name","definitions":["a village in Tilișca, Sibiu County, Romania"],"gender":"m"},{"word":"rod","pos":"noun","definitions":["fruit","fruit (advantageous result)"],"forms":{"plural":"roade","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"rod","accusative-definite-nominative-singular":"rodul","accusative-indefinite-nominative-plural":"roade","accusative-definite-nominative-plural":"roadele","dative-genitive-indefinite-singular":"rod","dative-definite-genitive-singular":"rodului","dative-genitive-indefinite-plural":"roade","dative-definite-genitive-plural":"roadelor","singular-vocative":"rodule","plural-vocative":"roadelor"}},{"word":"rod","pos":"verb","definitions":["inflection of roade:","first-person singular present indicative/subjunctive","third-person plural present indicative"]},{"word":"Bujor","pos":"name","definitions":["a village in Vârvoru de Jos, Dolj County, Romania","a village in Miheșu de Câmpie, Mureș County, Romania"],"gender":"m"},{"word":"bujor","pos":"noun","definitions":["peony"],"pronunciation":"/buˈʒor/","forms":{"plural":"bujori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bujor","accusative-definite-nominative-singular":"bujorul","accusative-indefinite-nominative-plural":"bujori","accusative-definite-nominative-plural":"bujorii","dative-genitive-indefinite-singular":"bujor","dative-definite-genitive-singular":"bujorului","dative-genitive-indefinite-plural":"bujori","dative-definite-genitive-plural":"bujorilor","singular-vocative":"bujorule","plural-vocative":"bujorilor"}},{"word":"te-ai","pos":"contraction","definitions":["contraction of te + ai"],"pronunciation":"/te̯aj/"},{"word":"grijă","pos":"noun","definitions":["worry","care (looking out for something)","carefulness, attentiveness, meticulousness","memorial service"],"pronunciation":"/ˈɡri.ʒə/","examples":[{"ro":"fără nicio grijă","en":"without a care"},{"ro":"îi avea/purta grija cuiva","en":"to be worried for someone"},{"ro":"în grija cuiva","en":"in someone’s care"}],"forms":{"plural":"griji","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"grijă","accusative-definite-nominative-singular":"grija","accusative-indefinite-nominative-plural":"griji","accusative-definite-nominative-plural":"grijile","dative-genitive-indefinite-singular":"griji","dative-definite-genitive-singular":"grijii","dative-genitive-indefinite-plural":"griji","dative-definite-genitive-plural":"grijilor","singular-vocative":"grijă","plural-vocative":"grijilor","alternative":"grije"}},{"word":"Lumina","pos":"name","definitions":["a commune of Constanța County, Romania","a village in Lumina, Constanța County, Romania"],"gender":"f"},{"word":"lumina","pos":"noun","definitions":["definite nominative/accusative singular of lumină"],"gender":"f"},{"word":"lumina","pos":"verb","definitions":["to light, to illuminate","to shine","to enlighten"],"forms":{"canonical":"a lumina 1st conjugation","present-singular-third-person":"luminează","participle-past":"luminat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a lumina","gerund":"luminând","first-person-indicative-present-singular":"luminez","indicative-present-second-person-singular":"luminezi","indicative-present-singular-third-person":"luminează","first-person-indicative-plural-present":"luminăm","indicative-plural-present-second-person":"luminați","indicative-plural-present-third-person":"luminează","first-person-imperfect-indicative-singular":"luminam","imperfect-indicative-second-person-singular":"luminai","imperfect-indicative-singular-third-person":"lumina","first-person-imperfect-indicative-plural":"luminam","imperfect-indicative-plural-second-person":"luminați","imperfect-indicative-plural-third-person":"luminau","first-person-indicative-perfect-singular":"luminai","indicative-perfect-second-person-singular":"luminași","indicative-perfect-singular-third-person":"lumină","first-person-indicative-perfect-plural":"luminarăm","indicative-perfect-plural-second-person":"luminarăți","indicative-perfect-plural-third-person":"luminară","first-person-indicative-pluperfect-singular":"luminasem","indicative-pluperfect-second-person-singular":"luminaseși","indicative-pluperfect-singular-third-person":"luminase","first-person-indicative-pluperfect-plural":"luminaserăm","indicative-pluperfect-plural-second-person":"luminaserăți","indicative-pluperfect-plural-third-person":"luminaseră","first-person-present-singular-subjunctive":"să luminez","present-second-person-singular-subjunctive":"să luminezi","present-singular-subjunctive-third-person":"să lumineze","first-person-plural-present-subjunctive":"să luminăm","plural-present-second-person-subjunctive":"să luminați","plural-present-subjunctive-third-person":"să lumineze","imperative-second-person-singular":"luminează","imperative-plural-second-person":"luminați","imperative-negative-second-person-singular":"nu lumina","imperative-negative-plural-second-person":"nu luminați"}},{"word":"noastre","pos":"adj","definitions":["feminine plural of nostru; our"],"pronunciation":"/ˈno̯astre/"},{"word":"numele","pos":"noun","definitions":["definite nominative singular of nume: the name","definite accusative singular of nume: the name","definite nominative plural of nume: the names","definite accusative plural of nume: the names"],"pronunciation":"[ˈnumele]"},{"word":"bătut","pos":"adj","definitions":["beaten","defeated"],"pronunciation":"/bəˈtut/","forms":{"feminine-singular":"bătută","masculine-plural":"bătuți","feminine-neuter-plural":"bătute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bătut","error-unrecognized-form-feminine-indefinite-singular":"bătută","error-unrecognized-form-indefinite-masculine-plural":"bătuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bătute","definite-error-unrecognized-form-masculine-neuter-singular":"bătutul","definite-error-unrecognized-form-feminine-singular":"bătuta","definite-error-unrecognized-form-masculine-plural":"bătuții","definite-error-unrecognized-form-feminine-neuter-plural":"bătutele"}},{"word":"bătut","pos":"verb","definitions":["past participle of bate"],"pronunciation":"/bəˈtut/","forms":{"participle-past":"of bate"}},{"word":"gât","pos":"noun","definitions":["throat","neck"],"pronunciation":"/ɡɨt/","forms":{"plural":"gâturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gât","accusative-definite-nominative-singular":"gâtul","accusative-indefinite-nominative-plural":"gâturi","accusative-definite-nominative-plural":"gâturile","dative-genitive-indefinite-singular":"gât","dative-definite-genitive-singular":"gâtului","dative-genitive-indefinite-plural":"gâturi","dative-definite-genitive-plural":"gâturilor","singular-vocative":"gâtule","plural-vocative":"gâturilor"}},{"word":"ouă","pos":"noun","definitions":["plural of ou"],"pronunciation":"/ˈo.wə/","gender":"n"},{"word":"glasul","pos":"noun","definitions":["nominative definite singular articulation of glas"]},{"word":"vreau","pos":"verb","definitions":["first-person singular present indicative/subjunctive of vrea","third-person singular imperfect indicative of vrea"],"pronunciation":"/ˈvre̯aw/"},{"word":"fugi","pos":"verb","definitions":["to run","to flee, run away, escape"],"pronunciation":"/fuˈd͡ʒi/","forms":{"canonical":"a fugi 4th conjugation","present-singular-third-person":"fuge","participle-past":"fugit","subjunctive-third-person":"fugă","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a fugi","gerund":"fugind","first-person-indicative-present-singular":"fug","indicative-present-second-person-singular":"fugi","indicative-present-singular-third-person":"fuge","first-person-indicative-plural-present":"fugim","indicative-plural-present-second-person":"fugiți","indicative-plural-present-third-person":"fug","first-person-imperfect-indicative-singular":"fugeam","imperfect-indicative-second-person-singular":"fugeai","imperfect-indicative-singular-third-person":"fugea","first-person-imperfect-indicative-plural":"fugeam","imperfect-indicative-plural-second-person":"fugeați","imperfect-indicative-plural-third-person":"fugeau","first-person-indicative-perfect-singular":"fugii","indicative-perfect-second-person-singular":"fugiși","indicative-perfect-singular-third-person":"fugi","first-person-indicative-perfect-plural":"fugirăm","indicative-perfect-plural-second-person":"fugirăți","indicative-perfect-plural-third-person":"fugiră","first-person-indicative-pluperfect-singular":"fugisem","indicative-pluperfect-second-person-singular":"fugiseși","indicative-pluperfect-singular-third-person":"fugise","first-person-indicative-pluperfect-plural":"fugiserăm","indicative-pluperfect-plural-second-person":"fugiserăți","indicative-pluperfect-plural-third-person":"fugiseră","first-person-present-singular-subjunctive":"să fug","present-second-person-singular-subjunctive":"să fugi","present-singular-subjunctive-third-person":"să fugă","first-person-plural-present-subjunctive":"să fugim","plural-present-second-person-subjunctive":"să fugiți","plural-present-subjunctive-third-person":"să fugă","imperative-second-person-singular":"fugi","imperative-plural-second-person":"fugiți","imperative-negative-second-person-singular":"nu fugi","imperative-negative-plural-second-person":"nu fugiți"}},{"word":"juca","pos":"verb","definitions":["to play","to gamble","to dance"],"pronunciation":"/ʒuˈka/","examples":[{"ro":"Nu mai juca.","en":"Stop gambling."}],"forms":{"canonical":"a juca 1st conjugation","present-singular-third-person":"joacă","participle-past":"jucat","subjunctive-third-person":"joace","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a juca","gerund":"jucând","first-person-indicative-present-singular":"joc","indicative-present-second-person-singular":"joci","indicative-present-singular-third-person":"joacă","first-person-indicative-plural-present":"jucăm","indicative-plural-present-second-person":"jucați","indicative-plural-present-third-person":"joacă","first-person-imperfect-indicative-singular":"jucam","imperfect-indicative-second-person-singular":"jucai","imperfect-indicative-singular-third-person":"juca","first-person-imperfect-indicative-plural":"jucam","imperfect-indicative-plural-second-person":"jucați","imperfect-indicative-plural-third-person":"jucau","first-person-indicative-perfect-singular":"jucai","indicative-perfect-second-person-singular":"jucași","indicative-perfect-singular-third-person":"jucă","first-person-indicative-perfect-plural":"jucarăm","indicative-perfect-plural-second-person":"jucarăți","indicative-perfect-plural-third-person":"jucară","first-person-indicative-pluperfect-singular":"jucasem","indicative-pluperfect-second-person-singular":"jucaseși","indicative-pluperfect-singular-third-person":"jucase","first-person-indicative-pluperfect-plural":"jucaserăm","indicative-pluperfect-plural-second-person":"jucaserăți","indicative-pluperfect-plural-third-person":"jucaseră","first-person-present-singular-subjunctive":"să joc","present-second-person-singular-subjunctive":"să joci","present-singular-subjunctive-third-person":"să joace","first-person-plural-present-subjunctive":"să jucăm","plural-present-second-person-subjunctive":"să jucați","plural-present-subjunctive-third-person":"să joace","imperative-second-person-singular":"joacă","imperative-plural-second-person":"jucați","imperative-negative-second-person-singular":"nu juca","imperative-negative-plural-second-person":"nu jucați","alternative":"жука"}},{"word":"uneori","pos":"adv","definitions":["sometimes, occasionally"],"pronunciation":"/u.neˈorʲ/"},{"word":"Grozav","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grozav"}},{"word":"grozav","pos":"adj","definitions":["terrific, great, exceptional, tremendous, scrumptious, awesome, lush, copacetic","terrible, awful, dreadful, atrocious, horrible"],"forms":{"feminine-singular":"grozavă","masculine-plural":"grozavi","feminine-neuter-plural":"grozave"}},{"word":"grozav","pos":"adv","definitions":["very, bloody, extremely"]},{"word":"lungă","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of lung"]},{"word":"gros","pos":"adj","definitions":["thick"],"pronunciation":"/ɡros/","forms":{"feminine-singular":"groasă","masculine-plural":"groși","feminine-neuter-plural":"groase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gros","error-unrecognized-form-feminine-indefinite-singular":"groasă","error-unrecognized-form-indefinite-masculine-plural":"groși","error-unrecognized-form-feminine-indefinite-neuter-plural":"groase","definite-error-unrecognized-form-masculine-neuter-singular":"grosul","definite-error-unrecognized-form-feminine-singular":"groasa","definite-error-unrecognized-form-masculine-plural":"groșii","definite-error-unrecognized-form-feminine-neuter-plural":"groasele"}},{"word":"lacrimă","pos":"noun","definitions":["teardrop, tear"],"pronunciation":"[ˈlakrimə]","forms":{"plural":"lacrimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lacrimă","accusative-definite-nominative-singular":"lacrima","accusative-indefinite-nominative-plural":"lacrimi","accusative-definite-nominative-plural":"lacrimile","dative-genitive-indefinite-singular":"lacrimi","dative-definite-genitive-singular":"lacrimii","dative-genitive-indefinite-plural":"lacrimi","dative-definite-genitive-plural":"lacrimilor","singular-vocative":"lacrimă","plural-vocative":"lacrimilor","alternative-common":"lacrămă"}},{"word":"toarce","pos":"verb","definitions":["to spin (yarn)","to purr"],"pronunciation":"/ˈto̯ar.t͡ʃe/","forms":{"canonical":"a toarce 3rd conjugation","present-singular-third-person":"toarce","participle-past":"tors","subjunctive-third-person":"toarcă","table-tags":"conjugation-3","inflection-template":"ro-conj-e-s","infinitive":"a toarce","gerund":"torcând","first-person-indicative-present-singular":"torc","indicative-present-second-person-singular":"torci","indicative-present-singular-third-person":"toarce","first-person-indicative-plural-present":"toarcem","indicative-plural-present-second-person":"toarceți","indicative-plural-present-third-person":"torc","first-person-imperfect-indicative-singular":"torceam","imperfect-indicative-second-person-singular":"torceai","imperfect-indicative-singular-third-person":"torcea","first-person-imperfect-indicative-plural":"torceam","imperfect-indicative-plural-second-person":"torceați","imperfect-indicative-plural-third-person":"torceau","first-person-indicative-perfect-singular":"torsei","indicative-perfect-second-person-singular":"torseși","indicative-perfect-singular-third-person":"toarse","first-person-indicative-perfect-plural":"toarserăm","indicative-perfect-plural-second-person":"toarserăți","indicative-perfect-plural-third-person":"toarseră","first-person-indicative-pluperfect-singular":"torsesem","indicative-pluperfect-second-person-singular":"torseseși","indicative-pluperfect-singular-third-person":"torsese","first-person-indicative-pluperfect-plural":"torseserăm","indicative-pluperfect-plural-second-person":"torseserăți","indicative-pluperfect-plural-third-person":"torseseră","first-person-present-singular-subjunctive":"să torc","present-second-person-singular-subjunctive":"să torci","present-singular-subjunctive-third-person":"să toarcă","first-person-plural-present-subjunctive":"să toarcem","plural-present-second-person-subjunctive":"să toarceți","plural-present-subjunctive-third-person":"să toarcă","imperative-second-person-singular":"toarce","imperative-plural-second-person":"toarceți","imperative-negative-second-person-singular":"nu toarce","imperative-negative-plural-second-person":"nu toarceți","alternative-obsolete":"tórce"}},{"word":"Bogat","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bogat"}},{"word":"bogat","pos":"adj","definitions":["rich, wealthy","luxurious, expensive"],"pronunciation":"/boˈɡat/","forms":{"feminine-singular":"bogată","masculine-plural":"bogați","feminine-neuter-plural":"bogate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bogat","error-unrecognized-form-feminine-indefinite-singular":"bogată","error-unrecognized-form-indefinite-masculine-plural":"bogați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bogate","definite-error-unrecognized-form-masculine-neuter-singular":"bogatul","definite-error-unrecognized-form-feminine-singular":"bogata","definite-error-unrecognized-form-masculine-plural":"bogații","definite-error-unrecognized-form-feminine-neuter-plural":"bogatele","alternative":"богат"}},{"word":"bogat","pos":"adv","definitions":["richly, fully, amply"],"pronunciation":"/boˈɡat/","forms":{"alternative":"богат"}},{"word":"bogat","pos":"noun","definitions":["a rich or wealthy person"],"pronunciation":"/boˈɡat/","forms":{"plural":"bogați","feminine":"equivalent bogată","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bogat","accusative-definite-nominative-singular":"bogatul","accusative-indefinite-nominative-plural":"bogați","accusative-definite-nominative-plural":"bogații","dative-genitive-indefinite-singular":"bogat","dative-definite-genitive-singular":"bogatului","dative-genitive-indefinite-plural":"bogați","dative-definite-genitive-plural":"bogaților","singular-vocative":"bogatule","plural-vocative":"bogaților","alternative":"богат"}},{"word":"Busuioc","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Busuioc"}},{"word":"busuioc","pos":"noun","definitions":["basil (plant)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"busuioc","accusative-definite-nominative":"busuiocul","dative-genitive-indefinite":"busuioc","dative-definite-genitive":"busuiocului","vocative":"busuiocule"}},{"word":"fus","pos":"noun","definitions":["spindle","journal (part of an axle)","shaft of a column","shaft (tree trunk)","shank of an anchor (the straight vertical part)"],"pronunciation":"/ˈfus/","forms":{"plural":"fuse","error-unknown-tag-plural":"fusuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fus","accusative-definite-nominative-singular":"fusul","accusative-indefinite-nominative-plural":"fuse","accusative-definite-nominative-plural":"fusele","dative-genitive-indefinite-singular":"fus","dative-definite-genitive-singular":"fusului","dative-genitive-indefinite-plural":"fuse","dative-definite-genitive-plural":"fuselor","singular-vocative":"fusule","plural-vocative":"fuselor","alternative":"фус"}},{"word":"fus","pos":"noun","definitions":["square foot"],"pronunciation":"/ˈfus/","forms":{"plural":"fuse","alternative":"фус"}},{"word":"boieri","pos":"verb","definitions":["to make a boyar","to adopt a new, comfortable lifestyle or habits","to become, be made a boyar"],"pronunciation":"/bo.jeˈri/","forms":{"canonical":"a boieri 4th conjugation","present-singular-third-person":"boierește","participle-past":"boierit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a boieri","gerund":"boierind","first-person-indicative-present-singular":"boieresc","indicative-present-second-person-singular":"boierești","indicative-present-singular-third-person":"boierește","first-person-indicative-plural-present":"boierim","indicative-plural-present-second-person":"boieriți","indicative-plural-present-third-person":"boieresc","first-person-imperfect-indicative-singular":"boieream","imperfect-indicative-second-person-singular":"boiereai","imperfect-indicative-singular-third-person":"boierea","first-person-imperfect-indicative-plural":"boieream","imperfect-indicative-plural-second-person":"boiereați","imperfect-indicative-plural-third-person":"boiereau","first-person-indicative-perfect-singular":"boierii","indicative-perfect-second-person-singular":"boieriși","indicative-perfect-singular-third-person":"boieri","first-person-indicative-perfect-plural":"boierirăm","indicative-perfect-plural-second-person":"boierirăți","indicative-perfect-plural-third-person":"boieriră","first-person-indicative-pluperfect-singular":"boierisem","indicative-pluperfect-second-person-singular":"boieriseși","indicative-pluperfect-singular-third-person":"boierise","first-person-indicative-pluperfect-plural":"boieriserăm","indicative-pluperfect-plural-second-person":"boieriserăți","indicative-pluperfect-plural-third-person":"boieriseră","first-person-present-singular-subjunctive":"să boieresc","present-second-person-singular-subjunctive":"să boierești","present-singular-subjunctive-third-person":"să boierească","first-person-plural-present-subjunctive":"să boierim","plural-present-second-person-subjunctive":"să boieriți","plural-present-subjunctive-third-person":"să boierească","imperative-second-person-singular":"boierește","imperative-plural-second-person":"boieriți","imperative-negative-second-person-singular":"nu boieri","imperative-negative-plural-second-person":"nu boieriți"}},{"word":"boieri","pos":"noun","definitions":["indefinite plural of boier"],"pronunciation":"/boˈjerʲ/"},{"word":"glas","pos":"noun","definitions":["voice","mode of Orthodox chant, of which there are eight","words, speech","news"],"pronunciation":"/ɡlas/","forms":{"plural":"glasuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"glas","accusative-definite-nominative-singular":"glasul","accusative-indefinite-nominative-plural":"glasuri","accusative-definite-nominative-plural":"glasurile","dative-genitive-indefinite-singular":"glas","dative-definite-genitive-singular":"glasului","dative-genitive-indefinite-plural":"glasuri","dative-definite-genitive-plural":"glasurilor","singular-vocative":"glasule","plural-vocative":"glasurilor"}},{"word":"brâu","pos":"noun","definitions":["girdle, belt; thong"],"pronunciation":"/brɨw/","forms":{"plural":"brâie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brâu","accusative-definite-nominative-singular":"brâul","accusative-indefinite-nominative-plural":"brâie","accusative-definite-nominative-plural":"brâiele","dative-genitive-indefinite-singular":"brâu","dative-definite-genitive-singular":"brâului","dative-genitive-indefinite-plural":"brâie","dative-definite-genitive-plural":"brâielor","singular-vocative":"brâule","plural-vocative":"brâielor","alternative-common":"brână","alternative":"brîu"}},{"word":"brâu","pos":"noun","definitions":["folk dance"],"pronunciation":"/brɨw/","forms":{"plural":"brâuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brâu","accusative-definite-nominative-singular":"brâul","accusative-indefinite-nominative-plural":"brâuri","accusative-definite-nominative-plural":"brâurile","dative-genitive-indefinite-singular":"brâu","dative-definite-genitive-singular":"brâului","dative-genitive-indefinite-plural":"brâuri","dative-definite-genitive-plural":"brâurilor","singular-vocative":"brâule","plural-vocative":"brâurilor","alternative-common":"brână","alternative":"brîu"}},{"word":"Genunchi","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Genunchi"}},{"word":"genunchi","pos":"noun","definitions":["knee"],"pronunciation":"[dʒeˈnunkʲ]","forms":{"plural":"genunchi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"genunchi","accusative-definite-nominative-singular":"genunchiul","accusative-indefinite-nominative-plural":"genunchi","accusative-definite-nominative-plural":"genunchii","dative-genitive-indefinite-singular":"genunchi","dative-definite-genitive-singular":"genunchiului","dative-genitive-indefinite-plural":"genunchi","dative-definite-genitive-plural":"genunchilor","singular-vocative":"genunchiule","plural-vocative":"genunchilor","alternative":"genuchi"}},{"word":"Făt-Frumos","pos":"noun","definitions":["a handsome, brave, and noble youth of good character from traditional Romanian fairy-tales, similar to the idea of Prince Charming or the like","an exceptionally handsome young man"],"pronunciation":"/fət.fruˈmos/","forms":{"plural":"Feți-Frumoși"}},{"word":"Țăran","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Țăran"}},{"word":"țăran","pos":"noun","definitions":["peasant, countryman","hick, oaf, hillbilly","an uneducated or brutish person"],"pronunciation":"[t͡səˈran]","forms":{"plural":"țărani","feminine":"equivalent țărancă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"țăran","accusative-definite-nominative-singular":"țăranul","accusative-indefinite-nominative-plural":"țărani","accusative-definite-nominative-plural":"țăranii","dative-genitive-indefinite-singular":"țăran","dative-definite-genitive-singular":"țăranului","dative-genitive-indefinite-plural":"țărani","dative-definite-genitive-plural":"țăranilor","singular-vocative":"țăranule","plural-vocative":"țăranilor"}},{"word":"uite","pos":"verb","definitions":["third-person singular/plural present subjunctive of uita"],"pronunciation":"[ˈuj.te]"},{"word":"uite","pos":"intj","definitions":["look!, see!, behold! (interjection to attract attention)"],"pronunciation":"[ˈuj.te]"},{"word":"Luna","pos":"name","definitions":["a commune of Cluj County, Romania","a village in Luna, Cluj County, Romania","a locality in Negrești-Oaș, Satu Mare County, Romania"],"gender":"f"},{"word":"luna","pos":"noun","definitions":["definite nominative/accusative singular of lună: the moon, the month"],"pronunciation":"/ˈlu.na/"},{"word":"zbura","pos":"verb","definitions":["to fly"],"pronunciation":"/zbuˈra/","forms":{"canonical":"a zbura 1st conjugation","present-singular-third-person":"zboară","participle-past":"zburat","subjunctive-third-person":"zboare","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a zbura","gerund":"zburând","first-person-indicative-present-singular":"zbor","indicative-present-second-person-singular":"zbori","indicative-present-singular-third-person":"zboară","first-person-indicative-plural-present":"zburăm","indicative-plural-present-second-person":"zburați","indicative-plural-present-third-person":"zboară","first-person-imperfect-indicative-singular":"zburam","imperfect-indicative-second-person-singular":"zburai","imperfect-indicative-singular-third-person":"zbura","first-person-imperfect-indicative-plural":"zburam","imperfect-indicative-plural-second-person":"zburați","imperfect-indicative-plural-third-person":"zburau","first-person-indicative-perfect-singular":"zburai","indicative-perfect-second-person-singular":"zburași","indicative-perfect-singular-third-person":"zbură","first-person-indicative-perfect-plural":"zburarăm","indicative-perfect-plural-second-person":"zburarăți","indicative-perfect-plural-third-person":"zburară","first-person-indicative-pluperfect-singular":"zburasem","indicative-pluperfect-second-person-singular":"zburaseși","indicative-pluperfect-singular-third-person":"zburase","first-person-indicative-pluperfect-plural":"zburaserăm","indicative-pluperfect-plural-second-person":"zburaserăți","indicative-pluperfect-plural-third-person":"zburaseră","first-person-present-singular-subjunctive":"să zbor","present-second-person-singular-subjunctive":"să zbori","present-singular-subjunctive-third-person":"să zboare","first-person-plural-present-subjunctive":"să zburăm","plural-present-second-person-subjunctive":"să zburați","plural-present-subjunctive-third-person":"să zboare","imperative-second-person-singular":"zboară","imperative-plural-second-person":"zburați","imperative-negative-second-person-singular":"nu zbura","imperative-negative-plural-second-person":"nu zburați","alternative-dated-rare":"sburà","alternative":"збура"}},{"word":"-e","pos":"suffix","definitions":["-s (feminine/neuter)"],"pronunciation":"/e/","forms":{"alternative":"-le"}},{"word":"-e","pos":"suffix","definitions":["Vocative singular (masculine/neuter)"],"pronunciation":"/e/","examples":[{"ro":"Oh!","en":null}]},{"word":"-e","pos":"suffix","definitions":["A suffix forming infinitives of many verbs."],"pronunciation":"/e/","forms":{"table-tags":"conjugation-3","inflection-template":"ro-conj-e","infinitive":"a -e","gerund":"-ând","participle-past":"s","error-unrecognized-form-indicative-present-singular":"-","indicative-present-second-person-singular":"-i","first-person-indicative-plural-present":"-em","indicative-plural-present-second-person":"-eți","error-unrecognized-form-indicative-plural-present":"-","error-unrecognized-form-imperfect-indicative-singular":"-eam","imperfect-indicative-second-person-singular":"-eai","first-person-imperfect-indicative-plural":"-eam","imperfect-indicative-plural-second-person":"-eați","error-unrecognized-form-imperfect-indicative-plural":"-eau","error-unrecognized-form-indicative-perfect-singular":"sei","indicative-perfect-second-person-singular":"seși","first-person-indicative-perfect-plural":"serăm","indicative-perfect-plural-second-person":"serăți","error-unrecognized-form-indicative-perfect-plural":"seră","error-unrecognized-form-indicative-pluperfect-singular":"sesem","indicative-pluperfect-second-person-singular":"seseși","first-person-indicative-pluperfect-plural":"seserăm","indicative-pluperfect-plural-second-person":"seserăți","error-unrecognized-form-indicative-pluperfect-plural":"seseră","error-unrecognized-form-present-singular-subjunctive":"să -","present-second-person-singular-subjunctive":"să -i","first-person-plural-present-subjunctive":"să -em","plural-present-second-person-subjunctive":"să -eți","error-unrecognized-form-plural-present-subjunctive":"să -ă","imperative-positive-second-person-singular":"-e","imperative-plural-positive-second-person":"-eți","imperative-negative-second-person-singular":"nu -e","imperative-negative-plural-second-person":"nu -eți"}},{"word":"Fața","pos":"name","definitions":["a village in Albac, Alba County, Romania"],"gender":"f"},{"word":"fața","pos":"noun","definitions":["definite nominative/accusative singular of față"],"pronunciation":"[ˈfatsa]","gender":"f"},{"word":"rea","pos":"adj","definitions":["nominative/accusative feminine singular of rău"],"pronunciation":"[re̯a]"},{"word":"Bătrâni","pos":"name","definitions":["a village in Moșoaia, Argeș County, Romania","a commune of Prahova County, Romania","a village in Bătrâni, Prahova County, Romania"],"gender":"m","forms":{"alternative":"Bătrîni"}},{"word":"bătrâni","pos":"adj","definitions":["indefinite masculine plural of bătrân"],"pronunciation":"/bəˈtrɨnʲ/","forms":{"alternative":"bătrîni"}},{"word":"bătrâni","pos":"noun","definitions":["indefinite plural of bătrân"],"pronunciation":"/bəˈtrɨnʲ/","forms":{"alternative":"bătrîni"}},{"word":"leneș","pos":"adj","definitions":["lazy"],"pronunciation":"/ˈle.neʃ/","forms":{"feminine-singular":"leneșă","masculine-plural":"leneși","feminine-neuter-plural":"leneșe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leneș","error-unrecognized-form-feminine-indefinite-singular":"leneșă","error-unrecognized-form-indefinite-masculine-plural":"leneși","error-unrecognized-form-feminine-indefinite-neuter-plural":"leneșe","definite-error-unrecognized-form-masculine-neuter-singular":"leneșul","definite-error-unrecognized-form-feminine-singular":"leneșa","definite-error-unrecognized-form-masculine-plural":"leneșii","definite-error-unrecognized-form-feminine-neuter-plural":"leneșele"}},{"word":"leneș","pos":"noun","definitions":["lazy person","sloth (animal)"],"pronunciation":"/ˈle.neʃ/","forms":{"plural":"leneși","feminine":"equivalent leneșă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leneș","accusative-definite-nominative-singular":"leneșul","accusative-indefinite-nominative-plural":"leneși","accusative-definite-nominative-plural":"leneșii","dative-genitive-indefinite-singular":"leneș","dative-definite-genitive-singular":"leneșului","dative-genitive-indefinite-plural":"leneși","dative-definite-genitive-plural":"leneșilor","singular-vocative":"leneșule","plural-vocative":"leneșilor"}},{"word":"zâmbi","pos":"verb","definitions":["to smile"],"pronunciation":"/zɨmˈbi/","forms":{"canonical":"a zâmbi 4th conjugation","present-singular-third-person":"zâmbește","participle-past":"zâmbit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a zâmbi","gerund":"zâmbind","first-person-indicative-present-singular":"zâmbesc","indicative-present-second-person-singular":"zâmbești","indicative-present-singular-third-person":"zâmbește","first-person-indicative-plural-present":"zâmbim","indicative-plural-present-second-person":"zâmbiți","indicative-plural-present-third-person":"zâmbesc","first-person-imperfect-indicative-singular":"zâmbeam","imperfect-indicative-second-person-singular":"zâmbeai","imperfect-indicative-singular-third-person":"zâmbea","first-person-imperfect-indicative-plural":"zâmbeam","imperfect-indicative-plural-second-person":"zâmbeați","imperfect-indicative-plural-third-person":"zâmbeau","first-person-indicative-perfect-singular":"zâmbii","indicative-perfect-second-person-singular":"zâmbiși","indicative-perfect-singular-third-person":"zâmbi","first-person-indicative-perfect-plural":"zâmbirăm","indicative-perfect-plural-second-person":"zâmbirăți","indicative-perfect-plural-third-person":"zâmbiră","first-person-indicative-pluperfect-singular":"zâmbisem","indicative-pluperfect-second-person-singular":"zâmbiseși","indicative-pluperfect-singular-third-person":"zâmbise","first-person-indicative-pluperfect-plural":"zâmbiserăm","indicative-pluperfect-plural-second-person":"zâmbiserăți","indicative-pluperfect-plural-third-person":"zâmbiseră","first-person-present-singular-subjunctive":"să zâmbesc","present-second-person-singular-subjunctive":"să zâmbești","present-singular-subjunctive-third-person":"să zâmbească","first-person-plural-present-subjunctive":"să zâmbim","plural-present-second-person-subjunctive":"să zâmbiți","plural-present-subjunctive-third-person":"să zâmbească","imperative-second-person-singular":"zâmbește","imperative-plural-second-person":"zâmbiți","imperative-negative-second-person-singular":"nu zâmbi","imperative-negative-plural-second-person":"nu zâmbiți"}},{"word":"zări","pos":"verb","definitions":["to observe","to catch sight of, catch a glimpse of"],"forms":{"canonical":"a zări 4th conjugation","present-singular-third-person":"zărește","participle-past":"zărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a zări","gerund":"zărind","first-person-indicative-present-singular":"zăresc","indicative-present-second-person-singular":"zărești","indicative-present-singular-third-person":"zărește","first-person-indicative-plural-present":"zărim","indicative-plural-present-second-person":"zăriți","indicative-plural-present-third-person":"zăresc","first-person-imperfect-indicative-singular":"zăream","imperfect-indicative-second-person-singular":"zăreai","imperfect-indicative-singular-third-person":"zărea","first-person-imperfect-indicative-plural":"zăream","imperfect-indicative-plural-second-person":"zăreați","imperfect-indicative-plural-third-person":"zăreau","first-person-indicative-perfect-singular":"zării","indicative-perfect-second-person-singular":"zăriși","indicative-perfect-singular-third-person":"zări","first-person-indicative-perfect-plural":"zărirăm","indicative-perfect-plural-second-person":"zărirăți","indicative-perfect-plural-third-person":"zăriră","first-person-indicative-pluperfect-singular":"zărisem","indicative-pluperfect-second-person-singular":"zăriseși","indicative-pluperfect-singular-third-person":"zărise","first-person-indicative-pluperfect-plural":"zăriserăm","indicative-pluperfect-plural-second-person":"zăriserăți","indicative-pluperfect-plural-third-person":"zăriseră","first-person-present-singular-subjunctive":"să zăresc","present-second-person-singular-subjunctive":"să zărești","present-singular-subjunctive-third-person":"să zărească","first-person-plural-present-subjunctive":"să zărim","plural-present-second-person-subjunctive":"să zăriți","plural-present-subjunctive-third-person":"să zărească","imperative-second-person-singular":"zărește","imperative-plural-second-person":"zăriți","imperative-negative-second-person-singular":"nu zări","imperative-negative-plural-second-person":"nu zăriți"}},{"word":"taran","pos":"noun","definitions":["common roach (Rutilus rutilus)"],"forms":{"plural":"taranuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"taran","accusative-definite-nominative-singular":"taranul","accusative-indefinite-nominative-plural":"taranuri","accusative-definite-nominative-plural":"taranurile","dative-genitive-indefinite-singular":"taran","dative-definite-genitive-singular":"taranului","dative-genitive-indefinite-plural":"taranuri","dative-definite-genitive-plural":"taranurilor","singular-vocative":"taranule","plural-vocative":"taranurilor"}},{"word":"rupe","pos":"verb","definitions":["to tear","to tear off","to rend","to break","synonym of o rupe (“to have a basic, poor knowledge of a language”)"],"examples":[{"ro":"Mi-am rupt rochia din greșeală.","en":"I tore my dress by mistake."},{"ro":"Nu uita să rupi eticheta.","en":"Don't forget to tear off the label."},{"ro":"El și-a rupt două coaste în acel accident.","en":"He broke two ribs in that accident."}],"forms":{"canonical":"a rupe 3rd conjugation","present-singular-third-person":"rupe","participle-past":"rupt","subjunctive-third-person":"rupă","table-tags":"conjugation-3","inflection-template":"ro-conj-e-pt","infinitive":"a rupe","gerund":"rupând","first-person-indicative-present-singular":"rup","indicative-present-second-person-singular":"rupi","indicative-present-singular-third-person":"rupe","first-person-indicative-plural-present":"rupem","indicative-plural-present-second-person":"rupeți","indicative-plural-present-third-person":"rup","first-person-imperfect-indicative-singular":"rupeam","imperfect-indicative-second-person-singular":"rupeai","imperfect-indicative-singular-third-person":"rupea","first-person-imperfect-indicative-plural":"rupeam","imperfect-indicative-plural-second-person":"rupeați","imperfect-indicative-plural-third-person":"rupeau","first-person-indicative-perfect-singular":"rupsei","indicative-perfect-second-person-singular":"rupseși","indicative-perfect-singular-third-person":"rupse","first-person-indicative-perfect-plural":"rupserăm","indicative-perfect-plural-second-person":"rupserăți","indicative-perfect-plural-third-person":"rupseră","first-person-indicative-pluperfect-singular":"rupsesem","indicative-pluperfect-second-person-singular":"rupseseși","indicative-pluperfect-singular-third-person":"rupsese","first-person-indicative-pluperfect-plural":"rupseserăm","indicative-pluperfect-plural-second-person":"rupseserăți","indicative-pluperfect-plural-third-person":"rupseseră","first-person-present-singular-subjunctive":"să rup","present-second-person-singular-subjunctive":"să rupi","present-singular-subjunctive-third-person":"să rupă","first-person-plural-present-subjunctive":"să rupem","plural-present-second-person-subjunctive":"să rupeți","plural-present-subjunctive-third-person":"să rupă","imperative-second-person-singular":"rupe","imperative-plural-second-person":"rupeți","imperative-negative-second-person-singular":"nu rupe","imperative-negative-plural-second-person":"nu rupeți","alternative-dated-regional":"rumpe"}},{"word":"boteza","pos":"verb","definitions":["to baptize","to sprinkle holy water on believers or their houses","to godfather / godmother at somebody's baptism"],"pronunciation":"[bo.teˈza]","forms":{"canonical":"a boteza 1st conjugation","present-singular-third-person":"botează","participle-past":"botezat","subjunctive-third-person":"boteze","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a boteza","gerund":"botezând","first-person-indicative-present-singular":"botez","indicative-present-second-person-singular":"botezi","indicative-present-singular-third-person":"botează","first-person-indicative-plural-present":"botezăm","indicative-plural-present-second-person":"botezați","indicative-plural-present-third-person":"botează","first-person-imperfect-indicative-singular":"botezam","imperfect-indicative-second-person-singular":"botezai","imperfect-indicative-singular-third-person":"boteza","first-person-imperfect-indicative-plural":"botezam","imperfect-indicative-plural-second-person":"botezați","imperfect-indicative-plural-third-person":"botezau","first-person-indicative-perfect-singular":"botezai","indicative-perfect-second-person-singular":"botezași","indicative-perfect-singular-third-person":"boteză","first-person-indicative-perfect-plural":"botezarăm","indicative-perfect-plural-second-person":"botezarăți","indicative-perfect-plural-third-person":"botezară","first-person-indicative-pluperfect-singular":"botezasem","indicative-pluperfect-second-person-singular":"botezaseși","indicative-pluperfect-singular-third-person":"botezase","first-person-indicative-pluperfect-plural":"botezaserăm","indicative-pluperfect-plural-second-person":"botezaserăți","indicative-pluperfect-plural-third-person":"botezaseră","first-person-present-singular-subjunctive":"să botez","present-second-person-singular-subjunctive":"să botezi","present-singular-subjunctive-third-person":"să boteze","first-person-plural-present-subjunctive":"să botezăm","plural-present-second-person-subjunctive":"să botezați","plural-present-subjunctive-third-person":"să boteze","imperative-second-person-singular":"botează","imperative-plural-second-person":"botezați","imperative-negative-second-person-singular":"nu boteza","imperative-negative-plural-second-person":"nu botezați"}},{"word":"vro","pos":"det","definitions":["feminine singular of vrun"],"pronunciation":"/vro/"},{"word":"veselie","pos":"noun","definitions":["joy (feeling of happiness)"],"forms":{"plural":"veselii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"veselie","accusative-definite-nominative-singular":"veselia","accusative-indefinite-nominative-plural":"veselii","accusative-definite-nominative-plural":"veseliile","dative-genitive-indefinite-singular":"veselii","dative-definite-genitive-singular":"veseliei","dative-genitive-indefinite-plural":"veselii","dative-definite-genitive-plural":"veseliilor","singular-vocative":"veselie","plural-vocative":"veseliilor"}},{"word":"făcură","pos":"verb","definitions":["third-person plural simple perfect indicative of face"],"pronunciation":"[fəˈkurə]"},{"word":"vreo","pos":"det","definitions":["nominative/accusative feminine of vreun"],"pronunciation":"/vre̯o/"},{"word":"Limba","pos":"name","definitions":["a village in Ciugud, Alba County, Romania"],"gender":"f"},{"word":"limba","pos":"noun","definitions":["definite nominative/accusative singular of limbă"],"pronunciation":"/ˈlim.ba/","gender":"f","forms":{"alternative":"лимба"}},{"word":"gândea","pos":"verb","definitions":["third-person singular imperfect indicative of gândi"],"pronunciation":"[ɡɨnˈde̯a]"},{"word":"banii","pos":"noun","definitions":["definite nominative/accusative plural of ban"]},{"word":"niște","pos":"article","definitions":["some","any"],"pronunciation":"/ˈniʃ.te/","examples":[{"ro":"ei sunt niște bărbați","en":"they are some men"},{"ro":"ai niște mere?","en":"do you have any apples?"}],"forms":{"alternative":"ниште"}},{"word":"vinde","pos":"verb","definitions":["to sell"],"forms":{"canonical":"a vinde 3rd conjugation","present-singular-third-person":"vinde","participle-past":"vândut","subjunctive-third-person":"vândă","table-tags":"conjugation-3","inflection-template":"ro-conj-2\n","infinitive":"a vinde","gerund":"vânzând","first-person-indicative-present-singular":"vând","indicative-present-second-person-singular":"vinzi","indicative-present-singular-third-person":"vinde","first-person-indicative-plural-present":"vindem","indicative-plural-present-second-person":"vindeți","indicative-plural-present-third-person":"vând","first-person-imperfect-indicative-singular":"vindeam","imperfect-indicative-second-person-singular":"vindeai","imperfect-indicative-singular-third-person":"vindea","first-person-imperfect-indicative-plural":"vindeam","imperfect-indicative-plural-second-person":"vindeați","imperfect-indicative-plural-third-person":"vindeau","first-person-indicative-perfect-singular":"vândui","indicative-perfect-second-person-singular":"vânduși","indicative-perfect-singular-third-person":"vându","first-person-indicative-perfect-plural":"vândurăm","indicative-perfect-plural-second-person":"vândurăți","indicative-perfect-plural-third-person":"vândură","first-person-indicative-pluperfect-singular":"vândusem","indicative-pluperfect-second-person-singular":"vânduseși","indicative-pluperfect-singular-third-person":"vânduse","first-person-indicative-pluperfect-plural":"vânduserăm","indicative-pluperfect-plural-second-person":"vânduserăți","indicative-pluperfect-plural-third-person":"vânduseră","first-person-present-singular-subjunctive":"să vând","present-second-person-singular-subjunctive":"să vinzi","present-singular-subjunctive-third-person":"să vândă","first-person-plural-present-subjunctive":"să vindem","plural-present-second-person-subjunctive":"să vindeți","plural-present-subjunctive-third-person":"să vândă","imperative-second-person-singular":"vinde","imperative-plural-second-person":"vindeți","imperative-negative-second-person-singular":"nu vinde","imperative-negative-plural-second-person":"nu vindeți"}},{"word":"locui","pos":"verb","definitions":["to reside, to dwell"],"pronunciation":"[lokuˈi]","forms":{"canonical":"a locui 4th conjugation","present-singular-third-person":"locuiește","participle-past":"locuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a locui","gerund":"locuind","first-person-indicative-present-singular":"locuiesc","indicative-present-second-person-singular":"locuiești","indicative-present-singular-third-person":"locuiește","first-person-indicative-plural-present":"locuim","indicative-plural-present-second-person":"locuiți","indicative-plural-present-third-person":"locuiesc","first-person-imperfect-indicative-singular":"locuiam","imperfect-indicative-second-person-singular":"locuiai","imperfect-indicative-singular-third-person":"locuia","first-person-imperfect-indicative-plural":"locuiam","imperfect-indicative-plural-second-person":"locuiați","imperfect-indicative-plural-third-person":"locuiau","first-person-indicative-perfect-singular":"locuii","indicative-perfect-second-person-singular":"locuiși","indicative-perfect-singular-third-person":"locui","first-person-indicative-perfect-plural":"locuirăm","indicative-perfect-plural-second-person":"locuirăți","indicative-perfect-plural-third-person":"locuiră","first-person-indicative-pluperfect-singular":"locuisem","indicative-pluperfect-second-person-singular":"locuiseși","indicative-pluperfect-singular-third-person":"locuise","first-person-indicative-pluperfect-plural":"locuiserăm","indicative-pluperfect-plural-second-person":"locuiserăți","indicative-pluperfect-plural-third-person":"locuiseră","first-person-present-singular-subjunctive":"să locuiesc","present-second-person-singular-subjunctive":"să locuiești","present-singular-subjunctive-third-person":"să locuiască","first-person-plural-present-subjunctive":"să locuim","plural-present-second-person-subjunctive":"să locuiți","plural-present-subjunctive-third-person":"să locuiască","imperative-second-person-singular":"locuiește","imperative-plural-second-person":"locuiți","imperative-negative-second-person-singular":"nu locui","imperative-negative-plural-second-person":"nu locuiți"}},{"word":"țară","pos":"noun","definitions":["country","land"],"pronunciation":"[ˈtsarə]","forms":{"plural":"țări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"țară","accusative-definite-nominative-singular":"țara","accusative-indefinite-nominative-plural":"țări","accusative-definite-nominative-plural":"țările","dative-genitive-indefinite-singular":"țări","dative-definite-genitive-singular":"țării","dative-genitive-indefinite-plural":"țări","dative-definite-genitive-plural":"țărilor","singular-vocative":"țaro","plural-vocative":"țărilor","alternative-archaic":"țeară"}},{"word":"viața","pos":"noun","definitions":["definite nominative/accusative singular of viață"],"pronunciation":"/ˈvja.t͡sa/","gender":"f"},{"word":"Bucată","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bucată"}},{"word":"bucată","pos":"noun","definitions":["piece, bit, fragment, morsel","(type) of food"],"pronunciation":"/buˈka.tə/","forms":{"plural":"bucăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bucată","accusative-definite-nominative-singular":"bucata","accusative-indefinite-nominative-plural":"bucăți","accusative-definite-nominative-plural":"bucățile","dative-genitive-indefinite-singular":"bucăți","dative-definite-genitive-singular":"bucății","dative-genitive-indefinite-plural":"bucăți","dative-definite-genitive-plural":"bucăților","singular-vocative":"bucată","plural-vocative":"bucăților"}},{"word":"Târziu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Târziu"}},{"word":"târziu","pos":"adj","definitions":["late"],"pronunciation":"/tɨrˈziw/","forms":{"feminine-singular":"târzie","plural":"târzii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"târziu","error-unrecognized-form-feminine-indefinite-singular":"târzie","error-unrecognized-form-indefinite-masculine-plural":"târzii","error-unrecognized-form-feminine-indefinite-neuter-plural":"târzii","definite-error-unrecognized-form-masculine-neuter-singular":"târziul","definite-error-unrecognized-form-feminine-singular":"târzia","definite-error-unrecognized-form-masculine-plural":"târziii","definite-error-unrecognized-form-feminine-neuter-plural":"târziile","alternative-obsolete":"târd̦iŭ","alternative-proscribed":"tîrziu"}},{"word":"târziu","pos":"adv","definitions":["late"],"pronunciation":"/tɨrˈziw/","examples":[{"ro":"Voi ați plecat cam târziu.","en":"You left rather late."}],"forms":{"alternative-obsolete":"târd̦iŭ","alternative-proscribed":"tîrziu"}},{"word":"bea","pos":"verb","definitions":["to drink"],"pronunciation":"/be̯a/","forms":{"canonical":"a bea 2nd conjugation","present-singular-third-person":"bea","participle-past":"băut","subjunctive-third-person":"bea","regional-subjunctive-third-person":"beie","table-tags":"conjugation-2","inflection-template":"ro-conj-2","infinitive":"a bea","gerund":"bând","first-person-indicative-present-singular":"beau","indicative-present-second-person-singular":"bei","indicative-present-singular-third-person":"bea","first-person-indicative-plural-present":"bem","indicative-plural-present-second-person":"beți","indicative-plural-present-third-person":"beau","first-person-imperfect-indicative-singular":"beam","imperfect-indicative-second-person-singular":"beai","imperfect-indicative-singular-third-person":"bea","first-person-imperfect-indicative-plural":"beam","imperfect-indicative-plural-second-person":"beați","imperfect-indicative-plural-third-person":"beau","first-person-indicative-perfect-singular":"băui","indicative-perfect-second-person-singular":"băuși","indicative-perfect-singular-third-person":"bău","first-person-indicative-perfect-plural":"băurăm","indicative-perfect-plural-second-person":"băurăți","indicative-perfect-plural-third-person":"băură","first-person-indicative-pluperfect-singular":"băusem","indicative-pluperfect-second-person-singular":"băuseși","indicative-pluperfect-singular-third-person":"băuse","first-person-indicative-pluperfect-plural":"băuserăm","indicative-pluperfect-plural-second-person":"băuserăți","indicative-pluperfect-plural-third-person":"băuseră","first-person-present-singular-subjunctive":"să beau","present-second-person-singular-subjunctive":"să bei","present-singular-subjunctive-third-person":"să bea","first-person-plural-present-subjunctive":"să bem","plural-present-second-person-subjunctive":"să beți","plural-present-subjunctive-third-person":"să bea","imperative-second-person-singular":"bea","imperative-plural-second-person":"beți","imperative-negative-second-person-singular":"nu bea","imperative-negative-plural-second-person":"nu beți"}},{"word":"bune","pos":"adj","definitions":["nominative/accusative feminine/neuter plural of bun"],"pronunciation":"[ˈbu.ne]"},{"word":"rând","pos":"noun","definitions":["row","line (of text)","line, queue","ranks","occasion, time"],"pronunciation":"/rɨnd/","examples":[{"ro":"Piatra ce nu în rândŭ feaceră ziditorii, aceaia fu în capulŭ unghiului.","en":"The stone which the builders rejected, the same is become the head of the corner. (Psalms 118:22)"},{"ro":"Citeam pe-o carte veche,\nCu mii de negre gânduri\nȘi literile-n rânduri\nPrinsese a juca.","en":"I was reading an old book,\nWith thousands of black thoughts\nAnd the letters of the lines\nHad begun to jiggle."},{"ro":"Pentru că am primit câteva sute de mesaje și nu pot răspunde fiecăruia în parte am decis să scriu câteva rânduri pentru toți oamenii care mă apreciază.","en":"As I've received a few hundred messaged and I cannot answer each one I've decided to write a few lines to all the people who appreciate me."}],"forms":{"plural":"rânduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"rând","accusative-definite-nominative-singular":"rândul","accusative-indefinite-nominative-plural":"rânduri","accusative-definite-nominative-plural":"rândurile","dative-genitive-indefinite-singular":"rând","dative-definite-genitive-singular":"rândului","dative-genitive-indefinite-plural":"rânduri","dative-definite-genitive-plural":"rândurilor","singular-vocative":"rândule","plural-vocative":"rândurilor"}},{"word":"Frunză","pos":"name","definitions":["a town in Ocnița Raion, Moldova","a surname"],"pronunciation":"/ˈfrun.zə/","gender":"m","forms":{"alternative":"Фрунзэ"}},{"word":"frunză","pos":"noun","definitions":["leaf"],"pronunciation":"/ˈfrun.zə/","forms":{"plural":"frunze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frunză","accusative-definite-nominative-singular":"frunza","accusative-indefinite-nominative-plural":"frunze","accusative-definite-nominative-plural":"frunzele","dative-genitive-indefinite-singular":"frunze","dative-definite-genitive-singular":"frunzei","dative-genitive-indefinite-plural":"frunze","dative-definite-genitive-plural":"frunzelor","singular-vocative":"frunză","plural-vocative":"frunzelor","alternative-obsolete":"frund̦ă","alternative":"фрунзэ"}},{"word":"haine","pos":"noun","definitions":["plural of haină"]}],"forms":{"babele":"babă","badea":"bade","baieti":["băieți","băiat","băieți","băiet"],"baietii":["băieții","băiat","băieții","băiet"],"balauri":"balaur","balaurul":"balaur","balaurului":"balaur","batand":"bate","batea":"bate","bateau":"bate","bati":["bâți","bât","bați","bate"],"batrane":["bătrâne","bătrân","bătrâne","bătrână"],"batranii":"bătrân","batranul":"bătrân","batranului":"bătrân","batu":"bate","batuse":"bate","batut":"bate","batuti":"bătut","baura":"bea","baut":"bea","biata":["biată","biet","biata","biet"],"bietii":"biet","bietul":"biet","bisericile":"biserică","bogati":"bogat","bogatii":["bogații","bogat","bogății","bogăție"],"boieresti":["boierești","boieresc","boierești","boieri"],"boierii":["boierii","boier","boierii","boieri","boierii","boierie"],"boierul":"boier","boierului":"boier","boii":["boii","boi","boii","bou"],"boiul":"boi","boteaza":"boteza","botezara":"boteza","botezau":"boteza","boteze":"boteza","braiele":"brâu","braul":"brâu","bucati":"bucată","bucuram":["bucurăm","bucura","bucuram","bucura"],"bucurara":"bucura","bucurau":"bucura","bucurii":"bucurie","bucuriile":"bucurie","budulea":"buduli","bunicii":["bunicii","bunic","bunicii","bunică"],"bunicilor":["bunicilor","bunic","bunicilor","bunică"],"bunicul":"bunic","bunicului":"bunic","bunul":"bun","bunurile":"bun","dau":"zău","esti":"fi","fa":"face","faca":"face","facea":"face","faceau":"face","faceti":"face","facut":"face","facuta":["făcută","făcut","făcuta","făcut"],"facute":"făcut","facutul":"făcut","feciorii":["feciorii","fecior","feciorii","feciori","feciorii","feciorie"],"feciorilor":"fecior","feciorul":"fecior","feciorului":"fecior","ferestrele":"fereastră","feti-frumosi":"Făt-Frumos","fiecarui":"fiecare","fiecaruia":"fiecare","fiti":"fi","flacaii":"flăcău","flacaul":"flăcău","flacaule":"flăcău","flacaului":"flăcău","florile":"floare","fostul":"fost","fostului":"fost","frati":"frate","fratii":["frații","frate","frății","frăție"],"fratilor":"frate","frumosi":"frumos","fruntea":"frunte","fruntii":"frunte","frunzele":"frunză","frunzelor":"frunză","fugea":"fugi","fugeau":"fugi","fugind":"fugi","fugise":"fugi","fugisera":"fugi","fundul":"fund","fusele":"fus","fusul":"fus","gandea":"gândi","gandeste":"gândi","gandesti":"gândi","gandim":"gândi","gandul":"gând","gandurile":"gând","gaseste":"găsi","gasesti":"găsi","gasit":"găsi","gasiti":"găsi","gatea":"găti","gatesc":"găti","gatesti":"găti","gatira":"găti","gatiti":["gătiți","găti","gătiți","gătit"],"gatul":["gatul","gat","gâtul","gât"],"gaturile":["gaturile","gat","gâturile","gât"],"genunchii":["genunchii","genunche","genunchii","genunchi"],"goala":["goală","gol","goala","gol"],"goale":"gol","goi":"gol","graiesc":"grăi","graieste":"grăi","graind":"grăi","groasa":["groasă","gros","groasa","gros"],"groase":"gros","grosi":["groși","gros","groși","groș"],"grozava":"grozav","grozave":"grozav","grozavi":"grozav","harnica":["harnică","harnic","harnica","harnic"],"harnice":"harnic","hi":"fi","hotarai":["hotărai","hotărî","hotărâi","hotărî"],"hotarara":"hotărî","hotarasc":"hotărî","hotarat":"hotărî","hotarati":["hotărâți","hotărât","hotărâți","hotărî","hotărați","hotărî"],"hotarau":"hotărî","i":"vârtejire","ia":"lua","iau":"lua","iei":"lua","ieie":"lua","ii":["îi","ea","îi","ei","îi","el","ii","vârtejire"],"il":"el","imbla":"umbla","imi":"eu","isi":["își","ea","își","ei","își","el","își","ele"],"iti":"tu","joace":["joace","joacă","joace","juca"],"jucam":["jucăm","juca","jucam","juca"],"jucau":"juca","lacrimile":"lacrimă","lasa":["lașă","laș","lașa","laș"],"lasam":["lăsăm","lăsa","lăsam","lăsa"],"lasand":"lăsa","lasara":"lăsa","lasase":"lăsa","lasat":"lăsa","lasata":["lăsata","lăsat","lăsată","lăsat"],"lasate":"lăsat","lasati":["lăsați","lăsa","lăsați","lăsat"],"lasau":"lăsa","lasi":["lași","laș","lași","lăsa"],"leaga":"lega","legasera":"lega","legati":["legați","lega","legați","legat"],"legau":"lega","lemne":"lemn","lemnul":"lemn","lenesa":["leneșă","leneș","leneșa","leneș"],"lenese":["leneșe","leneș","leneșe","leneșă"],"lenesul":"leneș","lenesule":"leneș","lenesului":"leneș","locuia":"locui","locuiau":"locui","locuiesc":"locui","locuieste":"locui","locuiesti":"locui","luara":"lua","luase":"lua","luasera":"lua","luate":"luat","luminam":["luminăm","lumina","luminam","lumina"],"luminase":"lumina","lungile":"lung","lungul":"lung","luptam":["luptăm","lupta","luptam","lupta"],"luptara":"lupta","luptat":"lupta","luptei":"luptă","ma":"eu","mea":"eu","mei":"eu","mele":"eu","meu":"eu","mie":"eu","mine":"eu","nasca":"naște","nascu":"naște","nascuse":"naște","nascut":"naște","nastea":"naște","nasteati":"naște","negustorul":"negustor","negutator":"negustor","nevestei":"nevastă","nevestele":["nevestele","nevastă","nevestele","nevestea"],"nevoia":["nevoia","nevoi","nevoia","nevoie"],"nevoile":"nevoie","nimanui":"nimeni","nimenea":"nimeni","niste":"un","noastra":["noastră","noi","noastră","nostru"],"nopti":"noapte","noptii":"noapte","noptile":"noapte","nostri":["noștri","noi","noștri","nostru"],"opreste":"opri","ouale":"ou","oul":"ou","rada":["radă","rade","râdă","râde","rad̦ă","rază"],"radea":["rădea","rade","râdea","râde"],"radeau":["rădeau","rade","râdeau","râde"],"radica":["rădica","ridica","râdica","ridica"],"ramai":["ramai","rama","râmai","râma","rămâi","rămâne","rămâi","rămânea"],"raman":["rămân","rămâne","rămân","rămânea"],"ramana":["rămână","rămâne","rămână","rămânea"],"ramanand":["rămânând","rămâne","rămânând","rămânea"],"ramaneai":["rămâneai","rămâne","rămâneai","rămânea"],"ramanem":["rămânem","rămâne","rămânem","rămânea"],"ramaneti":["rămâneți","rămâne","rămâneți","rămânea"],"ramas":["rămas","rămâne","rămas","rămânea"],"ramasa":"rămas","ramase":["ramase","rama","râmase","râma","rămase","rămâne","rămase","rămânea","rămase","rămas"],"ramasera":["ramaseră","rama","râmaseră","râma","rămaseră","rămâne","rămaseră","rămânea"],"ramasese":["rămăsese","rămâne","rămăsese","rămânea"],"ramasesera":["rămăseseră","rămâne","rămăseseră","rămânea"],"ramasi":["ramași","rama","râmași","râma","rămași","rămas"],"randul":"rând","rasei":["răsei","rade","râsei","râde","răsei","rage"],"rasera":["raseră","rade","râseră","râde","raseră","rage"],"rasese":["răsese","rade","râsese","râde","răsese","rage"],"raspund":"răspunde","raspunda":"răspunde","raspundea":"răspunde","raspundeti":"răspunde","raspuns":"răspunde","raspunse":["răspunse","răspunde","răspunse","răspuns"],"raspunsera":"răspunde","raspunzand":"răspunde","raspunzi":"răspunde","rasul":["rasul","ras","râsul","râs"],"reci":"rece","relele":"rău","ridicam":["ridicăm","ridica","ridicam","ridica"],"ridicand":"ridica","ridicau":"ridica","roadele":["roadele","roadă","roadele","rod"],"roadelor":["roadelor","roadă","roadelor","rod"],"rodul":"rod","rupa":"rupe","rupse":"rupe","rupsei":"rupe","rupsera":"rupe","s":"-e","sa":["sa","ea","sa","el"],"sai":["săi","ea","săi","el"],"sale":["sale","ea","sale","el"],"sau":["său","ea","său","el"],"se":["se","ea","se","ei","se","el","se","ele"],"sera":"-e","sine":["sine","ea","sine","ei","sine","el","sine","ele"],"sunt":"fi","suntem":"fi","sunteti":"fi","tanara":["tânără","tânăr","tânăra","tânăr"],"tanarul":"tânăr","tanarului":"tânăr","tarani":"țăran","taranii":["țăranii","țăran","țărănii","țărănie"],"taranul":["taranul","taran","țăranul","țăran"],"tarii":["țarii","țar","țării","țară","tarii","tare","tării","tărie"],"tarile":["țările","țară","tarile","tare"],"taro":"țară","tata":"tăt","tatal":"tată","tate":["tăte","tăt","țațe","țață","țâțe","țâță"],"tau":"tu","tie":"tu","tii":["ții","ține","ții","ținea"],"tin":["țin","ține","țin","ținea"],"tinea":"ține","tineam":["țineam","ține","țineam","ținea"],"tineau":["țineau","ține","țineau","ținea"],"tinere":["tinere","tânăr","tinere","tânără","tinere","tiner"],"tinerii":["tinerii","tânăr","tinerii","tiner","ținerii","ținere","tinerii","tinerie","tinerii","tineriu"],"tinerilor":["tinerilor","tânăr","ținerilor","ținere"],"tineti":["țineți","ține","țineți","ținea"],"tinu":["ținu","ține","ținu","ținea"],"tinura":["ținură","ține","ținură","ținea"],"tinut":["ținut","ține","ținut","ținea"],"toarcem":"toarce","toata":"tot","torcea":"toarce","tors":"toarce","toti":"tot","traga":["tragă","targă","tragă","trage"],"tragea":"trage","trageau":"trage","trageti":"trage","traia":"trăi","traiau":"trăi","traiesc":"trăi","traiesti":"trăi","traim":"trăi","traira":"trăi","trait":"trăi","traiti":"trăi","trasera":"trage","treaca":"trece","trebuiau":"trebui","trebuiesc":"trebui","trebuira":"trebui","trecand":"trece","trecea":"trece","treceau":"trece","treci":"trece","trecura":"trece","trecuse":"trece","trecusera":"trece","trecuta":["trecută","trecut","trecuta","trecut"],"trecutul":"trecut","trezea":"trezi","trezesc":"trezi","trezeste":"trezi","trezim":"trezi","trezira":"trezi","trezise":"trezi","trimisese":"trimite","trimisesem":"trimite","trimit":"trimite","trimita":"trimite","trimitea":"trimite","trimiteti":"trimite","trimiti":"trimite","uitai":"uita","uitam":["uităm","uita","uitam","uita"],"uitase":"uita","uitau":"uita","uiti":["uiți","ui","uiți","uita"],"umbland":"umbla","umblara":"umbla","umblase":"umbla","umblasera":"umbla","umblati":["umblați","umbla","umblați","umblat"],"umblau":"umbla","umbli":"umbla","unchiasul":"unchiaș","unchiasului":"unchiaș","urata":["urâtă","urât","urâta","urât"],"uratul":["uratul","urat","urâtul","urât"],"urechi":"ureche","urechile":"ureche","urechilor":"ureche","urmeaza":"urma","urmele":"urmă","urmezi":"urma","uscata":["uscată","uscat","uscata","uscat"],"uscate":"uscat","uscati":["uscați","usca","uscați","uscat"],"vanda":"vinde","vantul":"vânt","vanturilor":"vânt","vazu":"vedea","vazui":"vedea","vazura":"vedea","vazuse":"vedea","vazusem":"vedea","vazusera":"vedea","vazut":"vedea","vecine":["vecine","vecin","vecine","vecină"],"vecinele":["vecinele","vecin","vecinele","vecină","vecinele","vecinică"],"vecinii":["vecinii","vecin","vecinii","vecinie"],"vecinilor":"vecin","vecinul":"vecin","vecinului":"vecin","vedeai":"vedea","vedeam":"vedea","vedeau":"vedea","vedeti":"vedea","venea":"veni","veneau":"veni","venira":"veni","veniti":"veni","verzi":"verde","veselia":"veselie","vestea":["vestea","veste","vestea","vesti","veștea","vești"],"veti":"voi","vietii":"viață","vietile":"viață","vietilor":"viață","vindea":"vinde","vindeau":"vinde","vinzi":"vinde","voastra":["voastră","voi","voastră","vostru"],"voiai":"voi","voiam":"voi","voiau":"voi","voiesc":"voi","voieste":"voi","voind":"voi","voinice":"voinic","voinici":"voinic","voinicii":["voinicii","voinic","voinicii","voinicie"],"voinicul":"voinic","voira":"voi","voiti":["voiți","voi","voiți","voit"],"vrand":"vrea","vreti":"vrea","vrura":"vrea","vrute":"vrut","vulpea":"vulpe","vulpile":"vulpe","zambea":"zâmbi","zambind":"zâmbi","zambit":"zâmbi","zareau":"zări","zaresc":"zări","zareste":"zări","zboara":"zbura","zburand":"zbura","zicand":"zice","zicea":"zice","ziceam":"zice","ziceau":"zice","zicem":"zice","ziceti":"zice","zisa":["zisă","zis","zisa","zis"],"zisele":"zis","zisera":"zice","zisese":"zice","zmeii":"zmeu","zmeilor":"zmeu","zmeul":"zmeu","zmeului":"zmeu"}};
@@ -1,182 +1,272 @@
 /**
  * Romanian Dictionary Index
- * Generated from Kaikki.org (Wiktionary) data
- * Total words: 129330
+ * Generated from Kaikki.org (Wiktionary) data by scripts/build_dictionary.py
+ * Total words: 55013
+ * Shards: 124 (largest: 256.0KB)
+ *
+ * Shards are grouped by first letter ('#' for anything else) and each
+ * covers a contiguous range of folded keys (lowercase, no diacritics).
+ * The most frequent corpus words live in hot.js, which is bundled with
+ * this index and checked before any cold shard is loaded.
  */
 
+import HOT from './hot.js';
+
 const INDEX = {
-  "c": {
-    "file": "c.json",
-    "count": 15101,
-    "size": 7918361
-  },
-  "g": {
-    "file": "g.json",
-    "count": 4384,
-    "size": 2045743
-  },
-  "p": {
-    "file": "p.json",
-    "count": 12982,
-    "size": 7465921
-  },
-  "a": {
-    "file": "a.json",
-    "count": 9984,
-    "size": 5294340
-  },
-  "j": {
-    "file": "j.json",
-    "count": 925,
-    "size": 480777
-  },
-  "m": {
-    "file": "m.json",
-    "count": 8266,
-    "size": 4303017
-  },
-  "d": {
-    "file": "d.json",
-    "count": 7680,
-    "size": 5064422
-  },
-  "v": {
-    "file": "v.json",
-    "count": 4391,
-    "size": 1876580
-  },
-  "s": {
-    "file": "s.json",
-    "count": 12944,
-    "size": 7090348
-  },
-  "f": {
-    "file": "f.json",
-    "count": 4847,
-    "size": 2568762
-  },
-  "n": {
-    "file": "n.json",
-    "count": 3890,
-    "size": 2168258
-  },
-  "r": {
-    "file": "r.json",
-    "count": 5610,
-    "size": 3771299
-  },
-  "y": {
-    "file": "y.json",
-    "count": 32,
-    "size": 12549
-  },
-  "t": {
-    "file": "t.json",
-    "count": 6375,
-    "size": 3438856
-  },
-  "i": {
-    "file": "i.json",
-    "count": 7360,
-    "size": 5103465
-  },
-  "o": {
-    "file": "o.json",
-    "count": 3233,
-    "size": 1786340
-  },
-  "z": {
-    "file": "z.json",
-    "count": 1509,
-    "size": 875756
-  },
-  "b": {
-    "file": "b.json",
-    "count": 6912,
-    "size": 3152046
-  },
-  "e": {
-    "file": "e.json",
-    "count": 3751,
-    "size": 2460343
-  },
-  "l": {
-    "file": "l.json",
-    "count": 3997,
-    "size": 2001047
-  },
-  "u": {
-    "file": "u.json",
-    "count": 1563,
-    "size": 810397
-  },
-  "q": {
-    "file": "q.json",
-    "count": 22,
-    "size": 10935
-  },
-  "k": {
-    "file": "k.json",
-    "count": 158,
-    "size": 80170
-  },
-  "w": {
-    "file": "w.json",
-    "count": 47,
-    "size": 20665
-  },
-  "x": {
-    "file": "x.json",
-    "count": 137,
-    "size": 83255
-  },
-  "h": {
-    "file": "h.json",
-    "count": 2862,
-    "size": 1551566
-  },
-  "#": {
-    "file": "#.json",
-    "count": 368,
-    "size": 147547
-  }
+  "#": [
+    {"shard": "other", "from": "-a", "to": "ꙟ", "count": 368, "size": 155666},
+  ],
+  "b": [
+    {"shard": "b", "from": "b", "to": "baladier", "count": 615, "size": 261725},
+    {"shard": "baladin", "from": "baladin", "to": "banucu", "count": 571, "size": 260998},
+    {"shard": "banui", "from": "banui", "to": "bastinas", "count": 598, "size": 262122},
+    {"shard": "bastinasa", "from": "bastinasa", "to": "bellu", "count": 529, "size": 261473},
+    {"shard": "beln", "from": "belnita", "to": "biciutca", "count": 548, "size": 262085},
+    {"shard": "bicl", "from": "bicla", "to": "birgauan", "count": 459, "size": 262104},
+    {"shard": "birgauanu", "from": "birgauanu", "to": "blonzi", "count": 511, "size": 262079},
+    {"shard": "blonziu", "from": "blonziu", "to": "bombaitura", "count": 606, "size": 261718},
+    {"shard": "bomban", "from": "bombaneala", "to": "br", "count": 616, "size": 262119},
+    {"shard": "bra", "from": "brabeti", "to": "brontofobie", "count": 606, "size": 261648},
+    {"shard": "brontoz", "from": "brontozaur", "to": "bujorica", "count": 554, "size": 262097},
+    {"shard": "bujoril", "from": "bujorilor", "to": "butnaresti", "count": 560, "size": 261735},
+    {"shard": "butnari", "from": "butnari", "to": "bz", "count": 139, "size": 58070},
+  ],
+  "e": [
+    {"shard": "e", "from": "e", "to": "efemerizare", "count": 435, "size": 260888},
+    {"shard": "efemi", "from": "efemina", "to": "electrosecuritate", "count": 404, "size": 261688},
+    {"shard": "electroso", "from": "electrosoc", "to": "empireu", "count": 387, "size": 261919},
+    {"shard": "empireum", "from": "empireumatic", "to": "epexegetic", "count": 434, "size": 262102},
+    {"shard": "epexegez", "from": "epexegeza", "to": "eroda", "count": 425, "size": 262082},
+    {"shard": "erodar", "from": "erodare", "to": "etatizare", "count": 390, "size": 261444},
+    {"shard": "etatizat", "from": "etatizat", "to": "evidenta", "count": 390, "size": 261861},
+    {"shard": "evidenti", "from": "evidentia", "to": "exige", "count": 387, "size": 262124},
+    {"shard": "exigen", "from": "exigent", "to": "extenuant", "count": 340, "size": 261585},
+    {"shard": "extenuar", "from": "extenuare", "to": "ezredes", "count": 159, "size": 124139},
+  ],
+  "f": [
+    {"shard": "f", "from": "f", "to": "fango", "count": 502, "size": 262126},
+    {"shard": "fangot", "from": "fangoterapie", "to": "fatidic", "count": 449, "size": 261587},
+    {"shard": "fatig", "from": "fatigabilitate", "to": "fermecatorie", "count": 478, "size": 261965},
+    {"shard": "fermecatu", "from": "fermecatura", "to": "filmologic", "count": 496, "size": 261894},
+    {"shard": "filmologie", "from": "filmologie", "to": "flamaropol", "count": 480, "size": 262096},
+    {"shard": "flamb", "from": "flamba", "to": "foicica", "count": 490, "size": 262029},
+    {"shard": "foie", "from": "foieni", "to": "fotoconductivitate", "count": 494, "size": 261343},
+    {"shard": "fotoconducto", "from": "fotoconductor", "to": "frau", "count": 449, "size": 261734},
+    {"shard": "fraud", "from": "frauda", "to": "fulgescu", "count": 496, "size": 262087},
+    {"shard": "fulgi", "from": "fulgi", "to": "fuziune nucleara", "count": 513, "size": 248185},
+  ],
+  "g": [
+    {"shard": "g", "from": "g", "to": "gamfatura", "count": 483, "size": 262091},
+    {"shard": "gamo", "from": "gamofob", "to": "gazdasie", "count": 602, "size": 261809},
+    {"shard": "gazdi", "from": "gazdisoara", "to": "germinal", "count": 483, "size": 261742},
+    {"shard": "germinar", "from": "germinare", "to": "gigoleta", "count": 583, "size": 261868},
+    {"shard": "gigolo", "from": "gigolo", "to": "glumela", "count": 558, "size": 261424},
+    {"shard": "glumet", "from": "glumet", "to": "granadir", "count": 606, "size": 261965},
+    {"shard": "granar", "from": "granar", "to": "grizzly", "count": 502, "size": 261207},
+    {"shard": "gro", "from": "groapa", "to": "gvozdova", "count": 567, "size": 242276},
+  ],
+  "h": [
+    {"shard": "h", "from": "h", "to": "harau", "count": 527, "size": 261787},
+    {"shard": "haraz", "from": "harazeala", "to": "hematemeza", "count": 459, "size": 261929},
+    {"shard": "hemati", "from": "hematic", "to": "hidroaviatie", "count": 449, "size": 261518},
+    {"shard": "hidroavio", "from": "hidroavion", "to": "hipoacuzie", "count": 391, "size": 261639},
+    {"shard": "hipoal", "from": "hipoalgezie", "to": "homorozean", "count": 479, "size": 261664},
+    {"shard": "homos", "from": "homosexual", "to": "hypnos", "count": 557, "size": 260810},
+  ],
+  "j": [
+    {"shard": "j", "from": "j", "to": "joimir", "count": 510, "size": 261495},
+    {"shard": "join", "from": "joint", "to": "jvart", "count": 415, "size": 225526},
+  ],
+  "k": [
+    {"shard": "k", "from": "k", "to": "kyat", "count": 158, "size": 80542},
+  ],
+  "l": [
+    {"shard": "l", "from": "l", "to": "lamentatiune", "count": 479, "size": 261980},
+    {"shard": "lami", "from": "lamie", "to": "latinizant", "count": 477, "size": 261513},
+    {"shard": "latinizar", "from": "latinizare", "to": "leishmanioza", "count": 502, "size": 261443},
+    {"shard": "leit", "from": "leit", "to": "liber-cugetator", "count": 494, "size": 261976},
+    {"shard": "liber-s", "from": "liber-schimbism", "to": "lingari", "count": 468, "size": 261901},
+    {"shard": "lingarir", "from": "lingarire", "to": "localiza", "count": 545, "size": 261463},
+    {"shard": "localizab", "from": "localizabil", "to": "luddita", "count": 524, "size": 262120},
+    {"shard": "lude", "from": "lude", "to": "luzie", "count": 508, "size": 196350},
+  ],
+  "n": [
+    {"shard": "n", "from": "n", "to": "nasaud", "count": 462, "size": 261470},
+    {"shard": "nasaude", "from": "nasaudean", "to": "nearat", "count": 421, "size": 261399},
+    {"shard": "nearm", "from": "nearmonios", "to": "neestetic", "count": 432, "size": 261423},
+    {"shard": "neet", "from": "neetans", "to": "nelinistit", "count": 451, "size": 261815},
+    {"shard": "nelinistito", "from": "nelinistitor", "to": "nepipait", "count": 401, "size": 262138},
+    {"shard": "nepl", "from": "neplacere", "to": "neurotom", "count": 398, "size": 261774},
+    {"shard": "neurotomi", "from": "neurotomie", "to": "nobet", "count": 565, "size": 261795},
+    {"shard": "nobi", "from": "nobil", "to": "nudist", "count": 526, "size": 261859},
+    {"shard": "nudista", "from": "nudista", "to": "nuzi", "count": 234, "size": 105043},
+  ],
+  "o": [
+    {"shard": "o", "from": "o", "to": "obtentiune", "count": 422, "size": 260441},
+    {"shard": "obti", "from": "obtine", "to": "oficia", "count": 450, "size": 261865},
+    {"shard": "oficial", "from": "oficial", "to": "omeopatic", "count": 523, "size": 261910},
+    {"shard": "omeoz", "from": "omeoza", "to": "opresti", "count": 454, "size": 260605},
+    {"shard": "opri", "from": "opri", "to": "orientul indepartat", "count": 556, "size": 261859},
+    {"shard": "orif", "from": "orificiu", "to": "osteotomie", "count": 440, "size": 261914},
+    {"shard": "osteoz", "from": "osteoza", "to": "ozunca-bai", "count": 388, "size": 238537},
+  ],
+  "q": [
+    {"shard": "q", "from": "q", "to": "quruch", "count": 22, "size": 10970},
+  ],
+  "r": [
+    {"shard": "r", "from": "r", "to": "radiopirat", "count": 466, "size": 261527},
+    {"shard": "radiopr", "from": "radioprogram", "to": "ranusa", "count": 454, "size": 260034},
+    {"shard": "ranv", "from": "ranversa", "to": "rastalmaci", "count": 405, "size": 261742},
+    {"shard": "rastalmacir", "from": "rastalmacire", "to": "razori", "count": 428, "size": 262080},
+    {"shard": "razu", "from": "razui", "to": "recalut", "count": 279, "size": 261498},
+    {"shard": "recan", "from": "recantari", "to": "rectangul", "count": 288, "size": 261752},
+    {"shard": "rectangula", "from": "rectangular", "to": "refrigeratiune", "count": 302, "size": 262079},
+    {"shard": "refrigerato", "from": "refrigerator", "to": "reinnoitor", "count": 311, "size": 260989},
+    {"shard": "reins", "from": "reinsamanta", "to": "rencloda", "count": 282, "size": 261920},
+    {"shard": "rend", "from": "rendez-vous", "to": "republica socialista federativa iugoslavia", "count": 376, "size": 262116},
+    {"shard": "republica-socialista-v", "from": "republica socialista vietnam", "to": "retrograd", "count": 331, "size": 261078},
+    {"shard": "retrograda", "from": "retrograda", "to": "rezumare", "count": 312, "size": 261689},
+    {"shard": "rezumat", "from": "rezumat", "to": "romaic", "count": 482, "size": 260233},
+    {"shard": "roman", "from": "roman", "to": "rudisoara", "count": 541, "size": 261988},
+    {"shard": "rudist", "from": "rudist", "to": "ruxandra", "count": 353, "size": 171845},
+  ],
+  "t": [
+    {"shard": "t", "from": "t", "to": "talnis", "count": 434, "size": 261701},
+    {"shard": "talo", "from": "talofita", "to": "tarca", "count": 458, "size": 260178},
+    {"shard": "tarcai", "from": "tarcai", "to": "tavalire", "count": 554, "size": 261725},
+    {"shard": "tavalit", "from": "tavalitura", "to": "temelia", "count": 479, "size": 262011},
+    {"shard": "temelie", "from": "temelie", "to": "termomanometru", "count": 490, "size": 261588},
+    {"shard": "termome", "from": "termometric", "to": "tiganete", "count": 482, "size": 261674},
+    {"shard": "tigani", "from": "tigani", "to": "tita", "count": 547, "size": 261497},
+    {"shard": "titan", "from": "titan", "to": "torace", "count": 556, "size": 261497},
+    {"shard": "toracen", "from": "toracenteza", "to": "transbordare", "count": 461, "size": 261882},
+    {"shard": "transbordo", "from": "transbordor", "to": "traumaticina", "count": 335, "size": 261490},
+    {"shard": "traumatis", "from": "traumatism", "to": "trihotomie", "count": 460, "size": 261768},
+    {"shard": "triht", "from": "trihtar", "to": "trupet", "count": 420, "size": 261938},
+    {"shard": "trupi", "from": "trupina", "to": "turnant", "count": 513, "size": 262029},
+    {"shard": "turnanta", "from": "turnanta", "to": "twist", "count": 186, "size": 92652},
+  ],
+  "u": [
+    {"shard": "u", "from": "u", "to": "umpic", "count": 497, "size": 261117},
+    {"shard": "umpl", "from": "umple", "to": "urcat", "count": 489, "size": 261354},
+    {"shard": "urcato", "from": "urcator", "to": "uvologie", "count": 524, "size": 261898},
+    {"shard": "uvr", "from": "uvragiu", "to": "uzuru", "count": 53, "size": 35157},
+  ],
+  "v": [
+    {"shard": "v", "from": "v", "to": "valea vopselelor", "count": 1067, "size": 262034},
+    {"shard": "valea-z", "from": "valea zadelor", "to": "vartecus", "count": 532, "size": 261793},
+    {"shard": "vartej", "from": "vartej", "to": "venisem", "count": 525, "size": 261497},
+    {"shard": "venit", "from": "venit", "to": "vibratoriu", "count": 497, "size": 261875},
+    {"shard": "vibri", "from": "vibrion", "to": "viorea", "count": 514, "size": 262124},
+    {"shard": "viorean", "from": "vioreanu", "to": "voalare", "count": 546, "size": 261903},
+    {"shard": "voalat", "from": "voalat", "to": "vrodinioara", "count": 563, "size": 260516},
+    {"shard": "vroi", "from": "vroi", "to": "vzt", "count": 147, "size": 72022},
+  ],
+  "w": [
+    {"shard": "w", "from": "w", "to": "wyoming", "count": 47, "size": 20758},
+  ],
+  "x": [
+    {"shard": "x", "from": "x", "to": "xulescu", "count": 137, "size": 83554},
+  ],
+  "y": [
+    {"shard": "y", "from": "y", "to": "yucca", "count": 32, "size": 12605},
+  ],
+  "z": [
+    {"shard": "z", "from": "z", "to": "zbarceata", "count": 504, "size": 260817},
+    {"shard": "zbarci", "from": "zbarci", "to": "zgomotos", "count": 380, "size": 261296},
+    {"shard": "zgor", "from": "zgorni", "to": "zorile", "count": 461, "size": 261861},
+    {"shard": "zorir", "from": "zorire", "to": "zzz", "count": 164, "size": 107560},
+  ],
 };
 
-const loadedLetters = {};
+// Hot/cold split: hot entries and the share of corpus tokens they cover
+export const HOT_SPLIT = {"words": 548, "forms": 443, "size": 307171, "tokens": 27956, "coverage": 0.7948};
+
+const HOT_WORDS = new Map();
+for (const w of HOT.words) {
+  const key = w.word.toLowerCase();
+  if (!HOT_WORDS.has(key)) HOT_WORDS.set(key, w);
+}
+
+// Every cold shard is code-split into its own lazily loaded chunk
+const SHARD_LOADERS = import.meta.glob(['./*.js', '!./index.js', '!./hot.js']);
+
+const loadedShards = {};
+
+/**
+ * Fold a word to its shard key (lowercase, diacritics removed)
+ */
+export function foldKey(word) {
+  return word.toLowerCase().normalize('NFD').replace(/[\u0300-\u036f]/g, '');
+}
+
+function bucketOf(key) {
+  const first = key.charAt(0);
+  return first >= 'a' && first <= 'z' ? first : '#';
+}
 
 /**
- * Load dictionary data for a specific letter on demand
+ * Find the shard whose key range holds a folded key (null if none can)
  */
-export async function loadLetter(letter) {
-  const key = letter.toLowerCase();
-  if (loadedLetters[key]) {
-    return loadedLetters[key];
+export function findShard(key) {
+  const shards = INDEX[bucketOf(key)];
+  if (!shards) return null;
+
+  let lo = 0;
+  let hi = shards.length - 1;
+  let found = null;
+  while (lo <= hi) {
+    const mid = (lo + hi) >> 1;
+    if (shards[mid].from <= key) {
+      found = shards[mid];
+      lo = mid + 1;
+    } else {
+      hi = mid - 1;
+    }
+  }
+  return found && key <= found.to ? found.shard : null;
+}
+
+/**
+ * Load one dictionary shard on demand
+ */
+export async function loadShard(shard) {
+  if (loadedShards[shard]) {
+    return loadedShards[shard];
   }
 
-  const info = INDEX[key];
-  if (!info) {
+  const loader = SHARD_LOADERS[`./${shard}.js`];
+  if (!loader) {
     return [];
   }
 
   try {
-    // Dynamic import with static extension for Vite bundling
-    const module = await import(/* @vite-ignore */ `./${key}.js`);
-    loadedLetters[key] = module.default;
-    return loadedLetters[key];
+    const module = await loader();
+    loadedShards[shard] = module.default;
+    return loadedShards[shard];
   } catch (err) {
-    console.error(`Failed to load dictionary for letter "${letter}"`, err);
+    console.error(`Failed to load dictionary shard "${shard}"`, err);
     return [];
   }
 }
 
 /**
  * Look up a word in the dictionary
+ * Pass the shard key when it is known (e.g. from a story token sidecar)
+ * to skip range resolution.
  */
-export async function lookupWord(word) {
+export async function lookupWord(word, shard = null) {
   if (!word || word.length === 0) return null;
 
-  const letter = word.charAt(0).toLowerCase().normalize('NFD').replace(/[\u0300-\u036f]/g, '');
-  const words = await loadLetter(letter);
+  const hot = HOT_WORDS.get(word.toLowerCase());
+  if (hot) return hot;
+
+  // A hint naming a shard that no longer exists (e.g. a sidecar from
+  // before a re-shard) falls back to range resolution
+  const known = shard && SHARD_LOADERS[`./${shard}.js`] ? shard : null;
+  const target = known || findShard(foldKey(word));
+  if (!target) return null;
+  const words = await loadShard(target);
 
   const normalizedWord = word.toLowerCase();
   return words.find(w => w.word.toLowerCase() === normalizedWord) || null;
@@ -188,13 +278,24 @@ export async function lookupWord(word) {
 export async function searchWords(prefix, limit = 10) {
   if (!prefix || prefix.length === 0) return [];
 
-  const letter = prefix.charAt(0).toLowerCase().normalize('NFD').replace(/[\u0300-\u036f]/g, '');
-  const words = await loadLetter(letter);
-
+  const key = foldKey(prefix);
   const normalizedPrefix = prefix.toLowerCase();
-  return words
-    .filter(w => w.word.toLowerCase().startsWith(normalizedPrefix))
-    .slice(0, limit);
+  const results = [];
+
+  // Shards are sorted, so walk from the first one that can hold the prefix
+  for (const info of INDEX[bucketOf(key)] || []) {
+    if (info.to < key) continue;
+    if (!info.from.startsWith(key) && info.from > key) break;
+
+    const words = await loadShard(info.shard);
+    for (const w of words) {
+      if (w.word.toLowerCase().startsWith(normalizedPrefix)) {
+        results.push(w);
+        if (results.length >= limit) return results;
+      }
+    }
+  }
+  return results;
 }
 
 /**
@@ -202,8 +303,10 @@ export async function searchWords(prefix, limit = 10) {
  */
 export function getStats() {
   return {
-    totalWords: 129330,
+    totalWords: 55013,
+    shards: 124,
     letters: Object.keys(INDEX).length,
+    hot: HOT_SPLIT,
     index: INDEX,
   };
 }
@@ -211,6 +314,7 @@ export function getStats() {
 export default {
   lookupWord,
   searchWords,
-  loadLetter,
+  loadShard,
+  findShard,
   getStats,
 };
@@ -1 +1 @@
-export default [{"word":"j","pos":"character","definitions":["The thirteenth letter of the Romanian alphabet, called je or jî and written in the Latin script."],"pronunciation":"/ʒ/","forms":{"uppercase":"J"}},{"word":"J","pos":"character","definitions":["The thirteenth letter of the Romanian alphabet, called je or jî and written in the Latin script."],"pronunciation":"/ʒ/","forms":{"lowercase":"j"}},{"word":"Jabăr","pos":"name","definitions":["a village in Boldur, Timiș County, Romania"],"gender":"m"},{"word":"Jabenițan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jabenițan"}},{"word":"jabiru","pos":"noun","definitions":["jabiru"],"forms":{"plural":"jabiruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jabiru","accusative-definite-nominative-singular":"jabirul","accusative-indefinite-nominative-plural":"jabiruri","accusative-definite-nominative-plural":"jabirurile","dative-genitive-indefinite-singular":"jabiru","dative-definite-genitive-singular":"jabirului","dative-genitive-indefinite-plural":"jabiruri","dative-definite-genitive-plural":"jabirurilor","singular-vocative":"jabirule","plural-vocative":"jabirurilor"}},{"word":"jabotieră","pos":"noun","definitions":["chiffon frill"],"forms":{"plural":"jabotiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jabotieră","accusative-definite-nominative-singular":"jabotiera","accusative-indefinite-nominative-plural":"jabotiere","accusative-definite-nominative-plural":"jabotierele","dative-genitive-indefinite-singular":"jabotiere","dative-definite-genitive-singular":"jabotierei","dative-genitive-indefinite-plural":"jabotiere","dative-definite-genitive-plural":"jabotierelor","singular-vocative":"jabotieră","plural-vocative":"jabotierelor"}},{"word":"jabou","pos":"noun","definitions":["frill"],"forms":{"plural":"jabouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jabou","accusative-definite-nominative-singular":"jaboul","accusative-indefinite-nominative-plural":"jabouri","accusative-definite-nominative-plural":"jabourile","dative-genitive-indefinite-singular":"jabou","dative-definite-genitive-singular":"jaboului","dative-genitive-indefinite-plural":"jabouri","dative-definite-genitive-plural":"jabourilor","singular-vocative":"jaboule","plural-vocative":"jabourilor"}},{"word":"jabră","pos":"noun","definitions":["alternative form of javră"],"forms":{"plural":"jabre"}},{"word":"jac","pos":"noun","definitions":["alternative form of jaf"],"forms":{"plural":"jacuri"}},{"word":"Jac","pos":"name","definitions":["a village in Creaca, Sălaj County, Romania"],"pronunciation":"/ˈʒak/","gender":"m"},{"word":"jacaranda","pos":"noun","definitions":["jacaranda"],"forms":{"plural":"jacaranda","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jacaranda","accusative-definite-nominative-singular":"jacarandaul","accusative-indefinite-nominative-plural":"jacaranda","accusative-definite-nominative-plural":"jacarandai","dative-genitive-indefinite-singular":"jacaranda","dative-definite-genitive-singular":"jacarandaului","dative-genitive-indefinite-plural":"jacaranda","dative-definite-genitive-plural":"jacarandalor","singular-vocative":"jacarandaule","plural-vocative":"jacarandalor"}},{"word":"jacard","pos":"noun","definitions":["jacquard"],"forms":{"plural":"jacarde","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jacard","accusative-definite-nominative-singular":"jacardul","accusative-indefinite-nominative-plural":"jacarde","accusative-definite-nominative-plural":"jacardele","dative-genitive-indefinite-singular":"jacard","dative-definite-genitive-singular":"jacardului","dative-genitive-indefinite-plural":"jacarde","dative-definite-genitive-plural":"jacardelor","singular-vocative":"jacardule","plural-vocative":"jacardelor"}},{"word":"jacă","pos":"noun","definitions":["sack, bag"],"forms":{"plural":"jăci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jacă","accusative-definite-nominative-singular":"jaca","accusative-indefinite-nominative-plural":"jăci","accusative-definite-nominative-plural":"jăcile","dative-genitive-indefinite-singular":"jăci","dative-definite-genitive-singular":"jăcii","dative-genitive-indefinite-plural":"jăci","dative-definite-genitive-plural":"jăcilor","singular-vocative":"jacă","plural-vocative":"jăcilor"}},{"word":"jachetă","pos":"noun","definitions":["a long jacket or overcoat"],"pronunciation":"/ʒaˈke.tə/","forms":{"plural":"jachete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jachetă","accusative-definite-nominative-singular":"jacheta","accusative-indefinite-nominative-plural":"jachete","accusative-definite-nominative-plural":"jachetele","dative-genitive-indefinite-singular":"jachete","dative-definite-genitive-singular":"jachetei","dative-genitive-indefinite-plural":"jachete","dative-definite-genitive-plural":"jachetelor","singular-vocative":"jachetă","plural-vocative":"jachetelor"}},{"word":"jachetuță","pos":"noun","definitions":["diminutive of jachetă; small jacket"],"forms":{"plural":"jachetuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jachetuță","accusative-definite-nominative-singular":"jachetuța","accusative-indefinite-nominative-plural":"jachetuțe","accusative-definite-nominative-plural":"jachetuțele","dative-genitive-indefinite-singular":"jachetuțe","dative-definite-genitive-singular":"jachetuței","dative-genitive-indefinite-plural":"jachetuțe","dative-definite-genitive-plural":"jachetuțelor","singular-vocative":"jachetuță","plural-vocative":"jachetuțelor"}},{"word":"jachețică","pos":"noun","definitions":["diminutive of jachetă; small jacket"],"forms":{"plural":"jachețele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jachețică","accusative-definite-nominative-singular":"jachețica","accusative-indefinite-nominative-plural":"jachețice","accusative-definite-nominative-plural":"jachețicele","dative-genitive-indefinite-singular":"jachețice","dative-definite-genitive-singular":"jachețicei","dative-genitive-indefinite-plural":"jachețice","dative-definite-genitive-plural":"jachețicelor","singular-vocative":"jachețică","plural-vocative":"jachețicelor"}},{"word":"jack","pos":"noun","definitions":["alternative form of geac"],"forms":{"plural":"jackuri"}},{"word":"Jack Spintecătorul","pos":"name","definitions":["Jack the Ripper"],"gender":"m"},{"word":"jackpot","pos":"noun","definitions":["jackpot"],"forms":{"plural":"jackpoturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jackpot","accusative-definite-nominative-singular":"jackpotul","accusative-indefinite-nominative-plural":"jackpoturi","accusative-definite-nominative-plural":"jackpoturile","dative-genitive-indefinite-singular":"jackpot","dative-definite-genitive-singular":"jackpotului","dative-genitive-indefinite-plural":"jackpoturi","dative-definite-genitive-plural":"jackpoturilor","singular-vocative":"jackpotule","plural-vocative":"jackpoturilor"}},{"word":"jackuri","pos":"noun","definitions":["plural of jack"]},{"word":"jacmar","pos":"noun","definitions":["jack, quarter jack"],"forms":{"plural":"jacmare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jacmar","accusative-definite-nominative-singular":"jacmarul","accusative-indefinite-nominative-plural":"jacmare","accusative-definite-nominative-plural":"jacmarele","dative-genitive-indefinite-singular":"jacmar","dative-definite-genitive-singular":"jacmarului","dative-genitive-indefinite-plural":"jacmare","dative-definite-genitive-plural":"jacmarelor","singular-vocative":"jacmarule","plural-vocative":"jacmarelor"}},{"word":"jacobin","pos":"noun","definitions":["obsolete form of iacobin"],"forms":{"plural":"jacobini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jacobin","accusative-definite-nominative-singular":"jacobinul","accusative-indefinite-nominative-plural":"jacobini","accusative-definite-nominative-plural":"jacobinii","dative-genitive-indefinite-singular":"jacobin","dative-definite-genitive-singular":"jacobinului","dative-genitive-indefinite-plural":"jacobini","dative-definite-genitive-plural":"jacobinilor","singular-vocative":"jacobinule","plural-vocative":"jacobinilor"}},{"word":"Jacodu","pos":"name","definitions":["a village in Vețca, Mureș County, Romania"],"gender":"m"},{"word":"Jacota","pos":"name","definitions":["a village in Vulturești, Suceava County, Romania"],"gender":"f"},{"word":"jacquerie","pos":"noun","definitions":["jacquerie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"jacquerie","accusative-definite-nominative":"jacqueria","dative-genitive-indefinite":"jacquerii","dative-definite-genitive":"jacqueriei","vocative":"jacquerie"}},{"word":"jacuzzi","pos":"noun","definitions":["jacuzzi"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jacuzzi","accusative-definite-nominative":"jacuzziul","dative-genitive-indefinite":"jacuzzi","dative-definite-genitive":"jacuzziului","vocative":"jacuzziule"}},{"word":"jad","pos":"noun","definitions":["jade"],"forms":{"plural":"jaduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jad","accusative-definite-nominative-singular":"jadul","accusative-indefinite-nominative-plural":"jaduri","accusative-definite-nominative-plural":"jadurile","dative-genitive-indefinite-singular":"jad","dative-definite-genitive-singular":"jadului","dative-genitive-indefinite-plural":"jaduri","dative-definite-genitive-plural":"jadurilor","singular-vocative":"jadule","plural-vocative":"jadurilor"}},{"word":"jadeit","pos":"noun","definitions":["jadeite"],"forms":{"plural":"jadeite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jadeit","accusative-definite-nominative-singular":"jadeitul","accusative-indefinite-nominative-plural":"jadeite","accusative-definite-nominative-plural":"jadeitele","dative-genitive-indefinite-singular":"jadeit","dative-definite-genitive-singular":"jadeitului","dative-genitive-indefinite-plural":"jadeite","dative-definite-genitive-plural":"jadeitelor","singular-vocative":"jadeitule","plural-vocative":"jadeitelor"}},{"word":"jaf","pos":"noun","definitions":["robbery"],"forms":{"plural":"jafuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jaf","accusative-definite-nominative-singular":"jaful","accusative-indefinite-nominative-plural":"jafuri","accusative-definite-nominative-plural":"jafurile","dative-genitive-indefinite-singular":"jaf","dative-definite-genitive-singular":"jafului","dative-genitive-indefinite-plural":"jafuri","dative-definite-genitive-plural":"jafurilor","singular-vocative":"jafule","plural-vocative":"jafurilor"}},{"word":"jagardea","pos":"noun","definitions":["an old, ragged, worn down piece of clothing","a person who is dirty, disheveled, disgusting, reproachful, reprehensible, insane, etc. or who inspires disgust, loathing, and aversion in others","a woman of loose morals or one who engages in scandalous behavior"],"forms":{"plural":"jagardele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"jagardea","accusative-definite-nominative-singular":"jagardeaua","accusative-indefinite-nominative-plural":"jagardele","accusative-definite-nominative-plural":"jagardelele","dative-genitive-indefinite-singular":"jagardele","dative-definite-genitive-singular":"jagardelei","dative-genitive-indefinite-plural":"jagardele","dative-definite-genitive-plural":"jagardelelor","singular-vocative":"jagardea","plural-vocative":"jagardelelor"}},{"word":"jaghetă","pos":"noun","definitions":["obsolete form of jachetă"],"forms":{"plural":"jaghete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jaghetă","accusative-definite-nominative-singular":"jagheta","accusative-indefinite-nominative-plural":"jaghete","accusative-definite-nominative-plural":"jaghetele","dative-genitive-indefinite-singular":"jaghete","dative-definite-genitive-singular":"jaghetei","dative-genitive-indefinite-plural":"jaghete","dative-definite-genitive-plural":"jaghetelor","singular-vocative":"jaghetă","plural-vocative":"jaghetelor"}},{"word":"jaguar","pos":"noun","definitions":["jaguar"],"pronunciation":"/ʒa.ɡuˈar/","forms":{"plural":"jaguari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jaguar","accusative-definite-nominative-singular":"jaguarul","accusative-indefinite-nominative-plural":"jaguari","accusative-definite-nominative-plural":"jaguarii","dative-genitive-indefinite-singular":"jaguar","dative-definite-genitive-singular":"jaguarului","dative-genitive-indefinite-plural":"jaguari","dative-definite-genitive-plural":"jaguarilor","singular-vocative":"jaguarule","plural-vocative":"jaguarilor"}},{"word":"jaguari","pos":"noun","definitions":["indefinite plural of jaguar"],"pronunciation":"[ʒaɡuˈarʲ]","gender":"m-p"},{"word":"jaguarundi","pos":"noun","definitions":["jaguarundi"],"forms":{"plural":"jaguarundi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jaguarundi","accusative-definite-nominative-singular":"jaguarundiul","accusative-indefinite-nominative-plural":"jaguarundi","accusative-definite-nominative-plural":"jaguarundii","dative-genitive-indefinite-singular":"jaguarundi","dative-definite-genitive-singular":"jaguarundiului","dative-genitive-indefinite-plural":"jaguarundi","dative-definite-genitive-plural":"jaguarundilor","singular-vocative":"jaguarundiule","plural-vocative":"jaguarundilor"}},{"word":"jainism","pos":"noun","definitions":["Jainism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jainism","accusative-definite-nominative-singular":"jainismul","accusative-indefinite-nominative-plural":"jainisme","accusative-definite-nominative-plural":"jainismele","dative-genitive-indefinite-singular":"jainism","dative-definite-genitive-singular":"jainismului","dative-genitive-indefinite-plural":"jainisme","dative-definite-genitive-plural":"jainismelor","singular-vocative":"jainismule","plural-vocative":"jainismelor"}},{"word":"jainist","pos":"noun","definitions":["Jainist"],"forms":{"plural":"jainiști","feminine":"equivalent jainistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jainist","accusative-definite-nominative-singular":"jainistul","accusative-indefinite-nominative-plural":"jainiști","accusative-definite-nominative-plural":"jainiștii","dative-genitive-indefinite-singular":"jainist","dative-definite-genitive-singular":"jainistului","dative-genitive-indefinite-plural":"jainiști","dative-definite-genitive-plural":"jainiștilor","singular-vocative":"jainistule","plural-vocative":"jainiștilor"}},{"word":"jainistă","pos":"noun","definitions":["female equivalent of jainist"],"forms":{"plural":"jainiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jainistă","accusative-definite-nominative-singular":"jainista","accusative-indefinite-nominative-plural":"jainiste","accusative-definite-nominative-plural":"jainistele","dative-genitive-indefinite-singular":"jainiste","dative-definite-genitive-singular":"jainistei","dative-genitive-indefinite-plural":"jainiste","dative-definite-genitive-plural":"jainistelor","singular-vocative":"jainistă","plural-vocative":"jainistelor"}},{"word":"jais","pos":"noun","definitions":["jet (coal)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jais","accusative-definite-nominative":"jaisul","dative-genitive-indefinite":"jais","dative-definite-genitive":"jaisului","vocative":"jaisule"}},{"word":"Jalba","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jalba"}},{"word":"jalbă","pos":"noun","definitions":["complaint, written reclamation"],"forms":{"plural":"jalbe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jalbă","accusative-definite-nominative-singular":"jalba","accusative-indefinite-nominative-plural":"jalbe","accusative-definite-nominative-plural":"jalbele","dative-genitive-indefinite-singular":"jalbe","dative-definite-genitive-singular":"jalbei","dative-genitive-indefinite-plural":"jalbe","dative-definite-genitive-plural":"jalbelor","singular-vocative":"jalbă","plural-vocative":"jalbelor"}},{"word":"Jalbă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jalbă"}},{"word":"jale","pos":"noun","definitions":["grief, distress"],"pronunciation":"/ˈʒa.le/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"jale","accusative-definite-nominative":"jalea","dative-genitive-indefinite":"jale","dative-definite-genitive":"jalei","vocative":"jale"}},{"word":"jale","pos":"noun","definitions":["common sage (Salvia officinalis)"],"pronunciation":"/ˈʒa.le/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"jale","accusative-definite-nominative":"jalea","dative-genitive-indefinite":"jale","dative-definite-genitive":"jalei","vocative":"jale"}},{"word":"jalea","pos":"noun","definitions":["definite nominative/accusative singular of jale"],"pronunciation":"/ˈʒa.le̯a/","gender":"f"},{"word":"jalei","pos":"noun","definitions":["definite genitive/dative singular of jale"],"pronunciation":"/ˈʒa.lej/","gender":"f"},{"word":"jaleo","pos":"noun","definitions":["vocative singular of jale"],"pronunciation":"[ˈʒale̯o]","gender":"f"},{"word":"jaleo","pos":"noun","definitions":["jaleo"],"forms":{"plural":"jaleo","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jaleo","accusative-definite-nominative-singular":"jaleoul","accusative-indefinite-nominative-plural":"jaleo","accusative-definite-nominative-plural":"jaleole","dative-genitive-indefinite-singular":"jaleo","dative-definite-genitive-singular":"jaleoului","dative-genitive-indefinite-plural":"jaleo","dative-definite-genitive-plural":"jaleolor","singular-vocative":"jaleoule","plural-vocative":"jaleolor"}},{"word":"Jaleș","pos":"name","definitions":["a river in Gorj, Romania, tributary to the Tismana"],"gender":"m"},{"word":"jalet","pos":"noun","definitions":["wail"],"forms":{"plural":"jalete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jalet","accusative-definite-nominative-singular":"jaletul","accusative-indefinite-nominative-plural":"jalete","accusative-definite-nominative-plural":"jaletele","dative-genitive-indefinite-singular":"jalet","dative-definite-genitive-singular":"jaletului","dative-genitive-indefinite-plural":"jalete","dative-definite-genitive-plural":"jaletelor","singular-vocative":"jaletule","plural-vocative":"jaletelor"}},{"word":"jalnic","pos":"adj","definitions":["distressing, lamentable"],"pronunciation":"/ˈʒalnik/","forms":{"feminine-singular":"jalnică","masculine-plural":"jalnici","feminine-neuter-plural":"jalnice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"jalnic","error-unrecognized-form-feminine-indefinite-singular":"jalnică","error-unrecognized-form-indefinite-masculine-plural":"jalnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"jalnice","definite-error-unrecognized-form-masculine-neuter-singular":"jalnicul","definite-error-unrecognized-form-feminine-singular":"jalnica","definite-error-unrecognized-form-masculine-plural":"jalnicii","definite-error-unrecognized-form-feminine-neuter-plural":"jalnicele"}},{"word":"jalnic","pos":"adv","definitions":["distressingly"],"pronunciation":"/ˈʒalnik/"},{"word":"jalobă","pos":"noun","definitions":["alternative form of jalbă"],"forms":{"plural":"jalobe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jalobă","accusative-definite-nominative-singular":"jaloba","accusative-indefinite-nominative-plural":"jalobe","accusative-definite-nominative-plural":"jalobele","dative-genitive-indefinite-singular":"jalobe","dative-definite-genitive-singular":"jalobei","dative-genitive-indefinite-plural":"jalobe","dative-definite-genitive-plural":"jalobelor","singular-vocative":"jalobă","plural-vocative":"jalobelor"}},{"word":"Jalobeanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jalobeanu"}},{"word":"jalon","pos":"noun","definitions":["stake (surveyor's)"],"forms":{"plural":"jaloane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jalon","accusative-definite-nominative-singular":"jalonul","accusative-indefinite-nominative-plural":"jaloane","accusative-definite-nominative-plural":"jaloanele","dative-genitive-indefinite-singular":"jalon","dative-definite-genitive-singular":"jalonului","dative-genitive-indefinite-plural":"jaloane","dative-definite-genitive-plural":"jaloanelor","singular-vocative":"jalonule","plural-vocative":"jaloanelor"}},{"word":"jalona","pos":"verb","definitions":["to stake out"],"forms":{"canonical":"a jalona 1st conjugation","present-singular-third-person":"jalonează","participle-past":"jalonat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a jalona","gerund":"jalonând","first-person-indicative-present-singular":"jalonez","indicative-present-second-person-singular":"jalonezi","indicative-present-singular-third-person":"jalonează","first-person-indicative-plural-present":"jalonăm","indicative-plural-present-second-person":"jalonați","indicative-plural-present-third-person":"jalonează","first-person-imperfect-indicative-singular":"jalonam","imperfect-indicative-second-person-singular":"jalonai","imperfect-indicative-singular-third-person":"jalona","first-person-imperfect-indicative-plural":"jalonam","imperfect-indicative-plural-second-person":"jalonați","imperfect-indicative-plural-third-person":"jalonau","first-person-indicative-perfect-singular":"jalonai","indicative-perfect-second-person-singular":"jalonași","indicative-perfect-singular-third-person":"jalonă","first-person-indicative-perfect-plural":"jalonarăm","indicative-perfect-plural-second-person":"jalonarăți","indicative-perfect-plural-third-person":"jalonară","first-person-indicative-pluperfect-singular":"jalonasem","indicative-pluperfect-second-person-singular":"jalonaseși","indicative-pluperfect-singular-third-person":"jalonase","first-person-indicative-pluperfect-plural":"jalonaserăm","indicative-pluperfect-plural-second-person":"jalonaserăți","indicative-pluperfect-plural-third-person":"jalonaseră","first-person-present-singular-subjunctive":"să jalonez","present-second-person-singular-subjunctive":"să jalonezi","present-singular-subjunctive-third-person":"să jaloneze","first-person-plural-present-subjunctive":"să jalonăm","plural-present-second-person-subjunctive":"să jalonați","plural-present-subjunctive-third-person":"să jaloneze","imperative-second-person-singular":"jalonează","imperative-plural-second-person":"jalonați","imperative-negative-second-person-singular":"nu jalona","imperative-negative-plural-second-person":"nu jalonați"}},{"word":"jaloste","pos":"noun","definitions":["grief"],"forms":{"plural":"jalosti","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jaloste","accusative-definite-nominative-singular":"jalostea","accusative-indefinite-nominative-plural":"jalosti","accusative-definite-nominative-plural":"jalostile","dative-genitive-indefinite-singular":"jalosti","dative-definite-genitive-singular":"jalostii","dative-genitive-indefinite-plural":"jalosti","dative-definite-genitive-plural":"jalostilor","singular-vocative":"jaloste","plural-vocative":"jalostilor"}},{"word":"jalovanie","pos":"noun","definitions":["gratuity"],"forms":{"plural":"jalovanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jalovanie","accusative-definite-nominative-singular":"jalovania","accusative-indefinite-nominative-plural":"jalovanii","accusative-definite-nominative-plural":"jalovaniile","dative-genitive-indefinite-singular":"jalovanii","dative-definite-genitive-singular":"jalovaniei","dative-genitive-indefinite-plural":"jalovanii","dative-definite-genitive-plural":"jalovaniilor","singular-vocative":"jalovanie","plural-vocative":"jalovaniilor"}},{"word":"jaluzea","pos":"noun","definitions":["blind (covering for windows)"],"forms":{"plural":"jaluzele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"jaluzea","accusative-definite-nominative-singular":"jaluzeaua","accusative-indefinite-nominative-plural":"jaluzele","accusative-definite-nominative-plural":"jaluzelele","dative-genitive-indefinite-singular":"jaluzele","dative-definite-genitive-singular":"jaluzelei","dative-genitive-indefinite-plural":"jaluzele","dative-definite-genitive-plural":"jaluzelelor","singular-vocative":"jaluzea","plural-vocative":"jaluzelelor"}},{"word":"jaluzie","pos":"noun","definitions":["jalousie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jaluzie","accusative-definite-nominative-singular":"jaluzia","accusative-indefinite-nominative-plural":"jaluzii","accusative-definite-nominative-plural":"jaluziile","dative-genitive-indefinite-singular":"jaluzii","dative-definite-genitive-singular":"jaluziei","dative-genitive-indefinite-plural":"jaluzii","dative-definite-genitive-plural":"jaluziilor","singular-vocative":"jaluzie","plural-vocative":"jaluziilor"}},{"word":"jamaican","pos":"noun","definitions":["Jamaican"],"pronunciation":"/ʒa.majˈkan/","forms":{"plural":"jamaicani","feminine":"equivalent jamaicană"}},{"word":"jamaican","pos":"adj","definitions":["Jamaican"],"pronunciation":"/ʒa.majˈkan/","forms":{"feminine-singular":"jamaicană","masculine-plural":"jamaicani","feminine-neuter-plural":"jamaicane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jamaican","error-unrecognized-form-feminine-indefinite-singular":"jamaicană","error-unrecognized-form-indefinite-masculine-plural":"jamaicani","error-unrecognized-form-feminine-indefinite-neuter-plural":"jamaicane","definite-error-unrecognized-form-masculine-neuter-singular":"jamaicanul","definite-error-unrecognized-form-feminine-singular":"jamaicana","definite-error-unrecognized-form-masculine-plural":"jamaicanii","definite-error-unrecognized-form-feminine-neuter-plural":"jamaicanele"}},{"word":"jamaicană","pos":"noun","definitions":["female equivalent of jamaican"],"forms":{"plural":"jamaicane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jamaicană","accusative-definite-nominative-singular":"jamaicana","accusative-indefinite-nominative-plural":"jamaicane","accusative-definite-nominative-plural":"jamaicanele","dative-genitive-indefinite-singular":"jamaicane","dative-definite-genitive-singular":"jamaicanei","dative-genitive-indefinite-plural":"jamaicane","dative-definite-genitive-plural":"jamaicanelor","singular-vocative":"jamaicană","plural-vocative":"jamaicanelor"}},{"word":"jamaică","pos":"noun","definitions":["Jamaica rum"],"forms":{"plural":"jamaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jamaică","accusative-definite-nominative-singular":"jamaica","accusative-indefinite-nominative-plural":"jamaice","accusative-definite-nominative-plural":"jamaicele","dative-genitive-indefinite-singular":"jamaice","dative-definite-genitive-singular":"jamaicei","dative-genitive-indefinite-plural":"jamaice","dative-definite-genitive-plural":"jamaicelor","singular-vocative":"jamaică","plural-vocative":"jamaicelor"}},{"word":"jambieră","pos":"noun","definitions":["puttee"],"forms":{"plural":"jambiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jambieră","accusative-definite-nominative-singular":"jambiera","accusative-indefinite-nominative-plural":"jambiere","accusative-definite-nominative-plural":"jambierele","dative-genitive-indefinite-singular":"jambiere","dative-definite-genitive-singular":"jambierei","dative-genitive-indefinite-plural":"jambiere","dative-definite-genitive-plural":"jambierelor","singular-vocative":"jambieră","plural-vocative":"jambierelor"}},{"word":"jambon","pos":"noun","definitions":["ham"],"forms":{"plural":"jamboane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jambon","accusative-definite-nominative-singular":"jambonul","accusative-indefinite-nominative-plural":"jamboane","accusative-definite-nominative-plural":"jamboanele","dative-genitive-indefinite-singular":"jambon","dative-definite-genitive-singular":"jambonului","dative-genitive-indefinite-plural":"jamboane","dative-definite-genitive-plural":"jamboanelor","singular-vocative":"jambonule","plural-vocative":"jamboanelor"}},{"word":"jamboree","pos":"noun","definitions":["jamboree"],"forms":{"plural":"jamboree","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"jamboree","accusative-definite-nominative-singular":"jamboreea","accusative-indefinite-nominative-plural":"jamboree","accusative-definite-nominative-plural":"jamboreele","dative-genitive-indefinite-singular":"jamboree","dative-definite-genitive-singular":"jamboreei","dative-genitive-indefinite-plural":"jamboree","dative-definite-genitive-plural":"jamboreelor","singular-vocative":"jamboree","plural-vocative":"jamboreelor"}},{"word":"jamnă","pos":"noun","definitions":["Romanian barbel (Barbus petenyi)"],"forms":{"plural":"jamne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jamnă","accusative-definite-nominative-singular":"jamna","accusative-indefinite-nominative-plural":"jamne","accusative-definite-nominative-plural":"jamnele","dative-genitive-indefinite-singular":"jamne","dative-definite-genitive-singular":"jamnei","dative-genitive-indefinite-plural":"jamne","dative-definite-genitive-plural":"jamnelor","singular-vocative":"jamnă","plural-vocative":"jamnelor"}},{"word":"Jamu Mare","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Jamu Mare, Timiș County, Romania"],"gender":"m"},{"word":"janc","pos":"noun","definitions":["connection, bond, link, conjunction"],"forms":{"plural":"jancuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"janc","accusative-definite-nominative-singular":"jancul","accusative-indefinite-nominative-plural":"jancuri","accusative-definite-nominative-plural":"jancurile","dative-genitive-indefinite-singular":"janc","dative-definite-genitive-singular":"jancului","dative-genitive-indefinite-plural":"jancuri","dative-definite-genitive-plural":"jancurilor","singular-vocative":"jancule","plural-vocative":"jancurilor"}},{"word":"jandar","pos":"noun","definitions":["alternative form of jandarm"],"forms":{"plural":"jăndari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jandar","accusative-definite-nominative-singular":"jandarul","accusative-indefinite-nominative-plural":"jăndari","accusative-definite-nominative-plural":"jăndarii","dative-genitive-indefinite-singular":"jandar","dative-definite-genitive-singular":"jandarului","dative-genitive-indefinite-plural":"jăndari","dative-definite-genitive-plural":"jăndarilor","singular-vocative":"jandarule","plural-vocative":"jăndarilor"}},{"word":"jandarm","pos":"noun","definitions":["gendarme (member of the gendarmerie)","wife"],"pronunciation":"/ʒanˈdarm/","forms":{"plural":"jandarmi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jandarm","accusative-definite-nominative-singular":"jandarmul","accusative-indefinite-nominative-plural":"jandarmi","accusative-definite-nominative-plural":"jandarmii","dative-genitive-indefinite-singular":"jandarm","dative-definite-genitive-singular":"jandarmului","dative-genitive-indefinite-plural":"jandarmi","dative-definite-genitive-plural":"jandarmilor","singular-vocative":"jandarmule","plural-vocative":"jandarmilor","alternative-common":"jandar"}},{"word":"jandarmeresc","pos":"adj","definitions":["gendarme"],"forms":{"feminine-singular":"jandarmerească","plural":"jandarmerești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jandarmeresc","error-unrecognized-form-feminine-indefinite-singular":"jandarmerească","error-unrecognized-form-indefinite-masculine-plural":"jandarmerești","error-unrecognized-form-feminine-indefinite-neuter-plural":"jandarmerești","definite-error-unrecognized-form-masculine-neuter-singular":"jandarmerescul","definite-error-unrecognized-form-feminine-singular":"jandarmereasca","definite-error-unrecognized-form-masculine-plural":"jandarmereștii","definite-error-unrecognized-form-feminine-neuter-plural":"jandarmereștile"}},{"word":"jandarmerie","pos":"noun","definitions":["gendarmerie"],"forms":{"plural":"jandarmerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jandarmerie","accusative-definite-nominative-singular":"jandarmeria","accusative-indefinite-nominative-plural":"jandarmerii","accusative-definite-nominative-plural":"jandarmeriile","dative-genitive-indefinite-singular":"jandarmerii","dative-definite-genitive-singular":"jandarmeriei","dative-genitive-indefinite-plural":"jandarmerii","dative-definite-genitive-plural":"jandarmeriilor","singular-vocative":"jandarmerie","plural-vocative":"jandarmeriilor"}},{"word":"Jandarmu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Jandarmu"}},{"word":"janghină","pos":"noun","definitions":["a horse disease","term used as an insult"],"forms":{"plural":"janghine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"janghină","accusative-definite-nominative-singular":"janghina","accusative-indefinite-nominative-plural":"janghine","accusative-definite-nominative-plural":"janghinele","dative-genitive-indefinite-singular":"janghine","dative-definite-genitive-singular":"janghinei","dative-genitive-indefinite-plural":"janghine","dative-definite-genitive-plural":"janghinelor","singular-vocative":"janghină","plural-vocative":"janghinelor"}},{"word":"janghinos","pos":"adj","definitions":["dirty, unkempt"],"forms":{"feminine-singular":"janghinoasă","masculine-plural":"janghinoși","feminine-neuter-plural":"janghinoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"janghinos","error-unrecognized-form-feminine-indefinite-singular":"janghinoasă","error-unrecognized-form-indefinite-masculine-plural":"janghinoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"janghinoase","definite-error-unrecognized-form-masculine-neuter-singular":"janghinosul","definite-error-unrecognized-form-feminine-singular":"janghinoasa","definite-error-unrecognized-form-masculine-plural":"janghinoșii","definite-error-unrecognized-form-feminine-neuter-plural":"janghinoasele"}},{"word":"Jangu Bradului","pos":"name","definitions":["a river in Vâlcea County, Romania, tributary to the Pârâul Ștreaurilor"],"gender":"m"},{"word":"janilie","pos":"noun","definitions":["chenille"],"forms":{"plural":"janilii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"janilie","accusative-definite-nominative-singular":"janilieul","accusative-indefinite-nominative-plural":"janilii","accusative-definite-nominative-plural":"janiliile","dative-genitive-indefinite-singular":"janilie","dative-definite-genitive-singular":"janilieului","dative-genitive-indefinite-plural":"janilii","dative-definite-genitive-plural":"janiliilor","singular-vocative":"janilieule","plural-vocative":"janiliilor"}},{"word":"jansenism","pos":"noun","definitions":["Jansenism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jansenism","accusative-definite-nominative-singular":"jansenismul","accusative-indefinite-nominative-plural":"jansenisme","accusative-definite-nominative-plural":"jansenismele","dative-genitive-indefinite-singular":"jansenism","dative-definite-genitive-singular":"jansenismului","dative-genitive-indefinite-plural":"jansenisme","dative-definite-genitive-plural":"jansenismelor","singular-vocative":"jansenismule","plural-vocative":"jansenismelor"}},{"word":"jansenist","pos":"noun","definitions":["Jansenist"],"forms":{"plural":"janseniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jansenist","accusative-definite-nominative-singular":"jansenistul","accusative-indefinite-nominative-plural":"janseniști","accusative-definite-nominative-plural":"janseniștii","dative-genitive-indefinite-singular":"jansenist","dative-definite-genitive-singular":"jansenistului","dative-genitive-indefinite-plural":"janseniști","dative-definite-genitive-plural":"janseniștilor","singular-vocative":"jansenistule","plural-vocative":"janseniștilor"}},{"word":"jansenistă","pos":"noun","definitions":["female equivalent of jansenist"],"forms":{"plural":"janseniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jansenistă","accusative-definite-nominative-singular":"jansenista","accusative-indefinite-nominative-plural":"janseniste","accusative-definite-nominative-plural":"jansenistele","dative-genitive-indefinite-singular":"janseniste","dative-definite-genitive-singular":"jansenistei","dative-genitive-indefinite-plural":"janseniste","dative-definite-genitive-plural":"jansenistelor","singular-vocative":"jansenistă","plural-vocative":"jansenistelor"}},{"word":"janta","pos":"noun","definitions":["definite nominative/accusative singular of jantă"],"pronunciation":"[ˈʒanta]","gender":"f"},{"word":"jantă","pos":"noun","definitions":["wheel rim (car part)"],"forms":{"plural":"jante","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jantă","accusative-definite-nominative-singular":"janta","accusative-indefinite-nominative-plural":"jante","accusative-definite-nominative-plural":"jantele","dative-genitive-indefinite-singular":"jante","dative-definite-genitive-singular":"jantei","dative-genitive-indefinite-plural":"jante","dative-definite-genitive-plural":"jantelor","singular-vocative":"jantă","plural-vocative":"jantelor"}},{"word":"jante","pos":"noun","definitions":["inflection of jantă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈʒante]","gender":"f"},{"word":"jantei","pos":"noun","definitions":["definite genitive/dative singular of jantă"],"pronunciation":"[ˈʒantej]","gender":"f"},{"word":"janto","pos":"noun","definitions":["vocative singular of jantă"],"pronunciation":"[ˈʒanto]","gender":"f"},{"word":"jap","pos":"intj","definitions":["smack"]},{"word":"japanicesc","pos":"adj","definitions":["Japanese"],"forms":{"feminine-singular":"japanicească","plural":"japanicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"japanicesc","error-unrecognized-form-feminine-indefinite-singular":"japanicească","error-unrecognized-form-indefinite-masculine-plural":"japanicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"japanicești","definite-error-unrecognized-form-masculine-neuter-singular":"japanicescul","definite-error-unrecognized-form-feminine-singular":"japaniceasca","definite-error-unrecognized-form-masculine-plural":"japaniceștii","definite-error-unrecognized-form-feminine-neuter-plural":"japaniceștile"}},{"word":"japanologă","pos":"noun","definitions":["female equivalent of japanolog"],"forms":{"plural":"japanologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"japanologă","accusative-definite-nominative-singular":"japanologa","accusative-indefinite-nominative-plural":"japanologe","accusative-definite-nominative-plural":"japanologele","dative-genitive-indefinite-singular":"japanologe","dative-definite-genitive-singular":"japanologei","dative-genitive-indefinite-plural":"japanologe","dative-definite-genitive-plural":"japanologelor","singular-vocative":"japanologă","plural-vocative":"japanologelor"}},{"word":"japanologie","pos":"noun","definitions":["alternative form of japonologie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"japanologie","accusative-definite-nominative-singular":"japanologia","accusative-indefinite-nominative-plural":"japanologii","accusative-definite-nominative-plural":"japanologiile","dative-genitive-indefinite-singular":"japanologii","dative-definite-genitive-singular":"japanologiei","dative-genitive-indefinite-plural":"japanologii","dative-definite-genitive-plural":"japanologiilor","singular-vocative":"japanologie","plural-vocative":"japanologiilor"}},{"word":"japă","pos":"noun","definitions":["twig"],"forms":{"plural":"jape","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"japă","accusative-definite-nominative-singular":"japa","accusative-indefinite-nominative-plural":"jape","accusative-definite-nominative-plural":"japele","dative-genitive-indefinite-singular":"jape","dative-definite-genitive-singular":"japei","dative-genitive-indefinite-plural":"jape","dative-definite-genitive-plural":"japelor","singular-vocative":"japă","plural-vocative":"japelor"}},{"word":"japcă","pos":"noun","definitions":["thievery"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"japcă","accusative-definite-nominative":"japca","dative-genitive-indefinite":"japce","dative-definite-genitive":"japcei","vocative":"japcă"}},{"word":"japon","pos":"noun","definitions":["japanware (porcelain or silk)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"japon","accusative-definite-nominative":"japonul","dative-genitive-indefinite":"japon","dative-definite-genitive":"japonului","vocative":"japonule"}},{"word":"japonez","pos":"adj","definitions":["Japanese"],"pronunciation":"[ʒa.poˈnez]","forms":{"feminine-singular":"japoneză","masculine-plural":"japonezi","feminine-neuter-plural":"japoneze","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"japonez","error-unrecognized-form-feminine-indefinite-singular":"japoneză","error-unrecognized-form-indefinite-masculine-plural":"japonezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"japoneze","definite-error-unrecognized-form-masculine-neuter-singular":"japonezul","definite-error-unrecognized-form-feminine-singular":"japoneza","definite-error-unrecognized-form-masculine-plural":"japonezii","definite-error-unrecognized-form-feminine-neuter-plural":"japonezele"}},{"word":"japonez","pos":"noun","definitions":["a Japanese man"],"pronunciation":"[ʒa.poˈnez]","forms":{"plural":"japonezi","feminine":"equivalent japoneză","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"japonez","accusative-definite-nominative-singular":"japonezul","accusative-indefinite-nominative-plural":"japonezi","accusative-definite-nominative-plural":"japonezii","dative-genitive-indefinite-singular":"japonez","dative-definite-genitive-singular":"japonezului","dative-genitive-indefinite-plural":"japonezi","dative-definite-genitive-plural":"japonezilor","singular-vocative":"japonezule","plural-vocative":"japonezilor"}},{"word":"japoneză","pos":"adj","definitions":["nominative/accusative feminine singular of japonez"],"pronunciation":"/ʒapoˈnezə/"},{"word":"japoneză","pos":"noun","definitions":["a female Japanese person"],"pronunciation":"/ʒapoˈnezə/","forms":{"plural":"japoneze","masculine":"equivalent japonez","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"japoneză","accusative-definite-nominative-singular":"japoneza","accusative-indefinite-nominative-plural":"japoneze","accusative-definite-nominative-plural":"japonezele","dative-genitive-indefinite-singular":"japoneze","dative-definite-genitive-singular":"japonezei","dative-genitive-indefinite-plural":"japoneze","dative-definite-genitive-plural":"japonezelor","singular-vocative":"japoneză","plural-vocative":"japonezelor"}},{"word":"japoneză","pos":"noun","definitions":["the Japanese language"],"pronunciation":"/ʒapoˈnezə/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"japoneză","accusative-definite-nominative":"japoneza","dative-genitive-indefinite":"japoneze","dative-definite-genitive":"japonezei","vocative":"japoneză"}},{"word":"japonezi","pos":"noun","definitions":["plural of japonez"]},{"word":"Japonia","pos":"name","definitions":["Japan (a country and archipelago of East Asia)"],"gender":"f"},{"word":"japonism","pos":"noun","definitions":["Japonism"],"forms":{"plural":"japonisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"japonism","accusative-definite-nominative-singular":"japonismul","accusative-indefinite-nominative-plural":"japonisme","accusative-definite-nominative-plural":"japonismele","dative-genitive-indefinite-singular":"japonism","dative-definite-genitive-singular":"japonismului","dative-genitive-indefinite-plural":"japonisme","dative-definite-genitive-plural":"japonismelor","singular-vocative":"japonismule","plural-vocative":"japonismelor"}},{"word":"japonolog","pos":"noun","definitions":["Japanologist"],"forms":{"plural":"japonologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"japonolog","accusative-definite-nominative-singular":"japonologul","accusative-indefinite-nominative-plural":"japonologi","accusative-definite-nominative-plural":"japonologii","dative-genitive-indefinite-singular":"japonolog","dative-definite-genitive-singular":"japonologului","dative-genitive-indefinite-plural":"japonologi","dative-definite-genitive-plural":"japonologilor","singular-vocative":"japonologule","plural-vocative":"japonologilor"}},{"word":"japonologă","pos":"noun","definitions":["female equivalent of japonolog"],"forms":{"plural":"japonologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"japonologă","accusative-definite-nominative-singular":"japonologa","accusative-indefinite-nominative-plural":"japonologe","accusative-definite-nominative-plural":"japonologele","dative-genitive-indefinite-singular":"japonologe","dative-definite-genitive-singular":"japonologei","dative-genitive-indefinite-plural":"japonologe","dative-definite-genitive-plural":"japonologelor","singular-vocative":"japonologă","plural-vocative":"japonologelor"}},{"word":"japonologie","pos":"noun","definitions":["alternative form of japanologie"],"forms":{"plural":"japonologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"japonologie","accusative-definite-nominative-singular":"japonologia","accusative-indefinite-nominative-plural":"japonologii","accusative-definite-nominative-plural":"japonologiile","dative-genitive-indefinite-singular":"japonologii","dative-definite-genitive-singular":"japonologiei","dative-genitive-indefinite-plural":"japonologii","dative-definite-genitive-plural":"japonologiilor","singular-vocative":"japonologie","plural-vocative":"japonologiilor"}},{"word":"japsă","pos":"noun","definitions":["scorching heat"],"forms":{"plural":"japse","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"japsă","accusative-definite-nominative-singular":"japsa","accusative-indefinite-nominative-plural":"japse","accusative-definite-nominative-plural":"japsele","dative-genitive-indefinite-singular":"japse","dative-definite-genitive-singular":"japsei","dative-genitive-indefinite-plural":"japse","dative-definite-genitive-plural":"japselor","singular-vocative":"japsă","plural-vocative":"japselor"}},{"word":"jar","pos":"noun","definitions":["embers (glowing coal or wood)","intense heat, fire, glow"],"forms":{"plural":"jaruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jar","accusative-definite-nominative-singular":"jarul","accusative-indefinite-nominative-plural":"jaruri","accusative-definite-nominative-plural":"jarurile","dative-genitive-indefinite-singular":"jar","dative-definite-genitive-singular":"jarului","dative-genitive-indefinite-plural":"jaruri","dative-definite-genitive-plural":"jarurilor","singular-vocative":"jarule","plural-vocative":"jarurilor"}},{"word":"jarcalău","pos":"noun","definitions":["low-quality sheepskin waistcoat"],"forms":{"plural":"jarcalaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jarcalău","accusative-definite-nominative-singular":"jarcalăuul","accusative-indefinite-nominative-plural":"jarcalaie","accusative-definite-nominative-plural":"jarcalaiele","dative-genitive-indefinite-singular":"jarcalău","dative-definite-genitive-singular":"jarcalăuului","dative-genitive-indefinite-plural":"jarcalaie","dative-definite-genitive-plural":"jarcalaielor","singular-vocative":"jarcalăuule","plural-vocative":"jarcalaielor"}},{"word":"jarcalete","pos":"noun","definitions":["hooligan"],"forms":{"plural":"jarcaleți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jarcalete","accusative-definite-nominative-singular":"jarcaleteul","accusative-indefinite-nominative-plural":"jarcaleți","accusative-definite-nominative-plural":"jarcaleții","dative-genitive-indefinite-singular":"jarcalete","dative-definite-genitive-singular":"jarcaleteului","dative-genitive-indefinite-plural":"jarcaleți","dative-definite-genitive-plural":"jarcaleților","singular-vocative":"jarcaleteule","plural-vocative":"jarcaleților"}},{"word":"jarchină","pos":"noun","definitions":["shabby clothes"],"forms":{"plural":"jarchine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jarchină","accusative-definite-nominative-singular":"jarchina","accusative-indefinite-nominative-plural":"jarchine","accusative-definite-nominative-plural":"jarchinele","dative-genitive-indefinite-singular":"jarchine","dative-definite-genitive-singular":"jarchinei","dative-genitive-indefinite-plural":"jarchine","dative-definite-genitive-plural":"jarchinelor","singular-vocative":"jarchină","plural-vocative":"jarchinelor"}},{"word":"jardinieră","pos":"noun","definitions":["planter"],"forms":{"plural":"jardiniere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jardinieră","accusative-definite-nominative-singular":"jardiniera","accusative-indefinite-nominative-plural":"jardiniere","accusative-definite-nominative-plural":"jardinierele","dative-genitive-indefinite-singular":"jardiniere","dative-definite-genitive-singular":"jardinierei","dative-genitive-indefinite-plural":"jardiniere","dative-definite-genitive-plural":"jardinierelor","singular-vocative":"jardinieră","plural-vocative":"jardinierelor"}},{"word":"jaret","pos":"noun","definitions":["hock (joint)"],"forms":{"plural":"jarete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jaret","accusative-definite-nominative-singular":"jaretul","accusative-indefinite-nominative-plural":"jarete","accusative-definite-nominative-plural":"jaretele","dative-genitive-indefinite-singular":"jaret","dative-definite-genitive-singular":"jaretului","dative-genitive-indefinite-plural":"jarete","dative-definite-genitive-plural":"jaretelor","singular-vocative":"jaretule","plural-vocative":"jaretelor"}},{"word":"jaretieră","pos":"noun","definitions":["obsolete form of jartieră"],"forms":{"plural":"jaretiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jaretieră","accusative-definite-nominative-singular":"jaretiera","accusative-indefinite-nominative-plural":"jaretiere","accusative-definite-nominative-plural":"jaretierele","dative-genitive-indefinite-singular":"jaretiere","dative-definite-genitive-singular":"jaretierei","dative-genitive-indefinite-plural":"jaretiere","dative-definite-genitive-plural":"jaretierelor","singular-vocative":"jaretieră","plural-vocative":"jaretierelor"}},{"word":"jargoane","pos":"noun","definitions":["plural of jargon"]},{"word":"jargon","pos":"noun","definitions":["jargon, slang"],"forms":{"plural":"jargoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jargon","accusative-definite-nominative-singular":"jargonul","accusative-indefinite-nominative-plural":"jargoane","accusative-definite-nominative-plural":"jargoanele","dative-genitive-indefinite-singular":"jargon","dative-definite-genitive-singular":"jargonului","dative-genitive-indefinite-plural":"jargoane","dative-definite-genitive-plural":"jargoanelor","singular-vocative":"jargonule","plural-vocative":"jargoanelor"}},{"word":"jargonafazie","pos":"noun","definitions":["jargon aphasia"],"forms":{"plural":"jargonafazii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jargonafazie","accusative-definite-nominative-singular":"jargonafazia","accusative-indefinite-nominative-plural":"jargonafazii","accusative-definite-nominative-plural":"jargonafaziile","dative-genitive-indefinite-singular":"jargonafazii","dative-definite-genitive-singular":"jargonafaziei","dative-genitive-indefinite-plural":"jargonafazii","dative-definite-genitive-plural":"jargonafaziilor","singular-vocative":"jargonafazie","plural-vocative":"jargonafaziilor"}},{"word":"jariște","pos":"noun","definitions":["burning coals","burnt up place, especially a burnt up forest"],"forms":{"plural":"jariști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jariște","accusative-definite-nominative-singular":"jariștea","accusative-indefinite-nominative-plural":"jariști","accusative-definite-nominative-plural":"jariștile","dative-genitive-indefinite-singular":"jariști","dative-definite-genitive-singular":"jariștii","dative-genitive-indefinite-plural":"jariști","dative-definite-genitive-plural":"jariștilor","singular-vocative":"jariște","plural-vocative":"jariștilor"}},{"word":"jariștea","pos":"noun","definitions":["definite nominative/accusative singular of jariște"]},{"word":"Jariștea","pos":"name","definitions":["a commune of Vrancea County, Romania","a village in Jariștea, Vrancea County, Romania"],"gender":"f"},{"word":"Jariștea Mare","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Mândra"],"gender":"f"},{"word":"Jariștea Mică","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Mândra"],"gender":"f"},{"word":"Jaroștea","pos":"name","definitions":["a village in Glăvile, Vâlcea County, Romania"],"gender":"f"},{"word":"jartea","pos":"noun","definitions":["garter"],"forms":{"plural":"jartele","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"jartea","accusative-definite-nominative-singular":"jarteaua","accusative-indefinite-nominative-plural":"jartele","accusative-definite-nominative-plural":"jartelele","dative-genitive-indefinite-singular":"jartele","dative-definite-genitive-singular":"jartelei","dative-genitive-indefinite-plural":"jartele","dative-definite-genitive-plural":"jartelelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"jartelă","pos":"noun","definitions":["alternative form of jartea"],"forms":{"plural":"jartele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jartelă","accusative-definite-nominative-singular":"jartela","accusative-indefinite-nominative-plural":"jartele","accusative-definite-nominative-plural":"jartelele","dative-genitive-indefinite-singular":"jartele","dative-definite-genitive-singular":"jartelei","dative-genitive-indefinite-plural":"jartele","dative-definite-genitive-plural":"jartelelor","singular-vocative":"jartelă","plural-vocative":"jartelelor"}},{"word":"jartieră","pos":"noun","definitions":["garter"],"forms":{"plural":"jartiere"}},{"word":"jasmin","pos":"noun","definitions":["jasmine"],"forms":{"plural":"jasmini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jasmin","accusative-definite-nominative-singular":"jasminul","accusative-indefinite-nominative-plural":"jasmini","accusative-definite-nominative-plural":"jasminii","dative-genitive-indefinite-singular":"jasmin","dative-definite-genitive-singular":"jasminului","dative-genitive-indefinite-plural":"jasmini","dative-definite-genitive-plural":"jasminilor","singular-vocative":"jasminule","plural-vocative":"jasminilor"}},{"word":"jasp","pos":"noun","definitions":["jasper"],"pronunciation":"/ʒasp/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jasp","accusative-definite-nominative":"jaspul","dative-genitive-indefinite":"jasp","dative-definite-genitive":"jaspului","vocative":"jaspule"}},{"word":"javanez","pos":"noun","definitions":["Javanese"],"forms":{"plural":"javanezi","feminine":"equivalent javaneză","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"javanez","accusative-definite-nominative-singular":"javanezul","accusative-indefinite-nominative-plural":"javanezi","accusative-definite-nominative-plural":"javanezii","dative-genitive-indefinite-singular":"javanez","dative-definite-genitive-singular":"javanezului","dative-genitive-indefinite-plural":"javanezi","dative-definite-genitive-plural":"javanezilor","singular-vocative":"javanezule","plural-vocative":"javanezilor"}},{"word":"javaneză","pos":"noun","definitions":["female equivalent of javanez"],"forms":{"plural":"javaneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"javaneză","accusative-definite-nominative-singular":"javaneza","accusative-indefinite-nominative-plural":"javaneze","accusative-definite-nominative-plural":"javanezele","dative-genitive-indefinite-singular":"javaneze","dative-definite-genitive-singular":"javanezei","dative-genitive-indefinite-plural":"javaneze","dative-definite-genitive-plural":"javanezelor","singular-vocative":"javaneză","plural-vocative":"javanezelor"}},{"word":"javart","pos":"noun","definitions":["windgall, windpuff"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"javart","accusative-definite-nominative":"javartul","dative-genitive-indefinite":"javart","dative-definite-genitive":"javartului","vocative":"javartule"}},{"word":"javelină","pos":"noun","definitions":["javelin"],"forms":{"plural":"javeline","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"javelină","accusative-definite-nominative-singular":"javelina","accusative-indefinite-nominative-plural":"javeline","accusative-definite-nominative-plural":"javelinele","dative-genitive-indefinite-singular":"javeline","dative-definite-genitive-singular":"javelinei","dative-genitive-indefinite-plural":"javeline","dative-definite-genitive-plural":"javelinelor","singular-vocative":"javelină","plural-vocative":"javelinelor"}},{"word":"javeliza","pos":"verb","definitions":["to chlorinate"],"forms":{"canonical":"a javeliza 1st conjugation","present-singular-third-person":"javelizează","participle-past":"javelizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a javeliza","gerund":"javelizând","first-person-indicative-present-singular":"javelizez","indicative-present-second-person-singular":"javelizezi","indicative-present-singular-third-person":"javelizează","first-person-indicative-plural-present":"javelizăm","indicative-plural-present-second-person":"javelizați","indicative-plural-present-third-person":"javelizează","first-person-imperfect-indicative-singular":"javelizam","imperfect-indicative-second-person-singular":"javelizai","imperfect-indicative-singular-third-person":"javeliza","first-person-imperfect-indicative-plural":"javelizam","imperfect-indicative-plural-second-person":"javelizați","imperfect-indicative-plural-third-person":"javelizau","first-person-indicative-perfect-singular":"javelizai","indicative-perfect-second-person-singular":"javelizași","indicative-perfect-singular-third-person":"javeliză","first-person-indicative-perfect-plural":"javelizarăm","indicative-perfect-plural-second-person":"javelizarăți","indicative-perfect-plural-third-person":"javelizară","first-person-indicative-pluperfect-singular":"javelizasem","indicative-pluperfect-second-person-singular":"javelizaseși","indicative-pluperfect-singular-third-person":"javelizase","first-person-indicative-pluperfect-plural":"javelizaserăm","indicative-pluperfect-plural-second-person":"javelizaserăți","indicative-pluperfect-plural-third-person":"javelizaseră","first-person-present-singular-subjunctive":"să javelizez","present-second-person-singular-subjunctive":"să javelizezi","present-singular-subjunctive-third-person":"să javelizeze","first-person-plural-present-subjunctive":"să javelizăm","plural-present-second-person-subjunctive":"să javelizați","plural-present-subjunctive-third-person":"să javelizeze","imperative-second-person-singular":"javelizează","imperative-plural-second-person":"javelizați","imperative-negative-second-person-singular":"nu javeliza","imperative-negative-plural-second-person":"nu javelizați"}},{"word":"javelizare","pos":"noun","definitions":["chlorination"],"forms":{"plural":"javelizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"javelizare","accusative-definite-nominative-singular":"javelizarea","accusative-indefinite-nominative-plural":"javelizări","accusative-definite-nominative-plural":"javelizările","dative-genitive-indefinite-singular":"javelizări","dative-definite-genitive-singular":"javelizării","dative-genitive-indefinite-plural":"javelizări","dative-definite-genitive-plural":"javelizărilor","singular-vocative":"javelizare","plural-vocative":"javelizărilor"}},{"word":"javră","pos":"noun","definitions":["cur, mutt, pooch (dog)","twerp"],"pronunciation":"/ˈʒavrə/","forms":{"plural":"javre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"javră","accusative-definite-nominative-singular":"javra","accusative-indefinite-nominative-plural":"javre","accusative-definite-nominative-plural":"javrele","dative-genitive-indefinite-singular":"javre","dative-definite-genitive-singular":"javrei","dative-genitive-indefinite-plural":"javre","dative-definite-genitive-plural":"javrelor","singular-vocative":"javră","plural-vocative":"javrelor"}},{"word":"jazman","pos":"noun","definitions":["jazzman"],"forms":{"plural":"jazmeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jazman","accusative-definite-nominative-singular":"jazmanul","accusative-indefinite-nominative-plural":"jazmeni","accusative-definite-nominative-plural":"jazmenii","dative-genitive-indefinite-singular":"jazman","dative-definite-genitive-singular":"jazmanului","dative-genitive-indefinite-plural":"jazmeni","dative-definite-genitive-plural":"jazmenilor","singular-vocative":"jazmanule","plural-vocative":"jazmenilor"}},{"word":"jazz","pos":"noun","definitions":["jazz (music style)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jazz","accusative-definite-nominative":"jazzul","dative-genitive-indefinite":"jazz","dative-definite-genitive":"jazzului","vocative":"jazzule"}},{"word":"jazzistic","pos":"adj","definitions":["jazzistic"],"forms":{"feminine-singular":"jazzistică","masculine-plural":"jazzistici","feminine-neuter-plural":"jazzistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jazzistic","error-unrecognized-form-feminine-indefinite-singular":"jazzistică","error-unrecognized-form-indefinite-masculine-plural":"jazzistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"jazzistice","definite-error-unrecognized-form-masculine-neuter-singular":"jazzisticul","definite-error-unrecognized-form-feminine-singular":"jazzistica","definite-error-unrecognized-form-masculine-plural":"jazzisticii","definite-error-unrecognized-form-feminine-neuter-plural":"jazzisticele"}},{"word":"jăbrăcie","pos":"noun","definitions":["vileness"],"forms":{"plural":"jăbrăcii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jăbrăcie","accusative-definite-nominative-singular":"jăbrăcia","accusative-indefinite-nominative-plural":"jăbrăcii","accusative-definite-nominative-plural":"jăbrăciile","dative-genitive-indefinite-singular":"jăbrăcii","dative-definite-genitive-singular":"jăbrăciei","dative-genitive-indefinite-plural":"jăbrăcii","dative-definite-genitive-plural":"jăbrăciilor","singular-vocative":"jăbrăcie","plural-vocative":"jăbrăciilor"}},{"word":"jăcaș","pos":"noun","definitions":["alternative form of jacaș"],"forms":{"plural":"jăcași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jăcaș","accusative-definite-nominative-singular":"jăcașul","accusative-indefinite-nominative-plural":"jăcași","accusative-definite-nominative-plural":"jăcașii","dative-genitive-indefinite-singular":"jăcaș","dative-definite-genitive-singular":"jăcașului","dative-genitive-indefinite-plural":"jăcași","dative-definite-genitive-plural":"jăcașilor","singular-vocative":"jăcașule","plural-vocative":"jăcașilor"}},{"word":"jăcman","pos":"noun","definitions":["thievery"],"forms":{"plural":"jăcmanuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jăcman","accusative-definite-nominative-singular":"jăcmanul","accusative-indefinite-nominative-plural":"jăcmanuri","accusative-definite-nominative-plural":"jăcmanurile","dative-genitive-indefinite-singular":"jăcman","dative-definite-genitive-singular":"jăcmanului","dative-genitive-indefinite-plural":"jăcmanuri","dative-definite-genitive-plural":"jăcmanurilor","singular-vocative":"jăcmanule","plural-vocative":"jăcmanurilor"}},{"word":"jăcmăneală","pos":"noun","definitions":["alternative form of jecmăneală"],"forms":{"plural":"jăcmăneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jăcmăneală","accusative-definite-nominative-singular":"jăcmăneala","accusative-indefinite-nominative-plural":"jăcmăneli","accusative-definite-nominative-plural":"jăcmănelile","dative-genitive-indefinite-singular":"jăcmăneli","dative-definite-genitive-singular":"jăcmănelii","dative-genitive-indefinite-plural":"jăcmăneli","dative-definite-genitive-plural":"jăcmănelilor","singular-vocative":"jăcmăneală","plural-vocative":"jăcmănelilor"}},{"word":"jăcmăni","pos":"verb","definitions":["alternative form of jecmăni"],"forms":{"canonical":"a jăcmăni 4th conjugation","present-singular-third-person":"jăcmănește","participle-past":"jăcmănit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jăcmăni","gerund":"jăcmănind","first-person-indicative-present-singular":"jăcmănesc","indicative-present-second-person-singular":"jăcmănești","indicative-present-singular-third-person":"jăcmănește","first-person-indicative-plural-present":"jăcmănim","indicative-plural-present-second-person":"jăcmăniți","indicative-plural-present-third-person":"jăcmănesc","first-person-imperfect-indicative-singular":"jăcmăneam","imperfect-indicative-second-person-singular":"jăcmăneai","imperfect-indicative-singular-third-person":"jăcmănea","first-person-imperfect-indicative-plural":"jăcmăneam","imperfect-indicative-plural-second-person":"jăcmăneați","imperfect-indicative-plural-third-person":"jăcmăneau","first-person-indicative-perfect-singular":"jăcmănii","indicative-perfect-second-person-singular":"jăcmăniși","indicative-perfect-singular-third-person":"jăcmăni","first-person-indicative-perfect-plural":"jăcmănirăm","indicative-perfect-plural-second-person":"jăcmănirăți","indicative-perfect-plural-third-person":"jăcmăniră","first-person-indicative-pluperfect-singular":"jăcmănisem","indicative-pluperfect-second-person-singular":"jăcmăniseși","indicative-pluperfect-singular-third-person":"jăcmănise","first-person-indicative-pluperfect-plural":"jăcmăniserăm","indicative-pluperfect-plural-second-person":"jăcmăniserăți","indicative-pluperfect-plural-third-person":"jăcmăniseră","first-person-present-singular-subjunctive":"să jăcmănesc","present-second-person-singular-subjunctive":"să jăcmănești","present-singular-subjunctive-third-person":"să jăcmănească","first-person-plural-present-subjunctive":"să jăcmănim","plural-present-second-person-subjunctive":"să jăcmăniți","plural-present-subjunctive-third-person":"să jăcmănească","imperative-second-person-singular":"jăcmănește","imperative-plural-second-person":"jăcmăniți","imperative-negative-second-person-singular":"nu jăcmăni","imperative-negative-plural-second-person":"nu jăcmăniți"}},{"word":"jăcui","pos":"verb","definitions":["obsolete form of jefui"],"forms":{"canonical":"a jăcui 4th conjugation","present-singular-third-person":"jăcuiește","participle-past":"jăcuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jăcui","gerund":"jăcuind","first-person-indicative-present-singular":"jăcuiesc","indicative-present-second-person-singular":"jăcuiești","indicative-present-singular-third-person":"jăcuiește","first-person-indicative-plural-present":"jăcuim","indicative-plural-present-second-person":"jăcuiți","indicative-plural-present-third-person":"jăcuiesc","first-person-imperfect-indicative-singular":"jăcuiam","imperfect-indicative-second-person-singular":"jăcuiai","imperfect-indicative-singular-third-person":"jăcuia","first-person-imperfect-indicative-plural":"jăcuiam","imperfect-indicative-plural-second-person":"jăcuiați","imperfect-indicative-plural-third-person":"jăcuiau","first-person-indicative-perfect-singular":"jăcuii","indicative-perfect-second-person-singular":"jăcuiși","indicative-perfect-singular-third-person":"jăcui","first-person-indicative-perfect-plural":"jăcuirăm","indicative-perfect-plural-second-person":"jăcuirăți","indicative-perfect-plural-third-person":"jăcuiră","first-person-indicative-pluperfect-singular":"jăcuisem","indicative-pluperfect-second-person-singular":"jăcuiseși","indicative-pluperfect-singular-third-person":"jăcuise","first-person-indicative-pluperfect-plural":"jăcuiserăm","indicative-pluperfect-plural-second-person":"jăcuiserăți","indicative-pluperfect-plural-third-person":"jăcuiseră","first-person-present-singular-subjunctive":"să jăcuiesc","present-second-person-singular-subjunctive":"să jăcuiești","present-singular-subjunctive-third-person":"să jăcuiască","first-person-plural-present-subjunctive":"să jăcuim","plural-present-second-person-subjunctive":"să jăcuiți","plural-present-subjunctive-third-person":"să jăcuiască","imperative-second-person-singular":"jăcuiește","imperative-plural-second-person":"jăcuiți","imperative-negative-second-person-singular":"nu jăcui","imperative-negative-plural-second-person":"nu jăcuiți"}},{"word":"jăcuire","pos":"noun","definitions":["obsolete form of jefuire"],"forms":{"plural":"jăcuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jăcuire","accusative-definite-nominative-singular":"jăcuirea","accusative-indefinite-nominative-plural":"jăcuiri","accusative-definite-nominative-plural":"jăcuirile","dative-genitive-indefinite-singular":"jăcuiri","dative-definite-genitive-singular":"jăcuirii","dative-genitive-indefinite-plural":"jăcuiri","dative-definite-genitive-plural":"jăcuirilor","singular-vocative":"jăcuire","plural-vocative":"jăcuirilor"}},{"word":"jăcuitor","pos":"noun","definitions":["obsolete form of jefuitor"],"forms":{"plural":"jăcuitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jăcuitor","accusative-definite-nominative-singular":"jăcuitorul","accusative-indefinite-nominative-plural":"jăcuitori","accusative-definite-nominative-plural":"jăcuitorii","dative-genitive-indefinite-singular":"jăcuitor","dative-definite-genitive-singular":"jăcuitorului","dative-genitive-indefinite-plural":"jăcuitori","dative-definite-genitive-plural":"jăcuitorilor","singular-vocative":"jăcuitorule","plural-vocative":"jăcuitorilor"}},{"word":"jăete","pos":"noun","definitions":["common minnow (Phoxinus phoxinus)"],"forms":{"plural":"jăeteți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jăete","accusative-definite-nominative-singular":"jăeteul","accusative-indefinite-nominative-plural":"jăeteți","accusative-definite-nominative-plural":"jăeteții","dative-genitive-indefinite-singular":"jăete","dative-definite-genitive-singular":"jăeteului","dative-genitive-indefinite-plural":"jăeteți","dative-definite-genitive-plural":"jăeteților","singular-vocative":"jăeteule","plural-vocative":"jăeteților"}},{"word":"jăfuire","pos":"noun","definitions":["obsolete form of jefuire"],"forms":{"plural":"jăfuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jăfuire","accusative-definite-nominative-singular":"jăfuirea","accusative-indefinite-nominative-plural":"jăfuiri","accusative-definite-nominative-plural":"jăfuirile","dative-genitive-indefinite-singular":"jăfuiri","dative-definite-genitive-singular":"jăfuirii","dative-genitive-indefinite-plural":"jăfuiri","dative-definite-genitive-plural":"jăfuirilor","singular-vocative":"jăfuire","plural-vocative":"jăfuirilor"}},{"word":"jălanie","pos":"noun","definitions":["obsolete form of jelanie"],"forms":{"plural":"jălanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jălanie","accusative-definite-nominative-singular":"jălania","accusative-indefinite-nominative-plural":"jălanii","accusative-definite-nominative-plural":"jălaniile","dative-genitive-indefinite-singular":"jălanii","dative-definite-genitive-singular":"jălaniei","dative-genitive-indefinite-plural":"jălanii","dative-definite-genitive-plural":"jălaniilor","singular-vocative":"jălanie","plural-vocative":"jălaniilor"}},{"word":"jălire","pos":"noun","definitions":["obsolete form of jelire"],"forms":{"plural":"jăliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jălire","accusative-definite-nominative-singular":"jălirea","accusative-indefinite-nominative-plural":"jăliri","accusative-definite-nominative-plural":"jălirile","dative-genitive-indefinite-singular":"jăliri","dative-definite-genitive-singular":"jălirii","dative-genitive-indefinite-plural":"jăliri","dative-definite-genitive-plural":"jălirilor","singular-vocative":"jălire","plural-vocative":"jălirilor"}},{"word":"jălțuiaș","pos":"noun","definitions":["diminutive of jelț"],"forms":{"plural":"jălțuiașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jălțuiaș","accusative-definite-nominative-singular":"jălțuiașul","accusative-indefinite-nominative-plural":"jălțuiașe","accusative-definite-nominative-plural":"jălțuiașele","dative-genitive-indefinite-singular":"jălțuiaș","dative-definite-genitive-singular":"jălțuiașului","dative-genitive-indefinite-plural":"jălțuiașe","dative-definite-genitive-plural":"jălțuiașelor","singular-vocative":"jălțuiașule","plural-vocative":"jălțuiașelor"}},{"word":"jăluire","pos":"noun","definitions":["obsolete form of jeluire"],"forms":{"plural":"jăluiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jăluire","accusative-definite-nominative-singular":"jăluirea","accusative-indefinite-nominative-plural":"jăluiri","accusative-definite-nominative-plural":"jăluirile","dative-genitive-indefinite-singular":"jăluiri","dative-definite-genitive-singular":"jăluirii","dative-genitive-indefinite-plural":"jăluiri","dative-definite-genitive-plural":"jăluirilor","singular-vocative":"jăluire","plural-vocative":"jăluirilor"}},{"word":"jăluitor","pos":"adj","definitions":["obsolete form of jeluitor"],"forms":{"feminine-singular":"jăluitoare","masculine-plural":"jăluitori","feminine-neuter-plural":"jăluitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jăluitor","error-unrecognized-form-feminine-indefinite-singular":"jăluitoare","error-unrecognized-form-indefinite-masculine-plural":"jăluitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"jăluitoare","definite-error-unrecognized-form-masculine-neuter-singular":"jăluitorul","definite-error-unrecognized-form-feminine-singular":"jăluitoarea","definite-error-unrecognized-form-masculine-plural":"jăluitorii","definite-error-unrecognized-form-feminine-neuter-plural":"jăluitoarele"}},{"word":"jăndar","pos":"noun","definitions":["obsolete form of jandarm"],"forms":{"plural":"jăndari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jăndar","accusative-definite-nominative-singular":"jăndarul","accusative-indefinite-nominative-plural":"jăndari","accusative-definite-nominative-plural":"jăndarii","dative-genitive-indefinite-singular":"jăndar","dative-definite-genitive-singular":"jăndarului","dative-genitive-indefinite-plural":"jăndari","dative-definite-genitive-plural":"jăndarilor","singular-vocative":"jăndarule","plural-vocative":"jăndarilor"}},{"word":"jăpcan","pos":"noun","definitions":["a predatory man"],"forms":{"plural":"jăpcani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jăpcan","accusative-definite-nominative-singular":"jăpcanul","accusative-indefinite-nominative-plural":"jăpcani","accusative-definite-nominative-plural":"jăpcanii","dative-genitive-indefinite-singular":"jăpcan","dative-definite-genitive-singular":"jăpcanului","dative-genitive-indefinite-plural":"jăpcani","dative-definite-genitive-plural":"jăpcanilor","singular-vocative":"jăpcanule","plural-vocative":"jăpcanilor"}},{"word":"jăpcaș","pos":"noun","definitions":["thief"],"forms":{"plural":"jăpcași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jăpcaș","accusative-definite-nominative-singular":"jăpcașul","accusative-indefinite-nominative-plural":"jăpcași","accusative-definite-nominative-plural":"jăpcașii","dative-genitive-indefinite-singular":"jăpcaș","dative-definite-genitive-singular":"jăpcașului","dative-genitive-indefinite-plural":"jăpcași","dative-definite-genitive-plural":"jăpcașilor","singular-vocative":"jăpcașule","plural-vocative":"jăpcașilor"}},{"word":"jăpcăneală","pos":"noun","definitions":["robbery"],"forms":{"plural":"jăpcăneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jăpcăneală","accusative-definite-nominative-singular":"jăpcăneala","accusative-indefinite-nominative-plural":"jăpcănele","accusative-definite-nominative-plural":"jăpcănelele","dative-genitive-indefinite-singular":"jăpcănele","dative-definite-genitive-singular":"jăpcănelei","dative-genitive-indefinite-plural":"jăpcănele","dative-definite-genitive-plural":"jăpcănelelor","singular-vocative":"jăpcăneală","plural-vocative":"jăpcănelelor"}},{"word":"jăpcănire","pos":"noun","definitions":["robbery"],"forms":{"plural":"jăpcăniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jăpcănire","accusative-definite-nominative-singular":"jăpcănirea","accusative-indefinite-nominative-plural":"jăpcăniri","accusative-definite-nominative-plural":"jăpcănirile","dative-genitive-indefinite-singular":"jăpcăniri","dative-definite-genitive-singular":"jăpcănirii","dative-genitive-indefinite-plural":"jăpcăniri","dative-definite-genitive-plural":"jăpcănirilor","singular-vocative":"jăpcănire","plural-vocative":"jăpcănirilor"}},{"word":"jăpcănit","pos":"adj","definitions":["robbed"],"forms":{"feminine-singular":"jăpcănită","masculine-plural":"jăpcăniți","feminine-neuter-plural":"jăpcănite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jăpcănit","error-unrecognized-form-feminine-indefinite-singular":"jăpcănită","error-unrecognized-form-indefinite-masculine-plural":"jăpcăniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jăpcănite","definite-error-unrecognized-form-masculine-neuter-singular":"jăpcănitul","definite-error-unrecognized-form-feminine-singular":"jăpcănita","definite-error-unrecognized-form-masculine-plural":"jăpcăniții","definite-error-unrecognized-form-feminine-neuter-plural":"jăpcănitele"}},{"word":"jăpcănit","pos":"verb","definitions":["past participle of jăpcăni"],"forms":{"participle-past":"of jăpcăni"}},{"word":"jăratec","pos":"noun","definitions":["alternative form of jăratic"]},{"word":"jăratic","pos":"noun","definitions":["embers"],"pronunciation":"/ʒəˈra.tik/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jăratic","accusative-definite-nominative":"jăraticul","dative-genitive-indefinite":"jăratic","dative-definite-genitive":"jăraticului","vocative":"jăraticule","alternative":"jăratec"}},{"word":"Jăratic","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jăratic"}},{"word":"jărăgai","pos":"noun","definitions":["burning coals"],"forms":{"plural":"jărăgaiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jărăgai","accusative-definite-nominative-singular":"jărăgaiul","accusative-indefinite-nominative-plural":"jărăgaiuri","accusative-definite-nominative-plural":"jărăgaiurile","dative-genitive-indefinite-singular":"jărăgai","dative-definite-genitive-singular":"jărăgaiului","dative-genitive-indefinite-plural":"jărăgaiuri","dative-definite-genitive-plural":"jărăgaiurilor","singular-vocative":"jărăgaiule","plural-vocative":"jărăgaiurilor"}},{"word":"jărdie","pos":"noun","definitions":["alternative form of jordie"],"forms":{"plural":"jărdii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jărdie","accusative-definite-nominative-singular":"jărdia","accusative-indefinite-nominative-plural":"jărdii","accusative-definite-nominative-plural":"jărdiile","dative-genitive-indefinite-singular":"jărdii","dative-definite-genitive-singular":"jărdiei","dative-genitive-indefinite-plural":"jărdii","dative-definite-genitive-plural":"jărdiilor","singular-vocative":"jărdie","plural-vocative":"jărdiilor"}},{"word":"jări","pos":"verb","definitions":["to stir the burning coals"],"forms":{"canonical":"a jări 4th conjugation","present-singular-third-person":"jărește","participle-past":"jărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jări","gerund":"jărind","first-person-indicative-present-singular":"jăresc","indicative-present-second-person-singular":"jărești","indicative-present-singular-third-person":"jărește","first-person-indicative-plural-present":"jărim","indicative-plural-present-second-person":"jăriți","indicative-plural-present-third-person":"jăresc","first-person-imperfect-indicative-singular":"jăream","imperfect-indicative-second-person-singular":"jăreai","imperfect-indicative-singular-third-person":"jărea","first-person-imperfect-indicative-plural":"jăream","imperfect-indicative-plural-second-person":"jăreați","imperfect-indicative-plural-third-person":"jăreau","first-person-indicative-perfect-singular":"jării","indicative-perfect-second-person-singular":"jăriși","indicative-perfect-singular-third-person":"jări","first-person-indicative-perfect-plural":"jărirăm","indicative-perfect-plural-second-person":"jărirăți","indicative-perfect-plural-third-person":"jăriră","first-person-indicative-pluperfect-singular":"jărisem","indicative-pluperfect-second-person-singular":"jăriseși","indicative-pluperfect-singular-third-person":"jărise","first-person-indicative-pluperfect-plural":"jăriserăm","indicative-pluperfect-plural-second-person":"jăriserăți","indicative-pluperfect-plural-third-person":"jăriseră","first-person-present-singular-subjunctive":"să jăresc","present-second-person-singular-subjunctive":"să jărești","present-singular-subjunctive-third-person":"să jărească","first-person-plural-present-subjunctive":"să jărim","plural-present-second-person-subjunctive":"să jăriți","plural-present-subjunctive-third-person":"să jărească","imperative-second-person-singular":"jărește","imperative-plural-second-person":"jăriți","imperative-negative-second-person-singular":"nu jări","imperative-negative-plural-second-person":"nu jăriți"}},{"word":"jăriște","pos":"noun","definitions":["obsolete form of jariște"],"forms":{"plural":"jăriști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jăriște","accusative-definite-nominative-singular":"jăriștea","accusative-indefinite-nominative-plural":"jăriști","accusative-definite-nominative-plural":"jăriștile","dative-genitive-indefinite-singular":"jăriști","dative-definite-genitive-singular":"jăriștii","dative-genitive-indefinite-plural":"jăriști","dative-definite-genitive-plural":"jăriștilor","singular-vocative":"jăriște","plural-vocative":"jăriștilor"}},{"word":"Jărosul","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Orăștie"],"gender":"m"},{"word":"jărtfire","pos":"noun","definitions":["obsolete form of jertfire"],"forms":{"plural":"jărtfiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jărtfire","accusative-definite-nominative-singular":"jărtfirea","accusative-indefinite-nominative-plural":"jărtfiri","accusative-definite-nominative-plural":"jărtfirile","dative-genitive-indefinite-singular":"jărtfiri","dative-definite-genitive-singular":"jărtfirii","dative-genitive-indefinite-plural":"jărtfiri","dative-definite-genitive-plural":"jărtfirilor","singular-vocative":"jărtfire","plural-vocative":"jărtfirilor"}},{"word":"jărtvă","pos":"noun","definitions":["obsolete form of jertfă"],"forms":{"plural":"jărtve","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jărtvă","accusative-definite-nominative-singular":"jărtva","accusative-indefinite-nominative-plural":"jărtve","accusative-definite-nominative-plural":"jărtvele","dative-genitive-indefinite-singular":"jărtve","dative-definite-genitive-singular":"jărtvei","dative-genitive-indefinite-plural":"jărtve","dative-definite-genitive-plural":"jărtvelor","singular-vocative":"jărtvă","plural-vocative":"jărtvelor"}},{"word":"jărtvire","pos":"noun","definitions":["obsolete form of jertfire"],"forms":{"plural":"jărtviri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jărtvire","accusative-definite-nominative-singular":"jărtvirea","accusative-indefinite-nominative-plural":"jărtviri","accusative-definite-nominative-plural":"jărtvirile","dative-genitive-indefinite-singular":"jărtviri","dative-definite-genitive-singular":"jărtvirii","dative-genitive-indefinite-plural":"jărtviri","dative-definite-genitive-plural":"jărtvirilor","singular-vocative":"jărtvire","plural-vocative":"jărtvirilor"}},{"word":"jărui","pos":"verb","definitions":["to stir the burning coals"],"forms":{"canonical":"a jărui 4th conjugation","present-singular-third-person":"jăruiește","participle-past":"jăruit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jărui","gerund":"jăruind","first-person-indicative-present-singular":"jăruiesc","indicative-present-second-person-singular":"jăruiești","indicative-present-singular-third-person":"jăruiește","first-person-indicative-plural-present":"jăruim","indicative-plural-present-second-person":"jăruiți","indicative-plural-present-third-person":"jăruiesc","first-person-imperfect-indicative-singular":"jăruiam","imperfect-indicative-second-person-singular":"jăruiai","imperfect-indicative-singular-third-person":"jăruia","first-person-imperfect-indicative-plural":"jăruiam","imperfect-indicative-plural-second-person":"jăruiați","imperfect-indicative-plural-third-person":"jăruiau","first-person-indicative-perfect-singular":"jăruii","indicative-perfect-second-person-singular":"jăruiși","indicative-perfect-singular-third-person":"jărui","first-person-indicative-perfect-plural":"jăruirăm","indicative-perfect-plural-second-person":"jăruirăți","indicative-perfect-plural-third-person":"jăruiră","first-person-indicative-pluperfect-singular":"jăruisem","indicative-pluperfect-second-person-singular":"jăruiseși","indicative-pluperfect-singular-third-person":"jăruise","first-person-indicative-pluperfect-plural":"jăruiserăm","indicative-pluperfect-plural-second-person":"jăruiserăți","indicative-pluperfect-plural-third-person":"jăruiseră","first-person-present-singular-subjunctive":"să jăruiesc","present-second-person-singular-subjunctive":"să jăruiești","present-singular-subjunctive-third-person":"să jăruiască","first-person-plural-present-subjunctive":"să jăruim","plural-present-second-person-subjunctive":"să jăruiți","plural-present-subjunctive-third-person":"să jăruiască","imperative-second-person-singular":"jăruiește","imperative-plural-second-person":"jăruiți","imperative-negative-second-person-singular":"nu jărui","imperative-negative-plural-second-person":"nu jăruiți"}},{"word":"jăț","pos":"noun","definitions":["obsolete form of jeț"],"forms":{"plural":"jățuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jăț","accusative-definite-nominative-singular":"jățul","accusative-indefinite-nominative-plural":"jățuri","accusative-definite-nominative-plural":"jățurile","dative-genitive-indefinite-singular":"jăț","dative-definite-genitive-singular":"jățului","dative-genitive-indefinite-plural":"jățuri","dative-definite-genitive-plural":"jățurilor","singular-vocative":"jățule","plural-vocative":"jățurilor"}},{"word":"jâlț","pos":"noun","definitions":["obsolete form of jeț"],"forms":{"plural":"jâlțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jâlț","accusative-definite-nominative-singular":"jâlțul","accusative-indefinite-nominative-plural":"jâlțuri","accusative-definite-nominative-plural":"jâlțurile","dative-genitive-indefinite-singular":"jâlț","dative-definite-genitive-singular":"jâlțului","dative-genitive-indefinite-plural":"jâlțuri","dative-definite-genitive-plural":"jâlțurilor","singular-vocative":"jâlțule","plural-vocative":"jâlțurilor"}},{"word":"jâmblăcaș","pos":"noun","definitions":["semolina"],"forms":{"plural":"jâmblăcașuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jâmblăcaș","accusative-definite-nominative-singular":"jâmblăcașul","accusative-indefinite-nominative-plural":"jâmblăcașuri","accusative-definite-nominative-plural":"jâmblăcașurile","dative-genitive-indefinite-singular":"jâmblăcaș","dative-definite-genitive-singular":"jâmblăcașului","dative-genitive-indefinite-plural":"jâmblăcașuri","dative-definite-genitive-plural":"jâmblăcașurilor","singular-vocative":"jâmblăcașule","plural-vocative":"jâmblăcașurilor"}},{"word":"jârtvă","pos":"noun","definitions":["obsolete form of jertfă"],"forms":{"plural":"jârtve","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jârtvă","accusative-definite-nominative-singular":"jârtva","accusative-indefinite-nominative-plural":"jârtve","accusative-definite-nominative-plural":"jârtvele","dative-genitive-indefinite-singular":"jârtve","dative-definite-genitive-singular":"jârtvei","dative-genitive-indefinite-plural":"jârtve","dative-definite-genitive-plural":"jârtvelor","singular-vocative":"jârtvă","plural-vocative":"jârtvelor"}},{"word":"jbranț","pos":"noun","definitions":["connection, bond, link, conjunction"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jbranț","accusative-definite-nominative":"jbranțul","dative-genitive-indefinite":"jbranț","dative-definite-genitive":"jbranțului","vocative":"jbranțule"}},{"word":"jder","pos":"noun","definitions":["marten"],"pronunciation":"/ʒder/","forms":{"plural":"jderi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jder","accusative-definite-nominative-singular":"jderul","accusative-indefinite-nominative-plural":"jderi","accusative-definite-nominative-plural":"jderii","dative-genitive-indefinite-singular":"jder","dative-definite-genitive-singular":"jderului","dative-genitive-indefinite-plural":"jderi","dative-definite-genitive-plural":"jderilor","singular-vocative":"jderule","plural-vocative":"jderilor"}},{"word":"Jder","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jder"}},{"word":"Jderiu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jderiu"}},{"word":"Jderoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Jderoiu"}},{"word":"Jderu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jderu"}},{"word":"Jdimir","pos":"name","definitions":["a river in Caraș-Severin County, Romania, tributary to the Bistra Mărului"],"gender":"m"},{"word":"Jdioara","pos":"name","definitions":["a village in Criciova, Timiș County, Romania"],"gender":"f"},{"word":"jdior","pos":"noun","definitions":["marten"],"forms":{"plural":"jdiori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jdior","accusative-definite-nominative-singular":"jdiorul","accusative-indefinite-nominative-plural":"jdiori","accusative-definite-nominative-plural":"jdiorii","dative-genitive-indefinite-singular":"jdior","dative-definite-genitive-singular":"jdiorului","dative-genitive-indefinite-plural":"jdiori","dative-definite-genitive-plural":"jdiorilor","singular-vocative":"jdiorule","plural-vocative":"jdiorilor"}},{"word":"jeanși","pos":"noun","definitions":["alternative form of jeans"],"forms":{"plural":"jeanși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jeanși","accusative-definite-nominative-singular":"jeanșiul","accusative-indefinite-nominative-plural":"jeanși","accusative-definite-nominative-plural":"jeanșii","dative-genitive-indefinite-singular":"jeanși","dative-definite-genitive-singular":"jeanșiului","dative-genitive-indefinite-plural":"jeanși","dative-definite-genitive-plural":"jeanșilor","singular-vocative":"jeanșiule","plural-vocative":"jeanșilor"}},{"word":"jeb","pos":"noun","definitions":["pocket"],"forms":{"plural":"jeburi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jeb","accusative-definite-nominative-singular":"jebul","accusative-indefinite-nominative-plural":"jeburi","accusative-definite-nominative-plural":"jeburile","dative-genitive-indefinite-singular":"jeb","dative-definite-genitive-singular":"jebului","dative-genitive-indefinite-plural":"jeburi","dative-definite-genitive-plural":"jeburilor","singular-vocative":"jebule","plural-vocative":"jeburilor"}},{"word":"Jebeleanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jebeleanu"}},{"word":"Jebuc","pos":"name","definitions":["a river in Sălaj, Romania, tributary to the Almaș"],"gender":"m"},{"word":"Jebucu","pos":"name","definitions":["a village in Almașu, Sălaj County, Romania"],"gender":"m"},{"word":"jecmăneală","pos":"noun","definitions":["plunder"],"forms":{"plural":"jecmăneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jecmăneală","accusative-definite-nominative-singular":"jecmăneala","accusative-indefinite-nominative-plural":"jecmăneli","accusative-definite-nominative-plural":"jecmănelile","dative-genitive-indefinite-singular":"jecmăneli","dative-definite-genitive-singular":"jecmănelii","dative-genitive-indefinite-plural":"jecmăneli","dative-definite-genitive-plural":"jecmănelilor","singular-vocative":"jecmăneală","plural-vocative":"jecmănelilor"}},{"word":"jecmăni","pos":"verb","definitions":["to extort"],"forms":{"canonical":"a jecmăni 4th conjugation","present-singular-third-person":"jecmănește","participle-past":"jecmănit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jecmăni","gerund":"jecmănind","first-person-indicative-present-singular":"jecmănesc","indicative-present-second-person-singular":"jecmănești","indicative-present-singular-third-person":"jecmănește","first-person-indicative-plural-present":"jecmănim","indicative-plural-present-second-person":"jecmăniți","indicative-plural-present-third-person":"jecmănesc","first-person-imperfect-indicative-singular":"jecmăneam","imperfect-indicative-second-person-singular":"jecmăneai","imperfect-indicative-singular-third-person":"jecmănea","first-person-imperfect-indicative-plural":"jecmăneam","imperfect-indicative-plural-second-person":"jecmăneați","imperfect-indicative-plural-third-person":"jecmăneau","first-person-indicative-perfect-singular":"jecmănii","indicative-perfect-second-person-singular":"jecmăniși","indicative-perfect-singular-third-person":"jecmăni","first-person-indicative-perfect-plural":"jecmănirăm","indicative-perfect-plural-second-person":"jecmănirăți","indicative-perfect-plural-third-person":"jecmăniră","first-person-indicative-pluperfect-singular":"jecmănisem","indicative-pluperfect-second-person-singular":"jecmăniseși","indicative-pluperfect-singular-third-person":"jecmănise","first-person-indicative-pluperfect-plural":"jecmăniserăm","indicative-pluperfect-plural-second-person":"jecmăniserăți","indicative-pluperfect-plural-third-person":"jecmăniseră","first-person-present-singular-subjunctive":"să jecmănesc","present-second-person-singular-subjunctive":"să jecmănești","present-singular-subjunctive-third-person":"să jecmănească","first-person-plural-present-subjunctive":"să jecmănim","plural-present-second-person-subjunctive":"să jecmăniți","plural-present-subjunctive-third-person":"să jecmănească","imperative-second-person-singular":"jecmănește","imperative-plural-second-person":"jecmăniți","imperative-negative-second-person-singular":"nu jecmăni","imperative-negative-plural-second-person":"nu jecmăniți"}},{"word":"jecmănie","pos":"noun","definitions":["robbery"],"forms":{"plural":"jecmănii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jecmănie","accusative-definite-nominative-singular":"jecmănia","accusative-indefinite-nominative-plural":"jecmănii","accusative-definite-nominative-plural":"jecmăniile","dative-genitive-indefinite-singular":"jecmănii","dative-definite-genitive-singular":"jecmăniei","dative-genitive-indefinite-plural":"jecmănii","dative-definite-genitive-plural":"jecmăniilor","singular-vocative":"jecmănie","plural-vocative":"jecmăniilor"}},{"word":"jecmănire","pos":"noun","definitions":["extortion"],"forms":{"plural":"jecmăniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jecmănire","accusative-definite-nominative-singular":"jecmănirea","accusative-indefinite-nominative-plural":"jecmăniri","accusative-definite-nominative-plural":"jecmănirile","dative-genitive-indefinite-singular":"jecmăniri","dative-definite-genitive-singular":"jecmănirii","dative-genitive-indefinite-plural":"jecmăniri","dative-definite-genitive-plural":"jecmănirilor","singular-vocative":"jecmănire","plural-vocative":"jecmănirilor"}},{"word":"jecmănitor","pos":"noun","definitions":["robber"],"forms":{"plural":"jecmănitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jecmănitor","accusative-definite-nominative-singular":"jecmănitorul","accusative-indefinite-nominative-plural":"jecmănitori","accusative-definite-nominative-plural":"jecmănitorii","dative-genitive-indefinite-singular":"jecmănitor","dative-definite-genitive-singular":"jecmănitorului","dative-genitive-indefinite-plural":"jecmănitori","dative-definite-genitive-plural":"jecmănitorilor","singular-vocative":"jecmănitorule","plural-vocative":"jecmănitorilor"}},{"word":"jecui","pos":"verb","definitions":["alternative form of jefui"],"forms":{"canonical":"a jecui 4th conjugation","present-singular-third-person":"jecuiește","participle-past":"jecuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jecui","gerund":"jecuind","first-person-indicative-present-singular":"jecuiesc","indicative-present-second-person-singular":"jecuiești","indicative-present-singular-third-person":"jecuiește","first-person-indicative-plural-present":"jecuim","indicative-plural-present-second-person":"jecuiți","indicative-plural-present-third-person":"jecuiesc","first-person-imperfect-indicative-singular":"jecuiam","imperfect-indicative-second-person-singular":"jecuiai","imperfect-indicative-singular-third-person":"jecuia","first-person-imperfect-indicative-plural":"jecuiam","imperfect-indicative-plural-second-person":"jecuiați","imperfect-indicative-plural-third-person":"jecuiau","first-person-indicative-perfect-singular":"jecuii","indicative-perfect-second-person-singular":"jecuiși","indicative-perfect-singular-third-person":"jecui","first-person-indicative-perfect-plural":"jecuirăm","indicative-perfect-plural-second-person":"jecuirăți","indicative-perfect-plural-third-person":"jecuiră","first-person-indicative-pluperfect-singular":"jecuisem","indicative-pluperfect-second-person-singular":"jecuiseși","indicative-pluperfect-singular-third-person":"jecuise","first-person-indicative-pluperfect-plural":"jecuiserăm","indicative-pluperfect-plural-second-person":"jecuiserăți","indicative-pluperfect-plural-third-person":"jecuiseră","first-person-present-singular-subjunctive":"să jecuiesc","present-second-person-singular-subjunctive":"să jecuiești","present-singular-subjunctive-third-person":"să jecuiască","first-person-plural-present-subjunctive":"să jecuim","plural-present-second-person-subjunctive":"să jecuiți","plural-present-subjunctive-third-person":"să jecuiască","imperative-second-person-singular":"jecuiește","imperative-plural-second-person":"jecuiți","imperative-negative-second-person-singular":"nu jecui","imperative-negative-plural-second-person":"nu jecuiți"}},{"word":"jecuire","pos":"noun","definitions":["alternative form of jefuire"],"forms":{"plural":"jecuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jecuire","accusative-definite-nominative-singular":"jecuirea","accusative-indefinite-nominative-plural":"jecuiri","accusative-definite-nominative-plural":"jecuirile","dative-genitive-indefinite-singular":"jecuiri","dative-definite-genitive-singular":"jecuirii","dative-genitive-indefinite-plural":"jecuiri","dative-definite-genitive-plural":"jecuirilor","singular-vocative":"jecuire","plural-vocative":"jecuirilor"}},{"word":"jeep","pos":"noun","definitions":["jeep"],"forms":{"plural":"jeepuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jeep","accusative-definite-nominative-singular":"jeepul","accusative-indefinite-nominative-plural":"jeepuri","accusative-definite-nominative-plural":"jeepurile","dative-genitive-indefinite-singular":"jeep","dative-definite-genitive-singular":"jeepului","dative-genitive-indefinite-plural":"jeepuri","dative-definite-genitive-plural":"jeepurilor","singular-vocative":"jeepule","plural-vocative":"jeepurilor"}},{"word":"Jeflești","pos":"name","definitions":["a village in Vidra, Alba County, Romania"],"gender":"m"},{"word":"jefui","pos":"verb","definitions":["to rob"],"forms":{"canonical":"a jefui 4th conjugation","present-singular-third-person":"jefuiește","participle-past":"jefuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jefui","gerund":"jefuind","first-person-indicative-present-singular":"jefuiesc","indicative-present-second-person-singular":"jefuiești","indicative-present-singular-third-person":"jefuiește","first-person-indicative-plural-present":"jefuim","indicative-plural-present-second-person":"jefuiți","indicative-plural-present-third-person":"jefuiesc","first-person-imperfect-indicative-singular":"jefuiam","imperfect-indicative-second-person-singular":"jefuiai","imperfect-indicative-singular-third-person":"jefuia","first-person-imperfect-indicative-plural":"jefuiam","imperfect-indicative-plural-second-person":"jefuiați","imperfect-indicative-plural-third-person":"jefuiau","first-person-indicative-perfect-singular":"jefuii","indicative-perfect-second-person-singular":"jefuiși","indicative-perfect-singular-third-person":"jefui","first-person-indicative-perfect-plural":"jefuirăm","indicative-perfect-plural-second-person":"jefuirăți","indicative-perfect-plural-third-person":"jefuiră","first-person-indicative-pluperfect-singular":"jefuisem","indicative-pluperfect-second-person-singular":"jefuiseși","indicative-pluperfect-singular-third-person":"jefuise","first-person-indicative-pluperfect-plural":"jefuiserăm","indicative-pluperfect-plural-second-person":"jefuiserăți","indicative-pluperfect-plural-third-person":"jefuiseră","first-person-present-singular-subjunctive":"să jefuiesc","present-second-person-singular-subjunctive":"să jefuiești","present-singular-subjunctive-third-person":"să jefuiască","first-person-plural-present-subjunctive":"să jefuim","plural-present-second-person-subjunctive":"să jefuiți","plural-present-subjunctive-third-person":"să jefuiască","imperative-second-person-singular":"jefuiește","imperative-plural-second-person":"jefuiți","imperative-negative-second-person-singular":"nu jefui","imperative-negative-plural-second-person":"nu jefuiți"}},{"word":"jefuială","pos":"noun","definitions":["robbery"],"forms":{"plural":"jefuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jefuială","accusative-definite-nominative-singular":"jefuiala","accusative-indefinite-nominative-plural":"jefuiele","accusative-definite-nominative-plural":"jefuielele","dative-genitive-indefinite-singular":"jefuiele","dative-definite-genitive-singular":"jefuielei","dative-genitive-indefinite-plural":"jefuiele","dative-definite-genitive-plural":"jefuielelor","singular-vocative":"jefuială","plural-vocative":"jefuielelor"}},{"word":"jefuire","pos":"noun","definitions":["robbery"],"forms":{"plural":"jefuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jefuire","accusative-definite-nominative-singular":"jefuirea","accusative-indefinite-nominative-plural":"jefuiri","accusative-definite-nominative-plural":"jefuirile","dative-genitive-indefinite-singular":"jefuiri","dative-definite-genitive-singular":"jefuirii","dative-genitive-indefinite-plural":"jefuiri","dative-definite-genitive-plural":"jefuirilor","singular-vocative":"jefuire","plural-vocative":"jefuirilor"}},{"word":"jefuit","pos":"noun","definitions":["robbed"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jefuit","accusative-definite-nominative":"jefuitul","dative-genitive-indefinite":"jefuit","dative-definite-genitive":"jefuitului","vocative":"jefuitule"}},{"word":"jefuit","pos":"verb","definitions":["past participle of jefui"],"forms":{"participle-past":"of jefui"}},{"word":"jefuitoare","pos":"noun","definitions":["female equivalent of jefuitor"],"forms":{"plural":"jefuitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"jefuitoare","accusative-definite-nominative-singular":"jefuitoarea","accusative-indefinite-nominative-plural":"jefuitoare","accusative-definite-nominative-plural":"jefuitoarele","dative-genitive-indefinite-singular":"jefuitoare","dative-definite-genitive-singular":"jefuitoarei","dative-genitive-indefinite-plural":"jefuitoare","dative-definite-genitive-plural":"jefuitoarelor","singular-vocative":"jefuitoare","plural-vocative":"jefuitoarelor"}},{"word":"jefuitor","pos":"noun","definitions":["robber"],"forms":{"plural":"jefuitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jefuitor","accusative-definite-nominative-singular":"jefuitorul","accusative-indefinite-nominative-plural":"jefuitori","accusative-definite-nominative-plural":"jefuitorii","dative-genitive-indefinite-singular":"jefuitor","dative-definite-genitive-singular":"jefuitorului","dative-genitive-indefinite-plural":"jefuitori","dative-definite-genitive-plural":"jefuitorilor","singular-vocative":"jefuitorule","plural-vocative":"jefuitorilor"}},{"word":"jeg","pos":"noun","definitions":["dirt, filth"],"pronunciation":"/ˈʒeɡ/","forms":{"plural":"jeguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jeg","accusative-definite-nominative-singular":"jegul","accusative-indefinite-nominative-plural":"jeguri","accusative-definite-nominative-plural":"jegurile","dative-genitive-indefinite-singular":"jeg","dative-definite-genitive-singular":"jegului","dative-genitive-indefinite-plural":"jeguri","dative-definite-genitive-plural":"jegurilor","singular-vocative":"jegule","plural-vocative":"jegurilor","alternative":"jig"}},{"word":"Jegălia","pos":"name","definitions":["a commune of Călărași County, Romania","a village in Jegălia, Călărași County, Romania"],"gender":"f"},{"word":"jegos","pos":"adj","definitions":["filthy, dirty, soiled"],"pronunciation":"/ʒeˈɡos/","forms":{"feminine-singular":"jegoasă","masculine-plural":"jegoși","feminine-neuter-plural":"jegoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jegos","error-unrecognized-form-feminine-indefinite-singular":"jegoasă","error-unrecognized-form-indefinite-masculine-plural":"jegoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"jegoase","definite-error-unrecognized-form-masculine-neuter-singular":"jegosul","definite-error-unrecognized-form-feminine-singular":"jegoasa","definite-error-unrecognized-form-masculine-plural":"jegoșii","definite-error-unrecognized-form-feminine-neuter-plural":"jegoasele"}},{"word":"Jegu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jegu"}},{"word":"jeguiață","pos":"noun","definitions":["burning coals"],"forms":{"plural":"jeguiețe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jeguiață","accusative-definite-nominative-singular":"jeguiața","accusative-indefinite-nominative-plural":"jeguiețe","accusative-definite-nominative-plural":"jeguiețele","dative-genitive-indefinite-singular":"jeguiețe","dative-definite-genitive-singular":"jeguieței","dative-genitive-indefinite-plural":"jeguiețe","dative-definite-genitive-plural":"jeguiețelor","singular-vocative":"jeguiață","plural-vocative":"jeguiețelor"}},{"word":"jejun","pos":"noun","definitions":["jejunum"],"forms":{"plural":"jejunuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jejun","accusative-definite-nominative-singular":"jejunul","accusative-indefinite-nominative-plural":"jejunuri","accusative-definite-nominative-plural":"jejunurile","dative-genitive-indefinite-singular":"jejun","dative-definite-genitive-singular":"jejunului","dative-genitive-indefinite-plural":"jejunuri","dative-definite-genitive-plural":"jejunurilor","singular-vocative":"jejunule","plural-vocative":"jejunurilor"}},{"word":"jejunal","pos":"adj","definitions":["jejunal"],"forms":{"feminine-singular":"jejunală","masculine-plural":"jejunali","feminine-neuter-plural":"jejunale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jejunal","error-unrecognized-form-feminine-indefinite-singular":"jejunală","error-unrecognized-form-indefinite-masculine-plural":"jejunali","error-unrecognized-form-feminine-indefinite-neuter-plural":"jejunale","definite-error-unrecognized-form-masculine-neuter-singular":"jejunalul","definite-error-unrecognized-form-feminine-singular":"jejunala","definite-error-unrecognized-form-masculine-plural":"jejunalii","definite-error-unrecognized-form-feminine-neuter-plural":"jejunalele"}},{"word":"jejunostomie","pos":"noun","definitions":["jejunostomy"],"forms":{"plural":"jejunostomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jejunostomie","accusative-definite-nominative-singular":"jejunostomia","accusative-indefinite-nominative-plural":"jejunostomii","accusative-definite-nominative-plural":"jejunostomiile","dative-genitive-indefinite-singular":"jejunostomii","dative-definite-genitive-singular":"jejunostomiei","dative-genitive-indefinite-plural":"jejunostomii","dative-definite-genitive-plural":"jejunostomiilor","singular-vocative":"jejunostomie","plural-vocative":"jejunostomiilor"}},{"word":"jelanie","pos":"noun","definitions":["mourning, lamenting"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"jelanie","accusative-definite-nominative":"jelania","dative-genitive-indefinite":"jelanii","dative-definite-genitive":"jelaniei","vocative":"jelanie"}},{"word":"jelbar","pos":"noun","definitions":["alternative form of jălbar"],"forms":{"plural":"jelbari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jelbar","accusative-definite-nominative-singular":"jelbarul","accusative-indefinite-nominative-plural":"jelbari","accusative-definite-nominative-plural":"jelbarii","dative-genitive-indefinite-singular":"jelbar","dative-definite-genitive-singular":"jelbarului","dative-genitive-indefinite-plural":"jelbari","dative-definite-genitive-plural":"jelbarilor","singular-vocative":"jelbarule","plural-vocative":"jelbarilor"}},{"word":"Jeleanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jeleanu"}},{"word":"Jeledințan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jeledințan"}},{"word":"Jeledințean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jeledințean"}},{"word":"jelerie","pos":"noun","definitions":["squatting"],"forms":{"plural":"jelerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jelerie","accusative-definite-nominative-singular":"jeleria","accusative-indefinite-nominative-plural":"jelerii","accusative-definite-nominative-plural":"jeleriile","dative-genitive-indefinite-singular":"jelerii","dative-definite-genitive-singular":"jeleriei","dative-genitive-indefinite-plural":"jelerii","dative-definite-genitive-plural":"jeleriilor","singular-vocative":"jelerie","plural-vocative":"jeleriilor"}},{"word":"Jelescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Jelescu"}},{"word":"Jeleșel","pos":"name","definitions":["a river in Gorj, Romania, tributary to the Jaleș"],"gender":"m"},{"word":"jeleu","pos":"noun","definitions":["jelly (dessert)"],"pronunciation":"/ʒeˈlew/","forms":{"plural":"jeleuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jeleu","accusative-definite-nominative-singular":"jeleul","accusative-indefinite-nominative-plural":"jeleuri","accusative-definite-nominative-plural":"jeleurile","dative-genitive-indefinite-singular":"jeleu","dative-definite-genitive-singular":"jeleului","dative-genitive-indefinite-plural":"jeleuri","dative-definite-genitive-plural":"jeleurilor","singular-vocative":"jeleule","plural-vocative":"jeleurilor"}},{"word":"Jelev","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Jelev"}},{"word":"jeli","pos":"verb","definitions":["to wail, to mourn"],"forms":{"canonical":"a jeli 4th conjugation","present-singular-third-person":"jele","participle-past":"jelit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a jeli","gerund":"jelind","first-person-indicative-present-singular":"jel","indicative-present-second-person-singular":"jeli","indicative-present-singular-third-person":"jele","first-person-indicative-plural-present":"jelim","indicative-plural-present-second-person":"jeliți","indicative-plural-present-third-person":"jel","first-person-imperfect-indicative-singular":"jeleam","imperfect-indicative-second-person-singular":"jeleai","imperfect-indicative-singular-third-person":"jelea","first-person-imperfect-indicative-plural":"jeleam","imperfect-indicative-plural-second-person":"jeleați","imperfect-indicative-plural-third-person":"jeleau","first-person-indicative-perfect-singular":"jelii","indicative-perfect-second-person-singular":"jeliși","indicative-perfect-singular-third-person":"jeli","first-person-indicative-perfect-plural":"jelirăm","indicative-perfect-plural-second-person":"jelirăți","indicative-perfect-plural-third-person":"jeliră","first-person-indicative-pluperfect-singular":"jelisem","indicative-pluperfect-second-person-singular":"jeliseși","indicative-pluperfect-singular-third-person":"jelise","first-person-indicative-pluperfect-plural":"jeliserăm","indicative-pluperfect-plural-second-person":"jeliserăți","indicative-pluperfect-plural-third-person":"jeliseră","first-person-present-singular-subjunctive":"să jel","present-second-person-singular-subjunctive":"să jeli","present-singular-subjunctive-third-person":"să jelă","first-person-plural-present-subjunctive":"să jelim","plural-present-second-person-subjunctive":"să jeliți","plural-present-subjunctive-third-person":"să jelă","imperative-second-person-singular":"jele","imperative-plural-second-person":"jeliți","imperative-negative-second-person-singular":"nu jeli","imperative-negative-plural-second-person":"nu jeliți"}},{"word":"jelire","pos":"noun","definitions":["wailing"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"jelire","accusative-definite-nominative":"jelirea","dative-genitive-indefinite":"jelire","dative-definite-genitive":"jelirei","vocative":"jelire"}},{"word":"jelit","pos":"adj","definitions":["mourned"],"forms":{"feminine-singular":"jelită","masculine-plural":"jeliți","feminine-neuter-plural":"jelite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jelit","error-unrecognized-form-feminine-indefinite-singular":"jelită","error-unrecognized-form-indefinite-masculine-plural":"jeliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jelite","definite-error-unrecognized-form-masculine-neuter-singular":"jelitul","definite-error-unrecognized-form-feminine-singular":"jelita","definite-error-unrecognized-form-masculine-plural":"jeliții","definite-error-unrecognized-form-feminine-neuter-plural":"jelitele"}},{"word":"jelitor","pos":"adj","definitions":["mournful"],"forms":{"feminine-singular":"jelitoare","masculine-plural":"jelitori","feminine-neuter-plural":"jelitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jelitor","error-unrecognized-form-feminine-indefinite-singular":"jelitoare","error-unrecognized-form-indefinite-masculine-plural":"jelitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"jelitoare","definite-error-unrecognized-form-masculine-neuter-singular":"jelitorul","definite-error-unrecognized-form-feminine-singular":"jelitoarea","definite-error-unrecognized-form-masculine-plural":"jelitorii","definite-error-unrecognized-form-feminine-neuter-plural":"jelitoarele"}},{"word":"jelnic","pos":"adj","definitions":["obsolete form of jalnic"],"forms":{"feminine-singular":"jelnică","masculine-plural":"jelnici","feminine-neuter-plural":"jelnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jelnic","error-unrecognized-form-feminine-indefinite-singular":"jelnică","error-unrecognized-form-indefinite-masculine-plural":"jelnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"jelnice","definite-error-unrecognized-form-masculine-neuter-singular":"jelnicul","definite-error-unrecognized-form-feminine-singular":"jelnica","definite-error-unrecognized-form-masculine-plural":"jelnicii","definite-error-unrecognized-form-feminine-neuter-plural":"jelnicele"}},{"word":"jelnic","pos":"adv","definitions":["obsolete form of jalnic"]},{"word":"Jeloboc","pos":"name","definitions":["a village in Piatra, Orhei Raion, Moldova"],"gender":"m"},{"word":"jelț","pos":"noun","definitions":["alternative form of jilț"],"forms":{"plural":"jelțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jelț","accusative-definite-nominative-singular":"jelțul","accusative-indefinite-nominative-plural":"jelțuri","accusative-definite-nominative-plural":"jelțurile","dative-genitive-indefinite-singular":"jelț","dative-definite-genitive-singular":"jelțului","dative-genitive-indefinite-plural":"jelțuri","dative-definite-genitive-plural":"jelțurilor","singular-vocative":"jelțule","plural-vocative":"jelțurilor"}},{"word":"jelțurel","pos":"noun","definitions":["diminutive of jelț"],"forms":{"plural":"jelțurele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jelțurel","accusative-definite-nominative-singular":"jelțurelul","accusative-indefinite-nominative-plural":"jelțurele","accusative-definite-nominative-plural":"jelțurelele","dative-genitive-indefinite-singular":"jelțurel","dative-definite-genitive-singular":"jelțurelului","dative-genitive-indefinite-plural":"jelțurele","dative-definite-genitive-plural":"jelțurelelor","singular-vocative":"jelțurelule","plural-vocative":"jelțurelelor"}},{"word":"jelui","pos":"verb","definitions":["to wail"],"forms":{"canonical":"a jelui 4th conjugation","present-singular-third-person":"jeluiesc","participle-past":"jeluit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a jelui","gerund":"jeluind","first-person-indicative-present-singular":"jelui","indicative-present-second-person-singular":"jelui","indicative-present-singular-third-person":"jeluie","first-person-indicative-plural-present":"jeluim","indicative-plural-present-second-person":"jeluiți","indicative-plural-present-third-person":"jeluie","first-person-imperfect-indicative-singular":"jeluiam","imperfect-indicative-second-person-singular":"jeluiai","imperfect-indicative-singular-third-person":"jeluia","first-person-imperfect-indicative-plural":"jeluiam","imperfect-indicative-plural-second-person":"jeluiați","imperfect-indicative-plural-third-person":"jeluiau","first-person-indicative-perfect-singular":"jeluii","indicative-perfect-second-person-singular":"jeluiși","indicative-perfect-singular-third-person":"jelui","first-person-indicative-perfect-plural":"jeluirăm","indicative-perfect-plural-second-person":"jeluirăți","indicative-perfect-plural-third-person":"jeluiră","first-person-indicative-pluperfect-singular":"jeluisem","indicative-pluperfect-second-person-singular":"jeluiseși","indicative-pluperfect-singular-third-person":"jeluise","first-person-indicative-pluperfect-plural":"jeluiserăm","indicative-pluperfect-plural-second-person":"jeluiserăți","indicative-pluperfect-plural-third-person":"jeluiseră","first-person-present-singular-subjunctive":"să jelui","present-second-person-singular-subjunctive":"să jelui","present-singular-subjunctive-third-person":"să jeluie","first-person-plural-present-subjunctive":"să jeluim","plural-present-second-person-subjunctive":"să jeluiți","plural-present-subjunctive-third-person":"să jeluie","imperative-second-person-singular":"jeluie","imperative-plural-second-person":"jeluiți","imperative-negative-second-person-singular":"nu jelui","imperative-negative-plural-second-person":"nu jeluiți"}},{"word":"jeluire","pos":"noun","definitions":["wail"],"forms":{"plural":"jeluiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jeluire","accusative-definite-nominative-singular":"jeluirea","accusative-indefinite-nominative-plural":"jeluiri","accusative-definite-nominative-plural":"jeluirile","dative-genitive-indefinite-singular":"jeluiri","dative-definite-genitive-singular":"jeluirii","dative-genitive-indefinite-plural":"jeluiri","dative-definite-genitive-plural":"jeluirilor","singular-vocative":"jeluire","plural-vocative":"jeluirilor"}},{"word":"jeluit","pos":"adj","definitions":["wailed"],"forms":{"feminine-singular":"jeluită","masculine-plural":"jeluiți","feminine-neuter-plural":"jeluite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jeluit","error-unrecognized-form-feminine-indefinite-singular":"jeluită","error-unrecognized-form-indefinite-masculine-plural":"jeluiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jeluite","definite-error-unrecognized-form-masculine-neuter-singular":"jeluitul","definite-error-unrecognized-form-feminine-singular":"jeluita","definite-error-unrecognized-form-masculine-plural":"jeluiții","definite-error-unrecognized-form-feminine-neuter-plural":"jeluitele"}},{"word":"jeluitoare","pos":"noun","definitions":["female equivalent of jeluitor"],"forms":{"plural":"jeluitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"jeluitoare","accusative-definite-nominative-singular":"jeluitoarea","accusative-indefinite-nominative-plural":"jeluitoare","accusative-definite-nominative-plural":"jeluitoarele","dative-genitive-indefinite-singular":"jeluitoare","dative-definite-genitive-singular":"jeluitoarei","dative-genitive-indefinite-plural":"jeluitoare","dative-definite-genitive-plural":"jeluitoarelor","singular-vocative":"jeluitoare","plural-vocative":"jeluitoarelor"}},{"word":"jeluitor","pos":"adj","definitions":["mourning"],"forms":{"feminine-singular":"jeluitoare","masculine-plural":"jeluitori","feminine-neuter-plural":"jeluitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jeluitor","error-unrecognized-form-feminine-indefinite-singular":"jeluitoare","error-unrecognized-form-indefinite-masculine-plural":"jeluitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"jeluitoare","definite-error-unrecognized-form-masculine-neuter-singular":"jeluitorul","definite-error-unrecognized-form-feminine-singular":"jeluitoarea","definite-error-unrecognized-form-masculine-plural":"jeluitorii","definite-error-unrecognized-form-feminine-neuter-plural":"jeluitoarele"}},{"word":"jeluitor","pos":"noun","definitions":["mourner"],"forms":{"plural":"jeluitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jeluitor","accusative-definite-nominative-singular":"jeluitorul","accusative-indefinite-nominative-plural":"jeluitori","accusative-definite-nominative-plural":"jeluitorii","dative-genitive-indefinite-singular":"jeluitor","dative-definite-genitive-singular":"jeluitorului","dative-genitive-indefinite-plural":"jeluitori","dative-definite-genitive-plural":"jeluitorilor","singular-vocative":"jeluitorule","plural-vocative":"jeluitorilor"}},{"word":"jemanfișism","pos":"noun","definitions":["indifference"],"forms":{"plural":"jemanfișismuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jemanfișism","accusative-definite-nominative-singular":"jemanfișismul","accusative-indefinite-nominative-plural":"jemanfișismuri","accusative-definite-nominative-plural":"jemanfișismurile","dative-genitive-indefinite-singular":"jemanfișism","dative-definite-genitive-singular":"jemanfișismului","dative-genitive-indefinite-plural":"jemanfișismuri","dative-definite-genitive-plural":"jemanfișismurilor","singular-vocative":"jemanfișismule","plural-vocative":"jemanfișismurilor"}},{"word":"jena","pos":"verb","definitions":["to embarrass","to discomfort, incommode","to inconvenience","to hinder, impede, be in the way of","to disturb, trouble"],"forms":{"canonical":"a jena 1st conjugation","present-singular-third-person":"jenează","participle-past":"jenat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a jena","gerund":"jenând","first-person-indicative-present-singular":"jenez","indicative-present-second-person-singular":"jenezi","indicative-present-singular-third-person":"jenează","first-person-indicative-plural-present":"jenăm","indicative-plural-present-second-person":"jenați","indicative-plural-present-third-person":"jenează","first-person-imperfect-indicative-singular":"jenam","imperfect-indicative-second-person-singular":"jenai","imperfect-indicative-singular-third-person":"jena","first-person-imperfect-indicative-plural":"jenam","imperfect-indicative-plural-second-person":"jenați","imperfect-indicative-plural-third-person":"jenau","first-person-indicative-perfect-singular":"jenai","indicative-perfect-second-person-singular":"jenași","indicative-perfect-singular-third-person":"jenă","first-person-indicative-perfect-plural":"jenarăm","indicative-perfect-plural-second-person":"jenarăți","indicative-perfect-plural-third-person":"jenară","first-person-indicative-pluperfect-singular":"jenasem","indicative-pluperfect-second-person-singular":"jenaseși","indicative-pluperfect-singular-third-person":"jenase","first-person-indicative-pluperfect-plural":"jenaserăm","indicative-pluperfect-plural-second-person":"jenaserăți","indicative-pluperfect-plural-third-person":"jenaseră","first-person-present-singular-subjunctive":"să jenez","present-second-person-singular-subjunctive":"să jenezi","present-singular-subjunctive-third-person":"să jeneze","first-person-plural-present-subjunctive":"să jenăm","plural-present-second-person-subjunctive":"să jenați","plural-present-subjunctive-third-person":"să jeneze","imperative-second-person-singular":"jenează","imperative-plural-second-person":"jenați","imperative-negative-second-person-singular":"nu jena","imperative-negative-plural-second-person":"nu jenați"}},{"word":"Jena","pos":"name","definitions":["a village in Gavojdia, Timiș County, Romania"],"gender":"f"},{"word":"jenant","pos":"adj","definitions":["embarrassing"],"forms":{"feminine-singular":"jenantă","masculine-plural":"jenanți","feminine-neuter-plural":"jenante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jenant","error-unrecognized-form-feminine-indefinite-singular":"jenantă","error-unrecognized-form-indefinite-masculine-plural":"jenanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jenante","definite-error-unrecognized-form-masculine-neuter-singular":"jenantul","definite-error-unrecognized-form-feminine-singular":"jenanta","definite-error-unrecognized-form-masculine-plural":"jenanții","definite-error-unrecognized-form-feminine-neuter-plural":"jenantele"}},{"word":"jenare","pos":"noun","definitions":["embarrassment"],"forms":{"plural":"jenări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jenare","accusative-definite-nominative-singular":"jenarea","accusative-indefinite-nominative-plural":"jenări","accusative-definite-nominative-plural":"jenările","dative-genitive-indefinite-singular":"jenări","dative-definite-genitive-singular":"jenării","dative-genitive-indefinite-plural":"jenări","dative-definite-genitive-plural":"jenărilor","singular-vocative":"jenare","plural-vocative":"jenărilor"}},{"word":"jenat","pos":"adj","definitions":["embarrassed"],"forms":{"feminine-singular":"jenată","masculine-plural":"jenați","feminine-neuter-plural":"jenate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jenat","error-unrecognized-form-feminine-indefinite-singular":"jenată","error-unrecognized-form-indefinite-masculine-plural":"jenați","error-unrecognized-form-feminine-indefinite-neuter-plural":"jenate","definite-error-unrecognized-form-masculine-neuter-singular":"jenatul","definite-error-unrecognized-form-feminine-singular":"jenata","definite-error-unrecognized-form-masculine-plural":"jenații","definite-error-unrecognized-form-feminine-neuter-plural":"jenatele"}},{"word":"jenă","pos":"noun","definitions":["embarrassment (state of discomfort); uneasiness","a slight feeling of physical pain"],"forms":{"plural":"jene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jenă","accusative-definite-nominative-singular":"jena","accusative-indefinite-nominative-plural":"jene","accusative-definite-nominative-plural":"jenele","dative-genitive-indefinite-singular":"jene","dative-definite-genitive-singular":"jenei","dative-genitive-indefinite-plural":"jene","dative-definite-genitive-plural":"jenelor","singular-vocative":"jenă","plural-vocative":"jenelor"}},{"word":"jendarm","pos":"noun","definitions":["obsolete form of jandarm"],"forms":{"plural":"jendarmi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jendarm","accusative-definite-nominative-singular":"jendarmul","accusative-indefinite-nominative-plural":"jendarmi","accusative-definite-nominative-plural":"jendarmii","dative-genitive-indefinite-singular":"jendarm","dative-definite-genitive-singular":"jendarmului","dative-genitive-indefinite-plural":"jendarmi","dative-definite-genitive-plural":"jendarmilor","singular-vocative":"jendarmule","plural-vocative":"jendarmilor"}},{"word":"jenibil","pos":"adj","definitions":["embarrassing"],"forms":{"feminine-singular":"jenibilă","masculine-plural":"jenibili","feminine-neuter-plural":"jenibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jenibil","error-unrecognized-form-feminine-indefinite-singular":"jenibilă","error-unrecognized-form-indefinite-masculine-plural":"jenibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"jenibile","definite-error-unrecognized-form-masculine-neuter-singular":"jenibilul","definite-error-unrecognized-form-feminine-singular":"jenibila","definite-error-unrecognized-form-masculine-plural":"jenibilii","definite-error-unrecognized-form-feminine-neuter-plural":"jenibilele"}},{"word":"jenie","pos":"noun","definitions":["genius"],"forms":{"plural":"jenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jenie","accusative-definite-nominative-singular":"jenia","accusative-indefinite-nominative-plural":"jenii","accusative-definite-nominative-plural":"jeniile","dative-genitive-indefinite-singular":"jenii","dative-definite-genitive-singular":"jeniei","dative-genitive-indefinite-plural":"jenii","dative-definite-genitive-plural":"jeniilor","singular-vocative":"jenie","plural-vocative":"jeniilor"}},{"word":"jep","pos":"noun","definitions":["bog pine (Pinus mugo)"],"forms":{"plural":"jepi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jep","accusative-definite-nominative-singular":"jepul","accusative-indefinite-nominative-plural":"jepi","accusative-definite-nominative-plural":"jepii","dative-genitive-indefinite-singular":"jep","dative-definite-genitive-singular":"jepului","dative-genitive-indefinite-plural":"jepi","dative-definite-genitive-plural":"jepilor","singular-vocative":"jepule","plural-vocative":"jepilor"}},{"word":"jepii","pos":"noun","definitions":["definite nominative/accusative plural of jep"]},{"word":"Jepii Mari","pos":"name","definitions":["a river in Prahova, Romania, tributary to the Izvorul Dorului"],"gender":"m"},{"word":"jepilor","pos":"noun","definitions":["definite genitive/dative plural of jep"]},{"word":"jeratec","pos":"noun","definitions":["alternative form of jăratic"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jeratec","accusative-definite-nominative":"jeratecul","dative-genitive-indefinite":"jeratec","dative-definite-genitive":"jeratecului","vocative":"jeratecule"}},{"word":"jeratic","pos":"noun","definitions":["alternative form of jăratic"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jeratic","accusative-definite-nominative":"jeraticul","dative-genitive-indefinite":"jeratic","dative-definite-genitive":"jeraticului","vocative":"jeraticule"}},{"word":"jerbă","pos":"noun","definitions":["sheaf"],"forms":{"plural":"jerbe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jerbă","accusative-definite-nominative-singular":"jerba","accusative-indefinite-nominative-plural":"jerbe","accusative-definite-nominative-plural":"jerbele","dative-genitive-indefinite-singular":"jerbe","dative-definite-genitive-singular":"jerbei","dative-genitive-indefinite-plural":"jerbe","dative-definite-genitive-plural":"jerbelor","singular-vocative":"jerbă","plural-vocative":"jerbelor"}},{"word":"jerbe","pos":"noun","definitions":["inflection of jerbă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈʒerbe]","gender":"f"},{"word":"jerbo","pos":"noun","definitions":["vocative singular of jerbă"],"pronunciation":"[ˈʒerbo]","gender":"f"},{"word":"Jercălăi","pos":"name","definitions":["a locality in Urlați, Prahova County, Romania"],"gender":"m"},{"word":"Jercălău","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jercălău"}},{"word":"jeregai","pos":"noun","definitions":["alternative form of jărăgai"],"forms":{"plural":"jeregaiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jeregai","accusative-definite-nominative-singular":"jeregaiul","accusative-indefinite-nominative-plural":"jeregaiuri","accusative-definite-nominative-plural":"jeregaiurile","dative-genitive-indefinite-singular":"jeregai","dative-definite-genitive-singular":"jeregaiului","dative-genitive-indefinite-plural":"jeregaiuri","dative-definite-genitive-plural":"jeregaiurilor","singular-vocative":"jeregaiule","plural-vocative":"jeregaiurilor"}},{"word":"jerfă","pos":"noun","definitions":["obsolete form of jertfă"],"forms":{"plural":"jerfe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jerfă","accusative-definite-nominative-singular":"jerfa","accusative-indefinite-nominative-plural":"jerfe","accusative-definite-nominative-plural":"jerfele","dative-genitive-indefinite-singular":"jerfe","dative-definite-genitive-singular":"jerfei","dative-genitive-indefinite-plural":"jerfe","dative-definite-genitive-plural":"jerfelor","singular-vocative":"jerfă","plural-vocative":"jerfelor"}},{"word":"Jeriștea","pos":"name","definitions":["a village in Săcelu, Gorj County, Romania"],"gender":"f"},{"word":"Jernoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Jernoiu"}},{"word":"jerpeli","pos":"verb","definitions":["to wear out (about clothes, books etc.)"],"pronunciation":"/ʒer.peˈli/","forms":{"canonical":"a jerpeli 4th conjugation","present-singular-third-person":"jerpelește","participle-past":"jerpelit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jerpeli","gerund":"jerpelind","first-person-indicative-present-singular":"jerpelesc","indicative-present-second-person-singular":"jerpelești","indicative-present-singular-third-person":"jerpelește","first-person-indicative-plural-present":"jerpelim","indicative-plural-present-second-person":"jerpeliți","indicative-plural-present-third-person":"jerpelesc","first-person-imperfect-indicative-singular":"jerpeleam","imperfect-indicative-second-person-singular":"jerpeleai","imperfect-indicative-singular-third-person":"jerpelea","first-person-imperfect-indicative-plural":"jerpeleam","imperfect-indicative-plural-second-person":"jerpeleați","imperfect-indicative-plural-third-person":"jerpeleau","first-person-indicative-perfect-singular":"jerpelii","indicative-perfect-second-person-singular":"jerpeliși","indicative-perfect-singular-third-person":"jerpeli","first-person-indicative-perfect-plural":"jerpelirăm","indicative-perfect-plural-second-person":"jerpelirăți","indicative-perfect-plural-third-person":"jerpeliră","first-person-indicative-pluperfect-singular":"jerpelisem","indicative-pluperfect-second-person-singular":"jerpeliseși","indicative-pluperfect-singular-third-person":"jerpelise","first-person-indicative-pluperfect-plural":"jerpeliserăm","indicative-pluperfect-plural-second-person":"jerpeliserăți","indicative-pluperfect-plural-third-person":"jerpeliseră","first-person-present-singular-subjunctive":"să jerpelesc","present-second-person-singular-subjunctive":"să jerpelești","present-singular-subjunctive-third-person":"să jerpelească","first-person-plural-present-subjunctive":"să jerpelim","plural-present-second-person-subjunctive":"să jerpeliți","plural-present-subjunctive-third-person":"să jerpelească","imperative-second-person-singular":"jerpelește","imperative-plural-second-person":"jerpeliți","imperative-negative-second-person-singular":"nu jerpeli","imperative-negative-plural-second-person":"nu jerpeliți"}},{"word":"jerpelit","pos":"adj","definitions":["shabby"],"forms":{"feminine-singular":"jerpelită","masculine-plural":"jerpeliți","feminine-neuter-plural":"jerpelite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jerpelit","error-unrecognized-form-feminine-indefinite-singular":"jerpelită","error-unrecognized-form-indefinite-masculine-plural":"jerpeliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jerpelite","definite-error-unrecognized-form-masculine-neuter-singular":"jerpelitul","definite-error-unrecognized-form-feminine-singular":"jerpelita","definite-error-unrecognized-form-masculine-plural":"jerpeliții","definite-error-unrecognized-form-feminine-neuter-plural":"jerpelitele"}},{"word":"jerpelitură","pos":"noun","definitions":["rag, old, torn clothes"],"pronunciation":"/ʒer.pe.liˈtu.rə/","forms":{"plural":"jerpelituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jerpelitură","accusative-definite-nominative-singular":"jerpelitura","accusative-indefinite-nominative-plural":"jerpelituri","accusative-definite-nominative-plural":"jerpeliturile","dative-genitive-indefinite-singular":"jerpelituri","dative-definite-genitive-singular":"jerpeliturii","dative-genitive-indefinite-plural":"jerpelituri","dative-definite-genitive-plural":"jerpeliturilor","singular-vocative":"jerpelitură","plural-vocative":"jerpeliturilor"}},{"word":"jerse","pos":"noun","definitions":["alternative form of jerseu"],"forms":{"plural":"jerseuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jerse","accusative-definite-nominative-singular":"jerseul","accusative-indefinite-nominative-plural":"jerseuri","accusative-definite-nominative-plural":"jerseurile","dative-genitive-indefinite-singular":"jerse","dative-definite-genitive-singular":"jerseului","dative-genitive-indefinite-plural":"jerseuri","dative-definite-genitive-plural":"jerseurilor","singular-vocative":"jerseule","plural-vocative":"jerseurilor"}},{"word":"jerseu","pos":"noun","definitions":["jersey"],"forms":{"plural":"jerseuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jerseu","accusative-definite-nominative-singular":"jerseul","accusative-indefinite-nominative-plural":"jerseuri","accusative-definite-nominative-plural":"jerseurile","dative-genitive-indefinite-singular":"jerseu","dative-definite-genitive-singular":"jerseului","dative-genitive-indefinite-plural":"jerseuri","dative-definite-genitive-plural":"jerseurilor","singular-vocative":"jerseule","plural-vocative":"jerseurilor"}},{"word":"jertfă","pos":"noun","definitions":["sacrifice","oblation, offering","victim"],"pronunciation":"[ˈʒer.tfə]","forms":{"plural":"jertfe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jertfă","accusative-definite-nominative-singular":"jertfa","accusative-indefinite-nominative-plural":"jertfe","accusative-definite-nominative-plural":"jertfele","dative-genitive-indefinite-singular":"jertfe","dative-definite-genitive-singular":"jertfei","dative-genitive-indefinite-plural":"jertfe","dative-definite-genitive-plural":"jertfelor","singular-vocative":"jertfă","plural-vocative":"jertfelor"}},{"word":"jertfelnic","pos":"noun","definitions":["altar"],"forms":{"plural":"jertfelnice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jertfelnic","accusative-definite-nominative-singular":"jertfelnicul","accusative-indefinite-nominative-plural":"jertfelnice","accusative-definite-nominative-plural":"jertfelnicele","dative-genitive-indefinite-singular":"jertfelnic","dative-definite-genitive-singular":"jertfelnicului","dative-genitive-indefinite-plural":"jertfelnice","dative-definite-genitive-plural":"jertfelnicelor","singular-vocative":"jertfelnicule","plural-vocative":"jertfelnicelor"}},{"word":"jertfi","pos":"verb","definitions":["to sacrifice"],"forms":{"canonical":"a jertfi 4th conjugation","present-singular-third-person":"jertfește","participle-past":"jertfit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jertfi","gerund":"jertfind","first-person-indicative-present-singular":"jertfesc","indicative-present-second-person-singular":"jertfești","indicative-present-singular-third-person":"jertfește","first-person-indicative-plural-present":"jertfim","indicative-plural-present-second-person":"jertfiți","indicative-plural-present-third-person":"jertfesc","first-person-imperfect-indicative-singular":"jertfeam","imperfect-indicative-second-person-singular":"jertfeai","imperfect-indicative-singular-third-person":"jertfea","first-person-imperfect-indicative-plural":"jertfeam","imperfect-indicative-plural-second-person":"jertfeați","imperfect-indicative-plural-third-person":"jertfeau","first-person-indicative-perfect-singular":"jertfii","indicative-perfect-second-person-singular":"jertfiși","indicative-perfect-singular-third-person":"jertfi","first-person-indicative-perfect-plural":"jertfirăm","indicative-perfect-plural-second-person":"jertfirăți","indicative-perfect-plural-third-person":"jertfiră","first-person-indicative-pluperfect-singular":"jertfisem","indicative-pluperfect-second-person-singular":"jertfiseși","indicative-pluperfect-singular-third-person":"jertfise","first-person-indicative-pluperfect-plural":"jertfiserăm","indicative-pluperfect-plural-second-person":"jertfiserăți","indicative-pluperfect-plural-third-person":"jertfiseră","first-person-present-singular-subjunctive":"să jertfesc","present-second-person-singular-subjunctive":"să jertfești","present-singular-subjunctive-third-person":"să jertfească","first-person-plural-present-subjunctive":"să jertfim","plural-present-second-person-subjunctive":"să jertfiți","plural-present-subjunctive-third-person":"să jertfească","imperative-second-person-singular":"jertfește","imperative-plural-second-person":"jertfiți","imperative-negative-second-person-singular":"nu jertfi","imperative-negative-plural-second-person":"nu jertfiți"}},{"word":"jertfire","pos":"noun","definitions":["sacrifice","immolation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"jertfire","accusative-definite-nominative":"jertfirea","dative-genitive-indefinite":"jertfire","dative-definite-genitive":"jertfirei","vocative":"jertfire"}},{"word":"jertfui","pos":"verb","definitions":["to sacrifice"],"forms":{"canonical":"a jertfui 4th conjugation","present-singular-third-person":"jertfuiește","participle-past":"jertfuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jertfui","gerund":"jertfuind","first-person-indicative-present-singular":"jertfuiesc","indicative-present-second-person-singular":"jertfuiești","indicative-present-singular-third-person":"jertfuiește","first-person-indicative-plural-present":"jertfuim","indicative-plural-present-second-person":"jertfuiți","indicative-plural-present-third-person":"jertfuiesc","first-person-imperfect-indicative-singular":"jertfuiam","imperfect-indicative-second-person-singular":"jertfuiai","imperfect-indicative-singular-third-person":"jertfuia","first-person-imperfect-indicative-plural":"jertfuiam","imperfect-indicative-plural-second-person":"jertfuiați","imperfect-indicative-plural-third-person":"jertfuiau","first-person-indicative-perfect-singular":"jertfuii","indicative-perfect-second-person-singular":"jertfuiși","indicative-perfect-singular-third-person":"jertfui","first-person-indicative-perfect-plural":"jertfuirăm","indicative-perfect-plural-second-person":"jertfuirăți","indicative-perfect-plural-third-person":"jertfuiră","first-person-indicative-pluperfect-singular":"jertfuisem","indicative-pluperfect-second-person-singular":"jertfuiseși","indicative-pluperfect-singular-third-person":"jertfuise","first-person-indicative-pluperfect-plural":"jertfuiserăm","indicative-pluperfect-plural-second-person":"jertfuiserăți","indicative-pluperfect-plural-third-person":"jertfuiseră","first-person-present-singular-subjunctive":"să jertfuiesc","present-second-person-singular-subjunctive":"să jertfuiești","present-singular-subjunctive-third-person":"să jertfuiască","first-person-plural-present-subjunctive":"să jertfuim","plural-present-second-person-subjunctive":"să jertfuiți","plural-present-subjunctive-third-person":"să jertfuiască","imperative-second-person-singular":"jertfuiește","imperative-plural-second-person":"jertfuiți","imperative-negative-second-person-singular":"nu jertfui","imperative-negative-plural-second-person":"nu jertfuiți"}},{"word":"jertfuire","pos":"noun","definitions":["sacrifice"],"forms":{"plural":"jertfuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jertfuire","accusative-definite-nominative-singular":"jertfuirea","accusative-indefinite-nominative-plural":"jertfuiri","accusative-definite-nominative-plural":"jertfuirile","dative-genitive-indefinite-singular":"jertfuiri","dative-definite-genitive-singular":"jertfuirii","dative-genitive-indefinite-plural":"jertfuiri","dative-definite-genitive-plural":"jertfuirilor","singular-vocative":"jertfuire","plural-vocative":"jertfuirilor"}},{"word":"jertvă","pos":"noun","definitions":["obsolete form of jertfă"],"forms":{"plural":"jertve","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jertvă","accusative-definite-nominative-singular":"jertva","accusative-indefinite-nominative-plural":"jertve","accusative-definite-nominative-plural":"jertvele","dative-genitive-indefinite-singular":"jertve","dative-definite-genitive-singular":"jertvei","dative-genitive-indefinite-plural":"jertve","dative-definite-genitive-plural":"jertvelor","singular-vocative":"jertvă","plural-vocative":"jertvelor"}},{"word":"jerui","pos":"verb","definitions":["alternative form of jărui"],"forms":{"canonical":"a jerui 4th conjugation","present-singular-third-person":"jeruiește","participle-past":"jeruit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jerui","gerund":"jeruind","first-person-indicative-present-singular":"jeruiesc","indicative-present-second-person-singular":"jeruiești","indicative-present-singular-third-person":"jeruiește","first-person-indicative-plural-present":"jeruim","indicative-plural-present-second-person":"jeruiți","indicative-plural-present-third-person":"jeruiesc","first-person-imperfect-indicative-singular":"jeruiam","imperfect-indicative-second-person-singular":"jeruiai","imperfect-indicative-singular-third-person":"jeruia","first-person-imperfect-indicative-plural":"jeruiam","imperfect-indicative-plural-second-person":"jeruiați","imperfect-indicative-plural-third-person":"jeruiau","first-person-indicative-perfect-singular":"jeruii","indicative-perfect-second-person-singular":"jeruiși","indicative-perfect-singular-third-person":"jerui","first-person-indicative-perfect-plural":"jeruirăm","indicative-perfect-plural-second-person":"jeruirăți","indicative-perfect-plural-third-person":"jeruiră","first-person-indicative-pluperfect-singular":"jeruisem","indicative-pluperfect-second-person-singular":"jeruiseși","indicative-pluperfect-singular-third-person":"jeruise","first-person-indicative-pluperfect-plural":"jeruiserăm","indicative-pluperfect-plural-second-person":"jeruiserăți","indicative-pluperfect-plural-third-person":"jeruiseră","first-person-present-singular-subjunctive":"să jeruiesc","present-second-person-singular-subjunctive":"să jeruiești","present-singular-subjunctive-third-person":"să jeruiască","first-person-plural-present-subjunctive":"să jeruim","plural-present-second-person-subjunctive":"să jeruiți","plural-present-subjunctive-third-person":"să jeruiască","imperative-second-person-singular":"jeruiește","imperative-plural-second-person":"jeruiți","imperative-negative-second-person-singular":"nu jerui","imperative-negative-plural-second-person":"nu jeruiți"}},{"word":"jet","pos":"noun","definitions":["jet (of a gas of liquid)"],"forms":{"plural":"jeturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jet","accusative-definite-nominative-singular":"jetul","accusative-indefinite-nominative-plural":"jeturi","accusative-definite-nominative-plural":"jeturile","dative-genitive-indefinite-singular":"jet","dative-definite-genitive-singular":"jetului","dative-genitive-indefinite-plural":"jeturi","dative-definite-genitive-plural":"jeturilor","singular-vocative":"jetule","plural-vocative":"jeturilor"}},{"word":"jeteu","pos":"noun","definitions":["make one stitch"],"forms":{"plural":"jeteuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jeteu","accusative-definite-nominative-singular":"jeteul","accusative-indefinite-nominative-plural":"jeteuri","accusative-definite-nominative-plural":"jeteurile","dative-genitive-indefinite-singular":"jeteu","dative-definite-genitive-singular":"jeteului","dative-genitive-indefinite-plural":"jeteuri","dative-definite-genitive-plural":"jeteurilor","singular-vocative":"jeteule","plural-vocative":"jeteurilor"}},{"word":"jeton","pos":"noun","definitions":["token"],"forms":{"plural":"jetoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jeton","accusative-definite-nominative-singular":"jetonul","accusative-indefinite-nominative-plural":"jetoane","accusative-definite-nominative-plural":"jetoanele","dative-genitive-indefinite-singular":"jeton","dative-definite-genitive-singular":"jetonului","dative-genitive-indefinite-plural":"jetoane","dative-definite-genitive-plural":"jetoanelor","singular-vocative":"jetonule","plural-vocative":"jetoanelor"}},{"word":"jeț","pos":"noun","definitions":["a large, tall, or high chair, similar to a throne","armchair","easy chair, lounge chair"],"pronunciation":"/ˈʒet͡s/","forms":{"plural":"jețuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jeț","accusative-definite-nominative-singular":"jețul","accusative-indefinite-nominative-plural":"jețuri","accusative-definite-nominative-plural":"jețurile","dative-genitive-indefinite-singular":"jeț","dative-definite-genitive-singular":"jețului","dative-genitive-indefinite-plural":"jețuri","dative-definite-genitive-plural":"jețurilor","singular-vocative":"jețule","plural-vocative":"jețurilor","alternative":"jilț"}},{"word":"jețurel","pos":"noun","definitions":["diminutive of jeț"],"forms":{"plural":"jețurele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jețurel","accusative-definite-nominative-singular":"jețurelul","accusative-indefinite-nominative-plural":"jețurele","accusative-definite-nominative-plural":"jețurelele","dative-genitive-indefinite-singular":"jețurel","dative-definite-genitive-singular":"jețurelului","dative-genitive-indefinite-plural":"jețurele","dative-definite-genitive-plural":"jețurelelor","singular-vocative":"jețurelule","plural-vocative":"jețurelelor"}},{"word":"jevroaică","pos":"noun","definitions":["bitch"],"forms":{"plural":"jevroaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jevroaică","accusative-definite-nominative-singular":"jevroaica","accusative-indefinite-nominative-plural":"jevroaice","accusative-definite-nominative-plural":"jevroaicele","dative-genitive-indefinite-singular":"jevroaice","dative-definite-genitive-singular":"jevroaicei","dative-genitive-indefinite-plural":"jevroaice","dative-definite-genitive-plural":"jevroaicelor","singular-vocative":"jevroaică","plural-vocative":"jevroaicelor"}},{"word":"jezuit","pos":"noun","definitions":["obsolete form of iezuit"],"forms":{"plural":"jezuiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jezuit","accusative-definite-nominative-singular":"jezuitul","accusative-indefinite-nominative-plural":"jezuiți","accusative-definite-nominative-plural":"jezuiții","dative-genitive-indefinite-singular":"jezuit","dative-definite-genitive-singular":"jezuitului","dative-genitive-indefinite-plural":"jezuiți","dative-definite-genitive-plural":"jezuiților","singular-vocative":"jezuitule","plural-vocative":"jezuiților"}},{"word":"jgheab","pos":"noun","definitions":["gutter","drainpipe","waterway","groove","trough"],"pronunciation":"/ʒɡe̯ab/","forms":{"plural":"jgheaburi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jgheab","accusative-definite-nominative-singular":"jgheabul","accusative-indefinite-nominative-plural":"jgheaburi","accusative-definite-nominative-plural":"jgheaburile","dative-genitive-indefinite-singular":"jgheab","dative-definite-genitive-singular":"jgheabului","dative-genitive-indefinite-plural":"jgheaburi","dative-definite-genitive-plural":"jgheaburilor","singular-vocative":"jgheabule","plural-vocative":"jgheaburilor","alternative":"zgheab"}},{"word":"Jgheab","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Bahrin","a river in Buzău, Romania, tributary to the Slănic"],"gender":"m"},{"word":"Jgheabu Muntelui","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Bățul"],"gender":"m"},{"word":"Jgheabul Cherecului","pos":"name","definitions":["a river in Neamț County, Romania, tributary to the Bicăjel"],"gender":"m"},{"word":"jgheaburi","pos":"noun","definitions":["plural of jgheab"]},{"word":"Jgheaburi","pos":"name","definitions":["a village in Corbi, Argeș County, Romania","a village in Reghiu, Vrancea County, Romania"],"gender":"m"},{"word":"Jgheboasa","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Ribița"],"gender":"f"},{"word":"jghebuleț","pos":"noun","definitions":["diminutive of jgheab; small gutter"],"forms":{"plural":"jghebulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jghebuleț","accusative-definite-nominative-singular":"jghebulețul","accusative-indefinite-nominative-plural":"jghebulețe","accusative-definite-nominative-plural":"jghebulețele","dative-genitive-indefinite-singular":"jghebuleț","dative-definite-genitive-singular":"jghebulețului","dative-genitive-indefinite-plural":"jghebulețe","dative-definite-genitive-plural":"jghebulețelor","singular-vocative":"jghebulețule","plural-vocative":"jghebulețelor"}},{"word":"Jgheburoasa","pos":"name","definitions":["a river in Argeș, Romania, tributary to the Zârna"],"gender":"f"},{"word":"Jghiab","pos":"name","definitions":["a village in Mânzălești, Buzău County, Romania"],"gender":"m"},{"word":"Jghiabului","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Strei"],"gender":"m"},{"word":"jian","pos":"noun","definitions":["person from the region around the Jiu river in Romania"],"forms":{"plural":"jieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jian","accusative-definite-nominative-singular":"jianul","accusative-indefinite-nominative-plural":"jieni","accusative-definite-nominative-plural":"jienii","dative-genitive-indefinite-singular":"jian","dative-definite-genitive-singular":"jianului","dative-genitive-indefinite-plural":"jieni","dative-definite-genitive-plural":"jienilor","singular-vocative":"jianule","plural-vocative":"jienilor"}},{"word":"Jiana","pos":"name","definitions":["a commune of Mehedinți County, Romania","a village in Jiana, Mehedinți County, Romania"],"gender":"f"},{"word":"Jiana Mare","pos":"name","definitions":["a village in Jiana, Mehedinți County, Romania"],"gender":"f"},{"word":"Jiana Veche","pos":"name","definitions":["a village in Jiana, Mehedinți County, Romania"],"gender":"f"},{"word":"jiană","pos":"noun","definitions":["female equivalent of jian"],"forms":{"plural":"jiane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jiană","accusative-definite-nominative-singular":"jiana","accusative-indefinite-nominative-plural":"jiane","accusative-definite-nominative-plural":"jianele","dative-genitive-indefinite-singular":"jiane","dative-definite-genitive-singular":"jianei","dative-genitive-indefinite-plural":"jiane","dative-definite-genitive-plural":"jianelor","singular-vocative":"jiană","plural-vocative":"jianelor"}},{"word":"jiancă","pos":"noun","definitions":["female equivalent of jian"],"forms":{"plural":"jience","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jiancă","accusative-definite-nominative-singular":"jianca","accusative-indefinite-nominative-plural":"jience","accusative-definite-nominative-plural":"jiencele","dative-genitive-indefinite-singular":"jience","dative-definite-genitive-singular":"jiencei","dative-genitive-indefinite-plural":"jience","dative-definite-genitive-plural":"jiencelor","singular-vocative":"jiancă","plural-vocative":"jiencelor"}},{"word":"Jibert","pos":"name","definitions":["a commune of Brașov County, Romania","a village in Jibert, Brașov County, Romania"],"gender":"m"},{"word":"Jiblea Nouă","pos":"name","definitions":["a locality in Călimănești, Vâlcea County, Romania"],"gender":"f"},{"word":"Jiblea Veche","pos":"name","definitions":["a locality in Călimănești, Vâlcea County, Romania"],"forms":{"canonical":"Jiblea Vechef"}},{"word":"Jiboan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jiboan"}},{"word":"Jibou","pos":"name","definitions":["a town in Sălaj County, Romania"],"gender":"m"},{"word":"Jichișu de Jos","pos":"name","definitions":["a commune of Cluj County, Romania","a village in Jichișu de Jos, Cluj County, Romania"],"gender":"m"},{"word":"Jichișu de Sus","pos":"name","definitions":["a village in Jichișu de Jos, Cluj County, Romania"],"gender":"m"},{"word":"jiclor","pos":"noun","definitions":["nozzle"],"forms":{"plural":"jicloare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jiclor","accusative-definite-nominative-singular":"jiclorul","accusative-indefinite-nominative-plural":"jicloare","accusative-definite-nominative-plural":"jicloarele","dative-genitive-indefinite-singular":"jiclor","dative-definite-genitive-singular":"jiclorului","dative-genitive-indefinite-plural":"jicloare","dative-definite-genitive-plural":"jicloarelor","singular-vocative":"jiclorule","plural-vocative":"jicloarelor"}},{"word":"Jicmon","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Jicmon"}},{"word":"jicni","pos":"verb","definitions":["alternative form of jigni"],"forms":{"canonical":"a jicni 4th conjugation","present-singular-third-person":"jicnește","participle-past":"jicnit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jicni","gerund":"jicnind","first-person-indicative-present-singular":"jicnesc","indicative-present-second-person-singular":"jicnești","indicative-present-singular-third-person":"jicnește","first-person-indicative-plural-present":"jicnim","indicative-plural-present-second-person":"jicniți","indicative-plural-present-third-person":"jicnesc","first-person-imperfect-indicative-singular":"jicneam","imperfect-indicative-second-person-singular":"jicneai","imperfect-indicative-singular-third-person":"jicnea","first-person-imperfect-indicative-plural":"jicneam","imperfect-indicative-plural-second-person":"jicneați","imperfect-indicative-plural-third-person":"jicneau","first-person-indicative-perfect-singular":"jicnii","indicative-perfect-second-person-singular":"jicniși","indicative-perfect-singular-third-person":"jicni","first-person-indicative-perfect-plural":"jicnirăm","indicative-perfect-plural-second-person":"jicnirăți","indicative-perfect-plural-third-person":"jicniră","first-person-indicative-pluperfect-singular":"jicnisem","indicative-pluperfect-second-person-singular":"jicniseși","indicative-pluperfect-singular-third-person":"jicnise","first-person-indicative-pluperfect-plural":"jicniserăm","indicative-pluperfect-plural-second-person":"jicniserăți","indicative-pluperfect-plural-third-person":"jicniseră","first-person-present-singular-subjunctive":"să jicnesc","present-second-person-singular-subjunctive":"să jicnești","present-singular-subjunctive-third-person":"să jicnească","first-person-plural-present-subjunctive":"să jicnim","plural-present-second-person-subjunctive":"să jicniți","plural-present-subjunctive-third-person":"să jicnească","imperative-second-person-singular":"jicnește","imperative-plural-second-person":"jicniți","imperative-negative-second-person-singular":"nu jicni","imperative-negative-plural-second-person":"nu jicniți"}},{"word":"jicnicer","pos":"noun","definitions":["alternative form of jitnicer"],"forms":{"plural":"jicniceri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jicnicer","accusative-definite-nominative-singular":"jicnicerul","accusative-indefinite-nominative-plural":"jicniceri","accusative-definite-nominative-plural":"jicnicerii","dative-genitive-indefinite-singular":"jicnicer","dative-definite-genitive-singular":"jicnicerului","dative-genitive-indefinite-plural":"jicniceri","dative-definite-genitive-plural":"jicnicerilor","singular-vocative":"jicnicerule","plural-vocative":"jicnicerilor"}},{"word":"jicnire","pos":"noun","definitions":["obsolete form of jignire"],"forms":{"plural":"jicniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jicnire","accusative-definite-nominative-singular":"jicnirea","accusative-indefinite-nominative-plural":"jicniri","accusative-definite-nominative-plural":"jicnirile","dative-genitive-indefinite-singular":"jicniri","dative-definite-genitive-singular":"jicnirii","dative-genitive-indefinite-plural":"jicniri","dative-definite-genitive-plural":"jicnirilor","singular-vocative":"jicnire","plural-vocative":"jicnirilor"}},{"word":"jicnit","pos":"adj","definitions":["obsolete form of jignit"],"forms":{"feminine-singular":"jicnită","masculine-plural":"jicniți","feminine-neuter-plural":"jicnite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jicnit","error-unrecognized-form-feminine-indefinite-singular":"jicnită","error-unrecognized-form-indefinite-masculine-plural":"jicniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jicnite","definite-error-unrecognized-form-masculine-neuter-singular":"jicnitul","definite-error-unrecognized-form-feminine-singular":"jicnita","definite-error-unrecognized-form-masculine-plural":"jicniții","definite-error-unrecognized-form-feminine-neuter-plural":"jicnitele"}},{"word":"jicniță","pos":"noun","definitions":["obsolete form of jitniță"],"forms":{"plural":"jicnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jicniță","accusative-definite-nominative-singular":"jicnița","accusative-indefinite-nominative-plural":"jicnițe","accusative-definite-nominative-plural":"jicnițele","dative-genitive-indefinite-singular":"jicnițe","dative-definite-genitive-singular":"jicniței","dative-genitive-indefinite-plural":"jicnițe","dative-definite-genitive-plural":"jicnițelor","singular-vocative":"jicniță","plural-vocative":"jicnițelor"}},{"word":"jid","pos":"noun","definitions":["Jewish"],"forms":{"plural":"jizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jid","accusative-definite-nominative-singular":"jidul","accusative-indefinite-nominative-plural":"jizi","accusative-definite-nominative-plural":"jizii","dative-genitive-indefinite-singular":"jid","dative-definite-genitive-singular":"jidului","dative-genitive-indefinite-plural":"jizi","dative-definite-genitive-plural":"jizilor","singular-vocative":"jidule","plural-vocative":"jizilor"}},{"word":"jidan","pos":"noun","definitions":["Jew, yid, kike"],"pronunciation":"/ʒiˈdan/","forms":{"plural":"jidani","feminine":"equivalent jidancă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jidan","accusative-definite-nominative-singular":"jidanul","accusative-indefinite-nominative-plural":"jidani","accusative-definite-nominative-plural":"jidanii","dative-genitive-indefinite-singular":"jidan","dative-definite-genitive-singular":"jidanului","dative-genitive-indefinite-plural":"jidani","dative-definite-genitive-plural":"jidanilor","singular-vocative":"jidanule","plural-vocative":"jidanilor"}},{"word":"jidancă","pos":"noun","definitions":["Jewess"],"forms":{"plural":"jidance","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jidancă","accusative-definite-nominative-singular":"jidanca","accusative-indefinite-nominative-plural":"jidance","accusative-definite-nominative-plural":"jidancele","dative-genitive-indefinite-singular":"jidance","dative-definite-genitive-singular":"jidancei","dative-genitive-indefinite-plural":"jidance","dative-definite-genitive-plural":"jidancelor","singular-vocative":"jidancă","plural-vocative":"jidancelor"}},{"word":"jidanul","pos":"noun","definitions":["definite nominative/accusative singular of jidan"]},{"word":"Jidanul","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Bicaz","a river in Hunedoara, Romania, tributary to the Jiul de Vest"],"gender":"m"},{"word":"jidănaș","pos":"noun","definitions":["diminutive of jidan"],"forms":{"plural":"jidănași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"jidănaș","accusative-definite-nominative":"jidănașul","dative-genitive-indefinite":"jidănaș","dative-definite-genitive":"jidănașului","vocative":"jidănașule"}},{"word":"jidăncuță","pos":"noun","definitions":["diminutive of jidancă; (derogatory, ethnic slur) small Jewess"],"forms":{"plural":"jidăncuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jidăncuță","accusative-definite-nominative-singular":"jidăncuța","accusative-indefinite-nominative-plural":"jidăncuțe","accusative-definite-nominative-plural":"jidăncuțele","dative-genitive-indefinite-singular":"jidăncuțe","dative-definite-genitive-singular":"jidăncuței","dative-genitive-indefinite-plural":"jidăncuțe","dative-definite-genitive-plural":"jidăncuțelor","singular-vocative":"jidăncuță","plural-vocative":"jidăncuțelor"}},{"word":"jidănesc","pos":"adj","definitions":["Jewishly"],"forms":{"feminine-singular":"jidănească","plural":"jidănești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jidănesc","error-unrecognized-form-feminine-indefinite-singular":"jidănească","error-unrecognized-form-indefinite-masculine-plural":"jidănești","error-unrecognized-form-feminine-indefinite-neuter-plural":"jidănești","definite-error-unrecognized-form-masculine-neuter-singular":"jidănescul","definite-error-unrecognized-form-feminine-singular":"jidăneasca","definite-error-unrecognized-form-masculine-plural":"jidăneștii","definite-error-unrecognized-form-feminine-neuter-plural":"jidăneștile"}},{"word":"jidănime","pos":"noun","definitions":["Jewdom, Jewry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"jidănime","accusative-definite-nominative":"jidănimea","dative-genitive-indefinite":"jidănimi","dative-definite-genitive":"jidănimii","vocative":"jidănime"}},{"word":"jidoaică","pos":"noun","definitions":["Jewess"],"forms":{"plural":"jidoaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jidoaică","accusative-definite-nominative-singular":"jidoaica","accusative-indefinite-nominative-plural":"jidoaice","accusative-definite-nominative-plural":"jidoaicele","dative-genitive-indefinite-singular":"jidoaice","dative-definite-genitive-singular":"jidoaicei","dative-genitive-indefinite-plural":"jidoaice","dative-definite-genitive-plural":"jidoaicelor","singular-vocative":"jidoaică","plural-vocative":"jidoaicelor"}},{"word":"jidoavcă","pos":"noun","definitions":["Jewess"],"forms":{"plural":"jidoavce","alternative":"jidoafcă"}},{"word":"jidoavce","pos":"noun","definitions":["plural of jidoavcă"]},{"word":"jidofcuță","pos":"noun","definitions":["diminutive of jidovcă"],"forms":{"plural":"jidofcuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jidofcuță","accusative-definite-nominative-singular":"jidofcuța","accusative-indefinite-nominative-plural":"jidofcuțe","accusative-definite-nominative-plural":"jidofcuțele","dative-genitive-indefinite-singular":"jidofcuțe","dative-definite-genitive-singular":"jidofcuței","dative-genitive-indefinite-plural":"jidofcuțe","dative-definite-genitive-plural":"jidofcuțelor","singular-vocative":"jidofcuță","plural-vocative":"jidofcuțelor"}},{"word":"Jidoi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Jidoi"}},{"word":"Jidoștina","pos":"name","definitions":["a village in Șugag, Alba County, Romania"],"gender":"f"},{"word":"Jidoștița","pos":"name","definitions":["a river in Mehedinți, Romania, tributary to the Danube","a village in Breznița-Ocol, Mehedinți County, Romania"],"gender":"f"},{"word":"jidov","pos":"noun","definitions":["Jew","yid, kike"],"forms":{"plural":"jidovi","feminine":"equivalent jidoavcă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jidov","accusative-definite-nominative-singular":"jidovul","accusative-indefinite-nominative-plural":"jidovi","accusative-definite-nominative-plural":"jidovii","dative-genitive-indefinite-singular":"jidov","dative-definite-genitive-singular":"jidovului","dative-genitive-indefinite-plural":"jidovi","dative-definite-genitive-plural":"jidovilor","singular-vocative":"jidovule","plural-vocative":"jidovilor"}},{"word":"Jidov","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Jidov"}},{"word":"jidovcă","pos":"noun","definitions":["Jewish woman"],"forms":{"plural":"jidovce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jidovcă","accusative-definite-nominative-singular":"jidovca","accusative-indefinite-nominative-plural":"jidovce","accusative-definite-nominative-plural":"jidovcele","dative-genitive-indefinite-singular":"jidovce","dative-definite-genitive-singular":"jidovcei","dative-genitive-indefinite-plural":"jidovce","dative-definite-genitive-plural":"jidovcelor","singular-vocative":"jidovcă","plural-vocative":"jidovcelor"}},{"word":"Jidoveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jidoveanu"}},{"word":"jidovesc","pos":"adj","definitions":["Jewishly"],"forms":{"feminine-singular":"jidovească","plural":"jidovești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jidovesc","error-unrecognized-form-feminine-indefinite-singular":"jidovească","error-unrecognized-form-indefinite-masculine-plural":"jidovești","error-unrecognized-form-feminine-indefinite-neuter-plural":"jidovești","definite-error-unrecognized-form-masculine-neuter-singular":"jidovescul","definite-error-unrecognized-form-feminine-singular":"jidoveasca","definite-error-unrecognized-form-masculine-plural":"jidoveștii","definite-error-unrecognized-form-feminine-neuter-plural":"jidoveștile"}},{"word":"jidovește","pos":"adv","definitions":["Jewishly"]},{"word":"jidovie","pos":"noun","definitions":["Jewish faith"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"jidovie","accusative-definite-nominative":"jidovia","dative-genitive-indefinite":"jidovii","dative-definite-genitive":"jidoviei","vocative":"jidovie"}},{"word":"jidovime","pos":"noun","definitions":["Jews (collectively)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"jidovime","accusative-definite-nominative":"jidovimea","dative-genitive-indefinite":"jidovimi","dative-definite-genitive":"jidovimii","vocative":"jidovime"}},{"word":"jidovin","pos":"noun","definitions":["a Jew"],"forms":{"plural":"jidovini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jidovin","accusative-definite-nominative-singular":"jidovinul","accusative-indefinite-nominative-plural":"jidovini","accusative-definite-nominative-plural":"jidovinii","dative-genitive-indefinite-singular":"jidovin","dative-definite-genitive-singular":"jidovinului","dative-genitive-indefinite-plural":"jidovini","dative-definite-genitive-plural":"jidovinilor","singular-vocative":"jidovinule","plural-vocative":"jidovinilor"}},{"word":"jidovoaică","pos":"noun","definitions":["female equivalent of jidov"],"forms":{"plural":"jidovoaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jidovoaică","accusative-definite-nominative-singular":"jidovoaica","accusative-indefinite-nominative-plural":"jidovoaice","accusative-definite-nominative-plural":"jidovoaicele","dative-genitive-indefinite-singular":"jidovoaice","dative-definite-genitive-singular":"jidovoaicei","dative-genitive-indefinite-plural":"jidovoaice","dative-definite-genitive-plural":"jidovoaicelor","singular-vocative":"jidovoaică","plural-vocative":"jidovoaicelor"}},{"word":"Jidovu","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Jidovu"}},{"word":"Jidvei","pos":"name","definitions":["a commune of Alba County, Romania","a village in Jidvei, Alba County, Romania"],"gender":"m"},{"word":"Jienaru","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jienaru"}},{"word":"jieneasca","pos":"noun","definitions":["a Romanian folk dance"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"jieneasca","accusative-definite-nominative":"jieneasca","dative-genitive-indefinite":"jienești","dative-definite-genitive":"jieneștii","vocative":"-"}},{"word":"Jienescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Jienescu"}},{"word":"Jieni","pos":"name","definitions":["a village in Șimnicu de Sus, Dolj County, Romania","a village in Rusănești, Olt County, Romania"],"gender":"m"},{"word":"Jieț","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Jiul de Est","a locality in Petrila, Hunedoara County, Romania"],"gender":"m"},{"word":"jig","pos":"noun","definitions":["obsolete form of jeg"],"forms":{"plural":"jiguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jig","accusative-definite-nominative-singular":"jigul","accusative-indefinite-nominative-plural":"jiguri","accusative-definite-nominative-plural":"jigurile","dative-genitive-indefinite-singular":"jig","dative-definite-genitive-singular":"jigului","dative-genitive-indefinite-plural":"jiguri","dative-definite-genitive-plural":"jigurilor","singular-vocative":"jigule","plural-vocative":"jigurilor"}},{"word":"jiganie","pos":"noun","definitions":["wild beast"],"forms":{"plural":"jigănii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jiganie","accusative-definite-nominative-singular":"jigania","accusative-indefinite-nominative-plural":"jiganii","accusative-definite-nominative-plural":"jiganiile","dative-genitive-indefinite-singular":"jiganii","dative-definite-genitive-singular":"jiganiei","dative-genitive-indefinite-plural":"jiganii","dative-definite-genitive-plural":"jiganiilor","singular-vocative":"jiganie","plural-vocative":"jiganiilor"}},{"word":"Jiganie","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jiganie"}},{"word":"jigăniuță","pos":"noun","definitions":["diminutive of jiganie"],"forms":{"plural":"jigăniuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jigăniuță","accusative-definite-nominative-singular":"jigăniuța","accusative-indefinite-nominative-plural":"jigăniuțe","accusative-definite-nominative-plural":"jigăniuțele","dative-genitive-indefinite-singular":"jigăniuțe","dative-definite-genitive-singular":"jigăniuței","dative-genitive-indefinite-plural":"jigăniuțe","dative-definite-genitive-plural":"jigăniuțelor","singular-vocative":"jigăniuță","plural-vocative":"jigăniuțelor"}},{"word":"jigărainiță","pos":"noun","definitions":["mange"],"forms":{"plural":"jigărainițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jigărainiță","accusative-definite-nominative-singular":"jigărainița","accusative-indefinite-nominative-plural":"jigărainițe","accusative-definite-nominative-plural":"jigărainițele","dative-genitive-indefinite-singular":"jigărainițe","dative-definite-genitive-singular":"jigărainiței","dative-genitive-indefinite-plural":"jigărainițe","dative-definite-genitive-plural":"jigărainițelor","singular-vocative":"jigărainiță","plural-vocative":"jigărainițelor"}},{"word":"jigăreală","pos":"noun","definitions":["feebleness"],"forms":{"plural":"jigăreli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jigăreală","accusative-definite-nominative-singular":"jigăreala","accusative-indefinite-nominative-plural":"jigărele","accusative-definite-nominative-plural":"jigărelele","dative-genitive-indefinite-singular":"jigărele","dative-definite-genitive-singular":"jigărelei","dative-genitive-indefinite-plural":"jigărele","dative-definite-genitive-plural":"jigărelelor","singular-vocative":"jigăreală","plural-vocative":"jigărelelor"}},{"word":"jigări","pos":"verb","definitions":["to become weak"],"forms":{"canonical":"a jigări 4th conjugation","present-singular-third-person":"jigărește","participle-past":"jigărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jigări","gerund":"jigărind","first-person-indicative-present-singular":"jigăresc","indicative-present-second-person-singular":"jigărești","indicative-present-singular-third-person":"jigărește","first-person-indicative-plural-present":"jigărim","indicative-plural-present-second-person":"jigăriți","indicative-plural-present-third-person":"jigăresc","first-person-imperfect-indicative-singular":"jigăream","imperfect-indicative-second-person-singular":"jigăreai","imperfect-indicative-singular-third-person":"jigărea","first-person-imperfect-indicative-plural":"jigăream","imperfect-indicative-plural-second-person":"jigăreați","imperfect-indicative-plural-third-person":"jigăreau","first-person-indicative-perfect-singular":"jigării","indicative-perfect-second-person-singular":"jigăriși","indicative-perfect-singular-third-person":"jigări","first-person-indicative-perfect-plural":"jigărirăm","indicative-perfect-plural-second-person":"jigărirăți","indicative-perfect-plural-third-person":"jigăriră","first-person-indicative-pluperfect-singular":"jigărisem","indicative-pluperfect-second-person-singular":"jigăriseși","indicative-pluperfect-singular-third-person":"jigărise","first-person-indicative-pluperfect-plural":"jigăriserăm","indicative-pluperfect-plural-second-person":"jigăriserăți","indicative-pluperfect-plural-third-person":"jigăriseră","first-person-present-singular-subjunctive":"să jigăresc","present-second-person-singular-subjunctive":"să jigărești","present-singular-subjunctive-third-person":"să jigărească","first-person-plural-present-subjunctive":"să jigărim","plural-present-second-person-subjunctive":"să jigăriți","plural-present-subjunctive-third-person":"să jigărească","imperative-second-person-singular":"jigărește","imperative-plural-second-person":"jigăriți","imperative-negative-second-person-singular":"nu jigări","imperative-negative-plural-second-person":"nu jigăriți"}},{"word":"jigăriță","pos":"noun","definitions":["cow lung"],"forms":{"plural":"jigărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jigăriță","accusative-definite-nominative-singular":"jigărița","accusative-indefinite-nominative-plural":"jigărițe","accusative-definite-nominative-plural":"jigărițele","dative-genitive-indefinite-singular":"jigărițe","dative-definite-genitive-singular":"jigăriței","dative-genitive-indefinite-plural":"jigărițe","dative-definite-genitive-plural":"jigărițelor","singular-vocative":"jigăriță","plural-vocative":"jigărițelor"}},{"word":"jigâricioară","pos":"noun","definitions":["diminutive of jigăriță"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"jigâricioară","accusative-definite-nominative":"jigâricioara","dative-genitive-indefinite":"jigâricioare","dative-definite-genitive":"jigâricioarei","vocative":"jigâricioară"}},{"word":"jigluitură","pos":"noun","definitions":["balustrade"],"forms":{"plural":"jigluituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jigluitură","accusative-definite-nominative-singular":"jigluitura","accusative-indefinite-nominative-plural":"jigluituri","accusative-definite-nominative-plural":"jigluiturile","dative-genitive-indefinite-singular":"jigluituri","dative-definite-genitive-singular":"jigluiturii","dative-genitive-indefinite-plural":"jigluituri","dative-definite-genitive-plural":"jigluiturilor","singular-vocative":"jigluitură","plural-vocative":"jigluiturilor"}},{"word":"jigni","pos":"verb","definitions":["to insult, to offend, to humiliate, to hurt"],"pronunciation":"/ʒiɡˈni/","forms":{"canonical":"a jigni 4th conjugation","present-singular-third-person":"jignește","participle-past":"jignit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jigni","gerund":"jignind","first-person-indicative-present-singular":"jignesc","indicative-present-second-person-singular":"jignești","indicative-present-singular-third-person":"jignește","first-person-indicative-plural-present":"jignim","indicative-plural-present-second-person":"jigniți","indicative-plural-present-third-person":"jignesc","first-person-imperfect-indicative-singular":"jigneam","imperfect-indicative-second-person-singular":"jigneai","imperfect-indicative-singular-third-person":"jignea","first-person-imperfect-indicative-plural":"jigneam","imperfect-indicative-plural-second-person":"jigneați","imperfect-indicative-plural-third-person":"jigneau","first-person-indicative-perfect-singular":"jignii","indicative-perfect-second-person-singular":"jigniși","indicative-perfect-singular-third-person":"jigni","first-person-indicative-perfect-plural":"jignirăm","indicative-perfect-plural-second-person":"jignirăți","indicative-perfect-plural-third-person":"jigniră","first-person-indicative-pluperfect-singular":"jignisem","indicative-pluperfect-second-person-singular":"jigniseși","indicative-pluperfect-singular-third-person":"jignise","first-person-indicative-pluperfect-plural":"jigniserăm","indicative-pluperfect-plural-second-person":"jigniserăți","indicative-pluperfect-plural-third-person":"jigniseră","first-person-present-singular-subjunctive":"să jignesc","present-second-person-singular-subjunctive":"să jignești","present-singular-subjunctive-third-person":"să jignească","first-person-plural-present-subjunctive":"să jignim","plural-present-second-person-subjunctive":"să jigniți","plural-present-subjunctive-third-person":"să jignească","imperative-second-person-singular":"jignește","imperative-plural-second-person":"jigniți","imperative-negative-second-person-singular":"nu jigni","imperative-negative-plural-second-person":"nu jigniți"}},{"word":"jignicer","pos":"noun","definitions":["alternative form of jitnicer"],"forms":{"plural":"jigniceri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jignicer","accusative-definite-nominative-singular":"jignicerul","accusative-indefinite-nominative-plural":"jigniceri","accusative-definite-nominative-plural":"jignicerii","dative-genitive-indefinite-singular":"jignicer","dative-definite-genitive-singular":"jignicerului","dative-genitive-indefinite-plural":"jigniceri","dative-definite-genitive-plural":"jignicerilor","singular-vocative":"jignicerule","plural-vocative":"jignicerilor"}},{"word":"jignire","pos":"noun","definitions":["offense"],"forms":{"plural":"jigniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jignire","accusative-definite-nominative-singular":"jignirea","accusative-indefinite-nominative-plural":"jigniri","accusative-definite-nominative-plural":"jignirile","dative-genitive-indefinite-singular":"jigniri","dative-definite-genitive-singular":"jignirii","dative-genitive-indefinite-plural":"jigniri","dative-definite-genitive-plural":"jignirilor","singular-vocative":"jignire","plural-vocative":"jignirilor"}},{"word":"jignit","pos":"adj","definitions":["insulted"],"forms":{"feminine-singular":"jignită","masculine-plural":"jigniți","feminine-neuter-plural":"jignite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jignit","error-unrecognized-form-feminine-indefinite-singular":"jignită","error-unrecognized-form-indefinite-masculine-plural":"jigniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jignite","definite-error-unrecognized-form-masculine-neuter-singular":"jignitul","definite-error-unrecognized-form-feminine-singular":"jignita","definite-error-unrecognized-form-masculine-plural":"jigniții","definite-error-unrecognized-form-feminine-neuter-plural":"jignitele"}},{"word":"jignitor","pos":"adj","definitions":["offensive"],"forms":{"feminine-singular":"jignitoare","masculine-plural":"jignitori","feminine-neuter-plural":"jignitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jignitor","error-unrecognized-form-feminine-indefinite-singular":"jignitoare","error-unrecognized-form-indefinite-masculine-plural":"jignitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"jignitoare","definite-error-unrecognized-form-masculine-neuter-singular":"jignitorul","definite-error-unrecognized-form-feminine-singular":"jignitoarea","definite-error-unrecognized-form-masculine-plural":"jignitorii","definite-error-unrecognized-form-feminine-neuter-plural":"jignitoarele"}},{"word":"jigniță","pos":"noun","definitions":["obsolete form of jitniță"],"forms":{"plural":"jignițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jigniță","accusative-definite-nominative-singular":"jignița","accusative-indefinite-nominative-plural":"jignițe","accusative-definite-nominative-plural":"jignițele","dative-genitive-indefinite-singular":"jignițe","dative-definite-genitive-singular":"jigniței","dative-genitive-indefinite-plural":"jignițe","dative-definite-genitive-plural":"jignițelor","singular-vocative":"jigniță","plural-vocative":"jignițelor"}},{"word":"jigodie","pos":"noun","definitions":["mange","cur, twerp","hireling"],"forms":{"plural":"jigodii"}},{"word":"jigodii","pos":"noun","definitions":["plural of jigodie"]},{"word":"Jigodin-Băi","pos":"name","definitions":["a locality in Miercurea Ciuc, Harghita County, Romania"],"gender":"m"},{"word":"jigodios","pos":"adj","definitions":["mangy"],"forms":{"feminine-singular":"jigodioasă","masculine-plural":"jigodioși","feminine-neuter-plural":"jigodioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jigodios","error-unrecognized-form-feminine-indefinite-singular":"jigodioasă","error-unrecognized-form-indefinite-masculine-plural":"jigodioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"jigodioase","definite-error-unrecognized-form-masculine-neuter-singular":"jigodiosul","definite-error-unrecognized-form-feminine-singular":"jigodioasa","definite-error-unrecognized-form-masculine-plural":"jigodioșii","definite-error-unrecognized-form-feminine-neuter-plural":"jigodioasele"}},{"word":"Jigoreni","pos":"name","definitions":["a village in Țibănești, Iași County, Romania"],"gender":"m"},{"word":"jigou","pos":"noun","definitions":["lamb leg"],"forms":{"plural":"jigouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jigou","accusative-definite-nominative-singular":"jigoul","accusative-indefinite-nominative-plural":"jigouri","accusative-definite-nominative-plural":"jigourile","dative-genitive-indefinite-singular":"jigou","dative-definite-genitive-singular":"jigoului","dative-genitive-indefinite-plural":"jigouri","dative-definite-genitive-plural":"jigourilor","singular-vocative":"jigoule","plural-vocative":"jigourilor"}},{"word":"jihad","pos":"noun","definitions":["jihad"],"forms":{"plural":"jihaduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jihad","accusative-definite-nominative-singular":"jihadul","accusative-indefinite-nominative-plural":"jihaduri","accusative-definite-nominative-plural":"jihadurile","dative-genitive-indefinite-singular":"jihad","dative-definite-genitive-singular":"jihadului","dative-genitive-indefinite-plural":"jihaduri","dative-definite-genitive-plural":"jihadurilor","singular-vocative":"jihadule","plural-vocative":"jihadurilor"}},{"word":"Jijia","pos":"name","definitions":["a river in Romania and Ukraine, tributary to the Prut","a river in Suceava, Romania, tributary to the Boul","a village in Albești, Botoșani County, Romania"],"gender":"f"},{"word":"jijină","pos":"noun","definitions":["dirt, filth, grime"],"forms":{"plural":"jijine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jijină","accusative-definite-nominative-singular":"jijina","accusative-indefinite-nominative-plural":"jijine","accusative-definite-nominative-plural":"jijinele","dative-genitive-indefinite-singular":"jijine","dative-definite-genitive-singular":"jijinei","dative-genitive-indefinite-plural":"jijine","dative-definite-genitive-plural":"jijinelor","singular-vocative":"jijină","plural-vocative":"jijinelor"}},{"word":"Jijioara","pos":"name","definitions":["a river in Iași, Romania, tributary to the Jijia"],"gender":"f"},{"word":"jilav","pos":"adj","definitions":["wet"],"forms":{"feminine-singular":"jilavă","masculine-plural":"jilavi","feminine-neuter-plural":"jilave","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jilav","error-unrecognized-form-feminine-indefinite-singular":"jilavă","error-unrecognized-form-indefinite-masculine-plural":"jilavi","error-unrecognized-form-feminine-indefinite-neuter-plural":"jilave","definite-error-unrecognized-form-masculine-neuter-singular":"jilavul","definite-error-unrecognized-form-feminine-singular":"jilava","definite-error-unrecognized-form-masculine-plural":"jilavii","definite-error-unrecognized-form-feminine-neuter-plural":"jilavele"}},{"word":"Jilava","pos":"name","definitions":["a commune of Ilfov County, Romania","a village in Jilava, Ilfov County, Romania"],"gender":"f"},{"word":"Jilavele","pos":"name","definitions":["a commune of Ialomița County, Romania","a village in Jilavele, Ialomița County, Romania"],"gender":"m"},{"word":"Jilavu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jilavu"}},{"word":"jilă","pos":"noun","definitions":["vein (of a horse)"],"forms":{"plural":"jile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jilă","accusative-definite-nominative-singular":"jila","accusative-indefinite-nominative-plural":"jile","accusative-definite-nominative-plural":"jilele","dative-genitive-indefinite-singular":"jile","dative-definite-genitive-singular":"jilei","dative-genitive-indefinite-plural":"jile","dative-definite-genitive-plural":"jilelor","singular-vocative":"jilă","plural-vocative":"jilelor"}},{"word":"jilău","pos":"noun","definitions":["plane"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jilău","accusative-definite-nominative":"jilăuul","dative-genitive-indefinite":"jilău","dative-definite-genitive":"jilăuului","vocative":"jilăuule"}},{"word":"jilăveală","pos":"noun","definitions":["moisting"],"forms":{"plural":"jilăveli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jilăveală","accusative-definite-nominative-singular":"jilăveala","accusative-indefinite-nominative-plural":"jilăveli","accusative-definite-nominative-plural":"jilăvelile","dative-genitive-indefinite-singular":"jilăveli","dative-definite-genitive-singular":"jilăvelii","dative-genitive-indefinite-plural":"jilăveli","dative-definite-genitive-plural":"jilăvelilor","singular-vocative":"jilăveală","plural-vocative":"jilăvelilor"}},{"word":"Jilăveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jilăveanu"}},{"word":"jilăvi","pos":"verb","definitions":["to moisten, to wet"],"forms":{"canonical":"a jilăvi 4th conjugation","present-singular-third-person":"jilăvește","participle-past":"jilăvit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jilăvi","gerund":"jilăvind","first-person-indicative-present-singular":"jilăvesc","indicative-present-second-person-singular":"jilăvești","indicative-present-singular-third-person":"jilăvește","first-person-indicative-plural-present":"jilăvim","indicative-plural-present-second-person":"jilăviți","indicative-plural-present-third-person":"jilăvesc","first-person-imperfect-indicative-singular":"jilăveam","imperfect-indicative-second-person-singular":"jilăveai","imperfect-indicative-singular-third-person":"jilăvea","first-person-imperfect-indicative-plural":"jilăveam","imperfect-indicative-plural-second-person":"jilăveați","imperfect-indicative-plural-third-person":"jilăveau","first-person-indicative-perfect-singular":"jilăvii","indicative-perfect-second-person-singular":"jilăviși","indicative-perfect-singular-third-person":"jilăvi","first-person-indicative-perfect-plural":"jilăvirăm","indicative-perfect-plural-second-person":"jilăvirăți","indicative-perfect-plural-third-person":"jilăviră","first-person-indicative-pluperfect-singular":"jilăvisem","indicative-pluperfect-second-person-singular":"jilăviseși","indicative-pluperfect-singular-third-person":"jilăvise","first-person-indicative-pluperfect-plural":"jilăviserăm","indicative-pluperfect-plural-second-person":"jilăviserăți","indicative-pluperfect-plural-third-person":"jilăviseră","first-person-present-singular-subjunctive":"să jilăvesc","present-second-person-singular-subjunctive":"să jilăvești","present-singular-subjunctive-third-person":"să jilăvească","first-person-plural-present-subjunctive":"să jilăvim","plural-present-second-person-subjunctive":"să jilăviți","plural-present-subjunctive-third-person":"să jilăvească","imperative-second-person-singular":"jilăvește","imperative-plural-second-person":"jilăviți","imperative-negative-second-person-singular":"nu jilăvi","imperative-negative-plural-second-person":"nu jilăviți"}},{"word":"jilăvie","pos":"noun","definitions":["humidity"],"forms":{"plural":"jilăvii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jilăvie","accusative-definite-nominative-singular":"jilăvia","accusative-indefinite-nominative-plural":"jilăvii","accusative-definite-nominative-plural":"jilăviile","dative-genitive-indefinite-singular":"jilăvii","dative-definite-genitive-singular":"jilăviei","dative-genitive-indefinite-plural":"jilăvii","dative-definite-genitive-plural":"jilăviilor","singular-vocative":"jilăvie","plural-vocative":"jilăviilor"}},{"word":"jilăvire","pos":"noun","definitions":["wetting"],"forms":{"plural":"jilăviri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jilăvire","accusative-definite-nominative-singular":"jilăvirea","accusative-indefinite-nominative-plural":"jilăviri","accusative-definite-nominative-plural":"jilăvirile","dative-genitive-indefinite-singular":"jilăviri","dative-definite-genitive-singular":"jilăvirii","dative-genitive-indefinite-plural":"jilăviri","dative-definite-genitive-plural":"jilăvirilor","singular-vocative":"jilăvire","plural-vocative":"jilăvirilor"}},{"word":"jilăvit","pos":"adj","definitions":["humid"],"forms":{"feminine-singular":"jilăvită","masculine-plural":"jilăviți","feminine-neuter-plural":"jilăvite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jilăvit","error-unrecognized-form-feminine-indefinite-singular":"jilăvită","error-unrecognized-form-indefinite-masculine-plural":"jilăviți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jilăvite","definite-error-unrecognized-form-masculine-neuter-singular":"jilăvitul","definite-error-unrecognized-form-feminine-singular":"jilăvita","definite-error-unrecognized-form-masculine-plural":"jilăviții","definite-error-unrecognized-form-feminine-neuter-plural":"jilăvitele"}},{"word":"jilăvit","pos":"verb","definitions":["past participle of jilăvi"],"forms":{"participle-past":"of jilăvi"}},{"word":"jiletcă","pos":"noun","definitions":["waistcoat"],"forms":{"plural":"jiletci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jiletcă","accusative-definite-nominative-singular":"jiletca","accusative-indefinite-nominative-plural":"jiletci","accusative-definite-nominative-plural":"jiletcile","dative-genitive-indefinite-singular":"jiletci","dative-definite-genitive-singular":"jiletcii","dative-genitive-indefinite-plural":"jiletci","dative-definite-genitive-plural":"jiletcilor","singular-vocative":"jiletcă","plural-vocative":"jiletcilor"}},{"word":"jiletcel","pos":"noun","definitions":["diminutive of jiletcă"],"forms":{"plural":"jiletcele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jiletcel","accusative-definite-nominative-singular":"jiletcelul","accusative-indefinite-nominative-plural":"jiletcele","accusative-definite-nominative-plural":"jiletcelele","dative-genitive-indefinite-singular":"jiletcel","dative-definite-genitive-singular":"jiletcelului","dative-genitive-indefinite-plural":"jiletcele","dative-definite-genitive-plural":"jiletcelelor","singular-vocative":"jiletcelule","plural-vocative":"jiletcelelor"}},{"word":"Jiloveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jiloveanu"}},{"word":"jilț","pos":"noun","definitions":["alternative form of jeț"],"forms":{"plural":"jilțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jilț","accusative-definite-nominative-singular":"jilțul","accusative-indefinite-nominative-plural":"jilțuri","accusative-definite-nominative-plural":"jilțurile","dative-genitive-indefinite-singular":"jilț","dative-definite-genitive-singular":"jilțului","dative-genitive-indefinite-plural":"jilțuri","dative-definite-genitive-plural":"jilțurilor","singular-vocative":"jilțule","plural-vocative":"jilțurilor"}},{"word":"Jilț","pos":"name","definitions":["a river in Gorj, Romania, tributary to the Jiu"],"gender":"m"},{"word":"Jilț Slivilești","pos":"name","definitions":["a river in Gorj County, Romania, tributary to the Jilț"],"gender":"m"},{"word":"Jilțu","pos":"name","definitions":["a locality in Turceni, Gorj County, Romania","a surname"],"gender":"m","forms":{"dative-genitive":"lui Jilțu"}},{"word":"Jilțul Mic","pos":"name","definitions":["a river in Gorj, Romania, tributary to the Jilț"],"gender":"m"},{"word":"jimblar","pos":"noun","definitions":["baker"],"forms":{"plural":"jimblari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jimblar","accusative-definite-nominative-singular":"jimblarul","accusative-indefinite-nominative-plural":"jimblari","accusative-definite-nominative-plural":"jimblarii","dative-genitive-indefinite-singular":"jimblar","dative-definite-genitive-singular":"jimblarului","dative-genitive-indefinite-plural":"jimblari","dative-definite-genitive-plural":"jimblarilor","singular-vocative":"jimblarule","plural-vocative":"jimblarilor"}},{"word":"Jimblaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Jimblaru"}},{"word":"jimblă","pos":"noun","definitions":["oblong loaf (of bread)"],"forms":{"plural":"jimble","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jimblă","accusative-definite-nominative-singular":"jimbla","accusative-indefinite-nominative-plural":"jimble","accusative-definite-nominative-plural":"jimblele","dative-genitive-indefinite-singular":"jimble","dative-definite-genitive-singular":"jimblei","dative-genitive-indefinite-plural":"jimble","dative-definite-genitive-plural":"jimblelor","singular-vocative":"jimblă","plural-vocative":"jimblelor"}},{"word":"jimblăreasă","pos":"noun","definitions":["female equivalent of jimblar"],"forms":{"plural":"jimblărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jimblăreasă","accusative-definite-nominative-singular":"jimblăreasa","accusative-indefinite-nominative-plural":"jimblărese","accusative-definite-nominative-plural":"jimblăresele","dative-genitive-indefinite-singular":"jimblărese","dative-definite-genitive-singular":"jimblăresei","dative-genitive-indefinite-plural":"jimblărese","dative-definite-genitive-plural":"jimblăreselor","singular-vocative":"jimblăreasă","plural-vocative":"jimblăreselor"}},{"word":"jimblărie","pos":"noun","definitions":["bakery"],"forms":{"plural":"jimblării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jimblărie","accusative-definite-nominative-singular":"jimblăria","accusative-indefinite-nominative-plural":"jimblării","accusative-definite-nominative-plural":"jimblăriile","dative-genitive-indefinite-singular":"jimblării","dative-definite-genitive-singular":"jimblăriei","dative-genitive-indefinite-plural":"jimblării","dative-definite-genitive-plural":"jimblăriilor","singular-vocative":"jimblărie","plural-vocative":"jimblăriilor"}},{"word":"jimblăriță","pos":"noun","definitions":["diminutive of jimblar"],"forms":{"plural":"jimblărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jimblăriță","accusative-definite-nominative-singular":"jimblărița","accusative-indefinite-nominative-plural":"jimblărițe","accusative-definite-nominative-plural":"jimblărițele","dative-genitive-indefinite-singular":"jimblărițe","dative-definite-genitive-singular":"jimblăriței","dative-genitive-indefinite-plural":"jimblărițe","dative-definite-genitive-plural":"jimblărițelor","singular-vocative":"jimblăriță","plural-vocative":"jimblărițelor"}},{"word":"jimbluță","pos":"noun","definitions":["diminutive of jimblă"],"forms":{"plural":"jimbluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jimbluță","accusative-definite-nominative-singular":"jimbluța","accusative-indefinite-nominative-plural":"jimbluțe","accusative-definite-nominative-plural":"jimbluțele","dative-genitive-indefinite-singular":"jimbluțe","dative-definite-genitive-singular":"jimbluței","dative-genitive-indefinite-plural":"jimbluțe","dative-definite-genitive-plural":"jimbluțelor","singular-vocative":"jimbluță","plural-vocative":"jimbluțelor"}},{"word":"Jimbolia","pos":"name","definitions":["a town in Timiș County, Romania"],"gender":"f"},{"word":"Jimbor","pos":"name","definitions":["a village in Chiochiș, Bistrița-Năsăud County, Romania","a village in Homorod, Brașov County, Romania"],"gender":"m"},{"word":"Jimboran","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jimboran"}},{"word":"Jimboru","pos":"name","definitions":["a river in Covasna County, Romania, tributary to the Valea Roșie"],"gender":"m"},{"word":"jimbuliță","pos":"noun","definitions":["diminutive of jimblă"],"forms":{"plural":"jimbulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jimbuliță","accusative-definite-nominative-singular":"jimbulița","accusative-indefinite-nominative-plural":"jimbulițe","accusative-definite-nominative-plural":"jimbulițele","dative-genitive-indefinite-singular":"jimbulițe","dative-definite-genitive-singular":"jimbuliței","dative-genitive-indefinite-plural":"jimbulițe","dative-definite-genitive-plural":"jimbulițelor","singular-vocative":"jimbuliță","plural-vocative":"jimbulițelor"}},{"word":"jinău","pos":"noun","definitions":["suspicion"],"forms":{"plural":"jinaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jinău","accusative-definite-nominative-singular":"jinăuul","accusative-indefinite-nominative-plural":"jinaie","accusative-definite-nominative-plural":"jinaiele","dative-genitive-indefinite-singular":"jinău","dative-definite-genitive-singular":"jinăuului","dative-genitive-indefinite-plural":"jinaie","dative-definite-genitive-plural":"jinaielor","singular-vocative":"jinăuule","plural-vocative":"jinaielor"}},{"word":"jind","pos":"noun","definitions":["envy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jind","accusative-definite-nominative":"jindul","dative-genitive-indefinite":"jind","dative-definite-genitive":"jindului","vocative":"jindule"}},{"word":"jindui","pos":"verb","definitions":["to covet, crave, yearn or long for","to envy"],"forms":{"canonical":"a jindui 4th conjugation","present-singular-third-person":"jinduiește","participle-past":"jinduit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jindui","gerund":"jinduind","first-person-indicative-present-singular":"jinduiesc","indicative-present-second-person-singular":"jinduiești","indicative-present-singular-third-person":"jinduiește","first-person-indicative-plural-present":"jinduim","indicative-plural-present-second-person":"jinduiți","indicative-plural-present-third-person":"jinduiesc","first-person-imperfect-indicative-singular":"jinduiam","imperfect-indicative-second-person-singular":"jinduiai","imperfect-indicative-singular-third-person":"jinduia","first-person-imperfect-indicative-plural":"jinduiam","imperfect-indicative-plural-second-person":"jinduiați","imperfect-indicative-plural-third-person":"jinduiau","first-person-indicative-perfect-singular":"jinduii","indicative-perfect-second-person-singular":"jinduiși","indicative-perfect-singular-third-person":"jindui","first-person-indicative-perfect-plural":"jinduirăm","indicative-perfect-plural-second-person":"jinduirăți","indicative-perfect-plural-third-person":"jinduiră","first-person-indicative-pluperfect-singular":"jinduisem","indicative-pluperfect-second-person-singular":"jinduiseși","indicative-pluperfect-singular-third-person":"jinduise","first-person-indicative-pluperfect-plural":"jinduiserăm","indicative-pluperfect-plural-second-person":"jinduiserăți","indicative-pluperfect-plural-third-person":"jinduiseră","first-person-present-singular-subjunctive":"să jinduiesc","present-second-person-singular-subjunctive":"să jinduiești","present-singular-subjunctive-third-person":"să jinduiască","first-person-plural-present-subjunctive":"să jinduim","plural-present-second-person-subjunctive":"să jinduiți","plural-present-subjunctive-third-person":"să jinduiască","imperative-second-person-singular":"jinduiește","imperative-plural-second-person":"jinduiți","imperative-negative-second-person-singular":"nu jindui","imperative-negative-plural-second-person":"nu jinduiți"}},{"word":"jinduială","pos":"noun","definitions":["craving, coveting"],"forms":{"plural":"jinduieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jinduială","accusative-definite-nominative-singular":"jinduiala","accusative-indefinite-nominative-plural":"jinduiele","accusative-definite-nominative-plural":"jinduielele","dative-genitive-indefinite-singular":"jinduiele","dative-definite-genitive-singular":"jinduielei","dative-genitive-indefinite-plural":"jinduiele","dative-definite-genitive-plural":"jinduielelor","singular-vocative":"jinduială","plural-vocative":"jinduielelor"}},{"word":"jinduire","pos":"noun","definitions":["aching"],"forms":{"plural":"jinduiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jinduire","accusative-definite-nominative-singular":"jinduirea","accusative-indefinite-nominative-plural":"jinduiri","accusative-definite-nominative-plural":"jinduirile","dative-genitive-indefinite-singular":"jinduiri","dative-definite-genitive-singular":"jinduirii","dative-genitive-indefinite-plural":"jinduiri","dative-definite-genitive-plural":"jinduirilor","singular-vocative":"jinduire","plural-vocative":"jinduirilor"}},{"word":"jinduit","pos":"adj","definitions":["coveted"],"forms":{"feminine-singular":"jinduită","masculine-plural":"jinduiți","feminine-neuter-plural":"jinduite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jinduit","error-unrecognized-form-feminine-indefinite-singular":"jinduită","error-unrecognized-form-indefinite-masculine-plural":"jinduiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jinduite","definite-error-unrecognized-form-masculine-neuter-singular":"jinduitul","definite-error-unrecognized-form-feminine-singular":"jinduita","definite-error-unrecognized-form-masculine-plural":"jinduiții","definite-error-unrecognized-form-feminine-neuter-plural":"jinduitele"}},{"word":"jinduitor","pos":"adj","definitions":["covetous"],"forms":{"feminine-singular":"jinduitoare","masculine-plural":"jinduitori","feminine-neuter-plural":"jinduitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jinduitor","error-unrecognized-form-feminine-indefinite-singular":"jinduitoare","error-unrecognized-form-indefinite-masculine-plural":"jinduitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"jinduitoare","definite-error-unrecognized-form-masculine-neuter-singular":"jinduitorul","definite-error-unrecognized-form-feminine-singular":"jinduitoarea","definite-error-unrecognized-form-masculine-plural":"jinduitorii","definite-error-unrecognized-form-feminine-neuter-plural":"jinduitoarele"}},{"word":"Jingoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Jingoiu"}},{"word":"jinteră","pos":"noun","definitions":["earwig"],"forms":{"plural":"jintere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jinteră","accusative-definite-nominative-singular":"jintera","accusative-indefinite-nominative-plural":"jintere","accusative-definite-nominative-plural":"jinterele","dative-genitive-indefinite-singular":"jintere","dative-definite-genitive-singular":"jinterei","dative-genitive-indefinite-plural":"jintere","dative-definite-genitive-plural":"jinterelor","singular-vocative":"jinteră","plural-vocative":"jinterelor"}},{"word":"jintițit","pos":"adj","definitions":["coagulated"],"forms":{"feminine-singular":"jintițită","masculine-plural":"jintițiți","feminine-neuter-plural":"jintițite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jintițit","error-unrecognized-form-feminine-indefinite-singular":"jintițită","error-unrecognized-form-indefinite-masculine-plural":"jintițiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jintițite","definite-error-unrecognized-form-masculine-neuter-singular":"jintițitul","definite-error-unrecognized-form-feminine-singular":"jintițita","definite-error-unrecognized-form-masculine-plural":"jintițiții","definite-error-unrecognized-form-feminine-neuter-plural":"jintițitele"}},{"word":"Jipescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Jipescu"}},{"word":"Jiquidi","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Jiquidi"}},{"word":"jir","pos":"noun","definitions":["beech nut"],"pronunciation":"/ʒir/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jir","accusative-definite-nominative":"jirul","dative-genitive-indefinite":"jir","dative-definite-genitive":"jirului","vocative":"jirule"}},{"word":"jirbiuță","pos":"noun","definitions":["diminutive of jirebie"],"forms":{"plural":"jirbiuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jirbiuță","accusative-definite-nominative-singular":"jirbiuța","accusative-indefinite-nominative-plural":"jirbiuțe","accusative-definite-nominative-plural":"jirbiuțele","dative-genitive-indefinite-singular":"jirbiuțe","dative-definite-genitive-singular":"jirbiuței","dative-genitive-indefinite-plural":"jirbiuțe","dative-definite-genitive-plural":"jirbiuțelor","singular-vocative":"jirbiuță","plural-vocative":"jirbiuțelor"}},{"word":"jireagă","pos":"noun","definitions":["alternative form of șireglă"],"forms":{"plural":"jireage","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jireagă","accusative-definite-nominative-singular":"jireaga","accusative-indefinite-nominative-plural":"jireage","accusative-definite-nominative-plural":"jireagele","dative-genitive-indefinite-singular":"jireage","dative-definite-genitive-singular":"jireagei","dative-genitive-indefinite-plural":"jireage","dative-definite-genitive-plural":"jireagelor","singular-vocative":"jireagă","plural-vocative":"jireagelor"}},{"word":"jirișor","pos":"noun","definitions":["diminutive of jir"],"forms":{"plural":"jirișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jirișor","accusative-definite-nominative-singular":"jirișorul","accusative-indefinite-nominative-plural":"jirișori","accusative-definite-nominative-plural":"jirișorii","dative-genitive-indefinite-singular":"jirișor","dative-definite-genitive-singular":"jirișorului","dative-genitive-indefinite-plural":"jirișori","dative-definite-genitive-plural":"jirișorilor","singular-vocative":"jirișorule","plural-vocative":"jirișorilor"}},{"word":"jiriște","pos":"noun","definitions":["beechwood (forest)"],"forms":{"plural":"jiriști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jiriște","accusative-definite-nominative-singular":"jiriștea","accusative-indefinite-nominative-plural":"jiriști","accusative-definite-nominative-plural":"jiriștile","dative-genitive-indefinite-singular":"jiriști","dative-definite-genitive-singular":"jiriștii","dative-genitive-indefinite-plural":"jiriști","dative-definite-genitive-plural":"jiriștilor","singular-vocative":"jiriște","plural-vocative":"jiriștilor"}},{"word":"Jirlău","pos":"name","definitions":["a commune of Brăila County, Romania","a village in Jirlău, Brăila County, Romania"],"gender":"m"},{"word":"Jirov","pos":"name","definitions":["a village in Corcova, Mehedinți County, Romania"],"gender":"m"},{"word":"jirtăvnic","pos":"noun","definitions":["obsolete form of jertfelnic"],"forms":{"plural":"jirtăvnice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jirtăvnic","accusative-definite-nominative-singular":"jirtăvnicul","accusative-indefinite-nominative-plural":"jirtăvnice","accusative-definite-nominative-plural":"jirtăvnicele","dative-genitive-indefinite-singular":"jirtăvnic","dative-definite-genitive-singular":"jirtăvnicului","dative-genitive-indefinite-plural":"jirtăvnice","dative-definite-genitive-plural":"jirtăvnicelor","singular-vocative":"jirtăvnicule","plural-vocative":"jirtăvnicelor"}},{"word":"jirtvă","pos":"noun","definitions":["obsolete form of jertfă"],"forms":{"plural":"jirtve","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jirtvă","accusative-definite-nominative-singular":"jirtva","accusative-indefinite-nominative-plural":"jirtve","accusative-definite-nominative-plural":"jirtvele","dative-genitive-indefinite-singular":"jirtve","dative-definite-genitive-singular":"jirtvei","dative-genitive-indefinite-plural":"jirtve","dative-definite-genitive-plural":"jirtvelor","singular-vocative":"jirtvă","plural-vocative":"jirtvelor"}},{"word":"Jiru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jiru"}},{"word":"Jitar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Jitar"}},{"word":"Jitariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Jitariu"}},{"word":"Jitariuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Jitariuc"}},{"word":"Jitaru","pos":"name","definitions":["a village in Scornicești, Olt County, Romania"],"gender":"m"},{"word":"jităreasă","pos":"noun","definitions":["female equivalent of jitar"],"forms":{"plural":"jitărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jităreasă","accusative-definite-nominative-singular":"jităreasa","accusative-indefinite-nominative-plural":"jitărese","accusative-definite-nominative-plural":"jităresele","dative-genitive-indefinite-singular":"jitărese","dative-definite-genitive-singular":"jităresei","dative-genitive-indefinite-plural":"jitărese","dative-definite-genitive-plural":"jităreselor","singular-vocative":"jităreasă","plural-vocative":"jităreselor"}},{"word":"Jitărel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jitărel"}},{"word":"Jitărița","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"f"},{"word":"Jităriuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Jităriuc"}},{"word":"jitcă","pos":"noun","definitions":["a Jew"],"forms":{"plural":"jitci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jitcă","accusative-definite-nominative-singular":"jitca","accusative-indefinite-nominative-plural":"jitci","accusative-definite-nominative-plural":"jitcile","dative-genitive-indefinite-singular":"jitci","dative-definite-genitive-singular":"jitcii","dative-genitive-indefinite-plural":"jitci","dative-definite-genitive-plural":"jitcilor","singular-vocative":"jitcă","plural-vocative":"jitcilor"}},{"word":"Jiteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jiteanu"}},{"word":"Jitia de Jos","pos":"name","definitions":["a village in Jitia, Vrancea County, Romania"],"gender":"f"},{"word":"jitie","pos":"noun","definitions":["story","chronic disease"],"forms":{"plural":"jitii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jitie","accusative-definite-nominative-singular":"jitia","accusative-indefinite-nominative-plural":"jitii","accusative-definite-nominative-plural":"jitiile","dative-genitive-indefinite-singular":"jitii","dative-definite-genitive-singular":"jitiei","dative-genitive-indefinite-plural":"jitii","dative-definite-genitive-plural":"jitiilor","singular-vocative":"jitie","plural-vocative":"jitiilor"}},{"word":"Jitin","pos":"name","definitions":["a village in Ciudanovița, Caraș-Severin County, Romania"],"gender":"m"},{"word":"jitniță","pos":"noun","definitions":["granary"],"forms":{"plural":"jitnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jitniță","accusative-definite-nominative-singular":"jitnița","accusative-indefinite-nominative-plural":"jitnițe","accusative-definite-nominative-plural":"jitnițele","dative-genitive-indefinite-singular":"jitnițe","dative-definite-genitive-singular":"jitniței","dative-genitive-indefinite-plural":"jitnițe","dative-definite-genitive-plural":"jitnițelor","singular-vocative":"jitniță","plural-vocative":"jitnițelor"}},{"word":"Jiu","pos":"name","definitions":["a river in Romania"],"gender":"m"},{"word":"jiu-jitsu","pos":"noun","definitions":["jujitsu"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jiu-jitsu","accusative-definite-nominative":"jiu-jitsul","dative-genitive-indefinite":"jiu-jitsu","dative-definite-genitive":"jiu-jitsului","vocative":"jiu-jitsule"}},{"word":"Jiu-Paroșeni","pos":"name","definitions":["a locality in Vulcan, Hunedoara County, Romania"],"gender":"m"},{"word":"Jiul","pos":"name","definitions":["a village in Țuglui, Dolj County, Romania"],"gender":"m"},{"word":"Jiul de Est","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Jiu"],"gender":"m"},{"word":"Jiul de Vest","pos":"name","definitions":["a river in Romania, tributary to the Jiu"],"gender":"m"},{"word":"jivan","pos":"noun","definitions":["bandit, brigand, outlaw"],"forms":{"plural":"jivani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jivan","accusative-definite-nominative-singular":"jivanul","accusative-indefinite-nominative-plural":"jivani","accusative-definite-nominative-plural":"jivanii","dative-genitive-indefinite-singular":"jivan","dative-definite-genitive-singular":"jivanului","dative-genitive-indefinite-plural":"jivani","dative-definite-genitive-plural":"jivanilor","singular-vocative":"jivanule","plural-vocative":"jivanilor"}},{"word":"Jivan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jivan"}},{"word":"Jivanov","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Jivanov"}},{"word":"jivete","pos":"noun","definitions":["the letter zhe (ж) of the Romanian Cyrillic alphabet"],"forms":{"plural":"jiveți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jivete","accusative-definite-nominative-singular":"jiveteul","accusative-indefinite-nominative-plural":"jiveți","accusative-definite-nominative-plural":"jiveții","dative-genitive-indefinite-singular":"jivete","dative-definite-genitive-singular":"jiveteului","dative-genitive-indefinite-plural":"jiveți","dative-definite-genitive-plural":"jiveților","singular-vocative":"jiveteule","plural-vocative":"jiveților"}},{"word":"jivină","pos":"noun","definitions":["wild animal","brute"],"forms":{"plural":"jivine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jivină","accusative-definite-nominative-singular":"jivina","accusative-indefinite-nominative-plural":"jivine","accusative-definite-nominative-plural":"jivinele","dative-genitive-indefinite-singular":"jivine","dative-definite-genitive-singular":"jivinei","dative-genitive-indefinite-plural":"jivine","dative-definite-genitive-plural":"jivinelor","singular-vocative":"jivină","plural-vocative":"jivinelor"}},{"word":"jivinie","pos":"noun","definitions":["wild animal"],"forms":{"plural":"jivinii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jivinie","accusative-definite-nominative-singular":"jivinia","accusative-indefinite-nominative-plural":"jivinii","accusative-definite-nominative-plural":"jiviniile","dative-genitive-indefinite-singular":"jivinii","dative-definite-genitive-singular":"jiviniei","dative-genitive-indefinite-plural":"jivinii","dative-definite-genitive-plural":"jiviniilor","singular-vocative":"jivinie","plural-vocative":"jiviniilor"}},{"word":"jivinuță","pos":"noun","definitions":["diminutive of jivină"],"forms":{"plural":"jivinuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jivinuță","accusative-definite-nominative-singular":"jivinuța","accusative-indefinite-nominative-plural":"jivinuțe","accusative-definite-nominative-plural":"jivinuțele","dative-genitive-indefinite-singular":"jivinuțe","dative-definite-genitive-singular":"jivinuței","dative-genitive-indefinite-plural":"jivinuțe","dative-definite-genitive-plural":"jivinuțelor","singular-vocative":"jivinuță","plural-vocative":"jivinuțelor"}},{"word":"jivraj","pos":"noun","definitions":["icing"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jivraj","accusative-definite-nominative-singular":"jivrajul","accusative-indefinite-nominative-plural":"jivraje","accusative-definite-nominative-plural":"jivrajele","dative-genitive-indefinite-singular":"jivraj","dative-definite-genitive-singular":"jivrajului","dative-genitive-indefinite-plural":"jivraje","dative-definite-genitive-plural":"jivrajelor","singular-vocative":"jivrajule","plural-vocative":"jivrajelor"}},{"word":"jivrat","pos":"adj","definitions":["frosted"],"forms":{"feminine-singular":"jivrată","masculine-plural":"jivrați","feminine-neuter-plural":"jivrate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jivrat","error-unrecognized-form-feminine-indefinite-singular":"jivrată","error-unrecognized-form-indefinite-masculine-plural":"jivrați","error-unrecognized-form-feminine-indefinite-neuter-plural":"jivrate","definite-error-unrecognized-form-masculine-neuter-singular":"jivratul","definite-error-unrecognized-form-feminine-singular":"jivrata","definite-error-unrecognized-form-masculine-plural":"jivrații","definite-error-unrecognized-form-feminine-neuter-plural":"jivratele"}},{"word":"jlipă","pos":"noun","definitions":["plaster"],"forms":{"plural":"jlipe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jlipă","accusative-definite-nominative-singular":"jlipa","accusative-indefinite-nominative-plural":"jlipe","accusative-definite-nominative-plural":"jlipele","dative-genitive-indefinite-singular":"jlipe","dative-definite-genitive-singular":"jlipei","dative-genitive-indefinite-plural":"jlipe","dative-definite-genitive-plural":"jlipelor","singular-vocative":"jlipă","plural-vocative":"jlipelor"}},{"word":"jnăpăi","pos":"verb","definitions":["to beat up"],"forms":{"canonical":"a jnăpăi 4th conjugation","present-singular-third-person":"jnăpăie","participle-past":"jnăpăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a jnăpăi","gerund":"jnăpăind","first-person-indicative-present-singular":"jnăpăi","indicative-present-second-person-singular":"jnăpăi","indicative-present-singular-third-person":"jnăpăie","first-person-indicative-plural-present":"jnăpăim","indicative-plural-present-second-person":"jnăpăiți","indicative-plural-present-third-person":"jnăpăie","first-person-imperfect-indicative-singular":"jnăpăiam","imperfect-indicative-second-person-singular":"jnăpăiai","imperfect-indicative-singular-third-person":"jnăpăia","first-person-imperfect-indicative-plural":"jnăpăiam","imperfect-indicative-plural-second-person":"jnăpăiați","imperfect-indicative-plural-third-person":"jnăpăiau","first-person-indicative-perfect-singular":"jnăpăii","indicative-perfect-second-person-singular":"jnăpăiși","indicative-perfect-singular-third-person":"jnăpăi","first-person-indicative-perfect-plural":"jnăpăirăm","indicative-perfect-plural-second-person":"jnăpăirăți","indicative-perfect-plural-third-person":"jnăpăiră","first-person-indicative-pluperfect-singular":"jnăpăisem","indicative-pluperfect-second-person-singular":"jnăpăiseși","indicative-pluperfect-singular-third-person":"jnăpăise","first-person-indicative-pluperfect-plural":"jnăpăiserăm","indicative-pluperfect-plural-second-person":"jnăpăiserăți","indicative-pluperfect-plural-third-person":"jnăpăiseră","first-person-present-singular-subjunctive":"să jnăpăi","present-second-person-singular-subjunctive":"să jnăpăi","present-singular-subjunctive-third-person":"să jnăpăie","first-person-plural-present-subjunctive":"să jnăpăim","plural-present-second-person-subjunctive":"să jnăpăiți","plural-present-subjunctive-third-person":"să jnăpăie","imperative-second-person-singular":"jnăpăie","imperative-plural-second-person":"jnăpăiți","imperative-negative-second-person-singular":"nu jnăpăi","imperative-negative-plural-second-person":"nu jnăpăiți"}},{"word":"jneapăn","pos":"noun","definitions":["juniper","juniper tree"],"pronunciation":"/ˈʒne̯a.pən/","forms":{"plural":"jnepeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jneapăn","accusative-definite-nominative-singular":"jneapănul","accusative-indefinite-nominative-plural":"jnepeni","accusative-definite-nominative-plural":"jnepenii","dative-genitive-indefinite-singular":"jneapăn","dative-definite-genitive-singular":"jneapănului","dative-genitive-indefinite-plural":"jnepeni","dative-definite-genitive-plural":"jnepenilor","singular-vocative":"jneapănule","plural-vocative":"jnepenilor","alternative":"jnepen"}},{"word":"Jneapăn","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jneapăn"}},{"word":"jnepen","pos":"noun","definitions":["alternative form of jneapăn"],"forms":{"plural":"jnepeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jnepen","accusative-definite-nominative-singular":"jnepenul","accusative-indefinite-nominative-plural":"jnepeni","accusative-definite-nominative-plural":"jnepenii","dative-genitive-indefinite-singular":"jnepen","dative-definite-genitive-singular":"jnepenului","dative-genitive-indefinite-plural":"jnepeni","dative-definite-genitive-plural":"jnepenilor","singular-vocative":"jnepenule","plural-vocative":"jnepenilor"}},{"word":"jnepeni","pos":"noun","definitions":["plural of jneapăn"],"pronunciation":"/ˈʒne.penʲ/","gender":"m-p"},{"word":"jnepeniș","pos":"noun","definitions":["juniper grove"],"forms":{"plural":"jnepenișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jnepeniș","accusative-definite-nominative-singular":"jnepenișul","accusative-indefinite-nominative-plural":"jnepenișuri","accusative-definite-nominative-plural":"jnepenișurile","dative-genitive-indefinite-singular":"jnepeniș","dative-definite-genitive-singular":"jnepenișului","dative-genitive-indefinite-plural":"jnepenișuri","dative-definite-genitive-plural":"jnepenișurilor","singular-vocative":"jnepenișule","plural-vocative":"jnepenișurilor"}},{"word":"Jnepenișului","pos":"name","definitions":["a river in Sibiu, Romania, tributary to the Sfârcașu"],"gender":"m"},{"word":"joacă","pos":"noun","definitions":["play"],"pronunciation":"/ˈʒo̯a.kə/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-manual","accusative-indefinite-nominative-singular":"joacă","accusative-definite-nominative-singular":"joaca","accusative-indefinite-nominative-plural":"-","accusative-definite-nominative-plural":"-","dative-genitive-indefinite-singular":"joace","dative-definite-genitive-singular":"joacăi","dative-genitive-indefinite-plural":"-","dative-definite-genitive-plural":"-","singular-vocative":"-","plural-vocative":"-","alternative":"жоакэ"}},{"word":"joacă","pos":"verb","definitions":["inflection of juca (“to play”):","third-person singular/plural indicative present","second-person singular imperative"],"pronunciation":"/ˈʒo̯a.kə/","forms":{"alternative":"жоакэ"}},{"word":"joacă de copii","pos":"noun","definitions":["child's play"],"forms":{"alternative":"joacă de copil"}},{"word":"joacă de copil","pos":"noun","definitions":["alternative form of joacă de copii (“child’s play”)"]},{"word":"joagăr","pos":"noun","definitions":["a large saw"],"forms":{"plural":"joagăre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"joagăr","accusative-definite-nominative-singular":"joagărul","accusative-indefinite-nominative-plural":"joagăre","accusative-definite-nominative-plural":"joagărele","dative-genitive-indefinite-singular":"joagăr","dative-definite-genitive-singular":"joagărului","dative-genitive-indefinite-plural":"joagăre","dative-definite-genitive-plural":"joagărelor","singular-vocative":"joagărule","plural-vocative":"joagărelor"}},{"word":"Joagăru","pos":"name","definitions":["a river in Sibiu, Romania, tributary to the Valea Strâmbă"],"gender":"m"},{"word":"joardă","pos":"noun","definitions":["rod, stick"],"forms":{"plural":"joarde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"joardă","accusative-definite-nominative-singular":"joarda","accusative-indefinite-nominative-plural":"joarde","accusative-definite-nominative-plural":"joardele","dative-genitive-indefinite-singular":"joarde","dative-definite-genitive-singular":"joardei","dative-genitive-indefinite-plural":"joarde","dative-definite-genitive-plural":"joardelor","singular-vocative":"joardă","plural-vocative":"joardelor"}},{"word":"job","pos":"noun","definitions":["job"],"forms":{"plural":"joburi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"job","accusative-definite-nominative-singular":"jobul","accusative-indefinite-nominative-plural":"joburi","accusative-definite-nominative-plural":"joburile","dative-genitive-indefinite-singular":"job","dative-definite-genitive-singular":"jobului","dative-genitive-indefinite-plural":"joburi","dative-definite-genitive-plural":"joburilor","singular-vocative":"jobule","plural-vocative":"joburilor"}},{"word":"joben","pos":"noun","definitions":["top hat"],"forms":{"plural":"jobene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"joben","accusative-definite-nominative-singular":"jobenul","accusative-indefinite-nominative-plural":"jobene","accusative-definite-nominative-plural":"jobenele","dative-genitive-indefinite-singular":"joben","dative-definite-genitive-singular":"jobenului","dative-genitive-indefinite-plural":"jobene","dative-definite-genitive-plural":"jobenelor","singular-vocative":"jobenule","plural-vocative":"jobenelor"}},{"word":"jobenat","pos":"adj","definitions":["wearing a top hat"],"forms":{"feminine-singular":"jobenată","masculine-plural":"jobenați","feminine-neuter-plural":"jobenate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jobenat","error-unrecognized-form-feminine-indefinite-singular":"jobenată","error-unrecognized-form-indefinite-masculine-plural":"jobenați","error-unrecognized-form-feminine-indefinite-neuter-plural":"jobenate","definite-error-unrecognized-form-masculine-neuter-singular":"jobenatul","definite-error-unrecognized-form-feminine-singular":"jobenata","definite-error-unrecognized-form-masculine-plural":"jobenații","definite-error-unrecognized-form-feminine-neuter-plural":"jobenatele"}},{"word":"joc","pos":"noun","definitions":["game, play","dance"],"pronunciation":"/ʒok/","forms":{"plural":"jocuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"joc","accusative-definite-nominative-singular":"jocul","accusative-indefinite-nominative-plural":"jocuri","accusative-definite-nominative-plural":"jocurile","dative-genitive-indefinite-singular":"joc","dative-definite-genitive-singular":"jocului","dative-genitive-indefinite-plural":"jocuri","dative-definite-genitive-plural":"jocurilor","singular-vocative":"jocule","plural-vocative":"jocurilor"}},{"word":"joc","pos":"verb","definitions":["first-person singular present indicative/subjunctive of juca"],"pronunciation":"/ʒok/"},{"word":"joc de cărți","pos":"noun","definitions":["card game"],"forms":{"plural":"jocuri de cărți"}},{"word":"joc de cuvinte","pos":"noun","definitions":["pun"],"forms":{"plural":"jocuri de cuvinte"}},{"word":"joc de hazard","pos":"noun","definitions":["game of chance"],"forms":{"plural":"jocuri de hazard"}},{"word":"joc de noroc","pos":"noun","definitions":["game of chance"]},{"word":"joc de rol","pos":"noun","definitions":["roleplaying game","roleplay"],"forms":{"plural":"jocuri de rol"}},{"word":"joc de scenă","pos":"noun","definitions":["stage play"],"forms":{"plural":"jocuri de scenă"}},{"word":"joc de societate","pos":"noun","definitions":["board game"],"forms":{"plural":"jocuri de societate"}},{"word":"joc electronic","pos":"noun","definitions":["electronic game"],"forms":{"plural":"jocuri electronice"}},{"word":"joc video","pos":"noun","definitions":["video game (game controlled by a software)"],"forms":{"plural":"jocuri video"}},{"word":"jochei","pos":"noun","definitions":["alternative form of jocheu"],"forms":{"plural":"jochei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jochei","accusative-definite-nominative-singular":"jocheiul","accusative-indefinite-nominative-plural":"jochei","accusative-definite-nominative-plural":"jocheii","dative-genitive-indefinite-singular":"jochei","dative-definite-genitive-singular":"jocheiului","dative-genitive-indefinite-plural":"jochei","dative-definite-genitive-plural":"jocheilor","singular-vocative":"jocheiule","plural-vocative":"jocheilor"}},{"word":"jocheu","pos":"noun","definitions":["jockey"],"forms":{"plural":"jochei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jocheu","accusative-definite-nominative-singular":"jocheul","accusative-indefinite-nominative-plural":"jochei","accusative-definite-nominative-plural":"jocheii","dative-genitive-indefinite-singular":"jocheu","dative-definite-genitive-singular":"jocheului","dative-genitive-indefinite-plural":"jochei","dative-definite-genitive-plural":"jocheilor","singular-vocative":"jocheule","plural-vocative":"jocheilor"}},{"word":"joci","pos":"verb","definitions":["second-person singular present indicative/subjunctive of juca"],"pronunciation":"[ʒot͡ʃʲ]"},{"word":"jocot","pos":"noun","definitions":["jump"],"forms":{"plural":"jocote","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jocot","accusative-definite-nominative-singular":"jocotul","accusative-indefinite-nominative-plural":"jocote","accusative-definite-nominative-plural":"jocotele","dative-genitive-indefinite-singular":"jocot","dative-definite-genitive-singular":"jocotului","dative-genitive-indefinite-plural":"jocote","dative-definite-genitive-plural":"jocotelor","singular-vocative":"jocotule","plural-vocative":"jocotelor"}},{"word":"jocșor","pos":"noun","definitions":["alternative form of jocușor"],"forms":{"plural":"jocșoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jocșor","accusative-definite-nominative-singular":"jocșorul","accusative-indefinite-nominative-plural":"jocșoare","accusative-definite-nominative-plural":"jocșoarele","dative-genitive-indefinite-singular":"jocșor","dative-definite-genitive-singular":"jocșorului","dative-genitive-indefinite-plural":"jocșoare","dative-definite-genitive-plural":"jocșoarelor","singular-vocative":"jocșorule","plural-vocative":"jocșoarelor"}},{"word":"jocul","pos":"noun","definitions":["definite nominative/accusative singular of joc"]},{"word":"jocule","pos":"noun","definitions":["vocative singular of joc"]},{"word":"joculeț","pos":"noun","definitions":["diminutive of joc; small game"],"forms":{"plural":"joculețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"joculeț","accusative-definite-nominative-singular":"joculețul","accusative-indefinite-nominative-plural":"joculețe","accusative-definite-nominative-plural":"joculețele","dative-genitive-indefinite-singular":"joculeț","dative-definite-genitive-singular":"joculețului","dative-genitive-indefinite-plural":"joculețe","dative-definite-genitive-plural":"joculețelor","singular-vocative":"joculețule","plural-vocative":"joculețelor"}},{"word":"jocului","pos":"noun","definitions":["definite dative/genitive singular of joc"]},{"word":"jocuri","pos":"noun","definitions":["plural of joc"]},{"word":"jocuri olimpice","pos":"noun","definitions":["Olympic Games"]},{"word":"jocurile","pos":"noun","definitions":["definite nominative/accusative plural of joc"]},{"word":"jocurilor","pos":"noun","definitions":["inflection of joc:","definite genitive/dative plural","vocative plural"]},{"word":"jocușor","pos":"noun","definitions":["diminutive of joc; small game"],"forms":{"plural":"jocușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jocușor","accusative-definite-nominative-singular":"jocușorul","accusative-indefinite-nominative-plural":"jocușore","accusative-definite-nominative-plural":"jocușorele","dative-genitive-indefinite-singular":"jocușor","dative-definite-genitive-singular":"jocușorului","dative-genitive-indefinite-plural":"jocușore","dative-definite-genitive-plural":"jocușorelor","singular-vocative":"jocușorule","plural-vocative":"jocușorelor"}},{"word":"jocuț","pos":"noun","definitions":["diminutive of joc; small game"],"forms":{"plural":"jocuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jocuț","accusative-definite-nominative-singular":"jocuțul","accusative-indefinite-nominative-plural":"jocuțe","accusative-definite-nominative-plural":"jocuțele","dative-genitive-indefinite-singular":"jocuț","dative-definite-genitive-singular":"jocuțului","dative-genitive-indefinite-plural":"jocuțe","dative-definite-genitive-plural":"jocuțelor","singular-vocative":"jocuțule","plural-vocative":"jocuțelor"}},{"word":"jofră","pos":"noun","definitions":["a type of cake"],"forms":{"plural":"jofre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jofră","accusative-definite-nominative-singular":"jofra","accusative-indefinite-nominative-plural":"jofre","accusative-definite-nominative-plural":"jofrele","dative-genitive-indefinite-singular":"jofre","dative-definite-genitive-singular":"jofrei","dative-genitive-indefinite-plural":"jofre","dative-definite-genitive-plural":"jofrelor","singular-vocative":"jofră","plural-vocative":"jofrelor"}},{"word":"jogging","pos":"noun","definitions":["jogging"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jogging","accusative-definite-nominative":"joggingul","dative-genitive-indefinite":"jogging","dative-definite-genitive":"joggingului","vocative":"joggingule"}},{"word":"joi","pos":"noun","definitions":["Thursday"],"pronunciation":"/ˈʒoj/","forms":{"plural":"joi"}},{"word":"Joia Mare","pos":"name","definitions":["a village in Almaș, Arad County, Romania"],"gender":"f"},{"word":"joiană","pos":"noun","definitions":["narrow-leaved water-dropwort (Oenanthe silaifolia)"],"forms":{"plural":"joiane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"joiană","accusative-definite-nominative":"joiana","dative-genitive-indefinite":"joiane","dative-definite-genitive":"joianei","vocative":"joiană"}},{"word":"joică","pos":"noun","definitions":["narrow-leaved water-dropwort (Oenanthe silaifolia)"],"forms":{"plural":"joici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"joică","accusative-definite-nominative-singular":"joica","accusative-indefinite-nominative-plural":"joici","accusative-definite-nominative-plural":"joicile","dative-genitive-indefinite-singular":"joici","dative-definite-genitive-singular":"joicii","dative-genitive-indefinite-plural":"joici","dative-definite-genitive-plural":"joicilor","singular-vocative":"joică","plural-vocative":"joicilor"}},{"word":"joichiță","pos":"noun","definitions":["diminutive of joică"],"forms":{"plural":"joichițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"joichiță","accusative-definite-nominative-singular":"joichița","accusative-indefinite-nominative-plural":"joichițe","accusative-definite-nominative-plural":"joichițele","dative-genitive-indefinite-singular":"joichițe","dative-definite-genitive-singular":"joichiței","dative-genitive-indefinite-plural":"joichițe","dative-definite-genitive-plural":"joichițelor","singular-vocative":"joichiță","plural-vocative":"joichițelor"}},{"word":"joienel","pos":"noun","definitions":["diminutive of joian"],"forms":{"plural":"joienei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"joienel","accusative-definite-nominative-singular":"joienelul","accusative-indefinite-nominative-plural":"joienei","accusative-definite-nominative-plural":"joieneii","dative-genitive-indefinite-singular":"joienel","dative-definite-genitive-singular":"joienelului","dative-genitive-indefinite-plural":"joienei","dative-definite-genitive-plural":"joieneilor","singular-vocative":"joienelule","plural-vocative":"joieneilor"}},{"word":"joienică","pos":"noun","definitions":["diminutive of joiană"],"forms":{"plural":"joienici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"joienică","accusative-definite-nominative-singular":"joienica","accusative-indefinite-nominative-plural":"joienici","accusative-definite-nominative-plural":"joienicile","dative-genitive-indefinite-singular":"joienici","dative-definite-genitive-singular":"joienicii","dative-genitive-indefinite-plural":"joienici","dative-definite-genitive-plural":"joienicilor","singular-vocative":"joienică","plural-vocative":"joienicilor"}},{"word":"joimir","pos":"noun","definitions":["Polish mercenary"],"forms":{"plural":"joimiri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"joimir","accusative-definite-nominative-singular":"joimirul","accusative-indefinite-nominative-plural":"joimiri","accusative-definite-nominative-plural":"joimirii","dative-genitive-indefinite-singular":"joimir","dative-definite-genitive-singular":"joimirului","dative-genitive-indefinite-plural":"joimiri","dative-definite-genitive-plural":"joimirilor","singular-vocative":"joimirule","plural-vocative":"joimirilor"}},{"word":"joint","pos":"noun","definitions":["joint (bar)","joint (marijuana cigarette)"],"pronunciation":"/d͡ʒojnt/","examples":[{"ro":"Hai să fumăm un joint.","en":"Let's smoke a joint."}],"forms":{"plural":"jointuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"joint","accusative-definite-nominative-singular":"jointul","accusative-indefinite-nominative-plural":"jointuri","accusative-definite-nominative-plural":"jointurile","dative-genitive-indefinite-singular":"joint","dative-definite-genitive-singular":"jointului","dative-genitive-indefinite-plural":"jointuri","dative-definite-genitive-plural":"jointurilor","singular-vocative":"jointule","plural-vocative":"jointurilor"}},{"word":"Joița","pos":"name","definitions":["a commune of Giurgiu County, Romania","a village in Joița, Giurgiu County, Romania"],"gender":"f"},{"word":"Joițaru","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Joițaru"}},{"word":"jojă","pos":"noun","definitions":["gauge"],"forms":{"plural":"joje","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jojă","accusative-definite-nominative-singular":"joja","accusative-indefinite-nominative-plural":"joje","accusative-definite-nominative-plural":"jojele","dative-genitive-indefinite-singular":"joje","dative-definite-genitive-singular":"jojei","dative-genitive-indefinite-plural":"joje","dative-definite-genitive-plural":"jojelor","singular-vocative":"jojă","plural-vocative":"jojelor"}},{"word":"joker","pos":"noun","definitions":["joker"],"pronunciation":"/ˈd͡ʒo.kər/","forms":{"plural":"jokeri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"joker","accusative-definite-nominative-singular":"jokerul","accusative-indefinite-nominative-plural":"jokeri","accusative-definite-nominative-plural":"jokerii","dative-genitive-indefinite-singular":"joker","dative-definite-genitive-singular":"jokerului","dative-genitive-indefinite-plural":"jokeri","dative-definite-genitive-plural":"jokerilor","singular-vocative":"jokerule","plural-vocative":"jokerilor"}},{"word":"jokeri","pos":"noun","definitions":["indefinite plural of joker"],"pronunciation":"[ˈd͡ʒokərʲ]","gender":"m"},{"word":"Joldescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Joldescu"}},{"word":"Joldești","pos":"name","definitions":["a village in Vorona, Botoșani County, Romania"],"gender":"m"},{"word":"Joldișești","pos":"name","definitions":["a village in Sohodol, Alba County, Romania"],"gender":"m"},{"word":"joldunar","pos":"noun","definitions":["mercenary"],"forms":{"plural":"joldunari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"joldunar","accusative-definite-nominative-singular":"joldunarul","accusative-indefinite-nominative-plural":"joldunari","accusative-definite-nominative-plural":"joldunarii","dative-genitive-indefinite-singular":"joldunar","dative-definite-genitive-singular":"joldunarului","dative-genitive-indefinite-plural":"joldunari","dative-definite-genitive-plural":"joldunarilor","singular-vocative":"joldunarule","plural-vocative":"joldunarilor"}},{"word":"Jolotca","pos":"name","definitions":["a river in Harghita, Romania, tributary to the Mureș","a village in Ditrău, Harghita County, Romania"],"gender":"f"},{"word":"Joltai","pos":"name","definitions":["a village in Joltai, Gagauzia, Moldova","a commune of Gagauzia, Moldova"],"gender":"m"},{"word":"joltar","pos":"noun","definitions":["psalm"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"joltar","accusative-definite-nominative":"joltarul","dative-genitive-indefinite":"joltar","dative-definite-genitive":"joltarului","vocative":"joltarule"}},{"word":"jolub","pos":"noun","definitions":["manger"],"forms":{"plural":"joluburi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jolub","accusative-definite-nominative-singular":"jolubul","accusative-indefinite-nominative-plural":"joluburi","accusative-definite-nominative-plural":"joluburile","dative-genitive-indefinite-singular":"jolub","dative-definite-genitive-singular":"jolubului","dative-genitive-indefinite-plural":"joluburi","dative-definite-genitive-plural":"joluburilor","singular-vocative":"jolubule","plural-vocative":"joluburilor"}},{"word":"joncă","pos":"noun","definitions":["junk (ship)"],"forms":{"plural":"jonci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"joncă","accusative-definite-nominative-singular":"jonca","accusative-indefinite-nominative-plural":"jonci","accusative-definite-nominative-plural":"joncile","dative-genitive-indefinite-singular":"jonci","dative-definite-genitive-singular":"joncii","dative-genitive-indefinite-plural":"jonci","dative-definite-genitive-plural":"joncilor","singular-vocative":"joncă","plural-vocative":"joncilor"}},{"word":"joncăneală","pos":"noun","definitions":["fight, argument"],"forms":{"plural":"joncăneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"joncăneală","accusative-definite-nominative-singular":"joncăneala","accusative-indefinite-nominative-plural":"joncănele","accusative-definite-nominative-plural":"joncănelele","dative-genitive-indefinite-singular":"joncănele","dative-definite-genitive-singular":"joncănelei","dative-genitive-indefinite-plural":"joncănele","dative-definite-genitive-plural":"joncănelelor","singular-vocative":"joncăneală","plural-vocative":"joncănelelor"}},{"word":"jonco","pos":"noun","definitions":["vocative singular of joncă"],"pronunciation":"[ˈʒoŋko]","gender":"f"},{"word":"joncțiune","pos":"noun","definitions":["junction"],"forms":{"plural":"joncțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"joncțiune","accusative-definite-nominative-singular":"joncțiunea","accusative-indefinite-nominative-plural":"joncțiuni","accusative-definite-nominative-plural":"joncțiunile","dative-genitive-indefinite-singular":"joncțiuni","dative-definite-genitive-singular":"joncțiunii","dative-genitive-indefinite-plural":"joncțiuni","dative-definite-genitive-plural":"joncțiunilor","singular-vocative":"joncțiune","plural-vocative":"joncțiunilor"}},{"word":"joncțiune p-n","pos":"noun","definitions":["p-n junction"],"forms":{"plural":"joncțiuni p-n"}},{"word":"jongla","pos":"verb","definitions":["to juggle"],"forms":{"canonical":"a jongla 1st conjugation","present-singular-third-person":"jonglează","participle-past":"jonglat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a jongla","gerund":"jonglând","first-person-indicative-present-singular":"jonglez","indicative-present-second-person-singular":"jonglezi","indicative-present-singular-third-person":"jonglează","first-person-indicative-plural-present":"jonglăm","indicative-plural-present-second-person":"jonglați","indicative-plural-present-third-person":"jonglează","first-person-imperfect-indicative-singular":"jonglam","imperfect-indicative-second-person-singular":"jonglai","imperfect-indicative-singular-third-person":"jongla","first-person-imperfect-indicative-plural":"jonglam","imperfect-indicative-plural-second-person":"jonglați","imperfect-indicative-plural-third-person":"jonglau","first-person-indicative-perfect-singular":"jonglai","indicative-perfect-second-person-singular":"jonglași","indicative-perfect-singular-third-person":"jonglă","first-person-indicative-perfect-plural":"jonglarăm","indicative-perfect-plural-second-person":"jonglarăți","indicative-perfect-plural-third-person":"jonglară","first-person-indicative-pluperfect-singular":"jonglasem","indicative-pluperfect-second-person-singular":"jonglaseși","indicative-pluperfect-singular-third-person":"jonglase","first-person-indicative-pluperfect-plural":"jonglaserăm","indicative-pluperfect-plural-second-person":"jonglaserăți","indicative-pluperfect-plural-third-person":"jonglaseră","first-person-present-singular-subjunctive":"să jonglez","present-second-person-singular-subjunctive":"să jonglezi","present-singular-subjunctive-third-person":"să jongleze","first-person-plural-present-subjunctive":"să jonglăm","plural-present-second-person-subjunctive":"să jonglați","plural-present-subjunctive-third-person":"să jongleze","imperative-second-person-singular":"jonglează","imperative-plural-second-person":"jonglați","imperative-negative-second-person-singular":"nu jongla","imperative-negative-plural-second-person":"nu jonglați"}},{"word":"jonglare","pos":"noun","definitions":["juggling"],"forms":{"plural":"jonglări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jonglare","accusative-definite-nominative-singular":"jonglarea","accusative-indefinite-nominative-plural":"jonglări","accusative-definite-nominative-plural":"jonglările","dative-genitive-indefinite-singular":"jonglări","dative-definite-genitive-singular":"jonglării","dative-genitive-indefinite-plural":"jonglări","dative-definite-genitive-plural":"jonglărilor","singular-vocative":"jonglare","plural-vocative":"jonglărilor"}},{"word":"jongler","pos":"noun","definitions":["juggler"],"forms":{"plural":"jongleri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jongler","accusative-definite-nominative-singular":"jonglerul","accusative-indefinite-nominative-plural":"jongleri","accusative-definite-nominative-plural":"jonglerii","dative-genitive-indefinite-singular":"jongler","dative-definite-genitive-singular":"jonglerului","dative-genitive-indefinite-plural":"jongleri","dative-definite-genitive-plural":"jonglerilor","singular-vocative":"jonglerule","plural-vocative":"jonglerilor"}},{"word":"jonglerie","pos":"noun","definitions":["juggling"],"forms":{"plural":"jonglerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jonglerie","accusative-definite-nominative-singular":"jongleria","accusative-indefinite-nominative-plural":"jonglerii","accusative-definite-nominative-plural":"jongleriile","dative-genitive-indefinite-singular":"jonglerii","dative-definite-genitive-singular":"jongleriei","dative-genitive-indefinite-plural":"jonglerii","dative-definite-genitive-plural":"jongleriilor","singular-vocative":"jonglerie","plural-vocative":"jongleriilor"}},{"word":"jongleur","pos":"noun","definitions":["obsolete form of jongler"],"forms":{"plural":"jongleuri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jongleur","accusative-definite-nominative-singular":"jongleurul","accusative-indefinite-nominative-plural":"jongleuri","accusative-definite-nominative-plural":"jongleurii","dative-genitive-indefinite-singular":"jongleur","dative-definite-genitive-singular":"jongleurului","dative-genitive-indefinite-plural":"jongleuri","dative-definite-genitive-plural":"jongleurilor","singular-vocative":"jongleurule","plural-vocative":"jongleurilor"}},{"word":"Jora de Jos","pos":"name","definitions":["a village in Jora de Mijloc, Orhei Raion, Moldova"],"gender":"f"},{"word":"Jora de Mijloc","pos":"name","definitions":["a village in Jora de Mijloc, Orhei Raion, Moldova","a commune of Orhei Raion, Moldova"],"gender":"f"},{"word":"Jora de Sus","pos":"name","definitions":["a village in Jora de Mijloc, Orhei Raion, Moldova"],"gender":"f"},{"word":"Jorăști","pos":"name","definitions":["a commune of Galați County, Romania","a village in Jorăști, Galați County, Romania","a village in Vânători, Vrancea County, Romania"],"gender":"m"},{"word":"jordea","pos":"noun","definitions":["diminutive of joardă"],"forms":{"plural":"jordele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"jordea","accusative-definite-nominative-singular":"jordeaua","accusative-indefinite-nominative-plural":"jordele","accusative-definite-nominative-plural":"jordelele","dative-genitive-indefinite-singular":"jordele","dative-definite-genitive-singular":"jordelei","dative-genitive-indefinite-plural":"jordele","dative-definite-genitive-plural":"jordelelor","singular-vocative":"jordea","plural-vocative":"jordelelor"}},{"word":"jordie","pos":"noun","definitions":["stick"],"forms":{"plural":"jordii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jordie","accusative-definite-nominative-singular":"jordia","accusative-indefinite-nominative-plural":"jordii","accusative-definite-nominative-plural":"jordiile","dative-genitive-indefinite-singular":"jordii","dative-definite-genitive-singular":"jordiei","dative-genitive-indefinite-plural":"jordii","dative-definite-genitive-plural":"jordiilor","singular-vocative":"jordie","plural-vocative":"jordiilor"}},{"word":"jordiță","pos":"noun","definitions":["diminutive of joardă"],"forms":{"plural":"jordițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jordiță","accusative-definite-nominative-singular":"jordița","accusative-indefinite-nominative-plural":"jordițe","accusative-definite-nominative-plural":"jordițele","dative-genitive-indefinite-singular":"jordițe","dative-definite-genitive-singular":"jordiței","dative-genitive-indefinite-plural":"jordițe","dative-definite-genitive-plural":"jordițelor","singular-vocative":"jordiță","plural-vocative":"jordițelor"}},{"word":"Jorea","pos":"name","definitions":["a river in Galați County, Romania, tributary to the Mălina"],"gender":"f"},{"word":"Joroveanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Joroveanu"}},{"word":"jos","pos":"adv","definitions":["down"],"pronunciation":"/ʒos/"},{"word":"jos","pos":"adj","definitions":["low","down"],"pronunciation":"/ʒos/","forms":{"feminine-singular":"joasă","masculine-plural":"joși","feminine-neuter-plural":"joase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jos","error-unrecognized-form-feminine-indefinite-singular":"joasă","error-unrecognized-form-indefinite-masculine-plural":"joși","error-unrecognized-form-feminine-indefinite-neuter-plural":"joase","definite-error-unrecognized-form-masculine-neuter-singular":"josul","definite-error-unrecognized-form-feminine-singular":"joasa","definite-error-unrecognized-form-masculine-plural":"joșii","definite-error-unrecognized-form-feminine-neuter-plural":"joasele"}},{"word":"Josani","pos":"name","definitions":["a village in Căbești, Bihor County, Romania","a village in Măgești, Bihor County, Romania","a village in Pestișu Mic, Hunedoara County, Romania"],"gender":"m"},{"word":"josean","pos":"noun","definitions":["inhabitant of the Țara de Jos region of Moldavia"],"forms":{"plural":"joseni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"josean","accusative-definite-nominative-singular":"joseanul","accusative-indefinite-nominative-plural":"joseni","accusative-definite-nominative-plural":"josenii","dative-genitive-indefinite-singular":"josean","dative-definite-genitive-singular":"joseanului","dative-genitive-indefinite-plural":"joseni","dative-definite-genitive-plural":"josenilor","singular-vocative":"joseanule","plural-vocative":"josenilor"}},{"word":"joseană","pos":"noun","definitions":["female equivalent of josean"],"forms":{"plural":"joseane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"joseană","accusative-definite-nominative-singular":"joseana","accusative-indefinite-nominative-plural":"joseane","accusative-definite-nominative-plural":"joseanele","dative-genitive-indefinite-singular":"joseane","dative-definite-genitive-singular":"joseanei","dative-genitive-indefinite-plural":"joseane","dative-definite-genitive-plural":"joseanelor","singular-vocative":"joseană","plural-vocative":"joseanelor"}},{"word":"joseancă","pos":"noun","definitions":["female equivalent of josean"],"forms":{"plural":"josence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"joseancă","accusative-definite-nominative-singular":"joseanca","accusative-indefinite-nominative-plural":"josence","accusative-definite-nominative-plural":"josencele","dative-genitive-indefinite-singular":"josence","dative-definite-genitive-singular":"josencei","dative-genitive-indefinite-plural":"josence","dative-definite-genitive-plural":"josencelor","singular-vocative":"joseancă","plural-vocative":"josencelor"}},{"word":"Joseni","pos":"name","definitions":["a village in Berca, Buzău County, Romania","a commune of Harghita County, Romania","a village in Joseni, Harghita County, Romania"],"gender":"m"},{"word":"josenii","pos":"noun","definitions":["definite nominative/accusative plural of josean"]},{"word":"Josenii Bârgăului","pos":"name","definitions":["a commune of Bistrița-Năsăud County, Romania","a village in Josenii Bârgăului, Bistrița-Năsăud County, Romania"],"gender":"m"},{"word":"josișor","pos":"adv","definitions":["diminutive of jos"]},{"word":"jositor","pos":"adj","definitions":["degrading"],"forms":{"feminine-singular":"jositoare","masculine-plural":"jositori","feminine-neuter-plural":"jositoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jositor","error-unrecognized-form-feminine-indefinite-singular":"jositoare","error-unrecognized-form-indefinite-masculine-plural":"jositori","error-unrecognized-form-feminine-indefinite-neuter-plural":"jositoare","definite-error-unrecognized-form-masculine-neuter-singular":"jositorul","definite-error-unrecognized-form-feminine-singular":"jositoarea","definite-error-unrecognized-form-masculine-plural":"jositorii","definite-error-unrecognized-form-feminine-neuter-plural":"jositoarele"}},{"word":"josnic","pos":"adj","definitions":["low, lowly, abject, ignoble, base","sordid, vile, mean, lousy, sleazy, depraved"],"forms":{"feminine-singular":"josnică","masculine-plural":"josnici","feminine-neuter-plural":"josnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"josnic","error-unrecognized-form-feminine-indefinite-singular":"josnică","error-unrecognized-form-indefinite-masculine-plural":"josnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"josnice","definite-error-unrecognized-form-masculine-neuter-singular":"josnicul","definite-error-unrecognized-form-feminine-singular":"josnica","definite-error-unrecognized-form-masculine-plural":"josnicii","definite-error-unrecognized-form-feminine-neuter-plural":"josnicele"}},{"word":"josnicie","pos":"noun","definitions":["vileness"],"forms":{"plural":"josnicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"josnicie","accusative-definite-nominative-singular":"josnicia","accusative-indefinite-nominative-plural":"josnicii","accusative-definite-nominative-plural":"josniciile","dative-genitive-indefinite-singular":"josnicii","dative-definite-genitive-singular":"josniciei","dative-genitive-indefinite-plural":"josnicii","dative-definite-genitive-plural":"josniciilor","singular-vocative":"josnicie","plural-vocative":"josniciilor"}},{"word":"josorare","pos":"noun","definitions":["humiliation"],"forms":{"plural":"josorări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"josorare","accusative-definite-nominative-singular":"josorarea","accusative-indefinite-nominative-plural":"josorări","accusative-definite-nominative-plural":"josorările","dative-genitive-indefinite-singular":"josorări","dative-definite-genitive-singular":"josorării","dative-genitive-indefinite-plural":"josorări","dative-definite-genitive-plural":"josorărilor","singular-vocative":"josorare","plural-vocative":"josorărilor"}},{"word":"joule","pos":"noun","definitions":["joule"],"pronunciation":"/ʒul/","forms":{"plural":"jouli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"joule","accusative-definite-nominative-singular":"joulul","accusative-indefinite-nominative-plural":"jouli","accusative-definite-nominative-plural":"joulii","dative-genitive-indefinite-singular":"joule","dative-definite-genitive-singular":"joulului","dative-genitive-indefinite-plural":"jouli","dative-definite-genitive-plural":"joulilor","singular-vocative":"joulule","plural-vocative":"joulilor"}},{"word":"jovial","pos":"adj","definitions":["jocose"],"forms":{"feminine-singular":"jovială","masculine-plural":"joviali","feminine-neuter-plural":"joviale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jovial","error-unrecognized-form-feminine-indefinite-singular":"jovială","error-unrecognized-form-indefinite-masculine-plural":"joviali","error-unrecognized-form-feminine-indefinite-neuter-plural":"joviale","definite-error-unrecognized-form-masculine-neuter-singular":"jovialul","definite-error-unrecognized-form-feminine-singular":"joviala","definite-error-unrecognized-form-masculine-plural":"jovialii","definite-error-unrecognized-form-feminine-neuter-plural":"jovialele"}},{"word":"jovialitate","pos":"noun","definitions":["cheerfulness"],"pronunciation":"/ʒo.vi.a.liˈta.te/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jovialitate","accusative-definite-nominative-singular":"jovialitatea","accusative-indefinite-nominative-plural":"jovialități","accusative-definite-nominative-plural":"jovialitățile","dative-genitive-indefinite-singular":"jovialități","dative-definite-genitive-singular":"jovialității","dative-genitive-indefinite-plural":"jovialități","dative-definite-genitive-plural":"jovialităților","singular-vocative":"jovialitate","plural-vocative":"jovialităților"}},{"word":"jubartă","pos":"noun","definitions":["humpback whale"],"forms":{"plural":"jubarte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jubartă","accusative-definite-nominative-singular":"jubarta","accusative-indefinite-nominative-plural":"jubarte","accusative-definite-nominative-plural":"jubartele","dative-genitive-indefinite-singular":"jubarte","dative-definite-genitive-singular":"jubartei","dative-genitive-indefinite-plural":"jubarte","dative-definite-genitive-plural":"jubartelor","singular-vocative":"jubartă","plural-vocative":"jubartelor"}},{"word":"jubila","pos":"verb","definitions":["to gloat"],"forms":{"canonical":"a jubila 1st conjugation","present-singular-third-person":"jubilează","participle-past":"jubilat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a jubila","gerund":"jubilând","first-person-indicative-present-singular":"jubilez","indicative-present-second-person-singular":"jubilezi","indicative-present-singular-third-person":"jubilează","first-person-indicative-plural-present":"jubilăm","indicative-plural-present-second-person":"jubilați","indicative-plural-present-third-person":"jubilează","first-person-imperfect-indicative-singular":"jubilam","imperfect-indicative-second-person-singular":"jubilai","imperfect-indicative-singular-third-person":"jubila","first-person-imperfect-indicative-plural":"jubilam","imperfect-indicative-plural-second-person":"jubilați","imperfect-indicative-plural-third-person":"jubilau","first-person-indicative-perfect-singular":"jubilai","indicative-perfect-second-person-singular":"jubilași","indicative-perfect-singular-third-person":"jubilă","first-person-indicative-perfect-plural":"jubilarăm","indicative-perfect-plural-second-person":"jubilarăți","indicative-perfect-plural-third-person":"jubilară","first-person-indicative-pluperfect-singular":"jubilasem","indicative-pluperfect-second-person-singular":"jubilaseși","indicative-pluperfect-singular-third-person":"jubilase","first-person-indicative-pluperfect-plural":"jubilaserăm","indicative-pluperfect-plural-second-person":"jubilaserăți","indicative-pluperfect-plural-third-person":"jubilaseră","first-person-present-singular-subjunctive":"să jubilez","present-second-person-singular-subjunctive":"să jubilezi","present-singular-subjunctive-third-person":"să jubileze","first-person-plural-present-subjunctive":"să jubilăm","plural-present-second-person-subjunctive":"să jubilați","plural-present-subjunctive-third-person":"să jubileze","imperative-second-person-singular":"jubilează","imperative-plural-second-person":"jubilați","imperative-negative-second-person-singular":"nu jubila","imperative-negative-plural-second-person":"nu jubilați"}},{"word":"jubilare","pos":"noun","definitions":["jubilation"],"forms":{"plural":"jubilări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jubilare","accusative-definite-nominative-singular":"jubilarea","accusative-indefinite-nominative-plural":"jubilări","accusative-definite-nominative-plural":"jubilările","dative-genitive-indefinite-singular":"jubilări","dative-definite-genitive-singular":"jubilării","dative-genitive-indefinite-plural":"jubilări","dative-definite-genitive-plural":"jubilărilor","singular-vocative":"jubilare","plural-vocative":"jubilărilor"}},{"word":"jubilativ","pos":"adj","definitions":["jubilating, triumphant"],"forms":{"feminine-singular":"jubilativă","masculine-plural":"jubilativi","feminine-neuter-plural":"jubilative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jubilativ","error-unrecognized-form-feminine-indefinite-singular":"jubilativă","error-unrecognized-form-indefinite-masculine-plural":"jubilativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"jubilative","definite-error-unrecognized-form-masculine-neuter-singular":"jubilativul","definite-error-unrecognized-form-feminine-singular":"jubilativa","definite-error-unrecognized-form-masculine-plural":"jubilativii","definite-error-unrecognized-form-feminine-neuter-plural":"jubilativele"}},{"word":"jubilație","pos":"noun","definitions":["synonym of jubilare (“jubilation”)"],"pronunciation":"/ʒu.biˈla.t͡si.e/","forms":{"plural":"jubilații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jubilație","accusative-definite-nominative-singular":"jubilația","accusative-indefinite-nominative-plural":"jubilații","accusative-definite-nominative-plural":"jubilațiile","dative-genitive-indefinite-singular":"jubilații","dative-definite-genitive-singular":"jubilației","dative-genitive-indefinite-plural":"jubilații","dative-definite-genitive-plural":"jubilațiilor","singular-vocative":"jubilație","plural-vocative":"jubilațiilor"}},{"word":"jubileu","pos":"noun","definitions":["jubilee"],"forms":{"plural":"jubilee","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jubileu","accusative-definite-nominative-singular":"jubileul","accusative-indefinite-nominative-plural":"jubilee","accusative-definite-nominative-plural":"jubileele","dative-genitive-indefinite-singular":"jubileu","dative-definite-genitive-singular":"jubileului","dative-genitive-indefinite-plural":"jubilee","dative-definite-genitive-plural":"jubileelor","singular-vocative":"jubileule","plural-vocative":"jubileelor"}},{"word":"jubiliar","pos":"adj","definitions":["jubilee"],"forms":{"feminine-singular":"jubiliară","masculine-plural":"jubiliari","feminine-neuter-plural":"jubiliare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jubiliar","error-unrecognized-form-feminine-indefinite-singular":"jubiliară","error-unrecognized-form-indefinite-masculine-plural":"jubiliari","error-unrecognized-form-feminine-indefinite-neuter-plural":"jubiliare","definite-error-unrecognized-form-masculine-neuter-singular":"jubiliarul","definite-error-unrecognized-form-feminine-singular":"jubiliara","definite-error-unrecognized-form-masculine-plural":"jubiliarii","definite-error-unrecognized-form-feminine-neuter-plural":"jubiliarele"}},{"word":"Juc-Herghelie","pos":"name","definitions":["a village in Jucu, Cluj County, Romania"],"gender":"m"},{"word":"juca","pos":"verb","definitions":["to play","to gamble","to dance"],"pronunciation":"/ʒuˈka/","examples":[{"ro":"Nu mai juca.","en":"Stop gambling."}],"forms":{"canonical":"a juca 1st conjugation","present-singular-third-person":"joacă","participle-past":"jucat","subjunctive-third-person":"joace","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a juca","gerund":"jucând","first-person-indicative-present-singular":"joc","indicative-present-second-person-singular":"joci","indicative-present-singular-third-person":"joacă","first-person-indicative-plural-present":"jucăm","indicative-plural-present-second-person":"jucați","indicative-plural-present-third-person":"joacă","first-person-imperfect-indicative-singular":"jucam","imperfect-indicative-second-person-singular":"jucai","imperfect-indicative-singular-third-person":"juca","first-person-imperfect-indicative-plural":"jucam","imperfect-indicative-plural-second-person":"jucați","imperfect-indicative-plural-third-person":"jucau","first-person-indicative-perfect-singular":"jucai","indicative-perfect-second-person-singular":"jucași","indicative-perfect-singular-third-person":"jucă","first-person-indicative-perfect-plural":"jucarăm","indicative-perfect-plural-second-person":"jucarăți","indicative-perfect-plural-third-person":"jucară","first-person-indicative-pluperfect-singular":"jucasem","indicative-pluperfect-second-person-singular":"jucaseși","indicative-pluperfect-singular-third-person":"jucase","first-person-indicative-pluperfect-plural":"jucaserăm","indicative-pluperfect-plural-second-person":"jucaserăți","indicative-pluperfect-plural-third-person":"jucaseră","first-person-present-singular-subjunctive":"să joc","present-second-person-singular-subjunctive":"să joci","present-singular-subjunctive-third-person":"să joace","first-person-plural-present-subjunctive":"să jucăm","plural-present-second-person-subjunctive":"să jucați","plural-present-subjunctive-third-person":"să joace","imperative-second-person-singular":"joacă","imperative-plural-second-person":"jucați","imperative-negative-second-person-singular":"nu juca","imperative-negative-plural-second-person":"nu jucați","alternative":"жука"}},{"word":"jucabil","pos":"adj","definitions":["playable"],"forms":{"feminine-singular":"jucabilă","masculine-plural":"jucabili","feminine-neuter-plural":"jucabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jucabil","error-unrecognized-form-feminine-indefinite-singular":"jucabilă","error-unrecognized-form-indefinite-masculine-plural":"jucabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"jucabile","definite-error-unrecognized-form-masculine-neuter-singular":"jucabilul","definite-error-unrecognized-form-feminine-singular":"jucabila","definite-error-unrecognized-form-masculine-plural":"jucabilii","definite-error-unrecognized-form-feminine-neuter-plural":"jucabilele"}},{"word":"Jucan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jucan"}},{"word":"jucare","pos":"noun","definitions":["a game","a joke"],"forms":{"plural":"jucări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jucare","accusative-definite-nominative-singular":"jucarea","accusative-indefinite-nominative-plural":"jucări","accusative-definite-nominative-plural":"jucările","dative-genitive-indefinite-singular":"jucări","dative-definite-genitive-singular":"jucării","dative-genitive-indefinite-plural":"jucări","dative-definite-genitive-plural":"jucărilor","singular-vocative":"jucare","plural-vocative":"jucărilor"}},{"word":"jucaș","pos":"adj","definitions":["playful"],"forms":{"feminine-singular":"jucașă","masculine-plural":"jucași","feminine-neuter-plural":"jucașe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jucaș","error-unrecognized-form-feminine-indefinite-singular":"jucașă","error-unrecognized-form-indefinite-masculine-plural":"jucași","error-unrecognized-form-feminine-indefinite-neuter-plural":"jucașe","definite-error-unrecognized-form-masculine-neuter-singular":"jucașul","definite-error-unrecognized-form-feminine-singular":"jucașa","definite-error-unrecognized-form-masculine-plural":"jucașii","definite-error-unrecognized-form-feminine-neuter-plural":"jucașele"}},{"word":"jucat","pos":"noun","definitions":["playing"],"pronunciation":"/ʒuˈkat/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jucat","accusative-definite-nominative":"jucatul","dative-genitive-indefinite":"jucat","dative-definite-genitive":"jucatului","vocative":"jucatule"}},{"word":"jucat","pos":"verb","definitions":["past participle of juca"],"pronunciation":"/ʒuˈkat/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"jucat","error-unrecognized-form-feminine-indefinite-singular":"jucată","error-unrecognized-form-indefinite-masculine-plural":"jucați","error-unrecognized-form-feminine-indefinite-neuter-plural":"jucate","definite-error-unrecognized-form-masculine-neuter-singular":"jucatul","definite-error-unrecognized-form-feminine-singular":"jucata","definite-error-unrecognized-form-masculine-plural":"jucații","definite-error-unrecognized-form-feminine-neuter-plural":"jucatele"}},{"word":"jucărea","pos":"noun","definitions":["diminutive of jucărie"],"forms":{"plural":"jucărele","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"jucărea","accusative-definite-nominative-singular":"jucăreaua","accusative-indefinite-nominative-plural":"jucărele","accusative-definite-nominative-plural":"jucărelele","dative-genitive-indefinite-singular":"jucărele","dative-definite-genitive-singular":"jucărelei","dative-genitive-indefinite-plural":"jucărele","dative-definite-genitive-plural":"jucărelelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"jucăreie","pos":"noun","definitions":["toy"],"forms":{"plural":"jucărei","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"jucăreie","accusative-definite-nominative-singular":"jucăreia","accusative-indefinite-nominative-plural":"jucărei","accusative-definite-nominative-plural":"jucăreile","dative-genitive-indefinite-singular":"jucărei","dative-definite-genitive-singular":"jucăreii","dative-genitive-indefinite-plural":"jucărei","dative-definite-genitive-plural":"jucăreilor","singular-vocative":"jucăreie","plural-vocative":"jucăreilor"}},{"word":"jucărică","pos":"noun","definitions":["diminutive of jucărie; small toy"],"forms":{"plural":"jucărele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jucărică","accusative-definite-nominative-singular":"jucărica","accusative-indefinite-nominative-plural":"jucărice","accusative-definite-nominative-plural":"jucăricele","dative-genitive-indefinite-singular":"jucărice","dative-definite-genitive-singular":"jucăricei","dative-genitive-indefinite-plural":"jucărice","dative-definite-genitive-plural":"jucăricelor","singular-vocative":"jucărică","plural-vocative":"jucăricelor"}},{"word":"jucărie","pos":"noun","definitions":["toy"],"pronunciation":"/ʒu.kəˈri.e/","forms":{"plural":"jucării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jucărie","accusative-definite-nominative-singular":"jucăria","accusative-indefinite-nominative-plural":"jucării","accusative-definite-nominative-plural":"jucăriile","dative-genitive-indefinite-singular":"jucării","dative-definite-genitive-singular":"jucăriei","dative-genitive-indefinite-plural":"jucării","dative-definite-genitive-plural":"jucăriilor","singular-vocative":"jucărie","plural-vocative":"jucăriilor"}},{"word":"jucărier","pos":"noun","definitions":["toymaker","toyseller"],"forms":{"plural":"jucărieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jucărier","accusative-definite-nominative-singular":"jucărierul","accusative-indefinite-nominative-plural":"jucărieri","accusative-definite-nominative-plural":"jucărierii","dative-genitive-indefinite-singular":"jucărier","dative-definite-genitive-singular":"jucărierului","dative-genitive-indefinite-plural":"jucărieri","dative-definite-genitive-plural":"jucărierilor","singular-vocative":"jucărierule","plural-vocative":"jucărierilor"}},{"word":"jucărioară","pos":"noun","definitions":["diminutive of jucărie; small toy"],"forms":{"plural":"jucărioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jucărioară","accusative-definite-nominative-singular":"jucărioara","accusative-indefinite-nominative-plural":"jucărioare","accusative-definite-nominative-plural":"jucărioarele","dative-genitive-indefinite-singular":"jucărioare","dative-definite-genitive-singular":"jucărioarei","dative-genitive-indefinite-plural":"jucărioare","dative-definite-genitive-plural":"jucărioarelor","singular-vocative":"jucărioară","plural-vocative":"jucărioarelor"}},{"word":"jucăriuță","pos":"noun","definitions":["diminutive of jucărie; a small toy"],"forms":{"plural":"jucăriuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jucăriuță","accusative-definite-nominative-singular":"jucăriuța","accusative-indefinite-nominative-plural":"jucăriuțe","accusative-definite-nominative-plural":"jucăriuțele","dative-genitive-indefinite-singular":"jucăriuțe","dative-definite-genitive-singular":"jucăriuței","dative-genitive-indefinite-plural":"jucăriuțe","dative-definite-genitive-plural":"jucăriuțelor","singular-vocative":"jucăriuță","plural-vocative":"jucăriuțelor"}},{"word":"jucătoare","pos":"noun","definitions":["female player","female dancer"],"forms":{"plural":"jucătoare","masculine":"equivalent jucător","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"jucătoare","accusative-definite-nominative-singular":"jucătoarea","accusative-indefinite-nominative-plural":"jucătoare","accusative-definite-nominative-plural":"jucătoarele","dative-genitive-indefinite-singular":"jucătoare","dative-definite-genitive-singular":"jucătoarei","dative-genitive-indefinite-plural":"jucătoare","dative-definite-genitive-plural":"jucătoarelor","singular-vocative":"jucătoare","plural-vocative":"jucătoarelor"}},{"word":"jucătoare de badminton","pos":"noun","definitions":["female badminton player"],"forms":{"plural":"jucătoare de badminton"}},{"word":"jucător","pos":"noun","definitions":["player (one who plays a game or sport)","dancer"],"pronunciation":"/ʒu.kəˈtor/","forms":{"plural":"jucători","feminine":"equivalent jucătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jucător","accusative-definite-nominative-singular":"jucătorul","accusative-indefinite-nominative-plural":"jucători","accusative-definite-nominative-plural":"jucătorii","dative-genitive-indefinite-singular":"jucător","dative-definite-genitive-singular":"jucătorului","dative-genitive-indefinite-plural":"jucători","dative-definite-genitive-plural":"jucătorilor","singular-vocative":"jucătorule","plural-vocative":"jucătorilor"}},{"word":"jucător de badminton","pos":"noun","definitions":["badminton player"],"forms":{"plural":"jucător de badminton"}},{"word":"jucător de golf","pos":"noun","definitions":["golfer"],"forms":{"plural":"jucători de golf"}},{"word":"jucător de șah","pos":"noun","definitions":["chess player"],"forms":{"plural":"jucători de șah"}},{"word":"jucătorie","pos":"noun","definitions":["gambling house"],"forms":{"plural":"jucătorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jucătorie","accusative-definite-nominative-singular":"jucătoria","accusative-indefinite-nominative-plural":"jucătorii","accusative-definite-nominative-plural":"jucătoriile","dative-genitive-indefinite-singular":"jucătorii","dative-definite-genitive-singular":"jucătoriei","dative-genitive-indefinite-plural":"jucătorii","dative-definite-genitive-plural":"jucătoriilor","singular-vocative":"jucătorie","plural-vocative":"jucătoriilor"}},{"word":"Jucătoru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jucătoru"}},{"word":"jucăuș","pos":"adj","definitions":["playful"],"forms":{"feminine-singular":"jucăușă","masculine-plural":"jucăuși","feminine-neuter-plural":"jucăușe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jucăuș","error-unrecognized-form-feminine-indefinite-singular":"jucăușă","error-unrecognized-form-indefinite-masculine-plural":"jucăuși","error-unrecognized-form-feminine-indefinite-neuter-plural":"jucăușe","definite-error-unrecognized-form-masculine-neuter-singular":"jucăușul","definite-error-unrecognized-form-feminine-singular":"jucăușa","definite-error-unrecognized-form-masculine-plural":"jucăușii","definite-error-unrecognized-form-feminine-neuter-plural":"jucăușele"}},{"word":"Jucu","pos":"name","definitions":["a commune of Cluj County, Romania"],"gender":"m"},{"word":"Jucu de Mijloc","pos":"name","definitions":["a village in Jucu, Cluj County, Romania"],"gender":"m"},{"word":"Jucu de Sus","pos":"name","definitions":["a village in Jucu, Cluj County, Romania"],"gender":"m"},{"word":"jucuială","pos":"noun","definitions":["execution"],"forms":{"plural":"jucuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jucuială","accusative-definite-nominative-singular":"jucuiala","accusative-indefinite-nominative-plural":"jucuiele","accusative-definite-nominative-plural":"jucuielele","dative-genitive-indefinite-singular":"jucuiele","dative-definite-genitive-singular":"jucuielei","dative-genitive-indefinite-plural":"jucuiele","dative-definite-genitive-plural":"jucuielelor","singular-vocative":"jucuială","plural-vocative":"jucuielelor"}},{"word":"jucuțău","pos":"noun","definitions":["bailiff"],"forms":{"plural":"jucuțăi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jucuțău","accusative-definite-nominative-singular":"jucuțăuul","accusative-indefinite-nominative-plural":"jucuțăi","accusative-definite-nominative-plural":"jucuțăii","dative-genitive-indefinite-singular":"jucuțău","dative-definite-genitive-singular":"jucuțăuului","dative-genitive-indefinite-plural":"jucuțăi","dative-definite-genitive-plural":"jucuțăilor","singular-vocative":"jucuțăuule","plural-vocative":"jucuțăilor"}},{"word":"jucuțel","pos":"noun","definitions":["diminutive of jucuț"],"forms":{"plural":"jucuței","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jucuțel","accusative-definite-nominative-singular":"jucuțelul","accusative-indefinite-nominative-plural":"jucuței","accusative-definite-nominative-plural":"jucuțeii","dative-genitive-indefinite-singular":"jucuțel","dative-definite-genitive-singular":"jucuțelului","dative-genitive-indefinite-plural":"jucuței","dative-definite-genitive-plural":"jucuțeilor","singular-vocative":"jucuțelule","plural-vocative":"jucuțeilor"}},{"word":"jud.","pos":"noun","definitions":["abbreviation of județ (“county”)"]},{"word":"judaism","pos":"noun","definitions":["obsolete form of iudaism"],"forms":{"plural":"judaisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"judaism","accusative-definite-nominative-singular":"judaismul","accusative-indefinite-nominative-plural":"judaisme","accusative-definite-nominative-plural":"judaismele","dative-genitive-indefinite-singular":"judaism","dative-definite-genitive-singular":"judaismului","dative-genitive-indefinite-plural":"judaisme","dative-definite-genitive-plural":"judaismelor","singular-vocative":"judaismule","plural-vocative":"judaismelor"}},{"word":"judan","pos":"noun","definitions":["obsolete form of jidan"],"forms":{"plural":"judani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"judan","accusative-definite-nominative-singular":"judanul","accusative-indefinite-nominative-plural":"judani","accusative-definite-nominative-plural":"judanii","dative-genitive-indefinite-singular":"judan","dative-definite-genitive-singular":"judanului","dative-genitive-indefinite-plural":"judani","dative-definite-genitive-plural":"judanilor","singular-vocative":"judanule","plural-vocative":"judanilor"}},{"word":"jude","pos":"noun","definitions":["In the old Romanian principalities, an office with administrative and judicial responsibilities that served as a type of mayor and judge. See also județ.","Minor ruler, prince.","judge"],"pronunciation":"/ˈʒu.de/","forms":{"plural":"juzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m-e","accusative-indefinite-nominative-singular":"jude","accusative-definite-nominative-singular":"judele","accusative-indefinite-nominative-plural":"juzi","accusative-definite-nominative-plural":"juzii","dative-genitive-indefinite-singular":"jude","dative-definite-genitive-singular":"judelui","dative-genitive-indefinite-plural":"juzi","dative-definite-genitive-plural":"juzilor","singular-vocative":"jude","plural-vocative":"juzilor","alternative":"judec"}},{"word":"Jude","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jude"}},{"word":"judec","pos":"verb","definitions":["first-person singular present indicative/subjunctive of judeca"]},{"word":"judec","pos":"noun","definitions":["obsolete form of jude"],"forms":{"plural":"judeci"}},{"word":"judeca","pos":"verb","definitions":["to judge"],"pronunciation":"/ʒu.deˈka/","forms":{"canonical":"a judeca 1st conjugation","present-singular-third-person":"judecă","participle-past":"judecat","subjunctive-third-person":"judece","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a judeca","gerund":"judecând","first-person-indicative-present-singular":"judec","indicative-present-second-person-singular":"judeci","indicative-present-singular-third-person":"judecă","first-person-indicative-plural-present":"judecăm","indicative-plural-present-second-person":"judecați","indicative-plural-present-third-person":"judecă","first-person-imperfect-indicative-singular":"judecam","imperfect-indicative-second-person-singular":"judecai","imperfect-indicative-singular-third-person":"judeca","first-person-imperfect-indicative-plural":"judecam","imperfect-indicative-plural-second-person":"judecați","imperfect-indicative-plural-third-person":"judecau","first-person-indicative-perfect-singular":"judecai","indicative-perfect-second-person-singular":"judecași","indicative-perfect-singular-third-person":"judecă","first-person-indicative-perfect-plural":"judecarăm","indicative-perfect-plural-second-person":"judecarăți","indicative-perfect-plural-third-person":"judecară","first-person-indicative-pluperfect-singular":"judecasem","indicative-pluperfect-second-person-singular":"judecaseși","indicative-pluperfect-singular-third-person":"judecase","first-person-indicative-pluperfect-plural":"judecaserăm","indicative-pluperfect-plural-second-person":"judecaserăți","indicative-pluperfect-plural-third-person":"judecaseră","first-person-present-singular-subjunctive":"să judec","present-second-person-singular-subjunctive":"să judeci","present-singular-subjunctive-third-person":"să judece","first-person-plural-present-subjunctive":"să judecăm","plural-present-second-person-subjunctive":"să judecați","plural-present-subjunctive-third-person":"să judece","imperative-second-person-singular":"judecă","imperative-plural-second-person":"judecați","imperative-negative-second-person-singular":"nu judeca","imperative-negative-plural-second-person":"nu judecați"}},{"word":"judecare","pos":"noun","definitions":["the act of judging, judgement, estimation, appreciation","criticism, censure, condemnation"],"forms":{"plural":"judecări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"judecare","accusative-definite-nominative-singular":"judecarea","accusative-indefinite-nominative-plural":"judecări","accusative-definite-nominative-plural":"judecările","dative-genitive-indefinite-singular":"judecări","dative-definite-genitive-singular":"judecării","dative-genitive-indefinite-plural":"judecări","dative-definite-genitive-plural":"judecărilor","singular-vocative":"judecare","plural-vocative":"judecărilor"}},{"word":"judecat","pos":"verb","definitions":["past participle of judeca"],"pronunciation":"/ʒu.deˈkat/","forms":{"participle-past":"of judeca"}},{"word":"judecat","pos":"adj","definitions":["judged"],"pronunciation":"/ʒu.deˈkat/","forms":{"feminine-singular":"judecată","masculine-plural":"judecați","feminine-neuter-plural":"judecate","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"judecat","error-unrecognized-form-feminine-indefinite-singular":"judecată","error-unrecognized-form-indefinite-masculine-plural":"judecați","error-unrecognized-form-feminine-indefinite-neuter-plural":"judecate","definite-error-unrecognized-form-masculine-neuter-singular":"judecatul","definite-error-unrecognized-form-feminine-singular":"judecata","definite-error-unrecognized-form-masculine-plural":"judecații","definite-error-unrecognized-form-feminine-neuter-plural":"judecatele"}},{"word":"judecată","pos":"adj","definitions":["feminine singular of judecat"],"pronunciation":"/ʒudeˈkatə/"},{"word":"judecată","pos":"noun","definitions":["judgement, reason, wisdom","act of judging","trial","intelligence, discernment"],"pronunciation":"/ʒudeˈkatə/","forms":{"plural":"judecăți"}},{"word":"judecătoare","pos":"noun","definitions":["female equivalent of judecător"],"forms":{"plural":"judecătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"judecătoare","accusative-definite-nominative-singular":"judecătoarea","accusative-indefinite-nominative-plural":"judecătoare","accusative-definite-nominative-plural":"judecătoarele","dative-genitive-indefinite-singular":"judecătoare","dative-definite-genitive-singular":"judecătoarei","dative-genitive-indefinite-plural":"judecătoare","dative-definite-genitive-plural":"judecătoarelor","singular-vocative":"judecătoare","plural-vocative":"judecătoarelor"}},{"word":"judecător","pos":"noun","definitions":["judge","justice","magistrate","arbitrator"],"forms":{"plural":"judecători","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"judecător","accusative-definite-nominative-singular":"judecătorul","accusative-indefinite-nominative-plural":"judecători","accusative-definite-nominative-plural":"judecătorii","dative-genitive-indefinite-singular":"judecător","dative-definite-genitive-singular":"judecătorului","dative-genitive-indefinite-plural":"judecători","dative-definite-genitive-plural":"judecătorilor","singular-vocative":"judecătorule","plural-vocative":"judecătorilor"}},{"word":"judecătoraș","pos":"noun","definitions":["diminutive of judecător; small judge"],"forms":{"plural":"judecătorași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"judecătoraș","accusative-definite-nominative-singular":"judecătorașul","accusative-indefinite-nominative-plural":"judecătorași","accusative-definite-nominative-plural":"judecătorașii","dative-genitive-indefinite-singular":"judecătoraș","dative-definite-genitive-singular":"judecătorașului","dative-genitive-indefinite-plural":"judecătorași","dative-definite-genitive-plural":"judecătorașilor","singular-vocative":"judecătorașule","plural-vocative":"judecătorașilor"}},{"word":"judecătoreasă","pos":"noun","definitions":["female equivalent of judecător"],"forms":{"plural":"judecătorese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"judecătoreasă","accusative-definite-nominative-singular":"judecătoreasa","accusative-indefinite-nominative-plural":"judecătorese","accusative-definite-nominative-plural":"judecătoresele","dative-genitive-indefinite-singular":"judecătorese","dative-definite-genitive-singular":"judecătoresei","dative-genitive-indefinite-plural":"judecătorese","dative-definite-genitive-plural":"judecătoreselor","singular-vocative":"judecătoreasă","plural-vocative":"judecătoreselor"}},{"word":"judecătoresc","pos":"adj","definitions":["judiciary"],"forms":{"feminine-singular":"judecătorească","plural":"judecătorești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"judecătoresc","error-unrecognized-form-feminine-indefinite-singular":"judecătorească","error-unrecognized-form-indefinite-masculine-plural":"judecătorești","error-unrecognized-form-feminine-indefinite-neuter-plural":"judecătorești","definite-error-unrecognized-form-masculine-neuter-singular":"judecătorescul","definite-error-unrecognized-form-feminine-singular":"judecătoreasca","definite-error-unrecognized-form-masculine-plural":"judecătoreștii","definite-error-unrecognized-form-feminine-neuter-plural":"judecătoreștile"}},{"word":"judecătorește","pos":"adv","definitions":["judicially"]},{"word":"judecători","pos":"noun","definitions":["plural of judecător"]},{"word":"judecătorie","pos":"noun","definitions":["court of law"],"forms":{"plural":"judecătorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"judecătorie","accusative-definite-nominative-singular":"judecătoria","accusative-indefinite-nominative-plural":"judecătorii","accusative-definite-nominative-plural":"judecătoriile","dative-genitive-indefinite-singular":"judecătorii","dative-definite-genitive-singular":"judecătoriei","dative-genitive-indefinite-plural":"judecătorii","dative-definite-genitive-plural":"judecătoriilor","singular-vocative":"judecătorie","plural-vocative":"judecătoriilor"}},{"word":"judecătoriță","pos":"noun","definitions":["female equivalent of judecător"],"forms":{"plural":"judecătorițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"judecătoriță","accusative-definite-nominative-singular":"judecătorița","accusative-indefinite-nominative-plural":"judecătorițe","accusative-definite-nominative-plural":"judecătorițele","dative-genitive-indefinite-singular":"judecătorițe","dative-definite-genitive-singular":"judecătoriței","dative-genitive-indefinite-plural":"judecătorițe","dative-definite-genitive-plural":"judecătorițelor","singular-vocative":"judecătoriță","plural-vocative":"judecătorițelor"}},{"word":"judecătoriu","pos":"noun","definitions":["obsolete form of judecător"],"forms":{"plural":"judecători","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"judecătoriu","accusative-definite-nominative-singular":"judecătoriuul","accusative-indefinite-nominative-plural":"judecători","accusative-definite-nominative-plural":"judecătorii","dative-genitive-indefinite-singular":"judecătoriu","dative-definite-genitive-singular":"judecătoriuului","dative-genitive-indefinite-plural":"judecători","dative-definite-genitive-plural":"judecătorilor","singular-vocative":"judecătoriuule","plural-vocative":"judecătorilor"}},{"word":"judeceasă","pos":"noun","definitions":["the mayor's wife"],"forms":{"plural":"judecese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"judeceasă","accusative-definite-nominative-singular":"judeceasa","accusative-indefinite-nominative-plural":"judecese","accusative-definite-nominative-plural":"judecesele","dative-genitive-indefinite-singular":"judecese","dative-definite-genitive-singular":"judecesei","dative-genitive-indefinite-plural":"judecese","dative-definite-genitive-plural":"judeceselor","singular-vocative":"judeceasă","plural-vocative":"judeceselor"}},{"word":"judeci","pos":"verb","definitions":["to emancipate from serfdom, to become a free peasant"],"forms":{"canonical":"a judeci 4th conjugation","present-singular-third-person":"judecește","participle-past":"judecit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a judeci","gerund":"judecind","first-person-indicative-present-singular":"judecesc","indicative-present-second-person-singular":"judecești","indicative-present-singular-third-person":"judecește","first-person-indicative-plural-present":"judecim","indicative-plural-present-second-person":"judeciți","indicative-plural-present-third-person":"judecesc","first-person-imperfect-indicative-singular":"judeceam","imperfect-indicative-second-person-singular":"judeceai","imperfect-indicative-singular-third-person":"judecea","first-person-imperfect-indicative-plural":"judeceam","imperfect-indicative-plural-second-person":"judeceați","imperfect-indicative-plural-third-person":"judeceau","first-person-indicative-perfect-singular":"judecii","indicative-perfect-second-person-singular":"judeciși","indicative-perfect-singular-third-person":"judeci","first-person-indicative-perfect-plural":"judecirăm","indicative-perfect-plural-second-person":"judecirăți","indicative-perfect-plural-third-person":"judeciră","first-person-indicative-pluperfect-singular":"judecisem","indicative-pluperfect-second-person-singular":"judeciseși","indicative-pluperfect-singular-third-person":"judecise","first-person-indicative-pluperfect-plural":"judeciserăm","indicative-pluperfect-plural-second-person":"judeciserăți","indicative-pluperfect-plural-third-person":"judeciseră","first-person-present-singular-subjunctive":"să judecesc","present-second-person-singular-subjunctive":"să judecești","present-singular-subjunctive-third-person":"să judecească","first-person-plural-present-subjunctive":"să judecim","plural-present-second-person-subjunctive":"să judeciți","plural-present-subjunctive-third-person":"să judecească","imperative-second-person-singular":"judecește","imperative-plural-second-person":"judeciți","imperative-negative-second-person-singular":"nu judeci","imperative-negative-plural-second-person":"nu judeciți"}},{"word":"judecie","pos":"noun","definitions":["reign, rule"],"forms":{"plural":"judecii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"judecie","accusative-definite-nominative-singular":"judecia","accusative-indefinite-nominative-plural":"judecii","accusative-definite-nominative-plural":"judeciile","dative-genitive-indefinite-singular":"judecii","dative-definite-genitive-singular":"judeciei","dative-genitive-indefinite-plural":"judecii","dative-definite-genitive-plural":"judeciilor","singular-vocative":"judecie","plural-vocative":"judeciilor"}},{"word":"judecire","pos":"noun","definitions":["judgment"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"judecire","accusative-definite-nominative":"judecirea","dative-genitive-indefinite":"judecire","dative-definite-genitive":"judecirei","vocative":"judecire"}},{"word":"judele","pos":"noun","definitions":["definite nominative/accusative singular of jude"]},{"word":"Judele","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Lăpușnicul Mare","a surname originating as an occupation"],"gender":"m"},{"word":"Judescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Judescu"}},{"word":"județ","pos":"noun","definitions":["county (administrative division in Romania)","jurisdiction"],"pronunciation":"/ʒuˈdet͡s/","forms":{"plural":"județe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"județ","accusative-definite-nominative-singular":"județul","accusative-indefinite-nominative-plural":"județe","accusative-definite-nominative-plural":"județele","dative-genitive-indefinite-singular":"județ","dative-definite-genitive-singular":"județului","dative-genitive-indefinite-plural":"județe","dative-definite-genitive-plural":"județelor","singular-vocative":"județule","plural-vocative":"județelor"}},{"word":"Județ","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Județ"}},{"word":"județe","pos":"noun","definitions":["plural of județ"],"pronunciation":"/ʒuˈde.t͡se/"},{"word":"județean","pos":"adj","definitions":["county"],"forms":{"feminine-singular":"județeană","masculine-plural":"județeni","feminine-neuter-plural":"județene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"județean","error-unrecognized-form-feminine-indefinite-singular":"județeană","error-unrecognized-form-indefinite-masculine-plural":"județeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"județene","definite-error-unrecognized-form-masculine-neuter-singular":"județeanul","definite-error-unrecognized-form-feminine-singular":"județeana","definite-error-unrecognized-form-masculine-plural":"județenii","definite-error-unrecognized-form-feminine-neuter-plural":"județenele"}},{"word":"județeasă","pos":"noun","definitions":["mayor's wife"],"forms":{"plural":"județese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"județeasă","accusative-definite-nominative-singular":"județeasa","accusative-indefinite-nominative-plural":"județese","accusative-definite-nominative-plural":"județesele","dative-genitive-indefinite-singular":"județese","dative-definite-genitive-singular":"județesei","dative-genitive-indefinite-plural":"județese","dative-definite-genitive-plural":"județeselor","singular-vocative":"județeasă","plural-vocative":"județeselor"}},{"word":"județul","pos":"noun","definitions":["nominative/accusative definite singular of județ"],"gender":"n"},{"word":"judiciar","pos":"adj","definitions":["judicial"],"forms":{"feminine-singular":"judiciară","masculine-plural":"judiciari","feminine-neuter-plural":"judiciare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"judiciar","error-unrecognized-form-feminine-indefinite-singular":"judiciară","error-unrecognized-form-indefinite-masculine-plural":"judiciari","error-unrecognized-form-feminine-indefinite-neuter-plural":"judiciare","definite-error-unrecognized-form-masculine-neuter-singular":"judiciarul","definite-error-unrecognized-form-feminine-singular":"judiciara","definite-error-unrecognized-form-masculine-plural":"judiciarii","definite-error-unrecognized-form-feminine-neuter-plural":"judiciarele"}},{"word":"judicios","pos":"adj","definitions":["judicious, wise"],"forms":{"feminine-singular":"judicioasă","masculine-plural":"judicioși","feminine-neuter-plural":"judicioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"judicios","error-unrecognized-form-feminine-indefinite-singular":"judicioasă","error-unrecognized-form-indefinite-masculine-plural":"judicioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"judicioase","definite-error-unrecognized-form-masculine-neuter-singular":"judiciosul","definite-error-unrecognized-form-feminine-singular":"judicioasa","definite-error-unrecognized-form-masculine-plural":"judicioșii","definite-error-unrecognized-form-feminine-neuter-plural":"judicioasele"}},{"word":"judiciozitate","pos":"noun","definitions":["judiciousness"],"forms":{"plural":"judiciozități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"judiciozitate","accusative-definite-nominative-singular":"judiciozitatea","accusative-indefinite-nominative-plural":"judiciozități","accusative-definite-nominative-plural":"judiciozitățile","dative-genitive-indefinite-singular":"judiciozități","dative-definite-genitive-singular":"judiciozității","dative-genitive-indefinite-plural":"judiciozități","dative-definite-genitive-plural":"judiciozităților","singular-vocative":"judiciozitate","plural-vocative":"judiciozităților"}},{"word":"judo","pos":"noun","definitions":["judo"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"judo","accusative-definite-nominative":"judoul","dative-genitive-indefinite":"judo","dative-definite-genitive":"judoului","vocative":"judoule"}},{"word":"judoka","pos":"noun","definitions":["alternative form of judocan"],"forms":{"plural":"judoka","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"judoka","accusative-definite-nominative-singular":"judokaul","accusative-indefinite-nominative-plural":"judoka","accusative-definite-nominative-plural":"judokai","dative-genitive-indefinite-singular":"judoka","dative-definite-genitive-singular":"judokaului","dative-genitive-indefinite-plural":"judoka","dative-definite-genitive-plural":"judokalor","singular-vocative":"judokaule","plural-vocative":"judokalor"}},{"word":"jufă","pos":"noun","definitions":["obsolete form of julfă"],"forms":{"plural":"jufe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jufă","accusative-definite-nominative-singular":"jufa","accusative-indefinite-nominative-plural":"jufe","accusative-definite-nominative-plural":"jufele","dative-genitive-indefinite-singular":"jufe","dative-definite-genitive-singular":"jufei","dative-genitive-indefinite-plural":"jufe","dative-definite-genitive-plural":"jufelor","singular-vocative":"jufă","plural-vocative":"jufelor"}},{"word":"jug","pos":"noun","definitions":["yoke"],"forms":{"plural":"juguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jug","accusative-definite-nominative-singular":"jugul","accusative-indefinite-nominative-plural":"juguri","accusative-definite-nominative-plural":"jugurile","dative-genitive-indefinite-singular":"jug","dative-definite-genitive-singular":"jugului","dative-genitive-indefinite-plural":"juguri","dative-definite-genitive-plural":"jugurilor","singular-vocative":"jugule","plural-vocative":"jugurilor"}},{"word":"jugan","pos":"noun","definitions":["gelding"],"forms":{"plural":"jugani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugan","accusative-definite-nominative-singular":"juganul","accusative-indefinite-nominative-plural":"jugani","accusative-definite-nominative-plural":"juganii","dative-genitive-indefinite-singular":"jugan","dative-definite-genitive-singular":"juganului","dative-genitive-indefinite-plural":"jugani","dative-definite-genitive-plural":"juganilor","singular-vocative":"juganule","plural-vocative":"juganilor"}},{"word":"jugar","pos":"adj","definitions":["of a yoke, good or fitting for a yoke"],"pronunciation":"/ʒuˈɡar/","forms":{"feminine-singular":"jugară","masculine-plural":"jugari","feminine-neuter-plural":"jugare","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"jugar","error-unrecognized-form-feminine-indefinite-singular":"jugară","error-unrecognized-form-indefinite-masculine-plural":"jugari","error-unrecognized-form-feminine-indefinite-neuter-plural":"jugare","definite-error-unrecognized-form-masculine-neuter-singular":"jugarul","definite-error-unrecognized-form-feminine-singular":"jugara","definite-error-unrecognized-form-masculine-plural":"jugarii","definite-error-unrecognized-form-feminine-neuter-plural":"jugarele"}},{"word":"jugar","pos":"noun","definitions":["a yoked oxen"],"pronunciation":"/ʒuˈɡar/","forms":{"plural":"jugari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugar","accusative-definite-nominative-singular":"jugarul","accusative-indefinite-nominative-plural":"jugari","accusative-definite-nominative-plural":"jugarii","dative-genitive-indefinite-singular":"jugar","dative-definite-genitive-singular":"jugarului","dative-genitive-indefinite-plural":"jugari","dative-definite-genitive-plural":"jugarilor","singular-vocative":"jugarule","plural-vocative":"jugarilor"}},{"word":"jugastru","pos":"noun","definitions":["field maple (Acer campestre)"],"forms":{"plural":"jugaștri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugastru","accusative-definite-nominative-singular":"jugastrul","accusative-indefinite-nominative-plural":"jugaștri","accusative-definite-nominative-plural":"jugaștrii","dative-genitive-indefinite-singular":"jugastru","dative-definite-genitive-singular":"jugastrului","dative-genitive-indefinite-plural":"jugaștri","dative-definite-genitive-plural":"jugaștrilor","singular-vocative":"jugastrule","plural-vocative":"jugaștrilor"}},{"word":"Jugastru","pos":"name","definitions":["a village in Butoiești, Mehedinți County, Romania","a county in the Transnistria Governorate, administered by Romania during World War II"],"gender":"m"},{"word":"jugaș","pos":"noun","definitions":["a yoked ox"],"forms":{"plural":"jugași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugaș","accusative-definite-nominative-singular":"jugașul","accusative-indefinite-nominative-plural":"jugași","accusative-definite-nominative-plural":"jugașii","dative-genitive-indefinite-singular":"jugaș","dative-definite-genitive-singular":"jugașului","dative-genitive-indefinite-plural":"jugași","dative-definite-genitive-plural":"jugașilor","singular-vocative":"jugașule","plural-vocative":"jugașilor"}},{"word":"jugălit","pos":"adj","definitions":["worked on the field (about cows)"],"forms":{"feminine-singular":"jugălită","masculine-plural":"jugăliți","feminine-neuter-plural":"jugălite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jugălit","error-unrecognized-form-feminine-indefinite-singular":"jugălită","error-unrecognized-form-indefinite-masculine-plural":"jugăliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jugălite","definite-error-unrecognized-form-masculine-neuter-singular":"jugălitul","definite-error-unrecognized-form-feminine-singular":"jugălita","definite-error-unrecognized-form-masculine-plural":"jugăliții","definite-error-unrecognized-form-feminine-neuter-plural":"jugălitele"}},{"word":"jugănar","pos":"noun","definitions":["castrator"],"forms":{"plural":"jugănari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugănar","accusative-definite-nominative-singular":"jugănarul","accusative-indefinite-nominative-plural":"jugănari","accusative-definite-nominative-plural":"jugănarii","dative-genitive-indefinite-singular":"jugănar","dative-definite-genitive-singular":"jugănarului","dative-genitive-indefinite-plural":"jugănari","dative-definite-genitive-plural":"jugănarilor","singular-vocative":"jugănarule","plural-vocative":"jugănarilor"}},{"word":"Jugănariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Jugănariu"}},{"word":"Jugănaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Jugănaru"}},{"word":"jugănaș","pos":"noun","definitions":["diminutive of jugan; small gelding"],"pronunciation":"/ʒu.ɡə.ˈnaʃ/","forms":{"plural":"jugănași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugănaș","accusative-definite-nominative-singular":"jugănașul","accusative-indefinite-nominative-plural":"jugănași","accusative-definite-nominative-plural":"jugănașii","dative-genitive-indefinite-singular":"jugănaș","dative-definite-genitive-singular":"jugănașului","dative-genitive-indefinite-plural":"jugănași","dative-definite-genitive-plural":"jugănașilor","singular-vocative":"jugănașule","plural-vocative":"jugănașilor"}},{"word":"jugăneală","pos":"noun","definitions":["castration"],"forms":{"plural":"jugăneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jugăneală","accusative-definite-nominative-singular":"jugăneala","accusative-indefinite-nominative-plural":"jugănele","accusative-definite-nominative-plural":"jugănelele","dative-genitive-indefinite-singular":"jugănele","dative-definite-genitive-singular":"jugănelei","dative-genitive-indefinite-plural":"jugănele","dative-definite-genitive-plural":"jugănelelor","singular-vocative":"jugăneală","plural-vocative":"jugănelelor"}},{"word":"jugănel","pos":"noun","definitions":["diminutive of jugan"],"forms":{"plural":"jugănei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugănel","accusative-definite-nominative-singular":"jugănelul","accusative-indefinite-nominative-plural":"jugănei","accusative-definite-nominative-plural":"jugăneii","dative-genitive-indefinite-singular":"jugănel","dative-definite-genitive-singular":"jugănelului","dative-genitive-indefinite-plural":"jugănei","dative-definite-genitive-plural":"jugăneilor","singular-vocative":"jugănelule","plural-vocative":"jugăneilor"}},{"word":"jugăni","pos":"verb","definitions":["to castrate","to torment"],"forms":{"canonical":"a jugăni 4th conjugation","present-singular-third-person":"jugănește","participle-past":"jugănit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jugăni","gerund":"jugănind","first-person-indicative-present-singular":"jugănesc","indicative-present-second-person-singular":"jugănești","indicative-present-singular-third-person":"jugănește","first-person-indicative-plural-present":"jugănim","indicative-plural-present-second-person":"jugăniți","indicative-plural-present-third-person":"jugănesc","first-person-imperfect-indicative-singular":"jugăneam","imperfect-indicative-second-person-singular":"jugăneai","imperfect-indicative-singular-third-person":"jugănea","first-person-imperfect-indicative-plural":"jugăneam","imperfect-indicative-plural-second-person":"jugăneați","imperfect-indicative-plural-third-person":"jugăneau","first-person-indicative-perfect-singular":"jugănii","indicative-perfect-second-person-singular":"jugăniși","indicative-perfect-singular-third-person":"jugăni","first-person-indicative-perfect-plural":"jugănirăm","indicative-perfect-plural-second-person":"jugănirăți","indicative-perfect-plural-third-person":"jugăniră","first-person-indicative-pluperfect-singular":"jugănisem","indicative-pluperfect-second-person-singular":"jugăniseși","indicative-pluperfect-singular-third-person":"jugănise","first-person-indicative-pluperfect-plural":"jugăniserăm","indicative-pluperfect-plural-second-person":"jugăniserăți","indicative-pluperfect-plural-third-person":"jugăniseră","first-person-present-singular-subjunctive":"să jugănesc","present-second-person-singular-subjunctive":"să jugănești","present-singular-subjunctive-third-person":"să jugănească","first-person-plural-present-subjunctive":"să jugănim","plural-present-second-person-subjunctive":"să jugăniți","plural-present-subjunctive-third-person":"să jugănească","imperative-second-person-singular":"jugănește","imperative-plural-second-person":"jugăniți","imperative-negative-second-person-singular":"nu jugăni","imperative-negative-plural-second-person":"nu jugăniți"}},{"word":"jugănire","pos":"noun","definitions":["castration"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"jugănire","accusative-definite-nominative":"jugănirea","dative-genitive-indefinite":"jugăniri","dative-definite-genitive":"jugănirii","vocative":"jugănire"}},{"word":"jugănit","pos":"adj","definitions":["castrated"],"forms":{"feminine-singular":"jugănită","masculine-plural":"jugăniți","feminine-neuter-plural":"jugănite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jugănit","error-unrecognized-form-feminine-indefinite-singular":"jugănită","error-unrecognized-form-indefinite-masculine-plural":"jugăniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jugănite","definite-error-unrecognized-form-masculine-neuter-singular":"jugănitul","definite-error-unrecognized-form-feminine-singular":"jugănita","definite-error-unrecognized-form-masculine-plural":"jugăniții","definite-error-unrecognized-form-feminine-neuter-plural":"jugănitele"}},{"word":"jugănit","pos":"verb","definitions":["past participle of jugăni"],"forms":{"participle-past":"of jugăni"}},{"word":"jugăr","pos":"noun","definitions":["alternative form of iugăr"],"forms":{"plural":"jugăre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jugăr","accusative-definite-nominative-singular":"jugărul","accusative-indefinite-nominative-plural":"jugăre","accusative-definite-nominative-plural":"jugărele","dative-genitive-indefinite-singular":"jugăr","dative-definite-genitive-singular":"jugărului","dative-genitive-indefinite-plural":"jugăre","dative-definite-genitive-plural":"jugărelor","singular-vocative":"jugărule","plural-vocative":"jugărelor"}},{"word":"jugărel","pos":"noun","definitions":["wall germander (Teucrium chamaedrys)"],"forms":{"plural":"jugărei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugărel","accusative-definite-nominative-singular":"jugărelul","accusative-indefinite-nominative-plural":"jugărei","accusative-definite-nominative-plural":"jugăreii","dative-genitive-indefinite-singular":"jugărel","dative-definite-genitive-singular":"jugărelului","dative-genitive-indefinite-plural":"jugărei","dative-definite-genitive-plural":"jugăreilor","singular-vocative":"jugărelule","plural-vocative":"jugăreilor"}},{"word":"jugăreț","pos":"noun","definitions":["wall germander (Teucrium chamaedrys)"],"forms":{"plural":"jugăreți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugăreț","accusative-definite-nominative-singular":"jugărețul","accusative-indefinite-nominative-plural":"jugăreți","accusative-definite-nominative-plural":"jugăreții","dative-genitive-indefinite-singular":"jugăreț","dative-definite-genitive-singular":"jugărețului","dative-genitive-indefinite-plural":"jugăreți","dative-definite-genitive-plural":"jugăreților","singular-vocative":"jugărețule","plural-vocative":"jugăreților"}},{"word":"jugărit","pos":"noun","definitions":["tax on cutting wood from the forest"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jugărit","accusative-definite-nominative":"jugăritul","dative-genitive-indefinite":"jugărit","dative-definite-genitive":"jugăritului","vocative":"jugăritule"}},{"word":"Jugăstreanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jugăstreanu"}},{"word":"Jugăstreni","pos":"name","definitions":["a village in Vima Mică, Maramureș County, Romania"],"gender":"m"},{"word":"jugendstil","pos":"noun","definitions":["jugendstil"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jugendstil","accusative-definite-nominative":"jugendstilul","dative-genitive-indefinite":"jugendstil","dative-definite-genitive":"jugendstilului","vocative":"jugendstilule"}},{"word":"jughilan","pos":"noun","definitions":["an ox"],"forms":{"plural":"jughilani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jughilan","accusative-definite-nominative-singular":"jughilanul","accusative-indefinite-nominative-plural":"jughilani","accusative-definite-nominative-plural":"jughilanii","dative-genitive-indefinite-singular":"jughilan","dative-definite-genitive-singular":"jughilanului","dative-genitive-indefinite-plural":"jughilani","dative-definite-genitive-plural":"jughilanilor","singular-vocative":"jughilanule","plural-vocative":"jughilanilor"}},{"word":"juglău","pos":"noun","definitions":["neck yoke to prevent animals from jumping over fences"],"forms":{"plural":"juglăi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"juglău","accusative-definite-nominative-singular":"juglăuul","accusative-indefinite-nominative-plural":"juglăi","accusative-definite-nominative-plural":"juglăile","dative-genitive-indefinite-singular":"juglău","dative-definite-genitive-singular":"juglăuului","dative-genitive-indefinite-plural":"juglăi","dative-definite-genitive-plural":"juglăilor","singular-vocative":"juglăuule","plural-vocative":"juglăilor"}},{"word":"Jugravu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Jugravu"}},{"word":"jugula","pos":"verb","definitions":["to choke, to strangle","to stamp out"],"forms":{"canonical":"a jugula 1st conjugation","present-singular-third-person":"jugulează","participle-past":"jugulat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a jugula","gerund":"jugulând","first-person-indicative-present-singular":"jugulez","indicative-present-second-person-singular":"jugulezi","indicative-present-singular-third-person":"jugulează","first-person-indicative-plural-present":"jugulăm","indicative-plural-present-second-person":"jugulați","indicative-plural-present-third-person":"jugulează","first-person-imperfect-indicative-singular":"jugulam","imperfect-indicative-second-person-singular":"jugulai","imperfect-indicative-singular-third-person":"jugula","first-person-imperfect-indicative-plural":"jugulam","imperfect-indicative-plural-second-person":"jugulați","imperfect-indicative-plural-third-person":"jugulau","first-person-indicative-perfect-singular":"jugulai","indicative-perfect-second-person-singular":"jugulași","indicative-perfect-singular-third-person":"jugulă","first-person-indicative-perfect-plural":"jugularăm","indicative-perfect-plural-second-person":"jugularăți","indicative-perfect-plural-third-person":"jugulară","first-person-indicative-pluperfect-singular":"jugulasem","indicative-pluperfect-second-person-singular":"jugulaseși","indicative-pluperfect-singular-third-person":"jugulase","first-person-indicative-pluperfect-plural":"jugulaserăm","indicative-pluperfect-plural-second-person":"jugulaserăți","indicative-pluperfect-plural-third-person":"jugulaseră","first-person-present-singular-subjunctive":"să jugulez","present-second-person-singular-subjunctive":"să jugulezi","present-singular-subjunctive-third-person":"să juguleze","first-person-plural-present-subjunctive":"să jugulăm","plural-present-second-person-subjunctive":"să jugulați","plural-present-subjunctive-third-person":"să juguleze","imperative-second-person-singular":"jugulează","imperative-plural-second-person":"jugulați","imperative-negative-second-person-singular":"nu jugula","imperative-negative-plural-second-person":"nu jugulați"}},{"word":"jugular","pos":"adj","definitions":["jugular; pertaining to the neck or throat"],"pronunciation":"/ʒu.ɡuˈlar/","forms":{"feminine-singular":"jugulară","masculine-plural":"jugulari","feminine-neuter-plural":"jugulare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jugular","error-unrecognized-form-feminine-indefinite-singular":"jugulară","error-unrecognized-form-indefinite-masculine-plural":"jugulari","error-unrecognized-form-feminine-indefinite-neuter-plural":"jugulare","definite-error-unrecognized-form-masculine-neuter-singular":"jugularul","definite-error-unrecognized-form-feminine-singular":"jugulara","definite-error-unrecognized-form-masculine-plural":"jugularii","definite-error-unrecognized-form-feminine-neuter-plural":"jugularele"}},{"word":"jugulară","pos":"noun","definitions":["jugular (vein)"],"forms":{"plural":"jugulare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jugulară","accusative-definite-nominative-singular":"jugulara","accusative-indefinite-nominative-plural":"jugulare","accusative-definite-nominative-plural":"jugularele","dative-genitive-indefinite-singular":"jugulare","dative-definite-genitive-singular":"jugularei","dative-genitive-indefinite-plural":"jugulare","dative-definite-genitive-plural":"jugularelor","singular-vocative":"jugulară","plural-vocative":"jugularelor"}},{"word":"jugulare","pos":"noun","definitions":["jugulation"],"forms":{"plural":"jugulări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jugulare","accusative-definite-nominative-singular":"jugularea","accusative-indefinite-nominative-plural":"jugulări","accusative-definite-nominative-plural":"jugulările","dative-genitive-indefinite-singular":"jugulări","dative-definite-genitive-singular":"jugulării","dative-genitive-indefinite-plural":"jugulări","dative-definite-genitive-plural":"jugulărilor","singular-vocative":"jugulare","plural-vocative":"jugulărilor"}},{"word":"jugule","pos":"noun","definitions":["vocative singular of jug"],"pronunciation":"[ˈʒuɡule]","gender":"n"},{"word":"Jugulete","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Jugulete"}},{"word":"juguleț","pos":"noun","definitions":["diminutive of jug"],"forms":{"plural":"juguleți","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"juguleț","accusative-definite-nominative-singular":"jugulețul","accusative-indefinite-nominative-plural":"juguleți","accusative-definite-nominative-plural":"jugulețile","dative-genitive-indefinite-singular":"juguleț","dative-definite-genitive-singular":"jugulețului","dative-genitive-indefinite-plural":"juguleți","dative-definite-genitive-plural":"juguleților","singular-vocative":"jugulețule","plural-vocative":"juguleților"}},{"word":"juguluire","pos":"noun","definitions":["subjugation"],"forms":{"plural":"juguluiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"juguluire","accusative-definite-nominative-singular":"juguluirea","accusative-indefinite-nominative-plural":"juguluiri","accusative-definite-nominative-plural":"juguluirile","dative-genitive-indefinite-singular":"juguluiri","dative-definite-genitive-singular":"juguluirii","dative-genitive-indefinite-plural":"juguluiri","dative-definite-genitive-plural":"juguluirilor","singular-vocative":"juguluire","plural-vocative":"juguluirilor"}},{"word":"Jugureanu","pos":"name","definitions":["a village in Ulmu, Brăila County, Romania"],"gender":"m"},{"word":"jugurel","pos":"noun","definitions":["wall germander (Teucrium chamaedrys)"],"forms":{"plural":"jugurei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugurel","accusative-definite-nominative-singular":"jugurelul","accusative-indefinite-nominative-plural":"jugurei","accusative-definite-nominative-plural":"jugureii","dative-genitive-indefinite-singular":"jugurel","dative-definite-genitive-singular":"jugurelului","dative-genitive-indefinite-plural":"jugurei","dative-definite-genitive-plural":"jugureilor","singular-vocative":"jugurelule","plural-vocative":"jugureilor"}},{"word":"Jugureni","pos":"name","definitions":["a village in Uliești, Dâmbovița County, Romania","a commune of Prahova County, Romania","a village in Jugureni, Prahova County, Romania"],"gender":"m"},{"word":"jugureț","pos":"noun","definitions":["wall germander (Teucrium chamaedrys)"],"forms":{"plural":"jugureți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugureț","accusative-definite-nominative-singular":"jugurețul","accusative-indefinite-nominative-plural":"jugureți","accusative-definite-nominative-plural":"jugureții","dative-genitive-indefinite-singular":"jugureț","dative-definite-genitive-singular":"jugurețului","dative-genitive-indefinite-plural":"jugureți","dative-definite-genitive-plural":"jugureților","singular-vocative":"jugurețule","plural-vocative":"jugureților"}},{"word":"jugușor","pos":"noun","definitions":["diminutive of jug"],"forms":{"plural":"jugușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jugușor","accusative-definite-nominative-singular":"jugușorul","accusative-indefinite-nominative-plural":"jugușoare","accusative-definite-nominative-plural":"jugușoarele","dative-genitive-indefinite-singular":"jugușor","dative-definite-genitive-singular":"jugușorului","dative-genitive-indefinite-plural":"jugușoare","dative-definite-genitive-plural":"jugușoarelor","singular-vocative":"jugușorule","plural-vocative":"jugușoarelor"}},{"word":"juguț","pos":"noun","definitions":["diminutive of jug"],"forms":{"plural":"juguțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"juguț","accusative-definite-nominative-singular":"juguțul","accusative-indefinite-nominative-plural":"juguțe","accusative-definite-nominative-plural":"juguțele","dative-genitive-indefinite-singular":"juguț","dative-definite-genitive-singular":"juguțului","dative-genitive-indefinite-plural":"juguțe","dative-definite-genitive-plural":"juguțelor","singular-vocative":"juguțule","plural-vocative":"juguțelor"}},{"word":"juhăt","pos":"noun","definitions":["noise, uproar, rumbling"],"forms":{"plural":"juhăte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"juhăt","accusative-definite-nominative-singular":"juhătul","accusative-indefinite-nominative-plural":"juhăte","accusative-definite-nominative-plural":"juhătele","dative-genitive-indefinite-singular":"juhăt","dative-definite-genitive-singular":"juhătului","dative-genitive-indefinite-plural":"juhăte","dative-definite-genitive-plural":"juhătelor","singular-vocative":"juhătule","plural-vocative":"juhătelor"}},{"word":"juisa","pos":"verb","definitions":["to enjoy the pleasures of life","to ejaculate, to orgasm"],"pronunciation":"[ʒuiˈsa]","forms":{"canonical":"a juisa 1st conjugation","present-singular-third-person":"juisează","participle-past":"juisat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a juisa","gerund":"juisând","first-person-indicative-present-singular":"juisez","indicative-present-second-person-singular":"juisezi","indicative-present-singular-third-person":"juisează","first-person-indicative-plural-present":"juisăm","indicative-plural-present-second-person":"juisați","indicative-plural-present-third-person":"juisează","first-person-imperfect-indicative-singular":"juisam","imperfect-indicative-second-person-singular":"juisai","imperfect-indicative-singular-third-person":"juisa","first-person-imperfect-indicative-plural":"juisam","imperfect-indicative-plural-second-person":"juisați","imperfect-indicative-plural-third-person":"juisau","first-person-indicative-perfect-singular":"juisai","indicative-perfect-second-person-singular":"juisași","indicative-perfect-singular-third-person":"juisă","first-person-indicative-perfect-plural":"juisarăm","indicative-perfect-plural-second-person":"juisarăți","indicative-perfect-plural-third-person":"juisară","first-person-indicative-pluperfect-singular":"juisasem","indicative-pluperfect-second-person-singular":"juisaseși","indicative-pluperfect-singular-third-person":"juisase","first-person-indicative-pluperfect-plural":"juisaserăm","indicative-pluperfect-plural-second-person":"juisaserăți","indicative-pluperfect-plural-third-person":"juisaseră","first-person-present-singular-subjunctive":"să juisez","present-second-person-singular-subjunctive":"să juisezi","present-singular-subjunctive-third-person":"să juiseze","first-person-plural-present-subjunctive":"să juisăm","plural-present-second-person-subjunctive":"să juisați","plural-present-subjunctive-third-person":"să juiseze","imperative-second-person-singular":"juisează","imperative-plural-second-person":"juisați","imperative-negative-second-person-singular":"nu juisa","imperative-negative-plural-second-person":"nu juisați"}},{"word":"juisare","pos":"noun","definitions":["orgasm"],"forms":{"plural":"juisări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"juisare","accusative-definite-nominative-singular":"juisarea","accusative-indefinite-nominative-plural":"juisări","accusative-definite-nominative-plural":"juisările","dative-genitive-indefinite-singular":"juisări","dative-definite-genitive-singular":"juisării","dative-genitive-indefinite-plural":"juisări","dative-definite-genitive-plural":"juisărilor","singular-vocative":"juisare","plural-vocative":"juisărilor"}},{"word":"juisați","pos":"adj","definitions":["masculine plural of juisat"],"pronunciation":"[ʒuiˈsat͡sʲ]"},{"word":"juisați","pos":"verb","definitions":["inflection of juisa:","second-person plural present/imperfect indicative","second-person plural present subjunctive","second-person plural imperative"],"pronunciation":"[ʒuiˈsat͡sʲ]"},{"word":"juisă","pos":"verb","definitions":["third-person singular simple perfect indicative of juisa"]},{"word":"juisăm","pos":"verb","definitions":["first-person plural present indicative/subjunctive of juisa"],"pronunciation":"[ʒuiˈsəm]"},{"word":"juisează","pos":"verb","definitions":["inflection of juisa:","third-person singular/plural present indicative","second-person singular imperative"],"pronunciation":"[ʒuiˈse̯azə]"},{"word":"juisez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of juisa"],"pronunciation":"[ʒuiˈsez]"},{"word":"juiseze","pos":"verb","definitions":["third-person singular/plural present subjunctive of juisa"],"pronunciation":"[ʒuiˈseze]"},{"word":"juisezi","pos":"verb","definitions":["second-person singular present indicative/subjunctive of juisa"],"pronunciation":"[ʒuiˈsezʲ]"},{"word":"juisoare","pos":"noun","definitions":["female equivalent of juisor"],"forms":{"plural":"juisoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"juisoare","accusative-definite-nominative-singular":"juisoarea","accusative-indefinite-nominative-plural":"juisoare","accusative-definite-nominative-plural":"juisoarele","dative-genitive-indefinite-singular":"juisoare","dative-definite-genitive-singular":"juisoarei","dative-genitive-indefinite-plural":"juisoare","dative-definite-genitive-plural":"juisoarelor","singular-vocative":"juisoare","plural-vocative":"juisoarelor"}},{"word":"jujău","pos":"noun","definitions":["alternative form of jujeu"],"forms":{"plural":"jujăie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jujău","accusative-definite-nominative-singular":"jujăuul","accusative-indefinite-nominative-plural":"jujăie","accusative-definite-nominative-plural":"jujăiele","dative-genitive-indefinite-singular":"jujău","dative-definite-genitive-singular":"jujăuului","dative-genitive-indefinite-plural":"jujăie","dative-definite-genitive-plural":"jujăielor","singular-vocative":"jujăuule","plural-vocative":"jujăielor"}},{"word":"jujeu","pos":"noun","definitions":["neck yoke to prevent animals from jumping over fences"],"forms":{"plural":"jujeie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jujeu","accusative-definite-nominative-singular":"jujeul","accusative-indefinite-nominative-plural":"jujeie","accusative-definite-nominative-plural":"jujeiele","dative-genitive-indefinite-singular":"jujeu","dative-definite-genitive-singular":"jujeului","dative-genitive-indefinite-plural":"jujeie","dative-definite-genitive-plural":"jujeielor","singular-vocative":"jujeule","plural-vocative":"jujeielor"}},{"word":"jujub","pos":"noun","definitions":["jujube tree (Ziziphus jujuba or Ziziphus zizyphus)"],"forms":{"plural":"jujubi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jujub","accusative-definite-nominative-singular":"jujubul","accusative-indefinite-nominative-plural":"jujubi","accusative-definite-nominative-plural":"jujubii","dative-genitive-indefinite-singular":"jujub","dative-definite-genitive-singular":"jujubului","dative-genitive-indefinite-plural":"jujubi","dative-definite-genitive-plural":"jujubilor","singular-vocative":"jujubule","plural-vocative":"jujubilor"}},{"word":"jujuba","pos":"noun","definitions":["definite nominative/accusative singular of jujubă"]},{"word":"jujubă","pos":"noun","definitions":["jujube (fruit)"],"pronunciation":"/ʒuˈʒu.bə/","forms":{"plural":"jujube","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"jujubă","accusative-definite-nominative-singular":"jujuba","accusative-indefinite-nominative-plural":"jujube","accusative-definite-nominative-plural":"jujubele","dative-genitive-indefinite-singular":"jujube","dative-definite-genitive-singular":"jujubei","dative-genitive-indefinite-plural":"jujube","dative-definite-genitive-plural":"jujubelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"jujube","pos":"noun","definitions":["plural of jujubă"]},{"word":"jujubier","pos":"noun","definitions":["jujube (tree)"],"forms":{"plural":"jujubieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jujubier","accusative-definite-nominative-singular":"jujubierul","accusative-indefinite-nominative-plural":"jujubieri","accusative-definite-nominative-plural":"jujubierii","dative-genitive-indefinite-singular":"jujubier","dative-definite-genitive-singular":"jujubierului","dative-genitive-indefinite-plural":"jujubieri","dative-definite-genitive-plural":"jujubierilor","singular-vocative":"jujubierule","plural-vocative":"jujubierilor"}},{"word":"julep","pos":"noun","definitions":["julep"],"forms":{"plural":"julepuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"julep","accusative-definite-nominative-singular":"julepul","accusative-indefinite-nominative-plural":"julepuri","accusative-definite-nominative-plural":"julepurile","dative-genitive-indefinite-singular":"julep","dative-definite-genitive-singular":"julepului","dative-genitive-indefinite-plural":"julepuri","dative-definite-genitive-plural":"julepurilor","singular-vocative":"julepule","plural-vocative":"julepurilor"}},{"word":"julfă","pos":"noun","definitions":["hemp seed, hemp heart"],"forms":{"plural":"julfe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"julfă","accusative-definite-nominative-singular":"julfa","accusative-indefinite-nominative-plural":"julfe","accusative-definite-nominative-plural":"julfele","dative-genitive-indefinite-singular":"julfe","dative-definite-genitive-singular":"julfei","dative-genitive-indefinite-plural":"julfe","dative-definite-genitive-plural":"julfelor","singular-vocative":"julfă","plural-vocative":"julfelor"}},{"word":"juli","pos":"verb","definitions":["to scratch"],"forms":{"canonical":"a juli 4th conjugation","present-singular-third-person":"julește","participle-past":"julit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a juli","gerund":"julind","first-person-indicative-present-singular":"julesc","indicative-present-second-person-singular":"julești","indicative-present-singular-third-person":"julește","first-person-indicative-plural-present":"julim","indicative-plural-present-second-person":"juliți","indicative-plural-present-third-person":"julesc","first-person-imperfect-indicative-singular":"juleam","imperfect-indicative-second-person-singular":"juleai","imperfect-indicative-singular-third-person":"julea","first-person-imperfect-indicative-plural":"juleam","imperfect-indicative-plural-second-person":"juleați","imperfect-indicative-plural-third-person":"juleau","first-person-indicative-perfect-singular":"julii","indicative-perfect-second-person-singular":"juliși","indicative-perfect-singular-third-person":"juli","first-person-indicative-perfect-plural":"julirăm","indicative-perfect-plural-second-person":"julirăți","indicative-perfect-plural-third-person":"juliră","first-person-indicative-pluperfect-singular":"julisem","indicative-pluperfect-second-person-singular":"juliseși","indicative-pluperfect-singular-third-person":"julise","first-person-indicative-pluperfect-plural":"juliserăm","indicative-pluperfect-plural-second-person":"juliserăți","indicative-pluperfect-plural-third-person":"juliseră","first-person-present-singular-subjunctive":"să julesc","present-second-person-singular-subjunctive":"să julești","present-singular-subjunctive-third-person":"să julească","first-person-plural-present-subjunctive":"să julim","plural-present-second-person-subjunctive":"să juliți","plural-present-subjunctive-third-person":"să julească","imperative-second-person-singular":"julește","imperative-plural-second-person":"juliți","imperative-negative-second-person-singular":"nu juli","imperative-negative-plural-second-person":"nu juliți"}},{"word":"Juliana","pos":"name","definitions":["a female given name"],"gender":"f"},{"word":"julire","pos":"noun","definitions":["scratch"],"forms":{"plural":"juliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"julire","accusative-definite-nominative-singular":"julirea","accusative-indefinite-nominative-plural":"juliri","accusative-definite-nominative-plural":"julirile","dative-genitive-indefinite-singular":"juliri","dative-definite-genitive-singular":"julirii","dative-genitive-indefinite-plural":"juliri","dative-definite-genitive-plural":"julirilor","singular-vocative":"julire","plural-vocative":"julirilor"}},{"word":"julit","pos":"adj","definitions":["scratched, skinned"],"forms":{"feminine-singular":"julită","masculine-plural":"juliți","feminine-neuter-plural":"julite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"julit","error-unrecognized-form-feminine-indefinite-singular":"julită","error-unrecognized-form-indefinite-masculine-plural":"juliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"julite","definite-error-unrecognized-form-masculine-neuter-singular":"julitul","definite-error-unrecognized-form-feminine-singular":"julita","definite-error-unrecognized-form-masculine-plural":"juliții","definite-error-unrecognized-form-feminine-neuter-plural":"julitele"}},{"word":"julitură","pos":"noun","definitions":["scratch"],"forms":{"plural":"julituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"julitură","accusative-definite-nominative-singular":"julitura","accusative-indefinite-nominative-plural":"juliture","accusative-definite-nominative-plural":"juliturele","dative-genitive-indefinite-singular":"juliture","dative-definite-genitive-singular":"juliturei","dative-genitive-indefinite-plural":"juliture","dative-definite-genitive-plural":"juliturelor","singular-vocative":"julitură","plural-vocative":"juliturelor"}},{"word":"juma","pos":"noun","definitions":["alternative form of jumătate"]},{"word":"jumalț","pos":"noun","definitions":["obsolete form of smalț"],"forms":{"plural":"jumalțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jumalț","accusative-definite-nominative-singular":"jumalțul","accusative-indefinite-nominative-plural":"jumalțuri","accusative-definite-nominative-plural":"jumalțurile","dative-genitive-indefinite-singular":"jumalț","dative-definite-genitive-singular":"jumalțului","dative-genitive-indefinite-plural":"jumalțuri","dative-definite-genitive-plural":"jumalțurilor","singular-vocative":"jumalțule","plural-vocative":"jumalțurilor"}},{"word":"jumară","pos":"noun","definitions":["edible leftovers of bacon that was used to produce lard","meal prepared by frying eggs in grease","weak man","mamaliga with whey cooked in melted butter","a dish prepared by frying a mixture of cornflour, milk and eggs"],"forms":{"plural":"jumări","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"jumară","accusative-definite-nominative-singular":"jumara","accusative-indefinite-nominative-plural":"jumări","accusative-definite-nominative-plural":"jumările","dative-genitive-indefinite-singular":"jumări","dative-definite-genitive-singular":"jumării","dative-genitive-indefinite-plural":"jumări","dative-definite-genitive-plural":"jumărilor","singular-vocative":"-","plural-vocative":"-","alternative":"jumarcă"}},{"word":"Jumară","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jumară"}},{"word":"jumate","pos":"noun","definitions":["syncopic form of jumătate"],"pronunciation":"/ʒuˈma.te/","forms":{"plural":"jumăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jumate","accusative-definite-nominative-singular":"jumatea","accusative-indefinite-nominative-plural":"jumăți","accusative-definite-nominative-plural":"jumățile","dative-genitive-indefinite-singular":"jumăți","dative-definite-genitive-singular":"jumății","dative-genitive-indefinite-plural":"jumăți","dative-definite-genitive-plural":"jumăților","singular-vocative":"jumate","plural-vocative":"jumăților","alternative":"жумате"}},{"word":"jumări","pos":"noun","definitions":["plural of jumară"],"gender":"f-p"},{"word":"jumătate","pos":"noun","definitions":["half"],"pronunciation":"/ʒu.məˈta.te/","forms":{"plural":"jumătăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jumătate","accusative-definite-nominative-singular":"jumătatea","accusative-indefinite-nominative-plural":"jumătăți","accusative-definite-nominative-plural":"jumătățile","dative-genitive-indefinite-singular":"jumătăți","dative-definite-genitive-singular":"jumătății","dative-genitive-indefinite-plural":"jumătăți","dative-definite-genitive-plural":"jumătăților","singular-vocative":"jumătate","plural-vocative":"jumătăților","alternative":"жумэтате","alternative-colloquial":"jumate"}},{"word":"Jumătate","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jumătate"}},{"word":"jumătate de măsură","pos":"noun","definitions":["half measure"],"forms":{"plural":"jumătăți de măsură"}},{"word":"jumătatea","pos":"noun","definitions":["definite nominative/accusative singular of jumătate"]},{"word":"jumătăți","pos":"noun","definitions":["inflection of jumătate:","plural","genitive/dative singular"]},{"word":"jumătăți","pos":"verb","definitions":["to half"],"forms":{"canonical":"a jumătăți 4th conjugation","present-singular-third-person":"jumătățește","participle-past":"jumătățit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jumătăți","gerund":"jumătățind","first-person-indicative-present-singular":"jumătățesc","indicative-present-second-person-singular":"jumătățești","indicative-present-singular-third-person":"jumătățește","first-person-indicative-plural-present":"jumătățim","indicative-plural-present-second-person":"jumătățiți","indicative-plural-present-third-person":"jumătățesc","first-person-imperfect-indicative-singular":"jumătățeam","imperfect-indicative-second-person-singular":"jumătățeai","imperfect-indicative-singular-third-person":"jumătățea","first-person-imperfect-indicative-plural":"jumătățeam","imperfect-indicative-plural-second-person":"jumătățeați","imperfect-indicative-plural-third-person":"jumătățeau","first-person-indicative-perfect-singular":"jumătății","indicative-perfect-second-person-singular":"jumătățiși","indicative-perfect-singular-third-person":"jumătăți","first-person-indicative-perfect-plural":"jumătățirăm","indicative-perfect-plural-second-person":"jumătățirăți","indicative-perfect-plural-third-person":"jumătățiră","first-person-indicative-pluperfect-singular":"jumătățisem","indicative-pluperfect-second-person-singular":"jumătățiseși","indicative-pluperfect-singular-third-person":"jumătățise","first-person-indicative-pluperfect-plural":"jumătățiserăm","indicative-pluperfect-plural-second-person":"jumătățiserăți","indicative-pluperfect-plural-third-person":"jumătățiseră","first-person-present-singular-subjunctive":"să jumătățesc","present-second-person-singular-subjunctive":"să jumătățești","present-singular-subjunctive-third-person":"să jumătățească","first-person-plural-present-subjunctive":"să jumătățim","plural-present-second-person-subjunctive":"să jumătățiți","plural-present-subjunctive-third-person":"să jumătățească","imperative-second-person-singular":"jumătățește","imperative-plural-second-person":"jumătățiți","imperative-negative-second-person-singular":"nu jumătăți","imperative-negative-plural-second-person":"nu jumătățiți"}},{"word":"jumătății","pos":"noun","definitions":["definite dative/genitive singular of jumătate"]},{"word":"jumătățile","pos":"noun","definitions":["definite nominative/accusative plural of jumătate"]},{"word":"jumătăților","pos":"noun","definitions":["inflection of jumătate:","definite genitive/dative plural","vocative plural"]},{"word":"jumătățire","pos":"noun","definitions":["halving"],"forms":{"plural":"jumătățiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jumătățire","accusative-definite-nominative-singular":"jumătățirea","accusative-indefinite-nominative-plural":"jumătățiri","accusative-definite-nominative-plural":"jumătățirile","dative-genitive-indefinite-singular":"jumătățiri","dative-definite-genitive-singular":"jumătățirii","dative-genitive-indefinite-plural":"jumătățiri","dative-definite-genitive-plural":"jumătățirilor","singular-vocative":"jumătățire","plural-vocative":"jumătățirilor"}},{"word":"jumătățit","pos":"noun","definitions":["halving"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jumătățit","accusative-definite-nominative":"jumătățitul","dative-genitive-indefinite":"jumătățit","dative-definite-genitive":"jumătățitului","vocative":"jumătățitule"}},{"word":"jumătățit","pos":"verb","definitions":["past participle of jumătăți"],"forms":{"participle-past":"of jumătăți"}},{"word":"jumela","pos":"noun","definitions":["definite nominative/accusative singular of jumelă"],"pronunciation":"[ʒuˈmela]","gender":"f"},{"word":"jumelă","pos":"noun","definitions":["articulation part of a vehicle"],"forms":{"plural":"jumele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jumelă","accusative-definite-nominative-singular":"jumela","accusative-indefinite-nominative-plural":"jumele","accusative-definite-nominative-plural":"jumelele","dative-genitive-indefinite-singular":"jumele","dative-definite-genitive-singular":"jumelei","dative-genitive-indefinite-plural":"jumele","dative-definite-genitive-plural":"jumelelor","singular-vocative":"jumelă","plural-vocative":"jumelelor"}},{"word":"jumuleală","pos":"noun","definitions":["plucking"],"forms":{"plural":"jumuleli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jumuleală","accusative-definite-nominative-singular":"jumuleala","accusative-indefinite-nominative-plural":"jumulele","accusative-definite-nominative-plural":"jumulelele","dative-genitive-indefinite-singular":"jumulele","dative-definite-genitive-singular":"jumulelei","dative-genitive-indefinite-plural":"jumulele","dative-definite-genitive-plural":"jumulelelor","singular-vocative":"jumuleală","plural-vocative":"jumulelelor"}},{"word":"jumuli","pos":"verb","definitions":["to pluck"],"forms":{"canonical":"a jumuli 4th conjugation","present-singular-third-person":"jumulește","participle-past":"jumulit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jumuli","gerund":"jumulind","first-person-indicative-present-singular":"jumulesc","indicative-present-second-person-singular":"jumulești","indicative-present-singular-third-person":"jumulește","first-person-indicative-plural-present":"jumulim","indicative-plural-present-second-person":"jumuliți","indicative-plural-present-third-person":"jumulesc","first-person-imperfect-indicative-singular":"jumuleam","imperfect-indicative-second-person-singular":"jumuleai","imperfect-indicative-singular-third-person":"jumulea","first-person-imperfect-indicative-plural":"jumuleam","imperfect-indicative-plural-second-person":"jumuleați","imperfect-indicative-plural-third-person":"jumuleau","first-person-indicative-perfect-singular":"jumulii","indicative-perfect-second-person-singular":"jumuliși","indicative-perfect-singular-third-person":"jumuli","first-person-indicative-perfect-plural":"jumulirăm","indicative-perfect-plural-second-person":"jumulirăți","indicative-perfect-plural-third-person":"jumuliră","first-person-indicative-pluperfect-singular":"jumulisem","indicative-pluperfect-second-person-singular":"jumuliseși","indicative-pluperfect-singular-third-person":"jumulise","first-person-indicative-pluperfect-plural":"jumuliserăm","indicative-pluperfect-plural-second-person":"jumuliserăți","indicative-pluperfect-plural-third-person":"jumuliseră","first-person-present-singular-subjunctive":"să jumulesc","present-second-person-singular-subjunctive":"să jumulești","present-singular-subjunctive-third-person":"să jumulească","first-person-plural-present-subjunctive":"să jumulim","plural-present-second-person-subjunctive":"să jumuliți","plural-present-subjunctive-third-person":"să jumulească","imperative-second-person-singular":"jumulește","imperative-plural-second-person":"jumuliți","imperative-negative-second-person-singular":"nu jumuli","imperative-negative-plural-second-person":"nu jumuliți"}},{"word":"jumulire","pos":"noun","definitions":["plucking"],"forms":{"plural":"jumuliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jumulire","accusative-definite-nominative-singular":"jumulirea","accusative-indefinite-nominative-plural":"jumuliri","accusative-definite-nominative-plural":"jumulirile","dative-genitive-indefinite-singular":"jumuliri","dative-definite-genitive-singular":"jumulirii","dative-genitive-indefinite-plural":"jumuliri","dative-definite-genitive-plural":"jumulirilor","singular-vocative":"jumulire","plural-vocative":"jumulirilor"}},{"word":"jumulit","pos":"adj","definitions":["plucked"],"forms":{"feminine-singular":"jumulită","masculine-plural":"jumuliți","feminine-neuter-plural":"jumulite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jumulit","error-unrecognized-form-feminine-indefinite-singular":"jumulită","error-unrecognized-form-indefinite-masculine-plural":"jumuliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jumulite","definite-error-unrecognized-form-masculine-neuter-singular":"jumulitul","definite-error-unrecognized-form-feminine-singular":"jumulita","definite-error-unrecognized-form-masculine-plural":"jumuliții","definite-error-unrecognized-form-feminine-neuter-plural":"jumulitele"}},{"word":"jună","pos":"noun","definitions":["female equivalent of june"],"forms":{"plural":"june","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jună","accusative-definite-nominative-singular":"juna","accusative-indefinite-nominative-plural":"june","accusative-definite-nominative-plural":"junele","dative-genitive-indefinite-singular":"june","dative-definite-genitive-singular":"junei","dative-genitive-indefinite-plural":"june","dative-definite-genitive-plural":"junelor","singular-vocative":"jună","plural-vocative":"junelor"}},{"word":"junc","pos":"noun","definitions":["a young bullock"],"examples":[{"ro":"(regional)","en":null}],"forms":{"plural":"junci","feminine":"equivalent juncă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"junc","accusative-definite-nominative-singular":"juncul","accusative-indefinite-nominative-plural":"junci","accusative-definite-nominative-plural":"juncii","dative-genitive-indefinite-singular":"junc","dative-definite-genitive-singular":"juncului","dative-genitive-indefinite-plural":"junci","dative-definite-genitive-plural":"juncilor","singular-vocative":"juncule","plural-vocative":"juncilor"}},{"word":"Junc","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Crișul Alb"],"gender":"m"},{"word":"Junca","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Junca"}},{"word":"juncan","pos":"noun","definitions":["an older bullock"],"forms":{"plural":"juncani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"juncan","accusative-definite-nominative-singular":"juncanul","accusative-indefinite-nominative-plural":"juncani","accusative-definite-nominative-plural":"juncanii","dative-genitive-indefinite-singular":"juncan","dative-definite-genitive-singular":"juncanului","dative-genitive-indefinite-plural":"juncani","dative-definite-genitive-plural":"juncanilor","singular-vocative":"juncanule","plural-vocative":"juncanilor"}},{"word":"juncană","pos":"noun","definitions":["heifer"],"forms":{"plural":"juncane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"juncană","accusative-definite-nominative-singular":"juncana","accusative-indefinite-nominative-plural":"juncane","accusative-definite-nominative-plural":"juncanele","dative-genitive-indefinite-singular":"juncane","dative-definite-genitive-singular":"juncanei","dative-genitive-indefinite-plural":"juncane","dative-definite-genitive-plural":"juncanelor","singular-vocative":"juncană","plural-vocative":"juncanelor"}},{"word":"juncancă","pos":"noun","definitions":["heifer"],"forms":{"plural":"juncance","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"juncancă","accusative-definite-nominative-singular":"juncanca","accusative-indefinite-nominative-plural":"juncance","accusative-definite-nominative-plural":"juncancele","dative-genitive-indefinite-singular":"juncance","dative-definite-genitive-singular":"juncancei","dative-genitive-indefinite-plural":"juncance","dative-definite-genitive-plural":"juncancelor","singular-vocative":"juncancă","plural-vocative":"juncancelor"}},{"word":"juncă","pos":"noun","definitions":["heifer"],"forms":{"plural":"junci","masculine":"equivalent junc","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"juncă","accusative-definite-nominative-singular":"junca","accusative-indefinite-nominative-plural":"junci","accusative-definite-nominative-plural":"juncile","dative-genitive-indefinite-singular":"junci","dative-definite-genitive-singular":"juncii","dative-genitive-indefinite-plural":"junci","dative-definite-genitive-plural":"juncilor","singular-vocative":"juncă","plural-vocative":"juncilor"}},{"word":"Juncă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Juncă"}},{"word":"juncălău","pos":"noun","definitions":["an older bullock"],"forms":{"plural":"juncălăi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"juncălău","accusative-definite-nominative-singular":"juncălăuul","accusative-indefinite-nominative-plural":"juncălăi","accusative-definite-nominative-plural":"juncălăii","dative-genitive-indefinite-singular":"juncălău","dative-definite-genitive-singular":"juncălăuului","dative-genitive-indefinite-plural":"juncălăi","dative-definite-genitive-plural":"juncălăilor","singular-vocative":"juncălăuule","plural-vocative":"juncălăilor"}},{"word":"juncănaș","pos":"noun","definitions":["diminutive of juncan; small steer"],"forms":{"plural":"juncănași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"juncănaș","accusative-definite-nominative-singular":"juncănașul","accusative-indefinite-nominative-plural":"juncănași","accusative-definite-nominative-plural":"juncănașii","dative-genitive-indefinite-singular":"juncănaș","dative-definite-genitive-singular":"juncănașului","dative-genitive-indefinite-plural":"juncănași","dative-definite-genitive-plural":"juncănașilor","singular-vocative":"juncănașule","plural-vocative":"juncănașilor"}},{"word":"juncănel","pos":"noun","definitions":["diminutive of juncan"],"forms":{"plural":"juncănei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"juncănel","accusative-definite-nominative-singular":"juncănelul","accusative-indefinite-nominative-plural":"juncănei","accusative-definite-nominative-plural":"juncăneii","dative-genitive-indefinite-singular":"juncănel","dative-definite-genitive-singular":"juncănelului","dative-genitive-indefinite-plural":"juncănei","dative-definite-genitive-plural":"juncăneilor","singular-vocative":"juncănelule","plural-vocative":"juncăneilor"}},{"word":"junci","pos":"noun","definitions":["plural of juncă"],"gender":"f-p"},{"word":"junctură","pos":"noun","definitions":["junction"],"forms":{"plural":"juncturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"junctură","accusative-definite-nominative-singular":"junctura","accusative-indefinite-nominative-plural":"juncturi","accusative-definite-nominative-plural":"juncturile","dative-genitive-indefinite-singular":"juncturi","dative-definite-genitive-singular":"juncturii","dative-genitive-indefinite-plural":"juncturi","dative-definite-genitive-plural":"juncturilor","singular-vocative":"junctură","plural-vocative":"juncturilor"}},{"word":"junculean","pos":"noun","definitions":["diminutive of junc"],"forms":{"plural":"junculeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"junculean","accusative-definite-nominative-singular":"junculeanul","accusative-indefinite-nominative-plural":"junculeni","accusative-definite-nominative-plural":"junculenii","dative-genitive-indefinite-singular":"junculean","dative-definite-genitive-singular":"junculeanului","dative-genitive-indefinite-plural":"junculeni","dative-definite-genitive-plural":"junculenilor","singular-vocative":"junculeanule","plural-vocative":"junculenilor"}},{"word":"juncușor","pos":"noun","definitions":["diminutive of junc"],"forms":{"plural":"juncușori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"juncușor","accusative-definite-nominative-singular":"juncușorul","accusative-indefinite-nominative-plural":"juncușori","accusative-definite-nominative-plural":"juncușorii","dative-genitive-indefinite-singular":"juncușor","dative-definite-genitive-singular":"juncușorului","dative-genitive-indefinite-plural":"juncușori","dative-definite-genitive-plural":"juncușorilor","singular-vocative":"juncușorule","plural-vocative":"juncușorilor"}},{"word":"juncuț","pos":"noun","definitions":["diminutive of junc"],"forms":{"plural":"juncuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"juncuț","accusative-definite-nominative-singular":"juncuțul","accusative-indefinite-nominative-plural":"juncuți","accusative-definite-nominative-plural":"juncuții","dative-genitive-indefinite-singular":"juncuț","dative-definite-genitive-singular":"juncuțului","dative-genitive-indefinite-plural":"juncuți","dative-definite-genitive-plural":"juncuților","singular-vocative":"juncuțule","plural-vocative":"juncuților"}},{"word":"juncuță","pos":"noun","definitions":["diminutive of juncă; small heifer"],"forms":{"plural":"juncuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"juncuță","accusative-definite-nominative-singular":"juncuța","accusative-indefinite-nominative-plural":"juncuțe","accusative-definite-nominative-plural":"juncuțele","dative-genitive-indefinite-singular":"juncuțe","dative-definite-genitive-singular":"juncuței","dative-genitive-indefinite-plural":"juncuțe","dative-definite-genitive-plural":"juncuțelor","singular-vocative":"juncuță","plural-vocative":"juncuțelor"}},{"word":"june","pos":"adj","definitions":["young"],"pronunciation":"/ˈʒu.ne/","forms":{"feminine-singular":"jună","masculine-plural":"juni","feminine-neuter-plural":"june","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"june","error-unrecognized-form-feminine-indefinite-singular":"jună","error-unrecognized-form-indefinite-masculine-plural":"juni","error-unrecognized-form-feminine-indefinite-neuter-plural":"june","definite-error-unrecognized-form-masculine-neuter-singular":"junele","definite-error-unrecognized-form-feminine-singular":"juna","definite-error-unrecognized-form-masculine-plural":"junii","definite-error-unrecognized-form-feminine-neuter-plural":"junele"}},{"word":"june","pos":"noun","definitions":["youth, young man, bachelor"],"pronunciation":"/ˈʒu.ne/","forms":{"plural":"juni","table-tags":"no-table-tags","inflection-template":"ro-noun-m-e","accusative-indefinite-nominative-singular":"june","accusative-definite-nominative-singular":"junele","accusative-indefinite-nominative-plural":"juni","accusative-definite-nominative-plural":"junii","dative-genitive-indefinite-singular":"june","dative-definite-genitive-singular":"junelui","dative-genitive-indefinite-plural":"juni","dative-definite-genitive-plural":"junilor","singular-vocative":"june","plural-vocative":"junilor"}},{"word":"June","pos":"name","definitions":["a surname"],"pronunciation":"/ˈʒu.ne/","gender":"m","forms":{"dative-genitive":"lui June"}},{"word":"june prim","pos":"noun","definitions":["jeune premier"],"forms":{"plural":"juni primi"}},{"word":"junecuț","pos":"noun","definitions":["diminutive of june"],"forms":{"plural":"junecuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"junecuț","accusative-definite-nominative-singular":"junecuțul","accusative-indefinite-nominative-plural":"junecuți","accusative-definite-nominative-plural":"junecuții","dative-genitive-indefinite-singular":"junecuț","dative-definite-genitive-singular":"junecuțului","dative-genitive-indefinite-plural":"junecuți","dative-definite-genitive-plural":"junecuților","singular-vocative":"junecuțule","plural-vocative":"junecuților"}},{"word":"junel","pos":"noun","definitions":["diminutive of june"],"forms":{"plural":"junei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"junel","accusative-definite-nominative-singular":"junelul","accusative-indefinite-nominative-plural":"junei","accusative-definite-nominative-plural":"juneii","dative-genitive-indefinite-singular":"junel","dative-definite-genitive-singular":"junelului","dative-genitive-indefinite-plural":"junei","dative-definite-genitive-plural":"juneilor","singular-vocative":"junelule","plural-vocative":"juneilor"}},{"word":"junelaș","pos":"noun","definitions":["diminutive of junel"],"forms":{"plural":"junelași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"junelaș","accusative-definite-nominative-singular":"junelașul","accusative-indefinite-nominative-plural":"junelași","accusative-definite-nominative-plural":"junelașii","dative-genitive-indefinite-singular":"junelaș","dative-definite-genitive-singular":"junelașului","dative-genitive-indefinite-plural":"junelași","dative-definite-genitive-plural":"junelașilor","singular-vocative":"junelașule","plural-vocative":"junelașilor"}},{"word":"juneță","pos":"noun","definitions":["obsolete form of junețe"],"forms":{"plural":"juneți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"juneță","accusative-definite-nominative-singular":"juneța","accusative-indefinite-nominative-plural":"juneți","accusative-definite-nominative-plural":"junețile","dative-genitive-indefinite-singular":"juneți","dative-definite-genitive-singular":"juneții","dative-genitive-indefinite-plural":"juneți","dative-definite-genitive-plural":"juneților","singular-vocative":"juneță","plural-vocative":"juneților"}},{"word":"junețe","pos":"noun","definitions":["youth"],"forms":{"plural":"juneți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"junețe","accusative-definite-nominative-singular":"junețea","accusative-indefinite-nominative-plural":"juneți","accusative-definite-nominative-plural":"junețile","dative-genitive-indefinite-singular":"juneți","dative-definite-genitive-singular":"juneții","dative-genitive-indefinite-plural":"juneți","dative-definite-genitive-plural":"juneților","singular-vocative":"junețe","plural-vocative":"juneților"}},{"word":"jungher","pos":"noun","definitions":["dagger"],"forms":{"plural":"junghere"}},{"word":"junghet","pos":"noun","definitions":["smile"],"forms":{"plural":"junghete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"junghet","accusative-definite-nominative-singular":"junghetul","accusative-indefinite-nominative-plural":"junghete","accusative-definite-nominative-plural":"junghetele","dative-genitive-indefinite-singular":"junghet","dative-definite-genitive-singular":"junghetului","dative-genitive-indefinite-plural":"junghete","dative-definite-genitive-plural":"junghetelor","singular-vocative":"junghetule","plural-vocative":"junghetelor"}},{"word":"junghetură","pos":"noun","definitions":["obsolete form of junghietură"],"forms":{"plural":"jungheturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"junghetură","accusative-definite-nominative-singular":"junghetura","accusative-indefinite-nominative-plural":"jungheturi","accusative-definite-nominative-plural":"jungheturile","dative-genitive-indefinite-singular":"jungheturi","dative-definite-genitive-singular":"jungheturii","dative-genitive-indefinite-plural":"jungheturi","dative-definite-genitive-plural":"jungheturilor","singular-vocative":"junghetură","plural-vocative":"jungheturilor"}},{"word":"junghi","pos":"noun","definitions":["twinge, shooting; a sharp or piercing pain of short duration, especially in the ribs, back, or chest","a dagger"],"forms":{"plural":"junghiuri","alternative":"junghiu"}},{"word":"junghia","pos":"verb","definitions":["synonym of înjunghia (“to stab”)"],"forms":{"canonical":"a junghia 1st conjugation","present-singular-third-person":"junghie","participle-past":"junghiat","subjunctive-third-person":"junghie","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a junghia","gerund":"junghiind","first-person-indicative-present-singular":"junghii","indicative-present-second-person-singular":"junghii","indicative-present-singular-third-person":"junghie","first-person-indicative-plural-present":"junghiem","indicative-plural-present-second-person":"junghiați","indicative-plural-present-third-person":"junghie","first-person-imperfect-indicative-singular":"junghiam","imperfect-indicative-second-person-singular":"junghiai","imperfect-indicative-singular-third-person":"junghia","first-person-imperfect-indicative-plural":"junghiam","imperfect-indicative-plural-second-person":"junghiați","imperfect-indicative-plural-third-person":"junghiau","first-person-indicative-perfect-singular":"junghiai","indicative-perfect-second-person-singular":"junghiași","indicative-perfect-singular-third-person":"junghie","first-person-indicative-perfect-plural":"junghiarăm","indicative-perfect-plural-second-person":"junghiarăți","indicative-perfect-plural-third-person":"junghiară","first-person-indicative-pluperfect-singular":"junghiasem","indicative-pluperfect-second-person-singular":"junghiaseși","indicative-pluperfect-singular-third-person":"junghiase","first-person-indicative-pluperfect-plural":"junghiaserăm","indicative-pluperfect-plural-second-person":"junghiaserăți","indicative-pluperfect-plural-third-person":"junghiaseră","first-person-present-singular-subjunctive":"să junghii","present-second-person-singular-subjunctive":"să junghii","present-singular-subjunctive-third-person":"să junghie","first-person-plural-present-subjunctive":"să junghiem","plural-present-second-person-subjunctive":"să junghiați","plural-present-subjunctive-third-person":"să junghie","imperative-second-person-singular":"junghie","imperative-plural-second-person":"junghiați","imperative-negative-second-person-singular":"nu junghia","imperative-negative-plural-second-person":"nu junghiați"}},{"word":"junghiere","pos":"noun","definitions":["a stabbing"],"forms":{"plural":"junghieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"junghiere","accusative-definite-nominative-singular":"junghierea","accusative-indefinite-nominative-plural":"junghieri","accusative-definite-nominative-plural":"junghierile","dative-genitive-indefinite-singular":"junghieri","dative-definite-genitive-singular":"junghierii","dative-genitive-indefinite-plural":"junghieri","dative-definite-genitive-plural":"junghierilor","singular-vocative":"junghiere","plural-vocative":"junghierilor"}},{"word":"junghietor","pos":"adj","definitions":["stabbing"],"forms":{"feminine-singular":"junghietoare","masculine-plural":"junghietori","feminine-neuter-plural":"junghietoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"junghietor","error-unrecognized-form-feminine-indefinite-singular":"junghietoare","error-unrecognized-form-indefinite-masculine-plural":"junghietori","error-unrecognized-form-feminine-indefinite-neuter-plural":"junghietoare","definite-error-unrecognized-form-masculine-neuter-singular":"junghietorul","definite-error-unrecognized-form-feminine-singular":"junghietoarea","definite-error-unrecognized-form-masculine-plural":"junghietorii","definite-error-unrecognized-form-feminine-neuter-plural":"junghietoarele"}},{"word":"junghietură","pos":"noun","definitions":["nape","victim","sacrificed animal","stabbing","killing"],"forms":{"plural":"junghieturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"junghietură","accusative-definite-nominative-singular":"junghietura","accusative-indefinite-nominative-plural":"junghieturi","accusative-definite-nominative-plural":"junghieturile","dative-genitive-indefinite-singular":"junghieturi","dative-definite-genitive-singular":"junghieturii","dative-genitive-indefinite-plural":"junghieturi","dative-definite-genitive-plural":"junghieturilor","singular-vocative":"junghietură","plural-vocative":"junghieturilor","alternative":"junghetură"}},{"word":"junghiuleț","pos":"noun","definitions":["diminutive of junghi"],"forms":{"plural":"junghiulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"junghiuleț","accusative-definite-nominative-singular":"junghiulețul","accusative-indefinite-nominative-plural":"junghiulețe","accusative-definite-nominative-plural":"junghiulețele","dative-genitive-indefinite-singular":"junghiuleț","dative-definite-genitive-singular":"junghiulețului","dative-genitive-indefinite-plural":"junghiulețe","dative-definite-genitive-plural":"junghiulețelor","singular-vocative":"junghiulețule","plural-vocative":"junghiulețelor"}},{"word":"jungla","pos":"noun","definitions":["definite nominative/accusative singular of junglă"],"pronunciation":"[ˈʒuŋɡla]","gender":"f"},{"word":"junglă","pos":"noun","definitions":["jungle"],"forms":{"plural":"jungle","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"junglă","accusative-definite-nominative-singular":"jungla","accusative-indefinite-nominative-plural":"jungle","accusative-definite-nominative-plural":"junglele","dative-genitive-indefinite-singular":"jungle","dative-definite-genitive-singular":"junglei","dative-genitive-indefinite-plural":"jungle","dative-definite-genitive-plural":"junglelor","singular-vocative":"junglă","plural-vocative":"junglelor"}},{"word":"jungle","pos":"noun","definitions":["inflection of junglă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈʒuŋɡle]","gender":"f"},{"word":"junică","pos":"noun","definitions":["obsolete form of junincă"],"forms":{"plural":"junici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"junică","accusative-definite-nominative-singular":"junica","accusative-indefinite-nominative-plural":"junici","accusative-definite-nominative-plural":"junicile","dative-genitive-indefinite-singular":"junici","dative-definite-genitive-singular":"junicii","dative-genitive-indefinite-plural":"junici","dative-definite-genitive-plural":"junicilor","singular-vocative":"junică","plural-vocative":"junicilor"}},{"word":"junice","pos":"noun","definitions":["obsolete form of junincă"],"forms":{"plural":"junici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"junice","accusative-definite-nominative-singular":"junicea","accusative-indefinite-nominative-plural":"junici","accusative-definite-nominative-plural":"junicile","dative-genitive-indefinite-singular":"junici","dative-definite-genitive-singular":"junicii","dative-genitive-indefinite-plural":"junici","dative-definite-genitive-plural":"junicilor","singular-vocative":"junice","plural-vocative":"junicilor"}},{"word":"junie","pos":"noun","definitions":["youth"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"junie","accusative-definite-nominative":"junia","dative-genitive-indefinite":"junii","dative-definite-genitive":"juniei","vocative":"junie"}},{"word":"junigaș","pos":"noun","definitions":["diminutive of june"],"forms":{"plural":"junigași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"junigaș","accusative-definite-nominative-singular":"junigașul","accusative-indefinite-nominative-plural":"junigași","accusative-definite-nominative-plural":"junigașii","dative-genitive-indefinite-singular":"junigaș","dative-definite-genitive-singular":"junigașului","dative-genitive-indefinite-plural":"junigași","dative-definite-genitive-plural":"junigașilor","singular-vocative":"junigașule","plural-vocative":"junigașilor"}},{"word":"junime","pos":"noun","definitions":["youth (part of life)"],"forms":{"plural":"junimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"junime","accusative-definite-nominative-singular":"junimea","accusative-indefinite-nominative-plural":"junimi","accusative-definite-nominative-plural":"junimile","dative-genitive-indefinite-singular":"junimi","dative-definite-genitive-singular":"junimii","dative-genitive-indefinite-plural":"junimi","dative-definite-genitive-plural":"junimilor","singular-vocative":"junime","plural-vocative":"junimilor"}},{"word":"junimea","pos":"noun","definitions":["definite nominative/accusative singular of junime"],"gender":"f"},{"word":"junimism","pos":"noun","definitions":["a literary movement in 19th century Romania"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"junimism","accusative-definite-nominative":"junimismul","dative-genitive-indefinite":"junimism","dative-definite-genitive":"junimismului","vocative":"junimismule"}},{"word":"junimistă","pos":"noun","definitions":["female equivalent of junimist"],"forms":{"plural":"junimiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"junimistă","accusative-definite-nominative-singular":"junimista","accusative-indefinite-nominative-plural":"junimiste","accusative-definite-nominative-plural":"junimistele","dative-genitive-indefinite-singular":"junimiste","dative-definite-genitive-singular":"junimistei","dative-genitive-indefinite-plural":"junimiste","dative-definite-genitive-plural":"junimistelor","singular-vocative":"junimistă","plural-vocative":"junimistelor"}},{"word":"junincă","pos":"noun","definitions":["heifer, young female calf"],"forms":{"plural":"juninci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"junincă","accusative-definite-nominative-singular":"juninca","accusative-indefinite-nominative-plural":"juninci","accusative-definite-nominative-plural":"junincile","dative-genitive-indefinite-singular":"juninci","dative-definite-genitive-singular":"junincii","dative-genitive-indefinite-plural":"juninci","dative-definite-genitive-plural":"junincilor","singular-vocative":"junincă","plural-vocative":"junincilor","alternative":"junice"}},{"word":"junincea","pos":"noun","definitions":["diminutive of junincă"],"forms":{"plural":"junincele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"junincea","accusative-definite-nominative-singular":"juninceaua","accusative-indefinite-nominative-plural":"junincele","accusative-definite-nominative-plural":"junincelele","dative-genitive-indefinite-singular":"junincele","dative-definite-genitive-singular":"junincelei","dative-genitive-indefinite-plural":"junincele","dative-definite-genitive-plural":"junincelelor","singular-vocative":"junincea","plural-vocative":"junincelelor"}},{"word":"junincuță","pos":"noun","definitions":["diminutive of junincă"],"forms":{"plural":"junincuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"junincuță","accusative-definite-nominative-singular":"junincuța","accusative-indefinite-nominative-plural":"junincuțe","accusative-definite-nominative-plural":"junincuțele","dative-genitive-indefinite-singular":"junincuțe","dative-definite-genitive-singular":"junincuței","dative-genitive-indefinite-plural":"junincuțe","dative-definite-genitive-plural":"junincuțelor","singular-vocative":"junincuță","plural-vocative":"junincuțelor"}},{"word":"junioară","pos":"noun","definitions":["female equivalent of junior"],"forms":{"plural":"junioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"junioară","accusative-definite-nominative-singular":"junioara","accusative-indefinite-nominative-plural":"junioare","accusative-definite-nominative-plural":"junioarele","dative-genitive-indefinite-singular":"junioare","dative-definite-genitive-singular":"junioarei","dative-genitive-indefinite-plural":"junioare","dative-definite-genitive-plural":"junioarelor","singular-vocative":"junioară","plural-vocative":"junioarelor"}},{"word":"junior","pos":"adj","definitions":["junior"],"forms":{"feminine-singular":"junioră","masculine-plural":"juniori","feminine-neuter-plural":"juniore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"junior","error-unrecognized-form-feminine-indefinite-singular":"junioră","error-unrecognized-form-indefinite-masculine-plural":"juniori","error-unrecognized-form-feminine-indefinite-neuter-plural":"juniore","definite-error-unrecognized-form-masculine-neuter-singular":"juniorul","definite-error-unrecognized-form-feminine-singular":"juniora","definite-error-unrecognized-form-masculine-plural":"juniorii","definite-error-unrecognized-form-feminine-neuter-plural":"juniorele"}},{"word":"junior","pos":"noun","definitions":["junior"],"forms":{"plural":"juniori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"junior","accusative-definite-nominative-singular":"juniorul","accusative-indefinite-nominative-plural":"juniori","accusative-definite-nominative-plural":"juniorii","dative-genitive-indefinite-singular":"junior","dative-definite-genitive-singular":"juniorului","dative-genitive-indefinite-plural":"juniori","dative-definite-genitive-plural":"juniorilor","singular-vocative":"juniorule","plural-vocative":"juniorilor"}},{"word":"juniorat","pos":"noun","definitions":["teenagehood"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"juniorat","accusative-definite-nominative":"junioratul","dative-genitive-indefinite":"juniorat","dative-definite-genitive":"junioratului","vocative":"junioratule"}},{"word":"junișan","pos":"noun","definitions":["bachelor"],"forms":{"plural":"junișani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"junișan","accusative-definite-nominative-singular":"junișanul","accusative-indefinite-nominative-plural":"junișani","accusative-definite-nominative-plural":"junișanii","dative-genitive-indefinite-singular":"junișan","dative-definite-genitive-singular":"junișanului","dative-genitive-indefinite-plural":"junișani","dative-definite-genitive-plural":"junișanilor","singular-vocative":"junișanule","plural-vocative":"junișanilor"}},{"word":"junișor","pos":"noun","definitions":["diminutive of june"],"forms":{"plural":"junișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"junișor","accusative-definite-nominative-singular":"junișorul","accusative-indefinite-nominative-plural":"junișori","accusative-definite-nominative-plural":"junișorii","dative-genitive-indefinite-singular":"junișor","dative-definite-genitive-singular":"junișorului","dative-genitive-indefinite-plural":"junișori","dative-definite-genitive-plural":"junișorilor","singular-vocative":"junișorule","plural-vocative":"junișorilor"}},{"word":"junt","pos":"noun","definitions":["gun, firearm"],"forms":{"plural":"junturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"junt","accusative-definite-nominative-singular":"juntul","accusative-indefinite-nominative-plural":"junturi","accusative-definite-nominative-plural":"junturile","dative-genitive-indefinite-singular":"junt","dative-definite-genitive-singular":"juntului","dative-genitive-indefinite-plural":"junturi","dative-definite-genitive-plural":"junturilor","singular-vocative":"juntule","plural-vocative":"junturilor"}},{"word":"juntă","pos":"noun","definitions":["junta"],"forms":{"plural":"junte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"juntă","accusative-definite-nominative-singular":"junta","accusative-indefinite-nominative-plural":"junte","accusative-definite-nominative-plural":"juntele","dative-genitive-indefinite-singular":"junte","dative-definite-genitive-singular":"juntei","dative-genitive-indefinite-plural":"junte","dative-definite-genitive-plural":"juntelor","singular-vocative":"juntă","plural-vocative":"juntelor"}},{"word":"jupan","pos":"noun","definitions":["medieval title in Wallachia and Moldavia"],"forms":{"plural":"jupani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jupan","accusative-definite-nominative-singular":"jupanul","accusative-indefinite-nominative-plural":"jupani","accusative-definite-nominative-plural":"jupanii","dative-genitive-indefinite-singular":"jupan","dative-definite-genitive-singular":"jupanului","dative-genitive-indefinite-plural":"jupani","dative-definite-genitive-plural":"jupanilor","singular-vocative":"jupanule","plural-vocative":"jupanilor"}},{"word":"Jupani","pos":"name","definitions":["a village in Traian Vuia, Timiș County, Romania"],"gender":"m"},{"word":"jupaniță","pos":"noun","definitions":["wife of a jupan"],"forms":{"plural":"jupanițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jupaniță","accusative-definite-nominative-singular":"jupanița","accusative-indefinite-nominative-plural":"jupanițe","accusative-definite-nominative-plural":"jupanițele","dative-genitive-indefinite-singular":"jupanițe","dative-definite-genitive-singular":"jupaniței","dative-genitive-indefinite-plural":"jupanițe","dative-definite-genitive-plural":"jupanițelor","singular-vocative":"jupaniță","plural-vocative":"jupanițelor"}},{"word":"jupă","pos":"noun","definitions":["skirt"],"pronunciation":"/ˈʒu.pə/","forms":{"plural":"jupe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jupă","accusative-definite-nominative-singular":"jupa","accusative-indefinite-nominative-plural":"jupe","accusative-definite-nominative-plural":"jupele","dative-genitive-indefinite-singular":"jupe","dative-definite-genitive-singular":"jupei","dative-genitive-indefinite-plural":"jupe","dative-definite-genitive-plural":"jupelor","singular-vocative":"jupă","plural-vocative":"jupelor"}},{"word":"jupăitură","pos":"noun","definitions":["beating, punching"],"forms":{"plural":"jupăituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jupăitură","accusative-definite-nominative-singular":"jupăitura","accusative-indefinite-nominative-plural":"jupăituri","accusative-definite-nominative-plural":"jupăiturile","dative-genitive-indefinite-singular":"jupăituri","dative-definite-genitive-singular":"jupăiturii","dative-genitive-indefinite-plural":"jupăituri","dative-definite-genitive-plural":"jupăiturilor","singular-vocative":"jupăitură","plural-vocative":"jupăiturilor"}},{"word":"jupân","pos":"noun","definitions":["master (a courtesy title for a boy)"],"forms":{"plural":"jupâni","feminine":"equivalent jupâneasă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jupân","accusative-definite-nominative-singular":"jupânul","accusative-indefinite-nominative-plural":"jupâni","accusative-definite-nominative-plural":"jupânii","dative-genitive-indefinite-singular":"jupân","dative-definite-genitive-singular":"jupânului","dative-genitive-indefinite-plural":"jupâni","dative-definite-genitive-plural":"jupânilor","singular-vocative":"jupânule","plural-vocative":"jupânilor"}},{"word":"jupână","pos":"noun","definitions":["female equivalent of jupân"],"forms":{"plural":"jupâne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jupână","accusative-definite-nominative-singular":"jupâna","accusative-indefinite-nominative-plural":"jupâne","accusative-definite-nominative-plural":"jupânele","dative-genitive-indefinite-singular":"jupâne","dative-definite-genitive-singular":"jupânei","dative-genitive-indefinite-plural":"jupâne","dative-definite-genitive-plural":"jupânelor","singular-vocative":"jupână","plural-vocative":"jupânelor"}},{"word":"jupâneasa","pos":"noun","definitions":["definite nominative/accusative singular of jupâneasă"]},{"word":"Jupâneasa","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Bănița"],"gender":"f"},{"word":"jupâneasă","pos":"noun","definitions":["female equivalent of jupân"],"forms":{"plural":"jupânese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jupâneasă","accusative-definite-nominative-singular":"jupâneasa","accusative-indefinite-nominative-plural":"jupânese","accusative-definite-nominative-plural":"jupânesele","dative-genitive-indefinite-singular":"jupânese","dative-definite-genitive-singular":"jupânesei","dative-genitive-indefinite-plural":"jupânese","dative-definite-genitive-plural":"jupâneselor","singular-vocative":"jupâneasă","plural-vocative":"jupâneselor"}},{"word":"jupâneșică","pos":"noun","definitions":["diminutive of jupâneasă; small female master"],"forms":{"plural":"jupâneșele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jupâneșică","accusative-definite-nominative-singular":"jupâneșica","accusative-indefinite-nominative-plural":"jupâneșice","accusative-definite-nominative-plural":"jupâneșicele","dative-genitive-indefinite-singular":"jupâneșice","dative-definite-genitive-singular":"jupâneșicei","dative-genitive-indefinite-plural":"jupâneșice","dative-definite-genitive-plural":"jupâneșicelor","singular-vocative":"jupâneșică","plural-vocative":"jupâneșicelor"}},{"word":"Jupânești","pos":"name","definitions":["a village in Coșești, Argeș County, Romania","a commune of Gorj County, Romania","a village in Jupânești, Gorj County, Romania","a village in Cireșu, Mehedinți County, Romania","a village in Făget, Timiș County, Romania"],"gender":"m"},{"word":"jupâniță","pos":"noun","definitions":["female equivalent of jupân"],"forms":{"plural":"jupânițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jupâniță","accusative-definite-nominative-singular":"jupânița","accusative-indefinite-nominative-plural":"jupânițe","accusative-definite-nominative-plural":"jupânițele","dative-genitive-indefinite-singular":"jupânițe","dative-definite-genitive-singular":"jupâniței","dative-genitive-indefinite-plural":"jupânițe","dative-definite-genitive-plural":"jupânițelor","singular-vocative":"jupâniță","plural-vocative":"jupânițelor"}},{"word":"Jupânu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jupânu"}},{"word":"jupi","pos":"verb","definitions":["alternative form of jupui"],"forms":{"canonical":"a jupi 4th conjugation","present-singular-third-person":"jupește","participle-past":"jupit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jupi","gerund":"jupind","first-person-indicative-present-singular":"jupesc","indicative-present-second-person-singular":"jupești","indicative-present-singular-third-person":"jupește","first-person-indicative-plural-present":"jupim","indicative-plural-present-second-person":"jupiți","indicative-plural-present-third-person":"jupesc","first-person-imperfect-indicative-singular":"jupeam","imperfect-indicative-second-person-singular":"jupeai","imperfect-indicative-singular-third-person":"jupea","first-person-imperfect-indicative-plural":"jupeam","imperfect-indicative-plural-second-person":"jupeați","imperfect-indicative-plural-third-person":"jupeau","first-person-indicative-perfect-singular":"jupii","indicative-perfect-second-person-singular":"jupiși","indicative-perfect-singular-third-person":"jupi","first-person-indicative-perfect-plural":"jupirăm","indicative-perfect-plural-second-person":"jupirăți","indicative-perfect-plural-third-person":"jupiră","first-person-indicative-pluperfect-singular":"jupisem","indicative-pluperfect-second-person-singular":"jupiseși","indicative-pluperfect-singular-third-person":"jupise","first-person-indicative-pluperfect-plural":"jupiserăm","indicative-pluperfect-plural-second-person":"jupiserăți","indicative-pluperfect-plural-third-person":"jupiseră","first-person-present-singular-subjunctive":"să jupesc","present-second-person-singular-subjunctive":"să jupești","present-singular-subjunctive-third-person":"să jupească","first-person-plural-present-subjunctive":"să jupim","plural-present-second-person-subjunctive":"să jupiți","plural-present-subjunctive-third-person":"să jupească","imperative-second-person-singular":"jupește","imperative-plural-second-person":"jupiți","imperative-negative-second-person-singular":"nu jupi","imperative-negative-plural-second-person":"nu jupiți"}},{"word":"jupire","pos":"noun","definitions":["alternative form of jupuire"],"forms":{"plural":"jupiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jupire","accusative-definite-nominative-singular":"jupirea","accusative-indefinite-nominative-plural":"jupiri","accusative-definite-nominative-plural":"jupirile","dative-genitive-indefinite-singular":"jupiri","dative-definite-genitive-singular":"jupirii","dative-genitive-indefinite-plural":"jupiri","dative-definite-genitive-plural":"jupirilor","singular-vocative":"jupire","plural-vocative":"jupirilor"}},{"word":"jupit","pos":"adj","definitions":["alternative form of jupuit"],"forms":{"feminine-singular":"jupită","masculine-plural":"jupiți","feminine-neuter-plural":"jupite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jupit","error-unrecognized-form-feminine-indefinite-singular":"jupită","error-unrecognized-form-indefinite-masculine-plural":"jupiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jupite","definite-error-unrecognized-form-masculine-neuter-singular":"jupitul","definite-error-unrecognized-form-feminine-singular":"jupita","definite-error-unrecognized-form-masculine-plural":"jupiții","definite-error-unrecognized-form-feminine-neuter-plural":"jupitele"}},{"word":"Jupiter","pos":"name","definitions":["Jupiter (planet)"],"gender":"m"},{"word":"jupitoare","pos":"noun","definitions":["female equivalent of jupitor"],"forms":{"plural":"jupitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"jupitoare","accusative-definite-nominative-singular":"jupitoarea","accusative-indefinite-nominative-plural":"jupitoare","accusative-definite-nominative-plural":"jupitoarele","dative-genitive-indefinite-singular":"jupitoare","dative-definite-genitive-singular":"jupitoarei","dative-genitive-indefinite-plural":"jupitoare","dative-definite-genitive-plural":"jupitoarelor","singular-vocative":"jupitoare","plural-vocative":"jupitoarelor"}},{"word":"jupitor","pos":"noun","definitions":["alternative form of jupuitor"],"forms":{"plural":"jupitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jupitor","accusative-definite-nominative-singular":"jupitorul","accusative-indefinite-nominative-plural":"jupitori","accusative-definite-nominative-plural":"jupitorii","dative-genitive-indefinite-singular":"jupitor","dative-definite-genitive-singular":"jupitorului","dative-genitive-indefinite-plural":"jupitori","dative-definite-genitive-plural":"jupitorilor","singular-vocative":"jupitorule","plural-vocative":"jupitorilor"}},{"word":"Jupînese","pos":"name","definitions":["a village in Hunedoara County, Romania. Renamed to Peștera in 1964."],"gender":"f-p"},{"word":"jupon","pos":"noun","definitions":["underskirt, petticoat, jupon"],"forms":{"plural":"jupoane"}},{"word":"jupui","pos":"verb","definitions":["to skin, to peel, to flay"],"pronunciation":"/ʒu.puˈi/","forms":{"canonical":"a jupui 4th conjugation","present-singular-third-person":"jupoaie","participle-past":"jupuit","subjunctive-third-person":"jupoaie","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a jupui","gerund":"jupuind","first-person-indicative-present-singular":"jupoi","indicative-present-second-person-singular":"jupoi","indicative-present-singular-third-person":"jupoaie","first-person-indicative-plural-present":"jupuim","indicative-plural-present-second-person":"jupuiți","indicative-plural-present-third-person":"jupoaie","first-person-imperfect-indicative-singular":"jupuiam","imperfect-indicative-second-person-singular":"jupuiai","imperfect-indicative-singular-third-person":"jupuia","first-person-imperfect-indicative-plural":"jupuiam","imperfect-indicative-plural-second-person":"jupuiați","imperfect-indicative-plural-third-person":"jupuiau","first-person-indicative-perfect-singular":"jupuii","indicative-perfect-second-person-singular":"jupuiși","indicative-perfect-singular-third-person":"jupui","first-person-indicative-perfect-plural":"jupuirăm","indicative-perfect-plural-second-person":"jupuirăți","indicative-perfect-plural-third-person":"jupuiră","first-person-indicative-pluperfect-singular":"jupuisem","indicative-pluperfect-second-person-singular":"jupuiseși","indicative-pluperfect-singular-third-person":"jupuise","first-person-indicative-pluperfect-plural":"jupuiserăm","indicative-pluperfect-plural-second-person":"jupuiserăți","indicative-pluperfect-plural-third-person":"jupuiseră","first-person-present-singular-subjunctive":"să jupoi","present-second-person-singular-subjunctive":"să jupoi","present-singular-subjunctive-third-person":"să jupoaie","first-person-plural-present-subjunctive":"să jupuim","plural-present-second-person-subjunctive":"să jupuiți","plural-present-subjunctive-third-person":"să jupoaie","imperative-second-person-singular":"jupoaie","imperative-plural-second-person":"jupuiți","imperative-negative-second-person-singular":"nu jupui","imperative-negative-plural-second-person":"nu jupuiți","alternative":"jupi"}},{"word":"jupuială","pos":"noun","definitions":["excoriation"],"forms":{"plural":"jupuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jupuială","accusative-definite-nominative-singular":"jupuiala","accusative-indefinite-nominative-plural":"jupuieli","accusative-definite-nominative-plural":"jupuielile","dative-genitive-indefinite-singular":"jupuieli","dative-definite-genitive-singular":"jupuielii","dative-genitive-indefinite-plural":"jupuieli","dative-definite-genitive-plural":"jupuielilor","singular-vocative":"jupuială","plural-vocative":"jupuielilor"}},{"word":"jupuire","pos":"noun","definitions":["skinning"],"forms":{"plural":"jupuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jupuire","accusative-definite-nominative-singular":"jupuirea","accusative-indefinite-nominative-plural":"jupuiri","accusative-definite-nominative-plural":"jupuirile","dative-genitive-indefinite-singular":"jupuiri","dative-definite-genitive-singular":"jupuirii","dative-genitive-indefinite-plural":"jupuiri","dative-definite-genitive-plural":"jupuirilor","singular-vocative":"jupuire","plural-vocative":"jupuirilor"}},{"word":"jupuit","pos":"adj","definitions":["skinned"],"forms":{"feminine-singular":"jupuită","masculine-plural":"jupuiți","feminine-neuter-plural":"jupuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jupuit","error-unrecognized-form-feminine-indefinite-singular":"jupuită","error-unrecognized-form-indefinite-masculine-plural":"jupuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jupuite","definite-error-unrecognized-form-masculine-neuter-singular":"jupuitul","definite-error-unrecognized-form-feminine-singular":"jupuita","definite-error-unrecognized-form-masculine-plural":"jupuiții","definite-error-unrecognized-form-feminine-neuter-plural":"jupuitele"}},{"word":"jupuitoare","pos":"noun","definitions":["female equivalent of jupuitor"],"forms":{"plural":"jupuitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"jupuitoare","accusative-definite-nominative-singular":"jupuitoarea","accusative-indefinite-nominative-plural":"jupuitoare","accusative-definite-nominative-plural":"jupuitoarele","dative-genitive-indefinite-singular":"jupuitoare","dative-definite-genitive-singular":"jupuitoarei","dative-genitive-indefinite-plural":"jupuitoare","dative-definite-genitive-plural":"jupuitoarelor","singular-vocative":"jupuitoare","plural-vocative":"jupuitoarelor"}},{"word":"jupuitor","pos":"noun","definitions":["flayer"],"forms":{"plural":"jupuitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jupuitor","accusative-definite-nominative-singular":"jupuitorul","accusative-indefinite-nominative-plural":"jupuitori","accusative-definite-nominative-plural":"jupuitorii","dative-genitive-indefinite-singular":"jupuitor","dative-definite-genitive-singular":"jupuitorului","dative-genitive-indefinite-plural":"jupuitori","dative-definite-genitive-plural":"jupuitorilor","singular-vocative":"jupuitorule","plural-vocative":"jupuitorilor"}},{"word":"jupuitură","pos":"noun","definitions":["scratch"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"jupuitură","accusative-definite-nominative":"jupuitura","dative-genitive-indefinite":"jupuiture","dative-definite-genitive":"jupuiturei","vocative":"jupuitură"}},{"word":"jur","pos":"noun","definitions":["surroundings, vicinity"],"pronunciation":"/ʒur/","forms":{"plural":"jururi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jur","accusative-definite-nominative-singular":"jurul","accusative-indefinite-nominative-plural":"jururi","accusative-definite-nominative-plural":"jururile","dative-genitive-indefinite-singular":"jur","dative-definite-genitive-singular":"jurului","dative-genitive-indefinite-plural":"jururi","dative-definite-genitive-plural":"jururilor","singular-vocative":"jurule","plural-vocative":"jururilor"}},{"word":"jur","pos":"noun","definitions":["oath"],"pronunciation":"/ʒur/","forms":{"plural":"jururi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jur","accusative-definite-nominative-singular":"jurul","accusative-indefinite-nominative-plural":"jururi","accusative-definite-nominative-plural":"jururile","dative-genitive-indefinite-singular":"jur","dative-definite-genitive-singular":"jurului","dative-genitive-indefinite-plural":"jururi","dative-definite-genitive-plural":"jururilor","singular-vocative":"jurule","plural-vocative":"jururilor"}},{"word":"jur","pos":"verb","definitions":["first-person singular present indicative/subjunctive of jura"],"pronunciation":"/ʒur/"},{"word":"jura","pos":"verb","definitions":["to swear; to vow","to swear up and down"],"pronunciation":"/ʒuˈra/","forms":{"canonical":"a jura 1st conjugation","present-singular-third-person":"jură","participle-past":"jurat","subjunctive-third-person":"jure","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a jura","gerund":"jurând","first-person-indicative-present-singular":"jur","indicative-present-second-person-singular":"juri","indicative-present-singular-third-person":"jură","first-person-indicative-plural-present":"jurăm","indicative-plural-present-second-person":"jurați","indicative-plural-present-third-person":"jură","first-person-imperfect-indicative-singular":"juram","imperfect-indicative-second-person-singular":"jurai","imperfect-indicative-singular-third-person":"jura","first-person-imperfect-indicative-plural":"juram","imperfect-indicative-plural-second-person":"jurați","imperfect-indicative-plural-third-person":"jurau","first-person-indicative-perfect-singular":"jurai","indicative-perfect-second-person-singular":"jurași","indicative-perfect-singular-third-person":"jură","first-person-indicative-perfect-plural":"jurarăm","indicative-perfect-plural-second-person":"jurarăți","indicative-perfect-plural-third-person":"jurară","first-person-indicative-pluperfect-singular":"jurasem","indicative-pluperfect-second-person-singular":"juraseși","indicative-pluperfect-singular-third-person":"jurase","first-person-indicative-pluperfect-plural":"juraserăm","indicative-pluperfect-plural-second-person":"juraserăți","indicative-pluperfect-plural-third-person":"juraseră","first-person-present-singular-subjunctive":"să jur","present-second-person-singular-subjunctive":"să juri","present-singular-subjunctive-third-person":"să jure","first-person-plural-present-subjunctive":"să jurăm","plural-present-second-person-subjunctive":"să jurați","plural-present-subjunctive-third-person":"să jure","imperative-second-person-singular":"jură","imperative-plural-second-person":"jurați","imperative-negative-second-person-singular":"nu jura","imperative-negative-plural-second-person":"nu jurați"}},{"word":"Jura","pos":"name","definitions":["a village in Jura, Transnistria, Moldova","a commune of Transnistria, Moldova"],"gender":"f"},{"word":"jurai","pos":"verb","definitions":["inflection of jura:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[ʒuˈraj]"},{"word":"juram","pos":"verb","definitions":["first-person singular/plural imperfect indicative of jura"],"pronunciation":"[ʒuˈram]"},{"word":"jurare","pos":"noun","definitions":["swearing, vowing"],"pronunciation":"/ʒuˈra.re/","forms":{"plural":"jurări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jurare","accusative-definite-nominative-singular":"jurarea","accusative-indefinite-nominative-plural":"jurări","accusative-definite-nominative-plural":"jurările","dative-genitive-indefinite-singular":"jurări","dative-definite-genitive-singular":"jurării","dative-genitive-indefinite-plural":"jurări","dative-definite-genitive-plural":"jurărilor","singular-vocative":"jurare","plural-vocative":"jurărilor"}},{"word":"jurase","pos":"verb","definitions":["third-person singular pluperfect indicative of jura"],"pronunciation":"[ʒuˈrase]"},{"word":"jurasic","pos":"noun","definitions":["Jurassic"],"forms":{"plural":"jurasici","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jurasic","accusative-definite-nominative-singular":"jurasicul","accusative-indefinite-nominative-plural":"jurasici","accusative-definite-nominative-plural":"jurasicile","dative-genitive-indefinite-singular":"jurasic","dative-definite-genitive-singular":"jurasicului","dative-genitive-indefinite-plural":"jurasici","dative-definite-genitive-plural":"jurasicilor","singular-vocative":"jurasicule","plural-vocative":"jurasicilor"}},{"word":"jurat","pos":"verb","definitions":["vowed, swore","past participle of jura"],"pronunciation":"/ʒuˈrat/","forms":{"participle-past":"of jura","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"jurat","error-unrecognized-form-feminine-indefinite-singular":"jurată","error-unrecognized-form-indefinite-masculine-plural":"jurați","error-unrecognized-form-feminine-indefinite-neuter-plural":"jurate","definite-error-unrecognized-form-masculine-neuter-singular":"juratul","definite-error-unrecognized-form-feminine-singular":"jurata","definite-error-unrecognized-form-masculine-plural":"jurații","definite-error-unrecognized-form-feminine-neuter-plural":"juratele"}},{"word":"jurat","pos":"noun","definitions":["juror, member of a jury"],"pronunciation":"/ʒuˈrat/","forms":{"plural":"jurați"}},{"word":"Jurat","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jurat"}},{"word":"Juratu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Juratu"}},{"word":"jură","pos":"verb","definitions":["third-person singular simple perfect indicative of jura"]},{"word":"jurământ","pos":"noun","definitions":["oath, vow"],"pronunciation":"/ʒurəˈmɨnt/","forms":{"plural":"jurăminte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jurământ","accusative-definite-nominative-singular":"jurământul","accusative-indefinite-nominative-plural":"jurăminte","accusative-definite-nominative-plural":"jurămintele","dative-genitive-indefinite-singular":"jurământ","dative-definite-genitive-singular":"jurământului","dative-genitive-indefinite-plural":"jurăminte","dative-definite-genitive-plural":"jurămintelor","singular-vocative":"jurământule","plural-vocative":"jurămintelor","alternative-archaic":"jurămînt"}},{"word":"jurăminte","pos":"noun","definitions":["plural of jurământ"],"pronunciation":"/ʒurəˈminte/","gender":"n-p"},{"word":"Jurăscu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jurăscu"}},{"word":"jurătoare","pos":"noun","definitions":["female equivalent of jurător"],"forms":{"plural":"jurătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"jurătoare","accusative-definite-nominative-singular":"jurătoarea","accusative-indefinite-nominative-plural":"jurătoare","accusative-definite-nominative-plural":"jurătoarele","dative-genitive-indefinite-singular":"jurătoare","dative-definite-genitive-singular":"jurătoarei","dative-genitive-indefinite-plural":"jurătoare","dative-definite-genitive-plural":"jurătoarelor","singular-vocative":"jurătoare","plural-vocative":"jurătoarelor"}},{"word":"jurător","pos":"noun","definitions":["one who testifies under oath as a witness in a judicial proceeding","one who swears an oath"],"forms":{"plural":"jurători"}},{"word":"jurătură","pos":"noun","definitions":["profanity"],"forms":{"plural":"jurături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jurătură","accusative-definite-nominative-singular":"jurătura","accusative-indefinite-nominative-plural":"jurături","accusative-definite-nominative-plural":"jurăturile","dative-genitive-indefinite-singular":"jurături","dative-definite-genitive-singular":"jurăturii","dative-genitive-indefinite-plural":"jurături","dative-definite-genitive-plural":"jurăturilor","singular-vocative":"jurătură","plural-vocative":"jurăturilor"}},{"word":"jurățel","pos":"noun","definitions":["subprefect"],"forms":{"plural":"jurăței","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jurățel","accusative-definite-nominative-singular":"jurățelul","accusative-indefinite-nominative-plural":"jurăței","accusative-definite-nominative-plural":"jurățeii","dative-genitive-indefinite-singular":"jurățel","dative-definite-genitive-singular":"jurățelului","dative-genitive-indefinite-plural":"jurăței","dative-definite-genitive-plural":"jurățeilor","singular-vocative":"jurățelule","plural-vocative":"jurățeilor"}},{"word":"Jurchescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Jurchescu"}},{"word":"Jurcuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jurcuț"}},{"word":"jure","pos":"verb","definitions":["third-person singular/plural present subjunctive of jura"],"pronunciation":"[ˈʒure]"},{"word":"Jurești","pos":"name","definitions":["a village in Bârna, Timiș County, Romania"],"gender":"m"},{"word":"juri","pos":"verb","definitions":["second-person singular present indicative/subjunctive of jura"],"pronunciation":"[ʒurʲ]"},{"word":"juridic","pos":"adj","definitions":["legal"],"forms":{"feminine-singular":"juridică","masculine-plural":"juridici","feminine-neuter-plural":"juridice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"juridic","error-unrecognized-form-feminine-indefinite-singular":"juridică","error-unrecognized-form-indefinite-masculine-plural":"juridici","error-unrecognized-form-feminine-indefinite-neuter-plural":"juridice","definite-error-unrecognized-form-masculine-neuter-singular":"juridicul","definite-error-unrecognized-form-feminine-singular":"juridica","definite-error-unrecognized-form-masculine-plural":"juridicii","definite-error-unrecognized-form-feminine-neuter-plural":"juridicele"}},{"word":"juridicește","pos":"adv","definitions":["legally"]},{"word":"juridicțiune","pos":"noun","definitions":["obsolete form of jurisdicție"],"forms":{"plural":"juridicțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"juridicțiune","accusative-definite-nominative-singular":"juridicțiunea","accusative-indefinite-nominative-plural":"juridicțiuni","accusative-definite-nominative-plural":"juridicțiunile","dative-genitive-indefinite-singular":"juridicțiuni","dative-definite-genitive-singular":"juridicțiunii","dative-genitive-indefinite-plural":"juridicțiuni","dative-definite-genitive-plural":"juridicțiunilor","singular-vocative":"juridicțiune","plural-vocative":"juridicțiunilor"}},{"word":"Jurilovca","pos":"name","definitions":["a village in Tulcea County, Dobruja, in eastern Romania"],"gender":"f"},{"word":"jurisconsult","pos":"noun","definitions":["jurisconsult"],"forms":{"plural":"jurisconsulți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jurisconsult","accusative-definite-nominative-singular":"jurisconsultul","accusative-indefinite-nominative-plural":"jurisconsulți","accusative-definite-nominative-plural":"jurisconsulții","dative-genitive-indefinite-singular":"jurisconsult","dative-definite-genitive-singular":"jurisconsultului","dative-genitive-indefinite-plural":"jurisconsulți","dative-definite-genitive-plural":"jurisconsulților","singular-vocative":"jurisconsultule","plural-vocative":"jurisconsulților"}},{"word":"jurisconsultă","pos":"noun","definitions":["female equivalent of jurisconsult"],"forms":{"plural":"jurisconsulte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jurisconsultă","accusative-definite-nominative-singular":"jurisconsulta","accusative-indefinite-nominative-plural":"jurisconsulte","accusative-definite-nominative-plural":"jurisconsultele","dative-genitive-indefinite-singular":"jurisconsulte","dative-definite-genitive-singular":"jurisconsultei","dative-genitive-indefinite-plural":"jurisconsulte","dative-definite-genitive-plural":"jurisconsultelor","singular-vocative":"jurisconsultă","plural-vocative":"jurisconsultelor"}},{"word":"jurisdicție","pos":"noun","definitions":["jurisdiction"],"pronunciation":"/ʒu.risˈdik.t͡si.e/","forms":{"plural":"jurisdicții","alternative-dated":"jurisdicțiune"}},{"word":"jurisdicții","pos":"noun","definitions":["plural of jurisdicție"],"gender":"f"},{"word":"jurisdicțional","pos":"adj","definitions":["jurisdictional"],"forms":{"feminine-singular":"jurisdicțională","masculine-plural":"jurisdicționali","feminine-neuter-plural":"jurisdicționale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jurisdicțional","error-unrecognized-form-feminine-indefinite-singular":"jurisdicțională","error-unrecognized-form-indefinite-masculine-plural":"jurisdicționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"jurisdicționale","definite-error-unrecognized-form-masculine-neuter-singular":"jurisdicționalul","definite-error-unrecognized-form-feminine-singular":"jurisdicționala","definite-error-unrecognized-form-masculine-plural":"jurisdicționalii","definite-error-unrecognized-form-feminine-neuter-plural":"jurisdicționalele"}},{"word":"jurisdicțiune","pos":"noun","definitions":["obsolete form of jurisdicție"],"forms":{"plural":"jurisdicțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jurisdicțiune","accusative-definite-nominative-singular":"jurisdicțiunea","accusative-indefinite-nominative-plural":"jurisdicțiuni","accusative-definite-nominative-plural":"jurisdicțiunile","dative-genitive-indefinite-singular":"jurisdicțiuni","dative-definite-genitive-singular":"jurisdicțiunii","dative-genitive-indefinite-plural":"jurisdicțiuni","dative-definite-genitive-plural":"jurisdicțiunilor","singular-vocative":"jurisdicțiune","plural-vocative":"jurisdicțiunilor"}},{"word":"jurisdicțiuni","pos":"noun","definitions":["plural of jurisdicțiune"],"gender":"f"},{"word":"jurisprudență","pos":"noun","definitions":["jurisprudence"],"forms":{"plural":"jurisprudențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jurisprudență","accusative-definite-nominative-singular":"jurisprudența","accusative-indefinite-nominative-plural":"jurisprudențe","accusative-definite-nominative-plural":"jurisprudențele","dative-genitive-indefinite-singular":"jurisprudențe","dative-definite-genitive-singular":"jurisprudenței","dative-genitive-indefinite-plural":"jurisprudențe","dative-definite-genitive-plural":"jurisprudențelor","singular-vocative":"jurisprudență","plural-vocative":"jurisprudențelor"}},{"word":"jurisprudențial","pos":"adj","definitions":["jurisprudential"],"forms":{"feminine-singular":"jurisprudențială","masculine-plural":"jurisprudențiali","feminine-neuter-plural":"jurisprudențiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jurisprudențial","error-unrecognized-form-feminine-indefinite-singular":"jurisprudențială","error-unrecognized-form-indefinite-masculine-plural":"jurisprudențiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"jurisprudențiale","definite-error-unrecognized-form-masculine-neuter-singular":"jurisprudențialul","definite-error-unrecognized-form-feminine-singular":"jurisprudențiala","definite-error-unrecognized-form-masculine-plural":"jurisprudențialii","definite-error-unrecognized-form-feminine-neuter-plural":"jurisprudențialele"}},{"word":"jurist","pos":"noun","definitions":["jurist","a law student"],"pronunciation":"/ʒuˈrist/","forms":{"plural":"juriști","feminine":"equivalent juristă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jurist","accusative-definite-nominative-singular":"juristul","accusative-indefinite-nominative-plural":"juriști","accusative-definite-nominative-plural":"juriștii","dative-genitive-indefinite-singular":"jurist","dative-definite-genitive-singular":"juristului","dative-genitive-indefinite-plural":"juriști","dative-definite-genitive-plural":"juriștilor","singular-vocative":"juristule","plural-vocative":"juriștilor"}},{"word":"jurista","pos":"noun","definitions":["definite nominative/accusative singular of juristă"]},{"word":"juristă","pos":"noun","definitions":["female equivalent of jurist"],"pronunciation":"/ʒuˈris.tə/","forms":{"plural":"juriste","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"juristă","accusative-definite-nominative-singular":"jurista","accusative-indefinite-nominative-plural":"juriste","accusative-definite-nominative-plural":"juristele","dative-genitive-indefinite-singular":"juriste","dative-definite-genitive-singular":"juristei","dative-genitive-indefinite-plural":"juriste","dative-definite-genitive-plural":"juristelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"juriste","pos":"noun","definitions":["plural of juristă"],"gender":"f-p"},{"word":"juriști","pos":"noun","definitions":["plural of jurist"],"gender":"m"},{"word":"juriu","pos":"noun","definitions":["jury","panel"],"forms":{"plural":"jurii"}},{"word":"juriza","pos":"verb","definitions":["to jury"],"forms":{"canonical":"a juriza 1st conjugation","present-singular-third-person":"jurizează","participle-past":"jurizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a juriza","gerund":"jurizând","first-person-indicative-present-singular":"jurizez","indicative-present-second-person-singular":"jurizezi","indicative-present-singular-third-person":"jurizează","first-person-indicative-plural-present":"jurizăm","indicative-plural-present-second-person":"jurizați","indicative-plural-present-third-person":"jurizează","first-person-imperfect-indicative-singular":"jurizam","imperfect-indicative-second-person-singular":"jurizai","imperfect-indicative-singular-third-person":"juriza","first-person-imperfect-indicative-plural":"jurizam","imperfect-indicative-plural-second-person":"jurizați","imperfect-indicative-plural-third-person":"jurizau","first-person-indicative-perfect-singular":"jurizai","indicative-perfect-second-person-singular":"jurizași","indicative-perfect-singular-third-person":"juriză","first-person-indicative-perfect-plural":"jurizarăm","indicative-perfect-plural-second-person":"jurizarăți","indicative-perfect-plural-third-person":"jurizară","first-person-indicative-pluperfect-singular":"jurizasem","indicative-pluperfect-second-person-singular":"jurizaseși","indicative-pluperfect-singular-third-person":"jurizase","first-person-indicative-pluperfect-plural":"jurizaserăm","indicative-pluperfect-plural-second-person":"jurizaserăți","indicative-pluperfect-plural-third-person":"jurizaseră","first-person-present-singular-subjunctive":"să jurizez","present-second-person-singular-subjunctive":"să jurizezi","present-singular-subjunctive-third-person":"să jurizeze","first-person-plural-present-subjunctive":"să jurizăm","plural-present-second-person-subjunctive":"să jurizați","plural-present-subjunctive-third-person":"să jurizeze","imperative-second-person-singular":"jurizează","imperative-plural-second-person":"jurizați","imperative-negative-second-person-singular":"nu juriza","imperative-negative-plural-second-person":"nu jurizați"}},{"word":"jurizare","pos":"noun","definitions":["jurying"],"forms":{"plural":"jurizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jurizare","accusative-definite-nominative-singular":"jurizarea","accusative-indefinite-nominative-plural":"jurizări","accusative-definite-nominative-plural":"jurizările","dative-genitive-indefinite-singular":"jurizări","dative-definite-genitive-singular":"jurizării","dative-genitive-indefinite-plural":"jurizări","dative-definite-genitive-plural":"jurizărilor","singular-vocative":"jurizare","plural-vocative":"jurizărilor"}},{"word":"Jurjică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jurjică"}},{"word":"jurnal","pos":"noun","definitions":["journal","diary"],"forms":{"plural":"jurnale","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jurnal","accusative-definite-nominative-singular":"jurnalul","accusative-indefinite-nominative-plural":"jurnale","accusative-definite-nominative-plural":"jurnalele","dative-genitive-indefinite-singular":"jurnal","dative-definite-genitive-singular":"jurnalului","dative-genitive-indefinite-plural":"jurnale","dative-definite-genitive-plural":"jurnalelor","singular-vocative":"jurnalule","plural-vocative":"jurnalelor"}},{"word":"jurnal de bord","pos":"noun","definitions":["logbook"],"forms":{"plural":"jurnale de bord"}},{"word":"jurnalier","pos":"adj","definitions":["daily"],"forms":{"feminine-singular":"jurnalieră","masculine-plural":"jurnalieri","feminine-neuter-plural":"jurnaliere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jurnalier","error-unrecognized-form-feminine-indefinite-singular":"jurnalieră","error-unrecognized-form-indefinite-masculine-plural":"jurnalieri","error-unrecognized-form-feminine-indefinite-neuter-plural":"jurnaliere","definite-error-unrecognized-form-masculine-neuter-singular":"jurnalierul","definite-error-unrecognized-form-feminine-singular":"jurnaliera","definite-error-unrecognized-form-masculine-plural":"jurnalierii","definite-error-unrecognized-form-feminine-neuter-plural":"jurnalierele"}},{"word":"jurnalism","pos":"noun","definitions":["journalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jurnalism","accusative-definite-nominative-singular":"jurnalismul","accusative-indefinite-nominative-plural":"jurnalisme","accusative-definite-nominative-plural":"jurnalismele","dative-genitive-indefinite-singular":"jurnalism","dative-definite-genitive-singular":"jurnalismului","dative-genitive-indefinite-plural":"jurnalisme","dative-definite-genitive-plural":"jurnalismelor","singular-vocative":"jurnalismule","plural-vocative":"jurnalismelor"}},{"word":"jurnalist","pos":"noun","definitions":["journalist"],"forms":{"plural":"jurnaliști","feminine":"equivalent jurnalistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jurnalist","accusative-definite-nominative-singular":"jurnalistul","accusative-indefinite-nominative-plural":"jurnaliști","accusative-definite-nominative-plural":"jurnaliștii","dative-genitive-indefinite-singular":"jurnalist","dative-definite-genitive-singular":"jurnalistului","dative-genitive-indefinite-plural":"jurnaliști","dative-definite-genitive-plural":"jurnaliștilor","singular-vocative":"jurnalistule","plural-vocative":"jurnaliștilor"}},{"word":"jurnalist sportiv","pos":"noun","definitions":["sports writer"],"forms":{"plural":"jurnaliști sportivi"}},{"word":"jurnalistă","pos":"noun","definitions":["female equivalent of jurnalist"],"forms":{"plural":"jurnaliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jurnalistă","accusative-definite-nominative-singular":"jurnalista","accusative-indefinite-nominative-plural":"jurnaliste","accusative-definite-nominative-plural":"jurnalistele","dative-genitive-indefinite-singular":"jurnaliste","dative-definite-genitive-singular":"jurnalistei","dative-genitive-indefinite-plural":"jurnaliste","dative-definite-genitive-plural":"jurnalistelor","singular-vocative":"jurnalistă","plural-vocative":"jurnalistelor"}},{"word":"jurnalistic","pos":"adj","definitions":["journalistic"],"forms":{"feminine-singular":"jurnalistică","masculine-plural":"jurnalistici","feminine-neuter-plural":"jurnalistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jurnalistic","error-unrecognized-form-feminine-indefinite-singular":"jurnalistică","error-unrecognized-form-indefinite-masculine-plural":"jurnalistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"jurnalistice","definite-error-unrecognized-form-masculine-neuter-singular":"jurnalisticul","definite-error-unrecognized-form-feminine-singular":"jurnalistica","definite-error-unrecognized-form-masculine-plural":"jurnalisticii","definite-error-unrecognized-form-feminine-neuter-plural":"jurnalisticele"}},{"word":"jurnalistică","pos":"noun","definitions":["journalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"jurnalistică","accusative-definite-nominative":"jurnalistica","dative-genitive-indefinite":"jurnalistici","dative-definite-genitive":"jurnalisticii","vocative":"jurnalistică"}},{"word":"Jurubiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jurubiță"}},{"word":"jurui","pos":"verb","definitions":["to promise solemnly"],"forms":{"canonical":"a jurui 4th conjugation","present-singular-third-person":"juruiește","participle-past":"juruit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jurui","gerund":"juruind","first-person-indicative-present-singular":"juruiesc","indicative-present-second-person-singular":"juruiești","indicative-present-singular-third-person":"juruiește","first-person-indicative-plural-present":"juruim","indicative-plural-present-second-person":"juruiți","indicative-plural-present-third-person":"juruiesc","first-person-imperfect-indicative-singular":"juruiam","imperfect-indicative-second-person-singular":"juruiai","imperfect-indicative-singular-third-person":"juruia","first-person-imperfect-indicative-plural":"juruiam","imperfect-indicative-plural-second-person":"juruiați","imperfect-indicative-plural-third-person":"juruiau","first-person-indicative-perfect-singular":"juruii","indicative-perfect-second-person-singular":"juruiși","indicative-perfect-singular-third-person":"jurui","first-person-indicative-perfect-plural":"juruirăm","indicative-perfect-plural-second-person":"juruirăți","indicative-perfect-plural-third-person":"juruiră","first-person-indicative-pluperfect-singular":"juruisem","indicative-pluperfect-second-person-singular":"juruiseși","indicative-pluperfect-singular-third-person":"juruise","first-person-indicative-pluperfect-plural":"juruiserăm","indicative-pluperfect-plural-second-person":"juruiserăți","indicative-pluperfect-plural-third-person":"juruiseră","first-person-present-singular-subjunctive":"să juruiesc","present-second-person-singular-subjunctive":"să juruiești","present-singular-subjunctive-third-person":"să juruiască","first-person-plural-present-subjunctive":"să juruim","plural-present-second-person-subjunctive":"să juruiți","plural-present-subjunctive-third-person":"să juruiască","imperative-second-person-singular":"juruiește","imperative-plural-second-person":"juruiți","imperative-negative-second-person-singular":"nu jurui","imperative-negative-plural-second-person":"nu juruiți"}},{"word":"juruință","pos":"noun","definitions":["oath"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"juruință","accusative-definite-nominative":"juruința","dative-genitive-indefinite":"juruințe","dative-definite-genitive":"juruinței","vocative":"juruință"}},{"word":"juruită","pos":"noun","definitions":["promise"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"juruită","accusative-definite-nominative-singular":"juruita","accusative-indefinite-nominative-plural":"juruite","accusative-definite-nominative-plural":"juruitele","dative-genitive-indefinite-singular":"juruite","dative-definite-genitive-singular":"juruitei","dative-genitive-indefinite-plural":"juruite","dative-definite-genitive-plural":"juruitelor","singular-vocative":"juruită","plural-vocative":"juruitelor"}},{"word":"jurul","pos":"noun","definitions":["definite nominative/accusative singular of jur"]},{"word":"jurului","pos":"noun","definitions":["definite dative/genitive singular of jur"]},{"word":"jururi","pos":"noun","definitions":["plural of jur"]},{"word":"jururile","pos":"noun","definitions":["definite nominative/accusative plural of jur"]},{"word":"jururilor","pos":"noun","definitions":["inflection of jur:","definite genitive/dative plural","vocative plural"]},{"word":"just","pos":"adj","definitions":["just, correct"],"pronunciation":"/ʒust/","forms":{"feminine-singular":"justă","masculine-plural":"juști","feminine-neuter-plural":"juste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"just","error-unrecognized-form-feminine-indefinite-singular":"justă","error-unrecognized-form-indefinite-masculine-plural":"juști","error-unrecognized-form-feminine-indefinite-neuter-plural":"juste","definite-error-unrecognized-form-masculine-neuter-singular":"justul","definite-error-unrecognized-form-feminine-singular":"justa","definite-error-unrecognized-form-masculine-plural":"juștii","definite-error-unrecognized-form-feminine-neuter-plural":"justele"}},{"word":"justeță","pos":"noun","definitions":["alternative form of justețe"],"forms":{"plural":"justețe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"justeță","accusative-definite-nominative-singular":"justeța","accusative-indefinite-nominative-plural":"justețe","accusative-definite-nominative-plural":"justețele","dative-genitive-indefinite-singular":"justețe","dative-definite-genitive-singular":"justeței","dative-genitive-indefinite-plural":"justețe","dative-definite-genitive-plural":"justețelor","singular-vocative":"justeță","plural-vocative":"justețelor"}},{"word":"justețe","pos":"noun","definitions":["rightness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"justețe","accusative-definite-nominative":"justețea","dative-genitive-indefinite":"justeți","dative-definite-genitive":"justeții","vocative":"justețe"}},{"word":"justifica","pos":"verb","definitions":["to justify"],"pronunciation":"/ʒus.ti.fiˈka/","forms":{"canonical":"a justifica 1st conjugation","present-singular-third-person":"justifică","participle-past":"justificat","subjunctive-third-person":"justifice","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a justifica","gerund":"justificând","first-person-indicative-present-singular":"justific","indicative-present-second-person-singular":"justifici","indicative-present-singular-third-person":"justifică","first-person-indicative-plural-present":"justificăm","indicative-plural-present-second-person":"justificați","indicative-plural-present-third-person":"justifică","first-person-imperfect-indicative-singular":"justificam","imperfect-indicative-second-person-singular":"justificai","imperfect-indicative-singular-third-person":"justifica","first-person-imperfect-indicative-plural":"justificam","imperfect-indicative-plural-second-person":"justificați","imperfect-indicative-plural-third-person":"justificau","first-person-indicative-perfect-singular":"justificai","indicative-perfect-second-person-singular":"justificași","indicative-perfect-singular-third-person":"justifică","first-person-indicative-perfect-plural":"justificarăm","indicative-perfect-plural-second-person":"justificarăți","indicative-perfect-plural-third-person":"justificară","first-person-indicative-pluperfect-singular":"justificasem","indicative-pluperfect-second-person-singular":"justificaseși","indicative-pluperfect-singular-third-person":"justificase","first-person-indicative-pluperfect-plural":"justificaserăm","indicative-pluperfect-plural-second-person":"justificaserăți","indicative-pluperfect-plural-third-person":"justificaseră","first-person-present-singular-subjunctive":"să justific","present-second-person-singular-subjunctive":"să justifici","present-singular-subjunctive-third-person":"să justifice","first-person-plural-present-subjunctive":"să justificăm","plural-present-second-person-subjunctive":"să justificați","plural-present-subjunctive-third-person":"să justifice","imperative-second-person-singular":"justifică","imperative-plural-second-person":"justificați","imperative-negative-second-person-singular":"nu justifica","imperative-negative-plural-second-person":"nu justificați"}},{"word":"justificabil","pos":"adj","definitions":["justifiable"],"pronunciation":"/ʒus.ti.fiˈka.bil/","forms":{"feminine-singular":"justificabilă","masculine-plural":"justificabili","feminine-neuter-plural":"justificabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"justificabil","error-unrecognized-form-feminine-indefinite-singular":"justificabilă","error-unrecognized-form-indefinite-masculine-plural":"justificabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"justificabile","definite-error-unrecognized-form-masculine-neuter-singular":"justificabilul","definite-error-unrecognized-form-feminine-singular":"justificabila","definite-error-unrecognized-form-masculine-plural":"justificabilii","definite-error-unrecognized-form-feminine-neuter-plural":"justificabilele"}},{"word":"justificai","pos":"verb","definitions":["inflection of justifica:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[ʒustifiˈkaj]"},{"word":"justificam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of justifica"],"pronunciation":"[ʒustifiˈkam]"},{"word":"justificare","pos":"noun","definitions":["justification; act of justifying"],"forms":{"plural":"justificări"}},{"word":"justificase","pos":"verb","definitions":["third-person singular pluperfect indicative of justifica"],"pronunciation":"[ʒustifiˈkase]"},{"word":"justificat","pos":"adj","definitions":["justified","legitimate"],"pronunciation":"[ʒustifiˈkat]","forms":{"feminine-singular":"justificată","masculine-plural":"justificați","feminine-neuter-plural":"justificate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"justificat","error-unrecognized-form-feminine-indefinite-singular":"justificată","error-unrecognized-form-indefinite-masculine-plural":"justificați","error-unrecognized-form-feminine-indefinite-neuter-plural":"justificate","definite-error-unrecognized-form-masculine-neuter-singular":"justificatul","definite-error-unrecognized-form-feminine-singular":"justificata","definite-error-unrecognized-form-masculine-plural":"justificații","definite-error-unrecognized-form-feminine-neuter-plural":"justificatele"}},{"word":"justificat","pos":"verb","definitions":["past participle of justifica"],"pronunciation":"[ʒustifiˈkat]"},{"word":"justificativ","pos":"adj","definitions":["justificatory"],"forms":{"feminine-singular":"justificativă","masculine-plural":"justificativi","feminine-neuter-plural":"justificative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"justificativ","error-unrecognized-form-feminine-indefinite-singular":"justificativă","error-unrecognized-form-indefinite-masculine-plural":"justificativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"justificative","definite-error-unrecognized-form-masculine-neuter-singular":"justificativul","definite-error-unrecognized-form-feminine-singular":"justificativa","definite-error-unrecognized-form-masculine-plural":"justificativii","definite-error-unrecognized-form-feminine-neuter-plural":"justificativele"}},{"word":"justificator","pos":"adj","definitions":["justificatory"],"forms":{"feminine-singular":"justificatoare","masculine-plural":"justificatori","feminine-neuter-plural":"justificatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"justificator","error-unrecognized-form-feminine-indefinite-singular":"justificatoare","error-unrecognized-form-indefinite-masculine-plural":"justificatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"justificatoare","definite-error-unrecognized-form-masculine-neuter-singular":"justificatorul","definite-error-unrecognized-form-feminine-singular":"justificatoarea","definite-error-unrecognized-form-masculine-plural":"justificatorii","definite-error-unrecognized-form-feminine-neuter-plural":"justificatoarele"}},{"word":"justificație","pos":"noun","definitions":["justificatory"],"forms":{"plural":"justificații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"justificație","accusative-definite-nominative-singular":"justificația","accusative-indefinite-nominative-plural":"justificații","accusative-definite-nominative-plural":"justificațiile","dative-genitive-indefinite-singular":"justificații","dative-definite-genitive-singular":"justificației","dative-genitive-indefinite-plural":"justificații","dative-definite-genitive-plural":"justificațiilor","singular-vocative":"justificație","plural-vocative":"justificațiilor"}},{"word":"justificațiune","pos":"noun","definitions":["alternative form of justificație"],"forms":{"plural":"justificațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"justificațiune","accusative-definite-nominative-singular":"justificațiunea","accusative-indefinite-nominative-plural":"justificațiuni","accusative-definite-nominative-plural":"justificațiunile","dative-genitive-indefinite-singular":"justificațiuni","dative-definite-genitive-singular":"justificațiunii","dative-genitive-indefinite-plural":"justificațiuni","dative-definite-genitive-plural":"justificațiunilor","singular-vocative":"justificațiune","plural-vocative":"justificațiunilor"}},{"word":"justițiabil","pos":"noun","definitions":["justiciable"],"forms":{"plural":"justițiabili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"justițiabil","accusative-definite-nominative-singular":"justițiabilul","accusative-indefinite-nominative-plural":"justițiabili","accusative-definite-nominative-plural":"justițiabilii","dative-genitive-indefinite-singular":"justițiabil","dative-definite-genitive-singular":"justițiabilului","dative-genitive-indefinite-plural":"justițiabili","dative-definite-genitive-plural":"justițiabililor","singular-vocative":"justițiabilule","plural-vocative":"justițiabililor"}},{"word":"justițiabilă","pos":"noun","definitions":["female equivalent of justițiabil"],"forms":{"plural":"justițiabile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"justițiabilă","accusative-definite-nominative-singular":"justițiabila","accusative-indefinite-nominative-plural":"justițiabile","accusative-definite-nominative-plural":"justițiabilele","dative-genitive-indefinite-singular":"justițiabile","dative-definite-genitive-singular":"justițiabilei","dative-genitive-indefinite-plural":"justițiabile","dative-definite-genitive-plural":"justițiabilelor","singular-vocative":"justițiabilă","plural-vocative":"justițiabilelor"}},{"word":"justițial","pos":"adj","definitions":["justicial, judicial"],"forms":{"feminine-singular":"justițială","masculine-plural":"justițiali","feminine-neuter-plural":"justițiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"justițial","error-unrecognized-form-feminine-indefinite-singular":"justițială","error-unrecognized-form-indefinite-masculine-plural":"justițiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"justițiale","definite-error-unrecognized-form-masculine-neuter-singular":"justițialul","definite-error-unrecognized-form-feminine-singular":"justițiala","definite-error-unrecognized-form-masculine-plural":"justițialii","definite-error-unrecognized-form-feminine-neuter-plural":"justițialele"}},{"word":"justițiar","pos":"adj","definitions":["justiciary"],"forms":{"feminine-singular":"justițiară","masculine-plural":"justițiari","feminine-neuter-plural":"justițiare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"justițiar","error-unrecognized-form-feminine-indefinite-singular":"justițiară","error-unrecognized-form-indefinite-masculine-plural":"justițiari","error-unrecognized-form-feminine-indefinite-neuter-plural":"justițiare","definite-error-unrecognized-form-masculine-neuter-singular":"justițiarul","definite-error-unrecognized-form-feminine-singular":"justițiara","definite-error-unrecognized-form-masculine-plural":"justițiarii","definite-error-unrecognized-form-feminine-neuter-plural":"justițiarele"}},{"word":"justiție","pos":"noun","definitions":["justice, fairness","justice","righteousness"],"pronunciation":"/ʒusˈtit͡si.e/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"justiție","accusative-definite-nominative":"justiția","dative-genitive-indefinite":"justiții","dative-definite-genitive":"justiției","vocative":"justiție","alternative":"жустицие"}},{"word":"juvaier","pos":"noun","definitions":["alternative form of giuvaier"],"forms":{"plural":"juvaiere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"juvaier","accusative-definite-nominative-singular":"juvaierul","accusative-indefinite-nominative-plural":"juvaiere","accusative-definite-nominative-plural":"juvaierele","dative-genitive-indefinite-singular":"juvaier","dative-definite-genitive-singular":"juvaierului","dative-genitive-indefinite-plural":"juvaiere","dative-definite-genitive-plural":"juvaierelor","singular-vocative":"juvaierule","plural-vocative":"juvaierelor"}},{"word":"juvală","pos":"noun","definitions":["alternative form of jigală"],"forms":{"plural":"juvale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"juvală","accusative-definite-nominative-singular":"juvala","accusative-indefinite-nominative-plural":"juvale","accusative-definite-nominative-plural":"juvalele","dative-genitive-indefinite-singular":"juvale","dative-definite-genitive-singular":"juvalei","dative-genitive-indefinite-plural":"juvale","dative-definite-genitive-plural":"juvalelor","singular-vocative":"juvală","plural-vocative":"juvalelor"}},{"word":"juvăț","pos":"noun","definitions":["snare used to catch animals","noose (to hang someone)"],"forms":{"plural":"juvețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"juvăț","accusative-definite-nominative-singular":"juvățul","accusative-indefinite-nominative-plural":"juvețe","accusative-definite-nominative-plural":"juvețele","dative-genitive-indefinite-singular":"juvăț","dative-definite-genitive-singular":"juvățului","dative-genitive-indefinite-plural":"juvețe","dative-definite-genitive-plural":"juvețelor","singular-vocative":"juvățule","plural-vocative":"juvețelor"}},{"word":"juvenil","pos":"adj","definitions":["juvenile","teenage"],"pronunciation":"/ʒu.veˈnil/","forms":{"feminine-singular":"juvenilă","masculine-plural":"juvenili","feminine-neuter-plural":"juvenile","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"juvenil","error-unrecognized-form-feminine-indefinite-singular":"juvenilă","error-unrecognized-form-indefinite-masculine-plural":"juvenili","error-unrecognized-form-feminine-indefinite-neuter-plural":"juvenile","definite-error-unrecognized-form-masculine-neuter-singular":"juvenilul","definite-error-unrecognized-form-feminine-singular":"juvenila","definite-error-unrecognized-form-masculine-plural":"juvenilii","definite-error-unrecognized-form-feminine-neuter-plural":"juvenilele"}},{"word":"juvenilă","pos":"adj","definitions":["nominative/accusative feminine singular of juvenil"],"pronunciation":"/ʒu.veˈni.lə/"},{"word":"juvenilitate","pos":"noun","definitions":["juvenility"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"juvenilitate","accusative-definite-nominative-singular":"juvenilitatea","accusative-indefinite-nominative-plural":"juvenilități","accusative-definite-nominative-plural":"juvenilitățile","dative-genitive-indefinite-singular":"juvenilități","dative-definite-genitive-singular":"juvenilității","dative-genitive-indefinite-plural":"juvenilități","dative-definite-genitive-plural":"juvenilităților","singular-vocative":"juvenilitate","plural-vocative":"juvenilităților"}},{"word":"Juverțelul","pos":"name","definitions":["a river in Sibiu, Romania, tributary to the Juvertul"],"gender":"m"},{"word":"juvete","pos":"noun","definitions":["fry, any small fish","nickname applied to Oltenians (Romanians from Oltenia, in Romania)"],"forms":{"plural":"juveți","table-tags":"no-table-tags","inflection-template":"ro-noun-m-e","accusative-indefinite-nominative-singular":"juvete","accusative-definite-nominative-singular":"juvetele","accusative-indefinite-nominative-plural":"juveți","accusative-definite-nominative-plural":"juveții","dative-genitive-indefinite-singular":"juvete","dative-definite-genitive-singular":"juvetelui","dative-genitive-indefinite-plural":"juveți","dative-definite-genitive-plural":"juveților","singular-vocative":"juvete","plural-vocative":"juveților"}},{"word":"Juvete","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Juvete"}},{"word":"juveți","pos":"noun","definitions":["plural of juvete"]},{"word":"juvină","pos":"noun","definitions":["obsolete form of jivină"],"forms":{"plural":"juvine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"juvină","accusative-definite-nominative-singular":"juvina","accusative-indefinite-nominative-plural":"juvine","accusative-definite-nominative-plural":"juvinele","dative-genitive-indefinite-singular":"juvine","dative-definite-genitive-singular":"juvinei","dative-genitive-indefinite-plural":"juvine","dative-definite-genitive-plural":"juvinelor","singular-vocative":"juvină","plural-vocative":"juvinelor"}},{"word":"juxtalinear","pos":"adj","definitions":["juxtalinear"],"forms":{"feminine-singular":"juxtalineară","masculine-plural":"juxtalineari","feminine-neuter-plural":"juxtalineare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"juxtalinear","error-unrecognized-form-feminine-indefinite-singular":"juxtalineară","error-unrecognized-form-indefinite-masculine-plural":"juxtalineari","error-unrecognized-form-feminine-indefinite-neuter-plural":"juxtalineare","definite-error-unrecognized-form-masculine-neuter-singular":"juxtalinearul","definite-error-unrecognized-form-feminine-singular":"juxtalineara","definite-error-unrecognized-form-masculine-plural":"juxtalinearii","definite-error-unrecognized-form-feminine-neuter-plural":"juxtalinearele"}},{"word":"juxtaliniară","pos":"adj","definitions":["alternative form of juxtalineară"],"forms":{"plural":"juxtaliniare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-","error-unrecognized-form-feminine-indefinite-singular":"juxtaliniară","error-unrecognized-form-indefinite-masculine-plural":"-","error-unrecognized-form-feminine-indefinite-neuter-plural":"juxtaliniare","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"juxtaliniara","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"juxtaliniarele"}},{"word":"juxtapoziție","pos":"noun","definitions":["juxtaposition"],"forms":{"plural":"juxtapoziții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"juxtapoziție","accusative-definite-nominative-singular":"juxtapoziția","accusative-indefinite-nominative-plural":"juxtapoziții","accusative-definite-nominative-plural":"juxtapozițiile","dative-genitive-indefinite-singular":"juxtapoziții","dative-definite-genitive-singular":"juxtapoziției","dative-genitive-indefinite-plural":"juxtapoziții","dative-definite-genitive-plural":"juxtapozițiilor","singular-vocative":"juxtapoziție","plural-vocative":"juxtapozițiilor"}},{"word":"juxtapozițiune","pos":"noun","definitions":["obsolete form of juxtapoziție"],"forms":{"plural":"juxtapozițiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"juxtapozițiune","accusative-definite-nominative-singular":"juxtapozițiunea","accusative-indefinite-nominative-plural":"juxtapozițiuni","accusative-definite-nominative-plural":"juxtapozițiunile","dative-genitive-indefinite-singular":"juxtapozițiuni","dative-definite-genitive-singular":"juxtapozițiunii","dative-genitive-indefinite-plural":"juxtapozițiuni","dative-definite-genitive-plural":"juxtapozițiunilor","singular-vocative":"juxtapozițiune","plural-vocative":"juxtapozițiunilor"}},{"word":"juxtapune","pos":"verb","definitions":["to juxtapose"],"forms":{"canonical":"a juxtapune 3rd conjugation","present-singular-third-person":"juxtapune","participle-past":"juxtapus","subjunctive-third-person":"juxtapună","table-tags":"conjugation-3","inflection-template":"ro-conj-e","infinitive":"a juxtapune","gerund":"juxtapunând","first-person-indicative-present-singular":"juxtapun","indicative-present-second-person-singular":"juxtapui","indicative-present-singular-third-person":"juxtapune","first-person-indicative-plural-present":"juxtapunem","indicative-plural-present-second-person":"juxtapuneți","indicative-plural-present-third-person":"juxtapun","first-person-imperfect-indicative-singular":"juxtapuneam","imperfect-indicative-second-person-singular":"juxtapuneai","imperfect-indicative-singular-third-person":"juxtapunea","first-person-imperfect-indicative-plural":"juxtapuneam","imperfect-indicative-plural-second-person":"juxtapuneați","imperfect-indicative-plural-third-person":"juxtapuneau","first-person-indicative-perfect-singular":"juxtapusei","indicative-perfect-second-person-singular":"juxtapuseși","indicative-perfect-singular-third-person":"juxtapuse","first-person-indicative-perfect-plural":"juxtapuserăm","indicative-perfect-plural-second-person":"juxtapuserăți","indicative-perfect-plural-third-person":"juxtapuseră","first-person-indicative-pluperfect-singular":"juxtapusesem","indicative-pluperfect-second-person-singular":"juxtapuseseși","indicative-pluperfect-singular-third-person":"juxtapusese","first-person-indicative-pluperfect-plural":"juxtapuseserăm","indicative-pluperfect-plural-second-person":"juxtapuseserăți","indicative-pluperfect-plural-third-person":"juxtapuseseră","first-person-present-singular-subjunctive":"să juxtapun","present-second-person-singular-subjunctive":"să juxtapui","present-singular-subjunctive-third-person":"să juxtapună","first-person-plural-present-subjunctive":"să juxtapunem","plural-present-second-person-subjunctive":"să juxtapuneți","plural-present-subjunctive-third-person":"să juxtapună","imperative-second-person-singular":"juxtapune","imperative-plural-second-person":"juxtapuneți","imperative-negative-second-person-singular":"nu juxtapune","imperative-negative-plural-second-person":"nu juxtapuneți"}},{"word":"juxtapunere","pos":"noun","definitions":["juxtaposition"],"forms":{"plural":"juxtapuneri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"juxtapunere","accusative-definite-nominative-singular":"juxtapunerea","accusative-indefinite-nominative-plural":"juxtapuneri","accusative-definite-nominative-plural":"juxtapunerile","dative-genitive-indefinite-singular":"juxtapuneri","dative-definite-genitive-singular":"juxtapunerii","dative-genitive-indefinite-plural":"juxtapuneri","dative-definite-genitive-plural":"juxtapunerilor","singular-vocative":"juxtapunere","plural-vocative":"juxtapunerilor"}},{"word":"juxtapus","pos":"adj","definitions":["juxtaposited"],"forms":{"feminine-singular":"juxtapusă","masculine-plural":"juxtapuși","feminine-neuter-plural":"juxtapuse","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"juxtapus","error-unrecognized-form-feminine-indefinite-singular":"juxtapusă","error-unrecognized-form-indefinite-masculine-plural":"juxtapuși","error-unrecognized-form-feminine-indefinite-neuter-plural":"juxtapuse","definite-error-unrecognized-form-masculine-neuter-singular":"juxtapusul","definite-error-unrecognized-form-feminine-singular":"juxtapusa","definite-error-unrecognized-form-masculine-plural":"juxtapușii","definite-error-unrecognized-form-feminine-neuter-plural":"juxtapusele"}},{"word":"juzi","pos":"noun","definitions":["plural of jude"],"pronunciation":"/ʒuzʲ/"},{"word":"jvarț","pos":"noun","definitions":["obsolete form of șvarț"],"forms":{"plural":"jvarțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jvarț","accusative-definite-nominative-singular":"jvarțul","accusative-indefinite-nominative-plural":"jvarțuri","accusative-definite-nominative-plural":"jvarțurile","dative-genitive-indefinite-singular":"jvarț","dative-definite-genitive-singular":"jvarțului","dative-genitive-indefinite-plural":"jvarțuri","dative-definite-genitive-plural":"jvarțurilor","singular-vocative":"jvarțule","plural-vocative":"jvarțurilor"}}];
+export default [{"word":"J","pos":"character","definitions":["The thirteenth letter of the Romanian alphabet, called je or jî and written in the Latin script."],"pronunciation":"/ʒ/","forms":{"lowercase":"j"}},{"word":"j","pos":"character","definitions":["The thirteenth letter of the Romanian alphabet, called je or jî and written in the Latin script."],"pronunciation":"/ʒ/","forms":{"uppercase":"J"}},{"word":"Jabăr","pos":"name","definitions":["a village in Boldur, Timiș County, Romania"],"gender":"m"},{"word":"Jabenițan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jabenițan"}},{"word":"jabiru","pos":"noun","definitions":["jabiru"],"forms":{"plural":"jabiruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jabiru","accusative-definite-nominative-singular":"jabirul","accusative-indefinite-nominative-plural":"jabiruri","accusative-definite-nominative-plural":"jabirurile","dative-genitive-indefinite-singular":"jabiru","dative-definite-genitive-singular":"jabirului","dative-genitive-indefinite-plural":"jabiruri","dative-definite-genitive-plural":"jabirurilor","singular-vocative":"jabirule","plural-vocative":"jabirurilor"}},{"word":"jabotieră","pos":"noun","definitions":["chiffon frill"],"forms":{"plural":"jabotiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jabotieră","accusative-definite-nominative-singular":"jabotiera","accusative-indefinite-nominative-plural":"jabotiere","accusative-definite-nominative-plural":"jabotierele","dative-genitive-indefinite-singular":"jabotiere","dative-definite-genitive-singular":"jabotierei","dative-genitive-indefinite-plural":"jabotiere","dative-definite-genitive-plural":"jabotierelor","singular-vocative":"jabotieră","plural-vocative":"jabotierelor"}},{"word":"jabou","pos":"noun","definitions":["frill"],"forms":{"plural":"jabouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jabou","accusative-definite-nominative-singular":"jaboul","accusative-indefinite-nominative-plural":"jabouri","accusative-definite-nominative-plural":"jabourile","dative-genitive-indefinite-singular":"jabou","dative-definite-genitive-singular":"jaboului","dative-genitive-indefinite-plural":"jabouri","dative-definite-genitive-plural":"jabourilor","singular-vocative":"jaboule","plural-vocative":"jabourilor"}},{"word":"jabră","pos":"noun","definitions":["alternative form of javră"],"forms":{"plural":"jabre"}},{"word":"jăbrăcie","pos":"noun","definitions":["vileness"],"forms":{"plural":"jăbrăcii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jăbrăcie","accusative-definite-nominative-singular":"jăbrăcia","accusative-indefinite-nominative-plural":"jăbrăcii","accusative-definite-nominative-plural":"jăbrăciile","dative-genitive-indefinite-singular":"jăbrăcii","dative-definite-genitive-singular":"jăbrăciei","dative-genitive-indefinite-plural":"jăbrăcii","dative-definite-genitive-plural":"jăbrăciilor","singular-vocative":"jăbrăcie","plural-vocative":"jăbrăciilor"}},{"word":"Jac","pos":"name","definitions":["a village in Creaca, Sălaj County, Romania"],"pronunciation":"/ˈʒak/","gender":"m"},{"word":"jac","pos":"noun","definitions":["alternative form of jaf"],"forms":{"plural":"jacuri"}},{"word":"jacă","pos":"noun","definitions":["sack, bag"],"forms":{"plural":"jăci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jacă","accusative-definite-nominative-singular":"jaca","accusative-indefinite-nominative-plural":"jăci","accusative-definite-nominative-plural":"jăcile","dative-genitive-indefinite-singular":"jăci","dative-definite-genitive-singular":"jăcii","dative-genitive-indefinite-plural":"jăci","dative-definite-genitive-plural":"jăcilor","singular-vocative":"jacă","plural-vocative":"jăcilor"}},{"word":"jacaranda","pos":"noun","definitions":["jacaranda"],"forms":{"plural":"jacaranda","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jacaranda","accusative-definite-nominative-singular":"jacarandaul","accusative-indefinite-nominative-plural":"jacaranda","accusative-definite-nominative-plural":"jacarandai","dative-genitive-indefinite-singular":"jacaranda","dative-definite-genitive-singular":"jacarandaului","dative-genitive-indefinite-plural":"jacaranda","dative-definite-genitive-plural":"jacarandalor","singular-vocative":"jacarandaule","plural-vocative":"jacarandalor"}},{"word":"jacard","pos":"noun","definitions":["jacquard"],"forms":{"plural":"jacarde","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jacard","accusative-definite-nominative-singular":"jacardul","accusative-indefinite-nominative-plural":"jacarde","accusative-definite-nominative-plural":"jacardele","dative-genitive-indefinite-singular":"jacard","dative-definite-genitive-singular":"jacardului","dative-genitive-indefinite-plural":"jacarde","dative-definite-genitive-plural":"jacardelor","singular-vocative":"jacardule","plural-vocative":"jacardelor"}},{"word":"jăcaș","pos":"noun","definitions":["alternative form of jacaș"],"forms":{"plural":"jăcași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jăcaș","accusative-definite-nominative-singular":"jăcașul","accusative-indefinite-nominative-plural":"jăcași","accusative-definite-nominative-plural":"jăcașii","dative-genitive-indefinite-singular":"jăcaș","dative-definite-genitive-singular":"jăcașului","dative-genitive-indefinite-plural":"jăcași","dative-definite-genitive-plural":"jăcașilor","singular-vocative":"jăcașule","plural-vocative":"jăcașilor"}},{"word":"jachetă","pos":"noun","definitions":["a long jacket or overcoat"],"pronunciation":"/ʒaˈke.tə/","forms":{"plural":"jachete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jachetă","accusative-definite-nominative-singular":"jacheta","accusative-indefinite-nominative-plural":"jachete","accusative-definite-nominative-plural":"jachetele","dative-genitive-indefinite-singular":"jachete","dative-definite-genitive-singular":"jachetei","dative-genitive-indefinite-plural":"jachete","dative-definite-genitive-plural":"jachetelor","singular-vocative":"jachetă","plural-vocative":"jachetelor"}},{"word":"jachețică","pos":"noun","definitions":["diminutive of jachetă; small jacket"],"forms":{"plural":"jachețele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jachețică","accusative-definite-nominative-singular":"jachețica","accusative-indefinite-nominative-plural":"jachețice","accusative-definite-nominative-plural":"jachețicele","dative-genitive-indefinite-singular":"jachețice","dative-definite-genitive-singular":"jachețicei","dative-genitive-indefinite-plural":"jachețice","dative-definite-genitive-plural":"jachețicelor","singular-vocative":"jachețică","plural-vocative":"jachețicelor"}},{"word":"jachetuță","pos":"noun","definitions":["diminutive of jachetă; small jacket"],"forms":{"plural":"jachetuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jachetuță","accusative-definite-nominative-singular":"jachetuța","accusative-indefinite-nominative-plural":"jachetuțe","accusative-definite-nominative-plural":"jachetuțele","dative-genitive-indefinite-singular":"jachetuțe","dative-definite-genitive-singular":"jachetuței","dative-genitive-indefinite-plural":"jachetuțe","dative-definite-genitive-plural":"jachetuțelor","singular-vocative":"jachetuță","plural-vocative":"jachetuțelor"}},{"word":"jack","pos":"noun","definitions":["alternative form of geac"],"forms":{"plural":"jackuri"}},{"word":"Jack Spintecătorul","pos":"name","definitions":["Jack the Ripper"],"gender":"m"},{"word":"jackpot","pos":"noun","definitions":["jackpot"],"forms":{"plural":"jackpoturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jackpot","accusative-definite-nominative-singular":"jackpotul","accusative-indefinite-nominative-plural":"jackpoturi","accusative-definite-nominative-plural":"jackpoturile","dative-genitive-indefinite-singular":"jackpot","dative-definite-genitive-singular":"jackpotului","dative-genitive-indefinite-plural":"jackpoturi","dative-definite-genitive-plural":"jackpoturilor","singular-vocative":"jackpotule","plural-vocative":"jackpoturilor"}},{"word":"jackuri","pos":"noun","definitions":["plural of jack"]},{"word":"jăcman","pos":"noun","definitions":["thievery"],"forms":{"plural":"jăcmanuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jăcman","accusative-definite-nominative-singular":"jăcmanul","accusative-indefinite-nominative-plural":"jăcmanuri","accusative-definite-nominative-plural":"jăcmanurile","dative-genitive-indefinite-singular":"jăcman","dative-definite-genitive-singular":"jăcmanului","dative-genitive-indefinite-plural":"jăcmanuri","dative-definite-genitive-plural":"jăcmanurilor","singular-vocative":"jăcmanule","plural-vocative":"jăcmanurilor"}},{"word":"jăcmăneală","pos":"noun","definitions":["alternative form of jecmăneală"],"forms":{"plural":"jăcmăneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jăcmăneală","accusative-definite-nominative-singular":"jăcmăneala","accusative-indefinite-nominative-plural":"jăcmăneli","accusative-definite-nominative-plural":"jăcmănelile","dative-genitive-indefinite-singular":"jăcmăneli","dative-definite-genitive-singular":"jăcmănelii","dative-genitive-indefinite-plural":"jăcmăneli","dative-definite-genitive-plural":"jăcmănelilor","singular-vocative":"jăcmăneală","plural-vocative":"jăcmănelilor"}},{"word":"jăcmăni","pos":"verb","definitions":["alternative form of jecmăni"],"forms":{"canonical":"a jăcmăni 4th conjugation","present-singular-third-person":"jăcmănește","participle-past":"jăcmănit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jăcmăni","gerund":"jăcmănind","first-person-indicative-present-singular":"jăcmănesc","indicative-present-second-person-singular":"jăcmănești","indicative-present-singular-third-person":"jăcmănește","first-person-indicative-plural-present":"jăcmănim","indicative-plural-present-second-person":"jăcmăniți","indicative-plural-present-third-person":"jăcmănesc","first-person-imperfect-indicative-singular":"jăcmăneam","imperfect-indicative-second-person-singular":"jăcmăneai","imperfect-indicative-singular-third-person":"jăcmănea","first-person-imperfect-indicative-plural":"jăcmăneam","imperfect-indicative-plural-second-person":"jăcmăneați","imperfect-indicative-plural-third-person":"jăcmăneau","first-person-indicative-perfect-singular":"jăcmănii","indicative-perfect-second-person-singular":"jăcmăniși","indicative-perfect-singular-third-person":"jăcmăni","first-person-indicative-perfect-plural":"jăcmănirăm","indicative-perfect-plural-second-person":"jăcmănirăți","indicative-perfect-plural-third-person":"jăcmăniră","first-person-indicative-pluperfect-singular":"jăcmănisem","indicative-pluperfect-second-person-singular":"jăcmăniseși","indicative-pluperfect-singular-third-person":"jăcmănise","first-person-indicative-pluperfect-plural":"jăcmăniserăm","indicative-pluperfect-plural-second-person":"jăcmăniserăți","indicative-pluperfect-plural-third-person":"jăcmăniseră","first-person-present-singular-subjunctive":"să jăcmănesc","present-second-person-singular-subjunctive":"să jăcmănești","present-singular-subjunctive-third-person":"să jăcmănească","first-person-plural-present-subjunctive":"să jăcmănim","plural-present-second-person-subjunctive":"să jăcmăniți","plural-present-subjunctive-third-person":"să jăcmănească","imperative-second-person-singular":"jăcmănește","imperative-plural-second-person":"jăcmăniți","imperative-negative-second-person-singular":"nu jăcmăni","imperative-negative-plural-second-person":"nu jăcmăniți"}},{"word":"jacmar","pos":"noun","definitions":["jack, quarter jack"],"forms":{"plural":"jacmare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jacmar","accusative-definite-nominative-singular":"jacmarul","accusative-indefinite-nominative-plural":"jacmare","accusative-definite-nominative-plural":"jacmarele","dative-genitive-indefinite-singular":"jacmar","dative-definite-genitive-singular":"jacmarului","dative-genitive-indefinite-plural":"jacmare","dative-definite-genitive-plural":"jacmarelor","singular-vocative":"jacmarule","plural-vocative":"jacmarelor"}},{"word":"jacobin","pos":"noun","definitions":["obsolete form of iacobin"],"forms":{"plural":"jacobini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jacobin","accusative-definite-nominative-singular":"jacobinul","accusative-indefinite-nominative-plural":"jacobini","accusative-definite-nominative-plural":"jacobinii","dative-genitive-indefinite-singular":"jacobin","dative-definite-genitive-singular":"jacobinului","dative-genitive-indefinite-plural":"jacobini","dative-definite-genitive-plural":"jacobinilor","singular-vocative":"jacobinule","plural-vocative":"jacobinilor"}},{"word":"Jacodu","pos":"name","definitions":["a village in Vețca, Mureș County, Romania"],"gender":"m"},{"word":"Jacota","pos":"name","definitions":["a village in Vulturești, Suceava County, Romania"],"gender":"f"},{"word":"jacquerie","pos":"noun","definitions":["jacquerie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"jacquerie","accusative-definite-nominative":"jacqueria","dative-genitive-indefinite":"jacquerii","dative-definite-genitive":"jacqueriei","vocative":"jacquerie"}},{"word":"jăcui","pos":"verb","definitions":["obsolete form of jefui"],"forms":{"canonical":"a jăcui 4th conjugation","present-singular-third-person":"jăcuiește","participle-past":"jăcuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jăcui","gerund":"jăcuind","first-person-indicative-present-singular":"jăcuiesc","indicative-present-second-person-singular":"jăcuiești","indicative-present-singular-third-person":"jăcuiește","first-person-indicative-plural-present":"jăcuim","indicative-plural-present-second-person":"jăcuiți","indicative-plural-present-third-person":"jăcuiesc","first-person-imperfect-indicative-singular":"jăcuiam","imperfect-indicative-second-person-singular":"jăcuiai","imperfect-indicative-singular-third-person":"jăcuia","first-person-imperfect-indicative-plural":"jăcuiam","imperfect-indicative-plural-second-person":"jăcuiați","imperfect-indicative-plural-third-person":"jăcuiau","first-person-indicative-perfect-singular":"jăcuii","indicative-perfect-second-person-singular":"jăcuiși","indicative-perfect-singular-third-person":"jăcui","first-person-indicative-perfect-plural":"jăcuirăm","indicative-perfect-plural-second-person":"jăcuirăți","indicative-perfect-plural-third-person":"jăcuiră","first-person-indicative-pluperfect-singular":"jăcuisem","indicative-pluperfect-second-person-singular":"jăcuiseși","indicative-pluperfect-singular-third-person":"jăcuise","first-person-indicative-pluperfect-plural":"jăcuiserăm","indicative-pluperfect-plural-second-person":"jăcuiserăți","indicative-pluperfect-plural-third-person":"jăcuiseră","first-person-present-singular-subjunctive":"să jăcuiesc","present-second-person-singular-subjunctive":"să jăcuiești","present-singular-subjunctive-third-person":"să jăcuiască","first-person-plural-present-subjunctive":"să jăcuim","plural-present-second-person-subjunctive":"să jăcuiți","plural-present-subjunctive-third-person":"să jăcuiască","imperative-second-person-singular":"jăcuiește","imperative-plural-second-person":"jăcuiți","imperative-negative-second-person-singular":"nu jăcui","imperative-negative-plural-second-person":"nu jăcuiți"}},{"word":"jăcuire","pos":"noun","definitions":["obsolete form of jefuire"],"forms":{"plural":"jăcuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jăcuire","accusative-definite-nominative-singular":"jăcuirea","accusative-indefinite-nominative-plural":"jăcuiri","accusative-definite-nominative-plural":"jăcuirile","dative-genitive-indefinite-singular":"jăcuiri","dative-definite-genitive-singular":"jăcuirii","dative-genitive-indefinite-plural":"jăcuiri","dative-definite-genitive-plural":"jăcuirilor","singular-vocative":"jăcuire","plural-vocative":"jăcuirilor"}},{"word":"jăcuitor","pos":"noun","definitions":["obsolete form of jefuitor"],"forms":{"plural":"jăcuitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jăcuitor","accusative-definite-nominative-singular":"jăcuitorul","accusative-indefinite-nominative-plural":"jăcuitori","accusative-definite-nominative-plural":"jăcuitorii","dative-genitive-indefinite-singular":"jăcuitor","dative-definite-genitive-singular":"jăcuitorului","dative-genitive-indefinite-plural":"jăcuitori","dative-definite-genitive-plural":"jăcuitorilor","singular-vocative":"jăcuitorule","plural-vocative":"jăcuitorilor"}},{"word":"jacuzzi","pos":"noun","definitions":["jacuzzi"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jacuzzi","accusative-definite-nominative":"jacuzziul","dative-genitive-indefinite":"jacuzzi","dative-definite-genitive":"jacuzziului","vocative":"jacuzziule"}},{"word":"jad","pos":"noun","definitions":["jade"],"forms":{"plural":"jaduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jad","accusative-definite-nominative-singular":"jadul","accusative-indefinite-nominative-plural":"jaduri","accusative-definite-nominative-plural":"jadurile","dative-genitive-indefinite-singular":"jad","dative-definite-genitive-singular":"jadului","dative-genitive-indefinite-plural":"jaduri","dative-definite-genitive-plural":"jadurilor","singular-vocative":"jadule","plural-vocative":"jadurilor"}},{"word":"jadeit","pos":"noun","definitions":["jadeite"],"forms":{"plural":"jadeite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jadeit","accusative-definite-nominative-singular":"jadeitul","accusative-indefinite-nominative-plural":"jadeite","accusative-definite-nominative-plural":"jadeitele","dative-genitive-indefinite-singular":"jadeit","dative-definite-genitive-singular":"jadeitului","dative-genitive-indefinite-plural":"jadeite","dative-definite-genitive-plural":"jadeitelor","singular-vocative":"jadeitule","plural-vocative":"jadeitelor"}},{"word":"jăete","pos":"noun","definitions":["common minnow (Phoxinus phoxinus)"],"forms":{"plural":"jăeteți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jăete","accusative-definite-nominative-singular":"jăeteul","accusative-indefinite-nominative-plural":"jăeteți","accusative-definite-nominative-plural":"jăeteții","dative-genitive-indefinite-singular":"jăete","dative-definite-genitive-singular":"jăeteului","dative-genitive-indefinite-plural":"jăeteți","dative-definite-genitive-plural":"jăeteților","singular-vocative":"jăeteule","plural-vocative":"jăeteților"}},{"word":"jaf","pos":"noun","definitions":["robbery"],"forms":{"plural":"jafuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jaf","accusative-definite-nominative-singular":"jaful","accusative-indefinite-nominative-plural":"jafuri","accusative-definite-nominative-plural":"jafurile","dative-genitive-indefinite-singular":"jaf","dative-definite-genitive-singular":"jafului","dative-genitive-indefinite-plural":"jafuri","dative-definite-genitive-plural":"jafurilor","singular-vocative":"jafule","plural-vocative":"jafurilor"}},{"word":"jăfuire","pos":"noun","definitions":["obsolete form of jefuire"],"forms":{"plural":"jăfuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jăfuire","accusative-definite-nominative-singular":"jăfuirea","accusative-indefinite-nominative-plural":"jăfuiri","accusative-definite-nominative-plural":"jăfuirile","dative-genitive-indefinite-singular":"jăfuiri","dative-definite-genitive-singular":"jăfuirii","dative-genitive-indefinite-plural":"jăfuiri","dative-definite-genitive-plural":"jăfuirilor","singular-vocative":"jăfuire","plural-vocative":"jăfuirilor"}},{"word":"jagardea","pos":"noun","definitions":["an old, ragged, worn down piece of clothing","a person who is dirty, disheveled, disgusting, reproachful, reprehensible, insane, etc. or who inspires disgust, loathing, and aversion in others","a woman of loose morals or one who engages in scandalous behavior"],"forms":{"plural":"jagardele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"jagardea","accusative-definite-nominative-singular":"jagardeaua","accusative-indefinite-nominative-plural":"jagardele","accusative-definite-nominative-plural":"jagardelele","dative-genitive-indefinite-singular":"jagardele","dative-definite-genitive-singular":"jagardelei","dative-genitive-indefinite-plural":"jagardele","dative-definite-genitive-plural":"jagardelelor","singular-vocative":"jagardea","plural-vocative":"jagardelelor"}},{"word":"jaghetă","pos":"noun","definitions":["obsolete form of jachetă"],"forms":{"plural":"jaghete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jaghetă","accusative-definite-nominative-singular":"jagheta","accusative-indefinite-nominative-plural":"jaghete","accusative-definite-nominative-plural":"jaghetele","dative-genitive-indefinite-singular":"jaghete","dative-definite-genitive-singular":"jaghetei","dative-genitive-indefinite-plural":"jaghete","dative-definite-genitive-plural":"jaghetelor","singular-vocative":"jaghetă","plural-vocative":"jaghetelor"}},{"word":"jaguar","pos":"noun","definitions":["jaguar"],"pronunciation":"/ʒa.ɡuˈar/","forms":{"plural":"jaguari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jaguar","accusative-definite-nominative-singular":"jaguarul","accusative-indefinite-nominative-plural":"jaguari","accusative-definite-nominative-plural":"jaguarii","dative-genitive-indefinite-singular":"jaguar","dative-definite-genitive-singular":"jaguarului","dative-genitive-indefinite-plural":"jaguari","dative-definite-genitive-plural":"jaguarilor","singular-vocative":"jaguarule","plural-vocative":"jaguarilor"}},{"word":"jaguari","pos":"noun","definitions":["indefinite plural of jaguar"],"pronunciation":"[ʒaɡuˈarʲ]","gender":"m-p"},{"word":"jaguarundi","pos":"noun","definitions":["jaguarundi"],"forms":{"plural":"jaguarundi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jaguarundi","accusative-definite-nominative-singular":"jaguarundiul","accusative-indefinite-nominative-plural":"jaguarundi","accusative-definite-nominative-plural":"jaguarundii","dative-genitive-indefinite-singular":"jaguarundi","dative-definite-genitive-singular":"jaguarundiului","dative-genitive-indefinite-plural":"jaguarundi","dative-definite-genitive-plural":"jaguarundilor","singular-vocative":"jaguarundiule","plural-vocative":"jaguarundilor"}},{"word":"jainism","pos":"noun","definitions":["Jainism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jainism","accusative-definite-nominative-singular":"jainismul","accusative-indefinite-nominative-plural":"jainisme","accusative-definite-nominative-plural":"jainismele","dative-genitive-indefinite-singular":"jainism","dative-definite-genitive-singular":"jainismului","dative-genitive-indefinite-plural":"jainisme","dative-definite-genitive-plural":"jainismelor","singular-vocative":"jainismule","plural-vocative":"jainismelor"}},{"word":"jainist","pos":"noun","definitions":["Jainist"],"forms":{"plural":"jainiști","feminine":"equivalent jainistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jainist","accusative-definite-nominative-singular":"jainistul","accusative-indefinite-nominative-plural":"jainiști","accusative-definite-nominative-plural":"jainiștii","dative-genitive-indefinite-singular":"jainist","dative-definite-genitive-singular":"jainistului","dative-genitive-indefinite-plural":"jainiști","dative-definite-genitive-plural":"jainiștilor","singular-vocative":"jainistule","plural-vocative":"jainiștilor"}},{"word":"jainistă","pos":"noun","definitions":["female equivalent of jainist"],"forms":{"plural":"jainiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jainistă","accusative-definite-nominative-singular":"jainista","accusative-indefinite-nominative-plural":"jainiste","accusative-definite-nominative-plural":"jainistele","dative-genitive-indefinite-singular":"jainiste","dative-definite-genitive-singular":"jainistei","dative-genitive-indefinite-plural":"jainiste","dative-definite-genitive-plural":"jainistelor","singular-vocative":"jainistă","plural-vocative":"jainistelor"}},{"word":"jais","pos":"noun","definitions":["jet (coal)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jais","accusative-definite-nominative":"jaisul","dative-genitive-indefinite":"jais","dative-definite-genitive":"jaisului","vocative":"jaisule"}},{"word":"jălanie","pos":"noun","definitions":["obsolete form of jelanie"],"forms":{"plural":"jălanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jălanie","accusative-definite-nominative-singular":"jălania","accusative-indefinite-nominative-plural":"jălanii","accusative-definite-nominative-plural":"jălaniile","dative-genitive-indefinite-singular":"jălanii","dative-definite-genitive-singular":"jălaniei","dative-genitive-indefinite-plural":"jălanii","dative-definite-genitive-plural":"jălaniilor","singular-vocative":"jălanie","plural-vocative":"jălaniilor"}},{"word":"Jalba","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jalba"}},{"word":"Jalbă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jalbă"}},{"word":"jalbă","pos":"noun","definitions":["complaint, written reclamation"],"forms":{"plural":"jalbe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jalbă","accusative-definite-nominative-singular":"jalba","accusative-indefinite-nominative-plural":"jalbe","accusative-definite-nominative-plural":"jalbele","dative-genitive-indefinite-singular":"jalbe","dative-definite-genitive-singular":"jalbei","dative-genitive-indefinite-plural":"jalbe","dative-definite-genitive-plural":"jalbelor","singular-vocative":"jalbă","plural-vocative":"jalbelor"}},{"word":"jale","pos":"noun","definitions":["grief, distress"],"pronunciation":"/ˈʒa.le/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"jale","accusative-definite-nominative":"jalea","dative-genitive-indefinite":"jale","dative-definite-genitive":"jalei","vocative":"jale"}},{"word":"jale","pos":"noun","definitions":["common sage (Salvia officinalis)"],"pronunciation":"/ˈʒa.le/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"jale","accusative-definite-nominative":"jalea","dative-genitive-indefinite":"jale","dative-definite-genitive":"jalei","vocative":"jale"}},{"word":"jalea","pos":"noun","definitions":["definite nominative/accusative singular of jale"],"pronunciation":"/ˈʒa.le̯a/","gender":"f"},{"word":"jalei","pos":"noun","definitions":["definite genitive/dative singular of jale"],"pronunciation":"/ˈʒa.lej/","gender":"f"},{"word":"jaleo","pos":"noun","definitions":["vocative singular of jale"],"pronunciation":"[ˈʒale̯o]","gender":"f"},{"word":"jaleo","pos":"noun","definitions":["jaleo"],"forms":{"plural":"jaleo","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jaleo","accusative-definite-nominative-singular":"jaleoul","accusative-indefinite-nominative-plural":"jaleo","accusative-definite-nominative-plural":"jaleole","dative-genitive-indefinite-singular":"jaleo","dative-definite-genitive-singular":"jaleoului","dative-genitive-indefinite-plural":"jaleo","dative-definite-genitive-plural":"jaleolor","singular-vocative":"jaleoule","plural-vocative":"jaleolor"}},{"word":"Jaleș","pos":"name","definitions":["a river in Gorj, Romania, tributary to the Tismana"],"gender":"m"},{"word":"jalet","pos":"noun","definitions":["wail"],"forms":{"plural":"jalete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jalet","accusative-definite-nominative-singular":"jaletul","accusative-indefinite-nominative-plural":"jalete","accusative-definite-nominative-plural":"jaletele","dative-genitive-indefinite-singular":"jalet","dative-definite-genitive-singular":"jaletului","dative-genitive-indefinite-plural":"jalete","dative-definite-genitive-plural":"jaletelor","singular-vocative":"jaletule","plural-vocative":"jaletelor"}},{"word":"jălire","pos":"noun","definitions":["obsolete form of jelire"],"forms":{"plural":"jăliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jălire","accusative-definite-nominative-singular":"jălirea","accusative-indefinite-nominative-plural":"jăliri","accusative-definite-nominative-plural":"jălirile","dative-genitive-indefinite-singular":"jăliri","dative-definite-genitive-singular":"jălirii","dative-genitive-indefinite-plural":"jăliri","dative-definite-genitive-plural":"jălirilor","singular-vocative":"jălire","plural-vocative":"jălirilor"}},{"word":"jalnic","pos":"adj","definitions":["distressing, lamentable"],"pronunciation":"/ˈʒalnik/","forms":{"feminine-singular":"jalnică","masculine-plural":"jalnici","feminine-neuter-plural":"jalnice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"jalnic","error-unrecognized-form-feminine-indefinite-singular":"jalnică","error-unrecognized-form-indefinite-masculine-plural":"jalnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"jalnice","definite-error-unrecognized-form-masculine-neuter-singular":"jalnicul","definite-error-unrecognized-form-feminine-singular":"jalnica","definite-error-unrecognized-form-masculine-plural":"jalnicii","definite-error-unrecognized-form-feminine-neuter-plural":"jalnicele"}},{"word":"jalnic","pos":"adv","definitions":["distressingly"],"pronunciation":"/ˈʒalnik/"},{"word":"jalobă","pos":"noun","definitions":["alternative form of jalbă"],"forms":{"plural":"jalobe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jalobă","accusative-definite-nominative-singular":"jaloba","accusative-indefinite-nominative-plural":"jalobe","accusative-definite-nominative-plural":"jalobele","dative-genitive-indefinite-singular":"jalobe","dative-definite-genitive-singular":"jalobei","dative-genitive-indefinite-plural":"jalobe","dative-definite-genitive-plural":"jalobelor","singular-vocative":"jalobă","plural-vocative":"jalobelor"}},{"word":"Jalobeanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jalobeanu"}},{"word":"jalon","pos":"noun","definitions":["stake (surveyor's)"],"forms":{"plural":"jaloane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jalon","accusative-definite-nominative-singular":"jalonul","accusative-indefinite-nominative-plural":"jaloane","accusative-definite-nominative-plural":"jaloanele","dative-genitive-indefinite-singular":"jalon","dative-definite-genitive-singular":"jalonului","dative-genitive-indefinite-plural":"jaloane","dative-definite-genitive-plural":"jaloanelor","singular-vocative":"jalonule","plural-vocative":"jaloanelor"}},{"word":"jalona","pos":"verb","definitions":["to stake out"],"forms":{"canonical":"a jalona 1st conjugation","present-singular-third-person":"jalonează","participle-past":"jalonat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a jalona","gerund":"jalonând","first-person-indicative-present-singular":"jalonez","indicative-present-second-person-singular":"jalonezi","indicative-present-singular-third-person":"jalonează","first-person-indicative-plural-present":"jalonăm","indicative-plural-present-second-person":"jalonați","indicative-plural-present-third-person":"jalonează","first-person-imperfect-indicative-singular":"jalonam","imperfect-indicative-second-person-singular":"jalonai","imperfect-indicative-singular-third-person":"jalona","first-person-imperfect-indicative-plural":"jalonam","imperfect-indicative-plural-second-person":"jalonați","imperfect-indicative-plural-third-person":"jalonau","first-person-indicative-perfect-singular":"jalonai","indicative-perfect-second-person-singular":"jalonași","indicative-perfect-singular-third-person":"jalonă","first-person-indicative-perfect-plural":"jalonarăm","indicative-perfect-plural-second-person":"jalonarăți","indicative-perfect-plural-third-person":"jalonară","first-person-indicative-pluperfect-singular":"jalonasem","indicative-pluperfect-second-person-singular":"jalonaseși","indicative-pluperfect-singular-third-person":"jalonase","first-person-indicative-pluperfect-plural":"jalonaserăm","indicative-pluperfect-plural-second-person":"jalonaserăți","indicative-pluperfect-plural-third-person":"jalonaseră","first-person-present-singular-subjunctive":"să jalonez","present-second-person-singular-subjunctive":"să jalonezi","present-singular-subjunctive-third-person":"să jaloneze","first-person-plural-present-subjunctive":"să jalonăm","plural-present-second-person-subjunctive":"să jalonați","plural-present-subjunctive-third-person":"să jaloneze","imperative-second-person-singular":"jalonează","imperative-plural-second-person":"jalonați","imperative-negative-second-person-singular":"nu jalona","imperative-negative-plural-second-person":"nu jalonați"}},{"word":"jaloste","pos":"noun","definitions":["grief"],"forms":{"plural":"jalosti","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jaloste","accusative-definite-nominative-singular":"jalostea","accusative-indefinite-nominative-plural":"jalosti","accusative-definite-nominative-plural":"jalostile","dative-genitive-indefinite-singular":"jalosti","dative-definite-genitive-singular":"jalostii","dative-genitive-indefinite-plural":"jalosti","dative-definite-genitive-plural":"jalostilor","singular-vocative":"jaloste","plural-vocative":"jalostilor"}},{"word":"jalovanie","pos":"noun","definitions":["gratuity"],"forms":{"plural":"jalovanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jalovanie","accusative-definite-nominative-singular":"jalovania","accusative-indefinite-nominative-plural":"jalovanii","accusative-definite-nominative-plural":"jalovaniile","dative-genitive-indefinite-singular":"jalovanii","dative-definite-genitive-singular":"jalovaniei","dative-genitive-indefinite-plural":"jalovanii","dative-definite-genitive-plural":"jalovaniilor","singular-vocative":"jalovanie","plural-vocative":"jalovaniilor"}},{"word":"jâlț","pos":"noun","definitions":["obsolete form of jeț"],"forms":{"plural":"jâlțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jâlț","accusative-definite-nominative-singular":"jâlțul","accusative-indefinite-nominative-plural":"jâlțuri","accusative-definite-nominative-plural":"jâlțurile","dative-genitive-indefinite-singular":"jâlț","dative-definite-genitive-singular":"jâlțului","dative-genitive-indefinite-plural":"jâlțuri","dative-definite-genitive-plural":"jâlțurilor","singular-vocative":"jâlțule","plural-vocative":"jâlțurilor"}},{"word":"jălțuiaș","pos":"noun","definitions":["diminutive of jelț"],"forms":{"plural":"jălțuiașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jălțuiaș","accusative-definite-nominative-singular":"jălțuiașul","accusative-indefinite-nominative-plural":"jălțuiașe","accusative-definite-nominative-plural":"jălțuiașele","dative-genitive-indefinite-singular":"jălțuiaș","dative-definite-genitive-singular":"jălțuiașului","dative-genitive-indefinite-plural":"jălțuiașe","dative-definite-genitive-plural":"jălțuiașelor","singular-vocative":"jălțuiașule","plural-vocative":"jălțuiașelor"}},{"word":"jăluire","pos":"noun","definitions":["obsolete form of jeluire"],"forms":{"plural":"jăluiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jăluire","accusative-definite-nominative-singular":"jăluirea","accusative-indefinite-nominative-plural":"jăluiri","accusative-definite-nominative-plural":"jăluirile","dative-genitive-indefinite-singular":"jăluiri","dative-definite-genitive-singular":"jăluirii","dative-genitive-indefinite-plural":"jăluiri","dative-definite-genitive-plural":"jăluirilor","singular-vocative":"jăluire","plural-vocative":"jăluirilor"}},{"word":"jăluitor","pos":"adj","definitions":["obsolete form of jeluitor"],"forms":{"feminine-singular":"jăluitoare","masculine-plural":"jăluitori","feminine-neuter-plural":"jăluitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jăluitor","error-unrecognized-form-feminine-indefinite-singular":"jăluitoare","error-unrecognized-form-indefinite-masculine-plural":"jăluitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"jăluitoare","definite-error-unrecognized-form-masculine-neuter-singular":"jăluitorul","definite-error-unrecognized-form-feminine-singular":"jăluitoarea","definite-error-unrecognized-form-masculine-plural":"jăluitorii","definite-error-unrecognized-form-feminine-neuter-plural":"jăluitoarele"}},{"word":"jaluzea","pos":"noun","definitions":["blind (covering for windows)"],"forms":{"plural":"jaluzele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"jaluzea","accusative-definite-nominative-singular":"jaluzeaua","accusative-indefinite-nominative-plural":"jaluzele","accusative-definite-nominative-plural":"jaluzelele","dative-genitive-indefinite-singular":"jaluzele","dative-definite-genitive-singular":"jaluzelei","dative-genitive-indefinite-plural":"jaluzele","dative-definite-genitive-plural":"jaluzelelor","singular-vocative":"jaluzea","plural-vocative":"jaluzelelor"}},{"word":"jaluzie","pos":"noun","definitions":["jalousie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jaluzie","accusative-definite-nominative-singular":"jaluzia","accusative-indefinite-nominative-plural":"jaluzii","accusative-definite-nominative-plural":"jaluziile","dative-genitive-indefinite-singular":"jaluzii","dative-definite-genitive-singular":"jaluziei","dative-genitive-indefinite-plural":"jaluzii","dative-definite-genitive-plural":"jaluziilor","singular-vocative":"jaluzie","plural-vocative":"jaluziilor"}},{"word":"jamaică","pos":"noun","definitions":["Jamaica rum"],"forms":{"plural":"jamaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jamaică","accusative-definite-nominative-singular":"jamaica","accusative-indefinite-nominative-plural":"jamaice","accusative-definite-nominative-plural":"jamaicele","dative-genitive-indefinite-singular":"jamaice","dative-definite-genitive-singular":"jamaicei","dative-genitive-indefinite-plural":"jamaice","dative-definite-genitive-plural":"jamaicelor","singular-vocative":"jamaică","plural-vocative":"jamaicelor"}},{"word":"jamaican","pos":"noun","definitions":["Jamaican"],"pronunciation":"/ʒa.majˈkan/","forms":{"plural":"jamaicani","feminine":"equivalent jamaicană"}},{"word":"jamaican","pos":"adj","definitions":["Jamaican"],"pronunciation":"/ʒa.majˈkan/","forms":{"feminine-singular":"jamaicană","masculine-plural":"jamaicani","feminine-neuter-plural":"jamaicane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jamaican","error-unrecognized-form-feminine-indefinite-singular":"jamaicană","error-unrecognized-form-indefinite-masculine-plural":"jamaicani","error-unrecognized-form-feminine-indefinite-neuter-plural":"jamaicane","definite-error-unrecognized-form-masculine-neuter-singular":"jamaicanul","definite-error-unrecognized-form-feminine-singular":"jamaicana","definite-error-unrecognized-form-masculine-plural":"jamaicanii","definite-error-unrecognized-form-feminine-neuter-plural":"jamaicanele"}},{"word":"jamaicană","pos":"noun","definitions":["female equivalent of jamaican"],"forms":{"plural":"jamaicane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jamaicană","accusative-definite-nominative-singular":"jamaicana","accusative-indefinite-nominative-plural":"jamaicane","accusative-definite-nominative-plural":"jamaicanele","dative-genitive-indefinite-singular":"jamaicane","dative-definite-genitive-singular":"jamaicanei","dative-genitive-indefinite-plural":"jamaicane","dative-definite-genitive-plural":"jamaicanelor","singular-vocative":"jamaicană","plural-vocative":"jamaicanelor"}},{"word":"jambieră","pos":"noun","definitions":["puttee"],"forms":{"plural":"jambiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jambieră","accusative-definite-nominative-singular":"jambiera","accusative-indefinite-nominative-plural":"jambiere","accusative-definite-nominative-plural":"jambierele","dative-genitive-indefinite-singular":"jambiere","dative-definite-genitive-singular":"jambierei","dative-genitive-indefinite-plural":"jambiere","dative-definite-genitive-plural":"jambierelor","singular-vocative":"jambieră","plural-vocative":"jambierelor"}},{"word":"jâmblăcaș","pos":"noun","definitions":["semolina"],"forms":{"plural":"jâmblăcașuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jâmblăcaș","accusative-definite-nominative-singular":"jâmblăcașul","accusative-indefinite-nominative-plural":"jâmblăcașuri","accusative-definite-nominative-plural":"jâmblăcașurile","dative-genitive-indefinite-singular":"jâmblăcaș","dative-definite-genitive-singular":"jâmblăcașului","dative-genitive-indefinite-plural":"jâmblăcașuri","dative-definite-genitive-plural":"jâmblăcașurilor","singular-vocative":"jâmblăcașule","plural-vocative":"jâmblăcașurilor"}},{"word":"jambon","pos":"noun","definitions":["ham"],"forms":{"plural":"jamboane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jambon","accusative-definite-nominative-singular":"jambonul","accusative-indefinite-nominative-plural":"jamboane","accusative-definite-nominative-plural":"jamboanele","dative-genitive-indefinite-singular":"jambon","dative-definite-genitive-singular":"jambonului","dative-genitive-indefinite-plural":"jamboane","dative-definite-genitive-plural":"jamboanelor","singular-vocative":"jambonule","plural-vocative":"jamboanelor"}},{"word":"jamboree","pos":"noun","definitions":["jamboree"],"forms":{"plural":"jamboree","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"jamboree","accusative-definite-nominative-singular":"jamboreea","accusative-indefinite-nominative-plural":"jamboree","accusative-definite-nominative-plural":"jamboreele","dative-genitive-indefinite-singular":"jamboree","dative-definite-genitive-singular":"jamboreei","dative-genitive-indefinite-plural":"jamboree","dative-definite-genitive-plural":"jamboreelor","singular-vocative":"jamboree","plural-vocative":"jamboreelor"}},{"word":"jamnă","pos":"noun","definitions":["Romanian barbel (Barbus petenyi)"],"forms":{"plural":"jamne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jamnă","accusative-definite-nominative-singular":"jamna","accusative-indefinite-nominative-plural":"jamne","accusative-definite-nominative-plural":"jamnele","dative-genitive-indefinite-singular":"jamne","dative-definite-genitive-singular":"jamnei","dative-genitive-indefinite-plural":"jamne","dative-definite-genitive-plural":"jamnelor","singular-vocative":"jamnă","plural-vocative":"jamnelor"}},{"word":"Jamu Mare","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Jamu Mare, Timiș County, Romania"],"gender":"m"},{"word":"janc","pos":"noun","definitions":["connection, bond, link, conjunction"],"forms":{"plural":"jancuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"janc","accusative-definite-nominative-singular":"jancul","accusative-indefinite-nominative-plural":"jancuri","accusative-definite-nominative-plural":"jancurile","dative-genitive-indefinite-singular":"janc","dative-definite-genitive-singular":"jancului","dative-genitive-indefinite-plural":"jancuri","dative-definite-genitive-plural":"jancurilor","singular-vocative":"jancule","plural-vocative":"jancurilor"}},{"word":"jandar","pos":"noun","definitions":["alternative form of jandarm"],"forms":{"plural":"jăndari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jandar","accusative-definite-nominative-singular":"jandarul","accusative-indefinite-nominative-plural":"jăndari","accusative-definite-nominative-plural":"jăndarii","dative-genitive-indefinite-singular":"jandar","dative-definite-genitive-singular":"jandarului","dative-genitive-indefinite-plural":"jăndari","dative-definite-genitive-plural":"jăndarilor","singular-vocative":"jandarule","plural-vocative":"jăndarilor"}},{"word":"jăndar","pos":"noun","definitions":["obsolete form of jandarm"],"forms":{"plural":"jăndari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jăndar","accusative-definite-nominative-singular":"jăndarul","accusative-indefinite-nominative-plural":"jăndari","accusative-definite-nominative-plural":"jăndarii","dative-genitive-indefinite-singular":"jăndar","dative-definite-genitive-singular":"jăndarului","dative-genitive-indefinite-plural":"jăndari","dative-definite-genitive-plural":"jăndarilor","singular-vocative":"jăndarule","plural-vocative":"jăndarilor"}},{"word":"jandarm","pos":"noun","definitions":["gendarme (member of the gendarmerie)","wife"],"pronunciation":"/ʒanˈdarm/","forms":{"plural":"jandarmi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jandarm","accusative-definite-nominative-singular":"jandarmul","accusative-indefinite-nominative-plural":"jandarmi","accusative-definite-nominative-plural":"jandarmii","dative-genitive-indefinite-singular":"jandarm","dative-definite-genitive-singular":"jandarmului","dative-genitive-indefinite-plural":"jandarmi","dative-definite-genitive-plural":"jandarmilor","singular-vocative":"jandarmule","plural-vocative":"jandarmilor","alternative-common":"jandar"}},{"word":"jandarmeresc","pos":"adj","definitions":["gendarme"],"forms":{"feminine-singular":"jandarmerească","plural":"jandarmerești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jandarmeresc","error-unrecognized-form-feminine-indefinite-singular":"jandarmerească","error-unrecognized-form-indefinite-masculine-plural":"jandarmerești","error-unrecognized-form-feminine-indefinite-neuter-plural":"jandarmerești","definite-error-unrecognized-form-masculine-neuter-singular":"jandarmerescul","definite-error-unrecognized-form-feminine-singular":"jandarmereasca","definite-error-unrecognized-form-masculine-plural":"jandarmereștii","definite-error-unrecognized-form-feminine-neuter-plural":"jandarmereștile"}},{"word":"jandarmerie","pos":"noun","definitions":["gendarmerie"],"forms":{"plural":"jandarmerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jandarmerie","accusative-definite-nominative-singular":"jandarmeria","accusative-indefinite-nominative-plural":"jandarmerii","accusative-definite-nominative-plural":"jandarmeriile","dative-genitive-indefinite-singular":"jandarmerii","dative-definite-genitive-singular":"jandarmeriei","dative-genitive-indefinite-plural":"jandarmerii","dative-definite-genitive-plural":"jandarmeriilor","singular-vocative":"jandarmerie","plural-vocative":"jandarmeriilor"}},{"word":"Jandarmu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Jandarmu"}},{"word":"janghină","pos":"noun","definitions":["a horse disease","term used as an insult"],"forms":{"plural":"janghine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"janghină","accusative-definite-nominative-singular":"janghina","accusative-indefinite-nominative-plural":"janghine","accusative-definite-nominative-plural":"janghinele","dative-genitive-indefinite-singular":"janghine","dative-definite-genitive-singular":"janghinei","dative-genitive-indefinite-plural":"janghine","dative-definite-genitive-plural":"janghinelor","singular-vocative":"janghină","plural-vocative":"janghinelor"}},{"word":"janghinos","pos":"adj","definitions":["dirty, unkempt"],"forms":{"feminine-singular":"janghinoasă","masculine-plural":"janghinoși","feminine-neuter-plural":"janghinoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"janghinos","error-unrecognized-form-feminine-indefinite-singular":"janghinoasă","error-unrecognized-form-indefinite-masculine-plural":"janghinoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"janghinoase","definite-error-unrecognized-form-masculine-neuter-singular":"janghinosul","definite-error-unrecognized-form-feminine-singular":"janghinoasa","definite-error-unrecognized-form-masculine-plural":"janghinoșii","definite-error-unrecognized-form-feminine-neuter-plural":"janghinoasele"}},{"word":"Jangu Bradului","pos":"name","definitions":["a river in Vâlcea County, Romania, tributary to the Pârâul Ștreaurilor"],"gender":"m"},{"word":"janilie","pos":"noun","definitions":["chenille"],"forms":{"plural":"janilii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"janilie","accusative-definite-nominative-singular":"janilieul","accusative-indefinite-nominative-plural":"janilii","accusative-definite-nominative-plural":"janiliile","dative-genitive-indefinite-singular":"janilie","dative-definite-genitive-singular":"janilieului","dative-genitive-indefinite-plural":"janilii","dative-definite-genitive-plural":"janiliilor","singular-vocative":"janilieule","plural-vocative":"janiliilor"}},{"word":"jansenism","pos":"noun","definitions":["Jansenism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jansenism","accusative-definite-nominative-singular":"jansenismul","accusative-indefinite-nominative-plural":"jansenisme","accusative-definite-nominative-plural":"jansenismele","dative-genitive-indefinite-singular":"jansenism","dative-definite-genitive-singular":"jansenismului","dative-genitive-indefinite-plural":"jansenisme","dative-definite-genitive-plural":"jansenismelor","singular-vocative":"jansenismule","plural-vocative":"jansenismelor"}},{"word":"jansenist","pos":"noun","definitions":["Jansenist"],"forms":{"plural":"janseniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jansenist","accusative-definite-nominative-singular":"jansenistul","accusative-indefinite-nominative-plural":"janseniști","accusative-definite-nominative-plural":"janseniștii","dative-genitive-indefinite-singular":"jansenist","dative-definite-genitive-singular":"jansenistului","dative-genitive-indefinite-plural":"janseniști","dative-definite-genitive-plural":"janseniștilor","singular-vocative":"jansenistule","plural-vocative":"janseniștilor"}},{"word":"jansenistă","pos":"noun","definitions":["female equivalent of jansenist"],"forms":{"plural":"janseniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jansenistă","accusative-definite-nominative-singular":"jansenista","accusative-indefinite-nominative-plural":"janseniste","accusative-definite-nominative-plural":"jansenistele","dative-genitive-indefinite-singular":"janseniste","dative-definite-genitive-singular":"jansenistei","dative-genitive-indefinite-plural":"janseniste","dative-definite-genitive-plural":"jansenistelor","singular-vocative":"jansenistă","plural-vocative":"jansenistelor"}},{"word":"janta","pos":"noun","definitions":["definite nominative/accusative singular of jantă"],"pronunciation":"[ˈʒanta]","gender":"f"},{"word":"jantă","pos":"noun","definitions":["wheel rim (car part)"],"forms":{"plural":"jante","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jantă","accusative-definite-nominative-singular":"janta","accusative-indefinite-nominative-plural":"jante","accusative-definite-nominative-plural":"jantele","dative-genitive-indefinite-singular":"jante","dative-definite-genitive-singular":"jantei","dative-genitive-indefinite-plural":"jante","dative-definite-genitive-plural":"jantelor","singular-vocative":"jantă","plural-vocative":"jantelor"}},{"word":"jante","pos":"noun","definitions":["inflection of jantă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈʒante]","gender":"f"},{"word":"jantei","pos":"noun","definitions":["definite genitive/dative singular of jantă"],"pronunciation":"[ˈʒantej]","gender":"f"},{"word":"janto","pos":"noun","definitions":["vocative singular of jantă"],"pronunciation":"[ˈʒanto]","gender":"f"},{"word":"jap","pos":"intj","definitions":["smack"]},{"word":"japă","pos":"noun","definitions":["twig"],"forms":{"plural":"jape","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"japă","accusative-definite-nominative-singular":"japa","accusative-indefinite-nominative-plural":"jape","accusative-definite-nominative-plural":"japele","dative-genitive-indefinite-singular":"jape","dative-definite-genitive-singular":"japei","dative-genitive-indefinite-plural":"jape","dative-definite-genitive-plural":"japelor","singular-vocative":"japă","plural-vocative":"japelor"}},{"word":"japanicesc","pos":"adj","definitions":["Japanese"],"forms":{"feminine-singular":"japanicească","plural":"japanicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"japanicesc","error-unrecognized-form-feminine-indefinite-singular":"japanicească","error-unrecognized-form-indefinite-masculine-plural":"japanicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"japanicești","definite-error-unrecognized-form-masculine-neuter-singular":"japanicescul","definite-error-unrecognized-form-feminine-singular":"japaniceasca","definite-error-unrecognized-form-masculine-plural":"japaniceștii","definite-error-unrecognized-form-feminine-neuter-plural":"japaniceștile"}},{"word":"japanologă","pos":"noun","definitions":["female equivalent of japanolog"],"forms":{"plural":"japanologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"japanologă","accusative-definite-nominative-singular":"japanologa","accusative-indefinite-nominative-plural":"japanologe","accusative-definite-nominative-plural":"japanologele","dative-genitive-indefinite-singular":"japanologe","dative-definite-genitive-singular":"japanologei","dative-genitive-indefinite-plural":"japanologe","dative-definite-genitive-plural":"japanologelor","singular-vocative":"japanologă","plural-vocative":"japanologelor"}},{"word":"japanologie","pos":"noun","definitions":["alternative form of japonologie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"japanologie","accusative-definite-nominative-singular":"japanologia","accusative-indefinite-nominative-plural":"japanologii","accusative-definite-nominative-plural":"japanologiile","dative-genitive-indefinite-singular":"japanologii","dative-definite-genitive-singular":"japanologiei","dative-genitive-indefinite-plural":"japanologii","dative-definite-genitive-plural":"japanologiilor","singular-vocative":"japanologie","plural-vocative":"japanologiilor"}},{"word":"japcă","pos":"noun","definitions":["thievery"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"japcă","accusative-definite-nominative":"japca","dative-genitive-indefinite":"japce","dative-definite-genitive":"japcei","vocative":"japcă"}},{"word":"jăpcan","pos":"noun","definitions":["a predatory man"],"forms":{"plural":"jăpcani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jăpcan","accusative-definite-nominative-singular":"jăpcanul","accusative-indefinite-nominative-plural":"jăpcani","accusative-definite-nominative-plural":"jăpcanii","dative-genitive-indefinite-singular":"jăpcan","dative-definite-genitive-singular":"jăpcanului","dative-genitive-indefinite-plural":"jăpcani","dative-definite-genitive-plural":"jăpcanilor","singular-vocative":"jăpcanule","plural-vocative":"jăpcanilor"}},{"word":"jăpcăneală","pos":"noun","definitions":["robbery"],"forms":{"plural":"jăpcăneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jăpcăneală","accusative-definite-nominative-singular":"jăpcăneala","accusative-indefinite-nominative-plural":"jăpcănele","accusative-definite-nominative-plural":"jăpcănelele","dative-genitive-indefinite-singular":"jăpcănele","dative-definite-genitive-singular":"jăpcănelei","dative-genitive-indefinite-plural":"jăpcănele","dative-definite-genitive-plural":"jăpcănelelor","singular-vocative":"jăpcăneală","plural-vocative":"jăpcănelelor"}},{"word":"jăpcănire","pos":"noun","definitions":["robbery"],"forms":{"plural":"jăpcăniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jăpcănire","accusative-definite-nominative-singular":"jăpcănirea","accusative-indefinite-nominative-plural":"jăpcăniri","accusative-definite-nominative-plural":"jăpcănirile","dative-genitive-indefinite-singular":"jăpcăniri","dative-definite-genitive-singular":"jăpcănirii","dative-genitive-indefinite-plural":"jăpcăniri","dative-definite-genitive-plural":"jăpcănirilor","singular-vocative":"jăpcănire","plural-vocative":"jăpcănirilor"}},{"word":"jăpcănit","pos":"adj","definitions":["robbed"],"forms":{"feminine-singular":"jăpcănită","masculine-plural":"jăpcăniți","feminine-neuter-plural":"jăpcănite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jăpcănit","error-unrecognized-form-feminine-indefinite-singular":"jăpcănită","error-unrecognized-form-indefinite-masculine-plural":"jăpcăniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jăpcănite","definite-error-unrecognized-form-masculine-neuter-singular":"jăpcănitul","definite-error-unrecognized-form-feminine-singular":"jăpcănita","definite-error-unrecognized-form-masculine-plural":"jăpcăniții","definite-error-unrecognized-form-feminine-neuter-plural":"jăpcănitele"}},{"word":"jăpcănit","pos":"verb","definitions":["past participle of jăpcăni"],"forms":{"participle-past":"of jăpcăni"}},{"word":"jăpcaș","pos":"noun","definitions":["thief"],"forms":{"plural":"jăpcași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jăpcaș","accusative-definite-nominative-singular":"jăpcașul","accusative-indefinite-nominative-plural":"jăpcași","accusative-definite-nominative-plural":"jăpcașii","dative-genitive-indefinite-singular":"jăpcaș","dative-definite-genitive-singular":"jăpcașului","dative-genitive-indefinite-plural":"jăpcași","dative-definite-genitive-plural":"jăpcașilor","singular-vocative":"jăpcașule","plural-vocative":"jăpcașilor"}},{"word":"japon","pos":"noun","definitions":["japanware (porcelain or silk)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"japon","accusative-definite-nominative":"japonul","dative-genitive-indefinite":"japon","dative-definite-genitive":"japonului","vocative":"japonule"}},{"word":"japonez","pos":"adj","definitions":["Japanese"],"pronunciation":"[ʒa.poˈnez]","forms":{"feminine-singular":"japoneză","masculine-plural":"japonezi","feminine-neuter-plural":"japoneze","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"japonez","error-unrecognized-form-feminine-indefinite-singular":"japoneză","error-unrecognized-form-indefinite-masculine-plural":"japonezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"japoneze","definite-error-unrecognized-form-masculine-neuter-singular":"japonezul","definite-error-unrecognized-form-feminine-singular":"japoneza","definite-error-unrecognized-form-masculine-plural":"japonezii","definite-error-unrecognized-form-feminine-neuter-plural":"japonezele"}},{"word":"japonez","pos":"noun","definitions":["a Japanese man"],"pronunciation":"[ʒa.poˈnez]","forms":{"plural":"japonezi","feminine":"equivalent japoneză","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"japonez","accusative-definite-nominative-singular":"japonezul","accusative-indefinite-nominative-plural":"japonezi","accusative-definite-nominative-plural":"japonezii","dative-genitive-indefinite-singular":"japonez","dative-definite-genitive-singular":"japonezului","dative-genitive-indefinite-plural":"japonezi","dative-definite-genitive-plural":"japonezilor","singular-vocative":"japonezule","plural-vocative":"japonezilor"}},{"word":"japoneză","pos":"adj","definitions":["nominative/accusative feminine singular of japonez"],"pronunciation":"/ʒapoˈnezə/"},{"word":"japoneză","pos":"noun","definitions":["a female Japanese person"],"pronunciation":"/ʒapoˈnezə/","forms":{"plural":"japoneze","masculine":"equivalent japonez","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"japoneză","accusative-definite-nominative-singular":"japoneza","accusative-indefinite-nominative-plural":"japoneze","accusative-definite-nominative-plural":"japonezele","dative-genitive-indefinite-singular":"japoneze","dative-definite-genitive-singular":"japonezei","dative-genitive-indefinite-plural":"japoneze","dative-definite-genitive-plural":"japonezelor","singular-vocative":"japoneză","plural-vocative":"japonezelor"}},{"word":"japoneză","pos":"noun","definitions":["the Japanese language"],"pronunciation":"/ʒapoˈnezə/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"japoneză","accusative-definite-nominative":"japoneza","dative-genitive-indefinite":"japoneze","dative-definite-genitive":"japonezei","vocative":"japoneză"}},{"word":"japonezi","pos":"noun","definitions":["plural of japonez"]},{"word":"Japonia","pos":"name","definitions":["Japan (a country and archipelago of East Asia)"],"gender":"f"},{"word":"japonism","pos":"noun","definitions":["Japonism"],"forms":{"plural":"japonisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"japonism","accusative-definite-nominative-singular":"japonismul","accusative-indefinite-nominative-plural":"japonisme","accusative-definite-nominative-plural":"japonismele","dative-genitive-indefinite-singular":"japonism","dative-definite-genitive-singular":"japonismului","dative-genitive-indefinite-plural":"japonisme","dative-definite-genitive-plural":"japonismelor","singular-vocative":"japonismule","plural-vocative":"japonismelor"}},{"word":"japonolog","pos":"noun","definitions":["Japanologist"],"forms":{"plural":"japonologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"japonolog","accusative-definite-nominative-singular":"japonologul","accusative-indefinite-nominative-plural":"japonologi","accusative-definite-nominative-plural":"japonologii","dative-genitive-indefinite-singular":"japonolog","dative-definite-genitive-singular":"japonologului","dative-genitive-indefinite-plural":"japonologi","dative-definite-genitive-plural":"japonologilor","singular-vocative":"japonologule","plural-vocative":"japonologilor"}},{"word":"japonologă","pos":"noun","definitions":["female equivalent of japonolog"],"forms":{"plural":"japonologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"japonologă","accusative-definite-nominative-singular":"japonologa","accusative-indefinite-nominative-plural":"japonologe","accusative-definite-nominative-plural":"japonologele","dative-genitive-indefinite-singular":"japonologe","dative-definite-genitive-singular":"japonologei","dative-genitive-indefinite-plural":"japonologe","dative-definite-genitive-plural":"japonologelor","singular-vocative":"japonologă","plural-vocative":"japonologelor"}},{"word":"japonologie","pos":"noun","definitions":["alternative form of japanologie"],"forms":{"plural":"japonologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"japonologie","accusative-definite-nominative-singular":"japonologia","accusative-indefinite-nominative-plural":"japonologii","accusative-definite-nominative-plural":"japonologiile","dative-genitive-indefinite-singular":"japonologii","dative-definite-genitive-singular":"japonologiei","dative-genitive-indefinite-plural":"japonologii","dative-definite-genitive-plural":"japonologiilor","singular-vocative":"japonologie","plural-vocative":"japonologiilor"}},{"word":"japsă","pos":"noun","definitions":["scorching heat"],"forms":{"plural":"japse","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"japsă","accusative-definite-nominative-singular":"japsa","accusative-indefinite-nominative-plural":"japse","accusative-definite-nominative-plural":"japsele","dative-genitive-indefinite-singular":"japse","dative-definite-genitive-singular":"japsei","dative-genitive-indefinite-plural":"japse","dative-definite-genitive-plural":"japselor","singular-vocative":"japsă","plural-vocative":"japselor"}},{"word":"jar","pos":"noun","definitions":["embers (glowing coal or wood)","intense heat, fire, glow"],"forms":{"plural":"jaruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jar","accusative-definite-nominative-singular":"jarul","accusative-indefinite-nominative-plural":"jaruri","accusative-definite-nominative-plural":"jarurile","dative-genitive-indefinite-singular":"jar","dative-definite-genitive-singular":"jarului","dative-genitive-indefinite-plural":"jaruri","dative-definite-genitive-plural":"jarurilor","singular-vocative":"jarule","plural-vocative":"jarurilor"}},{"word":"jărăgai","pos":"noun","definitions":["burning coals"],"forms":{"plural":"jărăgaiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jărăgai","accusative-definite-nominative-singular":"jărăgaiul","accusative-indefinite-nominative-plural":"jărăgaiuri","accusative-definite-nominative-plural":"jărăgaiurile","dative-genitive-indefinite-singular":"jărăgai","dative-definite-genitive-singular":"jărăgaiului","dative-genitive-indefinite-plural":"jărăgaiuri","dative-definite-genitive-plural":"jărăgaiurilor","singular-vocative":"jărăgaiule","plural-vocative":"jărăgaiurilor"}},{"word":"jăratec","pos":"noun","definitions":["alternative form of jăratic"]},{"word":"Jăratic","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jăratic"}},{"word":"jăratic","pos":"noun","definitions":["embers"],"pronunciation":"/ʒəˈra.tik/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jăratic","accusative-definite-nominative":"jăraticul","dative-genitive-indefinite":"jăratic","dative-definite-genitive":"jăraticului","vocative":"jăraticule","alternative":"jăratec"}},{"word":"jarcalău","pos":"noun","definitions":["low-quality sheepskin waistcoat"],"forms":{"plural":"jarcalaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jarcalău","accusative-definite-nominative-singular":"jarcalăuul","accusative-indefinite-nominative-plural":"jarcalaie","accusative-definite-nominative-plural":"jarcalaiele","dative-genitive-indefinite-singular":"jarcalău","dative-definite-genitive-singular":"jarcalăuului","dative-genitive-indefinite-plural":"jarcalaie","dative-definite-genitive-plural":"jarcalaielor","singular-vocative":"jarcalăuule","plural-vocative":"jarcalaielor"}},{"word":"jarcalete","pos":"noun","definitions":["hooligan"],"forms":{"plural":"jarcaleți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jarcalete","accusative-definite-nominative-singular":"jarcaleteul","accusative-indefinite-nominative-plural":"jarcaleți","accusative-definite-nominative-plural":"jarcaleții","dative-genitive-indefinite-singular":"jarcalete","dative-definite-genitive-singular":"jarcaleteului","dative-genitive-indefinite-plural":"jarcaleți","dative-definite-genitive-plural":"jarcaleților","singular-vocative":"jarcaleteule","plural-vocative":"jarcaleților"}},{"word":"jarchină","pos":"noun","definitions":["shabby clothes"],"forms":{"plural":"jarchine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jarchină","accusative-definite-nominative-singular":"jarchina","accusative-indefinite-nominative-plural":"jarchine","accusative-definite-nominative-plural":"jarchinele","dative-genitive-indefinite-singular":"jarchine","dative-definite-genitive-singular":"jarchinei","dative-genitive-indefinite-plural":"jarchine","dative-definite-genitive-plural":"jarchinelor","singular-vocative":"jarchină","plural-vocative":"jarchinelor"}},{"word":"jărdie","pos":"noun","definitions":["alternative form of jordie"],"forms":{"plural":"jărdii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jărdie","accusative-definite-nominative-singular":"jărdia","accusative-indefinite-nominative-plural":"jărdii","accusative-definite-nominative-plural":"jărdiile","dative-genitive-indefinite-singular":"jărdii","dative-definite-genitive-singular":"jărdiei","dative-genitive-indefinite-plural":"jărdii","dative-definite-genitive-plural":"jărdiilor","singular-vocative":"jărdie","plural-vocative":"jărdiilor"}},{"word":"jardinieră","pos":"noun","definitions":["planter"],"forms":{"plural":"jardiniere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jardinieră","accusative-definite-nominative-singular":"jardiniera","accusative-indefinite-nominative-plural":"jardiniere","accusative-definite-nominative-plural":"jardinierele","dative-genitive-indefinite-singular":"jardiniere","dative-definite-genitive-singular":"jardinierei","dative-genitive-indefinite-plural":"jardiniere","dative-definite-genitive-plural":"jardinierelor","singular-vocative":"jardinieră","plural-vocative":"jardinierelor"}},{"word":"jaret","pos":"noun","definitions":["hock (joint)"],"forms":{"plural":"jarete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jaret","accusative-definite-nominative-singular":"jaretul","accusative-indefinite-nominative-plural":"jarete","accusative-definite-nominative-plural":"jaretele","dative-genitive-indefinite-singular":"jaret","dative-definite-genitive-singular":"jaretului","dative-genitive-indefinite-plural":"jarete","dative-definite-genitive-plural":"jaretelor","singular-vocative":"jaretule","plural-vocative":"jaretelor"}},{"word":"jaretieră","pos":"noun","definitions":["obsolete form of jartieră"],"forms":{"plural":"jaretiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jaretieră","accusative-definite-nominative-singular":"jaretiera","accusative-indefinite-nominative-plural":"jaretiere","accusative-definite-nominative-plural":"jaretierele","dative-genitive-indefinite-singular":"jaretiere","dative-definite-genitive-singular":"jaretierei","dative-genitive-indefinite-plural":"jaretiere","dative-definite-genitive-plural":"jaretierelor","singular-vocative":"jaretieră","plural-vocative":"jaretierelor"}},{"word":"jargoane","pos":"noun","definitions":["plural of jargon"]},{"word":"jargon","pos":"noun","definitions":["jargon, slang"],"forms":{"plural":"jargoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jargon","accusative-definite-nominative-singular":"jargonul","accusative-indefinite-nominative-plural":"jargoane","accusative-definite-nominative-plural":"jargoanele","dative-genitive-indefinite-singular":"jargon","dative-definite-genitive-singular":"jargonului","dative-genitive-indefinite-plural":"jargoane","dative-definite-genitive-plural":"jargoanelor","singular-vocative":"jargonule","plural-vocative":"jargoanelor"}},{"word":"jargonafazie","pos":"noun","definitions":["jargon aphasia"],"forms":{"plural":"jargonafazii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jargonafazie","accusative-definite-nominative-singular":"jargonafazia","accusative-indefinite-nominative-plural":"jargonafazii","accusative-definite-nominative-plural":"jargonafaziile","dative-genitive-indefinite-singular":"jargonafazii","dative-definite-genitive-singular":"jargonafaziei","dative-genitive-indefinite-plural":"jargonafazii","dative-definite-genitive-plural":"jargonafaziilor","singular-vocative":"jargonafazie","plural-vocative":"jargonafaziilor"}},{"word":"jări","pos":"verb","definitions":["to stir the burning coals"],"forms":{"canonical":"a jări 4th conjugation","present-singular-third-person":"jărește","participle-past":"jărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jări","gerund":"jărind","first-person-indicative-present-singular":"jăresc","indicative-present-second-person-singular":"jărești","indicative-present-singular-third-person":"jărește","first-person-indicative-plural-present":"jărim","indicative-plural-present-second-person":"jăriți","indicative-plural-present-third-person":"jăresc","first-person-imperfect-indicative-singular":"jăream","imperfect-indicative-second-person-singular":"jăreai","imperfect-indicative-singular-third-person":"jărea","first-person-imperfect-indicative-plural":"jăream","imperfect-indicative-plural-second-person":"jăreați","imperfect-indicative-plural-third-person":"jăreau","first-person-indicative-perfect-singular":"jării","indicative-perfect-second-person-singular":"jăriși","indicative-perfect-singular-third-person":"jări","first-person-indicative-perfect-plural":"jărirăm","indicative-perfect-plural-second-person":"jărirăți","indicative-perfect-plural-third-person":"jăriră","first-person-indicative-pluperfect-singular":"jărisem","indicative-pluperfect-second-person-singular":"jăriseși","indicative-pluperfect-singular-third-person":"jărise","first-person-indicative-pluperfect-plural":"jăriserăm","indicative-pluperfect-plural-second-person":"jăriserăți","indicative-pluperfect-plural-third-person":"jăriseră","first-person-present-singular-subjunctive":"să jăresc","present-second-person-singular-subjunctive":"să jărești","present-singular-subjunctive-third-person":"să jărească","first-person-plural-present-subjunctive":"să jărim","plural-present-second-person-subjunctive":"să jăriți","plural-present-subjunctive-third-person":"să jărească","imperative-second-person-singular":"jărește","imperative-plural-second-person":"jăriți","imperative-negative-second-person-singular":"nu jări","imperative-negative-plural-second-person":"nu jăriți"}},{"word":"jariște","pos":"noun","definitions":["burning coals","burnt up place, especially a burnt up forest"],"forms":{"plural":"jariști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jariște","accusative-definite-nominative-singular":"jariștea","accusative-indefinite-nominative-plural":"jariști","accusative-definite-nominative-plural":"jariștile","dative-genitive-indefinite-singular":"jariști","dative-definite-genitive-singular":"jariștii","dative-genitive-indefinite-plural":"jariști","dative-definite-genitive-plural":"jariștilor","singular-vocative":"jariște","plural-vocative":"jariștilor"}},{"word":"jăriște","pos":"noun","definitions":["obsolete form of jariște"],"forms":{"plural":"jăriști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jăriște","accusative-definite-nominative-singular":"jăriștea","accusative-indefinite-nominative-plural":"jăriști","accusative-definite-nominative-plural":"jăriștile","dative-genitive-indefinite-singular":"jăriști","dative-definite-genitive-singular":"jăriștii","dative-genitive-indefinite-plural":"jăriști","dative-definite-genitive-plural":"jăriștilor","singular-vocative":"jăriște","plural-vocative":"jăriștilor"}},{"word":"Jariștea","pos":"name","definitions":["a commune of Vrancea County, Romania","a village in Jariștea, Vrancea County, Romania"],"gender":"f"},{"word":"jariștea","pos":"noun","definitions":["definite nominative/accusative singular of jariște"]},{"word":"Jariștea Mare","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Mândra"],"gender":"f"},{"word":"Jariștea Mică","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Mândra"],"gender":"f"},{"word":"Jaroștea","pos":"name","definitions":["a village in Glăvile, Vâlcea County, Romania"],"gender":"f"},{"word":"Jărosul","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Orăștie"],"gender":"m"},{"word":"jartea","pos":"noun","definitions":["garter"],"forms":{"plural":"jartele","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"jartea","accusative-definite-nominative-singular":"jarteaua","accusative-indefinite-nominative-plural":"jartele","accusative-definite-nominative-plural":"jartelele","dative-genitive-indefinite-singular":"jartele","dative-definite-genitive-singular":"jartelei","dative-genitive-indefinite-plural":"jartele","dative-definite-genitive-plural":"jartelelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"jartelă","pos":"noun","definitions":["alternative form of jartea"],"forms":{"plural":"jartele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jartelă","accusative-definite-nominative-singular":"jartela","accusative-indefinite-nominative-plural":"jartele","accusative-definite-nominative-plural":"jartelele","dative-genitive-indefinite-singular":"jartele","dative-definite-genitive-singular":"jartelei","dative-genitive-indefinite-plural":"jartele","dative-definite-genitive-plural":"jartelelor","singular-vocative":"jartelă","plural-vocative":"jartelelor"}},{"word":"jărtfire","pos":"noun","definitions":["obsolete form of jertfire"],"forms":{"plural":"jărtfiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jărtfire","accusative-definite-nominative-singular":"jărtfirea","accusative-indefinite-nominative-plural":"jărtfiri","accusative-definite-nominative-plural":"jărtfirile","dative-genitive-indefinite-singular":"jărtfiri","dative-definite-genitive-singular":"jărtfirii","dative-genitive-indefinite-plural":"jărtfiri","dative-definite-genitive-plural":"jărtfirilor","singular-vocative":"jărtfire","plural-vocative":"jărtfirilor"}},{"word":"jartieră","pos":"noun","definitions":["garter"],"forms":{"plural":"jartiere"}},{"word":"jârtvă","pos":"noun","definitions":["obsolete form of jertfă"],"forms":{"plural":"jârtve","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jârtvă","accusative-definite-nominative-singular":"jârtva","accusative-indefinite-nominative-plural":"jârtve","accusative-definite-nominative-plural":"jârtvele","dative-genitive-indefinite-singular":"jârtve","dative-definite-genitive-singular":"jârtvei","dative-genitive-indefinite-plural":"jârtve","dative-definite-genitive-plural":"jârtvelor","singular-vocative":"jârtvă","plural-vocative":"jârtvelor"}},{"word":"jărtvă","pos":"noun","definitions":["obsolete form of jertfă"],"forms":{"plural":"jărtve","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jărtvă","accusative-definite-nominative-singular":"jărtva","accusative-indefinite-nominative-plural":"jărtve","accusative-definite-nominative-plural":"jărtvele","dative-genitive-indefinite-singular":"jărtve","dative-definite-genitive-singular":"jărtvei","dative-genitive-indefinite-plural":"jărtve","dative-definite-genitive-plural":"jărtvelor","singular-vocative":"jărtvă","plural-vocative":"jărtvelor"}},{"word":"jărtvire","pos":"noun","definitions":["obsolete form of jertfire"],"forms":{"plural":"jărtviri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jărtvire","accusative-definite-nominative-singular":"jărtvirea","accusative-indefinite-nominative-plural":"jărtviri","accusative-definite-nominative-plural":"jărtvirile","dative-genitive-indefinite-singular":"jărtviri","dative-definite-genitive-singular":"jărtvirii","dative-genitive-indefinite-plural":"jărtviri","dative-definite-genitive-plural":"jărtvirilor","singular-vocative":"jărtvire","plural-vocative":"jărtvirilor"}},{"word":"jărui","pos":"verb","definitions":["to stir the burning coals"],"forms":{"canonical":"a jărui 4th conjugation","present-singular-third-person":"jăruiește","participle-past":"jăruit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jărui","gerund":"jăruind","first-person-indicative-present-singular":"jăruiesc","indicative-present-second-person-singular":"jăruiești","indicative-present-singular-third-person":"jăruiește","first-person-indicative-plural-present":"jăruim","indicative-plural-present-second-person":"jăruiți","indicative-plural-present-third-person":"jăruiesc","first-person-imperfect-indicative-singular":"jăruiam","imperfect-indicative-second-person-singular":"jăruiai","imperfect-indicative-singular-third-person":"jăruia","first-person-imperfect-indicative-plural":"jăruiam","imperfect-indicative-plural-second-person":"jăruiați","imperfect-indicative-plural-third-person":"jăruiau","first-person-indicative-perfect-singular":"jăruii","indicative-perfect-second-person-singular":"jăruiși","indicative-perfect-singular-third-person":"jărui","first-person-indicative-perfect-plural":"jăruirăm","indicative-perfect-plural-second-person":"jăruirăți","indicative-perfect-plural-third-person":"jăruiră","first-person-indicative-pluperfect-singular":"jăruisem","indicative-pluperfect-second-person-singular":"jăruiseși","indicative-pluperfect-singular-third-person":"jăruise","first-person-indicative-pluperfect-plural":"jăruiserăm","indicative-pluperfect-plural-second-person":"jăruiserăți","indicative-pluperfect-plural-third-person":"jăruiseră","first-person-present-singular-subjunctive":"să jăruiesc","present-second-person-singular-subjunctive":"să jăruiești","present-singular-subjunctive-third-person":"să jăruiască","first-person-plural-present-subjunctive":"să jăruim","plural-present-second-person-subjunctive":"să jăruiți","plural-present-subjunctive-third-person":"să jăruiască","imperative-second-person-singular":"jăruiește","imperative-plural-second-person":"jăruiți","imperative-negative-second-person-singular":"nu jărui","imperative-negative-plural-second-person":"nu jăruiți"}},{"word":"jasmin","pos":"noun","definitions":["jasmine"],"forms":{"plural":"jasmini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jasmin","accusative-definite-nominative-singular":"jasminul","accusative-indefinite-nominative-plural":"jasmini","accusative-definite-nominative-plural":"jasminii","dative-genitive-indefinite-singular":"jasmin","dative-definite-genitive-singular":"jasminului","dative-genitive-indefinite-plural":"jasmini","dative-definite-genitive-plural":"jasminilor","singular-vocative":"jasminule","plural-vocative":"jasminilor"}},{"word":"jasp","pos":"noun","definitions":["jasper"],"pronunciation":"/ʒasp/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jasp","accusative-definite-nominative":"jaspul","dative-genitive-indefinite":"jasp","dative-definite-genitive":"jaspului","vocative":"jaspule"}},{"word":"jăț","pos":"noun","definitions":["obsolete form of jeț"],"forms":{"plural":"jățuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jăț","accusative-definite-nominative-singular":"jățul","accusative-indefinite-nominative-plural":"jățuri","accusative-definite-nominative-plural":"jățurile","dative-genitive-indefinite-singular":"jăț","dative-definite-genitive-singular":"jățului","dative-genitive-indefinite-plural":"jățuri","dative-definite-genitive-plural":"jățurilor","singular-vocative":"jățule","plural-vocative":"jățurilor"}},{"word":"javanez","pos":"noun","definitions":["Javanese"],"forms":{"plural":"javanezi","feminine":"equivalent javaneză","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"javanez","accusative-definite-nominative-singular":"javanezul","accusative-indefinite-nominative-plural":"javanezi","accusative-definite-nominative-plural":"javanezii","dative-genitive-indefinite-singular":"javanez","dative-definite-genitive-singular":"javanezului","dative-genitive-indefinite-plural":"javanezi","dative-definite-genitive-plural":"javanezilor","singular-vocative":"javanezule","plural-vocative":"javanezilor"}},{"word":"javaneză","pos":"noun","definitions":["female equivalent of javanez"],"forms":{"plural":"javaneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"javaneză","accusative-definite-nominative-singular":"javaneza","accusative-indefinite-nominative-plural":"javaneze","accusative-definite-nominative-plural":"javanezele","dative-genitive-indefinite-singular":"javaneze","dative-definite-genitive-singular":"javanezei","dative-genitive-indefinite-plural":"javaneze","dative-definite-genitive-plural":"javanezelor","singular-vocative":"javaneză","plural-vocative":"javanezelor"}},{"word":"javart","pos":"noun","definitions":["windgall, windpuff"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"javart","accusative-definite-nominative":"javartul","dative-genitive-indefinite":"javart","dative-definite-genitive":"javartului","vocative":"javartule"}},{"word":"javelină","pos":"noun","definitions":["javelin"],"forms":{"plural":"javeline","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"javelină","accusative-definite-nominative-singular":"javelina","accusative-indefinite-nominative-plural":"javeline","accusative-definite-nominative-plural":"javelinele","dative-genitive-indefinite-singular":"javeline","dative-definite-genitive-singular":"javelinei","dative-genitive-indefinite-plural":"javeline","dative-definite-genitive-plural":"javelinelor","singular-vocative":"javelină","plural-vocative":"javelinelor"}},{"word":"javeliza","pos":"verb","definitions":["to chlorinate"],"forms":{"canonical":"a javeliza 1st conjugation","present-singular-third-person":"javelizează","participle-past":"javelizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a javeliza","gerund":"javelizând","first-person-indicative-present-singular":"javelizez","indicative-present-second-person-singular":"javelizezi","indicative-present-singular-third-person":"javelizează","first-person-indicative-plural-present":"javelizăm","indicative-plural-present-second-person":"javelizați","indicative-plural-present-third-person":"javelizează","first-person-imperfect-indicative-singular":"javelizam","imperfect-indicative-second-person-singular":"javelizai","imperfect-indicative-singular-third-person":"javeliza","first-person-imperfect-indicative-plural":"javelizam","imperfect-indicative-plural-second-person":"javelizați","imperfect-indicative-plural-third-person":"javelizau","first-person-indicative-perfect-singular":"javelizai","indicative-perfect-second-person-singular":"javelizași","indicative-perfect-singular-third-person":"javeliză","first-person-indicative-perfect-plural":"javelizarăm","indicative-perfect-plural-second-person":"javelizarăți","indicative-perfect-plural-third-person":"javelizară","first-person-indicative-pluperfect-singular":"javelizasem","indicative-pluperfect-second-person-singular":"javelizaseși","indicative-pluperfect-singular-third-person":"javelizase","first-person-indicative-pluperfect-plural":"javelizaserăm","indicative-pluperfect-plural-second-person":"javelizaserăți","indicative-pluperfect-plural-third-person":"javelizaseră","first-person-present-singular-subjunctive":"să javelizez","present-second-person-singular-subjunctive":"să javelizezi","present-singular-subjunctive-third-person":"să javelizeze","first-person-plural-present-subjunctive":"să javelizăm","plural-present-second-person-subjunctive":"să javelizați","plural-present-subjunctive-third-person":"să javelizeze","imperative-second-person-singular":"javelizează","imperative-plural-second-person":"javelizați","imperative-negative-second-person-singular":"nu javeliza","imperative-negative-plural-second-person":"nu javelizați"}},{"word":"javelizare","pos":"noun","definitions":["chlorination"],"forms":{"plural":"javelizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"javelizare","accusative-definite-nominative-singular":"javelizarea","accusative-indefinite-nominative-plural":"javelizări","accusative-definite-nominative-plural":"javelizările","dative-genitive-indefinite-singular":"javelizări","dative-definite-genitive-singular":"javelizării","dative-genitive-indefinite-plural":"javelizări","dative-definite-genitive-plural":"javelizărilor","singular-vocative":"javelizare","plural-vocative":"javelizărilor"}},{"word":"javră","pos":"noun","definitions":["cur, mutt, pooch (dog)","twerp"],"pronunciation":"/ˈʒavrə/","forms":{"plural":"javre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"javră","accusative-definite-nominative-singular":"javra","accusative-indefinite-nominative-plural":"javre","accusative-definite-nominative-plural":"javrele","dative-genitive-indefinite-singular":"javre","dative-definite-genitive-singular":"javrei","dative-genitive-indefinite-plural":"javre","dative-definite-genitive-plural":"javrelor","singular-vocative":"javră","plural-vocative":"javrelor"}},{"word":"jazman","pos":"noun","definitions":["jazzman"],"forms":{"plural":"jazmeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jazman","accusative-definite-nominative-singular":"jazmanul","accusative-indefinite-nominative-plural":"jazmeni","accusative-definite-nominative-plural":"jazmenii","dative-genitive-indefinite-singular":"jazman","dative-definite-genitive-singular":"jazmanului","dative-genitive-indefinite-plural":"jazmeni","dative-definite-genitive-plural":"jazmenilor","singular-vocative":"jazmanule","plural-vocative":"jazmenilor"}},{"word":"jazz","pos":"noun","definitions":["jazz (music style)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jazz","accusative-definite-nominative":"jazzul","dative-genitive-indefinite":"jazz","dative-definite-genitive":"jazzului","vocative":"jazzule"}},{"word":"jazzistic","pos":"adj","definitions":["jazzistic"],"forms":{"feminine-singular":"jazzistică","masculine-plural":"jazzistici","feminine-neuter-plural":"jazzistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jazzistic","error-unrecognized-form-feminine-indefinite-singular":"jazzistică","error-unrecognized-form-indefinite-masculine-plural":"jazzistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"jazzistice","definite-error-unrecognized-form-masculine-neuter-singular":"jazzisticul","definite-error-unrecognized-form-feminine-singular":"jazzistica","definite-error-unrecognized-form-masculine-plural":"jazzisticii","definite-error-unrecognized-form-feminine-neuter-plural":"jazzisticele"}},{"word":"jbranț","pos":"noun","definitions":["connection, bond, link, conjunction"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jbranț","accusative-definite-nominative":"jbranțul","dative-genitive-indefinite":"jbranț","dative-definite-genitive":"jbranțului","vocative":"jbranțule"}},{"word":"Jder","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jder"}},{"word":"jder","pos":"noun","definitions":["marten"],"pronunciation":"/ʒder/","forms":{"plural":"jderi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jder","accusative-definite-nominative-singular":"jderul","accusative-indefinite-nominative-plural":"jderi","accusative-definite-nominative-plural":"jderii","dative-genitive-indefinite-singular":"jder","dative-definite-genitive-singular":"jderului","dative-genitive-indefinite-plural":"jderi","dative-definite-genitive-plural":"jderilor","singular-vocative":"jderule","plural-vocative":"jderilor"}},{"word":"Jderiu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jderiu"}},{"word":"Jderoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Jderoiu"}},{"word":"Jderu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jderu"}},{"word":"Jdimir","pos":"name","definitions":["a river in Caraș-Severin County, Romania, tributary to the Bistra Mărului"],"gender":"m"},{"word":"Jdioara","pos":"name","definitions":["a village in Criciova, Timiș County, Romania"],"gender":"f"},{"word":"jdior","pos":"noun","definitions":["marten"],"forms":{"plural":"jdiori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jdior","accusative-definite-nominative-singular":"jdiorul","accusative-indefinite-nominative-plural":"jdiori","accusative-definite-nominative-plural":"jdiorii","dative-genitive-indefinite-singular":"jdior","dative-definite-genitive-singular":"jdiorului","dative-genitive-indefinite-plural":"jdiori","dative-definite-genitive-plural":"jdiorilor","singular-vocative":"jdiorule","plural-vocative":"jdiorilor"}},{"word":"jeanși","pos":"noun","definitions":["alternative form of jeans"],"forms":{"plural":"jeanși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jeanși","accusative-definite-nominative-singular":"jeanșiul","accusative-indefinite-nominative-plural":"jeanși","accusative-definite-nominative-plural":"jeanșii","dative-genitive-indefinite-singular":"jeanși","dative-definite-genitive-singular":"jeanșiului","dative-genitive-indefinite-plural":"jeanși","dative-definite-genitive-plural":"jeanșilor","singular-vocative":"jeanșiule","plural-vocative":"jeanșilor"}},{"word":"jeb","pos":"noun","definitions":["pocket"],"forms":{"plural":"jeburi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jeb","accusative-definite-nominative-singular":"jebul","accusative-indefinite-nominative-plural":"jeburi","accusative-definite-nominative-plural":"jeburile","dative-genitive-indefinite-singular":"jeb","dative-definite-genitive-singular":"jebului","dative-genitive-indefinite-plural":"jeburi","dative-definite-genitive-plural":"jeburilor","singular-vocative":"jebule","plural-vocative":"jeburilor"}},{"word":"Jebeleanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jebeleanu"}},{"word":"Jebuc","pos":"name","definitions":["a river in Sălaj, Romania, tributary to the Almaș"],"gender":"m"},{"word":"Jebucu","pos":"name","definitions":["a village in Almașu, Sălaj County, Romania"],"gender":"m"},{"word":"jecmăneală","pos":"noun","definitions":["plunder"],"forms":{"plural":"jecmăneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jecmăneală","accusative-definite-nominative-singular":"jecmăneala","accusative-indefinite-nominative-plural":"jecmăneli","accusative-definite-nominative-plural":"jecmănelile","dative-genitive-indefinite-singular":"jecmăneli","dative-definite-genitive-singular":"jecmănelii","dative-genitive-indefinite-plural":"jecmăneli","dative-definite-genitive-plural":"jecmănelilor","singular-vocative":"jecmăneală","plural-vocative":"jecmănelilor"}},{"word":"jecmăni","pos":"verb","definitions":["to extort"],"forms":{"canonical":"a jecmăni 4th conjugation","present-singular-third-person":"jecmănește","participle-past":"jecmănit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jecmăni","gerund":"jecmănind","first-person-indicative-present-singular":"jecmănesc","indicative-present-second-person-singular":"jecmănești","indicative-present-singular-third-person":"jecmănește","first-person-indicative-plural-present":"jecmănim","indicative-plural-present-second-person":"jecmăniți","indicative-plural-present-third-person":"jecmănesc","first-person-imperfect-indicative-singular":"jecmăneam","imperfect-indicative-second-person-singular":"jecmăneai","imperfect-indicative-singular-third-person":"jecmănea","first-person-imperfect-indicative-plural":"jecmăneam","imperfect-indicative-plural-second-person":"jecmăneați","imperfect-indicative-plural-third-person":"jecmăneau","first-person-indicative-perfect-singular":"jecmănii","indicative-perfect-second-person-singular":"jecmăniși","indicative-perfect-singular-third-person":"jecmăni","first-person-indicative-perfect-plural":"jecmănirăm","indicative-perfect-plural-second-person":"jecmănirăți","indicative-perfect-plural-third-person":"jecmăniră","first-person-indicative-pluperfect-singular":"jecmănisem","indicative-pluperfect-second-person-singular":"jecmăniseși","indicative-pluperfect-singular-third-person":"jecmănise","first-person-indicative-pluperfect-plural":"jecmăniserăm","indicative-pluperfect-plural-second-person":"jecmăniserăți","indicative-pluperfect-plural-third-person":"jecmăniseră","first-person-present-singular-subjunctive":"să jecmănesc","present-second-person-singular-subjunctive":"să jecmănești","present-singular-subjunctive-third-person":"să jecmănească","first-person-plural-present-subjunctive":"să jecmănim","plural-present-second-person-subjunctive":"să jecmăniți","plural-present-subjunctive-third-person":"să jecmănească","imperative-second-person-singular":"jecmănește","imperative-plural-second-person":"jecmăniți","imperative-negative-second-person-singular":"nu jecmăni","imperative-negative-plural-second-person":"nu jecmăniți"}},{"word":"jecmănie","pos":"noun","definitions":["robbery"],"forms":{"plural":"jecmănii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jecmănie","accusative-definite-nominative-singular":"jecmănia","accusative-indefinite-nominative-plural":"jecmănii","accusative-definite-nominative-plural":"jecmăniile","dative-genitive-indefinite-singular":"jecmănii","dative-definite-genitive-singular":"jecmăniei","dative-genitive-indefinite-plural":"jecmănii","dative-definite-genitive-plural":"jecmăniilor","singular-vocative":"jecmănie","plural-vocative":"jecmăniilor"}},{"word":"jecmănire","pos":"noun","definitions":["extortion"],"forms":{"plural":"jecmăniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jecmănire","accusative-definite-nominative-singular":"jecmănirea","accusative-indefinite-nominative-plural":"jecmăniri","accusative-definite-nominative-plural":"jecmănirile","dative-genitive-indefinite-singular":"jecmăniri","dative-definite-genitive-singular":"jecmănirii","dative-genitive-indefinite-plural":"jecmăniri","dative-definite-genitive-plural":"jecmănirilor","singular-vocative":"jecmănire","plural-vocative":"jecmănirilor"}},{"word":"jecmănitor","pos":"noun","definitions":["robber"],"forms":{"plural":"jecmănitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jecmănitor","accusative-definite-nominative-singular":"jecmănitorul","accusative-indefinite-nominative-plural":"jecmănitori","accusative-definite-nominative-plural":"jecmănitorii","dative-genitive-indefinite-singular":"jecmănitor","dative-definite-genitive-singular":"jecmănitorului","dative-genitive-indefinite-plural":"jecmănitori","dative-definite-genitive-plural":"jecmănitorilor","singular-vocative":"jecmănitorule","plural-vocative":"jecmănitorilor"}},{"word":"jecui","pos":"verb","definitions":["alternative form of jefui"],"forms":{"canonical":"a jecui 4th conjugation","present-singular-third-person":"jecuiește","participle-past":"jecuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jecui","gerund":"jecuind","first-person-indicative-present-singular":"jecuiesc","indicative-present-second-person-singular":"jecuiești","indicative-present-singular-third-person":"jecuiește","first-person-indicative-plural-present":"jecuim","indicative-plural-present-second-person":"jecuiți","indicative-plural-present-third-person":"jecuiesc","first-person-imperfect-indicative-singular":"jecuiam","imperfect-indicative-second-person-singular":"jecuiai","imperfect-indicative-singular-third-person":"jecuia","first-person-imperfect-indicative-plural":"jecuiam","imperfect-indicative-plural-second-person":"jecuiați","imperfect-indicative-plural-third-person":"jecuiau","first-person-indicative-perfect-singular":"jecuii","indicative-perfect-second-person-singular":"jecuiși","indicative-perfect-singular-third-person":"jecui","first-person-indicative-perfect-plural":"jecuirăm","indicative-perfect-plural-second-person":"jecuirăți","indicative-perfect-plural-third-person":"jecuiră","first-person-indicative-pluperfect-singular":"jecuisem","indicative-pluperfect-second-person-singular":"jecuiseși","indicative-pluperfect-singular-third-person":"jecuise","first-person-indicative-pluperfect-plural":"jecuiserăm","indicative-pluperfect-plural-second-person":"jecuiserăți","indicative-pluperfect-plural-third-person":"jecuiseră","first-person-present-singular-subjunctive":"să jecuiesc","present-second-person-singular-subjunctive":"să jecuiești","present-singular-subjunctive-third-person":"să jecuiască","first-person-plural-present-subjunctive":"să jecuim","plural-present-second-person-subjunctive":"să jecuiți","plural-present-subjunctive-third-person":"să jecuiască","imperative-second-person-singular":"jecuiește","imperative-plural-second-person":"jecuiți","imperative-negative-second-person-singular":"nu jecui","imperative-negative-plural-second-person":"nu jecuiți"}},{"word":"jecuire","pos":"noun","definitions":["alternative form of jefuire"],"forms":{"plural":"jecuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jecuire","accusative-definite-nominative-singular":"jecuirea","accusative-indefinite-nominative-plural":"jecuiri","accusative-definite-nominative-plural":"jecuirile","dative-genitive-indefinite-singular":"jecuiri","dative-definite-genitive-singular":"jecuirii","dative-genitive-indefinite-plural":"jecuiri","dative-definite-genitive-plural":"jecuirilor","singular-vocative":"jecuire","plural-vocative":"jecuirilor"}},{"word":"jeep","pos":"noun","definitions":["jeep"],"forms":{"plural":"jeepuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jeep","accusative-definite-nominative-singular":"jeepul","accusative-indefinite-nominative-plural":"jeepuri","accusative-definite-nominative-plural":"jeepurile","dative-genitive-indefinite-singular":"jeep","dative-definite-genitive-singular":"jeepului","dative-genitive-indefinite-plural":"jeepuri","dative-definite-genitive-plural":"jeepurilor","singular-vocative":"jeepule","plural-vocative":"jeepurilor"}},{"word":"Jeflești","pos":"name","definitions":["a village in Vidra, Alba County, Romania"],"gender":"m"},{"word":"jefui","pos":"verb","definitions":["to rob"],"forms":{"canonical":"a jefui 4th conjugation","present-singular-third-person":"jefuiește","participle-past":"jefuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jefui","gerund":"jefuind","first-person-indicative-present-singular":"jefuiesc","indicative-present-second-person-singular":"jefuiești","indicative-present-singular-third-person":"jefuiește","first-person-indicative-plural-present":"jefuim","indicative-plural-present-second-person":"jefuiți","indicative-plural-present-third-person":"jefuiesc","first-person-imperfect-indicative-singular":"jefuiam","imperfect-indicative-second-person-singular":"jefuiai","imperfect-indicative-singular-third-person":"jefuia","first-person-imperfect-indicative-plural":"jefuiam","imperfect-indicative-plural-second-person":"jefuiați","imperfect-indicative-plural-third-person":"jefuiau","first-person-indicative-perfect-singular":"jefuii","indicative-perfect-second-person-singular":"jefuiși","indicative-perfect-singular-third-person":"jefui","first-person-indicative-perfect-plural":"jefuirăm","indicative-perfect-plural-second-person":"jefuirăți","indicative-perfect-plural-third-person":"jefuiră","first-person-indicative-pluperfect-singular":"jefuisem","indicative-pluperfect-second-person-singular":"jefuiseși","indicative-pluperfect-singular-third-person":"jefuise","first-person-indicative-pluperfect-plural":"jefuiserăm","indicative-pluperfect-plural-second-person":"jefuiserăți","indicative-pluperfect-plural-third-person":"jefuiseră","first-person-present-singular-subjunctive":"să jefuiesc","present-second-person-singular-subjunctive":"să jefuiești","present-singular-subjunctive-third-person":"să jefuiască","first-person-plural-present-subjunctive":"să jefuim","plural-present-second-person-subjunctive":"să jefuiți","plural-present-subjunctive-third-person":"să jefuiască","imperative-second-person-singular":"jefuiește","imperative-plural-second-person":"jefuiți","imperative-negative-second-person-singular":"nu jefui","imperative-negative-plural-second-person":"nu jefuiți"}},{"word":"jefuială","pos":"noun","definitions":["robbery"],"forms":{"plural":"jefuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jefuială","accusative-definite-nominative-singular":"jefuiala","accusative-indefinite-nominative-plural":"jefuiele","accusative-definite-nominative-plural":"jefuielele","dative-genitive-indefinite-singular":"jefuiele","dative-definite-genitive-singular":"jefuielei","dative-genitive-indefinite-plural":"jefuiele","dative-definite-genitive-plural":"jefuielelor","singular-vocative":"jefuială","plural-vocative":"jefuielelor"}},{"word":"jefuire","pos":"noun","definitions":["robbery"],"forms":{"plural":"jefuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jefuire","accusative-definite-nominative-singular":"jefuirea","accusative-indefinite-nominative-plural":"jefuiri","accusative-definite-nominative-plural":"jefuirile","dative-genitive-indefinite-singular":"jefuiri","dative-definite-genitive-singular":"jefuirii","dative-genitive-indefinite-plural":"jefuiri","dative-definite-genitive-plural":"jefuirilor","singular-vocative":"jefuire","plural-vocative":"jefuirilor"}},{"word":"jefuit","pos":"noun","definitions":["robbed"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jefuit","accusative-definite-nominative":"jefuitul","dative-genitive-indefinite":"jefuit","dative-definite-genitive":"jefuitului","vocative":"jefuitule"}},{"word":"jefuit","pos":"verb","definitions":["past participle of jefui"],"forms":{"participle-past":"of jefui"}},{"word":"jefuitoare","pos":"noun","definitions":["female equivalent of jefuitor"],"forms":{"plural":"jefuitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"jefuitoare","accusative-definite-nominative-singular":"jefuitoarea","accusative-indefinite-nominative-plural":"jefuitoare","accusative-definite-nominative-plural":"jefuitoarele","dative-genitive-indefinite-singular":"jefuitoare","dative-definite-genitive-singular":"jefuitoarei","dative-genitive-indefinite-plural":"jefuitoare","dative-definite-genitive-plural":"jefuitoarelor","singular-vocative":"jefuitoare","plural-vocative":"jefuitoarelor"}},{"word":"jefuitor","pos":"noun","definitions":["robber"],"forms":{"plural":"jefuitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jefuitor","accusative-definite-nominative-singular":"jefuitorul","accusative-indefinite-nominative-plural":"jefuitori","accusative-definite-nominative-plural":"jefuitorii","dative-genitive-indefinite-singular":"jefuitor","dative-definite-genitive-singular":"jefuitorului","dative-genitive-indefinite-plural":"jefuitori","dative-definite-genitive-plural":"jefuitorilor","singular-vocative":"jefuitorule","plural-vocative":"jefuitorilor"}},{"word":"jeg","pos":"noun","definitions":["dirt, filth"],"pronunciation":"/ˈʒeɡ/","forms":{"plural":"jeguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jeg","accusative-definite-nominative-singular":"jegul","accusative-indefinite-nominative-plural":"jeguri","accusative-definite-nominative-plural":"jegurile","dative-genitive-indefinite-singular":"jeg","dative-definite-genitive-singular":"jegului","dative-genitive-indefinite-plural":"jeguri","dative-definite-genitive-plural":"jegurilor","singular-vocative":"jegule","plural-vocative":"jegurilor","alternative":"jig"}},{"word":"Jegălia","pos":"name","definitions":["a commune of Călărași County, Romania","a village in Jegălia, Călărași County, Romania"],"gender":"f"},{"word":"jegos","pos":"adj","definitions":["filthy, dirty, soiled"],"pronunciation":"/ʒeˈɡos/","forms":{"feminine-singular":"jegoasă","masculine-plural":"jegoși","feminine-neuter-plural":"jegoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jegos","error-unrecognized-form-feminine-indefinite-singular":"jegoasă","error-unrecognized-form-indefinite-masculine-plural":"jegoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"jegoase","definite-error-unrecognized-form-masculine-neuter-singular":"jegosul","definite-error-unrecognized-form-feminine-singular":"jegoasa","definite-error-unrecognized-form-masculine-plural":"jegoșii","definite-error-unrecognized-form-feminine-neuter-plural":"jegoasele"}},{"word":"Jegu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jegu"}},{"word":"jeguiață","pos":"noun","definitions":["burning coals"],"forms":{"plural":"jeguiețe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jeguiață","accusative-definite-nominative-singular":"jeguiața","accusative-indefinite-nominative-plural":"jeguiețe","accusative-definite-nominative-plural":"jeguiețele","dative-genitive-indefinite-singular":"jeguiețe","dative-definite-genitive-singular":"jeguieței","dative-genitive-indefinite-plural":"jeguiețe","dative-definite-genitive-plural":"jeguiețelor","singular-vocative":"jeguiață","plural-vocative":"jeguiețelor"}},{"word":"jejun","pos":"noun","definitions":["jejunum"],"forms":{"plural":"jejunuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jejun","accusative-definite-nominative-singular":"jejunul","accusative-indefinite-nominative-plural":"jejunuri","accusative-definite-nominative-plural":"jejunurile","dative-genitive-indefinite-singular":"jejun","dative-definite-genitive-singular":"jejunului","dative-genitive-indefinite-plural":"jejunuri","dative-definite-genitive-plural":"jejunurilor","singular-vocative":"jejunule","plural-vocative":"jejunurilor"}},{"word":"jejunal","pos":"adj","definitions":["jejunal"],"forms":{"feminine-singular":"jejunală","masculine-plural":"jejunali","feminine-neuter-plural":"jejunale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jejunal","error-unrecognized-form-feminine-indefinite-singular":"jejunală","error-unrecognized-form-indefinite-masculine-plural":"jejunali","error-unrecognized-form-feminine-indefinite-neuter-plural":"jejunale","definite-error-unrecognized-form-masculine-neuter-singular":"jejunalul","definite-error-unrecognized-form-feminine-singular":"jejunala","definite-error-unrecognized-form-masculine-plural":"jejunalii","definite-error-unrecognized-form-feminine-neuter-plural":"jejunalele"}},{"word":"jejunostomie","pos":"noun","definitions":["jejunostomy"],"forms":{"plural":"jejunostomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jejunostomie","accusative-definite-nominative-singular":"jejunostomia","accusative-indefinite-nominative-plural":"jejunostomii","accusative-definite-nominative-plural":"jejunostomiile","dative-genitive-indefinite-singular":"jejunostomii","dative-definite-genitive-singular":"jejunostomiei","dative-genitive-indefinite-plural":"jejunostomii","dative-definite-genitive-plural":"jejunostomiilor","singular-vocative":"jejunostomie","plural-vocative":"jejunostomiilor"}},{"word":"jelanie","pos":"noun","definitions":["mourning, lamenting"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"jelanie","accusative-definite-nominative":"jelania","dative-genitive-indefinite":"jelanii","dative-definite-genitive":"jelaniei","vocative":"jelanie"}},{"word":"jelbar","pos":"noun","definitions":["alternative form of jălbar"],"forms":{"plural":"jelbari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jelbar","accusative-definite-nominative-singular":"jelbarul","accusative-indefinite-nominative-plural":"jelbari","accusative-definite-nominative-plural":"jelbarii","dative-genitive-indefinite-singular":"jelbar","dative-definite-genitive-singular":"jelbarului","dative-genitive-indefinite-plural":"jelbari","dative-definite-genitive-plural":"jelbarilor","singular-vocative":"jelbarule","plural-vocative":"jelbarilor"}},{"word":"Jeleanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jeleanu"}},{"word":"Jeledințan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jeledințan"}},{"word":"Jeledințean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jeledințean"}},{"word":"jelerie","pos":"noun","definitions":["squatting"],"forms":{"plural":"jelerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jelerie","accusative-definite-nominative-singular":"jeleria","accusative-indefinite-nominative-plural":"jelerii","accusative-definite-nominative-plural":"jeleriile","dative-genitive-indefinite-singular":"jelerii","dative-definite-genitive-singular":"jeleriei","dative-genitive-indefinite-plural":"jelerii","dative-definite-genitive-plural":"jeleriilor","singular-vocative":"jelerie","plural-vocative":"jeleriilor"}},{"word":"Jelescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Jelescu"}},{"word":"Jeleșel","pos":"name","definitions":["a river in Gorj, Romania, tributary to the Jaleș"],"gender":"m"},{"word":"jeleu","pos":"noun","definitions":["jelly (dessert)"],"pronunciation":"/ʒeˈlew/","forms":{"plural":"jeleuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jeleu","accusative-definite-nominative-singular":"jeleul","accusative-indefinite-nominative-plural":"jeleuri","accusative-definite-nominative-plural":"jeleurile","dative-genitive-indefinite-singular":"jeleu","dative-definite-genitive-singular":"jeleului","dative-genitive-indefinite-plural":"jeleuri","dative-definite-genitive-plural":"jeleurilor","singular-vocative":"jeleule","plural-vocative":"jeleurilor"}},{"word":"Jelev","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Jelev"}},{"word":"jeli","pos":"verb","definitions":["to wail, to mourn"],"forms":{"canonical":"a jeli 4th conjugation","present-singular-third-person":"jele","participle-past":"jelit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a jeli","gerund":"jelind","first-person-indicative-present-singular":"jel","indicative-present-second-person-singular":"jeli","indicative-present-singular-third-person":"jele","first-person-indicative-plural-present":"jelim","indicative-plural-present-second-person":"jeliți","indicative-plural-present-third-person":"jel","first-person-imperfect-indicative-singular":"jeleam","imperfect-indicative-second-person-singular":"jeleai","imperfect-indicative-singular-third-person":"jelea","first-person-imperfect-indicative-plural":"jeleam","imperfect-indicative-plural-second-person":"jeleați","imperfect-indicative-plural-third-person":"jeleau","first-person-indicative-perfect-singular":"jelii","indicative-perfect-second-person-singular":"jeliși","indicative-perfect-singular-third-person":"jeli","first-person-indicative-perfect-plural":"jelirăm","indicative-perfect-plural-second-person":"jelirăți","indicative-perfect-plural-third-person":"jeliră","first-person-indicative-pluperfect-singular":"jelisem","indicative-pluperfect-second-person-singular":"jeliseși","indicative-pluperfect-singular-third-person":"jelise","first-person-indicative-pluperfect-plural":"jeliserăm","indicative-pluperfect-plural-second-person":"jeliserăți","indicative-pluperfect-plural-third-person":"jeliseră","first-person-present-singular-subjunctive":"să jel","present-second-person-singular-subjunctive":"să jeli","present-singular-subjunctive-third-person":"să jelă","first-person-plural-present-subjunctive":"să jelim","plural-present-second-person-subjunctive":"să jeliți","plural-present-subjunctive-third-person":"să jelă","imperative-second-person-singular":"jele","imperative-plural-second-person":"jeliți","imperative-negative-second-person-singular":"nu jeli","imperative-negative-plural-second-person":"nu jeliți"}},{"word":"jelire","pos":"noun","definitions":["wailing"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"jelire","accusative-definite-nominative":"jelirea","dative-genitive-indefinite":"jelire","dative-definite-genitive":"jelirei","vocative":"jelire"}},{"word":"jelit","pos":"adj","definitions":["mourned"],"forms":{"feminine-singular":"jelită","masculine-plural":"jeliți","feminine-neuter-plural":"jelite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jelit","error-unrecognized-form-feminine-indefinite-singular":"jelită","error-unrecognized-form-indefinite-masculine-plural":"jeliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jelite","definite-error-unrecognized-form-masculine-neuter-singular":"jelitul","definite-error-unrecognized-form-feminine-singular":"jelita","definite-error-unrecognized-form-masculine-plural":"jeliții","definite-error-unrecognized-form-feminine-neuter-plural":"jelitele"}},{"word":"jelitor","pos":"adj","definitions":["mournful"],"forms":{"feminine-singular":"jelitoare","masculine-plural":"jelitori","feminine-neuter-plural":"jelitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jelitor","error-unrecognized-form-feminine-indefinite-singular":"jelitoare","error-unrecognized-form-indefinite-masculine-plural":"jelitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"jelitoare","definite-error-unrecognized-form-masculine-neuter-singular":"jelitorul","definite-error-unrecognized-form-feminine-singular":"jelitoarea","definite-error-unrecognized-form-masculine-plural":"jelitorii","definite-error-unrecognized-form-feminine-neuter-plural":"jelitoarele"}},{"word":"jelnic","pos":"adj","definitions":["obsolete form of jalnic"],"forms":{"feminine-singular":"jelnică","masculine-plural":"jelnici","feminine-neuter-plural":"jelnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jelnic","error-unrecognized-form-feminine-indefinite-singular":"jelnică","error-unrecognized-form-indefinite-masculine-plural":"jelnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"jelnice","definite-error-unrecognized-form-masculine-neuter-singular":"jelnicul","definite-error-unrecognized-form-feminine-singular":"jelnica","definite-error-unrecognized-form-masculine-plural":"jelnicii","definite-error-unrecognized-form-feminine-neuter-plural":"jelnicele"}},{"word":"jelnic","pos":"adv","definitions":["obsolete form of jalnic"]},{"word":"Jeloboc","pos":"name","definitions":["a village in Piatra, Orhei Raion, Moldova"],"gender":"m"},{"word":"jelț","pos":"noun","definitions":["alternative form of jilț"],"forms":{"plural":"jelțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jelț","accusative-definite-nominative-singular":"jelțul","accusative-indefinite-nominative-plural":"jelțuri","accusative-definite-nominative-plural":"jelțurile","dative-genitive-indefinite-singular":"jelț","dative-definite-genitive-singular":"jelțului","dative-genitive-indefinite-plural":"jelțuri","dative-definite-genitive-plural":"jelțurilor","singular-vocative":"jelțule","plural-vocative":"jelțurilor"}},{"word":"jelțurel","pos":"noun","definitions":["diminutive of jelț"],"forms":{"plural":"jelțurele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jelțurel","accusative-definite-nominative-singular":"jelțurelul","accusative-indefinite-nominative-plural":"jelțurele","accusative-definite-nominative-plural":"jelțurelele","dative-genitive-indefinite-singular":"jelțurel","dative-definite-genitive-singular":"jelțurelului","dative-genitive-indefinite-plural":"jelțurele","dative-definite-genitive-plural":"jelțurelelor","singular-vocative":"jelțurelule","plural-vocative":"jelțurelelor"}},{"word":"jelui","pos":"verb","definitions":["to wail"],"forms":{"canonical":"a jelui 4th conjugation","present-singular-third-person":"jeluiesc","participle-past":"jeluit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a jelui","gerund":"jeluind","first-person-indicative-present-singular":"jelui","indicative-present-second-person-singular":"jelui","indicative-present-singular-third-person":"jeluie","first-person-indicative-plural-present":"jeluim","indicative-plural-present-second-person":"jeluiți","indicative-plural-present-third-person":"jeluie","first-person-imperfect-indicative-singular":"jeluiam","imperfect-indicative-second-person-singular":"jeluiai","imperfect-indicative-singular-third-person":"jeluia","first-person-imperfect-indicative-plural":"jeluiam","imperfect-indicative-plural-second-person":"jeluiați","imperfect-indicative-plural-third-person":"jeluiau","first-person-indicative-perfect-singular":"jeluii","indicative-perfect-second-person-singular":"jeluiși","indicative-perfect-singular-third-person":"jelui","first-person-indicative-perfect-plural":"jeluirăm","indicative-perfect-plural-second-person":"jeluirăți","indicative-perfect-plural-third-person":"jeluiră","first-person-indicative-pluperfect-singular":"jeluisem","indicative-pluperfect-second-person-singular":"jeluiseși","indicative-pluperfect-singular-third-person":"jeluise","first-person-indicative-pluperfect-plural":"jeluiserăm","indicative-pluperfect-plural-second-person":"jeluiserăți","indicative-pluperfect-plural-third-person":"jeluiseră","first-person-present-singular-subjunctive":"să jelui","present-second-person-singular-subjunctive":"să jelui","present-singular-subjunctive-third-person":"să jeluie","first-person-plural-present-subjunctive":"să jeluim","plural-present-second-person-subjunctive":"să jeluiți","plural-present-subjunctive-third-person":"să jeluie","imperative-second-person-singular":"jeluie","imperative-plural-second-person":"jeluiți","imperative-negative-second-person-singular":"nu jelui","imperative-negative-plural-second-person":"nu jeluiți"}},{"word":"jeluire","pos":"noun","definitions":["wail"],"forms":{"plural":"jeluiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jeluire","accusative-definite-nominative-singular":"jeluirea","accusative-indefinite-nominative-plural":"jeluiri","accusative-definite-nominative-plural":"jeluirile","dative-genitive-indefinite-singular":"jeluiri","dative-definite-genitive-singular":"jeluirii","dative-genitive-indefinite-plural":"jeluiri","dative-definite-genitive-plural":"jeluirilor","singular-vocative":"jeluire","plural-vocative":"jeluirilor"}},{"word":"jeluit","pos":"adj","definitions":["wailed"],"forms":{"feminine-singular":"jeluită","masculine-plural":"jeluiți","feminine-neuter-plural":"jeluite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jeluit","error-unrecognized-form-feminine-indefinite-singular":"jeluită","error-unrecognized-form-indefinite-masculine-plural":"jeluiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jeluite","definite-error-unrecognized-form-masculine-neuter-singular":"jeluitul","definite-error-unrecognized-form-feminine-singular":"jeluita","definite-error-unrecognized-form-masculine-plural":"jeluiții","definite-error-unrecognized-form-feminine-neuter-plural":"jeluitele"}},{"word":"jeluitoare","pos":"noun","definitions":["female equivalent of jeluitor"],"forms":{"plural":"jeluitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"jeluitoare","accusative-definite-nominative-singular":"jeluitoarea","accusative-indefinite-nominative-plural":"jeluitoare","accusative-definite-nominative-plural":"jeluitoarele","dative-genitive-indefinite-singular":"jeluitoare","dative-definite-genitive-singular":"jeluitoarei","dative-genitive-indefinite-plural":"jeluitoare","dative-definite-genitive-plural":"jeluitoarelor","singular-vocative":"jeluitoare","plural-vocative":"jeluitoarelor"}},{"word":"jeluitor","pos":"adj","definitions":["mourning"],"forms":{"feminine-singular":"jeluitoare","masculine-plural":"jeluitori","feminine-neuter-plural":"jeluitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jeluitor","error-unrecognized-form-feminine-indefinite-singular":"jeluitoare","error-unrecognized-form-indefinite-masculine-plural":"jeluitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"jeluitoare","definite-error-unrecognized-form-masculine-neuter-singular":"jeluitorul","definite-error-unrecognized-form-feminine-singular":"jeluitoarea","definite-error-unrecognized-form-masculine-plural":"jeluitorii","definite-error-unrecognized-form-feminine-neuter-plural":"jeluitoarele"}},{"word":"jeluitor","pos":"noun","definitions":["mourner"],"forms":{"plural":"jeluitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jeluitor","accusative-definite-nominative-singular":"jeluitorul","accusative-indefinite-nominative-plural":"jeluitori","accusative-definite-nominative-plural":"jeluitorii","dative-genitive-indefinite-singular":"jeluitor","dative-definite-genitive-singular":"jeluitorului","dative-genitive-indefinite-plural":"jeluitori","dative-definite-genitive-plural":"jeluitorilor","singular-vocative":"jeluitorule","plural-vocative":"jeluitorilor"}},{"word":"jemanfișism","pos":"noun","definitions":["indifference"],"forms":{"plural":"jemanfișismuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jemanfișism","accusative-definite-nominative-singular":"jemanfișismul","accusative-indefinite-nominative-plural":"jemanfișismuri","accusative-definite-nominative-plural":"jemanfișismurile","dative-genitive-indefinite-singular":"jemanfișism","dative-definite-genitive-singular":"jemanfișismului","dative-genitive-indefinite-plural":"jemanfișismuri","dative-definite-genitive-plural":"jemanfișismurilor","singular-vocative":"jemanfișismule","plural-vocative":"jemanfișismurilor"}},{"word":"Jena","pos":"name","definitions":["a village in Gavojdia, Timiș County, Romania"],"gender":"f"},{"word":"jena","pos":"verb","definitions":["to embarrass","to discomfort, incommode","to inconvenience","to hinder, impede, be in the way of","to disturb, trouble"],"forms":{"canonical":"a jena 1st conjugation","present-singular-third-person":"jenează","participle-past":"jenat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a jena","gerund":"jenând","first-person-indicative-present-singular":"jenez","indicative-present-second-person-singular":"jenezi","indicative-present-singular-third-person":"jenează","first-person-indicative-plural-present":"jenăm","indicative-plural-present-second-person":"jenați","indicative-plural-present-third-person":"jenează","first-person-imperfect-indicative-singular":"jenam","imperfect-indicative-second-person-singular":"jenai","imperfect-indicative-singular-third-person":"jena","first-person-imperfect-indicative-plural":"jenam","imperfect-indicative-plural-second-person":"jenați","imperfect-indicative-plural-third-person":"jenau","first-person-indicative-perfect-singular":"jenai","indicative-perfect-second-person-singular":"jenași","indicative-perfect-singular-third-person":"jenă","first-person-indicative-perfect-plural":"jenarăm","indicative-perfect-plural-second-person":"jenarăți","indicative-perfect-plural-third-person":"jenară","first-person-indicative-pluperfect-singular":"jenasem","indicative-pluperfect-second-person-singular":"jenaseși","indicative-pluperfect-singular-third-person":"jenase","first-person-indicative-pluperfect-plural":"jenaserăm","indicative-pluperfect-plural-second-person":"jenaserăți","indicative-pluperfect-plural-third-person":"jenaseră","first-person-present-singular-subjunctive":"să jenez","present-second-person-singular-subjunctive":"să jenezi","present-singular-subjunctive-third-person":"să jeneze","first-person-plural-present-subjunctive":"să jenăm","plural-present-second-person-subjunctive":"să jenați","plural-present-subjunctive-third-person":"să jeneze","imperative-second-person-singular":"jenează","imperative-plural-second-person":"jenați","imperative-negative-second-person-singular":"nu jena","imperative-negative-plural-second-person":"nu jenați"}},{"word":"jenă","pos":"noun","definitions":["embarrassment (state of discomfort); uneasiness","a slight feeling of physical pain"],"forms":{"plural":"jene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jenă","accusative-definite-nominative-singular":"jena","accusative-indefinite-nominative-plural":"jene","accusative-definite-nominative-plural":"jenele","dative-genitive-indefinite-singular":"jene","dative-definite-genitive-singular":"jenei","dative-genitive-indefinite-plural":"jene","dative-definite-genitive-plural":"jenelor","singular-vocative":"jenă","plural-vocative":"jenelor"}},{"word":"jenant","pos":"adj","definitions":["embarrassing"],"forms":{"feminine-singular":"jenantă","masculine-plural":"jenanți","feminine-neuter-plural":"jenante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jenant","error-unrecognized-form-feminine-indefinite-singular":"jenantă","error-unrecognized-form-indefinite-masculine-plural":"jenanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jenante","definite-error-unrecognized-form-masculine-neuter-singular":"jenantul","definite-error-unrecognized-form-feminine-singular":"jenanta","definite-error-unrecognized-form-masculine-plural":"jenanții","definite-error-unrecognized-form-feminine-neuter-plural":"jenantele"}},{"word":"jenare","pos":"noun","definitions":["embarrassment"],"forms":{"plural":"jenări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jenare","accusative-definite-nominative-singular":"jenarea","accusative-indefinite-nominative-plural":"jenări","accusative-definite-nominative-plural":"jenările","dative-genitive-indefinite-singular":"jenări","dative-definite-genitive-singular":"jenării","dative-genitive-indefinite-plural":"jenări","dative-definite-genitive-plural":"jenărilor","singular-vocative":"jenare","plural-vocative":"jenărilor"}},{"word":"jenat","pos":"adj","definitions":["embarrassed"],"forms":{"feminine-singular":"jenată","masculine-plural":"jenați","feminine-neuter-plural":"jenate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jenat","error-unrecognized-form-feminine-indefinite-singular":"jenată","error-unrecognized-form-indefinite-masculine-plural":"jenați","error-unrecognized-form-feminine-indefinite-neuter-plural":"jenate","definite-error-unrecognized-form-masculine-neuter-singular":"jenatul","definite-error-unrecognized-form-feminine-singular":"jenata","definite-error-unrecognized-form-masculine-plural":"jenații","definite-error-unrecognized-form-feminine-neuter-plural":"jenatele"}},{"word":"jendarm","pos":"noun","definitions":["obsolete form of jandarm"],"forms":{"plural":"jendarmi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jendarm","accusative-definite-nominative-singular":"jendarmul","accusative-indefinite-nominative-plural":"jendarmi","accusative-definite-nominative-plural":"jendarmii","dative-genitive-indefinite-singular":"jendarm","dative-definite-genitive-singular":"jendarmului","dative-genitive-indefinite-plural":"jendarmi","dative-definite-genitive-plural":"jendarmilor","singular-vocative":"jendarmule","plural-vocative":"jendarmilor"}},{"word":"jenibil","pos":"adj","definitions":["embarrassing"],"forms":{"feminine-singular":"jenibilă","masculine-plural":"jenibili","feminine-neuter-plural":"jenibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jenibil","error-unrecognized-form-feminine-indefinite-singular":"jenibilă","error-unrecognized-form-indefinite-masculine-plural":"jenibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"jenibile","definite-error-unrecognized-form-masculine-neuter-singular":"jenibilul","definite-error-unrecognized-form-feminine-singular":"jenibila","definite-error-unrecognized-form-masculine-plural":"jenibilii","definite-error-unrecognized-form-feminine-neuter-plural":"jenibilele"}},{"word":"jenie","pos":"noun","definitions":["genius"],"forms":{"plural":"jenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jenie","accusative-definite-nominative-singular":"jenia","accusative-indefinite-nominative-plural":"jenii","accusative-definite-nominative-plural":"jeniile","dative-genitive-indefinite-singular":"jenii","dative-definite-genitive-singular":"jeniei","dative-genitive-indefinite-plural":"jenii","dative-definite-genitive-plural":"jeniilor","singular-vocative":"jenie","plural-vocative":"jeniilor"}},{"word":"jep","pos":"noun","definitions":["bog pine (Pinus mugo)"],"forms":{"plural":"jepi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jep","accusative-definite-nominative-singular":"jepul","accusative-indefinite-nominative-plural":"jepi","accusative-definite-nominative-plural":"jepii","dative-genitive-indefinite-singular":"jep","dative-definite-genitive-singular":"jepului","dative-genitive-indefinite-plural":"jepi","dative-definite-genitive-plural":"jepilor","singular-vocative":"jepule","plural-vocative":"jepilor"}},{"word":"jepii","pos":"noun","definitions":["definite nominative/accusative plural of jep"]},{"word":"Jepii Mari","pos":"name","definitions":["a river in Prahova, Romania, tributary to the Izvorul Dorului"],"gender":"m"},{"word":"jepilor","pos":"noun","definitions":["definite genitive/dative plural of jep"]},{"word":"jeratec","pos":"noun","definitions":["alternative form of jăratic"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jeratec","accusative-definite-nominative":"jeratecul","dative-genitive-indefinite":"jeratec","dative-definite-genitive":"jeratecului","vocative":"jeratecule"}},{"word":"jeratic","pos":"noun","definitions":["alternative form of jăratic"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jeratic","accusative-definite-nominative":"jeraticul","dative-genitive-indefinite":"jeratic","dative-definite-genitive":"jeraticului","vocative":"jeraticule"}},{"word":"jerbă","pos":"noun","definitions":["sheaf"],"forms":{"plural":"jerbe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jerbă","accusative-definite-nominative-singular":"jerba","accusative-indefinite-nominative-plural":"jerbe","accusative-definite-nominative-plural":"jerbele","dative-genitive-indefinite-singular":"jerbe","dative-definite-genitive-singular":"jerbei","dative-genitive-indefinite-plural":"jerbe","dative-definite-genitive-plural":"jerbelor","singular-vocative":"jerbă","plural-vocative":"jerbelor"}},{"word":"jerbe","pos":"noun","definitions":["inflection of jerbă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈʒerbe]","gender":"f"},{"word":"jerbo","pos":"noun","definitions":["vocative singular of jerbă"],"pronunciation":"[ˈʒerbo]","gender":"f"},{"word":"Jercălăi","pos":"name","definitions":["a locality in Urlați, Prahova County, Romania"],"gender":"m"},{"word":"Jercălău","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jercălău"}},{"word":"jeregai","pos":"noun","definitions":["alternative form of jărăgai"],"forms":{"plural":"jeregaiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jeregai","accusative-definite-nominative-singular":"jeregaiul","accusative-indefinite-nominative-plural":"jeregaiuri","accusative-definite-nominative-plural":"jeregaiurile","dative-genitive-indefinite-singular":"jeregai","dative-definite-genitive-singular":"jeregaiului","dative-genitive-indefinite-plural":"jeregaiuri","dative-definite-genitive-plural":"jeregaiurilor","singular-vocative":"jeregaiule","plural-vocative":"jeregaiurilor"}},{"word":"jerfă","pos":"noun","definitions":["obsolete form of jertfă"],"forms":{"plural":"jerfe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jerfă","accusative-definite-nominative-singular":"jerfa","accusative-indefinite-nominative-plural":"jerfe","accusative-definite-nominative-plural":"jerfele","dative-genitive-indefinite-singular":"jerfe","dative-definite-genitive-singular":"jerfei","dative-genitive-indefinite-plural":"jerfe","dative-definite-genitive-plural":"jerfelor","singular-vocative":"jerfă","plural-vocative":"jerfelor"}},{"word":"Jeriștea","pos":"name","definitions":["a village in Săcelu, Gorj County, Romania"],"gender":"f"},{"word":"Jernoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Jernoiu"}},{"word":"jerpeli","pos":"verb","definitions":["to wear out (about clothes, books etc.)"],"pronunciation":"/ʒer.peˈli/","forms":{"canonical":"a jerpeli 4th conjugation","present-singular-third-person":"jerpelește","participle-past":"jerpelit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jerpeli","gerund":"jerpelind","first-person-indicative-present-singular":"jerpelesc","indicative-present-second-person-singular":"jerpelești","indicative-present-singular-third-person":"jerpelește","first-person-indicative-plural-present":"jerpelim","indicative-plural-present-second-person":"jerpeliți","indicative-plural-present-third-person":"jerpelesc","first-person-imperfect-indicative-singular":"jerpeleam","imperfect-indicative-second-person-singular":"jerpeleai","imperfect-indicative-singular-third-person":"jerpelea","first-person-imperfect-indicative-plural":"jerpeleam","imperfect-indicative-plural-second-person":"jerpeleați","imperfect-indicative-plural-third-person":"jerpeleau","first-person-indicative-perfect-singular":"jerpelii","indicative-perfect-second-person-singular":"jerpeliși","indicative-perfect-singular-third-person":"jerpeli","first-person-indicative-perfect-plural":"jerpelirăm","indicative-perfect-plural-second-person":"jerpelirăți","indicative-perfect-plural-third-person":"jerpeliră","first-person-indicative-pluperfect-singular":"jerpelisem","indicative-pluperfect-second-person-singular":"jerpeliseși","indicative-pluperfect-singular-third-person":"jerpelise","first-person-indicative-pluperfect-plural":"jerpeliserăm","indicative-pluperfect-plural-second-person":"jerpeliserăți","indicative-pluperfect-plural-third-person":"jerpeliseră","first-person-present-singular-subjunctive":"să jerpelesc","present-second-person-singular-subjunctive":"să jerpelești","present-singular-subjunctive-third-person":"să jerpelească","first-person-plural-present-subjunctive":"să jerpelim","plural-present-second-person-subjunctive":"să jerpeliți","plural-present-subjunctive-third-person":"să jerpelească","imperative-second-person-singular":"jerpelește","imperative-plural-second-person":"jerpeliți","imperative-negative-second-person-singular":"nu jerpeli","imperative-negative-plural-second-person":"nu jerpeliți"}},{"word":"jerpelit","pos":"adj","definitions":["shabby"],"forms":{"feminine-singular":"jerpelită","masculine-plural":"jerpeliți","feminine-neuter-plural":"jerpelite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jerpelit","error-unrecognized-form-feminine-indefinite-singular":"jerpelită","error-unrecognized-form-indefinite-masculine-plural":"jerpeliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jerpelite","definite-error-unrecognized-form-masculine-neuter-singular":"jerpelitul","definite-error-unrecognized-form-feminine-singular":"jerpelita","definite-error-unrecognized-form-masculine-plural":"jerpeliții","definite-error-unrecognized-form-feminine-neuter-plural":"jerpelitele"}},{"word":"jerpelitură","pos":"noun","definitions":["rag, old, torn clothes"],"pronunciation":"/ʒer.pe.liˈtu.rə/","forms":{"plural":"jerpelituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jerpelitură","accusative-definite-nominative-singular":"jerpelitura","accusative-indefinite-nominative-plural":"jerpelituri","accusative-definite-nominative-plural":"jerpeliturile","dative-genitive-indefinite-singular":"jerpelituri","dative-definite-genitive-singular":"jerpeliturii","dative-genitive-indefinite-plural":"jerpelituri","dative-definite-genitive-plural":"jerpeliturilor","singular-vocative":"jerpelitură","plural-vocative":"jerpeliturilor"}},{"word":"jerse","pos":"noun","definitions":["alternative form of jerseu"],"forms":{"plural":"jerseuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jerse","accusative-definite-nominative-singular":"jerseul","accusative-indefinite-nominative-plural":"jerseuri","accusative-definite-nominative-plural":"jerseurile","dative-genitive-indefinite-singular":"jerse","dative-definite-genitive-singular":"jerseului","dative-genitive-indefinite-plural":"jerseuri","dative-definite-genitive-plural":"jerseurilor","singular-vocative":"jerseule","plural-vocative":"jerseurilor"}},{"word":"jerseu","pos":"noun","definitions":["jersey"],"forms":{"plural":"jerseuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jerseu","accusative-definite-nominative-singular":"jerseul","accusative-indefinite-nominative-plural":"jerseuri","accusative-definite-nominative-plural":"jerseurile","dative-genitive-indefinite-singular":"jerseu","dative-definite-genitive-singular":"jerseului","dative-genitive-indefinite-plural":"jerseuri","dative-definite-genitive-plural":"jerseurilor","singular-vocative":"jerseule","plural-vocative":"jerseurilor"}},{"word":"jertfă","pos":"noun","definitions":["sacrifice","oblation, offering","victim"],"pronunciation":"[ˈʒer.tfə]","forms":{"plural":"jertfe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jertfă","accusative-definite-nominative-singular":"jertfa","accusative-indefinite-nominative-plural":"jertfe","accusative-definite-nominative-plural":"jertfele","dative-genitive-indefinite-singular":"jertfe","dative-definite-genitive-singular":"jertfei","dative-genitive-indefinite-plural":"jertfe","dative-definite-genitive-plural":"jertfelor","singular-vocative":"jertfă","plural-vocative":"jertfelor"}},{"word":"jertfelnic","pos":"noun","definitions":["altar"],"forms":{"plural":"jertfelnice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jertfelnic","accusative-definite-nominative-singular":"jertfelnicul","accusative-indefinite-nominative-plural":"jertfelnice","accusative-definite-nominative-plural":"jertfelnicele","dative-genitive-indefinite-singular":"jertfelnic","dative-definite-genitive-singular":"jertfelnicului","dative-genitive-indefinite-plural":"jertfelnice","dative-definite-genitive-plural":"jertfelnicelor","singular-vocative":"jertfelnicule","plural-vocative":"jertfelnicelor"}},{"word":"jertfi","pos":"verb","definitions":["to sacrifice"],"forms":{"canonical":"a jertfi 4th conjugation","present-singular-third-person":"jertfește","participle-past":"jertfit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jertfi","gerund":"jertfind","first-person-indicative-present-singular":"jertfesc","indicative-present-second-person-singular":"jertfești","indicative-present-singular-third-person":"jertfește","first-person-indicative-plural-present":"jertfim","indicative-plural-present-second-person":"jertfiți","indicative-plural-present-third-person":"jertfesc","first-person-imperfect-indicative-singular":"jertfeam","imperfect-indicative-second-person-singular":"jertfeai","imperfect-indicative-singular-third-person":"jertfea","first-person-imperfect-indicative-plural":"jertfeam","imperfect-indicative-plural-second-person":"jertfeați","imperfect-indicative-plural-third-person":"jertfeau","first-person-indicative-perfect-singular":"jertfii","indicative-perfect-second-person-singular":"jertfiși","indicative-perfect-singular-third-person":"jertfi","first-person-indicative-perfect-plural":"jertfirăm","indicative-perfect-plural-second-person":"jertfirăți","indicative-perfect-plural-third-person":"jertfiră","first-person-indicative-pluperfect-singular":"jertfisem","indicative-pluperfect-second-person-singular":"jertfiseși","indicative-pluperfect-singular-third-person":"jertfise","first-person-indicative-pluperfect-plural":"jertfiserăm","indicative-pluperfect-plural-second-person":"jertfiserăți","indicative-pluperfect-plural-third-person":"jertfiseră","first-person-present-singular-subjunctive":"să jertfesc","present-second-person-singular-subjunctive":"să jertfești","present-singular-subjunctive-third-person":"să jertfească","first-person-plural-present-subjunctive":"să jertfim","plural-present-second-person-subjunctive":"să jertfiți","plural-present-subjunctive-third-person":"să jertfească","imperative-second-person-singular":"jertfește","imperative-plural-second-person":"jertfiți","imperative-negative-second-person-singular":"nu jertfi","imperative-negative-plural-second-person":"nu jertfiți"}},{"word":"jertfire","pos":"noun","definitions":["sacrifice","immolation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"jertfire","accusative-definite-nominative":"jertfirea","dative-genitive-indefinite":"jertfire","dative-definite-genitive":"jertfirei","vocative":"jertfire"}},{"word":"jertfui","pos":"verb","definitions":["to sacrifice"],"forms":{"canonical":"a jertfui 4th conjugation","present-singular-third-person":"jertfuiește","participle-past":"jertfuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jertfui","gerund":"jertfuind","first-person-indicative-present-singular":"jertfuiesc","indicative-present-second-person-singular":"jertfuiești","indicative-present-singular-third-person":"jertfuiește","first-person-indicative-plural-present":"jertfuim","indicative-plural-present-second-person":"jertfuiți","indicative-plural-present-third-person":"jertfuiesc","first-person-imperfect-indicative-singular":"jertfuiam","imperfect-indicative-second-person-singular":"jertfuiai","imperfect-indicative-singular-third-person":"jertfuia","first-person-imperfect-indicative-plural":"jertfuiam","imperfect-indicative-plural-second-person":"jertfuiați","imperfect-indicative-plural-third-person":"jertfuiau","first-person-indicative-perfect-singular":"jertfuii","indicative-perfect-second-person-singular":"jertfuiși","indicative-perfect-singular-third-person":"jertfui","first-person-indicative-perfect-plural":"jertfuirăm","indicative-perfect-plural-second-person":"jertfuirăți","indicative-perfect-plural-third-person":"jertfuiră","first-person-indicative-pluperfect-singular":"jertfuisem","indicative-pluperfect-second-person-singular":"jertfuiseși","indicative-pluperfect-singular-third-person":"jertfuise","first-person-indicative-pluperfect-plural":"jertfuiserăm","indicative-pluperfect-plural-second-person":"jertfuiserăți","indicative-pluperfect-plural-third-person":"jertfuiseră","first-person-present-singular-subjunctive":"să jertfuiesc","present-second-person-singular-subjunctive":"să jertfuiești","present-singular-subjunctive-third-person":"să jertfuiască","first-person-plural-present-subjunctive":"să jertfuim","plural-present-second-person-subjunctive":"să jertfuiți","plural-present-subjunctive-third-person":"să jertfuiască","imperative-second-person-singular":"jertfuiește","imperative-plural-second-person":"jertfuiți","imperative-negative-second-person-singular":"nu jertfui","imperative-negative-plural-second-person":"nu jertfuiți"}},{"word":"jertfuire","pos":"noun","definitions":["sacrifice"],"forms":{"plural":"jertfuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jertfuire","accusative-definite-nominative-singular":"jertfuirea","accusative-indefinite-nominative-plural":"jertfuiri","accusative-definite-nominative-plural":"jertfuirile","dative-genitive-indefinite-singular":"jertfuiri","dative-definite-genitive-singular":"jertfuirii","dative-genitive-indefinite-plural":"jertfuiri","dative-definite-genitive-plural":"jertfuirilor","singular-vocative":"jertfuire","plural-vocative":"jertfuirilor"}},{"word":"jertvă","pos":"noun","definitions":["obsolete form of jertfă"],"forms":{"plural":"jertve","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jertvă","accusative-definite-nominative-singular":"jertva","accusative-indefinite-nominative-plural":"jertve","accusative-definite-nominative-plural":"jertvele","dative-genitive-indefinite-singular":"jertve","dative-definite-genitive-singular":"jertvei","dative-genitive-indefinite-plural":"jertve","dative-definite-genitive-plural":"jertvelor","singular-vocative":"jertvă","plural-vocative":"jertvelor"}},{"word":"jerui","pos":"verb","definitions":["alternative form of jărui"],"forms":{"canonical":"a jerui 4th conjugation","present-singular-third-person":"jeruiește","participle-past":"jeruit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jerui","gerund":"jeruind","first-person-indicative-present-singular":"jeruiesc","indicative-present-second-person-singular":"jeruiești","indicative-present-singular-third-person":"jeruiește","first-person-indicative-plural-present":"jeruim","indicative-plural-present-second-person":"jeruiți","indicative-plural-present-third-person":"jeruiesc","first-person-imperfect-indicative-singular":"jeruiam","imperfect-indicative-second-person-singular":"jeruiai","imperfect-indicative-singular-third-person":"jeruia","first-person-imperfect-indicative-plural":"jeruiam","imperfect-indicative-plural-second-person":"jeruiați","imperfect-indicative-plural-third-person":"jeruiau","first-person-indicative-perfect-singular":"jeruii","indicative-perfect-second-person-singular":"jeruiși","indicative-perfect-singular-third-person":"jerui","first-person-indicative-perfect-plural":"jeruirăm","indicative-perfect-plural-second-person":"jeruirăți","indicative-perfect-plural-third-person":"jeruiră","first-person-indicative-pluperfect-singular":"jeruisem","indicative-pluperfect-second-person-singular":"jeruiseși","indicative-pluperfect-singular-third-person":"jeruise","first-person-indicative-pluperfect-plural":"jeruiserăm","indicative-pluperfect-plural-second-person":"jeruiserăți","indicative-pluperfect-plural-third-person":"jeruiseră","first-person-present-singular-subjunctive":"să jeruiesc","present-second-person-singular-subjunctive":"să jeruiești","present-singular-subjunctive-third-person":"să jeruiască","first-person-plural-present-subjunctive":"să jeruim","plural-present-second-person-subjunctive":"să jeruiți","plural-present-subjunctive-third-person":"să jeruiască","imperative-second-person-singular":"jeruiește","imperative-plural-second-person":"jeruiți","imperative-negative-second-person-singular":"nu jerui","imperative-negative-plural-second-person":"nu jeruiți"}},{"word":"jet","pos":"noun","definitions":["jet (of a gas of liquid)"],"forms":{"plural":"jeturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jet","accusative-definite-nominative-singular":"jetul","accusative-indefinite-nominative-plural":"jeturi","accusative-definite-nominative-plural":"jeturile","dative-genitive-indefinite-singular":"jet","dative-definite-genitive-singular":"jetului","dative-genitive-indefinite-plural":"jeturi","dative-definite-genitive-plural":"jeturilor","singular-vocative":"jetule","plural-vocative":"jeturilor"}},{"word":"jeț","pos":"noun","definitions":["a large, tall, or high chair, similar to a throne","armchair","easy chair, lounge chair"],"pronunciation":"/ˈʒet͡s/","forms":{"plural":"jețuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jeț","accusative-definite-nominative-singular":"jețul","accusative-indefinite-nominative-plural":"jețuri","accusative-definite-nominative-plural":"jețurile","dative-genitive-indefinite-singular":"jeț","dative-definite-genitive-singular":"jețului","dative-genitive-indefinite-plural":"jețuri","dative-definite-genitive-plural":"jețurilor","singular-vocative":"jețule","plural-vocative":"jețurilor","alternative":"jilț"}},{"word":"jeteu","pos":"noun","definitions":["make one stitch"],"forms":{"plural":"jeteuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jeteu","accusative-definite-nominative-singular":"jeteul","accusative-indefinite-nominative-plural":"jeteuri","accusative-definite-nominative-plural":"jeteurile","dative-genitive-indefinite-singular":"jeteu","dative-definite-genitive-singular":"jeteului","dative-genitive-indefinite-plural":"jeteuri","dative-definite-genitive-plural":"jeteurilor","singular-vocative":"jeteule","plural-vocative":"jeteurilor"}},{"word":"jeton","pos":"noun","definitions":["token"],"forms":{"plural":"jetoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jeton","accusative-definite-nominative-singular":"jetonul","accusative-indefinite-nominative-plural":"jetoane","accusative-definite-nominative-plural":"jetoanele","dative-genitive-indefinite-singular":"jeton","dative-definite-genitive-singular":"jetonului","dative-genitive-indefinite-plural":"jetoane","dative-definite-genitive-plural":"jetoanelor","singular-vocative":"jetonule","plural-vocative":"jetoanelor"}},{"word":"jețurel","pos":"noun","definitions":["diminutive of jeț"],"forms":{"plural":"jețurele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jețurel","accusative-definite-nominative-singular":"jețurelul","accusative-indefinite-nominative-plural":"jețurele","accusative-definite-nominative-plural":"jețurelele","dative-genitive-indefinite-singular":"jețurel","dative-definite-genitive-singular":"jețurelului","dative-genitive-indefinite-plural":"jețurele","dative-definite-genitive-plural":"jețurelelor","singular-vocative":"jețurelule","plural-vocative":"jețurelelor"}},{"word":"jevroaică","pos":"noun","definitions":["bitch"],"forms":{"plural":"jevroaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jevroaică","accusative-definite-nominative-singular":"jevroaica","accusative-indefinite-nominative-plural":"jevroaice","accusative-definite-nominative-plural":"jevroaicele","dative-genitive-indefinite-singular":"jevroaice","dative-definite-genitive-singular":"jevroaicei","dative-genitive-indefinite-plural":"jevroaice","dative-definite-genitive-plural":"jevroaicelor","singular-vocative":"jevroaică","plural-vocative":"jevroaicelor"}},{"word":"jezuit","pos":"noun","definitions":["obsolete form of iezuit"],"forms":{"plural":"jezuiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jezuit","accusative-definite-nominative-singular":"jezuitul","accusative-indefinite-nominative-plural":"jezuiți","accusative-definite-nominative-plural":"jezuiții","dative-genitive-indefinite-singular":"jezuit","dative-definite-genitive-singular":"jezuitului","dative-genitive-indefinite-plural":"jezuiți","dative-definite-genitive-plural":"jezuiților","singular-vocative":"jezuitule","plural-vocative":"jezuiților"}},{"word":"Jgheab","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Bahrin","a river in Buzău, Romania, tributary to the Slănic"],"gender":"m"},{"word":"jgheab","pos":"noun","definitions":["gutter","drainpipe","waterway","groove","trough"],"pronunciation":"/ʒɡe̯ab/","forms":{"plural":"jgheaburi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jgheab","accusative-definite-nominative-singular":"jgheabul","accusative-indefinite-nominative-plural":"jgheaburi","accusative-definite-nominative-plural":"jgheaburile","dative-genitive-indefinite-singular":"jgheab","dative-definite-genitive-singular":"jgheabului","dative-genitive-indefinite-plural":"jgheaburi","dative-definite-genitive-plural":"jgheaburilor","singular-vocative":"jgheabule","plural-vocative":"jgheaburilor","alternative":"zgheab"}},{"word":"Jgheabu Muntelui","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Bățul"],"gender":"m"},{"word":"Jgheabul Cherecului","pos":"name","definitions":["a river in Neamț County, Romania, tributary to the Bicăjel"],"gender":"m"},{"word":"Jgheaburi","pos":"name","definitions":["a village in Corbi, Argeș County, Romania","a village in Reghiu, Vrancea County, Romania"],"gender":"m"},{"word":"jgheaburi","pos":"noun","definitions":["plural of jgheab"]},{"word":"Jgheboasa","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Ribița"],"gender":"f"},{"word":"jghebuleț","pos":"noun","definitions":["diminutive of jgheab; small gutter"],"forms":{"plural":"jghebulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jghebuleț","accusative-definite-nominative-singular":"jghebulețul","accusative-indefinite-nominative-plural":"jghebulețe","accusative-definite-nominative-plural":"jghebulețele","dative-genitive-indefinite-singular":"jghebuleț","dative-definite-genitive-singular":"jghebulețului","dative-genitive-indefinite-plural":"jghebulețe","dative-definite-genitive-plural":"jghebulețelor","singular-vocative":"jghebulețule","plural-vocative":"jghebulețelor"}},{"word":"Jgheburoasa","pos":"name","definitions":["a river in Argeș, Romania, tributary to the Zârna"],"gender":"f"},{"word":"Jghiab","pos":"name","definitions":["a village in Mânzălești, Buzău County, Romania"],"gender":"m"},{"word":"Jghiabului","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Strei"],"gender":"m"},{"word":"jian","pos":"noun","definitions":["person from the region around the Jiu river in Romania"],"forms":{"plural":"jieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jian","accusative-definite-nominative-singular":"jianul","accusative-indefinite-nominative-plural":"jieni","accusative-definite-nominative-plural":"jienii","dative-genitive-indefinite-singular":"jian","dative-definite-genitive-singular":"jianului","dative-genitive-indefinite-plural":"jieni","dative-definite-genitive-plural":"jienilor","singular-vocative":"jianule","plural-vocative":"jienilor"}},{"word":"Jiana","pos":"name","definitions":["a commune of Mehedinți County, Romania","a village in Jiana, Mehedinți County, Romania"],"gender":"f"},{"word":"jiană","pos":"noun","definitions":["female equivalent of jian"],"forms":{"plural":"jiane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jiană","accusative-definite-nominative-singular":"jiana","accusative-indefinite-nominative-plural":"jiane","accusative-definite-nominative-plural":"jianele","dative-genitive-indefinite-singular":"jiane","dative-definite-genitive-singular":"jianei","dative-genitive-indefinite-plural":"jiane","dative-definite-genitive-plural":"jianelor","singular-vocative":"jiană","plural-vocative":"jianelor"}},{"word":"Jiana Mare","pos":"name","definitions":["a village in Jiana, Mehedinți County, Romania"],"gender":"f"},{"word":"Jiana Veche","pos":"name","definitions":["a village in Jiana, Mehedinți County, Romania"],"gender":"f"},{"word":"jiancă","pos":"noun","definitions":["female equivalent of jian"],"forms":{"plural":"jience","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jiancă","accusative-definite-nominative-singular":"jianca","accusative-indefinite-nominative-plural":"jience","accusative-definite-nominative-plural":"jiencele","dative-genitive-indefinite-singular":"jience","dative-definite-genitive-singular":"jiencei","dative-genitive-indefinite-plural":"jience","dative-definite-genitive-plural":"jiencelor","singular-vocative":"jiancă","plural-vocative":"jiencelor"}},{"word":"Jibert","pos":"name","definitions":["a commune of Brașov County, Romania","a village in Jibert, Brașov County, Romania"],"gender":"m"},{"word":"Jiblea Nouă","pos":"name","definitions":["a locality in Călimănești, Vâlcea County, Romania"],"gender":"f"},{"word":"Jiblea Veche","pos":"name","definitions":["a locality in Călimănești, Vâlcea County, Romania"],"forms":{"canonical":"Jiblea Vechef"}},{"word":"Jiboan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jiboan"}},{"word":"Jibou","pos":"name","definitions":["a town in Sălaj County, Romania"],"gender":"m"},{"word":"Jichișu de Jos","pos":"name","definitions":["a commune of Cluj County, Romania","a village in Jichișu de Jos, Cluj County, Romania"],"gender":"m"},{"word":"Jichișu de Sus","pos":"name","definitions":["a village in Jichișu de Jos, Cluj County, Romania"],"gender":"m"},{"word":"jiclor","pos":"noun","definitions":["nozzle"],"forms":{"plural":"jicloare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jiclor","accusative-definite-nominative-singular":"jiclorul","accusative-indefinite-nominative-plural":"jicloare","accusative-definite-nominative-plural":"jicloarele","dative-genitive-indefinite-singular":"jiclor","dative-definite-genitive-singular":"jiclorului","dative-genitive-indefinite-plural":"jicloare","dative-definite-genitive-plural":"jicloarelor","singular-vocative":"jiclorule","plural-vocative":"jicloarelor"}},{"word":"Jicmon","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Jicmon"}},{"word":"jicni","pos":"verb","definitions":["alternative form of jigni"],"forms":{"canonical":"a jicni 4th conjugation","present-singular-third-person":"jicnește","participle-past":"jicnit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jicni","gerund":"jicnind","first-person-indicative-present-singular":"jicnesc","indicative-present-second-person-singular":"jicnești","indicative-present-singular-third-person":"jicnește","first-person-indicative-plural-present":"jicnim","indicative-plural-present-second-person":"jicniți","indicative-plural-present-third-person":"jicnesc","first-person-imperfect-indicative-singular":"jicneam","imperfect-indicative-second-person-singular":"jicneai","imperfect-indicative-singular-third-person":"jicnea","first-person-imperfect-indicative-plural":"jicneam","imperfect-indicative-plural-second-person":"jicneați","imperfect-indicative-plural-third-person":"jicneau","first-person-indicative-perfect-singular":"jicnii","indicative-perfect-second-person-singular":"jicniși","indicative-perfect-singular-third-person":"jicni","first-person-indicative-perfect-plural":"jicnirăm","indicative-perfect-plural-second-person":"jicnirăți","indicative-perfect-plural-third-person":"jicniră","first-person-indicative-pluperfect-singular":"jicnisem","indicative-pluperfect-second-person-singular":"jicniseși","indicative-pluperfect-singular-third-person":"jicnise","first-person-indicative-pluperfect-plural":"jicniserăm","indicative-pluperfect-plural-second-person":"jicniserăți","indicative-pluperfect-plural-third-person":"jicniseră","first-person-present-singular-subjunctive":"să jicnesc","present-second-person-singular-subjunctive":"să jicnești","present-singular-subjunctive-third-person":"să jicnească","first-person-plural-present-subjunctive":"să jicnim","plural-present-second-person-subjunctive":"să jicniți","plural-present-subjunctive-third-person":"să jicnească","imperative-second-person-singular":"jicnește","imperative-plural-second-person":"jicniți","imperative-negative-second-person-singular":"nu jicni","imperative-negative-plural-second-person":"nu jicniți"}},{"word":"jicnicer","pos":"noun","definitions":["alternative form of jitnicer"],"forms":{"plural":"jicniceri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jicnicer","accusative-definite-nominative-singular":"jicnicerul","accusative-indefinite-nominative-plural":"jicniceri","accusative-definite-nominative-plural":"jicnicerii","dative-genitive-indefinite-singular":"jicnicer","dative-definite-genitive-singular":"jicnicerului","dative-genitive-indefinite-plural":"jicniceri","dative-definite-genitive-plural":"jicnicerilor","singular-vocative":"jicnicerule","plural-vocative":"jicnicerilor"}},{"word":"jicnire","pos":"noun","definitions":["obsolete form of jignire"],"forms":{"plural":"jicniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jicnire","accusative-definite-nominative-singular":"jicnirea","accusative-indefinite-nominative-plural":"jicniri","accusative-definite-nominative-plural":"jicnirile","dative-genitive-indefinite-singular":"jicniri","dative-definite-genitive-singular":"jicnirii","dative-genitive-indefinite-plural":"jicniri","dative-definite-genitive-plural":"jicnirilor","singular-vocative":"jicnire","plural-vocative":"jicnirilor"}},{"word":"jicnit","pos":"adj","definitions":["obsolete form of jignit"],"forms":{"feminine-singular":"jicnită","masculine-plural":"jicniți","feminine-neuter-plural":"jicnite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jicnit","error-unrecognized-form-feminine-indefinite-singular":"jicnită","error-unrecognized-form-indefinite-masculine-plural":"jicniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jicnite","definite-error-unrecognized-form-masculine-neuter-singular":"jicnitul","definite-error-unrecognized-form-feminine-singular":"jicnita","definite-error-unrecognized-form-masculine-plural":"jicniții","definite-error-unrecognized-form-feminine-neuter-plural":"jicnitele"}},{"word":"jicniță","pos":"noun","definitions":["obsolete form of jitniță"],"forms":{"plural":"jicnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jicniță","accusative-definite-nominative-singular":"jicnița","accusative-indefinite-nominative-plural":"jicnițe","accusative-definite-nominative-plural":"jicnițele","dative-genitive-indefinite-singular":"jicnițe","dative-definite-genitive-singular":"jicniței","dative-genitive-indefinite-plural":"jicnițe","dative-definite-genitive-plural":"jicnițelor","singular-vocative":"jicniță","plural-vocative":"jicnițelor"}},{"word":"jid","pos":"noun","definitions":["Jewish"],"forms":{"plural":"jizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jid","accusative-definite-nominative-singular":"jidul","accusative-indefinite-nominative-plural":"jizi","accusative-definite-nominative-plural":"jizii","dative-genitive-indefinite-singular":"jid","dative-definite-genitive-singular":"jidului","dative-genitive-indefinite-plural":"jizi","dative-definite-genitive-plural":"jizilor","singular-vocative":"jidule","plural-vocative":"jizilor"}},{"word":"jidan","pos":"noun","definitions":["Jew, yid, kike"],"pronunciation":"/ʒiˈdan/","forms":{"plural":"jidani","feminine":"equivalent jidancă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jidan","accusative-definite-nominative-singular":"jidanul","accusative-indefinite-nominative-plural":"jidani","accusative-definite-nominative-plural":"jidanii","dative-genitive-indefinite-singular":"jidan","dative-definite-genitive-singular":"jidanului","dative-genitive-indefinite-plural":"jidani","dative-definite-genitive-plural":"jidanilor","singular-vocative":"jidanule","plural-vocative":"jidanilor"}},{"word":"jidănaș","pos":"noun","definitions":["diminutive of jidan"],"forms":{"plural":"jidănași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"jidănaș","accusative-definite-nominative":"jidănașul","dative-genitive-indefinite":"jidănaș","dative-definite-genitive":"jidănașului","vocative":"jidănașule"}},{"word":"jidancă","pos":"noun","definitions":["Jewess"],"forms":{"plural":"jidance","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jidancă","accusative-definite-nominative-singular":"jidanca","accusative-indefinite-nominative-plural":"jidance","accusative-definite-nominative-plural":"jidancele","dative-genitive-indefinite-singular":"jidance","dative-definite-genitive-singular":"jidancei","dative-genitive-indefinite-plural":"jidance","dative-definite-genitive-plural":"jidancelor","singular-vocative":"jidancă","plural-vocative":"jidancelor"}},{"word":"jidăncuță","pos":"noun","definitions":["diminutive of jidancă; (derogatory, ethnic slur) small Jewess"],"forms":{"plural":"jidăncuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jidăncuță","accusative-definite-nominative-singular":"jidăncuța","accusative-indefinite-nominative-plural":"jidăncuțe","accusative-definite-nominative-plural":"jidăncuțele","dative-genitive-indefinite-singular":"jidăncuțe","dative-definite-genitive-singular":"jidăncuței","dative-genitive-indefinite-plural":"jidăncuțe","dative-definite-genitive-plural":"jidăncuțelor","singular-vocative":"jidăncuță","plural-vocative":"jidăncuțelor"}},{"word":"jidănesc","pos":"adj","definitions":["Jewishly"],"forms":{"feminine-singular":"jidănească","plural":"jidănești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jidănesc","error-unrecognized-form-feminine-indefinite-singular":"jidănească","error-unrecognized-form-indefinite-masculine-plural":"jidănești","error-unrecognized-form-feminine-indefinite-neuter-plural":"jidănești","definite-error-unrecognized-form-masculine-neuter-singular":"jidănescul","definite-error-unrecognized-form-feminine-singular":"jidăneasca","definite-error-unrecognized-form-masculine-plural":"jidăneștii","definite-error-unrecognized-form-feminine-neuter-plural":"jidăneștile"}},{"word":"jidănime","pos":"noun","definitions":["Jewdom, Jewry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"jidănime","accusative-definite-nominative":"jidănimea","dative-genitive-indefinite":"jidănimi","dative-definite-genitive":"jidănimii","vocative":"jidănime"}},{"word":"Jidanul","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Bicaz","a river in Hunedoara, Romania, tributary to the Jiul de Vest"],"gender":"m"},{"word":"jidanul","pos":"noun","definitions":["definite nominative/accusative singular of jidan"]},{"word":"jidoaică","pos":"noun","definitions":["Jewess"],"forms":{"plural":"jidoaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jidoaică","accusative-definite-nominative-singular":"jidoaica","accusative-indefinite-nominative-plural":"jidoaice","accusative-definite-nominative-plural":"jidoaicele","dative-genitive-indefinite-singular":"jidoaice","dative-definite-genitive-singular":"jidoaicei","dative-genitive-indefinite-plural":"jidoaice","dative-definite-genitive-plural":"jidoaicelor","singular-vocative":"jidoaică","plural-vocative":"jidoaicelor"}},{"word":"jidoavcă","pos":"noun","definitions":["Jewess"],"forms":{"plural":"jidoavce","alternative":"jidoafcă"}},{"word":"jidoavce","pos":"noun","definitions":["plural of jidoavcă"]},{"word":"jidofcuță","pos":"noun","definitions":["diminutive of jidovcă"],"forms":{"plural":"jidofcuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jidofcuță","accusative-definite-nominative-singular":"jidofcuța","accusative-indefinite-nominative-plural":"jidofcuțe","accusative-definite-nominative-plural":"jidofcuțele","dative-genitive-indefinite-singular":"jidofcuțe","dative-definite-genitive-singular":"jidofcuței","dative-genitive-indefinite-plural":"jidofcuțe","dative-definite-genitive-plural":"jidofcuțelor","singular-vocative":"jidofcuță","plural-vocative":"jidofcuțelor"}},{"word":"Jidoi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Jidoi"}},{"word":"Jidoștina","pos":"name","definitions":["a village in Șugag, Alba County, Romania"],"gender":"f"},{"word":"Jidoștița","pos":"name","definitions":["a river in Mehedinți, Romania, tributary to the Danube","a village in Breznița-Ocol, Mehedinți County, Romania"],"gender":"f"},{"word":"Jidov","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Jidov"}},{"word":"jidov","pos":"noun","definitions":["Jew","yid, kike"],"forms":{"plural":"jidovi","feminine":"equivalent jidoavcă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jidov","accusative-definite-nominative-singular":"jidovul","accusative-indefinite-nominative-plural":"jidovi","accusative-definite-nominative-plural":"jidovii","dative-genitive-indefinite-singular":"jidov","dative-definite-genitive-singular":"jidovului","dative-genitive-indefinite-plural":"jidovi","dative-definite-genitive-plural":"jidovilor","singular-vocative":"jidovule","plural-vocative":"jidovilor"}},{"word":"jidovcă","pos":"noun","definitions":["Jewish woman"],"forms":{"plural":"jidovce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jidovcă","accusative-definite-nominative-singular":"jidovca","accusative-indefinite-nominative-plural":"jidovce","accusative-definite-nominative-plural":"jidovcele","dative-genitive-indefinite-singular":"jidovce","dative-definite-genitive-singular":"jidovcei","dative-genitive-indefinite-plural":"jidovce","dative-definite-genitive-plural":"jidovcelor","singular-vocative":"jidovcă","plural-vocative":"jidovcelor"}},{"word":"Jidoveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jidoveanu"}},{"word":"jidovesc","pos":"adj","definitions":["Jewishly"],"forms":{"feminine-singular":"jidovească","plural":"jidovești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jidovesc","error-unrecognized-form-feminine-indefinite-singular":"jidovească","error-unrecognized-form-indefinite-masculine-plural":"jidovești","error-unrecognized-form-feminine-indefinite-neuter-plural":"jidovești","definite-error-unrecognized-form-masculine-neuter-singular":"jidovescul","definite-error-unrecognized-form-feminine-singular":"jidoveasca","definite-error-unrecognized-form-masculine-plural":"jidoveștii","definite-error-unrecognized-form-feminine-neuter-plural":"jidoveștile"}},{"word":"jidovește","pos":"adv","definitions":["Jewishly"]},{"word":"jidovie","pos":"noun","definitions":["Jewish faith"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"jidovie","accusative-definite-nominative":"jidovia","dative-genitive-indefinite":"jidovii","dative-definite-genitive":"jidoviei","vocative":"jidovie"}},{"word":"jidovime","pos":"noun","definitions":["Jews (collectively)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"jidovime","accusative-definite-nominative":"jidovimea","dative-genitive-indefinite":"jidovimi","dative-definite-genitive":"jidovimii","vocative":"jidovime"}},{"word":"jidovin","pos":"noun","definitions":["a Jew"],"forms":{"plural":"jidovini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jidovin","accusative-definite-nominative-singular":"jidovinul","accusative-indefinite-nominative-plural":"jidovini","accusative-definite-nominative-plural":"jidovinii","dative-genitive-indefinite-singular":"jidovin","dative-definite-genitive-singular":"jidovinului","dative-genitive-indefinite-plural":"jidovini","dative-definite-genitive-plural":"jidovinilor","singular-vocative":"jidovinule","plural-vocative":"jidovinilor"}},{"word":"jidovoaică","pos":"noun","definitions":["female equivalent of jidov"],"forms":{"plural":"jidovoaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jidovoaică","accusative-definite-nominative-singular":"jidovoaica","accusative-indefinite-nominative-plural":"jidovoaice","accusative-definite-nominative-plural":"jidovoaicele","dative-genitive-indefinite-singular":"jidovoaice","dative-definite-genitive-singular":"jidovoaicei","dative-genitive-indefinite-plural":"jidovoaice","dative-definite-genitive-plural":"jidovoaicelor","singular-vocative":"jidovoaică","plural-vocative":"jidovoaicelor"}},{"word":"Jidovu","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Jidovu"}},{"word":"Jidvei","pos":"name","definitions":["a commune of Alba County, Romania","a village in Jidvei, Alba County, Romania"],"gender":"m"},{"word":"Jienaru","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jienaru"}},{"word":"jieneasca","pos":"noun","definitions":["a Romanian folk dance"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"jieneasca","accusative-definite-nominative":"jieneasca","dative-genitive-indefinite":"jienești","dative-definite-genitive":"jieneștii","vocative":"-"}},{"word":"Jienescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Jienescu"}},{"word":"Jieni","pos":"name","definitions":["a village in Șimnicu de Sus, Dolj County, Romania","a village in Rusănești, Olt County, Romania"],"gender":"m"},{"word":"Jieț","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Jiul de Est","a locality in Petrila, Hunedoara County, Romania"],"gender":"m"},{"word":"jig","pos":"noun","definitions":["obsolete form of jeg"],"forms":{"plural":"jiguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jig","accusative-definite-nominative-singular":"jigul","accusative-indefinite-nominative-plural":"jiguri","accusative-definite-nominative-plural":"jigurile","dative-genitive-indefinite-singular":"jig","dative-definite-genitive-singular":"jigului","dative-genitive-indefinite-plural":"jiguri","dative-definite-genitive-plural":"jigurilor","singular-vocative":"jigule","plural-vocative":"jigurilor"}},{"word":"Jiganie","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jiganie"}},{"word":"jiganie","pos":"noun","definitions":["wild beast"],"forms":{"plural":"jigănii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jiganie","accusative-definite-nominative-singular":"jigania","accusative-indefinite-nominative-plural":"jiganii","accusative-definite-nominative-plural":"jiganiile","dative-genitive-indefinite-singular":"jiganii","dative-definite-genitive-singular":"jiganiei","dative-genitive-indefinite-plural":"jiganii","dative-definite-genitive-plural":"jiganiilor","singular-vocative":"jiganie","plural-vocative":"jiganiilor"}},{"word":"jigăniuță","pos":"noun","definitions":["diminutive of jiganie"],"forms":{"plural":"jigăniuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jigăniuță","accusative-definite-nominative-singular":"jigăniuța","accusative-indefinite-nominative-plural":"jigăniuțe","accusative-definite-nominative-plural":"jigăniuțele","dative-genitive-indefinite-singular":"jigăniuțe","dative-definite-genitive-singular":"jigăniuței","dative-genitive-indefinite-plural":"jigăniuțe","dative-definite-genitive-plural":"jigăniuțelor","singular-vocative":"jigăniuță","plural-vocative":"jigăniuțelor"}},{"word":"jigărainiță","pos":"noun","definitions":["mange"],"forms":{"plural":"jigărainițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jigărainiță","accusative-definite-nominative-singular":"jigărainița","accusative-indefinite-nominative-plural":"jigărainițe","accusative-definite-nominative-plural":"jigărainițele","dative-genitive-indefinite-singular":"jigărainițe","dative-definite-genitive-singular":"jigărainiței","dative-genitive-indefinite-plural":"jigărainițe","dative-definite-genitive-plural":"jigărainițelor","singular-vocative":"jigărainiță","plural-vocative":"jigărainițelor"}},{"word":"jigăreală","pos":"noun","definitions":["feebleness"],"forms":{"plural":"jigăreli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jigăreală","accusative-definite-nominative-singular":"jigăreala","accusative-indefinite-nominative-plural":"jigărele","accusative-definite-nominative-plural":"jigărelele","dative-genitive-indefinite-singular":"jigărele","dative-definite-genitive-singular":"jigărelei","dative-genitive-indefinite-plural":"jigărele","dative-definite-genitive-plural":"jigărelelor","singular-vocative":"jigăreală","plural-vocative":"jigărelelor"}},{"word":"jigări","pos":"verb","definitions":["to become weak"],"forms":{"canonical":"a jigări 4th conjugation","present-singular-third-person":"jigărește","participle-past":"jigărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jigări","gerund":"jigărind","first-person-indicative-present-singular":"jigăresc","indicative-present-second-person-singular":"jigărești","indicative-present-singular-third-person":"jigărește","first-person-indicative-plural-present":"jigărim","indicative-plural-present-second-person":"jigăriți","indicative-plural-present-third-person":"jigăresc","first-person-imperfect-indicative-singular":"jigăream","imperfect-indicative-second-person-singular":"jigăreai","imperfect-indicative-singular-third-person":"jigărea","first-person-imperfect-indicative-plural":"jigăream","imperfect-indicative-plural-second-person":"jigăreați","imperfect-indicative-plural-third-person":"jigăreau","first-person-indicative-perfect-singular":"jigării","indicative-perfect-second-person-singular":"jigăriși","indicative-perfect-singular-third-person":"jigări","first-person-indicative-perfect-plural":"jigărirăm","indicative-perfect-plural-second-person":"jigărirăți","indicative-perfect-plural-third-person":"jigăriră","first-person-indicative-pluperfect-singular":"jigărisem","indicative-pluperfect-second-person-singular":"jigăriseși","indicative-pluperfect-singular-third-person":"jigărise","first-person-indicative-pluperfect-plural":"jigăriserăm","indicative-pluperfect-plural-second-person":"jigăriserăți","indicative-pluperfect-plural-third-person":"jigăriseră","first-person-present-singular-subjunctive":"să jigăresc","present-second-person-singular-subjunctive":"să jigărești","present-singular-subjunctive-third-person":"să jigărească","first-person-plural-present-subjunctive":"să jigărim","plural-present-second-person-subjunctive":"să jigăriți","plural-present-subjunctive-third-person":"să jigărească","imperative-second-person-singular":"jigărește","imperative-plural-second-person":"jigăriți","imperative-negative-second-person-singular":"nu jigări","imperative-negative-plural-second-person":"nu jigăriți"}},{"word":"jigâricioară","pos":"noun","definitions":["diminutive of jigăriță"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"jigâricioară","accusative-definite-nominative":"jigâricioara","dative-genitive-indefinite":"jigâricioare","dative-definite-genitive":"jigâricioarei","vocative":"jigâricioară"}},{"word":"jigăriță","pos":"noun","definitions":["cow lung"],"forms":{"plural":"jigărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jigăriță","accusative-definite-nominative-singular":"jigărița","accusative-indefinite-nominative-plural":"jigărițe","accusative-definite-nominative-plural":"jigărițele","dative-genitive-indefinite-singular":"jigărițe","dative-definite-genitive-singular":"jigăriței","dative-genitive-indefinite-plural":"jigărițe","dative-definite-genitive-plural":"jigărițelor","singular-vocative":"jigăriță","plural-vocative":"jigărițelor"}},{"word":"jigluitură","pos":"noun","definitions":["balustrade"],"forms":{"plural":"jigluituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jigluitură","accusative-definite-nominative-singular":"jigluitura","accusative-indefinite-nominative-plural":"jigluituri","accusative-definite-nominative-plural":"jigluiturile","dative-genitive-indefinite-singular":"jigluituri","dative-definite-genitive-singular":"jigluiturii","dative-genitive-indefinite-plural":"jigluituri","dative-definite-genitive-plural":"jigluiturilor","singular-vocative":"jigluitură","plural-vocative":"jigluiturilor"}},{"word":"jigni","pos":"verb","definitions":["to insult, to offend, to humiliate, to hurt"],"pronunciation":"/ʒiɡˈni/","forms":{"canonical":"a jigni 4th conjugation","present-singular-third-person":"jignește","participle-past":"jignit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jigni","gerund":"jignind","first-person-indicative-present-singular":"jignesc","indicative-present-second-person-singular":"jignești","indicative-present-singular-third-person":"jignește","first-person-indicative-plural-present":"jignim","indicative-plural-present-second-person":"jigniți","indicative-plural-present-third-person":"jignesc","first-person-imperfect-indicative-singular":"jigneam","imperfect-indicative-second-person-singular":"jigneai","imperfect-indicative-singular-third-person":"jignea","first-person-imperfect-indicative-plural":"jigneam","imperfect-indicative-plural-second-person":"jigneați","imperfect-indicative-plural-third-person":"jigneau","first-person-indicative-perfect-singular":"jignii","indicative-perfect-second-person-singular":"jigniși","indicative-perfect-singular-third-person":"jigni","first-person-indicative-perfect-plural":"jignirăm","indicative-perfect-plural-second-person":"jignirăți","indicative-perfect-plural-third-person":"jigniră","first-person-indicative-pluperfect-singular":"jignisem","indicative-pluperfect-second-person-singular":"jigniseși","indicative-pluperfect-singular-third-person":"jignise","first-person-indicative-pluperfect-plural":"jigniserăm","indicative-pluperfect-plural-second-person":"jigniserăți","indicative-pluperfect-plural-third-person":"jigniseră","first-person-present-singular-subjunctive":"să jignesc","present-second-person-singular-subjunctive":"să jignești","present-singular-subjunctive-third-person":"să jignească","first-person-plural-present-subjunctive":"să jignim","plural-present-second-person-subjunctive":"să jigniți","plural-present-subjunctive-third-person":"să jignească","imperative-second-person-singular":"jignește","imperative-plural-second-person":"jigniți","imperative-negative-second-person-singular":"nu jigni","imperative-negative-plural-second-person":"nu jigniți"}},{"word":"jignicer","pos":"noun","definitions":["alternative form of jitnicer"],"forms":{"plural":"jigniceri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jignicer","accusative-definite-nominative-singular":"jignicerul","accusative-indefinite-nominative-plural":"jigniceri","accusative-definite-nominative-plural":"jignicerii","dative-genitive-indefinite-singular":"jignicer","dative-definite-genitive-singular":"jignicerului","dative-genitive-indefinite-plural":"jigniceri","dative-definite-genitive-plural":"jignicerilor","singular-vocative":"jignicerule","plural-vocative":"jignicerilor"}},{"word":"jignire","pos":"noun","definitions":["offense"],"forms":{"plural":"jigniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jignire","accusative-definite-nominative-singular":"jignirea","accusative-indefinite-nominative-plural":"jigniri","accusative-definite-nominative-plural":"jignirile","dative-genitive-indefinite-singular":"jigniri","dative-definite-genitive-singular":"jignirii","dative-genitive-indefinite-plural":"jigniri","dative-definite-genitive-plural":"jignirilor","singular-vocative":"jignire","plural-vocative":"jignirilor"}},{"word":"jignit","pos":"adj","definitions":["insulted"],"forms":{"feminine-singular":"jignită","masculine-plural":"jigniți","feminine-neuter-plural":"jignite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jignit","error-unrecognized-form-feminine-indefinite-singular":"jignită","error-unrecognized-form-indefinite-masculine-plural":"jigniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jignite","definite-error-unrecognized-form-masculine-neuter-singular":"jignitul","definite-error-unrecognized-form-feminine-singular":"jignita","definite-error-unrecognized-form-masculine-plural":"jigniții","definite-error-unrecognized-form-feminine-neuter-plural":"jignitele"}},{"word":"jigniță","pos":"noun","definitions":["obsolete form of jitniță"],"forms":{"plural":"jignițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jigniță","accusative-definite-nominative-singular":"jignița","accusative-indefinite-nominative-plural":"jignițe","accusative-definite-nominative-plural":"jignițele","dative-genitive-indefinite-singular":"jignițe","dative-definite-genitive-singular":"jigniței","dative-genitive-indefinite-plural":"jignițe","dative-definite-genitive-plural":"jignițelor","singular-vocative":"jigniță","plural-vocative":"jignițelor"}},{"word":"jignitor","pos":"adj","definitions":["offensive"],"forms":{"feminine-singular":"jignitoare","masculine-plural":"jignitori","feminine-neuter-plural":"jignitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jignitor","error-unrecognized-form-feminine-indefinite-singular":"jignitoare","error-unrecognized-form-indefinite-masculine-plural":"jignitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"jignitoare","definite-error-unrecognized-form-masculine-neuter-singular":"jignitorul","definite-error-unrecognized-form-feminine-singular":"jignitoarea","definite-error-unrecognized-form-masculine-plural":"jignitorii","definite-error-unrecognized-form-feminine-neuter-plural":"jignitoarele"}},{"word":"jigodie","pos":"noun","definitions":["mange","cur, twerp","hireling"],"forms":{"plural":"jigodii"}},{"word":"jigodii","pos":"noun","definitions":["plural of jigodie"]},{"word":"Jigodin-Băi","pos":"name","definitions":["a locality in Miercurea Ciuc, Harghita County, Romania"],"gender":"m"},{"word":"jigodios","pos":"adj","definitions":["mangy"],"forms":{"feminine-singular":"jigodioasă","masculine-plural":"jigodioși","feminine-neuter-plural":"jigodioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jigodios","error-unrecognized-form-feminine-indefinite-singular":"jigodioasă","error-unrecognized-form-indefinite-masculine-plural":"jigodioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"jigodioase","definite-error-unrecognized-form-masculine-neuter-singular":"jigodiosul","definite-error-unrecognized-form-feminine-singular":"jigodioasa","definite-error-unrecognized-form-masculine-plural":"jigodioșii","definite-error-unrecognized-form-feminine-neuter-plural":"jigodioasele"}},{"word":"Jigoreni","pos":"name","definitions":["a village in Țibănești, Iași County, Romania"],"gender":"m"},{"word":"jigou","pos":"noun","definitions":["lamb leg"],"forms":{"plural":"jigouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jigou","accusative-definite-nominative-singular":"jigoul","accusative-indefinite-nominative-plural":"jigouri","accusative-definite-nominative-plural":"jigourile","dative-genitive-indefinite-singular":"jigou","dative-definite-genitive-singular":"jigoului","dative-genitive-indefinite-plural":"jigouri","dative-definite-genitive-plural":"jigourilor","singular-vocative":"jigoule","plural-vocative":"jigourilor"}},{"word":"jihad","pos":"noun","definitions":["jihad"],"forms":{"plural":"jihaduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jihad","accusative-definite-nominative-singular":"jihadul","accusative-indefinite-nominative-plural":"jihaduri","accusative-definite-nominative-plural":"jihadurile","dative-genitive-indefinite-singular":"jihad","dative-definite-genitive-singular":"jihadului","dative-genitive-indefinite-plural":"jihaduri","dative-definite-genitive-plural":"jihadurilor","singular-vocative":"jihadule","plural-vocative":"jihadurilor"}},{"word":"Jijia","pos":"name","definitions":["a river in Romania and Ukraine, tributary to the Prut","a river in Suceava, Romania, tributary to the Boul","a village in Albești, Botoșani County, Romania"],"gender":"f"},{"word":"jijină","pos":"noun","definitions":["dirt, filth, grime"],"forms":{"plural":"jijine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jijină","accusative-definite-nominative-singular":"jijina","accusative-indefinite-nominative-plural":"jijine","accusative-definite-nominative-plural":"jijinele","dative-genitive-indefinite-singular":"jijine","dative-definite-genitive-singular":"jijinei","dative-genitive-indefinite-plural":"jijine","dative-definite-genitive-plural":"jijinelor","singular-vocative":"jijină","plural-vocative":"jijinelor"}},{"word":"Jijioara","pos":"name","definitions":["a river in Iași, Romania, tributary to the Jijia"],"gender":"f"},{"word":"jilă","pos":"noun","definitions":["vein (of a horse)"],"forms":{"plural":"jile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jilă","accusative-definite-nominative-singular":"jila","accusative-indefinite-nominative-plural":"jile","accusative-definite-nominative-plural":"jilele","dative-genitive-indefinite-singular":"jile","dative-definite-genitive-singular":"jilei","dative-genitive-indefinite-plural":"jile","dative-definite-genitive-plural":"jilelor","singular-vocative":"jilă","plural-vocative":"jilelor"}},{"word":"jilău","pos":"noun","definitions":["plane"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jilău","accusative-definite-nominative":"jilăuul","dative-genitive-indefinite":"jilău","dative-definite-genitive":"jilăuului","vocative":"jilăuule"}},{"word":"jilav","pos":"adj","definitions":["wet"],"forms":{"feminine-singular":"jilavă","masculine-plural":"jilavi","feminine-neuter-plural":"jilave","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jilav","error-unrecognized-form-feminine-indefinite-singular":"jilavă","error-unrecognized-form-indefinite-masculine-plural":"jilavi","error-unrecognized-form-feminine-indefinite-neuter-plural":"jilave","definite-error-unrecognized-form-masculine-neuter-singular":"jilavul","definite-error-unrecognized-form-feminine-singular":"jilava","definite-error-unrecognized-form-masculine-plural":"jilavii","definite-error-unrecognized-form-feminine-neuter-plural":"jilavele"}},{"word":"Jilava","pos":"name","definitions":["a commune of Ilfov County, Romania","a village in Jilava, Ilfov County, Romania"],"gender":"f"},{"word":"jilăveală","pos":"noun","definitions":["moisting"],"forms":{"plural":"jilăveli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jilăveală","accusative-definite-nominative-singular":"jilăveala","accusative-indefinite-nominative-plural":"jilăveli","accusative-definite-nominative-plural":"jilăvelile","dative-genitive-indefinite-singular":"jilăveli","dative-definite-genitive-singular":"jilăvelii","dative-genitive-indefinite-plural":"jilăveli","dative-definite-genitive-plural":"jilăvelilor","singular-vocative":"jilăveală","plural-vocative":"jilăvelilor"}},{"word":"Jilăveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jilăveanu"}},{"word":"Jilavele","pos":"name","definitions":["a commune of Ialomița County, Romania","a village in Jilavele, Ialomița County, Romania"],"gender":"m"},{"word":"jilăvi","pos":"verb","definitions":["to moisten, to wet"],"forms":{"canonical":"a jilăvi 4th conjugation","present-singular-third-person":"jilăvește","participle-past":"jilăvit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jilăvi","gerund":"jilăvind","first-person-indicative-present-singular":"jilăvesc","indicative-present-second-person-singular":"jilăvești","indicative-present-singular-third-person":"jilăvește","first-person-indicative-plural-present":"jilăvim","indicative-plural-present-second-person":"jilăviți","indicative-plural-present-third-person":"jilăvesc","first-person-imperfect-indicative-singular":"jilăveam","imperfect-indicative-second-person-singular":"jilăveai","imperfect-indicative-singular-third-person":"jilăvea","first-person-imperfect-indicative-plural":"jilăveam","imperfect-indicative-plural-second-person":"jilăveați","imperfect-indicative-plural-third-person":"jilăveau","first-person-indicative-perfect-singular":"jilăvii","indicative-perfect-second-person-singular":"jilăviși","indicative-perfect-singular-third-person":"jilăvi","first-person-indicative-perfect-plural":"jilăvirăm","indicative-perfect-plural-second-person":"jilăvirăți","indicative-perfect-plural-third-person":"jilăviră","first-person-indicative-pluperfect-singular":"jilăvisem","indicative-pluperfect-second-person-singular":"jilăviseși","indicative-pluperfect-singular-third-person":"jilăvise","first-person-indicative-pluperfect-plural":"jilăviserăm","indicative-pluperfect-plural-second-person":"jilăviserăți","indicative-pluperfect-plural-third-person":"jilăviseră","first-person-present-singular-subjunctive":"să jilăvesc","present-second-person-singular-subjunctive":"să jilăvești","present-singular-subjunctive-third-person":"să jilăvească","first-person-plural-present-subjunctive":"să jilăvim","plural-present-second-person-subjunctive":"să jilăviți","plural-present-subjunctive-third-person":"să jilăvească","imperative-second-person-singular":"jilăvește","imperative-plural-second-person":"jilăviți","imperative-negative-second-person-singular":"nu jilăvi","imperative-negative-plural-second-person":"nu jilăviți"}},{"word":"jilăvie","pos":"noun","definitions":["humidity"],"forms":{"plural":"jilăvii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jilăvie","accusative-definite-nominative-singular":"jilăvia","accusative-indefinite-nominative-plural":"jilăvii","accusative-definite-nominative-plural":"jilăviile","dative-genitive-indefinite-singular":"jilăvii","dative-definite-genitive-singular":"jilăviei","dative-genitive-indefinite-plural":"jilăvii","dative-definite-genitive-plural":"jilăviilor","singular-vocative":"jilăvie","plural-vocative":"jilăviilor"}},{"word":"jilăvire","pos":"noun","definitions":["wetting"],"forms":{"plural":"jilăviri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jilăvire","accusative-definite-nominative-singular":"jilăvirea","accusative-indefinite-nominative-plural":"jilăviri","accusative-definite-nominative-plural":"jilăvirile","dative-genitive-indefinite-singular":"jilăviri","dative-definite-genitive-singular":"jilăvirii","dative-genitive-indefinite-plural":"jilăviri","dative-definite-genitive-plural":"jilăvirilor","singular-vocative":"jilăvire","plural-vocative":"jilăvirilor"}},{"word":"jilăvit","pos":"adj","definitions":["humid"],"forms":{"feminine-singular":"jilăvită","masculine-plural":"jilăviți","feminine-neuter-plural":"jilăvite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jilăvit","error-unrecognized-form-feminine-indefinite-singular":"jilăvită","error-unrecognized-form-indefinite-masculine-plural":"jilăviți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jilăvite","definite-error-unrecognized-form-masculine-neuter-singular":"jilăvitul","definite-error-unrecognized-form-feminine-singular":"jilăvita","definite-error-unrecognized-form-masculine-plural":"jilăviții","definite-error-unrecognized-form-feminine-neuter-plural":"jilăvitele"}},{"word":"jilăvit","pos":"verb","definitions":["past participle of jilăvi"],"forms":{"participle-past":"of jilăvi"}},{"word":"Jilavu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jilavu"}},{"word":"jiletcă","pos":"noun","definitions":["waistcoat"],"forms":{"plural":"jiletci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jiletcă","accusative-definite-nominative-singular":"jiletca","accusative-indefinite-nominative-plural":"jiletci","accusative-definite-nominative-plural":"jiletcile","dative-genitive-indefinite-singular":"jiletci","dative-definite-genitive-singular":"jiletcii","dative-genitive-indefinite-plural":"jiletci","dative-definite-genitive-plural":"jiletcilor","singular-vocative":"jiletcă","plural-vocative":"jiletcilor"}},{"word":"jiletcel","pos":"noun","definitions":["diminutive of jiletcă"],"forms":{"plural":"jiletcele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jiletcel","accusative-definite-nominative-singular":"jiletcelul","accusative-indefinite-nominative-plural":"jiletcele","accusative-definite-nominative-plural":"jiletcelele","dative-genitive-indefinite-singular":"jiletcel","dative-definite-genitive-singular":"jiletcelului","dative-genitive-indefinite-plural":"jiletcele","dative-definite-genitive-plural":"jiletcelelor","singular-vocative":"jiletcelule","plural-vocative":"jiletcelelor"}},{"word":"Jiloveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jiloveanu"}},{"word":"Jilț","pos":"name","definitions":["a river in Gorj, Romania, tributary to the Jiu"],"gender":"m"},{"word":"jilț","pos":"noun","definitions":["alternative form of jeț"],"forms":{"plural":"jilțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jilț","accusative-definite-nominative-singular":"jilțul","accusative-indefinite-nominative-plural":"jilțuri","accusative-definite-nominative-plural":"jilțurile","dative-genitive-indefinite-singular":"jilț","dative-definite-genitive-singular":"jilțului","dative-genitive-indefinite-plural":"jilțuri","dative-definite-genitive-plural":"jilțurilor","singular-vocative":"jilțule","plural-vocative":"jilțurilor"}},{"word":"Jilț Slivilești","pos":"name","definitions":["a river in Gorj County, Romania, tributary to the Jilț"],"gender":"m"},{"word":"Jilțu","pos":"name","definitions":["a locality in Turceni, Gorj County, Romania","a surname"],"gender":"m","forms":{"dative-genitive":"lui Jilțu"}},{"word":"Jilțul Mic","pos":"name","definitions":["a river in Gorj, Romania, tributary to the Jilț"],"gender":"m"},{"word":"jimblă","pos":"noun","definitions":["oblong loaf (of bread)"],"forms":{"plural":"jimble","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jimblă","accusative-definite-nominative-singular":"jimbla","accusative-indefinite-nominative-plural":"jimble","accusative-definite-nominative-plural":"jimblele","dative-genitive-indefinite-singular":"jimble","dative-definite-genitive-singular":"jimblei","dative-genitive-indefinite-plural":"jimble","dative-definite-genitive-plural":"jimblelor","singular-vocative":"jimblă","plural-vocative":"jimblelor"}},{"word":"jimblar","pos":"noun","definitions":["baker"],"forms":{"plural":"jimblari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jimblar","accusative-definite-nominative-singular":"jimblarul","accusative-indefinite-nominative-plural":"jimblari","accusative-definite-nominative-plural":"jimblarii","dative-genitive-indefinite-singular":"jimblar","dative-definite-genitive-singular":"jimblarului","dative-genitive-indefinite-plural":"jimblari","dative-definite-genitive-plural":"jimblarilor","singular-vocative":"jimblarule","plural-vocative":"jimblarilor"}},{"word":"jimblăreasă","pos":"noun","definitions":["female equivalent of jimblar"],"forms":{"plural":"jimblărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jimblăreasă","accusative-definite-nominative-singular":"jimblăreasa","accusative-indefinite-nominative-plural":"jimblărese","accusative-definite-nominative-plural":"jimblăresele","dative-genitive-indefinite-singular":"jimblărese","dative-definite-genitive-singular":"jimblăresei","dative-genitive-indefinite-plural":"jimblărese","dative-definite-genitive-plural":"jimblăreselor","singular-vocative":"jimblăreasă","plural-vocative":"jimblăreselor"}},{"word":"jimblărie","pos":"noun","definitions":["bakery"],"forms":{"plural":"jimblării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jimblărie","accusative-definite-nominative-singular":"jimblăria","accusative-indefinite-nominative-plural":"jimblării","accusative-definite-nominative-plural":"jimblăriile","dative-genitive-indefinite-singular":"jimblării","dative-definite-genitive-singular":"jimblăriei","dative-genitive-indefinite-plural":"jimblării","dative-definite-genitive-plural":"jimblăriilor","singular-vocative":"jimblărie","plural-vocative":"jimblăriilor"}},{"word":"jimblăriță","pos":"noun","definitions":["diminutive of jimblar"],"forms":{"plural":"jimblărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jimblăriță","accusative-definite-nominative-singular":"jimblărița","accusative-indefinite-nominative-plural":"jimblărițe","accusative-definite-nominative-plural":"jimblărițele","dative-genitive-indefinite-singular":"jimblărițe","dative-definite-genitive-singular":"jimblăriței","dative-genitive-indefinite-plural":"jimblărițe","dative-definite-genitive-plural":"jimblărițelor","singular-vocative":"jimblăriță","plural-vocative":"jimblărițelor"}},{"word":"Jimblaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Jimblaru"}},{"word":"jimbluță","pos":"noun","definitions":["diminutive of jimblă"],"forms":{"plural":"jimbluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jimbluță","accusative-definite-nominative-singular":"jimbluța","accusative-indefinite-nominative-plural":"jimbluțe","accusative-definite-nominative-plural":"jimbluțele","dative-genitive-indefinite-singular":"jimbluțe","dative-definite-genitive-singular":"jimbluței","dative-genitive-indefinite-plural":"jimbluțe","dative-definite-genitive-plural":"jimbluțelor","singular-vocative":"jimbluță","plural-vocative":"jimbluțelor"}},{"word":"Jimbolia","pos":"name","definitions":["a town in Timiș County, Romania"],"gender":"f"},{"word":"Jimbor","pos":"name","definitions":["a village in Chiochiș, Bistrița-Năsăud County, Romania","a village in Homorod, Brașov County, Romania"],"gender":"m"},{"word":"Jimboran","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jimboran"}},{"word":"Jimboru","pos":"name","definitions":["a river in Covasna County, Romania, tributary to the Valea Roșie"],"gender":"m"},{"word":"jimbuliță","pos":"noun","definitions":["diminutive of jimblă"],"forms":{"plural":"jimbulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jimbuliță","accusative-definite-nominative-singular":"jimbulița","accusative-indefinite-nominative-plural":"jimbulițe","accusative-definite-nominative-plural":"jimbulițele","dative-genitive-indefinite-singular":"jimbulițe","dative-definite-genitive-singular":"jimbuliței","dative-genitive-indefinite-plural":"jimbulițe","dative-definite-genitive-plural":"jimbulițelor","singular-vocative":"jimbuliță","plural-vocative":"jimbulițelor"}},{"word":"jinău","pos":"noun","definitions":["suspicion"],"forms":{"plural":"jinaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jinău","accusative-definite-nominative-singular":"jinăuul","accusative-indefinite-nominative-plural":"jinaie","accusative-definite-nominative-plural":"jinaiele","dative-genitive-indefinite-singular":"jinău","dative-definite-genitive-singular":"jinăuului","dative-genitive-indefinite-plural":"jinaie","dative-definite-genitive-plural":"jinaielor","singular-vocative":"jinăuule","plural-vocative":"jinaielor"}},{"word":"jind","pos":"noun","definitions":["envy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jind","accusative-definite-nominative":"jindul","dative-genitive-indefinite":"jind","dative-definite-genitive":"jindului","vocative":"jindule"}},{"word":"jindui","pos":"verb","definitions":["to covet, crave, yearn or long for","to envy"],"forms":{"canonical":"a jindui 4th conjugation","present-singular-third-person":"jinduiește","participle-past":"jinduit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jindui","gerund":"jinduind","first-person-indicative-present-singular":"jinduiesc","indicative-present-second-person-singular":"jinduiești","indicative-present-singular-third-person":"jinduiește","first-person-indicative-plural-present":"jinduim","indicative-plural-present-second-person":"jinduiți","indicative-plural-present-third-person":"jinduiesc","first-person-imperfect-indicative-singular":"jinduiam","imperfect-indicative-second-person-singular":"jinduiai","imperfect-indicative-singular-third-person":"jinduia","first-person-imperfect-indicative-plural":"jinduiam","imperfect-indicative-plural-second-person":"jinduiați","imperfect-indicative-plural-third-person":"jinduiau","first-person-indicative-perfect-singular":"jinduii","indicative-perfect-second-person-singular":"jinduiși","indicative-perfect-singular-third-person":"jindui","first-person-indicative-perfect-plural":"jinduirăm","indicative-perfect-plural-second-person":"jinduirăți","indicative-perfect-plural-third-person":"jinduiră","first-person-indicative-pluperfect-singular":"jinduisem","indicative-pluperfect-second-person-singular":"jinduiseși","indicative-pluperfect-singular-third-person":"jinduise","first-person-indicative-pluperfect-plural":"jinduiserăm","indicative-pluperfect-plural-second-person":"jinduiserăți","indicative-pluperfect-plural-third-person":"jinduiseră","first-person-present-singular-subjunctive":"să jinduiesc","present-second-person-singular-subjunctive":"să jinduiești","present-singular-subjunctive-third-person":"să jinduiască","first-person-plural-present-subjunctive":"să jinduim","plural-present-second-person-subjunctive":"să jinduiți","plural-present-subjunctive-third-person":"să jinduiască","imperative-second-person-singular":"jinduiește","imperative-plural-second-person":"jinduiți","imperative-negative-second-person-singular":"nu jindui","imperative-negative-plural-second-person":"nu jinduiți"}},{"word":"jinduială","pos":"noun","definitions":["craving, coveting"],"forms":{"plural":"jinduieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jinduială","accusative-definite-nominative-singular":"jinduiala","accusative-indefinite-nominative-plural":"jinduiele","accusative-definite-nominative-plural":"jinduielele","dative-genitive-indefinite-singular":"jinduiele","dative-definite-genitive-singular":"jinduielei","dative-genitive-indefinite-plural":"jinduiele","dative-definite-genitive-plural":"jinduielelor","singular-vocative":"jinduială","plural-vocative":"jinduielelor"}},{"word":"jinduire","pos":"noun","definitions":["aching"],"forms":{"plural":"jinduiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jinduire","accusative-definite-nominative-singular":"jinduirea","accusative-indefinite-nominative-plural":"jinduiri","accusative-definite-nominative-plural":"jinduirile","dative-genitive-indefinite-singular":"jinduiri","dative-definite-genitive-singular":"jinduirii","dative-genitive-indefinite-plural":"jinduiri","dative-definite-genitive-plural":"jinduirilor","singular-vocative":"jinduire","plural-vocative":"jinduirilor"}},{"word":"jinduit","pos":"adj","definitions":["coveted"],"forms":{"feminine-singular":"jinduită","masculine-plural":"jinduiți","feminine-neuter-plural":"jinduite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jinduit","error-unrecognized-form-feminine-indefinite-singular":"jinduită","error-unrecognized-form-indefinite-masculine-plural":"jinduiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jinduite","definite-error-unrecognized-form-masculine-neuter-singular":"jinduitul","definite-error-unrecognized-form-feminine-singular":"jinduita","definite-error-unrecognized-form-masculine-plural":"jinduiții","definite-error-unrecognized-form-feminine-neuter-plural":"jinduitele"}},{"word":"jinduitor","pos":"adj","definitions":["covetous"],"forms":{"feminine-singular":"jinduitoare","masculine-plural":"jinduitori","feminine-neuter-plural":"jinduitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jinduitor","error-unrecognized-form-feminine-indefinite-singular":"jinduitoare","error-unrecognized-form-indefinite-masculine-plural":"jinduitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"jinduitoare","definite-error-unrecognized-form-masculine-neuter-singular":"jinduitorul","definite-error-unrecognized-form-feminine-singular":"jinduitoarea","definite-error-unrecognized-form-masculine-plural":"jinduitorii","definite-error-unrecognized-form-feminine-neuter-plural":"jinduitoarele"}},{"word":"Jingoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Jingoiu"}},{"word":"jinteră","pos":"noun","definitions":["earwig"],"forms":{"plural":"jintere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jinteră","accusative-definite-nominative-singular":"jintera","accusative-indefinite-nominative-plural":"jintere","accusative-definite-nominative-plural":"jinterele","dative-genitive-indefinite-singular":"jintere","dative-definite-genitive-singular":"jinterei","dative-genitive-indefinite-plural":"jintere","dative-definite-genitive-plural":"jinterelor","singular-vocative":"jinteră","plural-vocative":"jinterelor"}},{"word":"jintițit","pos":"adj","definitions":["coagulated"],"forms":{"feminine-singular":"jintițită","masculine-plural":"jintițiți","feminine-neuter-plural":"jintițite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jintițit","error-unrecognized-form-feminine-indefinite-singular":"jintițită","error-unrecognized-form-indefinite-masculine-plural":"jintițiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jintițite","definite-error-unrecognized-form-masculine-neuter-singular":"jintițitul","definite-error-unrecognized-form-feminine-singular":"jintițita","definite-error-unrecognized-form-masculine-plural":"jintițiții","definite-error-unrecognized-form-feminine-neuter-plural":"jintițitele"}},{"word":"Jipescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Jipescu"}},{"word":"Jiquidi","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Jiquidi"}},{"word":"jir","pos":"noun","definitions":["beech nut"],"pronunciation":"/ʒir/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jir","accusative-definite-nominative":"jirul","dative-genitive-indefinite":"jir","dative-definite-genitive":"jirului","vocative":"jirule"}},{"word":"jirbiuță","pos":"noun","definitions":["diminutive of jirebie"],"forms":{"plural":"jirbiuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jirbiuță","accusative-definite-nominative-singular":"jirbiuța","accusative-indefinite-nominative-plural":"jirbiuțe","accusative-definite-nominative-plural":"jirbiuțele","dative-genitive-indefinite-singular":"jirbiuțe","dative-definite-genitive-singular":"jirbiuței","dative-genitive-indefinite-plural":"jirbiuțe","dative-definite-genitive-plural":"jirbiuțelor","singular-vocative":"jirbiuță","plural-vocative":"jirbiuțelor"}},{"word":"jireagă","pos":"noun","definitions":["alternative form of șireglă"],"forms":{"plural":"jireage","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jireagă","accusative-definite-nominative-singular":"jireaga","accusative-indefinite-nominative-plural":"jireage","accusative-definite-nominative-plural":"jireagele","dative-genitive-indefinite-singular":"jireage","dative-definite-genitive-singular":"jireagei","dative-genitive-indefinite-plural":"jireage","dative-definite-genitive-plural":"jireagelor","singular-vocative":"jireagă","plural-vocative":"jireagelor"}},{"word":"jirișor","pos":"noun","definitions":["diminutive of jir"],"forms":{"plural":"jirișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jirișor","accusative-definite-nominative-singular":"jirișorul","accusative-indefinite-nominative-plural":"jirișori","accusative-definite-nominative-plural":"jirișorii","dative-genitive-indefinite-singular":"jirișor","dative-definite-genitive-singular":"jirișorului","dative-genitive-indefinite-plural":"jirișori","dative-definite-genitive-plural":"jirișorilor","singular-vocative":"jirișorule","plural-vocative":"jirișorilor"}},{"word":"jiriște","pos":"noun","definitions":["beechwood (forest)"],"forms":{"plural":"jiriști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jiriște","accusative-definite-nominative-singular":"jiriștea","accusative-indefinite-nominative-plural":"jiriști","accusative-definite-nominative-plural":"jiriștile","dative-genitive-indefinite-singular":"jiriști","dative-definite-genitive-singular":"jiriștii","dative-genitive-indefinite-plural":"jiriști","dative-definite-genitive-plural":"jiriștilor","singular-vocative":"jiriște","plural-vocative":"jiriștilor"}},{"word":"Jirlău","pos":"name","definitions":["a commune of Brăila County, Romania","a village in Jirlău, Brăila County, Romania"],"gender":"m"},{"word":"Jirov","pos":"name","definitions":["a village in Corcova, Mehedinți County, Romania"],"gender":"m"},{"word":"jirtăvnic","pos":"noun","definitions":["obsolete form of jertfelnic"],"forms":{"plural":"jirtăvnice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jirtăvnic","accusative-definite-nominative-singular":"jirtăvnicul","accusative-indefinite-nominative-plural":"jirtăvnice","accusative-definite-nominative-plural":"jirtăvnicele","dative-genitive-indefinite-singular":"jirtăvnic","dative-definite-genitive-singular":"jirtăvnicului","dative-genitive-indefinite-plural":"jirtăvnice","dative-definite-genitive-plural":"jirtăvnicelor","singular-vocative":"jirtăvnicule","plural-vocative":"jirtăvnicelor"}},{"word":"jirtvă","pos":"noun","definitions":["obsolete form of jertfă"],"forms":{"plural":"jirtve","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jirtvă","accusative-definite-nominative-singular":"jirtva","accusative-indefinite-nominative-plural":"jirtve","accusative-definite-nominative-plural":"jirtvele","dative-genitive-indefinite-singular":"jirtve","dative-definite-genitive-singular":"jirtvei","dative-genitive-indefinite-plural":"jirtve","dative-definite-genitive-plural":"jirtvelor","singular-vocative":"jirtvă","plural-vocative":"jirtvelor"}},{"word":"Jiru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jiru"}},{"word":"Jitar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Jitar"}},{"word":"jităreasă","pos":"noun","definitions":["female equivalent of jitar"],"forms":{"plural":"jitărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jităreasă","accusative-definite-nominative-singular":"jităreasa","accusative-indefinite-nominative-plural":"jitărese","accusative-definite-nominative-plural":"jităresele","dative-genitive-indefinite-singular":"jitărese","dative-definite-genitive-singular":"jităresei","dative-genitive-indefinite-plural":"jitărese","dative-definite-genitive-plural":"jităreselor","singular-vocative":"jităreasă","plural-vocative":"jităreselor"}},{"word":"Jitărel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jitărel"}},{"word":"Jitărița","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"f"},{"word":"Jitariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Jitariu"}},{"word":"Jitariuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Jitariuc"}},{"word":"Jităriuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Jităriuc"}},{"word":"Jitaru","pos":"name","definitions":["a village in Scornicești, Olt County, Romania"],"gender":"m"},{"word":"jitcă","pos":"noun","definitions":["a Jew"],"forms":{"plural":"jitci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jitcă","accusative-definite-nominative-singular":"jitca","accusative-indefinite-nominative-plural":"jitci","accusative-definite-nominative-plural":"jitcile","dative-genitive-indefinite-singular":"jitci","dative-definite-genitive-singular":"jitcii","dative-genitive-indefinite-plural":"jitci","dative-definite-genitive-plural":"jitcilor","singular-vocative":"jitcă","plural-vocative":"jitcilor"}},{"word":"Jiteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jiteanu"}},{"word":"Jitia de Jos","pos":"name","definitions":["a village in Jitia, Vrancea County, Romania"],"gender":"f"},{"word":"jitie","pos":"noun","definitions":["story","chronic disease"],"forms":{"plural":"jitii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jitie","accusative-definite-nominative-singular":"jitia","accusative-indefinite-nominative-plural":"jitii","accusative-definite-nominative-plural":"jitiile","dative-genitive-indefinite-singular":"jitii","dative-definite-genitive-singular":"jitiei","dative-genitive-indefinite-plural":"jitii","dative-definite-genitive-plural":"jitiilor","singular-vocative":"jitie","plural-vocative":"jitiilor"}},{"word":"Jitin","pos":"name","definitions":["a village in Ciudanovița, Caraș-Severin County, Romania"],"gender":"m"},{"word":"jitniță","pos":"noun","definitions":["granary"],"forms":{"plural":"jitnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jitniță","accusative-definite-nominative-singular":"jitnița","accusative-indefinite-nominative-plural":"jitnițe","accusative-definite-nominative-plural":"jitnițele","dative-genitive-indefinite-singular":"jitnițe","dative-definite-genitive-singular":"jitniței","dative-genitive-indefinite-plural":"jitnițe","dative-definite-genitive-plural":"jitnițelor","singular-vocative":"jitniță","plural-vocative":"jitnițelor"}},{"word":"Jiu","pos":"name","definitions":["a river in Romania"],"gender":"m"},{"word":"jiu-jitsu","pos":"noun","definitions":["jujitsu"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jiu-jitsu","accusative-definite-nominative":"jiu-jitsul","dative-genitive-indefinite":"jiu-jitsu","dative-definite-genitive":"jiu-jitsului","vocative":"jiu-jitsule"}},{"word":"Jiu-Paroșeni","pos":"name","definitions":["a locality in Vulcan, Hunedoara County, Romania"],"gender":"m"},{"word":"Jiul","pos":"name","definitions":["a village in Țuglui, Dolj County, Romania"],"gender":"m"},{"word":"Jiul de Est","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Jiu"],"gender":"m"},{"word":"Jiul de Vest","pos":"name","definitions":["a river in Romania, tributary to the Jiu"],"gender":"m"},{"word":"Jivan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jivan"}},{"word":"jivan","pos":"noun","definitions":["bandit, brigand, outlaw"],"forms":{"plural":"jivani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jivan","accusative-definite-nominative-singular":"jivanul","accusative-indefinite-nominative-plural":"jivani","accusative-definite-nominative-plural":"jivanii","dative-genitive-indefinite-singular":"jivan","dative-definite-genitive-singular":"jivanului","dative-genitive-indefinite-plural":"jivani","dative-definite-genitive-plural":"jivanilor","singular-vocative":"jivanule","plural-vocative":"jivanilor"}},{"word":"Jivanov","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Jivanov"}},{"word":"jivete","pos":"noun","definitions":["the letter zhe (ж) of the Romanian Cyrillic alphabet"],"forms":{"plural":"jiveți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jivete","accusative-definite-nominative-singular":"jiveteul","accusative-indefinite-nominative-plural":"jiveți","accusative-definite-nominative-plural":"jiveții","dative-genitive-indefinite-singular":"jivete","dative-definite-genitive-singular":"jiveteului","dative-genitive-indefinite-plural":"jiveți","dative-definite-genitive-plural":"jiveților","singular-vocative":"jiveteule","plural-vocative":"jiveților"}},{"word":"jivină","pos":"noun","definitions":["wild animal","brute"],"forms":{"plural":"jivine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jivină","accusative-definite-nominative-singular":"jivina","accusative-indefinite-nominative-plural":"jivine","accusative-definite-nominative-plural":"jivinele","dative-genitive-indefinite-singular":"jivine","dative-definite-genitive-singular":"jivinei","dative-genitive-indefinite-plural":"jivine","dative-definite-genitive-plural":"jivinelor","singular-vocative":"jivină","plural-vocative":"jivinelor"}},{"word":"jivinie","pos":"noun","definitions":["wild animal"],"forms":{"plural":"jivinii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jivinie","accusative-definite-nominative-singular":"jivinia","accusative-indefinite-nominative-plural":"jivinii","accusative-definite-nominative-plural":"jiviniile","dative-genitive-indefinite-singular":"jivinii","dative-definite-genitive-singular":"jiviniei","dative-genitive-indefinite-plural":"jivinii","dative-definite-genitive-plural":"jiviniilor","singular-vocative":"jivinie","plural-vocative":"jiviniilor"}},{"word":"jivinuță","pos":"noun","definitions":["diminutive of jivină"],"forms":{"plural":"jivinuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jivinuță","accusative-definite-nominative-singular":"jivinuța","accusative-indefinite-nominative-plural":"jivinuțe","accusative-definite-nominative-plural":"jivinuțele","dative-genitive-indefinite-singular":"jivinuțe","dative-definite-genitive-singular":"jivinuței","dative-genitive-indefinite-plural":"jivinuțe","dative-definite-genitive-plural":"jivinuțelor","singular-vocative":"jivinuță","plural-vocative":"jivinuțelor"}},{"word":"jivraj","pos":"noun","definitions":["icing"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jivraj","accusative-definite-nominative-singular":"jivrajul","accusative-indefinite-nominative-plural":"jivraje","accusative-definite-nominative-plural":"jivrajele","dative-genitive-indefinite-singular":"jivraj","dative-definite-genitive-singular":"jivrajului","dative-genitive-indefinite-plural":"jivraje","dative-definite-genitive-plural":"jivrajelor","singular-vocative":"jivrajule","plural-vocative":"jivrajelor"}},{"word":"jivrat","pos":"adj","definitions":["frosted"],"forms":{"feminine-singular":"jivrată","masculine-plural":"jivrați","feminine-neuter-plural":"jivrate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jivrat","error-unrecognized-form-feminine-indefinite-singular":"jivrată","error-unrecognized-form-indefinite-masculine-plural":"jivrați","error-unrecognized-form-feminine-indefinite-neuter-plural":"jivrate","definite-error-unrecognized-form-masculine-neuter-singular":"jivratul","definite-error-unrecognized-form-feminine-singular":"jivrata","definite-error-unrecognized-form-masculine-plural":"jivrații","definite-error-unrecognized-form-feminine-neuter-plural":"jivratele"}},{"word":"jlipă","pos":"noun","definitions":["plaster"],"forms":{"plural":"jlipe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jlipă","accusative-definite-nominative-singular":"jlipa","accusative-indefinite-nominative-plural":"jlipe","accusative-definite-nominative-plural":"jlipele","dative-genitive-indefinite-singular":"jlipe","dative-definite-genitive-singular":"jlipei","dative-genitive-indefinite-plural":"jlipe","dative-definite-genitive-plural":"jlipelor","singular-vocative":"jlipă","plural-vocative":"jlipelor"}},{"word":"jnăpăi","pos":"verb","definitions":["to beat up"],"forms":{"canonical":"a jnăpăi 4th conjugation","present-singular-third-person":"jnăpăie","participle-past":"jnăpăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a jnăpăi","gerund":"jnăpăind","first-person-indicative-present-singular":"jnăpăi","indicative-present-second-person-singular":"jnăpăi","indicative-present-singular-third-person":"jnăpăie","first-person-indicative-plural-present":"jnăpăim","indicative-plural-present-second-person":"jnăpăiți","indicative-plural-present-third-person":"jnăpăie","first-person-imperfect-indicative-singular":"jnăpăiam","imperfect-indicative-second-person-singular":"jnăpăiai","imperfect-indicative-singular-third-person":"jnăpăia","first-person-imperfect-indicative-plural":"jnăpăiam","imperfect-indicative-plural-second-person":"jnăpăiați","imperfect-indicative-plural-third-person":"jnăpăiau","first-person-indicative-perfect-singular":"jnăpăii","indicative-perfect-second-person-singular":"jnăpăiși","indicative-perfect-singular-third-person":"jnăpăi","first-person-indicative-perfect-plural":"jnăpăirăm","indicative-perfect-plural-second-person":"jnăpăirăți","indicative-perfect-plural-third-person":"jnăpăiră","first-person-indicative-pluperfect-singular":"jnăpăisem","indicative-pluperfect-second-person-singular":"jnăpăiseși","indicative-pluperfect-singular-third-person":"jnăpăise","first-person-indicative-pluperfect-plural":"jnăpăiserăm","indicative-pluperfect-plural-second-person":"jnăpăiserăți","indicative-pluperfect-plural-third-person":"jnăpăiseră","first-person-present-singular-subjunctive":"să jnăpăi","present-second-person-singular-subjunctive":"să jnăpăi","present-singular-subjunctive-third-person":"să jnăpăie","first-person-plural-present-subjunctive":"să jnăpăim","plural-present-second-person-subjunctive":"să jnăpăiți","plural-present-subjunctive-third-person":"să jnăpăie","imperative-second-person-singular":"jnăpăie","imperative-plural-second-person":"jnăpăiți","imperative-negative-second-person-singular":"nu jnăpăi","imperative-negative-plural-second-person":"nu jnăpăiți"}},{"word":"Jneapăn","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jneapăn"}},{"word":"jneapăn","pos":"noun","definitions":["juniper","juniper tree"],"pronunciation":"/ˈʒne̯a.pən/","forms":{"plural":"jnepeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jneapăn","accusative-definite-nominative-singular":"jneapănul","accusative-indefinite-nominative-plural":"jnepeni","accusative-definite-nominative-plural":"jnepenii","dative-genitive-indefinite-singular":"jneapăn","dative-definite-genitive-singular":"jneapănului","dative-genitive-indefinite-plural":"jnepeni","dative-definite-genitive-plural":"jnepenilor","singular-vocative":"jneapănule","plural-vocative":"jnepenilor","alternative":"jnepen"}},{"word":"jnepen","pos":"noun","definitions":["alternative form of jneapăn"],"forms":{"plural":"jnepeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jnepen","accusative-definite-nominative-singular":"jnepenul","accusative-indefinite-nominative-plural":"jnepeni","accusative-definite-nominative-plural":"jnepenii","dative-genitive-indefinite-singular":"jnepen","dative-definite-genitive-singular":"jnepenului","dative-genitive-indefinite-plural":"jnepeni","dative-definite-genitive-plural":"jnepenilor","singular-vocative":"jnepenule","plural-vocative":"jnepenilor"}},{"word":"jnepeni","pos":"noun","definitions":["plural of jneapăn"],"pronunciation":"/ˈʒne.penʲ/","gender":"m-p"},{"word":"jnepeniș","pos":"noun","definitions":["juniper grove"],"forms":{"plural":"jnepenișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jnepeniș","accusative-definite-nominative-singular":"jnepenișul","accusative-indefinite-nominative-plural":"jnepenișuri","accusative-definite-nominative-plural":"jnepenișurile","dative-genitive-indefinite-singular":"jnepeniș","dative-definite-genitive-singular":"jnepenișului","dative-genitive-indefinite-plural":"jnepenișuri","dative-definite-genitive-plural":"jnepenișurilor","singular-vocative":"jnepenișule","plural-vocative":"jnepenișurilor"}},{"word":"Jnepenișului","pos":"name","definitions":["a river in Sibiu, Romania, tributary to the Sfârcașu"],"gender":"m"},{"word":"joacă","pos":"noun","definitions":["play"],"pronunciation":"/ˈʒo̯a.kə/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-manual","accusative-indefinite-nominative-singular":"joacă","accusative-definite-nominative-singular":"joaca","accusative-indefinite-nominative-plural":"-","accusative-definite-nominative-plural":"-","dative-genitive-indefinite-singular":"joace","dative-definite-genitive-singular":"joacăi","dative-genitive-indefinite-plural":"-","dative-definite-genitive-plural":"-","singular-vocative":"-","plural-vocative":"-","alternative":"жоакэ"}},{"word":"joacă","pos":"verb","definitions":["inflection of juca (“to play”):","third-person singular/plural indicative present","second-person singular imperative"],"pronunciation":"/ˈʒo̯a.kə/","forms":{"alternative":"жоакэ"}},{"word":"joacă de copii","pos":"noun","definitions":["child's play"],"forms":{"alternative":"joacă de copil"}},{"word":"joacă de copil","pos":"noun","definitions":["alternative form of joacă de copii (“child’s play”)"]},{"word":"joagăr","pos":"noun","definitions":["a large saw"],"forms":{"plural":"joagăre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"joagăr","accusative-definite-nominative-singular":"joagărul","accusative-indefinite-nominative-plural":"joagăre","accusative-definite-nominative-plural":"joagărele","dative-genitive-indefinite-singular":"joagăr","dative-definite-genitive-singular":"joagărului","dative-genitive-indefinite-plural":"joagăre","dative-definite-genitive-plural":"joagărelor","singular-vocative":"joagărule","plural-vocative":"joagărelor"}},{"word":"Joagăru","pos":"name","definitions":["a river in Sibiu, Romania, tributary to the Valea Strâmbă"],"gender":"m"},{"word":"joardă","pos":"noun","definitions":["rod, stick"],"forms":{"plural":"joarde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"joardă","accusative-definite-nominative-singular":"joarda","accusative-indefinite-nominative-plural":"joarde","accusative-definite-nominative-plural":"joardele","dative-genitive-indefinite-singular":"joarde","dative-definite-genitive-singular":"joardei","dative-genitive-indefinite-plural":"joarde","dative-definite-genitive-plural":"joardelor","singular-vocative":"joardă","plural-vocative":"joardelor"}},{"word":"job","pos":"noun","definitions":["job"],"forms":{"plural":"joburi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"job","accusative-definite-nominative-singular":"jobul","accusative-indefinite-nominative-plural":"joburi","accusative-definite-nominative-plural":"joburile","dative-genitive-indefinite-singular":"job","dative-definite-genitive-singular":"jobului","dative-genitive-indefinite-plural":"joburi","dative-definite-genitive-plural":"joburilor","singular-vocative":"jobule","plural-vocative":"joburilor"}},{"word":"joben","pos":"noun","definitions":["top hat"],"forms":{"plural":"jobene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"joben","accusative-definite-nominative-singular":"jobenul","accusative-indefinite-nominative-plural":"jobene","accusative-definite-nominative-plural":"jobenele","dative-genitive-indefinite-singular":"joben","dative-definite-genitive-singular":"jobenului","dative-genitive-indefinite-plural":"jobene","dative-definite-genitive-plural":"jobenelor","singular-vocative":"jobenule","plural-vocative":"jobenelor"}},{"word":"jobenat","pos":"adj","definitions":["wearing a top hat"],"forms":{"feminine-singular":"jobenată","masculine-plural":"jobenați","feminine-neuter-plural":"jobenate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jobenat","error-unrecognized-form-feminine-indefinite-singular":"jobenată","error-unrecognized-form-indefinite-masculine-plural":"jobenați","error-unrecognized-form-feminine-indefinite-neuter-plural":"jobenate","definite-error-unrecognized-form-masculine-neuter-singular":"jobenatul","definite-error-unrecognized-form-feminine-singular":"jobenata","definite-error-unrecognized-form-masculine-plural":"jobenații","definite-error-unrecognized-form-feminine-neuter-plural":"jobenatele"}},{"word":"joc","pos":"noun","definitions":["game, play","dance"],"pronunciation":"/ʒok/","forms":{"plural":"jocuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"joc","accusative-definite-nominative-singular":"jocul","accusative-indefinite-nominative-plural":"jocuri","accusative-definite-nominative-plural":"jocurile","dative-genitive-indefinite-singular":"joc","dative-definite-genitive-singular":"jocului","dative-genitive-indefinite-plural":"jocuri","dative-definite-genitive-plural":"jocurilor","singular-vocative":"jocule","plural-vocative":"jocurilor"}},{"word":"joc","pos":"verb","definitions":["first-person singular present indicative/subjunctive of juca"],"pronunciation":"/ʒok/"},{"word":"joc de cărți","pos":"noun","definitions":["card game"],"forms":{"plural":"jocuri de cărți"}},{"word":"joc de cuvinte","pos":"noun","definitions":["pun"],"forms":{"plural":"jocuri de cuvinte"}},{"word":"joc de hazard","pos":"noun","definitions":["game of chance"],"forms":{"plural":"jocuri de hazard"}},{"word":"joc de noroc","pos":"noun","definitions":["game of chance"]},{"word":"joc de rol","pos":"noun","definitions":["roleplaying game","roleplay"],"forms":{"plural":"jocuri de rol"}},{"word":"joc de scenă","pos":"noun","definitions":["stage play"],"forms":{"plural":"jocuri de scenă"}},{"word":"joc de societate","pos":"noun","definitions":["board game"],"forms":{"plural":"jocuri de societate"}},{"word":"joc electronic","pos":"noun","definitions":["electronic game"],"forms":{"plural":"jocuri electronice"}},{"word":"joc video","pos":"noun","definitions":["video game (game controlled by a software)"],"forms":{"plural":"jocuri video"}},{"word":"jochei","pos":"noun","definitions":["alternative form of jocheu"],"forms":{"plural":"jochei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jochei","accusative-definite-nominative-singular":"jocheiul","accusative-indefinite-nominative-plural":"jochei","accusative-definite-nominative-plural":"jocheii","dative-genitive-indefinite-singular":"jochei","dative-definite-genitive-singular":"jocheiului","dative-genitive-indefinite-plural":"jochei","dative-definite-genitive-plural":"jocheilor","singular-vocative":"jocheiule","plural-vocative":"jocheilor"}},{"word":"jocheu","pos":"noun","definitions":["jockey"],"forms":{"plural":"jochei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jocheu","accusative-definite-nominative-singular":"jocheul","accusative-indefinite-nominative-plural":"jochei","accusative-definite-nominative-plural":"jocheii","dative-genitive-indefinite-singular":"jocheu","dative-definite-genitive-singular":"jocheului","dative-genitive-indefinite-plural":"jochei","dative-definite-genitive-plural":"jocheilor","singular-vocative":"jocheule","plural-vocative":"jocheilor"}},{"word":"joci","pos":"verb","definitions":["second-person singular present indicative/subjunctive of juca"],"pronunciation":"[ʒot͡ʃʲ]"},{"word":"jocot","pos":"noun","definitions":["jump"],"forms":{"plural":"jocote","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jocot","accusative-definite-nominative-singular":"jocotul","accusative-indefinite-nominative-plural":"jocote","accusative-definite-nominative-plural":"jocotele","dative-genitive-indefinite-singular":"jocot","dative-definite-genitive-singular":"jocotului","dative-genitive-indefinite-plural":"jocote","dative-definite-genitive-plural":"jocotelor","singular-vocative":"jocotule","plural-vocative":"jocotelor"}},{"word":"jocșor","pos":"noun","definitions":["alternative form of jocușor"],"forms":{"plural":"jocșoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jocșor","accusative-definite-nominative-singular":"jocșorul","accusative-indefinite-nominative-plural":"jocșoare","accusative-definite-nominative-plural":"jocșoarele","dative-genitive-indefinite-singular":"jocșor","dative-definite-genitive-singular":"jocșorului","dative-genitive-indefinite-plural":"jocșoare","dative-definite-genitive-plural":"jocșoarelor","singular-vocative":"jocșorule","plural-vocative":"jocșoarelor"}},{"word":"jocul","pos":"noun","definitions":["definite nominative/accusative singular of joc"]},{"word":"jocule","pos":"noun","definitions":["vocative singular of joc"]},{"word":"joculeț","pos":"noun","definitions":["diminutive of joc; small game"],"forms":{"plural":"joculețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"joculeț","accusative-definite-nominative-singular":"joculețul","accusative-indefinite-nominative-plural":"joculețe","accusative-definite-nominative-plural":"joculețele","dative-genitive-indefinite-singular":"joculeț","dative-definite-genitive-singular":"joculețului","dative-genitive-indefinite-plural":"joculețe","dative-definite-genitive-plural":"joculețelor","singular-vocative":"joculețule","plural-vocative":"joculețelor"}},{"word":"jocului","pos":"noun","definitions":["definite dative/genitive singular of joc"]},{"word":"jocuri","pos":"noun","definitions":["plural of joc"]},{"word":"jocuri olimpice","pos":"noun","definitions":["Olympic Games"]},{"word":"jocurile","pos":"noun","definitions":["definite nominative/accusative plural of joc"]},{"word":"jocurilor","pos":"noun","definitions":["inflection of joc:","definite genitive/dative plural","vocative plural"]},{"word":"jocușor","pos":"noun","definitions":["diminutive of joc; small game"],"forms":{"plural":"jocușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jocușor","accusative-definite-nominative-singular":"jocușorul","accusative-indefinite-nominative-plural":"jocușore","accusative-definite-nominative-plural":"jocușorele","dative-genitive-indefinite-singular":"jocușor","dative-definite-genitive-singular":"jocușorului","dative-genitive-indefinite-plural":"jocușore","dative-definite-genitive-plural":"jocușorelor","singular-vocative":"jocușorule","plural-vocative":"jocușorelor"}},{"word":"jocuț","pos":"noun","definitions":["diminutive of joc; small game"],"forms":{"plural":"jocuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jocuț","accusative-definite-nominative-singular":"jocuțul","accusative-indefinite-nominative-plural":"jocuțe","accusative-definite-nominative-plural":"jocuțele","dative-genitive-indefinite-singular":"jocuț","dative-definite-genitive-singular":"jocuțului","dative-genitive-indefinite-plural":"jocuțe","dative-definite-genitive-plural":"jocuțelor","singular-vocative":"jocuțule","plural-vocative":"jocuțelor"}},{"word":"jofră","pos":"noun","definitions":["a type of cake"],"forms":{"plural":"jofre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jofră","accusative-definite-nominative-singular":"jofra","accusative-indefinite-nominative-plural":"jofre","accusative-definite-nominative-plural":"jofrele","dative-genitive-indefinite-singular":"jofre","dative-definite-genitive-singular":"jofrei","dative-genitive-indefinite-plural":"jofre","dative-definite-genitive-plural":"jofrelor","singular-vocative":"jofră","plural-vocative":"jofrelor"}},{"word":"jogging","pos":"noun","definitions":["jogging"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jogging","accusative-definite-nominative":"joggingul","dative-genitive-indefinite":"jogging","dative-definite-genitive":"joggingului","vocative":"joggingule"}},{"word":"joi","pos":"noun","definitions":["Thursday"],"pronunciation":"/ˈʒoj/","forms":{"plural":"joi"}},{"word":"Joia Mare","pos":"name","definitions":["a village in Almaș, Arad County, Romania"],"gender":"f"},{"word":"joiană","pos":"noun","definitions":["narrow-leaved water-dropwort (Oenanthe silaifolia)"],"forms":{"plural":"joiane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"joiană","accusative-definite-nominative":"joiana","dative-genitive-indefinite":"joiane","dative-definite-genitive":"joianei","vocative":"joiană"}},{"word":"joică","pos":"noun","definitions":["narrow-leaved water-dropwort (Oenanthe silaifolia)"],"forms":{"plural":"joici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"joică","accusative-definite-nominative-singular":"joica","accusative-indefinite-nominative-plural":"joici","accusative-definite-nominative-plural":"joicile","dative-genitive-indefinite-singular":"joici","dative-definite-genitive-singular":"joicii","dative-genitive-indefinite-plural":"joici","dative-definite-genitive-plural":"joicilor","singular-vocative":"joică","plural-vocative":"joicilor"}},{"word":"joichiță","pos":"noun","definitions":["diminutive of joică"],"forms":{"plural":"joichițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"joichiță","accusative-definite-nominative-singular":"joichița","accusative-indefinite-nominative-plural":"joichițe","accusative-definite-nominative-plural":"joichițele","dative-genitive-indefinite-singular":"joichițe","dative-definite-genitive-singular":"joichiței","dative-genitive-indefinite-plural":"joichițe","dative-definite-genitive-plural":"joichițelor","singular-vocative":"joichiță","plural-vocative":"joichițelor"}},{"word":"joienel","pos":"noun","definitions":["diminutive of joian"],"forms":{"plural":"joienei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"joienel","accusative-definite-nominative-singular":"joienelul","accusative-indefinite-nominative-plural":"joienei","accusative-definite-nominative-plural":"joieneii","dative-genitive-indefinite-singular":"joienel","dative-definite-genitive-singular":"joienelului","dative-genitive-indefinite-plural":"joienei","dative-definite-genitive-plural":"joieneilor","singular-vocative":"joienelule","plural-vocative":"joieneilor"}},{"word":"joienică","pos":"noun","definitions":["diminutive of joiană"],"forms":{"plural":"joienici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"joienică","accusative-definite-nominative-singular":"joienica","accusative-indefinite-nominative-plural":"joienici","accusative-definite-nominative-plural":"joienicile","dative-genitive-indefinite-singular":"joienici","dative-definite-genitive-singular":"joienicii","dative-genitive-indefinite-plural":"joienici","dative-definite-genitive-plural":"joienicilor","singular-vocative":"joienică","plural-vocative":"joienicilor"}},{"word":"joimir","pos":"noun","definitions":["Polish mercenary"],"forms":{"plural":"joimiri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"joimir","accusative-definite-nominative-singular":"joimirul","accusative-indefinite-nominative-plural":"joimiri","accusative-definite-nominative-plural":"joimirii","dative-genitive-indefinite-singular":"joimir","dative-definite-genitive-singular":"joimirului","dative-genitive-indefinite-plural":"joimiri","dative-definite-genitive-plural":"joimirilor","singular-vocative":"joimirule","plural-vocative":"joimirilor"}}];
@@ -0,0 +1 @@
+export default [{"word":"joint","pos":"noun","definitions":["joint (bar)","joint (marijuana cigarette)"],"pronunciation":"/d͡ʒojnt/","examples":[{"ro":"Hai să fumăm un joint.","en":"Let's smoke a joint."}],"forms":{"plural":"jointuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"joint","accusative-definite-nominative-singular":"jointul","accusative-indefinite-nominative-plural":"jointuri","accusative-definite-nominative-plural":"jointurile","dative-genitive-indefinite-singular":"joint","dative-definite-genitive-singular":"jointului","dative-genitive-indefinite-plural":"jointuri","dative-definite-genitive-plural":"jointurilor","singular-vocative":"jointule","plural-vocative":"jointurilor"}},{"word":"Joița","pos":"name","definitions":["a commune of Giurgiu County, Romania","a village in Joița, Giurgiu County, Romania"],"gender":"f"},{"word":"Joițaru","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Joițaru"}},{"word":"jojă","pos":"noun","definitions":["gauge"],"forms":{"plural":"joje","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jojă","accusative-definite-nominative-singular":"joja","accusative-indefinite-nominative-plural":"joje","accusative-definite-nominative-plural":"jojele","dative-genitive-indefinite-singular":"joje","dative-definite-genitive-singular":"jojei","dative-genitive-indefinite-plural":"joje","dative-definite-genitive-plural":"jojelor","singular-vocative":"jojă","plural-vocative":"jojelor"}},{"word":"joker","pos":"noun","definitions":["joker"],"pronunciation":"/ˈd͡ʒo.kər/","forms":{"plural":"jokeri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"joker","accusative-definite-nominative-singular":"jokerul","accusative-indefinite-nominative-plural":"jokeri","accusative-definite-nominative-plural":"jokerii","dative-genitive-indefinite-singular":"joker","dative-definite-genitive-singular":"jokerului","dative-genitive-indefinite-plural":"jokeri","dative-definite-genitive-plural":"jokerilor","singular-vocative":"jokerule","plural-vocative":"jokerilor"}},{"word":"jokeri","pos":"noun","definitions":["indefinite plural of joker"],"pronunciation":"[ˈd͡ʒokərʲ]","gender":"m"},{"word":"Joldescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Joldescu"}},{"word":"Joldești","pos":"name","definitions":["a village in Vorona, Botoșani County, Romania"],"gender":"m"},{"word":"Joldișești","pos":"name","definitions":["a village in Sohodol, Alba County, Romania"],"gender":"m"},{"word":"joldunar","pos":"noun","definitions":["mercenary"],"forms":{"plural":"joldunari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"joldunar","accusative-definite-nominative-singular":"joldunarul","accusative-indefinite-nominative-plural":"joldunari","accusative-definite-nominative-plural":"joldunarii","dative-genitive-indefinite-singular":"joldunar","dative-definite-genitive-singular":"joldunarului","dative-genitive-indefinite-plural":"joldunari","dative-definite-genitive-plural":"joldunarilor","singular-vocative":"joldunarule","plural-vocative":"joldunarilor"}},{"word":"Jolotca","pos":"name","definitions":["a river in Harghita, Romania, tributary to the Mureș","a village in Ditrău, Harghita County, Romania"],"gender":"f"},{"word":"Joltai","pos":"name","definitions":["a village in Joltai, Gagauzia, Moldova","a commune of Gagauzia, Moldova"],"gender":"m"},{"word":"joltar","pos":"noun","definitions":["psalm"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"joltar","accusative-definite-nominative":"joltarul","dative-genitive-indefinite":"joltar","dative-definite-genitive":"joltarului","vocative":"joltarule"}},{"word":"jolub","pos":"noun","definitions":["manger"],"forms":{"plural":"joluburi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jolub","accusative-definite-nominative-singular":"jolubul","accusative-indefinite-nominative-plural":"joluburi","accusative-definite-nominative-plural":"joluburile","dative-genitive-indefinite-singular":"jolub","dative-definite-genitive-singular":"jolubului","dative-genitive-indefinite-plural":"joluburi","dative-definite-genitive-plural":"joluburilor","singular-vocative":"jolubule","plural-vocative":"joluburilor"}},{"word":"joncă","pos":"noun","definitions":["junk (ship)"],"forms":{"plural":"jonci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"joncă","accusative-definite-nominative-singular":"jonca","accusative-indefinite-nominative-plural":"jonci","accusative-definite-nominative-plural":"joncile","dative-genitive-indefinite-singular":"jonci","dative-definite-genitive-singular":"joncii","dative-genitive-indefinite-plural":"jonci","dative-definite-genitive-plural":"joncilor","singular-vocative":"joncă","plural-vocative":"joncilor"}},{"word":"joncăneală","pos":"noun","definitions":["fight, argument"],"forms":{"plural":"joncăneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"joncăneală","accusative-definite-nominative-singular":"joncăneala","accusative-indefinite-nominative-plural":"joncănele","accusative-definite-nominative-plural":"joncănelele","dative-genitive-indefinite-singular":"joncănele","dative-definite-genitive-singular":"joncănelei","dative-genitive-indefinite-plural":"joncănele","dative-definite-genitive-plural":"joncănelelor","singular-vocative":"joncăneală","plural-vocative":"joncănelelor"}},{"word":"jonco","pos":"noun","definitions":["vocative singular of joncă"],"pronunciation":"[ˈʒoŋko]","gender":"f"},{"word":"joncțiune","pos":"noun","definitions":["junction"],"forms":{"plural":"joncțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"joncțiune","accusative-definite-nominative-singular":"joncțiunea","accusative-indefinite-nominative-plural":"joncțiuni","accusative-definite-nominative-plural":"joncțiunile","dative-genitive-indefinite-singular":"joncțiuni","dative-definite-genitive-singular":"joncțiunii","dative-genitive-indefinite-plural":"joncțiuni","dative-definite-genitive-plural":"joncțiunilor","singular-vocative":"joncțiune","plural-vocative":"joncțiunilor"}},{"word":"joncțiune p-n","pos":"noun","definitions":["p-n junction"],"forms":{"plural":"joncțiuni p-n"}},{"word":"jongla","pos":"verb","definitions":["to juggle"],"forms":{"canonical":"a jongla 1st conjugation","present-singular-third-person":"jonglează","participle-past":"jonglat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a jongla","gerund":"jonglând","first-person-indicative-present-singular":"jonglez","indicative-present-second-person-singular":"jonglezi","indicative-present-singular-third-person":"jonglează","first-person-indicative-plural-present":"jonglăm","indicative-plural-present-second-person":"jonglați","indicative-plural-present-third-person":"jonglează","first-person-imperfect-indicative-singular":"jonglam","imperfect-indicative-second-person-singular":"jonglai","imperfect-indicative-singular-third-person":"jongla","first-person-imperfect-indicative-plural":"jonglam","imperfect-indicative-plural-second-person":"jonglați","imperfect-indicative-plural-third-person":"jonglau","first-person-indicative-perfect-singular":"jonglai","indicative-perfect-second-person-singular":"jonglași","indicative-perfect-singular-third-person":"jonglă","first-person-indicative-perfect-plural":"jonglarăm","indicative-perfect-plural-second-person":"jonglarăți","indicative-perfect-plural-third-person":"jonglară","first-person-indicative-pluperfect-singular":"jonglasem","indicative-pluperfect-second-person-singular":"jonglaseși","indicative-pluperfect-singular-third-person":"jonglase","first-person-indicative-pluperfect-plural":"jonglaserăm","indicative-pluperfect-plural-second-person":"jonglaserăți","indicative-pluperfect-plural-third-person":"jonglaseră","first-person-present-singular-subjunctive":"să jonglez","present-second-person-singular-subjunctive":"să jonglezi","present-singular-subjunctive-third-person":"să jongleze","first-person-plural-present-subjunctive":"să jonglăm","plural-present-second-person-subjunctive":"să jonglați","plural-present-subjunctive-third-person":"să jongleze","imperative-second-person-singular":"jonglează","imperative-plural-second-person":"jonglați","imperative-negative-second-person-singular":"nu jongla","imperative-negative-plural-second-person":"nu jonglați"}},{"word":"jonglare","pos":"noun","definitions":["juggling"],"forms":{"plural":"jonglări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jonglare","accusative-definite-nominative-singular":"jonglarea","accusative-indefinite-nominative-plural":"jonglări","accusative-definite-nominative-plural":"jonglările","dative-genitive-indefinite-singular":"jonglări","dative-definite-genitive-singular":"jonglării","dative-genitive-indefinite-plural":"jonglări","dative-definite-genitive-plural":"jonglărilor","singular-vocative":"jonglare","plural-vocative":"jonglărilor"}},{"word":"jongler","pos":"noun","definitions":["juggler"],"forms":{"plural":"jongleri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jongler","accusative-definite-nominative-singular":"jonglerul","accusative-indefinite-nominative-plural":"jongleri","accusative-definite-nominative-plural":"jonglerii","dative-genitive-indefinite-singular":"jongler","dative-definite-genitive-singular":"jonglerului","dative-genitive-indefinite-plural":"jongleri","dative-definite-genitive-plural":"jonglerilor","singular-vocative":"jonglerule","plural-vocative":"jonglerilor"}},{"word":"jonglerie","pos":"noun","definitions":["juggling"],"forms":{"plural":"jonglerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jonglerie","accusative-definite-nominative-singular":"jongleria","accusative-indefinite-nominative-plural":"jonglerii","accusative-definite-nominative-plural":"jongleriile","dative-genitive-indefinite-singular":"jonglerii","dative-definite-genitive-singular":"jongleriei","dative-genitive-indefinite-plural":"jonglerii","dative-definite-genitive-plural":"jongleriilor","singular-vocative":"jonglerie","plural-vocative":"jongleriilor"}},{"word":"jongleur","pos":"noun","definitions":["obsolete form of jongler"],"forms":{"plural":"jongleuri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jongleur","accusative-definite-nominative-singular":"jongleurul","accusative-indefinite-nominative-plural":"jongleuri","accusative-definite-nominative-plural":"jongleurii","dative-genitive-indefinite-singular":"jongleur","dative-definite-genitive-singular":"jongleurului","dative-genitive-indefinite-plural":"jongleuri","dative-definite-genitive-plural":"jongleurilor","singular-vocative":"jongleurule","plural-vocative":"jongleurilor"}},{"word":"Jora de Jos","pos":"name","definitions":["a village in Jora de Mijloc, Orhei Raion, Moldova"],"gender":"f"},{"word":"Jora de Mijloc","pos":"name","definitions":["a village in Jora de Mijloc, Orhei Raion, Moldova","a commune of Orhei Raion, Moldova"],"gender":"f"},{"word":"Jora de Sus","pos":"name","definitions":["a village in Jora de Mijloc, Orhei Raion, Moldova"],"gender":"f"},{"word":"Jorăști","pos":"name","definitions":["a commune of Galați County, Romania","a village in Jorăști, Galați County, Romania","a village in Vânători, Vrancea County, Romania"],"gender":"m"},{"word":"jordea","pos":"noun","definitions":["diminutive of joardă"],"forms":{"plural":"jordele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"jordea","accusative-definite-nominative-singular":"jordeaua","accusative-indefinite-nominative-plural":"jordele","accusative-definite-nominative-plural":"jordelele","dative-genitive-indefinite-singular":"jordele","dative-definite-genitive-singular":"jordelei","dative-genitive-indefinite-plural":"jordele","dative-definite-genitive-plural":"jordelelor","singular-vocative":"jordea","plural-vocative":"jordelelor"}},{"word":"jordie","pos":"noun","definitions":["stick"],"forms":{"plural":"jordii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jordie","accusative-definite-nominative-singular":"jordia","accusative-indefinite-nominative-plural":"jordii","accusative-definite-nominative-plural":"jordiile","dative-genitive-indefinite-singular":"jordii","dative-definite-genitive-singular":"jordiei","dative-genitive-indefinite-plural":"jordii","dative-definite-genitive-plural":"jordiilor","singular-vocative":"jordie","plural-vocative":"jordiilor"}},{"word":"jordiță","pos":"noun","definitions":["diminutive of joardă"],"forms":{"plural":"jordițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jordiță","accusative-definite-nominative-singular":"jordița","accusative-indefinite-nominative-plural":"jordițe","accusative-definite-nominative-plural":"jordițele","dative-genitive-indefinite-singular":"jordițe","dative-definite-genitive-singular":"jordiței","dative-genitive-indefinite-plural":"jordițe","dative-definite-genitive-plural":"jordițelor","singular-vocative":"jordiță","plural-vocative":"jordițelor"}},{"word":"Jorea","pos":"name","definitions":["a river in Galați County, Romania, tributary to the Mălina"],"gender":"f"},{"word":"Joroveanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Joroveanu"}},{"word":"jos","pos":"adv","definitions":["down"],"pronunciation":"/ʒos/"},{"word":"jos","pos":"adj","definitions":["low","down"],"pronunciation":"/ʒos/","forms":{"feminine-singular":"joasă","masculine-plural":"joși","feminine-neuter-plural":"joase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jos","error-unrecognized-form-feminine-indefinite-singular":"joasă","error-unrecognized-form-indefinite-masculine-plural":"joși","error-unrecognized-form-feminine-indefinite-neuter-plural":"joase","definite-error-unrecognized-form-masculine-neuter-singular":"josul","definite-error-unrecognized-form-feminine-singular":"joasa","definite-error-unrecognized-form-masculine-plural":"joșii","definite-error-unrecognized-form-feminine-neuter-plural":"joasele"}},{"word":"Josani","pos":"name","definitions":["a village in Căbești, Bihor County, Romania","a village in Măgești, Bihor County, Romania","a village in Pestișu Mic, Hunedoara County, Romania"],"gender":"m"},{"word":"josean","pos":"noun","definitions":["inhabitant of the Țara de Jos region of Moldavia"],"forms":{"plural":"joseni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"josean","accusative-definite-nominative-singular":"joseanul","accusative-indefinite-nominative-plural":"joseni","accusative-definite-nominative-plural":"josenii","dative-genitive-indefinite-singular":"josean","dative-definite-genitive-singular":"joseanului","dative-genitive-indefinite-plural":"joseni","dative-definite-genitive-plural":"josenilor","singular-vocative":"joseanule","plural-vocative":"josenilor"}},{"word":"joseană","pos":"noun","definitions":["female equivalent of josean"],"forms":{"plural":"joseane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"joseană","accusative-definite-nominative-singular":"joseana","accusative-indefinite-nominative-plural":"joseane","accusative-definite-nominative-plural":"joseanele","dative-genitive-indefinite-singular":"joseane","dative-definite-genitive-singular":"joseanei","dative-genitive-indefinite-plural":"joseane","dative-definite-genitive-plural":"joseanelor","singular-vocative":"joseană","plural-vocative":"joseanelor"}},{"word":"joseancă","pos":"noun","definitions":["female equivalent of josean"],"forms":{"plural":"josence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"joseancă","accusative-definite-nominative-singular":"joseanca","accusative-indefinite-nominative-plural":"josence","accusative-definite-nominative-plural":"josencele","dative-genitive-indefinite-singular":"josence","dative-definite-genitive-singular":"josencei","dative-genitive-indefinite-plural":"josence","dative-definite-genitive-plural":"josencelor","singular-vocative":"joseancă","plural-vocative":"josencelor"}},{"word":"Joseni","pos":"name","definitions":["a village in Berca, Buzău County, Romania","a commune of Harghita County, Romania","a village in Joseni, Harghita County, Romania"],"gender":"m"},{"word":"josenii","pos":"noun","definitions":["definite nominative/accusative plural of josean"]},{"word":"Josenii Bârgăului","pos":"name","definitions":["a commune of Bistrița-Năsăud County, Romania","a village in Josenii Bârgăului, Bistrița-Năsăud County, Romania"],"gender":"m"},{"word":"josișor","pos":"adv","definitions":["diminutive of jos"]},{"word":"jositor","pos":"adj","definitions":["degrading"],"forms":{"feminine-singular":"jositoare","masculine-plural":"jositori","feminine-neuter-plural":"jositoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jositor","error-unrecognized-form-feminine-indefinite-singular":"jositoare","error-unrecognized-form-indefinite-masculine-plural":"jositori","error-unrecognized-form-feminine-indefinite-neuter-plural":"jositoare","definite-error-unrecognized-form-masculine-neuter-singular":"jositorul","definite-error-unrecognized-form-feminine-singular":"jositoarea","definite-error-unrecognized-form-masculine-plural":"jositorii","definite-error-unrecognized-form-feminine-neuter-plural":"jositoarele"}},{"word":"josnic","pos":"adj","definitions":["low, lowly, abject, ignoble, base","sordid, vile, mean, lousy, sleazy, depraved"],"forms":{"feminine-singular":"josnică","masculine-plural":"josnici","feminine-neuter-plural":"josnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"josnic","error-unrecognized-form-feminine-indefinite-singular":"josnică","error-unrecognized-form-indefinite-masculine-plural":"josnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"josnice","definite-error-unrecognized-form-masculine-neuter-singular":"josnicul","definite-error-unrecognized-form-feminine-singular":"josnica","definite-error-unrecognized-form-masculine-plural":"josnicii","definite-error-unrecognized-form-feminine-neuter-plural":"josnicele"}},{"word":"josnicie","pos":"noun","definitions":["vileness"],"forms":{"plural":"josnicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"josnicie","accusative-definite-nominative-singular":"josnicia","accusative-indefinite-nominative-plural":"josnicii","accusative-definite-nominative-plural":"josniciile","dative-genitive-indefinite-singular":"josnicii","dative-definite-genitive-singular":"josniciei","dative-genitive-indefinite-plural":"josnicii","dative-definite-genitive-plural":"josniciilor","singular-vocative":"josnicie","plural-vocative":"josniciilor"}},{"word":"josorare","pos":"noun","definitions":["humiliation"],"forms":{"plural":"josorări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"josorare","accusative-definite-nominative-singular":"josorarea","accusative-indefinite-nominative-plural":"josorări","accusative-definite-nominative-plural":"josorările","dative-genitive-indefinite-singular":"josorări","dative-definite-genitive-singular":"josorării","dative-genitive-indefinite-plural":"josorări","dative-definite-genitive-plural":"josorărilor","singular-vocative":"josorare","plural-vocative":"josorărilor"}},{"word":"joule","pos":"noun","definitions":["joule"],"pronunciation":"/ʒul/","forms":{"plural":"jouli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"joule","accusative-definite-nominative-singular":"joulul","accusative-indefinite-nominative-plural":"jouli","accusative-definite-nominative-plural":"joulii","dative-genitive-indefinite-singular":"joule","dative-definite-genitive-singular":"joulului","dative-genitive-indefinite-plural":"jouli","dative-definite-genitive-plural":"joulilor","singular-vocative":"joulule","plural-vocative":"joulilor"}},{"word":"jovial","pos":"adj","definitions":["jocose"],"forms":{"feminine-singular":"jovială","masculine-plural":"joviali","feminine-neuter-plural":"joviale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jovial","error-unrecognized-form-feminine-indefinite-singular":"jovială","error-unrecognized-form-indefinite-masculine-plural":"joviali","error-unrecognized-form-feminine-indefinite-neuter-plural":"joviale","definite-error-unrecognized-form-masculine-neuter-singular":"jovialul","definite-error-unrecognized-form-feminine-singular":"joviala","definite-error-unrecognized-form-masculine-plural":"jovialii","definite-error-unrecognized-form-feminine-neuter-plural":"jovialele"}},{"word":"jovialitate","pos":"noun","definitions":["cheerfulness"],"pronunciation":"/ʒo.vi.a.liˈta.te/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jovialitate","accusative-definite-nominative-singular":"jovialitatea","accusative-indefinite-nominative-plural":"jovialități","accusative-definite-nominative-plural":"jovialitățile","dative-genitive-indefinite-singular":"jovialități","dative-definite-genitive-singular":"jovialității","dative-genitive-indefinite-plural":"jovialități","dative-definite-genitive-plural":"jovialităților","singular-vocative":"jovialitate","plural-vocative":"jovialităților"}},{"word":"jubartă","pos":"noun","definitions":["humpback whale"],"forms":{"plural":"jubarte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jubartă","accusative-definite-nominative-singular":"jubarta","accusative-indefinite-nominative-plural":"jubarte","accusative-definite-nominative-plural":"jubartele","dative-genitive-indefinite-singular":"jubarte","dative-definite-genitive-singular":"jubartei","dative-genitive-indefinite-plural":"jubarte","dative-definite-genitive-plural":"jubartelor","singular-vocative":"jubartă","plural-vocative":"jubartelor"}},{"word":"jubila","pos":"verb","definitions":["to gloat"],"forms":{"canonical":"a jubila 1st conjugation","present-singular-third-person":"jubilează","participle-past":"jubilat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a jubila","gerund":"jubilând","first-person-indicative-present-singular":"jubilez","indicative-present-second-person-singular":"jubilezi","indicative-present-singular-third-person":"jubilează","first-person-indicative-plural-present":"jubilăm","indicative-plural-present-second-person":"jubilați","indicative-plural-present-third-person":"jubilează","first-person-imperfect-indicative-singular":"jubilam","imperfect-indicative-second-person-singular":"jubilai","imperfect-indicative-singular-third-person":"jubila","first-person-imperfect-indicative-plural":"jubilam","imperfect-indicative-plural-second-person":"jubilați","imperfect-indicative-plural-third-person":"jubilau","first-person-indicative-perfect-singular":"jubilai","indicative-perfect-second-person-singular":"jubilași","indicative-perfect-singular-third-person":"jubilă","first-person-indicative-perfect-plural":"jubilarăm","indicative-perfect-plural-second-person":"jubilarăți","indicative-perfect-plural-third-person":"jubilară","first-person-indicative-pluperfect-singular":"jubilasem","indicative-pluperfect-second-person-singular":"jubilaseși","indicative-pluperfect-singular-third-person":"jubilase","first-person-indicative-pluperfect-plural":"jubilaserăm","indicative-pluperfect-plural-second-person":"jubilaserăți","indicative-pluperfect-plural-third-person":"jubilaseră","first-person-present-singular-subjunctive":"să jubilez","present-second-person-singular-subjunctive":"să jubilezi","present-singular-subjunctive-third-person":"să jubileze","first-person-plural-present-subjunctive":"să jubilăm","plural-present-second-person-subjunctive":"să jubilați","plural-present-subjunctive-third-person":"să jubileze","imperative-second-person-singular":"jubilează","imperative-plural-second-person":"jubilați","imperative-negative-second-person-singular":"nu jubila","imperative-negative-plural-second-person":"nu jubilați"}},{"word":"jubilare","pos":"noun","definitions":["jubilation"],"forms":{"plural":"jubilări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jubilare","accusative-definite-nominative-singular":"jubilarea","accusative-indefinite-nominative-plural":"jubilări","accusative-definite-nominative-plural":"jubilările","dative-genitive-indefinite-singular":"jubilări","dative-definite-genitive-singular":"jubilării","dative-genitive-indefinite-plural":"jubilări","dative-definite-genitive-plural":"jubilărilor","singular-vocative":"jubilare","plural-vocative":"jubilărilor"}},{"word":"jubilație","pos":"noun","definitions":["synonym of jubilare (“jubilation”)"],"pronunciation":"/ʒu.biˈla.t͡si.e/","forms":{"plural":"jubilații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jubilație","accusative-definite-nominative-singular":"jubilația","accusative-indefinite-nominative-plural":"jubilații","accusative-definite-nominative-plural":"jubilațiile","dative-genitive-indefinite-singular":"jubilații","dative-definite-genitive-singular":"jubilației","dative-genitive-indefinite-plural":"jubilații","dative-definite-genitive-plural":"jubilațiilor","singular-vocative":"jubilație","plural-vocative":"jubilațiilor"}},{"word":"jubilativ","pos":"adj","definitions":["jubilating, triumphant"],"forms":{"feminine-singular":"jubilativă","masculine-plural":"jubilativi","feminine-neuter-plural":"jubilative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jubilativ","error-unrecognized-form-feminine-indefinite-singular":"jubilativă","error-unrecognized-form-indefinite-masculine-plural":"jubilativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"jubilative","definite-error-unrecognized-form-masculine-neuter-singular":"jubilativul","definite-error-unrecognized-form-feminine-singular":"jubilativa","definite-error-unrecognized-form-masculine-plural":"jubilativii","definite-error-unrecognized-form-feminine-neuter-plural":"jubilativele"}},{"word":"jubileu","pos":"noun","definitions":["jubilee"],"forms":{"plural":"jubilee","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jubileu","accusative-definite-nominative-singular":"jubileul","accusative-indefinite-nominative-plural":"jubilee","accusative-definite-nominative-plural":"jubileele","dative-genitive-indefinite-singular":"jubileu","dative-definite-genitive-singular":"jubileului","dative-genitive-indefinite-plural":"jubilee","dative-definite-genitive-plural":"jubileelor","singular-vocative":"jubileule","plural-vocative":"jubileelor"}},{"word":"jubiliar","pos":"adj","definitions":["jubilee"],"forms":{"feminine-singular":"jubiliară","masculine-plural":"jubiliari","feminine-neuter-plural":"jubiliare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jubiliar","error-unrecognized-form-feminine-indefinite-singular":"jubiliară","error-unrecognized-form-indefinite-masculine-plural":"jubiliari","error-unrecognized-form-feminine-indefinite-neuter-plural":"jubiliare","definite-error-unrecognized-form-masculine-neuter-singular":"jubiliarul","definite-error-unrecognized-form-feminine-singular":"jubiliara","definite-error-unrecognized-form-masculine-plural":"jubiliarii","definite-error-unrecognized-form-feminine-neuter-plural":"jubiliarele"}},{"word":"Juc-Herghelie","pos":"name","definitions":["a village in Jucu, Cluj County, Romania"],"gender":"m"},{"word":"juca","pos":"verb","definitions":["to play","to gamble","to dance"],"pronunciation":"/ʒuˈka/","examples":[{"ro":"Nu mai juca.","en":"Stop gambling."}],"forms":{"canonical":"a juca 1st conjugation","present-singular-third-person":"joacă","participle-past":"jucat","subjunctive-third-person":"joace","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a juca","gerund":"jucând","first-person-indicative-present-singular":"joc","indicative-present-second-person-singular":"joci","indicative-present-singular-third-person":"joacă","first-person-indicative-plural-present":"jucăm","indicative-plural-present-second-person":"jucați","indicative-plural-present-third-person":"joacă","first-person-imperfect-indicative-singular":"jucam","imperfect-indicative-second-person-singular":"jucai","imperfect-indicative-singular-third-person":"juca","first-person-imperfect-indicative-plural":"jucam","imperfect-indicative-plural-second-person":"jucați","imperfect-indicative-plural-third-person":"jucau","first-person-indicative-perfect-singular":"jucai","indicative-perfect-second-person-singular":"jucași","indicative-perfect-singular-third-person":"jucă","first-person-indicative-perfect-plural":"jucarăm","indicative-perfect-plural-second-person":"jucarăți","indicative-perfect-plural-third-person":"jucară","first-person-indicative-pluperfect-singular":"jucasem","indicative-pluperfect-second-person-singular":"jucaseși","indicative-pluperfect-singular-third-person":"jucase","first-person-indicative-pluperfect-plural":"jucaserăm","indicative-pluperfect-plural-second-person":"jucaserăți","indicative-pluperfect-plural-third-person":"jucaseră","first-person-present-singular-subjunctive":"să joc","present-second-person-singular-subjunctive":"să joci","present-singular-subjunctive-third-person":"să joace","first-person-plural-present-subjunctive":"să jucăm","plural-present-second-person-subjunctive":"să jucați","plural-present-subjunctive-third-person":"să joace","imperative-second-person-singular":"joacă","imperative-plural-second-person":"jucați","imperative-negative-second-person-singular":"nu juca","imperative-negative-plural-second-person":"nu jucați","alternative":"жука"}},{"word":"jucabil","pos":"adj","definitions":["playable"],"forms":{"feminine-singular":"jucabilă","masculine-plural":"jucabili","feminine-neuter-plural":"jucabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jucabil","error-unrecognized-form-feminine-indefinite-singular":"jucabilă","error-unrecognized-form-indefinite-masculine-plural":"jucabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"jucabile","definite-error-unrecognized-form-masculine-neuter-singular":"jucabilul","definite-error-unrecognized-form-feminine-singular":"jucabila","definite-error-unrecognized-form-masculine-plural":"jucabilii","definite-error-unrecognized-form-feminine-neuter-plural":"jucabilele"}},{"word":"Jucan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jucan"}},{"word":"jucare","pos":"noun","definitions":["a game","a joke"],"forms":{"plural":"jucări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jucare","accusative-definite-nominative-singular":"jucarea","accusative-indefinite-nominative-plural":"jucări","accusative-definite-nominative-plural":"jucările","dative-genitive-indefinite-singular":"jucări","dative-definite-genitive-singular":"jucării","dative-genitive-indefinite-plural":"jucări","dative-definite-genitive-plural":"jucărilor","singular-vocative":"jucare","plural-vocative":"jucărilor"}},{"word":"jucărea","pos":"noun","definitions":["diminutive of jucărie"],"forms":{"plural":"jucărele","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"jucărea","accusative-definite-nominative-singular":"jucăreaua","accusative-indefinite-nominative-plural":"jucărele","accusative-definite-nominative-plural":"jucărelele","dative-genitive-indefinite-singular":"jucărele","dative-definite-genitive-singular":"jucărelei","dative-genitive-indefinite-plural":"jucărele","dative-definite-genitive-plural":"jucărelelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"jucăreie","pos":"noun","definitions":["toy"],"forms":{"plural":"jucărei","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"jucăreie","accusative-definite-nominative-singular":"jucăreia","accusative-indefinite-nominative-plural":"jucărei","accusative-definite-nominative-plural":"jucăreile","dative-genitive-indefinite-singular":"jucărei","dative-definite-genitive-singular":"jucăreii","dative-genitive-indefinite-plural":"jucărei","dative-definite-genitive-plural":"jucăreilor","singular-vocative":"jucăreie","plural-vocative":"jucăreilor"}},{"word":"jucărică","pos":"noun","definitions":["diminutive of jucărie; small toy"],"forms":{"plural":"jucărele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jucărică","accusative-definite-nominative-singular":"jucărica","accusative-indefinite-nominative-plural":"jucărice","accusative-definite-nominative-plural":"jucăricele","dative-genitive-indefinite-singular":"jucărice","dative-definite-genitive-singular":"jucăricei","dative-genitive-indefinite-plural":"jucărice","dative-definite-genitive-plural":"jucăricelor","singular-vocative":"jucărică","plural-vocative":"jucăricelor"}},{"word":"jucărie","pos":"noun","definitions":["toy"],"pronunciation":"/ʒu.kəˈri.e/","forms":{"plural":"jucării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jucărie","accusative-definite-nominative-singular":"jucăria","accusative-indefinite-nominative-plural":"jucării","accusative-definite-nominative-plural":"jucăriile","dative-genitive-indefinite-singular":"jucării","dative-definite-genitive-singular":"jucăriei","dative-genitive-indefinite-plural":"jucării","dative-definite-genitive-plural":"jucăriilor","singular-vocative":"jucărie","plural-vocative":"jucăriilor"}},{"word":"jucărier","pos":"noun","definitions":["toymaker","toyseller"],"forms":{"plural":"jucărieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jucărier","accusative-definite-nominative-singular":"jucărierul","accusative-indefinite-nominative-plural":"jucărieri","accusative-definite-nominative-plural":"jucărierii","dative-genitive-indefinite-singular":"jucărier","dative-definite-genitive-singular":"jucărierului","dative-genitive-indefinite-plural":"jucărieri","dative-definite-genitive-plural":"jucărierilor","singular-vocative":"jucărierule","plural-vocative":"jucărierilor"}},{"word":"jucărioară","pos":"noun","definitions":["diminutive of jucărie; small toy"],"forms":{"plural":"jucărioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jucărioară","accusative-definite-nominative-singular":"jucărioara","accusative-indefinite-nominative-plural":"jucărioare","accusative-definite-nominative-plural":"jucărioarele","dative-genitive-indefinite-singular":"jucărioare","dative-definite-genitive-singular":"jucărioarei","dative-genitive-indefinite-plural":"jucărioare","dative-definite-genitive-plural":"jucărioarelor","singular-vocative":"jucărioară","plural-vocative":"jucărioarelor"}},{"word":"jucăriuță","pos":"noun","definitions":["diminutive of jucărie; a small toy"],"forms":{"plural":"jucăriuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jucăriuță","accusative-definite-nominative-singular":"jucăriuța","accusative-indefinite-nominative-plural":"jucăriuțe","accusative-definite-nominative-plural":"jucăriuțele","dative-genitive-indefinite-singular":"jucăriuțe","dative-definite-genitive-singular":"jucăriuței","dative-genitive-indefinite-plural":"jucăriuțe","dative-definite-genitive-plural":"jucăriuțelor","singular-vocative":"jucăriuță","plural-vocative":"jucăriuțelor"}},{"word":"jucaș","pos":"adj","definitions":["playful"],"forms":{"feminine-singular":"jucașă","masculine-plural":"jucași","feminine-neuter-plural":"jucașe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jucaș","error-unrecognized-form-feminine-indefinite-singular":"jucașă","error-unrecognized-form-indefinite-masculine-plural":"jucași","error-unrecognized-form-feminine-indefinite-neuter-plural":"jucașe","definite-error-unrecognized-form-masculine-neuter-singular":"jucașul","definite-error-unrecognized-form-feminine-singular":"jucașa","definite-error-unrecognized-form-masculine-plural":"jucașii","definite-error-unrecognized-form-feminine-neuter-plural":"jucașele"}},{"word":"jucat","pos":"noun","definitions":["playing"],"pronunciation":"/ʒuˈkat/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jucat","accusative-definite-nominative":"jucatul","dative-genitive-indefinite":"jucat","dative-definite-genitive":"jucatului","vocative":"jucatule"}},{"word":"jucat","pos":"verb","definitions":["past participle of juca"],"pronunciation":"/ʒuˈkat/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"jucat","error-unrecognized-form-feminine-indefinite-singular":"jucată","error-unrecognized-form-indefinite-masculine-plural":"jucați","error-unrecognized-form-feminine-indefinite-neuter-plural":"jucate","definite-error-unrecognized-form-masculine-neuter-singular":"jucatul","definite-error-unrecognized-form-feminine-singular":"jucata","definite-error-unrecognized-form-masculine-plural":"jucații","definite-error-unrecognized-form-feminine-neuter-plural":"jucatele"}},{"word":"jucătoare","pos":"noun","definitions":["female player","female dancer"],"forms":{"plural":"jucătoare","masculine":"equivalent jucător","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"jucătoare","accusative-definite-nominative-singular":"jucătoarea","accusative-indefinite-nominative-plural":"jucătoare","accusative-definite-nominative-plural":"jucătoarele","dative-genitive-indefinite-singular":"jucătoare","dative-definite-genitive-singular":"jucătoarei","dative-genitive-indefinite-plural":"jucătoare","dative-definite-genitive-plural":"jucătoarelor","singular-vocative":"jucătoare","plural-vocative":"jucătoarelor"}},{"word":"jucătoare de badminton","pos":"noun","definitions":["female badminton player"],"forms":{"plural":"jucătoare de badminton"}},{"word":"jucător","pos":"noun","definitions":["player (one who plays a game or sport)","dancer"],"pronunciation":"/ʒu.kəˈtor/","forms":{"plural":"jucători","feminine":"equivalent jucătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jucător","accusative-definite-nominative-singular":"jucătorul","accusative-indefinite-nominative-plural":"jucători","accusative-definite-nominative-plural":"jucătorii","dative-genitive-indefinite-singular":"jucător","dative-definite-genitive-singular":"jucătorului","dative-genitive-indefinite-plural":"jucători","dative-definite-genitive-plural":"jucătorilor","singular-vocative":"jucătorule","plural-vocative":"jucătorilor"}},{"word":"jucător de badminton","pos":"noun","definitions":["badminton player"],"forms":{"plural":"jucător de badminton"}},{"word":"jucător de golf","pos":"noun","definitions":["golfer"],"forms":{"plural":"jucători de golf"}},{"word":"jucător de șah","pos":"noun","definitions":["chess player"],"forms":{"plural":"jucători de șah"}},{"word":"jucătorie","pos":"noun","definitions":["gambling house"],"forms":{"plural":"jucătorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"jucătorie","accusative-definite-nominative-singular":"jucătoria","accusative-indefinite-nominative-plural":"jucătorii","accusative-definite-nominative-plural":"jucătoriile","dative-genitive-indefinite-singular":"jucătorii","dative-definite-genitive-singular":"jucătoriei","dative-genitive-indefinite-plural":"jucătorii","dative-definite-genitive-plural":"jucătoriilor","singular-vocative":"jucătorie","plural-vocative":"jucătoriilor"}},{"word":"Jucătoru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jucătoru"}},{"word":"jucăuș","pos":"adj","definitions":["playful"],"forms":{"feminine-singular":"jucăușă","masculine-plural":"jucăuși","feminine-neuter-plural":"jucăușe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jucăuș","error-unrecognized-form-feminine-indefinite-singular":"jucăușă","error-unrecognized-form-indefinite-masculine-plural":"jucăuși","error-unrecognized-form-feminine-indefinite-neuter-plural":"jucăușe","definite-error-unrecognized-form-masculine-neuter-singular":"jucăușul","definite-error-unrecognized-form-feminine-singular":"jucăușa","definite-error-unrecognized-form-masculine-plural":"jucăușii","definite-error-unrecognized-form-feminine-neuter-plural":"jucăușele"}},{"word":"Jucu","pos":"name","definitions":["a commune of Cluj County, Romania"],"gender":"m"},{"word":"Jucu de Mijloc","pos":"name","definitions":["a village in Jucu, Cluj County, Romania"],"gender":"m"},{"word":"Jucu de Sus","pos":"name","definitions":["a village in Jucu, Cluj County, Romania"],"gender":"m"},{"word":"jucuială","pos":"noun","definitions":["execution"],"forms":{"plural":"jucuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jucuială","accusative-definite-nominative-singular":"jucuiala","accusative-indefinite-nominative-plural":"jucuiele","accusative-definite-nominative-plural":"jucuielele","dative-genitive-indefinite-singular":"jucuiele","dative-definite-genitive-singular":"jucuielei","dative-genitive-indefinite-plural":"jucuiele","dative-definite-genitive-plural":"jucuielelor","singular-vocative":"jucuială","plural-vocative":"jucuielelor"}},{"word":"jucuțău","pos":"noun","definitions":["bailiff"],"forms":{"plural":"jucuțăi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jucuțău","accusative-definite-nominative-singular":"jucuțăuul","accusative-indefinite-nominative-plural":"jucuțăi","accusative-definite-nominative-plural":"jucuțăii","dative-genitive-indefinite-singular":"jucuțău","dative-definite-genitive-singular":"jucuțăuului","dative-genitive-indefinite-plural":"jucuțăi","dative-definite-genitive-plural":"jucuțăilor","singular-vocative":"jucuțăuule","plural-vocative":"jucuțăilor"}},{"word":"jucuțel","pos":"noun","definitions":["diminutive of jucuț"],"forms":{"plural":"jucuței","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jucuțel","accusative-definite-nominative-singular":"jucuțelul","accusative-indefinite-nominative-plural":"jucuței","accusative-definite-nominative-plural":"jucuțeii","dative-genitive-indefinite-singular":"jucuțel","dative-definite-genitive-singular":"jucuțelului","dative-genitive-indefinite-plural":"jucuței","dative-definite-genitive-plural":"jucuțeilor","singular-vocative":"jucuțelule","plural-vocative":"jucuțeilor"}},{"word":"jud.","pos":"noun","definitions":["abbreviation of județ (“county”)"]},{"word":"judaism","pos":"noun","definitions":["obsolete form of iudaism"],"forms":{"plural":"judaisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"judaism","accusative-definite-nominative-singular":"judaismul","accusative-indefinite-nominative-plural":"judaisme","accusative-definite-nominative-plural":"judaismele","dative-genitive-indefinite-singular":"judaism","dative-definite-genitive-singular":"judaismului","dative-genitive-indefinite-plural":"judaisme","dative-definite-genitive-plural":"judaismelor","singular-vocative":"judaismule","plural-vocative":"judaismelor"}},{"word":"judan","pos":"noun","definitions":["obsolete form of jidan"],"forms":{"plural":"judani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"judan","accusative-definite-nominative-singular":"judanul","accusative-indefinite-nominative-plural":"judani","accusative-definite-nominative-plural":"judanii","dative-genitive-indefinite-singular":"judan","dative-definite-genitive-singular":"judanului","dative-genitive-indefinite-plural":"judani","dative-definite-genitive-plural":"judanilor","singular-vocative":"judanule","plural-vocative":"judanilor"}},{"word":"Jude","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jude"}},{"word":"jude","pos":"noun","definitions":["In the old Romanian principalities, an office with administrative and judicial responsibilities that served as a type of mayor and judge. See also județ.","Minor ruler, prince.","judge"],"pronunciation":"/ˈʒu.de/","forms":{"plural":"juzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m-e","accusative-indefinite-nominative-singular":"jude","accusative-definite-nominative-singular":"judele","accusative-indefinite-nominative-plural":"juzi","accusative-definite-nominative-plural":"juzii","dative-genitive-indefinite-singular":"jude","dative-definite-genitive-singular":"judelui","dative-genitive-indefinite-plural":"juzi","dative-definite-genitive-plural":"juzilor","singular-vocative":"jude","plural-vocative":"juzilor","alternative":"judec"}},{"word":"judec","pos":"verb","definitions":["first-person singular present indicative/subjunctive of judeca"]},{"word":"judec","pos":"noun","definitions":["obsolete form of jude"],"forms":{"plural":"judeci"}},{"word":"judeca","pos":"verb","definitions":["to judge"],"pronunciation":"/ʒu.deˈka/","forms":{"canonical":"a judeca 1st conjugation","present-singular-third-person":"judecă","participle-past":"judecat","subjunctive-third-person":"judece","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a judeca","gerund":"judecând","first-person-indicative-present-singular":"judec","indicative-present-second-person-singular":"judeci","indicative-present-singular-third-person":"judecă","first-person-indicative-plural-present":"judecăm","indicative-plural-present-second-person":"judecați","indicative-plural-present-third-person":"judecă","first-person-imperfect-indicative-singular":"judecam","imperfect-indicative-second-person-singular":"judecai","imperfect-indicative-singular-third-person":"judeca","first-person-imperfect-indicative-plural":"judecam","imperfect-indicative-plural-second-person":"judecați","imperfect-indicative-plural-third-person":"judecau","first-person-indicative-perfect-singular":"judecai","indicative-perfect-second-person-singular":"judecași","indicative-perfect-singular-third-person":"judecă","first-person-indicative-perfect-plural":"judecarăm","indicative-perfect-plural-second-person":"judecarăți","indicative-perfect-plural-third-person":"judecară","first-person-indicative-pluperfect-singular":"judecasem","indicative-pluperfect-second-person-singular":"judecaseși","indicative-pluperfect-singular-third-person":"judecase","first-person-indicative-pluperfect-plural":"judecaserăm","indicative-pluperfect-plural-second-person":"judecaserăți","indicative-pluperfect-plural-third-person":"judecaseră","first-person-present-singular-subjunctive":"să judec","present-second-person-singular-subjunctive":"să judeci","present-singular-subjunctive-third-person":"să judece","first-person-plural-present-subjunctive":"să judecăm","plural-present-second-person-subjunctive":"să judecați","plural-present-subjunctive-third-person":"să judece","imperative-second-person-singular":"judecă","imperative-plural-second-person":"judecați","imperative-negative-second-person-singular":"nu judeca","imperative-negative-plural-second-person":"nu judecați"}},{"word":"judecare","pos":"noun","definitions":["the act of judging, judgement, estimation, appreciation","criticism, censure, condemnation"],"forms":{"plural":"judecări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"judecare","accusative-definite-nominative-singular":"judecarea","accusative-indefinite-nominative-plural":"judecări","accusative-definite-nominative-plural":"judecările","dative-genitive-indefinite-singular":"judecări","dative-definite-genitive-singular":"judecării","dative-genitive-indefinite-plural":"judecări","dative-definite-genitive-plural":"judecărilor","singular-vocative":"judecare","plural-vocative":"judecărilor"}},{"word":"judecat","pos":"verb","definitions":["past participle of judeca"],"pronunciation":"/ʒu.deˈkat/","forms":{"participle-past":"of judeca"}},{"word":"judecat","pos":"adj","definitions":["judged"],"pronunciation":"/ʒu.deˈkat/","forms":{"feminine-singular":"judecată","masculine-plural":"judecați","feminine-neuter-plural":"judecate","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"judecat","error-unrecognized-form-feminine-indefinite-singular":"judecată","error-unrecognized-form-indefinite-masculine-plural":"judecați","error-unrecognized-form-feminine-indefinite-neuter-plural":"judecate","definite-error-unrecognized-form-masculine-neuter-singular":"judecatul","definite-error-unrecognized-form-feminine-singular":"judecata","definite-error-unrecognized-form-masculine-plural":"judecații","definite-error-unrecognized-form-feminine-neuter-plural":"judecatele"}},{"word":"judecată","pos":"adj","definitions":["feminine singular of judecat"],"pronunciation":"/ʒudeˈkatə/"},{"word":"judecată","pos":"noun","definitions":["judgement, reason, wisdom","act of judging","trial","intelligence, discernment"],"pronunciation":"/ʒudeˈkatə/","forms":{"plural":"judecăți"}},{"word":"judecătoare","pos":"noun","definitions":["female equivalent of judecător"],"forms":{"plural":"judecătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"judecătoare","accusative-definite-nominative-singular":"judecătoarea","accusative-indefinite-nominative-plural":"judecătoare","accusative-definite-nominative-plural":"judecătoarele","dative-genitive-indefinite-singular":"judecătoare","dative-definite-genitive-singular":"judecătoarei","dative-genitive-indefinite-plural":"judecătoare","dative-definite-genitive-plural":"judecătoarelor","singular-vocative":"judecătoare","plural-vocative":"judecătoarelor"}},{"word":"judecător","pos":"noun","definitions":["judge","justice","magistrate","arbitrator"],"forms":{"plural":"judecători","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"judecător","accusative-definite-nominative-singular":"judecătorul","accusative-indefinite-nominative-plural":"judecători","accusative-definite-nominative-plural":"judecătorii","dative-genitive-indefinite-singular":"judecător","dative-definite-genitive-singular":"judecătorului","dative-genitive-indefinite-plural":"judecători","dative-definite-genitive-plural":"judecătorilor","singular-vocative":"judecătorule","plural-vocative":"judecătorilor"}},{"word":"judecătoraș","pos":"noun","definitions":["diminutive of judecător; small judge"],"forms":{"plural":"judecătorași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"judecătoraș","accusative-definite-nominative-singular":"judecătorașul","accusative-indefinite-nominative-plural":"judecătorași","accusative-definite-nominative-plural":"judecătorașii","dative-genitive-indefinite-singular":"judecătoraș","dative-definite-genitive-singular":"judecătorașului","dative-genitive-indefinite-plural":"judecătorași","dative-definite-genitive-plural":"judecătorașilor","singular-vocative":"judecătorașule","plural-vocative":"judecătorașilor"}},{"word":"judecătoreasă","pos":"noun","definitions":["female equivalent of judecător"],"forms":{"plural":"judecătorese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"judecătoreasă","accusative-definite-nominative-singular":"judecătoreasa","accusative-indefinite-nominative-plural":"judecătorese","accusative-definite-nominative-plural":"judecătoresele","dative-genitive-indefinite-singular":"judecătorese","dative-definite-genitive-singular":"judecătoresei","dative-genitive-indefinite-plural":"judecătorese","dative-definite-genitive-plural":"judecătoreselor","singular-vocative":"judecătoreasă","plural-vocative":"judecătoreselor"}},{"word":"judecătoresc","pos":"adj","definitions":["judiciary"],"forms":{"feminine-singular":"judecătorească","plural":"judecătorești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"judecătoresc","error-unrecognized-form-feminine-indefinite-singular":"judecătorească","error-unrecognized-form-indefinite-masculine-plural":"judecătorești","error-unrecognized-form-feminine-indefinite-neuter-plural":"judecătorești","definite-error-unrecognized-form-masculine-neuter-singular":"judecătorescul","definite-error-unrecognized-form-feminine-singular":"judecătoreasca","definite-error-unrecognized-form-masculine-plural":"judecătoreștii","definite-error-unrecognized-form-feminine-neuter-plural":"judecătoreștile"}},{"word":"judecătorește","pos":"adv","definitions":["judicially"]},{"word":"judecători","pos":"noun","definitions":["plural of judecător"]},{"word":"judecătorie","pos":"noun","definitions":["court of law"],"forms":{"plural":"judecătorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"judecătorie","accusative-definite-nominative-singular":"judecătoria","accusative-indefinite-nominative-plural":"judecătorii","accusative-definite-nominative-plural":"judecătoriile","dative-genitive-indefinite-singular":"judecătorii","dative-definite-genitive-singular":"judecătoriei","dative-genitive-indefinite-plural":"judecătorii","dative-definite-genitive-plural":"judecătoriilor","singular-vocative":"judecătorie","plural-vocative":"judecătoriilor"}},{"word":"judecătoriță","pos":"noun","definitions":["female equivalent of judecător"],"forms":{"plural":"judecătorițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"judecătoriță","accusative-definite-nominative-singular":"judecătorița","accusative-indefinite-nominative-plural":"judecătorițe","accusative-definite-nominative-plural":"judecătorițele","dative-genitive-indefinite-singular":"judecătorițe","dative-definite-genitive-singular":"judecătoriței","dative-genitive-indefinite-plural":"judecătorițe","dative-definite-genitive-plural":"judecătorițelor","singular-vocative":"judecătoriță","plural-vocative":"judecătorițelor"}},{"word":"judecătoriu","pos":"noun","definitions":["obsolete form of judecător"],"forms":{"plural":"judecători","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"judecătoriu","accusative-definite-nominative-singular":"judecătoriuul","accusative-indefinite-nominative-plural":"judecători","accusative-definite-nominative-plural":"judecătorii","dative-genitive-indefinite-singular":"judecătoriu","dative-definite-genitive-singular":"judecătoriuului","dative-genitive-indefinite-plural":"judecători","dative-definite-genitive-plural":"judecătorilor","singular-vocative":"judecătoriuule","plural-vocative":"judecătorilor"}},{"word":"judeceasă","pos":"noun","definitions":["the mayor's wife"],"forms":{"plural":"judecese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"judeceasă","accusative-definite-nominative-singular":"judeceasa","accusative-indefinite-nominative-plural":"judecese","accusative-definite-nominative-plural":"judecesele","dative-genitive-indefinite-singular":"judecese","dative-definite-genitive-singular":"judecesei","dative-genitive-indefinite-plural":"judecese","dative-definite-genitive-plural":"judeceselor","singular-vocative":"judeceasă","plural-vocative":"judeceselor"}},{"word":"judeci","pos":"verb","definitions":["to emancipate from serfdom, to become a free peasant"],"forms":{"canonical":"a judeci 4th conjugation","present-singular-third-person":"judecește","participle-past":"judecit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a judeci","gerund":"judecind","first-person-indicative-present-singular":"judecesc","indicative-present-second-person-singular":"judecești","indicative-present-singular-third-person":"judecește","first-person-indicative-plural-present":"judecim","indicative-plural-present-second-person":"judeciți","indicative-plural-present-third-person":"judecesc","first-person-imperfect-indicative-singular":"judeceam","imperfect-indicative-second-person-singular":"judeceai","imperfect-indicative-singular-third-person":"judecea","first-person-imperfect-indicative-plural":"judeceam","imperfect-indicative-plural-second-person":"judeceați","imperfect-indicative-plural-third-person":"judeceau","first-person-indicative-perfect-singular":"judecii","indicative-perfect-second-person-singular":"judeciși","indicative-perfect-singular-third-person":"judeci","first-person-indicative-perfect-plural":"judecirăm","indicative-perfect-plural-second-person":"judecirăți","indicative-perfect-plural-third-person":"judeciră","first-person-indicative-pluperfect-singular":"judecisem","indicative-pluperfect-second-person-singular":"judeciseși","indicative-pluperfect-singular-third-person":"judecise","first-person-indicative-pluperfect-plural":"judeciserăm","indicative-pluperfect-plural-second-person":"judeciserăți","indicative-pluperfect-plural-third-person":"judeciseră","first-person-present-singular-subjunctive":"să judecesc","present-second-person-singular-subjunctive":"să judecești","present-singular-subjunctive-third-person":"să judecească","first-person-plural-present-subjunctive":"să judecim","plural-present-second-person-subjunctive":"să judeciți","plural-present-subjunctive-third-person":"să judecească","imperative-second-person-singular":"judecește","imperative-plural-second-person":"judeciți","imperative-negative-second-person-singular":"nu judeci","imperative-negative-plural-second-person":"nu judeciți"}},{"word":"judecie","pos":"noun","definitions":["reign, rule"],"forms":{"plural":"judecii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"judecie","accusative-definite-nominative-singular":"judecia","accusative-indefinite-nominative-plural":"judecii","accusative-definite-nominative-plural":"judeciile","dative-genitive-indefinite-singular":"judecii","dative-definite-genitive-singular":"judeciei","dative-genitive-indefinite-plural":"judecii","dative-definite-genitive-plural":"judeciilor","singular-vocative":"judecie","plural-vocative":"judeciilor"}},{"word":"judecire","pos":"noun","definitions":["judgment"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"judecire","accusative-definite-nominative":"judecirea","dative-genitive-indefinite":"judecire","dative-definite-genitive":"judecirei","vocative":"judecire"}},{"word":"Judele","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Lăpușnicul Mare","a surname originating as an occupation"],"gender":"m"},{"word":"judele","pos":"noun","definitions":["definite nominative/accusative singular of jude"]},{"word":"Judescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Judescu"}},{"word":"Județ","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Județ"}},{"word":"județ","pos":"noun","definitions":["county (administrative division in Romania)","jurisdiction"],"pronunciation":"/ʒuˈdet͡s/","forms":{"plural":"județe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"județ","accusative-definite-nominative-singular":"județul","accusative-indefinite-nominative-plural":"județe","accusative-definite-nominative-plural":"județele","dative-genitive-indefinite-singular":"județ","dative-definite-genitive-singular":"județului","dative-genitive-indefinite-plural":"județe","dative-definite-genitive-plural":"județelor","singular-vocative":"județule","plural-vocative":"județelor"}},{"word":"județe","pos":"noun","definitions":["plural of județ"],"pronunciation":"/ʒuˈde.t͡se/"},{"word":"județean","pos":"adj","definitions":["county"],"forms":{"feminine-singular":"județeană","masculine-plural":"județeni","feminine-neuter-plural":"județene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"județean","error-unrecognized-form-feminine-indefinite-singular":"județeană","error-unrecognized-form-indefinite-masculine-plural":"județeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"județene","definite-error-unrecognized-form-masculine-neuter-singular":"județeanul","definite-error-unrecognized-form-feminine-singular":"județeana","definite-error-unrecognized-form-masculine-plural":"județenii","definite-error-unrecognized-form-feminine-neuter-plural":"județenele"}},{"word":"județeasă","pos":"noun","definitions":["mayor's wife"],"forms":{"plural":"județese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"județeasă","accusative-definite-nominative-singular":"județeasa","accusative-indefinite-nominative-plural":"județese","accusative-definite-nominative-plural":"județesele","dative-genitive-indefinite-singular":"județese","dative-definite-genitive-singular":"județesei","dative-genitive-indefinite-plural":"județese","dative-definite-genitive-plural":"județeselor","singular-vocative":"județeasă","plural-vocative":"județeselor"}},{"word":"județul","pos":"noun","definitions":["nominative/accusative definite singular of județ"],"gender":"n"},{"word":"judiciar","pos":"adj","definitions":["judicial"],"forms":{"feminine-singular":"judiciară","masculine-plural":"judiciari","feminine-neuter-plural":"judiciare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"judiciar","error-unrecognized-form-feminine-indefinite-singular":"judiciară","error-unrecognized-form-indefinite-masculine-plural":"judiciari","error-unrecognized-form-feminine-indefinite-neuter-plural":"judiciare","definite-error-unrecognized-form-masculine-neuter-singular":"judiciarul","definite-error-unrecognized-form-feminine-singular":"judiciara","definite-error-unrecognized-form-masculine-plural":"judiciarii","definite-error-unrecognized-form-feminine-neuter-plural":"judiciarele"}},{"word":"judicios","pos":"adj","definitions":["judicious, wise"],"forms":{"feminine-singular":"judicioasă","masculine-plural":"judicioși","feminine-neuter-plural":"judicioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"judicios","error-unrecognized-form-feminine-indefinite-singular":"judicioasă","error-unrecognized-form-indefinite-masculine-plural":"judicioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"judicioase","definite-error-unrecognized-form-masculine-neuter-singular":"judiciosul","definite-error-unrecognized-form-feminine-singular":"judicioasa","definite-error-unrecognized-form-masculine-plural":"judicioșii","definite-error-unrecognized-form-feminine-neuter-plural":"judicioasele"}},{"word":"judiciozitate","pos":"noun","definitions":["judiciousness"],"forms":{"plural":"judiciozități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"judiciozitate","accusative-definite-nominative-singular":"judiciozitatea","accusative-indefinite-nominative-plural":"judiciozități","accusative-definite-nominative-plural":"judiciozitățile","dative-genitive-indefinite-singular":"judiciozități","dative-definite-genitive-singular":"judiciozității","dative-genitive-indefinite-plural":"judiciozități","dative-definite-genitive-plural":"judiciozităților","singular-vocative":"judiciozitate","plural-vocative":"judiciozităților"}},{"word":"judo","pos":"noun","definitions":["judo"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"judo","accusative-definite-nominative":"judoul","dative-genitive-indefinite":"judo","dative-definite-genitive":"judoului","vocative":"judoule"}},{"word":"judoka","pos":"noun","definitions":["alternative form of judocan"],"forms":{"plural":"judoka","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"judoka","accusative-definite-nominative-singular":"judokaul","accusative-indefinite-nominative-plural":"judoka","accusative-definite-nominative-plural":"judokai","dative-genitive-indefinite-singular":"judoka","dative-definite-genitive-singular":"judokaului","dative-genitive-indefinite-plural":"judoka","dative-definite-genitive-plural":"judokalor","singular-vocative":"judokaule","plural-vocative":"judokalor"}},{"word":"jufă","pos":"noun","definitions":["obsolete form of julfă"],"forms":{"plural":"jufe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jufă","accusative-definite-nominative-singular":"jufa","accusative-indefinite-nominative-plural":"jufe","accusative-definite-nominative-plural":"jufele","dative-genitive-indefinite-singular":"jufe","dative-definite-genitive-singular":"jufei","dative-genitive-indefinite-plural":"jufe","dative-definite-genitive-plural":"jufelor","singular-vocative":"jufă","plural-vocative":"jufelor"}},{"word":"jug","pos":"noun","definitions":["yoke"],"forms":{"plural":"juguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jug","accusative-definite-nominative-singular":"jugul","accusative-indefinite-nominative-plural":"juguri","accusative-definite-nominative-plural":"jugurile","dative-genitive-indefinite-singular":"jug","dative-definite-genitive-singular":"jugului","dative-genitive-indefinite-plural":"juguri","dative-definite-genitive-plural":"jugurilor","singular-vocative":"jugule","plural-vocative":"jugurilor"}},{"word":"jugălit","pos":"adj","definitions":["worked on the field (about cows)"],"forms":{"feminine-singular":"jugălită","masculine-plural":"jugăliți","feminine-neuter-plural":"jugălite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jugălit","error-unrecognized-form-feminine-indefinite-singular":"jugălită","error-unrecognized-form-indefinite-masculine-plural":"jugăliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jugălite","definite-error-unrecognized-form-masculine-neuter-singular":"jugălitul","definite-error-unrecognized-form-feminine-singular":"jugălita","definite-error-unrecognized-form-masculine-plural":"jugăliții","definite-error-unrecognized-form-feminine-neuter-plural":"jugălitele"}},{"word":"jugan","pos":"noun","definitions":["gelding"],"forms":{"plural":"jugani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugan","accusative-definite-nominative-singular":"juganul","accusative-indefinite-nominative-plural":"jugani","accusative-definite-nominative-plural":"juganii","dative-genitive-indefinite-singular":"jugan","dative-definite-genitive-singular":"juganului","dative-genitive-indefinite-plural":"jugani","dative-definite-genitive-plural":"juganilor","singular-vocative":"juganule","plural-vocative":"juganilor"}},{"word":"jugănar","pos":"noun","definitions":["castrator"],"forms":{"plural":"jugănari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugănar","accusative-definite-nominative-singular":"jugănarul","accusative-indefinite-nominative-plural":"jugănari","accusative-definite-nominative-plural":"jugănarii","dative-genitive-indefinite-singular":"jugănar","dative-definite-genitive-singular":"jugănarului","dative-genitive-indefinite-plural":"jugănari","dative-definite-genitive-plural":"jugănarilor","singular-vocative":"jugănarule","plural-vocative":"jugănarilor"}},{"word":"Jugănariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Jugănariu"}},{"word":"Jugănaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Jugănaru"}},{"word":"jugănaș","pos":"noun","definitions":["diminutive of jugan; small gelding"],"pronunciation":"/ʒu.ɡə.ˈnaʃ/","forms":{"plural":"jugănași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugănaș","accusative-definite-nominative-singular":"jugănașul","accusative-indefinite-nominative-plural":"jugănași","accusative-definite-nominative-plural":"jugănașii","dative-genitive-indefinite-singular":"jugănaș","dative-definite-genitive-singular":"jugănașului","dative-genitive-indefinite-plural":"jugănași","dative-definite-genitive-plural":"jugănașilor","singular-vocative":"jugănașule","plural-vocative":"jugănașilor"}},{"word":"jugăneală","pos":"noun","definitions":["castration"],"forms":{"plural":"jugăneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jugăneală","accusative-definite-nominative-singular":"jugăneala","accusative-indefinite-nominative-plural":"jugănele","accusative-definite-nominative-plural":"jugănelele","dative-genitive-indefinite-singular":"jugănele","dative-definite-genitive-singular":"jugănelei","dative-genitive-indefinite-plural":"jugănele","dative-definite-genitive-plural":"jugănelelor","singular-vocative":"jugăneală","plural-vocative":"jugănelelor"}},{"word":"jugănel","pos":"noun","definitions":["diminutive of jugan"],"forms":{"plural":"jugănei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugănel","accusative-definite-nominative-singular":"jugănelul","accusative-indefinite-nominative-plural":"jugănei","accusative-definite-nominative-plural":"jugăneii","dative-genitive-indefinite-singular":"jugănel","dative-definite-genitive-singular":"jugănelului","dative-genitive-indefinite-plural":"jugănei","dative-definite-genitive-plural":"jugăneilor","singular-vocative":"jugănelule","plural-vocative":"jugăneilor"}},{"word":"jugăni","pos":"verb","definitions":["to castrate","to torment"],"forms":{"canonical":"a jugăni 4th conjugation","present-singular-third-person":"jugănește","participle-past":"jugănit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jugăni","gerund":"jugănind","first-person-indicative-present-singular":"jugănesc","indicative-present-second-person-singular":"jugănești","indicative-present-singular-third-person":"jugănește","first-person-indicative-plural-present":"jugănim","indicative-plural-present-second-person":"jugăniți","indicative-plural-present-third-person":"jugănesc","first-person-imperfect-indicative-singular":"jugăneam","imperfect-indicative-second-person-singular":"jugăneai","imperfect-indicative-singular-third-person":"jugănea","first-person-imperfect-indicative-plural":"jugăneam","imperfect-indicative-plural-second-person":"jugăneați","imperfect-indicative-plural-third-person":"jugăneau","first-person-indicative-perfect-singular":"jugănii","indicative-perfect-second-person-singular":"jugăniși","indicative-perfect-singular-third-person":"jugăni","first-person-indicative-perfect-plural":"jugănirăm","indicative-perfect-plural-second-person":"jugănirăți","indicative-perfect-plural-third-person":"jugăniră","first-person-indicative-pluperfect-singular":"jugănisem","indicative-pluperfect-second-person-singular":"jugăniseși","indicative-pluperfect-singular-third-person":"jugănise","first-person-indicative-pluperfect-plural":"jugăniserăm","indicative-pluperfect-plural-second-person":"jugăniserăți","indicative-pluperfect-plural-third-person":"jugăniseră","first-person-present-singular-subjunctive":"să jugănesc","present-second-person-singular-subjunctive":"să jugănești","present-singular-subjunctive-third-person":"să jugănească","first-person-plural-present-subjunctive":"să jugănim","plural-present-second-person-subjunctive":"să jugăniți","plural-present-subjunctive-third-person":"să jugănească","imperative-second-person-singular":"jugănește","imperative-plural-second-person":"jugăniți","imperative-negative-second-person-singular":"nu jugăni","imperative-negative-plural-second-person":"nu jugăniți"}},{"word":"jugănire","pos":"noun","definitions":["castration"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"jugănire","accusative-definite-nominative":"jugănirea","dative-genitive-indefinite":"jugăniri","dative-definite-genitive":"jugănirii","vocative":"jugănire"}},{"word":"jugănit","pos":"adj","definitions":["castrated"],"forms":{"feminine-singular":"jugănită","masculine-plural":"jugăniți","feminine-neuter-plural":"jugănite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jugănit","error-unrecognized-form-feminine-indefinite-singular":"jugănită","error-unrecognized-form-indefinite-masculine-plural":"jugăniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jugănite","definite-error-unrecognized-form-masculine-neuter-singular":"jugănitul","definite-error-unrecognized-form-feminine-singular":"jugănita","definite-error-unrecognized-form-masculine-plural":"jugăniții","definite-error-unrecognized-form-feminine-neuter-plural":"jugănitele"}},{"word":"jugănit","pos":"verb","definitions":["past participle of jugăni"],"forms":{"participle-past":"of jugăni"}},{"word":"jugar","pos":"adj","definitions":["of a yoke, good or fitting for a yoke"],"pronunciation":"/ʒuˈɡar/","forms":{"feminine-singular":"jugară","masculine-plural":"jugari","feminine-neuter-plural":"jugare","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"jugar","error-unrecognized-form-feminine-indefinite-singular":"jugară","error-unrecognized-form-indefinite-masculine-plural":"jugari","error-unrecognized-form-feminine-indefinite-neuter-plural":"jugare","definite-error-unrecognized-form-masculine-neuter-singular":"jugarul","definite-error-unrecognized-form-feminine-singular":"jugara","definite-error-unrecognized-form-masculine-plural":"jugarii","definite-error-unrecognized-form-feminine-neuter-plural":"jugarele"}},{"word":"jugar","pos":"noun","definitions":["a yoked oxen"],"pronunciation":"/ʒuˈɡar/","forms":{"plural":"jugari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugar","accusative-definite-nominative-singular":"jugarul","accusative-indefinite-nominative-plural":"jugari","accusative-definite-nominative-plural":"jugarii","dative-genitive-indefinite-singular":"jugar","dative-definite-genitive-singular":"jugarului","dative-genitive-indefinite-plural":"jugari","dative-definite-genitive-plural":"jugarilor","singular-vocative":"jugarule","plural-vocative":"jugarilor"}},{"word":"jugăr","pos":"noun","definitions":["alternative form of iugăr"],"forms":{"plural":"jugăre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jugăr","accusative-definite-nominative-singular":"jugărul","accusative-indefinite-nominative-plural":"jugăre","accusative-definite-nominative-plural":"jugărele","dative-genitive-indefinite-singular":"jugăr","dative-definite-genitive-singular":"jugărului","dative-genitive-indefinite-plural":"jugăre","dative-definite-genitive-plural":"jugărelor","singular-vocative":"jugărule","plural-vocative":"jugărelor"}},{"word":"jugărel","pos":"noun","definitions":["wall germander (Teucrium chamaedrys)"],"forms":{"plural":"jugărei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugărel","accusative-definite-nominative-singular":"jugărelul","accusative-indefinite-nominative-plural":"jugărei","accusative-definite-nominative-plural":"jugăreii","dative-genitive-indefinite-singular":"jugărel","dative-definite-genitive-singular":"jugărelului","dative-genitive-indefinite-plural":"jugărei","dative-definite-genitive-plural":"jugăreilor","singular-vocative":"jugărelule","plural-vocative":"jugăreilor"}},{"word":"jugăreț","pos":"noun","definitions":["wall germander (Teucrium chamaedrys)"],"forms":{"plural":"jugăreți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugăreț","accusative-definite-nominative-singular":"jugărețul","accusative-indefinite-nominative-plural":"jugăreți","accusative-definite-nominative-plural":"jugăreții","dative-genitive-indefinite-singular":"jugăreț","dative-definite-genitive-singular":"jugărețului","dative-genitive-indefinite-plural":"jugăreți","dative-definite-genitive-plural":"jugăreților","singular-vocative":"jugărețule","plural-vocative":"jugăreților"}},{"word":"jugărit","pos":"noun","definitions":["tax on cutting wood from the forest"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jugărit","accusative-definite-nominative":"jugăritul","dative-genitive-indefinite":"jugărit","dative-definite-genitive":"jugăritului","vocative":"jugăritule"}},{"word":"jugaș","pos":"noun","definitions":["a yoked ox"],"forms":{"plural":"jugași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugaș","accusative-definite-nominative-singular":"jugașul","accusative-indefinite-nominative-plural":"jugași","accusative-definite-nominative-plural":"jugașii","dative-genitive-indefinite-singular":"jugaș","dative-definite-genitive-singular":"jugașului","dative-genitive-indefinite-plural":"jugași","dative-definite-genitive-plural":"jugașilor","singular-vocative":"jugașule","plural-vocative":"jugașilor"}},{"word":"Jugăstreanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Jugăstreanu"}},{"word":"Jugăstreni","pos":"name","definitions":["a village in Vima Mică, Maramureș County, Romania"],"gender":"m"},{"word":"Jugastru","pos":"name","definitions":["a village in Butoiești, Mehedinți County, Romania","a county in the Transnistria Governorate, administered by Romania during World War II"],"gender":"m"},{"word":"jugastru","pos":"noun","definitions":["field maple (Acer campestre)"],"forms":{"plural":"jugaștri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugastru","accusative-definite-nominative-singular":"jugastrul","accusative-indefinite-nominative-plural":"jugaștri","accusative-definite-nominative-plural":"jugaștrii","dative-genitive-indefinite-singular":"jugastru","dative-definite-genitive-singular":"jugastrului","dative-genitive-indefinite-plural":"jugaștri","dative-definite-genitive-plural":"jugaștrilor","singular-vocative":"jugastrule","plural-vocative":"jugaștrilor"}},{"word":"jugendstil","pos":"noun","definitions":["jugendstil"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jugendstil","accusative-definite-nominative":"jugendstilul","dative-genitive-indefinite":"jugendstil","dative-definite-genitive":"jugendstilului","vocative":"jugendstilule"}},{"word":"jughilan","pos":"noun","definitions":["an ox"],"forms":{"plural":"jughilani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jughilan","accusative-definite-nominative-singular":"jughilanul","accusative-indefinite-nominative-plural":"jughilani","accusative-definite-nominative-plural":"jughilanii","dative-genitive-indefinite-singular":"jughilan","dative-definite-genitive-singular":"jughilanului","dative-genitive-indefinite-plural":"jughilani","dative-definite-genitive-plural":"jughilanilor","singular-vocative":"jughilanule","plural-vocative":"jughilanilor"}},{"word":"juglău","pos":"noun","definitions":["neck yoke to prevent animals from jumping over fences"],"forms":{"plural":"juglăi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"juglău","accusative-definite-nominative-singular":"juglăuul","accusative-indefinite-nominative-plural":"juglăi","accusative-definite-nominative-plural":"juglăile","dative-genitive-indefinite-singular":"juglău","dative-definite-genitive-singular":"juglăuului","dative-genitive-indefinite-plural":"juglăi","dative-definite-genitive-plural":"juglăilor","singular-vocative":"juglăuule","plural-vocative":"juglăilor"}},{"word":"Jugravu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Jugravu"}},{"word":"jugula","pos":"verb","definitions":["to choke, to strangle","to stamp out"],"forms":{"canonical":"a jugula 1st conjugation","present-singular-third-person":"jugulează","participle-past":"jugulat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a jugula","gerund":"jugulând","first-person-indicative-present-singular":"jugulez","indicative-present-second-person-singular":"jugulezi","indicative-present-singular-third-person":"jugulează","first-person-indicative-plural-present":"jugulăm","indicative-plural-present-second-person":"jugulați","indicative-plural-present-third-person":"jugulează","first-person-imperfect-indicative-singular":"jugulam","imperfect-indicative-second-person-singular":"jugulai","imperfect-indicative-singular-third-person":"jugula","first-person-imperfect-indicative-plural":"jugulam","imperfect-indicative-plural-second-person":"jugulați","imperfect-indicative-plural-third-person":"jugulau","first-person-indicative-perfect-singular":"jugulai","indicative-perfect-second-person-singular":"jugulași","indicative-perfect-singular-third-person":"jugulă","first-person-indicative-perfect-plural":"jugularăm","indicative-perfect-plural-second-person":"jugularăți","indicative-perfect-plural-third-person":"jugulară","first-person-indicative-pluperfect-singular":"jugulasem","indicative-pluperfect-second-person-singular":"jugulaseși","indicative-pluperfect-singular-third-person":"jugulase","first-person-indicative-pluperfect-plural":"jugulaserăm","indicative-pluperfect-plural-second-person":"jugulaserăți","indicative-pluperfect-plural-third-person":"jugulaseră","first-person-present-singular-subjunctive":"să jugulez","present-second-person-singular-subjunctive":"să jugulezi","present-singular-subjunctive-third-person":"să juguleze","first-person-plural-present-subjunctive":"să jugulăm","plural-present-second-person-subjunctive":"să jugulați","plural-present-subjunctive-third-person":"să juguleze","imperative-second-person-singular":"jugulează","imperative-plural-second-person":"jugulați","imperative-negative-second-person-singular":"nu jugula","imperative-negative-plural-second-person":"nu jugulați"}},{"word":"jugular","pos":"adj","definitions":["jugular; pertaining to the neck or throat"],"pronunciation":"/ʒu.ɡuˈlar/","forms":{"feminine-singular":"jugulară","masculine-plural":"jugulari","feminine-neuter-plural":"jugulare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jugular","error-unrecognized-form-feminine-indefinite-singular":"jugulară","error-unrecognized-form-indefinite-masculine-plural":"jugulari","error-unrecognized-form-feminine-indefinite-neuter-plural":"jugulare","definite-error-unrecognized-form-masculine-neuter-singular":"jugularul","definite-error-unrecognized-form-feminine-singular":"jugulara","definite-error-unrecognized-form-masculine-plural":"jugularii","definite-error-unrecognized-form-feminine-neuter-plural":"jugularele"}},{"word":"jugulară","pos":"noun","definitions":["jugular (vein)"],"forms":{"plural":"jugulare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jugulară","accusative-definite-nominative-singular":"jugulara","accusative-indefinite-nominative-plural":"jugulare","accusative-definite-nominative-plural":"jugularele","dative-genitive-indefinite-singular":"jugulare","dative-definite-genitive-singular":"jugularei","dative-genitive-indefinite-plural":"jugulare","dative-definite-genitive-plural":"jugularelor","singular-vocative":"jugulară","plural-vocative":"jugularelor"}},{"word":"jugulare","pos":"noun","definitions":["jugulation"],"forms":{"plural":"jugulări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jugulare","accusative-definite-nominative-singular":"jugularea","accusative-indefinite-nominative-plural":"jugulări","accusative-definite-nominative-plural":"jugulările","dative-genitive-indefinite-singular":"jugulări","dative-definite-genitive-singular":"jugulării","dative-genitive-indefinite-plural":"jugulări","dative-definite-genitive-plural":"jugulărilor","singular-vocative":"jugulare","plural-vocative":"jugulărilor"}},{"word":"jugule","pos":"noun","definitions":["vocative singular of jug"],"pronunciation":"[ˈʒuɡule]","gender":"n"},{"word":"juguleț","pos":"noun","definitions":["diminutive of jug"],"forms":{"plural":"juguleți","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"juguleț","accusative-definite-nominative-singular":"jugulețul","accusative-indefinite-nominative-plural":"juguleți","accusative-definite-nominative-plural":"jugulețile","dative-genitive-indefinite-singular":"juguleț","dative-definite-genitive-singular":"jugulețului","dative-genitive-indefinite-plural":"juguleți","dative-definite-genitive-plural":"juguleților","singular-vocative":"jugulețule","plural-vocative":"juguleților"}},{"word":"Jugulete","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Jugulete"}},{"word":"juguluire","pos":"noun","definitions":["subjugation"],"forms":{"plural":"juguluiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"juguluire","accusative-definite-nominative-singular":"juguluirea","accusative-indefinite-nominative-plural":"juguluiri","accusative-definite-nominative-plural":"juguluirile","dative-genitive-indefinite-singular":"juguluiri","dative-definite-genitive-singular":"juguluirii","dative-genitive-indefinite-plural":"juguluiri","dative-definite-genitive-plural":"juguluirilor","singular-vocative":"juguluire","plural-vocative":"juguluirilor"}},{"word":"Jugureanu","pos":"name","definitions":["a village in Ulmu, Brăila County, Romania"],"gender":"m"},{"word":"jugurel","pos":"noun","definitions":["wall germander (Teucrium chamaedrys)"],"forms":{"plural":"jugurei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugurel","accusative-definite-nominative-singular":"jugurelul","accusative-indefinite-nominative-plural":"jugurei","accusative-definite-nominative-plural":"jugureii","dative-genitive-indefinite-singular":"jugurel","dative-definite-genitive-singular":"jugurelului","dative-genitive-indefinite-plural":"jugurei","dative-definite-genitive-plural":"jugureilor","singular-vocative":"jugurelule","plural-vocative":"jugureilor"}},{"word":"Jugureni","pos":"name","definitions":["a village in Uliești, Dâmbovița County, Romania","a commune of Prahova County, Romania","a village in Jugureni, Prahova County, Romania"],"gender":"m"},{"word":"jugureț","pos":"noun","definitions":["wall germander (Teucrium chamaedrys)"],"forms":{"plural":"jugureți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jugureț","accusative-definite-nominative-singular":"jugurețul","accusative-indefinite-nominative-plural":"jugureți","accusative-definite-nominative-plural":"jugureții","dative-genitive-indefinite-singular":"jugureț","dative-definite-genitive-singular":"jugurețului","dative-genitive-indefinite-plural":"jugureți","dative-definite-genitive-plural":"jugureților","singular-vocative":"jugurețule","plural-vocative":"jugureților"}},{"word":"jugușor","pos":"noun","definitions":["diminutive of jug"],"forms":{"plural":"jugușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jugușor","accusative-definite-nominative-singular":"jugușorul","accusative-indefinite-nominative-plural":"jugușoare","accusative-definite-nominative-plural":"jugușoarele","dative-genitive-indefinite-singular":"jugușor","dative-definite-genitive-singular":"jugușorului","dative-genitive-indefinite-plural":"jugușoare","dative-definite-genitive-plural":"jugușoarelor","singular-vocative":"jugușorule","plural-vocative":"jugușoarelor"}},{"word":"juguț","pos":"noun","definitions":["diminutive of jug"],"forms":{"plural":"juguțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"juguț","accusative-definite-nominative-singular":"juguțul","accusative-indefinite-nominative-plural":"juguțe","accusative-definite-nominative-plural":"juguțele","dative-genitive-indefinite-singular":"juguț","dative-definite-genitive-singular":"juguțului","dative-genitive-indefinite-plural":"juguțe","dative-definite-genitive-plural":"juguțelor","singular-vocative":"juguțule","plural-vocative":"juguțelor"}},{"word":"juhăt","pos":"noun","definitions":["noise, uproar, rumbling"],"forms":{"plural":"juhăte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"juhăt","accusative-definite-nominative-singular":"juhătul","accusative-indefinite-nominative-plural":"juhăte","accusative-definite-nominative-plural":"juhătele","dative-genitive-indefinite-singular":"juhăt","dative-definite-genitive-singular":"juhătului","dative-genitive-indefinite-plural":"juhăte","dative-definite-genitive-plural":"juhătelor","singular-vocative":"juhătule","plural-vocative":"juhătelor"}},{"word":"juisa","pos":"verb","definitions":["to enjoy the pleasures of life","to ejaculate, to orgasm"],"pronunciation":"[ʒuiˈsa]","forms":{"canonical":"a juisa 1st conjugation","present-singular-third-person":"juisează","participle-past":"juisat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a juisa","gerund":"juisând","first-person-indicative-present-singular":"juisez","indicative-present-second-person-singular":"juisezi","indicative-present-singular-third-person":"juisează","first-person-indicative-plural-present":"juisăm","indicative-plural-present-second-person":"juisați","indicative-plural-present-third-person":"juisează","first-person-imperfect-indicative-singular":"juisam","imperfect-indicative-second-person-singular":"juisai","imperfect-indicative-singular-third-person":"juisa","first-person-imperfect-indicative-plural":"juisam","imperfect-indicative-plural-second-person":"juisați","imperfect-indicative-plural-third-person":"juisau","first-person-indicative-perfect-singular":"juisai","indicative-perfect-second-person-singular":"juisași","indicative-perfect-singular-third-person":"juisă","first-person-indicative-perfect-plural":"juisarăm","indicative-perfect-plural-second-person":"juisarăți","indicative-perfect-plural-third-person":"juisară","first-person-indicative-pluperfect-singular":"juisasem","indicative-pluperfect-second-person-singular":"juisaseși","indicative-pluperfect-singular-third-person":"juisase","first-person-indicative-pluperfect-plural":"juisaserăm","indicative-pluperfect-plural-second-person":"juisaserăți","indicative-pluperfect-plural-third-person":"juisaseră","first-person-present-singular-subjunctive":"să juisez","present-second-person-singular-subjunctive":"să juisezi","present-singular-subjunctive-third-person":"să juiseze","first-person-plural-present-subjunctive":"să juisăm","plural-present-second-person-subjunctive":"să juisați","plural-present-subjunctive-third-person":"să juiseze","imperative-second-person-singular":"juisează","imperative-plural-second-person":"juisați","imperative-negative-second-person-singular":"nu juisa","imperative-negative-plural-second-person":"nu juisați"}},{"word":"juisă","pos":"verb","definitions":["third-person singular simple perfect indicative of juisa"]},{"word":"juisăm","pos":"verb","definitions":["first-person plural present indicative/subjunctive of juisa"],"pronunciation":"[ʒuiˈsəm]"},{"word":"juisare","pos":"noun","definitions":["orgasm"],"forms":{"plural":"juisări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"juisare","accusative-definite-nominative-singular":"juisarea","accusative-indefinite-nominative-plural":"juisări","accusative-definite-nominative-plural":"juisările","dative-genitive-indefinite-singular":"juisări","dative-definite-genitive-singular":"juisării","dative-genitive-indefinite-plural":"juisări","dative-definite-genitive-plural":"juisărilor","singular-vocative":"juisare","plural-vocative":"juisărilor"}},{"word":"juisați","pos":"adj","definitions":["masculine plural of juisat"],"pronunciation":"[ʒuiˈsat͡sʲ]"},{"word":"juisați","pos":"verb","definitions":["inflection of juisa:","second-person plural present/imperfect indicative","second-person plural present subjunctive","second-person plural imperative"],"pronunciation":"[ʒuiˈsat͡sʲ]"},{"word":"juisează","pos":"verb","definitions":["inflection of juisa:","third-person singular/plural present indicative","second-person singular imperative"],"pronunciation":"[ʒuiˈse̯azə]"},{"word":"juisez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of juisa"],"pronunciation":"[ʒuiˈsez]"},{"word":"juiseze","pos":"verb","definitions":["third-person singular/plural present subjunctive of juisa"],"pronunciation":"[ʒuiˈseze]"},{"word":"juisezi","pos":"verb","definitions":["second-person singular present indicative/subjunctive of juisa"],"pronunciation":"[ʒuiˈsezʲ]"},{"word":"juisoare","pos":"noun","definitions":["female equivalent of juisor"],"forms":{"plural":"juisoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"juisoare","accusative-definite-nominative-singular":"juisoarea","accusative-indefinite-nominative-plural":"juisoare","accusative-definite-nominative-plural":"juisoarele","dative-genitive-indefinite-singular":"juisoare","dative-definite-genitive-singular":"juisoarei","dative-genitive-indefinite-plural":"juisoare","dative-definite-genitive-plural":"juisoarelor","singular-vocative":"juisoare","plural-vocative":"juisoarelor"}},{"word":"jujău","pos":"noun","definitions":["alternative form of jujeu"],"forms":{"plural":"jujăie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jujău","accusative-definite-nominative-singular":"jujăuul","accusative-indefinite-nominative-plural":"jujăie","accusative-definite-nominative-plural":"jujăiele","dative-genitive-indefinite-singular":"jujău","dative-definite-genitive-singular":"jujăuului","dative-genitive-indefinite-plural":"jujăie","dative-definite-genitive-plural":"jujăielor","singular-vocative":"jujăuule","plural-vocative":"jujăielor"}},{"word":"jujeu","pos":"noun","definitions":["neck yoke to prevent animals from jumping over fences"],"forms":{"plural":"jujeie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jujeu","accusative-definite-nominative-singular":"jujeul","accusative-indefinite-nominative-plural":"jujeie","accusative-definite-nominative-plural":"jujeiele","dative-genitive-indefinite-singular":"jujeu","dative-definite-genitive-singular":"jujeului","dative-genitive-indefinite-plural":"jujeie","dative-definite-genitive-plural":"jujeielor","singular-vocative":"jujeule","plural-vocative":"jujeielor"}},{"word":"jujub","pos":"noun","definitions":["jujube tree (Ziziphus jujuba or Ziziphus zizyphus)"],"forms":{"plural":"jujubi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jujub","accusative-definite-nominative-singular":"jujubul","accusative-indefinite-nominative-plural":"jujubi","accusative-definite-nominative-plural":"jujubii","dative-genitive-indefinite-singular":"jujub","dative-definite-genitive-singular":"jujubului","dative-genitive-indefinite-plural":"jujubi","dative-definite-genitive-plural":"jujubilor","singular-vocative":"jujubule","plural-vocative":"jujubilor"}},{"word":"jujuba","pos":"noun","definitions":["definite nominative/accusative singular of jujubă"]},{"word":"jujubă","pos":"noun","definitions":["jujube (fruit)"],"pronunciation":"/ʒuˈʒu.bə/","forms":{"plural":"jujube","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"jujubă","accusative-definite-nominative-singular":"jujuba","accusative-indefinite-nominative-plural":"jujube","accusative-definite-nominative-plural":"jujubele","dative-genitive-indefinite-singular":"jujube","dative-definite-genitive-singular":"jujubei","dative-genitive-indefinite-plural":"jujube","dative-definite-genitive-plural":"jujubelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"jujube","pos":"noun","definitions":["plural of jujubă"]},{"word":"jujubier","pos":"noun","definitions":["jujube (tree)"],"forms":{"plural":"jujubieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jujubier","accusative-definite-nominative-singular":"jujubierul","accusative-indefinite-nominative-plural":"jujubieri","accusative-definite-nominative-plural":"jujubierii","dative-genitive-indefinite-singular":"jujubier","dative-definite-genitive-singular":"jujubierului","dative-genitive-indefinite-plural":"jujubieri","dative-definite-genitive-plural":"jujubierilor","singular-vocative":"jujubierule","plural-vocative":"jujubierilor"}},{"word":"julep","pos":"noun","definitions":["julep"],"forms":{"plural":"julepuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"julep","accusative-definite-nominative-singular":"julepul","accusative-indefinite-nominative-plural":"julepuri","accusative-definite-nominative-plural":"julepurile","dative-genitive-indefinite-singular":"julep","dative-definite-genitive-singular":"julepului","dative-genitive-indefinite-plural":"julepuri","dative-definite-genitive-plural":"julepurilor","singular-vocative":"julepule","plural-vocative":"julepurilor"}},{"word":"julfă","pos":"noun","definitions":["hemp seed, hemp heart"],"forms":{"plural":"julfe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"julfă","accusative-definite-nominative-singular":"julfa","accusative-indefinite-nominative-plural":"julfe","accusative-definite-nominative-plural":"julfele","dative-genitive-indefinite-singular":"julfe","dative-definite-genitive-singular":"julfei","dative-genitive-indefinite-plural":"julfe","dative-definite-genitive-plural":"julfelor","singular-vocative":"julfă","plural-vocative":"julfelor"}},{"word":"juli","pos":"verb","definitions":["to scratch"],"forms":{"canonical":"a juli 4th conjugation","present-singular-third-person":"julește","participle-past":"julit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a juli","gerund":"julind","first-person-indicative-present-singular":"julesc","indicative-present-second-person-singular":"julești","indicative-present-singular-third-person":"julește","first-person-indicative-plural-present":"julim","indicative-plural-present-second-person":"juliți","indicative-plural-present-third-person":"julesc","first-person-imperfect-indicative-singular":"juleam","imperfect-indicative-second-person-singular":"juleai","imperfect-indicative-singular-third-person":"julea","first-person-imperfect-indicative-plural":"juleam","imperfect-indicative-plural-second-person":"juleați","imperfect-indicative-plural-third-person":"juleau","first-person-indicative-perfect-singular":"julii","indicative-perfect-second-person-singular":"juliși","indicative-perfect-singular-third-person":"juli","first-person-indicative-perfect-plural":"julirăm","indicative-perfect-plural-second-person":"julirăți","indicative-perfect-plural-third-person":"juliră","first-person-indicative-pluperfect-singular":"julisem","indicative-pluperfect-second-person-singular":"juliseși","indicative-pluperfect-singular-third-person":"julise","first-person-indicative-pluperfect-plural":"juliserăm","indicative-pluperfect-plural-second-person":"juliserăți","indicative-pluperfect-plural-third-person":"juliseră","first-person-present-singular-subjunctive":"să julesc","present-second-person-singular-subjunctive":"să julești","present-singular-subjunctive-third-person":"să julească","first-person-plural-present-subjunctive":"să julim","plural-present-second-person-subjunctive":"să juliți","plural-present-subjunctive-third-person":"să julească","imperative-second-person-singular":"julește","imperative-plural-second-person":"juliți","imperative-negative-second-person-singular":"nu juli","imperative-negative-plural-second-person":"nu juliți"}},{"word":"Juliana","pos":"name","definitions":["a female given name"],"gender":"f"},{"word":"julire","pos":"noun","definitions":["scratch"],"forms":{"plural":"juliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"julire","accusative-definite-nominative-singular":"julirea","accusative-indefinite-nominative-plural":"juliri","accusative-definite-nominative-plural":"julirile","dative-genitive-indefinite-singular":"juliri","dative-definite-genitive-singular":"julirii","dative-genitive-indefinite-plural":"juliri","dative-definite-genitive-plural":"julirilor","singular-vocative":"julire","plural-vocative":"julirilor"}},{"word":"julit","pos":"adj","definitions":["scratched, skinned"],"forms":{"feminine-singular":"julită","masculine-plural":"juliți","feminine-neuter-plural":"julite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"julit","error-unrecognized-form-feminine-indefinite-singular":"julită","error-unrecognized-form-indefinite-masculine-plural":"juliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"julite","definite-error-unrecognized-form-masculine-neuter-singular":"julitul","definite-error-unrecognized-form-feminine-singular":"julita","definite-error-unrecognized-form-masculine-plural":"juliții","definite-error-unrecognized-form-feminine-neuter-plural":"julitele"}},{"word":"julitură","pos":"noun","definitions":["scratch"],"forms":{"plural":"julituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"julitură","accusative-definite-nominative-singular":"julitura","accusative-indefinite-nominative-plural":"juliture","accusative-definite-nominative-plural":"juliturele","dative-genitive-indefinite-singular":"juliture","dative-definite-genitive-singular":"juliturei","dative-genitive-indefinite-plural":"juliture","dative-definite-genitive-plural":"juliturelor","singular-vocative":"julitură","plural-vocative":"juliturelor"}},{"word":"juma","pos":"noun","definitions":["alternative form of jumătate"]},{"word":"jumalț","pos":"noun","definitions":["obsolete form of smalț"],"forms":{"plural":"jumalțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jumalț","accusative-definite-nominative-singular":"jumalțul","accusative-indefinite-nominative-plural":"jumalțuri","accusative-definite-nominative-plural":"jumalțurile","dative-genitive-indefinite-singular":"jumalț","dative-definite-genitive-singular":"jumalțului","dative-genitive-indefinite-plural":"jumalțuri","dative-definite-genitive-plural":"jumalțurilor","singular-vocative":"jumalțule","plural-vocative":"jumalțurilor"}},{"word":"Jumară","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jumară"}},{"word":"jumară","pos":"noun","definitions":["edible leftovers of bacon that was used to produce lard","meal prepared by frying eggs in grease","weak man","mamaliga with whey cooked in melted butter","a dish prepared by frying a mixture of cornflour, milk and eggs"],"forms":{"plural":"jumări","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"jumară","accusative-definite-nominative-singular":"jumara","accusative-indefinite-nominative-plural":"jumări","accusative-definite-nominative-plural":"jumările","dative-genitive-indefinite-singular":"jumări","dative-definite-genitive-singular":"jumării","dative-genitive-indefinite-plural":"jumări","dative-definite-genitive-plural":"jumărilor","singular-vocative":"-","plural-vocative":"-","alternative":"jumarcă"}},{"word":"jumări","pos":"noun","definitions":["plural of jumară"],"gender":"f-p"},{"word":"Jumătate","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jumătate"}},{"word":"jumătate","pos":"noun","definitions":["half"],"pronunciation":"/ʒu.məˈta.te/","forms":{"plural":"jumătăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jumătate","accusative-definite-nominative-singular":"jumătatea","accusative-indefinite-nominative-plural":"jumătăți","accusative-definite-nominative-plural":"jumătățile","dative-genitive-indefinite-singular":"jumătăți","dative-definite-genitive-singular":"jumătății","dative-genitive-indefinite-plural":"jumătăți","dative-definite-genitive-plural":"jumătăților","singular-vocative":"jumătate","plural-vocative":"jumătăților","alternative":"жумэтате","alternative-colloquial":"jumate"}},{"word":"jumătate de măsură","pos":"noun","definitions":["half measure"],"forms":{"plural":"jumătăți de măsură"}},{"word":"jumătatea","pos":"noun","definitions":["definite nominative/accusative singular of jumătate"]},{"word":"jumătăți","pos":"noun","definitions":["inflection of jumătate:","plural","genitive/dative singular"]},{"word":"jumătăți","pos":"verb","definitions":["to half"],"forms":{"canonical":"a jumătăți 4th conjugation","present-singular-third-person":"jumătățește","participle-past":"jumătățit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jumătăți","gerund":"jumătățind","first-person-indicative-present-singular":"jumătățesc","indicative-present-second-person-singular":"jumătățești","indicative-present-singular-third-person":"jumătățește","first-person-indicative-plural-present":"jumătățim","indicative-plural-present-second-person":"jumătățiți","indicative-plural-present-third-person":"jumătățesc","first-person-imperfect-indicative-singular":"jumătățeam","imperfect-indicative-second-person-singular":"jumătățeai","imperfect-indicative-singular-third-person":"jumătățea","first-person-imperfect-indicative-plural":"jumătățeam","imperfect-indicative-plural-second-person":"jumătățeați","imperfect-indicative-plural-third-person":"jumătățeau","first-person-indicative-perfect-singular":"jumătății","indicative-perfect-second-person-singular":"jumătățiși","indicative-perfect-singular-third-person":"jumătăți","first-person-indicative-perfect-plural":"jumătățirăm","indicative-perfect-plural-second-person":"jumătățirăți","indicative-perfect-plural-third-person":"jumătățiră","first-person-indicative-pluperfect-singular":"jumătățisem","indicative-pluperfect-second-person-singular":"jumătățiseși","indicative-pluperfect-singular-third-person":"jumătățise","first-person-indicative-pluperfect-plural":"jumătățiserăm","indicative-pluperfect-plural-second-person":"jumătățiserăți","indicative-pluperfect-plural-third-person":"jumătățiseră","first-person-present-singular-subjunctive":"să jumătățesc","present-second-person-singular-subjunctive":"să jumătățești","present-singular-subjunctive-third-person":"să jumătățească","first-person-plural-present-subjunctive":"să jumătățim","plural-present-second-person-subjunctive":"să jumătățiți","plural-present-subjunctive-third-person":"să jumătățească","imperative-second-person-singular":"jumătățește","imperative-plural-second-person":"jumătățiți","imperative-negative-second-person-singular":"nu jumătăți","imperative-negative-plural-second-person":"nu jumătățiți"}},{"word":"jumătății","pos":"noun","definitions":["definite dative/genitive singular of jumătate"]},{"word":"jumătățile","pos":"noun","definitions":["definite nominative/accusative plural of jumătate"]},{"word":"jumătăților","pos":"noun","definitions":["inflection of jumătate:","definite genitive/dative plural","vocative plural"]},{"word":"jumătățire","pos":"noun","definitions":["halving"],"forms":{"plural":"jumătățiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jumătățire","accusative-definite-nominative-singular":"jumătățirea","accusative-indefinite-nominative-plural":"jumătățiri","accusative-definite-nominative-plural":"jumătățirile","dative-genitive-indefinite-singular":"jumătățiri","dative-definite-genitive-singular":"jumătățirii","dative-genitive-indefinite-plural":"jumătățiri","dative-definite-genitive-plural":"jumătățirilor","singular-vocative":"jumătățire","plural-vocative":"jumătățirilor"}},{"word":"jumătățit","pos":"noun","definitions":["halving"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"jumătățit","accusative-definite-nominative":"jumătățitul","dative-genitive-indefinite":"jumătățit","dative-definite-genitive":"jumătățitului","vocative":"jumătățitule"}},{"word":"jumătățit","pos":"verb","definitions":["past participle of jumătăți"],"forms":{"participle-past":"of jumătăți"}},{"word":"jumate","pos":"noun","definitions":["syncopic form of jumătate"],"pronunciation":"/ʒuˈma.te/","forms":{"plural":"jumăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jumate","accusative-definite-nominative-singular":"jumatea","accusative-indefinite-nominative-plural":"jumăți","accusative-definite-nominative-plural":"jumățile","dative-genitive-indefinite-singular":"jumăți","dative-definite-genitive-singular":"jumății","dative-genitive-indefinite-plural":"jumăți","dative-definite-genitive-plural":"jumăților","singular-vocative":"jumate","plural-vocative":"jumăților","alternative":"жумате"}},{"word":"jumela","pos":"noun","definitions":["definite nominative/accusative singular of jumelă"],"pronunciation":"[ʒuˈmela]","gender":"f"},{"word":"jumelă","pos":"noun","definitions":["articulation part of a vehicle"],"forms":{"plural":"jumele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jumelă","accusative-definite-nominative-singular":"jumela","accusative-indefinite-nominative-plural":"jumele","accusative-definite-nominative-plural":"jumelele","dative-genitive-indefinite-singular":"jumele","dative-definite-genitive-singular":"jumelei","dative-genitive-indefinite-plural":"jumele","dative-definite-genitive-plural":"jumelelor","singular-vocative":"jumelă","plural-vocative":"jumelelor"}},{"word":"jumuleală","pos":"noun","definitions":["plucking"],"forms":{"plural":"jumuleli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jumuleală","accusative-definite-nominative-singular":"jumuleala","accusative-indefinite-nominative-plural":"jumulele","accusative-definite-nominative-plural":"jumulelele","dative-genitive-indefinite-singular":"jumulele","dative-definite-genitive-singular":"jumulelei","dative-genitive-indefinite-plural":"jumulele","dative-definite-genitive-plural":"jumulelelor","singular-vocative":"jumuleală","plural-vocative":"jumulelelor"}},{"word":"jumuli","pos":"verb","definitions":["to pluck"],"forms":{"canonical":"a jumuli 4th conjugation","present-singular-third-person":"jumulește","participle-past":"jumulit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jumuli","gerund":"jumulind","first-person-indicative-present-singular":"jumulesc","indicative-present-second-person-singular":"jumulești","indicative-present-singular-third-person":"jumulește","first-person-indicative-plural-present":"jumulim","indicative-plural-present-second-person":"jumuliți","indicative-plural-present-third-person":"jumulesc","first-person-imperfect-indicative-singular":"jumuleam","imperfect-indicative-second-person-singular":"jumuleai","imperfect-indicative-singular-third-person":"jumulea","first-person-imperfect-indicative-plural":"jumuleam","imperfect-indicative-plural-second-person":"jumuleați","imperfect-indicative-plural-third-person":"jumuleau","first-person-indicative-perfect-singular":"jumulii","indicative-perfect-second-person-singular":"jumuliși","indicative-perfect-singular-third-person":"jumuli","first-person-indicative-perfect-plural":"jumulirăm","indicative-perfect-plural-second-person":"jumulirăți","indicative-perfect-plural-third-person":"jumuliră","first-person-indicative-pluperfect-singular":"jumulisem","indicative-pluperfect-second-person-singular":"jumuliseși","indicative-pluperfect-singular-third-person":"jumulise","first-person-indicative-pluperfect-plural":"jumuliserăm","indicative-pluperfect-plural-second-person":"jumuliserăți","indicative-pluperfect-plural-third-person":"jumuliseră","first-person-present-singular-subjunctive":"să jumulesc","present-second-person-singular-subjunctive":"să jumulești","present-singular-subjunctive-third-person":"să jumulească","first-person-plural-present-subjunctive":"să jumulim","plural-present-second-person-subjunctive":"să jumuliți","plural-present-subjunctive-third-person":"să jumulească","imperative-second-person-singular":"jumulește","imperative-plural-second-person":"jumuliți","imperative-negative-second-person-singular":"nu jumuli","imperative-negative-plural-second-person":"nu jumuliți"}},{"word":"jumulire","pos":"noun","definitions":["plucking"],"forms":{"plural":"jumuliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jumulire","accusative-definite-nominative-singular":"jumulirea","accusative-indefinite-nominative-plural":"jumuliri","accusative-definite-nominative-plural":"jumulirile","dative-genitive-indefinite-singular":"jumuliri","dative-definite-genitive-singular":"jumulirii","dative-genitive-indefinite-plural":"jumuliri","dative-definite-genitive-plural":"jumulirilor","singular-vocative":"jumulire","plural-vocative":"jumulirilor"}},{"word":"jumulit","pos":"adj","definitions":["plucked"],"forms":{"feminine-singular":"jumulită","masculine-plural":"jumuliți","feminine-neuter-plural":"jumulite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jumulit","error-unrecognized-form-feminine-indefinite-singular":"jumulită","error-unrecognized-form-indefinite-masculine-plural":"jumuliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jumulite","definite-error-unrecognized-form-masculine-neuter-singular":"jumulitul","definite-error-unrecognized-form-feminine-singular":"jumulita","definite-error-unrecognized-form-masculine-plural":"jumuliții","definite-error-unrecognized-form-feminine-neuter-plural":"jumulitele"}},{"word":"jună","pos":"noun","definitions":["female equivalent of june"],"forms":{"plural":"june","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jună","accusative-definite-nominative-singular":"juna","accusative-indefinite-nominative-plural":"june","accusative-definite-nominative-plural":"junele","dative-genitive-indefinite-singular":"june","dative-definite-genitive-singular":"junei","dative-genitive-indefinite-plural":"june","dative-definite-genitive-plural":"junelor","singular-vocative":"jună","plural-vocative":"junelor"}},{"word":"Junc","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Crișul Alb"],"gender":"m"},{"word":"junc","pos":"noun","definitions":["a young bullock"],"examples":[{"ro":"(regional)","en":null}],"forms":{"plural":"junci","feminine":"equivalent juncă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"junc","accusative-definite-nominative-singular":"juncul","accusative-indefinite-nominative-plural":"junci","accusative-definite-nominative-plural":"juncii","dative-genitive-indefinite-singular":"junc","dative-definite-genitive-singular":"juncului","dative-genitive-indefinite-plural":"junci","dative-definite-genitive-plural":"juncilor","singular-vocative":"juncule","plural-vocative":"juncilor"}},{"word":"Junca","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Junca"}},{"word":"Juncă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Juncă"}},{"word":"juncă","pos":"noun","definitions":["heifer"],"forms":{"plural":"junci","masculine":"equivalent junc","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"juncă","accusative-definite-nominative-singular":"junca","accusative-indefinite-nominative-plural":"junci","accusative-definite-nominative-plural":"juncile","dative-genitive-indefinite-singular":"junci","dative-definite-genitive-singular":"juncii","dative-genitive-indefinite-plural":"junci","dative-definite-genitive-plural":"juncilor","singular-vocative":"juncă","plural-vocative":"juncilor"}},{"word":"juncălău","pos":"noun","definitions":["an older bullock"],"forms":{"plural":"juncălăi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"juncălău","accusative-definite-nominative-singular":"juncălăuul","accusative-indefinite-nominative-plural":"juncălăi","accusative-definite-nominative-plural":"juncălăii","dative-genitive-indefinite-singular":"juncălău","dative-definite-genitive-singular":"juncălăuului","dative-genitive-indefinite-plural":"juncălăi","dative-definite-genitive-plural":"juncălăilor","singular-vocative":"juncălăuule","plural-vocative":"juncălăilor"}},{"word":"juncan","pos":"noun","definitions":["an older bullock"],"forms":{"plural":"juncani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"juncan","accusative-definite-nominative-singular":"juncanul","accusative-indefinite-nominative-plural":"juncani","accusative-definite-nominative-plural":"juncanii","dative-genitive-indefinite-singular":"juncan","dative-definite-genitive-singular":"juncanului","dative-genitive-indefinite-plural":"juncani","dative-definite-genitive-plural":"juncanilor","singular-vocative":"juncanule","plural-vocative":"juncanilor"}},{"word":"juncană","pos":"noun","definitions":["heifer"],"forms":{"plural":"juncane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"juncană","accusative-definite-nominative-singular":"juncana","accusative-indefinite-nominative-plural":"juncane","accusative-definite-nominative-plural":"juncanele","dative-genitive-indefinite-singular":"juncane","dative-definite-genitive-singular":"juncanei","dative-genitive-indefinite-plural":"juncane","dative-definite-genitive-plural":"juncanelor","singular-vocative":"juncană","plural-vocative":"juncanelor"}},{"word":"juncănaș","pos":"noun","definitions":["diminutive of juncan; small steer"],"forms":{"plural":"juncănași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"juncănaș","accusative-definite-nominative-singular":"juncănașul","accusative-indefinite-nominative-plural":"juncănași","accusative-definite-nominative-plural":"juncănașii","dative-genitive-indefinite-singular":"juncănaș","dative-definite-genitive-singular":"juncănașului","dative-genitive-indefinite-plural":"juncănași","dative-definite-genitive-plural":"juncănașilor","singular-vocative":"juncănașule","plural-vocative":"juncănașilor"}},{"word":"juncancă","pos":"noun","definitions":["heifer"],"forms":{"plural":"juncance","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"juncancă","accusative-definite-nominative-singular":"juncanca","accusative-indefinite-nominative-plural":"juncance","accusative-definite-nominative-plural":"juncancele","dative-genitive-indefinite-singular":"juncance","dative-definite-genitive-singular":"juncancei","dative-genitive-indefinite-plural":"juncance","dative-definite-genitive-plural":"juncancelor","singular-vocative":"juncancă","plural-vocative":"juncancelor"}},{"word":"juncănel","pos":"noun","definitions":["diminutive of juncan"],"forms":{"plural":"juncănei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"juncănel","accusative-definite-nominative-singular":"juncănelul","accusative-indefinite-nominative-plural":"juncănei","accusative-definite-nominative-plural":"juncăneii","dative-genitive-indefinite-singular":"juncănel","dative-definite-genitive-singular":"juncănelului","dative-genitive-indefinite-plural":"juncănei","dative-definite-genitive-plural":"juncăneilor","singular-vocative":"juncănelule","plural-vocative":"juncăneilor"}},{"word":"junci","pos":"noun","definitions":["plural of juncă"],"gender":"f-p"},{"word":"junctură","pos":"noun","definitions":["junction"],"forms":{"plural":"juncturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"junctură","accusative-definite-nominative-singular":"junctura","accusative-indefinite-nominative-plural":"juncturi","accusative-definite-nominative-plural":"juncturile","dative-genitive-indefinite-singular":"juncturi","dative-definite-genitive-singular":"juncturii","dative-genitive-indefinite-plural":"juncturi","dative-definite-genitive-plural":"juncturilor","singular-vocative":"junctură","plural-vocative":"juncturilor"}},{"word":"junculean","pos":"noun","definitions":["diminutive of junc"],"forms":{"plural":"junculeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"junculean","accusative-definite-nominative-singular":"junculeanul","accusative-indefinite-nominative-plural":"junculeni","accusative-definite-nominative-plural":"junculenii","dative-genitive-indefinite-singular":"junculean","dative-definite-genitive-singular":"junculeanului","dative-genitive-indefinite-plural":"junculeni","dative-definite-genitive-plural":"junculenilor","singular-vocative":"junculeanule","plural-vocative":"junculenilor"}},{"word":"juncușor","pos":"noun","definitions":["diminutive of junc"],"forms":{"plural":"juncușori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"juncușor","accusative-definite-nominative-singular":"juncușorul","accusative-indefinite-nominative-plural":"juncușori","accusative-definite-nominative-plural":"juncușorii","dative-genitive-indefinite-singular":"juncușor","dative-definite-genitive-singular":"juncușorului","dative-genitive-indefinite-plural":"juncușori","dative-definite-genitive-plural":"juncușorilor","singular-vocative":"juncușorule","plural-vocative":"juncușorilor"}},{"word":"juncuț","pos":"noun","definitions":["diminutive of junc"],"forms":{"plural":"juncuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"juncuț","accusative-definite-nominative-singular":"juncuțul","accusative-indefinite-nominative-plural":"juncuți","accusative-definite-nominative-plural":"juncuții","dative-genitive-indefinite-singular":"juncuț","dative-definite-genitive-singular":"juncuțului","dative-genitive-indefinite-plural":"juncuți","dative-definite-genitive-plural":"juncuților","singular-vocative":"juncuțule","plural-vocative":"juncuților"}},{"word":"juncuță","pos":"noun","definitions":["diminutive of juncă; small heifer"],"forms":{"plural":"juncuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"juncuță","accusative-definite-nominative-singular":"juncuța","accusative-indefinite-nominative-plural":"juncuțe","accusative-definite-nominative-plural":"juncuțele","dative-genitive-indefinite-singular":"juncuțe","dative-definite-genitive-singular":"juncuței","dative-genitive-indefinite-plural":"juncuțe","dative-definite-genitive-plural":"juncuțelor","singular-vocative":"juncuță","plural-vocative":"juncuțelor"}},{"word":"June","pos":"name","definitions":["a surname"],"pronunciation":"/ˈʒu.ne/","gender":"m","forms":{"dative-genitive":"lui June"}},{"word":"june","pos":"adj","definitions":["young"],"pronunciation":"/ˈʒu.ne/","forms":{"feminine-singular":"jună","masculine-plural":"juni","feminine-neuter-plural":"june","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"june","error-unrecognized-form-feminine-indefinite-singular":"jună","error-unrecognized-form-indefinite-masculine-plural":"juni","error-unrecognized-form-feminine-indefinite-neuter-plural":"june","definite-error-unrecognized-form-masculine-neuter-singular":"junele","definite-error-unrecognized-form-feminine-singular":"juna","definite-error-unrecognized-form-masculine-plural":"junii","definite-error-unrecognized-form-feminine-neuter-plural":"junele"}},{"word":"june","pos":"noun","definitions":["youth, young man, bachelor"],"pronunciation":"/ˈʒu.ne/","forms":{"plural":"juni","table-tags":"no-table-tags","inflection-template":"ro-noun-m-e","accusative-indefinite-nominative-singular":"june","accusative-definite-nominative-singular":"junele","accusative-indefinite-nominative-plural":"juni","accusative-definite-nominative-plural":"junii","dative-genitive-indefinite-singular":"june","dative-definite-genitive-singular":"junelui","dative-genitive-indefinite-plural":"juni","dative-definite-genitive-plural":"junilor","singular-vocative":"june","plural-vocative":"junilor"}},{"word":"june prim","pos":"noun","definitions":["jeune premier"],"forms":{"plural":"juni primi"}},{"word":"junecuț","pos":"noun","definitions":["diminutive of june"],"forms":{"plural":"junecuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"junecuț","accusative-definite-nominative-singular":"junecuțul","accusative-indefinite-nominative-plural":"junecuți","accusative-definite-nominative-plural":"junecuții","dative-genitive-indefinite-singular":"junecuț","dative-definite-genitive-singular":"junecuțului","dative-genitive-indefinite-plural":"junecuți","dative-definite-genitive-plural":"junecuților","singular-vocative":"junecuțule","plural-vocative":"junecuților"}},{"word":"junel","pos":"noun","definitions":["diminutive of june"],"forms":{"plural":"junei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"junel","accusative-definite-nominative-singular":"junelul","accusative-indefinite-nominative-plural":"junei","accusative-definite-nominative-plural":"juneii","dative-genitive-indefinite-singular":"junel","dative-definite-genitive-singular":"junelului","dative-genitive-indefinite-plural":"junei","dative-definite-genitive-plural":"juneilor","singular-vocative":"junelule","plural-vocative":"juneilor"}},{"word":"junelaș","pos":"noun","definitions":["diminutive of junel"],"forms":{"plural":"junelași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"junelaș","accusative-definite-nominative-singular":"junelașul","accusative-indefinite-nominative-plural":"junelași","accusative-definite-nominative-plural":"junelașii","dative-genitive-indefinite-singular":"junelaș","dative-definite-genitive-singular":"junelașului","dative-genitive-indefinite-plural":"junelași","dative-definite-genitive-plural":"junelașilor","singular-vocative":"junelașule","plural-vocative":"junelașilor"}},{"word":"juneță","pos":"noun","definitions":["obsolete form of junețe"],"forms":{"plural":"juneți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"juneță","accusative-definite-nominative-singular":"juneța","accusative-indefinite-nominative-plural":"juneți","accusative-definite-nominative-plural":"junețile","dative-genitive-indefinite-singular":"juneți","dative-definite-genitive-singular":"juneții","dative-genitive-indefinite-plural":"juneți","dative-definite-genitive-plural":"juneților","singular-vocative":"juneță","plural-vocative":"juneților"}},{"word":"junețe","pos":"noun","definitions":["youth"],"forms":{"plural":"juneți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"junețe","accusative-definite-nominative-singular":"junețea","accusative-indefinite-nominative-plural":"juneți","accusative-definite-nominative-plural":"junețile","dative-genitive-indefinite-singular":"juneți","dative-definite-genitive-singular":"juneții","dative-genitive-indefinite-plural":"juneți","dative-definite-genitive-plural":"juneților","singular-vocative":"junețe","plural-vocative":"juneților"}},{"word":"jungher","pos":"noun","definitions":["dagger"],"forms":{"plural":"junghere"}},{"word":"junghet","pos":"noun","definitions":["smile"],"forms":{"plural":"junghete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"junghet","accusative-definite-nominative-singular":"junghetul","accusative-indefinite-nominative-plural":"junghete","accusative-definite-nominative-plural":"junghetele","dative-genitive-indefinite-singular":"junghet","dative-definite-genitive-singular":"junghetului","dative-genitive-indefinite-plural":"junghete","dative-definite-genitive-plural":"junghetelor","singular-vocative":"junghetule","plural-vocative":"junghetelor"}},{"word":"junghetură","pos":"noun","definitions":["obsolete form of junghietură"],"forms":{"plural":"jungheturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"junghetură","accusative-definite-nominative-singular":"junghetura","accusative-indefinite-nominative-plural":"jungheturi","accusative-definite-nominative-plural":"jungheturile","dative-genitive-indefinite-singular":"jungheturi","dative-definite-genitive-singular":"jungheturii","dative-genitive-indefinite-plural":"jungheturi","dative-definite-genitive-plural":"jungheturilor","singular-vocative":"junghetură","plural-vocative":"jungheturilor"}},{"word":"junghi","pos":"noun","definitions":["twinge, shooting; a sharp or piercing pain of short duration, especially in the ribs, back, or chest","a dagger"],"forms":{"plural":"junghiuri","alternative":"junghiu"}},{"word":"junghia","pos":"verb","definitions":["synonym of înjunghia (“to stab”)"],"forms":{"canonical":"a junghia 1st conjugation","present-singular-third-person":"junghie","participle-past":"junghiat","subjunctive-third-person":"junghie","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a junghia","gerund":"junghiind","first-person-indicative-present-singular":"junghii","indicative-present-second-person-singular":"junghii","indicative-present-singular-third-person":"junghie","first-person-indicative-plural-present":"junghiem","indicative-plural-present-second-person":"junghiați","indicative-plural-present-third-person":"junghie","first-person-imperfect-indicative-singular":"junghiam","imperfect-indicative-second-person-singular":"junghiai","imperfect-indicative-singular-third-person":"junghia","first-person-imperfect-indicative-plural":"junghiam","imperfect-indicative-plural-second-person":"junghiați","imperfect-indicative-plural-third-person":"junghiau","first-person-indicative-perfect-singular":"junghiai","indicative-perfect-second-person-singular":"junghiași","indicative-perfect-singular-third-person":"junghie","first-person-indicative-perfect-plural":"junghiarăm","indicative-perfect-plural-second-person":"junghiarăți","indicative-perfect-plural-third-person":"junghiară","first-person-indicative-pluperfect-singular":"junghiasem","indicative-pluperfect-second-person-singular":"junghiaseși","indicative-pluperfect-singular-third-person":"junghiase","first-person-indicative-pluperfect-plural":"junghiaserăm","indicative-pluperfect-plural-second-person":"junghiaserăți","indicative-pluperfect-plural-third-person":"junghiaseră","first-person-present-singular-subjunctive":"să junghii","present-second-person-singular-subjunctive":"să junghii","present-singular-subjunctive-third-person":"să junghie","first-person-plural-present-subjunctive":"să junghiem","plural-present-second-person-subjunctive":"să junghiați","plural-present-subjunctive-third-person":"să junghie","imperative-second-person-singular":"junghie","imperative-plural-second-person":"junghiați","imperative-negative-second-person-singular":"nu junghia","imperative-negative-plural-second-person":"nu junghiați"}},{"word":"junghiere","pos":"noun","definitions":["a stabbing"],"forms":{"plural":"junghieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"junghiere","accusative-definite-nominative-singular":"junghierea","accusative-indefinite-nominative-plural":"junghieri","accusative-definite-nominative-plural":"junghierile","dative-genitive-indefinite-singular":"junghieri","dative-definite-genitive-singular":"junghierii","dative-genitive-indefinite-plural":"junghieri","dative-definite-genitive-plural":"junghierilor","singular-vocative":"junghiere","plural-vocative":"junghierilor"}},{"word":"junghietor","pos":"adj","definitions":["stabbing"],"forms":{"feminine-singular":"junghietoare","masculine-plural":"junghietori","feminine-neuter-plural":"junghietoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"junghietor","error-unrecognized-form-feminine-indefinite-singular":"junghietoare","error-unrecognized-form-indefinite-masculine-plural":"junghietori","error-unrecognized-form-feminine-indefinite-neuter-plural":"junghietoare","definite-error-unrecognized-form-masculine-neuter-singular":"junghietorul","definite-error-unrecognized-form-feminine-singular":"junghietoarea","definite-error-unrecognized-form-masculine-plural":"junghietorii","definite-error-unrecognized-form-feminine-neuter-plural":"junghietoarele"}},{"word":"junghietură","pos":"noun","definitions":["nape","victim","sacrificed animal","stabbing","killing"],"forms":{"plural":"junghieturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"junghietură","accusative-definite-nominative-singular":"junghietura","accusative-indefinite-nominative-plural":"junghieturi","accusative-definite-nominative-plural":"junghieturile","dative-genitive-indefinite-singular":"junghieturi","dative-definite-genitive-singular":"junghieturii","dative-genitive-indefinite-plural":"junghieturi","dative-definite-genitive-plural":"junghieturilor","singular-vocative":"junghietură","plural-vocative":"junghieturilor","alternative":"junghetură"}},{"word":"junghiuleț","pos":"noun","definitions":["diminutive of junghi"],"forms":{"plural":"junghiulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"junghiuleț","accusative-definite-nominative-singular":"junghiulețul","accusative-indefinite-nominative-plural":"junghiulețe","accusative-definite-nominative-plural":"junghiulețele","dative-genitive-indefinite-singular":"junghiuleț","dative-definite-genitive-singular":"junghiulețului","dative-genitive-indefinite-plural":"junghiulețe","dative-definite-genitive-plural":"junghiulețelor","singular-vocative":"junghiulețule","plural-vocative":"junghiulețelor"}},{"word":"jungla","pos":"noun","definitions":["definite nominative/accusative singular of junglă"],"pronunciation":"[ˈʒuŋɡla]","gender":"f"},{"word":"junglă","pos":"noun","definitions":["jungle"],"forms":{"plural":"jungle","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"junglă","accusative-definite-nominative-singular":"jungla","accusative-indefinite-nominative-plural":"jungle","accusative-definite-nominative-plural":"junglele","dative-genitive-indefinite-singular":"jungle","dative-definite-genitive-singular":"junglei","dative-genitive-indefinite-plural":"jungle","dative-definite-genitive-plural":"junglelor","singular-vocative":"junglă","plural-vocative":"junglelor"}},{"word":"jungle","pos":"noun","definitions":["inflection of junglă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈʒuŋɡle]","gender":"f"},{"word":"junică","pos":"noun","definitions":["obsolete form of junincă"],"forms":{"plural":"junici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"junică","accusative-definite-nominative-singular":"junica","accusative-indefinite-nominative-plural":"junici","accusative-definite-nominative-plural":"junicile","dative-genitive-indefinite-singular":"junici","dative-definite-genitive-singular":"junicii","dative-genitive-indefinite-plural":"junici","dative-definite-genitive-plural":"junicilor","singular-vocative":"junică","plural-vocative":"junicilor"}},{"word":"junice","pos":"noun","definitions":["obsolete form of junincă"],"forms":{"plural":"junici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"junice","accusative-definite-nominative-singular":"junicea","accusative-indefinite-nominative-plural":"junici","accusative-definite-nominative-plural":"junicile","dative-genitive-indefinite-singular":"junici","dative-definite-genitive-singular":"junicii","dative-genitive-indefinite-plural":"junici","dative-definite-genitive-plural":"junicilor","singular-vocative":"junice","plural-vocative":"junicilor"}},{"word":"junie","pos":"noun","definitions":["youth"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"junie","accusative-definite-nominative":"junia","dative-genitive-indefinite":"junii","dative-definite-genitive":"juniei","vocative":"junie"}},{"word":"junigaș","pos":"noun","definitions":["diminutive of june"],"forms":{"plural":"junigași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"junigaș","accusative-definite-nominative-singular":"junigașul","accusative-indefinite-nominative-plural":"junigași","accusative-definite-nominative-plural":"junigașii","dative-genitive-indefinite-singular":"junigaș","dative-definite-genitive-singular":"junigașului","dative-genitive-indefinite-plural":"junigași","dative-definite-genitive-plural":"junigașilor","singular-vocative":"junigașule","plural-vocative":"junigașilor"}},{"word":"junime","pos":"noun","definitions":["youth (part of life)"],"forms":{"plural":"junimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"junime","accusative-definite-nominative-singular":"junimea","accusative-indefinite-nominative-plural":"junimi","accusative-definite-nominative-plural":"junimile","dative-genitive-indefinite-singular":"junimi","dative-definite-genitive-singular":"junimii","dative-genitive-indefinite-plural":"junimi","dative-definite-genitive-plural":"junimilor","singular-vocative":"junime","plural-vocative":"junimilor"}},{"word":"junimea","pos":"noun","definitions":["definite nominative/accusative singular of junime"],"gender":"f"},{"word":"junimism","pos":"noun","definitions":["a literary movement in 19th century Romania"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"junimism","accusative-definite-nominative":"junimismul","dative-genitive-indefinite":"junimism","dative-definite-genitive":"junimismului","vocative":"junimismule"}},{"word":"junimistă","pos":"noun","definitions":["female equivalent of junimist"],"forms":{"plural":"junimiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"junimistă","accusative-definite-nominative-singular":"junimista","accusative-indefinite-nominative-plural":"junimiste","accusative-definite-nominative-plural":"junimistele","dative-genitive-indefinite-singular":"junimiste","dative-definite-genitive-singular":"junimistei","dative-genitive-indefinite-plural":"junimiste","dative-definite-genitive-plural":"junimistelor","singular-vocative":"junimistă","plural-vocative":"junimistelor"}},{"word":"junincă","pos":"noun","definitions":["heifer, young female calf"],"forms":{"plural":"juninci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"junincă","accusative-definite-nominative-singular":"juninca","accusative-indefinite-nominative-plural":"juninci","accusative-definite-nominative-plural":"junincile","dative-genitive-indefinite-singular":"juninci","dative-definite-genitive-singular":"junincii","dative-genitive-indefinite-plural":"juninci","dative-definite-genitive-plural":"junincilor","singular-vocative":"junincă","plural-vocative":"junincilor","alternative":"junice"}},{"word":"junincea","pos":"noun","definitions":["diminutive of junincă"],"forms":{"plural":"junincele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"junincea","accusative-definite-nominative-singular":"juninceaua","accusative-indefinite-nominative-plural":"junincele","accusative-definite-nominative-plural":"junincelele","dative-genitive-indefinite-singular":"junincele","dative-definite-genitive-singular":"junincelei","dative-genitive-indefinite-plural":"junincele","dative-definite-genitive-plural":"junincelelor","singular-vocative":"junincea","plural-vocative":"junincelelor"}},{"word":"junincuță","pos":"noun","definitions":["diminutive of junincă"],"forms":{"plural":"junincuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"junincuță","accusative-definite-nominative-singular":"junincuța","accusative-indefinite-nominative-plural":"junincuțe","accusative-definite-nominative-plural":"junincuțele","dative-genitive-indefinite-singular":"junincuțe","dative-definite-genitive-singular":"junincuței","dative-genitive-indefinite-plural":"junincuțe","dative-definite-genitive-plural":"junincuțelor","singular-vocative":"junincuță","plural-vocative":"junincuțelor"}},{"word":"junioară","pos":"noun","definitions":["female equivalent of junior"],"forms":{"plural":"junioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"junioară","accusative-definite-nominative-singular":"junioara","accusative-indefinite-nominative-plural":"junioare","accusative-definite-nominative-plural":"junioarele","dative-genitive-indefinite-singular":"junioare","dative-definite-genitive-singular":"junioarei","dative-genitive-indefinite-plural":"junioare","dative-definite-genitive-plural":"junioarelor","singular-vocative":"junioară","plural-vocative":"junioarelor"}},{"word":"junior","pos":"adj","definitions":["junior"],"forms":{"feminine-singular":"junioră","masculine-plural":"juniori","feminine-neuter-plural":"juniore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"junior","error-unrecognized-form-feminine-indefinite-singular":"junioră","error-unrecognized-form-indefinite-masculine-plural":"juniori","error-unrecognized-form-feminine-indefinite-neuter-plural":"juniore","definite-error-unrecognized-form-masculine-neuter-singular":"juniorul","definite-error-unrecognized-form-feminine-singular":"juniora","definite-error-unrecognized-form-masculine-plural":"juniorii","definite-error-unrecognized-form-feminine-neuter-plural":"juniorele"}},{"word":"junior","pos":"noun","definitions":["junior"],"forms":{"plural":"juniori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"junior","accusative-definite-nominative-singular":"juniorul","accusative-indefinite-nominative-plural":"juniori","accusative-definite-nominative-plural":"juniorii","dative-genitive-indefinite-singular":"junior","dative-definite-genitive-singular":"juniorului","dative-genitive-indefinite-plural":"juniori","dative-definite-genitive-plural":"juniorilor","singular-vocative":"juniorule","plural-vocative":"juniorilor"}},{"word":"juniorat","pos":"noun","definitions":["teenagehood"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"juniorat","accusative-definite-nominative":"junioratul","dative-genitive-indefinite":"juniorat","dative-definite-genitive":"junioratului","vocative":"junioratule"}},{"word":"junișan","pos":"noun","definitions":["bachelor"],"forms":{"plural":"junișani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"junișan","accusative-definite-nominative-singular":"junișanul","accusative-indefinite-nominative-plural":"junișani","accusative-definite-nominative-plural":"junișanii","dative-genitive-indefinite-singular":"junișan","dative-definite-genitive-singular":"junișanului","dative-genitive-indefinite-plural":"junișani","dative-definite-genitive-plural":"junișanilor","singular-vocative":"junișanule","plural-vocative":"junișanilor"}},{"word":"junișor","pos":"noun","definitions":["diminutive of june"],"forms":{"plural":"junișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"junișor","accusative-definite-nominative-singular":"junișorul","accusative-indefinite-nominative-plural":"junișori","accusative-definite-nominative-plural":"junișorii","dative-genitive-indefinite-singular":"junișor","dative-definite-genitive-singular":"junișorului","dative-genitive-indefinite-plural":"junișori","dative-definite-genitive-plural":"junișorilor","singular-vocative":"junișorule","plural-vocative":"junișorilor"}},{"word":"junt","pos":"noun","definitions":["gun, firearm"],"forms":{"plural":"junturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"junt","accusative-definite-nominative-singular":"juntul","accusative-indefinite-nominative-plural":"junturi","accusative-definite-nominative-plural":"junturile","dative-genitive-indefinite-singular":"junt","dative-definite-genitive-singular":"juntului","dative-genitive-indefinite-plural":"junturi","dative-definite-genitive-plural":"junturilor","singular-vocative":"juntule","plural-vocative":"junturilor"}},{"word":"juntă","pos":"noun","definitions":["junta"],"forms":{"plural":"junte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"juntă","accusative-definite-nominative-singular":"junta","accusative-indefinite-nominative-plural":"junte","accusative-definite-nominative-plural":"juntele","dative-genitive-indefinite-singular":"junte","dative-definite-genitive-singular":"juntei","dative-genitive-indefinite-plural":"junte","dative-definite-genitive-plural":"juntelor","singular-vocative":"juntă","plural-vocative":"juntelor"}},{"word":"jupă","pos":"noun","definitions":["skirt"],"pronunciation":"/ˈʒu.pə/","forms":{"plural":"jupe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jupă","accusative-definite-nominative-singular":"jupa","accusative-indefinite-nominative-plural":"jupe","accusative-definite-nominative-plural":"jupele","dative-genitive-indefinite-singular":"jupe","dative-definite-genitive-singular":"jupei","dative-genitive-indefinite-plural":"jupe","dative-definite-genitive-plural":"jupelor","singular-vocative":"jupă","plural-vocative":"jupelor"}},{"word":"jupăitură","pos":"noun","definitions":["beating, punching"],"forms":{"plural":"jupăituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jupăitură","accusative-definite-nominative-singular":"jupăitura","accusative-indefinite-nominative-plural":"jupăituri","accusative-definite-nominative-plural":"jupăiturile","dative-genitive-indefinite-singular":"jupăituri","dative-definite-genitive-singular":"jupăiturii","dative-genitive-indefinite-plural":"jupăituri","dative-definite-genitive-plural":"jupăiturilor","singular-vocative":"jupăitură","plural-vocative":"jupăiturilor"}},{"word":"jupan","pos":"noun","definitions":["medieval title in Wallachia and Moldavia"],"forms":{"plural":"jupani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jupan","accusative-definite-nominative-singular":"jupanul","accusative-indefinite-nominative-plural":"jupani","accusative-definite-nominative-plural":"jupanii","dative-genitive-indefinite-singular":"jupan","dative-definite-genitive-singular":"jupanului","dative-genitive-indefinite-plural":"jupani","dative-definite-genitive-plural":"jupanilor","singular-vocative":"jupanule","plural-vocative":"jupanilor"}},{"word":"jupân","pos":"noun","definitions":["master (a courtesy title for a boy)"],"forms":{"plural":"jupâni","feminine":"equivalent jupâneasă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jupân","accusative-definite-nominative-singular":"jupânul","accusative-indefinite-nominative-plural":"jupâni","accusative-definite-nominative-plural":"jupânii","dative-genitive-indefinite-singular":"jupân","dative-definite-genitive-singular":"jupânului","dative-genitive-indefinite-plural":"jupâni","dative-definite-genitive-plural":"jupânilor","singular-vocative":"jupânule","plural-vocative":"jupânilor"}},{"word":"jupână","pos":"noun","definitions":["female equivalent of jupân"],"forms":{"plural":"jupâne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jupână","accusative-definite-nominative-singular":"jupâna","accusative-indefinite-nominative-plural":"jupâne","accusative-definite-nominative-plural":"jupânele","dative-genitive-indefinite-singular":"jupâne","dative-definite-genitive-singular":"jupânei","dative-genitive-indefinite-plural":"jupâne","dative-definite-genitive-plural":"jupânelor","singular-vocative":"jupână","plural-vocative":"jupânelor"}},{"word":"Jupâneasa","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Bănița"],"gender":"f"},{"word":"jupâneasa","pos":"noun","definitions":["definite nominative/accusative singular of jupâneasă"]},{"word":"jupâneasă","pos":"noun","definitions":["female equivalent of jupân"],"forms":{"plural":"jupânese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jupâneasă","accusative-definite-nominative-singular":"jupâneasa","accusative-indefinite-nominative-plural":"jupânese","accusative-definite-nominative-plural":"jupânesele","dative-genitive-indefinite-singular":"jupânese","dative-definite-genitive-singular":"jupânesei","dative-genitive-indefinite-plural":"jupânese","dative-definite-genitive-plural":"jupâneselor","singular-vocative":"jupâneasă","plural-vocative":"jupâneselor"}},{"word":"jupâneșică","pos":"noun","definitions":["diminutive of jupâneasă; small female master"],"forms":{"plural":"jupâneșele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jupâneșică","accusative-definite-nominative-singular":"jupâneșica","accusative-indefinite-nominative-plural":"jupâneșice","accusative-definite-nominative-plural":"jupâneșicele","dative-genitive-indefinite-singular":"jupâneșice","dative-definite-genitive-singular":"jupâneșicei","dative-genitive-indefinite-plural":"jupâneșice","dative-definite-genitive-plural":"jupâneșicelor","singular-vocative":"jupâneșică","plural-vocative":"jupâneșicelor"}},{"word":"Jupânești","pos":"name","definitions":["a village in Coșești, Argeș County, Romania","a commune of Gorj County, Romania","a village in Jupânești, Gorj County, Romania","a village in Cireșu, Mehedinți County, Romania","a village in Făget, Timiș County, Romania"],"gender":"m"},{"word":"Jupani","pos":"name","definitions":["a village in Traian Vuia, Timiș County, Romania"],"gender":"m"},{"word":"jupaniță","pos":"noun","definitions":["wife of a jupan"],"forms":{"plural":"jupanițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jupaniță","accusative-definite-nominative-singular":"jupanița","accusative-indefinite-nominative-plural":"jupanițe","accusative-definite-nominative-plural":"jupanițele","dative-genitive-indefinite-singular":"jupanițe","dative-definite-genitive-singular":"jupaniței","dative-genitive-indefinite-plural":"jupanițe","dative-definite-genitive-plural":"jupanițelor","singular-vocative":"jupaniță","plural-vocative":"jupanițelor"}},{"word":"jupâniță","pos":"noun","definitions":["female equivalent of jupân"],"forms":{"plural":"jupânițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jupâniță","accusative-definite-nominative-singular":"jupânița","accusative-indefinite-nominative-plural":"jupânițe","accusative-definite-nominative-plural":"jupânițele","dative-genitive-indefinite-singular":"jupânițe","dative-definite-genitive-singular":"jupâniței","dative-genitive-indefinite-plural":"jupânițe","dative-definite-genitive-plural":"jupânițelor","singular-vocative":"jupâniță","plural-vocative":"jupânițelor"}},{"word":"Jupânu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jupânu"}},{"word":"jupi","pos":"verb","definitions":["alternative form of jupui"],"forms":{"canonical":"a jupi 4th conjugation","present-singular-third-person":"jupește","participle-past":"jupit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jupi","gerund":"jupind","first-person-indicative-present-singular":"jupesc","indicative-present-second-person-singular":"jupești","indicative-present-singular-third-person":"jupește","first-person-indicative-plural-present":"jupim","indicative-plural-present-second-person":"jupiți","indicative-plural-present-third-person":"jupesc","first-person-imperfect-indicative-singular":"jupeam","imperfect-indicative-second-person-singular":"jupeai","imperfect-indicative-singular-third-person":"jupea","first-person-imperfect-indicative-plural":"jupeam","imperfect-indicative-plural-second-person":"jupeați","imperfect-indicative-plural-third-person":"jupeau","first-person-indicative-perfect-singular":"jupii","indicative-perfect-second-person-singular":"jupiși","indicative-perfect-singular-third-person":"jupi","first-person-indicative-perfect-plural":"jupirăm","indicative-perfect-plural-second-person":"jupirăți","indicative-perfect-plural-third-person":"jupiră","first-person-indicative-pluperfect-singular":"jupisem","indicative-pluperfect-second-person-singular":"jupiseși","indicative-pluperfect-singular-third-person":"jupise","first-person-indicative-pluperfect-plural":"jupiserăm","indicative-pluperfect-plural-second-person":"jupiserăți","indicative-pluperfect-plural-third-person":"jupiseră","first-person-present-singular-subjunctive":"să jupesc","present-second-person-singular-subjunctive":"să jupești","present-singular-subjunctive-third-person":"să jupească","first-person-plural-present-subjunctive":"să jupim","plural-present-second-person-subjunctive":"să jupiți","plural-present-subjunctive-third-person":"să jupească","imperative-second-person-singular":"jupește","imperative-plural-second-person":"jupiți","imperative-negative-second-person-singular":"nu jupi","imperative-negative-plural-second-person":"nu jupiți"}},{"word":"Jupînese","pos":"name","definitions":["a village in Hunedoara County, Romania. Renamed to Peștera in 1964."],"gender":"f-p"},{"word":"jupire","pos":"noun","definitions":["alternative form of jupuire"],"forms":{"plural":"jupiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jupire","accusative-definite-nominative-singular":"jupirea","accusative-indefinite-nominative-plural":"jupiri","accusative-definite-nominative-plural":"jupirile","dative-genitive-indefinite-singular":"jupiri","dative-definite-genitive-singular":"jupirii","dative-genitive-indefinite-plural":"jupiri","dative-definite-genitive-plural":"jupirilor","singular-vocative":"jupire","plural-vocative":"jupirilor"}},{"word":"jupit","pos":"adj","definitions":["alternative form of jupuit"],"forms":{"feminine-singular":"jupită","masculine-plural":"jupiți","feminine-neuter-plural":"jupite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jupit","error-unrecognized-form-feminine-indefinite-singular":"jupită","error-unrecognized-form-indefinite-masculine-plural":"jupiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jupite","definite-error-unrecognized-form-masculine-neuter-singular":"jupitul","definite-error-unrecognized-form-feminine-singular":"jupita","definite-error-unrecognized-form-masculine-plural":"jupiții","definite-error-unrecognized-form-feminine-neuter-plural":"jupitele"}},{"word":"Jupiter","pos":"name","definitions":["Jupiter (planet)"],"gender":"m"},{"word":"jupitoare","pos":"noun","definitions":["female equivalent of jupitor"],"forms":{"plural":"jupitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"jupitoare","accusative-definite-nominative-singular":"jupitoarea","accusative-indefinite-nominative-plural":"jupitoare","accusative-definite-nominative-plural":"jupitoarele","dative-genitive-indefinite-singular":"jupitoare","dative-definite-genitive-singular":"jupitoarei","dative-genitive-indefinite-plural":"jupitoare","dative-definite-genitive-plural":"jupitoarelor","singular-vocative":"jupitoare","plural-vocative":"jupitoarelor"}},{"word":"jupitor","pos":"noun","definitions":["alternative form of jupuitor"],"forms":{"plural":"jupitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jupitor","accusative-definite-nominative-singular":"jupitorul","accusative-indefinite-nominative-plural":"jupitori","accusative-definite-nominative-plural":"jupitorii","dative-genitive-indefinite-singular":"jupitor","dative-definite-genitive-singular":"jupitorului","dative-genitive-indefinite-plural":"jupitori","dative-definite-genitive-plural":"jupitorilor","singular-vocative":"jupitorule","plural-vocative":"jupitorilor"}},{"word":"jupon","pos":"noun","definitions":["underskirt, petticoat, jupon"],"forms":{"plural":"jupoane"}},{"word":"jupui","pos":"verb","definitions":["to skin, to peel, to flay"],"pronunciation":"/ʒu.puˈi/","forms":{"canonical":"a jupui 4th conjugation","present-singular-third-person":"jupoaie","participle-past":"jupuit","subjunctive-third-person":"jupoaie","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a jupui","gerund":"jupuind","first-person-indicative-present-singular":"jupoi","indicative-present-second-person-singular":"jupoi","indicative-present-singular-third-person":"jupoaie","first-person-indicative-plural-present":"jupuim","indicative-plural-present-second-person":"jupuiți","indicative-plural-present-third-person":"jupoaie","first-person-imperfect-indicative-singular":"jupuiam","imperfect-indicative-second-person-singular":"jupuiai","imperfect-indicative-singular-third-person":"jupuia","first-person-imperfect-indicative-plural":"jupuiam","imperfect-indicative-plural-second-person":"jupuiați","imperfect-indicative-plural-third-person":"jupuiau","first-person-indicative-perfect-singular":"jupuii","indicative-perfect-second-person-singular":"jupuiși","indicative-perfect-singular-third-person":"jupui","first-person-indicative-perfect-plural":"jupuirăm","indicative-perfect-plural-second-person":"jupuirăți","indicative-perfect-plural-third-person":"jupuiră","first-person-indicative-pluperfect-singular":"jupuisem","indicative-pluperfect-second-person-singular":"jupuiseși","indicative-pluperfect-singular-third-person":"jupuise","first-person-indicative-pluperfect-plural":"jupuiserăm","indicative-pluperfect-plural-second-person":"jupuiserăți","indicative-pluperfect-plural-third-person":"jupuiseră","first-person-present-singular-subjunctive":"să jupoi","present-second-person-singular-subjunctive":"să jupoi","present-singular-subjunctive-third-person":"să jupoaie","first-person-plural-present-subjunctive":"să jupuim","plural-present-second-person-subjunctive":"să jupuiți","plural-present-subjunctive-third-person":"să jupoaie","imperative-second-person-singular":"jupoaie","imperative-plural-second-person":"jupuiți","imperative-negative-second-person-singular":"nu jupui","imperative-negative-plural-second-person":"nu jupuiți","alternative":"jupi"}},{"word":"jupuială","pos":"noun","definitions":["excoriation"],"forms":{"plural":"jupuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jupuială","accusative-definite-nominative-singular":"jupuiala","accusative-indefinite-nominative-plural":"jupuieli","accusative-definite-nominative-plural":"jupuielile","dative-genitive-indefinite-singular":"jupuieli","dative-definite-genitive-singular":"jupuielii","dative-genitive-indefinite-plural":"jupuieli","dative-definite-genitive-plural":"jupuielilor","singular-vocative":"jupuială","plural-vocative":"jupuielilor"}},{"word":"jupuire","pos":"noun","definitions":["skinning"],"forms":{"plural":"jupuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jupuire","accusative-definite-nominative-singular":"jupuirea","accusative-indefinite-nominative-plural":"jupuiri","accusative-definite-nominative-plural":"jupuirile","dative-genitive-indefinite-singular":"jupuiri","dative-definite-genitive-singular":"jupuirii","dative-genitive-indefinite-plural":"jupuiri","dative-definite-genitive-plural":"jupuirilor","singular-vocative":"jupuire","plural-vocative":"jupuirilor"}},{"word":"jupuit","pos":"adj","definitions":["skinned"],"forms":{"feminine-singular":"jupuită","masculine-plural":"jupuiți","feminine-neuter-plural":"jupuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jupuit","error-unrecognized-form-feminine-indefinite-singular":"jupuită","error-unrecognized-form-indefinite-masculine-plural":"jupuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"jupuite","definite-error-unrecognized-form-masculine-neuter-singular":"jupuitul","definite-error-unrecognized-form-feminine-singular":"jupuita","definite-error-unrecognized-form-masculine-plural":"jupuiții","definite-error-unrecognized-form-feminine-neuter-plural":"jupuitele"}},{"word":"jupuitoare","pos":"noun","definitions":["female equivalent of jupuitor"],"forms":{"plural":"jupuitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"jupuitoare","accusative-definite-nominative-singular":"jupuitoarea","accusative-indefinite-nominative-plural":"jupuitoare","accusative-definite-nominative-plural":"jupuitoarele","dative-genitive-indefinite-singular":"jupuitoare","dative-definite-genitive-singular":"jupuitoarei","dative-genitive-indefinite-plural":"jupuitoare","dative-definite-genitive-plural":"jupuitoarelor","singular-vocative":"jupuitoare","plural-vocative":"jupuitoarelor"}},{"word":"jupuitor","pos":"noun","definitions":["flayer"],"forms":{"plural":"jupuitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jupuitor","accusative-definite-nominative-singular":"jupuitorul","accusative-indefinite-nominative-plural":"jupuitori","accusative-definite-nominative-plural":"jupuitorii","dative-genitive-indefinite-singular":"jupuitor","dative-definite-genitive-singular":"jupuitorului","dative-genitive-indefinite-plural":"jupuitori","dative-definite-genitive-plural":"jupuitorilor","singular-vocative":"jupuitorule","plural-vocative":"jupuitorilor"}},{"word":"jupuitură","pos":"noun","definitions":["scratch"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"jupuitură","accusative-definite-nominative":"jupuitura","dative-genitive-indefinite":"jupuiture","dative-definite-genitive":"jupuiturei","vocative":"jupuitură"}},{"word":"jur","pos":"noun","definitions":["surroundings, vicinity"],"pronunciation":"/ʒur/","forms":{"plural":"jururi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jur","accusative-definite-nominative-singular":"jurul","accusative-indefinite-nominative-plural":"jururi","accusative-definite-nominative-plural":"jururile","dative-genitive-indefinite-singular":"jur","dative-definite-genitive-singular":"jurului","dative-genitive-indefinite-plural":"jururi","dative-definite-genitive-plural":"jururilor","singular-vocative":"jurule","plural-vocative":"jururilor"}},{"word":"jur","pos":"noun","definitions":["oath"],"pronunciation":"/ʒur/","forms":{"plural":"jururi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jur","accusative-definite-nominative-singular":"jurul","accusative-indefinite-nominative-plural":"jururi","accusative-definite-nominative-plural":"jururile","dative-genitive-indefinite-singular":"jur","dative-definite-genitive-singular":"jurului","dative-genitive-indefinite-plural":"jururi","dative-definite-genitive-plural":"jururilor","singular-vocative":"jurule","plural-vocative":"jururilor"}},{"word":"jur","pos":"verb","definitions":["first-person singular present indicative/subjunctive of jura"],"pronunciation":"/ʒur/"},{"word":"Jura","pos":"name","definitions":["a village in Jura, Transnistria, Moldova","a commune of Transnistria, Moldova"],"gender":"f"},{"word":"jura","pos":"verb","definitions":["to swear; to vow","to swear up and down"],"pronunciation":"/ʒuˈra/","forms":{"canonical":"a jura 1st conjugation","present-singular-third-person":"jură","participle-past":"jurat","subjunctive-third-person":"jure","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a jura","gerund":"jurând","first-person-indicative-present-singular":"jur","indicative-present-second-person-singular":"juri","indicative-present-singular-third-person":"jură","first-person-indicative-plural-present":"jurăm","indicative-plural-present-second-person":"jurați","indicative-plural-present-third-person":"jură","first-person-imperfect-indicative-singular":"juram","imperfect-indicative-second-person-singular":"jurai","imperfect-indicative-singular-third-person":"jura","first-person-imperfect-indicative-plural":"juram","imperfect-indicative-plural-second-person":"jurați","imperfect-indicative-plural-third-person":"jurau","first-person-indicative-perfect-singular":"jurai","indicative-perfect-second-person-singular":"jurași","indicative-perfect-singular-third-person":"jură","first-person-indicative-perfect-plural":"jurarăm","indicative-perfect-plural-second-person":"jurarăți","indicative-perfect-plural-third-person":"jurară","first-person-indicative-pluperfect-singular":"jurasem","indicative-pluperfect-second-person-singular":"juraseși","indicative-pluperfect-singular-third-person":"jurase","first-person-indicative-pluperfect-plural":"juraserăm","indicative-pluperfect-plural-second-person":"juraserăți","indicative-pluperfect-plural-third-person":"juraseră","first-person-present-singular-subjunctive":"să jur","present-second-person-singular-subjunctive":"să juri","present-singular-subjunctive-third-person":"să jure","first-person-plural-present-subjunctive":"să jurăm","plural-present-second-person-subjunctive":"să jurați","plural-present-subjunctive-third-person":"să jure","imperative-second-person-singular":"jură","imperative-plural-second-person":"jurați","imperative-negative-second-person-singular":"nu jura","imperative-negative-plural-second-person":"nu jurați"}},{"word":"jură","pos":"verb","definitions":["third-person singular simple perfect indicative of jura"]},{"word":"jurai","pos":"verb","definitions":["inflection of jura:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[ʒuˈraj]"},{"word":"juram","pos":"verb","definitions":["first-person singular/plural imperfect indicative of jura"],"pronunciation":"[ʒuˈram]"},{"word":"jurământ","pos":"noun","definitions":["oath, vow"],"pronunciation":"/ʒurəˈmɨnt/","forms":{"plural":"jurăminte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jurământ","accusative-definite-nominative-singular":"jurământul","accusative-indefinite-nominative-plural":"jurăminte","accusative-definite-nominative-plural":"jurămintele","dative-genitive-indefinite-singular":"jurământ","dative-definite-genitive-singular":"jurământului","dative-genitive-indefinite-plural":"jurăminte","dative-definite-genitive-plural":"jurămintelor","singular-vocative":"jurământule","plural-vocative":"jurămintelor","alternative-archaic":"jurămînt"}},{"word":"jurăminte","pos":"noun","definitions":["plural of jurământ"],"pronunciation":"/ʒurəˈminte/","gender":"n-p"},{"word":"jurare","pos":"noun","definitions":["swearing, vowing"],"pronunciation":"/ʒuˈra.re/","forms":{"plural":"jurări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jurare","accusative-definite-nominative-singular":"jurarea","accusative-indefinite-nominative-plural":"jurări","accusative-definite-nominative-plural":"jurările","dative-genitive-indefinite-singular":"jurări","dative-definite-genitive-singular":"jurării","dative-genitive-indefinite-plural":"jurări","dative-definite-genitive-plural":"jurărilor","singular-vocative":"jurare","plural-vocative":"jurărilor"}},{"word":"Jurăscu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jurăscu"}},{"word":"jurase","pos":"verb","definitions":["third-person singular pluperfect indicative of jura"],"pronunciation":"[ʒuˈrase]"},{"word":"jurasic","pos":"noun","definitions":["Jurassic"],"forms":{"plural":"jurasici","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jurasic","accusative-definite-nominative-singular":"jurasicul","accusative-indefinite-nominative-plural":"jurasici","accusative-definite-nominative-plural":"jurasicile","dative-genitive-indefinite-singular":"jurasic","dative-definite-genitive-singular":"jurasicului","dative-genitive-indefinite-plural":"jurasici","dative-definite-genitive-plural":"jurasicilor","singular-vocative":"jurasicule","plural-vocative":"jurasicilor"}},{"word":"Jurat","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jurat"}},{"word":"jurat","pos":"verb","definitions":["vowed, swore","past participle of jura"],"pronunciation":"/ʒuˈrat/","forms":{"participle-past":"of jura","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"jurat","error-unrecognized-form-feminine-indefinite-singular":"jurată","error-unrecognized-form-indefinite-masculine-plural":"jurați","error-unrecognized-form-feminine-indefinite-neuter-plural":"jurate","definite-error-unrecognized-form-masculine-neuter-singular":"juratul","definite-error-unrecognized-form-feminine-singular":"jurata","definite-error-unrecognized-form-masculine-plural":"jurații","definite-error-unrecognized-form-feminine-neuter-plural":"juratele"}},{"word":"jurat","pos":"noun","definitions":["juror, member of a jury"],"pronunciation":"/ʒuˈrat/","forms":{"plural":"jurați"}},{"word":"jurățel","pos":"noun","definitions":["subprefect"],"forms":{"plural":"jurăței","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jurățel","accusative-definite-nominative-singular":"jurățelul","accusative-indefinite-nominative-plural":"jurăței","accusative-definite-nominative-plural":"jurățeii","dative-genitive-indefinite-singular":"jurățel","dative-definite-genitive-singular":"jurățelului","dative-genitive-indefinite-plural":"jurăței","dative-definite-genitive-plural":"jurățeilor","singular-vocative":"jurățelule","plural-vocative":"jurățeilor"}},{"word":"jurătoare","pos":"noun","definitions":["female equivalent of jurător"],"forms":{"plural":"jurătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"jurătoare","accusative-definite-nominative-singular":"jurătoarea","accusative-indefinite-nominative-plural":"jurătoare","accusative-definite-nominative-plural":"jurătoarele","dative-genitive-indefinite-singular":"jurătoare","dative-definite-genitive-singular":"jurătoarei","dative-genitive-indefinite-plural":"jurătoare","dative-definite-genitive-plural":"jurătoarelor","singular-vocative":"jurătoare","plural-vocative":"jurătoarelor"}},{"word":"jurător","pos":"noun","definitions":["one who testifies under oath as a witness in a judicial proceeding","one who swears an oath"],"forms":{"plural":"jurători"}},{"word":"Juratu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Juratu"}},{"word":"jurătură","pos":"noun","definitions":["profanity"],"forms":{"plural":"jurături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"jurătură","accusative-definite-nominative-singular":"jurătura","accusative-indefinite-nominative-plural":"jurături","accusative-definite-nominative-plural":"jurăturile","dative-genitive-indefinite-singular":"jurături","dative-definite-genitive-singular":"jurăturii","dative-genitive-indefinite-plural":"jurături","dative-definite-genitive-plural":"jurăturilor","singular-vocative":"jurătură","plural-vocative":"jurăturilor"}},{"word":"Jurchescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Jurchescu"}},{"word":"Jurcuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jurcuț"}},{"word":"jure","pos":"verb","definitions":["third-person singular/plural present subjunctive of jura"],"pronunciation":"[ˈʒure]"},{"word":"Jurești","pos":"name","definitions":["a village in Bârna, Timiș County, Romania"],"gender":"m"},{"word":"juri","pos":"verb","definitions":["second-person singular present indicative/subjunctive of jura"],"pronunciation":"[ʒurʲ]"},{"word":"juridic","pos":"adj","definitions":["legal"],"forms":{"feminine-singular":"juridică","masculine-plural":"juridici","feminine-neuter-plural":"juridice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"juridic","error-unrecognized-form-feminine-indefinite-singular":"juridică","error-unrecognized-form-indefinite-masculine-plural":"juridici","error-unrecognized-form-feminine-indefinite-neuter-plural":"juridice","definite-error-unrecognized-form-masculine-neuter-singular":"juridicul","definite-error-unrecognized-form-feminine-singular":"juridica","definite-error-unrecognized-form-masculine-plural":"juridicii","definite-error-unrecognized-form-feminine-neuter-plural":"juridicele"}},{"word":"juridicește","pos":"adv","definitions":["legally"]},{"word":"juridicțiune","pos":"noun","definitions":["obsolete form of jurisdicție"],"forms":{"plural":"juridicțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"juridicțiune","accusative-definite-nominative-singular":"juridicțiunea","accusative-indefinite-nominative-plural":"juridicțiuni","accusative-definite-nominative-plural":"juridicțiunile","dative-genitive-indefinite-singular":"juridicțiuni","dative-definite-genitive-singular":"juridicțiunii","dative-genitive-indefinite-plural":"juridicțiuni","dative-definite-genitive-plural":"juridicțiunilor","singular-vocative":"juridicțiune","plural-vocative":"juridicțiunilor"}},{"word":"Jurilovca","pos":"name","definitions":["a village in Tulcea County, Dobruja, in eastern Romania"],"gender":"f"},{"word":"jurisconsult","pos":"noun","definitions":["jurisconsult"],"forms":{"plural":"jurisconsulți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jurisconsult","accusative-definite-nominative-singular":"jurisconsultul","accusative-indefinite-nominative-plural":"jurisconsulți","accusative-definite-nominative-plural":"jurisconsulții","dative-genitive-indefinite-singular":"jurisconsult","dative-definite-genitive-singular":"jurisconsultului","dative-genitive-indefinite-plural":"jurisconsulți","dative-definite-genitive-plural":"jurisconsulților","singular-vocative":"jurisconsultule","plural-vocative":"jurisconsulților"}},{"word":"jurisconsultă","pos":"noun","definitions":["female equivalent of jurisconsult"],"forms":{"plural":"jurisconsulte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jurisconsultă","accusative-definite-nominative-singular":"jurisconsulta","accusative-indefinite-nominative-plural":"jurisconsulte","accusative-definite-nominative-plural":"jurisconsultele","dative-genitive-indefinite-singular":"jurisconsulte","dative-definite-genitive-singular":"jurisconsultei","dative-genitive-indefinite-plural":"jurisconsulte","dative-definite-genitive-plural":"jurisconsultelor","singular-vocative":"jurisconsultă","plural-vocative":"jurisconsultelor"}},{"word":"jurisdicție","pos":"noun","definitions":["jurisdiction"],"pronunciation":"/ʒu.risˈdik.t͡si.e/","forms":{"plural":"jurisdicții","alternative-dated":"jurisdicțiune"}},{"word":"jurisdicții","pos":"noun","definitions":["plural of jurisdicție"],"gender":"f"},{"word":"jurisdicțional","pos":"adj","definitions":["jurisdictional"],"forms":{"feminine-singular":"jurisdicțională","masculine-plural":"jurisdicționali","feminine-neuter-plural":"jurisdicționale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jurisdicțional","error-unrecognized-form-feminine-indefinite-singular":"jurisdicțională","error-unrecognized-form-indefinite-masculine-plural":"jurisdicționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"jurisdicționale","definite-error-unrecognized-form-masculine-neuter-singular":"jurisdicționalul","definite-error-unrecognized-form-feminine-singular":"jurisdicționala","definite-error-unrecognized-form-masculine-plural":"jurisdicționalii","definite-error-unrecognized-form-feminine-neuter-plural":"jurisdicționalele"}},{"word":"jurisdicțiune","pos":"noun","definitions":["obsolete form of jurisdicție"],"forms":{"plural":"jurisdicțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jurisdicțiune","accusative-definite-nominative-singular":"jurisdicțiunea","accusative-indefinite-nominative-plural":"jurisdicțiuni","accusative-definite-nominative-plural":"jurisdicțiunile","dative-genitive-indefinite-singular":"jurisdicțiuni","dative-definite-genitive-singular":"jurisdicțiunii","dative-genitive-indefinite-plural":"jurisdicțiuni","dative-definite-genitive-plural":"jurisdicțiunilor","singular-vocative":"jurisdicțiune","plural-vocative":"jurisdicțiunilor"}},{"word":"jurisdicțiuni","pos":"noun","definitions":["plural of jurisdicțiune"],"gender":"f"},{"word":"jurisprudență","pos":"noun","definitions":["jurisprudence"],"forms":{"plural":"jurisprudențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jurisprudență","accusative-definite-nominative-singular":"jurisprudența","accusative-indefinite-nominative-plural":"jurisprudențe","accusative-definite-nominative-plural":"jurisprudențele","dative-genitive-indefinite-singular":"jurisprudențe","dative-definite-genitive-singular":"jurisprudenței","dative-genitive-indefinite-plural":"jurisprudențe","dative-definite-genitive-plural":"jurisprudențelor","singular-vocative":"jurisprudență","plural-vocative":"jurisprudențelor"}},{"word":"jurisprudențial","pos":"adj","definitions":["jurisprudential"],"forms":{"feminine-singular":"jurisprudențială","masculine-plural":"jurisprudențiali","feminine-neuter-plural":"jurisprudențiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jurisprudențial","error-unrecognized-form-feminine-indefinite-singular":"jurisprudențială","error-unrecognized-form-indefinite-masculine-plural":"jurisprudențiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"jurisprudențiale","definite-error-unrecognized-form-masculine-neuter-singular":"jurisprudențialul","definite-error-unrecognized-form-feminine-singular":"jurisprudențiala","definite-error-unrecognized-form-masculine-plural":"jurisprudențialii","definite-error-unrecognized-form-feminine-neuter-plural":"jurisprudențialele"}},{"word":"jurist","pos":"noun","definitions":["jurist","a law student"],"pronunciation":"/ʒuˈrist/","forms":{"plural":"juriști","feminine":"equivalent juristă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jurist","accusative-definite-nominative-singular":"juristul","accusative-indefinite-nominative-plural":"juriști","accusative-definite-nominative-plural":"juriștii","dative-genitive-indefinite-singular":"jurist","dative-definite-genitive-singular":"juristului","dative-genitive-indefinite-plural":"juriști","dative-definite-genitive-plural":"juriștilor","singular-vocative":"juristule","plural-vocative":"juriștilor"}},{"word":"jurista","pos":"noun","definitions":["definite nominative/accusative singular of juristă"]},{"word":"juristă","pos":"noun","definitions":["female equivalent of jurist"],"pronunciation":"/ʒuˈris.tə/","forms":{"plural":"juriste","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"juristă","accusative-definite-nominative-singular":"jurista","accusative-indefinite-nominative-plural":"juriste","accusative-definite-nominative-plural":"juristele","dative-genitive-indefinite-singular":"juriste","dative-definite-genitive-singular":"juristei","dative-genitive-indefinite-plural":"juriste","dative-definite-genitive-plural":"juristelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"juriste","pos":"noun","definitions":["plural of juristă"],"gender":"f-p"},{"word":"juriști","pos":"noun","definitions":["plural of jurist"],"gender":"m"},{"word":"juriu","pos":"noun","definitions":["jury","panel"],"forms":{"plural":"jurii"}},{"word":"juriza","pos":"verb","definitions":["to jury"],"forms":{"canonical":"a juriza 1st conjugation","present-singular-third-person":"jurizează","participle-past":"jurizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a juriza","gerund":"jurizând","first-person-indicative-present-singular":"jurizez","indicative-present-second-person-singular":"jurizezi","indicative-present-singular-third-person":"jurizează","first-person-indicative-plural-present":"jurizăm","indicative-plural-present-second-person":"jurizați","indicative-plural-present-third-person":"jurizează","first-person-imperfect-indicative-singular":"jurizam","imperfect-indicative-second-person-singular":"jurizai","imperfect-indicative-singular-third-person":"juriza","first-person-imperfect-indicative-plural":"jurizam","imperfect-indicative-plural-second-person":"jurizați","imperfect-indicative-plural-third-person":"jurizau","first-person-indicative-perfect-singular":"jurizai","indicative-perfect-second-person-singular":"jurizași","indicative-perfect-singular-third-person":"juriză","first-person-indicative-perfect-plural":"jurizarăm","indicative-perfect-plural-second-person":"jurizarăți","indicative-perfect-plural-third-person":"jurizară","first-person-indicative-pluperfect-singular":"jurizasem","indicative-pluperfect-second-person-singular":"jurizaseși","indicative-pluperfect-singular-third-person":"jurizase","first-person-indicative-pluperfect-plural":"jurizaserăm","indicative-pluperfect-plural-second-person":"jurizaserăți","indicative-pluperfect-plural-third-person":"jurizaseră","first-person-present-singular-subjunctive":"să jurizez","present-second-person-singular-subjunctive":"să jurizezi","present-singular-subjunctive-third-person":"să jurizeze","first-person-plural-present-subjunctive":"să jurizăm","plural-present-second-person-subjunctive":"să jurizați","plural-present-subjunctive-third-person":"să jurizeze","imperative-second-person-singular":"jurizează","imperative-plural-second-person":"jurizați","imperative-negative-second-person-singular":"nu juriza","imperative-negative-plural-second-person":"nu jurizați"}},{"word":"jurizare","pos":"noun","definitions":["jurying"],"forms":{"plural":"jurizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"jurizare","accusative-definite-nominative-singular":"jurizarea","accusative-indefinite-nominative-plural":"jurizări","accusative-definite-nominative-plural":"jurizările","dative-genitive-indefinite-singular":"jurizări","dative-definite-genitive-singular":"jurizării","dative-genitive-indefinite-plural":"jurizări","dative-definite-genitive-plural":"jurizărilor","singular-vocative":"jurizare","plural-vocative":"jurizărilor"}},{"word":"Jurjică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jurjică"}},{"word":"jurnal","pos":"noun","definitions":["journal","diary"],"forms":{"plural":"jurnale","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jurnal","accusative-definite-nominative-singular":"jurnalul","accusative-indefinite-nominative-plural":"jurnale","accusative-definite-nominative-plural":"jurnalele","dative-genitive-indefinite-singular":"jurnal","dative-definite-genitive-singular":"jurnalului","dative-genitive-indefinite-plural":"jurnale","dative-definite-genitive-plural":"jurnalelor","singular-vocative":"jurnalule","plural-vocative":"jurnalelor"}},{"word":"jurnal de bord","pos":"noun","definitions":["logbook"],"forms":{"plural":"jurnale de bord"}},{"word":"jurnalier","pos":"adj","definitions":["daily"],"forms":{"feminine-singular":"jurnalieră","masculine-plural":"jurnalieri","feminine-neuter-plural":"jurnaliere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jurnalier","error-unrecognized-form-feminine-indefinite-singular":"jurnalieră","error-unrecognized-form-indefinite-masculine-plural":"jurnalieri","error-unrecognized-form-feminine-indefinite-neuter-plural":"jurnaliere","definite-error-unrecognized-form-masculine-neuter-singular":"jurnalierul","definite-error-unrecognized-form-feminine-singular":"jurnaliera","definite-error-unrecognized-form-masculine-plural":"jurnalierii","definite-error-unrecognized-form-feminine-neuter-plural":"jurnalierele"}},{"word":"jurnalism","pos":"noun","definitions":["journalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"jurnalism","accusative-definite-nominative-singular":"jurnalismul","accusative-indefinite-nominative-plural":"jurnalisme","accusative-definite-nominative-plural":"jurnalismele","dative-genitive-indefinite-singular":"jurnalism","dative-definite-genitive-singular":"jurnalismului","dative-genitive-indefinite-plural":"jurnalisme","dative-definite-genitive-plural":"jurnalismelor","singular-vocative":"jurnalismule","plural-vocative":"jurnalismelor"}},{"word":"jurnalist","pos":"noun","definitions":["journalist"],"forms":{"plural":"jurnaliști","feminine":"equivalent jurnalistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"jurnalist","accusative-definite-nominative-singular":"jurnalistul","accusative-indefinite-nominative-plural":"jurnaliști","accusative-definite-nominative-plural":"jurnaliștii","dative-genitive-indefinite-singular":"jurnalist","dative-definite-genitive-singular":"jurnalistului","dative-genitive-indefinite-plural":"jurnaliști","dative-definite-genitive-plural":"jurnaliștilor","singular-vocative":"jurnalistule","plural-vocative":"jurnaliștilor"}},{"word":"jurnalist sportiv","pos":"noun","definitions":["sports writer"],"forms":{"plural":"jurnaliști sportivi"}},{"word":"jurnalistă","pos":"noun","definitions":["female equivalent of jurnalist"],"forms":{"plural":"jurnaliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"jurnalistă","accusative-definite-nominative-singular":"jurnalista","accusative-indefinite-nominative-plural":"jurnaliste","accusative-definite-nominative-plural":"jurnalistele","dative-genitive-indefinite-singular":"jurnaliste","dative-definite-genitive-singular":"jurnalistei","dative-genitive-indefinite-plural":"jurnaliste","dative-definite-genitive-plural":"jurnalistelor","singular-vocative":"jurnalistă","plural-vocative":"jurnalistelor"}},{"word":"jurnalistic","pos":"adj","definitions":["journalistic"],"forms":{"feminine-singular":"jurnalistică","masculine-plural":"jurnalistici","feminine-neuter-plural":"jurnalistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"jurnalistic","error-unrecognized-form-feminine-indefinite-singular":"jurnalistică","error-unrecognized-form-indefinite-masculine-plural":"jurnalistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"jurnalistice","definite-error-unrecognized-form-masculine-neuter-singular":"jurnalisticul","definite-error-unrecognized-form-feminine-singular":"jurnalistica","definite-error-unrecognized-form-masculine-plural":"jurnalisticii","definite-error-unrecognized-form-feminine-neuter-plural":"jurnalisticele"}},{"word":"jurnalistică","pos":"noun","definitions":["journalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"jurnalistică","accusative-definite-nominative":"jurnalistica","dative-genitive-indefinite":"jurnalistici","dative-definite-genitive":"jurnalisticii","vocative":"jurnalistică"}},{"word":"Jurubiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Jurubiță"}},{"word":"jurui","pos":"verb","definitions":["to promise solemnly"],"forms":{"canonical":"a jurui 4th conjugation","present-singular-third-person":"juruiește","participle-past":"juruit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a jurui","gerund":"juruind","first-person-indicative-present-singular":"juruiesc","indicative-present-second-person-singular":"juruiești","indicative-present-singular-third-person":"juruiește","first-person-indicative-plural-present":"juruim","indicative-plural-present-second-person":"juruiți","indicative-plural-present-third-person":"juruiesc","first-person-imperfect-indicative-singular":"juruiam","imperfect-indicative-second-person-singular":"juruiai","imperfect-indicative-singular-third-person":"juruia","first-person-imperfect-indicative-plural":"juruiam","imperfect-indicative-plural-second-person":"juruiați","imperfect-indicative-plural-third-person":"juruiau","first-person-indicative-perfect-singular":"juruii","indicative-perfect-second-person-singular":"juruiși","indicative-perfect-singular-third-person":"jurui","first-person-indicative-perfect-plural":"juruirăm","indicative-perfect-plural-second-person":"juruirăți","indicative-perfect-plural-third-person":"juruiră","first-person-indicative-pluperfect-singular":"juruisem","indicative-pluperfect-second-person-singular":"juruiseși","indicative-pluperfect-singular-third-person":"juruise","first-person-indicative-pluperfect-plural":"juruiserăm","indicative-pluperfect-plural-second-person":"juruiserăți","indicative-pluperfect-plural-third-person":"juruiseră","first-person-present-singular-subjunctive":"să juruiesc","present-second-person-singular-subjunctive":"să juruiești","present-singular-subjunctive-third-person":"să juruiască","first-person-plural-present-subjunctive":"să juruim","plural-present-second-person-subjunctive":"să juruiți","plural-present-subjunctive-third-person":"să juruiască","imperative-second-person-singular":"juruiește","imperative-plural-second-person":"juruiți","imperative-negative-second-person-singular":"nu jurui","imperative-negative-plural-second-person":"nu juruiți"}},{"word":"juruință","pos":"noun","definitions":["oath"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"juruință","accusative-definite-nominative":"juruința","dative-genitive-indefinite":"juruințe","dative-definite-genitive":"juruinței","vocative":"juruință"}},{"word":"juruită","pos":"noun","definitions":["promise"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"juruită","accusative-definite-nominative-singular":"juruita","accusative-indefinite-nominative-plural":"juruite","accusative-definite-nominative-plural":"juruitele","dative-genitive-indefinite-singular":"juruite","dative-definite-genitive-singular":"juruitei","dative-genitive-indefinite-plural":"juruite","dative-definite-genitive-plural":"juruitelor","singular-vocative":"juruită","plural-vocative":"juruitelor"}},{"word":"jurul","pos":"noun","definitions":["definite nominative/accusative singular of jur"]},{"word":"jurului","pos":"noun","definitions":["definite dative/genitive singular of jur"]},{"word":"jururi","pos":"noun","definitions":["plural of jur"]},{"word":"jururile","pos":"noun","definitions":["definite nominative/accusative plural of jur"]},{"word":"jururilor","pos":"noun","definitions":["inflection of jur:","definite genitive/dative plural","vocative plural"]},{"word":"just","pos":"adj","definitions":["just, correct"],"pronunciation":"/ʒust/","forms":{"feminine-singular":"justă","masculine-plural":"juști","feminine-neuter-plural":"juste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"just","error-unrecognized-form-feminine-indefinite-singular":"justă","error-unrecognized-form-indefinite-masculine-plural":"juști","error-unrecognized-form-feminine-indefinite-neuter-plural":"juste","definite-error-unrecognized-form-masculine-neuter-singular":"justul","definite-error-unrecognized-form-feminine-singular":"justa","definite-error-unrecognized-form-masculine-plural":"juștii","definite-error-unrecognized-form-feminine-neuter-plural":"justele"}},{"word":"justeță","pos":"noun","definitions":["alternative form of justețe"],"forms":{"plural":"justețe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"justeță","accusative-definite-nominative-singular":"justeța","accusative-indefinite-nominative-plural":"justețe","accusative-definite-nominative-plural":"justețele","dative-genitive-indefinite-singular":"justețe","dative-definite-genitive-singular":"justeței","dative-genitive-indefinite-plural":"justețe","dative-definite-genitive-plural":"justețelor","singular-vocative":"justeță","plural-vocative":"justețelor"}},{"word":"justețe","pos":"noun","definitions":["rightness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"justețe","accusative-definite-nominative":"justețea","dative-genitive-indefinite":"justeți","dative-definite-genitive":"justeții","vocative":"justețe"}},{"word":"justifica","pos":"verb","definitions":["to justify"],"pronunciation":"/ʒus.ti.fiˈka/","forms":{"canonical":"a justifica 1st conjugation","present-singular-third-person":"justifică","participle-past":"justificat","subjunctive-third-person":"justifice","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a justifica","gerund":"justificând","first-person-indicative-present-singular":"justific","indicative-present-second-person-singular":"justifici","indicative-present-singular-third-person":"justifică","first-person-indicative-plural-present":"justificăm","indicative-plural-present-second-person":"justificați","indicative-plural-present-third-person":"justifică","first-person-imperfect-indicative-singular":"justificam","imperfect-indicative-second-person-singular":"justificai","imperfect-indicative-singular-third-person":"justifica","first-person-imperfect-indicative-plural":"justificam","imperfect-indicative-plural-second-person":"justificați","imperfect-indicative-plural-third-person":"justificau","first-person-indicative-perfect-singular":"justificai","indicative-perfect-second-person-singular":"justificași","indicative-perfect-singular-third-person":"justifică","first-person-indicative-perfect-plural":"justificarăm","indicative-perfect-plural-second-person":"justificarăți","indicative-perfect-plural-third-person":"justificară","first-person-indicative-pluperfect-singular":"justificasem","indicative-pluperfect-second-person-singular":"justificaseși","indicative-pluperfect-singular-third-person":"justificase","first-person-indicative-pluperfect-plural":"justificaserăm","indicative-pluperfect-plural-second-person":"justificaserăți","indicative-pluperfect-plural-third-person":"justificaseră","first-person-present-singular-subjunctive":"să justific","present-second-person-singular-subjunctive":"să justifici","present-singular-subjunctive-third-person":"să justifice","first-person-plural-present-subjunctive":"să justificăm","plural-present-second-person-subjunctive":"să justificați","plural-present-subjunctive-third-person":"să justifice","imperative-second-person-singular":"justifică","imperative-plural-second-person":"justificați","imperative-negative-second-person-singular":"nu justifica","imperative-negative-plural-second-person":"nu justificați"}},{"word":"justificabil","pos":"adj","definitions":["justifiable"],"pronunciation":"/ʒus.ti.fiˈka.bil/","forms":{"feminine-singular":"justificabilă","masculine-plural":"justificabili","feminine-neuter-plural":"justificabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"justificabil","error-unrecognized-form-feminine-indefinite-singular":"justificabilă","error-unrecognized-form-indefinite-masculine-plural":"justificabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"justificabile","definite-error-unrecognized-form-masculine-neuter-singular":"justificabilul","definite-error-unrecognized-form-feminine-singular":"justificabila","definite-error-unrecognized-form-masculine-plural":"justificabilii","definite-error-unrecognized-form-feminine-neuter-plural":"justificabilele"}},{"word":"justificai","pos":"verb","definitions":["inflection of justifica:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[ʒustifiˈkaj]"},{"word":"justificam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of justifica"],"pronunciation":"[ʒustifiˈkam]"},{"word":"justificare","pos":"noun","definitions":["justification; act of justifying"],"forms":{"plural":"justificări"}},{"word":"justificase","pos":"verb","definitions":["third-person singular pluperfect indicative of justifica"],"pronunciation":"[ʒustifiˈkase]"},{"word":"justificat","pos":"adj","definitions":["justified","legitimate"],"pronunciation":"[ʒustifiˈkat]","forms":{"feminine-singular":"justificată","masculine-plural":"justificați","feminine-neuter-plural":"justificate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"justificat","error-unrecognized-form-feminine-indefinite-singular":"justificată","error-unrecognized-form-indefinite-masculine-plural":"justificați","error-unrecognized-form-feminine-indefinite-neuter-plural":"justificate","definite-error-unrecognized-form-masculine-neuter-singular":"justificatul","definite-error-unrecognized-form-feminine-singular":"justificata","definite-error-unrecognized-form-masculine-plural":"justificații","definite-error-unrecognized-form-feminine-neuter-plural":"justificatele"}},{"word":"justificat","pos":"verb","definitions":["past participle of justifica"],"pronunciation":"[ʒustifiˈkat]"},{"word":"justificație","pos":"noun","definitions":["justificatory"],"forms":{"plural":"justificații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"justificație","accusative-definite-nominative-singular":"justificația","accusative-indefinite-nominative-plural":"justificații","accusative-definite-nominative-plural":"justificațiile","dative-genitive-indefinite-singular":"justificații","dative-definite-genitive-singular":"justificației","dative-genitive-indefinite-plural":"justificații","dative-definite-genitive-plural":"justificațiilor","singular-vocative":"justificație","plural-vocative":"justificațiilor"}},{"word":"justificațiune","pos":"noun","definitions":["alternative form of justificație"],"forms":{"plural":"justificațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"justificațiune","accusative-definite-nominative-singular":"justificațiunea","accusative-indefinite-nominative-plural":"justificațiuni","accusative-definite-nominative-plural":"justificațiunile","dative-genitive-indefinite-singular":"justificațiuni","dative-definite-genitive-singular":"justificațiunii","dative-genitive-indefinite-plural":"justificațiuni","dative-definite-genitive-plural":"justificațiunilor","singular-vocative":"justificațiune","plural-vocative":"justificațiunilor"}},{"word":"justificativ","pos":"adj","definitions":["justificatory"],"forms":{"feminine-singular":"justificativă","masculine-plural":"justificativi","feminine-neuter-plural":"justificative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"justificativ","error-unrecognized-form-feminine-indefinite-singular":"justificativă","error-unrecognized-form-indefinite-masculine-plural":"justificativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"justificative","definite-error-unrecognized-form-masculine-neuter-singular":"justificativul","definite-error-unrecognized-form-feminine-singular":"justificativa","definite-error-unrecognized-form-masculine-plural":"justificativii","definite-error-unrecognized-form-feminine-neuter-plural":"justificativele"}},{"word":"justificator","pos":"adj","definitions":["justificatory"],"forms":{"feminine-singular":"justificatoare","masculine-plural":"justificatori","feminine-neuter-plural":"justificatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"justificator","error-unrecognized-form-feminine-indefinite-singular":"justificatoare","error-unrecognized-form-indefinite-masculine-plural":"justificatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"justificatoare","definite-error-unrecognized-form-masculine-neuter-singular":"justificatorul","definite-error-unrecognized-form-feminine-singular":"justificatoarea","definite-error-unrecognized-form-masculine-plural":"justificatorii","definite-error-unrecognized-form-feminine-neuter-plural":"justificatoarele"}},{"word":"justițiabil","pos":"noun","definitions":["justiciable"],"forms":{"plural":"justițiabili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"justițiabil","accusative-definite-nominative-singular":"justițiabilul","accusative-indefinite-nominative-plural":"justițiabili","accusative-definite-nominative-plural":"justițiabilii","dative-genitive-indefinite-singular":"justițiabil","dative-definite-genitive-singular":"justițiabilului","dative-genitive-indefinite-plural":"justițiabili","dative-definite-genitive-plural":"justițiabililor","singular-vocative":"justițiabilule","plural-vocative":"justițiabililor"}},{"word":"justițiabilă","pos":"noun","definitions":["female equivalent of justițiabil"],"forms":{"plural":"justițiabile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"justițiabilă","accusative-definite-nominative-singular":"justițiabila","accusative-indefinite-nominative-plural":"justițiabile","accusative-definite-nominative-plural":"justițiabilele","dative-genitive-indefinite-singular":"justițiabile","dative-definite-genitive-singular":"justițiabilei","dative-genitive-indefinite-plural":"justițiabile","dative-definite-genitive-plural":"justițiabilelor","singular-vocative":"justițiabilă","plural-vocative":"justițiabilelor"}},{"word":"justițial","pos":"adj","definitions":["justicial, judicial"],"forms":{"feminine-singular":"justițială","masculine-plural":"justițiali","feminine-neuter-plural":"justițiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"justițial","error-unrecognized-form-feminine-indefinite-singular":"justițială","error-unrecognized-form-indefinite-masculine-plural":"justițiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"justițiale","definite-error-unrecognized-form-masculine-neuter-singular":"justițialul","definite-error-unrecognized-form-feminine-singular":"justițiala","definite-error-unrecognized-form-masculine-plural":"justițialii","definite-error-unrecognized-form-feminine-neuter-plural":"justițialele"}},{"word":"justițiar","pos":"adj","definitions":["justiciary"],"forms":{"feminine-singular":"justițiară","masculine-plural":"justițiari","feminine-neuter-plural":"justițiare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"justițiar","error-unrecognized-form-feminine-indefinite-singular":"justițiară","error-unrecognized-form-indefinite-masculine-plural":"justițiari","error-unrecognized-form-feminine-indefinite-neuter-plural":"justițiare","definite-error-unrecognized-form-masculine-neuter-singular":"justițiarul","definite-error-unrecognized-form-feminine-singular":"justițiara","definite-error-unrecognized-form-masculine-plural":"justițiarii","definite-error-unrecognized-form-feminine-neuter-plural":"justițiarele"}},{"word":"justiție","pos":"noun","definitions":["justice, fairness","justice","righteousness"],"pronunciation":"/ʒusˈtit͡si.e/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"justiție","accusative-definite-nominative":"justiția","dative-genitive-indefinite":"justiții","dative-definite-genitive":"justiției","vocative":"justiție","alternative":"жустицие"}},{"word":"juvaier","pos":"noun","definitions":["alternative form of giuvaier"],"forms":{"plural":"juvaiere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"juvaier","accusative-definite-nominative-singular":"juvaierul","accusative-indefinite-nominative-plural":"juvaiere","accusative-definite-nominative-plural":"juvaierele","dative-genitive-indefinite-singular":"juvaier","dative-definite-genitive-singular":"juvaierului","dative-genitive-indefinite-plural":"juvaiere","dative-definite-genitive-plural":"juvaierelor","singular-vocative":"juvaierule","plural-vocative":"juvaierelor"}},{"word":"juvală","pos":"noun","definitions":["alternative form of jigală"],"forms":{"plural":"juvale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"juvală","accusative-definite-nominative-singular":"juvala","accusative-indefinite-nominative-plural":"juvale","accusative-definite-nominative-plural":"juvalele","dative-genitive-indefinite-singular":"juvale","dative-definite-genitive-singular":"juvalei","dative-genitive-indefinite-plural":"juvale","dative-definite-genitive-plural":"juvalelor","singular-vocative":"juvală","plural-vocative":"juvalelor"}},{"word":"juvăț","pos":"noun","definitions":["snare used to catch animals","noose (to hang someone)"],"forms":{"plural":"juvețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"juvăț","accusative-definite-nominative-singular":"juvățul","accusative-indefinite-nominative-plural":"juvețe","accusative-definite-nominative-plural":"juvețele","dative-genitive-indefinite-singular":"juvăț","dative-definite-genitive-singular":"juvățului","dative-genitive-indefinite-plural":"juvețe","dative-definite-genitive-plural":"juvețelor","singular-vocative":"juvățule","plural-vocative":"juvețelor"}},{"word":"juvenil","pos":"adj","definitions":["juvenile","teenage"],"pronunciation":"/ʒu.veˈnil/","forms":{"feminine-singular":"juvenilă","masculine-plural":"juvenili","feminine-neuter-plural":"juvenile","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"juvenil","error-unrecognized-form-feminine-indefinite-singular":"juvenilă","error-unrecognized-form-indefinite-masculine-plural":"juvenili","error-unrecognized-form-feminine-indefinite-neuter-plural":"juvenile","definite-error-unrecognized-form-masculine-neuter-singular":"juvenilul","definite-error-unrecognized-form-feminine-singular":"juvenila","definite-error-unrecognized-form-masculine-plural":"juvenilii","definite-error-unrecognized-form-feminine-neuter-plural":"juvenilele"}},{"word":"juvenilă","pos":"adj","definitions":["nominative/accusative feminine singular of juvenil"],"pronunciation":"/ʒu.veˈni.lə/"},{"word":"juvenilitate","pos":"noun","definitions":["juvenility"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"juvenilitate","accusative-definite-nominative-singular":"juvenilitatea","accusative-indefinite-nominative-plural":"juvenilități","accusative-definite-nominative-plural":"juvenilitățile","dative-genitive-indefinite-singular":"juvenilități","dative-definite-genitive-singular":"juvenilității","dative-genitive-indefinite-plural":"juvenilități","dative-definite-genitive-plural":"juvenilităților","singular-vocative":"juvenilitate","plural-vocative":"juvenilităților"}},{"word":"Juverțelul","pos":"name","definitions":["a river in Sibiu, Romania, tributary to the Juvertul"],"gender":"m"},{"word":"Juvete","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Juvete"}},{"word":"juvete","pos":"noun","definitions":["fry, any small fish","nickname applied to Oltenians (Romanians from Oltenia, in Romania)"],"forms":{"plural":"juveți","table-tags":"no-table-tags","inflection-template":"ro-noun-m-e","accusative-indefinite-nominative-singular":"juvete","accusative-definite-nominative-singular":"juvetele","accusative-indefinite-nominative-plural":"juveți","accusative-definite-nominative-plural":"juveții","dative-genitive-indefinite-singular":"juvete","dative-definite-genitive-singular":"juvetelui","dative-genitive-indefinite-plural":"juveți","dative-definite-genitive-plural":"juveților","singular-vocative":"juvete","plural-vocative":"juveților"}},{"word":"juveți","pos":"noun","definitions":["plural of juvete"]},{"word":"juvină","pos":"noun","definitions":["obsolete form of jivină"],"forms":{"plural":"juvine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"juvină","accusative-definite-nominative-singular":"juvina","accusative-indefinite-nominative-plural":"juvine","accusative-definite-nominative-plural":"juvinele","dative-genitive-indefinite-singular":"juvine","dative-definite-genitive-singular":"juvinei","dative-genitive-indefinite-plural":"juvine","dative-definite-genitive-plural":"juvinelor","singular-vocative":"juvină","plural-vocative":"juvinelor"}},{"word":"juxtalinear","pos":"adj","definitions":["juxtalinear"],"forms":{"feminine-singular":"juxtalineară","masculine-plural":"juxtalineari","feminine-neuter-plural":"juxtalineare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"juxtalinear","error-unrecognized-form-feminine-indefinite-singular":"juxtalineară","error-unrecognized-form-indefinite-masculine-plural":"juxtalineari","error-unrecognized-form-feminine-indefinite-neuter-plural":"juxtalineare","definite-error-unrecognized-form-masculine-neuter-singular":"juxtalinearul","definite-error-unrecognized-form-feminine-singular":"juxtalineara","definite-error-unrecognized-form-masculine-plural":"juxtalinearii","definite-error-unrecognized-form-feminine-neuter-plural":"juxtalinearele"}},{"word":"juxtaliniară","pos":"adj","definitions":["alternative form of juxtalineară"],"forms":{"plural":"juxtaliniare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-","error-unrecognized-form-feminine-indefinite-singular":"juxtaliniară","error-unrecognized-form-indefinite-masculine-plural":"-","error-unrecognized-form-feminine-indefinite-neuter-plural":"juxtaliniare","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"juxtaliniara","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"juxtaliniarele"}},{"word":"juxtapoziție","pos":"noun","definitions":["juxtaposition"],"forms":{"plural":"juxtapoziții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"juxtapoziție","accusative-definite-nominative-singular":"juxtapoziția","accusative-indefinite-nominative-plural":"juxtapoziții","accusative-definite-nominative-plural":"juxtapozițiile","dative-genitive-indefinite-singular":"juxtapoziții","dative-definite-genitive-singular":"juxtapoziției","dative-genitive-indefinite-plural":"juxtapoziții","dative-definite-genitive-plural":"juxtapozițiilor","singular-vocative":"juxtapoziție","plural-vocative":"juxtapozițiilor"}},{"word":"juxtapozițiune","pos":"noun","definitions":["obsolete form of juxtapoziție"],"forms":{"plural":"juxtapozițiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"juxtapozițiune","accusative-definite-nominative-singular":"juxtapozițiunea","accusative-indefinite-nominative-plural":"juxtapozițiuni","accusative-definite-nominative-plural":"juxtapozițiunile","dative-genitive-indefinite-singular":"juxtapozițiuni","dative-definite-genitive-singular":"juxtapozițiunii","dative-genitive-indefinite-plural":"juxtapozițiuni","dative-definite-genitive-plural":"juxtapozițiunilor","singular-vocative":"juxtapozițiune","plural-vocative":"juxtapozițiunilor"}},{"word":"juxtapune","pos":"verb","definitions":["to juxtapose"],"forms":{"canonical":"a juxtapune 3rd conjugation","present-singular-third-person":"juxtapune","participle-past":"juxtapus","subjunctive-third-person":"juxtapună","table-tags":"conjugation-3","inflection-template":"ro-conj-e","infinitive":"a juxtapune","gerund":"juxtapunând","first-person-indicative-present-singular":"juxtapun","indicative-present-second-person-singular":"juxtapui","indicative-present-singular-third-person":"juxtapune","first-person-indicative-plural-present":"juxtapunem","indicative-plural-present-second-person":"juxtapuneți","indicative-plural-present-third-person":"juxtapun","first-person-imperfect-indicative-singular":"juxtapuneam","imperfect-indicative-second-person-singular":"juxtapuneai","imperfect-indicative-singular-third-person":"juxtapunea","first-person-imperfect-indicative-plural":"juxtapuneam","imperfect-indicative-plural-second-person":"juxtapuneați","imperfect-indicative-plural-third-person":"juxtapuneau","first-person-indicative-perfect-singular":"juxtapusei","indicative-perfect-second-person-singular":"juxtapuseși","indicative-perfect-singular-third-person":"juxtapuse","first-person-indicative-perfect-plural":"juxtapuserăm","indicative-perfect-plural-second-person":"juxtapuserăți","indicative-perfect-plural-third-person":"juxtapuseră","first-person-indicative-pluperfect-singular":"juxtapusesem","indicative-pluperfect-second-person-singular":"juxtapuseseși","indicative-pluperfect-singular-third-person":"juxtapusese","first-person-indicative-pluperfect-plural":"juxtapuseserăm","indicative-pluperfect-plural-second-person":"juxtapuseserăți","indicative-pluperfect-plural-third-person":"juxtapuseseră","first-person-present-singular-subjunctive":"să juxtapun","present-second-person-singular-subjunctive":"să juxtapui","present-singular-subjunctive-third-person":"să juxtapună","first-person-plural-present-subjunctive":"să juxtapunem","plural-present-second-person-subjunctive":"să juxtapuneți","plural-present-subjunctive-third-person":"să juxtapună","imperative-second-person-singular":"juxtapune","imperative-plural-second-person":"juxtapuneți","imperative-negative-second-person-singular":"nu juxtapune","imperative-negative-plural-second-person":"nu juxtapuneți"}},{"word":"juxtapunere","pos":"noun","definitions":["juxtaposition"],"forms":{"plural":"juxtapuneri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"juxtapunere","accusative-definite-nominative-singular":"juxtapunerea","accusative-indefinite-nominative-plural":"juxtapuneri","accusative-definite-nominative-plural":"juxtapunerile","dative-genitive-indefinite-singular":"juxtapuneri","dative-definite-genitive-singular":"juxtapunerii","dative-genitive-indefinite-plural":"juxtapuneri","dative-definite-genitive-plural":"juxtapunerilor","singular-vocative":"juxtapunere","plural-vocative":"juxtapunerilor"}},{"word":"juxtapus","pos":"adj","definitions":["juxtaposited"],"forms":{"feminine-singular":"juxtapusă","masculine-plural":"juxtapuși","feminine-neuter-plural":"juxtapuse","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"juxtapus","error-unrecognized-form-feminine-indefinite-singular":"juxtapusă","error-unrecognized-form-indefinite-masculine-plural":"juxtapuși","error-unrecognized-form-feminine-indefinite-neuter-plural":"juxtapuse","definite-error-unrecognized-form-masculine-neuter-singular":"juxtapusul","definite-error-unrecognized-form-feminine-singular":"juxtapusa","definite-error-unrecognized-form-masculine-plural":"juxtapușii","definite-error-unrecognized-form-feminine-neuter-plural":"juxtapusele"}},{"word":"juzi","pos":"noun","definitions":["plural of jude"],"pronunciation":"/ʒuzʲ/"},{"word":"jvarț","pos":"noun","definitions":["obsolete form of șvarț"],"forms":{"plural":"jvarțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"jvarț","accusative-definite-nominative-singular":"jvarțul","accusative-indefinite-nominative-plural":"jvarțuri","accusative-definite-nominative-plural":"jvarțurile","dative-genitive-indefinite-singular":"jvarț","dative-definite-genitive-singular":"jvarțului","dative-genitive-indefinite-plural":"jvarțuri","dative-definite-genitive-plural":"jvarțurilor","singular-vocative":"jvarțule","plural-vocative":"jvarțurilor"}}];
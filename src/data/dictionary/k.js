@@ -1 +1 @@
-export default [{"word":"k","pos":"character","definitions":["The fourteenth letter of the Romanian alphabet, called ca or capa and written in the Latin script."],"pronunciation":"/kapa/","forms":{"uppercase":"K"}},{"word":"k","pos":"conj","definitions":["abbreviation of că (“that, because”)"],"pronunciation":"/kapa/","examples":[{"ro":"hai k ma culc k-i trz","en":null},{"ro":"(Hai că mă culc că-i târziu)","en":null},{"ro":"i'm gonna go sleep cuz it's getting late","en":null}]},{"word":"K","pos":"character","definitions":["The fourteenth letter of the Romanian alphabet, called ca or capa and written in the Latin script."],"pronunciation":"/k/","forms":{"lowercase":"k"}},{"word":"kabil","pos":"noun","definitions":["Kabyle (person)"],"forms":{"plural":"kabili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kabil","accusative-definite-nominative-singular":"kabilul","accusative-indefinite-nominative-plural":"kabili","accusative-definite-nominative-plural":"kabilii","dative-genitive-indefinite-singular":"kabil","dative-definite-genitive-singular":"kabilului","dative-genitive-indefinite-plural":"kabili","dative-definite-genitive-plural":"kabililor","singular-vocative":"kabilule","plural-vocative":"kabililor"}},{"word":"kabilă","pos":"noun","definitions":["female equivalent of kabil"],"forms":{"plural":"kabile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kabilă","accusative-definite-nominative-singular":"kabila","accusative-indefinite-nominative-plural":"kabile","accusative-definite-nominative-plural":"kabilele","dative-genitive-indefinite-singular":"kabile","dative-definite-genitive-singular":"kabilei","dative-genitive-indefinite-plural":"kabile","dative-definite-genitive-plural":"kabilelor","singular-vocative":"kabilă","plural-vocative":"kabilelor"}},{"word":"kabuki","pos":"noun","definitions":["kabuki"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kabuki","accusative-definite-nominative":"kabukiul","dative-genitive-indefinite":"kabuki","dative-definite-genitive":"kabukiului","vocative":"kabukiule"}},{"word":"kainit","pos":"noun","definitions":["kainite"],"forms":{"plural":"kainite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kainit","accusative-definite-nominative-singular":"kainitul","accusative-indefinite-nominative-plural":"kainite","accusative-definite-nominative-plural":"kainitele","dative-genitive-indefinite-singular":"kainit","dative-definite-genitive-singular":"kainitului","dative-genitive-indefinite-plural":"kainite","dative-definite-genitive-plural":"kainitelor","singular-vocative":"kainitule","plural-vocative":"kainitelor"}},{"word":"kaizer","pos":"noun","definitions":["kaiser","bacon"],"forms":{"plural":"kaizeri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kaizer","accusative-definite-nominative-singular":"kaizerul","accusative-indefinite-nominative-plural":"kaizeri","accusative-definite-nominative-plural":"kaizerii","dative-genitive-indefinite-singular":"kaizer","dative-definite-genitive-singular":"kaizerului","dative-genitive-indefinite-plural":"kaizeri","dative-definite-genitive-plural":"kaizerilor","singular-vocative":"kaizerule","plural-vocative":"kaizerilor"}},{"word":"kakemono","pos":"noun","definitions":["kakemono"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kakemono","accusative-definite-nominative":"kakemonoul","dative-genitive-indefinite":"kakemono","dative-definite-genitive":"kakemonoului","vocative":"kakemonoule"}},{"word":"kaki","pos":"adj","definitions":["khaki"],"pronunciation":"/kaˈki/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kaki","error-unrecognized-form-feminine-indefinite-singular":"kaki","error-unrecognized-form-indefinite-masculine-plural":"kaki","error-unrecognized-form-feminine-indefinite-neuter-plural":"kaki","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"kaki","pos":"noun","definitions":["khaki (colour)"],"pronunciation":"/kaˈki/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kaki","accusative-definite-nominative":"kakiul","dative-genitive-indefinite":"kaki","dative-definite-genitive":"kakiului","vocative":"kakiule"}},{"word":"kaki","pos":"noun","definitions":["persimmon"],"pronunciation":"/ˈkaki/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kaki","accusative-definite-nominative":"kakiul","dative-genitive-indefinite":"kaki","dative-definite-genitive":"kakiului","vocative":"kakiule"}},{"word":"kakiu","pos":"adj","definitions":["alternative form of kaki"],"forms":{"feminine-singular":"kakie","plural":"kakii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kakiu","error-unrecognized-form-feminine-indefinite-singular":"kakie","error-unrecognized-form-indefinite-masculine-plural":"kakii","error-unrecognized-form-feminine-indefinite-neuter-plural":"kakii","definite-error-unrecognized-form-masculine-neuter-singular":"kakiul","definite-error-unrecognized-form-feminine-singular":"kakia","definite-error-unrecognized-form-masculine-plural":"kakiii","definite-error-unrecognized-form-feminine-neuter-plural":"kakiile"}},{"word":"kala-azar","pos":"noun","definitions":["kala-azar"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kala-azar","accusative-definite-nominative":"kala-azarul","dative-genitive-indefinite":"kala-azar","dative-definite-genitive":"kala-azarului","vocative":"kala-azarule"}},{"word":"kalașnikov","pos":"noun","definitions":["Kalashnikov rifle"],"forms":{"plural":"kalașnikovuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"kalașnikov","accusative-definite-nominative-singular":"kalașnikovul","accusative-indefinite-nominative-plural":"kalașnikovuri","accusative-definite-nominative-plural":"kalașnikovurile","dative-genitive-indefinite-singular":"kalașnikov","dative-definite-genitive-singular":"kalașnikovului","dative-genitive-indefinite-plural":"kalașnikovuri","dative-definite-genitive-plural":"kalașnikovurilor","singular-vocative":"kalașnikovule","plural-vocative":"kalașnikovurilor"}},{"word":"kaliu","pos":"noun","definitions":["potassium (chemical element)"],"pronunciation":"/ˈkalju/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kaliu","accusative-definite-nominative":"kaliul","dative-genitive-indefinite":"kaliu","dative-definite-genitive":"kaliului","vocative":"kaliule"}},{"word":"kalmâc","pos":"noun","definitions":["alternative form of calmuc"],"forms":{"plural":"kalmâci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kalmâc","accusative-definite-nominative-singular":"kalmâcul","accusative-indefinite-nominative-plural":"kalmâci","accusative-definite-nominative-plural":"kalmâcii","dative-genitive-indefinite-singular":"kalmâc","dative-definite-genitive-singular":"kalmâcului","dative-genitive-indefinite-plural":"kalmâci","dative-definite-genitive-plural":"kalmâcilor","singular-vocative":"kalmâcule","plural-vocative":"kalmâcilor"}},{"word":"kalmâcă","pos":"noun","definitions":["female equivalent of kalmâc"],"forms":{"plural":"kalmâce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kalmâcă","accusative-definite-nominative-singular":"kalmâca","accusative-indefinite-nominative-plural":"kalmâce","accusative-definite-nominative-plural":"kalmâcele","dative-genitive-indefinite-singular":"kalmâce","dative-definite-genitive-singular":"kalmâcei","dative-genitive-indefinite-plural":"kalmâce","dative-definite-genitive-plural":"kalmâcelor","singular-vocative":"kalmâcă","plural-vocative":"kalmâcelor"}},{"word":"Kama Sutra","pos":"name","definitions":["Kama Sutra"],"gender":"f"},{"word":"kamala","pos":"noun","definitions":["kamala"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"kamala","accusative-definite-nominative":"kamalaua","dative-genitive-indefinite":"{{{pl}}}","dative-definite-genitive":"{{{pl}}}i","vocative":"-"}},{"word":"kamikaze","pos":"noun","definitions":["kamikaze"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kamikaze","accusative-definite-nominative":"kamikazeul","dative-genitive-indefinite":"kamikaze","dative-definite-genitive":"kamikazeului","vocative":"kamikazeule"}},{"word":"kampuchian","pos":"noun","definitions":["Kampuchean"],"forms":{"plural":"kampuchieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kampuchian","accusative-definite-nominative-singular":"kampuchianul","accusative-indefinite-nominative-plural":"kampuchieni","accusative-definite-nominative-plural":"kampuchienii","dative-genitive-indefinite-singular":"kampuchian","dative-definite-genitive-singular":"kampuchianului","dative-genitive-indefinite-plural":"kampuchieni","dative-definite-genitive-plural":"kampuchienilor","singular-vocative":"kampuchianule","plural-vocative":"kampuchienilor"}},{"word":"kampuchiană","pos":"noun","definitions":["female equivalent of kampuchian"],"forms":{"plural":"kampuchiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kampuchiană","accusative-definite-nominative-singular":"kampuchiana","accusative-indefinite-nominative-plural":"kampuchiene","accusative-definite-nominative-plural":"kampuchienele","dative-genitive-indefinite-singular":"kampuchiene","dative-definite-genitive-singular":"kampuchienei","dative-genitive-indefinite-plural":"kampuchiene","dative-definite-genitive-plural":"kampuchienelor","singular-vocative":"kampuchiană","plural-vocative":"kampuchienelor"}},{"word":"kantian","pos":"noun","definitions":["Kantian"],"forms":{"plural":"kantieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kantian","accusative-definite-nominative-singular":"kantianul","accusative-indefinite-nominative-plural":"kantieni","accusative-definite-nominative-plural":"kantienii","dative-genitive-indefinite-singular":"kantian","dative-definite-genitive-singular":"kantianului","dative-genitive-indefinite-plural":"kantieni","dative-definite-genitive-plural":"kantienilor","singular-vocative":"kantianule","plural-vocative":"kantienilor"}},{"word":"kantiană","pos":"noun","definitions":["female equivalent of kantian"],"forms":{"plural":"kantiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kantiană","accusative-definite-nominative-singular":"kantiana","accusative-indefinite-nominative-plural":"kantiene","accusative-definite-nominative-plural":"kantienele","dative-genitive-indefinite-singular":"kantiene","dative-definite-genitive-singular":"kantienei","dative-genitive-indefinite-plural":"kantiene","dative-definite-genitive-plural":"kantienelor","singular-vocative":"kantiană","plural-vocative":"kantienelor"}},{"word":"kantianism","pos":"noun","definitions":["Kantianism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kantianism","accusative-definite-nominative-singular":"kantianismul","accusative-indefinite-nominative-plural":"kantianisme","accusative-definite-nominative-plural":"kantianismele","dative-genitive-indefinite-singular":"kantianism","dative-definite-genitive-singular":"kantianismului","dative-genitive-indefinite-plural":"kantianisme","dative-definite-genitive-plural":"kantianismelor","singular-vocative":"kantianismule","plural-vocative":"kantianismelor"}},{"word":"kantism","pos":"noun","definitions":["Kantianism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kantism","accusative-definite-nominative-singular":"kantismul","accusative-indefinite-nominative-plural":"kantisme","accusative-definite-nominative-plural":"kantismele","dative-genitive-indefinite-singular":"kantism","dative-definite-genitive-singular":"kantismului","dative-genitive-indefinite-plural":"kantisme","dative-definite-genitive-plural":"kantismelor","singular-vocative":"kantismule","plural-vocative":"kantismelor"}},{"word":"kappa","pos":"noun","definitions":["kappa"],"forms":{"plural":"kappa","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kappa","accusative-definite-nominative-singular":"kappaul","accusative-indefinite-nominative-plural":"kappa","accusative-definite-nominative-plural":"kappai","dative-genitive-indefinite-singular":"kappa","dative-definite-genitive-singular":"kappaului","dative-genitive-indefinite-plural":"kappa","dative-definite-genitive-plural":"kappalor","singular-vocative":"kappaule","plural-vocative":"kappalor"}},{"word":"Karakalpakstan","pos":"name","definitions":["Karakalpakstan (an autonomous republic in northwestern Uzbekistan; capital: Nukus)"],"pronunciation":"/karakalpakˈstan/","gender":"n","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"Karakalpakstan","accusative-definite-nominative":"Karakalpakstanul","dative-genitive-indefinite":"Karakalpakstan","dative-definite-genitive":"Karakalpakstanului","vocative":"Karakalpakstanule"}},{"word":"karaoke","pos":"noun","definitions":["karaoke"]},{"word":"karate","pos":"noun","definitions":["karate"],"pronunciation":"/kaˈra.te/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"karate","accusative-definite-nominative":"karateul","dative-genitive-indefinite":"karate","dative-definite-genitive":"karateului","vocative":"karateule"}},{"word":"karma","pos":"noun","definitions":["karma"]},{"word":"kasidă","pos":"noun","definitions":["kassid"],"forms":{"plural":"kaside","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kasidă","accusative-definite-nominative-singular":"kasida","accusative-indefinite-nominative-plural":"kaside","accusative-definite-nominative-plural":"kasidele","dative-genitive-indefinite-singular":"kaside","dative-definite-genitive-singular":"kasidei","dative-genitive-indefinite-plural":"kaside","dative-definite-genitive-plural":"kasidelor","singular-vocative":"kasidă","plural-vocative":"kasidelor"}},{"word":"kasolit","pos":"noun","definitions":["kasolite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kasolit","accusative-definite-nominative-singular":"kasolitul","accusative-indefinite-nominative-plural":"kasolite","accusative-definite-nominative-plural":"kasolitele","dative-genitive-indefinite-singular":"kasolit","dative-definite-genitive-singular":"kasolitului","dative-genitive-indefinite-plural":"kasolite","dative-definite-genitive-plural":"kasolitelor","singular-vocative":"kasolitule","plural-vocative":"kasolitelor"}},{"word":"kazah","pos":"noun","definitions":["Kazakh"],"forms":{"plural":"kazahi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kazah","accusative-definite-nominative-singular":"kazahul","accusative-indefinite-nominative-plural":"kazahi","accusative-definite-nominative-plural":"kazahii","dative-genitive-indefinite-singular":"kazah","dative-definite-genitive-singular":"kazahului","dative-genitive-indefinite-plural":"kazahi","dative-definite-genitive-plural":"kazahilor","singular-vocative":"kazahule","plural-vocative":"kazahilor"}},{"word":"kazahă","pos":"noun","definitions":["female equivalent of kazah"],"forms":{"plural":"kazahe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kazahă","accusative-definite-nominative-singular":"kazaha","accusative-indefinite-nominative-plural":"kazahe","accusative-definite-nominative-plural":"kazahele","dative-genitive-indefinite-singular":"kazahe","dative-definite-genitive-singular":"kazahei","dative-genitive-indefinite-plural":"kazahe","dative-definite-genitive-plural":"kazahelor","singular-vocative":"kazahă","plural-vocative":"kazahelor"}},{"word":"kazahi","pos":"noun","definitions":["indefinite plural of kazah"],"pronunciation":"[kaˈzahʲ]","gender":"m"},{"word":"Kazahstan","pos":"name","definitions":["Kazakhstan (a country in Central Asia and Eastern Europe)"],"pronunciation":"/ka.zahˈstan/","gender":"n","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"Kazahstan","accusative-definite-nominative":"Kazahstanul","dative-genitive-indefinite":"Kazahstan","dative-definite-genitive":"Kazahstanului","vocative":"Kazahstanule"}},{"word":"kârgâz","pos":"noun","definitions":["Kyrgyz"],"pronunciation":"/kɨrˈɡɨz/","forms":{"plural":"kârgâzi","feminine":"equivalent kârgâză","alternative":"kirghiz"}},{"word":"kârgâz","pos":"adj","definitions":["Kyrgyz"],"pronunciation":"/kɨrˈɡɨz/","forms":{"feminine-singular":"kârgâză","masculine-plural":"kârgâzi","feminine-neuter-plural":"kârgâze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kârgâz","error-unrecognized-form-feminine-indefinite-singular":"kârgâză","error-unrecognized-form-indefinite-masculine-plural":"kârgâzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"kârgâze","definite-error-unrecognized-form-masculine-neuter-singular":"kârgâzul","definite-error-unrecognized-form-feminine-singular":"kârgâza","definite-error-unrecognized-form-masculine-plural":"kârgâzii","definite-error-unrecognized-form-feminine-neuter-plural":"kârgâzele","alternative":"kirghiz"}},{"word":"Kârgâzstan","pos":"name","definitions":["Kyrgyzstan (a country in Central Asia, bordering on Kazakhstan, Uzbekistan, Tajikistan and China)"],"gender":"n"},{"word":"kediv","pos":"noun","definitions":["khedive"],"forms":{"plural":"kedivi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kediv","accusative-definite-nominative-singular":"kedivul","accusative-indefinite-nominative-plural":"kedivi","accusative-definite-nominative-plural":"kedivii","dative-genitive-indefinite-singular":"kediv","dative-definite-genitive-singular":"kedivului","dative-genitive-indefinite-plural":"kedivi","dative-definite-genitive-plural":"kedivilor","singular-vocative":"kedivule","plural-vocative":"kedivilor"}},{"word":"Kelemen","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Kelemen"}},{"word":"kelvin","pos":"noun","definitions":["a kelvin (unit of temperature)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"kelvin","accusative-definite-nominative":"kelvinul","dative-genitive-indefinite":"kelvin","dative-definite-genitive":"kelvinului","vocative":"kelvinule"}},{"word":"kemalism","pos":"noun","definitions":["Kemalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kemalism","accusative-definite-nominative":"kemalismul","dative-genitive-indefinite":"kemalism","dative-definite-genitive":"kemalismului","vocative":"kemalismule"}},{"word":"kenotron","pos":"noun","definitions":["kenotron"],"forms":{"plural":"kenotroane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kenotron","accusative-definite-nominative-singular":"kenotronul","accusative-indefinite-nominative-plural":"kenotroane","accusative-definite-nominative-plural":"kenotroanele","dative-genitive-indefinite-singular":"kenotron","dative-definite-genitive-singular":"kenotronului","dative-genitive-indefinite-plural":"kenotroane","dative-definite-genitive-plural":"kenotroanelor","singular-vocative":"kenotronule","plural-vocative":"kenotroanelor"}},{"word":"Kentucky","pos":"name","definitions":["Kentucky (a state of the United States)"],"gender":"n"},{"word":"kenyan","pos":"adj","definitions":["Kenyan"],"forms":{"feminine-singular":"kenyană","masculine-plural":"kenyeni","feminine-neuter-plural":"kenyene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kenyan","error-unrecognized-form-feminine-indefinite-singular":"kenyană","error-unrecognized-form-indefinite-masculine-plural":"kenyeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"kenyene","definite-error-unrecognized-form-masculine-neuter-singular":"kenyanul","definite-error-unrecognized-form-feminine-singular":"kenyana","definite-error-unrecognized-form-masculine-plural":"kenyenii","definite-error-unrecognized-form-feminine-neuter-plural":"kenyenele"}},{"word":"kenyan","pos":"noun","definitions":["Kenyan"],"forms":{"plural":"kenyeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kenyan","accusative-definite-nominative-singular":"kenyanul","accusative-indefinite-nominative-plural":"kenyeni","accusative-definite-nominative-plural":"kenyenii","dative-genitive-indefinite-singular":"kenyan","dative-definite-genitive-singular":"kenyanului","dative-genitive-indefinite-plural":"kenyeni","dative-definite-genitive-plural":"kenyenilor","singular-vocative":"kenyanule","plural-vocative":"kenyenilor"}},{"word":"kenyană","pos":"noun","definitions":["female equivalent of kenyan"],"forms":{"plural":"kenyane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kenyană","accusative-definite-nominative-singular":"kenyana","accusative-indefinite-nominative-plural":"kenyane","accusative-definite-nominative-plural":"kenyanele","dative-genitive-indefinite-singular":"kenyane","dative-definite-genitive-singular":"kenyanei","dative-genitive-indefinite-plural":"kenyane","dative-definite-genitive-plural":"kenyanelor","singular-vocative":"kenyană","plural-vocative":"kenyanelor"}},{"word":"keramit","pos":"noun","definitions":["ceramic paving"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"keramit","accusative-definite-nominative-singular":"keramitul","accusative-indefinite-nominative-plural":"keramite","accusative-definite-nominative-plural":"keramitele","dative-genitive-indefinite-singular":"keramit","dative-definite-genitive-singular":"keramitului","dative-genitive-indefinite-plural":"keramite","dative-definite-genitive-plural":"keramitelor","singular-vocative":"keramitule","plural-vocative":"keramitelor"}},{"word":"kerosen","pos":"noun","definitions":["kerosene"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kerosen","accusative-definite-nominative":"kerosenul","dative-genitive-indefinite":"kerosen","dative-definite-genitive":"kerosenului","vocative":"kerosenule"}},{"word":"kersantit","pos":"noun","definitions":["kersantite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kersantit","accusative-definite-nominative":"kersantitul","dative-genitive-indefinite":"kersantit","dative-definite-genitive":"kersantitului","vocative":"kersantitule"}},{"word":"keta","pos":"noun","definitions":["chum salmon"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"keta","accusative-definite-nominative":"ketaua","dative-genitive-indefinite":"-","dative-definite-genitive":"-i","vocative":"-"}},{"word":"ketchup","pos":"noun","definitions":["ketchup"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ketchup","accusative-definite-nominative":"ketchupul","dative-genitive-indefinite":"ketchup","dative-definite-genitive":"ketchupului","vocative":"ketchupule"}},{"word":"keynesian","pos":"noun","definitions":["Keynesian"],"forms":{"plural":"keynesieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"keynesian","accusative-definite-nominative-singular":"keynesianul","accusative-indefinite-nominative-plural":"keynesieni","accusative-definite-nominative-plural":"keynesienii","dative-genitive-indefinite-singular":"keynesian","dative-definite-genitive-singular":"keynesianului","dative-genitive-indefinite-plural":"keynesieni","dative-definite-genitive-plural":"keynesienilor","singular-vocative":"keynesianule","plural-vocative":"keynesienilor"}},{"word":"keynesism","pos":"noun","definitions":["Keynesianism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"keynesism","accusative-definite-nominative":"keynesismul","dative-genitive-indefinite":"keynesism","dative-definite-genitive":"keynesismului","vocative":"keynesismule"}},{"word":"khmer","pos":"noun","definitions":["Khmer"],"forms":{"plural":"khmeri","feminine":"equivalent khmeră","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"khmer","accusative-definite-nominative-singular":"khmerul","accusative-indefinite-nominative-plural":"khmeri","accusative-definite-nominative-plural":"khmerii","dative-genitive-indefinite-singular":"khmer","dative-definite-genitive-singular":"khmerului","dative-genitive-indefinite-plural":"khmeri","dative-definite-genitive-plural":"khmerilor","singular-vocative":"khmerule","plural-vocative":"khmerilor"}},{"word":"khmeră","pos":"noun","definitions":["female equivalent of khmer","Khmer language"],"forms":{"plural":"khmere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"khmeră","accusative-definite-nominative-singular":"khmera","accusative-indefinite-nominative-plural":"khmere","accusative-definite-nominative-plural":"khmerele","dative-genitive-indefinite-singular":"khmere","dative-definite-genitive-singular":"khmerei","dative-genitive-indefinite-plural":"khmere","dative-definite-genitive-plural":"khmerelor","singular-vocative":"khmeră","plural-vocative":"khmerelor"}},{"word":"kibbutz","pos":"noun","definitions":["kibbutz"],"forms":{"plural":"kibbutzuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"kibbutz","accusative-definite-nominative-singular":"kibbutzul","accusative-indefinite-nominative-plural":"kibbutzuri","accusative-definite-nominative-plural":"kibbutzurile","dative-genitive-indefinite-singular":"kibbutz","dative-definite-genitive-singular":"kibbutzului","dative-genitive-indefinite-plural":"kibbutzuri","dative-definite-genitive-plural":"kibbutzurilor","singular-vocative":"kibbutzule","plural-vocative":"kibbutzurilor"}},{"word":"kidnapping","pos":"noun","definitions":["kidnapping"],"pronunciation":"[kidˈnapiŋ]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kidnapping","accusative-definite-nominative":"kidnapping-ul","dative-genitive-indefinite":"kidnapping","dative-definite-genitive":"kidnapping-ului","vocative":"kidnapping-ule"}},{"word":"kieserit","pos":"noun","definitions":["kieserite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kieserit","accusative-definite-nominative":"kieseritul","dative-genitive-indefinite":"kieserit","dative-definite-genitive":"kieseritului","vocative":"kieseritule"}},{"word":"kil","pos":"noun","definitions":["kilo"],"forms":{"plural":"kile","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kil","accusative-definite-nominative-singular":"kilul","accusative-indefinite-nominative-plural":"kile","accusative-definite-nominative-plural":"kilele","dative-genitive-indefinite-singular":"kil","dative-definite-genitive-singular":"kilului","dative-genitive-indefinite-plural":"kile","dative-definite-genitive-plural":"kilelor","singular-vocative":"kilule","plural-vocative":"kilelor"}},{"word":"kilo","pos":"noun","definitions":["alternative form of kil"],"forms":{"plural":"kilo","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kilo","accusative-definite-nominative-singular":"kiloul","accusative-indefinite-nominative-plural":"kilo","accusative-definite-nominative-plural":"kilole","dative-genitive-indefinite-singular":"kilo","dative-definite-genitive-singular":"kiloului","dative-genitive-indefinite-plural":"kilo","dative-definite-genitive-plural":"kilolor","singular-vocative":"kiloule","plural-vocative":"kilolor"}},{"word":"kilo-","pos":"prefix","definitions":["kilo-"]},{"word":"kiloamper","pos":"noun","definitions":["kiloampere"],"forms":{"plural":"kiloamperi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kiloamper","accusative-definite-nominative-singular":"kiloamperul","accusative-indefinite-nominative-plural":"kiloamperi","accusative-definite-nominative-plural":"kiloamperii","dative-genitive-indefinite-singular":"kiloamper","dative-definite-genitive-singular":"kiloamperului","dative-genitive-indefinite-plural":"kiloamperi","dative-definite-genitive-plural":"kiloamperilor","singular-vocative":"kiloamperule","plural-vocative":"kiloamperilor"}},{"word":"kilocalorie","pos":"noun","definitions":["kilocalorie"],"forms":{"plural":"kilocalorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"kilocalorie","accusative-definite-nominative-singular":"kilocaloria","accusative-indefinite-nominative-plural":"kilocalorii","accusative-definite-nominative-plural":"kilocaloriile","dative-genitive-indefinite-singular":"kilocalorii","dative-definite-genitive-singular":"kilocaloriei","dative-genitive-indefinite-plural":"kilocalorii","dative-definite-genitive-plural":"kilocaloriilor","singular-vocative":"kilocalorie","plural-vocative":"kilocaloriilor"}},{"word":"kilociclu","pos":"noun","definitions":["kilocycle"],"forms":{"plural":"kilocicli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilociclu","accusative-definite-nominative-singular":"kilocicluul","accusative-indefinite-nominative-plural":"kilocicli","accusative-definite-nominative-plural":"kilociclii","dative-genitive-indefinite-singular":"kilociclu","dative-definite-genitive-singular":"kilocicluului","dative-genitive-indefinite-plural":"kilocicli","dative-definite-genitive-plural":"kilociclilor","singular-vocative":"kilocicluule","plural-vocative":"kilociclilor"}},{"word":"kilocuvânt","pos":"noun","definitions":["kiloword"],"forms":{"plural":"kilocuvinte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kilocuvânt","accusative-definite-nominative-singular":"kilocuvântul","accusative-indefinite-nominative-plural":"kilocuvinte","accusative-definite-nominative-plural":"kilocuvintele","dative-genitive-indefinite-singular":"kilocuvânt","dative-definite-genitive-singular":"kilocuvântului","dative-genitive-indefinite-plural":"kilocuvinte","dative-definite-genitive-plural":"kilocuvintelor","singular-vocative":"kilocuvântule","plural-vocative":"kilocuvintelor"}},{"word":"kiloelectronvolt","pos":"noun","definitions":["kiloelectronvolt"],"forms":{"plural":"kiloelectronvolți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kiloelectronvolt","accusative-definite-nominative-singular":"kiloelectronvoltul","accusative-indefinite-nominative-plural":"kiloelectronvolți","accusative-definite-nominative-plural":"kiloelectronvolții","dative-genitive-indefinite-singular":"kiloelectronvolt","dative-definite-genitive-singular":"kiloelectronvoltului","dative-genitive-indefinite-plural":"kiloelectronvolți","dative-definite-genitive-plural":"kiloelectronvolților","singular-vocative":"kiloelectronvoltule","plural-vocative":"kiloelectronvolților"}},{"word":"kilogram","pos":"noun","definitions":["kilogram"],"pronunciation":"/ki.loˈɡram/","forms":{"alternative":"chilogram"}},{"word":"kilogram-forță","pos":"noun","definitions":["kilogram-force"],"forms":{"plural":"kilograme-forță"}},{"word":"kilogram-metru","pos":"noun","definitions":["kilogram-metre"],"forms":{"plural":"kilogram-metri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilogram-metru","accusative-definite-nominative-singular":"kilogram-metruul","accusative-indefinite-nominative-plural":"kilogram-metri","accusative-definite-nominative-plural":"kilogram-metrii","dative-genitive-indefinite-singular":"kilogram-metru","dative-definite-genitive-singular":"kilogram-metruului","dative-genitive-indefinite-plural":"kilogram-metri","dative-definite-genitive-plural":"kilogram-metrilor","singular-vocative":"kilogram-metruule","plural-vocative":"kilogram-metrilor"}},{"word":"kilogrammetru","pos":"noun","definitions":["alternative spelling of kilogram-metru"],"forms":{"plural":"kilogrammetri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilogrammetru","accusative-definite-nominative-singular":"kilogrammetrul","accusative-indefinite-nominative-plural":"kilogrammetri","accusative-definite-nominative-plural":"kilogrammetrii","dative-genitive-indefinite-singular":"kilogrammetru","dative-definite-genitive-singular":"kilogrammetrului","dative-genitive-indefinite-plural":"kilogrammetri","dative-definite-genitive-plural":"kilogrammetrilor","singular-vocative":"kilogrammetrule","plural-vocative":"kilogrammetrilor"}},{"word":"kilohertz","pos":"noun","definitions":["kilohertz"],"forms":{"plural":"kilohertzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilohertz","accusative-definite-nominative-singular":"kilohertzul","accusative-indefinite-nominative-plural":"kilohertzi","accusative-definite-nominative-plural":"kilohertzii","dative-genitive-indefinite-singular":"kilohertz","dative-definite-genitive-singular":"kilohertzului","dative-genitive-indefinite-plural":"kilohertzi","dative-definite-genitive-plural":"kilohertzilor","singular-vocative":"kilohertzule","plural-vocative":"kilohertzilor"}},{"word":"kilojoule","pos":"noun","definitions":["kilojoule"],"forms":{"plural":"kilojouli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilojoule","accusative-definite-nominative-singular":"kilojouleul","accusative-indefinite-nominative-plural":"kilojouli","accusative-definite-nominative-plural":"kilojoulii","dative-genitive-indefinite-singular":"kilojoule","dative-definite-genitive-singular":"kilojouleului","dative-genitive-indefinite-plural":"kilojouli","dative-definite-genitive-plural":"kilojoulilor","singular-vocative":"kilojouleule","plural-vocative":"kilojoulilor"}},{"word":"kilolitru","pos":"noun","definitions":["kiloliter"],"forms":{"plural":"kilolitri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilolitru","accusative-definite-nominative-singular":"kilolitrul","accusative-indefinite-nominative-plural":"kilolitri","accusative-definite-nominative-plural":"kilolitrii","dative-genitive-indefinite-singular":"kilolitru","dative-definite-genitive-singular":"kilolitrului","dative-genitive-indefinite-plural":"kilolitri","dative-definite-genitive-plural":"kilolitrilor","singular-vocative":"kilolitrule","plural-vocative":"kilolitrilor"}},{"word":"kilometra","pos":"verb","definitions":["to mileage"],"forms":{"canonical":"a kilometra 1st conjugation","present-singular-third-person":"kilometrează","participle-past":"kilometrat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a kilometra","gerund":"kilometrând","first-person-indicative-present-singular":"kilometrez","indicative-present-second-person-singular":"kilometrezi","indicative-present-singular-third-person":"kilometrează","first-person-indicative-plural-present":"kilometrăm","indicative-plural-present-second-person":"kilometrați","indicative-plural-present-third-person":"kilometrează","first-person-imperfect-indicative-singular":"kilometram","imperfect-indicative-second-person-singular":"kilometrai","imperfect-indicative-singular-third-person":"kilometra","first-person-imperfect-indicative-plural":"kilometram","imperfect-indicative-plural-second-person":"kilometrați","imperfect-indicative-plural-third-person":"kilometrau","first-person-indicative-perfect-singular":"kilometrai","indicative-perfect-second-person-singular":"kilometrași","indicative-perfect-singular-third-person":"kilometră","first-person-indicative-perfect-plural":"kilometrarăm","indicative-perfect-plural-second-person":"kilometrarăți","indicative-perfect-plural-third-person":"kilometrară","first-person-indicative-pluperfect-singular":"kilometrasem","indicative-pluperfect-second-person-singular":"kilometraseși","indicative-pluperfect-singular-third-person":"kilometrase","first-person-indicative-pluperfect-plural":"kilometraserăm","indicative-pluperfect-plural-second-person":"kilometraserăți","indicative-pluperfect-plural-third-person":"kilometraseră","first-person-present-singular-subjunctive":"să kilometrez","present-second-person-singular-subjunctive":"să kilometrezi","present-singular-subjunctive-third-person":"să kilometreze","first-person-plural-present-subjunctive":"să kilometrăm","plural-present-second-person-subjunctive":"să kilometrați","plural-present-subjunctive-third-person":"să kilometreze","imperative-second-person-singular":"kilometrează","imperative-plural-second-person":"kilometrați","imperative-negative-second-person-singular":"nu kilometra","imperative-negative-plural-second-person":"nu kilometrați"}},{"word":"kilometraj","pos":"noun","definitions":["tachometer"],"forms":{"plural":"kilometraje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kilometraj","accusative-definite-nominative-singular":"kilometrajul","accusative-indefinite-nominative-plural":"kilometraje","accusative-definite-nominative-plural":"kilometrajele","dative-genitive-indefinite-singular":"kilometraj","dative-definite-genitive-singular":"kilometrajului","dative-genitive-indefinite-plural":"kilometraje","dative-definite-genitive-plural":"kilometrajelor","singular-vocative":"kilometrajule","plural-vocative":"kilometrajelor"}},{"word":"kilometrat","pos":"adj","definitions":["milestoned"],"forms":{"feminine-singular":"kilometrată","masculine-plural":"kilometrați","feminine-neuter-plural":"kilometrate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kilometrat","error-unrecognized-form-feminine-indefinite-singular":"kilometrată","error-unrecognized-form-indefinite-masculine-plural":"kilometrați","error-unrecognized-form-feminine-indefinite-neuter-plural":"kilometrate","definite-error-unrecognized-form-masculine-neuter-singular":"kilometratul","definite-error-unrecognized-form-feminine-singular":"kilometrata","definite-error-unrecognized-form-masculine-plural":"kilometrații","definite-error-unrecognized-form-feminine-neuter-plural":"kilometratele"}},{"word":"kilometrat","pos":"verb","definitions":["past participle of kilometra"],"forms":{"participle-past":"of kilometra"}},{"word":"kilometric","pos":"adj","definitions":["kilometric","very long, endless, interminable"],"forms":{"feminine-singular":"kilometrică","masculine-plural":"kilometrici","feminine-neuter-plural":"kilometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kilometric","error-unrecognized-form-feminine-indefinite-singular":"kilometrică","error-unrecognized-form-indefinite-masculine-plural":"kilometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"kilometrice","definite-error-unrecognized-form-masculine-neuter-singular":"kilometricul","definite-error-unrecognized-form-feminine-singular":"kilometrica","definite-error-unrecognized-form-masculine-plural":"kilometricii","definite-error-unrecognized-form-feminine-neuter-plural":"kilometricele"}},{"word":"kilometru","pos":"noun","definitions":["kilometer/kilometre"],"pronunciation":"/ki.loˈme.tru/","forms":{"plural":"kilometri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilometru","accusative-definite-nominative-singular":"kilometrul","accusative-indefinite-nominative-plural":"kilometri","accusative-definite-nominative-plural":"kilometrii","dative-genitive-indefinite-singular":"kilometru","dative-definite-genitive-singular":"kilometrului","dative-genitive-indefinite-plural":"kilometri","dative-definite-genitive-plural":"kilometrilor","singular-vocative":"kilometrule","plural-vocative":"kilometrilor","alternative":"chilometru"}},{"word":"kilometru pătrat","pos":"noun","definitions":["square kilometre"],"forms":{"plural":"kilometri pătrați"}},{"word":"kilomol","pos":"noun","definitions":["kilomole"],"forms":{"plural":"kilomoli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilomol","accusative-definite-nominative-singular":"kilomolul","accusative-indefinite-nominative-plural":"kilomoli","accusative-definite-nominative-plural":"kilomolii","dative-genitive-indefinite-singular":"kilomol","dative-definite-genitive-singular":"kilomolului","dative-genitive-indefinite-plural":"kilomoli","dative-definite-genitive-plural":"kilomolilor","singular-vocative":"kilomolule","plural-vocative":"kilomolilor"}},{"word":"kiloohm","pos":"noun","definitions":["kiloohm"],"forms":{"plural":"kiloohmi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kiloohm","accusative-definite-nominative-singular":"kiloohmul","accusative-indefinite-nominative-plural":"kiloohmi","accusative-definite-nominative-plural":"kiloohmii","dative-genitive-indefinite-singular":"kiloohm","dative-definite-genitive-singular":"kiloohmului","dative-genitive-indefinite-plural":"kiloohmi","dative-definite-genitive-plural":"kiloohmilor","singular-vocative":"kiloohmule","plural-vocative":"kiloohmilor"}},{"word":"kilotonă","pos":"noun","definitions":["kiloton"],"forms":{"plural":"kilotone","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kilotonă","accusative-definite-nominative-singular":"kilotona","accusative-indefinite-nominative-plural":"kilotone","accusative-definite-nominative-plural":"kilotonele","dative-genitive-indefinite-singular":"kilotone","dative-definite-genitive-singular":"kilotonei","dative-genitive-indefinite-plural":"kilotone","dative-definite-genitive-plural":"kilotonelor","singular-vocative":"kilotonă","plural-vocative":"kilotonelor"}},{"word":"kilovar","pos":"noun","definitions":["kilovar"],"forms":{"plural":"kilovari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilovar","accusative-definite-nominative-singular":"kilovarul","accusative-indefinite-nominative-plural":"kilovari","accusative-definite-nominative-plural":"kilovarii","dative-genitive-indefinite-singular":"kilovar","dative-definite-genitive-singular":"kilovarului","dative-genitive-indefinite-plural":"kilovari","dative-definite-genitive-plural":"kilovarilor","singular-vocative":"kilovarule","plural-vocative":"kilovarilor"}},{"word":"kilovolt","pos":"noun","definitions":["kilovolt"],"forms":{"plural":"kilovolți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilovolt","accusative-definite-nominative-singular":"kilovoltul","accusative-indefinite-nominative-plural":"kilovolți","accusative-definite-nominative-plural":"kilovolții","dative-genitive-indefinite-singular":"kilovolt","dative-definite-genitive-singular":"kilovoltului","dative-genitive-indefinite-plural":"kilovolți","dative-definite-genitive-plural":"kilovolților","singular-vocative":"kilovoltule","plural-vocative":"kilovolților"}},{"word":"kilowatt","pos":"noun","definitions":["kilowatt"],"forms":{"plural":"kilowați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilowatt","accusative-definite-nominative-singular":"kilowattul","accusative-indefinite-nominative-plural":"kilowați","accusative-definite-nominative-plural":"kilowații","dative-genitive-indefinite-singular":"kilowatt","dative-definite-genitive-singular":"kilowattului","dative-genitive-indefinite-plural":"kilowați","dative-definite-genitive-plural":"kilowaților","singular-vocative":"kilowattule","plural-vocative":"kilowaților"}},{"word":"kilowatt-oră","pos":"noun","definitions":["kilowatt-hour"],"forms":{"plural":"kilowați-oră"}},{"word":"kilt","pos":"noun","definitions":["kilt"],"forms":{"plural":"kilturi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilt","accusative-definite-nominative-singular":"kiltul","accusative-indefinite-nominative-plural":"kilturi","accusative-definite-nominative-plural":"kilturii","dative-genitive-indefinite-singular":"kilt","dative-definite-genitive-singular":"kiltului","dative-genitive-indefinite-plural":"kilturi","dative-definite-genitive-plural":"kilturilor","singular-vocative":"kiltule","plural-vocative":"kilturilor"}},{"word":"kimberlit","pos":"noun","definitions":["kimberlite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kimberlit","accusative-definite-nominative-singular":"kimberlitul","accusative-indefinite-nominative-plural":"kimberlite","accusative-definite-nominative-plural":"kimberlitele","dative-genitive-indefinite-singular":"kimberlit","dative-definite-genitive-singular":"kimberlitului","dative-genitive-indefinite-plural":"kimberlite","dative-definite-genitive-plural":"kimberlitelor","singular-vocative":"kimberlitule","plural-vocative":"kimberlitelor"}},{"word":"kimono","pos":"noun","definitions":["kimono"],"forms":{"plural":"kimonouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"kimono","accusative-definite-nominative-singular":"kimonoul","accusative-indefinite-nominative-plural":"kimonouri","accusative-definite-nominative-plural":"kimonourile","dative-genitive-indefinite-singular":"kimono","dative-definite-genitive-singular":"kimonoului","dative-genitive-indefinite-plural":"kimonouri","dative-definite-genitive-plural":"kimonourilor","singular-vocative":"kimonoule","plural-vocative":"kimonourilor"}},{"word":"kinestezic","pos":"adj","definitions":["kinesthetic"],"forms":{"feminine-singular":"kinestezică","masculine-plural":"kinestezici","feminine-neuter-plural":"kinestezice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kinestezic","error-unrecognized-form-feminine-indefinite-singular":"kinestezică","error-unrecognized-form-indefinite-masculine-plural":"kinestezici","error-unrecognized-form-feminine-indefinite-neuter-plural":"kinestezice","definite-error-unrecognized-form-masculine-neuter-singular":"kinestezicul","definite-error-unrecognized-form-feminine-singular":"kinestezica","definite-error-unrecognized-form-masculine-plural":"kinestezicii","definite-error-unrecognized-form-feminine-neuter-plural":"kinestezicele"}},{"word":"kinestezie","pos":"noun","definitions":["kinesthesia"],"forms":{"plural":"kinestezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"kinestezie","accusative-definite-nominative-singular":"kinestezia","accusative-indefinite-nominative-plural":"kinestezii","accusative-definite-nominative-plural":"kinesteziile","dative-genitive-indefinite-singular":"kinestezii","dative-definite-genitive-singular":"kinesteziei","dative-genitive-indefinite-plural":"kinestezii","dative-definite-genitive-plural":"kinesteziilor","singular-vocative":"kinestezie","plural-vocative":"kinesteziilor"}},{"word":"kinetoscop","pos":"noun","definitions":["kinetoscope"],"forms":{"plural":"kinetoscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kinetoscop","accusative-definite-nominative-singular":"kinetoscopul","accusative-indefinite-nominative-plural":"kinetoscoape","accusative-definite-nominative-plural":"kinetoscoapele","dative-genitive-indefinite-singular":"kinetoscop","dative-definite-genitive-singular":"kinetoscopului","dative-genitive-indefinite-plural":"kinetoscoape","dative-definite-genitive-plural":"kinetoscoapelor","singular-vocative":"kinetoscopule","plural-vocative":"kinetoscoapelor"}},{"word":"kinetoterapeut","pos":"noun","definitions":["kinesiotherapist"],"forms":{"plural":"kinetoterapeuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kinetoterapeut","accusative-definite-nominative-singular":"kinetoterapeutul","accusative-indefinite-nominative-plural":"kinetoterapeuți","accusative-definite-nominative-plural":"kinetoterapeuții","dative-genitive-indefinite-singular":"kinetoterapeut","dative-definite-genitive-singular":"kinetoterapeutului","dative-genitive-indefinite-plural":"kinetoterapeuți","dative-definite-genitive-plural":"kinetoterapeuților","singular-vocative":"kinetoterapeutule","plural-vocative":"kinetoterapeuților"}},{"word":"kinetoterapeută","pos":"noun","definitions":["female equivalent of kinetoterapeut"],"forms":{"plural":"kinetoterapeute","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kinetoterapeută","accusative-definite-nominative-singular":"kinetoterapeuta","accusative-indefinite-nominative-plural":"kinetoterapeute","accusative-definite-nominative-plural":"kinetoterapeutele","dative-genitive-indefinite-singular":"kinetoterapeute","dative-definite-genitive-singular":"kinetoterapeutei","dative-genitive-indefinite-plural":"kinetoterapeute","dative-definite-genitive-plural":"kinetoterapeutelor","singular-vocative":"kinetoterapeută","plural-vocative":"kinetoterapeutelor"}},{"word":"kinetoterapie","pos":"noun","definitions":["kinesiotherapy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"kinetoterapie","accusative-definite-nominative":"kinetoterapia","dative-genitive-indefinite":"kinetoterapii","dative-definite-genitive":"kinetoterapiei","vocative":"kinetoterapie"}},{"word":"kinezic","pos":"adj","definitions":["kinesic"],"forms":{"feminine-singular":"kinezică","masculine-plural":"kinezici","feminine-neuter-plural":"kinezice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kinezic","error-unrecognized-form-feminine-indefinite-singular":"kinezică","error-unrecognized-form-indefinite-masculine-plural":"kinezici","error-unrecognized-form-feminine-indefinite-neuter-plural":"kinezice","definite-error-unrecognized-form-masculine-neuter-singular":"kinezicul","definite-error-unrecognized-form-feminine-singular":"kinezica","definite-error-unrecognized-form-masculine-plural":"kinezicii","definite-error-unrecognized-form-feminine-neuter-plural":"kinezicele"}},{"word":"kineziologie","pos":"noun","definitions":["kinesiology"],"forms":{"plural":"kineziologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"kineziologie","accusative-definite-nominative-singular":"kineziologia","accusative-indefinite-nominative-plural":"kineziologii","accusative-definite-nominative-plural":"kineziologiile","dative-genitive-indefinite-singular":"kineziologii","dative-definite-genitive-singular":"kineziologiei","dative-genitive-indefinite-plural":"kineziologii","dative-definite-genitive-plural":"kineziologiilor","singular-vocative":"kineziologie","plural-vocative":"kineziologiilor"}},{"word":"kineziterapeut","pos":"noun","definitions":["physiotherapist"],"forms":{"plural":"kineziterapeuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kineziterapeut","accusative-definite-nominative-singular":"kineziterapeutul","accusative-indefinite-nominative-plural":"kineziterapeuți","accusative-definite-nominative-plural":"kineziterapeuții","dative-genitive-indefinite-singular":"kineziterapeut","dative-definite-genitive-singular":"kineziterapeutului","dative-genitive-indefinite-plural":"kineziterapeuți","dative-definite-genitive-plural":"kineziterapeuților","singular-vocative":"kineziterapeutule","plural-vocative":"kineziterapeuților"}},{"word":"kineziterapie","pos":"noun","definitions":["kinesiotherapy"],"forms":{"plural":"kineziterapii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"kineziterapie","accusative-definite-nominative-singular":"kineziterapia","accusative-indefinite-nominative-plural":"kineziterapii","accusative-definite-nominative-plural":"kineziterapiile","dative-genitive-indefinite-singular":"kineziterapii","dative-definite-genitive-singular":"kineziterapiei","dative-genitive-indefinite-plural":"kineziterapii","dative-definite-genitive-plural":"kineziterapiilor","singular-vocative":"kineziterapie","plural-vocative":"kineziterapiilor"}},{"word":"kip","pos":"noun","definitions":["kip"],"forms":{"plural":"kipi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kip","accusative-definite-nominative-singular":"kipul","accusative-indefinite-nominative-plural":"kipi","accusative-definite-nominative-plural":"kipii","dative-genitive-indefinite-singular":"kip","dative-definite-genitive-singular":"kipului","dative-genitive-indefinite-plural":"kipi","dative-definite-genitive-plural":"kipilor","singular-vocative":"kipule","plural-vocative":"kipilor"}},{"word":"kirghiz","pos":"noun","definitions":["Kyrgyz"],"pronunciation":"/kirˈɡiz/","forms":{"plural":"kirghizi","feminine":"equivalent kirghiză","alternative":"kârgâz"}},{"word":"kirghiz","pos":"adj","definitions":["Kyrgyz"],"pronunciation":"/kirˈɡiz/","forms":{"feminine-singular":"kirghiză","masculine-plural":"kirghizi","feminine-neuter-plural":"kirghize","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kirghiz","error-unrecognized-form-feminine-indefinite-singular":"kirghiză","error-unrecognized-form-indefinite-masculine-plural":"kirghizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"kirghize","definite-error-unrecognized-form-masculine-neuter-singular":"kirghizul","definite-error-unrecognized-form-feminine-singular":"kirghiza","definite-error-unrecognized-form-masculine-plural":"kirghizii","definite-error-unrecognized-form-feminine-neuter-plural":"kirghizele","alternative":"kârgâz"}},{"word":"kirghiză","pos":"noun","definitions":["female equivalent of kirghiz"],"forms":{"plural":"kirghize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kirghiză","accusative-definite-nominative-singular":"kirghiza","accusative-indefinite-nominative-plural":"kirghize","accusative-definite-nominative-plural":"kirghizele","dative-genitive-indefinite-singular":"kirghize","dative-definite-genitive-singular":"kirghizei","dative-genitive-indefinite-plural":"kirghize","dative-definite-genitive-plural":"kirghizelor","singular-vocative":"kirghiză","plural-vocative":"kirghizelor"}},{"word":"Kiriac","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Kiriac"}},{"word":"Kiribati","pos":"name","definitions":["Kiribati (a country consisting mostly of the Gilbert Islands archipelago, located in Micronesia in Oceania)"],"gender":"n"},{"word":"kiribatian","pos":"noun","definitions":["Kiribatian"],"pronunciation":"/ˌki.ri.ba.tiˈan/","forms":{"plural":"kiribatieni","feminine":"equivalent kiribatiană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kiribatian","accusative-definite-nominative-singular":"kiribatianul","accusative-indefinite-nominative-plural":"kiribatieni","accusative-definite-nominative-plural":"kiribatienii","dative-genitive-indefinite-singular":"kiribatian","dative-definite-genitive-singular":"kiribatianului","dative-genitive-indefinite-plural":"kiribatieni","dative-definite-genitive-plural":"kiribatienilor","singular-vocative":"kiribatianule","plural-vocative":"kiribatienilor"}},{"word":"kiribatian","pos":"adj","definitions":["Kiribatian"],"pronunciation":"/ˌki.ri.ba.tiˈan/","forms":{"feminine-singular":"kiribatiană","masculine-plural":"kiribatieni","feminine-neuter-plural":"kiribatiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kiribatian","error-unrecognized-form-feminine-indefinite-singular":"kiribatiană","error-unrecognized-form-indefinite-masculine-plural":"kiribatieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"kiribatiene","definite-error-unrecognized-form-masculine-neuter-singular":"kiribatianul","definite-error-unrecognized-form-feminine-singular":"kiribatiana","definite-error-unrecognized-form-masculine-plural":"kiribatienii","definite-error-unrecognized-form-feminine-neuter-plural":"kiribatienele"}},{"word":"kiribatiană","pos":"noun","definitions":["female equivalent of kiribatian"],"forms":{"plural":"kiribatiane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kiribatiană","accusative-definite-nominative-singular":"kiribatiana","accusative-indefinite-nominative-plural":"kiribatiene","accusative-definite-nominative-plural":"kiribatienele","dative-genitive-indefinite-singular":"kiribatiene","dative-definite-genitive-singular":"kiribatienei","dative-genitive-indefinite-plural":"kiribatiene","dative-definite-genitive-plural":"kiribatienelor","singular-vocative":"kiribatiană","plural-vocative":"kiribatienelor"}},{"word":"Kiriță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Kiriță"}},{"word":"Kirițescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Kirițescu"}},{"word":"Kisselef","pos":"name","definitions":["a neighbourhood of Bucharest, Romania","a park in Bucharest, Romania"],"gender":"m"},{"word":"kit","pos":"noun","definitions":["kit"],"forms":{"plural":"kituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"kit","accusative-definite-nominative-singular":"kitul","accusative-indefinite-nominative-plural":"kituri","accusative-definite-nominative-plural":"kiturile","dative-genitive-indefinite-singular":"kit","dative-definite-genitive-singular":"kitului","dative-genitive-indefinite-plural":"kituri","dative-definite-genitive-plural":"kiturilor","singular-vocative":"kitule","plural-vocative":"kiturilor"}},{"word":"kitsch","pos":"noun","definitions":["kitsch"],"forms":{"plural":"kitschuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"kitsch","accusative-definite-nominative-singular":"kitschul","accusative-indefinite-nominative-plural":"kitschuri","accusative-definite-nominative-plural":"kitschurile","dative-genitive-indefinite-singular":"kitsch","dative-definite-genitive-singular":"kitschului","dative-genitive-indefinite-plural":"kitschuri","dative-definite-genitive-plural":"kitschurilor","singular-vocative":"kitschule","plural-vocative":"kitschurilor"}},{"word":"kittsian","pos":"adj","definitions":["Kittsian"],"forms":{"feminine-singular":"kittsiană","masculine-plural":"kittsieni","feminine-neuter-plural":"kittsiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kittsian","error-unrecognized-form-feminine-indefinite-singular":"kittsiană","error-unrecognized-form-indefinite-masculine-plural":"kittsieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"kittsiene","definite-error-unrecognized-form-masculine-neuter-singular":"kittsianul","definite-error-unrecognized-form-feminine-singular":"kittsiana","definite-error-unrecognized-form-masculine-plural":"kittsienii","definite-error-unrecognized-form-feminine-neuter-plural":"kittsienele"}},{"word":"kittsian","pos":"noun","definitions":["Kittsian"],"forms":{"plural":"kittsieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kittsian","accusative-definite-nominative-singular":"kittsianul","accusative-indefinite-nominative-plural":"kittsieni","accusative-definite-nominative-plural":"kittsienii","dative-genitive-indefinite-singular":"kittsian","dative-definite-genitive-singular":"kittsianului","dative-genitive-indefinite-plural":"kittsieni","dative-definite-genitive-plural":"kittsienilor","singular-vocative":"kittsianule","plural-vocative":"kittsienilor"}},{"word":"kittsiană","pos":"noun","definitions":["female equivalent of kittsian"],"forms":{"plural":"kittsiane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kittsiană","accusative-definite-nominative-singular":"kittsiana","accusative-indefinite-nominative-plural":"kittsiane","accusative-definite-nominative-plural":"kittsianele","dative-genitive-indefinite-singular":"kittsiane","dative-definite-genitive-singular":"kittsianei","dative-genitive-indefinite-plural":"kittsiane","dative-definite-genitive-plural":"kittsianelor","singular-vocative":"kittsiană","plural-vocative":"kittsianelor"}},{"word":"Kițescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Kițescu"}},{"word":"Kițu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Kițu"}},{"word":"Kivu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Kivu"}},{"word":"kiwi","pos":"noun","definitions":["kiwi"],"forms":{"plural":"kiwi","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"kiwi","accusative-definite-nominative-singular":"kiwiul","accusative-indefinite-nominative-plural":"kiwi","accusative-definite-nominative-plural":"kiwile","dative-genitive-indefinite-singular":"kiwi","dative-definite-genitive-singular":"kiwii","dative-genitive-indefinite-plural":"kiwi","dative-definite-genitive-plural":"kiwilor","singular-vocative":"-","plural-vocative":"-"}},{"word":"klingoniană","pos":"noun","definitions":["female equivalent of klingonian"],"forms":{"plural":"klingoniene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"klingoniană","accusative-definite-nominative-singular":"klingoniana","accusative-indefinite-nominative-plural":"klingoniene","accusative-definite-nominative-plural":"klingonienele","dative-genitive-indefinite-singular":"klingoniene","dative-definite-genitive-singular":"klingonienei","dative-genitive-indefinite-plural":"klingoniene","dative-definite-genitive-plural":"klingonienelor","singular-vocative":"klingoniană","plural-vocative":"klingonienelor"}},{"word":"knesset","pos":"noun","definitions":["Knesset"],"forms":{"plural":"knessete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"knesset","accusative-definite-nominative-singular":"knessetul","accusative-indefinite-nominative-plural":"knessete","accusative-definite-nominative-plural":"knessetele","dative-genitive-indefinite-singular":"knesset","dative-definite-genitive-singular":"knessetului","dative-genitive-indefinite-plural":"knessete","dative-definite-genitive-plural":"knessetelor","singular-vocative":"knessetule","plural-vocative":"knessetelor"}},{"word":"knockout","pos":"noun","definitions":["knockout"],"forms":{"plural":"knockouturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"knockout","accusative-definite-nominative-singular":"knockoutul","accusative-indefinite-nominative-plural":"knockouturi","accusative-definite-nominative-plural":"knockouturile","dative-genitive-indefinite-singular":"knockout","dative-definite-genitive-singular":"knockoutului","dative-genitive-indefinite-plural":"knockouturi","dative-definite-genitive-plural":"knockouturilor","singular-vocative":"knockoutule","plural-vocative":"knockouturilor"}},{"word":"knockouta","pos":"verb","definitions":["to knockout"],"forms":{"canonical":"a knockouta 1st conjugation","present-singular-third-person":"knockoutează","participle-past":"knockoutat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a knockouta","gerund":"knockoutând","first-person-indicative-present-singular":"knockoutez","indicative-present-second-person-singular":"knockoutezi","indicative-present-singular-third-person":"knockoutează","first-person-indicative-plural-present":"knockoutăm","indicative-plural-present-second-person":"knockoutați","indicative-plural-present-third-person":"knockoutează","first-person-imperfect-indicative-singular":"knockoutam","imperfect-indicative-second-person-singular":"knockoutai","imperfect-indicative-singular-third-person":"knockouta","first-person-imperfect-indicative-plural":"knockoutam","imperfect-indicative-plural-second-person":"knockoutați","imperfect-indicative-plural-third-person":"knockoutau","first-person-indicative-perfect-singular":"knockoutai","indicative-perfect-second-person-singular":"knockoutași","indicative-perfect-singular-third-person":"knockoută","first-person-indicative-perfect-plural":"knockoutarăm","indicative-perfect-plural-second-person":"knockoutarăți","indicative-perfect-plural-third-person":"knockoutară","first-person-indicative-pluperfect-singular":"knockoutasem","indicative-pluperfect-second-person-singular":"knockoutaseși","indicative-pluperfect-singular-third-person":"knockoutase","first-person-indicative-pluperfect-plural":"knockoutaserăm","indicative-pluperfect-plural-second-person":"knockoutaserăți","indicative-pluperfect-plural-third-person":"knockoutaseră","first-person-present-singular-subjunctive":"să knockoutez","present-second-person-singular-subjunctive":"să knockoutezi","present-singular-subjunctive-third-person":"să knockouteze","first-person-plural-present-subjunctive":"să knockoutăm","plural-present-second-person-subjunctive":"să knockoutați","plural-present-subjunctive-third-person":"să knockouteze","imperative-second-person-singular":"knockoutează","imperative-plural-second-person":"knockoutați","imperative-negative-second-person-singular":"nu knockouta","imperative-negative-plural-second-person":"nu knockoutați"}},{"word":"know-how","pos":"noun","definitions":["know-how"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"know-how","accusative-definite-nominative":"know-howul","dative-genitive-indefinite":"know-how","dative-definite-genitive":"know-howului","vocative":"know-howule"}},{"word":"koala","pos":"noun","definitions":["koala"],"pronunciation":"/ˈko̯a.la/","forms":{"plural":"koala","table-tags":"no-table-tags","accusative-indefinite-nominative-singular":"koala","accusative-definite-nominative-singular":"koalaul","accusative-indefinite-nominative-plural":"koala","accusative-definite-nominative-plural":"-","dative-genitive-indefinite-singular":"koala","dative-definite-genitive-singular":"koalaului","dative-genitive-indefinite-plural":"koala","dative-definite-genitive-plural":"-","singular-vocative":"koala","plural-vocative":"-"}},{"word":"kobold","pos":"noun","definitions":["kobold"],"forms":{"plural":"kobolzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kobold","accusative-definite-nominative-singular":"koboldul","accusative-indefinite-nominative-plural":"kobolzi","accusative-definite-nominative-plural":"kobolzii","dative-genitive-indefinite-singular":"kobold","dative-definite-genitive-singular":"koboldului","dative-genitive-indefinite-plural":"kobolzi","dative-definite-genitive-plural":"kobolzilor","singular-vocative":"koboldule","plural-vocative":"kobolzilor"}},{"word":"Kogălniceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Kogălniceanu"}},{"word":"Kogălniceni","pos":"name","definitions":["a village in Alexandru I. Cuza, Iași County, Romania"],"gender":"m"},{"word":"koine","pos":"noun","definitions":["koine, lingua franca"]},{"word":"kosovar","pos":"noun","definitions":["Kosovar, Kosovan"],"pronunciation":"/ko.soˈvar/","forms":{"plural":"kosovari","feminine":"equivalent kosovară"}},{"word":"kosovar","pos":"adj","definitions":["Kosovar, Kosovan"],"pronunciation":"/ko.soˈvar/","forms":{"feminine-singular":"kosovară","masculine-plural":"kosovari","feminine-neuter-plural":"kosovare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kosovar","error-unrecognized-form-feminine-indefinite-singular":"kosovară","error-unrecognized-form-indefinite-masculine-plural":"kosovari","error-unrecognized-form-feminine-indefinite-neuter-plural":"kosovare","definite-error-unrecognized-form-masculine-neuter-singular":"kosovarul","definite-error-unrecognized-form-feminine-singular":"kosovara","definite-error-unrecognized-form-masculine-plural":"kosovarii","definite-error-unrecognized-form-feminine-neuter-plural":"kosovarele"}},{"word":"kosovară","pos":"noun","definitions":["female equivalent of kosovar"],"forms":{"plural":"kosovare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kosovară","accusative-definite-nominative-singular":"kosovara","accusative-indefinite-nominative-plural":"kosovare","accusative-definite-nominative-plural":"kosovarele","dative-genitive-indefinite-singular":"kosovare","dative-definite-genitive-singular":"kosovarei","dative-genitive-indefinite-plural":"kosovare","dative-definite-genitive-plural":"kosovarelor","singular-vocative":"kosovară","plural-vocative":"kosovarelor"}},{"word":"Kosovo","pos":"name","definitions":["Kosovo (a partly-recognized country on the Balkan Peninsula in Southeast Europe)"],"gender":"n"},{"word":"Kovaci","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Kovaci"}},{"word":"kremlinologist","pos":"noun","definitions":["Kremlinologist"],"forms":{"plural":"kremlinologiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kremlinologist","accusative-definite-nominative-singular":"kremlinologistul","accusative-indefinite-nominative-plural":"kremlinologiști","accusative-definite-nominative-plural":"kremlinologiștii","dative-genitive-indefinite-singular":"kremlinologist","dative-definite-genitive-singular":"kremlinologistului","dative-genitive-indefinite-plural":"kremlinologiști","dative-definite-genitive-plural":"kremlinologiștilor","singular-vocative":"kremlinologistule","plural-vocative":"kremlinologiștilor"}},{"word":"krennerit","pos":"noun","definitions":["krennerite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"krennerit","accusative-definite-nominative":"krenneritul","dative-genitive-indefinite":"krennerit","dative-definite-genitive":"krenneritului","vocative":"krenneritule"}},{"word":"Kretzulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Kretzulescu"}},{"word":"Krețulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Krețulescu"}},{"word":"kripton","pos":"noun","definitions":["krypton"],"pronunciation":"/kripˈton/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kripton","accusative-definite-nominative":"kriptonul","dative-genitive-indefinite":"kripton","dative-definite-genitive":"kriptonului","vocative":"kriptonule"}},{"word":"kronprinz","pos":"noun","definitions":["crown prince (of a German-speaking country)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"kronprinz","accusative-definite-nominative":"kronprinzul","dative-genitive-indefinite":"kronprinz","dative-definite-genitive":"kronprinzului","vocative":"kronprinzule"}},{"word":"Ku Klux Klan","pos":"name","definitions":["Ku Klux Klan"],"gender":"n"},{"word":"Kuala Lumpur","pos":"name","definitions":["Kuala Lumpur (a federal territory, the capital and largest city of Malaysia, located in the western part of the country)"],"gender":"f"},{"word":"kurd","pos":"noun","definitions":["Kurd"],"pronunciation":"/kurd/","forms":{"plural":"kurzi","feminine":"equivalent kurdă"}},{"word":"kurd","pos":"adj","definitions":["Kurdish"],"pronunciation":"/kurd/","forms":{"feminine-singular":"kurdă","masculine-plural":"kurzi","feminine-neuter-plural":"kurde","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kurd","error-unrecognized-form-feminine-indefinite-singular":"kurdă","error-unrecognized-form-indefinite-masculine-plural":"kurzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"kurde","definite-error-unrecognized-form-masculine-neuter-singular":"kurdul","definite-error-unrecognized-form-feminine-singular":"kurda","definite-error-unrecognized-form-masculine-plural":"kurzii","definite-error-unrecognized-form-feminine-neuter-plural":"kurdele"}},{"word":"kurdă","pos":"noun","definitions":["female equivalent of kurd"],"forms":{"plural":"kurde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kurdă","accusative-definite-nominative-singular":"kurda","accusative-indefinite-nominative-plural":"kurde","accusative-definite-nominative-plural":"kurdele","dative-genitive-indefinite-singular":"kurde","dative-definite-genitive-singular":"kurdei","dative-genitive-indefinite-plural":"kurde","dative-definite-genitive-plural":"kurdelor","singular-vocative":"kurdă","plural-vocative":"kurdelor"}},{"word":"kuwaitian","pos":"adj","definitions":["Kuwaiti"],"forms":{"feminine-singular":"kuwaitiană","masculine-plural":"kuwaitieni","feminine-neuter-plural":"kuwaitiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kuwaitian","error-unrecognized-form-feminine-indefinite-singular":"kuwaitiană","error-unrecognized-form-indefinite-masculine-plural":"kuwaitieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"kuwaitiene","definite-error-unrecognized-form-masculine-neuter-singular":"kuwaitianul","definite-error-unrecognized-form-feminine-singular":"kuwaitiana","definite-error-unrecognized-form-masculine-plural":"kuwaitienii","definite-error-unrecognized-form-feminine-neuter-plural":"kuwaitienele"}},{"word":"kuwaitian","pos":"noun","definitions":["Kuwaiti"],"forms":{"plural":"kuwaitieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kuwaitian","accusative-definite-nominative-singular":"kuwaitianul","accusative-indefinite-nominative-plural":"kuwaitieni","accusative-definite-nominative-plural":"kuwaitienii","dative-genitive-indefinite-singular":"kuwaitian","dative-definite-genitive-singular":"kuwaitianului","dative-genitive-indefinite-plural":"kuwaitieni","dative-definite-genitive-plural":"kuwaitienilor","singular-vocative":"kuwaitianule","plural-vocative":"kuwaitienilor"}},{"word":"kuwaitiană","pos":"noun","definitions":["female equivalent of kuwaitian"],"forms":{"plural":"kuwaitiane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kuwaitiană","accusative-definite-nominative-singular":"kuwaitiana","accusative-indefinite-nominative-plural":"kuwaitiane","accusative-definite-nominative-plural":"kuwaitianele","dative-genitive-indefinite-singular":"kuwaitiane","dative-definite-genitive-singular":"kuwaitianei","dative-genitive-indefinite-plural":"kuwaitiane","dative-definite-genitive-plural":"kuwaitianelor","singular-vocative":"kuwaitiană","plural-vocative":"kuwaitianelor"}},{"word":"Kuweit","pos":"name","definitions":["Kuwait (a country in West Asia in the Middle East)"],"pronunciation":"/kuˈvejt/","gender":"n","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"Kuweit","accusative-definite-nominative":"Kuweitul","dative-genitive-indefinite":"Kuweit","dative-definite-genitive":"Kuweitului","vocative":"Kuweitule"}},{"word":"kuweitian","pos":"noun","definitions":["Kuwaiti"],"forms":{"plural":"kuweitieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kuweitian","accusative-definite-nominative-singular":"kuweitianul","accusative-indefinite-nominative-plural":"kuweitieni","accusative-definite-nominative-plural":"kuweitienii","dative-genitive-indefinite-singular":"kuweitian","dative-definite-genitive-singular":"kuweitianului","dative-genitive-indefinite-plural":"kuweitieni","dative-definite-genitive-plural":"kuweitienilor","singular-vocative":"kuweitianule","plural-vocative":"kuweitienilor"}},{"word":"kuweitiană","pos":"noun","definitions":["female equivalent of kuweitian"],"forms":{"plural":"kuweitiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kuweitiană","accusative-definite-nominative-singular":"kuweitiana","accusative-indefinite-nominative-plural":"kuweitiene","accusative-definite-nominative-plural":"kuweitienele","dative-genitive-indefinite-singular":"kuweitiene","dative-definite-genitive-singular":"kuweitienei","dative-genitive-indefinite-plural":"kuweitiene","dative-definite-genitive-plural":"kuweitienelor","singular-vocative":"kuweitiană","plural-vocative":"kuweitienelor"}},{"word":"kyat","pos":"noun","definitions":["kyat"],"forms":{"plural":"kyați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kyat","accusative-definite-nominative-singular":"kyatul","accusative-indefinite-nominative-plural":"kyați","accusative-definite-nominative-plural":"kyații","dative-genitive-indefinite-singular":"kyat","dative-definite-genitive-singular":"kyatului","dative-genitive-indefinite-plural":"kyați","dative-definite-genitive-plural":"kyaților","singular-vocative":"kyatule","plural-vocative":"kyaților"}}];
+export default [{"word":"K","pos":"character","definitions":["The fourteenth letter of the Romanian alphabet, called ca or capa and written in the Latin script."],"pronunciation":"/k/","forms":{"lowercase":"k"}},{"word":"k","pos":"character","definitions":["The fourteenth letter of the Romanian alphabet, called ca or capa and written in the Latin script."],"pronunciation":"/kapa/","forms":{"uppercase":"K"}},{"word":"k","pos":"conj","definitions":["abbreviation of că (“that, because”)"],"pronunciation":"/kapa/","examples":[{"ro":"hai k ma culc k-i trz","en":null},{"ro":"(Hai că mă culc că-i târziu)","en":null},{"ro":"i'm gonna go sleep cuz it's getting late","en":null}]},{"word":"kabil","pos":"noun","definitions":["Kabyle (person)"],"forms":{"plural":"kabili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kabil","accusative-definite-nominative-singular":"kabilul","accusative-indefinite-nominative-plural":"kabili","accusative-definite-nominative-plural":"kabilii","dative-genitive-indefinite-singular":"kabil","dative-definite-genitive-singular":"kabilului","dative-genitive-indefinite-plural":"kabili","dative-definite-genitive-plural":"kabililor","singular-vocative":"kabilule","plural-vocative":"kabililor"}},{"word":"kabilă","pos":"noun","definitions":["female equivalent of kabil"],"forms":{"plural":"kabile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kabilă","accusative-definite-nominative-singular":"kabila","accusative-indefinite-nominative-plural":"kabile","accusative-definite-nominative-plural":"kabilele","dative-genitive-indefinite-singular":"kabile","dative-definite-genitive-singular":"kabilei","dative-genitive-indefinite-plural":"kabile","dative-definite-genitive-plural":"kabilelor","singular-vocative":"kabilă","plural-vocative":"kabilelor"}},{"word":"kabuki","pos":"noun","definitions":["kabuki"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kabuki","accusative-definite-nominative":"kabukiul","dative-genitive-indefinite":"kabuki","dative-definite-genitive":"kabukiului","vocative":"kabukiule"}},{"word":"kainit","pos":"noun","definitions":["kainite"],"forms":{"plural":"kainite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kainit","accusative-definite-nominative-singular":"kainitul","accusative-indefinite-nominative-plural":"kainite","accusative-definite-nominative-plural":"kainitele","dative-genitive-indefinite-singular":"kainit","dative-definite-genitive-singular":"kainitului","dative-genitive-indefinite-plural":"kainite","dative-definite-genitive-plural":"kainitelor","singular-vocative":"kainitule","plural-vocative":"kainitelor"}},{"word":"kaizer","pos":"noun","definitions":["kaiser","bacon"],"forms":{"plural":"kaizeri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kaizer","accusative-definite-nominative-singular":"kaizerul","accusative-indefinite-nominative-plural":"kaizeri","accusative-definite-nominative-plural":"kaizerii","dative-genitive-indefinite-singular":"kaizer","dative-definite-genitive-singular":"kaizerului","dative-genitive-indefinite-plural":"kaizeri","dative-definite-genitive-plural":"kaizerilor","singular-vocative":"kaizerule","plural-vocative":"kaizerilor"}},{"word":"kakemono","pos":"noun","definitions":["kakemono"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kakemono","accusative-definite-nominative":"kakemonoul","dative-genitive-indefinite":"kakemono","dative-definite-genitive":"kakemonoului","vocative":"kakemonoule"}},{"word":"kaki","pos":"adj","definitions":["khaki"],"pronunciation":"/kaˈki/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kaki","error-unrecognized-form-feminine-indefinite-singular":"kaki","error-unrecognized-form-indefinite-masculine-plural":"kaki","error-unrecognized-form-feminine-indefinite-neuter-plural":"kaki","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"kaki","pos":"noun","definitions":["khaki (colour)"],"pronunciation":"/kaˈki/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kaki","accusative-definite-nominative":"kakiul","dative-genitive-indefinite":"kaki","dative-definite-genitive":"kakiului","vocative":"kakiule"}},{"word":"kaki","pos":"noun","definitions":["persimmon"],"pronunciation":"/ˈkaki/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kaki","accusative-definite-nominative":"kakiul","dative-genitive-indefinite":"kaki","dative-definite-genitive":"kakiului","vocative":"kakiule"}},{"word":"kakiu","pos":"adj","definitions":["alternative form of kaki"],"forms":{"feminine-singular":"kakie","plural":"kakii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kakiu","error-unrecognized-form-feminine-indefinite-singular":"kakie","error-unrecognized-form-indefinite-masculine-plural":"kakii","error-unrecognized-form-feminine-indefinite-neuter-plural":"kakii","definite-error-unrecognized-form-masculine-neuter-singular":"kakiul","definite-error-unrecognized-form-feminine-singular":"kakia","definite-error-unrecognized-form-masculine-plural":"kakiii","definite-error-unrecognized-form-feminine-neuter-plural":"kakiile"}},{"word":"kala-azar","pos":"noun","definitions":["kala-azar"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kala-azar","accusative-definite-nominative":"kala-azarul","dative-genitive-indefinite":"kala-azar","dative-definite-genitive":"kala-azarului","vocative":"kala-azarule"}},{"word":"kalașnikov","pos":"noun","definitions":["Kalashnikov rifle"],"forms":{"plural":"kalașnikovuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"kalașnikov","accusative-definite-nominative-singular":"kalașnikovul","accusative-indefinite-nominative-plural":"kalașnikovuri","accusative-definite-nominative-plural":"kalașnikovurile","dative-genitive-indefinite-singular":"kalașnikov","dative-definite-genitive-singular":"kalașnikovului","dative-genitive-indefinite-plural":"kalașnikovuri","dative-definite-genitive-plural":"kalașnikovurilor","singular-vocative":"kalașnikovule","plural-vocative":"kalașnikovurilor"}},{"word":"kaliu","pos":"noun","definitions":["potassium (chemical element)"],"pronunciation":"/ˈkalju/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kaliu","accusative-definite-nominative":"kaliul","dative-genitive-indefinite":"kaliu","dative-definite-genitive":"kaliului","vocative":"kaliule"}},{"word":"kalmâc","pos":"noun","definitions":["alternative form of calmuc"],"forms":{"plural":"kalmâci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kalmâc","accusative-definite-nominative-singular":"kalmâcul","accusative-indefinite-nominative-plural":"kalmâci","accusative-definite-nominative-plural":"kalmâcii","dative-genitive-indefinite-singular":"kalmâc","dative-definite-genitive-singular":"kalmâcului","dative-genitive-indefinite-plural":"kalmâci","dative-definite-genitive-plural":"kalmâcilor","singular-vocative":"kalmâcule","plural-vocative":"kalmâcilor"}},{"word":"kalmâcă","pos":"noun","definitions":["female equivalent of kalmâc"],"forms":{"plural":"kalmâce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kalmâcă","accusative-definite-nominative-singular":"kalmâca","accusative-indefinite-nominative-plural":"kalmâce","accusative-definite-nominative-plural":"kalmâcele","dative-genitive-indefinite-singular":"kalmâce","dative-definite-genitive-singular":"kalmâcei","dative-genitive-indefinite-plural":"kalmâce","dative-definite-genitive-plural":"kalmâcelor","singular-vocative":"kalmâcă","plural-vocative":"kalmâcelor"}},{"word":"Kama Sutra","pos":"name","definitions":["Kama Sutra"],"gender":"f"},{"word":"kamala","pos":"noun","definitions":["kamala"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"kamala","accusative-definite-nominative":"kamalaua","dative-genitive-indefinite":"{{{pl}}}","dative-definite-genitive":"{{{pl}}}i","vocative":"-"}},{"word":"kamikaze","pos":"noun","definitions":["kamikaze"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kamikaze","accusative-definite-nominative":"kamikazeul","dative-genitive-indefinite":"kamikaze","dative-definite-genitive":"kamikazeului","vocative":"kamikazeule"}},{"word":"kampuchian","pos":"noun","definitions":["Kampuchean"],"forms":{"plural":"kampuchieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kampuchian","accusative-definite-nominative-singular":"kampuchianul","accusative-indefinite-nominative-plural":"kampuchieni","accusative-definite-nominative-plural":"kampuchienii","dative-genitive-indefinite-singular":"kampuchian","dative-definite-genitive-singular":"kampuchianului","dative-genitive-indefinite-plural":"kampuchieni","dative-definite-genitive-plural":"kampuchienilor","singular-vocative":"kampuchianule","plural-vocative":"kampuchienilor"}},{"word":"kampuchiană","pos":"noun","definitions":["female equivalent of kampuchian"],"forms":{"plural":"kampuchiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kampuchiană","accusative-definite-nominative-singular":"kampuchiana","accusative-indefinite-nominative-plural":"kampuchiene","accusative-definite-nominative-plural":"kampuchienele","dative-genitive-indefinite-singular":"kampuchiene","dative-definite-genitive-singular":"kampuchienei","dative-genitive-indefinite-plural":"kampuchiene","dative-definite-genitive-plural":"kampuchienelor","singular-vocative":"kampuchiană","plural-vocative":"kampuchienelor"}},{"word":"kantian","pos":"noun","definitions":["Kantian"],"forms":{"plural":"kantieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kantian","accusative-definite-nominative-singular":"kantianul","accusative-indefinite-nominative-plural":"kantieni","accusative-definite-nominative-plural":"kantienii","dative-genitive-indefinite-singular":"kantian","dative-definite-genitive-singular":"kantianului","dative-genitive-indefinite-plural":"kantieni","dative-definite-genitive-plural":"kantienilor","singular-vocative":"kantianule","plural-vocative":"kantienilor"}},{"word":"kantiană","pos":"noun","definitions":["female equivalent of kantian"],"forms":{"plural":"kantiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kantiană","accusative-definite-nominative-singular":"kantiana","accusative-indefinite-nominative-plural":"kantiene","accusative-definite-nominative-plural":"kantienele","dative-genitive-indefinite-singular":"kantiene","dative-definite-genitive-singular":"kantienei","dative-genitive-indefinite-plural":"kantiene","dative-definite-genitive-plural":"kantienelor","singular-vocative":"kantiană","plural-vocative":"kantienelor"}},{"word":"kantianism","pos":"noun","definitions":["Kantianism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kantianism","accusative-definite-nominative-singular":"kantianismul","accusative-indefinite-nominative-plural":"kantianisme","accusative-definite-nominative-plural":"kantianismele","dative-genitive-indefinite-singular":"kantianism","dative-definite-genitive-singular":"kantianismului","dative-genitive-indefinite-plural":"kantianisme","dative-definite-genitive-plural":"kantianismelor","singular-vocative":"kantianismule","plural-vocative":"kantianismelor"}},{"word":"kantism","pos":"noun","definitions":["Kantianism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kantism","accusative-definite-nominative-singular":"kantismul","accusative-indefinite-nominative-plural":"kantisme","accusative-definite-nominative-plural":"kantismele","dative-genitive-indefinite-singular":"kantism","dative-definite-genitive-singular":"kantismului","dative-genitive-indefinite-plural":"kantisme","dative-definite-genitive-plural":"kantismelor","singular-vocative":"kantismule","plural-vocative":"kantismelor"}},{"word":"kappa","pos":"noun","definitions":["kappa"],"forms":{"plural":"kappa","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kappa","accusative-definite-nominative-singular":"kappaul","accusative-indefinite-nominative-plural":"kappa","accusative-definite-nominative-plural":"kappai","dative-genitive-indefinite-singular":"kappa","dative-definite-genitive-singular":"kappaului","dative-genitive-indefinite-plural":"kappa","dative-definite-genitive-plural":"kappalor","singular-vocative":"kappaule","plural-vocative":"kappalor"}},{"word":"Karakalpakstan","pos":"name","definitions":["Karakalpakstan (an autonomous republic in northwestern Uzbekistan; capital: Nukus)"],"pronunciation":"/karakalpakˈstan/","gender":"n","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"Karakalpakstan","accusative-definite-nominative":"Karakalpakstanul","dative-genitive-indefinite":"Karakalpakstan","dative-definite-genitive":"Karakalpakstanului","vocative":"Karakalpakstanule"}},{"word":"karaoke","pos":"noun","definitions":["karaoke"]},{"word":"karate","pos":"noun","definitions":["karate"],"pronunciation":"/kaˈra.te/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"karate","accusative-definite-nominative":"karateul","dative-genitive-indefinite":"karate","dative-definite-genitive":"karateului","vocative":"karateule"}},{"word":"kârgâz","pos":"noun","definitions":["Kyrgyz"],"pronunciation":"/kɨrˈɡɨz/","forms":{"plural":"kârgâzi","feminine":"equivalent kârgâză","alternative":"kirghiz"}},{"word":"kârgâz","pos":"adj","definitions":["Kyrgyz"],"pronunciation":"/kɨrˈɡɨz/","forms":{"feminine-singular":"kârgâză","masculine-plural":"kârgâzi","feminine-neuter-plural":"kârgâze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kârgâz","error-unrecognized-form-feminine-indefinite-singular":"kârgâză","error-unrecognized-form-indefinite-masculine-plural":"kârgâzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"kârgâze","definite-error-unrecognized-form-masculine-neuter-singular":"kârgâzul","definite-error-unrecognized-form-feminine-singular":"kârgâza","definite-error-unrecognized-form-masculine-plural":"kârgâzii","definite-error-unrecognized-form-feminine-neuter-plural":"kârgâzele","alternative":"kirghiz"}},{"word":"Kârgâzstan","pos":"name","definitions":["Kyrgyzstan (a country in Central Asia, bordering on Kazakhstan, Uzbekistan, Tajikistan and China)"],"gender":"n"},{"word":"karma","pos":"noun","definitions":["karma"]},{"word":"kasidă","pos":"noun","definitions":["kassid"],"forms":{"plural":"kaside","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kasidă","accusative-definite-nominative-singular":"kasida","accusative-indefinite-nominative-plural":"kaside","accusative-definite-nominative-plural":"kasidele","dative-genitive-indefinite-singular":"kaside","dative-definite-genitive-singular":"kasidei","dative-genitive-indefinite-plural":"kaside","dative-definite-genitive-plural":"kasidelor","singular-vocative":"kasidă","plural-vocative":"kasidelor"}},{"word":"kasolit","pos":"noun","definitions":["kasolite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kasolit","accusative-definite-nominative-singular":"kasolitul","accusative-indefinite-nominative-plural":"kasolite","accusative-definite-nominative-plural":"kasolitele","dative-genitive-indefinite-singular":"kasolit","dative-definite-genitive-singular":"kasolitului","dative-genitive-indefinite-plural":"kasolite","dative-definite-genitive-plural":"kasolitelor","singular-vocative":"kasolitule","plural-vocative":"kasolitelor"}},{"word":"kazah","pos":"noun","definitions":["Kazakh"],"forms":{"plural":"kazahi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kazah","accusative-definite-nominative-singular":"kazahul","accusative-indefinite-nominative-plural":"kazahi","accusative-definite-nominative-plural":"kazahii","dative-genitive-indefinite-singular":"kazah","dative-definite-genitive-singular":"kazahului","dative-genitive-indefinite-plural":"kazahi","dative-definite-genitive-plural":"kazahilor","singular-vocative":"kazahule","plural-vocative":"kazahilor"}},{"word":"kazahă","pos":"noun","definitions":["female equivalent of kazah"],"forms":{"plural":"kazahe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kazahă","accusative-definite-nominative-singular":"kazaha","accusative-indefinite-nominative-plural":"kazahe","accusative-definite-nominative-plural":"kazahele","dative-genitive-indefinite-singular":"kazahe","dative-definite-genitive-singular":"kazahei","dative-genitive-indefinite-plural":"kazahe","dative-definite-genitive-plural":"kazahelor","singular-vocative":"kazahă","plural-vocative":"kazahelor"}},{"word":"kazahi","pos":"noun","definitions":["indefinite plural of kazah"],"pronunciation":"[kaˈzahʲ]","gender":"m"},{"word":"Kazahstan","pos":"name","definitions":["Kazakhstan (a country in Central Asia and Eastern Europe)"],"pronunciation":"/ka.zahˈstan/","gender":"n","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"Kazahstan","accusative-definite-nominative":"Kazahstanul","dative-genitive-indefinite":"Kazahstan","dative-definite-genitive":"Kazahstanului","vocative":"Kazahstanule"}},{"word":"kediv","pos":"noun","definitions":["khedive"],"forms":{"plural":"kedivi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kediv","accusative-definite-nominative-singular":"kedivul","accusative-indefinite-nominative-plural":"kedivi","accusative-definite-nominative-plural":"kedivii","dative-genitive-indefinite-singular":"kediv","dative-definite-genitive-singular":"kedivului","dative-genitive-indefinite-plural":"kedivi","dative-definite-genitive-plural":"kedivilor","singular-vocative":"kedivule","plural-vocative":"kedivilor"}},{"word":"Kelemen","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Kelemen"}},{"word":"kelvin","pos":"noun","definitions":["a kelvin (unit of temperature)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"kelvin","accusative-definite-nominative":"kelvinul","dative-genitive-indefinite":"kelvin","dative-definite-genitive":"kelvinului","vocative":"kelvinule"}},{"word":"kemalism","pos":"noun","definitions":["Kemalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kemalism","accusative-definite-nominative":"kemalismul","dative-genitive-indefinite":"kemalism","dative-definite-genitive":"kemalismului","vocative":"kemalismule"}},{"word":"kenotron","pos":"noun","definitions":["kenotron"],"forms":{"plural":"kenotroane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kenotron","accusative-definite-nominative-singular":"kenotronul","accusative-indefinite-nominative-plural":"kenotroane","accusative-definite-nominative-plural":"kenotroanele","dative-genitive-indefinite-singular":"kenotron","dative-definite-genitive-singular":"kenotronului","dative-genitive-indefinite-plural":"kenotroane","dative-definite-genitive-plural":"kenotroanelor","singular-vocative":"kenotronule","plural-vocative":"kenotroanelor"}},{"word":"Kentucky","pos":"name","definitions":["Kentucky (a state of the United States)"],"gender":"n"},{"word":"kenyan","pos":"adj","definitions":["Kenyan"],"forms":{"feminine-singular":"kenyană","masculine-plural":"kenyeni","feminine-neuter-plural":"kenyene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kenyan","error-unrecognized-form-feminine-indefinite-singular":"kenyană","error-unrecognized-form-indefinite-masculine-plural":"kenyeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"kenyene","definite-error-unrecognized-form-masculine-neuter-singular":"kenyanul","definite-error-unrecognized-form-feminine-singular":"kenyana","definite-error-unrecognized-form-masculine-plural":"kenyenii","definite-error-unrecognized-form-feminine-neuter-plural":"kenyenele"}},{"word":"kenyan","pos":"noun","definitions":["Kenyan"],"forms":{"plural":"kenyeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kenyan","accusative-definite-nominative-singular":"kenyanul","accusative-indefinite-nominative-plural":"kenyeni","accusative-definite-nominative-plural":"kenyenii","dative-genitive-indefinite-singular":"kenyan","dative-definite-genitive-singular":"kenyanului","dative-genitive-indefinite-plural":"kenyeni","dative-definite-genitive-plural":"kenyenilor","singular-vocative":"kenyanule","plural-vocative":"kenyenilor"}},{"word":"kenyană","pos":"noun","definitions":["female equivalent of kenyan"],"forms":{"plural":"kenyane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kenyană","accusative-definite-nominative-singular":"kenyana","accusative-indefinite-nominative-plural":"kenyane","accusative-definite-nominative-plural":"kenyanele","dative-genitive-indefinite-singular":"kenyane","dative-definite-genitive-singular":"kenyanei","dative-genitive-indefinite-plural":"kenyane","dative-definite-genitive-plural":"kenyanelor","singular-vocative":"kenyană","plural-vocative":"kenyanelor"}},{"word":"keramit","pos":"noun","definitions":["ceramic paving"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"keramit","accusative-definite-nominative-singular":"keramitul","accusative-indefinite-nominative-plural":"keramite","accusative-definite-nominative-plural":"keramitele","dative-genitive-indefinite-singular":"keramit","dative-definite-genitive-singular":"keramitului","dative-genitive-indefinite-plural":"keramite","dative-definite-genitive-plural":"keramitelor","singular-vocative":"keramitule","plural-vocative":"keramitelor"}},{"word":"kerosen","pos":"noun","definitions":["kerosene"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kerosen","accusative-definite-nominative":"kerosenul","dative-genitive-indefinite":"kerosen","dative-definite-genitive":"kerosenului","vocative":"kerosenule"}},{"word":"kersantit","pos":"noun","definitions":["kersantite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kersantit","accusative-definite-nominative":"kersantitul","dative-genitive-indefinite":"kersantit","dative-definite-genitive":"kersantitului","vocative":"kersantitule"}},{"word":"keta","pos":"noun","definitions":["chum salmon"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"keta","accusative-definite-nominative":"ketaua","dative-genitive-indefinite":"-","dative-definite-genitive":"-i","vocative":"-"}},{"word":"ketchup","pos":"noun","definitions":["ketchup"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ketchup","accusative-definite-nominative":"ketchupul","dative-genitive-indefinite":"ketchup","dative-definite-genitive":"ketchupului","vocative":"ketchupule"}},{"word":"keynesian","pos":"noun","definitions":["Keynesian"],"forms":{"plural":"keynesieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"keynesian","accusative-definite-nominative-singular":"keynesianul","accusative-indefinite-nominative-plural":"keynesieni","accusative-definite-nominative-plural":"keynesienii","dative-genitive-indefinite-singular":"keynesian","dative-definite-genitive-singular":"keynesianului","dative-genitive-indefinite-plural":"keynesieni","dative-definite-genitive-plural":"keynesienilor","singular-vocative":"keynesianule","plural-vocative":"keynesienilor"}},{"word":"keynesism","pos":"noun","definitions":["Keynesianism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"keynesism","accusative-definite-nominative":"keynesismul","dative-genitive-indefinite":"keynesism","dative-definite-genitive":"keynesismului","vocative":"keynesismule"}},{"word":"khmer","pos":"noun","definitions":["Khmer"],"forms":{"plural":"khmeri","feminine":"equivalent khmeră","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"khmer","accusative-definite-nominative-singular":"khmerul","accusative-indefinite-nominative-plural":"khmeri","accusative-definite-nominative-plural":"khmerii","dative-genitive-indefinite-singular":"khmer","dative-definite-genitive-singular":"khmerului","dative-genitive-indefinite-plural":"khmeri","dative-definite-genitive-plural":"khmerilor","singular-vocative":"khmerule","plural-vocative":"khmerilor"}},{"word":"khmeră","pos":"noun","definitions":["female equivalent of khmer","Khmer language"],"forms":{"plural":"khmere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"khmeră","accusative-definite-nominative-singular":"khmera","accusative-indefinite-nominative-plural":"khmere","accusative-definite-nominative-plural":"khmerele","dative-genitive-indefinite-singular":"khmere","dative-definite-genitive-singular":"khmerei","dative-genitive-indefinite-plural":"khmere","dative-definite-genitive-plural":"khmerelor","singular-vocative":"khmeră","plural-vocative":"khmerelor"}},{"word":"kibbutz","pos":"noun","definitions":["kibbutz"],"forms":{"plural":"kibbutzuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"kibbutz","accusative-definite-nominative-singular":"kibbutzul","accusative-indefinite-nominative-plural":"kibbutzuri","accusative-definite-nominative-plural":"kibbutzurile","dative-genitive-indefinite-singular":"kibbutz","dative-definite-genitive-singular":"kibbutzului","dative-genitive-indefinite-plural":"kibbutzuri","dative-definite-genitive-plural":"kibbutzurilor","singular-vocative":"kibbutzule","plural-vocative":"kibbutzurilor"}},{"word":"kidnapping","pos":"noun","definitions":["kidnapping"],"pronunciation":"[kidˈnapiŋ]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kidnapping","accusative-definite-nominative":"kidnapping-ul","dative-genitive-indefinite":"kidnapping","dative-definite-genitive":"kidnapping-ului","vocative":"kidnapping-ule"}},{"word":"kieserit","pos":"noun","definitions":["kieserite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kieserit","accusative-definite-nominative":"kieseritul","dative-genitive-indefinite":"kieserit","dative-definite-genitive":"kieseritului","vocative":"kieseritule"}},{"word":"kil","pos":"noun","definitions":["kilo"],"forms":{"plural":"kile","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kil","accusative-definite-nominative-singular":"kilul","accusative-indefinite-nominative-plural":"kile","accusative-definite-nominative-plural":"kilele","dative-genitive-indefinite-singular":"kil","dative-definite-genitive-singular":"kilului","dative-genitive-indefinite-plural":"kile","dative-definite-genitive-plural":"kilelor","singular-vocative":"kilule","plural-vocative":"kilelor"}},{"word":"kilo","pos":"noun","definitions":["alternative form of kil"],"forms":{"plural":"kilo","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kilo","accusative-definite-nominative-singular":"kiloul","accusative-indefinite-nominative-plural":"kilo","accusative-definite-nominative-plural":"kilole","dative-genitive-indefinite-singular":"kilo","dative-definite-genitive-singular":"kiloului","dative-genitive-indefinite-plural":"kilo","dative-definite-genitive-plural":"kilolor","singular-vocative":"kiloule","plural-vocative":"kilolor"}},{"word":"kilo-","pos":"prefix","definitions":["kilo-"]},{"word":"kiloamper","pos":"noun","definitions":["kiloampere"],"forms":{"plural":"kiloamperi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kiloamper","accusative-definite-nominative-singular":"kiloamperul","accusative-indefinite-nominative-plural":"kiloamperi","accusative-definite-nominative-plural":"kiloamperii","dative-genitive-indefinite-singular":"kiloamper","dative-definite-genitive-singular":"kiloamperului","dative-genitive-indefinite-plural":"kiloamperi","dative-definite-genitive-plural":"kiloamperilor","singular-vocative":"kiloamperule","plural-vocative":"kiloamperilor"}},{"word":"kilocalorie","pos":"noun","definitions":["kilocalorie"],"forms":{"plural":"kilocalorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"kilocalorie","accusative-definite-nominative-singular":"kilocaloria","accusative-indefinite-nominative-plural":"kilocalorii","accusative-definite-nominative-plural":"kilocaloriile","dative-genitive-indefinite-singular":"kilocalorii","dative-definite-genitive-singular":"kilocaloriei","dative-genitive-indefinite-plural":"kilocalorii","dative-definite-genitive-plural":"kilocaloriilor","singular-vocative":"kilocalorie","plural-vocative":"kilocaloriilor"}},{"word":"kilociclu","pos":"noun","definitions":["kilocycle"],"forms":{"plural":"kilocicli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilociclu","accusative-definite-nominative-singular":"kilocicluul","accusative-indefinite-nominative-plural":"kilocicli","accusative-definite-nominative-plural":"kilociclii","dative-genitive-indefinite-singular":"kilociclu","dative-definite-genitive-singular":"kilocicluului","dative-genitive-indefinite-plural":"kilocicli","dative-definite-genitive-plural":"kilociclilor","singular-vocative":"kilocicluule","plural-vocative":"kilociclilor"}},{"word":"kilocuvânt","pos":"noun","definitions":["kiloword"],"forms":{"plural":"kilocuvinte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kilocuvânt","accusative-definite-nominative-singular":"kilocuvântul","accusative-indefinite-nominative-plural":"kilocuvinte","accusative-definite-nominative-plural":"kilocuvintele","dative-genitive-indefinite-singular":"kilocuvânt","dative-definite-genitive-singular":"kilocuvântului","dative-genitive-indefinite-plural":"kilocuvinte","dative-definite-genitive-plural":"kilocuvintelor","singular-vocative":"kilocuvântule","plural-vocative":"kilocuvintelor"}},{"word":"kiloelectronvolt","pos":"noun","definitions":["kiloelectronvolt"],"forms":{"plural":"kiloelectronvolți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kiloelectronvolt","accusative-definite-nominative-singular":"kiloelectronvoltul","accusative-indefinite-nominative-plural":"kiloelectronvolți","accusative-definite-nominative-plural":"kiloelectronvolții","dative-genitive-indefinite-singular":"kiloelectronvolt","dative-definite-genitive-singular":"kiloelectronvoltului","dative-genitive-indefinite-plural":"kiloelectronvolți","dative-definite-genitive-plural":"kiloelectronvolților","singular-vocative":"kiloelectronvoltule","plural-vocative":"kiloelectronvolților"}},{"word":"kilogram","pos":"noun","definitions":["kilogram"],"pronunciation":"/ki.loˈɡram/","forms":{"alternative":"chilogram"}},{"word":"kilogram-forță","pos":"noun","definitions":["kilogram-force"],"forms":{"plural":"kilograme-forță"}},{"word":"kilogram-metru","pos":"noun","definitions":["kilogram-metre"],"forms":{"plural":"kilogram-metri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilogram-metru","accusative-definite-nominative-singular":"kilogram-metruul","accusative-indefinite-nominative-plural":"kilogram-metri","accusative-definite-nominative-plural":"kilogram-metrii","dative-genitive-indefinite-singular":"kilogram-metru","dative-definite-genitive-singular":"kilogram-metruului","dative-genitive-indefinite-plural":"kilogram-metri","dative-definite-genitive-plural":"kilogram-metrilor","singular-vocative":"kilogram-metruule","plural-vocative":"kilogram-metrilor"}},{"word":"kilogrammetru","pos":"noun","definitions":["alternative spelling of kilogram-metru"],"forms":{"plural":"kilogrammetri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilogrammetru","accusative-definite-nominative-singular":"kilogrammetrul","accusative-indefinite-nominative-plural":"kilogrammetri","accusative-definite-nominative-plural":"kilogrammetrii","dative-genitive-indefinite-singular":"kilogrammetru","dative-definite-genitive-singular":"kilogrammetrului","dative-genitive-indefinite-plural":"kilogrammetri","dative-definite-genitive-plural":"kilogrammetrilor","singular-vocative":"kilogrammetrule","plural-vocative":"kilogrammetrilor"}},{"word":"kilohertz","pos":"noun","definitions":["kilohertz"],"forms":{"plural":"kilohertzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilohertz","accusative-definite-nominative-singular":"kilohertzul","accusative-indefinite-nominative-plural":"kilohertzi","accusative-definite-nominative-plural":"kilohertzii","dative-genitive-indefinite-singular":"kilohertz","dative-definite-genitive-singular":"kilohertzului","dative-genitive-indefinite-plural":"kilohertzi","dative-definite-genitive-plural":"kilohertzilor","singular-vocative":"kilohertzule","plural-vocative":"kilohertzilor"}},{"word":"kilojoule","pos":"noun","definitions":["kilojoule"],"forms":{"plural":"kilojouli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilojoule","accusative-definite-nominative-singular":"kilojouleul","accusative-indefinite-nominative-plural":"kilojouli","accusative-definite-nominative-plural":"kilojoulii","dative-genitive-indefinite-singular":"kilojoule","dative-definite-genitive-singular":"kilojouleului","dative-genitive-indefinite-plural":"kilojouli","dative-definite-genitive-plural":"kilojoulilor","singular-vocative":"kilojouleule","plural-vocative":"kilojoulilor"}},{"word":"kilolitru","pos":"noun","definitions":["kiloliter"],"forms":{"plural":"kilolitri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilolitru","accusative-definite-nominative-singular":"kilolitrul","accusative-indefinite-nominative-plural":"kilolitri","accusative-definite-nominative-plural":"kilolitrii","dative-genitive-indefinite-singular":"kilolitru","dative-definite-genitive-singular":"kilolitrului","dative-genitive-indefinite-plural":"kilolitri","dative-definite-genitive-plural":"kilolitrilor","singular-vocative":"kilolitrule","plural-vocative":"kilolitrilor"}},{"word":"kilometra","pos":"verb","definitions":["to mileage"],"forms":{"canonical":"a kilometra 1st conjugation","present-singular-third-person":"kilometrează","participle-past":"kilometrat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a kilometra","gerund":"kilometrând","first-person-indicative-present-singular":"kilometrez","indicative-present-second-person-singular":"kilometrezi","indicative-present-singular-third-person":"kilometrează","first-person-indicative-plural-present":"kilometrăm","indicative-plural-present-second-person":"kilometrați","indicative-plural-present-third-person":"kilometrează","first-person-imperfect-indicative-singular":"kilometram","imperfect-indicative-second-person-singular":"kilometrai","imperfect-indicative-singular-third-person":"kilometra","first-person-imperfect-indicative-plural":"kilometram","imperfect-indicative-plural-second-person":"kilometrați","imperfect-indicative-plural-third-person":"kilometrau","first-person-indicative-perfect-singular":"kilometrai","indicative-perfect-second-person-singular":"kilometrași","indicative-perfect-singular-third-person":"kilometră","first-person-indicative-perfect-plural":"kilometrarăm","indicative-perfect-plural-second-person":"kilometrarăți","indicative-perfect-plural-third-person":"kilometrară","first-person-indicative-pluperfect-singular":"kilometrasem","indicative-pluperfect-second-person-singular":"kilometraseși","indicative-pluperfect-singular-third-person":"kilometrase","first-person-indicative-pluperfect-plural":"kilometraserăm","indicative-pluperfect-plural-second-person":"kilometraserăți","indicative-pluperfect-plural-third-person":"kilometraseră","first-person-present-singular-subjunctive":"să kilometrez","present-second-person-singular-subjunctive":"să kilometrezi","present-singular-subjunctive-third-person":"să kilometreze","first-person-plural-present-subjunctive":"să kilometrăm","plural-present-second-person-subjunctive":"să kilometrați","plural-present-subjunctive-third-person":"să kilometreze","imperative-second-person-singular":"kilometrează","imperative-plural-second-person":"kilometrați","imperative-negative-second-person-singular":"nu kilometra","imperative-negative-plural-second-person":"nu kilometrați"}},{"word":"kilometraj","pos":"noun","definitions":["tachometer"],"forms":{"plural":"kilometraje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kilometraj","accusative-definite-nominative-singular":"kilometrajul","accusative-indefinite-nominative-plural":"kilometraje","accusative-definite-nominative-plural":"kilometrajele","dative-genitive-indefinite-singular":"kilometraj","dative-definite-genitive-singular":"kilometrajului","dative-genitive-indefinite-plural":"kilometraje","dative-definite-genitive-plural":"kilometrajelor","singular-vocative":"kilometrajule","plural-vocative":"kilometrajelor"}},{"word":"kilometrat","pos":"adj","definitions":["milestoned"],"forms":{"feminine-singular":"kilometrată","masculine-plural":"kilometrați","feminine-neuter-plural":"kilometrate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kilometrat","error-unrecognized-form-feminine-indefinite-singular":"kilometrată","error-unrecognized-form-indefinite-masculine-plural":"kilometrați","error-unrecognized-form-feminine-indefinite-neuter-plural":"kilometrate","definite-error-unrecognized-form-masculine-neuter-singular":"kilometratul","definite-error-unrecognized-form-feminine-singular":"kilometrata","definite-error-unrecognized-form-masculine-plural":"kilometrații","definite-error-unrecognized-form-feminine-neuter-plural":"kilometratele"}},{"word":"kilometrat","pos":"verb","definitions":["past participle of kilometra"],"forms":{"participle-past":"of kilometra"}},{"word":"kilometric","pos":"adj","definitions":["kilometric","very long, endless, interminable"],"forms":{"feminine-singular":"kilometrică","masculine-plural":"kilometrici","feminine-neuter-plural":"kilometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kilometric","error-unrecognized-form-feminine-indefinite-singular":"kilometrică","error-unrecognized-form-indefinite-masculine-plural":"kilometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"kilometrice","definite-error-unrecognized-form-masculine-neuter-singular":"kilometricul","definite-error-unrecognized-form-feminine-singular":"kilometrica","definite-error-unrecognized-form-masculine-plural":"kilometricii","definite-error-unrecognized-form-feminine-neuter-plural":"kilometricele"}},{"word":"kilometru","pos":"noun","definitions":["kilometer/kilometre"],"pronunciation":"/ki.loˈme.tru/","forms":{"plural":"kilometri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilometru","accusative-definite-nominative-singular":"kilometrul","accusative-indefinite-nominative-plural":"kilometri","accusative-definite-nominative-plural":"kilometrii","dative-genitive-indefinite-singular":"kilometru","dative-definite-genitive-singular":"kilometrului","dative-genitive-indefinite-plural":"kilometri","dative-definite-genitive-plural":"kilometrilor","singular-vocative":"kilometrule","plural-vocative":"kilometrilor","alternative":"chilometru"}},{"word":"kilometru pătrat","pos":"noun","definitions":["square kilometre"],"forms":{"plural":"kilometri pătrați"}},{"word":"kilomol","pos":"noun","definitions":["kilomole"],"forms":{"plural":"kilomoli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilomol","accusative-definite-nominative-singular":"kilomolul","accusative-indefinite-nominative-plural":"kilomoli","accusative-definite-nominative-plural":"kilomolii","dative-genitive-indefinite-singular":"kilomol","dative-definite-genitive-singular":"kilomolului","dative-genitive-indefinite-plural":"kilomoli","dative-definite-genitive-plural":"kilomolilor","singular-vocative":"kilomolule","plural-vocative":"kilomolilor"}},{"word":"kiloohm","pos":"noun","definitions":["kiloohm"],"forms":{"plural":"kiloohmi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kiloohm","accusative-definite-nominative-singular":"kiloohmul","accusative-indefinite-nominative-plural":"kiloohmi","accusative-definite-nominative-plural":"kiloohmii","dative-genitive-indefinite-singular":"kiloohm","dative-definite-genitive-singular":"kiloohmului","dative-genitive-indefinite-plural":"kiloohmi","dative-definite-genitive-plural":"kiloohmilor","singular-vocative":"kiloohmule","plural-vocative":"kiloohmilor"}},{"word":"kilotonă","pos":"noun","definitions":["kiloton"],"forms":{"plural":"kilotone","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kilotonă","accusative-definite-nominative-singular":"kilotona","accusative-indefinite-nominative-plural":"kilotone","accusative-definite-nominative-plural":"kilotonele","dative-genitive-indefinite-singular":"kilotone","dative-definite-genitive-singular":"kilotonei","dative-genitive-indefinite-plural":"kilotone","dative-definite-genitive-plural":"kilotonelor","singular-vocative":"kilotonă","plural-vocative":"kilotonelor"}},{"word":"kilovar","pos":"noun","definitions":["kilovar"],"forms":{"plural":"kilovari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilovar","accusative-definite-nominative-singular":"kilovarul","accusative-indefinite-nominative-plural":"kilovari","accusative-definite-nominative-plural":"kilovarii","dative-genitive-indefinite-singular":"kilovar","dative-definite-genitive-singular":"kilovarului","dative-genitive-indefinite-plural":"kilovari","dative-definite-genitive-plural":"kilovarilor","singular-vocative":"kilovarule","plural-vocative":"kilovarilor"}},{"word":"kilovolt","pos":"noun","definitions":["kilovolt"],"forms":{"plural":"kilovolți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilovolt","accusative-definite-nominative-singular":"kilovoltul","accusative-indefinite-nominative-plural":"kilovolți","accusative-definite-nominative-plural":"kilovolții","dative-genitive-indefinite-singular":"kilovolt","dative-definite-genitive-singular":"kilovoltului","dative-genitive-indefinite-plural":"kilovolți","dative-definite-genitive-plural":"kilovolților","singular-vocative":"kilovoltule","plural-vocative":"kilovolților"}},{"word":"kilowatt","pos":"noun","definitions":["kilowatt"],"forms":{"plural":"kilowați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilowatt","accusative-definite-nominative-singular":"kilowattul","accusative-indefinite-nominative-plural":"kilowați","accusative-definite-nominative-plural":"kilowații","dative-genitive-indefinite-singular":"kilowatt","dative-definite-genitive-singular":"kilowattului","dative-genitive-indefinite-plural":"kilowați","dative-definite-genitive-plural":"kilowaților","singular-vocative":"kilowattule","plural-vocative":"kilowaților"}},{"word":"kilowatt-oră","pos":"noun","definitions":["kilowatt-hour"],"forms":{"plural":"kilowați-oră"}},{"word":"kilt","pos":"noun","definitions":["kilt"],"forms":{"plural":"kilturi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kilt","accusative-definite-nominative-singular":"kiltul","accusative-indefinite-nominative-plural":"kilturi","accusative-definite-nominative-plural":"kilturii","dative-genitive-indefinite-singular":"kilt","dative-definite-genitive-singular":"kiltului","dative-genitive-indefinite-plural":"kilturi","dative-definite-genitive-plural":"kilturilor","singular-vocative":"kiltule","plural-vocative":"kilturilor"}},{"word":"kimberlit","pos":"noun","definitions":["kimberlite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kimberlit","accusative-definite-nominative-singular":"kimberlitul","accusative-indefinite-nominative-plural":"kimberlite","accusative-definite-nominative-plural":"kimberlitele","dative-genitive-indefinite-singular":"kimberlit","dative-definite-genitive-singular":"kimberlitului","dative-genitive-indefinite-plural":"kimberlite","dative-definite-genitive-plural":"kimberlitelor","singular-vocative":"kimberlitule","plural-vocative":"kimberlitelor"}},{"word":"kimono","pos":"noun","definitions":["kimono"],"forms":{"plural":"kimonouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"kimono","accusative-definite-nominative-singular":"kimonoul","accusative-indefinite-nominative-plural":"kimonouri","accusative-definite-nominative-plural":"kimonourile","dative-genitive-indefinite-singular":"kimono","dative-definite-genitive-singular":"kimonoului","dative-genitive-indefinite-plural":"kimonouri","dative-definite-genitive-plural":"kimonourilor","singular-vocative":"kimonoule","plural-vocative":"kimonourilor"}},{"word":"kinestezic","pos":"adj","definitions":["kinesthetic"],"forms":{"feminine-singular":"kinestezică","masculine-plural":"kinestezici","feminine-neuter-plural":"kinestezice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kinestezic","error-unrecognized-form-feminine-indefinite-singular":"kinestezică","error-unrecognized-form-indefinite-masculine-plural":"kinestezici","error-unrecognized-form-feminine-indefinite-neuter-plural":"kinestezice","definite-error-unrecognized-form-masculine-neuter-singular":"kinestezicul","definite-error-unrecognized-form-feminine-singular":"kinestezica","definite-error-unrecognized-form-masculine-plural":"kinestezicii","definite-error-unrecognized-form-feminine-neuter-plural":"kinestezicele"}},{"word":"kinestezie","pos":"noun","definitions":["kinesthesia"],"forms":{"plural":"kinestezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"kinestezie","accusative-definite-nominative-singular":"kinestezia","accusative-indefinite-nominative-plural":"kinestezii","accusative-definite-nominative-plural":"kinesteziile","dative-genitive-indefinite-singular":"kinestezii","dative-definite-genitive-singular":"kinesteziei","dative-genitive-indefinite-plural":"kinestezii","dative-definite-genitive-plural":"kinesteziilor","singular-vocative":"kinestezie","plural-vocative":"kinesteziilor"}},{"word":"kinetoscop","pos":"noun","definitions":["kinetoscope"],"forms":{"plural":"kinetoscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"kinetoscop","accusative-definite-nominative-singular":"kinetoscopul","accusative-indefinite-nominative-plural":"kinetoscoape","accusative-definite-nominative-plural":"kinetoscoapele","dative-genitive-indefinite-singular":"kinetoscop","dative-definite-genitive-singular":"kinetoscopului","dative-genitive-indefinite-plural":"kinetoscoape","dative-definite-genitive-plural":"kinetoscoapelor","singular-vocative":"kinetoscopule","plural-vocative":"kinetoscoapelor"}},{"word":"kinetoterapeut","pos":"noun","definitions":["kinesiotherapist"],"forms":{"plural":"kinetoterapeuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kinetoterapeut","accusative-definite-nominative-singular":"kinetoterapeutul","accusative-indefinite-nominative-plural":"kinetoterapeuți","accusative-definite-nominative-plural":"kinetoterapeuții","dative-genitive-indefinite-singular":"kinetoterapeut","dative-definite-genitive-singular":"kinetoterapeutului","dative-genitive-indefinite-plural":"kinetoterapeuți","dative-definite-genitive-plural":"kinetoterapeuților","singular-vocative":"kinetoterapeutule","plural-vocative":"kinetoterapeuților"}},{"word":"kinetoterapeută","pos":"noun","definitions":["female equivalent of kinetoterapeut"],"forms":{"plural":"kinetoterapeute","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kinetoterapeută","accusative-definite-nominative-singular":"kinetoterapeuta","accusative-indefinite-nominative-plural":"kinetoterapeute","accusative-definite-nominative-plural":"kinetoterapeutele","dative-genitive-indefinite-singular":"kinetoterapeute","dative-definite-genitive-singular":"kinetoterapeutei","dative-genitive-indefinite-plural":"kinetoterapeute","dative-definite-genitive-plural":"kinetoterapeutelor","singular-vocative":"kinetoterapeută","plural-vocative":"kinetoterapeutelor"}},{"word":"kinetoterapie","pos":"noun","definitions":["kinesiotherapy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"kinetoterapie","accusative-definite-nominative":"kinetoterapia","dative-genitive-indefinite":"kinetoterapii","dative-definite-genitive":"kinetoterapiei","vocative":"kinetoterapie"}},{"word":"kinezic","pos":"adj","definitions":["kinesic"],"forms":{"feminine-singular":"kinezică","masculine-plural":"kinezici","feminine-neuter-plural":"kinezice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kinezic","error-unrecognized-form-feminine-indefinite-singular":"kinezică","error-unrecognized-form-indefinite-masculine-plural":"kinezici","error-unrecognized-form-feminine-indefinite-neuter-plural":"kinezice","definite-error-unrecognized-form-masculine-neuter-singular":"kinezicul","definite-error-unrecognized-form-feminine-singular":"kinezica","definite-error-unrecognized-form-masculine-plural":"kinezicii","definite-error-unrecognized-form-feminine-neuter-plural":"kinezicele"}},{"word":"kineziologie","pos":"noun","definitions":["kinesiology"],"forms":{"plural":"kineziologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"kineziologie","accusative-definite-nominative-singular":"kineziologia","accusative-indefinite-nominative-plural":"kineziologii","accusative-definite-nominative-plural":"kineziologiile","dative-genitive-indefinite-singular":"kineziologii","dative-definite-genitive-singular":"kineziologiei","dative-genitive-indefinite-plural":"kineziologii","dative-definite-genitive-plural":"kineziologiilor","singular-vocative":"kineziologie","plural-vocative":"kineziologiilor"}},{"word":"kineziterapeut","pos":"noun","definitions":["physiotherapist"],"forms":{"plural":"kineziterapeuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kineziterapeut","accusative-definite-nominative-singular":"kineziterapeutul","accusative-indefinite-nominative-plural":"kineziterapeuți","accusative-definite-nominative-plural":"kineziterapeuții","dative-genitive-indefinite-singular":"kineziterapeut","dative-definite-genitive-singular":"kineziterapeutului","dative-genitive-indefinite-plural":"kineziterapeuți","dative-definite-genitive-plural":"kineziterapeuților","singular-vocative":"kineziterapeutule","plural-vocative":"kineziterapeuților"}},{"word":"kineziterapie","pos":"noun","definitions":["kinesiotherapy"],"forms":{"plural":"kineziterapii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"kineziterapie","accusative-definite-nominative-singular":"kineziterapia","accusative-indefinite-nominative-plural":"kineziterapii","accusative-definite-nominative-plural":"kineziterapiile","dative-genitive-indefinite-singular":"kineziterapii","dative-definite-genitive-singular":"kineziterapiei","dative-genitive-indefinite-plural":"kineziterapii","dative-definite-genitive-plural":"kineziterapiilor","singular-vocative":"kineziterapie","plural-vocative":"kineziterapiilor"}},{"word":"kip","pos":"noun","definitions":["kip"],"forms":{"plural":"kipi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kip","accusative-definite-nominative-singular":"kipul","accusative-indefinite-nominative-plural":"kipi","accusative-definite-nominative-plural":"kipii","dative-genitive-indefinite-singular":"kip","dative-definite-genitive-singular":"kipului","dative-genitive-indefinite-plural":"kipi","dative-definite-genitive-plural":"kipilor","singular-vocative":"kipule","plural-vocative":"kipilor"}},{"word":"kirghiz","pos":"noun","definitions":["Kyrgyz"],"pronunciation":"/kirˈɡiz/","forms":{"plural":"kirghizi","feminine":"equivalent kirghiză","alternative":"kârgâz"}},{"word":"kirghiz","pos":"adj","definitions":["Kyrgyz"],"pronunciation":"/kirˈɡiz/","forms":{"feminine-singular":"kirghiză","masculine-plural":"kirghizi","feminine-neuter-plural":"kirghize","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kirghiz","error-unrecognized-form-feminine-indefinite-singular":"kirghiză","error-unrecognized-form-indefinite-masculine-plural":"kirghizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"kirghize","definite-error-unrecognized-form-masculine-neuter-singular":"kirghizul","definite-error-unrecognized-form-feminine-singular":"kirghiza","definite-error-unrecognized-form-masculine-plural":"kirghizii","definite-error-unrecognized-form-feminine-neuter-plural":"kirghizele","alternative":"kârgâz"}},{"word":"kirghiză","pos":"noun","definitions":["female equivalent of kirghiz"],"forms":{"plural":"kirghize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kirghiză","accusative-definite-nominative-singular":"kirghiza","accusative-indefinite-nominative-plural":"kirghize","accusative-definite-nominative-plural":"kirghizele","dative-genitive-indefinite-singular":"kirghize","dative-definite-genitive-singular":"kirghizei","dative-genitive-indefinite-plural":"kirghize","dative-definite-genitive-plural":"kirghizelor","singular-vocative":"kirghiză","plural-vocative":"kirghizelor"}},{"word":"Kiriac","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Kiriac"}},{"word":"Kiribati","pos":"name","definitions":["Kiribati (a country consisting mostly of the Gilbert Islands archipelago, located in Micronesia in Oceania)"],"gender":"n"},{"word":"kiribatian","pos":"noun","definitions":["Kiribatian"],"pronunciation":"/ˌki.ri.ba.tiˈan/","forms":{"plural":"kiribatieni","feminine":"equivalent kiribatiană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kiribatian","accusative-definite-nominative-singular":"kiribatianul","accusative-indefinite-nominative-plural":"kiribatieni","accusative-definite-nominative-plural":"kiribatienii","dative-genitive-indefinite-singular":"kiribatian","dative-definite-genitive-singular":"kiribatianului","dative-genitive-indefinite-plural":"kiribatieni","dative-definite-genitive-plural":"kiribatienilor","singular-vocative":"kiribatianule","plural-vocative":"kiribatienilor"}},{"word":"kiribatian","pos":"adj","definitions":["Kiribatian"],"pronunciation":"/ˌki.ri.ba.tiˈan/","forms":{"feminine-singular":"kiribatiană","masculine-plural":"kiribatieni","feminine-neuter-plural":"kiribatiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kiribatian","error-unrecognized-form-feminine-indefinite-singular":"kiribatiană","error-unrecognized-form-indefinite-masculine-plural":"kiribatieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"kiribatiene","definite-error-unrecognized-form-masculine-neuter-singular":"kiribatianul","definite-error-unrecognized-form-feminine-singular":"kiribatiana","definite-error-unrecognized-form-masculine-plural":"kiribatienii","definite-error-unrecognized-form-feminine-neuter-plural":"kiribatienele"}},{"word":"kiribatiană","pos":"noun","definitions":["female equivalent of kiribatian"],"forms":{"plural":"kiribatiane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kiribatiană","accusative-definite-nominative-singular":"kiribatiana","accusative-indefinite-nominative-plural":"kiribatiene","accusative-definite-nominative-plural":"kiribatienele","dative-genitive-indefinite-singular":"kiribatiene","dative-definite-genitive-singular":"kiribatienei","dative-genitive-indefinite-plural":"kiribatiene","dative-definite-genitive-plural":"kiribatienelor","singular-vocative":"kiribatiană","plural-vocative":"kiribatienelor"}},{"word":"Kiriță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Kiriță"}},{"word":"Kirițescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Kirițescu"}},{"word":"Kisselef","pos":"name","definitions":["a neighbourhood of Bucharest, Romania","a park in Bucharest, Romania"],"gender":"m"},{"word":"kit","pos":"noun","definitions":["kit"],"forms":{"plural":"kituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"kit","accusative-definite-nominative-singular":"kitul","accusative-indefinite-nominative-plural":"kituri","accusative-definite-nominative-plural":"kiturile","dative-genitive-indefinite-singular":"kit","dative-definite-genitive-singular":"kitului","dative-genitive-indefinite-plural":"kituri","dative-definite-genitive-plural":"kiturilor","singular-vocative":"kitule","plural-vocative":"kiturilor"}},{"word":"Kițescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Kițescu"}},{"word":"kitsch","pos":"noun","definitions":["kitsch"],"forms":{"plural":"kitschuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"kitsch","accusative-definite-nominative-singular":"kitschul","accusative-indefinite-nominative-plural":"kitschuri","accusative-definite-nominative-plural":"kitschurile","dative-genitive-indefinite-singular":"kitsch","dative-definite-genitive-singular":"kitschului","dative-genitive-indefinite-plural":"kitschuri","dative-definite-genitive-plural":"kitschurilor","singular-vocative":"kitschule","plural-vocative":"kitschurilor"}},{"word":"kittsian","pos":"adj","definitions":["Kittsian"],"forms":{"feminine-singular":"kittsiană","masculine-plural":"kittsieni","feminine-neuter-plural":"kittsiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kittsian","error-unrecognized-form-feminine-indefinite-singular":"kittsiană","error-unrecognized-form-indefinite-masculine-plural":"kittsieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"kittsiene","definite-error-unrecognized-form-masculine-neuter-singular":"kittsianul","definite-error-unrecognized-form-feminine-singular":"kittsiana","definite-error-unrecognized-form-masculine-plural":"kittsienii","definite-error-unrecognized-form-feminine-neuter-plural":"kittsienele"}},{"word":"kittsian","pos":"noun","definitions":["Kittsian"],"forms":{"plural":"kittsieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kittsian","accusative-definite-nominative-singular":"kittsianul","accusative-indefinite-nominative-plural":"kittsieni","accusative-definite-nominative-plural":"kittsienii","dative-genitive-indefinite-singular":"kittsian","dative-definite-genitive-singular":"kittsianului","dative-genitive-indefinite-plural":"kittsieni","dative-definite-genitive-plural":"kittsienilor","singular-vocative":"kittsianule","plural-vocative":"kittsienilor"}},{"word":"kittsiană","pos":"noun","definitions":["female equivalent of kittsian"],"forms":{"plural":"kittsiane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kittsiană","accusative-definite-nominative-singular":"kittsiana","accusative-indefinite-nominative-plural":"kittsiane","accusative-definite-nominative-plural":"kittsianele","dative-genitive-indefinite-singular":"kittsiane","dative-definite-genitive-singular":"kittsianei","dative-genitive-indefinite-plural":"kittsiane","dative-definite-genitive-plural":"kittsianelor","singular-vocative":"kittsiană","plural-vocative":"kittsianelor"}},{"word":"Kițu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Kițu"}},{"word":"Kivu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Kivu"}},{"word":"kiwi","pos":"noun","definitions":["kiwi"],"forms":{"plural":"kiwi","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"kiwi","accusative-definite-nominative-singular":"kiwiul","accusative-indefinite-nominative-plural":"kiwi","accusative-definite-nominative-plural":"kiwile","dative-genitive-indefinite-singular":"kiwi","dative-definite-genitive-singular":"kiwii","dative-genitive-indefinite-plural":"kiwi","dative-definite-genitive-plural":"kiwilor","singular-vocative":"-","plural-vocative":"-"}},{"word":"klingoniană","pos":"noun","definitions":["female equivalent of klingonian"],"forms":{"plural":"klingoniene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"klingoniană","accusative-definite-nominative-singular":"klingoniana","accusative-indefinite-nominative-plural":"klingoniene","accusative-definite-nominative-plural":"klingonienele","dative-genitive-indefinite-singular":"klingoniene","dative-definite-genitive-singular":"klingonienei","dative-genitive-indefinite-plural":"klingoniene","dative-definite-genitive-plural":"klingonienelor","singular-vocative":"klingoniană","plural-vocative":"klingonienelor"}},{"word":"knesset","pos":"noun","definitions":["Knesset"],"forms":{"plural":"knessete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"knesset","accusative-definite-nominative-singular":"knessetul","accusative-indefinite-nominative-plural":"knessete","accusative-definite-nominative-plural":"knessetele","dative-genitive-indefinite-singular":"knesset","dative-definite-genitive-singular":"knessetului","dative-genitive-indefinite-plural":"knessete","dative-definite-genitive-plural":"knessetelor","singular-vocative":"knessetule","plural-vocative":"knessetelor"}},{"word":"knockout","pos":"noun","definitions":["knockout"],"forms":{"plural":"knockouturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"knockout","accusative-definite-nominative-singular":"knockoutul","accusative-indefinite-nominative-plural":"knockouturi","accusative-definite-nominative-plural":"knockouturile","dative-genitive-indefinite-singular":"knockout","dative-definite-genitive-singular":"knockoutului","dative-genitive-indefinite-plural":"knockouturi","dative-definite-genitive-plural":"knockouturilor","singular-vocative":"knockoutule","plural-vocative":"knockouturilor"}},{"word":"knockouta","pos":"verb","definitions":["to knockout"],"forms":{"canonical":"a knockouta 1st conjugation","present-singular-third-person":"knockoutează","participle-past":"knockoutat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a knockouta","gerund":"knockoutând","first-person-indicative-present-singular":"knockoutez","indicative-present-second-person-singular":"knockoutezi","indicative-present-singular-third-person":"knockoutează","first-person-indicative-plural-present":"knockoutăm","indicative-plural-present-second-person":"knockoutați","indicative-plural-present-third-person":"knockoutează","first-person-imperfect-indicative-singular":"knockoutam","imperfect-indicative-second-person-singular":"knockoutai","imperfect-indicative-singular-third-person":"knockouta","first-person-imperfect-indicative-plural":"knockoutam","imperfect-indicative-plural-second-person":"knockoutați","imperfect-indicative-plural-third-person":"knockoutau","first-person-indicative-perfect-singular":"knockoutai","indicative-perfect-second-person-singular":"knockoutași","indicative-perfect-singular-third-person":"knockoută","first-person-indicative-perfect-plural":"knockoutarăm","indicative-perfect-plural-second-person":"knockoutarăți","indicative-perfect-plural-third-person":"knockoutară","first-person-indicative-pluperfect-singular":"knockoutasem","indicative-pluperfect-second-person-singular":"knockoutaseși","indicative-pluperfect-singular-third-person":"knockoutase","first-person-indicative-pluperfect-plural":"knockoutaserăm","indicative-pluperfect-plural-second-person":"knockoutaserăți","indicative-pluperfect-plural-third-person":"knockoutaseră","first-person-present-singular-subjunctive":"să knockoutez","present-second-person-singular-subjunctive":"să knockoutezi","present-singular-subjunctive-third-person":"să knockouteze","first-person-plural-present-subjunctive":"să knockoutăm","plural-present-second-person-subjunctive":"să knockoutați","plural-present-subjunctive-third-person":"să knockouteze","imperative-second-person-singular":"knockoutează","imperative-plural-second-person":"knockoutați","imperative-negative-second-person-singular":"nu knockouta","imperative-negative-plural-second-person":"nu knockoutați"}},{"word":"know-how","pos":"noun","definitions":["know-how"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"know-how","accusative-definite-nominative":"know-howul","dative-genitive-indefinite":"know-how","dative-definite-genitive":"know-howului","vocative":"know-howule"}},{"word":"koala","pos":"noun","definitions":["koala"],"pronunciation":"/ˈko̯a.la/","forms":{"plural":"koala","table-tags":"no-table-tags","accusative-indefinite-nominative-singular":"koala","accusative-definite-nominative-singular":"koalaul","accusative-indefinite-nominative-plural":"koala","accusative-definite-nominative-plural":"-","dative-genitive-indefinite-singular":"koala","dative-definite-genitive-singular":"koalaului","dative-genitive-indefinite-plural":"koala","dative-definite-genitive-plural":"-","singular-vocative":"koala","plural-vocative":"-"}},{"word":"kobold","pos":"noun","definitions":["kobold"],"forms":{"plural":"kobolzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kobold","accusative-definite-nominative-singular":"koboldul","accusative-indefinite-nominative-plural":"kobolzi","accusative-definite-nominative-plural":"kobolzii","dative-genitive-indefinite-singular":"kobold","dative-definite-genitive-singular":"koboldului","dative-genitive-indefinite-plural":"kobolzi","dative-definite-genitive-plural":"kobolzilor","singular-vocative":"koboldule","plural-vocative":"kobolzilor"}},{"word":"Kogălniceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Kogălniceanu"}},{"word":"Kogălniceni","pos":"name","definitions":["a village in Alexandru I. Cuza, Iași County, Romania"],"gender":"m"},{"word":"koine","pos":"noun","definitions":["koine, lingua franca"]},{"word":"kosovar","pos":"noun","definitions":["Kosovar, Kosovan"],"pronunciation":"/ko.soˈvar/","forms":{"plural":"kosovari","feminine":"equivalent kosovară"}},{"word":"kosovar","pos":"adj","definitions":["Kosovar, Kosovan"],"pronunciation":"/ko.soˈvar/","forms":{"feminine-singular":"kosovară","masculine-plural":"kosovari","feminine-neuter-plural":"kosovare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kosovar","error-unrecognized-form-feminine-indefinite-singular":"kosovară","error-unrecognized-form-indefinite-masculine-plural":"kosovari","error-unrecognized-form-feminine-indefinite-neuter-plural":"kosovare","definite-error-unrecognized-form-masculine-neuter-singular":"kosovarul","definite-error-unrecognized-form-feminine-singular":"kosovara","definite-error-unrecognized-form-masculine-plural":"kosovarii","definite-error-unrecognized-form-feminine-neuter-plural":"kosovarele"}},{"word":"kosovară","pos":"noun","definitions":["female equivalent of kosovar"],"forms":{"plural":"kosovare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kosovară","accusative-definite-nominative-singular":"kosovara","accusative-indefinite-nominative-plural":"kosovare","accusative-definite-nominative-plural":"kosovarele","dative-genitive-indefinite-singular":"kosovare","dative-definite-genitive-singular":"kosovarei","dative-genitive-indefinite-plural":"kosovare","dative-definite-genitive-plural":"kosovarelor","singular-vocative":"kosovară","plural-vocative":"kosovarelor"}},{"word":"Kosovo","pos":"name","definitions":["Kosovo (a partly-recognized country on the Balkan Peninsula in Southeast Europe)"],"gender":"n"},{"word":"Kovaci","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Kovaci"}},{"word":"kremlinologist","pos":"noun","definitions":["Kremlinologist"],"forms":{"plural":"kremlinologiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kremlinologist","accusative-definite-nominative-singular":"kremlinologistul","accusative-indefinite-nominative-plural":"kremlinologiști","accusative-definite-nominative-plural":"kremlinologiștii","dative-genitive-indefinite-singular":"kremlinologist","dative-definite-genitive-singular":"kremlinologistului","dative-genitive-indefinite-plural":"kremlinologiști","dative-definite-genitive-plural":"kremlinologiștilor","singular-vocative":"kremlinologistule","plural-vocative":"kremlinologiștilor"}},{"word":"krennerit","pos":"noun","definitions":["krennerite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"krennerit","accusative-definite-nominative":"krenneritul","dative-genitive-indefinite":"krennerit","dative-definite-genitive":"krenneritului","vocative":"krenneritule"}},{"word":"Krețulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Krețulescu"}},{"word":"Kretzulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Kretzulescu"}},{"word":"kripton","pos":"noun","definitions":["krypton"],"pronunciation":"/kripˈton/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"kripton","accusative-definite-nominative":"kriptonul","dative-genitive-indefinite":"kripton","dative-definite-genitive":"kriptonului","vocative":"kriptonule"}},{"word":"kronprinz","pos":"noun","definitions":["crown prince (of a German-speaking country)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"kronprinz","accusative-definite-nominative":"kronprinzul","dative-genitive-indefinite":"kronprinz","dative-definite-genitive":"kronprinzului","vocative":"kronprinzule"}},{"word":"Ku Klux Klan","pos":"name","definitions":["Ku Klux Klan"],"gender":"n"},{"word":"Kuala Lumpur","pos":"name","definitions":["Kuala Lumpur (a federal territory, the capital and largest city of Malaysia, located in the western part of the country)"],"gender":"f"},{"word":"kurd","pos":"noun","definitions":["Kurd"],"pronunciation":"/kurd/","forms":{"plural":"kurzi","feminine":"equivalent kurdă"}},{"word":"kurd","pos":"adj","definitions":["Kurdish"],"pronunciation":"/kurd/","forms":{"feminine-singular":"kurdă","masculine-plural":"kurzi","feminine-neuter-plural":"kurde","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kurd","error-unrecognized-form-feminine-indefinite-singular":"kurdă","error-unrecognized-form-indefinite-masculine-plural":"kurzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"kurde","definite-error-unrecognized-form-masculine-neuter-singular":"kurdul","definite-error-unrecognized-form-feminine-singular":"kurda","definite-error-unrecognized-form-masculine-plural":"kurzii","definite-error-unrecognized-form-feminine-neuter-plural":"kurdele"}},{"word":"kurdă","pos":"noun","definitions":["female equivalent of kurd"],"forms":{"plural":"kurde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kurdă","accusative-definite-nominative-singular":"kurda","accusative-indefinite-nominative-plural":"kurde","accusative-definite-nominative-plural":"kurdele","dative-genitive-indefinite-singular":"kurde","dative-definite-genitive-singular":"kurdei","dative-genitive-indefinite-plural":"kurde","dative-definite-genitive-plural":"kurdelor","singular-vocative":"kurdă","plural-vocative":"kurdelor"}},{"word":"kuwaitian","pos":"adj","definitions":["Kuwaiti"],"forms":{"feminine-singular":"kuwaitiană","masculine-plural":"kuwaitieni","feminine-neuter-plural":"kuwaitiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"kuwaitian","error-unrecognized-form-feminine-indefinite-singular":"kuwaitiană","error-unrecognized-form-indefinite-masculine-plural":"kuwaitieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"kuwaitiene","definite-error-unrecognized-form-masculine-neuter-singular":"kuwaitianul","definite-error-unrecognized-form-feminine-singular":"kuwaitiana","definite-error-unrecognized-form-masculine-plural":"kuwaitienii","definite-error-unrecognized-form-feminine-neuter-plural":"kuwaitienele"}},{"word":"kuwaitian","pos":"noun","definitions":["Kuwaiti"],"forms":{"plural":"kuwaitieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kuwaitian","accusative-definite-nominative-singular":"kuwaitianul","accusative-indefinite-nominative-plural":"kuwaitieni","accusative-definite-nominative-plural":"kuwaitienii","dative-genitive-indefinite-singular":"kuwaitian","dative-definite-genitive-singular":"kuwaitianului","dative-genitive-indefinite-plural":"kuwaitieni","dative-definite-genitive-plural":"kuwaitienilor","singular-vocative":"kuwaitianule","plural-vocative":"kuwaitienilor"}},{"word":"kuwaitiană","pos":"noun","definitions":["female equivalent of kuwaitian"],"forms":{"plural":"kuwaitiane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kuwaitiană","accusative-definite-nominative-singular":"kuwaitiana","accusative-indefinite-nominative-plural":"kuwaitiane","accusative-definite-nominative-plural":"kuwaitianele","dative-genitive-indefinite-singular":"kuwaitiane","dative-definite-genitive-singular":"kuwaitianei","dative-genitive-indefinite-plural":"kuwaitiane","dative-definite-genitive-plural":"kuwaitianelor","singular-vocative":"kuwaitiană","plural-vocative":"kuwaitianelor"}},{"word":"Kuweit","pos":"name","definitions":["Kuwait (a country in West Asia in the Middle East)"],"pronunciation":"/kuˈvejt/","gender":"n","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"Kuweit","accusative-definite-nominative":"Kuweitul","dative-genitive-indefinite":"Kuweit","dative-definite-genitive":"Kuweitului","vocative":"Kuweitule"}},{"word":"kuweitian","pos":"noun","definitions":["Kuwaiti"],"forms":{"plural":"kuweitieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kuweitian","accusative-definite-nominative-singular":"kuweitianul","accusative-indefinite-nominative-plural":"kuweitieni","accusative-definite-nominative-plural":"kuweitienii","dative-genitive-indefinite-singular":"kuweitian","dative-definite-genitive-singular":"kuweitianului","dative-genitive-indefinite-plural":"kuweitieni","dative-definite-genitive-plural":"kuweitienilor","singular-vocative":"kuweitianule","plural-vocative":"kuweitienilor"}},{"word":"kuweitiană","pos":"noun","definitions":["female equivalent of kuweitian"],"forms":{"plural":"kuweitiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"kuweitiană","accusative-definite-nominative-singular":"kuweitiana","accusative-indefinite-nominative-plural":"kuweitiene","accusative-definite-nominative-plural":"kuweitienele","dative-genitive-indefinite-singular":"kuweitiene","dative-definite-genitive-singular":"kuweitienei","dative-genitive-indefinite-plural":"kuweitiene","dative-definite-genitive-plural":"kuweitienelor","singular-vocative":"kuweitiană","plural-vocative":"kuweitienelor"}},{"word":"kyat","pos":"noun","definitions":["kyat"],"forms":{"plural":"kyați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"kyat","accusative-definite-nominative-singular":"kyatul","accusative-indefinite-nominative-plural":"kyați","accusative-definite-nominative-plural":"kyații","dative-genitive-indefinite-singular":"kyat","dative-definite-genitive-singular":"kyatului","dative-genitive-indefinite-plural":"kyați","dative-definite-genitive-plural":"kyaților","singular-vocative":"kyatule","plural-vocative":"kyaților"}}];
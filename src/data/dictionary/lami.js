@@ -0,0 +1 @@
+export default [{"word":"lamie","pos":"noun","definitions":["lamia"],"forms":{"plural":"lamii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lamie","accusative-definite-nominative-singular":"lamia","accusative-indefinite-nominative-plural":"lamii","accusative-definite-nominative-plural":"lamiile","dative-genitive-indefinite-singular":"lamii","dative-definite-genitive-singular":"lamiei","dative-genitive-indefinite-plural":"lamii","dative-definite-genitive-plural":"lamiilor","singular-vocative":"lamie","plural-vocative":"lamiilor"}},{"word":"lamina","pos":"verb","definitions":["to laminate"],"forms":{"canonical":"a lamina 1st conjugation","present-singular-third-person":"laminează","participle-past":"laminat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a lamina","gerund":"laminând","first-person-indicative-present-singular":"laminez","indicative-present-second-person-singular":"laminezi","indicative-present-singular-third-person":"laminează","first-person-indicative-plural-present":"laminăm","indicative-plural-present-second-person":"laminați","indicative-plural-present-third-person":"laminează","first-person-imperfect-indicative-singular":"laminam","imperfect-indicative-second-person-singular":"laminai","imperfect-indicative-singular-third-person":"lamina","first-person-imperfect-indicative-plural":"laminam","imperfect-indicative-plural-second-person":"laminați","imperfect-indicative-plural-third-person":"laminau","first-person-indicative-perfect-singular":"laminai","indicative-perfect-second-person-singular":"laminași","indicative-perfect-singular-third-person":"lamină","first-person-indicative-perfect-plural":"laminarăm","indicative-perfect-plural-second-person":"laminarăți","indicative-perfect-plural-third-person":"laminară","first-person-indicative-pluperfect-singular":"laminasem","indicative-pluperfect-second-person-singular":"laminaseși","indicative-pluperfect-singular-third-person":"laminase","first-person-indicative-pluperfect-plural":"laminaserăm","indicative-pluperfect-plural-second-person":"laminaserăți","indicative-pluperfect-plural-third-person":"laminaseră","first-person-present-singular-subjunctive":"să laminez","present-second-person-singular-subjunctive":"să laminezi","present-singular-subjunctive-third-person":"să lamineze","first-person-plural-present-subjunctive":"să laminăm","plural-present-second-person-subjunctive":"să laminați","plural-present-subjunctive-third-person":"să lamineze","imperative-second-person-singular":"laminează","imperative-plural-second-person":"laminați","imperative-negative-second-person-singular":"nu lamina","imperative-negative-plural-second-person":"nu laminați"}},{"word":"lamină","pos":"noun","definitions":["lamina"],"forms":{"plural":"lamine","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"lamină","accusative-definite-nominative-singular":"lamina","accusative-indefinite-nominative-plural":"lamine","accusative-definite-nominative-plural":"laminele","dative-genitive-indefinite-singular":"lamine","dative-definite-genitive-singular":"laminei","dative-genitive-indefinite-plural":"lamine","dative-definite-genitive-plural":"laminelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"laminaj","pos":"noun","definitions":["lamination"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"laminaj","accusative-definite-nominative":"laminajul","dative-genitive-indefinite":"laminaj","dative-definite-genitive":"laminajului","vocative":"laminajule"}},{"word":"laminar","pos":"adj","definitions":["laminar"],"forms":{"feminine-singular":"laminară","masculine-plural":"laminari","feminine-neuter-plural":"laminare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"laminar","error-unrecognized-form-feminine-indefinite-singular":"laminară","error-unrecognized-form-indefinite-masculine-plural":"laminari","error-unrecognized-form-feminine-indefinite-neuter-plural":"laminare","definite-error-unrecognized-form-masculine-neuter-singular":"laminarul","definite-error-unrecognized-form-feminine-singular":"laminara","definite-error-unrecognized-form-masculine-plural":"laminarii","definite-error-unrecognized-form-feminine-neuter-plural":"laminarele"}},{"word":"laminare","pos":"noun","definitions":["lamination"],"forms":{"plural":"laminări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"laminare","accusative-definite-nominative-singular":"laminarea","accusative-indefinite-nominative-plural":"laminări","accusative-definite-nominative-plural":"laminările","dative-genitive-indefinite-singular":"laminări","dative-definite-genitive-singular":"laminării","dative-genitive-indefinite-plural":"laminări","dative-definite-genitive-plural":"laminărilor","singular-vocative":"laminare","plural-vocative":"laminărilor"}},{"word":"laminat","pos":"adj","definitions":["laminated"],"forms":{"feminine-singular":"laminată","masculine-plural":"laminați","feminine-neuter-plural":"laminate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"laminat","error-unrecognized-form-feminine-indefinite-singular":"laminată","error-unrecognized-form-indefinite-masculine-plural":"laminați","error-unrecognized-form-feminine-indefinite-neuter-plural":"laminate","definite-error-unrecognized-form-masculine-neuter-singular":"laminatul","definite-error-unrecognized-form-feminine-singular":"laminata","definite-error-unrecognized-form-masculine-plural":"laminații","definite-error-unrecognized-form-feminine-neuter-plural":"laminatele"}},{"word":"laminatoare","pos":"noun","definitions":["female equivalent of laminator"],"forms":{"plural":"laminatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"laminatoare","accusative-definite-nominative-singular":"laminatoarea","accusative-indefinite-nominative-plural":"laminatoare","accusative-definite-nominative-plural":"laminatoarele","dative-genitive-indefinite-singular":"laminatoare","dative-definite-genitive-singular":"laminatoarei","dative-genitive-indefinite-plural":"laminatoare","dative-definite-genitive-plural":"laminatoarelor","singular-vocative":"laminatoare","plural-vocative":"laminatoarelor"}},{"word":"laminectomie","pos":"noun","definitions":["laminectomy"],"forms":{"plural":"laminectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"laminectomie","accusative-definite-nominative-singular":"laminectomia","accusative-indefinite-nominative-plural":"laminectomii","accusative-definite-nominative-plural":"laminectomiile","dative-genitive-indefinite-singular":"laminectomii","dative-definite-genitive-singular":"laminectomiei","dative-genitive-indefinite-plural":"laminectomii","dative-definite-genitive-plural":"laminectomiilor","singular-vocative":"laminectomie","plural-vocative":"laminectomiilor"}},{"word":"laminor","pos":"noun","definitions":["rolling mill"],"forms":{"plural":"laminoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"laminor","accusative-definite-nominative-singular":"laminorul","accusative-indefinite-nominative-plural":"laminoare","accusative-definite-nominative-plural":"laminoarele","dative-genitive-indefinite-singular":"laminor","dative-definite-genitive-singular":"laminorului","dative-genitive-indefinite-plural":"laminoare","dative-definite-genitive-plural":"laminoarelor","singular-vocative":"laminorule","plural-vocative":"laminoarelor"}},{"word":"laminorist","pos":"noun","definitions":["roller"],"forms":{"plural":"laminoriști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"laminorist","accusative-definite-nominative-singular":"laminoristul","accusative-indefinite-nominative-plural":"laminoriști","accusative-definite-nominative-plural":"laminoriștii","dative-genitive-indefinite-singular":"laminorist","dative-definite-genitive-singular":"laminoristului","dative-genitive-indefinite-plural":"laminoriști","dative-definite-genitive-plural":"laminoriștilor","singular-vocative":"laminoristule","plural-vocative":"laminoriștilor"}},{"word":"laminoristă","pos":"noun","definitions":["female equivalent of laminorist"],"forms":{"plural":"laminoriste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"laminoristă","accusative-definite-nominative-singular":"laminorista","accusative-indefinite-nominative-plural":"laminoriste","accusative-definite-nominative-plural":"laminoristele","dative-genitive-indefinite-singular":"laminoriste","dative-definite-genitive-singular":"laminoristei","dative-genitive-indefinite-plural":"laminoriste","dative-definite-genitive-plural":"laminoristelor","singular-vocative":"laminoristă","plural-vocative":"laminoristelor"}},{"word":"lamo","pos":"noun","definitions":["vocative singular of lamă"],"pronunciation":"[ˈlamo]","gender":"f"},{"word":"lămosteală","pos":"noun","definitions":["influenza"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lămosteală","accusative-definite-nominative":"lămosteala","dative-genitive-indefinite":"lămosteale","dative-definite-genitive":"lămostealei","vocative":"lămosteală"}},{"word":"Lămotești","pos":"name","definitions":["a village in Milcovul, Vrancea County, Romania"],"gender":"m"},{"word":"lampa","pos":"noun","definitions":["definite nominative/accusative singular of lampă"],"pronunciation":"[ˈlampa]","gender":"f"},{"word":"Lampă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lampă"}},{"word":"lampă","pos":"noun","definitions":["lamp","light"],"forms":{"plural":"lămpi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lampă","accusative-definite-nominative-singular":"lampa","accusative-indefinite-nominative-plural":"lămpi","accusative-definite-nominative-plural":"lămpile","dative-genitive-indefinite-singular":"lămpi","dative-definite-genitive-singular":"lămpii","dative-genitive-indefinite-plural":"lămpi","dative-definite-genitive-plural":"lămpilor","singular-vocative":"lampă","plural-vocative":"lămpilor"}},{"word":"lampă cu halogen","pos":"noun","definitions":["halogen lamp"],"forms":{"plural":"lămpi cu halogen"}},{"word":"lampă cu incandescență","pos":"noun","definitions":["incandescent lamp"],"forms":{"plural":"lămpi cu incandescență"}},{"word":"lampă cu plasmă","pos":"noun","definitions":["plasma lamp"],"forms":{"plural":"lămpi cu plasmă"}},{"word":"lampă de veghe","pos":"noun","definitions":["nightlight lamp, nightlamp"],"forms":{"plural":"lămpi de veghe"}},{"word":"lampadă","pos":"noun","definitions":["torch"],"forms":{"plural":"lampade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lampadă","accusative-definite-nominative-singular":"lampada","accusative-indefinite-nominative-plural":"lampade","accusative-definite-nominative-plural":"lampadele","dative-genitive-indefinite-singular":"lampade","dative-definite-genitive-singular":"lampadei","dative-genitive-indefinite-plural":"lampade","dative-definite-genitive-plural":"lampadelor","singular-vocative":"lampadă","plural-vocative":"lampadelor"}},{"word":"lampadar","pos":"noun","definitions":["floor lamp"],"forms":{"plural":"lampadare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lampadar","accusative-definite-nominative-singular":"lampadarul","accusative-indefinite-nominative-plural":"lampadare","accusative-definite-nominative-plural":"lampadarele","dative-genitive-indefinite-singular":"lampadar","dative-definite-genitive-singular":"lampadarului","dative-genitive-indefinite-plural":"lampadare","dative-definite-genitive-plural":"lampadarelor","singular-vocative":"lampadarule","plural-vocative":"lampadarelor"}},{"word":"lampadedromie","pos":"noun","definitions":["torch race"],"forms":{"plural":"lampadedromii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lampadedromie","accusative-definite-nominative-singular":"lampadedromia","accusative-indefinite-nominative-plural":"lampadedromii","accusative-definite-nominative-plural":"lampadedromiile","dative-genitive-indefinite-singular":"lampadedromii","dative-definite-genitive-singular":"lampadedromiei","dative-genitive-indefinite-plural":"lampadedromii","dative-definite-genitive-plural":"lampadedromiilor","singular-vocative":"lampadedromie","plural-vocative":"lampadedromiilor"}},{"word":"lampagiu","pos":"noun","definitions":["lamplighter"],"forms":{"plural":"lampagii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lampagiu","accusative-definite-nominative-singular":"lampagiul","accusative-indefinite-nominative-plural":"lampagii","accusative-definite-nominative-plural":"lampagiii","dative-genitive-indefinite-singular":"lampagiu","dative-definite-genitive-singular":"lampagiului","dative-genitive-indefinite-plural":"lampagii","dative-definite-genitive-plural":"lampagiilor","singular-vocative":"lampagiule","plural-vocative":"lampagiilor"}},{"word":"lămpărie","pos":"noun","definitions":["lamp warehouse in the mine"],"forms":{"plural":"lămpării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lămpărie","accusative-definite-nominative-singular":"lămpăria","accusative-indefinite-nominative-plural":"lămpării","accusative-definite-nominative-plural":"lămpăriile","dative-genitive-indefinite-singular":"lămpării","dative-definite-genitive-singular":"lămpăriei","dative-genitive-indefinite-plural":"lămpării","dative-definite-genitive-plural":"lămpăriilor","singular-vocative":"lămpărie","plural-vocative":"lămpăriilor"}},{"word":"lămpaș","pos":"noun","definitions":["lamp, lantern"],"forms":{"plural":"lămpașe","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lămpaș","accusative-definite-nominative-singular":"lămpașul","accusative-indefinite-nominative-plural":"lămpașe","accusative-definite-nominative-plural":"lămpașei","dative-genitive-indefinite-singular":"lămpaș","dative-definite-genitive-singular":"lămpașului","dative-genitive-indefinite-plural":"lămpașe","dative-definite-genitive-plural":"lămpașelor","singular-vocative":"lămpașule","plural-vocative":"lămpașelor"}},{"word":"lămpășel","pos":"noun","definitions":["diminutive of lămpaș"],"forms":{"plural":"lămpășele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lămpășel","accusative-definite-nominative-singular":"lămpășelul","accusative-indefinite-nominative-plural":"lămpășele","accusative-definite-nominative-plural":"lămpășelele","dative-genitive-indefinite-singular":"lămpășel","dative-definite-genitive-singular":"lămpășelului","dative-genitive-indefinite-plural":"lămpășele","dative-definite-genitive-plural":"lămpășelelor","singular-vocative":"lămpășelule","plural-vocative":"lămpășelelor"}},{"word":"lămpășuț","pos":"noun","definitions":["diminutive of lămpaș"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"lămpășuț","accusative-definite-nominative":"lămpășuțul","dative-genitive-indefinite":"lămpășuț","dative-definite-genitive":"lămpășuțului","vocative":"lămpășuțule"}},{"word":"lampion","pos":"noun","definitions":["Chinese lantern"],"forms":{"plural":"lampioane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lampion","accusative-definite-nominative-singular":"lampionul","accusative-indefinite-nominative-plural":"lampioane","accusative-definite-nominative-plural":"lampioanele","dative-genitive-indefinite-singular":"lampion","dative-definite-genitive-singular":"lampionului","dative-genitive-indefinite-plural":"lampioane","dative-definite-genitive-plural":"lampioanelor","singular-vocative":"lampionule","plural-vocative":"lampioanelor"}},{"word":"lămpișoară","pos":"noun","definitions":["diminutive of lampă; small lamp"],"forms":{"plural":"lămpișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lămpișoară","accusative-definite-nominative-singular":"lămpișoara","accusative-indefinite-nominative-plural":"lămpișoare","accusative-definite-nominative-plural":"lămpișoarele","dative-genitive-indefinite-singular":"lămpișoare","dative-definite-genitive-singular":"lămpișoarei","dative-genitive-indefinite-plural":"lămpișoare","dative-definite-genitive-plural":"lămpișoarelor","singular-vocative":"lămpișoară","plural-vocative":"lămpișoarelor"}},{"word":"lampist","pos":"noun","definitions":["a worker responsible for maintaining lamps and for issuing them from the lamp room at the start of a shift; lampman"],"forms":{"plural":"lampiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lampist","accusative-definite-nominative-singular":"lampistul","accusative-indefinite-nominative-plural":"lampiști","accusative-definite-nominative-plural":"lampiștii","dative-genitive-indefinite-singular":"lampist","dative-definite-genitive-singular":"lampistului","dative-genitive-indefinite-plural":"lampiști","dative-definite-genitive-plural":"lampiștilor","singular-vocative":"lampistule","plural-vocative":"lampiștilor"}},{"word":"lampisterie","pos":"noun","definitions":["lamp room"],"forms":{"plural":"lampisterii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lampisterie","accusative-definite-nominative-singular":"lampisteria","accusative-indefinite-nominative-plural":"lampisterii","accusative-definite-nominative-plural":"lampisteriile","dative-genitive-indefinite-singular":"lampisterii","dative-definite-genitive-singular":"lampisteriei","dative-genitive-indefinite-plural":"lampisterii","dative-definite-genitive-plural":"lampisteriilor","singular-vocative":"lampisterie","plural-vocative":"lampisteriilor"}},{"word":"lămpiță","pos":"noun","definitions":["diminutive of lampă; small lamp"],"forms":{"plural":"lămpițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lămpiță","accusative-definite-nominative-singular":"lămpița","accusative-indefinite-nominative-plural":"lămpițe","accusative-definite-nominative-plural":"lămpițele","dative-genitive-indefinite-singular":"lămpițe","dative-definite-genitive-singular":"lămpiței","dative-genitive-indefinite-plural":"lămpițe","dative-definite-genitive-plural":"lămpițelor","singular-vocative":"lămpiță","plural-vocative":"lămpițelor"}},{"word":"lampo","pos":"noun","definitions":["vocative singular of lampă"],"pronunciation":"[ˈlampo]","gender":"f"},{"word":"lămpoi","pos":"noun","definitions":["augmentative of lampă"],"forms":{"plural":"lămpoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lămpoi","accusative-definite-nominative-singular":"lămpoiul","accusative-indefinite-nominative-plural":"lămpoaie","accusative-definite-nominative-plural":"lămpoaiele","dative-genitive-indefinite-singular":"lămpoi","dative-definite-genitive-singular":"lămpoiului","dative-genitive-indefinite-plural":"lămpoaie","dative-definite-genitive-plural":"lămpoaielor","singular-vocative":"lămpoiule","plural-vocative":"lămpoaielor"}},{"word":"lampretă","pos":"noun","definitions":["lamprey"],"forms":{"plural":"lamprete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lampretă","accusative-definite-nominative-singular":"lampreta","accusative-indefinite-nominative-plural":"lamprete","accusative-definite-nominative-plural":"lampretele","dative-genitive-indefinite-singular":"lamprete","dative-definite-genitive-singular":"lampretei","dative-genitive-indefinite-plural":"lamprete","dative-definite-genitive-plural":"lampretelor","singular-vocative":"lampretă","plural-vocative":"lampretelor"}},{"word":"lamprofir","pos":"noun","definitions":["lamprophyre"],"forms":{"plural":"lamprofire","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lamprofir","accusative-definite-nominative-singular":"lamprofirul","accusative-indefinite-nominative-plural":"lamprofire","accusative-definite-nominative-plural":"lamprofirele","dative-genitive-indefinite-singular":"lamprofir","dative-definite-genitive-singular":"lamprofirului","dative-genitive-indefinite-plural":"lamprofire","dative-definite-genitive-plural":"lamprofirelor","singular-vocative":"lamprofirule","plural-vocative":"lamprofirelor"}},{"word":"lămpuș","pos":"noun","definitions":["diminutive of lampă; small lamp"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lămpuș","accusative-definite-nominative":"lămpușul","dative-genitive-indefinite":"lămpuș","dative-definite-genitive":"lămpușului","vocative":"lămpușule"}},{"word":"lămpușoară","pos":"noun","definitions":["diminutive of lampă"],"forms":{"plural":"lămpușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lămpușoară","accusative-definite-nominative-singular":"lămpușoara","accusative-indefinite-nominative-plural":"lămpușoare","accusative-definite-nominative-plural":"lămpușoarele","dative-genitive-indefinite-singular":"lămpușoare","dative-definite-genitive-singular":"lămpușoarei","dative-genitive-indefinite-plural":"lămpușoare","dative-definite-genitive-plural":"lămpușoarelor","singular-vocative":"lămpușoară","plural-vocative":"lămpușoarelor"}},{"word":"lămpuță","pos":"noun","definitions":["diminutive of lampă"],"forms":{"plural":"lămpuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lămpuță","accusative-definite-nominative-singular":"lămpuța","accusative-indefinite-nominative-plural":"lămpuțe","accusative-definite-nominative-plural":"lămpuțele","dative-genitive-indefinite-singular":"lămpuțe","dative-definite-genitive-singular":"lămpuței","dative-genitive-indefinite-plural":"lămpuțe","dative-definite-genitive-plural":"lămpuțelor","singular-vocative":"lămpuță","plural-vocative":"lămpuțelor"}},{"word":"lamură","pos":"noun","definitions":["the best of something, the cream, the flower, the pick"],"forms":{"plural":"lamuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lamură","accusative-definite-nominative-singular":"lamura","accusative-indefinite-nominative-plural":"lamuri","accusative-definite-nominative-plural":"lamurile","dative-genitive-indefinite-singular":"lamuri","dative-definite-genitive-singular":"lamurii","dative-genitive-indefinite-plural":"lamuri","dative-definite-genitive-plural":"lamurilor","singular-vocative":"lamură","plural-vocative":"lamurilor"}},{"word":"lămureală","pos":"noun","definitions":["explanation"],"forms":{"plural":"lămureli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lămureală","accusative-definite-nominative-singular":"lămureala","accusative-indefinite-nominative-plural":"lămurele","accusative-definite-nominative-plural":"lămurelele","dative-genitive-indefinite-singular":"lămurele","dative-definite-genitive-singular":"lămurelei","dative-genitive-indefinite-plural":"lămurele","dative-definite-genitive-plural":"lămurelelor","singular-vocative":"lămureală","plural-vocative":"lămurelelor"}},{"word":"lămuri","pos":"verb","definitions":["to shed light on, make clear, clear up, be explained, enlighten"],"forms":{"canonical":"a lămuri 4th conjugation","present-singular-third-person":"lămurește","participle-past":"lămurit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lămuri","gerund":"lămurind","first-person-indicative-present-singular":"lămuresc","indicative-present-second-person-singular":"lămurești","indicative-present-singular-third-person":"lămurește","first-person-indicative-plural-present":"lămurim","indicative-plural-present-second-person":"lămuriți","indicative-plural-present-third-person":"lămuresc","first-person-imperfect-indicative-singular":"lămuream","imperfect-indicative-second-person-singular":"lămureai","imperfect-indicative-singular-third-person":"lămurea","first-person-imperfect-indicative-plural":"lămuream","imperfect-indicative-plural-second-person":"lămureați","imperfect-indicative-plural-third-person":"lămureau","first-person-indicative-perfect-singular":"lămurii","indicative-perfect-second-person-singular":"lămuriși","indicative-perfect-singular-third-person":"lămuri","first-person-indicative-perfect-plural":"lămurirăm","indicative-perfect-plural-second-person":"lămurirăți","indicative-perfect-plural-third-person":"lămuriră","first-person-indicative-pluperfect-singular":"lămurisem","indicative-pluperfect-second-person-singular":"lămuriseși","indicative-pluperfect-singular-third-person":"lămurise","first-person-indicative-pluperfect-plural":"lămuriserăm","indicative-pluperfect-plural-second-person":"lămuriserăți","indicative-pluperfect-plural-third-person":"lămuriseră","first-person-present-singular-subjunctive":"să lămuresc","present-second-person-singular-subjunctive":"să lămurești","present-singular-subjunctive-third-person":"să lămurească","first-person-plural-present-subjunctive":"să lămurim","plural-present-second-person-subjunctive":"să lămuriți","plural-present-subjunctive-third-person":"să lămurească","imperative-second-person-singular":"lămurește","imperative-plural-second-person":"lămuriți","imperative-negative-second-person-singular":"nu lămuri","imperative-negative-plural-second-person":"nu lămuriți"}},{"word":"lămurință","pos":"noun","definitions":["limpidity"],"forms":{"plural":"lămurințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lămurință","accusative-definite-nominative-singular":"lămurința","accusative-indefinite-nominative-plural":"lămurințe","accusative-definite-nominative-plural":"lămurințele","dative-genitive-indefinite-singular":"lămurințe","dative-definite-genitive-singular":"lămurinței","dative-genitive-indefinite-plural":"lămurințe","dative-definite-genitive-plural":"lămurințelor","singular-vocative":"lămurință","plural-vocative":"lămurințelor"}},{"word":"lămurire","pos":"noun","definitions":["explanation"],"forms":{"plural":"lămuriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lămurire","accusative-definite-nominative-singular":"lămurirea","accusative-indefinite-nominative-plural":"lămuriri","accusative-definite-nominative-plural":"lămuririle","dative-genitive-indefinite-singular":"lămuriri","dative-definite-genitive-singular":"lămuririi","dative-genitive-indefinite-plural":"lămuriri","dative-definite-genitive-plural":"lămuririlor","singular-vocative":"lămurire","plural-vocative":"lămuririlor"}},{"word":"lămurit","pos":"adj","definitions":["clear, clarified"],"forms":{"feminine-singular":"lămurită","masculine-plural":"lămuriți","feminine-neuter-plural":"lămurite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lămurit","error-unrecognized-form-feminine-indefinite-singular":"lămurită","error-unrecognized-form-indefinite-masculine-plural":"lămuriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lămurite","definite-error-unrecognized-form-masculine-neuter-singular":"lămuritul","definite-error-unrecognized-form-feminine-singular":"lămurita","definite-error-unrecognized-form-masculine-plural":"lămuriții","definite-error-unrecognized-form-feminine-neuter-plural":"lămuritele"}},{"word":"lămurit","pos":"verb","definitions":["past participle of lămuri"],"forms":{"participle-past":"of lămuri"}},{"word":"lămuritor","pos":"adj","definitions":["explanatory"],"forms":{"feminine-singular":"lămuritoare","masculine-plural":"lămuritori","feminine-neuter-plural":"lămuritoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lămuritor","error-unrecognized-form-feminine-indefinite-singular":"lămuritoare","error-unrecognized-form-indefinite-masculine-plural":"lămuritori","error-unrecognized-form-feminine-indefinite-neuter-plural":"lămuritoare","definite-error-unrecognized-form-masculine-neuter-singular":"lămuritorul","definite-error-unrecognized-form-feminine-singular":"lămuritoarea","definite-error-unrecognized-form-masculine-plural":"lămuritorii","definite-error-unrecognized-form-feminine-neuter-plural":"lămuritoarele"}},{"word":"lămuriu","pos":"adj","definitions":["The meaning of this term is uncertain. Possibilities include","The meaning of this term is uncertain. Possibilities include:","in cash"],"pronunciation":"/lə.muˈriw/","forms":{"feminine-singular":"lămurie","plural":"lămurii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lămuriu","error-unrecognized-form-feminine-indefinite-singular":"lămurie","error-unrecognized-form-indefinite-masculine-plural":"lămurii","error-unrecognized-form-feminine-indefinite-neuter-plural":"lămurii","definite-error-unrecognized-form-masculine-neuter-singular":"lămuriul","definite-error-unrecognized-form-feminine-singular":"lămuria","definite-error-unrecognized-form-masculine-plural":"lămuriii","definite-error-unrecognized-form-feminine-neuter-plural":"lămuriile"}},{"word":"lan","pos":"noun","definitions":["field (arable land)"],"forms":{"plural":"lanuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lan","accusative-definite-nominative-singular":"lanul","accusative-indefinite-nominative-plural":"lanuri","accusative-definite-nominative-plural":"lanurile","dative-genitive-indefinite-singular":"lan","dative-definite-genitive-singular":"lanului","dative-genitive-indefinite-plural":"lanuri","dative-definite-genitive-plural":"lanurilor","singular-vocative":"lanule","plural-vocative":"lanurilor"}},{"word":"lână","pos":"noun","definitions":["wool"],"forms":{"plural":"lânuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-uri","accusative-indefinite-nominative-singular":"lână","accusative-definite-nominative-singular":"lâna","accusative-indefinite-nominative-plural":"lânuri","accusative-definite-nominative-plural":"lânurile","dative-genitive-indefinite-singular":"lâni","dative-definite-genitive-singular":"lânii","dative-genitive-indefinite-plural":"lânuri","dative-definite-genitive-plural":"lânurilor","singular-vocative":"lână","plural-vocative":"lânurilor"}},{"word":"lână de lemn","pos":"noun","definitions":["wood wool"]},{"word":"lanametru","pos":"noun","definitions":["lanameter"],"forms":{"plural":"lanametre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lanametru","accusative-definite-nominative-singular":"lanametrul","accusative-indefinite-nominative-plural":"lanametre","accusative-definite-nominative-plural":"lanametrele","dative-genitive-indefinite-singular":"lanametru","dative-definite-genitive-singular":"lanametrului","dative-genitive-indefinite-plural":"lanametre","dative-definite-genitive-plural":"lanametrelor","singular-vocative":"lanametrule","plural-vocative":"lanametrelor"}},{"word":"lânar","pos":"noun","definitions":["one who works with or sells wool"],"forms":{"plural":"lânari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lânar","accusative-definite-nominative-singular":"lânarul","accusative-indefinite-nominative-plural":"lânari","accusative-definite-nominative-plural":"lânarii","dative-genitive-indefinite-singular":"lânar","dative-definite-genitive-singular":"lânarului","dative-genitive-indefinite-plural":"lânari","dative-definite-genitive-plural":"lânarilor","singular-vocative":"lânarule","plural-vocative":"lânarilor"}},{"word":"lânărică","pos":"noun","definitions":["cottongrass (Eriophorum)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lânărică","accusative-definite-nominative":"lânărica","dative-genitive-indefinite":"e","dative-definite-genitive":"ei","vocative":"lânărică"}},{"word":"lânărie","pos":"noun","definitions":["wool shop"],"forms":{"plural":"lânării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lânărie","accusative-definite-nominative-singular":"lânăria","accusative-indefinite-nominative-plural":"lânării","accusative-definite-nominative-plural":"lânăriile","dative-genitive-indefinite-singular":"lânării","dative-definite-genitive-singular":"lânăriei","dative-genitive-indefinite-plural":"lânării","dative-definite-genitive-plural":"lânăriilor","singular-vocative":"lânărie","plural-vocative":"lânăriilor"}},{"word":"lânăriță","pos":"noun","definitions":["cottongrass (Eriophorum)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lânăriță","accusative-definite-nominative":"lânărița","dative-genitive-indefinite":"lânărițe","dative-definite-genitive":"lânăriței","vocative":"lânăriță"}},{"word":"lanat","pos":"adj","definitions":["lanate"],"forms":{"feminine-singular":"lanată","masculine-plural":"lanați","feminine-neuter-plural":"lanate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lanat","error-unrecognized-form-feminine-indefinite-singular":"lanată","error-unrecognized-form-indefinite-masculine-plural":"lanați","error-unrecognized-form-feminine-indefinite-neuter-plural":"lanate","definite-error-unrecognized-form-masculine-neuter-singular":"lanatul","definite-error-unrecognized-form-feminine-singular":"lanata","definite-error-unrecognized-form-masculine-plural":"lanații","definite-error-unrecognized-form-feminine-neuter-plural":"lanatele"}},{"word":"lancasterian","pos":"adj","definitions":["Lancasterian"],"forms":{"feminine-singular":"lancasteriană","masculine-plural":"lancasterieni","feminine-neuter-plural":"lancasteriene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lancasterian","error-unrecognized-form-feminine-indefinite-singular":"lancasteriană","error-unrecognized-form-indefinite-masculine-plural":"lancasterieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"lancasteriene","definite-error-unrecognized-form-masculine-neuter-singular":"lancasterianul","definite-error-unrecognized-form-feminine-singular":"lancasteriana","definite-error-unrecognized-form-masculine-plural":"lancasterienii","definite-error-unrecognized-form-feminine-neuter-plural":"lancasterienele"}},{"word":"lancasterian","pos":"noun","definitions":["Lancasterian"],"forms":{"plural":"lancasterieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lancasterian","accusative-definite-nominative-singular":"lancasterianul","accusative-indefinite-nominative-plural":"lancasterieni","accusative-definite-nominative-plural":"lancasterienii","dative-genitive-indefinite-singular":"lancasterian","dative-definite-genitive-singular":"lancasterianului","dative-genitive-indefinite-plural":"lancasterieni","dative-definite-genitive-plural":"lancasterienilor","singular-vocative":"lancasterianule","plural-vocative":"lancasterienilor"}},{"word":"lancasteriană","pos":"noun","definitions":["female equivalent of lancasterian"],"forms":{"plural":"lancasteriene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lancasteriană","accusative-definite-nominative-singular":"lancasteriana","accusative-indefinite-nominative-plural":"lancasteriene","accusative-definite-nominative-plural":"lancasterienele","dative-genitive-indefinite-singular":"lancasteriene","dative-definite-genitive-singular":"lancasterienei","dative-genitive-indefinite-plural":"lancasteriene","dative-definite-genitive-plural":"lancasterienelor","singular-vocative":"lancasteriană","plural-vocative":"lancasterienelor"}},{"word":"lancaviu","pos":"adj","definitions":["sly, crafty, cunning"],"forms":{"feminine-singular":"lancavie","plural":"lancavii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lancaviu","error-unrecognized-form-feminine-indefinite-singular":"lancavie","error-unrecognized-form-indefinite-masculine-plural":"lancavii","error-unrecognized-form-feminine-indefinite-neuter-plural":"lancavii","definite-error-unrecognized-form-masculine-neuter-singular":"lancaviul","definite-error-unrecognized-form-feminine-singular":"lancavia","definite-error-unrecognized-form-masculine-plural":"lancaviii","definite-error-unrecognized-form-feminine-neuter-plural":"lancaviile"}},{"word":"lance","pos":"noun","definitions":["spear, lance"],"forms":{"plural":"lănci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lance","accusative-definite-nominative-singular":"lancea","accusative-indefinite-nominative-plural":"lănci","accusative-definite-nominative-plural":"lăncile","dative-genitive-indefinite-singular":"lănci","dative-definite-genitive-singular":"lăncii","dative-genitive-indefinite-plural":"lănci","dative-definite-genitive-plural":"lăncilor","singular-vocative":"lance","plural-vocative":"lăncilor"}},{"word":"lânced","pos":"adj","definitions":["weak, feeble, languid","withered"],"pronunciation":"/ˈlɨn.t͡ʃed/","forms":{"feminine-singular":"lâncedă","masculine-plural":"lâncezi","feminine-neuter-plural":"lâncede","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"lânced","error-unrecognized-form-feminine-indefinite-singular":"lâncedă","error-unrecognized-form-indefinite-masculine-plural":"lâncezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lâncede","definite-error-unrecognized-form-masculine-neuter-singular":"lâncedul","definite-error-unrecognized-form-feminine-singular":"lânceda","definite-error-unrecognized-form-masculine-plural":"lâncezii","definite-error-unrecognized-form-feminine-neuter-plural":"lâncedele","alternative-archaic-rare":"lânged"}},{"word":"lanceolat","pos":"adj","definitions":["lanceolate"],"forms":{"feminine-singular":"lanceolată","masculine-plural":"lanceolați","feminine-neuter-plural":"lanceolate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lanceolat","error-unrecognized-form-feminine-indefinite-singular":"lanceolată","error-unrecognized-form-indefinite-masculine-plural":"lanceolați","error-unrecognized-form-feminine-indefinite-neuter-plural":"lanceolate","definite-error-unrecognized-form-masculine-neuter-singular":"lanceolatul","definite-error-unrecognized-form-feminine-singular":"lanceolata","definite-error-unrecognized-form-masculine-plural":"lanceolații","definite-error-unrecognized-form-feminine-neuter-plural":"lanceolatele"}},{"word":"lăncer","pos":"noun","definitions":["alternative form of lăncier"],"forms":{"plural":"lănceri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lăncer","accusative-definite-nominative-singular":"lăncerul","accusative-indefinite-nominative-plural":"lănceri","accusative-definite-nominative-plural":"lăncerii","dative-genitive-indefinite-singular":"lăncer","dative-definite-genitive-singular":"lăncerului","dative-genitive-indefinite-plural":"lănceri","dative-definite-genitive-plural":"lăncerilor","singular-vocative":"lăncerule","plural-vocative":"lăncerilor"}},{"word":"lâncezând","pos":"adj","definitions":["stagnating"],"forms":{"feminine-singular":"lâncezândă","masculine-plural":"lâncezânzi","feminine-neuter-plural":"lâncezânde","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lâncezând","error-unrecognized-form-feminine-indefinite-singular":"lâncezândă","error-unrecognized-form-indefinite-masculine-plural":"lâncezânzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lâncezânde","definite-error-unrecognized-form-masculine-neuter-singular":"lâncezândul","definite-error-unrecognized-form-feminine-singular":"lâncezânda","definite-error-unrecognized-form-masculine-plural":"lâncezânzii","definite-error-unrecognized-form-feminine-neuter-plural":"lâncezândele"}},{"word":"lâncezeală","pos":"noun","definitions":["languor, weakness","flatness","acedia, apathy, sloth, lethargy, torpor"]},{"word":"lâncezi","pos":"verb","definitions":["to become feeble"],"forms":{"canonical":"a lâncezi 4th conjugation","present-singular-third-person":"lâncezește","participle-past":"lâncezit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lâncezi","gerund":"lâncezind","first-person-indicative-present-singular":"lâncezesc","indicative-present-second-person-singular":"lâncezești","indicative-present-singular-third-person":"lâncezește","first-person-indicative-plural-present":"lâncezim","indicative-plural-present-second-person":"lânceziți","indicative-plural-present-third-person":"lâncezesc","first-person-imperfect-indicative-singular":"lâncezeam","imperfect-indicative-second-person-singular":"lâncezeai","imperfect-indicative-singular-third-person":"lâncezea","first-person-imperfect-indicative-plural":"lâncezeam","imperfect-indicative-plural-second-person":"lâncezeați","imperfect-indicative-plural-third-person":"lâncezeau","first-person-indicative-perfect-singular":"lâncezii","indicative-perfect-second-person-singular":"lânceziși","indicative-perfect-singular-third-person":"lâncezi","first-person-indicative-perfect-plural":"lâncezirăm","indicative-perfect-plural-second-person":"lâncezirăți","indicative-perfect-plural-third-person":"lânceziră","first-person-indicative-pluperfect-singular":"lâncezisem","indicative-pluperfect-second-person-singular":"lânceziseși","indicative-pluperfect-singular-third-person":"lâncezise","first-person-indicative-pluperfect-plural":"lânceziserăm","indicative-pluperfect-plural-second-person":"lânceziserăți","indicative-pluperfect-plural-third-person":"lânceziseră","first-person-present-singular-subjunctive":"să lâncezesc","present-second-person-singular-subjunctive":"să lâncezești","present-singular-subjunctive-third-person":"să lâncezească","first-person-plural-present-subjunctive":"să lâncezim","plural-present-second-person-subjunctive":"să lânceziți","plural-present-subjunctive-third-person":"să lâncezească","imperative-second-person-singular":"lâncezește","imperative-plural-second-person":"lânceziți","imperative-negative-second-person-singular":"nu lâncezi","imperative-negative-plural-second-person":"nu lânceziți"}},{"word":"lâncezie","pos":"noun","definitions":["languor, weakness"],"forms":{"plural":"lâncezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lâncezie","accusative-definite-nominative-singular":"lâncezia","accusative-indefinite-nominative-plural":"lâncezii","accusative-definite-nominative-plural":"lânceziile","dative-genitive-indefinite-singular":"lâncezii","dative-definite-genitive-singular":"lânceziei","dative-genitive-indefinite-plural":"lâncezii","dative-definite-genitive-plural":"lânceziilor","singular-vocative":"lâncezie","plural-vocative":"lânceziilor"}},{"word":"lâncezii","pos":"noun","definitions":["inflection of lâncezie:","indefinite nominative/accusative plural","indefinite genitive/dative singular","indefinite genitive/dative plural"]},{"word":"lâncezime","pos":"noun","definitions":["languor, weakness"],"forms":{"plural":"lâncezimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lâncezime","accusative-definite-nominative-singular":"lâncezimea","accusative-indefinite-nominative-plural":"lâncezimi","accusative-definite-nominative-plural":"lâncezimile","dative-genitive-indefinite-singular":"lâncezimi","dative-definite-genitive-singular":"lâncezimii","dative-genitive-indefinite-plural":"lâncezimi","dative-definite-genitive-plural":"lâncezimilor","singular-vocative":"lâncezime","plural-vocative":"lâncezimilor"}},{"word":"lâncezire","pos":"noun","definitions":["languor, weakness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"lâncezire","accusative-definite-nominative":"lâncezirea","dative-genitive-indefinite":"lânceziri","dative-definite-genitive":"lâncezirii","vocative":"lâncezire"}},{"word":"lânceziu","pos":"adj","definitions":["weak, feeble, languid"],"forms":{"feminine-singular":"lâncezie","plural":"lâncezii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lânceziu","error-unrecognized-form-feminine-indefinite-singular":"lâncezie","error-unrecognized-form-indefinite-masculine-plural":"lâncezii","error-unrecognized-form-feminine-indefinite-neuter-plural":"lâncezii","definite-error-unrecognized-form-masculine-neuter-singular":"lânceziul","definite-error-unrecognized-form-feminine-singular":"lâncezia","definite-error-unrecognized-form-masculine-plural":"lânceziii","definite-error-unrecognized-form-feminine-neuter-plural":"lânceziile"}},{"word":"lănci","pos":"noun","definitions":["plural of lance"]},{"word":"lănciat","pos":"adj","definitions":["lanceolate"],"forms":{"feminine-singular":"lănciată","masculine-plural":"lănciați","feminine-neuter-plural":"lănciate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lănciat","error-unrecognized-form-feminine-indefinite-singular":"lănciată","error-unrecognized-form-indefinite-masculine-plural":"lănciați","error-unrecognized-form-feminine-indefinite-neuter-plural":"lănciate","definite-error-unrecognized-form-masculine-neuter-singular":"lănciatul","definite-error-unrecognized-form-feminine-singular":"lănciata","definite-error-unrecognized-form-masculine-plural":"lănciații","definite-error-unrecognized-form-feminine-neuter-plural":"lănciatele"}},{"word":"lăncier","pos":"noun","definitions":["lancer"],"forms":{"plural":"lăncieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lăncier","accusative-definite-nominative-singular":"lăncierul","accusative-indefinite-nominative-plural":"lăncieri","accusative-definite-nominative-plural":"lăncierii","dative-genitive-indefinite-singular":"lăncier","dative-definite-genitive-singular":"lăncierului","dative-genitive-indefinite-plural":"lăncieri","dative-definite-genitive-plural":"lăncierilor","singular-vocative":"lăncierule","plural-vocative":"lăncierilor"}},{"word":"lanciform","pos":"adj","definitions":["lanciform"],"forms":{"feminine-singular":"lanciformă","masculine-plural":"lanciformi","feminine-neuter-plural":"lanciforme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lanciform","error-unrecognized-form-feminine-indefinite-singular":"lanciformă","error-unrecognized-form-indefinite-masculine-plural":"lanciformi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lanciforme","definite-error-unrecognized-form-masculine-neuter-singular":"lanciformul","definite-error-unrecognized-form-feminine-singular":"lanciforma","definite-error-unrecognized-form-masculine-plural":"lanciformii","definite-error-unrecognized-form-feminine-neuter-plural":"lanciformele"}},{"word":"lancinant","pos":"adj","definitions":["throbbing"],"forms":{"feminine-singular":"lancinantă","masculine-plural":"lancinanți","feminine-neuter-plural":"lancinante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lancinant","error-unrecognized-form-feminine-indefinite-singular":"lancinantă","error-unrecognized-form-indefinite-masculine-plural":"lancinanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lancinante","definite-error-unrecognized-form-masculine-neuter-singular":"lancinantul","definite-error-unrecognized-form-feminine-singular":"lancinanta","definite-error-unrecognized-form-masculine-plural":"lancinanții","definite-error-unrecognized-form-feminine-neuter-plural":"lancinantele"}},{"word":"lăncioară","pos":"noun","definitions":["diminutive of lance"],"forms":{"plural":"lăncioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lăncioară","accusative-definite-nominative-singular":"lăncioara","accusative-indefinite-nominative-plural":"lăncioare","accusative-definite-nominative-plural":"lăncioarele","dative-genitive-indefinite-singular":"lăncioare","dative-definite-genitive-singular":"lăncioarei","dative-genitive-indefinite-plural":"lăncioare","dative-definite-genitive-plural":"lăncioarelor","singular-vocative":"lăncioară","plural-vocative":"lăncioarelor"}},{"word":"lăncișoară","pos":"noun","definitions":["diminutive of lance"],"forms":{"plural":"lăncișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lăncișoară","accusative-definite-nominative-singular":"lăncișoara","accusative-indefinite-nominative-plural":"lăncișoare","accusative-definite-nominative-plural":"lăncișoarele","dative-genitive-indefinite-singular":"lăncișoare","dative-definite-genitive-singular":"lăncișoarei","dative-genitive-indefinite-plural":"lăncișoare","dative-definite-genitive-plural":"lăncișoarelor","singular-vocative":"lăncișoară","plural-vocative":"lăncișoarelor"}},{"word":"lâncotă","pos":"noun","definitions":["conspiracy, fraud"],"forms":{"plural":"lâncote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lâncotă","accusative-definite-nominative-singular":"lâncota","accusative-indefinite-nominative-plural":"lâncote","accusative-definite-nominative-plural":"lâncotele","dative-genitive-indefinite-singular":"lâncote","dative-definite-genitive-singular":"lâncotei","dative-genitive-indefinite-plural":"lâncote","dative-definite-genitive-plural":"lâncotelor","singular-vocative":"lâncotă","plural-vocative":"lâncotelor"}},{"word":"Lancrăm","pos":"name","definitions":["a locality in Sebeș, Alba County, Romania"],"gender":"m"},{"word":"Lăncrănjan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lăncrănjan"}},{"word":"land","pos":"noun","definitions":["land (German and Austrian province)"],"forms":{"plural":"landuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"land","accusative-definite-nominative-singular":"landul","accusative-indefinite-nominative-plural":"landuri","accusative-definite-nominative-plural":"landurile","dative-genitive-indefinite-singular":"land","dative-definite-genitive-singular":"landului","dative-genitive-indefinite-plural":"landuri","dative-definite-genitive-plural":"landurilor","singular-vocative":"landule","plural-vocative":"landurilor"}},{"word":"landa","pos":"noun","definitions":["definite nominative/accusative singular of landă"],"pronunciation":"[ˈlanda]","gender":"f"},{"word":"landă","pos":"noun","definitions":["heath"],"forms":{"plural":"lande","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"landă","accusative-definite-nominative-singular":"landa","accusative-indefinite-nominative-plural":"lande","accusative-definite-nominative-plural":"landele","dative-genitive-indefinite-singular":"lande","dative-definite-genitive-singular":"landei","dative-genitive-indefinite-plural":"lande","dative-definite-genitive-plural":"landelor","singular-vocative":"landă","plural-vocative":"landelor"}},{"word":"landcartă","pos":"noun","definitions":["map"],"forms":{"plural":"landcarte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"landcartă","accusative-definite-nominative-singular":"landcarta","accusative-indefinite-nominative-plural":"landcarte","accusative-definite-nominative-plural":"landcartele","dative-genitive-indefinite-singular":"landcarte","dative-definite-genitive-singular":"landcartei","dative-genitive-indefinite-plural":"landcarte","dative-definite-genitive-plural":"landcartelor","singular-vocative":"landcartă","plural-vocative":"landcartelor"}},{"word":"lande","pos":"noun","definitions":["inflection of landă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈlande]","gender":"f"},{"word":"landgraf","pos":"noun","definitions":["landgrave"],"forms":{"plural":"landgrafi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"landgraf","accusative-definite-nominative-singular":"landgraful","accusative-indefinite-nominative-plural":"landgrafi","accusative-definite-nominative-plural":"landgrafii","dative-genitive-indefinite-singular":"landgraf","dative-definite-genitive-singular":"landgrafului","dative-genitive-indefinite-plural":"landgrafi","dative-definite-genitive-plural":"landgrafilor","singular-vocative":"landgrafule","plural-vocative":"landgrafilor"}},{"word":"landgrafat","pos":"noun","definitions":["landgraviate"],"forms":{"plural":"landgrafaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"landgrafat","accusative-definite-nominative-singular":"landgrafatul","accusative-indefinite-nominative-plural":"landgrafaturi","accusative-definite-nominative-plural":"landgrafaturile","dative-genitive-indefinite-singular":"landgrafat","dative-definite-genitive-singular":"landgrafatului","dative-genitive-indefinite-plural":"landgrafaturi","dative-definite-genitive-plural":"landgrafaturilor","singular-vocative":"landgrafatule","plural-vocative":"landgrafaturilor"}},{"word":"landgrafiat","pos":"noun","definitions":["landgraviate"],"forms":{"plural":"landgrafiate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"landgrafiat","accusative-definite-nominative-singular":"landgrafiatul","accusative-indefinite-nominative-plural":"landgrafiate","accusative-definite-nominative-plural":"landgrafiatele","dative-genitive-indefinite-singular":"landgrafiat","dative-definite-genitive-singular":"landgrafiatului","dative-genitive-indefinite-plural":"landgrafiate","dative-definite-genitive-plural":"landgrafiatelor","singular-vocative":"landgrafiatule","plural-vocative":"landgrafiatelor"}},{"word":"lando","pos":"noun","definitions":["vocative singular of landă"],"pronunciation":"[ˈlando]","gender":"f"},{"word":"landou","pos":"noun","definitions":["stroller"],"forms":{"plural":"landouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"landou","accusative-definite-nominative-singular":"landoul","accusative-indefinite-nominative-plural":"landouri","accusative-definite-nominative-plural":"landourile","dative-genitive-indefinite-singular":"landou","dative-definite-genitive-singular":"landoului","dative-genitive-indefinite-plural":"landouri","dative-definite-genitive-plural":"landourilor","singular-vocative":"landoule","plural-vocative":"landourilor"}},{"word":"lâneață","pos":"noun","definitions":["diminutive of lână"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lâneață","accusative-definite-nominative":"lâneața","dative-genitive-indefinite":"lâneațe","dative-definite-genitive":"lâneaței","vocative":"lâneață"}},{"word":"langă","pos":"noun","definitions":["flame"],"forms":{"plural":"lăngi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"langă","accusative-definite-nominative-singular":"langa","accusative-indefinite-nominative-plural":"lănge","accusative-definite-nominative-plural":"lăngele","dative-genitive-indefinite-singular":"lănge","dative-definite-genitive-singular":"lăngei","dative-genitive-indefinite-plural":"lănge","dative-definite-genitive-plural":"lăngelor","singular-vocative":"langă","plural-vocative":"lăngelor"}},{"word":"Lânga","pos":"name","definitions":["a village in Pielești, Dolj County, Romania"],"gender":"f"},{"word":"lângă","pos":"prep","definitions":["beside, next to, by, near (to), close to, alongside"],"pronunciation":"/ˈlɨn.ɡə/"},{"word":"langaj","pos":"noun","definitions":["language"],"forms":{"plural":"langaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"langaj","accusative-definite-nominative-singular":"langajul","accusative-indefinite-nominative-plural":"langaje","accusative-definite-nominative-plural":"langajele","dative-genitive-indefinite-singular":"langaj","dative-definite-genitive-singular":"langajului","dative-genitive-indefinite-plural":"langaje","dative-definite-genitive-plural":"langajelor","singular-vocative":"langajule","plural-vocative":"langajelor"}},{"word":"lânged","pos":"adj","definitions":["obsolete form of lânced"],"forms":{"feminine-singular":"lângedă","masculine-plural":"lângezi","feminine-neuter-plural":"lângede","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lânged","error-unrecognized-form-feminine-indefinite-singular":"lângedă","error-unrecognized-form-indefinite-masculine-plural":"lângezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lângede","definite-error-unrecognized-form-masculine-neuter-singular":"lângedul","definite-error-unrecognized-form-feminine-singular":"lângeda","definite-error-unrecognized-form-masculine-plural":"lângezii","definite-error-unrecognized-form-feminine-neuter-plural":"lângedele"}},{"word":"Lăngești","pos":"name","definitions":["a village in Lunca Corbului, Argeș County, Romania"],"gender":"m"},{"word":"lângezire","pos":"noun","definitions":["obsolete form of lâncezire"],"forms":{"plural":"lângeziri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lângezire","accusative-definite-nominative-singular":"lângezirea","accusative-indefinite-nominative-plural":"lângeziri","accusative-definite-nominative-plural":"lângezirile","dative-genitive-indefinite-singular":"lângeziri","dative-definite-genitive-singular":"lângezirii","dative-genitive-indefinite-plural":"lângeziri","dative-definite-genitive-plural":"lângezirilor","singular-vocative":"lângezire","plural-vocative":"lângezirilor"}},{"word":"langhid","pos":"adj","definitions":["languorous"],"forms":{"feminine-singular":"langhidă","masculine-plural":"langhizi","feminine-neuter-plural":"langhide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"langhid","error-unrecognized-form-feminine-indefinite-singular":"langhidă","error-unrecognized-form-indefinite-masculine-plural":"langhizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"langhide","definite-error-unrecognized-form-masculine-neuter-singular":"langhidul","definite-error-unrecognized-form-feminine-singular":"langhida","definite-error-unrecognized-form-masculine-plural":"langhizii","definite-error-unrecognized-form-feminine-neuter-plural":"langhidele"}},{"word":"langoare","pos":"noun","definitions":["languor"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"langoare","accusative-definite-nominative":"langoareul","dative-genitive-indefinite":"langoare","dative-definite-genitive":"langoareului","vocative":"langoareule"}},{"word":"lângoare","pos":"noun","definitions":["alternative form of lingoare"],"forms":{"plural":"lângori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lângoare","accusative-definite-nominative-singular":"lângoarea","accusative-indefinite-nominative-plural":"lângoari","accusative-definite-nominative-plural":"lângoarile","dative-genitive-indefinite-singular":"lângoari","dative-definite-genitive-singular":"lângoarii","dative-genitive-indefinite-plural":"lângoari","dative-definite-genitive-plural":"lângoarilor","singular-vocative":"lângoare","plural-vocative":"lângoarilor"}},{"word":"langoș","pos":"noun","definitions":["langos, a kind of cheese donut"],"forms":{"plural":"langoși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"langoș","accusative-definite-nominative-singular":"langoșul","accusative-indefinite-nominative-plural":"langoși","accusative-definite-nominative-plural":"langoșii","dative-genitive-indefinite-singular":"langoș","dative-definite-genitive-singular":"langoșului","dative-genitive-indefinite-plural":"langoși","dative-definite-genitive-plural":"langoșilor","singular-vocative":"langoșule","plural-vocative":"langoșilor"}},{"word":"langui","pos":"verb","definitions":["to languish"],"forms":{"canonical":"a langui 4th conjugation","present-singular-third-person":"languiește","participle-past":"languit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a langui","gerund":"languind","first-person-indicative-present-singular":"languiesc","indicative-present-second-person-singular":"languiești","indicative-present-singular-third-person":"languiește","first-person-indicative-plural-present":"languim","indicative-plural-present-second-person":"languiți","indicative-plural-present-third-person":"languiesc","first-person-imperfect-indicative-singular":"languiam","imperfect-indicative-second-person-singular":"languiai","imperfect-indicative-singular-third-person":"languia","first-person-imperfect-indicative-plural":"languiam","imperfect-indicative-plural-second-person":"languiați","imperfect-indicative-plural-third-person":"languiau","first-person-indicative-perfect-singular":"languii","indicative-perfect-second-person-singular":"languiși","indicative-perfect-singular-third-person":"langui","first-person-indicative-perfect-plural":"languirăm","indicative-perfect-plural-second-person":"languirăți","indicative-perfect-plural-third-person":"languiră","first-person-indicative-pluperfect-singular":"languisem","indicative-pluperfect-second-person-singular":"languiseși","indicative-pluperfect-singular-third-person":"languise","first-person-indicative-pluperfect-plural":"languiserăm","indicative-pluperfect-plural-second-person":"languiserăți","indicative-pluperfect-plural-third-person":"languiseră","first-person-present-singular-subjunctive":"să languiesc","present-second-person-singular-subjunctive":"să languiești","present-singular-subjunctive-third-person":"să languiască","first-person-plural-present-subjunctive":"să languim","plural-present-second-person-subjunctive":"să languiți","plural-present-subjunctive-third-person":"să languiască","imperative-second-person-singular":"languiește","imperative-plural-second-person":"languiți","imperative-negative-second-person-singular":"nu langui","imperative-negative-plural-second-person":"nu languiți"}},{"word":"languros","pos":"adj","definitions":["languorous"],"forms":{"feminine-singular":"languroasă","masculine-plural":"languroși","feminine-neuter-plural":"languroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"languros","error-unrecognized-form-feminine-indefinite-singular":"languroasă","error-unrecognized-form-indefinite-masculine-plural":"languroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"languroase","definite-error-unrecognized-form-masculine-neuter-singular":"langurosul","definite-error-unrecognized-form-feminine-singular":"languroasa","definite-error-unrecognized-form-masculine-plural":"languroșii","definite-error-unrecognized-form-feminine-neuter-plural":"languroasele"}},{"word":"lănguros","pos":"adj","definitions":["obsolete form of languros"],"forms":{"feminine-singular":"lănguroasă","masculine-plural":"lănguroși","feminine-neuter-plural":"lănguroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lănguros","error-unrecognized-form-feminine-indefinite-singular":"lănguroasă","error-unrecognized-form-indefinite-masculine-plural":"lănguroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lănguroase","definite-error-unrecognized-form-masculine-neuter-singular":"lăngurosul","definite-error-unrecognized-form-feminine-singular":"lănguroasa","definite-error-unrecognized-form-masculine-plural":"lănguroșii","definite-error-unrecognized-form-feminine-neuter-plural":"lănguroasele"}},{"word":"langurozitate","pos":"noun","definitions":["languorousness"],"forms":{"plural":"langurozități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"langurozitate","accusative-definite-nominative-singular":"langurozitatea","accusative-indefinite-nominative-plural":"langurozități","accusative-definite-nominative-plural":"langurozitățile","dative-genitive-indefinite-singular":"langurozități","dative-definite-genitive-singular":"langurozității","dative-genitive-indefinite-plural":"langurozități","dative-definite-genitive-plural":"langurozităților","singular-vocative":"langurozitate","plural-vocative":"langurozităților"}},{"word":"langusta","pos":"noun","definitions":["definite nominative/accusative singular of langustă"],"pronunciation":"[laŋˈɡusta]","gender":"f"},{"word":"langustă","pos":"noun","definitions":["lobster"],"forms":{"plural":"languste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"langustă","accusative-definite-nominative-singular":"langusta","accusative-indefinite-nominative-plural":"languste","accusative-definite-nominative-plural":"langustele","dative-genitive-indefinite-singular":"languste","dative-definite-genitive-singular":"langustei","dative-genitive-indefinite-plural":"languste","dative-definite-genitive-plural":"langustelor","singular-vocative":"langustă","plural-vocative":"langustelor"}},{"word":"lânică","pos":"noun","definitions":["diminutive of lână; small wool"],"forms":{"plural":"lânici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lânică","accusative-definite-nominative-singular":"lânica","accusative-indefinite-nominative-plural":"lânice","accusative-definite-nominative-plural":"lânicele","dative-genitive-indefinite-singular":"lânice","dative-definite-genitive-singular":"lânicei","dative-genitive-indefinite-plural":"lânice","dative-definite-genitive-plural":"lânicelor","singular-vocative":"lânică","plural-vocative":"lânicelor"}},{"word":"lanifer","pos":"adj","definitions":["laniferous"],"forms":{"feminine-singular":"laniferă","masculine-plural":"laniferi","feminine-neuter-plural":"lanifere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lanifer","error-unrecognized-form-feminine-indefinite-singular":"laniferă","error-unrecognized-form-indefinite-masculine-plural":"laniferi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lanifere","definite-error-unrecognized-form-masculine-neuter-singular":"laniferul","definite-error-unrecognized-form-feminine-singular":"lanifera","definite-error-unrecognized-form-masculine-plural":"laniferii","definite-error-unrecognized-form-feminine-neuter-plural":"laniferele"}},{"word":"lânișoară","pos":"noun","definitions":["diminutive of lână"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lânișoară","accusative-definite-nominative":"lânișoara","dative-genitive-indefinite":"lânișoare","dative-definite-genitive":"lânișoarei","vocative":"lânișoară"}},{"word":"lanist","pos":"noun","definitions":["lanista"],"forms":{"plural":"laniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lanist","accusative-definite-nominative-singular":"lanistul","accusative-indefinite-nominative-plural":"laniști","accusative-definite-nominative-plural":"laniștii","dative-genitive-indefinite-singular":"lanist","dative-definite-genitive-singular":"lanistului","dative-genitive-indefinite-plural":"laniști","dative-definite-genitive-plural":"laniștilor","singular-vocative":"lanistule","plural-vocative":"laniștilor"}},{"word":"lâniță","pos":"noun","definitions":["diminutive of lână"],"forms":{"plural":"lânițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lâniță","accusative-definite-nominative-singular":"lânița","accusative-indefinite-nominative-plural":"lânițe","accusative-definite-nominative-plural":"lânițele","dative-genitive-indefinite-singular":"lânițe","dative-definite-genitive-singular":"lâniței","dative-genitive-indefinite-plural":"lânițe","dative-definite-genitive-plural":"lânițelor","singular-vocative":"lâniță","plural-vocative":"lânițelor"}},{"word":"lanolina","pos":"noun","definitions":["definite nominative/accusative singular of lanolină"],"pronunciation":"[lanoˈlina]","gender":"f"},{"word":"lanolină","pos":"noun","definitions":["lanolin"],"forms":{"plural":"lanoline","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lanolină","accusative-definite-nominative-singular":"lanolina","accusative-indefinite-nominative-plural":"lanoline","accusative-definite-nominative-plural":"lanolinele","dative-genitive-indefinite-singular":"lanoline","dative-definite-genitive-singular":"lanolinei","dative-genitive-indefinite-plural":"lanoline","dative-definite-genitive-plural":"lanolinelor","singular-vocative":"lanolină","plural-vocative":"lanolinelor"}},{"word":"lanoline","pos":"noun","definitions":["inflection of lanolină:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[lanoˈline]","gender":"f"},{"word":"lânos","pos":"adj","definitions":["woolly"],"pronunciation":"/lɨˈnos/","forms":{"feminine-singular":"lânoasă","masculine-plural":"lânoși","feminine-neuter-plural":"lânoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lânos","error-unrecognized-form-feminine-indefinite-singular":"lânoasă","error-unrecognized-form-indefinite-masculine-plural":"lânoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lânoase","definite-error-unrecognized-form-masculine-neuter-singular":"lânosul","definite-error-unrecognized-form-feminine-singular":"lânoasa","definite-error-unrecognized-form-masculine-plural":"lânoșii","definite-error-unrecognized-form-feminine-neuter-plural":"lânoasele"}},{"word":"lansa","pos":"verb","definitions":["to pitch","to launch"],"pronunciation":"/lanˈsa/","forms":{"canonical":"a lansa 1st conjugation","present-singular-third-person":"lansează","participle-past":"lansat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a lansa","gerund":"lansând","first-person-indicative-present-singular":"lansez","indicative-present-second-person-singular":"lansezi","indicative-present-singular-third-person":"lansează","first-person-indicative-plural-present":"lansăm","indicative-plural-present-second-person":"lansați","indicative-plural-present-third-person":"lansează","first-person-imperfect-indicative-singular":"lansam","imperfect-indicative-second-person-singular":"lansai","imperfect-indicative-singular-third-person":"lansa","first-person-imperfect-indicative-plural":"lansam","imperfect-indicative-plural-second-person":"lansați","imperfect-indicative-plural-third-person":"lansau","first-person-indicative-perfect-singular":"lansai","indicative-perfect-second-person-singular":"lansași","indicative-perfect-singular-third-person":"lansă","first-person-indicative-perfect-plural":"lansarăm","indicative-perfect-plural-second-person":"lansarăți","indicative-perfect-plural-third-person":"lansară","first-person-indicative-pluperfect-singular":"lansasem","indicative-pluperfect-second-person-singular":"lansaseși","indicative-pluperfect-singular-third-person":"lansase","first-person-indicative-pluperfect-plural":"lansaserăm","indicative-pluperfect-plural-second-person":"lansaserăți","indicative-pluperfect-plural-third-person":"lansaseră","first-person-present-singular-subjunctive":"să lansez","present-second-person-singular-subjunctive":"să lansezi","present-singular-subjunctive-third-person":"să lanseze","first-person-plural-present-subjunctive":"să lansăm","plural-present-second-person-subjunctive":"să lansați","plural-present-subjunctive-third-person":"să lanseze","imperative-second-person-singular":"lansează","imperative-plural-second-person":"lansați","imperative-negative-second-person-singular":"nu lansa","imperative-negative-plural-second-person":"nu lansați"}},{"word":"lansai","pos":"verb","definitions":["inflection of lansa:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[lanˈsaj]"},{"word":"lansaj","pos":"noun","definitions":["launch"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lansaj","accusative-definite-nominative-singular":"lansajul","accusative-indefinite-nominative-plural":"lansaje","accusative-definite-nominative-plural":"lansajele","dative-genitive-indefinite-singular":"lansaj","dative-definite-genitive-singular":"lansajului","dative-genitive-indefinite-plural":"lansaje","dative-definite-genitive-plural":"lansajelor","singular-vocative":"lansajule","plural-vocative":"lansajelor"}},{"word":"lansare","pos":"noun","definitions":["launch, release"],"forms":{"plural":"lansări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lansare","accusative-definite-nominative-singular":"lansarea","accusative-indefinite-nominative-plural":"lansări","accusative-definite-nominative-plural":"lansările","dative-genitive-indefinite-singular":"lansări","dative-definite-genitive-singular":"lansării","dative-genitive-indefinite-plural":"lansări","dative-definite-genitive-plural":"lansărilor","singular-vocative":"lansare","plural-vocative":"lansărilor"}},{"word":"lansat","pos":"adj","definitions":["released"],"forms":{"feminine-singular":"lansată","masculine-plural":"lansați","feminine-neuter-plural":"lansate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lansat","error-unrecognized-form-feminine-indefinite-singular":"lansată","error-unrecognized-form-indefinite-masculine-plural":"lansați","error-unrecognized-form-feminine-indefinite-neuter-plural":"lansate","definite-error-unrecognized-form-masculine-neuter-singular":"lansatul","definite-error-unrecognized-form-feminine-singular":"lansata","definite-error-unrecognized-form-masculine-plural":"lansații","definite-error-unrecognized-form-feminine-neuter-plural":"lansatele"}},{"word":"lansator","pos":"noun","definitions":["launcher"],"forms":{"plural":"lansatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lansator","accusative-definite-nominative-singular":"lansatorul","accusative-indefinite-nominative-plural":"lansatoare","accusative-definite-nominative-plural":"lansatoarele","dative-genitive-indefinite-singular":"lansator","dative-definite-genitive-singular":"lansatorului","dative-genitive-indefinite-plural":"lansatoare","dative-definite-genitive-plural":"lansatoarelor","singular-vocative":"lansatorule","plural-vocative":"lansatoarelor"}},{"word":"lansator de grenade","pos":"noun","definitions":["grenade launcher"],"forms":{"plural":"lansatoare de grenade"}},{"word":"lansetă","pos":"noun","definitions":["lancet"],"forms":{"plural":"lansete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lansetă","accusative-definite-nominative-singular":"lanseta","accusative-indefinite-nominative-plural":"lansete","accusative-definite-nominative-plural":"lansetele","dative-genitive-indefinite-singular":"lansete","dative-definite-genitive-singular":"lansetei","dative-genitive-indefinite-plural":"lansete","dative-definite-genitive-plural":"lansetelor","singular-vocative":"lansetă","plural-vocative":"lansetelor"}},{"word":"lanț","pos":"noun","definitions":["chain"],"pronunciation":"/lant͡s/","forms":{"plural":"lanțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lanț","accusative-definite-nominative-singular":"lanțul","accusative-indefinite-nominative-plural":"lanțuri","accusative-definite-nominative-plural":"lanțurile","dative-genitive-indefinite-singular":"lanț","dative-definite-genitive-singular":"lanțului","dative-genitive-indefinite-plural":"lanțuri","dative-definite-genitive-plural":"lanțurilor","singular-vocative":"lanțule","plural-vocative":"lanțurilor","alternative":"ланц"}},{"word":"lanț de aprovizionare","pos":"noun","definitions":["supply chain"],"examples":[{"ro":"„[…] Este imposibil să afli numărul real de ore de muncă prestate de copii în cadrul unui lanț de aprovizionare. Ar trebui să ne întrebăm mai degrabă: «Se exploatează copiii prin muncă, și de ce?»“.","en":null}],"forms":{"plural":"lanțuri de aprovizionare"}},{"word":"lanț frigorifer","pos":"noun","definitions":["cold chain"]},{"word":"lanțag","pos":"noun","definitions":["chain"],"forms":{"plural":"lanțaguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lanțag","accusative-definite-nominative-singular":"lanțagul","accusative-indefinite-nominative-plural":"lanțaguri","accusative-definite-nominative-plural":"lanțagurile","dative-genitive-indefinite-singular":"lanțag","dative-definite-genitive-singular":"lanțagului","dative-genitive-indefinite-plural":"lanțaguri","dative-definite-genitive-plural":"lanțagurilor","singular-vocative":"lanțagule","plural-vocative":"lanțagurilor"}},{"word":"lantan","pos":"noun","definitions":["lanthanum (metallic element)"],"gender":"n","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lantan","accusative-definite-nominative":"lantanul","dative-genitive-indefinite":"lantan","dative-definite-genitive":"lantanului","vocative":"lantanule"}},{"word":"lantanid","pos":"noun","definitions":["lanthanide"],"forms":{"plural":"lantanide","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lantanid","accusative-definite-nominative-singular":"lantanidul","accusative-indefinite-nominative-plural":"lantanide","accusative-definite-nominative-plural":"lantanidele","dative-genitive-indefinite-singular":"lantanid","dative-definite-genitive-singular":"lantanidului","dative-genitive-indefinite-plural":"lantanide","dative-definite-genitive-plural":"lantanidelor","singular-vocative":"lantanidule","plural-vocative":"lantanidelor"}},{"word":"lantanidă","pos":"noun","definitions":["lanthanide"],"forms":{"plural":"lantanide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lantanidă","accusative-definite-nominative-singular":"lantanida","accusative-indefinite-nominative-plural":"lantanide","accusative-definite-nominative-plural":"lantanidele","dative-genitive-indefinite-singular":"lantanide","dative-definite-genitive-singular":"lantanidei","dative-genitive-indefinite-plural":"lantanide","dative-definite-genitive-plural":"lantanidelor","singular-vocative":"lantanidă","plural-vocative":"lantanidelor"}},{"word":"lănțat","pos":"adj","definitions":["lanceolate"],"forms":{"feminine-singular":"lănțată","masculine-plural":"lănțați","feminine-neuter-plural":"lănțate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lănțat","error-unrecognized-form-feminine-indefinite-singular":"lănțată","error-unrecognized-form-indefinite-masculine-plural":"lănțați","error-unrecognized-form-feminine-indefinite-neuter-plural":"lănțate","definite-error-unrecognized-form-masculine-neuter-singular":"lănțatul","definite-error-unrecognized-form-feminine-singular":"lănțata","definite-error-unrecognized-form-masculine-plural":"lănțații","definite-error-unrecognized-form-feminine-neuter-plural":"lănțatele"}},{"word":"lănțeguș","pos":"noun","definitions":["diminutive of lanțag"],"forms":{"plural":"lănțegușuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lănțeguș","accusative-definite-nominative-singular":"lănțegușul","accusative-indefinite-nominative-plural":"lănțegușuri","accusative-definite-nominative-plural":"lănțegușurile","dative-genitive-indefinite-singular":"lănțeguș","dative-definite-genitive-singular":"lănțegușului","dative-genitive-indefinite-plural":"lănțegușuri","dative-definite-genitive-plural":"lănțegușurilor","singular-vocative":"lănțegușule","plural-vocative":"lănțegușurilor"}},{"word":"lanternă","pos":"noun","definitions":["flashlight, torch","lantern"],"forms":{"plural":"lanterne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lanternă","accusative-definite-nominative-singular":"lanterna","accusative-indefinite-nominative-plural":"lanterne","accusative-definite-nominative-plural":"lanternele","dative-genitive-indefinite-singular":"lanterne","dative-definite-genitive-singular":"lanternei","dative-genitive-indefinite-plural":"lanterne","dative-definite-genitive-plural":"lanternelor","singular-vocative":"lanternă","plural-vocative":"lanternelor"}},{"word":"lanternă magică","pos":"noun","definitions":["magic lantern"],"forms":{"plural":"lanterne magice"}},{"word":"lanternou","pos":"noun","definitions":["skylight"],"forms":{"plural":"lanternouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lanternou","accusative-definite-nominative-singular":"lanternouul","accusative-indefinite-nominative-plural":"lanternouri","accusative-definite-nominative-plural":"lanternourile","dative-genitive-indefinite-singular":"lanternou","dative-definite-genitive-singular":"lanternouului","dative-genitive-indefinite-plural":"lanternouri","dative-definite-genitive-plural":"lanternourilor","singular-vocative":"lanternouule","plural-vocative":"lanternourilor"}},{"word":"lanțetă","pos":"noun","definitions":["A lancet, a sharp pointed medical instrument."],"forms":{"plural":"lanțete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lanțetă","accusative-definite-nominative-singular":"lanțeta","accusative-indefinite-nominative-plural":"lanțete","accusative-definite-nominative-plural":"lanțetele","dative-genitive-indefinite-singular":"lanțete","dative-definite-genitive-singular":"lanțetei","dative-genitive-indefinite-plural":"lanțete","dative-definite-genitive-plural":"lanțetelor","singular-vocative":"lanțetă","plural-vocative":"lanțetelor"}},{"word":"lănțic","pos":"noun","definitions":["diminutive of lanț"],"forms":{"plural":"lănțicuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lănțic","accusative-definite-nominative-singular":"lănțicul","accusative-indefinite-nominative-plural":"lănțicuri","accusative-definite-nominative-plural":"lănțicurile","dative-genitive-indefinite-singular":"lănțic","dative-definite-genitive-singular":"lănțicului","dative-genitive-indefinite-plural":"lănțicuri","dative-definite-genitive-plural":"lănțicurilor","singular-vocative":"lănțicule","plural-vocative":"lănțicurilor"}},{"word":"lănțișor","pos":"noun","definitions":["diminutive of lanț; small chain","necklace"],"forms":{"plural":"lănțișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lănțișor","accusative-definite-nominative-singular":"lănțișorul","accusative-indefinite-nominative-plural":"lănțișore","accusative-definite-nominative-plural":"lănțișorele","dative-genitive-indefinite-singular":"lănțișor","dative-definite-genitive-singular":"lănțișorului","dative-genitive-indefinite-plural":"lănțișore","dative-definite-genitive-plural":"lănțișorelor","singular-vocative":"lănțișorule","plural-vocative":"lănțișorelor"}},{"word":"lănțuc","pos":"noun","definitions":["alternative form of lănțug"],"forms":{"plural":"lănțucuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lănțuc","accusative-definite-nominative-singular":"lănțucul","accusative-indefinite-nominative-plural":"lănțucuri","accusative-definite-nominative-plural":"lănțucurile","dative-genitive-indefinite-singular":"lănțuc","dative-definite-genitive-singular":"lănțucului","dative-genitive-indefinite-plural":"lănțucuri","dative-definite-genitive-plural":"lănțucurilor","singular-vocative":"lănțucule","plural-vocative":"lănțucurilor"}},{"word":"lanțug","pos":"noun","definitions":["alternative form of lănțug"],"forms":{"plural":"lanțuguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lanțug","accusative-definite-nominative-singular":"lanțugul","accusative-indefinite-nominative-plural":"lanțuguri","accusative-definite-nominative-plural":"lanțugurile","dative-genitive-indefinite-singular":"lanțug","dative-definite-genitive-singular":"lanțugului","dative-genitive-indefinite-plural":"lanțuguri","dative-definite-genitive-plural":"lanțugurilor","singular-vocative":"lanțugule","plural-vocative":"lanțugurilor"}},{"word":"lănțui","pos":"verb","definitions":["to chain"],"forms":{"canonical":"a lănțui 4th conjugation","present-singular-third-person":"lănțuiește","participle-past":"lănțuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lănțui","gerund":"lănțuind","first-person-indicative-present-singular":"lănțuiesc","indicative-present-second-person-singular":"lănțuiești","indicative-present-singular-third-person":"lănțuiește","first-person-indicative-plural-present":"lănțuim","indicative-plural-present-second-person":"lănțuiți","indicative-plural-present-third-person":"lănțuiesc","first-person-imperfect-indicative-singular":"lănțuiam","imperfect-indicative-second-person-singular":"lănțuiai","imperfect-indicative-singular-third-person":"lănțuia","first-person-imperfect-indicative-plural":"lănțuiam","imperfect-indicative-plural-second-person":"lănțuiați","imperfect-indicative-plural-third-person":"lănțuiau","first-person-indicative-perfect-singular":"lănțuii","indicative-perfect-second-person-singular":"lănțuiși","indicative-perfect-singular-third-person":"lănțui","first-person-indicative-perfect-plural":"lănțuirăm","indicative-perfect-plural-second-person":"lănțuirăți","indicative-perfect-plural-third-person":"lănțuiră","first-person-indicative-pluperfect-singular":"lănțuisem","indicative-pluperfect-second-person-singular":"lănțuiseși","indicative-pluperfect-singular-third-person":"lănțuise","first-person-indicative-pluperfect-plural":"lănțuiserăm","indicative-pluperfect-plural-second-person":"lănțuiserăți","indicative-pluperfect-plural-third-person":"lănțuiseră","first-person-present-singular-subjunctive":"să lănțuiesc","present-second-person-singular-subjunctive":"să lănțuiești","present-singular-subjunctive-third-person":"să lănțuiască","first-person-plural-present-subjunctive":"să lănțuim","plural-present-second-person-subjunctive":"să lănțuiți","plural-present-subjunctive-third-person":"să lănțuiască","imperative-second-person-singular":"lănțuiește","imperative-plural-second-person":"lănțuiți","imperative-negative-second-person-singular":"nu lănțui","imperative-negative-plural-second-person":"nu lănțuiți"}},{"word":"lănțuire","pos":"noun","definitions":["chaining"],"forms":{"plural":"lănțuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lănțuire","accusative-definite-nominative-singular":"lănțuirea","accusative-indefinite-nominative-plural":"lănțuiri","accusative-definite-nominative-plural":"lănțuirile","dative-genitive-indefinite-singular":"lănțuiri","dative-definite-genitive-singular":"lănțuirii","dative-genitive-indefinite-plural":"lănțuiri","dative-definite-genitive-plural":"lănțuirilor","singular-vocative":"lănțuire","plural-vocative":"lănțuirilor"}},{"word":"lănțuit","pos":"adj","definitions":["chained"],"forms":{"feminine-singular":"lănțuită","masculine-plural":"lănțuiți","feminine-neuter-plural":"lănțuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lănțuit","error-unrecognized-form-feminine-indefinite-singular":"lănțuită","error-unrecognized-form-indefinite-masculine-plural":"lănțuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lănțuite","definite-error-unrecognized-form-masculine-neuter-singular":"lănțuitul","definite-error-unrecognized-form-feminine-singular":"lănțuita","definite-error-unrecognized-form-masculine-plural":"lănțuiții","definite-error-unrecognized-form-feminine-neuter-plural":"lănțuitele"}},{"word":"lănțuit","pos":"verb","definitions":["past participle of lănțui"],"forms":{"participle-past":"of lănțui"}},{"word":"lănțujel","pos":"noun","definitions":["diminutive of lanțug"],"forms":{"plural":"lănțujele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lănțujel","accusative-definite-nominative-singular":"lănțujelul","accusative-indefinite-nominative-plural":"lănțujele","accusative-definite-nominative-plural":"lănțujelele","dative-genitive-indefinite-singular":"lănțujel","dative-definite-genitive-singular":"lănțujelului","dative-genitive-indefinite-plural":"lănțujele","dative-definite-genitive-plural":"lănțujelelor","singular-vocative":"lănțujelule","plural-vocative":"lănțujelelor"}},{"word":"lănțuleț","pos":"noun","definitions":["diminutive of lanț"],"forms":{"plural":"lănțulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lănțuleț","accusative-definite-nominative-singular":"lănțulețul","accusative-indefinite-nominative-plural":"lănțulețe","accusative-definite-nominative-plural":"lănțulețele","dative-genitive-indefinite-singular":"lănțuleț","dative-definite-genitive-singular":"lănțulețului","dative-genitive-indefinite-plural":"lănțulețe","dative-definite-genitive-plural":"lănțulețelor","singular-vocative":"lănțulețule","plural-vocative":"lănțulețelor"}},{"word":"lănțurel","pos":"noun","definitions":["diminutive of lanțuri"],"forms":{"plural":"lănțurele","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lănțurel","accusative-definite-nominative-singular":"lănțurelul","accusative-indefinite-nominative-plural":"lănțurele","accusative-definite-nominative-plural":"lănțurelei","dative-genitive-indefinite-singular":"lănțurel","dative-definite-genitive-singular":"lănțurelului","dative-genitive-indefinite-plural":"lănțurele","dative-definite-genitive-plural":"lănțurelelor","singular-vocative":"lănțurelule","plural-vocative":"lănțurelelor"}},{"word":"lanțuri","pos":"noun","definitions":["plural of lanț"]},{"word":"lanțuri de aprovizionare","pos":"noun","definitions":["plural of lanț de aprovizionare"]},{"word":"lănțuros","pos":"adj","definitions":["chainlike"],"forms":{"feminine-singular":"lănțuroasă","masculine-plural":"lănțuroși","feminine-neuter-plural":"lănțuroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lănțuros","error-unrecognized-form-feminine-indefinite-singular":"lănțuroasă","error-unrecognized-form-indefinite-masculine-plural":"lănțuroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lănțuroase","definite-error-unrecognized-form-masculine-neuter-singular":"lănțurosul","definite-error-unrecognized-form-feminine-singular":"lănțuroasa","definite-error-unrecognized-form-masculine-plural":"lănțuroșii","definite-error-unrecognized-form-feminine-neuter-plural":"lănțuroasele"}},{"word":"lănțuș","pos":"noun","definitions":["diminutive of lanț; small chain"],"forms":{"plural":"lănțușe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lănțuș","accusative-definite-nominative-singular":"lănțușul","accusative-indefinite-nominative-plural":"lănțușe","accusative-definite-nominative-plural":"lănțușele","dative-genitive-indefinite-singular":"lănțuș","dative-definite-genitive-singular":"lănțușului","dative-genitive-indefinite-plural":"lănțușe","dative-definite-genitive-plural":"lănțușelor","singular-vocative":"lănțușule","plural-vocative":"lănțușelor"}},{"word":"lănțușor","pos":"noun","definitions":["diminutive of lanț; small chain","necklace"],"forms":{"plural":"lănțușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lănțușor","accusative-definite-nominative-singular":"lănțușorul","accusative-indefinite-nominative-plural":"lănțușore","accusative-definite-nominative-plural":"lănțușorele","dative-genitive-indefinite-singular":"lănțușor","dative-definite-genitive-singular":"lănțușorului","dative-genitive-indefinite-plural":"lănțușore","dative-definite-genitive-plural":"lănțușorelor","singular-vocative":"lănțușorule","plural-vocative":"lănțușorelor"}},{"word":"lănțuț","pos":"noun","definitions":["diminutive of lanț"],"forms":{"plural":"lănțuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lănțuț","accusative-definite-nominative-singular":"lănțuțul","accusative-indefinite-nominative-plural":"lănțuțe","accusative-definite-nominative-plural":"lănțuțele","dative-genitive-indefinite-singular":"lănțuț","dative-definite-genitive-singular":"lănțuțului","dative-genitive-indefinite-plural":"lănțuțe","dative-definite-genitive-plural":"lănțuțelor","singular-vocative":"lănțuțule","plural-vocative":"lănțuțelor"}},{"word":"lanugo","pos":"noun","definitions":["lanugo"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lanugo","accusative-definite-nominative":"lanugoul","dative-genitive-indefinite":"lanugo","dative-definite-genitive":"lanugoului","vocative":"lanugoule"}},{"word":"lanul","pos":"noun","definitions":["definite nominative/accusative singular of lan"]},{"word":"lanului","pos":"noun","definitions":["definite genitive/dative singular of lan"]},{"word":"lanuri","pos":"noun","definitions":["plural of lan"],"gender":"n-p"},{"word":"Lanurile","pos":"name","definitions":["a village in Viziru, Brăila County, Romania","a village in Ziduri, Buzău County, Romania","a village in Bărăganu, Constanța County, Romania"],"gender":"f"},{"word":"lanurile","pos":"noun","definitions":["definite nominative/accusative plural of lan"]},{"word":"lanurilor","pos":"noun","definitions":["definite genitive/dative plural of lan"]},{"word":"lânuță","pos":"noun","definitions":["diminutive of lână"],"forms":{"plural":"lânuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lânuță","accusative-definite-nominative-singular":"lânuța","accusative-indefinite-nominative-plural":"lânuțe","accusative-definite-nominative-plural":"lânuțele","dative-genitive-indefinite-singular":"lânuțe","dative-definite-genitive-singular":"lânuței","dative-genitive-indefinite-plural":"lânuțe","dative-definite-genitive-plural":"lânuțelor","singular-vocative":"lânuță","plural-vocative":"lânuțelor"}},{"word":"laolaltă","pos":"adv","definitions":["together"]},{"word":"laolăltuță","pos":"adv","definitions":["diminutive of laolaltă"]},{"word":"lăor","pos":"noun","definitions":["a bundle of hemp or flax ready to be spun"],"forms":{"plural":"lăori","alternative":"lior"}},{"word":"laoțian","pos":"noun","definitions":["Laotian"],"forms":{"plural":"laoțieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"laoțian","accusative-definite-nominative-singular":"laoțianul","accusative-indefinite-nominative-plural":"laoțieni","accusative-definite-nominative-plural":"laoțienii","dative-genitive-indefinite-singular":"laoțian","dative-definite-genitive-singular":"laoțianului","dative-genitive-indefinite-plural":"laoțieni","dative-definite-genitive-plural":"laoțienilor","singular-vocative":"laoțianule","plural-vocative":"laoțienilor"}},{"word":"laoțiană","pos":"noun","definitions":["female equivalent of laoțian"],"forms":{"plural":"laoțiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"laoțiană","accusative-definite-nominative-singular":"laoțiana","accusative-indefinite-nominative-plural":"laoțiene","accusative-definite-nominative-plural":"laoțienele","dative-genitive-indefinite-singular":"laoțiene","dative-definite-genitive-singular":"laoțienei","dative-genitive-indefinite-plural":"laoțiene","dative-definite-genitive-plural":"laoțienelor","singular-vocative":"laoțiană","plural-vocative":"laoțienelor"}},{"word":"lăpăda","pos":"verb","definitions":["alternative form of lepăda"],"forms":{"canonical":"a lăpăda 1st conjugation","present-singular-third-person":"lapădă","participle-past":"lăpădat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a lăpăda","gerund":"lăpădând","first-person-indicative-present-singular":"lăpăd","indicative-present-second-person-singular":"lăpăzi","indicative-present-singular-third-person":"lăpădă","first-person-indicative-plural-present":"lăpădăm","indicative-plural-present-second-person":"lăpădați","indicative-plural-present-third-person":"lăpădă","first-person-imperfect-indicative-singular":"lăpădam","imperfect-indicative-second-person-singular":"lăpădai","imperfect-indicative-singular-third-person":"lăpăda","first-person-imperfect-indicative-plural":"lăpădam","imperfect-indicative-plural-second-person":"lăpădați","imperfect-indicative-plural-third-person":"lăpădau","first-person-indicative-perfect-singular":"lăpădai","indicative-perfect-second-person-singular":"lăpădași","indicative-perfect-singular-third-person":"lăpădă","first-person-indicative-perfect-plural":"lăpădarăm","indicative-perfect-plural-second-person":"lăpădarăți","indicative-perfect-plural-third-person":"lăpădară","first-person-indicative-pluperfect-singular":"lăpădasem","indicative-pluperfect-second-person-singular":"lăpădaseși","indicative-pluperfect-singular-third-person":"lăpădase","first-person-indicative-pluperfect-plural":"lăpădaserăm","indicative-pluperfect-plural-second-person":"lăpădaserăți","indicative-pluperfect-plural-third-person":"lăpădaseră","first-person-present-singular-subjunctive":"să lăpăd","present-second-person-singular-subjunctive":"să lăpăzi","present-singular-subjunctive-third-person":"să lăpăde","first-person-plural-present-subjunctive":"să lăpădăm","plural-present-second-person-subjunctive":"să lăpădați","plural-present-subjunctive-third-person":"să lăpăde","imperative-second-person-singular":"lăpădă","imperative-plural-second-person":"lăpădați","imperative-negative-second-person-singular":"nu lăpăda","imperative-negative-plural-second-person":"nu lăpădați"}},{"word":"lăpădare","pos":"noun","definitions":["obsolete form of lepădare"],"forms":{"plural":"lăpădări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lăpădare","accusative-definite-nominative-singular":"lăpădarea","accusative-indefinite-nominative-plural":"lăpădări","accusative-definite-nominative-plural":"lăpădările","dative-genitive-indefinite-singular":"lăpădări","dative-definite-genitive-singular":"lăpădării","dative-genitive-indefinite-plural":"lăpădări","dative-definite-genitive-plural":"lăpădărilor","singular-vocative":"lăpădare","plural-vocative":"lăpădărilor"}},{"word":"Lăpădătescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lăpădătescu"}},{"word":"Lăpădeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lăpădeanu"}},{"word":"lăpăi","pos":"verb","definitions":["alternative form of lipăi"],"forms":{"canonical":"a lăpăi 4th conjugation","present-singular-third-person":"lăpăiește","participle-past":"lăpăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lăpăi","gerund":"lăpăind","first-person-indicative-present-singular":"lăpăiesc","indicative-present-second-person-singular":"lăpăiești","indicative-present-singular-third-person":"lăpăiește","first-person-indicative-plural-present":"lăpăim","indicative-plural-present-second-person":"lăpăiți","indicative-plural-present-third-person":"lăpăiesc","first-person-imperfect-indicative-singular":"lăpăiam","imperfect-indicative-second-person-singular":"lăpăiai","imperfect-indicative-singular-third-person":"lăpăia","first-person-imperfect-indicative-plural":"lăpăiam","imperfect-indicative-plural-second-person":"lăpăiați","imperfect-indicative-plural-third-person":"lăpăiau","first-person-indicative-perfect-singular":"lăpăii","indicative-perfect-second-person-singular":"lăpăiși","indicative-perfect-singular-third-person":"lăpăi","first-person-indicative-perfect-plural":"lăpăirăm","indicative-perfect-plural-second-person":"lăpăirăți","indicative-perfect-plural-third-person":"lăpăiră","first-person-indicative-pluperfect-singular":"lăpăisem","indicative-pluperfect-second-person-singular":"lăpăiseși","indicative-pluperfect-singular-third-person":"lăpăise","first-person-indicative-pluperfect-plural":"lăpăiserăm","indicative-pluperfect-plural-second-person":"lăpăiserăți","indicative-pluperfect-plural-third-person":"lăpăiseră","first-person-present-singular-subjunctive":"să lăpăiesc","present-second-person-singular-subjunctive":"să lăpăiești","present-singular-subjunctive-third-person":"să lăpăiască","first-person-plural-present-subjunctive":"să lăpăim","plural-present-second-person-subjunctive":"să lăpăiți","plural-present-subjunctive-third-person":"să lăpăiască","imperative-second-person-singular":"lăpăiește","imperative-plural-second-person":"lăpăiți","imperative-negative-second-person-singular":"nu lăpăi","imperative-negative-plural-second-person":"nu lăpăiți"}},{"word":"lapalisadă","pos":"noun","definitions":["lapalissade"],"forms":{"plural":"lapalisade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lapalisadă","accusative-definite-nominative-singular":"lapalisada","accusative-indefinite-nominative-plural":"lapalisade","accusative-definite-nominative-plural":"lapalisadele","dative-genitive-indefinite-singular":"lapalisade","dative-definite-genitive-singular":"lapalisadei","dative-genitive-indefinite-plural":"lapalisade","dative-definite-genitive-plural":"lapalisadelor","singular-vocative":"lapalisadă","plural-vocative":"lapalisadelor"}},{"word":"lapăn","pos":"noun","definitions":["slipper"],"forms":{"plural":"lapeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lapăn","accusative-definite-nominative-singular":"lapănul","accusative-indefinite-nominative-plural":"lapeni","accusative-definite-nominative-plural":"lapenii","dative-genitive-indefinite-singular":"lapăn","dative-definite-genitive-singular":"lapănului","dative-genitive-indefinite-plural":"lapeni","dative-definite-genitive-plural":"lapenilor","singular-vocative":"lapănule","plural-vocative":"lapenilor"}},{"word":"laparoscop","pos":"noun","definitions":["laparoscope"],"forms":{"plural":"laparoscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"laparoscop","accusative-definite-nominative-singular":"laparoscopul","accusative-indefinite-nominative-plural":"laparoscoape","accusative-definite-nominative-plural":"laparoscoapele","dative-genitive-indefinite-singular":"laparoscop","dative-definite-genitive-singular":"laparoscopului","dative-genitive-indefinite-plural":"laparoscoape","dative-definite-genitive-plural":"laparoscoapelor","singular-vocative":"laparoscopule","plural-vocative":"laparoscoapelor"}},{"word":"laparoscopie","pos":"noun","definitions":["laparoscopy"],"forms":{"plural":"laparoscopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"laparoscopie","accusative-definite-nominative-singular":"laparoscopia","accusative-indefinite-nominative-plural":"laparoscopii","accusative-definite-nominative-plural":"laparoscopiile","dative-genitive-indefinite-singular":"laparoscopii","dative-definite-genitive-singular":"laparoscopiei","dative-genitive-indefinite-plural":"laparoscopii","dative-definite-genitive-plural":"laparoscopiilor","singular-vocative":"laparoscopie","plural-vocative":"laparoscopiilor"}},{"word":"laparotomie","pos":"noun","definitions":["laparotomy"],"forms":{"plural":"laparotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"laparotomie","accusative-definite-nominative-singular":"laparotomia","accusative-indefinite-nominative-plural":"laparotomii","accusative-definite-nominative-plural":"laparotomiile","dative-genitive-indefinite-singular":"laparotomii","dative-definite-genitive-singular":"laparotomiei","dative-genitive-indefinite-plural":"laparotomii","dative-definite-genitive-plural":"laparotomiilor","singular-vocative":"laparotomie","plural-vocative":"laparotomiilor"}},{"word":"lapiaz","pos":"noun","definitions":["alternative form of lapiez"],"forms":{"plural":"lapiazuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lapiaz","accusative-definite-nominative-singular":"lapiazul","accusative-indefinite-nominative-plural":"lapiazuri","accusative-definite-nominative-plural":"lapiazurile","dative-genitive-indefinite-singular":"lapiaz","dative-definite-genitive-singular":"lapiazului","dative-genitive-indefinite-plural":"lapiazuri","dative-definite-genitive-plural":"lapiazurilor","singular-vocative":"lapiazule","plural-vocative":"lapiazurilor"}},{"word":"lapicid","pos":"noun","definitions":["lapicide"],"forms":{"plural":"lapicizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lapicid","accusative-definite-nominative-singular":"lapicidul","accusative-indefinite-nominative-plural":"lapicizi","accusative-definite-nominative-plural":"lapicizii","dative-genitive-indefinite-singular":"lapicid","dative-definite-genitive-singular":"lapicidului","dative-genitive-indefinite-plural":"lapicizi","dative-definite-genitive-plural":"lapicizilor","singular-vocative":"lapicidule","plural-vocative":"lapicizilor"}},{"word":"lapida","pos":"verb","definitions":["to stone"],"forms":{"canonical":"a lapida 1st conjugation","present-singular-third-person":"lapidează","participle-past":"lapidat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a lapida","gerund":"lapidând","first-person-indicative-present-singular":"lapidez","indicative-present-second-person-singular":"lapidezi","indicative-present-singular-third-person":"lapidează","first-person-indicative-plural-present":"lapidăm","indicative-plural-present-second-person":"lapidați","indicative-plural-present-third-person":"lapidează","first-person-imperfect-indicative-singular":"lapidam","imperfect-indicative-second-person-singular":"lapidai","imperfect-indicative-singular-third-person":"lapida","first-person-imperfect-indicative-plural":"lapidam","imperfect-indicative-plural-second-person":"lapidați","imperfect-indicative-plural-third-person":"lapidau","first-person-indicative-perfect-singular":"lapidai","indicative-perfect-second-person-singular":"lapidași","indicative-perfect-singular-third-person":"lapidă","first-person-indicative-perfect-plural":"lapidarăm","indicative-perfect-plural-second-person":"lapidarăți","indicative-perfect-plural-third-person":"lapidară","first-person-indicative-pluperfect-singular":"lapidasem","indicative-pluperfect-second-person-singular":"lapidaseși","indicative-pluperfect-singular-third-person":"lapidase","first-person-indicative-pluperfect-plural":"lapidaserăm","indicative-pluperfect-plural-second-person":"lapidaserăți","indicative-pluperfect-plural-third-person":"lapidaseră","first-person-present-singular-subjunctive":"să lapidez","present-second-person-singular-subjunctive":"să lapidezi","present-singular-subjunctive-third-person":"să lapideze","first-person-plural-present-subjunctive":"să lapidăm","plural-present-second-person-subjunctive":"să lapidați","plural-present-subjunctive-third-person":"să lapideze","imperative-second-person-singular":"lapidează","imperative-plural-second-person":"lapidați","imperative-negative-second-person-singular":"nu lapida","imperative-negative-plural-second-person":"nu lapidați"}},{"word":"lapidă","pos":"noun","definitions":["tombstone"],"forms":{"plural":"lapide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lapidă","accusative-definite-nominative-singular":"lapida","accusative-indefinite-nominative-plural":"lapide","accusative-definite-nominative-plural":"lapidele","dative-genitive-indefinite-singular":"lapide","dative-definite-genitive-singular":"lapidei","dative-genitive-indefinite-plural":"lapide","dative-definite-genitive-plural":"lapidelor","singular-vocative":"lapidă","plural-vocative":"lapidelor"}},{"word":"lapidar","pos":"adj","definitions":["lapidary"],"forms":{"feminine-singular":"lapidară","masculine-plural":"lapidari","feminine-neuter-plural":"lapidare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lapidar","error-unrecognized-form-feminine-indefinite-singular":"lapidară","error-unrecognized-form-indefinite-masculine-plural":"lapidari","error-unrecognized-form-feminine-indefinite-neuter-plural":"lapidare","definite-error-unrecognized-form-masculine-neuter-singular":"lapidarul","definite-error-unrecognized-form-feminine-singular":"lapidara","definite-error-unrecognized-form-masculine-plural":"lapidarii","definite-error-unrecognized-form-feminine-neuter-plural":"lapidarele"}},{"word":"lapidare","pos":"noun","definitions":["lapidation"],"forms":{"plural":"lapidări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lapidare","accusative-definite-nominative-singular":"lapidarea","accusative-indefinite-nominative-plural":"lapidări","accusative-definite-nominative-plural":"lapidările","dative-genitive-indefinite-singular":"lapidări","dative-definite-genitive-singular":"lapidării","dative-genitive-indefinite-plural":"lapidări","dative-definite-genitive-plural":"lapidărilor","singular-vocative":"lapidare","plural-vocative":"lapidărilor"}},{"word":"lapidaritate","pos":"noun","definitions":["succinctness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"lapidaritate","accusative-definite-nominative":"lapidaritatea","dative-genitive-indefinite":"lapidarități","dative-definite-genitive":"lapidarității","vocative":"-"}},{"word":"lapidariu","pos":"noun","definitions":["lapidary"],"forms":{"plural":"lapidarii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lapidariu","accusative-definite-nominative-singular":"lapidariul","accusative-indefinite-nominative-plural":"lapidarii","accusative-definite-nominative-plural":"lapidariile","dative-genitive-indefinite-singular":"lapidariu","dative-definite-genitive-singular":"lapidariului","dative-genitive-indefinite-plural":"lapidarii","dative-definite-genitive-plural":"lapidariilor","singular-vocative":"lapidariule","plural-vocative":"lapidariilor"}},{"word":"lapidarium","pos":"noun","definitions":["alternative form of lapidariu"],"forms":{"plural":"lapidariumuri"}},{"word":"lapidație","pos":"noun","definitions":["lapidation"],"forms":{"plural":"lapidații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lapidație","accusative-definite-nominative-singular":"lapidația","accusative-indefinite-nominative-plural":"lapidații","accusative-definite-nominative-plural":"lapidațiile","dative-genitive-indefinite-singular":"lapidații","dative-definite-genitive-singular":"lapidației","dative-genitive-indefinite-plural":"lapidații","dative-definite-genitive-plural":"lapidațiilor","singular-vocative":"lapidație","plural-vocative":"lapidațiilor"}},{"word":"lapis","pos":"noun","definitions":["lapis lazuli"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lapis","accusative-definite-nominative":"lapisul","dative-genitive-indefinite":"lapis","dative-definite-genitive":"lapisului","vocative":"lapisule"}},{"word":"lapislazuli","pos":"noun","definitions":["lapis lazuli"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lapislazuli","accusative-definite-nominative":"lapislazuliul","dative-genitive-indefinite":"lapislazuli","dative-definite-genitive":"lapislazuliului","vocative":"lapislazuliule"}},{"word":"lapit","pos":"noun","definitions":["Lapith"],"forms":{"plural":"lapiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lapit","accusative-definite-nominative-singular":"lapitul","accusative-indefinite-nominative-plural":"lapiți","accusative-definite-nominative-plural":"lapiții","dative-genitive-indefinite-singular":"lapit","dative-definite-genitive-singular":"lapitului","dative-genitive-indefinite-plural":"lapiți","dative-definite-genitive-plural":"lapiților","singular-vocative":"lapitule","plural-vocative":"lapiților"}},{"word":"lapon","pos":"noun","definitions":["Lapp"],"forms":{"plural":"laponi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lapon","accusative-definite-nominative-singular":"laponul","accusative-indefinite-nominative-plural":"laponi","accusative-definite-nominative-plural":"laponii","dative-genitive-indefinite-singular":"lapon","dative-definite-genitive-singular":"laponului","dative-genitive-indefinite-plural":"laponi","dative-definite-genitive-plural":"laponilor","singular-vocative":"laponule","plural-vocative":"laponilor"}},{"word":"laponă","pos":"noun","definitions":["female equivalent of lapon","Lappish language"],"forms":{"plural":"lapone","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"laponă","accusative-definite-nominative-singular":"lapona","accusative-indefinite-nominative-plural":"lapone","accusative-definite-nominative-plural":"laponele","dative-genitive-indefinite-singular":"lapone","dative-definite-genitive-singular":"laponei","dative-genitive-indefinite-plural":"lapone","dative-definite-genitive-plural":"laponelor","singular-vocative":"laponă","plural-vocative":"laponelor"}},{"word":"laponez","pos":"noun","definitions":["Lappish"],"forms":{"plural":"laponezi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"laponez","accusative-definite-nominative-singular":"laponezul","accusative-indefinite-nominative-plural":"laponezi","accusative-definite-nominative-plural":"laponezii","dative-genitive-indefinite-singular":"laponez","dative-definite-genitive-singular":"laponezului","dative-genitive-indefinite-plural":"laponezi","dative-definite-genitive-plural":"laponezilor","singular-vocative":"laponezule","plural-vocative":"laponezilor"}},{"word":"Lapoș","pos":"name","definitions":["a village in Dărmănești, Bacău County, Romania"],"gender":"m"},{"word":"Lăpoș","pos":"name","definitions":["a village in Dărmănești, Bacău County, Romania"],"gender":"m"},{"word":"Lăpoșel","pos":"name","definitions":["a village in Lapoș, Prahova County, Romania"],"gender":"m"},{"word":"lapovița","pos":"verb","definitions":["to sleet"],"forms":{"canonical":"a lapovița 1st conjugation","present-singular-third-person":"lapovițează","participle-past":"lapovițat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a lapovița","gerund":"lapovițând","first-person-indicative-present-singular":"lapoviț","indicative-present-second-person-singular":"lapoviți","indicative-present-singular-third-person":"lapoviță","first-person-indicative-plural-present":"lapovițăm","indicative-plural-present-second-person":"lapovițați","indicative-plural-present-third-person":"lapoviță","first-person-imperfect-indicative-singular":"lapovițam","imperfect-indicative-second-person-singular":"lapovițai","imperfect-indicative-singular-third-person":"lapovița","first-person-imperfect-indicative-plural":"lapovițam","imperfect-indicative-plural-second-person":"lapovițați","imperfect-indicative-plural-third-person":"lapovițau","first-person-indicative-perfect-singular":"lapovițai","indicative-perfect-second-person-singular":"lapovițași","indicative-perfect-singular-third-person":"lapoviță","first-person-indicative-perfect-plural":"lapovițarăm","indicative-perfect-plural-second-person":"lapovițarăți","indicative-perfect-plural-third-person":"lapovițară","first-person-indicative-pluperfect-singular":"lapovițasem","indicative-pluperfect-second-person-singular":"lapovițaseși","indicative-pluperfect-singular-third-person":"lapovițase","first-person-indicative-pluperfect-plural":"lapovițaserăm","indicative-pluperfect-plural-second-person":"lapovițaserăți","indicative-pluperfect-plural-third-person":"lapovițaseră","first-person-present-singular-subjunctive":"să lapoviț","present-second-person-singular-subjunctive":"să lapoviți","present-singular-subjunctive-third-person":"să lapovițe","first-person-plural-present-subjunctive":"să lapovițăm","plural-present-second-person-subjunctive":"să lapovițați","plural-present-subjunctive-third-person":"să lapovițe","imperative-second-person-singular":"lapoviță","imperative-plural-second-person":"lapovițați","imperative-negative-second-person-singular":"nu lapovița","imperative-negative-plural-second-person":"nu lapovițați"}},{"word":"Lapoviță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lapoviță"}},{"word":"lapoviță","pos":"noun","definitions":["sleet"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lapoviță","accusative-definite-nominative":"lapovița","dative-genitive-indefinite":"lapovițe","dative-definite-genitive":"lapoviței","vocative":"lapoviță"}},{"word":"lapsus","pos":"noun","definitions":["on the tip of one's tongue","slip of the tongue"],"forms":{"plural":"lapsusuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lapsus","accusative-definite-nominative-singular":"lapsusul","accusative-indefinite-nominative-plural":"lapsusuri","accusative-definite-nominative-plural":"lapsusurile","dative-genitive-indefinite-singular":"lapsus","dative-definite-genitive-singular":"lapsusului","dative-genitive-indefinite-plural":"lapsusuri","dative-definite-genitive-plural":"lapsusurilor","singular-vocative":"lapsusule","plural-vocative":"lapsusurilor"}},{"word":"lăpta","pos":"verb","definitions":["to breastfeed"],"forms":{"canonical":"a lăpta 1st conjugation","present-singular-third-person":"lăptează","participle-past":"lăptat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a lăpta","gerund":"lăptând","first-person-indicative-present-singular":"lăptez","indicative-present-second-person-singular":"lăptezi","indicative-present-singular-third-person":"lăptează","first-person-indicative-plural-present":"lăptăm","indicative-plural-present-second-person":"lăptați","indicative-plural-present-third-person":"lăptează","first-person-imperfect-indicative-singular":"lăptam","imperfect-indicative-second-person-singular":"lăptai","imperfect-indicative-singular-third-person":"lăpta","first-person-imperfect-indicative-plural":"lăptam","imperfect-indicative-plural-second-person":"lăptați","imperfect-indicative-plural-third-person":"lăptau","first-person-indicative-perfect-singular":"lăptai","indicative-perfect-second-person-singular":"lăptași","indicative-perfect-singular-third-person":"lăptă","first-person-indicative-perfect-plural":"lăptarăm","indicative-perfect-plural-second-person":"lăptarăți","indicative-perfect-plural-third-person":"lăptară","first-person-indicative-pluperfect-singular":"lăptasem","indicative-pluperfect-second-person-singular":"lăptaseși","indicative-pluperfect-singular-third-person":"lăptase","first-person-indicative-pluperfect-plural":"lăptaserăm","indicative-pluperfect-plural-second-person":"lăptaserăți","indicative-pluperfect-plural-third-person":"lăptaseră","first-person-present-singular-subjunctive":"să lăptez","present-second-person-singular-subjunctive":"să lăptezi","present-singular-subjunctive-third-person":"să lăpteze","first-person-plural-present-subjunctive":"să lăptăm","plural-present-second-person-subjunctive":"să lăptați","plural-present-subjunctive-third-person":"să lăpteze","imperative-second-person-singular":"lăptează","imperative-plural-second-person":"lăptați","imperative-negative-second-person-singular":"nu lăpta","imperative-negative-plural-second-person":"nu lăptați"}},{"word":"laptagiu","pos":"noun","definitions":["milkman"],"forms":{"plural":"laptagii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"laptagiu","accusative-definite-nominative-singular":"laptagiuul","accusative-indefinite-nominative-plural":"laptagii","accusative-definite-nominative-plural":"laptagiii","dative-genitive-indefinite-singular":"laptagiu","dative-definite-genitive-singular":"laptagiuului","dative-genitive-indefinite-plural":"laptagii","dative-definite-genitive-plural":"laptagiilor","singular-vocative":"laptagiuule","plural-vocative":"laptagiilor"}},{"word":"lăptar","pos":"noun","definitions":["milkman","dairyman"],"forms":{"plural":"lăptari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lăptar","accusative-definite-nominative-singular":"lăptarul","accusative-indefinite-nominative-plural":"lăptari","accusative-definite-nominative-plural":"lăptarii","dative-genitive-indefinite-singular":"lăptar","dative-definite-genitive-singular":"lăptarului","dative-genitive-indefinite-plural":"lăptari","dative-definite-genitive-plural":"lăptarilor","singular-vocative":"lăptarule","plural-vocative":"lăptarilor"}},{"word":"lăptare","pos":"noun","definitions":["breastfeeding, lactation"],"forms":{"plural":"lăptări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lăptare","accusative-definite-nominative-singular":"lăptarea","accusative-indefinite-nominative-plural":"lăptări","accusative-definite-nominative-plural":"lăptările","dative-genitive-indefinite-singular":"lăptări","dative-definite-genitive-singular":"lăptării","dative-genitive-indefinite-plural":"lăptări","dative-definite-genitive-plural":"lăptărilor","singular-vocative":"lăptare","plural-vocative":"lăptărilor"}},{"word":"lăptăreasă","pos":"noun","definitions":["female equivalent of lăptar"],"forms":{"plural":"lăptărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lăptăreasă","accusative-definite-nominative-singular":"lăptăreasa","accusative-indefinite-nominative-plural":"lăptărese","accusative-definite-nominative-plural":"lăptăresele","dative-genitive-indefinite-singular":"lăptărese","dative-definite-genitive-singular":"lăptăresei","dative-genitive-indefinite-plural":"lăptărese","dative-definite-genitive-plural":"lăptăreselor","singular-vocative":"lăptăreasă","plural-vocative":"lăptăreselor"}},{"word":"lăptărie","pos":"noun","definitions":["dairy or milk shop/store"],"forms":{"plural":"lăptării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lăptărie","accusative-definite-nominative-singular":"lăptăria","accusative-indefinite-nominative-plural":"lăptării","accusative-definite-nominative-plural":"lăptăriile","dative-genitive-indefinite-singular":"lăptării","dative-definite-genitive-singular":"lăptăriei","dative-genitive-indefinite-plural":"lăptării","dative-definite-genitive-plural":"lăptăriilor","singular-vocative":"lăptărie","plural-vocative":"lăptăriilor"}},{"word":"lăptăriță","pos":"noun","definitions":["female equivalent of lăptar"],"forms":{"plural":"lăptărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lăptăriță","accusative-definite-nominative-singular":"lăptărița","accusative-indefinite-nominative-plural":"lăptărițe","accusative-definite-nominative-plural":"lăptărițele","dative-genitive-indefinite-singular":"lăptărițe","dative-definite-genitive-singular":"lăptăriței","dative-genitive-indefinite-plural":"lăptărițe","dative-definite-genitive-plural":"lăptărițelor","singular-vocative":"lăptăriță","plural-vocative":"lăptărițelor"}},{"word":"Lăptaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Lăptaru"}},{"word":"Lapte","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lapte"}},{"word":"lapte","pos":"noun","definitions":["milk","type of milk"],"pronunciation":"[ˈlapte]","forms":{"plural":"lăpturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-e","accusative-indefinite-nominative-singular":"lapte","accusative-definite-nominative-singular":"laptele","accusative-indefinite-nominative-plural":"lăpturi","accusative-definite-nominative-plural":"lăpturile","dative-genitive-indefinite-singular":"lapte","dative-definite-genitive-singular":"laptelui","dative-genitive-indefinite-plural":"lăpturi","dative-definite-genitive-plural":"lăpturilor","singular-vocative":"lapte","plural-vocative":"lăpturilor"}},{"word":"lapte bătut","pos":"noun","definitions":["sour milk"]},{"word":"lapte condensat","pos":"noun","definitions":["condensed milk"]},{"word":"lapte covăsit","pos":"noun","definitions":["buttermilk"]},{"word":"lapte de cocos","pos":"noun","definitions":["coconut milk"]},{"word":"lapte de oaie","pos":"noun","definitions":["sheep milk"]},{"word":"lapte de pasăre","pos":"noun","definitions":["floating island"]},{"word":"lapte de var","pos":"noun","definitions":["whitewash"]},{"word":"lapte gros","pos":"noun","definitions":["A game where the members of one team line up in a chain and tuck their heads between the legs of the person in front of them, after which the members of the opposing team jump over them in an effort to make them fall or break up while shouting \"Lapte gros!\". It is similar to leapfrog."]},{"word":"lapte praf","pos":"noun","definitions":["powdered milk"]},{"word":"laptele","pos":"noun","definitions":["definite nominative/accusative of lapte"],"pronunciation":"[ˈlap.te.le]","gender":"n"},{"word":"laptele câinelui","pos":"noun","definitions":["cypress spurge (Euphorbia cyparissias)"]},{"word":"laptele stâncii","pos":"noun","definitions":["milkwhite rock jasmine (Androsace lactea)"]},{"word":"laptelui","pos":"noun","definitions":["definite genitive/dative of lapte"],"pronunciation":"[ˈlapteluj]","gender":"n"},{"word":"lăpțer","pos":"noun","definitions":["milkman"],"forms":{"plural":"lăpțeri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lăpțer","accusative-definite-nominative-singular":"lăpțerul","accusative-indefinite-nominative-plural":"lăpțeri","accusative-definite-nominative-plural":"lăpțerii","dative-genitive-indefinite-singular":"lăpțer","dative-definite-genitive-singular":"lăpțerului","dative-genitive-indefinite-plural":"lăpțeri","dative-definite-genitive-plural":"lăpțerilor","singular-vocative":"lăpțerule","plural-vocative":"lăpțerilor"}},{"word":"lapți","pos":"noun","definitions":["milt; soft roe"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"lapți","accusative-definite-nominative":"lapții","dative-genitive-indefinite":"lapți","dative-definite-genitive":"lapților","vocative":"lapților"}},{"word":"lăptic","pos":"noun","definitions":["diminutive of lapte; small milk"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lăptic","accusative-definite-nominative":"lăpticul","dative-genitive-indefinite":"lăptic","dative-definite-genitive":"lăpticului","vocative":"lăpticule"}},{"word":"lăpticel","pos":"noun","definitions":["diminutive of lapte; a small amount of milk"],"forms":{"plural":"lăpticele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lăpticel","accusative-definite-nominative-singular":"lăpticelul","accusative-indefinite-nominative-plural":"lăpticele","accusative-definite-nominative-plural":"lăpticelele","dative-genitive-indefinite-singular":"lăpticel","dative-definite-genitive-singular":"lăpticelului","dative-genitive-indefinite-plural":"lăpticele","dative-definite-genitive-plural":"lăpticelelor","singular-vocative":"lăpticelule","plural-vocative":"lăpticelelor"}},{"word":"lăptire","pos":"noun","definitions":["breastfeeding, lactation"],"forms":{"plural":"lăptiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lăptire","accusative-definite-nominative-singular":"lăptirea","accusative-indefinite-nominative-plural":"lăptiri","accusative-definite-nominative-plural":"lăptirile","dative-genitive-indefinite-singular":"lăptiri","dative-definite-genitive-singular":"lăptirii","dative-genitive-indefinite-plural":"lăptiri","dative-definite-genitive-plural":"lăptirilor","singular-vocative":"lăptire","plural-vocative":"lăptirilor"}},{"word":"lăptișor","pos":"noun","definitions":["diminutive of lapte; a small amount of milk"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lăptișor","accusative-definite-nominative-singular":"lăptișorul","accusative-indefinite-nominative-plural":"lăptișore","accusative-definite-nominative-plural":"lăptișorele","dative-genitive-indefinite-singular":"lăptișor","dative-definite-genitive-singular":"lăptișorului","dative-genitive-indefinite-plural":"lăptișore","dative-definite-genitive-plural":"lăptișorelor","singular-vocative":"lăptișorule","plural-vocative":"lăptișorelor"}},{"word":"lăptișor","pos":"noun","definitions":["A small flower, Androsace villosa, having white or pink petals and native to cold and temperate climates."],"forms":{"plural":"lăptișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lăptișor","accusative-definite-nominative-singular":"lăptișorul","accusative-indefinite-nominative-plural":"lăptișori","accusative-definite-nominative-plural":"lăptișorii","dative-genitive-indefinite-singular":"lăptișor","dative-definite-genitive-singular":"lăptișorului","dative-genitive-indefinite-plural":"lăptișori","dative-definite-genitive-plural":"lăptișorilor","singular-vocative":"lăptișorule","plural-vocative":"lăptișorilor"}},{"word":"lăptiuc","pos":"noun","definitions":["diminutive of lapte"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lăptiuc","accusative-definite-nominative":"lăptiucul","dative-genitive-indefinite":"lăptiuc","dative-definite-genitive":"lăptiucului","vocative":"lăptiucule"}},{"word":"lăptoc","pos":"noun","definitions":["headrace"],"forms":{"plural":"lăptoace","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lăptoc","accusative-definite-nominative-singular":"lăptocul","accusative-indefinite-nominative-plural":"lăptoace","accusative-definite-nominative-plural":"lăptoacei","dative-genitive-indefinite-singular":"lăptoc","dative-definite-genitive-singular":"lăptocului","dative-genitive-indefinite-plural":"lăptoace","dative-definite-genitive-plural":"lăptoacelor","singular-vocative":"lăptocule","plural-vocative":"lăptoacelor"}},{"word":"laptop","pos":"noun","definitions":["laptop"],"pronunciation":"/ˈlep.top/","forms":{"plural":"laptopuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"laptop","accusative-definite-nominative-singular":"laptopul","accusative-indefinite-nominative-plural":"laptopuri","accusative-definite-nominative-plural":"laptopurile","dative-genitive-indefinite-singular":"laptop","dative-definite-genitive-singular":"laptopului","dative-genitive-indefinite-plural":"laptopuri","dative-definite-genitive-plural":"laptopurilor","singular-vocative":"laptopule","plural-vocative":"laptopurilor"}},{"word":"lăptos","pos":"adj","definitions":["milky"],"pronunciation":"/ləpˈtos/","forms":{"feminine-singular":"lăptoasă","masculine-plural":"lăptoși","feminine-neuter-plural":"lăptoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăptos","error-unrecognized-form-feminine-indefinite-singular":"lăptoasă","error-unrecognized-form-indefinite-masculine-plural":"lăptoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăptoase","definite-error-unrecognized-form-masculine-neuter-singular":"lăptosul","definite-error-unrecognized-form-feminine-singular":"lăptoasa","definite-error-unrecognized-form-masculine-plural":"lăptoșii","definite-error-unrecognized-form-feminine-neuter-plural":"lăptoasele"}},{"word":"lăptoșit","pos":"adj","definitions":["turned into milk"],"forms":{"feminine-singular":"lăptoșită","masculine-plural":"lăptoșiți","feminine-neuter-plural":"lăptoșite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăptoșit","error-unrecognized-form-feminine-indefinite-singular":"lăptoșită","error-unrecognized-form-indefinite-masculine-plural":"lăptoșiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăptoșite","definite-error-unrecognized-form-masculine-neuter-singular":"lăptoșitul","definite-error-unrecognized-form-feminine-singular":"lăptoșita","definite-error-unrecognized-form-masculine-plural":"lăptoșiții","definite-error-unrecognized-form-feminine-neuter-plural":"lăptoșitele"}},{"word":"lăptoșit","pos":"verb","definitions":["past participle of lăptoși"],"forms":{"participle-past":"of lăptoși"}},{"word":"Lăptucă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lăptucă"}},{"word":"lăptucă","pos":"noun","definitions":["lettuce (an edible plant, Lactuca)"],"pronunciation":"/ləpˈtukə/","forms":{"plural":"lăptuci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lăptucă","accusative-definite-nominative-singular":"lăptuca","accusative-indefinite-nominative-plural":"lăptuci","accusative-definite-nominative-plural":"lăptucile","dative-genitive-indefinite-singular":"lăptuci","dative-definite-genitive-singular":"lăptucii","dative-genitive-indefinite-plural":"lăptuci","dative-definite-genitive-plural":"lăptucilor","singular-vocative":"lăptucă","plural-vocative":"lăptucilor"}},{"word":"lăptuceală","pos":"noun","definitions":["beating"],"forms":{"plural":"lăptuceli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lăptuceală","accusative-definite-nominative-singular":"lăptuceala","accusative-indefinite-nominative-plural":"lăptucele","accusative-definite-nominative-plural":"lăptucelele","dative-genitive-indefinite-singular":"lăptucele","dative-definite-genitive-singular":"lăptucelei","dative-genitive-indefinite-plural":"lăptucele","dative-definite-genitive-plural":"lăptucelelor","singular-vocative":"lăptuceală","plural-vocative":"lăptucelelor"}},{"word":"lăptuci","pos":"verb","definitions":["to slap"],"forms":{"canonical":"a lăptuci 4th conjugation","present-singular-third-person":"lăptucie","participle-past":"lăptucit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a lăptuci","gerund":"lăptucind","first-person-indicative-present-singular":"lăptuc","indicative-present-second-person-singular":"lăptuci","indicative-present-singular-third-person":"lăptuce","first-person-indicative-plural-present":"lăptucim","indicative-plural-present-second-person":"lăptuciți","indicative-plural-present-third-person":"lăptuc","first-person-imperfect-indicative-singular":"lăptuceam","imperfect-indicative-second-person-singular":"lăptuceai","imperfect-indicative-singular-third-person":"lăptucea","first-person-imperfect-indicative-plural":"lăptuceam","imperfect-indicative-plural-second-person":"lăptuceați","imperfect-indicative-plural-third-person":"lăptuceau","first-person-indicative-perfect-singular":"lăptucii","indicative-perfect-second-person-singular":"lăptuciși","indicative-perfect-singular-third-person":"lăptuci","first-person-indicative-perfect-plural":"lăptucirăm","indicative-perfect-plural-second-person":"lăptucirăți","indicative-perfect-plural-third-person":"lăptuciră","first-person-indicative-pluperfect-singular":"lăptucisem","indicative-pluperfect-second-person-singular":"lăptuciseși","indicative-pluperfect-singular-third-person":"lăptucise","first-person-indicative-pluperfect-plural":"lăptuciserăm","indicative-pluperfect-plural-second-person":"lăptuciserăți","indicative-pluperfect-plural-third-person":"lăptuciseră","first-person-present-singular-subjunctive":"să lăptuc","present-second-person-singular-subjunctive":"să lăptuci","present-singular-subjunctive-third-person":"să lăptucă","first-person-plural-present-subjunctive":"să lăptucim","plural-present-second-person-subjunctive":"să lăptuciți","plural-present-subjunctive-third-person":"să lăptucă","imperative-second-person-singular":"lăptuce","imperative-plural-second-person":"lăptuciți","imperative-negative-second-person-singular":"nu lăptuci","imperative-negative-plural-second-person":"nu lăptuciți"}},{"word":"lăptuci","pos":"noun","definitions":["inflection of lăptucă:","indefinite nominative/accusative/genitive/dative plural","indefinite genitive/dative singular"]},{"word":"lăptucit","pos":"adj","definitions":["slapped"],"forms":{"feminine-singular":"lăptucită","masculine-plural":"lăptuciți","feminine-neuter-plural":"lăptucite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăptucit","error-unrecognized-form-feminine-indefinite-singular":"lăptucită","error-unrecognized-form-indefinite-masculine-plural":"lăptuciți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăptucite","definite-error-unrecognized-form-masculine-neuter-singular":"lăptucitul","definite-error-unrecognized-form-feminine-singular":"lăptucita","definite-error-unrecognized-form-masculine-plural":"lăptuciții","definite-error-unrecognized-form-feminine-neuter-plural":"lăptucitele"}},{"word":"lăptucit","pos":"verb","definitions":["past participle of lăptuci"],"forms":{"participle-past":"of lăptuci"}},{"word":"lăpturi","pos":"noun","definitions":["plural of lapte"],"pronunciation":"/ˈləp.turʲ/"},{"word":"lăpturiu","pos":"adj","definitions":["milk-white"],"forms":{"feminine-singular":"lăpturie","plural":"lăpturii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăpturiu","error-unrecognized-form-feminine-indefinite-singular":"lăpturie","error-unrecognized-form-indefinite-masculine-plural":"lăpturii","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăpturii","definite-error-unrecognized-form-masculine-neuter-singular":"lăpturiul","definite-error-unrecognized-form-feminine-singular":"lăpturia","definite-error-unrecognized-form-masculine-plural":"lăpturiii","definite-error-unrecognized-form-feminine-neuter-plural":"lăpturiile"}},{"word":"lăptuș","pos":"noun","definitions":["milt, soft roe"],"forms":{"plural":"lăptuși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lăptuș","accusative-definite-nominative-singular":"lăptușul","accusative-indefinite-nominative-plural":"lăptuși","accusative-definite-nominative-plural":"lăptușii","dative-genitive-indefinite-singular":"lăptuș","dative-definite-genitive-singular":"lăptușului","dative-genitive-indefinite-plural":"lăptuși","dative-definite-genitive-plural":"lăptușilor","singular-vocative":"lăptușule","plural-vocative":"lăptușilor"}},{"word":"lăptuț","pos":"noun","definitions":["diminutive of lapte"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lăptuț","accusative-definite-nominative":"lăptuțul","dative-genitive-indefinite":"lăptuț","dative-definite-genitive":"lăptuțului","vocative":"lăptuțule"}},{"word":"Lăpugeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lăpugeanu"}},{"word":"Lăpugiu de Jos","pos":"name","definitions":["a commune of Hunedoara County, Romania","a village in Lăpugiu de Jos, Hunedoara County, Romania"],"gender":"m"},{"word":"Lăpugiu de Sus","pos":"name","definitions":["a village in Lăpugiu de Jos, Hunedoara County, Romania"],"gender":"m"},{"word":"Lăpuș","pos":"name","definitions":["a commune of Maramureș County, Romania","a village in Lăpuș, Maramureș County, Romania"],"gender":"m"},{"word":"lăpuș","pos":"noun","definitions":["heartleaf oxeye (Telekia speciosa)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"lăpuș","accusative-definite-nominative":"lăpușul","dative-genitive-indefinite":"lăpuș","dative-definite-genitive":"lăpușului","vocative":"lăpușule"}},{"word":"Lăpușan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lăpușan"}},{"word":"Lăpușani","pos":"name","definitions":["a village in Coșești, Argeș County, Romania"],"gender":"m"},{"word":"Lăpușanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lăpușanu"}},{"word":"Lăpușata","pos":"name","definitions":["a commune of Vâlcea County, Romania"],"gender":"f"},{"word":"Lăpușel","pos":"name","definitions":["a village in Recea, Maramureș County, Romania"],"gender":"m"},{"word":"Lăpușna","pos":"name","definitions":["a village in Ibănești, Mureș County, Romania","a county of Romania"],"gender":"f"},{"word":"Lăpușna Mare","pos":"name","definitions":["a river in Maramureș, Romania, tributary to the Valea Roșie"],"gender":"f"},{"word":"Lăpușna Mică","pos":"name","definitions":["a river in Maramureș, Romania, tributary to the Valea Roșie"],"gender":"f"},{"word":"Lăpușneanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lăpușneanu"}},{"word":"Lăpușnianu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lăpușnianu"}},{"word":"Lăpușnic","pos":"name","definitions":["a village in Dobra, Hunedoara County, Romania","a village in Bara, Timiș County, Romania"],"gender":"m"},{"word":"Lăpușniceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lăpușniceanu"}},{"word":"Lăpușnicel","pos":"name","definitions":["a commune of Caraș-Severin County, Romania","a village in Lăpușnicel, Caraș-Severin County, Romania"],"gender":"m"},{"word":"Lăpușnicu","pos":"name","definitions":["a river in Caraș-Severin County, Romania, tributary to the Nera"],"gender":"m"},{"word":"Lăpușnicu Mare","pos":"name","definitions":["a commune of Caraș-Severin County, Romania","a village in Lăpușnicu Mare, Caraș-Severin County, Romania"],"gender":"m"},{"word":"Lăpușnicul Mare","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Mare"],"gender":"m"},{"word":"Lăpușnicul Mic","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Lăpușnicul Mare"],"gender":"m"},{"word":"Lăpușteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lăpușteanu"}},{"word":"Lăpuștești","pos":"name","definitions":["a village in Râșca, Cluj County, Romania"],"gender":"m"},{"word":"larariu","pos":"noun","definitions":["lararium"],"forms":{"plural":"lararii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"larariu","accusative-definite-nominative-singular":"larariuul","accusative-indefinite-nominative-plural":"lararii","accusative-definite-nominative-plural":"larariile","dative-genitive-indefinite-singular":"larariu","dative-definite-genitive-singular":"larariuului","dative-genitive-indefinite-plural":"lararii","dative-definite-genitive-plural":"larariilor","singular-vocative":"larariuule","plural-vocative":"larariilor"}},{"word":"lard","pos":"noun","definitions":["bacon","pig-fat"],"forms":{"plural":"larduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lard","accusative-definite-nominative-singular":"lardul","accusative-indefinite-nominative-plural":"larduri","accusative-definite-nominative-plural":"lardurile","dative-genitive-indefinite-singular":"lard","dative-definite-genitive-singular":"lardului","dative-genitive-indefinite-plural":"larduri","dative-definite-genitive-plural":"lardurilor","singular-vocative":"lardule","plural-vocative":"lardurilor"}},{"word":"lărdos","pos":"adj","definitions":["lardy"],"forms":{"feminine-singular":"lărdoasă","masculine-plural":"lărdoși","feminine-neuter-plural":"lărdoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lărdos","error-unrecognized-form-feminine-indefinite-singular":"lărdoasă","error-unrecognized-form-indefinite-masculine-plural":"lărdoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lărdoase","definite-error-unrecognized-form-masculine-neuter-singular":"lărdosul","definite-error-unrecognized-form-feminine-singular":"lărdoasa","definite-error-unrecognized-form-masculine-plural":"lărdoșii","definite-error-unrecognized-form-feminine-neuter-plural":"lărdoasele"}},{"word":"lare","pos":"noun","definitions":["washing"],"forms":{"plural":"lări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"lare","accusative-definite-nominative":"larea","dative-genitive-indefinite":"lări","dative-definite-genitive":"lării","vocative":"lare"}},{"word":"larg","pos":"adj","definitions":["wide"],"pronunciation":"[larɡ]","forms":{"feminine-singular":"largă","plural":"largi","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"larg","error-unrecognized-form-feminine-indefinite-singular":"largă","error-unrecognized-form-indefinite-masculine-plural":"largi","error-unrecognized-form-feminine-indefinite-neuter-plural":"largi","definite-error-unrecognized-form-masculine-neuter-singular":"largul","definite-error-unrecognized-form-feminine-singular":"larga","definite-error-unrecognized-form-masculine-plural":"largii","definite-error-unrecognized-form-feminine-neuter-plural":"largile"}},{"word":"Larga","pos":"name","definitions":["a village in Dofteana, Bacău County, Romania","a village in Samarinești, Gorj County, Romania","a village in Suciu de Sus, Maramureș County, Romania","a locality in Sarmașu, Mureș County, Romania","a village in Gurghiu, Mureș County, Romania"],"gender":"f"},{"word":"largă","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of larg"]},{"word":"Larga Mare","pos":"name","definitions":["a river in Sibiu, Romania, tributary to the Sebeș","a river in Brașov, Romania, tributary to the Timiș"],"gender":"f"},{"word":"Larga Mică","pos":"name","definitions":["a river in Sibiu, Romania, tributary to the Sebeș","a river in Brașov, Romania, tributary to the Larga Mare"],"gender":"f"},{"word":"Larga Nouă","pos":"name","definitions":["a village in Larga Nouă, Cahul Raion, Moldova","a commune of Cahul Raion, Moldova"],"gender":"f"},{"word":"Larga Veche","pos":"name","definitions":["a village in Larga Nouă, Cahul Raion, Moldova"],"gender":"f"},{"word":"Larga-Jijia","pos":"name","definitions":["a village in Movileni, Iași County, Romania"],"gender":"f"},{"word":"Lărgeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lărgeanu"}},{"word":"lărgelnic","pos":"adj","definitions":["wide"],"forms":{"feminine-singular":"lărgelnică","masculine-plural":"lărgelnici","feminine-neuter-plural":"lărgelnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lărgelnic","error-unrecognized-form-feminine-indefinite-singular":"lărgelnică","error-unrecognized-form-indefinite-masculine-plural":"lărgelnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"lărgelnice","definite-error-unrecognized-form-masculine-neuter-singular":"lărgelnicul","definite-error-unrecognized-form-feminine-singular":"lărgelnica","definite-error-unrecognized-form-masculine-plural":"lărgelnicii","definite-error-unrecognized-form-feminine-neuter-plural":"lărgelnicele"}},{"word":"larghețe","pos":"noun","definitions":["munificence"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"larghețe","accusative-definite-nominative":"larghețea","dative-genitive-indefinite":"larghețe","dative-definite-genitive":"largheței","vocative":"larghețe"}},{"word":"larghetto","pos":"adv","definitions":["larghetto"]},{"word":"largi","pos":"adj","definitions":["inflection of larg:","indefinite plural","indefinite genitive/dative feminine singular"]},{"word":"lărgi","pos":"verb","definitions":["to enlarge, expand, extend","to widen, broaden","to amplify"],"forms":{"canonical":"a lărgi 4th conjugation","present-singular-third-person":"lărgește","participle-past":"lărgit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lărgi","gerund":"lărgind","first-person-indicative-present-singular":"lărgesc","indicative-present-second-person-singular":"lărgești","indicative-present-singular-third-person":"lărgește","first-person-indicative-plural-present":"lărgim","indicative-plural-present-second-person":"lărgiți","indicative-plural-present-third-person":"lărgesc","first-person-imperfect-indicative-singular":"lărgeam","imperfect-indicative-second-person-singular":"lărgeai","imperfect-indicative-singular-third-person":"lărgea","first-person-imperfect-indicative-plural":"lărgeam","imperfect-indicative-plural-second-person":"lărgeați","imperfect-indicative-plural-third-person":"lărgeau","first-person-indicative-perfect-singular":"lărgii","indicative-perfect-second-person-singular":"lărgiși","indicative-perfect-singular-third-person":"lărgi","first-person-indicative-perfect-plural":"lărgirăm","indicative-perfect-plural-second-person":"lărgirăți","indicative-perfect-plural-third-person":"lărgiră","first-person-indicative-pluperfect-singular":"lărgisem","indicative-pluperfect-second-person-singular":"lărgiseși","indicative-pluperfect-singular-third-person":"lărgise","first-person-indicative-pluperfect-plural":"lărgiserăm","indicative-pluperfect-plural-second-person":"lărgiserăți","indicative-pluperfect-plural-third-person":"lărgiseră","first-person-present-singular-subjunctive":"să lărgesc","present-second-person-singular-subjunctive":"să lărgești","present-singular-subjunctive-third-person":"să lărgească","first-person-plural-present-subjunctive":"să lărgim","plural-present-second-person-subjunctive":"să lărgiți","plural-present-subjunctive-third-person":"să lărgească","imperative-second-person-singular":"lărgește","imperative-plural-second-person":"lărgiți","imperative-negative-second-person-singular":"nu lărgi","imperative-negative-plural-second-person":"nu lărgiți"}},{"word":"lărgie","pos":"noun","definitions":["breadth"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"lărgie","accusative-definite-nominative":"lărgia","dative-genitive-indefinite":"lărgii","dative-definite-genitive":"lărgiei","vocative":"lărgie"}},{"word":"lărgime","pos":"noun","definitions":["breadth"],"pronunciation":"/lərˈd͡ʒi.me/","forms":{"plural":"lărgimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lărgime","accusative-definite-nominative-singular":"lărgimea","accusative-indefinite-nominative-plural":"lărgimi","accusative-definite-nominative-plural":"lărgimile","dative-genitive-indefinite-singular":"lărgimi","dative-definite-genitive-singular":"lărgimii","dative-genitive-indefinite-plural":"lărgimi","dative-definite-genitive-plural":"lărgimilor","singular-vocative":"lărgime","plural-vocative":"lărgimilor"}},{"word":"lărgire","pos":"noun","definitions":["enlargement"],"forms":{"plural":"lărgiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lărgire","accusative-definite-nominative-singular":"lărgirea","accusative-indefinite-nominative-plural":"lărgiri","accusative-definite-nominative-plural":"lărgirile","dative-genitive-indefinite-singular":"lărgiri","dative-definite-genitive-singular":"lărgirii","dative-genitive-indefinite-plural":"lărgiri","dative-definite-genitive-plural":"lărgirilor","singular-vocative":"lărgire","plural-vocative":"lărgirilor"}},{"word":"lărgit","pos":"adj","definitions":["widened"],"forms":{"feminine-singular":"lărgită","masculine-plural":"lărgiți","feminine-neuter-plural":"lărgite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lărgit","error-unrecognized-form-feminine-indefinite-singular":"lărgită","error-unrecognized-form-indefinite-masculine-plural":"lărgiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lărgite","definite-error-unrecognized-form-masculine-neuter-singular":"lărgitul","definite-error-unrecognized-form-feminine-singular":"lărgita","definite-error-unrecognized-form-masculine-plural":"lărgiții","definite-error-unrecognized-form-feminine-neuter-plural":"lărgitele"}},{"word":"lărgitor","pos":"noun","definitions":["widener"],"forms":{"plural":"lărgitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lărgitor","accusative-definite-nominative-singular":"lărgitorul","accusative-indefinite-nominative-plural":"lărgitoare","accusative-definite-nominative-plural":"lărgitoarele","dative-genitive-indefinite-singular":"lărgitor","dative-definite-genitive-singular":"lărgitorului","dative-genitive-indefinite-plural":"lărgitoare","dative-definite-genitive-plural":"lărgitoarelor","singular-vocative":"lărgitorule","plural-vocative":"lărgitoarelor"}},{"word":"largitudine","pos":"noun","definitions":["breadth"],"forms":{"plural":"largitudini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"largitudine","accusative-definite-nominative-singular":"largitudinea","accusative-indefinite-nominative-plural":"largitudini","accusative-definite-nominative-plural":"largitudinile","dative-genitive-indefinite-singular":"largitudini","dative-definite-genitive-singular":"largitudinii","dative-genitive-indefinite-plural":"largitudini","dative-definite-genitive-plural":"largitudinilor","singular-vocative":"largitudine","plural-vocative":"largitudinilor"}},{"word":"lărgitură","pos":"noun","definitions":["enlargement"],"forms":{"plural":"lărgituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lărgitură","accusative-definite-nominative-singular":"lărgitura","accusative-indefinite-nominative-plural":"lărgituri","accusative-definite-nominative-plural":"lărgiturile","dative-genitive-indefinite-singular":"lărgituri","dative-definite-genitive-singular":"lărgiturii","dative-genitive-indefinite-plural":"lărgituri","dative-definite-genitive-plural":"lărgiturilor","singular-vocative":"lărgitură","plural-vocative":"lărgiturilor"}},{"word":"largo","pos":"adv","definitions":["largo"]},{"word":"Largu","pos":"name","definitions":["a commune of Buzău County, Romania","a village in Largu, Buzău County, Romania"],"gender":"m"},{"word":"Largul","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Izvorul"],"gender":"m"},{"word":"lărguliță","pos":"adj","definitions":["diminutive of larg"],"forms":{"plural":"lărgulițe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-","error-unrecognized-form-feminine-indefinite-singular":"lărguliță","error-unrecognized-form-indefinite-masculine-plural":"-","error-unrecognized-form-feminine-indefinite-neuter-plural":"lărgulițe","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"lărgulița","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"lărgulițele"}},{"word":"lărgușor","pos":"adj","definitions":["diminutive of larg"],"forms":{"feminine-singular":"lărgușoră","masculine-plural":"lărgușori","feminine-neuter-plural":"lărgușore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lărgușor","error-unrecognized-form-feminine-indefinite-singular":"lărgușoră","error-unrecognized-form-indefinite-masculine-plural":"lărgușori","error-unrecognized-form-feminine-indefinite-neuter-plural":"lărgușore","definite-error-unrecognized-form-masculine-neuter-singular":"lărgușorul","definite-error-unrecognized-form-feminine-singular":"lărgușora","definite-error-unrecognized-form-masculine-plural":"lărgușorii","definite-error-unrecognized-form-feminine-neuter-plural":"lărgușorele"}},{"word":"lărguț","pos":"adj","definitions":["diminutive of larg"],"forms":{"feminine-singular":"lărguță","masculine-plural":"lărguți","feminine-neuter-plural":"lărguțe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lărguț","error-unrecognized-form-feminine-indefinite-singular":"lărguță","error-unrecognized-form-indefinite-masculine-plural":"lărguți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lărguțe","definite-error-unrecognized-form-masculine-neuter-singular":"lărguțul","definite-error-unrecognized-form-feminine-singular":"lărguța","definite-error-unrecognized-form-masculine-plural":"lărguții","definite-error-unrecognized-form-feminine-neuter-plural":"lărguțele"}},{"word":"Lărguța","pos":"name","definitions":["a village in Nicolae Bălcescu, Bacău County, Romania"],"gender":"f"},{"word":"larice","pos":"noun","definitions":["larch"],"forms":{"plural":"larici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"larice","accusative-definite-nominative-singular":"laricea","accusative-indefinite-nominative-plural":"larici","accusative-definite-nominative-plural":"laricile","dative-genitive-indefinite-singular":"larici","dative-definite-genitive-singular":"laricii","dative-genitive-indefinite-plural":"larici","dative-definite-genitive-plural":"laricilor","singular-vocative":"larice","plural-vocative":"laricilor"}},{"word":"laringal","pos":"adj","definitions":["laryngeal"],"forms":{"feminine-singular":"laringală","masculine-plural":"laringali","feminine-neuter-plural":"laringale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"laringal","error-unrecognized-form-feminine-indefinite-singular":"laringală","error-unrecognized-form-indefinite-masculine-plural":"laringali","error-unrecognized-form-feminine-indefinite-neuter-plural":"laringale","definite-error-unrecognized-form-masculine-neuter-singular":"laringalul","definite-error-unrecognized-form-feminine-singular":"laringala","definite-error-unrecognized-form-masculine-plural":"laringalii","definite-error-unrecognized-form-feminine-neuter-plural":"laringalele"}},{"word":"laringe","pos":"noun","definitions":["larynx"],"forms":{"plural":"laringe","table-tags":"no-table-tags","inflection-template":"ro-noun-n-e","accusative-indefinite-nominative-singular":"laringe","accusative-definite-nominative-singular":"laringele","accusative-indefinite-nominative-plural":"laringe","accusative-definite-nominative-plural":"laringele","dative-genitive-indefinite-singular":"laringe","dative-definite-genitive-singular":"laringelui","dative-genitive-indefinite-plural":"laringe","dative-definite-genitive-plural":"laringelor","singular-vocative":"laringe","plural-vocative":"laringelor"}},{"word":"laringectomie","pos":"noun","definitions":["laryngectomy"],"forms":{"plural":"laringectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"laringectomie","accusative-definite-nominative-singular":"laringectomia","accusative-indefinite-nominative-plural":"laringectomii","accusative-definite-nominative-plural":"laringectomiile","dative-genitive-indefinite-singular":"laringectomii","dative-definite-genitive-singular":"laringectomiei","dative-genitive-indefinite-plural":"laringectomii","dative-definite-genitive-plural":"laringectomiilor","singular-vocative":"laringectomie","plural-vocative":"laringectomiilor"}},{"word":"laringian","pos":"adj","definitions":["laryngeal"],"forms":{"feminine-singular":"laringiană","masculine-plural":"laringieni","feminine-neuter-plural":"laringiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"laringian","error-unrecognized-form-feminine-indefinite-singular":"laringiană","error-unrecognized-form-indefinite-masculine-plural":"laringieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"laringiene","definite-error-unrecognized-form-masculine-neuter-singular":"laringianul","definite-error-unrecognized-form-feminine-singular":"laringiana","definite-error-unrecognized-form-masculine-plural":"laringienii","definite-error-unrecognized-form-feminine-neuter-plural":"laringienele"}},{"word":"laringită","pos":"noun","definitions":["laryngitis"],"forms":{"plural":"laringite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"laringită","accusative-definite-nominative-singular":"laringita","accusative-indefinite-nominative-plural":"laringite","accusative-definite-nominative-plural":"laringitele","dative-genitive-indefinite-singular":"laringite","dative-definite-genitive-singular":"laringitei","dative-genitive-indefinite-plural":"laringite","dative-definite-genitive-plural":"laringitelor","singular-vocative":"laringită","plural-vocative":"laringitelor"}},{"word":"laringocel","pos":"noun","definitions":["laryngocele"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"laringocel","accusative-definite-nominative":"laringocelul","dative-genitive-indefinite":"laringocel","dative-definite-genitive":"laringocelului","vocative":"laringocelule"}},{"word":"laringofon","pos":"noun","definitions":["laryngophone"],"forms":{"plural":"laringofoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"laringofon","accusative-definite-nominative-singular":"laringofonul","accusative-indefinite-nominative-plural":"laringofoane","accusative-definite-nominative-plural":"laringofoanele","dative-genitive-indefinite-singular":"laringofon","dative-definite-genitive-singular":"laringofonului","dative-genitive-indefinite-plural":"laringofoane","dative-definite-genitive-plural":"laringofoanelor","singular-vocative":"laringofonule","plural-vocative":"laringofoanelor"}},{"word":"laringolog","pos":"noun","definitions":["laryngologist"],"forms":{"plural":"laringologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"laringolog","accusative-definite-nominative-singular":"laringologul","accusative-indefinite-nominative-plural":"laringologi","accusative-definite-nominative-plural":"laringologii","dative-genitive-indefinite-singular":"laringolog","dative-definite-genitive-singular":"laringologului","dative-genitive-indefinite-plural":"laringologi","dative-definite-genitive-plural":"laringologilor","singular-vocative":"laringologule","plural-vocative":"laringologilor"}},{"word":"laringologă","pos":"noun","definitions":["female equivalent of laringolog"],"forms":{"plural":"laringologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"laringologă","accusative-definite-nominative-singular":"laringologa","accusative-indefinite-nominative-plural":"laringologe","accusative-definite-nominative-plural":"laringologele","dative-genitive-indefinite-singular":"laringologe","dative-definite-genitive-singular":"laringologei","dative-genitive-indefinite-plural":"laringologe","dative-definite-genitive-plural":"laringologelor","singular-vocative":"laringologă","plural-vocative":"laringologelor"}},{"word":"laringologic","pos":"adj","definitions":["laryngological"],"forms":{"feminine-singular":"laringologică","masculine-plural":"laringologici","feminine-neuter-plural":"laringologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"laringologic","error-unrecognized-form-feminine-indefinite-singular":"laringologică","error-unrecognized-form-indefinite-masculine-plural":"laringologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"laringologice","definite-error-unrecognized-form-masculine-neuter-singular":"laringologicul","definite-error-unrecognized-form-feminine-singular":"laringologica","definite-error-unrecognized-form-masculine-plural":"laringologicii","definite-error-unrecognized-form-feminine-neuter-plural":"laringologicele"}},{"word":"laringologie","pos":"noun","definitions":["laryngologists"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"laringologie","accusative-definite-nominative":"laringologia","dative-genitive-indefinite":"laringologii","dative-definite-genitive":"laringologiei","vocative":"laringologie"}},{"word":"laringopatie","pos":"noun","definitions":["laryngopathy"],"forms":{"plural":"laringopatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"laringopatie","accusative-definite-nominative-singular":"laringopatia","accusative-indefinite-nominative-plural":"laringopatii","accusative-definite-nominative-plural":"laringopatiile","dative-genitive-indefinite-singular":"laringopatii","dative-definite-genitive-singular":"laringopatiei","dative-genitive-indefinite-plural":"laringopatii","dative-definite-genitive-plural":"laringopatiilor","singular-vocative":"laringopatie","plural-vocative":"laringopatiilor"}},{"word":"laringoplegie","pos":"noun","definitions":["laryngoplegia"],"forms":{"plural":"laringoplegii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"laringoplegie","accusative-definite-nominative-singular":"laringoplegia","accusative-indefinite-nominative-plural":"laringoplegii","accusative-definite-nominative-plural":"laringoplegiile","dative-genitive-indefinite-singular":"laringoplegii","dative-definite-genitive-singular":"laringoplegiei","dative-genitive-indefinite-plural":"laringoplegii","dative-definite-genitive-plural":"laringoplegiilor","singular-vocative":"laringoplegie","plural-vocative":"laringoplegiilor"}},{"word":"laringoscop","pos":"noun","definitions":["laryngoscope"],"forms":{"plural":"laringoscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"laringoscop","accusative-definite-nominative-singular":"laringoscopul","accusative-indefinite-nominative-plural":"laringoscoape","accusative-definite-nominative-plural":"laringoscoapele","dative-genitive-indefinite-singular":"laringoscop","dative-definite-genitive-singular":"laringoscopului","dative-genitive-indefinite-plural":"laringoscoape","dative-definite-genitive-plural":"laringoscoapelor","singular-vocative":"laringoscopule","plural-vocative":"laringoscoapelor"}},{"word":"laringoscopic","pos":"adj","definitions":["laryngoscopic"],"forms":{"feminine-singular":"laringoscopică","masculine-plural":"laringoscopici","feminine-neuter-plural":"laringoscopice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"laringoscopic","error-unrecognized-form-feminine-indefinite-singular":"laringoscopică","error-unrecognized-form-indefinite-masculine-plural":"laringoscopici","error-unrecognized-form-feminine-indefinite-neuter-plural":"laringoscopice","definite-error-unrecognized-form-masculine-neuter-singular":"laringoscopicul","definite-error-unrecognized-form-feminine-singular":"laringoscopica","definite-error-unrecognized-form-masculine-plural":"laringoscopicii","definite-error-unrecognized-form-feminine-neuter-plural":"laringoscopicele"}},{"word":"laringoscopie","pos":"noun","definitions":["laryngoscopy"],"forms":{"plural":"laringoscopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"laringoscopie","accusative-definite-nominative-singular":"laringoscopia","accusative-indefinite-nominative-plural":"laringoscopii","accusative-definite-nominative-plural":"laringoscopiile","dative-genitive-indefinite-singular":"laringoscopii","dative-definite-genitive-singular":"laringoscopiei","dative-genitive-indefinite-plural":"laringoscopii","dative-definite-genitive-plural":"laringoscopiilor","singular-vocative":"laringoscopie","plural-vocative":"laringoscopiilor"}},{"word":"laringospasm","pos":"noun","definitions":["laryngospasm"],"forms":{"plural":"laringospasme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"laringospasm","accusative-definite-nominative-singular":"laringospasmul","accusative-indefinite-nominative-plural":"laringospasme","accusative-definite-nominative-plural":"laringospasmele","dative-genitive-indefinite-singular":"laringospasm","dative-definite-genitive-singular":"laringospasmului","dative-genitive-indefinite-plural":"laringospasme","dative-definite-genitive-plural":"laringospasmelor","singular-vocative":"laringospasmule","plural-vocative":"laringospasmelor"}},{"word":"laringostroboscop","pos":"noun","definitions":["laryngostroboscope"],"forms":{"plural":"laringostroboscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"laringostroboscop","accusative-definite-nominative-singular":"laringostroboscopul","accusative-indefinite-nominative-plural":"laringostroboscoape","accusative-definite-nominative-plural":"laringostroboscoapele","dative-genitive-indefinite-singular":"laringostroboscop","dative-definite-genitive-singular":"laringostroboscopului","dative-genitive-indefinite-plural":"laringostroboscoape","dative-definite-genitive-plural":"laringostroboscoapelor","singular-vocative":"laringostroboscopule","plural-vocative":"laringostroboscoapelor"}},{"word":"laringostroboscopie","pos":"noun","definitions":["laryngostroboscopy"],"forms":{"plural":"laringostroboscopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"laringostroboscopie","accusative-definite-nominative-singular":"laringostroboscopia","accusative-indefinite-nominative-plural":"laringostroboscopii","accusative-definite-nominative-plural":"laringostroboscopiile","dative-genitive-indefinite-singular":"laringostroboscopii","dative-definite-genitive-singular":"laringostroboscopiei","dative-genitive-indefinite-plural":"laringostroboscopii","dative-definite-genitive-plural":"laringostroboscopiilor","singular-vocative":"laringostroboscopie","plural-vocative":"laringostroboscopiilor"}},{"word":"laringotom","pos":"noun","definitions":["laryngotome"],"forms":{"plural":"laringotomuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"laringotom","accusative-definite-nominative-singular":"laringotomul","accusative-indefinite-nominative-plural":"laringotomuri","accusative-definite-nominative-plural":"laringotomurile","dative-genitive-indefinite-singular":"laringotom","dative-definite-genitive-singular":"laringotomului","dative-genitive-indefinite-plural":"laringotomuri","dative-definite-genitive-plural":"laringotomurilor","singular-vocative":"laringotomule","plural-vocative":"laringotomurilor"}},{"word":"laringotomie","pos":"noun","definitions":["laryngotomy"],"forms":{"plural":"laringotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"laringotomie","accusative-definite-nominative-singular":"laringotomia","accusative-indefinite-nominative-plural":"laringotomii","accusative-definite-nominative-plural":"laringotomiile","dative-genitive-indefinite-singular":"laringotomii","dative-definite-genitive-singular":"laringotomiei","dative-genitive-indefinite-plural":"laringotomii","dative-definite-genitive-plural":"laringotomiilor","singular-vocative":"laringotomie","plural-vocative":"laringotomiilor"}},{"word":"larinx","pos":"noun","definitions":["obsolete form of laringe"],"forms":{"plural":"larinxuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"larinx","accusative-definite-nominative-singular":"larinxul","accusative-indefinite-nominative-plural":"larinxuri","accusative-definite-nominative-plural":"larinxurile","dative-genitive-indefinite-singular":"larinx","dative-definite-genitive-singular":"larinxului","dative-genitive-indefinite-plural":"larinxuri","dative-definite-genitive-plural":"larinxurilor","singular-vocative":"larinxule","plural-vocative":"larinxurilor"}},{"word":"Larionescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Larionescu"}},{"word":"lariță","pos":"noun","definitions":["alternative form of larice"],"forms":{"plural":"larițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lariță","accusative-definite-nominative-singular":"larița","accusative-indefinite-nominative-plural":"larițe","accusative-definite-nominative-plural":"larițele","dative-genitive-indefinite-singular":"larițe","dative-definite-genitive-singular":"lariței","dative-genitive-indefinite-plural":"larițe","dative-definite-genitive-plural":"larițelor","singular-vocative":"lariță","plural-vocative":"larițelor"}},{"word":"larma","pos":"noun","definitions":["definite nominative/accusative singular of larmă"],"pronunciation":"[ˈlarma]","gender":"f"},{"word":"larmă","pos":"noun","definitions":["noise"],"forms":{"plural":"larme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"larmă","accusative-definite-nominative-singular":"larma","accusative-indefinite-nominative-plural":"larme","accusative-definite-nominative-plural":"larmele","dative-genitive-indefinite-singular":"larme","dative-definite-genitive-singular":"larmei","dative-genitive-indefinite-plural":"larme","dative-definite-genitive-plural":"larmelor","singular-vocative":"larmă","plural-vocative":"larmelor"}},{"word":"lărmălaie","pos":"noun","definitions":["noise"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"lărmălaie","accusative-definite-nominative":"lărmălaia","dative-genitive-indefinite":"lărmălaii","dative-definite-genitive":"lărmălaiei","vocative":"lărmălaie"}},{"word":"lărmălău","pos":"noun","definitions":["rumble, noise"],"forms":{"plural":"lărmălaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lărmălău","accusative-definite-nominative-singular":"lărmălăuul","accusative-indefinite-nominative-plural":"lărmălaie","accusative-definite-nominative-plural":"lărmălaiele","dative-genitive-indefinite-singular":"lărmălău","dative-definite-genitive-singular":"lărmălăuului","dative-genitive-indefinite-plural":"lărmălaie","dative-definite-genitive-plural":"lărmălaielor","singular-vocative":"lărmălăuule","plural-vocative":"lărmălaielor"}},{"word":"larme","pos":"noun","definitions":["definite nominative/accusative singular of larmă"],"pronunciation":"[ˈlarme]","gender":"f"},{"word":"larmo","pos":"noun","definitions":["vocative singular of larmă"],"pronunciation":"[ˈlarmo]","gender":"f"},{"word":"larmoaiant","pos":"adj","definitions":["teary, tearful"],"forms":{"feminine-singular":"larmoaiantă","masculine-plural":"larmoaianți","feminine-neuter-plural":"larmoaiante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"larmoaiant","error-unrecognized-form-feminine-indefinite-singular":"larmoaiantă","error-unrecognized-form-indefinite-masculine-plural":"larmoaianți","error-unrecognized-form-feminine-indefinite-neuter-plural":"larmoaiante","definite-error-unrecognized-form-masculine-neuter-singular":"larmoaiantul","definite-error-unrecognized-form-feminine-singular":"larmoaianta","definite-error-unrecognized-form-masculine-plural":"larmoaianții","definite-error-unrecognized-form-feminine-neuter-plural":"larmoaiantele"}},{"word":"lărmui","pos":"verb","definitions":["to make noise"],"forms":{"canonical":"a lărmui 4th conjugation","present-singular-third-person":"lărmuiește","participle-past":"lărmuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lărmui","gerund":"lărmuind","first-person-indicative-present-singular":"lărmuiesc","indicative-present-second-person-singular":"lărmuiești","indicative-present-singular-third-person":"lărmuiește","first-person-indicative-plural-present":"lărmuim","indicative-plural-present-second-person":"lărmuiți","indicative-plural-present-third-person":"lărmuiesc","first-person-imperfect-indicative-singular":"lărmuiam","imperfect-indicative-second-person-singular":"lărmuiai","imperfect-indicative-singular-third-person":"lărmuia","first-person-imperfect-indicative-plural":"lărmuiam","imperfect-indicative-plural-second-person":"lărmuiați","imperfect-indicative-plural-third-person":"lărmuiau","first-person-indicative-perfect-singular":"lărmuii","indicative-perfect-second-person-singular":"lărmuiși","indicative-perfect-singular-third-person":"lărmui","first-person-indicative-perfect-plural":"lărmuirăm","indicative-perfect-plural-second-person":"lărmuirăți","indicative-perfect-plural-third-person":"lărmuiră","first-person-indicative-pluperfect-singular":"lărmuisem","indicative-pluperfect-second-person-singular":"lărmuiseși","indicative-pluperfect-singular-third-person":"lărmuise","first-person-indicative-pluperfect-plural":"lărmuiserăm","indicative-pluperfect-plural-second-person":"lărmuiserăți","indicative-pluperfect-plural-third-person":"lărmuiseră","first-person-present-singular-subjunctive":"să lărmuiesc","present-second-person-singular-subjunctive":"să lărmuiești","present-singular-subjunctive-third-person":"să lărmuiască","first-person-plural-present-subjunctive":"să lărmuim","plural-present-second-person-subjunctive":"să lărmuiți","plural-present-subjunctive-third-person":"să lărmuiască","imperative-second-person-singular":"lărmuiește","imperative-plural-second-person":"lărmuiți","imperative-negative-second-person-singular":"nu lărmui","imperative-negative-plural-second-person":"nu lărmuiți"}},{"word":"lărmuire","pos":"noun","definitions":["uproar, noise"],"forms":{"plural":"lărmuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lărmuire","accusative-definite-nominative-singular":"lărmuirea","accusative-indefinite-nominative-plural":"lărmuiri","accusative-definite-nominative-plural":"lărmuirile","dative-genitive-indefinite-singular":"lărmuiri","dative-definite-genitive-singular":"lărmuirii","dative-genitive-indefinite-plural":"lărmuiri","dative-definite-genitive-plural":"lărmuirilor","singular-vocative":"lărmuire","plural-vocative":"lărmuirilor"}},{"word":"lărmuitor","pos":"adj","definitions":["noisy"],"forms":{"feminine-singular":"lărmuitoare","masculine-plural":"lărmuitori","feminine-neuter-plural":"lărmuitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lărmuitor","error-unrecognized-form-feminine-indefinite-singular":"lărmuitoare","error-unrecognized-form-indefinite-masculine-plural":"lărmuitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"lărmuitoare","definite-error-unrecognized-form-masculine-neuter-singular":"lărmuitorul","definite-error-unrecognized-form-feminine-singular":"lărmuitoarea","definite-error-unrecognized-form-masculine-plural":"lărmuitorii","definite-error-unrecognized-form-feminine-neuter-plural":"lărmuitoarele"}},{"word":"larva","pos":"noun","definitions":["definite nominative/accusative singular of larvă"],"pronunciation":"[ˈlarva]","gender":"f"},{"word":"larvă","pos":"noun","definitions":["larva, grub"],"forms":{"plural":"larve","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"larvă","accusative-definite-nominative-singular":"larva","accusative-indefinite-nominative-plural":"larve","accusative-definite-nominative-plural":"larvele","dative-genitive-indefinite-singular":"larve","dative-definite-genitive-singular":"larvei","dative-genitive-indefinite-plural":"larve","dative-definite-genitive-plural":"larvelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"larvar","pos":"adj","definitions":["larval"],"forms":{"feminine-singular":"larvară","masculine-plural":"larvari","feminine-neuter-plural":"larvare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"larvar","error-unrecognized-form-feminine-indefinite-singular":"larvară","error-unrecognized-form-indefinite-masculine-plural":"larvari","error-unrecognized-form-feminine-indefinite-neuter-plural":"larvare","definite-error-unrecognized-form-masculine-neuter-singular":"larvarul","definite-error-unrecognized-form-feminine-singular":"larvara","definite-error-unrecognized-form-masculine-plural":"larvarii","definite-error-unrecognized-form-feminine-neuter-plural":"larvarele"}},{"word":"larve","pos":"noun","definitions":["inflection of larvă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈlarve]","gender":"f"},{"word":"larvicid","pos":"noun","definitions":["larvicide"],"forms":{"plural":"larvicide","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"larvicid","accusative-definite-nominative-singular":"larvicidul","accusative-indefinite-nominative-plural":"larvicide","accusative-definite-nominative-plural":"larvicidele","dative-genitive-indefinite-singular":"larvicid","dative-definite-genitive-singular":"larvicidului","dative-genitive-indefinite-plural":"larvicide","dative-definite-genitive-plural":"larvicidelor","singular-vocative":"larvicidule","plural-vocative":"larvicidelor"}},{"word":"larvo","pos":"noun","definitions":["vocative singular of larvă"],"pronunciation":"[ˈlarvo]","gender":"f"},{"word":"las","pos":"verb","definitions":["inflection of lăsa:","first-person singular present indicative/subjunctive","third-person plural present indicative"]},{"word":"laș","pos":"noun","definitions":["coward, poltroon, dastard"],"pronunciation":"/laʃ/","forms":{"plural":"lași"}},{"word":"laș","pos":"adj","definitions":["cowardly"],"pronunciation":"/laʃ/","forms":{"feminine-singular":"lașă","masculine-plural":"lași","feminine-neuter-plural":"lașe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"laș","error-unrecognized-form-feminine-indefinite-singular":"lașă","error-unrecognized-form-indefinite-masculine-plural":"lași","error-unrecognized-form-feminine-indefinite-neuter-plural":"lașe","definite-error-unrecognized-form-masculine-neuter-singular":"lașul","definite-error-unrecognized-form-feminine-singular":"lașa","definite-error-unrecognized-form-masculine-plural":"lașii","definite-error-unrecognized-form-feminine-neuter-plural":"lașele"}},{"word":"las-o jos că măcăne","pos":"phrase","definitions":["cut the crap"]},{"word":"lasă","pos":"verb","definitions":["inflection of lăsa:","third-person singular/plural present indicative","second-person singular affirmative imperative"],"pronunciation":"/ˈla.sə/"},{"word":"lașă","pos":"noun","definitions":["female equivalent of laș"],"forms":{"plural":"lașe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lașă","accusative-definite-nominative-singular":"lașa","accusative-indefinite-nominative-plural":"lașe","accusative-definite-nominative-plural":"lașele","dative-genitive-indefinite-singular":"lașe","dative-definite-genitive-singular":"lașei","dative-genitive-indefinite-plural":"lașe","dative-definite-genitive-plural":"lașelor","singular-vocative":"lașă","plural-vocative":"lașelor"}},{"word":"lăsa","pos":"verb","definitions":["to leave","to let, to allow","to drop, let go","to buckle, droop, sag, tilt, show signs of being about to fall","to not mind, not worry"],"pronunciation":"/ləˈsa/","examples":[{"ro":"Am lăsat cartea acasă.","en":"I left the book at home."},{"ro":"L-am lăsat liber.","en":"I set him free."},{"ro":"O să îți las ție casa.","en":"I’ll leave the house to you."}],"forms":{"canonical":"a lăsa 1st conjugation","present-singular-third-person":"lasă","participle-past":"lăsat","subjunctive-third-person":"lase","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a lăsa","gerund":"lăsând","first-person-indicative-present-singular":"las","indicative-present-second-person-singular":"lași","indicative-present-singular-third-person":"lasă","first-person-indicative-plural-present":"lăsăm","indicative-plural-present-second-person":"lăsați","indicative-plural-present-third-person":"lasă","first-person-imperfect-indicative-singular":"lăsam","imperfect-indicative-second-person-singular":"lăsai","imperfect-indicative-singular-third-person":"lăsa","first-person-imperfect-indicative-plural":"lăsam","imperfect-indicative-plural-second-person":"lăsați","imperfect-indicative-plural-third-person":"lăsau","first-person-indicative-perfect-singular":"lăsai","indicative-perfect-second-person-singular":"lăsași","indicative-perfect-singular-third-person":"lăsă","first-person-indicative-perfect-plural":"lăsarăm","indicative-perfect-plural-second-person":"lăsarăți","indicative-perfect-plural-third-person":"lăsară","first-person-indicative-pluperfect-singular":"lăsasem","indicative-pluperfect-second-person-singular":"lăsaseși","indicative-pluperfect-singular-third-person":"lăsase","first-person-indicative-pluperfect-plural":"lăsaserăm","indicative-pluperfect-plural-second-person":"lăsaserăți","indicative-pluperfect-plural-third-person":"lăsaseră","first-person-present-singular-subjunctive":"să las","present-second-person-singular-subjunctive":"să lași","present-singular-subjunctive-third-person":"să lase","first-person-plural-present-subjunctive":"să lăsăm","plural-present-second-person-subjunctive":"să lăsați","plural-present-subjunctive-third-person":"să lase","imperative-second-person-singular":"lasă","imperative-plural-second-person":"lăsați","imperative-negative-second-person-singular":"nu lăsa","imperative-negative-plural-second-person":"nu lăsați"}},{"word":"lăsa baltă","pos":"verb","definitions":["to stop helping; to bail out"],"forms":{"canonical":"a lăsa baltă 1st conjugation","present-singular-third-person":"lăsa baltă","participle-past":"lăsa baltă"}},{"word":"lăsa în pace","pos":"verb","definitions":["leave alone (not bother)"],"forms":{"canonical":"a lăsa în pace 1st conjugation","present-singular-third-person":"lasă în pace","participle-past":"lăsat în pace"}},{"word":"lăsa în pom","pos":"verb","definitions":["to abandon when one needed help"],"forms":{"canonical":"a lăsa în pom 1st conjugation","present-singular-third-person":"lasă în pom","participle-past":"lăsat în pom"}},{"word":"lăsa loc de bună ziua","pos":"verb","definitions":["to hide one's hard feelings for someone after having an argument or breaking up with him/her/them, in order to be able to greet or have a small talk with him/her/them if needed"],"examples":[{"ro":"Ei s-au despărțit acum trei luni, dar au lăsat loc de bună ziua.","en":"They broke up three months ago, but they left room to say hello."}],"forms":{"canonical":"a lăsa loc de bună ziua 1st conjugation","present-singular-third-person":"lasă loc de bună ziua","participle-past":"lăsat loc de bună ziua"}},{"word":"lăsăciune","pos":"noun","definitions":["forgiveness, act of forgiving, letting something go","separation, divorce"],"forms":{"plural":"lăsăciuni"}},{"word":"lăsământ","pos":"noun","definitions":["inheritance"],"forms":{"plural":"lăsăminte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lăsământ","accusative-definite-nominative-singular":"lăsământul","accusative-indefinite-nominative-plural":"lăsăminte","accusative-definite-nominative-plural":"lăsămintele","dative-genitive-indefinite-singular":"lăsământ","dative-definite-genitive-singular":"lăsământului","dative-genitive-indefinite-plural":"lăsăminte","dative-definite-genitive-plural":"lăsămintelor","singular-vocative":"lăsământule","plural-vocative":"lăsămintelor"}},{"word":"lăsare","pos":"noun","definitions":["sag"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"lăsare","accusative-definite-nominative":"lăsarea","dative-genitive-indefinite":"lăsare","dative-definite-genitive":"lăsarei","vocative":"lăsare"}},{"word":"lăsat","pos":"noun","definitions":["letting, allowing","leaving, dropping"],"pronunciation":"/ləˈsat/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lăsat","accusative-definite-nominative":"lăsatul","dative-genitive-indefinite":"lăsat","dative-definite-genitive":"lăsatului","vocative":"lăsatule","alternative":"lăsata"}},{"word":"lăsat","pos":"adj","definitions":["dropped, fallen","abandoned, deserted, left behind","bequeathed, bestowed, passed down","lingering, enduring, lasting (about odours, heat, darkness, etc.)","saggy, slack, drooping"],"pronunciation":"/ləˈsat/","forms":{"feminine-singular":"lăsată","masculine-plural":"lăsați","feminine-neuter-plural":"lăsate","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăsat","error-unrecognized-form-feminine-indefinite-singular":"lăsată","error-unrecognized-form-indefinite-masculine-plural":"lăsați","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăsate","definite-error-unrecognized-form-masculine-neuter-singular":"lăsatul","definite-error-unrecognized-form-feminine-singular":"lăsata","definite-error-unrecognized-form-masculine-plural":"lăsații","definite-error-unrecognized-form-feminine-neuter-plural":"lăsatele","alternative":"lăsata"}},{"word":"lăsat","pos":"verb","definitions":["past participle of lăsa"],"pronunciation":"/ləˈsat/","forms":{"alternative":"lăsata"}},{"word":"lăsățel","pos":"adj","definitions":["diminutive of lăsat"],"forms":{"feminine-singular":"lăsățelă","masculine-plural":"lăsățeli","feminine-neuter-plural":"lăsățele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăsățel","error-unrecognized-form-feminine-indefinite-singular":"lăsățelă","error-unrecognized-form-indefinite-masculine-plural":"lăsățeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăsățele","definite-error-unrecognized-form-masculine-neuter-singular":"lăsățelul","definite-error-unrecognized-form-feminine-singular":"lăsățela","definite-error-unrecognized-form-masculine-plural":"lăsățelii","definite-error-unrecognized-form-feminine-neuter-plural":"lăsățelele"}},{"word":"lăsător","pos":"adj","definitions":["neglectful"],"forms":{"feminine-singular":"lăsătoare","masculine-plural":"lăsători","feminine-neuter-plural":"lăsătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăsător","error-unrecognized-form-feminine-indefinite-singular":"lăsătoare","error-unrecognized-form-indefinite-masculine-plural":"lăsători","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăsătoare","definite-error-unrecognized-form-masculine-neuter-singular":"lăsătorul","definite-error-unrecognized-form-feminine-singular":"lăsătoarea","definite-error-unrecognized-form-masculine-plural":"lăsătorii","definite-error-unrecognized-form-feminine-neuter-plural":"lăsătoarele"}},{"word":"lăsător","pos":"noun","definitions":["indispensably, neglectful"],"forms":{"plural":"lăsători","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lăsător","accusative-definite-nominative-singular":"lăsătorul","accusative-indefinite-nominative-plural":"lăsători","accusative-definite-nominative-plural":"lăsătorii","dative-genitive-indefinite-singular":"lăsător","dative-definite-genitive-singular":"lăsătorului","dative-genitive-indefinite-plural":"lăsători","dative-definite-genitive-plural":"lăsătorilor","singular-vocative":"lăsătorule","plural-vocative":"lăsătorilor"}},{"word":"lăsătură","pos":"noun","definitions":["depression"],"forms":{"plural":"lăsături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lăsătură","accusative-definite-nominative-singular":"lăsătura","accusative-indefinite-nominative-plural":"lăsături","accusative-definite-nominative-plural":"lăsăturile","dative-genitive-indefinite-singular":"lăsături","dative-definite-genitive-singular":"lăsăturii","dative-genitive-indefinite-plural":"lăsături","dative-definite-genitive-plural":"lăsăturilor","singular-vocative":"lăsătură","plural-vocative":"lăsăturilor"}},{"word":"Lăsău","pos":"name","definitions":["a village in Lăpugiu de Jos, Hunedoara County, Romania"],"gender":"m"},{"word":"lăscăiață","pos":"noun","definitions":["diminutive of lăscaie"],"forms":{"plural":"lăscăiețe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lăscăiață","accusative-definite-nominative-singular":"lăscăiața","accusative-indefinite-nominative-plural":"lăscăiețe","accusative-definite-nominative-plural":"lăscăiețele","dative-genitive-indefinite-singular":"lăscăiețe","dative-definite-genitive-singular":"lăscăieței","dative-genitive-indefinite-plural":"lăscăiețe","dative-definite-genitive-plural":"lăscăiețelor","singular-vocative":"lăscăiață","plural-vocative":"lăscăiețelor"}},{"word":"lăscaie","pos":"noun","definitions":["copper coin worth half a para","any small value coin"],"forms":{"plural":"lăscăi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lăscaie","accusative-definite-nominative-singular":"lăscaia","accusative-indefinite-nominative-plural":"lăscaii","accusative-definite-nominative-plural":"lăscaiile","dative-genitive-indefinite-singular":"lăscaii","dative-definite-genitive-singular":"lăscaiei","dative-genitive-indefinite-plural":"lăscaii","dative-definite-genitive-plural":"lăscaiilor","singular-vocative":"lăscaie","plural-vocative":"lăscaiilor","alternative":"lescaie"}},{"word":"lăscăioară","pos":"noun","definitions":["diminutive of lăscaie"],"forms":{"plural":"lăscăioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lăscăioară","accusative-definite-nominative-singular":"lăscăioara","accusative-indefinite-nominative-plural":"lăscăioare","accusative-definite-nominative-plural":"lăscăioarele","dative-genitive-indefinite-singular":"lăscăioare","dative-definite-genitive-singular":"lăscăioarei","dative-genitive-indefinite-plural":"lăscăioare","dative-definite-genitive-plural":"lăscăioarelor","singular-vocative":"lăscăioară","plural-vocative":"lăscăioarelor"}},{"word":"lăscăiță","pos":"noun","definitions":["diminutive of lăscaie"],"forms":{"plural":"lăscăițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lăscăiță","accusative-definite-nominative-singular":"lăscăița","accusative-indefinite-nominative-plural":"lăscăițe","accusative-definite-nominative-plural":"lăscăițele","dative-genitive-indefinite-singular":"lăscăițe","dative-definite-genitive-singular":"lăscăiței","dative-genitive-indefinite-plural":"lăscăițe","dative-definite-genitive-plural":"lăscăițelor","singular-vocative":"lăscăiță","plural-vocative":"lăscăițelor"}},{"word":"Lascăr","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Lascăr"}},{"word":"Lăscărache","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Lăscărache"}},{"word":"Lăscăruță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lăscăruță"}},{"word":"Lascău","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Lascău"}},{"word":"lascav","pos":"adj","definitions":["gracious","cheerful"],"forms":{"feminine-singular":"lascavă","masculine-plural":"lascavi","feminine-neuter-plural":"lascave","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lascav","error-unrecognized-form-feminine-indefinite-singular":"lascavă","error-unrecognized-form-indefinite-masculine-plural":"lascavi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lascave","definite-error-unrecognized-form-masculine-neuter-singular":"lascavul","definite-error-unrecognized-form-feminine-singular":"lascava","definite-error-unrecognized-form-masculine-plural":"lascavii","definite-error-unrecognized-form-feminine-neuter-plural":"lascavele"}},{"word":"Laschescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Laschescu"}},{"word":"Lăschia","pos":"name","definitions":["a village in Copalnic-Mănăștur, Maramureș County, Romania"],"gender":"f"},{"word":"lasciv","pos":"adj","definitions":["lascivious, lustful, prurient"],"pronunciation":"[lasˈt͡ʃiv]","forms":{"feminine-singular":"lascivă","masculine-plural":"lascivi","feminine-neuter-plural":"lascive","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"lasciv","error-unrecognized-form-feminine-indefinite-singular":"lascivă","error-unrecognized-form-indefinite-masculine-plural":"lascivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lascive","definite-error-unrecognized-form-masculine-neuter-singular":"lascivul","definite-error-unrecognized-form-feminine-singular":"lasciva","definite-error-unrecognized-form-masculine-plural":"lascivii","definite-error-unrecognized-form-feminine-neuter-plural":"lascivele"}},{"word":"lascivie","pos":"noun","definitions":["lasciviousness"],"forms":{"plural":"lascivii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lascivie","accusative-definite-nominative-singular":"lascivia","accusative-indefinite-nominative-plural":"lascivii","accusative-definite-nominative-plural":"lasciviile","dative-genitive-indefinite-singular":"lascivii","dative-definite-genitive-singular":"lasciviei","dative-genitive-indefinite-plural":"lascivii","dative-definite-genitive-plural":"lasciviilor","singular-vocative":"lascivie","plural-vocative":"lasciviilor"}},{"word":"lascivitate","pos":"noun","definitions":["lasciviousness, prurience, lubricity"],"pronunciation":"[las.t͡ʃi.viˈta.te]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"lascivitate","accusative-definite-nominative":"lascivitatea","dative-genitive-indefinite":"lascivități","dative-definite-genitive":"lascivității","vocative":"lascivitate"}},{"word":"Lasconi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m"},{"word":"Lăscud","pos":"name","definitions":["a village in Ogra, Mureș County, Romania"],"gender":"m"},{"word":"Lăsculescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lăsculescu"}},{"word":"Lăscuș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lăscuș"}},{"word":"Lăscuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lăscuț"}},{"word":"lase","pos":"verb","definitions":["third-person singular/plural present subjunctive of lăsa"],"pronunciation":"[ˈlase]"},{"word":"laser","pos":"noun","definitions":["laser"],"forms":{"plural":"lasere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"laser","accusative-definite-nominative-singular":"laserul","accusative-indefinite-nominative-plural":"lasere","accusative-definite-nominative-plural":"laserele","dative-genitive-indefinite-singular":"laser","dative-definite-genitive-singular":"laserului","dative-genitive-indefinite-plural":"lasere","dative-definite-genitive-plural":"laserelor","singular-vocative":"laserule","plural-vocative":"laserelor"}},{"word":"lasetă","pos":"noun","definitions":["lace"],"forms":{"plural":"lasete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lasetă","accusative-definite-nominative-singular":"laseta","accusative-indefinite-nominative-plural":"lasete","accusative-definite-nominative-plural":"lasetele","dative-genitive-indefinite-singular":"lasete","dative-definite-genitive-singular":"lasetei","dative-genitive-indefinite-plural":"lasete","dative-definite-genitive-plural":"lasetelor","singular-vocative":"lasetă","plural-vocative":"lasetelor"}},{"word":"lașitate","pos":"noun","definitions":["cowardice"],"forms":{"plural":"lașități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lașitate","accusative-definite-nominative-singular":"lașitatea","accusative-indefinite-nominative-plural":"lașități","accusative-definite-nominative-plural":"lașitățile","dative-genitive-indefinite-singular":"lașități","dative-definite-genitive-singular":"lașității","dative-genitive-indefinite-plural":"lașități","dative-definite-genitive-plural":"lașităților","singular-vocative":"lașitate","plural-vocative":"lașităților"}},{"word":"lasitudine","pos":"noun","definitions":["lassitude"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"lasitudine","accusative-definite-nominative":"lasitudinea","dative-genitive-indefinite":"lasitudini","dative-definite-genitive":"lasitudinii","vocative":"lasitudine"}},{"word":"Laslău Mare","pos":"name","definitions":["a village in Suplac, Mureș County, Romania"],"gender":"m"},{"word":"Laslău Mic","pos":"name","definitions":["a village in Suplac, Mureș County, Romania"],"gender":"m"},{"word":"Laslea","pos":"name","definitions":["a commune of Sibiu County, Romania","a village in Laslea, Sibiu County, Romania"],"gender":"f"},{"word":"lasou","pos":"noun","definitions":["lasso"],"forms":{"plural":"lasouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lasou","accusative-definite-nominative-singular":"lasoul","accusative-indefinite-nominative-plural":"lasouri","accusative-definite-nominative-plural":"lasourile","dative-genitive-indefinite-singular":"lasou","dative-definite-genitive-singular":"lasoului","dative-genitive-indefinite-plural":"lasouri","dative-definite-genitive-plural":"lasourilor","singular-vocative":"lasoule","plural-vocative":"lasourilor"}},{"word":"lassalleanism","pos":"noun","definitions":["Lassallism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lassalleanism","accusative-definite-nominative":"lassalleanismul","dative-genitive-indefinite":"lassalleanism","dative-definite-genitive":"lassalleanismului","vocative":"lassalleanismule"}},{"word":"lăstar","pos":"noun","definitions":["shoot, offshoot","twig","coppice, copse, underbrush, brushwood, young/small trees"],"forms":{"plural":"lăstare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lăstar","accusative-definite-nominative-singular":"lăstarul","accusative-indefinite-nominative-plural":"lăstare","accusative-definite-nominative-plural":"lăstarele","dative-genitive-indefinite-singular":"lăstar","dative-definite-genitive-singular":"lăstarului","dative-genitive-indefinite-plural":"lăstare","dative-definite-genitive-plural":"lăstarelor","singular-vocative":"lăstarule","plural-vocative":"lăstarelor"}},{"word":"lăstăraș","pos":"noun","definitions":["diminutive of lăstar; small sprout"],"forms":{"plural":"lăstărași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lăstăraș","accusative-definite-nominative-singular":"lăstărașul","accusative-indefinite-nominative-plural":"lăstărași","accusative-definite-nominative-plural":"lăstărașii","dative-genitive-indefinite-singular":"lăstăraș","dative-definite-genitive-singular":"lăstărașului","dative-genitive-indefinite-plural":"lăstărași","dative-definite-genitive-plural":"lăstărașilor","singular-vocative":"lăstărașule","plural-vocative":"lăstărașilor"}},{"word":"lăstare","pos":"noun","definitions":["plural of lăstar"]},{"word":"lăstărel","pos":"noun","definitions":["diminutive of lăstar"],"forms":{"plural":"lăstărei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lăstărel","accusative-definite-nominative-singular":"lăstărelul","accusative-indefinite-nominative-plural":"lăstărei","accusative-definite-nominative-plural":"lăstăreii","dative-genitive-indefinite-singular":"lăstărel","dative-definite-genitive-singular":"lăstărelului","dative-genitive-indefinite-plural":"lăstărei","dative-definite-genitive-plural":"lăstăreilor","singular-vocative":"lăstărelule","plural-vocative":"lăstăreilor"}},{"word":"lăstăret","pos":"noun","definitions":["thicket, underbrush"],"forms":{"plural":"lăstăreturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lăstăret","accusative-definite-nominative-singular":"lăstăretul","accusative-indefinite-nominative-plural":"lăstăreturi","accusative-definite-nominative-plural":"lăstăreturile","dative-genitive-indefinite-singular":"lăstăret","dative-definite-genitive-singular":"lăstăretului","dative-genitive-indefinite-plural":"lăstăreturi","dative-definite-genitive-plural":"lăstăreturilor","singular-vocative":"lăstăretule","plural-vocative":"lăstăreturilor"}},{"word":"lăstări","pos":"verb","definitions":["to sprout"],"forms":{"canonical":"a lăstări 4th conjugation","present-singular-third-person":"lăstărește","participle-past":"lăstărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lăstări","gerund":"lăstărind","first-person-indicative-present-singular":"lăstăresc","indicative-present-second-person-singular":"lăstărești","indicative-present-singular-third-person":"lăstărește","first-person-indicative-plural-present":"lăstărim","indicative-plural-present-second-person":"lăstăriți","indicative-plural-present-third-person":"lăstăresc","first-person-imperfect-indicative-singular":"lăstăream","imperfect-indicative-second-person-singular":"lăstăreai","imperfect-indicative-singular-third-person":"lăstărea","first-person-imperfect-indicative-plural":"lăstăream","imperfect-indicative-plural-second-person":"lăstăreați","imperfect-indicative-plural-third-person":"lăstăreau","first-person-indicative-perfect-singular":"lăstării","indicative-perfect-second-person-singular":"lăstăriși","indicative-perfect-singular-third-person":"lăstări","first-person-indicative-perfect-plural":"lăstărirăm","indicative-perfect-plural-second-person":"lăstărirăți","indicative-perfect-plural-third-person":"lăstăriră","first-person-indicative-pluperfect-singular":"lăstărisem","indicative-pluperfect-second-person-singular":"lăstăriseși","indicative-pluperfect-singular-third-person":"lăstărise","first-person-indicative-pluperfect-plural":"lăstăriserăm","indicative-pluperfect-plural-second-person":"lăstăriserăți","indicative-pluperfect-plural-third-person":"lăstăriseră","first-person-present-singular-subjunctive":"să lăstăresc","present-second-person-singular-subjunctive":"să lăstărești","present-singular-subjunctive-third-person":"să lăstărească","first-person-plural-present-subjunctive":"să lăstărim","plural-present-second-person-subjunctive":"să lăstăriți","plural-present-subjunctive-third-person":"să lăstărească","imperative-second-person-singular":"lăstărește","imperative-plural-second-person":"lăstăriți","imperative-negative-second-person-singular":"nu lăstări","imperative-negative-plural-second-person":"nu lăstăriți"}},{"word":"lăstărire","pos":"noun","definitions":["sprouting"],"forms":{"plural":"lăstăriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lăstărire","accusative-definite-nominative-singular":"lăstărirea","accusative-indefinite-nominative-plural":"lăstăriri","accusative-definite-nominative-plural":"lăstăririle","dative-genitive-indefinite-singular":"lăstăriri","dative-definite-genitive-singular":"lăstăririi","dative-genitive-indefinite-plural":"lăstăriri","dative-definite-genitive-plural":"lăstăririlor","singular-vocative":"lăstărire","plural-vocative":"lăstăririlor"}},{"word":"lăstăriș","pos":"noun","definitions":["underbrush"],"forms":{"plural":"lăstărișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lăstăriș","accusative-definite-nominative-singular":"lăstărișul","accusative-indefinite-nominative-plural":"lăstărișuri","accusative-definite-nominative-plural":"lăstărișurile","dative-genitive-indefinite-singular":"lăstăriș","dative-definite-genitive-singular":"lăstărișului","dative-genitive-indefinite-plural":"lăstărișuri","dative-definite-genitive-plural":"lăstărișurilor","singular-vocative":"lăstărișule","plural-vocative":"lăstărișurilor"}},{"word":"lăstăruț","pos":"noun","definitions":["diminutive of lăstar; small sprout"],"forms":{"plural":"lăstăruțe","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lăstăruț","accusative-definite-nominative-singular":"lăstăruțul","accusative-indefinite-nominative-plural":"lăstăruțe","accusative-definite-nominative-plural":"lăstăruței","dative-genitive-indefinite-singular":"lăstăruț","dative-definite-genitive-singular":"lăstăruțului","dative-genitive-indefinite-plural":"lăstăruțe","dative-definite-genitive-plural":"lăstăruțelor","singular-vocative":"lăstăruțule","plural-vocative":"lăstăruțelor"}},{"word":"lastex","pos":"noun","definitions":["Lastex"],"forms":{"plural":"lastexuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lastex","accusative-definite-nominative-singular":"lastexul","accusative-indefinite-nominative-plural":"lastexuri","accusative-definite-nominative-plural":"lastexurile","dative-genitive-indefinite-singular":"lastex","dative-definite-genitive-singular":"lastexului","dative-genitive-indefinite-plural":"lastexuri","dative-definite-genitive-plural":"lastexurilor","singular-vocative":"lastexule","plural-vocative":"lastexurilor"}},{"word":"lăsti","pos":"verb","definitions":["to cheat, to fool"],"forms":{"canonical":"a lăsti 4th conjugation","present-singular-third-person":"lăstește","participle-past":"lăstit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lăsti","gerund":"lăstind","first-person-indicative-present-singular":"lăstesc","indicative-present-second-person-singular":"lăstești","indicative-present-singular-third-person":"lăstește","first-person-indicative-plural-present":"lăstim","indicative-plural-present-second-person":"lăstiți","indicative-plural-present-third-person":"lăstesc","first-person-imperfect-indicative-singular":"lăsteam","imperfect-indicative-second-person-singular":"lăsteai","imperfect-indicative-singular-third-person":"lăstea","first-person-imperfect-indicative-plural":"lăsteam","imperfect-indicative-plural-second-person":"lăsteați","imperfect-indicative-plural-third-person":"lăsteau","first-person-indicative-perfect-singular":"lăstii","indicative-perfect-second-person-singular":"lăstiși","indicative-perfect-singular-third-person":"lăsti","first-person-indicative-perfect-plural":"lăstirăm","indicative-perfect-plural-second-person":"lăstirăți","indicative-perfect-plural-third-person":"lăstiră","first-person-indicative-pluperfect-singular":"lăstisem","indicative-pluperfect-second-person-singular":"lăstiseși","indicative-pluperfect-singular-third-person":"lăstise","first-person-indicative-pluperfect-plural":"lăstiserăm","indicative-pluperfect-plural-second-person":"lăstiserăți","indicative-pluperfect-plural-third-person":"lăstiseră","first-person-present-singular-subjunctive":"să lăstesc","present-second-person-singular-subjunctive":"să lăstești","present-singular-subjunctive-third-person":"să lăstească","first-person-plural-present-subjunctive":"să lăstim","plural-present-second-person-subjunctive":"să lăstiți","plural-present-subjunctive-third-person":"să lăstească","imperative-second-person-singular":"lăstește","imperative-plural-second-person":"lăstiți","imperative-negative-second-person-singular":"nu lăsti","imperative-negative-plural-second-person":"nu lăstiți"}},{"word":"lastic","pos":"noun","definitions":["lasting (durable woollen material)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lastic","accusative-definite-nominative":"lasticul","dative-genitive-indefinite":"lastic","dative-definite-genitive":"lasticului","vocative":"lasticule"}},{"word":"lăstire","pos":"noun","definitions":["fraud"],"forms":{"plural":"lăstiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lăstire","accusative-definite-nominative-singular":"lăstirea","accusative-indefinite-nominative-plural":"lăstiri","accusative-definite-nominative-plural":"lăstirile","dative-genitive-indefinite-singular":"lăstiri","dative-definite-genitive-singular":"lăstirii","dative-genitive-indefinite-plural":"lăstiri","dative-definite-genitive-plural":"lăstirilor","singular-vocative":"lăstire","plural-vocative":"lăstirilor"}},{"word":"lăstitor","pos":"adj","definitions":["deceptive"],"forms":{"feminine-singular":"lăstitoare","masculine-plural":"lăstitori","feminine-neuter-plural":"lăstitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăstitor","error-unrecognized-form-feminine-indefinite-singular":"lăstitoare","error-unrecognized-form-indefinite-masculine-plural":"lăstitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăstitoare","definite-error-unrecognized-form-masculine-neuter-singular":"lăstitorul","definite-error-unrecognized-form-feminine-singular":"lăstitoarea","definite-error-unrecognized-form-masculine-plural":"lăstitorii","definite-error-unrecognized-form-feminine-neuter-plural":"lăstitoarele"}},{"word":"lăstitură","pos":"noun","definitions":["fraud"],"forms":{"plural":"lăstituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lăstitură","accusative-definite-nominative-singular":"lăstitura","accusative-indefinite-nominative-plural":"lăstituri","accusative-definite-nominative-plural":"lăstiturile","dative-genitive-indefinite-singular":"lăstituri","dative-definite-genitive-singular":"lăstiturii","dative-genitive-indefinite-plural":"lăstituri","dative-definite-genitive-plural":"lăstiturilor","singular-vocative":"lăstitură","plural-vocative":"lăstiturilor"}},{"word":"lăstiv","pos":"adj","definitions":["deceptive"],"forms":{"feminine-singular":"lăstivă","masculine-plural":"lăstivi","feminine-neuter-plural":"lăstive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăstiv","error-unrecognized-form-feminine-indefinite-singular":"lăstivă","error-unrecognized-form-indefinite-masculine-plural":"lăstivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăstive","definite-error-unrecognized-form-masculine-neuter-singular":"lăstivul","definite-error-unrecognized-form-feminine-singular":"lăstiva","definite-error-unrecognized-form-masculine-plural":"lăstivii","definite-error-unrecognized-form-feminine-neuter-plural":"lăstivele"}},{"word":"lăstrică","pos":"noun","definitions":["diminutive of lastră"],"forms":{"plural":"lăstrici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lăstrică","accusative-definite-nominative-singular":"lăstrica","accusative-indefinite-nominative-plural":"lăstrici","accusative-definite-nominative-plural":"lăstricile","dative-genitive-indefinite-singular":"lăstrici","dative-definite-genitive-singular":"lăstricii","dative-genitive-indefinite-plural":"lăstrici","dative-definite-genitive-plural":"lăstricilor","singular-vocative":"lăstrică","plural-vocative":"lăstricilor"}},{"word":"Lăstun","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lăstun"}},{"word":"lăstun","pos":"noun","definitions":["martin (bird)","swallow (bird), barn swallow"],"forms":{"plural":"lăstuni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lăstun","accusative-definite-nominative-singular":"lăstunul","accusative-indefinite-nominative-plural":"lăstuni","accusative-definite-nominative-plural":"lăstunii","dative-genitive-indefinite-singular":"lăstun","dative-definite-genitive-singular":"lăstunului","dative-genitive-indefinite-plural":"lăstuni","dative-definite-genitive-plural":"lăstunilor","singular-vocative":"lăstunule","plural-vocative":"lăstunilor"}},{"word":"lăstun de casă","pos":"noun","definitions":["common house martin (Delichon urbicum)"],"forms":{"plural":"lăstuni de casă"}},{"word":"lăstun de mal","pos":"noun","definitions":["sand martin (Riparia riparia)"],"forms":{"plural":"lăstuni de mal"}},{"word":"lăstun de stâncă","pos":"noun","definitions":["Eurasian crag martin (Ptyonoprogne rupestris)"],"forms":{"plural":"lăstuni de stâncă"}},{"word":"lăstunaș","pos":"noun","definitions":["diminutive of lăstun; small martin"],"forms":{"plural":"lăstunași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lăstunaș","accusative-definite-nominative-singular":"lăstunașul","accusative-indefinite-nominative-plural":"lăstunași","accusative-definite-nominative-plural":"lăstunașii","dative-genitive-indefinite-singular":"lăstunaș","dative-definite-genitive-singular":"lăstunașului","dative-genitive-indefinite-plural":"lăstunași","dative-definite-genitive-plural":"lăstunașilor","singular-vocative":"lăstunașule","plural-vocative":"lăstunașilor"}},{"word":"lăstunel","pos":"noun","definitions":["diminutive of lăstun"],"forms":{"plural":"lăstunei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lăstunel","accusative-definite-nominative-singular":"lăstunelul","accusative-indefinite-nominative-plural":"lăstunei","accusative-definite-nominative-plural":"lăstuneii","dative-genitive-indefinite-singular":"lăstunel","dative-definite-genitive-singular":"lăstunelului","dative-genitive-indefinite-plural":"lăstunei","dative-definite-genitive-plural":"lăstuneilor","singular-vocative":"lăstunelule","plural-vocative":"lăstuneilor"}},{"word":"Lăstuni","pos":"name","definitions":["a village in Mihail Kogălniceanu, Tulcea County, Romania","a village in Dumitrești, Vrancea County, Romania"],"gender":"m"},{"word":"lat","pos":"adj","definitions":["wide, broad"],"pronunciation":"/lat/","forms":{"feminine-singular":"lată","masculine-plural":"lați","feminine-neuter-plural":"late","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"lat","error-unrecognized-form-feminine-indefinite-singular":"lată","error-unrecognized-form-indefinite-masculine-plural":"lați","error-unrecognized-form-feminine-indefinite-neuter-plural":"late","definite-error-unrecognized-form-masculine-neuter-singular":"latul","definite-error-unrecognized-form-feminine-singular":"lata","definite-error-unrecognized-form-masculine-plural":"lații","definite-error-unrecognized-form-feminine-neuter-plural":"latele"}},{"word":"lat","pos":"noun","definitions":["the wide part of an object"],"pronunciation":"/lat/","forms":{"plural":"laturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lat","accusative-definite-nominative-singular":"latul","accusative-indefinite-nominative-plural":"laturi","accusative-definite-nominative-plural":"laturile","dative-genitive-indefinite-singular":"lat","dative-definite-genitive-singular":"latului","dative-genitive-indefinite-plural":"laturi","dative-definite-genitive-plural":"laturilor","singular-vocative":"latule","plural-vocative":"laturilor"}},{"word":"laț","pos":"noun","definitions":["snare","noose","loop"],"forms":{"plural":"lațuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"laț","accusative-definite-nominative-singular":"lațul","accusative-indefinite-nominative-plural":"lațuri","accusative-definite-nominative-plural":"lațurile","dative-genitive-indefinite-singular":"laț","dative-definite-genitive-singular":"lațului","dative-genitive-indefinite-plural":"lațuri","dative-definite-genitive-plural":"lațurilor","singular-vocative":"lațule","plural-vocative":"lațurilor"}},{"word":"lat.","pos":"noun","definitions":["abbreviation of latină (“Latin”)","abbreviation of latitudine (“latitude”)"]},{"word":"latanier","pos":"noun","definitions":["palmetto"],"forms":{"plural":"latanieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"latanier","accusative-definite-nominative-singular":"latanierul","accusative-indefinite-nominative-plural":"latanieri","accusative-definite-nominative-plural":"latanierii","dative-genitive-indefinite-singular":"latanier","dative-definite-genitive-singular":"latanierului","dative-genitive-indefinite-plural":"latanieri","dative-definite-genitive-plural":"latanierilor","singular-vocative":"latanierule","plural-vocative":"latanierilor"}},{"word":"lătăreț","pos":"adj","definitions":["wide and flat"],"forms":{"feminine-singular":"lătăreață","masculine-plural":"lătăreți","feminine-neuter-plural":"lătărețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lătăreț","error-unrecognized-form-feminine-indefinite-singular":"lătăreață","error-unrecognized-form-indefinite-masculine-plural":"lătăreți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lătărețe","definite-error-unrecognized-form-masculine-neuter-singular":"lătărețul","definite-error-unrecognized-form-feminine-singular":"lătăreața","definite-error-unrecognized-form-masculine-plural":"lătăreții","definite-error-unrecognized-form-feminine-neuter-plural":"lătărețele"}},{"word":"lătățime","pos":"noun","definitions":["latitude"],"forms":{"plural":"lătățimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lătățime","accusative-definite-nominative-singular":"lătățimea","accusative-indefinite-nominative-plural":"lătățimi","accusative-definite-nominative-plural":"lătățimile","dative-genitive-indefinite-singular":"lătățimi","dative-definite-genitive-singular":"lătățimii","dative-genitive-indefinite-plural":"lătățimi","dative-definite-genitive-plural":"lătățimilor","singular-vocative":"lătățime","plural-vocative":"lătățimilor"}},{"word":"lătăuș","pos":"noun","definitions":["species of crustacean (Gammarus pulex)"],"forms":{"plural":"lătăuși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lătăuș","accusative-definite-nominative-singular":"lătăușul","accusative-indefinite-nominative-plural":"lătăuși","accusative-definite-nominative-plural":"lătăușii","dative-genitive-indefinite-singular":"lătăuș","dative-definite-genitive-singular":"lătăușului","dative-genitive-indefinite-plural":"lătăuși","dative-definite-genitive-plural":"lătăușilor","singular-vocative":"lătăușule","plural-vocative":"lătăușilor"}},{"word":"Lățchescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lățchescu"}},{"word":"lațe","pos":"noun","definitions":["tufts of wool or hair"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"lațe","accusative-definite-nominative":"lațele","dative-genitive-indefinite":"lațe","dative-definite-genitive":"lațelor","vocative":"-"}},{"word":"lățel","pos":"noun","definitions":["crab louse"],"forms":{"plural":"lăței","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lățel","accusative-definite-nominative-singular":"lățelul","accusative-indefinite-nominative-plural":"lăței","accusative-definite-nominative-plural":"lățeii","dative-genitive-indefinite-singular":"lățel","dative-definite-genitive-singular":"lățelului","dative-genitive-indefinite-plural":"lăței","dative-definite-genitive-plural":"lățeilor","singular-vocative":"lățelule","plural-vocative":"lățeilor"}},{"word":"latent","pos":"adj","definitions":["latent"],"forms":{"feminine-singular":"latentă","masculine-plural":"latenți","feminine-neuter-plural":"latente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"latent","error-unrecognized-form-feminine-indefinite-singular":"latentă","error-unrecognized-form-indefinite-masculine-plural":"latenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"latente","definite-error-unrecognized-form-masculine-neuter-singular":"latentul","definite-error-unrecognized-form-feminine-singular":"latenta","definite-error-unrecognized-form-masculine-plural":"latenții","definite-error-unrecognized-form-feminine-neuter-plural":"latentele"}},{"word":"latență","pos":"noun","definitions":["latency"],"forms":{"plural":"latențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"latență","accusative-definite-nominative-singular":"latența","accusative-indefinite-nominative-plural":"latențe","accusative-definite-nominative-plural":"latențele","dative-genitive-indefinite-singular":"latențe","dative-definite-genitive-singular":"latenței","dative-genitive-indefinite-plural":"latențe","dative-definite-genitive-plural":"latențelor","singular-vocative":"latență","plural-vocative":"latențelor"}},{"word":"lateral","pos":"adj","definitions":["lateral"],"forms":{"feminine-singular":"laterală","masculine-plural":"laterali","feminine-neuter-plural":"laterale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lateral","error-unrecognized-form-feminine-indefinite-singular":"laterală","error-unrecognized-form-indefinite-masculine-plural":"laterali","error-unrecognized-form-feminine-indefinite-neuter-plural":"laterale","definite-error-unrecognized-form-masculine-neuter-singular":"lateralul","definite-error-unrecognized-form-feminine-singular":"laterala","definite-error-unrecognized-form-masculine-plural":"lateralii","definite-error-unrecognized-form-feminine-neuter-plural":"lateralele"}},{"word":"laterală","pos":"noun","definitions":["lateral"],"forms":{"plural":"laterale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"laterală","accusative-definite-nominative-singular":"laterala","accusative-indefinite-nominative-plural":"laterale","accusative-definite-nominative-plural":"lateralele","dative-genitive-indefinite-singular":"laterale","dative-definite-genitive-singular":"lateralei","dative-genitive-indefinite-plural":"laterale","dative-definite-genitive-plural":"lateralelor","singular-vocative":"laterală","plural-vocative":"lateralelor"}},{"word":"laterit","pos":"noun","definitions":["laterite"],"forms":{"plural":"lateríte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"laterit","accusative-definite-nominative-singular":"lateritul","accusative-indefinite-nominative-plural":"lateríte","accusative-definite-nominative-plural":"laterítele","dative-genitive-indefinite-singular":"laterit","dative-definite-genitive-singular":"lateritului","dative-genitive-indefinite-plural":"lateríte","dative-definite-genitive-plural":"laterítelor","singular-vocative":"lateritule","plural-vocative":"laterítelor"}},{"word":"lateritic","pos":"adj","definitions":["lateritic"],"forms":{"feminine-singular":"lateritică","masculine-plural":"lateritici","feminine-neuter-plural":"lateritice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lateritic","error-unrecognized-form-feminine-indefinite-singular":"lateritică","error-unrecognized-form-indefinite-masculine-plural":"lateritici","error-unrecognized-form-feminine-indefinite-neuter-plural":"lateritice","definite-error-unrecognized-form-masculine-neuter-singular":"lateriticul","definite-error-unrecognized-form-feminine-singular":"lateritica","definite-error-unrecognized-form-masculine-plural":"lateriticii","definite-error-unrecognized-form-feminine-neuter-plural":"lateriticele"}},{"word":"lateritizare","pos":"noun","definitions":["laterization"],"forms":{"plural":"lateritizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lateritizare","accusative-definite-nominative-singular":"lateritizarea","accusative-indefinite-nominative-plural":"lateritizări","accusative-definite-nominative-plural":"lateritizările","dative-genitive-indefinite-singular":"lateritizări","dative-definite-genitive-singular":"lateritizării","dative-genitive-indefinite-plural":"lateritizări","dative-definite-genitive-plural":"lateritizărilor","singular-vocative":"lateritizare","plural-vocative":"lateritizărilor"}},{"word":"Lățești","pos":"name","definitions":["a locality in Murgeni, Vaslui County, Romania"],"gender":"m"},{"word":"lăteț","pos":"adj","definitions":["diminutive of lat"],"forms":{"feminine-singular":"lăteață","masculine-plural":"lăteți","feminine-neuter-plural":"lătețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăteț","error-unrecognized-form-feminine-indefinite-singular":"lăteață","error-unrecognized-form-indefinite-masculine-plural":"lăteți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lătețe","definite-error-unrecognized-form-masculine-neuter-singular":"lătețul","definite-error-unrecognized-form-feminine-singular":"lăteața","definite-error-unrecognized-form-masculine-plural":"lăteții","definite-error-unrecognized-form-feminine-neuter-plural":"lătețele"}},{"word":"latex","pos":"noun","definitions":["latex"],"forms":{"plural":"latexuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"latex","accusative-definite-nominative-singular":"latexul","accusative-indefinite-nominative-plural":"latexuri","accusative-definite-nominative-plural":"latexurile","dative-genitive-indefinite-singular":"latex","dative-definite-genitive-singular":"latexului","dative-genitive-indefinite-plural":"latexuri","dative-definite-genitive-plural":"latexurilor","singular-vocative":"latexule","plural-vocative":"latexurilor"}},{"word":"lăți","pos":"verb","definitions":["to widen, broaden","to spread, extend, dilate"],"forms":{"canonical":"a lăți 4th conjugation","present-singular-third-person":"lățește","participle-past":"lățit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lăți","gerund":"lățind","first-person-indicative-present-singular":"lățesc","indicative-present-second-person-singular":"lățești","indicative-present-singular-third-person":"lățește","first-person-indicative-plural-present":"lățim","indicative-plural-present-second-person":"lățiți","indicative-plural-present-third-person":"lățesc","first-person-imperfect-indicative-singular":"lățeam","imperfect-indicative-second-person-singular":"lățeai","imperfect-indicative-singular-third-person":"lățea","first-person-imperfect-indicative-plural":"lățeam","imperfect-indicative-plural-second-person":"lățeați","imperfect-indicative-plural-third-person":"lățeau","first-person-indicative-perfect-singular":"lății","indicative-perfect-second-person-singular":"lățiși","indicative-perfect-singular-third-person":"lăți","first-person-indicative-perfect-plural":"lățirăm","indicative-perfect-plural-second-person":"lățirăți","indicative-perfect-plural-third-person":"lățiră","first-person-indicative-pluperfect-singular":"lățisem","indicative-pluperfect-second-person-singular":"lățiseși","indicative-pluperfect-singular-third-person":"lățise","first-person-indicative-pluperfect-plural":"lățiserăm","indicative-pluperfect-plural-second-person":"lățiserăți","indicative-pluperfect-plural-third-person":"lățiseră","first-person-present-singular-subjunctive":"să lățesc","present-second-person-singular-subjunctive":"să lățești","present-singular-subjunctive-third-person":"să lățească","first-person-plural-present-subjunctive":"să lățim","plural-present-second-person-subjunctive":"să lățiți","plural-present-subjunctive-third-person":"să lățească","imperative-second-person-singular":"lățește","imperative-plural-second-person":"lățiți","imperative-negative-second-person-singular":"nu lăți","imperative-negative-plural-second-person":"nu lățiți"}},{"word":"latibul","pos":"noun","definitions":["latibulum, hiding place, refuge"],"forms":{"plural":"latibuli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"latibul","accusative-definite-nominative-singular":"latibulul","accusative-indefinite-nominative-plural":"latibuli","accusative-definite-nominative-plural":"latibulii","dative-genitive-indefinite-singular":"latibul","dative-definite-genitive-singular":"latibulului","dative-genitive-indefinite-plural":"latibuli","dative-definite-genitive-plural":"latibulilor","singular-vocative":"latibulule","plural-vocative":"latibulilor"}},{"word":"latice","pos":"noun","definitions":["lattice"],"forms":{"plural":"latici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"latice","accusative-definite-nominative-singular":"laticea","accusative-indefinite-nominative-plural":"latici","accusative-definite-nominative-plural":"laticile","dative-genitive-indefinite-singular":"latici","dative-definite-genitive-singular":"laticii","dative-genitive-indefinite-plural":"latici","dative-definite-genitive-plural":"laticilor","singular-vocative":"latice","plural-vocative":"laticilor"}},{"word":"lăticel","pos":"adj","definitions":["diminutive of lat"],"forms":{"feminine-singular":"lăticelă","masculine-plural":"lăticeli","feminine-neuter-plural":"lăticele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăticel","error-unrecognized-form-feminine-indefinite-singular":"lăticelă","error-unrecognized-form-indefinite-masculine-plural":"lăticeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăticele","definite-error-unrecognized-form-masculine-neuter-singular":"lăticelul","definite-error-unrecognized-form-feminine-singular":"lăticela","definite-error-unrecognized-form-masculine-plural":"lăticelii","definite-error-unrecognized-form-feminine-neuter-plural":"lăticelele"}},{"word":"laticifer","pos":"noun","definitions":["laticifer"],"forms":{"plural":"laticifere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"laticifer","accusative-definite-nominative-singular":"laticiferul","accusative-indefinite-nominative-plural":"laticifere","accusative-definite-nominative-plural":"laticiferele","dative-genitive-indefinite-singular":"laticifer","dative-definite-genitive-singular":"laticiferului","dative-genitive-indefinite-plural":"laticifere","dative-definite-genitive-plural":"laticiferelor","singular-vocative":"laticiferule","plural-vocative":"laticiferelor"}},{"word":"laticlavă","pos":"noun","definitions":["laticlave"],"forms":{"plural":"laticlave","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"laticlavă","accusative-definite-nominative-singular":"laticlava","accusative-indefinite-nominative-plural":"laticlave","accusative-definite-nominative-plural":"laticlavele","dative-genitive-indefinite-singular":"laticlave","dative-definite-genitive-singular":"laticlavei","dative-genitive-indefinite-plural":"laticlave","dative-definite-genitive-plural":"laticlavelor","singular-vocative":"laticlavă","plural-vocative":"laticlavelor"}},{"word":"latifundiar","pos":"noun","definitions":["landowner"],"forms":{"plural":"latifundiari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"latifundiar","accusative-definite-nominative-singular":"latifundiarul","accusative-indefinite-nominative-plural":"latifundiari","accusative-definite-nominative-plural":"latifundiarii","dative-genitive-indefinite-singular":"latifundiar","dative-definite-genitive-singular":"latifundiarului","dative-genitive-indefinite-plural":"latifundiari","dative-definite-genitive-plural":"latifundiarilor","singular-vocative":"latifundiarule","plural-vocative":"latifundiarilor"}},{"word":"latifundiară","pos":"noun","definitions":["female equivalent of latifundiar"],"forms":{"plural":"latifundiare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"latifundiară","accusative-definite-nominative-singular":"latifundiara","accusative-indefinite-nominative-plural":"latifundiare","accusative-definite-nominative-plural":"latifundiarele","dative-genitive-indefinite-singular":"latifundiare","dative-definite-genitive-singular":"latifundiarei","dative-genitive-indefinite-plural":"latifundiare","dative-definite-genitive-plural":"latifundiarelor","singular-vocative":"latifundiară","plural-vocative":"latifundiarelor"}},{"word":"latifundie","pos":"noun","definitions":["alternative form of latifundiu"],"forms":{"plural":"latifundii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"latifundie","accusative-definite-nominative-singular":"latifundia","accusative-indefinite-nominative-plural":"latifundii","accusative-definite-nominative-plural":"latifundiile","dative-genitive-indefinite-singular":"latifundii","dative-definite-genitive-singular":"latifundiei","dative-genitive-indefinite-plural":"latifundii","dative-definite-genitive-plural":"latifundiilor","singular-vocative":"latifundie","plural-vocative":"latifundiilor"}},{"word":"latifundiu","pos":"noun","definitions":["very large estate, great landed property"],"forms":{"plural":"latifundii"}},{"word":"lățime","pos":"noun","definitions":["width, breadth"],"pronunciation":"/ləˈt͡si.me/","forms":{"plural":"lățimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lățime","accusative-definite-nominative-singular":"lățimea","accusative-indefinite-nominative-plural":"lățimi","accusative-definite-nominative-plural":"lățimile","dative-genitive-indefinite-singular":"lățimi","dative-definite-genitive-singular":"lățimii","dative-genitive-indefinite-plural":"lățimi","dative-definite-genitive-plural":"lățimilor","singular-vocative":"lățime","plural-vocative":"lățimilor"}},{"word":"latin","pos":"adj","definitions":["Latin"],"pronunciation":"/laˈtin/","forms":{"feminine-singular":"latină","masculine-plural":"latini","feminine-neuter-plural":"latine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"latin","error-unrecognized-form-feminine-indefinite-singular":"latină","error-unrecognized-form-indefinite-masculine-plural":"latini","error-unrecognized-form-feminine-indefinite-neuter-plural":"latine","definite-error-unrecognized-form-masculine-neuter-singular":"latinul","definite-error-unrecognized-form-feminine-singular":"latina","definite-error-unrecognized-form-masculine-plural":"latinii","definite-error-unrecognized-form-feminine-neuter-plural":"latinele"}},{"word":"latină","pos":"adj","definitions":["nominative feminine singular of latin"],"pronunciation":"[laˈtinə]"},{"word":"latină","pos":"noun","definitions":["Latin (language)"],"pronunciation":"[laˈtinə]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"latină","accusative-definite-nominative":"latina","dative-genitive-indefinite":"latine","dative-definite-genitive":"latinei","vocative":"latină"}},{"word":"latinătate","pos":"noun","definitions":["Latinity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"latinătate","accusative-definite-nominative":"latinătatea","dative-genitive-indefinite":"latinătăți","dative-definite-genitive":"latinătății","vocative":"-"}},{"word":"latinesc","pos":"adj","definitions":["Latin"],"forms":{"feminine-singular":"latinească","plural":"latinești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"latinesc","error-unrecognized-form-feminine-indefinite-singular":"latinească","error-unrecognized-form-indefinite-masculine-plural":"latinești","error-unrecognized-form-feminine-indefinite-neuter-plural":"latinești","definite-error-unrecognized-form-masculine-neuter-singular":"latinescul","definite-error-unrecognized-form-feminine-singular":"latineasca","definite-error-unrecognized-form-masculine-plural":"latineștii","definite-error-unrecognized-form-feminine-neuter-plural":"latineștile"}},{"word":"lătinesc","pos":"adj","definitions":["obsolete form of latinesc"],"forms":{"feminine-singular":"lătinească","plural":"lătinești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lătinesc","error-unrecognized-form-feminine-indefinite-singular":"lătinească","error-unrecognized-form-indefinite-masculine-plural":"lătinești","error-unrecognized-form-feminine-indefinite-neuter-plural":"lătinești","definite-error-unrecognized-form-masculine-neuter-singular":"lătinescul","definite-error-unrecognized-form-feminine-singular":"lătineasca","definite-error-unrecognized-form-masculine-plural":"lătineștii","definite-error-unrecognized-form-feminine-neuter-plural":"lătineștile"}},{"word":"latinește","pos":"adv","definitions":["in Latin language"]},{"word":"lătinește","pos":"adv","definitions":["obsolete form of latinește"]},{"word":"latini","pos":"verb","definitions":["to Latinize"],"forms":{"canonical":"a latini 4th conjugation","present-singular-third-person":"latinește","participle-past":"latinit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a latini","gerund":"latinind","first-person-indicative-present-singular":"latinesc","indicative-present-second-person-singular":"latinești","indicative-present-singular-third-person":"latinește","first-person-indicative-plural-present":"latinim","indicative-plural-present-second-person":"latiniți","indicative-plural-present-third-person":"latinesc","first-person-imperfect-indicative-singular":"latineam","imperfect-indicative-second-person-singular":"latineai","imperfect-indicative-singular-third-person":"latinea","first-person-imperfect-indicative-plural":"latineam","imperfect-indicative-plural-second-person":"latineați","imperfect-indicative-plural-third-person":"latineau","first-person-indicative-perfect-singular":"latinii","indicative-perfect-second-person-singular":"latiniși","indicative-perfect-singular-third-person":"latini","first-person-indicative-perfect-plural":"latinirăm","indicative-perfect-plural-second-person":"latinirăți","indicative-perfect-plural-third-person":"latiniră","first-person-indicative-pluperfect-singular":"latinisem","indicative-pluperfect-second-person-singular":"latiniseși","indicative-pluperfect-singular-third-person":"latinise","first-person-indicative-pluperfect-plural":"latiniserăm","indicative-pluperfect-plural-second-person":"latiniserăți","indicative-pluperfect-plural-third-person":"latiniseră","first-person-present-singular-subjunctive":"să latinesc","present-second-person-singular-subjunctive":"să latinești","present-singular-subjunctive-third-person":"să latinească","first-person-plural-present-subjunctive":"să latinim","plural-present-second-person-subjunctive":"să latiniți","plural-present-subjunctive-third-person":"să latinească","imperative-second-person-singular":"latinește","imperative-plural-second-person":"latiniți","imperative-negative-second-person-singular":"nu latini","imperative-negative-plural-second-person":"nu latiniți"}},{"word":"latinie","pos":"noun","definitions":["Latin language"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"latinie","accusative-definite-nominative":"latinia","dative-genitive-indefinite":"latinii","dative-definite-genitive":"latiniei","vocative":"latinie"}},{"word":"latinime","pos":"noun","definitions":["Latindom"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"latinime","accusative-definite-nominative":"latinimea","dative-genitive-indefinite":"latinimi","dative-definite-genitive":"latinimii","vocative":"latinime"}},{"word":"latinire","pos":"noun","definitions":["Latinization"],"forms":{"plural":"latiniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"latinire","accusative-definite-nominative-singular":"latinirea","accusative-indefinite-nominative-plural":"latiniri","accusative-definite-nominative-plural":"latinirile","dative-genitive-indefinite-singular":"latiniri","dative-definite-genitive-singular":"latinirii","dative-genitive-indefinite-plural":"latiniri","dative-definite-genitive-plural":"latinirilor","singular-vocative":"latinire","plural-vocative":"latinirilor"}},{"word":"latinism","pos":"noun","definitions":["Latinism"],"forms":{"plural":"latinisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"latinism","accusative-definite-nominative-singular":"latinismul","accusative-indefinite-nominative-plural":"latinisme","accusative-definite-nominative-plural":"latinismele","dative-genitive-indefinite-singular":"latinism","dative-definite-genitive-singular":"latinismului","dative-genitive-indefinite-plural":"latinisme","dative-definite-genitive-plural":"latinismelor","singular-vocative":"latinismule","plural-vocative":"latinismelor"}},{"word":"latinist","pos":"noun","definitions":["Latinist"],"forms":{"plural":"latiniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"latinist","accusative-definite-nominative-singular":"latinistul","accusative-indefinite-nominative-plural":"latiniști","accusative-definite-nominative-plural":"latiniștii","dative-genitive-indefinite-singular":"latinist","dative-definite-genitive-singular":"latinistului","dative-genitive-indefinite-plural":"latiniști","dative-definite-genitive-plural":"latiniștilor","singular-vocative":"latinistule","plural-vocative":"latiniștilor"}},{"word":"latinistă","pos":"noun","definitions":["female equivalent of latinist"],"forms":{"plural":"latiniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"latinistă","accusative-definite-nominative-singular":"latinista","accusative-indefinite-nominative-plural":"latiniste","accusative-definite-nominative-plural":"latinistele","dative-genitive-indefinite-singular":"latiniste","dative-definite-genitive-singular":"latinistei","dative-genitive-indefinite-plural":"latiniste","dative-definite-genitive-plural":"latinistelor","singular-vocative":"latinistă","plural-vocative":"latinistelor"}},{"word":"latinitate","pos":"noun","definitions":["Latinity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"latinitate","accusative-definite-nominative":"latinitatea","dative-genitive-indefinite":"latinități","dative-definite-genitive":"latinității","vocative":"latinitate"}},{"word":"latiniza","pos":"verb","definitions":["to Latinize"],"forms":{"canonical":"a latiniza 1st conjugation","present-singular-third-person":"latinizează","participle-past":"latinizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a latiniza","gerund":"latinizând","first-person-indicative-present-singular":"latinizez","indicative-present-second-person-singular":"latinizezi","indicative-present-singular-third-person":"latinizează","first-person-indicative-plural-present":"latinizăm","indicative-plural-present-second-person":"latinizați","indicative-plural-present-third-person":"latinizează","first-person-imperfect-indicative-singular":"latinizam","imperfect-indicative-second-person-singular":"latinizai","imperfect-indicative-singular-third-person":"latiniza","first-person-imperfect-indicative-plural":"latinizam","imperfect-indicative-plural-second-person":"latinizați","imperfect-indicative-plural-third-person":"latinizau","first-person-indicative-perfect-singular":"latinizai","indicative-perfect-second-person-singular":"latinizași","indicative-perfect-singular-third-person":"latiniză","first-person-indicative-perfect-plural":"latinizarăm","indicative-perfect-plural-second-person":"latinizarăți","indicative-perfect-plural-third-person":"latinizară","first-person-indicative-pluperfect-singular":"latinizasem","indicative-pluperfect-second-person-singular":"latinizaseși","indicative-pluperfect-singular-third-person":"latinizase","first-person-indicative-pluperfect-plural":"latinizaserăm","indicative-pluperfect-plural-second-person":"latinizaserăți","indicative-pluperfect-plural-third-person":"latinizaseră","first-person-present-singular-subjunctive":"să latinizez","present-second-person-singular-subjunctive":"să latinizezi","present-singular-subjunctive-third-person":"să latinizeze","first-person-plural-present-subjunctive":"să latinizăm","plural-present-second-person-subjunctive":"să latinizați","plural-present-subjunctive-third-person":"să latinizeze","imperative-second-person-singular":"latinizează","imperative-plural-second-person":"latinizați","imperative-negative-second-person-singular":"nu latiniza","imperative-negative-plural-second-person":"nu latinizați"}},{"word":"latinizant","pos":"adj","definitions":["latinizing"],"forms":{"feminine-singular":"latinizantă","masculine-plural":"latinizanți","feminine-neuter-plural":"latinizante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"latinizant","error-unrecognized-form-feminine-indefinite-singular":"latinizantă","error-unrecognized-form-indefinite-masculine-plural":"latinizanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"latinizante","definite-error-unrecognized-form-masculine-neuter-singular":"latinizantul","definite-error-unrecognized-form-feminine-singular":"latinizanta","definite-error-unrecognized-form-masculine-plural":"latinizanții","definite-error-unrecognized-form-feminine-neuter-plural":"latinizantele"}}];
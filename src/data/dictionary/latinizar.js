@@ -0,0 +1 @@
+export default [{"word":"latinizare","pos":"noun","definitions":["Latinization"],"forms":{"plural":"latinizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"latinizare","accusative-definite-nominative-singular":"latinizarea","accusative-indefinite-nominative-plural":"latinizări","accusative-definite-nominative-plural":"latinizările","dative-genitive-indefinite-singular":"latinizări","dative-definite-genitive-singular":"latinizării","dative-genitive-indefinite-plural":"latinizări","dative-definite-genitive-plural":"latinizărilor","singular-vocative":"latinizare","plural-vocative":"latinizărilor"}},{"word":"latinizat","pos":"adj","definitions":["Latinized"],"forms":{"feminine-singular":"latinizată","masculine-plural":"latinizați","feminine-neuter-plural":"latinizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"latinizat","error-unrecognized-form-feminine-indefinite-singular":"latinizată","error-unrecognized-form-indefinite-masculine-plural":"latinizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"latinizate","definite-error-unrecognized-form-masculine-neuter-singular":"latinizatul","definite-error-unrecognized-form-feminine-singular":"latinizata","definite-error-unrecognized-form-masculine-plural":"latinizații","definite-error-unrecognized-form-feminine-neuter-plural":"latinizatele"}},{"word":"latinizație","pos":"noun","definitions":["Latinization"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"latinizație","accusative-definite-nominative":"latinizația","dative-genitive-indefinite":"latinizații","dative-definite-genitive":"latinizației","vocative":"latinizație"}},{"word":"latinizatoare","pos":"noun","definitions":["female equivalent of latinizator"],"forms":{"plural":"latinizatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"latinizatoare","accusative-definite-nominative-singular":"latinizatoarea","accusative-indefinite-nominative-plural":"latinizatoare","accusative-definite-nominative-plural":"latinizatoarele","dative-genitive-indefinite-singular":"latinizatoare","dative-definite-genitive-singular":"latinizatoarei","dative-genitive-indefinite-plural":"latinizatoare","dative-definite-genitive-plural":"latinizatoarelor","singular-vocative":"latinizatoare","plural-vocative":"latinizatoarelor"}},{"word":"latinizator","pos":"noun","definitions":["Latinizer"],"forms":{"plural":"latinizatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"latinizator","accusative-definite-nominative-singular":"latinizatorul","accusative-indefinite-nominative-plural":"latinizatori","accusative-definite-nominative-plural":"latinizatorii","dative-genitive-indefinite-singular":"latinizator","dative-definite-genitive-singular":"latinizatorului","dative-genitive-indefinite-plural":"latinizatori","dative-definite-genitive-plural":"latinizatorilor","singular-vocative":"latinizatorule","plural-vocative":"latinizatorilor"}},{"word":"latino","pos":"noun","definitions":["Latino music"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"latino","accusative-definite-nominative":"latinoul","dative-genitive-indefinite":"latino","dative-definite-genitive":"latinoului","vocative":"latinoule"}},{"word":"latinoamerican","pos":"adj","definitions":["Latin American"],"forms":{"feminine-singular":"latinoamericană","masculine-plural":"latinoamericani","feminine-neuter-plural":"latinoamericane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"latinoamerican","error-unrecognized-form-feminine-indefinite-singular":"latinoamericană","error-unrecognized-form-indefinite-masculine-plural":"latinoamericani","error-unrecognized-form-feminine-indefinite-neuter-plural":"latinoamericane","definite-error-unrecognized-form-masculine-neuter-singular":"latinoamericanul","definite-error-unrecognized-form-feminine-singular":"latinoamericana","definite-error-unrecognized-form-masculine-plural":"latinoamericanii","definite-error-unrecognized-form-feminine-neuter-plural":"latinoamericanele"}},{"word":"Latinu","pos":"name","definitions":["a village in Măxineni, Brăila County, Romania"],"gender":"m"},{"word":"latinul","pos":"noun","definitions":["definite nominative/accusative singular of latin"]},{"word":"lățire","pos":"noun","definitions":["widening"],"forms":{"plural":"lățiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lățire","accusative-definite-nominative-singular":"lățirea","accusative-indefinite-nominative-plural":"lățiri","accusative-definite-nominative-plural":"lățirile","dative-genitive-indefinite-singular":"lățiri","dative-definite-genitive-singular":"lățirii","dative-genitive-indefinite-plural":"lățiri","dative-definite-genitive-plural":"lățirilor","singular-vocative":"lățire","plural-vocative":"lățirilor"}},{"word":"latirism","pos":"noun","definitions":["lathyrism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"latirism","accusative-definite-nominative":"latirismul","dative-genitive-indefinite":"latirism","dative-definite-genitive":"latirismului","vocative":"latirismule"}},{"word":"lățișoară","pos":"noun","definitions":["diminutive of laț; small loop, snare"],"forms":{"plural":"lățișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lățișoară","accusative-definite-nominative-singular":"lățișoara","accusative-indefinite-nominative-plural":"lățișoare","accusative-definite-nominative-plural":"lățișoarele","dative-genitive-indefinite-singular":"lățișoare","dative-definite-genitive-singular":"lățișoarei","dative-genitive-indefinite-plural":"lățișoare","dative-definite-genitive-plural":"lățișoarelor","singular-vocative":"lățișoară","plural-vocative":"lățișoarelor"}},{"word":"lătișor","pos":"adj","definitions":["diminutive of lat"],"pronunciation":"/lə.tiˈʃor/","forms":{"feminine-singular":"lătișoară","masculine-plural":"lătișori","feminine-neuter-plural":"lătișoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lătișor","error-unrecognized-form-feminine-indefinite-singular":"lătișoară","error-unrecognized-form-indefinite-masculine-plural":"lătișori","error-unrecognized-form-feminine-indefinite-neuter-plural":"lătișoare","definite-error-unrecognized-form-masculine-neuter-singular":"lătișorul","definite-error-unrecognized-form-feminine-singular":"lătișoara","definite-error-unrecognized-form-masculine-plural":"lătișorii","definite-error-unrecognized-form-feminine-neuter-plural":"lătișoarele"}},{"word":"lățișor","pos":"noun","definitions":["diminutive of laț; small loop, snare"],"forms":{"plural":"lățișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lățișor","accusative-definite-nominative-singular":"lățișorul","accusative-indefinite-nominative-plural":"lățișore","accusative-definite-nominative-plural":"lățișorele","dative-genitive-indefinite-singular":"lățișor","dative-definite-genitive-singular":"lățișorului","dative-genitive-indefinite-plural":"lățișore","dative-definite-genitive-plural":"lățișorelor","singular-vocative":"lățișorule","plural-vocative":"lățișorelor"}},{"word":"lățit","pos":"adj","definitions":["widened"],"forms":{"feminine-singular":"lățită","masculine-plural":"lățiți","feminine-neuter-plural":"lățite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lățit","error-unrecognized-form-feminine-indefinite-singular":"lățită","error-unrecognized-form-indefinite-masculine-plural":"lățiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lățite","definite-error-unrecognized-form-masculine-neuter-singular":"lățitul","definite-error-unrecognized-form-feminine-singular":"lățita","definite-error-unrecognized-form-masculine-plural":"lățiții","definite-error-unrecognized-form-feminine-neuter-plural":"lățitele"}},{"word":"latitudinal","pos":"adj","definitions":["latitudinal"],"forms":{"feminine-singular":"latitudinală","masculine-plural":"latitudinali","feminine-neuter-plural":"latitudinale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"latitudinal","error-unrecognized-form-feminine-indefinite-singular":"latitudinală","error-unrecognized-form-indefinite-masculine-plural":"latitudinali","error-unrecognized-form-feminine-indefinite-neuter-plural":"latitudinale","definite-error-unrecognized-form-masculine-neuter-singular":"latitudinalul","definite-error-unrecognized-form-feminine-singular":"latitudinala","definite-error-unrecognized-form-masculine-plural":"latitudinalii","definite-error-unrecognized-form-feminine-neuter-plural":"latitudinalele"}},{"word":"latitudine","pos":"noun","definitions":["latitude"],"forms":{"plural":"latitudini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"latitudine","accusative-definite-nominative-singular":"latitudinea","accusative-indefinite-nominative-plural":"latitudini","accusative-definite-nominative-plural":"latitudinile","dative-genitive-indefinite-singular":"latitudini","dative-definite-genitive-singular":"latitudinii","dative-genitive-indefinite-plural":"latitudini","dative-definite-genitive-plural":"latitudinilor","singular-vocative":"latitudine","plural-vocative":"latitudinilor"}},{"word":"lătoc","pos":"noun","definitions":["alternative form of lăptoc"],"forms":{"plural":"lătoace","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lătoc","accusative-definite-nominative-singular":"lătocul","accusative-indefinite-nominative-plural":"lătoace","accusative-definite-nominative-plural":"lătoacele","dative-genitive-indefinite-singular":"lătoc","dative-definite-genitive-singular":"lătocului","dative-genitive-indefinite-plural":"lătoace","dative-definite-genitive-plural":"lătoacelor","singular-vocative":"lătocule","plural-vocative":"lătoacelor"}},{"word":"lătocaș","pos":"noun","definitions":["diminutive of lătoc"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lătocaș","accusative-definite-nominative":"lătocașul","dative-genitive-indefinite":"lătocaș","dative-definite-genitive":"lătocașului","vocative":"lătocașule"}},{"word":"lățoi","pos":"noun","definitions":["augmentative of laț"],"forms":{"plural":"lățoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lățoi","accusative-definite-nominative-singular":"lățoiul","accusative-indefinite-nominative-plural":"lățoaie","accusative-definite-nominative-plural":"lățoaiele","dative-genitive-indefinite-singular":"lățoi","dative-definite-genitive-singular":"lățoiului","dative-genitive-indefinite-plural":"lățoaie","dative-definite-genitive-plural":"lățoaielor","singular-vocative":"lățoiule","plural-vocative":"lățoaielor"}},{"word":"Latorița","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Lotru"],"gender":"f"},{"word":"Latorița de Jos","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Latorița"],"gender":"f"},{"word":"Latorița de Mijloc","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Latorița"],"gender":"f"},{"word":"lățos","pos":"adj","definitions":["disheveled"],"forms":{"feminine-singular":"lățoasă","masculine-plural":"lățoși","feminine-neuter-plural":"lățoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lățos","error-unrecognized-form-feminine-indefinite-singular":"lățoasă","error-unrecognized-form-indefinite-masculine-plural":"lățoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lățoase","definite-error-unrecognized-form-masculine-neuter-singular":"lățosul","definite-error-unrecognized-form-feminine-singular":"lățoasa","definite-error-unrecognized-form-masculine-plural":"lățoșii","definite-error-unrecognized-form-feminine-neuter-plural":"lățoasele"}},{"word":"Lățosu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lățosu"}},{"word":"lătra","pos":"verb","definitions":["to bark"],"forms":{"canonical":"a lătra 1st conjugation","present-singular-third-person":"latră","participle-past":"lătrat","subjunctive-third-person":"latre","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a lătra","gerund":"lătrând","first-person-indicative-present-singular":"latru","indicative-present-second-person-singular":"latri","indicative-present-singular-third-person":"latră","first-person-indicative-plural-present":"lătrăm","indicative-plural-present-second-person":"lătrați","indicative-plural-present-third-person":"latră","first-person-imperfect-indicative-singular":"lătram","imperfect-indicative-second-person-singular":"lătrai","imperfect-indicative-singular-third-person":"lătra","first-person-imperfect-indicative-plural":"lătram","imperfect-indicative-plural-second-person":"lătrați","imperfect-indicative-plural-third-person":"lătrau","first-person-indicative-perfect-singular":"lătrai","indicative-perfect-second-person-singular":"lătrași","indicative-perfect-singular-third-person":"lătră","first-person-indicative-perfect-plural":"lătrarăm","indicative-perfect-plural-second-person":"lătrarăți","indicative-perfect-plural-third-person":"lătrară","first-person-indicative-pluperfect-singular":"lătrasem","indicative-pluperfect-second-person-singular":"lătraseși","indicative-pluperfect-singular-third-person":"lătrase","first-person-indicative-pluperfect-plural":"lătraserăm","indicative-pluperfect-plural-second-person":"lătraserăți","indicative-pluperfect-plural-third-person":"lătraseră","first-person-present-singular-subjunctive":"să latru","present-second-person-singular-subjunctive":"să latri","present-singular-subjunctive-third-person":"să latre","first-person-plural-present-subjunctive":"să lătrăm","plural-present-second-person-subjunctive":"să lătrați","plural-present-subjunctive-third-person":"să latre","imperative-second-person-singular":"latră","imperative-plural-second-person":"lătrați","imperative-negative-second-person-singular":"nu lătra","imperative-negative-plural-second-person":"nu lătrați"}},{"word":"lătrare","pos":"noun","definitions":["barking"],"forms":{"plural":"lătrări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lătrare","accusative-definite-nominative-singular":"lătrarea","accusative-indefinite-nominative-plural":"lătrări","accusative-definite-nominative-plural":"lătrările","dative-genitive-indefinite-singular":"lătrări","dative-definite-genitive-singular":"lătrării","dative-genitive-indefinite-plural":"lătrări","dative-definite-genitive-plural":"lătrărilor","singular-vocative":"lătrare","plural-vocative":"lătrărilor"}},{"word":"lătrat","pos":"noun","definitions":["bark (dog's)"],"forms":{"plural":"lătrături","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lătrat","accusative-definite-nominative-singular":"lătratul","accusative-indefinite-nominative-plural":"lătraturi","accusative-definite-nominative-plural":"lătraturile","dative-genitive-indefinite-singular":"lătrat","dative-definite-genitive-singular":"lătratului","dative-genitive-indefinite-plural":"lătraturi","dative-definite-genitive-plural":"lătraturilor","singular-vocative":"lătratule","plural-vocative":"lătraturilor"}},{"word":"lătrător","pos":"adj","definitions":["barking"],"forms":{"feminine-singular":"lătrătoare","masculine-plural":"lătrători","feminine-neuter-plural":"lătrătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lătrător","error-unrecognized-form-feminine-indefinite-singular":"lătrătoare","error-unrecognized-form-indefinite-masculine-plural":"lătrători","error-unrecognized-form-feminine-indefinite-neuter-plural":"lătrătoare","definite-error-unrecognized-form-masculine-neuter-singular":"lătrătorul","definite-error-unrecognized-form-feminine-singular":"lătrătoarea","definite-error-unrecognized-form-masculine-plural":"lătrătorii","definite-error-unrecognized-form-feminine-neuter-plural":"lătrătoarele"}},{"word":"lătrătură","pos":"noun","definitions":["bark (dog's)"],"forms":{"plural":"lătrături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lătrătură","accusative-definite-nominative-singular":"lătrătura","accusative-indefinite-nominative-plural":"lătrături","accusative-definite-nominative-plural":"lătrăturile","dative-genitive-indefinite-singular":"lătrături","dative-definite-genitive-singular":"lătrăturii","dative-genitive-indefinite-plural":"lătrături","dative-definite-genitive-plural":"lătrăturilor","singular-vocative":"lătrătură","plural-vocative":"lătrăturilor"}},{"word":"latri","pos":"verb","definitions":["second-person singular present indicative/subjunctive of lătra"],"pronunciation":"[ˈlatri]"},{"word":"latrie","pos":"noun","definitions":["adoration, worship"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"latrie","accusative-definite-nominative":"latria","dative-genitive-indefinite":"latrii","dative-definite-genitive":"latriei","vocative":"latrie"}},{"word":"latrină","pos":"noun","definitions":["latrine"],"forms":{"plural":"latrine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"latrină","accusative-definite-nominative-singular":"latrina","accusative-indefinite-nominative-plural":"latrine","accusative-definite-nominative-plural":"latrinele","dative-genitive-indefinite-singular":"latrine","dative-definite-genitive-singular":"latrinei","dative-genitive-indefinite-plural":"latrine","dative-definite-genitive-plural":"latrinelor","singular-vocative":"latrină","plural-vocative":"latrinelor"}},{"word":"latrocinare","pos":"noun","definitions":["robbery"],"forms":{"plural":"latrocinări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"latrocinare","accusative-definite-nominative-singular":"latrocinarea","accusative-indefinite-nominative-plural":"latrocinări","accusative-definite-nominative-plural":"latrocinările","dative-genitive-indefinite-singular":"latrocinări","dative-definite-genitive-singular":"latrocinării","dative-genitive-indefinite-plural":"latrocinări","dative-definite-genitive-plural":"latrocinărilor","singular-vocative":"latrocinare","plural-vocative":"latrocinărilor"}},{"word":"latrocinațiune","pos":"noun","definitions":["theft"],"forms":{"plural":"latrocinațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"latrocinațiune","accusative-definite-nominative-singular":"latrocinațiunea","accusative-indefinite-nominative-plural":"latrocinațiuni","accusative-definite-nominative-plural":"latrocinațiunile","dative-genitive-indefinite-singular":"latrocinațiuni","dative-definite-genitive-singular":"latrocinațiunii","dative-genitive-indefinite-plural":"latrocinațiuni","dative-definite-genitive-plural":"latrocinațiunilor","singular-vocative":"latrocinațiune","plural-vocative":"latrocinațiunilor"}},{"word":"latrone","pos":"noun","definitions":["mercenary","highwayman; brigand, bandit; robber"],"pronunciation":"/laˈtro.ne/","forms":{"plural":"latroni","table-tags":"no-table-tags","inflection-template":"ro-noun-m-e","accusative-indefinite-nominative-singular":"latrone","accusative-definite-nominative-singular":"latronele","accusative-indefinite-nominative-plural":"latroni","accusative-definite-nominative-plural":"latronii","dative-genitive-indefinite-singular":"latrone","dative-definite-genitive-singular":"latronelui","dative-genitive-indefinite-plural":"latroni","dative-definite-genitive-plural":"latronilor","singular-vocative":"latrone","plural-vocative":"latronilor"}},{"word":"latru","pos":"verb","definitions":["first-person singular present indicative/subjunctive of lătra"]},{"word":"lătui","pos":"adj","definitions":["diminutive of lat"],"forms":{"feminine-singular":"lătuie","masculine-plural":"lătui","feminine-neuter-plural":"lătuie","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lătui","error-unrecognized-form-feminine-indefinite-singular":"lătuie","error-unrecognized-form-indefinite-masculine-plural":"lătui","error-unrecognized-form-feminine-indefinite-neuter-plural":"lătuie","definite-error-unrecognized-form-masculine-neuter-singular":"lătuiul","definite-error-unrecognized-form-feminine-singular":"lătuia","definite-error-unrecognized-form-masculine-plural":"lătuii","definite-error-unrecognized-form-feminine-neuter-plural":"lătuiele"}},{"word":"lătuleț","pos":"adj","definitions":["diminutive of lat"],"forms":{"feminine-singular":"lătuleață","masculine-plural":"lătuleți","feminine-neuter-plural":"lătulețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lătuleț","error-unrecognized-form-feminine-indefinite-singular":"lătuleață","error-unrecognized-form-indefinite-masculine-plural":"lătuleți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lătulețe","definite-error-unrecognized-form-masculine-neuter-singular":"lătulețul","definite-error-unrecognized-form-feminine-singular":"lătuleața","definite-error-unrecognized-form-masculine-plural":"lătuleții","definite-error-unrecognized-form-feminine-neuter-plural":"lătulețele"}},{"word":"lătunoi","pos":"noun","definitions":["alternative form of lătunoaie"],"forms":{"plural":"lătunoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lătunoi","accusative-definite-nominative-singular":"lătunoiul","accusative-indefinite-nominative-plural":"lătunoaie","accusative-definite-nominative-plural":"lătunoaiele","dative-genitive-indefinite-singular":"lătunoi","dative-definite-genitive-singular":"lătunoiului","dative-genitive-indefinite-plural":"lătunoaie","dative-definite-genitive-plural":"lătunoaielor","singular-vocative":"lătunoiule","plural-vocative":"lătunoaielor"}},{"word":"latura","pos":"noun","definitions":["definite nominative/accusative singular of latură"],"pronunciation":"[laˈtura]","gender":"f"},{"word":"latură","pos":"noun","definitions":["side","aspect"],"forms":{"plural":"laturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"latură","accusative-definite-nominative-singular":"latura","accusative-indefinite-nominative-plural":"laturi","accusative-definite-nominative-plural":"laturile","dative-genitive-indefinite-singular":"laturi","dative-definite-genitive-singular":"laturii","dative-genitive-indefinite-plural":"laturi","dative-definite-genitive-plural":"laturilor","singular-vocative":"latură","plural-vocative":"laturilor","alternative":"lature"}},{"word":"lătura","pos":"verb","definitions":["alternative form of alătura"],"forms":{"canonical":"a lătura 1st conjugation","present-singular-third-person":"lătură","participle-past":"lăturat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a lătura","gerund":"lăturând","first-person-indicative-present-singular":"lătur","indicative-present-second-person-singular":"lături","indicative-present-singular-third-person":"lătură","first-person-indicative-plural-present":"lăturăm","indicative-plural-present-second-person":"lăturați","indicative-plural-present-third-person":"lătură","first-person-imperfect-indicative-singular":"lăturam","imperfect-indicative-second-person-singular":"lăturai","imperfect-indicative-singular-third-person":"lătura","first-person-imperfect-indicative-plural":"lăturam","imperfect-indicative-plural-second-person":"lăturați","imperfect-indicative-plural-third-person":"lăturau","first-person-indicative-perfect-singular":"lăturai","indicative-perfect-second-person-singular":"lăturași","indicative-perfect-singular-third-person":"lătură","first-person-indicative-perfect-plural":"lăturarăm","indicative-perfect-plural-second-person":"lăturarăți","indicative-perfect-plural-third-person":"lăturară","first-person-indicative-pluperfect-singular":"lăturasem","indicative-pluperfect-second-person-singular":"lăturaseși","indicative-pluperfect-singular-third-person":"lăturase","first-person-indicative-pluperfect-plural":"lăturaserăm","indicative-pluperfect-plural-second-person":"lăturaserăți","indicative-pluperfect-plural-third-person":"lăturaseră","first-person-present-singular-subjunctive":"să lătur","present-second-person-singular-subjunctive":"să lături","present-singular-subjunctive-third-person":"să lăture","first-person-plural-present-subjunctive":"să lăturăm","plural-present-second-person-subjunctive":"să lăturați","plural-present-subjunctive-third-person":"să lăture","imperative-second-person-singular":"lătură","imperative-plural-second-person":"lăturați","imperative-negative-second-person-singular":"nu lătura","imperative-negative-plural-second-person":"nu lăturați"}},{"word":"lățură","pos":"noun","definitions":["snare"],"forms":{"plural":"lățuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lățură","accusative-definite-nominative-singular":"lățura","accusative-indefinite-nominative-plural":"lățuri","accusative-definite-nominative-plural":"lățurile","dative-genitive-indefinite-singular":"lățuri","dative-definite-genitive-singular":"lățurii","dative-genitive-indefinite-plural":"lățuri","dative-definite-genitive-plural":"lățurilor","singular-vocative":"lățură","plural-vocative":"lățurilor"}},{"word":"lăturalnic","pos":"adj","definitions":["adjacent"],"forms":{"feminine-singular":"lăturalnică","masculine-plural":"lăturalnici","feminine-neuter-plural":"lăturalnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăturalnic","error-unrecognized-form-feminine-indefinite-singular":"lăturalnică","error-unrecognized-form-indefinite-masculine-plural":"lăturalnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăturalnice","definite-error-unrecognized-form-masculine-neuter-singular":"lăturalnicul","definite-error-unrecognized-form-feminine-singular":"lăturalnica","definite-error-unrecognized-form-masculine-plural":"lăturalnicii","definite-error-unrecognized-form-feminine-neuter-plural":"lăturalnicele"}},{"word":"lature","pos":"noun","definitions":["alternative form of latură"],"forms":{"plural":"lături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lature","accusative-definite-nominative-singular":"laturea","accusative-indefinite-nominative-plural":"lături","accusative-definite-nominative-plural":"lăturile","dative-genitive-indefinite-singular":"lături","dative-definite-genitive-singular":"lăturii","dative-genitive-indefinite-plural":"lături","dative-definite-genitive-plural":"lăturilor","singular-vocative":"lature","plural-vocative":"lăturilor"}},{"word":"lăturea","pos":"noun","definitions":["diminutive of latură"],"forms":{"plural":"lăturele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"lăturea","accusative-definite-nominative-singular":"lătureaua","accusative-indefinite-nominative-plural":"lăturele","accusative-definite-nominative-plural":"lăturelele","dative-genitive-indefinite-singular":"lăturele","dative-definite-genitive-singular":"lăturelei","dative-genitive-indefinite-plural":"lăturele","dative-definite-genitive-plural":"lăturelelor","singular-vocative":"lăturea","plural-vocative":"lăturelelor"}},{"word":"lături","pos":"noun","definitions":["dirty water (from washing)","slops, swill, hogwash"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"lături","accusative-definite-nominative":"lăturile","dative-genitive-indefinite":"lături","dative-definite-genitive":"lăturilor","vocative":"lăturilor","alternative":"lătură"}},{"word":"lăturică","pos":"noun","definitions":["diminutive of lăture"],"forms":{"plural":"lăturici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lăturică","accusative-definite-nominative-singular":"lăturica","accusative-indefinite-nominative-plural":"lăturici","accusative-definite-nominative-plural":"lăturicile","dative-genitive-indefinite-singular":"lăturici","dative-definite-genitive-singular":"lăturicii","dative-genitive-indefinite-plural":"lăturici","dative-definite-genitive-plural":"lăturicilor","singular-vocative":"lăturică","plural-vocative":"lăturicilor"}},{"word":"lăturiș","pos":"adv","definitions":["slantwise"]},{"word":"lăturiță","pos":"noun","definitions":["diminutive of lăture"],"forms":{"plural":"lăturițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lăturiță","accusative-definite-nominative-singular":"lăturița","accusative-indefinite-nominative-plural":"lăturițe","accusative-definite-nominative-plural":"lăturițele","dative-genitive-indefinite-singular":"lăturițe","dative-definite-genitive-singular":"lăturiței","dative-genitive-indefinite-plural":"lăturițe","dative-definite-genitive-plural":"lăturițelor","singular-vocative":"lăturiță","plural-vocative":"lăturițelor"}},{"word":"lățuros","pos":"adj","definitions":["disheveled"],"forms":{"feminine-singular":"lățuroasă","masculine-plural":"lățuroși","feminine-neuter-plural":"lățuroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lățuros","error-unrecognized-form-feminine-indefinite-singular":"lățuroasă","error-unrecognized-form-indefinite-masculine-plural":"lățuroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lățuroase","definite-error-unrecognized-form-masculine-neuter-singular":"lățurosul","definite-error-unrecognized-form-feminine-singular":"lățuroasa","definite-error-unrecognized-form-masculine-plural":"lățuroșii","definite-error-unrecognized-form-feminine-neuter-plural":"lățuroasele"}},{"word":"lătuș","pos":"noun","definitions":["diminutive of laț"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lătuș","accusative-definite-nominative":"lătușul","dative-genitive-indefinite":"lătuș","dative-definite-genitive":"lătușului","vocative":"lătușule"}},{"word":"lătuț","pos":"adj","definitions":["diminutive of lat"],"forms":{"feminine-singular":"lătuță","masculine-plural":"lătuți","feminine-neuter-plural":"lătuțe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lătuț","error-unrecognized-form-feminine-indefinite-singular":"lătuță","error-unrecognized-form-indefinite-masculine-plural":"lătuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lătuțe","definite-error-unrecognized-form-masculine-neuter-singular":"lătuțul","definite-error-unrecognized-form-feminine-singular":"lătuța","definite-error-unrecognized-form-masculine-plural":"lătuții","definite-error-unrecognized-form-feminine-neuter-plural":"lătuțele"}},{"word":"lătuț","pos":"noun","definitions":["diminutive of -uț"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"lătuț","accusative-definite-nominative":"lătuțul","dative-genitive-indefinite":"lătuț","dative-definite-genitive":"lătuțului","vocative":"lătuțule"}},{"word":"lau","pos":"verb","definitions":["inflection of la:","first-person singular present indicative/subjunctive","third-person plural present/imperfect indicative"]},{"word":"laud","pos":"verb","definitions":["first-person singular present indicative/subjunctive of lăuda"],"pronunciation":"[ˈla.ud]"},{"word":"Laudă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Laudă"}},{"word":"laudă","pos":"noun","definitions":["praise, commendation","praise, glory","boast, boasting","threat (expression of intent to do something bad)"],"pronunciation":"/ˈla.u.də/","forms":{"plural":"laude"}},{"word":"laudă","pos":"verb","definitions":["inflection of lăuda (“to praise; to brag”):","third-person singular/plural indicative present","imperative singular"],"pronunciation":"/ˈla.u.də/"},{"word":"lăuda","pos":"verb","definitions":["to praise, laud","to praise (worship)","to boast, brag","to threaten (issue threats)","to denounce, tell on"],"pronunciation":"/lə.uˈda/","forms":{"canonical":"a lăuda 1st conjugation","present-singular-third-person":"laudă","participle-past":"lăudat","subjunctive-third-person":"laude","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a lăuda","gerund":"lăudând","first-person-indicative-present-singular":"laud","indicative-present-second-person-singular":"lauzi","indicative-present-singular-third-person":"laudă","first-person-indicative-plural-present":"lăudăm","indicative-plural-present-second-person":"lăudați","indicative-plural-present-third-person":"laudă","first-person-imperfect-indicative-singular":"lăudam","imperfect-indicative-second-person-singular":"lăudai","imperfect-indicative-singular-third-person":"lăuda","first-person-imperfect-indicative-plural":"lăudam","imperfect-indicative-plural-second-person":"lăudați","imperfect-indicative-plural-third-person":"lăudau","first-person-indicative-perfect-singular":"lăudai","indicative-perfect-second-person-singular":"lăudași","indicative-perfect-singular-third-person":"lăudă","first-person-indicative-perfect-plural":"lăudarăm","indicative-perfect-plural-second-person":"lăudarăți","indicative-perfect-plural-third-person":"lăudară","first-person-indicative-pluperfect-singular":"lăudasem","indicative-pluperfect-second-person-singular":"lăudaseși","indicative-pluperfect-singular-third-person":"lăudase","first-person-indicative-pluperfect-plural":"lăudaserăm","indicative-pluperfect-plural-second-person":"lăudaserăți","indicative-pluperfect-plural-third-person":"lăudaseră","first-person-present-singular-subjunctive":"să laud","present-second-person-singular-subjunctive":"să lauzi","present-singular-subjunctive-third-person":"să laude","first-person-plural-present-subjunctive":"să lăudăm","plural-present-second-person-subjunctive":"să lăudați","plural-present-subjunctive-third-person":"să laude","imperative-second-person-singular":"laudă","imperative-plural-second-person":"lăudați","imperative-negative-second-person-singular":"nu lăuda","imperative-negative-plural-second-person":"nu lăudați","alternative":"lăbda"}},{"word":"lăudabil","pos":"adj","definitions":["commendable"],"forms":{"feminine-singular":"lăudabilă","masculine-plural":"lăudabili","feminine-neuter-plural":"lăudabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăudabil","error-unrecognized-form-feminine-indefinite-singular":"lăudabilă","error-unrecognized-form-indefinite-masculine-plural":"lăudabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăudabile","definite-error-unrecognized-form-masculine-neuter-singular":"lăudabilul","definite-error-unrecognized-form-feminine-singular":"lăudabila","definite-error-unrecognized-form-masculine-plural":"lăudabilii","definite-error-unrecognized-form-feminine-neuter-plural":"lăudabilele"}},{"word":"lăudăcios","pos":"adj","definitions":["synonym of lăudăros (“boastful”)"],"forms":{"feminine-singular":"lăudăcioasă","masculine-plural":"lăudăcioși","feminine-neuter-plural":"lăudăcioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăudăcios","error-unrecognized-form-feminine-indefinite-singular":"lăudăcioasă","error-unrecognized-form-indefinite-masculine-plural":"lăudăcioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăudăcioase","definite-error-unrecognized-form-masculine-neuter-singular":"lăudăciosul","definite-error-unrecognized-form-feminine-singular":"lăudăcioasa","definite-error-unrecognized-form-masculine-plural":"lăudăcioșii","definite-error-unrecognized-form-feminine-neuter-plural":"lăudăcioasele"}},{"word":"laudanum","pos":"noun","definitions":["laudanum"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"laudanum","accusative-definite-nominative":"laudanumul","dative-genitive-indefinite":"laudanum","dative-definite-genitive":"laudanumului","vocative":"laudanumule"}},{"word":"lăudare","pos":"noun","definitions":["boasting"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"lăudare","accusative-definite-nominative":"lăudarea","dative-genitive-indefinite":"lăudare","dative-definite-genitive":"lăudarei","vocative":"lăudare"}},{"word":"lăudărie","pos":"noun","definitions":["swagger"],"forms":{"plural":"lăudării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lăudărie","accusative-definite-nominative-singular":"lăudăria","accusative-indefinite-nominative-plural":"lăudării","accusative-definite-nominative-plural":"lăudăriile","dative-genitive-indefinite-singular":"lăudării","dative-definite-genitive-singular":"lăudăriei","dative-genitive-indefinite-plural":"lăudării","dative-definite-genitive-plural":"lăudăriilor","singular-vocative":"lăudărie","plural-vocative":"lăudăriilor"}},{"word":"laudaros","pos":"adj","definitions":["obsolete form of lăudăros"],"forms":{"feminine-singular":"laudaroasă","masculine-plural":"laudaroși","feminine-neuter-plural":"laudaroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"laudaros","error-unrecognized-form-feminine-indefinite-singular":"laudaroasă","error-unrecognized-form-indefinite-masculine-plural":"laudaroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"laudaroase","definite-error-unrecognized-form-masculine-neuter-singular":"laudarosul","definite-error-unrecognized-form-feminine-singular":"laudaroasa","definite-error-unrecognized-form-masculine-plural":"laudaroșii","definite-error-unrecognized-form-feminine-neuter-plural":"laudaroasele"}},{"word":"lăudăros","pos":"adj","definitions":["boastful"],"pronunciation":"/lə.u.dəˈros/","forms":{"feminine-singular":"lăudăroasă","masculine-plural":"lăudăroși","feminine-neuter-plural":"lăudăroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăudăros","error-unrecognized-form-feminine-indefinite-singular":"lăudăroasă","error-unrecognized-form-indefinite-masculine-plural":"lăudăroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăudăroase","definite-error-unrecognized-form-masculine-neuter-singular":"lăudărosul","definite-error-unrecognized-form-feminine-singular":"lăudăroasa","definite-error-unrecognized-form-masculine-plural":"lăudăroșii","definite-error-unrecognized-form-feminine-neuter-plural":"lăudăroasele"}},{"word":"lăudăroșenie","pos":"noun","definitions":["fanfaronade, boastfulness"],"pronunciation":"/lə.u.də.roˈʃe.ni.e/","forms":{"plural":"lăudăroșenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lăudăroșenie","accusative-definite-nominative-singular":"lăudăroșenia","accusative-indefinite-nominative-plural":"lăudăroșenii","accusative-definite-nominative-plural":"lăudăroșeniile","dative-genitive-indefinite-singular":"lăudăroșenii","dative-definite-genitive-singular":"lăudăroșeniei","dative-genitive-indefinite-plural":"lăudăroșenii","dative-definite-genitive-plural":"lăudăroșeniilor","singular-vocative":"lăudăroșenie","plural-vocative":"lăudăroșeniilor"}},{"word":"lăudăroșie","pos":"noun","definitions":["boastfulness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"lăudăroșie","accusative-definite-nominative":"lăudăroșia","dative-genitive-indefinite":"lăudăroșii","dative-definite-genitive":"lăudăroșiei","vocative":"lăudăroșie"}},{"word":"Lăudat","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lăudat"}},{"word":"lăudat","pos":"adj","definitions":["praised"],"forms":{"feminine-singular":"lăudată","masculine-plural":"lăudați","feminine-neuter-plural":"lăudate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăudat","error-unrecognized-form-feminine-indefinite-singular":"lăudată","error-unrecognized-form-indefinite-masculine-plural":"lăudați","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăudate","definite-error-unrecognized-form-masculine-neuter-singular":"lăudatul","definite-error-unrecognized-form-feminine-singular":"lăudata","definite-error-unrecognized-form-masculine-plural":"lăudații","definite-error-unrecognized-form-feminine-neuter-plural":"lăudatele"}},{"word":"laudatio","pos":"noun","definitions":["commendation, praise"]},{"word":"laudativ","pos":"adj","definitions":["complimentary"],"forms":{"feminine-singular":"laudativă","masculine-plural":"laudativi","feminine-neuter-plural":"laudative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"laudativ","error-unrecognized-form-feminine-indefinite-singular":"laudativă","error-unrecognized-form-indefinite-masculine-plural":"laudativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"laudative","definite-error-unrecognized-form-masculine-neuter-singular":"laudativul","definite-error-unrecognized-form-feminine-singular":"laudativa","definite-error-unrecognized-form-masculine-plural":"laudativii","definite-error-unrecognized-form-feminine-neuter-plural":"laudativele"}},{"word":"lăudatnic","pos":"adj","definitions":["laudatory"],"pronunciation":"/lə.uˈdat.nik/","forms":{"feminine-singular":"lăudatnică","masculine-plural":"lăudatnici","feminine-neuter-plural":"lăudatnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăudatnic","error-unrecognized-form-feminine-indefinite-singular":"lăudatnică","error-unrecognized-form-indefinite-masculine-plural":"lăudatnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăudatnice","definite-error-unrecognized-form-masculine-neuter-singular":"lăudatnicul","definite-error-unrecognized-form-feminine-singular":"lăudatnica","definite-error-unrecognized-form-masculine-plural":"lăudatnicii","definite-error-unrecognized-form-feminine-neuter-plural":"lăudatnicele"}},{"word":"lăudătoare","pos":"noun","definitions":["female equivalent of lăudător"],"forms":{"plural":"lăudătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"lăudătoare","accusative-definite-nominative-singular":"lăudătoarea","accusative-indefinite-nominative-plural":"lăudătoare","accusative-definite-nominative-plural":"lăudătoarele","dative-genitive-indefinite-singular":"lăudătoare","dative-definite-genitive-singular":"lăudătoarei","dative-genitive-indefinite-plural":"lăudătoare","dative-definite-genitive-plural":"lăudătoarelor","singular-vocative":"lăudătoare","plural-vocative":"lăudătoarelor"}},{"word":"lăudător","pos":"noun","definitions":["praiser, lauder"],"pronunciation":"/ˌlə.u.dəˈtor/","forms":{"plural":"lăudători","feminine":"equivalent lăudătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lăudător","accusative-definite-nominative-singular":"lăudătorul","accusative-indefinite-nominative-plural":"lăudători","accusative-definite-nominative-plural":"lăudătorii","dative-genitive-indefinite-singular":"lăudător","dative-definite-genitive-singular":"lăudătorului","dative-genitive-indefinite-plural":"lăudători","dative-definite-genitive-plural":"lăudătorilor","singular-vocative":"lăudătorule","plural-vocative":"lăudătorilor"}},{"word":"lăudător","pos":"adj","definitions":["laudatory, eulogistic"],"pronunciation":"/ˌlə.u.dəˈtor/","forms":{"feminine-singular":"lăudătoare","masculine-plural":"lăudători","feminine-neuter-plural":"lăudătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăudător","error-unrecognized-form-feminine-indefinite-singular":"lăudătoare","error-unrecognized-form-indefinite-masculine-plural":"lăudători","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăudătoare","definite-error-unrecognized-form-masculine-neuter-singular":"lăudătorul","definite-error-unrecognized-form-feminine-singular":"lăudătoarea","definite-error-unrecognized-form-masculine-plural":"lăudătorii","definite-error-unrecognized-form-feminine-neuter-plural":"lăudătoarele"}},{"word":"Lăudatu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lăudatu"}},{"word":"lăudătură","pos":"noun","definitions":["praise"],"forms":{"plural":"lăudături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lăudătură","accusative-definite-nominative-singular":"lăudătura","accusative-indefinite-nominative-plural":"lăudături","accusative-definite-nominative-plural":"lăudăturile","dative-genitive-indefinite-singular":"lăudături","dative-definite-genitive-singular":"lăudăturii","dative-genitive-indefinite-plural":"lăudături","dative-definite-genitive-plural":"lăudăturilor","singular-vocative":"lăudătură","plural-vocative":"lăudăturilor"}},{"word":"laude","pos":"verb","definitions":["third-person singular/plural present subjunctive of lăuda"],"pronunciation":"[ˈla.ude]"},{"word":"lăudos","pos":"adj","definitions":["laudatory"],"forms":{"feminine-singular":"lăudoasă","masculine-plural":"lăudoși","feminine-neuter-plural":"lăudoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăudos","error-unrecognized-form-feminine-indefinite-singular":"lăudoasă","error-unrecognized-form-indefinite-masculine-plural":"lăudoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăudoase","definite-error-unrecognized-form-masculine-neuter-singular":"lăudosul","definite-error-unrecognized-form-feminine-singular":"lăudoasa","definite-error-unrecognized-form-masculine-plural":"lăudoșii","definite-error-unrecognized-form-feminine-neuter-plural":"lăudoasele"}},{"word":"lăuduros","pos":"adj","definitions":["obsolete form of lăudăros"],"forms":{"feminine-singular":"lăuduroasă","masculine-plural":"lăuduroși","feminine-neuter-plural":"lăuduroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăuduros","error-unrecognized-form-feminine-indefinite-singular":"lăuduroasă","error-unrecognized-form-indefinite-masculine-plural":"lăuduroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăuduroase","definite-error-unrecognized-form-masculine-neuter-singular":"lăudurosul","definite-error-unrecognized-form-feminine-singular":"lăuduroasa","definite-error-unrecognized-form-masculine-plural":"lăuduroșii","definite-error-unrecognized-form-feminine-neuter-plural":"lăuduroasele"}},{"word":"lăun","pos":"noun","definitions":["whorled water-milfoil (Myriophyllum verticillatum)"],"forms":{"plural":"lăuni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lăun","accusative-definite-nominative-singular":"lăunul","accusative-indefinite-nominative-plural":"lăuni","accusative-definite-nominative-plural":"lăunii","dative-genitive-indefinite-singular":"lăun","dative-definite-genitive-singular":"lăunului","dative-genitive-indefinite-plural":"lăuni","dative-definite-genitive-plural":"lăunilor","singular-vocative":"lăunule","plural-vocative":"lăunilor"}},{"word":"Lăunele","pos":"name","definitions":["a village in Sâmburești, Olt County, Romania"],"gender":"m"},{"word":"Lăunele de Jos","pos":"name","definitions":["a village in Dănicei, Vâlcea County, Romania"],"gender":"m"},{"word":"Lăunele de Sus","pos":"name","definitions":["a village in Cuca, Argeș County, Romania"],"gender":"m"},{"word":"lăuntric","pos":"adj","definitions":["inner"],"forms":{"feminine-singular":"lăuntrică","masculine-plural":"lăuntrici","feminine-neuter-plural":"lăuntrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăuntric","error-unrecognized-form-feminine-indefinite-singular":"lăuntrică","error-unrecognized-form-indefinite-masculine-plural":"lăuntrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăuntrice","definite-error-unrecognized-form-masculine-neuter-singular":"lăuntricul","definite-error-unrecognized-form-feminine-singular":"lăuntrica","definite-error-unrecognized-form-masculine-plural":"lăuntricii","definite-error-unrecognized-form-feminine-neuter-plural":"lăuntricele"}},{"word":"laur","pos":"noun","definitions":["laurel (evergreen shrub, of the genus Laurus)","jimsonweed, thorn apple (Datura stramonium)"],"forms":{"plural":"lauri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"laur","accusative-definite-nominative-singular":"laurul","accusative-indefinite-nominative-plural":"lauri","accusative-definite-nominative-plural":"laurii","dative-genitive-indefinite-singular":"laur","dative-definite-genitive-singular":"laurului","dative-genitive-indefinite-plural":"lauri","dative-definite-genitive-plural":"laurilor","singular-vocative":"laurule","plural-vocative":"laurilor"}},{"word":"laur englezesc","pos":"noun","definitions":["cherry laurel"],"forms":{"plural":"lauri englezești"}},{"word":"lauracee","pos":"noun","definitions":["Lauraceae"],"forms":{"plural":"lauracee","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"lauracee","accusative-definite-nominative-singular":"lauraceea","accusative-indefinite-nominative-plural":"lauracee","accusative-definite-nominative-plural":"lauraceele","dative-genitive-indefinite-singular":"lauracee","dative-definite-genitive-singular":"lauraceei","dative-genitive-indefinite-plural":"lauracee","dative-definite-genitive-plural":"lauraceelor","singular-vocative":"lauracee","plural-vocative":"lauraceelor"}},{"word":"laureat","pos":"noun","definitions":["laureate"],"forms":{"plural":"laureați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"laureat","accusative-definite-nominative-singular":"laureatul","accusative-indefinite-nominative-plural":"laureați","accusative-definite-nominative-plural":"laureații","dative-genitive-indefinite-singular":"laureat","dative-definite-genitive-singular":"laureatului","dative-genitive-indefinite-plural":"laureați","dative-definite-genitive-plural":"laureaților","singular-vocative":"laureatule","plural-vocative":"laureaților"}},{"word":"laureată","pos":"noun","definitions":["female equivalent of laureat"],"forms":{"plural":"laureate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"laureată","accusative-definite-nominative-singular":"laureata","accusative-indefinite-nominative-plural":"laureate","accusative-definite-nominative-plural":"laureatele","dative-genitive-indefinite-singular":"laureate","dative-definite-genitive-singular":"laureatei","dative-genitive-indefinite-plural":"laureate","dative-definite-genitive-plural":"laureatelor","singular-vocative":"laureată","plural-vocative":"laureatelor"}},{"word":"Lăureni","pos":"name","definitions":["a locality in Miercurea Nirajului, Mureș County, Romania"],"gender":"m"},{"word":"Laurențiu","pos":"name","definitions":["a male given name from Latin","a surname from Latin"],"gender":"m","forms":{"dative-genitive":"lui Laurențiu"}},{"word":"laurușcă","pos":"noun","definitions":["alternative form of lăuruscă"],"forms":{"plural":"lauruște","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"laurușcă","accusative-definite-nominative-singular":"laurușca","accusative-indefinite-nominative-plural":"lauruște","accusative-definite-nominative-plural":"lauruștele","dative-genitive-indefinite-singular":"lauruște","dative-definite-genitive-singular":"lauruștei","dative-genitive-indefinite-plural":"lauruște","dative-definite-genitive-plural":"lauruștelor","singular-vocative":"laurușcă","plural-vocative":"lauruștelor"}},{"word":"lăuruscă","pos":"noun","definitions":["wild vine (Vitis silvestris)"],"forms":{"plural":"lăuruște"}},{"word":"lăut","pos":"noun","definitions":["wash"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lăut","accusative-definite-nominative":"lăutul","dative-genitive-indefinite":"lăut","dative-definite-genitive":"lăutului","vocative":"lăutule"}},{"word":"lăut","pos":"verb","definitions":["past participle of la"],"forms":{"participle-past":"of la"}},{"word":"lăută","pos":"noun","definitions":["lute"],"forms":{"plural":"lăute","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lăută","accusative-definite-nominative-singular":"lăuta","accusative-indefinite-nominative-plural":"lăute","accusative-definite-nominative-plural":"lăutele","dative-genitive-indefinite-singular":"lăute","dative-definite-genitive-singular":"lăutei","dative-genitive-indefinite-plural":"lăute","dative-definite-genitive-plural":"lăutelor","singular-vocative":"lăută","plural-vocative":"lăutelor","alternative":"alăută"}},{"word":"lăutar","pos":"noun","definitions":["fiddler, musician","manele singer"],"pronunciation":"/lə.uˈtar/","forms":{"plural":"lăutari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lăutar","accusative-definite-nominative-singular":"lăutarul","accusative-indefinite-nominative-plural":"lăutari","accusative-definite-nominative-plural":"lăutarii","dative-genitive-indefinite-singular":"lăutar","dative-definite-genitive-singular":"lăutarului","dative-genitive-indefinite-plural":"lăutari","dative-definite-genitive-plural":"lăutarilor","singular-vocative":"lăutarule","plural-vocative":"lăutarilor"}},{"word":"lăutăraș","pos":"noun","definitions":["diminutive of lăutar"],"forms":{"plural":"lăutărași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lăutăraș","accusative-definite-nominative-singular":"lăutărașul","accusative-indefinite-nominative-plural":"lăutărași","accusative-definite-nominative-plural":"lăutărașii","dative-genitive-indefinite-singular":"lăutăraș","dative-definite-genitive-singular":"lăutărașului","dative-genitive-indefinite-plural":"lăutărași","dative-definite-genitive-plural":"lăutărașilor","singular-vocative":"lăutărașule","plural-vocative":"lăutărașilor"}},{"word":"lăutăreasă","pos":"noun","definitions":["female equivalent of lăutar"],"forms":{"plural":"lăutărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lăutăreasă","accusative-definite-nominative-singular":"lăutăreasa","accusative-indefinite-nominative-plural":"lăutărese","accusative-definite-nominative-plural":"lăutăresele","dative-genitive-indefinite-singular":"lăutărese","dative-definite-genitive-singular":"lăutăresei","dative-genitive-indefinite-plural":"lăutărese","dative-definite-genitive-plural":"lăutăreselor","singular-vocative":"lăutăreasă","plural-vocative":"lăutăreselor"}},{"word":"lăutărel","pos":"noun","definitions":["diminutive of lăutar"],"forms":{"plural":"lăutărei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lăutărel","accusative-definite-nominative-singular":"lăutărelul","accusative-indefinite-nominative-plural":"lăutărei","accusative-definite-nominative-plural":"lăutăreii","dative-genitive-indefinite-singular":"lăutărel","dative-definite-genitive-singular":"lăutărelului","dative-genitive-indefinite-plural":"lăutărei","dative-definite-genitive-plural":"lăutăreilor","singular-vocative":"lăutărelule","plural-vocative":"lăutăreilor"}},{"word":"lăutăresc","pos":"adj","definitions":["fiddler"],"forms":{"feminine-singular":"lăutărească","plural":"lăutărești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăutăresc","error-unrecognized-form-feminine-indefinite-singular":"lăutărească","error-unrecognized-form-indefinite-masculine-plural":"lăutărești","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăutărești","definite-error-unrecognized-form-masculine-neuter-singular":"lăutărescul","definite-error-unrecognized-form-feminine-singular":"lăutăreasca","definite-error-unrecognized-form-masculine-plural":"lăutăreștii","definite-error-unrecognized-form-feminine-neuter-plural":"lăutăreștile"}},{"word":"lăutărește","pos":"adv","definitions":["like a fiddler"]},{"word":"lăutari","pos":"noun","definitions":["plural of lăutar"],"gender":"m"},{"word":"lăutăriță","pos":"noun","definitions":["diminutive of lăutar"],"forms":{"plural":"lăutărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lăutăriță","accusative-definite-nominative-singular":"lăutărița","accusative-indefinite-nominative-plural":"lăutărițe","accusative-definite-nominative-plural":"lăutărițele","dative-genitive-indefinite-singular":"lăutărițe","dative-definite-genitive-singular":"lăutăriței","dative-genitive-indefinite-plural":"lăutărițe","dative-definite-genitive-plural":"lăutărițelor","singular-vocative":"lăutăriță","plural-vocative":"lăutărițelor"}},{"word":"Lăutaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Lăutaru"}},{"word":"lăutaș","pos":"noun","definitions":["fiddler"],"forms":{"plural":"lăutași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lăutaș","accusative-definite-nominative-singular":"lăutașul","accusative-indefinite-nominative-plural":"lăutași","accusative-definite-nominative-plural":"lăutașii","dative-genitive-indefinite-singular":"lăutaș","dative-definite-genitive-singular":"lăutașului","dative-genitive-indefinite-plural":"lăutași","dative-definite-genitive-plural":"lăutașilor","singular-vocative":"lăutașule","plural-vocative":"lăutașilor"}},{"word":"lăutoare","pos":"noun","definitions":["washwater"],"forms":{"plural":"lăutori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lăutoare","accusative-definite-nominative-singular":"lăutoarea","accusative-indefinite-nominative-plural":"lăutori","accusative-definite-nominative-plural":"lăutorile","dative-genitive-indefinite-singular":"lăutori","dative-definite-genitive-singular":"lăutorii","dative-genitive-indefinite-plural":"lăutori","dative-definite-genitive-plural":"lăutorilor","singular-vocative":"lăutoare","plural-vocative":"lăutorilor"}},{"word":"lăutură","pos":"noun","definitions":["wash"],"forms":{"plural":"lăuturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lăutură","accusative-definite-nominative-singular":"lăutura","accusative-indefinite-nominative-plural":"lăuturi","accusative-definite-nominative-plural":"lăuturile","dative-genitive-indefinite-singular":"lăuturi","dative-definite-genitive-singular":"lăuturii","dative-genitive-indefinite-plural":"lăuturi","dative-definite-genitive-plural":"lăuturilor","singular-vocative":"lăutură","plural-vocative":"lăuturilor"}},{"word":"lăuză","pos":"noun","definitions":["postpartum woman"],"forms":{"plural":"lăuze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lăuză","accusative-definite-nominative-singular":"lăuza","accusative-indefinite-nominative-plural":"lăuze","accusative-definite-nominative-plural":"lăuzele","dative-genitive-indefinite-singular":"lăuze","dative-definite-genitive-singular":"lăuzei","dative-genitive-indefinite-plural":"lăuze","dative-definite-genitive-plural":"lăuzelor","singular-vocative":"lăuză","plural-vocative":"lăuzelor"}},{"word":"lăuzi","pos":"verb","definitions":["to be postpartum"],"forms":{"canonical":"a lăuzi 4th conjugation","present-singular-third-person":"lăuzește","participle-past":"lăuzit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lăuzi","gerund":"lăuzind","first-person-indicative-present-singular":"lăuzesc","indicative-present-second-person-singular":"lăuzești","indicative-present-singular-third-person":"lăuzește","first-person-indicative-plural-present":"lăuzim","indicative-plural-present-second-person":"lăuziți","indicative-plural-present-third-person":"lăuzesc","first-person-imperfect-indicative-singular":"lăuzeam","imperfect-indicative-second-person-singular":"lăuzeai","imperfect-indicative-singular-third-person":"lăuzea","first-person-imperfect-indicative-plural":"lăuzeam","imperfect-indicative-plural-second-person":"lăuzeați","imperfect-indicative-plural-third-person":"lăuzeau","first-person-indicative-perfect-singular":"lăuzii","indicative-perfect-second-person-singular":"lăuziși","indicative-perfect-singular-third-person":"lăuzi","first-person-indicative-perfect-plural":"lăuzirăm","indicative-perfect-plural-second-person":"lăuzirăți","indicative-perfect-plural-third-person":"lăuziră","first-person-indicative-pluperfect-singular":"lăuzisem","indicative-pluperfect-second-person-singular":"lăuziseși","indicative-pluperfect-singular-third-person":"lăuzise","first-person-indicative-pluperfect-plural":"lăuziserăm","indicative-pluperfect-plural-second-person":"lăuziserăți","indicative-pluperfect-plural-third-person":"lăuziseră","first-person-present-singular-subjunctive":"să lăuzesc","present-second-person-singular-subjunctive":"să lăuzești","present-singular-subjunctive-third-person":"să lăuzească","first-person-plural-present-subjunctive":"să lăuzim","plural-present-second-person-subjunctive":"să lăuziți","plural-present-subjunctive-third-person":"să lăuzească","imperative-second-person-singular":"lăuzește","imperative-plural-second-person":"lăuziți","imperative-negative-second-person-singular":"nu lăuzi","imperative-negative-plural-second-person":"nu lăuziți"}},{"word":"lăuzie","pos":"noun","definitions":["postpartum"],"forms":{"plural":"lăuzii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lăuzie","accusative-definite-nominative-singular":"lăuzia","accusative-indefinite-nominative-plural":"lăuzii","accusative-definite-nominative-plural":"lăuziile","dative-genitive-indefinite-singular":"lăuzii","dative-definite-genitive-singular":"lăuziei","dative-genitive-indefinite-plural":"lăuzii","dative-definite-genitive-plural":"lăuziilor","singular-vocative":"lăuzie","plural-vocative":"lăuziilor"}},{"word":"lăuzit","pos":"adj","definitions":["disoriented, confused, bewildered"],"forms":{"feminine-singular":"lăuzită","masculine-plural":"lăuziți","feminine-neuter-plural":"lăuzite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lăuzit","error-unrecognized-form-feminine-indefinite-singular":"lăuzită","error-unrecognized-form-indefinite-masculine-plural":"lăuziți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lăuzite","definite-error-unrecognized-form-masculine-neuter-singular":"lăuzitul","definite-error-unrecognized-form-feminine-singular":"lăuzita","definite-error-unrecognized-form-masculine-plural":"lăuziții","definite-error-unrecognized-form-feminine-neuter-plural":"lăuzitele"}},{"word":"lăuzit","pos":"verb","definitions":["past participle of lăuzi"],"forms":{"participle-past":"of lăuzi"}},{"word":"lava","pos":"noun","definitions":["definite nominative/accusative singular of lavă"],"pronunciation":"[ˈlava]","gender":"f"},{"word":"lavă","pos":"noun","definitions":["lava"],"forms":{"plural":"lave","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lavă","accusative-definite-nominative-singular":"lava","accusative-indefinite-nominative-plural":"lave","accusative-definite-nominative-plural":"lavele","dative-genitive-indefinite-singular":"lave","dative-definite-genitive-singular":"lavei","dative-genitive-indefinite-plural":"lave","dative-definite-genitive-plural":"lavelor","singular-vocative":"lavă","plural-vocative":"lavelor"}},{"word":"lavabil","pos":"adj","definitions":["washable"],"forms":{"feminine-singular":"lavabilă","masculine-plural":"lavabili","feminine-neuter-plural":"lavabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lavabil","error-unrecognized-form-feminine-indefinite-singular":"lavabilă","error-unrecognized-form-indefinite-masculine-plural":"lavabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"lavabile","definite-error-unrecognized-form-masculine-neuter-singular":"lavabilul","definite-error-unrecognized-form-feminine-singular":"lavabila","definite-error-unrecognized-form-masculine-plural":"lavabilii","definite-error-unrecognized-form-feminine-neuter-plural":"lavabilele"}},{"word":"lavabilitate","pos":"noun","definitions":["washability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lavabilitate","accusative-definite-nominative-singular":"lavabilitatea","accusative-indefinite-nominative-plural":"lavabilități","accusative-definite-nominative-plural":"lavabilitățile","dative-genitive-indefinite-singular":"lavabilități","dative-definite-genitive-singular":"lavabilității","dative-genitive-indefinite-plural":"lavabilități","dative-definite-genitive-plural":"lavabilităților","singular-vocative":"lavabilitate","plural-vocative":"lavabilităților"}},{"word":"lavabou","pos":"noun","definitions":["lavatory"],"forms":{"plural":"lavabouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lavabou","accusative-definite-nominative-singular":"lavaboul","accusative-indefinite-nominative-plural":"lavabouri","accusative-definite-nominative-plural":"lavabourile","dative-genitive-indefinite-singular":"lavabou","dative-definite-genitive-singular":"lavaboului","dative-genitive-indefinite-plural":"lavabouri","dative-definite-genitive-plural":"lavabourilor","singular-vocative":"lavaboule","plural-vocative":"lavabourilor"}},{"word":"lavaj","pos":"noun","definitions":["lavage"],"forms":{"plural":"lavajuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lavaj","accusative-definite-nominative-singular":"lavajul","accusative-indefinite-nominative-plural":"lavaje","accusative-definite-nominative-plural":"lavajele","dative-genitive-indefinite-singular":"lavaj","dative-definite-genitive-singular":"lavajului","dative-genitive-indefinite-plural":"lavaje","dative-definite-genitive-plural":"lavajelor","singular-vocative":"lavajule","plural-vocative":"lavajelor"}},{"word":"lavalieră","pos":"noun","definitions":["a type of necktie"],"forms":{"plural":"lavaliere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lavalieră","accusative-definite-nominative-singular":"lavaliera","accusative-indefinite-nominative-plural":"lavaliere","accusative-definite-nominative-plural":"lavalierele","dative-genitive-indefinite-singular":"lavaliere","dative-definite-genitive-singular":"lavalierei","dative-genitive-indefinite-plural":"lavaliere","dative-definite-genitive-plural":"lavalierelor","singular-vocative":"lavalieră","plural-vocative":"lavalierelor"}},{"word":"lavanda","pos":"noun","definitions":["definite nominative/accusative singular of lavandă"],"pronunciation":"[laˈvanda]","gender":"f"},{"word":"lavandă","pos":"noun","definitions":["lavender (plant)"],"pronunciation":"/laˈvandə/","forms":{"plural":"lavande","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lavandă","accusative-definite-nominative-singular":"lavanda","accusative-indefinite-nominative-plural":"lavande","accusative-definite-nominative-plural":"lavandele","dative-genitive-indefinite-singular":"lavande","dative-definite-genitive-singular":"lavandei","dative-genitive-indefinite-plural":"lavande","dative-definite-genitive-plural":"lavandelor","singular-vocative":"lavandă","plural-vocative":"lavandelor"}},{"word":"lavande","pos":"noun","definitions":["plural of lavandă"]},{"word":"lavando","pos":"noun","definitions":["vocative singular of lavandă"],"pronunciation":"[laˈvando]","gender":"f"},{"word":"lavator","pos":"noun","definitions":["washbasin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lavator","accusative-definite-nominative":"lavatorul","dative-genitive-indefinite":"lavator","dative-definite-genitive":"lavatorului","vocative":"lavatorule"}},{"word":"lave","pos":"noun","definitions":["inflection of lavă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈlave]","gender":"f"},{"word":"lavei","pos":"noun","definitions":["definite genitive/dative singular of lavă"],"pronunciation":"[ˈlavej]","gender":"f"},{"word":"lavement","pos":"noun","definitions":["enema"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lavement","accusative-definite-nominative":"lavementul","dative-genitive-indefinite":"lavement","dative-definite-genitive":"lavementului","vocative":"lavementule"}},{"word":"lavetă","pos":"noun","definitions":["dishcloth"],"forms":{"plural":"lavete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lavetă","accusative-definite-nominative-singular":"laveta","accusative-indefinite-nominative-plural":"lavete","accusative-definite-nominative-plural":"lavetele","dative-genitive-indefinite-singular":"lavete","dative-definite-genitive-singular":"lavetei","dative-genitive-indefinite-plural":"lavete","dative-definite-genitive-plural":"lavetelor","singular-vocative":"lavetă","plural-vocative":"lavetelor"}},{"word":"lăvicer","pos":"noun","definitions":["alternative form of lăicer"],"forms":{"plural":"lăvicere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lăvicer","accusative-definite-nominative-singular":"lăvicerul","accusative-indefinite-nominative-plural":"lăvicere","accusative-definite-nominative-plural":"lăvicerele","dative-genitive-indefinite-singular":"lăvicer","dative-definite-genitive-singular":"lăvicerului","dative-genitive-indefinite-plural":"lăvicere","dative-definite-genitive-plural":"lăvicerelor","singular-vocative":"lăvicerule","plural-vocative":"lăvicerelor"}},{"word":"lăvicioară","pos":"noun","definitions":["diminutive of laviță"],"forms":{"plural":"lăvicioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lăvicioară","accusative-definite-nominative-singular":"lăvicioara","accusative-indefinite-nominative-plural":"lăvicioare","accusative-definite-nominative-plural":"lăvicioarele","dative-genitive-indefinite-singular":"lăvicioare","dative-definite-genitive-singular":"lăvicioarei","dative-genitive-indefinite-plural":"lăvicioare","dative-definite-genitive-plural":"lăvicioarelor","singular-vocative":"lăvicioară","plural-vocative":"lăvicioarelor"}},{"word":"lavina","pos":"noun","definitions":["definite nominative/accusative singular of lavină"],"pronunciation":"[laˈvina]","gender":"f"},{"word":"lavină","pos":"noun","definitions":["avalanche"],"forms":{"plural":"lavine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lavină","accusative-definite-nominative-singular":"lavina","accusative-indefinite-nominative-plural":"lavine","accusative-definite-nominative-plural":"lavinele","dative-genitive-indefinite-singular":"lavine","dative-definite-genitive-singular":"lavinei","dative-genitive-indefinite-plural":"lavine","dative-definite-genitive-plural":"lavinelor","singular-vocative":"lavină","plural-vocative":"lavinelor"}},{"word":"lavine","pos":"noun","definitions":["inflection of lavină:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[laˈvine]","gender":"f"},{"word":"lavino","pos":"noun","definitions":["vocative singular of lavină"],"pronunciation":"[laˈvino]","gender":"f"},{"word":"laviță","pos":"noun","definitions":["bench"],"forms":{"plural":"lavițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"laviță","accusative-definite-nominative-singular":"lavița","accusative-indefinite-nominative-plural":"lavițe","accusative-definite-nominative-plural":"lavițele","dative-genitive-indefinite-singular":"lavițe","dative-definite-genitive-singular":"laviței","dative-genitive-indefinite-plural":"lavițe","dative-definite-genitive-plural":"lavițelor","singular-vocative":"laviță","plural-vocative":"lavițelor"}},{"word":"lavo","pos":"noun","definitions":["vocative singular of lavă"],"pronunciation":"[ˈlavo]","gender":"f"},{"word":"lavoar","pos":"noun","definitions":["washbasin"],"forms":{"plural":"lavoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lavoar","accusative-definite-nominative-singular":"lavoarul","accusative-indefinite-nominative-plural":"lavoare","accusative-definite-nominative-plural":"lavoarele","dative-genitive-indefinite-singular":"lavoar","dative-definite-genitive-singular":"lavoarului","dative-genitive-indefinite-plural":"lavoare","dative-definite-genitive-plural":"lavoarelor","singular-vocative":"lavoarule","plural-vocative":"lavoarelor"}},{"word":"lavra","pos":"noun","definitions":["definite nominative/accusative singular of lavră"],"pronunciation":"[ˈlavra]","gender":"f"},{"word":"lavră","pos":"noun","definitions":["monastery"],"forms":{"plural":"lavre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lavră","accusative-definite-nominative-singular":"lavra","accusative-indefinite-nominative-plural":"lavre","accusative-definite-nominative-plural":"lavrele","dative-genitive-indefinite-singular":"lavre","dative-definite-genitive-singular":"lavrei","dative-genitive-indefinite-plural":"lavre","dative-definite-genitive-plural":"lavrelor","singular-vocative":"lavră","plural-vocative":"lavrelor"}},{"word":"lavrac","pos":"noun","definitions":["European seabass (Dicentrarchus labrax)"],"forms":{"plural":"lavraci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lavrac","accusative-definite-nominative-singular":"lavracul","accusative-indefinite-nominative-plural":"lavraci","accusative-definite-nominative-plural":"lavracii","dative-genitive-indefinite-singular":"lavrac","dative-definite-genitive-singular":"lavracului","dative-genitive-indefinite-plural":"lavraci","dative-definite-genitive-plural":"lavracilor","singular-vocative":"lavracule","plural-vocative":"lavracilor"}},{"word":"lavre","pos":"noun","definitions":["inflection of lavră:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈlavre]","gender":"f"},{"word":"lavrei","pos":"noun","definitions":["definite genitive/dative singular of lavră"],"pronunciation":"[ˈlavrej]","gender":"f"},{"word":"lavrentină","pos":"noun","definitions":["common bugle (Ajuga reptans)"],"forms":{"plural":"lavrentine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lavrentină","accusative-definite-nominative-singular":"lavrentina","accusative-indefinite-nominative-plural":"lavrentine","accusative-definite-nominative-plural":"lavrentinele","dative-genitive-indefinite-singular":"lavrentine","dative-definite-genitive-singular":"lavrentinei","dative-genitive-indefinite-plural":"lavrentine","dative-definite-genitive-plural":"lavrentinelor","singular-vocative":"lavrentină","plural-vocative":"lavrentinelor"}},{"word":"Lavrinencu","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Lavrinencu"}},{"word":"Lavrinescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lavrinescu"}},{"word":"lavriot","pos":"noun","definitions":["a monk living in a laura"],"forms":{"plural":"lavrioți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lavriot","accusative-definite-nominative-singular":"lavriotul","accusative-indefinite-nominative-plural":"lavrioți","accusative-definite-nominative-plural":"lavrioții","dative-genitive-indefinite-singular":"lavriot","dative-definite-genitive-singular":"lavriotului","dative-genitive-indefinite-plural":"lavrioți","dative-definite-genitive-plural":"lavrioților","singular-vocative":"lavriotule","plural-vocative":"lavrioților"}},{"word":"lavro","pos":"noun","definitions":["vocative singular of lavră"],"pronunciation":"[ˈlavro]","gender":"f"},{"word":"lawrențiu","pos":"noun","definitions":["lawrencium"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lawrențiu","accusative-definite-nominative":"lawrențiul","dative-genitive-indefinite":"lawrențiu","dative-definite-genitive":"lawrențiului","vocative":"lawrențiule"}},{"word":"lax","pos":"adj","definitions":["lax"],"forms":{"feminine-singular":"laxă","masculine-plural":"lacși","feminine-neuter-plural":"laxe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lax","error-unrecognized-form-feminine-indefinite-singular":"laxă","error-unrecognized-form-indefinite-masculine-plural":"lacși","error-unrecognized-form-feminine-indefinite-neuter-plural":"laxe","definite-error-unrecognized-form-masculine-neuter-singular":"laxul","definite-error-unrecognized-form-feminine-singular":"laxa","definite-error-unrecognized-form-masculine-plural":"lacșii","definite-error-unrecognized-form-feminine-neuter-plural":"laxele"}},{"word":"laxativ","pos":"noun","definitions":["laxative"],"forms":{"plural":"laxativi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"laxativ","accusative-definite-nominative-singular":"laxativul","accusative-indefinite-nominative-plural":"laxativi","accusative-definite-nominative-plural":"laxativile","dative-genitive-indefinite-singular":"laxativ","dative-definite-genitive-singular":"laxativului","dative-genitive-indefinite-plural":"laxativi","dative-definite-genitive-plural":"laxativilor","singular-vocative":"laxativule","plural-vocative":"laxativilor"}},{"word":"laxism","pos":"noun","definitions":["laxity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"laxism","accusative-definite-nominative":"laxismul","dative-genitive-indefinite":"laxism","dative-definite-genitive":"laxismului","vocative":"laxismule"}},{"word":"laxist","pos":"noun","definitions":["lax"],"forms":{"plural":"laxiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"laxist","accusative-definite-nominative-singular":"laxistul","accusative-indefinite-nominative-plural":"laxiști","accusative-definite-nominative-plural":"laxiștii","dative-genitive-indefinite-singular":"laxist","dative-definite-genitive-singular":"laxistului","dative-genitive-indefinite-plural":"laxiști","dative-definite-genitive-plural":"laxiștilor","singular-vocative":"laxistule","plural-vocative":"laxiștilor"}},{"word":"laxistă","pos":"noun","definitions":["female equivalent of laxist"],"forms":{"plural":"laxiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"laxistă","accusative-definite-nominative-singular":"laxista","accusative-indefinite-nominative-plural":"laxiste","accusative-definite-nominative-plural":"laxistele","dative-genitive-indefinite-singular":"laxiste","dative-definite-genitive-singular":"laxistei","dative-genitive-indefinite-plural":"laxiste","dative-definite-genitive-plural":"laxistelor","singular-vocative":"laxistă","plural-vocative":"laxistelor"}},{"word":"laxitate","pos":"noun","definitions":["laxity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"laxitate","accusative-definite-nominative":"laxitatea","dative-genitive-indefinite":"laxități","dative-definite-genitive":"laxității","vocative":"laxitate"}},{"word":"layout","pos":"noun","definitions":["layout"],"forms":{"plural":"layouturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"layout","accusative-definite-nominative-singular":"layoutul","accusative-indefinite-nominative-plural":"layouturi","accusative-definite-nominative-plural":"layouturile","dative-genitive-indefinite-singular":"layout","dative-definite-genitive-singular":"layoutului","dative-genitive-indefinite-plural":"layouturi","dative-definite-genitive-plural":"layouturilor","singular-vocative":"layoutule","plural-vocative":"layouturilor"}},{"word":"Laz","pos":"name","definitions":["a village in Săsciori, Alba County, Romania","a village in Vințu de Jos, Alba County, Romania","a village in Dezna, Arad County, Romania"],"gender":"f"},{"word":"laz","pos":"noun","definitions":["recently cleared forest"],"forms":{"plural":"lazuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"laz","accusative-definite-nominative-singular":"lazul","accusative-indefinite-nominative-plural":"lazuri","accusative-definite-nominative-plural":"lazurile","dative-genitive-indefinite-singular":"laz","dative-definite-genitive-singular":"lazului","dative-genitive-indefinite-plural":"lazuri","dative-definite-genitive-plural":"lazurilor","singular-vocative":"lazule","plural-vocative":"lazurilor"}},{"word":"Laz-Firtănuș","pos":"name","definitions":["a village in Avrămești, Harghita County, Romania"],"gender":"m"},{"word":"Laz-Șoimuș","pos":"name","definitions":["a village in Avrămești, Harghita County, Romania"],"gender":"m"},{"word":"Lăzarea","pos":"name","definitions":["a river in Harghita, Romania, tributary to the Mureș","a commune of Harghita County, Romania","a village in Lăzarea, Harghita County, Romania"],"gender":"f"},{"word":"Lăzărean","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lăzărean"}},{"word":"Lăzăreanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lăzăreanu"}},{"word":"Lăzărel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lăzărel"}},{"word":"Lazarencu","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Lazarencu"}},{"word":"Lăzărencu","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Lăzărencu"}},{"word":"Lăzăreni","pos":"name","definitions":["a commune of Bihor County, Romania","a village in Lăzăreni, Bihor County, Romania"],"gender":"m"},{"word":"Lăzărescu","pos":"name","definitions":["a surname"],"forms":{"alternative":"Lazarescu","alternative-French":"Lazaresco"}},{"word":"Lăzărești","pos":"name","definitions":["a village in Moșoaia, Argeș County, Romania","a village in Schitu Golești, Argeș County, Romania","a village in Bumbești-Jiu, Gorj County, Romania","a village in Cozmeni, Harghita County, Romania","a village in Bărăști, Olt County, Romania"],"gender":"m"},{"word":"Lazaret","pos":"name","definitions":["a village in Boița, Sibiu County, Romania"],"gender":"m"},{"word":"lazaret","pos":"noun","definitions":["lazaret"],"forms":{"plural":"lazarete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lazaret","accusative-definite-nominative-singular":"lazaretul","accusative-indefinite-nominative-plural":"lazarete","accusative-definite-nominative-plural":"lazaretele","dative-genitive-indefinite-singular":"lazaret","dative-definite-genitive-singular":"lazaretului","dative-genitive-indefinite-plural":"lazarete","dative-definite-genitive-plural":"lazaretelor","singular-vocative":"lazaretule","plural-vocative":"lazaretelor"}},{"word":"lăzăret","pos":"noun","definitions":["alternative form of lazaret"],"forms":{"plural":"lăzăreturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lăzăret","accusative-definite-nominative-singular":"lăzăretul","accusative-indefinite-nominative-plural":"lăzăreturi","accusative-definite-nominative-plural":"lăzăreturile","dative-genitive-indefinite-singular":"lăzăret","dative-definite-genitive-singular":"lăzăretului","dative-genitive-indefinite-plural":"lăzăreturi","dative-definite-genitive-plural":"lăzăreturilor","singular-vocative":"lăzăretule","plural-vocative":"lăzăreturilor"}},{"word":"Lăzărică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lăzărică"}},{"word":"lazarist","pos":"noun","definitions":["Lazarist"],"forms":{"plural":"lazariști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lazarist","accusative-definite-nominative-singular":"lazaristul","accusative-indefinite-nominative-plural":"lazariști","accusative-definite-nominative-plural":"lazariștii","dative-genitive-indefinite-singular":"lazarist","dative-definite-genitive-singular":"lazaristului","dative-genitive-indefinite-plural":"lazariști","dative-definite-genitive-plural":"lazariștilor","singular-vocative":"lazaristule","plural-vocative":"lazariștilor"}},{"word":"Lazariuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Lazariuc"}},{"word":"Lăzăriuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Lăzăriuc"}},{"word":"Lăzăroaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Lăzăroaia"}},{"word":"Lăzăroaie","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Bolovăniș"],"gender":"m"},{"word":"Lăzăroi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lăzăroi"}},{"word":"Lăzăroiu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lăzăroiu"}},{"word":"lazaron","pos":"noun","definitions":["lazzarone"],"forms":{"plural":"lazaroni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lazaron","accusative-definite-nominative-singular":"lazaronul","accusative-indefinite-nominative-plural":"lazaroni","accusative-definite-nominative-plural":"lazaronii","dative-genitive-indefinite-singular":"lazaron","dative-definite-genitive-singular":"lazaronului","dative-genitive-indefinite-plural":"lazaroni","dative-definite-genitive-plural":"lazaronilor","singular-vocative":"lazaronule","plural-vocative":"lazaronilor"}},{"word":"Lazarov","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Lazarov"}},{"word":"Lazarovici","pos":"name","definitions":["a surname from Polish"],"gender":"m","forms":{"dative-genitive":"lui Lazarovici"}},{"word":"Lazăru","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Latorița","a river in Neamț, Romania, tributary to the Bicăjel"],"gender":"m"},{"word":"Lăzarucă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lăzarucă"}},{"word":"Lăzăruică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lăzăruică"}},{"word":"Lăzăruț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lăzăruț"}},{"word":"Lăzăsescu","pos":"name","definitions":["a surname"]},{"word":"lăzaștină","pos":"noun","definitions":["recently cleared forest"],"forms":{"plural":"lăzaștine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lăzaștină","accusative-definite-nominative-singular":"lăzaștina","accusative-indefinite-nominative-plural":"lăzaștine","accusative-definite-nominative-plural":"lăzaștinele","dative-genitive-indefinite-singular":"lăzaștine","dative-definite-genitive-singular":"lăzaștinei","dative-genitive-indefinite-plural":"lăzaștine","dative-definite-genitive-plural":"lăzaștinelor","singular-vocative":"lăzaștină","plural-vocative":"lăzaștinelor"}},{"word":"Lăzescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lăzescu"}},{"word":"Lăzești","pos":"name","definitions":["a village in Scărișoara, Alba County, Romania","a village in Vadu Moților, Alba County, Romania"],"gender":"m"},{"word":"lăzglăuș","pos":"noun","definitions":["flag-bearer"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"lăzglăuș","accusative-definite-nominative":"lăzglăușul","dative-genitive-indefinite":"lăzglăuș","dative-definite-genitive":"lăzglăușului","vocative":"lăzglăușule"}},{"word":"lăzilor","pos":"noun","definitions":["definite genitive/dative plural of ladă"]},{"word":"lazioară","pos":"noun","definitions":["diminutive of laz"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lazioară","accusative-definite-nominative":"lazioara","dative-genitive-indefinite":"lazioare","dative-definite-genitive":"lazioarei","vocative":"lazioară"}},{"word":"lazlău","pos":"noun","definitions":["flag"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m-u","accusative-indefinite-nominative":"lazlău","accusative-definite-nominative":"lazlăul","dative-genitive-indefinite":"lazlău","dative-definite-genitive":"lazlăului","vocative":"lazlăule"}},{"word":"Lazo","pos":"name","definitions":["a village in Alava, Ștefan Vodă Raion, Moldova","a village in Hăsnășenii Noi, Drochia Raion, Moldova"],"gender":"m"},{"word":"Lazu","pos":"name","definitions":["a village in Terpezița, Dolj County, Romania","a village in Malovăț, Mehedinți County, Romania","a village in Gherghești, Vaslui County, Romania"],"gender":"m"},{"word":"Lazu","pos":"name","definitions":["a village in Agigea, Constanța County, Romania"],"gender":"m"},{"word":"Lazu Baciului","pos":"name","definitions":["a locality in Sighetu Marmației, Maramureș County, Romania"],"gender":"m"},{"word":"Lazul","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Latorița","a river in Caraș-Severin, Romania, tributary to the Teregova"],"gender":"m"},{"word":"lazulit","pos":"noun","definitions":["lazulite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lazulit","accusative-definite-nominative-singular":"lazulitul","accusative-indefinite-nominative-plural":"lazulite","accusative-definite-nominative-plural":"lazulitele","dative-genitive-indefinite-singular":"lazulit","dative-definite-genitive-singular":"lazulitului","dative-genitive-indefinite-plural":"lazulite","dative-definite-genitive-plural":"lazulitelor","singular-vocative":"lazulitule","plural-vocative":"lazulitelor"}},{"word":"lazului","pos":"noun","definitions":["definite genitive/dative singular of laz"]},{"word":"Lăzurean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lăzurean"}},{"word":"Lăzureanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lăzureanu"}},{"word":"Lazuri","pos":"name","definitions":["a village in Lupșa, Alba County, Romania","a village in Sohodol, Alba County, Romania","a village in Vârfurile, Arad County, Romania","a village in Roșia, Bihor County, Romania","a village in Comișani, Dâmbovița County, Romania"],"gender":"m"},{"word":"Lazuri de Beiuș","pos":"name","definitions":["a commune of Bihor County, Romania","a village in Lazuri de Beiuș, Bihor County, Romania"],"gender":"m"},{"word":"lazurit","pos":"noun","definitions":["lazurite"],"forms":{"plural":"lazurite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lazurit","accusative-definite-nominative-singular":"lazuritul","accusative-indefinite-nominative-plural":"lazurite","accusative-definite-nominative-plural":"lazuritele","dative-genitive-indefinite-singular":"lazurit","dative-definite-genitive-singular":"lazuritului","dative-genitive-indefinite-plural":"lazurite","dative-definite-genitive-plural":"lazuritelor","singular-vocative":"lazuritule","plural-vocative":"lazuritelor"}},{"word":"lăzuț","pos":"noun","definitions":["diminutive of laz"],"forms":{"plural":"lăzuțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lăzuț","accusative-definite-nominative-singular":"lăzuțul","accusative-indefinite-nominative-plural":"lăzuțuri","accusative-definite-nominative-plural":"lăzuțurile","dative-genitive-indefinite-singular":"lăzuț","dative-definite-genitive-singular":"lăzuțului","dative-genitive-indefinite-plural":"lăzuțuri","dative-definite-genitive-plural":"lăzuțurilor","singular-vocative":"lăzuțule","plural-vocative":"lăzuțurilor"}},{"word":"le","pos":"pron","definitions":["to them (all-male or mixed group)"],"pronunciation":"/le/","gender":"m"},{"word":"le","pos":"pron","definitions":["to them (all-female group)"],"pronunciation":"/le/","gender":"f"},{"word":"le","pos":"pron","definitions":["them (all-female group)"],"pronunciation":"/le/","gender":"m"},{"word":"le-a","pos":"contraction","definitions":["contraction of le + a"],"pronunciation":"/le̯a/"},{"word":"le-ai","pos":"contraction","definitions":["contraction of le + ai"],"pronunciation":"/le̯aj/"},{"word":"le-am","pos":"contraction","definitions":["contraction of le + am"],"pronunciation":"/le̯am/"},{"word":"le-ar","pos":"contraction","definitions":["contraction of le + ar"],"pronunciation":"/le̯ar/"},{"word":"le-aș","pos":"contraction","definitions":["contraction of le + aș"],"pronunciation":"/le̯aʃ/"},{"word":"le-ați","pos":"contraction","definitions":["contraction of le + ați"],"pronunciation":"/le̯at͡sʲ/"},{"word":"le-au","pos":"contraction","definitions":["contraction of le + au"],"pronunciation":"/le̯aw/"},{"word":"le-o","pos":"contraction","definitions":["contraction of le + o"],"pronunciation":"/le̯o/"},{"word":"le-or","pos":"contraction","definitions":["contraction of le + or"],"pronunciation":"/le̯or/"},{"word":"lea","pos":"verb","definitions":["third-person singular/plural present subjunctive of la"],"pronunciation":"[le̯a]"},{"word":"leac","pos":"noun","definitions":["medicine, remedy, cure"],"forms":{"plural":"leacuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"leac","accusative-definite-nominative-singular":"leacul","accusative-indefinite-nominative-plural":"leacuri","accusative-definite-nominative-plural":"leacurile","dative-genitive-indefinite-singular":"leac","dative-definite-genitive-singular":"leacului","dative-genitive-indefinite-plural":"leacuri","dative-definite-genitive-plural":"leacurilor","singular-vocative":"leacule","plural-vocative":"leacurilor"}},{"word":"leac băbesc","pos":"noun","definitions":["folk medicine, particularly ineffective medicine"],"forms":{"plural":"leacuri băbești"}},{"word":"leacă","pos":"adv","definitions":["alternative form of oleacă"]},{"word":"leader","pos":"noun","definitions":["obsolete form of lider"],"forms":{"plural":"leaderi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leader","accusative-definite-nominative-singular":"leaderul","accusative-indefinite-nominative-plural":"leaderi","accusative-definite-nominative-plural":"leaderii","dative-genitive-indefinite-singular":"leader","dative-definite-genitive-singular":"leaderului","dative-genitive-indefinite-plural":"leaderi","dative-definite-genitive-plural":"leaderilor","singular-vocative":"leaderule","plural-vocative":"leaderilor"}},{"word":"leafă","pos":"noun","definitions":["wage, salary"],"forms":{"plural":"lefi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"leafă","accusative-definite-nominative-singular":"leafa","accusative-indefinite-nominative-plural":"lefi","accusative-definite-nominative-plural":"lefile","dative-genitive-indefinite-singular":"lefi","dative-definite-genitive-singular":"lefii","dative-genitive-indefinite-plural":"lefi","dative-definite-genitive-plural":"lefilor","singular-vocative":"leafă","plural-vocative":"lefilor"}},{"word":"leagăn","pos":"noun","definitions":["cradle","swing"],"forms":{"plural":"leagăne","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"leagăn","accusative-definite-nominative-singular":"leagănul","accusative-indefinite-nominative-plural":"leagăne","accusative-definite-nominative-plural":"leagănele","dative-genitive-indefinite-singular":"leagăn","dative-definite-genitive-singular":"leagănului","dative-genitive-indefinite-plural":"leagăne","dative-definite-genitive-plural":"leagănelor","singular-vocative":"leagănule","plural-vocative":"leagănelor"}},{"word":"leagăne","pos":"noun","definitions":["plural of leagăn"]},{"word":"Leah","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Leah"}},{"word":"leah","pos":"noun","definitions":["Pole, Polack"],"forms":{"plural":"leși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leah","accusative-definite-nominative-singular":"leahul","accusative-indefinite-nominative-plural":"leși","accusative-definite-nominative-plural":"leșii","dative-genitive-indefinite-singular":"leah","dative-definite-genitive-singular":"leahului","dative-genitive-indefinite-plural":"leși","dative-definite-genitive-plural":"leșilor","singular-vocative":"leahule","plural-vocative":"leșilor"}},{"word":"leahă","pos":"noun","definitions":["female equivalent of leah"],"forms":{"plural":"leșe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leahă","accusative-definite-nominative-singular":"leaha","accusative-indefinite-nominative-plural":"leșe","accusative-definite-nominative-plural":"leșele","dative-genitive-indefinite-singular":"leșe","dative-definite-genitive-singular":"leșei","dative-genitive-indefinite-plural":"leșe","dative-definite-genitive-plural":"leșelor","singular-vocative":"leahă","plural-vocative":"leșelor"}},{"word":"Leahu","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Leahu"}},{"word":"Leahu-Nacu","pos":"name","definitions":["a village in Deleni, Iași County, Romania"],"gender":"m"},{"word":"leal","pos":"adj","definitions":["loyal, faithful"],"forms":{"feminine-singular":"leală","masculine-plural":"leali","feminine-neuter-plural":"leale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leal","error-unrecognized-form-feminine-indefinite-singular":"leală","error-unrecognized-form-indefinite-masculine-plural":"leali","error-unrecognized-form-feminine-indefinite-neuter-plural":"leale","definite-error-unrecognized-form-masculine-neuter-singular":"lealul","definite-error-unrecognized-form-feminine-singular":"leala","definite-error-unrecognized-form-masculine-plural":"lealii","definite-error-unrecognized-form-feminine-neuter-plural":"lealele"}},{"word":"lealism","pos":"noun","definitions":["loyalty"],"forms":{"plural":"lealisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lealism","accusative-definite-nominative-singular":"lealismul","accusative-indefinite-nominative-plural":"lealisme","accusative-definite-nominative-plural":"lealismele","dative-genitive-indefinite-singular":"lealism","dative-definite-genitive-singular":"lealismului","dative-genitive-indefinite-plural":"lealisme","dative-definite-genitive-plural":"lealismelor","singular-vocative":"lealismule","plural-vocative":"lealismelor"}},{"word":"lealitate","pos":"noun","definitions":["loyalty, faithfulness","fairness, honesty"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"lealitate","accusative-definite-nominative":"lealitatea","dative-genitive-indefinite":"lealități","dative-definite-genitive":"lealității","vocative":"lealitate"}},{"word":"Leamna de Jos","pos":"name","definitions":["a village in Bucovăț, Dolj County, Romania"],"gender":"f"},{"word":"Leamna de Sus","pos":"name","definitions":["a village in Bucovăț, Dolj County, Romania"],"gender":"f"},{"word":"leandru","pos":"noun","definitions":["oleander"],"forms":{"plural":"leandri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leandru","accusative-definite-nominative-singular":"leandrul","accusative-indefinite-nominative-plural":"leandri","accusative-definite-nominative-plural":"leandrii","dative-genitive-indefinite-singular":"leandru","dative-definite-genitive-singular":"leandrului","dative-genitive-indefinite-plural":"leandri","dative-definite-genitive-plural":"leandrilor","singular-vocative":"leandrule","plural-vocative":"leandrilor"}},{"word":"Leaota","pos":"name","definitions":["a river in Dâmbovița County, Romania, tributary to the Raciu","a river in Argeș County, Romania, tributary to the Zârna"],"gender":"f"},{"word":"Leaotu","pos":"name","definitions":["a river in Prahova County, Romania, tributary to the Teleajen"],"gender":"m"},{"word":"leapșa","pos":"intj","definitions":["tag (exclamation that signals the start of a game of tag)"],"pronunciation":"/ˈle̯ap.ʃa/","examples":[{"ro":"Leapșa, tu ești!","en":"Tag, you're it!"}]},{"word":"leapșă","pos":"noun","definitions":["slap (a blow with the hand)","tag (children's chasing game)"],"pronunciation":"/ˈle̯ap.ʃə/","examples":[{"ro":"Hai să jucăm leapșa / de-a leapșa.","en":"Let's play tag."}],"forms":{"plural":"lepșe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leapșă","accusative-definite-nominative-singular":"leapșa","accusative-indefinite-nominative-plural":"lepșe","accusative-definite-nominative-plural":"lepșele","dative-genitive-indefinite-singular":"lepșe","dative-definite-genitive-singular":"lepșei","dative-genitive-indefinite-plural":"lepșe","dative-definite-genitive-plural":"lepșelor","singular-vocative":"leapșă","plural-vocative":"lepșelor"}},{"word":"leasă","pos":"noun","definitions":["a fishing net"],"forms":{"plural":"lese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leasă","accusative-definite-nominative-singular":"leasa","accusative-indefinite-nominative-plural":"lese","accusative-definite-nominative-plural":"lesele","dative-genitive-indefinite-singular":"lese","dative-definite-genitive-singular":"lesei","dative-genitive-indefinite-plural":"lese","dative-definite-genitive-plural":"leselor","singular-vocative":"leasă","plural-vocative":"leselor"}},{"word":"leasing","pos":"noun","definitions":["leasing"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"leasing","accusative-definite-nominative":"leasingul","dative-genitive-indefinite":"leasing","dative-definite-genitive":"leasingului","vocative":"leasingule"}},{"word":"leat","pos":"noun","definitions":["year","being of the same age","recruit"],"pronunciation":"[le̯at]","forms":{"plural":"leaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"leat","accusative-definite-nominative-singular":"leatul","accusative-indefinite-nominative-plural":"leaturi","accusative-definite-nominative-plural":"leaturile","dative-genitive-indefinite-singular":"leat","dative-definite-genitive-singular":"leatului","dative-genitive-indefinite-plural":"leaturi","dative-definite-genitive-plural":"leaturilor","singular-vocative":"leatule","plural-vocative":"leaturilor"}},{"word":"leaț","pos":"noun","definitions":["lath"],"forms":{"plural":"leațuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"leaț","accusative-definite-nominative-singular":"leațul","accusative-indefinite-nominative-plural":"leațuri","accusative-definite-nominative-plural":"leațurile","dative-genitive-indefinite-singular":"leaț","dative-definite-genitive-singular":"leațului","dative-genitive-indefinite-plural":"leațuri","dative-definite-genitive-plural":"leațurilor","singular-vocative":"leațule","plural-vocative":"leațurilor"}},{"word":"Leauț","pos":"name","definitions":["a village in Tomești, Hunedoara County, Romania"],"gender":"m"},{"word":"Lebăda","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lebăda"}},{"word":"Lebădă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lebădă"}},{"word":"lebădă","pos":"noun","definitions":["swan (Cygnus)"],"pronunciation":"[ˈlebədə]","forms":{"plural":"lebede","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lebădă","accusative-definite-nominative-singular":"lebăda","accusative-indefinite-nominative-plural":"lebede","accusative-definite-nominative-plural":"lebedele","dative-genitive-indefinite-singular":"lebede","dative-definite-genitive-singular":"lebedei","dative-genitive-indefinite-plural":"lebede","dative-definite-genitive-plural":"lebedelor","singular-vocative":"lebădă","plural-vocative":"lebedelor"}},{"word":"lebădă de iarnă","pos":"noun","definitions":["whooper swan (Cygnus cygnus)"],"forms":{"plural":"lebede de iarnă"}},{"word":"lebădă de vară","pos":"noun","definitions":["mute swan (Cygnus olor)"],"forms":{"plural":"lebede de vară"}},{"word":"lebădă mică","pos":"noun","definitions":["Bewick's swan (Cygnus columbianus)"],"forms":{"plural":"lebede mici"}},{"word":"lebădă neagră","pos":"noun","definitions":["black swan (Cygnus atratus)"],"forms":{"plural":"lebede negre"}},{"word":"lebadea","pos":"noun","definitions":["alternative form of libadea"],"forms":{"plural":"lebadele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"lebadea","accusative-definite-nominative-singular":"lebadeaua","accusative-indefinite-nominative-plural":"lebadele","accusative-definite-nominative-plural":"lebadelele","dative-genitive-indefinite-singular":"lebadele","dative-definite-genitive-singular":"lebadelei","dative-genitive-indefinite-plural":"lebadele","dative-definite-genitive-plural":"lebadelelor","singular-vocative":"lebadea","plural-vocative":"lebadelelor"}},{"word":"lebădoi","pos":"noun","definitions":["male swan"],"forms":{"plural":"lebădoi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lebădoi","accusative-definite-nominative-singular":"lebădoiul","accusative-indefinite-nominative-plural":"lebădoi","accusative-definite-nominative-plural":"lebădoii","dative-genitive-indefinite-singular":"lebădoi","dative-definite-genitive-singular":"lebădoiului","dative-genitive-indefinite-plural":"lebădoi","dative-definite-genitive-plural":"lebădoilor","singular-vocative":"lebădoiule","plural-vocative":"lebădoilor"}},{"word":"lebăr","pos":"noun","definitions":["liverwurst, liver sausage"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lebăr","accusative-definite-nominative":"lebărul","dative-genitive-indefinite":"lebăr","dative-definite-genitive":"lebărului","vocative":"lebărule"}},{"word":"lebărvurst","pos":"noun","definitions":["liverwurst, liver sausage"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"lebărvurst","accusative-definite-nominative":"lebărvurstul","dative-genitive-indefinite":"lebărvurst","dative-definite-genitive":"lebărvurstului","vocative":"lebărvurstule"}},{"word":"lebărvurșt","pos":"noun","definitions":["liverwurst, liver sausage"],"forms":{"plural":"lebărvurști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lebărvurșt","accusative-definite-nominative-singular":"lebărvurștul","accusative-indefinite-nominative-plural":"lebărvurști","accusative-definite-nominative-plural":"lebărvurștii","dative-genitive-indefinite-singular":"lebărvurșt","dative-definite-genitive-singular":"lebărvurștului","dative-genitive-indefinite-plural":"lebărvurști","dative-definite-genitive-plural":"lebărvurștilor","singular-vocative":"lebărvurștule","plural-vocative":"lebărvurștilor"}},{"word":"lebede","pos":"noun","definitions":["plural of lebădă"],"pronunciation":"/ˈle.be.de/"},{"word":"lebede negre","pos":"noun","definitions":["plural of lebădă neagră"]},{"word":"Lebedenco","pos":"name","definitions":["a village in Lebedenco, Cahul Raion, Moldova","a commune of Cahul Raion, Moldova"],"gender":"m"},{"word":"lebediță","pos":"noun","definitions":["diminutive of lebădă"],"forms":{"plural":"lebedițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lebediță","accusative-definite-nominative-singular":"lebedița","accusative-indefinite-nominative-plural":"lebedițe","accusative-definite-nominative-plural":"lebedițele","dative-genitive-indefinite-singular":"lebedițe","dative-definite-genitive-singular":"lebediței","dative-genitive-indefinite-plural":"lebedițe","dative-definite-genitive-plural":"lebedițelor","singular-vocative":"lebediță","plural-vocative":"lebedițelor"}},{"word":"lebejoară","pos":"noun","definitions":["diminutive of lebădă"],"forms":{"plural":"lebejoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lebejoară","accusative-definite-nominative-singular":"lebejoara","accusative-indefinite-nominative-plural":"lebejoare","accusative-definite-nominative-plural":"lebejoarele","dative-genitive-indefinite-singular":"lebejoare","dative-definite-genitive-singular":"lebejoarei","dative-genitive-indefinite-plural":"lebejoare","dative-definite-genitive-plural":"lebejoarelor","singular-vocative":"lebejoară","plural-vocative":"lebejoarelor"}},{"word":"lebes","pos":"noun","definitions":["lebes"],"forms":{"plural":"lebesuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lebes","accusative-definite-nominative-singular":"lebesul","accusative-indefinite-nominative-plural":"lebesuri","accusative-definite-nominative-plural":"lebesurile","dative-genitive-indefinite-singular":"lebes","dative-definite-genitive-singular":"lebesului","dative-genitive-indefinite-plural":"lebesuri","dative-definite-genitive-plural":"lebesurilor","singular-vocative":"lebesule","plural-vocative":"lebesurilor"}},{"word":"Leca","pos":"name","definitions":["a village in Antonești, Cantemir Raion, Moldova","a surname from Greek"],"gender":"f"},{"word":"Lechențeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lechențeanu"}},{"word":"Lechincioara","pos":"name","definitions":["a village in Șincai, Mureș County, Romania"],"gender":"f"},{"word":"Lechința","pos":"name","definitions":["a commune of Bistrița-Năsăud County, Romania","a village in Lechința, Bistrița-Năsăud County, Romania","a village in Iernut, Mureș County, Romania","a village in Călinești-Oaș, Satu Mare County, Romania"],"gender":"f"},{"word":"Lechințan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lechințan"}},{"word":"Lechințean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lechințean"}},{"word":"Lechițeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lechițeanu"}},{"word":"lecit","pos":"noun","definitions":["alternative form of lecită"],"forms":{"plural":"lecite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lecit","accusative-definite-nominative-singular":"lecitul","accusative-indefinite-nominative-plural":"lecite","accusative-definite-nominative-plural":"lecitele","dative-genitive-indefinite-singular":"lecit","dative-definite-genitive-singular":"lecitului","dative-genitive-indefinite-plural":"lecite","dative-definite-genitive-plural":"lecitelor","singular-vocative":"lecitule","plural-vocative":"lecitelor"}},{"word":"lecitină","pos":"noun","definitions":["lecithin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lecitină","accusative-definite-nominative-singular":"lecitina","accusative-indefinite-nominative-plural":"lecitine","accusative-definite-nominative-plural":"lecitinele","dative-genitive-indefinite-singular":"lecitine","dative-definite-genitive-singular":"lecitinei","dative-genitive-indefinite-plural":"lecitine","dative-definite-genitive-plural":"lecitinelor","singular-vocative":"lecitină","plural-vocative":"lecitinelor"}},{"word":"lecnă","pos":"noun","definitions":["clay, loam"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lecnă","accusative-definite-nominative":"lecna","dative-genitive-indefinite":"lecne","dative-definite-genitive":"lecnei","vocative":"lecnă"}},{"word":"lectica","pos":"noun","definitions":["definite nominative/accusative singular of lectică"]},{"word":"lectică","pos":"noun","definitions":["litter, particularly (historical) lectica"],"forms":{"plural":"lectici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lectică","accusative-definite-nominative-singular":"lectica","accusative-indefinite-nominative-plural":"lectici","accusative-definite-nominative-plural":"lecticile","dative-genitive-indefinite-singular":"lectici","dative-definite-genitive-singular":"lecticii","dative-genitive-indefinite-plural":"lectici","dative-definite-genitive-plural":"lecticilor","singular-vocative":"lectică","plural-vocative":"lecticilor"}},{"word":"lecticar","pos":"noun","definitions":["a litter-bearer, sedan-bearer, lectica-bearer"],"forms":{"plural":"lecticari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lecticar","accusative-definite-nominative-singular":"lecticarul","accusative-indefinite-nominative-plural":"lecticari","accusative-definite-nominative-plural":"lecticarii","dative-genitive-indefinite-singular":"lecticar","dative-definite-genitive-singular":"lecticarului","dative-genitive-indefinite-plural":"lecticari","dative-definite-genitive-plural":"lecticarilor","singular-vocative":"lecticarule","plural-vocative":"lecticarilor"}},{"word":"lectici","pos":"noun","definitions":["inflection of lectică:","indefinite nominative/accusative/genitive/dative plural","indefinite genitive/dative singular"]},{"word":"lecție","pos":"noun","definitions":["lesson"],"forms":{"plural":"lecții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lecție","accusative-definite-nominative-singular":"lecția","accusative-indefinite-nominative-plural":"lecții","accusative-definite-nominative-plural":"lecțiile","dative-genitive-indefinite-singular":"lecții","dative-definite-genitive-singular":"lecției","dative-genitive-indefinite-plural":"lecții","dative-definite-genitive-plural":"lecțiilor","singular-vocative":"lecție","plural-vocative":"lecțiilor","alternative-dated":"lecțiune"}},{"word":"lecționar","pos":"noun","definitions":["lectionary"],"forms":{"plural":"lecționare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lecționar","accusative-definite-nominative-singular":"lecționarul","accusative-indefinite-nominative-plural":"lecționare","accusative-definite-nominative-plural":"lecționarele","dative-genitive-indefinite-singular":"lecționar","dative-definite-genitive-singular":"lecționarului","dative-genitive-indefinite-plural":"lecționare","dative-definite-genitive-plural":"lecționarelor","singular-vocative":"lecționarule","plural-vocative":"lecționarelor"}},{"word":"lecțiune","pos":"noun","definitions":["alternative form of lecție"],"forms":{"plural":"lecțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lecțiune","accusative-definite-nominative-singular":"lecțiunea","accusative-indefinite-nominative-plural":"lecțiuni","accusative-definite-nominative-plural":"lecțiunile","dative-genitive-indefinite-singular":"lecțiuni","dative-definite-genitive-singular":"lecțiunii","dative-genitive-indefinite-plural":"lecțiuni","dative-definite-genitive-plural":"lecțiunilor","singular-vocative":"lecțiune","plural-vocative":"lecțiunilor"}},{"word":"lector","pos":"noun","definitions":["lecturer"],"forms":{"plural":"lectori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lector","accusative-definite-nominative-singular":"lectorul","accusative-indefinite-nominative-plural":"lectori","accusative-definite-nominative-plural":"lectorii","dative-genitive-indefinite-singular":"lector","dative-definite-genitive-singular":"lectorului","dative-genitive-indefinite-plural":"lectori","dative-definite-genitive-plural":"lectorilor","singular-vocative":"lectorule","plural-vocative":"lectorilor"}},{"word":"lectoră","pos":"noun","definitions":["female equivalent of lector"],"forms":{"plural":"lectore","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lectoră","accusative-definite-nominative-singular":"lectora","accusative-indefinite-nominative-plural":"lectore","accusative-definite-nominative-plural":"lectorele","dative-genitive-indefinite-singular":"lectore","dative-definite-genitive-singular":"lectorei","dative-genitive-indefinite-plural":"lectore","dative-definite-genitive-plural":"lectorelor","singular-vocative":"lectoră","plural-vocative":"lectorelor"}},{"word":"lectorat","pos":"noun","definitions":["lectureship"],"forms":{"plural":"lectorate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lectorat","accusative-definite-nominative-singular":"lectoratul","accusative-indefinite-nominative-plural":"lectorate","accusative-definite-nominative-plural":"lectoratele","dative-genitive-indefinite-singular":"lectorat","dative-definite-genitive-singular":"lectoratului","dative-genitive-indefinite-plural":"lectorate","dative-definite-genitive-plural":"lectoratelor","singular-vocative":"lectoratule","plural-vocative":"lectoratelor"}},{"word":"lectoriță","pos":"noun","definitions":["female equivalent of lector"],"forms":{"plural":"lectorițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lectoriță","accusative-definite-nominative-singular":"lectorița","accusative-indefinite-nominative-plural":"lectorițe","accusative-definite-nominative-plural":"lectorițele","dative-genitive-indefinite-singular":"lectorițe","dative-definite-genitive-singular":"lectoriței","dative-genitive-indefinite-plural":"lectorițe","dative-definite-genitive-plural":"lectorițelor","singular-vocative":"lectoriță","plural-vocative":"lectorițelor"}},{"word":"lectriță","pos":"noun","definitions":["female reader"],"forms":{"plural":"lectrițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lectriță","accusative-definite-nominative-singular":"lectrița","accusative-indefinite-nominative-plural":"lectrițe","accusative-definite-nominative-plural":"lectrițele","dative-genitive-indefinite-singular":"lectrițe","dative-definite-genitive-singular":"lectriței","dative-genitive-indefinite-plural":"lectrițe","dative-definite-genitive-plural":"lectrițelor","singular-vocative":"lectriță","plural-vocative":"lectrițelor"}},{"word":"lectura","pos":"verb","definitions":["to read"],"forms":{"canonical":"a lectura 1st conjugation","present-singular-third-person":"lecturează","participle-past":"lecturat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a lectura","gerund":"lecturând","first-person-indicative-present-singular":"lecturez","indicative-present-second-person-singular":"lecturezi","indicative-present-singular-third-person":"lecturează","first-person-indicative-plural-present":"lecturăm","indicative-plural-present-second-person":"lecturați","indicative-plural-present-third-person":"lecturează","first-person-imperfect-indicative-singular":"lecturam","imperfect-indicative-second-person-singular":"lecturai","imperfect-indicative-singular-third-person":"lectura","first-person-imperfect-indicative-plural":"lecturam","imperfect-indicative-plural-second-person":"lecturați","imperfect-indicative-plural-third-person":"lecturau","first-person-indicative-perfect-singular":"lecturai","indicative-perfect-second-person-singular":"lecturași","indicative-perfect-singular-third-person":"lectură","first-person-indicative-perfect-plural":"lecturarăm","indicative-perfect-plural-second-person":"lecturarăți","indicative-perfect-plural-third-person":"lecturară","first-person-indicative-pluperfect-singular":"lecturasem","indicative-pluperfect-second-person-singular":"lecturaseși","indicative-pluperfect-singular-third-person":"lecturase","first-person-indicative-pluperfect-plural":"lecturaserăm","indicative-pluperfect-plural-second-person":"lecturaserăți","indicative-pluperfect-plural-third-person":"lecturaseră","first-person-present-singular-subjunctive":"să lecturez","present-second-person-singular-subjunctive":"să lecturezi","present-singular-subjunctive-third-person":"să lectureze","first-person-plural-present-subjunctive":"să lecturăm","plural-present-second-person-subjunctive":"să lecturați","plural-present-subjunctive-third-person":"să lectureze","imperative-second-person-singular":"lecturează","imperative-plural-second-person":"lecturați","imperative-negative-second-person-singular":"nu lectura","imperative-negative-plural-second-person":"nu lecturați"}},{"word":"lectură","pos":"noun","definitions":["reading"],"forms":{"plural":"lecturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lectură","accusative-definite-nominative-singular":"lectura","accusative-indefinite-nominative-plural":"lecturi","accusative-definite-nominative-plural":"lecturile","dative-genitive-indefinite-singular":"lecturi","dative-definite-genitive-singular":"lecturii","dative-genitive-indefinite-plural":"lecturi","dative-definite-genitive-plural":"lecturilor","singular-vocative":"lectură","plural-vocative":"lecturilor"}},{"word":"lecturare","pos":"noun","definitions":["reading"],"forms":{"plural":"lecturări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lecturare","accusative-definite-nominative-singular":"lecturarea","accusative-indefinite-nominative-plural":"lecturări","accusative-definite-nominative-plural":"lecturările","dative-genitive-indefinite-singular":"lecturări","dative-definite-genitive-singular":"lecturării","dative-genitive-indefinite-plural":"lecturări","dative-definite-genitive-plural":"lecturărilor","singular-vocative":"lecturare","plural-vocative":"lecturărilor"}},{"word":"lecturi","pos":"noun","definitions":["plural of lectură"]},{"word":"Lecu","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Lecu"}},{"word":"lecui","pos":"verb","definitions":["to cure","to heal, recover","to correct someone’s or one’s own bad behaviour or conviction"],"forms":{"canonical":"a lecui 4th conjugation","present-singular-third-person":"lecuiește","participle-past":"lecuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lecui","gerund":"lecuind","first-person-indicative-present-singular":"lecuiesc","indicative-present-second-person-singular":"lecuiești","indicative-present-singular-third-person":"lecuiește","first-person-indicative-plural-present":"lecuim","indicative-plural-present-second-person":"lecuiți","indicative-plural-present-third-person":"lecuiesc","first-person-imperfect-indicative-singular":"lecuiam","imperfect-indicative-second-person-singular":"lecuiai","imperfect-indicative-singular-third-person":"lecuia","first-person-imperfect-indicative-plural":"lecuiam","imperfect-indicative-plural-second-person":"lecuiați","imperfect-indicative-plural-third-person":"lecuiau","first-person-indicative-perfect-singular":"lecuii","indicative-perfect-second-person-singular":"lecuiși","indicative-perfect-singular-third-person":"lecui","first-person-indicative-perfect-plural":"lecuirăm","indicative-perfect-plural-second-person":"lecuirăți","indicative-perfect-plural-third-person":"lecuiră","first-person-indicative-pluperfect-singular":"lecuisem","indicative-pluperfect-second-person-singular":"lecuiseși","indicative-pluperfect-singular-third-person":"lecuise","first-person-indicative-pluperfect-plural":"lecuiserăm","indicative-pluperfect-plural-second-person":"lecuiserăți","indicative-pluperfect-plural-third-person":"lecuiseră","first-person-present-singular-subjunctive":"să lecuiesc","present-second-person-singular-subjunctive":"să lecuiești","present-singular-subjunctive-third-person":"să lecuiască","first-person-plural-present-subjunctive":"să lecuim","plural-present-second-person-subjunctive":"să lecuiți","plural-present-subjunctive-third-person":"să lecuiască","imperative-second-person-singular":"lecuiește","imperative-plural-second-person":"lecuiți","imperative-negative-second-person-singular":"nu lecui","imperative-negative-plural-second-person":"nu lecuiți"}},{"word":"lecuială","pos":"noun","definitions":["heal"],"forms":{"plural":"lecuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lecuială","accusative-definite-nominative-singular":"lecuiala","accusative-indefinite-nominative-plural":"lecuiele","accusative-definite-nominative-plural":"lecuielele","dative-genitive-indefinite-singular":"lecuiele","dative-definite-genitive-singular":"lecuielei","dative-genitive-indefinite-plural":"lecuiele","dative-definite-genitive-plural":"lecuielelor","singular-vocative":"lecuială","plural-vocative":"lecuielelor"}},{"word":"lecuință","pos":"noun","definitions":["healing"],"forms":{"plural":"lecuințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lecuință","accusative-definite-nominative-singular":"lecuința","accusative-indefinite-nominative-plural":"lecuințe","accusative-definite-nominative-plural":"lecuințele","dative-genitive-indefinite-singular":"lecuințe","dative-definite-genitive-singular":"lecuinței","dative-genitive-indefinite-plural":"lecuințe","dative-definite-genitive-plural":"lecuințelor","singular-vocative":"lecuință","plural-vocative":"lecuințelor"}},{"word":"lecuire","pos":"noun","definitions":["heal"],"forms":{"plural":"lecuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lecuire","accusative-definite-nominative-singular":"lecuirea","accusative-indefinite-nominative-plural":"lecuiri","accusative-definite-nominative-plural":"lecuirile","dative-genitive-indefinite-singular":"lecuiri","dative-definite-genitive-singular":"lecuirii","dative-genitive-indefinite-plural":"lecuiri","dative-definite-genitive-plural":"lecuirilor","singular-vocative":"lecuire","plural-vocative":"lecuirilor"}},{"word":"lecuit","pos":"adj","definitions":["cured"],"forms":{"feminine-singular":"lecuită","masculine-plural":"lecuiți","feminine-neuter-plural":"lecuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lecuit","error-unrecognized-form-feminine-indefinite-singular":"lecuită","error-unrecognized-form-indefinite-masculine-plural":"lecuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lecuite","definite-error-unrecognized-form-masculine-neuter-singular":"lecuitul","definite-error-unrecognized-form-feminine-singular":"lecuita","definite-error-unrecognized-form-masculine-plural":"lecuiții","definite-error-unrecognized-form-feminine-neuter-plural":"lecuitele"}},{"word":"lecuitor","pos":"adj","definitions":["healing"],"forms":{"feminine-singular":"lecuitoare","masculine-plural":"lecuitori","feminine-neuter-plural":"lecuitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lecuitor","error-unrecognized-form-feminine-indefinite-singular":"lecuitoare","error-unrecognized-form-indefinite-masculine-plural":"lecuitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"lecuitoare","definite-error-unrecognized-form-masculine-neuter-singular":"lecuitorul","definite-error-unrecognized-form-feminine-singular":"lecuitoarea","definite-error-unrecognized-form-masculine-plural":"lecuitorii","definite-error-unrecognized-form-feminine-neuter-plural":"lecuitoarele"}},{"word":"lecurele","pos":"noun","definitions":["diminutive of leac"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lecurele","accusative-definite-nominative":"lecurelele","dative-genitive-indefinite":"lecurele","dative-definite-genitive":"lecurelelor","vocative":"lecurelelor"}},{"word":"lecușor","pos":"noun","definitions":["diminutive of leac"],"forms":{"plural":"lecușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lecușor","accusative-definite-nominative-singular":"lecușorul","accusative-indefinite-nominative-plural":"lecușoare","accusative-definite-nominative-plural":"lecușoarele","dative-genitive-indefinite-singular":"lecușor","dative-definite-genitive-singular":"lecușorului","dative-genitive-indefinite-plural":"lecușoare","dative-definite-genitive-plural":"lecușoarelor","singular-vocative":"lecușorule","plural-vocative":"lecușoarelor"}},{"word":"lecuț","pos":"noun","definitions":["diminutive of leac"],"forms":{"plural":"lecuțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lecuț","accusative-definite-nominative-singular":"lecuțul","accusative-indefinite-nominative-plural":"lecuțuri","accusative-definite-nominative-plural":"lecuțurile","dative-genitive-indefinite-singular":"lecuț","dative-definite-genitive-singular":"lecuțului","dative-genitive-indefinite-plural":"lecuțuri","dative-definite-genitive-plural":"lecuțurilor","singular-vocative":"lecuțule","plural-vocative":"lecuțurilor"}},{"word":"led","pos":"noun","definitions":["LED"],"forms":{"plural":"leduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"led","accusative-definite-nominative-singular":"ledul","accusative-indefinite-nominative-plural":"leduri","accusative-definite-nominative-plural":"ledurile","dative-genitive-indefinite-singular":"led","dative-definite-genitive-singular":"ledului","dative-genitive-indefinite-plural":"leduri","dative-definite-genitive-plural":"ledurilor","singular-vocative":"ledule","plural-vocative":"ledurilor"}},{"word":"ledăr","pos":"noun","definitions":["tanner"],"forms":{"plural":"ledări","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ledăr","accusative-definite-nominative-singular":"ledărul","accusative-indefinite-nominative-plural":"ledări","accusative-definite-nominative-plural":"ledării","dative-genitive-indefinite-singular":"ledăr","dative-definite-genitive-singular":"ledărului","dative-genitive-indefinite-plural":"ledări","dative-definite-genitive-plural":"ledărilor","singular-vocative":"ledărule","plural-vocative":"ledărilor"}},{"word":"ledeburită","pos":"noun","definitions":["ledeburite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"ledeburită","accusative-definite-nominative":"ledeburita","dative-genitive-indefinite":"ledeburite","dative-definite-genitive":"ledeburitei","vocative":"ledeburită"}},{"word":"ledul","pos":"noun","definitions":["definite nominative/accusative singular of led"]},{"word":"ledului","pos":"noun","definitions":["definite genitive/dative singular of led"]},{"word":"leduri","pos":"noun","definitions":["indefinite nominative/accusative/genitive/dative plural of led"]},{"word":"ledurile","pos":"noun","definitions":["definite nominative/accusative plural of led"]},{"word":"ledurilor","pos":"noun","definitions":["definite genitive/dative plural of led"]},{"word":"lefaș","pos":"noun","definitions":["a wage laborer"],"forms":{"plural":"lefași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lefaș","accusative-definite-nominative-singular":"lefașul","accusative-indefinite-nominative-plural":"lefași","accusative-definite-nominative-plural":"lefașii","dative-genitive-indefinite-singular":"lefaș","dative-definite-genitive-singular":"lefașului","dative-genitive-indefinite-plural":"lefași","dative-definite-genitive-plural":"lefașilor","singular-vocative":"lefașule","plural-vocative":"lefașilor"}},{"word":"Lefegiu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Lefegiu"}},{"word":"lefegiu","pos":"noun","definitions":["mercenary","employee"],"forms":{"plural":"lefegii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lefegiu","accusative-definite-nominative-singular":"lefegiul","accusative-indefinite-nominative-plural":"lefegii","accusative-definite-nominative-plural":"lefegiii","dative-genitive-indefinite-singular":"lefegiu","dative-definite-genitive-singular":"lefegiului","dative-genitive-indefinite-plural":"lefegii","dative-definite-genitive-plural":"lefegiilor","singular-vocative":"lefegiule","plural-vocative":"lefegiilor"}},{"word":"leficiu","pos":"noun","definitions":["obsolete form of lefegiu"],"forms":{"plural":"leficii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leficiu","accusative-definite-nominative-singular":"leficiuul","accusative-indefinite-nominative-plural":"leficii","accusative-definite-nominative-plural":"leficiii","dative-genitive-indefinite-singular":"leficiu","dative-definite-genitive-singular":"leficiuului","dative-genitive-indefinite-plural":"leficii","dative-definite-genitive-plural":"leficiilor","singular-vocative":"leficiuule","plural-vocative":"leficiilor"}},{"word":"lefișoară","pos":"noun","definitions":["diminutive of leafă"],"forms":{"plural":"lefișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lefișoară","accusative-definite-nominative-singular":"lefișoara","accusative-indefinite-nominative-plural":"lefișoare","accusative-definite-nominative-plural":"lefișoarele","dative-genitive-indefinite-singular":"lefișoare","dative-definite-genitive-singular":"lefișoarei","dative-genitive-indefinite-plural":"lefișoare","dative-definite-genitive-plural":"lefișoarelor","singular-vocative":"lefișoară","plural-vocative":"lefișoarelor"}},{"word":"lefșoară","pos":"noun","definitions":["alternative form of lefușoară"],"forms":{"plural":"lefșoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lefșoară","accusative-definite-nominative-singular":"lefșoara","accusative-indefinite-nominative-plural":"lefșoare","accusative-definite-nominative-plural":"lefșoarele","dative-genitive-indefinite-singular":"lefșoare","dative-definite-genitive-singular":"lefșoarei","dative-genitive-indefinite-plural":"lefșoare","dative-definite-genitive-plural":"lefșoarelor","singular-vocative":"lefșoară","plural-vocative":"lefșoarelor"}},{"word":"Lefter","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lefter"}},{"word":"lefter","pos":"adj","definitions":["penniless, broke"],"forms":{"feminine-singular":"lefteră","masculine-plural":"lefteri","feminine-neuter-plural":"leftere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lefter","error-unrecognized-form-feminine-indefinite-singular":"lefteră","error-unrecognized-form-indefinite-masculine-plural":"lefteri","error-unrecognized-form-feminine-indefinite-neuter-plural":"leftere","definite-error-unrecognized-form-masculine-neuter-singular":"lefterul","definite-error-unrecognized-form-feminine-singular":"leftera","definite-error-unrecognized-form-masculine-plural":"lefterii","definite-error-unrecognized-form-feminine-neuter-plural":"lefterele"}},{"word":"Lefterache","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Lefterache"}},{"word":"Lefterachi","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Lefterachi"}},{"word":"Lefterescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lefterescu"}},{"word":"lefteri","pos":"verb","definitions":["to become penniless"],"forms":{"canonical":"a lefteri 4th conjugation","present-singular-third-person":"lefterește","participle-past":"lefterit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lefteri","gerund":"lefterind","first-person-indicative-present-singular":"lefteresc","indicative-present-second-person-singular":"lefterești","indicative-present-singular-third-person":"lefterește","first-person-indicative-plural-present":"lefterim","indicative-plural-present-second-person":"lefteriți","indicative-plural-present-third-person":"lefteresc","first-person-imperfect-indicative-singular":"lefteream","imperfect-indicative-second-person-singular":"leftereai","imperfect-indicative-singular-third-person":"lefterea","first-person-imperfect-indicative-plural":"lefteream","imperfect-indicative-plural-second-person":"leftereați","imperfect-indicative-plural-third-person":"leftereau","first-person-indicative-perfect-singular":"lefterii","indicative-perfect-second-person-singular":"lefteriși","indicative-perfect-singular-third-person":"lefteri","first-person-indicative-perfect-plural":"lefterirăm","indicative-perfect-plural-second-person":"lefterirăți","indicative-perfect-plural-third-person":"lefteriră","first-person-indicative-pluperfect-singular":"lefterisem","indicative-pluperfect-second-person-singular":"lefteriseși","indicative-pluperfect-singular-third-person":"lefterise","first-person-indicative-pluperfect-plural":"lefteriserăm","indicative-pluperfect-plural-second-person":"lefteriserăți","indicative-pluperfect-plural-third-person":"lefteriseră","first-person-present-singular-subjunctive":"să lefteresc","present-second-person-singular-subjunctive":"să lefterești","present-singular-subjunctive-third-person":"să lefterească","first-person-plural-present-subjunctive":"să lefterim","plural-present-second-person-subjunctive":"să lefteriți","plural-present-subjunctive-third-person":"să lefterească","imperative-second-person-singular":"lefterește","imperative-plural-second-person":"lefteriți","imperative-negative-second-person-singular":"nu lefteri","imperative-negative-plural-second-person":"nu lefteriți"}},{"word":"lefterie","pos":"noun","definitions":["honor","occupation"],"forms":{"plural":"lefterii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lefterie","accusative-definite-nominative-singular":"lefteria","accusative-indefinite-nominative-plural":"lefterii","accusative-definite-nominative-plural":"lefteriile","dative-genitive-indefinite-singular":"lefterii","dative-definite-genitive-singular":"lefteriei","dative-genitive-indefinite-plural":"lefterii","dative-definite-genitive-plural":"lefteriilor","singular-vocative":"lefterie","plural-vocative":"lefteriilor"}},{"word":"leftișor","pos":"noun","definitions":["diminutive of left"],"forms":{"plural":"leftișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leftișor","accusative-definite-nominative-singular":"leftișorul","accusative-indefinite-nominative-plural":"leftișori","accusative-definite-nominative-plural":"leftișorii","dative-genitive-indefinite-singular":"leftișor","dative-definite-genitive-singular":"leftișorului","dative-genitive-indefinite-plural":"leftișori","dative-definite-genitive-plural":"leftișorilor","singular-vocative":"leftișorule","plural-vocative":"leftișorilor"}},{"word":"lefușoară","pos":"noun","definitions":["diminutive of leafă; small wage"],"forms":{"plural":"lefușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lefușoară","accusative-definite-nominative-singular":"lefușoara","accusative-indefinite-nominative-plural":"lefușoare","accusative-definite-nominative-plural":"lefușoarele","dative-genitive-indefinite-singular":"lefușoare","dative-definite-genitive-singular":"lefușoarei","dative-genitive-indefinite-plural":"lefușoare","dative-definite-genitive-plural":"lefușoarelor","singular-vocative":"lefușoară","plural-vocative":"lefușoarelor"}},{"word":"leg","pos":"verb","definitions":["first-person singular present indicative/subjunctive of lega"],"pronunciation":"[leɡ]"},{"word":"lega","pos":"verb","definitions":["to tie, bind, connect"],"pronunciation":"/leˈɡa/","forms":{"canonical":"a lega 1st conjugation","present-singular-third-person":"leagă","participle-past":"legat","subjunctive-third-person":"lege","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a lega","gerund":"legând","first-person-indicative-present-singular":"leg","indicative-present-second-person-singular":"legi","indicative-present-singular-third-person":"leagă","first-person-indicative-plural-present":"legăm","indicative-plural-present-second-person":"legați","indicative-plural-present-third-person":"leagă","first-person-imperfect-indicative-singular":"legam","imperfect-indicative-second-person-singular":"legai","imperfect-indicative-singular-third-person":"lega","first-person-imperfect-indicative-plural":"legam","imperfect-indicative-plural-second-person":"legați","imperfect-indicative-plural-third-person":"legau","first-person-indicative-perfect-singular":"legai","indicative-perfect-second-person-singular":"legași","indicative-perfect-singular-third-person":"legă","first-person-indicative-perfect-plural":"legarăm","indicative-perfect-plural-second-person":"legarăți","indicative-perfect-plural-third-person":"legară","first-person-indicative-pluperfect-singular":"legasem","indicative-pluperfect-second-person-singular":"legaseși","indicative-pluperfect-singular-third-person":"legase","first-person-indicative-pluperfect-plural":"legaserăm","indicative-pluperfect-plural-second-person":"legaserăți","indicative-pluperfect-plural-third-person":"legaseră","first-person-present-singular-subjunctive":"să leg","present-second-person-singular-subjunctive":"să legi","present-singular-subjunctive-third-person":"să lege","first-person-plural-present-subjunctive":"să legăm","plural-present-second-person-subjunctive":"să legați","plural-present-subjunctive-third-person":"să lege","imperative-second-person-singular":"leagă","imperative-plural-second-person":"legați","imperative-negative-second-person-singular":"nu lega","imperative-negative-plural-second-person":"nu legați","alternative":"лега"}},{"word":"legai","pos":"verb","definitions":["inflection of lega:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[leˈɡaj]"},{"word":"legal","pos":"adj","definitions":["legal, lawful"],"pronunciation":"/leˈɡal/","forms":{"feminine-singular":"legală","masculine-plural":"legali","feminine-neuter-plural":"legale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"legal","error-unrecognized-form-feminine-indefinite-singular":"legală","error-unrecognized-form-indefinite-masculine-plural":"legali","error-unrecognized-form-feminine-indefinite-neuter-plural":"legale","definite-error-unrecognized-form-masculine-neuter-singular":"legalul","definite-error-unrecognized-form-feminine-singular":"legala","definite-error-unrecognized-form-masculine-plural":"legalii","definite-error-unrecognized-form-feminine-neuter-plural":"legalele"}},{"word":"legalism","pos":"noun","definitions":["legalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"legalism","accusative-definite-nominative":"legalismul","dative-genitive-indefinite":"legalism","dative-definite-genitive":"legalismului","vocative":"legalismule"}},{"word":"legalist","pos":"adj","definitions":["legalistic"],"forms":{"feminine-singular":"legalistă","masculine-plural":"legaliști","feminine-neuter-plural":"legaliste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"legalist","error-unrecognized-form-feminine-indefinite-singular":"legalistă","error-unrecognized-form-indefinite-masculine-plural":"legaliști","error-unrecognized-form-feminine-indefinite-neuter-plural":"legaliste","definite-error-unrecognized-form-masculine-neuter-singular":"legalistul","definite-error-unrecognized-form-feminine-singular":"legalista","definite-error-unrecognized-form-masculine-plural":"legaliștii","definite-error-unrecognized-form-feminine-neuter-plural":"legalistele"}},{"word":"legalist","pos":"noun","definitions":["legalist"],"forms":{"plural":"legaliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"legalist","accusative-definite-nominative-singular":"legalistul","accusative-indefinite-nominative-plural":"legaliști","accusative-definite-nominative-plural":"legaliștii","dative-genitive-indefinite-singular":"legalist","dative-definite-genitive-singular":"legalistului","dative-genitive-indefinite-plural":"legaliști","dative-definite-genitive-plural":"legaliștilor","singular-vocative":"legalistule","plural-vocative":"legaliștilor"}},{"word":"legalitate","pos":"noun","definitions":["legality"],"forms":{"plural":"legalități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"legalitate","accusative-definite-nominative-singular":"legalitatea","accusative-indefinite-nominative-plural":"legalități","accusative-definite-nominative-plural":"legalitățile","dative-genitive-indefinite-singular":"legalități","dative-definite-genitive-singular":"legalității","dative-genitive-indefinite-plural":"legalități","dative-definite-genitive-plural":"legalităților","singular-vocative":"legalitate","plural-vocative":"legalităților"}},{"word":"legaliza","pos":"verb","definitions":["to legalize"],"pronunciation":"/le.ɡa.liˈza/","forms":{"canonical":"a legaliza 1st conjugation","present-singular-third-person":"legalizează","participle-past":"legalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a legaliza","gerund":"legalizând","first-person-indicative-present-singular":"legalizez","indicative-present-second-person-singular":"legalizezi","indicative-present-singular-third-person":"legalizează","first-person-indicative-plural-present":"legalizăm","indicative-plural-present-second-person":"legalizați","indicative-plural-present-third-person":"legalizează","first-person-imperfect-indicative-singular":"legalizam","imperfect-indicative-second-person-singular":"legalizai","imperfect-indicative-singular-third-person":"legaliza","first-person-imperfect-indicative-plural":"legalizam","imperfect-indicative-plural-second-person":"legalizați","imperfect-indicative-plural-third-person":"legalizau","first-person-indicative-perfect-singular":"legalizai","indicative-perfect-second-person-singular":"legalizași","indicative-perfect-singular-third-person":"legaliză","first-person-indicative-perfect-plural":"legalizarăm","indicative-perfect-plural-second-person":"legalizarăți","indicative-perfect-plural-third-person":"legalizară","first-person-indicative-pluperfect-singular":"legalizasem","indicative-pluperfect-second-person-singular":"legalizaseși","indicative-pluperfect-singular-third-person":"legalizase","first-person-indicative-pluperfect-plural":"legalizaserăm","indicative-pluperfect-plural-second-person":"legalizaserăți","indicative-pluperfect-plural-third-person":"legalizaseră","first-person-present-singular-subjunctive":"să legalizez","present-second-person-singular-subjunctive":"să legalizezi","present-singular-subjunctive-third-person":"să legalizeze","first-person-plural-present-subjunctive":"să legalizăm","plural-present-second-person-subjunctive":"să legalizați","plural-present-subjunctive-third-person":"să legalizeze","imperative-second-person-singular":"legalizează","imperative-plural-second-person":"legalizați","imperative-negative-second-person-singular":"nu legaliza","imperative-negative-plural-second-person":"nu legalizați"}},{"word":"legalizare","pos":"noun","definitions":["legalization"],"forms":{"plural":"legalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"legalizare","accusative-definite-nominative-singular":"legalizarea","accusative-indefinite-nominative-plural":"legalizări","accusative-definite-nominative-plural":"legalizările","dative-genitive-indefinite-singular":"legalizări","dative-definite-genitive-singular":"legalizării","dative-genitive-indefinite-plural":"legalizări","dative-definite-genitive-plural":"legalizărilor","singular-vocative":"legalizare","plural-vocative":"legalizărilor"}},{"word":"legalizat","pos":"adj","definitions":["legalized"],"forms":{"feminine-singular":"legalizată","masculine-plural":"legalizați","feminine-neuter-plural":"legalizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"legalizat","error-unrecognized-form-feminine-indefinite-singular":"legalizată","error-unrecognized-form-indefinite-masculine-plural":"legalizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"legalizate","definite-error-unrecognized-form-masculine-neuter-singular":"legalizatul","definite-error-unrecognized-form-feminine-singular":"legalizata","definite-error-unrecognized-form-masculine-plural":"legalizații","definite-error-unrecognized-form-feminine-neuter-plural":"legalizatele"}},{"word":"legalizație","pos":"noun","definitions":["legalization (process of making something legal)"],"forms":{"plural":"legalizații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"legalizație","accusative-definite-nominative-singular":"legalizația","accusative-indefinite-nominative-plural":"legalizații","accusative-definite-nominative-plural":"legalizațiile","dative-genitive-indefinite-singular":"legalizații","dative-definite-genitive-singular":"legalizației","dative-genitive-indefinite-plural":"legalizații","dative-definite-genitive-plural":"legalizațiilor","singular-vocative":"legalizație","plural-vocative":"legalizațiilor"}},{"word":"legalmente","pos":"adv","definitions":["legally"]},{"word":"legam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of lega"],"pronunciation":"[leˈɡam]"},{"word":"legământ","pos":"noun","definitions":["pledge, promise, agreement, bond, covenant, oath, vow"],"pronunciation":"[le.ɡəˈmɨnt]","forms":{"plural":"legăminte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"legământ","accusative-definite-nominative-singular":"legământul","accusative-indefinite-nominative-plural":"legăminte","accusative-definite-nominative-plural":"legămintele","dative-genitive-indefinite-singular":"legământ","dative-definite-genitive-singular":"legământului","dative-genitive-indefinite-plural":"legăminte","dative-definite-genitive-plural":"legămintelor","singular-vocative":"legământule","plural-vocative":"legămintelor"}},{"word":"legăna","pos":"verb","definitions":["to rock, swing","to sway"],"forms":{"canonical":"a legăna 1st conjugation","present-singular-third-person":"leagănă","participle-past":"legănat","subjunctive-third-person":"legene","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a legăna","gerund":"legănând","first-person-indicative-present-singular":"legăn","indicative-present-second-person-singular":"legeni","indicative-present-singular-third-person":"leagănă","first-person-indicative-plural-present":"legănăm","indicative-plural-present-second-person":"legănați","indicative-plural-present-third-person":"leagănă","first-person-imperfect-indicative-singular":"legănam","imperfect-indicative-second-person-singular":"legănai","imperfect-indicative-singular-third-person":"legăna","first-person-imperfect-indicative-plural":"legănam","imperfect-indicative-plural-second-person":"legănați","imperfect-indicative-plural-third-person":"legănau","first-person-indicative-perfect-singular":"legănai","indicative-perfect-second-person-singular":"legănași","indicative-perfect-singular-third-person":"legănă","first-person-indicative-perfect-plural":"legănarăm","indicative-perfect-plural-second-person":"legănarăți","indicative-perfect-plural-third-person":"legănară","first-person-indicative-pluperfect-singular":"legănasem","indicative-pluperfect-second-person-singular":"legănaseși","indicative-pluperfect-singular-third-person":"legănase","first-person-indicative-pluperfect-plural":"legănaserăm","indicative-pluperfect-plural-second-person":"legănaserăți","indicative-pluperfect-plural-third-person":"legănaseră","first-person-present-singular-subjunctive":"să legăn","present-second-person-singular-subjunctive":"să legeni","present-singular-subjunctive-third-person":"să legene","first-person-plural-present-subjunctive":"să legănăm","plural-present-second-person-subjunctive":"să legănați","plural-present-subjunctive-third-person":"să legene","imperative-second-person-singular":"leagănă","imperative-plural-second-person":"legănați","imperative-negative-second-person-singular":"nu legăna","imperative-negative-plural-second-person":"nu legănați"}},{"word":"legănare","pos":"noun","definitions":["swinging"],"forms":{"plural":"legănări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"legănare","accusative-definite-nominative-singular":"legănarea","accusative-indefinite-nominative-plural":"legănări","accusative-definite-nominative-plural":"legănările","dative-genitive-indefinite-singular":"legănări","dative-definite-genitive-singular":"legănării","dative-genitive-indefinite-plural":"legănări","dative-definite-genitive-plural":"legănărilor","singular-vocative":"legănare","plural-vocative":"legănărilor"}},{"word":"legănaș","pos":"noun","definitions":["diminutive of leagăn; small swing"],"forms":{"plural":"legănașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"legănaș","accusative-definite-nominative-singular":"legănașul","accusative-indefinite-nominative-plural":"legănașe","accusative-definite-nominative-plural":"legănașele","dative-genitive-indefinite-singular":"legănaș","dative-definite-genitive-singular":"legănașului","dative-genitive-indefinite-plural":"legănașe","dative-definite-genitive-plural":"legănașelor","singular-vocative":"legănașule","plural-vocative":"legănașelor"}},{"word":"legănat","pos":"adj","definitions":["swinging"],"forms":{"feminine-singular":"legănată","masculine-plural":"legănați","feminine-neuter-plural":"legănate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"legănat","error-unrecognized-form-feminine-indefinite-singular":"legănată","error-unrecognized-form-indefinite-masculine-plural":"legănați","error-unrecognized-form-feminine-indefinite-neuter-plural":"legănate","definite-error-unrecognized-form-masculine-neuter-singular":"legănatul","definite-error-unrecognized-form-feminine-singular":"legănata","definite-error-unrecognized-form-masculine-plural":"legănații","definite-error-unrecognized-form-feminine-neuter-plural":"legănatele"}},{"word":"legănător","pos":"adj","definitions":["rocking"],"forms":{"feminine-singular":"legănătoare","masculine-plural":"legănători","feminine-neuter-plural":"legănătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"legănător","error-unrecognized-form-feminine-indefinite-singular":"legănătoare","error-unrecognized-form-indefinite-masculine-plural":"legănători","error-unrecognized-form-feminine-indefinite-neuter-plural":"legănătoare","definite-error-unrecognized-form-masculine-neuter-singular":"legănătorul","definite-error-unrecognized-form-feminine-singular":"legănătoarea","definite-error-unrecognized-form-masculine-plural":"legănătorii","definite-error-unrecognized-form-feminine-neuter-plural":"legănătoarele"}},{"word":"legănătură","pos":"noun","definitions":["rocking"],"forms":{"plural":"legănături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"legănătură","accusative-definite-nominative-singular":"legănătura","accusative-indefinite-nominative-plural":"legănături","accusative-definite-nominative-plural":"legănăturile","dative-genitive-indefinite-singular":"legănături","dative-definite-genitive-singular":"legănăturii","dative-genitive-indefinite-plural":"legănături","dative-definite-genitive-plural":"legănăturilor","singular-vocative":"legănătură","plural-vocative":"legănăturilor"}},{"word":"legănel","pos":"noun","definitions":["diminutive of leagăn; small swing, craddle"],"forms":{"plural":"legănele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"legănel","accusative-definite-nominative-singular":"legănelul","accusative-indefinite-nominative-plural":"legănele","accusative-definite-nominative-plural":"legănelele","dative-genitive-indefinite-singular":"legănel","dative-definite-genitive-singular":"legănelului","dative-genitive-indefinite-plural":"legănele","dative-definite-genitive-plural":"legănelelor","singular-vocative":"legănelule","plural-vocative":"legănelelor"}},{"word":"legănior","pos":"noun","definitions":["diminutive of leagăn"],"forms":{"plural":"legănioare","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"legănior","accusative-definite-nominative-singular":"legăniorul","accusative-indefinite-nominative-plural":"legănioare","accusative-definite-nominative-plural":"legănioarei","dative-genitive-indefinite-singular":"legănior","dative-definite-genitive-singular":"legăniorului","dative-genitive-indefinite-plural":"legănioare","dative-definite-genitive-plural":"legănioarelor","singular-vocative":"legăniorule","plural-vocative":"legănioarelor"}},{"word":"Legănuș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Legănuș"}},{"word":"legănuș","pos":"noun","definitions":["diminutive of leagăn; small swing, craddle"],"forms":{"plural":"legănușe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"legănuș","accusative-definite-nominative-singular":"legănușul","accusative-indefinite-nominative-plural":"legănușe","accusative-definite-nominative-plural":"legănușele","dative-genitive-indefinite-singular":"legănuș","dative-definite-genitive-singular":"legănușului","dative-genitive-indefinite-plural":"legănușe","dative-definite-genitive-plural":"legănușelor","singular-vocative":"legănușule","plural-vocative":"legănușelor"}},{"word":"legănuț","pos":"noun","definitions":["diminutive of leagăn; small swing, craddle"],"forms":{"plural":"legănuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"legănuț","accusative-definite-nominative-singular":"legănuțul","accusative-indefinite-nominative-plural":"legănuțe","accusative-definite-nominative-plural":"legănuțele","dative-genitive-indefinite-singular":"legănuț","dative-definite-genitive-singular":"legănuțului","dative-genitive-indefinite-plural":"legănuțe","dative-definite-genitive-plural":"legănuțelor","singular-vocative":"legănuțule","plural-vocative":"legănuțelor"}},{"word":"legar","pos":"noun","definitions":["ruler (instrument)"],"forms":{"plural":"legare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"legar","accusative-definite-nominative-singular":"legarul","accusative-indefinite-nominative-plural":"legare","accusative-definite-nominative-plural":"legarele","dative-genitive-indefinite-singular":"legar","dative-definite-genitive-singular":"legarului","dative-genitive-indefinite-plural":"legare","dative-definite-genitive-plural":"legarelor","singular-vocative":"legarule","plural-vocative":"legarelor"}},{"word":"legare","pos":"noun","definitions":["binding"],"pronunciation":"/leˈɡa.re/","forms":{"plural":"legări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"legare","accusative-definite-nominative-singular":"legarea","accusative-indefinite-nominative-plural":"legări","accusative-definite-nominative-plural":"legările","dative-genitive-indefinite-singular":"legări","dative-definite-genitive-singular":"legării","dative-genitive-indefinite-plural":"legări","dative-definite-genitive-plural":"legărilor","singular-vocative":"legare","plural-vocative":"legărilor","alternative":"легаре"}},{"word":"legase","pos":"verb","definitions":["third-person singular pluperfect indicative of lega"],"pronunciation":"[leˈɡase]"},{"word":"legat","pos":"adj","definitions":["tied, bound"],"forms":{"feminine-singular":"legată","masculine-plural":"legați","feminine-neuter-plural":"legate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"legat","error-unrecognized-form-feminine-indefinite-singular":"legată","error-unrecognized-form-indefinite-masculine-plural":"legați","error-unrecognized-form-feminine-indefinite-neuter-plural":"legate","definite-error-unrecognized-form-masculine-neuter-singular":"legatul","definite-error-unrecognized-form-feminine-singular":"legata","definite-error-unrecognized-form-masculine-plural":"legații","definite-error-unrecognized-form-feminine-neuter-plural":"legatele"}},{"word":"legat","pos":"adv","definitions":["coherently"]},{"word":"legat","pos":"verb","definitions":["past participle of lega"],"forms":{"participle-past":"of lega","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"legat","error-unrecognized-form-feminine-indefinite-singular":"legată","error-unrecognized-form-indefinite-masculine-plural":"legați","error-unrecognized-form-feminine-indefinite-neuter-plural":"legate","definite-error-unrecognized-form-masculine-neuter-singular":"legatul","definite-error-unrecognized-form-feminine-singular":"legata","definite-error-unrecognized-form-masculine-plural":"legații","definite-error-unrecognized-form-feminine-neuter-plural":"legatele"}},{"word":"legatar","pos":"noun","definitions":["legatee"],"forms":{"plural":"legatari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"legatar","accusative-definite-nominative-singular":"legatarul","accusative-indefinite-nominative-plural":"legatari","accusative-definite-nominative-plural":"legatarii","dative-genitive-indefinite-singular":"legatar","dative-definite-genitive-singular":"legatarului","dative-genitive-indefinite-plural":"legatari","dative-definite-genitive-plural":"legatarilor","singular-vocative":"legatarule","plural-vocative":"legatarilor"}},{"word":"legatară","pos":"noun","definitions":["female equivalent of legatar"],"forms":{"plural":"legatare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"legatară","accusative-definite-nominative-singular":"legatara","accusative-indefinite-nominative-plural":"legatare","accusative-definite-nominative-plural":"legatarele","dative-genitive-indefinite-singular":"legatare","dative-definite-genitive-singular":"legatarei","dative-genitive-indefinite-plural":"legatare","dative-definite-genitive-plural":"legatarelor","singular-vocative":"legatară","plural-vocative":"legatarelor"}},{"word":"legație","pos":"noun","definitions":["legation"],"forms":{"plural":"legații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"legație","accusative-definite-nominative-singular":"legația","accusative-indefinite-nominative-plural":"legații","accusative-definite-nominative-plural":"legațiile","dative-genitive-indefinite-singular":"legații","dative-definite-genitive-singular":"legației","dative-genitive-indefinite-plural":"legații","dative-definite-genitive-plural":"legațiilor","singular-vocative":"legație","plural-vocative":"legațiilor"}},{"word":"legațiune","pos":"noun","definitions":["alternative form of legație"],"forms":{"plural":"legațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"legațiune","accusative-definite-nominative-singular":"legațiunea","accusative-indefinite-nominative-plural":"legațiuni","accusative-definite-nominative-plural":"legațiunile","dative-genitive-indefinite-singular":"legațiuni","dative-definite-genitive-singular":"legațiunii","dative-genitive-indefinite-plural":"legațiuni","dative-definite-genitive-plural":"legațiunilor","singular-vocative":"legațiune","plural-vocative":"legațiunilor"}},{"word":"legato","pos":"adv","definitions":["legato"]},{"word":"legătoare","pos":"noun","definitions":["female equivalent of legător"],"forms":{"plural":"legătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"legătoare","accusative-definite-nominative-singular":"legătoarea","accusative-indefinite-nominative-plural":"legătoare","accusative-definite-nominative-plural":"legătoarele","dative-genitive-indefinite-singular":"legătoare","dative-definite-genitive-singular":"legătoarei","dative-genitive-indefinite-plural":"legătoare","dative-definite-genitive-plural":"legătoarelor","singular-vocative":"legătoare","plural-vocative":"legătoarelor"}},{"word":"legător","pos":"noun","definitions":["bookbinder"],"forms":{"plural":"legători","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"legător","accusative-definite-nominative-singular":"legătorul","accusative-indefinite-nominative-plural":"legători","accusative-definite-nominative-plural":"legătorii","dative-genitive-indefinite-singular":"legător","dative-definite-genitive-singular":"legătorului","dative-genitive-indefinite-plural":"legători","dative-definite-genitive-plural":"legătorilor","singular-vocative":"legătorule","plural-vocative":"legătorilor"}},{"word":"legătoreasă","pos":"noun","definitions":["female equivalent of legător"],"forms":{"plural":"legătorese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"legătoreasă","accusative-definite-nominative-singular":"legătoreasa","accusative-indefinite-nominative-plural":"legătorese","accusative-definite-nominative-plural":"legătoresele","dative-genitive-indefinite-singular":"legătorese","dative-definite-genitive-singular":"legătoresei","dative-genitive-indefinite-plural":"legătorese","dative-definite-genitive-plural":"legătoreselor","singular-vocative":"legătoreasă","plural-vocative":"legătoreselor"}},{"word":"legătorie","pos":"noun","definitions":["bookbinding"],"forms":{"plural":"legătorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"legătorie","accusative-definite-nominative-singular":"legătoria","accusative-indefinite-nominative-plural":"legătorii","accusative-definite-nominative-plural":"legătoriile","dative-genitive-indefinite-singular":"legătorii","dative-definite-genitive-singular":"legătoriei","dative-genitive-indefinite-plural":"legătorii","dative-definite-genitive-plural":"legătoriilor","singular-vocative":"legătorie","plural-vocative":"legătoriilor"}},{"word":"legatui","pos":"verb","definitions":["to bequeath"],"forms":{"canonical":"a legatui 4th conjugation","present-singular-third-person":"legatuie","participle-past":"legatuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a legatui","gerund":"legatuind","first-person-indicative-present-singular":"legatui","indicative-present-second-person-singular":"legatui","indicative-present-singular-third-person":"legatuie","first-person-indicative-plural-present":"legatuim","indicative-plural-present-second-person":"legatuiți","indicative-plural-present-third-person":"legatuie","first-person-imperfect-indicative-singular":"legatuiam","imperfect-indicative-second-person-singular":"legatuiai","imperfect-indicative-singular-third-person":"legatuia","first-person-imperfect-indicative-plural":"legatuiam","imperfect-indicative-plural-second-person":"legatuiați","imperfect-indicative-plural-third-person":"legatuiau","first-person-indicative-perfect-singular":"legatuii","indicative-perfect-second-person-singular":"legatuiși","indicative-perfect-singular-third-person":"legatui","first-person-indicative-perfect-plural":"legatuirăm","indicative-perfect-plural-second-person":"legatuirăți","indicative-perfect-plural-third-person":"legatuiră","first-person-indicative-pluperfect-singular":"legatuisem","indicative-pluperfect-second-person-singular":"legatuiseși","indicative-pluperfect-singular-third-person":"legatuise","first-person-indicative-pluperfect-plural":"legatuiserăm","indicative-pluperfect-plural-second-person":"legatuiserăți","indicative-pluperfect-plural-third-person":"legatuiseră","first-person-present-singular-subjunctive":"să legatui","present-second-person-singular-subjunctive":"să legatui","present-singular-subjunctive-third-person":"să legatuie","first-person-plural-present-subjunctive":"să legatuim","plural-present-second-person-subjunctive":"să legatuiți","plural-present-subjunctive-third-person":"să legatuie","imperative-second-person-singular":"legatuie","imperative-plural-second-person":"legatuiți","imperative-negative-second-person-singular":"nu legatui","imperative-negative-plural-second-person":"nu legatuiți"}},{"word":"legătuială","pos":"noun","definitions":["agreement"],"forms":{"plural":"legătuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"legătuială","accusative-definite-nominative-singular":"legătuiala","accusative-indefinite-nominative-plural":"legătuiele","accusative-definite-nominative-plural":"legătuielele","dative-genitive-indefinite-singular":"legătuiele","dative-definite-genitive-singular":"legătuielei","dative-genitive-indefinite-plural":"legătuiele","dative-definite-genitive-plural":"legătuielelor","singular-vocative":"legătuială","plural-vocative":"legătuielelor"}},{"word":"legătuire","pos":"noun","definitions":["ending"],"forms":{"plural":"legătuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"legătuire","accusative-definite-nominative-singular":"legătuirea","accusative-indefinite-nominative-plural":"legătuiri","accusative-definite-nominative-plural":"legătuirile","dative-genitive-indefinite-singular":"legătuiri","dative-definite-genitive-singular":"legătuirii","dative-genitive-indefinite-plural":"legătuiri","dative-definite-genitive-plural":"legătuirilor","singular-vocative":"legătuire","plural-vocative":"legătuirilor"}},{"word":"legatuit","pos":"adj","definitions":["left as inheritance"],"forms":{"feminine-singular":"legatuită","masculine-plural":"legatuiți","feminine-neuter-plural":"legatuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"legatuit","error-unrecognized-form-feminine-indefinite-singular":"legatuită","error-unrecognized-form-indefinite-masculine-plural":"legatuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"legatuite","definite-error-unrecognized-form-masculine-neuter-singular":"legatuitul","definite-error-unrecognized-form-feminine-singular":"legatuita","definite-error-unrecognized-form-masculine-plural":"legatuiții","definite-error-unrecognized-form-feminine-neuter-plural":"legatuitele"}},{"word":"legatuit","pos":"verb","definitions":["past participle of legatui"],"forms":{"participle-past":"of legatui"}},{"word":"legătura","pos":"noun","definitions":["definite nominative/accusative singular of legătură"]},{"word":"legătură","pos":"noun","definitions":["connection, link, correlation, relationship of cause and effect","connection of similarity, something to do with","human relationship, relation, connection, bond","contact, link, attachment, connection","connection, line"],"pronunciation":"/le.ɡəˈtu.rə/","examples":[{"ro":"a se afla în strânsă legătură cu","en":"to be closely linked to"},{"ro":"a face legătura","en":"to make the connection"},{"ro":"a pune în legătură","en":"to correlate, link"}],"forms":{"plural":"legături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"legătură","accusative-definite-nominative-singular":"legătura","accusative-indefinite-nominative-plural":"legături","accusative-definite-nominative-plural":"legăturile","dative-genitive-indefinite-singular":"legături","dative-definite-genitive-singular":"legăturii","dative-genitive-indefinite-plural":"legături","dative-definite-genitive-plural":"legăturilor","singular-vocative":"legătură","plural-vocative":"legăturilor"}},{"word":"legătură chimică","pos":"noun","definitions":["chemical bond"],"forms":{"plural":"legături chimice"}},{"word":"legătură covalentă","pos":"noun","definitions":["covalent bond"],"forms":{"plural":"legături covalente"}},{"word":"legătură ionică","pos":"noun","definitions":["ionic bond"],"forms":{"plural":"legături ionice"}},{"word":"legătură peptidică","pos":"noun","definitions":["peptide bond"],"forms":{"plural":"legături peptidice"}},{"word":"legături","pos":"noun","definitions":["inflection of legătură:","plural","genitive/dative singular"]},{"word":"legăturică","pos":"noun","definitions":["diminutive of legătură; small bunch"],"forms":{"plural":"legăturici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"legăturică","accusative-definite-nominative-singular":"legăturica","accusative-indefinite-nominative-plural":"legăturice","accusative-definite-nominative-plural":"legăturicele","dative-genitive-indefinite-singular":"legăturice","dative-definite-genitive-singular":"legăturicei","dative-genitive-indefinite-plural":"legăturice","dative-definite-genitive-plural":"legăturicelor","singular-vocative":"legăturică","plural-vocative":"legăturicelor"}},{"word":"legăturii","pos":"noun","definitions":["definite dative/genitive singular of legătură"]},{"word":"legăturile","pos":"noun","definitions":["definite nominative/accusative plural of legătură"]},{"word":"legăturilor","pos":"noun","definitions":["inflection of legătură:","definite genitive/dative plural","vocative plural"]},{"word":"legăturiță","pos":"noun","definitions":["diminutive of legătură"],"forms":{"plural":"legăturițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"legăturiță","accusative-definite-nominative-singular":"legăturița","accusative-indefinite-nominative-plural":"legăturițe","accusative-definite-nominative-plural":"legăturițele","dative-genitive-indefinite-singular":"legăturițe","dative-definite-genitive-singular":"legăturiței","dative-genitive-indefinite-plural":"legăturițe","dative-definite-genitive-plural":"legăturițelor","singular-vocative":"legăturiță","plural-vocative":"legăturițelor"}},{"word":"lege","pos":"noun","definitions":["law","religion, belief (in God or a divinity), credence"],"pronunciation":"/ˈled͡ʒe/","forms":{"plural":"legi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lege","accusative-definite-nominative-singular":"legea","accusative-indefinite-nominative-plural":"legi","accusative-definite-nominative-plural":"legile","dative-genitive-indefinite-singular":"legi","dative-definite-genitive-singular":"legii","dative-genitive-indefinite-plural":"legi","dative-definite-genitive-plural":"legilor","singular-vocative":"lege","plural-vocative":"legilor"}},{"word":"lege","pos":"verb","definitions":["third-person singular/plural present subjunctive of lega"],"pronunciation":"/ˈled͡ʒe/"},{"word":"lege marțială","pos":"noun","definitions":["martial law"]},{"word":"lege nescrisă","pos":"noun","definitions":["unwritten rule"],"forms":{"plural":"legi nescrise"}},{"word":"legea","pos":"noun","definitions":["definite nominative/accusative singular of lege"],"pronunciation":"[ˈled͡ʒe̯a]","gender":"f"},{"word":"legea salică","pos":"noun","definitions":["Salic law"]},{"word":"legendă","pos":"noun","definitions":["legend"],"forms":{"plural":"legende","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"legendă","accusative-definite-nominative-singular":"legenda","accusative-indefinite-nominative-plural":"legende","accusative-definite-nominative-plural":"legendele","dative-genitive-indefinite-singular":"legende","dative-definite-genitive-singular":"legendei","dative-genitive-indefinite-plural":"legende","dative-definite-genitive-plural":"legendelor","singular-vocative":"legendă","plural-vocative":"legendelor"}},{"word":"legendar","pos":"adj","definitions":["legendary"],"pronunciation":"/ˌle.d͡ʒenˈdar/","forms":{"feminine-singular":"legendară","masculine-plural":"legendari","feminine-neuter-plural":"legendare","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"legendar","error-unrecognized-form-feminine-indefinite-singular":"legendară","error-unrecognized-form-indefinite-masculine-plural":"legendari","error-unrecognized-form-feminine-indefinite-neuter-plural":"legendare","definite-error-unrecognized-form-masculine-neuter-singular":"legendarul","definite-error-unrecognized-form-feminine-singular":"legendara","definite-error-unrecognized-form-masculine-plural":"legendarii","definite-error-unrecognized-form-feminine-neuter-plural":"legendarele"}},{"word":"legendari","pos":"adj","definitions":["nominative/accusative masculine plural of legendar"],"pronunciation":"[ˌle.d͡ʒenˈdarʲ]"},{"word":"legene","pos":"verb","definitions":["third-person singular/plural present subjunctive of legăna"],"pronunciation":"[ˈled͡ʒene]"},{"word":"legere","pos":"noun","definitions":["reading"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"legere","accusative-definite-nominative":"legerea","dative-genitive-indefinite":"legeri","dative-definite-genitive":"legerii","vocative":"legere"}},{"word":"leghe","pos":"noun","definitions":["league (distance)"],"forms":{"plural":"leghe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"leghe","accusative-definite-nominative-singular":"leghea","accusative-indefinite-nominative-plural":"leghe","accusative-definite-nominative-plural":"leghele","dative-genitive-indefinite-singular":"leghe","dative-definite-genitive-singular":"leghei","dative-genitive-indefinite-plural":"leghe","dative-definite-genitive-plural":"leghelor","singular-vocative":"leghe","plural-vocative":"leghelor"}},{"word":"Leghia","pos":"name","definitions":["a village in Aghireșu, Cluj County, Romania"],"gender":"f"},{"word":"leghian","pos":"noun","definitions":["obsolete form of lighean"],"forms":{"plural":"leghiane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"leghian","accusative-definite-nominative-singular":"leghianul","accusative-indefinite-nominative-plural":"leghiane","accusative-definite-nominative-plural":"leghianele","dative-genitive-indefinite-singular":"leghian","dative-definite-genitive-singular":"leghianului","dative-genitive-indefinite-plural":"leghiane","dative-definite-genitive-plural":"leghianelor","singular-vocative":"leghianule","plural-vocative":"leghianelor"}},{"word":"Leghin","pos":"name","definitions":["a village in Pipirig, Neamț County, Romania"],"gender":"m"},{"word":"leghion","pos":"noun","definitions":["obsolete form of legiune"],"forms":{"plural":"leghioane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"leghion","accusative-definite-nominative-singular":"leghionul","accusative-indefinite-nominative-plural":"leghioane","accusative-definite-nominative-plural":"leghioanele","dative-genitive-indefinite-singular":"leghion","dative-definite-genitive-singular":"leghionului","dative-genitive-indefinite-plural":"leghioane","dative-definite-genitive-plural":"leghioanelor","singular-vocative":"leghionule","plural-vocative":"leghioanelor"}},{"word":"legi","pos":"noun","definitions":["plural of lege (“laws”)"],"pronunciation":"[led͡ʒʲ]","gender":"f-p"},{"word":"legi","pos":"verb","definitions":["second-person singular present indicative of lega: you tie","second-person singular present subjunctive of lega"],"pronunciation":"[led͡ʒʲ]"},{"word":"legibil","pos":"adj","definitions":["readable"],"forms":{"feminine-singular":"legibilă","masculine-plural":"legibili","feminine-neuter-plural":"legibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"legibil","error-unrecognized-form-feminine-indefinite-singular":"legibilă","error-unrecognized-form-indefinite-masculine-plural":"legibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"legibile","definite-error-unrecognized-form-masculine-neuter-singular":"legibilul","definite-error-unrecognized-form-feminine-singular":"legibila","definite-error-unrecognized-form-masculine-plural":"legibilii","definite-error-unrecognized-form-feminine-neuter-plural":"legibilele"}},{"word":"legibilitate","pos":"noun","definitions":["legibility"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"legibilitate","accusative-definite-nominative":"legibilitatea","dative-genitive-indefinite":"legibilități","dative-definite-genitive":"legibilității","vocative":"legibilitate"}},{"word":"legic","pos":"adj","definitions":["lawlike"],"forms":{"feminine-singular":"legică","masculine-plural":"legici","feminine-neuter-plural":"legice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"legic","error-unrecognized-form-feminine-indefinite-singular":"legică","error-unrecognized-form-indefinite-masculine-plural":"legici","error-unrecognized-form-feminine-indefinite-neuter-plural":"legice","definite-error-unrecognized-form-masculine-neuter-singular":"legicul","definite-error-unrecognized-form-feminine-singular":"legica","definite-error-unrecognized-form-masculine-plural":"legicii","definite-error-unrecognized-form-feminine-neuter-plural":"legicele"}},{"word":"legifer","pos":"adj","definitions":["law-giving"],"forms":{"feminine-singular":"legiferă","masculine-plural":"legiferi","feminine-neuter-plural":"legifere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"legifer","error-unrecognized-form-feminine-indefinite-singular":"legiferă","error-unrecognized-form-indefinite-masculine-plural":"legiferi","error-unrecognized-form-feminine-indefinite-neuter-plural":"legifere","definite-error-unrecognized-form-masculine-neuter-singular":"legiferul","definite-error-unrecognized-form-feminine-singular":"legifera","definite-error-unrecognized-form-masculine-plural":"legiferii","definite-error-unrecognized-form-feminine-neuter-plural":"legiferele"}},{"word":"legifera","pos":"verb","definitions":["to legislate"],"forms":{"canonical":"a legifera 1st conjugation","present-singular-third-person":"legiferează","participle-past":"legiferat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a legifera","gerund":"legiferând","first-person-indicative-present-singular":"legiferez","indicative-present-second-person-singular":"legiferezi","indicative-present-singular-third-person":"legiferează","first-person-indicative-plural-present":"legiferăm","indicative-plural-present-second-person":"legiferați","indicative-plural-present-third-person":"legiferează","first-person-imperfect-indicative-singular":"legiferam","imperfect-indicative-second-person-singular":"legiferai","imperfect-indicative-singular-third-person":"legifera","first-person-imperfect-indicative-plural":"legiferam","imperfect-indicative-plural-second-person":"legiferați","imperfect-indicative-plural-third-person":"legiferau","first-person-indicative-perfect-singular":"legiferai","indicative-perfect-second-person-singular":"legiferași","indicative-perfect-singular-third-person":"legiferă","first-person-indicative-perfect-plural":"legiferarăm","indicative-perfect-plural-second-person":"legiferarăți","indicative-perfect-plural-third-person":"legiferară","first-person-indicative-pluperfect-singular":"legiferasem","indicative-pluperfect-second-person-singular":"legiferaseși","indicative-pluperfect-singular-third-person":"legiferase","first-person-indicative-pluperfect-plural":"legiferaserăm","indicative-pluperfect-plural-second-person":"legiferaserăți","indicative-pluperfect-plural-third-person":"legiferaseră","first-person-present-singular-subjunctive":"să legiferez","present-second-person-singular-subjunctive":"să legiferezi","present-singular-subjunctive-third-person":"să legifereze","first-person-plural-present-subjunctive":"să legiferăm","plural-present-second-person-subjunctive":"să legiferați","plural-present-subjunctive-third-person":"să legifereze","imperative-second-person-singular":"legiferează","imperative-plural-second-person":"legiferați","imperative-negative-second-person-singular":"nu legifera","imperative-negative-plural-second-person":"nu legiferați"}},{"word":"legiferare","pos":"noun","definitions":["enactment (of a law)"],"forms":{"plural":"legiferări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"legiferare","accusative-definite-nominative-singular":"legiferarea","accusative-indefinite-nominative-plural":"legiferări","accusative-definite-nominative-plural":"legiferările","dative-genitive-indefinite-singular":"legiferări","dative-definite-genitive-singular":"legiferării","dative-genitive-indefinite-plural":"legiferări","dative-definite-genitive-plural":"legiferărilor","singular-vocative":"legiferare","plural-vocative":"legiferărilor"}},{"word":"legiferat","pos":"adj","definitions":["enacted (of a law)"],"forms":{"feminine-singular":"legiferată","masculine-plural":"legiferați","feminine-neuter-plural":"legiferate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"legiferat","error-unrecognized-form-feminine-indefinite-singular":"legiferată","error-unrecognized-form-indefinite-masculine-plural":"legiferați","error-unrecognized-form-feminine-indefinite-neuter-plural":"legiferate","definite-error-unrecognized-form-masculine-neuter-singular":"legiferatul","definite-error-unrecognized-form-feminine-singular":"legiferata","definite-error-unrecognized-form-masculine-plural":"legiferații","definite-error-unrecognized-form-feminine-neuter-plural":"legiferatele"}},{"word":"legiferat","pos":"verb","definitions":["past participle of legifera"],"forms":{"participle-past":"of legifera"}},{"word":"legiferator","pos":"adj","definitions":["legislating"],"forms":{"feminine-singular":"legiferatoare","masculine-plural":"legiferatori","feminine-neuter-plural":"legiferatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"legiferator","error-unrecognized-form-feminine-indefinite-singular":"legiferatoare","error-unrecognized-form-indefinite-masculine-plural":"legiferatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"legiferatoare","definite-error-unrecognized-form-masculine-neuter-singular":"legiferatorul","definite-error-unrecognized-form-feminine-singular":"legiferatoarea","definite-error-unrecognized-form-masculine-plural":"legiferatorii","definite-error-unrecognized-form-feminine-neuter-plural":"legiferatoarele"}},{"word":"Legii","pos":"name","definitions":["a village in Geaca, Cluj County, Romania"],"gender":"m"},{"word":"legioană","pos":"noun","definitions":["alternative form of legiune"],"forms":{"plural":"legioane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"legioană","accusative-definite-nominative-singular":"legioana","accusative-indefinite-nominative-plural":"legioene","accusative-definite-nominative-plural":"legioenele","dative-genitive-indefinite-singular":"legioene","dative-definite-genitive-singular":"legioenei","dative-genitive-indefinite-plural":"legioene","dative-definite-genitive-plural":"legioenelor","singular-vocative":"legioană","plural-vocative":"legioenelor"}},{"word":"legionar","pos":"adj","definitions":["legionary"],"forms":{"feminine-singular":"legionară","masculine-plural":"legionari","feminine-neuter-plural":"legionare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"legionar","error-unrecognized-form-feminine-indefinite-singular":"legionară","error-unrecognized-form-indefinite-masculine-plural":"legionari","error-unrecognized-form-feminine-indefinite-neuter-plural":"legionare","definite-error-unrecognized-form-masculine-neuter-singular":"legionarul","definite-error-unrecognized-form-feminine-singular":"legionara","definite-error-unrecognized-form-masculine-plural":"legionarii","definite-error-unrecognized-form-feminine-neuter-plural":"legionarele"}},{"word":"legionară","pos":"noun","definitions":["female equivalent of legionar"],"forms":{"plural":"legionare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"legionară","accusative-definite-nominative-singular":"legionara","accusative-indefinite-nominative-plural":"legionare","accusative-definite-nominative-plural":"legionarele","dative-genitive-indefinite-singular":"legionare","dative-definite-genitive-singular":"legionarei","dative-genitive-indefinite-plural":"legionare","dative-definite-genitive-plural":"legionarelor","singular-vocative":"legionară","plural-vocative":"legionarelor"}},{"word":"legionarism","pos":"noun","definitions":["the ideology of the Iron Guard"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"legionarism","accusative-definite-nominative":"legionarismul","dative-genitive-indefinite":"legionarism","dative-definite-genitive":"legionarismului","vocative":"legionarismule"}},{"word":"legionariza","pos":"verb","definitions":["to become a member of the Iron Guard"],"forms":{"canonical":"a legionariza 1st conjugation","present-singular-third-person":"legionarizează","participle-past":"legionarizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a legionariza","gerund":"legionarizând","first-person-indicative-present-singular":"legionariz","indicative-present-second-person-singular":"legionarizi","indicative-present-singular-third-person":"legionariză","first-person-indicative-plural-present":"legionarizăm","indicative-plural-present-second-person":"legionarizați","indicative-plural-present-third-person":"legionariză","first-person-imperfect-indicative-singular":"legionarizam","imperfect-indicative-second-person-singular":"legionarizai","imperfect-indicative-singular-third-person":"legionariza","first-person-imperfect-indicative-plural":"legionarizam","imperfect-indicative-plural-second-person":"legionarizați","imperfect-indicative-plural-third-person":"legionarizau","first-person-indicative-perfect-singular":"legionarizai","indicative-perfect-second-person-singular":"legionarizași","indicative-perfect-singular-third-person":"legionariză","first-person-indicative-perfect-plural":"legionarizarăm","indicative-perfect-plural-second-person":"legionarizarăți","indicative-perfect-plural-third-person":"legionarizară","first-person-indicative-pluperfect-singular":"legionarizasem","indicative-pluperfect-second-person-singular":"legionarizaseși","indicative-pluperfect-singular-third-person":"legionarizase","first-person-indicative-pluperfect-plural":"legionarizaserăm","indicative-pluperfect-plural-second-person":"legionarizaserăți","indicative-pluperfect-plural-third-person":"legionarizaseră","first-person-present-singular-subjunctive":"să legionariz","present-second-person-singular-subjunctive":"să legionarizi","present-singular-subjunctive-third-person":"să legionarize","first-person-plural-present-subjunctive":"să legionarizăm","plural-present-second-person-subjunctive":"să legionarizați","plural-present-subjunctive-third-person":"să legionarize","imperative-second-person-singular":"legionariză","imperative-plural-second-person":"legionarizați","imperative-negative-second-person-singular":"nu legionariza","imperative-negative-plural-second-person":"nu legionarizați"}},{"word":"legisla","pos":"verb","definitions":["to legislate"],"pronunciation":"/le.d͡ʒisˈla/","forms":{"canonical":"a legisla 1st conjugation","present-singular-third-person":"legislează","participle-past":"legislat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a legisla","gerund":"legislând","first-person-indicative-present-singular":"legislez","indicative-present-second-person-singular":"legislezi","indicative-present-singular-third-person":"legislează","first-person-indicative-plural-present":"legislăm","indicative-plural-present-second-person":"legislați","indicative-plural-present-third-person":"legislează","first-person-imperfect-indicative-singular":"legislam","imperfect-indicative-second-person-singular":"legislai","imperfect-indicative-singular-third-person":"legisla","first-person-imperfect-indicative-plural":"legislam","imperfect-indicative-plural-second-person":"legislați","imperfect-indicative-plural-third-person":"legislau","first-person-indicative-perfect-singular":"legislai","indicative-perfect-second-person-singular":"legislași","indicative-perfect-singular-third-person":"legislă","first-person-indicative-perfect-plural":"legislarăm","indicative-perfect-plural-second-person":"legislarăți","indicative-perfect-plural-third-person":"legislară","first-person-indicative-pluperfect-singular":"legislasem","indicative-pluperfect-second-person-singular":"legislaseși","indicative-pluperfect-singular-third-person":"legislase","first-person-indicative-pluperfect-plural":"legislaserăm","indicative-pluperfect-plural-second-person":"legislaserăți","indicative-pluperfect-plural-third-person":"legislaseră","first-person-present-singular-subjunctive":"să legislez","present-second-person-singular-subjunctive":"să legislezi","present-singular-subjunctive-third-person":"să legisleze","first-person-plural-present-subjunctive":"să legislăm","plural-present-second-person-subjunctive":"să legislați","plural-present-subjunctive-third-person":"să legisleze","imperative-second-person-singular":"legislează","imperative-plural-second-person":"legislați","imperative-negative-second-person-singular":"nu legisla","imperative-negative-plural-second-person":"nu legislați"}},{"word":"legislare","pos":"noun","definitions":["legislation"],"forms":{"plural":"legislări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"legislare","accusative-definite-nominative-singular":"legislarea","accusative-indefinite-nominative-plural":"legislări","accusative-definite-nominative-plural":"legislările","dative-genitive-indefinite-singular":"legislări","dative-definite-genitive-singular":"legislării","dative-genitive-indefinite-plural":"legislări","dative-definite-genitive-plural":"legislărilor","singular-vocative":"legislare","plural-vocative":"legislărilor"}},{"word":"legislație","pos":"noun","definitions":["legislation"],"forms":{"plural":"legislații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"legislație","accusative-definite-nominative-singular":"legislația","accusative-indefinite-nominative-plural":"legislații","accusative-definite-nominative-plural":"legislațiile","dative-genitive-indefinite-singular":"legislații","dative-definite-genitive-singular":"legislației","dative-genitive-indefinite-plural":"legislații","dative-definite-genitive-plural":"legislațiilor","singular-vocative":"legislație","plural-vocative":"legislațiilor"}},{"word":"legislațiune","pos":"noun","definitions":["obsolete form of legislație"],"forms":{"plural":"legislațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"legislațiune","accusative-definite-nominative-singular":"legislațiunea","accusative-indefinite-nominative-plural":"legislațiuni","accusative-definite-nominative-plural":"legislațiunile","dative-genitive-indefinite-singular":"legislațiuni","dative-definite-genitive-singular":"legislațiunii","dative-genitive-indefinite-plural":"legislațiuni","dative-definite-genitive-plural":"legislațiunilor","singular-vocative":"legislațiune","plural-vocative":"legislațiunilor"}},{"word":"legislativ","pos":"adj","definitions":["legislative"],"forms":{"feminine-singular":"legislativă","masculine-plural":"legislativi","feminine-neuter-plural":"legislative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"legislativ","error-unrecognized-form-feminine-indefinite-singular":"legislativă","error-unrecognized-form-indefinite-masculine-plural":"legislativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"legislative","definite-error-unrecognized-form-masculine-neuter-singular":"legislativul","definite-error-unrecognized-form-feminine-singular":"legislativa","definite-error-unrecognized-form-masculine-plural":"legislativii","definite-error-unrecognized-form-feminine-neuter-plural":"legislativele"}},{"word":"legislator","pos":"noun","definitions":["legislator"],"forms":{"plural":"legislatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"legislator","accusative-definite-nominative-singular":"legislatorul","accusative-indefinite-nominative-plural":"legislatori","accusative-definite-nominative-plural":"legislatorii","dative-genitive-indefinite-singular":"legislator","dative-definite-genitive-singular":"legislatorului","dative-genitive-indefinite-plural":"legislatori","dative-definite-genitive-plural":"legislatorilor","singular-vocative":"legislatorule","plural-vocative":"legislatorilor"}},{"word":"legislatură","pos":"noun","definitions":["legislature"],"forms":{"plural":"legislaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"legislatură","accusative-definite-nominative-singular":"legislatura","accusative-indefinite-nominative-plural":"legislature","accusative-definite-nominative-plural":"legislaturele","dative-genitive-indefinite-singular":"legislature","dative-definite-genitive-singular":"legislaturei","dative-genitive-indefinite-plural":"legislature","dative-definite-genitive-plural":"legislaturelor","singular-vocative":"legislatură","plural-vocative":"legislaturelor"}},{"word":"legist","pos":"adj","definitions":["forensic"],"forms":{"feminine-singular":"legistă","masculine-plural":"legiști","feminine-neuter-plural":"legiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"legist","error-unrecognized-form-feminine-indefinite-singular":"legistă","error-unrecognized-form-indefinite-masculine-plural":"legiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"legiste","definite-error-unrecognized-form-masculine-neuter-singular":"legistul","definite-error-unrecognized-form-feminine-singular":"legista","definite-error-unrecognized-form-masculine-plural":"legiștii","definite-error-unrecognized-form-feminine-neuter-plural":"legistele"}},{"word":"legistă","pos":"noun","definitions":["female equivalent of legist"],"forms":{"plural":"legiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"legistă","accusative-definite-nominative-singular":"legista","accusative-indefinite-nominative-plural":"legiste","accusative-definite-nominative-plural":"legistele","dative-genitive-indefinite-singular":"legiste","dative-definite-genitive-singular":"legistei","dative-genitive-indefinite-plural":"legiste","dative-definite-genitive-plural":"legistelor","singular-vocative":"legistă","plural-vocative":"legistelor"}},{"word":"legitate","pos":"noun","definitions":["lawfulness"],"forms":{"plural":"legități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"legitate","accusative-definite-nominative-singular":"legitatea","accusative-indefinite-nominative-plural":"legități","accusative-definite-nominative-plural":"legitățile","dative-genitive-indefinite-singular":"legități","dative-definite-genitive-singular":"legității","dative-genitive-indefinite-plural":"legități","dative-definite-genitive-plural":"legităților","singular-vocative":"legitate","plural-vocative":"legităților"}},{"word":"legitim","pos":"adj","definitions":["legitimate"],"forms":{"feminine-singular":"legitimă","masculine-plural":"legitimi","feminine-neuter-plural":"legitime","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"legitim","error-unrecognized-form-feminine-indefinite-singular":"legitimă","error-unrecognized-form-indefinite-masculine-plural":"legitimi","error-unrecognized-form-feminine-indefinite-neuter-plural":"legitime","definite-error-unrecognized-form-masculine-neuter-singular":"legitimul","definite-error-unrecognized-form-feminine-singular":"legitima","definite-error-unrecognized-form-masculine-plural":"legitimii","definite-error-unrecognized-form-feminine-neuter-plural":"legitimele"}},{"word":"legitima","pos":"verb","definitions":["to legitimize"],"pronunciation":"/le.d͡ʒi.tiˈma/","forms":{"canonical":"a legitima 1st conjugation","present-singular-third-person":"legitimează","participle-past":"legitimat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a legitima","gerund":"legitimând","first-person-indicative-present-singular":"legitimez","indicative-present-second-person-singular":"legitimezi","indicative-present-singular-third-person":"legitimează","first-person-indicative-plural-present":"legitimăm","indicative-plural-present-second-person":"legitimați","indicative-plural-present-third-person":"legitimează","first-person-imperfect-indicative-singular":"legitimam","imperfect-indicative-second-person-singular":"legitimai","imperfect-indicative-singular-third-person":"legitima","first-person-imperfect-indicative-plural":"legitimam","imperfect-indicative-plural-second-person":"legitimați","imperfect-indicative-plural-third-person":"legitimau","first-person-indicative-perfect-singular":"legitimai","indicative-perfect-second-person-singular":"legitimași","indicative-perfect-singular-third-person":"legitimă","first-person-indicative-perfect-plural":"legitimarăm","indicative-perfect-plural-second-person":"legitimarăți","indicative-perfect-plural-third-person":"legitimară","first-person-indicative-pluperfect-singular":"legitimasem","indicative-pluperfect-second-person-singular":"legitimaseși","indicative-pluperfect-singular-third-person":"legitimase","first-person-indicative-pluperfect-plural":"legitimaserăm","indicative-pluperfect-plural-second-person":"legitimaserăți","indicative-pluperfect-plural-third-person":"legitimaseră","first-person-present-singular-subjunctive":"să legitimez","present-second-person-singular-subjunctive":"să legitimezi","present-singular-subjunctive-third-person":"să legitimeze","first-person-plural-present-subjunctive":"să legitimăm","plural-present-second-person-subjunctive":"să legitimați","plural-present-subjunctive-third-person":"să legitimeze","imperative-second-person-singular":"legitimează","imperative-plural-second-person":"legitimați","imperative-negative-second-person-singular":"nu legitima","imperative-negative-plural-second-person":"nu legitimați"}},{"word":"legitimă apărare","pos":"noun","definitions":["self-defense"]},{"word":"legitimare","pos":"noun","definitions":["legitimation"],"forms":{"plural":"legitimări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"legitimare","accusative-definite-nominative-singular":"legitimarea","accusative-indefinite-nominative-plural":"legitimări","accusative-definite-nominative-plural":"legitimările","dative-genitive-indefinite-singular":"legitimări","dative-definite-genitive-singular":"legitimării","dative-genitive-indefinite-plural":"legitimări","dative-definite-genitive-plural":"legitimărilor","singular-vocative":"legitimare","plural-vocative":"legitimărilor"}},{"word":"legitimat","pos":"adj","definitions":["legitimated"],"forms":{"feminine-singular":"legitimată","masculine-plural":"legitimați","feminine-neuter-plural":"legitimate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"legitimat","error-unrecognized-form-feminine-indefinite-singular":"legitimată","error-unrecognized-form-indefinite-masculine-plural":"legitimați","error-unrecognized-form-feminine-indefinite-neuter-plural":"legitimate","definite-error-unrecognized-form-masculine-neuter-singular":"legitimatul","definite-error-unrecognized-form-feminine-singular":"legitimata","definite-error-unrecognized-form-masculine-plural":"legitimații","definite-error-unrecognized-form-feminine-neuter-plural":"legitimatele"}},{"word":"legitimație","pos":"noun","definitions":["ID card","legitimation"],"forms":{"plural":"legitimații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"legitimație","accusative-definite-nominative-singular":"legitimația","accusative-indefinite-nominative-plural":"legitimații","accusative-definite-nominative-plural":"legitimațiile","dative-genitive-indefinite-singular":"legitimații","dative-definite-genitive-singular":"legitimației","dative-genitive-indefinite-plural":"legitimații","dative-definite-genitive-plural":"legitimațiilor","singular-vocative":"legitimație","plural-vocative":"legitimațiilor"}},{"word":"legitimațiune","pos":"noun","definitions":["obsolete form of legitimație"],"forms":{"plural":"legitimațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"legitimațiune","accusative-definite-nominative-singular":"legitimațiunea","accusative-indefinite-nominative-plural":"legitimațiuni","accusative-definite-nominative-plural":"legitimațiunile","dative-genitive-indefinite-singular":"legitimațiuni","dative-definite-genitive-singular":"legitimațiunii","dative-genitive-indefinite-plural":"legitimațiuni","dative-definite-genitive-plural":"legitimațiunilor","singular-vocative":"legitimațiune","plural-vocative":"legitimațiunilor"}},{"word":"legitimism","pos":"noun","definitions":["legitimism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"legitimism","accusative-definite-nominative":"legitimismul","dative-genitive-indefinite":"legitimism","dative-definite-genitive":"legitimismului","vocative":"legitimismule"}},{"word":"legitimist","pos":"noun","definitions":["legitimist"],"forms":{"plural":"legitimiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"legitimist","accusative-definite-nominative-singular":"legitimistul","accusative-indefinite-nominative-plural":"legitimiști","accusative-definite-nominative-plural":"legitimiștii","dative-genitive-indefinite-singular":"legitimist","dative-definite-genitive-singular":"legitimistului","dative-genitive-indefinite-plural":"legitimiști","dative-definite-genitive-plural":"legitimiștilor","singular-vocative":"legitimistule","plural-vocative":"legitimiștilor"}},{"word":"legitimistă","pos":"noun","definitions":["female equivalent of legitimist"],"forms":{"plural":"legitimiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"legitimistă","accusative-definite-nominative-singular":"legitimista","accusative-indefinite-nominative-plural":"legitimiste","accusative-definite-nominative-plural":"legitimistele","dative-genitive-indefinite-singular":"legitimiste","dative-definite-genitive-singular":"legitimistei","dative-genitive-indefinite-plural":"legitimiste","dative-definite-genitive-plural":"legitimistelor","singular-vocative":"legitimistă","plural-vocative":"legitimistelor"}},{"word":"legitimitate","pos":"noun","definitions":["legitimacy"],"forms":{"plural":"legitimități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"legitimitate","accusative-definite-nominative-singular":"legitimitatea","accusative-indefinite-nominative-plural":"legitimități","accusative-definite-nominative-plural":"legitimitățile","dative-genitive-indefinite-singular":"legitimități","dative-definite-genitive-singular":"legitimității","dative-genitive-indefinite-plural":"legitimități","dative-definite-genitive-plural":"legitimităților","singular-vocative":"legitimitate","plural-vocative":"legitimităților"}},{"word":"legitimiza","pos":"verb","definitions":["to legitimize"],"pronunciation":"/le.d͡ʒi.ti.miˈza/","forms":{"canonical":"a legitimiza 1st conjugation","present-singular-third-person":"legitimizează","participle-past":"legitimizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a legitimiza","gerund":"legitimizând","first-person-indicative-present-singular":"legitimizez","indicative-present-second-person-singular":"legitimizezi","indicative-present-singular-third-person":"legitimizează","first-person-indicative-plural-present":"legitimizăm","indicative-plural-present-second-person":"legitimizați","indicative-plural-present-third-person":"legitimizează","first-person-imperfect-indicative-singular":"legitimizam","imperfect-indicative-second-person-singular":"legitimizai","imperfect-indicative-singular-third-person":"legitimiza","first-person-imperfect-indicative-plural":"legitimizam","imperfect-indicative-plural-second-person":"legitimizați","imperfect-indicative-plural-third-person":"legitimizau","first-person-indicative-perfect-singular":"legitimizai","indicative-perfect-second-person-singular":"legitimizași","indicative-perfect-singular-third-person":"legitimiză","first-person-indicative-perfect-plural":"legitimizarăm","indicative-perfect-plural-second-person":"legitimizarăți","indicative-perfect-plural-third-person":"legitimizară","first-person-indicative-pluperfect-singular":"legitimizasem","indicative-pluperfect-second-person-singular":"legitimizaseși","indicative-pluperfect-singular-third-person":"legitimizase","first-person-indicative-pluperfect-plural":"legitimizaserăm","indicative-pluperfect-plural-second-person":"legitimizaserăți","indicative-pluperfect-plural-third-person":"legitimizaseră","first-person-present-singular-subjunctive":"să legitimizez","present-second-person-singular-subjunctive":"să legitimizezi","present-singular-subjunctive-third-person":"să legitimizeze","first-person-plural-present-subjunctive":"să legitimizăm","plural-present-second-person-subjunctive":"să legitimizați","plural-present-subjunctive-third-person":"să legitimizeze","imperative-second-person-singular":"legitimizează","imperative-plural-second-person":"legitimizați","imperative-negative-second-person-singular":"nu legitimiza","imperative-negative-plural-second-person":"nu legitimizați"}},{"word":"legitimizare","pos":"noun","definitions":["legitimation"],"forms":{"plural":"legitimizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"legitimizare","accusative-definite-nominative-singular":"legitimizarea","accusative-indefinite-nominative-plural":"legitimizări","accusative-definite-nominative-plural":"legitimizările","dative-genitive-indefinite-singular":"legitimizări","dative-definite-genitive-singular":"legitimizării","dative-genitive-indefinite-plural":"legitimizări","dative-definite-genitive-plural":"legitimizărilor","singular-vocative":"legitimizare","plural-vocative":"legitimizărilor"}},{"word":"legiui","pos":"verb","definitions":["to legislate"],"forms":{"canonical":"a legiui 4th conjugation","present-singular-third-person":"legiuiește","participle-past":"legiuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a legiui","gerund":"legiuind","first-person-indicative-present-singular":"legiuiesc","indicative-present-second-person-singular":"legiuiești","indicative-present-singular-third-person":"legiuiește","first-person-indicative-plural-present":"legiuim","indicative-plural-present-second-person":"legiuiți","indicative-plural-present-third-person":"legiuiesc","first-person-imperfect-indicative-singular":"legiuiam","imperfect-indicative-second-person-singular":"legiuiai","imperfect-indicative-singular-third-person":"legiuia","first-person-imperfect-indicative-plural":"legiuiam","imperfect-indicative-plural-second-person":"legiuiați","imperfect-indicative-plural-third-person":"legiuiau","first-person-indicative-perfect-singular":"legiuii","indicative-perfect-second-person-singular":"legiuiși","indicative-perfect-singular-third-person":"legiui","first-person-indicative-perfect-plural":"legiuirăm","indicative-perfect-plural-second-person":"legiuirăți","indicative-perfect-plural-third-person":"legiuiră","first-person-indicative-pluperfect-singular":"legiuisem","indicative-pluperfect-second-person-singular":"legiuiseși","indicative-pluperfect-singular-third-person":"legiuise","first-person-indicative-pluperfect-plural":"legiuiserăm","indicative-pluperfect-plural-second-person":"legiuiserăți","indicative-pluperfect-plural-third-person":"legiuiseră","first-person-present-singular-subjunctive":"să legiuiesc","present-second-person-singular-subjunctive":"să legiuiești","present-singular-subjunctive-third-person":"să legiuiască","first-person-plural-present-subjunctive":"să legiuim","plural-present-second-person-subjunctive":"să legiuiți","plural-present-subjunctive-third-person":"să legiuiască","imperative-second-person-singular":"legiuiește","imperative-plural-second-person":"legiuiți","imperative-negative-second-person-singular":"nu legiui","imperative-negative-plural-second-person":"nu legiuiți"}},{"word":"legiuire","pos":"noun","definitions":["enactment"],"forms":{"plural":"legiuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"legiuire","accusative-definite-nominative-singular":"legiuirea","accusative-indefinite-nominative-plural":"legiuiri","accusative-definite-nominative-plural":"legiuirile","dative-genitive-indefinite-singular":"legiuiri","dative-definite-genitive-singular":"legiuirii","dative-genitive-indefinite-plural":"legiuiri","dative-definite-genitive-plural":"legiuirilor","singular-vocative":"legiuire","plural-vocative":"legiuirilor"}},{"word":"legiuit","pos":"adj","definitions":["lawful"],"forms":{"feminine-singular":"legiuită","masculine-plural":"legiuiți","feminine-neuter-plural":"legiuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"legiuit","error-unrecognized-form-feminine-indefinite-singular":"legiuită","error-unrecognized-form-indefinite-masculine-plural":"legiuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"legiuite","definite-error-unrecognized-form-masculine-neuter-singular":"legiuitul","definite-error-unrecognized-form-feminine-singular":"legiuita","definite-error-unrecognized-form-masculine-plural":"legiuiții","definite-error-unrecognized-form-feminine-neuter-plural":"legiuitele"}},{"word":"legiuitoare","pos":"noun","definitions":["female equivalent of legiuitor"],"forms":{"plural":"legiuitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"legiuitoare","accusative-definite-nominative-singular":"legiuitoarea","accusative-indefinite-nominative-plural":"legiuitoare","accusative-definite-nominative-plural":"legiuitoarele","dative-genitive-indefinite-singular":"legiuitoare","dative-definite-genitive-singular":"legiuitoarei","dative-genitive-indefinite-plural":"legiuitoare","dative-definite-genitive-plural":"legiuitoarelor","singular-vocative":"legiuitoare","plural-vocative":"legiuitoarelor"}},{"word":"legiuitor","pos":"noun","definitions":["legislator"],"forms":{"plural":"legiuitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"legiuitor","accusative-definite-nominative-singular":"legiuitorul","accusative-indefinite-nominative-plural":"legiuitori","accusative-definite-nominative-plural":"legiuitorii","dative-genitive-indefinite-singular":"legiuitor","dative-definite-genitive-singular":"legiuitorului","dative-genitive-indefinite-plural":"legiuitori","dative-definite-genitive-plural":"legiuitorilor","singular-vocative":"legiuitorule","plural-vocative":"legiuitorilor"}},{"word":"legiune","pos":"noun","definitions":["legion"],"forms":{"plural":"legiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"legiune","accusative-definite-nominative-singular":"legiunea","accusative-indefinite-nominative-plural":"legiuni","accusative-definite-nominative-plural":"legiunile","dative-genitive-indefinite-singular":"legiuni","dative-definite-genitive-singular":"legiunii","dative-genitive-indefinite-plural":"legiuni","dative-definite-genitive-plural":"legiunilor","singular-vocative":"legiune","plural-vocative":"legiunilor"}},{"word":"legiune străină","pos":"noun","definitions":["foreign legion"]},{"word":"leguan","pos":"noun","definitions":["iguana"],"forms":{"plural":"leguani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leguan","accusative-definite-nominative-singular":"leguanul","accusative-indefinite-nominative-plural":"leguani","accusative-definite-nominative-plural":"leguanii","dative-genitive-indefinite-singular":"leguan","dative-definite-genitive-singular":"leguanului","dative-genitive-indefinite-plural":"leguani","dative-definite-genitive-plural":"leguanilor","singular-vocative":"leguanule","plural-vocative":"leguanilor"}},{"word":"legumă","pos":"noun","definitions":["vegetable"],"forms":{"plural":"legume","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"legumă","accusative-definite-nominative-singular":"leguma","accusative-indefinite-nominative-plural":"legume","accusative-definite-nominative-plural":"legumele","dative-genitive-indefinite-singular":"legume","dative-definite-genitive-singular":"legumei","dative-genitive-indefinite-plural":"legume","dative-definite-genitive-plural":"legumelor","singular-vocative":"legumă","plural-vocative":"legumelor"}},{"word":"legumărie","pos":"noun","definitions":["vegetable field"],"forms":{"plural":"legumării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"legumărie","accusative-definite-nominative-singular":"legumăria","accusative-indefinite-nominative-plural":"legumării","accusative-definite-nominative-plural":"legumăriile","dative-genitive-indefinite-singular":"legumării","dative-definite-genitive-singular":"legumăriei","dative-genitive-indefinite-plural":"legumării","dative-definite-genitive-plural":"legumăriilor","singular-vocative":"legumărie","plural-vocative":"legumăriilor"}},{"word":"legumărit","pos":"noun","definitions":["vegetable farming"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"legumărit","accusative-definite-nominative":"legumăritul","dative-genitive-indefinite":"legumărit","dative-definite-genitive":"legumăritului","vocative":"legumăritule"}},{"word":"legume","pos":"noun","definitions":["plural of legumă"],"gender":"f-p"},{"word":"legumen","pos":"noun","definitions":["legume (The fruit or seed of leguminous plants)"],"forms":{"plural":"legumene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"legumen","accusative-definite-nominative-singular":"legumenul","accusative-indefinite-nominative-plural":"legumene","accusative-definite-nominative-plural":"legumenele","dative-genitive-indefinite-singular":"legumen","dative-definite-genitive-singular":"legumenului","dative-genitive-indefinite-plural":"legumene","dative-definite-genitive-plural":"legumenelor","singular-vocative":"legumenule","plural-vocative":"legumenelor"}},{"word":"legumet","pos":"noun","definitions":["assortment of vegetables"],"forms":{"plural":"legumeturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"legumet","accusative-definite-nominative-singular":"legumetul","accusative-indefinite-nominative-plural":"legumeturi","accusative-definite-nominative-plural":"legumeturile","dative-genitive-indefinite-singular":"legumet","dative-definite-genitive-singular":"legumetului","dative-genitive-indefinite-plural":"legumeturi","dative-definite-genitive-plural":"legumeturilor","singular-vocative":"legumetule","plural-vocative":"legumeturilor"}},{"word":"legumicultoare","pos":"noun","definitions":["female equivalent of legumicultor"],"forms":{"plural":"legumicultoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"legumicultoare","accusative-definite-nominative-singular":"legumicultoarea","accusative-indefinite-nominative-plural":"legumicultoare","accusative-definite-nominative-plural":"legumicultoarele","dative-genitive-indefinite-singular":"legumicultoare","dative-definite-genitive-singular":"legumicultoarei","dative-genitive-indefinite-plural":"legumicultoare","dative-definite-genitive-plural":"legumicultoarelor","singular-vocative":"legumicultoare","plural-vocative":"legumicultoarelor"}},{"word":"legumicultură","pos":"noun","definitions":["vegetable culture"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"legumicultură","accusative-definite-nominative":"legumicultura","dative-genitive-indefinite":"legumiculture","dative-definite-genitive":"legumiculturei","vocative":"legumicultură"}},{"word":"legumină","pos":"noun","definitions":["legumine, casein"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"legumină","accusative-definite-nominative":"legumina","dative-genitive-indefinite":"legumine","dative-definite-genitive":"leguminei","vocative":"legumină"}},{"word":"leguminărie","pos":"noun","definitions":["vegetable field"],"forms":{"plural":"leguminării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"leguminărie","accusative-definite-nominative-singular":"leguminăria","accusative-indefinite-nominative-plural":"leguminării","accusative-definite-nominative-plural":"leguminăriile","dative-genitive-indefinite-singular":"leguminării","dative-definite-genitive-singular":"leguminăriei","dative-genitive-indefinite-plural":"leguminării","dative-definite-genitive-plural":"leguminăriilor","singular-vocative":"leguminărie","plural-vocative":"leguminăriilor"}},{"word":"leguminoasă","pos":"noun","definitions":["leguminous plant"],"forms":{"plural":"leguminoase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leguminoasă","accusative-definite-nominative-singular":"leguminoasa","accusative-indefinite-nominative-plural":"leguminoase","accusative-definite-nominative-plural":"leguminoasele","dative-genitive-indefinite-singular":"leguminoase","dative-definite-genitive-singular":"leguminoasei","dative-genitive-indefinite-plural":"leguminoase","dative-definite-genitive-plural":"leguminoaselor","singular-vocative":"leguminoasă","plural-vocative":"leguminoaselor"}},{"word":"leguminos","pos":"adj","definitions":["leguminous"],"forms":{"feminine-singular":"leguminoasă","masculine-plural":"leguminoși","feminine-neuter-plural":"leguminoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leguminos","error-unrecognized-form-feminine-indefinite-singular":"leguminoasă","error-unrecognized-form-indefinite-masculine-plural":"leguminoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"leguminoase","definite-error-unrecognized-form-masculine-neuter-singular":"leguminosul","definite-error-unrecognized-form-feminine-singular":"leguminoasa","definite-error-unrecognized-form-masculine-plural":"leguminoșii","definite-error-unrecognized-form-feminine-neuter-plural":"leguminoasele"}},{"word":"legumos","pos":"adj","definitions":["vegetable-like"],"forms":{"feminine-singular":"legumoasă","masculine-plural":"legumoși","feminine-neuter-plural":"legumoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"legumos","error-unrecognized-form-feminine-indefinite-singular":"legumoasă","error-unrecognized-form-indefinite-masculine-plural":"legumoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"legumoase","definite-error-unrecognized-form-masculine-neuter-singular":"legumosul","definite-error-unrecognized-form-feminine-singular":"legumoasa","definite-error-unrecognized-form-masculine-plural":"legumoșii","definite-error-unrecognized-form-feminine-neuter-plural":"legumoasele"}},{"word":"Lehăceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lehăceanu"}},{"word":"lehăi","pos":"verb","definitions":["to prattle, babble, blather, gabble (talk much and pointlessly)"],"forms":{"canonical":"a lehăi 4th conjugation","present-singular-third-person":"lehăește","participle-past":"lehăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lehăi","gerund":"lehăind","first-person-indicative-present-singular":"lehăiesc","indicative-present-second-person-singular":"lehăiești","indicative-present-singular-third-person":"lehăiește","first-person-indicative-plural-present":"lehăim","indicative-plural-present-second-person":"lehăiți","indicative-plural-present-third-person":"lehăiesc","first-person-imperfect-indicative-singular":"lehăiam","imperfect-indicative-second-person-singular":"lehăiai","imperfect-indicative-singular-third-person":"lehăia","first-person-imperfect-indicative-plural":"lehăiam","imperfect-indicative-plural-second-person":"lehăiați","imperfect-indicative-plural-third-person":"lehăiau","first-person-indicative-perfect-singular":"lehăii","indicative-perfect-second-person-singular":"lehăiși","indicative-perfect-singular-third-person":"lehăi","first-person-indicative-perfect-plural":"lehăirăm","indicative-perfect-plural-second-person":"lehăirăți","indicative-perfect-plural-third-person":"lehăiră","first-person-indicative-pluperfect-singular":"lehăisem","indicative-pluperfect-second-person-singular":"lehăiseși","indicative-pluperfect-singular-third-person":"lehăise","first-person-indicative-pluperfect-plural":"lehăiserăm","indicative-pluperfect-plural-second-person":"lehăiserăți","indicative-pluperfect-plural-third-person":"lehăiseră","first-person-present-singular-subjunctive":"să lehăiesc","present-second-person-singular-subjunctive":"să lehăiești","present-singular-subjunctive-third-person":"să lehăiască","first-person-plural-present-subjunctive":"să lehăim","plural-present-second-person-subjunctive":"să lehăiți","plural-present-subjunctive-third-person":"să lehăiască","imperative-second-person-singular":"lehăiește","imperative-plural-second-person":"lehăiți","imperative-negative-second-person-singular":"nu lehăi","imperative-negative-plural-second-person":"nu lehăiți"}},{"word":"lehămeti","pos":"verb","definitions":["to disgust"],"forms":{"canonical":"a lehămeti 4th conjugation","present-singular-third-person":"lehămetește","participle-past":"lehămetit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lehămeti","gerund":"lehămetind","first-person-indicative-present-singular":"lehămetesc","indicative-present-second-person-singular":"lehămetești","indicative-present-singular-third-person":"lehămetește","first-person-indicative-plural-present":"lehămetim","indicative-plural-present-second-person":"lehămetiți","indicative-plural-present-third-person":"lehămetesc","first-person-imperfect-indicative-singular":"lehămeteam","imperfect-indicative-second-person-singular":"lehămeteai","imperfect-indicative-singular-third-person":"lehămetea","first-person-imperfect-indicative-plural":"lehămeteam","imperfect-indicative-plural-second-person":"lehămeteați","imperfect-indicative-plural-third-person":"lehămeteau","first-person-indicative-perfect-singular":"lehămetii","indicative-perfect-second-person-singular":"lehămetiși","indicative-perfect-singular-third-person":"lehămeti","first-person-indicative-perfect-plural":"lehămetirăm","indicative-perfect-plural-second-person":"lehămetirăți","indicative-perfect-plural-third-person":"lehămetiră","first-person-indicative-pluperfect-singular":"lehămetisem","indicative-pluperfect-second-person-singular":"lehămetiseși","indicative-pluperfect-singular-third-person":"lehămetise","first-person-indicative-pluperfect-plural":"lehămetiserăm","indicative-pluperfect-plural-second-person":"lehămetiserăți","indicative-pluperfect-plural-third-person":"lehămetiseră","first-person-present-singular-subjunctive":"să lehămetesc","present-second-person-singular-subjunctive":"să lehămetești","present-singular-subjunctive-third-person":"să lehămetească","first-person-plural-present-subjunctive":"să lehămetim","plural-present-second-person-subjunctive":"să lehămetiți","plural-present-subjunctive-third-person":"să lehămetească","imperative-second-person-singular":"lehămetește","imperative-plural-second-person":"lehămetiți","imperative-negative-second-person-singular":"nu lehămeti","imperative-negative-plural-second-person":"nu lehămetiți"}},{"word":"lehămeți","pos":"verb","definitions":["alternative form of lehămeti"],"forms":{"canonical":"a lehămeți 4th conjugation","present-singular-third-person":"lehămețește","participle-past":"lehămețit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lehămeți","gerund":"lehămețind","first-person-indicative-present-singular":"lehămețesc","indicative-present-second-person-singular":"lehămețești","indicative-present-singular-third-person":"lehămețește","first-person-indicative-plural-present":"lehămețim","indicative-plural-present-second-person":"lehămețiți","indicative-plural-present-third-person":"lehămețesc","first-person-imperfect-indicative-singular":"lehămețeam","imperfect-indicative-second-person-singular":"lehămețeai","imperfect-indicative-singular-third-person":"lehămețea","first-person-imperfect-indicative-plural":"lehămețeam","imperfect-indicative-plural-second-person":"lehămețeați","imperfect-indicative-plural-third-person":"lehămețeau","first-person-indicative-perfect-singular":"lehămeții","indicative-perfect-second-person-singular":"lehămețiși","indicative-perfect-singular-third-person":"lehămeți","first-person-indicative-perfect-plural":"lehămețirăm","indicative-perfect-plural-second-person":"lehămețirăți","indicative-perfect-plural-third-person":"lehămețiră","first-person-indicative-pluperfect-singular":"lehămețisem","indicative-pluperfect-second-person-singular":"lehămețiseși","indicative-pluperfect-singular-third-person":"lehămețise","first-person-indicative-pluperfect-plural":"lehămețiserăm","indicative-pluperfect-plural-second-person":"lehămețiserăți","indicative-pluperfect-plural-third-person":"lehămețiseră","first-person-present-singular-subjunctive":"să lehămețesc","present-second-person-singular-subjunctive":"să lehămețești","present-singular-subjunctive-third-person":"să lehămețească","first-person-plural-present-subjunctive":"să lehămețim","plural-present-second-person-subjunctive":"să lehămețiți","plural-present-subjunctive-third-person":"să lehămețească","imperative-second-person-singular":"lehămețește","imperative-plural-second-person":"lehămețiți","imperative-negative-second-person-singular":"nu lehămeți","imperative-negative-plural-second-person":"nu lehămețiți"}},{"word":"lehămetiseală","pos":"noun","definitions":["boredom"],"forms":{"plural":"lehămetiseli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lehămetiseală","accusative-definite-nominative-singular":"lehămetiseala","accusative-indefinite-nominative-plural":"lehămetisele","accusative-definite-nominative-plural":"lehămetiselele","dative-genitive-indefinite-singular":"lehămetisele","dative-definite-genitive-singular":"lehămetiselei","dative-genitive-indefinite-plural":"lehămetisele","dative-definite-genitive-plural":"lehămetiselelor","singular-vocative":"lehămetiseală","plural-vocative":"lehămetiselelor"}},{"word":"lehămetisi","pos":"verb","definitions":["to disgust"],"forms":{"canonical":"a lehămetisi 4th conjugation","present-singular-third-person":"lehămetisește","participle-past":"lehămetisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lehămetisi","gerund":"lehămetisind","first-person-indicative-present-singular":"lehămetisesc","indicative-present-second-person-singular":"lehămetisești","indicative-present-singular-third-person":"lehămetisește","first-person-indicative-plural-present":"lehămetisim","indicative-plural-present-second-person":"lehămetisiți","indicative-plural-present-third-person":"lehămetisesc","first-person-imperfect-indicative-singular":"lehămetiseam","imperfect-indicative-second-person-singular":"lehămetiseai","imperfect-indicative-singular-third-person":"lehămetisea","first-person-imperfect-indicative-plural":"lehămetiseam","imperfect-indicative-plural-second-person":"lehămetiseați","imperfect-indicative-plural-third-person":"lehămetiseau","first-person-indicative-perfect-singular":"lehămetisii","indicative-perfect-second-person-singular":"lehămetisiși","indicative-perfect-singular-third-person":"lehămetisi","first-person-indicative-perfect-plural":"lehămetisirăm","indicative-perfect-plural-second-person":"lehămetisirăți","indicative-perfect-plural-third-person":"lehămetisiră","first-person-indicative-pluperfect-singular":"lehămetisisem","indicative-pluperfect-second-person-singular":"lehămetisiseși","indicative-pluperfect-singular-third-person":"lehămetisise","first-person-indicative-pluperfect-plural":"lehămetisiserăm","indicative-pluperfect-plural-second-person":"lehămetisiserăți","indicative-pluperfect-plural-third-person":"lehămetisiseră","first-person-present-singular-subjunctive":"să lehămetisesc","present-second-person-singular-subjunctive":"să lehămetisești","present-singular-subjunctive-third-person":"să lehămetisească","first-person-plural-present-subjunctive":"să lehămetisim","plural-present-second-person-subjunctive":"să lehămetisiți","plural-present-subjunctive-third-person":"să lehămetisească","imperative-second-person-singular":"lehămetisește","imperative-plural-second-person":"lehămetisiți","imperative-negative-second-person-singular":"nu lehămetisi","imperative-negative-plural-second-person":"nu lehămetisiți"}},{"word":"lehămetit","pos":"adj","definitions":["disgusted"],"forms":{"feminine-singular":"lehămetită","masculine-plural":"lehămetiți","feminine-neuter-plural":"lehămetite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lehămetit","error-unrecognized-form-feminine-indefinite-singular":"lehămetită","error-unrecognized-form-indefinite-masculine-plural":"lehămetiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lehămetite","definite-error-unrecognized-form-masculine-neuter-singular":"lehămetitul","definite-error-unrecognized-form-feminine-singular":"lehămetita","definite-error-unrecognized-form-masculine-plural":"lehămetiții","definite-error-unrecognized-form-feminine-neuter-plural":"lehămetitele"}},{"word":"lehămetit","pos":"verb","definitions":["past participle of lehămeti"],"forms":{"participle-past":"of lehămeti"}},{"word":"lehămetui","pos":"verb","definitions":["to disgust"],"forms":{"canonical":"a lehămetui 4th conjugation","present-singular-third-person":"lehămetuiește","participle-past":"lehămetuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lehămetui","gerund":"lehămetuind","first-person-indicative-present-singular":"lehămetuiesc","indicative-present-second-person-singular":"lehămetuiești","indicative-present-singular-third-person":"lehămetuiește","first-person-indicative-plural-present":"lehămetuim","indicative-plural-present-second-person":"lehămetuiți","indicative-plural-present-third-person":"lehămetuiesc","first-person-imperfect-indicative-singular":"lehămetuiam","imperfect-indicative-second-person-singular":"lehămetuiai","imperfect-indicative-singular-third-person":"lehămetuia","first-person-imperfect-indicative-plural":"lehămetuiam","imperfect-indicative-plural-second-person":"lehămetuiați","imperfect-indicative-plural-third-person":"lehămetuiau","first-person-indicative-perfect-singular":"lehămetuii","indicative-perfect-second-person-singular":"lehămetuiși","indicative-perfect-singular-third-person":"lehămetui","first-person-indicative-perfect-plural":"lehămetuirăm","indicative-perfect-plural-second-person":"lehămetuirăți","indicative-perfect-plural-third-person":"lehămetuiră","first-person-indicative-pluperfect-singular":"lehămetuisem","indicative-pluperfect-second-person-singular":"lehămetuiseși","indicative-pluperfect-singular-third-person":"lehămetuise","first-person-indicative-pluperfect-plural":"lehămetuiserăm","indicative-pluperfect-plural-second-person":"lehămetuiserăți","indicative-pluperfect-plural-third-person":"lehămetuiseră","first-person-present-singular-subjunctive":"să lehămetuiesc","present-second-person-singular-subjunctive":"să lehămetuiești","present-singular-subjunctive-third-person":"să lehămetuiască","first-person-plural-present-subjunctive":"să lehămetuim","plural-present-second-person-subjunctive":"să lehămetuiți","plural-present-subjunctive-third-person":"să lehămetuiască","imperative-second-person-singular":"lehămetuiește","imperative-plural-second-person":"lehămetuiți","imperative-negative-second-person-singular":"nu lehămetui","imperative-negative-plural-second-person":"nu lehămetuiți"}},{"word":"lehămetuit","pos":"adj","definitions":["disgusted"],"forms":{"feminine-singular":"lehămetuită","masculine-plural":"lehămetuiți","feminine-neuter-plural":"lehămetuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lehămetuit","error-unrecognized-form-feminine-indefinite-singular":"lehămetuită","error-unrecognized-form-indefinite-masculine-plural":"lehămetuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lehămetuite","definite-error-unrecognized-form-masculine-neuter-singular":"lehămetuitul","definite-error-unrecognized-form-feminine-singular":"lehămetuita","definite-error-unrecognized-form-masculine-plural":"lehămetuiții","definite-error-unrecognized-form-feminine-neuter-plural":"lehămetuitele"}},{"word":"lehămetuit","pos":"verb","definitions":["past participle of lehămetui"],"forms":{"participle-past":"of lehămetui"}},{"word":"lehamite","pos":"noun","definitions":["disgust"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"lehamite","accusative-definite-nominative":"lehamitea","dative-genitive-indefinite":"lehamite","dative-definite-genitive":"lehamitei","vocative":"lehamite"}},{"word":"lehău","pos":"noun","definitions":["liar","chatterbox"],"forms":{"plural":"lehăi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lehău","accusative-definite-nominative-singular":"lehăuul","accusative-indefinite-nominative-plural":"lehăi","accusative-definite-nominative-plural":"lehăii","dative-genitive-indefinite-singular":"lehău","dative-definite-genitive-singular":"lehăuului","dative-genitive-indefinite-plural":"lehăi","dative-definite-genitive-plural":"lehăilor","singular-vocative":"lehăuule","plural-vocative":"lehăilor"}},{"word":"Lehești","pos":"name","definitions":["a village in Sohodol, Alba County, Romania"],"gender":"m"},{"word":"lehime","pos":"noun","definitions":["Poles"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"lehime","accusative-definite-nominative":"lehimea","dative-genitive-indefinite":"lehimi","dative-definite-genitive":"lehimii","vocative":"lehime"}},{"word":"Lehințan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lehințan"}},{"word":"Lehințanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lehințanu"}},{"word":"Lehliu","pos":"name","definitions":["a commune of Călărași County, Romania","a village in Lehliu, Călărași County, Romania"],"gender":"m"},{"word":"Lehliu-Gară","pos":"name","definitions":["a town in Călărași County, Romania"],"gender":"m"},{"word":"lehm","pos":"noun","definitions":["loam"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lehm","accusative-definite-nominative":"lehmul","dative-genitive-indefinite":"lehm","dative-definite-genitive":"lehmului","vocative":"lehmule"}},{"word":"lehuză","pos":"noun","definitions":["alternative form of lăuză"],"forms":{"plural":"lehuze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lehuză","accusative-definite-nominative-singular":"lehuza","accusative-indefinite-nominative-plural":"lehuze","accusative-definite-nominative-plural":"lehuzele","dative-genitive-indefinite-singular":"lehuze","dative-definite-genitive-singular":"lehuzei","dative-genitive-indefinite-plural":"lehuze","dative-definite-genitive-plural":"lehuzelor","singular-vocative":"lehuză","plural-vocative":"lehuzelor"}},{"word":"lehuzi","pos":"verb","definitions":["alternative form of lăuzi"],"forms":{"canonical":"a lehuzi 4th conjugation","present-singular-third-person":"lehuzește","participle-past":"lehuzit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lehuzi","gerund":"lehuzind","first-person-indicative-present-singular":"lehuzesc","indicative-present-second-person-singular":"lehuzești","indicative-present-singular-third-person":"lehuzește","first-person-indicative-plural-present":"lehuzim","indicative-plural-present-second-person":"lehuziți","indicative-plural-present-third-person":"lehuzesc","first-person-imperfect-indicative-singular":"lehuzeam","imperfect-indicative-second-person-singular":"lehuzeai","imperfect-indicative-singular-third-person":"lehuzea","first-person-imperfect-indicative-plural":"lehuzeam","imperfect-indicative-plural-second-person":"lehuzeați","imperfect-indicative-plural-third-person":"lehuzeau","first-person-indicative-perfect-singular":"lehuzii","indicative-perfect-second-person-singular":"lehuziși","indicative-perfect-singular-third-person":"lehuzi","first-person-indicative-perfect-plural":"lehuzirăm","indicative-perfect-plural-second-person":"lehuzirăți","indicative-perfect-plural-third-person":"lehuziră","first-person-indicative-pluperfect-singular":"lehuzisem","indicative-pluperfect-second-person-singular":"lehuziseși","indicative-pluperfect-singular-third-person":"lehuzise","first-person-indicative-pluperfect-plural":"lehuziserăm","indicative-pluperfect-plural-second-person":"lehuziserăți","indicative-pluperfect-plural-third-person":"lehuziseră","first-person-present-singular-subjunctive":"să lehuzesc","present-second-person-singular-subjunctive":"să lehuzești","present-singular-subjunctive-third-person":"să lehuzească","first-person-plural-present-subjunctive":"să lehuzim","plural-present-second-person-subjunctive":"să lehuziți","plural-present-subjunctive-third-person":"să lehuzească","imperative-second-person-singular":"lehuzește","imperative-plural-second-person":"lehuziți","imperative-negative-second-person-singular":"nu lehuzi","imperative-negative-plural-second-person":"nu lehuziți"}},{"word":"lehuzie","pos":"noun","definitions":["alternative form of lăuzie"],"forms":{"plural":"lehuzii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lehuzie","accusative-definite-nominative-singular":"lehuzia","accusative-indefinite-nominative-plural":"lehuzii","accusative-definite-nominative-plural":"lehuziile","dative-genitive-indefinite-singular":"lehuzii","dative-definite-genitive-singular":"lehuziei","dative-genitive-indefinite-plural":"lehuzii","dative-definite-genitive-plural":"lehuziilor","singular-vocative":"lehuzie","plural-vocative":"lehuziilor"}},{"word":"lei","pos":"noun","definitions":["plural of leu"],"pronunciation":"/lej/","gender":"m-p"},{"word":"leibnizian","pos":"adj","definitions":["Leibnizian"],"forms":{"feminine-singular":"leibniziană","masculine-plural":"leibnizieni","feminine-neuter-plural":"leibniziene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leibnizian","error-unrecognized-form-feminine-indefinite-singular":"leibniziană","error-unrecognized-form-indefinite-masculine-plural":"leibnizieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"leibniziene","definite-error-unrecognized-form-masculine-neuter-singular":"leibnizianul","definite-error-unrecognized-form-feminine-singular":"leibniziana","definite-error-unrecognized-form-masculine-plural":"leibnizienii","definite-error-unrecognized-form-feminine-neuter-plural":"leibnizienele"}},{"word":"Leica","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Leica"}},{"word":"leică","pos":"noun","definitions":["funnel"],"forms":{"plural":"leici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"leică","accusative-definite-nominative-singular":"leica","accusative-indefinite-nominative-plural":"leici","accusative-definite-nominative-plural":"leicile","dative-genitive-indefinite-singular":"leici","dative-definite-genitive-singular":"leicii","dative-genitive-indefinite-plural":"leici","dative-definite-genitive-plural":"leicilor","singular-vocative":"leică","plural-vocative":"leicilor"}},{"word":"Leicești","pos":"name","definitions":["a village in Coșești, Argeș County, Romania"],"gender":"m"},{"word":"Leiculești","pos":"name","definitions":["a village in Tisău, Buzău County, Romania"],"gender":"m"},{"word":"leiculiță","pos":"noun","definitions":["diminutive of leică"],"forms":{"plural":"leiculițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leiculiță","accusative-definite-nominative-singular":"leiculița","accusative-indefinite-nominative-plural":"leiculițe","accusative-definite-nominative-plural":"leiculițele","dative-genitive-indefinite-singular":"leiculițe","dative-definite-genitive-singular":"leiculiței","dative-genitive-indefinite-plural":"leiculițe","dative-definite-genitive-plural":"leiculițelor","singular-vocative":"leiculiță","plural-vocative":"leiculițelor"}},{"word":"leicușoară","pos":"noun","definitions":["diminutive of leică"],"forms":{"plural":"leicușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leicușoară","accusative-definite-nominative-singular":"leicușoara","accusative-indefinite-nominative-plural":"leicușoare","accusative-definite-nominative-plural":"leicușoarele","dative-genitive-indefinite-singular":"leicușoare","dative-definite-genitive-singular":"leicușoarei","dative-genitive-indefinite-plural":"leicușoare","dative-definite-genitive-plural":"leicușoarelor","singular-vocative":"leicușoară","plural-vocative":"leicușoarelor"}},{"word":"leicuță","pos":"noun","definitions":["diminutive of leică"],"forms":{"plural":"leicuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leicuță","accusative-definite-nominative-singular":"leicuța","accusative-indefinite-nominative-plural":"leicuțe","accusative-definite-nominative-plural":"leicuțele","dative-genitive-indefinite-singular":"leicuțe","dative-definite-genitive-singular":"leicuței","dative-genitive-indefinite-plural":"leicuțe","dative-definite-genitive-plural":"leicuțelor","singular-vocative":"leicuță","plural-vocative":"leicuțelor"}},{"word":"leie","pos":"verb","definitions":["third-person singular/plural present subjunctive of la"],"pronunciation":"[ˈleje]"},{"word":"leiofil","pos":"adj","definitions":["lyophilic"],"forms":{"feminine-singular":"leiofilă","masculine-plural":"leiofili","feminine-neuter-plural":"leiofile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leiofil","error-unrecognized-form-feminine-indefinite-singular":"leiofilă","error-unrecognized-form-indefinite-masculine-plural":"leiofili","error-unrecognized-form-feminine-indefinite-neuter-plural":"leiofile","definite-error-unrecognized-form-masculine-neuter-singular":"leiofilul","definite-error-unrecognized-form-feminine-singular":"leiofila","definite-error-unrecognized-form-masculine-plural":"leiofilii","definite-error-unrecognized-form-feminine-neuter-plural":"leiofilele"}},{"word":"leiomion","pos":"noun","definitions":["leiomyoma"],"forms":{"plural":"leiomioane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"leiomion","accusative-definite-nominative-singular":"leiomionul","accusative-indefinite-nominative-plural":"leiomioane","accusative-definite-nominative-plural":"leiomioanele","dative-genitive-indefinite-singular":"leiomion","dative-definite-genitive-singular":"leiomionului","dative-genitive-indefinite-plural":"leiomioane","dative-definite-genitive-plural":"leiomioanelor","singular-vocative":"leiomionule","plural-vocative":"leiomioanelor"}},{"word":"leiomiosarcom","pos":"noun","definitions":["leiomyosarcoma"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"leiomiosarcom","accusative-definite-nominative":"leiomiosarcomul","dative-genitive-indefinite":"leiomiosarcom","dative-definite-genitive":"leiomiosarcomului","vocative":"leiomiosarcomule"}},{"word":"leishmanie","pos":"noun","definitions":["leishmania"],"forms":{"plural":"leishmanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"leishmanie","accusative-definite-nominative-singular":"leishmania","accusative-indefinite-nominative-plural":"leishmanii","accusative-definite-nominative-plural":"leishmaniile","dative-genitive-indefinite-singular":"leishmanii","dative-definite-genitive-singular":"leishmaniei","dative-genitive-indefinite-plural":"leishmanii","dative-definite-genitive-plural":"leishmaniilor","singular-vocative":"leishmanie","plural-vocative":"leishmaniilor"}},{"word":"leishmanioză","pos":"noun","definitions":["leishmaniasis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"leishmanioză","accusative-definite-nominative":"leishmanioza","dative-genitive-indefinite":"leishmanioze","dative-definite-genitive":"leishmaniozei","vocative":"leishmanioză"}}];
@@ -0,0 +1 @@
+export default [{"word":"leit","pos":"adj","definitions":["alike, identical"],"pronunciation":"/leˈit/","forms":{"feminine-singular":"leită","masculine-plural":"leiți","feminine-neuter-plural":"leite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leit","error-unrecognized-form-feminine-indefinite-singular":"leită","error-unrecognized-form-indefinite-masculine-plural":"leiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"leite","definite-error-unrecognized-form-masculine-neuter-singular":"leitul","definite-error-unrecognized-form-feminine-singular":"leita","definite-error-unrecognized-form-masculine-plural":"leiții","definite-error-unrecognized-form-feminine-neuter-plural":"leitele"}},{"word":"leiță","pos":"noun","definitions":["coin worth 20 para"],"forms":{"plural":"leițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leiță","accusative-definite-nominative-singular":"leița","accusative-indefinite-nominative-plural":"leițe","accusative-definite-nominative-plural":"leițele","dative-genitive-indefinite-singular":"leițe","dative-definite-genitive-singular":"leiței","dative-genitive-indefinite-plural":"leițe","dative-definite-genitive-plural":"leițelor","singular-vocative":"leiță","plural-vocative":"leițelor"}},{"word":"leitenant","pos":"noun","definitions":["lieutenant"],"forms":{"plural":"leitenanți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leitenant","accusative-definite-nominative-singular":"leitenantul","accusative-indefinite-nominative-plural":"leitenanți","accusative-definite-nominative-plural":"leitenanții","dative-genitive-indefinite-singular":"leitenant","dative-definite-genitive-singular":"leitenantului","dative-genitive-indefinite-plural":"leitenanți","dative-definite-genitive-plural":"leitenanților","singular-vocative":"leitenantule","plural-vocative":"leitenanților"}},{"word":"leitenință","pos":"noun","definitions":["lieutenancy"],"forms":{"plural":"leitenințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leitenință","accusative-definite-nominative-singular":"leitenința","accusative-indefinite-nominative-plural":"leitenințe","accusative-definite-nominative-plural":"leitenințele","dative-genitive-indefinite-singular":"leitenințe","dative-definite-genitive-singular":"leiteninței","dative-genitive-indefinite-plural":"leitenințe","dative-definite-genitive-plural":"leitenințelor","singular-vocative":"leitenință","plural-vocative":"leitenințelor"}},{"word":"leitmotiv","pos":"noun","definitions":["obsolete form of laitmotiv"],"forms":{"plural":"leitmotivuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"leitmotiv","accusative-definite-nominative-singular":"leitmotivul","accusative-indefinite-nominative-plural":"leitmotivuri","accusative-definite-nominative-plural":"leitmotivurile","dative-genitive-indefinite-singular":"leitmotiv","dative-definite-genitive-singular":"leitmotivului","dative-genitive-indefinite-plural":"leitmotivuri","dative-definite-genitive-plural":"leitmotivurilor","singular-vocative":"leitmotivule","plural-vocative":"leitmotivurilor"}},{"word":"lejancă","pos":"noun","definitions":["sleeping ledge above a chimney stove"],"forms":{"plural":"lejănci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lejancă","accusative-definite-nominative-singular":"lejanca","accusative-indefinite-nominative-plural":"lejănci","accusative-definite-nominative-plural":"lejăncile","dative-genitive-indefinite-singular":"lejănci","dative-definite-genitive-singular":"lejăncii","dative-genitive-indefinite-plural":"lejănci","dative-definite-genitive-plural":"lejăncilor","singular-vocative":"lejancă","plural-vocative":"lejăncilor"}},{"word":"lejer","pos":"adj","definitions":["light (not heavy)","slack, lax","easy-fitting"],"pronunciation":"/leˈʒer/","forms":{"feminine-singular":"lejeră","masculine-plural":"lejeri","feminine-neuter-plural":"lejere"}},{"word":"lejer","pos":"adv","definitions":["easily","lightly"],"pronunciation":"/leˈʒer/"},{"word":"lejeritate","pos":"noun","definitions":["lightness"],"forms":{"plural":"lejerități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lejeritate","accusative-definite-nominative-singular":"lejeritatea","accusative-indefinite-nominative-plural":"lejerități","accusative-definite-nominative-plural":"lejeritățile","dative-genitive-indefinite-singular":"lejerități","dative-definite-genitive-singular":"lejerității","dative-genitive-indefinite-plural":"lejerități","dative-definite-genitive-plural":"lejerităților","singular-vocative":"lejeritate","plural-vocative":"lejerităților"}},{"word":"Leleasca","pos":"name","definitions":["a commune of Olt County, Romania","a village in Leleasca, Olt County, Romania"],"gender":"f"},{"word":"Lelei","pos":"name","definitions":["a village in Hodod, Satu Mare County, Romania"],"gender":"m"},{"word":"Lelescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lelescu"}},{"word":"Lelese","pos":"name","definitions":["a commune of Hunedoara County, Romania","a village in Lelese, Hunedoara County, Romania"],"gender":"m"},{"word":"Leleștean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Leleștean"}},{"word":"Leleșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Leleșteanu"}},{"word":"Lelești","pos":"name","definitions":["a village in Buntești, Bihor County, Romania","a village in Ciceu-Mihăiești, Bistrița-Năsăud County, Romania","a commune of Gorj County, Romania","a village in Lelești, Gorj County, Romania"],"gender":"m"},{"word":"lelica","pos":"noun","definitions":["definite nominative/accusative singular of lelică"]},{"word":"lelică","pos":"noun","definitions":["diminutive of lele"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lelică","accusative-definite-nominative":"lelica","dative-genitive-indefinite":"lelice","dative-definite-genitive":"lelicei","vocative":"lelică"}},{"word":"Leliceni","pos":"name","definitions":["a commune of Harghita County, Romania","a village in Leliceni, Harghita County, Romania"],"gender":"m"},{"word":"lelicuță","pos":"noun","definitions":["diminutive of lelică"],"forms":{"plural":"lelicuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lelicuță","accusative-definite-nominative-singular":"lelicuța","accusative-indefinite-nominative-plural":"lelicuțe","accusative-definite-nominative-plural":"lelicuțele","dative-genitive-indefinite-singular":"lelicuțe","dative-definite-genitive-singular":"lelicuței","dative-genitive-indefinite-plural":"lelicuțe","dative-definite-genitive-plural":"lelicuțelor","singular-vocative":"lelicuță","plural-vocative":"lelicuțelor"}},{"word":"lelioară","pos":"noun","definitions":["diminutive of lele"],"forms":{"plural":"lelioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lelioară","accusative-definite-nominative-singular":"lelioara","accusative-indefinite-nominative-plural":"lelioare","accusative-definite-nominative-plural":"lelioarele","dative-genitive-indefinite-singular":"lelioare","dative-definite-genitive-singular":"lelioarei","dative-genitive-indefinite-plural":"lelioare","dative-definite-genitive-plural":"lelioarelor","singular-vocative":"lelioară","plural-vocative":"lelioarelor"}},{"word":"lelișoară","pos":"noun","definitions":["diminutive of lele"],"forms":{"plural":"lelișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lelișoară","accusative-definite-nominative-singular":"lelișoara","accusative-indefinite-nominative-plural":"lelișoare","accusative-definite-nominative-plural":"lelișoarele","dative-genitive-indefinite-singular":"lelișoare","dative-definite-genitive-singular":"lelișoarei","dative-genitive-indefinite-plural":"lelișoare","dative-definite-genitive-plural":"lelișoarelor","singular-vocative":"lelișoară","plural-vocative":"lelișoarelor"}},{"word":"leliță","pos":"noun","definitions":["diminutive of lele (wikt:ro:lele)"],"forms":{"plural":"lelițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leliță","accusative-definite-nominative-singular":"lelița","accusative-indefinite-nominative-plural":"lelițe","accusative-definite-nominative-plural":"lelițele","dative-genitive-indefinite-singular":"lelițe","dative-definite-genitive-singular":"leliței","dative-genitive-indefinite-plural":"lelițe","dative-definite-genitive-plural":"lelițelor","singular-vocative":"leliță","plural-vocative":"lelițelor"}},{"word":"lelițcană","pos":"noun","definitions":["diminutive of lele"],"forms":{"plural":"lelițcane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lelițcană","accusative-definite-nominative-singular":"lelițcana","accusative-indefinite-nominative-plural":"lelițcane","accusative-definite-nominative-plural":"lelițcanele","dative-genitive-indefinite-singular":"lelițcane","dative-definite-genitive-singular":"lelițcanei","dative-genitive-indefinite-plural":"lelițcane","dative-definite-genitive-plural":"lelițcanelor","singular-vocative":"lelițcană","plural-vocative":"lelițcanelor"}},{"word":"lelițică","pos":"noun","definitions":["diminutive of lele"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lelițică","accusative-definite-nominative":"lelițica","dative-genitive-indefinite":"lelițice","dative-definite-genitive":"lelițicei","vocative":"lelițică"}},{"word":"leliucă","pos":"noun","definitions":["diminutive of lele"],"forms":{"plural":"leliuci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"leliucă","accusative-definite-nominative-singular":"leliuca","accusative-indefinite-nominative-plural":"leliuci","accusative-definite-nominative-plural":"leliucile","dative-genitive-indefinite-singular":"leliuci","dative-definite-genitive-singular":"leliucii","dative-genitive-indefinite-plural":"leliuci","dative-definite-genitive-plural":"leliucilor","singular-vocative":"leliucă","plural-vocative":"leliucilor"}},{"word":"leltarozaș","pos":"noun","definitions":["inventory"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"leltarozaș","accusative-definite-nominative":"leltarozașul","dative-genitive-indefinite":"leltarozaș","dative-definite-genitive":"leltarozașului","vocative":"leltarozașule"}},{"word":"lemă","pos":"noun","definitions":["lemma"],"forms":{"plural":"leme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lemă","accusative-definite-nominative-singular":"lema","accusative-indefinite-nominative-plural":"leme","accusative-definite-nominative-plural":"lemele","dative-genitive-indefinite-singular":"leme","dative-definite-genitive-singular":"lemei","dative-genitive-indefinite-plural":"leme","dative-definite-genitive-plural":"lemelor","singular-vocative":"lemă","plural-vocative":"lemelor"}},{"word":"lematic","pos":"adj","definitions":["lemmatical"],"forms":{"feminine-singular":"lematică","masculine-plural":"lematici","feminine-neuter-plural":"lematice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lematic","error-unrecognized-form-feminine-indefinite-singular":"lematică","error-unrecognized-form-indefinite-masculine-plural":"lematici","error-unrecognized-form-feminine-indefinite-neuter-plural":"lematice","definite-error-unrecognized-form-masculine-neuter-singular":"lematicul","definite-error-unrecognized-form-feminine-singular":"lematica","definite-error-unrecognized-form-masculine-plural":"lematicii","definite-error-unrecognized-form-feminine-neuter-plural":"lematicele"}},{"word":"leming","pos":"noun","definitions":["lemming"],"pronunciation":"/ˈlemiŋɡ/","forms":{"plural":"lemingi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leming","accusative-definite-nominative-singular":"lemingul","accusative-indefinite-nominative-plural":"lemingi","accusative-definite-nominative-plural":"lemingii","dative-genitive-indefinite-singular":"leming","dative-definite-genitive-singular":"lemingului","dative-genitive-indefinite-plural":"lemingi","dative-definite-genitive-plural":"lemingilor","singular-vocative":"lemingule","plural-vocative":"lemingilor"}},{"word":"lemn","pos":"noun","definitions":["wood","timber"],"forms":{"plural":"lemne","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lemn","accusative-definite-nominative-singular":"lemnul","accusative-indefinite-nominative-plural":"lemne","accusative-definite-nominative-plural":"lemnele","dative-genitive-indefinite-singular":"lemn","dative-definite-genitive-singular":"lemnului","dative-genitive-indefinite-plural":"lemne","dative-definite-genitive-plural":"lemnelor","singular-vocative":"lemnule","plural-vocative":"lemnelor"}},{"word":"lemn câinesc","pos":"noun","definitions":["wild privet (Ligustrum vulgare)"]},{"word":"lemn de trandafir","pos":"noun","definitions":["rosewood"]},{"word":"lemn dulce","pos":"noun","definitions":["alternative form of lemn-dulce"]},{"word":"lemn-dulce","pos":"noun","definitions":["liquorice (plant)"],"forms":{"alternative":"lemn dulce"}},{"word":"lemnamă","pos":"noun","definitions":["a multitude of wood or timber"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lemnamă","accusative-definite-nominative":"lemnama","dative-genitive-indefinite":"lemname","dative-definite-genitive":"lemnamei","vocative":"lemnamă"}},{"word":"lemnar","pos":"noun","definitions":["someone who works with wood, such as a carpenter, joiner, or lumberjack/woodcutter"],"forms":{"plural":"lemnari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lemnar","accusative-definite-nominative-singular":"lemnarul","accusative-indefinite-nominative-plural":"lemnari","accusative-definite-nominative-plural":"lemnarii","dative-genitive-indefinite-singular":"lemnar","dative-definite-genitive-singular":"lemnarului","dative-genitive-indefinite-plural":"lemnari","dative-definite-genitive-plural":"lemnarilor","singular-vocative":"lemnarule","plural-vocative":"lemnarilor"}},{"word":"lemnăraș","pos":"noun","definitions":["diminutive of lemnar"],"forms":{"plural":"lemnărași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lemnăraș","accusative-definite-nominative-singular":"lemnărașul","accusative-indefinite-nominative-plural":"lemnărași","accusative-definite-nominative-plural":"lemnărașii","dative-genitive-indefinite-singular":"lemnăraș","dative-definite-genitive-singular":"lemnărașului","dative-genitive-indefinite-plural":"lemnărași","dative-definite-genitive-plural":"lemnărașilor","singular-vocative":"lemnărașule","plural-vocative":"lemnărașilor"}},{"word":"lemnăreasă","pos":"noun","definitions":["female equivalent of lemnar"],"forms":{"plural":"lemnărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lemnăreasă","accusative-definite-nominative-singular":"lemnăreasa","accusative-indefinite-nominative-plural":"lemnărese","accusative-definite-nominative-plural":"lemnăresele","dative-genitive-indefinite-singular":"lemnărese","dative-definite-genitive-singular":"lemnăresei","dative-genitive-indefinite-plural":"lemnărese","dative-definite-genitive-plural":"lemnăreselor","singular-vocative":"lemnăreasă","plural-vocative":"lemnăreselor"}},{"word":"lemnărel","pos":"noun","definitions":["diminutive of lemnar"],"forms":{"plural":"lemnărei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lemnărel","accusative-definite-nominative-singular":"lemnărelul","accusative-indefinite-nominative-plural":"lemnărei","accusative-definite-nominative-plural":"lemnăreii","dative-genitive-indefinite-singular":"lemnărel","dative-definite-genitive-singular":"lemnărelului","dative-genitive-indefinite-plural":"lemnărei","dative-definite-genitive-plural":"lemnăreilor","singular-vocative":"lemnărelule","plural-vocative":"lemnăreilor"}},{"word":"lemnăresc","pos":"adj","definitions":["carpenterly"],"forms":{"feminine-singular":"lemnărească","plural":"lemnărești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lemnăresc","error-unrecognized-form-feminine-indefinite-singular":"lemnărească","error-unrecognized-form-indefinite-masculine-plural":"lemnărești","error-unrecognized-form-feminine-indefinite-neuter-plural":"lemnărești","definite-error-unrecognized-form-masculine-neuter-singular":"lemnărescul","definite-error-unrecognized-form-feminine-singular":"lemnăreasca","definite-error-unrecognized-form-masculine-plural":"lemnăreștii","definite-error-unrecognized-form-feminine-neuter-plural":"lemnăreștile"}},{"word":"lemnărie","pos":"noun","definitions":["carpentry, woodcutting","timber, wood","wood material","woodyard"],"forms":{"plural":"lemnării"}},{"word":"lemnărit","pos":"noun","definitions":["carpentry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lemnărit","accusative-definite-nominative":"lemnăritul","dative-genitive-indefinite":"lemnărit","dative-definite-genitive":"lemnăritului","vocative":"lemnăritule"}},{"word":"Lemnariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Lemnariu"}},{"word":"Lemnaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Lemnaru"}},{"word":"lemnet","pos":"noun","definitions":["a multitude or large quantity of wood or timber"],"forms":{"plural":"lemnete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lemnet","accusative-definite-nominative-singular":"lemnetul","accusative-indefinite-nominative-plural":"lemnete","accusative-definite-nominative-plural":"lemnetele","dative-genitive-indefinite-singular":"lemnet","dative-definite-genitive-singular":"lemnetului","dative-genitive-indefinite-plural":"lemnete","dative-definite-genitive-plural":"lemnetelor","singular-vocative":"lemnetule","plural-vocative":"lemnetelor"}},{"word":"Lemnia","pos":"name","definitions":["a river in Covasna, Romania, tributary to the Negru","a commune of Covasna County, Romania","a village in Lemnia, Covasna County, Romania"],"gender":"f"},{"word":"lemnicel","pos":"noun","definitions":["diminutive of lemn; small piece of wood"],"forms":{"plural":"lemnicele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lemnicel","accusative-definite-nominative-singular":"lemnicelul","accusative-indefinite-nominative-plural":"lemnicele","accusative-definite-nominative-plural":"lemnicelele","dative-genitive-indefinite-singular":"lemnicel","dative-definite-genitive-singular":"lemnicelului","dative-genitive-indefinite-plural":"lemnicele","dative-definite-genitive-plural":"lemnicelelor","singular-vocative":"lemnicelule","plural-vocative":"lemnicelelor"}},{"word":"lemnificat","pos":"adj","definitions":["lignified"],"forms":{"feminine-singular":"lemnificată","masculine-plural":"lemnificați","feminine-neuter-plural":"lemnificate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lemnificat","error-unrecognized-form-feminine-indefinite-singular":"lemnificată","error-unrecognized-form-indefinite-masculine-plural":"lemnificați","error-unrecognized-form-feminine-indefinite-neuter-plural":"lemnificate","definite-error-unrecognized-form-masculine-neuter-singular":"lemnificatul","definite-error-unrecognized-form-feminine-singular":"lemnificata","definite-error-unrecognized-form-masculine-plural":"lemnificații","definite-error-unrecognized-form-feminine-neuter-plural":"lemnificatele"}},{"word":"lemnificat","pos":"verb","definitions":["past participle of lemnifica"],"forms":{"participle-past":"of lemnifica"}},{"word":"lemnișor","pos":"noun","definitions":["diminutive of lemn; small piece of wood"],"forms":{"plural":"lemnișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lemnișor","accusative-definite-nominative-singular":"lemnișorul","accusative-indefinite-nominative-plural":"lemnișore","accusative-definite-nominative-plural":"lemnișorele","dative-genitive-indefinite-singular":"lemnișor","dative-definite-genitive-singular":"lemnișorului","dative-genitive-indefinite-plural":"lemnișore","dative-definite-genitive-plural":"lemnișorelor","singular-vocative":"lemnișorule","plural-vocative":"lemnișorelor"}},{"word":"lemniu","pos":"adj","definitions":["succory (Cichorium intybus)"],"forms":{"feminine-singular":"lemnie","plural":"lemnii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lemniu","error-unrecognized-form-feminine-indefinite-singular":"lemnie","error-unrecognized-form-indefinite-masculine-plural":"lemnii","error-unrecognized-form-feminine-indefinite-neuter-plural":"lemnii","definite-error-unrecognized-form-masculine-neuter-singular":"lemniul","definite-error-unrecognized-form-feminine-singular":"lemnia","definite-error-unrecognized-form-masculine-plural":"lemniii","definite-error-unrecognized-form-feminine-neuter-plural":"lemniile"}},{"word":"lemniu","pos":"noun","definitions":["Cichorium intybus"],"forms":{"plural":"lemnii"}},{"word":"lemnoi","pos":"noun","definitions":["augmentative of lemn"],"forms":{"plural":"lemnoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lemnoi","accusative-definite-nominative-singular":"lemnoiul","accusative-indefinite-nominative-plural":"lemnoaie","accusative-definite-nominative-plural":"lemnoaiele","dative-genitive-indefinite-singular":"lemnoi","dative-definite-genitive-singular":"lemnoiului","dative-genitive-indefinite-plural":"lemnoaie","dative-definite-genitive-plural":"lemnoaielor","singular-vocative":"lemnoiule","plural-vocative":"lemnoaielor"}},{"word":"lemnos","pos":"adj","definitions":["wooden","woody, ligneous, woodlike"],"pronunciation":"/lemˈnos/","forms":{"feminine-singular":"lemnoasă","masculine-plural":"lemnoși","feminine-neuter-plural":"lemnoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lemnos","error-unrecognized-form-feminine-indefinite-singular":"lemnoasă","error-unrecognized-form-indefinite-masculine-plural":"lemnoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lemnoase","definite-error-unrecognized-form-masculine-neuter-singular":"lemnosul","definite-error-unrecognized-form-feminine-singular":"lemnoasa","definite-error-unrecognized-form-masculine-plural":"lemnoșii","definite-error-unrecognized-form-feminine-neuter-plural":"lemnoasele"}},{"word":"lemnuleț","pos":"noun","definitions":["diminutive of lemn"],"forms":{"plural":"lemnulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lemnuleț","accusative-definite-nominative-singular":"lemnulețul","accusative-indefinite-nominative-plural":"lemnulețe","accusative-definite-nominative-plural":"lemnulețele","dative-genitive-indefinite-singular":"lemnuleț","dative-definite-genitive-singular":"lemnulețului","dative-genitive-indefinite-plural":"lemnulețe","dative-definite-genitive-plural":"lemnulețelor","singular-vocative":"lemnulețule","plural-vocative":"lemnulețelor"}},{"word":"lemnuș","pos":"noun","definitions":["diminutive of lemn; small piece of wood"],"forms":{"plural":"lemnușuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lemnuș","accusative-definite-nominative-singular":"lemnușul","accusative-indefinite-nominative-plural":"lemnușe","accusative-definite-nominative-plural":"lemnușele","dative-genitive-indefinite-singular":"lemnuș","dative-definite-genitive-singular":"lemnușului","dative-genitive-indefinite-plural":"lemnușe","dative-definite-genitive-plural":"lemnușelor","singular-vocative":"lemnușule","plural-vocative":"lemnușelor"}},{"word":"lemnușcă","pos":"noun","definitions":["purple loosestrife (Lythrum salicaria)"],"forms":{"plural":"lemnuști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lemnușcă","accusative-definite-nominative-singular":"lemnușca","accusative-indefinite-nominative-plural":"lemnuște","accusative-definite-nominative-plural":"lemnuștele","dative-genitive-indefinite-singular":"lemnuște","dative-definite-genitive-singular":"lemnuștei","dative-genitive-indefinite-plural":"lemnuște","dative-definite-genitive-plural":"lemnuștelor","singular-vocative":"lemnușcă","plural-vocative":"lemnuștelor"}},{"word":"lemnuț","pos":"noun","definitions":["diminutive of lemn"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lemnuț","accusative-definite-nominative":"lemnuțul","dative-genitive-indefinite":"lemnuț","dative-definite-genitive":"lemnuțului","vocative":"lemnuțule"}},{"word":"lempiră","pos":"noun","definitions":["lempira"],"forms":{"plural":"lempire","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lempiră","accusative-definite-nominative-singular":"lempira","accusative-indefinite-nominative-plural":"lempire","accusative-definite-nominative-plural":"lempirele","dative-genitive-indefinite-singular":"lempire","dative-definite-genitive-singular":"lempirei","dative-genitive-indefinite-plural":"lempire","dative-definite-genitive-plural":"lempirelor","singular-vocative":"lempiră","plural-vocative":"lempirelor"}},{"word":"lemur","pos":"noun","definitions":["lemur"],"forms":{"plural":"lemuri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lemur","accusative-definite-nominative-singular":"lemurul","accusative-indefinite-nominative-plural":"lemuri","accusative-definite-nominative-plural":"lemurii","dative-genitive-indefinite-singular":"lemur","dative-definite-genitive-singular":"lemurului","dative-genitive-indefinite-plural":"lemuri","dative-definite-genitive-plural":"lemurilor","singular-vocative":"lemurule","plural-vocative":"lemurilor"}},{"word":"lemurian","pos":"noun","definitions":["lemur"],"forms":{"plural":"lemurieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lemurian","accusative-definite-nominative-singular":"lemurianul","accusative-indefinite-nominative-plural":"lemurieni","accusative-definite-nominative-plural":"lemurienii","dative-genitive-indefinite-singular":"lemurian","dative-definite-genitive-singular":"lemurianului","dative-genitive-indefinite-plural":"lemurieni","dative-definite-genitive-plural":"lemurienilor","singular-vocative":"lemurianule","plural-vocative":"lemurienilor"}},{"word":"lenaj","pos":"noun","definitions":["woollens"],"forms":{"plural":"lenajuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lenaj","accusative-definite-nominative-singular":"lenajul","accusative-indefinite-nominative-plural":"lenajuri","accusative-definite-nominative-plural":"lenajurile","dative-genitive-indefinite-singular":"lenaj","dative-definite-genitive-singular":"lenajului","dative-genitive-indefinite-plural":"lenajuri","dative-definite-genitive-plural":"lenajurilor","singular-vocative":"lenajule","plural-vocative":"lenajurilor"}},{"word":"Lenauheim","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Lenauheim, Timiș County, Romania"],"gender":"m"},{"word":"Lencăuți","pos":"name","definitions":["a village in Lencăuți, Ocnița Raion, Moldova","a commune of Ocnița Raion, Moldova"],"gender":"m"},{"word":"lencuță","pos":"noun","definitions":["diminutive of leancă"],"forms":{"plural":"lencuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lencuță","accusative-definite-nominative-singular":"lencuța","accusative-indefinite-nominative-plural":"lencuțe","accusative-definite-nominative-plural":"lencuțele","dative-genitive-indefinite-singular":"lencuțe","dative-definite-genitive-singular":"lencuței","dative-genitive-indefinite-plural":"lencuțe","dative-definite-genitive-plural":"lencuțelor","singular-vocative":"lencuță","plural-vocative":"lencuțelor"}},{"word":"lene","pos":"noun","definitions":["laziness, sloth, idleness, indolence"],"pronunciation":"/ˈle.ne/","examples":[{"ro":"a îi fi lene","en":"to be lazy, not feel like"}],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"lene","accusative-definite-nominative":"lenea","dative-genitive-indefinite":"lene","dative-definite-genitive":"lenei","vocative":"lene"}},{"word":"leneos","pos":"adj","definitions":["obsolete form of lenos"],"forms":{"feminine-singular":"leneoasă","masculine-plural":"leneoși","feminine-neuter-plural":"leneoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leneos","error-unrecognized-form-feminine-indefinite-singular":"leneoasă","error-unrecognized-form-indefinite-masculine-plural":"leneoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"leneoase","definite-error-unrecognized-form-masculine-neuter-singular":"leneosul","definite-error-unrecognized-form-feminine-singular":"leneoasa","definite-error-unrecognized-form-masculine-plural":"leneoșii","definite-error-unrecognized-form-feminine-neuter-plural":"leneoasele"}},{"word":"leneș","pos":"adj","definitions":["lazy"],"pronunciation":"/ˈle.neʃ/","forms":{"feminine-singular":"leneșă","masculine-plural":"leneși","feminine-neuter-plural":"leneșe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leneș","error-unrecognized-form-feminine-indefinite-singular":"leneșă","error-unrecognized-form-indefinite-masculine-plural":"leneși","error-unrecognized-form-feminine-indefinite-neuter-plural":"leneșe","definite-error-unrecognized-form-masculine-neuter-singular":"leneșul","definite-error-unrecognized-form-feminine-singular":"leneșa","definite-error-unrecognized-form-masculine-plural":"leneșii","definite-error-unrecognized-form-feminine-neuter-plural":"leneșele"}},{"word":"leneș","pos":"noun","definitions":["lazy person","sloth (animal)"],"pronunciation":"/ˈle.neʃ/","forms":{"plural":"leneși","feminine":"equivalent leneșă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leneș","accusative-definite-nominative-singular":"leneșul","accusative-indefinite-nominative-plural":"leneși","accusative-definite-nominative-plural":"leneșii","dative-genitive-indefinite-singular":"leneș","dative-definite-genitive-singular":"leneșului","dative-genitive-indefinite-plural":"leneși","dative-definite-genitive-plural":"leneșilor","singular-vocative":"leneșule","plural-vocative":"leneșilor"}},{"word":"leneșă","pos":"noun","definitions":["female equivalent of leneș"],"forms":{"plural":"leneșe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leneșă","accusative-definite-nominative-singular":"leneșa","accusative-indefinite-nominative-plural":"leneșe","accusative-definite-nominative-plural":"leneșele","dative-genitive-indefinite-singular":"leneșe","dative-definite-genitive-singular":"leneșei","dative-genitive-indefinite-plural":"leneșe","dative-definite-genitive-plural":"leneșelor","singular-vocative":"leneșă","plural-vocative":"leneșelor"}},{"word":"leneșie","pos":"noun","definitions":["laziness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"leneșie","accusative-definite-nominative":"leneșia","dative-genitive-indefinite":"leneșii","dative-definite-genitive":"leneșiei","vocative":"leneșie"}},{"word":"leneveală","pos":"noun","definitions":["laziness"],"forms":{"plural":"leneveli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leneveală","accusative-definite-nominative-singular":"leneveala","accusative-indefinite-nominative-plural":"lenevele","accusative-definite-nominative-plural":"lenevelele","dative-genitive-indefinite-singular":"lenevele","dative-definite-genitive-singular":"lenevelei","dative-genitive-indefinite-plural":"lenevele","dative-definite-genitive-plural":"lenevelelor","singular-vocative":"leneveală","plural-vocative":"lenevelelor"}},{"word":"lenevi","pos":"verb","definitions":["to be idle"],"forms":{"canonical":"a lenevi 4th conjugation","present-singular-third-person":"lenevește","participle-past":"lenevit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lenevi","gerund":"lenevind","first-person-indicative-present-singular":"lenevesc","indicative-present-second-person-singular":"lenevești","indicative-present-singular-third-person":"lenevește","first-person-indicative-plural-present":"lenevim","indicative-plural-present-second-person":"leneviți","indicative-plural-present-third-person":"lenevesc","first-person-imperfect-indicative-singular":"leneveam","imperfect-indicative-second-person-singular":"leneveai","imperfect-indicative-singular-third-person":"lenevea","first-person-imperfect-indicative-plural":"leneveam","imperfect-indicative-plural-second-person":"leneveați","imperfect-indicative-plural-third-person":"leneveau","first-person-indicative-perfect-singular":"lenevii","indicative-perfect-second-person-singular":"leneviși","indicative-perfect-singular-third-person":"lenevi","first-person-indicative-perfect-plural":"lenevirăm","indicative-perfect-plural-second-person":"lenevirăți","indicative-perfect-plural-third-person":"leneviră","first-person-indicative-pluperfect-singular":"lenevisem","indicative-pluperfect-second-person-singular":"leneviseși","indicative-pluperfect-singular-third-person":"lenevise","first-person-indicative-pluperfect-plural":"leneviserăm","indicative-pluperfect-plural-second-person":"leneviserăți","indicative-pluperfect-plural-third-person":"leneviseră","first-person-present-singular-subjunctive":"să lenevesc","present-second-person-singular-subjunctive":"să lenevești","present-singular-subjunctive-third-person":"să lenevească","first-person-plural-present-subjunctive":"să lenevim","plural-present-second-person-subjunctive":"să leneviți","plural-present-subjunctive-third-person":"să lenevească","imperative-second-person-singular":"lenevește","imperative-plural-second-person":"leneviți","imperative-negative-second-person-singular":"nu lenevi","imperative-negative-plural-second-person":"nu leneviți"}},{"word":"lenevie","pos":"noun","definitions":["laziness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"lenevie","accusative-definite-nominative":"lenevia","dative-genitive-indefinite":"lenevii","dative-definite-genitive":"leneviei","vocative":"lenevie"}},{"word":"lenevior","pos":"adj","definitions":["diminutive of leniv"],"pronunciation":"/le.neˈvjor/","forms":{"feminine-singular":"lenevioară","masculine-plural":"leneviori","feminine-neuter-plural":"lenevioare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lenevior","error-unrecognized-form-feminine-indefinite-singular":"lenevioară","error-unrecognized-form-indefinite-masculine-plural":"leneviori","error-unrecognized-form-feminine-indefinite-neuter-plural":"lenevioare","definite-error-unrecognized-form-masculine-neuter-singular":"leneviorul","definite-error-unrecognized-form-feminine-singular":"lenevioara","definite-error-unrecognized-form-masculine-plural":"leneviorii","definite-error-unrecognized-form-feminine-neuter-plural":"lenevioarele"}},{"word":"lenevire","pos":"noun","definitions":["becoming indolent"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"lenevire","accusative-definite-nominative":"lenevirea","dative-genitive-indefinite":"leneviri","dative-definite-genitive":"lenevirii","vocative":"lenevire"}},{"word":"lenevit","pos":"noun","definitions":["laze"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lenevit","accusative-definite-nominative":"lenevitul","dative-genitive-indefinite":"lenevit","dative-definite-genitive":"lenevitului","vocative":"lenevitule"}},{"word":"lenevit","pos":"verb","definitions":["past participle of lenevi"],"forms":{"participle-past":"of lenevi"}},{"word":"lenevos","pos":"adj","definitions":["lazy"],"forms":{"feminine-singular":"lenevoasă","masculine-plural":"lenevoși","feminine-neuter-plural":"lenevoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lenevos","error-unrecognized-form-feminine-indefinite-singular":"lenevoasă","error-unrecognized-form-indefinite-masculine-plural":"lenevoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lenevoase","definite-error-unrecognized-form-masculine-neuter-singular":"lenevosul","definite-error-unrecognized-form-feminine-singular":"lenevoasa","definite-error-unrecognized-form-masculine-plural":"lenevoșii","definite-error-unrecognized-form-feminine-neuter-plural":"lenevoasele"}},{"word":"lenevoșie","pos":"noun","definitions":["laziness, sloth, idleness, indolence"],"forms":{"plural":"lenevoșii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lenevoșie","accusative-definite-nominative-singular":"lenevoșia","accusative-indefinite-nominative-plural":"lenevoșii","accusative-definite-nominative-plural":"lenevoșiile","dative-genitive-indefinite-singular":"lenevoșii","dative-definite-genitive-singular":"lenevoșiei","dative-genitive-indefinite-plural":"lenevoșii","dative-definite-genitive-plural":"lenevoșiilor","singular-vocative":"lenevoșie","plural-vocative":"lenevoșiilor"}},{"word":"Lenghel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lenghel"}},{"word":"lengher","pos":"noun","definitions":["a Polish Jew"],"forms":{"plural":"lengheri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lengher","accusative-definite-nominative-singular":"lengherul","accusative-indefinite-nominative-plural":"lengheri","accusative-definite-nominative-plural":"lengherii","dative-genitive-indefinite-singular":"lengher","dative-definite-genitive-singular":"lengherului","dative-genitive-indefinite-plural":"lengheri","dative-definite-genitive-plural":"lengherilor","singular-vocative":"lengherule","plural-vocative":"lengherilor"}},{"word":"lenghi","pos":"noun","definitions":["alternative form of lenchi"],"forms":{"plural":"lenghiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lenghi","accusative-definite-nominative-singular":"lenghiul","accusative-indefinite-nominative-plural":"lenghiuri","accusative-definite-nominative-plural":"lenghiurile","dative-genitive-indefinite-singular":"lenghi","dative-definite-genitive-singular":"lenghiului","dative-genitive-indefinite-plural":"lenghiuri","dative-definite-genitive-plural":"lenghiurilor","singular-vocative":"lenghiule","plural-vocative":"lenghiurilor"}},{"word":"lenie","pos":"noun","definitions":["laziness, sloth, idleness, indolence"],"forms":{"plural":"lenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lenie","accusative-definite-nominative-singular":"lenia","accusative-indefinite-nominative-plural":"lenii","accusative-definite-nominative-plural":"leniile","dative-genitive-indefinite-singular":"lenii","dative-definite-genitive-singular":"leniei","dative-genitive-indefinite-plural":"lenii","dative-definite-genitive-plural":"leniilor","singular-vocative":"lenie","plural-vocative":"leniilor"}},{"word":"lenifiant","pos":"adj","definitions":["emollient, soothing"],"forms":{"feminine-singular":"lenifiantă","masculine-plural":"lenifianți","feminine-neuter-plural":"lenifiante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lenifiant","error-unrecognized-form-feminine-indefinite-singular":"lenifiantă","error-unrecognized-form-indefinite-masculine-plural":"lenifianți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lenifiante","definite-error-unrecognized-form-masculine-neuter-singular":"lenifiantul","definite-error-unrecognized-form-feminine-singular":"lenifianta","definite-error-unrecognized-form-masculine-plural":"lenifianții","definite-error-unrecognized-form-feminine-neuter-plural":"lenifiantele"}},{"word":"Lenin","pos":"name","definitions":["a village in Lenin, Transnistria, Moldova","a commune of Transnistria, Moldova"],"gender":"m"},{"word":"leningrădean","pos":"adj","definitions":["of, from or relating to Leningrad"],"forms":{"feminine-singular":"leningrădeană","masculine-plural":"leningrădeni","feminine-neuter-plural":"leningrădene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leningrădean","error-unrecognized-form-feminine-indefinite-singular":"leningrădeană","error-unrecognized-form-indefinite-masculine-plural":"leningrădeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"leningrădene","definite-error-unrecognized-form-masculine-neuter-singular":"leningrădeanul","definite-error-unrecognized-form-feminine-singular":"leningrădeana","definite-error-unrecognized-form-masculine-plural":"leningrădenii","definite-error-unrecognized-form-feminine-neuter-plural":"leningrădenele"}},{"word":"leningrădean","pos":"noun","definitions":["native or inhabitant of Leningrad (usually male)"],"forms":{"plural":"leningrădeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leningrădean","accusative-definite-nominative-singular":"leningrădeanul","accusative-indefinite-nominative-plural":"leningrădeni","accusative-definite-nominative-plural":"leningrădenii","dative-genitive-indefinite-singular":"leningrădean","dative-definite-genitive-singular":"leningrădeanului","dative-genitive-indefinite-plural":"leningrădeni","dative-definite-genitive-plural":"leningrădenilor","singular-vocative":"leningrădeanule","plural-vocative":"leningrădenilor"}},{"word":"leninism","pos":"noun","definitions":["Leninism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"leninism","accusative-definite-nominative":"leninismul","dative-genitive-indefinite":"leninism","dative-definite-genitive":"leninismului","vocative":"leninismule"}},{"word":"leninist","pos":"adj","definitions":["Leninist (relating to Lenin)"],"forms":{"feminine-singular":"leninistă","masculine-plural":"leniniști","feminine-neuter-plural":"leniniste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leninist","error-unrecognized-form-feminine-indefinite-singular":"leninistă","error-unrecognized-form-indefinite-masculine-plural":"leniniști","error-unrecognized-form-feminine-indefinite-neuter-plural":"leniniste","definite-error-unrecognized-form-masculine-neuter-singular":"leninistul","definite-error-unrecognized-form-feminine-singular":"leninista","definite-error-unrecognized-form-masculine-plural":"leniniștii","definite-error-unrecognized-form-feminine-neuter-plural":"leninistele"}},{"word":"leninist","pos":"noun","definitions":["Leninist"],"forms":{"plural":"leniniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leninist","accusative-definite-nominative-singular":"leninistul","accusative-indefinite-nominative-plural":"leniniști","accusative-definite-nominative-plural":"leniniștii","dative-genitive-indefinite-singular":"leninist","dative-definite-genitive-singular":"leninistului","dative-genitive-indefinite-plural":"leniniști","dative-definite-genitive-plural":"leniniștilor","singular-vocative":"leninistule","plural-vocative":"leniniștilor"}},{"word":"leninistă","pos":"noun","definitions":["female equivalent of leninist"],"forms":{"plural":"leniniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leninistă","accusative-definite-nominative-singular":"leninista","accusative-indefinite-nominative-plural":"leniniste","accusative-definite-nominative-plural":"leninistele","dative-genitive-indefinite-singular":"leniniste","dative-definite-genitive-singular":"leninistei","dative-genitive-indefinite-plural":"leniniste","dative-definite-genitive-plural":"leninistelor","singular-vocative":"leninistă","plural-vocative":"leninistelor"}},{"word":"lenios","pos":"adj","definitions":["obsolete form of lenos"],"forms":{"feminine-singular":"lenioasă","masculine-plural":"lenioși","feminine-neuter-plural":"lenioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lenios","error-unrecognized-form-feminine-indefinite-singular":"lenioasă","error-unrecognized-form-indefinite-masculine-plural":"lenioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lenioase","definite-error-unrecognized-form-masculine-neuter-singular":"leniosul","definite-error-unrecognized-form-feminine-singular":"lenioasa","definite-error-unrecognized-form-masculine-plural":"lenioșii","definite-error-unrecognized-form-feminine-neuter-plural":"lenioasele"}},{"word":"lenire","pos":"noun","definitions":["idling"],"forms":{"plural":"leniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lenire","accusative-definite-nominative-singular":"lenirea","accusative-indefinite-nominative-plural":"leniri","accusative-definite-nominative-plural":"lenirile","dative-genitive-indefinite-singular":"leniri","dative-definite-genitive-singular":"lenirii","dative-genitive-indefinite-plural":"leniri","dative-definite-genitive-plural":"lenirilor","singular-vocative":"lenire","plural-vocative":"lenirilor"}},{"word":"lenitiv","pos":"noun","definitions":["lenitive"],"forms":{"plural":"lenitivi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lenitiv","accusative-definite-nominative-singular":"lenitivul","accusative-indefinite-nominative-plural":"lenitivi","accusative-definite-nominative-plural":"lenitivile","dative-genitive-indefinite-singular":"lenitiv","dative-definite-genitive-singular":"lenitivului","dative-genitive-indefinite-plural":"lenitivi","dative-definite-genitive-plural":"lenitivilor","singular-vocative":"lenitivule","plural-vocative":"lenitivilor"}},{"word":"leniv","pos":"adj","definitions":["lazy"],"forms":{"feminine-singular":"lenivă","masculine-plural":"lenivi","feminine-neuter-plural":"lenive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leniv","error-unrecognized-form-feminine-indefinite-singular":"lenivă","error-unrecognized-form-indefinite-masculine-plural":"lenivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lenive","definite-error-unrecognized-form-masculine-neuter-singular":"lenivul","definite-error-unrecognized-form-feminine-singular":"leniva","definite-error-unrecognized-form-masculine-plural":"lenivii","definite-error-unrecognized-form-feminine-neuter-plural":"lenivele"}},{"word":"lenjereasă","pos":"noun","definitions":["seamstress"],"forms":{"plural":"lenjerese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lenjereasă","accusative-definite-nominative-singular":"lenjereasa","accusative-indefinite-nominative-plural":"lenjerese","accusative-definite-nominative-plural":"lenjeresele","dative-genitive-indefinite-singular":"lenjerese","dative-definite-genitive-singular":"lenjeresei","dative-genitive-indefinite-plural":"lenjerese","dative-definite-genitive-plural":"lenjereselor","singular-vocative":"lenjereasă","plural-vocative":"lenjereselor"}},{"word":"lenjerie","pos":"noun","definitions":["linen"],"forms":{"plural":"lenjerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lenjerie","accusative-definite-nominative-singular":"lenjeria","accusative-indefinite-nominative-plural":"lenjerii","accusative-definite-nominative-plural":"lenjeriile","dative-genitive-indefinite-singular":"lenjerii","dative-definite-genitive-singular":"lenjeriei","dative-genitive-indefinite-plural":"lenjerii","dative-definite-genitive-plural":"lenjeriilor","singular-vocative":"lenjerie","plural-vocative":"lenjeriilor"}},{"word":"lenjuri","pos":"noun","definitions":["linen"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lenjuri","accusative-definite-nominative":"lenjuriul","dative-genitive-indefinite":"lenjuri","dative-definite-genitive":"lenjuriului","vocative":"lenjuriule"}},{"word":"lenociniu","pos":"noun","definitions":["pimping"],"forms":{"plural":"lenocinii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lenociniu","accusative-definite-nominative-singular":"lenociniuul","accusative-indefinite-nominative-plural":"lenocinii","accusative-definite-nominative-plural":"lenociniile","dative-genitive-indefinite-singular":"lenociniu","dative-definite-genitive-singular":"lenociniuului","dative-genitive-indefinite-plural":"lenocinii","dative-definite-genitive-plural":"lenociniilor","singular-vocative":"lenociniuule","plural-vocative":"lenociniilor"}},{"word":"lenos","pos":"adj","definitions":["lazy"],"forms":{"feminine-singular":"lenoasă","masculine-plural":"lenoși","feminine-neuter-plural":"lenoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lenos","error-unrecognized-form-feminine-indefinite-singular":"lenoasă","error-unrecognized-form-indefinite-masculine-plural":"lenoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lenoase","definite-error-unrecognized-form-masculine-neuter-singular":"lenosul","definite-error-unrecognized-form-feminine-singular":"lenoasa","definite-error-unrecognized-form-masculine-plural":"lenoșii","definite-error-unrecognized-form-feminine-neuter-plural":"lenoasele"}},{"word":"lent","pos":"adj","definitions":["slow"],"forms":{"feminine-singular":"lentă","masculine-plural":"lenți","feminine-neuter-plural":"lente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lent","error-unrecognized-form-feminine-indefinite-singular":"lentă","error-unrecognized-form-indefinite-masculine-plural":"lenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lente","definite-error-unrecognized-form-masculine-neuter-singular":"lentul","definite-error-unrecognized-form-feminine-singular":"lenta","definite-error-unrecognized-form-masculine-plural":"lenții","definite-error-unrecognized-form-feminine-neuter-plural":"lentele"}},{"word":"lentă","pos":"noun","definitions":["ribbon, band"],"forms":{"plural":"lente","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lentă","accusative-definite-nominative-singular":"lenta","accusative-indefinite-nominative-plural":"lente","accusative-definite-nominative-plural":"lentele","dative-genitive-indefinite-singular":"lente","dative-definite-genitive-singular":"lentei","dative-genitive-indefinite-plural":"lente","dative-definite-genitive-plural":"lentelor","singular-vocative":"lentă","plural-vocative":"lentelor"}},{"word":"lentamente","pos":"adv","definitions":["slowly"]},{"word":"lentețe","pos":"noun","definitions":["slowness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"lentețe","accusative-definite-nominative":"lentețea","dative-genitive-indefinite":"lentețe","dative-definite-genitive":"lenteței","vocative":"lentețe"}},{"word":"lenticelă","pos":"noun","definitions":["lenticel"],"forms":{"plural":"lenticele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lenticelă","accusative-definite-nominative-singular":"lenticela","accusative-indefinite-nominative-plural":"lenticele","accusative-definite-nominative-plural":"lenticelele","dative-genitive-indefinite-singular":"lenticele","dative-definite-genitive-singular":"lenticelei","dative-genitive-indefinite-plural":"lenticele","dative-definite-genitive-plural":"lenticelelor","singular-vocative":"lenticelă","plural-vocative":"lenticelelor"}},{"word":"lenticelat","pos":"adj","definitions":["lenticellate"],"forms":{"feminine-singular":"lenticelată","masculine-plural":"lenticelați","feminine-neuter-plural":"lenticelate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lenticelat","error-unrecognized-form-feminine-indefinite-singular":"lenticelată","error-unrecognized-form-indefinite-masculine-plural":"lenticelați","error-unrecognized-form-feminine-indefinite-neuter-plural":"lenticelate","definite-error-unrecognized-form-masculine-neuter-singular":"lenticelatul","definite-error-unrecognized-form-feminine-singular":"lenticelata","definite-error-unrecognized-form-masculine-plural":"lenticelații","definite-error-unrecognized-form-feminine-neuter-plural":"lenticelatele"}},{"word":"lenticular","pos":"adj","definitions":["lenticular"],"forms":{"feminine-singular":"lenticulară","masculine-plural":"lenticulari","feminine-neuter-plural":"lenticulare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lenticular","error-unrecognized-form-feminine-indefinite-singular":"lenticulară","error-unrecognized-form-indefinite-masculine-plural":"lenticulari","error-unrecognized-form-feminine-indefinite-neuter-plural":"lenticulare","definite-error-unrecognized-form-masculine-neuter-singular":"lenticularul","definite-error-unrecognized-form-feminine-singular":"lenticulara","definite-error-unrecognized-form-masculine-plural":"lenticularii","definite-error-unrecognized-form-feminine-neuter-plural":"lenticularele"}},{"word":"lentiform","pos":"adj","definitions":["lentiform"],"forms":{"feminine-singular":"lentiformă","masculine-plural":"lentiformi","feminine-neuter-plural":"lentiforme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lentiform","error-unrecognized-form-feminine-indefinite-singular":"lentiformă","error-unrecognized-form-indefinite-masculine-plural":"lentiformi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lentiforme","definite-error-unrecognized-form-masculine-neuter-singular":"lentiformul","definite-error-unrecognized-form-feminine-singular":"lentiforma","definite-error-unrecognized-form-masculine-plural":"lentiformii","definite-error-unrecognized-form-feminine-neuter-plural":"lentiformele"}},{"word":"lentiginoză","pos":"noun","definitions":["lentiginosis"],"forms":{"plural":"lentiginoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lentiginoză","accusative-definite-nominative-singular":"lentiginoza","accusative-indefinite-nominative-plural":"lentiginoze","accusative-definite-nominative-plural":"lentiginozele","dative-genitive-indefinite-singular":"lentiginoze","dative-definite-genitive-singular":"lentiginozei","dative-genitive-indefinite-plural":"lentiginoze","dative-definite-genitive-plural":"lentiginozelor","singular-vocative":"lentiginoză","plural-vocative":"lentiginozelor"}},{"word":"lentigo","pos":"noun","definitions":["lentigo"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lentigo","accusative-definite-nominative":"lentigoul","dative-genitive-indefinite":"lentigo","dative-definite-genitive":"lentigoului","vocative":"lentigoule"}},{"word":"lentilă","pos":"noun","definitions":["lens"],"forms":{"plural":"lentile"}},{"word":"lentilă de contact","pos":"noun","definitions":["contact lens"],"forms":{"plural":"lentile de contact"}},{"word":"lentilă gravitațională","pos":"noun","definitions":["gravitational lens"],"forms":{"plural":"lentile gravitaționale"}},{"word":"lentile de contact","pos":"noun","definitions":["contact lens"]},{"word":"lentisc","pos":"noun","definitions":["lentisk, mastic-tree (Pistacia lentiscus)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"lentisc","accusative-definite-nominative":"lentiscul","dative-genitive-indefinite":"lentisc","dative-definite-genitive":"lentiscului","vocative":"lentiscule"}},{"word":"lentitudine","pos":"noun","definitions":["sluggishness"],"forms":{"plural":"lentitudini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lentitudine","accusative-definite-nominative-singular":"lentitudinea","accusative-indefinite-nominative-plural":"lentitudini","accusative-definite-nominative-plural":"lentitudinile","dative-genitive-indefinite-singular":"lentitudini","dative-definite-genitive-singular":"lentitudinii","dative-genitive-indefinite-plural":"lentitudini","dative-definite-genitive-plural":"lentitudinilor","singular-vocative":"lentitudine","plural-vocative":"lentitudinilor"}},{"word":"lento","pos":"adv","definitions":["lento"]},{"word":"lentoare","pos":"noun","definitions":["slowness"],"forms":{"plural":"lentori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lentoare","accusative-definite-nominative-singular":"lentoarea","accusative-indefinite-nominative-plural":"lentoari","accusative-definite-nominative-plural":"lentoarile","dative-genitive-indefinite-singular":"lentoari","dative-definite-genitive-singular":"lentoarii","dative-genitive-indefinite-plural":"lentoari","dative-definite-genitive-plural":"lentoarilor","singular-vocative":"lentoare","plural-vocative":"lentoarilor"}},{"word":"lentos","pos":"adj","definitions":["slow"],"forms":{"feminine-singular":"lentoasă","masculine-plural":"lentoși","feminine-neuter-plural":"lentoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lentos","error-unrecognized-form-feminine-indefinite-singular":"lentoasă","error-unrecognized-form-indefinite-masculine-plural":"lentoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lentoase","definite-error-unrecognized-form-masculine-neuter-singular":"lentosul","definite-error-unrecognized-form-feminine-singular":"lentoasa","definite-error-unrecognized-form-masculine-plural":"lentoșii","definite-error-unrecognized-form-feminine-neuter-plural":"lentoasele"}},{"word":"lențulete","pos":"noun","definitions":["diminutive of lanț"],"forms":{"plural":"lențuleteți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lențulete","accusative-definite-nominative-singular":"lențuleteul","accusative-indefinite-nominative-plural":"lențuleteți","accusative-definite-nominative-plural":"lențuleteții","dative-genitive-indefinite-singular":"lențulete","dative-definite-genitive-singular":"lențuleteului","dative-genitive-indefinite-plural":"lențuleteți","dative-definite-genitive-plural":"lențuleteților","singular-vocative":"lențuleteule","plural-vocative":"lențuleteților"}},{"word":"Lenuța","pos":"name","definitions":["a female given name"],"gender":"f"},{"word":"leoaică","pos":"noun","definitions":["lioness"],"pronunciation":"/le.ˈo̯aj.kə/","forms":{"plural":"leoaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leoaică","accusative-definite-nominative-singular":"leoaica","accusative-indefinite-nominative-plural":"leoaice","accusative-definite-nominative-plural":"leoaicele","dative-genitive-indefinite-singular":"leoaice","dative-definite-genitive-singular":"leoaicei","dative-genitive-indefinite-plural":"leoaice","dative-definite-genitive-plural":"leoaicelor","singular-vocative":"leoaică","plural-vocative":"leoaicelor"}},{"word":"leoarbă","pos":"noun","definitions":["mouth, gab, gob"],"forms":{"plural":"leoarbe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leoarbă","accusative-definite-nominative-singular":"leoarba","accusative-indefinite-nominative-plural":"leoarbe","accusative-definite-nominative-plural":"leoarbele","dative-genitive-indefinite-singular":"leoarbe","dative-definite-genitive-singular":"leoarbei","dative-genitive-indefinite-plural":"leoarbe","dative-definite-genitive-plural":"leoarbelor","singular-vocative":"leoarbă","plural-vocative":"leoarbelor"}},{"word":"leoarcă","pos":"adj","definitions":["dripping wet, very wet, soaking"],"pronunciation":"/ˈle̯o̯ar.kə/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leoarcă","error-unrecognized-form-feminine-indefinite-singular":"leoarcă","error-unrecognized-form-indefinite-masculine-plural":"leoarcă","error-unrecognized-form-feminine-indefinite-neuter-plural":"leoarcă","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"leoarpă","pos":"noun","definitions":["magnifying glass"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"leoarpă","accusative-definite-nominative":"leoarpa","dative-genitive-indefinite":"leoarpe","dative-definite-genitive":"leoarpei","vocative":"leoarpă"}},{"word":"leoi","pos":"noun","definitions":["augmentative of leu"],"forms":{"plural":"leoi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leoi","accusative-definite-nominative-singular":"leoiul","accusative-indefinite-nominative-plural":"leoi","accusative-definite-nominative-plural":"leoii","dative-genitive-indefinite-singular":"leoi","dative-definite-genitive-singular":"leoiului","dative-genitive-indefinite-plural":"leoi","dative-definite-genitive-plural":"leoilor","singular-vocative":"leoiule","plural-vocative":"leoilor"}},{"word":"Leon","pos":"name","definitions":["a male given name from Latin"],"gender":"m","forms":{"dative-genitive":"lui Leon"}},{"word":"Leonăchescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Leonăchescu"}},{"word":"Leonard","pos":"name","definitions":["a male given name"],"gender":"m","forms":{"dative-genitive":"lui Leonard"}},{"word":"Leonescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Leonescu"}},{"word":"leonin","pos":"adj","definitions":["leonine"],"forms":{"feminine-singular":"leonină","masculine-plural":"leonini","feminine-neuter-plural":"leonine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leonin","error-unrecognized-form-feminine-indefinite-singular":"leonină","error-unrecognized-form-indefinite-masculine-plural":"leonini","error-unrecognized-form-feminine-indefinite-neuter-plural":"leonine","definite-error-unrecognized-form-masculine-neuter-singular":"leoninul","definite-error-unrecognized-form-feminine-singular":"leonina","definite-error-unrecognized-form-masculine-plural":"leoninii","definite-error-unrecognized-form-feminine-neuter-plural":"leoninele"}},{"word":"Leonte","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Leonte"}},{"word":"Leontescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Leontescu"}},{"word":"leontiazis","pos":"noun","definitions":["leontiasis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"leontiazis","accusative-definite-nominative":"leontiazisul","dative-genitive-indefinite":"leontiazis","dative-definite-genitive":"leontiazisului","vocative":"leontiazisule"}},{"word":"Leontică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Leontică"}},{"word":"Leontinescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Leontinescu"}},{"word":"Leontinești","pos":"name","definitions":["a village in Ardeoani, Bacău County, Romania"],"gender":"m"},{"word":"Leontiuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Leontiuc"}},{"word":"leonușcă","pos":"noun","definitions":["wild fennel (Nigella arvensis)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"leonușcă","accusative-definite-nominative":"leonușca","dative-genitive-indefinite":"leonușce","dative-definite-genitive":"leonușcei","vocative":"leonușcă"}},{"word":"leopăi","pos":"verb","definitions":["alternative form of lipăi"],"forms":{"canonical":"a leopăi 4th conjugation","present-singular-third-person":"leopăie","participle-past":"leopăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a leopăi","gerund":"leopăind","first-person-indicative-present-singular":"leopăi","indicative-present-second-person-singular":"leopăi","indicative-present-singular-third-person":"leopăie","first-person-indicative-plural-present":"leopăim","indicative-plural-present-second-person":"leopăiți","indicative-plural-present-third-person":"leopăie","first-person-imperfect-indicative-singular":"leopăiam","imperfect-indicative-second-person-singular":"leopăiai","imperfect-indicative-singular-third-person":"leopăia","first-person-imperfect-indicative-plural":"leopăiam","imperfect-indicative-plural-second-person":"leopăiați","imperfect-indicative-plural-third-person":"leopăiau","first-person-indicative-perfect-singular":"leopăii","indicative-perfect-second-person-singular":"leopăiși","indicative-perfect-singular-third-person":"leopăi","first-person-indicative-perfect-plural":"leopăirăm","indicative-perfect-plural-second-person":"leopăirăți","indicative-perfect-plural-third-person":"leopăiră","first-person-indicative-pluperfect-singular":"leopăisem","indicative-pluperfect-second-person-singular":"leopăiseși","indicative-pluperfect-singular-third-person":"leopăise","first-person-indicative-pluperfect-plural":"leopăiserăm","indicative-pluperfect-plural-second-person":"leopăiserăți","indicative-pluperfect-plural-third-person":"leopăiseră","first-person-present-singular-subjunctive":"să leopăi","present-second-person-singular-subjunctive":"să leopăi","present-singular-subjunctive-third-person":"să leopăie","first-person-plural-present-subjunctive":"să leopăim","plural-present-second-person-subjunctive":"să leopăiți","plural-present-subjunctive-third-person":"să leopăie","imperative-second-person-singular":"leopăie","imperative-plural-second-person":"leopăiți","imperative-negative-second-person-singular":"nu leopăi","imperative-negative-plural-second-person":"nu leopăiți"}},{"word":"leopard","pos":"noun","definitions":["leopard"],"pronunciation":"/ˌle.oˈpard/","forms":{"plural":"leoparzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leopard","accusative-definite-nominative-singular":"leopardul","accusative-indefinite-nominative-plural":"leoparzi","accusative-definite-nominative-plural":"leoparzii","dative-genitive-indefinite-singular":"leopard","dative-definite-genitive-singular":"leopardului","dative-genitive-indefinite-plural":"leoparzi","dative-definite-genitive-plural":"leoparzilor","singular-vocative":"leopardule","plural-vocative":"leoparzilor"}},{"word":"leopardul","pos":"noun","definitions":["definite nominative/accusative singular of leopard"]},{"word":"leopardul zăpezilor","pos":"noun","definitions":["snow leopard"],"forms":{"plural":"loparzii zăpezilor"}},{"word":"leopardului","pos":"noun","definitions":["definite genitive/dative singular of leopard"]},{"word":"leoparzi","pos":"noun","definitions":["plural of leopard"],"gender":"m-p"},{"word":"leoparzii","pos":"noun","definitions":["definite nominative/accusative plural of leopard"]},{"word":"leorbăi","pos":"verb","definitions":["to chatter"],"forms":{"canonical":"a leorbăi 4th conjugation","present-singular-third-person":"leorbăie","participle-past":"leorbăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a leorbăi","gerund":"leorbăind","first-person-indicative-present-singular":"leorbăi","indicative-present-second-person-singular":"leorbăi","indicative-present-singular-third-person":"leorbăie","first-person-indicative-plural-present":"leorbăim","indicative-plural-present-second-person":"leorbăiți","indicative-plural-present-third-person":"leorbăie","first-person-imperfect-indicative-singular":"leorbăiam","imperfect-indicative-second-person-singular":"leorbăiai","imperfect-indicative-singular-third-person":"leorbăia","first-person-imperfect-indicative-plural":"leorbăiam","imperfect-indicative-plural-second-person":"leorbăiați","imperfect-indicative-plural-third-person":"leorbăiau","first-person-indicative-perfect-singular":"leorbăii","indicative-perfect-second-person-singular":"leorbăiși","indicative-perfect-singular-third-person":"leorbăi","first-person-indicative-perfect-plural":"leorbăirăm","indicative-perfect-plural-second-person":"leorbăirăți","indicative-perfect-plural-third-person":"leorbăiră","first-person-indicative-pluperfect-singular":"leorbăisem","indicative-pluperfect-second-person-singular":"leorbăiseși","indicative-pluperfect-singular-third-person":"leorbăise","first-person-indicative-pluperfect-plural":"leorbăiserăm","indicative-pluperfect-plural-second-person":"leorbăiserăți","indicative-pluperfect-plural-third-person":"leorbăiseră","first-person-present-singular-subjunctive":"să leorbăi","present-second-person-singular-subjunctive":"să leorbăi","present-singular-subjunctive-third-person":"să leorbăie","first-person-plural-present-subjunctive":"să leorbăim","plural-present-second-person-subjunctive":"să leorbăiți","plural-present-subjunctive-third-person":"să leorbăie","imperative-second-person-singular":"leorbăie","imperative-plural-second-person":"leorbăiți","imperative-negative-second-person-singular":"nu leorbăi","imperative-negative-plural-second-person":"nu leorbăiți"}},{"word":"leorbăială","pos":"noun","definitions":["chatter"],"forms":{"plural":"leorbăieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leorbăială","accusative-definite-nominative-singular":"leorbăiala","accusative-indefinite-nominative-plural":"leorbăiele","accusative-definite-nominative-plural":"leorbăielele","dative-genitive-indefinite-singular":"leorbăiele","dative-definite-genitive-singular":"leorbăielei","dative-genitive-indefinite-plural":"leorbăiele","dative-definite-genitive-plural":"leorbăielelor","singular-vocative":"leorbăială","plural-vocative":"leorbăielelor"}},{"word":"leorbău","pos":"noun","definitions":["chatterbox"],"pronunciation":"/le̯orˈbəw/","forms":{"plural":"leorbăi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leorbău","accusative-definite-nominative-singular":"leorbăul","accusative-indefinite-nominative-plural":"leorbăi","accusative-definite-nominative-plural":"leorbăii","dative-genitive-indefinite-singular":"leorbău","dative-definite-genitive-singular":"leorbăului","dative-genitive-indefinite-plural":"leorbăi","dative-definite-genitive-plural":"leorbăilor","singular-vocative":"leorbăule","plural-vocative":"leorbăilor"}},{"word":"leordă","pos":"noun","definitions":["alternative form of leurdă"],"forms":{"plural":"leorde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leordă","accusative-definite-nominative-singular":"leorda","accusative-indefinite-nominative-plural":"leorde","accusative-definite-nominative-plural":"leordele","dative-genitive-indefinite-singular":"leorde","dative-definite-genitive-singular":"leordei","dative-genitive-indefinite-plural":"leorde","dative-definite-genitive-plural":"leordelor","singular-vocative":"leordă","plural-vocative":"leordelor"}},{"word":"leordacă","pos":"noun","definitions":["lesser butterfly-orchid (Platanthera bifolia)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"leordacă","accusative-definite-nominative":"leordaca","dative-genitive-indefinite":"leordace","dative-definite-genitive":"leordacei","vocative":"leordacă"}},{"word":"Leordeni","pos":"name","definitions":["a commune of Argeș County, Romania","a village in Leordeni, Argeș County, Romania","a village in Gheorghe Doja, Mureș County, Romania"],"gender":"m"},{"word":"Leordiș","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Lung"],"gender":"m"},{"word":"Leordoaia","pos":"name","definitions":["a village in Hîrcești, Ungheni Raion, Moldova","a village in Hîrjauca, Călărași Raion, Moldova"],"gender":"f"},{"word":"Leordoasa","pos":"name","definitions":["a village in Argetoaia, Dolj County, Romania"],"gender":"f"},{"word":"Leorinț","pos":"name","definitions":["a village in Rădești, Alba County, Romania"],"gender":"m"},{"word":"Leorința","pos":"name","definitions":["a village in Grebenișu de Câmpie, Mureș County, Romania"],"gender":"f"},{"word":"Leorința-Șăulia","pos":"name","definitions":["a village in Șăulia, Mureș County, Romania"],"gender":"f"},{"word":"Leoști","pos":"name","definitions":["a village in Pădureni, Vaslui County, Romania","a village in Tătărăni, Vaslui County, Romania"],"gender":"m"},{"word":"Leotești","pos":"name","definitions":["a village in Bobicești, Olt County, Romania"],"gender":"m"},{"word":"Leova","pos":"name","definitions":["a city and district of Moldova","a male given name"],"gender":"f"},{"word":"lepăda","pos":"verb","definitions":["to renounce, abjure, abandon, relinquish, give up","to cast, hurl, throw, fling","to slip, let drop, cast off, break off"],"forms":{"canonical":"a lepăda 1st conjugation","present-singular-third-person":"leapădă","participle-past":"lepădat","subjunctive-third-person":"lepede","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a lepăda","gerund":"lepădând","first-person-indicative-present-singular":"lepăd","indicative-present-second-person-singular":"lepezi","indicative-present-singular-third-person":"leapădă","first-person-indicative-plural-present":"lepădăm","indicative-plural-present-second-person":"lepădați","indicative-plural-present-third-person":"leapădă","first-person-imperfect-indicative-singular":"lepădam","imperfect-indicative-second-person-singular":"lepădai","imperfect-indicative-singular-third-person":"lepăda","first-person-imperfect-indicative-plural":"lepădam","imperfect-indicative-plural-second-person":"lepădați","imperfect-indicative-plural-third-person":"lepădau","first-person-indicative-perfect-singular":"lepădai","indicative-perfect-second-person-singular":"lepădași","indicative-perfect-singular-third-person":"lepădă","first-person-indicative-perfect-plural":"lepădarăm","indicative-perfect-plural-second-person":"lepădarăți","indicative-perfect-plural-third-person":"lepădară","first-person-indicative-pluperfect-singular":"lepădasem","indicative-pluperfect-second-person-singular":"lepădaseși","indicative-pluperfect-singular-third-person":"lepădase","first-person-indicative-pluperfect-plural":"lepădaserăm","indicative-pluperfect-plural-second-person":"lepădaserăți","indicative-pluperfect-plural-third-person":"lepădaseră","first-person-present-singular-subjunctive":"să lepăd","present-second-person-singular-subjunctive":"să lepezi","present-singular-subjunctive-third-person":"să lepede","first-person-plural-present-subjunctive":"să lepădăm","plural-present-second-person-subjunctive":"să lepădați","plural-present-subjunctive-third-person":"să lepede","imperative-second-person-singular":"leapădă","imperative-plural-second-person":"lepădați","imperative-negative-second-person-singular":"nu lepăda","imperative-negative-plural-second-person":"nu lepădați"}},{"word":"lepădare","pos":"noun","definitions":["abandonment"],"forms":{"plural":"lepădări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lepădare","accusative-definite-nominative-singular":"lepădarea","accusative-indefinite-nominative-plural":"lepădări","accusative-definite-nominative-plural":"lepădările","dative-genitive-indefinite-singular":"lepădări","dative-definite-genitive-singular":"lepădării","dative-genitive-indefinite-plural":"lepădări","dative-definite-genitive-plural":"lepădărilor","singular-vocative":"lepădare","plural-vocative":"lepădărilor"}},{"word":"lepădare de sine","pos":"noun","definitions":["self-denial"]},{"word":"Lepădat","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lepădat"}},{"word":"lepădat","pos":"adj","definitions":["discarded, thrown away (about an object)","abandoned (about a child)"],"forms":{"feminine-singular":"lepădată","masculine-plural":"lepădați","feminine-neuter-plural":"lepădate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lepădat","error-unrecognized-form-feminine-indefinite-singular":"lepădată","error-unrecognized-form-indefinite-masculine-plural":"lepădați","error-unrecognized-form-feminine-indefinite-neuter-plural":"lepădate","definite-error-unrecognized-form-masculine-neuter-singular":"lepădatul","definite-error-unrecognized-form-feminine-singular":"lepădata","definite-error-unrecognized-form-masculine-plural":"lepădații","definite-error-unrecognized-form-feminine-neuter-plural":"lepădatele"}},{"word":"Lepădătescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lepădătescu"}},{"word":"lepădător","pos":"noun","definitions":["apostate"],"forms":{"plural":"lepădători"}},{"word":"Lepădatu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lepădatu"}},{"word":"lepădătură","pos":"noun","definitions":["degenerate"],"forms":{"plural":"lepădături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lepădătură","accusative-definite-nominative-singular":"lepădătura","accusative-indefinite-nominative-plural":"lepădături","accusative-definite-nominative-plural":"lepădăturile","dative-genitive-indefinite-singular":"lepădături","dative-definite-genitive-singular":"lepădăturii","dative-genitive-indefinite-plural":"lepădături","dative-definite-genitive-plural":"lepădăturilor","singular-vocative":"lepădătură","plural-vocative":"lepădăturilor"}},{"word":"lepăi","pos":"verb","definitions":["alternative form of lipăi"],"forms":{"canonical":"a lepăi 4th conjugation","present-singular-third-person":"lepăie","participle-past":"lepăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a lepăi","gerund":"lepăind","first-person-indicative-present-singular":"lepăi","indicative-present-second-person-singular":"lepăi","indicative-present-singular-third-person":"lepăie","first-person-indicative-plural-present":"lepăim","indicative-plural-present-second-person":"lepăiți","indicative-plural-present-third-person":"lepăie","first-person-imperfect-indicative-singular":"lepăiam","imperfect-indicative-second-person-singular":"lepăiai","imperfect-indicative-singular-third-person":"lepăia","first-person-imperfect-indicative-plural":"lepăiam","imperfect-indicative-plural-second-person":"lepăiați","imperfect-indicative-plural-third-person":"lepăiau","first-person-indicative-perfect-singular":"lepăii","indicative-perfect-second-person-singular":"lepăiși","indicative-perfect-singular-third-person":"lepăi","first-person-indicative-perfect-plural":"lepăirăm","indicative-perfect-plural-second-person":"lepăirăți","indicative-perfect-plural-third-person":"lepăiră","first-person-indicative-pluperfect-singular":"lepăisem","indicative-pluperfect-second-person-singular":"lepăiseși","indicative-pluperfect-singular-third-person":"lepăise","first-person-indicative-pluperfect-plural":"lepăiserăm","indicative-pluperfect-plural-second-person":"lepăiserăți","indicative-pluperfect-plural-third-person":"lepăiseră","first-person-present-singular-subjunctive":"să lepăi","present-second-person-singular-subjunctive":"să lepăi","present-singular-subjunctive-third-person":"să lepăie","first-person-plural-present-subjunctive":"să lepăim","plural-present-second-person-subjunctive":"să lepăiți","plural-present-subjunctive-third-person":"să lepăie","imperative-second-person-singular":"lepăie","imperative-plural-second-person":"lepăiți","imperative-negative-second-person-singular":"nu lepăi","imperative-negative-plural-second-person":"nu lepăiți"}},{"word":"lepedeu","pos":"noun","definitions":["bedsheet"],"forms":{"plural":"lepedeie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lepedeu","accusative-definite-nominative-singular":"lepedeuul","accusative-indefinite-nominative-plural":"lepedeie","accusative-definite-nominative-plural":"lepedeiele","dative-genitive-indefinite-singular":"lepedeu","dative-definite-genitive-singular":"lepedeuului","dative-genitive-indefinite-plural":"lepedeie","dative-definite-genitive-plural":"lepedeielor","singular-vocative":"lepedeuule","plural-vocative":"lepedeielor"}},{"word":"lepidodendron","pos":"noun","definitions":["Lepidodendron"],"forms":{"plural":"lepidodendroni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lepidodendron","accusative-definite-nominative-singular":"lepidodendronul","accusative-indefinite-nominative-plural":"lepidodendroni","accusative-definite-nominative-plural":"lepidodendronii","dative-genitive-indefinite-singular":"lepidodendron","dative-definite-genitive-singular":"lepidodendronului","dative-genitive-indefinite-plural":"lepidodendroni","dative-definite-genitive-plural":"lepidodendronilor","singular-vocative":"lepidodendronule","plural-vocative":"lepidodendronilor"}},{"word":"lepidolit","pos":"noun","definitions":["lepidolite"],"forms":{"plural":"lepidoliți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lepidolit","accusative-definite-nominative-singular":"lepidolitul","accusative-indefinite-nominative-plural":"lepidoliți","accusative-definite-nominative-plural":"lepidoliții","dative-genitive-indefinite-singular":"lepidolit","dative-definite-genitive-singular":"lepidolitului","dative-genitive-indefinite-plural":"lepidoliți","dative-definite-genitive-plural":"lepidoliților","singular-vocative":"lepidolitule","plural-vocative":"lepidoliților"}},{"word":"lepidopter","pos":"noun","definitions":["Lepidoptera"],"forms":{"plural":"lepidoptere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lepidopter","accusative-definite-nominative-singular":"lepidopterul","accusative-indefinite-nominative-plural":"lepidoptere","accusative-definite-nominative-plural":"lepidopterele","dative-genitive-indefinite-singular":"lepidopter","dative-definite-genitive-singular":"lepidopterului","dative-genitive-indefinite-plural":"lepidoptere","dative-definite-genitive-plural":"lepidopterelor","singular-vocative":"lepidopterule","plural-vocative":"lepidopterelor"}},{"word":"lepidopteră","pos":"noun","definitions":["alternative form of lepidopter"],"forms":{"plural":"lepidoptere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lepidopteră","accusative-definite-nominative-singular":"lepidoptera","accusative-indefinite-nominative-plural":"lepidoptere","accusative-definite-nominative-plural":"lepidopterele","dative-genitive-indefinite-singular":"lepidoptere","dative-definite-genitive-singular":"lepidopterei","dative-genitive-indefinite-plural":"lepidoptere","dative-definite-genitive-plural":"lepidopterelor","singular-vocative":"lepidopteră","plural-vocative":"lepidopterelor"}},{"word":"lepidopterolog","pos":"noun","definitions":["lepidopterist, lepidopterologist"],"pronunciation":"/le.pi.dop.te.roˈloɡ/","forms":{"plural":"lepidopterologi","feminine":"equivalent lepidopterologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lepidopterolog","accusative-definite-nominative-singular":"lepidopterologul","accusative-indefinite-nominative-plural":"lepidopterologi","accusative-definite-nominative-plural":"lepidopterologii","dative-genitive-indefinite-singular":"lepidopterolog","dative-definite-genitive-singular":"lepidopterologului","dative-genitive-indefinite-plural":"lepidopterologi","dative-definite-genitive-plural":"lepidopterologilor","singular-vocative":"lepidopterologule","plural-vocative":"lepidopterologilor"}},{"word":"lepidopterologă","pos":"noun","definitions":["female equivalent of lepidopterolog"],"pronunciation":"/le.pi.dop.te.roˈlo.ɡə/","forms":{"plural":"lepidopterologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"lepidopterologă","accusative-definite-nominative-singular":"lepidopterologa","accusative-indefinite-nominative-plural":"lepidopterologe","accusative-definite-nominative-plural":"lepidopterologele","dative-genitive-indefinite-singular":"lepidopterologe","dative-definite-genitive-singular":"lepidopterologei","dative-genitive-indefinite-plural":"lepidopterologe","dative-definite-genitive-plural":"lepidopterologelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"lepidopterologe","pos":"noun","definitions":["plural of lepidopterologă"],"gender":"f"},{"word":"lepidopterologi","pos":"noun","definitions":["plural of lepidopterolog"],"gender":"m"},{"word":"lepidopterologie","pos":"noun","definitions":["lepidopterology (scientific study of butterflies and moths)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"lepidopterologie","accusative-definite-nominative":"lepidopterologia","dative-genitive-indefinite":"lepidopterologii","dative-definite-genitive":"lepidopterologiei","vocative":"lepidopterologie"}},{"word":"lepidosiren","pos":"noun","definitions":["lepidosiren; lungfish"],"forms":{"plural":"lepidosireni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lepidosiren","accusative-definite-nominative-singular":"lepidosirenul","accusative-indefinite-nominative-plural":"lepidosireni","accusative-definite-nominative-plural":"lepidosirenii","dative-genitive-indefinite-singular":"lepidosiren","dative-definite-genitive-singular":"lepidosirenului","dative-genitive-indefinite-plural":"lepidosireni","dative-definite-genitive-plural":"lepidosirenilor","singular-vocative":"lepidosirenule","plural-vocative":"lepidosirenilor"}},{"word":"Lepindea","pos":"name","definitions":["a village in Bahnea, Mureș County, Romania"],"gender":"f"},{"word":"lepră","pos":"noun","definitions":["leprosy"],"forms":{"plural":"lepre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lepră","accusative-definite-nominative-singular":"lepra","accusative-indefinite-nominative-plural":"lepre","accusative-definite-nominative-plural":"leprele","dative-genitive-indefinite-singular":"lepre","dative-definite-genitive-singular":"leprei","dative-genitive-indefinite-plural":"lepre","dative-definite-genitive-plural":"leprelor","singular-vocative":"lepră","plural-vocative":"leprelor"}},{"word":"leprărie","pos":"noun","definitions":["leper colony"],"forms":{"plural":"leprării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"leprărie","accusative-definite-nominative-singular":"leprăria","accusative-indefinite-nominative-plural":"leprării","accusative-definite-nominative-plural":"leprăriile","dative-genitive-indefinite-singular":"leprării","dative-definite-genitive-singular":"leprăriei","dative-genitive-indefinite-plural":"leprării","dative-definite-genitive-plural":"leprăriilor","singular-vocative":"leprărie","plural-vocative":"leprăriilor"}},{"word":"leproasă","pos":"noun","definitions":["female equivalent of lepros"],"forms":{"plural":"leproase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leproasă","accusative-definite-nominative-singular":"leproasa","accusative-indefinite-nominative-plural":"leproase","accusative-definite-nominative-plural":"leproasele","dative-genitive-indefinite-singular":"leproase","dative-definite-genitive-singular":"leproasei","dative-genitive-indefinite-plural":"leproase","dative-definite-genitive-plural":"leproaselor","singular-vocative":"leproasă","plural-vocative":"leproaselor"}},{"word":"lepros","pos":"noun","definitions":["leprous"],"forms":{"plural":"leproși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lepros","accusative-definite-nominative-singular":"leprosul","accusative-indefinite-nominative-plural":"leproși","accusative-definite-nominative-plural":"leproșii","dative-genitive-indefinite-singular":"lepros","dative-definite-genitive-singular":"leprosului","dative-genitive-indefinite-plural":"leproși","dative-definite-genitive-plural":"leproșilor","singular-vocative":"leprosule","plural-vocative":"leproșilor"}},{"word":"leprotic","pos":"adj","definitions":["leprous"],"forms":{"feminine-singular":"leprotică","masculine-plural":"leprotici","feminine-neuter-plural":"leprotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leprotic","error-unrecognized-form-feminine-indefinite-singular":"leprotică","error-unrecognized-form-indefinite-masculine-plural":"leprotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"leprotice","definite-error-unrecognized-form-masculine-neuter-singular":"leproticul","definite-error-unrecognized-form-feminine-singular":"leprotica","definite-error-unrecognized-form-masculine-plural":"leproticii","definite-error-unrecognized-form-feminine-neuter-plural":"leproticele"}},{"word":"leprozerie","pos":"noun","definitions":["leper colony"],"forms":{"plural":"leprozerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"leprozerie","accusative-definite-nominative-singular":"leprozeria","accusative-indefinite-nominative-plural":"leprozerii","accusative-definite-nominative-plural":"leprozeriile","dative-genitive-indefinite-singular":"leprozerii","dative-definite-genitive-singular":"leprozeriei","dative-genitive-indefinite-plural":"leprozerii","dative-definite-genitive-plural":"leprozeriilor","singular-vocative":"leprozerie","plural-vocative":"leprozeriilor"}},{"word":"lepșe","pos":"noun","definitions":["plural of leapșă"]},{"word":"lepșit","pos":"adj","definitions":["flattened"],"forms":{"feminine-singular":"lepșită","masculine-plural":"lepșiți","feminine-neuter-plural":"lepșite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lepșit","error-unrecognized-form-feminine-indefinite-singular":"lepșită","error-unrecognized-form-indefinite-masculine-plural":"lepșiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lepșite","definite-error-unrecognized-form-masculine-neuter-singular":"lepșitul","definite-error-unrecognized-form-feminine-singular":"lepșita","definite-error-unrecognized-form-masculine-plural":"lepșiții","definite-error-unrecognized-form-feminine-neuter-plural":"lepșitele"}},{"word":"lepșit","pos":"verb","definitions":["past participle of lepși"],"forms":{"participle-past":"of lepși"}},{"word":"leptocefal","pos":"noun","definitions":["leptocephalus"],"forms":{"plural":"leptocefali","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leptocefal","accusative-definite-nominative-singular":"leptocefalul","accusative-indefinite-nominative-plural":"leptocefali","accusative-definite-nominative-plural":"leptocefalii","dative-genitive-indefinite-singular":"leptocefal","dative-definite-genitive-singular":"leptocefalului","dative-genitive-indefinite-plural":"leptocefali","dative-definite-genitive-plural":"leptocefalilor","singular-vocative":"leptocefalule","plural-vocative":"leptocefalilor"}},{"word":"leptomeninge","pos":"noun","definitions":["leptomeninges"],"forms":{"plural":"leptomeninge","table-tags":"no-table-tags","inflection-template":"ro-noun-n-e","accusative-indefinite-nominative-singular":"leptomeninge","accusative-definite-nominative-singular":"leptomeningele","accusative-indefinite-nominative-plural":"leptomeninge","accusative-definite-nominative-plural":"leptomeningele","dative-genitive-indefinite-singular":"leptomeninge","dative-definite-genitive-singular":"leptomeningelui","dative-genitive-indefinite-plural":"leptomeninge","dative-definite-genitive-plural":"leptomeningelor","singular-vocative":"leptomeninge","plural-vocative":"leptomeningelor"}},{"word":"leptomeningită","pos":"noun","definitions":["leptomeningitis"],"forms":{"plural":"leptomeningite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leptomeningită","accusative-definite-nominative-singular":"leptomeningita","accusative-indefinite-nominative-plural":"leptomeningite","accusative-definite-nominative-plural":"leptomeningitele","dative-genitive-indefinite-singular":"leptomeningite","dative-definite-genitive-singular":"leptomeningitei","dative-genitive-indefinite-plural":"leptomeningite","dative-definite-genitive-plural":"leptomeningitelor","singular-vocative":"leptomeningită","plural-vocative":"leptomeningitelor"}},{"word":"lepton","pos":"noun","definitions":["lepton"],"forms":{"plural":"leptoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lepton","accusative-definite-nominative-singular":"leptonul","accusative-indefinite-nominative-plural":"leptoni","accusative-definite-nominative-plural":"leptonii","dative-genitive-indefinite-singular":"lepton","dative-definite-genitive-singular":"leptonului","dative-genitive-indefinite-plural":"leptoni","dative-definite-genitive-plural":"leptonilor","singular-vocative":"leptonule","plural-vocative":"leptonilor"}},{"word":"leptospiră","pos":"noun","definitions":["leptospira"],"forms":{"plural":"leptospire","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leptospiră","accusative-definite-nominative-singular":"leptospira","accusative-indefinite-nominative-plural":"leptospire","accusative-definite-nominative-plural":"leptospirele","dative-genitive-indefinite-singular":"leptospire","dative-definite-genitive-singular":"leptospirei","dative-genitive-indefinite-plural":"leptospire","dative-definite-genitive-plural":"leptospirelor","singular-vocative":"leptospiră","plural-vocative":"leptospirelor"}},{"word":"leptospiroză","pos":"noun","definitions":["leptospirosis"],"forms":{"plural":"leptospiroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leptospiroză","accusative-definite-nominative-singular":"leptospiroza","accusative-indefinite-nominative-plural":"leptospiroze","accusative-definite-nominative-plural":"leptospirozele","dative-genitive-indefinite-singular":"leptospiroze","dative-definite-genitive-singular":"leptospirozei","dative-genitive-indefinite-plural":"leptospiroze","dative-definite-genitive-plural":"leptospirozelor","singular-vocative":"leptospiroză","plural-vocative":"leptospirozelor"}},{"word":"lepturariu","pos":"noun","definitions":["a book"],"forms":{"plural":"lepturarii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lepturariu","accusative-definite-nominative-singular":"lepturariuul","accusative-indefinite-nominative-plural":"lepturarii","accusative-definite-nominative-plural":"lepturariile","dative-genitive-indefinite-singular":"lepturariu","dative-definite-genitive-singular":"lepturariuului","dative-genitive-indefinite-plural":"lepturarii","dative-definite-genitive-plural":"lepturariilor","singular-vocative":"lepturariuule","plural-vocative":"lepturariilor"}},{"word":"Lercă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lercă"}},{"word":"Lerescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lerescu"}},{"word":"Lerești","pos":"name","definitions":["a commune of Argeș County, Romania","a village in Lerești, Argeș County, Romania"],"gender":"m"},{"word":"leroi","pos":"intj","definitions":["alternative form of ler"]},{"word":"leroloi","pos":"intj","definitions":["alternative form of ler"]},{"word":"lerpenea","pos":"noun","definitions":["hard work, labor"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative":"lerpenea","accusative-definite-nominative":"lerpeneaua","dative-genitive-indefinite":"lerpenele","dative-definite-genitive":"lerpenelei","vocative":"lerpenea"}},{"word":"lerui","pos":"intj","definitions":["alternative form of ler"]},{"word":"lerului","pos":"intj","definitions":["alternative form of ler"]},{"word":"les","pos":"noun","definitions":["thicket"],"forms":{"plural":"lesuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"les","accusative-definite-nominative-singular":"lesul","accusative-indefinite-nominative-plural":"lesuri","accusative-definite-nominative-plural":"lesurile","dative-genitive-indefinite-singular":"les","dative-definite-genitive-singular":"lesului","dative-genitive-indefinite-plural":"lesuri","dative-definite-genitive-plural":"lesurilor","singular-vocative":"lesule","plural-vocative":"lesurilor"}},{"word":"Leș","pos":"name","definitions":["a village in Nojorid, Bihor County, Romania"],"gender":"m"},{"word":"leș","pos":"noun","definitions":["corpse"],"forms":{"plural":"leșuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"leș","accusative-definite-nominative-singular":"leșul","accusative-indefinite-nominative-plural":"leșuri","accusative-definite-nominative-plural":"leșurile","dative-genitive-indefinite-singular":"leș","dative-definite-genitive-singular":"leșului","dative-genitive-indefinite-plural":"leșuri","dative-definite-genitive-plural":"leșurilor","singular-vocative":"leșule","plural-vocative":"leșurilor"}},{"word":"lesă","pos":"noun","definitions":["leash"],"forms":{"plural":"lese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lesă","accusative-definite-nominative-singular":"lesa","accusative-indefinite-nominative-plural":"lese","accusative-definite-nominative-plural":"lesele","dative-genitive-indefinite-singular":"lese","dative-definite-genitive-singular":"lesei","dative-genitive-indefinite-plural":"lese","dative-definite-genitive-plural":"leselor","singular-vocative":"lesă","plural-vocative":"leselor"}},{"word":"lesbian","pos":"adj","definitions":["lesbian"],"pronunciation":"/les.biˈan/","forms":{"feminine-singular":"lesbiană","masculine-plural":"lesbieni","feminine-neuter-plural":"lesbiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lesbian","error-unrecognized-form-feminine-indefinite-singular":"lesbiană","error-unrecognized-form-indefinite-masculine-plural":"lesbieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"lesbiene","definite-error-unrecognized-form-masculine-neuter-singular":"lesbianul","definite-error-unrecognized-form-feminine-singular":"lesbiana","definite-error-unrecognized-form-masculine-plural":"lesbienii","definite-error-unrecognized-form-feminine-neuter-plural":"lesbienele","alternative":"лесбиян"}},{"word":"lesbiană","pos":"noun","definitions":["lesbian"],"pronunciation":"/les.biˈa.nə/","forms":{"plural":"lesbiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lesbiană","accusative-definite-nominative-singular":"lesbiana","accusative-indefinite-nominative-plural":"lesbiene","accusative-definite-nominative-plural":"lesbienele","dative-genitive-indefinite-singular":"lesbiene","dative-definite-genitive-singular":"lesbienei","dative-genitive-indefinite-plural":"lesbiene","dative-definite-genitive-plural":"lesbienelor","singular-vocative":"lesbiană","plural-vocative":"lesbienelor","alternative":"лесбиянэ"}},{"word":"lesbianism","pos":"noun","definitions":["lesbianism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lesbianism","accusative-definite-nominative-singular":"lesbianismul","accusative-indefinite-nominative-plural":"lesbianisme","accusative-definite-nominative-plural":"lesbianismele","dative-genitive-indefinite-singular":"lesbianism","dative-definite-genitive-singular":"lesbianismului","dative-genitive-indefinite-plural":"lesbianisme","dative-definite-genitive-plural":"lesbianismelor","singular-vocative":"lesbianismule","plural-vocative":"lesbianismelor"}},{"word":"lesbic","pos":"adj","definitions":["lesbian (of a woman, attracted to other women)"],"forms":{"feminine-singular":"lesbică","masculine-plural":"lesbici","feminine-neuter-plural":"lesbice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lesbic","error-unrecognized-form-feminine-indefinite-singular":"lesbică","error-unrecognized-form-indefinite-masculine-plural":"lesbici","error-unrecognized-form-feminine-indefinite-neuter-plural":"lesbice","definite-error-unrecognized-form-masculine-neuter-singular":"lesbicul","definite-error-unrecognized-form-feminine-singular":"lesbica","definite-error-unrecognized-form-masculine-plural":"lesbicii","definite-error-unrecognized-form-feminine-neuter-plural":"lesbicele"}},{"word":"lescaie","pos":"noun","definitions":["alternative form of lăscaie"],"forms":{"plural":"lescăi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lescaie","accusative-definite-nominative-singular":"lescaia","accusative-indefinite-nominative-plural":"lescăi","accusative-definite-nominative-plural":"lescăile","dative-genitive-indefinite-singular":"lescăi","dative-definite-genitive-singular":"lescaiei","dative-genitive-indefinite-plural":"lescăi","dative-definite-genitive-plural":"lescăilor","singular-vocative":"lescaie","plural-vocative":"lescăilor"}},{"word":"leșcioară","pos":"noun","definitions":["diminutive of leasă"],"forms":{"plural":"leșcioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leșcioară","accusative-definite-nominative-singular":"leșcioara","accusative-indefinite-nominative-plural":"leșcioare","accusative-definite-nominative-plural":"leșcioarele","dative-genitive-indefinite-singular":"leșcioare","dative-definite-genitive-singular":"leșcioarei","dative-genitive-indefinite-plural":"leșcioare","dative-definite-genitive-plural":"leșcioarelor","singular-vocative":"leșcioară","plural-vocative":"leșcioarelor"}},{"word":"Lescovița","pos":"name","definitions":["a village in Naidăș, Caraș-Severin County, Romania"],"gender":"f"},{"word":"Leșeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Leșeanu"}},{"word":"leșesc","pos":"adj","definitions":["Polish"],"forms":{"feminine-singular":"leșească","plural":"leșești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leșesc","error-unrecognized-form-feminine-indefinite-singular":"leșească","error-unrecognized-form-indefinite-masculine-plural":"leșești","error-unrecognized-form-feminine-indefinite-neuter-plural":"leșești","definite-error-unrecognized-form-masculine-neuter-singular":"leșescul","definite-error-unrecognized-form-feminine-singular":"leșeasca","definite-error-unrecognized-form-masculine-plural":"leșeștii","definite-error-unrecognized-form-feminine-neuter-plural":"leșeștile"}},{"word":"leșește","pos":"adv","definitions":["in Polish language"]},{"word":"leșiatic","pos":"adj","definitions":["alternative form of leșietic"],"forms":{"feminine-singular":"leșiatică","masculine-plural":"leșiatici","feminine-neuter-plural":"leșiatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leșiatic","error-unrecognized-form-feminine-indefinite-singular":"leșiatică","error-unrecognized-form-indefinite-masculine-plural":"leșiatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"leșiatice","definite-error-unrecognized-form-masculine-neuter-singular":"leșiaticul","definite-error-unrecognized-form-feminine-singular":"leșiatica","definite-error-unrecognized-form-masculine-plural":"leșiaticii","definite-error-unrecognized-form-feminine-neuter-plural":"leșiaticele"}},{"word":"leșie","pos":"noun","definitions":["lye, alkaline solution"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"leșie","accusative-definite-nominative":"leșia","dative-genitive-indefinite":"leșii","dative-definite-genitive":"leșiei","vocative":"leșie"}},{"word":"leșietic","pos":"adj","definitions":["having a taste or smell like lye"],"forms":{"feminine-singular":"leșietică","masculine-plural":"leșietici","feminine-neuter-plural":"leșietice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leșietic","error-unrecognized-form-feminine-indefinite-singular":"leșietică","error-unrecognized-form-indefinite-masculine-plural":"leșietici","error-unrecognized-form-feminine-indefinite-neuter-plural":"leșietice","definite-error-unrecognized-form-masculine-neuter-singular":"leșieticul","definite-error-unrecognized-form-feminine-singular":"leșietica","definite-error-unrecognized-form-masculine-plural":"leșieticii","definite-error-unrecognized-form-feminine-neuter-plural":"leșieticele"}},{"word":"Leșile","pos":"name","definitions":["a village in Teiu, Argeș County, Romania","a village in Șimnicu de Sus, Dolj County, Romania"],"gender":"m"},{"word":"leșin","pos":"noun","definitions":["faint"],"forms":{"plural":"leșinuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"leșin","accusative-definite-nominative-singular":"leșinul","accusative-indefinite-nominative-plural":"leșinuri","accusative-definite-nominative-plural":"leșinurile","dative-genitive-indefinite-singular":"leșin","dative-definite-genitive-singular":"leșinului","dative-genitive-indefinite-plural":"leșinuri","dative-definite-genitive-plural":"leșinurilor","singular-vocative":"leșinule","plural-vocative":"leșinurilor"}},{"word":"leșina","pos":"verb","definitions":["to faint"],"forms":{"canonical":"a leșina 1st conjugation","present-singular-third-person":"leșină","participle-past":"leșinat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a leșina","gerund":"leșinând","first-person-indicative-present-singular":"leșin","indicative-present-second-person-singular":"leșini","indicative-present-singular-third-person":"leșină","first-person-indicative-plural-present":"leșinăm","indicative-plural-present-second-person":"leșinați","indicative-plural-present-third-person":"leșină","first-person-imperfect-indicative-singular":"leșinam","imperfect-indicative-second-person-singular":"leșinai","imperfect-indicative-singular-third-person":"leșina","first-person-imperfect-indicative-plural":"leșinam","imperfect-indicative-plural-second-person":"leșinați","imperfect-indicative-plural-third-person":"leșinau","first-person-indicative-perfect-singular":"leșinai","indicative-perfect-second-person-singular":"leșinași","indicative-perfect-singular-third-person":"leșină","first-person-indicative-perfect-plural":"leșinarăm","indicative-perfect-plural-second-person":"leșinarăți","indicative-perfect-plural-third-person":"leșinară","first-person-indicative-pluperfect-singular":"leșinasem","indicative-pluperfect-second-person-singular":"leșinaseși","indicative-pluperfect-singular-third-person":"leșinase","first-person-indicative-pluperfect-plural":"leșinaserăm","indicative-pluperfect-plural-second-person":"leșinaserăți","indicative-pluperfect-plural-third-person":"leșinaseră","first-person-present-singular-subjunctive":"să leșin","present-second-person-singular-subjunctive":"să leșini","present-singular-subjunctive-third-person":"să leșine","first-person-plural-present-subjunctive":"să leșinăm","plural-present-second-person-subjunctive":"să leșinați","plural-present-subjunctive-third-person":"să leșine","imperative-second-person-singular":"leșină","imperative-plural-second-person":"leșinați","imperative-negative-second-person-singular":"nu leșina","imperative-negative-plural-second-person":"nu leșinați"}},{"word":"leșinat","pos":"adj","definitions":["fainted"],"forms":{"feminine-singular":"leșinată","masculine-plural":"leșinați","feminine-neuter-plural":"leșinate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leșinat","error-unrecognized-form-feminine-indefinite-singular":"leșinată","error-unrecognized-form-indefinite-masculine-plural":"leșinați","error-unrecognized-form-feminine-indefinite-neuter-plural":"leșinate","definite-error-unrecognized-form-masculine-neuter-singular":"leșinatul","definite-error-unrecognized-form-feminine-singular":"leșinata","definite-error-unrecognized-form-masculine-plural":"leșinații","definite-error-unrecognized-form-feminine-neuter-plural":"leșinatele"}},{"word":"leșinătură","pos":"noun","definitions":["faint"],"forms":{"plural":"leșinături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"leșinătură","accusative-definite-nominative-singular":"leșinătura","accusative-indefinite-nominative-plural":"leșinături","accusative-definite-nominative-plural":"leșinăturile","dative-genitive-indefinite-singular":"leșinături","dative-definite-genitive-singular":"leșinăturii","dative-genitive-indefinite-plural":"leșinături","dative-definite-genitive-plural":"leșinăturilor","singular-vocative":"leșinătură","plural-vocative":"leșinăturilor"}},{"word":"leșioară","pos":"noun","definitions":["diminutive of leșie"],"forms":{"plural":"leșioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leșioară","accusative-definite-nominative-singular":"leșioara","accusative-indefinite-nominative-plural":"leșioare","accusative-definite-nominative-plural":"leșioarele","dative-genitive-indefinite-singular":"leșioare","dative-definite-genitive-singular":"leșioarei","dative-genitive-indefinite-plural":"leșioare","dative-definite-genitive-plural":"leșioarelor","singular-vocative":"leșioară","plural-vocative":"leșioarelor"}},{"word":"leșios","pos":"adj","definitions":["savorless"],"forms":{"feminine-singular":"leșioasă","masculine-plural":"leșioși","feminine-neuter-plural":"leșioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leșios","error-unrecognized-form-feminine-indefinite-singular":"leșioasă","error-unrecognized-form-indefinite-masculine-plural":"leșioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"leșioase","definite-error-unrecognized-form-masculine-neuter-singular":"leșiosul","definite-error-unrecognized-form-feminine-singular":"leșioasa","definite-error-unrecognized-form-masculine-plural":"leșioșii","definite-error-unrecognized-form-feminine-neuter-plural":"leșioasele"}},{"word":"Leșmir","pos":"name","definitions":["a village in Marca, Sălaj County, Romania"],"gender":"m"},{"word":"lesne","pos":"adv","definitions":["easily"]},{"word":"lesneală","pos":"noun","definitions":["facilitation"],"forms":{"plural":"lesneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lesneală","accusative-definite-nominative-singular":"lesneala","accusative-indefinite-nominative-plural":"lesnele","accusative-definite-nominative-plural":"lesnelele","dative-genitive-indefinite-singular":"lesnele","dative-definite-genitive-singular":"lesnelei","dative-genitive-indefinite-plural":"lesnele","dative-definite-genitive-plural":"lesnelelor","singular-vocative":"lesneală","plural-vocative":"lesnelelor"}},{"word":"Leșnic","pos":"name","definitions":["a village in Vețel, Hunedoara County, Romania"],"gender":"m"},{"word":"lesnicios","pos":"adj","definitions":["easy"],"forms":{"feminine-singular":"lesnicioasă","masculine-plural":"lesnicioși","feminine-neuter-plural":"lesnicioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lesnicios","error-unrecognized-form-feminine-indefinite-singular":"lesnicioasă","error-unrecognized-form-indefinite-masculine-plural":"lesnicioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lesnicioase","definite-error-unrecognized-form-masculine-neuter-singular":"lesniciosul","definite-error-unrecognized-form-feminine-singular":"lesnicioasa","definite-error-unrecognized-form-masculine-plural":"lesnicioșii","definite-error-unrecognized-form-feminine-neuter-plural":"lesnicioasele"}},{"word":"lesniciune","pos":"noun","definitions":["ease"],"forms":{"plural":"lesniciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lesniciune","accusative-definite-nominative-singular":"lesniciunea","accusative-indefinite-nominative-plural":"lesniciuni","accusative-definite-nominative-plural":"lesniciunile","dative-genitive-indefinite-singular":"lesniciuni","dative-definite-genitive-singular":"lesniciunii","dative-genitive-indefinite-plural":"lesniciuni","dative-definite-genitive-plural":"lesniciunilor","singular-vocative":"lesniciune","plural-vocative":"lesniciunilor"}},{"word":"leșniec","pos":"noun","definitions":["alternative form of leșnic"],"forms":{"plural":"leșniece","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"leșniec","accusative-definite-nominative-singular":"leșniecul","accusative-indefinite-nominative-plural":"leșniece","accusative-definite-nominative-plural":"leșniecele","dative-genitive-indefinite-singular":"leșniec","dative-definite-genitive-singular":"leșniecului","dative-genitive-indefinite-plural":"leșniece","dative-definite-genitive-plural":"leșniecelor","singular-vocative":"leșniecule","plural-vocative":"leșniecelor"}},{"word":"lesnime","pos":"noun","definitions":["ease"],"forms":{"plural":"lesnimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lesnime","accusative-definite-nominative-singular":"lesnimea","accusative-indefinite-nominative-plural":"lesnimi","accusative-definite-nominative-plural":"lesnimile","dative-genitive-indefinite-singular":"lesnimi","dative-definite-genitive-singular":"lesnimii","dative-genitive-indefinite-plural":"lesnimi","dative-definite-genitive-plural":"lesnimilor","singular-vocative":"lesnime","plural-vocative":"lesnimilor"}},{"word":"lesnire","pos":"noun","definitions":["facilitation"],"forms":{"plural":"lesniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lesnire","accusative-definite-nominative-singular":"lesnirea","accusative-indefinite-nominative-plural":"lesniri","accusative-definite-nominative-plural":"lesnirile","dative-genitive-indefinite-singular":"lesniri","dative-definite-genitive-singular":"lesnirii","dative-genitive-indefinite-plural":"lesniri","dative-definite-genitive-plural":"lesnirilor","singular-vocative":"lesnire","plural-vocative":"lesnirilor"}},{"word":"leșnit","pos":"adj","definitions":["starving"],"forms":{"feminine-singular":"leșnită","masculine-plural":"leșniți","feminine-neuter-plural":"leșnite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leșnit","error-unrecognized-form-feminine-indefinite-singular":"leșnită","error-unrecognized-form-indefinite-masculine-plural":"leșniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"leșnite","definite-error-unrecognized-form-masculine-neuter-singular":"leșnitul","definite-error-unrecognized-form-feminine-singular":"leșnita","definite-error-unrecognized-form-masculine-plural":"leșniții","definite-error-unrecognized-form-feminine-neuter-plural":"leșnitele"}},{"word":"lesnitate","pos":"noun","definitions":["easiness"],"forms":{"plural":"lesnitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lesnitate","accusative-definite-nominative-singular":"lesnitatea","accusative-indefinite-nominative-plural":"lesnitatăți","accusative-definite-nominative-plural":"lesnitatățile","dative-genitive-indefinite-singular":"lesnitatăți","dative-definite-genitive-singular":"lesnitatății","dative-genitive-indefinite-plural":"lesnitatăți","dative-definite-genitive-plural":"lesnitatăților","singular-vocative":"lesnitate","plural-vocative":"lesnitatăților"}},{"word":"lesoi","pos":"noun","definitions":["augmentative of leasă"],"forms":{"plural":"lesoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lesoi","accusative-definite-nominative-singular":"lesoiul","accusative-indefinite-nominative-plural":"lesoaie","accusative-definite-nominative-plural":"lesoaiele","dative-genitive-indefinite-singular":"lesoi","dative-definite-genitive-singular":"lesoiului","dative-genitive-indefinite-plural":"lesoaie","dative-definite-genitive-plural":"lesoaielor","singular-vocative":"lesoiule","plural-vocative":"lesoaielor"}},{"word":"leșos","pos":"adj","definitions":["corpsy"],"forms":{"feminine-singular":"leșoasă","masculine-plural":"leșoși","feminine-neuter-plural":"leșoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leșos","error-unrecognized-form-feminine-indefinite-singular":"leșoasă","error-unrecognized-form-indefinite-masculine-plural":"leșoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"leșoase","definite-error-unrecognized-form-masculine-neuter-singular":"leșosul","definite-error-unrecognized-form-feminine-singular":"leșoasa","definite-error-unrecognized-form-masculine-plural":"leșoșii","definite-error-unrecognized-form-feminine-neuter-plural":"leșoasele"}},{"word":"lesothian","pos":"adj","definitions":["related to Lesotho"],"forms":{"feminine-singular":"lesothiană","masculine-plural":"lesothieni","feminine-neuter-plural":"lesothiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lesothian","error-unrecognized-form-feminine-indefinite-singular":"lesothiană","error-unrecognized-form-indefinite-masculine-plural":"lesothieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"lesothiene","definite-error-unrecognized-form-masculine-neuter-singular":"lesothianul","definite-error-unrecognized-form-feminine-singular":"lesothiana","definite-error-unrecognized-form-masculine-plural":"lesothienii","definite-error-unrecognized-form-feminine-neuter-plural":"lesothienele"}},{"word":"lesothian","pos":"noun","definitions":["a person from Lesotho"],"forms":{"plural":"lesothieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lesothian","accusative-definite-nominative-singular":"lesothianul","accusative-indefinite-nominative-plural":"lesothieni","accusative-definite-nominative-plural":"lesothienii","dative-genitive-indefinite-singular":"lesothian","dative-definite-genitive-singular":"lesothianului","dative-genitive-indefinite-plural":"lesothieni","dative-definite-genitive-plural":"lesothienilor","singular-vocative":"lesothianule","plural-vocative":"lesothienilor"}},{"word":"lesothiană","pos":"noun","definitions":["female equivalent of lesothian"],"forms":{"plural":"lesothiane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lesothiană","accusative-definite-nominative-singular":"lesothiana","accusative-indefinite-nominative-plural":"lesothiene","accusative-definite-nominative-plural":"lesothienele","dative-genitive-indefinite-singular":"lesothiene","dative-definite-genitive-singular":"lesothienei","dative-genitive-indefinite-plural":"lesothiene","dative-definite-genitive-plural":"lesothienelor","singular-vocative":"lesothiană","plural-vocative":"lesothienelor"}},{"word":"lespede","pos":"noun","definitions":["slab","tombstone","plate"],"pronunciation":"[ˈlespede]","forms":{"plural":"lespezi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lespede","accusative-definite-nominative-singular":"lespedea","accusative-indefinite-nominative-plural":"lespezi","accusative-definite-nominative-plural":"lespezile","dative-genitive-indefinite-singular":"lespezi","dative-definite-genitive-singular":"lespezii","dative-genitive-indefinite-plural":"lespezi","dative-definite-genitive-plural":"lespezilor","singular-vocative":"lespede","plural-vocative":"lespezilor"}},{"word":"Lespedea","pos":"name","definitions":["a river in Bistrița-Năsăud, Romania, tributary to the Rebra"],"gender":"f"},{"word":"lespedos","pos":"adj","definitions":["stratified"],"forms":{"feminine-singular":"lespedoasă","masculine-plural":"lespedoși","feminine-neuter-plural":"lespedoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lespedos","error-unrecognized-form-feminine-indefinite-singular":"lespedoasă","error-unrecognized-form-indefinite-masculine-plural":"lespedoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lespedoase","definite-error-unrecognized-form-masculine-neuter-singular":"lespedosul","definite-error-unrecognized-form-feminine-singular":"lespedoasa","definite-error-unrecognized-form-masculine-plural":"lespedoșii","definite-error-unrecognized-form-feminine-neuter-plural":"lespedoasele"}},{"word":"lespeduță","pos":"noun","definitions":["diminutive of lespede"],"forms":{"plural":"lespeduțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lespeduță","accusative-definite-nominative-singular":"lespeduța","accusative-indefinite-nominative-plural":"lespeduțe","accusative-definite-nominative-plural":"lespeduțele","dative-genitive-indefinite-singular":"lespeduțe","dative-definite-genitive-singular":"lespeduței","dative-genitive-indefinite-plural":"lespeduțe","dative-definite-genitive-plural":"lespeduțelor","singular-vocative":"lespeduță","plural-vocative":"lespeduțelor"}},{"word":"lespegioară","pos":"noun","definitions":["alternative form of lespejoară"],"forms":{"plural":"lespegioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lespegioară","accusative-definite-nominative-singular":"lespegioara","accusative-indefinite-nominative-plural":"lespegioare","accusative-definite-nominative-plural":"lespegioarele","dative-genitive-indefinite-singular":"lespegioare","dative-definite-genitive-singular":"lespegioarei","dative-genitive-indefinite-plural":"lespegioare","dative-definite-genitive-plural":"lespegioarelor","singular-vocative":"lespegioară","plural-vocative":"lespegioarelor"}},{"word":"lespejoară","pos":"noun","definitions":["diminutive of lespede; small slab"],"forms":{"plural":"lespejoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lespejoară","accusative-definite-nominative-singular":"lespejoara","accusative-indefinite-nominative-plural":"lespejoare","accusative-definite-nominative-plural":"lespejoarele","dative-genitive-indefinite-singular":"lespejoare","dative-definite-genitive-singular":"lespejoarei","dative-genitive-indefinite-plural":"lespejoare","dative-definite-genitive-plural":"lespejoarelor","singular-vocative":"lespejoară","plural-vocative":"lespejoarelor"}},{"word":"Lespezea","pos":"name","definitions":["a village in Scărișoara, Alba County, Romania"],"gender":"f"},{"word":"Lespezeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lespezeanu"}},{"word":"Lespezel","pos":"name","definitions":["a river in Gorj, Romania, tributary to the Bistrița"],"gender":"m"},{"word":"Lespezi","pos":"name","definitions":["a village in Hârtiești, Argeș County, Romania","a village in Gârleni, Bacău County, Romania","a village in Dobromir, Constanța County, Romania","a commune of Iași County, Romania","a village in Lespezi, Iași County, Romania"],"gender":"m"},{"word":"lespezi","pos":"noun","definitions":["inflection of lespede:","indefinite nominative/accusative/genitive/dative plural","indefinite genitive/dative singular"]},{"word":"lespezii","pos":"noun","definitions":["definite genitive/dative singular of lespede"]},{"word":"lespezilor","pos":"noun","definitions":["definite genitive/dative plural of lespede"]},{"word":"lespeziță","pos":"noun","definitions":["diminutive of lespede"],"forms":{"plural":"lespezițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lespeziță","accusative-definite-nominative-singular":"lespezița","accusative-indefinite-nominative-plural":"lespezițe","accusative-definite-nominative-plural":"lespezițele","dative-genitive-indefinite-singular":"lespezițe","dative-definite-genitive-singular":"lespeziței","dative-genitive-indefinite-plural":"lespezițe","dative-definite-genitive-plural":"lespezițelor","singular-vocative":"lespeziță","plural-vocative":"lespezițelor"}},{"word":"lespezuie","pos":"noun","definitions":["diminutive of lespede"],"forms":{"plural":"lespezui","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"lespezuie","accusative-definite-nominative-singular":"lespezuia","accusative-indefinite-nominative-plural":"lespezui","accusative-definite-nominative-plural":"lespezuile","dative-genitive-indefinite-singular":"lespezui","dative-definite-genitive-singular":"lespezuii","dative-genitive-indefinite-plural":"lespezui","dative-definite-genitive-plural":"lespezuilor","singular-vocative":"lespezuie","plural-vocative":"lespezuilor"}},{"word":"lest","pos":"noun","definitions":["ballast"],"forms":{"plural":"lesturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lest","accusative-definite-nominative-singular":"lestul","accusative-indefinite-nominative-plural":"lesturi","accusative-definite-nominative-plural":"lesturile","dative-genitive-indefinite-singular":"lest","dative-definite-genitive-singular":"lestului","dative-genitive-indefinite-plural":"lesturi","dative-definite-genitive-plural":"lesturilor","singular-vocative":"lestule","plural-vocative":"lesturilor"}},{"word":"lesta","pos":"verb","definitions":["to ballast"],"forms":{"canonical":"a lesta 1st conjugation","present-singular-third-person":"lestează","participle-past":"lestat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a lesta","gerund":"lestând","first-person-indicative-present-singular":"lestez","indicative-present-second-person-singular":"lestezi","indicative-present-singular-third-person":"lestează","first-person-indicative-plural-present":"lestăm","indicative-plural-present-second-person":"lestați","indicative-plural-present-third-person":"lestează","first-person-imperfect-indicative-singular":"lestam","imperfect-indicative-second-person-singular":"lestai","imperfect-indicative-singular-third-person":"lesta","first-person-imperfect-indicative-plural":"lestam","imperfect-indicative-plural-second-person":"lestați","imperfect-indicative-plural-third-person":"lestau","first-person-indicative-perfect-singular":"lestai","indicative-perfect-second-person-singular":"lestași","indicative-perfect-singular-third-person":"lestă","first-person-indicative-perfect-plural":"lestarăm","indicative-perfect-plural-second-person":"lestarăți","indicative-perfect-plural-third-person":"lestară","first-person-indicative-pluperfect-singular":"lestasem","indicative-pluperfect-second-person-singular":"lestaseși","indicative-pluperfect-singular-third-person":"lestase","first-person-indicative-pluperfect-plural":"lestaserăm","indicative-pluperfect-plural-second-person":"lestaserăți","indicative-pluperfect-plural-third-person":"lestaseră","first-person-present-singular-subjunctive":"să lestez","present-second-person-singular-subjunctive":"să lestezi","present-singular-subjunctive-third-person":"să lesteze","first-person-plural-present-subjunctive":"să lestăm","plural-present-second-person-subjunctive":"să lestați","plural-present-subjunctive-third-person":"să lesteze","imperative-second-person-singular":"lestează","imperative-plural-second-person":"lestați","imperative-negative-second-person-singular":"nu lesta","imperative-negative-plural-second-person":"nu lestați"}},{"word":"lestie","pos":"adj","definitions":["penniless, broke"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lestie","error-unrecognized-form-feminine-indefinite-singular":"lestie","error-unrecognized-form-indefinite-masculine-plural":"lestie","error-unrecognized-form-feminine-indefinite-neuter-plural":"lestie","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"lesturi","pos":"noun","definitions":["plural of lest (ballast)"],"pronunciation":"/ˈles.turʲ/","forms":{"singular":"lest"}},{"word":"Leșu","pos":"name","definitions":["a river in Bihor, Romania, tributary to the Iada","a river in Buzău, Romania, tributary to the Pietrele","a commune of Bistrița-Năsăud County, Romania","a village in Leșu, Bistrița-Năsăud County, Romania"],"gender":"m"},{"word":"lesucă","pos":"noun","definitions":["diminutive of leasă"],"forms":{"plural":"lesuci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lesucă","accusative-definite-nominative-singular":"lesuca","accusative-indefinite-nominative-plural":"lesuci","accusative-definite-nominative-plural":"lesucile","dative-genitive-indefinite-singular":"lesuci","dative-definite-genitive-singular":"lesucii","dative-genitive-indefinite-plural":"lesuci","dative-definite-genitive-plural":"lesucilor","singular-vocative":"lesucă","plural-vocative":"lesucilor"}},{"word":"leșui","pos":"verb","definitions":["to debilitate, to weaken"],"forms":{"canonical":"a leșui 4th conjugation","present-singular-third-person":"leșuiește","participle-past":"leșuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a leșui","gerund":"leșuind","first-person-indicative-present-singular":"leșuiesc","indicative-present-second-person-singular":"leșuiești","indicative-present-singular-third-person":"leșuiește","first-person-indicative-plural-present":"leșuim","indicative-plural-present-second-person":"leșuiți","indicative-plural-present-third-person":"leșuiesc","first-person-imperfect-indicative-singular":"leșuiam","imperfect-indicative-second-person-singular":"leșuiai","imperfect-indicative-singular-third-person":"leșuia","first-person-imperfect-indicative-plural":"leșuiam","imperfect-indicative-plural-second-person":"leșuiați","imperfect-indicative-plural-third-person":"leșuiau","first-person-indicative-perfect-singular":"leșuii","indicative-perfect-second-person-singular":"leșuiși","indicative-perfect-singular-third-person":"leșui","first-person-indicative-perfect-plural":"leșuirăm","indicative-perfect-plural-second-person":"leșuirăți","indicative-perfect-plural-third-person":"leșuiră","first-person-indicative-pluperfect-singular":"leșuisem","indicative-pluperfect-second-person-singular":"leșuiseși","indicative-pluperfect-singular-third-person":"leșuise","first-person-indicative-pluperfect-plural":"leșuiserăm","indicative-pluperfect-plural-second-person":"leșuiserăți","indicative-pluperfect-plural-third-person":"leșuiseră","first-person-present-singular-subjunctive":"să leșuiesc","present-second-person-singular-subjunctive":"să leșuiești","present-singular-subjunctive-third-person":"să leșuiască","first-person-plural-present-subjunctive":"să leșuim","plural-present-second-person-subjunctive":"să leșuiți","plural-present-subjunctive-third-person":"să leșuiască","imperative-second-person-singular":"leșuiește","imperative-plural-second-person":"leșuiți","imperative-negative-second-person-singular":"nu leșui","imperative-negative-plural-second-person":"nu leșuiți"}},{"word":"leșuit","pos":"adj","definitions":["fainted, weakened"],"forms":{"feminine-singular":"leșuită","masculine-plural":"leșuiți","feminine-neuter-plural":"leșuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leșuit","error-unrecognized-form-feminine-indefinite-singular":"leșuită","error-unrecognized-form-indefinite-masculine-plural":"leșuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"leșuite","definite-error-unrecognized-form-masculine-neuter-singular":"leșuitul","definite-error-unrecognized-form-feminine-singular":"leșuita","definite-error-unrecognized-form-masculine-plural":"leșuiții","definite-error-unrecognized-form-feminine-neuter-plural":"leșuitele"}},{"word":"leșuit","pos":"verb","definitions":["past participle of leșui"],"forms":{"participle-past":"of leșui"}},{"word":"leșuitură","pos":"noun","definitions":["lurking, lying in ambush"],"forms":{"plural":"leșuituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"leșuitură","accusative-definite-nominative-singular":"leșuitura","accusative-indefinite-nominative-plural":"leșuituri","accusative-definite-nominative-plural":"leșuiturile","dative-genitive-indefinite-singular":"leșuituri","dative-definite-genitive-singular":"leșuiturii","dative-genitive-indefinite-plural":"leșuituri","dative-definite-genitive-plural":"leșuiturilor","singular-vocative":"leșuitură","plural-vocative":"leșuiturilor"}},{"word":"leșul","pos":"noun","definitions":["definite nominative/accusative singular of leș"]},{"word":"lesuță","pos":"noun","definitions":["diminutive of leasă"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lesuță","accusative-definite-nominative":"lesuța","dative-genitive-indefinite":"lesuțe","dative-definite-genitive":"lesuței","vocative":"lesuță"}},{"word":"Leț","pos":"name","definitions":["a village in Boroșneu Mare, Covasna County, Romania"],"gender":"m"},{"word":"letal","pos":"adj","definitions":["lethal"],"forms":{"feminine-singular":"letală","masculine-plural":"letali","feminine-neuter-plural":"letale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"letal","error-unrecognized-form-feminine-indefinite-singular":"letală","error-unrecognized-form-indefinite-masculine-plural":"letali","error-unrecognized-form-feminine-indefinite-neuter-plural":"letale","definite-error-unrecognized-form-masculine-neuter-singular":"letalul","definite-error-unrecognized-form-feminine-singular":"letala","definite-error-unrecognized-form-masculine-plural":"letalii","definite-error-unrecognized-form-feminine-neuter-plural":"letalele"}},{"word":"letalitate","pos":"noun","definitions":["lethality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"letalitate","accusative-definite-nominative-singular":"letalitatea","accusative-indefinite-nominative-plural":"letalități","accusative-definite-nominative-plural":"letalitățile","dative-genitive-indefinite-singular":"letalități","dative-definite-genitive-singular":"letalității","dative-genitive-indefinite-plural":"letalități","dative-definite-genitive-plural":"letalităților","singular-vocative":"letalitate","plural-vocative":"letalităților"}},{"word":"letarghicesc","pos":"adj","definitions":["lethargic"],"forms":{"feminine-singular":"letarghicească","plural":"letarghicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"letarghicesc","error-unrecognized-form-feminine-indefinite-singular":"letarghicească","error-unrecognized-form-indefinite-masculine-plural":"letarghicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"letarghicești","definite-error-unrecognized-form-masculine-neuter-singular":"letarghicescul","definite-error-unrecognized-form-feminine-singular":"letarghiceasca","definite-error-unrecognized-form-masculine-plural":"letarghiceștii","definite-error-unrecognized-form-feminine-neuter-plural":"letarghiceștile"}},{"word":"letargic","pos":"adj","definitions":["lethargic"],"forms":{"feminine-singular":"letargică","masculine-plural":"letargici","feminine-neuter-plural":"letargice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"letargic","error-unrecognized-form-feminine-indefinite-singular":"letargică","error-unrecognized-form-indefinite-masculine-plural":"letargici","error-unrecognized-form-feminine-indefinite-neuter-plural":"letargice","definite-error-unrecognized-form-masculine-neuter-singular":"letargicul","definite-error-unrecognized-form-feminine-singular":"letargica","definite-error-unrecognized-form-masculine-plural":"letargicii","definite-error-unrecognized-form-feminine-neuter-plural":"letargicele"}},{"word":"letargie","pos":"noun","definitions":["lethargy"],"forms":{"plural":"letargii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"letargie","accusative-definite-nominative-singular":"letargia","accusative-indefinite-nominative-plural":"letargii","accusative-definite-nominative-plural":"letargiile","dative-genitive-indefinite-singular":"letargii","dative-definite-genitive-singular":"letargiei","dative-genitive-indefinite-plural":"letargii","dative-definite-genitive-plural":"letargiilor","singular-vocative":"letargie","plural-vocative":"letargiilor"}},{"word":"Letca","pos":"name","definitions":["a commune of Sălaj County, Romania","a village in Letca, Sălaj County, Romania"],"gender":"f"},{"word":"Letca Nouă","pos":"name","definitions":["a commune of Giurgiu County, Romania","a village in Letca Nouă, Giurgiu County, Romania"],"gender":"f","forms":{"canonical-feminine":"Lecta Nouă"}},{"word":"Letca Veche","pos":"name","definitions":["a village in Letca Nouă, Giurgiu County, Romania"],"gender":"f","forms":{"canonical-feminine":"Lecta Veche"}},{"word":"lețcaie","pos":"noun","definitions":["alternative form of lăscaie"],"forms":{"plural":"lețcăi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lețcaie","accusative-definite-nominative-singular":"lețcaiea","accusative-indefinite-nominative-plural":"lețcăi","accusative-definite-nominative-plural":"lețcăile","dative-genitive-indefinite-singular":"lețcăi","dative-definite-genitive-singular":"lețcăii","dative-genitive-indefinite-plural":"lețcăi","dative-definite-genitive-plural":"lețcăilor","singular-vocative":"lețcaie","plural-vocative":"lețcăilor"}},{"word":"Lețcana","pos":"name","definitions":["a river in Bacău County, Romania, tributary to the Bistrița"],"gender":"f"},{"word":"Lețcani","pos":"name","definitions":["a commune of Iași County, Romania","a village in Lețcani, Iași County, Romania"],"gender":"m"},{"word":"letcon","pos":"noun","definitions":["soldering iron"],"forms":{"plural":"letcoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"letcon","accusative-definite-nominative-singular":"letconul","accusative-indefinite-nominative-plural":"letcoane","accusative-definite-nominative-plural":"letcoanele","dative-genitive-indefinite-singular":"letcon","dative-definite-genitive-singular":"letconului","dative-genitive-indefinite-plural":"letcoane","dative-definite-genitive-plural":"letcoanelor","singular-vocative":"letconule","plural-vocative":"letcoanelor"}},{"word":"Letea","pos":"name","definitions":["a village in C. A. Rosetti, Tulcea County, Romania"],"gender":"f"},{"word":"Letea Veche","pos":"name","definitions":["a commune of Bacău County, Romania","a village in Letea Veche, Bacău County, Romania"],"gender":"f"},{"word":"letifer","pos":"adj","definitions":["lethal"],"forms":{"feminine-singular":"letiferă","masculine-plural":"letiferi","feminine-neuter-plural":"letifere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"letifer","error-unrecognized-form-feminine-indefinite-singular":"letiferă","error-unrecognized-form-indefinite-masculine-plural":"letiferi","error-unrecognized-form-feminine-indefinite-neuter-plural":"letifere","definite-error-unrecognized-form-masculine-neuter-singular":"letiferul","definite-error-unrecognized-form-feminine-singular":"letifera","definite-error-unrecognized-form-masculine-plural":"letiferii","definite-error-unrecognized-form-feminine-neuter-plural":"letiferele"}},{"word":"letiție","pos":"noun","definitions":["joy"],"forms":{"plural":"letiții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"letiție","accusative-definite-nominative-singular":"letiția","accusative-indefinite-nominative-plural":"letiții","accusative-definite-nominative-plural":"letițiile","dative-genitive-indefinite-singular":"letiții","dative-definite-genitive-singular":"letiției","dative-genitive-indefinite-plural":"letiții","dative-definite-genitive-plural":"letițiilor","singular-vocative":"letiție","plural-vocative":"letițiilor"}},{"word":"leton","pos":"noun","definitions":["Latvian"],"pronunciation":"/leˈton/","forms":{"plural":"letoni","feminine":"equivalent letonă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leton","accusative-definite-nominative-singular":"letonul","accusative-indefinite-nominative-plural":"letoni","accusative-definite-nominative-plural":"letonii","dative-genitive-indefinite-singular":"leton","dative-definite-genitive-singular":"letonului","dative-genitive-indefinite-plural":"letoni","dative-definite-genitive-plural":"letonilor","singular-vocative":"letonule","plural-vocative":"letonilor"}},{"word":"leton","pos":"adj","definitions":["Latvian"],"pronunciation":"/leˈton/","forms":{"feminine-singular":"letonă","masculine-plural":"letoni","feminine-neuter-plural":"letone","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"leton","error-unrecognized-form-feminine-indefinite-singular":"letonă","error-unrecognized-form-indefinite-masculine-plural":"letoni","error-unrecognized-form-feminine-indefinite-neuter-plural":"letone","definite-error-unrecognized-form-masculine-neuter-singular":"letonul","definite-error-unrecognized-form-feminine-singular":"letona","definite-error-unrecognized-form-masculine-plural":"letonii","definite-error-unrecognized-form-feminine-neuter-plural":"letonele"}},{"word":"letonă","pos":"adj","definitions":["feminine nominative/accusative of leton"],"pronunciation":"/leˈtonə/","gender":"f"},{"word":"letonă","pos":"noun","definitions":["Latvian woman"],"pronunciation":"/leˈtonə/","forms":{"plural":"letone","masculine":"equivalent leton","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"letonă","accusative-definite-nominative-singular":"letona","accusative-indefinite-nominative-plural":"letone","accusative-definite-nominative-plural":"letonele","dative-genitive-indefinite-singular":"letone","dative-definite-genitive-singular":"letonei","dative-genitive-indefinite-plural":"letone","dative-definite-genitive-plural":"letonelor","singular-vocative":"letonă","plural-vocative":"letonelor"}},{"word":"letonă","pos":"noun","definitions":["Latvian (language)"],"pronunciation":"/leˈtonə/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"letonă","accusative-definite-nominative":"letona","dative-genitive-indefinite":"letone","dative-definite-genitive":"letonei","vocative":"letonă"}},{"word":"Letonia","pos":"name","definitions":["Latvia (a country in northeastern Europe)"],"pronunciation":"/leˈto.ni.(j)a/","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"Letonie","accusative-definite-nominative":"Letonia","dative-genitive-indefinite":"Letonii","dative-definite-genitive":"Letoniei","vocative":"Letonie"}},{"word":"letopiseț","pos":"noun","definitions":["chronicle"],"forms":{"plural":"letopisețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"letopiseț","accusative-definite-nominative-singular":"letopisețul","accusative-indefinite-nominative-plural":"letopisețe","accusative-definite-nominative-plural":"letopisețele","dative-genitive-indefinite-singular":"letopiseț","dative-definite-genitive-singular":"letopisețului","dative-genitive-indefinite-plural":"letopisețe","dative-definite-genitive-plural":"letopisețelor","singular-vocative":"letopisețule","plural-vocative":"letopisețelor"}},{"word":"letopisițar","pos":"noun","definitions":["chronicler"],"forms":{"plural":"letopisițari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"letopisițar","accusative-definite-nominative-singular":"letopisițarul","accusative-indefinite-nominative-plural":"letopisițari","accusative-definite-nominative-plural":"letopisițarii","dative-genitive-indefinite-singular":"letopisițar","dative-definite-genitive-singular":"letopisițarului","dative-genitive-indefinite-plural":"letopisițari","dative-definite-genitive-plural":"letopisițarilor","singular-vocative":"letopisițarule","plural-vocative":"letopisițarilor"}},{"word":"letrină","pos":"noun","definitions":["drop cap"],"forms":{"plural":"letrine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"letrină","accusative-definite-nominative-singular":"letrina","accusative-indefinite-nominative-plural":"letrine","accusative-definite-nominative-plural":"letrinele","dative-genitive-indefinite-singular":"letrine","dative-definite-genitive-singular":"letrinei","dative-genitive-indefinite-plural":"letrine","dative-definite-genitive-plural":"letrinelor","singular-vocative":"letrină","plural-vocative":"letrinelor"}},{"word":"letrism","pos":"noun","definitions":["Lettrism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"letrism","accusative-definite-nominative-singular":"letrismul","accusative-indefinite-nominative-plural":"letrisme","accusative-definite-nominative-plural":"letrismele","dative-genitive-indefinite-singular":"letrism","dative-definite-genitive-singular":"letrismului","dative-genitive-indefinite-plural":"letrisme","dative-definite-genitive-plural":"letrismelor","singular-vocative":"letrismule","plural-vocative":"letrismelor"}},{"word":"letrist","pos":"adj","definitions":["lettrist"],"forms":{"feminine-singular":"letristă","masculine-plural":"letriști","feminine-neuter-plural":"letriste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"letrist","error-unrecognized-form-feminine-indefinite-singular":"letristă","error-unrecognized-form-indefinite-masculine-plural":"letriști","error-unrecognized-form-feminine-indefinite-neuter-plural":"letriste","definite-error-unrecognized-form-masculine-neuter-singular":"letristul","definite-error-unrecognized-form-feminine-singular":"letrista","definite-error-unrecognized-form-masculine-plural":"letriștii","definite-error-unrecognized-form-feminine-neuter-plural":"letristele"}},{"word":"lețurel","pos":"noun","definitions":["diminutive of leaț"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lețurel","accusative-definite-nominative":"lețurelul","dative-genitive-indefinite":"lețurel","dative-definite-genitive":"lețurelului","vocative":"lețurelule"}},{"word":"leturghie","pos":"noun","definitions":["alternative form of liturghie"],"forms":{"plural":"leturghii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"leturghie","accusative-definite-nominative-singular":"leturghia","accusative-indefinite-nominative-plural":"leturghii","accusative-definite-nominative-plural":"leturghiile","dative-genitive-indefinite-singular":"leturghii","dative-definite-genitive-singular":"leturghiei","dative-genitive-indefinite-plural":"leturghii","dative-definite-genitive-plural":"leturghiilor","singular-vocative":"leturghie","plural-vocative":"leturghiilor"}},{"word":"leu","pos":"noun","definitions":["lion","leu (Romanian and Moldovan unit of currency)"],"pronunciation":"/lew/","examples":[{"ro":"Moneda națională este leul, iar subdiviziunea acestuia, banul.","en":"The national currency is the leu, and its subunit is the ban."}],"forms":{"plural":"lei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leu","accusative-definite-nominative-singular":"leul","accusative-indefinite-nominative-plural":"lei","accusative-definite-nominative-plural":"leii","dative-genitive-indefinite-singular":"leu","dative-definite-genitive-singular":"leului","dative-genitive-indefinite-plural":"lei","dative-definite-genitive-plural":"leilor","singular-vocative":"leule","plural-vocative":"leilor","alternative":"леу"}},{"word":"leu asiatic","pos":"noun","definitions":["Asian lion"],"forms":{"plural":"lei asiatici"}},{"word":"leu berber","pos":"noun","definitions":["Barbary lion"],"forms":{"plural":"lei berberi"}},{"word":"leuaș","pos":"noun","definitions":["diminutive of leu","taxman"],"forms":{"plural":"leuași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leuaș","accusative-definite-nominative-singular":"leuașul","accusative-indefinite-nominative-plural":"leuași","accusative-definite-nominative-plural":"leuașii","dative-genitive-indefinite-singular":"leuaș","dative-definite-genitive-singular":"leuașului","dative-genitive-indefinite-plural":"leuași","dative-definite-genitive-plural":"leuașilor","singular-vocative":"leuașule","plural-vocative":"leuașilor"}},{"word":"Leuca","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Leuca"}},{"word":"Leucă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Leucă"}},{"word":"leucă","pos":"noun","definitions":["a curved wooden beam connecting a ladder wagon’s rims to its axletree for support"],"pronunciation":"/ˈlew.kə/","forms":{"plural":"leuci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"leucă","accusative-definite-nominative-singular":"leuca","accusative-indefinite-nominative-plural":"leuci","accusative-definite-nominative-plural":"leucile","dative-genitive-indefinite-singular":"leuci","dative-definite-genitive-singular":"leucii","dative-genitive-indefinite-plural":"leuci","dative-definite-genitive-plural":"leucilor","singular-vocative":"leucă","plural-vocative":"leucilor","alternative":"леукэ"}},{"word":"leucemic","pos":"adj","definitions":["leukemic"],"forms":{"feminine-singular":"leucemică","masculine-plural":"leucemici","feminine-neuter-plural":"leucemice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leucemic","error-unrecognized-form-feminine-indefinite-singular":"leucemică","error-unrecognized-form-indefinite-masculine-plural":"leucemici","error-unrecognized-form-feminine-indefinite-neuter-plural":"leucemice","definite-error-unrecognized-form-masculine-neuter-singular":"leucemicul","definite-error-unrecognized-form-feminine-singular":"leucemica","definite-error-unrecognized-form-masculine-plural":"leucemicii","definite-error-unrecognized-form-feminine-neuter-plural":"leucemicele"}},{"word":"leucemie","pos":"noun","definitions":["leukemia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"leucemie","accusative-definite-nominative":"leucemia","dative-genitive-indefinite":"leucemii","dative-definite-genitive":"leucemiei","vocative":"leucemie"}},{"word":"leucină","pos":"noun","definitions":["leucine (essential amino acid; C₆H₁₃NO₂)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"leucină","accusative-definite-nominative":"leucina","dative-genitive-indefinite":"leucine","dative-definite-genitive":"leucinei","vocative":"leucină"}},{"word":"leucioară","pos":"noun","definitions":["diminutive of lele"],"forms":{"plural":"leucioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leucioară","accusative-definite-nominative-singular":"leucioara","accusative-indefinite-nominative-plural":"leucioare","accusative-definite-nominative-plural":"leucioarele","dative-genitive-indefinite-singular":"leucioare","dative-definite-genitive-singular":"leucioarei","dative-genitive-indefinite-plural":"leucioare","dative-definite-genitive-plural":"leucioarelor","singular-vocative":"leucioară","plural-vocative":"leucioarelor"}},{"word":"leucism","pos":"noun","definitions":["leucism"],"forms":{"plural":"leucisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"leucism","accusative-definite-nominative-singular":"leucismul","accusative-indefinite-nominative-plural":"leucisme","accusative-definite-nominative-plural":"leucismele","dative-genitive-indefinite-singular":"leucism","dative-definite-genitive-singular":"leucismului","dative-genitive-indefinite-plural":"leucisme","dative-definite-genitive-plural":"leucismelor","singular-vocative":"leucismule","plural-vocative":"leucismelor"}},{"word":"leucit","pos":"noun","definitions":["leucite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"leucit","accusative-definite-nominative-singular":"leucitul","accusative-indefinite-nominative-plural":"leucite","accusative-definite-nominative-plural":"leucitele","dative-genitive-indefinite-singular":"leucit","dative-definite-genitive-singular":"leucitului","dative-genitive-indefinite-plural":"leucite","dative-definite-genitive-plural":"leucitelor","singular-vocative":"leucitule","plural-vocative":"leucitelor"}},{"word":"leucitic","pos":"adj","definitions":["leucitic"],"forms":{"feminine-singular":"leucitică","masculine-plural":"leucitici","feminine-neuter-plural":"leucitice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leucitic","error-unrecognized-form-feminine-indefinite-singular":"leucitică","error-unrecognized-form-indefinite-masculine-plural":"leucitici","error-unrecognized-form-feminine-indefinite-neuter-plural":"leucitice","definite-error-unrecognized-form-masculine-neuter-singular":"leuciticul","definite-error-unrecognized-form-feminine-singular":"leucitica","definite-error-unrecognized-form-masculine-plural":"leuciticii","definite-error-unrecognized-form-feminine-neuter-plural":"leuciticele"}},{"word":"leucitit","pos":"noun","definitions":["leucitite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"leucitit","accusative-definite-nominative":"leucititul","dative-genitive-indefinite":"leucitit","dative-definite-genitive":"leucititului","vocative":"leucititule"}},{"word":"leucoaglutinină","pos":"noun","definitions":["leukoagglutinin"],"forms":{"plural":"leucoaglutinine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leucoaglutinină","accusative-definite-nominative-singular":"leucoaglutinina","accusative-indefinite-nominative-plural":"leucoaglutinine","accusative-definite-nominative-plural":"leucoaglutininele","dative-genitive-indefinite-singular":"leucoaglutinine","dative-definite-genitive-singular":"leucoaglutininei","dative-genitive-indefinite-plural":"leucoaglutinine","dative-definite-genitive-plural":"leucoaglutininelor","singular-vocative":"leucoaglutinină","plural-vocative":"leucoaglutininelor"}},{"word":"leucobază","pos":"noun","definitions":["leucoderivative"],"forms":{"plural":"leucobaze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leucobază","accusative-definite-nominative-singular":"leucobaza","accusative-indefinite-nominative-plural":"leucobaze","accusative-definite-nominative-plural":"leucobazele","dative-genitive-indefinite-singular":"leucobaze","dative-definite-genitive-singular":"leucobazei","dative-genitive-indefinite-plural":"leucobaze","dative-definite-genitive-plural":"leucobazelor","singular-vocative":"leucobază","plural-vocative":"leucobazelor"}},{"word":"leucoblast","pos":"noun","definitions":["leucoblast"],"forms":{"plural":"leucoblaste","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"leucoblast","accusative-definite-nominative-singular":"leucoblastul","accusative-indefinite-nominative-plural":"leucoblaste","accusative-definite-nominative-plural":"leucoblastele","dative-genitive-indefinite-singular":"leucoblast","dative-definite-genitive-singular":"leucoblastului","dative-genitive-indefinite-plural":"leucoblaste","dative-definite-genitive-plural":"leucoblastelor","singular-vocative":"leucoblastule","plural-vocative":"leucoblastelor"}},{"word":"leucocheratoză","pos":"noun","definitions":["leukokeratosis"],"forms":{"plural":"leucocheratoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leucocheratoză","accusative-definite-nominative-singular":"leucocheratoza","accusative-indefinite-nominative-plural":"leucocheratoze","accusative-definite-nominative-plural":"leucocheratozele","dative-genitive-indefinite-singular":"leucocheratoze","dative-definite-genitive-singular":"leucocheratozei","dative-genitive-indefinite-plural":"leucocheratoze","dative-definite-genitive-plural":"leucocheratozelor","singular-vocative":"leucocheratoză","plural-vocative":"leucocheratozelor"}},{"word":"leucocit","pos":"noun","definitions":["alternative form of leucocită"],"forms":{"plural":"leucocite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"leucocit","accusative-definite-nominative-singular":"leucocitul","accusative-indefinite-nominative-plural":"leucocite","accusative-definite-nominative-plural":"leucocitele","dative-genitive-indefinite-singular":"leucocit","dative-definite-genitive-singular":"leucocitului","dative-genitive-indefinite-plural":"leucocite","dative-definite-genitive-plural":"leucocitelor","singular-vocative":"leucocitule","plural-vocative":"leucocitelor"}},{"word":"leucocită","pos":"noun","definitions":["leukocyte"],"forms":{"plural":"leucocite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"leucocită","accusative-definite-nominative-singular":"leucocităul","accusative-indefinite-nominative-plural":"leucocite","accusative-definite-nominative-plural":"leucocitele","dative-genitive-indefinite-singular":"leucocită","dative-definite-genitive-singular":"leucocităului","dative-genitive-indefinite-plural":"leucocite","dative-definite-genitive-plural":"leucocitelor","singular-vocative":"leucocităule","plural-vocative":"leucocitelor"}},{"word":"leucocitar","pos":"adj","definitions":["leukocytic"],"forms":{"feminine-singular":"leucocitară","masculine-plural":"leucocitari","feminine-neuter-plural":"leucocitare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leucocitar","error-unrecognized-form-feminine-indefinite-singular":"leucocitară","error-unrecognized-form-indefinite-masculine-plural":"leucocitari","error-unrecognized-form-feminine-indefinite-neuter-plural":"leucocitare","definite-error-unrecognized-form-masculine-neuter-singular":"leucocitarul","definite-error-unrecognized-form-feminine-singular":"leucocitara","definite-error-unrecognized-form-masculine-plural":"leucocitarii","definite-error-unrecognized-form-feminine-neuter-plural":"leucocitarele"}},{"word":"leucocitemie","pos":"noun","definitions":["leukemia"],"forms":{"plural":"leucocitemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"leucocitemie","accusative-definite-nominative-singular":"leucocitemia","accusative-indefinite-nominative-plural":"leucocitemii","accusative-definite-nominative-plural":"leucocitemiile","dative-genitive-indefinite-singular":"leucocitemii","dative-definite-genitive-singular":"leucocitemiei","dative-genitive-indefinite-plural":"leucocitemii","dative-definite-genitive-plural":"leucocitemiilor","singular-vocative":"leucocitemie","plural-vocative":"leucocitemiilor"}},{"word":"leucocitogeneză","pos":"noun","definitions":["leukocytogenesis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leucocitogeneză","accusative-definite-nominative-singular":"leucocitogeneza","accusative-indefinite-nominative-plural":"leucocitogeneze","accusative-definite-nominative-plural":"leucocitogenezele","dative-genitive-indefinite-singular":"leucocitogeneze","dative-definite-genitive-singular":"leucocitogenezei","dative-genitive-indefinite-plural":"leucocitogeneze","dative-definite-genitive-plural":"leucocitogenezelor","singular-vocative":"leucocitogeneză","plural-vocative":"leucocitogenezelor"}},{"word":"leucocitoliză","pos":"noun","definitions":["leukocytolysis"],"forms":{"plural":"leucocitolize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leucocitoliză","accusative-definite-nominative-singular":"leucocitoliza","accusative-indefinite-nominative-plural":"leucocitolize","accusative-definite-nominative-plural":"leucocitolizele","dative-genitive-indefinite-singular":"leucocitolize","dative-definite-genitive-singular":"leucocitolizei","dative-genitive-indefinite-plural":"leucocitolize","dative-definite-genitive-plural":"leucocitolizelor","singular-vocative":"leucocitoliză","plural-vocative":"leucocitolizelor"}},{"word":"leucocitopenie","pos":"noun","definitions":["leukopenia"],"forms":{"plural":"leucocitopenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"leucocitopenie","accusative-definite-nominative-singular":"leucocitopenia","accusative-indefinite-nominative-plural":"leucocitopenii","accusative-definite-nominative-plural":"leucocitopeniile","dative-genitive-indefinite-singular":"leucocitopenii","dative-definite-genitive-singular":"leucocitopeniei","dative-genitive-indefinite-plural":"leucocitopenii","dative-definite-genitive-plural":"leucocitopeniilor","singular-vocative":"leucocitopenie","plural-vocative":"leucocitopeniilor"}},{"word":"leucocitopoieză","pos":"noun","definitions":["leukocytopoiesis"],"forms":{"plural":"leucocitopoieze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leucocitopoieză","accusative-definite-nominative-singular":"leucocitopoieza","accusative-indefinite-nominative-plural":"leucocitopoieze","accusative-definite-nominative-plural":"leucocitopoiezele","dative-genitive-indefinite-singular":"leucocitopoieze","dative-definite-genitive-singular":"leucocitopoiezei","dative-genitive-indefinite-plural":"leucocitopoieze","dative-definite-genitive-plural":"leucocitopoiezelor","singular-vocative":"leucocitopoieză","plural-vocative":"leucocitopoiezelor"}},{"word":"leucocitoză","pos":"noun","definitions":["leukocytosis"],"forms":{"plural":"leucocitoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leucocitoză","accusative-definite-nominative-singular":"leucocitoza","accusative-indefinite-nominative-plural":"leucocitoze","accusative-definite-nominative-plural":"leucocitozele","dative-genitive-indefinite-singular":"leucocitoze","dative-definite-genitive-singular":"leucocitozei","dative-genitive-indefinite-plural":"leucocitoze","dative-definite-genitive-plural":"leucocitozelor","singular-vocative":"leucocitoză","plural-vocative":"leucocitozelor"}},{"word":"leucociturie","pos":"noun","definitions":["leucocyturia"],"forms":{"plural":"leucociturii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"leucociturie","accusative-definite-nominative-singular":"leucocituria","accusative-indefinite-nominative-plural":"leucociturii","accusative-definite-nominative-plural":"leucocituriile","dative-genitive-indefinite-singular":"leucociturii","dative-definite-genitive-singular":"leucocituriei","dative-genitive-indefinite-plural":"leucociturii","dative-definite-genitive-plural":"leucocituriilor","singular-vocative":"leucociturie","plural-vocative":"leucocituriilor"}},{"word":"leucoderivat","pos":"noun","definitions":["leucoderivative"],"forms":{"plural":"leucoderivați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leucoderivat","accusative-definite-nominative-singular":"leucoderivatul","accusative-indefinite-nominative-plural":"leucoderivați","accusative-definite-nominative-plural":"leucoderivații","dative-genitive-indefinite-singular":"leucoderivat","dative-definite-genitive-singular":"leucoderivatului","dative-genitive-indefinite-plural":"leucoderivați","dative-definite-genitive-plural":"leucoderivaților","singular-vocative":"leucoderivatule","plural-vocative":"leucoderivaților"}},{"word":"leucoderm","pos":"adj","definitions":["leucodermic"],"forms":{"feminine-singular":"leucodermă","masculine-plural":"leucodermi","feminine-neuter-plural":"leucoderme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leucoderm","error-unrecognized-form-feminine-indefinite-singular":"leucodermă","error-unrecognized-form-indefinite-masculine-plural":"leucodermi","error-unrecognized-form-feminine-indefinite-neuter-plural":"leucoderme","definite-error-unrecognized-form-masculine-neuter-singular":"leucodermul","definite-error-unrecognized-form-feminine-singular":"leucoderma","definite-error-unrecognized-form-masculine-plural":"leucodermii","definite-error-unrecognized-form-feminine-neuter-plural":"leucodermele"}},{"word":"leucodermie","pos":"noun","definitions":["leukoderma"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"leucodermie","accusative-definite-nominative":"leucodermia","dative-genitive-indefinite":"leucodermii","dative-definite-genitive":"leucodermiei","vocative":"leucodermie"}},{"word":"leucoencefalită","pos":"noun","definitions":["leukoencephalitis"],"forms":{"plural":"leucoencefalite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leucoencefalită","accusative-definite-nominative-singular":"leucoencefalita","accusative-indefinite-nominative-plural":"leucoencefalite","accusative-definite-nominative-plural":"leucoencefalitele","dative-genitive-indefinite-singular":"leucoencefalite","dative-definite-genitive-singular":"leucoencefalitei","dative-genitive-indefinite-plural":"leucoencefalite","dative-definite-genitive-plural":"leucoencefalitelor","singular-vocative":"leucoencefalită","plural-vocative":"leucoencefalitelor"}},{"word":"leucofan","pos":"noun","definitions":["leucophanite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"leucofan","accusative-definite-nominative":"leucofanul","dative-genitive-indefinite":"leucofan","dative-definite-genitive":"leucofanului","vocative":"leucofanule"}},{"word":"leucogen","pos":"adj","definitions":["leukogenic"],"forms":{"feminine-singular":"leucogenă","masculine-plural":"leucogeni","feminine-neuter-plural":"leucogene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leucogen","error-unrecognized-form-feminine-indefinite-singular":"leucogenă","error-unrecognized-form-indefinite-masculine-plural":"leucogeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"leucogene","definite-error-unrecognized-form-masculine-neuter-singular":"leucogenul","definite-error-unrecognized-form-feminine-singular":"leucogena","definite-error-unrecognized-form-masculine-plural":"leucogenii","definite-error-unrecognized-form-feminine-neuter-plural":"leucogenele"}},{"word":"leucogeneză","pos":"noun","definitions":["leukogenesis"],"forms":{"plural":"leucogeneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leucogeneză","accusative-definite-nominative-singular":"leucogeneza","accusative-indefinite-nominative-plural":"leucogeneze","accusative-definite-nominative-plural":"leucogenezele","dative-genitive-indefinite-singular":"leucogeneze","dative-definite-genitive-singular":"leucogenezei","dative-genitive-indefinite-plural":"leucogeneze","dative-definite-genitive-plural":"leucogenezelor","singular-vocative":"leucogeneză","plural-vocative":"leucogenezelor"}},{"word":"leucogramă","pos":"noun","definitions":["leukogram"],"forms":{"plural":"leucograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leucogramă","accusative-definite-nominative-singular":"leucograma","accusative-indefinite-nominative-plural":"leucograme","accusative-definite-nominative-plural":"leucogramele","dative-genitive-indefinite-singular":"leucograme","dative-definite-genitive-singular":"leucogramei","dative-genitive-indefinite-plural":"leucograme","dative-definite-genitive-plural":"leucogramelor","singular-vocative":"leucogramă","plural-vocative":"leucogramelor"}},{"word":"leucom","pos":"noun","definitions":["leucoma"],"forms":{"plural":"leucoame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"leucom","accusative-definite-nominative-singular":"leucomul","accusative-indefinite-nominative-plural":"leucoame","accusative-definite-nominative-plural":"leucoamele","dative-genitive-indefinite-singular":"leucom","dative-definite-genitive-singular":"leucomului","dative-genitive-indefinite-plural":"leucoame","dative-definite-genitive-plural":"leucoamelor","singular-vocative":"leucomule","plural-vocative":"leucoamelor"}},{"word":"leucomaină","pos":"noun","definitions":["leucomaine"],"forms":{"plural":"leucomaine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leucomaină","accusative-definite-nominative-singular":"leucomaina","accusative-indefinite-nominative-plural":"leucomaine","accusative-definite-nominative-plural":"leucomainele","dative-genitive-indefinite-singular":"leucomaine","dative-definite-genitive-singular":"leucomainei","dative-genitive-indefinite-plural":"leucomaine","dative-definite-genitive-plural":"leucomainelor","singular-vocative":"leucomaină","plural-vocative":"leucomainelor"}},{"word":"leucomelanodermie","pos":"noun","definitions":["leukomelanoderma"],"forms":{"plural":"leucomelanodermii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"leucomelanodermie","accusative-definite-nominative-singular":"leucomelanodermia","accusative-indefinite-nominative-plural":"leucomelanodermii","accusative-definite-nominative-plural":"leucomelanodermiile","dative-genitive-indefinite-singular":"leucomelanodermii","dative-definite-genitive-singular":"leucomelanodermiei","dative-genitive-indefinite-plural":"leucomelanodermii","dative-definite-genitive-plural":"leucomelanodermiilor","singular-vocative":"leucomelanodermie","plural-vocative":"leucomelanodermiilor"}},{"word":"leucometru","pos":"noun","definitions":["leukometer"],"forms":{"plural":"leucometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"leucometru","accusative-definite-nominative-singular":"leucometruul","accusative-indefinite-nominative-plural":"leucometre","accusative-definite-nominative-plural":"leucometrele","dative-genitive-indefinite-singular":"leucometru","dative-definite-genitive-singular":"leucometruului","dative-genitive-indefinite-plural":"leucometre","dative-definite-genitive-plural":"leucometrelor","singular-vocative":"leucometruule","plural-vocative":"leucometrelor"}},{"word":"leucomielită","pos":"noun","definitions":["leukomyelitis"],"forms":{"plural":"leucomielite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leucomielită","accusative-definite-nominative-singular":"leucomielita","accusative-indefinite-nominative-plural":"leucomielite","accusative-definite-nominative-plural":"leucomielitele","dative-genitive-indefinite-singular":"leucomielite","dative-definite-genitive-singular":"leucomielitei","dative-genitive-indefinite-plural":"leucomielite","dative-definite-genitive-plural":"leucomielitelor","singular-vocative":"leucomielită","plural-vocative":"leucomielitelor"}},{"word":"leuconichie","pos":"noun","definitions":["leuconychia"],"forms":{"plural":"leuconichii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"leuconichie","accusative-definite-nominative-singular":"leuconichia","accusative-indefinite-nominative-plural":"leuconichii","accusative-definite-nominative-plural":"leuconichiile","dative-genitive-indefinite-singular":"leuconichii","dative-definite-genitive-singular":"leuconichiei","dative-genitive-indefinite-plural":"leuconichii","dative-definite-genitive-plural":"leuconichiilor","singular-vocative":"leuconichie","plural-vocative":"leuconichiilor"}},{"word":"leucopatie","pos":"noun","definitions":["leukopathy"],"forms":{"plural":"leucopatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"leucopatie","accusative-definite-nominative-singular":"leucopatia","accusative-indefinite-nominative-plural":"leucopatii","accusative-definite-nominative-plural":"leucopatiile","dative-genitive-indefinite-singular":"leucopatii","dative-definite-genitive-singular":"leucopatiei","dative-genitive-indefinite-plural":"leucopatii","dative-definite-genitive-plural":"leucopatiilor","singular-vocative":"leucopatie","plural-vocative":"leucopatiilor"}},{"word":"leucopedeză","pos":"noun","definitions":["leukopedesis"],"forms":{"plural":"leucopedeze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leucopedeză","accusative-definite-nominative-singular":"leucopedeza","accusative-indefinite-nominative-plural":"leucopedeze","accusative-definite-nominative-plural":"leucopedezele","dative-genitive-indefinite-singular":"leucopedeze","dative-definite-genitive-singular":"leucopedezei","dative-genitive-indefinite-plural":"leucopedeze","dative-definite-genitive-plural":"leucopedezelor","singular-vocative":"leucopedeză","plural-vocative":"leucopedezelor"}},{"word":"leucopenie","pos":"noun","definitions":["leukopenia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"leucopenie","accusative-definite-nominative":"leucopenia","dative-genitive-indefinite":"leucopenii","dative-definite-genitive":"leucopeniei","vocative":"leucopenie"}},{"word":"leucoplachie","pos":"noun","definitions":["leukokeratosis"],"forms":{"plural":"leucoplachii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"leucoplachie","accusative-definite-nominative-singular":"leucoplachia","accusative-indefinite-nominative-plural":"leucoplachii","accusative-definite-nominative-plural":"leucoplachiile","dative-genitive-indefinite-singular":"leucoplachii","dative-definite-genitive-singular":"leucoplachiei","dative-genitive-indefinite-plural":"leucoplachii","dative-definite-genitive-plural":"leucoplachiilor","singular-vocative":"leucoplachie","plural-vocative":"leucoplachiilor"}},{"word":"leucoplast","pos":"noun","definitions":["sticking plaster, band-aid"],"forms":{"plural":"leucoplaste","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"leucoplast","accusative-definite-nominative-singular":"leucoplastul","accusative-indefinite-nominative-plural":"leucoplaste","accusative-definite-nominative-plural":"leucoplastele","dative-genitive-indefinite-singular":"leucoplast","dative-definite-genitive-singular":"leucoplastului","dative-genitive-indefinite-plural":"leucoplaste","dative-definite-genitive-plural":"leucoplastelor","singular-vocative":"leucoplastule","plural-vocative":"leucoplastelor"}},{"word":"leucoplazie","pos":"noun","definitions":["leukoplakia"],"forms":{"plural":"leucoplazii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"leucoplazie","accusative-definite-nominative-singular":"leucoplazia","accusative-indefinite-nominative-plural":"leucoplazii","accusative-definite-nominative-plural":"leucoplaziile","dative-genitive-indefinite-singular":"leucoplazii","dative-definite-genitive-singular":"leucoplaziei","dative-genitive-indefinite-plural":"leucoplazii","dative-definite-genitive-plural":"leucoplaziilor","singular-vocative":"leucoplazie","plural-vocative":"leucoplaziilor"}},{"word":"leucopoieză","pos":"noun","definitions":["leukopoiesis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leucopoieză","accusative-definite-nominative-singular":"leucopoieza","accusative-indefinite-nominative-plural":"leucopoieze","accusative-definite-nominative-plural":"leucopoiezele","dative-genitive-indefinite-singular":"leucopoieze","dative-definite-genitive-singular":"leucopoiezei","dative-genitive-indefinite-plural":"leucopoieze","dative-definite-genitive-plural":"leucopoiezelor","singular-vocative":"leucopoieză","plural-vocative":"leucopoiezelor"}},{"word":"leucoree","pos":"noun","definitions":["leucorrhea"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"leucoree","accusative-definite-nominative":"leucoreea","dative-genitive-indefinite":"leucorei","dative-definite-genitive":"leucoreii","vocative":"leucoree"}},{"word":"leucoreic","pos":"adj","definitions":["leukorrheal"],"forms":{"feminine-singular":"leucoreică","masculine-plural":"leucoreici","feminine-neuter-plural":"leucoreice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leucoreic","error-unrecognized-form-feminine-indefinite-singular":"leucoreică","error-unrecognized-form-indefinite-masculine-plural":"leucoreici","error-unrecognized-form-feminine-indefinite-neuter-plural":"leucoreice","definite-error-unrecognized-form-masculine-neuter-singular":"leucoreicul","definite-error-unrecognized-form-feminine-singular":"leucoreica","definite-error-unrecognized-form-masculine-plural":"leucoreicii","definite-error-unrecognized-form-feminine-neuter-plural":"leucoreicele"}},{"word":"leucospermie","pos":"noun","definitions":["leukocytospermia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"leucospermie","accusative-definite-nominative":"leucospermia","dative-genitive-indefinite":"leucospermii","dative-definite-genitive":"leucospermiei","vocative":"leucospermie"}},{"word":"leucotomie","pos":"noun","definitions":["leucotomy"],"forms":{"plural":"leucotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"leucotomie","accusative-definite-nominative-singular":"leucotomia","accusative-indefinite-nominative-plural":"leucotomii","accusative-definite-nominative-plural":"leucotomiile","dative-genitive-indefinite-singular":"leucotomii","dative-definite-genitive-singular":"leucotomiei","dative-genitive-indefinite-plural":"leucotomii","dative-definite-genitive-plural":"leucotomiilor","singular-vocative":"leucotomie","plural-vocative":"leucotomiilor"}},{"word":"leucotoxic","pos":"adj","definitions":["leukotoxic"],"forms":{"feminine-singular":"leucotoxică","masculine-plural":"leucotoxici","feminine-neuter-plural":"leucotoxice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leucotoxic","error-unrecognized-form-feminine-indefinite-singular":"leucotoxică","error-unrecognized-form-indefinite-masculine-plural":"leucotoxici","error-unrecognized-form-feminine-indefinite-neuter-plural":"leucotoxice","definite-error-unrecognized-form-masculine-neuter-singular":"leucotoxicul","definite-error-unrecognized-form-feminine-singular":"leucotoxica","definite-error-unrecognized-form-masculine-plural":"leucotoxicii","definite-error-unrecognized-form-feminine-neuter-plural":"leucotoxicele"}},{"word":"leucotoxină","pos":"noun","definitions":["leukotoxin"],"forms":{"plural":"leucotoxine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leucotoxină","accusative-definite-nominative-singular":"leucotoxina","accusative-indefinite-nominative-plural":"leucotoxine","accusative-definite-nominative-plural":"leucotoxinele","dative-genitive-indefinite-singular":"leucotoxine","dative-definite-genitive-singular":"leucotoxinei","dative-genitive-indefinite-plural":"leucotoxine","dative-definite-genitive-plural":"leucotoxinelor","singular-vocative":"leucotoxină","plural-vocative":"leucotoxinelor"}},{"word":"leucoxen","pos":"noun","definitions":["leucoxene"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"leucoxen","accusative-definite-nominative":"leucoxenul","dative-genitive-indefinite":"leucoxen","dative-definite-genitive":"leucoxenului","vocative":"leucoxenule"}},{"word":"leucoză","pos":"noun","definitions":["leukosis"],"forms":{"plural":"leucoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leucoză","accusative-definite-nominative-singular":"leucoza","accusative-indefinite-nominative-plural":"leucoze","accusative-definite-nominative-plural":"leucozele","dative-genitive-indefinite-singular":"leucoze","dative-definite-genitive-singular":"leucozei","dative-genitive-indefinite-plural":"leucoze","dative-definite-genitive-plural":"leucozelor","singular-vocative":"leucoză","plural-vocative":"leucozelor"}},{"word":"leucozic","pos":"adj","definitions":["leukotic"],"forms":{"feminine-singular":"leucozică","masculine-plural":"leucozici","feminine-neuter-plural":"leucozice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leucozic","error-unrecognized-form-feminine-indefinite-singular":"leucozică","error-unrecognized-form-indefinite-masculine-plural":"leucozici","error-unrecognized-form-feminine-indefinite-neuter-plural":"leucozice","definite-error-unrecognized-form-masculine-neuter-singular":"leucozicul","definite-error-unrecognized-form-feminine-singular":"leucozica","definite-error-unrecognized-form-masculine-plural":"leucozicii","definite-error-unrecognized-form-feminine-neuter-plural":"leucozicele"}},{"word":"leucozină","pos":"noun","definitions":["leucosin"],"forms":{"plural":"leucozine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leucozină","accusative-definite-nominative-singular":"leucozina","accusative-indefinite-nominative-plural":"leucozine","accusative-definite-nominative-plural":"leucozinele","dative-genitive-indefinite-singular":"leucozine","dative-definite-genitive-singular":"leucozinei","dative-genitive-indefinite-plural":"leucozine","dative-definite-genitive-plural":"leucozinelor","singular-vocative":"leucozină","plural-vocative":"leucozinelor"}},{"word":"leucozom","pos":"noun","definitions":["leucosome"],"forms":{"plural":"leucozomi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leucozom","accusative-definite-nominative-singular":"leucozomul","accusative-indefinite-nominative-plural":"leucozomi","accusative-definite-nominative-plural":"leucozomii","dative-genitive-indefinite-singular":"leucozom","dative-definite-genitive-singular":"leucozomului","dative-genitive-indefinite-plural":"leucozomi","dative-definite-genitive-plural":"leucozomilor","singular-vocative":"leucozomule","plural-vocative":"leucozomilor"}},{"word":"Leucușești","pos":"name","definitions":["a village in Preutești, Suceava County, Romania","a village in Bethausen, Timiș County, Romania"],"gender":"m"},{"word":"leul","pos":"noun","definitions":["definite nominative/accusative singular of leu"],"gender":"m"},{"word":"leul-furnicilor","pos":"noun","definitions":["antlion"]},{"word":"Leulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Leulescu"}},{"word":"leuleț","pos":"noun","definitions":["diminutive of leu"],"forms":{"plural":"leuleți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leuleț","accusative-definite-nominative-singular":"leulețul","accusative-indefinite-nominative-plural":"leuleți","accusative-definite-nominative-plural":"leuleții","dative-genitive-indefinite-singular":"leuleț","dative-definite-genitive-singular":"leulețului","dative-genitive-indefinite-plural":"leuleți","dative-definite-genitive-plural":"leuleților","singular-vocative":"leulețule","plural-vocative":"leuleților"}},{"word":"leului","pos":"noun","definitions":["definite genitive/dative singular of leu"]},{"word":"Leurda","pos":"name","definitions":["a village in Cășeiu, Cluj County, Romania","a locality in Motru, Gorj County, Romania"],"gender":"f"},{"word":"leurda","pos":"noun","definitions":["definite nominative/accusative singular of leurdă"]},{"word":"Leurdă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Leurdă"}},{"word":"leurdă","pos":"noun","definitions":["ramsons (Allium ursinum)"],"pronunciation":"/leˈur.da/","forms":{"plural":"leurde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leurdă","accusative-definite-nominative-singular":"leurda","accusative-indefinite-nominative-plural":"leurde","accusative-definite-nominative-plural":"leurdele","dative-genitive-indefinite-singular":"leurde","dative-definite-genitive-singular":"leurdei","dative-genitive-indefinite-plural":"leurde","dative-definite-genitive-plural":"leurdelor","singular-vocative":"leurdă","plural-vocative":"leurdelor"}},{"word":"leurdar","pos":"noun","definitions":["sinner"],"forms":{"plural":"leurdari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leurdar","accusative-definite-nominative-singular":"leurdarul","accusative-indefinite-nominative-plural":"leurdari","accusative-definite-nominative-plural":"leurdarii","dative-genitive-indefinite-singular":"leurdar","dative-definite-genitive-singular":"leurdarului","dative-genitive-indefinite-plural":"leurdari","dative-definite-genitive-plural":"leurdarilor","singular-vocative":"leurdarule","plural-vocative":"leurdarilor"}},{"word":"leurde","pos":"noun","definitions":["inflection of leurdă:","indefinite nominative/accusative/genitive/dative plural","indefinite genitive/dative singular"]},{"word":"leurdeasă","pos":"noun","definitions":["thicket, grove, small wood"],"forms":{"plural":"leurdese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leurdeasă","accusative-definite-nominative-singular":"leurdeasa","accusative-indefinite-nominative-plural":"leurdese","accusative-definite-nominative-plural":"leurdesele","dative-genitive-indefinite-singular":"leurdese","dative-definite-genitive-singular":"leurdesei","dative-genitive-indefinite-plural":"leurdese","dative-definite-genitive-plural":"leurdeselor","singular-vocative":"leurdeasă","plural-vocative":"leurdeselor"}},{"word":"Leurdele","pos":"name","definitions":["a river in Gorj, Romania, tributary to the Lespezel"],"gender":"m"},{"word":"leurdele","pos":"noun","definitions":["definite nominative/accusative plural of leurdă"]},{"word":"leurdină","pos":"noun","definitions":["dahlia"],"forms":{"plural":"leurdine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"leurdină","accusative-definite-nominative-singular":"leurdina","accusative-indefinite-nominative-plural":"leurdine","accusative-definite-nominative-plural":"leurdinele","dative-genitive-indefinite-singular":"leurdine","dative-definite-genitive-singular":"leurdinei","dative-genitive-indefinite-plural":"leurdine","dative-definite-genitive-plural":"leurdinelor","singular-vocative":"leurdină","plural-vocative":"leurdinelor"}},{"word":"leușcan","pos":"noun","definitions":["diminutive of leu"],"forms":{"plural":"leușcani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leușcan","accusative-definite-nominative-singular":"leușcanul","accusative-indefinite-nominative-plural":"leușcani","accusative-definite-nominative-plural":"leușcanii","dative-genitive-indefinite-singular":"leușcan","dative-definite-genitive-singular":"leușcanului","dative-genitive-indefinite-plural":"leușcani","dative-definite-genitive-plural":"leușcanilor","singular-vocative":"leușcanule","plural-vocative":"leușcanilor"}},{"word":"Leușeni","pos":"name","definitions":["a village in Leușeni, Hîncești Raion, Moldova","a village in Leușeni, Telenești Raion, Moldova","a commune of Hîncești Raion, Moldova","a commune of Telenești Raion, Moldova"],"gender":"m"},{"word":"leușor","pos":"noun","definitions":["diminutive of leu; small lion, leu"],"forms":{"plural":"leușori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leușor","accusative-definite-nominative-singular":"leușorul","accusative-indefinite-nominative-plural":"leușori","accusative-definite-nominative-plural":"leușorii","dative-genitive-indefinite-singular":"leușor","dative-definite-genitive-singular":"leușorului","dative-genitive-indefinite-plural":"leușori","dative-definite-genitive-plural":"leușorilor","singular-vocative":"leușorule","plural-vocative":"leușorilor"}},{"word":"Leuștean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Leuștean"}},{"word":"leuștean","pos":"noun","definitions":["lovage"],"pronunciation":"/leuʃˈte̯an/","forms":{"plural":"leușteni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leuștean","accusative-definite-nominative-singular":"leușteanul","accusative-indefinite-nominative-plural":"leușteni","accusative-definite-nominative-plural":"leuștenii","dative-genitive-indefinite-singular":"leuștean","dative-definite-genitive-singular":"leușteanului","dative-genitive-indefinite-plural":"leușteni","dative-definite-genitive-plural":"leuștenilor","singular-vocative":"leușteanule","plural-vocative":"leuștenilor"}},{"word":"Leușteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Leușteanu"}},{"word":"leuț","pos":"noun","definitions":["diminutive of leu; small lion"],"forms":{"plural":"leuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"leuț","accusative-definite-nominative-singular":"leuțul","accusative-indefinite-nominative-plural":"leuți","accusative-definite-nominative-plural":"leuții","dative-genitive-indefinite-singular":"leuț","dative-definite-genitive-singular":"leuțului","dative-genitive-indefinite-plural":"leuți","dative-definite-genitive-plural":"leuților","singular-vocative":"leuțule","plural-vocative":"leuților"}},{"word":"leva","pos":"noun","definitions":["lev (currency of Bulgaria)"],"forms":{"plural":"leve","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"leva","accusative-definite-nominative-singular":"leva","accusative-indefinite-nominative-plural":"leve","accusative-definite-nominative-plural":"levele","dative-genitive-indefinite-singular":"leve","dative-definite-genitive-singular":"levei","dative-genitive-indefinite-plural":"leve","dative-definite-genitive-plural":"levelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"levă","pos":"noun","definitions":["alternative form of leva"],"forms":{"plural":"leve","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"levă","accusative-definite-nominative-singular":"leva","accusative-indefinite-nominative-plural":"leve","accusative-definite-nominative-plural":"levele","dative-genitive-indefinite-singular":"leve","dative-definite-genitive-singular":"levei","dative-genitive-indefinite-plural":"leve","dative-definite-genitive-plural":"levelor","singular-vocative":"levă","plural-vocative":"levelor"}},{"word":"levănțică","pos":"noun","definitions":["lavender (plant)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"levănțică","accusative-definite-nominative":"levănțica","dative-genitive-indefinite":"levănțici","dative-definite-genitive":"levănțicii","vocative":"levănțică"}},{"word":"levantin","pos":"noun","definitions":["Levantine"],"forms":{"plural":"levantini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"levantin","accusative-definite-nominative-singular":"levantinul","accusative-indefinite-nominative-plural":"levantini","accusative-definite-nominative-plural":"levantinii","dative-genitive-indefinite-singular":"levantin","dative-definite-genitive-singular":"levantinului","dative-genitive-indefinite-plural":"levantini","dative-definite-genitive-plural":"levantinilor","singular-vocative":"levantinule","plural-vocative":"levantinilor"}},{"word":"levantină","pos":"noun","definitions":["female equivalent of levantin"],"forms":{"plural":"levantine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"levantină","accusative-definite-nominative-singular":"levantina","accusative-indefinite-nominative-plural":"levantine","accusative-definite-nominative-plural":"levantinele","dative-genitive-indefinite-singular":"levantine","dative-definite-genitive-singular":"levantinei","dative-genitive-indefinite-plural":"levantine","dative-definite-genitive-plural":"levantinelor","singular-vocative":"levantină","plural-vocative":"levantinelor"}},{"word":"Levcencu","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Levcencu"}},{"word":"Leveleș","pos":"name","definitions":["a river in Romania, tributary to the Teuz"],"gender":"m"},{"word":"levent","pos":"adj","definitions":["gallant, well-mannered","capable, in one's prime","fearless"],"pronunciation":"/leˈvent/","examples":[{"ro":"Mĕ rog, odată ce nu e bărbatul levent, ce fel de casă să mai fie ș’aia?","en":"I mean, if the man is not well-mannered, what sort of household even is that?"},{"ro":"Era proaspăt îndrăgostită de tânărul Pascal Delulescu, practicant fără leafă la judecătorie, care pe-atunci era un băiat drăguț, levent și desghețat de se scurgeau ochii fetelor după el.","en":"She was freshly in love with the young Pascal Delulescu, unpaid intern at the courthouse, back then a pretty, gallant and smart boy that the girls were fawning over."},{"ro":"Conducea un redactor de televiziune, bărbat surîzător, cît se poate de pașnic și de levent.","en":"A TV redactor was in charge, a smiling man, as peaceful and gallant as it gets."}],"forms":{"feminine-singular":"leventă","masculine-plural":"levenți","feminine-neuter-plural":"levente","alternative-obsolete":"levint"}},{"word":"levent","pos":"noun","definitions":["levend (soldier of the Ottoman Navy)","Moldovan mercenary in Wallachia","member of a Hungarian nationalistic paramilitary group between 1920 and 1945"],"pronunciation":"/leˈvent/","examples":[{"ro":"[…]să să rădice Măria Sa seraschiarĭ Murtazà-Pașà cu oștile înpărătești, cu 55 de steaguri de serdenghečti, și cu 40 de steaguri de levenț, și cu 30 de steaguri de aghialeturĭ[…]","en":"[…] for His Highness Murtaza Pasha Serasker to come up with the imperial armies, with 55 troops of serdengeçti, and with 40 troops of levends, and with 30 troops of provincial soldiers […]"},{"ro":"Dela mânăstire, bandele de levenți au trecut în Țara Oașului și în Maramureș unde au masacrat toți românii întâlniți.","en":"From the monastery, the bands of levends went over to Oaș Country and Maramureș where they massacred every Romanian they met."}],"forms":{"plural":"levenți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"levent","accusative-definite-nominative-singular":"leventul","accusative-indefinite-nominative-plural":"leventi","accusative-definite-nominative-plural":"leventii","dative-genitive-indefinite-singular":"levent","dative-definite-genitive-singular":"leventului","dative-genitive-indefinite-plural":"leventi","dative-definite-genitive-plural":"leventilor","singular-vocative":"leventule","plural-vocative":"leventilor","alternative-obsolete":"levint"}},{"word":"levențică","pos":"noun","definitions":["alternative form of levănțică"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"levențică","accusative-definite-nominative":"levențica","dative-genitive-indefinite":"levențice","dative-definite-genitive":"levențicei","vocative":"levențică"}},{"word":"leveș","pos":"noun","definitions":["meat soup"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"leveș","accusative-definite-nominative":"leveșul","dative-genitive-indefinite":"leveș","dative-definite-genitive":"leveșului","vocative":"leveșule"}},{"word":"leviatan","pos":"noun","definitions":["leviathan"],"forms":{"plural":"leviatane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"leviatan","accusative-definite-nominative-singular":"leviatanul","accusative-indefinite-nominative-plural":"leviatane","accusative-definite-nominative-plural":"leviatanele","dative-genitive-indefinite-singular":"leviatan","dative-definite-genitive-singular":"leviatanului","dative-genitive-indefinite-plural":"leviatane","dative-definite-genitive-plural":"leviatanelor","singular-vocative":"leviatanule","plural-vocative":"leviatanelor"}},{"word":"levier","pos":"noun","definitions":["lever"],"forms":{"plural":"leviere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"levier","accusative-definite-nominative-singular":"levierul","accusative-indefinite-nominative-plural":"leviere","accusative-definite-nominative-plural":"levierele","dative-genitive-indefinite-singular":"levier","dative-definite-genitive-singular":"levierului","dative-genitive-indefinite-plural":"leviere","dative-definite-genitive-plural":"levierelor","singular-vocative":"levierule","plural-vocative":"levierelor"}},{"word":"leviga","pos":"verb","definitions":["to levigate"],"forms":{"canonical":"a leviga 1st conjugation","present-singular-third-person":"levighează","participle-past":"levigat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a leviga","gerund":"levigând","first-person-indicative-present-singular":"levighez","indicative-present-second-person-singular":"levighezi","indicative-present-singular-third-person":"levighează","first-person-indicative-plural-present":"levigăm","indicative-plural-present-second-person":"levigați","indicative-plural-present-third-person":"levighează","first-person-imperfect-indicative-singular":"levigam","imperfect-indicative-second-person-singular":"levigai","imperfect-indicative-singular-third-person":"leviga","first-person-imperfect-indicative-plural":"levigam","imperfect-indicative-plural-second-person":"levigați","imperfect-indicative-plural-third-person":"levigau","first-person-indicative-perfect-singular":"levigai","indicative-perfect-second-person-singular":"levigași","indicative-perfect-singular-third-person":"levigă","first-person-indicative-perfect-plural":"levigarăm","indicative-perfect-plural-second-person":"levigarăți","indicative-perfect-plural-third-person":"levigară","first-person-indicative-pluperfect-singular":"levigasem","indicative-pluperfect-second-person-singular":"levigaseși","indicative-pluperfect-singular-third-person":"levigase","first-person-indicative-pluperfect-plural":"levigaserăm","indicative-pluperfect-plural-second-person":"levigaserăți","indicative-pluperfect-plural-third-person":"levigaseră","first-person-present-singular-subjunctive":"să levighez","present-second-person-singular-subjunctive":"să levighezi","present-singular-subjunctive-third-person":"să levigheze","first-person-plural-present-subjunctive":"să levigăm","plural-present-second-person-subjunctive":"să levigați","plural-present-subjunctive-third-person":"să levigheze","imperative-second-person-singular":"levighează","imperative-plural-second-person":"levigați","imperative-negative-second-person-singular":"nu leviga","imperative-negative-plural-second-person":"nu levigați"}},{"word":"levigație","pos":"noun","definitions":["levigation"],"forms":{"plural":"levigații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"levigație","accusative-definite-nominative-singular":"levigația","accusative-indefinite-nominative-plural":"levigații","accusative-definite-nominative-plural":"levigațiile","dative-genitive-indefinite-singular":"levigații","dative-definite-genitive-singular":"levigației","dative-genitive-indefinite-plural":"levigații","dative-definite-genitive-plural":"levigațiilor","singular-vocative":"levigație","plural-vocative":"levigațiilor"}},{"word":"levincior","pos":"adj","definitions":["diminutive of levint"],"forms":{"feminine-singular":"levincioră","masculine-plural":"levinciori","feminine-neuter-plural":"levinciore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"levincior","error-unrecognized-form-feminine-indefinite-singular":"levincioră","error-unrecognized-form-indefinite-masculine-plural":"levinciori","error-unrecognized-form-feminine-indefinite-neuter-plural":"levinciore","definite-error-unrecognized-form-masculine-neuter-singular":"levinciorul","definite-error-unrecognized-form-feminine-singular":"levinciora","definite-error-unrecognized-form-masculine-plural":"levinciorii","definite-error-unrecognized-form-feminine-neuter-plural":"levinciorele"}},{"word":"levint","pos":"adj","definitions":["alternative form of levent"],"forms":{"feminine-singular":"levintă","masculine-plural":"levinți","feminine-neuter-plural":"levinte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"levint","error-unrecognized-form-feminine-indefinite-singular":"levintă","error-unrecognized-form-indefinite-masculine-plural":"levinți","error-unrecognized-form-feminine-indefinite-neuter-plural":"levinte","definite-error-unrecognized-form-masculine-neuter-singular":"levintul","definite-error-unrecognized-form-feminine-singular":"levinta","definite-error-unrecognized-form-masculine-plural":"levinții","definite-error-unrecognized-form-feminine-neuter-plural":"levintele"}},{"word":"levințel","pos":"adj","definitions":["diminutive of levint"],"forms":{"feminine-singular":"levințelă","masculine-plural":"levințeli","feminine-neuter-plural":"levințele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"levințel","error-unrecognized-form-feminine-indefinite-singular":"levințelă","error-unrecognized-form-indefinite-masculine-plural":"levințeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"levințele","definite-error-unrecognized-form-masculine-neuter-singular":"levințelul","definite-error-unrecognized-form-feminine-singular":"levințela","definite-error-unrecognized-form-masculine-plural":"levințelii","definite-error-unrecognized-form-feminine-neuter-plural":"levințelele"}},{"word":"levirat","pos":"noun","definitions":["levirate"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"levirat","accusative-definite-nominative":"leviratul","dative-genitive-indefinite":"levirat","dative-definite-genitive":"leviratului","vocative":"leviratule"}},{"word":"levit","pos":"noun","definitions":["Levite (member of the Hebrew tribe Levi)"],"forms":{"plural":"leviți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"levit","accusative-definite-nominative-singular":"levitul","accusative-indefinite-nominative-plural":"leviți","accusative-definite-nominative-plural":"leviții","dative-genitive-indefinite-singular":"levit","dative-definite-genitive-singular":"levitului","dative-genitive-indefinite-plural":"leviți","dative-definite-genitive-plural":"leviților","singular-vocative":"levitule","plural-vocative":"leviților"}},{"word":"levitate","pos":"noun","definitions":["ease"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"levitate","accusative-definite-nominative":"levitatea","dative-genitive-indefinite":"levități","dative-definite-genitive":"levității","vocative":"-"}},{"word":"levitație","pos":"noun","definitions":["levitation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"levitație","accusative-definite-nominative-singular":"levitația","accusative-indefinite-nominative-plural":"levitații","accusative-definite-nominative-plural":"levitațiile","dative-genitive-indefinite-singular":"levitații","dative-definite-genitive-singular":"levitației","dative-genitive-indefinite-plural":"levitații","dative-definite-genitive-plural":"levitațiilor","singular-vocative":"levitație","plural-vocative":"levitațiilor"}},{"word":"levitațiune","pos":"noun","definitions":["alternative form of levitație"],"forms":{"plural":"levitațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"levitațiune","accusative-definite-nominative-singular":"levitațiunea","accusative-indefinite-nominative-plural":"levitațiuni","accusative-definite-nominative-plural":"levitațiunile","dative-genitive-indefinite-singular":"levitațiuni","dative-definite-genitive-singular":"levitațiunii","dative-genitive-indefinite-plural":"levitațiuni","dative-definite-genitive-plural":"levitațiunilor","singular-vocative":"levitațiune","plural-vocative":"levitațiunilor"}},{"word":"leviticesc","pos":"adj","definitions":["Levitic"],"forms":{"feminine-singular":"leviticească","plural":"leviticești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"leviticesc","error-unrecognized-form-feminine-indefinite-singular":"leviticească","error-unrecognized-form-indefinite-masculine-plural":"leviticești","error-unrecognized-form-feminine-indefinite-neuter-plural":"leviticești","definite-error-unrecognized-form-masculine-neuter-singular":"leviticescul","definite-error-unrecognized-form-feminine-singular":"leviticeasca","definite-error-unrecognized-form-masculine-plural":"leviticeștii","definite-error-unrecognized-form-feminine-neuter-plural":"leviticeștile"}},{"word":"levizită","pos":"noun","definitions":["lewisite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"levizită","accusative-definite-nominative":"levizita","dative-genitive-indefinite":"e","dative-definite-genitive":"ei","vocative":"levizită"}},{"word":"levocardie","pos":"noun","definitions":["laevocardia"],"forms":{"plural":"levocardii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"levocardie","accusative-definite-nominative-singular":"levocardia","accusative-indefinite-nominative-plural":"levocardii","accusative-definite-nominative-plural":"levocardiile","dative-genitive-indefinite-singular":"levocardii","dative-definite-genitive-singular":"levocardiei","dative-genitive-indefinite-plural":"levocardii","dative-definite-genitive-plural":"levocardiilor","singular-vocative":"levocardie","plural-vocative":"levocardiilor"}},{"word":"levocardiogramă","pos":"noun","definitions":["laevocardiogram"],"forms":{"plural":"levocardiograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"levocardiogramă","accusative-definite-nominative-singular":"levocardiograma","accusative-indefinite-nominative-plural":"levocardiograme","accusative-definite-nominative-plural":"levocardiogramele","dative-genitive-indefinite-singular":"levocardiograme","dative-definite-genitive-singular":"levocardiogramei","dative-genitive-indefinite-plural":"levocardiograme","dative-definite-genitive-plural":"levocardiogramelor","singular-vocative":"levocardiogramă","plural-vocative":"levocardiogramelor"}},{"word":"levogir","pos":"adj","definitions":["levogyre"],"forms":{"feminine-singular":"levogiră","masculine-plural":"levogiri","feminine-neuter-plural":"levogire","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"levogir","error-unrecognized-form-feminine-indefinite-singular":"levogiră","error-unrecognized-form-indefinite-masculine-plural":"levogiri","error-unrecognized-form-feminine-indefinite-neuter-plural":"levogire","definite-error-unrecognized-form-masculine-neuter-singular":"levogirul","definite-error-unrecognized-form-feminine-singular":"levogira","definite-error-unrecognized-form-masculine-plural":"levogirii","definite-error-unrecognized-form-feminine-neuter-plural":"levogirele"}},{"word":"levorotație","pos":"noun","definitions":["levorotation"],"forms":{"plural":"levorotații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"levorotație","accusative-definite-nominative-singular":"levorotația","accusative-indefinite-nominative-plural":"levorotații","accusative-definite-nominative-plural":"levorotațiile","dative-genitive-indefinite-singular":"levorotații","dative-definite-genitive-singular":"levorotației","dative-genitive-indefinite-plural":"levorotații","dative-definite-genitive-plural":"levorotațiilor","singular-vocative":"levorotație","plural-vocative":"levorotațiilor"}},{"word":"levretă","pos":"noun","definitions":["female greyhound"],"pronunciation":"/leˈvre.tə/","forms":{"plural":"levrete","masculine":"equivalent levrier","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"levretă","accusative-definite-nominative-singular":"levreta","accusative-indefinite-nominative-plural":"levrete","accusative-definite-nominative-plural":"levretele","dative-genitive-indefinite-singular":"levrete","dative-definite-genitive-singular":"levretei","dative-genitive-indefinite-plural":"levrete","dative-definite-genitive-plural":"levretelor","singular-vocative":"levretă","plural-vocative":"levretelor","alternative":"левретэ"}},{"word":"levrier","pos":"noun","definitions":["greyhound"],"pronunciation":"/le.vriˈer/","forms":{"plural":"levrieri","feminine":"equivalent levretă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"levrier","accusative-definite-nominative-singular":"levrierul","accusative-indefinite-nominative-plural":"levrieri","accusative-definite-nominative-plural":"levrierii","dative-genitive-indefinite-singular":"levrier","dative-definite-genitive-singular":"levrierului","dative-genitive-indefinite-plural":"levrieri","dative-definite-genitive-plural":"levrierilor","singular-vocative":"levrierule","plural-vocative":"levrierilor","alternative":"левриер"}},{"word":"levuloză","pos":"noun","definitions":["levulose"],"forms":{"plural":"levuloze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"levuloză","accusative-definite-nominative-singular":"levuloza","accusative-indefinite-nominative-plural":"levuloze","accusative-definite-nominative-plural":"levulozele","dative-genitive-indefinite-singular":"levuloze","dative-definite-genitive-singular":"levulozei","dative-genitive-indefinite-plural":"levuloze","dative-definite-genitive-plural":"levulozelor","singular-vocative":"levuloză","plural-vocative":"levulozelor"}},{"word":"levură","pos":"noun","definitions":["yeast"],"forms":{"plural":"levuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"levură","accusative-definite-nominative-singular":"levura","accusative-indefinite-nominative-plural":"levuri","accusative-definite-nominative-plural":"levurile","dative-genitive-indefinite-singular":"levuri","dative-definite-genitive-singular":"levurii","dative-genitive-indefinite-plural":"levuri","dative-definite-genitive-plural":"levurilor","singular-vocative":"levură","plural-vocative":"levurilor"}},{"word":"lexem","pos":"noun","definitions":["lexeme"],"pronunciation":"[lekˈsem]","forms":{"plural":"lexeme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lexem","accusative-definite-nominative-singular":"lexemul","accusative-indefinite-nominative-plural":"lexeme","accusative-definite-nominative-plural":"lexemele","dative-genitive-indefinite-singular":"lexem","dative-definite-genitive-singular":"lexemului","dative-genitive-indefinite-plural":"lexeme","dative-definite-genitive-plural":"lexemelor","singular-vocative":"lexemule","plural-vocative":"lexemelor"}},{"word":"lexematic","pos":"adj","definitions":["lexemic"],"forms":{"feminine-singular":"lexematică","masculine-plural":"lexematici","feminine-neuter-plural":"lexematice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lexematic","error-unrecognized-form-feminine-indefinite-singular":"lexematică","error-unrecognized-form-indefinite-masculine-plural":"lexematici","error-unrecognized-form-feminine-indefinite-neuter-plural":"lexematice","definite-error-unrecognized-form-masculine-neuter-singular":"lexematicul","definite-error-unrecognized-form-feminine-singular":"lexematica","definite-error-unrecognized-form-masculine-plural":"lexematicii","definite-error-unrecognized-form-feminine-neuter-plural":"lexematicele"}},{"word":"lexeme","pos":"noun","definitions":["plural of lexem"],"gender":"n-p"},{"word":"lexic","pos":"noun","definitions":["vocabulary"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lexic","accusative-definite-nominative":"lexicul","dative-genitive-indefinite":"lexic","dative-definite-genitive":"lexicului","vocative":"lexicule"}},{"word":"lexical","pos":"adj","definitions":["lexical"],"pronunciation":"/lek.siˈkal/","forms":{"feminine-singular":"lexicală","masculine-plural":"lexicali","feminine-neuter-plural":"lexicale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lexical","error-unrecognized-form-feminine-indefinite-singular":"lexicală","error-unrecognized-form-indefinite-masculine-plural":"lexicali","error-unrecognized-form-feminine-indefinite-neuter-plural":"lexicale","definite-error-unrecognized-form-masculine-neuter-singular":"lexicalul","definite-error-unrecognized-form-feminine-singular":"lexicala","definite-error-unrecognized-form-masculine-plural":"lexicalii","definite-error-unrecognized-form-feminine-neuter-plural":"lexicalele"}},{"word":"lexicaliza","pos":"verb","definitions":["to lexicalize"],"pronunciation":"/lek.si.ka.liˈza/","forms":{"canonical":"a lexicaliza 1st conjugation","present-singular-third-person":"lexicalizează","participle-past":"lexicalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a lexicaliza","gerund":"lexicalizând","first-person-indicative-present-singular":"lexicalizez","indicative-present-second-person-singular":"lexicalizezi","indicative-present-singular-third-person":"lexicalizează","first-person-indicative-plural-present":"lexicalizăm","indicative-plural-present-second-person":"lexicalizați","indicative-plural-present-third-person":"lexicalizează","first-person-imperfect-indicative-singular":"lexicalizam","imperfect-indicative-second-person-singular":"lexicalizai","imperfect-indicative-singular-third-person":"lexicaliza","first-person-imperfect-indicative-plural":"lexicalizam","imperfect-indicative-plural-second-person":"lexicalizați","imperfect-indicative-plural-third-person":"lexicalizau","first-person-indicative-perfect-singular":"lexicalizai","indicative-perfect-second-person-singular":"lexicalizași","indicative-perfect-singular-third-person":"lexicaliză","first-person-indicative-perfect-plural":"lexicalizarăm","indicative-perfect-plural-second-person":"lexicalizarăți","indicative-perfect-plural-third-person":"lexicalizară","first-person-indicative-pluperfect-singular":"lexicalizasem","indicative-pluperfect-second-person-singular":"lexicalizaseși","indicative-pluperfect-singular-third-person":"lexicalizase","first-person-indicative-pluperfect-plural":"lexicalizaserăm","indicative-pluperfect-plural-second-person":"lexicalizaserăți","indicative-pluperfect-plural-third-person":"lexicalizaseră","first-person-present-singular-subjunctive":"să lexicalizez","present-second-person-singular-subjunctive":"să lexicalizezi","present-singular-subjunctive-third-person":"să lexicalizeze","first-person-plural-present-subjunctive":"să lexicalizăm","plural-present-second-person-subjunctive":"să lexicalizați","plural-present-subjunctive-third-person":"să lexicalizeze","imperative-second-person-singular":"lexicalizează","imperative-plural-second-person":"lexicalizați","imperative-negative-second-person-singular":"nu lexicaliza","imperative-negative-plural-second-person":"nu lexicalizați"}},{"word":"lexicalizare","pos":"noun","definitions":["lexicalization"],"forms":{"plural":"lexicalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lexicalizare","accusative-definite-nominative-singular":"lexicalizarea","accusative-indefinite-nominative-plural":"lexicalizări","accusative-definite-nominative-plural":"lexicalizările","dative-genitive-indefinite-singular":"lexicalizări","dative-definite-genitive-singular":"lexicalizării","dative-genitive-indefinite-plural":"lexicalizări","dative-definite-genitive-plural":"lexicalizărilor","singular-vocative":"lexicalizare","plural-vocative":"lexicalizărilor"}},{"word":"lexicalizat","pos":"adj","definitions":["lexicalised"],"forms":{"feminine-singular":"lexicalizată","masculine-plural":"lexicalizați","feminine-neuter-plural":"lexicalizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lexicalizat","error-unrecognized-form-feminine-indefinite-singular":"lexicalizată","error-unrecognized-form-indefinite-masculine-plural":"lexicalizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"lexicalizate","definite-error-unrecognized-form-masculine-neuter-singular":"lexicalizatul","definite-error-unrecognized-form-feminine-singular":"lexicalizata","definite-error-unrecognized-form-masculine-plural":"lexicalizații","definite-error-unrecognized-form-feminine-neuter-plural":"lexicalizatele"}},{"word":"lexico-","pos":"prefix","definitions":["lexico-"]},{"word":"lexicograf","pos":"noun","definitions":["lexicographer"],"pronunciation":"/lek.si.koˈɡraf/","forms":{"plural":"lexicografi","feminine":"equivalent lexicografă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lexicograf","accusative-definite-nominative-singular":"lexicograful","accusative-indefinite-nominative-plural":"lexicografi","accusative-definite-nominative-plural":"lexicografii","dative-genitive-indefinite-singular":"lexicograf","dative-definite-genitive-singular":"lexicografului","dative-genitive-indefinite-plural":"lexicografi","dative-definite-genitive-plural":"lexicografilor","singular-vocative":"lexicografule","plural-vocative":"lexicografilor"}},{"word":"lexicografă","pos":"noun","definitions":["female equivalent of lexicograf"],"pronunciation":"/lek.si.koˈɡra.fə/","forms":{"plural":"lexicografe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"lexicografă","accusative-definite-nominative-singular":"lexicografa","accusative-indefinite-nominative-plural":"lexicografe","accusative-definite-nominative-plural":"lexicografele","dative-genitive-indefinite-singular":"lexicografe","dative-definite-genitive-singular":"lexicografei","dative-genitive-indefinite-plural":"lexicografe","dative-definite-genitive-plural":"lexicografelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"lexicografe","pos":"noun","definitions":["plural of lexicografă"],"gender":"f"},{"word":"lexicografi","pos":"noun","definitions":["plural of lexicograf"],"gender":"m"},{"word":"lexicografic","pos":"adj","definitions":["lexicographical"],"forms":{"feminine-singular":"lexicografică","masculine-plural":"lexicografici","feminine-neuter-plural":"lexicografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lexicografic","error-unrecognized-form-feminine-indefinite-singular":"lexicografică","error-unrecognized-form-indefinite-masculine-plural":"lexicografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"lexicografice","definite-error-unrecognized-form-masculine-neuter-singular":"lexicograficul","definite-error-unrecognized-form-feminine-singular":"lexicografica","definite-error-unrecognized-form-masculine-plural":"lexicograficii","definite-error-unrecognized-form-feminine-neuter-plural":"lexicograficele"}},{"word":"lexicograficesc","pos":"adj","definitions":["lexicographical"],"forms":{"feminine-singular":"lexicograficească","plural":"lexicograficești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lexicograficesc","error-unrecognized-form-feminine-indefinite-singular":"lexicograficească","error-unrecognized-form-indefinite-masculine-plural":"lexicograficești","error-unrecognized-form-feminine-indefinite-neuter-plural":"lexicograficești","definite-error-unrecognized-form-masculine-neuter-singular":"lexicograficescul","definite-error-unrecognized-form-feminine-singular":"lexicograficeasca","definite-error-unrecognized-form-masculine-plural":"lexicograficeștii","definite-error-unrecognized-form-feminine-neuter-plural":"lexicograficeștile"}},{"word":"lexicograficește","pos":"adv","definitions":["lexicographically"]},{"word":"lexicografie","pos":"noun","definitions":["lexicography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"lexicografie","accusative-definite-nominative":"lexicografia","dative-genitive-indefinite":"lexicografii","dative-definite-genitive":"lexicografiei","vocative":"lexicografie"}},{"word":"lexicolog","pos":"noun","definitions":["lexicologist"],"forms":{"plural":"lexicologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lexicolog","accusative-definite-nominative-singular":"lexicologul","accusative-indefinite-nominative-plural":"lexicologi","accusative-definite-nominative-plural":"lexicologii","dative-genitive-indefinite-singular":"lexicolog","dative-definite-genitive-singular":"lexicologului","dative-genitive-indefinite-plural":"lexicologi","dative-definite-genitive-plural":"lexicologilor","singular-vocative":"lexicologule","plural-vocative":"lexicologilor"}},{"word":"lexicologă","pos":"noun","definitions":["female equivalent of lexicolog"],"forms":{"plural":"lexicologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lexicologă","accusative-definite-nominative-singular":"lexicologa","accusative-indefinite-nominative-plural":"lexicologe","accusative-definite-nominative-plural":"lexicologele","dative-genitive-indefinite-singular":"lexicologe","dative-definite-genitive-singular":"lexicologei","dative-genitive-indefinite-plural":"lexicologe","dative-definite-genitive-plural":"lexicologelor","singular-vocative":"lexicologă","plural-vocative":"lexicologelor"}},{"word":"lexicologic","pos":"adj","definitions":["lexicological"],"forms":{"feminine-singular":"lexicologică","masculine-plural":"lexicologici","feminine-neuter-plural":"lexicologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lexicologic","error-unrecognized-form-feminine-indefinite-singular":"lexicologică","error-unrecognized-form-indefinite-masculine-plural":"lexicologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"lexicologice","definite-error-unrecognized-form-masculine-neuter-singular":"lexicologicul","definite-error-unrecognized-form-feminine-singular":"lexicologica","definite-error-unrecognized-form-masculine-plural":"lexicologicii","definite-error-unrecognized-form-feminine-neuter-plural":"lexicologicele"}},{"word":"lexicologicesc","pos":"adj","definitions":["lexicological"],"forms":{"feminine-singular":"lexicologicească","plural":"lexicologicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lexicologicesc","error-unrecognized-form-feminine-indefinite-singular":"lexicologicească","error-unrecognized-form-indefinite-masculine-plural":"lexicologicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"lexicologicești","definite-error-unrecognized-form-masculine-neuter-singular":"lexicologicescul","definite-error-unrecognized-form-feminine-singular":"lexicologiceasca","definite-error-unrecognized-form-masculine-plural":"lexicologiceștii","definite-error-unrecognized-form-feminine-neuter-plural":"lexicologiceștile"}},{"word":"lexicologicește","pos":"adv","definitions":["lexicologically"]},{"word":"lexicologie","pos":"noun","definitions":["lexicology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"lexicologie","accusative-definite-nominative":"lexicologia","dative-genitive-indefinite":"lexicologii","dative-definite-genitive":"lexicologiei","vocative":"lexicologie"}},{"word":"lexicon","pos":"noun","definitions":["lexicon"],"forms":{"plural":"lexicoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lexicon","accusative-definite-nominative-singular":"lexiconul","accusative-indefinite-nominative-plural":"lexicoane","accusative-definite-nominative-plural":"lexicoanele","dative-genitive-indefinite-singular":"lexicon","dative-definite-genitive-singular":"lexiconului","dative-genitive-indefinite-plural":"lexicoane","dative-definite-genitive-plural":"lexicoanelor","singular-vocative":"lexiconule","plural-vocative":"lexicoanelor"}},{"word":"lexicotecă","pos":"noun","definitions":["lexicon"],"forms":{"plural":"lexicoteci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lexicotecă","accusative-definite-nominative-singular":"lexicoteca","accusative-indefinite-nominative-plural":"lexicoteci","accusative-definite-nominative-plural":"lexicotecile","dative-genitive-indefinite-singular":"lexicoteci","dative-definite-genitive-singular":"lexicotecii","dative-genitive-indefinite-plural":"lexicoteci","dative-definite-genitive-plural":"lexicotecilor","singular-vocative":"lexicotecă","plural-vocative":"lexicotecilor"}},{"word":"lexie","pos":"noun","definitions":["lexie"],"forms":{"plural":"lexii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lexie","accusative-definite-nominative-singular":"lexia","accusative-indefinite-nominative-plural":"lexii","accusative-definite-nominative-plural":"lexiile","dative-genitive-indefinite-singular":"lexii","dative-definite-genitive-singular":"lexiei","dative-genitive-indefinite-plural":"lexii","dative-definite-genitive-plural":"lexiilor","singular-vocative":"lexie","plural-vocative":"lexiilor"}},{"word":"lexigrafic","pos":"adj","definitions":["lexigraphic"],"forms":{"feminine-singular":"lexigrafică","masculine-plural":"lexigrafici","feminine-neuter-plural":"lexigrafice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lexigrafic","error-unrecognized-form-feminine-indefinite-singular":"lexigrafică","error-unrecognized-form-indefinite-masculine-plural":"lexigrafici","error-unrecognized-form-feminine-indefinite-neuter-plural":"lexigrafice","definite-error-unrecognized-form-masculine-neuter-singular":"lexigraficul","definite-error-unrecognized-form-feminine-singular":"lexigrafica","definite-error-unrecognized-form-masculine-plural":"lexigraficii","definite-error-unrecognized-form-feminine-neuter-plural":"lexigraficele"}},{"word":"lexigrafie","pos":"noun","definitions":["lexigraphy"],"forms":{"plural":"lexigrafii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lexigrafie","accusative-definite-nominative-singular":"lexigrafia","accusative-indefinite-nominative-plural":"lexigrafii","accusative-definite-nominative-plural":"lexigrafiile","dative-genitive-indefinite-singular":"lexigrafii","dative-definite-genitive-singular":"lexigrafiei","dative-genitive-indefinite-plural":"lexigrafii","dative-definite-genitive-plural":"lexigrafiilor","singular-vocative":"lexigrafie","plural-vocative":"lexigrafiilor"}},{"word":"lexiologie","pos":"noun","definitions":["lexicology"],"forms":{"plural":"lexiologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lexiologie","accusative-definite-nominative-singular":"lexiologia","accusative-indefinite-nominative-plural":"lexiologii","accusative-definite-nominative-plural":"lexiologiile","dative-genitive-indefinite-singular":"lexiologii","dative-definite-genitive-singular":"lexiologiei","dative-genitive-indefinite-plural":"lexiologii","dative-definite-genitive-plural":"lexiologiilor","singular-vocative":"lexiologie","plural-vocative":"lexiologiilor"}},{"word":"lexis","pos":"noun","definitions":["word"],"forms":{"plural":"lexise","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lexis","accusative-definite-nominative-singular":"lexisul","accusative-indefinite-nominative-plural":"lexise","accusative-definite-nominative-plural":"lexisele","dative-genitive-indefinite-singular":"lexis","dative-definite-genitive-singular":"lexisului","dative-genitive-indefinite-plural":"lexise","dative-definite-genitive-plural":"lexiselor","singular-vocative":"lexisule","plural-vocative":"lexiselor"}},{"word":"leza","pos":"verb","definitions":["to hurt","to offend"],"forms":{"canonical":"a leza 1st conjugation","present-singular-third-person":"lezează","participle-past":"lezat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a leza","gerund":"lezând","first-person-indicative-present-singular":"lezez","indicative-present-second-person-singular":"lezezi","indicative-present-singular-third-person":"lezează","first-person-indicative-plural-present":"lezăm","indicative-plural-present-second-person":"lezați","indicative-plural-present-third-person":"lezează","first-person-imperfect-indicative-singular":"lezam","imperfect-indicative-second-person-singular":"lezai","imperfect-indicative-singular-third-person":"leza","first-person-imperfect-indicative-plural":"lezam","imperfect-indicative-plural-second-person":"lezați","imperfect-indicative-plural-third-person":"lezau","first-person-indicative-perfect-singular":"lezai","indicative-perfect-second-person-singular":"lezași","indicative-perfect-singular-third-person":"leză","first-person-indicative-perfect-plural":"lezarăm","indicative-perfect-plural-second-person":"lezarăți","indicative-perfect-plural-third-person":"lezară","first-person-indicative-pluperfect-singular":"lezasem","indicative-pluperfect-second-person-singular":"lezaseși","indicative-pluperfect-singular-third-person":"lezase","first-person-indicative-pluperfect-plural":"lezaserăm","indicative-pluperfect-plural-second-person":"lezaserăți","indicative-pluperfect-plural-third-person":"lezaseră","first-person-present-singular-subjunctive":"să lezez","present-second-person-singular-subjunctive":"să lezezi","present-singular-subjunctive-third-person":"să lezeze","first-person-plural-present-subjunctive":"să lezăm","plural-present-second-person-subjunctive":"să lezați","plural-present-subjunctive-third-person":"să lezeze","imperative-second-person-singular":"lezează","imperative-plural-second-person":"lezați","imperative-negative-second-person-singular":"nu leza","imperative-negative-plural-second-person":"nu lezați"}},{"word":"lezard","pos":"noun","definitions":["lizard","lizard tanned leather"],"pronunciation":"/leˈzard/","forms":{"plural":"lezardi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lezard","accusative-definite-nominative-singular":"lezardul","accusative-indefinite-nominative-plural":"lezardi","accusative-definite-nominative-plural":"lezardii","dative-genitive-indefinite-singular":"lezard","dative-definite-genitive-singular":"lezardului","dative-genitive-indefinite-plural":"lezardi","dative-definite-genitive-plural":"lezardilor","singular-vocative":"lezardule","plural-vocative":"lezardilor","accusative-indefinite-nominative":"lezard","accusative-definite-nominative":"lezardul","dative-genitive-indefinite":"lezard","dative-definite-genitive":"lezardului","vocative":"lezardule"}},{"word":"lezardă","pos":"noun","definitions":["ribbon"],"pronunciation":"/leˈzar.də/","forms":{"plural":"lezarde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lezardă","accusative-definite-nominative-singular":"lezarda","accusative-indefinite-nominative-plural":"lezarde","accusative-definite-nominative-plural":"lezardele","dative-genitive-indefinite-singular":"lezarde","dative-definite-genitive-singular":"lezardei","dative-genitive-indefinite-plural":"lezarde","dative-definite-genitive-plural":"lezardelor","singular-vocative":"lezardă","plural-vocative":"lezardelor"}},{"word":"lezare","pos":"noun","definitions":["injury"],"forms":{"plural":"lezări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lezare","accusative-definite-nominative-singular":"lezarea","accusative-indefinite-nominative-plural":"lezări","accusative-definite-nominative-plural":"lezările","dative-genitive-indefinite-singular":"lezări","dative-definite-genitive-singular":"lezării","dative-genitive-indefinite-plural":"lezări","dative-definite-genitive-plural":"lezărilor","singular-vocative":"lezare","plural-vocative":"lezărilor"}},{"word":"lezional","pos":"adj","definitions":["lesional"],"forms":{"feminine-singular":"lezională","masculine-plural":"lezionali","feminine-neuter-plural":"lezionale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lezional","error-unrecognized-form-feminine-indefinite-singular":"lezională","error-unrecognized-form-indefinite-masculine-plural":"lezionali","error-unrecognized-form-feminine-indefinite-neuter-plural":"lezionale","definite-error-unrecognized-form-masculine-neuter-singular":"lezionalul","definite-error-unrecognized-form-feminine-singular":"lezionala","definite-error-unrecognized-form-masculine-plural":"lezionalii","definite-error-unrecognized-form-feminine-neuter-plural":"lezionalele"}},{"word":"lezionar","pos":"adj","definitions":["lesional"],"forms":{"feminine-singular":"lezionară","masculine-plural":"lezionari","feminine-neuter-plural":"lezionare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lezionar","error-unrecognized-form-feminine-indefinite-singular":"lezionară","error-unrecognized-form-indefinite-masculine-plural":"lezionari","error-unrecognized-form-feminine-indefinite-neuter-plural":"lezionare","definite-error-unrecognized-form-masculine-neuter-singular":"lezionarul","definite-error-unrecognized-form-feminine-singular":"lezionara","definite-error-unrecognized-form-masculine-plural":"lezionarii","definite-error-unrecognized-form-feminine-neuter-plural":"lezionarele"}},{"word":"leziune","pos":"noun","definitions":["lesion, wound, injury"],"forms":{"plural":"leziuni"}},{"word":"lezmaiestate","pos":"noun","definitions":["lese-majesty"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"lezmaiestate","accusative-definite-nominative":"lezmaiestatea","dative-genitive-indefinite":"lezmaiestăți","dative-definite-genitive":"lezmaiestății","vocative":"-"}},{"word":"lezmajestate","pos":"noun","definitions":["alternative form of lezmaiestate"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"lezmajestate","accusative-definite-nominative":"lezmajestatea","dative-genitive-indefinite":"lezmajestăți","dative-definite-genitive":"lezmajestății","vocative":"-"}},{"word":"lezne","pos":"adv","definitions":["obsolete form of lesne"]},{"word":"lherzolit","pos":"noun","definitions":["lherzolite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lherzolit","accusative-definite-nominative":"lherzolitul","dative-genitive-indefinite":"lherzolit","dative-definite-genitive":"lherzolitului","vocative":"lherzolitule"}},{"word":"li","pos":"pron","definitions":["to them"]},{"word":"li-i","pos":"contraction","definitions":["contraction of li + îi"],"pronunciation":"/lij/"},{"word":"li-l","pos":"contraction","definitions":["contraction of le + îl"],"pronunciation":"[lil]","examples":[{"ro":"Trebuie să li-l dai în curând.","en":"You need to give it to them soon."}]},{"word":"Lia","pos":"name","definitions":["a female given name"],"gender":"f"},{"word":"lia","pos":"intj","definitions":["obsolete form of li"]},{"word":"Liahu","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Liahu"}},{"word":"liaj","pos":"noun","definitions":["binding"],"forms":{"plural":"liaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"liaj","accusative-definite-nominative-singular":"liajul","accusative-indefinite-nominative-plural":"liaje","accusative-definite-nominative-plural":"liajele","dative-genitive-indefinite-singular":"liaj","dative-definite-genitive-singular":"liajului","dative-genitive-indefinite-plural":"liaje","dative-definite-genitive-plural":"liajelor","singular-vocative":"liajule","plural-vocative":"liajelor"}},{"word":"liană","pos":"noun","definitions":["liana"],"forms":{"plural":"liane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"liană","accusative-definite-nominative-singular":"liana","accusative-indefinite-nominative-plural":"liane","accusative-definite-nominative-plural":"lianele","dative-genitive-indefinite-singular":"liane","dative-definite-genitive-singular":"lianei","dative-genitive-indefinite-plural":"liane","dative-definite-genitive-plural":"lianelor","singular-vocative":"liană","plural-vocative":"lianelor"}},{"word":"liant","pos":"noun","definitions":["binder (substance)"],"forms":{"plural":"lianți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"liant","accusative-definite-nominative-singular":"liantul","accusative-indefinite-nominative-plural":"lianți","accusative-definite-nominative-plural":"lianții","dative-genitive-indefinite-singular":"liant","dative-definite-genitive-singular":"liantului","dative-genitive-indefinite-plural":"lianți","dative-definite-genitive-plural":"lianților","singular-vocative":"liantule","plural-vocative":"lianților"}},{"word":"liapă","pos":"noun","definitions":["mouth"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"liapă","accusative-definite-nominative":"liapa","dative-genitive-indefinite":"liape","dative-definite-genitive":"liapei","vocative":"liapă"}},{"word":"liasic","pos":"adj","definitions":["liassic"],"forms":{"feminine-singular":"liasică","masculine-plural":"liasici","feminine-neuter-plural":"liasice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liasic","error-unrecognized-form-feminine-indefinite-singular":"liasică","error-unrecognized-form-indefinite-masculine-plural":"liasici","error-unrecognized-form-feminine-indefinite-neuter-plural":"liasice","definite-error-unrecognized-form-masculine-neuter-singular":"liasicul","definite-error-unrecognized-form-feminine-singular":"liasica","definite-error-unrecognized-form-masculine-plural":"liasicii","definite-error-unrecognized-form-feminine-neuter-plural":"liasicele"}},{"word":"liasic","pos":"noun","definitions":["liassic"],"forms":{"plural":"liasici","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"liasic","accusative-definite-nominative-singular":"liasicul","accusative-indefinite-nominative-plural":"liasici","accusative-definite-nominative-plural":"liasicile","dative-genitive-indefinite-singular":"liasic","dative-definite-genitive-singular":"liasicului","dative-genitive-indefinite-plural":"liasici","dative-definite-genitive-plural":"liasicilor","singular-vocative":"liasicule","plural-vocative":"liasicilor"}},{"word":"libadea","pos":"noun","definitions":["a long men's coat"],"forms":{"plural":"libadele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"libadea","accusative-definite-nominative-singular":"libadeaua","accusative-indefinite-nominative-plural":"libadele","accusative-definite-nominative-plural":"libadelele","dative-genitive-indefinite-singular":"libadele","dative-definite-genitive-singular":"libadelei","dative-genitive-indefinite-plural":"libadele","dative-definite-genitive-plural":"libadelelor","singular-vocative":"libadea","plural-vocative":"libadelelor"}},{"word":"Liban","pos":"name","definitions":["Lebanon (a country in West Asia in the Middle East)"],"gender":"n"},{"word":"libanez","pos":"adj","definitions":["Lebanese"],"forms":{"feminine-singular":"libaneză","masculine-plural":"libanezi","feminine-neuter-plural":"libaneze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"libanez","error-unrecognized-form-feminine-indefinite-singular":"libaneză","error-unrecognized-form-indefinite-masculine-plural":"libanezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"libaneze","definite-error-unrecognized-form-masculine-neuter-singular":"libanezul","definite-error-unrecognized-form-feminine-singular":"libaneza","definite-error-unrecognized-form-masculine-plural":"libanezii","definite-error-unrecognized-form-feminine-neuter-plural":"libanezele"}},{"word":"libaneză","pos":"noun","definitions":["female equivalent of libanez"],"forms":{"plural":"libaneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"libaneză","accusative-definite-nominative-singular":"libaneza","accusative-indefinite-nominative-plural":"libaneze","accusative-definite-nominative-plural":"libanezele","dative-genitive-indefinite-singular":"libaneze","dative-definite-genitive-singular":"libanezei","dative-genitive-indefinite-plural":"libaneze","dative-definite-genitive-plural":"libanezelor","singular-vocative":"libaneză","plural-vocative":"libanezelor"}},{"word":"libăr","pos":"adj","definitions":["purple, violet"],"forms":{"feminine-singular":"libără","masculine-plural":"libări","feminine-neuter-plural":"libăre","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"libăr","error-unrecognized-form-feminine-indefinite-singular":"libără","error-unrecognized-form-indefinite-masculine-plural":"libări","error-unrecognized-form-feminine-indefinite-neuter-plural":"libăre","definite-error-unrecognized-form-masculine-neuter-singular":"libărul","definite-error-unrecognized-form-feminine-singular":"libăra","definite-error-unrecognized-form-masculine-plural":"libării","definite-error-unrecognized-form-feminine-neuter-plural":"libărele"}},{"word":"libarcă","pos":"noun","definitions":["cockroach","black beetle (oriental cockroach)"],"forms":{"plural":"libărci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"libarcă","accusative-definite-nominative-singular":"libarca","accusative-indefinite-nominative-plural":"libărci","accusative-definite-nominative-plural":"libărcile","dative-genitive-indefinite-singular":"libărci","dative-definite-genitive-singular":"libărcii","dative-genitive-indefinite-plural":"libărci","dative-definite-genitive-plural":"libărcilor","singular-vocative":"libarcă","plural-vocative":"libărcilor"}},{"word":"libare","pos":"noun","definitions":["libation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"libare","accusative-definite-nominative":"libarea","dative-genitive-indefinite":"libări","dative-definite-genitive":"libării","vocative":"libare"}},{"word":"libăriță","pos":"noun","definitions":["currant (fruit)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"libăriță","accusative-definite-nominative":"libărița","dative-genitive-indefinite":"libărițe","dative-definite-genitive":"libăriței","vocative":"libăriță"}},{"word":"libăruș","pos":"noun","definitions":["booklet on which the paid taxes were written"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"libăruș","accusative-definite-nominative":"libărușul","dative-genitive-indefinite":"libăruș","dative-definite-genitive":"libărușului","vocative":"libărușule"}},{"word":"libație","pos":"noun","definitions":["libation"],"forms":{"plural":"libații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"libație","accusative-definite-nominative-singular":"libația","accusative-indefinite-nominative-plural":"libații","accusative-definite-nominative-plural":"libațiile","dative-genitive-indefinite-singular":"libații","dative-definite-genitive-singular":"libației","dative-genitive-indefinite-plural":"libații","dative-definite-genitive-plural":"libațiilor","singular-vocative":"libație","plural-vocative":"libațiilor"}},{"word":"libațiune","pos":"noun","definitions":["alternative form of libație"],"forms":{"plural":"libațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"libațiune","accusative-definite-nominative-singular":"libațiunea","accusative-indefinite-nominative-plural":"libațiuni","accusative-definite-nominative-plural":"libațiunile","dative-genitive-indefinite-singular":"libațiuni","dative-definite-genitive-singular":"libațiunii","dative-genitive-indefinite-plural":"libațiuni","dative-definite-genitive-plural":"libațiunilor","singular-vocative":"libațiune","plural-vocative":"libațiunilor"}},{"word":"libatoriu","pos":"noun","definitions":["libation vessel"],"forms":{"plural":"libatorii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"libatoriu","accusative-definite-nominative-singular":"libatoriuul","accusative-indefinite-nominative-plural":"libatorii","accusative-definite-nominative-plural":"libatoriile","dative-genitive-indefinite-singular":"libatoriu","dative-definite-genitive-singular":"libatoriuului","dative-genitive-indefinite-plural":"libatorii","dative-definite-genitive-plural":"libatoriilor","singular-vocative":"libatoriuule","plural-vocative":"libatoriilor"}},{"word":"libela","pos":"verb","definitions":["to write a document"],"forms":{"canonical":"a libela 1st conjugation","present-singular-third-person":"libelează","participle-past":"libelat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a libela","gerund":"libelând","first-person-indicative-present-singular":"libelez","indicative-present-second-person-singular":"libelezi","indicative-present-singular-third-person":"libelează","first-person-indicative-plural-present":"libelăm","indicative-plural-present-second-person":"libelați","indicative-plural-present-third-person":"libelează","first-person-imperfect-indicative-singular":"libelam","imperfect-indicative-second-person-singular":"libelai","imperfect-indicative-singular-third-person":"libela","first-person-imperfect-indicative-plural":"libelam","imperfect-indicative-plural-second-person":"libelați","imperfect-indicative-plural-third-person":"libelau","first-person-indicative-perfect-singular":"libelai","indicative-perfect-second-person-singular":"libelași","indicative-perfect-singular-third-person":"libelă","first-person-indicative-perfect-plural":"libelarăm","indicative-perfect-plural-second-person":"libelarăți","indicative-perfect-plural-third-person":"libelară","first-person-indicative-pluperfect-singular":"libelasem","indicative-pluperfect-second-person-singular":"libelaseși","indicative-pluperfect-singular-third-person":"libelase","first-person-indicative-pluperfect-plural":"libelaserăm","indicative-pluperfect-plural-second-person":"libelaserăți","indicative-pluperfect-plural-third-person":"libelaseră","first-person-present-singular-subjunctive":"să libelez","present-second-person-singular-subjunctive":"să libelezi","present-singular-subjunctive-third-person":"să libeleze","first-person-plural-present-subjunctive":"să libelăm","plural-present-second-person-subjunctive":"să libelați","plural-present-subjunctive-third-person":"să libeleze","imperative-second-person-singular":"libelează","imperative-plural-second-person":"libelați","imperative-negative-second-person-singular":"nu libela","imperative-negative-plural-second-person":"nu libelați"}},{"word":"libelulă","pos":"noun","definitions":["dragonfly"],"pronunciation":"/libeˈlulə/","forms":{"plural":"libelule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"libelulă","accusative-definite-nominative-singular":"libelula","accusative-indefinite-nominative-plural":"libelule","accusative-definite-nominative-plural":"libelulele","dative-genitive-indefinite-singular":"libelule","dative-definite-genitive-singular":"libelulei","dative-genitive-indefinite-plural":"libelule","dative-definite-genitive-plural":"libelulelor","singular-vocative":"libelulă","plural-vocative":"libelulelor"}},{"word":"Libenciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Libenciuc"}},{"word":"liber","pos":"adj","definitions":["free, at liberty"],"pronunciation":"/ˈli.ber/","forms":{"feminine-singular":"liberă","masculine-plural":"liberi","feminine-neuter-plural":"libere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liber","error-unrecognized-form-feminine-indefinite-singular":"liberă","error-unrecognized-form-indefinite-masculine-plural":"liberi","error-unrecognized-form-feminine-indefinite-neuter-plural":"libere","definite-error-unrecognized-form-masculine-neuter-singular":"liberul","definite-error-unrecognized-form-feminine-singular":"libera","definite-error-unrecognized-form-masculine-plural":"liberii","definite-error-unrecognized-form-feminine-neuter-plural":"liberele"}},{"word":"liber arbitru","pos":"noun","definitions":["free will"]},{"word":"liber-cugetător","pos":"noun","definitions":["free-thinker"],"forms":{"plural":"liberi-cugetători","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"liber-cugetător","accusative-definite-nominative-singular":"liber-cugetătorul","accusative-indefinite-nominative-plural":"liberi-cugetători","accusative-definite-nominative-plural":"liberi-cugetătorii","dative-genitive-indefinite-singular":"liber-cugetător","dative-definite-genitive-singular":"liber-cugetătorului","dative-genitive-indefinite-plural":"liberi-cugetători","dative-definite-genitive-plural":"liberi-cugetătorilor","singular-vocative":"liber-cugetătorule","plural-vocative":"liberi-cugetătorilor"}}];
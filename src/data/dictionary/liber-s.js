@@ -0,0 +1 @@
+export default [{"word":"liber-schimbism","pos":"noun","definitions":["free trade"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"liber-schimbism","accusative-definite-nominative-singular":"liber-schimbismul","accusative-indefinite-nominative-plural":"-","accusative-definite-nominative-plural":"-le","dative-genitive-indefinite-singular":"liber-schimbism","dative-definite-genitive-singular":"liber-schimbismului","dative-genitive-indefinite-plural":"-","dative-definite-genitive-plural":"-lor","singular-vocative":"liber-schimbismule","plural-vocative":"-lor"}},{"word":"liber-schimbist","pos":"noun","definitions":["free trader"],"forms":{"plural":"liber-schimbiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"liber-schimbist","accusative-definite-nominative-singular":"liber-schimbistul","accusative-indefinite-nominative-plural":"liber-schimbiști","accusative-definite-nominative-plural":"liber-schimbiștii","dative-genitive-indefinite-singular":"liber-schimbist","dative-definite-genitive-singular":"liber-schimbistului","dative-genitive-indefinite-plural":"liber-schimbiști","dative-definite-genitive-plural":"liber-schimbiștilor","singular-vocative":"liber-schimbistule","plural-vocative":"liber-schimbiștilor"}},{"word":"libera","pos":"verb","definitions":["to free, liberate","to transfer a soldier to the reserves or away from active duty, or let him go home"],"forms":{"canonical":"a libera 1st conjugation","present-singular-third-person":"liberează","participle-past":"liberat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a libera","gerund":"liberând","first-person-indicative-present-singular":"liberez","indicative-present-second-person-singular":"liberezi","indicative-present-singular-third-person":"liberează","first-person-indicative-plural-present":"liberăm","indicative-plural-present-second-person":"liberați","indicative-plural-present-third-person":"liberează","first-person-imperfect-indicative-singular":"liberam","imperfect-indicative-second-person-singular":"liberai","imperfect-indicative-singular-third-person":"libera","first-person-imperfect-indicative-plural":"liberam","imperfect-indicative-plural-second-person":"liberați","imperfect-indicative-plural-third-person":"liberau","first-person-indicative-perfect-singular":"liberai","indicative-perfect-second-person-singular":"liberași","indicative-perfect-singular-third-person":"liberă","first-person-indicative-perfect-plural":"liberarăm","indicative-perfect-plural-second-person":"liberarăți","indicative-perfect-plural-third-person":"liberară","first-person-indicative-pluperfect-singular":"liberasem","indicative-pluperfect-second-person-singular":"liberaseși","indicative-pluperfect-singular-third-person":"liberase","first-person-indicative-pluperfect-plural":"liberaserăm","indicative-pluperfect-plural-second-person":"liberaserăți","indicative-pluperfect-plural-third-person":"liberaseră","first-person-present-singular-subjunctive":"să liberez","present-second-person-singular-subjunctive":"să liberezi","present-singular-subjunctive-third-person":"să libereze","first-person-plural-present-subjunctive":"să liberăm","plural-present-second-person-subjunctive":"să liberați","plural-present-subjunctive-third-person":"să libereze","imperative-second-person-singular":"liberează","imperative-plural-second-person":"liberați","imperative-negative-second-person-singular":"nu libera","imperative-negative-plural-second-person":"nu liberați"}},{"word":"liberă","pos":"verb","definitions":["third-person singular simple perfect indicative of libera"]},{"word":"liberabil","pos":"adj","definitions":["releasable"],"forms":{"feminine-singular":"liberabilă","masculine-plural":"liberabili","feminine-neuter-plural":"liberabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liberabil","error-unrecognized-form-feminine-indefinite-singular":"liberabilă","error-unrecognized-form-indefinite-masculine-plural":"liberabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"liberabile","definite-error-unrecognized-form-masculine-neuter-singular":"liberabilul","definite-error-unrecognized-form-feminine-singular":"liberabila","definite-error-unrecognized-form-masculine-plural":"liberabilii","definite-error-unrecognized-form-feminine-neuter-plural":"liberabilele"}},{"word":"liberai","pos":"verb","definitions":["inflection of libera:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[libeˈraj]"},{"word":"liberal","pos":"adj","definitions":["liberal"],"pronunciation":"/libeˈral/","forms":{"feminine-singular":"liberală","masculine-plural":"liberali","feminine-neuter-plural":"liberale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liberal","error-unrecognized-form-feminine-indefinite-singular":"liberală","error-unrecognized-form-indefinite-masculine-plural":"liberali","error-unrecognized-form-feminine-indefinite-neuter-plural":"liberale","definite-error-unrecognized-form-masculine-neuter-singular":"liberalul","definite-error-unrecognized-form-feminine-singular":"liberala","definite-error-unrecognized-form-masculine-plural":"liberalii","definite-error-unrecognized-form-feminine-neuter-plural":"liberalele","alternative":"либерал"}},{"word":"liberaliciune","pos":"noun","definitions":["liberty, freedom"],"forms":{"plural":"liberaliciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"liberaliciune","accusative-definite-nominative-singular":"liberaliciunea","accusative-indefinite-nominative-plural":"liberaliciuni","accusative-definite-nominative-plural":"liberaliciunile","dative-genitive-indefinite-singular":"liberaliciuni","dative-definite-genitive-singular":"liberaliciunii","dative-genitive-indefinite-plural":"liberaliciuni","dative-definite-genitive-plural":"liberaliciunilor","singular-vocative":"liberaliciune","plural-vocative":"liberaliciunilor"}},{"word":"liberălime","pos":"noun","definitions":["liberals"],"forms":{"plural":"liberălimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"liberălime","accusative-definite-nominative-singular":"liberălimea","accusative-indefinite-nominative-plural":"liberălimi","accusative-definite-nominative-plural":"liberălimile","dative-genitive-indefinite-singular":"liberălimi","dative-definite-genitive-singular":"liberălimii","dative-genitive-indefinite-plural":"liberălimi","dative-definite-genitive-plural":"liberălimilor","singular-vocative":"liberălime","plural-vocative":"liberălimilor"}},{"word":"liberalism","pos":"noun","definitions":["liberalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"liberalism","accusative-definite-nominative":"liberalismul","dative-genitive-indefinite":"liberalism","dative-definite-genitive":"liberalismului","vocative":"liberalismule"}},{"word":"liberalist","pos":"adj","definitions":["liberal"],"forms":{"feminine-singular":"liberalistă","masculine-plural":"liberaliști","feminine-neuter-plural":"liberaliste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liberalist","error-unrecognized-form-feminine-indefinite-singular":"liberalistă","error-unrecognized-form-indefinite-masculine-plural":"liberaliști","error-unrecognized-form-feminine-indefinite-neuter-plural":"liberaliste","definite-error-unrecognized-form-masculine-neuter-singular":"liberalistul","definite-error-unrecognized-form-feminine-singular":"liberalista","definite-error-unrecognized-form-masculine-plural":"liberaliștii","definite-error-unrecognized-form-feminine-neuter-plural":"liberalistele"}},{"word":"liberalitate","pos":"noun","definitions":["generosity"],"forms":{"plural":"liberalități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"liberalitate","accusative-definite-nominative-singular":"liberalitatea","accusative-indefinite-nominative-plural":"liberalități","accusative-definite-nominative-plural":"liberalitățile","dative-genitive-indefinite-singular":"liberalități","dative-definite-genitive-singular":"liberalității","dative-genitive-indefinite-plural":"liberalități","dative-definite-genitive-plural":"liberalităților","singular-vocative":"liberalitate","plural-vocative":"liberalităților"}},{"word":"liberaliza","pos":"verb","definitions":["to liberalize"],"forms":{"canonical":"a liberaliza 1st conjugation","present-singular-third-person":"liberalizează","participle-past":"liberalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a liberaliza","gerund":"liberalizând","first-person-indicative-present-singular":"liberalizez","indicative-present-second-person-singular":"liberalizezi","indicative-present-singular-third-person":"liberalizează","first-person-indicative-plural-present":"liberalizăm","indicative-plural-present-second-person":"liberalizați","indicative-plural-present-third-person":"liberalizează","first-person-imperfect-indicative-singular":"liberalizam","imperfect-indicative-second-person-singular":"liberalizai","imperfect-indicative-singular-third-person":"liberaliza","first-person-imperfect-indicative-plural":"liberalizam","imperfect-indicative-plural-second-person":"liberalizați","imperfect-indicative-plural-third-person":"liberalizau","first-person-indicative-perfect-singular":"liberalizai","indicative-perfect-second-person-singular":"liberalizași","indicative-perfect-singular-third-person":"liberaliză","first-person-indicative-perfect-plural":"liberalizarăm","indicative-perfect-plural-second-person":"liberalizarăți","indicative-perfect-plural-third-person":"liberalizară","first-person-indicative-pluperfect-singular":"liberalizasem","indicative-pluperfect-second-person-singular":"liberalizaseși","indicative-pluperfect-singular-third-person":"liberalizase","first-person-indicative-pluperfect-plural":"liberalizaserăm","indicative-pluperfect-plural-second-person":"liberalizaserăți","indicative-pluperfect-plural-third-person":"liberalizaseră","first-person-present-singular-subjunctive":"să liberalizez","present-second-person-singular-subjunctive":"să liberalizezi","present-singular-subjunctive-third-person":"să liberalizeze","first-person-plural-present-subjunctive":"să liberalizăm","plural-present-second-person-subjunctive":"să liberalizați","plural-present-subjunctive-third-person":"să liberalizeze","imperative-second-person-singular":"liberalizează","imperative-plural-second-person":"liberalizați","imperative-negative-second-person-singular":"nu liberaliza","imperative-negative-plural-second-person":"nu liberalizați"}},{"word":"liberalizare","pos":"noun","definitions":["liberalization"],"forms":{"plural":"liberalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"liberalizare","accusative-definite-nominative-singular":"liberalizarea","accusative-indefinite-nominative-plural":"liberalizări","accusative-definite-nominative-plural":"liberalizările","dative-genitive-indefinite-singular":"liberalizări","dative-definite-genitive-singular":"liberalizării","dative-genitive-indefinite-plural":"liberalizări","dative-definite-genitive-plural":"liberalizărilor","singular-vocative":"liberalizare","plural-vocative":"liberalizărilor"}},{"word":"liberalizat","pos":"adj","definitions":["liberalized"],"forms":{"feminine-singular":"liberalizată","masculine-plural":"liberalizați","feminine-neuter-plural":"liberalizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liberalizat","error-unrecognized-form-feminine-indefinite-singular":"liberalizată","error-unrecognized-form-indefinite-masculine-plural":"liberalizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"liberalizate","definite-error-unrecognized-form-masculine-neuter-singular":"liberalizatul","definite-error-unrecognized-form-feminine-singular":"liberalizata","definite-error-unrecognized-form-masculine-plural":"liberalizații","definite-error-unrecognized-form-feminine-neuter-plural":"liberalizatele"}},{"word":"liberam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of libera"],"pronunciation":"[libeˈram]"},{"word":"liberare","pos":"noun","definitions":["liberation"],"forms":{"plural":"liberări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"liberare","accusative-definite-nominative-singular":"liberarea","accusative-indefinite-nominative-plural":"liberări","accusative-definite-nominative-plural":"liberările","dative-genitive-indefinite-singular":"liberări","dative-definite-genitive-singular":"liberării","dative-genitive-indefinite-plural":"liberări","dative-definite-genitive-plural":"liberărilor","singular-vocative":"liberare","plural-vocative":"liberărilor"}},{"word":"liberase","pos":"verb","definitions":["third-person singular pluperfect indicative of libera"],"pronunciation":"[libeˈrase]"},{"word":"liberat","pos":"adj","definitions":["discharged from military service","freed, emancipated"],"pronunciation":"[libeˈrat]","forms":{"feminine-singular":"liberată","masculine-plural":"liberați","feminine-neuter-plural":"liberate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liberat","error-unrecognized-form-feminine-indefinite-singular":"liberată","error-unrecognized-form-indefinite-masculine-plural":"liberați","error-unrecognized-form-feminine-indefinite-neuter-plural":"liberate","definite-error-unrecognized-form-masculine-neuter-singular":"liberatul","definite-error-unrecognized-form-feminine-singular":"liberata","definite-error-unrecognized-form-masculine-plural":"liberații","definite-error-unrecognized-form-feminine-neuter-plural":"liberatele"}},{"word":"liberat","pos":"verb","definitions":["past participle of libera"],"pronunciation":"[libeˈrat]","forms":{"participle-past":"of libera"}},{"word":"liberație","pos":"noun","definitions":["liberation"],"pronunciation":"/libeˈrat͡si.e/","forms":{"plural":"liberații"}},{"word":"liberațiune","pos":"noun","definitions":["obsolete form of liberație"],"forms":{"plural":"liberațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"liberațiune","accusative-definite-nominative-singular":"liberațiunea","accusative-indefinite-nominative-plural":"liberațiuni","accusative-definite-nominative-plural":"liberațiunile","dative-genitive-indefinite-singular":"liberațiuni","dative-definite-genitive-singular":"liberațiunii","dative-genitive-indefinite-plural":"liberațiuni","dative-definite-genitive-plural":"liberațiunilor","singular-vocative":"liberațiune","plural-vocative":"liberațiunilor"}},{"word":"liberatoare","pos":"noun","definitions":["female equivalent of liberator"],"forms":{"plural":"liberatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"liberatoare","accusative-definite-nominative-singular":"liberatoarea","accusative-indefinite-nominative-plural":"liberatoare","accusative-definite-nominative-plural":"liberatoarele","dative-genitive-indefinite-singular":"liberatoare","dative-definite-genitive-singular":"liberatoarei","dative-genitive-indefinite-plural":"liberatoare","dative-definite-genitive-plural":"liberatoarelor","singular-vocative":"liberatoare","plural-vocative":"liberatoarelor"}},{"word":"liberator","pos":"adj","definitions":["liberating"],"forms":{"feminine-singular":"liberatoare","masculine-plural":"liberatori","feminine-neuter-plural":"liberatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liberator","error-unrecognized-form-feminine-indefinite-singular":"liberatoare","error-unrecognized-form-indefinite-masculine-plural":"liberatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"liberatoare","definite-error-unrecognized-form-masculine-neuter-singular":"liberatorul","definite-error-unrecognized-form-feminine-singular":"liberatoarea","definite-error-unrecognized-form-masculine-plural":"liberatorii","definite-error-unrecognized-form-feminine-neuter-plural":"liberatoarele"}},{"word":"liberez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of libera"],"pronunciation":"[libeˈrez]"},{"word":"liberian","pos":"adj","definitions":["Liberian"],"forms":{"feminine-singular":"liberiană","masculine-plural":"liberieni","feminine-neuter-plural":"liberiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liberian","error-unrecognized-form-feminine-indefinite-singular":"liberiană","error-unrecognized-form-indefinite-masculine-plural":"liberieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"liberiene","definite-error-unrecognized-form-masculine-neuter-singular":"liberianul","definite-error-unrecognized-form-feminine-singular":"liberiana","definite-error-unrecognized-form-masculine-plural":"liberienii","definite-error-unrecognized-form-feminine-neuter-plural":"liberienele"}},{"word":"liberian","pos":"noun","definitions":["Liberian"],"forms":{"plural":"liberieni","feminine":"equivalent liberiană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"liberian","accusative-definite-nominative-singular":"liberianul","accusative-indefinite-nominative-plural":"liberieni","accusative-definite-nominative-plural":"liberienii","dative-genitive-indefinite-singular":"liberian","dative-definite-genitive-singular":"liberianului","dative-genitive-indefinite-plural":"liberieni","dative-definite-genitive-plural":"liberienilor","singular-vocative":"liberianule","plural-vocative":"liberienilor"}},{"word":"liberiană","pos":"noun","definitions":["female equivalent of liberian"],"forms":{"plural":"liberiane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"liberiană","accusative-definite-nominative-singular":"liberiana","accusative-indefinite-nominative-plural":"liberiene","accusative-definite-nominative-plural":"liberienele","dative-genitive-indefinite-singular":"liberiene","dative-definite-genitive-singular":"liberienei","dative-genitive-indefinite-plural":"liberiene","dative-definite-genitive-plural":"liberienelor","singular-vocative":"liberiană","plural-vocative":"liberienelor"}},{"word":"libero","pos":"noun","definitions":["sweeper"],"forms":{"plural":"libero","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"libero","accusative-definite-nominative-singular":"liberoul","accusative-indefinite-nominative-plural":"libero","accusative-definite-nominative-plural":"liberoi","dative-genitive-indefinite-singular":"libero","dative-definite-genitive-singular":"liberoului","dative-genitive-indefinite-plural":"libero","dative-definite-genitive-plural":"liberolor","singular-vocative":"liberoule","plural-vocative":"liberolor"}},{"word":"liberolemnos","pos":"adj","definitions":["liberoligneous"],"forms":{"feminine-singular":"liberolemnoasă","masculine-plural":"liberolemnoși","feminine-neuter-plural":"liberolemnoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liberolemnos","error-unrecognized-form-feminine-indefinite-singular":"liberolemnoasă","error-unrecognized-form-indefinite-masculine-plural":"liberolemnoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"liberolemnoase","definite-error-unrecognized-form-masculine-neuter-singular":"liberolemnosul","definite-error-unrecognized-form-feminine-singular":"liberolemnoasa","definite-error-unrecognized-form-masculine-plural":"liberolemnoșii","definite-error-unrecognized-form-feminine-neuter-plural":"liberolemnoasele"}},{"word":"libert","pos":"noun","definitions":["a freedman, an emancipated person. (in ancient Rome)"],"forms":{"plural":"liberți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"libert","accusative-definite-nominative-singular":"libertul","accusative-indefinite-nominative-plural":"liberți","accusative-definite-nominative-plural":"liberții","dative-genitive-indefinite-singular":"libert","dative-definite-genitive-singular":"libertului","dative-genitive-indefinite-plural":"liberți","dative-definite-genitive-plural":"liberților","singular-vocative":"libertule","plural-vocative":"liberților"}},{"word":"libertă","pos":"noun","definitions":["female equivalent of libert"],"forms":{"plural":"liberte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"libertă","accusative-definite-nominative-singular":"liberta","accusative-indefinite-nominative-plural":"liberte","accusative-definite-nominative-plural":"libertele","dative-genitive-indefinite-singular":"liberte","dative-definite-genitive-singular":"libertei","dative-genitive-indefinite-plural":"liberte","dative-definite-genitive-plural":"libertelor","singular-vocative":"libertă","plural-vocative":"libertelor"}},{"word":"libertar","pos":"adj","definitions":["libertarian"],"forms":{"feminine-singular":"libertară","masculine-plural":"libertari","feminine-neuter-plural":"libertare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"libertar","error-unrecognized-form-feminine-indefinite-singular":"libertară","error-unrecognized-form-indefinite-masculine-plural":"libertari","error-unrecognized-form-feminine-indefinite-neuter-plural":"libertare","definite-error-unrecognized-form-masculine-neuter-singular":"libertarul","definite-error-unrecognized-form-feminine-singular":"libertara","definite-error-unrecognized-form-masculine-plural":"libertarii","definite-error-unrecognized-form-feminine-neuter-plural":"libertarele"}},{"word":"libertate","pos":"noun","definitions":["liberty, freedom"],"pronunciation":"/li.berˈta.te/","forms":{"plural":"libertăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative-singular":"libertate","accusative-definite-nominative-singular":"libertatea","accusative-indefinite-nominative-plural":"libertăți","accusative-definite-nominative-plural":"libertățile","dative-genitive-indefinite-singular":"libertăți","dative-definite-genitive-singular":"libertății","dative-genitive-indefinite-plural":"libertăți","dative-definite-genitive-plural":"libertăților","singular-vocative":"libertate","plural-vocative":"libertăților","alternative":"либертате"}},{"word":"libertate de expresie","pos":"noun","definitions":["freedom of expression"]},{"word":"libertate de gândire","pos":"noun","definitions":["freedom of expression"]},{"word":"Libertatea","pos":"name","definitions":["a village in Călărași, Botoșani County, Romania","a village in Dichiseni, Călărași County, Romania"],"gender":"f"},{"word":"libertatea cuvântului","pos":"noun","definitions":["freedom of speech"]},{"word":"libertăți","pos":"noun","definitions":["plural of libertate"]},{"word":"liberticid","pos":"adj","definitions":["liberticide, liberticidal"],"forms":{"feminine-singular":"liberticidă","masculine-plural":"liberticizi","feminine-neuter-plural":"liberticide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liberticid","error-unrecognized-form-feminine-indefinite-singular":"liberticidă","error-unrecognized-form-indefinite-masculine-plural":"liberticizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"liberticide","definite-error-unrecognized-form-masculine-neuter-singular":"liberticidul","definite-error-unrecognized-form-feminine-singular":"liberticida","definite-error-unrecognized-form-masculine-plural":"liberticizii","definite-error-unrecognized-form-feminine-neuter-plural":"liberticidele"}},{"word":"liberticidiu","pos":"noun","definitions":["liberticide (the destruction of liberty)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"liberticidiu","accusative-definite-nominative":"liberticidiuul","dative-genitive-indefinite":"liberticidiu","dative-definite-genitive":"liberticidiuului","vocative":"liberticidiuule"}},{"word":"libertin","pos":"adj","definitions":["libertine"],"forms":{"feminine-singular":"libertină","masculine-plural":"libertini","feminine-neuter-plural":"libertine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"libertin","error-unrecognized-form-feminine-indefinite-singular":"libertină","error-unrecognized-form-indefinite-masculine-plural":"libertini","error-unrecognized-form-feminine-indefinite-neuter-plural":"libertine","definite-error-unrecognized-form-masculine-neuter-singular":"libertinul","definite-error-unrecognized-form-feminine-singular":"libertina","definite-error-unrecognized-form-masculine-plural":"libertinii","definite-error-unrecognized-form-feminine-neuter-plural":"libertinele"}},{"word":"libertinagiu","pos":"noun","definitions":["obsolete form of libertinaj"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"libertinagiu","accusative-definite-nominative":"libertinagiuul","dative-genitive-indefinite":"libertinagiu","dative-definite-genitive":"libertinagiuului","vocative":"libertinagiuule"}},{"word":"libertinaj","pos":"noun","definitions":["libertinage"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"libertinaj","accusative-definite-nominative-singular":"libertinajul","accusative-indefinite-nominative-plural":"libertinaje","accusative-definite-nominative-plural":"libertinajele","dative-genitive-indefinite-singular":"libertinaj","dative-definite-genitive-singular":"libertinajului","dative-genitive-indefinite-plural":"libertinaje","dative-definite-genitive-plural":"libertinajelor","singular-vocative":"libertinajule","plural-vocative":"libertinajelor"}},{"word":"libertinism","pos":"noun","definitions":["libertinism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"libertinism","accusative-definite-nominative":"libertinismul","dative-genitive-indefinite":"libertinism","dative-definite-genitive":"libertinismului","vocative":"libertinismule"}},{"word":"libian","pos":"adj","definitions":["Libyan"],"forms":{"feminine-singular":"libiană","masculine-plural":"libieni","feminine-neuter-plural":"libiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"libian","error-unrecognized-form-feminine-indefinite-singular":"libiană","error-unrecognized-form-indefinite-masculine-plural":"libieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"libiene","definite-error-unrecognized-form-masculine-neuter-singular":"libianul","definite-error-unrecognized-form-feminine-singular":"libiana","definite-error-unrecognized-form-masculine-plural":"libienii","definite-error-unrecognized-form-feminine-neuter-plural":"libienele"}},{"word":"libian","pos":"noun","definitions":["Libyan"],"forms":{"plural":"libieni","feminine":"equivalent libiană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"libian","accusative-definite-nominative-singular":"libianul","accusative-indefinite-nominative-plural":"libieni","accusative-definite-nominative-plural":"libienii","dative-genitive-indefinite-singular":"libian","dative-definite-genitive-singular":"libianului","dative-genitive-indefinite-plural":"libieni","dative-definite-genitive-plural":"libienilor","singular-vocative":"libianule","plural-vocative":"libienilor"}},{"word":"libiană","pos":"noun","definitions":["female equivalent of libian"],"forms":{"plural":"libiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"libiană","accusative-definite-nominative-singular":"libiana","accusative-indefinite-nominative-plural":"libiene","accusative-definite-nominative-plural":"libienele","dative-genitive-indefinite-singular":"libiene","dative-definite-genitive-singular":"libienei","dative-genitive-indefinite-plural":"libiene","dative-definite-genitive-plural":"libienelor","singular-vocative":"libiană","plural-vocative":"libienelor"}},{"word":"libic","pos":"adj","definitions":["Libyan"],"forms":{"feminine-singular":"libică","masculine-plural":"libici","feminine-neuter-plural":"libice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"libic","error-unrecognized-form-feminine-indefinite-singular":"libică","error-unrecognized-form-indefinite-masculine-plural":"libici","error-unrecognized-form-feminine-indefinite-neuter-plural":"libice","definite-error-unrecognized-form-masculine-neuter-singular":"libicul","definite-error-unrecognized-form-feminine-singular":"libica","definite-error-unrecognized-form-masculine-plural":"libicii","definite-error-unrecognized-form-feminine-neuter-plural":"libicele"}},{"word":"libidine","pos":"noun","definitions":["sex drive, libido"],"forms":{"plural":"libidini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"libidine","accusative-definite-nominative-singular":"libidinea","accusative-indefinite-nominative-plural":"libidini","accusative-definite-nominative-plural":"libidinile","dative-genitive-indefinite-singular":"libidini","dative-definite-genitive-singular":"libidinii","dative-genitive-indefinite-plural":"libidini","dative-definite-genitive-plural":"libidinilor","singular-vocative":"libidine","plural-vocative":"libidinilor"}},{"word":"libidinism","pos":"noun","definitions":["libidinousness"],"forms":{"plural":"libidinisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"libidinism","accusative-definite-nominative-singular":"libidinismul","accusative-indefinite-nominative-plural":"libidinisme","accusative-definite-nominative-plural":"libidinismele","dative-genitive-indefinite-singular":"libidinism","dative-definite-genitive-singular":"libidinismului","dative-genitive-indefinite-plural":"libidinisme","dative-definite-genitive-plural":"libidinismelor","singular-vocative":"libidinismule","plural-vocative":"libidinismelor"}},{"word":"libidinos","pos":"adj","definitions":["libidinous"],"pronunciation":"[li.bi.diˈnos]","forms":{"feminine-singular":"libidinoasă","masculine-plural":"libidinoși","feminine-neuter-plural":"libidinoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"libidinos","error-unrecognized-form-feminine-indefinite-singular":"libidinoasă","error-unrecognized-form-indefinite-masculine-plural":"libidinoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"libidinoase","definite-error-unrecognized-form-masculine-neuter-singular":"libidinosul","definite-error-unrecognized-form-feminine-singular":"libidinoasa","definite-error-unrecognized-form-masculine-plural":"libidinoșii","definite-error-unrecognized-form-feminine-neuter-plural":"libidinoasele"}},{"word":"libidinozitate","pos":"noun","definitions":["libidinosity"],"forms":{"plural":"libidinozități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"libidinozitate","accusative-definite-nominative-singular":"libidinozitatea","accusative-indefinite-nominative-plural":"libidinozități","accusative-definite-nominative-plural":"libidinozitățile","dative-genitive-indefinite-singular":"libidinozități","dative-definite-genitive-singular":"libidinozității","dative-genitive-indefinite-plural":"libidinozități","dative-definite-genitive-plural":"libidinozităților","singular-vocative":"libidinozitate","plural-vocative":"libidinozităților"}},{"word":"libido","pos":"noun","definitions":["sex drive, libido"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"libido","accusative-definite-nominative":"libidoul","dative-genitive-indefinite":"libido","dative-definite-genitive":"libidoului","vocative":"libidoule"}},{"word":"libitinariu","pos":"noun","definitions":["undertaker"],"forms":{"plural":"libitinari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"libitinariu","accusative-definite-nominative-singular":"libitinariuul","accusative-indefinite-nominative-plural":"libitinari","accusative-definite-nominative-plural":"libitinarii","dative-genitive-indefinite-singular":"libitinariu","dative-definite-genitive-singular":"libitinariuului","dative-genitive-indefinite-plural":"libitinari","dative-definite-genitive-plural":"libitinarilor","singular-vocative":"libitinariuule","plural-vocative":"libitinarilor"}},{"word":"Liborajdea","pos":"name","definitions":["a village in Sichevița, Caraș-Severin County, Romania"],"gender":"f"},{"word":"Libotin","pos":"name","definitions":["a village in Cupșeni, Maramureș County, Romania"],"gender":"m"},{"word":"libov","pos":"noun","definitions":["love"],"forms":{"plural":"libovi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"libov","accusative-definite-nominative-singular":"libovul","accusative-indefinite-nominative-plural":"libovi","accusative-definite-nominative-plural":"libovii","dative-genitive-indefinite-singular":"libov","dative-definite-genitive-singular":"libovului","dative-genitive-indefinite-plural":"libovi","dative-definite-genitive-plural":"libovilor","singular-vocative":"libovule","plural-vocative":"libovilor"}},{"word":"libovie","pos":"noun","definitions":["love"],"forms":{"plural":"libovii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"libovie","accusative-definite-nominative-singular":"libovia","accusative-indefinite-nominative-plural":"libovii","accusative-definite-nominative-plural":"liboviile","dative-genitive-indefinite-singular":"libovii","dative-definite-genitive-singular":"liboviei","dative-genitive-indefinite-plural":"libovii","dative-definite-genitive-plural":"liboviilor","singular-vocative":"libovie","plural-vocative":"liboviilor"}},{"word":"libovire","pos":"noun","definitions":["love"],"forms":{"plural":"liboviri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"libovire","accusative-definite-nominative-singular":"libovirea","accusative-indefinite-nominative-plural":"liboviri","accusative-definite-nominative-plural":"libovirile","dative-genitive-indefinite-singular":"liboviri","dative-definite-genitive-singular":"libovirii","dative-genitive-indefinite-plural":"liboviri","dative-definite-genitive-plural":"libovirilor","singular-vocative":"libovire","plural-vocative":"libovirilor"}},{"word":"libovit","pos":"adj","definitions":["cheerful"],"forms":{"feminine-singular":"libovită","masculine-plural":"liboviți","feminine-neuter-plural":"libovite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"libovit","error-unrecognized-form-feminine-indefinite-singular":"libovită","error-unrecognized-form-indefinite-masculine-plural":"liboviți","error-unrecognized-form-feminine-indefinite-neuter-plural":"libovite","definite-error-unrecognized-form-masculine-neuter-singular":"libovitul","definite-error-unrecognized-form-feminine-singular":"libovita","definite-error-unrecognized-form-masculine-plural":"liboviții","definite-error-unrecognized-form-feminine-neuter-plural":"libovitele"}},{"word":"libovit","pos":"verb","definitions":["past participle of libovi"],"forms":{"participle-past":"of libovi"}},{"word":"libră","pos":"noun","definitions":["obsolete form of livră"],"forms":{"plural":"libre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"libră","accusative-definite-nominative-singular":"libra","accusative-indefinite-nominative-plural":"libre","accusative-definite-nominative-plural":"librele","dative-genitive-indefinite-singular":"libre","dative-definite-genitive-singular":"librei","dative-genitive-indefinite-plural":"libre","dative-definite-genitive-plural":"librelor","singular-vocative":"libră","plural-vocative":"librelor"}},{"word":"librar","pos":"noun","definitions":["bookseller"],"forms":{"plural":"librari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"librar","accusative-definite-nominative-singular":"librarul","accusative-indefinite-nominative-plural":"librari","accusative-definite-nominative-plural":"librarii","dative-genitive-indefinite-singular":"librar","dative-definite-genitive-singular":"librarului","dative-genitive-indefinite-plural":"librari","dative-definite-genitive-plural":"librarilor","singular-vocative":"librarule","plural-vocative":"librarilor"}},{"word":"librărie","pos":"noun","definitions":["bookshop, bookstore"],"forms":{"plural":"librării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"librărie","accusative-definite-nominative-singular":"librăria","accusative-indefinite-nominative-plural":"librării","accusative-definite-nominative-plural":"librăriile","dative-genitive-indefinite-singular":"librării","dative-definite-genitive-singular":"librăriei","dative-genitive-indefinite-plural":"librării","dative-definite-genitive-plural":"librăriilor","singular-vocative":"librărie","plural-vocative":"librăriilor"}},{"word":"librării","pos":"noun","definitions":["plural of librărie"]},{"word":"librăriță","pos":"noun","definitions":["female equivalent of librar"],"forms":{"plural":"librărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"librăriță","accusative-definite-nominative-singular":"librărița","accusative-indefinite-nominative-plural":"librărițe","accusative-definite-nominative-plural":"librărițele","dative-genitive-indefinite-singular":"librărițe","dative-definite-genitive-singular":"librăriței","dative-genitive-indefinite-plural":"librărițe","dative-definite-genitive-plural":"librărițelor","singular-vocative":"librăriță","plural-vocative":"librărițelor"}},{"word":"librație","pos":"noun","definitions":["libration"],"forms":{"plural":"librații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"librație","accusative-definite-nominative-singular":"librația","accusative-indefinite-nominative-plural":"librații","accusative-definite-nominative-plural":"librațiile","dative-genitive-indefinite-singular":"librații","dative-definite-genitive-singular":"librației","dative-genitive-indefinite-plural":"librații","dative-definite-genitive-plural":"librațiilor","singular-vocative":"librație","plural-vocative":"librațiilor"}},{"word":"librațiune","pos":"noun","definitions":["obsolete form of librație"],"forms":{"plural":"librațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"librațiune","accusative-definite-nominative-singular":"librațiunea","accusative-indefinite-nominative-plural":"librațiuni","accusative-definite-nominative-plural":"librațiunile","dative-genitive-indefinite-singular":"librațiuni","dative-definite-genitive-singular":"librațiunii","dative-genitive-indefinite-plural":"librațiuni","dative-definite-genitive-plural":"librațiunilor","singular-vocative":"librațiune","plural-vocative":"librațiunilor"}},{"word":"libret","pos":"noun","definitions":["libretto"],"forms":{"plural":"librete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"libret","accusative-definite-nominative-singular":"libretul","accusative-indefinite-nominative-plural":"librete","accusative-definite-nominative-plural":"libretele","dative-genitive-indefinite-singular":"libret","dative-definite-genitive-singular":"libretului","dative-genitive-indefinite-plural":"librete","dative-definite-genitive-plural":"libretelor","singular-vocative":"libretule","plural-vocative":"libretelor"}},{"word":"libretist","pos":"noun","definitions":["librettist"],"forms":{"plural":"libretiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"libretist","accusative-definite-nominative-singular":"libretistul","accusative-indefinite-nominative-plural":"libretiști","accusative-definite-nominative-plural":"libretiștii","dative-genitive-indefinite-singular":"libretist","dative-definite-genitive-singular":"libretistului","dative-genitive-indefinite-plural":"libretiști","dative-definite-genitive-plural":"libretiștilor","singular-vocative":"libretistule","plural-vocative":"libretiștilor"}},{"word":"Lică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lică"}},{"word":"licantropic","pos":"adj","definitions":["lycanthropic"],"forms":{"feminine-singular":"licantropică","masculine-plural":"licantropici","feminine-neuter-plural":"licantropice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"licantropic","error-unrecognized-form-feminine-indefinite-singular":"licantropică","error-unrecognized-form-indefinite-masculine-plural":"licantropici","error-unrecognized-form-feminine-indefinite-neuter-plural":"licantropice","definite-error-unrecognized-form-masculine-neuter-singular":"licantropicul","definite-error-unrecognized-form-feminine-singular":"licantropica","definite-error-unrecognized-form-masculine-plural":"licantropicii","definite-error-unrecognized-form-feminine-neuter-plural":"licantropicele"}},{"word":"licantropie","pos":"noun","definitions":["lycanthropy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"licantropie","accusative-definite-nominative":"licantropia","dative-genitive-indefinite":"licantropii","dative-definite-genitive":"licantropiei","vocative":"licantropie"}},{"word":"licăr","pos":"noun","definitions":["gleam"],"forms":{"plural":"licăre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"licăr","accusative-definite-nominative-singular":"licărul","accusative-indefinite-nominative-plural":"licăre","accusative-definite-nominative-plural":"licărele","dative-genitive-indefinite-singular":"licăr","dative-definite-genitive-singular":"licărului","dative-genitive-indefinite-plural":"licăre","dative-definite-genitive-plural":"licărelor","singular-vocative":"licărule","plural-vocative":"licărelor"}},{"word":"licări","pos":"verb","definitions":["to gleam; to sparkle"],"forms":{"canonical":"a licări 4th conjugation","present-singular-third-person":"licărește","participle-past":"licărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a licări","gerund":"licărind","first-person-indicative-present-singular":"licăresc","indicative-present-second-person-singular":"licărești","indicative-present-singular-third-person":"licărește","first-person-indicative-plural-present":"licărim","indicative-plural-present-second-person":"licăriți","indicative-plural-present-third-person":"licăresc","first-person-imperfect-indicative-singular":"licăream","imperfect-indicative-second-person-singular":"licăreai","imperfect-indicative-singular-third-person":"licărea","first-person-imperfect-indicative-plural":"licăream","imperfect-indicative-plural-second-person":"licăreați","imperfect-indicative-plural-third-person":"licăreau","first-person-indicative-perfect-singular":"licării","indicative-perfect-second-person-singular":"licăriși","indicative-perfect-singular-third-person":"licări","first-person-indicative-perfect-plural":"licărirăm","indicative-perfect-plural-second-person":"licărirăți","indicative-perfect-plural-third-person":"licăriră","first-person-indicative-pluperfect-singular":"licărisem","indicative-pluperfect-second-person-singular":"licăriseși","indicative-pluperfect-singular-third-person":"licărise","first-person-indicative-pluperfect-plural":"licăriserăm","indicative-pluperfect-plural-second-person":"licăriserăți","indicative-pluperfect-plural-third-person":"licăriseră","first-person-present-singular-subjunctive":"să licăresc","present-second-person-singular-subjunctive":"să licărești","present-singular-subjunctive-third-person":"să licărească","first-person-plural-present-subjunctive":"să licărim","plural-present-second-person-subjunctive":"să licăriți","plural-present-subjunctive-third-person":"să licărească","imperative-second-person-singular":"licărește","imperative-plural-second-person":"licăriți","imperative-negative-second-person-singular":"nu licări","imperative-negative-plural-second-person":"nu licăriți","alternative":"licuri"}},{"word":"licărie","pos":"noun","definitions":["gleam"],"forms":{"plural":"licării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"licărie","accusative-definite-nominative-singular":"licăria","accusative-indefinite-nominative-plural":"licării","accusative-definite-nominative-plural":"licăriile","dative-genitive-indefinite-singular":"licării","dative-definite-genitive-singular":"licăriei","dative-genitive-indefinite-plural":"licării","dative-definite-genitive-plural":"licăriilor","singular-vocative":"licărie","plural-vocative":"licăriilor"}},{"word":"licărire","pos":"noun","definitions":["blink"],"forms":{"plural":"licăriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"licărire","accusative-definite-nominative-singular":"licărirea","accusative-indefinite-nominative-plural":"licăriri","accusative-definite-nominative-plural":"licăririle","dative-genitive-indefinite-singular":"licăriri","dative-definite-genitive-singular":"licăririi","dative-genitive-indefinite-plural":"licăriri","dative-definite-genitive-plural":"licăririlor","singular-vocative":"licărire","plural-vocative":"licăririlor"}},{"word":"licăriș","pos":"noun","definitions":["flicker"],"forms":{"plural":"licărișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"licăriș","accusative-definite-nominative-singular":"licărișul","accusative-indefinite-nominative-plural":"licărișuri","accusative-definite-nominative-plural":"licărișurile","dative-genitive-indefinite-singular":"licăriș","dative-definite-genitive-singular":"licărișului","dative-genitive-indefinite-plural":"licărișuri","dative-definite-genitive-plural":"licărișurilor","singular-vocative":"licărișule","plural-vocative":"licărișurilor"}},{"word":"licărit","pos":"noun","definitions":["flickering"],"forms":{"plural":"licărituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"licărit","accusative-definite-nominative-singular":"licăritul","accusative-indefinite-nominative-plural":"licărituri","accusative-definite-nominative-plural":"licăriturile","dative-genitive-indefinite-singular":"licărit","dative-definite-genitive-singular":"licăritului","dative-genitive-indefinite-plural":"licărituri","dative-definite-genitive-plural":"licăriturilor","singular-vocative":"licăritule","plural-vocative":"licăriturilor"}},{"word":"licărit","pos":"verb","definitions":["past participle of licări"],"forms":{"participle-past":"of licări"}},{"word":"licăritor","pos":"adj","definitions":["gleamy"],"forms":{"feminine-singular":"licăritoare","masculine-plural":"licăritori","feminine-neuter-plural":"licăritoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"licăritor","error-unrecognized-form-feminine-indefinite-singular":"licăritoare","error-unrecognized-form-indefinite-masculine-plural":"licăritori","error-unrecognized-form-feminine-indefinite-neuter-plural":"licăritoare","definite-error-unrecognized-form-masculine-neuter-singular":"licăritorul","definite-error-unrecognized-form-feminine-singular":"licăritoarea","definite-error-unrecognized-form-masculine-plural":"licăritorii","definite-error-unrecognized-form-feminine-neuter-plural":"licăritoarele"}},{"word":"Licaș","pos":"name","definitions":["a river in Harghita County, Romania, tributary to the Veleșchia"],"gender":"m"},{"word":"liceal","pos":"adj","definitions":["lyceum, high school"],"forms":{"feminine-singular":"liceală","masculine-plural":"liceali","feminine-neuter-plural":"liceale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liceal","error-unrecognized-form-feminine-indefinite-singular":"liceală","error-unrecognized-form-indefinite-masculine-plural":"liceali","error-unrecognized-form-feminine-indefinite-neuter-plural":"liceale","definite-error-unrecognized-form-masculine-neuter-singular":"licealul","definite-error-unrecognized-form-feminine-singular":"liceala","definite-error-unrecognized-form-masculine-plural":"licealii","definite-error-unrecognized-form-feminine-neuter-plural":"licealele"}},{"word":"liceale","pos":"adj","definitions":["obsolete form of liceal"],"forms":{"masculine-plural":"liceali","feminine-neuter-plural":"liceale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liceale","error-unrecognized-form-feminine-indefinite-singular":"liceale","error-unrecognized-form-indefinite-masculine-plural":"liceali","error-unrecognized-form-feminine-indefinite-neuter-plural":"liceale","definite-error-unrecognized-form-masculine-neuter-singular":"licealele","definite-error-unrecognized-form-feminine-singular":"licealea","definite-error-unrecognized-form-masculine-plural":"licealii","definite-error-unrecognized-form-feminine-neuter-plural":"licealele"}},{"word":"licean","pos":"noun","definitions":["high school student"],"forms":{"plural":"liceeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"licean","accusative-definite-nominative-singular":"liceanul","accusative-indefinite-nominative-plural":"liceeni","accusative-definite-nominative-plural":"liceenii","dative-genitive-indefinite-singular":"licean","dative-definite-genitive-singular":"liceanului","dative-genitive-indefinite-plural":"liceeni","dative-definite-genitive-plural":"liceenilor","singular-vocative":"liceanule","plural-vocative":"liceenilor"}},{"word":"liceană","pos":"noun","definitions":["female equivalent of licean"],"forms":{"plural":"liceene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"liceană","accusative-definite-nominative-singular":"liceana","accusative-indefinite-nominative-plural":"liceene","accusative-definite-nominative-plural":"liceenele","dative-genitive-indefinite-singular":"liceene","dative-definite-genitive-singular":"liceenei","dative-genitive-indefinite-plural":"liceene","dative-definite-genitive-plural":"liceenelor","singular-vocative":"liceană","plural-vocative":"liceenelor"}},{"word":"Liceanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Liceanu"}},{"word":"liceist","pos":"noun","definitions":["high school student"],"forms":{"plural":"liceiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"liceist","accusative-definite-nominative-singular":"liceistul","accusative-indefinite-nominative-plural":"liceiști","accusative-definite-nominative-plural":"liceiștii","dative-genitive-indefinite-singular":"liceist","dative-definite-genitive-singular":"liceistului","dative-genitive-indefinite-plural":"liceiști","dative-definite-genitive-plural":"liceiștilor","singular-vocative":"liceistule","plural-vocative":"liceiștilor"}},{"word":"licență","pos":"noun","definitions":["license"],"forms":{"plural":"licențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"licență","accusative-definite-nominative-singular":"licența","accusative-indefinite-nominative-plural":"licențe","accusative-definite-nominative-plural":"licențele","dative-genitive-indefinite-singular":"licențe","dative-definite-genitive-singular":"licenței","dative-genitive-indefinite-plural":"licențe","dative-definite-genitive-plural":"licențelor","singular-vocative":"licență","plural-vocative":"licențelor"}},{"word":"licență artistică","pos":"noun","definitions":["artistic licence"],"forms":{"plural":"licențe artistice"}},{"word":"licență poetică","pos":"noun","definitions":["poetic license"],"forms":{"plural":"licențe poetice"}},{"word":"licenția","pos":"verb","definitions":["to fire, to sack"],"forms":{"canonical":"a licenția 1st conjugation","present-singular-third-person":"licențiează","participle-past":"licențiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a licenția","gerund":"licențiind","first-person-indicative-present-singular":"licențiez","indicative-present-second-person-singular":"licențiezi","indicative-present-singular-third-person":"licențiază","first-person-indicative-plural-present":"licențiem","indicative-plural-present-second-person":"licențiați","indicative-plural-present-third-person":"licențiază","first-person-imperfect-indicative-singular":"licențiam","imperfect-indicative-second-person-singular":"licențiai","imperfect-indicative-singular-third-person":"licenția","first-person-imperfect-indicative-plural":"licențiam","imperfect-indicative-plural-second-person":"licențiați","imperfect-indicative-plural-third-person":"licențiau","first-person-indicative-perfect-singular":"licențiai","indicative-perfect-second-person-singular":"licențiași","indicative-perfect-singular-third-person":"licenție","first-person-indicative-perfect-plural":"licențiarăm","indicative-perfect-plural-second-person":"licențiarăți","indicative-perfect-plural-third-person":"licențiară","first-person-indicative-pluperfect-singular":"licențiasem","indicative-pluperfect-second-person-singular":"licențiaseși","indicative-pluperfect-singular-third-person":"licențiase","first-person-indicative-pluperfect-plural":"licențiaserăm","indicative-pluperfect-plural-second-person":"licențiaserăți","indicative-pluperfect-plural-third-person":"licențiaseră","first-person-present-singular-subjunctive":"să licențiez","present-second-person-singular-subjunctive":"să licențiezi","present-singular-subjunctive-third-person":"să licențieze","first-person-plural-present-subjunctive":"să licențiem","plural-present-second-person-subjunctive":"să licențiați","plural-present-subjunctive-third-person":"să licențieze","imperative-second-person-singular":"licențiază","imperative-plural-second-person":"licențiați","imperative-negative-second-person-singular":"nu licenția","imperative-negative-plural-second-person":"nu licențiați"}},{"word":"licențiat","pos":"noun","definitions":["holder of a bachelor's degree"],"forms":{"plural":"licențiați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"licențiat","accusative-definite-nominative-singular":"licențiatul","accusative-indefinite-nominative-plural":"licențiați","accusative-definite-nominative-plural":"licențiații","dative-genitive-indefinite-singular":"licențiat","dative-definite-genitive-singular":"licențiatului","dative-genitive-indefinite-plural":"licențiați","dative-definite-genitive-plural":"licențiaților","singular-vocative":"licențiatule","plural-vocative":"licențiaților"}},{"word":"licențiată","pos":"noun","definitions":["female equivalent of licențiat"],"forms":{"plural":"licențiate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"licențiată","accusative-definite-nominative-singular":"licențiata","accusative-indefinite-nominative-plural":"licențiate","accusative-definite-nominative-plural":"licențiatele","dative-genitive-indefinite-singular":"licențiate","dative-definite-genitive-singular":"licențiatei","dative-genitive-indefinite-plural":"licențiate","dative-definite-genitive-plural":"licențiatelor","singular-vocative":"licențiată","plural-vocative":"licențiatelor"}},{"word":"licențiere","pos":"noun","definitions":["licensing"],"forms":{"plural":"licențieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"licențiere","accusative-definite-nominative-singular":"licențierea","accusative-indefinite-nominative-plural":"licențieri","accusative-definite-nominative-plural":"licențierile","dative-genitive-indefinite-singular":"licențieri","dative-definite-genitive-singular":"licențierii","dative-genitive-indefinite-plural":"licențieri","dative-definite-genitive-plural":"licențierilor","singular-vocative":"licențiere","plural-vocative":"licențierilor"}},{"word":"licențios","pos":"adj","definitions":["licentious"],"forms":{"feminine-singular":"licențioasă","masculine-plural":"licențioși","feminine-neuter-plural":"licențioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"licențios","error-unrecognized-form-feminine-indefinite-singular":"licențioasă","error-unrecognized-form-indefinite-masculine-plural":"licențioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"licențioase","definite-error-unrecognized-form-masculine-neuter-singular":"licențiosul","definite-error-unrecognized-form-feminine-singular":"licențioasa","definite-error-unrecognized-form-masculine-plural":"licențioșii","definite-error-unrecognized-form-feminine-neuter-plural":"licențioasele"}},{"word":"licențiozitate","pos":"noun","definitions":["licentiousness"],"forms":{"plural":"licențiozități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"licențiozitate","accusative-definite-nominative-singular":"licențiozitatea","accusative-indefinite-nominative-plural":"licențiozități","accusative-definite-nominative-plural":"licențiozitățile","dative-genitive-indefinite-singular":"licențiozități","dative-definite-genitive-singular":"licențiozității","dative-genitive-indefinite-plural":"licențiozități","dative-definite-genitive-plural":"licențiozităților","singular-vocative":"licențiozitate","plural-vocative":"licențiozităților"}},{"word":"Licescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Licescu"}},{"word":"liceu","pos":"noun","definitions":["secondary school"],"forms":{"plural":"licee"}},{"word":"lichea","pos":"noun","definitions":["toady, wretch, despicable person"],"forms":{"plural":"lichele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"lichea","accusative-definite-nominative-singular":"licheaua","accusative-indefinite-nominative-plural":"lichele","accusative-definite-nominative-plural":"lichelele","dative-genitive-indefinite-singular":"lichele","dative-definite-genitive-singular":"lichelei","dative-genitive-indefinite-plural":"lichele","dative-definite-genitive-plural":"lichelelor","singular-vocative":"lichea","plural-vocative":"lichelelor"}},{"word":"lichefacție","pos":"noun","definitions":["liquefaction"],"forms":{"plural":"lichefacții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lichefacție","accusative-definite-nominative-singular":"lichefacția","accusative-indefinite-nominative-plural":"lichefacții","accusative-definite-nominative-plural":"lichefacțiile","dative-genitive-indefinite-singular":"lichefacții","dative-definite-genitive-singular":"lichefacției","dative-genitive-indefinite-plural":"lichefacții","dative-definite-genitive-plural":"lichefacțiilor","singular-vocative":"lichefacție","plural-vocative":"lichefacțiilor"}},{"word":"lichefia","pos":"verb","definitions":["to liquefy"],"forms":{"canonical":"a lichefia 1st conjugation","present-singular-third-person":"lichefiează","participle-past":"lichefiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a lichefia","gerund":"lichefiind","first-person-indicative-present-singular":"lichefiez","indicative-present-second-person-singular":"lichefiezi","indicative-present-singular-third-person":"lichefiază","first-person-indicative-plural-present":"lichefiem","indicative-plural-present-second-person":"lichefiați","indicative-plural-present-third-person":"lichefiază","first-person-imperfect-indicative-singular":"lichefiam","imperfect-indicative-second-person-singular":"lichefiai","imperfect-indicative-singular-third-person":"lichefia","first-person-imperfect-indicative-plural":"lichefiam","imperfect-indicative-plural-second-person":"lichefiați","imperfect-indicative-plural-third-person":"lichefiau","first-person-indicative-perfect-singular":"lichefiai","indicative-perfect-second-person-singular":"lichefiași","indicative-perfect-singular-third-person":"lichefie","first-person-indicative-perfect-plural":"lichefiarăm","indicative-perfect-plural-second-person":"lichefiarăți","indicative-perfect-plural-third-person":"lichefiară","first-person-indicative-pluperfect-singular":"lichefiasem","indicative-pluperfect-second-person-singular":"lichefiaseși","indicative-pluperfect-singular-third-person":"lichefiase","first-person-indicative-pluperfect-plural":"lichefiaserăm","indicative-pluperfect-plural-second-person":"lichefiaserăți","indicative-pluperfect-plural-third-person":"lichefiaseră","first-person-present-singular-subjunctive":"să lichefiez","present-second-person-singular-subjunctive":"să lichefiezi","present-singular-subjunctive-third-person":"să lichefieze","first-person-plural-present-subjunctive":"să lichefiem","plural-present-second-person-subjunctive":"să lichefiați","plural-present-subjunctive-third-person":"să lichefieze","imperative-second-person-singular":"lichefiază","imperative-plural-second-person":"lichefiați","imperative-negative-second-person-singular":"nu lichefia","imperative-negative-plural-second-person":"nu lichefiați"}},{"word":"lichefiabil","pos":"adj","definitions":["liquefiable"],"forms":{"feminine-singular":"lichefiabilă","masculine-plural":"lichefiabili","feminine-neuter-plural":"lichefiabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lichefiabil","error-unrecognized-form-feminine-indefinite-singular":"lichefiabilă","error-unrecognized-form-indefinite-masculine-plural":"lichefiabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"lichefiabile","definite-error-unrecognized-form-masculine-neuter-singular":"lichefiabilul","definite-error-unrecognized-form-feminine-singular":"lichefiabila","definite-error-unrecognized-form-masculine-plural":"lichefiabilii","definite-error-unrecognized-form-feminine-neuter-plural":"lichefiabilele"}},{"word":"lichefiant","pos":"adj","definitions":["liquefying"],"forms":{"feminine-singular":"lichefiantă","masculine-plural":"lichefianți","feminine-neuter-plural":"lichefiante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lichefiant","error-unrecognized-form-feminine-indefinite-singular":"lichefiantă","error-unrecognized-form-indefinite-masculine-plural":"lichefianți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lichefiante","definite-error-unrecognized-form-masculine-neuter-singular":"lichefiantul","definite-error-unrecognized-form-feminine-singular":"lichefianta","definite-error-unrecognized-form-masculine-plural":"lichefianții","definite-error-unrecognized-form-feminine-neuter-plural":"lichefiantele"}},{"word":"lichefiat","pos":"adj","definitions":["liquefied"],"forms":{"feminine-singular":"lichefiată","masculine-plural":"lichefiați","feminine-neuter-plural":"lichefiate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lichefiat","error-unrecognized-form-feminine-indefinite-singular":"lichefiată","error-unrecognized-form-indefinite-masculine-plural":"lichefiați","error-unrecognized-form-feminine-indefinite-neuter-plural":"lichefiate","definite-error-unrecognized-form-masculine-neuter-singular":"lichefiatul","definite-error-unrecognized-form-feminine-singular":"lichefiata","definite-error-unrecognized-form-masculine-plural":"lichefiații","definite-error-unrecognized-form-feminine-neuter-plural":"lichefiatele"}},{"word":"lichefiere","pos":"noun","definitions":["liquefaction"],"forms":{"plural":"lichefieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lichefiere","accusative-definite-nominative-singular":"lichefierea","accusative-indefinite-nominative-plural":"lichefieri","accusative-definite-nominative-plural":"lichefierile","dative-genitive-indefinite-singular":"lichefieri","dative-definite-genitive-singular":"lichefierii","dative-genitive-indefinite-plural":"lichefieri","dative-definite-genitive-plural":"lichefierilor","singular-vocative":"lichefiere","plural-vocative":"lichefierilor"}},{"word":"lichele","pos":"noun","definitions":["plural of lichea"]},{"word":"lichelie","pos":"noun","definitions":["rascaldom"],"forms":{"plural":"lichelii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lichelie","accusative-definite-nominative-singular":"lichelia","accusative-indefinite-nominative-plural":"lichelii","accusative-definite-nominative-plural":"licheliile","dative-genitive-indefinite-singular":"lichelii","dative-definite-genitive-singular":"licheliei","dative-genitive-indefinite-plural":"lichelii","dative-definite-genitive-plural":"licheliilor","singular-vocative":"lichelie","plural-vocative":"licheliilor"}},{"word":"lichelism","pos":"noun","definitions":["rascaldom"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lichelism","accusative-definite-nominative-singular":"lichelismul","accusative-indefinite-nominative-plural":"lichelisme","accusative-definite-nominative-plural":"lichelismele","dative-genitive-indefinite-singular":"lichelism","dative-definite-genitive-singular":"lichelismului","dative-genitive-indefinite-plural":"lichelisme","dative-definite-genitive-plural":"lichelismelor","singular-vocative":"lichelismule","plural-vocative":"lichelismelor"}},{"word":"licheluță","pos":"noun","definitions":["diminutive of lichea"],"forms":{"plural":"licheluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"licheluță","accusative-definite-nominative-singular":"licheluța","accusative-indefinite-nominative-plural":"licheluțe","accusative-definite-nominative-plural":"licheluțele","dative-genitive-indefinite-singular":"licheluțe","dative-definite-genitive-singular":"licheluței","dative-genitive-indefinite-plural":"licheluțe","dative-definite-genitive-plural":"licheluțelor","singular-vocative":"licheluță","plural-vocative":"licheluțelor"}},{"word":"lichen","pos":"noun","definitions":["lichen"],"forms":{"plural":"licheni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lichen","accusative-definite-nominative-singular":"lichenul","accusative-indefinite-nominative-plural":"licheni","accusative-definite-nominative-plural":"lichenii","dative-genitive-indefinite-singular":"lichen","dative-definite-genitive-singular":"lichenului","dative-genitive-indefinite-plural":"licheni","dative-definite-genitive-plural":"lichenilor","singular-vocative":"lichenule","plural-vocative":"lichenilor"}},{"word":"lichenic","pos":"adj","definitions":["lichenic"],"forms":{"feminine-singular":"lichenică","masculine-plural":"lichenici","feminine-neuter-plural":"lichenice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lichenic","error-unrecognized-form-feminine-indefinite-singular":"lichenică","error-unrecognized-form-indefinite-masculine-plural":"lichenici","error-unrecognized-form-feminine-indefinite-neuter-plural":"lichenice","definite-error-unrecognized-form-masculine-neuter-singular":"lichenicul","definite-error-unrecognized-form-feminine-singular":"lichenica","definite-error-unrecognized-form-masculine-plural":"lichenicii","definite-error-unrecognized-form-feminine-neuter-plural":"lichenicele"}},{"word":"lichenificare","pos":"noun","definitions":["lichenification"],"forms":{"plural":"lichenificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lichenificare","accusative-definite-nominative-singular":"lichenificarea","accusative-indefinite-nominative-plural":"lichenificări","accusative-definite-nominative-plural":"lichenificările","dative-genitive-indefinite-singular":"lichenificări","dative-definite-genitive-singular":"lichenificării","dative-genitive-indefinite-plural":"lichenificări","dative-definite-genitive-plural":"lichenificărilor","singular-vocative":"lichenificare","plural-vocative":"lichenificărilor"}},{"word":"lichenină","pos":"noun","definitions":["lichenin"],"forms":{"plural":"lichenine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lichenină","accusative-definite-nominative-singular":"lichenina","accusative-indefinite-nominative-plural":"lichenine","accusative-definite-nominative-plural":"licheninele","dative-genitive-indefinite-singular":"lichenine","dative-definite-genitive-singular":"licheninei","dative-genitive-indefinite-plural":"lichenine","dative-definite-genitive-plural":"licheninelor","singular-vocative":"lichenină","plural-vocative":"licheninelor"}},{"word":"lichenolog","pos":"noun","definitions":["lichenologist"],"forms":{"plural":"lichenologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lichenolog","accusative-definite-nominative-singular":"lichenologul","accusative-indefinite-nominative-plural":"lichenologi","accusative-definite-nominative-plural":"lichenologii","dative-genitive-indefinite-singular":"lichenolog","dative-definite-genitive-singular":"lichenologului","dative-genitive-indefinite-plural":"lichenologi","dative-definite-genitive-plural":"lichenologilor","singular-vocative":"lichenologule","plural-vocative":"lichenologilor"}},{"word":"lichenologă","pos":"noun","definitions":["female equivalent of lichenolog"],"forms":{"plural":"lichenologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lichenologă","accusative-definite-nominative-singular":"lichenologa","accusative-indefinite-nominative-plural":"lichenologe","accusative-definite-nominative-plural":"lichenologele","dative-genitive-indefinite-singular":"lichenologe","dative-definite-genitive-singular":"lichenologei","dative-genitive-indefinite-plural":"lichenologe","dative-definite-genitive-plural":"lichenologelor","singular-vocative":"lichenologă","plural-vocative":"lichenologelor"}},{"word":"lichenologie","pos":"noun","definitions":["lichenology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"lichenologie","accusative-definite-nominative":"lichenologia","dative-genitive-indefinite":"lichenologii","dative-definite-genitive":"lichenologiei","vocative":"lichenologie"}},{"word":"Lichiardopol","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Lichiardopol"}},{"word":"lichid","pos":"adj","definitions":["liquid, fluid, molten"],"pronunciation":"/liˈkid/","forms":{"feminine-singular":"lichidă","masculine-plural":"lichizi","feminine-neuter-plural":"lichide","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"lichid","error-unrecognized-form-feminine-indefinite-singular":"lichidă","error-unrecognized-form-indefinite-masculine-plural":"lichizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lichide","definite-error-unrecognized-form-masculine-neuter-singular":"lichidul","definite-error-unrecognized-form-feminine-singular":"lichida","definite-error-unrecognized-form-masculine-plural":"lichizii","definite-error-unrecognized-form-feminine-neuter-plural":"lichidele","alternative":"ликид"}},{"word":"lichid","pos":"noun","definitions":["liquid"],"pronunciation":"/liˈkid/","forms":{"plural":"lichide","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lichid","accusative-definite-nominative-singular":"lichidul","accusative-indefinite-nominative-plural":"lichide","accusative-definite-nominative-plural":"lichidele","dative-genitive-indefinite-singular":"lichid","dative-definite-genitive-singular":"lichidului","dative-genitive-indefinite-plural":"lichide","dative-definite-genitive-plural":"lichidelor","singular-vocative":"lichidule","plural-vocative":"lichidelor","alternative":"ликид"}},{"word":"lichid amniotic","pos":"noun","definitions":["amniotic fluid"]},{"word":"lichid cefalorahidian","pos":"noun","definitions":["cerebrospinal fluid"]},{"word":"lichid de frână","pos":"noun","definitions":["brake fluid"]},{"word":"lichid preejaculator","pos":"noun","definitions":["pre-ejaculate, Cowper's fluid, precum"],"pronunciation":"[liˈkid pre.e.ˌʒa.ku.laˈtor]","forms":{"table-tags":"no-table-tags","accusative-indefinite-nominative":"lichid preejaculator","accusative-definite-nominative":"lichidul preejaculator","dative-genitive-indefinite":"lichid preejaculator","dative-definite-genitive":"lichidului preejaculator","vocative":"-"}},{"word":"lichida","pos":"verb","definitions":["to liquidate"],"forms":{"canonical":"a lichida 1st conjugation","present-singular-third-person":"lichidează","participle-past":"lichidat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a lichida","gerund":"lichidând","first-person-indicative-present-singular":"lichidez","indicative-present-second-person-singular":"lichidezi","indicative-present-singular-third-person":"lichidează","first-person-indicative-plural-present":"lichidăm","indicative-plural-present-second-person":"lichidați","indicative-plural-present-third-person":"lichidează","first-person-imperfect-indicative-singular":"lichidam","imperfect-indicative-second-person-singular":"lichidai","imperfect-indicative-singular-third-person":"lichida","first-person-imperfect-indicative-plural":"lichidam","imperfect-indicative-plural-second-person":"lichidați","imperfect-indicative-plural-third-person":"lichidau","first-person-indicative-perfect-singular":"lichidai","indicative-perfect-second-person-singular":"lichidași","indicative-perfect-singular-third-person":"lichidă","first-person-indicative-perfect-plural":"lichidarăm","indicative-perfect-plural-second-person":"lichidarăți","indicative-perfect-plural-third-person":"lichidară","first-person-indicative-pluperfect-singular":"lichidasem","indicative-pluperfect-second-person-singular":"lichidaseși","indicative-pluperfect-singular-third-person":"lichidase","first-person-indicative-pluperfect-plural":"lichidaserăm","indicative-pluperfect-plural-second-person":"lichidaserăți","indicative-pluperfect-plural-third-person":"lichidaseră","first-person-present-singular-subjunctive":"să lichidez","present-second-person-singular-subjunctive":"să lichidezi","present-singular-subjunctive-third-person":"să lichideze","first-person-plural-present-subjunctive":"să lichidăm","plural-present-second-person-subjunctive":"să lichidați","plural-present-subjunctive-third-person":"să lichideze","imperative-second-person-singular":"lichidează","imperative-plural-second-person":"lichidați","imperative-negative-second-person-singular":"nu lichida","imperative-negative-plural-second-person":"nu lichidați"}},{"word":"lichidă","pos":"adj","definitions":["nominative/accusative feminine singular of lichid"],"pronunciation":"[liˈki.də]"},{"word":"lichidă","pos":"noun","definitions":["liquid"],"pronunciation":"[liˈki.də]","forms":{"plural":"lichide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lichidă","accusative-definite-nominative-singular":"lichida","accusative-indefinite-nominative-plural":"lichide","accusative-definite-nominative-plural":"lichidele","dative-genitive-indefinite-singular":"lichide","dative-definite-genitive-singular":"lichidei","dative-genitive-indefinite-plural":"lichide","dative-definite-genitive-plural":"lichidelor","singular-vocative":"lichidă","plural-vocative":"lichidelor"}},{"word":"lichidabil","pos":"adj","definitions":["liquidable"],"forms":{"feminine-singular":"lichidabilă","masculine-plural":"lichidabili","feminine-neuter-plural":"lichidabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lichidabil","error-unrecognized-form-feminine-indefinite-singular":"lichidabilă","error-unrecognized-form-indefinite-masculine-plural":"lichidabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"lichidabile","definite-error-unrecognized-form-masculine-neuter-singular":"lichidabilul","definite-error-unrecognized-form-feminine-singular":"lichidabila","definite-error-unrecognized-form-masculine-plural":"lichidabilii","definite-error-unrecognized-form-feminine-neuter-plural":"lichidabilele"}},{"word":"lichidare","pos":"noun","definitions":["liquidation"],"forms":{"plural":"lichidări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lichidare","accusative-definite-nominative-singular":"lichidarea","accusative-indefinite-nominative-plural":"lichidări","accusative-definite-nominative-plural":"lichidările","dative-genitive-indefinite-singular":"lichidări","dative-definite-genitive-singular":"lichidării","dative-genitive-indefinite-plural":"lichidări","dative-definite-genitive-plural":"lichidărilor","singular-vocative":"lichidare","plural-vocative":"lichidărilor"}},{"word":"lichidat","pos":"adj","definitions":["assassinated"],"forms":{"feminine-singular":"lichidată","masculine-plural":"lichidați","feminine-neuter-plural":"lichidate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lichidat","error-unrecognized-form-feminine-indefinite-singular":"lichidată","error-unrecognized-form-indefinite-masculine-plural":"lichidați","error-unrecognized-form-feminine-indefinite-neuter-plural":"lichidate","definite-error-unrecognized-form-masculine-neuter-singular":"lichidatul","definite-error-unrecognized-form-feminine-singular":"lichidata","definite-error-unrecognized-form-masculine-plural":"lichidații","definite-error-unrecognized-form-feminine-neuter-plural":"lichidatele"}},{"word":"lichidat","pos":"verb","definitions":["past participle of lichida"],"forms":{"participle-past":"of lichida"}},{"word":"lichidație","pos":"noun","definitions":["liquidation"],"forms":{"plural":"lichidații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lichidație","accusative-definite-nominative-singular":"lichidația","accusative-indefinite-nominative-plural":"lichidații","accusative-definite-nominative-plural":"lichidațiile","dative-genitive-indefinite-singular":"lichidații","dative-definite-genitive-singular":"lichidației","dative-genitive-indefinite-plural":"lichidații","dative-definite-genitive-plural":"lichidațiilor","singular-vocative":"lichidație","plural-vocative":"lichidațiilor"}},{"word":"lichidațiune","pos":"noun","definitions":["obsolete form of lichidație"],"forms":{"plural":"lichidațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lichidațiune","accusative-definite-nominative-singular":"lichidațiunea","accusative-indefinite-nominative-plural":"lichidațiuni","accusative-definite-nominative-plural":"lichidațiunile","dative-genitive-indefinite-singular":"lichidațiuni","dative-definite-genitive-singular":"lichidațiunii","dative-genitive-indefinite-plural":"lichidațiuni","dative-definite-genitive-plural":"lichidațiunilor","singular-vocative":"lichidațiune","plural-vocative":"lichidațiunilor"}},{"word":"lichidatoare","pos":"noun","definitions":["female equivalent of lichidator"],"forms":{"plural":"lichidatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"lichidatoare","accusative-definite-nominative-singular":"lichidatoarea","accusative-indefinite-nominative-plural":"lichidatoare","accusative-definite-nominative-plural":"lichidatoarele","dative-genitive-indefinite-singular":"lichidatoare","dative-definite-genitive-singular":"lichidatoarei","dative-genitive-indefinite-plural":"lichidatoare","dative-definite-genitive-plural":"lichidatoarelor","singular-vocative":"lichidatoare","plural-vocative":"lichidatoarelor"}},{"word":"lichidator","pos":"noun","definitions":["liquidator"],"forms":{"plural":"lichidatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lichidator","accusative-definite-nominative-singular":"lichidatorul","accusative-indefinite-nominative-plural":"lichidatori","accusative-definite-nominative-plural":"lichidatorii","dative-genitive-indefinite-singular":"lichidator","dative-definite-genitive-singular":"lichidatorului","dative-genitive-indefinite-plural":"lichidatori","dative-definite-genitive-plural":"lichidatorilor","singular-vocative":"lichidatorule","plural-vocative":"lichidatorilor"}},{"word":"lichidatorism","pos":"noun","definitions":["liquidationism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lichidatorism","accusative-definite-nominative-singular":"lichidatorismul","accusative-indefinite-nominative-plural":"-","accusative-definite-nominative-plural":"-le","dative-genitive-indefinite-singular":"lichidatorism","dative-definite-genitive-singular":"lichidatorismului","dative-genitive-indefinite-plural":"-","dative-definite-genitive-plural":"-lor","singular-vocative":"lichidatorismule","plural-vocative":"-lor"}},{"word":"lichidatorist","pos":"adj","definitions":["liquidationist"],"forms":{"feminine-singular":"lichidatoristă","masculine-plural":"lichidatoriști","feminine-neuter-plural":"lichidatoriste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lichidatorist","error-unrecognized-form-feminine-indefinite-singular":"lichidatoristă","error-unrecognized-form-indefinite-masculine-plural":"lichidatoriști","error-unrecognized-form-feminine-indefinite-neuter-plural":"lichidatoriste","definite-error-unrecognized-form-masculine-neuter-singular":"lichidatoristul","definite-error-unrecognized-form-feminine-singular":"lichidatorista","definite-error-unrecognized-form-masculine-plural":"lichidatoriștii","definite-error-unrecognized-form-feminine-neuter-plural":"lichidatoristele"}},{"word":"lichidatorist","pos":"noun","definitions":["liquidationist"],"forms":{"plural":"lichidatoriști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lichidatorist","accusative-definite-nominative-singular":"lichidatoristul","accusative-indefinite-nominative-plural":"lichidatoriști","accusative-definite-nominative-plural":"lichidatoriștii","dative-genitive-indefinite-singular":"lichidatorist","dative-definite-genitive-singular":"lichidatoristului","dative-genitive-indefinite-plural":"lichidatoriști","dative-definite-genitive-plural":"lichidatoriștilor","singular-vocative":"lichidatoristule","plural-vocative":"lichidatoriștilor"}},{"word":"lichidian","pos":"adj","definitions":["liquid"],"forms":{"feminine-singular":"lichidiană","masculine-plural":"lichidieni","feminine-neuter-plural":"lichidiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lichidian","error-unrecognized-form-feminine-indefinite-singular":"lichidiană","error-unrecognized-form-indefinite-masculine-plural":"lichidieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"lichidiene","definite-error-unrecognized-form-masculine-neuter-singular":"lichidianul","definite-error-unrecognized-form-feminine-singular":"lichidiana","definite-error-unrecognized-form-masculine-plural":"lichidienii","definite-error-unrecognized-form-feminine-neuter-plural":"lichidienele"}},{"word":"lichiditate","pos":"noun","definitions":["liquidity"],"pronunciation":"/li.ki.diˈta.te/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"lichiditate","accusative-definite-nominative":"lichiditatea","dative-genitive-indefinite":"lichidități","dative-definite-genitive":"lichidității","vocative":"lichiditate"}},{"word":"lichineală","pos":"noun","definitions":["adorning"],"forms":{"plural":"lichineli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lichineală","accusative-definite-nominative-singular":"lichineala","accusative-indefinite-nominative-plural":"lichinele","accusative-definite-nominative-plural":"lichinelele","dative-genitive-indefinite-singular":"lichinele","dative-definite-genitive-singular":"lichinelei","dative-genitive-indefinite-plural":"lichinele","dative-definite-genitive-plural":"lichinelelor","singular-vocative":"lichineală","plural-vocative":"lichinelelor"}},{"word":"lichior","pos":"noun","definitions":["liqueur"],"forms":{"plural":"lichioruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lichior","accusative-definite-nominative-singular":"lichiorul","accusative-indefinite-nominative-plural":"lichiore","accusative-definite-nominative-plural":"lichiorele","dative-genitive-indefinite-singular":"lichior","dative-definite-genitive-singular":"lichiorului","dative-genitive-indefinite-plural":"lichiore","dative-definite-genitive-plural":"lichiorelor","singular-vocative":"lichiorule","plural-vocative":"lichiorelor"}},{"word":"lichiorist","pos":"noun","definitions":["distiller or liqueur seller"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"lichiorist","accusative-definite-nominative":"lichioristul","dative-genitive-indefinite":"lichiorist","dative-definite-genitive":"lichioristului","vocative":"lichioristule"}},{"word":"Lichitișeni","pos":"name","definitions":["a village in Vultureni, Bacău County, Romania"],"gender":"m"},{"word":"Licia","pos":"name","definitions":["Lycia (a historical region in southwestern Asia Minor, in modern-day Turkey)","Lycia (a former province of the Roman Empire, existing on its own from 43 AD to 74 AD, and later as part of Lycia et Pamphylia)"],"gender":"f"},{"word":"licit","pos":"adj","definitions":["lawful"],"forms":{"feminine-singular":"licită","masculine-plural":"liciți","feminine-neuter-plural":"licite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"licit","error-unrecognized-form-feminine-indefinite-singular":"licită","error-unrecognized-form-indefinite-masculine-plural":"liciți","error-unrecognized-form-feminine-indefinite-neuter-plural":"licite","definite-error-unrecognized-form-masculine-neuter-singular":"licitul","definite-error-unrecognized-form-feminine-singular":"licita","definite-error-unrecognized-form-masculine-plural":"liciții","definite-error-unrecognized-form-feminine-neuter-plural":"licitele"}},{"word":"licita","pos":"verb","definitions":["to bid (in an auction)"],"forms":{"canonical":"a licita 1st conjugation","present-singular-third-person":"licitează","participle-past":"licitat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a licita","gerund":"licitând","first-person-indicative-present-singular":"licitez","indicative-present-second-person-singular":"licitezi","indicative-present-singular-third-person":"licitează","first-person-indicative-plural-present":"licităm","indicative-plural-present-second-person":"licitați","indicative-plural-present-third-person":"licitează","first-person-imperfect-indicative-singular":"licitam","imperfect-indicative-second-person-singular":"licitai","imperfect-indicative-singular-third-person":"licita","first-person-imperfect-indicative-plural":"licitam","imperfect-indicative-plural-second-person":"licitați","imperfect-indicative-plural-third-person":"licitau","first-person-indicative-perfect-singular":"licitai","indicative-perfect-second-person-singular":"licitași","indicative-perfect-singular-third-person":"licită","first-person-indicative-perfect-plural":"licitarăm","indicative-perfect-plural-second-person":"licitarăți","indicative-perfect-plural-third-person":"licitară","first-person-indicative-pluperfect-singular":"licitasem","indicative-pluperfect-second-person-singular":"licitaseși","indicative-pluperfect-singular-third-person":"licitase","first-person-indicative-pluperfect-plural":"licitaserăm","indicative-pluperfect-plural-second-person":"licitaserăți","indicative-pluperfect-plural-third-person":"licitaseră","first-person-present-singular-subjunctive":"să licitez","present-second-person-singular-subjunctive":"să licitezi","present-singular-subjunctive-third-person":"să liciteze","first-person-plural-present-subjunctive":"să licităm","plural-present-second-person-subjunctive":"să licitați","plural-present-subjunctive-third-person":"să liciteze","imperative-second-person-singular":"licitează","imperative-plural-second-person":"licitați","imperative-negative-second-person-singular":"nu licita","imperative-negative-plural-second-person":"nu licitați"}},{"word":"licitantă","pos":"noun","definitions":["female equivalent of licitant"],"forms":{"plural":"licitante","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"licitantă","accusative-definite-nominative-singular":"licitanta","accusative-indefinite-nominative-plural":"licitante","accusative-definite-nominative-plural":"licitantele","dative-genitive-indefinite-singular":"licitante","dative-definite-genitive-singular":"licitantei","dative-genitive-indefinite-plural":"licitante","dative-definite-genitive-plural":"licitantelor","singular-vocative":"licitantă","plural-vocative":"licitantelor"}},{"word":"licitare","pos":"noun","definitions":["bidding"],"forms":{"plural":"licitări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"licitare","accusative-definite-nominative-singular":"licitarea","accusative-indefinite-nominative-plural":"licitări","accusative-definite-nominative-plural":"licitările","dative-genitive-indefinite-singular":"licitări","dative-definite-genitive-singular":"licitării","dative-genitive-indefinite-plural":"licitări","dative-definite-genitive-plural":"licitărilor","singular-vocative":"licitare","plural-vocative":"licitărilor"}},{"word":"licitație","pos":"noun","definitions":["auction"],"forms":{"plural":"licitații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"licitație","accusative-definite-nominative-singular":"licitația","accusative-indefinite-nominative-plural":"licitații","accusative-definite-nominative-plural":"licitațiile","dative-genitive-indefinite-singular":"licitații","dative-definite-genitive-singular":"licitației","dative-genitive-indefinite-plural":"licitații","dative-definite-genitive-plural":"licitațiilor","singular-vocative":"licitație","plural-vocative":"licitațiilor"}},{"word":"licitațiune","pos":"noun","definitions":["alternative form of licitație"],"forms":{"plural":"licitațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"licitațiune","accusative-definite-nominative-singular":"licitațiunea","accusative-indefinite-nominative-plural":"licitațiuni","accusative-definite-nominative-plural":"licitațiunile","dative-genitive-indefinite-singular":"licitațiuni","dative-definite-genitive-singular":"licitațiunii","dative-genitive-indefinite-plural":"licitațiuni","dative-definite-genitive-plural":"licitațiunilor","singular-vocative":"licitațiune","plural-vocative":"licitațiunilor"}},{"word":"liciuit","pos":"noun","definitions":["squeeze, squeezing"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"liciuit","accusative-definite-nominative":"liciuitul","dative-genitive-indefinite":"liciuit","dative-definite-genitive":"liciuitului","vocative":"liciuitule"}},{"word":"licoare","pos":"noun","definitions":["drink"],"forms":{"plural":"licori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"licoare","accusative-definite-nominative-singular":"licoarea","accusative-indefinite-nominative-plural":"licori","accusative-definite-nominative-plural":"licorile","dative-genitive-indefinite-singular":"licori","dative-definite-genitive-singular":"licorii","dative-genitive-indefinite-plural":"licori","dative-definite-genitive-plural":"licorilor","singular-vocative":"licoare","plural-vocative":"licorilor"}},{"word":"Licoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Licoiu"}},{"word":"licopod","pos":"noun","definitions":["obsolete form of licopodiu"],"forms":{"plural":"licopode","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"licopod","accusative-definite-nominative-singular":"licopodul","accusative-indefinite-nominative-plural":"licopode","accusative-definite-nominative-plural":"licopodele","dative-genitive-indefinite-singular":"licopod","dative-definite-genitive-singular":"licopodului","dative-genitive-indefinite-plural":"licopode","dative-definite-genitive-plural":"licopodelor","singular-vocative":"licopodule","plural-vocative":"licopodelor"}},{"word":"licopodiu","pos":"noun","definitions":["lycopodium"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"licopodiu","accusative-definite-nominative":"licopodiul","dative-genitive-indefinite":"licopodiu","dative-definite-genitive":"licopodiului","vocative":"licopodiule"}},{"word":"licorexie","pos":"noun","definitions":["lycorexia"],"forms":{"plural":"licorexii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"licorexie","accusative-definite-nominative-singular":"licorexia","accusative-indefinite-nominative-plural":"licorexii","accusative-definite-nominative-plural":"licorexiile","dative-genitive-indefinite-singular":"licorexii","dative-definite-genitive-singular":"licorexiei","dative-genitive-indefinite-plural":"licorexii","dative-definite-genitive-plural":"licorexiilor","singular-vocative":"licorexie","plural-vocative":"licorexiilor"}},{"word":"licorin","pos":"noun","definitions":["alternative form of licurin"],"forms":{"plural":"licorini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"licorin","accusative-definite-nominative-singular":"licorinul","accusative-indefinite-nominative-plural":"licorini","accusative-definite-nominative-plural":"licorinii","dative-genitive-indefinite-singular":"licorin","dative-definite-genitive-singular":"licorinului","dative-genitive-indefinite-plural":"licorini","dative-definite-genitive-plural":"licorinilor","singular-vocative":"licorinule","plural-vocative":"licorinilor"}},{"word":"licorn","pos":"noun","definitions":["unicorn"],"forms":{"plural":"licorni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"licorn","accusative-definite-nominative-singular":"licornul","accusative-indefinite-nominative-plural":"licorni","accusative-definite-nominative-plural":"licornii","dative-genitive-indefinite-singular":"licorn","dative-definite-genitive-singular":"licornului","dative-genitive-indefinite-plural":"licorni","dative-definite-genitive-plural":"licornilor","singular-vocative":"licornule","plural-vocative":"licornilor"}},{"word":"licoros","pos":"adj","definitions":["syrupy"],"forms":{"feminine-singular":"licoroasă","masculine-plural":"licoroși","feminine-neuter-plural":"licoroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"licoros","error-unrecognized-form-feminine-indefinite-singular":"licoroasă","error-unrecognized-form-indefinite-masculine-plural":"licoroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"licoroase","definite-error-unrecognized-form-masculine-neuter-singular":"licorosul","definite-error-unrecognized-form-feminine-singular":"licoroasa","definite-error-unrecognized-form-masculine-plural":"licoroșii","definite-error-unrecognized-form-feminine-neuter-plural":"licoroasele"}},{"word":"licreanță","pos":"noun","definitions":["earwig"],"forms":{"plural":"licreanțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"licreanță","accusative-definite-nominative-singular":"licreanța","accusative-indefinite-nominative-plural":"licreanțe","accusative-definite-nominative-plural":"licreanțele","dative-genitive-indefinite-singular":"licreanțe","dative-definite-genitive-singular":"licreanței","dative-genitive-indefinite-plural":"licreanțe","dative-definite-genitive-plural":"licreanțelor","singular-vocative":"licreanță","plural-vocative":"licreanțelor"}},{"word":"Licsandroiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Licsandroiu"}},{"word":"lictar","pos":"noun","definitions":["jam, marmalade"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lictar","accusative-definite-nominative":"lictarul","dative-genitive-indefinite":"lictar","dative-definite-genitive":"lictarului","vocative":"lictarule"}},{"word":"lictor","pos":"noun","definitions":["lictor (an officer in Ancient Rome)"],"forms":{"plural":"lictori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lictor","accusative-definite-nominative-singular":"lictorul","accusative-indefinite-nominative-plural":"lictori","accusative-definite-nominative-plural":"lictorii","dative-genitive-indefinite-singular":"lictor","dative-definite-genitive-singular":"lictorului","dative-genitive-indefinite-plural":"lictori","dative-definite-genitive-plural":"lictorilor","singular-vocative":"lictorule","plural-vocative":"lictorilor"}},{"word":"licuație","pos":"noun","definitions":["liquefaction"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"licuație","accusative-definite-nominative-singular":"licuația","accusative-indefinite-nominative-plural":"licuații","accusative-definite-nominative-plural":"licuațiile","dative-genitive-indefinite-singular":"licuații","dative-definite-genitive-singular":"licuației","dative-genitive-indefinite-plural":"licuații","dative-definite-genitive-plural":"licuațiilor","singular-vocative":"licuație","plural-vocative":"licuațiilor"}},{"word":"licuid","pos":"adj","definitions":["obsolete form of lichid"],"forms":{"feminine-singular":"licuidă","masculine-plural":"licuizi","feminine-neuter-plural":"licuide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"licuid","error-unrecognized-form-feminine-indefinite-singular":"licuidă","error-unrecognized-form-indefinite-masculine-plural":"licuizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"licuide","definite-error-unrecognized-form-masculine-neuter-singular":"licuidul","definite-error-unrecognized-form-feminine-singular":"licuida","definite-error-unrecognized-form-masculine-plural":"licuizii","definite-error-unrecognized-form-feminine-neuter-plural":"licuidele"}},{"word":"Liculescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Liculescu"}},{"word":"licur","pos":"noun","definitions":["alternative form of licăr"],"forms":{"plural":"licure","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"licur","accusative-definite-nominative-singular":"licurul","accusative-indefinite-nominative-plural":"licure","accusative-definite-nominative-plural":"licurele","dative-genitive-indefinite-singular":"licur","dative-definite-genitive-singular":"licurului","dative-genitive-indefinite-plural":"licure","dative-definite-genitive-plural":"licurelor","singular-vocative":"licurule","plural-vocative":"licurelor"}},{"word":"licura","pos":"verb","definitions":["alternative form of licări"],"forms":{"canonical":"a licura 1st conjugation","present-singular-third-person":"licură","participle-past":"licurat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a licura","gerund":"licurând","first-person-indicative-present-singular":"licur","indicative-present-second-person-singular":"licuri","indicative-present-singular-third-person":"licură","first-person-indicative-plural-present":"licurăm","indicative-plural-present-second-person":"licurați","indicative-plural-present-third-person":"licură","first-person-imperfect-indicative-singular":"licuram","imperfect-indicative-second-person-singular":"licurai","imperfect-indicative-singular-third-person":"licura","first-person-imperfect-indicative-plural":"licuram","imperfect-indicative-plural-second-person":"licurați","imperfect-indicative-plural-third-person":"licurau","first-person-indicative-perfect-singular":"licurai","indicative-perfect-second-person-singular":"licurași","indicative-perfect-singular-third-person":"licură","first-person-indicative-perfect-plural":"licurarăm","indicative-perfect-plural-second-person":"licurarăți","indicative-perfect-plural-third-person":"licurară","first-person-indicative-pluperfect-singular":"licurasem","indicative-pluperfect-second-person-singular":"licuraseși","indicative-pluperfect-singular-third-person":"licurase","first-person-indicative-pluperfect-plural":"licuraserăm","indicative-pluperfect-plural-second-person":"licuraserăți","indicative-pluperfect-plural-third-person":"licuraseră","first-person-present-singular-subjunctive":"să licur","present-second-person-singular-subjunctive":"să licuri","present-singular-subjunctive-third-person":"să licure","first-person-plural-present-subjunctive":"să licurăm","plural-present-second-person-subjunctive":"să licurați","plural-present-subjunctive-third-person":"să licure","imperative-second-person-singular":"licură","imperative-plural-second-person":"licurați","imperative-negative-second-person-singular":"nu licura","imperative-negative-plural-second-person":"nu licurați"}},{"word":"licureală","pos":"noun","definitions":["blink"],"forms":{"plural":"licureli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"licureală","accusative-definite-nominative-singular":"licureala","accusative-indefinite-nominative-plural":"licurele","accusative-definite-nominative-plural":"licurelele","dative-genitive-indefinite-singular":"licurele","dative-definite-genitive-singular":"licurelei","dative-genitive-indefinite-plural":"licurele","dative-definite-genitive-plural":"licurelelor","singular-vocative":"licureală","plural-vocative":"licurelelor"}},{"word":"licuri","pos":"verb","definitions":["alternative form of licări"],"forms":{"canonical":"a licuri 4th conjugation","present-singular-third-person":"licurește","participle-past":"licurit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a licuri","gerund":"licurind","first-person-indicative-present-singular":"licuresc","indicative-present-second-person-singular":"licurești","indicative-present-singular-third-person":"licurește","first-person-indicative-plural-present":"licurim","indicative-plural-present-second-person":"licuriți","indicative-plural-present-third-person":"licuresc","first-person-imperfect-indicative-singular":"licuream","imperfect-indicative-second-person-singular":"licureai","imperfect-indicative-singular-third-person":"licurea","first-person-imperfect-indicative-plural":"licuream","imperfect-indicative-plural-second-person":"licureați","imperfect-indicative-plural-third-person":"licureau","first-person-indicative-perfect-singular":"licurii","indicative-perfect-second-person-singular":"licuriși","indicative-perfect-singular-third-person":"licuri","first-person-indicative-perfect-plural":"licurirăm","indicative-perfect-plural-second-person":"licurirăți","indicative-perfect-plural-third-person":"licuriră","first-person-indicative-pluperfect-singular":"licurisem","indicative-pluperfect-second-person-singular":"licuriseși","indicative-pluperfect-singular-third-person":"licurise","first-person-indicative-pluperfect-plural":"licuriserăm","indicative-pluperfect-plural-second-person":"licuriserăți","indicative-pluperfect-plural-third-person":"licuriseră","first-person-present-singular-subjunctive":"să licuresc","present-second-person-singular-subjunctive":"să licurești","present-singular-subjunctive-third-person":"să licurească","first-person-plural-present-subjunctive":"să licurim","plural-present-second-person-subjunctive":"să licuriți","plural-present-subjunctive-third-person":"să licurească","imperative-second-person-singular":"licurește","imperative-plural-second-person":"licuriți","imperative-negative-second-person-singular":"nu licuri","imperative-negative-plural-second-person":"nu licuriți"}},{"word":"Licuriceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Licuriceanu"}},{"word":"Licurici","pos":"name","definitions":["a commune of Gorj County, Romania","a village in Licurici, Gorj County, Romania"],"gender":"m"},{"word":"licurici","pos":"noun","definitions":["firefly","glowworm","a power behind the scene; specifically the United States or its secret services"],"pronunciation":"/ˌlikuˈrit͡ʃʲ/","forms":{"plural":"licurici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"licurici","accusative-definite-nominative-singular":"licuriciul","accusative-indefinite-nominative-plural":"licurici","accusative-definite-nominative-plural":"licuricii","dative-genitive-indefinite-singular":"licurici","dative-definite-genitive-singular":"licuriciului","dative-genitive-indefinite-plural":"licurici","dative-definite-genitive-plural":"licuricilor","singular-vocative":"licuriciule","plural-vocative":"licuricilor"}},{"word":"Licuriciu","pos":"name","definitions":["a village in Călinești, Teleorman County, Romania"],"gender":"m"},{"word":"licuriciul","pos":"noun","definitions":["definite nominative/accusative singular of licurici"]},{"word":"licurin","pos":"noun","definitions":["smoked grey mullet"],"forms":{"plural":"licurini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"licurin","accusative-definite-nominative-singular":"licurinul","accusative-indefinite-nominative-plural":"licurini","accusative-definite-nominative-plural":"licurinii","dative-genitive-indefinite-singular":"licurin","dative-definite-genitive-singular":"licurinului","dative-genitive-indefinite-plural":"licurini","dative-definite-genitive-plural":"licurinilor","singular-vocative":"licurinule","plural-vocative":"licurinilor"}},{"word":"licurire","pos":"noun","definitions":["alternative form of licărire"],"forms":{"plural":"licuriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"licurire","accusative-definite-nominative-singular":"licurirea","accusative-indefinite-nominative-plural":"licuriri","accusative-definite-nominative-plural":"licuririle","dative-genitive-indefinite-singular":"licuriri","dative-definite-genitive-singular":"licuririi","dative-genitive-indefinite-plural":"licuriri","dative-definite-genitive-plural":"licuririlor","singular-vocative":"licurire","plural-vocative":"licuririlor"}},{"word":"licvid","pos":"adj","definitions":["obsolete form of lichid"],"forms":{"feminine-singular":"licvidă","masculine-plural":"licvizi","feminine-neuter-plural":"licvide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"licvid","error-unrecognized-form-feminine-indefinite-singular":"licvidă","error-unrecognized-form-indefinite-masculine-plural":"licvizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"licvide","definite-error-unrecognized-form-masculine-neuter-singular":"licvidul","definite-error-unrecognized-form-feminine-singular":"licvida","definite-error-unrecognized-form-masculine-plural":"licvizii","definite-error-unrecognized-form-feminine-neuter-plural":"licvidele"}},{"word":"lider","pos":"noun","definitions":["leader (of a party or organization)"],"forms":{"plural":"lideri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lider","accusative-definite-nominative-singular":"liderul","accusative-indefinite-nominative-plural":"lideri","accusative-definite-nominative-plural":"liderii","dative-genitive-indefinite-singular":"lider","dative-definite-genitive-singular":"liderului","dative-genitive-indefinite-plural":"lideri","dative-definite-genitive-plural":"liderilor","singular-vocative":"liderule","plural-vocative":"liderilor"}},{"word":"lidian","pos":"noun","definitions":["Lydian"],"forms":{"plural":"lidieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lidian","accusative-definite-nominative-singular":"lidianul","accusative-indefinite-nominative-plural":"lidieni","accusative-definite-nominative-plural":"lidienii","dative-genitive-indefinite-singular":"lidian","dative-definite-genitive-singular":"lidianului","dative-genitive-indefinite-plural":"lidieni","dative-definite-genitive-plural":"lidienilor","singular-vocative":"lidianule","plural-vocative":"lidienilor"}},{"word":"lidiană","pos":"noun","definitions":["female equivalent of lidian"],"forms":{"plural":"lidiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lidiană","accusative-definite-nominative-singular":"lidiana","accusative-indefinite-nominative-plural":"lidiene","accusative-definite-nominative-plural":"lidienele","dative-genitive-indefinite-singular":"lidiene","dative-definite-genitive-singular":"lidienei","dative-genitive-indefinite-plural":"lidiene","dative-definite-genitive-plural":"lidienelor","singular-vocative":"lidiană","plural-vocative":"lidienelor"}},{"word":"lidită","pos":"noun","definitions":["lyddite"],"forms":{"plural":"lidite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lidită","accusative-definite-nominative-singular":"lidita","accusative-indefinite-nominative-plural":"lidite","accusative-definite-nominative-plural":"liditele","dative-genitive-indefinite-singular":"lidite","dative-definite-genitive-singular":"liditei","dative-genitive-indefinite-plural":"lidite","dative-definite-genitive-plural":"liditelor","singular-vocative":"lidită","plural-vocative":"liditelor"}},{"word":"lidiu","pos":"noun","definitions":["Lydian"],"forms":{"plural":"lidii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lidiu","accusative-definite-nominative-singular":"lidiuul","accusative-indefinite-nominative-plural":"lidii","accusative-definite-nominative-plural":"lidiii","dative-genitive-indefinite-singular":"lidiu","dative-definite-genitive-singular":"lidiuului","dative-genitive-indefinite-plural":"lidii","dative-definite-genitive-plural":"lidiilor","singular-vocative":"lidiuule","plural-vocative":"lidiilor"}},{"word":"lidocaină","pos":"noun","definitions":["lidocaine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lidocaină","accusative-definite-nominative-singular":"lidocaina","accusative-indefinite-nominative-plural":"lidocaine","accusative-definite-nominative-plural":"lidocainele","dative-genitive-indefinite-singular":"lidocaine","dative-definite-genitive-singular":"lidocainei","dative-genitive-indefinite-plural":"lidocaine","dative-definite-genitive-plural":"lidocainelor","singular-vocative":"lidocaină","plural-vocative":"lidocainelor"}},{"word":"Lidovca","pos":"name","definitions":["a village in Alexeevca, Ungheni Raion, Moldova"],"gender":"f"},{"word":"Liebling","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Liebling, Timiș County, Romania"],"gender":"m"},{"word":"Liechtenstein","pos":"name","definitions":["Liechtenstein (a microstate in Central Europe)"],"pronunciation":"/lih.tenˈʃtajn/","gender":"n","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"Liechtenstein","accusative-definite-nominative":"Liechtensteinul","dative-genitive-indefinite":"Liechtenstein","dative-definite-genitive":"Liechtensteinului","vocative":"Liechtensteinule"}},{"word":"liechtensteinian","pos":"adj","definitions":["Liechtensteinian"],"forms":{"feminine-singular":"liechtensteiniană","masculine-plural":"liechtensteinieni","feminine-neuter-plural":"liechtensteiniene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liechtensteinian","error-unrecognized-form-feminine-indefinite-singular":"liechtensteiniană","error-unrecognized-form-indefinite-masculine-plural":"liechtensteinieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"liechtensteiniene","definite-error-unrecognized-form-masculine-neuter-singular":"liechtensteinianul","definite-error-unrecognized-form-feminine-singular":"liechtensteiniana","definite-error-unrecognized-form-masculine-plural":"liechtensteinienii","definite-error-unrecognized-form-feminine-neuter-plural":"liechtensteinienele"}},{"word":"liechtensteinian","pos":"noun","definitions":["Liechtensteiner"],"forms":{"plural":"liechtensteinieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"liechtensteinian","accusative-definite-nominative-singular":"liechtensteinianul","accusative-indefinite-nominative-plural":"liechtensteinieni","accusative-definite-nominative-plural":"liechtensteinienii","dative-genitive-indefinite-singular":"liechtensteinian","dative-definite-genitive-singular":"liechtensteinianului","dative-genitive-indefinite-plural":"liechtensteinieni","dative-definite-genitive-plural":"liechtensteinienilor","singular-vocative":"liechtensteinianule","plural-vocative":"liechtensteinienilor"}},{"word":"liechtensteiniană","pos":"noun","definitions":["female equivalent of liechtensteinian"],"forms":{"plural":"liechtensteiniane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"liechtensteiniană","accusative-definite-nominative-singular":"liechtensteiniana","accusative-indefinite-nominative-plural":"liechtensteiniane","accusative-definite-nominative-plural":"liechtensteinianele","dative-genitive-indefinite-singular":"liechtensteiniane","dative-definite-genitive-singular":"liechtensteinianei","dative-genitive-indefinite-plural":"liechtensteiniane","dative-definite-genitive-plural":"liechtensteinianelor","singular-vocative":"liechtensteiniană","plural-vocative":"liechtensteinianelor"}},{"word":"lied","pos":"noun","definitions":["song"],"forms":{"plural":"lieduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lied","accusative-definite-nominative-singular":"liedul","accusative-indefinite-nominative-plural":"lieduri","accusative-definite-nominative-plural":"liedurile","dative-genitive-indefinite-singular":"lied","dative-definite-genitive-singular":"liedului","dative-genitive-indefinite-plural":"lieduri","dative-definite-genitive-plural":"liedurilor","singular-vocative":"liedule","plural-vocative":"liedurilor"}},{"word":"lieduri","pos":"noun","definitions":["plural of lied"]},{"word":"lien","pos":"noun","definitions":["spleen"],"forms":{"plural":"lienuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lien","accusative-definite-nominative-singular":"lienul","accusative-indefinite-nominative-plural":"lienuri","accusative-definite-nominative-plural":"lienurile","dative-genitive-indefinite-singular":"lien","dative-definite-genitive-singular":"lienului","dative-genitive-indefinite-plural":"lienuri","dative-definite-genitive-plural":"lienurilor","singular-vocative":"lienule","plural-vocative":"lienurilor"}},{"word":"lienal","pos":"adj","definitions":["lienal"],"forms":{"feminine-singular":"lienală","masculine-plural":"lienali","feminine-neuter-plural":"lienale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lienal","error-unrecognized-form-feminine-indefinite-singular":"lienală","error-unrecognized-form-indefinite-masculine-plural":"lienali","error-unrecognized-form-feminine-indefinite-neuter-plural":"lienale","definite-error-unrecognized-form-masculine-neuter-singular":"lienalul","definite-error-unrecognized-form-feminine-singular":"lienala","definite-error-unrecognized-form-masculine-plural":"lienalii","definite-error-unrecognized-form-feminine-neuter-plural":"lienalele"}},{"word":"lienteric","pos":"adj","definitions":["lienteric"],"forms":{"feminine-singular":"lienterică","masculine-plural":"lienterici","feminine-neuter-plural":"lienterice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lienteric","error-unrecognized-form-feminine-indefinite-singular":"lienterică","error-unrecognized-form-indefinite-masculine-plural":"lienterici","error-unrecognized-form-feminine-indefinite-neuter-plural":"lienterice","definite-error-unrecognized-form-masculine-neuter-singular":"lientericul","definite-error-unrecognized-form-feminine-singular":"lienterica","definite-error-unrecognized-form-masculine-plural":"lientericii","definite-error-unrecognized-form-feminine-neuter-plural":"lientericele"}},{"word":"Liești","pos":"name","definitions":["a commune of Galați County, Romania","a village in Liești, Galați County, Romania","a village in Priponești, Galați County, Romania","a village in Slobozia Bradului, Vrancea County, Romania"],"gender":"m"},{"word":"lifera","pos":"verb","definitions":["to provide"],"forms":{"canonical":"a lifera 1st conjugation","participle-past":"liferat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a lifera","gerund":"liferând","first-person-indicative-present-singular":"lifer","indicative-present-second-person-singular":"liferi","indicative-present-singular-third-person":"liferă","first-person-indicative-plural-present":"liferăm","indicative-plural-present-second-person":"liferați","indicative-plural-present-third-person":"liferă","first-person-imperfect-indicative-singular":"liferam","imperfect-indicative-second-person-singular":"liferai","imperfect-indicative-singular-third-person":"lifera","first-person-imperfect-indicative-plural":"liferam","imperfect-indicative-plural-second-person":"liferați","imperfect-indicative-plural-third-person":"liferau","first-person-indicative-perfect-singular":"liferai","indicative-perfect-second-person-singular":"liferași","indicative-perfect-singular-third-person":"liferă","first-person-indicative-perfect-plural":"liferarăm","indicative-perfect-plural-second-person":"liferarăți","indicative-perfect-plural-third-person":"liferară","first-person-indicative-pluperfect-singular":"liferasem","indicative-pluperfect-second-person-singular":"liferaseși","indicative-pluperfect-singular-third-person":"liferase","first-person-indicative-pluperfect-plural":"liferaserăm","indicative-pluperfect-plural-second-person":"liferaserăți","indicative-pluperfect-plural-third-person":"liferaseră","first-person-present-singular-subjunctive":"să lifer","present-second-person-singular-subjunctive":"să liferi","present-singular-subjunctive-third-person":"să lifere","first-person-plural-present-subjunctive":"să liferăm","plural-present-second-person-subjunctive":"să liferați","plural-present-subjunctive-third-person":"să lifere","imperative-second-person-singular":"liferă","imperative-plural-second-person":"liferați","imperative-negative-second-person-singular":"nu lifera","imperative-negative-plural-second-person":"nu liferați"}},{"word":"liferant","pos":"noun","definitions":["supplier"],"forms":{"plural":"liferanți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"liferant","accusative-definite-nominative-singular":"liferantul","accusative-indefinite-nominative-plural":"liferanți","accusative-definite-nominative-plural":"liferanții","dative-genitive-indefinite-singular":"liferant","dative-definite-genitive-singular":"liferantului","dative-genitive-indefinite-plural":"liferanți","dative-definite-genitive-plural":"liferanților","singular-vocative":"liferantule","plural-vocative":"liferanților"}},{"word":"liferare","pos":"noun","definitions":["delivery"],"forms":{"plural":"liferarări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"liferare","accusative-definite-nominative-singular":"liferarea","accusative-indefinite-nominative-plural":"liferarări","accusative-definite-nominative-plural":"liferarările","dative-genitive-indefinite-singular":"liferarări","dative-definite-genitive-singular":"liferarării","dative-genitive-indefinite-plural":"liferarări","dative-definite-genitive-plural":"liferarărilor","singular-vocative":"liferare","plural-vocative":"liferarărilor"}},{"word":"liferător","pos":"noun","definitions":["provider"],"forms":{"plural":"liferători","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"liferător","accusative-definite-nominative-singular":"liferătorul","accusative-indefinite-nominative-plural":"liferători","accusative-definite-nominative-plural":"liferătorii","dative-genitive-indefinite-singular":"liferător","dative-definite-genitive-singular":"liferătorului","dative-genitive-indefinite-plural":"liferători","dative-definite-genitive-plural":"liferătorilor","singular-vocative":"liferătorule","plural-vocative":"liferătorilor"}},{"word":"lift","pos":"noun","definitions":["elevator, lift","A stroke that gives the ball an upward trajection."],"pronunciation":"/lift/","forms":{"plural":"lifturi"}},{"word":"liftă","pos":"noun","definitions":["a person that is not an Orthodox Christian.","an evil man"],"pronunciation":"/ˈliftə/","forms":{"plural":"lifte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"liftă","accusative-definite-nominative-singular":"lifta","accusative-indefinite-nominative-plural":"lifte","accusative-definite-nominative-plural":"liftele","dative-genitive-indefinite-singular":"lifte","dative-definite-genitive-singular":"liftei","dative-genitive-indefinite-plural":"lifte","dative-definite-genitive-plural":"liftelor","singular-vocative":"liftă","plural-vocative":"liftelor"}},{"word":"lifteluță","pos":"noun","definitions":["diminutive of liftă"],"forms":{"plural":"lifteluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lifteluță","accusative-definite-nominative-singular":"lifteluța","accusative-indefinite-nominative-plural":"lifteluțe","accusative-definite-nominative-plural":"lifteluțele","dative-genitive-indefinite-singular":"lifteluțe","dative-definite-genitive-singular":"lifteluței","dative-genitive-indefinite-plural":"lifteluțe","dative-definite-genitive-plural":"lifteluțelor","singular-vocative":"lifteluță","plural-vocative":"lifteluțelor"}},{"word":"liftier","pos":"noun","definitions":["lift attendant"],"forms":{"plural":"liftieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"liftier","accusative-definite-nominative-singular":"liftierul","accusative-indefinite-nominative-plural":"liftieri","accusative-definite-nominative-plural":"liftierii","dative-genitive-indefinite-singular":"liftier","dative-definite-genitive-singular":"liftierului","dative-genitive-indefinite-plural":"liftieri","dative-definite-genitive-plural":"liftierilor","singular-vocative":"liftierule","plural-vocative":"liftierilor"}},{"word":"liftieră","pos":"noun","definitions":["female equivalent of liftier"],"forms":{"plural":"liftiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"liftieră","accusative-definite-nominative-singular":"liftiera","accusative-indefinite-nominative-plural":"liftiere","accusative-definite-nominative-plural":"liftierele","dative-genitive-indefinite-singular":"liftiere","dative-definite-genitive-singular":"liftierei","dative-genitive-indefinite-plural":"liftiere","dative-definite-genitive-plural":"liftierelor","singular-vocative":"liftieră","plural-vocative":"liftierelor"}},{"word":"lifting","pos":"noun","definitions":["lifting"],"forms":{"plural":"liftinguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lifting","accusative-definite-nominative-singular":"liftingul","accusative-indefinite-nominative-plural":"liftinguri","accusative-definite-nominative-plural":"liftingurile","dative-genitive-indefinite-singular":"lifting","dative-definite-genitive-singular":"liftingului","dative-genitive-indefinite-plural":"liftinguri","dative-definite-genitive-plural":"liftingurilor","singular-vocative":"liftingule","plural-vocative":"liftingurilor"}},{"word":"liftinguri","pos":"noun","definitions":["plural of lifting"]},{"word":"ligă","pos":"noun","definitions":["league"],"forms":{"plural":"ligi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ligă","accusative-definite-nominative-singular":"liga","accusative-indefinite-nominative-plural":"ligi","accusative-definite-nominative-plural":"ligile","dative-genitive-indefinite-singular":"ligi","dative-definite-genitive-singular":"ligii","dative-genitive-indefinite-plural":"ligi","dative-definite-genitive-plural":"ligilor","singular-vocative":"ligă","plural-vocative":"ligilor"}},{"word":"Liga Națiunilor","pos":"name","definitions":["League of Nations"],"gender":"f"},{"word":"ligament","pos":"noun","definitions":["ligament"],"pronunciation":"[li.ɡaˈment]","forms":{"plural":"ligamente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ligament","accusative-definite-nominative-singular":"ligamentul","accusative-indefinite-nominative-plural":"ligamente","accusative-definite-nominative-plural":"ligamentele","dative-genitive-indefinite-singular":"ligament","dative-definite-genitive-singular":"ligamentului","dative-genitive-indefinite-plural":"ligamente","dative-definite-genitive-plural":"ligamentelor","singular-vocative":"ligamentule","plural-vocative":"ligamentelor"}},{"word":"ligamentoplastie","pos":"noun","definitions":["ligamentoplasty"],"forms":{"plural":"ligamentoplastii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ligamentoplastie","accusative-definite-nominative-singular":"ligamentoplastia","accusative-indefinite-nominative-plural":"ligamentoplastii","accusative-definite-nominative-plural":"ligamentoplastiile","dative-genitive-indefinite-singular":"ligamentoplastii","dative-definite-genitive-singular":"ligamentoplastiei","dative-genitive-indefinite-plural":"ligamentoplastii","dative-definite-genitive-plural":"ligamentoplastiilor","singular-vocative":"ligamentoplastie","plural-vocative":"ligamentoplastiilor"}},{"word":"ligamentos","pos":"adj","definitions":["ligamentous"],"forms":{"feminine-singular":"ligamentoasă","masculine-plural":"ligamentoși","feminine-neuter-plural":"ligamentoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ligamentos","error-unrecognized-form-feminine-indefinite-singular":"ligamentoasă","error-unrecognized-form-indefinite-masculine-plural":"ligamentoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"ligamentoase","definite-error-unrecognized-form-masculine-neuter-singular":"ligamentosul","definite-error-unrecognized-form-feminine-singular":"ligamentoasa","definite-error-unrecognized-form-masculine-plural":"ligamentoșii","definite-error-unrecognized-form-feminine-neuter-plural":"ligamentoasele"}},{"word":"ligatură","pos":"noun","definitions":["ligature"],"forms":{"plural":"ligaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ligatură","accusative-definite-nominative-singular":"ligatura","accusative-indefinite-nominative-plural":"ligature","accusative-definite-nominative-plural":"ligaturele","dative-genitive-indefinite-singular":"ligature","dative-definite-genitive-singular":"ligaturei","dative-genitive-indefinite-plural":"ligature","dative-definite-genitive-plural":"ligaturelor","singular-vocative":"ligatură","plural-vocative":"ligaturelor"}},{"word":"ligav","pos":"adj","definitions":["alternative form of lingav"],"forms":{"feminine-singular":"ligavă","masculine-plural":"ligavi","feminine-neuter-plural":"ligave","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ligav","error-unrecognized-form-feminine-indefinite-singular":"ligavă","error-unrecognized-form-indefinite-masculine-plural":"ligavi","error-unrecognized-form-feminine-indefinite-neuter-plural":"ligave","definite-error-unrecognized-form-masculine-neuter-singular":"ligavul","definite-error-unrecognized-form-feminine-singular":"ligava","definite-error-unrecognized-form-masculine-plural":"ligavii","definite-error-unrecognized-form-feminine-neuter-plural":"ligavele"}},{"word":"lighean","pos":"noun","definitions":["bowl or basin for washing"],"forms":{"plural":"lighene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lighean","accusative-definite-nominative-singular":"ligheanul","accusative-indefinite-nominative-plural":"lighene","accusative-definite-nominative-plural":"lighenele","dative-genitive-indefinite-singular":"lighean","dative-definite-genitive-singular":"ligheanului","dative-genitive-indefinite-plural":"lighene","dative-definite-genitive-plural":"lighenelor","singular-vocative":"ligheanule","plural-vocative":"lighenelor"}},{"word":"lighenaș","pos":"noun","definitions":["diminutive of lighean; small washing bowl"],"forms":{"plural":"lighenașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lighenaș","accusative-definite-nominative-singular":"lighenașul","accusative-indefinite-nominative-plural":"lighenașe","accusative-definite-nominative-plural":"lighenașele","dative-genitive-indefinite-singular":"lighenaș","dative-definite-genitive-singular":"lighenașului","dative-genitive-indefinite-plural":"lighenașe","dative-definite-genitive-plural":"lighenașelor","singular-vocative":"lighenașule","plural-vocative":"lighenașelor"}},{"word":"lighioaie","pos":"noun","definitions":["alternative form of lighioană"],"forms":{"plural":"lighioi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lighioaie","accusative-definite-nominative-singular":"lighioaiea","accusative-indefinite-nominative-plural":"lighioi","accusative-definite-nominative-plural":"lighioile","dative-genitive-indefinite-singular":"lighioi","dative-definite-genitive-singular":"lighioii","dative-genitive-indefinite-plural":"lighioi","dative-definite-genitive-plural":"lighioilor","singular-vocative":"lighioaie","plural-vocative":"lighioilor"}},{"word":"lighioană","pos":"noun","definitions":["wild beast","brute"],"forms":{"plural":"lighioane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lighioană","accusative-definite-nominative-singular":"lighioana","accusative-indefinite-nominative-plural":"lighioane","accusative-definite-nominative-plural":"lighioanele","dative-genitive-indefinite-singular":"lighioane","dative-definite-genitive-singular":"lighioanei","dative-genitive-indefinite-plural":"lighioane","dative-definite-genitive-plural":"lighioanelor","singular-vocative":"lighioană","plural-vocative":"lighioanelor"}},{"word":"lignicol","pos":"adj","definitions":["lignicolous"],"forms":{"feminine-singular":"lignicolă","masculine-plural":"lignicoli","feminine-neuter-plural":"lignicole","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lignicol","error-unrecognized-form-feminine-indefinite-singular":"lignicolă","error-unrecognized-form-indefinite-masculine-plural":"lignicoli","error-unrecognized-form-feminine-indefinite-neuter-plural":"lignicole","definite-error-unrecognized-form-masculine-neuter-singular":"lignicolul","definite-error-unrecognized-form-feminine-singular":"lignicola","definite-error-unrecognized-form-masculine-plural":"lignicolii","definite-error-unrecognized-form-feminine-neuter-plural":"lignicolele"}},{"word":"lignifer","pos":"noun","definitions":["ligniferous"],"forms":{"plural":"ligniferi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lignifer","accusative-definite-nominative-singular":"ligniferul","accusative-indefinite-nominative-plural":"ligniferi","accusative-definite-nominative-plural":"ligniferii","dative-genitive-indefinite-singular":"lignifer","dative-definite-genitive-singular":"ligniferului","dative-genitive-indefinite-plural":"ligniferi","dative-definite-genitive-plural":"ligniferilor","singular-vocative":"ligniferule","plural-vocative":"ligniferilor"}},{"word":"lignifica","pos":"verb","definitions":["to lignify"],"pronunciation":"/liɡ.ni.fiˈka/","forms":{"canonical":"a lignifica 1st conjugation","present-singular-third-person":"lignifică","participle-past":"lignificat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a lignifica","gerund":"lignificând","first-person-indicative-present-singular":"lignific","indicative-present-second-person-singular":"lignifici","indicative-present-singular-third-person":"lignifică","first-person-indicative-plural-present":"lignificăm","indicative-plural-present-second-person":"lignificați","indicative-plural-present-third-person":"lignifică","first-person-imperfect-indicative-singular":"lignificam","imperfect-indicative-second-person-singular":"lignificai","imperfect-indicative-singular-third-person":"lignifica","first-person-imperfect-indicative-plural":"lignificam","imperfect-indicative-plural-second-person":"lignificați","imperfect-indicative-plural-third-person":"lignificau","first-person-indicative-perfect-singular":"lignificai","indicative-perfect-second-person-singular":"lignificași","indicative-perfect-singular-third-person":"lignifică","first-person-indicative-perfect-plural":"lignificarăm","indicative-perfect-plural-second-person":"lignificarăți","indicative-perfect-plural-third-person":"lignificară","first-person-indicative-pluperfect-singular":"lignificasem","indicative-pluperfect-second-person-singular":"lignificaseși","indicative-pluperfect-singular-third-person":"lignificase","first-person-indicative-pluperfect-plural":"lignificaserăm","indicative-pluperfect-plural-second-person":"lignificaserăți","indicative-pluperfect-plural-third-person":"lignificaseră","first-person-present-singular-subjunctive":"să lignific","present-second-person-singular-subjunctive":"să lignifici","present-singular-subjunctive-third-person":"să lignifice","first-person-plural-present-subjunctive":"să lignificăm","plural-present-second-person-subjunctive":"să lignificați","plural-present-subjunctive-third-person":"să lignifice","imperative-second-person-singular":"lignifică","imperative-plural-second-person":"lignificați","imperative-negative-second-person-singular":"nu lignifica","imperative-negative-plural-second-person":"nu lignificați"}},{"word":"lignificare","pos":"noun","definitions":["lignification"],"forms":{"plural":"lignificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lignificare","accusative-definite-nominative-singular":"lignificarea","accusative-indefinite-nominative-plural":"lignificări","accusative-definite-nominative-plural":"lignificările","dative-genitive-indefinite-singular":"lignificări","dative-definite-genitive-singular":"lignificării","dative-genitive-indefinite-plural":"lignificări","dative-definite-genitive-plural":"lignificărilor","singular-vocative":"lignificare","plural-vocative":"lignificărilor"}},{"word":"lignificat","pos":"adj","definitions":["lignified"],"forms":{"feminine-singular":"lignificată","masculine-plural":"lignificați","feminine-neuter-plural":"lignificate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lignificat","error-unrecognized-form-feminine-indefinite-singular":"lignificată","error-unrecognized-form-indefinite-masculine-plural":"lignificați","error-unrecognized-form-feminine-indefinite-neuter-plural":"lignificate","definite-error-unrecognized-form-masculine-neuter-singular":"lignificatul","definite-error-unrecognized-form-feminine-singular":"lignificata","definite-error-unrecognized-form-masculine-plural":"lignificații","definite-error-unrecognized-form-feminine-neuter-plural":"lignificatele"}},{"word":"lignificat","pos":"verb","definitions":["past participle of lignifica"],"forms":{"participle-past":"of lignifica"}},{"word":"lignină","pos":"noun","definitions":["lignin"],"forms":{"plural":"lignine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lignină","accusative-definite-nominative-singular":"lignina","accusative-indefinite-nominative-plural":"lignine","accusative-definite-nominative-plural":"ligninele","dative-genitive-indefinite-singular":"lignine","dative-definite-genitive-singular":"ligninei","dative-genitive-indefinite-plural":"lignine","dative-definite-genitive-plural":"ligninelor","singular-vocative":"lignină","plural-vocative":"ligninelor"}},{"word":"lignit","pos":"noun","definitions":["lignite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lignit","accusative-definite-nominative-singular":"lignitul","accusative-indefinite-nominative-plural":"lignite","accusative-definite-nominative-plural":"lignitele","dative-genitive-indefinite-singular":"lignit","dative-definite-genitive-singular":"lignitului","dative-genitive-indefinite-plural":"lignite","dative-definite-genitive-plural":"lignitelor","singular-vocative":"lignitule","plural-vocative":"lignitelor"}},{"word":"lignivor","pos":"adj","definitions":["lignivorous"],"forms":{"feminine-singular":"lignivoră","masculine-plural":"lignivori","feminine-neuter-plural":"lignivore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lignivor","error-unrecognized-form-feminine-indefinite-singular":"lignivoră","error-unrecognized-form-indefinite-masculine-plural":"lignivori","error-unrecognized-form-feminine-indefinite-neuter-plural":"lignivore","definite-error-unrecognized-form-masculine-neuter-singular":"lignivorul","definite-error-unrecognized-form-feminine-singular":"lignivora","definite-error-unrecognized-form-masculine-plural":"lignivorii","definite-error-unrecognized-form-feminine-neuter-plural":"lignivorele"}},{"word":"lignoceluloză","pos":"noun","definitions":["lignocellulose"],"forms":{"plural":"lignoceluloze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lignoceluloză","accusative-definite-nominative-singular":"lignoceluloza","accusative-indefinite-nominative-plural":"lignoceluloze","accusative-definite-nominative-plural":"lignocelulozele","dative-genitive-indefinite-singular":"lignoceluloze","dative-definite-genitive-singular":"lignocelulozei","dative-genitive-indefinite-plural":"lignoceluloze","dative-definite-genitive-plural":"lignocelulozelor","singular-vocative":"lignoceluloză","plural-vocative":"lignocelulozelor"}},{"word":"lignofoliu","pos":"noun","definitions":["alternative form of lignofol"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lignofoliu","accusative-definite-nominative":"lignofoliuul","dative-genitive-indefinite":"lignofoliu","dative-definite-genitive":"lignofoliuului","vocative":"lignofoliuule"}},{"word":"lignos","pos":"adj","definitions":["ligneous"],"forms":{"feminine-singular":"lignoasă","masculine-plural":"lignoși","feminine-neuter-plural":"lignoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lignos","error-unrecognized-form-feminine-indefinite-singular":"lignoasă","error-unrecognized-form-indefinite-masculine-plural":"lignoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lignoase","definite-error-unrecognized-form-masculine-neuter-singular":"lignosul","definite-error-unrecognized-form-feminine-singular":"lignoasa","definite-error-unrecognized-form-masculine-plural":"lignoșii","definite-error-unrecognized-form-feminine-neuter-plural":"lignoasele"}},{"word":"lignoză","pos":"noun","definitions":["lignose"],"forms":{"plural":"lignoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lignoză","accusative-definite-nominative-singular":"lignoza","accusative-indefinite-nominative-plural":"lignoze","accusative-definite-nominative-plural":"lignozele","dative-genitive-indefinite-singular":"lignoze","dative-definite-genitive-singular":"lignozei","dative-genitive-indefinite-plural":"lignoze","dative-definite-genitive-plural":"lignozelor","singular-vocative":"lignoză","plural-vocative":"lignozelor"}},{"word":"ligotă","pos":"noun","definitions":["privilege"],"forms":{"plural":"ligote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ligotă","accusative-definite-nominative-singular":"ligota","accusative-indefinite-nominative-plural":"ligote","accusative-definite-nominative-plural":"ligotele","dative-genitive-indefinite-singular":"ligote","dative-definite-genitive-singular":"ligotei","dative-genitive-indefinite-plural":"ligote","dative-definite-genitive-plural":"ligotelor","singular-vocative":"ligotă","plural-vocative":"ligotelor"}},{"word":"Ligoțchi","pos":"name","definitions":["a surname from Polish"],"gender":"m","forms":{"dative-genitive":"lui Ligoțchi"}},{"word":"ligroină","pos":"noun","definitions":["ligroin"],"forms":{"plural":"ligroine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ligroină","accusative-definite-nominative-singular":"ligroina","accusative-indefinite-nominative-plural":"ligroine","accusative-definite-nominative-plural":"ligroinele","dative-genitive-indefinite-singular":"ligroine","dative-definite-genitive-singular":"ligroinei","dative-genitive-indefinite-plural":"ligroine","dative-definite-genitive-plural":"ligroinelor","singular-vocative":"ligroină","plural-vocative":"ligroinelor"}},{"word":"ligulă","pos":"noun","definitions":["ligule"],"forms":{"plural":"ligule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ligulă","accusative-definite-nominative-singular":"ligula","accusative-indefinite-nominative-plural":"ligule","accusative-definite-nominative-plural":"ligulele","dative-genitive-indefinite-singular":"ligule","dative-definite-genitive-singular":"ligulei","dative-genitive-indefinite-plural":"ligule","dative-definite-genitive-plural":"ligulelor","singular-vocative":"ligulă","plural-vocative":"ligulelor"}},{"word":"ligulat","pos":"adj","definitions":["ligulate"],"forms":{"feminine-singular":"ligulată","masculine-plural":"ligulați","feminine-neuter-plural":"ligulate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ligulat","error-unrecognized-form-feminine-indefinite-singular":"ligulată","error-unrecognized-form-indefinite-masculine-plural":"ligulați","error-unrecognized-form-feminine-indefinite-neuter-plural":"ligulate","definite-error-unrecognized-form-masculine-neuter-singular":"ligulatul","definite-error-unrecognized-form-feminine-singular":"ligulata","definite-error-unrecognized-form-masculine-plural":"ligulații","definite-error-unrecognized-form-feminine-neuter-plural":"ligulatele"}},{"word":"ligur","pos":"noun","definitions":["Ligurian"],"forms":{"plural":"liguri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ligur","accusative-definite-nominative-singular":"ligurul","accusative-indefinite-nominative-plural":"liguri","accusative-definite-nominative-plural":"ligurii","dative-genitive-indefinite-singular":"ligur","dative-definite-genitive-singular":"ligurului","dative-genitive-indefinite-plural":"liguri","dative-definite-genitive-plural":"ligurilor","singular-vocative":"ligurule","plural-vocative":"ligurilor"}},{"word":"ligură","pos":"noun","definitions":["female equivalent of ligur"],"forms":{"plural":"ligure","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ligură","accusative-definite-nominative-singular":"ligura","accusative-indefinite-nominative-plural":"ligure","accusative-definite-nominative-plural":"ligurele","dative-genitive-indefinite-singular":"ligure","dative-definite-genitive-singular":"ligurei","dative-genitive-indefinite-plural":"ligure","dative-definite-genitive-plural":"ligurelor","singular-vocative":"ligură","plural-vocative":"ligurelor"}},{"word":"ligurian","pos":"adj","definitions":["Ligurian"],"forms":{"feminine-singular":"liguriană","masculine-plural":"ligurieni","feminine-neuter-plural":"liguriene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ligurian","error-unrecognized-form-feminine-indefinite-singular":"liguriană","error-unrecognized-form-indefinite-masculine-plural":"ligurieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"liguriene","definite-error-unrecognized-form-masculine-neuter-singular":"ligurianul","definite-error-unrecognized-form-feminine-singular":"liguriana","definite-error-unrecognized-form-masculine-plural":"ligurienii","definite-error-unrecognized-form-feminine-neuter-plural":"ligurienele"}},{"word":"liguric","pos":"adj","definitions":["Ligurian"],"forms":{"feminine-singular":"ligurică","masculine-plural":"ligurici","feminine-neuter-plural":"ligurice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liguric","error-unrecognized-form-feminine-indefinite-singular":"ligurică","error-unrecognized-form-indefinite-masculine-plural":"ligurici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ligurice","definite-error-unrecognized-form-masculine-neuter-singular":"liguricul","definite-error-unrecognized-form-feminine-singular":"ligurica","definite-error-unrecognized-form-masculine-plural":"liguricii","definite-error-unrecognized-form-feminine-neuter-plural":"liguricele"}},{"word":"lihăi","pos":"verb","definitions":["alternative form of lehăi"],"forms":{"canonical":"a lihăi 4th conjugation","present-singular-third-person":"lihăie","participle-past":"lihăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a lihăi","gerund":"lihăind","first-person-indicative-present-singular":"lihăi","indicative-present-second-person-singular":"lihăi","indicative-present-singular-third-person":"lihăie","first-person-indicative-plural-present":"lihăim","indicative-plural-present-second-person":"lihăiți","indicative-plural-present-third-person":"lihăie","first-person-imperfect-indicative-singular":"lihăiam","imperfect-indicative-second-person-singular":"lihăiai","imperfect-indicative-singular-third-person":"lihăia","first-person-imperfect-indicative-plural":"lihăiam","imperfect-indicative-plural-second-person":"lihăiați","imperfect-indicative-plural-third-person":"lihăiau","first-person-indicative-perfect-singular":"lihăii","indicative-perfect-second-person-singular":"lihăiși","indicative-perfect-singular-third-person":"lihăi","first-person-indicative-perfect-plural":"lihăirăm","indicative-perfect-plural-second-person":"lihăirăți","indicative-perfect-plural-third-person":"lihăiră","first-person-indicative-pluperfect-singular":"lihăisem","indicative-pluperfect-second-person-singular":"lihăiseși","indicative-pluperfect-singular-third-person":"lihăise","first-person-indicative-pluperfect-plural":"lihăiserăm","indicative-pluperfect-plural-second-person":"lihăiserăți","indicative-pluperfect-plural-third-person":"lihăiseră","first-person-present-singular-subjunctive":"să lihăi","present-second-person-singular-subjunctive":"să lihăi","present-singular-subjunctive-third-person":"să lihăie","first-person-plural-present-subjunctive":"să lihăim","plural-present-second-person-subjunctive":"să lihăiți","plural-present-subjunctive-third-person":"să lihăie","imperative-second-person-singular":"lihăie","imperative-plural-second-person":"lihăiți","imperative-negative-second-person-singular":"nu lihăi","imperative-negative-plural-second-person":"nu lihăiți"}},{"word":"lihneală","pos":"noun","definitions":["hunger"],"forms":{"plural":"lihneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lihneală","accusative-definite-nominative-singular":"lihneala","accusative-indefinite-nominative-plural":"lihneli","accusative-definite-nominative-plural":"lihnelile","dative-genitive-indefinite-singular":"lihneli","dative-definite-genitive-singular":"lihnelii","dative-genitive-indefinite-plural":"lihneli","dative-definite-genitive-plural":"lihnelilor","singular-vocative":"lihneală","plural-vocative":"lihnelilor"}},{"word":"lihnit","pos":"adj","definitions":["starving"],"forms":{"feminine-singular":"lihnită","masculine-plural":"lihniți","feminine-neuter-plural":"lihnite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lihnit","error-unrecognized-form-feminine-indefinite-singular":"lihnită","error-unrecognized-form-indefinite-masculine-plural":"lihniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lihnite","definite-error-unrecognized-form-masculine-neuter-singular":"lihnitul","definite-error-unrecognized-form-feminine-singular":"lihnita","definite-error-unrecognized-form-masculine-plural":"lihniții","definite-error-unrecognized-form-feminine-neuter-plural":"lihnitele"}},{"word":"lihtdruc","pos":"noun","definitions":["phototype"],"forms":{"plural":"lihtdrucuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lihtdruc","accusative-definite-nominative-singular":"lihtdrucul","accusative-indefinite-nominative-plural":"lihtdrucuri","accusative-definite-nominative-plural":"lihtdrucurile","dative-genitive-indefinite-singular":"lihtdruc","dative-definite-genitive-singular":"lihtdrucului","dative-genitive-indefinite-plural":"lihtdrucuri","dative-definite-genitive-plural":"lihtdrucurilor","singular-vocative":"lihtdrucule","plural-vocative":"lihtdrucurilor"}},{"word":"Lihulești","pos":"name","definitions":["a village in Berlești, Gorj County, Romania"],"gender":"m"},{"word":"Liiceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Liiceanu"}},{"word":"Liiceni","pos":"name","definitions":["a village in Drăghiceni, Olt County, Romania"],"gender":"m"},{"word":"lila","pos":"adj","definitions":["lilac (color/colour)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lila","error-unrecognized-form-feminine-indefinite-singular":"lila","error-unrecognized-form-indefinite-masculine-plural":"lila","error-unrecognized-form-feminine-indefinite-neuter-plural":"lila","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"Liliac","pos":"name","definitions":["a village in Bahna, Neamț County, Romania"],"gender":"m"},{"word":"liliac","pos":"noun","definitions":["lilac"],"forms":{"plural":"lilieci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"liliac","accusative-definite-nominative-singular":"liliacul","accusative-indefinite-nominative-plural":"lilieci","accusative-definite-nominative-plural":"liliecii","dative-genitive-indefinite-singular":"liliac","dative-definite-genitive-singular":"liliacului","dative-genitive-indefinite-plural":"lilieci","dative-definite-genitive-plural":"liliecilor","singular-vocative":"liliacule","plural-vocative":"liliecilor"}},{"word":"liliac","pos":"noun","definitions":["bat (the flying mammal)"],"forms":{"plural":"lilieci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"liliac","accusative-definite-nominative-singular":"liliacul","accusative-indefinite-nominative-plural":"lilieci","accusative-definite-nominative-plural":"liliecii","dative-genitive-indefinite-singular":"liliac","dative-definite-genitive-singular":"liliacului","dative-genitive-indefinite-plural":"lilieci","dative-definite-genitive-plural":"liliecilor","singular-vocative":"liliacule","plural-vocative":"liliecilor","alternative-archaic-regional":"leliac","alternative-regional":"iliac","alternative-archaic":"liec"}},{"word":"liliacee","pos":"noun","definitions":["a plant of the Liliaceae family"],"forms":{"plural":"liliacee","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"liliacee","accusative-definite-nominative-singular":"liliaceea","accusative-indefinite-nominative-plural":"liliacee","accusative-definite-nominative-plural":"liliaceele","dative-genitive-indefinite-singular":"liliacee","dative-definite-genitive-singular":"liliaceei","dative-genitive-indefinite-plural":"liliacee","dative-definite-genitive-plural":"liliaceelor","singular-vocative":"liliacee","plural-vocative":"liliaceelor"}},{"word":"liliacel","pos":"noun","definitions":["dame's rocket, dame's violet"],"forms":{"plural":"liliacei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"liliacel","accusative-definite-nominative-singular":"liliacelul","accusative-indefinite-nominative-plural":"liliacei","accusative-definite-nominative-plural":"liliaceii","dative-genitive-indefinite-singular":"liliacel","dative-definite-genitive-singular":"liliacelului","dative-genitive-indefinite-plural":"liliacei","dative-definite-genitive-plural":"liliaceilor","singular-vocative":"liliacelule","plural-vocative":"liliaceilor"}},{"word":"liliachiu","pos":"adj","definitions":["lilac, lilac-colored"],"pronunciation":"/ˌli.li.aˈkiw/","forms":{"feminine-singular":"liliachie","plural":"liliachii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liliachiu","error-unrecognized-form-feminine-indefinite-singular":"liliachie","error-unrecognized-form-indefinite-masculine-plural":"liliachii","error-unrecognized-form-feminine-indefinite-neuter-plural":"liliachii","definite-error-unrecognized-form-masculine-neuter-singular":"liliachiul","definite-error-unrecognized-form-feminine-singular":"liliachia","definite-error-unrecognized-form-masculine-plural":"liliachiii","definite-error-unrecognized-form-feminine-neuter-plural":"liliachiile"}},{"word":"Liliacul","pos":"name","definitions":["a river in Maramureș, Romania, tributary to the Râoaia"],"gender":"m"},{"word":"lilialitate","pos":"noun","definitions":["purity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"lilialitate","accusative-definite-nominative":"lilialitatea","dative-genitive-indefinite":"lilialități","dative-definite-genitive":"lilialității","vocative":"-"}},{"word":"lilie","pos":"noun","definitions":["lily, lilium (flower)"],"forms":{"plural":"lilii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lilie","accusative-definite-nominative-singular":"lilia","accusative-indefinite-nominative-plural":"lilii","accusative-definite-nominative-plural":"liliile","dative-genitive-indefinite-singular":"lilii","dative-definite-genitive-singular":"liliei","dative-genitive-indefinite-plural":"lilii","dative-definite-genitive-plural":"liliilor","singular-vocative":"lilie","plural-vocative":"liliilor"}},{"word":"Lilieci","pos":"name","definitions":["a village in Hemeiuș, Bacău County, Romania","a village in Sinești, Ialomița County, Romania"],"gender":"m"},{"word":"lilieci","pos":"noun","definitions":["plural of liliac"]},{"word":"liliecuț","pos":"noun","definitions":["fall phlox (Phlox paniculata)"],"forms":{"plural":"liliecuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"liliecuț","accusative-definite-nominative-singular":"liliecuțul","accusative-indefinite-nominative-plural":"liliecuți","accusative-definite-nominative-plural":"liliecuții","dative-genitive-indefinite-singular":"liliecuț","dative-definite-genitive-singular":"liliecuțului","dative-genitive-indefinite-plural":"liliecuți","dative-definite-genitive-plural":"liliecuților","singular-vocative":"liliecuțule","plural-vocative":"liliecuților"}},{"word":"Liliești","pos":"name","definitions":["a locality in Băicoi, Prahova County, Romania"],"gender":"m"},{"word":"liliom","pos":"noun","definitions":["lily"],"forms":{"plural":"liliomi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"liliom","accusative-definite-nominative-singular":"liliomul","accusative-indefinite-nominative-plural":"liliomi","accusative-definite-nominative-plural":"liliomii","dative-genitive-indefinite-singular":"liliom","dative-definite-genitive-singular":"liliomului","dative-genitive-indefinite-plural":"liliomi","dative-definite-genitive-plural":"liliomilor","singular-vocative":"liliomule","plural-vocative":"liliomilor"}},{"word":"liliput","pos":"adj","definitions":["liliputan"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liliput","error-unrecognized-form-feminine-indefinite-singular":"liliput","error-unrecognized-form-indefinite-masculine-plural":"liliput","error-unrecognized-form-feminine-indefinite-neuter-plural":"liliput","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"liliputan","pos":"noun","definitions":["lilliputian"],"forms":{"plural":"liliputani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"liliputan","accusative-definite-nominative-singular":"liliputanul","accusative-indefinite-nominative-plural":"liliputani","accusative-definite-nominative-plural":"liliputanii","dative-genitive-indefinite-singular":"liliputan","dative-definite-genitive-singular":"liliputanului","dative-genitive-indefinite-plural":"liliputani","dative-definite-genitive-plural":"liliputanilor","singular-vocative":"liliputanule","plural-vocative":"liliputanilor"}},{"word":"liliputană","pos":"noun","definitions":["female equivalent of liliputan"],"forms":{"plural":"liliputane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"liliputană","accusative-definite-nominative-singular":"liliputana","accusative-indefinite-nominative-plural":"liliputane","accusative-definite-nominative-plural":"liliputanele","dative-genitive-indefinite-singular":"liliputane","dative-definite-genitive-singular":"liliputanei","dative-genitive-indefinite-plural":"liliputane","dative-definite-genitive-plural":"liliputanelor","singular-vocative":"liliputană","plural-vocative":"liliputanelor"}},{"word":"liliputian","pos":"adj","definitions":["Lilliputian"],"forms":{"feminine-singular":"liliputiană","masculine-plural":"liliputieni","feminine-neuter-plural":"liliputiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liliputian","error-unrecognized-form-feminine-indefinite-singular":"liliputiană","error-unrecognized-form-indefinite-masculine-plural":"liliputieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"liliputiene","definite-error-unrecognized-form-masculine-neuter-singular":"liliputianul","definite-error-unrecognized-form-feminine-singular":"liliputiana","definite-error-unrecognized-form-masculine-plural":"liliputienii","definite-error-unrecognized-form-feminine-neuter-plural":"liliputienele"}},{"word":"liliu","pos":"noun","definitions":["a lily"],"forms":{"plural":"lilii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"liliu","accusative-definite-nominative-singular":"liliuul","accusative-indefinite-nominative-plural":"lilii","accusative-definite-nominative-plural":"liliii","dative-genitive-indefinite-singular":"liliu","dative-definite-genitive-singular":"liliuului","dative-genitive-indefinite-plural":"lilii","dative-definite-genitive-plural":"liliilor","singular-vocative":"liliuule","plural-vocative":"liliilor"}},{"word":"Liman","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Liman"}},{"word":"liman","pos":"noun","definitions":["haven","port, harbor","bank","lagoon","estuary"],"forms":{"plural":"limanuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"liman","accusative-definite-nominative-singular":"limanul","accusative-indefinite-nominative-plural":"limanuri","accusative-definite-nominative-plural":"limanurile","dative-genitive-indefinite-singular":"liman","dative-definite-genitive-singular":"limanului","dative-genitive-indefinite-plural":"limanuri","dative-definite-genitive-plural":"limanurilor","singular-vocative":"limanule","plural-vocative":"limanurilor"}},{"word":"Limanu","pos":"name","definitions":["a commune of Constanța County, Romania","a village in Limanu, Constanța County, Romania"],"gender":"m"},{"word":"limanul","pos":"noun","definitions":["definite nominative/accusative singular of liman"]},{"word":"limax","pos":"noun","definitions":["slug"],"forms":{"plural":"limacși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"limax","accusative-definite-nominative-singular":"limaxul","accusative-indefinite-nominative-plural":"limacși","accusative-definite-nominative-plural":"limacșii","dative-genitive-indefinite-singular":"limax","dative-definite-genitive-singular":"limaxului","dative-genitive-indefinite-plural":"limacși","dative-definite-genitive-plural":"limacșilor","singular-vocative":"limaxule","plural-vocative":"limacșilor"}},{"word":"Limba","pos":"name","definitions":["a village in Ciugud, Alba County, Romania"],"gender":"f"},{"word":"limba","pos":"noun","definitions":["definite nominative/accusative singular of limbă"],"pronunciation":"/ˈlim.ba/","gender":"f","forms":{"alternative":"лимба"}},{"word":"Limbă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Limbă"}},{"word":"limbă","pos":"noun","definitions":["tongue","language"],"pronunciation":"/ˈlim.bə/","forms":{"plural":"limbi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"limbă","accusative-definite-nominative-singular":"limba","accusative-indefinite-nominative-plural":"limbi","accusative-definite-nominative-plural":"limbile","dative-genitive-indefinite-singular":"limbi","dative-definite-genitive-singular":"limbii","dative-genitive-indefinite-plural":"limbi","dative-definite-genitive-plural":"limbilor","singular-vocative":"limbă","plural-vocative":"limbilor","alternative":"лимбэ"}},{"word":"limbă auxiliară","pos":"noun","definitions":["auxiliary language"],"forms":{"plural":"limbi auxiliare"}},{"word":"limba boului","pos":"noun","definitions":["beefsteak fungus (Fistulina hepatica)"]},{"word":"limba cucului","pos":"noun","definitions":["Gentianella bulgarica"]},{"word":"limbă de programare","pos":"noun","definitions":["programming language"],"forms":{"plural":"limbi de programare"}},{"word":"limbă încărcată","pos":"noun","definitions":["coated tongue, white tongue, leukoplakia"],"forms":{"plural":"limbi încărcate"}},{"word":"limbă literară","pos":"noun","definitions":["literary language"],"forms":{"plural":"limbi literare"}},{"word":"limbă maternă","pos":"noun","definitions":["native language"],"forms":{"plural":"limbi materne"}},{"word":"limbă moartă","pos":"noun","definitions":["dead language"],"forms":{"plural":"limbi moarte"}},{"word":"limbă modernă","pos":"noun","definitions":["modern language"],"forms":{"plural":"limbi moderne"}},{"word":"limbă natală","pos":"noun","definitions":["native language"],"forms":{"plural":"limbi natale"}},{"word":"limbă nativă","pos":"noun","definitions":["mother tongue"],"forms":{"plural":"limbi native"}},{"word":"limbă naturală","pos":"noun","definitions":["natural language"],"forms":{"plural":"limbi naturale"}},{"word":"limba soacrei","pos":"noun","definitions":["mother-in-law's tongue (Dracaena trifasciata)"]},{"word":"limbă standard","pos":"noun","definitions":["standard language"],"forms":{"plural":"limbi standard"}},{"word":"limbă străină","pos":"noun","definitions":["foreign language"],"forms":{"plural":"limbi străine"}},{"word":"limbă sursă","pos":"noun","definitions":["source language"],"forms":{"plural":"limbi sursă"}},{"word":"limbă vecină","pos":"noun","definitions":["hart's tongue, hart's-tongue fern, Asplenium scolopendrium."],"gender":"f"},{"word":"limbă vie","pos":"noun","definitions":["living language"],"forms":{"plural":"limbi vii"}},{"word":"limbă-de-mare","pos":"noun","definitions":["sand sole (Pegusa lascaris)"]},{"word":"limba-mielului","pos":"noun","definitions":["borage (herb)"],"forms":{"canonical-feminine":"limba mielului"}},{"word":"limbagiu","pos":"noun","definitions":["obsolete form of limbaj"],"forms":{"plural":"limbagii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"limbagiu","accusative-definite-nominative-singular":"limbagiuul","accusative-indefinite-nominative-plural":"limbagii","accusative-definite-nominative-plural":"limbagiile","dative-genitive-indefinite-singular":"limbagiu","dative-definite-genitive-singular":"limbagiuului","dative-genitive-indefinite-plural":"limbagii","dative-definite-genitive-plural":"limbagiilor","singular-vocative":"limbagiuule","plural-vocative":"limbagiilor"}},{"word":"limbaj","pos":"noun","definitions":["language","speech, manner of speaking","idiom"],"pronunciation":"/limˈbaʒ/","forms":{"plural":"limbaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"limbaj","accusative-definite-nominative-singular":"limbajul","accusative-indefinite-nominative-plural":"limbaje","accusative-definite-nominative-plural":"limbajele","dative-genitive-indefinite-singular":"limbaj","dative-definite-genitive-singular":"limbajului","dative-genitive-indefinite-plural":"limbaje","dative-definite-genitive-plural":"limbajelor","singular-vocative":"limbajule","plural-vocative":"limbajelor","alternative":"лимбаж"}},{"word":"limbaj de asamblare","pos":"noun","definitions":["assembly language"],"forms":{"plural":"limbaje de asamblare"}},{"word":"limbaj de calculator","pos":"noun","definitions":["computer language"],"forms":{"plural":"limbaje de calculator"}},{"word":"limbaj de programare","pos":"noun","definitions":["programming language"],"forms":{"plural":"limbaje de programare"}},{"word":"limbaj mașină","pos":"noun","definitions":["machine language"],"forms":{"plural":"limbaje mașină"}},{"word":"limbaje","pos":"noun","definitions":["plural of limbaj"],"gender":"m-p"},{"word":"limbareț","pos":"adj","definitions":["talkative, chatty, loquacious"],"forms":{"feminine-singular":"limbareață","masculine-plural":"limbareți","feminine-neuter-plural":"limbarețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"limbareț","error-unrecognized-form-feminine-indefinite-singular":"limbareață","error-unrecognized-form-indefinite-masculine-plural":"limbareți","error-unrecognized-form-feminine-indefinite-neuter-plural":"limbarețe","definite-error-unrecognized-form-masculine-neuter-singular":"limbarețul","definite-error-unrecognized-form-feminine-singular":"limbareața","definite-error-unrecognized-form-masculine-plural":"limbareții","definite-error-unrecognized-form-feminine-neuter-plural":"limbarețele"}},{"word":"limbariță","pos":"noun","definitions":["European water-plantain (Alisma plantago-aquatica)","tendency to talk too much"],"forms":{"plural":"limbarițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"limbariță","accusative-definite-nominative-singular":"limbarița","accusative-indefinite-nominative-plural":"limbarițe","accusative-definite-nominative-plural":"limbarițele","dative-genitive-indefinite-singular":"limbarițe","dative-definite-genitive-singular":"limbariței","dative-genitive-indefinite-plural":"limbarițe","dative-definite-genitive-plural":"limbarițelor","singular-vocative":"limbariță","plural-vocative":"limbarițelor"}},{"word":"Limbășelu Mare","pos":"name","definitions":["a river in Prahova, Romania, tributary to the Azuga"],"gender":"m"},{"word":"Limbășelu Mic","pos":"name","definitions":["a river in Prahova, Romania, tributary to the Azuga"],"gender":"m"},{"word":"Limbenii Noi","pos":"name","definitions":["a village in Limbenii Noi, Glodeni Raion, Moldova","a commune of Glodeni Raion, Moldova"],"gender":"m"},{"word":"Limbenii Vechi","pos":"name","definitions":["a village in Limbenii Vechi, Glodeni Raion, Moldova","a commune of Glodeni Raion, Moldova"],"gender":"m"},{"word":"limbi","pos":"noun","definitions":["plural of limbă"],"pronunciation":"/ˈlim.bi/","gender":"f-p"},{"word":"limbii","pos":"noun","definitions":["definite genitive/dative singular of limbă"],"pronunciation":"[ˈlimbiː]","gender":"f"},{"word":"limbile","pos":"noun","definitions":["definite nominative/accusative plural of limbă"],"pronunciation":"[ˈlimbile]","gender":"f-p"},{"word":"limbilor","pos":"noun","definitions":["definite genitive/dative plural of limbă"],"pronunciation":"[ˈlimbilor]","gender":"f-p"},{"word":"limbist","pos":"noun","definitions":["linguist","ass-kisser, flatterer, sycophant","cunnilinguist"],"forms":{"plural":"limbiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"limbist","accusative-definite-nominative-singular":"lingvistul","accusative-indefinite-nominative-plural":"lingviști","accusative-definite-nominative-plural":"lingviștii","dative-genitive-indefinite-singular":"limbist","dative-definite-genitive-singular":"lingvistului","dative-genitive-indefinite-plural":"lingviști","dative-definite-genitive-plural":"lingviștilor","singular-vocative":"lingvistule","plural-vocative":"lingviștilor"}},{"word":"limbistică","pos":"noun","definitions":["linguistics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"limbistică","accusative-definite-nominative":"limbistica","dative-genitive-indefinite":"limbistice","dative-definite-genitive":"limbisticei","vocative":"limbistică"}},{"word":"limbiță","pos":"noun","definitions":["diminutive of limbă"],"forms":{"plural":"limbițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"limbiță","accusative-definite-nominative-singular":"limbița","accusative-indefinite-nominative-plural":"limbițe","accusative-definite-nominative-plural":"limbițele","dative-genitive-indefinite-singular":"limbițe","dative-definite-genitive-singular":"limbiței","dative-genitive-indefinite-plural":"limbițe","dative-definite-genitive-plural":"limbițelor","singular-vocative":"limbiță","plural-vocative":"limbițelor"}},{"word":"limbotenie","pos":"noun","definitions":["nation"],"forms":{"plural":"limbotenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"limbotenie","accusative-definite-nominative-singular":"limbotenia","accusative-indefinite-nominative-plural":"limbotenii","accusative-definite-nominative-plural":"limboteniile","dative-genitive-indefinite-singular":"limbotenii","dative-definite-genitive-singular":"limboteniei","dative-genitive-indefinite-plural":"limbotenii","dative-definite-genitive-plural":"limboteniilor","singular-vocative":"limbotenie","plural-vocative":"limboteniilor"}},{"word":"limbric","pos":"noun","definitions":["roundworm"],"forms":{"plural":"limbrici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"limbric","accusative-definite-nominative-singular":"limbricul","accusative-indefinite-nominative-plural":"limbrici","accusative-definite-nominative-plural":"limbricii","dative-genitive-indefinite-singular":"limbric","dative-definite-genitive-singular":"limbricului","dative-genitive-indefinite-plural":"limbrici","dative-definite-genitive-plural":"limbricilor","singular-vocative":"limbricule","plural-vocative":"limbricilor"}},{"word":"limbricariță","pos":"noun","definitions":["ascariasis"],"forms":{"plural":"limbricarițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"limbricariță","accusative-definite-nominative-singular":"limbricarița","accusative-indefinite-nominative-plural":"limbricarițe","accusative-definite-nominative-plural":"limbricarițele","dative-genitive-indefinite-singular":"limbricarițe","dative-definite-genitive-singular":"limbricariței","dative-genitive-indefinite-plural":"limbricarițe","dative-definite-genitive-plural":"limbricarițelor","singular-vocative":"limbricariță","plural-vocative":"limbricarițelor"}},{"word":"limbricaș","pos":"noun","definitions":["willowherb (Epilobium)"],"forms":{"plural":"limbricași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"limbricaș","accusative-definite-nominative-singular":"limbricașul","accusative-indefinite-nominative-plural":"limbricași","accusative-definite-nominative-plural":"limbricașii","dative-genitive-indefinite-singular":"limbricaș","dative-definite-genitive-singular":"limbricașului","dative-genitive-indefinite-plural":"limbricași","dative-definite-genitive-plural":"limbricașilor","singular-vocative":"limbricașule","plural-vocative":"limbricașilor"}},{"word":"limbricos","pos":"adj","definitions":["which has roundworms"],"forms":{"feminine-singular":"limbricoasă","masculine-plural":"limbricoși","feminine-neuter-plural":"limbricoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"limbricos","error-unrecognized-form-feminine-indefinite-singular":"limbricoasă","error-unrecognized-form-indefinite-masculine-plural":"limbricoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"limbricoase","definite-error-unrecognized-form-masculine-neuter-singular":"limbricosul","definite-error-unrecognized-form-feminine-singular":"limbricoasa","definite-error-unrecognized-form-masculine-plural":"limbricoșii","definite-error-unrecognized-form-feminine-neuter-plural":"limbricoasele"}},{"word":"limbricuț","pos":"noun","definitions":["diminutive of limbric"],"forms":{"plural":"limbricuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"limbricuț","accusative-definite-nominative-singular":"limbricuțul","accusative-indefinite-nominative-plural":"limbricuți","accusative-definite-nominative-plural":"limbricuții","dative-genitive-indefinite-singular":"limbricuț","dative-definite-genitive-singular":"limbricuțului","dative-genitive-indefinite-plural":"limbricuți","dative-definite-genitive-plural":"limbricuților","singular-vocative":"limbricuțule","plural-vocative":"limbricuților"}},{"word":"limbuliță","pos":"noun","definitions":["diminutive of limbă"],"forms":{"plural":"limbulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"limbuliță","accusative-definite-nominative-singular":"limbulița","accusative-indefinite-nominative-plural":"limbulițe","accusative-definite-nominative-plural":"limbulițele","dative-genitive-indefinite-singular":"limbulițe","dative-definite-genitive-singular":"limbuliței","dative-genitive-indefinite-plural":"limbulițe","dative-definite-genitive-plural":"limbulițelor","singular-vocative":"limbuliță","plural-vocative":"limbulițelor"}},{"word":"limbușoară","pos":"noun","definitions":["garden candytuft (Iberis umbellata)"],"forms":{"plural":"limbușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"limbușoară","accusative-definite-nominative-singular":"limbușoara","accusative-indefinite-nominative-plural":"limbușoare","accusative-definite-nominative-plural":"limbușoarele","dative-genitive-indefinite-singular":"limbușoare","dative-definite-genitive-singular":"limbușoarei","dative-genitive-indefinite-plural":"limbușoare","dative-definite-genitive-plural":"limbușoarelor","singular-vocative":"limbușoară","plural-vocative":"limbușoarelor"}},{"word":"limbut","pos":"adj","definitions":["talkative, talky, chatty, garrulous"],"pronunciation":"/limˈbut/","forms":{"feminine-singular":"limbută","masculine-plural":"limbuți","feminine-neuter-plural":"limbute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"limbut","error-unrecognized-form-feminine-indefinite-singular":"limbută","error-unrecognized-form-indefinite-masculine-plural":"limbuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"limbute","definite-error-unrecognized-form-masculine-neuter-singular":"limbutul","definite-error-unrecognized-form-feminine-singular":"limbuta","definite-error-unrecognized-form-masculine-plural":"limbuții","definite-error-unrecognized-form-feminine-neuter-plural":"limbutele"}},{"word":"limbut","pos":"noun","definitions":["prattler, chatterbox, windbag"],"pronunciation":"/limˈbut/","forms":{"plural":"limbuți","feminine":"equivalent limbută","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"limbut","accusative-definite-nominative-singular":"limbutul","accusative-indefinite-nominative-plural":"limbuți","accusative-definite-nominative-plural":"limbuții","dative-genitive-indefinite-singular":"limbut","dative-definite-genitive-singular":"limbutului","dative-genitive-indefinite-plural":"limbuți","dative-definite-genitive-plural":"limbuților","singular-vocative":"limbutule","plural-vocative":"limbuților"}},{"word":"limbuta","pos":"noun","definitions":["definite nominative/accusative singular of limbută"],"gender":"f"},{"word":"limbută","pos":"noun","definitions":["female equivalent of limbut"],"forms":{"plural":"limbute","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"limbută","accusative-definite-nominative-singular":"limbuta","accusative-indefinite-nominative-plural":"limbute","accusative-definite-nominative-plural":"limbutele","dative-genitive-indefinite-singular":"limbute","dative-definite-genitive-singular":"limbutei","dative-genitive-indefinite-plural":"limbute","dative-definite-genitive-plural":"limbutelor","singular-vocative":"limbută","plural-vocative":"limbutelor"}},{"word":"limbuță","pos":"noun","definitions":["diminutive of limbă; small tongue"],"forms":{"plural":"limbuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"limbuță","accusative-definite-nominative-singular":"limbuța","accusative-indefinite-nominative-plural":"limbuțe","accusative-definite-nominative-plural":"limbuțele","dative-genitive-indefinite-singular":"limbuțe","dative-definite-genitive-singular":"limbuței","dative-genitive-indefinite-plural":"limbuțe","dative-definite-genitive-plural":"limbuțelor","singular-vocative":"limbuță","plural-vocative":"limbuțelor"}},{"word":"limbuți","pos":"verb","definitions":["to babble"],"forms":{"canonical":"a limbuți 4th conjugation","present-singular-third-person":"limbuțește","participle-past":"limbuțit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a limbuți","gerund":"limbuțind","first-person-indicative-present-singular":"limbuțesc","indicative-present-second-person-singular":"limbuțești","indicative-present-singular-third-person":"limbuțește","first-person-indicative-plural-present":"limbuțim","indicative-plural-present-second-person":"limbuțiți","indicative-plural-present-third-person":"limbuțesc","first-person-imperfect-indicative-singular":"limbuțeam","imperfect-indicative-second-person-singular":"limbuțeai","imperfect-indicative-singular-third-person":"limbuțea","first-person-imperfect-indicative-plural":"limbuțeam","imperfect-indicative-plural-second-person":"limbuțeați","imperfect-indicative-plural-third-person":"limbuțeau","first-person-indicative-perfect-singular":"limbuții","indicative-perfect-second-person-singular":"limbuțiși","indicative-perfect-singular-third-person":"limbuți","first-person-indicative-perfect-plural":"limbuțirăm","indicative-perfect-plural-second-person":"limbuțirăți","indicative-perfect-plural-third-person":"limbuțiră","first-person-indicative-pluperfect-singular":"limbuțisem","indicative-pluperfect-second-person-singular":"limbuțiseși","indicative-pluperfect-singular-third-person":"limbuțise","first-person-indicative-pluperfect-plural":"limbuțiserăm","indicative-pluperfect-plural-second-person":"limbuțiserăți","indicative-pluperfect-plural-third-person":"limbuțiseră","first-person-present-singular-subjunctive":"să limbuțesc","present-second-person-singular-subjunctive":"să limbuțești","present-singular-subjunctive-third-person":"să limbuțească","first-person-plural-present-subjunctive":"să limbuțim","plural-present-second-person-subjunctive":"să limbuțiți","plural-present-subjunctive-third-person":"să limbuțească","imperative-second-person-singular":"limbuțește","imperative-plural-second-person":"limbuțiți","imperative-negative-second-person-singular":"nu limbuți","imperative-negative-plural-second-person":"nu limbuțiți"}},{"word":"limbuție","pos":"noun","definitions":["loquacity"],"forms":{"plural":"limbuții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"limbuție","accusative-definite-nominative-singular":"limbuția","accusative-indefinite-nominative-plural":"limbuții","accusative-definite-nominative-plural":"limbuțiile","dative-genitive-indefinite-singular":"limbuții","dative-definite-genitive-singular":"limbuției","dative-genitive-indefinite-plural":"limbuții","dative-definite-genitive-plural":"limbuțiilor","singular-vocative":"limbuție","plural-vocative":"limbuțiilor"}},{"word":"limes","pos":"noun","definitions":["limes"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"limes","accusative-definite-nominative":"limesul","dative-genitive-indefinite":"limes","dative-definite-genitive":"limesului","vocative":"limesule"}},{"word":"limetă","pos":"noun","definitions":["lime (citrus fruit)"],"pronunciation":"/liˈme.tə/","forms":{"plural":"limete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"limetă","accusative-definite-nominative-singular":"limeta","accusative-indefinite-nominative-plural":"limete","accusative-definite-nominative-plural":"limetele","dative-genitive-indefinite-singular":"limete","dative-definite-genitive-singular":"limetei","dative-genitive-indefinite-plural":"limete","dative-definite-genitive-plural":"limetelor","singular-vocative":"limetă","plural-vocative":"limetelor"}},{"word":"limfă","pos":"noun","definitions":["lymph"],"forms":{"plural":"limfe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"limfă","accusative-definite-nominative-singular":"limfa","accusative-indefinite-nominative-plural":"limfe","accusative-definite-nominative-plural":"limfele","dative-genitive-indefinite-singular":"limfe","dative-definite-genitive-singular":"limfei","dative-genitive-indefinite-plural":"limfe","dative-definite-genitive-plural":"limfelor","singular-vocative":"limfă","plural-vocative":"limfelor"}},{"word":"limfadenie","pos":"noun","definitions":["lymphadenia"],"forms":{"plural":"limfadenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"limfadenie","accusative-definite-nominative-singular":"limfadenia","accusative-indefinite-nominative-plural":"limfadenii","accusative-definite-nominative-plural":"limfadeniile","dative-genitive-indefinite-singular":"limfadenii","dative-definite-genitive-singular":"limfadeniei","dative-genitive-indefinite-plural":"limfadenii","dative-definite-genitive-plural":"limfadeniilor","singular-vocative":"limfadenie","plural-vocative":"limfadeniilor"}},{"word":"limfadenită","pos":"noun","definitions":["lymphadenitis"],"forms":{"plural":"limfadenite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"limfadenită","accusative-definite-nominative-singular":"limfadenita","accusative-indefinite-nominative-plural":"limfadenite","accusative-definite-nominative-plural":"limfadenitele","dative-genitive-indefinite-singular":"limfadenite","dative-definite-genitive-singular":"limfadenitei","dative-genitive-indefinite-plural":"limfadenite","dative-definite-genitive-plural":"limfadenitelor","singular-vocative":"limfadenită","plural-vocative":"limfadenitelor"}},{"word":"limfadenom","pos":"noun","definitions":["lymphadenoma"],"forms":{"plural":"limfadenoame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"limfadenom","accusative-definite-nominative-singular":"limfadenomul","accusative-indefinite-nominative-plural":"limfadenoame","accusative-definite-nominative-plural":"limfadenoamele","dative-genitive-indefinite-singular":"limfadenom","dative-definite-genitive-singular":"limfadenomului","dative-genitive-indefinite-plural":"limfadenoame","dative-definite-genitive-plural":"limfadenoamelor","singular-vocative":"limfadenomule","plural-vocative":"limfadenoamelor"}},{"word":"limfagog","pos":"noun","definitions":["lymphagogue"],"forms":{"plural":"limfagogi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"limfagog","accusative-definite-nominative-singular":"limfagogul","accusative-indefinite-nominative-plural":"limfagogi","accusative-definite-nominative-plural":"limfagogile","dative-genitive-indefinite-singular":"limfagog","dative-definite-genitive-singular":"limfagogului","dative-genitive-indefinite-plural":"limfagogi","dative-definite-genitive-plural":"limfagogilor","singular-vocative":"limfagogule","plural-vocative":"limfagogilor"}},{"word":"limfangiectazie","pos":"noun","definitions":["lymphangiectasia"],"forms":{"plural":"limfangiectazii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"limfangiectazie","accusative-definite-nominative-singular":"limfangiectazia","accusative-indefinite-nominative-plural":"limfangiectazii","accusative-definite-nominative-plural":"limfangiectaziile","dative-genitive-indefinite-singular":"limfangiectazii","dative-definite-genitive-singular":"limfangiectaziei","dative-genitive-indefinite-plural":"limfangiectazii","dative-definite-genitive-plural":"limfangiectaziilor","singular-vocative":"limfangiectazie","plural-vocative":"limfangiectaziilor"}},{"word":"limfangiom","pos":"noun","definitions":["lymphangioma"],"forms":{"plural":"limfangioame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"limfangiom","accusative-definite-nominative-singular":"limfangiomul","accusative-indefinite-nominative-plural":"limfangioame","accusative-definite-nominative-plural":"limfangioamele","dative-genitive-indefinite-singular":"limfangiom","dative-definite-genitive-singular":"limfangiomului","dative-genitive-indefinite-plural":"limfangioame","dative-definite-genitive-plural":"limfangioamelor","singular-vocative":"limfangiomule","plural-vocative":"limfangioamelor"}},{"word":"limfangioplastie","pos":"noun","definitions":["lymphangioplasty"],"forms":{"plural":"limfangioplastii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"limfangioplastie","accusative-definite-nominative-singular":"limfangioplastia","accusative-indefinite-nominative-plural":"limfangioplastii","accusative-definite-nominative-plural":"limfangioplastiile","dative-genitive-indefinite-singular":"limfangioplastii","dative-definite-genitive-singular":"limfangioplastiei","dative-genitive-indefinite-plural":"limfangioplastii","dative-definite-genitive-plural":"limfangioplastiilor","singular-vocative":"limfangioplastie","plural-vocative":"limfangioplastiilor"}},{"word":"limfangiosarcom","pos":"noun","definitions":["lymphangiosarcoma"],"forms":{"plural":"limfangiosarcoame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"limfangiosarcom","accusative-definite-nominative-singular":"limfangiosarcomul","accusative-indefinite-nominative-plural":"limfangiosarcoame","accusative-definite-nominative-plural":"limfangiosarcoamele","dative-genitive-indefinite-singular":"limfangiosarcom","dative-definite-genitive-singular":"limfangiosarcomului","dative-genitive-indefinite-plural":"limfangiosarcoame","dative-definite-genitive-plural":"limfangiosarcoamelor","singular-vocative":"limfangiosarcomule","plural-vocative":"limfangiosarcoamelor"}},{"word":"limfangită","pos":"noun","definitions":["lymphangitis"],"forms":{"plural":"limfangite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"limfangită","accusative-definite-nominative-singular":"limfangita","accusative-indefinite-nominative-plural":"limfangite","accusative-definite-nominative-plural":"limfangitele","dative-genitive-indefinite-singular":"limfangite","dative-definite-genitive-singular":"limfangitei","dative-genitive-indefinite-plural":"limfangite","dative-definite-genitive-plural":"limfangitelor","singular-vocative":"limfangită","plural-vocative":"limfangitelor"}},{"word":"limfatic","pos":"adj","definitions":["lymphatic"],"forms":{"feminine-singular":"limfatică","masculine-plural":"limfatici","feminine-neuter-plural":"limfatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"limfatic","error-unrecognized-form-feminine-indefinite-singular":"limfatică","error-unrecognized-form-indefinite-masculine-plural":"limfatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"limfatice","definite-error-unrecognized-form-masculine-neuter-singular":"limfaticul","definite-error-unrecognized-form-feminine-singular":"limfatica","definite-error-unrecognized-form-masculine-plural":"limfaticii","definite-error-unrecognized-form-feminine-neuter-plural":"limfaticele"}},{"word":"limfatism","pos":"noun","definitions":["lymphatism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"limfatism","accusative-definite-nominative-singular":"limfatismul","accusative-indefinite-nominative-plural":"limfatisme","accusative-definite-nominative-plural":"limfatismele","dative-genitive-indefinite-singular":"limfatism","dative-definite-genitive-singular":"limfatismului","dative-genitive-indefinite-plural":"limfatisme","dative-definite-genitive-plural":"limfatismelor","singular-vocative":"limfatismule","plural-vocative":"limfatismelor"}},{"word":"limfoblast","pos":"noun","definitions":["lymphoblast"],"forms":{"plural":"limfoblaste","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"limfoblast","accusative-definite-nominative-singular":"limfoblastul","accusative-indefinite-nominative-plural":"limfoblaste","accusative-definite-nominative-plural":"limfoblastele","dative-genitive-indefinite-singular":"limfoblast","dative-definite-genitive-singular":"limfoblastului","dative-genitive-indefinite-plural":"limfoblaste","dative-definite-genitive-plural":"limfoblastelor","singular-vocative":"limfoblastule","plural-vocative":"limfoblastelor"}},{"word":"limfoblastom","pos":"noun","definitions":["lymphoblastoma"],"forms":{"plural":"limfoblastoame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"limfoblastom","accusative-definite-nominative-singular":"limfoblastomul","accusative-indefinite-nominative-plural":"limfoblastoame","accusative-definite-nominative-plural":"limfoblastoamele","dative-genitive-indefinite-singular":"limfoblastom","dative-definite-genitive-singular":"limfoblastomului","dative-genitive-indefinite-plural":"limfoblastoame","dative-definite-genitive-plural":"limfoblastoamelor","singular-vocative":"limfoblastomule","plural-vocative":"limfoblastoamelor"}},{"word":"limfocit","pos":"noun","definitions":["lymphocyte"],"forms":{"plural":"limfocite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"limfocit","accusative-definite-nominative-singular":"limfocitul","accusative-indefinite-nominative-plural":"limfocite","accusative-definite-nominative-plural":"limfocitele","dative-genitive-indefinite-singular":"limfocit","dative-definite-genitive-singular":"limfocitului","dative-genitive-indefinite-plural":"limfocite","dative-definite-genitive-plural":"limfocitelor","singular-vocative":"limfocitule","plural-vocative":"limfocitelor"}},{"word":"limfocită","pos":"noun","definitions":["alternative form of limfocit"],"forms":{"plural":"limfocite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"limfocită","accusative-definite-nominative-singular":"limfocita","accusative-indefinite-nominative-plural":"limfocite","accusative-definite-nominative-plural":"limfocitele","dative-genitive-indefinite-singular":"limfocite","dative-definite-genitive-singular":"limfocitei","dative-genitive-indefinite-plural":"limfocite","dative-definite-genitive-plural":"limfocitelor","singular-vocative":"limfocită","plural-vocative":"limfocitelor"}},{"word":"limfocitemie","pos":"noun","definitions":["lymphocytosis"],"forms":{"plural":"limfocitemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"limfocitemie","accusative-definite-nominative-singular":"limfocitemia","accusative-indefinite-nominative-plural":"limfocitemii","accusative-definite-nominative-plural":"limfocitemiile","dative-genitive-indefinite-singular":"limfocitemii","dative-definite-genitive-singular":"limfocitemiei","dative-genitive-indefinite-plural":"limfocitemii","dative-definite-genitive-plural":"limfocitemiilor","singular-vocative":"limfocitemie","plural-vocative":"limfocitemiilor"}},{"word":"limfocitoză","pos":"noun","definitions":["lymphocytosis"],"forms":{"plural":"limfocitoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"limfocitoză","accusative-definite-nominative-singular":"limfocitoza","accusative-indefinite-nominative-plural":"limfocitoze","accusative-definite-nominative-plural":"limfocitozele","dative-genitive-indefinite-singular":"limfocitoze","dative-definite-genitive-singular":"limfocitozei","dative-genitive-indefinite-plural":"limfocitoze","dative-definite-genitive-plural":"limfocitozelor","singular-vocative":"limfocitoză","plural-vocative":"limfocitozelor"}},{"word":"limfografie","pos":"noun","definitions":["lymphography"],"forms":{"plural":"limfografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"limfografie","accusative-definite-nominative-singular":"limfografia","accusative-indefinite-nominative-plural":"limfografii","accusative-definite-nominative-plural":"limfografiile","dative-genitive-indefinite-singular":"limfografii","dative-definite-genitive-singular":"limfografiei","dative-genitive-indefinite-plural":"limfografii","dative-definite-genitive-plural":"limfografiilor","singular-vocative":"limfografie","plural-vocative":"limfografiilor"}},{"word":"limfogranulomatoză","pos":"noun","definitions":["lymphogranulomatosis"],"forms":{"plural":"limfogranulomatoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"limfogranulomatoză","accusative-definite-nominative-singular":"limfogranulomatoza","accusative-indefinite-nominative-plural":"limfogranulomatoze","accusative-definite-nominative-plural":"limfogranulomatozele","dative-genitive-indefinite-singular":"limfogranulomatoze","dative-definite-genitive-singular":"limfogranulomatozei","dative-genitive-indefinite-plural":"limfogranulomatoze","dative-definite-genitive-plural":"limfogranulomatozelor","singular-vocative":"limfogranulomatoză","plural-vocative":"limfogranulomatozelor"}},{"word":"limfoid","pos":"adj","definitions":["lymphoid"],"forms":{"feminine-singular":"limfoidă","masculine-plural":"limfoizi","feminine-neuter-plural":"limfoide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"limfoid","error-unrecognized-form-feminine-indefinite-singular":"limfoidă","error-unrecognized-form-indefinite-masculine-plural":"limfoizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"limfoide","definite-error-unrecognized-form-masculine-neuter-singular":"limfoidul","definite-error-unrecognized-form-feminine-singular":"limfoida","definite-error-unrecognized-form-masculine-plural":"limfoizii","definite-error-unrecognized-form-feminine-neuter-plural":"limfoidele"}},{"word":"limfom","pos":"noun","definitions":["lymphoma"],"forms":{"plural":"limfoame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"limfom","accusative-definite-nominative-singular":"limfomul","accusative-indefinite-nominative-plural":"limfoame","accusative-definite-nominative-plural":"limfoamele","dative-genitive-indefinite-singular":"limfom","dative-definite-genitive-singular":"limfomului","dative-genitive-indefinite-plural":"limfoame","dative-definite-genitive-plural":"limfoamelor","singular-vocative":"limfomule","plural-vocative":"limfoamelor"}},{"word":"limfomatoză","pos":"noun","definitions":["lymphomatosis"],"forms":{"plural":"limfomatoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"limfomatoză","accusative-definite-nominative-singular":"limfomatoza","accusative-indefinite-nominative-plural":"limfomatoze","accusative-definite-nominative-plural":"limfomatozele","dative-genitive-indefinite-singular":"limfomatoze","dative-definite-genitive-singular":"limfomatozei","dative-genitive-indefinite-plural":"limfomatoze","dative-definite-genitive-plural":"limfomatozelor","singular-vocative":"limfomatoză","plural-vocative":"limfomatozelor"}},{"word":"limfopatie","pos":"noun","definitions":["lymphopathy"],"forms":{"plural":"limfopatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"limfopatie","accusative-definite-nominative-singular":"limfopatia","accusative-indefinite-nominative-plural":"limfopatii","accusative-definite-nominative-plural":"limfopatiile","dative-genitive-indefinite-singular":"limfopatii","dative-definite-genitive-singular":"limfopatiei","dative-genitive-indefinite-plural":"limfopatii","dative-definite-genitive-plural":"limfopatiilor","singular-vocative":"limfopatie","plural-vocative":"limfopatiilor"}},{"word":"limfopenie","pos":"noun","definitions":["lymphopenia"],"forms":{"plural":"limfopenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"limfopenie","accusative-definite-nominative-singular":"limfopenia","accusative-indefinite-nominative-plural":"limfopenii","accusative-definite-nominative-plural":"limfopeniile","dative-genitive-indefinite-singular":"limfopenii","dative-definite-genitive-singular":"limfopeniei","dative-genitive-indefinite-plural":"limfopenii","dative-definite-genitive-plural":"limfopeniilor","singular-vocative":"limfopenie","plural-vocative":"limfopeniilor"}},{"word":"limfopoieză","pos":"noun","definitions":["lymphopoiesis"],"forms":{"plural":"limfopoieze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"limfopoieză","accusative-definite-nominative-singular":"limfopoieza","accusative-indefinite-nominative-plural":"limfopoieze","accusative-definite-nominative-plural":"limfopoiezele","dative-genitive-indefinite-singular":"limfopoieze","dative-definite-genitive-singular":"limfopoiezei","dative-genitive-indefinite-plural":"limfopoieze","dative-definite-genitive-plural":"limfopoiezelor","singular-vocative":"limfopoieză","plural-vocative":"limfopoiezelor"}},{"word":"limforagie","pos":"noun","definitions":["lymphorrhagia"],"forms":{"plural":"limforagii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"limforagie","accusative-definite-nominative-singular":"limforagia","accusative-indefinite-nominative-plural":"limforagii","accusative-definite-nominative-plural":"limforagiile","dative-genitive-indefinite-singular":"limforagii","dative-definite-genitive-singular":"limforagiei","dative-genitive-indefinite-plural":"limforagii","dative-definite-genitive-plural":"limforagiilor","singular-vocative":"limforagie","plural-vocative":"limforagiilor"}},{"word":"limforee","pos":"noun","definitions":["lymphorrhea"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"limforee","accusative-definite-nominative":"limforeea","dative-genitive-indefinite":"limforee","dative-definite-genitive":"limforeei","vocative":"limforee"}},{"word":"limfosarcom","pos":"noun","definitions":["lymphosarcoma"],"forms":{"plural":"limfosarcoame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"limfosarcom","accusative-definite-nominative-singular":"limfosarcomul","accusative-indefinite-nominative-plural":"limfosarcoame","accusative-definite-nominative-plural":"limfosarcoamele","dative-genitive-indefinite-singular":"limfosarcom","dative-definite-genitive-singular":"limfosarcomului","dative-genitive-indefinite-plural":"limfosarcoame","dative-definite-genitive-plural":"limfosarcoamelor","singular-vocative":"limfosarcomule","plural-vocative":"limfosarcoamelor"}},{"word":"limfotrop","pos":"adj","definitions":["lymphotropic"],"forms":{"feminine-singular":"limfotropă","masculine-plural":"limfotropi","feminine-neuter-plural":"limfotrope","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"limfotrop","error-unrecognized-form-feminine-indefinite-singular":"limfotropă","error-unrecognized-form-indefinite-masculine-plural":"limfotropi","error-unrecognized-form-feminine-indefinite-neuter-plural":"limfotrope","definite-error-unrecognized-form-masculine-neuter-singular":"limfotropul","definite-error-unrecognized-form-feminine-singular":"limfotropa","definite-error-unrecognized-form-masculine-plural":"limfotropii","definite-error-unrecognized-form-feminine-neuter-plural":"limfotropele"}},{"word":"limicol","pos":"adj","definitions":["limicolous"],"forms":{"feminine-singular":"limicolă","masculine-plural":"limicoli","feminine-neuter-plural":"limicole","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"limicol","error-unrecognized-form-feminine-indefinite-singular":"limicolă","error-unrecognized-form-indefinite-masculine-plural":"limicoli","error-unrecognized-form-feminine-indefinite-neuter-plural":"limicole","definite-error-unrecognized-form-masculine-neuter-singular":"limicolul","definite-error-unrecognized-form-feminine-singular":"limicola","definite-error-unrecognized-form-masculine-plural":"limicolii","definite-error-unrecognized-form-feminine-neuter-plural":"limicolele"}},{"word":"limier","pos":"noun","definitions":["bloodhound"],"forms":{"plural":"limieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"limier","accusative-definite-nominative-singular":"limierul","accusative-indefinite-nominative-plural":"limieri","accusative-definite-nominative-plural":"limierii","dative-genitive-indefinite-singular":"limier","dative-definite-genitive-singular":"limierului","dative-genitive-indefinite-plural":"limieri","dative-definite-genitive-plural":"limierilor","singular-vocative":"limierule","plural-vocative":"limierilor"}},{"word":"liminal","pos":"adj","definitions":["liminal"],"forms":{"feminine-singular":"liminală","masculine-plural":"liminali","feminine-neuter-plural":"liminale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liminal","error-unrecognized-form-feminine-indefinite-singular":"liminală","error-unrecognized-form-indefinite-masculine-plural":"liminali","error-unrecognized-form-feminine-indefinite-neuter-plural":"liminale","definite-error-unrecognized-form-masculine-neuter-singular":"liminalul","definite-error-unrecognized-form-feminine-singular":"liminala","definite-error-unrecognized-form-masculine-plural":"liminalii","definite-error-unrecognized-form-feminine-neuter-plural":"liminalele"}},{"word":"liminar","pos":"adj","definitions":["introductory"],"forms":{"feminine-singular":"liminară","masculine-plural":"liminari","feminine-neuter-plural":"liminare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liminar","error-unrecognized-form-feminine-indefinite-singular":"liminară","error-unrecognized-form-indefinite-masculine-plural":"liminari","error-unrecognized-form-feminine-indefinite-neuter-plural":"liminare","definite-error-unrecognized-form-masculine-neuter-singular":"liminarul","definite-error-unrecognized-form-feminine-singular":"liminara","definite-error-unrecognized-form-masculine-plural":"liminarii","definite-error-unrecognized-form-feminine-neuter-plural":"liminarele"}},{"word":"limita","pos":"verb","definitions":["to limit"],"pronunciation":"[li.miˈta]","forms":{"canonical":"a limita 1st conjugation","present-singular-third-person":"limitează","participle-past":"limitat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a limita","gerund":"limitând","first-person-indicative-present-singular":"limitez","indicative-present-second-person-singular":"limitezi","indicative-present-singular-third-person":"limitează","first-person-indicative-plural-present":"limităm","indicative-plural-present-second-person":"limitați","indicative-plural-present-third-person":"limitează","first-person-imperfect-indicative-singular":"limitam","imperfect-indicative-second-person-singular":"limitai","imperfect-indicative-singular-third-person":"limita","first-person-imperfect-indicative-plural":"limitam","imperfect-indicative-plural-second-person":"limitați","imperfect-indicative-plural-third-person":"limitau","first-person-indicative-perfect-singular":"limitai","indicative-perfect-second-person-singular":"limitași","indicative-perfect-singular-third-person":"limită","first-person-indicative-perfect-plural":"limitarăm","indicative-perfect-plural-second-person":"limitarăți","indicative-perfect-plural-third-person":"limitară","first-person-indicative-pluperfect-singular":"limitasem","indicative-pluperfect-second-person-singular":"limitaseși","indicative-pluperfect-singular-third-person":"limitase","first-person-indicative-pluperfect-plural":"limitaserăm","indicative-pluperfect-plural-second-person":"limitaserăți","indicative-pluperfect-plural-third-person":"limitaseră","first-person-present-singular-subjunctive":"să limitez","present-second-person-singular-subjunctive":"să limitezi","present-singular-subjunctive-third-person":"să limiteze","first-person-plural-present-subjunctive":"să limităm","plural-present-second-person-subjunctive":"să limitați","plural-present-subjunctive-third-person":"să limiteze","imperative-second-person-singular":"limitează","imperative-plural-second-person":"limitați","imperative-negative-second-person-singular":"nu limita","imperative-negative-plural-second-person":"nu limitați"}},{"word":"limita","pos":"noun","definitions":["definite nominative/accusative singular of limită"],"pronunciation":"[ˈli.mi.ta]"},{"word":"limită","pos":"noun","definitions":["limit"],"pronunciation":"[ˈli.mi.tə]","forms":{"plural":"limite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"limită","accusative-definite-nominative-singular":"limita","accusative-indefinite-nominative-plural":"limite","accusative-definite-nominative-plural":"limitele","dative-genitive-indefinite-singular":"limite","dative-definite-genitive-singular":"limitei","dative-genitive-indefinite-plural":"limite","dative-definite-genitive-plural":"limitelor","singular-vocative":"limită","plural-vocative":"limitelor"}},{"word":"limită","pos":"verb","definitions":["third-person singular simple perfect indicative of limita"],"pronunciation":"[li.miˈtə]"},{"word":"limită de timp","pos":"noun","definitions":["time limit"],"forms":{"plural":"limite de timp"}},{"word":"limită de vârstă","pos":"noun","definitions":["age limit"],"forms":{"plural":"limite de vârstă"}},{"word":"limită de viteză","pos":"noun","definitions":["speed limit"],"forms":{"plural":"limite de viteză"}},{"word":"limitabil","pos":"adj","definitions":["limitable"],"forms":{"feminine-singular":"limitabilă","masculine-plural":"limitabili","feminine-neuter-plural":"limitabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"limitabil","error-unrecognized-form-feminine-indefinite-singular":"limitabilă","error-unrecognized-form-indefinite-masculine-plural":"limitabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"limitabile","definite-error-unrecognized-form-masculine-neuter-singular":"limitabilul","definite-error-unrecognized-form-feminine-singular":"limitabila","definite-error-unrecognized-form-masculine-plural":"limitabilii","definite-error-unrecognized-form-feminine-neuter-plural":"limitabilele"}},{"word":"limitai","pos":"verb","definitions":["inflection of limita:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[li.miˈtaj]"},{"word":"limitam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of limita"],"pronunciation":"[li.miˈtam]"},{"word":"limităm","pos":"verb","definitions":["first-person plural present indicative/subjunctive of limita"],"pronunciation":"[li.miˈtəm]"},{"word":"limitând","pos":"verb","definitions":["gerund of limita"],"pronunciation":"[li.miˈtɨnd]"},{"word":"limitară","pos":"verb","definitions":["third-person plural simple perfect indicative of limita"],"pronunciation":"[li.miˈtarə]"},{"word":"limitarăm","pos":"verb","definitions":["first-person plural simple perfect indicative of limita"],"pronunciation":"[li.miˈtarəm]"},{"word":"limitarăți","pos":"verb","definitions":["second-person plural simple perfect indicative of limita"],"pronunciation":"[li.miˈtarətsʲ]"},{"word":"limitare","pos":"noun","definitions":["limitation"],"forms":{"plural":"limitări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"limitare","accusative-definite-nominative-singular":"limitarea","accusative-indefinite-nominative-plural":"limitări","accusative-definite-nominative-plural":"limitările","dative-genitive-indefinite-singular":"limitări","dative-definite-genitive-singular":"limitării","dative-genitive-indefinite-plural":"limitări","dative-definite-genitive-plural":"limitărilor","singular-vocative":"limitare","plural-vocative":"limitărilor"}},{"word":"limitase","pos":"verb","definitions":["third-person singular pluperfect indicative of limita"],"pronunciation":"[li.miˈtase]"},{"word":"limitasem","pos":"verb","definitions":["first-person singular pluperfect indicative of limita"],"pronunciation":"[li.miˈtasem]"},{"word":"limitaseră","pos":"verb","definitions":["third-person plural pluperfect indicative of limita"],"pronunciation":"[li.miˈtaserə]"},{"word":"limitaserăm","pos":"verb","definitions":["first-person plural pluperfect indicative of limita"],"pronunciation":"[li.miˈtaserəm]"},{"word":"limitaserăți","pos":"verb","definitions":["second-person plural pluperfect indicative of limita"],"pronunciation":"[li.miˈtaserətsʲ]"},{"word":"limitaseși","pos":"verb","definitions":["second-person singular pluperfect indicative of limita"],"pronunciation":"[li.miˈtaseʃʲ]"},{"word":"limitași","pos":"verb","definitions":["second-person singular simple perfect indicative of limita"],"pronunciation":"[li.miˈtaʃʲ]"},{"word":"limitat","pos":"adj","definitions":["limited"],"pronunciation":"[li.miˈtat]","forms":{"feminine-singular":"limitată","masculine-plural":"limitați","feminine-neuter-plural":"limitate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"limitat","error-unrecognized-form-feminine-indefinite-singular":"limitată","error-unrecognized-form-indefinite-masculine-plural":"limitați","error-unrecognized-form-feminine-indefinite-neuter-plural":"limitate","definite-error-unrecognized-form-masculine-neuter-singular":"limitatul","definite-error-unrecognized-form-feminine-singular":"limitata","definite-error-unrecognized-form-masculine-plural":"limitații","definite-error-unrecognized-form-feminine-neuter-plural":"limitatele"}},{"word":"limitat","pos":"verb","definitions":["past participle of limita"],"pronunciation":"[li.miˈtat]","forms":{"participle-past":"of limita"}},{"word":"limitați","pos":"adj","definitions":["masculine plural of limitat"],"pronunciation":"[li.miˈtat͡sʲ]"},{"word":"limitați","pos":"verb","definitions":["inflection of limita:","second-person plural present/imperfect indicative","second-person plural present subjunctive","second-person plural imperative"],"pronunciation":"[li.miˈtat͡sʲ]"},{"word":"limitație","pos":"noun","definitions":["limitation"]},{"word":"limitativ","pos":"adj","definitions":["limiting"],"forms":{"feminine-singular":"limitativă","masculine-plural":"limitativi","feminine-neuter-plural":"limitative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"limitativ","error-unrecognized-form-feminine-indefinite-singular":"limitativă","error-unrecognized-form-indefinite-masculine-plural":"limitativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"limitative","definite-error-unrecognized-form-masculine-neuter-singular":"limitativul","definite-error-unrecognized-form-feminine-singular":"limitativa","definite-error-unrecognized-form-masculine-plural":"limitativii","definite-error-unrecognized-form-feminine-neuter-plural":"limitativele"}},{"word":"limitator","pos":"noun","definitions":["limiter"],"forms":{"plural":"limitatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"limitator","accusative-definite-nominative-singular":"limitatorul","accusative-indefinite-nominative-plural":"limitatore","accusative-definite-nominative-plural":"limitatorele","dative-genitive-indefinite-singular":"limitator","dative-definite-genitive-singular":"limitatorului","dative-genitive-indefinite-plural":"limitatore","dative-definite-genitive-plural":"limitatorelor","singular-vocative":"limitatorule","plural-vocative":"limitatorelor"}},{"word":"limitau","pos":"verb","definitions":["third-person plural imperfect indicative of limita"],"pronunciation":"[li.miˈtaw]"},{"word":"limite","pos":"noun","definitions":["plural of limită (“limits”)"],"pronunciation":"/ˈli.mi.te/","gender":"f-p"},{"word":"limitează","pos":"verb","definitions":["inflection of limita:","third-person singular/plural present indicative","second-person singular imperative"],"pronunciation":"[li.miˈte̯a.zə]"},{"word":"limitez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of limita"],"pronunciation":"[li.miˈtez]"},{"word":"limiteze","pos":"verb","definitions":["third-person singular/plural present subjunctive of limita"],"pronunciation":"[li.miˈteze]"},{"word":"limitezi","pos":"verb","definitions":["second-person singular present indicative/subjunctive of limita"],"pronunciation":"[li.miˈtezʲ]"},{"word":"limitor","pos":"noun","definitions":["limiter"],"forms":{"plural":"limitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"limitor","accusative-definite-nominative-singular":"limitorul","accusative-indefinite-nominative-plural":"limitoare","accusative-definite-nominative-plural":"limitoarele","dative-genitive-indefinite-singular":"limitor","dative-definite-genitive-singular":"limitorului","dative-genitive-indefinite-plural":"limitoare","dative-definite-genitive-plural":"limitoarelor","singular-vocative":"limitorule","plural-vocative":"limitoarelor"}},{"word":"limitrof","pos":"adj","definitions":["bordering"],"forms":{"feminine-singular":"limitrofă","masculine-plural":"limitrofi","feminine-neuter-plural":"limitrofe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"limitrof","error-unrecognized-form-feminine-indefinite-singular":"limitrofă","error-unrecognized-form-indefinite-masculine-plural":"limitrofi","error-unrecognized-form-feminine-indefinite-neuter-plural":"limitrofe","definite-error-unrecognized-form-masculine-neuter-singular":"limitroful","definite-error-unrecognized-form-feminine-singular":"limitrofa","definite-error-unrecognized-form-masculine-plural":"limitrofii","definite-error-unrecognized-form-feminine-neuter-plural":"limitrofele"}},{"word":"limnigraf","pos":"noun","definitions":["limnograph"],"forms":{"plural":"limnigrafe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"limnigraf","accusative-definite-nominative-singular":"limnigraful","accusative-indefinite-nominative-plural":"limnigrafe","accusative-definite-nominative-plural":"limnigrafele","dative-genitive-indefinite-singular":"limnigraf","dative-definite-genitive-singular":"limnigrafului","dative-genitive-indefinite-plural":"limnigrafe","dative-definite-genitive-plural":"limnigrafelor","singular-vocative":"limnigrafule","plural-vocative":"limnigrafelor"}},{"word":"limnimetric","pos":"adj","definitions":["limnimetric"],"forms":{"feminine-singular":"limnimetrică","masculine-plural":"limnimetrici","feminine-neuter-plural":"limnimetrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"limnimetric","error-unrecognized-form-feminine-indefinite-singular":"limnimetrică","error-unrecognized-form-indefinite-masculine-plural":"limnimetrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"limnimetrice","definite-error-unrecognized-form-masculine-neuter-singular":"limnimetricul","definite-error-unrecognized-form-feminine-singular":"limnimetrica","definite-error-unrecognized-form-masculine-plural":"limnimetricii","definite-error-unrecognized-form-feminine-neuter-plural":"limnimetricele"}},{"word":"limnimetrie","pos":"noun","definitions":["limnimetry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"limnimetrie","accusative-definite-nominative":"limnimetria","dative-genitive-indefinite":"limnimetrii","dative-definite-genitive":"limnimetriei","vocative":"limnimetrie"}},{"word":"limnimetru","pos":"noun","definitions":["limnimeter"],"forms":{"plural":"limnimetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"limnimetru","accusative-definite-nominative-singular":"limnimetrul","accusative-indefinite-nominative-plural":"limnimetre","accusative-definite-nominative-plural":"limnimetrele","dative-genitive-indefinite-singular":"limnimetru","dative-definite-genitive-singular":"limnimetrului","dative-genitive-indefinite-plural":"limnimetre","dative-definite-genitive-plural":"limnimetrelor","singular-vocative":"limnimetrule","plural-vocative":"limnimetrelor"}},{"word":"limnobiologie","pos":"noun","definitions":["limnobiology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"limnobiologie","accusative-definite-nominative":"limnobiologia","dative-genitive-indefinite":"limnobiologii","dative-definite-genitive":"limnobiologiei","vocative":"limnobiologie"}},{"word":"limnolog","pos":"noun","definitions":["limnologist"],"pronunciation":"/lim.noˈloɡ/","forms":{"plural":"limnologi","feminine":"equivalent limnologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"limnolog","accusative-definite-nominative-singular":"limnologul","accusative-indefinite-nominative-plural":"limnologi","accusative-definite-nominative-plural":"limnologii","dative-genitive-indefinite-singular":"limnolog","dative-definite-genitive-singular":"limnologului","dative-genitive-indefinite-plural":"limnologi","dative-definite-genitive-plural":"limnologilor","singular-vocative":"limnologule","plural-vocative":"limnologilor"}},{"word":"limnologă","pos":"noun","definitions":["female equivalent of limnolog"],"pronunciation":"/lim.noˈlo.ɡə/","forms":{"plural":"limnologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"limnologă","accusative-definite-nominative-singular":"limnologa","accusative-indefinite-nominative-plural":"limnologe","accusative-definite-nominative-plural":"limnologele","dative-genitive-indefinite-singular":"limnologe","dative-definite-genitive-singular":"limnologei","dative-genitive-indefinite-plural":"limnologe","dative-definite-genitive-plural":"limnologelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"limnologe","pos":"noun","definitions":["plural of limnologă"],"gender":"f"},{"word":"limnologi","pos":"noun","definitions":["plural of limnolog"],"gender":"m"},{"word":"limnologie","pos":"noun","definitions":["limnology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"limnologie","accusative-definite-nominative":"limnologia","dative-genitive-indefinite":"limnologii","dative-definite-genitive":"limnologiei","vocative":"limnologie"}},{"word":"limonadă","pos":"noun","definitions":["lemonade"],"forms":{"plural":"limonade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"limonadă","accusative-definite-nominative-singular":"limonada","accusative-indefinite-nominative-plural":"limonade","accusative-definite-nominative-plural":"limonadele","dative-genitive-indefinite-singular":"limonade","dative-definite-genitive-singular":"limonadei","dative-genitive-indefinite-plural":"limonade","dative-definite-genitive-plural":"limonadelor","singular-vocative":"limonadă","plural-vocative":"limonadelor"}},{"word":"limonagiu","pos":"noun","definitions":["lemonade seller"],"forms":{"plural":"limonagii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"limonagiu","accusative-definite-nominative-singular":"limonagiul","accusative-indefinite-nominative-plural":"limonagii","accusative-definite-nominative-plural":"limonagiii","dative-genitive-indefinite-singular":"limonagiu","dative-definite-genitive-singular":"limonagiului","dative-genitive-indefinite-plural":"limonagii","dative-definite-genitive-plural":"limonagiilor","singular-vocative":"limonagiule","plural-vocative":"limonagiilor"}},{"word":"limonată","pos":"noun","definitions":["alternative form of limonadă"],"forms":{"plural":"limonate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"limonată","accusative-definite-nominative-singular":"limonata","accusative-indefinite-nominative-plural":"limonate","accusative-definite-nominative-plural":"limonatele","dative-genitive-indefinite-singular":"limonate","dative-definite-genitive-singular":"limonatei","dative-genitive-indefinite-plural":"limonate","dative-definite-genitive-plural":"limonatelor","singular-vocative":"limonată","plural-vocative":"limonatelor"}},{"word":"limonit","pos":"noun","definitions":["limonite"],"forms":{"plural":"limonite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"limonit","accusative-definite-nominative-singular":"limonitul","accusative-indefinite-nominative-plural":"limonite","accusative-definite-nominative-plural":"limonitele","dative-genitive-indefinite-singular":"limonit","dative-definite-genitive-singular":"limonitului","dative-genitive-indefinite-plural":"limonite","dative-definite-genitive-plural":"limonitelor","singular-vocative":"limonitule","plural-vocative":"limonitelor"}},{"word":"limoniu","pos":"adj","definitions":["lemon-colored"],"forms":{"feminine-singular":"limonie","plural":"limonii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"limoniu","error-unrecognized-form-feminine-indefinite-singular":"limonie","error-unrecognized-form-indefinite-masculine-plural":"limonii","error-unrecognized-form-feminine-indefinite-neuter-plural":"limonii","definite-error-unrecognized-form-masculine-neuter-singular":"limoniul","definite-error-unrecognized-form-feminine-singular":"limonia","definite-error-unrecognized-form-masculine-plural":"limoniii","definite-error-unrecognized-form-feminine-neuter-plural":"limoniile"}},{"word":"limoterapie","pos":"noun","definitions":["limotherapy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"limoterapie","accusative-definite-nominative-singular":"limoterapia","accusative-indefinite-nominative-plural":"limoterapii","accusative-definite-nominative-plural":"limoterapiile","dative-genitive-indefinite-singular":"limoterapii","dative-definite-genitive-singular":"limoterapiei","dative-genitive-indefinite-plural":"limoterapii","dative-definite-genitive-plural":"limoterapiilor","singular-vocative":"limoterapie","plural-vocative":"limoterapiilor"}},{"word":"Limpede","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Limpede"}},{"word":"limpede","pos":"adj","definitions":["clear, transparent, limpid","serene, without clouds","obvious, crystal, evident"],"pronunciation":"/ˈlim.pe.de/","forms":{"plural":"limpezi","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"limpede","error-unrecognized-form-feminine-indefinite-singular":"limpede","error-unrecognized-form-indefinite-masculine-plural":"limpezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"limpezi","definite-error-unrecognized-form-masculine-neuter-singular":"limpedele","definite-error-unrecognized-form-feminine-singular":"limpedea","definite-error-unrecognized-form-masculine-plural":"limpezii","definite-error-unrecognized-form-feminine-neuter-plural":"limpezile"}},{"word":"Limpedea","pos":"name","definitions":["a river in Argeș, Romania, tributary to the Argeș","a river in Suceava, Romania, tributary to the Izvorul Alb","a river in Maramureș, Romania, tributary to the Jidovoaia","a river in Bacău, Romania, tributary to the Trebiș"],"gender":"f"},{"word":"Limpeioara","pos":"name","definitions":["a river in Maramureș, Romania, tributary to the Mintoasa"],"gender":"f"},{"word":"Limpejioara","pos":"name","definitions":["a river in Vrancea, Romania, tributary to the Alba","a river in Vrancea, Romania, tributary to the Repejioara"],"gender":"f"},{"word":"Limpejioru","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Tazlăul Mare"],"gender":"m"},{"word":"limpejor","pos":"adj","definitions":["diminutive of limpede"],"pronunciation":"/lim.peˈʒor/","forms":{"feminine-singular":"limpejoară","masculine-plural":"limpejori","feminine-neuter-plural":"limpejoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"limpejor","error-unrecognized-form-feminine-indefinite-singular":"limpejoară","error-unrecognized-form-indefinite-masculine-plural":"limpejori","error-unrecognized-form-feminine-indefinite-neuter-plural":"limpejoare","definite-error-unrecognized-form-masculine-neuter-singular":"limpejorul","definite-error-unrecognized-form-feminine-singular":"limpejoara","definite-error-unrecognized-form-masculine-plural":"limpejorii","definite-error-unrecognized-form-feminine-neuter-plural":"limpejoarele"}},{"word":"limpezeală","pos":"noun","definitions":["clarity"],"forms":{"plural":"limpezeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"limpezeală","accusative-definite-nominative-singular":"limpezeala","accusative-indefinite-nominative-plural":"limpezeli","accusative-definite-nominative-plural":"limpezelile","dative-genitive-indefinite-singular":"limpezeli","dative-definite-genitive-singular":"limpezelii","dative-genitive-indefinite-plural":"limpezeli","dative-definite-genitive-plural":"limpezelilor","singular-vocative":"limpezeală","plural-vocative":"limpezelilor"}},{"word":"limpezi","pos":"verb","definitions":["to clarify, make clear","to become more clear, calm, tranquil","to filter, strain","to purify"],"forms":{"canonical":"a limpezi 4th conjugation","present-singular-third-person":"limpezește","participle-past":"limpezit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a limpezi","gerund":"limpezind","first-person-indicative-present-singular":"limpezesc","indicative-present-second-person-singular":"limpezești","indicative-present-singular-third-person":"limpezește","first-person-indicative-plural-present":"limpezim","indicative-plural-present-second-person":"limpeziți","indicative-plural-present-third-person":"limpezesc","first-person-imperfect-indicative-singular":"limpezeam","imperfect-indicative-second-person-singular":"limpezeai","imperfect-indicative-singular-third-person":"limpezea","first-person-imperfect-indicative-plural":"limpezeam","imperfect-indicative-plural-second-person":"limpezeați","imperfect-indicative-plural-third-person":"limpezeau","first-person-indicative-perfect-singular":"limpezii","indicative-perfect-second-person-singular":"limpeziși","indicative-perfect-singular-third-person":"limpezi","first-person-indicative-perfect-plural":"limpezirăm","indicative-perfect-plural-second-person":"limpezirăți","indicative-perfect-plural-third-person":"limpeziră","first-person-indicative-pluperfect-singular":"limpezisem","indicative-pluperfect-second-person-singular":"limpeziseși","indicative-pluperfect-singular-third-person":"limpezise","first-person-indicative-pluperfect-plural":"limpeziserăm","indicative-pluperfect-plural-second-person":"limpeziserăți","indicative-pluperfect-plural-third-person":"limpeziseră","first-person-present-singular-subjunctive":"să limpezesc","present-second-person-singular-subjunctive":"să limpezești","present-singular-subjunctive-third-person":"să limpezească","first-person-plural-present-subjunctive":"să limpezim","plural-present-second-person-subjunctive":"să limpeziți","plural-present-subjunctive-third-person":"să limpezească","imperative-second-person-singular":"limpezește","imperative-plural-second-person":"limpeziți","imperative-negative-second-person-singular":"nu limpezi","imperative-negative-plural-second-person":"nu limpeziți"}},{"word":"limpeziciune","pos":"noun","definitions":["clearness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"limpeziciune","accusative-definite-nominative":"limpeziciunea","dative-genitive-indefinite":"limpeziciuni","dative-definite-genitive":"limpeziciunii","vocative":"limpeziciune"}},{"word":"limpezie","pos":"noun","definitions":["transparency"],"forms":{"plural":"limpezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"limpezie","accusative-definite-nominative-singular":"limpezia","accusative-indefinite-nominative-plural":"limpezii","accusative-definite-nominative-plural":"limpeziile","dative-genitive-indefinite-singular":"limpezii","dative-definite-genitive-singular":"limpeziei","dative-genitive-indefinite-plural":"limpezii","dative-definite-genitive-plural":"limpeziilor","singular-vocative":"limpezie","plural-vocative":"limpeziilor"}},{"word":"limpezime","pos":"noun","definitions":["limpidity"],"forms":{"plural":"limpezimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"limpezime","accusative-definite-nominative-singular":"limpezimea","accusative-indefinite-nominative-plural":"limpezimi","accusative-definite-nominative-plural":"limpezimile","dative-genitive-indefinite-singular":"limpezimi","dative-definite-genitive-singular":"limpezimii","dative-genitive-indefinite-plural":"limpezimi","dative-definite-genitive-plural":"limpezimilor","singular-vocative":"limpezime","plural-vocative":"limpezimilor"}},{"word":"limpezire","pos":"noun","definitions":["clarification"],"forms":{"plural":"limpeziri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"limpezire","accusative-definite-nominative-singular":"limpezirea","accusative-indefinite-nominative-plural":"limpeziri","accusative-definite-nominative-plural":"limpezirile","dative-genitive-indefinite-singular":"limpeziri","dative-definite-genitive-singular":"limpezirii","dative-genitive-indefinite-plural":"limpeziri","dative-definite-genitive-plural":"limpezirilor","singular-vocative":"limpezire","plural-vocative":"limpezirilor"}},{"word":"Limpeziș","pos":"name","definitions":["a village in Movila Banului, Buzău County, Romania"],"gender":"m"},{"word":"limpeziș","pos":"noun","definitions":["surface of a clear water","an open space, an area without vegetation"],"forms":{"plural":"limpezișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"limpeziș","accusative-definite-nominative-singular":"limpezișul","accusative-indefinite-nominative-plural":"limpezișuri","accusative-definite-nominative-plural":"limpezișurile","dative-genitive-indefinite-singular":"limpeziș","dative-definite-genitive-singular":"limpezișului","dative-genitive-indefinite-plural":"limpezișuri","dative-definite-genitive-plural":"limpezișurilor","singular-vocative":"limpezișule","plural-vocative":"limpezișurilor"}},{"word":"limpezit","pos":"adj","definitions":["cleared"],"forms":{"feminine-singular":"limpezită","masculine-plural":"limpeziți","feminine-neuter-plural":"limpezite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"limpezit","error-unrecognized-form-feminine-indefinite-singular":"limpezită","error-unrecognized-form-indefinite-masculine-plural":"limpeziți","error-unrecognized-form-feminine-indefinite-neuter-plural":"limpezite","definite-error-unrecognized-form-masculine-neuter-singular":"limpezitul","definite-error-unrecognized-form-feminine-singular":"limpezita","definite-error-unrecognized-form-masculine-plural":"limpeziții","definite-error-unrecognized-form-feminine-neuter-plural":"limpezitele"}},{"word":"limpezitor","pos":"adj","definitions":["transparentizing"],"forms":{"feminine-singular":"limpezitoare","masculine-plural":"limpezitori","feminine-neuter-plural":"limpezitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"limpezitor","error-unrecognized-form-feminine-indefinite-singular":"limpezitoare","error-unrecognized-form-indefinite-masculine-plural":"limpezitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"limpezitoare","definite-error-unrecognized-form-masculine-neuter-singular":"limpezitorul","definite-error-unrecognized-form-feminine-singular":"limpezitoarea","definite-error-unrecognized-form-masculine-plural":"limpezitorii","definite-error-unrecognized-form-feminine-neuter-plural":"limpezitoarele"}},{"word":"limpezitură","pos":"noun","definitions":["clarity"],"forms":{"plural":"limpezituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"limpezitură","accusative-definite-nominative-singular":"limpezitura","accusative-indefinite-nominative-plural":"limpezituri","accusative-definite-nominative-plural":"limpeziturile","dative-genitive-indefinite-singular":"limpezituri","dative-definite-genitive-singular":"limpeziturii","dative-genitive-indefinite-plural":"limpezituri","dative-definite-genitive-plural":"limpeziturilor","singular-vocative":"limpezitură","plural-vocative":"limpeziturilor"}},{"word":"limpid","pos":"adj","definitions":["clear, limpid, transparent"],"forms":{"feminine-singular":"limpidă","masculine-plural":"limpizi","feminine-neuter-plural":"limpide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"limpid","error-unrecognized-form-feminine-indefinite-singular":"limpidă","error-unrecognized-form-indefinite-masculine-plural":"limpizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"limpide","definite-error-unrecognized-form-masculine-neuter-singular":"limpidul","definite-error-unrecognized-form-feminine-singular":"limpida","definite-error-unrecognized-form-masculine-plural":"limpizii","definite-error-unrecognized-form-feminine-neuter-plural":"limpidele"}},{"word":"limpiditate","pos":"noun","definitions":["clarity"],"forms":{"plural":"limpidități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"limpiditate","accusative-definite-nominative-singular":"limpiditatea","accusative-indefinite-nominative-plural":"limpidități","accusative-definite-nominative-plural":"limpiditățile","dative-genitive-indefinite-singular":"limpidități","dative-definite-genitive-singular":"limpidității","dative-genitive-indefinite-plural":"limpidități","dative-definite-genitive-plural":"limpidităților","singular-vocative":"limpiditate","plural-vocative":"limpidităților"}},{"word":"limul","pos":"noun","definitions":["horseshoe crab"],"forms":{"plural":"limuli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"limul","accusative-definite-nominative-singular":"limulul","accusative-indefinite-nominative-plural":"limuli","accusative-definite-nominative-plural":"limulii","dative-genitive-indefinite-singular":"limul","dative-definite-genitive-singular":"limulului","dative-genitive-indefinite-plural":"limuli","dative-definite-genitive-plural":"limulilor","singular-vocative":"limulule","plural-vocative":"limulilor"}},{"word":"limuzină","pos":"noun","definitions":["limousine"],"forms":{"plural":"limuzine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"limuzină","accusative-definite-nominative-singular":"limuzina","accusative-indefinite-nominative-plural":"limuzine","accusative-definite-nominative-plural":"limuzinele","dative-genitive-indefinite-singular":"limuzine","dative-definite-genitive-singular":"limuzinei","dative-genitive-indefinite-plural":"limuzine","dative-definite-genitive-plural":"limuzinelor","singular-vocative":"limuzină","plural-vocative":"limuzinelor"}},{"word":"lin","pos":"adj","definitions":["even, smooth","calm, quiet","mild, gentle, sweet"],"pronunciation":"/lin/","forms":{"feminine-singular":"lină","masculine-plural":"lini","feminine-neuter-plural":"line","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"lin","error-unrecognized-form-feminine-indefinite-singular":"lină","error-unrecognized-form-indefinite-masculine-plural":"lini","error-unrecognized-form-feminine-indefinite-neuter-plural":"line","definite-error-unrecognized-form-masculine-neuter-singular":"linul","definite-error-unrecognized-form-feminine-singular":"lina","definite-error-unrecognized-form-masculine-plural":"linii","definite-error-unrecognized-form-feminine-neuter-plural":"linele"}},{"word":"lin","pos":"noun","definitions":["tench (Tinca tinca)"],"pronunciation":"/lin/","forms":{"plural":"lini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lin","accusative-definite-nominative-singular":"linul","accusative-indefinite-nominative-plural":"lini","accusative-definite-nominative-plural":"linii","dative-genitive-indefinite-singular":"lin","dative-definite-genitive-singular":"linului","dative-genitive-indefinite-plural":"lini","dative-definite-genitive-plural":"linilor","singular-vocative":"linule","plural-vocative":"linilor"}},{"word":"lină","pos":"adj","definitions":["indefinite nominative/accusative feminine singular of lin"],"pronunciation":"/ˈli.nə/","gender":"f"},{"word":"linariță","pos":"noun","definitions":["toadflax"],"forms":{"plural":"linarițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"linariță","accusative-definite-nominative-singular":"linarița","accusative-indefinite-nominative-plural":"linarițe","accusative-definite-nominative-plural":"linarițele","dative-genitive-indefinite-singular":"linarițe","dative-definite-genitive-singular":"linariței","dative-genitive-indefinite-plural":"linarițe","dative-definite-genitive-plural":"linarițelor","singular-vocative":"linariță","plural-vocative":"linarițelor"}},{"word":"linăriță","pos":"noun","definitions":["alternative form of linariță"],"forms":{"plural":"linărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"linăriță","accusative-definite-nominative-singular":"linărița","accusative-indefinite-nominative-plural":"linărițe","accusative-definite-nominative-plural":"linărițele","dative-genitive-indefinite-singular":"linărițe","dative-definite-genitive-singular":"linăriței","dative-genitive-indefinite-plural":"linărițe","dative-definite-genitive-plural":"linărițelor","singular-vocative":"linăriță","plural-vocative":"linărițelor"}},{"word":"linciureală","pos":"noun","definitions":["washing oneself fast"],"forms":{"plural":"linciureli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"linciureală","accusative-definite-nominative-singular":"linciureala","accusative-indefinite-nominative-plural":"linciurele","accusative-definite-nominative-plural":"linciurelele","dative-genitive-indefinite-singular":"linciurele","dative-definite-genitive-singular":"linciurelei","dative-genitive-indefinite-plural":"linciurele","dative-definite-genitive-plural":"linciurelelor","singular-vocative":"linciureală","plural-vocative":"linciurelelor"}},{"word":"linciuri","pos":"verb","definitions":["to splash around"],"forms":{"canonical":"a linciuri 4th conjugation","present-singular-third-person":"linciurește","participle-past":"linciurit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a linciuri","gerund":"linciurind","first-person-indicative-present-singular":"linciuresc","indicative-present-second-person-singular":"linciurești","indicative-present-singular-third-person":"linciurește","first-person-indicative-plural-present":"linciurim","indicative-plural-present-second-person":"linciuriți","indicative-plural-present-third-person":"linciuresc","first-person-imperfect-indicative-singular":"linciuream","imperfect-indicative-second-person-singular":"linciureai","imperfect-indicative-singular-third-person":"linciurea","first-person-imperfect-indicative-plural":"linciuream","imperfect-indicative-plural-second-person":"linciureați","imperfect-indicative-plural-third-person":"linciureau","first-person-indicative-perfect-singular":"linciurii","indicative-perfect-second-person-singular":"linciuriși","indicative-perfect-singular-third-person":"linciuri","first-person-indicative-perfect-plural":"linciurirăm","indicative-perfect-plural-second-person":"linciurirăți","indicative-perfect-plural-third-person":"linciuriră","first-person-indicative-pluperfect-singular":"linciurisem","indicative-pluperfect-second-person-singular":"linciuriseși","indicative-pluperfect-singular-third-person":"linciurise","first-person-indicative-pluperfect-plural":"linciuriserăm","indicative-pluperfect-plural-second-person":"linciuriserăți","indicative-pluperfect-plural-third-person":"linciuriseră","first-person-present-singular-subjunctive":"să linciuresc","present-second-person-singular-subjunctive":"să linciurești","present-singular-subjunctive-third-person":"să linciurească","first-person-plural-present-subjunctive":"să linciurim","plural-present-second-person-subjunctive":"să linciuriți","plural-present-subjunctive-third-person":"să linciurească","imperative-second-person-singular":"linciurește","imperative-plural-second-person":"linciuriți","imperative-negative-second-person-singular":"nu linciuri","imperative-negative-plural-second-person":"nu linciuriți"}},{"word":"linciurire","pos":"noun","definitions":["splashing"],"forms":{"plural":"linciuriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"linciurire","accusative-definite-nominative":"liciurirea","dative-genitive-indefinite":"linciuriri","dative-definite-genitive":"linciuririi","vocative":"-"}},{"word":"lincșii","pos":"noun","definitions":["definite nominative/accusative plural of linx"]},{"word":"Linculescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Linculescu"}},{"word":"lindenă","pos":"noun","definitions":["alternative form of lindină"],"forms":{"plural":"lindene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lindenă","accusative-definite-nominative-singular":"lindena","accusative-indefinite-nominative-plural":"lindene","accusative-definite-nominative-plural":"lindenele","dative-genitive-indefinite-singular":"lindene","dative-definite-genitive-singular":"lindenei","dative-genitive-indefinite-plural":"lindene","dative-definite-genitive-plural":"lindenelor","singular-vocative":"lindenă","plural-vocative":"lindenelor"}},{"word":"Lindenfeld","pos":"name","definitions":["a village in Buchin, Caraș-Severin County, Romania"],"gender":"m"},{"word":"lindic","pos":"noun","definitions":["clitoris, clit"],"pronunciation":"[linˈdik]","forms":{"plural":"lindicuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lindic","accusative-definite-nominative-singular":"lindicul","accusative-indefinite-nominative-plural":"lindicuri","accusative-definite-nominative-plural":"lindicurile","dative-genitive-indefinite-singular":"lindic","dative-definite-genitive-singular":"lindicului","dative-genitive-indefinite-plural":"lindicuri","dative-definite-genitive-plural":"lindicurilor","singular-vocative":"lindicule","plural-vocative":"lindicurilor"}},{"word":"Lindina","pos":"name","definitions":["a river in Caraș-Severin County, Romania, tributary to the Nera"],"gender":"f"},{"word":"lindină","pos":"noun","definitions":["nit (egg of a louse)"],"pronunciation":"/ˈlin.di.nə/","forms":{"plural":"lindini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lindină","accusative-definite-nominative-singular":"lindina","accusative-indefinite-nominative-plural":"lindini","accusative-definite-nominative-plural":"lindinile","dative-genitive-indefinite-singular":"lindini","dative-definite-genitive-singular":"lindinii","dative-genitive-indefinite-plural":"lindini","dative-definite-genitive-plural":"lindinilor","singular-vocative":"lindină","plural-vocative":"lindinilor","alternative":"lindenă"}},{"word":"lindinea","pos":"noun","definitions":["diminutive of lindină"],"forms":{"plural":"lindinele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lindinea","accusative-definite-nominative-singular":"lindineaul","accusative-indefinite-nominative-plural":"lindinele","accusative-definite-nominative-plural":"lindinelele","dative-genitive-indefinite-singular":"lindinea","dative-definite-genitive-singular":"lindineaului","dative-genitive-indefinite-plural":"lindinele","dative-definite-genitive-plural":"lindinelelor","singular-vocative":"lindineaule","plural-vocative":"lindinelelor"}},{"word":"lindinos","pos":"adj","definitions":["nitty","dirty"],"forms":{"feminine-singular":"lindinoasă","masculine-plural":"lindinoși","feminine-neuter-plural":"lindinoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lindinos","error-unrecognized-form-feminine-indefinite-singular":"lindinoasă","error-unrecognized-form-indefinite-masculine-plural":"lindinoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lindinoase","definite-error-unrecognized-form-masculine-neuter-singular":"lindinosul","definite-error-unrecognized-form-feminine-singular":"lindinoasa","definite-error-unrecognized-form-masculine-plural":"lindinoșii","definite-error-unrecognized-form-feminine-neuter-plural":"lindinoasele"}},{"word":"lindinuță","pos":"noun","definitions":["diminutive of lindină"],"forms":{"plural":"lindinuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lindinuță","accusative-definite-nominative-singular":"lindinuțăul","accusative-indefinite-nominative-plural":"lindinuțe","accusative-definite-nominative-plural":"lindinuțele","dative-genitive-indefinite-singular":"lindinuță","dative-definite-genitive-singular":"lindinuțăului","dative-genitive-indefinite-plural":"lindinuțe","dative-definite-genitive-plural":"lindinuțelor","singular-vocative":"lindinuțăule","plural-vocative":"lindinuțelor"}},{"word":"linear","pos":"adj","definitions":["alternative form of liniar"],"forms":{"feminine-singular":"lineară","masculine-plural":"lineari","feminine-neuter-plural":"lineare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"linear","error-unrecognized-form-feminine-indefinite-singular":"lineară","error-unrecognized-form-indefinite-masculine-plural":"lineari","error-unrecognized-form-feminine-indefinite-neuter-plural":"lineare","definite-error-unrecognized-form-masculine-neuter-singular":"linearul","definite-error-unrecognized-form-feminine-singular":"lineara","definite-error-unrecognized-form-masculine-plural":"linearii","definite-error-unrecognized-form-feminine-neuter-plural":"linearele"}},{"word":"linearitate","pos":"noun","definitions":["alternative form of liniaritate"]},{"word":"ling","pos":"verb","definitions":["inflection of linge:","first-person singular present indicative/subjunctive","third-person plural present indicative"],"pronunciation":"[liŋɡ]"},{"word":"lingăreală","pos":"noun","definitions":["servility"],"forms":{"plural":"lingăreli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lingăreală","accusative-definite-nominative-singular":"lingăreala","accusative-indefinite-nominative-plural":"lingăreli","accusative-definite-nominative-plural":"lingărelile","dative-genitive-indefinite-singular":"lingăreli","dative-definite-genitive-singular":"lingărelii","dative-genitive-indefinite-plural":"lingăreli","dative-definite-genitive-plural":"lingărelilor","singular-vocative":"lingăreală","plural-vocative":"lingărelilor"}},{"word":"lingări","pos":"verb","definitions":["to flatter"],"forms":{"canonical":"a lingări 4th conjugation","present-singular-third-person":"lingărește","participle-past":"lingărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lingări","gerund":"lingărind","first-person-indicative-present-singular":"lingăresc","indicative-present-second-person-singular":"lingărești","indicative-present-singular-third-person":"lingărește","first-person-indicative-plural-present":"lingărim","indicative-plural-present-second-person":"lingăriți","indicative-plural-present-third-person":"lingăresc","first-person-imperfect-indicative-singular":"lingăream","imperfect-indicative-second-person-singular":"lingăreai","imperfect-indicative-singular-third-person":"lingărea","first-person-imperfect-indicative-plural":"lingăream","imperfect-indicative-plural-second-person":"lingăreați","imperfect-indicative-plural-third-person":"lingăreau","first-person-indicative-perfect-singular":"lingării","indicative-perfect-second-person-singular":"lingăriși","indicative-perfect-singular-third-person":"lingări","first-person-indicative-perfect-plural":"lingărirăm","indicative-perfect-plural-second-person":"lingărirăți","indicative-perfect-plural-third-person":"lingăriră","first-person-indicative-pluperfect-singular":"lingărisem","indicative-pluperfect-second-person-singular":"lingăriseși","indicative-pluperfect-singular-third-person":"lingărise","first-person-indicative-pluperfect-plural":"lingăriserăm","indicative-pluperfect-plural-second-person":"lingăriserăți","indicative-pluperfect-plural-third-person":"lingăriseră","first-person-present-singular-subjunctive":"să lingăresc","present-second-person-singular-subjunctive":"să lingărești","present-singular-subjunctive-third-person":"să lingărească","first-person-plural-present-subjunctive":"să lingărim","plural-present-second-person-subjunctive":"să lingăriți","plural-present-subjunctive-third-person":"să lingărească","imperative-second-person-singular":"lingărește","imperative-plural-second-person":"lingăriți","imperative-negative-second-person-singular":"nu lingări","imperative-negative-plural-second-person":"nu lingăriți"}}];
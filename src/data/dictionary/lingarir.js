@@ -0,0 +1 @@
+export default [{"word":"lingărire","pos":"noun","definitions":["tasting (of food)"],"forms":{"plural":"lingăriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lingărire","accusative-definite-nominative-singular":"lingărirea","accusative-indefinite-nominative-plural":"lingăriri","accusative-definite-nominative-plural":"lingăririle","dative-genitive-indefinite-singular":"lingăriri","dative-definite-genitive-singular":"lingăririi","dative-genitive-indefinite-plural":"lingăriri","dative-definite-genitive-plural":"lingăririlor","singular-vocative":"lingărire","plural-vocative":"lingăririlor"}},{"word":"lingărit","pos":"adj","definitions":["tasted (of food)"],"forms":{"feminine-singular":"lingărită","masculine-plural":"lingăriți","feminine-neuter-plural":"lingărite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lingărit","error-unrecognized-form-feminine-indefinite-singular":"lingărită","error-unrecognized-form-indefinite-masculine-plural":"lingăriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lingărite","definite-error-unrecognized-form-masculine-neuter-singular":"lingăritul","definite-error-unrecognized-form-feminine-singular":"lingărita","definite-error-unrecognized-form-masculine-plural":"lingăriții","definite-error-unrecognized-form-feminine-neuter-plural":"lingăritele"}},{"word":"lingărit","pos":"verb","definitions":["past participle of lingări"],"forms":{"participle-past":"of lingări"}},{"word":"lingăritură","pos":"noun","definitions":["flattering, flattery"],"forms":{"plural":"lingărituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lingăritură","accusative-definite-nominative-singular":"lingăritura","accusative-indefinite-nominative-plural":"lingărituri","accusative-definite-nominative-plural":"lingăriturile","dative-genitive-indefinite-singular":"lingărituri","dative-definite-genitive-singular":"lingăriturii","dative-genitive-indefinite-plural":"lingărituri","dative-definite-genitive-plural":"lingăriturilor","singular-vocative":"lingăritură","plural-vocative":"lingăriturilor"}},{"word":"lingăros","pos":"adj","definitions":["flattering"],"forms":{"feminine-singular":"lingăroasă","masculine-plural":"lingăroși","feminine-neuter-plural":"lingăroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lingăros","error-unrecognized-form-feminine-indefinite-singular":"lingăroasă","error-unrecognized-form-indefinite-masculine-plural":"lingăroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lingăroase","definite-error-unrecognized-form-masculine-neuter-singular":"lingărosul","definite-error-unrecognized-form-feminine-singular":"lingăroasa","definite-error-unrecognized-form-masculine-plural":"lingăroșii","definite-error-unrecognized-form-feminine-neuter-plural":"lingăroasele"}},{"word":"lingău","pos":"noun","definitions":["ass-kisser, suckup, sycophant"],"forms":{"plural":"lingăi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lingău","accusative-definite-nominative-singular":"lingăul","accusative-indefinite-nominative-plural":"lingăi","accusative-definite-nominative-plural":"lingăii","dative-genitive-indefinite-singular":"lingău","dative-definite-genitive-singular":"lingăului","dative-genitive-indefinite-plural":"lingăi","dative-definite-genitive-plural":"lingăilor","singular-vocative":"lingăule","plural-vocative":"lingăilor"}},{"word":"linge","pos":"verb","definitions":["to lick","synonym of linguși (“to bootlick”)","to make out"],"pronunciation":"/ˈlin.dʒe/","forms":{"canonical":"a linge 3rd conjugation","present-singular-third-person":"linge","participle-past":"lins","subjunctive-third-person":"lingă","table-tags":"conjugation-3","inflection-template":"ro-conj-e","infinitive":"a linge","gerund":"lingând","first-person-indicative-present-singular":"ling","indicative-present-second-person-singular":"lingi","indicative-present-singular-third-person":"linge","first-person-indicative-plural-present":"lingem","indicative-plural-present-second-person":"lingeți","indicative-plural-present-third-person":"ling","first-person-imperfect-indicative-singular":"lingeam","imperfect-indicative-second-person-singular":"lingeai","imperfect-indicative-singular-third-person":"lingea","first-person-imperfect-indicative-plural":"lingeam","imperfect-indicative-plural-second-person":"lingeați","imperfect-indicative-plural-third-person":"lingeau","first-person-indicative-perfect-singular":"linsei","indicative-perfect-second-person-singular":"linseși","indicative-perfect-singular-third-person":"linse","first-person-indicative-perfect-plural":"linserăm","indicative-perfect-plural-second-person":"linserăți","indicative-perfect-plural-third-person":"linseră","first-person-indicative-pluperfect-singular":"linsesem","indicative-pluperfect-second-person-singular":"linseseși","indicative-pluperfect-singular-third-person":"linsese","first-person-indicative-pluperfect-plural":"linseserăm","indicative-pluperfect-plural-second-person":"linseserăți","indicative-pluperfect-plural-third-person":"linseseră","first-person-present-singular-subjunctive":"să ling","present-second-person-singular-subjunctive":"să lingi","present-singular-subjunctive-third-person":"să lingă","first-person-plural-present-subjunctive":"să lingem","plural-present-second-person-subjunctive":"să lingeți","plural-present-subjunctive-third-person":"să lingă","imperative-second-person-singular":"linge","imperative-plural-second-person":"lingeți","imperative-negative-second-person-singular":"nu linge","imperative-negative-plural-second-person":"nu lingeți"}},{"word":"lingerie","pos":"noun","definitions":["alternative form of lenjerie"],"forms":{"plural":"lingerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lingerie","accusative-definite-nominative-singular":"lingeria","accusative-indefinite-nominative-plural":"lingerii","accusative-definite-nominative-plural":"lingeriile","dative-genitive-indefinite-singular":"lingerii","dative-definite-genitive-singular":"lingeriei","dative-genitive-indefinite-plural":"lingerii","dative-definite-genitive-plural":"lingeriilor","singular-vocative":"lingerie","plural-vocative":"lingeriilor"}},{"word":"lingi","pos":"verb","definitions":["second-person singular present indicative/subjunctive of linge"],"pronunciation":"[lindʒʲ]"},{"word":"lingoare","pos":"noun","definitions":["typhoid (fever)","illness, malady, suffering"],"forms":{"plural":"lingori","alternative":"lângoare"}},{"word":"lingotieră","pos":"noun","definitions":["ingot mold"],"forms":{"plural":"lingotiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lingotieră","accusative-definite-nominative-singular":"lingotiera","accusative-indefinite-nominative-plural":"lingotiere","accusative-definite-nominative-plural":"lingotierele","dative-genitive-indefinite-singular":"lingotiere","dative-definite-genitive-singular":"lingotierei","dative-genitive-indefinite-plural":"lingotiere","dative-definite-genitive-plural":"lingotierelor","singular-vocative":"lingotieră","plural-vocative":"lingotierelor"}},{"word":"lingou","pos":"noun","definitions":["ingot"],"pronunciation":"/linˈɡow/","forms":{"plural":"lingouri","table-tags":"no-table-tags","accusative-indefinite-nominative-singular":"lingou","accusative-definite-nominative-singular":"lingoul","accusative-indefinite-nominative-plural":"lingouri","accusative-definite-nominative-plural":"lingourile","dative-genitive-indefinite-singular":"lingou","dative-definite-genitive-singular":"lingoului","dative-genitive-indefinite-plural":"lingouri","dative-definite-genitive-plural":"lingourilor","singular-vocative":"-","plural-vocative":"-"}},{"word":"lingouri","pos":"noun","definitions":["plural of lingou"],"pronunciation":"/linˈɡo.urʲ/"},{"word":"lingual","pos":"adj","definitions":["lingual"],"forms":{"feminine-singular":"linguală","masculine-plural":"linguali","feminine-neuter-plural":"linguale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lingual","error-unrecognized-form-feminine-indefinite-singular":"linguală","error-unrecognized-form-indefinite-masculine-plural":"linguali","error-unrecognized-form-feminine-indefinite-neuter-plural":"linguale","definite-error-unrecognized-form-masculine-neuter-singular":"lingualul","definite-error-unrecognized-form-feminine-singular":"linguala","definite-error-unrecognized-form-masculine-plural":"lingualii","definite-error-unrecognized-form-feminine-neuter-plural":"lingualele"}},{"word":"linguală","pos":"noun","definitions":["lingual"],"forms":{"plural":"linguale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"linguală","accusative-definite-nominative-singular":"linguala","accusative-indefinite-nominative-plural":"linguale","accusative-definite-nominative-plural":"lingualele","dative-genitive-indefinite-singular":"linguale","dative-definite-genitive-singular":"lingualei","dative-genitive-indefinite-plural":"linguale","dative-definite-genitive-plural":"lingualelor","singular-vocative":"linguală","plural-vocative":"lingualelor"}},{"word":"linguist","pos":"noun","definitions":["alternative form of lingvist"],"forms":{"plural":"linguiști","feminine":"equivalent linguistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"linguist","accusative-definite-nominative-singular":"linguistul","accusative-indefinite-nominative-plural":"linguiști","accusative-definite-nominative-plural":"linguiștii","dative-genitive-indefinite-singular":"linguist","dative-definite-genitive-singular":"linguistului","dative-genitive-indefinite-plural":"linguiști","dative-definite-genitive-plural":"linguiștilor","singular-vocative":"linguistule","plural-vocative":"linguiștilor"}},{"word":"linguistă","pos":"noun","definitions":["alternative spelling of lingvistă"],"forms":{"plural":"linguiste"}},{"word":"linguiste","pos":"noun","definitions":["plural of linguistă"],"gender":"f"},{"word":"linguiști","pos":"noun","definitions":["plural of linguist"],"gender":"m"},{"word":"linguistic","pos":"adj","definitions":["alternative form of lingvistic"],"forms":{"feminine-singular":"linguistică","masculine-plural":"linguistici","feminine-neuter-plural":"linguistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"linguistic","error-unrecognized-form-feminine-indefinite-singular":"linguistică","error-unrecognized-form-indefinite-masculine-plural":"linguistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"linguistice","definite-error-unrecognized-form-masculine-neuter-singular":"linguisticul","definite-error-unrecognized-form-feminine-singular":"linguistica","definite-error-unrecognized-form-masculine-plural":"linguisticii","definite-error-unrecognized-form-feminine-neuter-plural":"linguisticele"}},{"word":"linguistici","pos":"adj","definitions":["nominative/accusative masculine plural of linguistic"],"gender":"m-p"},{"word":"Lingura","pos":"name","definitions":["a village in Lingura, Cantemir Raion, Moldova","a commune of Cantemir Raion, Moldova"],"gender":"f"},{"word":"lingura","pos":"noun","definitions":["definite nominative/accusative singular of lingură"],"pronunciation":"[ˈliŋɡura]","gender":"f"},{"word":"lingură","pos":"noun","definitions":["spoon"],"pronunciation":"[ˈliŋɡurə]","forms":{"plural":"linguri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lingură","accusative-definite-nominative-singular":"lingura","accusative-indefinite-nominative-plural":"linguri","accusative-definite-nominative-plural":"lingurile","dative-genitive-indefinite-singular":"linguri","dative-definite-genitive-singular":"lingurii","dative-genitive-indefinite-plural":"linguri","dative-definite-genitive-plural":"lingurilor","singular-vocative":"lingură","plural-vocative":"lingurilor"}},{"word":"Lingurar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Lingurar"}},{"word":"lingurar","pos":"noun","definitions":["tinker"],"forms":{"plural":"lingurari","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lingurar","accusative-definite-nominative-singular":"lingurarul","accusative-indefinite-nominative-plural":"lingurari","accusative-definite-nominative-plural":"lingurarile","dative-genitive-indefinite-singular":"lingurar","dative-definite-genitive-singular":"lingurarului","dative-genitive-indefinite-plural":"lingurari","dative-definite-genitive-plural":"lingurarilor","singular-vocative":"lingurarule","plural-vocative":"lingurarilor"}},{"word":"lingurăreasă","pos":"noun","definitions":["female equivalent of lingurar"],"forms":{"plural":"lingurărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lingurăreasă","accusative-definite-nominative-singular":"lingurăreasa","accusative-indefinite-nominative-plural":"lingurărese","accusative-definite-nominative-plural":"lingurăresele","dative-genitive-indefinite-singular":"lingurărese","dative-definite-genitive-singular":"lingurăresei","dative-genitive-indefinite-plural":"lingurărese","dative-definite-genitive-plural":"lingurăreselor","singular-vocative":"lingurăreasă","plural-vocative":"lingurăreselor"}},{"word":"lingurărie","pos":"noun","definitions":["spoonmaker's shop"],"forms":{"plural":"lingurării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lingurărie","accusative-definite-nominative-singular":"lingurăria","accusative-indefinite-nominative-plural":"lingurării","accusative-definite-nominative-plural":"lingurăriile","dative-genitive-indefinite-singular":"lingurării","dative-definite-genitive-singular":"lingurăriei","dative-genitive-indefinite-plural":"lingurării","dative-definite-genitive-plural":"lingurăriilor","singular-vocative":"lingurărie","plural-vocative":"lingurăriilor"}},{"word":"lingurăriță","pos":"noun","definitions":["female equivalent of lingurar"],"forms":{"plural":"lingurărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lingurăriță","accusative-definite-nominative-singular":"lingurărița","accusative-indefinite-nominative-plural":"lingurărițe","accusative-definite-nominative-plural":"lingurărițele","dative-genitive-indefinite-singular":"lingurărițe","dative-definite-genitive-singular":"lingurăriței","dative-genitive-indefinite-plural":"lingurărițe","dative-definite-genitive-plural":"lingurărițelor","singular-vocative":"lingurăriță","plural-vocative":"lingurărițelor"}},{"word":"Lingurariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Lingurariu"}},{"word":"Linguraru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Linguraru"}},{"word":"lingurea","pos":"noun","definitions":["spoonwort (Cochlearia officinalis)"],"forms":{"plural":"lingurele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"lingurea","accusative-definite-nominative-singular":"lingureaua","accusative-indefinite-nominative-plural":"lingurele","accusative-definite-nominative-plural":"lingurelele","dative-genitive-indefinite-singular":"lingurele","dative-definite-genitive-singular":"lingurelei","dative-genitive-indefinite-plural":"lingurele","dative-definite-genitive-plural":"lingurelelor","singular-vocative":"lingurea","plural-vocative":"lingurelelor"}},{"word":"linguri","pos":"noun","definitions":["plural of lingură"],"pronunciation":"[ˈliŋɡurʲ]","gender":"f-p"},{"word":"lingurică","pos":"noun","definitions":["scurvy-grass (Cochlearia officinalis)"],"forms":{"plural":"lingurici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lingurică","accusative-definite-nominative-singular":"lingurica","accusative-indefinite-nominative-plural":"lingurici","accusative-definite-nominative-plural":"linguricile","dative-genitive-indefinite-singular":"lingurici","dative-definite-genitive-singular":"linguricii","dative-genitive-indefinite-plural":"lingurici","dative-definite-genitive-plural":"linguricilor","singular-vocative":"lingurică","plural-vocative":"linguricilor"}},{"word":"lingurii","pos":"noun","definitions":["definite genitive/dative singular of lingură"],"pronunciation":"[ˈliŋɡuriː]"},{"word":"lingurile","pos":"noun","definitions":["definite nominative/accusative plural of lingură"],"pronunciation":"[ˈliŋɡurile]","gender":"f-p"},{"word":"lingurilor","pos":"noun","definitions":["definite genitive/dative plural of lingură"],"pronunciation":"[ˈliŋɡurilor]","gender":"f-p"},{"word":"Linguriță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Linguriță"}},{"word":"linguriță","pos":"noun","definitions":["teaspoon"],"forms":{"plural":"lingurițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"linguriță","accusative-definite-nominative-singular":"lingurița","accusative-indefinite-nominative-plural":"lingurițe","accusative-definite-nominative-plural":"lingurițele","dative-genitive-indefinite-singular":"lingurițe","dative-definite-genitive-singular":"linguriței","dative-genitive-indefinite-plural":"lingurițe","dative-definite-genitive-plural":"lingurițelor","singular-vocative":"linguriță","plural-vocative":"lingurițelor"}},{"word":"linguroi","pos":"noun","definitions":["ladle"],"forms":{"plural":"linguroaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"linguroi","accusative-definite-nominative-singular":"linguroiul","accusative-indefinite-nominative-plural":"lunguroaie","accusative-definite-nominative-plural":"lunguroaiele","dative-genitive-indefinite-singular":"linguroi","dative-definite-genitive-singular":"linguroiului","dative-genitive-indefinite-plural":"lunguroaie","dative-definite-genitive-plural":"lunguroaielor","singular-vocative":"linguroiule","plural-vocative":"lunguroaielor"}},{"word":"linguruță","pos":"noun","definitions":["spoonwort (Cochlearia officinalis)"],"forms":{"plural":"linguruțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"linguruță","accusative-definite-nominative-singular":"linguruța","accusative-indefinite-nominative-plural":"linguruțe","accusative-definite-nominative-plural":"linguruțele","dative-genitive-indefinite-singular":"linguruțe","dative-definite-genitive-singular":"linguruței","dative-genitive-indefinite-plural":"linguruțe","dative-definite-genitive-plural":"linguruțelor","singular-vocative":"linguruță","plural-vocative":"linguruțelor"}},{"word":"lingușeală","pos":"noun","definitions":["flattery"],"forms":{"plural":"lingușeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lingușeală","accusative-definite-nominative-singular":"lingușeala","accusative-indefinite-nominative-plural":"lingușeli","accusative-definite-nominative-plural":"lingușelile","dative-genitive-indefinite-singular":"lingușeli","dative-definite-genitive-singular":"lingușelii","dative-genitive-indefinite-plural":"lingușeli","dative-definite-genitive-plural":"lingușelilor","singular-vocative":"lingușeală","plural-vocative":"lingușelilor"}},{"word":"linguși","pos":"verb","definitions":["to flatter","to bootlick, brownnose, fawn, fawn over"],"forms":{"canonical":"a linguși 4th conjugation","present-singular-third-person":"lingușește","participle-past":"lingușit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a linguși","gerund":"lingușind","first-person-indicative-present-singular":"lingușesc","indicative-present-second-person-singular":"lingușești","indicative-present-singular-third-person":"lingușește","first-person-indicative-plural-present":"lingușim","indicative-plural-present-second-person":"lingușiți","indicative-plural-present-third-person":"lingușesc","first-person-imperfect-indicative-singular":"lingușeam","imperfect-indicative-second-person-singular":"lingușeai","imperfect-indicative-singular-third-person":"lingușea","first-person-imperfect-indicative-plural":"lingușeam","imperfect-indicative-plural-second-person":"lingușeați","imperfect-indicative-plural-third-person":"lingușeau","first-person-indicative-perfect-singular":"lingușii","indicative-perfect-second-person-singular":"lingușiși","indicative-perfect-singular-third-person":"linguși","first-person-indicative-perfect-plural":"lingușirăm","indicative-perfect-plural-second-person":"lingușirăți","indicative-perfect-plural-third-person":"lingușiră","first-person-indicative-pluperfect-singular":"lingușisem","indicative-pluperfect-second-person-singular":"lingușiseși","indicative-pluperfect-singular-third-person":"lingușise","first-person-indicative-pluperfect-plural":"lingușiserăm","indicative-pluperfect-plural-second-person":"lingușiserăți","indicative-pluperfect-plural-third-person":"lingușiseră","first-person-present-singular-subjunctive":"să lingușesc","present-second-person-singular-subjunctive":"să lingușești","present-singular-subjunctive-third-person":"să lingușească","first-person-plural-present-subjunctive":"să lingușim","plural-present-second-person-subjunctive":"să lingușiți","plural-present-subjunctive-third-person":"să lingușească","imperative-second-person-singular":"lingușește","imperative-plural-second-person":"lingușiți","imperative-negative-second-person-singular":"nu linguși","imperative-negative-plural-second-person":"nu lingușiți"}},{"word":"lingușie","pos":"noun","definitions":["flattery"],"forms":{"plural":"lingușii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lingușie","accusative-definite-nominative-singular":"lingușia","accusative-indefinite-nominative-plural":"lingușii","accusative-definite-nominative-plural":"lingușiile","dative-genitive-indefinite-singular":"lingușii","dative-definite-genitive-singular":"lingușiei","dative-genitive-indefinite-plural":"lingușii","dative-definite-genitive-plural":"lingușiilor","singular-vocative":"lingușie","plural-vocative":"lingușiilor"}},{"word":"lingușire","pos":"noun","definitions":["flattery, fawning, blarney"],"forms":{"plural":"lingușiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lingușire","accusative-definite-nominative-singular":"lingușirea","accusative-indefinite-nominative-plural":"lingușiri","accusative-definite-nominative-plural":"lingușirile","dative-genitive-indefinite-singular":"lingușiri","dative-definite-genitive-singular":"lingușirii","dative-genitive-indefinite-plural":"lingușiri","dative-definite-genitive-plural":"lingușirilor","singular-vocative":"lingușire","plural-vocative":"lingușirilor"}},{"word":"lingușit","pos":"adj","definitions":["flattered"],"forms":{"feminine-singular":"lingușită","masculine-plural":"lingușiți","feminine-neuter-plural":"lingușite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lingușit","error-unrecognized-form-feminine-indefinite-singular":"lingușită","error-unrecognized-form-indefinite-masculine-plural":"lingușiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lingușite","definite-error-unrecognized-form-masculine-neuter-singular":"lingușitul","definite-error-unrecognized-form-feminine-singular":"lingușita","definite-error-unrecognized-form-masculine-plural":"lingușiții","definite-error-unrecognized-form-feminine-neuter-plural":"lingușitele"}},{"word":"lingușit","pos":"verb","definitions":["past participle of linguși"],"forms":{"participle-past":"of linguși"}},{"word":"lingușitoare","pos":"noun","definitions":["female equivalent of lingușitor"],"forms":{"plural":"lingușitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"lingușitoare","accusative-definite-nominative-singular":"lingușitoarea","accusative-indefinite-nominative-plural":"lingușitoare","accusative-definite-nominative-plural":"lingușitoarele","dative-genitive-indefinite-singular":"lingușitoare","dative-definite-genitive-singular":"lingușitoarei","dative-genitive-indefinite-plural":"lingușitoare","dative-definite-genitive-plural":"lingușitoarelor","singular-vocative":"lingușitoare","plural-vocative":"lingușitoarelor"}},{"word":"lingușitor","pos":"adj","definitions":["flattering"],"forms":{"feminine-singular":"lingușitoare","masculine-plural":"lingușitori","feminine-neuter-plural":"lingușitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lingușitor","error-unrecognized-form-feminine-indefinite-singular":"lingușitoare","error-unrecognized-form-indefinite-masculine-plural":"lingușitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"lingușitoare","definite-error-unrecognized-form-masculine-neuter-singular":"lingușitorul","definite-error-unrecognized-form-feminine-singular":"lingușitoarea","definite-error-unrecognized-form-masculine-plural":"lingușitorii","definite-error-unrecognized-form-feminine-neuter-plural":"lingușitoarele"}},{"word":"lingușitor","pos":"noun","definitions":["flatterer"],"forms":{"plural":"lingușitori","feminine":"equivalent lingușitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lingușitor","accusative-definite-nominative-singular":"lingușitorul","accusative-indefinite-nominative-plural":"lingușitori","accusative-definite-nominative-plural":"lingușitorii","dative-genitive-indefinite-singular":"lingușitor","dative-definite-genitive-singular":"lingușitorului","dative-genitive-indefinite-plural":"lingușitori","dative-definite-genitive-plural":"lingușitorilor","singular-vocative":"lingușitorule","plural-vocative":"lingușitorilor"}},{"word":"lingușitorie","pos":"noun","definitions":["flattery, fawning, blarney"],"forms":{"plural":"lingușitorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lingușitorie","accusative-definite-nominative-singular":"lingușitoria","accusative-indefinite-nominative-plural":"lingușitorii","accusative-definite-nominative-plural":"lingușitoriile","dative-genitive-indefinite-singular":"lingușitorii","dative-definite-genitive-singular":"lingușitoriei","dative-genitive-indefinite-plural":"lingușitorii","dative-definite-genitive-plural":"lingușitoriilor","singular-vocative":"lingușitorie","plural-vocative":"lingușitoriilor"}},{"word":"lingușitură","pos":"noun","definitions":["flattery"],"forms":{"plural":"lingușituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lingușitură","accusative-definite-nominative-singular":"lingușitura","accusative-indefinite-nominative-plural":"lingușiture","accusative-definite-nominative-plural":"lingușiturele","dative-genitive-indefinite-singular":"lingușiture","dative-definite-genitive-singular":"lingușiturei","dative-genitive-indefinite-plural":"lingușiture","dative-definite-genitive-plural":"lingușiturelor","singular-vocative":"lingușitură","plural-vocative":"lingușiturelor"}},{"word":"lingv.","pos":"noun","definitions":["abbreviation of lingvistică (“linguistics”)"]},{"word":"lingviform","pos":"adj","definitions":["linguiform"],"forms":{"feminine-singular":"lingviformă","masculine-plural":"lingviformi","feminine-neuter-plural":"lingviforme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lingviform","error-unrecognized-form-feminine-indefinite-singular":"lingviformă","error-unrecognized-form-indefinite-masculine-plural":"lingviformi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lingviforme","definite-error-unrecognized-form-masculine-neuter-singular":"lingviformul","definite-error-unrecognized-form-feminine-singular":"lingviforma","definite-error-unrecognized-form-masculine-plural":"lingviformii","definite-error-unrecognized-form-feminine-neuter-plural":"lingviformele"}},{"word":"lingvist","pos":"noun","definitions":["linguist"],"pronunciation":"/linˈɡvist/","forms":{"plural":"lingviști","feminine":"equivalent lingvistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lingvist","accusative-definite-nominative-singular":"lingvistul","accusative-indefinite-nominative-plural":"lingviști","accusative-definite-nominative-plural":"lingviștii","dative-genitive-indefinite-singular":"lingvist","dative-definite-genitive-singular":"lingvistului","dative-genitive-indefinite-plural":"lingviști","dative-definite-genitive-plural":"lingviștilor","singular-vocative":"lingvistule","plural-vocative":"lingviștilor","alternative":"linguist"}},{"word":"lingvista","pos":"noun","definitions":["definite nominative/accusative singular of lingvistă"]},{"word":"lingvistă","pos":"noun","definitions":["female equivalent of lingvist"],"pronunciation":"/linˈɡvis.tə/","forms":{"plural":"lingviste","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"lingvistă","accusative-definite-nominative-singular":"lingvista","accusative-indefinite-nominative-plural":"lingviste","accusative-definite-nominative-plural":"lingvistele","dative-genitive-indefinite-singular":"lingviste","dative-definite-genitive-singular":"lingvistei","dative-genitive-indefinite-plural":"lingviste","dative-definite-genitive-plural":"lingvistelor","singular-vocative":"-","plural-vocative":"-","alternative":"linguistă"}},{"word":"lingviste","pos":"noun","definitions":["plural of lingvistă"],"gender":"f"},{"word":"lingvistei","pos":"noun","definitions":["definite genitive/dative singular of lingvistă"]},{"word":"lingviști","pos":"noun","definitions":["plural of lingvist"],"gender":"m"},{"word":"lingvistic","pos":"adj","definitions":["linguistic"],"pronunciation":"/liŋɡˈvis.tik/","forms":{"feminine-singular":"lingvistică","masculine-plural":"lingvistici","feminine-neuter-plural":"lingvistice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"lingvistic","error-unrecognized-form-feminine-indefinite-singular":"lingvistică","error-unrecognized-form-indefinite-masculine-plural":"lingvistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"lingvistice","definite-error-unrecognized-form-masculine-neuter-singular":"lingvisticul","definite-error-unrecognized-form-feminine-singular":"lingvistica","definite-error-unrecognized-form-masculine-plural":"lingvisticii","definite-error-unrecognized-form-feminine-neuter-plural":"lingvisticele"}},{"word":"lingvistică","pos":"noun","definitions":["linguistics"],"pronunciation":"/linɡˈvi.sti.kə/","forms":{"plural":"lingvistici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lingvistică","accusative-definite-nominative-singular":"lingvistica","accusative-indefinite-nominative-plural":"lingvistici","accusative-definite-nominative-plural":"lingvisticile","dative-genitive-indefinite-singular":"lingvistici","dative-definite-genitive-singular":"lingvisticii","dative-genitive-indefinite-plural":"lingvistici","dative-definite-genitive-plural":"lingvisticilor","singular-vocative":"lingvistică","plural-vocative":"lingvisticilor"}},{"word":"lingvistică aplicată","pos":"noun","definitions":["applied linguistics"]},{"word":"lingvistică comparată","pos":"noun","definitions":["comparative linguistics"]},{"word":"lingvistică comparativă","pos":"noun","definitions":["comparative linguistics"]},{"word":"lingvistică diacronică","pos":"noun","definitions":["diachronic linguistics"]},{"word":"Linia","pos":"name","definitions":["a village in Budești, Vâlcea County, Romania","a village in Grădiștea, Vâlcea County, Romania"],"gender":"f"},{"word":"linia","pos":"verb","definitions":["to line"],"forms":{"canonical":"a linia 1st conjugation","present-singular-third-person":"liniază","participle-past":"liniat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a linia","gerund":"liniind","first-person-indicative-present-singular":"liniez","indicative-present-second-person-singular":"liniezi","indicative-present-singular-third-person":"liniază","first-person-indicative-plural-present":"liniem","indicative-plural-present-second-person":"liniați","indicative-plural-present-third-person":"liniază","first-person-imperfect-indicative-singular":"liniam","imperfect-indicative-second-person-singular":"liniai","imperfect-indicative-singular-third-person":"linia","first-person-imperfect-indicative-plural":"liniam","imperfect-indicative-plural-second-person":"liniați","imperfect-indicative-plural-third-person":"liniau","first-person-indicative-perfect-singular":"liniai","indicative-perfect-second-person-singular":"liniași","indicative-perfect-singular-third-person":"linie","first-person-indicative-perfect-plural":"liniarăm","indicative-perfect-plural-second-person":"liniarăți","indicative-perfect-plural-third-person":"liniară","first-person-indicative-pluperfect-singular":"liniasem","indicative-pluperfect-second-person-singular":"liniaseși","indicative-pluperfect-singular-third-person":"liniase","first-person-indicative-pluperfect-plural":"liniaserăm","indicative-pluperfect-plural-second-person":"liniaserăți","indicative-pluperfect-plural-third-person":"liniaseră","first-person-present-singular-subjunctive":"să liniez","present-second-person-singular-subjunctive":"să liniezi","present-singular-subjunctive-third-person":"să linieze","first-person-plural-present-subjunctive":"să liniem","plural-present-second-person-subjunctive":"să liniați","plural-present-subjunctive-third-person":"să linieze","imperative-second-person-singular":"liniază","imperative-plural-second-person":"liniați","imperative-negative-second-person-singular":"nu linia","imperative-negative-plural-second-person":"nu liniați"}},{"word":"Linia Costii","pos":"name","definitions":["a village in Talpa, Teleorman County, Romania"],"gender":"f"},{"word":"Linia Dealului","pos":"name","definitions":["a village in Stănești, Vâlcea County, Romania"],"gender":"f"},{"word":"Linia din Vale","pos":"name","definitions":["a village in Curtișoara, Olt County, Romania"],"gender":"f"},{"word":"Linia Hanului","pos":"name","definitions":["a village in Nicolae Bălcescu, Vâlcea County, Romania"],"gender":"f"},{"word":"Linia Pe Vale","pos":"name","definitions":["a village in Dănicei, Vâlcea County, Romania"],"gender":"f"},{"word":"Linia pe Vale","pos":"name","definitions":["a village in Dănicei, Vâlcea County, Romania"],"gender":"f"},{"word":"liniament","pos":"noun","definitions":["lineament"],"forms":{"plural":"liniamente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"liniament","accusative-definite-nominative-singular":"liniamentul","accusative-indefinite-nominative-plural":"liniamente","accusative-definite-nominative-plural":"liniamentele","dative-genitive-indefinite-singular":"liniament","dative-definite-genitive-singular":"liniamentului","dative-genitive-indefinite-plural":"liniamente","dative-definite-genitive-plural":"liniamentelor","singular-vocative":"liniamentule","plural-vocative":"liniamentelor"}},{"word":"liniar","pos":"adj","definitions":["linear"],"pronunciation":"/li.niˈar/","forms":{"feminine-singular":"liniară","masculine-plural":"liniari","feminine-neuter-plural":"liniare","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"liniar","error-unrecognized-form-feminine-indefinite-singular":"liniară","error-unrecognized-form-indefinite-masculine-plural":"liniari","error-unrecognized-form-feminine-indefinite-neuter-plural":"liniare","definite-error-unrecognized-form-masculine-neuter-singular":"liniarul","definite-error-unrecognized-form-feminine-singular":"liniara","definite-error-unrecognized-form-masculine-plural":"liniarii","definite-error-unrecognized-form-feminine-neuter-plural":"liniarele","alternative":"linear"}},{"word":"liniaritate","pos":"noun","definitions":["linearity"],"forms":{"plural":"liniarități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"liniaritate","accusative-definite-nominative-singular":"liniaritatea","accusative-indefinite-nominative-plural":"liniarități","accusative-definite-nominative-plural":"liniaritățile","dative-genitive-indefinite-singular":"liniarități","dative-definite-genitive-singular":"liniarității","dative-genitive-indefinite-plural":"liniarități","dative-definite-genitive-plural":"liniarităților","singular-vocative":"liniaritate","plural-vocative":"liniarităților"}},{"word":"liniat","pos":"adj","definitions":["lined, ruled"],"pronunciation":"/li.niˈat/","forms":{"feminine-singular":"liniată","masculine-plural":"liniați","feminine-neuter-plural":"liniate","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"liniat","error-unrecognized-form-feminine-indefinite-singular":"liniată","error-unrecognized-form-indefinite-masculine-plural":"liniați","error-unrecognized-form-feminine-indefinite-neuter-plural":"liniate","definite-error-unrecognized-form-masculine-neuter-singular":"liniatul","definite-error-unrecognized-form-feminine-singular":"liniata","definite-error-unrecognized-form-masculine-plural":"liniații","definite-error-unrecognized-form-feminine-neuter-plural":"liniatele"}},{"word":"liniat","pos":"verb","definitions":["past participle of linia"],"pronunciation":"/li.niˈat/"},{"word":"liniatură","pos":"noun","definitions":["lining"],"forms":{"plural":"liniaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"liniatură","accusative-definite-nominative-singular":"liniatura","accusative-indefinite-nominative-plural":"liniaturi","accusative-definite-nominative-plural":"liniaturile","dative-genitive-indefinite-singular":"liniaturi","dative-definite-genitive-singular":"liniaturii","dative-genitive-indefinite-plural":"liniaturi","dative-definite-genitive-plural":"liniaturilor","singular-vocative":"liniatură","plural-vocative":"liniaturilor"}},{"word":"linicel","pos":"adj","definitions":["diminutive of lin4"],"forms":{"feminine-singular":"linicelă","masculine-plural":"liniceli","feminine-neuter-plural":"linicele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"linicel","error-unrecognized-form-feminine-indefinite-singular":"linicelă","error-unrecognized-form-indefinite-masculine-plural":"liniceli","error-unrecognized-form-feminine-indefinite-neuter-plural":"linicele","definite-error-unrecognized-form-masculine-neuter-singular":"linicelul","definite-error-unrecognized-form-feminine-singular":"linicela","definite-error-unrecognized-form-masculine-plural":"linicelii","definite-error-unrecognized-form-feminine-neuter-plural":"linicelele"}},{"word":"linie","pos":"noun","definitions":["line","rank"],"forms":{"plural":"linii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"linie","accusative-definite-nominative-singular":"linia","accusative-indefinite-nominative-plural":"linii","accusative-definite-nominative-plural":"liniile","dative-genitive-indefinite-singular":"linii","dative-definite-genitive-singular":"liniei","dative-genitive-indefinite-plural":"linii","dative-definite-genitive-plural":"liniilor","singular-vocative":"linie","plural-vocative":"liniilor"}},{"word":"linie aeriană","pos":"noun","definitions":["airline"],"forms":{"plural":"linii aeriene"}},{"word":"linie de asamblare","pos":"noun","definitions":["assembly line"],"forms":{"plural":"linii de asamblare"}},{"word":"linie de comandă","pos":"noun","definitions":["command line"],"forms":{"plural":"linii de comandă"}},{"word":"linie de credit","pos":"noun","definitions":["line of credit"],"forms":{"plural":"linii de credit"}},{"word":"linie de demarcație","pos":"noun","definitions":["dividing line"],"forms":{"plural":"linii de demarcație"}},{"word":"linie de fracție","pos":"noun","definitions":["fraction bar"],"forms":{"plural":"linii de fracție"}},{"word":"linie de luptă","pos":"noun","definitions":["battle line"]},{"word":"linie de plutire","pos":"noun","definitions":["waterline"]},{"word":"linie de poartă","pos":"noun","definitions":["goal line"],"forms":{"plural":"linii de poartă"}},{"word":"linie de succesiune","pos":"noun","definitions":["line of succession"],"forms":{"plural":"linii de succesiune"}},{"word":"linie de telefon","pos":"noun","definitions":["telephone line"],"forms":{"plural":"linii de telefon"}},{"word":"linie directoare","pos":"noun","definitions":["guideline"],"forms":{"plural":"linii directoare"}},{"word":"linie dreaptă","pos":"noun","definitions":["straight line"],"forms":{"plural":"linii drepte"}},{"word":"linie electrică","pos":"noun","definitions":["power line"],"forms":{"plural":"linii electrice"}},{"word":"linie ferată","pos":"noun","definitions":["railway"],"forms":{"plural":"linii ferate"}},{"word":"linie oblică","pos":"noun","definitions":["forward slash ('/' symbol)"],"forms":{"plural":"linii oblice"}},{"word":"linie oblică inversă","pos":"noun","definitions":["backslash"],"forms":{"plural":"linii oblice inverse"}},{"word":"linie telefonică","pos":"noun","definitions":["telephone line"],"forms":{"plural":"linii telefonice"}},{"word":"linie telegrafică","pos":"noun","definitions":["telegraph line"],"forms":{"plural":"linii telegrafice"}},{"word":"linie vizuală","pos":"noun","definitions":["line of sight"]},{"word":"linier","pos":"noun","definitions":["ruler (instrument)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"linier","accusative-definite-nominative":"linierul","dative-genitive-indefinite":"linier","dative-definite-genitive":"linierului","vocative":"linierule"}},{"word":"liniere","pos":"noun","definitions":["drawing of lines"],"forms":{"plural":"linieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"liniere","accusative-definite-nominative-singular":"linierea","accusative-indefinite-nominative-plural":"linieri","accusative-definite-nominative-plural":"linierile","dative-genitive-indefinite-singular":"linieri","dative-definite-genitive-singular":"linierii","dative-genitive-indefinite-plural":"linieri","dative-definite-genitive-plural":"linierilor","singular-vocative":"liniere","plural-vocative":"linierilor"}},{"word":"liniment","pos":"noun","definitions":["liniment"],"forms":{"plural":"linimente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"liniment","accusative-definite-nominative-singular":"linimentul","accusative-indefinite-nominative-plural":"linimente","accusative-definite-nominative-plural":"linimentele","dative-genitive-indefinite-singular":"liniment","dative-definite-genitive-singular":"linimentului","dative-genitive-indefinite-plural":"linimente","dative-definite-genitive-plural":"linimentelor","singular-vocative":"linimentule","plural-vocative":"linimentelor"}},{"word":"linioară","pos":"noun","definitions":["diminutive of linie; small line"],"forms":{"plural":"linioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"linioară","accusative-definite-nominative-singular":"linioara","accusative-indefinite-nominative-plural":"linioare","accusative-definite-nominative-plural":"linioarele","dative-genitive-indefinite-singular":"linioare","dative-definite-genitive-singular":"linioarei","dative-genitive-indefinite-plural":"linioare","dative-definite-genitive-plural":"linioarelor","singular-vocative":"linioară","plural-vocative":"linioarelor"}},{"word":"linișor","pos":"adj","definitions":["diminutive of lin"],"pronunciation":"/li.niˈʃor/","forms":{"feminine-singular":"linișoară","masculine-plural":"linișori","feminine-neuter-plural":"linișoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"linișor","error-unrecognized-form-feminine-indefinite-singular":"linișoară","error-unrecognized-form-indefinite-masculine-plural":"linișori","error-unrecognized-form-feminine-indefinite-neuter-plural":"linișoare","definite-error-unrecognized-form-masculine-neuter-singular":"linișorul","definite-error-unrecognized-form-feminine-singular":"linișoara","definite-error-unrecognized-form-masculine-plural":"linișorii","definite-error-unrecognized-form-feminine-neuter-plural":"linișoarele"}},{"word":"liniște","pos":"noun","definitions":["silence, calm, quiet","peace, serenity, tranquility","equanimity"],"pronunciation":"/ˈli.ni.ʃte/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"liniște","accusative-definite-nominative":"liniștea","dative-genitive-indefinite":"liniști","dative-definite-genitive":"liniștii","vocative":"liniște"}},{"word":"liniști","pos":"verb","definitions":["to calm","to calm oneself, to settle down"],"pronunciation":"[li.niˈʃti]","forms":{"canonical":"a liniști 4th conjugation","present-singular-third-person":"liniștește","participle-past":"liniștit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a liniști","gerund":"liniștind","first-person-indicative-present-singular":"liniștesc","indicative-present-second-person-singular":"liniștești","indicative-present-singular-third-person":"liniștește","first-person-indicative-plural-present":"liniștim","indicative-plural-present-second-person":"liniștiți","indicative-plural-present-third-person":"liniștesc","first-person-imperfect-indicative-singular":"linișteam","imperfect-indicative-second-person-singular":"linișteai","imperfect-indicative-singular-third-person":"liniștea","first-person-imperfect-indicative-plural":"linișteam","imperfect-indicative-plural-second-person":"linișteați","imperfect-indicative-plural-third-person":"linișteau","first-person-indicative-perfect-singular":"liniștii","indicative-perfect-second-person-singular":"liniștiși","indicative-perfect-singular-third-person":"liniști","first-person-indicative-perfect-plural":"liniștirăm","indicative-perfect-plural-second-person":"liniștirăți","indicative-perfect-plural-third-person":"liniștiră","first-person-indicative-pluperfect-singular":"liniștisem","indicative-pluperfect-second-person-singular":"liniștiseși","indicative-pluperfect-singular-third-person":"liniștise","first-person-indicative-pluperfect-plural":"liniștiserăm","indicative-pluperfect-plural-second-person":"liniștiserăți","indicative-pluperfect-plural-third-person":"liniștiseră","first-person-present-singular-subjunctive":"să liniștesc","present-second-person-singular-subjunctive":"să liniștești","present-singular-subjunctive-third-person":"să liniștească","first-person-plural-present-subjunctive":"să liniștim","plural-present-second-person-subjunctive":"să liniștiți","plural-present-subjunctive-third-person":"să liniștească","imperative-second-person-singular":"liniștește","imperative-plural-second-person":"liniștiți","imperative-negative-second-person-singular":"nu liniști","imperative-negative-plural-second-person":"nu liniștiți"}},{"word":"liniștire","pos":"noun","definitions":["reassurance"],"forms":{"plural":"liniștiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"liniștire","accusative-definite-nominative-singular":"liniștirea","accusative-indefinite-nominative-plural":"liniștiri","accusative-definite-nominative-plural":"liniștirile","dative-genitive-indefinite-singular":"liniștiri","dative-definite-genitive-singular":"liniștirii","dative-genitive-indefinite-plural":"liniștiri","dative-definite-genitive-plural":"liniștirilor","singular-vocative":"liniștire","plural-vocative":"liniștirilor"}},{"word":"liniștit","pos":"adj","definitions":["calm"],"pronunciation":"[li.niˈʃtit]","forms":{"feminine-singular":"liniștită","masculine-plural":"liniștiți","feminine-neuter-plural":"liniștite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liniștit","error-unrecognized-form-feminine-indefinite-singular":"liniștită","error-unrecognized-form-indefinite-masculine-plural":"liniștiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"liniștite","definite-error-unrecognized-form-masculine-neuter-singular":"liniștitul","definite-error-unrecognized-form-feminine-singular":"liniștita","definite-error-unrecognized-form-masculine-plural":"liniștiții","definite-error-unrecognized-form-feminine-neuter-plural":"liniștitele"}},{"word":"liniștit","pos":"verb","definitions":["past participle of liniști"],"pronunciation":"[li.niˈʃtit]","forms":{"participle-past":"of liniști","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"liniștit","error-unrecognized-form-feminine-indefinite-singular":"liniștită","error-unrecognized-form-indefinite-masculine-plural":"liniștiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"liniștite","definite-error-unrecognized-form-masculine-neuter-singular":"liniștitul","definite-error-unrecognized-form-feminine-singular":"liniștita","definite-error-unrecognized-form-masculine-plural":"liniștiții","definite-error-unrecognized-form-feminine-neuter-plural":"liniștitele"}},{"word":"liniștitor","pos":"adj","definitions":["soothing"],"forms":{"feminine-singular":"liniștitoare","masculine-plural":"liniștitori","feminine-neuter-plural":"liniștitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liniștitor","error-unrecognized-form-feminine-indefinite-singular":"liniștitoare","error-unrecognized-form-indefinite-masculine-plural":"liniștitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"liniștitoare","definite-error-unrecognized-form-masculine-neuter-singular":"liniștitorul","definite-error-unrecognized-form-feminine-singular":"liniștitoarea","definite-error-unrecognized-form-masculine-plural":"liniștitorii","definite-error-unrecognized-form-feminine-neuter-plural":"liniștitoarele"}},{"word":"liniștos","pos":"adj","definitions":["tranquil"],"forms":{"feminine-singular":"liniștoasă","masculine-plural":"liniștoși","feminine-neuter-plural":"liniștoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liniștos","error-unrecognized-form-feminine-indefinite-singular":"liniștoasă","error-unrecognized-form-indefinite-masculine-plural":"liniștoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"liniștoase","definite-error-unrecognized-form-masculine-neuter-singular":"liniștosul","definite-error-unrecognized-form-feminine-singular":"liniștoasa","definite-error-unrecognized-form-masculine-plural":"liniștoșii","definite-error-unrecognized-form-feminine-neuter-plural":"liniștoasele"}},{"word":"liniuță","pos":"noun","definitions":["diminutive of linie; small line"],"forms":{"plural":"liniuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"liniuță","accusative-definite-nominative-singular":"liniuța","accusative-indefinite-nominative-plural":"liniuțe","accusative-definite-nominative-plural":"liniuțele","dative-genitive-indefinite-singular":"liniuțe","dative-definite-genitive-singular":"liniuței","dative-genitive-indefinite-plural":"liniuțe","dative-definite-genitive-plural":"liniuțelor","singular-vocative":"liniuță","plural-vocative":"liniuțelor"}},{"word":"liniuță de unire","pos":"noun","definitions":["hyphen"],"forms":{"plural":"liniuță de unire"}},{"word":"linjeriță","pos":"noun","definitions":["seamstress"],"forms":{"plural":"linjerițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"linjeriță","accusative-definite-nominative-singular":"linjerița","accusative-indefinite-nominative-plural":"linjerițe","accusative-definite-nominative-plural":"linjerițele","dative-genitive-indefinite-singular":"linjerițe","dative-definite-genitive-singular":"linjeriței","dative-genitive-indefinite-plural":"linjerițe","dative-definite-genitive-plural":"linjerițelor","singular-vocative":"linjeriță","plural-vocative":"linjerițelor"}},{"word":"link","pos":"noun","definitions":["link"],"forms":{"plural":"linkuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"link","accusative-definite-nominative-singular":"linkul","accusative-indefinite-nominative-plural":"linkuri","accusative-definite-nominative-plural":"linkurile","dative-genitive-indefinite-singular":"link","dative-definite-genitive-singular":"linkului","dative-genitive-indefinite-plural":"linkuri","dative-definite-genitive-plural":"linkurilor","singular-vocative":"linkule","plural-vocative":"linkurilor"}},{"word":"lino","pos":"noun","definitions":["alternative form of linon"],"forms":{"plural":"linouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lino","accusative-definite-nominative-singular":"linoul","accusative-indefinite-nominative-plural":"linouri","accusative-definite-nominative-plural":"linourile","dative-genitive-indefinite-singular":"lino","dative-definite-genitive-singular":"linoului","dative-genitive-indefinite-plural":"linouri","dative-definite-genitive-plural":"linourilor","singular-vocative":"linoule","plural-vocative":"linourilor"}},{"word":"linograf","pos":"noun","definitions":["linograph"],"forms":{"plural":"linografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"linograf","accusative-definite-nominative-singular":"linograful","accusative-indefinite-nominative-plural":"linografe","accusative-definite-nominative-plural":"linografele","dative-genitive-indefinite-singular":"linograf","dative-definite-genitive-singular":"linografului","dative-genitive-indefinite-plural":"linografe","dative-definite-genitive-plural":"linografelor","singular-vocative":"linografule","plural-vocative":"linografelor"}},{"word":"linogravură","pos":"noun","definitions":["linocut"],"forms":{"plural":"linogravuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"linogravură","accusative-definite-nominative-singular":"linogravura","accusative-indefinite-nominative-plural":"linogravuri","accusative-definite-nominative-plural":"linogravurile","dative-genitive-indefinite-singular":"linogravuri","dative-definite-genitive-singular":"linogravurii","dative-genitive-indefinite-plural":"linogravuri","dative-definite-genitive-plural":"linogravurilor","singular-vocative":"linogravură","plural-vocative":"linogravurilor"}},{"word":"linoleat","pos":"noun","definitions":["linoleate"],"forms":{"plural":"linoleați","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"linoleat","accusative-definite-nominative-singular":"linoleatul","accusative-indefinite-nominative-plural":"linoleați","accusative-definite-nominative-plural":"linoleațile","dative-genitive-indefinite-singular":"linoleat","dative-definite-genitive-singular":"linoleatului","dative-genitive-indefinite-plural":"linoleați","dative-definite-genitive-plural":"linoleaților","singular-vocative":"linoleatule","plural-vocative":"linoleaților"}},{"word":"linoleum","pos":"noun","definitions":["linoleum"],"forms":{"plural":"linoleumuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"linoleum","accusative-definite-nominative-singular":"linoleumul","accusative-indefinite-nominative-plural":"linoleumuri","accusative-definite-nominative-plural":"linoleumurile","dative-genitive-indefinite-singular":"linoleum","dative-definite-genitive-singular":"linoleumului","dative-genitive-indefinite-plural":"linoleumuri","dative-definite-genitive-plural":"linoleumurilor","singular-vocative":"linoleumule","plural-vocative":"linoleumurilor"}},{"word":"linon","pos":"noun","definitions":["lawn (linen fabric)"],"forms":{"plural":"linonuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"linon","accusative-definite-nominative-singular":"linonul","accusative-indefinite-nominative-plural":"linonuri","accusative-definite-nominative-plural":"linonurile","dative-genitive-indefinite-singular":"linon","dative-definite-genitive-singular":"linonului","dative-genitive-indefinite-plural":"linonuri","dative-definite-genitive-plural":"linonurilor","singular-vocative":"linonule","plural-vocative":"linonurilor"}},{"word":"linotip","pos":"noun","definitions":["linotype"],"forms":{"plural":"linotipuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"linotip","accusative-definite-nominative-singular":"linotipul","accusative-indefinite-nominative-plural":"linotipuri","accusative-definite-nominative-plural":"linotipurile","dative-genitive-indefinite-singular":"linotip","dative-definite-genitive-singular":"linotipului","dative-genitive-indefinite-plural":"linotipuri","dative-definite-genitive-plural":"linotipurilor","singular-vocative":"linotipule","plural-vocative":"linotipurilor"}},{"word":"linotipie","pos":"noun","definitions":["linotype"],"forms":{"plural":"linotipii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"linotipie","accusative-definite-nominative-singular":"linotipia","accusative-indefinite-nominative-plural":"linotipii","accusative-definite-nominative-plural":"linotipiile","dative-genitive-indefinite-singular":"linotipii","dative-definite-genitive-singular":"linotipiei","dative-genitive-indefinite-plural":"linotipii","dative-definite-genitive-plural":"linotipiilor","singular-vocative":"linotipie","plural-vocative":"linotipiilor"}},{"word":"linotipist","pos":"noun","definitions":["linotypist"],"forms":{"plural":"linotipiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"linotipist","accusative-definite-nominative-singular":"linotipistul","accusative-indefinite-nominative-plural":"linotipiști","accusative-definite-nominative-plural":"linotipiștii","dative-genitive-indefinite-singular":"linotipist","dative-definite-genitive-singular":"linotipistului","dative-genitive-indefinite-plural":"linotipiști","dative-definite-genitive-plural":"linotipiștilor","singular-vocative":"linotipistule","plural-vocative":"linotipiștilor"}},{"word":"linotipistă","pos":"noun","definitions":["female equivalent of linotipist"],"forms":{"plural":"linotipiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"linotipistă","accusative-definite-nominative-singular":"linotipista","accusative-indefinite-nominative-plural":"linotipiste","accusative-definite-nominative-plural":"linotipistele","dative-genitive-indefinite-singular":"linotipiste","dative-definite-genitive-singular":"linotipistei","dative-genitive-indefinite-plural":"linotipiste","dative-definite-genitive-plural":"linotipistelor","singular-vocative":"linotipistă","plural-vocative":"linotipistelor"}},{"word":"linou","pos":"noun","definitions":["lawn (linen fabric)"],"forms":{"plural":"linouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"linou","accusative-definite-nominative-singular":"linoul","accusative-indefinite-nominative-plural":"linouri","accusative-definite-nominative-plural":"linourile","dative-genitive-indefinite-singular":"linou","dative-definite-genitive-singular":"linoului","dative-genitive-indefinite-plural":"linouri","dative-definite-genitive-plural":"linourilor","singular-vocative":"linoule","plural-vocative":"linourilor"}},{"word":"lins","pos":"verb","definitions":["past participle of linge (“licked”)"],"pronunciation":"[lins]"},{"word":"lins","pos":"adj","definitions":["sleek, smoothed"],"pronunciation":"[lins]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lins","error-unrecognized-form-feminine-indefinite-singular":"linsă","error-unrecognized-form-indefinite-masculine-plural":"linși","error-unrecognized-form-feminine-indefinite-neuter-plural":"linse","definite-error-unrecognized-form-masculine-neuter-singular":"linsul","definite-error-unrecognized-form-feminine-singular":"linsa","definite-error-unrecognized-form-masculine-plural":"linșii","definite-error-unrecognized-form-feminine-neuter-plural":"linsele"}},{"word":"linșa","pos":"verb","definitions":["to lynch"],"forms":{"canonical":"a linșa 1st conjugation","present-singular-third-person":"linșează","participle-past":"linșat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a linșa","gerund":"linșând","first-person-indicative-present-singular":"linșez","indicative-present-second-person-singular":"linșezi","indicative-present-singular-third-person":"linșează","first-person-indicative-plural-present":"linșăm","indicative-plural-present-second-person":"linșați","indicative-plural-present-third-person":"linșează","first-person-imperfect-indicative-singular":"linșam","imperfect-indicative-second-person-singular":"linșai","imperfect-indicative-singular-third-person":"linșa","first-person-imperfect-indicative-plural":"linșam","imperfect-indicative-plural-second-person":"linșați","imperfect-indicative-plural-third-person":"linșau","first-person-indicative-perfect-singular":"linșai","indicative-perfect-second-person-singular":"linșași","indicative-perfect-singular-third-person":"linșă","first-person-indicative-perfect-plural":"linșarăm","indicative-perfect-plural-second-person":"linșarăți","indicative-perfect-plural-third-person":"linșară","first-person-indicative-pluperfect-singular":"linșasem","indicative-pluperfect-second-person-singular":"linșaseși","indicative-pluperfect-singular-third-person":"linșase","first-person-indicative-pluperfect-plural":"linșaserăm","indicative-pluperfect-plural-second-person":"linșaserăți","indicative-pluperfect-plural-third-person":"linșaseră","first-person-present-singular-subjunctive":"să linșez","present-second-person-singular-subjunctive":"să linșezi","present-singular-subjunctive-third-person":"să linșeze","first-person-plural-present-subjunctive":"să linșăm","plural-present-second-person-subjunctive":"să linșați","plural-present-subjunctive-third-person":"să linșeze","imperative-second-person-singular":"linșează","imperative-plural-second-person":"linșați","imperative-negative-second-person-singular":"nu linșa","imperative-negative-plural-second-person":"nu linșați"}},{"word":"linșaj","pos":"noun","definitions":["lynching"],"forms":{"plural":"linșaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"linșaj","accusative-definite-nominative-singular":"linșajul","accusative-indefinite-nominative-plural":"linșaje","accusative-definite-nominative-plural":"linșajele","dative-genitive-indefinite-singular":"linșaj","dative-definite-genitive-singular":"linșajului","dative-genitive-indefinite-plural":"linșaje","dative-definite-genitive-plural":"linșajelor","singular-vocative":"linșajule","plural-vocative":"linșajelor"}},{"word":"linșare","pos":"noun","definitions":["lynching"],"forms":{"plural":"linșări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"linșare","accusative-definite-nominative-singular":"linșarea","accusative-indefinite-nominative-plural":"linșări","accusative-definite-nominative-plural":"linșările","dative-genitive-indefinite-singular":"linșări","dative-definite-genitive-singular":"linșării","dative-genitive-indefinite-plural":"linșări","dative-definite-genitive-plural":"linșărilor","singular-vocative":"linșare","plural-vocative":"linșărilor"}},{"word":"Linte","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Linte"}},{"word":"linte","pos":"noun","definitions":["lentil"],"forms":{"plural":"linți"}},{"word":"Lintea","pos":"name","definitions":["a village in Scoarța, Gorj County, Romania"],"gender":"f"},{"word":"linteciune","pos":"noun","definitions":["freckle"],"forms":{"plural":"linteciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"linteciune","accusative-definite-nominative-singular":"linteciunea","accusative-indefinite-nominative-plural":"linteciuni","accusative-definite-nominative-plural":"linteciunile","dative-genitive-indefinite-singular":"linteciuni","dative-definite-genitive-singular":"linteciunii","dative-genitive-indefinite-plural":"linteciuni","dative-definite-genitive-plural":"linteciunilor","singular-vocative":"linteciune","plural-vocative":"linteciunilor"}},{"word":"Lintescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lintescu"}},{"word":"Lintești","pos":"name","definitions":["a village in Cotmeana, Argeș County, Romania"],"gender":"m"},{"word":"lintișoară","pos":"noun","definitions":["diminutive of linte"],"forms":{"plural":"lintișoarăe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lintișoară","accusative-definite-nominative-singular":"lintișoara","accusative-indefinite-nominative-plural":"lintișoarăe","accusative-definite-nominative-plural":"lintișoarăele","dative-genitive-indefinite-singular":"lintișoarăe","dative-definite-genitive-singular":"lintișoarăei","dative-genitive-indefinite-plural":"lintișoarăe","dative-definite-genitive-plural":"lintișoarăelor","singular-vocative":"lintișoară","plural-vocative":"lintișoarăelor"}},{"word":"lintiță","pos":"noun","definitions":["duckweed (Lemna)"],"forms":{"plural":"lintițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lintiță","accusative-definite-nominative-singular":"lintița","accusative-indefinite-nominative-plural":"lintițe","accusative-definite-nominative-plural":"lintițele","dative-genitive-indefinite-singular":"lintițe","dative-definite-genitive-singular":"lintiței","dative-genitive-indefinite-plural":"lintițe","dative-definite-genitive-plural":"lintițelor","singular-vocative":"lintiță","plural-vocative":"lintițelor"}},{"word":"lințoliu","pos":"noun","definitions":["shroud"],"forms":{"plural":"lințolii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lințoliu","accusative-definite-nominative-singular":"lințoliul","accusative-indefinite-nominative-plural":"lințolii","accusative-definite-nominative-plural":"lințoliile","dative-genitive-indefinite-singular":"lințoliu","dative-definite-genitive-singular":"lințoliului","dative-genitive-indefinite-plural":"lințolii","dative-definite-genitive-plural":"lințoliilor","singular-vocative":"lințoliule","plural-vocative":"lințoliilor"}},{"word":"lintou","pos":"noun","definitions":["lintel"],"forms":{"plural":"lintouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lintou","accusative-definite-nominative-singular":"lintoul","accusative-indefinite-nominative-plural":"lintouri","accusative-definite-nominative-plural":"lintourile","dative-genitive-indefinite-singular":"lintou","dative-definite-genitive-singular":"lintoului","dative-genitive-indefinite-plural":"lintouri","dative-definite-genitive-plural":"lintourilor","singular-vocative":"lintoule","plural-vocative":"lintourilor"}},{"word":"lințușcă","pos":"noun","definitions":["diminutive of linte"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lințușcă","accusative-definite-nominative":"lințușca","dative-genitive-indefinite":"lințușce","dative-definite-genitive":"lințușcei","vocative":"lințușcă"}},{"word":"linx","pos":"noun","definitions":["lynx (wild cat)"],"pronunciation":"/links/","forms":{"plural":"lincși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"linx","accusative-definite-nominative-singular":"linxul","accusative-indefinite-nominative-plural":"lincși","accusative-definite-nominative-plural":"lincșii","dative-genitive-indefinite-singular":"linx","dative-definite-genitive-singular":"linxului","dative-genitive-indefinite-plural":"lincși","dative-definite-genitive-plural":"lincșilor","singular-vocative":"linxule","plural-vocative":"lincșilor"}},{"word":"liofil","pos":"adj","definitions":["lyophilic"],"forms":{"feminine-singular":"liofilă","masculine-plural":"liofili","feminine-neuter-plural":"liofile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liofil","error-unrecognized-form-feminine-indefinite-singular":"liofilă","error-unrecognized-form-indefinite-masculine-plural":"liofili","error-unrecognized-form-feminine-indefinite-neuter-plural":"liofile","definite-error-unrecognized-form-masculine-neuter-singular":"liofilul","definite-error-unrecognized-form-feminine-singular":"liofila","definite-error-unrecognized-form-masculine-plural":"liofilii","definite-error-unrecognized-form-feminine-neuter-plural":"liofilele"}},{"word":"liofilie","pos":"noun","definitions":["lyophilia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"liofilie","accusative-definite-nominative-singular":"liofilia","accusative-indefinite-nominative-plural":"liofilii","accusative-definite-nominative-plural":"liofiliile","dative-genitive-indefinite-singular":"liofilii","dative-definite-genitive-singular":"liofiliei","dative-genitive-indefinite-plural":"liofilii","dative-definite-genitive-plural":"liofiliilor","singular-vocative":"liofilie","plural-vocative":"liofiliilor"}},{"word":"liofiliza","pos":"verb","definitions":["to lyophilize"],"forms":{"canonical":"a liofiliza 1st conjugation","present-singular-third-person":"liofilizează","participle-past":"liofilizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a liofiliza","gerund":"liofilizând","first-person-indicative-present-singular":"liofilizez","indicative-present-second-person-singular":"liofilizezi","indicative-present-singular-third-person":"liofilizează","first-person-indicative-plural-present":"liofilizăm","indicative-plural-present-second-person":"liofilizați","indicative-plural-present-third-person":"liofilizează","first-person-imperfect-indicative-singular":"liofilizam","imperfect-indicative-second-person-singular":"liofilizai","imperfect-indicative-singular-third-person":"liofiliza","first-person-imperfect-indicative-plural":"liofilizam","imperfect-indicative-plural-second-person":"liofilizați","imperfect-indicative-plural-third-person":"liofilizau","first-person-indicative-perfect-singular":"liofilizai","indicative-perfect-second-person-singular":"liofilizași","indicative-perfect-singular-third-person":"liofiliză","first-person-indicative-perfect-plural":"liofilizarăm","indicative-perfect-plural-second-person":"liofilizarăți","indicative-perfect-plural-third-person":"liofilizară","first-person-indicative-pluperfect-singular":"liofilizasem","indicative-pluperfect-second-person-singular":"liofilizaseși","indicative-pluperfect-singular-third-person":"liofilizase","first-person-indicative-pluperfect-plural":"liofilizaserăm","indicative-pluperfect-plural-second-person":"liofilizaserăți","indicative-pluperfect-plural-third-person":"liofilizaseră","first-person-present-singular-subjunctive":"să liofilizez","present-second-person-singular-subjunctive":"să liofilizezi","present-singular-subjunctive-third-person":"să liofilizeze","first-person-plural-present-subjunctive":"să liofilizăm","plural-present-second-person-subjunctive":"să liofilizați","plural-present-subjunctive-third-person":"să liofilizeze","imperative-second-person-singular":"liofilizează","imperative-plural-second-person":"liofilizați","imperative-negative-second-person-singular":"nu liofiliza","imperative-negative-plural-second-person":"nu liofilizați"}},{"word":"liofilizare","pos":"noun","definitions":["lyophilization"],"forms":{"plural":"liofilizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"liofilizare","accusative-definite-nominative-singular":"liofilizarea","accusative-indefinite-nominative-plural":"liofilizări","accusative-definite-nominative-plural":"liofilizările","dative-genitive-indefinite-singular":"liofilizări","dative-definite-genitive-singular":"liofilizării","dative-genitive-indefinite-plural":"liofilizări","dative-definite-genitive-plural":"liofilizărilor","singular-vocative":"liofilizare","plural-vocative":"liofilizărilor"}},{"word":"liofilizator","pos":"noun","definitions":["lyophilizer"],"forms":{"plural":"liofilizatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"liofilizator","accusative-definite-nominative-singular":"liofilizatorul","accusative-indefinite-nominative-plural":"liofilizatoare","accusative-definite-nominative-plural":"liofilizatoarele","dative-genitive-indefinite-singular":"liofilizator","dative-definite-genitive-singular":"liofilizatorului","dative-genitive-indefinite-plural":"liofilizatoare","dative-definite-genitive-plural":"liofilizatoarelor","singular-vocative":"liofilizatorule","plural-vocative":"liofilizatoarelor"}},{"word":"liofob","pos":"adj","definitions":["lyophobic"],"forms":{"feminine-singular":"liofobă","masculine-plural":"liofobi","feminine-neuter-plural":"liofobe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liofob","error-unrecognized-form-feminine-indefinite-singular":"liofobă","error-unrecognized-form-indefinite-masculine-plural":"liofobi","error-unrecognized-form-feminine-indefinite-neuter-plural":"liofobe","definite-error-unrecognized-form-masculine-neuter-singular":"liofobul","definite-error-unrecognized-form-feminine-singular":"liofoba","definite-error-unrecognized-form-masculine-plural":"liofobii","definite-error-unrecognized-form-feminine-neuter-plural":"liofobele"}},{"word":"lionă","pos":"noun","definitions":["lioness"],"forms":{"plural":"lione","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lionă","accusative-definite-nominative-singular":"liona","accusative-indefinite-nominative-plural":"lione","accusative-definite-nominative-plural":"lionele","dative-genitive-indefinite-singular":"lione","dative-definite-genitive-singular":"lionei","dative-genitive-indefinite-plural":"lione","dative-definite-genitive-plural":"lionelor","singular-vocative":"lionă","plural-vocative":"lionelor"}},{"word":"lior","pos":"noun","definitions":["watered-down liquor"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"lior","accusative-definite-nominative":"liorul","dative-genitive-indefinite":"lior","dative-definite-genitive":"liorului","vocative":"liorule"}},{"word":"lioruscă","pos":"noun","definitions":["old man's beard (Clematis vitalba)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lioruscă","accusative-definite-nominative":"liorusca","dative-genitive-indefinite":"liorusce","dative-definite-genitive":"lioruscei","vocative":"lioruscă"}},{"word":"lioșcă","pos":"noun","definitions":["a large spoon"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lioșcă","accusative-definite-nominative":"lioșca","dative-genitive-indefinite":"lioșce","dative-definite-genitive":"lioșcei","vocative":"lioșcă"}},{"word":"Liov","pos":"name","definitions":["Lviv (a city in Ukraine)","Lviv (an oblast in eastern Ukraine)"],"gender":"m"},{"word":"liovean","pos":"adj","definitions":["from or pertaining to Lviv"],"forms":{"feminine-singular":"lioveană","masculine-plural":"lioveni","feminine-neuter-plural":"liovene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liovean","error-unrecognized-form-feminine-indefinite-singular":"lioveană","error-unrecognized-form-indefinite-masculine-plural":"lioveni","error-unrecognized-form-feminine-indefinite-neuter-plural":"liovene","definite-error-unrecognized-form-masculine-neuter-singular":"lioveanul","definite-error-unrecognized-form-feminine-singular":"lioveana","definite-error-unrecognized-form-masculine-plural":"liovenii","definite-error-unrecognized-form-feminine-neuter-plural":"liovenele"}},{"word":"liovean","pos":"noun","definitions":["male inhabitant of Lviv"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"lioveni","accusative-definite-nominative":"liovenii","dative-genitive-indefinite":"lioveni","dative-definite-genitive":"liovenilor","vocative":"liovenilor"}},{"word":"lipa","pos":"intj","definitions":["the sound of an animal (like a cat or a dog) slurping water"]},{"word":"lipăi","pos":"intj","definitions":["obsolete form of lipa"]},{"word":"Lipaia","pos":"name","definitions":["a village in Bistra, Alba County, Romania"],"gender":"f"},{"word":"Lipan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lipan"}},{"word":"lipan","pos":"noun","definitions":["grayling (Thymallus thymallus)"],"forms":{"plural":"lipani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lipan","accusative-definite-nominative-singular":"lipanul","accusative-indefinite-nominative-plural":"lipani","accusative-definite-nominative-plural":"lipanii","dative-genitive-indefinite-singular":"lipan","dative-definite-genitive-singular":"lipanului","dative-genitive-indefinite-plural":"lipani","dative-definite-genitive-plural":"lipanilor","singular-vocative":"lipanule","plural-vocative":"lipanilor"}},{"word":"lipănaș","pos":"noun","definitions":["diminutive of lipan"],"forms":{"plural":"lipănași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lipănaș","accusative-definite-nominative-singular":"lipănașul","accusative-indefinite-nominative-plural":"lipănași","accusative-definite-nominative-plural":"lipănașii","dative-genitive-indefinite-singular":"lipănaș","dative-definite-genitive-singular":"lipănașului","dative-genitive-indefinite-plural":"lipănași","dative-definite-genitive-plural":"lipănașilor","singular-vocative":"lipănașule","plural-vocative":"lipănașilor"}},{"word":"Lipănescu","pos":"name","definitions":["a village in Scutelnici, Buzău County, Romania"],"gender":"m"},{"word":"Lipănești","pos":"name","definitions":["a commune of Prahova County, Romania","a village in Lipănești, Prahova County, Romania"],"gender":"m"},{"word":"Lipanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lipanu"}},{"word":"liparit","pos":"noun","definitions":["rhyolite, liparite"],"forms":{"plural":"liparite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"liparit","accusative-definite-nominative-singular":"liparitul","accusative-indefinite-nominative-plural":"liparite","accusative-definite-nominative-plural":"liparitele","dative-genitive-indefinite-singular":"liparit","dative-definite-genitive-singular":"liparitului","dative-genitive-indefinite-plural":"liparite","dative-definite-genitive-plural":"liparitelor","singular-vocative":"liparitule","plural-vocative":"liparitelor"}},{"word":"Lipatti","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Lipatti"}},{"word":"Lipău","pos":"name","definitions":["a village in Culciu, Satu Mare County, Romania"],"gender":"m"},{"word":"lipază","pos":"noun","definitions":["lipase"],"forms":{"plural":"lipaze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lipază","accusative-definite-nominative-singular":"lipaza","accusative-indefinite-nominative-plural":"lipaze","accusative-definite-nominative-plural":"lipazele","dative-genitive-indefinite-singular":"lipaze","dative-definite-genitive-singular":"lipazei","dative-genitive-indefinite-plural":"lipaze","dative-definite-genitive-plural":"lipazelor","singular-vocative":"lipază","plural-vocative":"lipazelor"}},{"word":"lipcan","pos":"noun","definitions":["courier"],"forms":{"plural":"lipcani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lipcan","accusative-definite-nominative-singular":"lipcanul","accusative-indefinite-nominative-plural":"lipcani","accusative-definite-nominative-plural":"lipcanii","dative-genitive-indefinite-singular":"lipcan","dative-definite-genitive-singular":"lipcanului","dative-genitive-indefinite-plural":"lipcani","dative-definite-genitive-plural":"lipcanilor","singular-vocative":"lipcanule","plural-vocative":"lipcanilor"}},{"word":"Lipcani","pos":"name","definitions":["a town in Briceni Raion, Moldova"],"gender":"m","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"Lipcani","accusative-definite-nominative":"Lipcaniul","dative-genitive-indefinite":"Lipcani","dative-definite-genitive":"Lipcaniului","vocative":"Lipcaniule"}},{"word":"lipeală","pos":"noun","definitions":["sticking, gluing"],"forms":{"plural":"lipeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lipeală","accusative-definite-nominative-singular":"lipeala","accusative-indefinite-nominative-plural":"lipele","accusative-definite-nominative-plural":"lipelele","dative-genitive-indefinite-singular":"lipele","dative-definite-genitive-singular":"lipelei","dative-genitive-indefinite-plural":"lipele","dative-definite-genitive-plural":"lipelelor","singular-vocative":"lipeală","plural-vocative":"lipelelor"}},{"word":"lipemie","pos":"noun","definitions":["lipemia"],"forms":{"plural":"lipemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lipemie","accusative-definite-nominative-singular":"lipemia","accusative-indefinite-nominative-plural":"lipemii","accusative-definite-nominative-plural":"lipemiile","dative-genitive-indefinite-singular":"lipemii","dative-definite-genitive-singular":"lipemiei","dative-genitive-indefinite-plural":"lipemii","dative-definite-genitive-plural":"lipemiilor","singular-vocative":"lipemie","plural-vocative":"lipemiilor"}},{"word":"lipi","pos":"verb","definitions":["to stick, glue","to stick, adhere"],"forms":{"canonical":"a lipi 4th conjugation","present-singular-third-person":"lipește","participle-past":"lipit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lipi","gerund":"lipind","first-person-indicative-present-singular":"lipesc","indicative-present-second-person-singular":"lipești","indicative-present-singular-third-person":"lipește","first-person-indicative-plural-present":"lipim","indicative-plural-present-second-person":"lipiți","indicative-plural-present-third-person":"lipesc","first-person-imperfect-indicative-singular":"lipeam","imperfect-indicative-second-person-singular":"lipeai","imperfect-indicative-singular-third-person":"lipea","first-person-imperfect-indicative-plural":"lipeam","imperfect-indicative-plural-second-person":"lipeați","imperfect-indicative-plural-third-person":"lipeau","first-person-indicative-perfect-singular":"lipii","indicative-perfect-second-person-singular":"lipiși","indicative-perfect-singular-third-person":"lipi","first-person-indicative-perfect-plural":"lipirăm","indicative-perfect-plural-second-person":"lipirăți","indicative-perfect-plural-third-person":"lipiră","first-person-indicative-pluperfect-singular":"lipisem","indicative-pluperfect-second-person-singular":"lipiseși","indicative-pluperfect-singular-third-person":"lipise","first-person-indicative-pluperfect-plural":"lipiserăm","indicative-pluperfect-plural-second-person":"lipiserăți","indicative-pluperfect-plural-third-person":"lipiseră","first-person-present-singular-subjunctive":"să lipesc","present-second-person-singular-subjunctive":"să lipești","present-singular-subjunctive-third-person":"să lipească","first-person-plural-present-subjunctive":"să lipim","plural-present-second-person-subjunctive":"să lipiți","plural-present-subjunctive-third-person":"să lipească","imperative-second-person-singular":"lipește","imperative-plural-second-person":"lipiți","imperative-negative-second-person-singular":"nu lipi","imperative-negative-plural-second-person":"nu lipiți"}},{"word":"Lipia","pos":"name","definitions":["a village in Săpata, Argeș County, Romania","a village in Merei, Buzău County, Romania","a village in Gruiu, Ilfov County, Romania"],"gender":"f"},{"word":"Lipici","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lipici"}},{"word":"lipici","pos":"noun","definitions":["glue"],"forms":{"plural":"lipiciuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lipici","accusative-definite-nominative-singular":"lipiciul","accusative-indefinite-nominative-plural":"lipiciuri","accusative-definite-nominative-plural":"lipiciurile","dative-genitive-indefinite-singular":"lipici","dative-definite-genitive-singular":"lipiciului","dative-genitive-indefinite-plural":"lipiciuri","dative-definite-genitive-plural":"lipiciurilor","singular-vocative":"lipiciule","plural-vocative":"lipiciurilor"}},{"word":"lipicios","pos":"adj","definitions":["sticky, adhesive, gluey, agglutinative","gooey, slimy"],"pronunciation":"/ˌli.piˈt͡ʃʲos/","forms":{"feminine-singular":"lipicioasă","masculine-plural":"lipicioși","feminine-neuter-plural":"lipicioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lipicios","error-unrecognized-form-feminine-indefinite-singular":"lipicioasă","error-unrecognized-form-indefinite-masculine-plural":"lipicioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lipicioase","definite-error-unrecognized-form-masculine-neuter-singular":"lipiciosul","definite-error-unrecognized-form-feminine-singular":"lipicioasa","definite-error-unrecognized-form-masculine-plural":"lipicioșii","definite-error-unrecognized-form-feminine-neuter-plural":"lipicioasele"}},{"word":"lipicioșie","pos":"noun","definitions":["viscosity"],"forms":{"plural":"lipicioșii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lipicioșie","accusative-definite-nominative-singular":"lipicioșia","accusative-indefinite-nominative-plural":"lipicioșii","accusative-definite-nominative-plural":"lipicioșiile","dative-genitive-indefinite-singular":"lipicioșii","dative-definite-genitive-singular":"lipicioșiei","dative-genitive-indefinite-plural":"lipicioșii","dative-definite-genitive-plural":"lipicioșiilor","singular-vocative":"lipicioșie","plural-vocative":"lipicioșiilor"}},{"word":"lipiciozitate","pos":"noun","definitions":["stickiness"],"forms":{"plural":"lipiciozități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lipiciozitate","accusative-definite-nominative-singular":"lipiciozitatea","accusative-indefinite-nominative-plural":"lipiciozități","accusative-definite-nominative-plural":"lipiciozitățile","dative-genitive-indefinite-singular":"lipiciozități","dative-definite-genitive-singular":"lipiciozității","dative-genitive-indefinite-plural":"lipiciozități","dative-definite-genitive-plural":"lipiciozităților","singular-vocative":"lipiciozitate","plural-vocative":"lipiciozităților"}},{"word":"lipiciune","pos":"noun","definitions":["gluing"],"forms":{"plural":"lipiciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lipiciune","accusative-definite-nominative-singular":"lipiciunea","accusative-indefinite-nominative-plural":"lipiciuni","accusative-definite-nominative-plural":"lipiciunile","dative-genitive-indefinite-singular":"lipiciuni","dative-definite-genitive-singular":"lipiciunii","dative-genitive-indefinite-plural":"lipiciuni","dative-definite-genitive-plural":"lipiciunilor","singular-vocative":"lipiciune","plural-vocative":"lipiciunilor"}},{"word":"lipidă","pos":"noun","definitions":["lipid"],"forms":{"plural":"lipide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lipidă","accusative-definite-nominative-singular":"lipida","accusative-indefinite-nominative-plural":"lipide","accusative-definite-nominative-plural":"lipidele","dative-genitive-indefinite-singular":"lipide","dative-definite-genitive-singular":"lipidei","dative-genitive-indefinite-plural":"lipide","dative-definite-genitive-plural":"lipidelor","singular-vocative":"lipidă","plural-vocative":"lipidelor"}},{"word":"lipidemie","pos":"noun","definitions":["lipidemia"],"forms":{"plural":"lipidemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lipidemie","accusative-definite-nominative-singular":"lipidemia","accusative-indefinite-nominative-plural":"lipidemii","accusative-definite-nominative-plural":"lipidemiile","dative-genitive-indefinite-singular":"lipidemii","dative-definite-genitive-singular":"lipidemiei","dative-genitive-indefinite-plural":"lipidemii","dative-definite-genitive-plural":"lipidemiilor","singular-vocative":"lipidemie","plural-vocative":"lipidemiilor"}},{"word":"lipie","pos":"noun","definitions":["a loaf of round wheaten yeast bread, pita"],"forms":{"plural":"lipii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lipie","accusative-definite-nominative-singular":"lipia","accusative-indefinite-nominative-plural":"lipii","accusative-definite-nominative-plural":"lipiile","dative-genitive-indefinite-singular":"lipii","dative-definite-genitive-singular":"lipiei","dative-genitive-indefinite-plural":"lipii","dative-definite-genitive-plural":"lipiilor","singular-vocative":"lipie","plural-vocative":"lipiilor"}},{"word":"lipioară","pos":"noun","definitions":["diminutive of lipie"],"forms":{"plural":"lipioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lipioară","accusative-definite-nominative-singular":"lipioara","accusative-indefinite-nominative-plural":"lipioare","accusative-definite-nominative-plural":"lipioarele","dative-genitive-indefinite-singular":"lipioare","dative-definite-genitive-singular":"lipioarei","dative-genitive-indefinite-plural":"lipioare","dative-definite-genitive-plural":"lipioarelor","singular-vocative":"lipioară","plural-vocative":"lipioarelor"}},{"word":"lipire","pos":"noun","definitions":["pasting"],"forms":{"plural":"lipiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lipire","accusative-definite-nominative-singular":"lipirea","accusative-indefinite-nominative-plural":"lipiri","accusative-definite-nominative-plural":"lipirile","dative-genitive-indefinite-singular":"lipiri","dative-definite-genitive-singular":"lipirii","dative-genitive-indefinite-plural":"lipiri","dative-definite-genitive-plural":"lipirilor","singular-vocative":"lipire","plural-vocative":"lipirilor"}},{"word":"lipiștoacă","pos":"noun","definitions":["leech"],"forms":{"plural":"lipiștoace","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lipiștoacă","accusative-definite-nominative-singular":"lipiștoaca","accusative-indefinite-nominative-plural":"lipiștoace","accusative-definite-nominative-plural":"lipiștoacele","dative-genitive-indefinite-singular":"lipiștoace","dative-definite-genitive-singular":"lipiștoacei","dative-genitive-indefinite-plural":"lipiștoace","dative-definite-genitive-plural":"lipiștoacelor","singular-vocative":"lipiștoacă","plural-vocative":"lipiștoacelor"}},{"word":"lipit","pos":"noun","definitions":["sticking, gluing/glueing, adhering"],"pronunciation":"/liˈpit/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lipit","accusative-definite-nominative":"lipitul","dative-genitive-indefinite":"lipit","dative-definite-genitive":"lipitului","vocative":"lipitule"}},{"word":"lipit","pos":"adj","definitions":["glued, united, joined","stuck together, shut (of eyelids)","very close, tied to somebody"],"pronunciation":"/liˈpit/","forms":{"feminine-singular":"lipită","masculine-plural":"lipiți","feminine-neuter-plural":"lipite","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"lipit","error-unrecognized-form-feminine-indefinite-singular":"lipită","error-unrecognized-form-indefinite-masculine-plural":"lipiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lipite","definite-error-unrecognized-form-masculine-neuter-singular":"lipitul","definite-error-unrecognized-form-feminine-singular":"lipita","definite-error-unrecognized-form-masculine-plural":"lipiții","definite-error-unrecognized-form-feminine-neuter-plural":"lipitele"}},{"word":"lipit","pos":"verb","definitions":["past participle of lipi"],"pronunciation":"/liˈpit/"},{"word":"lipițan","pos":"noun","definitions":["Lipizzan (horse breed)"],"forms":{"plural":"lipițani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lipițan","accusative-definite-nominative-singular":"lipițanul","accusative-indefinite-nominative-plural":"lipițani","accusative-definite-nominative-plural":"lipițanii","dative-genitive-indefinite-singular":"lipițan","dative-definite-genitive-singular":"lipițanului","dative-genitive-indefinite-plural":"lipițani","dative-definite-genitive-plural":"lipițanilor","singular-vocative":"lipițanule","plural-vocative":"lipițanilor"}},{"word":"lipitoare","pos":"noun","definitions":["leech"],"forms":{"plural":"lipitori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lipitoare","accusative-definite-nominative-singular":"lipitoarea","accusative-indefinite-nominative-plural":"lipitori","accusative-definite-nominative-plural":"lipitorile","dative-genitive-indefinite-singular":"lipitori","dative-definite-genitive-singular":"lipitorii","dative-genitive-indefinite-plural":"lipitori","dative-definite-genitive-plural":"lipitorilor","singular-vocative":"lipitoare","plural-vocative":"lipitorilor"}},{"word":"lipitor","pos":"noun","definitions":["gluer"],"forms":{"plural":"lipitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lipitor","accusative-definite-nominative-singular":"lipitorul","accusative-indefinite-nominative-plural":"lipitori","accusative-definite-nominative-plural":"lipitorii","dative-genitive-indefinite-singular":"lipitor","dative-definite-genitive-singular":"lipitorului","dative-genitive-indefinite-plural":"lipitori","dative-definite-genitive-plural":"lipitorilor","singular-vocative":"lipitorule","plural-vocative":"lipitorilor"}},{"word":"lipitură","pos":"noun","definitions":["splice"],"forms":{"plural":"lipituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lipitură","accusative-definite-nominative-singular":"lipitura","accusative-indefinite-nominative-plural":"lipituri","accusative-definite-nominative-plural":"lipiturile","dative-genitive-indefinite-singular":"lipituri","dative-definite-genitive-singular":"lipiturii","dative-genitive-indefinite-plural":"lipituri","dative-definite-genitive-plural":"lipiturilor","singular-vocative":"lipitură","plural-vocative":"lipiturilor"}},{"word":"lipiuță","pos":"noun","definitions":["diminutive of lipie"],"forms":{"plural":"lipiuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lipiuță","accusative-definite-nominative-singular":"lipiuța","accusative-indefinite-nominative-plural":"lipiuțe","accusative-definite-nominative-plural":"lipiuțele","dative-genitive-indefinite-singular":"lipiuțe","dative-definite-genitive-singular":"lipiuței","dative-genitive-indefinite-plural":"lipiuțe","dative-definite-genitive-plural":"lipiuțelor","singular-vocative":"lipiuță","plural-vocative":"lipiuțelor"}},{"word":"Lipnic","pos":"name","definitions":["a village in Lipnic, Ocnița Raion, Moldova","a commune of Ocnița Raion, Moldova"],"gender":"m"},{"word":"Lipnița","pos":"name","definitions":["a commune of Constanța County, Romania","a village in Lipnița, Constanța County, Romania"],"gender":"f"},{"word":"lipoblast","pos":"noun","definitions":["lipoblast"],"forms":{"plural":"lipoblaste","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lipoblast","accusative-definite-nominative-singular":"lipoblastul","accusative-indefinite-nominative-plural":"lipoblaste","accusative-definite-nominative-plural":"lipoblastele","dative-genitive-indefinite-singular":"lipoblast","dative-definite-genitive-singular":"lipoblastului","dative-genitive-indefinite-plural":"lipoblaste","dative-definite-genitive-plural":"lipoblastelor","singular-vocative":"lipoblastule","plural-vocative":"lipoblastelor"}},{"word":"lipocrom","pos":"noun","definitions":["lipochrome"],"forms":{"plural":"lipocromi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lipocrom","accusative-definite-nominative-singular":"lipocromul","accusative-indefinite-nominative-plural":"lipocromi","accusative-definite-nominative-plural":"lipocromii","dative-genitive-indefinite-singular":"lipocrom","dative-definite-genitive-singular":"lipocromului","dative-genitive-indefinite-plural":"lipocromi","dative-definite-genitive-plural":"lipocromilor","singular-vocative":"lipocromule","plural-vocative":"lipocromilor"}},{"word":"lipodistrofie","pos":"noun","definitions":["lipodystrophy"],"forms":{"plural":"lipodistrofii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lipodistrofie","accusative-definite-nominative-singular":"lipodistrofia","accusative-indefinite-nominative-plural":"lipodistrofii","accusative-definite-nominative-plural":"lipodistrofiile","dative-genitive-indefinite-singular":"lipodistrofii","dative-definite-genitive-singular":"lipodistrofiei","dative-genitive-indefinite-plural":"lipodistrofii","dative-definite-genitive-plural":"lipodistrofiilor","singular-vocative":"lipodistrofie","plural-vocative":"lipodistrofiilor"}},{"word":"lipofibrom","pos":"noun","definitions":["lipofibroma"],"forms":{"plural":"lipofibroame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lipofibrom","accusative-definite-nominative-singular":"lipofibromul","accusative-indefinite-nominative-plural":"lipofibroame","accusative-definite-nominative-plural":"lipofibroamele","dative-genitive-indefinite-singular":"lipofibrom","dative-definite-genitive-singular":"lipofibromului","dative-genitive-indefinite-plural":"lipofibroame","dative-definite-genitive-plural":"lipofibroamelor","singular-vocative":"lipofibromule","plural-vocative":"lipofibroamelor"}},{"word":"lipoid","pos":"adj","definitions":["lipoidal"],"forms":{"feminine-singular":"lipoidă","masculine-plural":"lipoizi","feminine-neuter-plural":"lipoide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lipoid","error-unrecognized-form-feminine-indefinite-singular":"lipoidă","error-unrecognized-form-indefinite-masculine-plural":"lipoizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lipoide","definite-error-unrecognized-form-masculine-neuter-singular":"lipoidul","definite-error-unrecognized-form-feminine-singular":"lipoida","definite-error-unrecognized-form-masculine-plural":"lipoizii","definite-error-unrecognized-form-feminine-neuter-plural":"lipoidele"}},{"word":"lipoid","pos":"noun","definitions":["lipoid"],"forms":{"plural":"lipoizi"}},{"word":"lipoidă","pos":"noun","definitions":["lipoid"],"forms":{"plural":"lipoide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lipoidă","accusative-definite-nominative-singular":"lipoida","accusative-indefinite-nominative-plural":"lipoide","accusative-definite-nominative-plural":"lipoidele","dative-genitive-indefinite-singular":"lipoide","dative-definite-genitive-singular":"lipoidei","dative-genitive-indefinite-plural":"lipoide","dative-definite-genitive-plural":"lipoidelor","singular-vocative":"lipoidă","plural-vocative":"lipoidelor"}},{"word":"lipoidoză","pos":"noun","definitions":["lipoidosis"],"forms":{"plural":"lipoidoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lipoidoză","accusative-definite-nominative-singular":"lipoidoza","accusative-indefinite-nominative-plural":"lipoidoze","accusative-definite-nominative-plural":"lipoidozele","dative-genitive-indefinite-singular":"lipoidoze","dative-definite-genitive-singular":"lipoidozei","dative-genitive-indefinite-plural":"lipoidoze","dative-definite-genitive-plural":"lipoidozelor","singular-vocative":"lipoidoză","plural-vocative":"lipoidozelor"}},{"word":"lipoliză","pos":"noun","definitions":["lipolysis"],"forms":{"plural":"lipolize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lipoliză","accusative-definite-nominative-singular":"lipoliza","accusative-indefinite-nominative-plural":"lipolize","accusative-definite-nominative-plural":"lipolizele","dative-genitive-indefinite-singular":"lipolize","dative-definite-genitive-singular":"lipolizei","dative-genitive-indefinite-plural":"lipolize","dative-definite-genitive-plural":"lipolizelor","singular-vocative":"lipoliză","plural-vocative":"lipolizelor"}},{"word":"lipom","pos":"noun","definitions":["lipoma"],"forms":{"plural":"lipomuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lipom","accusative-definite-nominative-singular":"lipomul","accusative-indefinite-nominative-plural":"lipomuri","accusative-definite-nominative-plural":"lipomurile","dative-genitive-indefinite-singular":"lipom","dative-definite-genitive-singular":"lipomului","dative-genitive-indefinite-plural":"lipomuri","dative-definite-genitive-plural":"lipomurilor","singular-vocative":"lipomule","plural-vocative":"lipomurilor"}},{"word":"lipomatoză","pos":"noun","definitions":["lipomatosis"],"forms":{"plural":"lipomatoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lipomatoză","accusative-definite-nominative-singular":"lipomatoza","accusative-indefinite-nominative-plural":"lipomatoze","accusative-definite-nominative-plural":"lipomatozele","dative-genitive-indefinite-singular":"lipomatoze","dative-definite-genitive-singular":"lipomatozei","dative-genitive-indefinite-plural":"lipomatoze","dative-definite-genitive-plural":"lipomatozelor","singular-vocative":"lipomatoză","plural-vocative":"lipomatozelor"}},{"word":"lipon","pos":"adv","definitions":["therefore"]},{"word":"lipoproteină","pos":"noun","definitions":["lipoprotein"],"forms":{"plural":"lipoproteine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lipoproteină","accusative-definite-nominative-singular":"lipoproteina","accusative-indefinite-nominative-plural":"lipoproteine","accusative-definite-nominative-plural":"lipoproteinele","dative-genitive-indefinite-singular":"lipoproteine","dative-definite-genitive-singular":"lipoproteinei","dative-genitive-indefinite-plural":"lipoproteine","dative-definite-genitive-plural":"lipoproteinelor","singular-vocative":"lipoproteină","plural-vocative":"lipoproteinelor"}},{"word":"liposarcom","pos":"noun","definitions":["liposarcoma"],"forms":{"plural":"liposarcomuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"liposarcom","accusative-definite-nominative-singular":"liposarcomul","accusative-indefinite-nominative-plural":"liposarcomuri","accusative-definite-nominative-plural":"liposarcomurile","dative-genitive-indefinite-singular":"liposarcom","dative-definite-genitive-singular":"liposarcomului","dative-genitive-indefinite-plural":"liposarcomuri","dative-definite-genitive-plural":"liposarcomurilor","singular-vocative":"liposarcomule","plural-vocative":"liposarcomurilor"}},{"word":"liposcleroză","pos":"noun","definitions":["liposclerosis"],"forms":{"plural":"liposcleroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"liposcleroză","accusative-definite-nominative-singular":"liposcleroza","accusative-indefinite-nominative-plural":"liposcleroze","accusative-definite-nominative-plural":"liposclerozele","dative-genitive-indefinite-singular":"liposcleroze","dative-definite-genitive-singular":"liposclerozei","dative-genitive-indefinite-plural":"liposcleroze","dative-definite-genitive-plural":"liposclerozelor","singular-vocative":"liposcleroză","plural-vocative":"liposclerozelor"}},{"word":"liposolubil","pos":"adj","definitions":["fat soluble"],"forms":{"feminine-singular":"liposolubilă","masculine-plural":"liposolubili","feminine-neuter-plural":"liposolubile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liposolubil","error-unrecognized-form-feminine-indefinite-singular":"liposolubilă","error-unrecognized-form-indefinite-masculine-plural":"liposolubili","error-unrecognized-form-feminine-indefinite-neuter-plural":"liposolubile","definite-error-unrecognized-form-masculine-neuter-singular":"liposolubilul","definite-error-unrecognized-form-feminine-singular":"liposolubila","definite-error-unrecognized-form-masculine-plural":"liposolubilii","definite-error-unrecognized-form-feminine-neuter-plural":"liposolubilele"}},{"word":"lipotimie","pos":"noun","definitions":["lipothymia"],"forms":{"plural":"lipotimii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lipotimie","accusative-definite-nominative-singular":"lipotimia","accusative-indefinite-nominative-plural":"lipotimii","accusative-definite-nominative-plural":"lipotimiile","dative-genitive-indefinite-singular":"lipotimii","dative-definite-genitive-singular":"lipotimiei","dative-genitive-indefinite-plural":"lipotimii","dative-definite-genitive-plural":"lipotimiilor","singular-vocative":"lipotimie","plural-vocative":"lipotimiilor"}},{"word":"lipotrop","pos":"adj","definitions":["lipotropic"],"forms":{"feminine-singular":"lipotropă","masculine-plural":"lipotropi","feminine-neuter-plural":"lipotrope","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lipotrop","error-unrecognized-form-feminine-indefinite-singular":"lipotropă","error-unrecognized-form-indefinite-masculine-plural":"lipotropi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lipotrope","definite-error-unrecognized-form-masculine-neuter-singular":"lipotropul","definite-error-unrecognized-form-feminine-singular":"lipotropa","definite-error-unrecognized-form-masculine-plural":"lipotropii","definite-error-unrecognized-form-feminine-neuter-plural":"lipotropele"}},{"word":"lipotropie","pos":"noun","definitions":["lipotropy"],"forms":{"plural":"lipotropii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lipotropie","accusative-definite-nominative-singular":"lipotropia","accusative-indefinite-nominative-plural":"lipotropii","accusative-definite-nominative-plural":"lipotropiile","dative-genitive-indefinite-singular":"lipotropii","dative-definite-genitive-singular":"lipotropiei","dative-genitive-indefinite-plural":"lipotropii","dative-definite-genitive-plural":"lipotropiilor","singular-vocative":"lipotropie","plural-vocative":"lipotropiilor"}},{"word":"Lipova","pos":"name","definitions":["a city in Arad County, Romania","a commune of Bacău County, Romania","a village in Lipova, Bacău County, Romania"],"gender":"f"},{"word":"Lipovan","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Lipovan"}},{"word":"Lipovanca","pos":"name","definitions":["a village in Bilicenii Noi, Sîngerei Raion, Moldova"],"gender":"f"},{"word":"Lipovanu","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Lipovanu"}},{"word":"Lipovăț","pos":"name","definitions":["a commune of Vaslui County, Romania","a village in Lipovăț, Vaslui County, Romania"],"gender":"m"},{"word":"lipovean","pos":"noun","definitions":["Lipovan"],"forms":{"plural":"lipoveni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lipovean","accusative-definite-nominative-singular":"lipoveanul","accusative-indefinite-nominative-plural":"lipoveni","accusative-definite-nominative-plural":"lipovenii","dative-genitive-indefinite-singular":"lipovean","dative-definite-genitive-singular":"lipoveanului","dative-genitive-indefinite-plural":"lipoveni","dative-definite-genitive-plural":"lipovenilor","singular-vocative":"lipoveanule","plural-vocative":"lipovenilor"}},{"word":"lipoveană","pos":"noun","definitions":["female equivalent of lipovean"],"forms":{"plural":"lipovene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lipoveană","accusative-definite-nominative-singular":"lipoveana","accusative-indefinite-nominative-plural":"lipovene","accusative-definite-nominative-plural":"lipovenele","dative-genitive-indefinite-singular":"lipovene","dative-definite-genitive-singular":"lipovenei","dative-genitive-indefinite-plural":"lipovene","dative-definite-genitive-plural":"lipovenelor","singular-vocative":"lipoveană","plural-vocative":"lipovenelor"}},{"word":"lipoveancă","pos":"noun","definitions":["female equivalent of lipovean"],"forms":{"plural":"lipovence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lipoveancă","accusative-definite-nominative-singular":"lipoveanca","accusative-indefinite-nominative-plural":"lipovence","accusative-definite-nominative-plural":"lipovencele","dative-genitive-indefinite-singular":"lipovence","dative-definite-genitive-singular":"lipovencei","dative-genitive-indefinite-plural":"lipovence","dative-definite-genitive-plural":"lipovencelor","singular-vocative":"lipoveancă","plural-vocative":"lipovencelor"}},{"word":"Lipoveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lipoveanu"}},{"word":"lipovencuță","pos":"noun","definitions":["diminutive of lipoveancă"],"forms":{"plural":"lipovencuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lipovencuță","accusative-definite-nominative-singular":"lipovencuța","accusative-indefinite-nominative-plural":"lipovencuțe","accusative-definite-nominative-plural":"lipovencuțele","dative-genitive-indefinite-singular":"lipovencuțe","dative-definite-genitive-singular":"lipovencuței","dative-genitive-indefinite-plural":"lipovencuțe","dative-definite-genitive-plural":"lipovencuțelor","singular-vocative":"lipovencuță","plural-vocative":"lipovencuțelor"}},{"word":"lipovenesc","pos":"adj","definitions":["Lipovan (about things)"],"forms":{"feminine-singular":"lipovenească","plural":"lipovenești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lipovenesc","error-unrecognized-form-feminine-indefinite-singular":"lipovenească","error-unrecognized-form-indefinite-masculine-plural":"lipovenești","error-unrecognized-form-feminine-indefinite-neuter-plural":"lipovenești","definite-error-unrecognized-form-masculine-neuter-singular":"lipovenescul","definite-error-unrecognized-form-feminine-singular":"lipoveneasca","definite-error-unrecognized-form-masculine-plural":"lipoveneștii","definite-error-unrecognized-form-feminine-neuter-plural":"lipoveneștile"}},{"word":"lipovenește","pos":"adv","definitions":["like a Lipovan"]},{"word":"Lipoveni","pos":"name","definitions":["a village in Mitocu Dragomirnei, Suceava County, Romania"],"gender":"m"},{"word":"lipovenime","pos":"noun","definitions":["Lipovans (collectively)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"lipovenime","accusative-definite-nominative":"lipovenimea","dative-genitive-indefinite":"lipovenimi","dative-definite-genitive":"lipovenimii","vocative":"lipovenime"}},{"word":"Lipoviceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lipoviceanu"}},{"word":"Lipovu","pos":"name","definitions":["a commune of Dolj County, Romania","a village in Lipovu, Dolj County, Romania"],"gender":"m"},{"word":"Lipovu de Sus","pos":"name","definitions":["a village in Lipovu, Dolj County, Romania"],"gender":"m"},{"word":"lipsă","pos":"noun","definitions":["absence","lack, want, deficiency"],"pronunciation":"/ˈlip.sə/","examples":[{"ro":"el are o lipsă de apă","en":"he is in want of water"}],"forms":{"plural":"lipsuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"lipsă","accusative-definite-nominative-singular":"lipsa","accusative-indefinite-nominative-plural":"lipsuri","accusative-definite-nominative-plural":"lipsurile","dative-genitive-indefinite-singular":"lipsuri","dative-definite-genitive-singular":"lipsurii","dative-genitive-indefinite-plural":"lipsuri","dative-definite-genitive-plural":"lipsurilor","singular-vocative":"-","plural-vocative":"-","alternative":"липсэ"}},{"word":"Lipsca","pos":"name","definitions":["Leipzig (a city in Saxony, Germany)"],"gender":"f"},{"word":"lipscan","pos":"noun","definitions":["merchant selling wares from Leipzig"],"forms":{"plural":"lipscani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lipscan","accusative-definite-nominative-singular":"lipscanul","accusative-indefinite-nominative-plural":"lipscani","accusative-definite-nominative-plural":"lipscanii","dative-genitive-indefinite-singular":"lipscan","dative-definite-genitive-singular":"lipscanului","dative-genitive-indefinite-plural":"lipscani","dative-definite-genitive-plural":"lipscanilor","singular-vocative":"lipscanule","plural-vocative":"lipscanilor"}},{"word":"lipscănie","pos":"noun","definitions":["a shop selling wares from Leipzig"],"forms":{"plural":"lipscănii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lipscănie","accusative-definite-nominative-singular":"lipscănia","accusative-indefinite-nominative-plural":"lipscănii","accusative-definite-nominative-plural":"lipscăniile","dative-genitive-indefinite-singular":"lipscănii","dative-definite-genitive-singular":"lipscăniei","dative-genitive-indefinite-plural":"lipscănii","dative-definite-genitive-plural":"lipscăniilor","singular-vocative":"lipscănie","plural-vocative":"lipscăniilor"}},{"word":"lipsea","pos":"verb","definitions":["third-person singular imperfect indicative of lipsi"],"pronunciation":"[lipˈse̯a]"},{"word":"lipseai","pos":"verb","definitions":["second-person singular imperfect indicative of lipsi"],"pronunciation":"[lipˈse̯aj]"},{"word":"lipseam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of lipsi"],"pronunciation":"[lipˈse̯am]"},{"word":"lipsească","pos":"verb","definitions":["third-person singular/plural present subjunctive of lipsi"],"pronunciation":"[lipˈse̯askə]"},{"word":"lipseați","pos":"verb","definitions":["second-person plural imperfect indicative of lipsi"],"pronunciation":"[lipˈse̯atsʲ]"},{"word":"lipseau","pos":"verb","definitions":["third-person plural imperfect indicative of lipsi"],"pronunciation":"[lipˈse̯aw]"},{"word":"lipsesc","pos":"verb","definitions":["inflection of lipsi:","first-person singular present indicative/subjunctive","third-person plural present indicative"],"pronunciation":"[lipˈsesk]"},{"word":"lipsește","pos":"verb","definitions":["inflection of lipsi:","third-person singular present indicative","second-person singular imperative"],"pronunciation":"[lipˈseʃte]"},{"word":"lipsești","pos":"verb","definitions":["second-person singular present indicative/subjunctive of lipsi"],"pronunciation":"[lipˈseʃtʲ]"},{"word":"lipsi","pos":"verb","definitions":["to deprive (someone of)","to be absent, to be missing, to lack","to give (something) up, to go without"],"pronunciation":"/lipˈsi/","examples":[{"ro":"Doar mă lipsesc de el.","en":"I'll just go without it."}],"forms":{"canonical":"a lipsi 4th conjugation","present-singular-third-person":"lipsește","participle-past":"lipsit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lipsi","gerund":"lipsind","first-person-indicative-present-singular":"lipsesc","indicative-present-second-person-singular":"lipsești","indicative-present-singular-third-person":"lipsește","first-person-indicative-plural-present":"lipsim","indicative-plural-present-second-person":"lipsiți","indicative-plural-present-third-person":"lipsesc","first-person-imperfect-indicative-singular":"lipseam","imperfect-indicative-second-person-singular":"lipseai","imperfect-indicative-singular-third-person":"lipsea","first-person-imperfect-indicative-plural":"lipseam","imperfect-indicative-plural-second-person":"lipseați","imperfect-indicative-plural-third-person":"lipseau","first-person-indicative-perfect-singular":"lipsii","indicative-perfect-second-person-singular":"lipsiși","indicative-perfect-singular-third-person":"lipsi","first-person-indicative-perfect-plural":"lipsirăm","indicative-perfect-plural-second-person":"lipsirăți","indicative-perfect-plural-third-person":"lipsiră","first-person-indicative-pluperfect-singular":"lipsisem","indicative-pluperfect-second-person-singular":"lipsiseși","indicative-pluperfect-singular-third-person":"lipsise","first-person-indicative-pluperfect-plural":"lipsiserăm","indicative-pluperfect-plural-second-person":"lipsiserăți","indicative-pluperfect-plural-third-person":"lipsiseră","first-person-present-singular-subjunctive":"să lipsesc","present-second-person-singular-subjunctive":"să lipsești","present-singular-subjunctive-third-person":"să lipsească","first-person-plural-present-subjunctive":"să lipsim","plural-present-second-person-subjunctive":"să lipsiți","plural-present-subjunctive-third-person":"să lipsească","imperative-second-person-singular":"lipsește","imperative-plural-second-person":"lipsiți","imperative-negative-second-person-singular":"nu lipsi","imperative-negative-plural-second-person":"nu lipsiți","alternative":"липси"}},{"word":"lipsii","pos":"verb","definitions":["first-person singular simple perfect indicative of lipsi"],"pronunciation":"[lipˈsiː]","forms":{"canonical":"lipsíi"}},{"word":"lipsim","pos":"verb","definitions":["first-person plural present indicative/subjunctive of lipsi"],"pronunciation":"[lipˈsim]","forms":{"canonical":"lipsím"}},{"word":"lipsiră","pos":"verb","definitions":["third-person plural simple perfect indicative of lipsi"],"pronunciation":"[lipˈsirə]","forms":{"canonical":"lipsíră"}},{"word":"lipsirăm","pos":"verb","definitions":["first-person plural simple perfect indicative of lipsi"],"pronunciation":"[lipˈsirəm]","forms":{"canonical":"lipsírăm"}},{"word":"lipsirăți","pos":"verb","definitions":["second-person plural simple perfect indicative of lipsi"],"pronunciation":"[lipˈsirətsʲ]","forms":{"canonical":"lipsírăți"}},{"word":"lipsire","pos":"noun","definitions":["deprivation"],"forms":{"plural":"lipsiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lipsire","accusative-definite-nominative-singular":"lipsirea","accusative-indefinite-nominative-plural":"lipsiri","accusative-definite-nominative-plural":"lipsirile","dative-genitive-indefinite-singular":"lipsiri","dative-definite-genitive-singular":"lipsirii","dative-genitive-indefinite-plural":"lipsiri","dative-definite-genitive-plural":"lipsirilor","singular-vocative":"lipsire","plural-vocative":"lipsirilor"}},{"word":"lipsise","pos":"verb","definitions":["third-person singular pluperfect indicative of lipsi"],"pronunciation":"[lipˈsise]","forms":{"canonical":"lipsíse"}},{"word":"lipsisem","pos":"verb","definitions":["first-person singular pluperfect indicative of lipsi"],"pronunciation":"[lipˈsisem]","forms":{"canonical":"lipsísem"}},{"word":"lipsiseră","pos":"verb","definitions":["third-person plural pluperfect indicative of lipsi"],"pronunciation":"[lipˈsiserə]","forms":{"canonical":"lipsíseră"}},{"word":"lipsiserăm","pos":"verb","definitions":["first-person plural pluperfect indicative of lipsi"],"pronunciation":"[lipˈsiserəm]","forms":{"canonical":"lipsíserăm"}},{"word":"lipsiserăți","pos":"verb","definitions":["second-person plural pluperfect indicative of lipsi"],"pronunciation":"[lipˈsiserətsʲ]","forms":{"canonical":"lipsíserăți"}},{"word":"lipsiseși","pos":"verb","definitions":["second-person singular pluperfect indicative of lipsi"],"pronunciation":"[lipˈsiseʃʲ]","forms":{"canonical":"lipsíseși"}},{"word":"lipsiși","pos":"verb","definitions":["second-person singular simple perfect indicative of lipsi"],"pronunciation":"[lipˈsiʃʲ]","forms":{"canonical":"lipsíși"}},{"word":"lipsit","pos":"adj","definitions":["missing, lacking"],"pronunciation":"[lipˈsit]","forms":{"feminine-singular":"lipsită","masculine-plural":"lipsiți","feminine-neuter-plural":"lipsite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lipsit","error-unrecognized-form-feminine-indefinite-singular":"lipsită","error-unrecognized-form-indefinite-masculine-plural":"lipsiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lipsite","definite-error-unrecognized-form-masculine-neuter-singular":"lipsitul","definite-error-unrecognized-form-feminine-singular":"lipsita","definite-error-unrecognized-form-masculine-plural":"lipsiții","definite-error-unrecognized-form-feminine-neuter-plural":"lipsitele"}},{"word":"lipsit","pos":"verb","definitions":["past participle of lipsi"],"pronunciation":"[lipˈsit]","forms":{"participle-past":"of lipsi"}},{"word":"lipsita","pos":"adj","definitions":["definite nominative/accusative feminine singular of lipsit"],"pronunciation":"[lipˈsita]"},{"word":"lipsită","pos":"adj","definitions":["feminine singular of lipsit"],"pronunciation":"[lipˈsitə]"},{"word":"lipsite","pos":"adj","definitions":["feminine/neuter plural of lipsit"],"pronunciation":"[lipˈsite]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"lipsíte"}},{"word":"lipsitei","pos":"adj","definitions":["definite genitive/dative feminine singular of lipsit"],"pronunciation":"[lipˈsitej]"},{"word":"lipsitele","pos":"adj","definitions":["definite nominative/accusative feminine/neuter plural of lipsit"],"pronunciation":"[lipˈsitele]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"lipsítele"}},{"word":"lipsitelor","pos":"adj","definitions":["definite genitive/dative feminine/neuter plural of lipsit"],"pronunciation":"[lipˈsitelor]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"lipsítelor"}},{"word":"lipsiți","pos":"adj","definitions":["masculine plural of lipsit"],"pronunciation":"[lipˈsit͡sʲ]","forms":{"canonical":"lipsíți"}},{"word":"lipsiți","pos":"verb","definitions":["inflection of lipsi:","second-person plural present indicative/subjunctive","second-person plural imperative"],"pronunciation":"[lipˈsit͡sʲ]","forms":{"canonical":"lipsíți"}},{"word":"lipsiții","pos":"adj","definitions":["definite nominative/accusative masculine plural of lipsit"],"pronunciation":"[lipˈsit͡siː]","gender":"m-p","forms":{"canonical-masculine-plural":"lipsíții"}},{"word":"lipsiților","pos":"adj","definitions":["definite genitive/dative masculine plural of lipsit"],"pronunciation":"[lipˈsit͡silor]","gender":"m-p","forms":{"canonical-masculine-plural":"lipsíților"}},{"word":"lipsitul","pos":"adj","definitions":["definite nominative/accusative masculine/neuter singular of lipsit"],"pronunciation":"[lipˈsitul]","gender":"m","forms":{"canonical-masculine-neuter":"lipsítul"}},{"word":"lipsitului","pos":"adj","definitions":["definite genitive/dative masculine/neuter singular of lipsit"],"pronunciation":"[lipˈsituluj]","gender":"m","forms":{"canonical-masculine-neuter":"lipsítului"}},{"word":"lipurie","pos":"noun","definitions":["lipuria"],"forms":{"plural":"lipurii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lipurie","accusative-definite-nominative-singular":"lipuria","accusative-indefinite-nominative-plural":"lipurii","accusative-definite-nominative-plural":"lipuriile","dative-genitive-indefinite-singular":"lipurii","dative-definite-genitive-singular":"lipuriei","dative-genitive-indefinite-plural":"lipurii","dative-definite-genitive-plural":"lipuriilor","singular-vocative":"lipurie","plural-vocative":"lipuriilor"}},{"word":"liqueur","pos":"noun","definitions":["obsolete form of lichior"],"forms":{"plural":"liqueururi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"liqueur","accusative-definite-nominative-singular":"liqueurul","accusative-indefinite-nominative-plural":"liqueururi","accusative-definite-nominative-plural":"liqueururile","dative-genitive-indefinite-singular":"liqueur","dative-definite-genitive-singular":"liqueurului","dative-genitive-indefinite-plural":"liqueururi","dative-definite-genitive-plural":"liqueururilor","singular-vocative":"liqueurule","plural-vocative":"liqueururilor"}},{"word":"liră","pos":"noun","definitions":["pound (currency)","lyre"],"forms":{"plural":"lire","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"liră","accusative-definite-nominative-singular":"lira","accusative-indefinite-nominative-plural":"lire","accusative-definite-nominative-plural":"lirele","dative-genitive-indefinite-singular":"lire","dative-definite-genitive-singular":"lirei","dative-genitive-indefinite-plural":"lire","dative-definite-genitive-plural":"lirelor","singular-vocative":"liră","plural-vocative":"lirelor"}},{"word":"liră sterlină","pos":"noun","definitions":["pound sterling"],"forms":{"plural":"lire sterline"}},{"word":"liric","pos":"adj","definitions":["lyrical"],"forms":{"feminine-singular":"lirică","masculine-plural":"lirici","feminine-neuter-plural":"lirice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liric","error-unrecognized-form-feminine-indefinite-singular":"lirică","error-unrecognized-form-indefinite-masculine-plural":"lirici","error-unrecognized-form-feminine-indefinite-neuter-plural":"lirice","definite-error-unrecognized-form-masculine-neuter-singular":"liricul","definite-error-unrecognized-form-feminine-singular":"lirica","definite-error-unrecognized-form-masculine-plural":"liricii","definite-error-unrecognized-form-feminine-neuter-plural":"liricele"}},{"word":"lirică","pos":"noun","definitions":["lyric poetry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lirică","accusative-definite-nominative-singular":"lirica","accusative-indefinite-nominative-plural":"lirice","accusative-definite-nominative-plural":"liricele","dative-genitive-indefinite-singular":"lirice","dative-definite-genitive-singular":"liricei","dative-genitive-indefinite-plural":"lirice","dative-definite-genitive-plural":"liricelor","singular-vocative":"lirică","plural-vocative":"liricelor"}},{"word":"liricesc","pos":"adj","definitions":["lyrical"],"forms":{"feminine-singular":"liricească","plural":"liricești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liricesc","error-unrecognized-form-feminine-indefinite-singular":"liricească","error-unrecognized-form-indefinite-masculine-plural":"liricești","error-unrecognized-form-feminine-indefinite-neuter-plural":"liricești","definite-error-unrecognized-form-masculine-neuter-singular":"liricescul","definite-error-unrecognized-form-feminine-singular":"liriceasca","definite-error-unrecognized-form-masculine-plural":"liriceștii","definite-error-unrecognized-form-feminine-neuter-plural":"liriceștile"}},{"word":"liriciza","pos":"verb","definitions":["to lyricize"],"forms":{"canonical":"a liriciza 1st conjugation","present-singular-third-person":"liricizează","participle-past":"liricizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a liriciza","gerund":"liricizând","first-person-indicative-present-singular":"liricizez","indicative-present-second-person-singular":"liricizezi","indicative-present-singular-third-person":"liricizează","first-person-indicative-plural-present":"liricizăm","indicative-plural-present-second-person":"liricizați","indicative-plural-present-third-person":"liricizează","first-person-imperfect-indicative-singular":"liricizam","imperfect-indicative-second-person-singular":"liricizai","imperfect-indicative-singular-third-person":"liriciza","first-person-imperfect-indicative-plural":"liricizam","imperfect-indicative-plural-second-person":"liricizați","imperfect-indicative-plural-third-person":"liricizau","first-person-indicative-perfect-singular":"liricizai","indicative-perfect-second-person-singular":"liricizași","indicative-perfect-singular-third-person":"liriciză","first-person-indicative-perfect-plural":"liricizarăm","indicative-perfect-plural-second-person":"liricizarăți","indicative-perfect-plural-third-person":"liricizară","first-person-indicative-pluperfect-singular":"liricizasem","indicative-pluperfect-second-person-singular":"liricizaseși","indicative-pluperfect-singular-third-person":"liricizase","first-person-indicative-pluperfect-plural":"liricizaserăm","indicative-pluperfect-plural-second-person":"liricizaserăți","indicative-pluperfect-plural-third-person":"liricizaseră","first-person-present-singular-subjunctive":"să liricizez","present-second-person-singular-subjunctive":"să liricizezi","present-singular-subjunctive-third-person":"să liricizeze","first-person-plural-present-subjunctive":"să liricizăm","plural-present-second-person-subjunctive":"să liricizați","plural-present-subjunctive-third-person":"să liricizeze","imperative-second-person-singular":"liricizează","imperative-plural-second-person":"liricizați","imperative-negative-second-person-singular":"nu liriciza","imperative-negative-plural-second-person":"nu liricizați"}},{"word":"liricizare","pos":"noun","definitions":["lyricization"],"forms":{"plural":"liricizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"liricizare","accusative-definite-nominative-singular":"liricizarea","accusative-indefinite-nominative-plural":"liricizări","accusative-definite-nominative-plural":"liricizările","dative-genitive-indefinite-singular":"liricizări","dative-definite-genitive-singular":"liricizării","dative-genitive-indefinite-plural":"liricizări","dative-definite-genitive-plural":"liricizărilor","singular-vocative":"liricizare","plural-vocative":"liricizărilor"}},{"word":"liricizat","pos":"adj","definitions":["lyricized"],"forms":{"feminine-singular":"liricizată","masculine-plural":"liricizați","feminine-neuter-plural":"liricizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liricizat","error-unrecognized-form-feminine-indefinite-singular":"liricizată","error-unrecognized-form-indefinite-masculine-plural":"liricizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"liricizate","definite-error-unrecognized-form-masculine-neuter-singular":"liricizatul","definite-error-unrecognized-form-feminine-singular":"liricizata","definite-error-unrecognized-form-masculine-plural":"liricizații","definite-error-unrecognized-form-feminine-neuter-plural":"liricizatele"}},{"word":"lirism","pos":"noun","definitions":["lyricism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lirism","accusative-definite-nominative-singular":"lirismul","accusative-indefinite-nominative-plural":"lirisme","accusative-definite-nominative-plural":"lirismele","dative-genitive-indefinite-singular":"lirism","dative-definite-genitive-singular":"lirismului","dative-genitive-indefinite-plural":"lirisme","dative-definite-genitive-plural":"lirismelor","singular-vocative":"lirismule","plural-vocative":"lirismelor"}},{"word":"lis","pos":"adj","definitions":["smooth"],"forms":{"feminine-singular":"lisă","masculine-plural":"liși","feminine-neuter-plural":"lise","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lis","error-unrecognized-form-feminine-indefinite-singular":"lisă","error-unrecognized-form-indefinite-masculine-plural":"liși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lise","definite-error-unrecognized-form-masculine-neuter-singular":"lisul","definite-error-unrecognized-form-feminine-singular":"lisa","definite-error-unrecognized-form-masculine-plural":"lișii","definite-error-unrecognized-form-feminine-neuter-plural":"lisele"}},{"word":"Lisa","pos":"name","definitions":["a commune of Brașov County, Romania","a village in Lisa, Brașov County, Romania","a village in Schitu, Olt County, Romania","a commune of Teleorman County, Romania","a village in Lisa, Teleorman County, Romania"],"gender":"f"},{"word":"lisă","pos":"noun","definitions":["smooth"],"forms":{"plural":"lise","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lisă","accusative-definite-nominative-singular":"lisa","accusative-indefinite-nominative-plural":"lise","accusative-definite-nominative-plural":"lisele","dative-genitive-indefinite-singular":"lise","dative-definite-genitive-singular":"lisei","dative-genitive-indefinite-plural":"lise","dative-definite-genitive-plural":"liselor","singular-vocative":"lisă","plural-vocative":"liselor"}},{"word":"Lisabona","pos":"name","definitions":["Lisbon (the capital city of Portugal)"],"gender":"f"},{"word":"Lîsaia Gora","pos":"name","definitions":["a village in Ulmu, Transnistria, Moldova"],"gender":"f"},{"word":"Lișcoteanca","pos":"name","definitions":["a village in Bordei Verde, Brăila County, Romania"],"gender":"f"},{"word":"Lișcov","pos":"name","definitions":["a river in Galați, Romania, tributary to the Horincea","a river in Sibiu, Romania"],"gender":"m"},{"word":"Lișcovu Mare","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Bârzava"],"gender":"m"},{"word":"Lișcovu Mic","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Lișcovu Mare"],"gender":"m"},{"word":"Liseanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Liseanu"}},{"word":"Lisencu","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Lisencu"}},{"word":"lișeță","pos":"noun","definitions":["alternative form of lișiță"],"forms":{"plural":"lișețe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lișeță","accusative-definite-nominative-singular":"lișeța","accusative-indefinite-nominative-plural":"lișețe","accusative-definite-nominative-plural":"lișețele","dative-genitive-indefinite-singular":"lișețe","dative-definite-genitive-singular":"lișeței","dative-genitive-indefinite-plural":"lișețe","dative-definite-genitive-plural":"lișețelor","singular-vocative":"lișeță","plural-vocative":"lișețelor"}},{"word":"Lișiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lișiță"}},{"word":"lișiță","pos":"noun","definitions":["coot"],"pronunciation":"/ˈli.ʃi.t͡sə/","forms":{"plural":"lișițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lișiță","accusative-definite-nominative-singular":"lișița","accusative-indefinite-nominative-plural":"lișițe","accusative-definite-nominative-plural":"lișițele","dative-genitive-indefinite-singular":"lișițe","dative-definite-genitive-singular":"lișiței","dative-genitive-indefinite-plural":"lișițe","dative-definite-genitive-plural":"lișițelor","singular-vocative":"lișiță","plural-vocative":"lișițelor","alternative":"лишицэ"}},{"word":"lișițe","pos":"noun","definitions":["plural of lișiță"]},{"word":"Lișna","pos":"name","definitions":["a village in Suharău, Botoșani County, Romania"],"gender":"f"},{"word":"Lisnău","pos":"name","definitions":["a village in Ozun, Covasna County, Romania"],"gender":"m"},{"word":"Lisnău-Vale","pos":"name","definitions":["a village in Ozun, Covasna County, Romania"],"gender":"m"},{"word":"Lișneanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lișneanu"}},{"word":"Lisnic","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lisnic"}},{"word":"lisofobie","pos":"noun","definitions":["lyssophobia"],"forms":{"plural":"lisofobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lisofobie","accusative-definite-nominative-singular":"lisofobia","accusative-indefinite-nominative-plural":"lisofobii","accusative-definite-nominative-plural":"lisofobiile","dative-genitive-indefinite-singular":"lisofobii","dative-definite-genitive-singular":"lisofobiei","dative-genitive-indefinite-plural":"lisofobii","dative-definite-genitive-plural":"lisofobiilor","singular-vocative":"lisofobie","plural-vocative":"lisofobiilor"}},{"word":"list","pos":"noun","definitions":["leaf, page"],"forms":{"plural":"listuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"list","accusative-definite-nominative-singular":"listul","accusative-indefinite-nominative-plural":"listuri","accusative-definite-nominative-plural":"listurile","dative-genitive-indefinite-singular":"list","dative-definite-genitive-singular":"listului","dative-genitive-indefinite-plural":"listuri","dative-definite-genitive-plural":"listurilor","singular-vocative":"listule","plural-vocative":"listurilor"}},{"word":"lista","pos":"verb","definitions":["to put on a list","to make a list","to print (on a computer printer)"],"forms":{"canonical":"a lista 1st conjugation","present-singular-third-person":"listează","participle-past":"listat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a lista","gerund":"listând","first-person-indicative-present-singular":"listez","indicative-present-second-person-singular":"listezi","indicative-present-singular-third-person":"listează","first-person-indicative-plural-present":"listăm","indicative-plural-present-second-person":"listați","indicative-plural-present-third-person":"listează","first-person-imperfect-indicative-singular":"listam","imperfect-indicative-second-person-singular":"listai","imperfect-indicative-singular-third-person":"lista","first-person-imperfect-indicative-plural":"listam","imperfect-indicative-plural-second-person":"listați","imperfect-indicative-plural-third-person":"listau","first-person-indicative-perfect-singular":"listai","indicative-perfect-second-person-singular":"listași","indicative-perfect-singular-third-person":"listă","first-person-indicative-perfect-plural":"listarăm","indicative-perfect-plural-second-person":"listarăți","indicative-perfect-plural-third-person":"listară","first-person-indicative-pluperfect-singular":"listasem","indicative-pluperfect-second-person-singular":"listaseși","indicative-pluperfect-singular-third-person":"listase","first-person-indicative-pluperfect-plural":"listaserăm","indicative-pluperfect-plural-second-person":"listaserăți","indicative-pluperfect-plural-third-person":"listaseră","first-person-present-singular-subjunctive":"să listez","present-second-person-singular-subjunctive":"să listezi","present-singular-subjunctive-third-person":"să listeze","first-person-plural-present-subjunctive":"să listăm","plural-present-second-person-subjunctive":"să listați","plural-present-subjunctive-third-person":"să listeze","imperative-second-person-singular":"listează","imperative-plural-second-person":"listați","imperative-negative-second-person-singular":"nu lista","imperative-negative-plural-second-person":"nu listați"}},{"word":"listă","pos":"noun","definitions":["list"],"forms":{"plural":"liste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"listă","accusative-definite-nominative-singular":"lista","accusative-indefinite-nominative-plural":"liste","accusative-definite-nominative-plural":"listele","dative-genitive-indefinite-singular":"liste","dative-definite-genitive-singular":"listei","dative-genitive-indefinite-plural":"liste","dative-definite-genitive-plural":"listelor","singular-vocative":"listă","plural-vocative":"listelor"}},{"word":"listă civilă","pos":"noun","definitions":["civil list"]},{"word":"listă de așteptare","pos":"noun","definitions":["waiting list"],"forms":{"plural":"liste de așteptare"}},{"word":"listă de cumpărături","pos":"noun","definitions":["shopping list"],"forms":{"plural":"liste de cumpărături"}},{"word":"liștai","pos":"adv","definitions":["exactly, precisely"]},{"word":"listare","pos":"noun","definitions":["listing"],"forms":{"plural":"listări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"listare","accusative-definite-nominative-singular":"listarea","accusative-indefinite-nominative-plural":"listări","accusative-definite-nominative-plural":"listările","dative-genitive-indefinite-singular":"listări","dative-definite-genitive-singular":"listării","dative-genitive-indefinite-plural":"listări","dative-definite-genitive-plural":"listărilor","singular-vocative":"listare","plural-vocative":"listărilor"}},{"word":"Lișteava","pos":"name","definitions":["a village in Ostroveni, Dolj County, Romania"],"gender":"f"},{"word":"listerioză","pos":"noun","definitions":["listeriosis"],"forms":{"plural":"listerioze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"listerioză","accusative-definite-nominative-singular":"listerioza","accusative-indefinite-nominative-plural":"listerioze","accusative-definite-nominative-plural":"listeriozele","dative-genitive-indefinite-singular":"listerioze","dative-definite-genitive-singular":"listeriozei","dative-genitive-indefinite-plural":"listerioze","dative-definite-genitive-plural":"listeriozelor","singular-vocative":"listerioză","plural-vocative":"listeriozelor"}},{"word":"liț","pos":"noun","definitions":["lath, batten, slat (a thin strip of wood)"],"forms":{"plural":"lițuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"liț","accusative-definite-nominative-singular":"lițul","accusative-indefinite-nominative-plural":"lițuri","accusative-definite-nominative-plural":"lițurile","dative-genitive-indefinite-singular":"liț","dative-definite-genitive-singular":"lițului","dative-genitive-indefinite-plural":"lițuri","dative-definite-genitive-plural":"lițurilor","singular-vocative":"lițule","plural-vocative":"lițurilor"}},{"word":"Lita","pos":"name","definitions":["a village in Săvădisla, Cluj County, Romania"],"gender":"f"},{"word":"Lița","pos":"name","definitions":["a commune of Teleorman County, Romania","a village in Lița, Teleorman County, Romania"],"gender":"f"},{"word":"lița","pos":"noun","definitions":["definite nominative/accusative singular of liță"]},{"word":"liță","pos":"noun","definitions":["alternative form of leliță"],"forms":{"plural":"lițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"liță","accusative-definite-nominative-singular":"lița","accusative-indefinite-nominative-plural":"lițe","accusative-definite-nominative-plural":"lițele","dative-genitive-indefinite-singular":"lițe","dative-definite-genitive-singular":"liței","dative-genitive-indefinite-plural":"lițe","dative-definite-genitive-plural":"lițelor","singular-vocative":"liță","plural-vocative":"lițelor"}},{"word":"litagog","pos":"adj","definitions":["lithagogue"],"forms":{"feminine-singular":"litagogă","masculine-plural":"litagogi","feminine-neuter-plural":"litagoge","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"litagog","error-unrecognized-form-feminine-indefinite-singular":"litagogă","error-unrecognized-form-indefinite-masculine-plural":"litagogi","error-unrecognized-form-feminine-indefinite-neuter-plural":"litagoge","definite-error-unrecognized-form-masculine-neuter-singular":"litagogul","definite-error-unrecognized-form-feminine-singular":"litagoga","definite-error-unrecognized-form-masculine-plural":"litagogii","definite-error-unrecognized-form-feminine-neuter-plural":"litagogele"}},{"word":"litanie","pos":"noun","definitions":["litany"],"forms":{"plural":"litanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"litanie","accusative-definite-nominative-singular":"litania","accusative-indefinite-nominative-plural":"litanii","accusative-definite-nominative-plural":"litaniile","dative-genitive-indefinite-singular":"litanii","dative-definite-genitive-singular":"litaniei","dative-genitive-indefinite-plural":"litanii","dative-definite-genitive-plural":"litaniilor","singular-vocative":"litanie","plural-vocative":"litaniilor"}},{"word":"litargă","pos":"noun","definitions":["litharge"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"litargă","accusative-definite-nominative":"litarga","dative-genitive-indefinite":"litarge","dative-definite-genitive":"litargei","vocative":"litargă"}},{"word":"lițcaie","pos":"noun","definitions":["alternative form of lăscaie"],"forms":{"plural":"lițcăi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lițcaie","accusative-definite-nominative-singular":"lițcaiea","accusative-indefinite-nominative-plural":"lițcăi","accusative-definite-nominative-plural":"lițcăile","dative-genitive-indefinite-singular":"lițcăi","dative-definite-genitive-singular":"lițcăii","dative-genitive-indefinite-plural":"lițcăi","dative-definite-genitive-plural":"lițcăilor","singular-vocative":"lițcaie","plural-vocative":"lițcăilor"}},{"word":"Lițcăneanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lițcăneanu"}},{"word":"Lițcanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lițcanu"}},{"word":"lițe","pos":"noun","definitions":["indefinite nominative/accusative/genitive/dative plural of liță"]},{"word":"Liteni","pos":"name","definitions":["a village in Săvădisla, Cluj County, Romania","a village in Belcești, Iași County, Romania","a city in Suceava County, Romania","a village in Moara, Suceava County, Romania"],"gender":"m"},{"word":"litera","pos":"verb","definitions":["to letter"],"pronunciation":"/liteˈra/","forms":{"canonical":"a litera 1st conjugation","present-singular-third-person":"literează","participle-past":"literat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a litera","gerund":"literând","first-person-indicative-present-singular":"literez","indicative-present-second-person-singular":"literezi","indicative-present-singular-third-person":"literează","first-person-indicative-plural-present":"literăm","indicative-plural-present-second-person":"literați","indicative-plural-present-third-person":"literează","first-person-imperfect-indicative-singular":"literam","imperfect-indicative-second-person-singular":"literai","imperfect-indicative-singular-third-person":"litera","first-person-imperfect-indicative-plural":"literam","imperfect-indicative-plural-second-person":"literați","imperfect-indicative-plural-third-person":"literau","first-person-indicative-perfect-singular":"literai","indicative-perfect-second-person-singular":"literași","indicative-perfect-singular-third-person":"literă","first-person-indicative-perfect-plural":"literarăm","indicative-perfect-plural-second-person":"literarăți","indicative-perfect-plural-third-person":"literară","first-person-indicative-pluperfect-singular":"literasem","indicative-pluperfect-second-person-singular":"literaseși","indicative-pluperfect-singular-third-person":"literase","first-person-indicative-pluperfect-plural":"literaserăm","indicative-pluperfect-plural-second-person":"literaserăți","indicative-pluperfect-plural-third-person":"literaseră","first-person-present-singular-subjunctive":"să literez","present-second-person-singular-subjunctive":"să literezi","present-singular-subjunctive-third-person":"să litereze","first-person-plural-present-subjunctive":"să literăm","plural-present-second-person-subjunctive":"să literați","plural-present-subjunctive-third-person":"să litereze","imperative-second-person-singular":"literează","imperative-plural-second-person":"literați","imperative-negative-second-person-singular":"nu litera","imperative-negative-plural-second-person":"nu literați"}},{"word":"litera","pos":"noun","definitions":["definite nominative/accusative singular of literă"],"pronunciation":"/ˈlitera/"},{"word":"literă","pos":"noun","definitions":["letter (of the alphabet)"],"pronunciation":"[ˈli.te.rə]","forms":{"plural":"litere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"literă","accusative-definite-nominative-singular":"litera","accusative-indefinite-nominative-plural":"litere","accusative-definite-nominative-plural":"literele","dative-genitive-indefinite-singular":"litere","dative-definite-genitive-singular":"literei","dative-genitive-indefinite-plural":"litere","dative-definite-genitive-plural":"literelor","singular-vocative":"literă","plural-vocative":"literelor"}},{"word":"literă mare","pos":"noun","definitions":["capital letter"],"forms":{"plural":"litere mari"}},{"word":"literă mică","pos":"noun","definitions":["minuscule, lower case letter"],"forms":{"plural":"litere mici"}},{"word":"literal","pos":"adj","definitions":["literal"],"forms":{"feminine-singular":"literală","masculine-plural":"literali","feminine-neuter-plural":"literale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"literal","error-unrecognized-form-feminine-indefinite-singular":"literală","error-unrecognized-form-indefinite-masculine-plural":"literali","error-unrecognized-form-feminine-indefinite-neuter-plural":"literale","definite-error-unrecognized-form-masculine-neuter-singular":"literalul","definite-error-unrecognized-form-feminine-singular":"literala","definite-error-unrecognized-form-masculine-plural":"literalii","definite-error-unrecognized-form-feminine-neuter-plural":"literalele"}},{"word":"literalicesc","pos":"adj","definitions":["literary"],"forms":{"feminine-singular":"literalicească","plural":"literalicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"literalicesc","error-unrecognized-form-feminine-indefinite-singular":"literalicească","error-unrecognized-form-indefinite-masculine-plural":"literalicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"literalicești","definite-error-unrecognized-form-masculine-neuter-singular":"literalicescul","definite-error-unrecognized-form-feminine-singular":"literaliceasca","definite-error-unrecognized-form-masculine-plural":"literaliceștii","definite-error-unrecognized-form-feminine-neuter-plural":"literaliceștile"}},{"word":"literalitate","pos":"noun","definitions":["literalness"],"forms":{"plural":"literalități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"literalitate","accusative-definite-nominative-singular":"literalitatea","accusative-indefinite-nominative-plural":"literalități","accusative-definite-nominative-plural":"literalitățile","dative-genitive-indefinite-singular":"literalități","dative-definite-genitive-singular":"literalității","dative-genitive-indefinite-plural":"literalități","dative-definite-genitive-plural":"literalităților","singular-vocative":"literalitate","plural-vocative":"literalităților"}},{"word":"literalmente","pos":"adv","definitions":["literally"]},{"word":"literalnicesc","pos":"adj","definitions":["literary"],"forms":{"feminine-singular":"literalnicească","plural":"literalnicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"literalnicesc","error-unrecognized-form-feminine-indefinite-singular":"literalnicească","error-unrecognized-form-indefinite-masculine-plural":"literalnicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"literalnicești","definite-error-unrecognized-form-masculine-neuter-singular":"literalnicescul","definite-error-unrecognized-form-feminine-singular":"literalniceasca","definite-error-unrecognized-form-masculine-plural":"literalniceștii","definite-error-unrecognized-form-feminine-neuter-plural":"literalniceștile"}},{"word":"literar","pos":"adj","definitions":["literary (relating to literature)"],"pronunciation":"/li.teˈrar/","forms":{"feminine-singular":"literară","masculine-plural":"literari","feminine-neuter-plural":"literare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"literar","error-unrecognized-form-feminine-indefinite-singular":"literară","error-unrecognized-form-indefinite-masculine-plural":"literari","error-unrecognized-form-feminine-indefinite-neuter-plural":"literare","definite-error-unrecognized-form-masculine-neuter-singular":"literarul","definite-error-unrecognized-form-feminine-singular":"literara","definite-error-unrecognized-form-masculine-plural":"literarii","definite-error-unrecognized-form-feminine-neuter-plural":"literarele"}},{"word":"literară","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of literar"]},{"word":"literariza","pos":"verb","definitions":["to make something literary"],"forms":{"canonical":"a literariza 1st conjugation","present-singular-third-person":"literarizează","participle-past":"literarizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a literariza","gerund":"literarizând","first-person-indicative-present-singular":"literarizez","indicative-present-second-person-singular":"literarizezi","indicative-present-singular-third-person":"literarizează","first-person-indicative-plural-present":"literarizăm","indicative-plural-present-second-person":"literarizați","indicative-plural-present-third-person":"literarizează","first-person-imperfect-indicative-singular":"literarizam","imperfect-indicative-second-person-singular":"literarizai","imperfect-indicative-singular-third-person":"literariza","first-person-imperfect-indicative-plural":"literarizam","imperfect-indicative-plural-second-person":"literarizați","imperfect-indicative-plural-third-person":"literarizau","first-person-indicative-perfect-singular":"literarizai","indicative-perfect-second-person-singular":"literarizași","indicative-perfect-singular-third-person":"literariză","first-person-indicative-perfect-plural":"literarizarăm","indicative-perfect-plural-second-person":"literarizarăți","indicative-perfect-plural-third-person":"literarizară","first-person-indicative-pluperfect-singular":"literarizasem","indicative-pluperfect-second-person-singular":"literarizaseși","indicative-pluperfect-singular-third-person":"literarizase","first-person-indicative-pluperfect-plural":"literarizaserăm","indicative-pluperfect-plural-second-person":"literarizaserăți","indicative-pluperfect-plural-third-person":"literarizaseră","first-person-present-singular-subjunctive":"să literarizez","present-second-person-singular-subjunctive":"să literarizezi","present-singular-subjunctive-third-person":"să literarizeze","first-person-plural-present-subjunctive":"să literarizăm","plural-present-second-person-subjunctive":"să literarizați","plural-present-subjunctive-third-person":"să literarizeze","imperative-second-person-singular":"literarizează","imperative-plural-second-person":"literarizați","imperative-negative-second-person-singular":"nu literariza","imperative-negative-plural-second-person":"nu literarizați"}},{"word":"literarizare","pos":"noun","definitions":["the act of making something more literary"],"forms":{"plural":"literarizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"literarizare","accusative-definite-nominative-singular":"literarizarea","accusative-indefinite-nominative-plural":"literarizări","accusative-definite-nominative-plural":"literarizările","dative-genitive-indefinite-singular":"literarizări","dative-definite-genitive-singular":"literarizării","dative-genitive-indefinite-plural":"literarizări","dative-definite-genitive-plural":"literarizărilor","singular-vocative":"literarizare","plural-vocative":"literarizărilor"}},{"word":"literarizat","pos":"adj","definitions":["literalised"],"pronunciation":"/li.te.ra.ri.ˈzat/","forms":{"feminine-singular":"literarizată","masculine-plural":"literarizați","feminine-neuter-plural":"literarizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"literarizat","error-unrecognized-form-feminine-indefinite-singular":"literarizată","error-unrecognized-form-indefinite-masculine-plural":"literarizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"literarizate","definite-error-unrecognized-form-masculine-neuter-singular":"literarizatul","definite-error-unrecognized-form-feminine-singular":"literarizata","definite-error-unrecognized-form-masculine-plural":"literarizații","definite-error-unrecognized-form-feminine-neuter-plural":"literarizatele"}},{"word":"literarizat","pos":"verb","definitions":["past participle of literariza"],"pronunciation":"/li.te.ra.ri.ˈzat/","forms":{"participle-past":"of literariza"}},{"word":"literat","pos":"noun","definitions":["man of letters"],"forms":{"plural":"literați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"literat","accusative-definite-nominative-singular":"literatul","accusative-indefinite-nominative-plural":"literați","accusative-definite-nominative-plural":"literații","dative-genitive-indefinite-singular":"literat","dative-definite-genitive-singular":"literatului","dative-genitive-indefinite-plural":"literați","dative-definite-genitive-plural":"literaților","singular-vocative":"literatule","plural-vocative":"literaților"}},{"word":"literată","pos":"noun","definitions":["female equivalent of literat"],"forms":{"plural":"literate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"literată","accusative-definite-nominative-singular":"literata","accusative-indefinite-nominative-plural":"literate","accusative-definite-nominative-plural":"literatele","dative-genitive-indefinite-singular":"literate","dative-definite-genitive-singular":"literatei","dative-genitive-indefinite-plural":"literate","dative-definite-genitive-plural":"literatelor","singular-vocative":"literată","plural-vocative":"literatelor"}},{"word":"literatoare","pos":"noun","definitions":["female equivalent of literator"],"forms":{"plural":"literatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"literatoare","accusative-definite-nominative-singular":"literatoarea","accusative-indefinite-nominative-plural":"literatoare","accusative-definite-nominative-plural":"literatoarele","dative-genitive-indefinite-singular":"literatoare","dative-definite-genitive-singular":"literatoarei","dative-genitive-indefinite-plural":"literatoare","dative-definite-genitive-plural":"literatoarelor","singular-vocative":"literatoare","plural-vocative":"literatoarelor"}},{"word":"literator","pos":"noun","definitions":["literator"],"forms":{"plural":"literatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"literator","accusative-definite-nominative-singular":"literatorul","accusative-indefinite-nominative-plural":"literatori","accusative-definite-nominative-plural":"literatorii","dative-genitive-indefinite-singular":"literator","dative-definite-genitive-singular":"literatorului","dative-genitive-indefinite-plural":"literatori","dative-definite-genitive-plural":"literatorilor","singular-vocative":"literatorule","plural-vocative":"literatorilor"}},{"word":"literatură","pos":"noun","definitions":["literature"],"pronunciation":"/literaˈturə/","forms":{"plural":"literaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"literatură","accusative-definite-nominative-singular":"literatura","accusative-indefinite-nominative-plural":"literaturi","accusative-definite-nominative-plural":"literaturile","dative-genitive-indefinite-singular":"literaturi","dative-definite-genitive-singular":"literaturii","dative-genitive-indefinite-plural":"literaturi","dative-definite-genitive-plural":"literaturilor","singular-vocative":"literatură","plural-vocative":"literaturilor"}},{"word":"literatură fantastică","pos":"noun","definitions":["fantasy"]},{"word":"literaturii","pos":"noun","definitions":["definite genitive/dative singular of literatură"]},{"word":"literaturiza","pos":"verb","definitions":["to make something literary"],"forms":{"canonical":"a literaturiza 1st conjugation","present-singular-third-person":"literaturizează","participle-past":"literaturizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a literaturiza","gerund":"literaturizând","first-person-indicative-present-singular":"literaturizez","indicative-present-second-person-singular":"literaturizezi","indicative-present-singular-third-person":"literaturizează","first-person-indicative-plural-present":"literaturizăm","indicative-plural-present-second-person":"literaturizați","indicative-plural-present-third-person":"literaturizează","first-person-imperfect-indicative-singular":"literaturizam","imperfect-indicative-second-person-singular":"literaturizai","imperfect-indicative-singular-third-person":"literaturiza","first-person-imperfect-indicative-plural":"literaturizam","imperfect-indicative-plural-second-person":"literaturizați","imperfect-indicative-plural-third-person":"literaturizau","first-person-indicative-perfect-singular":"literaturizai","indicative-perfect-second-person-singular":"literaturizași","indicative-perfect-singular-third-person":"literaturiză","first-person-indicative-perfect-plural":"literaturizarăm","indicative-perfect-plural-second-person":"literaturizarăți","indicative-perfect-plural-third-person":"literaturizară","first-person-indicative-pluperfect-singular":"literaturizasem","indicative-pluperfect-second-person-singular":"literaturizaseși","indicative-pluperfect-singular-third-person":"literaturizase","first-person-indicative-pluperfect-plural":"literaturizaserăm","indicative-pluperfect-plural-second-person":"literaturizaserăți","indicative-pluperfect-plural-third-person":"literaturizaseră","first-person-present-singular-subjunctive":"să literaturizez","present-second-person-singular-subjunctive":"să literaturizezi","present-singular-subjunctive-third-person":"să literaturizeze","first-person-plural-present-subjunctive":"să literaturizăm","plural-present-second-person-subjunctive":"să literaturizați","plural-present-subjunctive-third-person":"să literaturizeze","imperative-second-person-singular":"literaturizează","imperative-plural-second-person":"literaturizați","imperative-negative-second-person-singular":"nu literaturiza","imperative-negative-plural-second-person":"nu literaturizați"}},{"word":"literaturizare","pos":"noun","definitions":["the act of making something more literary"],"forms":{"plural":"literaturizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"literaturizare","accusative-definite-nominative-singular":"literaturizarea","accusative-indefinite-nominative-plural":"literaturizări","accusative-definite-nominative-plural":"literaturizările","dative-genitive-indefinite-singular":"literaturizări","dative-definite-genitive-singular":"literaturizării","dative-genitive-indefinite-plural":"literaturizări","dative-definite-genitive-plural":"literaturizărilor","singular-vocative":"literaturizare","plural-vocative":"literaturizărilor"}},{"word":"litere","pos":"noun","definitions":["plural of literă"],"gender":"f-p"},{"word":"Lițescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lițescu"}},{"word":"litiază","pos":"noun","definitions":["lithiasis"],"forms":{"plural":"litiaze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"litiază","accusative-definite-nominative-singular":"litiaza","accusative-indefinite-nominative-plural":"litiaze","accusative-definite-nominative-plural":"litiazele","dative-genitive-indefinite-singular":"litiaze","dative-definite-genitive-singular":"litiazei","dative-genitive-indefinite-plural":"litiaze","dative-definite-genitive-plural":"litiazelor","singular-vocative":"litiază","plural-vocative":"litiazelor"}},{"word":"litiazic","pos":"adj","definitions":["lithiasic"],"forms":{"feminine-singular":"litiazică","masculine-plural":"litiazici","feminine-neuter-plural":"litiazice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"litiazic","error-unrecognized-form-feminine-indefinite-singular":"litiazică","error-unrecognized-form-indefinite-masculine-plural":"litiazici","error-unrecognized-form-feminine-indefinite-neuter-plural":"litiazice","definite-error-unrecognized-form-masculine-neuter-singular":"litiazicul","definite-error-unrecognized-form-feminine-singular":"litiazica","definite-error-unrecognized-form-masculine-plural":"litiazicii","definite-error-unrecognized-form-feminine-neuter-plural":"litiazicele"}},{"word":"litiazică","pos":"noun","definitions":["female equivalent of litiazic"],"forms":{"plural":"litiazice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"litiazică","accusative-definite-nominative-singular":"litiazica","accusative-indefinite-nominative-plural":"litiazice","accusative-definite-nominative-plural":"litiazicele","dative-genitive-indefinite-singular":"litiazice","dative-definite-genitive-singular":"litiazicei","dative-genitive-indefinite-plural":"litiazice","dative-definite-genitive-plural":"litiazicelor","singular-vocative":"litiazică","plural-vocative":"litiazicelor"}},{"word":"litic","pos":"adj","definitions":["lithic"],"forms":{"feminine-singular":"litică","masculine-plural":"litici","feminine-neuter-plural":"litice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"litic","error-unrecognized-form-feminine-indefinite-singular":"litică","error-unrecognized-form-indefinite-masculine-plural":"litici","error-unrecognized-form-feminine-indefinite-neuter-plural":"litice","definite-error-unrecognized-form-masculine-neuter-singular":"liticul","definite-error-unrecognized-form-feminine-singular":"litica","definite-error-unrecognized-form-masculine-plural":"liticii","definite-error-unrecognized-form-feminine-neuter-plural":"liticele"}},{"word":"liticaș","pos":"noun","definitions":["minnow"],"forms":{"plural":"liticași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"liticaș","accusative-definite-nominative-singular":"liticașul","accusative-indefinite-nominative-plural":"liticași","accusative-definite-nominative-plural":"liticașii","dative-genitive-indefinite-singular":"liticaș","dative-definite-genitive-singular":"liticașului","dative-genitive-indefinite-plural":"liticași","dative-definite-genitive-plural":"liticașilor","singular-vocative":"liticașule","plural-vocative":"liticașilor"}},{"word":"litie","pos":"noun","definitions":["Orthodox Christian sermon for agricultural abundance"],"forms":{"plural":"litii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"litie","accusative-definite-nominative-singular":"litia","accusative-indefinite-nominative-plural":"litii","accusative-definite-nominative-plural":"litiile","dative-genitive-indefinite-singular":"litii","dative-definite-genitive-singular":"litiei","dative-genitive-indefinite-plural":"litii","dative-definite-genitive-plural":"litiilor","singular-vocative":"litie","plural-vocative":"litiilor"}},{"word":"litieră","pos":"noun","definitions":["litter (portable bed or couch used for transport)"],"forms":{"plural":"litiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"litieră","accusative-definite-nominative-singular":"litiera","accusative-indefinite-nominative-plural":"litiere","accusative-definite-nominative-plural":"litierele","dative-genitive-indefinite-singular":"litiere","dative-definite-genitive-singular":"litierei","dative-genitive-indefinite-plural":"litiere","dative-definite-genitive-plural":"litierelor","singular-vocative":"litieră","plural-vocative":"litierelor"}},{"word":"litigant","pos":"adj","definitions":["litigant"],"forms":{"feminine-singular":"litigantă","masculine-plural":"litiganți","feminine-neuter-plural":"litigante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"litigant","error-unrecognized-form-feminine-indefinite-singular":"litigantă","error-unrecognized-form-indefinite-masculine-plural":"litiganți","error-unrecognized-form-feminine-indefinite-neuter-plural":"litigante","definite-error-unrecognized-form-masculine-neuter-singular":"litigantul","definite-error-unrecognized-form-feminine-singular":"litiganta","definite-error-unrecognized-form-masculine-plural":"litiganții","definite-error-unrecognized-form-feminine-neuter-plural":"litigantele"}},{"word":"litigios","pos":"adj","definitions":["litigious"],"forms":{"feminine-singular":"litigioasă","masculine-plural":"litigioși","feminine-neuter-plural":"litigioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"litigios","error-unrecognized-form-feminine-indefinite-singular":"litigioasă","error-unrecognized-form-indefinite-masculine-plural":"litigioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"litigioase","definite-error-unrecognized-form-masculine-neuter-singular":"litigiosul","definite-error-unrecognized-form-feminine-singular":"litigioasa","definite-error-unrecognized-form-masculine-plural":"litigioșii","definite-error-unrecognized-form-feminine-neuter-plural":"litigioasele"}},{"word":"litigiu","pos":"noun","definitions":["litigation"],"forms":{"plural":"litigii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"litigiu","accusative-definite-nominative-singular":"litigiul","accusative-indefinite-nominative-plural":"litigii","accusative-definite-nominative-plural":"litigiile","dative-genitive-indefinite-singular":"litigiu","dative-definite-genitive-singular":"litigiului","dative-genitive-indefinite-plural":"litigii","dative-definite-genitive-plural":"litigiilor","singular-vocative":"litigiule","plural-vocative":"litigiilor"}},{"word":"litină","pos":"noun","definitions":["lithia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"litină","accusative-definite-nominative":"litina","dative-genitive-indefinite":"litine","dative-definite-genitive":"litinei","vocative":"litină"}},{"word":"lițișoară","pos":"noun","definitions":["diminutive of liță"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lițișoară","accusative-definite-nominative":"lițișoara","dative-genitive-indefinite":"lițișoare","dative-definite-genitive":"lițișoarei","vocative":"lițișoară"}},{"word":"litispendență","pos":"noun","definitions":["lis pendens"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"litispendență","accusative-definite-nominative":"litispendența","dative-genitive-indefinite":"e","dative-definite-genitive":"ei","vocative":"litispendență"}},{"word":"litiu","pos":"noun","definitions":["lithium (chemical element)"],"pronunciation":"/ˈlitju/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"litiu","accusative-definite-nominative":"litiul","dative-genitive-indefinite":"litiu","dative-definite-genitive":"litiului","vocative":"litiule"}},{"word":"lițo","pos":"noun","definitions":["vocative singular of liță"]},{"word":"litocarp","pos":"noun","definitions":["lithocarp"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"litocarp","accusative-definite-nominative":"litocarpul","dative-genitive-indefinite":"litocarp","dative-definite-genitive":"litocarpului","vocative":"litocarpule"}},{"word":"litocromie","pos":"noun","definitions":["lithochromy"],"forms":{"plural":"litocromii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"litocromie","accusative-definite-nominative-singular":"litocromia","accusative-indefinite-nominative-plural":"litocromii","accusative-definite-nominative-plural":"litocromiile","dative-genitive-indefinite-singular":"litocromii","dative-definite-genitive-singular":"litocromiei","dative-genitive-indefinite-plural":"litocromii","dative-definite-genitive-plural":"litocromiilor","singular-vocative":"litocromie","plural-vocative":"litocromiilor"}},{"word":"litofag","pos":"adj","definitions":["lithophagous"],"forms":{"feminine-singular":"litofagă","masculine-plural":"litofagi","feminine-neuter-plural":"litofage","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"litofag","error-unrecognized-form-feminine-indefinite-singular":"litofagă","error-unrecognized-form-indefinite-masculine-plural":"litofagi","error-unrecognized-form-feminine-indefinite-neuter-plural":"litofage","definite-error-unrecognized-form-masculine-neuter-singular":"litofagul","definite-error-unrecognized-form-feminine-singular":"litofaga","definite-error-unrecognized-form-masculine-plural":"litofagii","definite-error-unrecognized-form-feminine-neuter-plural":"litofagele"}},{"word":"litofit","pos":"adj","definitions":["lithophytic"],"forms":{"feminine-singular":"litofită","masculine-plural":"litofiți","feminine-neuter-plural":"litofite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"litofit","error-unrecognized-form-feminine-indefinite-singular":"litofită","error-unrecognized-form-indefinite-masculine-plural":"litofiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"litofite","definite-error-unrecognized-form-masculine-neuter-singular":"litofitul","definite-error-unrecognized-form-feminine-singular":"litofita","definite-error-unrecognized-form-masculine-plural":"litofiții","definite-error-unrecognized-form-feminine-neuter-plural":"litofitele"}},{"word":"litogeneză","pos":"noun","definitions":["lithogenesis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"litogeneză","accusative-definite-nominative-singular":"litogeneza","accusative-indefinite-nominative-plural":"litogeneze","accusative-definite-nominative-plural":"litogenezele","dative-genitive-indefinite-singular":"litogeneze","dative-definite-genitive-singular":"litogenezei","dative-genitive-indefinite-plural":"litogeneze","dative-definite-genitive-plural":"litogenezelor","singular-vocative":"litogeneză","plural-vocative":"litogenezelor"}},{"word":"litograf","pos":"noun","definitions":["lithographer"],"pronunciation":"/li.toˈɡraf/","forms":{"plural":"litografi","feminine":"equivalent litografă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"litograf","accusative-definite-nominative-singular":"litograful","accusative-indefinite-nominative-plural":"litografi","accusative-definite-nominative-plural":"litografii","dative-genitive-indefinite-singular":"litograf","dative-definite-genitive-singular":"litografului","dative-genitive-indefinite-plural":"litografi","dative-definite-genitive-plural":"litografilor","singular-vocative":"litografule","plural-vocative":"litografilor"}},{"word":"litografa","pos":"noun","definitions":["definite nominative/accusative singular of litografă"]},{"word":"litografă","pos":"noun","definitions":["female equivalent of litograf"],"pronunciation":"/li.toˈɡra.fə/","forms":{"plural":"litografe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"litografă","accusative-definite-nominative-singular":"litografa","accusative-indefinite-nominative-plural":"litografe","accusative-definite-nominative-plural":"litografele","dative-genitive-indefinite-singular":"litografe","dative-definite-genitive-singular":"litografei","dative-genitive-indefinite-plural":"litografe","dative-definite-genitive-plural":"litografelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"litografe","pos":"noun","definitions":["plural of litografă"],"gender":"f"},{"word":"litografi","pos":"noun","definitions":["plural of litograf"],"gender":"m"},{"word":"litografia","pos":"verb","definitions":["to lithograph"],"forms":{"canonical":"a litografia 1st conjugation","present-singular-third-person":"litografiează","participle-past":"litografiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a litografia","gerund":"litografiind","first-person-indicative-present-singular":"litografiez","indicative-present-second-person-singular":"litografiezi","indicative-present-singular-third-person":"litografiază","first-person-indicative-plural-present":"litografiem","indicative-plural-present-second-person":"litografiați","indicative-plural-present-third-person":"litografiază","first-person-imperfect-indicative-singular":"litografiam","imperfect-indicative-second-person-singular":"litografiai","imperfect-indicative-singular-third-person":"litografia","first-person-imperfect-indicative-plural":"litografiam","imperfect-indicative-plural-second-person":"litografiați","imperfect-indicative-plural-third-person":"litografiau","first-person-indicative-perfect-singular":"litografiai","indicative-perfect-second-person-singular":"litografiași","indicative-perfect-singular-third-person":"litografie","first-person-indicative-perfect-plural":"litografiarăm","indicative-perfect-plural-second-person":"litografiarăți","indicative-perfect-plural-third-person":"litografiară","first-person-indicative-pluperfect-singular":"litografiasem","indicative-pluperfect-second-person-singular":"litografiaseși","indicative-pluperfect-singular-third-person":"litografiase","first-person-indicative-pluperfect-plural":"litografiaserăm","indicative-pluperfect-plural-second-person":"litografiaserăți","indicative-pluperfect-plural-third-person":"litografiaseră","first-person-present-singular-subjunctive":"să litografiez","present-second-person-singular-subjunctive":"să litografiezi","present-singular-subjunctive-third-person":"să litografieze","first-person-plural-present-subjunctive":"să litografiem","plural-present-second-person-subjunctive":"să litografiați","plural-present-subjunctive-third-person":"să litografieze","imperative-second-person-singular":"litografiază","imperative-plural-second-person":"litografiați","imperative-negative-second-person-singular":"nu litografia","imperative-negative-plural-second-person":"nu litografiați"}},{"word":"litografiat","pos":"adj","definitions":["lithographed"],"forms":{"feminine-singular":"litografiată","masculine-plural":"litografiați","feminine-neuter-plural":"litografiate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"litografiat","error-unrecognized-form-feminine-indefinite-singular":"litografiată","error-unrecognized-form-indefinite-masculine-plural":"litografiați","error-unrecognized-form-feminine-indefinite-neuter-plural":"litografiate","definite-error-unrecognized-form-masculine-neuter-singular":"litografiatul","definite-error-unrecognized-form-feminine-singular":"litografiata","definite-error-unrecognized-form-masculine-plural":"litografiații","definite-error-unrecognized-form-feminine-neuter-plural":"litografiatele"}},{"word":"litografic","pos":"adj","definitions":["lithographic"],"forms":{"feminine-singular":"litografică","masculine-plural":"litografici","feminine-neuter-plural":"litografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"litografic","error-unrecognized-form-feminine-indefinite-singular":"litografică","error-unrecognized-form-indefinite-masculine-plural":"litografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"litografice","definite-error-unrecognized-form-masculine-neuter-singular":"litograficul","definite-error-unrecognized-form-feminine-singular":"litografica","definite-error-unrecognized-form-masculine-plural":"litograficii","definite-error-unrecognized-form-feminine-neuter-plural":"litograficele"}},{"word":"litograficesc","pos":"adj","definitions":["lithographical"],"forms":{"feminine-singular":"litograficească","plural":"litograficești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"litograficesc","error-unrecognized-form-feminine-indefinite-singular":"litograficească","error-unrecognized-form-indefinite-masculine-plural":"litograficești","error-unrecognized-form-feminine-indefinite-neuter-plural":"litograficești","definite-error-unrecognized-form-masculine-neuter-singular":"litograficescul","definite-error-unrecognized-form-feminine-singular":"litograficeasca","definite-error-unrecognized-form-masculine-plural":"litograficeștii","definite-error-unrecognized-form-feminine-neuter-plural":"litograficeștile"}},{"word":"litograficește","pos":"adv","definitions":["lithographically"]},{"word":"litografici","pos":"adj","definitions":["nominative/accusative masculine plural of litografic"],"gender":"m-p"},{"word":"litografie","pos":"noun","definitions":["lithography"],"forms":{"plural":"litografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"litografie","accusative-definite-nominative-singular":"litografia","accusative-indefinite-nominative-plural":"litografii","accusative-definite-nominative-plural":"litografiile","dative-genitive-indefinite-singular":"litografii","dative-definite-genitive-singular":"litografiei","dative-genitive-indefinite-plural":"litografii","dative-definite-genitive-plural":"litografiilor","singular-vocative":"litografie","plural-vocative":"litografiilor"}},{"word":"litografiere","pos":"noun","definitions":["lithographing"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"litografiere","accusative-definite-nominative":"litografierea","dative-genitive-indefinite":"litografiere","dative-definite-genitive":"litografierei","vocative":"litografiere"}},{"word":"Lițoi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lițoi"}},{"word":"litologic","pos":"adj","definitions":["lithologic"],"forms":{"feminine-singular":"litologică","masculine-plural":"litologici","feminine-neuter-plural":"litologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"litologic","error-unrecognized-form-feminine-indefinite-singular":"litologică","error-unrecognized-form-indefinite-masculine-plural":"litologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"litologice","definite-error-unrecognized-form-masculine-neuter-singular":"litologicul","definite-error-unrecognized-form-feminine-singular":"litologica","definite-error-unrecognized-form-masculine-plural":"litologicii","definite-error-unrecognized-form-feminine-neuter-plural":"litologicele"}},{"word":"litologie","pos":"noun","definitions":["lithology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"litologie","accusative-definite-nominative":"litologia","dative-genitive-indefinite":"litologii","dative-definite-genitive":"litologiei","vocative":"litologie"}},{"word":"litometeor","pos":"noun","definitions":["lithometeor"],"forms":{"plural":"litometeori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"litometeor","accusative-definite-nominative-singular":"litometeorul","accusative-indefinite-nominative-plural":"litometeori","accusative-definite-nominative-plural":"litometeorii","dative-genitive-indefinite-singular":"litometeor","dative-definite-genitive-singular":"litometeorului","dative-genitive-indefinite-plural":"litometeori","dative-definite-genitive-plural":"litometeorilor","singular-vocative":"litometeorule","plural-vocative":"litometeorilor"}},{"word":"litopon","pos":"noun","definitions":["lithopone"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"litopon","accusative-definite-nominative":"litoponul","dative-genitive-indefinite":"litopon","dative-definite-genitive":"litoponului","vocative":"litoponule"}},{"word":"litor","pos":"noun","definitions":["fugitive, runaway"],"forms":{"plural":"litori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"litor","accusative-definite-nominative-singular":"litorul","accusative-indefinite-nominative-plural":"litori","accusative-definite-nominative-plural":"litorii","dative-genitive-indefinite-singular":"litor","dative-definite-genitive-singular":"litorului","dative-genitive-indefinite-plural":"litori","dative-definite-genitive-plural":"litorilor","singular-vocative":"litorule","plural-vocative":"litorilor"}},{"word":"litoral","pos":"adj","definitions":["littoral"],"forms":{"feminine-singular":"litorală","masculine-plural":"litorali","feminine-neuter-plural":"litorale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"litoral","error-unrecognized-form-feminine-indefinite-singular":"litorală","error-unrecognized-form-indefinite-masculine-plural":"litorali","error-unrecognized-form-feminine-indefinite-neuter-plural":"litorale","definite-error-unrecognized-form-masculine-neuter-singular":"litoralul","definite-error-unrecognized-form-feminine-singular":"litorala","definite-error-unrecognized-form-masculine-plural":"litoralii","definite-error-unrecognized-form-feminine-neuter-plural":"litoralele"}},{"word":"litosferă","pos":"noun","definitions":["lithosphere"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"litosferă","accusative-definite-nominative-singular":"litosfera","accusative-indefinite-nominative-plural":"litosfere","accusative-definite-nominative-plural":"litosferele","dative-genitive-indefinite-singular":"litosfere","dative-definite-genitive-singular":"litosferei","dative-genitive-indefinite-plural":"litosfere","dative-definite-genitive-plural":"litosferelor","singular-vocative":"litosferă","plural-vocative":"litosferelor"}},{"word":"litotă","pos":"noun","definitions":["litotes"],"forms":{"plural":"litote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"litotă","accusative-definite-nominative-singular":"litota","accusative-indefinite-nominative-plural":"litote","accusative-definite-nominative-plural":"litotele","dative-genitive-indefinite-singular":"litote","dative-definite-genitive-singular":"litotei","dative-genitive-indefinite-plural":"litote","dative-definite-genitive-plural":"litotelor","singular-vocative":"litotă","plural-vocative":"litotelor"}},{"word":"litotipografie","pos":"noun","definitions":["lithotypography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"litotipografie","accusative-definite-nominative":"litotipografia","dative-genitive-indefinite":"litotipografii","dative-definite-genitive":"litotipografiei","vocative":"litotipografie"}},{"word":"litotom","pos":"noun","definitions":["lithotome"],"forms":{"plural":"litotoame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"litotom","accusative-definite-nominative-singular":"litotomul","accusative-indefinite-nominative-plural":"litotoame","accusative-definite-nominative-plural":"litotoamele","dative-genitive-indefinite-singular":"litotom","dative-definite-genitive-singular":"litotomului","dative-genitive-indefinite-plural":"litotoame","dative-definite-genitive-plural":"litotoamelor","singular-vocative":"litotomule","plural-vocative":"litotoamelor"}},{"word":"litotomie","pos":"noun","definitions":["lithotomy"],"forms":{"plural":"litotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"litotomie","accusative-definite-nominative-singular":"litotomia","accusative-indefinite-nominative-plural":"litotomii","accusative-definite-nominative-plural":"litotomiile","dative-genitive-indefinite-singular":"litotomii","dative-definite-genitive-singular":"litotomiei","dative-genitive-indefinite-plural":"litotomii","dative-definite-genitive-plural":"litotomiilor","singular-vocative":"litotomie","plural-vocative":"litotomiilor"}},{"word":"litotritie","pos":"noun","definitions":["lithotripsy"],"forms":{"plural":"litotritii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"litotritie","accusative-definite-nominative-singular":"litotritia","accusative-indefinite-nominative-plural":"litotritii","accusative-definite-nominative-plural":"litotritiile","dative-genitive-indefinite-singular":"litotritii","dative-definite-genitive-singular":"litotritiei","dative-genitive-indefinite-plural":"litotritii","dative-definite-genitive-plural":"litotritiilor","singular-vocative":"litotritie","plural-vocative":"litotritiilor"}},{"word":"litotritor","pos":"noun","definitions":["lithotripter"],"forms":{"plural":"litotritoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"litotritor","accusative-definite-nominative-singular":"litotritorul","accusative-indefinite-nominative-plural":"litotritoare","accusative-definite-nominative-plural":"litotritoarele","dative-genitive-indefinite-singular":"litotritor","dative-definite-genitive-singular":"litotritorului","dative-genitive-indefinite-plural":"litotritoare","dative-definite-genitive-plural":"litotritoarelor","singular-vocative":"litotritorule","plural-vocative":"litotritoarelor"}},{"word":"Litră","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Litră"}},{"word":"litră","pos":"noun","definitions":["libra"],"forms":{"plural":"litre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"litră","accusative-definite-nominative-singular":"litra","accusative-indefinite-nominative-plural":"litre","accusative-definite-nominative-plural":"litrele","dative-genitive-indefinite-singular":"litre","dative-definite-genitive-singular":"litrei","dative-genitive-indefinite-plural":"litre","dative-definite-genitive-plural":"litrelor","singular-vocative":"litră","plural-vocative":"litrelor"}},{"word":"litraj","pos":"noun","definitions":["litreage"],"forms":{"plural":"litraje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"litraj","accusative-definite-nominative-singular":"litrajul","accusative-indefinite-nominative-plural":"litraje","accusative-definite-nominative-plural":"litrajele","dative-genitive-indefinite-singular":"litraj","dative-definite-genitive-singular":"litrajului","dative-genitive-indefinite-plural":"litraje","dative-definite-genitive-plural":"litrajelor","singular-vocative":"litrajule","plural-vocative":"litrajelor"}},{"word":"litroseală","pos":"noun","definitions":["salvation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"litroseală","accusative-definite-nominative":"litroseala","dative-genitive-indefinite":"litroseale","dative-definite-genitive":"litrosealei","vocative":"litroseală"}},{"word":"litru","pos":"noun","definitions":["liter, litre"],"forms":{"plural":"litri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"litru","accusative-definite-nominative-singular":"litrul","accusative-indefinite-nominative-plural":"litri","accusative-definite-nominative-plural":"litrii","dative-genitive-indefinite-singular":"litru","dative-definite-genitive-singular":"litrului","dative-genitive-indefinite-plural":"litri","dative-definite-genitive-plural":"litrilor","singular-vocative":"litrule","plural-vocative":"litrilor"}},{"word":"Lituania","pos":"name","definitions":["Lithuania (a country in northeastern Europe)"],"pronunciation":"[lituˈania]","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"Lituanie","accusative-definite-nominative":"Lituania","dative-genitive-indefinite":"Lituanii","dative-definite-genitive":"Lituaniei","vocative":"Lituanie"}},{"word":"lituanian","pos":"adj","definitions":["Lithuanian (referring to Lithuania)"],"pronunciation":"/ˌli.tu.a.niˈan/","forms":{"feminine-singular":"lituaniană","masculine-plural":"lituanieni","feminine-neuter-plural":"lituaniene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lituanian","error-unrecognized-form-feminine-indefinite-singular":"lituaniană","error-unrecognized-form-indefinite-masculine-plural":"lituanieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"lituaniene","definite-error-unrecognized-form-masculine-neuter-singular":"lituanianul","definite-error-unrecognized-form-feminine-singular":"lituaniana","definite-error-unrecognized-form-masculine-plural":"lituanienii","definite-error-unrecognized-form-feminine-neuter-plural":"lituanienele"}},{"word":"lituanian","pos":"noun","definitions":["Lithuanian (person)"],"pronunciation":"/ˌli.tu.a.niˈan/","forms":{"plural":"lituanieni","feminine":"equivalent lituaniană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lituanian","accusative-definite-nominative-singular":"lituanianul","accusative-indefinite-nominative-plural":"lituanieni","accusative-definite-nominative-plural":"lituanienii","dative-genitive-indefinite-singular":"lituanian","dative-definite-genitive-singular":"lituanianului","dative-genitive-indefinite-plural":"lituanieni","dative-definite-genitive-plural":"lituanienilor","singular-vocative":"lituanianule","plural-vocative":"lituanienilor"}},{"word":"lituaniană","pos":"noun","definitions":["Lithuanian (language of Lithuania)"],"pronunciation":"/ˌli.tu.a.niˈa.nə/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lituaniană","accusative-definite-nominative":"lituaniana","dative-genitive-indefinite":"lituaniene","dative-definite-genitive":"lituanienei","vocative":"lituaniană"}},{"word":"lituaniană","pos":"noun","definitions":["female equivalent of lituanian"],"pronunciation":"/ˌli.tu.a.niˈa.nə/","forms":{"plural":"lituaniene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lituaniană","accusative-definite-nominative-singular":"lituaniana","accusative-indefinite-nominative-plural":"lituaniene","accusative-definite-nominative-plural":"lituanienele","dative-genitive-indefinite-singular":"lituaniene","dative-definite-genitive-singular":"lituanienei","dative-genitive-indefinite-plural":"lituaniene","dative-definite-genitive-plural":"lituanienelor","singular-vocative":"lituaniană","plural-vocative":"lituanienelor"}},{"word":"lituaniană","pos":"adj","definitions":["nominative/accusative feminine singular of lituanian"],"pronunciation":"/ˌli.tu.a.niˈa.nə/"},{"word":"lițucă","pos":"noun","definitions":["diminutive of lele"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lițucă","accusative-definite-nominative":"lițuca","dative-genitive-indefinite":"lițuce","dative-definite-genitive":"lițucei","vocative":"lițucă"}},{"word":"liturg","pos":"noun","definitions":["public official"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"liturg","accusative-definite-nominative":"liturgul","dative-genitive-indefinite":"liturg","dative-definite-genitive":"liturgului","vocative":"liturgule"}},{"word":"liturghie","pos":"noun","definitions":["liturgy"],"forms":{"plural":"liturghii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"liturghie","accusative-definite-nominative-singular":"liturghia","accusative-indefinite-nominative-plural":"liturghii","accusative-definite-nominative-plural":"liturghiile","dative-genitive-indefinite-singular":"liturghii","dative-definite-genitive-singular":"liturghiei","dative-genitive-indefinite-plural":"liturghii","dative-definite-genitive-plural":"liturghiilor","singular-vocative":"liturghie","plural-vocative":"liturghiilor"}},{"word":"liturghier","pos":"noun","definitions":["liturgy book"],"forms":{"plural":"liturghiere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"liturghier","accusative-definite-nominative-singular":"liturghierul","accusative-indefinite-nominative-plural":"liturghiere","accusative-definite-nominative-plural":"liturghierele","dative-genitive-indefinite-singular":"liturghier","dative-definite-genitive-singular":"liturghierului","dative-genitive-indefinite-plural":"liturghiere","dative-definite-genitive-plural":"liturghierelor","singular-vocative":"liturghierule","plural-vocative":"liturghierelor"}},{"word":"liturgic","pos":"adj","definitions":["liturgical"],"forms":{"feminine-singular":"liturgică","masculine-plural":"liturgici","feminine-neuter-plural":"liturgice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"liturgic","error-unrecognized-form-feminine-indefinite-singular":"liturgică","error-unrecognized-form-indefinite-masculine-plural":"liturgici","error-unrecognized-form-feminine-indefinite-neuter-plural":"liturgice","definite-error-unrecognized-form-masculine-neuter-singular":"liturgicul","definite-error-unrecognized-form-feminine-singular":"liturgica","definite-error-unrecognized-form-masculine-plural":"liturgicii","definite-error-unrecognized-form-feminine-neuter-plural":"liturgicele"}},{"word":"liturgică","pos":"noun","definitions":["liturgics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"liturgică","accusative-definite-nominative-singular":"liturgica","accusative-indefinite-nominative-plural":"liturgice","accusative-definite-nominative-plural":"liturgicele","dative-genitive-indefinite-singular":"liturgice","dative-definite-genitive-singular":"liturgicei","dative-genitive-indefinite-plural":"liturgice","dative-definite-genitive-plural":"liturgicelor","singular-vocative":"liturgică","plural-vocative":"liturgicelor"}},{"word":"liturgist","pos":"noun","definitions":["liturgist"],"forms":{"plural":"liturgiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"liturgist","accusative-definite-nominative-singular":"liturgistul","accusative-indefinite-nominative-plural":"liturgiști","accusative-definite-nominative-plural":"liturgiștii","dative-genitive-indefinite-singular":"liturgist","dative-definite-genitive-singular":"liturgistului","dative-genitive-indefinite-plural":"liturgiști","dative-definite-genitive-plural":"liturgiștilor","singular-vocative":"liturgistule","plural-vocative":"liturgiștilor"}},{"word":"lituus","pos":"noun","definitions":["lituus"],"forms":{"plural":"lituusuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lituus","accusative-definite-nominative-singular":"lituusul","accusative-indefinite-nominative-plural":"lituusuri","accusative-definite-nominative-plural":"lituusurile","dative-genitive-indefinite-singular":"lituus","dative-definite-genitive-singular":"lituusului","dative-genitive-indefinite-plural":"lituusuri","dative-definite-genitive-plural":"lituusurilor","singular-vocative":"lituusule","plural-vocative":"lituusurilor"}},{"word":"Litvinenco","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Litvinenco"}},{"word":"Liubcova","pos":"name","definitions":["a village in Berzasca, Caraș-Severin County, Romania"],"gender":"f"},{"word":"Liubimirescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Liubimirescu"}},{"word":"Liuborajdia","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Danube"],"gender":"f"},{"word":"Liubotina","pos":"name","definitions":["a river in Mehedinți, Romania, tributary to the Dunăre"],"gender":"f"},{"word":"liude","pos":"noun","definitions":["taxpayer"],"forms":{"plural":"liuzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"liude","accusative-definite-nominative-singular":"liudeul","accusative-indefinite-nominative-plural":"liuzi","accusative-definite-nominative-plural":"liuzii","dative-genitive-indefinite-singular":"liude","dative-definite-genitive-singular":"liudeului","dative-genitive-indefinite-plural":"liuzi","dative-definite-genitive-plural":"liuzilor","singular-vocative":"liudeule","plural-vocative":"liuzilor"}},{"word":"liulea","pos":"noun","definitions":["alternative form of lulea"],"forms":{"plural":"liulele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"liulea","accusative-definite-nominative-singular":"liuleaua","accusative-indefinite-nominative-plural":"liulele","accusative-definite-nominative-plural":"liulelele","dative-genitive-indefinite-singular":"liulele","dative-definite-genitive-singular":"liulelei","dative-genitive-indefinite-plural":"liulele","dative-definite-genitive-plural":"liulelelor","singular-vocative":"liulea","plural-vocative":"liulelelor"}},{"word":"liur","pos":"noun","definitions":["poor quality wine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"liur","accusative-definite-nominative":"liurul","dative-genitive-indefinite":"liur","dative-definite-genitive":"liurului","vocative":"liurule"}},{"word":"livă","pos":"noun","definitions":["northern wind"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"livă","accusative-definite-nominative":"liva","dative-genitive-indefinite":"live","dative-definite-genitive":"livei","vocative":"livă"}},{"word":"Livada","pos":"name","definitions":["a commune of Arad County, Romania","a village in Livada, Arad County, Romania","a village in Dobârceni, Botoșani County, Romania","a village in Grebănu, Buzău County, Romania","a village in Iclod, Cluj County, Romania"],"gender":"f"},{"word":"livada","pos":"noun","definitions":["definite nominative/accusative singular of livadă"]},{"word":"Livadă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Livadă"}},{"word":"livadă","pos":"noun","definitions":["orchard","meadow"],"pronunciation":"/liˈva.də/","forms":{"plural":"livezi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"livadă","accusative-definite-nominative-singular":"livada","accusative-indefinite-nominative-plural":"livezi","accusative-definite-nominative-plural":"livezile","dative-genitive-indefinite-singular":"livezi","dative-definite-genitive-singular":"livezii","dative-genitive-indefinite-plural":"livezi","dative-definite-genitive-plural":"livezilor","singular-vocative":"livadă","plural-vocative":"livezilor"}},{"word":"Livada Beiușului","pos":"name","definitions":["a village in Drăgănești, Bihor County, Romania"],"gender":"f"},{"word":"Livada de Bihor","pos":"name","definitions":["a village in Nojorid, Bihor County, Romania"],"gender":"f"},{"word":"Livada Mică","pos":"name","definitions":["a village in Grebănu, Buzău County, Romania","a locality in Livada, Satu Mare County, Romania"],"gender":"f"},{"word":"livădar","pos":"noun","definitions":["orchardist"],"forms":{"plural":"livădari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"livădar","accusative-definite-nominative-singular":"livădarul","accusative-indefinite-nominative-plural":"livădari","accusative-definite-nominative-plural":"livădarii","dative-genitive-indefinite-singular":"livădar","dative-definite-genitive-singular":"livădarului","dative-genitive-indefinite-plural":"livădari","dative-definite-genitive-plural":"livădarilor","singular-vocative":"livădarule","plural-vocative":"livădarilor"}},{"word":"Livădariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Livădariu"}},{"word":"Livădaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Livădaru"}},{"word":"Livadea","pos":"name","definitions":["a village in Vărbilău, Prahova County, Romania"],"gender":"f"},{"word":"Livădeanu","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Sterminos"],"gender":"m"},{"word":"Livadia","pos":"name","definitions":["a village in Baru, Hunedoara County, Romania"],"gender":"f"},{"word":"livan","pos":"noun","definitions":["frankincense tree (Boswellia serrata)"],"forms":{"plural":"livani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"livan","accusative-definite-nominative-singular":"livanul","accusative-indefinite-nominative-plural":"livani","accusative-definite-nominative-plural":"livanii","dative-genitive-indefinite-singular":"livan","dative-definite-genitive-singular":"livanului","dative-genitive-indefinite-plural":"livani","dative-definite-genitive-plural":"livanilor","singular-vocative":"livanule","plural-vocative":"livanilor"}},{"word":"livănțică","pos":"noun","definitions":["alternative form of levănțică"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"livănțică","accusative-definite-nominative":"livănțica","dative-genitive-indefinite":"livănțice","dative-definite-genitive":"livănțicei","vocative":"livănțică"}},{"word":"livăzuică","pos":"noun","definitions":["diminutive of livadă"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"livăzuică","accusative-definite-nominative":"livăzuica","dative-genitive-indefinite":"livăzuice","dative-definite-genitive":"livăzuicei","vocative":"livăzuică"}},{"word":"live","pos":"adj","definitions":["live"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"live","error-unrecognized-form-feminine-indefinite-singular":"live","error-unrecognized-form-indefinite-masculine-plural":"live","error-unrecognized-form-feminine-indefinite-neuter-plural":"live","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"live","pos":"adv","definitions":["live"]},{"word":"livede","pos":"noun","definitions":["alternative form of livadă"],"forms":{"plural":"livezi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"livede","accusative-definite-nominative-singular":"livedea","accusative-indefinite-nominative-plural":"livezi","accusative-definite-nominative-plural":"livezile","dative-genitive-indefinite-singular":"livezi","dative-definite-genitive-singular":"livezii","dative-genitive-indefinite-plural":"livezi","dative-definite-genitive-plural":"livezilor","singular-vocative":"livede","plural-vocative":"livezilor"}},{"word":"Livedea","pos":"name","definitions":["a village in Sinești, Ialomița County, Romania"],"gender":"f"},{"word":"Livedeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Livedeanu"}},{"word":"livejoară","pos":"noun","definitions":["diminutive of livadă"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"livejoară","accusative-definite-nominative":"livejoara","dative-genitive-indefinite":"livejoare","dative-definite-genitive":"livejoarei","vocative":"livejoară"}},{"word":"Liveni","pos":"name","definitions":["a village in Manoleasa, Botoșani County, Romania"],"gender":"m"},{"word":"Livezeanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Livezeanu"}},{"word":"Livezeni","pos":"name","definitions":["a village in Stâlpeni, Argeș County, Romania","a commune of Mureș County, Romania","a village in Livezeni, Mureș County, Romania"],"gender":"m"},{"word":"Livezi","pos":"name","definitions":["a commune of Bacău County, Romania","a village in Livezi, Bacău County, Romania","a village in Podari, Dolj County, Romania","a village in Mihăileni, Harghita County, Romania","a village in General Berthelot, Hunedoara County, Romania"],"gender":"m"},{"word":"livezi","pos":"noun","definitions":["plural of livadă"]},{"word":"livezii","pos":"noun","definitions":["definite genitive/dative singular of livadă"]},{"word":"Livezile","pos":"name","definitions":["a commune of Alba County, Romania","a village in Livezile, Alba County, Romania","a commune of Bistrița-Năsăud County, Romania","a village in Livezile, Bistrița-Năsăud County, Romania","a village in Glodeni, Dâmbovița County, Romania"],"gender":"f"},{"word":"livezuie","pos":"noun","definitions":["diminutive of livadă"],"forms":{"plural":"livezui","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"livezuie","accusative-definite-nominative-singular":"livezuia","accusative-indefinite-nominative-plural":"livezui","accusative-definite-nominative-plural":"livezuile","dative-genitive-indefinite-singular":"livezui","dative-definite-genitive-singular":"livezuii","dative-genitive-indefinite-plural":"livezui","dative-definite-genitive-plural":"livezuilor","singular-vocative":"livezuie","plural-vocative":"livezuilor"}},{"word":"livid","pos":"adj","definitions":["livid"],"forms":{"feminine-singular":"lividă","masculine-plural":"livizi","feminine-neuter-plural":"livide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"livid","error-unrecognized-form-feminine-indefinite-singular":"lividă","error-unrecognized-form-indefinite-masculine-plural":"livizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"livide","definite-error-unrecognized-form-masculine-neuter-singular":"lividul","definite-error-unrecognized-form-feminine-singular":"livida","definite-error-unrecognized-form-masculine-plural":"livizii","definite-error-unrecognized-form-feminine-neuter-plural":"lividele"}},{"word":"lividitate","pos":"noun","definitions":["lividity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lividitate","accusative-definite-nominative-singular":"lividitatea","accusative-indefinite-nominative-plural":"lividități","accusative-definite-nominative-plural":"lividitățile","dative-genitive-indefinite-singular":"lividități","dative-definite-genitive-singular":"lividității","dative-genitive-indefinite-plural":"lividități","dative-definite-genitive-plural":"lividităților","singular-vocative":"lividitate","plural-vocative":"lividităților"}},{"word":"living","pos":"noun","definitions":["living room"],"forms":{"plural":"livinguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"living","accusative-definite-nominative-singular":"livingul","accusative-indefinite-nominative-plural":"livinguri","accusative-definite-nominative-plural":"livingurile","dative-genitive-indefinite-singular":"living","dative-definite-genitive-singular":"livingului","dative-genitive-indefinite-plural":"livinguri","dative-definite-genitive-plural":"livingurilor","singular-vocative":"livingule","plural-vocative":"livingurilor"}},{"word":"Liviu","pos":"name","definitions":["a male given name from Latin"],"gender":"m","forms":{"dative-genitive":"lui Liviu","feminine":"Livia"}},{"word":"Liviu Rebreanu","pos":"name","definitions":["a locality in Năsăud, Bistrița-Năsăud County, Romania"],"gender":"m"},{"word":"livra","pos":"verb","definitions":["to deliver"],"forms":{"canonical":"a livra 1st conjugation","present-singular-third-person":"livrează","participle-past":"livrat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a livra","gerund":"livrând","first-person-indicative-present-singular":"livrez","indicative-present-second-person-singular":"livrezi","indicative-present-singular-third-person":"livrează","first-person-indicative-plural-present":"livrăm","indicative-plural-present-second-person":"livrați","indicative-plural-present-third-person":"livrează","first-person-imperfect-indicative-singular":"livram","imperfect-indicative-second-person-singular":"livrai","imperfect-indicative-singular-third-person":"livra","first-person-imperfect-indicative-plural":"livram","imperfect-indicative-plural-second-person":"livrați","imperfect-indicative-plural-third-person":"livrau","first-person-indicative-perfect-singular":"livrai","indicative-perfect-second-person-singular":"livrași","indicative-perfect-singular-third-person":"livră","first-person-indicative-perfect-plural":"livrarăm","indicative-perfect-plural-second-person":"livrarăți","indicative-perfect-plural-third-person":"livrară","first-person-indicative-pluperfect-singular":"livrasem","indicative-pluperfect-second-person-singular":"livraseși","indicative-pluperfect-singular-third-person":"livrase","first-person-indicative-pluperfect-plural":"livraserăm","indicative-pluperfect-plural-second-person":"livraserăți","indicative-pluperfect-plural-third-person":"livraseră","first-person-present-singular-subjunctive":"să livrez","present-second-person-singular-subjunctive":"să livrezi","present-singular-subjunctive-third-person":"să livreze","first-person-plural-present-subjunctive":"să livrăm","plural-present-second-person-subjunctive":"să livrați","plural-present-subjunctive-third-person":"să livreze","imperative-second-person-singular":"livrează","imperative-plural-second-person":"livrați","imperative-negative-second-person-singular":"nu livra","imperative-negative-plural-second-person":"nu livrați"}},{"word":"livră","pos":"noun","definitions":["pound (weight)"],"forms":{"plural":"livre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"livră","accusative-definite-nominative-singular":"livra","accusative-indefinite-nominative-plural":"livre","accusative-definite-nominative-plural":"livrele","dative-genitive-indefinite-singular":"livre","dative-definite-genitive-singular":"livrei","dative-genitive-indefinite-plural":"livre","dative-definite-genitive-plural":"livrelor","singular-vocative":"livră","plural-vocative":"livrelor"}},{"word":"livrabil","pos":"adj","definitions":["deliverable"],"forms":{"feminine-singular":"livrabilă","masculine-plural":"livrabili","feminine-neuter-plural":"livrabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"livrabil","error-unrecognized-form-feminine-indefinite-singular":"livrabilă","error-unrecognized-form-indefinite-masculine-plural":"livrabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"livrabile","definite-error-unrecognized-form-masculine-neuter-singular":"livrabilul","definite-error-unrecognized-form-feminine-singular":"livrabila","definite-error-unrecognized-form-masculine-plural":"livrabilii","definite-error-unrecognized-form-feminine-neuter-plural":"livrabilele"}},{"word":"livrare","pos":"noun","definitions":["delivery"],"forms":{"plural":"livrări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"livrare","accusative-definite-nominative-singular":"livrarea","accusative-indefinite-nominative-plural":"livrări","accusative-definite-nominative-plural":"livrările","dative-genitive-indefinite-singular":"livrări","dative-definite-genitive-singular":"livrării","dative-genitive-indefinite-plural":"livrări","dative-definite-genitive-plural":"livrărilor","singular-vocative":"livrare","plural-vocative":"livrărilor"}},{"word":"livrea","pos":"noun","definitions":["livery (uniform)"],"forms":{"plural":"livrele","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"livrea","accusative-definite-nominative-singular":"livreaua","accusative-indefinite-nominative-plural":"livrele","accusative-definite-nominative-plural":"livrelele","dative-genitive-indefinite-singular":"livrele","dative-definite-genitive-singular":"livrelei","dative-genitive-indefinite-plural":"livrele","dative-definite-genitive-plural":"livrelelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"livresc","pos":"adj","definitions":["bookish"],"forms":{"feminine-singular":"livrească","plural":"livrești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"livresc","error-unrecognized-form-feminine-indefinite-singular":"livrească","error-unrecognized-form-indefinite-masculine-plural":"livrești","error-unrecognized-form-feminine-indefinite-neuter-plural":"livrești","definite-error-unrecognized-form-masculine-neuter-singular":"livrescul","definite-error-unrecognized-form-feminine-singular":"livreasca","definite-error-unrecognized-form-masculine-plural":"livreștii","definite-error-unrecognized-form-feminine-neuter-plural":"livreștile"}},{"word":"livret","pos":"noun","definitions":["booklet"],"forms":{"plural":"livrete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"livret","accusative-definite-nominative-singular":"livretul","accusative-indefinite-nominative-plural":"livrete","accusative-definite-nominative-plural":"livretele","dative-genitive-indefinite-singular":"livret","dative-definite-genitive-singular":"livretului","dative-genitive-indefinite-plural":"livrete","dative-definite-genitive-plural":"livretelor","singular-vocative":"livretule","plural-vocative":"livretelor"}},{"word":"Lixăndroaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Lixăndroaia"}},{"word":"Lixeanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lixeanu"}},{"word":"liză","pos":"noun","definitions":["lysis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"liză","accusative-definite-nominative-singular":"liza","accusative-indefinite-nominative-plural":"lize","accusative-definite-nominative-plural":"lizele","dative-genitive-indefinite-singular":"lize","dative-definite-genitive-singular":"lizei","dative-genitive-indefinite-plural":"lize","dative-definite-genitive-plural":"lizelor","singular-vocative":"liză","plural-vocative":"lizelor"}},{"word":"lizeuză","pos":"noun","definitions":["reading light"],"forms":{"plural":"lizeuze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lizeuză","accusative-definite-nominative-singular":"lizeuza","accusative-indefinite-nominative-plural":"lizeuze","accusative-definite-nominative-plural":"lizeuzele","dative-genitive-indefinite-singular":"lizeuze","dative-definite-genitive-singular":"lizeuzei","dative-genitive-indefinite-plural":"lizeuze","dative-definite-genitive-plural":"lizeuzelor","singular-vocative":"lizeuză","plural-vocative":"lizeuzelor"}},{"word":"lizibil","pos":"adj","definitions":["legible, readable"],"pronunciation":"/liˈzi.bil/","forms":{"feminine-singular":"lizibilă","masculine-plural":"lizibili","feminine-neuter-plural":"lizibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lizibil","error-unrecognized-form-feminine-indefinite-singular":"lizibilă","error-unrecognized-form-indefinite-masculine-plural":"lizibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"lizibile","definite-error-unrecognized-form-masculine-neuter-singular":"lizibilul","definite-error-unrecognized-form-feminine-singular":"lizibila","definite-error-unrecognized-form-masculine-plural":"lizibilii","definite-error-unrecognized-form-feminine-neuter-plural":"lizibilele"}},{"word":"lizibilitate","pos":"noun","definitions":["legibility"],"forms":{"plural":"lizibilități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lizibilitate","accusative-definite-nominative-singular":"lizibilitatea","accusative-indefinite-nominative-plural":"lizibilități","accusative-definite-nominative-plural":"lizibilitățile","dative-genitive-indefinite-singular":"lizibilități","dative-definite-genitive-singular":"lizibilității","dative-genitive-indefinite-plural":"lizibilități","dative-definite-genitive-plural":"lizibilităților","singular-vocative":"lizibilitate","plural-vocative":"lizibilităților"}},{"word":"lizieră","pos":"noun","definitions":["edge (of a forest, a lake, etc.)"],"forms":{"plural":"liziere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lizieră","accusative-definite-nominative-singular":"liziera","accusative-indefinite-nominative-plural":"liziere","accusative-definite-nominative-plural":"lizierele","dative-genitive-indefinite-singular":"liziere","dative-definite-genitive-singular":"lizierei","dative-genitive-indefinite-plural":"liziere","dative-definite-genitive-plural":"lizierelor","singular-vocative":"lizieră","plural-vocative":"lizierelor"}},{"word":"lizigen","pos":"adj","definitions":["lysigenous"],"forms":{"feminine-singular":"lizigenă","masculine-plural":"lizigeni","feminine-neuter-plural":"lizigene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lizigen","error-unrecognized-form-feminine-indefinite-singular":"lizigenă","error-unrecognized-form-indefinite-masculine-plural":"lizigeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"lizigene","definite-error-unrecognized-form-masculine-neuter-singular":"lizigenul","definite-error-unrecognized-form-feminine-singular":"lizigena","definite-error-unrecognized-form-masculine-plural":"lizigenii","definite-error-unrecognized-form-feminine-neuter-plural":"lizigenele"}},{"word":"lizimetru","pos":"noun","definitions":["lysimeter"],"forms":{"plural":"lizimetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lizimetru","accusative-definite-nominative-singular":"lizimetrul","accusative-indefinite-nominative-plural":"lizimetre","accusative-definite-nominative-plural":"lizimetrele","dative-genitive-indefinite-singular":"lizimetru","dative-definite-genitive-singular":"lizimetrului","dative-genitive-indefinite-plural":"lizimetre","dative-definite-genitive-plural":"lizimetrelor","singular-vocative":"lizimetrule","plural-vocative":"lizimetrelor"}},{"word":"lizina","pos":"noun","definitions":["definite nominative/accusative singular of lizină"],"gender":"f"},{"word":"lizină","pos":"noun","definitions":["lysine"],"forms":{"plural":"lizine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lizină","accusative-definite-nominative-singular":"lizina","accusative-indefinite-nominative-plural":"lizine","accusative-definite-nominative-plural":"lizinele","dative-genitive-indefinite-singular":"lizine","dative-definite-genitive-singular":"lizinei","dative-genitive-indefinite-plural":"lizine","dative-definite-genitive-plural":"lizinelor","singular-vocative":"lizină","plural-vocative":"lizinelor"}},{"word":"lizozimă","pos":"noun","definitions":["lysozyme"],"forms":{"plural":"lizozime","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lizozimă","accusative-definite-nominative-singular":"lizozima","accusative-indefinite-nominative-plural":"lizozime","accusative-definite-nominative-plural":"lizozimele","dative-genitive-indefinite-singular":"lizozime","dative-definite-genitive-singular":"lizozimei","dative-genitive-indefinite-plural":"lizozime","dative-definite-genitive-plural":"lizozimelor","singular-vocative":"lizozimă","plural-vocative":"lizozimelor"}},{"word":"Ljubljana","pos":"name","definitions":["Ljubljana (the capital city of Slovenia)"],"gender":"f"},{"word":"loaial","pos":"adj","definitions":["alternative form of loial"],"forms":{"feminine-singular":"loaială","masculine-plural":"loaiali","feminine-neuter-plural":"loaiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"loaial","error-unrecognized-form-feminine-indefinite-singular":"loaială","error-unrecognized-form-indefinite-masculine-plural":"loaiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"loaiale","definite-error-unrecognized-form-masculine-neuter-singular":"loaialul","definite-error-unrecognized-form-feminine-singular":"loaiala","definite-error-unrecognized-form-masculine-plural":"loaialii","definite-error-unrecognized-form-feminine-neuter-plural":"loaialele"}},{"word":"loaialism","pos":"noun","definitions":["alternative form of loialism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"loaialism","accusative-definite-nominative":"loaialismul","dative-genitive-indefinite":"loaialism","dative-definite-genitive":"loaialismului","vocative":"loaialismule"}},{"word":"loaialist","pos":"noun","definitions":["alternative form of loialist"],"forms":{"plural":"loaialiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"loaialist","accusative-definite-nominative-singular":"loaialistul","accusative-indefinite-nominative-plural":"loaialiști","accusative-definite-nominative-plural":"loaialiștii","dative-genitive-indefinite-singular":"loaialist","dative-definite-genitive-singular":"loaialistului","dative-genitive-indefinite-plural":"loaialiști","dative-definite-genitive-plural":"loaialiștilor","singular-vocative":"loaialistule","plural-vocative":"loaialiștilor"}},{"word":"loaialistă","pos":"noun","definitions":["female equivalent of loaialist"],"forms":{"plural":"loaialiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"loaialistă","accusative-definite-nominative-singular":"loaialista","accusative-indefinite-nominative-plural":"loaialiste","accusative-definite-nominative-plural":"loaialistele","dative-genitive-indefinite-singular":"loaialiste","dative-definite-genitive-singular":"loaialistei","dative-genitive-indefinite-plural":"loaialiste","dative-definite-genitive-plural":"loaialistelor","singular-vocative":"loaialistă","plural-vocative":"loaialistelor"}},{"word":"loaialitate","pos":"noun","definitions":["alternative form of loialitate"]},{"word":"Loaieș","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Loaieș"}},{"word":"loajă","pos":"noun","definitions":["lie; deception"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"loajă","accusative-definite-nominative":"loaja","dative-genitive-indefinite":"loaje","dative-definite-genitive":"loajei","vocative":"loajă"}},{"word":"loare","pos":"noun","definitions":["obsolete form of luare"],"forms":{"plural":"loări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"loare","accusative-definite-nominative-singular":"loarea","accusative-indefinite-nominative-plural":"loări","accusative-definite-nominative-plural":"loările","dative-genitive-indefinite-singular":"loări","dative-definite-genitive-singular":"loării","dative-genitive-indefinite-plural":"loări","dative-definite-genitive-plural":"loărilor","singular-vocative":"loare","plural-vocative":"loărilor"}},{"word":"loaza","pos":"noun","definitions":["definite nominative/accusative singular of loază"],"gender":"f"},{"word":"loază","pos":"noun","definitions":["vine","cunning man, good-for-nothing"],"forms":{"plural":"loaze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"loază","accusative-definite-nominative-singular":"loaza","accusative-indefinite-nominative-plural":"loaze","accusative-definite-nominative-plural":"loazele","dative-genitive-indefinite-singular":"loaze","dative-definite-genitive-singular":"loazei","dative-genitive-indefinite-plural":"loaze","dative-definite-genitive-plural":"loazelor","singular-vocative":"loază","plural-vocative":"loazelor"}},{"word":"lob","pos":"noun","definitions":["lobe"],"forms":{"plural":"lobi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lob","accusative-definite-nominative-singular":"lobul","accusative-indefinite-nominative-plural":"lobi","accusative-definite-nominative-plural":"lobii","dative-genitive-indefinite-singular":"lob","dative-definite-genitive-singular":"lobului","dative-genitive-indefinite-plural":"lobi","dative-definite-genitive-plural":"lobilor","singular-vocative":"lobule","plural-vocative":"lobilor"}},{"word":"lob frontal","pos":"noun","definitions":["frontal lobe"],"forms":{"plural":"loburi frontale"}},{"word":"lob occipital","pos":"noun","definitions":["occipital lobe"],"forms":{"plural":"loburi occipitale"}},{"word":"lob parietal","pos":"noun","definitions":["parietal lobe"],"forms":{"plural":"loburi parietale"}},{"word":"lob temporal","pos":"noun","definitions":["temporal lobe"],"forms":{"plural":"loburi temporale"}},{"word":"loba","pos":"verb","definitions":["to lob"],"forms":{"canonical":"a loba 1st conjugation","present-singular-third-person":"lobează","participle-past":"lobat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a loba","gerund":"lobând","first-person-indicative-present-singular":"lobez","indicative-present-second-person-singular":"lobezi","indicative-present-singular-third-person":"lobează","first-person-indicative-plural-present":"lobăm","indicative-plural-present-second-person":"lobați","indicative-plural-present-third-person":"lobează","first-person-imperfect-indicative-singular":"lobam","imperfect-indicative-second-person-singular":"lobai","imperfect-indicative-singular-third-person":"loba","first-person-imperfect-indicative-plural":"lobam","imperfect-indicative-plural-second-person":"lobați","imperfect-indicative-plural-third-person":"lobau","first-person-indicative-perfect-singular":"lobai","indicative-perfect-second-person-singular":"lobași","indicative-perfect-singular-third-person":"lobă","first-person-indicative-perfect-plural":"lobarăm","indicative-perfect-plural-second-person":"lobarăți","indicative-perfect-plural-third-person":"lobară","first-person-indicative-pluperfect-singular":"lobasem","indicative-pluperfect-second-person-singular":"lobaseși","indicative-pluperfect-singular-third-person":"lobase","first-person-indicative-pluperfect-plural":"lobaserăm","indicative-pluperfect-plural-second-person":"lobaserăți","indicative-pluperfect-plural-third-person":"lobaseră","first-person-present-singular-subjunctive":"să lobez","present-second-person-singular-subjunctive":"să lobezi","present-singular-subjunctive-third-person":"să lobeze","first-person-plural-present-subjunctive":"să lobăm","plural-present-second-person-subjunctive":"să lobați","plural-present-subjunctive-third-person":"să lobeze","imperative-second-person-singular":"lobează","imperative-plural-second-person":"lobați","imperative-negative-second-person-singular":"nu loba","imperative-negative-plural-second-person":"nu lobați"}},{"word":"lobar","pos":"adj","definitions":["lobar"],"forms":{"feminine-singular":"lobară","masculine-plural":"lobari","feminine-neuter-plural":"lobare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lobar","error-unrecognized-form-feminine-indefinite-singular":"lobară","error-unrecognized-form-indefinite-masculine-plural":"lobari","error-unrecognized-form-feminine-indefinite-neuter-plural":"lobare","definite-error-unrecognized-form-masculine-neuter-singular":"lobarul","definite-error-unrecognized-form-feminine-singular":"lobara","definite-error-unrecognized-form-masculine-plural":"lobarii","definite-error-unrecognized-form-feminine-neuter-plural":"lobarele"}},{"word":"lobat","pos":"adj","definitions":["lobate"],"forms":{"feminine-singular":"lobată","masculine-plural":"lobați","feminine-neuter-plural":"lobate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lobat","error-unrecognized-form-feminine-indefinite-singular":"lobată","error-unrecognized-form-indefinite-masculine-plural":"lobați","error-unrecognized-form-feminine-indefinite-neuter-plural":"lobate","definite-error-unrecognized-form-masculine-neuter-singular":"lobatul","definite-error-unrecognized-form-feminine-singular":"lobata","definite-error-unrecognized-form-masculine-plural":"lobații","definite-error-unrecognized-form-feminine-neuter-plural":"lobatele"}},{"word":"lobby","pos":"noun","definitions":["lobby"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lobby","accusative-definite-nominative":"lobbyul","dative-genitive-indefinite":"lobby","dative-definite-genitive":"lobbyului","vocative":"lobbyule"}},{"word":"lobbying","pos":"noun","definitions":["lobbying"],"forms":{"plural":"lobbyinguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lobbying","accusative-definite-nominative-singular":"lobbyingul","accusative-indefinite-nominative-plural":"lobbyinguri","accusative-definite-nominative-plural":"lobbyingurile","dative-genitive-indefinite-singular":"lobbying","dative-definite-genitive-singular":"lobbyingului","dative-genitive-indefinite-plural":"lobbyinguri","dative-definite-genitive-plural":"lobbyingurilor","singular-vocative":"lobbyingule","plural-vocative":"lobbyingurilor"}},{"word":"lobbyism","pos":"noun","definitions":["lobbyism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lobbyism","accusative-definite-nominative":"lobbyismul","dative-genitive-indefinite":"lobbyism","dative-definite-genitive":"lobbyismului","vocative":"lobbyismule"}},{"word":"lobbyist","pos":"noun","definitions":["lobbyist"],"pronunciation":"/lo.biˈist/","forms":{"plural":"lobbyiști","feminine":"equivalent lobbyistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lobbyist","accusative-definite-nominative-singular":"lobbyistul","accusative-indefinite-nominative-plural":"lobbyiști","accusative-definite-nominative-plural":"lobbyiștii","dative-genitive-indefinite-singular":"lobbyist","dative-definite-genitive-singular":"lobbyistului","dative-genitive-indefinite-plural":"lobbyiști","dative-definite-genitive-plural":"lobbyiștilor","singular-vocative":"lobbyistule","plural-vocative":"lobbyiștilor"}},{"word":"lobbyistă","pos":"noun","definitions":["female equivalent of lobbyist"],"pronunciation":"/lo.biˈis.tə/","forms":{"plural":"lobbyiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"lobbyistă","accusative-definite-nominative-singular":"lobbyista","accusative-indefinite-nominative-plural":"lobbyiste","accusative-definite-nominative-plural":"lobbyistele","dative-genitive-indefinite-singular":"lobbyiste","dative-definite-genitive-singular":"lobbyistei","dative-genitive-indefinite-plural":"lobbyiste","dative-definite-genitive-plural":"lobbyistelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"lobbyiste","pos":"noun","definitions":["plural of lobbyistă"],"gender":"f"},{"word":"lobbyiști","pos":"noun","definitions":["plural of lobbyist"],"gender":"m"},{"word":"lobdă","pos":"noun","definitions":["alternative form of lodbă"],"forms":{"plural":"lobde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lobdă","accusative-definite-nominative-singular":"lobda","accusative-indefinite-nominative-plural":"lobde","accusative-definite-nominative-plural":"lobdele","dative-genitive-indefinite-singular":"lobde","dative-definite-genitive-singular":"lobdei","dative-genitive-indefinite-plural":"lobde","dative-definite-genitive-plural":"lobdelor","singular-vocative":"lobdă","plural-vocative":"lobdelor"}},{"word":"lobectomie","pos":"noun","definitions":["lobectomy"],"forms":{"plural":"lobectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lobectomie","accusative-definite-nominative-singular":"lobectomia","accusative-indefinite-nominative-plural":"lobectomii","accusative-definite-nominative-plural":"lobectomiile","dative-genitive-indefinite-singular":"lobectomii","dative-definite-genitive-singular":"lobectomiei","dative-genitive-indefinite-plural":"lobectomii","dative-definite-genitive-plural":"lobectomiilor","singular-vocative":"lobectomie","plural-vocative":"lobectomiilor"}},{"word":"lobelie","pos":"noun","definitions":["lobelia"],"forms":{"plural":"lobelii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lobelie","accusative-definite-nominative-singular":"lobelia","accusative-indefinite-nominative-plural":"lobelii","accusative-definite-nominative-plural":"lobeliile","dative-genitive-indefinite-singular":"lobelii","dative-definite-genitive-singular":"lobeliei","dative-genitive-indefinite-plural":"lobelii","dative-definite-genitive-plural":"lobeliilor","singular-vocative":"lobelie","plural-vocative":"lobeliilor"}},{"word":"lobelină","pos":"noun","definitions":["lobeline"],"forms":{"plural":"lobeline","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lobelină","accusative-definite-nominative-singular":"lobelina","accusative-indefinite-nominative-plural":"lobeline","accusative-definite-nominative-plural":"lobelinele","dative-genitive-indefinite-singular":"lobeline","dative-definite-genitive-singular":"lobelinei","dative-genitive-indefinite-plural":"lobeline","dative-definite-genitive-plural":"lobelinelor","singular-vocative":"lobelină","plural-vocative":"lobelinelor"}},{"word":"lobită","pos":"noun","definitions":["lobitis"],"forms":{"plural":"lobite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lobită","accusative-definite-nominative-singular":"lobita","accusative-indefinite-nominative-plural":"lobite","accusative-definite-nominative-plural":"lobitele","dative-genitive-indefinite-singular":"lobite","dative-definite-genitive-singular":"lobitei","dative-genitive-indefinite-plural":"lobite","dative-definite-genitive-plural":"lobitelor","singular-vocative":"lobită","plural-vocative":"lobitelor"}},{"word":"Lobodă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lobodă"}},{"word":"lobodă","pos":"noun","definitions":["mountain spinach (Atriplex hortensis)"],"forms":{"plural":"lobode","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lobodă","accusative-definite-nominative-singular":"loboda","accusative-indefinite-nominative-plural":"lobode","accusative-definite-nominative-plural":"lobodele","dative-genitive-indefinite-singular":"lobode","dative-definite-genitive-singular":"lobodei","dative-genitive-indefinite-plural":"lobode","dative-definite-genitive-plural":"lobodelor","singular-vocative":"lobodă","plural-vocative":"lobodelor"}},{"word":"Lobodaș","pos":"name","definitions":["a village in Ploscoș, Cluj County, Romania"],"gender":"m"},{"word":"lobodiță","pos":"noun","definitions":["red lungwort (Pulmonaria rubra)"],"forms":{"plural":"lobodițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lobodiță","accusative-definite-nominative-singular":"lobodița","accusative-indefinite-nominative-plural":"lobodițe","accusative-definite-nominative-plural":"lobodițele","dative-genitive-indefinite-singular":"lobodițe","dative-definite-genitive-singular":"lobodiței","dative-genitive-indefinite-plural":"lobodițe","dative-definite-genitive-plural":"lobodițelor","singular-vocative":"lobodiță","plural-vocative":"lobodițelor"}},{"word":"lobonț","pos":"noun","definitions":["a soldier who fought for the cause of the Habsburg Empire during the anti-Hapsburg movement in Hungary and Transylvania"],"pronunciation":"/loˈbont͡s/","forms":{"plural":"lobonți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lobonț","accusative-definite-nominative-singular":"lobonțul","accusative-indefinite-nominative-plural":"lobonți","accusative-definite-nominative-plural":"lobonții","dative-genitive-indefinite-singular":"lobonț","dative-definite-genitive-singular":"lobonțului","dative-genitive-indefinite-plural":"lobonți","dative-definite-genitive-plural":"lobonților","singular-vocative":"lobonțule","plural-vocative":"lobonților"}},{"word":"lobotomie","pos":"noun","definitions":["lobotomy"],"forms":{"plural":"lobotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lobotomie","accusative-definite-nominative-singular":"lobotomia","accusative-indefinite-nominative-plural":"lobotomii","accusative-definite-nominative-plural":"lobotomiile","dative-genitive-indefinite-singular":"lobotomii","dative-definite-genitive-singular":"lobotomiei","dative-genitive-indefinite-plural":"lobotomii","dative-definite-genitive-plural":"lobotomiilor","singular-vocative":"lobotomie","plural-vocative":"lobotomiilor"}},{"word":"lobul","pos":"noun","definitions":["lobule"],"forms":{"plural":"lobuli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lobul","accusative-definite-nominative-singular":"lobulul","accusative-indefinite-nominative-plural":"lobuli","accusative-definite-nominative-plural":"lobulii","dative-genitive-indefinite-singular":"lobul","dative-definite-genitive-singular":"lobulului","dative-genitive-indefinite-plural":"lobuli","dative-definite-genitive-plural":"lobulilor","singular-vocative":"lobulule","plural-vocative":"lobulilor"}},{"word":"lobul occipital","pos":"noun","definitions":["occipital lobe"]},{"word":"lobular","pos":"adj","definitions":["lobular"],"forms":{"feminine-singular":"lobulară","masculine-plural":"lobulari","feminine-neuter-plural":"lobulare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lobular","error-unrecognized-form-feminine-indefinite-singular":"lobulară","error-unrecognized-form-indefinite-masculine-plural":"lobulari","error-unrecognized-form-feminine-indefinite-neuter-plural":"lobulare","definite-error-unrecognized-form-masculine-neuter-singular":"lobularul","definite-error-unrecognized-form-feminine-singular":"lobulara","definite-error-unrecognized-form-masculine-plural":"lobularii","definite-error-unrecognized-form-feminine-neuter-plural":"lobularele"}},{"word":"lobulat","pos":"adj","definitions":["lobulated"],"forms":{"feminine-singular":"lobulată","masculine-plural":"lobulați","feminine-neuter-plural":"lobulate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lobulat","error-unrecognized-form-feminine-indefinite-singular":"lobulată","error-unrecognized-form-indefinite-masculine-plural":"lobulați","error-unrecognized-form-feminine-indefinite-neuter-plural":"lobulate","definite-error-unrecognized-form-masculine-neuter-singular":"lobulatul","definite-error-unrecognized-form-feminine-singular":"lobulata","definite-error-unrecognized-form-masculine-plural":"lobulații","definite-error-unrecognized-form-feminine-neuter-plural":"lobulatele"}},{"word":"lobușor","pos":"noun","definitions":["diminutive of lob"],"forms":{"plural":"lobușori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lobușor","accusative-definite-nominative-singular":"lobușorul","accusative-indefinite-nominative-plural":"lobușori","accusative-definite-nominative-plural":"lobușorii","dative-genitive-indefinite-singular":"lobușor","dative-definite-genitive-singular":"lobușorului","dative-genitive-indefinite-plural":"lobușori","dative-definite-genitive-plural":"lobușorilor","singular-vocative":"lobușorule","plural-vocative":"lobușorilor"}},{"word":"lobut","pos":"noun","definitions":["a short and thick stick used by the Ottoman soldiers"],"forms":{"plural":"lobuturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lobut","accusative-definite-nominative-singular":"lobutul","accusative-indefinite-nominative-plural":"lobuturi","accusative-definite-nominative-plural":"lobuturile","dative-genitive-indefinite-singular":"lobut","dative-definite-genitive-singular":"lobutului","dative-genitive-indefinite-plural":"lobuturi","dative-definite-genitive-plural":"lobuturilor","singular-vocative":"lobutule","plural-vocative":"lobuturilor"}},{"word":"loc","pos":"noun","definitions":["place, location","stead"],"pronunciation":"/lok/","forms":{"plural":"locuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"loc","accusative-definite-nominative-singular":"locul","accusative-indefinite-nominative-plural":"locuri","accusative-definite-nominative-plural":"locurile","dative-genitive-indefinite-singular":"loc","dative-definite-genitive-singular":"locului","dative-genitive-indefinite-plural":"locuri","dative-definite-genitive-plural":"locurilor","singular-vocative":"locule","plural-vocative":"locurilor"}},{"word":"loc de joacă","pos":"noun","definitions":["playground"],"forms":{"plural":"locuri de joacă"}},{"word":"loc de muncă","pos":"noun","definitions":["workplace"],"forms":{"plural":"locuri de muncă"}},{"word":"loc de parcare","pos":"noun","definitions":["parking space"],"forms":{"plural":"locuri de parcare"}},{"word":"loc de veci","pos":"noun","definitions":["grave"],"forms":{"plural":"locuri de veci"}},{"word":"loc.","pos":"noun","definitions":["abbreviation of locuitor (“inhabitant”)","abbreviation of localitate (“locality”)","abbreviation of locuțiune (“phrase, locution”)"]},{"word":"local","pos":"adj","definitions":["local"],"pronunciation":"/loˈkal/","forms":{"feminine-singular":"locală","masculine-plural":"locali","feminine-neuter-plural":"locale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"local","error-unrecognized-form-feminine-indefinite-singular":"locală","error-unrecognized-form-indefinite-masculine-plural":"locali","error-unrecognized-form-feminine-indefinite-neuter-plural":"locale","definite-error-unrecognized-form-masculine-neuter-singular":"localul","definite-error-unrecognized-form-feminine-singular":"locala","definite-error-unrecognized-form-masculine-plural":"localii","definite-error-unrecognized-form-feminine-neuter-plural":"localele"}},{"word":"localemente","pos":"adv","definitions":["locally"]},{"word":"localicește","pos":"adv","definitions":["locally"]},{"word":"localism","pos":"noun","definitions":["localism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"localism","accusative-definite-nominative":"localismul","dative-genitive-indefinite":"localism","dative-definite-genitive":"localismului","vocative":"localismule"}},{"word":"localist","pos":"adj","definitions":["localist"],"forms":{"feminine-singular":"localistă","masculine-plural":"localiști","feminine-neuter-plural":"localiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"localist","error-unrecognized-form-feminine-indefinite-singular":"localistă","error-unrecognized-form-indefinite-masculine-plural":"localiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"localiste","definite-error-unrecognized-form-masculine-neuter-singular":"localistul","definite-error-unrecognized-form-feminine-singular":"localista","definite-error-unrecognized-form-masculine-plural":"localiștii","definite-error-unrecognized-form-feminine-neuter-plural":"localistele"}},{"word":"localist","pos":"noun","definitions":["localistic"],"forms":{"plural":"localiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"localist","accusative-definite-nominative-singular":"localistul","accusative-indefinite-nominative-plural":"localiști","accusative-definite-nominative-plural":"localiștii","dative-genitive-indefinite-singular":"localist","dative-definite-genitive-singular":"localistului","dative-genitive-indefinite-plural":"localiști","dative-definite-genitive-plural":"localiștilor","singular-vocative":"localistule","plural-vocative":"localiștilor"}},{"word":"localitate","pos":"noun","definitions":["locality"],"pronunciation":"[lo.ka.liˈta.te]","forms":{"plural":"localități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative-singular":"localitate","accusative-definite-nominative-singular":"localitatea","accusative-indefinite-nominative-plural":"localități","accusative-definite-nominative-plural":"localitățile","dative-genitive-indefinite-singular":"localități","dative-definite-genitive-singular":"localității","dative-genitive-indefinite-plural":"localități","dative-definite-genitive-plural":"localităților","singular-vocative":"localitate","plural-vocative":"localităților"}},{"word":"localiza","pos":"verb","definitions":["to locate"],"forms":{"canonical":"a localiza 1st conjugation","present-singular-third-person":"localizează","participle-past":"localizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a localiza","gerund":"localizând","first-person-indicative-present-singular":"localizez","indicative-present-second-person-singular":"localizezi","indicative-present-singular-third-person":"localizează","first-person-indicative-plural-present":"localizăm","indicative-plural-present-second-person":"localizați","indicative-plural-present-third-person":"localizează","first-person-imperfect-indicative-singular":"localizam","imperfect-indicative-second-person-singular":"localizai","imperfect-indicative-singular-third-person":"localiza","first-person-imperfect-indicative-plural":"localizam","imperfect-indicative-plural-second-person":"localizați","imperfect-indicative-plural-third-person":"localizau","first-person-indicative-perfect-singular":"localizai","indicative-perfect-second-person-singular":"localizași","indicative-perfect-singular-third-person":"localiză","first-person-indicative-perfect-plural":"localizarăm","indicative-perfect-plural-second-person":"localizarăți","indicative-perfect-plural-third-person":"localizară","first-person-indicative-pluperfect-singular":"localizasem","indicative-pluperfect-second-person-singular":"localizaseși","indicative-pluperfect-singular-third-person":"localizase","first-person-indicative-pluperfect-plural":"localizaserăm","indicative-pluperfect-plural-second-person":"localizaserăți","indicative-pluperfect-plural-third-person":"localizaseră","first-person-present-singular-subjunctive":"să localizez","present-second-person-singular-subjunctive":"să localizezi","present-singular-subjunctive-third-person":"să localizeze","first-person-plural-present-subjunctive":"să localizăm","plural-present-second-person-subjunctive":"să localizați","plural-present-subjunctive-third-person":"să localizeze","imperative-second-person-singular":"localizează","imperative-plural-second-person":"localizați","imperative-negative-second-person-singular":"nu localiza","imperative-negative-plural-second-person":"nu localizați"}}];
@@ -0,0 +1 @@
+export default [{"word":"localizabil","pos":"adj","definitions":["locatable"],"forms":{"feminine-singular":"localizabilă","masculine-plural":"localizabili","feminine-neuter-plural":"localizabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"localizabil","error-unrecognized-form-feminine-indefinite-singular":"localizabilă","error-unrecognized-form-indefinite-masculine-plural":"localizabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"localizabile","definite-error-unrecognized-form-masculine-neuter-singular":"localizabilul","definite-error-unrecognized-form-feminine-singular":"localizabila","definite-error-unrecognized-form-masculine-plural":"localizabilii","definite-error-unrecognized-form-feminine-neuter-plural":"localizabilele"}},{"word":"localizare","pos":"noun","definitions":["localization"],"forms":{"plural":"localizări"}},{"word":"localizări","pos":"noun","definitions":["plural of localizare"]},{"word":"localizat","pos":"adj","definitions":["located","localized"],"forms":{"feminine-singular":"localizată","masculine-plural":"localizați","feminine-neuter-plural":"localizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"localizat","error-unrecognized-form-feminine-indefinite-singular":"localizată","error-unrecognized-form-indefinite-masculine-plural":"localizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"localizate","definite-error-unrecognized-form-masculine-neuter-singular":"localizatul","definite-error-unrecognized-form-feminine-singular":"localizata","definite-error-unrecognized-form-masculine-plural":"localizații","definite-error-unrecognized-form-feminine-neuter-plural":"localizatele"}},{"word":"localizație","pos":"noun","definitions":["localization"],"forms":{"plural":"localizații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"localizație","accusative-definite-nominative-singular":"localizația","accusative-indefinite-nominative-plural":"localizații","accusative-definite-nominative-plural":"localizațiile","dative-genitive-indefinite-singular":"localizații","dative-definite-genitive-singular":"localizației","dative-genitive-indefinite-plural":"localizații","dative-definite-genitive-plural":"localizațiilor","singular-vocative":"localizație","plural-vocative":"localizațiilor"}},{"word":"localizator","pos":"noun","definitions":["locator"],"forms":{"plural":"localizatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"localizator","accusative-definite-nominative-singular":"localizatorul","accusative-indefinite-nominative-plural":"localizatori","accusative-definite-nominative-plural":"localizatorii","dative-genitive-indefinite-singular":"localizator","dative-definite-genitive-singular":"localizatorului","dative-genitive-indefinite-plural":"localizatori","dative-definite-genitive-plural":"localizatorilor","singular-vocative":"localizatorule","plural-vocative":"localizatorilor"}},{"word":"localizez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of localiza"]},{"word":"localnic","pos":"noun","definitions":["local"],"forms":{"plural":"localnici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"localnic","accusative-definite-nominative-singular":"localnicul","accusative-indefinite-nominative-plural":"localnici","accusative-definite-nominative-plural":"localnicii","dative-genitive-indefinite-singular":"localnic","dative-definite-genitive-singular":"localnicului","dative-genitive-indefinite-plural":"localnici","dative-definite-genitive-plural":"localnicilor","singular-vocative":"localnicule","plural-vocative":"localnicilor"}},{"word":"localnică","pos":"noun","definitions":["female equivalent of localnic"],"forms":{"plural":"localnice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"localnică","accusative-definite-nominative-singular":"localnica","accusative-indefinite-nominative-plural":"localnice","accusative-definite-nominative-plural":"localnicele","dative-genitive-indefinite-singular":"localnice","dative-definite-genitive-singular":"localnicei","dative-genitive-indefinite-plural":"localnice","dative-definite-genitive-plural":"localnicelor","singular-vocative":"localnică","plural-vocative":"localnicelor"}},{"word":"locandă","pos":"noun","definitions":["alternative form of locantă"],"forms":{"plural":"locande","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"locandă","accusative-definite-nominative-singular":"locanda","accusative-indefinite-nominative-plural":"locande","accusative-definite-nominative-plural":"locandele","dative-genitive-indefinite-singular":"locande","dative-definite-genitive-singular":"locandei","dative-genitive-indefinite-plural":"locande","dative-definite-genitive-plural":"locandelor","singular-vocative":"locandă","plural-vocative":"locandelor"}},{"word":"locandier","pos":"noun","definitions":["alternative form of locantier"],"forms":{"plural":"locandieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"locandier","accusative-definite-nominative-singular":"locandierul","accusative-indefinite-nominative-plural":"locandieri","accusative-definite-nominative-plural":"locandierii","dative-genitive-indefinite-singular":"locandier","dative-definite-genitive-singular":"locandierului","dative-genitive-indefinite-plural":"locandieri","dative-definite-genitive-plural":"locandierilor","singular-vocative":"locandierule","plural-vocative":"locandierilor"}},{"word":"locandioară","pos":"noun","definitions":["diminutive of locandă"],"forms":{"plural":"locandioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"locandioară","accusative-definite-nominative-singular":"locandioara","accusative-indefinite-nominative-plural":"locandioare","accusative-definite-nominative-plural":"locandioarele","dative-genitive-indefinite-singular":"locandioare","dative-definite-genitive-singular":"locandioarei","dative-genitive-indefinite-plural":"locandioare","dative-definite-genitive-plural":"locandioarelor","singular-vocative":"locandioară","plural-vocative":"locandioarelor"}},{"word":"locantă","pos":"noun","definitions":["inn"],"forms":{"plural":"locante","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"locantă","accusative-definite-nominative-singular":"locanta","accusative-indefinite-nominative-plural":"locante","accusative-definite-nominative-plural":"locantele","dative-genitive-indefinite-singular":"locante","dative-definite-genitive-singular":"locantei","dative-genitive-indefinite-plural":"locante","dative-definite-genitive-plural":"locantelor","singular-vocative":"locantă","plural-vocative":"locantelor"}},{"word":"locantier","pos":"noun","definitions":["innkeeper"],"forms":{"plural":"locantieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"locantier","accusative-definite-nominative-singular":"locantierul","accusative-indefinite-nominative-plural":"locantieri","accusative-definite-nominative-plural":"locantierii","dative-genitive-indefinite-singular":"locantier","dative-definite-genitive-singular":"locantierului","dative-genitive-indefinite-plural":"locantieri","dative-definite-genitive-plural":"locantierilor","singular-vocative":"locantierule","plural-vocative":"locantierilor"}},{"word":"locantieră","pos":"noun","definitions":["female equivalent of locantier"],"forms":{"plural":"locantiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"locantieră","accusative-definite-nominative-singular":"locantiera","accusative-indefinite-nominative-plural":"locantiere","accusative-definite-nominative-plural":"locantierele","dative-genitive-indefinite-singular":"locantiere","dative-definite-genitive-singular":"locantierei","dative-genitive-indefinite-plural":"locantiere","dative-definite-genitive-plural":"locantierelor","singular-vocative":"locantieră","plural-vocative":"locantierelor"}},{"word":"locaș","pos":"noun","definitions":["dwelling"],"pronunciation":"/loˈkaʃ/","forms":{"plural":"locașuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"locaș","accusative-definite-nominative-singular":"locașul","accusative-indefinite-nominative-plural":"locașuri","accusative-definite-nominative-plural":"locașurile","dative-genitive-indefinite-singular":"locaș","dative-definite-genitive-singular":"locașului","dative-genitive-indefinite-plural":"locașuri","dative-definite-genitive-plural":"locașurilor","singular-vocative":"locașule","plural-vocative":"locașurilor","alternative":"lăcaș"}},{"word":"locatar","pos":"noun","definitions":["tenant"],"forms":{"plural":"locatari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"locatar","accusative-definite-nominative-singular":"locatarul","accusative-indefinite-nominative-plural":"locatari","accusative-definite-nominative-plural":"locatarii","dative-genitive-indefinite-singular":"locatar","dative-definite-genitive-singular":"locatarului","dative-genitive-indefinite-plural":"locatari","dative-definite-genitive-plural":"locatarilor","singular-vocative":"locatarule","plural-vocative":"locatarilor"}},{"word":"locatară","pos":"noun","definitions":["female equivalent of locatar"],"forms":{"plural":"locatare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"locatară","accusative-definite-nominative-singular":"locatara","accusative-indefinite-nominative-plural":"locatare","accusative-definite-nominative-plural":"locatarele","dative-genitive-indefinite-singular":"locatare","dative-definite-genitive-singular":"locatarei","dative-genitive-indefinite-plural":"locatare","dative-definite-genitive-plural":"locatarelor","singular-vocative":"locatară","plural-vocative":"locatarelor"}},{"word":"locație","pos":"noun","definitions":["renting, leasing","tenancy"],"pronunciation":"/loˈkat͡si.e/","forms":{"plural":"locații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"locație","accusative-definite-nominative-singular":"locația","accusative-indefinite-nominative-plural":"locații","accusative-definite-nominative-plural":"locațiile","dative-genitive-indefinite-singular":"locații","dative-definite-genitive-singular":"locației","dative-genitive-indefinite-plural":"locații","dative-definite-genitive-plural":"locațiilor","singular-vocative":"locație","plural-vocative":"locațiilor","alternative":"locațiune"}},{"word":"locație","pos":"noun","definitions":["location (a particular, well-defined place)"],"pronunciation":"/loˈkat͡si.e/","forms":{"plural":"locații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"locație","accusative-definite-nominative-singular":"locația","accusative-indefinite-nominative-plural":"locații","accusative-definite-nominative-plural":"locațiile","dative-genitive-indefinite-singular":"locații","dative-definite-genitive-singular":"locației","dative-genitive-indefinite-plural":"locații","dative-definite-genitive-plural":"locațiilor","singular-vocative":"locație","plural-vocative":"locațiilor"}},{"word":"locațiune","pos":"noun","definitions":["alternative form of locație"],"forms":{"plural":"locațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"locațiune","accusative-definite-nominative-singular":"locațiunea","accusative-indefinite-nominative-plural":"locațiuni","accusative-definite-nominative-plural":"locațiunile","dative-genitive-indefinite-singular":"locațiuni","dative-definite-genitive-singular":"locațiunii","dative-genitive-indefinite-plural":"locațiuni","dative-definite-genitive-plural":"locațiunilor","singular-vocative":"locațiune","plural-vocative":"locațiunilor"}},{"word":"locativ","pos":"noun","definitions":["locative case"],"forms":{"plural":"locativi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"locativ","accusative-definite-nominative-singular":"locativul","accusative-indefinite-nominative-plural":"locativi","accusative-definite-nominative-plural":"locativile","dative-genitive-indefinite-singular":"locativ","dative-definite-genitive-singular":"locativului","dative-genitive-indefinite-plural":"locativi","dative-definite-genitive-plural":"locativilor","singular-vocative":"locativule","plural-vocative":"locativilor"}},{"word":"locatoare","pos":"noun","definitions":["female equivalent of locator"],"forms":{"plural":"locatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"locatoare","accusative-definite-nominative-singular":"locatoarea","accusative-indefinite-nominative-plural":"locatoare","accusative-definite-nominative-plural":"locatoarele","dative-genitive-indefinite-singular":"locatoare","dative-definite-genitive-singular":"locatoarei","dative-genitive-indefinite-plural":"locatoare","dative-definite-genitive-plural":"locatoarelor","singular-vocative":"locatoare","plural-vocative":"locatoarelor"}},{"word":"locator","pos":"noun","definitions":["letter, lessor (person who lets or hires)"],"forms":{"plural":"locatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"locator","accusative-definite-nominative-singular":"locatorul","accusative-indefinite-nominative-plural":"locatori","accusative-definite-nominative-plural":"locatorii","dative-genitive-indefinite-singular":"locator","dative-definite-genitive-singular":"locatorului","dative-genitive-indefinite-plural":"locatori","dative-definite-genitive-plural":"locatorilor","singular-vocative":"locatorule","plural-vocative":"locatorilor"}},{"word":"locbaităl","pos":"noun","definitions":["chisel"],"forms":{"plural":"locbaităle","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"locbaităl","accusative-definite-nominative-singular":"locbaitălul","accusative-indefinite-nominative-plural":"locbaităle","accusative-definite-nominative-plural":"locbaitălele","dative-genitive-indefinite-singular":"locbaităl","dative-definite-genitive-singular":"locbaitălului","dative-genitive-indefinite-plural":"locbaităle","dative-definite-genitive-plural":"locbaitălelor","singular-vocative":"locbaitălule","plural-vocative":"locbaitălelor"}},{"word":"loch","pos":"noun","definitions":["loch"],"forms":{"plural":"lochuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"loch","accusative-definite-nominative-singular":"lochul","accusative-indefinite-nominative-plural":"lochuri","accusative-definite-nominative-plural":"lochurile","dative-genitive-indefinite-singular":"loch","dative-definite-genitive-singular":"lochului","dative-genitive-indefinite-plural":"lochuri","dative-definite-genitive-plural":"lochurilor","singular-vocative":"lochule","plural-vocative":"lochurilor"}},{"word":"lociolău","pos":"noun","definitions":["watering can"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lociolău","accusative-definite-nominative":"lociolăuul","dative-genitive-indefinite":"lociolău","dative-definite-genitive":"lociolăuului","vocative":"lociolăuule"}},{"word":"lock-out","pos":"noun","definitions":["lockout"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lock-out","accusative-definite-nominative":"lock-outul","dative-genitive-indefinite":"lock-out","dative-definite-genitive":"lock-outului","vocative":"lock-outule"}},{"word":"locma","pos":"noun","definitions":["tasty food"],"forms":{"plural":"locmale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-a","accusative-indefinite-nominative-singular":"locma","accusative-definite-nominative-singular":"locmaua","accusative-indefinite-nominative-plural":"locmale","accusative-definite-nominative-plural":"locmalele","dative-genitive-indefinite-singular":"locmale","dative-definite-genitive-singular":"locmalei","dative-genitive-indefinite-plural":"locmale","dative-definite-genitive-plural":"locmalelor","singular-vocative":"locma","plural-vocative":"locmalelor"}},{"word":"locmăluță","pos":"noun","definitions":["diminutive of locma"],"forms":{"plural":"locmăluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"locmăluță","accusative-definite-nominative-singular":"locmăluța","accusative-indefinite-nominative-plural":"locmăluțe","accusative-definite-nominative-plural":"locmăluțele","dative-genitive-indefinite-singular":"locmăluțe","dative-definite-genitive-singular":"locmăluței","dative-genitive-indefinite-plural":"locmăluțe","dative-definite-genitive-plural":"locmăluțelor","singular-vocative":"locmăluță","plural-vocative":"locmăluțelor"}},{"word":"Locodeni","pos":"name","definitions":["a village in Mărtiniș, Harghita County, Romania"],"gender":"m"},{"word":"locomobil","pos":"noun","definitions":["locomobile"],"forms":{"plural":"locomobili","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"locomobil","accusative-definite-nominative-singular":"locomobi","accusative-indefinite-nominative-plural":"locomobili","accusative-definite-nominative-plural":"locomobilile","dative-genitive-indefinite-singular":"locomobili","dative-definite-genitive-singular":"locomobilii","dative-genitive-indefinite-plural":"locomobili","dative-definite-genitive-plural":"locomobililor","singular-vocative":"-","plural-vocative":"-"}},{"word":"locomobilă","pos":"noun","definitions":["Locomobile"],"forms":{"plural":"locomobile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"locomobilă","accusative-definite-nominative-singular":"locomobila","accusative-indefinite-nominative-plural":"locomobile","accusative-definite-nominative-plural":"locomobilele","dative-genitive-indefinite-singular":"locomobile","dative-definite-genitive-singular":"locomobilei","dative-genitive-indefinite-plural":"locomobile","dative-definite-genitive-plural":"locomobilelor","singular-vocative":"locomobilă","plural-vocative":"locomobilelor"}},{"word":"locomoție","pos":"noun","definitions":["locomotion"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"locomoție","accusative-definite-nominative-singular":"locomoția","accusative-indefinite-nominative-plural":"locomoții","accusative-definite-nominative-plural":"locomoțiile","dative-genitive-indefinite-singular":"locomoții","dative-definite-genitive-singular":"locomoției","dative-genitive-indefinite-plural":"locomoții","dative-definite-genitive-plural":"locomoțiilor","singular-vocative":"locomoție","plural-vocative":"locomoțiilor"}},{"word":"locomoțiune","pos":"noun","definitions":["alternative form of locomoție"],"forms":{"plural":"locomoțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"locomoțiune","accusative-definite-nominative-singular":"locomoțiunea","accusative-indefinite-nominative-plural":"locomoțiuni","accusative-definite-nominative-plural":"locomoțiunile","dative-genitive-indefinite-singular":"locomoțiuni","dative-definite-genitive-singular":"locomoțiunii","dative-genitive-indefinite-plural":"locomoțiuni","dative-definite-genitive-plural":"locomoțiunilor","singular-vocative":"locomoțiune","plural-vocative":"locomoțiunilor"}},{"word":"locomotiv","pos":"adj","definitions":["locomotive"],"forms":{"feminine-singular":"locomotivă","masculine-plural":"locomotivi","feminine-neuter-plural":"locomotive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"locomotiv","error-unrecognized-form-feminine-indefinite-singular":"locomotivă","error-unrecognized-form-indefinite-masculine-plural":"locomotivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"locomotive","definite-error-unrecognized-form-masculine-neuter-singular":"locomotivul","definite-error-unrecognized-form-feminine-singular":"locomotiva","definite-error-unrecognized-form-masculine-plural":"locomotivii","definite-error-unrecognized-form-feminine-neuter-plural":"locomotivele"}},{"word":"locomotiva","pos":"noun","definitions":["definite nominative/accusative singular of locomotivă"],"gender":"f"},{"word":"locomotivă","pos":"noun","definitions":["locomotive"],"forms":{"plural":"locomotive","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"locomotivă","accusative-definite-nominative-singular":"locomotiva","accusative-indefinite-nominative-plural":"locomotive","accusative-definite-nominative-plural":"locomotivele","dative-genitive-indefinite-singular":"locomotive","dative-definite-genitive-singular":"locomotivei","dative-genitive-indefinite-plural":"locomotive","dative-definite-genitive-plural":"locomotivelor","singular-vocative":"locomotivă","plural-vocative":"locomotivelor"}},{"word":"locomotivă cu abur","pos":"noun","definitions":["steam locomotive"],"forms":{"plural":"locomotive cu abur"}},{"word":"locomotive","pos":"noun","definitions":["inflection of locomotivă:","indefinite plural","indefinite genitive/dative singular"],"gender":"f"},{"word":"locomotor","pos":"adj","definitions":["locomotory"],"forms":{"feminine-singular":"locomotoare","masculine-plural":"locomotori","feminine-neuter-plural":"locomotoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"locomotor","error-unrecognized-form-feminine-indefinite-singular":"locomotoare","error-unrecognized-form-indefinite-masculine-plural":"locomotori","error-unrecognized-form-feminine-indefinite-neuter-plural":"locomotoare","definite-error-unrecognized-form-masculine-neuter-singular":"locomotorul","definite-error-unrecognized-form-feminine-singular":"locomotoarea","definite-error-unrecognized-form-masculine-plural":"locomotorii","definite-error-unrecognized-form-feminine-neuter-plural":"locomotoarele"}},{"word":"locopaznic","pos":"noun","definitions":["custodian"],"forms":{"plural":"locopaznici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"locopaznic","accusative-definite-nominative-singular":"locopaznicul","accusative-indefinite-nominative-plural":"locopaznici","accusative-definite-nominative-plural":"locopaznicii","dative-genitive-indefinite-singular":"locopaznic","dative-definite-genitive-singular":"locopaznicului","dative-genitive-indefinite-plural":"locopaznici","dative-definite-genitive-plural":"locopaznicilor","singular-vocative":"locopaznicule","plural-vocative":"locopaznicilor"}},{"word":"locotenent","pos":"noun","definitions":["lieutenant"],"forms":{"plural":"locotenenți"}},{"word":"locotenent-colonel","pos":"noun","definitions":["lieutenant colonel"],"forms":{"plural":"locotenent-colonei"}},{"word":"locotenență","pos":"noun","definitions":["lieutenancy"],"forms":{"plural":"locotenențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"locotenență","accusative-definite-nominative-singular":"locotenența","accusative-indefinite-nominative-plural":"locotenențe","accusative-definite-nominative-plural":"locotenențele","dative-genitive-indefinite-singular":"locotenențe","dative-definite-genitive-singular":"locotenenței","dative-genitive-indefinite-plural":"locotenențe","dative-definite-genitive-plural":"locotenențelor","singular-vocative":"locotenență","plural-vocative":"locotenențelor"}},{"word":"locotractor","pos":"noun","definitions":["traction engine"],"forms":{"plural":"locotractoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"locotractor","accusative-definite-nominative-singular":"locotractorul","accusative-indefinite-nominative-plural":"locotractoare","accusative-definite-nominative-plural":"locotractoarele","dative-genitive-indefinite-singular":"locotractor","dative-definite-genitive-singular":"locotractorului","dative-genitive-indefinite-plural":"locotractoare","dative-definite-genitive-plural":"locotractoarelor","singular-vocative":"locotractorule","plural-vocative":"locotractoarelor"}},{"word":"locșor","pos":"noun","definitions":["diminutive of loc; small place"],"forms":{"plural":"locșoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"locșor","accusative-definite-nominative-singular":"locșorul","accusative-indefinite-nominative-plural":"locșore","accusative-definite-nominative-plural":"locșorele","dative-genitive-indefinite-singular":"locșor","dative-definite-genitive-singular":"locșorului","dative-genitive-indefinite-plural":"locșore","dative-definite-genitive-plural":"locșorelor","singular-vocative":"locșorule","plural-vocative":"locșorelor"}},{"word":"locșorel","pos":"noun","definitions":["diminutive of locșor"],"forms":{"plural":"locșorele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"locșorel","accusative-definite-nominative-singular":"locșorelul","accusative-indefinite-nominative-plural":"locșorele","accusative-definite-nominative-plural":"locșorelele","dative-genitive-indefinite-singular":"locșorel","dative-definite-genitive-singular":"locșorelului","dative-genitive-indefinite-plural":"locșorele","dative-definite-genitive-plural":"locșorelelor","singular-vocative":"locșorelule","plural-vocative":"locșorelelor"}},{"word":"locțiitoare","pos":"noun","definitions":["female equivalent of locțiitor"],"forms":{"plural":"locțiitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"locțiitoare","accusative-definite-nominative-singular":"locțiitoarea","accusative-indefinite-nominative-plural":"locțiitoare","accusative-definite-nominative-plural":"locțiitoarele","dative-genitive-indefinite-singular":"locțiitoare","dative-definite-genitive-singular":"locțiitoarei","dative-genitive-indefinite-plural":"locțiitoare","dative-definite-genitive-plural":"locțiitoarelor","singular-vocative":"locțiitoare","plural-vocative":"locțiitoarelor"}},{"word":"locțiitor","pos":"noun","definitions":["lieutenant"],"forms":{"plural":"locțiitori"}},{"word":"locținer","pos":"noun","definitions":["lieutenant"],"forms":{"plural":"locțineri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"locținer","accusative-definite-nominative-singular":"locținerul","accusative-indefinite-nominative-plural":"locțineri","accusative-definite-nominative-plural":"locținerii","dative-genitive-indefinite-singular":"locținer","dative-definite-genitive-singular":"locținerului","dative-genitive-indefinite-plural":"locțineri","dative-definite-genitive-plural":"locținerilor","singular-vocative":"locținerule","plural-vocative":"locținerilor"}},{"word":"locuace","pos":"adj","definitions":["talkative"],"pronunciation":"[lo.kw.a.t͡ʃe]","forms":{"masculine-plural":"locuaci","feminine-neuter-plural":"locuace","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"locuace","error-unrecognized-form-feminine-indefinite-singular":"locuace","error-unrecognized-form-indefinite-masculine-plural":"locuaci","error-unrecognized-form-feminine-indefinite-neuter-plural":"locuace","definite-error-unrecognized-form-masculine-neuter-singular":"locuacele","definite-error-unrecognized-form-feminine-singular":"locuacea","definite-error-unrecognized-form-masculine-plural":"locuacii","definite-error-unrecognized-form-feminine-neuter-plural":"locuacele"}},{"word":"locui","pos":"verb","definitions":["to reside, to dwell"],"pronunciation":"[lokuˈi]","forms":{"canonical":"a locui 4th conjugation","present-singular-third-person":"locuiește","participle-past":"locuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a locui","gerund":"locuind","first-person-indicative-present-singular":"locuiesc","indicative-present-second-person-singular":"locuiești","indicative-present-singular-third-person":"locuiește","first-person-indicative-plural-present":"locuim","indicative-plural-present-second-person":"locuiți","indicative-plural-present-third-person":"locuiesc","first-person-imperfect-indicative-singular":"locuiam","imperfect-indicative-second-person-singular":"locuiai","imperfect-indicative-singular-third-person":"locuia","first-person-imperfect-indicative-plural":"locuiam","imperfect-indicative-plural-second-person":"locuiați","imperfect-indicative-plural-third-person":"locuiau","first-person-indicative-perfect-singular":"locuii","indicative-perfect-second-person-singular":"locuiși","indicative-perfect-singular-third-person":"locui","first-person-indicative-perfect-plural":"locuirăm","indicative-perfect-plural-second-person":"locuirăți","indicative-perfect-plural-third-person":"locuiră","first-person-indicative-pluperfect-singular":"locuisem","indicative-pluperfect-second-person-singular":"locuiseși","indicative-pluperfect-singular-third-person":"locuise","first-person-indicative-pluperfect-plural":"locuiserăm","indicative-pluperfect-plural-second-person":"locuiserăți","indicative-pluperfect-plural-third-person":"locuiseră","first-person-present-singular-subjunctive":"să locuiesc","present-second-person-singular-subjunctive":"să locuiești","present-singular-subjunctive-third-person":"să locuiască","first-person-plural-present-subjunctive":"să locuim","plural-present-second-person-subjunctive":"să locuiți","plural-present-subjunctive-third-person":"să locuiască","imperative-second-person-singular":"locuiește","imperative-plural-second-person":"locuiți","imperative-negative-second-person-singular":"nu locui","imperative-negative-plural-second-person":"nu locuiți"}},{"word":"locuibil","pos":"adj","definitions":["habitable"],"forms":{"feminine-singular":"locuibilă","masculine-plural":"locuibili","feminine-neuter-plural":"locuibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"locuibil","error-unrecognized-form-feminine-indefinite-singular":"locuibilă","error-unrecognized-form-indefinite-masculine-plural":"locuibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"locuibile","definite-error-unrecognized-form-masculine-neuter-singular":"locuibilul","definite-error-unrecognized-form-feminine-singular":"locuibila","definite-error-unrecognized-form-masculine-plural":"locuibilii","definite-error-unrecognized-form-feminine-neuter-plural":"locuibilele"}},{"word":"locuibilitate","pos":"noun","definitions":["habitability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"locuibilitate","accusative-definite-nominative":"locuibilitatea","dative-genitive-indefinite":"locuibilități","dative-definite-genitive":"locuibilității","vocative":"-"}},{"word":"locuincios","pos":"adj","definitions":["habitable"],"forms":{"feminine-singular":"locuincioasă","masculine-plural":"locuincioși","feminine-neuter-plural":"locuincioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"locuincios","error-unrecognized-form-feminine-indefinite-singular":"locuincioasă","error-unrecognized-form-indefinite-masculine-plural":"locuincioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"locuincioase","definite-error-unrecognized-form-masculine-neuter-singular":"locuinciosul","definite-error-unrecognized-form-feminine-singular":"locuincioasa","definite-error-unrecognized-form-masculine-plural":"locuincioșii","definite-error-unrecognized-form-feminine-neuter-plural":"locuincioasele"}},{"word":"locuință","pos":"noun","definitions":["house, dwelling, residence, abode, habitat"],"pronunciation":"/lo.kuˈin.t͡sə/","forms":{"plural":"locuințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"locuință","accusative-definite-nominative-singular":"locuința","accusative-indefinite-nominative-plural":"locuințe","accusative-definite-nominative-plural":"locuințele","dative-genitive-indefinite-singular":"locuințe","dative-definite-genitive-singular":"locuinței","dative-genitive-indefinite-plural":"locuințe","dative-definite-genitive-plural":"locuințelor","singular-vocative":"locuință","plural-vocative":"locuințelor"}},{"word":"locuință lacustră","pos":"noun","definitions":["lake dwelling"],"forms":{"plural":"locuințe lacustre"}},{"word":"locuințișoară","pos":"noun","definitions":["diminutive of locuință"],"forms":{"plural":"locuințișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"locuințișoară","accusative-definite-nominative-singular":"locuințișoara","accusative-indefinite-nominative-plural":"locuințișoare","accusative-definite-nominative-plural":"locuințișoarele","dative-genitive-indefinite-singular":"locuințișoare","dative-definite-genitive-singular":"locuințișoarei","dative-genitive-indefinite-plural":"locuințișoare","dative-definite-genitive-plural":"locuințișoarelor","singular-vocative":"locuințișoară","plural-vocative":"locuințișoarelor"}},{"word":"locuire","pos":"noun","definitions":["habitation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"locuire","accusative-definite-nominative":"locuirea","dative-genitive-indefinite":"locuire","dative-definite-genitive":"locuirei","vocative":"locuire"}},{"word":"locuit","pos":"adj","definitions":["inhabited"],"forms":{"feminine-singular":"locuită","masculine-plural":"locuiți","feminine-neuter-plural":"locuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"locuit","error-unrecognized-form-feminine-indefinite-singular":"locuită","error-unrecognized-form-indefinite-masculine-plural":"locuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"locuite","definite-error-unrecognized-form-masculine-neuter-singular":"locuitul","definite-error-unrecognized-form-feminine-singular":"locuita","definite-error-unrecognized-form-masculine-plural":"locuiții","definite-error-unrecognized-form-feminine-neuter-plural":"locuitele"}},{"word":"locuitoare","pos":"noun","definitions":["female equivalent of locuitor"],"forms":{"plural":"locuitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"locuitoare","accusative-definite-nominative-singular":"locuitoarea","accusative-indefinite-nominative-plural":"locuitoare","accusative-definite-nominative-plural":"locuitoarele","dative-genitive-indefinite-singular":"locuitoare","dative-definite-genitive-singular":"locuitoarei","dative-genitive-indefinite-plural":"locuitoare","dative-definite-genitive-plural":"locuitoarelor","singular-vocative":"locuitoare","plural-vocative":"locuitoarelor"}},{"word":"locuitor","pos":"noun","definitions":["resident, inhabitant"],"forms":{"plural":"locuitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"locuitor","accusative-definite-nominative-singular":"locuitorul","accusative-indefinite-nominative-plural":"locuitori","accusative-definite-nominative-plural":"locuitorii","dative-genitive-indefinite-singular":"locuitor","dative-definite-genitive-singular":"locuitorului","dative-genitive-indefinite-plural":"locuitori","dative-definite-genitive-plural":"locuitorilor","singular-vocative":"locuitorule","plural-vocative":"locuitorilor"}},{"word":"locuitorime","pos":"noun","definitions":["inhabitants"],"forms":{"plural":"locuitorimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"locuitorime","accusative-definite-nominative-singular":"locuitorimea","accusative-indefinite-nominative-plural":"locuitorimi","accusative-definite-nominative-plural":"locuitorimile","dative-genitive-indefinite-singular":"locuitorimi","dative-definite-genitive-singular":"locuitorimii","dative-genitive-indefinite-plural":"locuitorimi","dative-definite-genitive-plural":"locuitorimilor","singular-vocative":"locuitorime","plural-vocative":"locuitorimilor"}},{"word":"locul","pos":"noun","definitions":["definite nominative/accusative singular of loc"]},{"word":"locul","pos":"noun","definitions":["loculus"],"forms":{"plural":"loculi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"locul","accusative-definite-nominative-singular":"loculul","accusative-indefinite-nominative-plural":"loculi","accusative-definite-nominative-plural":"loculii","dative-genitive-indefinite-singular":"locul","dative-definite-genitive-singular":"loculului","dative-genitive-indefinite-plural":"loculi","dative-definite-genitive-plural":"loculilor","singular-vocative":"loculule","plural-vocative":"loculilor"}},{"word":"Locul Mic","pos":"name","definitions":["a river in Harghita, Romania, tributary to the Loc"],"gender":"m"},{"word":"loculă","pos":"noun","definitions":["alternative form of locul"],"forms":{"plural":"locule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"loculă","accusative-definite-nominative-singular":"locula","accusative-indefinite-nominative-plural":"locule","accusative-definite-nominative-plural":"loculele","dative-genitive-indefinite-singular":"locule","dative-definite-genitive-singular":"loculei","dative-genitive-indefinite-plural":"locule","dative-definite-genitive-plural":"loculelor","singular-vocative":"loculă","plural-vocative":"loculelor"}},{"word":"locular","pos":"adj","definitions":["locular"],"forms":{"feminine-singular":"loculară","masculine-plural":"loculari","feminine-neuter-plural":"loculare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"locular","error-unrecognized-form-feminine-indefinite-singular":"loculară","error-unrecognized-form-indefinite-masculine-plural":"loculari","error-unrecognized-form-feminine-indefinite-neuter-plural":"loculare","definite-error-unrecognized-form-masculine-neuter-singular":"locularul","definite-error-unrecognized-form-feminine-singular":"loculara","definite-error-unrecognized-form-masculine-plural":"locularii","definite-error-unrecognized-form-feminine-neuter-plural":"locularele"}},{"word":"loculeț","pos":"noun","definitions":["diminutive of loc"],"forms":{"plural":"loculețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"loculeț","accusative-definite-nominative-singular":"loculețul","accusative-indefinite-nominative-plural":"loculețe","accusative-definite-nominative-plural":"loculețele","dative-genitive-indefinite-singular":"loculeț","dative-definite-genitive-singular":"loculețului","dative-genitive-indefinite-plural":"loculețe","dative-definite-genitive-plural":"loculețelor","singular-vocative":"loculețule","plural-vocative":"loculețelor"}},{"word":"loculos","pos":"adj","definitions":["locular"],"forms":{"feminine-singular":"loculoasă","masculine-plural":"loculoși","feminine-neuter-plural":"loculoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"loculos","error-unrecognized-form-feminine-indefinite-singular":"loculoasă","error-unrecognized-form-indefinite-masculine-plural":"loculoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"loculoase","definite-error-unrecognized-form-masculine-neuter-singular":"loculosul","definite-error-unrecognized-form-feminine-singular":"loculoasa","definite-error-unrecognized-form-masculine-plural":"loculoșii","definite-error-unrecognized-form-feminine-neuter-plural":"loculoasele"}},{"word":"locului","pos":"noun","definitions":["definite dative/genitive singular of loc"]},{"word":"locuri","pos":"noun","definitions":["plural of loc"]},{"word":"locurile","pos":"noun","definitions":["definite nominative/accusative plural of loc"]},{"word":"locurilor","pos":"noun","definitions":["inflection of loc:","definite genitive/dative plural","vocative plural"]},{"word":"locușor","pos":"noun","definitions":["alternative form of locșor"],"forms":{"plural":"locușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"locușor","accusative-definite-nominative-singular":"locușorul","accusative-indefinite-nominative-plural":"locușoare","accusative-definite-nominative-plural":"locușoarele","dative-genitive-indefinite-singular":"locușor","dative-definite-genitive-singular":"locușorului","dative-genitive-indefinite-plural":"locușoare","dative-definite-genitive-plural":"locușoarelor","singular-vocative":"locușorule","plural-vocative":"locușoarelor"}},{"word":"locustă","pos":"noun","definitions":["alternative form of lăcustă"],"forms":{"plural":"locuste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"locustă","accusative-definite-nominative-singular":"locusta","accusative-indefinite-nominative-plural":"locuste","accusative-definite-nominative-plural":"locustele","dative-genitive-indefinite-singular":"locuste","dative-definite-genitive-singular":"locustei","dative-genitive-indefinite-plural":"locuste","dative-definite-genitive-plural":"locustelor","singular-vocative":"locustă","plural-vocative":"locustelor"}},{"word":"Locusteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Locusteanu"}},{"word":"Locusteni","pos":"name","definitions":["a village in Daneți, Dolj County, Romania"],"gender":"m"},{"word":"locuț","pos":"noun","definitions":["diminutive of loc"],"forms":{"plural":"locuțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"locuț","accusative-definite-nominative-singular":"locuțul","accusative-indefinite-nominative-plural":"locuțe","accusative-definite-nominative-plural":"locuțele","dative-genitive-indefinite-singular":"locuț","dative-definite-genitive-singular":"locuțului","dative-genitive-indefinite-plural":"locuțe","dative-definite-genitive-plural":"locuțelor","singular-vocative":"locuțule","plural-vocative":"locuțelor"}},{"word":"locuție","pos":"noun","definitions":["alternative form of locuțiune"],"forms":{"plural":"locuții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"locuție","accusative-definite-nominative-singular":"locuția","accusative-indefinite-nominative-plural":"locuții","accusative-definite-nominative-plural":"locuțiile","dative-genitive-indefinite-singular":"locuții","dative-definite-genitive-singular":"locuției","dative-genitive-indefinite-plural":"locuții","dative-definite-genitive-plural":"locuțiilor","singular-vocative":"locuție","plural-vocative":"locuțiilor"}},{"word":"locuțiune","pos":"noun","definitions":["locution, phrase","word","way of speaking","sentence made up of at least two clauses","expression"],"pronunciation":"/lokut͡siˈune/","forms":{"plural":"locuțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"locuțiune","accusative-definite-nominative-singular":"locuțiunea","accusative-indefinite-nominative-plural":"locuțiuni","accusative-definite-nominative-plural":"locuțiunile","dative-genitive-indefinite-singular":"locuțiuni","dative-definite-genitive-singular":"locuțiunii","dative-genitive-indefinite-plural":"locuțiuni","dative-definite-genitive-plural":"locuțiunilor","singular-vocative":"locuțiune","plural-vocative":"locuțiunilor","alternative-dated":"locuție"}},{"word":"locuțiune adjectivală","pos":"noun","definitions":["adjective phrase"],"forms":{"plural":"locuțiuni adjectivale"}},{"word":"locuțiune adverbială","pos":"noun","definitions":["adverbial phrase"],"forms":{"plural":"locuțiuni adverbiale"}},{"word":"locuțiune conjuncțională","pos":"noun","definitions":["conjunctional phrase"],"forms":{"plural":"locuțiuni conjucționale"}},{"word":"locuțiune interjecțională","pos":"noun","definitions":["interjectional phrase"],"forms":{"plural":"locuțiuni interjecționale"}},{"word":"locuțiune prepozițională","pos":"noun","definitions":["phrasal preposition"],"forms":{"plural":"locuțiuni prepoziționale"}},{"word":"locuțiune substantivală","pos":"noun","definitions":["noun phrase"],"forms":{"plural":"locuțiuni substantivale"}},{"word":"locuțiune verbală","pos":"noun","definitions":["verb phrase"],"forms":{"plural":"locuțiuni verbale"}},{"word":"locutor","pos":"noun","definitions":["speaker"],"forms":{"plural":"locutori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"locutor","accusative-definite-nominative-singular":"locutorul","accusative-indefinite-nominative-plural":"locutori","accusative-definite-nominative-plural":"locutorii","dative-genitive-indefinite-singular":"locutor","dative-definite-genitive-singular":"locutorului","dative-genitive-indefinite-plural":"locutori","dative-definite-genitive-plural":"locutorilor","singular-vocative":"locutorule","plural-vocative":"locutorilor"}},{"word":"locvace","pos":"adj","definitions":["talkative"],"pronunciation":"[lo.kv.a.t͡ʃe]","forms":{"masculine-plural":"locvaci","feminine-neuter-plural":"locvace","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"locvace","error-unrecognized-form-feminine-indefinite-singular":"locvace","error-unrecognized-form-indefinite-masculine-plural":"locvaci","error-unrecognized-form-feminine-indefinite-neuter-plural":"locvace","definite-error-unrecognized-form-masculine-neuter-singular":"locvacele","definite-error-unrecognized-form-feminine-singular":"locvacea","definite-error-unrecognized-form-masculine-plural":"locvacii","definite-error-unrecognized-form-feminine-neuter-plural":"locvacele"}},{"word":"locvacitate","pos":"noun","definitions":["loquacity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"locvacitate","accusative-definite-nominative-singular":"locvacitatea","accusative-indefinite-nominative-plural":"locvacități","accusative-definite-nominative-plural":"locvacitățile","dative-genitive-indefinite-singular":"locvacități","dative-definite-genitive-singular":"locvacității","dative-genitive-indefinite-plural":"locvacități","dative-definite-genitive-plural":"locvacităților","singular-vocative":"locvacitate","plural-vocative":"locvacităților"}},{"word":"Lodroman","pos":"name","definitions":["a village in Valea Lungă, Alba County, Romania"],"gender":"m"},{"word":"loess","pos":"noun","definitions":["loess"],"forms":{"plural":"loessuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"loess","accusative-definite-nominative-singular":"loessul","accusative-indefinite-nominative-plural":"loessuri","accusative-definite-nominative-plural":"loessurile","dative-genitive-indefinite-singular":"loess","dative-definite-genitive-singular":"loessului","dative-genitive-indefinite-plural":"loessuri","dative-definite-genitive-plural":"loessurilor","singular-vocative":"loessule","plural-vocative":"loessurilor"}},{"word":"loessoid","pos":"adj","definitions":["loessic"],"forms":{"feminine-singular":"loessoidă","masculine-plural":"loessoizi","feminine-neuter-plural":"loessoide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"loessoid","error-unrecognized-form-feminine-indefinite-singular":"loessoidă","error-unrecognized-form-indefinite-masculine-plural":"loessoizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"loessoide","definite-error-unrecognized-form-masculine-neuter-singular":"loessoidul","definite-error-unrecognized-form-feminine-singular":"loessoida","definite-error-unrecognized-form-masculine-plural":"loessoizii","definite-error-unrecognized-form-feminine-neuter-plural":"loessoidele"}},{"word":"loessuri","pos":"noun","definitions":["plural of loess"]},{"word":"loga","pos":"verb","definitions":["to log in"],"forms":{"canonical":"a loga 1st conjugation","present-singular-third-person":"loghează","participle-past":"logat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a loga","gerund":"logând","first-person-indicative-present-singular":"loghez","indicative-present-second-person-singular":"loghezi","indicative-present-singular-third-person":"loghează","first-person-indicative-plural-present":"logăm","indicative-plural-present-second-person":"logați","indicative-plural-present-third-person":"loghează","first-person-imperfect-indicative-singular":"logam","imperfect-indicative-second-person-singular":"logai","imperfect-indicative-singular-third-person":"loga","first-person-imperfect-indicative-plural":"logam","imperfect-indicative-plural-second-person":"logați","imperfect-indicative-plural-third-person":"logau","first-person-indicative-perfect-singular":"logai","indicative-perfect-second-person-singular":"logași","indicative-perfect-singular-third-person":"logă","first-person-indicative-perfect-plural":"logarăm","indicative-perfect-plural-second-person":"logarăți","indicative-perfect-plural-third-person":"logară","first-person-indicative-pluperfect-singular":"logasem","indicative-pluperfect-second-person-singular":"logaseși","indicative-pluperfect-singular-third-person":"logase","first-person-indicative-pluperfect-plural":"logaserăm","indicative-pluperfect-plural-second-person":"logaserăți","indicative-pluperfect-plural-third-person":"logaseră","first-person-present-singular-subjunctive":"să loghez","present-second-person-singular-subjunctive":"să loghezi","present-singular-subjunctive-third-person":"să logheze","first-person-plural-present-subjunctive":"să logăm","plural-present-second-person-subjunctive":"să logați","plural-present-subjunctive-third-person":"să logheze","imperative-second-person-singular":"loghează","imperative-plural-second-person":"logați","imperative-negative-second-person-singular":"nu loga","imperative-negative-plural-second-person":"nu logați"}},{"word":"logaedic","pos":"adj","definitions":["logaoedic"],"forms":{"feminine-singular":"logaedică","masculine-plural":"logaedici","feminine-neuter-plural":"logaedice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"logaedic","error-unrecognized-form-feminine-indefinite-singular":"logaedică","error-unrecognized-form-indefinite-masculine-plural":"logaedici","error-unrecognized-form-feminine-indefinite-neuter-plural":"logaedice","definite-error-unrecognized-form-masculine-neuter-singular":"logaedicul","definite-error-unrecognized-form-feminine-singular":"logaedica","definite-error-unrecognized-form-masculine-plural":"logaedicii","definite-error-unrecognized-form-feminine-neuter-plural":"logaedicele"}},{"word":"logai","pos":"verb","definitions":["inflection of loga:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[loˈɡaj]"},{"word":"logam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of loga"],"pronunciation":"[loˈɡam]"},{"word":"Logănești","pos":"name","definitions":["a village in Drăsliceni, Criuleni Raion, Moldova","a village in Logănești, Hîncești Raion, Moldova","a commune of Hîncești Raion, Moldova"],"gender":"m"},{"word":"logaritm","pos":"noun","definitions":["logarithm"],"forms":{"plural":"logaritmi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"logaritm","accusative-definite-nominative-singular":"logaritmul","accusative-indefinite-nominative-plural":"logaritmi","accusative-definite-nominative-plural":"logaritmii","dative-genitive-indefinite-singular":"logaritm","dative-definite-genitive-singular":"logaritmului","dative-genitive-indefinite-plural":"logaritmi","dative-definite-genitive-plural":"logaritmilor","singular-vocative":"logaritmule","plural-vocative":"logaritmilor"}},{"word":"logaritm natural","pos":"noun","definitions":["natural logarithm"],"forms":{"plural":"logaritmi naturali"}},{"word":"logaritm zecimal","pos":"noun","definitions":["common logarithm"]},{"word":"logaritma","pos":"verb","definitions":["to logarithm"],"forms":{"canonical":"a logaritma 1st conjugation","present-singular-third-person":"logaritmează","participle-past":"logaritmat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a logaritma","gerund":"logaritmând","first-person-indicative-present-singular":"logaritmez","indicative-present-second-person-singular":"logaritmezi","indicative-present-singular-third-person":"logaritmează","first-person-indicative-plural-present":"logaritmăm","indicative-plural-present-second-person":"logaritmați","indicative-plural-present-third-person":"logaritmează","first-person-imperfect-indicative-singular":"logaritmam","imperfect-indicative-second-person-singular":"logaritmai","imperfect-indicative-singular-third-person":"logaritma","first-person-imperfect-indicative-plural":"logaritmam","imperfect-indicative-plural-second-person":"logaritmați","imperfect-indicative-plural-third-person":"logaritmau","first-person-indicative-perfect-singular":"logaritmai","indicative-perfect-second-person-singular":"logaritmași","indicative-perfect-singular-third-person":"logaritmă","first-person-indicative-perfect-plural":"logaritmarăm","indicative-perfect-plural-second-person":"logaritmarăți","indicative-perfect-plural-third-person":"logaritmară","first-person-indicative-pluperfect-singular":"logaritmasem","indicative-pluperfect-second-person-singular":"logaritmaseși","indicative-pluperfect-singular-third-person":"logaritmase","first-person-indicative-pluperfect-plural":"logaritmaserăm","indicative-pluperfect-plural-second-person":"logaritmaserăți","indicative-pluperfect-plural-third-person":"logaritmaseră","first-person-present-singular-subjunctive":"să logaritmez","present-second-person-singular-subjunctive":"să logaritmezi","present-singular-subjunctive-third-person":"să logaritmeze","first-person-plural-present-subjunctive":"să logaritmăm","plural-present-second-person-subjunctive":"să logaritmați","plural-present-subjunctive-third-person":"să logaritmeze","imperative-second-person-singular":"logaritmează","imperative-plural-second-person":"logaritmați","imperative-negative-second-person-singular":"nu logaritma","imperative-negative-plural-second-person":"nu logaritmați"}},{"word":"logaritmare","pos":"noun","definitions":["logarithmization"],"forms":{"plural":"logaritmări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"logaritmare","accusative-definite-nominative-singular":"logaritmarea","accusative-indefinite-nominative-plural":"logaritmări","accusative-definite-nominative-plural":"logaritmările","dative-genitive-indefinite-singular":"logaritmări","dative-definite-genitive-singular":"logaritmării","dative-genitive-indefinite-plural":"logaritmări","dative-definite-genitive-plural":"logaritmărilor","singular-vocative":"logaritmare","plural-vocative":"logaritmărilor"}},{"word":"logaritmic","pos":"adj","definitions":["logarithmic"],"forms":{"feminine-singular":"logaritmică","masculine-plural":"logaritmici","feminine-neuter-plural":"logaritmice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"logaritmic","error-unrecognized-form-feminine-indefinite-singular":"logaritmică","error-unrecognized-form-indefinite-masculine-plural":"logaritmici","error-unrecognized-form-feminine-indefinite-neuter-plural":"logaritmice","definite-error-unrecognized-form-masculine-neuter-singular":"logaritmicul","definite-error-unrecognized-form-feminine-singular":"logaritmica","definite-error-unrecognized-form-masculine-plural":"logaritmicii","definite-error-unrecognized-form-feminine-neuter-plural":"logaritmicele"}},{"word":"logaritmicesc","pos":"adj","definitions":["logarithmic"],"forms":{"feminine-singular":"logaritmicească","plural":"logaritmicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"logaritmicesc","error-unrecognized-form-feminine-indefinite-singular":"logaritmicească","error-unrecognized-form-indefinite-masculine-plural":"logaritmicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"logaritmicești","definite-error-unrecognized-form-masculine-neuter-singular":"logaritmicescul","definite-error-unrecognized-form-feminine-singular":"logaritmiceasca","definite-error-unrecognized-form-masculine-plural":"logaritmiceștii","definite-error-unrecognized-form-feminine-neuter-plural":"logaritmiceștile"}},{"word":"logase","pos":"verb","definitions":["third-person singular pluperfect indicative of loga"],"pronunciation":"[loˈɡase]"},{"word":"logat","pos":"verb","definitions":["past participle of loga"],"pronunciation":"[loˈɡat]"},{"word":"logatom","pos":"noun","definitions":["logatome"],"forms":{"plural":"logatomi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"logatom","accusative-definite-nominative-singular":"logatomul","accusative-indefinite-nominative-plural":"logatomi","accusative-definite-nominative-plural":"logatomii","dative-genitive-indefinite-singular":"logatom","dative-definite-genitive-singular":"logatomului","dative-genitive-indefinite-plural":"logatomi","dative-definite-genitive-plural":"logatomilor","singular-vocative":"logatomule","plural-vocative":"logatomilor"}},{"word":"loggia","pos":"noun","definitions":["loggia"],"forms":{"plural":"loggii"}},{"word":"Loghin","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Loghin"}},{"word":"Loghinaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Loghinaș"}},{"word":"loghios","pos":"noun","definitions":["scholar"],"forms":{"plural":"loghioși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"loghios","accusative-definite-nominative-singular":"loghiosul","accusative-indefinite-nominative-plural":"loghioși","accusative-definite-nominative-plural":"loghioșii","dative-genitive-indefinite-singular":"loghios","dative-definite-genitive-singular":"loghiosului","dative-genitive-indefinite-plural":"loghioși","dative-definite-genitive-plural":"loghioșilor","singular-vocative":"loghiosule","plural-vocative":"loghioșilor"}},{"word":"loghiotat","pos":"noun","definitions":["scholar"],"forms":{"plural":"loghiotați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"loghiotat","accusative-definite-nominative-singular":"loghiotatul","accusative-indefinite-nominative-plural":"loghiotați","accusative-definite-nominative-plural":"loghiotații","dative-genitive-indefinite-singular":"loghiotat","dative-definite-genitive-singular":"loghiotatului","dative-genitive-indefinite-plural":"loghiotați","dative-definite-genitive-plural":"loghiotaților","singular-vocative":"loghiotatule","plural-vocative":"loghiotaților"}},{"word":"logic","pos":"adj","definitions":["logical"],"forms":{"feminine-singular":"logică","masculine-plural":"logici","feminine-neuter-plural":"logice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"logic","error-unrecognized-form-feminine-indefinite-singular":"logică","error-unrecognized-form-indefinite-masculine-plural":"logici","error-unrecognized-form-feminine-indefinite-neuter-plural":"logice","definite-error-unrecognized-form-masculine-neuter-singular":"logicul","definite-error-unrecognized-form-feminine-singular":"logica","definite-error-unrecognized-form-masculine-plural":"logicii","definite-error-unrecognized-form-feminine-neuter-plural":"logicele"}},{"word":"logică","pos":"noun","definitions":["logic"],"forms":{"plural":"logici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"logică","accusative-definite-nominative-singular":"logica","accusative-indefinite-nominative-plural":"logici","accusative-definite-nominative-plural":"logicile","dative-genitive-indefinite-singular":"logici","dative-definite-genitive-singular":"logicii","dative-genitive-indefinite-plural":"logici","dative-definite-genitive-plural":"logicilor","singular-vocative":"logică","plural-vocative":"logicilor"}},{"word":"logică matematică","pos":"noun","definitions":["mathematical logic"]},{"word":"logică simbolică","pos":"noun","definitions":["symbolic logic"]},{"word":"logicamente","pos":"adv","definitions":["logically"]},{"word":"logicesc","pos":"adj","definitions":["logical"],"forms":{"feminine-singular":"logicească","plural":"logicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"logicesc","error-unrecognized-form-feminine-indefinite-singular":"logicească","error-unrecognized-form-indefinite-masculine-plural":"logicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"logicești","definite-error-unrecognized-form-masculine-neuter-singular":"logicescul","definite-error-unrecognized-form-feminine-singular":"logiceasca","definite-error-unrecognized-form-masculine-plural":"logiceștii","definite-error-unrecognized-form-feminine-neuter-plural":"logiceștile"}},{"word":"logicește","pos":"adv","definitions":["logically"]},{"word":"logician","pos":"noun","definitions":["logician"],"forms":{"plural":"logicieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"logician","accusative-definite-nominative-singular":"logicianul","accusative-indefinite-nominative-plural":"logicieni","accusative-definite-nominative-plural":"logicienii","dative-genitive-indefinite-singular":"logician","dative-definite-genitive-singular":"logicianului","dative-genitive-indefinite-plural":"logicieni","dative-definite-genitive-plural":"logicienilor","singular-vocative":"logicianule","plural-vocative":"logicienilor"}},{"word":"logiciană","pos":"noun","definitions":["female equivalent of logician"],"forms":{"plural":"logiciene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"logiciană","accusative-definite-nominative-singular":"logiciana","accusative-indefinite-nominative-plural":"logiciene","accusative-definite-nominative-plural":"logicienele","dative-genitive-indefinite-singular":"logiciene","dative-definite-genitive-singular":"logicienei","dative-genitive-indefinite-plural":"logiciene","dative-definite-genitive-plural":"logicienelor","singular-vocative":"logiciană","plural-vocative":"logicienelor"}},{"word":"logicieni","pos":"noun","definitions":["plural of logician"]},{"word":"logicism","pos":"noun","definitions":["logicism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"logicism","accusative-definite-nominative":"logicismul","dative-genitive-indefinite":"logicism","dative-definite-genitive":"logicismului","vocative":"logicismule"}},{"word":"logicist","pos":"noun","definitions":["logicist"],"forms":{"plural":"logiciști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"logicist","accusative-definite-nominative-singular":"logicistul","accusative-indefinite-nominative-plural":"logiciști","accusative-definite-nominative-plural":"logiciștii","dative-genitive-indefinite-singular":"logicist","dative-definite-genitive-singular":"logicistului","dative-genitive-indefinite-plural":"logiciști","dative-definite-genitive-plural":"logiciștilor","singular-vocative":"logicistule","plural-vocative":"logiciștilor"}},{"word":"logicistă","pos":"noun","definitions":["female equivalent of logicist"],"forms":{"plural":"logiciste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"logicistă","accusative-definite-nominative-singular":"logicista","accusative-indefinite-nominative-plural":"logiciste","accusative-definite-nominative-plural":"logicistele","dative-genitive-indefinite-singular":"logiciste","dative-definite-genitive-singular":"logicistei","dative-genitive-indefinite-plural":"logiciste","dative-definite-genitive-plural":"logicistelor","singular-vocative":"logicistă","plural-vocative":"logicistelor"}},{"word":"logicitate","pos":"noun","definitions":["logicity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"logicitate","accusative-definite-nominative":"logicitatea","dative-genitive-indefinite":"logicități","dative-definite-genitive":"logicității","vocative":"-"}},{"word":"logie","pos":"noun","definitions":["loggia"],"forms":{"plural":"logii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"logie","accusative-definite-nominative-singular":"logia","accusative-indefinite-nominative-plural":"logii","accusative-definite-nominative-plural":"logiile","dative-genitive-indefinite-singular":"logii","dative-definite-genitive-singular":"logiei","dative-genitive-indefinite-plural":"logii","dative-definite-genitive-plural":"logiilor","singular-vocative":"logie","plural-vocative":"logiilor"}},{"word":"Logig","pos":"name","definitions":["a village in Lunca, Mureș County, Romania"],"gender":"m"},{"word":"logistic","pos":"adj","definitions":["logistical","logistic"],"forms":{"feminine-singular":"logistică","masculine-plural":"logistici","feminine-neuter-plural":"logistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"logistic","error-unrecognized-form-feminine-indefinite-singular":"logistică","error-unrecognized-form-indefinite-masculine-plural":"logistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"logistice","definite-error-unrecognized-form-masculine-neuter-singular":"logisticul","definite-error-unrecognized-form-feminine-singular":"logistica","definite-error-unrecognized-form-masculine-plural":"logisticii","definite-error-unrecognized-form-feminine-neuter-plural":"logisticele"}},{"word":"logistică","pos":"noun","definitions":["logistics"],"forms":{"plural":"logistici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"logistică","accusative-definite-nominative-singular":"logistica","accusative-indefinite-nominative-plural":"logistici","accusative-definite-nominative-plural":"logisticile","dative-genitive-indefinite-singular":"logistici","dative-definite-genitive-singular":"logisticii","dative-genitive-indefinite-plural":"logistici","dative-definite-genitive-plural":"logisticilor","singular-vocative":"logistică","plural-vocative":"logisticilor"}},{"word":"logistici","pos":"adj","definitions":["nominative/accusative masculine plural of logistic"],"gender":"m-p"},{"word":"logistician","pos":"noun","definitions":["logistician"],"forms":{"plural":"logisticieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"logistician","accusative-definite-nominative-singular":"logisticianul","accusative-indefinite-nominative-plural":"logisticieni","accusative-definite-nominative-plural":"logisticienii","dative-genitive-indefinite-singular":"logistician","dative-definite-genitive-singular":"logisticianului","dative-genitive-indefinite-plural":"logisticieni","dative-definite-genitive-plural":"logisticienilor","singular-vocative":"logisticianule","plural-vocative":"logisticienilor"}},{"word":"logisticiană","pos":"noun","definitions":["female equivalent of logistician"],"forms":{"plural":"logisticiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"logisticiană","accusative-definite-nominative-singular":"logisticiana","accusative-indefinite-nominative-plural":"logisticiene","accusative-definite-nominative-plural":"logisticienele","dative-genitive-indefinite-singular":"logisticiene","dative-definite-genitive-singular":"logisticienei","dative-genitive-indefinite-plural":"logisticiene","dative-definite-genitive-plural":"logisticienelor","singular-vocative":"logisticiană","plural-vocative":"logisticienelor"}},{"word":"logo","pos":"noun","definitions":["logo"],"forms":{"plural":"logouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"logo","accusative-definite-nominative-singular":"logoul","accusative-indefinite-nominative-plural":"logouri","accusative-definite-nominative-plural":"logourile","dative-genitive-indefinite-singular":"logo","dative-definite-genitive-singular":"logoului","dative-genitive-indefinite-plural":"logouri","dative-definite-genitive-plural":"logourilor","singular-vocative":"logoule","plural-vocative":"logourilor"}},{"word":"logoclonie","pos":"noun","definitions":["logoclonia"],"forms":{"plural":"logoclonii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"logoclonie","accusative-definite-nominative-singular":"logoclonia","accusative-indefinite-nominative-plural":"logoclonii","accusative-definite-nominative-plural":"logocloniile","dative-genitive-indefinite-singular":"logoclonii","dative-definite-genitive-singular":"logocloniei","dative-genitive-indefinite-plural":"logoclonii","dative-definite-genitive-plural":"logocloniilor","singular-vocative":"logoclonie","plural-vocative":"logocloniilor"}},{"word":"logodan","pos":"noun","definitions":["suitor"],"forms":{"plural":"logodani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"logodan","accusative-definite-nominative-singular":"logodanul","accusative-indefinite-nominative-plural":"logodani","accusative-definite-nominative-plural":"logodanii","dative-genitive-indefinite-singular":"logodan","dative-definite-genitive-singular":"logodanului","dative-genitive-indefinite-plural":"logodani","dative-definite-genitive-plural":"logodanilor","singular-vocative":"logodanule","plural-vocative":"logodanilor"}},{"word":"logodeală","pos":"noun","definitions":["engagement"],"forms":{"plural":"logodeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"logodeală","accusative-definite-nominative-singular":"logodeala","accusative-indefinite-nominative-plural":"logodele","accusative-definite-nominative-plural":"logodelele","dative-genitive-indefinite-singular":"logodele","dative-definite-genitive-singular":"logodelei","dative-genitive-indefinite-plural":"logodele","dative-definite-genitive-plural":"logodelelor","singular-vocative":"logodeală","plural-vocative":"logodelelor"}},{"word":"logodeasă","pos":"noun","definitions":["fiancée"],"forms":{"plural":"logodese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"logodeasă","accusative-definite-nominative-singular":"logodeasa","accusative-indefinite-nominative-plural":"logodese","accusative-definite-nominative-plural":"logodesele","dative-genitive-indefinite-singular":"logodese","dative-definite-genitive-singular":"logodesei","dative-genitive-indefinite-plural":"logodese","dative-definite-genitive-plural":"logodeselor","singular-vocative":"logodeasă","plural-vocative":"logodeselor"}},{"word":"logodi","pos":"verb","definitions":["to betroth (to promise to give in marriage)","to become engaged"],"forms":{"canonical":"a logodi 4th conjugation","present-singular-third-person":"logodește","participle-past":"logodit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a logodi","gerund":"logodind","first-person-indicative-present-singular":"logodesc","indicative-present-second-person-singular":"logodești","indicative-present-singular-third-person":"logodește","first-person-indicative-plural-present":"logodim","indicative-plural-present-second-person":"logodiți","indicative-plural-present-third-person":"logodesc","first-person-imperfect-indicative-singular":"logodeam","imperfect-indicative-second-person-singular":"logodeai","imperfect-indicative-singular-third-person":"logodea","first-person-imperfect-indicative-plural":"logodeam","imperfect-indicative-plural-second-person":"logodeați","imperfect-indicative-plural-third-person":"logodeau","first-person-indicative-perfect-singular":"logodii","indicative-perfect-second-person-singular":"logodiși","indicative-perfect-singular-third-person":"logodi","first-person-indicative-perfect-plural":"logodirăm","indicative-perfect-plural-second-person":"logodirăți","indicative-perfect-plural-third-person":"logodiră","first-person-indicative-pluperfect-singular":"logodisem","indicative-pluperfect-second-person-singular":"logodiseși","indicative-pluperfect-singular-third-person":"logodise","first-person-indicative-pluperfect-plural":"logodiserăm","indicative-pluperfect-plural-second-person":"logodiserăți","indicative-pluperfect-plural-third-person":"logodiseră","first-person-present-singular-subjunctive":"să logodesc","present-second-person-singular-subjunctive":"să logodești","present-singular-subjunctive-third-person":"să logodească","first-person-plural-present-subjunctive":"să logodim","plural-present-second-person-subjunctive":"să logodiți","plural-present-subjunctive-third-person":"să logodească","imperative-second-person-singular":"logodește","imperative-plural-second-person":"logodiți","imperative-negative-second-person-singular":"nu logodi","imperative-negative-plural-second-person":"nu logodiți"}},{"word":"logodire","pos":"noun","definitions":["engagement (period of time when marriage is planned or promised)"],"gender":"f"},{"word":"logodit","pos":"adj","definitions":["betrothed, engaged"],"forms":{"feminine-singular":"logodită","masculine-plural":"logodiți","feminine-neuter-plural":"logodite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"logodit","error-unrecognized-form-feminine-indefinite-singular":"logodită","error-unrecognized-form-indefinite-masculine-plural":"logodiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"logodite","definite-error-unrecognized-form-masculine-neuter-singular":"logoditul","definite-error-unrecognized-form-feminine-singular":"logodita","definite-error-unrecognized-form-masculine-plural":"logodiții","definite-error-unrecognized-form-feminine-neuter-plural":"logoditele"}},{"word":"logoditură","pos":"noun","definitions":["engagement"],"forms":{"plural":"logodituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"logoditură","accusative-definite-nominative-singular":"logoditura","accusative-indefinite-nominative-plural":"logodituri","accusative-definite-nominative-plural":"logoditurile","dative-genitive-indefinite-singular":"logodituri","dative-definite-genitive-singular":"logoditurii","dative-genitive-indefinite-plural":"logodituri","dative-definite-genitive-plural":"logoditurilor","singular-vocative":"logoditură","plural-vocative":"logoditurilor"}},{"word":"logodna","pos":"noun","definitions":["definite nominative/accusative singular of logodnă"]},{"word":"logodnă","pos":"noun","definitions":["engagement","betrothal"],"forms":{"plural":"logodne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"logodnă","accusative-definite-nominative-singular":"logodna","accusative-indefinite-nominative-plural":"logodne","accusative-definite-nominative-plural":"logodnele","dative-genitive-indefinite-singular":"logodne","dative-definite-genitive-singular":"logodnei","dative-genitive-indefinite-plural":"logodne","dative-definite-genitive-plural":"logodnelor","singular-vocative":"logodnă","plural-vocative":"logodnelor"}},{"word":"logodnic","pos":"noun","definitions":["fiancé"],"forms":{"plural":"logodnici","feminine":"equivalent logodnică"}},{"word":"logodnica","pos":"noun","definitions":["definite nominative/accusative singular of logodnică"]},{"word":"logodnică","pos":"noun","definitions":["fiancée"],"forms":{"plural":"logodnice","masculine":"equivalent logodnic"}},{"word":"logofăt","pos":"noun","definitions":["an administrative position in the medieval Romanian principalities of Wallachia and Moldavia, such as the chief minister under the prince or a senior member of his council","a secretary or scribe","someone, especially young, with intellectual pretensions"],"forms":{"plural":"logofeți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"logofăt","accusative-definite-nominative-singular":"logofătul","accusative-indefinite-nominative-plural":"logofeți","accusative-definite-nominative-plural":"logofeții","dative-genitive-indefinite-singular":"logofăt","dative-definite-genitive-singular":"logofătului","dative-genitive-indefinite-plural":"logofeți","dative-definite-genitive-plural":"logofeților","singular-vocative":"logofătule","plural-vocative":"logofeților"}},{"word":"Logofătu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Logofătu"}},{"word":"logofeteasă","pos":"noun","definitions":["female equivalent of logofăt"],"forms":{"plural":"logofetese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"logofeteasă","accusative-definite-nominative-singular":"logofeteasa","accusative-indefinite-nominative-plural":"logofetese","accusative-definite-nominative-plural":"logofetesele","dative-genitive-indefinite-singular":"logofetese","dative-definite-genitive-singular":"logofetesei","dative-genitive-indefinite-plural":"logofetese","dative-definite-genitive-plural":"logofeteselor","singular-vocative":"logofeteasă","plural-vocative":"logofeteselor"}},{"word":"logofețel","pos":"noun","definitions":["diminutive of logofăt; small chancellor"],"forms":{"plural":"logofeței","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"logofețel","accusative-definite-nominative-singular":"logofețelul","accusative-indefinite-nominative-plural":"logofețeli","accusative-definite-nominative-plural":"logofețelii","dative-genitive-indefinite-singular":"logofețel","dative-definite-genitive-singular":"logofețelului","dative-genitive-indefinite-plural":"logofețeli","dative-definite-genitive-plural":"logofețelilor","singular-vocative":"logofețelule","plural-vocative":"logofețelilor"}},{"word":"Logofetescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Logofetescu"}},{"word":"logofeție","pos":"noun","definitions":["chancellery of a logofăt"],"forms":{"plural":"logofeții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"logofeție","accusative-definite-nominative-singular":"logofeția","accusative-indefinite-nominative-plural":"logofeții","accusative-definite-nominative-plural":"logofețiile","dative-genitive-indefinite-singular":"logofeții","dative-definite-genitive-singular":"logofeției","dative-genitive-indefinite-plural":"logofeții","dative-definite-genitive-plural":"logofețiilor","singular-vocative":"logofeție","plural-vocative":"logofețiilor"}},{"word":"Logofteni","pos":"name","definitions":["a village in Logofteni, Fălești Raion, Moldova","a commune of Fălești Raion, Moldova"],"gender":"m"},{"word":"logograf","pos":"noun","definitions":["logographer"],"forms":{"plural":"logografi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"logograf","accusative-definite-nominative-singular":"logograful","accusative-indefinite-nominative-plural":"logografi","accusative-definite-nominative-plural":"logografii","dative-genitive-indefinite-singular":"logograf","dative-definite-genitive-singular":"logografului","dative-genitive-indefinite-plural":"logografi","dative-definite-genitive-plural":"logografilor","singular-vocative":"logografule","plural-vocative":"logografilor"}},{"word":"logografie","pos":"noun","definitions":["logography"],"forms":{"plural":"logografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"logografie","accusative-definite-nominative-singular":"logografia","accusative-indefinite-nominative-plural":"logografii","accusative-definite-nominative-plural":"logografiile","dative-genitive-indefinite-singular":"logografii","dative-definite-genitive-singular":"logografiei","dative-genitive-indefinite-plural":"logografii","dative-definite-genitive-plural":"logografiilor","singular-vocative":"logografie","plural-vocative":"logografiilor"}},{"word":"logogrif","pos":"noun","definitions":["logogriph"],"forms":{"plural":"logogrifuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"logogrif","accusative-definite-nominative-singular":"logogriful","accusative-indefinite-nominative-plural":"logogrifuri","accusative-definite-nominative-plural":"logogrifurile","dative-genitive-indefinite-singular":"logogrif","dative-definite-genitive-singular":"logogrifului","dative-genitive-indefinite-plural":"logogrifuri","dative-definite-genitive-plural":"logogrifurilor","singular-vocative":"logogrifule","plural-vocative":"logogrifurilor"}},{"word":"logogrifă","pos":"noun","definitions":["obsolete form of logogrif"],"forms":{"plural":"logogrife","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"logogrifă","accusative-definite-nominative-singular":"logogrifa","accusative-indefinite-nominative-plural":"logogrife","accusative-definite-nominative-plural":"logogrifele","dative-genitive-indefinite-singular":"logogrife","dative-definite-genitive-singular":"logogrifei","dative-genitive-indefinite-plural":"logogrife","dative-definite-genitive-plural":"logogrifelor","singular-vocative":"logogrifă","plural-vocative":"logogrifelor"}},{"word":"logogrific","pos":"adj","definitions":["logographic"],"forms":{"feminine-singular":"logogrifică","masculine-plural":"logogrifici","feminine-neuter-plural":"logogrifice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"logogrific","error-unrecognized-form-feminine-indefinite-singular":"logogrifică","error-unrecognized-form-indefinite-masculine-plural":"logogrifici","error-unrecognized-form-feminine-indefinite-neuter-plural":"logogrifice","definite-error-unrecognized-form-masculine-neuter-singular":"logogrificul","definite-error-unrecognized-form-feminine-singular":"logogrifica","definite-error-unrecognized-form-masculine-plural":"logogrificii","definite-error-unrecognized-form-feminine-neuter-plural":"logogrificele"}},{"word":"Logojan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Logojan"}},{"word":"logolatrie","pos":"noun","definitions":["logolatry"],"forms":{"plural":"logolatrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"logolatrie","accusative-definite-nominative-singular":"logolatria","accusative-indefinite-nominative-plural":"logolatrii","accusative-definite-nominative-plural":"logolatriile","dative-genitive-indefinite-singular":"logolatrii","dative-definite-genitive-singular":"logolatriei","dative-genitive-indefinite-plural":"logolatrii","dative-definite-genitive-plural":"logolatriilor","singular-vocative":"logolatrie","plural-vocative":"logolatriilor"}},{"word":"logomahie","pos":"noun","definitions":["logomachy"],"forms":{"plural":"logomahii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"logomahie","accusative-definite-nominative-singular":"logomahia","accusative-indefinite-nominative-plural":"logomahii","accusative-definite-nominative-plural":"logomahiile","dative-genitive-indefinite-singular":"logomahii","dative-definite-genitive-singular":"logomahiei","dative-genitive-indefinite-plural":"logomahii","dative-definite-genitive-plural":"logomahiilor","singular-vocative":"logomahie","plural-vocative":"logomahiilor"}},{"word":"logometru","pos":"noun","definitions":["logometer"],"forms":{"plural":"logometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"logometru","accusative-definite-nominative-singular":"logometrul","accusative-indefinite-nominative-plural":"logometre","accusative-definite-nominative-plural":"logometrele","dative-genitive-indefinite-singular":"logometru","dative-definite-genitive-singular":"logometrului","dative-genitive-indefinite-plural":"logometre","dative-definite-genitive-plural":"logometrelor","singular-vocative":"logometrule","plural-vocative":"logometrelor"}},{"word":"logonevrotică","pos":"noun","definitions":["female equivalent of logonevrotic"],"forms":{"plural":"logonevrotice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"logonevrotică","accusative-definite-nominative-singular":"logonevrotica","accusative-indefinite-nominative-plural":"logonevrotice","accusative-definite-nominative-plural":"logonevroticele","dative-genitive-indefinite-singular":"logonevrotice","dative-definite-genitive-singular":"logonevroticei","dative-genitive-indefinite-plural":"logonevrotice","dative-definite-genitive-plural":"logonevroticelor","singular-vocative":"logonevrotică","plural-vocative":"logonevroticelor"}},{"word":"logonevroză","pos":"noun","definitions":["logoneurosis"],"forms":{"plural":"logonevroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"logonevroză","accusative-definite-nominative-singular":"logonevroza","accusative-indefinite-nominative-plural":"logonevroze","accusative-definite-nominative-plural":"logonevrozele","dative-genitive-indefinite-singular":"logonevroze","dative-definite-genitive-singular":"logonevrozei","dative-genitive-indefinite-plural":"logonevroze","dative-definite-genitive-plural":"logonevrozelor","singular-vocative":"logonevroză","plural-vocative":"logonevrozelor"}},{"word":"logopat","pos":"adj","definitions":["speech therapist"],"forms":{"feminine-singular":"logopată","masculine-plural":"logopați","feminine-neuter-plural":"logopate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"logopat","error-unrecognized-form-feminine-indefinite-singular":"logopată","error-unrecognized-form-indefinite-masculine-plural":"logopați","error-unrecognized-form-feminine-indefinite-neuter-plural":"logopate","definite-error-unrecognized-form-masculine-neuter-singular":"logopatul","definite-error-unrecognized-form-feminine-singular":"logopata","definite-error-unrecognized-form-masculine-plural":"logopații","definite-error-unrecognized-form-feminine-neuter-plural":"logopatele"}},{"word":"logopată","pos":"noun","definitions":["female equivalent of logopat"],"forms":{"plural":"logopate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"logopată","accusative-definite-nominative-singular":"logopata","accusative-indefinite-nominative-plural":"logopate","accusative-definite-nominative-plural":"logopatele","dative-genitive-indefinite-singular":"logopate","dative-definite-genitive-singular":"logopatei","dative-genitive-indefinite-plural":"logopate","dative-definite-genitive-plural":"logopatelor","singular-vocative":"logopată","plural-vocative":"logopatelor"}},{"word":"logopatie","pos":"noun","definitions":["logopathy"],"forms":{"plural":"logopatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"logopatie","accusative-definite-nominative-singular":"logopatia","accusative-indefinite-nominative-plural":"logopatii","accusative-definite-nominative-plural":"logopatiile","dative-genitive-indefinite-singular":"logopatii","dative-definite-genitive-singular":"logopatiei","dative-genitive-indefinite-plural":"logopatii","dative-definite-genitive-plural":"logopatiilor","singular-vocative":"logopatie","plural-vocative":"logopatiilor"}},{"word":"logoped","pos":"noun","definitions":["logopedist"],"forms":{"plural":"logopezi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"logoped","accusative-definite-nominative-singular":"logopedul","accusative-indefinite-nominative-plural":"logopezi","accusative-definite-nominative-plural":"logopezii","dative-genitive-indefinite-singular":"logoped","dative-definite-genitive-singular":"logopedului","dative-genitive-indefinite-plural":"logopezi","dative-definite-genitive-plural":"logopezilor","singular-vocative":"logopedule","plural-vocative":"logopezilor"}},{"word":"logopedă","pos":"noun","definitions":["female equivalent of logoped"],"forms":{"plural":"logopede","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"logopedă","accusative-definite-nominative-singular":"logopeda","accusative-indefinite-nominative-plural":"logopede","accusative-definite-nominative-plural":"logopedele","dative-genitive-indefinite-singular":"logopede","dative-definite-genitive-singular":"logopedei","dative-genitive-indefinite-plural":"logopede","dative-definite-genitive-plural":"logopedelor","singular-vocative":"logopedă","plural-vocative":"logopedelor"}},{"word":"logopedic","pos":"adj","definitions":["logopedic"],"forms":{"feminine-singular":"logopedică","masculine-plural":"logopedici","feminine-neuter-plural":"logopedice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"logopedic","error-unrecognized-form-feminine-indefinite-singular":"logopedică","error-unrecognized-form-indefinite-masculine-plural":"logopedici","error-unrecognized-form-feminine-indefinite-neuter-plural":"logopedice","definite-error-unrecognized-form-masculine-neuter-singular":"logopedicul","definite-error-unrecognized-form-feminine-singular":"logopedica","definite-error-unrecognized-form-masculine-plural":"logopedicii","definite-error-unrecognized-form-feminine-neuter-plural":"logopedicele"}},{"word":"logopedie","pos":"noun","definitions":["speech therapy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"logopedie","accusative-definite-nominative":"logopedia","dative-genitive-indefinite":"logopedii","dative-definite-genitive":"logopediei","vocative":"logopedie"}},{"word":"logoplegie","pos":"noun","definitions":["logoplegia"],"forms":{"plural":"logoplegii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"logoplegie","accusative-definite-nominative-singular":"logoplegia","accusative-indefinite-nominative-plural":"logoplegii","accusative-definite-nominative-plural":"logoplegiile","dative-genitive-indefinite-singular":"logoplegii","dative-definite-genitive-singular":"logoplegiei","dative-genitive-indefinite-plural":"logoplegii","dative-definite-genitive-plural":"logoplegiilor","singular-vocative":"logoplegie","plural-vocative":"logoplegiilor"}},{"word":"logoree","pos":"noun","definitions":["logorrhea"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"logoree","accusative-definite-nominative":"logoreea","dative-genitive-indefinite":"logorei","dative-definite-genitive":"logoreii","vocative":"logoree"}},{"word":"logoreic","pos":"adj","definitions":["logorrheic"],"forms":{"feminine-singular":"logoreică","masculine-plural":"logoreici","feminine-neuter-plural":"logoreice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"logoreic","error-unrecognized-form-feminine-indefinite-singular":"logoreică","error-unrecognized-form-indefinite-masculine-plural":"logoreici","error-unrecognized-form-feminine-indefinite-neuter-plural":"logoreice","definite-error-unrecognized-form-masculine-neuter-singular":"logoreicul","definite-error-unrecognized-form-feminine-singular":"logoreica","definite-error-unrecognized-form-masculine-plural":"logoreicii","definite-error-unrecognized-form-feminine-neuter-plural":"logoreicele"}},{"word":"logoroseală","pos":"noun","definitions":["understanding"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"logoroseală","accusative-definite-nominative":"logoroseala","dative-genitive-indefinite":"logoroseale","dative-definite-genitive":"logorosealei","vocative":"logoroseală"}},{"word":"logos","pos":"noun","definitions":["logos"],"forms":{"plural":"logosuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"logos","accusative-definite-nominative-singular":"logosul","accusative-indefinite-nominative-plural":"logosuri","accusative-definite-nominative-plural":"logosurile","dative-genitive-indefinite-singular":"logos","dative-definite-genitive-singular":"logosului","dative-genitive-indefinite-plural":"logosuri","dative-definite-genitive-plural":"logosurilor","singular-vocative":"logosule","plural-vocative":"logosurilor"}},{"word":"logotip","pos":"noun","definitions":["logotype"],"forms":{"plural":"logotipuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"logotip","accusative-definite-nominative-singular":"logotipul","accusative-indefinite-nominative-plural":"logotipuri","accusative-definite-nominative-plural":"logotipurile","dative-genitive-indefinite-singular":"logotip","dative-definite-genitive-singular":"logotipului","dative-genitive-indefinite-plural":"logotipuri","dative-definite-genitive-plural":"logotipurilor","singular-vocative":"logotipule","plural-vocative":"logotipurilor"}},{"word":"logotrivi","pos":"noun","definitions":["discussion"]},{"word":"Logrești Moșteni","pos":"name","definitions":["a village in Logrești, Gorj County, Romania"],"gender":"m"},{"word":"lohancă","pos":"noun","definitions":["basin for washing"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lohancă","accusative-definite-nominative":"lohanca","dative-genitive-indefinite":"lohance","dative-definite-genitive":"lohancei","vocative":"lohancă"}},{"word":"loial","pos":"adj","definitions":["loyal"],"forms":{"feminine-singular":"loială","masculine-plural":"loiali","feminine-neuter-plural":"loiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"loial","error-unrecognized-form-feminine-indefinite-singular":"loială","error-unrecognized-form-indefinite-masculine-plural":"loiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"loiale","definite-error-unrecognized-form-masculine-neuter-singular":"loialul","definite-error-unrecognized-form-feminine-singular":"loiala","definite-error-unrecognized-form-masculine-plural":"loialii","definite-error-unrecognized-form-feminine-neuter-plural":"loialele"}},{"word":"loialism","pos":"noun","definitions":["loyalty"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"loialism","accusative-definite-nominative":"loialismul","dative-genitive-indefinite":"loialism","dative-definite-genitive":"loialismului","vocative":"loialismule"}},{"word":"loialist","pos":"noun","definitions":["loyalist"],"forms":{"plural":"loialiști","feminine":"equivalent loialistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"loialist","accusative-definite-nominative-singular":"loialistul","accusative-indefinite-nominative-plural":"loialiști","accusative-definite-nominative-plural":"loialiștii","dative-genitive-indefinite-singular":"loialist","dative-definite-genitive-singular":"loialistului","dative-genitive-indefinite-plural":"loialiști","dative-definite-genitive-plural":"loialiștilor","singular-vocative":"loialistule","plural-vocative":"loialiștilor"}},{"word":"loialistă","pos":"noun","definitions":["female equivalent of loialist"],"forms":{"plural":"loialiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"loialistă","accusative-definite-nominative-singular":"loialista","accusative-indefinite-nominative-plural":"loialiste","accusative-definite-nominative-plural":"loialistele","dative-genitive-indefinite-singular":"loialiste","dative-definite-genitive-singular":"loialistei","dative-genitive-indefinite-plural":"loialiste","dative-definite-genitive-plural":"loialistelor","singular-vocative":"loialistă","plural-vocative":"loialistelor"}},{"word":"loialitate","pos":"noun","definitions":["loyalty"],"forms":{"plural":"loialități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"loialitate","accusative-definite-nominative-singular":"loialitatea","accusative-indefinite-nominative-plural":"loialități","accusative-definite-nominative-plural":"loialitățile","dative-genitive-indefinite-singular":"loialități","dative-definite-genitive-singular":"loialității","dative-genitive-indefinite-plural":"loialități","dative-definite-genitive-plural":"loialităților","singular-vocative":"loialitate","plural-vocative":"loialităților"}},{"word":"loialmente","pos":"adv","definitions":["loyally"]},{"word":"loisir","pos":"noun","definitions":["leisure, hobby"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"loisir","accusative-definite-nominative":"loisirul","dative-genitive-indefinite":"loisir","dative-definite-genitive":"loisirului","vocative":"loisirule"}},{"word":"loitră","pos":"noun","definitions":["one of the sides of a ladder wagon, shaped like a sideways ladder","a wooden fencelike structure affixed to the floor of a wagon that secures voluminous cargo such as hay and replaces the proper loitră which it is taller and wider than","ladder","ladder-shaped meat-hanging rack affixed to the ceiling","wall-mounted hay rack (simple gravity feed dispenser)"],"pronunciation":"/ˈloj.trə/","forms":{"plural":"loitre","alternative":"лойтрэ"}},{"word":"loitriță","pos":"noun","definitions":["diminutive of loitră"],"forms":{"plural":"loitrițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"loitriță","accusative-definite-nominative-singular":"loitrița","accusative-indefinite-nominative-plural":"loitrițe","accusative-definite-nominative-plural":"loitrițele","dative-genitive-indefinite-singular":"loitrițe","dative-definite-genitive-singular":"loitriței","dative-genitive-indefinite-plural":"loitrițe","dative-definite-genitive-plural":"loitrițelor","singular-vocative":"loitriță","plural-vocative":"loitrițelor"}},{"word":"lojă","pos":"noun","definitions":["lodge"],"forms":{"plural":"loji","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lojă","accusative-definite-nominative-singular":"loja","accusative-indefinite-nominative-plural":"loji","accusative-definite-nominative-plural":"lojile","dative-genitive-indefinite-singular":"loji","dative-definite-genitive-singular":"lojii","dative-genitive-indefinite-plural":"loji","dative-definite-genitive-plural":"lojilor","singular-vocative":"lojă","plural-vocative":"lojilor"}},{"word":"lojesnă","pos":"noun","definitions":["uterus"],"forms":{"plural":"lojesne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lojesnă","accusative-definite-nominative-singular":"lojesna","accusative-indefinite-nominative-plural":"lojesne","accusative-definite-nominative-plural":"lojesnele","dative-genitive-indefinite-singular":"lojesne","dative-definite-genitive-singular":"lojesnei","dative-genitive-indefinite-plural":"lojesne","dative-definite-genitive-plural":"lojesnelor","singular-vocative":"lojesnă","plural-vocative":"lojesnelor"}},{"word":"Lojnița","pos":"name","definitions":["a village in Chiojdeni, Vrancea County, Romania"],"gender":"f"},{"word":"Loloiasca","pos":"name","definitions":["a village in Tomșani, Prahova County, Romania"],"gender":"f"},{"word":"lom","pos":"noun","definitions":["crowbar"],"forms":{"plural":"lomuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lom","accusative-definite-nominative-singular":"lomul","accusative-indefinite-nominative-plural":"lomuri","accusative-definite-nominative-plural":"lomurile","dative-genitive-indefinite-singular":"lom","dative-definite-genitive-singular":"lomului","dative-genitive-indefinite-plural":"lomuri","dative-definite-genitive-plural":"lomurilor","singular-vocative":"lomule","plural-vocative":"lomurilor"}},{"word":"lombalgie","pos":"noun","definitions":["lumbago"],"forms":{"plural":"lombalgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lombalgie","accusative-definite-nominative-singular":"lombalgia","accusative-indefinite-nominative-plural":"lombalgii","accusative-definite-nominative-plural":"lombalgiile","dative-genitive-indefinite-singular":"lombalgii","dative-definite-genitive-singular":"lombalgiei","dative-genitive-indefinite-plural":"lombalgii","dative-definite-genitive-plural":"lombalgiilor","singular-vocative":"lombalgie","plural-vocative":"lombalgiilor"}},{"word":"lombalizare","pos":"noun","definitions":["lumbarization"],"forms":{"plural":"lombalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lombalizare","accusative-definite-nominative-singular":"lombalizarea","accusative-indefinite-nominative-plural":"lombalizări","accusative-definite-nominative-plural":"lombalizările","dative-genitive-indefinite-singular":"lombalizări","dative-definite-genitive-singular":"lombalizării","dative-genitive-indefinite-plural":"lombalizări","dative-definite-genitive-plural":"lombalizărilor","singular-vocative":"lombalizare","plural-vocative":"lombalizărilor"}},{"word":"lombar","pos":"adj","definitions":["lumbar"],"forms":{"feminine-singular":"lombară","masculine-plural":"lombari","feminine-neuter-plural":"lombare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lombar","error-unrecognized-form-feminine-indefinite-singular":"lombară","error-unrecognized-form-indefinite-masculine-plural":"lombari","error-unrecognized-form-feminine-indefinite-neuter-plural":"lombare","definite-error-unrecognized-form-masculine-neuter-singular":"lombarul","definite-error-unrecognized-form-feminine-singular":"lombara","definite-error-unrecognized-form-masculine-plural":"lombarii","definite-error-unrecognized-form-feminine-neuter-plural":"lombarele"}},{"word":"lombard","pos":"noun","definitions":["Lombard (native or inhabitant of the region of Lombardy, Italy) (usually male)","pawnshop"],"forms":{"plural":"lombarzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lombard","accusative-definite-nominative-singular":"lombardul","accusative-indefinite-nominative-plural":"lombarzi","accusative-definite-nominative-plural":"lombarzii","dative-genitive-indefinite-singular":"lombard","dative-definite-genitive-singular":"lombardului","dative-genitive-indefinite-plural":"lombarzi","dative-definite-genitive-plural":"lombarzilor","singular-vocative":"lombardule","plural-vocative":"lombarzilor"}},{"word":"lombarda","pos":"verb","definitions":["to pawn, to give something as collateral for a loan"],"forms":{"canonical":"a lombarda 1st conjugation","present-singular-third-person":"lombardează","participle-past":"lombardat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a lombarda","gerund":"lombardând","first-person-indicative-present-singular":"lombardez","indicative-present-second-person-singular":"lombardezi","indicative-present-singular-third-person":"lombardează","first-person-indicative-plural-present":"lombardăm","indicative-plural-present-second-person":"lombardați","indicative-plural-present-third-person":"lombardează","first-person-imperfect-indicative-singular":"lombardam","imperfect-indicative-second-person-singular":"lombardai","imperfect-indicative-singular-third-person":"lombarda","first-person-imperfect-indicative-plural":"lombardam","imperfect-indicative-plural-second-person":"lombardați","imperfect-indicative-plural-third-person":"lombardau","first-person-indicative-perfect-singular":"lombardai","indicative-perfect-second-person-singular":"lombardași","indicative-perfect-singular-third-person":"lombardă","first-person-indicative-perfect-plural":"lombardarăm","indicative-perfect-plural-second-person":"lombardarăți","indicative-perfect-plural-third-person":"lombardară","first-person-indicative-pluperfect-singular":"lombardasem","indicative-pluperfect-second-person-singular":"lombardaseși","indicative-pluperfect-singular-third-person":"lombardase","first-person-indicative-pluperfect-plural":"lombardaserăm","indicative-pluperfect-plural-second-person":"lombardaserăți","indicative-pluperfect-plural-third-person":"lombardaseră","first-person-present-singular-subjunctive":"să lombardez","present-second-person-singular-subjunctive":"să lombardezi","present-singular-subjunctive-third-person":"să lombardeze","first-person-plural-present-subjunctive":"să lombardăm","plural-present-second-person-subjunctive":"să lombardați","plural-present-subjunctive-third-person":"să lombardeze","imperative-second-person-singular":"lombardează","imperative-plural-second-person":"lombardați","imperative-negative-second-person-singular":"nu lombarda","imperative-negative-plural-second-person":"nu lombardați"}},{"word":"lombardare","pos":"noun","definitions":["pawning"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"lombardare","accusative-definite-nominative":"lombardarea","dative-genitive-indefinite":"lombardări","dative-definite-genitive":"lombardării","vocative":"lombardare"}},{"word":"Lombardia","pos":"name","definitions":["Lombardy (an administrative region in northern Italy, where its capital and the largest city Milan is founded in the Po Valley)"],"gender":"f"},{"word":"lombardic","pos":"adj","definitions":["Lombard"],"forms":{"feminine-singular":"lombardică","masculine-plural":"lombardici","feminine-neuter-plural":"lombardice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lombardic","error-unrecognized-form-feminine-indefinite-singular":"lombardică","error-unrecognized-form-indefinite-masculine-plural":"lombardici","error-unrecognized-form-feminine-indefinite-neuter-plural":"lombardice","definite-error-unrecognized-form-masculine-neuter-singular":"lombardicul","definite-error-unrecognized-form-feminine-singular":"lombardica","definite-error-unrecognized-form-masculine-plural":"lombardicii","definite-error-unrecognized-form-feminine-neuter-plural":"lombardicele"}},{"word":"lombardicesc","pos":"adj","definitions":["Lombardic"],"forms":{"feminine-singular":"lombardicească","plural":"lombardicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lombardicesc","error-unrecognized-form-feminine-indefinite-singular":"lombardicească","error-unrecognized-form-indefinite-masculine-plural":"lombardicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"lombardicești","definite-error-unrecognized-form-masculine-neuter-singular":"lombardicescul","definite-error-unrecognized-form-feminine-singular":"lombardiceasca","definite-error-unrecognized-form-masculine-plural":"lombardiceștii","definite-error-unrecognized-form-feminine-neuter-plural":"lombardiceștile"}},{"word":"lombartrie","pos":"noun","definitions":["lumbar osteoarthritis"],"forms":{"plural":"lombartrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lombartrie","accusative-definite-nominative-singular":"lombartria","accusative-indefinite-nominative-plural":"lombartrii","accusative-definite-nominative-plural":"lombartriile","dative-genitive-indefinite-singular":"lombartrii","dative-definite-genitive-singular":"lombartriei","dative-genitive-indefinite-plural":"lombartrii","dative-definite-genitive-plural":"lombartriilor","singular-vocative":"lombartrie","plural-vocative":"lombartriilor"}},{"word":"lombartroză","pos":"noun","definitions":["lumbar osteoarthritis"],"forms":{"plural":"lombartroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lombartroză","accusative-definite-nominative-singular":"lombartroza","accusative-indefinite-nominative-plural":"lombartroze","accusative-definite-nominative-plural":"lombartrozele","dative-genitive-indefinite-singular":"lombartroze","dative-definite-genitive-singular":"lombartrozei","dative-genitive-indefinite-plural":"lombartroze","dative-definite-genitive-plural":"lombartrozelor","singular-vocative":"lombartroză","plural-vocative":"lombartrozelor"}},{"word":"lombosciatică","pos":"noun","definitions":["lumbar sciatica"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lombosciatică","accusative-definite-nominative":"lombosciatica","dative-genitive-indefinite":"e","dative-definite-genitive":"ei","vocative":"lombosciatică"}},{"word":"lombotomie","pos":"noun","definitions":["lumbotomy"],"forms":{"plural":"lombotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lombotomie","accusative-definite-nominative-singular":"lombotomia","accusative-indefinite-nominative-plural":"lombotomii","accusative-definite-nominative-plural":"lombotomiile","dative-genitive-indefinite-singular":"lombotomii","dative-definite-genitive-singular":"lombotomiei","dative-genitive-indefinite-plural":"lombotomii","dative-definite-genitive-plural":"lombotomiilor","singular-vocative":"lombotomie","plural-vocative":"lombotomiilor"}},{"word":"Lompirt","pos":"name","definitions":["a village in Șărmășag, Sălaj County, Romania"],"gender":"m"},{"word":"londonez","pos":"noun","definitions":["Londoner"],"forms":{"plural":"londonezi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"londonez","accusative-definite-nominative-singular":"londonezul","accusative-indefinite-nominative-plural":"londonezi","accusative-definite-nominative-plural":"londonezii","dative-genitive-indefinite-singular":"londonez","dative-definite-genitive-singular":"londonezului","dative-genitive-indefinite-plural":"londonezi","dative-definite-genitive-plural":"londonezilor","singular-vocative":"londonezule","plural-vocative":"londonezilor"}},{"word":"londoneză","pos":"noun","definitions":["female equivalent of londonez"],"forms":{"plural":"londoneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"londoneză","accusative-definite-nominative-singular":"londoneza","accusative-indefinite-nominative-plural":"londoneze","accusative-definite-nominative-plural":"londonezele","dative-genitive-indefinite-singular":"londoneze","dative-definite-genitive-singular":"londonezei","dative-genitive-indefinite-plural":"londoneze","dative-definite-genitive-plural":"londonezelor","singular-vocative":"londoneză","plural-vocative":"londonezelor"}},{"word":"Londra","pos":"name","definitions":["London (the capital city of the United Kingdom; the capital city of England)"],"pronunciation":"/ˈlon.dra/","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"Londră","accusative-definite-nominative":"Londra","dative-genitive-indefinite":"Londre","dative-definite-genitive":"Londrei","vocative":"Londră","alternative":"Лондра"}},{"word":"Londra Mare","pos":"name","definitions":["Greater London"],"gender":"f"},{"word":"longeron","pos":"noun","definitions":["alternative form of lonjeron"],"forms":{"plural":"longeroane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"longeron","accusative-definite-nominative-singular":"longeronul","accusative-indefinite-nominative-plural":"longeroane","accusative-definite-nominative-plural":"longeroanele","dative-genitive-indefinite-singular":"longeron","dative-definite-genitive-singular":"longeronului","dative-genitive-indefinite-plural":"longeroane","dative-definite-genitive-plural":"longeroanelor","singular-vocative":"longeronule","plural-vocative":"longeroanelor"}},{"word":"longevitate","pos":"noun","definitions":["longevity"],"forms":{"plural":"longevități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"longevitate","accusative-definite-nominative-singular":"longevitatea","accusative-indefinite-nominative-plural":"longevități","accusative-definite-nominative-plural":"longevitățile","dative-genitive-indefinite-singular":"longevități","dative-definite-genitive-singular":"longevității","dative-genitive-indefinite-plural":"longevități","dative-definite-genitive-plural":"longevităților","singular-vocative":"longevitate","plural-vocative":"longevităților"}},{"word":"longeviv","pos":"noun","definitions":["long-lived person"],"pronunciation":"/lon.d͡ʒeˈviv/","forms":{"plural":"longevivi","feminine":"equivalent longevivă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"longeviv","accusative-definite-nominative-singular":"longevivul","accusative-indefinite-nominative-plural":"longevivi","accusative-definite-nominative-plural":"longevivii","dative-genitive-indefinite-singular":"longeviv","dative-definite-genitive-singular":"longevivului","dative-genitive-indefinite-plural":"longevivi","dative-definite-genitive-plural":"longevivilor","singular-vocative":"longevivule","plural-vocative":"longevivilor"}},{"word":"longeviv","pos":"adj","definitions":["longevous; long-lived"],"pronunciation":"/lon.d͡ʒeˈviv/","forms":{"feminine-singular":"longevivă","masculine-plural":"longevivi","feminine-neuter-plural":"longevive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"longeviv","error-unrecognized-form-feminine-indefinite-singular":"longevivă","error-unrecognized-form-indefinite-masculine-plural":"longevivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"longevive","definite-error-unrecognized-form-masculine-neuter-singular":"longevivul","definite-error-unrecognized-form-feminine-singular":"longeviva","definite-error-unrecognized-form-masculine-plural":"longevivii","definite-error-unrecognized-form-feminine-neuter-plural":"longevivele"}},{"word":"longevivă","pos":"noun","definitions":["female equivalent of longeviv"],"forms":{"plural":"longevive","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"longevivă","accusative-definite-nominative-singular":"longeviva","accusative-indefinite-nominative-plural":"longevive","accusative-definite-nominative-plural":"longevivele","dative-genitive-indefinite-singular":"longevive","dative-definite-genitive-singular":"longevivei","dative-genitive-indefinite-plural":"longevive","dative-definite-genitive-plural":"longevivelor","singular-vocative":"longevivă","plural-vocative":"longevivelor"}},{"word":"longevivi","pos":"noun","definitions":["plural of longeviv"]},{"word":"longilin","pos":"adj","definitions":["rangy (long-limbed)"],"forms":{"feminine-singular":"longilină","masculine-plural":"longilini","feminine-neuter-plural":"longiline","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"longilin","error-unrecognized-form-feminine-indefinite-singular":"longilină","error-unrecognized-form-indefinite-masculine-plural":"longilini","error-unrecognized-form-feminine-indefinite-neuter-plural":"longiline","definite-error-unrecognized-form-masculine-neuter-singular":"longilinul","definite-error-unrecognized-form-feminine-singular":"longilina","definite-error-unrecognized-form-masculine-plural":"longilinii","definite-error-unrecognized-form-feminine-neuter-plural":"longilinele"}},{"word":"longitudinal","pos":"adj","definitions":["longitudinal"],"forms":{"feminine-singular":"longitudinală","masculine-plural":"longitudinali","feminine-neuter-plural":"longitudinale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"longitudinal","error-unrecognized-form-feminine-indefinite-singular":"longitudinală","error-unrecognized-form-indefinite-masculine-plural":"longitudinali","error-unrecognized-form-feminine-indefinite-neuter-plural":"longitudinale","definite-error-unrecognized-form-masculine-neuter-singular":"longitudinalul","definite-error-unrecognized-form-feminine-singular":"longitudinala","definite-error-unrecognized-form-masculine-plural":"longitudinalii","definite-error-unrecognized-form-feminine-neuter-plural":"longitudinalele"}},{"word":"longitudine","pos":"noun","definitions":["longitude"],"forms":{"plural":"longitudini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"longitudine","accusative-definite-nominative-singular":"longitudinea","accusative-indefinite-nominative-plural":"longitudini","accusative-definite-nominative-plural":"longitudinile","dative-genitive-indefinite-singular":"longitudini","dative-definite-genitive-singular":"longitudinii","dative-genitive-indefinite-plural":"longitudini","dative-definite-genitive-plural":"longitudinilor","singular-vocative":"longitudine","plural-vocative":"longitudinilor"}},{"word":"longobard","pos":"noun","definitions":["Lombard"],"forms":{"plural":"longobarzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"longobard","accusative-definite-nominative-singular":"longobardul","accusative-indefinite-nominative-plural":"longobarzi","accusative-definite-nominative-plural":"longobarzii","dative-genitive-indefinite-singular":"longobard","dative-definite-genitive-singular":"longobardului","dative-genitive-indefinite-plural":"longobarzi","dative-definite-genitive-plural":"longobarzilor","singular-vocative":"longobardule","plural-vocative":"longobarzilor"}},{"word":"longobardă","pos":"noun","definitions":["female equivalent of longobard"],"forms":{"plural":"longobarde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"longobardă","accusative-definite-nominative-singular":"longobarda","accusative-indefinite-nominative-plural":"longobarde","accusative-definite-nominative-plural":"longobardele","dative-genitive-indefinite-singular":"longobarde","dative-definite-genitive-singular":"longobardei","dative-genitive-indefinite-plural":"longobarde","dative-definite-genitive-plural":"longobardelor","singular-vocative":"longobardă","plural-vocative":"longobardelor"}},{"word":"lonjeron","pos":"noun","definitions":["longeron"],"forms":{"plural":"lonjeroane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lonjeron","accusative-definite-nominative-singular":"lonjeronul","accusative-indefinite-nominative-plural":"lonjeroane","accusative-definite-nominative-plural":"lonjeroanele","dative-genitive-indefinite-singular":"lonjeron","dative-definite-genitive-singular":"lonjeronului","dative-genitive-indefinite-plural":"lonjeroane","dative-definite-genitive-plural":"lonjeroanelor","singular-vocative":"lonjeronule","plural-vocative":"lonjeroanelor"}},{"word":"look","pos":"noun","definitions":["look"],"forms":{"plural":"lookuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"look","accusative-definite-nominative-singular":"lookul","accusative-indefinite-nominative-plural":"lookuri","accusative-definite-nominative-plural":"lookurile","dative-genitive-indefinite-singular":"look","dative-definite-genitive-singular":"lookului","dative-genitive-indefinite-plural":"lookuri","dative-definite-genitive-plural":"lookurilor","singular-vocative":"lookule","plural-vocative":"lookurilor"}},{"word":"looping","pos":"noun","definitions":["loop (aerobatic maneuver in an aircraft)"],"forms":{"plural":"loopinguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"looping","accusative-definite-nominative-singular":"loopingul","accusative-indefinite-nominative-plural":"loopinguri","accusative-definite-nominative-plural":"loopingurile","dative-genitive-indefinite-singular":"looping","dative-definite-genitive-singular":"loopingului","dative-genitive-indefinite-plural":"loopinguri","dative-definite-genitive-plural":"loopingurilor","singular-vocative":"loopingule","plural-vocative":"loopingurilor"}},{"word":"lopăcioară","pos":"noun","definitions":["diminutive of lopată"],"forms":{"plural":"lopăcioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lopăcioară","accusative-definite-nominative-singular":"lopăcioara","accusative-indefinite-nominative-plural":"lopăcioare","accusative-definite-nominative-plural":"lopăcioarele","dative-genitive-indefinite-singular":"lopăcioare","dative-definite-genitive-singular":"lopăcioarei","dative-genitive-indefinite-plural":"lopăcioare","dative-definite-genitive-plural":"lopăcioarelor","singular-vocative":"lopăcioară","plural-vocative":"lopăcioarelor"}},{"word":"Lopadea Nouă","pos":"name","definitions":["a commune of Alba County, Romania","a village in Lopadea Nouă, Alba County, Romania"],"gender":"f"},{"word":"Lopadea Veche","pos":"name","definitions":["a village in Mirăslău, Alba County, Romania"],"gender":"f"},{"word":"lopar","pos":"noun","definitions":["scoop, peel (used to remove bread from an oven)"],"forms":{"plural":"lopare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lopar","accusative-definite-nominative-singular":"loparul","accusative-indefinite-nominative-plural":"lopare","accusative-definite-nominative-plural":"loparele","dative-genitive-indefinite-singular":"lopar","dative-definite-genitive-singular":"loparului","dative-genitive-indefinite-plural":"lopare","dative-definite-genitive-plural":"loparelor","singular-vocative":"loparule","plural-vocative":"loparelor"}},{"word":"Lopată","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lopată"}},{"word":"lopată","pos":"noun","definitions":["shovel, spade"],"forms":{"plural":"lopeți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lopată","accusative-definite-nominative-singular":"lopata","accusative-indefinite-nominative-plural":"lopeți","accusative-definite-nominative-plural":"lopețile","dative-genitive-indefinite-singular":"lopeți","dative-definite-genitive-singular":"lopeții","dative-genitive-indefinite-plural":"lopeți","dative-definite-genitive-plural":"lopeților","singular-vocative":"lopată","plural-vocative":"lopeților"}},{"word":"lopăta","pos":"verb","definitions":["to row (a boat)"],"forms":{"canonical":"a lopăta 1st conjugation","present-singular-third-person":"lopătează","participle-past":"lopătat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a lopăta","gerund":"lopătând","first-person-indicative-present-singular":"lopătez","indicative-present-second-person-singular":"lopătezi","indicative-present-singular-third-person":"lopătează","first-person-indicative-plural-present":"lopătăm","indicative-plural-present-second-person":"lopătați","indicative-plural-present-third-person":"lopătează","first-person-imperfect-indicative-singular":"lopătam","imperfect-indicative-second-person-singular":"lopătai","imperfect-indicative-singular-third-person":"lopăta","first-person-imperfect-indicative-plural":"lopătam","imperfect-indicative-plural-second-person":"lopătați","imperfect-indicative-plural-third-person":"lopătau","first-person-indicative-perfect-singular":"lopătai","indicative-perfect-second-person-singular":"lopătași","indicative-perfect-singular-third-person":"lopătă","first-person-indicative-perfect-plural":"lopătarăm","indicative-perfect-plural-second-person":"lopătarăți","indicative-perfect-plural-third-person":"lopătară","first-person-indicative-pluperfect-singular":"lopătasem","indicative-pluperfect-second-person-singular":"lopătaseși","indicative-pluperfect-singular-third-person":"lopătase","first-person-indicative-pluperfect-plural":"lopătaserăm","indicative-pluperfect-plural-second-person":"lopătaserăți","indicative-pluperfect-plural-third-person":"lopătaseră","first-person-present-singular-subjunctive":"să lopătez","present-second-person-singular-subjunctive":"să lopătezi","present-singular-subjunctive-third-person":"să lopăteze","first-person-plural-present-subjunctive":"să lopătăm","plural-present-second-person-subjunctive":"să lopătați","plural-present-subjunctive-third-person":"să lopăteze","imperative-second-person-singular":"lopătează","imperative-plural-second-person":"lopătați","imperative-negative-second-person-singular":"nu lopăta","imperative-negative-plural-second-person":"nu lopătați"}},{"word":"lopătar","pos":"noun","definitions":["riverboatman, boatman, paddler","shoveler (one who shovels)","spoonbill (bird)"],"pronunciation":"/lo.pəˈtar/","forms":{"plural":"lopătari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lopătar","accusative-definite-nominative-singular":"lopătarul","accusative-indefinite-nominative-plural":"lopătari","accusative-definite-nominative-plural":"lopătarii","dative-genitive-indefinite-singular":"lopătar","dative-definite-genitive-singular":"lopătarului","dative-genitive-indefinite-plural":"lopătari","dative-definite-genitive-plural":"lopătarilor","singular-vocative":"lopătarule","plural-vocative":"lopătarilor"}},{"word":"lopătăraș","pos":"noun","definitions":["diminutive of lopătar"],"forms":{"plural":"lopătărași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lopătăraș","accusative-definite-nominative-singular":"lopătărașul","accusative-indefinite-nominative-plural":"lopătărași","accusative-definite-nominative-plural":"lopătărașii","dative-genitive-indefinite-singular":"lopătăraș","dative-definite-genitive-singular":"lopătărașului","dative-genitive-indefinite-plural":"lopătărași","dative-definite-genitive-plural":"lopătărașilor","singular-vocative":"lopătărașule","plural-vocative":"lopătărașilor"}},{"word":"lopătare","pos":"noun","definitions":["rowing"],"forms":{"plural":"lopătări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lopătare","accusative-definite-nominative-singular":"lopătarea","accusative-indefinite-nominative-plural":"lopătări","accusative-definite-nominative-plural":"lopătările","dative-genitive-indefinite-singular":"lopătări","dative-definite-genitive-singular":"lopătării","dative-genitive-indefinite-plural":"lopătări","dative-definite-genitive-plural":"lopătărilor","singular-vocative":"lopătare","plural-vocative":"lopătărilor"}},{"word":"Lopătăreasa","pos":"name","definitions":["a village in Bisoca, Buzău County, Romania"],"gender":"f"},{"word":"lopătăreasă","pos":"noun","definitions":["female equivalent of lopătăreas"],"forms":{"plural":"lopătărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lopătăreasă","accusative-definite-nominative-singular":"lopătăreasa","accusative-indefinite-nominative-plural":"lopătărese","accusative-definite-nominative-plural":"lopătăresele","dative-genitive-indefinite-singular":"lopătărese","dative-definite-genitive-singular":"lopătăresei","dative-genitive-indefinite-plural":"lopătărese","dative-definite-genitive-plural":"lopătăreselor","singular-vocative":"lopătăreasă","plural-vocative":"lopătăreselor"}},{"word":"lopătărel","pos":"noun","definitions":["diminutive of lopătar"],"forms":{"plural":"lopătărei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lopătărel","accusative-definite-nominative-singular":"lopătărelul","accusative-indefinite-nominative-plural":"lopătărei","accusative-definite-nominative-plural":"lopătăreii","dative-genitive-indefinite-singular":"lopătărel","dative-definite-genitive-singular":"lopătărelului","dative-genitive-indefinite-plural":"lopătărei","dative-definite-genitive-plural":"lopătăreilor","singular-vocative":"lopătărelule","plural-vocative":"lopătăreilor"}},{"word":"lopătăresc","pos":"adj","definitions":["boatman's"],"forms":{"feminine-singular":"lopătărească","plural":"lopătărești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lopătăresc","error-unrecognized-form-feminine-indefinite-singular":"lopătărească","error-unrecognized-form-indefinite-masculine-plural":"lopătărești","error-unrecognized-form-feminine-indefinite-neuter-plural":"lopătărești","definite-error-unrecognized-form-masculine-neuter-singular":"lopătărescul","definite-error-unrecognized-form-feminine-singular":"lopătăreasca","definite-error-unrecognized-form-masculine-plural":"lopătăreștii","definite-error-unrecognized-form-feminine-neuter-plural":"lopătăreștile"}},{"word":"Lopătari","pos":"name","definitions":["a commune of Buzău County, Romania","a village in Lopătari, Buzău County, Romania"],"gender":"m"},{"word":"lopătari","pos":"noun","definitions":["plural of lopătar"]},{"word":"lopătăriță","pos":"noun","definitions":["female equivalent of lopătar"],"forms":{"plural":"lopătărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lopătăriță","accusative-definite-nominative-singular":"lopătărița","accusative-indefinite-nominative-plural":"lopătărițe","accusative-definite-nominative-plural":"lopătărițele","dative-genitive-indefinite-singular":"lopătărițe","dative-definite-genitive-singular":"lopătăriței","dative-genitive-indefinite-plural":"lopătărițe","dative-definite-genitive-plural":"lopătărițelor","singular-vocative":"lopătăriță","plural-vocative":"lopătărițelor"}},{"word":"Lopătaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Lopătaru"}},{"word":"Lopățica","pos":"name","definitions":["a village in Lopățica, Cahul Raion, Moldova","a commune of Cahul Raion, Moldova"],"gender":"f"},{"word":"lopățica","pos":"noun","definitions":["definite nominative/accusative singular of lopățică"]},{"word":"lopățică","pos":"noun","definitions":["diminutive of lopată; small spade"],"forms":{"plural":"lopățele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lopățică","accusative-definite-nominative-singular":"lopățica","accusative-indefinite-nominative-plural":"lopățice","accusative-definite-nominative-plural":"lopățicele","dative-genitive-indefinite-singular":"lopățice","dative-definite-genitive-singular":"lopățicei","dative-genitive-indefinite-plural":"lopățice","dative-definite-genitive-plural":"lopățicelor","singular-vocative":"lopățică","plural-vocative":"lopățicelor"}},{"word":"Lopatna","pos":"name","definitions":["a village in Jora de Mijloc, Orhei Raion, Moldova","a river in Prahova, Romania, tributary to the Cricovul Sărat"],"gender":"f"},{"word":"Lopatnic","pos":"name","definitions":["a river in Moldova and Ukraine","a village in Lopatnic, Edineț Raion, Republic of Moldova","a commune of Edineț Raion, Republic of Moldova"],"gender":"m"},{"word":"Lopatnița","pos":"name","definitions":["a village in Șoimari, Prahova County, Romania"],"gender":"f"},{"word":"lopățoi","pos":"noun","definitions":["augmentative of lopată"],"forms":{"plural":"lopățoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lopățoi","accusative-definite-nominative-singular":"lopățoiul","accusative-indefinite-nominative-plural":"lopățoaie","accusative-definite-nominative-plural":"lopățoaiele","dative-genitive-indefinite-singular":"lopățoi","dative-definite-genitive-singular":"lopățoiului","dative-genitive-indefinite-plural":"lopățoaie","dative-definite-genitive-plural":"lopățoaielor","singular-vocative":"lopățoiule","plural-vocative":"lopățoaielor"}},{"word":"lopățuie","pos":"noun","definitions":["diminutive of lopată"],"forms":{"plural":"lopățui","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"lopățuie","accusative-definite-nominative-singular":"lopățuia","accusative-indefinite-nominative-plural":"lopățui","accusative-definite-nominative-plural":"lopățuile","dative-genitive-indefinite-singular":"lopățui","dative-definite-genitive-singular":"lopățuii","dative-genitive-indefinite-plural":"lopățui","dative-definite-genitive-plural":"lopățuilor","singular-vocative":"lopățuie","plural-vocative":"lopățuilor"}},{"word":"lopătuță","pos":"noun","definitions":["diminutive of lopată"],"forms":{"plural":"lopătuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lopătuță","accusative-definite-nominative-singular":"lopătuța","accusative-indefinite-nominative-plural":"lopătuțe","accusative-definite-nominative-plural":"lopătuțele","dative-genitive-indefinite-singular":"lopătuțe","dative-definite-genitive-singular":"lopătuței","dative-genitive-indefinite-plural":"lopătuțe","dative-definite-genitive-plural":"lopătuțelor","singular-vocative":"lopătuță","plural-vocative":"lopătuțelor"}},{"word":"lopiscă","pos":"noun","definitions":["poker (metal rod for poking)"],"forms":{"plural":"lopiște","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lopiscă","accusative-definite-nominative-singular":"lopisca","accusative-indefinite-nominative-plural":"lopiște","accusative-definite-nominative-plural":"lopiștele","dative-genitive-indefinite-singular":"lopiște","dative-definite-genitive-singular":"lopiștei","dative-genitive-indefinite-plural":"lopiște","dative-definite-genitive-plural":"lopiștelor","singular-vocative":"lopiscă","plural-vocative":"lopiștelor"}},{"word":"loptă","pos":"noun","definitions":["ball"],"forms":{"plural":"lopte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"loptă","accusative-definite-nominative-singular":"lopta","accusative-indefinite-nominative-plural":"lopte","accusative-definite-nominative-plural":"loptele","dative-genitive-indefinite-singular":"lopte","dative-definite-genitive-singular":"loptei","dative-genitive-indefinite-plural":"lopte","dative-definite-genitive-plural":"loptelor","singular-vocative":"loptă","plural-vocative":"loptelor"}},{"word":"lor","pos":"pron","definitions":["their"],"pronunciation":"/lor/"},{"word":"lor","pos":"pron","definitions":["to them"],"pronunciation":"/lor/"},{"word":"Lorău","pos":"name","definitions":["a village in Bratca, Bihor County, Romania"],"gender":"m"},{"word":"lorbert","pos":"noun","definitions":["bay leaf"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lorbert","accusative-definite-nominative":"lorbertul","dative-genitive-indefinite":"lorbert","dative-definite-genitive":"lorbertului","vocative":"lorbertule"}},{"word":"lord","pos":"noun","definitions":["lord"],"forms":{"plural":"lorzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lord","accusative-definite-nominative-singular":"lordul","accusative-indefinite-nominative-plural":"lorzi","accusative-definite-nominative-plural":"lorzii","dative-genitive-indefinite-singular":"lord","dative-definite-genitive-singular":"lordului","dative-genitive-indefinite-plural":"lorzi","dative-definite-genitive-plural":"lorzilor","singular-vocative":"lordule","plural-vocative":"lorzilor"}},{"word":"lordoză","pos":"noun","definitions":["lordosis"],"forms":{"plural":"lordoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lordoză","accusative-definite-nominative-singular":"lordoza","accusative-indefinite-nominative-plural":"lordoze","accusative-definite-nominative-plural":"lordozele","dative-genitive-indefinite-singular":"lordoze","dative-definite-genitive-singular":"lordozei","dative-genitive-indefinite-plural":"lordoze","dative-definite-genitive-plural":"lordozelor","singular-vocative":"lordoză","plural-vocative":"lordozelor"}},{"word":"Loredana","pos":"name","definitions":["a female given name"],"gender":"f"},{"word":"loretă","pos":"noun","definitions":["loose woman, lorette"],"forms":{"plural":"lorete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"loretă","accusative-definite-nominative-singular":"loreta","accusative-indefinite-nominative-plural":"lorete","accusative-definite-nominative-plural":"loretele","dative-genitive-indefinite-singular":"lorete","dative-definite-genitive-singular":"loretei","dative-genitive-indefinite-plural":"lorete","dative-definite-genitive-plural":"loretelor","singular-vocative":"loretă","plural-vocative":"loretelor"}},{"word":"lori","pos":"noun","definitions":["loris"],"pronunciation":"/ˈlo.ri/","forms":{"plural":"lori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lori","accusative-definite-nominative-singular":"loriul","accusative-indefinite-nominative-plural":"lori","accusative-definite-nominative-plural":"lorii","dative-genitive-indefinite-singular":"lori","dative-definite-genitive-singular":"loriului","dative-genitive-indefinite-plural":"lori","dative-definite-genitive-plural":"lorilor","singular-vocative":"loriule","plural-vocative":"lorilor","alternative":"loris"}},{"word":"lori","pos":"noun","definitions":["lorikeet, lory"],"forms":{"plural":"lori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lori","accusative-definite-nominative-singular":"loriul","accusative-indefinite-nominative-plural":"lori","accusative-definite-nominative-plural":"lorii","dative-genitive-indefinite-singular":"lori","dative-definite-genitive-singular":"loriului","dative-genitive-indefinite-plural":"lori","dative-definite-genitive-plural":"lorilor","singular-vocative":"loriule","plural-vocative":"lorilor","alternative":"loris"}},{"word":"lorică","pos":"noun","definitions":["lorica"],"forms":{"plural":"lorice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lorică","accusative-definite-nominative-singular":"lorica","accusative-indefinite-nominative-plural":"lorice","accusative-definite-nominative-plural":"loricele","dative-genitive-indefinite-singular":"lorice","dative-definite-genitive-singular":"loricei","dative-genitive-indefinite-plural":"lorice","dative-definite-genitive-plural":"loricelor","singular-vocative":"lorică","plural-vocative":"loricelor"}},{"word":"lornetă","pos":"noun","definitions":["alternative form of lornietă"],"forms":{"plural":"lornete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lornetă","accusative-definite-nominative-singular":"lorneta","accusative-indefinite-nominative-plural":"lornete","accusative-definite-nominative-plural":"lornetele","dative-genitive-indefinite-singular":"lornete","dative-definite-genitive-singular":"lornetei","dative-genitive-indefinite-plural":"lornete","dative-definite-genitive-plural":"lornetelor","singular-vocative":"lornetă","plural-vocative":"lornetelor"}},{"word":"lornietă","pos":"noun","definitions":["lorgnette"],"forms":{"plural":"lorniete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lornietă","accusative-definite-nominative-singular":"lornieta","accusative-indefinite-nominative-plural":"lorniete","accusative-definite-nominative-plural":"lornietele","dative-genitive-indefinite-singular":"lorniete","dative-definite-genitive-singular":"lornietei","dative-genitive-indefinite-plural":"lorniete","dative-definite-genitive-plural":"lornietelor","singular-vocative":"lornietă","plural-vocative":"lornietelor"}},{"word":"lornion","pos":"noun","definitions":["lorgnette"],"forms":{"plural":"lornioane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lornion","accusative-definite-nominative-singular":"lornionul","accusative-indefinite-nominative-plural":"lornioane","accusative-definite-nominative-plural":"lornioanele","dative-genitive-indefinite-singular":"lornion","dative-definite-genitive-singular":"lornionului","dative-genitive-indefinite-plural":"lornioane","dative-definite-genitive-plural":"lornioanelor","singular-vocative":"lornionule","plural-vocative":"lornioanelor"}},{"word":"losanj","pos":"noun","definitions":["rhombus"],"forms":{"plural":"losanje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"losanj","accusative-definite-nominative-singular":"losanjul","accusative-indefinite-nominative-plural":"losanje","accusative-definite-nominative-plural":"losanjele","dative-genitive-indefinite-singular":"losanj","dative-definite-genitive-singular":"losanjului","dative-genitive-indefinite-plural":"losanje","dative-definite-genitive-plural":"losanjelor","singular-vocative":"losanjule","plural-vocative":"losanjelor"}},{"word":"loșniță","pos":"noun","definitions":["alternative form of lojniță"],"forms":{"plural":"loșnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"loșniță","accusative-definite-nominative-singular":"loșnița","accusative-indefinite-nominative-plural":"loșnițe","accusative-definite-nominative-plural":"loșnițele","dative-genitive-indefinite-singular":"loșnițe","dative-definite-genitive-singular":"loșniței","dative-genitive-indefinite-plural":"loșnițe","dative-definite-genitive-plural":"loșnițelor","singular-vocative":"loșniță","plural-vocative":"loșnițelor"}},{"word":"lostopan","pos":"noun","definitions":["alternative form of lostopană"],"forms":{"plural":"lostopane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lostopan","accusative-definite-nominative-singular":"lostopanul","accusative-indefinite-nominative-plural":"lostopane","accusative-definite-nominative-plural":"lostopanele","dative-genitive-indefinite-singular":"lostopan","dative-definite-genitive-singular":"lostopanului","dative-genitive-indefinite-plural":"lostopane","dative-definite-genitive-plural":"lostopanelor","singular-vocative":"lostopanule","plural-vocative":"lostopanelor"}},{"word":"lostopană","pos":"noun","definitions":["a large piece (of stone, of soil, of ice)"],"forms":{"plural":"lostopane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lostopană","accusative-definite-nominative-singular":"lostopana","accusative-indefinite-nominative-plural":"lostopane","accusative-definite-nominative-plural":"lostopanele","dative-genitive-indefinite-singular":"lostopane","dative-definite-genitive-singular":"lostopanei","dative-genitive-indefinite-plural":"lostopane","dative-definite-genitive-plural":"lostopanelor","singular-vocative":"lostopană","plural-vocative":"lostopanelor"}},{"word":"lostricică","pos":"noun","definitions":["diminutive of lostriță"],"forms":{"plural":"lostricicele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lostricică","accusative-definite-nominative-singular":"lostricica","accusative-indefinite-nominative-plural":"lostricicele","accusative-definite-nominative-plural":"lostricicelele","dative-genitive-indefinite-singular":"lostricicele","dative-definite-genitive-singular":"lostricicelei","dative-genitive-indefinite-plural":"lostricicele","dative-definite-genitive-plural":"lostricicelelor","singular-vocative":"lostricică","plural-vocative":"lostricicelelor"}},{"word":"lostriță","pos":"noun","definitions":["huchen, Danube salmon, Hucho hucho"],"forms":{"plural":"lostrițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lostriță","accusative-definite-nominative-singular":"lostrița","accusative-indefinite-nominative-plural":"lostrițe","accusative-definite-nominative-plural":"lostrițele","dative-genitive-indefinite-singular":"lostrițe","dative-definite-genitive-singular":"lostriței","dative-genitive-indefinite-plural":"lostrițe","dative-definite-genitive-plural":"lostrițelor","singular-vocative":"lostriță","plural-vocative":"lostrițelor","alternative":"lostică"}},{"word":"lostun","pos":"noun","definitions":["alternative form of lăstun"],"forms":{"plural":"lostuni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lostun","accusative-definite-nominative-singular":"lostunul","accusative-indefinite-nominative-plural":"lostuni","accusative-definite-nominative-plural":"lostunii","dative-genitive-indefinite-singular":"lostun","dative-definite-genitive-singular":"lostunului","dative-genitive-indefinite-plural":"lostuni","dative-definite-genitive-plural":"lostunilor","singular-vocative":"lostunule","plural-vocative":"lostunilor"}},{"word":"lot","pos":"noun","definitions":["plot (of land)","batch (of goods for sale)","lot (at auction)","national sports team","lottery ticket"],"pronunciation":"/lot/","forms":{"plural":"loturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lot","accusative-definite-nominative-singular":"lotul","accusative-indefinite-nominative-plural":"loturi","accusative-definite-nominative-plural":"loturile","dative-genitive-indefinite-singular":"lot","dative-definite-genitive-singular":"lotului","dative-genitive-indefinite-plural":"loturi","dative-definite-genitive-plural":"loturilor","singular-vocative":"lotule","plural-vocative":"loturilor"}},{"word":"lotaș","pos":"noun","definitions":["fiddler"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"lotaș","accusative-definite-nominative":"lotașul","dative-genitive-indefinite":"lotaș","dative-definite-genitive":"lotașului","vocative":"lotașule"}},{"word":"lotcă","pos":"noun","definitions":["boat"],"forms":{"plural":"lotci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lotcă","accusative-definite-nominative-singular":"lotca","accusative-indefinite-nominative-plural":"lotci","accusative-definite-nominative-plural":"lotcile","dative-genitive-indefinite-singular":"lotci","dative-definite-genitive-singular":"lotcii","dative-genitive-indefinite-plural":"lotci","dative-definite-genitive-plural":"lotcilor","singular-vocative":"lotcă","plural-vocative":"lotcilor"}},{"word":"lotcagiu","pos":"noun","definitions":["boatman"],"forms":{"plural":"lotcagii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lotcagiu","accusative-definite-nominative-singular":"lotcagiuul","accusative-indefinite-nominative-plural":"lotcagii","accusative-definite-nominative-plural":"lotcagiii","dative-genitive-indefinite-singular":"lotcagiu","dative-definite-genitive-singular":"lotcagiuului","dative-genitive-indefinite-plural":"lotcagii","dative-definite-genitive-plural":"lotcagiilor","singular-vocative":"lotcagiuule","plural-vocative":"lotcagiilor"}},{"word":"lotcar","pos":"noun","definitions":["boatman"],"forms":{"plural":"lotcari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lotcar","accusative-definite-nominative-singular":"lotcarul","accusative-indefinite-nominative-plural":"lotcari","accusative-definite-nominative-plural":"lotcarii","dative-genitive-indefinite-singular":"lotcar","dative-definite-genitive-singular":"lotcarului","dative-genitive-indefinite-plural":"lotcari","dative-definite-genitive-plural":"lotcarilor","singular-vocative":"lotcarule","plural-vocative":"lotcarilor"}},{"word":"lotcaș","pos":"noun","definitions":["boatman"],"forms":{"plural":"lotcași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lotcaș","accusative-definite-nominative-singular":"lotcașul","accusative-indefinite-nominative-plural":"lotcași","accusative-definite-nominative-plural":"lotcașii","dative-genitive-indefinite-singular":"lotcaș","dative-definite-genitive-singular":"lotcașului","dative-genitive-indefinite-plural":"lotcași","dative-definite-genitive-plural":"lotcașilor","singular-vocative":"lotcașule","plural-vocative":"lotcașilor"}},{"word":"Loteanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Loteanu"}},{"word":"loterie","pos":"noun","definitions":["lottery"],"forms":{"plural":"loterii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"loterie","accusative-definite-nominative-singular":"loteria","accusative-indefinite-nominative-plural":"loterii","accusative-definite-nominative-plural":"loteriile","dative-genitive-indefinite-singular":"loterii","dative-definite-genitive-singular":"loteriei","dative-genitive-indefinite-plural":"loterii","dative-definite-genitive-plural":"loteriilor","singular-vocative":"loterie","plural-vocative":"loteriilor"}},{"word":"lotiform","pos":"adj","definitions":["lotiform"],"forms":{"feminine-singular":"lotiformă","masculine-plural":"lotiformi","feminine-neuter-plural":"lotiforme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lotiform","error-unrecognized-form-feminine-indefinite-singular":"lotiformă","error-unrecognized-form-indefinite-masculine-plural":"lotiformi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lotiforme","definite-error-unrecognized-form-masculine-neuter-singular":"lotiformul","definite-error-unrecognized-form-feminine-singular":"lotiforma","definite-error-unrecognized-form-masculine-plural":"lotiformii","definite-error-unrecognized-form-feminine-neuter-plural":"lotiformele"}},{"word":"loționa","pos":"verb","definitions":["to lotion"],"forms":{"canonical":"a loționa 1st conjugation","present-singular-third-person":"loționează","participle-past":"loționat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a loționa","gerund":"loționând","first-person-indicative-present-singular":"loționez","indicative-present-second-person-singular":"loționezi","indicative-present-singular-third-person":"loționează","first-person-indicative-plural-present":"loționăm","indicative-plural-present-second-person":"loționați","indicative-plural-present-third-person":"loționează","first-person-imperfect-indicative-singular":"loționam","imperfect-indicative-second-person-singular":"loționai","imperfect-indicative-singular-third-person":"loționa","first-person-imperfect-indicative-plural":"loționam","imperfect-indicative-plural-second-person":"loționați","imperfect-indicative-plural-third-person":"loționau","first-person-indicative-perfect-singular":"loționai","indicative-perfect-second-person-singular":"loționași","indicative-perfect-singular-third-person":"loționă","first-person-indicative-perfect-plural":"loționarăm","indicative-perfect-plural-second-person":"loționarăți","indicative-perfect-plural-third-person":"loționară","first-person-indicative-pluperfect-singular":"loționasem","indicative-pluperfect-second-person-singular":"loționaseși","indicative-pluperfect-singular-third-person":"loționase","first-person-indicative-pluperfect-plural":"loționaserăm","indicative-pluperfect-plural-second-person":"loționaserăți","indicative-pluperfect-plural-third-person":"loționaseră","first-person-present-singular-subjunctive":"să loționez","present-second-person-singular-subjunctive":"să loționezi","present-singular-subjunctive-third-person":"să loționeze","first-person-plural-present-subjunctive":"să loționăm","plural-present-second-person-subjunctive":"să loționați","plural-present-subjunctive-third-person":"să loționeze","imperative-second-person-singular":"loționează","imperative-plural-second-person":"loționați","imperative-negative-second-person-singular":"nu loționa","imperative-negative-plural-second-person":"nu loționați"}},{"word":"loționare","pos":"noun","definitions":["lotioning"],"forms":{"plural":"loționări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"loționare","accusative-definite-nominative-singular":"loționarea","accusative-indefinite-nominative-plural":"loționări","accusative-definite-nominative-plural":"loționările","dative-genitive-indefinite-singular":"loționări","dative-definite-genitive-singular":"loționării","dative-genitive-indefinite-plural":"loționări","dative-definite-genitive-plural":"loționărilor","singular-vocative":"loționare","plural-vocative":"loționărilor"}},{"word":"loționat","pos":"adj","definitions":["lotioned"],"forms":{"feminine-singular":"loționată","masculine-plural":"loționați","feminine-neuter-plural":"loționate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"loționat","error-unrecognized-form-feminine-indefinite-singular":"loționată","error-unrecognized-form-indefinite-masculine-plural":"loționați","error-unrecognized-form-feminine-indefinite-neuter-plural":"loționate","definite-error-unrecognized-form-masculine-neuter-singular":"loționatul","definite-error-unrecognized-form-feminine-singular":"loționata","definite-error-unrecognized-form-masculine-plural":"loționații","definite-error-unrecognized-form-feminine-neuter-plural":"loționatele"}},{"word":"lotișor","pos":"noun","definitions":["diminutive of lot"],"forms":{"plural":"lotișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lotișor","accusative-definite-nominative-singular":"lotișorul","accusative-indefinite-nominative-plural":"lotișoare","accusative-definite-nominative-plural":"lotișoarele","dative-genitive-indefinite-singular":"lotișor","dative-definite-genitive-singular":"lotișorului","dative-genitive-indefinite-plural":"lotișoare","dative-definite-genitive-plural":"lotișoarelor","singular-vocative":"lotișorule","plural-vocative":"lotișoarelor"}},{"word":"loțiune","pos":"noun","definitions":["lotion"],"forms":{"plural":"loțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"loțiune","accusative-definite-nominative-singular":"loțiunea","accusative-indefinite-nominative-plural":"loțiuni","accusative-definite-nominative-plural":"loțiunile","dative-genitive-indefinite-singular":"loțiuni","dative-definite-genitive-singular":"loțiunii","dative-genitive-indefinite-plural":"loțiuni","dative-definite-genitive-plural":"loțiunilor","singular-vocative":"loțiune","plural-vocative":"loțiunilor"}},{"word":"lotiza","pos":"verb","definitions":["to divide land into plots","to divide into lots"],"forms":{"canonical":"a lotiza 1st conjugation","present-singular-third-person":"lotizează","participle-past":"lotizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a lotiza","gerund":"lotizând","first-person-indicative-present-singular":"lotizez","indicative-present-second-person-singular":"lotizezi","indicative-present-singular-third-person":"lotizează","first-person-indicative-plural-present":"lotizăm","indicative-plural-present-second-person":"lotizați","indicative-plural-present-third-person":"lotizează","first-person-imperfect-indicative-singular":"lotizam","imperfect-indicative-second-person-singular":"lotizai","imperfect-indicative-singular-third-person":"lotiza","first-person-imperfect-indicative-plural":"lotizam","imperfect-indicative-plural-second-person":"lotizați","imperfect-indicative-plural-third-person":"lotizau","first-person-indicative-perfect-singular":"lotizai","indicative-perfect-second-person-singular":"lotizași","indicative-perfect-singular-third-person":"lotiză","first-person-indicative-perfect-plural":"lotizarăm","indicative-perfect-plural-second-person":"lotizarăți","indicative-perfect-plural-third-person":"lotizară","first-person-indicative-pluperfect-singular":"lotizasem","indicative-pluperfect-second-person-singular":"lotizaseși","indicative-pluperfect-singular-third-person":"lotizase","first-person-indicative-pluperfect-plural":"lotizaserăm","indicative-pluperfect-plural-second-person":"lotizaserăți","indicative-pluperfect-plural-third-person":"lotizaseră","first-person-present-singular-subjunctive":"să lotizez","present-second-person-singular-subjunctive":"să lotizezi","present-singular-subjunctive-third-person":"să lotizeze","first-person-plural-present-subjunctive":"să lotizăm","plural-present-second-person-subjunctive":"să lotizați","plural-present-subjunctive-third-person":"să lotizeze","imperative-second-person-singular":"lotizează","imperative-plural-second-person":"lotizați","imperative-negative-second-person-singular":"nu lotiza","imperative-negative-plural-second-person":"nu lotizați"}},{"word":"lotizare","pos":"noun","definitions":["batching"],"forms":{"plural":"lotizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lotizare","accusative-definite-nominative-singular":"lotizarea","accusative-indefinite-nominative-plural":"lotizări","accusative-definite-nominative-plural":"lotizările","dative-genitive-indefinite-singular":"lotizări","dative-definite-genitive-singular":"lotizării","dative-genitive-indefinite-plural":"lotizări","dative-definite-genitive-plural":"lotizărilor","singular-vocative":"lotizare","plural-vocative":"lotizărilor"}},{"word":"loto","pos":"noun","definitions":["lotto"],"forms":{"plural":"lotouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"loto","accusative-definite-nominative-singular":"lotoul","accusative-indefinite-nominative-plural":"lotouri","accusative-definite-nominative-plural":"lotourile","dative-genitive-indefinite-singular":"loto","dative-definite-genitive-singular":"lotoului","dative-genitive-indefinite-plural":"lotouri","dative-definite-genitive-plural":"lotourilor","singular-vocative":"lotoule","plural-vocative":"lotourilor"}},{"word":"lotofag","pos":"noun","definitions":["Lotophagi"],"forms":{"plural":"lotofagi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lotofag","accusative-definite-nominative-singular":"lotofagul","accusative-indefinite-nominative-plural":"lotofagi","accusative-definite-nominative-plural":"lotofagii","dative-genitive-indefinite-singular":"lotofag","dative-definite-genitive-singular":"lotofagului","dative-genitive-indefinite-plural":"lotofagi","dative-definite-genitive-plural":"lotofagilor","singular-vocative":"lotofagule","plural-vocative":"lotofagilor"}},{"word":"loton","pos":"noun","definitions":["alternative form of loto"],"forms":{"plural":"lotoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"loton","accusative-definite-nominative-singular":"lotonul","accusative-indefinite-nominative-plural":"lotoane","accusative-definite-nominative-plural":"lotoanele","dative-genitive-indefinite-singular":"loton","dative-definite-genitive-singular":"lotonului","dative-genitive-indefinite-plural":"lotoane","dative-definite-genitive-plural":"lotoanelor","singular-vocative":"lotonule","plural-vocative":"lotoanelor"}},{"word":"lotouri","pos":"noun","definitions":["plural of loto"],"gender":"n"},{"word":"Lotreanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lotreanu"}},{"word":"lotresc","pos":"adj","definitions":["thievish"],"forms":{"feminine-singular":"lotrească","plural":"lotrești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lotresc","error-unrecognized-form-feminine-indefinite-singular":"lotrească","error-unrecognized-form-indefinite-masculine-plural":"lotrești","error-unrecognized-form-feminine-indefinite-neuter-plural":"lotrești","definite-error-unrecognized-form-masculine-neuter-singular":"lotrescul","definite-error-unrecognized-form-feminine-singular":"lotreasca","definite-error-unrecognized-form-masculine-plural":"lotreștii","definite-error-unrecognized-form-feminine-neuter-plural":"lotreștile"}},{"word":"lotrește","pos":"adv","definitions":["thievishly"]},{"word":"lotri","pos":"verb","definitions":["to lead the life of a robber"],"pronunciation":"/loˈtri/","forms":{"canonical":"a lotri 4th conjugation","present-singular-third-person":"lotrește","participle-past":"lotrit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lotri","gerund":"lotrind","first-person-indicative-present-singular":"lotresc","indicative-present-second-person-singular":"lotrești","indicative-present-singular-third-person":"lotrește","first-person-indicative-plural-present":"lotrim","indicative-plural-present-second-person":"lotriți","indicative-plural-present-third-person":"lotresc","first-person-imperfect-indicative-singular":"lotream","imperfect-indicative-second-person-singular":"lotreai","imperfect-indicative-singular-third-person":"lotrea","first-person-imperfect-indicative-plural":"lotream","imperfect-indicative-plural-second-person":"lotreați","imperfect-indicative-plural-third-person":"lotreau","first-person-indicative-perfect-singular":"lotrii","indicative-perfect-second-person-singular":"lotriși","indicative-perfect-singular-third-person":"lotri","first-person-indicative-perfect-plural":"lotrirăm","indicative-perfect-plural-second-person":"lotrirăți","indicative-perfect-plural-third-person":"lotriră","first-person-indicative-pluperfect-singular":"lotrisem","indicative-pluperfect-second-person-singular":"lotriseși","indicative-pluperfect-singular-third-person":"lotrise","first-person-indicative-pluperfect-plural":"lotriserăm","indicative-pluperfect-plural-second-person":"lotriserăți","indicative-pluperfect-plural-third-person":"lotriseră","first-person-present-singular-subjunctive":"să lotresc","present-second-person-singular-subjunctive":"să lotrești","present-singular-subjunctive-third-person":"să lotrească","first-person-plural-present-subjunctive":"să lotrim","plural-present-second-person-subjunctive":"să lotriți","plural-present-subjunctive-third-person":"să lotrească","imperative-second-person-singular":"lotrește","imperative-plural-second-person":"lotriți","imperative-negative-second-person-singular":"nu lotri","imperative-negative-plural-second-person":"nu lotriți"}},{"word":"lotri","pos":"noun","definitions":["indefinite plural of lotru (“thief”)"],"pronunciation":"/ˈlo.tri/"},{"word":"lotrie","pos":"noun","definitions":["thievery"],"forms":{"plural":"lotrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lotrie","accusative-definite-nominative-singular":"lotria","accusative-indefinite-nominative-plural":"lotrii","accusative-definite-nominative-plural":"lotriile","dative-genitive-indefinite-singular":"lotrii","dative-definite-genitive-singular":"lotriei","dative-genitive-indefinite-plural":"lotrii","dative-definite-genitive-plural":"lotriilor","singular-vocative":"lotrie","plural-vocative":"lotriilor"}},{"word":"Lotrioara","pos":"name","definitions":["a village in Boița, Sibiu County, Romania"],"gender":"f"},{"word":"Lotrișoara Mare","pos":"name","definitions":["a river in Sibiu, Romania, tributary to the Lotrioara"],"gender":"f"},{"word":"Lotrișor","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Olt"],"gender":"m"},{"word":"lotrișor","pos":"noun","definitions":["diminutive of lotru"],"forms":{"plural":"lotrișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lotrișor","accusative-definite-nominative-singular":"lotrișorul","accusative-indefinite-nominative-plural":"lotrișori","accusative-definite-nominative-plural":"lotrișorii","dative-genitive-indefinite-singular":"lotrișor","dative-definite-genitive-singular":"lotrișorului","dative-genitive-indefinite-plural":"lotrișori","dative-definite-genitive-plural":"lotrișorilor","singular-vocative":"lotrișorule","plural-vocative":"lotrișorilor"}},{"word":"Lotrișorul","pos":"name","definitions":["a river in Vâlcea County, Romania, tributary to the Olt"],"gender":"m"},{"word":"Lotru","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Olt"],"gender":"m"},{"word":"lotru","pos":"noun","definitions":["thief, robber"],"forms":{"plural":"lotri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lotru","accusative-definite-nominative-singular":"lotrul","accusative-indefinite-nominative-plural":"lotri","accusative-definite-nominative-plural":"lotrii","dative-genitive-indefinite-singular":"lotru","dative-definite-genitive-singular":"lotrului","dative-genitive-indefinite-plural":"lotri","dative-definite-genitive-plural":"lotrilor","singular-vocative":"lotrule","plural-vocative":"lotrilor"}},{"word":"lotrușag","pos":"noun","definitions":["outlawry"],"forms":{"plural":"lotrușaguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lotrușag","accusative-definite-nominative-singular":"lotrușagul","accusative-indefinite-nominative-plural":"lotrușaguri","accusative-definite-nominative-plural":"lotrușagurile","dative-genitive-indefinite-singular":"lotrușag","dative-definite-genitive-singular":"lotrușagului","dative-genitive-indefinite-plural":"lotrușaguri","dative-definite-genitive-plural":"lotrușagurilor","singular-vocative":"lotrușagule","plural-vocative":"lotrușagurilor"}},{"word":"lotuleț","pos":"noun","definitions":["diminutive of lot"],"forms":{"plural":"lotulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lotuleț","accusative-definite-nominative-singular":"lotulețul","accusative-indefinite-nominative-plural":"lotulețe","accusative-definite-nominative-plural":"lotulețele","dative-genitive-indefinite-singular":"lotuleț","dative-definite-genitive-singular":"lotulețului","dative-genitive-indefinite-plural":"lotulețe","dative-definite-genitive-plural":"lotulețelor","singular-vocative":"lotulețule","plural-vocative":"lotulețelor"}},{"word":"Loturi","pos":"name","definitions":["a village in Schitu Golești, Argeș County, Romania","a village in Manoleasa, Botoșani County, Romania"],"gender":"m"},{"word":"loturi","pos":"noun","definitions":["plural of lot"]},{"word":"Loturi Enescu","pos":"name","definitions":["a locality in Dorohoi, Botoșani County, Romania"],"gender":"m"},{"word":"lotus","pos":"noun","definitions":["lotus"],"pronunciation":"/ˈlo.tus/","forms":{"plural":"lotuși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lotus","accusative-definite-nominative-singular":"lotusul","accusative-indefinite-nominative-plural":"lotuși","accusative-definite-nominative-plural":"lotușii","dative-genitive-indefinite-singular":"lotus","dative-definite-genitive-singular":"lotusului","dative-genitive-indefinite-plural":"lotuși","dative-definite-genitive-plural":"lotușilor","singular-vocative":"lotusule","plural-vocative":"lotușilor"}},{"word":"Lovaș","pos":"name","definitions":["a river in Harghita County, Romania, tributary to the Ciobănuș"],"gender":"m"},{"word":"lovea","pos":"verb","definitions":["third-person singular imperfect indicative of lovi"],"pronunciation":"[loˈve̯a]"},{"word":"lovea","pos":"noun","definitions":["coin, banknote"],"pronunciation":"[loˈve̯a]","forms":{"plural":"lovele"}},{"word":"loveală","pos":"noun","definitions":["blow, hit","coincidence"],"forms":{"plural":"loveli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"loveală","accusative-definite-nominative-singular":"loveala","accusative-indefinite-nominative-plural":"lovele","accusative-definite-nominative-plural":"lovelele","dative-genitive-indefinite-singular":"lovele","dative-definite-genitive-singular":"lovelei","dative-genitive-indefinite-plural":"lovele","dative-definite-genitive-plural":"lovelelor","singular-vocative":"loveală","plural-vocative":"lovelelor"}},{"word":"lovele","pos":"noun","definitions":["plural of lovea; (slang) cash, dosh, dough"],"gender":"f-p"},{"word":"lovi","pos":"verb","definitions":["to hit; to strike"],"forms":{"canonical":"a lovi 4th conjugation","present-singular-third-person":"lovește","participle-past":"lovit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lovi","gerund":"lovind","first-person-indicative-present-singular":"lovesc","indicative-present-second-person-singular":"lovești","indicative-present-singular-third-person":"lovește","first-person-indicative-plural-present":"lovim","indicative-plural-present-second-person":"loviți","indicative-plural-present-third-person":"lovesc","first-person-imperfect-indicative-singular":"loveam","imperfect-indicative-second-person-singular":"loveai","imperfect-indicative-singular-third-person":"lovea","first-person-imperfect-indicative-plural":"loveam","imperfect-indicative-plural-second-person":"loveați","imperfect-indicative-plural-third-person":"loveau","first-person-indicative-perfect-singular":"lovii","indicative-perfect-second-person-singular":"loviși","indicative-perfect-singular-third-person":"lovi","first-person-indicative-perfect-plural":"lovirăm","indicative-perfect-plural-second-person":"lovirăți","indicative-perfect-plural-third-person":"loviră","first-person-indicative-pluperfect-singular":"lovisem","indicative-pluperfect-second-person-singular":"loviseși","indicative-pluperfect-singular-third-person":"lovise","first-person-indicative-pluperfect-plural":"loviserăm","indicative-pluperfect-plural-second-person":"loviserăți","indicative-pluperfect-plural-third-person":"loviseră","first-person-present-singular-subjunctive":"să lovesc","present-second-person-singular-subjunctive":"să lovești","present-singular-subjunctive-third-person":"să lovească","first-person-plural-present-subjunctive":"să lovim","plural-present-second-person-subjunctive":"să loviți","plural-present-subjunctive-third-person":"să lovească","imperative-second-person-singular":"lovește","imperative-plural-second-person":"loviți","imperative-negative-second-person-singular":"nu lovi","imperative-negative-plural-second-person":"nu loviți"}},{"word":"loviluție","pos":"noun","definitions":["a coup d'état presented as a people's revolution, particularly in reference to the Romanian Revolution"],"pronunciation":"/lo.viˈlu.t͡si.e/","forms":{"plural":"loviluții"}},{"word":"lovim","pos":"verb","definitions":["first-person plural present indicative/subjunctive of lovi"],"pronunciation":"[loˈvim]"},{"word":"lovinescian","pos":"adj","definitions":["Of or pertaining to the Romanian literary critic Eugen Lovinescu"],"forms":{"feminine-singular":"lovinesciană","masculine-plural":"lovinescieni","feminine-neuter-plural":"lovinesciene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lovinescian","error-unrecognized-form-feminine-indefinite-singular":"lovinesciană","error-unrecognized-form-indefinite-masculine-plural":"lovinescieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"lovinesciene","definite-error-unrecognized-form-masculine-neuter-singular":"lovinescianul","definite-error-unrecognized-form-feminine-singular":"lovinesciana","definite-error-unrecognized-form-masculine-plural":"lovinescienii","definite-error-unrecognized-form-feminine-neuter-plural":"lovinescienele"}},{"word":"Lovinescu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lovinescu"}},{"word":"lovire","pos":"noun","definitions":["impact, hit"],"forms":{"plural":"loviri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lovire","accusative-definite-nominative-singular":"lovirea","accusative-indefinite-nominative-plural":"loviri","accusative-definite-nominative-plural":"lovirile","dative-genitive-indefinite-singular":"loviri","dative-definite-genitive-singular":"lovirii","dative-genitive-indefinite-plural":"loviri","dative-definite-genitive-plural":"lovirilor","singular-vocative":"lovire","plural-vocative":"lovirilor"}},{"word":"loviște","pos":"noun","definitions":["whirlpool"],"forms":{"plural":"loviști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"loviște","accusative-definite-nominative-singular":"loviștea","accusative-indefinite-nominative-plural":"loviști","accusative-definite-nominative-plural":"loviștile","dative-genitive-indefinite-singular":"loviști","dative-definite-genitive-singular":"loviștii","dative-genitive-indefinite-plural":"loviști","dative-definite-genitive-plural":"loviștilor","singular-vocative":"loviște","plural-vocative":"loviștilor"}},{"word":"Loviștea","pos":"name","definitions":["a region of Romania"]},{"word":"Lovișteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lovișteanu"}},{"word":"lovit","pos":"noun","definitions":["hitting"],"pronunciation":"[loˈvit]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lovit","accusative-definite-nominative":"lovitul","dative-genitive-indefinite":"lovit","dative-definite-genitive":"lovitului","vocative":"lovitule"}},{"word":"lovit","pos":"verb","definitions":["past participle of lovi"],"pronunciation":"[loˈvit]","forms":{"participle-past":"of lovi"}},{"word":"lovitură","pos":"noun","definitions":["a hit, blow, kick"],"forms":{"plural":"lovituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lovitură","accusative-definite-nominative-singular":"lovitura","accusative-indefinite-nominative-plural":"lovituri","accusative-definite-nominative-plural":"loviturile","dative-genitive-indefinite-singular":"lovituri","dative-definite-genitive-singular":"loviturii","dative-genitive-indefinite-plural":"lovituri","dative-definite-genitive-plural":"loviturilor","singular-vocative":"lovitură","plural-vocative":"loviturilor"}},{"word":"lovitură de colț","pos":"noun","definitions":["corner kick"],"forms":{"plural":"lovituri de colț"}},{"word":"lovitură de grație","pos":"noun","definitions":["coup de grâce"],"forms":{"plural":"lovituri de grație"}},{"word":"lovitură de la 11 metri","pos":"noun","definitions":["penalty kick"],"forms":{"plural":"lovituri de la 11 metri"}},{"word":"lovitură de pedeapsă","pos":"noun","definitions":["penalty kick"],"forms":{"plural":"lovituri de pedeapsă"}},{"word":"lovitură de stat","pos":"noun","definitions":["coup d’état"],"pronunciation":"[lo.viˈtu.rə.deˌstat]","forms":{"plural":"lovituri de stat"}},{"word":"lovitură de teatru","pos":"noun","definitions":["coup de théâtre"],"forms":{"plural":"lovituri de teatru"}},{"word":"lovitură de trăsnet","pos":"noun","definitions":["lightning strike"],"forms":{"plural":"lovituri de trăsnet"}},{"word":"lovitură liberă","pos":"noun","definitions":["free kick"],"forms":{"plural":"lovituri libere"}},{"word":"lovituri de stat","pos":"noun","definitions":["plural of lovitură de stat"],"gender":"f-p"},{"word":"lovituros","pos":"noun","definitions":["epileptic"],"forms":{"plural":"lovituroși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lovituros","accusative-definite-nominative-singular":"loviturosul","accusative-indefinite-nominative-plural":"lovituroși","accusative-definite-nominative-plural":"lovituroșii","dative-genitive-indefinite-singular":"lovituros","dative-definite-genitive-singular":"loviturosului","dative-genitive-indefinite-plural":"lovituroși","dative-definite-genitive-plural":"lovituroșilor","singular-vocative":"loviturosule","plural-vocative":"lovituroșilor"}},{"word":"Lovnic","pos":"name","definitions":["a village in Jibert, Brașov County, Romania"],"gender":"m"},{"word":"Lovrin","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Lovrin, Timiș County, Romania"],"gender":"m"},{"word":"loxodromă","pos":"noun","definitions":["loxodrome"],"forms":{"plural":"loxodrome","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"loxodromă","accusative-definite-nominative-singular":"loxodroma","accusative-indefinite-nominative-plural":"loxodrome","accusative-definite-nominative-plural":"loxodromele","dative-genitive-indefinite-singular":"loxodrome","dative-definite-genitive-singular":"loxodromei","dative-genitive-indefinite-plural":"loxodrome","dative-definite-genitive-plural":"loxodromelor","singular-vocative":"loxodromă","plural-vocative":"loxodromelor"}},{"word":"loxodromic","pos":"adj","definitions":["loxodromic"],"forms":{"feminine-singular":"loxodromică","masculine-plural":"loxodromici","feminine-neuter-plural":"loxodromice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"loxodromic","error-unrecognized-form-feminine-indefinite-singular":"loxodromică","error-unrecognized-form-indefinite-masculine-plural":"loxodromici","error-unrecognized-form-feminine-indefinite-neuter-plural":"loxodromice","definite-error-unrecognized-form-masculine-neuter-singular":"loxodromicul","definite-error-unrecognized-form-feminine-singular":"loxodromica","definite-error-unrecognized-form-masculine-plural":"loxodromicii","definite-error-unrecognized-form-feminine-neuter-plural":"loxodromicele"}},{"word":"loxodromie","pos":"noun","definitions":["loxodrome"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"loxodromie","accusative-definite-nominative":"loxodromia","dative-genitive-indefinite":"loxodromii","dative-definite-genitive":"loxodromiei","vocative":"loxodromie"}},{"word":"loz","pos":"noun","definitions":["lottery ticket"],"forms":{"plural":"lozuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"loz","accusative-definite-nominative-singular":"lozul","accusative-indefinite-nominative-plural":"lozuri","accusative-definite-nominative-plural":"lozurile","dative-genitive-indefinite-singular":"loz","dative-definite-genitive-singular":"lozului","dative-genitive-indefinite-plural":"lozuri","dative-definite-genitive-plural":"lozurilor","singular-vocative":"lozule","plural-vocative":"lozurilor"}},{"word":"loză","pos":"noun","definitions":["obsolete form of loază"],"forms":{"plural":"loze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"loză","accusative-definite-nominative-singular":"loza","accusative-indefinite-nominative-plural":"loze","accusative-definite-nominative-plural":"lozele","dative-genitive-indefinite-singular":"loze","dative-definite-genitive-singular":"lozei","dative-genitive-indefinite-plural":"loze","dative-definite-genitive-plural":"lozelor","singular-vocative":"loză","plural-vocative":"lozelor"}},{"word":"lozărie","pos":"noun","definitions":["willow grove"],"forms":{"plural":"lozării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lozărie","accusative-definite-nominative-singular":"lozăria","accusative-indefinite-nominative-plural":"lozării","accusative-definite-nominative-plural":"lozăriile","dative-genitive-indefinite-singular":"lozării","dative-definite-genitive-singular":"lozăriei","dative-genitive-indefinite-plural":"lozării","dative-definite-genitive-plural":"lozăriilor","singular-vocative":"lozărie","plural-vocative":"lozăriilor"}},{"word":"lozeală","pos":"noun","definitions":["delirium"],"forms":{"plural":"lozeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lozeală","accusative-definite-nominative-singular":"lozeala","accusative-indefinite-nominative-plural":"lozele","accusative-definite-nominative-plural":"lozelele","dative-genitive-indefinite-singular":"lozele","dative-definite-genitive-singular":"lozelei","dative-genitive-indefinite-plural":"lozele","dative-definite-genitive-plural":"lozelelor","singular-vocative":"lozeală","plural-vocative":"lozelelor"}},{"word":"lozie","pos":"noun","definitions":["willow"],"forms":{"plural":"lozii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lozie","accusative-definite-nominative-singular":"lozia","accusative-indefinite-nominative-plural":"lozii","accusative-definite-nominative-plural":"loziile","dative-genitive-indefinite-singular":"lozii","dative-definite-genitive-singular":"loziei","dative-genitive-indefinite-plural":"lozii","dative-definite-genitive-plural":"loziilor","singular-vocative":"lozie","plural-vocative":"loziilor"}},{"word":"lozincă","pos":"noun","definitions":["slogan, motto, rallying cry"],"forms":{"plural":"lozinci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lozincă","accusative-definite-nominative-singular":"lozinca","accusative-indefinite-nominative-plural":"lozinci","accusative-definite-nominative-plural":"lozincile","dative-genitive-indefinite-singular":"lozinci","dative-definite-genitive-singular":"lozincii","dative-genitive-indefinite-plural":"lozinci","dative-definite-genitive-plural":"lozincilor","singular-vocative":"lozincă","plural-vocative":"lozincilor"}},{"word":"lozioară","pos":"noun","definitions":["diminutive of loză"],"forms":{"plural":"lozioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lozioară","accusative-definite-nominative-singular":"lozioara","accusative-indefinite-nominative-plural":"lozioare","accusative-definite-nominative-plural":"lozioarele","dative-genitive-indefinite-singular":"lozioare","dative-definite-genitive-singular":"lozioarei","dative-genitive-indefinite-plural":"lozioare","dative-definite-genitive-plural":"lozioarelor","singular-vocative":"lozioară","plural-vocative":"lozioarelor"}},{"word":"lozișoară","pos":"noun","definitions":["diminutive of loză"],"forms":{"plural":"lozișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lozișoară","accusative-definite-nominative-singular":"lozișoara","accusative-indefinite-nominative-plural":"lozișoare","accusative-definite-nominative-plural":"lozișoarele","dative-genitive-indefinite-singular":"lozișoare","dative-definite-genitive-singular":"lozișoarei","dative-genitive-indefinite-plural":"lozișoare","dative-definite-genitive-plural":"lozișoarelor","singular-vocative":"lozișoară","plural-vocative":"lozișoarelor"}},{"word":"loziță","pos":"noun","definitions":["diminutive of loză"],"forms":{"plural":"lozițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"loziță","accusative-definite-nominative-singular":"lozița","accusative-indefinite-nominative-plural":"lozițe","accusative-definite-nominative-plural":"lozițele","dative-genitive-indefinite-singular":"lozițe","dative-definite-genitive-singular":"loziței","dative-genitive-indefinite-plural":"lozițe","dative-definite-genitive-plural":"lozițelor","singular-vocative":"loziță","plural-vocative":"lozițelor"}},{"word":"Lozna","pos":"name","definitions":["a commune of Botoșani County, Romania","a village in Lozna, Botoșani County, Romania","a commune of Sălaj County, Romania","a village in Lozna, Sălaj County, Romania"],"gender":"f"},{"word":"Lozna Mare","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Lozna"],"gender":"f"},{"word":"Lozna Mică","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Lozna"],"gender":"f"},{"word":"Loznișoara","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Rusca"],"gender":"f"},{"word":"lozniță","pos":"noun","definitions":["alternative form of lojniță"],"forms":{"plural":"loznițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lozniță","accusative-definite-nominative-singular":"loznița","accusative-indefinite-nominative-plural":"loznițe","accusative-definite-nominative-plural":"loznițele","dative-genitive-indefinite-singular":"loznițe","dative-definite-genitive-singular":"lozniței","dative-genitive-indefinite-plural":"loznițe","dative-definite-genitive-plural":"loznițelor","singular-vocative":"lozniță","plural-vocative":"loznițelor"}},{"word":"Lozova","pos":"name","definitions":["a village in Braniștea, Galați County, Romania"],"gender":"f"},{"word":"Lozovan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lozovan"}},{"word":"Lozovița","pos":"name","definitions":["a river in Galați, Romania, tributary to the Lozova"],"gender":"f"},{"word":"lozuță","pos":"noun","definitions":["diminutive of loză"],"forms":{"plural":"lozuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lozuță","accusative-definite-nominative-singular":"lozuța","accusative-indefinite-nominative-plural":"lozuțe","accusative-definite-nominative-plural":"lozuțele","dative-genitive-indefinite-singular":"lozuțe","dative-definite-genitive-singular":"lozuței","dative-genitive-indefinite-plural":"lozuțe","dative-definite-genitive-plural":"lozuțelor","singular-vocative":"lozuță","plural-vocative":"lozuțelor"}},{"word":"LSD","pos":"noun","definitions":["LSD (lysergic acid diethylamide)"],"pronunciation":"[e.les.de]"},{"word":"lua","pos":"verb","definitions":["to take","synonym of cumpăra (“to buy”)","to take (to use up time)","to pass an examination","to come upon somebody"],"pronunciation":"/ˈlwa/","examples":[{"ro":"Aș dori să iau prânzul cu tine.","en":"I would like to have lunch with you."},{"ro":"Ia-mă cu tine.","en":"Take me with you."},{"ro":"Ce vrei să-ți iau de la magazin?","en":"What do you want me to buy you from the store?"}],"forms":{"canonical":"a lua 1st conjugation","present-singular-third-person":"ia","participle-past":"luat","subjunctive-third-person":"ia","regional-subjunctive-third-person":"ieie","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a lua","gerund":"luând","first-person-indicative-present-singular":"iau","indicative-present-second-person-singular":"iei","indicative-present-singular-third-person":"ia","first-person-indicative-plural-present":"luăm","indicative-plural-present-second-person":"luați","indicative-plural-present-third-person":"iau","first-person-imperfect-indicative-singular":"luam","imperfect-indicative-second-person-singular":"luai","imperfect-indicative-singular-third-person":"lua","first-person-imperfect-indicative-plural":"luam","imperfect-indicative-plural-second-person":"luați","imperfect-indicative-plural-third-person":"luau","first-person-indicative-perfect-singular":"luai","indicative-perfect-second-person-singular":"luași","indicative-perfect-singular-third-person":"luă","first-person-indicative-perfect-plural":"luarăm","indicative-perfect-plural-second-person":"luarăți","indicative-perfect-plural-third-person":"luară","first-person-indicative-pluperfect-singular":"luasem","indicative-pluperfect-second-person-singular":"luaseși","indicative-pluperfect-singular-third-person":"luase","first-person-indicative-pluperfect-plural":"luaserăm","indicative-pluperfect-plural-second-person":"luaserăți","indicative-pluperfect-plural-third-person":"luaseră","first-person-present-singular-subjunctive":"să iau","present-second-person-singular-subjunctive":"să iei","present-singular-subjunctive-third-person":"să ia","first-person-plural-present-subjunctive":"să luăm","plural-present-second-person-subjunctive":"să luați","plural-present-subjunctive-third-person":"să ia","imperative-second-person-singular":"ia","imperative-plural-second-person":"luați","imperative-negative-second-person-singular":"nu lua","imperative-negative-plural-second-person":"nu luați","alternative":"луа"}},{"word":"lua caimacul","pos":"verb","definitions":["to take the lion's share"],"forms":{"canonical":"a lua caimacul 1st conjugation","present-singular-third-person":"ia caimacul","participle-past":"luat caimacul"}},{"word":"lua de bun","pos":"verb","definitions":["take at face value"],"examples":[{"ro":"Nu poți să iei de bune toate lucrurile pe care le auzi.","en":"You cannot take at face value all the things you hear."}],"forms":{"canonical":"a lua de bun 1st conjugation","present-singular-third-person":"ia de bun","participle-past":"luat de bun"}},{"word":"lua de-a gata","pos":"verb","definitions":["to accept without questioning"],"forms":{"canonical":"a lua de-a gata 1st conjugation","present-singular-third-person":"ia de-a gata","participle-past":"luat de-a gata"}},{"word":"lua în considerație","pos":"verb","definitions":["alternative form of lua în considerare (“take into consideration”)"],"forms":{"canonical":"a lua în considerație 1st conjugation","present-singular-third-person":"ia în considerație","participle-past":"luat în considerație","subjunctive-third-person":"ia în considerație"}},{"word":"lua în seamă","pos":"verb","definitions":["synonym of băga în seamă (“give attention”)"],"forms":{"canonical":"a lua în seamă 1st conjugation","present-singular-third-person":"ia în seamă","participle-past":"luat în seamă","table-tags":"conjugation-1","inflection-template":"ro-conj-phrase","infinitive":"a lua în seamă","gerund":"luând în seamă","first-person-indicative-present-singular":"iau în seamă","indicative-present-second-person-singular":"iei în seamă","indicative-present-singular-third-person":"ia în seamă","first-person-indicative-plural-present":"luăm în seamă","indicative-plural-present-second-person":"luați în seamă","indicative-plural-present-third-person":"iau în seamă","first-person-imperfect-indicative-singular":"luam în seamă","imperfect-indicative-second-person-singular":"luai în seamă","imperfect-indicative-singular-third-person":"lua în seamă","first-person-imperfect-indicative-plural":"luam în seamă","imperfect-indicative-plural-second-person":"luați în seamă","imperfect-indicative-plural-third-person":"luau în seamă","first-person-indicative-perfect-singular":"luai în seamă","indicative-perfect-second-person-singular":"luași în seamă","indicative-perfect-singular-third-person":"luă în seamă","first-person-indicative-perfect-plural":"luarăm în seamă","indicative-perfect-plural-second-person":"luarăți în seamă","indicative-perfect-plural-third-person":"luară în seamă","first-person-indicative-pluperfect-singular":"luasem în seamă","indicative-pluperfect-second-person-singular":"luaseși în seamă","indicative-pluperfect-singular-third-person":"luase în seamă","first-person-indicative-pluperfect-plural":"luaserăm în seamă","indicative-pluperfect-plural-second-person":"luaserăți în seamă","indicative-pluperfect-plural-third-person":"luaseră în seamă","first-person-present-singular-subjunctive":"să iau în seamă","present-second-person-singular-subjunctive":"să iei în seamă","present-singular-subjunctive-third-person":"să ia în seamă","first-person-plural-present-subjunctive":"să luăm în seamă","plural-present-second-person-subjunctive":"să luați în seamă","plural-present-subjunctive-third-person":"să ia în seamă","imperative-second-person-singular":"ia în seamă","imperative-plural-second-person":"luați în seamă","imperative-negative-second-person-singular":"nu lua în seamă","imperative-negative-plural-second-person":"nu luați în seamă"}},{"word":"lua la pulă","pos":"verb","definitions":["to make fun of, to fuck with, to take the piss"],"pronunciation":"/ˈlwa la ˈpu.lə/","examples":[{"ro":"Te iau la pulă dușmanii cap gol, tu doar imiți golanii","en":"Your enemies are fucking with you bareheaded, you just imitate thugs"}],"forms":{"canonical":"a lua la pulă [conj]","present-singular-third-person":"ia la pulă","participle-past":"luat la pulă","table-tags":"conjugation-1","inflection-template":"ro-conj-phrase\n","infinitive":"a lua la pulă","gerund":"luând la pulă","first-person-indicative-present-singular":"iau la pulă","indicative-present-second-person-singular":"iei la pulă","indicative-present-singular-third-person":"ia la pulă","first-person-indicative-plural-present":"luăm la pulă","indicative-plural-present-second-person":"luați la pulă","indicative-plural-present-third-person":"iau la pulă","first-person-imperfect-indicative-singular":"luam la pulă","imperfect-indicative-second-person-singular":"luai la pulă","imperfect-indicative-singular-third-person":"lua la pulă","first-person-imperfect-indicative-plural":"luam la pulă","imperfect-indicative-plural-second-person":"luați la pulă","imperfect-indicative-plural-third-person":"luau la pulă","first-person-indicative-perfect-singular":"luai la pulă","indicative-perfect-second-person-singular":"luași la pulă","indicative-perfect-singular-third-person":"luă la pulă","first-person-indicative-perfect-plural":"luarăm la pulă","indicative-perfect-plural-second-person":"luarăți la pulă","indicative-perfect-plural-third-person":"luară la pulă","first-person-indicative-pluperfect-singular":"luasem la pulă","indicative-pluperfect-second-person-singular":"luaseși la pulă","indicative-pluperfect-singular-third-person":"luase la pulă","first-person-indicative-pluperfect-plural":"luaserăm la pulă","indicative-pluperfect-plural-second-person":"luaserăți la pulă","indicative-pluperfect-plural-third-person":"luaseră la pulă","first-person-present-singular-subjunctive":"să iau la pulă","present-second-person-singular-subjunctive":"să iei la pulă","present-singular-subjunctive-third-person":"să ia la pulă","first-person-plural-present-subjunctive":"să luăm la pulă","plural-present-second-person-subjunctive":"să luați la pulă","plural-present-subjunctive-third-person":"să ia la pulă","imperative-second-person-singular":"ia la pulă","imperative-plural-second-person":"luați la pulă","imperative-negative-second-person-singular":"nu lua la pulă","imperative-negative-plural-second-person":"nu luați la pulă"}},{"word":"lua pâinea de la gură","pos":"verb","definitions":["to deprive someone of their livelihood"],"forms":{"canonical":"a lua pâinea de la gură 1st conjugation","present-singular-third-person":"ia pâinea de la gură","participle-past":"luat pâinea de la gură"}},{"word":"lua plasă","pos":"verb","definitions":["to be fooled"],"forms":{"canonical":"a lua plasă 1st conjugation","present-singular-third-person":"ia plasă","participle-past":"luat plasă"}},{"word":"lua viața","pos":"verb","definitions":["to take someone's life"],"forms":{"canonical":"a lua viața 1st conjugation","present-singular-third-person":"ia viața","participle-past":"luat viața","subjunctive-third-person":"ia viața"}},{"word":"luabil","pos":"adj","definitions":["takeable"],"forms":{"feminine-singular":"luabilă","masculine-plural":"luabili","feminine-neuter-plural":"luabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"luabil","error-unrecognized-form-feminine-indefinite-singular":"luabilă","error-unrecognized-form-indefinite-masculine-plural":"luabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"luabile","definite-error-unrecognized-form-masculine-neuter-singular":"luabilul","definite-error-unrecognized-form-feminine-singular":"luabila","definite-error-unrecognized-form-masculine-plural":"luabilii","definite-error-unrecognized-form-feminine-neuter-plural":"luabilele"}},{"word":"luam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of lua"],"pronunciation":"[luˈam]"},{"word":"luăm","pos":"verb","definitions":["first-person plural present indicative/subjunctive of lua"],"pronunciation":"/luˈəm/"},{"word":"luând","pos":"verb","definitions":["gerund of lua"]},{"word":"luare","pos":"noun","definitions":["take; an act of taking"],"pronunciation":"/luˈa.re/","forms":{"plural":"luări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"luare","accusative-definite-nominative-singular":"luarea","accusative-indefinite-nominative-plural":"luări","accusative-definite-nominative-plural":"luările","dative-genitive-indefinite-singular":"luări","dative-definite-genitive-singular":"luării","dative-genitive-indefinite-plural":"luări","dative-definite-genitive-plural":"luărilor","singular-vocative":"luare","plural-vocative":"luărilor"}},{"word":"luat","pos":"noun","definitions":["taking"],"pronunciation":"/lwat/","forms":{"plural":"luaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"luat","accusative-definite-nominative-singular":"luatul","accusative-indefinite-nominative-plural":"luaturi","accusative-definite-nominative-plural":"luaturile","dative-genitive-indefinite-singular":"luat","dative-definite-genitive-singular":"luatului","dative-genitive-indefinite-plural":"luaturi","dative-definite-genitive-plural":"luaturilor","singular-vocative":"luatule","plural-vocative":"luaturilor"}},{"word":"luat","pos":"adj","definitions":["taken"],"pronunciation":"/lwat/","forms":{"feminine-singular":"luată","masculine-plural":"luați","feminine-neuter-plural":"luate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"luat","error-unrecognized-form-feminine-indefinite-singular":"luată","error-unrecognized-form-indefinite-masculine-plural":"luați","error-unrecognized-form-feminine-indefinite-neuter-plural":"luate","definite-error-unrecognized-form-masculine-neuter-singular":"luatul","definite-error-unrecognized-form-feminine-singular":"luata","definite-error-unrecognized-form-masculine-plural":"luații","definite-error-unrecognized-form-feminine-neuter-plural":"luatele"}},{"word":"luat","pos":"verb","definitions":["past participle of lua"],"pronunciation":"/lwat/","forms":{"participle-past":"of lua"}},{"word":"luați","pos":"adj","definitions":["masculine plural of luat"],"pronunciation":"/luˈat͡sʲ/","gender":"m-p"},{"word":"luați","pos":"verb","definitions":["inflection of lua:","second-person plural present indicative/subjunctive","second-person plural imperfect indicative","second-person plural imperative"],"pronunciation":"/luˈat͡sʲ/"},{"word":"luător","pos":"adj","definitions":["taking"],"forms":{"feminine-singular":"luătoare","masculine-plural":"luători","feminine-neuter-plural":"luătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"luător","error-unrecognized-form-feminine-indefinite-singular":"luătoare","error-unrecognized-form-indefinite-masculine-plural":"luători","error-unrecognized-form-feminine-indefinite-neuter-plural":"luătoare","definite-error-unrecognized-form-masculine-neuter-singular":"luătorul","definite-error-unrecognized-form-feminine-singular":"luătoarea","definite-error-unrecognized-form-masculine-plural":"luătorii","definite-error-unrecognized-form-feminine-neuter-plural":"luătoarele"}},{"word":"luător","pos":"noun","definitions":["taker"],"forms":{"plural":"luători","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"luător","accusative-definite-nominative-singular":"luătorul","accusative-indefinite-nominative-plural":"luători","accusative-definite-nominative-plural":"luătorii","dative-genitive-indefinite-singular":"luător","dative-definite-genitive-singular":"luătorului","dative-genitive-indefinite-plural":"luători","dative-definite-genitive-plural":"luătorilor","singular-vocative":"luătorule","plural-vocative":"luătorilor"}},{"word":"luau","pos":"verb","definitions":["third-person plural imperfect of lua"],"examples":[{"ro":"ei luau","en":"they took"}]},{"word":"lubă","pos":"noun","definitions":["pumpkin","watermelon"],"forms":{"plural":"lube","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lubă","accusative-definite-nominative-singular":"luba","accusative-indefinite-nominative-plural":"lube","accusative-definite-nominative-plural":"lubele","dative-genitive-indefinite-singular":"lube","dative-definite-genitive-singular":"lubei","dative-genitive-indefinite-plural":"lube","dative-definite-genitive-plural":"lubelor","singular-vocative":"lubă","plural-vocative":"lubelor"}},{"word":"Lubeniță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lubeniță"}},{"word":"lubeniță","pos":"noun","definitions":["watermelon"],"pronunciation":"/ˈlu.be.ni.tsə/","forms":{"plural":"lubenițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lubeniță","accusative-definite-nominative-singular":"lubenița","accusative-indefinite-nominative-plural":"lubenițe","accusative-definite-nominative-plural":"lubenițele","dative-genitive-indefinite-singular":"lubenițe","dative-definite-genitive-singular":"lubeniței","dative-genitive-indefinite-plural":"lubenițe","dative-definite-genitive-plural":"lubenițelor","singular-vocative":"lubeniță","plural-vocative":"lubenițelor","alternative":"lebeniță"}},{"word":"lubenițărie","pos":"noun","definitions":["watermelon field"],"forms":{"plural":"lubenițării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lubenițărie","accusative-definite-nominative-singular":"lubenițăria","accusative-indefinite-nominative-plural":"lubenițării","accusative-definite-nominative-plural":"lubenițăriile","dative-genitive-indefinite-singular":"lubenițării","dative-definite-genitive-singular":"lubenițăriei","dative-genitive-indefinite-plural":"lubenițării","dative-definite-genitive-plural":"lubenițăriilor","singular-vocative":"lubenițărie","plural-vocative":"lubenițăriilor"}},{"word":"lubiț","pos":"noun","definitions":["camelina (Camelina sativa)"],"forms":{"plural":"lubiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lubiț","accusative-definite-nominative-singular":"lubițul","accusative-indefinite-nominative-plural":"lubiți","accusative-definite-nominative-plural":"lubiții","dative-genitive-indefinite-singular":"lubiț","dative-definite-genitive-singular":"lubițului","dative-genitive-indefinite-plural":"lubiți","dative-definite-genitive-plural":"lubiților","singular-vocative":"lubițule","plural-vocative":"lubiților"}},{"word":"lubric","pos":"adj","definitions":["lustful"],"forms":{"feminine-singular":"lubrică","masculine-plural":"lubrici","feminine-neuter-plural":"lubrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lubric","error-unrecognized-form-feminine-indefinite-singular":"lubrică","error-unrecognized-form-indefinite-masculine-plural":"lubrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"lubrice","definite-error-unrecognized-form-masculine-neuter-singular":"lubricul","definite-error-unrecognized-form-feminine-singular":"lubrica","definite-error-unrecognized-form-masculine-plural":"lubricii","definite-error-unrecognized-form-feminine-neuter-plural":"lubricele"}},{"word":"lubricator","pos":"noun","definitions":["lubricator"],"forms":{"plural":"lubricatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lubricator","accusative-definite-nominative-singular":"lubricatorul","accusative-indefinite-nominative-plural":"lubricatoare","accusative-definite-nominative-plural":"lubricatoarele","dative-genitive-indefinite-singular":"lubricator","dative-definite-genitive-singular":"lubricatorului","dative-genitive-indefinite-plural":"lubricatoare","dative-definite-genitive-plural":"lubricatoarelor","singular-vocative":"lubricatorule","plural-vocative":"lubricatoarelor"}},{"word":"lubricitate","pos":"noun","definitions":["lubricity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"lubricitate","accusative-definite-nominative":"lubricitatea","dative-genitive-indefinite":"lubricități","dative-definite-genitive":"lubricității","vocative":"lubricitate"}},{"word":"lubrifia","pos":"verb","definitions":["to lubricate"],"pronunciation":"[lubrifiˈa]","forms":{"canonical":"a lubrifia 1st conjugation","present-singular-third-person":"lubrifiază","participle-past":"lubrifiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a lubrifia","gerund":"lubrifiind","first-person-indicative-present-singular":"lubrifiez","indicative-present-second-person-singular":"lubrifiezi","indicative-present-singular-third-person":"lubrifiază","first-person-indicative-plural-present":"lubrifiem","indicative-plural-present-second-person":"lubrifiați","indicative-plural-present-third-person":"lubrifiază","first-person-imperfect-indicative-singular":"lubrifiam","imperfect-indicative-second-person-singular":"lubrifiai","imperfect-indicative-singular-third-person":"lubrifia","first-person-imperfect-indicative-plural":"lubrifiam","imperfect-indicative-plural-second-person":"lubrifiați","imperfect-indicative-plural-third-person":"lubrifiau","first-person-indicative-perfect-singular":"lubrifiai","indicative-perfect-second-person-singular":"lubrifiași","indicative-perfect-singular-third-person":"lubrifie","first-person-indicative-perfect-plural":"lubrifiarăm","indicative-perfect-plural-second-person":"lubrifiarăți","indicative-perfect-plural-third-person":"lubrifiară","first-person-indicative-pluperfect-singular":"lubrifiasem","indicative-pluperfect-second-person-singular":"lubrifiaseși","indicative-pluperfect-singular-third-person":"lubrifiase","first-person-indicative-pluperfect-plural":"lubrifiaserăm","indicative-pluperfect-plural-second-person":"lubrifiaserăți","indicative-pluperfect-plural-third-person":"lubrifiaseră","first-person-present-singular-subjunctive":"să lubrifiez","present-second-person-singular-subjunctive":"să lubrifiezi","present-singular-subjunctive-third-person":"să lubrifieze","first-person-plural-present-subjunctive":"să lubrifiem","plural-present-second-person-subjunctive":"să lubrifiați","plural-present-subjunctive-third-person":"să lubrifieze","imperative-second-person-singular":"lubrifiază","imperative-plural-second-person":"lubrifiați","imperative-negative-second-person-singular":"nu lubrifia","imperative-negative-plural-second-person":"nu lubrifiați"}},{"word":"lubrifiai","pos":"verb","definitions":["inflection of lubrifia:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[lubrifiˈaj]"},{"word":"lubrifiant","pos":"noun","definitions":["lubricant"],"pronunciation":"[lubrifiˈant]","forms":{"plural":"lubrifianți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lubrifiant","accusative-definite-nominative-singular":"lubrifiantul","accusative-indefinite-nominative-plural":"lubrifianți","accusative-definite-nominative-plural":"lubrifianții","dative-genitive-indefinite-singular":"lubrifiant","dative-definite-genitive-singular":"lubrifiantului","dative-genitive-indefinite-plural":"lubrifianți","dative-definite-genitive-plural":"lubrifianților","singular-vocative":"lubrifiantule","plural-vocative":"lubrifianților"}},{"word":"lubrificație","pos":"noun","definitions":["lubrication"],"forms":{"plural":"lubrificații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lubrificație","accusative-definite-nominative-singular":"lubrificația","accusative-indefinite-nominative-plural":"lubrificații","accusative-definite-nominative-plural":"lubrificațiile","dative-genitive-indefinite-singular":"lubrificații","dative-definite-genitive-singular":"lubrificației","dative-genitive-indefinite-plural":"lubrificații","dative-definite-genitive-plural":"lubrificațiilor","singular-vocative":"lubrificație","plural-vocative":"lubrificațiilor"}},{"word":"lubrificator","pos":"noun","definitions":["lubricator"],"forms":{"plural":"lubrificatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lubrificator","accusative-definite-nominative-singular":"lubrificatorul","accusative-indefinite-nominative-plural":"lubrificatore","accusative-definite-nominative-plural":"lubrificatorele","dative-genitive-indefinite-singular":"lubrificator","dative-definite-genitive-singular":"lubrificatorului","dative-genitive-indefinite-plural":"lubrificatore","dative-definite-genitive-plural":"lubrificatorelor","singular-vocative":"lubrificatorule","plural-vocative":"lubrificatorelor"}},{"word":"lubrifie","pos":"verb","definitions":["third-person singular simple perfect indicative of lubrifia"],"pronunciation":"[lubrifiˈe]"},{"word":"lubrifiere","pos":"noun","definitions":["lubrication"],"forms":{"plural":"lubrifieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lubrifiere","accusative-definite-nominative-singular":"lubrifierea","accusative-indefinite-nominative-plural":"lubrifieri","accusative-definite-nominative-plural":"lubrifierile","dative-genitive-indefinite-singular":"lubrifieri","dative-definite-genitive-singular":"lubrifierii","dative-genitive-indefinite-plural":"lubrifieri","dative-definite-genitive-plural":"lubrifierilor","singular-vocative":"lubrifiere","plural-vocative":"lubrifierilor"}},{"word":"lubrifiez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of lubrifia"],"pronunciation":"[lubrifiˈez]"},{"word":"Luca","pos":"name","definitions":["a male given name, equivalent to English Luke or Lucas"],"gender":"m","forms":{"dative-genitive":"lui Luca"}},{"word":"Lucăcel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lucăcel"}},{"word":"Lucăceni","pos":"name","definitions":["a village in Berveni, Satu Mare County, Romania"],"gender":"m"},{"word":"Lucăcești","pos":"name","definitions":["a village in Mireșu Mare, Maramureș County, Romania","a village in Drăgoiești, Suceava County, Romania"],"gender":"m"},{"word":"Lucacevăț","pos":"name","definitions":["a village in Sichevița, Caraș-Severin County, Romania"],"gender":"m"},{"word":"Lucachi","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Lucachi"}},{"word":"Lucaci","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Lucaci"}},{"word":"Lucăcilă","pos":"name","definitions":["a river in Dâmbovița, Romania, tributary to the Brătei","a river in Dâmbovița, Romania, tributary to the Ialomița"],"gender":"m"},{"word":"Lucaciu","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Lucaciu"}},{"word":"Lucaciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Lucaciuc"}},{"word":"Lucănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lucănescu"}},{"word":"lucanică","pos":"noun","definitions":["loukaniko, sausage"],"forms":{"plural":"lucanici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lucanică","accusative-definite-nominative-singular":"lucanica","accusative-indefinite-nominative-plural":"lucanici","accusative-definite-nominative-plural":"lucanicile","dative-genitive-indefinite-singular":"lucanici","dative-definite-genitive-singular":"lucanicii","dative-genitive-indefinite-plural":"lucanici","dative-definite-genitive-plural":"lucanicilor","singular-vocative":"lucanică","plural-vocative":"lucanicilor"}},{"word":"Lucareț","pos":"name","definitions":["a village in Brestovăț, Timiș County, Romania"],"gender":"m"},{"word":"lucarnă","pos":"noun","definitions":["skylight"],"forms":{"plural":"lucarne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lucarnă","accusative-definite-nominative-singular":"lucarna","accusative-indefinite-nominative-plural":"lucarne","accusative-definite-nominative-plural":"lucarnele","dative-genitive-indefinite-singular":"lucarne","dative-definite-genitive-singular":"lucarnei","dative-genitive-indefinite-plural":"lucarne","dative-definite-genitive-plural":"lucarnelor","singular-vocative":"lucarnă","plural-vocative":"lucarnelor"}},{"word":"Lucășeuca","pos":"name","definitions":["a village in Seliște, Orhei Raion, Moldova"],"gender":"f"},{"word":"Lucasievici","pos":"name","definitions":["a surname from Polish"],"gender":"m","forms":{"dative-genitive":"lui Lucasievici"}},{"word":"luce","pos":"noun","definitions":["light","shine","beauty"],"forms":{"plural":"luci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"luce","accusative-definite-nominative-singular":"lucea","accusative-indefinite-nominative-plural":"luci","accusative-definite-nominative-plural":"lucile","dative-genitive-indefinite-singular":"luci","dative-definite-genitive-singular":"lucii","dative-genitive-indefinite-plural":"luci","dative-definite-genitive-plural":"lucilor","singular-vocative":"luce","plural-vocative":"lucilor"}},{"word":"lucea","pos":"noun","definitions":["definite nominative/accusative singular of luce"]},{"word":"Luceafăr","pos":"name","definitions":["the morning star, daystar, planet Venus"],"forms":{"alternative":"luceafăr"}},{"word":"luceafăr","pos":"noun","definitions":["the morningstar, daystar, planet Venus","a paragon","an Adonis (beautiful man)","Lucifer"],"forms":{"plural":"luceferi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"luceafăr","accusative-definite-nominative-singular":"luceafărul","accusative-indefinite-nominative-plural":"luceferi","accusative-definite-nominative-plural":"luceferii","dative-genitive-indefinite-singular":"luceafăr","dative-definite-genitive-singular":"luceafărului","dative-genitive-indefinite-plural":"luceferi","dative-definite-genitive-plural":"luceferilor","singular-vocative":"luceafărule","plural-vocative":"luceferilor","alternative":"Luceafăr"}},{"word":"Luceafărul-de-Dimineață","pos":"noun","definitions":["Morning Star"]},{"word":"Luceafărul-de-Seară","pos":"noun","definitions":["Evening Star"]},{"word":"luceafărul-de-seară","pos":"noun","definitions":["evening star"]},{"word":"luceală","pos":"noun","definitions":["radiance"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"luceală","accusative-definite-nominative":"luceala","dative-genitive-indefinite":"luceale","dative-definite-genitive":"lucealei","vocative":"luceală"}},{"word":"luceam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of luci"],"pronunciation":"[luˈt͡ʃe̯am]"},{"word":"luced","pos":"adj","definitions":["bright, shining, glowing"],"pronunciation":"/ˈlu.t͡ʃed/","forms":{"feminine-singular":"lucedă","masculine-plural":"lucezi","feminine-neuter-plural":"lucede","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"luced","error-unrecognized-form-feminine-indefinite-singular":"lucedă","error-unrecognized-form-indefinite-masculine-plural":"lucezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lucede","definite-error-unrecognized-form-masculine-neuter-singular":"lucedul","definite-error-unrecognized-form-feminine-singular":"luceda","definite-error-unrecognized-form-masculine-plural":"lucezii","definite-error-unrecognized-form-feminine-neuter-plural":"lucedele"}},{"word":"luceferel","pos":"noun","definitions":["diminutive of luceafăr"],"forms":{"plural":"luceferei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"luceferel","accusative-definite-nominative-singular":"luceferelul","accusative-indefinite-nominative-plural":"luceferei","accusative-definite-nominative-plural":"lucefereii","dative-genitive-indefinite-singular":"luceferel","dative-definite-genitive-singular":"luceferelului","dative-genitive-indefinite-plural":"luceferei","dative-definite-genitive-plural":"lucefereilor","singular-vocative":"luceferelule","plural-vocative":"lucefereilor"}},{"word":"Luceni","pos":"name","definitions":["a village in Victoria, Iași County, Romania"],"gender":"m"},{"word":"luceo","pos":"noun","definitions":["vocative singular of luce"]},{"word":"lucernă","pos":"noun","definitions":["lucerne, alfalfa"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lucernă","accusative-definite-nominative":"lucerna","dative-genitive-indefinite":"lucerne","dative-definite-genitive":"lucernei","vocative":"lucernă"}},{"word":"lucernariu","pos":"noun","definitions":["skylight"],"forms":{"plural":"lucernarii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lucernariu","accusative-definite-nominative-singular":"lucernariuul","accusative-indefinite-nominative-plural":"lucernarii","accusative-definite-nominative-plural":"lucernariii","dative-genitive-indefinite-singular":"lucernariu","dative-definite-genitive-singular":"lucernariuului","dative-genitive-indefinite-plural":"lucernarii","dative-definite-genitive-plural":"lucernariilor","singular-vocative":"lucernariuule","plural-vocative":"lucernariilor"}},{"word":"lucernieră","pos":"noun","definitions":["alfalfa field"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lucernieră","accusative-definite-nominative":"lucerniera","dative-genitive-indefinite":"lucerniere","dative-definite-genitive":"lucernierei","vocative":"lucernieră"}},{"word":"lucesc","pos":"verb","definitions":["inflection of luci:","first-person singular present indicative/subjunctive","third-person plural present indicative"]},{"word":"Lucescu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lucescu"}},{"word":"Lucești","pos":"name","definitions":["a village in Lucești, Cahul Raion, Moldova","a commune of Cahul Raion, Moldova"],"gender":"m"},{"word":"Luchescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Luchescu"}},{"word":"Luchide","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Luchide"}},{"word":"Luchiniuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Luchiniuc"}},{"word":"luci","pos":"verb","definitions":["to shine, sparkle, shimmer, glisten","to beam with joy"],"forms":{"canonical":"a luci 4th conjugation","present-singular-third-person":"lucește","participle-past":"lucit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a luci","gerund":"lucind","first-person-indicative-present-singular":"lucesc","indicative-present-second-person-singular":"lucești","indicative-present-singular-third-person":"lucește","first-person-indicative-plural-present":"lucim","indicative-plural-present-second-person":"luciți","indicative-plural-present-third-person":"lucesc","first-person-imperfect-indicative-singular":"luceam","imperfect-indicative-second-person-singular":"luceai","imperfect-indicative-singular-third-person":"lucea","first-person-imperfect-indicative-plural":"luceam","imperfect-indicative-plural-second-person":"luceați","imperfect-indicative-plural-third-person":"luceau","first-person-indicative-perfect-singular":"lucii","indicative-perfect-second-person-singular":"luciși","indicative-perfect-singular-third-person":"luci","first-person-indicative-perfect-plural":"lucirăm","indicative-perfect-plural-second-person":"lucirăți","indicative-perfect-plural-third-person":"luciră","first-person-indicative-pluperfect-singular":"lucisem","indicative-pluperfect-second-person-singular":"luciseși","indicative-pluperfect-singular-third-person":"lucise","first-person-indicative-pluperfect-plural":"luciserăm","indicative-pluperfect-plural-second-person":"luciserăți","indicative-pluperfect-plural-third-person":"luciseră","first-person-present-singular-subjunctive":"să lucesc","present-second-person-singular-subjunctive":"să lucești","present-singular-subjunctive-third-person":"să lucească","first-person-plural-present-subjunctive":"să lucim","plural-present-second-person-subjunctive":"să luciți","plural-present-subjunctive-third-person":"să lucească","imperative-second-person-singular":"lucește","imperative-plural-second-person":"luciți","imperative-negative-second-person-singular":"nu luci","imperative-negative-plural-second-person":"nu luciți"}},{"word":"luci","pos":"noun","definitions":["inflection of luce:","indefinite genitive/dative singular","indefinite nominative/accusative/genitive/dative plural"]},{"word":"Lucia","pos":"name","definitions":["a female given name, equivalent to English Lucy"],"pronunciation":"[ˈlu.tʃja]","gender":"f","forms":{"dative-genitive":"Luciei","masculine":"Lucian"}},{"word":"Lucian","pos":"name","definitions":["a male given name from Latin"],"pronunciation":"[luˈt͡ʃjan]","gender":"m","forms":{"dative-genitive":"lui Lucian","feminine":"Lucia"}},{"word":"Luciana","pos":"name","definitions":["a female given name"],"gender":"f","forms":{"dative-genitive":"Lucianei","masculine":"Lucian"}},{"word":"Lucianca","pos":"name","definitions":["a village in Butimanu, Dâmbovița County, Romania"],"gender":"f"},{"word":"lucid","pos":"adj","definitions":["lucid, clear-sighted"],"pronunciation":"/luˈt͡ʃid/","forms":{"feminine-singular":"lucidă","masculine-plural":"lucizi","feminine-neuter-plural":"lucide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lucid","error-unrecognized-form-feminine-indefinite-singular":"lucidă","error-unrecognized-form-indefinite-masculine-plural":"lucizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lucide","definite-error-unrecognized-form-masculine-neuter-singular":"lucidul","definite-error-unrecognized-form-feminine-singular":"lucida","definite-error-unrecognized-form-masculine-plural":"lucizii","definite-error-unrecognized-form-feminine-neuter-plural":"lucidele"}},{"word":"luciditate","pos":"noun","definitions":["lucidity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"luciditate","accusative-definite-nominative-singular":"luciditatea","accusative-indefinite-nominative-plural":"lucidități","accusative-definite-nominative-plural":"luciditățile","dative-genitive-indefinite-singular":"lucidități","dative-definite-genitive-singular":"lucidității","dative-genitive-indefinite-plural":"lucidități","dative-definite-genitive-plural":"lucidităților","singular-vocative":"luciditate","plural-vocative":"lucidităților"}},{"word":"Lucieni","pos":"name","definitions":["a village in Hârtiești, Argeș County, Romania","a commune of Dâmbovița County, Romania","a village in Lucieni, Dâmbovița County, Romania"],"gender":"m"},{"word":"lucietură","pos":"noun","definitions":["flatness"],"forms":{"plural":"lucieturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lucietură","accusative-definite-nominative-singular":"lucietura","accusative-indefinite-nominative-plural":"lucieturi","accusative-definite-nominative-plural":"lucieturile","dative-genitive-indefinite-singular":"lucieturi","dative-definite-genitive-singular":"lucieturii","dative-genitive-indefinite-plural":"lucieturi","dative-definite-genitive-plural":"lucieturilor","singular-vocative":"lucietură","plural-vocative":"lucieturilor"}},{"word":"Lucifer","pos":"name","definitions":["Lucifer"],"gender":"m","forms":{"dative-genitive":"lui Lucifer"}},{"word":"luciferian","pos":"adj","definitions":["Luciferian, demonic"],"forms":{"feminine-singular":"luciferiană","masculine-plural":"luciferieni","feminine-neuter-plural":"luciferiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"luciferian","error-unrecognized-form-feminine-indefinite-singular":"luciferiană","error-unrecognized-form-indefinite-masculine-plural":"luciferieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"luciferiene","definite-error-unrecognized-form-masculine-neuter-singular":"luciferianul","definite-error-unrecognized-form-feminine-singular":"luciferiana","definite-error-unrecognized-form-masculine-plural":"luciferienii","definite-error-unrecognized-form-feminine-neuter-plural":"luciferienele"}},{"word":"luciferic","pos":"adj","definitions":["Luciferic"],"forms":{"feminine-singular":"luciferică","masculine-plural":"luciferici","feminine-neuter-plural":"luciferice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"luciferic","error-unrecognized-form-feminine-indefinite-singular":"luciferică","error-unrecognized-form-indefinite-masculine-plural":"luciferici","error-unrecognized-form-feminine-indefinite-neuter-plural":"luciferice","definite-error-unrecognized-form-masculine-neuter-singular":"lucifericul","definite-error-unrecognized-form-feminine-singular":"luciferica","definite-error-unrecognized-form-masculine-plural":"lucifericii","definite-error-unrecognized-form-feminine-neuter-plural":"lucifericele"}},{"word":"luciferină","pos":"noun","definitions":["luciferin"],"forms":{"plural":"luciferine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luciferină","accusative-definite-nominative-singular":"luciferina","accusative-indefinite-nominative-plural":"luciferine","accusative-definite-nominative-plural":"luciferinele","dative-genitive-indefinite-singular":"luciferine","dative-definite-genitive-singular":"luciferinei","dative-genitive-indefinite-plural":"luciferine","dative-definite-genitive-plural":"luciferinelor","singular-vocative":"luciferină","plural-vocative":"luciferinelor"}},{"word":"luciferism","pos":"noun","definitions":["Luciferianism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"luciferism","accusative-definite-nominative":"luciferismul","dative-genitive-indefinite":"luciferism","dative-definite-genitive":"luciferismului","vocative":"luciferismule"}},{"word":"lucifob","pos":"adj","definitions":["photophobic"],"forms":{"feminine-singular":"lucifobă","masculine-plural":"lucifobi","feminine-neuter-plural":"lucifobe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lucifob","error-unrecognized-form-feminine-indefinite-singular":"lucifobă","error-unrecognized-form-indefinite-masculine-plural":"lucifobi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lucifobe","definite-error-unrecognized-form-masculine-neuter-singular":"lucifobul","definite-error-unrecognized-form-feminine-singular":"lucifoba","definite-error-unrecognized-form-masculine-plural":"lucifobii","definite-error-unrecognized-form-feminine-neuter-plural":"lucifobele"}},{"word":"lucifug","pos":"adj","definitions":["lucifugous"],"forms":{"feminine-singular":"lucifugă","masculine-plural":"lucifugi","feminine-neuter-plural":"lucifuge","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lucifug","error-unrecognized-form-feminine-indefinite-singular":"lucifugă","error-unrecognized-form-indefinite-masculine-plural":"lucifugi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lucifuge","definite-error-unrecognized-form-masculine-neuter-singular":"lucifugul","definite-error-unrecognized-form-feminine-singular":"lucifuga","definite-error-unrecognized-form-masculine-plural":"lucifugii","definite-error-unrecognized-form-feminine-neuter-plural":"lucifugele"}},{"word":"lucii","pos":"verb","definitions":["first-person plural simple perfect indicative of luci"],"pronunciation":"[luˈt͡ʃij]"},{"word":"lucii","pos":"noun","definitions":["definite genitive/dative singular of luce"],"pronunciation":"[luˈt͡ʃij]"},{"word":"lucile","pos":"noun","definitions":["definite nominative/accusative plural of luce"]},{"word":"lucilor","pos":"noun","definitions":["inflection of luce:","definite genitive/dative plural","vocative plural"]},{"word":"lucime","pos":"noun","definitions":["glimmer"],"forms":{"plural":"lucimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lucime","accusative-definite-nominative-singular":"lucimea","accusative-indefinite-nominative-plural":"lucimi","accusative-definite-nominative-plural":"lucimile","dative-genitive-indefinite-singular":"lucimi","dative-definite-genitive-singular":"lucimii","dative-genitive-indefinite-plural":"lucimi","dative-definite-genitive-plural":"lucimilor","singular-vocative":"lucime","plural-vocative":"lucimilor"}},{"word":"lucind","pos":"adj","definitions":["glimmering"],"forms":{"feminine-singular":"lucindă","masculine-plural":"lucinzi","feminine-neuter-plural":"lucinde","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lucind","error-unrecognized-form-feminine-indefinite-singular":"lucindă","error-unrecognized-form-indefinite-masculine-plural":"lucinzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lucinde","definite-error-unrecognized-form-masculine-neuter-singular":"lucindul","definite-error-unrecognized-form-feminine-singular":"lucinda","definite-error-unrecognized-form-masculine-plural":"lucinzii","definite-error-unrecognized-form-feminine-neuter-plural":"lucindele"}},{"word":"Lucinschi","pos":"name","definitions":["a surname from Polish"],"gender":"m","forms":{"dative-genitive":"lui Lucinschi"}},{"word":"luciolă","pos":"noun","definitions":["firefly"],"forms":{"plural":"luciole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luciolă","accusative-definite-nominative-singular":"luciola","accusative-indefinite-nominative-plural":"luciole","accusative-definite-nominative-plural":"luciolele","dative-genitive-indefinite-singular":"luciole","dative-definite-genitive-singular":"luciolei","dative-genitive-indefinite-plural":"luciole","dative-definite-genitive-plural":"luciolelor","singular-vocative":"luciolă","plural-vocative":"luciolelor"}},{"word":"lucior","pos":"adj","definitions":["diminutive of luciu"],"forms":{"feminine-singular":"lucioră","masculine-plural":"luciori","feminine-neuter-plural":"luciore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lucior","error-unrecognized-form-feminine-indefinite-singular":"lucioră","error-unrecognized-form-indefinite-masculine-plural":"luciori","error-unrecognized-form-feminine-indefinite-neuter-plural":"luciore","definite-error-unrecognized-form-masculine-neuter-singular":"luciorul","definite-error-unrecognized-form-feminine-singular":"luciora","definite-error-unrecognized-form-masculine-plural":"luciorii","definite-error-unrecognized-form-feminine-neuter-plural":"luciorele"}},{"word":"lucios","pos":"adj","definitions":["shiny, glossy","bright, shining"],"pronunciation":"/luˈt͡ʃʲos/","forms":{"feminine-singular":"lucioasă","masculine-plural":"lucioși","feminine-neuter-plural":"lucioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lucios","error-unrecognized-form-feminine-indefinite-singular":"lucioasă","error-unrecognized-form-indefinite-masculine-plural":"lucioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lucioase","definite-error-unrecognized-form-masculine-neuter-singular":"luciosul","definite-error-unrecognized-form-feminine-singular":"lucioasa","definite-error-unrecognized-form-masculine-plural":"lucioșii","definite-error-unrecognized-form-feminine-neuter-plural":"lucioasele"}},{"word":"lucioșie","pos":"noun","definitions":["clarity"],"forms":{"plural":"lucioșii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lucioșie","accusative-definite-nominative-singular":"lucioșia","accusative-indefinite-nominative-plural":"lucioșii","accusative-definite-nominative-plural":"lucioșiile","dative-genitive-indefinite-singular":"lucioșii","dative-definite-genitive-singular":"lucioșiei","dative-genitive-indefinite-plural":"lucioșii","dative-definite-genitive-plural":"lucioșiilor","singular-vocative":"lucioșie","plural-vocative":"lucioșiilor"}},{"word":"lucire","pos":"noun","definitions":["glimmer, glow"],"forms":{"plural":"luciri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lucire","accusative-definite-nominative-singular":"lucirea","accusative-indefinite-nominative-plural":"luciri","accusative-definite-nominative-plural":"lucirile","dative-genitive-indefinite-singular":"luciri","dative-definite-genitive-singular":"lucirii","dative-genitive-indefinite-plural":"luciri","dative-definite-genitive-plural":"lucirilor","singular-vocative":"lucire","plural-vocative":"lucirilor"}},{"word":"lucișor","pos":"adj","definitions":["diminutive of luciu"],"forms":{"feminine-singular":"lucișoră","masculine-plural":"lucișori","feminine-neuter-plural":"lucișore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lucișor","error-unrecognized-form-feminine-indefinite-singular":"lucișoră","error-unrecognized-form-indefinite-masculine-plural":"lucișori","error-unrecognized-form-feminine-indefinite-neuter-plural":"lucișore","definite-error-unrecognized-form-masculine-neuter-singular":"lucișorul","definite-error-unrecognized-form-feminine-singular":"lucișora","definite-error-unrecognized-form-masculine-plural":"lucișorii","definite-error-unrecognized-form-feminine-neuter-plural":"lucișorele"}},{"word":"lucitor","pos":"adj","definitions":["shining"],"forms":{"feminine-singular":"lucitoare","masculine-plural":"lucitori","feminine-neuter-plural":"lucitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lucitor","error-unrecognized-form-feminine-indefinite-singular":"lucitoare","error-unrecognized-form-indefinite-masculine-plural":"lucitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"lucitoare","definite-error-unrecognized-form-masculine-neuter-singular":"lucitorul","definite-error-unrecognized-form-feminine-singular":"lucitoarea","definite-error-unrecognized-form-masculine-plural":"lucitorii","definite-error-unrecognized-form-feminine-neuter-plural":"lucitoarele"}},{"word":"Luciu","pos":"name","definitions":["a commune of Buzău County, Romania","a village in Luciu, Buzău County, Romania","a village in Gura Ialomiței, Ialomița County, Romania"],"gender":"m"},{"word":"luciu","pos":"noun","definitions":["brilliance, splendor, magnificence, glory"],"forms":{"plural":"luciuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"luciu","accusative-definite-nominative-singular":"luciul","accusative-indefinite-nominative-plural":"luciuri","accusative-definite-nominative-plural":"luciurile","dative-genitive-indefinite-singular":"luciu","dative-definite-genitive-singular":"luciului","dative-genitive-indefinite-plural":"luciuri","dative-definite-genitive-plural":"luciurilor","singular-vocative":"luciule","plural-vocative":"luciurilor"}},{"word":"lucoare","pos":"noun","definitions":["glow, glimmer, radiance, light"],"forms":{"plural":"lucori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lucoare","accusative-definite-nominative-singular":"lucoarea","accusative-indefinite-nominative-plural":"lucori","accusative-definite-nominative-plural":"lucorile","dative-genitive-indefinite-singular":"lucori","dative-definite-genitive-singular":"lucorii","dative-genitive-indefinite-plural":"lucori","dative-definite-genitive-plural":"lucorilor","singular-vocative":"lucoare","plural-vocative":"lucorilor"}},{"word":"lucra","pos":"verb","definitions":["to work"],"pronunciation":"/luˈkra/","examples":[{"ro":"Lucrez pentru o companie mare.","en":"I work for a big company."}],"forms":{"canonical":"a lucra 1st conjugation","present-singular-third-person":"lucrează","colloquial-present-singular-third-person":"lucră","participle-past":"lucrat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a lucra","gerund":"lucrând","first-person-indicative-present-singular":"lucrez","indicative-present-second-person-singular":"lucrezi","indicative-present-singular-third-person":"lucrează","first-person-indicative-plural-present":"lucrăm","indicative-plural-present-second-person":"lucrați","indicative-plural-present-third-person":"lucrează","first-person-imperfect-indicative-singular":"lucram","imperfect-indicative-second-person-singular":"lucrai","imperfect-indicative-singular-third-person":"lucra","first-person-imperfect-indicative-plural":"lucram","imperfect-indicative-plural-second-person":"lucrați","imperfect-indicative-plural-third-person":"lucrau","first-person-indicative-perfect-singular":"lucrai","indicative-perfect-second-person-singular":"lucrași","indicative-perfect-singular-third-person":"lucră","first-person-indicative-perfect-plural":"lucrarăm","indicative-perfect-plural-second-person":"lucrarăți","indicative-perfect-plural-third-person":"lucrară","first-person-indicative-pluperfect-singular":"lucrasem","indicative-pluperfect-second-person-singular":"lucraseși","indicative-pluperfect-singular-third-person":"lucrase","first-person-indicative-pluperfect-plural":"lucraserăm","indicative-pluperfect-plural-second-person":"lucraserăți","indicative-pluperfect-plural-third-person":"lucraseră","first-person-present-singular-subjunctive":"să lucrez","present-second-person-singular-subjunctive":"să lucrezi","present-singular-subjunctive-third-person":"să lucreze","first-person-plural-present-subjunctive":"să lucrăm","plural-present-second-person-subjunctive":"să lucrați","plural-present-subjunctive-third-person":"să lucreze","imperative-second-person-singular":"lucrează","imperative-plural-second-person":"lucrați","imperative-negative-second-person-singular":"nu lucra","imperative-negative-plural-second-person":"nu lucrați"}},{"word":"lucrabilitate","pos":"noun","definitions":["workability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"lucrabilitate","accusative-definite-nominative":"lucrabilitatea","dative-genitive-indefinite":"lucrabilități","dative-definite-genitive":"lucrabilității","vocative":"lucrabilitate"}},{"word":"lucrai","pos":"verb","definitions":["inflection of lucra:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[luˈkraj]"},{"word":"lucram","pos":"verb","definitions":["first-person singular/plural imperfect indicative of lucra"],"pronunciation":"[luˈkram]"},{"word":"lucrare","pos":"noun","definitions":["work, labor","a piece of written work, for example, an academic monograph or an essay","a test, exam"],"pronunciation":"/luˈkrare/","forms":{"canonical-feminine":"lucráre","plural":"lucrări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lucrare","accusative-definite-nominative-singular":"lucrarea","accusative-indefinite-nominative-plural":"lucrări","accusative-definite-nominative-plural":"lucrările","dative-genitive-indefinite-singular":"lucrări","dative-definite-genitive-singular":"lucrării","dative-genitive-indefinite-plural":"lucrări","dative-definite-genitive-plural":"lucrărilor","singular-vocative":"lucrare","plural-vocative":"lucrărilor"}},{"word":"lucrare de control","pos":"noun","definitions":["test (at school)"]},{"word":"lucrare de referință","pos":"noun","definitions":["reference work"],"forms":{"plural":"lucrări de referință"}},{"word":"lucraș","pos":"noun","definitions":["worker"],"forms":{"plural":"lucrași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lucraș","accusative-definite-nominative-singular":"lucrașul","accusative-indefinite-nominative-plural":"lucrași","accusative-definite-nominative-plural":"lucrașii","dative-genitive-indefinite-singular":"lucraș","dative-definite-genitive-singular":"lucrașului","dative-genitive-indefinite-plural":"lucrași","dative-definite-genitive-plural":"lucrașilor","singular-vocative":"lucrașule","plural-vocative":"lucrașilor"}},{"word":"lucrase","pos":"verb","definitions":["third-person singular pluperfect indicative of lucra"],"pronunciation":"[luˈkrase]"},{"word":"lucrat","pos":"adj","definitions":["worked"],"pronunciation":"/lu.ˈkrat/","forms":{"feminine-singular":"lucrată","masculine-plural":"lucrați","feminine-neuter-plural":"lucrate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lucrat","error-unrecognized-form-feminine-indefinite-singular":"lucrată","error-unrecognized-form-indefinite-masculine-plural":"lucrați","error-unrecognized-form-feminine-indefinite-neuter-plural":"lucrate","definite-error-unrecognized-form-masculine-neuter-singular":"lucratul","definite-error-unrecognized-form-feminine-singular":"lucrata","definite-error-unrecognized-form-masculine-plural":"lucrații","definite-error-unrecognized-form-feminine-neuter-plural":"lucratele"}},{"word":"lucrat","pos":"verb","definitions":["past participle of lucra"],"pronunciation":"/lu.ˈkrat/","forms":{"participle-past":"of lucra"}},{"word":"lucrățel","pos":"adj","definitions":["diminutive of lucra"],"forms":{"feminine-singular":"lucrățelă","masculine-plural":"lucrățeli","feminine-neuter-plural":"lucrățele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lucrățel","error-unrecognized-form-feminine-indefinite-singular":"lucrățelă","error-unrecognized-form-indefinite-masculine-plural":"lucrățeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"lucrățele","definite-error-unrecognized-form-masculine-neuter-singular":"lucrățelul","definite-error-unrecognized-form-feminine-singular":"lucrățela","definite-error-unrecognized-form-masculine-plural":"lucrățelii","definite-error-unrecognized-form-feminine-neuter-plural":"lucrățelele"}},{"word":"lucrați","pos":"adj","definitions":["masculine plural of lucrat"],"pronunciation":"/luˈkrat͡sʲ/","gender":"m-p"},{"word":"lucrați","pos":"verb","definitions":["inflection of lucra:","second-person plural present indicative/subjunctive","second-person plural imperfect indicative","second-person plural imperative"],"pronunciation":"/luˈkrat͡sʲ/"},{"word":"lucrativ","pos":"adj","definitions":["lucrative"],"forms":{"feminine-singular":"lucrativă","masculine-plural":"lucrativi","feminine-neuter-plural":"lucrative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lucrativ","error-unrecognized-form-feminine-indefinite-singular":"lucrativă","error-unrecognized-form-indefinite-masculine-plural":"lucrativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lucrative","definite-error-unrecognized-form-masculine-neuter-singular":"lucrativul","definite-error-unrecognized-form-feminine-singular":"lucrativa","definite-error-unrecognized-form-masculine-plural":"lucrativii","definite-error-unrecognized-form-feminine-neuter-plural":"lucrativele"}},{"word":"lucrătoare","pos":"noun","definitions":["female equivalent of lucrător"],"pronunciation":"/lu.krəˈto̯a.re/","forms":{"plural":"lucrătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"lucrătoare","accusative-definite-nominative-singular":"lucrătoarea","accusative-indefinite-nominative-plural":"lucrătoare","accusative-definite-nominative-plural":"lucrătoarele","dative-genitive-indefinite-singular":"lucrătoare","dative-definite-genitive-singular":"lucrătoarei","dative-genitive-indefinite-plural":"lucrătoare","dative-definite-genitive-plural":"lucrătoarelor","singular-vocative":"lucrătoare","plural-vocative":"lucrătoarelor"}},{"word":"lucrător","pos":"noun","definitions":["worker"],"pronunciation":"/ˌlu.krəˈtor/","forms":{"plural":"lucrători","feminine":"equivalent lucrătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lucrător","accusative-definite-nominative-singular":"lucrătorul","accusative-indefinite-nominative-plural":"lucrători","accusative-definite-nominative-plural":"lucrătorii","dative-genitive-indefinite-singular":"lucrător","dative-definite-genitive-singular":"lucrătorului","dative-genitive-indefinite-plural":"lucrători","dative-definite-genitive-plural":"lucrătorilor","singular-vocative":"lucrătorule","plural-vocative":"lucrătorilor"}},{"word":"lucrător","pos":"adj","definitions":["working, diligent, industrious, active"],"pronunciation":"/ˌlu.krəˈtor/","forms":{"feminine-singular":"lucrătoare","masculine-plural":"lucrători","feminine-neuter-plural":"lucrătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lucrător","error-unrecognized-form-feminine-indefinite-singular":"lucrătoare","error-unrecognized-form-indefinite-masculine-plural":"lucrători","error-unrecognized-form-feminine-indefinite-neuter-plural":"lucrătoare","definite-error-unrecognized-form-masculine-neuter-singular":"lucrătorul","definite-error-unrecognized-form-feminine-singular":"lucrătoarea","definite-error-unrecognized-form-masculine-plural":"lucrătorii","definite-error-unrecognized-form-feminine-neuter-plural":"lucrătoarele"}},{"word":"lucrători","pos":"noun","definitions":["plural of lucrător"]},{"word":"lucrătorie","pos":"noun","definitions":["workshop"],"forms":{"plural":"lucrătorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lucrătorie","accusative-definite-nominative-singular":"lucrătoria","accusative-indefinite-nominative-plural":"lucrătorii","accusative-definite-nominative-plural":"lucrătoriile","dative-genitive-indefinite-singular":"lucrătorii","dative-definite-genitive-singular":"lucrătoriei","dative-genitive-indefinite-plural":"lucrătorii","dative-definite-genitive-plural":"lucrătoriilor","singular-vocative":"lucrătorie","plural-vocative":"lucrătoriilor"}},{"word":"lucrătură","pos":"noun","definitions":["workmanship"],"forms":{"plural":"lucrături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lucrătură","accusative-definite-nominative-singular":"lucrătura","accusative-indefinite-nominative-plural":"lucrături","accusative-definite-nominative-plural":"lucrăturile","dative-genitive-indefinite-singular":"lucrături","dative-definite-genitive-singular":"lucrăturii","dative-genitive-indefinite-plural":"lucrături","dative-definite-genitive-plural":"lucrăturilor","singular-vocative":"lucrătură","plural-vocative":"lucrăturilor"}},{"word":"lucrez","pos":"verb","definitions":["first-person singular present indicative of lucra","first-person singular present subjunctive of lucra"],"pronunciation":"[luˈkrez]","examples":[{"ro":"lucrez la spital","en":"I work at the hospital"},{"ro":"am să lucrez șase ori mâine","en":"I'm going to work for 6 hours tomorrow."}]},{"word":"lucreze","pos":"verb","definitions":["third-person singular/plural present subjunctive of lucra"],"pronunciation":"[luˈkreze]"},{"word":"lucrișor","pos":"noun","definitions":["diminutive of lucru"],"forms":{"plural":"lucrișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lucrișor","accusative-definite-nominative-singular":"lucrișorul","accusative-indefinite-nominative-plural":"lucrișoare","accusative-definite-nominative-plural":"lucrișoarele","dative-genitive-indefinite-singular":"lucrișor","dative-definite-genitive-singular":"lucrișorului","dative-genitive-indefinite-plural":"lucrișoare","dative-definite-genitive-plural":"lucrișoarelor","singular-vocative":"lucrișorule","plural-vocative":"lucrișoarelor"}},{"word":"lucru","pos":"noun","definitions":["thing; object","work, problem, action","belongings"],"pronunciation":"[ˈlukru]","examples":[{"ro":"lucrurile mele","en":"my things; my belongings"}],"forms":{"plural":"lucruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lucru","accusative-definite-nominative-singular":"lucrul","accusative-indefinite-nominative-plural":"lucruri","accusative-definite-nominative-plural":"lucrurile","dative-genitive-indefinite-singular":"lucru","dative-definite-genitive-singular":"lucrului","dative-genitive-indefinite-plural":"lucruri","dative-definite-genitive-plural":"lucrurilor","singular-vocative":"lucrule","plural-vocative":"lucrurilor"}},{"word":"lucru mecanic","pos":"noun","definitions":["work"]},{"word":"lucrul","pos":"noun","definitions":["definite nominative/accusative singular of lucru"],"pronunciation":"/ˈlukrul/","gender":"n"},{"word":"lucruleț","pos":"noun","definitions":["diminutive of lucru"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lucruleț","accusative-definite-nominative":"lucrulețul","dative-genitive-indefinite":"lucruleț","dative-definite-genitive":"lucrulețului","vocative":"lucrulețule"}},{"word":"lucrului","pos":"noun","definitions":["definite genitive/dative singular of lucru"],"pronunciation":"[ˈlukruluj]","gender":"n"},{"word":"lucruri","pos":"noun","definitions":["plural of lucru"],"pronunciation":"/ˈlu.krurʲ/","gender":"n-p"},{"word":"lucrurile","pos":"noun","definitions":["definite nominative/accusative plural of lucru"],"pronunciation":"[ˈlukrurile]","gender":"n-p"},{"word":"lucrurilor","pos":"noun","definitions":["definite genitive/dative plural of lucru"],"pronunciation":"[ˈlukrurilor]","gender":"n-p"},{"word":"lucrușor","pos":"noun","definitions":["diminutive of lucru; little thing, object"],"pronunciation":"/lu.kruˈʃor/","forms":{"plural":"lucrușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lucrușor","accusative-definite-nominative-singular":"lucrușorul","accusative-indefinite-nominative-plural":"lucrușoare","accusative-definite-nominative-plural":"lucrușoarele","dative-genitive-indefinite-singular":"lucrușor","dative-definite-genitive-singular":"lucrușorului","dative-genitive-indefinite-plural":"lucrușoare","dative-definite-genitive-plural":"lucrușoarelor","singular-vocative":"lucrușorule","plural-vocative":"lucrușoarelor"}},{"word":"lucruț","pos":"noun","definitions":["diminutive of lucru"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lucruț","accusative-definite-nominative":"lucruțul","dative-genitive-indefinite":"lucruț","dative-definite-genitive":"lucruțului","vocative":"lucruțule"}},{"word":"Lucșoara","pos":"name","definitions":["a river in Sălaj, Romania, tributary to the Valea Mare"],"gender":"f"},{"word":"luctuos","pos":"adj","definitions":["sorrowful"],"forms":{"feminine-singular":"luctuoasă","masculine-plural":"luctuoși","feminine-neuter-plural":"luctuoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"luctuos","error-unrecognized-form-feminine-indefinite-singular":"luctuoasă","error-unrecognized-form-indefinite-masculine-plural":"luctuoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"luctuoase","definite-error-unrecognized-form-masculine-neuter-singular":"luctuosul","definite-error-unrecognized-form-feminine-singular":"luctuoasa","definite-error-unrecognized-form-masculine-plural":"luctuoșii","definite-error-unrecognized-form-feminine-neuter-plural":"luctuoasele"}},{"word":"Luculescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Luculescu"}},{"word":"Ludăneasca","pos":"name","definitions":["a village in Răsmirești, Teleorman County, Romania"],"gender":"f"},{"word":"Ludași","pos":"name","definitions":["a village in Balcani, Bacău County, Romania"],"gender":"m"},{"word":"luddism","pos":"noun","definitions":["Luddism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"luddism","accusative-definite-nominative-singular":"luddismul","accusative-indefinite-nominative-plural":"luddisme","accusative-definite-nominative-plural":"luddismele","dative-genitive-indefinite-singular":"luddism","dative-definite-genitive-singular":"luddismului","dative-genitive-indefinite-plural":"luddisme","dative-definite-genitive-plural":"luddismelor","singular-vocative":"luddismule","plural-vocative":"luddismelor"}},{"word":"luddit","pos":"noun","definitions":["Luddite"],"forms":{"plural":"luddiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"luddit","accusative-definite-nominative-singular":"ludditul","accusative-indefinite-nominative-plural":"luddiți","accusative-definite-nominative-plural":"luddiții","dative-genitive-indefinite-singular":"luddit","dative-definite-genitive-singular":"ludditului","dative-genitive-indefinite-plural":"luddiți","dative-definite-genitive-plural":"luddiților","singular-vocative":"ludditule","plural-vocative":"luddiților"}},{"word":"luddită","pos":"noun","definitions":["female equivalent of luddit"],"forms":{"plural":"luddite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luddită","accusative-definite-nominative-singular":"luddita","accusative-indefinite-nominative-plural":"luddite","accusative-definite-nominative-plural":"ludditele","dative-genitive-indefinite-singular":"luddite","dative-definite-genitive-singular":"ludditei","dative-genitive-indefinite-plural":"luddite","dative-definite-genitive-plural":"ludditelor","singular-vocative":"luddită","plural-vocative":"ludditelor"}}];
@@ -0,0 +1 @@
+export default [{"word":"lude","pos":"noun","definitions":["alternative form of liude"],"forms":{"plural":"luzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lude","accusative-definite-nominative-singular":"ludeul","accusative-indefinite-nominative-plural":"luzi","accusative-definite-nominative-plural":"luzii","dative-genitive-indefinite-singular":"lude","dative-definite-genitive-singular":"ludeului","dative-genitive-indefinite-plural":"luzi","dative-definite-genitive-plural":"luzilor","singular-vocative":"ludeule","plural-vocative":"luzilor"}},{"word":"Ludești","pos":"name","definitions":["a commune of Dâmbovița County, Romania","a village in Ludești, Dâmbovița County, Romania"],"gender":"m"},{"word":"Ludeștii de Jos","pos":"name","definitions":["a village in Orăștioara de Sus, Hunedoara County, Romania"],"gender":"m"},{"word":"Ludeștii de Sus","pos":"name","definitions":["a village in Orăștioara de Sus, Hunedoara County, Romania"],"gender":"m"},{"word":"ludic","pos":"adj","definitions":["playful"],"forms":{"feminine-singular":"ludică","masculine-plural":"ludici","feminine-neuter-plural":"ludice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ludic","error-unrecognized-form-feminine-indefinite-singular":"ludică","error-unrecognized-form-indefinite-masculine-plural":"ludici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ludice","definite-error-unrecognized-form-masculine-neuter-singular":"ludicul","definite-error-unrecognized-form-feminine-singular":"ludica","definite-error-unrecognized-form-masculine-plural":"ludicii","definite-error-unrecognized-form-feminine-neuter-plural":"ludicele"}},{"word":"Ludișor","pos":"name","definitions":["a village in Voila, Brașov County, Romania"],"gender":"m"},{"word":"ludișor","pos":"adj","definitions":["diminutive of lud"],"forms":{"feminine-singular":"ludișoră","masculine-plural":"ludișori","feminine-neuter-plural":"ludișore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ludișor","error-unrecognized-form-feminine-indefinite-singular":"ludișoră","error-unrecognized-form-indefinite-masculine-plural":"ludișori","error-unrecognized-form-feminine-indefinite-neuter-plural":"ludișore","definite-error-unrecognized-form-masculine-neuter-singular":"ludișorul","definite-error-unrecognized-form-feminine-singular":"ludișora","definite-error-unrecognized-form-masculine-plural":"ludișorii","definite-error-unrecognized-form-feminine-neuter-plural":"ludișorele"}},{"word":"Ludișoru","pos":"name","definitions":["a river in Argeș, Romania, tributary to the Zârna"],"gender":"m"},{"word":"Ludoș","pos":"name","definitions":["a commune of Sibiu County, Romania","a village in Ludoș, Sibiu County, Romania"],"gender":"m"},{"word":"Ludoșan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ludoșan"}},{"word":"Ludoșanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ludoșanu"}},{"word":"Ludoșean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ludoșean"}},{"word":"ludotecă","pos":"noun","definitions":["toy library"],"forms":{"plural":"ludoteci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ludotecă","accusative-definite-nominative-singular":"ludoteca","accusative-indefinite-nominative-plural":"ludoteci","accusative-definite-nominative-plural":"ludotecile","dative-genitive-indefinite-singular":"ludoteci","dative-definite-genitive-singular":"ludotecii","dative-genitive-indefinite-plural":"ludoteci","dative-definite-genitive-plural":"ludotecilor","singular-vocative":"ludotecă","plural-vocative":"ludotecilor"}},{"word":"Ludovic","pos":"name","definitions":["a male given name from Latin"],"gender":"m"},{"word":"ludovic","pos":"noun","definitions":["a louis d'or"],"forms":{"plural":"ludovici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ludovic","accusative-definite-nominative-singular":"ludovicul","accusative-indefinite-nominative-plural":"ludovici","accusative-definite-nominative-plural":"ludovicii","dative-genitive-indefinite-singular":"ludovic","dative-definite-genitive-singular":"ludovicului","dative-genitive-indefinite-plural":"ludovici","dative-definite-genitive-plural":"ludovicilor","singular-vocative":"ludovicule","plural-vocative":"ludovicilor"}},{"word":"Ludu","pos":"name","definitions":["a village in Ponoarele, Mehedinți County, Romania"],"gender":"m"},{"word":"Luduș","pos":"name","definitions":["a city in Mureș County, Romania"],"gender":"m"},{"word":"Ludușan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ludușan"}},{"word":"lues","pos":"noun","definitions":["syphilis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lues","accusative-definite-nominative":"luesul","dative-genitive-indefinite":"lues","dative-definite-genitive":"luesului","vocative":"luesule"}},{"word":"Lueta","pos":"name","definitions":["a commune of Harghita County, Romania","a village in Lueta, Harghita County, Romania"],"gender":"f"},{"word":"luetă","pos":"noun","definitions":["lueta"],"forms":{"plural":"luete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luetă","accusative-definite-nominative-singular":"lueta","accusative-indefinite-nominative-plural":"luete","accusative-definite-nominative-plural":"luetele","dative-genitive-indefinite-singular":"luete","dative-definite-genitive-singular":"luetei","dative-genitive-indefinite-plural":"luete","dative-definite-genitive-plural":"luetelor","singular-vocative":"luetă","plural-vocative":"luetelor"}},{"word":"luetic","pos":"noun","definitions":["syphilitic"],"forms":{"plural":"luetici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"luetic","accusative-definite-nominative-singular":"lueticul","accusative-indefinite-nominative-plural":"luetici","accusative-definite-nominative-plural":"lueticii","dative-genitive-indefinite-singular":"luetic","dative-definite-genitive-singular":"lueticului","dative-genitive-indefinite-plural":"luetici","dative-definite-genitive-plural":"lueticilor","singular-vocative":"lueticule","plural-vocative":"lueticilor"}},{"word":"luetică","pos":"noun","definitions":["female equivalent of luetic"],"forms":{"plural":"luetice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luetică","accusative-definite-nominative-singular":"luetica","accusative-indefinite-nominative-plural":"luetice","accusative-definite-nominative-plural":"lueticele","dative-genitive-indefinite-singular":"luetice","dative-definite-genitive-singular":"lueticei","dative-genitive-indefinite-plural":"luetice","dative-definite-genitive-plural":"lueticelor","singular-vocative":"luetică","plural-vocative":"lueticelor"}},{"word":"lufă","pos":"noun","definitions":["loofah"],"forms":{"plural":"lufe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lufă","accusative-definite-nominative-singular":"lufa","accusative-indefinite-nominative-plural":"lufe","accusative-definite-nominative-plural":"lufele","dative-genitive-indefinite-singular":"lufe","dative-definite-genitive-singular":"lufei","dative-genitive-indefinite-plural":"lufe","dative-definite-genitive-plural":"lufelor","singular-vocative":"lufă","plural-vocative":"lufelor"}},{"word":"lufar","pos":"noun","definitions":["bluefish (Pomatomus saltatrix)"],"forms":{"plural":"lufari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lufar","accusative-definite-nominative-singular":"lufarul","accusative-indefinite-nominative-plural":"lufari","accusative-definite-nominative-plural":"lufarii","dative-genitive-indefinite-singular":"lufar","dative-definite-genitive-singular":"lufarului","dative-genitive-indefinite-plural":"lufari","dative-definite-genitive-plural":"lufarilor","singular-vocative":"lufarule","plural-vocative":"lufarilor"}},{"word":"Lugașu de Jos","pos":"name","definitions":["a commune of Bihor County, Romania","a village in Lugașu de Jos, Bihor County, Romania"],"gender":"m"},{"word":"Lugașu de Sus","pos":"name","definitions":["a village in Lugașu de Jos, Bihor County, Romania"],"gender":"m"},{"word":"Lugoj","pos":"name","definitions":["a city in Timiș County, Romania"],"pronunciation":"/ˈluɡoʒ/","gender":"n","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"Lugoj","accusative-definite-nominative":"Lugojul","dative-genitive-indefinite":"Lugoj","dative-definite-genitive":"Lugojului","vocative":"Lugojule"}},{"word":"Lugojan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lugojan"}},{"word":"Lugojanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lugojanu"}},{"word":"lugojean","pos":"noun","definitions":["native or inhabitant of the city of Lugoj, Timiș County, Romania (usually male)"],"forms":{"plural":"lugojeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lugojean","accusative-definite-nominative-singular":"lugojeanul","accusative-indefinite-nominative-plural":"lugojeni","accusative-definite-nominative-plural":"lugojenii","dative-genitive-indefinite-singular":"lugojean","dative-definite-genitive-singular":"lugojeanului","dative-genitive-indefinite-plural":"lugojeni","dative-definite-genitive-plural":"lugojenilor","singular-vocative":"lugojeanule","plural-vocative":"lugojenilor"}},{"word":"lugojeană","pos":"noun","definitions":["female equivalent of lugojean"],"forms":{"plural":"lugojene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lugojeană","accusative-definite-nominative-singular":"lugojeana","accusative-indefinite-nominative-plural":"lugojene","accusative-definite-nominative-plural":"lugojenele","dative-genitive-indefinite-singular":"lugojene","dative-definite-genitive-singular":"lugojenei","dative-genitive-indefinite-plural":"lugojene","dative-definite-genitive-plural":"lugojenelor","singular-vocative":"lugojeană","plural-vocative":"lugojenelor"}},{"word":"lugojeancă","pos":"noun","definitions":["female equivalent of lugojean"],"forms":{"plural":"lugojence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lugojeancă","accusative-definite-nominative-singular":"lugojeanca","accusative-indefinite-nominative-plural":"lugojence","accusative-definite-nominative-plural":"lugojencele","dative-genitive-indefinite-singular":"lugojence","dative-definite-genitive-singular":"lugojencei","dative-genitive-indefinite-plural":"lugojence","dative-definite-genitive-plural":"lugojencelor","singular-vocative":"lugojeancă","plural-vocative":"lugojencelor"}},{"word":"Lugojel","pos":"name","definitions":["a village in Gavojdia, Timiș County, Romania"],"gender":"m"},{"word":"lugol","pos":"noun","definitions":["an antiseptic solution of iodine and potassium iodide"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lugol","accusative-definite-nominative":"lugolul","dative-genitive-indefinite":"lugol","dative-definite-genitive":"lugolului","vocative":"lugolule"}},{"word":"Lugovoe","pos":"name","definitions":["a village in Regina Maria, Soroca Raion, Moldova"],"gender":"m"},{"word":"lugubru","pos":"adj","definitions":["lugubrious"],"pronunciation":"/luˈɡubru/","forms":{"feminine-singular":"lugubră","masculine-plural":"lugubri","feminine-neuter-plural":"lugubre","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lugubru","error-unrecognized-form-feminine-indefinite-singular":"lugubră","error-unrecognized-form-indefinite-masculine-plural":"lugubri","error-unrecognized-form-feminine-indefinite-neuter-plural":"lugubre","definite-error-unrecognized-form-masculine-neuter-singular":"lugubrul","definite-error-unrecognized-form-feminine-singular":"lugubra","definite-error-unrecognized-form-masculine-plural":"lugubrii","definite-error-unrecognized-form-feminine-neuter-plural":"lugubrele"}},{"word":"Luguzău","pos":"name","definitions":["a village in Șilindia, Arad County, Romania"],"gender":"m"},{"word":"luhăr","pos":"noun","definitions":["clover"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"luhăr","accusative-definite-nominative":"luhărul","dative-genitive-indefinite":"luhăr","dative-definite-genitive":"luhărului","vocative":"luhărule"}},{"word":"luheriște","pos":"noun","definitions":["clover field"],"forms":{"plural":"luheriști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"luheriște","accusative-definite-nominative-singular":"luheriștea","accusative-indefinite-nominative-plural":"luheriști","accusative-definite-nominative-plural":"luheriștile","dative-genitive-indefinite-singular":"luheriști","dative-definite-genitive-singular":"luheriștii","dative-genitive-indefinite-plural":"luheriști","dative-definite-genitive-plural":"luheriștilor","singular-vocative":"luheriște","plural-vocative":"luheriștilor"}},{"word":"lui","pos":"pron","definitions":["his"],"pronunciation":"/luj/","gender":"m","examples":[{"ro":"Au ceasul lui?","en":"Do they have his watch?"}],"forms":{"feminine":"equivalent ei","plural":"lor","alternative-informal":"lu'","alternative":"луй"}},{"word":"lui","pos":"pron","definitions":["to him"],"pronunciation":"/luj/","gender":"m","forms":{"feminine":"equivalent ei","plural":"lor","alternative-informal":"lu'","alternative":"луй"}},{"word":"lui","pos":"article","definitions":["genitive/dative article for proper names designating people that morphologically don't permit a suffix"],"pronunciation":"/luj/","examples":[{"ro":"Casa lui Carmen.","en":"Carmen's house."},{"ro":"Asta nu-i place lui Bogdan.","en":"Bogdan doesn't like this."}],"forms":{"alternative-informal":"lu'","alternative":"луй"}},{"word":"luică","pos":"noun","definitions":["cradle"],"forms":{"plural":"luici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"luică","accusative-definite-nominative-singular":"luica","accusative-indefinite-nominative-plural":"luici","accusative-definite-nominative-plural":"luicile","dative-genitive-indefinite-singular":"luici","dative-definite-genitive-singular":"luicii","dative-genitive-indefinite-plural":"luici","dative-definite-genitive-plural":"luicilor","singular-vocative":"luică","plural-vocative":"luicilor"}},{"word":"Luizi-Călugăra","pos":"name","definitions":["a commune of Bacău County, Romania","a village in Luizi-Călugăra, Bacău County, Romania"],"gender":"f"},{"word":"lujer","pos":"noun","definitions":["stalk"],"forms":{"plural":"lujeri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lujer","accusative-definite-nominative-singular":"lujerul","accusative-indefinite-nominative-plural":"lujeri","accusative-definite-nominative-plural":"lujerii","dative-genitive-indefinite-singular":"lujer","dative-definite-genitive-singular":"lujerului","dative-genitive-indefinite-plural":"lujeri","dative-definite-genitive-plural":"lujerilor","singular-vocative":"lujerule","plural-vocative":"lujerilor"}},{"word":"Lujerdiu","pos":"name","definitions":["a village in Cornești, Cluj County, Romania"],"gender":"m"},{"word":"lujerel","pos":"noun","definitions":["diminutive of lujer"],"forms":{"plural":"lujerei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lujerel","accusative-definite-nominative-singular":"lujerelul","accusative-indefinite-nominative-plural":"lujerei","accusative-definite-nominative-plural":"lujereii","dative-genitive-indefinite-singular":"lujerel","dative-definite-genitive-singular":"lujerelului","dative-genitive-indefinite-plural":"lujerei","dative-definite-genitive-plural":"lujereilor","singular-vocative":"lujerelule","plural-vocative":"lujereilor"}},{"word":"lulă","pos":"noun","definitions":["tobacco pipe"],"forms":{"plural":"lule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lulă","accusative-definite-nominative-singular":"lula","accusative-indefinite-nominative-plural":"lule","accusative-definite-nominative-plural":"lulele","dative-genitive-indefinite-singular":"lule","dative-definite-genitive-singular":"lulei","dative-genitive-indefinite-plural":"lule","dative-definite-genitive-plural":"lulelor","singular-vocative":"lulă","plural-vocative":"lulelor"}},{"word":"lulea","pos":"noun","definitions":["pipe (for smoking)"],"forms":{"plural":"lulele","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"lulea","accusative-definite-nominative-singular":"luleaua","accusative-indefinite-nominative-plural":"lulele","accusative-definite-nominative-plural":"lulelele","dative-genitive-indefinite-singular":"lulele","dative-definite-genitive-singular":"lulelei","dative-genitive-indefinite-plural":"lulele","dative-definite-genitive-plural":"lulelelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"luleaua turcului","pos":"noun","definitions":["trumpet vine (Campsis radicans)"]},{"word":"lulegiu","pos":"noun","definitions":["pipe seller"],"forms":{"plural":"lulegii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lulegiu","accusative-definite-nominative-singular":"lulegiuul","accusative-indefinite-nominative-plural":"lulegii","accusative-definite-nominative-plural":"lulegiii","dative-genitive-indefinite-singular":"lulegiu","dative-definite-genitive-singular":"lulegiuului","dative-genitive-indefinite-plural":"lulegii","dative-definite-genitive-plural":"lulegiilor","singular-vocative":"lulegiuule","plural-vocative":"lulegiilor"}},{"word":"lulelușă","pos":"noun","definitions":["diminutive of lulea"],"forms":{"plural":"lulelușe","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lulelușă","accusative-definite-nominative-singular":"lulelușăul","accusative-indefinite-nominative-plural":"lulelușe","accusative-definite-nominative-plural":"lulelușei","dative-genitive-indefinite-singular":"lulelușă","dative-definite-genitive-singular":"lulelușăului","dative-genitive-indefinite-plural":"lulelușe","dative-definite-genitive-plural":"lulelușelor","singular-vocative":"lulelușăule","plural-vocative":"lulelușelor"}},{"word":"luleluță","pos":"noun","definitions":["diminutive of lulea"],"forms":{"plural":"luleluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luleluță","accusative-definite-nominative-singular":"luleluța","accusative-indefinite-nominative-plural":"luleluțe","accusative-definite-nominative-plural":"luleluțele","dative-genitive-indefinite-singular":"luleluțe","dative-definite-genitive-singular":"luleluței","dative-genitive-indefinite-plural":"luleluțe","dative-definite-genitive-plural":"luleluțelor","singular-vocative":"luleluță","plural-vocative":"luleluțelor"}},{"word":"Lulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lulescu"}},{"word":"luleușă","pos":"noun","definitions":["diminutive of lulea"],"forms":{"plural":"luleușe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luleușă","accusative-definite-nominative-singular":"luleușa","accusative-indefinite-nominative-plural":"luleușe","accusative-definite-nominative-plural":"luleușele","dative-genitive-indefinite-singular":"luleușe","dative-definite-genitive-singular":"luleușei","dative-genitive-indefinite-plural":"luleușe","dative-definite-genitive-plural":"luleușelor","singular-vocative":"luleușă","plural-vocative":"luleușelor"}},{"word":"luludie","pos":"noun","definitions":["flower"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"luludie","accusative-definite-nominative":"luludia","dative-genitive-indefinite":"luludii","dative-definite-genitive":"luludiei","vocative":"luludie"}},{"word":"lumânărar","pos":"noun","definitions":["candlemaker"],"forms":{"plural":"lumânărari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lumânărar","accusative-definite-nominative-singular":"lumânărarul","accusative-indefinite-nominative-plural":"lumânărari","accusative-definite-nominative-plural":"lumânărarii","dative-genitive-indefinite-singular":"lumânărar","dative-definite-genitive-singular":"lumânărarului","dative-genitive-indefinite-plural":"lumânărari","dative-definite-genitive-plural":"lumânărarilor","singular-vocative":"lumânărarule","plural-vocative":"lumânărarilor"}},{"word":"lumânărăreasă","pos":"noun","definitions":["female equivalent of lumânărar"],"forms":{"plural":"lumânărărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lumânărăreasă","accusative-definite-nominative-singular":"lumânărăreasa","accusative-indefinite-nominative-plural":"lumânărărese","accusative-definite-nominative-plural":"lumânărăresele","dative-genitive-indefinite-singular":"lumânărărese","dative-definite-genitive-singular":"lumânărăresei","dative-genitive-indefinite-plural":"lumânărărese","dative-definite-genitive-plural":"lumânărăreselor","singular-vocative":"lumânărăreasă","plural-vocative":"lumânărăreselor"}},{"word":"lumânărărie","pos":"noun","definitions":["candle shop"],"forms":{"plural":"lumânărării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lumânărărie","accusative-definite-nominative-singular":"lumânărăria","accusative-indefinite-nominative-plural":"lumânărării","accusative-definite-nominative-plural":"lumânărăriile","dative-genitive-indefinite-singular":"lumânărării","dative-definite-genitive-singular":"lumânărăriei","dative-genitive-indefinite-plural":"lumânărării","dative-definite-genitive-plural":"lumânărăriilor","singular-vocative":"lumânărărie","plural-vocative":"lumânărăriilor"}},{"word":"Lumânare","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lumânare"}},{"word":"lumânare","pos":"noun","definitions":["candle"],"pronunciation":"/lu.mɨˈna.re/","forms":{"plural":"lumânări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lumânare","accusative-definite-nominative-singular":"lumânarea","accusative-indefinite-nominative-plural":"lumânări","accusative-definite-nominative-plural":"lumânările","dative-genitive-indefinite-singular":"lumânări","dative-definite-genitive-singular":"lumânării","dative-genitive-indefinite-plural":"lumânări","dative-definite-genitive-plural":"lumânărilor","singular-vocative":"lumânare","plural-vocative":"lumânărilor","alternative-archaic":"lumînare"}},{"word":"lumânărea","pos":"noun","definitions":["diminutive of lumânare"],"forms":{"plural":"lumânărele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"lumânărea","accusative-definite-nominative-singular":"lumânăreaua","accusative-indefinite-nominative-plural":"lumânărele","accusative-definite-nominative-plural":"lumânărelele","dative-genitive-indefinite-singular":"lumânărele","dative-definite-genitive-singular":"lumânărelei","dative-genitive-indefinite-plural":"lumânărele","dative-definite-genitive-plural":"lumânărelelor","singular-vocative":"lumânărea","plural-vocative":"lumânărelelor"}},{"word":"lumânărică","pos":"noun","definitions":["diminutive of lumânare; small candle"],"forms":{"plural":"lumânărele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lumânărică","accusative-definite-nominative-singular":"lumânărica","accusative-indefinite-nominative-plural":"lumânărice","accusative-definite-nominative-plural":"lumânăricele","dative-genitive-indefinite-singular":"lumânărice","dative-definite-genitive-singular":"lumânăricei","dative-genitive-indefinite-plural":"lumânărice","dative-definite-genitive-plural":"lumânăricelor","singular-vocative":"lumânărică","plural-vocative":"lumânăricelor"}},{"word":"lumânărie","pos":"noun","definitions":["candle shop"],"forms":{"plural":"lumânării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lumânărie","accusative-definite-nominative-singular":"lumânăria","accusative-indefinite-nominative-plural":"lumânării","accusative-definite-nominative-plural":"lumânăriile","dative-genitive-indefinite-singular":"lumânării","dative-definite-genitive-singular":"lumânăriei","dative-genitive-indefinite-plural":"lumânării","dative-definite-genitive-plural":"lumânăriilor","singular-vocative":"lumânărie","plural-vocative":"lumânăriilor"}},{"word":"lumânărioară","pos":"noun","definitions":["diminutive of lumânare"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lumânărioară","accusative-definite-nominative":"lumânărioara","dative-genitive-indefinite":"lumânărioare","dative-definite-genitive":"lumânărioarei","vocative":"lumânărioară"}},{"word":"lumașel","pos":"noun","definitions":["lumachel"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lumașel","accusative-definite-nominative":"lumașelul","dative-genitive-indefinite":"lumașel","dative-definite-genitive":"lumașelului","vocative":"lumașelule"}},{"word":"lumbago","pos":"noun","definitions":["lumbago"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lumbago","accusative-definite-nominative":"lumbagoul","dative-genitive-indefinite":"lumbago","dative-definite-genitive":"lumbagoului","vocative":"lumbagoule"}},{"word":"lumbalgie","pos":"noun","definitions":["alternative form of lombalgie"],"forms":{"plural":"lumbalgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lumbalgie","accusative-definite-nominative-singular":"lumbalgia","accusative-indefinite-nominative-plural":"lumbalgii","accusative-definite-nominative-plural":"lumbalgiile","dative-genitive-indefinite-singular":"lumbalgii","dative-definite-genitive-singular":"lumbalgiei","dative-genitive-indefinite-plural":"lumbalgii","dative-definite-genitive-plural":"lumbalgiilor","singular-vocative":"lumbalgie","plural-vocative":"lumbalgiilor"}},{"word":"lumbi","pos":"noun","definitions":["loin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"lumbi","accusative-definite-nominative":"lumbii","dative-genitive-indefinite":"lumbi","dative-definite-genitive":"lumbilor","vocative":"lumbilor"}},{"word":"lume","pos":"noun","definitions":["world","people","humanity, mankind","light"],"pronunciation":"/ˈlu.me/","forms":{"plural":"lumi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lume","accusative-definite-nominative-singular":"lumea","accusative-indefinite-nominative-plural":"lumi","accusative-definite-nominative-plural":"lumile","dative-genitive-indefinite-singular":"lumi","dative-definite-genitive-singular":"lumii","dative-genitive-indefinite-plural":"lumi","dative-definite-genitive-plural":"lumilor","singular-vocative":"lume","plural-vocative":"lumilor"}},{"word":"lume anglofonă","pos":"noun","definitions":["Anglosphere"]},{"word":"lumea","pos":"noun","definitions":["definite nominative/accusative singular of lume"],"pronunciation":"/ˈlume̯a/"},{"word":"lumea cealaltă","pos":"noun","definitions":["other world, the afterlife"]},{"word":"lumea de apoi","pos":"noun","definitions":["afterlife"]},{"word":"lumen","pos":"noun","definitions":["lumen (SI unit of measurement)"],"forms":{"plural":"lumeni"}},{"word":"lumen","pos":"noun","definitions":["lumen"],"forms":{"plural":"lumene"}},{"word":"lumenmetru","pos":"noun","definitions":["lumenometer"],"forms":{"plural":"lumenmetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lumenmetru","accusative-definite-nominative-singular":"lumenmetrul","accusative-indefinite-nominative-plural":"lumenmetre","accusative-definite-nominative-plural":"lumenmetrele","dative-genitive-indefinite-singular":"lumenmetru","dative-definite-genitive-singular":"lumenmetrului","dative-genitive-indefinite-plural":"lumenmetre","dative-definite-genitive-plural":"lumenmetrelor","singular-vocative":"lumenmetrule","plural-vocative":"lumenmetrelor"}},{"word":"lumesc","pos":"adj","definitions":["mundane, worldly"],"forms":{"feminine-singular":"lumească","plural":"lumești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lumesc","error-unrecognized-form-feminine-indefinite-singular":"lumească","error-unrecognized-form-indefinite-masculine-plural":"lumești","error-unrecognized-form-feminine-indefinite-neuter-plural":"lumești","definite-error-unrecognized-form-masculine-neuter-singular":"lumescul","definite-error-unrecognized-form-feminine-singular":"lumeasca","definite-error-unrecognized-form-masculine-plural":"lumeștii","definite-error-unrecognized-form-feminine-neuter-plural":"lumeștile"}},{"word":"lumește","pos":"adv","definitions":["worldly"]},{"word":"lumeț","pos":"adj","definitions":["worldly"],"forms":{"feminine-singular":"lumeață","masculine-plural":"lumeți","feminine-neuter-plural":"lumețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lumeț","error-unrecognized-form-feminine-indefinite-singular":"lumeață","error-unrecognized-form-indefinite-masculine-plural":"lumeți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lumețe","definite-error-unrecognized-form-masculine-neuter-singular":"lumețul","definite-error-unrecognized-form-feminine-singular":"lumeața","definite-error-unrecognized-form-masculine-plural":"lumeții","definite-error-unrecognized-form-feminine-neuter-plural":"lumețele"}},{"word":"lumeție","pos":"noun","definitions":["worldliness"],"forms":{"plural":"lumeții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lumeție","accusative-definite-nominative-singular":"lumeția","accusative-indefinite-nominative-plural":"lumeții","accusative-definite-nominative-plural":"lumețiile","dative-genitive-indefinite-singular":"lumeții","dative-definite-genitive-singular":"lumeției","dative-genitive-indefinite-plural":"lumeții","dative-definite-genitive-plural":"lumețiilor","singular-vocative":"lumeție","plural-vocative":"lumețiilor"}},{"word":"lumi","pos":"noun","definitions":["inflection of lume:","plural","genitive/dative singular"],"pronunciation":"[lumʲ]"},{"word":"lumicică","pos":"noun","definitions":["diminutive of lume"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lumicică","accusative-definite-nominative":"lumicica","dative-genitive-indefinite":"lumicice","dative-definite-genitive":"lumicicei","vocative":"lumicică"}},{"word":"lumicios","pos":"adj","definitions":["worldly"],"forms":{"feminine-singular":"lumicioasă","masculine-plural":"lumicioși","feminine-neuter-plural":"lumicioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lumicios","error-unrecognized-form-feminine-indefinite-singular":"lumicioasă","error-unrecognized-form-indefinite-masculine-plural":"lumicioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lumicioase","definite-error-unrecognized-form-masculine-neuter-singular":"lumiciosul","definite-error-unrecognized-form-feminine-singular":"lumicioasa","definite-error-unrecognized-form-masculine-plural":"lumicioșii","definite-error-unrecognized-form-feminine-neuter-plural":"lumicioasele"}},{"word":"lumii","pos":"noun","definitions":["definite dative/genitive singular of lume"]},{"word":"lumile","pos":"noun","definitions":["definite nominative/accusative plural of lume"]},{"word":"lumilor","pos":"noun","definitions":["inflection of lume:","definite genitive/dative plural","vocative plural"]},{"word":"Lumina","pos":"name","definitions":["a commune of Constanța County, Romania","a village in Lumina, Constanța County, Romania"],"gender":"f"},{"word":"lumina","pos":"noun","definitions":["definite nominative/accusative singular of lumină"],"gender":"f"},{"word":"lumina","pos":"verb","definitions":["to light, to illuminate","to shine","to enlighten"],"forms":{"canonical":"a lumina 1st conjugation","present-singular-third-person":"luminează","participle-past":"luminat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a lumina","gerund":"luminând","first-person-indicative-present-singular":"luminez","indicative-present-second-person-singular":"luminezi","indicative-present-singular-third-person":"luminează","first-person-indicative-plural-present":"luminăm","indicative-plural-present-second-person":"luminați","indicative-plural-present-third-person":"luminează","first-person-imperfect-indicative-singular":"luminam","imperfect-indicative-second-person-singular":"luminai","imperfect-indicative-singular-third-person":"lumina","first-person-imperfect-indicative-plural":"luminam","imperfect-indicative-plural-second-person":"luminați","imperfect-indicative-plural-third-person":"luminau","first-person-indicative-perfect-singular":"luminai","indicative-perfect-second-person-singular":"luminași","indicative-perfect-singular-third-person":"lumină","first-person-indicative-perfect-plural":"luminarăm","indicative-perfect-plural-second-person":"luminarăți","indicative-perfect-plural-third-person":"luminară","first-person-indicative-pluperfect-singular":"luminasem","indicative-pluperfect-second-person-singular":"luminaseși","indicative-pluperfect-singular-third-person":"luminase","first-person-indicative-pluperfect-plural":"luminaserăm","indicative-pluperfect-plural-second-person":"luminaserăți","indicative-pluperfect-plural-third-person":"luminaseră","first-person-present-singular-subjunctive":"să luminez","present-second-person-singular-subjunctive":"să luminezi","present-singular-subjunctive-third-person":"să lumineze","first-person-plural-present-subjunctive":"să luminăm","plural-present-second-person-subjunctive":"să luminați","plural-present-subjunctive-third-person":"să lumineze","imperative-second-person-singular":"luminează","imperative-plural-second-person":"luminați","imperative-negative-second-person-singular":"nu lumina","imperative-negative-plural-second-person":"nu luminați"}},{"word":"lumină","pos":"noun","definitions":["light"],"pronunciation":"/luˈmi.nə/","forms":{"plural":"lumini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lumină","accusative-definite-nominative-singular":"lumina","accusative-indefinite-nominative-plural":"lumini","accusative-definite-nominative-plural":"luminile","dative-genitive-indefinite-singular":"lumini","dative-definite-genitive-singular":"luminii","dative-genitive-indefinite-plural":"lumini","dative-definite-genitive-plural":"luminilor","singular-vocative":"lumină","plural-vocative":"luminilor"}},{"word":"lumină albă","pos":"noun","definitions":["white light"]},{"word":"lumină antisolară","pos":"noun","definitions":["anticrepuscular ray"]},{"word":"lumină electrică","pos":"noun","definitions":["electric light"]},{"word":"lumină naturală","pos":"noun","definitions":["natural light"]},{"word":"lumină plan polarizată","pos":"noun","definitions":["plane polarized light"]},{"word":"lumină polarizată","pos":"noun","definitions":["polarized light"]},{"word":"lumina soarelui","pos":"noun","definitions":["sunlight, sunshine"]},{"word":"lumină vizibilă","pos":"noun","definitions":["visible light"]},{"word":"lumină zodiacală","pos":"noun","definitions":["zodiacal light"]},{"word":"luminăciune","pos":"noun","definitions":["illumination","(the act of) lighting, shining, illuminating","enlightening","a title of respect or exaltation used in older times"],"forms":{"plural":"luminăciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"luminăciune","accusative-definite-nominative-singular":"luminăciunea","accusative-indefinite-nominative-plural":"luminăciuni","accusative-definite-nominative-plural":"luminăciunile","dative-genitive-indefinite-singular":"luminăciuni","dative-definite-genitive-singular":"luminăciunii","dative-genitive-indefinite-plural":"luminăciuni","dative-definite-genitive-plural":"luminăciunilor","singular-vocative":"luminăciune","plural-vocative":"luminăciunilor"}},{"word":"luminal","pos":"noun","definitions":["luminal"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"luminal","accusative-definite-nominative":"luminalul","dative-genitive-indefinite":"luminal","dative-definite-genitive":"luminalului","vocative":"luminalule"}},{"word":"luminanță","pos":"noun","definitions":["luminance"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luminanță","accusative-definite-nominative-singular":"luminanța","accusative-indefinite-nominative-plural":"luminanțe","accusative-definite-nominative-plural":"luminanțele","dative-genitive-indefinite-singular":"luminanțe","dative-definite-genitive-singular":"luminanței","dative-genitive-indefinite-plural":"luminanțe","dative-definite-genitive-plural":"luminanțelor","singular-vocative":"luminanță","plural-vocative":"luminanțelor"}},{"word":"luminar","pos":"noun","definitions":["lamp"],"forms":{"plural":"luminare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"luminar","accusative-definite-nominative-singular":"luminarul","accusative-indefinite-nominative-plural":"luminare","accusative-definite-nominative-plural":"luminarele","dative-genitive-indefinite-singular":"luminar","dative-definite-genitive-singular":"luminarului","dative-genitive-indefinite-plural":"luminare","dative-definite-genitive-plural":"luminarelor","singular-vocative":"luminarule","plural-vocative":"luminarelor"}},{"word":"Lumînăraru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Lumînăraru"}},{"word":"luminare","pos":"noun","definitions":["act of lighting, illuminating, shining"],"forms":{"plural":"luminări"}},{"word":"Lumînare","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lumînare"}},{"word":"luminat","pos":"noun","definitions":["lighting"],"pronunciation":"[lumiˈnat]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"luminat","accusative-definite-nominative":"luminatul","dative-genitive-indefinite":"luminat","dative-definite-genitive":"luminatului","vocative":"luminatule"}},{"word":"luminat","pos":"verb","definitions":["past participle of lumina"],"pronunciation":"[lumiˈnat]","forms":{"participle-past":"of lumina"}},{"word":"luminație","pos":"noun","definitions":["lighting"],"forms":{"plural":"luminații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"luminație","accusative-definite-nominative-singular":"luminația","accusative-indefinite-nominative-plural":"luminații","accusative-definite-nominative-plural":"luminațiile","dative-genitive-indefinite-singular":"luminații","dative-definite-genitive-singular":"luminației","dative-genitive-indefinite-plural":"luminații","dative-definite-genitive-plural":"luminațiilor","singular-vocative":"luminație","plural-vocative":"luminațiilor"}},{"word":"luminăție","pos":"noun","definitions":["serenity"],"forms":{"plural":"luminății","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"luminăție","accusative-definite-nominative-singular":"luminăția","accusative-indefinite-nominative-plural":"luminății","accusative-definite-nominative-plural":"luminățiile","dative-genitive-indefinite-singular":"luminății","dative-definite-genitive-singular":"luminăției","dative-genitive-indefinite-plural":"luminății","dative-definite-genitive-plural":"luminățiilor","singular-vocative":"luminăție","plural-vocative":"luminățiilor"}},{"word":"luminator","pos":"noun","definitions":["skylight"],"forms":{"plural":"luminatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"luminator","accusative-definite-nominative-singular":"luminatorul","accusative-indefinite-nominative-plural":"luminatore","accusative-definite-nominative-plural":"luminatorele","dative-genitive-indefinite-singular":"luminator","dative-definite-genitive-singular":"luminatorului","dative-genitive-indefinite-plural":"luminatore","dative-definite-genitive-plural":"luminatorelor","singular-vocative":"luminatorule","plural-vocative":"luminatorelor"}},{"word":"luminător","pos":"noun","definitions":["alternative form of luminator"],"forms":{"plural":"luminătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"luminător","accusative-definite-nominative-singular":"luminătorul","accusative-indefinite-nominative-plural":"luminătoare","accusative-definite-nominative-plural":"luminătoarele","dative-genitive-indefinite-singular":"luminător","dative-definite-genitive-singular":"luminătorului","dative-genitive-indefinite-plural":"luminătoare","dative-definite-genitive-plural":"luminătoarelor","singular-vocative":"luminătorule","plural-vocative":"luminătoarelor"}},{"word":"luminătoriu","pos":"adj","definitions":["obsolete form of luminător"],"forms":{"feminine-singular":"luminătorie","plural":"luminătorii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"luminătoriu","error-unrecognized-form-feminine-indefinite-singular":"luminătorie","error-unrecognized-form-indefinite-masculine-plural":"luminătorii","error-unrecognized-form-feminine-indefinite-neuter-plural":"luminătorii","definite-error-unrecognized-form-masculine-neuter-singular":"luminătoriul","definite-error-unrecognized-form-feminine-singular":"luminătoria","definite-error-unrecognized-form-masculine-plural":"luminătoriii","definite-error-unrecognized-form-feminine-neuter-plural":"luminătoriile"}},{"word":"luminea","pos":"noun","definitions":["diminutive of lumină"],"forms":{"plural":"luminele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"luminea","accusative-definite-nominative-singular":"lumineaua","accusative-indefinite-nominative-plural":"luminele","accusative-definite-nominative-plural":"luminelele","dative-genitive-indefinite-singular":"luminele","dative-definite-genitive-singular":"luminelei","dative-genitive-indefinite-plural":"luminele","dative-definite-genitive-plural":"luminelelor","singular-vocative":"luminea","plural-vocative":"luminelelor"}},{"word":"luminescent","pos":"adj","definitions":["luminescent"],"forms":{"feminine-singular":"luminescentă","masculine-plural":"luminescenți","feminine-neuter-plural":"luminescente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"luminescent","error-unrecognized-form-feminine-indefinite-singular":"luminescentă","error-unrecognized-form-indefinite-masculine-plural":"luminescenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"luminescente","definite-error-unrecognized-form-masculine-neuter-singular":"luminescentul","definite-error-unrecognized-form-feminine-singular":"luminescenta","definite-error-unrecognized-form-masculine-plural":"luminescenții","definite-error-unrecognized-form-feminine-neuter-plural":"luminescentele"}},{"word":"luminescență","pos":"noun","definitions":["luminescence"],"forms":{"plural":"luminescențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luminescență","accusative-definite-nominative-singular":"luminescența","accusative-indefinite-nominative-plural":"luminescențe","accusative-definite-nominative-plural":"luminescențele","dative-genitive-indefinite-singular":"luminescențe","dative-definite-genitive-singular":"luminescenței","dative-genitive-indefinite-plural":"luminescențe","dative-definite-genitive-plural":"luminescențelor","singular-vocative":"luminescență","plural-vocative":"luminescențelor"}},{"word":"Luminești","pos":"name","definitions":["a village in Sohodol, Alba County, Romania"],"gender":"m"},{"word":"luminez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of lumina"]},{"word":"lumini","pos":"noun","definitions":["plural of lumină (“lights”)"],"pronunciation":"[luˈminʲ]","gender":"f-p"},{"word":"luminică","pos":"noun","definitions":["diminutive of lumină"],"forms":{"plural":"luminici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"luminică","accusative-definite-nominative-singular":"luminica","accusative-indefinite-nominative-plural":"luminici","accusative-definite-nominative-plural":"luminicile","dative-genitive-indefinite-singular":"luminici","dative-definite-genitive-singular":"luminicii","dative-genitive-indefinite-plural":"luminici","dative-definite-genitive-plural":"luminicilor","singular-vocative":"luminică","plural-vocative":"luminicilor"}},{"word":"luminicică","pos":"noun","definitions":["diminutive of lumină"],"forms":{"plural":"luminicicele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luminicică","accusative-definite-nominative-singular":"luminicica","accusative-indefinite-nominative-plural":"luminicicele","accusative-definite-nominative-plural":"luminicicelele","dative-genitive-indefinite-singular":"luminicicele","dative-definite-genitive-singular":"luminicicelei","dative-genitive-indefinite-plural":"luminicicele","dative-definite-genitive-plural":"luminicicelelor","singular-vocative":"luminicică","plural-vocative":"luminicicelelor"}},{"word":"Luminile","pos":"name","definitions":["a village in Morărești, Argeș County, Romania"],"gender":"f"},{"word":"Luminiș","pos":"name","definitions":["a village in Piatra Șoimului, Neamț County, Romania"],"gender":"m"},{"word":"luminiș","pos":"noun","definitions":["glade"],"forms":{"plural":"luminișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"luminiș","accusative-definite-nominative-singular":"luminișul","accusative-indefinite-nominative-plural":"luminișuri","accusative-definite-nominative-plural":"luminișurile","dative-genitive-indefinite-singular":"luminiș","dative-definite-genitive-singular":"luminișului","dative-genitive-indefinite-plural":"luminișuri","dative-definite-genitive-plural":"luminișurilor","singular-vocative":"luminișule","plural-vocative":"luminișurilor"}},{"word":"luminiscență","pos":"noun","definitions":["obsolete form of luminescență"],"forms":{"plural":"luminiscențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luminiscență","accusative-definite-nominative-singular":"luminiscența","accusative-indefinite-nominative-plural":"luminiscențe","accusative-definite-nominative-plural":"luminiscențele","dative-genitive-indefinite-singular":"luminiscențe","dative-definite-genitive-singular":"luminiscenței","dative-genitive-indefinite-plural":"luminiscențe","dative-definite-genitive-plural":"luminiscențelor","singular-vocative":"luminiscență","plural-vocative":"luminiscențelor"}},{"word":"luminism","pos":"noun","definitions":["Enlightenment"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"luminism","accusative-definite-nominative":"luminismul","dative-genitive-indefinite":"luminism","dative-definite-genitive":"luminismului","vocative":"luminismule"}},{"word":"luminist","pos":"noun","definitions":["luminist"],"forms":{"plural":"luminiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"luminist","accusative-definite-nominative-singular":"luministul","accusative-indefinite-nominative-plural":"luminiști","accusative-definite-nominative-plural":"luminiștii","dative-genitive-indefinite-singular":"luminist","dative-definite-genitive-singular":"luministului","dative-genitive-indefinite-plural":"luminiști","dative-definite-genitive-plural":"luminiștilor","singular-vocative":"luministule","plural-vocative":"luminiștilor"}},{"word":"luministă","pos":"noun","definitions":["female equivalent of luminist"],"forms":{"plural":"luministe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luministă","accusative-definite-nominative-singular":"luminista","accusative-indefinite-nominative-plural":"luministe","accusative-definite-nominative-plural":"luministele","dative-genitive-indefinite-singular":"luministe","dative-definite-genitive-singular":"luministei","dative-genitive-indefinite-plural":"luministe","dative-definite-genitive-plural":"luministelor","singular-vocative":"luministă","plural-vocative":"luministelor"}},{"word":"Luminișu","pos":"name","definitions":["a village in Ileanda, Sălaj County, Romania"],"gender":"m"},{"word":"luminișul","pos":"noun","definitions":["definite nominative/accusative singular of luminiș"]},{"word":"Luminița","pos":"name","definitions":["a female given name"],"gender":"f"},{"word":"luminița","pos":"noun","definitions":["definite nominative/accusative singular of luminiță"]},{"word":"luminiță","pos":"noun","definitions":["diminutive of lumină; small light"],"forms":{"plural":"luminițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luminiță","accusative-definite-nominative-singular":"luminița","accusative-indefinite-nominative-plural":"luminițe","accusative-definite-nominative-plural":"luminițele","dative-genitive-indefinite-singular":"luminițe","dative-definite-genitive-singular":"luminiței","dative-genitive-indefinite-plural":"luminițe","dative-definite-genitive-plural":"luminițelor","singular-vocative":"luminiță","plural-vocative":"luminițelor"}},{"word":"luminoasă","pos":"adj","definitions":["indefinite nominative/accusative feminine singular of luminos"],"forms":{"canonical":"luminosă"}},{"word":"luminofor","pos":"adj","definitions":["luminophore"],"forms":{"feminine-singular":"luminoforă","masculine-plural":"luminofori","feminine-neuter-plural":"luminofore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"luminofor","error-unrecognized-form-feminine-indefinite-singular":"luminoforă","error-unrecognized-form-indefinite-masculine-plural":"luminofori","error-unrecognized-form-feminine-indefinite-neuter-plural":"luminofore","definite-error-unrecognized-form-masculine-neuter-singular":"luminoforul","definite-error-unrecognized-form-feminine-singular":"luminofora","definite-error-unrecognized-form-masculine-plural":"luminoforii","definite-error-unrecognized-form-feminine-neuter-plural":"luminoforele"}},{"word":"Luminos","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Luminos"}},{"word":"luminos","pos":"adj","definitions":["luminous, bright, glowing, radiant"],"pronunciation":"/ˌlu.miˈnos/","forms":{"feminine-singular":"luminoasă","masculine-plural":"luminoși","feminine-neuter-plural":"luminoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"luminos","error-unrecognized-form-feminine-indefinite-singular":"luminoasă","error-unrecognized-form-indefinite-masculine-plural":"luminoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"luminoase","definite-error-unrecognized-form-masculine-neuter-singular":"luminosul","definite-error-unrecognized-form-feminine-singular":"luminoasa","definite-error-unrecognized-form-masculine-plural":"luminoșii","definite-error-unrecognized-form-feminine-neuter-plural":"luminoasele"}},{"word":"luminoscop","pos":"noun","definitions":["luminoscope"],"forms":{"plural":"luminoscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"luminoscop","accusative-definite-nominative-singular":"luminoscopul","accusative-indefinite-nominative-plural":"luminoscoape","accusative-definite-nominative-plural":"luminoscoapele","dative-genitive-indefinite-singular":"luminoscop","dative-definite-genitive-singular":"luminoscopului","dative-genitive-indefinite-plural":"luminoscoape","dative-definite-genitive-plural":"luminoscoapelor","singular-vocative":"luminoscopule","plural-vocative":"luminoscoapelor"}},{"word":"Luminosu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Luminosu"}},{"word":"luminozitate","pos":"noun","definitions":["luminosity"],"forms":{"plural":"luminozități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"luminozitate","accusative-definite-nominative-singular":"luminozitatea","accusative-indefinite-nominative-plural":"luminozități","accusative-definite-nominative-plural":"luminozitățile","dative-genitive-indefinite-singular":"luminozități","dative-definite-genitive-singular":"luminozității","dative-genitive-indefinite-plural":"luminozități","dative-definite-genitive-plural":"luminozităților","singular-vocative":"luminozitate","plural-vocative":"luminozităților"}},{"word":"luminușă","pos":"noun","definitions":["diminutive of lumină"],"forms":{"plural":"luminușe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luminușă","accusative-definite-nominative-singular":"luminușa","accusative-indefinite-nominative-plural":"luminușe","accusative-definite-nominative-plural":"luminușele","dative-genitive-indefinite-singular":"luminușe","dative-definite-genitive-singular":"luminușei","dative-genitive-indefinite-plural":"luminușe","dative-definite-genitive-plural":"luminușelor","singular-vocative":"luminușă","plural-vocative":"luminușelor"}},{"word":"luminuță","pos":"noun","definitions":["diminutive of lumină"],"forms":{"plural":"luminuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luminuță","accusative-definite-nominative-singular":"luminuța","accusative-indefinite-nominative-plural":"luminuțe","accusative-definite-nominative-plural":"luminuțele","dative-genitive-indefinite-singular":"luminuțe","dative-definite-genitive-singular":"luminuței","dative-genitive-indefinite-plural":"luminuțe","dative-definite-genitive-plural":"luminuțelor","singular-vocative":"luminuță","plural-vocative":"luminuțelor"}},{"word":"Lumnic","pos":"name","definitions":["a village in Prunișor, Mehedinți County, Romania"],"gender":"m"},{"word":"lumpen","pos":"noun","definitions":["lumpenproletarian"],"forms":{"plural":"lumpeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lumpen","accusative-definite-nominative-singular":"lumpenul","accusative-indefinite-nominative-plural":"lumpeni","accusative-definite-nominative-plural":"lumpenii","dative-genitive-indefinite-singular":"lumpen","dative-definite-genitive-singular":"lumpenului","dative-genitive-indefinite-plural":"lumpeni","dative-definite-genitive-plural":"lumpenilor","singular-vocative":"lumpenule","plural-vocative":"lumpenilor"}},{"word":"lumpenproletar","pos":"noun","definitions":["lumpenproletarian"],"forms":{"plural":"lumpenproletari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lumpenproletar","accusative-definite-nominative-singular":"lumpenproletarul","accusative-indefinite-nominative-plural":"lumpenproletari","accusative-definite-nominative-plural":"lumpenproletarii","dative-genitive-indefinite-singular":"lumpenproletar","dative-definite-genitive-singular":"lumpenproletarului","dative-genitive-indefinite-plural":"lumpenproletari","dative-definite-genitive-plural":"lumpenproletarilor","singular-vocative":"lumpenproletarule","plural-vocative":"lumpenproletarilor"}},{"word":"lumpenproletariat","pos":"noun","definitions":["lumpenproletariat"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lumpenproletariat","accusative-definite-nominative":"lumpenproletariatul","dative-genitive-indefinite":"lumpenproletariat","dative-definite-genitive":"lumpenproletariatului","vocative":"lumpenproletariatule"}},{"word":"Luna","pos":"name","definitions":["a commune of Cluj County, Romania","a village in Luna, Cluj County, Romania","a locality in Negrești-Oaș, Satu Mare County, Romania"],"gender":"f"},{"word":"luna","pos":"noun","definitions":["definite nominative/accusative singular of lună: the moon, the month"],"pronunciation":"/ˈlu.na/"},{"word":"Lună","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lună"}},{"word":"lună","pos":"noun","definitions":["moon","month"],"pronunciation":"/ˈlu.nə/","forms":{"plural":"luni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lună","accusative-definite-nominative-singular":"luna","accusative-indefinite-nominative-plural":"luni","accusative-definite-nominative-plural":"lunile","dative-genitive-indefinite-singular":"luni","dative-definite-genitive-singular":"lunii","dative-genitive-indefinite-plural":"luni","dative-definite-genitive-plural":"lunilor","singular-vocative":"lună","plural-vocative":"lunilor","alternative":"лунэ"}},{"word":"lună calendaristică","pos":"noun","definitions":["calendar month"],"forms":{"plural":"luni calendaristice"}},{"word":"Luna de Jos","pos":"name","definitions":["a village in Dăbâca, Cluj County, Romania"],"gender":"f"},{"word":"lună de miere","pos":"noun","definitions":["honeymoon"],"forms":{"plural":"luni de miere"}},{"word":"Luna de Sus","pos":"name","definitions":["a village in Florești, Cluj County, Romania"],"gender":"f"},{"word":"lună nouă","pos":"noun","definitions":["new moon"],"forms":{"plural":"luni noi"}},{"word":"lună plină","pos":"noun","definitions":["full moon"],"forms":{"plural":"luni pline"}},{"word":"lună sinodică","pos":"noun","definitions":["synodic month"],"forms":{"plural":"luni sinodice"}},{"word":"lunar","pos":"adj","definitions":["lunar","monthly"],"pronunciation":"/luˈnar/","forms":{"feminine-singular":"lunară","masculine-plural":"lunari","feminine-neuter-plural":"lunare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lunar","error-unrecognized-form-feminine-indefinite-singular":"lunară","error-unrecognized-form-indefinite-masculine-plural":"lunari","error-unrecognized-form-feminine-indefinite-neuter-plural":"lunare","definite-error-unrecognized-form-masculine-neuter-singular":"lunarul","definite-error-unrecognized-form-feminine-singular":"lunara","definite-error-unrecognized-form-masculine-plural":"lunarii","definite-error-unrecognized-form-feminine-neuter-plural":"lunarele"}},{"word":"lunaș","pos":"noun","definitions":["temporary worker hired for a month"],"forms":{"plural":"lunași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lunaș","accusative-definite-nominative-singular":"lunașul","accusative-indefinite-nominative-plural":"lunași","accusative-definite-nominative-plural":"lunașii","dative-genitive-indefinite-singular":"lunaș","dative-definite-genitive-singular":"lunașului","dative-genitive-indefinite-plural":"lunași","dative-definite-genitive-plural":"lunașilor","singular-vocative":"lunașule","plural-vocative":"lunașilor"}},{"word":"lunatec","pos":"adj","definitions":["alternative form of lunatic"],"forms":{"feminine-singular":"lunatecă","masculine-plural":"lunateci","feminine-neuter-plural":"lunatece","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lunatec","error-unrecognized-form-feminine-indefinite-singular":"lunatecă","error-unrecognized-form-indefinite-masculine-plural":"lunateci","error-unrecognized-form-feminine-indefinite-neuter-plural":"lunatece","definite-error-unrecognized-form-masculine-neuter-singular":"lunatecul","definite-error-unrecognized-form-feminine-singular":"lunateca","definite-error-unrecognized-form-masculine-plural":"lunatecii","definite-error-unrecognized-form-feminine-neuter-plural":"lunatecele"}},{"word":"lunatic","pos":"noun","definitions":["somnambulist, sleepwalker","dullard, fool, scatterbrain"],"pronunciation":"/luˈna.tik/","forms":{"plural":"lunatici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lunatic","accusative-definite-nominative-singular":"lunaticul","accusative-indefinite-nominative-plural":"lunatici","accusative-definite-nominative-plural":"lunaticii","dative-genitive-indefinite-singular":"lunatic","dative-definite-genitive-singular":"lunaticului","dative-genitive-indefinite-plural":"lunatici","dative-definite-genitive-plural":"lunaticilor","singular-vocative":"lunaticule","plural-vocative":"lunaticilor","alternative":"lunatec"}},{"word":"lunatic","pos":"adj","definitions":["born in the same month as another"],"pronunciation":"/luˈna.tik/","forms":{"feminine-singular":"lunatică","masculine-plural":"lunatici","feminine-neuter-plural":"lunatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lunatic","error-unrecognized-form-feminine-indefinite-singular":"lunatică","error-unrecognized-form-indefinite-masculine-plural":"lunatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"lunatice","definite-error-unrecognized-form-masculine-neuter-singular":"lunaticul","definite-error-unrecognized-form-feminine-singular":"lunatica","definite-error-unrecognized-form-masculine-plural":"lunaticii","definite-error-unrecognized-form-feminine-neuter-plural":"lunaticele","alternative":"lunatec"}},{"word":"lunatic","pos":"adj","definitions":["having hallucinations","fantastic, unreal, bizarre","having unusual or strange ideas and behavior","fearful"],"pronunciation":"/luˈna.tik/","forms":{"feminine-singular":"lunatică","masculine-plural":"lunatici","feminine-neuter-plural":"lunatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lunatic","error-unrecognized-form-feminine-indefinite-singular":"lunatică","error-unrecognized-form-indefinite-masculine-plural":"lunatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"lunatice","definite-error-unrecognized-form-masculine-neuter-singular":"lunaticul","definite-error-unrecognized-form-feminine-singular":"lunatica","definite-error-unrecognized-form-masculine-plural":"lunaticii","definite-error-unrecognized-form-feminine-neuter-plural":"lunaticele"}},{"word":"lunație","pos":"noun","definitions":["lunation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lunație","accusative-definite-nominative-singular":"lunația","accusative-indefinite-nominative-plural":"lunații","accusative-definite-nominative-plural":"lunațiile","dative-genitive-indefinite-singular":"lunații","dative-definite-genitive-singular":"lunației","dative-genitive-indefinite-plural":"lunații","dative-definite-genitive-plural":"lunațiilor","singular-vocative":"lunație","plural-vocative":"lunațiilor"}},{"word":"lunatism","pos":"noun","definitions":["lunaticism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lunatism","accusative-definite-nominative-singular":"lunatismul","accusative-indefinite-nominative-plural":"lunatisme","accusative-definite-nominative-plural":"lunatismele","dative-genitive-indefinite-singular":"lunatism","dative-definite-genitive-singular":"lunatismului","dative-genitive-indefinite-plural":"lunatisme","dative-definite-genitive-plural":"lunatismelor","singular-vocative":"lunatismule","plural-vocative":"lunatismelor"}},{"word":"lunațiune","pos":"noun","definitions":["obsolete form of lunație"],"forms":{"plural":"lunațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lunațiune","accusative-definite-nominative-singular":"lunațiunea","accusative-indefinite-nominative-plural":"lunațiuni","accusative-definite-nominative-plural":"lunațiunile","dative-genitive-indefinite-singular":"lunațiuni","dative-definite-genitive-singular":"lunațiunii","dative-genitive-indefinite-plural":"lunațiuni","dative-definite-genitive-plural":"lunațiunilor","singular-vocative":"lunațiune","plural-vocative":"lunațiunilor"}},{"word":"Lunca","pos":"name","definitions":["a village in Lupșa, Alba County, Romania","a village in Poșaga, Alba County, Romania","a village in Valea Lungă, Alba County, Romania","a village in Vidra, Alba County, Romania","a village in Boteni, Argeș County, Romania"],"gender":"f"},{"word":"lunca","pos":"noun","definitions":["definite nominative/accusative singular of luncă"]},{"word":"Luncă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Luncă"}},{"word":"luncă","pos":"noun","definitions":["floodplain, water-meadow"],"forms":{"plural":"lunci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"luncă","accusative-definite-nominative-singular":"lunca","accusative-indefinite-nominative-plural":"lunci","accusative-definite-nominative-plural":"luncile","dative-genitive-indefinite-singular":"lunci","dative-definite-genitive-singular":"luncii","dative-genitive-indefinite-plural":"lunci","dative-definite-genitive-plural":"luncilor","singular-vocative":"luncă","plural-vocative":"luncilor"}},{"word":"Lunca Ampoiței","pos":"name","definitions":["a village in Meteș, Alba County, Romania"],"gender":"f"},{"word":"Lunca Apei","pos":"name","definitions":["a village in Apa, Satu Mare County, Romania"],"gender":"f"},{"word":"Lunca Asău","pos":"name","definitions":["a village in Asău, Bacău County, Romania"],"gender":"f"},{"word":"Lunca Banului","pos":"name","definitions":["a locality in Strehaia, Mehedinți County, Romania","a commune of Vaslui County, Romania","a village in Lunca Banului, Vaslui County, Romania"],"gender":"f"},{"word":"Lunca Bisericii","pos":"name","definitions":["a village in Vidra, Alba County, Romania"],"gender":"f"},{"word":"Lunca Bonțului","pos":"name","definitions":["a village in Fizeșu Gherlii, Cluj County, Romania"],"gender":"f"},{"word":"Lunca Borlesei","pos":"name","definitions":["a village in Spermezeu, Bistrița-Năsăud County, Romania"],"gender":"f"},{"word":"Lunca Bradului","pos":"name","definitions":["a commune of Mureș County, Romania","a village in Lunca Bradului, Mureș County, Romania"],"gender":"f"},{"word":"Lunca Calnicului","pos":"name","definitions":["a village in Prejmer, Brașov County, Romania"],"gender":"f"},{"word":"Lunca Cernii de Jos","pos":"name","definitions":["a commune of Hunedoara County, Romania","a village in Lunca Cernii de Jos, Hunedoara County, Romania"],"gender":"f","forms":{"canonical-feminine":"Lunca Cerna de Jos"}},{"word":"Lunca Cernii de Sus","pos":"name","definitions":["a village in Lunca Cernii de Jos, Hunedoara County, Romania"],"gender":"f"},{"word":"Lunca Cetățuii","pos":"name","definitions":["a village in Ciurea, Iași County, Romania"],"gender":"f"},{"word":"Lunca Ciocoiului","pos":"name","definitions":["a river in Olt, Romania, tributary to the Bobu"],"gender":"f"},{"word":"Lunca Corbului","pos":"name","definitions":["a commune of Argeș County, Romania","a village in Lunca Corbului, Argeș County, Romania"],"gender":"f"},{"word":"Lunca de Jos","pos":"name","definitions":["a village in Vidra, Alba County, Romania","a commune of Harghita County, Romania","a village in Lunca de Jos, Harghita County, Romania"],"gender":"f"},{"word":"Lunca de Sus","pos":"name","definitions":["a commune of Harghita County, Romania","a village in Lunca de Sus, Harghita County, Romania"],"gender":"f"},{"word":"Lunca Dochiei","pos":"name","definitions":["a village in Urechești, Bacău County, Romania"],"gender":"f"},{"word":"Lunca Florii","pos":"name","definitions":["a village in Cornereva, Caraș-Severin County, Romania"],"gender":"f"},{"word":"Lunca Frumoasă","pos":"name","definitions":["a village in Pârscov, Buzău County, Romania"],"gender":"f"},{"word":"Lunca Gârtii","pos":"name","definitions":["a village in Stoenești, Argeș County, Romania"],"gender":"f"},{"word":"Lunca Goiești","pos":"name","definitions":["a village in Vidra, Alba County, Romania"],"gender":"f"},{"word":"Lunca Ilvei","pos":"name","definitions":["a commune of Bistrița-Năsăud County, Romania","a village in Lunca Ilvei, Bistrița-Năsăud County, Romania"],"gender":"f"},{"word":"Lunca Jariștei","pos":"name","definitions":["a village in Siriu, Buzău County, Romania"],"gender":"f"},{"word":"Lunca La Tisa","pos":"name","definitions":["a village in Bocicoiu Mare, Maramureș County, Romania"],"gender":"f","forms":{"canonical-feminine":"Luna La Tisa"}},{"word":"Lunca Largă","pos":"name","definitions":["a village in Bistra, Alba County, Romania","a village in Ocoliș, Alba County, Romania"],"gender":"f"},{"word":"Lunca Leșului","pos":"name","definitions":["a village in Leșu, Bistrița-Năsăud County, Romania"],"gender":"f"},{"word":"Lunca Mărcușului","pos":"name","definitions":["a village in Dobârlău, Covasna County, Romania"],"gender":"f"},{"word":"Lunca Mare","pos":"name","definitions":["a village in Șotrile, Prahova County, Romania"],"gender":"f"},{"word":"Lunca Merilor","pos":"name","definitions":["a village in Bistra, Alba County, Romania"],"gender":"f"},{"word":"Lunca Meteșului","pos":"name","definitions":["a village in Meteș, Alba County, Romania"],"gender":"f"},{"word":"Lunca Moldovei","pos":"name","definitions":["a village in Păstrăveni, Neamț County, Romania"],"gender":"f"},{"word":"Lunca Mureșului","pos":"name","definitions":["a commune of Alba County, Romania","a village in Lunca Mureșului, Alba County, Romania","a village in Aluniș, Mureș County, Romania"],"gender":"f"},{"word":"Lunca Oamenilor","pos":"name","definitions":["a river in Olt, Romania, tributary to the Voineasa Mare"],"gender":"f"},{"word":"Lunca Ozunului","pos":"name","definitions":["a village in Ozun, Covasna County, Romania"],"gender":"f"},{"word":"Lunca Prahovei","pos":"name","definitions":["a village in Măgureni, Prahova County, Romania"],"gender":"f"},{"word":"Lunca Priporului","pos":"name","definitions":["a village in Nehoiu, Buzău County, Romania"],"gender":"f"},{"word":"Lunca Rateș","pos":"name","definitions":["a village in Scânteia, Iași County, Romania"],"gender":"f"},{"word":"Lunca Sătească","pos":"name","definitions":["a village in Târlișua, Bistrița-Năsăud County, Romania"],"gender":"f"},{"word":"Lunca Târnavei","pos":"name","definitions":["a village in Șona, Alba County, Romania"],"gender":"f"},{"word":"Lunca Veche","pos":"name","definitions":["a village in Lunca Banului, Vaslui County, Romania"],"gender":"f","forms":{"canonical-feminine":"lunca Veche"}},{"word":"Lunca Vesești","pos":"name","definitions":["a village in Vidra, Alba County, Romania"],"gender":"f"},{"word":"Lunca Vișagului","pos":"name","definitions":["a village in Poieni, Cluj County, Romania"],"gender":"f"},{"word":"Lunca Zaicii","pos":"name","definitions":["a village in Cornereva, Caraș-Severin County, Romania"],"gender":"f"},{"word":"Luncani","pos":"name","definitions":["a village in Mărgineni, Bacău County, Romania","a village in Luna, Cluj County, Romania","a locality in Toplița, Harghita County, Romania","a village in Boșorod, Hunedoara County, Romania"],"gender":"m"},{"word":"Luncanii de Jos","pos":"name","definitions":["a village in Tomești, Timiș County, Romania"],"gender":"m"},{"word":"Luncanii de Sus","pos":"name","definitions":["a village in Tomești, Timiș County, Romania"],"gender":"m"},{"word":"Luncaru","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Luncaru"}},{"word":"Luncași","pos":"name","definitions":["a village in Hălăucești, Iași County, Romania"],"gender":"m"},{"word":"Luncasprie","pos":"name","definitions":["a village in Dobrești, Bihor County, Romania"],"gender":"m"},{"word":"Luncașu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Luncașu"}},{"word":"Luncavăț","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Olt"],"gender":"m"},{"word":"Luncavița","pos":"name","definitions":["a commune of Caraș-Severin County, Romania","a village in Luncavița, Caraș-Severin County, Romania","a commune of Tulcea County, Romania","a village in Luncavița, Tulcea County, Romania"],"gender":"f"},{"word":"luncea","pos":"noun","definitions":["diminutive of luncă"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative":"luncea","accusative-definite-nominative":"lunceaua","dative-genitive-indefinite":"luncele","dative-definite-genitive":"luncelei","vocative":"luncea"}},{"word":"luncet","pos":"noun","definitions":["floodplains collectively"],"forms":{"plural":"lunceturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"luncet","accusative-definite-nominative-singular":"luncetul","accusative-indefinite-nominative-plural":"lunceturi","accusative-definite-nominative-plural":"lunceturile","dative-genitive-indefinite-singular":"luncet","dative-definite-genitive-singular":"luncetului","dative-genitive-indefinite-plural":"lunceturi","dative-definite-genitive-plural":"lunceturilor","singular-vocative":"luncetule","plural-vocative":"lunceturilor"}},{"word":"lunchiță","pos":"noun","definitions":["diminutive of luncă"],"forms":{"plural":"lunchițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lunchiță","accusative-definite-nominative-singular":"lunchița","accusative-indefinite-nominative-plural":"lunchițe","accusative-definite-nominative-plural":"lunchițele","dative-genitive-indefinite-singular":"lunchițe","dative-definite-genitive-singular":"lunchiței","dative-genitive-indefinite-plural":"lunchițe","dative-definite-genitive-plural":"lunchițelor","singular-vocative":"lunchiță","plural-vocative":"lunchițelor"}},{"word":"Luncii","pos":"name","definitions":["a river in Bacău County, Romania, tributary to the Camenca"],"gender":"m"},{"word":"luncii","pos":"noun","definitions":["definite genitive/dative singular of luncă"]},{"word":"Luncile","pos":"name","definitions":["a village in Lopătari, Buzău County, Romania","a village in Chiojdeni, Vrancea County, Romania"],"gender":"f"},{"word":"Luncoiu","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Crișul Alb"],"gender":"m"},{"word":"Luncoiu de Jos","pos":"name","definitions":["a commune of Hunedoara County, Romania","a village in Luncoiu de Jos, Hunedoara County, Romania"],"gender":"m"},{"word":"Luncoiu de Sus","pos":"name","definitions":["a village in Luncoiu de Jos, Hunedoara County, Romania"],"gender":"m"},{"word":"luncos","pos":"adj","definitions":["floodplain"],"forms":{"feminine-singular":"luncoasă","masculine-plural":"luncoși","feminine-neuter-plural":"luncoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"luncos","error-unrecognized-form-feminine-indefinite-singular":"luncoasă","error-unrecognized-form-indefinite-masculine-plural":"luncoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"luncoase","definite-error-unrecognized-form-masculine-neuter-singular":"luncosul","definite-error-unrecognized-form-feminine-singular":"luncoasa","definite-error-unrecognized-form-masculine-plural":"luncoșii","definite-error-unrecognized-form-feminine-neuter-plural":"luncoasele"}},{"word":"Luncșoara","pos":"name","definitions":["a village in Hălmăgel, Arad County, Romania","a village in Aușeu, Bihor County, Romania","a village in Vorța, Hunedoara County, Romania","a village in Broșteni, Mehedinți County, Romania"],"gender":"f"},{"word":"Luncșoru","pos":"name","definitions":["a village in Ghercești, Dolj County, Romania"],"gender":"m"},{"word":"lunculiță","pos":"noun","definitions":["diminutive of luncă; small meadow"],"forms":{"plural":"lunculițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lunculiță","accusative-definite-nominative-singular":"lunculița","accusative-indefinite-nominative-plural":"lunculițe","accusative-definite-nominative-plural":"lunculițele","dative-genitive-indefinite-singular":"lunculițe","dative-definite-genitive-singular":"lunculiței","dative-genitive-indefinite-plural":"lunculițe","dative-definite-genitive-plural":"lunculițelor","singular-vocative":"lunculiță","plural-vocative":"lunculițelor"}},{"word":"Luncușoara","pos":"name","definitions":["a village in Udești, Suceava County, Romania"],"gender":"f"},{"word":"luncușoară","pos":"noun","definitions":["diminutive of luncă"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"luncușoară","accusative-definite-nominative":"luncușoara","dative-genitive-indefinite":"luncușoare","dative-definite-genitive":"luncușoarei","vocative":"luncușoară"}},{"word":"Luncuța","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Paroș","a river in Sibiu, Romania, tributary to the Pârâul Negru"],"gender":"f"},{"word":"luncuță","pos":"noun","definitions":["diminutive of luncă; small meadow"],"forms":{"plural":"luncuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luncuță","accusative-definite-nominative-singular":"luncuța","accusative-indefinite-nominative-plural":"luncuțe","accusative-definite-nominative-plural":"luncuțele","dative-genitive-indefinite-singular":"luncuțe","dative-definite-genitive-singular":"luncuței","dative-genitive-indefinite-plural":"luncuțe","dative-definite-genitive-plural":"luncuțelor","singular-vocative":"luncuță","plural-vocative":"luncuțelor"}},{"word":"luneca","pos":"verb","definitions":["to slide","to slip","to glide","to be tempted; to be deluded; to be deceived; to err"],"forms":{"canonical":"a luneca 1st conjugation","present-singular-third-person":"lunecă","participle-past":"lunecat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a luneca","gerund":"lunecând","first-person-indicative-present-singular":"lunec","indicative-present-second-person-singular":"luneci","indicative-present-singular-third-person":"lunecă","first-person-indicative-plural-present":"lunecăm","indicative-plural-present-second-person":"lunecați","indicative-plural-present-third-person":"lunecă","first-person-imperfect-indicative-singular":"lunecam","imperfect-indicative-second-person-singular":"lunecai","imperfect-indicative-singular-third-person":"luneca","first-person-imperfect-indicative-plural":"lunecam","imperfect-indicative-plural-second-person":"lunecați","imperfect-indicative-plural-third-person":"lunecau","first-person-indicative-perfect-singular":"lunecai","indicative-perfect-second-person-singular":"lunecași","indicative-perfect-singular-third-person":"lunecă","first-person-indicative-perfect-plural":"lunecarăm","indicative-perfect-plural-second-person":"lunecarăți","indicative-perfect-plural-third-person":"lunecară","first-person-indicative-pluperfect-singular":"lunecasem","indicative-pluperfect-second-person-singular":"lunecaseși","indicative-pluperfect-singular-third-person":"lunecase","first-person-indicative-pluperfect-plural":"lunecaserăm","indicative-pluperfect-plural-second-person":"lunecaserăți","indicative-pluperfect-plural-third-person":"lunecaseră","first-person-present-singular-subjunctive":"să lunec","present-second-person-singular-subjunctive":"să luneci","present-singular-subjunctive-third-person":"să lunece","first-person-plural-present-subjunctive":"să lunecăm","plural-present-second-person-subjunctive":"să lunecați","plural-present-subjunctive-third-person":"să lunece","imperative-second-person-singular":"lunecă","imperative-plural-second-person":"lunecați","imperative-negative-second-person-singular":"nu luneca","imperative-negative-plural-second-person":"nu lunecați"}},{"word":"lunecare","pos":"noun","definitions":["glissade, sliding"],"forms":{"plural":"lunecări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lunecare","accusative-definite-nominative-singular":"lunecarea","accusative-indefinite-nominative-plural":"lunecări","accusative-definite-nominative-plural":"lunecările","dative-genitive-indefinite-singular":"lunecări","dative-definite-genitive-singular":"lunecării","dative-genitive-indefinite-plural":"lunecări","dative-definite-genitive-plural":"lunecărilor","singular-vocative":"lunecare","plural-vocative":"lunecărilor"}},{"word":"lunecător","pos":"adj","definitions":["slipping, gliding"],"forms":{"feminine-singular":"lunecătoare","masculine-plural":"lunecători","feminine-neuter-plural":"lunecătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lunecător","error-unrecognized-form-feminine-indefinite-singular":"lunecătoare","error-unrecognized-form-indefinite-masculine-plural":"lunecători","error-unrecognized-form-feminine-indefinite-neuter-plural":"lunecătoare","definite-error-unrecognized-form-masculine-neuter-singular":"lunecătorul","definite-error-unrecognized-form-feminine-singular":"lunecătoarea","definite-error-unrecognized-form-masculine-plural":"lunecătorii","definite-error-unrecognized-form-feminine-neuter-plural":"lunecătoarele"}},{"word":"lunecos","pos":"adj","definitions":["slippery"],"pronunciation":"/lu.neˈkos/","forms":{"feminine-singular":"lunecoasă","masculine-plural":"lunecoși","feminine-neuter-plural":"lunecoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lunecos","error-unrecognized-form-feminine-indefinite-singular":"lunecoasă","error-unrecognized-form-indefinite-masculine-plural":"lunecoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lunecoase","definite-error-unrecognized-form-masculine-neuter-singular":"lunecosul","definite-error-unrecognized-form-feminine-singular":"lunecoasa","definite-error-unrecognized-form-masculine-plural":"lunecoșii","definite-error-unrecognized-form-feminine-neuter-plural":"lunecoasele"}},{"word":"lunecuș","pos":"noun","definitions":["slipperiness"],"forms":{"plural":"lunecușuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"lunecuș","accusative-definite-nominative-singular":"lunecușul","accusative-indefinite-nominative-plural":"lunecușuri","accusative-definite-nominative-plural":"lunecușurile","dative-genitive-indefinite-singular":"lunecuș","dative-definite-genitive-singular":"lunecușului","dative-genitive-indefinite-plural":"lunecușuri","dative-definite-genitive-plural":"lunecușurilor","singular-vocative":"lunecușule","plural-vocative":"lunecușurilor"}},{"word":"lunetă","pos":"noun","definitions":["telescope"],"forms":{"plural":"lunete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lunetă","accusative-definite-nominative-singular":"luneta","accusative-indefinite-nominative-plural":"lunete","accusative-definite-nominative-plural":"lunetele","dative-genitive-indefinite-singular":"lunete","dative-definite-genitive-singular":"lunetei","dative-genitive-indefinite-plural":"lunete","dative-definite-genitive-plural":"lunetelor","singular-vocative":"lunetă","plural-vocative":"lunetelor"}},{"word":"lunetist","pos":"noun","definitions":["sniper"],"forms":{"plural":"lunetiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lunetist","accusative-definite-nominative-singular":"lunetistul","accusative-indefinite-nominative-plural":"lunetisti","accusative-definite-nominative-plural":"lunetistii","dative-genitive-indefinite-singular":"lunetist","dative-definite-genitive-singular":"lunetistului","dative-genitive-indefinite-plural":"lunetisti","dative-definite-genitive-plural":"lunetistilor","singular-vocative":"lunetistule","plural-vocative":"lunetistilor"}},{"word":"Lung","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lung"}},{"word":"lung","pos":"adj","definitions":["long"],"pronunciation":"/luŋɡ/","examples":[{"ro":"Asta e o stradă foarte lungă!","en":"This is a really long street!"}],"forms":{"feminine-singular":"lungă","plural":"lungi","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lung","error-unrecognized-form-feminine-indefinite-singular":"lungă","error-unrecognized-form-indefinite-masculine-plural":"lungi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lungi","definite-error-unrecognized-form-masculine-neuter-singular":"lungul","definite-error-unrecognized-form-feminine-singular":"lunga","definite-error-unrecognized-form-masculine-plural":"lungii","definite-error-unrecognized-form-feminine-neuter-plural":"lungile"}},{"word":"lung metraj","pos":"noun","definitions":["feature film"],"forms":{"plural":"lung metraje"}},{"word":"Lunga","pos":"name","definitions":["a village in Lunga, Florești Raion, Moldova","a commune of Florești Raion, Moldova","a village in Lunga, Transnistria, Moldova","a commune of Transnistria, Moldova","a village in Târgu Secuiesc, Covasna County, Romania"],"gender":"f"},{"word":"lunga","pos":"verb","definitions":["obsolete form of alunga (“to drive away”)"],"forms":{"canonical":"a lunga 1st conjugation","present-singular-third-person":"lungă","participle-past":"lungat","subjunctive-third-person":"lunge","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a lunga","gerund":"lungând","first-person-indicative-present-singular":"lung","indicative-present-second-person-singular":"lungi","indicative-present-singular-third-person":"lungă","first-person-indicative-plural-present":"lungăm","indicative-plural-present-second-person":"lungați","indicative-plural-present-third-person":"lungă","first-person-imperfect-indicative-singular":"lungam","imperfect-indicative-second-person-singular":"lungai","imperfect-indicative-singular-third-person":"lunga","first-person-imperfect-indicative-plural":"lungam","imperfect-indicative-plural-second-person":"lungați","imperfect-indicative-plural-third-person":"lungau","first-person-indicative-perfect-singular":"lungai","indicative-perfect-second-person-singular":"lungași","indicative-perfect-singular-third-person":"lungă","first-person-indicative-perfect-plural":"lungarăm","indicative-perfect-plural-second-person":"lungarăți","indicative-perfect-plural-third-person":"lungară","first-person-indicative-pluperfect-singular":"lungasem","indicative-pluperfect-second-person-singular":"lungaseși","indicative-pluperfect-singular-third-person":"lungase","first-person-indicative-pluperfect-plural":"lungaserăm","indicative-pluperfect-plural-second-person":"lungaserăți","indicative-pluperfect-plural-third-person":"lungaseră","first-person-present-singular-subjunctive":"să lung","present-second-person-singular-subjunctive":"să lungi","present-singular-subjunctive-third-person":"să lunge","first-person-plural-present-subjunctive":"să lungăm","plural-present-second-person-subjunctive":"să lungați","plural-present-subjunctive-third-person":"să lunge","imperative-second-person-singular":"lungă","imperative-plural-second-person":"lungați","imperative-negative-second-person-singular":"nu lunga","imperative-negative-plural-second-person":"nu lungați"}},{"word":"lungă","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of lung"]},{"word":"Lunga Nouă","pos":"name","definitions":["a village in Crasnîi Vinogradari, Transnistria, Moldova"],"gender":"f"},{"word":"lungan","pos":"adj","definitions":["tall (about a person)"],"forms":{"feminine-singular":"lungană","masculine-plural":"lungani","feminine-neuter-plural":"lungane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lungan","error-unrecognized-form-feminine-indefinite-singular":"lungană","error-unrecognized-form-indefinite-masculine-plural":"lungani","error-unrecognized-form-feminine-indefinite-neuter-plural":"lungane","definite-error-unrecognized-form-masculine-neuter-singular":"lunganul","definite-error-unrecognized-form-feminine-singular":"lungana","definite-error-unrecognized-form-masculine-plural":"lunganii","definite-error-unrecognized-form-feminine-neuter-plural":"lunganele"}},{"word":"lungană","pos":"noun","definitions":["female equivalent of lungan"],"forms":{"plural":"lungane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lungană","accusative-definite-nominative-singular":"lungana","accusative-indefinite-nominative-plural":"lungane","accusative-definite-nominative-plural":"lunganele","dative-genitive-indefinite-singular":"lungane","dative-definite-genitive-singular":"lunganei","dative-genitive-indefinite-plural":"lungane","dative-definite-genitive-plural":"lunganelor","singular-vocative":"lungană","plural-vocative":"lunganelor"}},{"word":"Lungani","pos":"name","definitions":["a village in Vedea, Argeș County, Romania","a commune of Iași County, Romania","a village in Lungani, Iași County, Romania","a village in Voinești, Iași County, Romania"],"gender":"m"},{"word":"Lungănoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lungănoiu"}},{"word":"lungăreț","pos":"adj","definitions":["longish"],"forms":{"feminine-singular":"lungăreață","masculine-plural":"lungăreți","feminine-neuter-plural":"lungărețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lungăreț","error-unrecognized-form-feminine-indefinite-singular":"lungăreață","error-unrecognized-form-indefinite-masculine-plural":"lungăreți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lungărețe","definite-error-unrecognized-form-masculine-neuter-singular":"lungărețul","definite-error-unrecognized-form-feminine-singular":"lungăreața","definite-error-unrecognized-form-masculine-plural":"lungăreții","definite-error-unrecognized-form-feminine-neuter-plural":"lungărețele"}},{"word":"lungeală","pos":"noun","definitions":["stretching"],"forms":{"plural":"lungeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lungeală","accusative-definite-nominative-singular":"lungeala","accusative-indefinite-nominative-plural":"lungele","accusative-definite-nominative-plural":"lungelele","dative-genitive-indefinite-singular":"lungele","dative-definite-genitive-singular":"lungelei","dative-genitive-indefinite-plural":"lungele","dative-definite-genitive-plural":"lungelelor","singular-vocative":"lungeală","plural-vocative":"lungelelor"}},{"word":"Lungeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lungeanu"}},{"word":"Lungeni","pos":"name","definitions":["a locality in Broșteni, Suceava County, Romania"],"gender":"m"},{"word":"Lungenilor","pos":"name","definitions":["a river in Olt, Romania, tributary to the Frăsinet"],"gender":"m"},{"word":"lungesc","pos":"verb","definitions":["inflection of lungi:","first-person singular present indicative/subjunctive","third-person plural present indicative"]},{"word":"Lungescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lungescu"}},{"word":"Lungești","pos":"name","definitions":["a village in Cozieni, Buzău County, Romania","a village in Iara, Cluj County, Romania","a village in Bălăbănești, Galați County, Romania","a commune of Vâlcea County, Romania","a village in Lungești, Vâlcea County, Romania"],"gender":"m"},{"word":"lungi","pos":"verb","definitions":["to lengthen, elongate, extend","to prolong"],"pronunciation":"/lunˈd͡ʒi/","forms":{"canonical":"a lungi 4th conjugation","present-singular-third-person":"lungește","participle-past":"lungit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lungi","gerund":"lungind","first-person-indicative-present-singular":"lungesc","indicative-present-second-person-singular":"lungești","indicative-present-singular-third-person":"lungește","first-person-indicative-plural-present":"lungim","indicative-plural-present-second-person":"lungiți","indicative-plural-present-third-person":"lungesc","first-person-imperfect-indicative-singular":"lungeam","imperfect-indicative-second-person-singular":"lungeai","imperfect-indicative-singular-third-person":"lungea","first-person-imperfect-indicative-plural":"lungeam","imperfect-indicative-plural-second-person":"lungeați","imperfect-indicative-plural-third-person":"lungeau","first-person-indicative-perfect-singular":"lungii","indicative-perfect-second-person-singular":"lungiși","indicative-perfect-singular-third-person":"lungi","first-person-indicative-perfect-plural":"lungirăm","indicative-perfect-plural-second-person":"lungirăți","indicative-perfect-plural-third-person":"lungiră","first-person-indicative-pluperfect-singular":"lungisem","indicative-pluperfect-second-person-singular":"lungiseși","indicative-pluperfect-singular-third-person":"lungise","first-person-indicative-pluperfect-plural":"lungiserăm","indicative-pluperfect-plural-second-person":"lungiserăți","indicative-pluperfect-plural-third-person":"lungiseră","first-person-present-singular-subjunctive":"să lungesc","present-second-person-singular-subjunctive":"să lungești","present-singular-subjunctive-third-person":"să lungească","first-person-plural-present-subjunctive":"să lungim","plural-present-second-person-subjunctive":"să lungiți","plural-present-subjunctive-third-person":"să lungească","imperative-second-person-singular":"lungește","imperative-plural-second-person":"lungiți","imperative-negative-second-person-singular":"nu lungi","imperative-negative-plural-second-person":"nu lungiți"}},{"word":"lungime","pos":"noun","definitions":["length","duration"],"pronunciation":"/lunˈd͡ʒi.me/","forms":{"plural":"lungimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lungime","accusative-definite-nominative-singular":"lungimea","accusative-indefinite-nominative-plural":"lungimi","accusative-definite-nominative-plural":"lungimile","dative-genitive-indefinite-singular":"lungimi","dative-definite-genitive-singular":"lungimii","dative-genitive-indefinite-plural":"lungimi","dative-definite-genitive-plural":"lungimilor","singular-vocative":"lungime","plural-vocative":"lungimilor"}},{"word":"lungime de undă","pos":"noun","definitions":["wavelength"],"forms":{"plural":"lungimi de undă"}},{"word":"lungimi de undă","pos":"noun","definitions":["plural of lungime de undă"]},{"word":"lungire","pos":"noun","definitions":["elongation"],"forms":{"plural":"lungiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lungire","accusative-definite-nominative-singular":"lungirea","accusative-indefinite-nominative-plural":"lungiri","accusative-definite-nominative-plural":"lungirile","dative-genitive-indefinite-singular":"lungiri","dative-definite-genitive-singular":"lungirii","dative-genitive-indefinite-plural":"lungiri","dative-definite-genitive-plural":"lungirilor","singular-vocative":"lungire","plural-vocative":"lungirilor"}},{"word":"lungiș","pos":"adv","definitions":["lengthwise"]},{"word":"lungit","pos":"adj","definitions":["lengthened"],"forms":{"feminine-singular":"lungită","masculine-plural":"lungiți","feminine-neuter-plural":"lungite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lungit","error-unrecognized-form-feminine-indefinite-singular":"lungită","error-unrecognized-form-indefinite-masculine-plural":"lungiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lungite","definite-error-unrecognized-form-masculine-neuter-singular":"lungitul","definite-error-unrecognized-form-feminine-singular":"lungita","definite-error-unrecognized-form-masculine-plural":"lungiții","definite-error-unrecognized-form-feminine-neuter-plural":"lungitele"}},{"word":"lungitură","pos":"noun","definitions":["prolongation"],"forms":{"plural":"lungituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lungitură","accusative-definite-nominative-singular":"lungitura","accusative-indefinite-nominative-plural":"lungituri","accusative-definite-nominative-plural":"lungiturile","dative-genitive-indefinite-singular":"lungituri","dative-definite-genitive-singular":"lungiturii","dative-genitive-indefinite-plural":"lungituri","dative-definite-genitive-plural":"lungiturilor","singular-vocative":"lungitură","plural-vocative":"lungiturilor"}},{"word":"lungmetraj","pos":"noun","definitions":["feature film"],"forms":{"plural":"lungmetraje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lungmetraj","accusative-definite-nominative-singular":"lungmetrajul","accusative-indefinite-nominative-plural":"lungmetraje","accusative-definite-nominative-plural":"lungmetrajele","dative-genitive-indefinite-singular":"lungmetraj","dative-definite-genitive-singular":"lungmetrajului","dative-genitive-indefinite-plural":"lungmetraje","dative-definite-genitive-plural":"lungmetrajelor","singular-vocative":"lungmetrajule","plural-vocative":"lungmetrajelor"}},{"word":"Lungoaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Lungoaia"}},{"word":"lungoare","pos":"noun","definitions":["alternative form of lingoare"],"forms":{"plural":"lungori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lungoare","accusative-definite-nominative-singular":"lungoarea","accusative-indefinite-nominative-plural":"lungoari","accusative-definite-nominative-plural":"lungoarile","dative-genitive-indefinite-singular":"lungoari","dative-definite-genitive-singular":"lungoarii","dative-genitive-indefinite-plural":"lungoari","dative-definite-genitive-plural":"lungoarilor","singular-vocative":"lungoare","plural-vocative":"lungoarilor"}},{"word":"Lungoci","pos":"name","definitions":["a village in Fundeni, Galați County, Romania"],"gender":"m"},{"word":"Lungșoara","pos":"name","definitions":["a river in Sibiu, Romania, tributary to the Cibin"],"gender":"f"},{"word":"Lungșorul","pos":"name","definitions":["a river in Bihor, Romania, tributary to the Dașor"],"gender":"m"},{"word":"Lungu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lungu"}},{"word":"lunguieț","pos":"adj","definitions":["longish"],"forms":{"feminine-singular":"lunguieață","masculine-plural":"lunguieți","feminine-neuter-plural":"lunguiețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lunguieț","error-unrecognized-form-feminine-indefinite-singular":"lunguieață","error-unrecognized-form-indefinite-masculine-plural":"lunguieți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lunguiețe","definite-error-unrecognized-form-masculine-neuter-singular":"lunguiețul","definite-error-unrecognized-form-feminine-singular":"lunguieața","definite-error-unrecognized-form-masculine-plural":"lunguieții","definite-error-unrecognized-form-feminine-neuter-plural":"lunguiețele"}},{"word":"lunguire","pos":"noun","definitions":["stretching"],"forms":{"plural":"lunguiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lunguire","accusative-definite-nominative-singular":"lunguirea","accusative-indefinite-nominative-plural":"lunguiri","accusative-definite-nominative-plural":"lunguirile","dative-genitive-indefinite-singular":"lunguiri","dative-definite-genitive-singular":"lunguirii","dative-genitive-indefinite-plural":"lunguiri","dative-definite-genitive-plural":"lunguirilor","singular-vocative":"lunguire","plural-vocative":"lunguirilor"}},{"word":"Lunguleasa","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"f"},{"word":"Lungulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lungulescu"}},{"word":"Lungulești","pos":"name","definitions":["a village in Uda, Argeș County, Romania"],"gender":"m"},{"word":"lunguleț","pos":"adj","definitions":["longish"],"forms":{"feminine-singular":"lunguleață","masculine-plural":"lunguleți","feminine-neuter-plural":"lungulețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lunguleț","error-unrecognized-form-feminine-indefinite-singular":"lunguleață","error-unrecognized-form-indefinite-masculine-plural":"lunguleți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lungulețe","definite-error-unrecognized-form-masculine-neuter-singular":"lungulețul","definite-error-unrecognized-form-feminine-singular":"lunguleața","definite-error-unrecognized-form-masculine-plural":"lunguleții","definite-error-unrecognized-form-feminine-neuter-plural":"lungulețele"}},{"word":"Lungulețu","pos":"name","definitions":["a commune of Dâmbovița County, Romania","a village in Lungulețu, Dâmbovița County, Romania"],"gender":"m"},{"word":"Lunguț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lunguț"}},{"word":"lunguț","pos":"adj","definitions":["diminutive of lung"],"forms":{"feminine-singular":"lunguță","masculine-plural":"lunguți","feminine-neuter-plural":"lunguțe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lunguț","error-unrecognized-form-feminine-indefinite-singular":"lunguță","error-unrecognized-form-indefinite-masculine-plural":"lunguți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lunguțe","definite-error-unrecognized-form-masculine-neuter-singular":"lunguțul","definite-error-unrecognized-form-feminine-singular":"lunguța","definite-error-unrecognized-form-masculine-plural":"lunguții","definite-error-unrecognized-form-feminine-neuter-plural":"lunguțele"}},{"word":"Lunguțescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lunguțescu"}},{"word":"luni","pos":"noun","definitions":["Monday"],"pronunciation":"/ˈlunʲ/","forms":{"plural":"luni"}},{"word":"luni","pos":"noun","definitions":["inflection of lună:","plural","genitive/dative singular"],"pronunciation":"/ˈlunʲ/"},{"word":"luni de zile","pos":"noun","definitions":["many months"]},{"word":"lunică","pos":"noun","definitions":["diminutive of lună"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lunică","accusative-definite-nominative":"lunica","dative-genitive-indefinite":"lunice","dative-definite-genitive":"lunicei","vocative":"lunică"}},{"word":"lunie","pos":"noun","definitions":["somnambulism"],"forms":{"plural":"lunii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lunie","accusative-definite-nominative-singular":"lunia","accusative-indefinite-nominative-plural":"lunii","accusative-definite-nominative-plural":"luniile","dative-genitive-indefinite-singular":"lunii","dative-definite-genitive-singular":"luniei","dative-genitive-indefinite-plural":"lunii","dative-definite-genitive-plural":"luniilor","singular-vocative":"lunie","plural-vocative":"luniilor"}},{"word":"lunii","pos":"noun","definitions":["definite dative/genitive singular of lună"]},{"word":"lunile","pos":"noun","definitions":["definite nominative/accusative plural of lună"]},{"word":"lunilor","pos":"noun","definitions":["inflection of lună:","definite genitive/dative plural","vocative plural"]},{"word":"lunioară","pos":"noun","definitions":["diminutive of lună"],"forms":{"plural":"lunioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lunioară","accusative-definite-nominative-singular":"lunioara","accusative-indefinite-nominative-plural":"lunioare","accusative-definite-nominative-plural":"lunioarele","dative-genitive-indefinite-singular":"lunioare","dative-definite-genitive-singular":"lunioarei","dative-genitive-indefinite-plural":"lunioare","dative-definite-genitive-plural":"lunioarelor","singular-vocative":"lunioară","plural-vocative":"lunioarelor"}},{"word":"lunișoară","pos":"noun","definitions":["diminutive of lună"],"forms":{"plural":"lunișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lunișoară","accusative-definite-nominative-singular":"lunișoara","accusative-indefinite-nominative-plural":"lunișoare","accusative-definite-nominative-plural":"lunișoarele","dative-genitive-indefinite-singular":"lunișoare","dative-definite-genitive-singular":"lunișoarei","dative-genitive-indefinite-plural":"lunișoare","dative-definite-genitive-plural":"lunișoarelor","singular-vocative":"lunișoară","plural-vocative":"lunișoarelor"}},{"word":"luniță","pos":"noun","definitions":["diminutive of lună"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"luniță","accusative-definite-nominative":"lunița","dative-genitive-indefinite":"lunițe","dative-definite-genitive":"luniței","vocative":"luniță"}},{"word":"lunos","pos":"adj","definitions":["moon-lighted"],"forms":{"feminine-singular":"lunoasă","masculine-plural":"lunoși","feminine-neuter-plural":"lunoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lunos","error-unrecognized-form-feminine-indefinite-singular":"lunoasă","error-unrecognized-form-indefinite-masculine-plural":"lunoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lunoase","definite-error-unrecognized-form-masculine-neuter-singular":"lunosul","definite-error-unrecognized-form-feminine-singular":"lunoasa","definite-error-unrecognized-form-masculine-plural":"lunoșii","definite-error-unrecognized-form-feminine-neuter-plural":"lunoasele"}},{"word":"luntrar","pos":"noun","definitions":["boatman, ferryman, riverboatman"],"forms":{"plural":"luntrari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"luntrar","accusative-definite-nominative-singular":"luntrarul","accusative-indefinite-nominative-plural":"luntrari","accusative-definite-nominative-plural":"luntrarii","dative-genitive-indefinite-singular":"luntrar","dative-definite-genitive-singular":"luntrarului","dative-genitive-indefinite-plural":"luntrari","dative-definite-genitive-plural":"luntrarilor","singular-vocative":"luntrarule","plural-vocative":"luntrarilor"}},{"word":"luntraș","pos":"noun","definitions":["boatman, ferryman, riverboatman"],"forms":{"plural":"luntrași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"luntraș","accusative-definite-nominative-singular":"luntrașul","accusative-indefinite-nominative-plural":"luntrași","accusative-definite-nominative-plural":"luntrașii","dative-genitive-indefinite-singular":"luntraș","dative-definite-genitive-singular":"luntrașului","dative-genitive-indefinite-plural":"luntrași","dative-definite-genitive-plural":"luntrașilor","singular-vocative":"luntrașule","plural-vocative":"luntrașilor"}},{"word":"luntrașă","pos":"noun","definitions":["female equivalent of luntraș"],"forms":{"plural":"luntrașe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luntrașă","accusative-definite-nominative-singular":"luntrașa","accusative-indefinite-nominative-plural":"luntrașe","accusative-definite-nominative-plural":"luntrașele","dative-genitive-indefinite-singular":"luntrașe","dative-definite-genitive-singular":"luntrașei","dative-genitive-indefinite-plural":"luntrașe","dative-definite-genitive-plural":"luntrașelor","singular-vocative":"luntrașă","plural-vocative":"luntrașelor"}},{"word":"luntrășiță","pos":"noun","definitions":["female equivalent of luntraș"],"forms":{"plural":"luntrășițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luntrășiță","accusative-definite-nominative-singular":"luntrășița","accusative-indefinite-nominative-plural":"luntrășițe","accusative-definite-nominative-plural":"luntrășițele","dative-genitive-indefinite-singular":"luntrășițe","dative-definite-genitive-singular":"luntrășiței","dative-genitive-indefinite-plural":"luntrășițe","dative-definite-genitive-plural":"luntrășițelor","singular-vocative":"luntrășiță","plural-vocative":"luntrășițelor"}},{"word":"luntre","pos":"noun","definitions":["boat (usually small), especially a rowboat"],"forms":{"plural":"luntre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"luntre","accusative-definite-nominative-singular":"luntrea","accusative-indefinite-nominative-plural":"luntre","accusative-definite-nominative-plural":"luntrele","dative-genitive-indefinite-singular":"luntre","dative-definite-genitive-singular":"luntrei","dative-genitive-indefinite-plural":"luntre","dative-definite-genitive-plural":"luntrelor","singular-vocative":"luntre","plural-vocative":"luntrelor"}},{"word":"luntrei","pos":"noun","definitions":["definite genitive/dative singular of luntre"]},{"word":"luntri","pos":"verb","definitions":["to row a boat"],"forms":{"canonical":"a luntri 4th conjugation","present-singular-third-person":"luntrește","participle-past":"luntrit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a luntri","gerund":"luntrind","first-person-indicative-present-singular":"luntresc","indicative-present-second-person-singular":"luntrești","indicative-present-singular-third-person":"luntrește","first-person-indicative-plural-present":"luntrim","indicative-plural-present-second-person":"luntriți","indicative-plural-present-third-person":"luntresc","first-person-imperfect-indicative-singular":"luntream","imperfect-indicative-second-person-singular":"luntreai","imperfect-indicative-singular-third-person":"luntrea","first-person-imperfect-indicative-plural":"luntream","imperfect-indicative-plural-second-person":"luntreați","imperfect-indicative-plural-third-person":"luntreau","first-person-indicative-perfect-singular":"luntrii","indicative-perfect-second-person-singular":"luntriși","indicative-perfect-singular-third-person":"luntri","first-person-indicative-perfect-plural":"luntrirăm","indicative-perfect-plural-second-person":"luntrirăți","indicative-perfect-plural-third-person":"luntriră","first-person-indicative-pluperfect-singular":"luntrisem","indicative-pluperfect-second-person-singular":"luntriseși","indicative-pluperfect-singular-third-person":"luntrise","first-person-indicative-pluperfect-plural":"luntriserăm","indicative-pluperfect-plural-second-person":"luntriserăți","indicative-pluperfect-plural-third-person":"luntriseră","first-person-present-singular-subjunctive":"să luntresc","present-second-person-singular-subjunctive":"să luntrești","present-singular-subjunctive-third-person":"să luntrească","first-person-plural-present-subjunctive":"să luntrim","plural-present-second-person-subjunctive":"să luntriți","plural-present-subjunctive-third-person":"să luntrească","imperative-second-person-singular":"luntrește","imperative-plural-second-person":"luntriți","imperative-negative-second-person-singular":"nu luntri","imperative-negative-plural-second-person":"nu luntriți"}},{"word":"luntricică","pos":"noun","definitions":["diminutive of luntre; small boat"],"forms":{"plural":"luntricele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luntricică","accusative-definite-nominative-singular":"luntricica","accusative-indefinite-nominative-plural":"luntricice","accusative-definite-nominative-plural":"luntricicele","dative-genitive-indefinite-singular":"luntricice","dative-definite-genitive-singular":"luntricicei","dative-genitive-indefinite-plural":"luntricice","dative-definite-genitive-plural":"luntricicelor","singular-vocative":"luntricică","plural-vocative":"luntricicelor"}},{"word":"luntrioară","pos":"noun","definitions":["diminutive of luntre"],"forms":{"plural":"luntrioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luntrioară","accusative-definite-nominative-singular":"luntrioara","accusative-indefinite-nominative-plural":"luntrioare","accusative-definite-nominative-plural":"luntrioarele","dative-genitive-indefinite-singular":"luntrioare","dative-definite-genitive-singular":"luntrioarei","dative-genitive-indefinite-plural":"luntrioare","dative-definite-genitive-plural":"luntrioarelor","singular-vocative":"luntrioară","plural-vocative":"luntrioarelor"}},{"word":"Luntrișoara","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Lotru"],"gender":"f"},{"word":"luntrișoară","pos":"noun","definitions":["diminutive of luntre; small boat"],"forms":{"plural":"luntrișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luntrișoară","accusative-definite-nominative-singular":"luntrișoara","accusative-indefinite-nominative-plural":"luntrișoare","accusative-definite-nominative-plural":"luntrișoarele","dative-genitive-indefinite-singular":"luntrișoare","dative-definite-genitive-singular":"luntrișoarei","dative-genitive-indefinite-plural":"luntrișoare","dative-definite-genitive-plural":"luntrișoarelor","singular-vocative":"luntrișoară","plural-vocative":"luntrișoarelor"}},{"word":"luntriță","pos":"noun","definitions":["diminutive of luntre; small boat"],"forms":{"plural":"luntrite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luntriță","accusative-definite-nominative-singular":"luntrița","accusative-indefinite-nominative-plural":"luntrițe","accusative-definite-nominative-plural":"luntrițele","dative-genitive-indefinite-singular":"luntrițe","dative-definite-genitive-singular":"luntriței","dative-genitive-indefinite-plural":"luntrițe","dative-definite-genitive-plural":"luntrițelor","singular-vocative":"luntriță","plural-vocative":"luntrițelor"}},{"word":"luntru","pos":"adv","definitions":["obsolete form of înăuntru"]},{"word":"lunulă","pos":"noun","definitions":["lunula"],"forms":{"plural":"lunule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lunulă","accusative-definite-nominative-singular":"lunula","accusative-indefinite-nominative-plural":"lunule","accusative-definite-nominative-plural":"lunulele","dative-genitive-indefinite-singular":"lunule","dative-definite-genitive-singular":"lunulei","dative-genitive-indefinite-plural":"lunule","dative-definite-genitive-plural":"lunulelor","singular-vocative":"lunulă","plural-vocative":"lunulelor"}},{"word":"lunuliță","pos":"noun","definitions":["diminutive of lună"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lunuliță","accusative-definite-nominative":"lunulița","dative-genitive-indefinite":"lunulițe","dative-definite-genitive":"lunuliței","vocative":"lunuliță"}},{"word":"lunuță","pos":"noun","definitions":["diminutive of lună"],"forms":{"plural":"lunuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lunuță","accusative-definite-nominative-singular":"lunuța","accusative-indefinite-nominative-plural":"lunuțe","accusative-definite-nominative-plural":"lunuțele","dative-genitive-indefinite-singular":"lunuțe","dative-definite-genitive-singular":"lunuței","dative-genitive-indefinite-plural":"lunuțe","dative-definite-genitive-plural":"lunuțelor","singular-vocative":"lunuță","plural-vocative":"lunuțelor"}},{"word":"luotoare","pos":"noun","definitions":["bucket, pail"],"forms":{"plural":"luotori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"luotoare","accusative-definite-nominative-singular":"luotoarea","accusative-indefinite-nominative-plural":"luotori","accusative-definite-nominative-plural":"luotorile","dative-genitive-indefinite-singular":"luotori","dative-definite-genitive-singular":"luotorii","dative-genitive-indefinite-plural":"luotori","dative-definite-genitive-plural":"luotorilor","singular-vocative":"luotoare","plural-vocative":"luotorilor"}},{"word":"Lup","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lup"}},{"word":"lup","pos":"noun","definitions":["wolf"],"pronunciation":"/ˈlup/","forms":{"plural":"lupi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lup","accusative-definite-nominative-singular":"lupul","accusative-indefinite-nominative-plural":"lupi","accusative-definite-nominative-plural":"lupii","dative-genitive-indefinite-singular":"lup","dative-definite-genitive-singular":"lupului","dative-genitive-indefinite-plural":"lupi","dative-definite-genitive-plural":"lupilor","singular-vocative":"lupule","plural-vocative":"lupilor","alternative":"луп"}},{"word":"lup de mare","pos":"noun","definitions":["pomarine skua (Stercorarius pomarinus)","sailor"],"forms":{"plural":"lupi de mare"}},{"word":"lup de mare atlantic","pos":"noun","definitions":["great skua (Stercorarius skua)"],"forms":{"plural":"lupi de mare atlantici"}},{"word":"lup de mare codat","pos":"noun","definitions":["long-tailed jaeger (Stercorarius longicaudus)"],"forms":{"plural":"lupi de mare codați"}},{"word":"lup de mare mic","pos":"noun","definitions":["Arctic skua (Stercorarius parasiticus)"],"forms":{"plural":"lupi de mare mici"}},{"word":"lupă","pos":"noun","definitions":["magnifying glass"],"pronunciation":"/ˈlu.pə/","forms":{"plural":"lupe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lupă","accusative-definite-nominative-singular":"lupa","accusative-indefinite-nominative-plural":"lupe","accusative-definite-nominative-plural":"lupele","dative-genitive-indefinite-singular":"lupe","dative-definite-genitive-singular":"lupei","dative-genitive-indefinite-plural":"lupe","dative-definite-genitive-plural":"lupelor","singular-vocative":"lupă","plural-vocative":"lupelor"}},{"word":"Lupa-Recea","pos":"name","definitions":["a village in Codreanca, Strășeni Raion, Moldova"],"gender":"f"},{"word":"Lupac","pos":"name","definitions":["a commune of Caraș-Severin County, Romania","a village in Lupac, Caraș-Severin County, Romania"],"gender":"f"},{"word":"Lupăceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lupăceanu"}},{"word":"Lupăcescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lupăcescu"}},{"word":"Lupacul Mic","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Gelug"],"gender":"m"},{"word":"Lupăiescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lupăiescu"}},{"word":"Lupăiești","pos":"name","definitions":["a village in Poiana Vadului, Alba County, Romania"],"gender":"m"},{"word":"lupan","pos":"adj","definitions":["gray, grey"],"forms":{"feminine-singular":"lupană","masculine-plural":"lupani","feminine-neuter-plural":"lupane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lupan","error-unrecognized-form-feminine-indefinite-singular":"lupană","error-unrecognized-form-indefinite-masculine-plural":"lupani","error-unrecognized-form-feminine-indefinite-neuter-plural":"lupane","definite-error-unrecognized-form-masculine-neuter-singular":"lupanul","definite-error-unrecognized-form-feminine-singular":"lupana","definite-error-unrecognized-form-masculine-plural":"lupanii","definite-error-unrecognized-form-feminine-neuter-plural":"lupanele"}},{"word":"lupan","pos":"noun","definitions":["wolf cub"],"forms":{"plural":"lupani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lupan","accusative-definite-nominative-singular":"lupanul","accusative-indefinite-nominative-plural":"lupani","accusative-definite-nominative-plural":"lupanii","dative-genitive-indefinite-singular":"lupan","dative-definite-genitive-singular":"lupanului","dative-genitive-indefinite-plural":"lupani","dative-definite-genitive-plural":"lupanilor","singular-vocative":"lupanule","plural-vocative":"lupanilor"}},{"word":"lupanar","pos":"noun","definitions":["brothel"],"forms":{"plural":"lupanare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lupanar","accusative-definite-nominative-singular":"lupanarul","accusative-indefinite-nominative-plural":"lupanare","accusative-definite-nominative-plural":"lupanarele","dative-genitive-indefinite-singular":"lupanar","dative-definite-genitive-singular":"lupanarului","dative-genitive-indefinite-plural":"lupanare","dative-definite-genitive-plural":"lupanarelor","singular-vocative":"lupanarule","plural-vocative":"lupanarelor"}},{"word":"lupănaș","pos":"noun","definitions":["diminutive of lupan"],"forms":{"plural":"lupănași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lupănaș","accusative-definite-nominative-singular":"lupănașul","accusative-indefinite-nominative-plural":"lupănași","accusative-definite-nominative-plural":"lupănașii","dative-genitive-indefinite-singular":"lupănaș","dative-definite-genitive-singular":"lupănașului","dative-genitive-indefinite-plural":"lupănași","dative-definite-genitive-plural":"lupănașilor","singular-vocative":"lupănașule","plural-vocative":"lupănașilor"}},{"word":"lupănel","pos":"noun","definitions":["diminutive of lupan"],"forms":{"plural":"lupănei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lupănel","accusative-definite-nominative-singular":"lupănelul","accusative-indefinite-nominative-plural":"lupănei","accusative-definite-nominative-plural":"lupăneii","dative-genitive-indefinite-singular":"lupănel","dative-definite-genitive-singular":"lupănelului","dative-genitive-indefinite-plural":"lupănei","dative-definite-genitive-plural":"lupăneilor","singular-vocative":"lupănelule","plural-vocative":"lupăneilor"}},{"word":"Lupănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lupănescu"}},{"word":"lupănică","pos":"noun","definitions":["diminutive of lupan"],"forms":{"plural":"lupănici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lupănică","accusative-definite-nominative-singular":"lupănica","accusative-indefinite-nominative-plural":"lupănici","accusative-definite-nominative-plural":"lupănicile","dative-genitive-indefinite-singular":"lupănici","dative-definite-genitive-singular":"lupănicii","dative-genitive-indefinite-plural":"lupănici","dative-definite-genitive-plural":"lupănicilor","singular-vocative":"lupănică","plural-vocative":"lupănicilor"}},{"word":"lupăniță","pos":"noun","definitions":["diminutive of lupan"],"forms":{"plural":"lupănițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lupăniță","accusative-definite-nominative-singular":"lupănița","accusative-indefinite-nominative-plural":"lupănițe","accusative-definite-nominative-plural":"lupănițele","dative-genitive-indefinite-singular":"lupănițe","dative-definite-genitive-singular":"lupăniței","dative-genitive-indefinite-plural":"lupănițe","dative-definite-genitive-plural":"lupănițelor","singular-vocative":"lupăniță","plural-vocative":"lupănițelor"}},{"word":"Lupăria","pos":"name","definitions":["a village in Prăjeni, Botoșani County, Romania","a village in Cotnari, Iași County, Romania","a village in Ciolpani, Ilfov County, Romania"],"gender":"f"},{"word":"lupăria","pos":"noun","definitions":["definite nominative/accusative singular of lupărie"]},{"word":"lupărie","pos":"noun","definitions":["pack of wolves"],"forms":{"plural":"lupării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lupărie","accusative-definite-nominative-singular":"lupăria","accusative-indefinite-nominative-plural":"lupării","accusative-definite-nominative-plural":"lupăriile","dative-genitive-indefinite-singular":"lupării","dative-definite-genitive-singular":"lupăriei","dative-genitive-indefinite-plural":"lupării","dative-definite-genitive-plural":"lupăriilor","singular-vocative":"lupărie","plural-vocative":"lupăriilor"}},{"word":"lupăriei","pos":"noun","definitions":["definite genitive/dative singular of lupărie"]},{"word":"lupării","pos":"noun","definitions":["inflection of lupărie:","indefinite nominative/accusative/genitive/dative plural","indefinite genitive/dative singular"]},{"word":"lupăriile","pos":"noun","definitions":["definite nominative/accusative plural of lupărie"]},{"word":"lupăriilor","pos":"noun","definitions":["definite genitive/dative plural of lupărie"]},{"word":"Lupaș","pos":"name","definitions":["a surname"]},{"word":"Lupașcu","pos":"name","definitions":["a surname"],"pronunciation":"/luˈpaʃ.ku/","gender":"mfbysense","forms":{"alternative":"Лупашку"}},{"word":"Lupăștean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lupăștean"}},{"word":"Lupășteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lupășteanu"}},{"word":"lupească","pos":"adj","definitions":["feminine singular of lupesc"],"pronunciation":"/luˈpe̯as.kə/","gender":"f"},{"word":"Lupele","pos":"name","definitions":["a village in Pechea, Galați County, Romania"],"gender":"m"},{"word":"Lupeni","pos":"name","definitions":["a commune of Harghita County, Romania","a village in Lupeni, Harghita County, Romania","a city in Hunedoara County, Romania"],"pronunciation":"/luˈpenʲ/","gender":"m"},{"word":"lupercalii","pos":"noun","definitions":["Lupercalia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"lupercalii","accusative-definite-nominative":"lupercaliile","dative-genitive-indefinite":"lupercalii","dative-definite-genitive":"lupercaliilor","vocative":"-"}},{"word":"lupesc","pos":"adj","definitions":["wolflike, wolfish, lupine","wolf's"],"pronunciation":"/luˈpesk/","forms":{"feminine-singular":"lupească","plural":"lupești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lupesc","error-unrecognized-form-feminine-indefinite-singular":"lupească","error-unrecognized-form-indefinite-masculine-plural":"lupești","error-unrecognized-form-feminine-indefinite-neuter-plural":"lupești","definite-error-unrecognized-form-masculine-neuter-singular":"lupescul","definite-error-unrecognized-form-feminine-singular":"lupeasca","definite-error-unrecognized-form-masculine-plural":"lupeștii","definite-error-unrecognized-form-feminine-neuter-plural":"lupeștile"}},{"word":"Lupescu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lupescu"}},{"word":"lupește","pos":"adv","definitions":["wolfly"]},{"word":"Lupești","pos":"name","definitions":["a village in Vărădia de Mureș, Arad County, Romania","a village in Mănăstirea Cașin, Bacău County, Romania","a village in Mălușteni, Vaslui County, Romania"],"gender":"m"},{"word":"lupești","pos":"adj","definitions":["plural of lupesc"],"pronunciation":"/luˈpeʃtʲ/"},{"word":"lupi","pos":"noun","definitions":["indefinite plural of lup (“wolf”)"],"pronunciation":"/ˈlupʲ/"},{"word":"Lupică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lupică"}},{"word":"lupii","pos":"noun","definitions":["definite nominative/accusative plural of lup"]},{"word":"lupilor","pos":"noun","definitions":["definite genitive/dative plural of lup"]},{"word":"luping","pos":"noun","definitions":["alternative form of looping"],"forms":{"plural":"lupinguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"luping","accusative-definite-nominative-singular":"lupingul","accusative-indefinite-nominative-plural":"lupinguri","accusative-definite-nominative-plural":"lupingurile","dative-genitive-indefinite-singular":"luping","dative-definite-genitive-singular":"lupingului","dative-genitive-indefinite-plural":"lupinguri","dative-definite-genitive-plural":"lupingurilor","singular-vocative":"lupingule","plural-vocative":"lupingurilor"}},{"word":"lupinoză","pos":"noun","definitions":["lupinosis"],"forms":{"plural":"lupinoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lupinoză","accusative-definite-nominative-singular":"lupinoza","accusative-indefinite-nominative-plural":"lupinoze","accusative-definite-nominative-plural":"lupinozele","dative-genitive-indefinite-singular":"lupinoze","dative-definite-genitive-singular":"lupinozei","dative-genitive-indefinite-plural":"lupinoze","dative-definite-genitive-plural":"lupinozelor","singular-vocative":"lupinoză","plural-vocative":"lupinozelor"}},{"word":"lupiță","pos":"noun","definitions":["cockscomb (Celosia argentea var. cristata)"],"forms":{"plural":"lupițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lupiță","accusative-definite-nominative-singular":"lupița","accusative-indefinite-nominative-plural":"lupițe","accusative-definite-nominative-plural":"lupițele","dative-genitive-indefinite-singular":"lupițe","dative-definite-genitive-singular":"lupiței","dative-genitive-indefinite-plural":"lupițe","dative-definite-genitive-plural":"lupițelor","singular-vocative":"lupiță","plural-vocative":"lupițelor"}},{"word":"lupiu","pos":"adj","definitions":["wolf-colored"],"forms":{"feminine-singular":"lupie","plural":"lupii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lupiu","error-unrecognized-form-feminine-indefinite-singular":"lupie","error-unrecognized-form-indefinite-masculine-plural":"lupii","error-unrecognized-form-feminine-indefinite-neuter-plural":"lupii","definite-error-unrecognized-form-masculine-neuter-singular":"lupiul","definite-error-unrecognized-form-feminine-singular":"lupia","definite-error-unrecognized-form-masculine-plural":"lupiii","definite-error-unrecognized-form-feminine-neuter-plural":"lupiile"}},{"word":"Lupoae","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Lupoae"}},{"word":"Lupoaia","pos":"name","definitions":["a village in Holod, Bihor County, Romania","a village in Cătunele, Gorj County, Romania","a village in Creaca, Sălaj County, Romania","a village in Pesceana, Vâlcea County, Romania","a village in Dumitrești, Vrancea County, Romania"],"gender":"f"},{"word":"lupoaica","pos":"noun","definitions":["definite nominative/accusative singular of lupoaică"]},{"word":"lupoaică","pos":"noun","definitions":["she-wolf"],"forms":{"plural":"lupoaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lupoaică","accusative-definite-nominative-singular":"lupoaica","accusative-indefinite-nominative-plural":"lupoaice","accusative-definite-nominative-plural":"lupoaicele","dative-genitive-indefinite-singular":"lupoaice","dative-definite-genitive-singular":"lupoaicei","dative-genitive-indefinite-plural":"lupoaice","dative-definite-genitive-plural":"lupoaicelor","singular-vocative":"lupoaică","plural-vocative":"lupoaicelor"}},{"word":"lupoaice","pos":"noun","definitions":["inflection of lupoaică:","indefinite nominative/accusative/genitive/dative plural","indefinite genitive/dative singular"]},{"word":"lupoaicei","pos":"noun","definitions":["definite genitive/dative singular of lupoaică"]},{"word":"lupoaicele","pos":"noun","definitions":["definite nominative/accusative plural of lupoaică"]},{"word":"lupoaicelor","pos":"noun","definitions":["definite genitive/dative plural of lupoaică"]},{"word":"lupoaie","pos":"noun","definitions":["she-wolf","broom rape (Orobanche ramosa)"],"forms":{"plural":"lupoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lupoaie","accusative-definite-nominative-singular":"lupoaia","accusative-indefinite-nominative-plural":"lupoaie","accusative-definite-nominative-plural":"lupoaiele","dative-genitive-indefinite-singular":"lupoaie","dative-definite-genitive-singular":"lupoaiei","dative-genitive-indefinite-plural":"lupoaie","dative-definite-genitive-plural":"lupoaielor","singular-vocative":"lupoaie","plural-vocative":"lupoaielor"}},{"word":"Lupoi","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lupoi"}},{"word":"lupoi","pos":"noun","definitions":["augmentative of lup","male wolf"],"forms":{"plural":"lupoi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lupoi","accusative-definite-nominative-singular":"lupoiul","accusative-indefinite-nominative-plural":"lupoi","accusative-definite-nominative-plural":"lupoii","dative-genitive-indefinite-singular":"lupoi","dative-definite-genitive-singular":"lupoiului","dative-genitive-indefinite-plural":"lupoi","dative-definite-genitive-plural":"lupoilor","singular-vocative":"lupoiule","plural-vocative":"lupoilor"}},{"word":"lupoid","pos":"adj","definitions":["lupoid"],"forms":{"feminine-singular":"lupoidă","masculine-plural":"lupoizi","feminine-neuter-plural":"lupoide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lupoid","error-unrecognized-form-feminine-indefinite-singular":"lupoidă","error-unrecognized-form-indefinite-masculine-plural":"lupoizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"lupoide","definite-error-unrecognized-form-masculine-neuter-singular":"lupoidul","definite-error-unrecognized-form-feminine-singular":"lupoida","definite-error-unrecognized-form-masculine-plural":"lupoizii","definite-error-unrecognized-form-feminine-neuter-plural":"lupoidele"}},{"word":"Lupoița","pos":"name","definitions":["a village in Motru, Gorj County, Romania"],"gender":"f"},{"word":"Lupșa","pos":"name","definitions":["a commune of Alba County, Romania","a village in Lupșa, Alba County, Romania","a village in Hoghiz, Brașov County, Romania"],"gender":"f"},{"word":"Lupșa de Jos","pos":"name","definitions":["a village in Broșteni, Mehedinți County, Romania"],"gender":"f"},{"word":"Lupșa de Sus","pos":"name","definitions":["a village in Broșteni, Mehedinți County, Romania"],"gender":"f"},{"word":"Lupșan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lupșan"}},{"word":"Lupșanu","pos":"name","definitions":["a commune of Călărași County, Romania","a village in Lupșanu, Călărași County, Romania"],"gender":"m"},{"word":"Lupșeneanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lupșeneanu"}},{"word":"Lupșeni","pos":"name","definitions":["a village in Galda de Jos, Alba County, Romania"],"gender":"m"},{"word":"Lupșescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lupșescu"}},{"word":"Lupșoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lupșoiu"}},{"word":"lupt","pos":"verb","definitions":["first-person singular present indicative/subjunctive of lupta"],"pronunciation":"[lupt]"},{"word":"lupta","pos":"verb","definitions":["to battle","to fight (strive against)"],"pronunciation":"/lupˈta/","forms":{"canonical":"a lupta 1st conjugation","present-singular-third-person":"luptă","participle-past":"luptat","subjunctive-third-person":"lupte","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a lupta","gerund":"luptând","first-person-indicative-present-singular":"lupt","indicative-present-second-person-singular":"lupți","indicative-present-singular-third-person":"luptă","first-person-indicative-plural-present":"luptăm","indicative-plural-present-second-person":"luptați","indicative-plural-present-third-person":"luptă","first-person-imperfect-indicative-singular":"luptam","imperfect-indicative-second-person-singular":"luptai","imperfect-indicative-singular-third-person":"lupta","first-person-imperfect-indicative-plural":"luptam","imperfect-indicative-plural-second-person":"luptați","imperfect-indicative-plural-third-person":"luptau","first-person-indicative-perfect-singular":"luptai","indicative-perfect-second-person-singular":"luptași","indicative-perfect-singular-third-person":"luptă","first-person-indicative-perfect-plural":"luptarăm","indicative-perfect-plural-second-person":"luptarăți","indicative-perfect-plural-third-person":"luptară","first-person-indicative-pluperfect-singular":"luptasem","indicative-pluperfect-second-person-singular":"luptaseși","indicative-pluperfect-singular-third-person":"luptase","first-person-indicative-pluperfect-plural":"luptaserăm","indicative-pluperfect-plural-second-person":"luptaserăți","indicative-pluperfect-plural-third-person":"luptaseră","first-person-present-singular-subjunctive":"să lupt","present-second-person-singular-subjunctive":"să lupți","present-singular-subjunctive-third-person":"să lupte","first-person-plural-present-subjunctive":"să luptăm","plural-present-second-person-subjunctive":"să luptați","plural-present-subjunctive-third-person":"să lupte","imperative-second-person-singular":"luptă","imperative-plural-second-person":"luptați","imperative-negative-second-person-singular":"nu lupta","imperative-negative-plural-second-person":"nu luptați"}},{"word":"luptă","pos":"noun","definitions":["fight, fighting"],"forms":{"plural":"lupte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luptă","accusative-definite-nominative-singular":"lupta","accusative-indefinite-nominative-plural":"lupte","accusative-definite-nominative-plural":"luptele","dative-genitive-indefinite-singular":"lupte","dative-definite-genitive-singular":"luptei","dative-genitive-indefinite-plural":"lupte","dative-definite-genitive-plural":"luptelor","singular-vocative":"luptă","plural-vocative":"luptelor"}},{"word":"luptă","pos":"verb","definitions":["inflection of lupta:","third-person singular/plural present indicative","third-person singular simple perfect indicative","second-person singular imperative"]},{"word":"lupta cu morile de vânt","pos":"verb","definitions":["to do something without any chances of success"],"forms":{"canonical":"a lupta cu morile de vânt 1st conjugation","present-singular-third-person":"luptă cu morile de vânt","participle-past":"luptat cu morile de vânt"}},{"word":"luptă de clasă","pos":"noun","definitions":["class struggle"]},{"word":"luptare","pos":"noun","definitions":["fighting"],"forms":{"plural":"luptări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"luptare","accusative-definite-nominative-singular":"luptarea","accusative-indefinite-nominative-plural":"luptări","accusative-definite-nominative-plural":"luptările","dative-genitive-indefinite-singular":"luptări","dative-definite-genitive-singular":"luptării","dative-genitive-indefinite-plural":"luptări","dative-definite-genitive-plural":"luptărilor","singular-vocative":"luptare","plural-vocative":"luptărilor"}},{"word":"luptaș","pos":"noun","definitions":["fighter"],"pronunciation":"/lupˈtaʃ/","forms":{"plural":"luptași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"luptaș","accusative-definite-nominative-singular":"luptașul","accusative-indefinite-nominative-plural":"luptași","accusative-definite-nominative-plural":"luptașii","dative-genitive-indefinite-singular":"luptaș","dative-definite-genitive-singular":"luptașului","dative-genitive-indefinite-plural":"luptași","dative-definite-genitive-plural":"luptașilor","singular-vocative":"luptașule","plural-vocative":"luptașilor"}},{"word":"luptătoare","pos":"noun","definitions":["female equivalent of luptător"],"forms":{"plural":"luptătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"luptătoare","accusative-definite-nominative-singular":"luptătoarea","accusative-indefinite-nominative-plural":"luptătoare","accusative-definite-nominative-plural":"luptătoarele","dative-genitive-indefinite-singular":"luptătoare","dative-definite-genitive-singular":"luptătoarei","dative-genitive-indefinite-plural":"luptătoare","dative-definite-genitive-plural":"luptătoarelor","singular-vocative":"luptătoare","plural-vocative":"luptătoarelor"}},{"word":"luptător","pos":"noun","definitions":["fighter","champion","warrior","wrestler"],"forms":{"plural":"luptători"}},{"word":"Luptători","pos":"name","definitions":["a village in Frăsinet, Călărași County, Romania"],"gender":"m"},{"word":"luptători","pos":"noun","definitions":["plural of luptător"]},{"word":"lupte","pos":"noun","definitions":["plural of luptă"],"gender":"f-p"},{"word":"lupte","pos":"verb","definitions":["third-person singular/plural present subjunctive of lupta"]},{"word":"lupte greco-romane","pos":"noun","definitions":["Graeco-Roman wrestling"]},{"word":"Lupu","pos":"name","definitions":["a village in Cergău, Alba County, Romania"],"gender":"m"},{"word":"Lupueni","pos":"name","definitions":["a village in Băbana, Argeș County, Romania"],"gender":"m"},{"word":"Lupuiești","pos":"name","definitions":["a village in Roșiile, Vâlcea County, Romania"],"gender":"m"},{"word":"Lupul","pos":"name","definitions":["a river in Galați, Romania, tributary to the Bârlad","a river in Vâlcea, Romania, tributary to the Călinești","a river in Harghita, Romania, tributary to the Dămuc","a river in Vâlcea, Romania, tributary to the Lotru","a river in Bacău, Romania, tributary to the Sulța"],"gender":"m"},{"word":"lupul","pos":"noun","definitions":["definite nominative/accusative singular of lup"]},{"word":"lupul își schimbă părul, dar năravul ba","pos":"proverb","definitions":["the wolf may lose his teeth but never his nature"]},{"word":"Lupuleasa","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"f"},{"word":"Lupulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lupulescu"}},{"word":"Lupulești","pos":"name","definitions":["a village in Bucium, Alba County, Romania"],"gender":"m"},{"word":"Lupuleț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lupuleț"}},{"word":"Lupulete","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Lupulete"}},{"word":"lupulină","pos":"noun","definitions":["lupulin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lupulină","accusative-definite-nominative":"lupulina","dative-genitive-indefinite":"lupuline","dative-definite-genitive":"lupulinei","vocative":"lupulină"}},{"word":"Lupului","pos":"name","definitions":["a river in Iași, Romania, tributary to the Bahlui","a river in Gorj, Romania, tributary to the Bistrița","a river in Satu Mare, Romania, tributary to the Homorod"],"gender":"m"},{"word":"lupului","pos":"noun","definitions":["definite genitive/dative singular of lup"]},{"word":"lupus","pos":"noun","definitions":["lupus"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lupus","accusative-definite-nominative":"lupusul","dative-genitive-indefinite":"lupus","dative-definite-genitive":"lupusului","vocative":"lupusule"}},{"word":"Lupuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Lupuț"}},{"word":"lurex","pos":"noun","definitions":["Lurex"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lurex","accusative-definite-nominative":"lurexul","dative-genitive-indefinite":"lurex","dative-definite-genitive":"lurexului","vocative":"lurexule"}},{"word":"luș","pos":"adj","definitions":["cross-eyed"],"forms":{"feminine-singular":"lușă","masculine-plural":"luși","feminine-neuter-plural":"lușe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"luș","error-unrecognized-form-feminine-indefinite-singular":"lușă","error-unrecognized-form-indefinite-masculine-plural":"luși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lușe","definite-error-unrecognized-form-masculine-neuter-singular":"lușul","definite-error-unrecognized-form-feminine-singular":"lușa","definite-error-unrecognized-form-masculine-plural":"lușii","definite-error-unrecognized-form-feminine-neuter-plural":"lușele"}},{"word":"lușa","pos":"verb","definitions":["to be cross-eyed, to be squint-eyed, to squint"],"forms":{"canonical":"a lușa 1st conjugation","present-singular-third-person":"lușează","participle-past":"lușat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a lușa","gerund":"lușând","first-person-indicative-present-singular":"lușez","indicative-present-second-person-singular":"lușezi","indicative-present-singular-third-person":"lușează","first-person-indicative-plural-present":"lușăm","indicative-plural-present-second-person":"lușați","indicative-plural-present-third-person":"lușează","first-person-imperfect-indicative-singular":"lușam","imperfect-indicative-second-person-singular":"lușai","imperfect-indicative-singular-third-person":"lușa","first-person-imperfect-indicative-plural":"lușam","imperfect-indicative-plural-second-person":"lușați","imperfect-indicative-plural-third-person":"lușau","first-person-indicative-perfect-singular":"lușai","indicative-perfect-second-person-singular":"lușași","indicative-perfect-singular-third-person":"lușă","first-person-indicative-perfect-plural":"lușarăm","indicative-perfect-plural-second-person":"lușarăți","indicative-perfect-plural-third-person":"lușară","first-person-indicative-pluperfect-singular":"lușasem","indicative-pluperfect-second-person-singular":"lușaseși","indicative-pluperfect-singular-third-person":"lușase","first-person-indicative-pluperfect-plural":"lușaserăm","indicative-pluperfect-plural-second-person":"lușaserăți","indicative-pluperfect-plural-third-person":"lușaseră","first-person-present-singular-subjunctive":"să lușez","present-second-person-singular-subjunctive":"să lușezi","present-singular-subjunctive-third-person":"să lușeze","first-person-plural-present-subjunctive":"să lușăm","plural-present-second-person-subjunctive":"să lușați","plural-present-subjunctive-third-person":"să lușeze","imperative-second-person-singular":"lușează","imperative-plural-second-person":"lușați","imperative-negative-second-person-singular":"nu lușa","imperative-negative-plural-second-person":"nu lușați"}},{"word":"Lușca","pos":"name","definitions":["a locality in Năsăud, Bistrița-Năsăud County, Romania"],"gender":"f"},{"word":"lușcă","pos":"noun","definitions":["daffodil"],"forms":{"plural":"luști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lușcă","accusative-definite-nominative-singular":"lușca","accusative-indefinite-nominative-plural":"luște","accusative-definite-nominative-plural":"luștele","dative-genitive-indefinite-singular":"luște","dative-definite-genitive-singular":"luștei","dative-genitive-indefinite-plural":"luște","dative-definite-genitive-plural":"luștelor","singular-vocative":"lușcă","plural-vocative":"luștelor"}},{"word":"Lușcan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Lușcan"}},{"word":"luscuță","pos":"noun","definitions":["diminutive of luscă"],"forms":{"plural":"luscuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luscuță","accusative-definite-nominative-singular":"luscuța","accusative-indefinite-nominative-plural":"luscuțe","accusative-definite-nominative-plural":"luscuțele","dative-genitive-indefinite-singular":"luscuțe","dative-definite-genitive-singular":"luscuței","dative-genitive-indefinite-plural":"luscuțe","dative-definite-genitive-plural":"luscuțelor","singular-vocative":"luscuță","plural-vocative":"luscuțelor"}},{"word":"lușcuță","pos":"noun","definitions":["diminutive of lușcă"],"forms":{"plural":"lușcuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lușcuță","accusative-definite-nominative-singular":"lușcuța","accusative-indefinite-nominative-plural":"lușcuțe","accusative-definite-nominative-plural":"lușcuțele","dative-genitive-indefinite-singular":"lușcuțe","dative-definite-genitive-singular":"lușcuței","dative-genitive-indefinite-plural":"lușcuțe","dative-definite-genitive-plural":"lușcuțelor","singular-vocative":"lușcuță","plural-vocative":"lușcuțelor"}},{"word":"lusitan","pos":"noun","definitions":["Lusitanian"],"forms":{"plural":"lusitani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lusitan","accusative-definite-nominative-singular":"lusitanul","accusative-indefinite-nominative-plural":"lusitani","accusative-definite-nominative-plural":"lusitanii","dative-genitive-indefinite-singular":"lusitan","dative-definite-genitive-singular":"lusitanului","dative-genitive-indefinite-plural":"lusitani","dative-definite-genitive-plural":"lusitanilor","singular-vocative":"lusitanule","plural-vocative":"lusitanilor"}},{"word":"lusitană","pos":"noun","definitions":["female equivalent of lusitan"],"forms":{"plural":"lusitane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lusitană","accusative-definite-nominative-singular":"lusitana","accusative-indefinite-nominative-plural":"lusitane","accusative-definite-nominative-plural":"lusitanele","dative-genitive-indefinite-singular":"lusitane","dative-definite-genitive-singular":"lusitanei","dative-genitive-indefinite-plural":"lusitane","dative-definite-genitive-plural":"lusitanelor","singular-vocative":"lusitană","plural-vocative":"lusitanelor"}},{"word":"lusitanian","pos":"adj","definitions":["Lusitanian"],"forms":{"feminine-singular":"lusitaniană","masculine-plural":"lusitanieni","feminine-neuter-plural":"lusitaniene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lusitanian","error-unrecognized-form-feminine-indefinite-singular":"lusitaniană","error-unrecognized-form-indefinite-masculine-plural":"lusitanieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"lusitaniene","definite-error-unrecognized-form-masculine-neuter-singular":"lusitanianul","definite-error-unrecognized-form-feminine-singular":"lusitaniana","definite-error-unrecognized-form-masculine-plural":"lusitanienii","definite-error-unrecognized-form-feminine-neuter-plural":"lusitanienele"}},{"word":"lusitanian","pos":"noun","definitions":["Lusitanian"],"forms":{"plural":"lusitanieni","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lusitanian","accusative-definite-nominative-singular":"lusitanianul","accusative-indefinite-nominative-plural":"lusitanieni","accusative-definite-nominative-plural":"lusitanienile","dative-genitive-indefinite-singular":"lusitanian","dative-definite-genitive-singular":"lusitanianului","dative-genitive-indefinite-plural":"lusitanieni","dative-definite-genitive-plural":"lusitanienilor","singular-vocative":"lusitanianule","plural-vocative":"lusitanienilor"}},{"word":"lustră","pos":"noun","definitions":["ceiling lamp"],"forms":{"plural":"lustre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lustră","accusative-definite-nominative-singular":"lustrăul","accusative-indefinite-nominative-plural":"lustre","accusative-definite-nominative-plural":"lustrele","dative-genitive-indefinite-singular":"lustră","dative-definite-genitive-singular":"lustrăului","dative-genitive-indefinite-plural":"lustre","dative-definite-genitive-plural":"lustrelor","singular-vocative":"lustrăule","plural-vocative":"lustrelor"}},{"word":"lustragerie","pos":"noun","definitions":["shoeshiner's shop"],"forms":{"plural":"lustragerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lustragerie","accusative-definite-nominative-singular":"lustrageria","accusative-indefinite-nominative-plural":"lustragerii","accusative-definite-nominative-plural":"lustrageriile","dative-genitive-indefinite-singular":"lustragerii","dative-definite-genitive-singular":"lustrageriei","dative-genitive-indefinite-plural":"lustragerii","dative-definite-genitive-plural":"lustrageriilor","singular-vocative":"lustragerie","plural-vocative":"lustrageriilor"}},{"word":"lustragioaică","pos":"noun","definitions":["female equivalent of lustragiu"],"forms":{"plural":"lustragioaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lustragioaică","accusative-definite-nominative-singular":"lustragioaica","accusative-indefinite-nominative-plural":"lustragioaice","accusative-definite-nominative-plural":"lustragioaicele","dative-genitive-indefinite-singular":"lustragioaice","dative-definite-genitive-singular":"lustragioaicei","dative-genitive-indefinite-plural":"lustragioaice","dative-definite-genitive-plural":"lustragioaicelor","singular-vocative":"lustragioaică","plural-vocative":"lustragioaicelor"}},{"word":"lustragiu","pos":"noun","definitions":["shoeshiner"],"forms":{"plural":"lustragii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lustragiu","accusative-definite-nominative-singular":"lustragiul","accusative-indefinite-nominative-plural":"lustragii","accusative-definite-nominative-plural":"lustragiii","dative-genitive-indefinite-singular":"lustragiu","dative-definite-genitive-singular":"lustragiului","dative-genitive-indefinite-plural":"lustragii","dative-definite-genitive-plural":"lustragiilor","singular-vocative":"lustragiule","plural-vocative":"lustragiilor"}},{"word":"lustral","pos":"adj","definitions":["lustral"],"forms":{"feminine-singular":"lustrală","masculine-plural":"lustrali","feminine-neuter-plural":"lustrale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lustral","error-unrecognized-form-feminine-indefinite-singular":"lustrală","error-unrecognized-form-indefinite-masculine-plural":"lustrali","error-unrecognized-form-feminine-indefinite-neuter-plural":"lustrale","definite-error-unrecognized-form-masculine-neuter-singular":"lustralul","definite-error-unrecognized-form-feminine-singular":"lustrala","definite-error-unrecognized-form-masculine-plural":"lustralii","definite-error-unrecognized-form-feminine-neuter-plural":"lustralele"}},{"word":"lustrație","pos":"noun","definitions":["lustration"],"forms":{"plural":"lustrații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lustrație","accusative-definite-nominative-singular":"lustrația","accusative-indefinite-nominative-plural":"lustrații","accusative-definite-nominative-plural":"lustrațiile","dative-genitive-indefinite-singular":"lustrații","dative-definite-genitive-singular":"lustrației","dative-genitive-indefinite-plural":"lustrații","dative-definite-genitive-plural":"lustrațiilor","singular-vocative":"lustrație","plural-vocative":"lustrațiilor"}},{"word":"lustrin","pos":"noun","definitions":["lutestring"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lustrin","accusative-definite-nominative":"lustrinul","dative-genitive-indefinite":"lustrin","dative-definite-genitive":"lustrinului","vocative":"lustrinule"}},{"word":"lustrină","pos":"noun","definitions":["alternative form of lustrin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"lustrină","accusative-definite-nominative":"lustrina","dative-genitive-indefinite":"lustrine","dative-definite-genitive":"lustrinei","vocative":"lustrină"}},{"word":"lustru","pos":"noun","definitions":["shine, gloss"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lustru","accusative-definite-nominative":"lustruul","dative-genitive-indefinite":"lustru","dative-definite-genitive":"lustruului","vocative":"lustruule"}},{"word":"lustrui","pos":"verb","definitions":["to polish"],"forms":{"canonical":"a lustrui 4th conjugation","present-singular-third-person":"lustruiește","participle-past":"lustruit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a lustrui","gerund":"lustruind","first-person-indicative-present-singular":"lustruiesc","indicative-present-second-person-singular":"lustruiești","indicative-present-singular-third-person":"lustruiește","first-person-indicative-plural-present":"lustruim","indicative-plural-present-second-person":"lustruiți","indicative-plural-present-third-person":"lustruiesc","first-person-imperfect-indicative-singular":"lustruiam","imperfect-indicative-second-person-singular":"lustruiai","imperfect-indicative-singular-third-person":"lustruia","first-person-imperfect-indicative-plural":"lustruiam","imperfect-indicative-plural-second-person":"lustruiați","imperfect-indicative-plural-third-person":"lustruiau","first-person-indicative-perfect-singular":"lustruii","indicative-perfect-second-person-singular":"lustruiși","indicative-perfect-singular-third-person":"lustrui","first-person-indicative-perfect-plural":"lustruirăm","indicative-perfect-plural-second-person":"lustruirăți","indicative-perfect-plural-third-person":"lustruiră","first-person-indicative-pluperfect-singular":"lustruisem","indicative-pluperfect-second-person-singular":"lustruiseși","indicative-pluperfect-singular-third-person":"lustruise","first-person-indicative-pluperfect-plural":"lustruiserăm","indicative-pluperfect-plural-second-person":"lustruiserăți","indicative-pluperfect-plural-third-person":"lustruiseră","first-person-present-singular-subjunctive":"să lustruiesc","present-second-person-singular-subjunctive":"să lustruiești","present-singular-subjunctive-third-person":"să lustruiască","first-person-plural-present-subjunctive":"să lustruim","plural-present-second-person-subjunctive":"să lustruiți","plural-present-subjunctive-third-person":"să lustruiască","imperative-second-person-singular":"lustruiește","imperative-plural-second-person":"lustruiți","imperative-negative-second-person-singular":"nu lustrui","imperative-negative-plural-second-person":"nu lustruiți"}},{"word":"lustruială","pos":"noun","definitions":["polishing"],"forms":{"plural":"lustruieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"lustruială","accusative-definite-nominative-singular":"lustruiala","accusative-indefinite-nominative-plural":"lustruieli","accusative-definite-nominative-plural":"lustruielile","dative-genitive-indefinite-singular":"lustruieli","dative-definite-genitive-singular":"lustruielii","dative-genitive-indefinite-plural":"lustruieli","dative-definite-genitive-plural":"lustruielilor","singular-vocative":"lustruială","plural-vocative":"lustruielilor"}},{"word":"lustruire","pos":"noun","definitions":["polish"],"forms":{"plural":"lustruiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"lustruire","accusative-definite-nominative-singular":"lustruirea","accusative-indefinite-nominative-plural":"lustruiri","accusative-definite-nominative-plural":"lustruirile","dative-genitive-indefinite-singular":"lustruiri","dative-definite-genitive-singular":"lustruirii","dative-genitive-indefinite-plural":"lustruiri","dative-definite-genitive-plural":"lustruirilor","singular-vocative":"lustruire","plural-vocative":"lustruirilor"}},{"word":"lustruit","pos":"adj","definitions":["polished"],"forms":{"feminine-singular":"lustruită","masculine-plural":"lustruiți","feminine-neuter-plural":"lustruite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lustruit","error-unrecognized-form-feminine-indefinite-singular":"lustruită","error-unrecognized-form-indefinite-masculine-plural":"lustruiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"lustruite","definite-error-unrecognized-form-masculine-neuter-singular":"lustruitul","definite-error-unrecognized-form-feminine-singular":"lustruita","definite-error-unrecognized-form-masculine-plural":"lustruiții","definite-error-unrecognized-form-feminine-neuter-plural":"lustruitele"}},{"word":"lustruitoare","pos":"noun","definitions":["female equivalent of lustruitor"],"forms":{"plural":"lustruitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"lustruitoare","accusative-definite-nominative-singular":"lustruitoarea","accusative-indefinite-nominative-plural":"lustruitoare","accusative-definite-nominative-plural":"lustruitoarele","dative-genitive-indefinite-singular":"lustruitoare","dative-definite-genitive-singular":"lustruitoarei","dative-genitive-indefinite-plural":"lustruitoare","dative-definite-genitive-plural":"lustruitoarelor","singular-vocative":"lustruitoare","plural-vocative":"lustruitoarelor"}},{"word":"lustruitor","pos":"noun","definitions":["shoeshiner","polisher"],"forms":{"plural":"lustruitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lustruitor","accusative-definite-nominative-singular":"lustruitorul","accusative-indefinite-nominative-plural":"lustruitori","accusative-definite-nominative-plural":"lustruitorii","dative-genitive-indefinite-singular":"lustruitor","dative-definite-genitive-singular":"lustruitorului","dative-genitive-indefinite-plural":"lustruitori","dative-definite-genitive-plural":"lustruitorilor","singular-vocative":"lustruitorule","plural-vocative":"lustruitorilor"}},{"word":"lut","pos":"noun","definitions":["clay, loam","mud, dirt"],"forms":{"plural":"luturi"}},{"word":"Luța","pos":"name","definitions":["a village in Beclean, Brașov County, Romania"],"gender":"f"},{"word":"Luțai","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Luțai"}},{"word":"lutărănaș","pos":"noun","definitions":["diminutive of hu"],"forms":{"plural":"lutărănași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lutărănaș","accusative-definite-nominative-singular":"lutărănașul","accusative-indefinite-nominative-plural":"lutărănași","accusative-definite-nominative-plural":"lutărănașii","dative-genitive-indefinite-singular":"lutărănaș","dative-definite-genitive-singular":"lutărănașului","dative-genitive-indefinite-plural":"lutărănași","dative-definite-genitive-plural":"lutărănașilor","singular-vocative":"lutărănașule","plural-vocative":"lutărănașilor"}},{"word":"lutărie","pos":"noun","definitions":["clay pit"],"forms":{"plural":"lutării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"lutărie","accusative-definite-nominative-singular":"lutăria","accusative-indefinite-nominative-plural":"lutării","accusative-definite-nominative-plural":"lutăriile","dative-genitive-indefinite-singular":"lutării","dative-definite-genitive-singular":"lutăriei","dative-genitive-indefinite-plural":"lutării","dative-definite-genitive-plural":"lutăriilor","singular-vocative":"lutărie","plural-vocative":"lutăriilor"}},{"word":"lutariu","pos":"noun","definitions":["clay pit"],"forms":{"plural":"lutarii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lutariu","accusative-definite-nominative-singular":"lutariuul","accusative-indefinite-nominative-plural":"lutarii","accusative-definite-nominative-plural":"lutariile","dative-genitive-indefinite-singular":"lutariu","dative-definite-genitive-singular":"lutariuului","dative-genitive-indefinite-plural":"lutarii","dative-definite-genitive-plural":"lutariilor","singular-vocative":"lutariuule","plural-vocative":"lutariilor"}},{"word":"luțarnă","pos":"noun","definitions":["alternative form of lucernă"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"luțarnă","accusative-definite-nominative":"luțarna","dative-genitive-indefinite":"luțarne","dative-definite-genitive":"luțarnei","vocative":"luțarnă"}},{"word":"Luțaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Luțaș"}},{"word":"Luțca","pos":"name","definitions":["a village in Sagna, Neamț County, Romania"],"gender":"f"},{"word":"luteină","pos":"noun","definitions":["lutein"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luteină","accusative-definite-nominative-singular":"luteina","accusative-indefinite-nominative-plural":"luteine","accusative-definite-nominative-plural":"luteinele","dative-genitive-indefinite-singular":"luteine","dative-definite-genitive-singular":"luteinei","dative-genitive-indefinite-plural":"luteine","dative-definite-genitive-plural":"luteinelor","singular-vocative":"luteină","plural-vocative":"luteinelor"}},{"word":"Luțele Mari","pos":"name","definitions":["a river in Argeș County, Romania, tributary to the Dâmbovița"],"gender":"m"},{"word":"Luțele Mici","pos":"name","definitions":["a river in Argeș County, Romania, tributary to the Dâmbovița"],"gender":"m"},{"word":"luteran","pos":"noun","definitions":["Lutheran"],"forms":{"plural":"luterani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"luteran","accusative-definite-nominative-singular":"luteranul","accusative-indefinite-nominative-plural":"luterani","accusative-definite-nominative-plural":"luteranii","dative-genitive-indefinite-singular":"luteran","dative-definite-genitive-singular":"luteranului","dative-genitive-indefinite-plural":"luterani","dative-definite-genitive-plural":"luteranilor","singular-vocative":"luteranule","plural-vocative":"luteranilor"}},{"word":"luterană","pos":"noun","definitions":["female equivalent of luteran"],"forms":{"plural":"luterane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luterană","accusative-definite-nominative-singular":"luterana","accusative-indefinite-nominative-plural":"luterane","accusative-definite-nominative-plural":"luteranele","dative-genitive-indefinite-singular":"luterane","dative-definite-genitive-singular":"luteranei","dative-genitive-indefinite-plural":"luterane","dative-definite-genitive-plural":"luteranelor","singular-vocative":"luterană","plural-vocative":"luteranelor"}},{"word":"luteranesc","pos":"adj","definitions":["Lutheran"],"forms":{"feminine-singular":"luteranească","plural":"luteranești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"luteranesc","error-unrecognized-form-feminine-indefinite-singular":"luteranească","error-unrecognized-form-indefinite-masculine-plural":"luteranești","error-unrecognized-form-feminine-indefinite-neuter-plural":"luteranești","definite-error-unrecognized-form-masculine-neuter-singular":"luteranescul","definite-error-unrecognized-form-feminine-singular":"luteraneasca","definite-error-unrecognized-form-masculine-plural":"luteraneștii","definite-error-unrecognized-form-feminine-neuter-plural":"luteraneștile"}},{"word":"luteranește","pos":"adv","definitions":["Lutheranly"]},{"word":"luteranism","pos":"noun","definitions":["Lutheranism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"luteranism","accusative-definite-nominative-singular":"luteranismul","accusative-indefinite-nominative-plural":"luteranisme","accusative-definite-nominative-plural":"luteranismele","dative-genitive-indefinite-singular":"luteranism","dative-definite-genitive-singular":"luteranismului","dative-genitive-indefinite-plural":"luteranisme","dative-definite-genitive-plural":"luteranismelor","singular-vocative":"luteranismule","plural-vocative":"luteranismelor"}},{"word":"luțernă","pos":"noun","definitions":["alternative form of lucernă"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"luțernă","accusative-definite-nominative":"luțerna","dative-genitive-indefinite":"luțerne","dative-definite-genitive":"luțernei","vocative":"luțernă"}},{"word":"Luțescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Luțescu"}},{"word":"lutețian","pos":"noun","definitions":["Lutetian"],"forms":{"plural":"lutețieni","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lutețian","accusative-definite-nominative-singular":"lutețianul","accusative-indefinite-nominative-plural":"lutețieni","accusative-definite-nominative-plural":"lutețienile","dative-genitive-indefinite-singular":"lutețian","dative-definite-genitive-singular":"lutețianului","dative-genitive-indefinite-plural":"lutețieni","dative-definite-genitive-plural":"lutețienilor","singular-vocative":"lutețianule","plural-vocative":"lutețienilor"}},{"word":"lutețiu","pos":"noun","definitions":["lutetium (chemical element)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lutețiu","accusative-definite-nominative":"lutețiul","dative-genitive-indefinite":"lutețiu","dative-definite-genitive":"lutețiului","vocative":"lutețiule"}},{"word":"luth","pos":"noun","definitions":["lute"],"forms":{"plural":"luthuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"luth","accusative-definite-nominative-singular":"luthul","accusative-indefinite-nominative-plural":"luthuri","accusative-definite-nominative-plural":"luthurile","dative-genitive-indefinite-singular":"luth","dative-definite-genitive-singular":"luthului","dative-genitive-indefinite-plural":"luthuri","dative-definite-genitive-plural":"luthurilor","singular-vocative":"luthule","plural-vocative":"luthurilor"}},{"word":"lutier","pos":"noun","definitions":["luthier (person who repairs wooden instruments)"],"pronunciation":"/lu.tiˈer/","forms":{"plural":"lutieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lutier","accusative-definite-nominative-singular":"lutierul","accusative-indefinite-nominative-plural":"lutieri","accusative-definite-nominative-plural":"lutierii","dative-genitive-indefinite-singular":"lutier","dative-definite-genitive-singular":"lutierului","dative-genitive-indefinite-plural":"lutieri","dative-definite-genitive-plural":"lutierilor","singular-vocative":"lutierule","plural-vocative":"lutierilor"}},{"word":"lutieri","pos":"noun","definitions":["plural of lutier"],"gender":"m"},{"word":"lutișor","pos":"noun","definitions":["diminutive of lut; small clay"],"forms":{"plural":"lutișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"lutișor","accusative-definite-nominative-singular":"lutișorul","accusative-indefinite-nominative-plural":"lutișore","accusative-definite-nominative-plural":"lutișorele","dative-genitive-indefinite-singular":"lutișor","dative-definite-genitive-singular":"lutișorului","dative-genitive-indefinite-plural":"lutișore","dative-definite-genitive-plural":"lutișorelor","singular-vocative":"lutișorule","plural-vocative":"lutișorelor"}},{"word":"lutist","pos":"noun","definitions":["lutenist"],"forms":{"plural":"lutiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lutist","accusative-definite-nominative-singular":"lutistul","accusative-indefinite-nominative-plural":"lutiști","accusative-definite-nominative-plural":"lutiștii","dative-genitive-indefinite-singular":"lutist","dative-definite-genitive-singular":"lutistului","dative-genitive-indefinite-plural":"lutiști","dative-definite-genitive-plural":"lutiștilor","singular-vocative":"lutistule","plural-vocative":"lutiștilor"}},{"word":"lutistă","pos":"noun","definitions":["female equivalent of lutist"],"forms":{"plural":"lutiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lutistă","accusative-definite-nominative-singular":"lutista","accusative-indefinite-nominative-plural":"lutiste","accusative-definite-nominative-plural":"lutistele","dative-genitive-indefinite-singular":"lutiste","dative-definite-genitive-singular":"lutistei","dative-genitive-indefinite-plural":"lutiste","dative-definite-genitive-plural":"lutistelor","singular-vocative":"lutistă","plural-vocative":"lutistelor"}},{"word":"Lutița","pos":"name","definitions":["a village in Mugeni, Harghita County, Romania"],"gender":"f"},{"word":"Lutoasa","pos":"name","definitions":["a village in Mereni, Covasna County, Romania"],"gender":"f"},{"word":"Luțoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Luțoiu"}},{"word":"lutos","pos":"adj","definitions":["clayey"],"pronunciation":"/luˈtos/","forms":{"feminine-singular":"lutoasă","masculine-plural":"lutoși","feminine-neuter-plural":"lutoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"lutos","error-unrecognized-form-feminine-indefinite-singular":"lutoasă","error-unrecognized-form-indefinite-masculine-plural":"lutoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"lutoase","definite-error-unrecognized-form-masculine-neuter-singular":"lutosul","definite-error-unrecognized-form-feminine-singular":"lutoasa","definite-error-unrecognized-form-masculine-plural":"lutoșii","definite-error-unrecognized-form-feminine-neuter-plural":"lutoasele"}},{"word":"lutră","pos":"noun","definitions":["otter (the mammal)"],"pronunciation":"/ˈlutrə/","forms":{"plural":"lutre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"lutră","accusative-definite-nominative-singular":"lutra","accusative-indefinite-nominative-plural":"lutre","accusative-definite-nominative-plural":"lutrele","dative-genitive-indefinite-singular":"lutre","dative-definite-genitive-singular":"lutrei","dative-genitive-indefinite-plural":"lutre","dative-definite-genitive-plural":"lutrelor","singular-vocative":"lutră","plural-vocative":"lutrelor"}},{"word":"lutru","pos":"noun","definitions":["otter fur"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"lutru","accusative-definite-nominative":"lutrul","dative-genitive-indefinite":"lutru","dative-definite-genitive":"lutrului","vocative":"lutrule"}},{"word":"Lutu Roșu","pos":"name","definitions":["a village in Bertea, Prahova County, Romania"],"gender":"m"},{"word":"lux","pos":"noun","definitions":["lux"],"forms":{"plural":"lucși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"lux","accusative-definite-nominative-singular":"luxul","accusative-indefinite-nominative-plural":"lucși","accusative-definite-nominative-plural":"lucșii","dative-genitive-indefinite-singular":"lux","dative-definite-genitive-singular":"luxului","dative-genitive-indefinite-plural":"lucși","dative-definite-genitive-plural":"lucșilor","singular-vocative":"luxule","plural-vocative":"lucșilor"}},{"word":"luxa","pos":"verb","definitions":["to dislocate (to dislodge a bone)"],"pronunciation":"/lukˈsa/","forms":{"canonical":"a luxa 1st conjugation","present-singular-third-person":"luxează","participle-past":"luxat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a luxa","gerund":"luxând","first-person-indicative-present-singular":"luxez","indicative-present-second-person-singular":"luxezi","indicative-present-singular-third-person":"luxează","first-person-indicative-plural-present":"luxăm","indicative-plural-present-second-person":"luxați","indicative-plural-present-third-person":"luxează","first-person-imperfect-indicative-singular":"luxam","imperfect-indicative-second-person-singular":"luxai","imperfect-indicative-singular-third-person":"luxa","first-person-imperfect-indicative-plural":"luxam","imperfect-indicative-plural-second-person":"luxați","imperfect-indicative-plural-third-person":"luxau","first-person-indicative-perfect-singular":"luxai","indicative-perfect-second-person-singular":"luxași","indicative-perfect-singular-third-person":"luxă","first-person-indicative-perfect-plural":"luxarăm","indicative-perfect-plural-second-person":"luxarăți","indicative-perfect-plural-third-person":"luxară","first-person-indicative-pluperfect-singular":"luxasem","indicative-pluperfect-second-person-singular":"luxaseși","indicative-pluperfect-singular-third-person":"luxase","first-person-indicative-pluperfect-plural":"luxaserăm","indicative-pluperfect-plural-second-person":"luxaserăți","indicative-pluperfect-plural-third-person":"luxaseră","first-person-present-singular-subjunctive":"să luxez","present-second-person-singular-subjunctive":"să luxezi","present-singular-subjunctive-third-person":"să luxeze","first-person-plural-present-subjunctive":"să luxăm","plural-present-second-person-subjunctive":"să luxați","plural-present-subjunctive-third-person":"să luxeze","imperative-second-person-singular":"luxează","imperative-plural-second-person":"luxați","imperative-negative-second-person-singular":"nu luxa","imperative-negative-plural-second-person":"nu luxați"}},{"word":"luxai","pos":"verb","definitions":["inflection of luxa:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[luˈksaj]"},{"word":"luxam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of luxa"],"pronunciation":"[luˈksam]"},{"word":"luxare","pos":"noun","definitions":["sprain"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"luxare","accusative-definite-nominative":"luxarea","dative-genitive-indefinite":"luxare","dative-definite-genitive":"luxarei","vocative":"luxare"}},{"word":"luxase","pos":"verb","definitions":["third-person singular pluperfect indicative of luxa"],"pronunciation":"[luˈksase]"},{"word":"luxație","pos":"noun","definitions":["dislocation"],"forms":{"plural":"luxații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"luxație","accusative-definite-nominative-singular":"luxația","accusative-indefinite-nominative-plural":"luxații","accusative-definite-nominative-plural":"luxațiile","dative-genitive-indefinite-singular":"luxații","dative-definite-genitive-singular":"luxației","dative-genitive-indefinite-plural":"luxații","dative-definite-genitive-plural":"luxațiilor","singular-vocative":"luxație","plural-vocative":"luxațiilor"}},{"word":"luxațiune","pos":"noun","definitions":["obsolete form of luxație"],"forms":{"plural":"luxațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"luxațiune","accusative-definite-nominative-singular":"luxațiunea","accusative-indefinite-nominative-plural":"luxațiuni","accusative-definite-nominative-plural":"luxațiunile","dative-genitive-indefinite-singular":"luxațiuni","dative-definite-genitive-singular":"luxațiunii","dative-genitive-indefinite-plural":"luxațiuni","dative-definite-genitive-plural":"luxațiunilor","singular-vocative":"luxațiune","plural-vocative":"luxațiunilor"}},{"word":"luxatură","pos":"noun","definitions":["joint dislocation"],"forms":{"plural":"luxaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"luxatură","accusative-definite-nominative-singular":"luxatura","accusative-indefinite-nominative-plural":"luxaturi","accusative-definite-nominative-plural":"luxaturile","dative-genitive-indefinite-singular":"luxaturi","dative-definite-genitive-singular":"luxaturii","dative-genitive-indefinite-plural":"luxaturi","dative-definite-genitive-plural":"luxaturilor","singular-vocative":"luxatură","plural-vocative":"luxaturilor"}},{"word":"Luxemburg","pos":"name","definitions":["Luxembourg (a small country in Western Europe)","Luxembourg (a province of Wallonia, Belgium)","Luxembourg, Luxembourg City (the capital city of Luxembourg)","Luxembourg (one of the twelve cantons of the country of Luxembourg, which includes its capital city)"],"pronunciation":"/ˈluk.sem.burɡ/","gender":"m","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"Luxemburg","accusative-definite-nominative":"Luxemburgul","dative-genitive-indefinite":"Luxemburg","dative-definite-genitive":"Luxemburgului","vocative":"Luxemburgule"}},{"word":"luxemburghez","pos":"adj","definitions":["Luxembourgish"],"forms":{"feminine-singular":"luxemburgheză","masculine-plural":"luxemburghezi","feminine-neuter-plural":"luxemburgheze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"luxemburghez","error-unrecognized-form-feminine-indefinite-singular":"luxemburgheză","error-unrecognized-form-indefinite-masculine-plural":"luxemburghezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"luxemburgheze","definite-error-unrecognized-form-masculine-neuter-singular":"luxemburghezul","definite-error-unrecognized-form-feminine-singular":"luxemburgheza","definite-error-unrecognized-form-masculine-plural":"luxemburghezii","definite-error-unrecognized-form-feminine-neuter-plural":"luxemburghezele"}},{"word":"luxemburghez","pos":"noun","definitions":["Luxembourger"],"forms":{"plural":"luxemburghezi","feminine":"equivalent luxemburgheză","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"luxemburghez","accusative-definite-nominative-singular":"luxemburghezul","accusative-indefinite-nominative-plural":"luxemburghezi","accusative-definite-nominative-plural":"luxemburghezii","dative-genitive-indefinite-singular":"luxemburghez","dative-definite-genitive-singular":"luxemburghezului","dative-genitive-indefinite-plural":"luxemburghezi","dative-definite-genitive-plural":"luxemburghezilor","singular-vocative":"luxemburghezule","plural-vocative":"luxemburghezilor"}},{"word":"luxemburgheză","pos":"noun","definitions":["female equivalent of luxemburghez"],"forms":{"plural":"luxemburgheze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luxemburgheză","accusative-definite-nominative-singular":"luxemburgheza","accusative-indefinite-nominative-plural":"luxemburgheze","accusative-definite-nominative-plural":"luxemburghezele","dative-genitive-indefinite-singular":"luxemburgheze","dative-definite-genitive-singular":"luxemburghezei","dative-genitive-indefinite-plural":"luxemburgheze","dative-definite-genitive-plural":"luxemburghezelor","singular-vocative":"luxemburgheză","plural-vocative":"luxemburghezelor"}},{"word":"luxez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of luxa"],"pronunciation":"[luˈksez]"},{"word":"luxmetru","pos":"noun","definitions":["luxmeter"],"forms":{"plural":"luxmetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"luxmetru","accusative-definite-nominative-singular":"luxmetrul","accusative-indefinite-nominative-plural":"luxmetre","accusative-definite-nominative-plural":"luxmetrele","dative-genitive-indefinite-singular":"luxmetru","dative-definite-genitive-singular":"luxmetrului","dative-genitive-indefinite-plural":"luxmetre","dative-definite-genitive-plural":"luxmetrelor","singular-vocative":"luxmetrule","plural-vocative":"luxmetrelor"}},{"word":"luxos","pos":"adj","definitions":["luxurious"],"forms":{"feminine-singular":"luxoasă","masculine-plural":"luxoși","feminine-neuter-plural":"luxoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"luxos","error-unrecognized-form-feminine-indefinite-singular":"luxoasă","error-unrecognized-form-indefinite-masculine-plural":"luxoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"luxoase","definite-error-unrecognized-form-masculine-neuter-singular":"luxosul","definite-error-unrecognized-form-feminine-singular":"luxoasa","definite-error-unrecognized-form-masculine-plural":"luxoșii","definite-error-unrecognized-form-feminine-neuter-plural":"luxoasele"}},{"word":"luxură","pos":"noun","definitions":["lust"],"forms":{"plural":"luxuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"luxură","accusative-definite-nominative-singular":"luxura","accusative-indefinite-nominative-plural":"luxuri","accusative-definite-nominative-plural":"luxurile","dative-genitive-indefinite-singular":"luxuri","dative-definite-genitive-singular":"luxurii","dative-genitive-indefinite-plural":"luxuri","dative-definite-genitive-plural":"luxurilor","singular-vocative":"luxură","plural-vocative":"luxurilor"}},{"word":"luxuriant","pos":"adj","definitions":["lush"],"forms":{"feminine-singular":"luxuriantă","masculine-plural":"luxurianți","feminine-neuter-plural":"luxuriante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"luxuriant","error-unrecognized-form-feminine-indefinite-singular":"luxuriantă","error-unrecognized-form-indefinite-masculine-plural":"luxurianți","error-unrecognized-form-feminine-indefinite-neuter-plural":"luxuriante","definite-error-unrecognized-form-masculine-neuter-singular":"luxuriantul","definite-error-unrecognized-form-feminine-singular":"luxurianta","definite-error-unrecognized-form-masculine-plural":"luxurianții","definite-error-unrecognized-form-feminine-neuter-plural":"luxuriantele"}},{"word":"luxurianță","pos":"noun","definitions":["luxuriance"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"luxurianță","accusative-definite-nominative-singular":"luxurianța","accusative-indefinite-nominative-plural":"luxurianțe","accusative-definite-nominative-plural":"luxurianțele","dative-genitive-indefinite-singular":"luxurianțe","dative-definite-genitive-singular":"luxurianței","dative-genitive-indefinite-plural":"luxurianțe","dative-definite-genitive-plural":"luxurianțelor","singular-vocative":"luxurianță","plural-vocative":"luxurianțelor"}},{"word":"luxurie","pos":"noun","definitions":["alternative form of luxură"],"forms":{"plural":"luxurii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"luxurie","accusative-definite-nominative-singular":"luxuria","accusative-indefinite-nominative-plural":"luxurii","accusative-definite-nominative-plural":"luxuriile","dative-genitive-indefinite-singular":"luxurii","dative-definite-genitive-singular":"luxuriei","dative-genitive-indefinite-plural":"luxurii","dative-definite-genitive-plural":"luxuriilor","singular-vocative":"luxurie","plural-vocative":"luxuriilor"}},{"word":"luxurios","pos":"adj","definitions":["lustful"],"pronunciation":"/luk.su.riˈos/","forms":{"feminine-singular":"luxurioasă","masculine-plural":"luxurioși","feminine-neuter-plural":"luxurioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"luxurios","error-unrecognized-form-feminine-indefinite-singular":"luxurioasă","error-unrecognized-form-indefinite-masculine-plural":"luxurioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"luxurioase","definite-error-unrecognized-form-masculine-neuter-singular":"luxuriosul","definite-error-unrecognized-form-feminine-singular":"luxurioasa","definite-error-unrecognized-form-masculine-plural":"luxurioșii","definite-error-unrecognized-form-feminine-neuter-plural":"luxurioasele"}},{"word":"luxuriozitate","pos":"noun","definitions":["lust"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"luxuriozitate","accusative-definite-nominative":"luxuriozitatea","dative-genitive-indefinite":"luxuriozități","dative-definite-genitive":"luxuriozității","vocative":"-"}},{"word":"luzie","pos":"noun","definitions":["childhood"],"forms":{"plural":"luzii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"luzie","accusative-definite-nominative-singular":"luzia","accusative-indefinite-nominative-plural":"luzii","accusative-definite-nominative-plural":"luziile","dative-genitive-indefinite-singular":"luzii","dative-definite-genitive-singular":"luziei","dative-genitive-indefinite-plural":"luzii","dative-definite-genitive-plural":"luziilor","singular-vocative":"luzie","plural-vocative":"luziilor"}}];
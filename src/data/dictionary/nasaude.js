@@ -0,0 +1 @@
+export default [{"word":"Năsăudean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Năsăudean"}},{"word":"năsăudean","pos":"noun","definitions":["native or inhabitant of the town of Năsăud or surrounding Bistrița-Năsăud County, Romania (usually male)"],"forms":{"plural":"năsăudeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"năsăudean","accusative-definite-nominative-singular":"năsăudeanul","accusative-indefinite-nominative-plural":"năsăudeni","accusative-definite-nominative-plural":"năsăudenii","dative-genitive-indefinite-singular":"năsăudean","dative-definite-genitive-singular":"năsăudeanului","dative-genitive-indefinite-plural":"năsăudeni","dative-definite-genitive-plural":"năsăudenilor","singular-vocative":"năsăudeanule","plural-vocative":"năsăudenilor"}},{"word":"năsăudeană","pos":"noun","definitions":["female equivalent of năsăudean"],"forms":{"plural":"năsăudene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"năsăudeană","accusative-definite-nominative-singular":"năsăudeana","accusative-indefinite-nominative-plural":"năsăudene","accusative-definite-nominative-plural":"năsăudenele","dative-genitive-indefinite-singular":"năsăudene","dative-definite-genitive-singular":"năsăudenei","dative-genitive-indefinite-plural":"năsăudene","dative-definite-genitive-plural":"năsăudenelor","singular-vocative":"năsăudeană","plural-vocative":"năsăudenelor"}},{"word":"năsăudeancă","pos":"noun","definitions":["female equivalent of năsăudean"],"forms":{"plural":"năsăudence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"năsăudeancă","accusative-definite-nominative-singular":"năsăudeanca","accusative-indefinite-nominative-plural":"năsăudence","accusative-definite-nominative-plural":"năsăudencele","dative-genitive-indefinite-singular":"năsăudence","dative-definite-genitive-singular":"năsăudencei","dative-genitive-indefinite-plural":"năsăudence","dative-definite-genitive-plural":"năsăudencelor","singular-vocative":"năsăudeancă","plural-vocative":"năsăudencelor"}},{"word":"Năsăudeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Năsăudeanu"}},{"word":"nasc","pos":"verb","definitions":["inflection of naște:","first-person singular present indicative/subjunctive","third-person plural present indicative"]},{"word":"născare","pos":"noun","definitions":["synonym of naștere (“birth”)"],"pronunciation":"/nəsˈka.re/","examples":[{"ro":"din născare","en":"from birth, innately, innate"}],"forms":{"plural":"născări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"născare","accusative-definite-nominative-singular":"născarea","accusative-indefinite-nominative-plural":"născari","accusative-definite-nominative-plural":"născarile","dative-genitive-indefinite-singular":"născari","dative-definite-genitive-singular":"născarii","dative-genitive-indefinite-plural":"născari","dative-definite-genitive-plural":"născarilor","singular-vocative":"născare","plural-vocative":"născarilor","alternative":"нэскаре"}},{"word":"născătoare","pos":"noun","definitions":["mother","Virgin Mary"],"forms":{"plural":"născătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"născătoare","accusative-definite-nominative-singular":"născătoarea","accusative-indefinite-nominative-plural":"născătoare","accusative-definite-nominative-plural":"născătoarele","dative-genitive-indefinite-singular":"născătoare","dative-definite-genitive-singular":"născătoarei","dative-genitive-indefinite-plural":"născătoare","dative-definite-genitive-plural":"născătoarelor","singular-vocative":"născătoare","plural-vocative":"născătoarelor"}},{"word":"născător","pos":"adj","definitions":["begetter"],"forms":{"feminine-singular":"născătoare","masculine-plural":"născători","feminine-neuter-plural":"născătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"născător","error-unrecognized-form-feminine-indefinite-singular":"născătoare","error-unrecognized-form-indefinite-masculine-plural":"născători","error-unrecognized-form-feminine-indefinite-neuter-plural":"născătoare","definite-error-unrecognized-form-masculine-neuter-singular":"născătorul","definite-error-unrecognized-form-feminine-singular":"născătoarea","definite-error-unrecognized-form-masculine-plural":"născătorii","definite-error-unrecognized-form-feminine-neuter-plural":"născătoarele"}},{"word":"născător","pos":"noun","definitions":["begetter"],"forms":{"plural":"născători","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"născător","accusative-definite-nominative-singular":"născătorul","accusative-indefinite-nominative-plural":"născători","accusative-definite-nominative-plural":"născătorii","dative-genitive-indefinite-singular":"născător","dative-definite-genitive-singular":"născătorului","dative-genitive-indefinite-plural":"născători","dative-definite-genitive-plural":"născătorilor","singular-vocative":"născătorule","plural-vocative":"născătorilor"}},{"word":"născătură","pos":"noun","definitions":["birth"],"forms":{"plural":"născături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"născătură","accusative-definite-nominative-singular":"născătura","accusative-indefinite-nominative-plural":"născături","accusative-definite-nominative-plural":"născăturile","dative-genitive-indefinite-singular":"născături","dative-definite-genitive-singular":"născăturii","dative-genitive-indefinite-plural":"născături","dative-definite-genitive-plural":"născăturilor","singular-vocative":"născătură","plural-vocative":"născăturilor"}},{"word":"născior","pos":"noun","definitions":["diminutive of nas (“nose”)"],"forms":{"plural":"născioare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"născior","accusative-definite-nominative-singular":"născiorul","accusative-indefinite-nominative-plural":"născioare","accusative-definite-nominative-plural":"născioarele","dative-genitive-indefinite-singular":"născior","dative-definite-genitive-singular":"născiorului","dative-genitive-indefinite-plural":"născioare","dative-definite-genitive-plural":"născioarelor","singular-vocative":"născiorule","plural-vocative":"născioarelor"}},{"word":"născoceală","pos":"noun","definitions":["invention"],"forms":{"plural":"născoceli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"născoceală","accusative-definite-nominative-singular":"născoceala","accusative-indefinite-nominative-plural":"născoceli","accusative-definite-nominative-plural":"născocelile","dative-genitive-indefinite-singular":"născoceli","dative-definite-genitive-singular":"născocelii","dative-genitive-indefinite-plural":"născoceli","dative-definite-genitive-plural":"născocelilor","singular-vocative":"născoceală","plural-vocative":"născocelilor"}},{"word":"născoci","pos":"verb","definitions":["to contrive, to make up"],"forms":{"canonical":"a născoci 4th conjugation","present-singular-third-person":"născocește","participle-past":"născocit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a născoci","gerund":"născocind","first-person-indicative-present-singular":"născocesc","indicative-present-second-person-singular":"născocești","indicative-present-singular-third-person":"născocește","first-person-indicative-plural-present":"născocim","indicative-plural-present-second-person":"născociți","indicative-plural-present-third-person":"născocesc","first-person-imperfect-indicative-singular":"născoceam","imperfect-indicative-second-person-singular":"născoceai","imperfect-indicative-singular-third-person":"născocea","first-person-imperfect-indicative-plural":"născoceam","imperfect-indicative-plural-second-person":"născoceați","imperfect-indicative-plural-third-person":"născoceau","first-person-indicative-perfect-singular":"născocii","indicative-perfect-second-person-singular":"născociși","indicative-perfect-singular-third-person":"născoci","first-person-indicative-perfect-plural":"născocirăm","indicative-perfect-plural-second-person":"născocirăți","indicative-perfect-plural-third-person":"născociră","first-person-indicative-pluperfect-singular":"născocisem","indicative-pluperfect-second-person-singular":"născociseși","indicative-pluperfect-singular-third-person":"născocise","first-person-indicative-pluperfect-plural":"născociserăm","indicative-pluperfect-plural-second-person":"născociserăți","indicative-pluperfect-plural-third-person":"născociseră","first-person-present-singular-subjunctive":"să născocesc","present-second-person-singular-subjunctive":"să născocești","present-singular-subjunctive-third-person":"să născocească","first-person-plural-present-subjunctive":"să născocim","plural-present-second-person-subjunctive":"să născociți","plural-present-subjunctive-third-person":"să născocească","imperative-second-person-singular":"născocește","imperative-plural-second-person":"născociți","imperative-negative-second-person-singular":"nu născoci","imperative-negative-plural-second-person":"nu născociți"}},{"word":"născocire","pos":"noun","definitions":["fabrication, fable"],"forms":{"plural":"născociri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"născocire","accusative-definite-nominative-singular":"născocirea","accusative-indefinite-nominative-plural":"născociri","accusative-definite-nominative-plural":"născocirile","dative-genitive-indefinite-singular":"născociri","dative-definite-genitive-singular":"născocirii","dative-genitive-indefinite-plural":"născociri","dative-definite-genitive-plural":"născocirilor","singular-vocative":"născocire","plural-vocative":"născocirilor"}},{"word":"născocitor","pos":"adj","definitions":["contriver, creator"],"forms":{"feminine-singular":"născocitoare","masculine-plural":"născocitori","feminine-neuter-plural":"născocitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"născocitor","error-unrecognized-form-feminine-indefinite-singular":"născocitoare","error-unrecognized-form-indefinite-masculine-plural":"născocitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"născocitoare","definite-error-unrecognized-form-masculine-neuter-singular":"născocitorul","definite-error-unrecognized-form-feminine-singular":"născocitoarea","definite-error-unrecognized-form-masculine-plural":"născocitorii","definite-error-unrecognized-form-feminine-neuter-plural":"născocitoarele"}},{"word":"născocitură","pos":"noun","definitions":["invention"],"forms":{"plural":"născocituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"născocitură","accusative-definite-nominative-singular":"născocitura","accusative-indefinite-nominative-plural":"născociture","accusative-definite-nominative-plural":"născociturele","dative-genitive-indefinite-singular":"născociture","dative-definite-genitive-singular":"născociturei","dative-genitive-indefinite-plural":"născociture","dative-definite-genitive-plural":"născociturelor","singular-vocative":"născocitură","plural-vocative":"născociturelor"}},{"word":"nascorniță","pos":"noun","definitions":["European rhinoceros beetle (Oryctes nasicornis)"],"forms":{"plural":"nascornițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nascorniță","accusative-definite-nominative-singular":"nascornița","accusative-indefinite-nominative-plural":"nascornițe","accusative-definite-nominative-plural":"nascornițele","dative-genitive-indefinite-singular":"nascornițe","dative-definite-genitive-singular":"nascorniței","dative-genitive-indefinite-plural":"nascornițe","dative-definite-genitive-plural":"nascornițelor","singular-vocative":"nascorniță","plural-vocative":"nascornițelor"}},{"word":"născut","pos":"adj","definitions":["born"],"pronunciation":"/nəˈskut/","forms":{"feminine-singular":"născută","masculine-plural":"născuți","feminine-neuter-plural":"născute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"născut","error-unrecognized-form-feminine-indefinite-singular":"născută","error-unrecognized-form-indefinite-masculine-plural":"născuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"născute","definite-error-unrecognized-form-masculine-neuter-singular":"născutul","definite-error-unrecognized-form-feminine-singular":"născuta","definite-error-unrecognized-form-masculine-plural":"născuții","definite-error-unrecognized-form-feminine-neuter-plural":"născutele","alternative":"нэскут"}},{"word":"născut","pos":"verb","definitions":["past participle of naște"],"pronunciation":"/nəˈskut/","examples":[{"ro":"o femeie născută în noiembrie","en":"a woman born in November"},{"ro":"ea s-a născut în România","en":"she was born in Romania"}],"forms":{"participle-past":"of naște","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"născut","error-unrecognized-form-feminine-indefinite-singular":"născută","error-unrecognized-form-indefinite-masculine-plural":"născuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"născute","definite-error-unrecognized-form-masculine-neuter-singular":"născutul","definite-error-unrecognized-form-feminine-singular":"născuta","definite-error-unrecognized-form-masculine-plural":"născuții","definite-error-unrecognized-form-feminine-neuter-plural":"născutele","alternative":"нэскут"}},{"word":"născută","pos":"noun","definitions":["female equivalent of născut"],"forms":{"plural":"născute","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"născută","accusative-definite-nominative-singular":"născuta","accusative-indefinite-nominative-plural":"născute","accusative-definite-nominative-plural":"născutele","dative-genitive-indefinite-singular":"născute","dative-definite-genitive-singular":"născutei","dative-genitive-indefinite-plural":"născute","dative-definite-genitive-plural":"născutelor","singular-vocative":"născută","plural-vocative":"născutelor"}},{"word":"nășel","pos":"noun","definitions":["diminutive of naș; small godfather"],"forms":{"plural":"nășei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nășel","accusative-definite-nominative-singular":"nășelul","accusative-indefinite-nominative-plural":"nășeli","accusative-definite-nominative-plural":"nășelii","dative-genitive-indefinite-singular":"nășel","dative-definite-genitive-singular":"nășelului","dative-genitive-indefinite-plural":"nășeli","dative-definite-genitive-plural":"nășelilor","singular-vocative":"nășelule","plural-vocative":"nășelilor"}},{"word":"năselnic","pos":"adj","definitions":["obsolete form of năsilnic"],"forms":{"feminine-singular":"năselnică","masculine-plural":"năselnici","feminine-neuter-plural":"năselnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"năselnic","error-unrecognized-form-feminine-indefinite-singular":"năselnică","error-unrecognized-form-indefinite-masculine-plural":"năselnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"năselnice","definite-error-unrecognized-form-masculine-neuter-singular":"năselnicul","definite-error-unrecognized-form-feminine-singular":"năselnica","definite-error-unrecognized-form-masculine-plural":"năselnicii","definite-error-unrecognized-form-feminine-neuter-plural":"năselnicele"}},{"word":"năși","pos":"verb","definitions":["to become a godfather"],"forms":{"canonical":"a năși 4th conjugation","present-singular-third-person":"nășește","participle-past":"nășit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a năși","gerund":"nășind","first-person-indicative-present-singular":"nășesc","indicative-present-second-person-singular":"nășești","indicative-present-singular-third-person":"nășește","first-person-indicative-plural-present":"nășim","indicative-plural-present-second-person":"nășiți","indicative-plural-present-third-person":"nășesc","first-person-imperfect-indicative-singular":"nășeam","imperfect-indicative-second-person-singular":"nășeai","imperfect-indicative-singular-third-person":"nășea","first-person-imperfect-indicative-plural":"nășeam","imperfect-indicative-plural-second-person":"nășeați","imperfect-indicative-plural-third-person":"nășeau","first-person-indicative-perfect-singular":"nășii","indicative-perfect-second-person-singular":"nășiși","indicative-perfect-singular-third-person":"năși","first-person-indicative-perfect-plural":"nășirăm","indicative-perfect-plural-second-person":"nășirăți","indicative-perfect-plural-third-person":"nășiră","first-person-indicative-pluperfect-singular":"nășisem","indicative-pluperfect-second-person-singular":"nășiseși","indicative-pluperfect-singular-third-person":"nășise","first-person-indicative-pluperfect-plural":"nășiserăm","indicative-pluperfect-plural-second-person":"nășiserăți","indicative-pluperfect-plural-third-person":"nășiseră","first-person-present-singular-subjunctive":"să nășesc","present-second-person-singular-subjunctive":"să nășești","present-singular-subjunctive-third-person":"să nășească","first-person-plural-present-subjunctive":"să nășim","plural-present-second-person-subjunctive":"să nășiți","plural-present-subjunctive-third-person":"să nășească","imperative-second-person-singular":"nășește","imperative-plural-second-person":"nășiți","imperative-negative-second-person-singular":"nu năși","imperative-negative-plural-second-person":"nu nășiți"}},{"word":"nășic","pos":"noun","definitions":["diminutive of naș; small godfather"],"forms":{"plural":"nășici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nășic","accusative-definite-nominative-singular":"nășicul","accusative-indefinite-nominative-plural":"nășici","accusative-definite-nominative-plural":"nășicii","dative-genitive-indefinite-singular":"nășic","dative-definite-genitive-singular":"nășicului","dative-genitive-indefinite-plural":"nășici","dative-definite-genitive-plural":"nășicilor","singular-vocative":"nășicule","plural-vocative":"nășicilor"}},{"word":"nășică","pos":"noun","definitions":["female equivalent of nășic"],"forms":{"plural":"nășici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"nășică","accusative-definite-nominative-singular":"nășica","accusative-indefinite-nominative-plural":"nășici","accusative-definite-nominative-plural":"nășicile","dative-genitive-indefinite-singular":"nășici","dative-definite-genitive-singular":"nășicii","dative-genitive-indefinite-plural":"nășici","dative-definite-genitive-plural":"nășicilor","singular-vocative":"nășică","plural-vocative":"nășicilor"}},{"word":"nasicorn","pos":"noun","definitions":["European rhinoceros beetle (Oryctes nasicornis)"],"forms":{"plural":"nasicorni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nasicorn","accusative-definite-nominative-singular":"nasicornul","accusative-indefinite-nominative-plural":"nasicorni","accusative-definite-nominative-plural":"nasicornii","dative-genitive-indefinite-singular":"nasicorn","dative-definite-genitive-singular":"nasicornului","dative-genitive-indefinite-plural":"nasicorni","dative-definite-genitive-plural":"nasicornilor","singular-vocative":"nasicornule","plural-vocative":"nasicornilor"}},{"word":"nășicuță","pos":"noun","definitions":["diminutive of nășică; small godmother"],"forms":{"plural":"nășicuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nășicuță","accusative-definite-nominative-singular":"nășicuța","accusative-indefinite-nominative-plural":"nășicuțe","accusative-definite-nominative-plural":"nășicuțele","dative-genitive-indefinite-singular":"nășicuțe","dative-definite-genitive-singular":"nășicuței","dative-genitive-indefinite-plural":"nășicuțe","dative-definite-genitive-plural":"nășicuțelor","singular-vocative":"nășicuță","plural-vocative":"nășicuțelor"}},{"word":"nășie","pos":"noun","definitions":["godfatherhood"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"nășie","accusative-definite-nominative":"nășia","dative-genitive-indefinite":"nășii","dative-definite-genitive":"nășiei","vocative":"nășie"}},{"word":"năsilnic","pos":"adj","definitions":["violent, brutal"],"forms":{"feminine-singular":"năsilnică","masculine-plural":"năsilnici","feminine-neuter-plural":"năsilnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"năsilnic","error-unrecognized-form-feminine-indefinite-singular":"năsilnică","error-unrecognized-form-indefinite-masculine-plural":"năsilnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"năsilnice","definite-error-unrecognized-form-masculine-neuter-singular":"năsilnicul","definite-error-unrecognized-form-feminine-singular":"năsilnica","definite-error-unrecognized-form-masculine-plural":"năsilnicii","definite-error-unrecognized-form-feminine-neuter-plural":"năsilnicele"}},{"word":"năsilnicie","pos":"noun","definitions":["violence, brutality"],"forms":{"plural":"nasilnicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"năsilnicie","accusative-definite-nominative-singular":"năsilniciea","accusative-indefinite-nominative-plural":"nasilnicii","accusative-definite-nominative-plural":"nasilniciile","dative-genitive-indefinite-singular":"nasilnicii","dative-definite-genitive-singular":"nasilniciii","dative-genitive-indefinite-plural":"nasilnicii","dative-definite-genitive-plural":"nasilniciilor","singular-vocative":"năsilnicie","plural-vocative":"nasilniciilor"}},{"word":"năsip","pos":"noun","definitions":["alternative form of nisip"],"forms":{"plural":"năsipuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"năsip","accusative-definite-nominative-singular":"năsipul","accusative-indefinite-nominative-plural":"năsipuri","accusative-definite-nominative-plural":"năsipurile","dative-genitive-indefinite-singular":"năsip","dative-definite-genitive-singular":"năsipului","dative-genitive-indefinite-plural":"năsipuri","dative-definite-genitive-plural":"năsipurilor","singular-vocative":"năsipule","plural-vocative":"năsipurilor"}},{"word":"năsipiș","pos":"noun","definitions":["alternative form of nisipiș"],"forms":{"plural":"năsipișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"năsipiș","accusative-definite-nominative-singular":"năsipișul","accusative-indefinite-nominative-plural":"năsipișuri","accusative-definite-nominative-plural":"năsipișurile","dative-genitive-indefinite-singular":"năsipiș","dative-definite-genitive-singular":"năsipișului","dative-genitive-indefinite-plural":"năsipișuri","dative-definite-genitive-plural":"năsipișurilor","singular-vocative":"năsipișule","plural-vocative":"năsipișurilor"}},{"word":"năsipit","pos":"adj","definitions":["alternative form of nisipit"],"forms":{"feminine-singular":"năsipită","masculine-plural":"năsipiți","feminine-neuter-plural":"năsipite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"năsipit","error-unrecognized-form-feminine-indefinite-singular":"năsipită","error-unrecognized-form-indefinite-masculine-plural":"năsipiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"năsipite","definite-error-unrecognized-form-masculine-neuter-singular":"năsipitul","definite-error-unrecognized-form-feminine-singular":"năsipita","definite-error-unrecognized-form-masculine-plural":"năsipiții","definite-error-unrecognized-form-feminine-neuter-plural":"năsipitele"}},{"word":"năsipos","pos":"adj","definitions":["alternative form of nisipos"],"forms":{"feminine-singular":"năsipoasă","masculine-plural":"năsipoși","feminine-neuter-plural":"năsipoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"năsipos","error-unrecognized-form-feminine-indefinite-singular":"năsipoasă","error-unrecognized-form-indefinite-masculine-plural":"năsipoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"năsipoase","definite-error-unrecognized-form-masculine-neuter-singular":"năsiposul","definite-error-unrecognized-form-feminine-singular":"năsipoasa","definite-error-unrecognized-form-masculine-plural":"năsipoșii","definite-error-unrecognized-form-feminine-neuter-plural":"năsipoasele"}},{"word":"nășire","pos":"noun","definitions":["the act of becoming a godfather"],"forms":{"plural":"nășiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nășire","accusative-definite-nominative-singular":"nășirea","accusative-indefinite-nominative-plural":"nășiri","accusative-definite-nominative-plural":"nășirile","dative-genitive-indefinite-singular":"nășiri","dative-definite-genitive-singular":"nășirii","dative-genitive-indefinite-plural":"nășiri","dative-definite-genitive-plural":"nășirilor","singular-vocative":"nășire","plural-vocative":"nășirilor"}},{"word":"nășit","pos":"noun","definitions":["the act of becoming a godfather"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nășit","accusative-definite-nominative":"nășitul","dative-genitive-indefinite":"nășit","dative-definite-genitive":"nășitului","vocative":"nășitule"}},{"word":"nășit","pos":"verb","definitions":["past participle of năși"],"forms":{"participle-past":"of năși"}},{"word":"nășiță","pos":"noun","definitions":["diminutive of naș"],"forms":{"plural":"nășițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nășiță","accusative-definite-nominative-singular":"nășița","accusative-indefinite-nominative-plural":"nășițe","accusative-definite-nominative-plural":"nășițele","dative-genitive-indefinite-singular":"nășițe","dative-definite-genitive-singular":"nășiței","dative-genitive-indefinite-plural":"nășițe","dative-definite-genitive-plural":"nășițelor","singular-vocative":"nășiță","plural-vocative":"nășițelor"}},{"word":"năsliciune","pos":"noun","definitions":["desire"],"forms":{"plural":"năsliciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"năsliciune","accusative-definite-nominative-singular":"năsliciunea","accusative-indefinite-nominative-plural":"năsliciuni","accusative-definite-nominative-plural":"năsliciunile","dative-genitive-indefinite-singular":"năsliciuni","dative-definite-genitive-singular":"năsliciunii","dative-genitive-indefinite-plural":"năsliciuni","dative-definite-genitive-plural":"năsliciunilor","singular-vocative":"năsliciune","plural-vocative":"năsliciunilor"}},{"word":"năslire","pos":"noun","definitions":["longing"],"forms":{"plural":"năsliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"năslire","accusative-definite-nominative-singular":"năslirea","accusative-indefinite-nominative-plural":"năsliri","accusative-definite-nominative-plural":"năslirile","dative-genitive-indefinite-singular":"năsliri","dative-definite-genitive-singular":"năslirii","dative-genitive-indefinite-plural":"năsliri","dative-definite-genitive-plural":"năslirilor","singular-vocative":"năslire","plural-vocative":"năslirilor"}},{"word":"năslui","pos":"verb","definitions":["to onrush"],"forms":{"canonical":"a năslui 4th conjugation","present-singular-third-person":"năsluiește","participle-past":"năsluit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a năslui","gerund":"năsluind","first-person-indicative-present-singular":"năsluiesc","indicative-present-second-person-singular":"năsluiești","indicative-present-singular-third-person":"năsluiește","first-person-indicative-plural-present":"năsluim","indicative-plural-present-second-person":"năsluiți","indicative-plural-present-third-person":"năsluiesc","first-person-imperfect-indicative-singular":"năsluiam","imperfect-indicative-second-person-singular":"năsluiai","imperfect-indicative-singular-third-person":"năsluia","first-person-imperfect-indicative-plural":"năsluiam","imperfect-indicative-plural-second-person":"năsluiați","imperfect-indicative-plural-third-person":"năsluiau","first-person-indicative-perfect-singular":"năsluii","indicative-perfect-second-person-singular":"năsluiși","indicative-perfect-singular-third-person":"năslui","first-person-indicative-perfect-plural":"năsluirăm","indicative-perfect-plural-second-person":"năsluirăți","indicative-perfect-plural-third-person":"năsluiră","first-person-indicative-pluperfect-singular":"năsluisem","indicative-pluperfect-second-person-singular":"năsluiseși","indicative-pluperfect-singular-third-person":"năsluise","first-person-indicative-pluperfect-plural":"năsluiserăm","indicative-pluperfect-plural-second-person":"năsluiserăți","indicative-pluperfect-plural-third-person":"năsluiseră","first-person-present-singular-subjunctive":"să năsluiesc","present-second-person-singular-subjunctive":"să năsluiești","present-singular-subjunctive-third-person":"să năsluiască","first-person-plural-present-subjunctive":"să năsluim","plural-present-second-person-subjunctive":"să năsluiți","plural-present-subjunctive-third-person":"să năsluiască","imperative-second-person-singular":"năsluiește","imperative-plural-second-person":"năsluiți","imperative-negative-second-person-singular":"nu năslui","imperative-negative-plural-second-person":"nu năsluiți"}},{"word":"nasoală","pos":"noun","definitions":["female equivalent of nasol"],"forms":{"plural":"nasoale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nasoală","accusative-definite-nominative-singular":"nasoala","accusative-indefinite-nominative-plural":"nasoale","accusative-definite-nominative-plural":"nasoalele","dative-genitive-indefinite-singular":"nasoale","dative-definite-genitive-singular":"nasoalei","dative-genitive-indefinite-plural":"nasoale","dative-definite-genitive-plural":"nasoalelor","singular-vocative":"nasoală","plural-vocative":"nasoalelor"}},{"word":"Năsoi","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Năsoi"}},{"word":"năsoi","pos":"noun","definitions":["augmentative of nas"],"forms":{"plural":"năsoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"năsoi","accusative-definite-nominative-singular":"năsoiul","accusative-indefinite-nominative-plural":"năsoaie","accusative-definite-nominative-plural":"năsoaiele","dative-genitive-indefinite-singular":"năsoi","dative-definite-genitive-singular":"năsoiului","dative-genitive-indefinite-plural":"năsoaie","dative-definite-genitive-plural":"năsoaielor","singular-vocative":"năsoiule","plural-vocative":"năsoaielor"}},{"word":"nasol","pos":"adj","definitions":["ugly; ridiculous","of poor quality, worn-out","uncool"],"pronunciation":"[ naˈsol ]","forms":{"feminine-singular":"nasoală","masculine-plural":"nasoli","feminine-neuter-plural":"nasoale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nasol","error-unrecognized-form-feminine-indefinite-singular":"nasoală","error-unrecognized-form-indefinite-masculine-plural":"nasoli","error-unrecognized-form-feminine-indefinite-neuter-plural":"nasoale","definite-error-unrecognized-form-masculine-neuter-singular":"nasolul","definite-error-unrecognized-form-feminine-singular":"nasoala","definite-error-unrecognized-form-masculine-plural":"nasolii","definite-error-unrecognized-form-feminine-neuter-plural":"nasoalele"}},{"word":"nasoli","pos":"verb","definitions":["to destroy, to ruin","to beat, to hit"],"forms":{"canonical":"a nasoli 4th conjugation","present-singular-third-person":"nasolește","participle-past":"nasolit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nasoli","gerund":"nasolind","first-person-indicative-present-singular":"nasolesc","indicative-present-second-person-singular":"nasolești","indicative-present-singular-third-person":"nasolește","first-person-indicative-plural-present":"nasolim","indicative-plural-present-second-person":"nasoliți","indicative-plural-present-third-person":"nasolesc","first-person-imperfect-indicative-singular":"nasoleam","imperfect-indicative-second-person-singular":"nasoleai","imperfect-indicative-singular-third-person":"nasolea","first-person-imperfect-indicative-plural":"nasoleam","imperfect-indicative-plural-second-person":"nasoleați","imperfect-indicative-plural-third-person":"nasoleau","first-person-indicative-perfect-singular":"nasolii","indicative-perfect-second-person-singular":"nasoliși","indicative-perfect-singular-third-person":"nasoli","first-person-indicative-perfect-plural":"nasolirăm","indicative-perfect-plural-second-person":"nasolirăți","indicative-perfect-plural-third-person":"nasoliră","first-person-indicative-pluperfect-singular":"nasolisem","indicative-pluperfect-second-person-singular":"nasoliseși","indicative-pluperfect-singular-third-person":"nasolise","first-person-indicative-pluperfect-plural":"nasoliserăm","indicative-pluperfect-plural-second-person":"nasoliserăți","indicative-pluperfect-plural-third-person":"nasoliseră","first-person-present-singular-subjunctive":"să nasolesc","present-second-person-singular-subjunctive":"să nasolești","present-singular-subjunctive-third-person":"să nasolească","first-person-plural-present-subjunctive":"să nasolim","plural-present-second-person-subjunctive":"să nasoliți","plural-present-subjunctive-third-person":"să nasolească","imperative-second-person-singular":"nasolește","imperative-plural-second-person":"nasoliți","imperative-negative-second-person-singular":"nu nasoli","imperative-negative-plural-second-person":"nu nasoliți"}},{"word":"năsos","pos":"adj","definitions":["big-nosed, conky"],"pronunciation":"/nəˈsos/","forms":{"feminine-singular":"năsoasă","masculine-plural":"năsoși","feminine-neuter-plural":"năsoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"năsos","error-unrecognized-form-feminine-indefinite-singular":"năsoasă","error-unrecognized-form-indefinite-masculine-plural":"năsoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"năsoase","definite-error-unrecognized-form-masculine-neuter-singular":"năsosul","definite-error-unrecognized-form-feminine-singular":"năsoasa","definite-error-unrecognized-form-masculine-plural":"năsoșii","definite-error-unrecognized-form-feminine-neuter-plural":"năsoasele","alternative":"нэсос"}},{"word":"nașpa","pos":"adj","definitions":["ugly, lame"],"pronunciation":"/ˈnaʃ.pa/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nașpa","error-unrecognized-form-feminine-indefinite-singular":"nașpa","error-unrecognized-form-indefinite-masculine-plural":"nașpa","error-unrecognized-form-feminine-indefinite-neuter-plural":"nașpa","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"nașparliu","pos":"noun","definitions":["an ugly person","a bad person"],"forms":{"plural":"nașparlii","table-tags":"no-table-tags","inflection-template":"ro-noun-m-u","accusative-indefinite-nominative-singular":"nașparliu","accusative-definite-nominative-singular":"nașparliul","accusative-indefinite-nominative-plural":"nașparlii","accusative-definite-nominative-plural":"nașparliii","dative-genitive-indefinite-singular":"nașparliu","dative-definite-genitive-singular":"nașparliului","dative-genitive-indefinite-plural":"nașparlii","dative-definite-genitive-plural":"nașparliilor","singular-vocative":"nașparliule","plural-vocative":"nașparliilor"}},{"word":"Năstăsache","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Năstăsache"}},{"word":"Năstăsachi","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Năstăsachi"}},{"word":"Năstase","pos":"name","definitions":["a village in Mihălășeni, Botoșani County, Romania"],"gender":"m"},{"word":"Năstăseni","pos":"name","definitions":["a village in Parincea, Bacău County, Romania"],"gender":"m"},{"word":"Năstăsescu","pos":"name","definitions":["a surname"],"pronunciation":"[nəstəˈsesku]","gender":"m","forms":{"dative-genitive":"lui Năstăsescu"}},{"word":"năstașnic","pos":"adj","definitions":["restless"],"forms":{"feminine-singular":"năstașnică","masculine-plural":"năstașnici","feminine-neuter-plural":"năstașnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"năstașnic","error-unrecognized-form-feminine-indefinite-singular":"năstașnică","error-unrecognized-form-indefinite-masculine-plural":"năstașnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"năstașnice","definite-error-unrecognized-form-masculine-neuter-singular":"năstașnicul","definite-error-unrecognized-form-feminine-singular":"năstașnica","definite-error-unrecognized-form-masculine-plural":"năstașnicii","definite-error-unrecognized-form-feminine-neuter-plural":"năstașnicele"}},{"word":"Năstăsoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Năstăsoiu"}},{"word":"năstăvi","pos":"verb","definitions":["to lead, to advise"],"forms":{"canonical":"a năstăvi 4th conjugation","present-singular-third-person":"năstăvește","participle-past":"năstăvit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a năstăvi","gerund":"năstăvind","first-person-indicative-present-singular":"năstăvesc","indicative-present-second-person-singular":"năstăvești","indicative-present-singular-third-person":"năstăvește","first-person-indicative-plural-present":"năstăvim","indicative-plural-present-second-person":"năstăviți","indicative-plural-present-third-person":"năstăvesc","first-person-imperfect-indicative-singular":"năstăveam","imperfect-indicative-second-person-singular":"năstăveai","imperfect-indicative-singular-third-person":"năstăvea","first-person-imperfect-indicative-plural":"năstăveam","imperfect-indicative-plural-second-person":"năstăveați","imperfect-indicative-plural-third-person":"năstăveau","first-person-indicative-perfect-singular":"năstăvii","indicative-perfect-second-person-singular":"năstăviși","indicative-perfect-singular-third-person":"năstăvi","first-person-indicative-perfect-plural":"năstăvirăm","indicative-perfect-plural-second-person":"năstăvirăți","indicative-perfect-plural-third-person":"năstăviră","first-person-indicative-pluperfect-singular":"năstăvisem","indicative-pluperfect-second-person-singular":"năstăviseși","indicative-pluperfect-singular-third-person":"năstăvise","first-person-indicative-pluperfect-plural":"năstăviserăm","indicative-pluperfect-plural-second-person":"năstăviserăți","indicative-pluperfect-plural-third-person":"năstăviseră","first-person-present-singular-subjunctive":"să năstăvesc","present-second-person-singular-subjunctive":"să năstăvești","present-singular-subjunctive-third-person":"să năstăvească","first-person-plural-present-subjunctive":"să năstăvim","plural-present-second-person-subjunctive":"să năstăviți","plural-present-subjunctive-third-person":"să năstăvească","imperative-second-person-singular":"năstăvește","imperative-plural-second-person":"năstăviți","imperative-negative-second-person-singular":"nu năstăvi","imperative-negative-plural-second-person":"nu năstăviți"}},{"word":"năstavnic","pos":"noun","definitions":["leader of a Church organization"],"forms":{"plural":"năstavnici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"năstavnic","accusative-definite-nominative-singular":"năstavnicul","accusative-indefinite-nominative-plural":"năstavnici","accusative-definite-nominative-plural":"năstavnicii","dative-genitive-indefinite-singular":"năstavnic","dative-definite-genitive-singular":"năstavnicului","dative-genitive-indefinite-plural":"năstavnici","dative-definite-genitive-plural":"năstavnicilor","singular-vocative":"năstavnicule","plural-vocative":"năstavnicilor"}},{"word":"naște","pos":"verb","definitions":["to give birth to; to bear","to be born"],"pronunciation":"/ˈnaʃ.te/","examples":[{"ro":"M-am născut în 1988.","en":"I was born in 1988."}],"forms":{"canonical":"a naște 3rd conjugation","present-singular-third-person":"naște","participle-past":"născut","subjunctive-third-person":"nască","table-tags":"conjugation-3","inflection-template":"ro-conj-e-ut","infinitive":"a naște","gerund":"născând","first-person-indicative-present-singular":"nasc","indicative-present-second-person-singular":"naști","indicative-present-singular-third-person":"naște","first-person-indicative-plural-present":"naștem","indicative-plural-present-second-person":"nașteți","indicative-plural-present-third-person":"nasc","first-person-imperfect-indicative-singular":"nășteam","imperfect-indicative-second-person-singular":"nășteai","imperfect-indicative-singular-third-person":"năștea","first-person-imperfect-indicative-plural":"nășteam","imperfect-indicative-plural-second-person":"nășteați","imperfect-indicative-plural-third-person":"nășteau","first-person-indicative-perfect-singular":"născui","indicative-perfect-second-person-singular":"născuși","indicative-perfect-singular-third-person":"născu","first-person-indicative-perfect-plural":"născurăm","indicative-perfect-plural-second-person":"născurăți","indicative-perfect-plural-third-person":"născură","first-person-indicative-pluperfect-singular":"născusem","indicative-pluperfect-second-person-singular":"născuseși","indicative-pluperfect-singular-third-person":"născuse","first-person-indicative-pluperfect-plural":"născuserăm","indicative-pluperfect-plural-second-person":"născuserăți","indicative-pluperfect-plural-third-person":"născuseră","first-person-present-singular-subjunctive":"să nasc","present-second-person-singular-subjunctive":"să naști","present-singular-subjunctive-third-person":"să nască","first-person-plural-present-subjunctive":"să naștem","plural-present-second-person-subjunctive":"să nașteți","plural-present-subjunctive-third-person":"să nască","imperative-second-person-singular":"naște","imperative-plural-second-person":"nașteți","imperative-negative-second-person-singular":"nu naște","imperative-negative-plural-second-person":"nu nașteți","alternative":"наште"}},{"word":"naștere","pos":"noun","definitions":["birth"],"pronunciation":"/ˈnaʃ.te.re/","examples":[{"ro":"zi de naștere","en":"birthday"}],"forms":{"plural":"nașteri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"naștere","accusative-definite-nominative-singular":"nașterea","accusative-indefinite-nominative-plural":"nașteri","accusative-definite-nominative-plural":"nașterile","dative-genitive-indefinite-singular":"nașteri","dative-definite-genitive-singular":"nașterii","dative-genitive-indefinite-plural":"nașteri","dative-definite-genitive-plural":"nașterilor","singular-vocative":"naștere","plural-vocative":"nașterilor","alternative":"наштере"}},{"word":"nașterea Domnului","pos":"noun","definitions":["Nativity"]},{"word":"nastie","pos":"noun","definitions":["a nastic change"],"forms":{"plural":"nastii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nastie","accusative-definite-nominative-singular":"nastia","accusative-indefinite-nominative-plural":"nastii","accusative-definite-nominative-plural":"nastiile","dative-genitive-indefinite-singular":"nastii","dative-definite-genitive-singular":"nastiei","dative-genitive-indefinite-plural":"nastii","dative-definite-genitive-plural":"nastiilor","singular-vocative":"nastie","plural-vocative":"nastiilor"}},{"word":"năstimeală","pos":"noun","definitions":["guidance"],"forms":{"plural":"năstimeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"năstimeală","accusative-definite-nominative-singular":"năstimeala","accusative-indefinite-nominative-plural":"năstimele","accusative-definite-nominative-plural":"năstimelele","dative-genitive-indefinite-singular":"năstimele","dative-definite-genitive-singular":"năstimelei","dative-genitive-indefinite-plural":"năstimele","dative-definite-genitive-plural":"năstimelelor","singular-vocative":"năstimeală","plural-vocative":"năstimelelor"}},{"word":"nastoatel","pos":"noun","definitions":["church leader"],"forms":{"plural":"nastoateli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nastoatel","accusative-definite-nominative-singular":"nastoatelul","accusative-indefinite-nominative-plural":"nastoateli","accusative-definite-nominative-plural":"nastoatelii","dative-genitive-indefinite-singular":"nastoatel","dative-definite-genitive-singular":"nastoatelului","dative-genitive-indefinite-plural":"nastoateli","dative-definite-genitive-plural":"nastoatelilor","singular-vocative":"nastoatelule","plural-vocative":"nastoatelilor"}},{"word":"Nastradin","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed to Pădureni."],"gender":"m"},{"word":"năstrăpioară","pos":"noun","definitions":["diminutive of năstrapă"],"forms":{"plural":"năstrăpioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"năstrăpioară","accusative-definite-nominative-singular":"năstrăpioara","accusative-indefinite-nominative-plural":"năstrăpioare","accusative-definite-nominative-plural":"năstrăpioarele","dative-genitive-indefinite-singular":"năstrăpioare","dative-definite-genitive-singular":"năstrăpioarei","dative-genitive-indefinite-plural":"năstrăpioare","dative-definite-genitive-plural":"năstrăpioarelor","singular-vocative":"năstrăpioară","plural-vocative":"năstrăpioarelor"}},{"word":"năstrușnic","pos":"adj","definitions":["exceeding quality; extraordinary","exceeding proportions, bounds; unprecedented, huge, great","not normal; odd, weird, strange"],"forms":{"feminine-singular":"năstrușnică","masculine-plural":"năstrușnici","feminine-neuter-plural":"năstrușnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"năstrușnic","error-unrecognized-form-feminine-indefinite-singular":"năstrușnică","error-unrecognized-form-indefinite-masculine-plural":"năstrușnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"năstrușnice","definite-error-unrecognized-form-masculine-neuter-singular":"năstrușnicul","definite-error-unrecognized-form-feminine-singular":"năstrușnica","definite-error-unrecognized-form-masculine-plural":"năstrușnicii","definite-error-unrecognized-form-feminine-neuter-plural":"năstrușnicele","alternative":"năstrașnic"}},{"word":"năstrușnicie","pos":"noun","definitions":["extravagant idea or behavior"],"forms":{"plural":"năstrușnicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"năstrușnicie","accusative-definite-nominative-singular":"năstrușnicia","accusative-indefinite-nominative-plural":"năstrușnicii","accusative-definite-nominative-plural":"năstrușniciile","dative-genitive-indefinite-singular":"năstrușnicii","dative-definite-genitive-singular":"năstrușniciei","dative-genitive-indefinite-plural":"năstrușnicii","dative-definite-genitive-plural":"năstrușniciilor","singular-vocative":"năstrușnicie","plural-vocative":"năstrușniciilor"}},{"word":"Năstrușnicu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Năstrușnicu"}},{"word":"năsturar","pos":"noun","definitions":["buttonmaker"],"forms":{"plural":"năsturari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"năsturar","accusative-definite-nominative-singular":"năsturarul","accusative-indefinite-nominative-plural":"năsturari","accusative-definite-nominative-plural":"năsturarii","dative-genitive-indefinite-singular":"năsturar","dative-definite-genitive-singular":"năsturarului","dative-genitive-indefinite-plural":"năsturari","dative-definite-genitive-plural":"năsturarilor","singular-vocative":"năsturarule","plural-vocative":"năsturarilor"}},{"word":"năsturăreasă","pos":"noun","definitions":["female equivalent of năsturar"],"forms":{"plural":"năsturărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"năsturăreasă","accusative-definite-nominative-singular":"năsturăreasa","accusative-indefinite-nominative-plural":"năsturărese","accusative-definite-nominative-plural":"năsturăresele","dative-genitive-indefinite-singular":"năsturărese","dative-definite-genitive-singular":"năsturăresei","dative-genitive-indefinite-plural":"năsturărese","dative-definite-genitive-plural":"năsturăreselor","singular-vocative":"năsturăreasă","plural-vocative":"năsturăreselor"}},{"word":"năsturărie","pos":"noun","definitions":["button workshop"],"forms":{"plural":"năsturării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"năsturărie","accusative-definite-nominative-singular":"năsturăria","accusative-indefinite-nominative-plural":"năsturării","accusative-definite-nominative-plural":"năsturăriile","dative-genitive-indefinite-singular":"năsturării","dative-definite-genitive-singular":"năsturăriei","dative-genitive-indefinite-plural":"năsturării","dative-definite-genitive-plural":"năsturăriilor","singular-vocative":"năsturărie","plural-vocative":"năsturăriilor"}},{"word":"Năsturaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Năsturaș"}},{"word":"năsturaș","pos":"noun","definitions":["diminutive of nasture; small button"],"forms":{"plural":"năsturași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"năsturaș","accusative-definite-nominative-singular":"năsturașul","accusative-indefinite-nominative-plural":"năsturași","accusative-definite-nominative-plural":"năsturașii","dative-genitive-indefinite-singular":"năsturaș","dative-definite-genitive-singular":"năsturașului","dative-genitive-indefinite-plural":"năsturași","dative-definite-genitive-plural":"năsturașilor","singular-vocative":"năsturașule","plural-vocative":"năsturașilor"}},{"word":"nasture","pos":"noun","definitions":["button (clothing)"],"forms":{"plural":"nasturi","table-tags":"no-table-tags","inflection-template":"ro-noun-m-e","accusative-indefinite-nominative-singular":"nasture","accusative-definite-nominative-singular":"nasturele","accusative-indefinite-nominative-plural":"nasturi","accusative-definite-nominative-plural":"nasturii","dative-genitive-indefinite-singular":"nasture","dative-definite-genitive-singular":"nasturelui","dative-genitive-indefinite-plural":"nasturi","dative-definite-genitive-plural":"nasturilor","singular-vocative":"nasture","plural-vocative":"nasturilor"}},{"word":"Năsturel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Năsturel"}},{"word":"năsturel","pos":"noun","definitions":["diminutive of nasture; small button"],"forms":{"plural":"năsturei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"năsturel","accusative-definite-nominative-singular":"năsturelul","accusative-indefinite-nominative-plural":"năstureli","accusative-definite-nominative-plural":"năsturelii","dative-genitive-indefinite-singular":"năsturel","dative-definite-genitive-singular":"năsturelului","dative-genitive-indefinite-plural":"năstureli","dative-definite-genitive-plural":"năsturelilor","singular-vocative":"năsturelule","plural-vocative":"năsturelilor"}},{"word":"Năsturelu","pos":"name","definitions":["a commune of Teleorman County, Romania","a village in Năsturelu, Teleorman County, Romania"],"gender":"m"},{"word":"năsturelul","pos":"noun","definitions":["definite nominative/accusative singular of năsturel"]},{"word":"Năsturescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Năsturescu"}},{"word":"Năsturică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Năsturică"}},{"word":"năsuc","pos":"noun","definitions":["diminutive of nas (“nose”)"],"forms":{"plural":"năsucuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"năsuc","accusative-definite-nominative-singular":"năsucul","accusative-indefinite-nominative-plural":"năsucuri","accusative-definite-nominative-plural":"năsucurile","dative-genitive-indefinite-singular":"năsuc","dative-definite-genitive-singular":"năsucului","dative-genitive-indefinite-plural":"năsucuri","dative-definite-genitive-plural":"năsucurilor","singular-vocative":"năsucule","plural-vocative":"năsucurilor"}},{"word":"nășuc","pos":"noun","definitions":["diminutive of naș"],"forms":{"feminine":"equivalent nășucă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"nășuc","accusative-definite-nominative":"nășucul","dative-genitive-indefinite":"nășuc","dative-definite-genitive":"nășucului","vocative":"nășucule"}},{"word":"Năsuescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Năsuescu"}},{"word":"nasul","pos":"adj","definitions":["obsolete form of nasol"],"forms":{"feminine-singular":"nasulă","masculine-plural":"nasuli","feminine-neuter-plural":"nasule","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nasul","error-unrecognized-form-feminine-indefinite-singular":"nasulă","error-unrecognized-form-indefinite-masculine-plural":"nasuli","error-unrecognized-form-feminine-indefinite-neuter-plural":"nasule","definite-error-unrecognized-form-masculine-neuter-singular":"nasulul","definite-error-unrecognized-form-feminine-singular":"nasula","definite-error-unrecognized-form-masculine-plural":"nasulii","definite-error-unrecognized-form-feminine-neuter-plural":"nasulele"}},{"word":"nasuri","pos":"noun","definitions":["plural of nas"]},{"word":"năsușor","pos":"noun","definitions":["diminutive of nas; small nose"],"forms":{"plural":"năsușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"năsușor","accusative-definite-nominative-singular":"năsușorul","accusative-indefinite-nominative-plural":"năsușore","accusative-definite-nominative-plural":"năsușorele","dative-genitive-indefinite-singular":"năsușor","dative-definite-genitive-singular":"năsușorului","dative-genitive-indefinite-plural":"năsușore","dative-definite-genitive-plural":"năsușorelor","singular-vocative":"năsușorule","plural-vocative":"năsușorelor"}},{"word":"năsut","pos":"adj","definitions":["having a big nose","curious, cheeky, impudent"],"pronunciation":"/nəˈsut/","forms":{"feminine-singular":"năsută","masculine-plural":"năsuți","feminine-neuter-plural":"năsute","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"năsut","error-unrecognized-form-feminine-indefinite-singular":"năsută","error-unrecognized-form-indefinite-masculine-plural":"năsuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"năsute","definite-error-unrecognized-form-masculine-neuter-singular":"năsutul","definite-error-unrecognized-form-feminine-singular":"năsuta","definite-error-unrecognized-form-masculine-plural":"năsuții","definite-error-unrecognized-form-feminine-neuter-plural":"năsutele"}},{"word":"năsuț","pos":"noun","definitions":["diminutive of nas; small nose"],"forms":{"plural":"năsuțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"năsuț","accusative-definite-nominative-singular":"năsuțul","accusative-indefinite-nominative-plural":"năsuțe","accusative-definite-nominative-plural":"năsuțele","dative-genitive-indefinite-singular":"năsuț","dative-definite-genitive-singular":"năsuțului","dative-genitive-indefinite-plural":"năsuțe","dative-definite-genitive-plural":"năsuțelor","singular-vocative":"năsuțule","plural-vocative":"năsuțelor"}},{"word":"nat","pos":"noun","definitions":["person, individual","kinsman, relative"],"forms":{"plural":"nați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nat","accusative-definite-nominative-singular":"natul","accusative-indefinite-nominative-plural":"nați","accusative-definite-nominative-plural":"nații","dative-genitive-indefinite-singular":"nat","dative-definite-genitive-singular":"natului","dative-genitive-indefinite-plural":"nați","dative-definite-genitive-plural":"naților","singular-vocative":"natule","plural-vocative":"naților"}},{"word":"nătăfleață","pos":"noun","definitions":["female equivalent of nătăfleț"],"forms":{"plural":"nătăfleațe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nătăfleață","accusative-definite-nominative-singular":"nătăfleața","accusative-indefinite-nominative-plural":"nătăfleațe","accusative-definite-nominative-plural":"nătăfleațele","dative-genitive-indefinite-singular":"nătăfleațe","dative-definite-genitive-singular":"nătăfleaței","dative-genitive-indefinite-plural":"nătăfleațe","dative-definite-genitive-plural":"nătăfleațelor","singular-vocative":"nătăfleață","plural-vocative":"nătăfleațelor"}},{"word":"natafleț","pos":"adj","definitions":["obsolete form of nătăfleț"],"forms":{"feminine-singular":"natafleață","masculine-plural":"natafleți","feminine-neuter-plural":"nataflețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"natafleț","error-unrecognized-form-feminine-indefinite-singular":"natafleață","error-unrecognized-form-indefinite-masculine-plural":"natafleți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nataflețe","definite-error-unrecognized-form-masculine-neuter-singular":"nataflețul","definite-error-unrecognized-form-feminine-singular":"natafleața","definite-error-unrecognized-form-masculine-plural":"natafleții","definite-error-unrecognized-form-feminine-neuter-plural":"nataflețele"}},{"word":"nătăfleț","pos":"adj","definitions":["foolish, easy to fool"],"pronunciation":"/nə.təˈflet͡s/","forms":{"feminine-singular":"nătăfleață","masculine-plural":"nătăfleți","feminine-neuter-plural":"nătăflețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nătăfleț","error-unrecognized-form-feminine-indefinite-singular":"nătăfleață","error-unrecognized-form-indefinite-masculine-plural":"nătăfleți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nătăflețe","definite-error-unrecognized-form-masculine-neuter-singular":"nătăflețul","definite-error-unrecognized-form-feminine-singular":"nătăfleața","definite-error-unrecognized-form-masculine-plural":"nătăfleții","definite-error-unrecognized-form-feminine-neuter-plural":"nătăflețele"}},{"word":"nătăfleț","pos":"noun","definitions":["dunce, fool"],"pronunciation":"/nə.təˈflet͡s/","forms":{"plural":"nătăfleți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nătăfleț","accusative-definite-nominative-singular":"nătăflețul","accusative-indefinite-nominative-plural":"nătăfleți","accusative-definite-nominative-plural":"nătăfleții","dative-genitive-indefinite-singular":"nătăfleț","dative-definite-genitive-singular":"nătăflețului","dative-genitive-indefinite-plural":"nătăfleți","dative-definite-genitive-plural":"nătăfleților","singular-vocative":"nătăflețule","plural-vocative":"nătăfleților","alternative":"nătăflete"}},{"word":"nătăflete","pos":"adj","definitions":["alternative form of nătăfleț"],"forms":{"masculine-plural":"nătăfleți","feminine-neuter-plural":"nătăflete","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nătăflete","error-unrecognized-form-feminine-indefinite-singular":"nătăflete","error-unrecognized-form-indefinite-masculine-plural":"nătăfleți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nătăflete","definite-error-unrecognized-form-masculine-neuter-singular":"nătăfletele","definite-error-unrecognized-form-feminine-singular":"nătăfletea","definite-error-unrecognized-form-masculine-plural":"nătăfleții","definite-error-unrecognized-form-feminine-neuter-plural":"nătăfletele"}},{"word":"natal","pos":"adj","definitions":["natal"],"forms":{"feminine-singular":"natală","masculine-plural":"natali","feminine-neuter-plural":"natale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"natal","error-unrecognized-form-feminine-indefinite-singular":"natală","error-unrecognized-form-indefinite-masculine-plural":"natali","error-unrecognized-form-feminine-indefinite-neuter-plural":"natale","definite-error-unrecognized-form-masculine-neuter-singular":"natalul","definite-error-unrecognized-form-feminine-singular":"natala","definite-error-unrecognized-form-masculine-plural":"natalii","definite-error-unrecognized-form-feminine-neuter-plural":"natalele"}},{"word":"Natalievca","pos":"name","definitions":["a village in Natalievca, Fălești Raion, Moldova","a commune of Fălești Raion, Moldova"],"gender":"f"},{"word":"natalitate","pos":"noun","definitions":["birth rate"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"natalitate","accusative-definite-nominative-singular":"natalitatea","accusative-indefinite-nominative-plural":"natalități","accusative-definite-nominative-plural":"natalitățile","dative-genitive-indefinite-singular":"natalități","dative-definite-genitive-singular":"natalității","dative-genitive-indefinite-plural":"natalități","dative-definite-genitive-plural":"natalităților","singular-vocative":"natalitate","plural-vocative":"natalităților"}},{"word":"Nataliuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Nataliuc"}},{"word":"nătâng","pos":"adj","definitions":["foolish, stupid"],"forms":{"feminine-singular":"nătângă","masculine-plural":"nătângi","feminine-neuter-plural":"nătânge","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nătâng","error-unrecognized-form-feminine-indefinite-singular":"nătângă","error-unrecognized-form-indefinite-masculine-plural":"nătângi","error-unrecognized-form-feminine-indefinite-neuter-plural":"nătânge","definite-error-unrecognized-form-masculine-neuter-singular":"nătângul","definite-error-unrecognized-form-feminine-singular":"nătânga","definite-error-unrecognized-form-masculine-plural":"nătângii","definite-error-unrecognized-form-feminine-neuter-plural":"nătângele"}},{"word":"nătângă","pos":"noun","definitions":["female equivalent of nătâng"],"forms":{"plural":"nătânge","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nătângă","accusative-definite-nominative-singular":"nătânga","accusative-indefinite-nominative-plural":"nătânge","accusative-definite-nominative-plural":"nătângele","dative-genitive-indefinite-singular":"nătânge","dative-definite-genitive-singular":"nătângei","dative-genitive-indefinite-plural":"nătânge","dative-definite-genitive-plural":"nătângelor","singular-vocative":"nătângă","plural-vocative":"nătângelor"}},{"word":"nătângeală","pos":"noun","definitions":["stupidity"],"forms":{"plural":"nătângeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nătângeală","accusative-definite-nominative-singular":"nătângeala","accusative-indefinite-nominative-plural":"nătângele","accusative-definite-nominative-plural":"nătângelele","dative-genitive-indefinite-singular":"nătângele","dative-definite-genitive-singular":"nătângelei","dative-genitive-indefinite-plural":"nătângele","dative-definite-genitive-plural":"nătângelelor","singular-vocative":"nătângeală","plural-vocative":"nătângelelor"}},{"word":"nătângi","pos":"verb","definitions":["to become stupid"],"forms":{"canonical":"a nătângi 4th conjugation","present-singular-third-person":"nătângește","participle-past":"nătângit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nătângi","gerund":"nătângind","first-person-indicative-present-singular":"nătângesc","indicative-present-second-person-singular":"nătângești","indicative-present-singular-third-person":"nătângește","first-person-indicative-plural-present":"nătângim","indicative-plural-present-second-person":"nătângiți","indicative-plural-present-third-person":"nătângesc","first-person-imperfect-indicative-singular":"nătângeam","imperfect-indicative-second-person-singular":"nătângeai","imperfect-indicative-singular-third-person":"nătângea","first-person-imperfect-indicative-plural":"nătângeam","imperfect-indicative-plural-second-person":"nătângeați","imperfect-indicative-plural-third-person":"nătângeau","first-person-indicative-perfect-singular":"nătângii","indicative-perfect-second-person-singular":"nătângiși","indicative-perfect-singular-third-person":"nătângi","first-person-indicative-perfect-plural":"nătângirăm","indicative-perfect-plural-second-person":"nătângirăți","indicative-perfect-plural-third-person":"nătângiră","first-person-indicative-pluperfect-singular":"nătângisem","indicative-pluperfect-second-person-singular":"nătângiseși","indicative-pluperfect-singular-third-person":"nătângise","first-person-indicative-pluperfect-plural":"nătângiserăm","indicative-pluperfect-plural-second-person":"nătângiserăți","indicative-pluperfect-plural-third-person":"nătângiseră","first-person-present-singular-subjunctive":"să nătângesc","present-second-person-singular-subjunctive":"să nătângești","present-singular-subjunctive-third-person":"să nătângească","first-person-plural-present-subjunctive":"să nătângim","plural-present-second-person-subjunctive":"să nătângiți","plural-present-subjunctive-third-person":"să nătângească","imperative-second-person-singular":"nătângește","imperative-plural-second-person":"nătângiți","imperative-negative-second-person-singular":"nu nătângi","imperative-negative-plural-second-person":"nu nătângiți"}},{"word":"nătângie","pos":"noun","definitions":["stupidity, foolishness"],"forms":{"plural":"nătângii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nătângie","accusative-definite-nominative-singular":"nătângia","accusative-indefinite-nominative-plural":"nătângii","accusative-definite-nominative-plural":"nătângiile","dative-genitive-indefinite-singular":"nătângii","dative-definite-genitive-singular":"nătângiei","dative-genitive-indefinite-plural":"nătângii","dative-definite-genitive-plural":"nătângiilor","singular-vocative":"nătângie","plural-vocative":"nătângiilor"}},{"word":"nătântoacă","pos":"noun","definitions":["female equivalent of nătântoc"],"forms":{"plural":"nătântoace","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nătântoacă","accusative-definite-nominative-singular":"nătântoaca","accusative-indefinite-nominative-plural":"nătântoace","accusative-definite-nominative-plural":"nătântoacele","dative-genitive-indefinite-singular":"nătântoace","dative-definite-genitive-singular":"nătântoacei","dative-genitive-indefinite-plural":"nătântoace","dative-definite-genitive-plural":"nătântoacelor","singular-vocative":"nătântoacă","plural-vocative":"nătântoacelor"}},{"word":"nătântoc","pos":"adj","definitions":["foolish"],"forms":{"feminine-singular":"nătântocă","masculine-plural":"nătântoci","feminine-neuter-plural":"nătântoce","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nătântoc","error-unrecognized-form-feminine-indefinite-singular":"nătântocă","error-unrecognized-form-indefinite-masculine-plural":"nătântoci","error-unrecognized-form-feminine-indefinite-neuter-plural":"nătântoce","definite-error-unrecognized-form-masculine-neuter-singular":"nătântocul","definite-error-unrecognized-form-feminine-singular":"nătântoca","definite-error-unrecognized-form-masculine-plural":"nătântocii","definite-error-unrecognized-form-feminine-neuter-plural":"nătântocele"}},{"word":"natantol","pos":"adj","definitions":["foolish, stupid"],"forms":{"feminine-singular":"natantolă","masculine-plural":"natantoli","feminine-neuter-plural":"natantole","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"natantol","error-unrecognized-form-feminine-indefinite-singular":"natantolă","error-unrecognized-form-indefinite-masculine-plural":"natantoli","error-unrecognized-form-feminine-indefinite-neuter-plural":"natantole","definite-error-unrecognized-form-masculine-neuter-singular":"natantolul","definite-error-unrecognized-form-feminine-singular":"natantola","definite-error-unrecognized-form-masculine-plural":"natantolii","definite-error-unrecognized-form-feminine-neuter-plural":"natantolele"}},{"word":"nătăntol","pos":"adj","definitions":["alternative form of natantol"],"forms":{"feminine-singular":"nătăntolă","masculine-plural":"nătăntoli","feminine-neuter-plural":"nătăntole","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nătăntol","error-unrecognized-form-feminine-indefinite-singular":"nătăntolă","error-unrecognized-form-indefinite-masculine-plural":"nătăntoli","error-unrecognized-form-feminine-indefinite-neuter-plural":"nătăntole","definite-error-unrecognized-form-masculine-neuter-singular":"nătăntolul","definite-error-unrecognized-form-feminine-singular":"nătăntola","definite-error-unrecognized-form-masculine-plural":"nătăntolii","definite-error-unrecognized-form-feminine-neuter-plural":"nătăntolele"}},{"word":"nătărăie","pos":"noun","definitions":["foolishness"],"forms":{"plural":"nătărăii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nătărăie","accusative-definite-nominative-singular":"nătărăia","accusative-indefinite-nominative-plural":"nătărăii","accusative-definite-nominative-plural":"nătărăiile","dative-genitive-indefinite-singular":"nătărăii","dative-definite-genitive-singular":"nătărăiei","dative-genitive-indefinite-plural":"nătărăii","dative-definite-genitive-plural":"nătărăiilor","singular-vocative":"nătărăie","plural-vocative":"nătărăiilor"}},{"word":"Nătărău","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nătărău"}},{"word":"nătărău","pos":"noun","definitions":["fool"],"pronunciation":"/nə.təˈrəw/","forms":{"plural":"nătărăi","table-tags":"no-table-tags","inflection-template":"ro-noun-m-u","accusative-indefinite-nominative-singular":"nătărău","accusative-definite-nominative-singular":"nătărăul","accusative-indefinite-nominative-plural":"nătărăi","accusative-definite-nominative-plural":"nătărăii","dative-genitive-indefinite-singular":"nătărău","dative-definite-genitive-singular":"nătărăului","dative-genitive-indefinite-plural":"nătărăi","dative-definite-genitive-plural":"nătărăilor","singular-vocative":"nătărăule","plural-vocative":"nătărăilor"}},{"word":"nătăroaică","pos":"noun","definitions":["female equivalent of nătărău"],"forms":{"plural":"nătăroaice"}},{"word":"Natașa","pos":"name","definitions":["a female given name from Russian"],"gender":"f"},{"word":"natație","pos":"noun","definitions":["swimming"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"natație","accusative-definite-nominative-singular":"natația","accusative-indefinite-nominative-plural":"natații","accusative-definite-nominative-plural":"natațiile","dative-genitive-indefinite-singular":"natații","dative-definite-genitive-singular":"natației","dative-genitive-indefinite-plural":"natații","dative-definite-genitive-plural":"natațiilor","singular-vocative":"natație","plural-vocative":"natațiilor"}},{"word":"natație sincronă","pos":"noun","definitions":["synchronized swimming"]},{"word":"natațiune","pos":"noun","definitions":["obsolete form of natație"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"natațiune","accusative-definite-nominative":"natațiunea","dative-genitive-indefinite":"natațiuni","dative-definite-genitive":"natațiunii","vocative":"natațiune"}},{"word":"nație","pos":"noun","definitions":["alternative form of națiune"],"pronunciation":"/ˈnat͡si.e/","forms":{"plural":"nații"}},{"word":"național","pos":"adj","definitions":["national"],"pronunciation":"/na.t͡si.oˈnal/","forms":{"feminine-singular":"națională","masculine-plural":"naționali","feminine-neuter-plural":"naționale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"național","error-unrecognized-form-feminine-indefinite-singular":"națională","error-unrecognized-form-indefinite-masculine-plural":"naționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"naționale","definite-error-unrecognized-form-masculine-neuter-singular":"naționalul","definite-error-unrecognized-form-feminine-singular":"naționala","definite-error-unrecognized-form-masculine-plural":"naționalii","definite-error-unrecognized-form-feminine-neuter-plural":"naționalele"}},{"word":"național-socialism","pos":"noun","definitions":["National Socialism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"național-socialism","accusative-definite-nominative":"național-socialismul","dative-genitive-indefinite":"național-socialism","dative-definite-genitive":"național-socialismului","vocative":"național-socialismule"}},{"word":"național-socialist","pos":"adj","definitions":["National Socialist"],"forms":{"feminine-singular":"național-socialistă","masculine-plural":"național-socialiști","feminine-neuter-plural":"național-socialiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"național-socialist","error-unrecognized-form-feminine-indefinite-singular":"național-socialistă","error-unrecognized-form-indefinite-masculine-plural":"național-socialiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"național-socialiste","definite-error-unrecognized-form-masculine-neuter-singular":"național-socialistul","definite-error-unrecognized-form-feminine-singular":"național-socialista","definite-error-unrecognized-form-masculine-plural":"național-socialiștii","definite-error-unrecognized-form-feminine-neuter-plural":"național-socialistele"}},{"word":"național-socialistă","pos":"noun","definitions":["female equivalent of național-socialist"],"forms":{"plural":"național-socialiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"național-socialistă","accusative-definite-nominative-singular":"național-socialista","accusative-indefinite-nominative-plural":"național-socialiste","accusative-definite-nominative-plural":"național-socialistele","dative-genitive-indefinite-singular":"național-socialiste","dative-definite-genitive-singular":"național-socialistei","dative-genitive-indefinite-plural":"național-socialiste","dative-definite-genitive-plural":"național-socialistelor","singular-vocative":"național-socialistă","plural-vocative":"național-socialistelor"}},{"word":"națională","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of național"]},{"word":"naționalicesc","pos":"adj","definitions":["national"],"forms":{"feminine-singular":"naționalicească","plural":"naționalicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"naționalicesc","error-unrecognized-form-feminine-indefinite-singular":"naționalicească","error-unrecognized-form-indefinite-masculine-plural":"naționalicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"naționalicești","definite-error-unrecognized-form-masculine-neuter-singular":"naționalicescul","definite-error-unrecognized-form-feminine-singular":"naționaliceasca","definite-error-unrecognized-form-masculine-plural":"naționaliceștii","definite-error-unrecognized-form-feminine-neuter-plural":"naționaliceștile"}},{"word":"naționalicește","pos":"adv","definitions":["nationally"]},{"word":"naționalism","pos":"noun","definitions":["nationalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"naționalism","accusative-definite-nominative-singular":"naționalismul","accusative-indefinite-nominative-plural":"naționalisme","accusative-definite-nominative-plural":"naționalismele","dative-genitive-indefinite-singular":"naționalism","dative-definite-genitive-singular":"naționalismului","dative-genitive-indefinite-plural":"naționalisme","dative-definite-genitive-plural":"naționalismelor","singular-vocative":"naționalismule","plural-vocative":"naționalismelor"}},{"word":"naționalist","pos":"adj","definitions":["nationalist, nationalistic"],"forms":{"feminine-singular":"naționalistă","masculine-plural":"naționaliști","feminine-neuter-plural":"naționaliste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"naționalist","error-unrecognized-form-feminine-indefinite-singular":"naționalistă","error-unrecognized-form-indefinite-masculine-plural":"naționaliști","error-unrecognized-form-feminine-indefinite-neuter-plural":"naționaliste","definite-error-unrecognized-form-masculine-neuter-singular":"naționalistul","definite-error-unrecognized-form-feminine-singular":"naționalista","definite-error-unrecognized-form-masculine-plural":"naționaliștii","definite-error-unrecognized-form-feminine-neuter-plural":"naționalistele"}},{"word":"naționalist","pos":"noun","definitions":["nationalist"],"forms":{"plural":"naționaliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"naționalist","accusative-definite-nominative-singular":"naționalistul","accusative-indefinite-nominative-plural":"naționaliști","accusative-definite-nominative-plural":"naționaliștii","dative-genitive-indefinite-singular":"naționalist","dative-definite-genitive-singular":"naționalistului","dative-genitive-indefinite-plural":"naționaliști","dative-definite-genitive-plural":"naționaliștilor","singular-vocative":"naționalistule","plural-vocative":"naționaliștilor"}},{"word":"naționalistă","pos":"noun","definitions":["female equivalent of naționalist"],"forms":{"plural":"naționaliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"naționalistă","accusative-definite-nominative-singular":"naționalista","accusative-indefinite-nominative-plural":"naționaliste","accusative-definite-nominative-plural":"naționalistele","dative-genitive-indefinite-singular":"naționaliste","dative-definite-genitive-singular":"naționalistei","dative-genitive-indefinite-plural":"naționaliste","dative-definite-genitive-plural":"naționalistelor","singular-vocative":"naționalistă","plural-vocative":"naționalistelor"}},{"word":"naționalistic","pos":"adj","definitions":["nationalist, nationalistic"],"forms":{"feminine-singular":"naționalistică","masculine-plural":"naționalistici","feminine-neuter-plural":"naționalistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"naționalistic","error-unrecognized-form-feminine-indefinite-singular":"naționalistică","error-unrecognized-form-indefinite-masculine-plural":"naționalistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"naționalistice","definite-error-unrecognized-form-masculine-neuter-singular":"naționalisticul","definite-error-unrecognized-form-feminine-singular":"naționalistica","definite-error-unrecognized-form-masculine-plural":"naționalisticii","definite-error-unrecognized-form-feminine-neuter-plural":"naționalisticele"}},{"word":"naționalitate","pos":"noun","definitions":["nationality (in the sense of national identity only, i.e. a people sharing a common origin, culture and/or language)"],"forms":{"plural":"naționalități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"naționalitate","accusative-definite-nominative-singular":"naționalitatea","accusative-indefinite-nominative-plural":"naționalități","accusative-definite-nominative-plural":"naționalitățile","dative-genitive-indefinite-singular":"naționalități","dative-definite-genitive-singular":"naționalității","dative-genitive-indefinite-plural":"naționalități","dative-definite-genitive-plural":"naționalităților","singular-vocative":"naționalitate","plural-vocative":"naționalităților"}},{"word":"naționaliza","pos":"verb","definitions":["to nationalize"],"forms":{"canonical":"a naționaliza 1st conjugation","present-singular-third-person":"naționalizează","participle-past":"naționalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a naționaliza","gerund":"naționalizând","first-person-indicative-present-singular":"naționalizez","indicative-present-second-person-singular":"naționalizezi","indicative-present-singular-third-person":"naționalizează","first-person-indicative-plural-present":"naționalizăm","indicative-plural-present-second-person":"naționalizați","indicative-plural-present-third-person":"naționalizează","first-person-imperfect-indicative-singular":"naționalizam","imperfect-indicative-second-person-singular":"naționalizai","imperfect-indicative-singular-third-person":"naționaliza","first-person-imperfect-indicative-plural":"naționalizam","imperfect-indicative-plural-second-person":"naționalizați","imperfect-indicative-plural-third-person":"naționalizau","first-person-indicative-perfect-singular":"naționalizai","indicative-perfect-second-person-singular":"naționalizași","indicative-perfect-singular-third-person":"naționaliză","first-person-indicative-perfect-plural":"naționalizarăm","indicative-perfect-plural-second-person":"naționalizarăți","indicative-perfect-plural-third-person":"naționalizară","first-person-indicative-pluperfect-singular":"naționalizasem","indicative-pluperfect-second-person-singular":"naționalizaseși","indicative-pluperfect-singular-third-person":"naționalizase","first-person-indicative-pluperfect-plural":"naționalizaserăm","indicative-pluperfect-plural-second-person":"naționalizaserăți","indicative-pluperfect-plural-third-person":"naționalizaseră","first-person-present-singular-subjunctive":"să naționalizez","present-second-person-singular-subjunctive":"să naționalizezi","present-singular-subjunctive-third-person":"să naționalizeze","first-person-plural-present-subjunctive":"să naționalizăm","plural-present-second-person-subjunctive":"să naționalizați","plural-present-subjunctive-third-person":"să naționalizeze","imperative-second-person-singular":"naționalizează","imperative-plural-second-person":"naționalizați","imperative-negative-second-person-singular":"nu naționaliza","imperative-negative-plural-second-person":"nu naționalizați"}},{"word":"naționalizare","pos":"noun","definitions":["nationalization"],"forms":{"plural":"naționalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"naționalizare","accusative-definite-nominative-singular":"naționalizarea","accusative-indefinite-nominative-plural":"naționalizări","accusative-definite-nominative-plural":"naționalizările","dative-genitive-indefinite-singular":"naționalizări","dative-definite-genitive-singular":"naționalizării","dative-genitive-indefinite-plural":"naționalizări","dative-definite-genitive-plural":"naționalizărilor","singular-vocative":"naționalizare","plural-vocative":"naționalizărilor"}},{"word":"naționalizat","pos":"adj","definitions":["nationalized"],"forms":{"feminine-singular":"naționalizată","masculine-plural":"naționalizați","feminine-neuter-plural":"naționalizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"naționalizat","error-unrecognized-form-feminine-indefinite-singular":"naționalizată","error-unrecognized-form-indefinite-masculine-plural":"naționalizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"naționalizate","definite-error-unrecognized-form-masculine-neuter-singular":"naționalizatul","definite-error-unrecognized-form-feminine-singular":"naționalizata","definite-error-unrecognized-form-masculine-plural":"naționalizații","definite-error-unrecognized-form-feminine-neuter-plural":"naționalizatele"}},{"word":"naționalnic","pos":"adj","definitions":["national"],"forms":{"feminine-singular":"naționalnică","masculine-plural":"naționalnici","feminine-neuter-plural":"naționalnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"naționalnic","error-unrecognized-form-feminine-indefinite-singular":"naționalnică","error-unrecognized-form-indefinite-masculine-plural":"naționalnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"naționalnice","definite-error-unrecognized-form-masculine-neuter-singular":"naționalnicul","definite-error-unrecognized-form-feminine-singular":"naționalnica","definite-error-unrecognized-form-masculine-plural":"naționalnicii","definite-error-unrecognized-form-feminine-neuter-plural":"naționalnicele"}},{"word":"națiunal","pos":"adj","definitions":["obsolete form of național"],"forms":{"feminine-singular":"națiunală","masculine-plural":"națiunali","feminine-neuter-plural":"națiunale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"națiunal","error-unrecognized-form-feminine-indefinite-singular":"națiunală","error-unrecognized-form-indefinite-masculine-plural":"națiunali","error-unrecognized-form-feminine-indefinite-neuter-plural":"națiunale","definite-error-unrecognized-form-masculine-neuter-singular":"națiunalul","definite-error-unrecognized-form-feminine-singular":"națiunala","definite-error-unrecognized-form-masculine-plural":"națiunalii","definite-error-unrecognized-form-feminine-neuter-plural":"națiunalele"}},{"word":"națiune","pos":"noun","definitions":["nation country, land","people"],"forms":{"plural":"națiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"națiune","accusative-definite-nominative-singular":"națiunea","accusative-indefinite-nominative-plural":"națiuni","accusative-definite-nominative-plural":"națiunile","dative-genitive-indefinite-singular":"națiuni","dative-definite-genitive-singular":"națiunii","dative-genitive-indefinite-plural":"națiuni","dative-definite-genitive-plural":"națiunilor","singular-vocative":"națiune","plural-vocative":"națiunilor","alternative-dated":"nație"}},{"word":"națiunile","pos":"noun","definitions":["definite nominative/accusative plural of națiune"]},{"word":"Națiunile Unite","pos":"name","definitions":["United Nations"],"gender":"f","forms":{"alternative":"Нациуниле Уните"}},{"word":"națiunilor","pos":"noun","definitions":["definite genitive/dative plural of națiune"]},{"word":"nativ","pos":"adj","definitions":["native; innate"],"pronunciation":"/naˈtiv/","examples":[{"ro":"Sunt vorbitori nativi ai limbii române.","en":"They are native speakers of Romanian."}],"forms":{"feminine-singular":"nativă","masculine-plural":"nativi","feminine-neuter-plural":"native","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"nativ","error-unrecognized-form-feminine-indefinite-singular":"nativă","error-unrecognized-form-indefinite-masculine-plural":"nativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"native","definite-error-unrecognized-form-masculine-neuter-singular":"nativul","definite-error-unrecognized-form-feminine-singular":"nativa","definite-error-unrecognized-form-masculine-plural":"nativii","definite-error-unrecognized-form-feminine-neuter-plural":"nativele"}},{"word":"nativa","pos":"adj","definitions":["definite nominative/accusative feminine singular of nativ"],"pronunciation":"[naˈti.va]"},{"word":"native","pos":"adj","definitions":["feminine/neuter plural nominative/accusative of nativ"],"pronunciation":"[naˈti.ve]"},{"word":"nativism","pos":"noun","definitions":["nativism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nativism","accusative-definite-nominative":"nativismul","dative-genitive-indefinite":"nativism","dative-definite-genitive":"nativismului","vocative":"nativismule"}},{"word":"nativist","pos":"adj","definitions":["nativist"],"forms":{"feminine-singular":"nativistă","masculine-plural":"nativiști","feminine-neuter-plural":"nativiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nativist","error-unrecognized-form-feminine-indefinite-singular":"nativistă","error-unrecognized-form-indefinite-masculine-plural":"nativiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"nativiste","definite-error-unrecognized-form-masculine-neuter-singular":"nativistul","definite-error-unrecognized-form-feminine-singular":"nativista","definite-error-unrecognized-form-masculine-plural":"nativiștii","definite-error-unrecognized-form-feminine-neuter-plural":"nativistele"}},{"word":"nativist","pos":"noun","definitions":["nativist"],"forms":{"plural":"nativiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nativist","accusative-definite-nominative-singular":"nativistul","accusative-indefinite-nominative-plural":"nativiști","accusative-definite-nominative-plural":"nativiștii","dative-genitive-indefinite-singular":"nativist","dative-definite-genitive-singular":"nativistului","dative-genitive-indefinite-plural":"nativiști","dative-definite-genitive-plural":"nativiștilor","singular-vocative":"nativistule","plural-vocative":"nativiștilor"}},{"word":"nativitate","pos":"noun","definitions":["nativity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"nativitate","accusative-definite-nominative":"nativitatea","dative-genitive-indefinite":"nativități","dative-definite-genitive":"nativității","vocative":"-"}},{"word":"nătot","pos":"adj","definitions":["obsolete form of netot"],"forms":{"feminine-singular":"nătotă","masculine-plural":"nătoți","feminine-neuter-plural":"nătote","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nătot","error-unrecognized-form-feminine-indefinite-singular":"nătotă","error-unrecognized-form-indefinite-masculine-plural":"nătoți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nătote","definite-error-unrecognized-form-masculine-neuter-singular":"nătotul","definite-error-unrecognized-form-feminine-singular":"nătota","definite-error-unrecognized-form-masculine-plural":"nătoții","definite-error-unrecognized-form-feminine-neuter-plural":"nătotele"}},{"word":"natpis","pos":"noun","definitions":["alternative form of nadpis"],"forms":{"plural":"natpisuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"natpis","accusative-definite-nominative-singular":"natpisul","accusative-indefinite-nominative-plural":"natpisuri","accusative-definite-nominative-plural":"natpisurile","dative-genitive-indefinite-singular":"natpis","dative-definite-genitive-singular":"natpisului","dative-genitive-indefinite-plural":"natpisuri","dative-definite-genitive-plural":"natpisurilor","singular-vocative":"natpisule","plural-vocative":"natpisurilor"}},{"word":"natră","pos":"noun","definitions":["warp"],"forms":{"plural":"natre"}},{"word":"natremie","pos":"noun","definitions":["natremia"],"forms":{"plural":"natremii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"natremie","accusative-definite-nominative-singular":"natremia","accusative-indefinite-nominative-plural":"natremii","accusative-definite-nominative-plural":"natremiile","dative-genitive-indefinite-singular":"natremii","dative-definite-genitive-singular":"natremiei","dative-genitive-indefinite-plural":"natremii","dative-definite-genitive-plural":"natremiilor","singular-vocative":"natremie","plural-vocative":"natremiilor"}},{"word":"natriu","pos":"noun","definitions":["sodium (chemical element)"],"pronunciation":"/ˈnatrju/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"natriu","accusative-definite-nominative":"natriul","dative-genitive-indefinite":"natriu","dative-definite-genitive":"natriului","vocative":"natriule"}},{"word":"natură","pos":"noun","definitions":["nature"],"forms":{"plural":"naturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"natură","accusative-definite-nominative-singular":"natura","accusative-indefinite-nominative-plural":"naturi","accusative-definite-nominative-plural":"naturile","dative-genitive-indefinite-singular":"naturi","dative-definite-genitive-singular":"naturii","dative-genitive-indefinite-plural":"naturi","dative-definite-genitive-plural":"naturilor","singular-vocative":"natură","plural-vocative":"naturilor"}},{"word":"natură moartă","pos":"noun","definitions":["still life"]},{"word":"natural","pos":"adj","definitions":["natural"],"pronunciation":"/na.tuˈral/","forms":{"feminine-singular":"naturală","masculine-plural":"naturali","feminine-neuter-plural":"naturale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"natural","error-unrecognized-form-feminine-indefinite-singular":"naturală","error-unrecognized-form-indefinite-masculine-plural":"naturali","error-unrecognized-form-feminine-indefinite-neuter-plural":"naturale","definite-error-unrecognized-form-masculine-neuter-singular":"naturalul","definite-error-unrecognized-form-feminine-singular":"naturala","definite-error-unrecognized-form-masculine-plural":"naturalii","definite-error-unrecognized-form-feminine-neuter-plural":"naturalele"}},{"word":"naturală","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of natural"]},{"word":"naturalețe","pos":"noun","definitions":["naturalness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"naturalețe","accusative-definite-nominative":"naturalețea","dative-genitive-indefinite":"naturalețe","dative-definite-genitive":"naturaleței","vocative":"naturalețe"}},{"word":"naturalicește","pos":"adv","definitions":["naturally"]},{"word":"naturalism","pos":"noun","definitions":["naturalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"naturalism","accusative-definite-nominative":"naturalismul","dative-genitive-indefinite":"naturalism","dative-definite-genitive":"naturalismului","vocative":"naturalismule"}},{"word":"naturalist","pos":"noun","definitions":["naturalist"],"forms":{"plural":"naturaliști","feminine":"equivalent naturalistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"naturalist","accusative-definite-nominative-singular":"naturalistul","accusative-indefinite-nominative-plural":"naturaliști","accusative-definite-nominative-plural":"naturaliștii","dative-genitive-indefinite-singular":"naturalist","dative-definite-genitive-singular":"naturalistului","dative-genitive-indefinite-plural":"naturaliști","dative-definite-genitive-plural":"naturaliștilor","singular-vocative":"naturalistule","plural-vocative":"naturaliștilor"}},{"word":"naturalistă","pos":"noun","definitions":["female equivalent of naturalist"],"forms":{"plural":"naturaliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"naturalistă","accusative-definite-nominative-singular":"naturalista","accusative-indefinite-nominative-plural":"naturaliste","accusative-definite-nominative-plural":"naturalistele","dative-genitive-indefinite-singular":"naturaliste","dative-definite-genitive-singular":"naturalistei","dative-genitive-indefinite-plural":"naturaliste","dative-definite-genitive-plural":"naturalistelor","singular-vocative":"naturalistă","plural-vocative":"naturalistelor"}},{"word":"naturalitate","pos":"noun","definitions":["naturality"],"forms":{"plural":"naturalități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"naturalitate","accusative-definite-nominative-singular":"naturalitatea","accusative-indefinite-nominative-plural":"naturalități","accusative-definite-nominative-plural":"naturalitățile","dative-genitive-indefinite-singular":"naturalități","dative-definite-genitive-singular":"naturalității","dative-genitive-indefinite-plural":"naturalități","dative-definite-genitive-plural":"naturalităților","singular-vocative":"naturalitate","plural-vocative":"naturalităților"}},{"word":"naturalități","pos":"noun","definitions":["plural of naturalitate"]},{"word":"naturaliza","pos":"verb","definitions":["to naturalize"],"forms":{"canonical":"a naturaliza 1st conjugation","present-singular-third-person":"naturalizează","participle-past":"naturalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a naturaliza","gerund":"naturalizând","first-person-indicative-present-singular":"naturalizez","indicative-present-second-person-singular":"naturalizezi","indicative-present-singular-third-person":"naturalizează","first-person-indicative-plural-present":"naturalizăm","indicative-plural-present-second-person":"naturalizați","indicative-plural-present-third-person":"naturalizează","first-person-imperfect-indicative-singular":"naturalizam","imperfect-indicative-second-person-singular":"naturalizai","imperfect-indicative-singular-third-person":"naturaliza","first-person-imperfect-indicative-plural":"naturalizam","imperfect-indicative-plural-second-person":"naturalizați","imperfect-indicative-plural-third-person":"naturalizau","first-person-indicative-perfect-singular":"naturalizai","indicative-perfect-second-person-singular":"naturalizași","indicative-perfect-singular-third-person":"naturaliză","first-person-indicative-perfect-plural":"naturalizarăm","indicative-perfect-plural-second-person":"naturalizarăți","indicative-perfect-plural-third-person":"naturalizară","first-person-indicative-pluperfect-singular":"naturalizasem","indicative-pluperfect-second-person-singular":"naturalizaseși","indicative-pluperfect-singular-third-person":"naturalizase","first-person-indicative-pluperfect-plural":"naturalizaserăm","indicative-pluperfect-plural-second-person":"naturalizaserăți","indicative-pluperfect-plural-third-person":"naturalizaseră","first-person-present-singular-subjunctive":"să naturalizez","present-second-person-singular-subjunctive":"să naturalizezi","present-singular-subjunctive-third-person":"să naturalizeze","first-person-plural-present-subjunctive":"să naturalizăm","plural-present-second-person-subjunctive":"să naturalizați","plural-present-subjunctive-third-person":"să naturalizeze","imperative-second-person-singular":"naturalizează","imperative-plural-second-person":"naturalizați","imperative-negative-second-person-singular":"nu naturaliza","imperative-negative-plural-second-person":"nu naturalizați"}},{"word":"naturalizare","pos":"noun","definitions":["naturalization"],"forms":{"plural":"naturalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"naturalizare","accusative-definite-nominative-singular":"naturalizarea","accusative-indefinite-nominative-plural":"naturalizări","accusative-definite-nominative-plural":"naturalizările","dative-genitive-indefinite-singular":"naturalizări","dative-definite-genitive-singular":"naturalizării","dative-genitive-indefinite-plural":"naturalizări","dative-definite-genitive-plural":"naturalizărilor","singular-vocative":"naturalizare","plural-vocative":"naturalizărilor"}},{"word":"naturalizat","pos":"adj","definitions":["naturalized"],"forms":{"feminine-singular":"naturalizată","masculine-plural":"naturalizați","feminine-neuter-plural":"naturalizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"naturalizat","error-unrecognized-form-feminine-indefinite-singular":"naturalizată","error-unrecognized-form-indefinite-masculine-plural":"naturalizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"naturalizate","definite-error-unrecognized-form-masculine-neuter-singular":"naturalizatul","definite-error-unrecognized-form-feminine-singular":"naturalizata","definite-error-unrecognized-form-masculine-plural":"naturalizații","definite-error-unrecognized-form-feminine-neuter-plural":"naturalizatele"}},{"word":"naturalizație","pos":"noun","definitions":["naturalisation"],"forms":{"plural":"naturalizații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"naturalizație","accusative-definite-nominative-singular":"naturalizația","accusative-indefinite-nominative-plural":"naturalizații","accusative-definite-nominative-plural":"naturalizațiile","dative-genitive-indefinite-singular":"naturalizații","dative-definite-genitive-singular":"naturalizației","dative-genitive-indefinite-plural":"naturalizații","dative-definite-genitive-plural":"naturalizațiilor","singular-vocative":"naturalizație","plural-vocative":"naturalizațiilor"}},{"word":"naturalizațiune","pos":"noun","definitions":["obsolete form of naturalizație"],"forms":{"plural":"naturalizațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"naturalizațiune","accusative-definite-nominative-singular":"naturalizațiunea","accusative-indefinite-nominative-plural":"naturalizațiuni","accusative-definite-nominative-plural":"naturalizațiunile","dative-genitive-indefinite-singular":"naturalizațiuni","dative-definite-genitive-singular":"naturalizațiunii","dative-genitive-indefinite-plural":"naturalizațiuni","dative-definite-genitive-plural":"naturalizațiunilor","singular-vocative":"naturalizațiune","plural-vocative":"naturalizațiunilor"}},{"word":"naturalmente","pos":"adv","definitions":["naturally"]},{"word":"naturi","pos":"noun","definitions":["plural of natură","indefinite genitive/dative singular/plural of natură"]},{"word":"naturism","pos":"noun","definitions":["naturism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"naturism","accusative-definite-nominative":"naturismul","dative-genitive-indefinite":"naturism","dative-definite-genitive":"naturismului","vocative":"naturismule"}},{"word":"naturist","pos":"adj","definitions":["naturist"],"forms":{"feminine-singular":"naturistă","masculine-plural":"naturiști","feminine-neuter-plural":"naturiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"naturist","error-unrecognized-form-feminine-indefinite-singular":"naturistă","error-unrecognized-form-indefinite-masculine-plural":"naturiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"naturiste","definite-error-unrecognized-form-masculine-neuter-singular":"naturistul","definite-error-unrecognized-form-feminine-singular":"naturista","definite-error-unrecognized-form-masculine-plural":"naturiștii","definite-error-unrecognized-form-feminine-neuter-plural":"naturistele"}},{"word":"naturistă","pos":"noun","definitions":["female equivalent of naturist"],"forms":{"plural":"naturiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"naturistă","accusative-definite-nominative-singular":"naturista","accusative-indefinite-nominative-plural":"naturiste","accusative-definite-nominative-plural":"naturistele","dative-genitive-indefinite-singular":"naturiste","dative-definite-genitive-singular":"naturistei","dative-genitive-indefinite-plural":"naturiste","dative-definite-genitive-plural":"naturistelor","singular-vocative":"naturistă","plural-vocative":"naturistelor"}},{"word":"naturoterapie","pos":"noun","definitions":["naturopathy"],"forms":{"plural":"naturoterapii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"naturoterapie","accusative-definite-nominative-singular":"naturoterapia","accusative-indefinite-nominative-plural":"naturoterapii","accusative-definite-nominative-plural":"naturoterapiile","dative-genitive-indefinite-singular":"naturoterapii","dative-definite-genitive-singular":"naturoterapiei","dative-genitive-indefinite-plural":"naturoterapii","dative-definite-genitive-plural":"naturoterapiilor","singular-vocative":"naturoterapie","plural-vocative":"naturoterapiilor"}},{"word":"năuc","pos":"adj","definitions":["disoriented, confused, bewildered"],"forms":{"feminine-singular":"năucă","masculine-plural":"năuci","feminine-neuter-plural":"năuce","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"năuc","error-unrecognized-form-feminine-indefinite-singular":"năucă","error-unrecognized-form-indefinite-masculine-plural":"năuci","error-unrecognized-form-feminine-indefinite-neuter-plural":"năuce","definite-error-unrecognized-form-masculine-neuter-singular":"năucul","definite-error-unrecognized-form-feminine-singular":"năuca","definite-error-unrecognized-form-masculine-plural":"năucii","definite-error-unrecognized-form-feminine-neuter-plural":"năucele"}},{"word":"năuceală","pos":"noun","definitions":["dizziness"],"forms":{"plural":"năuceli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"năuceală","accusative-definite-nominative-singular":"năuceala","accusative-indefinite-nominative-plural":"năuceli","accusative-definite-nominative-plural":"năucelile","dative-genitive-indefinite-singular":"năuceli","dative-definite-genitive-singular":"năucelii","dative-genitive-indefinite-plural":"năuceli","dative-definite-genitive-plural":"năucelilor","singular-vocative":"năuceală","plural-vocative":"năucelilor"}},{"word":"năuci","pos":"verb","definitions":["to dumbfound"],"forms":{"canonical":"a năuci 4th conjugation","present-singular-third-person":"năucește","participle-past":"năucit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a năuci","gerund":"năucind","first-person-indicative-present-singular":"năucesc","indicative-present-second-person-singular":"năucești","indicative-present-singular-third-person":"năucește","first-person-indicative-plural-present":"năucim","indicative-plural-present-second-person":"năuciți","indicative-plural-present-third-person":"năucesc","first-person-imperfect-indicative-singular":"năuceam","imperfect-indicative-second-person-singular":"năuceai","imperfect-indicative-singular-third-person":"năucea","first-person-imperfect-indicative-plural":"năuceam","imperfect-indicative-plural-second-person":"năuceați","imperfect-indicative-plural-third-person":"năuceau","first-person-indicative-perfect-singular":"năucii","indicative-perfect-second-person-singular":"năuciși","indicative-perfect-singular-third-person":"năuci","first-person-indicative-perfect-plural":"năucirăm","indicative-perfect-plural-second-person":"năucirăți","indicative-perfect-plural-third-person":"năuciră","first-person-indicative-pluperfect-singular":"năucisem","indicative-pluperfect-second-person-singular":"năuciseși","indicative-pluperfect-singular-third-person":"năucise","first-person-indicative-pluperfect-plural":"năuciserăm","indicative-pluperfect-plural-second-person":"năuciserăți","indicative-pluperfect-plural-third-person":"năuciseră","first-person-present-singular-subjunctive":"să năucesc","present-second-person-singular-subjunctive":"să năucești","present-singular-subjunctive-third-person":"să năucească","first-person-plural-present-subjunctive":"să năucim","plural-present-second-person-subjunctive":"să năuciți","plural-present-subjunctive-third-person":"să năucească","imperative-second-person-singular":"năucește","imperative-plural-second-person":"năuciți","imperative-negative-second-person-singular":"nu năuci","imperative-negative-plural-second-person":"nu năuciți"}},{"word":"năucie","pos":"noun","definitions":["dizziness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"năucie","accusative-definite-nominative":"năucia","dative-genitive-indefinite":"năucii","dative-definite-genitive":"năuciei","vocative":"năucie"}},{"word":"năucire","pos":"noun","definitions":["dizziness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"năucire","accusative-definite-nominative":"năucirea","dative-genitive-indefinite":"năucire","dative-definite-genitive":"năucirei","vocative":"năucire"}},{"word":"năucit","pos":"adj","definitions":["bewildered"],"forms":{"feminine-singular":"năucită","masculine-plural":"năuciți","feminine-neuter-plural":"năucite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"năucit","error-unrecognized-form-feminine-indefinite-singular":"năucită","error-unrecognized-form-indefinite-masculine-plural":"năuciți","error-unrecognized-form-feminine-indefinite-neuter-plural":"năucite","definite-error-unrecognized-form-masculine-neuter-singular":"năucitul","definite-error-unrecognized-form-feminine-singular":"năucita","definite-error-unrecognized-form-masculine-plural":"năuciții","definite-error-unrecognized-form-feminine-neuter-plural":"năucitele"}},{"word":"năucitor","pos":"adj","definitions":["stunning"],"forms":{"feminine-singular":"năucitoare","masculine-plural":"năucitori","feminine-neuter-plural":"năucitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"năucitor","error-unrecognized-form-feminine-indefinite-singular":"năucitoare","error-unrecognized-form-indefinite-masculine-plural":"năucitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"năucitoare","definite-error-unrecognized-form-masculine-neuter-singular":"năucitorul","definite-error-unrecognized-form-feminine-singular":"năucitoarea","definite-error-unrecognized-form-masculine-plural":"năucitorii","definite-error-unrecognized-form-feminine-neuter-plural":"năucitoarele"}},{"word":"naufragia","pos":"verb","definitions":["to be shipwrecked"],"forms":{"canonical":"a naufragia 1st conjugation","present-singular-third-person":"naufragiază","participle-past":"naufragiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a naufragia","gerund":"naufragiind","first-person-indicative-present-singular":"naufragiez","indicative-present-second-person-singular":"naufragiezi","indicative-present-singular-third-person":"naufragiază","first-person-indicative-plural-present":"naufragiem","indicative-plural-present-second-person":"naufragiați","indicative-plural-present-third-person":"naufragiază","first-person-imperfect-indicative-singular":"naufragiam","imperfect-indicative-second-person-singular":"naufragiai","imperfect-indicative-singular-third-person":"naufragia","first-person-imperfect-indicative-plural":"naufragiam","imperfect-indicative-plural-second-person":"naufragiați","imperfect-indicative-plural-third-person":"naufragiau","first-person-indicative-perfect-singular":"naufragiai","indicative-perfect-second-person-singular":"naufragiași","indicative-perfect-singular-third-person":"naufragie","first-person-indicative-perfect-plural":"naufragiarăm","indicative-perfect-plural-second-person":"naufragiarăți","indicative-perfect-plural-third-person":"naufragiară","first-person-indicative-pluperfect-singular":"naufragiasem","indicative-pluperfect-second-person-singular":"naufragiaseși","indicative-pluperfect-singular-third-person":"naufragiase","first-person-indicative-pluperfect-plural":"naufragiaserăm","indicative-pluperfect-plural-second-person":"naufragiaserăți","indicative-pluperfect-plural-third-person":"naufragiaseră","first-person-present-singular-subjunctive":"să naufragiez","present-second-person-singular-subjunctive":"să naufragiezi","present-singular-subjunctive-third-person":"să naufragieze","first-person-plural-present-subjunctive":"să naufragiem","plural-present-second-person-subjunctive":"să naufragiați","plural-present-subjunctive-third-person":"să naufragieze","imperative-second-person-singular":"naufragiază","imperative-plural-second-person":"naufragiați","imperative-negative-second-person-singular":"nu naufragia","imperative-negative-plural-second-person":"nu naufragiați"}},{"word":"naufragiat","pos":"adj","definitions":["shipwrecked"],"forms":{"feminine-singular":"naufragiată","masculine-plural":"naufragiați","feminine-neuter-plural":"naufragiate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"naufragiat","error-unrecognized-form-feminine-indefinite-singular":"naufragiată","error-unrecognized-form-indefinite-masculine-plural":"naufragiați","error-unrecognized-form-feminine-indefinite-neuter-plural":"naufragiate","definite-error-unrecognized-form-masculine-neuter-singular":"naufragiatul","definite-error-unrecognized-form-feminine-singular":"naufragiata","definite-error-unrecognized-form-masculine-plural":"naufragiații","definite-error-unrecognized-form-feminine-neuter-plural":"naufragiatele"}},{"word":"naufragiere","pos":"noun","definitions":["stranding"],"forms":{"plural":"naufragieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"naufragiere","accusative-definite-nominative-singular":"naufragierea","accusative-indefinite-nominative-plural":"naufragieri","accusative-definite-nominative-plural":"naufragierile","dative-genitive-indefinite-singular":"naufragieri","dative-definite-genitive-singular":"naufragierii","dative-genitive-indefinite-plural":"naufragieri","dative-definite-genitive-plural":"naufragierilor","singular-vocative":"naufragiere","plural-vocative":"naufragierilor"}},{"word":"naufragios","pos":"adj","definitions":["shipwrecky"],"forms":{"feminine-singular":"naufragioasă","masculine-plural":"naufragioși","feminine-neuter-plural":"naufragioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"naufragios","error-unrecognized-form-feminine-indefinite-singular":"naufragioasă","error-unrecognized-form-indefinite-masculine-plural":"naufragioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"naufragioase","definite-error-unrecognized-form-masculine-neuter-singular":"naufragiosul","definite-error-unrecognized-form-feminine-singular":"naufragioasa","definite-error-unrecognized-form-masculine-plural":"naufragioșii","definite-error-unrecognized-form-feminine-neuter-plural":"naufragioasele"}},{"word":"naufragiu","pos":"noun","definitions":["shipwreck"],"forms":{"plural":"naufragii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"naufragiu","accusative-definite-nominative-singular":"naufragiul","accusative-indefinite-nominative-plural":"naufragii","accusative-definite-nominative-plural":"naufragiile","dative-genitive-indefinite-singular":"naufragiu","dative-definite-genitive-singular":"naufragiului","dative-genitive-indefinite-plural":"naufragii","dative-definite-genitive-plural":"naufragiilor","singular-vocative":"naufragiule","plural-vocative":"naufragiilor"}},{"word":"Naumencu","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Naumencu"}},{"word":"Naumescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Naumescu"}},{"word":"Naumovici","pos":"name","definitions":["a surname from Polish"],"gender":"m","forms":{"dative-genitive":"lui Naumovici"}},{"word":"năuntru","pos":"adv","definitions":["alternative form of înăuntru"]},{"word":"naupatie","pos":"noun","definitions":["naupathia, seasickness"],"forms":{"plural":"naupatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"naupatie","accusative-definite-nominative-singular":"naupatia","accusative-indefinite-nominative-plural":"naupatii","accusative-definite-nominative-plural":"naupatiile","dative-genitive-indefinite-singular":"naupatii","dative-definite-genitive-singular":"naupatiei","dative-genitive-indefinite-plural":"naupatii","dative-definite-genitive-plural":"naupatiilor","singular-vocative":"naupatie","plural-vocative":"naupatiilor"}},{"word":"nauplius","pos":"noun","definitions":["nauplius"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"nauplius","accusative-definite-nominative":"naupliusul","dative-genitive-indefinite":"nauplius","dative-definite-genitive":"naupliusului","vocative":"naupliusule"}},{"word":"nauruan","pos":"noun","definitions":["Nauruan"],"pronunciation":"/na.u.ruˈan/","forms":{"plural":"nauruani","feminine":"equivalent nauruană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nauruan","accusative-definite-nominative-singular":"nauruanul","accusative-indefinite-nominative-plural":"nauruani","accusative-definite-nominative-plural":"nauruanii","dative-genitive-indefinite-singular":"nauruan","dative-definite-genitive-singular":"nauruanului","dative-genitive-indefinite-plural":"nauruani","dative-definite-genitive-plural":"nauruanilor","singular-vocative":"nauruanule","plural-vocative":"nauruanilor"}},{"word":"nauruan","pos":"adj","definitions":["Nauruan"],"pronunciation":"/na.u.ruˈan/","forms":{"feminine-singular":"nauruană","masculine-plural":"nauruani","feminine-neuter-plural":"nauruane","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"nauruan","error-unrecognized-form-feminine-indefinite-singular":"nauruană","error-unrecognized-form-indefinite-masculine-plural":"nauruani","error-unrecognized-form-feminine-indefinite-neuter-plural":"nauruane","definite-error-unrecognized-form-masculine-neuter-singular":"nauruanul","definite-error-unrecognized-form-feminine-singular":"nauruana","definite-error-unrecognized-form-masculine-plural":"nauruanii","definite-error-unrecognized-form-feminine-neuter-plural":"nauruanele"}},{"word":"nauruană","pos":"noun","definitions":["female equivalent of nauruan"],"forms":{"plural":"nauruane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nauruană","accusative-definite-nominative-singular":"nauruana","accusative-indefinite-nominative-plural":"nauruane","accusative-definite-nominative-plural":"nauruanele","dative-genitive-indefinite-singular":"nauruane","dative-definite-genitive-singular":"nauruanei","dative-genitive-indefinite-plural":"nauruane","dative-definite-genitive-plural":"nauruanelor","singular-vocative":"nauruană","plural-vocative":"nauruanelor"}},{"word":"nauscopie","pos":"noun","definitions":["nauscopy"],"forms":{"plural":"nauscopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nauscopie","accusative-definite-nominative-singular":"nauscopia","accusative-indefinite-nominative-plural":"nauscopii","accusative-definite-nominative-plural":"nauscopiile","dative-genitive-indefinite-singular":"nauscopii","dative-definite-genitive-singular":"nauscopiei","dative-genitive-indefinite-plural":"nauscopii","dative-definite-genitive-plural":"nauscopiilor","singular-vocative":"nauscopie","plural-vocative":"nauscopiilor"}},{"word":"năut","pos":"noun","definitions":["chickpeas"],"pronunciation":"/nəˈut/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"năut","accusative-definite-nominative":"năutul","dative-genitive-indefinite":"năut","dative-definite-genitive":"năutului","vocative":"năutule","alternative-archaic":"năhut"}},{"word":"nautic","pos":"adj","definitions":["nautical"],"pronunciation":"/naˈu.tik/","forms":{"feminine-singular":"nautică","masculine-plural":"nautici","feminine-neuter-plural":"nautice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nautic","error-unrecognized-form-feminine-indefinite-singular":"nautică","error-unrecognized-form-indefinite-masculine-plural":"nautici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nautice","definite-error-unrecognized-form-masculine-neuter-singular":"nauticul","definite-error-unrecognized-form-feminine-singular":"nautica","definite-error-unrecognized-form-masculine-plural":"nauticii","definite-error-unrecognized-form-feminine-neuter-plural":"nauticele"}},{"word":"nautică","pos":"noun","definitions":["nautics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nautică","accusative-definite-nominative-singular":"nautica","accusative-indefinite-nominative-plural":"nautice","accusative-definite-nominative-plural":"nauticele","dative-genitive-indefinite-singular":"nautice","dative-definite-genitive-singular":"nauticei","dative-genitive-indefinite-plural":"nautice","dative-definite-genitive-plural":"nauticelor","singular-vocative":"nautică","plural-vocative":"nauticelor"}},{"word":"nautil","pos":"noun","definitions":["nautilus"],"forms":{"plural":"nautili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nautil","accusative-definite-nominative-singular":"nautilul","accusative-indefinite-nominative-plural":"nautili","accusative-definite-nominative-plural":"nautilii","dative-genitive-indefinite-singular":"nautil","dative-definite-genitive-singular":"nautilului","dative-genitive-indefinite-plural":"nautili","dative-definite-genitive-plural":"nautililor","singular-vocative":"nautilule","plural-vocative":"nautililor"}},{"word":"nautiloid","pos":"noun","definitions":["nautiloid"],"forms":{"plural":"nautiloide","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nautiloid","accusative-definite-nominative-singular":"nautiloidul","accusative-indefinite-nominative-plural":"nautiloide","accusative-definite-nominative-plural":"nautiloidele","dative-genitive-indefinite-singular":"nautiloid","dative-definite-genitive-singular":"nautiloidului","dative-genitive-indefinite-plural":"nautiloide","dative-definite-genitive-plural":"nautiloidelor","singular-vocative":"nautiloidule","plural-vocative":"nautiloidelor"}},{"word":"nautilus","pos":"noun","definitions":["alternative form of nautil"],"forms":{"plural":"nautiluși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nautilus","accusative-definite-nominative-singular":"nautilusul","accusative-indefinite-nominative-plural":"nautiluși","accusative-definite-nominative-plural":"nautilușii","dative-genitive-indefinite-singular":"nautilus","dative-definite-genitive-singular":"nautilusului","dative-genitive-indefinite-plural":"nautiluși","dative-definite-genitive-plural":"nautilușilor","singular-vocative":"nautilusule","plural-vocative":"nautilușilor"}},{"word":"năutiu","pos":"adj","definitions":["chickpea colored, yellowish"],"forms":{"feminine-singular":"năutie","plural":"năutii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"năutiu","error-unrecognized-form-feminine-indefinite-singular":"năutie","error-unrecognized-form-indefinite-masculine-plural":"năutii","error-unrecognized-form-feminine-indefinite-neuter-plural":"năutii","definite-error-unrecognized-form-masculine-neuter-singular":"năutiul","definite-error-unrecognized-form-feminine-singular":"năutia","definite-error-unrecognized-form-masculine-plural":"năutiii","definite-error-unrecognized-form-feminine-neuter-plural":"năutiile"}},{"word":"nautofon","pos":"noun","definitions":["an electric foghorn"],"forms":{"plural":"nautofoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nautofon","accusative-definite-nominative-singular":"nautofonul","accusative-indefinite-nominative-plural":"nautofoane","accusative-definite-nominative-plural":"nautofoanele","dative-genitive-indefinite-singular":"nautofon","dative-definite-genitive-singular":"nautofonului","dative-genitive-indefinite-plural":"nautofoane","dative-definite-genitive-plural":"nautofoanelor","singular-vocative":"nautofonule","plural-vocative":"nautofoanelor"}},{"word":"nava","pos":"noun","definitions":["definite nominative/accusative singular of navă"]},{"word":"navă","pos":"noun","definitions":["ship"],"forms":{"plural":"nave","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"navă","accusative-definite-nominative-singular":"nava","accusative-indefinite-nominative-plural":"nave","accusative-definite-nominative-plural":"navele","dative-genitive-indefinite-singular":"nave","dative-definite-genitive-singular":"navei","dative-genitive-indefinite-plural":"nave","dative-definite-genitive-plural":"navelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"navă cosmică","pos":"noun","definitions":["spaceship"],"forms":{"plural":"nave cosmice"}},{"word":"navă de croazieră","pos":"noun","definitions":["cruise ship"],"forms":{"plural":"nave de croazieră"}},{"word":"navă de debarcare","pos":"noun","definitions":["landing ship"],"forms":{"plural":"nave de debarcare"}},{"word":"navă de război","pos":"noun","definitions":["warship"],"forms":{"plural":"nave de război"}},{"word":"navă militară","pos":"noun","definitions":["warship"],"forms":{"plural":"nave militare"}},{"word":"navă-amiral","pos":"noun","definitions":["flagship"]},{"word":"naval","pos":"adj","definitions":["nautical"],"forms":{"feminine-singular":"navală","masculine-plural":"navali","feminine-neuter-plural":"navale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"naval","error-unrecognized-form-feminine-indefinite-singular":"navală","error-unrecognized-form-indefinite-masculine-plural":"navali","error-unrecognized-form-feminine-indefinite-neuter-plural":"navale","definite-error-unrecognized-form-masculine-neuter-singular":"navalul","definite-error-unrecognized-form-feminine-singular":"navala","definite-error-unrecognized-form-masculine-plural":"navalii","definite-error-unrecognized-form-feminine-neuter-plural":"navalele"}},{"word":"navala","pos":"adj","definitions":["definite nominative/accusative feminine singular of naval"],"gender":"f"},{"word":"Năvală","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Năvală"}},{"word":"năvală","pos":"noun","definitions":["attack, invasion, assault, onslaught","onrush, act of rushing at or toward"],"forms":{"plural":"năvale"}},{"word":"năvăli","pos":"verb","definitions":["to attack, invade, rush at, assault, pounce upon, overwhelm, overflow"],"forms":{"canonical":"a năvăli 4th conjugation","present-singular-third-person":"năvălește","participle-past":"năvălit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a năvăli","gerund":"năvălind","first-person-indicative-present-singular":"năvălesc","indicative-present-second-person-singular":"năvălești","indicative-present-singular-third-person":"năvălește","first-person-indicative-plural-present":"năvălim","indicative-plural-present-second-person":"năvăliți","indicative-plural-present-third-person":"năvălesc","first-person-imperfect-indicative-singular":"năvăleam","imperfect-indicative-second-person-singular":"năvăleai","imperfect-indicative-singular-third-person":"năvălea","first-person-imperfect-indicative-plural":"năvăleam","imperfect-indicative-plural-second-person":"năvăleați","imperfect-indicative-plural-third-person":"năvăleau","first-person-indicative-perfect-singular":"năvălii","indicative-perfect-second-person-singular":"năvăliși","indicative-perfect-singular-third-person":"năvăli","first-person-indicative-perfect-plural":"năvălirăm","indicative-perfect-plural-second-person":"năvălirăți","indicative-perfect-plural-third-person":"năvăliră","first-person-indicative-pluperfect-singular":"năvălisem","indicative-pluperfect-second-person-singular":"năvăliseși","indicative-pluperfect-singular-third-person":"năvălise","first-person-indicative-pluperfect-plural":"năvăliserăm","indicative-pluperfect-plural-second-person":"năvăliserăți","indicative-pluperfect-plural-third-person":"năvăliseră","first-person-present-singular-subjunctive":"să năvălesc","present-second-person-singular-subjunctive":"să năvălești","present-singular-subjunctive-third-person":"să năvălească","first-person-plural-present-subjunctive":"să năvălim","plural-present-second-person-subjunctive":"să năvăliți","plural-present-subjunctive-third-person":"să năvălească","imperative-second-person-singular":"năvălește","imperative-plural-second-person":"năvăliți","imperative-negative-second-person-singular":"nu năvăli","imperative-negative-plural-second-person":"nu năvăliți"}},{"word":"năvălire","pos":"noun","definitions":["invasion"],"forms":{"plural":"năvăliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"năvălire","accusative-definite-nominative-singular":"năvălirea","accusative-indefinite-nominative-plural":"năvăliri","accusative-definite-nominative-plural":"năvălirile","dative-genitive-indefinite-singular":"năvăliri","dative-definite-genitive-singular":"năvălirii","dative-genitive-indefinite-plural":"năvăliri","dative-definite-genitive-plural":"năvălirilor","singular-vocative":"năvălire","plural-vocative":"năvălirilor"}},{"word":"năvălitoare","pos":"noun","definitions":["female equivalent of năvălitor"],"forms":{"plural":"năvălitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"năvălitoare","accusative-definite-nominative-singular":"năvălitoarea","accusative-indefinite-nominative-plural":"năvălitoare","accusative-definite-nominative-plural":"năvălitoarele","dative-genitive-indefinite-singular":"năvălitoare","dative-definite-genitive-singular":"năvălitoarei","dative-genitive-indefinite-plural":"năvălitoare","dative-definite-genitive-plural":"năvălitoarelor","singular-vocative":"năvălitoare","plural-vocative":"năvălitoarelor"}},{"word":"năvălitor","pos":"noun","definitions":["invader"],"forms":{"plural":"năvălitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"năvălitor","accusative-definite-nominative-singular":"năvălitorul","accusative-indefinite-nominative-plural":"năvălitori","accusative-definite-nominative-plural":"năvălitorii","dative-genitive-indefinite-singular":"năvălitor","dative-definite-genitive-singular":"năvălitorului","dative-genitive-indefinite-plural":"năvălitori","dative-definite-genitive-plural":"năvălitorilor","singular-vocative":"năvălitorule","plural-vocative":"năvălitorilor"}},{"word":"năvălitură","pos":"noun","definitions":["attack, onrush"],"forms":{"plural":"năvălituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"năvălitură","accusative-definite-nominative-singular":"năvălitura","accusative-indefinite-nominative-plural":"năvălituri","accusative-definite-nominative-plural":"năvăliturile","dative-genitive-indefinite-singular":"năvălituri","dative-definite-genitive-singular":"năvăliturii","dative-genitive-indefinite-plural":"năvălituri","dative-definite-genitive-plural":"năvăliturilor","singular-vocative":"năvălitură","plural-vocative":"năvăliturilor"}},{"word":"năvalnic","pos":"adj","definitions":["impetuous, heady","stormy"],"forms":{"feminine-singular":"năvalnică","masculine-plural":"năvalnici","feminine-neuter-plural":"năvalnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"năvalnic","error-unrecognized-form-feminine-indefinite-singular":"năvalnică","error-unrecognized-form-indefinite-masculine-plural":"năvalnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"năvalnice","definite-error-unrecognized-form-masculine-neuter-singular":"năvalnicul","definite-error-unrecognized-form-feminine-singular":"năvalnica","definite-error-unrecognized-form-masculine-plural":"năvalnicii","definite-error-unrecognized-form-feminine-neuter-plural":"năvalnicele"}},{"word":"năvalnic","pos":"adv","definitions":["impetuously"]},{"word":"năvalnic","pos":"noun","definitions":["hart's tongue, hart's-tongue fern (Asplenium scolopendrium)"],"forms":{"plural":"năvalnici"}},{"word":"năvalnică","pos":"noun","definitions":["female equivalent of năvalnic"],"forms":{"plural":"năvalnice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"năvalnică","accusative-definite-nominative-singular":"năvalnica","accusative-indefinite-nominative-plural":"năvalnice","accusative-definite-nominative-plural":"năvalnicele","dative-genitive-indefinite-singular":"năvalnice","dative-definite-genitive-singular":"năvalnicei","dative-genitive-indefinite-plural":"năvalnice","dative-definite-genitive-plural":"năvalnicelor","singular-vocative":"năvalnică","plural-vocative":"năvalnicelor"}},{"word":"năvălnicie","pos":"noun","definitions":["impetuosity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"năvălnicie","accusative-definite-nominative":"năvălnicia","dative-genitive-indefinite":"năvălnicii","dative-definite-genitive":"năvălniciei","vocative":"năvălnicie"}},{"word":"navarh","pos":"noun","definitions":["navarch"],"forms":{"plural":"navarhi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"navarh","accusative-definite-nominative-singular":"navarhul","accusative-indefinite-nominative-plural":"navarhi","accusative-definite-nominative-plural":"navarhii","dative-genitive-indefinite-singular":"navarh","dative-definite-genitive-singular":"navarhului","dative-genitive-indefinite-plural":"navarhi","dative-definite-genitive-plural":"navarhilor","singular-vocative":"navarhule","plural-vocative":"navarhilor"}},{"word":"năvârneală","pos":"noun","definitions":["toil"],"forms":{"plural":"năvârneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"năvârneală","accusative-definite-nominative-singular":"năvârneala","accusative-indefinite-nominative-plural":"năvârnele","accusative-definite-nominative-plural":"năvârnelele","dative-genitive-indefinite-singular":"năvârnele","dative-definite-genitive-singular":"năvârnelei","dative-genitive-indefinite-plural":"năvârnele","dative-definite-genitive-plural":"năvârnelelor","singular-vocative":"năvârneală","plural-vocative":"năvârnelelor"}},{"word":"navectăr","pos":"noun","definitions":["night watchman (a guard that protects cities at night)"],"forms":{"plural":"navectări","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"navectăr","accusative-definite-nominative-singular":"navectărul","accusative-indefinite-nominative-plural":"navectări","accusative-definite-nominative-plural":"navectării","dative-genitive-indefinite-singular":"navectăr","dative-definite-genitive-singular":"navectărului","dative-genitive-indefinite-plural":"navectări","dative-definite-genitive-plural":"navectărilor","singular-vocative":"navectărule","plural-vocative":"navectărilor"}},{"word":"naveta","pos":"noun","definitions":["definite nominative/accusative singular of navetă"]},{"word":"navetă","pos":"noun","definitions":["shuttle","commuting"],"forms":{"plural":"navete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"navetă","accusative-definite-nominative-singular":"naveta","accusative-indefinite-nominative-plural":"navete","accusative-definite-nominative-plural":"navetele","dative-genitive-indefinite-singular":"navete","dative-definite-genitive-singular":"navetei","dative-genitive-indefinite-plural":"navete","dative-definite-genitive-plural":"navetelor","singular-vocative":"navetă","plural-vocative":"navetelor"}},{"word":"navetă spațială","pos":"noun","definitions":["space shuttle"],"forms":{"plural":"navete spațiale"}},{"word":"navetist","pos":"noun","definitions":["commuter"],"forms":{"plural":"navetiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"navetist","accusative-definite-nominative-singular":"navetistul","accusative-indefinite-nominative-plural":"navetiști","accusative-definite-nominative-plural":"navetiștii","dative-genitive-indefinite-singular":"navetist","dative-definite-genitive-singular":"navetistului","dative-genitive-indefinite-plural":"navetiști","dative-definite-genitive-plural":"navetiștilor","singular-vocative":"navetistule","plural-vocative":"navetiștilor"}},{"word":"navetistă","pos":"noun","definitions":["female equivalent of navetist"],"forms":{"plural":"navetiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"navetistă","accusative-definite-nominative-singular":"navetista","accusative-indefinite-nominative-plural":"navetiste","accusative-definite-nominative-plural":"navetistele","dative-genitive-indefinite-singular":"navetiste","dative-definite-genitive-singular":"navetistei","dative-genitive-indefinite-plural":"navetiste","dative-definite-genitive-plural":"navetistelor","singular-vocative":"navetistă","plural-vocative":"navetistelor"}},{"word":"navicular","pos":"adj","definitions":["navicular"],"forms":{"feminine-singular":"naviculară","masculine-plural":"naviculari","feminine-neuter-plural":"naviculare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"navicular","error-unrecognized-form-feminine-indefinite-singular":"naviculară","error-unrecognized-form-indefinite-masculine-plural":"naviculari","error-unrecognized-form-feminine-indefinite-neuter-plural":"naviculare","definite-error-unrecognized-form-masculine-neuter-singular":"navicularul","definite-error-unrecognized-form-feminine-singular":"naviculara","definite-error-unrecognized-form-masculine-plural":"navicularii","definite-error-unrecognized-form-feminine-neuter-plural":"navicularele"}},{"word":"naviga","pos":"verb","definitions":["to navigate","to surf the internet"],"pronunciation":"/na.viˈɡa/","examples":[{"ro":"Navighezi pe internet.","en":"You surf the internet."}],"forms":{"canonical":"a naviga 1st conjugation","present-singular-third-person":"navighează","participle-past":"navigat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a naviga","gerund":"navigând","first-person-indicative-present-singular":"navighez","indicative-present-second-person-singular":"navighezi","indicative-present-singular-third-person":"navighează","first-person-indicative-plural-present":"navigăm","indicative-plural-present-second-person":"navigați","indicative-plural-present-third-person":"navighează","first-person-imperfect-indicative-singular":"navigam","imperfect-indicative-second-person-singular":"navigai","imperfect-indicative-singular-third-person":"naviga","first-person-imperfect-indicative-plural":"navigam","imperfect-indicative-plural-second-person":"navigați","imperfect-indicative-plural-third-person":"navigau","first-person-indicative-perfect-singular":"navigai","indicative-perfect-second-person-singular":"navigași","indicative-perfect-singular-third-person":"navigă","first-person-indicative-perfect-plural":"navigarăm","indicative-perfect-plural-second-person":"navigarăți","indicative-perfect-plural-third-person":"navigară","first-person-indicative-pluperfect-singular":"navigasem","indicative-pluperfect-second-person-singular":"navigaseși","indicative-pluperfect-singular-third-person":"navigase","first-person-indicative-pluperfect-plural":"navigaserăm","indicative-pluperfect-plural-second-person":"navigaserăți","indicative-pluperfect-plural-third-person":"navigaseră","first-person-present-singular-subjunctive":"să navighez","present-second-person-singular-subjunctive":"să navighezi","present-singular-subjunctive-third-person":"să navigheze","first-person-plural-present-subjunctive":"să navigăm","plural-present-second-person-subjunctive":"să navigați","plural-present-subjunctive-third-person":"să navigheze","imperative-second-person-singular":"navighează","imperative-plural-second-person":"navigați","imperative-negative-second-person-singular":"nu naviga","imperative-negative-plural-second-person":"nu navigați"}},{"word":"navigabil","pos":"adj","definitions":["navigable"],"forms":{"feminine-singular":"navigabilă","masculine-plural":"navigabili","feminine-neuter-plural":"navigabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"navigabil","error-unrecognized-form-feminine-indefinite-singular":"navigabilă","error-unrecognized-form-indefinite-masculine-plural":"navigabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"navigabile","definite-error-unrecognized-form-masculine-neuter-singular":"navigabilul","definite-error-unrecognized-form-feminine-singular":"navigabila","definite-error-unrecognized-form-masculine-plural":"navigabilii","definite-error-unrecognized-form-feminine-neuter-plural":"navigabilele"}},{"word":"navigabilitate","pos":"noun","definitions":["navigability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"navigabilitate","accusative-definite-nominative-singular":"navigabilitatea","accusative-indefinite-nominative-plural":"navigabilități","accusative-definite-nominative-plural":"navigabilitățile","dative-genitive-indefinite-singular":"navigabilități","dative-definite-genitive-singular":"navigabilității","dative-genitive-indefinite-plural":"navigabilități","dative-definite-genitive-plural":"navigabilităților","singular-vocative":"navigabilitate","plural-vocative":"navigabilităților"}},{"word":"navigabiliza","pos":"verb","definitions":["to make a waterway navigable"],"forms":{"canonical":"a navigabiliza 1st conjugation","present-singular-third-person":"navigabilizează","participle-past":"navigabilizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a navigabiliza","gerund":"navigabilizând","first-person-indicative-present-singular":"navigabilizez","indicative-present-second-person-singular":"navigabilizezi","indicative-present-singular-third-person":"navigabilizează","first-person-indicative-plural-present":"navigabilizăm","indicative-plural-present-second-person":"navigabilizați","indicative-plural-present-third-person":"navigabilizează","first-person-imperfect-indicative-singular":"navigabilizam","imperfect-indicative-second-person-singular":"navigabilizai","imperfect-indicative-singular-third-person":"navigabiliza","first-person-imperfect-indicative-plural":"navigabilizam","imperfect-indicative-plural-second-person":"navigabilizați","imperfect-indicative-plural-third-person":"navigabilizau","first-person-indicative-perfect-singular":"navigabilizai","indicative-perfect-second-person-singular":"navigabilizași","indicative-perfect-singular-third-person":"navigabiliză","first-person-indicative-perfect-plural":"navigabilizarăm","indicative-perfect-plural-second-person":"navigabilizarăți","indicative-perfect-plural-third-person":"navigabilizară","first-person-indicative-pluperfect-singular":"navigabilizasem","indicative-pluperfect-second-person-singular":"navigabilizaseși","indicative-pluperfect-singular-third-person":"navigabilizase","first-person-indicative-pluperfect-plural":"navigabilizaserăm","indicative-pluperfect-plural-second-person":"navigabilizaserăți","indicative-pluperfect-plural-third-person":"navigabilizaseră","first-person-present-singular-subjunctive":"să navigabilizez","present-second-person-singular-subjunctive":"să navigabilizezi","present-singular-subjunctive-third-person":"să navigabilizeze","first-person-plural-present-subjunctive":"să navigabilizăm","plural-present-second-person-subjunctive":"să navigabilizați","plural-present-subjunctive-third-person":"să navigabilizeze","imperative-second-person-singular":"navigabilizează","imperative-plural-second-person":"navigabilizați","imperative-negative-second-person-singular":"nu navigabiliza","imperative-negative-plural-second-person":"nu navigabilizați"}},{"word":"navigabilizare","pos":"noun","definitions":["making a waterway navigable"],"forms":{"plural":"navigabilizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"navigabilizare","accusative-definite-nominative-singular":"navigabilizarea","accusative-indefinite-nominative-plural":"navigabilizări","accusative-definite-nominative-plural":"navigabilizările","dative-genitive-indefinite-singular":"navigabilizări","dative-definite-genitive-singular":"navigabilizării","dative-genitive-indefinite-plural":"navigabilizări","dative-definite-genitive-plural":"navigabilizărilor","singular-vocative":"navigabilizare","plural-vocative":"navigabilizărilor"}},{"word":"navigai","pos":"verb","definitions":["inflection of naviga:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[naviˈɡaj]"},{"word":"navigant","pos":"adj","definitions":["navigating"],"forms":{"feminine-singular":"navigantă","masculine-plural":"naviganți","feminine-neuter-plural":"navigante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"navigant","error-unrecognized-form-feminine-indefinite-singular":"navigantă","error-unrecognized-form-indefinite-masculine-plural":"naviganți","error-unrecognized-form-feminine-indefinite-neuter-plural":"navigante","definite-error-unrecognized-form-masculine-neuter-singular":"navigantul","definite-error-unrecognized-form-feminine-singular":"naviganta","definite-error-unrecognized-form-masculine-plural":"naviganții","definite-error-unrecognized-form-feminine-neuter-plural":"navigantele"}},{"word":"navigare","pos":"noun","definitions":["navigation"],"forms":{"plural":"navigări"}},{"word":"navigat","pos":"noun","definitions":["navigation"],"pronunciation":"[naviˈɡat]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"navigat","accusative-definite-nominative":"navigatul","dative-genitive-indefinite":"navigat","dative-definite-genitive":"navigatului","vocative":"navigatule"}},{"word":"navigat","pos":"verb","definitions":["past participle of naviga"],"pronunciation":"[naviˈɡat]","forms":{"participle-past":"of naviga"}},{"word":"navigație","pos":"noun","definitions":["navigation"],"pronunciation":"/naviˈɡat͡si.e/","forms":{"plural":"navigații"}},{"word":"navigațiune","pos":"noun","definitions":["obsolete form of navigație"],"forms":{"plural":"navigațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"navigațiune","accusative-definite-nominative-singular":"navigațiunea","accusative-indefinite-nominative-plural":"navigațiuni","accusative-definite-nominative-plural":"navigațiunile","dative-genitive-indefinite-singular":"navigațiuni","dative-definite-genitive-singular":"navigațiunii","dative-genitive-indefinite-plural":"navigațiuni","dative-definite-genitive-plural":"navigațiunilor","singular-vocative":"navigațiune","plural-vocative":"navigațiunilor"}},{"word":"navigatoare","pos":"noun","definitions":["female equivalent of navigator"],"forms":{"plural":"navigatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"navigatoare","accusative-definite-nominative-singular":"navigatoarea","accusative-indefinite-nominative-plural":"navigatoare","accusative-definite-nominative-plural":"navigatoarele","dative-genitive-indefinite-singular":"navigatoare","dative-definite-genitive-singular":"navigatoarei","dative-genitive-indefinite-plural":"navigatoare","dative-definite-genitive-plural":"navigatoarelor","singular-vocative":"navigatoare","plural-vocative":"navigatoarelor"}},{"word":"navigator","pos":"noun","definitions":["navigator","browser"],"forms":{"plural":"navigatori","feminine":"equivalent navigatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"navigator","accusative-definite-nominative-singular":"navigatorul","accusative-indefinite-nominative-plural":"navigatori","accusative-definite-nominative-plural":"navigatorii","dative-genitive-indefinite-singular":"navigator","dative-definite-genitive-singular":"navigatorului","dative-genitive-indefinite-plural":"navigatori","dative-definite-genitive-plural":"navigatorilor","singular-vocative":"navigatorule","plural-vocative":"navigatorilor","alternative":"навигатор"}},{"word":"navigator web","pos":"noun","definitions":["web browser"],"forms":{"plural":"navigatoare web"}},{"word":"navigraf","pos":"noun","definitions":["an instrument once used to measure speed and direction of an aircraft relative to the ground"],"forms":{"plural":"navigrafe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"navigraf","accusative-definite-nominative-singular":"navigraful","accusative-indefinite-nominative-plural":"navigrafe","accusative-definite-nominative-plural":"navigrafele","dative-genitive-indefinite-singular":"navigraf","dative-definite-genitive-singular":"navigrafului","dative-genitive-indefinite-plural":"navigrafe","dative-definite-genitive-plural":"navigrafelor","singular-vocative":"navigrafule","plural-vocative":"navigrafelor"}},{"word":"navlon","pos":"noun","definitions":["alternative form of navlu"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"navlon","accusative-definite-nominative":"navlonul","dative-genitive-indefinite":"navlon","dative-definite-genitive":"navlonului","vocative":"navlonule"}},{"word":"navlosi","pos":"verb","definitions":["to charter a ship"],"forms":{"canonical":"a navlosi 4th conjugation","present-singular-third-person":"navlosește","participle-past":"navlosit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a navlosi","gerund":"navlosind","first-person-indicative-present-singular":"navlosesc","indicative-present-second-person-singular":"navlosești","indicative-present-singular-third-person":"navlosește","first-person-indicative-plural-present":"navlosim","indicative-plural-present-second-person":"navlosiți","indicative-plural-present-third-person":"navlosesc","first-person-imperfect-indicative-singular":"navloseam","imperfect-indicative-second-person-singular":"navloseai","imperfect-indicative-singular-third-person":"navlosea","first-person-imperfect-indicative-plural":"navloseam","imperfect-indicative-plural-second-person":"navloseați","imperfect-indicative-plural-third-person":"navloseau","first-person-indicative-perfect-singular":"navlosii","indicative-perfect-second-person-singular":"navlosiși","indicative-perfect-singular-third-person":"navlosi","first-person-indicative-perfect-plural":"navlosirăm","indicative-perfect-plural-second-person":"navlosirăți","indicative-perfect-plural-third-person":"navlosiră","first-person-indicative-pluperfect-singular":"navlosisem","indicative-pluperfect-second-person-singular":"navlosiseși","indicative-pluperfect-singular-third-person":"navlosise","first-person-indicative-pluperfect-plural":"navlosiserăm","indicative-pluperfect-plural-second-person":"navlosiserăți","indicative-pluperfect-plural-third-person":"navlosiseră","first-person-present-singular-subjunctive":"să navlosesc","present-second-person-singular-subjunctive":"să navlosești","present-singular-subjunctive-third-person":"să navlosească","first-person-plural-present-subjunctive":"să navlosim","plural-present-second-person-subjunctive":"să navlosiți","plural-present-subjunctive-third-person":"să navlosească","imperative-second-person-singular":"navlosește","imperative-plural-second-person":"navlosiți","imperative-negative-second-person-singular":"nu navlosi","imperative-negative-plural-second-person":"nu navlosiți"}},{"word":"navlosire","pos":"noun","definitions":["chartering of a ship"],"forms":{"plural":"navlosiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"navlosire","accusative-definite-nominative-singular":"navlosirea","accusative-indefinite-nominative-plural":"navlosiri","accusative-definite-nominative-plural":"navlosirile","dative-genitive-indefinite-singular":"navlosiri","dative-definite-genitive-singular":"navlosirii","dative-genitive-indefinite-plural":"navlosiri","dative-definite-genitive-plural":"navlosirilor","singular-vocative":"navlosire","plural-vocative":"navlosirilor"}},{"word":"navlositor","pos":"noun","definitions":["charterer (of a ship)"],"forms":{"plural":"navlositori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"navlositor","accusative-definite-nominative-singular":"navlositorul","accusative-indefinite-nominative-plural":"navlositori","accusative-definite-nominative-plural":"navlositorii","dative-genitive-indefinite-singular":"navlositor","dative-definite-genitive-singular":"navlositorului","dative-genitive-indefinite-plural":"navlositori","dative-definite-genitive-plural":"navlositorilor","singular-vocative":"navlositorule","plural-vocative":"navlositorilor"}},{"word":"navlu","pos":"noun","definitions":["rent for commissioning a ship"],"forms":{"plural":"navluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"navlu","accusative-definite-nominative-singular":"navlul","accusative-indefinite-nominative-plural":"navluri","accusative-definite-nominative-plural":"navlurile","dative-genitive-indefinite-singular":"navlu","dative-definite-genitive-singular":"navlului","dative-genitive-indefinite-plural":"navluri","dative-definite-genitive-plural":"navlurilor","singular-vocative":"navlule","plural-vocative":"navlurilor"}},{"word":"năvod","pos":"noun","definitions":["net","net for fishing; seine, dragnet, trawl, trammel"],"forms":{"plural":"năvoade"}},{"word":"năvodar","pos":"noun","definitions":["trawler"],"forms":{"plural":"năvodari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"năvodar","accusative-definite-nominative-singular":"năvodarul","accusative-indefinite-nominative-plural":"năvodari","accusative-definite-nominative-plural":"năvodarii","dative-genitive-indefinite-singular":"năvodar","dative-definite-genitive-singular":"năvodarului","dative-genitive-indefinite-plural":"năvodari","dative-definite-genitive-plural":"năvodarilor","singular-vocative":"năvodarule","plural-vocative":"năvodarilor"}},{"word":"Năvodari","pos":"name","definitions":["a city in Constanța County, Romania","a village in Seaca, Teleorman County, Romania"],"gender":"m"},{"word":"năvodari","pos":"noun","definitions":["plural of năvodar"]},{"word":"Năvodaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Năvodaru"}},{"word":"năvodaș","pos":"noun","definitions":["trawler (person)"],"forms":{"plural":"năvodași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"năvodaș","accusative-definite-nominative-singular":"năvodașul","accusative-indefinite-nominative-plural":"năvodași","accusative-definite-nominative-plural":"năvodașii","dative-genitive-indefinite-singular":"năvodaș","dative-definite-genitive-singular":"năvodașului","dative-genitive-indefinite-plural":"năvodași","dative-definite-genitive-plural":"năvodașilor","singular-vocative":"năvodașule","plural-vocative":"năvodașilor"}},{"word":"năvodi","pos":"verb","definitions":["to trawl"],"forms":{"canonical":"a năvodi 4th conjugation","present-singular-third-person":"năvodește","participle-past":"năvodit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a năvodi","gerund":"năvodind","first-person-indicative-present-singular":"năvodesc","indicative-present-second-person-singular":"năvodești","indicative-present-singular-third-person":"năvodește","first-person-indicative-plural-present":"năvodim","indicative-plural-present-second-person":"năvodiți","indicative-plural-present-third-person":"năvodesc","first-person-imperfect-indicative-singular":"năvodeam","imperfect-indicative-second-person-singular":"năvodeai","imperfect-indicative-singular-third-person":"năvodea","first-person-imperfect-indicative-plural":"năvodeam","imperfect-indicative-plural-second-person":"năvodeați","imperfect-indicative-plural-third-person":"năvodeau","first-person-indicative-perfect-singular":"năvodii","indicative-perfect-second-person-singular":"năvodiși","indicative-perfect-singular-third-person":"năvodi","first-person-indicative-perfect-plural":"năvodirăm","indicative-perfect-plural-second-person":"năvodirăți","indicative-perfect-plural-third-person":"năvodiră","first-person-indicative-pluperfect-singular":"năvodisem","indicative-pluperfect-second-person-singular":"năvodiseși","indicative-pluperfect-singular-third-person":"năvodise","first-person-indicative-pluperfect-plural":"năvodiserăm","indicative-pluperfect-plural-second-person":"năvodiserăți","indicative-pluperfect-plural-third-person":"năvodiseră","first-person-present-singular-subjunctive":"să năvodesc","present-second-person-singular-subjunctive":"să năvodești","present-singular-subjunctive-third-person":"să năvodească","first-person-plural-present-subjunctive":"să năvodim","plural-present-second-person-subjunctive":"să năvodiți","plural-present-subjunctive-third-person":"să năvodească","imperative-second-person-singular":"năvodește","imperative-plural-second-person":"năvodiți","imperative-negative-second-person-singular":"nu năvodi","imperative-negative-plural-second-person":"nu năvodiți"}},{"word":"năvodire","pos":"noun","definitions":["trawling"],"forms":{"plural":"năvodiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"năvodire","accusative-definite-nominative-singular":"năvodirea","accusative-indefinite-nominative-plural":"năvodiri","accusative-definite-nominative-plural":"năvodirile","dative-genitive-indefinite-singular":"năvodiri","dative-definite-genitive-singular":"năvodirii","dative-genitive-indefinite-plural":"năvodiri","dative-definite-genitive-plural":"năvodirilor","singular-vocative":"năvodire","plural-vocative":"năvodirilor"}},{"word":"navomodel","pos":"noun","definitions":["a model ship"],"forms":{"plural":"navomodele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"navomodel","accusative-definite-nominative-singular":"navomodelul","accusative-indefinite-nominative-plural":"navomodele","accusative-definite-nominative-plural":"navomodelele","dative-genitive-indefinite-singular":"navomodel","dative-definite-genitive-singular":"navomodelului","dative-genitive-indefinite-plural":"navomodele","dative-definite-genitive-plural":"navomodelelor","singular-vocative":"navomodelule","plural-vocative":"navomodelelor"}},{"word":"navomodelism","pos":"noun","definitions":["building ship models"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"navomodelism","accusative-definite-nominative":"navomodelismul","dative-genitive-indefinite":"navomodelism","dative-definite-genitive":"navomodelismului","vocative":"navomodelismule"}},{"word":"navomodelistă","pos":"noun","definitions":["female equivalent of navomodelist"],"forms":{"plural":"navomodeliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"navomodelistă","accusative-definite-nominative-singular":"navomodelista","accusative-indefinite-nominative-plural":"navomodeliste","accusative-definite-nominative-plural":"navomodelistele","dative-genitive-indefinite-singular":"navomodeliste","dative-definite-genitive-singular":"navomodelistei","dative-genitive-indefinite-plural":"navomodeliste","dative-definite-genitive-plural":"navomodelistelor","singular-vocative":"navomodelistă","plural-vocative":"navomodelistelor"}},{"word":"Navrescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Navrescu"}},{"word":"navtichie","pos":"noun","definitions":["nautics, navigation"],"forms":{"plural":"navtichii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"navtichie","accusative-definite-nominative-singular":"navtichia","accusative-indefinite-nominative-plural":"navtichii","accusative-definite-nominative-plural":"navtichiile","dative-genitive-indefinite-singular":"navtichii","dative-definite-genitive-singular":"navtichiei","dative-genitive-indefinite-plural":"navtichii","dative-definite-genitive-plural":"navtichiilor","singular-vocative":"navtichie","plural-vocative":"navtichiilor"}},{"word":"naz","pos":"noun","definitions":["singular of nazuri"],"forms":{"plural":"nazuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"naz","accusative-definite-nominative-singular":"nazul","accusative-indefinite-nominative-plural":"nazuri","accusative-definite-nominative-plural":"nazurile","dative-genitive-indefinite-singular":"naz","dative-definite-genitive-singular":"nazului","dative-genitive-indefinite-plural":"nazuri","dative-definite-genitive-plural":"nazurilor","singular-vocative":"nazule","plural-vocative":"nazurilor"}},{"word":"nazal","pos":"adj","definitions":["nasal"],"pronunciation":"/naˈzal/","forms":{"feminine-singular":"nazală","masculine-plural":"nazali","feminine-neuter-plural":"nazale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nazal","error-unrecognized-form-feminine-indefinite-singular":"nazală","error-unrecognized-form-indefinite-masculine-plural":"nazali","error-unrecognized-form-feminine-indefinite-neuter-plural":"nazale","definite-error-unrecognized-form-masculine-neuter-singular":"nazalul","definite-error-unrecognized-form-feminine-singular":"nazala","definite-error-unrecognized-form-masculine-plural":"nazalii","definite-error-unrecognized-form-feminine-neuter-plural":"nazalele"}},{"word":"nazală","pos":"noun","definitions":["nasal"],"forms":{"plural":"nazale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nazală","accusative-definite-nominative-singular":"nazala","accusative-indefinite-nominative-plural":"nazale","accusative-definite-nominative-plural":"nazalele","dative-genitive-indefinite-singular":"nazale","dative-definite-genitive-singular":"nazalei","dative-genitive-indefinite-plural":"nazale","dative-definite-genitive-plural":"nazalelor","singular-vocative":"nazală","plural-vocative":"nazalelor"}},{"word":"nazalitate","pos":"noun","definitions":["nasality"],"pronunciation":"/na.za.liˈta.te/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nazalitate","accusative-definite-nominative-singular":"nazalitatea","accusative-indefinite-nominative-plural":"nazalități","accusative-definite-nominative-plural":"nazalitățile","dative-genitive-indefinite-singular":"nazalități","dative-definite-genitive-singular":"nazalității","dative-genitive-indefinite-plural":"nazalități","dative-definite-genitive-plural":"nazalităților","singular-vocative":"nazalitate","plural-vocative":"nazalităților"}},{"word":"nazaliza","pos":"verb","definitions":["to nasalize"],"pronunciation":"/na.za.liˈza/","forms":{"canonical":"a nazaliza 1st conjugation","present-singular-third-person":"nazalizează","participle-past":"nazalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a nazaliza","gerund":"nazalizând","first-person-indicative-present-singular":"nazalizez","indicative-present-second-person-singular":"nazalizezi","indicative-present-singular-third-person":"nazalizează","first-person-indicative-plural-present":"nazalizăm","indicative-plural-present-second-person":"nazalizați","indicative-plural-present-third-person":"nazalizează","first-person-imperfect-indicative-singular":"nazalizam","imperfect-indicative-second-person-singular":"nazalizai","imperfect-indicative-singular-third-person":"nazaliza","first-person-imperfect-indicative-plural":"nazalizam","imperfect-indicative-plural-second-person":"nazalizați","imperfect-indicative-plural-third-person":"nazalizau","first-person-indicative-perfect-singular":"nazalizai","indicative-perfect-second-person-singular":"nazalizași","indicative-perfect-singular-third-person":"nazaliză","first-person-indicative-perfect-plural":"nazalizarăm","indicative-perfect-plural-second-person":"nazalizarăți","indicative-perfect-plural-third-person":"nazalizară","first-person-indicative-pluperfect-singular":"nazalizasem","indicative-pluperfect-second-person-singular":"nazalizaseși","indicative-pluperfect-singular-third-person":"nazalizase","first-person-indicative-pluperfect-plural":"nazalizaserăm","indicative-pluperfect-plural-second-person":"nazalizaserăți","indicative-pluperfect-plural-third-person":"nazalizaseră","first-person-present-singular-subjunctive":"să nazalizez","present-second-person-singular-subjunctive":"să nazalizezi","present-singular-subjunctive-third-person":"să nazalizeze","first-person-plural-present-subjunctive":"să nazalizăm","plural-present-second-person-subjunctive":"să nazalizați","plural-present-subjunctive-third-person":"să nazalizeze","imperative-second-person-singular":"nazalizează","imperative-plural-second-person":"nazalizați","imperative-negative-second-person-singular":"nu nazaliza","imperative-negative-plural-second-person":"nu nazalizați"}},{"word":"nazalizare","pos":"noun","definitions":["nasalization"],"forms":{"plural":"nazalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nazalizare","accusative-definite-nominative-singular":"nazalizarea","accusative-indefinite-nominative-plural":"nazalizări","accusative-definite-nominative-plural":"nazalizările","dative-genitive-indefinite-singular":"nazalizări","dative-definite-genitive-singular":"nazalizării","dative-genitive-indefinite-plural":"nazalizări","dative-definite-genitive-plural":"nazalizărilor","singular-vocative":"nazalizare","plural-vocative":"nazalizărilor"}},{"word":"nazalizat","pos":"adj","definitions":["nasalized"],"forms":{"feminine-singular":"nazalizată","masculine-plural":"nazalizați","feminine-neuter-plural":"nazalizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nazalizat","error-unrecognized-form-feminine-indefinite-singular":"nazalizată","error-unrecognized-form-indefinite-masculine-plural":"nazalizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nazalizate","definite-error-unrecognized-form-masculine-neuter-singular":"nazalizatul","definite-error-unrecognized-form-feminine-singular":"nazalizata","definite-error-unrecognized-form-masculine-plural":"nazalizații","definite-error-unrecognized-form-feminine-neuter-plural":"nazalizatele"}},{"word":"nazar","pos":"noun","definitions":["favor"],"forms":{"plural":"nazaruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nazar","accusative-definite-nominative-singular":"nazarul","accusative-indefinite-nominative-plural":"nazaruri","accusative-definite-nominative-plural":"nazarurile","dative-genitive-indefinite-singular":"nazar","dative-definite-genitive-singular":"nazarului","dative-genitive-indefinite-plural":"nazaruri","dative-definite-genitive-plural":"nazarurilor","singular-vocative":"nazarule","plural-vocative":"nazarurilor"}},{"word":"nazâr","pos":"noun","definitions":["minister, governor, administrator"],"forms":{"plural":"nazâri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nazâr","accusative-definite-nominative-singular":"nazârul","accusative-indefinite-nominative-plural":"nazâri","accusative-definite-nominative-plural":"nazârii","dative-genitive-indefinite-singular":"nazâr","dative-definite-genitive-singular":"nazârului","dative-genitive-indefinite-plural":"nazâri","dative-definite-genitive-plural":"nazârilor","singular-vocative":"nazârule","plural-vocative":"nazârilor"}},{"word":"Nazarcea","pos":"name","definitions":["a village in Constanța County, Dobruja, in eastern Romania"],"gender":"m"},{"word":"năzăreală","pos":"noun","definitions":["hallucination"],"forms":{"plural":"năzăreli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"năzăreală","accusative-definite-nominative-singular":"năzăreala","accusative-indefinite-nominative-plural":"năzărele","accusative-definite-nominative-plural":"năzărelele","dative-genitive-indefinite-singular":"năzărele","dative-definite-genitive-singular":"năzărelei","dative-genitive-indefinite-plural":"năzărele","dative-definite-genitive-plural":"năzărelelor","singular-vocative":"năzăreală","plural-vocative":"năzărelelor"}},{"word":"nazareanin","pos":"adj","definitions":["Nazarene"],"forms":{"feminine-singular":"nazareanină","masculine-plural":"nazareanini","feminine-neuter-plural":"nazareanine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nazareanin","error-unrecognized-form-feminine-indefinite-singular":"nazareanină","error-unrecognized-form-indefinite-masculine-plural":"nazareanini","error-unrecognized-form-feminine-indefinite-neuter-plural":"nazareanine","definite-error-unrecognized-form-masculine-neuter-singular":"nazareaninul","definite-error-unrecognized-form-feminine-singular":"nazareanina","definite-error-unrecognized-form-masculine-plural":"nazareaninii","definite-error-unrecognized-form-feminine-neuter-plural":"nazareaninele"}},{"word":"nazareean","pos":"noun","definitions":["Nazarene"],"forms":{"plural":"nazareeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nazareean","accusative-definite-nominative-singular":"nazareeanul","accusative-indefinite-nominative-plural":"nazareeni","accusative-definite-nominative-plural":"nazareenii","dative-genitive-indefinite-singular":"nazareean","dative-definite-genitive-singular":"nazareeanului","dative-genitive-indefinite-plural":"nazareeni","dative-definite-genitive-plural":"nazareenilor","singular-vocative":"nazareeanule","plural-vocative":"nazareenilor"}},{"word":"nazareeană","pos":"noun","definitions":["female equivalent of nazareean"],"forms":{"plural":"nazareeane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nazareeană","accusative-definite-nominative-singular":"nazareeana","accusative-indefinite-nominative-plural":"nazareene","accusative-definite-nominative-plural":"nazareenele","dative-genitive-indefinite-singular":"nazareene","dative-definite-genitive-singular":"nazareenei","dative-genitive-indefinite-plural":"nazareene","dative-definite-genitive-plural":"nazareenelor","singular-vocative":"nazareeană","plural-vocative":"nazareenelor"}},{"word":"năzări","pos":"verb","definitions":["to hallucinate, to see things"],"forms":{"canonical":"a năzări 4th conjugation","present-singular-third-person":"năzărește","participle-past":"năzărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a năzări","gerund":"năzărind","first-person-indicative-present-singular":"năzăresc","indicative-present-second-person-singular":"năzărești","indicative-present-singular-third-person":"năzărește","first-person-indicative-plural-present":"năzărim","indicative-plural-present-second-person":"năzăriți","indicative-plural-present-third-person":"năzăresc","first-person-imperfect-indicative-singular":"năzăream","imperfect-indicative-second-person-singular":"năzăreai","imperfect-indicative-singular-third-person":"năzărea","first-person-imperfect-indicative-plural":"năzăream","imperfect-indicative-plural-second-person":"năzăreați","imperfect-indicative-plural-third-person":"năzăreau","first-person-indicative-perfect-singular":"năzării","indicative-perfect-second-person-singular":"năzăriși","indicative-perfect-singular-third-person":"năzări","first-person-indicative-perfect-plural":"năzărirăm","indicative-perfect-plural-second-person":"năzărirăți","indicative-perfect-plural-third-person":"năzăriră","first-person-indicative-pluperfect-singular":"năzărisem","indicative-pluperfect-second-person-singular":"năzăriseși","indicative-pluperfect-singular-third-person":"năzărise","first-person-indicative-pluperfect-plural":"năzăriserăm","indicative-pluperfect-plural-second-person":"năzăriserăți","indicative-pluperfect-plural-third-person":"năzăriseră","first-person-present-singular-subjunctive":"să năzăresc","present-second-person-singular-subjunctive":"să năzărești","present-singular-subjunctive-third-person":"să năzărească","first-person-plural-present-subjunctive":"să năzărim","plural-present-second-person-subjunctive":"să năzăriți","plural-present-subjunctive-third-person":"să năzărească","imperative-second-person-singular":"năzărește","imperative-plural-second-person":"năzăriți","imperative-negative-second-person-singular":"nu năzări","imperative-negative-plural-second-person":"nu năzăriți"}},{"word":"nazarinean","pos":"adj","definitions":["Nazarene"],"forms":{"feminine-singular":"nazarineană","masculine-plural":"nazarineni","feminine-neuter-plural":"nazarinene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nazarinean","error-unrecognized-form-feminine-indefinite-singular":"nazarineană","error-unrecognized-form-indefinite-masculine-plural":"nazarineni","error-unrecognized-form-feminine-indefinite-neuter-plural":"nazarinene","definite-error-unrecognized-form-masculine-neuter-singular":"nazarineanul","definite-error-unrecognized-form-feminine-singular":"nazarineana","definite-error-unrecognized-form-masculine-plural":"nazarinenii","definite-error-unrecognized-form-feminine-neuter-plural":"nazarinenele"}},{"word":"nazarinean","pos":"noun","definitions":["Nazarene"],"forms":{"plural":"nazarineni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nazarinean","accusative-definite-nominative-singular":"nazarineanul","accusative-indefinite-nominative-plural":"nazarineni","accusative-definite-nominative-plural":"nazarinenii","dative-genitive-indefinite-singular":"nazarinean","dative-definite-genitive-singular":"nazarineanului","dative-genitive-indefinite-plural":"nazarineni","dative-definite-genitive-plural":"nazarinenilor","singular-vocative":"nazarineanule","plural-vocative":"nazarinenilor"}},{"word":"nazarineană","pos":"noun","definitions":["female equivalent of nazarinean"],"forms":{"plural":"nazarineane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nazarineană","accusative-definite-nominative-singular":"nazarineana","accusative-indefinite-nominative-plural":"nazarineane","accusative-definite-nominative-plural":"nazarineanele","dative-genitive-indefinite-singular":"nazarineane","dative-definite-genitive-singular":"nazarineanei","dative-genitive-indefinite-plural":"nazarineane","dative-definite-genitive-plural":"nazarineanelor","singular-vocative":"nazarineană","plural-vocative":"nazarineanelor"}},{"word":"Năzărioaia","pos":"name","definitions":["a village in Vultureni, Bacău County, Romania"],"gender":"f"},{"word":"năzărire","pos":"noun","definitions":["hallucination"],"forms":{"plural":"năzăriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"năzărire","accusative-definite-nominative-singular":"năzărirea","accusative-indefinite-nominative-plural":"năzăriri","accusative-definite-nominative-plural":"năzăririle","dative-genitive-indefinite-singular":"năzăriri","dative-definite-genitive-singular":"năzăririi","dative-genitive-indefinite-plural":"năzăriri","dative-definite-genitive-plural":"năzăririlor","singular-vocative":"năzărire","plural-vocative":"năzăririlor"}},{"word":"năzăritură","pos":"noun","definitions":["hallucination"],"forms":{"plural":"năzărituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"năzăritură","accusative-definite-nominative-singular":"năzăritura","accusative-indefinite-nominative-plural":"năzărituri","accusative-definite-nominative-plural":"năzăriturile","dative-genitive-indefinite-singular":"năzărituri","dative-definite-genitive-singular":"năzăriturii","dative-genitive-indefinite-plural":"năzărituri","dative-definite-genitive-plural":"năzăriturilor","singular-vocative":"năzăritură","plural-vocative":"năzăriturilor"}},{"word":"nazarlâc","pos":"noun","definitions":["care"],"forms":{"plural":"nazarlâcuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nazarlâc","accusative-definite-nominative-singular":"nazarlâcul","accusative-indefinite-nominative-plural":"nazarlâcuri","accusative-definite-nominative-plural":"nazarlâcurile","dative-genitive-indefinite-singular":"nazarlâc","dative-definite-genitive-singular":"nazarlâcului","dative-genitive-indefinite-plural":"nazarlâcuri","dative-definite-genitive-plural":"nazarlâcurilor","singular-vocative":"nazarlâcule","plural-vocative":"nazarlâcurilor"}},{"word":"năzbâtie","pos":"noun","definitions":["farce, jest, mischief, prank, prankishness"],"pronunciation":"/nəzˈbɨ.ti.e/","forms":{"plural":"năzbâtii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"năzbâtie","accusative-definite-nominative-singular":"năzbâtia","accusative-indefinite-nominative-plural":"năzbâtii","accusative-definite-nominative-plural":"năzbâtiile","dative-genitive-indefinite-singular":"năzbâtii","dative-definite-genitive-singular":"năzbâtiei","dative-genitive-indefinite-plural":"năzbâtii","dative-definite-genitive-plural":"năzbâtiilor","singular-vocative":"năzbâtie","plural-vocative":"năzbâtiilor","alternative":"năzbutie"}},{"word":"năzbâtii","pos":"noun","definitions":["plural of năzbâtie"]},{"word":"năzbutie","pos":"noun","definitions":["alternative form of năzbâtie"],"pronunciation":"/nəzˈbu.ti.e/","forms":{"plural":"năzbutii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"năzbutie","accusative-definite-nominative-singular":"năzbutia","accusative-indefinite-nominative-plural":"năzbutii","accusative-definite-nominative-plural":"năzbutiile","dative-genitive-indefinite-singular":"năzbutii","dative-definite-genitive-singular":"năzbutiei","dative-genitive-indefinite-plural":"năzbutii","dative-definite-genitive-plural":"năzbutiilor","singular-vocative":"năzbutie","plural-vocative":"năzbutiilor"}},{"word":"năzdravan","pos":"adj","definitions":["alternative form of năzdrăvan"],"forms":{"feminine-singular":"năzdravană","masculine-plural":"năzdravani","feminine-neuter-plural":"năzdravane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"năzdravan","error-unrecognized-form-feminine-indefinite-singular":"năzdravană","error-unrecognized-form-indefinite-masculine-plural":"năzdravani","error-unrecognized-form-feminine-indefinite-neuter-plural":"năzdravane","definite-error-unrecognized-form-masculine-neuter-singular":"năzdravanul","definite-error-unrecognized-form-feminine-singular":"năzdravana","definite-error-unrecognized-form-masculine-plural":"năzdravanii","definite-error-unrecognized-form-feminine-neuter-plural":"năzdravanele"}},{"word":"năzdravăn","pos":"adj","definitions":["alternative form of năzdrăvan"],"forms":{"feminine-singular":"năzdravănă","masculine-plural":"năzdravăni","feminine-neuter-plural":"năzdravăne","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"năzdravăn","error-unrecognized-form-feminine-indefinite-singular":"năzdravănă","error-unrecognized-form-indefinite-masculine-plural":"năzdravăni","error-unrecognized-form-feminine-indefinite-neuter-plural":"năzdravăne","definite-error-unrecognized-form-masculine-neuter-singular":"năzdravănul","definite-error-unrecognized-form-feminine-singular":"năzdravăna","definite-error-unrecognized-form-masculine-plural":"năzdravănii","definite-error-unrecognized-form-feminine-neuter-plural":"năzdravănele"}},{"word":"Năzdrăvan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Năzdrăvan"}},{"word":"năzdrăvan","pos":"adj","definitions":["supernatural"],"pronunciation":"/nəz.drəˈvan/","forms":{"feminine-singular":"năzdrăvană","masculine-plural":"năzdrăvani","feminine-neuter-plural":"năzdrăvane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"năzdrăvan","error-unrecognized-form-feminine-indefinite-singular":"năzdrăvană","error-unrecognized-form-indefinite-masculine-plural":"năzdrăvani","error-unrecognized-form-feminine-indefinite-neuter-plural":"năzdrăvane","definite-error-unrecognized-form-masculine-neuter-singular":"năzdrăvanul","definite-error-unrecognized-form-feminine-singular":"năzdrăvana","definite-error-unrecognized-form-masculine-plural":"năzdrăvanii","definite-error-unrecognized-form-feminine-neuter-plural":"năzdrăvanele"}},{"word":"năzdrăvănie","pos":"noun","definitions":["mischievous act","magic act"],"forms":{"plural":"năzdrăvănii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"năzdrăvănie","accusative-definite-nominative-singular":"năzdrăvănia","accusative-indefinite-nominative-plural":"năzdrăvănii","accusative-definite-nominative-plural":"năzdrăvăniile","dative-genitive-indefinite-singular":"năzdrăvănii","dative-definite-genitive-singular":"năzdrăvăniei","dative-genitive-indefinite-plural":"năzdrăvănii","dative-definite-genitive-plural":"năzdrăvăniilor","singular-vocative":"năzdrăvănie","plural-vocative":"năzdrăvăniilor"}},{"word":"Năzdrăvanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Năzdrăvanu"}},{"word":"năzgodie","pos":"noun","definitions":["oddity"],"forms":{"plural":"năzgodii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"năzgodie","accusative-definite-nominative-singular":"năzgodia","accusative-indefinite-nominative-plural":"năzgodii","accusative-definite-nominative-plural":"năzgodiile","dative-genitive-indefinite-singular":"năzgodii","dative-definite-genitive-singular":"năzgodiei","dative-genitive-indefinite-plural":"năzgodii","dative-definite-genitive-plural":"năzgodiilor","singular-vocative":"năzgodie","plural-vocative":"năzgodiilor"}},{"word":"nazificare","pos":"noun","definitions":["Nazification"],"forms":{"plural":"nazificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nazificare","accusative-definite-nominative-singular":"nazificarea","accusative-indefinite-nominative-plural":"nazificări","accusative-definite-nominative-plural":"nazificările","dative-genitive-indefinite-singular":"nazificări","dative-definite-genitive-singular":"nazificării","dative-genitive-indefinite-plural":"nazificări","dative-definite-genitive-plural":"nazificărilor","singular-vocative":"nazificare","plural-vocative":"nazificărilor"}},{"word":"nazir","pos":"noun","definitions":["alternative form of nazâr"],"forms":{"plural":"naziri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nazir","accusative-definite-nominative-singular":"nazirul","accusative-indefinite-nominative-plural":"naziri","accusative-definite-nominative-plural":"nazirii","dative-genitive-indefinite-singular":"nazir","dative-definite-genitive-singular":"nazirului","dative-genitive-indefinite-plural":"naziri","dative-definite-genitive-plural":"nazirilor","singular-vocative":"nazirule","plural-vocative":"nazirilor"}},{"word":"nazirie","pos":"noun","definitions":["surveillance, guard"],"forms":{"plural":"nazirii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nazirie","accusative-definite-nominative-singular":"naziria","accusative-indefinite-nominative-plural":"nazirii","accusative-definite-nominative-plural":"naziriile","dative-genitive-indefinite-singular":"nazirii","dative-definite-genitive-singular":"naziriei","dative-genitive-indefinite-plural":"nazirii","dative-definite-genitive-plural":"naziriilor","singular-vocative":"nazirie","plural-vocative":"naziriilor"}},{"word":"nazism","pos":"noun","definitions":["Nazism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nazism","accusative-definite-nominative-singular":"nazismul","accusative-indefinite-nominative-plural":"nazisme","accusative-definite-nominative-plural":"nazismele","dative-genitive-indefinite-singular":"nazism","dative-definite-genitive-singular":"nazismului","dative-genitive-indefinite-plural":"nazisme","dative-definite-genitive-plural":"nazismelor","singular-vocative":"nazismule","plural-vocative":"nazismelor"}},{"word":"nazist","pos":"noun","definitions":["Nazi"],"forms":{"plural":"naziști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nazist","accusative-definite-nominative-singular":"nazistul","accusative-indefinite-nominative-plural":"naziști","accusative-definite-nominative-plural":"naziștii","dative-genitive-indefinite-singular":"nazist","dative-definite-genitive-singular":"nazistului","dative-genitive-indefinite-plural":"naziști","dative-definite-genitive-plural":"naziștilor","singular-vocative":"nazistule","plural-vocative":"naziștilor"}},{"word":"nazistă","pos":"noun","definitions":["female equivalent of nazist"],"forms":{"plural":"naziste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nazistă","accusative-definite-nominative-singular":"nazista","accusative-indefinite-nominative-plural":"naziste","accusative-definite-nominative-plural":"nazistele","dative-genitive-indefinite-singular":"naziste","dative-definite-genitive-singular":"nazistei","dative-genitive-indefinite-plural":"naziste","dative-definite-genitive-plural":"nazistelor","singular-vocative":"nazistă","plural-vocative":"nazistelor"}},{"word":"Nazna","pos":"name","definitions":["a village in Sâncraiu de Mureș, Mureș County, Romania"],"gender":"f"},{"word":"nazofaringian","pos":"adj","definitions":["nasopharyngeal"],"forms":{"feminine-singular":"nazofaringiană","masculine-plural":"nazofaringieni","feminine-neuter-plural":"nazofaringiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nazofaringian","error-unrecognized-form-feminine-indefinite-singular":"nazofaringiană","error-unrecognized-form-indefinite-masculine-plural":"nazofaringieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"nazofaringiene","definite-error-unrecognized-form-masculine-neuter-singular":"nazofaringianul","definite-error-unrecognized-form-feminine-singular":"nazofaringiana","definite-error-unrecognized-form-masculine-plural":"nazofaringienii","definite-error-unrecognized-form-feminine-neuter-plural":"nazofaringienele"}},{"word":"năzui","pos":"verb","definitions":["to strive"],"forms":{"canonical":"a năzui 4th conjugation","present-singular-third-person":"năzuiește","participle-past":"năzuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a năzui","gerund":"năzuind","first-person-indicative-present-singular":"năzuiesc","indicative-present-second-person-singular":"năzuiești","indicative-present-singular-third-person":"năzuiește","first-person-indicative-plural-present":"năzuim","indicative-plural-present-second-person":"năzuiți","indicative-plural-present-third-person":"năzuiesc","first-person-imperfect-indicative-singular":"năzuiam","imperfect-indicative-second-person-singular":"năzuiai","imperfect-indicative-singular-third-person":"năzuia","first-person-imperfect-indicative-plural":"năzuiam","imperfect-indicative-plural-second-person":"năzuiați","imperfect-indicative-plural-third-person":"năzuiau","first-person-indicative-perfect-singular":"năzuii","indicative-perfect-second-person-singular":"năzuiși","indicative-perfect-singular-third-person":"năzui","first-person-indicative-perfect-plural":"năzuirăm","indicative-perfect-plural-second-person":"năzuirăți","indicative-perfect-plural-third-person":"năzuiră","first-person-indicative-pluperfect-singular":"năzuisem","indicative-pluperfect-second-person-singular":"năzuiseși","indicative-pluperfect-singular-third-person":"năzuise","first-person-indicative-pluperfect-plural":"năzuiserăm","indicative-pluperfect-plural-second-person":"năzuiserăți","indicative-pluperfect-plural-third-person":"năzuiseră","first-person-present-singular-subjunctive":"să năzuiesc","present-second-person-singular-subjunctive":"să năzuiești","present-singular-subjunctive-third-person":"să năzuiască","first-person-plural-present-subjunctive":"să năzuim","plural-present-second-person-subjunctive":"să năzuiți","plural-present-subjunctive-third-person":"să năzuiască","imperative-second-person-singular":"năzuiește","imperative-plural-second-person":"năzuiți","imperative-negative-second-person-singular":"nu năzui","imperative-negative-plural-second-person":"nu năzuiți"}},{"word":"năzuială","pos":"noun","definitions":["shelter"],"forms":{"plural":"năzuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"năzuială","accusative-definite-nominative-singular":"năzuiala","accusative-indefinite-nominative-plural":"năzuiele","accusative-definite-nominative-plural":"năzuielele","dative-genitive-indefinite-singular":"năzuiele","dative-definite-genitive-singular":"năzuielei","dative-genitive-indefinite-plural":"năzuiele","dative-definite-genitive-plural":"năzuielelor","singular-vocative":"năzuială","plural-vocative":"năzuielelor"}},{"word":"năzuință","pos":"noun","definitions":["yearning"],"forms":{"plural":"năzuințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"năzuință","accusative-definite-nominative-singular":"năzuința","accusative-indefinite-nominative-plural":"năzuințe","accusative-definite-nominative-plural":"năzuințele","dative-genitive-indefinite-singular":"năzuințe","dative-definite-genitive-singular":"năzuinței","dative-genitive-indefinite-plural":"năzuințe","dative-definite-genitive-plural":"năzuințelor","singular-vocative":"năzuință","plural-vocative":"năzuințelor"}},{"word":"năzuire","pos":"noun","definitions":["longing"],"forms":{"plural":"năzuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"năzuire","accusative-definite-nominative-singular":"năzuirea","accusative-indefinite-nominative-plural":"năzuiri","accusative-definite-nominative-plural":"năzuirile","dative-genitive-indefinite-singular":"năzuiri","dative-definite-genitive-singular":"năzuirii","dative-genitive-indefinite-plural":"năzuiri","dative-definite-genitive-plural":"năzuirilor","singular-vocative":"năzuire","plural-vocative":"năzuirilor"}},{"word":"nazuri","pos":"noun","definitions":["whims"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nazuri","accusative-definite-nominative":"nazurile","dative-genitive-indefinite":"nazuri","dative-definite-genitive":"nazurilor","vocative":"nazurilor"}},{"word":"năzuros","pos":"adj","definitions":["picky"],"forms":{"feminine-singular":"năzuroasă","masculine-plural":"năzuroși","feminine-neuter-plural":"năzuroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"năzuros","error-unrecognized-form-feminine-indefinite-singular":"năzuroasă","error-unrecognized-form-indefinite-masculine-plural":"năzuroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"năzuroase","definite-error-unrecognized-form-masculine-neuter-singular":"năzurosul","definite-error-unrecognized-form-feminine-singular":"năzuroasa","definite-error-unrecognized-form-masculine-plural":"năzuroșii","definite-error-unrecognized-form-feminine-neuter-plural":"năzuroasele"}},{"word":"ne","pos":"pron","definitions":["us"],"pronunciation":"/ne/","examples":[{"ro":"El ne urmează.","en":"He's following us."}],"forms":{"alternative":"нє"}},{"word":"ne","pos":"pron","definitions":["(to) us"],"pronunciation":"/ne/","examples":[{"ro":"Ele ne dau cadouri.","en":"They give us presents."}],"forms":{"alternative":"нє"}},{"word":"ne-","pos":"prefix","definitions":["un-; de- (attached to past participles, gerundives and some adjectives to negate them)"],"pronunciation":"/ne/","examples":[{"ro":"ne- + cunoscut (“known”) → necunoscut (“unknown”)","en":null},{"ro":"ne- + înțeles (“understood”) → neînțeles (“misunderstood”)","en":null},{"ro":"ne- + prietenos (“friendly”) → neprietenos (“unfriendly”)","en":null}]},{"word":"ne-a","pos":"contraction","definitions":["contraction of ne + a"],"pronunciation":"/ne̯a/"},{"word":"ne-ai","pos":"contraction","definitions":["contraction of ne + ai"],"pronunciation":"/ne̯aj/"},{"word":"ne-am","pos":"contraction","definitions":["contraction of ne + am"],"pronunciation":"/ne̯am/"},{"word":"ne-ar","pos":"contraction","definitions":["contraction of ne + ar"],"pronunciation":"/ne̯ar/"},{"word":"ne-aș","pos":"contraction","definitions":["contraction of ne + aș"],"pronunciation":"/ne̯aʃ/"},{"word":"ne-ați","pos":"contraction","definitions":["contraction of ne + ați"],"pronunciation":"/ne̯at͡sʲ/"},{"word":"ne-au","pos":"contraction","definitions":["contraction of ne + au"],"pronunciation":"/ne̯aw/"},{"word":"ne-o","pos":"contraction","definitions":["contraction of ne + o"],"pronunciation":"/ne̯o/"},{"word":"ne-or","pos":"contraction","definitions":["contraction of ne + or"],"pronunciation":"/ne̯or/"},{"word":"nea","pos":"noun","definitions":["snow"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-manual","accusative-indefinite-nominative":"nea","accusative-definite-nominative":"neaua","dative-genitive-indefinite":"nei","dative-definite-genitive":"neii","vocative":"-","alternative":"neauă"}},{"word":"nea Nicu","pos":"name","definitions":["Nickname for Nicolae Ceaușescu (1918–1989), dictator of Romania from 1965 to 1989"],"gender":"m","examples":[{"ro":"Transmisia s-a întrerupt pentru că urma relatarea unei vizite a lu’ nea Nicu.","en":"The broadcast ended because a recounting of a visit of Nicolae Ceaușescu was coming up."}]},{"word":"neabătut","pos":"adj","definitions":["unflinching"],"forms":{"feminine-singular":"neabătută","masculine-plural":"neabătuți","feminine-neuter-plural":"neabătute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neabătut","error-unrecognized-form-feminine-indefinite-singular":"neabătută","error-unrecognized-form-indefinite-masculine-plural":"neabătuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neabătute","definite-error-unrecognized-form-masculine-neuter-singular":"neabătutul","definite-error-unrecognized-form-feminine-singular":"neabătuta","definite-error-unrecognized-form-masculine-plural":"neabătuții","definite-error-unrecognized-form-feminine-neuter-plural":"neabătutele"}},{"word":"neabil","pos":"adj","definitions":["clumsy"],"forms":{"feminine-singular":"neabilă","masculine-plural":"neabili","feminine-neuter-plural":"neabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neabil","error-unrecognized-form-feminine-indefinite-singular":"neabilă","error-unrecognized-form-indefinite-masculine-plural":"neabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neabile","definite-error-unrecognized-form-masculine-neuter-singular":"neabilul","definite-error-unrecognized-form-feminine-singular":"neabila","definite-error-unrecognized-form-masculine-plural":"neabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neabilele"}},{"word":"neabonat","pos":"adj","definitions":["not subscribed"],"forms":{"feminine-singular":"neabonată","masculine-plural":"neabonați","feminine-neuter-plural":"neabonate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neabonat","error-unrecognized-form-feminine-indefinite-singular":"neabonată","error-unrecognized-form-indefinite-masculine-plural":"neabonați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neabonate","definite-error-unrecognized-form-masculine-neuter-singular":"neabonatul","definite-error-unrecognized-form-feminine-singular":"neabonata","definite-error-unrecognized-form-masculine-plural":"neabonații","definite-error-unrecognized-form-feminine-neuter-plural":"neabonatele"}},{"word":"neabordabil","pos":"adj","definitions":["unapproachable"],"forms":{"feminine-singular":"neabordabilă","masculine-plural":"neabordabili","feminine-neuter-plural":"neabordabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neabordabil","error-unrecognized-form-feminine-indefinite-singular":"neabordabilă","error-unrecognized-form-indefinite-masculine-plural":"neabordabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neabordabile","definite-error-unrecognized-form-masculine-neuter-singular":"neabordabilul","definite-error-unrecognized-form-feminine-singular":"neabordabila","definite-error-unrecognized-form-masculine-plural":"neabordabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neabordabilele"}},{"word":"neacademic","pos":"adj","definitions":["unacademic"],"forms":{"feminine-singular":"neacademică","masculine-plural":"neacademici","feminine-neuter-plural":"neacademice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neacademic","error-unrecognized-form-feminine-indefinite-singular":"neacademică","error-unrecognized-form-indefinite-masculine-plural":"neacademici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neacademice","definite-error-unrecognized-form-masculine-neuter-singular":"neacademicul","definite-error-unrecognized-form-feminine-singular":"neacademica","definite-error-unrecognized-form-masculine-plural":"neacademicii","definite-error-unrecognized-form-feminine-neuter-plural":"neacademicele"}},{"word":"neaccentuat","pos":"adj","definitions":["unstressed"],"forms":{"feminine-singular":"neaccentuată","masculine-plural":"neaccentuați","feminine-neuter-plural":"neaccentuate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neaccentuat","error-unrecognized-form-feminine-indefinite-singular":"neaccentuată","error-unrecognized-form-indefinite-masculine-plural":"neaccentuați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neaccentuate","definite-error-unrecognized-form-masculine-neuter-singular":"neaccentuatul","definite-error-unrecognized-form-feminine-singular":"neaccentuata","definite-error-unrecognized-form-masculine-plural":"neaccentuații","definite-error-unrecognized-form-feminine-neuter-plural":"neaccentuatele"}},{"word":"neacceptabil","pos":"adj","definitions":["nonacceptable"],"forms":{"feminine-singular":"neacceptabilă","masculine-plural":"neacceptabili","feminine-neuter-plural":"neacceptabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neacceptabil","error-unrecognized-form-feminine-indefinite-singular":"neacceptabilă","error-unrecognized-form-indefinite-masculine-plural":"neacceptabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neacceptabile","definite-error-unrecognized-form-masculine-neuter-singular":"neacceptabilul","definite-error-unrecognized-form-feminine-singular":"neacceptabila","definite-error-unrecognized-form-masculine-plural":"neacceptabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neacceptabilele"}},{"word":"neacceptare","pos":"noun","definitions":["objection"],"forms":{"plural":"neacceptări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neacceptare","accusative-definite-nominative-singular":"neacceptarea","accusative-indefinite-nominative-plural":"neacceptari","accusative-definite-nominative-plural":"neacceptarile","dative-genitive-indefinite-singular":"neacceptari","dative-definite-genitive-singular":"neacceptarii","dative-genitive-indefinite-plural":"neacceptari","dative-definite-genitive-plural":"neacceptarilor","singular-vocative":"neacceptare","plural-vocative":"neacceptarilor"}},{"word":"neaccidentat","pos":"adj","definitions":["drivable (about a road)"],"forms":{"feminine-singular":"neaccidentată","masculine-plural":"neaccidentați","feminine-neuter-plural":"neaccidentate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neaccidentat","error-unrecognized-form-feminine-indefinite-singular":"neaccidentată","error-unrecognized-form-indefinite-masculine-plural":"neaccidentați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neaccidentate","definite-error-unrecognized-form-masculine-neuter-singular":"neaccidentatul","definite-error-unrecognized-form-feminine-singular":"neaccidentata","definite-error-unrecognized-form-masculine-plural":"neaccidentații","definite-error-unrecognized-form-feminine-neuter-plural":"neaccidentatele"}},{"word":"neacoperit","pos":"adj","definitions":["uncovered"],"forms":{"feminine-singular":"neacoperită","masculine-plural":"neacoperiți","feminine-neuter-plural":"neacoperite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neacoperit","error-unrecognized-form-feminine-indefinite-singular":"neacoperită","error-unrecognized-form-indefinite-masculine-plural":"neacoperiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neacoperite","definite-error-unrecognized-form-masculine-neuter-singular":"neacoperitul","definite-error-unrecognized-form-feminine-singular":"neacoperita","definite-error-unrecognized-form-masculine-plural":"neacoperiții","definite-error-unrecognized-form-feminine-neuter-plural":"neacoperitele"}},{"word":"neacordat","pos":"adj","definitions":["not granted"],"forms":{"feminine-singular":"neacordată","masculine-plural":"neacordați","feminine-neuter-plural":"neacordate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neacordat","error-unrecognized-form-feminine-indefinite-singular":"neacordată","error-unrecognized-form-indefinite-masculine-plural":"neacordați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neacordate","definite-error-unrecognized-form-masculine-neuter-singular":"neacordatul","definite-error-unrecognized-form-feminine-singular":"neacordata","definite-error-unrecognized-form-masculine-plural":"neacordații","definite-error-unrecognized-form-feminine-neuter-plural":"neacordatele"}},{"word":"Neacșoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Neacșoiu"}},{"word":"neacțiune","pos":"noun","definitions":["inaction, lack of action"],"forms":{"plural":"neacțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neacțiune","accusative-definite-nominative":"neacțiunea","dative-genitive-indefinite":"neacțiuni","dative-definite-genitive":"neacțiunii","vocative":"neacțiune"}},{"word":"neactual","pos":"adj","definitions":["unupdated"],"forms":{"feminine-singular":"neactuală","masculine-plural":"neactuali","feminine-neuter-plural":"neactuale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neactual","error-unrecognized-form-feminine-indefinite-singular":"neactuală","error-unrecognized-form-indefinite-masculine-plural":"neactuali","error-unrecognized-form-feminine-indefinite-neuter-plural":"neactuale","definite-error-unrecognized-form-masculine-neuter-singular":"neactualul","definite-error-unrecognized-form-feminine-singular":"neactuala","definite-error-unrecognized-form-masculine-plural":"neactualii","definite-error-unrecognized-form-feminine-neuter-plural":"neactualele"}},{"word":"neadaptare","pos":"noun","definitions":["maladjustment"],"forms":{"plural":"neadaptări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neadaptare","accusative-definite-nominative-singular":"neadaptarea","accusative-indefinite-nominative-plural":"neadaptari","accusative-definite-nominative-plural":"neadaptarile","dative-genitive-indefinite-singular":"neadaptari","dative-definite-genitive-singular":"neadaptarii","dative-genitive-indefinite-plural":"neadaptari","dative-definite-genitive-plural":"neadaptarilor","singular-vocative":"neadaptare","plural-vocative":"neadaptarilor"}},{"word":"neadaptat","pos":"adj","definitions":["unadapted"],"pronunciation":"/ˌne.a.dapˈtat/","forms":{"feminine-singular":"neadaptată","masculine-plural":"neadaptați","feminine-neuter-plural":"neadaptate","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"neadaptat","error-unrecognized-form-feminine-indefinite-singular":"neadaptată","error-unrecognized-form-indefinite-masculine-plural":"neadaptați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neadaptate","definite-error-unrecognized-form-masculine-neuter-singular":"neadaptatul","definite-error-unrecognized-form-feminine-singular":"neadaptata","definite-error-unrecognized-form-masculine-plural":"neadaptații","definite-error-unrecognized-form-feminine-neuter-plural":"neadaptatele"}},{"word":"neadecvat","pos":"adj","definitions":["inadequate"],"pronunciation":"/ˌne.a.dekˈvat/","forms":{"feminine-singular":"neadecvată","masculine-plural":"neadecvați","feminine-neuter-plural":"neadecvate","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"neadecvat","error-unrecognized-form-feminine-indefinite-singular":"neadecvată","error-unrecognized-form-indefinite-masculine-plural":"neadecvați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neadecvate","definite-error-unrecognized-form-masculine-neuter-singular":"neadecvatul","definite-error-unrecognized-form-feminine-singular":"neadecvata","definite-error-unrecognized-form-masculine-plural":"neadecvații","definite-error-unrecognized-form-feminine-neuter-plural":"neadecvatele"}},{"word":"neaderent","pos":"adj","definitions":["nonadherent"],"forms":{"feminine-singular":"neaderentă","masculine-plural":"neaderenți","feminine-neuter-plural":"neaderente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neaderent","error-unrecognized-form-feminine-indefinite-singular":"neaderentă","error-unrecognized-form-indefinite-masculine-plural":"neaderenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neaderente","definite-error-unrecognized-form-masculine-neuter-singular":"neaderentul","definite-error-unrecognized-form-feminine-singular":"neaderenta","definite-error-unrecognized-form-masculine-plural":"neaderenții","definite-error-unrecognized-form-feminine-neuter-plural":"neaderentele"}},{"word":"neaderență","pos":"noun","definitions":["nonadherence"],"forms":{"plural":"neaderențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neaderență","accusative-definite-nominative-singular":"neaderența","accusative-indefinite-nominative-plural":"neaderențe","accusative-definite-nominative-plural":"neaderențele","dative-genitive-indefinite-singular":"neaderențe","dative-definite-genitive-singular":"neaderenței","dative-genitive-indefinite-plural":"neaderențe","dative-definite-genitive-plural":"neaderențelor","singular-vocative":"neaderență","plural-vocative":"neaderențelor"}},{"word":"neadevăr","pos":"noun","definitions":["untruth, falsehood","lie"],"forms":{"plural":"neadevăruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"neadevăr","accusative-definite-nominative-singular":"neadevărul","accusative-indefinite-nominative-plural":"neadevăruri","accusative-definite-nominative-plural":"neadevărurile","dative-genitive-indefinite-singular":"neadevăr","dative-definite-genitive-singular":"neadevărului","dative-genitive-indefinite-plural":"neadevăruri","dative-definite-genitive-plural":"neadevărurilor","singular-vocative":"neadevărule","plural-vocative":"neadevărurilor"}},{"word":"neadevărat","pos":"adj","definitions":["untrue"],"forms":{"feminine-singular":"neadevărată","masculine-plural":"neadevărați","feminine-neuter-plural":"neadevărate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neadevărat","error-unrecognized-form-feminine-indefinite-singular":"neadevărată","error-unrecognized-form-indefinite-masculine-plural":"neadevărați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neadevărate","definite-error-unrecognized-form-masculine-neuter-singular":"neadevăratul","definite-error-unrecognized-form-feminine-singular":"neadevărata","definite-error-unrecognized-form-masculine-plural":"neadevărații","definite-error-unrecognized-form-feminine-neuter-plural":"neadevăratele"}},{"word":"neadeverit","pos":"adj","definitions":["which did not become true"],"forms":{"feminine-singular":"neadeverită","masculine-plural":"neadeveriți","feminine-neuter-plural":"neadeverite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neadeverit","error-unrecognized-form-feminine-indefinite-singular":"neadeverită","error-unrecognized-form-indefinite-masculine-plural":"neadeveriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neadeverite","definite-error-unrecognized-form-masculine-neuter-singular":"neadeveritul","definite-error-unrecognized-form-feminine-singular":"neadeverita","definite-error-unrecognized-form-masculine-plural":"neadeveriții","definite-error-unrecognized-form-feminine-neuter-plural":"neadeveritele"}},{"word":"neadmisibil","pos":"adj","definitions":["inadmissible, impermissible"],"forms":{"feminine-singular":"neadmisibilă","masculine-plural":"neadmisibili","feminine-neuter-plural":"neadmisibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neadmisibil","error-unrecognized-form-feminine-indefinite-singular":"neadmisibilă","error-unrecognized-form-indefinite-masculine-plural":"neadmisibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neadmisibile","definite-error-unrecognized-form-masculine-neuter-singular":"neadmisibilul","definite-error-unrecognized-form-feminine-singular":"neadmisibila","definite-error-unrecognized-form-masculine-plural":"neadmisibilii","definite-error-unrecognized-form-feminine-neuter-plural":"neadmisibilele"}},{"word":"neadormire","pos":"noun","definitions":["wakefulness"],"forms":{"plural":"neadormiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neadormire","accusative-definite-nominative-singular":"neadormirea","accusative-indefinite-nominative-plural":"neadormiri","accusative-definite-nominative-plural":"neadormirile","dative-genitive-indefinite-singular":"neadormiri","dative-definite-genitive-singular":"neadormirii","dative-genitive-indefinite-plural":"neadormiri","dative-definite-genitive-plural":"neadormirilor","singular-vocative":"neadormire","plural-vocative":"neadormirilor"}},{"word":"neadormit","pos":"adj","definitions":["watchful"],"forms":{"feminine-singular":"neadormită","masculine-plural":"neadormiți","feminine-neuter-plural":"neadormite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neadormit","error-unrecognized-form-feminine-indefinite-singular":"neadormită","error-unrecognized-form-indefinite-masculine-plural":"neadormiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neadormite","definite-error-unrecognized-form-masculine-neuter-singular":"neadormitul","definite-error-unrecognized-form-feminine-singular":"neadormita","definite-error-unrecognized-form-masculine-plural":"neadormiții","definite-error-unrecognized-form-feminine-neuter-plural":"neadormitele"}},{"word":"neaducere","pos":"noun","definitions":["not doing something"],"forms":{"plural":"neaduceri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neaducere","accusative-definite-nominative-singular":"neaducerea","accusative-indefinite-nominative-plural":"neaduceri","accusative-definite-nominative-plural":"neaducerile","dative-genitive-indefinite-singular":"neaduceri","dative-definite-genitive-singular":"neaducerii","dative-genitive-indefinite-plural":"neaduceri","dative-definite-genitive-plural":"neaducerilor","singular-vocative":"neaducere","plural-vocative":"neaducerilor"}},{"word":"neaerat","pos":"adj","definitions":["unaerated"],"forms":{"feminine-singular":"neaerată","masculine-plural":"neaerați","feminine-neuter-plural":"neaerate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neaerat","error-unrecognized-form-feminine-indefinite-singular":"neaerată","error-unrecognized-form-indefinite-masculine-plural":"neaerați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neaerate","definite-error-unrecognized-form-masculine-neuter-singular":"neaeratul","definite-error-unrecognized-form-feminine-singular":"neaerata","definite-error-unrecognized-form-masculine-plural":"neaerații","definite-error-unrecognized-form-feminine-neuter-plural":"neaeratele"}},{"word":"neafectat","pos":"adj","definitions":["unaffected"],"forms":{"feminine-singular":"neafectată","masculine-plural":"neafectați","feminine-neuter-plural":"neafectate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neafectat","error-unrecognized-form-feminine-indefinite-singular":"neafectată","error-unrecognized-form-indefinite-masculine-plural":"neafectați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neafectate","definite-error-unrecognized-form-masculine-neuter-singular":"neafectatul","definite-error-unrecognized-form-feminine-singular":"neafectata","definite-error-unrecognized-form-masculine-plural":"neafectații","definite-error-unrecognized-form-feminine-neuter-plural":"neafectatele"}},{"word":"neafiliat","pos":"adj","definitions":["unaffiliated"],"forms":{"feminine-singular":"neafiliată","masculine-plural":"neafiliați","feminine-neuter-plural":"neafiliate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neafiliat","error-unrecognized-form-feminine-indefinite-singular":"neafiliată","error-unrecognized-form-indefinite-masculine-plural":"neafiliați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neafiliate","definite-error-unrecognized-form-masculine-neuter-singular":"neafiliatul","definite-error-unrecognized-form-feminine-singular":"neafiliata","definite-error-unrecognized-form-masculine-plural":"neafiliații","definite-error-unrecognized-form-feminine-neuter-plural":"neafiliatele"}},{"word":"neaglutinat","pos":"adj","definitions":["unagglutinated"],"forms":{"feminine-singular":"neaglutinată","masculine-plural":"neaglutinați","feminine-neuter-plural":"neaglutinate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neaglutinat","error-unrecognized-form-feminine-indefinite-singular":"neaglutinată","error-unrecognized-form-indefinite-masculine-plural":"neaglutinați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neaglutinate","definite-error-unrecognized-form-masculine-neuter-singular":"neaglutinatul","definite-error-unrecognized-form-feminine-singular":"neaglutinata","definite-error-unrecognized-form-masculine-plural":"neaglutinații","definite-error-unrecognized-form-feminine-neuter-plural":"neaglutinatele"}},{"word":"Neagoi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Neagoi"}},{"word":"Neagomir","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Neagomir"}},{"word":"Neagra","pos":"name","definitions":["a village in Dezna, Arad County, Romania","a village in Lunca Bradului, Mureș County, Romania","a village in Tașca, Neamț County, Romania","a locality in Broșteni, Suceava County, Romania"],"gender":"f"},{"word":"neagră","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of negru"]},{"word":"Neagra Mare","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Neagra"],"gender":"f"},{"word":"Neagra Mică","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Neagra"],"gender":"f"},{"word":"Neagra Șarului","pos":"name","definitions":["a village in Șaru Dornei, Suceava County, Romania"],"gender":"f"},{"word":"neagresiune","pos":"noun","definitions":["nonaggression"],"forms":{"plural":"neagresiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neagresiune","accusative-definite-nominative-singular":"neagresiunea","accusative-indefinite-nominative-plural":"neagresiuni","accusative-definite-nominative-plural":"neagresiunile","dative-genitive-indefinite-singular":"neagresiuni","dative-definite-genitive-singular":"neagresiunii","dative-genitive-indefinite-plural":"neagresiuni","dative-definite-genitive-plural":"neagresiunilor","singular-vocative":"neagresiune","plural-vocative":"neagresiunilor"}},{"word":"neagresiv","pos":"adj","definitions":["nonaggressive"],"forms":{"feminine-singular":"neagresivă","masculine-plural":"neagresivi","feminine-neuter-plural":"neagresive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neagresiv","error-unrecognized-form-feminine-indefinite-singular":"neagresivă","error-unrecognized-form-indefinite-masculine-plural":"neagresivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"neagresive","definite-error-unrecognized-form-masculine-neuter-singular":"neagresivul","definite-error-unrecognized-form-feminine-singular":"neagresiva","definite-error-unrecognized-form-masculine-plural":"neagresivii","definite-error-unrecognized-form-feminine-neuter-plural":"neagresivele"}},{"word":"neagresivitate","pos":"noun","definitions":["nonaggressiveness"],"forms":{"plural":"neagresivități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neagresivitate","accusative-definite-nominative-singular":"neagresivitatea","accusative-indefinite-nominative-plural":"neagresivități","accusative-definite-nominative-plural":"neagresivitățile","dative-genitive-indefinite-singular":"neagresivități","dative-definite-genitive-singular":"neagresivității","dative-genitive-indefinite-plural":"neagresivități","dative-definite-genitive-plural":"neagresivităților","singular-vocative":"neagresivitate","plural-vocative":"neagresivităților"}},{"word":"neagricol","pos":"adj","definitions":["nonagricultural"],"forms":{"feminine-singular":"neagricolă","masculine-plural":"neagricoli","feminine-neuter-plural":"neagricole","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neagricol","error-unrecognized-form-feminine-indefinite-singular":"neagricolă","error-unrecognized-form-indefinite-masculine-plural":"neagricoli","error-unrecognized-form-feminine-indefinite-neuter-plural":"neagricole","definite-error-unrecognized-form-masculine-neuter-singular":"neagricolul","definite-error-unrecognized-form-feminine-singular":"neagricola","definite-error-unrecognized-form-masculine-plural":"neagricolii","definite-error-unrecognized-form-feminine-neuter-plural":"neagricolele"}},{"word":"Neagu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Neagu"}},{"word":"Neajlov","pos":"name","definitions":["a river in Romania"],"gender":"m"},{"word":"Neajlovel","pos":"name","definitions":["a river in Romania, tributary to the Neajlov"],"gender":"m"},{"word":"Neajlovu","pos":"name","definitions":["a village in Morteni, Dâmbovița County, Romania","a village in Clejani, Giurgiu County, Romania"],"gender":"m"},{"word":"neajungere","pos":"noun","definitions":["not reaching a needed state"],"forms":{"plural":"neajungeri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neajungere","accusative-definite-nominative-singular":"neajungerea","accusative-indefinite-nominative-plural":"neajungeri","accusative-definite-nominative-plural":"neajungerile","dative-genitive-indefinite-singular":"neajungeri","dative-definite-genitive-singular":"neajungerii","dative-genitive-indefinite-plural":"neajungeri","dative-definite-genitive-plural":"neajungerilor","singular-vocative":"neajungere","plural-vocative":"neajungerilor"}},{"word":"neajuns","pos":"noun","definitions":["shortcoming"],"forms":{"plural":"neajunsuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"neajuns","accusative-definite-nominative-singular":"neajunsul","accusative-indefinite-nominative-plural":"neajunsuri","accusative-definite-nominative-plural":"neajunsurile","dative-genitive-indefinite-singular":"neajuns","dative-definite-genitive-singular":"neajunsului","dative-genitive-indefinite-plural":"neajunsuri","dative-definite-genitive-plural":"neajunsurilor","singular-vocative":"neajunsule","plural-vocative":"neajunsurilor"}},{"word":"neajunsie","pos":"noun","definitions":["destitution"],"forms":{"plural":"neajunsii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neajunsie","accusative-definite-nominative-singular":"neajunsia","accusative-indefinite-nominative-plural":"neajunsii","accusative-definite-nominative-plural":"neajunsiile","dative-genitive-indefinite-singular":"neajunsii","dative-definite-genitive-singular":"neajunsiei","dative-genitive-indefinite-plural":"neajunsii","dative-definite-genitive-plural":"neajunsiilor","singular-vocative":"neajunsie","plural-vocative":"neajunsiilor"}},{"word":"neajutător","pos":"adj","definitions":["unhelpful"],"forms":{"feminine-singular":"neajutătoare","masculine-plural":"neajutători","feminine-neuter-plural":"neajutătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neajutător","error-unrecognized-form-feminine-indefinite-singular":"neajutătoare","error-unrecognized-form-indefinite-masculine-plural":"neajutători","error-unrecognized-form-feminine-indefinite-neuter-plural":"neajutătoare","definite-error-unrecognized-form-masculine-neuter-singular":"neajutătorul","definite-error-unrecognized-form-feminine-singular":"neajutătoarea","definite-error-unrecognized-form-masculine-plural":"neajutătorii","definite-error-unrecognized-form-feminine-neuter-plural":"neajutătoarele"}},{"word":"neajutorat","pos":"adj","definitions":["helpless"],"pronunciation":"/ne.a.ʒu.toˈrat/","forms":{"feminine-singular":"neajutorată","masculine-plural":"neajutorați","feminine-neuter-plural":"neajutorate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neajutorat","error-unrecognized-form-feminine-indefinite-singular":"neajutorată","error-unrecognized-form-indefinite-masculine-plural":"neajutorați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neajutorate","definite-error-unrecognized-form-masculine-neuter-singular":"neajutoratul","definite-error-unrecognized-form-feminine-singular":"neajutorata","definite-error-unrecognized-form-masculine-plural":"neajutorații","definite-error-unrecognized-form-feminine-neuter-plural":"neajutoratele"}},{"word":"nealcoolic","pos":"adj","definitions":["nonalcoholic"],"forms":{"feminine-singular":"nealcoolică","masculine-plural":"nealcoolici","feminine-neuter-plural":"nealcoolice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nealcoolic","error-unrecognized-form-feminine-indefinite-singular":"nealcoolică","error-unrecognized-form-indefinite-masculine-plural":"nealcoolici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nealcoolice","definite-error-unrecognized-form-masculine-neuter-singular":"nealcoolicul","definite-error-unrecognized-form-feminine-singular":"nealcoolica","definite-error-unrecognized-form-masculine-plural":"nealcoolicii","definite-error-unrecognized-form-feminine-neuter-plural":"nealcoolicele"}},{"word":"nealiniat","pos":"adj","definitions":["nonaligned"],"forms":{"feminine-singular":"nealiniată","masculine-plural":"nealiniați","feminine-neuter-plural":"nealiniate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nealiniat","error-unrecognized-form-feminine-indefinite-singular":"nealiniată","error-unrecognized-form-indefinite-masculine-plural":"nealiniați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nealiniate","definite-error-unrecognized-form-masculine-neuter-singular":"nealiniatul","definite-error-unrecognized-form-feminine-singular":"nealiniata","definite-error-unrecognized-form-masculine-plural":"nealiniații","definite-error-unrecognized-form-feminine-neuter-plural":"nealiniatele"}},{"word":"nealiniere","pos":"noun","definitions":["nonalignment"],"forms":{"plural":"nealinieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nealiniere","accusative-definite-nominative-singular":"nealinierea","accusative-indefinite-nominative-plural":"nealinieri","accusative-definite-nominative-plural":"nealinierile","dative-genitive-indefinite-singular":"nealinieri","dative-definite-genitive-singular":"nealinierii","dative-genitive-indefinite-plural":"nealinieri","dative-definite-genitive-plural":"nealinierilor","singular-vocative":"nealiniere","plural-vocative":"nealinierilor"}},{"word":"nealtădată","pos":"adv","definitions":["as never before"]},{"word":"nealterabil","pos":"adj","definitions":["unalterable"],"forms":{"feminine-singular":"nealterabilă","masculine-plural":"nealterabili","feminine-neuter-plural":"nealterabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nealterabil","error-unrecognized-form-feminine-indefinite-singular":"nealterabilă","error-unrecognized-form-indefinite-masculine-plural":"nealterabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nealterabile","definite-error-unrecognized-form-masculine-neuter-singular":"nealterabilul","definite-error-unrecognized-form-feminine-singular":"nealterabila","definite-error-unrecognized-form-masculine-plural":"nealterabilii","definite-error-unrecognized-form-feminine-neuter-plural":"nealterabilele"}},{"word":"nealterare","pos":"noun","definitions":["non-alteration"],"forms":{"plural":"nealterări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nealterare","accusative-definite-nominative-singular":"nealterarea","accusative-indefinite-nominative-plural":"nealterări","accusative-definite-nominative-plural":"nealterările","dative-genitive-indefinite-singular":"nealterări","dative-definite-genitive-singular":"nealterării","dative-genitive-indefinite-plural":"nealterări","dative-definite-genitive-plural":"nealterărilor","singular-vocative":"nealterare","plural-vocative":"nealterărilor"}},{"word":"nealterat","pos":"adj","definitions":["untainted"],"forms":{"feminine-singular":"nealterată","masculine-plural":"nealterați","feminine-neuter-plural":"nealterate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nealterat","error-unrecognized-form-feminine-indefinite-singular":"nealterată","error-unrecognized-form-indefinite-masculine-plural":"nealterați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nealterate","definite-error-unrecognized-form-masculine-neuter-singular":"nealteratul","definite-error-unrecognized-form-feminine-singular":"nealterata","definite-error-unrecognized-form-masculine-plural":"nealterații","definite-error-unrecognized-form-feminine-neuter-plural":"nealteratele"}},{"word":"nealtoit","pos":"adj","definitions":["ungrafted"],"forms":{"feminine-singular":"nealtoită","masculine-plural":"nealtoiți","feminine-neuter-plural":"nealtoite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nealtoit","error-unrecognized-form-feminine-indefinite-singular":"nealtoită","error-unrecognized-form-indefinite-masculine-plural":"nealtoiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nealtoite","definite-error-unrecognized-form-masculine-neuter-singular":"nealtoitul","definite-error-unrecognized-form-feminine-singular":"nealtoita","definite-error-unrecognized-form-masculine-plural":"nealtoiții","definite-error-unrecognized-form-feminine-neuter-plural":"nealtoitele"}},{"word":"neam","pos":"noun","definitions":["family, sort, kin, tribe","ancestry, lineage, descent extraction, origin","nation, people"],"pronunciation":"/ˈne̯am/","forms":{"plural":"neamuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"neam","accusative-definite-nominative-singular":"neamul","accusative-indefinite-nominative-plural":"neamuri","accusative-definite-nominative-plural":"neamurile","dative-genitive-indefinite-singular":"neam","dative-definite-genitive-singular":"neamului","dative-genitive-indefinite-plural":"neamuri","dative-definite-genitive-plural":"neamurilor","singular-vocative":"neamule","plural-vocative":"neamurilor"}},{"word":"neamabil","pos":"adj","definitions":["unkind"],"forms":{"feminine-singular":"neamabilă","masculine-plural":"neamabili","feminine-neuter-plural":"neamabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neamabil","error-unrecognized-form-feminine-indefinite-singular":"neamabilă","error-unrecognized-form-indefinite-masculine-plural":"neamabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neamabile","definite-error-unrecognized-form-masculine-neuter-singular":"neamabilul","definite-error-unrecognized-form-feminine-singular":"neamabila","definite-error-unrecognized-form-masculine-plural":"neamabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neamabilele"}},{"word":"neamestec","pos":"noun","definitions":["noninterference"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neamestec","accusative-definite-nominative":"neamestecul","dative-genitive-indefinite":"neamestec","dative-definite-genitive":"neamestecului","vocative":"neamestecule"}},{"word":"neamic","pos":"noun","definitions":["enemy"],"forms":{"plural":"neamici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neamic","accusative-definite-nominative-singular":"neamicul","accusative-indefinite-nominative-plural":"neamici","accusative-definite-nominative-plural":"neamicii","dative-genitive-indefinite-singular":"neamic","dative-definite-genitive-singular":"neamicului","dative-genitive-indefinite-plural":"neamici","dative-definite-genitive-plural":"neamicilor","singular-vocative":"neamicule","plural-vocative":"neamicilor"}},{"word":"Neamț","pos":"name","definitions":["a county of Romania","a river in Romania"],"pronunciation":"/ne̯amt͡s/","gender":"n"},{"word":"neamț","pos":"name","definitions":["a German"],"pronunciation":"[ne̯amt͡s]","forms":{"plural":"nemți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neamț","accusative-definite-nominative-singular":"neamțul","accusative-indefinite-nominative-plural":"nemți","accusative-definite-nominative-plural":"nemții","dative-genitive-indefinite-singular":"neamț","dative-definite-genitive-singular":"neamțului","dative-genitive-indefinite-plural":"nemți","dative-definite-genitive-plural":"nemților","singular-vocative":"neamțule","plural-vocative":"nemților"}},{"word":"Neamțiu","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Neamțiu"}},{"word":"neamțofil","pos":"adj","definitions":["alternative form of nemțofil"],"forms":{"feminine-singular":"neamțofilă","masculine-plural":"neamțofili","feminine-neuter-plural":"neamțofile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neamțofil","error-unrecognized-form-feminine-indefinite-singular":"neamțofilă","error-unrecognized-form-indefinite-masculine-plural":"neamțofili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neamțofile","definite-error-unrecognized-form-masculine-neuter-singular":"neamțofilul","definite-error-unrecognized-form-feminine-singular":"neamțofila","definite-error-unrecognized-form-masculine-plural":"neamțofilii","definite-error-unrecognized-form-feminine-neuter-plural":"neamțofilele"}},{"word":"neamțofilă","pos":"noun","definitions":["female equivalent of neamțofil"],"forms":{"plural":"neamțofile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neamțofilă","accusative-definite-nominative-singular":"neamțofila","accusative-indefinite-nominative-plural":"neamțofile","accusative-definite-nominative-plural":"neamțofilele","dative-genitive-indefinite-singular":"neamțofile","dative-definite-genitive-singular":"neamțofilei","dative-genitive-indefinite-plural":"neamțofile","dative-definite-genitive-plural":"neamțofilelor","singular-vocative":"neamțofilă","plural-vocative":"neamțofilelor"}},{"word":"Neamțu","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Neamțu"}},{"word":"Neamțului cel Mare","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Neamț"],"gender":"m"},{"word":"Neamțului cel Mic","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Neamț"],"gender":"m"},{"word":"Neamu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Neamu"}},{"word":"neamul omenesc","pos":"noun","definitions":["human race"]},{"word":"neanalizabil","pos":"adj","definitions":["unanalysable"],"forms":{"feminine-singular":"neanalizabilă","masculine-plural":"neanalizabili","feminine-neuter-plural":"neanalizabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neanalizabil","error-unrecognized-form-feminine-indefinite-singular":"neanalizabilă","error-unrecognized-form-indefinite-masculine-plural":"neanalizabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neanalizabile","definite-error-unrecognized-form-masculine-neuter-singular":"neanalizabilul","definite-error-unrecognized-form-feminine-singular":"neanalizabila","definite-error-unrecognized-form-masculine-plural":"neanalizabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neanalizabilele"}},{"word":"neanexat","pos":"adj","definitions":["not annexed"],"forms":{"feminine-singular":"neanexată","masculine-plural":"neanexați","feminine-neuter-plural":"neanexate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neanexat","error-unrecognized-form-feminine-indefinite-singular":"neanexată","error-unrecognized-form-indefinite-masculine-plural":"neanexați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neanexate","definite-error-unrecognized-form-masculine-neuter-singular":"neanexatul","definite-error-unrecognized-form-feminine-singular":"neanexata","definite-error-unrecognized-form-masculine-plural":"neanexații","definite-error-unrecognized-form-feminine-neuter-plural":"neanexatele"}},{"word":"neangajat","pos":"adj","definitions":["disengaged","nonemployed"],"forms":{"feminine-singular":"neangajată","masculine-plural":"neangajați","feminine-neuter-plural":"neangajate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neangajat","error-unrecognized-form-feminine-indefinite-singular":"neangajată","error-unrecognized-form-indefinite-masculine-plural":"neangajați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neangajate","definite-error-unrecognized-form-masculine-neuter-singular":"neangajatul","definite-error-unrecognized-form-feminine-singular":"neangajata","definite-error-unrecognized-form-masculine-plural":"neangajații","definite-error-unrecognized-form-feminine-neuter-plural":"neangajatele"}},{"word":"neanimat","pos":"adj","definitions":["inanimate"],"forms":{"feminine-singular":"neanimată","masculine-plural":"neanimați","feminine-neuter-plural":"neanimate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neanimat","error-unrecognized-form-feminine-indefinite-singular":"neanimată","error-unrecognized-form-indefinite-masculine-plural":"neanimați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neanimate","definite-error-unrecognized-form-masculine-neuter-singular":"neanimatul","definite-error-unrecognized-form-feminine-singular":"neanimata","definite-error-unrecognized-form-masculine-plural":"neanimații","definite-error-unrecognized-form-feminine-neuter-plural":"neanimatele"}},{"word":"neant","pos":"noun","definitions":["nothingness"],"pronunciation":"/neˈant/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neant","accusative-definite-nominative":"neantul","dative-genitive-indefinite":"neant","dative-definite-genitive":"neantului","vocative":"neantule"}},{"word":"neantagonic","pos":"adj","definitions":["not antagonistic"],"forms":{"feminine-singular":"neantagonică","masculine-plural":"neantagonici","feminine-neuter-plural":"neantagonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neantagonic","error-unrecognized-form-feminine-indefinite-singular":"neantagonică","error-unrecognized-form-indefinite-masculine-plural":"neantagonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neantagonice","definite-error-unrecognized-form-masculine-neuter-singular":"neantagonicul","definite-error-unrecognized-form-feminine-singular":"neantagonica","definite-error-unrecognized-form-masculine-plural":"neantagonicii","definite-error-unrecognized-form-feminine-neuter-plural":"neantagonicele"}},{"word":"neantagonist","pos":"adj","definitions":["not antagonistic"],"forms":{"feminine-singular":"neantagonistă","masculine-plural":"neantagoniști","feminine-neuter-plural":"neantagoniste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neantagonist","error-unrecognized-form-feminine-indefinite-singular":"neantagonistă","error-unrecognized-form-indefinite-masculine-plural":"neantagoniști","error-unrecognized-form-feminine-indefinite-neuter-plural":"neantagoniste","definite-error-unrecognized-form-masculine-neuter-singular":"neantagonistul","definite-error-unrecognized-form-feminine-singular":"neantagonista","definite-error-unrecognized-form-masculine-plural":"neantagoniștii","definite-error-unrecognized-form-feminine-neuter-plural":"neantagonistele"}},{"word":"neanticipat","pos":"adj","definitions":["unanticipated"],"pronunciation":"/ˌne.an.ti.t͡ʃiˈpat/","forms":{"feminine-singular":"neanticipată","masculine-plural":"neanticipați","feminine-neuter-plural":"neanticipate","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"neanticipat","error-unrecognized-form-feminine-indefinite-singular":"neanticipată","error-unrecognized-form-indefinite-masculine-plural":"neanticipați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neanticipate","definite-error-unrecognized-form-masculine-neuter-singular":"neanticipatul","definite-error-unrecognized-form-feminine-singular":"neanticipata","definite-error-unrecognized-form-masculine-plural":"neanticipații","definite-error-unrecognized-form-feminine-neuter-plural":"neanticipatele"}},{"word":"neantiza","pos":"verb","definitions":["to annihilate"],"forms":{"canonical":"a neantiza 1st conjugation","present-singular-third-person":"neantizează","participle-past":"neantizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a neantiza","gerund":"neantizând","first-person-indicative-present-singular":"neantizez","indicative-present-second-person-singular":"neantizezi","indicative-present-singular-third-person":"neantizează","first-person-indicative-plural-present":"neantizăm","indicative-plural-present-second-person":"neantizați","indicative-plural-present-third-person":"neantizează","first-person-imperfect-indicative-singular":"neantizam","imperfect-indicative-second-person-singular":"neantizai","imperfect-indicative-singular-third-person":"neantiza","first-person-imperfect-indicative-plural":"neantizam","imperfect-indicative-plural-second-person":"neantizați","imperfect-indicative-plural-third-person":"neantizau","first-person-indicative-perfect-singular":"neantizai","indicative-perfect-second-person-singular":"neantizași","indicative-perfect-singular-third-person":"neantiză","first-person-indicative-perfect-plural":"neantizarăm","indicative-perfect-plural-second-person":"neantizarăți","indicative-perfect-plural-third-person":"neantizară","first-person-indicative-pluperfect-singular":"neantizasem","indicative-pluperfect-second-person-singular":"neantizaseși","indicative-pluperfect-singular-third-person":"neantizase","first-person-indicative-pluperfect-plural":"neantizaserăm","indicative-pluperfect-plural-second-person":"neantizaserăți","indicative-pluperfect-plural-third-person":"neantizaseră","first-person-present-singular-subjunctive":"să neantizez","present-second-person-singular-subjunctive":"să neantizezi","present-singular-subjunctive-third-person":"să neantizeze","first-person-plural-present-subjunctive":"să neantizăm","plural-present-second-person-subjunctive":"să neantizați","plural-present-subjunctive-third-person":"să neantizeze","imperative-second-person-singular":"neantizează","imperative-plural-second-person":"neantizați","imperative-negative-second-person-singular":"nu neantiza","imperative-negative-plural-second-person":"nu neantizați"}},{"word":"neantizare","pos":"noun","definitions":["annihilation"],"forms":{"plural":"neantizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neantizare","accusative-definite-nominative-singular":"neantizarea","accusative-indefinite-nominative-plural":"neantizări","accusative-definite-nominative-plural":"neantizările","dative-genitive-indefinite-singular":"neantizări","dative-definite-genitive-singular":"neantizării","dative-genitive-indefinite-plural":"neantizări","dative-definite-genitive-plural":"neantizărilor","singular-vocative":"neantizare","plural-vocative":"neantizărilor"}},{"word":"neaoș","pos":"adj","definitions":["trueborn"],"forms":{"feminine-singular":"neaoșă","masculine-plural":"neaoși","feminine-neuter-plural":"neaoșe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neaoș","error-unrecognized-form-feminine-indefinite-singular":"neaoșă","error-unrecognized-form-indefinite-masculine-plural":"neaoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"neaoșe","definite-error-unrecognized-form-masculine-neuter-singular":"neaoșul","definite-error-unrecognized-form-feminine-singular":"neaoșa","definite-error-unrecognized-form-masculine-plural":"neaoșii","definite-error-unrecognized-form-feminine-neuter-plural":"neaoșele"}},{"word":"neaoșism","pos":"noun","definitions":["archaizing word"],"forms":{"plural":"neaoșisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neaoșism","accusative-definite-nominative-singular":"neaoșismul","accusative-indefinite-nominative-plural":"neaoșisme","accusative-definite-nominative-plural":"neaoșismele","dative-genitive-indefinite-singular":"neaoșism","dative-definite-genitive-singular":"neaoșismului","dative-genitive-indefinite-plural":"neaoșisme","dative-definite-genitive-plural":"neaoșismelor","singular-vocative":"neaoșismule","plural-vocative":"neaoșismelor"}},{"word":"neaoșistă","pos":"noun","definitions":["female equivalent of neaoșist"],"forms":{"plural":"neaoșiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neaoșistă","accusative-definite-nominative-singular":"neaoșista","accusative-indefinite-nominative-plural":"neaoșiste","accusative-definite-nominative-plural":"neaoșistele","dative-genitive-indefinite-singular":"neaoșiste","dative-definite-genitive-singular":"neaoșistei","dative-genitive-indefinite-plural":"neaoșiste","dative-definite-genitive-plural":"neaoșistelor","singular-vocative":"neaoșistă","plural-vocative":"neaoșistelor"}},{"word":"neapărat","pos":"adv","definitions":["without fail, absolutely, at all costs, necessarily"],"pronunciation":"/ˌne.a.pəˈrat/","examples":[{"ro":"Trebuie neapărat să ajungem la timp.","en":"We must be on time at all costs."},{"ro":"Nu ai neapărat nevoie de cască, dar ar fi bine să ai una.","en":"You don't absolutely need a helmet, but it's better to have one."}]},{"word":"neapărat","pos":"adj","definitions":["undefended"],"pronunciation":"/ˌne.a.pəˈrat/","forms":{"feminine-singular":"neapărată","masculine-plural":"neapărați","feminine-neuter-plural":"neapărate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neapărat","error-unrecognized-form-feminine-indefinite-singular":"neapărată","error-unrecognized-form-indefinite-masculine-plural":"neapărați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neapărate","definite-error-unrecognized-form-masculine-neuter-singular":"neapăratul","definite-error-unrecognized-form-feminine-singular":"neapărata","definite-error-unrecognized-form-masculine-plural":"neapărații","definite-error-unrecognized-form-feminine-neuter-plural":"neapăratele"}},{"word":"neaplicabil","pos":"adj","definitions":["unapplicable"],"forms":{"feminine-singular":"neaplicabilă","masculine-plural":"neaplicabili","feminine-neuter-plural":"neaplicabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neaplicabil","error-unrecognized-form-feminine-indefinite-singular":"neaplicabilă","error-unrecognized-form-indefinite-masculine-plural":"neaplicabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neaplicabile","definite-error-unrecognized-form-masculine-neuter-singular":"neaplicabilul","definite-error-unrecognized-form-feminine-singular":"neaplicabila","definite-error-unrecognized-form-masculine-plural":"neaplicabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neaplicabilele"}},{"word":"neaplicabilitate","pos":"noun","definitions":["non-applicability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neaplicabilitate","accusative-definite-nominative":"neaplicabilitatea","dative-genitive-indefinite":"neaplicabilități","dative-definite-genitive":"neaplicabilității","vocative":"neaplicabilitate"}},{"word":"neapreciat","pos":"adj","definitions":["unappreciated"],"forms":{"feminine-singular":"neapreciată","masculine-plural":"neapreciați","feminine-neuter-plural":"neapreciate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neapreciat","error-unrecognized-form-feminine-indefinite-singular":"neapreciată","error-unrecognized-form-indefinite-masculine-plural":"neapreciați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neapreciate","definite-error-unrecognized-form-masculine-neuter-singular":"neapreciatul","definite-error-unrecognized-form-feminine-singular":"neapreciata","definite-error-unrecognized-form-masculine-plural":"neapreciații","definite-error-unrecognized-form-feminine-neuter-plural":"neapreciatele"}},{"word":"nearanjat","pos":"adj","definitions":["disordered"],"forms":{"feminine-singular":"nearanjată","masculine-plural":"nearanjați","feminine-neuter-plural":"nearanjate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nearanjat","error-unrecognized-form-feminine-indefinite-singular":"nearanjată","error-unrecognized-form-indefinite-masculine-plural":"nearanjați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nearanjate","definite-error-unrecognized-form-masculine-neuter-singular":"nearanjatul","definite-error-unrecognized-form-feminine-singular":"nearanjata","definite-error-unrecognized-form-masculine-plural":"nearanjații","definite-error-unrecognized-form-feminine-neuter-plural":"nearanjatele"}},{"word":"nearat","pos":"adj","definitions":["untilled"],"forms":{"feminine-singular":"nearată","masculine-plural":"nearați","feminine-neuter-plural":"nearate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nearat","error-unrecognized-form-feminine-indefinite-singular":"nearată","error-unrecognized-form-indefinite-masculine-plural":"nearați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nearate","definite-error-unrecognized-form-masculine-neuter-singular":"nearatul","definite-error-unrecognized-form-feminine-singular":"nearata","definite-error-unrecognized-form-masculine-plural":"nearații","definite-error-unrecognized-form-feminine-neuter-plural":"nearatele"}}];
@@ -0,0 +1 @@
+export default [{"word":"nearmonios","pos":"adj","definitions":["disharmonious"],"forms":{"feminine-singular":"nearmonioasă","masculine-plural":"nearmonioși","feminine-neuter-plural":"nearmonioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nearmonios","error-unrecognized-form-feminine-indefinite-singular":"nearmonioasă","error-unrecognized-form-indefinite-masculine-plural":"nearmonioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nearmonioase","definite-error-unrecognized-form-masculine-neuter-singular":"nearmoniosul","definite-error-unrecognized-form-feminine-singular":"nearmonioasa","definite-error-unrecognized-form-masculine-plural":"nearmonioșii","definite-error-unrecognized-form-feminine-neuter-plural":"nearmonioasele"}},{"word":"nearomat","pos":"adj","definitions":["unflavored"],"forms":{"feminine-singular":"nearomată","masculine-plural":"nearomați","feminine-neuter-plural":"nearomate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nearomat","error-unrecognized-form-feminine-indefinite-singular":"nearomată","error-unrecognized-form-indefinite-masculine-plural":"nearomați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nearomate","definite-error-unrecognized-form-masculine-neuter-singular":"nearomatul","definite-error-unrecognized-form-feminine-singular":"nearomata","definite-error-unrecognized-form-masculine-plural":"nearomații","definite-error-unrecognized-form-feminine-neuter-plural":"nearomatele"}},{"word":"Nearșova","pos":"name","definitions":["a village in Izvoru Crișului, Cluj County, Romania"],"gender":"f"},{"word":"nearticulat","pos":"adj","definitions":["nonarticulated"],"pronunciation":"/ˌne.ar.ti.kuˈlat/","forms":{"feminine-singular":"nearticulată","masculine-plural":"nearticulați","feminine-neuter-plural":"nearticulate","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"nearticulat","error-unrecognized-form-feminine-indefinite-singular":"nearticulată","error-unrecognized-form-indefinite-masculine-plural":"nearticulați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nearticulate","definite-error-unrecognized-form-masculine-neuter-singular":"nearticulatul","definite-error-unrecognized-form-feminine-singular":"nearticulata","definite-error-unrecognized-form-masculine-plural":"nearticulații","definite-error-unrecognized-form-feminine-neuter-plural":"nearticulatele"}},{"word":"neartificial","pos":"adj","definitions":["nonartificial"],"forms":{"feminine-singular":"neartificială","masculine-plural":"neartificiali","feminine-neuter-plural":"neartificiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neartificial","error-unrecognized-form-feminine-indefinite-singular":"neartificială","error-unrecognized-form-indefinite-masculine-plural":"neartificiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"neartificiale","definite-error-unrecognized-form-masculine-neuter-singular":"neartificialul","definite-error-unrecognized-form-feminine-singular":"neartificiala","definite-error-unrecognized-form-masculine-plural":"neartificialii","definite-error-unrecognized-form-feminine-neuter-plural":"neartificialele"}},{"word":"neartistic","pos":"adj","definitions":["nonartistic"],"forms":{"feminine-singular":"neartistică","masculine-plural":"neartistici","feminine-neuter-plural":"neartistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neartistic","error-unrecognized-form-feminine-indefinite-singular":"neartistică","error-unrecognized-form-indefinite-masculine-plural":"neartistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neartistice","definite-error-unrecognized-form-masculine-neuter-singular":"neartisticul","definite-error-unrecognized-form-feminine-singular":"neartistica","definite-error-unrecognized-form-masculine-plural":"neartisticii","definite-error-unrecognized-form-feminine-neuter-plural":"neartisticele"}},{"word":"neascultare","pos":"noun","definitions":["disobedience"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neascultare","accusative-definite-nominative":"neascultarea","dative-genitive-indefinite":"neascultari","dative-definite-genitive":"neascultarii","vocative":"neascultare"}},{"word":"neascultător","pos":"adj","definitions":["disobedient"],"forms":{"feminine-singular":"neascultătoare","masculine-plural":"neascultători","feminine-neuter-plural":"neascultătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neascultător","error-unrecognized-form-feminine-indefinite-singular":"neascultătoare","error-unrecognized-form-indefinite-masculine-plural":"neascultători","error-unrecognized-form-feminine-indefinite-neuter-plural":"neascultătoare","definite-error-unrecognized-form-masculine-neuter-singular":"neascultătorul","definite-error-unrecognized-form-feminine-singular":"neascultătoarea","definite-error-unrecognized-form-masculine-plural":"neascultătorii","definite-error-unrecognized-form-feminine-neuter-plural":"neascultătoarele"}},{"word":"neascuțit","pos":"adj","definitions":["dull"],"forms":{"feminine-singular":"neascuțită","masculine-plural":"neascuțiți","feminine-neuter-plural":"neascuțite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neascuțit","error-unrecognized-form-feminine-indefinite-singular":"neascuțită","error-unrecognized-form-indefinite-masculine-plural":"neascuțiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neascuțite","definite-error-unrecognized-form-masculine-neuter-singular":"neascuțitul","definite-error-unrecognized-form-feminine-singular":"neascuțita","definite-error-unrecognized-form-masculine-plural":"neascuțiții","definite-error-unrecognized-form-feminine-neuter-plural":"neascuțitele"}},{"word":"neasemănat","pos":"adj","definitions":["unlike"],"forms":{"feminine-singular":"neasemănată","masculine-plural":"neasemănați","feminine-neuter-plural":"neasemănate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neasemănat","error-unrecognized-form-feminine-indefinite-singular":"neasemănată","error-unrecognized-form-indefinite-masculine-plural":"neasemănați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neasemănate","definite-error-unrecognized-form-masculine-neuter-singular":"neasemănatul","definite-error-unrecognized-form-feminine-singular":"neasemănata","definite-error-unrecognized-form-masculine-plural":"neasemănații","definite-error-unrecognized-form-feminine-neuter-plural":"neasemănatele"}},{"word":"neasemuit","pos":"adj","definitions":["unparalleled"],"forms":{"feminine-singular":"neasemuită","masculine-plural":"neasemuiți","feminine-neuter-plural":"neasemuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neasemuit","error-unrecognized-form-feminine-indefinite-singular":"neasemuită","error-unrecognized-form-indefinite-masculine-plural":"neasemuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neasemuite","definite-error-unrecognized-form-masculine-neuter-singular":"neasemuitul","definite-error-unrecognized-form-feminine-singular":"neasemuita","definite-error-unrecognized-form-masculine-plural":"neasemuiții","definite-error-unrecognized-form-feminine-neuter-plural":"neasemuitele"}},{"word":"neasigurat","pos":"adj","definitions":["uninsured"],"forms":{"feminine-singular":"neasigurată","masculine-plural":"neasigurați","feminine-neuter-plural":"neasigurate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neasigurat","error-unrecognized-form-feminine-indefinite-singular":"neasigurată","error-unrecognized-form-indefinite-masculine-plural":"neasigurați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neasigurate","definite-error-unrecognized-form-masculine-neuter-singular":"neasiguratul","definite-error-unrecognized-form-feminine-singular":"neasigurata","definite-error-unrecognized-form-masculine-plural":"neasigurații","definite-error-unrecognized-form-feminine-neuter-plural":"neasiguratele"}},{"word":"neasimilat","pos":"adj","definitions":["unassimilated","indigested"],"forms":{"feminine-singular":"neasimilată","masculine-plural":"neasimilați","feminine-neuter-plural":"neasimilate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neasimilat","error-unrecognized-form-feminine-indefinite-singular":"neasimilată","error-unrecognized-form-indefinite-masculine-plural":"neasimilați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neasimilate","definite-error-unrecognized-form-masculine-neuter-singular":"neasimilatul","definite-error-unrecognized-form-feminine-singular":"neasimilata","definite-error-unrecognized-form-masculine-plural":"neasimilații","definite-error-unrecognized-form-feminine-neuter-plural":"neasimilatele"}},{"word":"neastâmpăr","pos":"noun","definitions":["fidget"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neastâmpăr","accusative-definite-nominative":"neastâmpărul","dative-genitive-indefinite":"neastâmpăr","dative-definite-genitive":"neastâmpărului","vocative":"neastâmpărule"}},{"word":"neastâmpărare","pos":"noun","definitions":["impatience"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neastâmpărare","accusative-definite-nominative":"neastâmpărarea","dative-genitive-indefinite":"neastâmpărări","dative-definite-genitive":"neastâmpărării","vocative":"neastâmpărare"}},{"word":"neastâmpărat","pos":"adj","definitions":["restless"],"forms":{"feminine-singular":"neastâmpărată","masculine-plural":"neastâmpărați","feminine-neuter-plural":"neastâmpărate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neastâmpărat","error-unrecognized-form-feminine-indefinite-singular":"neastâmpărată","error-unrecognized-form-indefinite-masculine-plural":"neastâmpărați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neastâmpărate","definite-error-unrecognized-form-masculine-neuter-singular":"neastâmpăratul","definite-error-unrecognized-form-feminine-singular":"neastâmpărata","definite-error-unrecognized-form-masculine-plural":"neastâmpărații","definite-error-unrecognized-form-feminine-neuter-plural":"neastâmpăratele"}},{"word":"neașteptare","pos":"noun","definitions":["immediately"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neașteptare","accusative-definite-nominative":"neașteptarea","dative-genitive-indefinite":"neașteptări","dative-definite-genitive":"neașteptării","vocative":"neașteptare"}},{"word":"neașteptat","pos":"adj","definitions":["unexpected"],"pronunciation":"/ˌne.aʃ.tepˈtat/","forms":{"feminine-singular":"neașteptată","masculine-plural":"neașteptați","feminine-neuter-plural":"neașteptate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neașteptat","error-unrecognized-form-feminine-indefinite-singular":"neașteptată","error-unrecognized-form-indefinite-masculine-plural":"neașteptați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neașteptate","definite-error-unrecognized-form-masculine-neuter-singular":"neașteptatul","definite-error-unrecognized-form-feminine-singular":"neașteptata","definite-error-unrecognized-form-masculine-plural":"neașteptații","definite-error-unrecognized-form-feminine-neuter-plural":"neașteptatele"}},{"word":"neașteptat","pos":"verb","definitions":["negative past participle of aștepta"],"pronunciation":"/ˌne.aʃ.tepˈtat/"},{"word":"neața","pos":"intj","definitions":["morning (a greeting said in the morning; shortening of good morning)"]},{"word":"Neață","pos":"name","definitions":["a surname"],"gender":"?"},{"word":"neatacabil","pos":"adj","definitions":["not open to challenge"],"forms":{"feminine-singular":"neatacabilă","masculine-plural":"neatacabili","feminine-neuter-plural":"neatacabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neatacabil","error-unrecognized-form-feminine-indefinite-singular":"neatacabilă","error-unrecognized-form-indefinite-masculine-plural":"neatacabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neatacabile","definite-error-unrecognized-form-masculine-neuter-singular":"neatacabilul","definite-error-unrecognized-form-feminine-singular":"neatacabila","definite-error-unrecognized-form-masculine-plural":"neatacabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neatacabilele"}},{"word":"neatârnare","pos":"noun","definitions":["independence"],"pronunciation":"/ne.a.tɨrˈna.re/","forms":{"plural":"neatârnări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neatârnare","accusative-definite-nominative-singular":"neatârnarea","accusative-indefinite-nominative-plural":"neatârnări","accusative-definite-nominative-plural":"neatârnările","dative-genitive-indefinite-singular":"neatârnări","dative-definite-genitive-singular":"neatârnării","dative-genitive-indefinite-plural":"neatârnări","dative-definite-genitive-plural":"neatârnărilor","singular-vocative":"neatârnare","plural-vocative":"neatârnărilor"}},{"word":"Neatârnarea","pos":"name","definitions":["a village in Beidaud, Tulcea County, Romania"],"gender":"f"},{"word":"neatârnat","pos":"adj","definitions":["independent"],"forms":{"feminine-singular":"neatârnată","masculine-plural":"neatârnați","feminine-neuter-plural":"neatârnate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neatârnat","error-unrecognized-form-feminine-indefinite-singular":"neatârnată","error-unrecognized-form-indefinite-masculine-plural":"neatârnați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neatârnate","definite-error-unrecognized-form-masculine-neuter-singular":"neatârnatul","definite-error-unrecognized-form-feminine-singular":"neatârnata","definite-error-unrecognized-form-masculine-plural":"neatârnații","definite-error-unrecognized-form-feminine-neuter-plural":"neatârnatele"}},{"word":"neatașabil","pos":"adj","definitions":["unattachable"],"forms":{"feminine-singular":"neatașabilă","masculine-plural":"neatașabili","feminine-neuter-plural":"neatașabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neatașabil","error-unrecognized-form-feminine-indefinite-singular":"neatașabilă","error-unrecognized-form-indefinite-masculine-plural":"neatașabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neatașabile","definite-error-unrecognized-form-masculine-neuter-singular":"neatașabilul","definite-error-unrecognized-form-feminine-singular":"neatașabila","definite-error-unrecognized-form-masculine-plural":"neatașabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neatașabilele"}},{"word":"neatent","pos":"adj","definitions":["careless, without paying attention"],"forms":{"feminine-singular":"neatentă","masculine-plural":"neatenți","feminine-neuter-plural":"neatente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neatent","error-unrecognized-form-feminine-indefinite-singular":"neatentă","error-unrecognized-form-indefinite-masculine-plural":"neatenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neatente","definite-error-unrecognized-form-masculine-neuter-singular":"neatentul","definite-error-unrecognized-form-feminine-singular":"neatenta","definite-error-unrecognized-form-masculine-plural":"neatenții","definite-error-unrecognized-form-feminine-neuter-plural":"neatentele"}},{"word":"neatenție","pos":"noun","definitions":["inattention"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"neatenție","accusative-definite-nominative":"neatenția","dative-genitive-indefinite":"neatenții","dative-definite-genitive":"neatenției","vocative":"neatenție"}},{"word":"neatestat","pos":"adj","definitions":["not attested"],"forms":{"feminine-singular":"neatestată","masculine-plural":"neatestați","feminine-neuter-plural":"neatestate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neatestat","error-unrecognized-form-feminine-indefinite-singular":"neatestată","error-unrecognized-form-indefinite-masculine-plural":"neatestați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neatestate","definite-error-unrecognized-form-masculine-neuter-singular":"neatestatul","definite-error-unrecognized-form-feminine-singular":"neatestata","definite-error-unrecognized-form-masculine-plural":"neatestații","definite-error-unrecognized-form-feminine-neuter-plural":"neatestatele"}},{"word":"neatins","pos":"adj","definitions":["untouched"],"forms":{"feminine-singular":"neatinsă","masculine-plural":"neatinși","feminine-neuter-plural":"neatinse","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neatins","error-unrecognized-form-feminine-indefinite-singular":"neatinsă","error-unrecognized-form-indefinite-masculine-plural":"neatinși","error-unrecognized-form-feminine-indefinite-neuter-plural":"neatinse","definite-error-unrecognized-form-masculine-neuter-singular":"neatinsul","definite-error-unrecognized-form-feminine-singular":"neatinsa","definite-error-unrecognized-form-masculine-plural":"neatinșii","definite-error-unrecognized-form-feminine-neuter-plural":"neatinsele"}},{"word":"neatrăgător","pos":"noun","definitions":["unattractive"],"forms":{"feminine-singular":"neatrăgătoare","masculine-plural":"neatrăgători","feminine-neuter-plural":"neatrăgătoare"}},{"word":"neauă","pos":"noun","definitions":["alternative form of nea"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"neauă","accusative-definite-nominative":"neaua","dative-genitive-indefinite":"neaue","dative-definite-genitive":"neauei","vocative":"neauă"}},{"word":"neautentic","pos":"adj","definitions":["inauthentic"],"forms":{"feminine-singular":"neautentică","masculine-plural":"neautentici","feminine-neuter-plural":"neautentice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neautentic","error-unrecognized-form-feminine-indefinite-singular":"neautentică","error-unrecognized-form-indefinite-masculine-plural":"neautentici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neautentice","definite-error-unrecognized-form-masculine-neuter-singular":"neautenticul","definite-error-unrecognized-form-feminine-singular":"neautentica","definite-error-unrecognized-form-masculine-plural":"neautenticii","definite-error-unrecognized-form-feminine-neuter-plural":"neautenticele"}},{"word":"neautorizat","pos":"adj","definitions":["unauthorized"],"forms":{"feminine-singular":"neautorizată","masculine-plural":"neautorizați","feminine-neuter-plural":"neautorizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neautorizat","error-unrecognized-form-feminine-indefinite-singular":"neautorizată","error-unrecognized-form-indefinite-masculine-plural":"neautorizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neautorizate","definite-error-unrecognized-form-masculine-neuter-singular":"neautorizatul","definite-error-unrecognized-form-feminine-singular":"neautorizata","definite-error-unrecognized-form-masculine-plural":"neautorizații","definite-error-unrecognized-form-feminine-neuter-plural":"neautorizatele"}},{"word":"neauzit","pos":"adj","definitions":["unheard"],"forms":{"feminine-singular":"neauzită","masculine-plural":"neauziți","feminine-neuter-plural":"neauzite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neauzit","error-unrecognized-form-feminine-indefinite-singular":"neauzită","error-unrecognized-form-indefinite-masculine-plural":"neauziți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neauzite","definite-error-unrecognized-form-masculine-neuter-singular":"neauzitul","definite-error-unrecognized-form-feminine-singular":"neauzita","definite-error-unrecognized-form-masculine-plural":"neauziții","definite-error-unrecognized-form-feminine-neuter-plural":"neauzitele"}},{"word":"neavenit","pos":"adj","definitions":["void"],"forms":{"feminine-singular":"neavenită","masculine-plural":"neaveniți","feminine-neuter-plural":"neavenite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neavenit","error-unrecognized-form-feminine-indefinite-singular":"neavenită","error-unrecognized-form-indefinite-masculine-plural":"neaveniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neavenite","definite-error-unrecognized-form-masculine-neuter-singular":"neavenitul","definite-error-unrecognized-form-feminine-singular":"neavenita","definite-error-unrecognized-form-masculine-plural":"neaveniții","definite-error-unrecognized-form-feminine-neuter-plural":"neavenitele"}},{"word":"neavizat","pos":"adj","definitions":["uninformed"],"forms":{"feminine-singular":"neavizată","masculine-plural":"neavizați","feminine-neuter-plural":"neavizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neavizat","error-unrecognized-form-feminine-indefinite-singular":"neavizată","error-unrecognized-form-indefinite-masculine-plural":"neavizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neavizate","definite-error-unrecognized-form-masculine-neuter-singular":"neavizatul","definite-error-unrecognized-form-feminine-singular":"neavizata","definite-error-unrecognized-form-masculine-plural":"neavizații","definite-error-unrecognized-form-feminine-neuter-plural":"neavizatele"}},{"word":"nebântuit","pos":"adj","definitions":["not haunted"],"forms":{"feminine-singular":"nebântuită","masculine-plural":"nebântuiți","feminine-neuter-plural":"nebântuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nebântuit","error-unrecognized-form-feminine-indefinite-singular":"nebântuită","error-unrecognized-form-indefinite-masculine-plural":"nebântuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nebântuite","definite-error-unrecognized-form-masculine-neuter-singular":"nebântuitul","definite-error-unrecognized-form-feminine-singular":"nebântuita","definite-error-unrecognized-form-masculine-plural":"nebântuiții","definite-error-unrecognized-form-feminine-neuter-plural":"nebântuitele"}},{"word":"nebănuit","pos":"adj","definitions":["unsuspected, inconspicuous","surprising, unforeseen","untold, very big"],"forms":{"feminine-singular":"nebănuită","masculine-plural":"nebănuiți","feminine-neuter-plural":"nebănuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nebănuit","error-unrecognized-form-feminine-indefinite-singular":"nebănuită","error-unrecognized-form-indefinite-masculine-plural":"nebănuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nebănuite","definite-error-unrecognized-form-masculine-neuter-singular":"nebănuitul","definite-error-unrecognized-form-feminine-singular":"nebănuita","definite-error-unrecognized-form-masculine-plural":"nebănuiții","definite-error-unrecognized-form-feminine-neuter-plural":"nebănuitele"}},{"word":"nebăut","pos":"adj","definitions":["undrunk"],"forms":{"feminine-singular":"nebăută","masculine-plural":"nebăuți","feminine-neuter-plural":"nebăute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nebăut","error-unrecognized-form-feminine-indefinite-singular":"nebăută","error-unrecognized-form-indefinite-masculine-plural":"nebăuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nebăute","definite-error-unrecognized-form-masculine-neuter-singular":"nebăutul","definite-error-unrecognized-form-feminine-singular":"nebăuta","definite-error-unrecognized-form-masculine-plural":"nebăuții","definite-error-unrecognized-form-feminine-neuter-plural":"nebăutele"}},{"word":"nebedernică","pos":"noun","definitions":["alternative form of nabederniță"],"forms":{"plural":"nebedernici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"nebedernică","accusative-definite-nominative-singular":"nebedernica","accusative-indefinite-nominative-plural":"nebedernici","accusative-definite-nominative-plural":"nebedernicile","dative-genitive-indefinite-singular":"nebedernici","dative-definite-genitive-singular":"nebedernicii","dative-genitive-indefinite-plural":"nebedernici","dative-definite-genitive-plural":"nebedernicilor","singular-vocative":"nebedernică","plural-vocative":"nebedernicilor"}},{"word":"nebeligerant","pos":"adj","definitions":["nonbelligerent"],"forms":{"feminine-singular":"nebeligerantă","masculine-plural":"nebeligeranți","feminine-neuter-plural":"nebeligerante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nebeligerant","error-unrecognized-form-feminine-indefinite-singular":"nebeligerantă","error-unrecognized-form-indefinite-masculine-plural":"nebeligeranți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nebeligerante","definite-error-unrecognized-form-masculine-neuter-singular":"nebeligerantul","definite-error-unrecognized-form-feminine-singular":"nebeligeranta","definite-error-unrecognized-form-masculine-plural":"nebeligeranții","definite-error-unrecognized-form-feminine-neuter-plural":"nebeligerantele"}},{"word":"nebeligeranță","pos":"noun","definitions":["nonaggression"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"nebeligeranță","accusative-definite-nominative":"nebeligeranța","dative-genitive-indefinite":"e","dative-definite-genitive":"ei","vocative":"nebeligeranță"}},{"word":"nebiruit","pos":"adj","definitions":["undefeated"],"forms":{"feminine-singular":"nebiruită","masculine-plural":"nebiruiți","feminine-neuter-plural":"nebiruite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nebiruit","error-unrecognized-form-feminine-indefinite-singular":"nebiruită","error-unrecognized-form-indefinite-masculine-plural":"nebiruiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nebiruite","definite-error-unrecognized-form-masculine-neuter-singular":"nebiruitul","definite-error-unrecognized-form-feminine-singular":"nebiruita","definite-error-unrecognized-form-masculine-plural":"nebiruiții","definite-error-unrecognized-form-feminine-neuter-plural":"nebiruitele"}},{"word":"nebotezat","pos":"adj","definitions":["unbaptized"],"pronunciation":"/ˌne.bo.teˈzat/","forms":{"feminine-singular":"nebotezată","masculine-plural":"nebotezați","feminine-neuter-plural":"nebotezate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nebotezat","error-unrecognized-form-feminine-indefinite-singular":"nebotezată","error-unrecognized-form-indefinite-masculine-plural":"nebotezați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nebotezate","definite-error-unrecognized-form-masculine-neuter-singular":"nebotezatul","definite-error-unrecognized-form-feminine-singular":"nebotezata","definite-error-unrecognized-form-masculine-plural":"nebotezații","definite-error-unrecognized-form-feminine-neuter-plural":"nebotezatele"}},{"word":"nebuloasă","pos":"noun","definitions":["nebula"],"forms":{"plural":"nebuloase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nebuloasă","accusative-definite-nominative-singular":"nebuloasa","accusative-indefinite-nominative-plural":"nebuloase","accusative-definite-nominative-plural":"nebuloasele","dative-genitive-indefinite-singular":"nebuloase","dative-definite-genitive-singular":"nebuloasei","dative-genitive-indefinite-plural":"nebuloase","dative-definite-genitive-plural":"nebuloaselor","singular-vocative":"nebuloasă","plural-vocative":"nebuloaselor"}},{"word":"nebuloasă planetară","pos":"noun","definitions":["planetary nebula"],"forms":{"plural":"nebuloase planetare"}},{"word":"nebulos","pos":"adj","definitions":["nebulous, hazy, vaporous, cloudy, cloudlike, obscure"],"forms":{"feminine-singular":"nebuloasă","masculine-plural":"nebuloși","feminine-neuter-plural":"nebuloase"}},{"word":"nebulos","pos":"adv","definitions":["nebulously, hazily, obscurely"]},{"word":"nebulozitate","pos":"noun","definitions":["nebulosity"],"forms":{"plural":"nebulozități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nebulozitate","accusative-definite-nominative-singular":"nebulozitatea","accusative-indefinite-nominative-plural":"nebulozități","accusative-definite-nominative-plural":"nebulozitățile","dative-genitive-indefinite-singular":"nebulozități","dative-definite-genitive-singular":"nebulozității","dative-genitive-indefinite-plural":"nebulozități","dative-definite-genitive-plural":"nebulozităților","singular-vocative":"nebulozitate","plural-vocative":"nebulozităților"}},{"word":"nebun","pos":"adj","definitions":["crazy, insane"],"pronunciation":"[neˈbun]","forms":{"feminine-singular":"nebună","masculine-plural":"nebuni","feminine-neuter-plural":"nebune","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"nebun","error-unrecognized-form-feminine-indefinite-singular":"nebună","error-unrecognized-form-indefinite-masculine-plural":"nebuni","error-unrecognized-form-feminine-indefinite-neuter-plural":"nebune","definite-error-unrecognized-form-masculine-neuter-singular":"nebunul","definite-error-unrecognized-form-feminine-singular":"nebuna","definite-error-unrecognized-form-masculine-plural":"nebunii","definite-error-unrecognized-form-feminine-neuter-plural":"nebunele"}},{"word":"nebun","pos":"noun","definitions":["madman","bishop"],"pronunciation":"[neˈbun]","forms":{"plural":"nebuni","feminine":"equivalent nebună","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nebun","accusative-definite-nominative-singular":"nebunul","accusative-indefinite-nominative-plural":"nebuni","accusative-definite-nominative-plural":"nebunii","dative-genitive-indefinite-singular":"nebun","dative-definite-genitive-singular":"nebunului","dative-genitive-indefinite-plural":"nebuni","dative-definite-genitive-plural":"nebunilor","singular-vocative":"nebunule","plural-vocative":"nebunilor"}},{"word":"nebun de legat","pos":"adj","definitions":["lunatic; stark raving mad"],"forms":{"feminine-singular":"nebună de legat","masculine-plural":"nebuni de legat","feminine-neuter-plural":"nebune de legat"}},{"word":"nebuna","pos":"noun","definitions":["definite nominative/accusative singular of nebună"]},{"word":"nebună","pos":"noun","definitions":["female equivalent of nebun"],"forms":{"plural":"nebune","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nebună","accusative-definite-nominative-singular":"nebuna","accusative-indefinite-nominative-plural":"nebune","accusative-definite-nominative-plural":"nebunele","dative-genitive-indefinite-singular":"nebune","dative-definite-genitive-singular":"nebunei","dative-genitive-indefinite-plural":"nebune","dative-definite-genitive-plural":"nebunelor","singular-vocative":"nebună","plural-vocative":"nebunelor"}},{"word":"nebunariță","pos":"noun","definitions":["henbane (Hyoscyamus niger)"],"forms":{"plural":"nebunarițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nebunariță","accusative-definite-nominative-singular":"nebunarița","accusative-indefinite-nominative-plural":"nebunarițe","accusative-definite-nominative-plural":"nebunarițele","dative-genitive-indefinite-singular":"nebunarițe","dative-definite-genitive-singular":"nebunariței","dative-genitive-indefinite-plural":"nebunarițe","dative-definite-genitive-plural":"nebunarițelor","singular-vocative":"nebunariță","plural-vocative":"nebunarițelor"}},{"word":"nebunăriță","pos":"noun","definitions":["henbane (Hyoscyamus niger)"],"forms":{"plural":"nebunărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nebunăriță","accusative-definite-nominative-singular":"nebunărița","accusative-indefinite-nominative-plural":"nebunărițe","accusative-definite-nominative-plural":"nebunărițele","dative-genitive-indefinite-singular":"nebunărițe","dative-definite-genitive-singular":"nebunăriței","dative-genitive-indefinite-plural":"nebunărițe","dative-definite-genitive-plural":"nebunărițelor","singular-vocative":"nebunăriță","plural-vocative":"nebunărițelor"}},{"word":"nebunatec","pos":"adj","definitions":["obsolete form of nebunatic"],"forms":{"feminine-singular":"nebunatecă","masculine-plural":"nebunateci","feminine-neuter-plural":"nebunatece","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nebunatec","error-unrecognized-form-feminine-indefinite-singular":"nebunatecă","error-unrecognized-form-indefinite-masculine-plural":"nebunateci","error-unrecognized-form-feminine-indefinite-neuter-plural":"nebunatece","definite-error-unrecognized-form-masculine-neuter-singular":"nebunatecul","definite-error-unrecognized-form-feminine-singular":"nebunateca","definite-error-unrecognized-form-masculine-plural":"nebunatecii","definite-error-unrecognized-form-feminine-neuter-plural":"nebunatecele"}},{"word":"nebunatecie","pos":"noun","definitions":["exuberance"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"nebunatecie","accusative-definite-nominative":"nebunatecia","dative-genitive-indefinite":"nebunatecii","dative-definite-genitive":"nebunateciei","vocative":"nebunatecie"}},{"word":"nebunatic","pos":"adj","definitions":["frisky"],"forms":{"feminine-singular":"nebunatică","masculine-plural":"nebunatici","feminine-neuter-plural":"nebunatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nebunatic","error-unrecognized-form-feminine-indefinite-singular":"nebunatică","error-unrecognized-form-indefinite-masculine-plural":"nebunatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nebunatice","definite-error-unrecognized-form-masculine-neuter-singular":"nebunaticul","definite-error-unrecognized-form-feminine-singular":"nebunatica","definite-error-unrecognized-form-masculine-plural":"nebunaticii","definite-error-unrecognized-form-feminine-neuter-plural":"nebunaticele"}},{"word":"nebune","pos":"noun","definitions":["inflection of nebună:","plural","genitive/dative singular"]},{"word":"nebuneală","pos":"noun","definitions":["madness"],"forms":{"plural":"nebuneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"nebuneală","accusative-definite-nominative-singular":"nebuneala","accusative-indefinite-nominative-plural":"nebuneli","accusative-definite-nominative-plural":"nebunelile","dative-genitive-indefinite-singular":"nebuneli","dative-definite-genitive-singular":"nebunelii","dative-genitive-indefinite-plural":"nebuneli","dative-definite-genitive-plural":"nebunelilor","singular-vocative":"nebuneală","plural-vocative":"nebunelilor"}},{"word":"nebunei","pos":"noun","definitions":["definite dative/genitive singular of nebună"]},{"word":"nebunele","pos":"noun","definitions":["definite nominative/accusative plural of nebună"]},{"word":"nebunelor","pos":"noun","definitions":["inflection of nebună:","definite genitive/dative plural","vocative plural"]},{"word":"nebunesc","pos":"adj","definitions":["crazy"],"forms":{"feminine-singular":"nebunească","plural":"nebunești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nebunesc","error-unrecognized-form-feminine-indefinite-singular":"nebunească","error-unrecognized-form-indefinite-masculine-plural":"nebunești","error-unrecognized-form-feminine-indefinite-neuter-plural":"nebunești","definite-error-unrecognized-form-masculine-neuter-singular":"nebunescul","definite-error-unrecognized-form-feminine-singular":"nebuneasca","definite-error-unrecognized-form-masculine-plural":"nebuneștii","definite-error-unrecognized-form-feminine-neuter-plural":"nebuneștile"}},{"word":"Nebunescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nebunescu"}},{"word":"nebunește","pos":"adv","definitions":["foolishly"]},{"word":"nebuni","pos":"verb","definitions":["to go crazy, go mad","to drive crazy"],"forms":{"canonical":"a nebuni 4th conjugation","present-singular-third-person":"nebunește","participle-past":"nebunit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nebuni","gerund":"nebunind","first-person-indicative-present-singular":"nebunesc","indicative-present-second-person-singular":"nebunești","indicative-present-singular-third-person":"nebunește","first-person-indicative-plural-present":"nebunim","indicative-plural-present-second-person":"nebuniți","indicative-plural-present-third-person":"nebunesc","first-person-imperfect-indicative-singular":"nebuneam","imperfect-indicative-second-person-singular":"nebuneai","imperfect-indicative-singular-third-person":"nebunea","first-person-imperfect-indicative-plural":"nebuneam","imperfect-indicative-plural-second-person":"nebuneați","imperfect-indicative-plural-third-person":"nebuneau","first-person-indicative-perfect-singular":"nebunii","indicative-perfect-second-person-singular":"nebuniși","indicative-perfect-singular-third-person":"nebuni","first-person-indicative-perfect-plural":"nebunirăm","indicative-perfect-plural-second-person":"nebunirăți","indicative-perfect-plural-third-person":"nebuniră","first-person-indicative-pluperfect-singular":"nebunisem","indicative-pluperfect-second-person-singular":"nebuniseși","indicative-pluperfect-singular-third-person":"nebunise","first-person-indicative-pluperfect-plural":"nebuniserăm","indicative-pluperfect-plural-second-person":"nebuniserăți","indicative-pluperfect-plural-third-person":"nebuniseră","first-person-present-singular-subjunctive":"să nebunesc","present-second-person-singular-subjunctive":"să nebunești","present-singular-subjunctive-third-person":"să nebunească","first-person-plural-present-subjunctive":"să nebunim","plural-present-second-person-subjunctive":"să nebuniți","plural-present-subjunctive-third-person":"să nebunească","imperative-second-person-singular":"nebunește","imperative-plural-second-person":"nebuniți","imperative-negative-second-person-singular":"nu nebuni","imperative-negative-plural-second-person":"nu nebuniți"}},{"word":"nebuni","pos":"noun","definitions":["plural of nebun"]},{"word":"nebunie","pos":"noun","definitions":["insanity"],"forms":{"plural":"nebunii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nebunie","accusative-definite-nominative-singular":"nebunia","accusative-indefinite-nominative-plural":"nebunii","accusative-definite-nominative-plural":"nebuniile","dative-genitive-indefinite-singular":"nebunii","dative-definite-genitive-singular":"nebuniei","dative-genitive-indefinite-plural":"nebunii","dative-definite-genitive-plural":"nebuniilor","singular-vocative":"nebunie","plural-vocative":"nebuniilor"}},{"word":"nebunii","pos":"noun","definitions":["definite nominative/accusative plural of nebun"]},{"word":"nebunilor","pos":"noun","definitions":["inflection of nebun:","definite genitive/dative plural","vocative plural"]},{"word":"nebunire","pos":"noun","definitions":["madness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"nebunire","accusative-definite-nominative":"nebunirea","dative-genitive-indefinite":"nebunire","dative-definite-genitive":"nebunirei","vocative":"nebunire"}},{"word":"nebunit","pos":"adj","definitions":["crazy person"],"forms":{"feminine-singular":"nebunită","masculine-plural":"nebuniți","feminine-neuter-plural":"nebunite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nebunit","error-unrecognized-form-feminine-indefinite-singular":"nebunită","error-unrecognized-form-indefinite-masculine-plural":"nebuniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nebunite","definite-error-unrecognized-form-masculine-neuter-singular":"nebunitul","definite-error-unrecognized-form-feminine-singular":"nebunita","definite-error-unrecognized-form-masculine-plural":"nebuniții","definite-error-unrecognized-form-feminine-neuter-plural":"nebunitele"}},{"word":"nebunoasă","pos":"noun","definitions":["sweet woodruff"],"forms":{"plural":"nebunoase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nebunoasă","accusative-definite-nominative-singular":"nebunoasa","accusative-indefinite-nominative-plural":"nebunoase","accusative-definite-nominative-plural":"nebunoasele","dative-genitive-indefinite-singular":"nebunoase","dative-definite-genitive-singular":"nebunoasei","dative-genitive-indefinite-plural":"nebunoase","dative-definite-genitive-plural":"nebunoaselor","singular-vocative":"nebunoasă","plural-vocative":"nebunoaselor"}},{"word":"Nebunu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nebunu"}},{"word":"nebunul","pos":"noun","definitions":["definite nominative/accusative singular of nebun"]},{"word":"nebunule","pos":"noun","definitions":["vocative singular of nebun"]},{"word":"nebunului","pos":"noun","definitions":["definite dative/genitive singular of nebun"]},{"word":"necăcios","pos":"adj","definitions":["alternative form of înecăcios"],"forms":{"feminine-singular":"necăcioasă","masculine-plural":"necăcioși","feminine-neuter-plural":"necăcioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necăcios","error-unrecognized-form-feminine-indefinite-singular":"necăcioasă","error-unrecognized-form-indefinite-masculine-plural":"necăcioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"necăcioase","definite-error-unrecognized-form-masculine-neuter-singular":"necăciosul","definite-error-unrecognized-form-feminine-singular":"necăcioasa","definite-error-unrecognized-form-masculine-plural":"necăcioșii","definite-error-unrecognized-form-feminine-neuter-plural":"necăcioasele"}},{"word":"necăciune","pos":"noun","definitions":["drowning"],"forms":{"plural":"necăciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"necăciune","accusative-definite-nominative-singular":"necăciunea","accusative-indefinite-nominative-plural":"necăciuni","accusative-definite-nominative-plural":"necăciunile","dative-genitive-indefinite-singular":"necăciuni","dative-definite-genitive-singular":"necăciunii","dative-genitive-indefinite-plural":"necăciuni","dative-definite-genitive-plural":"necăciunilor","singular-vocative":"necăciune","plural-vocative":"necăciunilor"}},{"word":"necăiri","pos":"adv","definitions":["obsolete form of nicăieri"]},{"word":"necăiuri","pos":"adv","definitions":["obsolete form of nicăieri"]},{"word":"necăjea","pos":"verb","definitions":["third-person singular imperfect indicative of necăji"],"pronunciation":"[nekəˈʒe̯a]","forms":{"canonical":"necăjeá"}},{"word":"necăjeai","pos":"verb","definitions":["second-person singular imperfect indicative of necăji"],"pronunciation":"[nekəˈʒe̯aj]","forms":{"canonical":"necăjeái"}},{"word":"necăjeală","pos":"noun","definitions":["trouble, distress"],"forms":{"plural":"necăjeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"necăjeală","accusative-definite-nominative-singular":"necăjeala","accusative-indefinite-nominative-plural":"necăjele","accusative-definite-nominative-plural":"necăjelele","dative-genitive-indefinite-singular":"necăjele","dative-definite-genitive-singular":"necăjelei","dative-genitive-indefinite-plural":"necăjele","dative-definite-genitive-plural":"necăjelelor","singular-vocative":"necăjeală","plural-vocative":"necăjelelor"}},{"word":"necăjeam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of necăji"],"pronunciation":"[nekəˈʒe̯am]","forms":{"canonical":"necăjeám"}},{"word":"necăjească","pos":"verb","definitions":["third-person singular/plural present subjunctive of necăji"],"pronunciation":"[nekəˈʒe̯askə]","forms":{"canonical":"necăjeáscă"}},{"word":"necăjeați","pos":"verb","definitions":["second-person plural imperfect indicative of necăji"],"pronunciation":"[nekəˈʒe̯at͡sʲ]","forms":{"canonical":"necăjeáți"}},{"word":"necăjeau","pos":"verb","definitions":["third-person plural imperfect indicative of necăji"],"pronunciation":"[nekəˈʒe̯aw]","forms":{"canonical":"necăjeáu"}},{"word":"necăjesc","pos":"verb","definitions":["inflection of necăji:","first-person singular present indicative/subjunctive","third-person plural present indicative"],"pronunciation":"[nekəˈʒesk]","forms":{"canonical":"necăjésc"}},{"word":"necăjește","pos":"verb","definitions":["inflection of necăji:","third-person singular present indicative","second-person singular imperative"],"pronunciation":"[nekəˈʒeʃte]","forms":{"canonical":"necăjéște"}},{"word":"necăjești","pos":"verb","definitions":["second-person singular present indicative/subjunctive of necăji"],"pronunciation":"[nekəˈʒeʃtʲ]","forms":{"canonical":"necăjéști"}},{"word":"necăji","pos":"verb","definitions":["to bother, to molest, to pester"],"pronunciation":"[nekəˈʒi]","forms":{"canonical":"a necăji 4th conjugation","present-singular-third-person":"necăjește","participle-past":"necăjit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a necăji","gerund":"necăjind","first-person-indicative-present-singular":"necăjesc","indicative-present-second-person-singular":"necăjești","indicative-present-singular-third-person":"necăjește","first-person-indicative-plural-present":"necăjim","indicative-plural-present-second-person":"necăjiți","indicative-plural-present-third-person":"necăjesc","first-person-imperfect-indicative-singular":"necăjeam","imperfect-indicative-second-person-singular":"necăjeai","imperfect-indicative-singular-third-person":"necăjea","first-person-imperfect-indicative-plural":"necăjeam","imperfect-indicative-plural-second-person":"necăjeați","imperfect-indicative-plural-third-person":"necăjeau","first-person-indicative-perfect-singular":"necăjii","indicative-perfect-second-person-singular":"necăjiși","indicative-perfect-singular-third-person":"necăji","first-person-indicative-perfect-plural":"necăjirăm","indicative-perfect-plural-second-person":"necăjirăți","indicative-perfect-plural-third-person":"necăjiră","first-person-indicative-pluperfect-singular":"necăjisem","indicative-pluperfect-second-person-singular":"necăjiseși","indicative-pluperfect-singular-third-person":"necăjise","first-person-indicative-pluperfect-plural":"necăjiserăm","indicative-pluperfect-plural-second-person":"necăjiserăți","indicative-pluperfect-plural-third-person":"necăjiseră","first-person-present-singular-subjunctive":"să necăjesc","present-second-person-singular-subjunctive":"să necăjești","present-singular-subjunctive-third-person":"să necăjească","first-person-plural-present-subjunctive":"să necăjim","plural-present-second-person-subjunctive":"să necăjiți","plural-present-subjunctive-third-person":"să necăjească","imperative-second-person-singular":"necăjește","imperative-plural-second-person":"necăjiți","imperative-negative-second-person-singular":"nu necăji","imperative-negative-plural-second-person":"nu necăjiți"}},{"word":"necăjicios","pos":"adj","definitions":["huffy, thin-skinned"],"forms":{"feminine-singular":"necăjicioasă","masculine-plural":"necăjicioși","feminine-neuter-plural":"necăjicioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necăjicios","error-unrecognized-form-feminine-indefinite-singular":"necăjicioasă","error-unrecognized-form-indefinite-masculine-plural":"necăjicioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"necăjicioase","definite-error-unrecognized-form-masculine-neuter-singular":"necăjiciosul","definite-error-unrecognized-form-feminine-singular":"necăjicioasa","definite-error-unrecognized-form-masculine-plural":"necăjicioșii","definite-error-unrecognized-form-feminine-neuter-plural":"necăjicioasele"}},{"word":"necăjii","pos":"verb","definitions":["first-person singular simple perfect indicative of necăji"],"pronunciation":"[nekəˈʒiː]","forms":{"canonical":"necăjíi"}},{"word":"necăjim","pos":"verb","definitions":["first-person plural present indicative/subjunctive of necăji"],"pronunciation":"[nekəˈʒim]","forms":{"canonical":"necăjím"}},{"word":"necăjind","pos":"verb","definitions":["gerund of necăji"],"pronunciation":"[nekəˈʒind]","forms":{"canonical":"necăjínd"}},{"word":"necăjiră","pos":"verb","definitions":["third-person plural simple perfect indicative of necăji"],"pronunciation":"[nekəˈʒirə]","forms":{"canonical":"necăjíră"}},{"word":"necăjirăm","pos":"verb","definitions":["first-person plural simple perfect indicative of necăji"],"pronunciation":"[nekəˈʒirəm]","forms":{"canonical":"necăjírăm"}},{"word":"necăjirăți","pos":"verb","definitions":["second-person plural simple perfect indicative of necăji"],"pronunciation":"[nekəˈʒirət͡sʲ]","forms":{"canonical":"necăjírăți"}},{"word":"necăjire","pos":"noun","definitions":["misery, suffering"],"forms":{"plural":"necăjiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"necăjire","accusative-definite-nominative-singular":"necăjirea","accusative-indefinite-nominative-plural":"necăjiri","accusative-definite-nominative-plural":"necăjirile","dative-genitive-indefinite-singular":"necăjiri","dative-definite-genitive-singular":"necăjirii","dative-genitive-indefinite-plural":"necăjiri","dative-definite-genitive-plural":"necăjirilor","singular-vocative":"necăjire","plural-vocative":"necăjirilor"}},{"word":"necăjise","pos":"verb","definitions":["third-person singular pluperfect indicative of necăji"],"pronunciation":"[nekəˈʒise]","forms":{"canonical":"necăjíse"}},{"word":"necăjisem","pos":"verb","definitions":["first-person singular pluperfect indicative of necăji"],"pronunciation":"[nekəˈʒisem]","forms":{"canonical":"necăjísem"}},{"word":"necăjiseră","pos":"verb","definitions":["third-person plural pluperfect indicative of necăji"],"pronunciation":"[nekəˈʒiserə]","forms":{"canonical":"necăjíseră"}},{"word":"necăjiserăm","pos":"verb","definitions":["first-person plural pluperfect indicative of necăji"],"pronunciation":"[nekəˈʒiserəm]","forms":{"canonical":"necăjíserăm"}},{"word":"necăjiserăți","pos":"verb","definitions":["second-person plural pluperfect indicative of necăji"],"pronunciation":"[nekəˈʒiserət͡sʲ]","forms":{"canonical":"necăjíserăți"}},{"word":"necăjiseși","pos":"verb","definitions":["second-person singular pluperfect indicative of necăji"],"pronunciation":"[nekəˈʒiseʃʲ]","forms":{"canonical":"necăjíseși"}},{"word":"necăjiși","pos":"verb","definitions":["second-person singular simple perfect indicative of necăji"],"pronunciation":"[nekəˈʒiʃʲ]","forms":{"canonical":"necăjíși"}},{"word":"necăjit","pos":"adj","definitions":["sad, upset","poor"],"pronunciation":"[nekəˈʒit]","forms":{"feminine-singular":"necăjită","masculine-plural":"necăjiți","feminine-neuter-plural":"necăjite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necăjit","error-unrecognized-form-feminine-indefinite-singular":"necăjită","error-unrecognized-form-indefinite-masculine-plural":"necăjiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"necăjite","definite-error-unrecognized-form-masculine-neuter-singular":"necăjitul","definite-error-unrecognized-form-feminine-singular":"necăjita","definite-error-unrecognized-form-masculine-plural":"necăjiții","definite-error-unrecognized-form-feminine-neuter-plural":"necăjitele"}},{"word":"necăjit","pos":"verb","definitions":["past participle of necăji"],"pronunciation":"[nekəˈʒit]","forms":{"canonical":"necăjít","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"necăjit","error-unrecognized-form-feminine-indefinite-singular":"necăjită","error-unrecognized-form-indefinite-masculine-plural":"necăjiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"necăjite","definite-error-unrecognized-form-masculine-neuter-singular":"necăjitul","definite-error-unrecognized-form-feminine-singular":"necăjita","definite-error-unrecognized-form-masculine-plural":"necăjiții","definite-error-unrecognized-form-feminine-neuter-plural":"necăjitele"}},{"word":"necăjita","pos":"adj","definitions":["definite nominative/accusative feminine singular of necăjit"],"pronunciation":"[nekəˈʒita]","forms":{"canonical":"necăjíta"}},{"word":"necăjită","pos":"adj","definitions":["feminine singular of necăjit"],"pronunciation":"[nekəˈʒitə]","gender":"f"},{"word":"necăjite","pos":"adj","definitions":["feminine/neuter plural of necăjit"],"pronunciation":"[nekəˈʒite]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"necăjíte"}},{"word":"necăjitei","pos":"adj","definitions":["definite genitive/dative feminine singular of necăjit"],"pronunciation":"[nekəˈʒitej]","forms":{"canonical":"necăjítei"}},{"word":"necăjitele","pos":"adj","definitions":["definite nominative/accusative feminine/neuter plural of necăjit"],"pronunciation":"[nekəˈʒitele]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"necăjítele"}},{"word":"necăjitelor","pos":"adj","definitions":["definite genitive/dative feminine/neuter plural of necăjit"],"pronunciation":"[nekəˈʒitelor]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"necăjítelor"}},{"word":"necăjiți","pos":"adj","definitions":["masculine plural of necăjit"],"pronunciation":"[nekəˈʒit͡sʲ]","forms":{"canonical":"necăjíți"}},{"word":"necăjiți","pos":"verb","definitions":["inflection of necăji:","second-person plural present indicative/subjunctive","second-person plural imperative"],"pronunciation":"[nekəˈʒit͡sʲ]","forms":{"canonical":"necăjíți"}},{"word":"necăjiții","pos":"adj","definitions":["definite nominative/accusative masculine plural of necăjit"],"pronunciation":"[nekəˈʒit͡siː]","gender":"m-p","forms":{"canonical-masculine-plural":"necăjíții"}},{"word":"necăjiților","pos":"adj","definitions":["definite genitive/dative masculine plural of necăjit"],"pronunciation":"[nekəˈʒit͡silor]","gender":"m-p","forms":{"canonical-masculine-plural":"necăjíților"}},{"word":"necăjitul","pos":"adj","definitions":["definite nominative/accusative masculine/neuter singular of necăjit"],"pronunciation":"[nekəˈʒitul]","gender":"m","forms":{"canonical-masculine-neuter":"necăjítul"}},{"word":"necăjitului","pos":"adj","definitions":["definite genitive/dative masculine/neuter singular of necăjit"],"pronunciation":"[nekəˈʒituluj]","gender":"m","forms":{"canonical-masculine-neuter":"necăjítului"}},{"word":"necălcat","pos":"adj","definitions":["crumpled"],"forms":{"feminine-singular":"necălcată","masculine-plural":"necălcați","feminine-neuter-plural":"necălcate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necălcat","error-unrecognized-form-feminine-indefinite-singular":"necălcată","error-unrecognized-form-indefinite-masculine-plural":"necălcați","error-unrecognized-form-feminine-indefinite-neuter-plural":"necălcate","definite-error-unrecognized-form-masculine-neuter-singular":"necălcatul","definite-error-unrecognized-form-feminine-singular":"necălcata","definite-error-unrecognized-form-masculine-plural":"necălcații","definite-error-unrecognized-form-feminine-neuter-plural":"necălcatele"}},{"word":"necalculabil","pos":"adj","definitions":["incalculable"],"forms":{"feminine-singular":"necalculabilă","masculine-plural":"necalculabili","feminine-neuter-plural":"necalculabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necalculabil","error-unrecognized-form-feminine-indefinite-singular":"necalculabilă","error-unrecognized-form-indefinite-masculine-plural":"necalculabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"necalculabile","definite-error-unrecognized-form-masculine-neuter-singular":"necalculabilul","definite-error-unrecognized-form-feminine-singular":"necalculabila","definite-error-unrecognized-form-masculine-plural":"necalculabilii","definite-error-unrecognized-form-feminine-neuter-plural":"necalculabilele"}},{"word":"necalificat","pos":"adj","definitions":["unqualified"],"forms":{"feminine-singular":"necalificată","masculine-plural":"necalificați","feminine-neuter-plural":"necalificate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necalificat","error-unrecognized-form-feminine-indefinite-singular":"necalificată","error-unrecognized-form-indefinite-masculine-plural":"necalificați","error-unrecognized-form-feminine-indefinite-neuter-plural":"necalificate","definite-error-unrecognized-form-masculine-neuter-singular":"necalificatul","definite-error-unrecognized-form-feminine-singular":"necalificata","definite-error-unrecognized-form-masculine-plural":"necalificații","definite-error-unrecognized-form-feminine-neuter-plural":"necalificatele"}},{"word":"necărturar","pos":"noun","definitions":["an ignorant"],"forms":{"plural":"necărturari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"necărturar","accusative-definite-nominative-singular":"necărturarul","accusative-indefinite-nominative-plural":"necărturari","accusative-definite-nominative-plural":"necărturarii","dative-genitive-indefinite-singular":"necărturar","dative-definite-genitive-singular":"necărturarului","dative-genitive-indefinite-plural":"necărturari","dative-definite-genitive-plural":"necărturarilor","singular-vocative":"necărturarule","plural-vocative":"necărturarilor"}},{"word":"necărturareț","pos":"noun","definitions":["an ignorant person"],"forms":{"plural":"necărturareți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"necărturareț","accusative-definite-nominative-singular":"necărturarețul","accusative-indefinite-nominative-plural":"necărturareți","accusative-definite-nominative-plural":"necărturareții","dative-genitive-indefinite-singular":"necărturareț","dative-definite-genitive-singular":"necărturarețului","dative-genitive-indefinite-plural":"necărturareți","dative-definite-genitive-plural":"necărturareților","singular-vocative":"necărturarețule","plural-vocative":"necărturareților"}},{"word":"necăsătorie","pos":"noun","definitions":["celibacy"],"forms":{"plural":"necăsătorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"necăsătorie","accusative-definite-nominative-singular":"necăsătoria","accusative-indefinite-nominative-plural":"necăsătorii","accusative-definite-nominative-plural":"necăsătoriile","dative-genitive-indefinite-singular":"necăsătorii","dative-definite-genitive-singular":"necăsătoriei","dative-genitive-indefinite-plural":"necăsătorii","dative-definite-genitive-plural":"necăsătoriilor","singular-vocative":"necăsătorie","plural-vocative":"necăsătoriilor"}},{"word":"necăsătorit","pos":"adj","definitions":["unmarried"],"forms":{"feminine-singular":"necăsătorită","masculine-plural":"necăsătoriți","feminine-neuter-plural":"necăsătorite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necăsătorit","error-unrecognized-form-feminine-indefinite-singular":"necăsătorită","error-unrecognized-form-indefinite-masculine-plural":"necăsătoriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"necăsătorite","definite-error-unrecognized-form-masculine-neuter-singular":"necăsătoritul","definite-error-unrecognized-form-feminine-singular":"necăsătorita","definite-error-unrecognized-form-masculine-plural":"necăsătoriții","definite-error-unrecognized-form-feminine-neuter-plural":"necăsătoritele"}},{"word":"necăsnicie","pos":"noun","definitions":["celibacy"],"forms":{"plural":"necăsnicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"necăsnicie","accusative-definite-nominative-singular":"necăsnicia","accusative-indefinite-nominative-plural":"necăsnicii","accusative-definite-nominative-plural":"necăsniciile","dative-genitive-indefinite-singular":"necăsnicii","dative-definite-genitive-singular":"necăsniciei","dative-genitive-indefinite-plural":"necăsnicii","dative-definite-genitive-plural":"necăsniciilor","singular-vocative":"necăsnicie","plural-vocative":"necăsniciilor"}},{"word":"necătură","pos":"noun","definitions":["suffocation","drowning"],"forms":{"plural":"necături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"necătură","accusative-definite-nominative-singular":"necătura","accusative-indefinite-nominative-plural":"necături","accusative-definite-nominative-plural":"necăturile","dative-genitive-indefinite-singular":"necături","dative-definite-genitive-singular":"necăturii","dative-genitive-indefinite-plural":"necături","dative-definite-genitive-plural":"necăturilor","singular-vocative":"necătură","plural-vocative":"necăturilor"}},{"word":"necaz","pos":"noun","definitions":["trouble, distress"],"examples":[{"ro":"Un necaz nu vine niciodată singur.","en":"When it rains, it pours."}],"forms":{"plural":"necazuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"necaz","accusative-definite-nominative-singular":"necazul","accusative-indefinite-nominative-plural":"necazuri","accusative-definite-nominative-plural":"necazurile","dative-genitive-indefinite-singular":"necaz","dative-definite-genitive-singular":"necazului","dative-genitive-indefinite-plural":"necazuri","dative-definite-genitive-plural":"necazurilor","singular-vocative":"necazule","plural-vocative":"necazurilor"}},{"word":"necazuri","pos":"noun","definitions":["plural of necaz"],"gender":"n-p"},{"word":"necăzut","pos":"adj","definitions":["not allowed"],"forms":{"feminine-singular":"necăzută","masculine-plural":"necăzuți","feminine-neuter-plural":"necăzute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necăzut","error-unrecognized-form-feminine-indefinite-singular":"necăzută","error-unrecognized-form-indefinite-masculine-plural":"necăzuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"necăzute","definite-error-unrecognized-form-masculine-neuter-singular":"necăzutul","definite-error-unrecognized-form-feminine-singular":"necăzuta","definite-error-unrecognized-form-masculine-plural":"necăzuții","definite-error-unrecognized-form-feminine-neuter-plural":"necăzutele"}},{"word":"necesar","pos":"adj","definitions":["necessary"],"pronunciation":"/ne.t͡ʃeˈsar/","forms":{"feminine-singular":"necesară","masculine-plural":"necesari","feminine-neuter-plural":"necesare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necesar","error-unrecognized-form-feminine-indefinite-singular":"necesară","error-unrecognized-form-indefinite-masculine-plural":"necesari","error-unrecognized-form-feminine-indefinite-neuter-plural":"necesare","definite-error-unrecognized-form-masculine-neuter-singular":"necesarul","definite-error-unrecognized-form-feminine-singular":"necesara","definite-error-unrecognized-form-masculine-plural":"necesarii","definite-error-unrecognized-form-feminine-neuter-plural":"necesarele"}},{"word":"necesarian","pos":"noun","definitions":["necessarian"],"forms":{"plural":"necesarieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"necesarian","accusative-definite-nominative-singular":"necesarianul","accusative-indefinite-nominative-plural":"necesarieni","accusative-definite-nominative-plural":"necesarienii","dative-genitive-indefinite-singular":"necesarian","dative-definite-genitive-singular":"necesarianului","dative-genitive-indefinite-plural":"necesarieni","dative-definite-genitive-plural":"necesarienilor","singular-vocative":"necesarianule","plural-vocative":"necesarienilor"}},{"word":"necesariană","pos":"noun","definitions":["female equivalent of necesarian"],"forms":{"plural":"necesariane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"necesariană","accusative-definite-nominative-singular":"necesariana","accusative-indefinite-nominative-plural":"necesariane","accusative-definite-nominative-plural":"necesarianele","dative-genitive-indefinite-singular":"necesariane","dative-definite-genitive-singular":"necesarianei","dative-genitive-indefinite-plural":"necesariane","dative-definite-genitive-plural":"necesarianelor","singular-vocative":"necesariană","plural-vocative":"necesarianelor"}},{"word":"necesarmente","pos":"adv","definitions":["necessarily"]},{"word":"necesita","pos":"verb","definitions":["to necessitate"],"pronunciation":"/ne.t͡ʃe.siˈta/","forms":{"canonical":"a necesita 1st conjugation","present-singular-third-person":"necesită","participle-past":"necesitat","subjunctive-third-person":"necesite","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a necesita","gerund":"necesitând","first-person-indicative-present-singular":"necesit","indicative-present-second-person-singular":"necesiți","indicative-present-singular-third-person":"necesită","first-person-indicative-plural-present":"necesităm","indicative-plural-present-second-person":"necesitați","indicative-plural-present-third-person":"necesită","first-person-imperfect-indicative-singular":"necesitam","imperfect-indicative-second-person-singular":"necesitai","imperfect-indicative-singular-third-person":"necesita","first-person-imperfect-indicative-plural":"necesitam","imperfect-indicative-plural-second-person":"necesitați","imperfect-indicative-plural-third-person":"necesitau","first-person-indicative-perfect-singular":"necesitai","indicative-perfect-second-person-singular":"necesitași","indicative-perfect-singular-third-person":"necesită","first-person-indicative-perfect-plural":"necesitarăm","indicative-perfect-plural-second-person":"necesitarăți","indicative-perfect-plural-third-person":"necesitară","first-person-indicative-pluperfect-singular":"necesitasem","indicative-pluperfect-second-person-singular":"necesitaseși","indicative-pluperfect-singular-third-person":"necesitase","first-person-indicative-pluperfect-plural":"necesitaserăm","indicative-pluperfect-plural-second-person":"necesitaserăți","indicative-pluperfect-plural-third-person":"necesitaseră","first-person-present-singular-subjunctive":"să necesit","present-second-person-singular-subjunctive":"să necesiți","present-singular-subjunctive-third-person":"să necesite","first-person-plural-present-subjunctive":"să necesităm","plural-present-second-person-subjunctive":"să necesitați","plural-present-subjunctive-third-person":"să necesite","imperative-second-person-singular":"necesită","imperative-plural-second-person":"necesitați","imperative-negative-second-person-singular":"nu necesita","imperative-negative-plural-second-person":"nu necesitați","alternative":"нечесита"}},{"word":"necesitate","pos":"noun","definitions":["necessity, need"],"pronunciation":"/ne.t͡ʃe.siˈta.te/","forms":{"plural":"necesități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative-singular":"necesitate","accusative-definite-nominative-singular":"necesitatea","accusative-indefinite-nominative-plural":"necesități","accusative-definite-nominative-plural":"necesitățile","dative-genitive-indefinite-singular":"necesități","dative-definite-genitive-singular":"necesității","dative-genitive-indefinite-plural":"necesități","dative-definite-genitive-plural":"necesităților","singular-vocative":"necesitate","plural-vocative":"necesităților","alternative":"нечеситате"}},{"word":"necestiv","pos":"noun","definitions":["unbeliever"],"forms":{"plural":"necestivi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"necestiv","accusative-definite-nominative-singular":"necestivul","accusative-indefinite-nominative-plural":"necestivi","accusative-definite-nominative-plural":"necestivii","dative-genitive-indefinite-singular":"necestiv","dative-definite-genitive-singular":"necestivului","dative-genitive-indefinite-plural":"necestivi","dative-definite-genitive-plural":"necestivilor","singular-vocative":"necestivule","plural-vocative":"necestivilor"}},{"word":"nechemat","pos":"noun","definitions":["uncalled"],"forms":{"plural":"nechemați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nechemat","accusative-definite-nominative-singular":"nechematul","accusative-indefinite-nominative-plural":"nechemați","accusative-definite-nominative-plural":"nechemații","dative-genitive-indefinite-singular":"nechemat","dative-definite-genitive-singular":"nechematului","dative-genitive-indefinite-plural":"nechemați","dative-definite-genitive-plural":"nechemaților","singular-vocative":"nechematule","plural-vocative":"nechemaților"}},{"word":"nechemată","pos":"noun","definitions":["female equivalent of nechemat"],"forms":{"plural":"nechemate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nechemată","accusative-definite-nominative-singular":"nechemata","accusative-indefinite-nominative-plural":"nechemate","accusative-definite-nominative-plural":"nechematele","dative-genitive-indefinite-singular":"nechemate","dative-definite-genitive-singular":"nechematei","dative-genitive-indefinite-plural":"nechemate","dative-definite-genitive-plural":"nechematelor","singular-vocative":"nechemată","plural-vocative":"nechematelor"}},{"word":"nechez","pos":"noun","definitions":["neigh"],"forms":{"plural":"nechezuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nechez","accusative-definite-nominative-singular":"nechezul","accusative-indefinite-nominative-plural":"nechezuri","accusative-definite-nominative-plural":"nechezurile","dative-genitive-indefinite-singular":"nechez","dative-definite-genitive-singular":"nechezului","dative-genitive-indefinite-plural":"nechezuri","dative-definite-genitive-plural":"nechezurilor","singular-vocative":"nechezule","plural-vocative":"nechezurilor"}},{"word":"necheza","pos":"verb","definitions":["to neigh","to laugh with a sound like a neigh"],"forms":{"canonical":"a necheza 1st conjugation","present-singular-third-person":"nechează","participle-past":"nechezat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a necheza","gerund":"nechezând","first-person-indicative-present-singular":"nechez","indicative-present-second-person-singular":"nechezi","indicative-present-singular-third-person":"nechează","first-person-indicative-plural-present":"nechezăm","indicative-plural-present-second-person":"nechezați","indicative-plural-present-third-person":"nechează","first-person-imperfect-indicative-singular":"nechezam","imperfect-indicative-second-person-singular":"nechezai","imperfect-indicative-singular-third-person":"necheza","first-person-imperfect-indicative-plural":"nechezam","imperfect-indicative-plural-second-person":"nechezați","imperfect-indicative-plural-third-person":"nechezau","first-person-indicative-perfect-singular":"nechezai","indicative-perfect-second-person-singular":"nechezași","indicative-perfect-singular-third-person":"necheză","first-person-indicative-perfect-plural":"nechezarăm","indicative-perfect-plural-second-person":"nechezarăți","indicative-perfect-plural-third-person":"nechezară","first-person-indicative-pluperfect-singular":"nechezasem","indicative-pluperfect-second-person-singular":"nechezaseși","indicative-pluperfect-singular-third-person":"nechezase","first-person-indicative-pluperfect-plural":"nechezaserăm","indicative-pluperfect-plural-second-person":"nechezaserăți","indicative-pluperfect-plural-third-person":"nechezaseră","first-person-present-singular-subjunctive":"să nechez","present-second-person-singular-subjunctive":"să nechezi","present-singular-subjunctive-third-person":"să necheze","first-person-plural-present-subjunctive":"să nechezăm","plural-present-second-person-subjunctive":"să nechezați","plural-present-subjunctive-third-person":"să necheze","imperative-second-person-singular":"nechează","imperative-plural-second-person":"nechezați","imperative-negative-second-person-singular":"nu necheza","imperative-negative-plural-second-person":"nu nechezați","alternative":"nincheza"}},{"word":"nechezare","pos":"noun","definitions":["neigh (cry of a horse)"],"forms":{"plural":"nechezări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nechezare","accusative-definite-nominative-singular":"nechezarea","accusative-indefinite-nominative-plural":"nechezări","accusative-definite-nominative-plural":"nechezările","dative-genitive-indefinite-singular":"nechezări","dative-definite-genitive-singular":"nechezării","dative-genitive-indefinite-plural":"nechezări","dative-definite-genitive-plural":"nechezărilor","singular-vocative":"nechezare","plural-vocative":"nechezărilor"}},{"word":"nechezat","pos":"noun","definitions":["neigh"],"forms":{"plural":"nechezaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nechezat","accusative-definite-nominative-singular":"nechezatul","accusative-indefinite-nominative-plural":"nechezaturi","accusative-definite-nominative-plural":"nechezaturile","dative-genitive-indefinite-singular":"nechezat","dative-definite-genitive-singular":"nechezatului","dative-genitive-indefinite-plural":"nechezaturi","dative-definite-genitive-plural":"nechezaturilor","singular-vocative":"nechezatule","plural-vocative":"nechezaturilor"}},{"word":"nechezător","pos":"adj","definitions":["neighing"],"forms":{"feminine-singular":"nechezătoare","masculine-plural":"nechezători","feminine-neuter-plural":"nechezătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nechezător","error-unrecognized-form-feminine-indefinite-singular":"nechezătoare","error-unrecognized-form-indefinite-masculine-plural":"nechezători","error-unrecognized-form-feminine-indefinite-neuter-plural":"nechezătoare","definite-error-unrecognized-form-masculine-neuter-singular":"nechezătorul","definite-error-unrecognized-form-feminine-singular":"nechezătoarea","definite-error-unrecognized-form-masculine-plural":"nechezătorii","definite-error-unrecognized-form-feminine-neuter-plural":"nechezătoarele"}},{"word":"nechezătură","pos":"noun","definitions":["neigh"],"forms":{"plural":"nechezături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"nechezătură","accusative-definite-nominative-singular":"nechezătura","accusative-indefinite-nominative-plural":"nechezături","accusative-definite-nominative-plural":"nechezăturile","dative-genitive-indefinite-singular":"nechezături","dative-definite-genitive-singular":"nechezăturii","dative-genitive-indefinite-plural":"nechezături","dative-definite-genitive-plural":"nechezăturilor","singular-vocative":"nechezătură","plural-vocative":"nechezăturilor"}},{"word":"nechezet","pos":"noun","definitions":["neigh"],"forms":{"plural":"nechezete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nechezet","accusative-definite-nominative-singular":"nechezetul","accusative-indefinite-nominative-plural":"nechezete","accusative-definite-nominative-plural":"nechezetele","dative-genitive-indefinite-singular":"nechezet","dative-definite-genitive-singular":"nechezetului","dative-genitive-indefinite-plural":"nechezete","dative-definite-genitive-plural":"nechezetelor","singular-vocative":"nechezetule","plural-vocative":"nechezetelor"}},{"word":"nechezol","pos":"noun","definitions":["ersatz coffee"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nechezol","accusative-definite-nominative":"nechezolul","dative-genitive-indefinite":"nechezol","dative-definite-genitive":"nechezolului","vocative":"nechezolule"}},{"word":"nechibzuință","pos":"noun","definitions":["recklessness","act of recklessness"],"pronunciation":"/ˌne.kib.zu.ˈin.t͡sə/","forms":{"plural":"nechibzuințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nechbzuință","accusative-definite-nominative-singular":"nechbzuința","accusative-indefinite-nominative-plural":"nechbzuințe","accusative-definite-nominative-plural":"nechbzuințele","dative-genitive-indefinite-singular":"nechbzuințe","dative-definite-genitive-singular":"nechbzuinței","dative-genitive-indefinite-plural":"nechbzuințe","dative-definite-genitive-plural":"nechbzuințelor","singular-vocative":"nechbzuință","plural-vocative":"nechbzuințelor"}},{"word":"nechibzuit","pos":"adj","definitions":["reckless","ill-conceived, misguided, unplanned"],"pronunciation":"/ne.kib.zuˈit/","forms":{"feminine-singular":"nechibzuită","masculine-plural":"nechibzuiți","feminine-neuter-plural":"nechibzuite","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"nechibzuit","error-unrecognized-form-feminine-indefinite-singular":"nechibzuită","error-unrecognized-form-indefinite-masculine-plural":"nechibzuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nechibzuite","definite-error-unrecognized-form-masculine-neuter-singular":"nechibzuitul","definite-error-unrecognized-form-feminine-singular":"nechibzuita","definite-error-unrecognized-form-masculine-plural":"nechibzuiții","definite-error-unrecognized-form-feminine-neuter-plural":"nechibzuitele"}},{"word":"Nechiforel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nechiforel"}},{"word":"Nechiforescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nechiforescu"}},{"word":"Nechiforoae","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Nechiforoae"}},{"word":"Nechit","pos":"name","definitions":["a village in Borlești, Neamț County, Romania"],"gender":"m"},{"word":"Nechitescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nechitescu"}},{"word":"nechitit","pos":"adj","definitions":["thoughtless"],"forms":{"feminine-singular":"nechitită","masculine-plural":"nechitiți","feminine-neuter-plural":"nechitite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nechitit","error-unrecognized-form-feminine-indefinite-singular":"nechitită","error-unrecognized-form-indefinite-masculine-plural":"nechitiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nechitite","definite-error-unrecognized-form-masculine-neuter-singular":"nechititul","definite-error-unrecognized-form-feminine-singular":"nechitita","definite-error-unrecognized-form-masculine-plural":"nechitiții","definite-error-unrecognized-form-feminine-neuter-plural":"nechititele"}},{"word":"Nechitoae","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Nechitoae"}},{"word":"Nechitoaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Nechitoaia"}},{"word":"Nechițoaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Nechițoaia"}},{"word":"Nechituș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nechituș"}},{"word":"Nechizel","pos":"name","definitions":["a river in Neamț County, Romania, tributary to the Nechitu"],"gender":"m"},{"word":"necicatrizat","pos":"adj","definitions":["unhealed (about a wound)"],"forms":{"feminine-singular":"necicatrizată","masculine-plural":"necicatrizați","feminine-neuter-plural":"necicatrizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necicatrizat","error-unrecognized-form-feminine-indefinite-singular":"necicatrizată","error-unrecognized-form-indefinite-masculine-plural":"necicatrizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"necicatrizate","definite-error-unrecognized-form-masculine-neuter-singular":"necicatrizatul","definite-error-unrecognized-form-feminine-singular":"necicatrizata","definite-error-unrecognized-form-masculine-plural":"necicatrizații","definite-error-unrecognized-form-feminine-neuter-plural":"necicatrizatele"}},{"word":"necinste","pos":"noun","definitions":["dishonesty"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"necinste","accusative-definite-nominative":"necinstea","dative-genitive-indefinite":"necinsti","dative-definite-genitive":"necinstii","vocative":"necinste"}},{"word":"necinsti","pos":"verb","definitions":["to dishonor"],"forms":{"canonical":"a necinsti 4th conjugation","present-singular-third-person":"necinstește","participle-past":"necinstit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a necinsti","gerund":"necinstind","first-person-indicative-present-singular":"necinstesc","indicative-present-second-person-singular":"necinstești","indicative-present-singular-third-person":"necinstește","first-person-indicative-plural-present":"necinstim","indicative-plural-present-second-person":"necinstiți","indicative-plural-present-third-person":"necinstesc","first-person-imperfect-indicative-singular":"necinsteam","imperfect-indicative-second-person-singular":"necinsteai","imperfect-indicative-singular-third-person":"necinstea","first-person-imperfect-indicative-plural":"necinsteam","imperfect-indicative-plural-second-person":"necinsteați","imperfect-indicative-plural-third-person":"necinsteau","first-person-indicative-perfect-singular":"necinstii","indicative-perfect-second-person-singular":"necinstiși","indicative-perfect-singular-third-person":"necinsti","first-person-indicative-perfect-plural":"necinstirăm","indicative-perfect-plural-second-person":"necinstirăți","indicative-perfect-plural-third-person":"necinstiră","first-person-indicative-pluperfect-singular":"necinstisem","indicative-pluperfect-second-person-singular":"necinstiseși","indicative-pluperfect-singular-third-person":"necinstise","first-person-indicative-pluperfect-plural":"necinstiserăm","indicative-pluperfect-plural-second-person":"necinstiserăți","indicative-pluperfect-plural-third-person":"necinstiseră","first-person-present-singular-subjunctive":"să necinstesc","present-second-person-singular-subjunctive":"să necinstești","present-singular-subjunctive-third-person":"să necinstească","first-person-plural-present-subjunctive":"să necinstim","plural-present-second-person-subjunctive":"să necinstiți","plural-present-subjunctive-third-person":"să necinstească","imperative-second-person-singular":"necinstește","imperative-plural-second-person":"necinstiți","imperative-negative-second-person-singular":"nu necinsti","imperative-negative-plural-second-person":"nu necinstiți"}},{"word":"necinstire","pos":"noun","definitions":["dishonouring","rape"],"forms":{"plural":"necinstiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"necinstire","accusative-definite-nominative-singular":"necinstirea","accusative-indefinite-nominative-plural":"necinstiri","accusative-definite-nominative-plural":"necinstirile","dative-genitive-indefinite-singular":"necinstiri","dative-definite-genitive-singular":"necinstirii","dative-genitive-indefinite-plural":"necinstiri","dative-definite-genitive-plural":"necinstirilor","singular-vocative":"necinstire","plural-vocative":"necinstirilor"}},{"word":"necinstit","pos":"adj","definitions":["dishonest"],"pronunciation":"/ˌne.t͡ʃinˈstit/","forms":{"feminine-singular":"necinstită","masculine-plural":"necinstiți","feminine-neuter-plural":"necinstite","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"necinstit","error-unrecognized-form-feminine-indefinite-singular":"necinstită","error-unrecognized-form-indefinite-masculine-plural":"necinstiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"necinstite","definite-error-unrecognized-form-masculine-neuter-singular":"necinstitul","definite-error-unrecognized-form-feminine-singular":"necinstita","definite-error-unrecognized-form-masculine-plural":"necinstiții","definite-error-unrecognized-form-feminine-neuter-plural":"necinstitele"}},{"word":"necinstitor","pos":"adj","definitions":["dishonourable"],"forms":{"feminine-singular":"necinstitoare","masculine-plural":"necinstitori","feminine-neuter-plural":"necinstitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necinstitor","error-unrecognized-form-feminine-indefinite-singular":"necinstitoare","error-unrecognized-form-indefinite-masculine-plural":"necinstitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"necinstitoare","definite-error-unrecognized-form-masculine-neuter-singular":"necinstitorul","definite-error-unrecognized-form-feminine-singular":"necinstitoarea","definite-error-unrecognized-form-masculine-plural":"necinstitorii","definite-error-unrecognized-form-feminine-neuter-plural":"necinstitoarele"}},{"word":"necioplire","pos":"noun","definitions":["rudeness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"necioplire","accusative-definite-nominative":"necioplirea","dative-genitive-indefinite":"necioplire","dative-definite-genitive":"necioplirei","vocative":"necioplire"}},{"word":"necioplit","pos":"adj","definitions":["unrefined, unpolished, agrestic","boorish, oafish, graceless, bad-mannered"],"forms":{"feminine-singular":"necioplită","masculine-plural":"neciopliți","feminine-neuter-plural":"necioplite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necioplit","error-unrecognized-form-feminine-indefinite-singular":"necioplită","error-unrecognized-form-indefinite-masculine-plural":"neciopliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"necioplite","definite-error-unrecognized-form-masculine-neuter-singular":"necioplitul","definite-error-unrecognized-form-feminine-singular":"necioplita","definite-error-unrecognized-form-masculine-plural":"neciopliții","definite-error-unrecognized-form-feminine-neuter-plural":"necioplitele"}},{"word":"necioplit","pos":"noun","definitions":["boor, oaf"],"forms":{"plural":"neciopliți"}},{"word":"neciteț","pos":"adj","definitions":["illegible"],"forms":{"feminine-singular":"neciteață","masculine-plural":"neciteți","feminine-neuter-plural":"necitețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neciteț","error-unrecognized-form-feminine-indefinite-singular":"neciteață","error-unrecognized-form-indefinite-masculine-plural":"neciteți","error-unrecognized-form-feminine-indefinite-neuter-plural":"necitețe","definite-error-unrecognized-form-masculine-neuter-singular":"necitețul","definite-error-unrecognized-form-feminine-singular":"neciteața","definite-error-unrecognized-form-masculine-plural":"neciteții","definite-error-unrecognized-form-feminine-neuter-plural":"necitețele"}},{"word":"necivilizat","pos":"adj","definitions":["uncivilized"],"forms":{"feminine-singular":"necivilizată","masculine-plural":"necivilizați","feminine-neuter-plural":"necivilizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necivilizat","error-unrecognized-form-feminine-indefinite-singular":"necivilizată","error-unrecognized-form-indefinite-masculine-plural":"necivilizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"necivilizate","definite-error-unrecognized-form-masculine-neuter-singular":"necivilizatul","definite-error-unrecognized-form-feminine-singular":"necivilizata","definite-error-unrecognized-form-masculine-plural":"necivilizații","definite-error-unrecognized-form-feminine-neuter-plural":"necivilizatele"}},{"word":"neclar","pos":"adj","definitions":["unclear, hazy"],"forms":{"feminine-singular":"neclară","masculine-plural":"neclari","feminine-neuter-plural":"neclare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neclar","error-unrecognized-form-feminine-indefinite-singular":"neclară","error-unrecognized-form-indefinite-masculine-plural":"neclari","error-unrecognized-form-feminine-indefinite-neuter-plural":"neclare","definite-error-unrecognized-form-masculine-neuter-singular":"neclarul","definite-error-unrecognized-form-feminine-singular":"neclara","definite-error-unrecognized-form-masculine-plural":"neclarii","definite-error-unrecognized-form-feminine-neuter-plural":"neclarele"}},{"word":"neclaritate","pos":"noun","definitions":["vagueness"],"forms":{"plural":"neclarități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neclaritate","accusative-definite-nominative-singular":"neclaritatea","accusative-indefinite-nominative-plural":"neclarități","accusative-definite-nominative-plural":"neclaritățile","dative-genitive-indefinite-singular":"neclarități","dative-definite-genitive-singular":"neclarității","dative-genitive-indefinite-plural":"neclarități","dative-definite-genitive-plural":"neclarităților","singular-vocative":"neclaritate","plural-vocative":"neclarităților"}},{"word":"neclătit","pos":"adj","definitions":["unwashed (about objects)"],"forms":{"feminine-singular":"neclătită","masculine-plural":"neclătiți","feminine-neuter-plural":"neclătite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neclătit","error-unrecognized-form-feminine-indefinite-singular":"neclătită","error-unrecognized-form-indefinite-masculine-plural":"neclătiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neclătite","definite-error-unrecognized-form-masculine-neuter-singular":"neclătitul","definite-error-unrecognized-form-feminine-singular":"neclătita","definite-error-unrecognized-form-masculine-plural":"neclătiții","definite-error-unrecognized-form-feminine-neuter-plural":"neclătitele"}},{"word":"neclintire","pos":"noun","definitions":["firmness"],"forms":{"plural":"neclintiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neclintire","accusative-definite-nominative-singular":"neclintirea","accusative-indefinite-nominative-plural":"neclintiri","accusative-definite-nominative-plural":"neclintirile","dative-genitive-indefinite-singular":"neclintiri","dative-definite-genitive-singular":"neclintirii","dative-genitive-indefinite-plural":"neclintiri","dative-definite-genitive-plural":"neclintirilor","singular-vocative":"neclintire","plural-vocative":"neclintirilor"}},{"word":"neclintit","pos":"adj","definitions":["firm"],"forms":{"feminine-singular":"neclintită","masculine-plural":"neclintiți","feminine-neuter-plural":"neclintite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neclintit","error-unrecognized-form-feminine-indefinite-singular":"neclintită","error-unrecognized-form-indefinite-masculine-plural":"neclintiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neclintite","definite-error-unrecognized-form-masculine-neuter-singular":"neclintitul","definite-error-unrecognized-form-feminine-singular":"neclintita","definite-error-unrecognized-form-masculine-plural":"neclintiții","definite-error-unrecognized-form-feminine-neuter-plural":"neclintitele"}},{"word":"Necoară","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Necoară"}},{"word":"Necolaiciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Necolaiciuc"}},{"word":"necombatant","pos":"adj","definitions":["non-combatant"],"forms":{"feminine-singular":"necombatantă","masculine-plural":"necombatanți","feminine-neuter-plural":"necombatante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necombatant","error-unrecognized-form-feminine-indefinite-singular":"necombatantă","error-unrecognized-form-indefinite-masculine-plural":"necombatanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"necombatante","definite-error-unrecognized-form-masculine-neuter-singular":"necombatantul","definite-error-unrecognized-form-feminine-singular":"necombatanta","definite-error-unrecognized-form-masculine-plural":"necombatanții","definite-error-unrecognized-form-feminine-neuter-plural":"necombatantele"}},{"word":"necombatant","pos":"noun","definitions":["non-combatant"],"forms":{"plural":"necombatanți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"necombatant","accusative-definite-nominative-singular":"necombatantul","accusative-indefinite-nominative-plural":"necombatanți","accusative-definite-nominative-plural":"necombatanții","dative-genitive-indefinite-singular":"necombatant","dative-definite-genitive-singular":"necombatantului","dative-genitive-indefinite-plural":"necombatanți","dative-definite-genitive-plural":"necombatanților","singular-vocative":"necombatantule","plural-vocative":"necombatanților"}},{"word":"necombustibil","pos":"adj","definitions":["incombustible"],"forms":{"feminine-singular":"necombustibilă","masculine-plural":"necombustibili","feminine-neuter-plural":"necombustibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necombustibil","error-unrecognized-form-feminine-indefinite-singular":"necombustibilă","error-unrecognized-form-indefinite-masculine-plural":"necombustibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"necombustibile","definite-error-unrecognized-form-masculine-neuter-singular":"necombustibilul","definite-error-unrecognized-form-feminine-singular":"necombustibila","definite-error-unrecognized-form-masculine-plural":"necombustibilii","definite-error-unrecognized-form-feminine-neuter-plural":"necombustibilele"}},{"word":"necomercial","pos":"adj","definitions":["noncommercial"],"forms":{"feminine-singular":"necomercială","masculine-plural":"necomerciali","feminine-neuter-plural":"necomerciale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necomercial","error-unrecognized-form-feminine-indefinite-singular":"necomercială","error-unrecognized-form-indefinite-masculine-plural":"necomerciali","error-unrecognized-form-feminine-indefinite-neuter-plural":"necomerciale","definite-error-unrecognized-form-masculine-neuter-singular":"necomercialul","definite-error-unrecognized-form-feminine-singular":"necomerciala","definite-error-unrecognized-form-masculine-plural":"necomercialii","definite-error-unrecognized-form-feminine-neuter-plural":"necomercialele"}},{"word":"necomestibil","pos":"adj","definitions":["inedible"],"forms":{"feminine-singular":"necomestibilă","masculine-plural":"necomestibili","feminine-neuter-plural":"necomestibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necomestibil","error-unrecognized-form-feminine-indefinite-singular":"necomestibilă","error-unrecognized-form-indefinite-masculine-plural":"necomestibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"necomestibile","definite-error-unrecognized-form-masculine-neuter-singular":"necomestibilul","definite-error-unrecognized-form-feminine-singular":"necomestibila","definite-error-unrecognized-form-masculine-plural":"necomestibilii","definite-error-unrecognized-form-feminine-neuter-plural":"necomestibilele"}},{"word":"necomparabil","pos":"adj","definitions":["incomparable (not comparable)"],"forms":{"feminine-singular":"necomparabilă","masculine-plural":"necomparabili","feminine-neuter-plural":"necomparabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necomparabil","error-unrecognized-form-feminine-indefinite-singular":"necomparabilă","error-unrecognized-form-indefinite-masculine-plural":"necomparabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"necomparabile","definite-error-unrecognized-form-masculine-neuter-singular":"necomparabilul","definite-error-unrecognized-form-feminine-singular":"necomparabila","definite-error-unrecognized-form-masculine-plural":"necomparabilii","definite-error-unrecognized-form-feminine-neuter-plural":"necomparabilele"}},{"word":"necompatibil","pos":"adj","definitions":["noncompatible"],"forms":{"feminine-singular":"necompatibilă","masculine-plural":"necompatibili","feminine-neuter-plural":"necompatibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necompatibil","error-unrecognized-form-feminine-indefinite-singular":"necompatibilă","error-unrecognized-form-indefinite-masculine-plural":"necompatibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"necompatibile","definite-error-unrecognized-form-masculine-neuter-singular":"necompatibilul","definite-error-unrecognized-form-feminine-singular":"necompatibila","definite-error-unrecognized-form-masculine-plural":"necompatibilii","definite-error-unrecognized-form-feminine-neuter-plural":"necompatibilele"}},{"word":"necompatibilitate","pos":"noun","definitions":["incompatibility"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"necompatibilitate","accusative-definite-nominative":"necompatibilitatea","dative-genitive-indefinite":"necompatibilități","dative-definite-genitive":"necompatibilității","vocative":"-"}},{"word":"necompetent","pos":"adj","definitions":["incompetent, unqualified","not having the jurisdiction"],"forms":{"feminine-singular":"necompetentă","masculine-plural":"necompetenți","feminine-neuter-plural":"necompetente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necompetent","error-unrecognized-form-feminine-indefinite-singular":"necompetentă","error-unrecognized-form-indefinite-masculine-plural":"necompetenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"necompetente","definite-error-unrecognized-form-masculine-neuter-singular":"necompetentul","definite-error-unrecognized-form-feminine-singular":"necompetenta","definite-error-unrecognized-form-masculine-plural":"necompetenții","definite-error-unrecognized-form-feminine-neuter-plural":"necompetentele"}},{"word":"necomplect","pos":"adj","definitions":["alternative form of necomplet"],"forms":{"feminine-singular":"necomplectă","masculine-plural":"necomplecți","feminine-neuter-plural":"necomplecte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necomplect","error-unrecognized-form-feminine-indefinite-singular":"necomplectă","error-unrecognized-form-indefinite-masculine-plural":"necomplecți","error-unrecognized-form-feminine-indefinite-neuter-plural":"necomplecte","definite-error-unrecognized-form-masculine-neuter-singular":"necomplectul","definite-error-unrecognized-form-feminine-singular":"necomplecta","definite-error-unrecognized-form-masculine-plural":"necomplecții","definite-error-unrecognized-form-feminine-neuter-plural":"necomplectele"}},{"word":"necomplet","pos":"adj","definitions":["incomplete"],"forms":{"feminine-singular":"necompletă","masculine-plural":"necompleți","feminine-neuter-plural":"necomplete","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necomplet","error-unrecognized-form-feminine-indefinite-singular":"necompletă","error-unrecognized-form-indefinite-masculine-plural":"necompleți","error-unrecognized-form-feminine-indefinite-neuter-plural":"necomplete","definite-error-unrecognized-form-masculine-neuter-singular":"necompletul","definite-error-unrecognized-form-feminine-singular":"necompleta","definite-error-unrecognized-form-masculine-plural":"necompleții","definite-error-unrecognized-form-feminine-neuter-plural":"necompletele"}},{"word":"necomplicat","pos":"adj","definitions":["uncomplicated, simple"],"pronunciation":"/ˌne.kom.pliˈkat/","forms":{"feminine-singular":"necomplicată","masculine-plural":"necomplicați","feminine-neuter-plural":"necomplicate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necomplicat","error-unrecognized-form-feminine-indefinite-singular":"necomplicată","error-unrecognized-form-indefinite-masculine-plural":"necomplicați","error-unrecognized-form-feminine-indefinite-neuter-plural":"necomplicate","definite-error-unrecognized-form-masculine-neuter-singular":"necomplicatul","definite-error-unrecognized-form-feminine-singular":"necomplicata","definite-error-unrecognized-form-masculine-plural":"necomplicații","definite-error-unrecognized-form-feminine-neuter-plural":"necomplicatele"}},{"word":"necompresibil","pos":"adj","definitions":["incompressible"],"forms":{"feminine-singular":"necompresibilă","masculine-plural":"necompresibili","feminine-neuter-plural":"necompresibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necompresibil","error-unrecognized-form-feminine-indefinite-singular":"necompresibilă","error-unrecognized-form-indefinite-masculine-plural":"necompresibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"necompresibile","definite-error-unrecognized-form-masculine-neuter-singular":"necompresibilul","definite-error-unrecognized-form-feminine-singular":"necompresibila","definite-error-unrecognized-form-masculine-plural":"necompresibilii","definite-error-unrecognized-form-feminine-neuter-plural":"necompresibilele"}},{"word":"necompresibilitate","pos":"noun","definitions":["incompressibility"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"necompresibilitate","accusative-definite-nominative":"necompresibilitatea","dative-genitive-indefinite":"necompresibilități","dative-definite-genitive":"necompresibilității","vocative":"necompresibilitate"}},{"word":"necomunicat","pos":"adj","definitions":["uncommunicated"],"pronunciation":"/ˌne.koˌmu.niˈkat/","forms":{"feminine-singular":"necomunicată","masculine-plural":"necomunicați","feminine-neuter-plural":"necomunicate","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"necomunicat","error-unrecognized-form-feminine-indefinite-singular":"necomunicată","error-unrecognized-form-indefinite-masculine-plural":"necomunicați","error-unrecognized-form-feminine-indefinite-neuter-plural":"necomunicate","definite-error-unrecognized-form-masculine-neuter-singular":"necomunicatul","definite-error-unrecognized-form-feminine-singular":"necomunicata","definite-error-unrecognized-form-masculine-plural":"necomunicații","definite-error-unrecognized-form-feminine-neuter-plural":"necomunicatele"}},{"word":"necomunicativ","pos":"adj","definitions":["uncommunicative"],"forms":{"feminine-singular":"necomunicativă","masculine-plural":"necomunicativi","feminine-neuter-plural":"necomunicative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necomunicativ","error-unrecognized-form-feminine-indefinite-singular":"necomunicativă","error-unrecognized-form-indefinite-masculine-plural":"necomunicativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"necomunicative","definite-error-unrecognized-form-masculine-neuter-singular":"necomunicativul","definite-error-unrecognized-form-feminine-singular":"necomunicativa","definite-error-unrecognized-form-masculine-plural":"necomunicativii","definite-error-unrecognized-form-feminine-neuter-plural":"necomunicativele"}},{"word":"necomutabil","pos":"adj","definitions":["incommutable"],"pronunciation":"/ˌne.ko.muˈta.bil/","forms":{"feminine-singular":"necomutabilă","masculine-plural":"necomutabili","feminine-neuter-plural":"necomutabile","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"necomutabil","error-unrecognized-form-feminine-indefinite-singular":"necomutabilă","error-unrecognized-form-indefinite-masculine-plural":"necomutabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"necomutabile","definite-error-unrecognized-form-masculine-neuter-singular":"necomutabilul","definite-error-unrecognized-form-feminine-singular":"necomutabila","definite-error-unrecognized-form-masculine-plural":"necomutabilii","definite-error-unrecognized-form-feminine-neuter-plural":"necomutabilele"}},{"word":"neconciliabil","pos":"adj","definitions":["irreconcilable"],"forms":{"feminine-singular":"neconciliabilă","masculine-plural":"neconciliabili","feminine-neuter-plural":"neconciliabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neconciliabil","error-unrecognized-form-feminine-indefinite-singular":"neconciliabilă","error-unrecognized-form-indefinite-masculine-plural":"neconciliabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neconciliabile","definite-error-unrecognized-form-masculine-neuter-singular":"neconciliabilul","definite-error-unrecognized-form-feminine-singular":"neconciliabila","definite-error-unrecognized-form-masculine-plural":"neconciliabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neconciliabilele"}},{"word":"neconcludent","pos":"adj","definitions":["inconclusive"],"forms":{"feminine-singular":"neconcludentă","masculine-plural":"neconcludenți","feminine-neuter-plural":"neconcludente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neconcludent","error-unrecognized-form-feminine-indefinite-singular":"neconcludentă","error-unrecognized-form-indefinite-masculine-plural":"neconcludenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neconcludente","definite-error-unrecognized-form-masculine-neuter-singular":"neconcludentul","definite-error-unrecognized-form-feminine-singular":"neconcludenta","definite-error-unrecognized-form-masculine-plural":"neconcludenții","definite-error-unrecognized-form-feminine-neuter-plural":"neconcludentele"}},{"word":"neconcordant","pos":"adj","definitions":["inconsistent"],"forms":{"feminine-singular":"neconcordantă","masculine-plural":"neconcordanți","feminine-neuter-plural":"neconcordante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neconcordant","error-unrecognized-form-feminine-indefinite-singular":"neconcordantă","error-unrecognized-form-indefinite-masculine-plural":"neconcordanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neconcordante","definite-error-unrecognized-form-masculine-neuter-singular":"neconcordantul","definite-error-unrecognized-form-feminine-singular":"neconcordanta","definite-error-unrecognized-form-masculine-plural":"neconcordanții","definite-error-unrecognized-form-feminine-neuter-plural":"neconcordantele"}},{"word":"necondiționat","pos":"adj","definitions":["unconditioned, unconditional"],"forms":{"feminine-singular":"necondiționată","masculine-plural":"necondiționați","feminine-neuter-plural":"necondiționate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necondiționat","error-unrecognized-form-feminine-indefinite-singular":"necondiționată","error-unrecognized-form-indefinite-masculine-plural":"necondiționați","error-unrecognized-form-feminine-indefinite-neuter-plural":"necondiționate","definite-error-unrecognized-form-masculine-neuter-singular":"necondiționatul","definite-error-unrecognized-form-feminine-singular":"necondiționata","definite-error-unrecognized-form-masculine-plural":"necondiționații","definite-error-unrecognized-form-feminine-neuter-plural":"necondiționatele"}},{"word":"necondiționat","pos":"adv","definitions":["unconditionally"]},{"word":"neconformism","pos":"noun","definitions":["nonconformism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neconformism","accusative-definite-nominative":"neconformismul","dative-genitive-indefinite":"neconformism","dative-definite-genitive":"neconformismului","vocative":"neconformismule"}},{"word":"neconformist","pos":"noun","definitions":["nonconformist"],"forms":{"plural":"neconformiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neconformist","accusative-definite-nominative-singular":"neconformistul","accusative-indefinite-nominative-plural":"neconformiști","accusative-definite-nominative-plural":"neconformiștii","dative-genitive-indefinite-singular":"neconformist","dative-definite-genitive-singular":"neconformistului","dative-genitive-indefinite-plural":"neconformiști","dative-definite-genitive-plural":"neconformiștilor","singular-vocative":"neconformistule","plural-vocative":"neconformiștilor"}},{"word":"neconformistă","pos":"noun","definitions":["female equivalent of neconformist"],"forms":{"plural":"neconformiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neconformistă","accusative-definite-nominative-singular":"neconformista","accusative-indefinite-nominative-plural":"neconformiste","accusative-definite-nominative-plural":"neconformistele","dative-genitive-indefinite-singular":"neconformiste","dative-definite-genitive-singular":"neconformistei","dative-genitive-indefinite-plural":"neconformiste","dative-definite-genitive-plural":"neconformistelor","singular-vocative":"neconformistă","plural-vocative":"neconformistelor"}},{"word":"neconfortabil","pos":"adj","definitions":["uncomfortable"],"forms":{"feminine-singular":"neconfortabilă","masculine-plural":"neconfortabili","feminine-neuter-plural":"neconfortabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neconfortabil","error-unrecognized-form-feminine-indefinite-singular":"neconfortabilă","error-unrecognized-form-indefinite-masculine-plural":"neconfortabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neconfortabile","definite-error-unrecognized-form-masculine-neuter-singular":"neconfortabilul","definite-error-unrecognized-form-feminine-singular":"neconfortabila","definite-error-unrecognized-form-masculine-plural":"neconfortabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neconfortabilele"}},{"word":"necongelat","pos":"adj","definitions":["uncongealed, unfrozen"],"pronunciation":"/ˌne.kon.d͡ʒeˈlat/","forms":{"feminine-singular":"necongelată","masculine-plural":"necongelați","feminine-neuter-plural":"necongelate","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"necongelat","error-unrecognized-form-feminine-indefinite-singular":"necongelată","error-unrecognized-form-indefinite-masculine-plural":"necongelați","error-unrecognized-form-feminine-indefinite-neuter-plural":"necongelate","definite-error-unrecognized-form-masculine-neuter-singular":"necongelatul","definite-error-unrecognized-form-feminine-singular":"necongelata","definite-error-unrecognized-form-masculine-plural":"necongelații","definite-error-unrecognized-form-feminine-neuter-plural":"necongelatele"}},{"word":"neconsecință","pos":"noun","definitions":["inconsistency"],"forms":{"plural":"neconsecințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neconsecință","accusative-definite-nominative-singular":"neconsecința","accusative-indefinite-nominative-plural":"neconsecințe","accusative-definite-nominative-plural":"neconsecințele","dative-genitive-indefinite-singular":"neconsecințe","dative-definite-genitive-singular":"neconsecinței","dative-genitive-indefinite-plural":"neconsecințe","dative-definite-genitive-plural":"neconsecințelor","singular-vocative":"neconsecință","plural-vocative":"neconsecințelor"}},{"word":"neconsecvent","pos":"adj","definitions":["inconsistent"],"forms":{"feminine-singular":"neconsecventă","masculine-plural":"neconsecvenți","feminine-neuter-plural":"neconsecvente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neconsecvent","error-unrecognized-form-feminine-indefinite-singular":"neconsecventă","error-unrecognized-form-indefinite-masculine-plural":"neconsecvenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neconsecvente","definite-error-unrecognized-form-masculine-neuter-singular":"neconsecventul","definite-error-unrecognized-form-feminine-singular":"neconsecventa","definite-error-unrecognized-form-masculine-plural":"neconsecvenții","definite-error-unrecognized-form-feminine-neuter-plural":"neconsecventele"}},{"word":"neconsecvență","pos":"noun","definitions":["inconsistence"],"forms":{"plural":"neconsecvențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neconsecvență","accusative-definite-nominative-singular":"neconsecvența","accusative-indefinite-nominative-plural":"neconsecvențe","accusative-definite-nominative-plural":"neconsecvențele","dative-genitive-indefinite-singular":"neconsecvențe","dative-definite-genitive-singular":"neconsecvenței","dative-genitive-indefinite-plural":"neconsecvențe","dative-definite-genitive-plural":"neconsecvențelor","singular-vocative":"neconsecvență","plural-vocative":"neconsecvențelor"}},{"word":"neconsistent","pos":"adj","definitions":["inconsistent"],"forms":{"feminine-singular":"neconsistentă","masculine-plural":"neconsistenți","feminine-neuter-plural":"neconsistente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neconsistent","error-unrecognized-form-feminine-indefinite-singular":"neconsistentă","error-unrecognized-form-indefinite-masculine-plural":"neconsistenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neconsistente","definite-error-unrecognized-form-masculine-neuter-singular":"neconsistentul","definite-error-unrecognized-form-feminine-singular":"neconsistenta","definite-error-unrecognized-form-masculine-plural":"neconsistenții","definite-error-unrecognized-form-feminine-neuter-plural":"neconsistentele"}},{"word":"neconsolabil","pos":"adj","definitions":["inconsolable"],"forms":{"feminine-singular":"neconsolabilă","masculine-plural":"neconsolabili","feminine-neuter-plural":"neconsolabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neconsolabil","error-unrecognized-form-feminine-indefinite-singular":"neconsolabilă","error-unrecognized-form-indefinite-masculine-plural":"neconsolabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neconsolabile","definite-error-unrecognized-form-masculine-neuter-singular":"neconsolabilul","definite-error-unrecognized-form-feminine-singular":"neconsolabila","definite-error-unrecognized-form-masculine-plural":"neconsolabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neconsolabilele"}},{"word":"neconstituțional","pos":"adj","definitions":["unconstitutional"],"forms":{"feminine-singular":"neconstituțională","masculine-plural":"neconstituționali","feminine-neuter-plural":"neconstituționale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neconstituțional","error-unrecognized-form-feminine-indefinite-singular":"neconstituțională","error-unrecognized-form-indefinite-masculine-plural":"neconstituționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"neconstituționale","definite-error-unrecognized-form-masculine-neuter-singular":"neconstituționalul","definite-error-unrecognized-form-feminine-singular":"neconstituționala","definite-error-unrecognized-form-masculine-plural":"neconstituționalii","definite-error-unrecognized-form-feminine-neuter-plural":"neconstituționalele"}},{"word":"necontenire","pos":"noun","definitions":["pauselessness"],"forms":{"plural":"neconteniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"necontenire","accusative-definite-nominative-singular":"necontenirea","accusative-indefinite-nominative-plural":"neconteniri","accusative-definite-nominative-plural":"necontenirile","dative-genitive-indefinite-singular":"neconteniri","dative-definite-genitive-singular":"necontenirii","dative-genitive-indefinite-plural":"neconteniri","dative-definite-genitive-plural":"necontenirilor","singular-vocative":"necontenire","plural-vocative":"necontenirilor"}},{"word":"necontenit","pos":"adj","definitions":["continual"],"forms":{"feminine-singular":"necontenită","masculine-plural":"neconteniți","feminine-neuter-plural":"necontenite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necontenit","error-unrecognized-form-feminine-indefinite-singular":"necontenită","error-unrecognized-form-indefinite-masculine-plural":"neconteniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"necontenite","definite-error-unrecognized-form-masculine-neuter-singular":"necontenitul","definite-error-unrecognized-form-feminine-singular":"necontenita","definite-error-unrecognized-form-masculine-plural":"neconteniții","definite-error-unrecognized-form-feminine-neuter-plural":"necontenitele"}},{"word":"necontestabil","pos":"adj","definitions":["incontestable"],"forms":{"feminine-singular":"necontestabilă","masculine-plural":"necontestabili","feminine-neuter-plural":"necontestabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necontestabil","error-unrecognized-form-feminine-indefinite-singular":"necontestabilă","error-unrecognized-form-indefinite-masculine-plural":"necontestabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"necontestabile","definite-error-unrecognized-form-masculine-neuter-singular":"necontestabilul","definite-error-unrecognized-form-feminine-singular":"necontestabila","definite-error-unrecognized-form-masculine-plural":"necontestabilii","definite-error-unrecognized-form-feminine-neuter-plural":"necontestabilele"}},{"word":"necontestat","pos":"adj","definitions":["uncontested"],"pronunciation":"/ˌne.kon.tesˈtat/","forms":{"feminine-singular":"necontestată","masculine-plural":"necontestați","feminine-neuter-plural":"necontestate","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"necontestat","error-unrecognized-form-feminine-indefinite-singular":"necontestată","error-unrecognized-form-indefinite-masculine-plural":"necontestați","error-unrecognized-form-feminine-indefinite-neuter-plural":"necontestate","definite-error-unrecognized-form-masculine-neuter-singular":"necontestatul","definite-error-unrecognized-form-feminine-singular":"necontestata","definite-error-unrecognized-form-masculine-plural":"necontestații","definite-error-unrecognized-form-feminine-neuter-plural":"necontestatele"}},{"word":"necontrolat","pos":"adj","definitions":["unchecked"],"forms":{"feminine-singular":"necontrolată","masculine-plural":"necontrolați","feminine-neuter-plural":"necontrolate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necontrolat","error-unrecognized-form-feminine-indefinite-singular":"necontrolată","error-unrecognized-form-indefinite-masculine-plural":"necontrolați","error-unrecognized-form-feminine-indefinite-neuter-plural":"necontrolate","definite-error-unrecognized-form-masculine-neuter-singular":"necontrolatul","definite-error-unrecognized-form-feminine-singular":"necontrolata","definite-error-unrecognized-form-masculine-plural":"necontrolații","definite-error-unrecognized-form-feminine-neuter-plural":"necontrolatele"}},{"word":"neconturat","pos":"adj","definitions":["uncontoured"],"forms":{"feminine-singular":"neconturată","masculine-plural":"neconturați","feminine-neuter-plural":"neconturate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neconturat","error-unrecognized-form-feminine-indefinite-singular":"neconturată","error-unrecognized-form-indefinite-masculine-plural":"neconturați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neconturate","definite-error-unrecognized-form-masculine-neuter-singular":"neconturatul","definite-error-unrecognized-form-feminine-singular":"neconturata","definite-error-unrecognized-form-masculine-plural":"neconturații","definite-error-unrecognized-form-feminine-neuter-plural":"neconturatele"}},{"word":"neconvenabil","pos":"adj","definitions":["inconvenient"],"forms":{"feminine-singular":"neconvenabilă","masculine-plural":"neconvenabili","feminine-neuter-plural":"neconvenabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neconvenabil","error-unrecognized-form-feminine-indefinite-singular":"neconvenabilă","error-unrecognized-form-indefinite-masculine-plural":"neconvenabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neconvenabile","definite-error-unrecognized-form-masculine-neuter-singular":"neconvenabilul","definite-error-unrecognized-form-feminine-singular":"neconvenabila","definite-error-unrecognized-form-masculine-plural":"neconvenabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neconvenabilele"}},{"word":"neconvențional","pos":"adj","definitions":["unconventional"],"forms":{"feminine-singular":"neconvențională","masculine-plural":"neconvenționali","feminine-neuter-plural":"neconvenționale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neconvențional","error-unrecognized-form-feminine-indefinite-singular":"neconvențională","error-unrecognized-form-indefinite-masculine-plural":"neconvenționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"neconvenționale","definite-error-unrecognized-form-masculine-neuter-singular":"neconvenționalul","definite-error-unrecognized-form-feminine-singular":"neconvenționala","definite-error-unrecognized-form-masculine-plural":"neconvenționalii","definite-error-unrecognized-form-feminine-neuter-plural":"neconvenționalele"}},{"word":"neconvertibil","pos":"adj","definitions":["inconvertible"],"forms":{"feminine-singular":"neconvertibilă","masculine-plural":"neconvertibili","feminine-neuter-plural":"neconvertibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neconvertibil","error-unrecognized-form-feminine-indefinite-singular":"neconvertibilă","error-unrecognized-form-indefinite-masculine-plural":"neconvertibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neconvertibile","definite-error-unrecognized-form-masculine-neuter-singular":"neconvertibilul","definite-error-unrecognized-form-feminine-singular":"neconvertibila","definite-error-unrecognized-form-masculine-plural":"neconvertibilii","definite-error-unrecognized-form-feminine-neuter-plural":"neconvertibilele"}},{"word":"neconvingător","pos":"adj","definitions":["unconvincing"],"forms":{"feminine-singular":"neconvingătoare","masculine-plural":"neconvingători","feminine-neuter-plural":"neconvingătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neconvingător","error-unrecognized-form-feminine-indefinite-singular":"neconvingătoare","error-unrecognized-form-indefinite-masculine-plural":"neconvingători","error-unrecognized-form-feminine-indefinite-neuter-plural":"neconvingătoare","definite-error-unrecognized-form-masculine-neuter-singular":"neconvingătorul","definite-error-unrecognized-form-feminine-singular":"neconvingătoarea","definite-error-unrecognized-form-masculine-plural":"neconvingătorii","definite-error-unrecognized-form-feminine-neuter-plural":"neconvingătoarele"}},{"word":"necoordonare","pos":"noun","definitions":["incoordination"],"forms":{"plural":"necoordonări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"necoordonare","accusative-definite-nominative-singular":"necoordonarea","accusative-indefinite-nominative-plural":"necoordonari","accusative-definite-nominative-plural":"necoordonarile","dative-genitive-indefinite-singular":"necoordonari","dative-definite-genitive-singular":"necoordonarii","dative-genitive-indefinite-plural":"necoordonari","dative-definite-genitive-plural":"necoordonarilor","singular-vocative":"necoordonare","plural-vocative":"necoordonarilor"}},{"word":"necoordonat","pos":"adj","definitions":["uncoordinated"],"forms":{"feminine-singular":"necoordonată","masculine-plural":"necoordonați","feminine-neuter-plural":"necoordonate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necoordonat","error-unrecognized-form-feminine-indefinite-singular":"necoordonată","error-unrecognized-form-indefinite-masculine-plural":"necoordonați","error-unrecognized-form-feminine-indefinite-neuter-plural":"necoordonate","definite-error-unrecognized-form-masculine-neuter-singular":"necoordonatul","definite-error-unrecognized-form-feminine-singular":"necoordonata","definite-error-unrecognized-form-masculine-plural":"necoordonații","definite-error-unrecognized-form-feminine-neuter-plural":"necoordonatele"}},{"word":"necopt","pos":"adj","definitions":["uncooked, raw","unripe","half-baked"],"pronunciation":"/neˈkopt/","forms":{"feminine-singular":"necoaptă","masculine-plural":"necopți","feminine-neuter-plural":"necoapte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necopt","error-unrecognized-form-feminine-indefinite-singular":"necoaptă","error-unrecognized-form-indefinite-masculine-plural":"necopți","error-unrecognized-form-feminine-indefinite-neuter-plural":"necoapte","definite-error-unrecognized-form-masculine-neuter-singular":"necoptul","definite-error-unrecognized-form-feminine-singular":"necoapta","definite-error-unrecognized-form-masculine-plural":"necopții","definite-error-unrecognized-form-feminine-neuter-plural":"necoaptele"}},{"word":"necorectitudine","pos":"noun","definitions":["incorrectness"],"forms":{"plural":"necorectitudini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"necorectitudine","accusative-definite-nominative-singular":"necorectitudinea","accusative-indefinite-nominative-plural":"necorectitudini","accusative-definite-nominative-plural":"necorectitudinile","dative-genitive-indefinite-singular":"necorectitudini","dative-definite-genitive-singular":"necorectitudinii","dative-genitive-indefinite-plural":"necorectitudini","dative-definite-genitive-plural":"necorectitudinilor","singular-vocative":"necorectitudine","plural-vocative":"necorectitudinilor"}},{"word":"necorespunzător","pos":"adj","definitions":["improper"],"forms":{"feminine-singular":"necorespunzătoare","masculine-plural":"necorespunzători","feminine-neuter-plural":"necorespunzătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necorespunzător","error-unrecognized-form-feminine-indefinite-singular":"necorespunzătoare","error-unrecognized-form-indefinite-masculine-plural":"necorespunzători","error-unrecognized-form-feminine-indefinite-neuter-plural":"necorespunzătoare","definite-error-unrecognized-form-masculine-neuter-singular":"necorespunzătorul","definite-error-unrecognized-form-feminine-singular":"necorespunzătoarea","definite-error-unrecognized-form-masculine-plural":"necorespunzătorii","definite-error-unrecognized-form-feminine-neuter-plural":"necorespunzătoarele"}},{"word":"necrectomie","pos":"noun","definitions":["necrectomy"],"forms":{"plural":"necrectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"necrectomie","accusative-definite-nominative-singular":"necrectomia","accusative-indefinite-nominative-plural":"necrectomii","accusative-definite-nominative-plural":"necrectomiile","dative-genitive-indefinite-singular":"necrectomii","dative-definite-genitive-singular":"necrectomiei","dative-genitive-indefinite-plural":"necrectomii","dative-definite-genitive-plural":"necrectomiilor","singular-vocative":"necrectomie","plural-vocative":"necrectomiilor"}},{"word":"necredincioasă","pos":"noun","definitions":["female equivalent of necredincios"],"forms":{"plural":"necredincioase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"necredincioasă","accusative-definite-nominative-singular":"necredincioasa","accusative-indefinite-nominative-plural":"necredincioase","accusative-definite-nominative-plural":"necredincioasele","dative-genitive-indefinite-singular":"necredincioase","dative-definite-genitive-singular":"necredincioasei","dative-genitive-indefinite-plural":"necredincioase","dative-definite-genitive-plural":"necredincioaselor","singular-vocative":"necredincioasă","plural-vocative":"necredincioaselor"}},{"word":"necredincios","pos":"noun","definitions":["unbeliever"],"forms":{"plural":"necredincioși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"necredincios","accusative-definite-nominative-singular":"necredinciosul","accusative-indefinite-nominative-plural":"necredincioși","accusative-definite-nominative-plural":"necredincioșii","dative-genitive-indefinite-singular":"necredincios","dative-definite-genitive-singular":"necredinciosului","dative-genitive-indefinite-plural":"necredincioși","dative-definite-genitive-plural":"necredincioșilor","singular-vocative":"necredinciosule","plural-vocative":"necredincioșilor"}},{"word":"necredincioșire","pos":"noun","definitions":["religious conversion away from Christianity"],"forms":{"plural":"necredincioșiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"necredincioșire","accusative-definite-nominative-singular":"necredincioșirea","accusative-indefinite-nominative-plural":"necredincioșiri","accusative-definite-nominative-plural":"necredincioșirile","dative-genitive-indefinite-singular":"necredincioșiri","dative-definite-genitive-singular":"necredincioșirii","dative-genitive-indefinite-plural":"necredincioșiri","dative-definite-genitive-plural":"necredincioșirilor","singular-vocative":"necredincioșire","plural-vocative":"necredincioșirilor"}},{"word":"necredință","pos":"noun","definitions":["unbelief"],"forms":{"plural":"necredințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"necredință","accusative-definite-nominative-singular":"necredința","accusative-indefinite-nominative-plural":"necredințe","accusative-definite-nominative-plural":"necredințele","dative-genitive-indefinite-singular":"necredințe","dative-definite-genitive-singular":"necredinței","dative-genitive-indefinite-plural":"necredințe","dative-definite-genitive-plural":"necredințelor","singular-vocative":"necredință","plural-vocative":"necredințelor"}},{"word":"Necrelescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Necrelescu"}},{"word":"necreștin","pos":"adj","definitions":["unchristian"],"forms":{"feminine-singular":"necreștină","masculine-plural":"necreștini","feminine-neuter-plural":"necreștine","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"necreștin","error-unrecognized-form-feminine-indefinite-singular":"necreștină","error-unrecognized-form-indefinite-masculine-plural":"necreștini","error-unrecognized-form-feminine-indefinite-neuter-plural":"necreștine","definite-error-unrecognized-form-masculine-neuter-singular":"necreștinul","definite-error-unrecognized-form-feminine-singular":"necreștina","definite-error-unrecognized-form-masculine-plural":"necreștinii","definite-error-unrecognized-form-feminine-neuter-plural":"necreștinele"}},{"word":"necrezare","pos":"noun","definitions":["disbelief"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"necrezare","accusative-definite-nominative":"necrezarea","dative-genitive-indefinite":"necrezări","dative-definite-genitive":"necrezării","vocative":"necrezare"}},{"word":"necrezut","pos":"adj","definitions":["unbelievable"],"forms":{"feminine-singular":"necrezută","masculine-plural":"necrezuți","feminine-neuter-plural":"necrezute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necrezut","error-unrecognized-form-feminine-indefinite-singular":"necrezută","error-unrecognized-form-indefinite-masculine-plural":"necrezuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"necrezute","definite-error-unrecognized-form-masculine-neuter-singular":"necrezutul","definite-error-unrecognized-form-feminine-singular":"necrezuta","definite-error-unrecognized-form-masculine-plural":"necrezuții","definite-error-unrecognized-form-feminine-neuter-plural":"necrezutele"}},{"word":"Necrilești","pos":"name","definitions":["a village in Întregalde, Alba County, Romania"],"gender":"m"},{"word":"necristalizat","pos":"adj","definitions":["uncrystallized"],"forms":{"feminine-singular":"necristalizată","masculine-plural":"necristalizați","feminine-neuter-plural":"necristalizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necristalizat","error-unrecognized-form-feminine-indefinite-singular":"necristalizată","error-unrecognized-form-indefinite-masculine-plural":"necristalizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"necristalizate","definite-error-unrecognized-form-masculine-neuter-singular":"necristalizatul","definite-error-unrecognized-form-feminine-singular":"necristalizata","definite-error-unrecognized-form-masculine-plural":"necristalizații","definite-error-unrecognized-form-feminine-neuter-plural":"necristalizatele"}},{"word":"necrobacil","pos":"noun","definitions":["necrotic bacillus"],"forms":{"plural":"necrobacili","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"necrobacil","accusative-definite-nominative-singular":"necrobacilul","accusative-indefinite-nominative-plural":"necrobacili","accusative-definite-nominative-plural":"necrobacilile","dative-genitive-indefinite-singular":"necrobacil","dative-definite-genitive-singular":"necrobacilului","dative-genitive-indefinite-plural":"necrobacili","dative-definite-genitive-plural":"necrobacililor","singular-vocative":"necrobacilule","plural-vocative":"necrobacililor"}},{"word":"necrobaciloză","pos":"noun","definitions":["necrobacillosis"],"forms":{"plural":"necrobaciloze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"necrobaciloză","accusative-definite-nominative-singular":"necrobaciloza","accusative-indefinite-nominative-plural":"necrobaciloze","accusative-definite-nominative-plural":"necrobacilozele","dative-genitive-indefinite-singular":"necrobaciloze","dative-definite-genitive-singular":"necrobacilozei","dative-genitive-indefinite-plural":"necrobaciloze","dative-definite-genitive-plural":"necrobacilozelor","singular-vocative":"necrobaciloză","plural-vocative":"necrobacilozelor"}},{"word":"necrobie","pos":"noun","definitions":["necrobia"],"forms":{"plural":"necrobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"necrobie","accusative-definite-nominative-singular":"necrobia","accusative-indefinite-nominative-plural":"necrobii","accusative-definite-nominative-plural":"necrobiile","dative-genitive-indefinite-singular":"necrobii","dative-definite-genitive-singular":"necrobiei","dative-genitive-indefinite-plural":"necrobii","dative-definite-genitive-plural":"necrobiilor","singular-vocative":"necrobie","plural-vocative":"necrobiilor"}},{"word":"necrobiotic","pos":"adj","definitions":["necrobiotic"],"forms":{"feminine-singular":"necrobiotică","masculine-plural":"necrobiotici","feminine-neuter-plural":"necrobiotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necrobiotic","error-unrecognized-form-feminine-indefinite-singular":"necrobiotică","error-unrecognized-form-indefinite-masculine-plural":"necrobiotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"necrobiotice","definite-error-unrecognized-form-masculine-neuter-singular":"necrobioticul","definite-error-unrecognized-form-feminine-singular":"necrobiotica","definite-error-unrecognized-form-masculine-plural":"necrobioticii","definite-error-unrecognized-form-feminine-neuter-plural":"necrobioticele"}},{"word":"necrobioză","pos":"noun","definitions":["necrobiosis"],"forms":{"plural":"necrobioze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"necrobioză","accusative-definite-nominative-singular":"necrobioza","accusative-indefinite-nominative-plural":"necrobioze","accusative-definite-nominative-plural":"necrobiozele","dative-genitive-indefinite-singular":"necrobioze","dative-definite-genitive-singular":"necrobiozei","dative-genitive-indefinite-plural":"necrobioze","dative-definite-genitive-plural":"necrobiozelor","singular-vocative":"necrobioză","plural-vocative":"necrobiozelor"}},{"word":"necrofag","pos":"noun","definitions":["necrophagous"],"forms":{"plural":"necrofagi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"necrofag","accusative-definite-nominative-singular":"necrofagul","accusative-indefinite-nominative-plural":"necrofagi","accusative-definite-nominative-plural":"necrofagii","dative-genitive-indefinite-singular":"necrofag","dative-definite-genitive-singular":"necrofagului","dative-genitive-indefinite-plural":"necrofagi","dative-definite-genitive-plural":"necrofagilor","singular-vocative":"necrofagule","plural-vocative":"necrofagilor"}},{"word":"necrofagă","pos":"noun","definitions":["female equivalent of necrofag"],"forms":{"plural":"necrofage","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"necrofagă","accusative-definite-nominative-singular":"necrofaga","accusative-indefinite-nominative-plural":"necrofage","accusative-definite-nominative-plural":"necrofagele","dative-genitive-indefinite-singular":"necrofage","dative-definite-genitive-singular":"necrofagei","dative-genitive-indefinite-plural":"necrofage","dative-definite-genitive-plural":"necrofagelor","singular-vocative":"necrofagă","plural-vocative":"necrofagelor"}},{"word":"necrofagie","pos":"noun","definitions":["necrophagy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"necrofagie","accusative-definite-nominative":"necrofagia","dative-genitive-indefinite":"necrofagii","dative-definite-genitive":"necrofagiei","vocative":"necrofagie"}},{"word":"necrofil","pos":"noun","definitions":["necrophile"],"forms":{"plural":"necrofili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"necrofil","accusative-definite-nominative-singular":"necrofilul","accusative-indefinite-nominative-plural":"necrofili","accusative-definite-nominative-plural":"necrofilii","dative-genitive-indefinite-singular":"necrofil","dative-definite-genitive-singular":"necrofilului","dative-genitive-indefinite-plural":"necrofili","dative-definite-genitive-plural":"necrofililor","singular-vocative":"necrofilule","plural-vocative":"necrofililor"}},{"word":"necrofilă","pos":"noun","definitions":["female equivalent of necrofil"],"forms":{"plural":"necrofile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"necrofilă","accusative-definite-nominative-singular":"necrofila","accusative-indefinite-nominative-plural":"necrofile","accusative-definite-nominative-plural":"necrofilele","dative-genitive-indefinite-singular":"necrofile","dative-definite-genitive-singular":"necrofilei","dative-genitive-indefinite-plural":"necrofile","dative-definite-genitive-plural":"necrofilelor","singular-vocative":"necrofilă","plural-vocative":"necrofilelor"}},{"word":"necrofilie","pos":"noun","definitions":["necrophilia"],"forms":{"plural":"necrofilii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"necrofilie","accusative-definite-nominative-singular":"necrofilia","accusative-indefinite-nominative-plural":"necrofilii","accusative-definite-nominative-plural":"necrofiliile","dative-genitive-indefinite-singular":"necrofilii","dative-definite-genitive-singular":"necrofiliei","dative-genitive-indefinite-plural":"necrofilii","dative-definite-genitive-plural":"necrofiliilor","singular-vocative":"necrofilie","plural-vocative":"necrofiliilor"}},{"word":"necrofob","pos":"noun","definitions":["necrophobe"],"forms":{"plural":"necrofobi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"necrofob","accusative-definite-nominative-singular":"necrofobul","accusative-indefinite-nominative-plural":"necrofobi","accusative-definite-nominative-plural":"necrofobii","dative-genitive-indefinite-singular":"necrofob","dative-definite-genitive-singular":"necrofobului","dative-genitive-indefinite-plural":"necrofobi","dative-definite-genitive-plural":"necrofobilor","singular-vocative":"necrofobule","plural-vocative":"necrofobilor"}},{"word":"necrofobă","pos":"noun","definitions":["female equivalent of necrofob"],"forms":{"plural":"necrofobe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"necrofobă","accusative-definite-nominative-singular":"necrofoba","accusative-indefinite-nominative-plural":"necrofobe","accusative-definite-nominative-plural":"necrofobele","dative-genitive-indefinite-singular":"necrofobe","dative-definite-genitive-singular":"necrofobei","dative-genitive-indefinite-plural":"necrofobe","dative-definite-genitive-plural":"necrofobelor","singular-vocative":"necrofobă","plural-vocative":"necrofobelor"}},{"word":"necrofobie","pos":"noun","definitions":["necrophobia"],"forms":{"plural":"necrofobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"necrofobie","accusative-definite-nominative-singular":"necrofobia","accusative-indefinite-nominative-plural":"necrofobii","accusative-definite-nominative-plural":"necrofobiile","dative-genitive-indefinite-singular":"necrofobii","dative-definite-genitive-singular":"necrofobiei","dative-genitive-indefinite-plural":"necrofobii","dative-definite-genitive-plural":"necrofobiilor","singular-vocative":"necrofobie","plural-vocative":"necrofobiilor"}},{"word":"necrofor","pos":"noun","definitions":["necrophore, gravedigger, burying beetle"],"pronunciation":"/ne.kroˈfor/","forms":{"plural":"necrofori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"necrofor","accusative-definite-nominative-singular":"necroforul","accusative-indefinite-nominative-plural":"necrofori","accusative-definite-nominative-plural":"necroforii","dative-genitive-indefinite-singular":"necrofor","dative-definite-genitive-singular":"necroforului","dative-genitive-indefinite-plural":"necrofori","dative-definite-genitive-plural":"necroforilor","singular-vocative":"necroforule","plural-vocative":"necroforilor"}},{"word":"necrofori","pos":"noun","definitions":["plural of necrofor"],"gender":"m"},{"word":"necrolatrie","pos":"noun","definitions":["necrolatry"],"forms":{"plural":"necrolatrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"necrolatrie","accusative-definite-nominative-singular":"necrolatria","accusative-indefinite-nominative-plural":"necrolatrii","accusative-definite-nominative-plural":"necrolatriile","dative-genitive-indefinite-singular":"necrolatrii","dative-definite-genitive-singular":"necrolatriei","dative-genitive-indefinite-plural":"necrolatrii","dative-definite-genitive-plural":"necrolatriilor","singular-vocative":"necrolatrie","plural-vocative":"necrolatriilor"}},{"word":"necrolatru","pos":"noun","definitions":["necrolater"],"forms":{"plural":"necrolatri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"necrolatru","accusative-definite-nominative-singular":"necrolatruul","accusative-indefinite-nominative-plural":"necrolatri","accusative-definite-nominative-plural":"necrolatrii","dative-genitive-indefinite-singular":"necrolatru","dative-definite-genitive-singular":"necrolatruului","dative-genitive-indefinite-plural":"necrolatri","dative-definite-genitive-plural":"necrolatrilor","singular-vocative":"necrolatruule","plural-vocative":"necrolatrilor"}},{"word":"necrolog","pos":"noun","definitions":["obituary"],"forms":{"plural":"necrologuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"necrolog","accusative-definite-nominative-singular":"necrologul","accusative-indefinite-nominative-plural":"necrologe","accusative-definite-nominative-plural":"necrologele","dative-genitive-indefinite-singular":"necrolog","dative-definite-genitive-singular":"necrologului","dative-genitive-indefinite-plural":"necrologe","dative-definite-genitive-plural":"necrologelor","singular-vocative":"necrologule","plural-vocative":"necrologelor"}},{"word":"necrologic","pos":"adj","definitions":["obituary"],"forms":{"feminine-singular":"necrologică","masculine-plural":"necrologici","feminine-neuter-plural":"necrologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necrologic","error-unrecognized-form-feminine-indefinite-singular":"necrologică","error-unrecognized-form-indefinite-masculine-plural":"necrologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"necrologice","definite-error-unrecognized-form-masculine-neuter-singular":"necrologicul","definite-error-unrecognized-form-feminine-singular":"necrologica","definite-error-unrecognized-form-masculine-plural":"necrologicii","definite-error-unrecognized-form-feminine-neuter-plural":"necrologicele"}},{"word":"necrologie","pos":"noun","definitions":["necrology"],"forms":{"plural":"necrologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"necrologie","accusative-definite-nominative-singular":"necrologia","accusative-indefinite-nominative-plural":"necrologii","accusative-definite-nominative-plural":"necrologiile","dative-genitive-indefinite-singular":"necrologii","dative-definite-genitive-singular":"necrologiei","dative-genitive-indefinite-plural":"necrologii","dative-definite-genitive-plural":"necrologiilor","singular-vocative":"necrologie","plural-vocative":"necrologiilor"}},{"word":"necroman","pos":"noun","definitions":["alternative form of necromant"],"forms":{"plural":"necromani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"necroman","accusative-definite-nominative-singular":"necromanul","accusative-indefinite-nominative-plural":"necromani","accusative-definite-nominative-plural":"necromanii","dative-genitive-indefinite-singular":"necroman","dative-definite-genitive-singular":"necromanului","dative-genitive-indefinite-plural":"necromani","dative-definite-genitive-plural":"necromanilor","singular-vocative":"necromanule","plural-vocative":"necromanilor"}},{"word":"necromană","pos":"noun","definitions":["female equivalent of necroman"],"forms":{"plural":"necromane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"necromană","accusative-definite-nominative-singular":"necromana","accusative-indefinite-nominative-plural":"necromane","accusative-definite-nominative-plural":"necromanele","dative-genitive-indefinite-singular":"necromane","dative-definite-genitive-singular":"necromanei","dative-genitive-indefinite-plural":"necromane","dative-definite-genitive-plural":"necromanelor","singular-vocative":"necromană","plural-vocative":"necromanelor"}},{"word":"necromancian","pos":"noun","definitions":["necromancer"],"forms":{"plural":"necromancieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"necromancian","accusative-definite-nominative-singular":"necromancianul","accusative-indefinite-nominative-plural":"necromancieni","accusative-definite-nominative-plural":"necromancienii","dative-genitive-indefinite-singular":"necromancian","dative-definite-genitive-singular":"necromancianului","dative-genitive-indefinite-plural":"necromancieni","dative-definite-genitive-plural":"necromancienilor","singular-vocative":"necromancianule","plural-vocative":"necromancienilor"}},{"word":"necromanie","pos":"noun","definitions":["necromania"],"forms":{"plural":"necromanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"necromanie","accusative-definite-nominative-singular":"necromania","accusative-indefinite-nominative-plural":"necromanii","accusative-definite-nominative-plural":"necromaniile","dative-genitive-indefinite-singular":"necromanii","dative-definite-genitive-singular":"necromaniei","dative-genitive-indefinite-plural":"necromanii","dative-definite-genitive-plural":"necromaniilor","singular-vocative":"necromanie","plural-vocative":"necromaniilor"}},{"word":"necromant","pos":"noun","definitions":["necromancer"],"pronunciation":"/ne.kroˈmant/","forms":{"plural":"necromanți","feminine":"equivalent necromantă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"necromant","accusative-definite-nominative-singular":"necromantul","accusative-indefinite-nominative-plural":"necromanți","accusative-definite-nominative-plural":"necromanții","dative-genitive-indefinite-singular":"necromant","dative-definite-genitive-singular":"necromantului","dative-genitive-indefinite-plural":"necromanți","dative-definite-genitive-plural":"necromanților","singular-vocative":"necromantule","plural-vocative":"necromanților","alternative":"necroman"}},{"word":"necromantă","pos":"noun","definitions":["female equivalent of necromant"],"forms":{"plural":"necromante","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"necromantă","accusative-definite-nominative-singular":"necromanta","accusative-indefinite-nominative-plural":"necromante","accusative-definite-nominative-plural":"necromantele","dative-genitive-indefinite-singular":"necromante","dative-definite-genitive-singular":"necromantei","dative-genitive-indefinite-plural":"necromante","dative-definite-genitive-plural":"necromantelor","singular-vocative":"necromantă","plural-vocative":"necromantelor"}},{"word":"necromantic","pos":"adj","definitions":["necromantic"],"forms":{"feminine-singular":"necromantică","masculine-plural":"necromantici","feminine-neuter-plural":"necromantice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necromantic","error-unrecognized-form-feminine-indefinite-singular":"necromantică","error-unrecognized-form-indefinite-masculine-plural":"necromantici","error-unrecognized-form-feminine-indefinite-neuter-plural":"necromantice","definite-error-unrecognized-form-masculine-neuter-singular":"necromanticul","definite-error-unrecognized-form-feminine-singular":"necromantica","definite-error-unrecognized-form-masculine-plural":"necromanticii","definite-error-unrecognized-form-feminine-neuter-plural":"necromanticele"}},{"word":"necromanție","pos":"noun","definitions":["necromancy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"necromanție","accusative-definite-nominative-singular":"necromanția","accusative-indefinite-nominative-plural":"necromanții","accusative-definite-nominative-plural":"necromanțiile","dative-genitive-indefinite-singular":"necromanții","dative-definite-genitive-singular":"necromanției","dative-genitive-indefinite-plural":"necromanții","dative-definite-genitive-plural":"necromanțiilor","singular-vocative":"necromanție","plural-vocative":"necromanțiilor"}},{"word":"necropolă","pos":"noun","definitions":["necropolis"],"forms":{"plural":"necropole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"necropolă","accusative-definite-nominative-singular":"necropola","accusative-indefinite-nominative-plural":"necropole","accusative-definite-nominative-plural":"necropolele","dative-genitive-indefinite-singular":"necropole","dative-definite-genitive-singular":"necropolei","dative-genitive-indefinite-plural":"necropole","dative-definite-genitive-plural":"necropolelor","singular-vocative":"necropolă","plural-vocative":"necropolelor"}},{"word":"necropsic","pos":"adj","definitions":["necropsy"],"forms":{"feminine-singular":"necropsică","masculine-plural":"necropsici","feminine-neuter-plural":"necropsice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necropsic","error-unrecognized-form-feminine-indefinite-singular":"necropsică","error-unrecognized-form-indefinite-masculine-plural":"necropsici","error-unrecognized-form-feminine-indefinite-neuter-plural":"necropsice","definite-error-unrecognized-form-masculine-neuter-singular":"necropsicul","definite-error-unrecognized-form-feminine-singular":"necropsica","definite-error-unrecognized-form-masculine-plural":"necropsicii","definite-error-unrecognized-form-feminine-neuter-plural":"necropsicele"}},{"word":"necropsie","pos":"noun","definitions":["necropsy"],"forms":{"plural":"necropsii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"necropsie","accusative-definite-nominative-singular":"necropsia","accusative-indefinite-nominative-plural":"necropsii","accusative-definite-nominative-plural":"necropsiile","dative-genitive-indefinite-singular":"necropsii","dative-definite-genitive-singular":"necropsiei","dative-genitive-indefinite-plural":"necropsii","dative-definite-genitive-plural":"necropsiilor","singular-vocative":"necropsie","plural-vocative":"necropsiilor"}},{"word":"necrosadism","pos":"noun","definitions":["necrosadism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"necrosadism","accusative-definite-nominative":"necrosadismul","dative-genitive-indefinite":"necrosadism","dative-definite-genitive":"necrosadismului","vocative":"necrosadismule"}},{"word":"necrospermie","pos":"noun","definitions":["necrospermia"],"forms":{"plural":"necrospermii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"necrospermie","accusative-definite-nominative-singular":"necrospermia","accusative-indefinite-nominative-plural":"necrospermii","accusative-definite-nominative-plural":"necrospermiile","dative-genitive-indefinite-singular":"necrospermii","dative-definite-genitive-singular":"necrospermiei","dative-genitive-indefinite-plural":"necrospermii","dative-definite-genitive-plural":"necrospermiilor","singular-vocative":"necrospermie","plural-vocative":"necrospermiilor"}},{"word":"necrotic","pos":"adj","definitions":["necrotic"],"forms":{"feminine-singular":"necrotică","masculine-plural":"necrotici","feminine-neuter-plural":"necrotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necrotic","error-unrecognized-form-feminine-indefinite-singular":"necrotică","error-unrecognized-form-indefinite-masculine-plural":"necrotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"necrotice","definite-error-unrecognized-form-masculine-neuter-singular":"necroticul","definite-error-unrecognized-form-feminine-singular":"necrotica","definite-error-unrecognized-form-masculine-plural":"necroticii","definite-error-unrecognized-form-feminine-neuter-plural":"necroticele"}},{"word":"necrotomie","pos":"noun","definitions":["necrotomy"],"forms":{"plural":"necrotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"necrotomie","accusative-definite-nominative-singular":"necrotomia","accusative-indefinite-nominative-plural":"necrotomii","accusative-definite-nominative-plural":"necrotomiile","dative-genitive-indefinite-singular":"necrotomii","dative-definite-genitive-singular":"necrotomiei","dative-genitive-indefinite-plural":"necrotomii","dative-definite-genitive-plural":"necrotomiilor","singular-vocative":"necrotomie","plural-vocative":"necrotomiilor"}},{"word":"necroza","pos":"verb","definitions":["to necrose"],"forms":{"canonical":"a necroza 1st conjugation","present-singular-third-person":"necrozează","participle-past":"necrozat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a necroza","gerund":"necrozând","first-person-indicative-present-singular":"necroz","indicative-present-second-person-singular":"necrozi","indicative-present-singular-third-person":"necroză","first-person-indicative-plural-present":"necrozăm","indicative-plural-present-second-person":"necrozați","indicative-plural-present-third-person":"necroză","first-person-imperfect-indicative-singular":"necrozam","imperfect-indicative-second-person-singular":"necrozai","imperfect-indicative-singular-third-person":"necroza","first-person-imperfect-indicative-plural":"necrozam","imperfect-indicative-plural-second-person":"necrozați","imperfect-indicative-plural-third-person":"necrozau","first-person-indicative-perfect-singular":"necrozai","indicative-perfect-second-person-singular":"necrozași","indicative-perfect-singular-third-person":"necroză","first-person-indicative-perfect-plural":"necrozarăm","indicative-perfect-plural-second-person":"necrozarăți","indicative-perfect-plural-third-person":"necrozară","first-person-indicative-pluperfect-singular":"necrozasem","indicative-pluperfect-second-person-singular":"necrozaseși","indicative-pluperfect-singular-third-person":"necrozase","first-person-indicative-pluperfect-plural":"necrozaserăm","indicative-pluperfect-plural-second-person":"necrozaserăți","indicative-pluperfect-plural-third-person":"necrozaseră","first-person-present-singular-subjunctive":"să necroz","present-second-person-singular-subjunctive":"să necrozi","present-singular-subjunctive-third-person":"să necroze","first-person-plural-present-subjunctive":"să necrozăm","plural-present-second-person-subjunctive":"să necrozați","plural-present-subjunctive-third-person":"să necroze","imperative-second-person-singular":"necroză","imperative-plural-second-person":"necrozați","imperative-negative-second-person-singular":"nu necroza","imperative-negative-plural-second-person":"nu necrozați"}},{"word":"necroză","pos":"noun","definitions":["necrosis"],"forms":{"plural":"necroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"necroză","accusative-definite-nominative-singular":"necroza","accusative-indefinite-nominative-plural":"necroze","accusative-definite-nominative-plural":"necrozele","dative-genitive-indefinite-singular":"necroze","dative-definite-genitive-singular":"necrozei","dative-genitive-indefinite-plural":"necroze","dative-definite-genitive-plural":"necrozelor","singular-vocative":"necroză","plural-vocative":"necrozelor"}},{"word":"necrozare","pos":"noun","definitions":["necrosis"],"forms":{"plural":"necrozări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"necrozare","accusative-definite-nominative-singular":"necrozarea","accusative-indefinite-nominative-plural":"necrozări","accusative-definite-nominative-plural":"necrozările","dative-genitive-indefinite-singular":"necrozări","dative-definite-genitive-singular":"necrozării","dative-genitive-indefinite-plural":"necrozări","dative-definite-genitive-plural":"necrozărilor","singular-vocative":"necrozare","plural-vocative":"necrozărilor"}},{"word":"necrozat","pos":"adj","definitions":["necrotic"],"forms":{"feminine-singular":"necrozată","masculine-plural":"necrozați","feminine-neuter-plural":"necrozate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necrozat","error-unrecognized-form-feminine-indefinite-singular":"necrozată","error-unrecognized-form-indefinite-masculine-plural":"necrozați","error-unrecognized-form-feminine-indefinite-neuter-plural":"necrozate","definite-error-unrecognized-form-masculine-neuter-singular":"necrozatul","definite-error-unrecognized-form-feminine-singular":"necrozata","definite-error-unrecognized-form-masculine-plural":"necrozații","definite-error-unrecognized-form-feminine-neuter-plural":"necrozatele"}},{"word":"necruțat","pos":"adv","definitions":["relentless"]},{"word":"necruțător","pos":"adj","definitions":["ruthless"],"forms":{"feminine-singular":"necruțătoare","masculine-plural":"necruțători","feminine-neuter-plural":"necruțătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necruțător","error-unrecognized-form-feminine-indefinite-singular":"necruțătoare","error-unrecognized-form-indefinite-masculine-plural":"necruțători","error-unrecognized-form-feminine-indefinite-neuter-plural":"necruțătoare","definite-error-unrecognized-form-masculine-neuter-singular":"necruțătorul","definite-error-unrecognized-form-feminine-singular":"necruțătoarea","definite-error-unrecognized-form-masculine-plural":"necruțătorii","definite-error-unrecognized-form-feminine-neuter-plural":"necruțătoarele"}},{"word":"Necșescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Necșescu"}},{"word":"Necșești","pos":"name","definitions":["a village in Vadu Moților, Alba County, Romania","a commune of Teleorman County, Romania","a village in Necșești, Teleorman County, Romania"],"gender":"m"},{"word":"Necșoi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Necșoi"}},{"word":"Necșoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Necșoiu"}},{"word":"Necșulea","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Necșulea"}},{"word":"Necșulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Necșulescu"}},{"word":"Necșuță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Necșuță"}},{"word":"nectar","pos":"noun","definitions":["nectar"],"forms":{"plural":"nectaruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nectar","accusative-definite-nominative-singular":"nectarul","accusative-indefinite-nominative-plural":"nectaruri","accusative-definite-nominative-plural":"nectarurile","dative-genitive-indefinite-singular":"nectar","dative-definite-genitive-singular":"nectarului","dative-genitive-indefinite-plural":"nectaruri","dative-definite-genitive-plural":"nectarurilor","singular-vocative":"nectarule","plural-vocative":"nectarurilor"}},{"word":"nectarie","pos":"noun","definitions":["nectary (gland that secretes nectar)"],"forms":{"plural":"nectarii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nectarie","accusative-definite-nominative-singular":"nectaria","accusative-indefinite-nominative-plural":"nectarii","accusative-definite-nominative-plural":"nectariile","dative-genitive-indefinite-singular":"nectarii","dative-definite-genitive-singular":"nectariei","dative-genitive-indefinite-plural":"nectarii","dative-definite-genitive-plural":"nectariilor","singular-vocative":"nectarie","plural-vocative":"nectariilor"}},{"word":"nectarifer","pos":"adj","definitions":["nectareous"],"forms":{"feminine-singular":"nectariferă","masculine-plural":"nectariferi","feminine-neuter-plural":"nectarifere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nectarifer","error-unrecognized-form-feminine-indefinite-singular":"nectariferă","error-unrecognized-form-indefinite-masculine-plural":"nectariferi","error-unrecognized-form-feminine-indefinite-neuter-plural":"nectarifere","definite-error-unrecognized-form-masculine-neuter-singular":"nectariferul","definite-error-unrecognized-form-feminine-singular":"nectarifera","definite-error-unrecognized-form-masculine-plural":"nectariferii","definite-error-unrecognized-form-feminine-neuter-plural":"nectariferele"}},{"word":"nectarină","pos":"noun","definitions":["nectarine (fruit)"],"pronunciation":"/nek.taˈri.nə/","forms":{"plural":"nectarine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nectarină","accusative-definite-nominative-singular":"nectarina","accusative-indefinite-nominative-plural":"nectarine","accusative-definite-nominative-plural":"nectarinele","dative-genitive-indefinite-singular":"nectarine","dative-definite-genitive-singular":"nectarinei","dative-genitive-indefinite-plural":"nectarine","dative-definite-genitive-plural":"nectarinelor","singular-vocative":"nectarină","plural-vocative":"nectarinelor"}},{"word":"necton","pos":"noun","definitions":["nekton"],"pronunciation":"/nekˈton/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"necton","accusative-definite-nominative":"nectonul","dative-genitive-indefinite":"necton","dative-definite-genitive":"nectonului","vocative":"nectonule"}},{"word":"necugetare","pos":"noun","definitions":["thoughtlessness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"necugetare","accusative-definite-nominative":"necugetarea","dative-genitive-indefinite":"necugetari","dative-definite-genitive":"necugetarii","vocative":"necugetare"}},{"word":"necugetat","pos":"adj","definitions":["thoughtless"],"forms":{"feminine-singular":"necugetată","masculine-plural":"necugetați","feminine-neuter-plural":"necugetate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necugetat","error-unrecognized-form-feminine-indefinite-singular":"necugetată","error-unrecognized-form-indefinite-masculine-plural":"necugetați","error-unrecognized-form-feminine-indefinite-neuter-plural":"necugetate","definite-error-unrecognized-form-masculine-neuter-singular":"necugetatul","definite-error-unrecognized-form-feminine-singular":"necugetata","definite-error-unrecognized-form-masculine-plural":"necugetații","definite-error-unrecognized-form-feminine-neuter-plural":"necugetatele"}},{"word":"Neculăeasa","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"f"},{"word":"Neculăescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Neculăescu"}},{"word":"Neculăică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Neculăică"}},{"word":"Neculaide","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Neculaide"}},{"word":"Neculăiescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Neculăiescu"}},{"word":"Neculăieuca","pos":"name","definitions":["a village in Neculăieuca, Orhei Raion, Moldova","a commune of Orhei Raion, Moldova"],"gender":"f"},{"word":"Neculăiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Neculăiță"}},{"word":"Neculele","pos":"name","definitions":["a village in Vintileasca, Vrancea County, Romania"],"gender":"m"},{"word":"Neculescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Neculescu"}},{"word":"Neculicioiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Neculicioiu"}},{"word":"Neculiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Neculiță"}},{"word":"Neculoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Neculoiu"}},{"word":"necultivat","pos":"adj","definitions":["uncultivated"],"forms":{"feminine-singular":"necultivată","masculine-plural":"necultivați","feminine-neuter-plural":"necultivate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necultivat","error-unrecognized-form-feminine-indefinite-singular":"necultivată","error-unrecognized-form-indefinite-masculine-plural":"necultivați","error-unrecognized-form-feminine-indefinite-neuter-plural":"necultivate","definite-error-unrecognized-form-masculine-neuter-singular":"necultivatul","definite-error-unrecognized-form-feminine-singular":"necultivata","definite-error-unrecognized-form-masculine-plural":"necultivații","definite-error-unrecognized-form-feminine-neuter-plural":"necultivatele"}},{"word":"necum","pos":"adv","definitions":["not at all"]},{"word":"necumpănire","pos":"noun","definitions":["intemperance"],"forms":{"plural":"necumpăniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"necumpănire","accusative-definite-nominative-singular":"necumpănirea","accusative-indefinite-nominative-plural":"necumpăniri","accusative-definite-nominative-plural":"necumpănirile","dative-genitive-indefinite-singular":"necumpăniri","dative-definite-genitive-singular":"necumpănirii","dative-genitive-indefinite-plural":"necumpăniri","dative-definite-genitive-plural":"necumpănirilor","singular-vocative":"necumpănire","plural-vocative":"necumpănirilor"}},{"word":"necumpătat","pos":"adj","definitions":["intemperate"],"forms":{"feminine-singular":"necumpătată","masculine-plural":"necumpătați","feminine-neuter-plural":"necumpătate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necumpătat","error-unrecognized-form-feminine-indefinite-singular":"necumpătată","error-unrecognized-form-indefinite-masculine-plural":"necumpătați","error-unrecognized-form-feminine-indefinite-neuter-plural":"necumpătate","definite-error-unrecognized-form-masculine-neuter-singular":"necumpătatul","definite-error-unrecognized-form-feminine-singular":"necumpătata","definite-error-unrecognized-form-masculine-plural":"necumpătații","definite-error-unrecognized-form-feminine-neuter-plural":"necumpătatele"}},{"word":"necunoaștere","pos":"noun","definitions":["ignorance"],"forms":{"plural":"necunoașteri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"necunoaștere","accusative-definite-nominative-singular":"necunoașterea","accusative-indefinite-nominative-plural":"necunoașteri","accusative-definite-nominative-plural":"necunoașterile","dative-genitive-indefinite-singular":"necunoașteri","dative-definite-genitive-singular":"necunoașterii","dative-genitive-indefinite-plural":"necunoașteri","dative-definite-genitive-plural":"necunoașterilor","singular-vocative":"necunoaștere","plural-vocative":"necunoașterilor"}},{"word":"necunoscător","pos":"adj","definitions":["ignorant"],"forms":{"feminine-singular":"necunoscătoare","masculine-plural":"necunoscători","feminine-neuter-plural":"necunoscătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necunoscător","error-unrecognized-form-feminine-indefinite-singular":"necunoscătoare","error-unrecognized-form-indefinite-masculine-plural":"necunoscători","error-unrecognized-form-feminine-indefinite-neuter-plural":"necunoscătoare","definite-error-unrecognized-form-masculine-neuter-singular":"necunoscătorul","definite-error-unrecognized-form-feminine-singular":"necunoscătoarea","definite-error-unrecognized-form-masculine-plural":"necunoscătorii","definite-error-unrecognized-form-feminine-neuter-plural":"necunoscătoarele"}},{"word":"necunoscut","pos":"adj","definitions":["unknown"],"pronunciation":"[ˌne.ku.nosˈkut]","forms":{"feminine-singular":"necunoscută","masculine-plural":"necunoscuți","feminine-neuter-plural":"necunoscute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necunoscut","error-unrecognized-form-feminine-indefinite-singular":"necunoscută","error-unrecognized-form-indefinite-masculine-plural":"necunoscuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"necunoscute","definite-error-unrecognized-form-masculine-neuter-singular":"necunoscutul","definite-error-unrecognized-form-feminine-singular":"necunoscuta","definite-error-unrecognized-form-masculine-plural":"necunoscuții","definite-error-unrecognized-form-feminine-neuter-plural":"necunoscutele"}},{"word":"necunoscut","pos":"verb","definitions":["negative past participle of cunoaște"],"pronunciation":"[ˌne.ku.nosˈkut]"},{"word":"necunoscută","pos":"noun","definitions":["female equivalent of necunoscut","unknown"],"forms":{"plural":"necunoscute","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"necunoscută","accusative-definite-nominative-singular":"necunoscuta","accusative-indefinite-nominative-plural":"necunoscute","accusative-definite-nominative-plural":"necunoscutele","dative-genitive-indefinite-singular":"necunoscute","dative-definite-genitive-singular":"necunoscutei","dative-genitive-indefinite-plural":"necunoscute","dative-definite-genitive-plural":"necunoscutelor","singular-vocative":"necunoscută","plural-vocative":"necunoscutelor"}},{"word":"necuprins","pos":"noun","definitions":["boundless"],"forms":{"plural":"necuprinși","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"necuprins","accusative-definite-nominative-singular":"necuprinsul","accusative-indefinite-nominative-plural":"necuprinși","accusative-definite-nominative-plural":"necuprinșile","dative-genitive-indefinite-singular":"necuprins","dative-definite-genitive-singular":"necuprinsului","dative-genitive-indefinite-plural":"necuprinși","dative-definite-genitive-plural":"necuprinșilor","singular-vocative":"necuprinsule","plural-vocative":"necuprinșilor"}},{"word":"necurăciune","pos":"noun","definitions":["dirtiness"],"forms":{"plural":"necurăciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"necurăciune","accusative-definite-nominative-singular":"necurăciunea","accusative-indefinite-nominative-plural":"necurăciuni","accusative-definite-nominative-plural":"necurăciunile","dative-genitive-indefinite-singular":"necurăciuni","dative-definite-genitive-singular":"necurăciunii","dative-genitive-indefinite-plural":"necurăciuni","dative-definite-genitive-plural":"necurăciunilor","singular-vocative":"necurăciune","plural-vocative":"necurăciunilor"}},{"word":"necurat","pos":"adj","definitions":["unclean"],"forms":{"feminine-singular":"necurată","masculine-plural":"necurați","feminine-neuter-plural":"necurate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necurat","error-unrecognized-form-feminine-indefinite-singular":"necurată","error-unrecognized-form-indefinite-masculine-plural":"necurați","error-unrecognized-form-feminine-indefinite-neuter-plural":"necurate","definite-error-unrecognized-form-masculine-neuter-singular":"necuratul","definite-error-unrecognized-form-feminine-singular":"necurata","definite-error-unrecognized-form-masculine-plural":"necurații","definite-error-unrecognized-form-feminine-neuter-plural":"necuratele"}},{"word":"necurățat","pos":"adj","definitions":["uncleaned"],"forms":{"feminine-singular":"necurățată","masculine-plural":"necurățați","feminine-neuter-plural":"necurățate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necurățat","error-unrecognized-form-feminine-indefinite-singular":"necurățată","error-unrecognized-form-indefinite-masculine-plural":"necurățați","error-unrecognized-form-feminine-indefinite-neuter-plural":"necurățate","definite-error-unrecognized-form-masculine-neuter-singular":"necurățatul","definite-error-unrecognized-form-feminine-singular":"necurățata","definite-error-unrecognized-form-masculine-plural":"necurățații","definite-error-unrecognized-form-feminine-neuter-plural":"necurățatele"}},{"word":"necurățenie","pos":"noun","definitions":["dirtiness"],"forms":{"plural":"necurățenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"necurățenie","accusative-definite-nominative-singular":"necurățenia","accusative-indefinite-nominative-plural":"necurățenii","accusative-definite-nominative-plural":"necurățeniile","dative-genitive-indefinite-singular":"necurățenii","dative-definite-genitive-singular":"necurățeniei","dative-genitive-indefinite-plural":"necurățenii","dative-definite-genitive-plural":"necurățeniilor","singular-vocative":"necurățenie","plural-vocative":"necurățeniilor"}},{"word":"necurăți","pos":"verb","definitions":["to sin"],"forms":{"canonical":"a necurăți 4th conjugation","present-singular-third-person":"necurățește","participle-past":"necurățit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a necurăți","gerund":"necurățind","first-person-indicative-present-singular":"necurățesc","indicative-present-second-person-singular":"necurățești","indicative-present-singular-third-person":"necurățește","first-person-indicative-plural-present":"necurățim","indicative-plural-present-second-person":"necurățiți","indicative-plural-present-third-person":"necurățesc","first-person-imperfect-indicative-singular":"necurățeam","imperfect-indicative-second-person-singular":"necurățeai","imperfect-indicative-singular-third-person":"necurățea","first-person-imperfect-indicative-plural":"necurățeam","imperfect-indicative-plural-second-person":"necurățeați","imperfect-indicative-plural-third-person":"necurățeau","first-person-indicative-perfect-singular":"necurății","indicative-perfect-second-person-singular":"necurățiși","indicative-perfect-singular-third-person":"necurăți","first-person-indicative-perfect-plural":"necurățirăm","indicative-perfect-plural-second-person":"necurățirăți","indicative-perfect-plural-third-person":"necurățiră","first-person-indicative-pluperfect-singular":"necurățisem","indicative-pluperfect-second-person-singular":"necurățiseși","indicative-pluperfect-singular-third-person":"necurățise","first-person-indicative-pluperfect-plural":"necurățiserăm","indicative-pluperfect-plural-second-person":"necurățiserăți","indicative-pluperfect-plural-third-person":"necurățiseră","first-person-present-singular-subjunctive":"să necurățesc","present-second-person-singular-subjunctive":"să necurățești","present-singular-subjunctive-third-person":"să necurățească","first-person-plural-present-subjunctive":"să necurățim","plural-present-second-person-subjunctive":"să necurățiți","plural-present-subjunctive-third-person":"să necurățească","imperative-second-person-singular":"necurățește","imperative-plural-second-person":"necurățiți","imperative-negative-second-person-singular":"nu necurăți","imperative-negative-plural-second-person":"nu necurățiți"}},{"word":"necurăție","pos":"noun","definitions":["uncleanness"],"forms":{"plural":"necurății","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"necurăție","accusative-definite-nominative-singular":"necurăția","accusative-indefinite-nominative-plural":"necurății","accusative-definite-nominative-plural":"necurățiile","dative-genitive-indefinite-singular":"necurății","dative-definite-genitive-singular":"necurăției","dative-genitive-indefinite-plural":"necurății","dative-definite-genitive-plural":"necurățiilor","singular-vocative":"necurăție","plural-vocative":"necurățiilor"}},{"word":"necurățime","pos":"noun","definitions":["dirt, filth"],"forms":{"plural":"necurățimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"necurățime","accusative-definite-nominative-singular":"necurățimea","accusative-indefinite-nominative-plural":"necurățimi","accusative-definite-nominative-plural":"necurățimile","dative-genitive-indefinite-singular":"necurățimi","dative-definite-genitive-singular":"necurățimii","dative-genitive-indefinite-plural":"necurățimi","dative-definite-genitive-plural":"necurățimilor","singular-vocative":"necurățime","plural-vocative":"necurățimilor"}},{"word":"necurățire","pos":"noun","definitions":["vileness"],"forms":{"plural":"necurățiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"necurățire","accusative-definite-nominative-singular":"necurățirea","accusative-indefinite-nominative-plural":"necurățiri","accusative-definite-nominative-plural":"necurățirile","dative-genitive-indefinite-singular":"necurățiri","dative-definite-genitive-singular":"necurățirii","dative-genitive-indefinite-plural":"necurățiri","dative-definite-genitive-plural":"necurățirilor","singular-vocative":"necurățire","plural-vocative":"necurățirilor"}},{"word":"necurățitor","pos":"noun","definitions":["unbeliever, sinner"],"forms":{"plural":"necurățitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"necurățitor","accusative-definite-nominative-singular":"necurățitorul","accusative-indefinite-nominative-plural":"necurățitori","accusative-definite-nominative-plural":"necurățitorii","dative-genitive-indefinite-singular":"necurățitor","dative-definite-genitive-singular":"necurățitorului","dative-genitive-indefinite-plural":"necurățitori","dative-definite-genitive-plural":"necurățitorilor","singular-vocative":"necurățitorule","plural-vocative":"necurățitorilor"}},{"word":"Necuratul","pos":"name","definitions":["the Devil"],"gender":"m","forms":{"dative-genitive":"lui Necuratul"}},{"word":"necurmat","pos":"adj","definitions":["continual"],"forms":{"feminine-singular":"necurmată","masculine-plural":"necurmați","feminine-neuter-plural":"necurmate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necurmat","error-unrecognized-form-feminine-indefinite-singular":"necurmată","error-unrecognized-form-indefinite-masculine-plural":"necurmați","error-unrecognized-form-feminine-indefinite-neuter-plural":"necurmate","definite-error-unrecognized-form-masculine-neuter-singular":"necurmatul","definite-error-unrecognized-form-feminine-singular":"necurmata","definite-error-unrecognized-form-masculine-plural":"necurmații","definite-error-unrecognized-form-feminine-neuter-plural":"necurmatele"}},{"word":"necuvântător","pos":"adj","definitions":["which cannot speak"],"forms":{"feminine-singular":"necuvântătoare","masculine-plural":"necuvântători","feminine-neuter-plural":"necuvântătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necuvântător","error-unrecognized-form-feminine-indefinite-singular":"necuvântătoare","error-unrecognized-form-indefinite-masculine-plural":"necuvântători","error-unrecognized-form-feminine-indefinite-neuter-plural":"necuvântătoare","definite-error-unrecognized-form-masculine-neuter-singular":"necuvântătorul","definite-error-unrecognized-form-feminine-singular":"necuvântătoarea","definite-error-unrecognized-form-masculine-plural":"necuvântătorii","definite-error-unrecognized-form-feminine-neuter-plural":"necuvântătoarele"}},{"word":"necuviincios","pos":"adj","definitions":["disrespectful"],"pronunciation":"/ˌne.ku.vi.inˈt͡ʃʲos/","forms":{"feminine-singular":"necuviincioasă","masculine-plural":"necuviincioși","feminine-neuter-plural":"necuviincioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necuviincios","error-unrecognized-form-feminine-indefinite-singular":"necuviincioasă","error-unrecognized-form-indefinite-masculine-plural":"necuviincioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"necuviincioase","definite-error-unrecognized-form-masculine-neuter-singular":"necuviinciosul","definite-error-unrecognized-form-feminine-singular":"necuviincioasa","definite-error-unrecognized-form-masculine-plural":"necuviincioșii","definite-error-unrecognized-form-feminine-neuter-plural":"necuviincioasele"}},{"word":"necuviință","pos":"noun","definitions":["indecency"],"forms":{"plural":"necuviințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"necuviință","accusative-definite-nominative-singular":"necuviința","accusative-indefinite-nominative-plural":"necuviințe","accusative-definite-nominative-plural":"necuviințele","dative-genitive-indefinite-singular":"necuviințe","dative-definite-genitive-singular":"necuviinței","dative-genitive-indefinite-plural":"necuviințe","dative-definite-genitive-plural":"necuviințelor","singular-vocative":"necuviință","plural-vocative":"necuviințelor"}},{"word":"necuvios","pos":"adj","definitions":["disrespectful"],"forms":{"feminine-singular":"necuvioasă","masculine-plural":"necuvioși","feminine-neuter-plural":"necuvioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"necuvios","error-unrecognized-form-feminine-indefinite-singular":"necuvioasă","error-unrecognized-form-indefinite-masculine-plural":"necuvioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"necuvioase","definite-error-unrecognized-form-masculine-neuter-singular":"necuviosul","definite-error-unrecognized-form-feminine-singular":"necuvioasa","definite-error-unrecognized-form-masculine-plural":"necuvioșii","definite-error-unrecognized-form-feminine-neuter-plural":"necuvioasele"}},{"word":"nedecapotabil","pos":"adj","definitions":["not convertible (about cars)"],"forms":{"feminine-singular":"nedecapotabilă","masculine-plural":"nedecapotabili","feminine-neuter-plural":"nedecapotabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedecapotabil","error-unrecognized-form-feminine-indefinite-singular":"nedecapotabilă","error-unrecognized-form-indefinite-masculine-plural":"nedecapotabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedecapotabile","definite-error-unrecognized-form-masculine-neuter-singular":"nedecapotabilul","definite-error-unrecognized-form-feminine-singular":"nedecapotabila","definite-error-unrecognized-form-masculine-plural":"nedecapotabilii","definite-error-unrecognized-form-feminine-neuter-plural":"nedecapotabilele"}},{"word":"nedeclinabil","pos":"adj","definitions":["indeclinable"],"forms":{"feminine-singular":"nedeclinabilă","masculine-plural":"nedeclinabili","feminine-neuter-plural":"nedeclinabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedeclinabil","error-unrecognized-form-feminine-indefinite-singular":"nedeclinabilă","error-unrecognized-form-indefinite-masculine-plural":"nedeclinabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedeclinabile","definite-error-unrecognized-form-masculine-neuter-singular":"nedeclinabilul","definite-error-unrecognized-form-feminine-singular":"nedeclinabila","definite-error-unrecognized-form-masculine-plural":"nedeclinabilii","definite-error-unrecognized-form-feminine-neuter-plural":"nedeclinabilele"}},{"word":"nedecolorat","pos":"adj","definitions":["not discolored"],"forms":{"feminine-singular":"nedecolorată","masculine-plural":"nedecolorați","feminine-neuter-plural":"nedecolorate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedecolorat","error-unrecognized-form-feminine-indefinite-singular":"nedecolorată","error-unrecognized-form-indefinite-masculine-plural":"nedecolorați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedecolorate","definite-error-unrecognized-form-masculine-neuter-singular":"nedecoloratul","definite-error-unrecognized-form-feminine-singular":"nedecolorata","definite-error-unrecognized-form-masculine-plural":"nedecolorații","definite-error-unrecognized-form-feminine-neuter-plural":"nedecoloratele"}},{"word":"nedefinibil","pos":"adj","definitions":["undefinable"],"forms":{"feminine-singular":"nedefinibilă","masculine-plural":"nedefinibili","feminine-neuter-plural":"nedefinibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedefinibil","error-unrecognized-form-feminine-indefinite-singular":"nedefinibilă","error-unrecognized-form-indefinite-masculine-plural":"nedefinibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedefinibile","definite-error-unrecognized-form-masculine-neuter-singular":"nedefinibilul","definite-error-unrecognized-form-feminine-singular":"nedefinibila","definite-error-unrecognized-form-masculine-plural":"nedefinibilii","definite-error-unrecognized-form-feminine-neuter-plural":"nedefinibilele"}},{"word":"nedefinit","pos":"adj","definitions":["undefined"],"forms":{"feminine-singular":"nedefinită","masculine-plural":"nedefiniți","feminine-neuter-plural":"nedefinite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedefinit","error-unrecognized-form-feminine-indefinite-singular":"nedefinită","error-unrecognized-form-indefinite-masculine-plural":"nedefiniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedefinite","definite-error-unrecognized-form-masculine-neuter-singular":"nedefinitul","definite-error-unrecognized-form-feminine-singular":"nedefinita","definite-error-unrecognized-form-masculine-plural":"nedefiniții","definite-error-unrecognized-form-feminine-neuter-plural":"nedefinitele"}},{"word":"nedeformabil","pos":"adj","definitions":["nondeformable"],"forms":{"feminine-singular":"nedeformabilă","masculine-plural":"nedeformabili","feminine-neuter-plural":"nedeformabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedeformabil","error-unrecognized-form-feminine-indefinite-singular":"nedeformabilă","error-unrecognized-form-indefinite-masculine-plural":"nedeformabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedeformabile","definite-error-unrecognized-form-masculine-neuter-singular":"nedeformabilul","definite-error-unrecognized-form-feminine-singular":"nedeformabila","definite-error-unrecognized-form-masculine-plural":"nedeformabilii","definite-error-unrecognized-form-feminine-neuter-plural":"nedeformabilele"}},{"word":"nedefrișabil","pos":"adj","definitions":["which cannot be razed (about a forest)"],"forms":{"feminine-singular":"nedefrișabilă","masculine-plural":"nedefrișabili","feminine-neuter-plural":"nedefrișabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedefrișabil","error-unrecognized-form-feminine-indefinite-singular":"nedefrișabilă","error-unrecognized-form-indefinite-masculine-plural":"nedefrișabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedefrișabile","definite-error-unrecognized-form-masculine-neuter-singular":"nedefrișabilul","definite-error-unrecognized-form-feminine-singular":"nedefrișabila","definite-error-unrecognized-form-masculine-plural":"nedefrișabilii","definite-error-unrecognized-form-feminine-neuter-plural":"nedefrișabilele"}},{"word":"Nedeia","pos":"name","definitions":["a village in Gighera, Dolj County, Romania"],"gender":"f"},{"word":"Nedeianu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Nedeianu"}},{"word":"Nedeicu","pos":"name","definitions":["a village in Mărașu, Brăila County, Romania"],"gender":"m"},{"word":"nedeie","pos":"noun","definitions":["rural festival"],"forms":{"plural":"nedeie","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"nedeie","accusative-definite-nominative-singular":"nedeiea","accusative-indefinite-nominative-plural":"nedeie","accusative-definite-nominative-plural":"nedeiele","dative-genitive-indefinite-singular":"nedeie","dative-definite-genitive-singular":"nedeiei","dative-genitive-indefinite-plural":"nedeie","dative-definite-genitive-plural":"nedeielor","singular-vocative":"nedeie","plural-vocative":"nedeielor"}},{"word":"Nedeița","pos":"name","definitions":["a river in Hunedoara County, Romania, tributary to the Râușor"],"gender":"f"},{"word":"Nedelcioiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nedelcioiu"}},{"word":"Nedelciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Nedelciuc"}},{"word":"Nedelcu","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Nedelcu"}},{"word":"Nedelcuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nedelcuț"}},{"word":"Nedelcuță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nedelcuță"}},{"word":"Nedelea","pos":"name","definitions":["a village in Ariceștii Rahtivani, Prahova County, Romania","a surname"],"gender":"f"},{"word":"Nedelescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nedelescu"}},{"word":"nedelicat","pos":"adj","definitions":["tactless"],"forms":{"feminine-singular":"nedelicată","masculine-plural":"nedelicați","feminine-neuter-plural":"nedelicate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedelicat","error-unrecognized-form-feminine-indefinite-singular":"nedelicată","error-unrecognized-form-indefinite-masculine-plural":"nedelicați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedelicate","definite-error-unrecognized-form-masculine-neuter-singular":"nedelicatul","definite-error-unrecognized-form-feminine-singular":"nedelicata","definite-error-unrecognized-form-masculine-plural":"nedelicații","definite-error-unrecognized-form-feminine-neuter-plural":"nedelicatele"}},{"word":"nedelicateță","pos":"noun","definitions":["obsolete form of nedelicatețe"],"forms":{"plural":"nedelicatețe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nedelicateță","accusative-definite-nominative-singular":"nedelicateța","accusative-indefinite-nominative-plural":"nedelicatețe","accusative-definite-nominative-plural":"nedelicatețele","dative-genitive-indefinite-singular":"nedelicatețe","dative-definite-genitive-singular":"nedelicateței","dative-genitive-indefinite-plural":"nedelicatețe","dative-definite-genitive-plural":"nedelicatețelor","singular-vocative":"nedelicateță","plural-vocative":"nedelicatețelor"}},{"word":"nedelicatețe","pos":"noun","definitions":["tactlessness"],"forms":{"plural":"nedelicateți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nedelicatețe","accusative-definite-nominative-singular":"nedelicatețea","accusative-indefinite-nominative-plural":"nedelicateți","accusative-definite-nominative-plural":"nedelicatețile","dative-genitive-indefinite-singular":"nedelicateți","dative-definite-genitive-singular":"nedelicateții","dative-genitive-indefinite-plural":"nedelicateți","dative-definite-genitive-plural":"nedelicateților","singular-vocative":"nedelicatețe","plural-vocative":"nedelicateților"}},{"word":"Nedeloaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Nedeloaia"}},{"word":"Nedeloiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nedeloiu"}},{"word":"Nedeluț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nedeluț"}},{"word":"nedemn","pos":"adj","definitions":["undignified, shameful"],"pronunciation":"/neˈdemn/","forms":{"feminine-singular":"nedemnă","masculine-plural":"nedemni","feminine-neuter-plural":"nedemne","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedemn","error-unrecognized-form-feminine-indefinite-singular":"nedemnă","error-unrecognized-form-indefinite-masculine-plural":"nedemni","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedemne","definite-error-unrecognized-form-masculine-neuter-singular":"nedemnul","definite-error-unrecognized-form-feminine-singular":"nedemna","definite-error-unrecognized-form-masculine-plural":"nedemnii","definite-error-unrecognized-form-feminine-neuter-plural":"nedemnele"}},{"word":"nedemonstrabil","pos":"adj","definitions":["indemonstrable"],"forms":{"feminine-singular":"nedemonstrabilă","masculine-plural":"nedemonstrabili","feminine-neuter-plural":"nedemonstrabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedemonstrabil","error-unrecognized-form-feminine-indefinite-singular":"nedemonstrabilă","error-unrecognized-form-indefinite-masculine-plural":"nedemonstrabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedemonstrabile","definite-error-unrecognized-form-masculine-neuter-singular":"nedemonstrabilul","definite-error-unrecognized-form-feminine-singular":"nedemonstrabila","definite-error-unrecognized-form-masculine-plural":"nedemonstrabilii","definite-error-unrecognized-form-feminine-neuter-plural":"nedemonstrabilele"}},{"word":"nedependență","pos":"noun","definitions":["independence"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"nedependență","accusative-definite-nominative":"nedependența","dative-genitive-indefinite":"nedependențe","dative-definite-genitive":"nedependenței","vocative":"nedependență"}},{"word":"nedeprins","pos":"adj","definitions":["unaccustomed"],"forms":{"feminine-singular":"nedeprinsă","masculine-plural":"nedeprinși","feminine-neuter-plural":"nedeprinse","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedeprins","error-unrecognized-form-feminine-indefinite-singular":"nedeprinsă","error-unrecognized-form-indefinite-masculine-plural":"nedeprinși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedeprinse","definite-error-unrecognized-form-masculine-neuter-singular":"nedeprinsul","definite-error-unrecognized-form-feminine-singular":"nedeprinsa","definite-error-unrecognized-form-masculine-plural":"nedeprinșii","definite-error-unrecognized-form-feminine-neuter-plural":"nedeprinsele"}},{"word":"neder","pos":"noun","definitions":["foolish, stupid, insane person"],"forms":{"plural":"nederi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neder","accusative-definite-nominative-singular":"nederul","accusative-indefinite-nominative-plural":"nederi","accusative-definite-nominative-plural":"nederii","dative-genitive-indefinite-singular":"neder","dative-definite-genitive-singular":"nederului","dative-genitive-indefinite-plural":"nederi","dative-definite-genitive-plural":"nederilor","singular-vocative":"nederule","plural-vocative":"nederilor"}},{"word":"nedesăvârșire","pos":"noun","definitions":["imperfection"],"forms":{"plural":"nedesăvârșiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nedesăvârșire","accusative-definite-nominative-singular":"nedesăvârșirea","accusative-indefinite-nominative-plural":"nedesăvârșiri","accusative-definite-nominative-plural":"nedesăvârșirile","dative-genitive-indefinite-singular":"nedesăvârșiri","dative-definite-genitive-singular":"nedesăvârșirii","dative-genitive-indefinite-plural":"nedesăvârșiri","dative-definite-genitive-plural":"nedesăvârșirilor","singular-vocative":"nedesăvârșire","plural-vocative":"nedesăvârșirilor"}},{"word":"nedescifrabil","pos":"adj","definitions":["undecipherable"],"forms":{"feminine-singular":"nedescifrabilă","masculine-plural":"nedescifrabili","feminine-neuter-plural":"nedescifrabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedescifrabil","error-unrecognized-form-feminine-indefinite-singular":"nedescifrabilă","error-unrecognized-form-indefinite-masculine-plural":"nedescifrabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedescifrabile","definite-error-unrecognized-form-masculine-neuter-singular":"nedescifrabilul","definite-error-unrecognized-form-feminine-singular":"nedescifrabila","definite-error-unrecognized-form-masculine-plural":"nedescifrabilii","definite-error-unrecognized-form-feminine-neuter-plural":"nedescifrabilele"}},{"word":"Nedescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nedescu"}},{"word":"nedeșirabil","pos":"adj","definitions":["tearproof"],"forms":{"feminine-singular":"nedeșirabilă","masculine-plural":"nedeșirabili","feminine-neuter-plural":"nedeșirabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedeșirabil","error-unrecognized-form-feminine-indefinite-singular":"nedeșirabilă","error-unrecognized-form-indefinite-masculine-plural":"nedeșirabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedeșirabile","definite-error-unrecognized-form-masculine-neuter-singular":"nedeșirabilul","definite-error-unrecognized-form-feminine-singular":"nedeșirabila","definite-error-unrecognized-form-masculine-plural":"nedeșirabilii","definite-error-unrecognized-form-feminine-neuter-plural":"nedeșirabilele"}},{"word":"nedeslușire","pos":"noun","definitions":["lack of clarity"],"forms":{"plural":"nedeslușiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nedeslușire","accusative-definite-nominative-singular":"nedeslușirea","accusative-indefinite-nominative-plural":"nedeslușiri","accusative-definite-nominative-plural":"nedeslușirile","dative-genitive-indefinite-singular":"nedeslușiri","dative-definite-genitive-singular":"nedeslușirii","dative-genitive-indefinite-plural":"nedeslușiri","dative-definite-genitive-plural":"nedeslușirilor","singular-vocative":"nedeslușire","plural-vocative":"nedeslușirilor"}},{"word":"nedeslușit","pos":"adj","definitions":["indistinct"],"forms":{"feminine-singular":"nedeslușită","masculine-plural":"nedeslușiți","feminine-neuter-plural":"nedeslușite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedeslușit","error-unrecognized-form-feminine-indefinite-singular":"nedeslușită","error-unrecognized-form-indefinite-masculine-plural":"nedeslușiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedeslușite","definite-error-unrecognized-form-masculine-neuter-singular":"nedeslușitul","definite-error-unrecognized-form-feminine-singular":"nedeslușita","definite-error-unrecognized-form-masculine-plural":"nedeslușiții","definite-error-unrecognized-form-feminine-neuter-plural":"nedeslușitele"}},{"word":"nedespărțit","pos":"adj","definitions":["inseparable"],"forms":{"feminine-singular":"nedespărțită","masculine-plural":"nedespărțiți","feminine-neuter-plural":"nedespărțite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedespărțit","error-unrecognized-form-feminine-indefinite-singular":"nedespărțită","error-unrecognized-form-indefinite-masculine-plural":"nedespărțiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedespărțite","definite-error-unrecognized-form-masculine-neuter-singular":"nedespărțitul","definite-error-unrecognized-form-feminine-singular":"nedespărțita","definite-error-unrecognized-form-masculine-plural":"nedespărțiții","definite-error-unrecognized-form-feminine-neuter-plural":"nedespărțitele"}},{"word":"nedeterminabil","pos":"adj","definitions":["indeterminable"],"forms":{"feminine-singular":"nedeterminabilă","masculine-plural":"nedeterminabili","feminine-neuter-plural":"nedeterminabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedeterminabil","error-unrecognized-form-feminine-indefinite-singular":"nedeterminabilă","error-unrecognized-form-indefinite-masculine-plural":"nedeterminabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedeterminabile","definite-error-unrecognized-form-masculine-neuter-singular":"nedeterminabilul","definite-error-unrecognized-form-feminine-singular":"nedeterminabila","definite-error-unrecognized-form-masculine-plural":"nedeterminabilii","definite-error-unrecognized-form-feminine-neuter-plural":"nedeterminabilele"}},{"word":"nedeterminare","pos":"noun","definitions":["indetermination","indefiniteness"],"forms":{"plural":"nedeterminări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nedeterminare","accusative-definite-nominative-singular":"nedeterminarea","accusative-indefinite-nominative-plural":"nedeterminari","accusative-definite-nominative-plural":"nedeterminarile","dative-genitive-indefinite-singular":"nedeterminari","dative-definite-genitive-singular":"nedeterminarii","dative-genitive-indefinite-plural":"nedeterminari","dative-definite-genitive-plural":"nedeterminarilor","singular-vocative":"nedeterminare","plural-vocative":"nedeterminarilor"}},{"word":"nedeterminat","pos":"adj","definitions":["indefinite"],"forms":{"feminine-singular":"nedeterminată","masculine-plural":"nedeterminați","feminine-neuter-plural":"nedeterminate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedeterminat","error-unrecognized-form-feminine-indefinite-singular":"nedeterminată","error-unrecognized-form-indefinite-masculine-plural":"nedeterminați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedeterminate","definite-error-unrecognized-form-masculine-neuter-singular":"nedeterminatul","definite-error-unrecognized-form-feminine-singular":"nedeterminata","definite-error-unrecognized-form-masculine-plural":"nedeterminații","definite-error-unrecognized-form-feminine-neuter-plural":"nedeterminatele"}},{"word":"nedezinfectat","pos":"adj","definitions":["not disinfected"],"forms":{"feminine-singular":"nedezinfectată","masculine-plural":"nedezinfectați","feminine-neuter-plural":"nedezinfectate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedezinfectat","error-unrecognized-form-feminine-indefinite-singular":"nedezinfectată","error-unrecognized-form-indefinite-masculine-plural":"nedezinfectați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedezinfectate","definite-error-unrecognized-form-masculine-neuter-singular":"nedezinfectatul","definite-error-unrecognized-form-feminine-singular":"nedezinfectata","definite-error-unrecognized-form-masculine-plural":"nedezinfectații","definite-error-unrecognized-form-feminine-neuter-plural":"nedezinfectatele"}},{"word":"nedezlegat","pos":"adj","definitions":["unsolved"],"forms":{"feminine-singular":"nedezlegată","masculine-plural":"nedezlegați","feminine-neuter-plural":"nedezlegate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedezlegat","error-unrecognized-form-feminine-indefinite-singular":"nedezlegată","error-unrecognized-form-indefinite-masculine-plural":"nedezlegați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedezlegate","definite-error-unrecognized-form-masculine-neuter-singular":"nedezlegatul","definite-error-unrecognized-form-feminine-singular":"nedezlegata","definite-error-unrecognized-form-masculine-plural":"nedezlegații","definite-error-unrecognized-form-feminine-neuter-plural":"nedezlegatele"}},{"word":"nedezlipit","pos":"adj","definitions":["inseparable"],"forms":{"feminine-singular":"nedezlipită","masculine-plural":"nedezlipiți","feminine-neuter-plural":"nedezlipite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedezlipit","error-unrecognized-form-feminine-indefinite-singular":"nedezlipită","error-unrecognized-form-indefinite-masculine-plural":"nedezlipiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedezlipite","definite-error-unrecognized-form-masculine-neuter-singular":"nedezlipitul","definite-error-unrecognized-form-feminine-singular":"nedezlipita","definite-error-unrecognized-form-masculine-plural":"nedezlipiții","definite-error-unrecognized-form-feminine-neuter-plural":"nedezlipitele"}},{"word":"nedezmințit","pos":"adj","definitions":["consistent, coherent"],"forms":{"feminine-singular":"nedezmințită","masculine-plural":"nedezmințiți","feminine-neuter-plural":"nedezmințite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedezmințit","error-unrecognized-form-feminine-indefinite-singular":"nedezmințită","error-unrecognized-form-indefinite-masculine-plural":"nedezmințiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedezmințite","definite-error-unrecognized-form-masculine-neuter-singular":"nedezmințitul","definite-error-unrecognized-form-feminine-singular":"nedezmințita","definite-error-unrecognized-form-masculine-plural":"nedezmințiții","definite-error-unrecognized-form-feminine-neuter-plural":"nedezmințitele"}},{"word":"nediferențiat","pos":"adj","definitions":["undifferentiated"],"forms":{"feminine-singular":"nediferențiată","masculine-plural":"nediferențiați","feminine-neuter-plural":"nediferențiate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nediferențiat","error-unrecognized-form-feminine-indefinite-singular":"nediferențiată","error-unrecognized-form-indefinite-masculine-plural":"nediferențiați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nediferențiate","definite-error-unrecognized-form-masculine-neuter-singular":"nediferențiatul","definite-error-unrecognized-form-feminine-singular":"nediferențiata","definite-error-unrecognized-form-masculine-plural":"nediferențiații","definite-error-unrecognized-form-feminine-neuter-plural":"nediferențiatele"}},{"word":"nedigestie","pos":"noun","definitions":["indigestion"],"forms":{"plural":"nedigestii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nedigestie","accusative-definite-nominative-singular":"nedigestia","accusative-indefinite-nominative-plural":"nedigestii","accusative-definite-nominative-plural":"nedigestiile","dative-genitive-indefinite-singular":"nedigestii","dative-definite-genitive-singular":"nedigestiei","dative-genitive-indefinite-plural":"nedigestii","dative-definite-genitive-plural":"nedigestiilor","singular-vocative":"nedigestie","plural-vocative":"nedigestiilor"}},{"word":"nedințire","pos":"noun","definitions":["a lack of teeth"],"forms":{"plural":"nedințiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nedințire","accusative-definite-nominative-singular":"nedințirea","accusative-indefinite-nominative-plural":"nedințiri","accusative-definite-nominative-plural":"nedințirile","dative-genitive-indefinite-singular":"nedințiri","dative-definite-genitive-singular":"nedințirii","dative-genitive-indefinite-plural":"nedințiri","dative-definite-genitive-plural":"nedințirilor","singular-vocative":"nedințire","plural-vocative":"nedințirilor"}},{"word":"nedisciplinat","pos":"adj","definitions":["undisciplined"],"forms":{"feminine-singular":"nedisciplinată","masculine-plural":"nedisciplinați","feminine-neuter-plural":"nedisciplinate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedisciplinat","error-unrecognized-form-feminine-indefinite-singular":"nedisciplinată","error-unrecognized-form-indefinite-masculine-plural":"nedisciplinați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedisciplinate","definite-error-unrecognized-form-masculine-neuter-singular":"nedisciplinatul","definite-error-unrecognized-form-feminine-singular":"nedisciplinata","definite-error-unrecognized-form-masculine-plural":"nedisciplinații","definite-error-unrecognized-form-feminine-neuter-plural":"nedisciplinatele"}},{"word":"nediseminare","pos":"noun","definitions":["non-proliferation"],"forms":{"plural":"nediseminări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nediseminare","accusative-definite-nominative-singular":"nediseminarea","accusative-indefinite-nominative-plural":"nediseminari","accusative-definite-nominative-plural":"nediseminarile","dative-genitive-indefinite-singular":"nediseminari","dative-definite-genitive-singular":"nediseminarii","dative-genitive-indefinite-plural":"nediseminari","dative-definite-genitive-plural":"nediseminarilor","singular-vocative":"nediseminare","plural-vocative":"nediseminarilor"}},{"word":"nedispus","pos":"adj","definitions":["disinclined"],"forms":{"feminine-singular":"nedispusă","masculine-plural":"nedispuși","feminine-neuter-plural":"nedispuse","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedispus","error-unrecognized-form-feminine-indefinite-singular":"nedispusă","error-unrecognized-form-indefinite-masculine-plural":"nedispuși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedispuse","definite-error-unrecognized-form-masculine-neuter-singular":"nedispusul","definite-error-unrecognized-form-feminine-singular":"nedispusa","definite-error-unrecognized-form-masculine-plural":"nedispușii","definite-error-unrecognized-form-feminine-neuter-plural":"nedispusele"}},{"word":"nedistribuit","pos":"adj","definitions":["undistributed"],"forms":{"feminine-singular":"nedistribuită","masculine-plural":"nedistribuiți","feminine-neuter-plural":"nedistribuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedistribuit","error-unrecognized-form-feminine-indefinite-singular":"nedistribuită","error-unrecognized-form-indefinite-masculine-plural":"nedistribuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedistribuite","definite-error-unrecognized-form-masculine-neuter-singular":"nedistribuitul","definite-error-unrecognized-form-feminine-singular":"nedistribuita","definite-error-unrecognized-form-masculine-plural":"nedistribuiții","definite-error-unrecognized-form-feminine-neuter-plural":"nedistribuitele"}},{"word":"Nediță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nediță"}},{"word":"nedivizat","pos":"adj","definitions":["undivided"],"forms":{"feminine-singular":"nedivizată","masculine-plural":"nedivizați","feminine-neuter-plural":"nedivizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedivizat","error-unrecognized-form-feminine-indefinite-singular":"nedivizată","error-unrecognized-form-indefinite-masculine-plural":"nedivizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedivizate","definite-error-unrecognized-form-masculine-neuter-singular":"nedivizatul","definite-error-unrecognized-form-feminine-singular":"nedivizata","definite-error-unrecognized-form-masculine-plural":"nedivizații","definite-error-unrecognized-form-feminine-neuter-plural":"nedivizatele"}},{"word":"nedivizibil","pos":"adj","definitions":["indivisible"],"forms":{"feminine-singular":"nedivizibilă","masculine-plural":"nedivizibili","feminine-neuter-plural":"nedivizibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedivizibil","error-unrecognized-form-feminine-indefinite-singular":"nedivizibilă","error-unrecognized-form-indefinite-masculine-plural":"nedivizibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedivizibile","definite-error-unrecognized-form-masculine-neuter-singular":"nedivizibilul","definite-error-unrecognized-form-feminine-singular":"nedivizibila","definite-error-unrecognized-form-masculine-plural":"nedivizibilii","definite-error-unrecognized-form-feminine-neuter-plural":"nedivizibilele"}},{"word":"nedizolvat","pos":"adj","definitions":["undissolved"],"forms":{"feminine-singular":"nedizolvată","masculine-plural":"nedizolvați","feminine-neuter-plural":"nedizolvate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedizolvat","error-unrecognized-form-feminine-indefinite-singular":"nedizolvată","error-unrecognized-form-indefinite-masculine-plural":"nedizolvați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedizolvate","definite-error-unrecognized-form-masculine-neuter-singular":"nedizolvatul","definite-error-unrecognized-form-feminine-singular":"nedizolvata","definite-error-unrecognized-form-masculine-plural":"nedizolvații","definite-error-unrecognized-form-feminine-neuter-plural":"nedizolvatele"}},{"word":"nedomolit","pos":"adj","definitions":["restless"],"forms":{"feminine-singular":"nedomolită","masculine-plural":"nedomoliți","feminine-neuter-plural":"nedomolite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedomolit","error-unrecognized-form-feminine-indefinite-singular":"nedomolită","error-unrecognized-form-indefinite-masculine-plural":"nedomoliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedomolite","definite-error-unrecognized-form-masculine-neuter-singular":"nedomolitul","definite-error-unrecognized-form-feminine-singular":"nedomolita","definite-error-unrecognized-form-masculine-plural":"nedomoliții","definite-error-unrecognized-form-feminine-neuter-plural":"nedomolitele"}},{"word":"nedorit","pos":"adj","definitions":["unwanted"],"forms":{"feminine-singular":"nedorită","masculine-plural":"nedoriți","feminine-neuter-plural":"nedorite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedorit","error-unrecognized-form-feminine-indefinite-singular":"nedorită","error-unrecognized-form-indefinite-masculine-plural":"nedoriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedorite","definite-error-unrecognized-form-masculine-neuter-singular":"nedoritul","definite-error-unrecognized-form-feminine-singular":"nedorita","definite-error-unrecognized-form-masculine-plural":"nedoriții","definite-error-unrecognized-form-feminine-neuter-plural":"nedoritele"}},{"word":"nedormire","pos":"noun","definitions":["lack of sleep"],"forms":{"plural":"nedormiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nedormire","accusative-definite-nominative-singular":"nedormirea","accusative-indefinite-nominative-plural":"nedormiri","accusative-definite-nominative-plural":"nedormirile","dative-genitive-indefinite-singular":"nedormiri","dative-definite-genitive-singular":"nedormirii","dative-genitive-indefinite-plural":"nedormiri","dative-definite-genitive-plural":"nedormirilor","singular-vocative":"nedormire","plural-vocative":"nedormirilor"}},{"word":"nedormit","pos":"adj","definitions":["sleepless"],"forms":{"feminine-singular":"nedormită","masculine-plural":"nedormiți","feminine-neuter-plural":"nedormite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedormit","error-unrecognized-form-feminine-indefinite-singular":"nedormită","error-unrecognized-form-indefinite-masculine-plural":"nedormiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedormite","definite-error-unrecognized-form-masculine-neuter-singular":"nedormitul","definite-error-unrecognized-form-feminine-singular":"nedormita","definite-error-unrecognized-form-masculine-plural":"nedormiții","definite-error-unrecognized-form-feminine-neuter-plural":"nedormitele"}},{"word":"nedospit","pos":"adj","definitions":["unleavened"],"forms":{"feminine-singular":"nedospită","masculine-plural":"nedospiți","feminine-neuter-plural":"nedospite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedospit","error-unrecognized-form-feminine-indefinite-singular":"nedospită","error-unrecognized-form-indefinite-masculine-plural":"nedospiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedospite","definite-error-unrecognized-form-masculine-neuter-singular":"nedospitul","definite-error-unrecognized-form-feminine-singular":"nedospita","definite-error-unrecognized-form-masculine-plural":"nedospiții","definite-error-unrecognized-form-feminine-neuter-plural":"nedospitele"}},{"word":"nedrept","pos":"adj","definitions":["wrong, unfair, unjust, unrighteous"],"pronunciation":"/neˈdrept/","forms":{"feminine-singular":"nedreaptă","masculine-plural":"nedrepți","feminine-neuter-plural":"nedrepte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedrept","error-unrecognized-form-feminine-indefinite-singular":"nedreaptă","error-unrecognized-form-indefinite-masculine-plural":"nedrepți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedrepte","definite-error-unrecognized-form-masculine-neuter-singular":"nedreptul","definite-error-unrecognized-form-feminine-singular":"nedreapta","definite-error-unrecognized-form-masculine-plural":"nedrepții","definite-error-unrecognized-form-feminine-neuter-plural":"nedreptele"}},{"word":"nedreptate","pos":"noun","definitions":["iniquity","injustice"],"forms":{"plural":"nedreptăți"}},{"word":"nedreptăți","pos":"verb","definitions":["to wrong"],"forms":{"canonical":"a nedreptăți 4th conjugation","present-singular-third-person":"nedreptățește","participle-past":"nedreptățit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nedreptăți","gerund":"nedreptățind","first-person-indicative-present-singular":"nedreptățesc","indicative-present-second-person-singular":"nedreptățești","indicative-present-singular-third-person":"nedreptățește","first-person-indicative-plural-present":"nedreptățim","indicative-plural-present-second-person":"nedreptățiți","indicative-plural-present-third-person":"nedreptățesc","first-person-imperfect-indicative-singular":"nedreptățeam","imperfect-indicative-second-person-singular":"nedreptățeai","imperfect-indicative-singular-third-person":"nedreptățea","first-person-imperfect-indicative-plural":"nedreptățeam","imperfect-indicative-plural-second-person":"nedreptățeați","imperfect-indicative-plural-third-person":"nedreptățeau","first-person-indicative-perfect-singular":"nedreptății","indicative-perfect-second-person-singular":"nedreptățiși","indicative-perfect-singular-third-person":"nedreptăți","first-person-indicative-perfect-plural":"nedreptățirăm","indicative-perfect-plural-second-person":"nedreptățirăți","indicative-perfect-plural-third-person":"nedreptățiră","first-person-indicative-pluperfect-singular":"nedreptățisem","indicative-pluperfect-second-person-singular":"nedreptățiseși","indicative-pluperfect-singular-third-person":"nedreptățise","first-person-indicative-pluperfect-plural":"nedreptățiserăm","indicative-pluperfect-plural-second-person":"nedreptățiserăți","indicative-pluperfect-plural-third-person":"nedreptățiseră","first-person-present-singular-subjunctive":"să nedreptățesc","present-second-person-singular-subjunctive":"să nedreptățești","present-singular-subjunctive-third-person":"să nedreptățească","first-person-plural-present-subjunctive":"să nedreptățim","plural-present-second-person-subjunctive":"să nedreptățiți","plural-present-subjunctive-third-person":"să nedreptățească","imperative-second-person-singular":"nedreptățește","imperative-plural-second-person":"nedreptățiți","imperative-negative-second-person-singular":"nu nedreptăți","imperative-negative-plural-second-person":"nu nedreptățiți"}},{"word":"nedreptățire","pos":"noun","definitions":["injustice"],"forms":{"plural":"nedreptățiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nedreptățire","accusative-definite-nominative-singular":"nedreptățirea","accusative-indefinite-nominative-plural":"nedreptățiri","accusative-definite-nominative-plural":"nedreptățirile","dative-genitive-indefinite-singular":"nedreptățiri","dative-definite-genitive-singular":"nedreptățirii","dative-genitive-indefinite-plural":"nedreptățiri","dative-definite-genitive-plural":"nedreptățirilor","singular-vocative":"nedreptățire","plural-vocative":"nedreptățirilor"}},{"word":"nedreptățit","pos":"adj","definitions":["wronged"],"forms":{"feminine-singular":"nedreptățită","masculine-plural":"nedreptățiți","feminine-neuter-plural":"nedreptățite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedreptățit","error-unrecognized-form-feminine-indefinite-singular":"nedreptățită","error-unrecognized-form-indefinite-masculine-plural":"nedreptățiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedreptățite","definite-error-unrecognized-form-masculine-neuter-singular":"nedreptățitul","definite-error-unrecognized-form-feminine-singular":"nedreptățita","definite-error-unrecognized-form-masculine-plural":"nedreptățiții","definite-error-unrecognized-form-feminine-neuter-plural":"nedreptățitele"}},{"word":"nedreptățit","pos":"verb","definitions":["past participle of nedreptăți"],"forms":{"participle-past":"of nedreptăți"}},{"word":"nedumeri","pos":"verb","definitions":["to perplex"],"forms":{"canonical":"a nedumeri 4th conjugation","present-singular-third-person":"nedumerește","participle-past":"nedumerit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nedumeri","gerund":"nedumerind","first-person-indicative-present-singular":"nedumeresc","indicative-present-second-person-singular":"nedumerești","indicative-present-singular-third-person":"nedumerește","first-person-indicative-plural-present":"nedumerim","indicative-plural-present-second-person":"nedumeriți","indicative-plural-present-third-person":"nedumeresc","first-person-imperfect-indicative-singular":"nedumeream","imperfect-indicative-second-person-singular":"nedumereai","imperfect-indicative-singular-third-person":"nedumerea","first-person-imperfect-indicative-plural":"nedumeream","imperfect-indicative-plural-second-person":"nedumereați","imperfect-indicative-plural-third-person":"nedumereau","first-person-indicative-perfect-singular":"nedumerii","indicative-perfect-second-person-singular":"nedumeriși","indicative-perfect-singular-third-person":"nedumeri","first-person-indicative-perfect-plural":"nedumerirăm","indicative-perfect-plural-second-person":"nedumerirăți","indicative-perfect-plural-third-person":"nedumeriră","first-person-indicative-pluperfect-singular":"nedumerisem","indicative-pluperfect-second-person-singular":"nedumeriseși","indicative-pluperfect-singular-third-person":"nedumerise","first-person-indicative-pluperfect-plural":"nedumeriserăm","indicative-pluperfect-plural-second-person":"nedumeriserăți","indicative-pluperfect-plural-third-person":"nedumeriseră","first-person-present-singular-subjunctive":"să nedumeresc","present-second-person-singular-subjunctive":"să nedumerești","present-singular-subjunctive-third-person":"să nedumerească","first-person-plural-present-subjunctive":"să nedumerim","plural-present-second-person-subjunctive":"să nedumeriți","plural-present-subjunctive-third-person":"să nedumerească","imperative-second-person-singular":"nedumerește","imperative-plural-second-person":"nedumeriți","imperative-negative-second-person-singular":"nu nedumeri","imperative-negative-plural-second-person":"nu nedumeriți"}},{"word":"nedumerire","pos":"noun","definitions":["perplexity"],"forms":{"plural":"nedumeriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nedumerire","accusative-definite-nominative-singular":"nedumerirea","accusative-indefinite-nominative-plural":"nedumeriri","accusative-definite-nominative-plural":"nedumeririle","dative-genitive-indefinite-singular":"nedumeriri","dative-definite-genitive-singular":"nedumeririi","dative-genitive-indefinite-plural":"nedumeriri","dative-definite-genitive-plural":"nedumeririlor","singular-vocative":"nedumerire","plural-vocative":"nedumeririlor"}},{"word":"nedumerit","pos":"adj","definitions":["perplexed"],"forms":{"feminine-singular":"nedumerită","masculine-plural":"nedumeriți","feminine-neuter-plural":"nedumerite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedumerit","error-unrecognized-form-feminine-indefinite-singular":"nedumerită","error-unrecognized-form-indefinite-masculine-plural":"nedumeriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedumerite","definite-error-unrecognized-form-masculine-neuter-singular":"nedumeritul","definite-error-unrecognized-form-feminine-singular":"nedumerita","definite-error-unrecognized-form-masculine-plural":"nedumeriții","definite-error-unrecognized-form-feminine-neuter-plural":"nedumeritele"}},{"word":"nedumiri","pos":"verb","definitions":["obsolete form of nedumeri"],"forms":{"canonical":"a nedumiri 4th conjugation","present-singular-third-person":"nedumirește","participle-past":"nedumirit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nedumiri","gerund":"nedumirind","first-person-indicative-present-singular":"nedumiresc","indicative-present-second-person-singular":"nedumirești","indicative-present-singular-third-person":"nedumirește","first-person-indicative-plural-present":"nedumirim","indicative-plural-present-second-person":"nedumiriți","indicative-plural-present-third-person":"nedumiresc","first-person-imperfect-indicative-singular":"nedumiream","imperfect-indicative-second-person-singular":"nedumireai","imperfect-indicative-singular-third-person":"nedumirea","first-person-imperfect-indicative-plural":"nedumiream","imperfect-indicative-plural-second-person":"nedumireați","imperfect-indicative-plural-third-person":"nedumireau","first-person-indicative-perfect-singular":"nedumirii","indicative-perfect-second-person-singular":"nedumiriși","indicative-perfect-singular-third-person":"nedumiri","first-person-indicative-perfect-plural":"nedumirirăm","indicative-perfect-plural-second-person":"nedumirirăți","indicative-perfect-plural-third-person":"nedumiriră","first-person-indicative-pluperfect-singular":"nedumirisem","indicative-pluperfect-second-person-singular":"nedumiriseși","indicative-pluperfect-singular-third-person":"nedumirise","first-person-indicative-pluperfect-plural":"nedumiriserăm","indicative-pluperfect-plural-second-person":"nedumiriserăți","indicative-pluperfect-plural-third-person":"nedumiriseră","first-person-present-singular-subjunctive":"să nedumiresc","present-second-person-singular-subjunctive":"să nedumirești","present-singular-subjunctive-third-person":"să nedumirească","first-person-plural-present-subjunctive":"să nedumirim","plural-present-second-person-subjunctive":"să nedumiriți","plural-present-subjunctive-third-person":"să nedumirească","imperative-second-person-singular":"nedumirește","imperative-plural-second-person":"nedumiriți","imperative-negative-second-person-singular":"nu nedumiri","imperative-negative-plural-second-person":"nu nedumiriți"}},{"word":"nedumirit","pos":"adj","definitions":["alternative form of nedumerit"],"forms":{"feminine-singular":"nedumirită","masculine-plural":"nedumiriți","feminine-neuter-plural":"nedumirite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedumirit","error-unrecognized-form-feminine-indefinite-singular":"nedumirită","error-unrecognized-form-indefinite-masculine-plural":"nedumiriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedumirite","definite-error-unrecognized-form-masculine-neuter-singular":"nedumiritul","definite-error-unrecognized-form-feminine-singular":"nedumirita","definite-error-unrecognized-form-masculine-plural":"nedumiriții","definite-error-unrecognized-form-feminine-neuter-plural":"nedumiritele"}},{"word":"nedureros","pos":"adj","definitions":["painless"],"forms":{"feminine-singular":"nedureroasă","masculine-plural":"nedureroși","feminine-neuter-plural":"nedureroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nedureros","error-unrecognized-form-feminine-indefinite-singular":"nedureroasă","error-unrecognized-form-indefinite-masculine-plural":"nedureroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nedureroase","definite-error-unrecognized-form-masculine-neuter-singular":"nedurerosul","definite-error-unrecognized-form-feminine-singular":"nedureroasa","definite-error-unrecognized-form-masculine-plural":"nedureroșii","definite-error-unrecognized-form-feminine-neuter-plural":"nedureroasele"}},{"word":"neechilibrat","pos":"adj","definitions":["unbalanced"],"forms":{"feminine-singular":"neechilibrată","masculine-plural":"neechilibrați","feminine-neuter-plural":"neechilibrate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neechilibrat","error-unrecognized-form-feminine-indefinite-singular":"neechilibrată","error-unrecognized-form-indefinite-masculine-plural":"neechilibrați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neechilibrate","definite-error-unrecognized-form-masculine-neuter-singular":"neechilibratul","definite-error-unrecognized-form-feminine-singular":"neechilibrata","definite-error-unrecognized-form-masculine-plural":"neechilibrații","definite-error-unrecognized-form-feminine-neuter-plural":"neechilibratele"}},{"word":"neechitabil","pos":"adj","definitions":["inequitable, unfair"],"forms":{"feminine-singular":"neechitabilă","masculine-plural":"neechitabili","feminine-neuter-plural":"neechitabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neechitabil","error-unrecognized-form-feminine-indefinite-singular":"neechitabilă","error-unrecognized-form-indefinite-masculine-plural":"neechitabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neechitabile","definite-error-unrecognized-form-masculine-neuter-singular":"neechitabilul","definite-error-unrecognized-form-feminine-singular":"neechitabila","definite-error-unrecognized-form-masculine-plural":"neechitabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neechitabilele"}},{"word":"neechitate","pos":"noun","definitions":["inequity"],"forms":{"plural":"neechități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neechitate","accusative-definite-nominative-singular":"neechitatea","accusative-indefinite-nominative-plural":"neechități","accusative-definite-nominative-plural":"neechitățile","dative-genitive-indefinite-singular":"neechități","dative-definite-genitive-singular":"neechității","dative-genitive-indefinite-plural":"neechități","dative-definite-genitive-plural":"neechităților","singular-vocative":"neechitate","plural-vocative":"neechităților"}},{"word":"neeconomic","pos":"adj","definitions":["uneconomical"],"forms":{"feminine-singular":"neeconomică","masculine-plural":"neeconomici","feminine-neuter-plural":"neeconomice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neeconomic","error-unrecognized-form-feminine-indefinite-singular":"neeconomică","error-unrecognized-form-indefinite-masculine-plural":"neeconomici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neeconomice","definite-error-unrecognized-form-masculine-neuter-singular":"neeconomicul","definite-error-unrecognized-form-feminine-singular":"neeconomica","definite-error-unrecognized-form-masculine-plural":"neeconomicii","definite-error-unrecognized-form-feminine-neuter-plural":"neeconomicele"}},{"word":"neeconomicos","pos":"adj","definitions":["uneconomic"],"forms":{"feminine-singular":"neeconomicoasă","masculine-plural":"neeconomicoși","feminine-neuter-plural":"neeconomicoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neeconomicos","error-unrecognized-form-feminine-indefinite-singular":"neeconomicoasă","error-unrecognized-form-indefinite-masculine-plural":"neeconomicoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"neeconomicoase","definite-error-unrecognized-form-masculine-neuter-singular":"neeconomicosul","definite-error-unrecognized-form-feminine-singular":"neeconomicoasa","definite-error-unrecognized-form-masculine-plural":"neeconomicoșii","definite-error-unrecognized-form-feminine-neuter-plural":"neeconomicoasele"}},{"word":"needificator","pos":"adj","definitions":["unclear"],"forms":{"feminine-singular":"needificatoare","masculine-plural":"needificatori","feminine-neuter-plural":"needificatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"needificator","error-unrecognized-form-feminine-indefinite-singular":"needificatoare","error-unrecognized-form-indefinite-masculine-plural":"needificatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"needificatoare","definite-error-unrecognized-form-masculine-neuter-singular":"needificatorul","definite-error-unrecognized-form-feminine-singular":"needificatoarea","definite-error-unrecognized-form-masculine-plural":"needificatorii","definite-error-unrecognized-form-feminine-neuter-plural":"needificatoarele"}},{"word":"neefectuat","pos":"adj","definitions":["not done"],"forms":{"feminine-singular":"neefectuată","masculine-plural":"neefectuați","feminine-neuter-plural":"neefectuate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neefectuat","error-unrecognized-form-feminine-indefinite-singular":"neefectuată","error-unrecognized-form-indefinite-masculine-plural":"neefectuați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neefectuate","definite-error-unrecognized-form-masculine-neuter-singular":"neefectuatul","definite-error-unrecognized-form-feminine-singular":"neefectuata","definite-error-unrecognized-form-masculine-plural":"neefectuații","definite-error-unrecognized-form-feminine-neuter-plural":"neefectuatele"}},{"word":"neeficient","pos":"adj","definitions":["ineffective"],"forms":{"feminine-singular":"neeficientă","masculine-plural":"neeficienți","feminine-neuter-plural":"neeficiente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neeficient","error-unrecognized-form-feminine-indefinite-singular":"neeficientă","error-unrecognized-form-indefinite-masculine-plural":"neeficienți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neeficiente","definite-error-unrecognized-form-masculine-neuter-singular":"neeficientul","definite-error-unrecognized-form-feminine-singular":"neeficienta","definite-error-unrecognized-form-masculine-plural":"neeficienții","definite-error-unrecognized-form-feminine-neuter-plural":"neeficientele"}},{"word":"neeficiență","pos":"noun","definitions":["inefficiency"],"forms":{"plural":"neeficiențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neeficiență","accusative-definite-nominative-singular":"neeficiența","accusative-indefinite-nominative-plural":"neeficiențe","accusative-definite-nominative-plural":"neeficiențele","dative-genitive-indefinite-singular":"neeficiențe","dative-definite-genitive-singular":"neeficienței","dative-genitive-indefinite-plural":"neeficiențe","dative-definite-genitive-plural":"neeficiențelor","singular-vocative":"neeficiență","plural-vocative":"neeficiențelor"}},{"word":"neegalabil","pos":"adj","definitions":["unequalable"],"forms":{"feminine-singular":"neegalabilă","masculine-plural":"neegalabili","feminine-neuter-plural":"neegalabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neegalabil","error-unrecognized-form-feminine-indefinite-singular":"neegalabilă","error-unrecognized-form-indefinite-masculine-plural":"neegalabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neegalabile","definite-error-unrecognized-form-masculine-neuter-singular":"neegalabilul","definite-error-unrecognized-form-feminine-singular":"neegalabila","definite-error-unrecognized-form-masculine-plural":"neegalabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neegalabilele"}},{"word":"neegalat","pos":"adj","definitions":["unequalled"],"forms":{"feminine-singular":"neegalată","masculine-plural":"neegalați","feminine-neuter-plural":"neegalate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neegalat","error-unrecognized-form-feminine-indefinite-singular":"neegalată","error-unrecognized-form-indefinite-masculine-plural":"neegalați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neegalate","definite-error-unrecognized-form-masculine-neuter-singular":"neegalatul","definite-error-unrecognized-form-feminine-singular":"neegalata","definite-error-unrecognized-form-masculine-plural":"neegalații","definite-error-unrecognized-form-feminine-neuter-plural":"neegalatele"}},{"word":"neegalitate","pos":"noun","definitions":["inequality"],"forms":{"plural":"neegalități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neegalitate","accusative-definite-nominative-singular":"neegalitatea","accusative-indefinite-nominative-plural":"neegalități","accusative-definite-nominative-plural":"neegalitățile","dative-genitive-indefinite-singular":"neegalități","dative-definite-genitive-singular":"neegalității","dative-genitive-indefinite-plural":"neegalități","dative-definite-genitive-plural":"neegalităților","singular-vocative":"neegalitate","plural-vocative":"neegalităților"}},{"word":"neelegant","pos":"adj","definitions":["unladylike"],"forms":{"feminine-singular":"neelegantă","masculine-plural":"neeleganți","feminine-neuter-plural":"neelegante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neelegant","error-unrecognized-form-feminine-indefinite-singular":"neelegantă","error-unrecognized-form-indefinite-masculine-plural":"neeleganți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neelegante","definite-error-unrecognized-form-masculine-neuter-singular":"neelegantul","definite-error-unrecognized-form-feminine-singular":"neeleganta","definite-error-unrecognized-form-masculine-plural":"neeleganții","definite-error-unrecognized-form-feminine-neuter-plural":"neelegantele"}},{"word":"neeleganță","pos":"noun","definitions":["inelegance"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"neeleganță","accusative-definite-nominative":"neeleganța","dative-genitive-indefinite":"neeleganțe","dative-definite-genitive":"neeleganței","vocative":"neeleganță"}},{"word":"neeligibil","pos":"adj","definitions":["ineligible"],"forms":{"feminine-singular":"neeligibilă","masculine-plural":"neeligibili","feminine-neuter-plural":"neeligibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neeligibil","error-unrecognized-form-feminine-indefinite-singular":"neeligibilă","error-unrecognized-form-indefinite-masculine-plural":"neeligibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neeligibile","definite-error-unrecognized-form-masculine-neuter-singular":"neeligibilul","definite-error-unrecognized-form-feminine-singular":"neeligibila","definite-error-unrecognized-form-masculine-plural":"neeligibilii","definite-error-unrecognized-form-feminine-neuter-plural":"neeligibilele"}},{"word":"neeligibilitate","pos":"noun","definitions":["ineligibility"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neeligibilitate","accusative-definite-nominative":"neeligibilitatea","dative-genitive-indefinite":"neeligibilități","dative-definite-genitive":"neeligibilității","vocative":"neeligibilitate"}},{"word":"neepuizabil","pos":"adj","definitions":["inexhaustible"],"forms":{"feminine-singular":"neepuizabilă","masculine-plural":"neepuizabili","feminine-neuter-plural":"neepuizabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neepuizabil","error-unrecognized-form-feminine-indefinite-singular":"neepuizabilă","error-unrecognized-form-indefinite-masculine-plural":"neepuizabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neepuizabile","definite-error-unrecognized-form-masculine-neuter-singular":"neepuizabilul","definite-error-unrecognized-form-feminine-singular":"neepuizabila","definite-error-unrecognized-form-masculine-plural":"neepuizabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neepuizabilele"}},{"word":"neerlandez","pos":"adj","definitions":["of the Netherlands; Dutch"],"pronunciation":"/ˌne.er.lanˈdez/","forms":{"feminine-singular":"neerlandeză","masculine-plural":"neerlandezi","feminine-neuter-plural":"neerlandeze","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"neerlandez","error-unrecognized-form-feminine-indefinite-singular":"neerlandeză","error-unrecognized-form-indefinite-masculine-plural":"neerlandezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"neerlandeze","definite-error-unrecognized-form-masculine-neuter-singular":"neerlandezul","definite-error-unrecognized-form-feminine-singular":"neerlandeza","definite-error-unrecognized-form-masculine-plural":"neerlandezii","definite-error-unrecognized-form-feminine-neuter-plural":"neerlandezele"}},{"word":"neerlandez","pos":"noun","definitions":["Dutch man"],"pronunciation":"/ˌne.er.lanˈdez/","forms":{"plural":"neerlandezi","feminine":"equivalent neerlandeză","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neerlandez","accusative-definite-nominative-singular":"neerlandezul","accusative-indefinite-nominative-plural":"neerlandezi","accusative-definite-nominative-plural":"neerlandezii","dative-genitive-indefinite-singular":"neerlandez","dative-definite-genitive-singular":"neerlandezului","dative-genitive-indefinite-plural":"neerlandezi","dative-definite-genitive-plural":"neerlandezilor","singular-vocative":"neerlandezule","plural-vocative":"neerlandezilor"}},{"word":"neerlandeză","pos":"adj","definitions":["nominative/accusative feminine singular of neerlandez"],"pronunciation":"[ˌne.er.lanˈde.zə]"},{"word":"neerlandeză","pos":"noun","definitions":["a Dutch woman"],"pronunciation":"[ˌne.er.lanˈde.zə]","forms":{"plural":"neerlandeze","masculine":"equivalent neerlandez","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neerlandeză","accusative-definite-nominative-singular":"neerlandeza","accusative-indefinite-nominative-plural":"neerlandeze","accusative-definite-nominative-plural":"neerlandezele","dative-genitive-indefinite-singular":"neerlandeze","dative-definite-genitive-singular":"neerlandezei","dative-genitive-indefinite-plural":"neerlandeze","dative-definite-genitive-plural":"neerlandezelor","singular-vocative":"neerlandeză","plural-vocative":"neerlandezelor"}},{"word":"neerlandeză","pos":"noun","definitions":["Dutch (language)"],"pronunciation":"[ˌne.er.lanˈde.zə]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"neerlandeză","accusative-definite-nominative":"neerlandeza","dative-genitive-indefinite":"neerlandeze","dative-definite-genitive":"neerlandezei","vocative":"neerlandeză"}},{"word":"neesențial","pos":"adj","definitions":["unessential"],"forms":{"feminine-singular":"neesențială","masculine-plural":"neesențiali","feminine-neuter-plural":"neesențiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neesențial","error-unrecognized-form-feminine-indefinite-singular":"neesențială","error-unrecognized-form-indefinite-masculine-plural":"neesențiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"neesențiale","definite-error-unrecognized-form-masculine-neuter-singular":"neesențialul","definite-error-unrecognized-form-feminine-singular":"neesențiala","definite-error-unrecognized-form-masculine-plural":"neesențialii","definite-error-unrecognized-form-feminine-neuter-plural":"neesențialele"}},{"word":"neestetic","pos":"adj","definitions":["nonaesthetic"],"forms":{"feminine-singular":"neestetică","masculine-plural":"neestetici","feminine-neuter-plural":"neestetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neestetic","error-unrecognized-form-feminine-indefinite-singular":"neestetică","error-unrecognized-form-indefinite-masculine-plural":"neestetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neestetice","definite-error-unrecognized-form-masculine-neuter-singular":"neesteticul","definite-error-unrecognized-form-feminine-singular":"neestetica","definite-error-unrecognized-form-masculine-plural":"neesteticii","definite-error-unrecognized-form-feminine-neuter-plural":"neesteticele"}}];
@@ -0,0 +1 @@
+export default [{"word":"neetanș","pos":"adj","definitions":["leaky"],"forms":{"feminine-singular":"neetanșă","masculine-plural":"neetanși","feminine-neuter-plural":"neetanșe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neetanș","error-unrecognized-form-feminine-indefinite-singular":"neetanșă","error-unrecognized-form-indefinite-masculine-plural":"neetanși","error-unrecognized-form-feminine-indefinite-neuter-plural":"neetanșe","definite-error-unrecognized-form-masculine-neuter-singular":"neetanșul","definite-error-unrecognized-form-feminine-singular":"neetanșa","definite-error-unrecognized-form-masculine-plural":"neetanșii","definite-error-unrecognized-form-feminine-neuter-plural":"neetanșele"}},{"word":"neetanșeitate","pos":"noun","definitions":["leakage"],"forms":{"plural":"neetanșeități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neetanșeitate","accusative-definite-nominative-singular":"neetanșeitatea","accusative-indefinite-nominative-plural":"neetanșeități","accusative-definite-nominative-plural":"neetanșeitățile","dative-genitive-indefinite-singular":"neetanșeități","dative-definite-genitive-singular":"neetanșeității","dative-genitive-indefinite-plural":"neetanșeități","dative-definite-genitive-plural":"neetanșeităților","singular-vocative":"neetanșeitate","plural-vocative":"neetanșeităților"}},{"word":"neeuclidian","pos":"adj","definitions":["non-Euclidean"],"forms":{"feminine-singular":"neeuclidiană","masculine-plural":"neeuclidieni","feminine-neuter-plural":"neeuclidiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neeuclidian","error-unrecognized-form-feminine-indefinite-singular":"neeuclidiană","error-unrecognized-form-indefinite-masculine-plural":"neeuclidieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"neeuclidiene","definite-error-unrecognized-form-masculine-neuter-singular":"neeuclidianul","definite-error-unrecognized-form-feminine-singular":"neeuclidiana","definite-error-unrecognized-form-masculine-plural":"neeuclidienii","definite-error-unrecognized-form-feminine-neuter-plural":"neeuclidienele"}},{"word":"neevaluat","pos":"adj","definitions":["not evaluated"],"forms":{"feminine-singular":"neevaluată","masculine-plural":"neevaluați","feminine-neuter-plural":"neevaluate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neevaluat","error-unrecognized-form-feminine-indefinite-singular":"neevaluată","error-unrecognized-form-indefinite-masculine-plural":"neevaluați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neevaluate","definite-error-unrecognized-form-masculine-neuter-singular":"neevaluatul","definite-error-unrecognized-form-feminine-singular":"neevaluata","definite-error-unrecognized-form-masculine-plural":"neevaluații","definite-error-unrecognized-form-feminine-neuter-plural":"neevaluatele"}},{"word":"neevoluat","pos":"adj","definitions":["undeveloped"],"forms":{"feminine-singular":"neevoluată","masculine-plural":"neevoluați","feminine-neuter-plural":"neevoluate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neevoluat","error-unrecognized-form-feminine-indefinite-singular":"neevoluată","error-unrecognized-form-indefinite-masculine-plural":"neevoluați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neevoluate","definite-error-unrecognized-form-masculine-neuter-singular":"neevoluatul","definite-error-unrecognized-form-feminine-singular":"neevoluata","definite-error-unrecognized-form-masculine-plural":"neevoluații","definite-error-unrecognized-form-feminine-neuter-plural":"neevoluatele"}},{"word":"neexact","pos":"adj","definitions":["inexact"],"forms":{"feminine-singular":"neexactă","masculine-plural":"neexacți","feminine-neuter-plural":"neexacte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neexact","error-unrecognized-form-feminine-indefinite-singular":"neexactă","error-unrecognized-form-indefinite-masculine-plural":"neexacți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neexacte","definite-error-unrecognized-form-masculine-neuter-singular":"neexactul","definite-error-unrecognized-form-feminine-singular":"neexacta","definite-error-unrecognized-form-masculine-plural":"neexacții","definite-error-unrecognized-form-feminine-neuter-plural":"neexactele"}},{"word":"neexactitate","pos":"noun","definitions":["inaccurate"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neexactitate","accusative-definite-nominative":"neexactitatea","dative-genitive-indefinite":"neexactități","dative-definite-genitive":"neexactității","vocative":"neexactitate"}},{"word":"neexcitabil","pos":"adj","definitions":["nonexcitable"],"forms":{"feminine-singular":"neexcitabilă","masculine-plural":"neexcitabili","feminine-neuter-plural":"neexcitabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neexcitabil","error-unrecognized-form-feminine-indefinite-singular":"neexcitabilă","error-unrecognized-form-indefinite-masculine-plural":"neexcitabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neexcitabile","definite-error-unrecognized-form-masculine-neuter-singular":"neexcitabilul","definite-error-unrecognized-form-feminine-singular":"neexcitabila","definite-error-unrecognized-form-masculine-plural":"neexcitabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neexcitabilele"}},{"word":"neexcitabilitate","pos":"noun","definitions":["non-excitability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neexcitabilitate","accusative-definite-nominative":"neexcitabilitatea","dative-genitive-indefinite":"neexcitabilități","dative-definite-genitive":"neexcitabilității","vocative":"neexcitabilitate"}},{"word":"neexecutare","pos":"noun","definitions":["nonexecution"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neexecutare","accusative-definite-nominative":"neexecutarea","dative-genitive-indefinite":"neexecutări","dative-definite-genitive":"neexecutării","vocative":"neexecutare"}},{"word":"neexperimentat","pos":"adj","definitions":["inexperienced"],"forms":{"feminine-singular":"neexperimentată","masculine-plural":"neexperimentați","feminine-neuter-plural":"neexperimentate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neexperimentat","error-unrecognized-form-feminine-indefinite-singular":"neexperimentată","error-unrecognized-form-indefinite-masculine-plural":"neexperimentați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neexperimentate","definite-error-unrecognized-form-masculine-neuter-singular":"neexperimentatul","definite-error-unrecognized-form-feminine-singular":"neexperimentata","definite-error-unrecognized-form-masculine-plural":"neexperimentații","definite-error-unrecognized-form-feminine-neuter-plural":"neexperimentatele"}},{"word":"neexploatat","pos":"adj","definitions":["unexploited"],"forms":{"feminine-singular":"neexploatată","masculine-plural":"neexploatați","feminine-neuter-plural":"neexploatate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neexploatat","error-unrecognized-form-feminine-indefinite-singular":"neexploatată","error-unrecognized-form-indefinite-masculine-plural":"neexploatați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neexploatate","definite-error-unrecognized-form-masculine-neuter-singular":"neexploatatul","definite-error-unrecognized-form-feminine-singular":"neexploatata","definite-error-unrecognized-form-masculine-plural":"neexploatații","definite-error-unrecognized-form-feminine-neuter-plural":"neexploatatele"}},{"word":"neexplorabil","pos":"adj","definitions":["unexplorable"],"forms":{"feminine-singular":"neexplorabilă","masculine-plural":"neexplorabili","feminine-neuter-plural":"neexplorabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neexplorabil","error-unrecognized-form-feminine-indefinite-singular":"neexplorabilă","error-unrecognized-form-indefinite-masculine-plural":"neexplorabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neexplorabile","definite-error-unrecognized-form-masculine-neuter-singular":"neexplorabilul","definite-error-unrecognized-form-feminine-singular":"neexplorabila","definite-error-unrecognized-form-masculine-plural":"neexplorabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neexplorabilele"}},{"word":"neexplorat","pos":"adj","definitions":["unexplored"],"forms":{"feminine-singular":"neexplorată","masculine-plural":"neexplorați","feminine-neuter-plural":"neexplorate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neexplorat","error-unrecognized-form-feminine-indefinite-singular":"neexplorată","error-unrecognized-form-indefinite-masculine-plural":"neexplorați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neexplorate","definite-error-unrecognized-form-masculine-neuter-singular":"neexploratul","definite-error-unrecognized-form-feminine-singular":"neexplorata","definite-error-unrecognized-form-masculine-plural":"neexplorații","definite-error-unrecognized-form-feminine-neuter-plural":"neexploratele"}},{"word":"neexprimabil","pos":"adj","definitions":["unexpressible"],"forms":{"feminine-singular":"neexprimabilă","masculine-plural":"neexprimabili","feminine-neuter-plural":"neexprimabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neexprimabil","error-unrecognized-form-feminine-indefinite-singular":"neexprimabilă","error-unrecognized-form-indefinite-masculine-plural":"neexprimabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neexprimabile","definite-error-unrecognized-form-masculine-neuter-singular":"neexprimabilul","definite-error-unrecognized-form-feminine-singular":"neexprimabila","definite-error-unrecognized-form-masculine-plural":"neexprimabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neexprimabilele"}},{"word":"nefăcut","pos":"adj","definitions":["undone"],"forms":{"feminine-singular":"nefăcută","masculine-plural":"nefăcuți","feminine-neuter-plural":"nefăcute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefăcut","error-unrecognized-form-feminine-indefinite-singular":"nefăcută","error-unrecognized-form-indefinite-masculine-plural":"nefăcuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefăcute","definite-error-unrecognized-form-masculine-neuter-singular":"nefăcutul","definite-error-unrecognized-form-feminine-singular":"nefăcuta","definite-error-unrecognized-form-masculine-plural":"nefăcuții","definite-error-unrecognized-form-feminine-neuter-plural":"nefăcutele"}},{"word":"nefalism","pos":"noun","definitions":["nephalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nefalism","accusative-definite-nominative-singular":"nefalismul","accusative-indefinite-nominative-plural":"nefalisme","accusative-definite-nominative-plural":"nefalismele","dative-genitive-indefinite-singular":"nefalism","dative-definite-genitive-singular":"nefalismului","dative-genitive-indefinite-plural":"nefalisme","dative-definite-genitive-plural":"nefalismelor","singular-vocative":"nefalismule","plural-vocative":"nefalismelor"}},{"word":"nefalist","pos":"noun","definitions":["nephalist"],"forms":{"plural":"nefaliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nefalist","accusative-definite-nominative-singular":"nefalistul","accusative-indefinite-nominative-plural":"nefaliști","accusative-definite-nominative-plural":"nefaliștii","dative-genitive-indefinite-singular":"nefalist","dative-definite-genitive-singular":"nefalistului","dative-genitive-indefinite-plural":"nefaliști","dative-definite-genitive-plural":"nefaliștilor","singular-vocative":"nefalistule","plural-vocative":"nefaliștilor"}},{"word":"nefalistă","pos":"noun","definitions":["female equivalent of nefalist"],"forms":{"plural":"nefaliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nefalistă","accusative-definite-nominative-singular":"nefalista","accusative-indefinite-nominative-plural":"nefaliste","accusative-definite-nominative-plural":"nefalistele","dative-genitive-indefinite-singular":"nefaliste","dative-definite-genitive-singular":"nefalistei","dative-genitive-indefinite-plural":"nefaliste","dative-definite-genitive-plural":"nefalistelor","singular-vocative":"nefalistă","plural-vocative":"nefalistelor"}},{"word":"nefalsificat","pos":"adj","definitions":["unfalsified"],"forms":{"feminine-singular":"nefalsificată","masculine-plural":"nefalsificați","feminine-neuter-plural":"nefalsificate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefalsificat","error-unrecognized-form-feminine-indefinite-singular":"nefalsificată","error-unrecognized-form-indefinite-masculine-plural":"nefalsificați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefalsificate","definite-error-unrecognized-form-masculine-neuter-singular":"nefalsificatul","definite-error-unrecognized-form-feminine-singular":"nefalsificata","definite-error-unrecognized-form-masculine-plural":"nefalsificații","definite-error-unrecognized-form-feminine-neuter-plural":"nefalsificatele"}},{"word":"nefamilist","pos":"adj","definitions":["single (about a person)"],"forms":{"feminine-singular":"nefamilistă","masculine-plural":"nefamiliști","feminine-neuter-plural":"nefamiliste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefamilist","error-unrecognized-form-feminine-indefinite-singular":"nefamilistă","error-unrecognized-form-indefinite-masculine-plural":"nefamiliști","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefamiliste","definite-error-unrecognized-form-masculine-neuter-singular":"nefamilistul","definite-error-unrecognized-form-feminine-singular":"nefamilista","definite-error-unrecognized-form-masculine-plural":"nefamiliștii","definite-error-unrecognized-form-feminine-neuter-plural":"nefamilistele"}},{"word":"nefapt","pos":"noun","definitions":["nothingness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nefapt","accusative-definite-nominative":"nefaptul","dative-genitive-indefinite":"nefapt","dative-definite-genitive":"nefaptului","vocative":"nefaptule"}},{"word":"nefârtat","pos":"noun","definitions":["unfriend"],"forms":{"plural":"nefârtați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nefârtat","accusative-definite-nominative-singular":"nefârtatul","accusative-indefinite-nominative-plural":"nefârtați","accusative-definite-nominative-plural":"nefârtații","dative-genitive-indefinite-singular":"nefârtat","dative-definite-genitive-singular":"nefârtatului","dative-genitive-indefinite-plural":"nefârtați","dative-definite-genitive-plural":"nefârtaților","singular-vocative":"nefârtatule","plural-vocative":"nefârtaților"}},{"word":"nefast","pos":"adj","definitions":["harmful"],"forms":{"feminine-singular":"nefastă","masculine-plural":"nefaști","feminine-neuter-plural":"nefaste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefast","error-unrecognized-form-feminine-indefinite-singular":"nefastă","error-unrecognized-form-indefinite-masculine-plural":"nefaști","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefaste","definite-error-unrecognized-form-masculine-neuter-singular":"nefastul","definite-error-unrecognized-form-feminine-singular":"nefasta","definite-error-unrecognized-form-masculine-plural":"nefaștii","definite-error-unrecognized-form-feminine-neuter-plural":"nefastele"}},{"word":"nefățărit","pos":"adj","definitions":["sincere"],"forms":{"feminine-singular":"nefățărită","masculine-plural":"nefățăriți","feminine-neuter-plural":"nefățărite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefățărit","error-unrecognized-form-feminine-indefinite-singular":"nefățărită","error-unrecognized-form-indefinite-masculine-plural":"nefățăriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefățărite","definite-error-unrecognized-form-masculine-neuter-singular":"nefățăritul","definite-error-unrecognized-form-feminine-singular":"nefățărita","definite-error-unrecognized-form-masculine-plural":"nefățăriții","definite-error-unrecognized-form-feminine-neuter-plural":"nefățăritele"}},{"word":"nefavorabil","pos":"adj","definitions":["unfavorable"],"forms":{"feminine-singular":"nefavorabilă","masculine-plural":"nefavorabili","feminine-neuter-plural":"nefavorabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefavorabil","error-unrecognized-form-feminine-indefinite-singular":"nefavorabilă","error-unrecognized-form-indefinite-masculine-plural":"nefavorabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefavorabile","definite-error-unrecognized-form-masculine-neuter-singular":"nefavorabilul","definite-error-unrecognized-form-feminine-singular":"nefavorabila","definite-error-unrecognized-form-masculine-plural":"nefavorabilii","definite-error-unrecognized-form-feminine-neuter-plural":"nefavorabilele"}},{"word":"nefelomanție","pos":"noun","definitions":["nephelomancy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nefelomanție","accusative-definite-nominative-singular":"nefelomanția","accusative-indefinite-nominative-plural":"nefelomanții","accusative-definite-nominative-plural":"nefelomanțiile","dative-genitive-indefinite-singular":"nefelomanții","dative-definite-genitive-singular":"nefelomanției","dative-genitive-indefinite-plural":"nefelomanții","dative-definite-genitive-plural":"nefelomanțiilor","singular-vocative":"nefelomanție","plural-vocative":"nefelomanțiilor"}},{"word":"nefelometrie","pos":"noun","definitions":["nephelometry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"nefelometrie","accusative-definite-nominative":"nefelometria","dative-genitive-indefinite":"nefelometrii","dative-definite-genitive":"nefelometriei","vocative":"nefelometrie"}},{"word":"nefelometru","pos":"noun","definitions":["nephelometer"],"forms":{"plural":"nefelometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nefelometru","accusative-definite-nominative-singular":"nefelometrul","accusative-indefinite-nominative-plural":"nefelometre","accusative-definite-nominative-plural":"nefelometrele","dative-genitive-indefinite-singular":"nefelometru","dative-definite-genitive-singular":"nefelometrului","dative-genitive-indefinite-plural":"nefelometre","dative-definite-genitive-plural":"nefelometrelor","singular-vocative":"nefelometrule","plural-vocative":"nefelometrelor"}},{"word":"nefer","pos":"noun","definitions":["Ottoman soldier","member of a posse"],"forms":{"plural":"neferi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nefer","accusative-definite-nominative-singular":"neferul","accusative-indefinite-nominative-plural":"neferi","accusative-definite-nominative-plural":"neferii","dative-genitive-indefinite-singular":"nefer","dative-definite-genitive-singular":"neferului","dative-genitive-indefinite-plural":"neferi","dative-definite-genitive-plural":"neferilor","singular-vocative":"neferule","plural-vocative":"neferilor"}},{"word":"neferici","pos":"verb","definitions":["to make unhappy"],"forms":{"canonical":"a neferici 4th conjugation","present-singular-third-person":"nefericește","participle-past":"nefericit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a neferici","gerund":"nefericind","first-person-indicative-present-singular":"nefericesc","indicative-present-second-person-singular":"nefericești","indicative-present-singular-third-person":"nefericește","first-person-indicative-plural-present":"nefericim","indicative-plural-present-second-person":"nefericiți","indicative-plural-present-third-person":"nefericesc","first-person-imperfect-indicative-singular":"nefericeam","imperfect-indicative-second-person-singular":"nefericeai","imperfect-indicative-singular-third-person":"nefericea","first-person-imperfect-indicative-plural":"nefericeam","imperfect-indicative-plural-second-person":"nefericeați","imperfect-indicative-plural-third-person":"nefericeau","first-person-indicative-perfect-singular":"nefericii","indicative-perfect-second-person-singular":"nefericiși","indicative-perfect-singular-third-person":"neferici","first-person-indicative-perfect-plural":"nefericirăm","indicative-perfect-plural-second-person":"nefericirăți","indicative-perfect-plural-third-person":"nefericiră","first-person-indicative-pluperfect-singular":"nefericisem","indicative-pluperfect-second-person-singular":"nefericiseși","indicative-pluperfect-singular-third-person":"nefericise","first-person-indicative-pluperfect-plural":"nefericiserăm","indicative-pluperfect-plural-second-person":"nefericiserăți","indicative-pluperfect-plural-third-person":"nefericiseră","first-person-present-singular-subjunctive":"să nefericesc","present-second-person-singular-subjunctive":"să nefericești","present-singular-subjunctive-third-person":"să nefericească","first-person-plural-present-subjunctive":"să nefericim","plural-present-second-person-subjunctive":"să nefericiți","plural-present-subjunctive-third-person":"să nefericească","imperative-second-person-singular":"nefericește","imperative-plural-second-person":"nefericiți","imperative-negative-second-person-singular":"nu neferici","imperative-negative-plural-second-person":"nu nefericiți"}},{"word":"nefericire","pos":"noun","definitions":["unhappiness (feeling of not being happy)"],"pronunciation":"/ne.fe.riˈt͡ʃi.re/","forms":{"plural":"nefericiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nefericire","accusative-definite-nominative-singular":"nefericirea","accusative-indefinite-nominative-plural":"nefericiri","accusative-definite-nominative-plural":"nefericirile","dative-genitive-indefinite-singular":"nefericiri","dative-definite-genitive-singular":"nefericirii","dative-genitive-indefinite-plural":"nefericiri","dative-definite-genitive-plural":"nefericirilor","singular-vocative":"nefericire","plural-vocative":"nefericirilor"}},{"word":"nefericit","pos":"adj","definitions":["unhappy","unfortunate, unlucky"],"pronunciation":"/ˌne.fe.riˈt͡ʃit/","forms":{"feminine-singular":"nefericită","masculine-plural":"nefericiți","feminine-neuter-plural":"nefericite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefericit","error-unrecognized-form-feminine-indefinite-singular":"nefericită","error-unrecognized-form-indefinite-masculine-plural":"nefericiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefericite","definite-error-unrecognized-form-masculine-neuter-singular":"nefericitul","definite-error-unrecognized-form-feminine-singular":"nefericita","definite-error-unrecognized-form-masculine-plural":"nefericiții","definite-error-unrecognized-form-feminine-neuter-plural":"nefericitele"}},{"word":"Neferoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Neferoiu"}},{"word":"neferos","pos":"adj","definitions":["non-ferrous"],"forms":{"feminine-singular":"neferoasă","masculine-plural":"neferoși","feminine-neuter-plural":"neferoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neferos","error-unrecognized-form-feminine-indefinite-singular":"neferoasă","error-unrecognized-form-indefinite-masculine-plural":"neferoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"neferoase","definite-error-unrecognized-form-masculine-neuter-singular":"neferosul","definite-error-unrecognized-form-feminine-singular":"neferoasa","definite-error-unrecognized-form-masculine-plural":"neferoșii","definite-error-unrecognized-form-feminine-neuter-plural":"neferoasele"}},{"word":"nefertil","pos":"adj","definitions":["infertile"],"forms":{"feminine-singular":"nefertilă","masculine-plural":"nefertili","feminine-neuter-plural":"nefertile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefertil","error-unrecognized-form-feminine-indefinite-singular":"nefertilă","error-unrecognized-form-indefinite-masculine-plural":"nefertili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefertile","definite-error-unrecognized-form-masculine-neuter-singular":"nefertilul","definite-error-unrecognized-form-feminine-singular":"nefertila","definite-error-unrecognized-form-masculine-plural":"nefertilii","definite-error-unrecognized-form-feminine-neuter-plural":"nefertilele"}},{"word":"nefertilizat","pos":"adj","definitions":["unfertilized"],"pronunciation":"/ˌne.fer.ti.liˈzat/","forms":{"feminine-singular":"nefertilizată","masculine-plural":"nefertilizați","feminine-neuter-plural":"nefertilizate","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefertilizat","error-unrecognized-form-feminine-indefinite-singular":"nefertilizată","error-unrecognized-form-indefinite-masculine-plural":"nefertilizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefertilizate","definite-error-unrecognized-form-masculine-neuter-singular":"nefertilizatul","definite-error-unrecognized-form-feminine-singular":"nefertilizata","definite-error-unrecognized-form-masculine-plural":"nefertilizații","definite-error-unrecognized-form-feminine-neuter-plural":"nefertilizatele"}},{"word":"Neferu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Neferu"}},{"word":"nefidel","pos":"adj","definitions":["nonfaithful"],"forms":{"feminine-singular":"nefidelă","masculine-plural":"nefideli","feminine-neuter-plural":"nefidele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefidel","error-unrecognized-form-feminine-indefinite-singular":"nefidelă","error-unrecognized-form-indefinite-masculine-plural":"nefideli","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefidele","definite-error-unrecognized-form-masculine-neuter-singular":"nefidelul","definite-error-unrecognized-form-feminine-singular":"nefidela","definite-error-unrecognized-form-masculine-plural":"nefidelii","definite-error-unrecognized-form-feminine-neuter-plural":"nefidelele"}},{"word":"nefiert","pos":"adj","definitions":["raw"],"forms":{"feminine-singular":"nefiertă","masculine-plural":"nefierți","feminine-neuter-plural":"nefierte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefiert","error-unrecognized-form-feminine-indefinite-singular":"nefiertă","error-unrecognized-form-indefinite-masculine-plural":"nefierți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefierte","definite-error-unrecognized-form-masculine-neuter-singular":"nefiertul","definite-error-unrecognized-form-feminine-singular":"nefierta","definite-error-unrecognized-form-masculine-plural":"nefierții","definite-error-unrecognized-form-feminine-neuter-plural":"nefiertele"}},{"word":"neființă","pos":"noun","definitions":["nothingness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"neființă","accusative-definite-nominative":"neființa","dative-genitive-indefinite":"neființe","dative-definite-genitive":"neființei","vocative":"neființă"}},{"word":"nefinalizat","pos":"adj","definitions":["incomplete"],"forms":{"feminine-singular":"nefinalizată","masculine-plural":"nefinalizați","feminine-neuter-plural":"nefinalizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefinalizat","error-unrecognized-form-feminine-indefinite-singular":"nefinalizată","error-unrecognized-form-indefinite-masculine-plural":"nefinalizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefinalizate","definite-error-unrecognized-form-masculine-neuter-singular":"nefinalizatul","definite-error-unrecognized-form-feminine-singular":"nefinalizata","definite-error-unrecognized-form-masculine-plural":"nefinalizații","definite-error-unrecognized-form-feminine-neuter-plural":"nefinalizatele"}},{"word":"nefiresc","pos":"adj","definitions":["unnatural"],"forms":{"feminine-singular":"nefirească","plural":"nefirești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefiresc","error-unrecognized-form-feminine-indefinite-singular":"nefirească","error-unrecognized-form-indefinite-masculine-plural":"nefirești","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefirești","definite-error-unrecognized-form-masculine-neuter-singular":"nefirescul","definite-error-unrecognized-form-feminine-singular":"nefireasca","definite-error-unrecognized-form-masculine-plural":"nefireștii","definite-error-unrecognized-form-feminine-neuter-plural":"nefireștile"}},{"word":"nefiță","pos":"noun","definitions":["weasel"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"nefiță","accusative-definite-nominative":"nefița","dative-genitive-indefinite":"nefițe","dative-definite-genitive":"nefiței","vocative":"nefiță"}},{"word":"neflexibil","pos":"adj","definitions":["inflexible"],"forms":{"feminine-singular":"neflexibilă","masculine-plural":"neflexibili","feminine-neuter-plural":"neflexibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neflexibil","error-unrecognized-form-feminine-indefinite-singular":"neflexibilă","error-unrecognized-form-indefinite-masculine-plural":"neflexibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neflexibile","definite-error-unrecognized-form-masculine-neuter-singular":"neflexibilul","definite-error-unrecognized-form-feminine-singular":"neflexibila","definite-error-unrecognized-form-masculine-plural":"neflexibilii","definite-error-unrecognized-form-feminine-neuter-plural":"neflexibilele"}},{"word":"neflexibilitate","pos":"noun","definitions":["inflexibility"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neflexibilitate","accusative-definite-nominative":"neflexibilitatea","dative-genitive-indefinite":"neflexibilități","dative-definite-genitive":"neflexibilității","vocative":"neflexibilitate"}},{"word":"nefolosință","pos":"noun","definitions":["uselessness"],"forms":{"plural":"nefolosințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nefolosință","accusative-definite-nominative-singular":"nefolosința","accusative-indefinite-nominative-plural":"nefolosințe","accusative-definite-nominative-plural":"nefolosințele","dative-genitive-indefinite-singular":"nefolosințe","dative-definite-genitive-singular":"nefolosinței","dative-genitive-indefinite-plural":"nefolosințe","dative-definite-genitive-plural":"nefolosințelor","singular-vocative":"nefolosință","plural-vocative":"nefolosințelor"}},{"word":"nefolosit","pos":"adj","definitions":["unused"],"forms":{"feminine-singular":"nefolosită","masculine-plural":"nefolosiți","feminine-neuter-plural":"nefolosite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefolosit","error-unrecognized-form-feminine-indefinite-singular":"nefolosită","error-unrecognized-form-indefinite-masculine-plural":"nefolosiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefolosite","definite-error-unrecognized-form-masculine-neuter-singular":"nefolositul","definite-error-unrecognized-form-feminine-singular":"nefolosita","definite-error-unrecognized-form-masculine-plural":"nefolosiții","definite-error-unrecognized-form-feminine-neuter-plural":"nefolositele"}},{"word":"nefolositor","pos":"adj","definitions":["useless"],"forms":{"feminine-singular":"nefolositoare","masculine-plural":"nefolositori","feminine-neuter-plural":"nefolositoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefolositor","error-unrecognized-form-feminine-indefinite-singular":"nefolositoare","error-unrecognized-form-indefinite-masculine-plural":"nefolositori","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefolositoare","definite-error-unrecognized-form-masculine-neuter-singular":"nefolositorul","definite-error-unrecognized-form-feminine-singular":"nefolositoarea","definite-error-unrecognized-form-masculine-plural":"nefolositorii","definite-error-unrecognized-form-feminine-neuter-plural":"nefolositoarele"}},{"word":"nefondat","pos":"adj","definitions":["unfounded, baseless"],"forms":{"feminine-singular":"nefondată","masculine-plural":"nefondați","feminine-neuter-plural":"nefondate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefondat","error-unrecognized-form-feminine-indefinite-singular":"nefondată","error-unrecognized-form-indefinite-masculine-plural":"nefondați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefondate","definite-error-unrecognized-form-masculine-neuter-singular":"nefondatul","definite-error-unrecognized-form-feminine-singular":"nefondata","definite-error-unrecognized-form-masculine-plural":"nefondații","definite-error-unrecognized-form-feminine-neuter-plural":"nefondatele","alternative":"nefundat"}},{"word":"nefoscop","pos":"noun","definitions":["nephoscope"],"forms":{"plural":"nefoscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nefoscop","accusative-definite-nominative-singular":"nefoscopul","accusative-indefinite-nominative-plural":"nefoscoape","accusative-definite-nominative-plural":"nefoscoapele","dative-genitive-indefinite-singular":"nefoscop","dative-definite-genitive-singular":"nefoscopului","dative-genitive-indefinite-plural":"nefoscoape","dative-definite-genitive-plural":"nefoscoapelor","singular-vocative":"nefoscopule","plural-vocative":"nefoscoapelor"}},{"word":"nefralgie","pos":"noun","definitions":["nephralgia"],"forms":{"plural":"nefralgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nefralgie","accusative-definite-nominative-singular":"nefralgia","accusative-indefinite-nominative-plural":"nefralgii","accusative-definite-nominative-plural":"nefralgiile","dative-genitive-indefinite-singular":"nefralgii","dative-definite-genitive-singular":"nefralgiei","dative-genitive-indefinite-plural":"nefralgii","dative-definite-genitive-plural":"nefralgiilor","singular-vocative":"nefralgie","plural-vocative":"nefralgiilor"}},{"word":"nefrectomie","pos":"noun","definitions":["nephrectomy"],"forms":{"plural":"nefrectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nefrectomie","accusative-definite-nominative-singular":"nefrectomia","accusative-indefinite-nominative-plural":"nefrectomii","accusative-definite-nominative-plural":"nefrectomiile","dative-genitive-indefinite-singular":"nefrectomii","dative-definite-genitive-singular":"nefrectomiei","dative-genitive-indefinite-plural":"nefrectomii","dative-definite-genitive-plural":"nefrectomiilor","singular-vocative":"nefrectomie","plural-vocative":"nefrectomiilor"}},{"word":"nefridie","pos":"noun","definitions":["nephridia"],"forms":{"plural":"nefridii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nefridie","accusative-definite-nominative-singular":"nefridia","accusative-indefinite-nominative-plural":"nefridii","accusative-definite-nominative-plural":"nefridiile","dative-genitive-indefinite-singular":"nefridii","dative-definite-genitive-singular":"nefridiei","dative-genitive-indefinite-plural":"nefridii","dative-definite-genitive-plural":"nefridiilor","singular-vocative":"nefridie","plural-vocative":"nefridiilor"}},{"word":"nefript","pos":"adj","definitions":["unroasted"],"forms":{"feminine-singular":"nefriptă","masculine-plural":"nefripți","feminine-neuter-plural":"nefripte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefript","error-unrecognized-form-feminine-indefinite-singular":"nefriptă","error-unrecognized-form-indefinite-masculine-plural":"nefripți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefripte","definite-error-unrecognized-form-masculine-neuter-singular":"nefriptul","definite-error-unrecognized-form-feminine-singular":"nefripta","definite-error-unrecognized-form-masculine-plural":"nefripții","definite-error-unrecognized-form-feminine-neuter-plural":"nefriptele"}},{"word":"nefrit","pos":"noun","definitions":["nephrite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nefrit","accusative-definite-nominative":"nefritul","dative-genitive-indefinite":"nefrit","dative-definite-genitive":"nefritului","vocative":"nefritule"}},{"word":"nefrită","pos":"noun","definitions":["nephritis"],"forms":{"plural":"nefrite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nefrită","accusative-definite-nominative-singular":"nefrita","accusative-indefinite-nominative-plural":"nefrite","accusative-definite-nominative-plural":"nefritele","dative-genitive-indefinite-singular":"nefrite","dative-definite-genitive-singular":"nefritei","dative-genitive-indefinite-plural":"nefrite","dative-definite-genitive-plural":"nefritelor","singular-vocative":"nefrită","plural-vocative":"nefritelor"}},{"word":"nefritic","pos":"adj","definitions":["nephritic"],"forms":{"feminine-singular":"nefritică","masculine-plural":"nefritici","feminine-neuter-plural":"nefritice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefritic","error-unrecognized-form-feminine-indefinite-singular":"nefritică","error-unrecognized-form-indefinite-masculine-plural":"nefritici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefritice","definite-error-unrecognized-form-masculine-neuter-singular":"nefriticul","definite-error-unrecognized-form-feminine-singular":"nefritica","definite-error-unrecognized-form-masculine-plural":"nefriticii","definite-error-unrecognized-form-feminine-neuter-plural":"nefriticele"}},{"word":"nefritică","pos":"noun","definitions":["female equivalent of nefritic"],"forms":{"plural":"nefritice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nefritică","accusative-definite-nominative-singular":"nefritica","accusative-indefinite-nominative-plural":"nefritice","accusative-definite-nominative-plural":"nefriticele","dative-genitive-indefinite-singular":"nefritice","dative-definite-genitive-singular":"nefriticei","dative-genitive-indefinite-plural":"nefritice","dative-definite-genitive-plural":"nefriticelor","singular-vocative":"nefritică","plural-vocative":"nefriticelor"}},{"word":"nefrografie","pos":"noun","definitions":["nephrography"],"forms":{"plural":"nefrografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nefrografie","accusative-definite-nominative-singular":"nefrografia","accusative-indefinite-nominative-plural":"nefrografii","accusative-definite-nominative-plural":"nefrografiile","dative-genitive-indefinite-singular":"nefrografii","dative-definite-genitive-singular":"nefrografiei","dative-genitive-indefinite-plural":"nefrografii","dative-definite-genitive-plural":"nefrografiilor","singular-vocative":"nefrografie","plural-vocative":"nefrografiilor"}},{"word":"nefrolit","pos":"noun","definitions":["nephrolith, kidney stone"],"forms":{"plural":"nefrolite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nefrolit","accusative-definite-nominative-singular":"nefrolitul","accusative-indefinite-nominative-plural":"nefrolite","accusative-definite-nominative-plural":"nefrolitele","dative-genitive-indefinite-singular":"nefrolit","dative-definite-genitive-singular":"nefrolitului","dative-genitive-indefinite-plural":"nefrolite","dative-definite-genitive-plural":"nefrolitelor","singular-vocative":"nefrolitule","plural-vocative":"nefrolitelor"}},{"word":"nefrolitotomie","pos":"noun","definitions":["nephrolithotomy"],"forms":{"plural":"nefrolitotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nefrolitotomie","accusative-definite-nominative-singular":"nefrolitotomia","accusative-indefinite-nominative-plural":"nefrolitotomii","accusative-definite-nominative-plural":"nefrolitotomiile","dative-genitive-indefinite-singular":"nefrolitotomii","dative-definite-genitive-singular":"nefrolitotomiei","dative-genitive-indefinite-plural":"nefrolitotomii","dative-definite-genitive-plural":"nefrolitotomiilor","singular-vocative":"nefrolitotomie","plural-vocative":"nefrolitotomiilor"}},{"word":"nefrolog","pos":"noun","definitions":["nephrologist"],"forms":{"plural":"nefrologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nefrolog","accusative-definite-nominative-singular":"nefrologul","accusative-indefinite-nominative-plural":"nefrologi","accusative-definite-nominative-plural":"nefrologii","dative-genitive-indefinite-singular":"nefrolog","dative-definite-genitive-singular":"nefrologului","dative-genitive-indefinite-plural":"nefrologi","dative-definite-genitive-plural":"nefrologilor","singular-vocative":"nefrologule","plural-vocative":"nefrologilor"}},{"word":"nefrologă","pos":"noun","definitions":["female equivalent of nefrolog"],"forms":{"plural":"nefrologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nefrologă","accusative-definite-nominative-singular":"nefrologa","accusative-indefinite-nominative-plural":"nefrologe","accusative-definite-nominative-plural":"nefrologele","dative-genitive-indefinite-singular":"nefrologe","dative-definite-genitive-singular":"nefrologei","dative-genitive-indefinite-plural":"nefrologe","dative-definite-genitive-plural":"nefrologelor","singular-vocative":"nefrologă","plural-vocative":"nefrologelor"}},{"word":"nefrologic","pos":"adj","definitions":["nephrological"],"forms":{"feminine-singular":"nefrologică","masculine-plural":"nefrologici","feminine-neuter-plural":"nefrologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefrologic","error-unrecognized-form-feminine-indefinite-singular":"nefrologică","error-unrecognized-form-indefinite-masculine-plural":"nefrologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefrologice","definite-error-unrecognized-form-masculine-neuter-singular":"nefrologicul","definite-error-unrecognized-form-feminine-singular":"nefrologica","definite-error-unrecognized-form-masculine-plural":"nefrologicii","definite-error-unrecognized-form-feminine-neuter-plural":"nefrologicele"}},{"word":"nefrologie","pos":"noun","definitions":["nephrology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"nefrologie","accusative-definite-nominative":"nefrologia","dative-genitive-indefinite":"nefrologii","dative-definite-genitive":"nefrologiei","vocative":"nefrologie"}},{"word":"nefron","pos":"noun","definitions":["nephron"],"pronunciation":"/neˈfron/","forms":{"plural":"nefroane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nefron","accusative-definite-nominative-singular":"nefronul","accusative-indefinite-nominative-plural":"nefroane","accusative-definite-nominative-plural":"nefroanele","dative-genitive-indefinite-singular":"nefron","dative-definite-genitive-singular":"nefronului","dative-genitive-indefinite-plural":"nefroane","dative-definite-genitive-plural":"nefroanelor","singular-vocative":"nefronule","plural-vocative":"nefroanelor"}},{"word":"nefropat","pos":"adj","definitions":["nephropathic"],"forms":{"feminine-singular":"nefropată","masculine-plural":"nefropați","feminine-neuter-plural":"nefropate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefropat","error-unrecognized-form-feminine-indefinite-singular":"nefropată","error-unrecognized-form-indefinite-masculine-plural":"nefropați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefropate","definite-error-unrecognized-form-masculine-neuter-singular":"nefropatul","definite-error-unrecognized-form-feminine-singular":"nefropata","definite-error-unrecognized-form-masculine-plural":"nefropații","definite-error-unrecognized-form-feminine-neuter-plural":"nefropatele"}},{"word":"nefropată","pos":"noun","definitions":["female equivalent of nefropat"],"forms":{"plural":"nefropate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nefropată","accusative-definite-nominative-singular":"nefropata","accusative-indefinite-nominative-plural":"nefropate","accusative-definite-nominative-plural":"nefropatele","dative-genitive-indefinite-singular":"nefropate","dative-definite-genitive-singular":"nefropatei","dative-genitive-indefinite-plural":"nefropate","dative-definite-genitive-plural":"nefropatelor","singular-vocative":"nefropată","plural-vocative":"nefropatelor"}},{"word":"nefropatie","pos":"noun","definitions":["nephropathy"],"forms":{"plural":"nefropatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nefropatie","accusative-definite-nominative-singular":"nefropatia","accusative-indefinite-nominative-plural":"nefropatii","accusative-definite-nominative-plural":"nefropatiile","dative-genitive-indefinite-singular":"nefropatii","dative-definite-genitive-singular":"nefropatiei","dative-genitive-indefinite-plural":"nefropatii","dative-definite-genitive-plural":"nefropatiilor","singular-vocative":"nefropatie","plural-vocative":"nefropatiilor"}},{"word":"nefropexie","pos":"noun","definitions":["nephropexia"],"forms":{"plural":"nefropexii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nefropexie","accusative-definite-nominative-singular":"nefropexia","accusative-indefinite-nominative-plural":"nefropexii","accusative-definite-nominative-plural":"nefropexiile","dative-genitive-indefinite-singular":"nefropexii","dative-definite-genitive-singular":"nefropexiei","dative-genitive-indefinite-plural":"nefropexii","dative-definite-genitive-plural":"nefropexiilor","singular-vocative":"nefropexie","plural-vocative":"nefropexiilor"}},{"word":"nefroplegie","pos":"noun","definitions":["nephroplegia"],"forms":{"plural":"nefroplegii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nefroplegie","accusative-definite-nominative-singular":"nefroplegia","accusative-indefinite-nominative-plural":"nefroplegii","accusative-definite-nominative-plural":"nefroplegiile","dative-genitive-indefinite-singular":"nefroplegii","dative-definite-genitive-singular":"nefroplegiei","dative-genitive-indefinite-plural":"nefroplegii","dative-definite-genitive-plural":"nefroplegiilor","singular-vocative":"nefroplegie","plural-vocative":"nefroplegiilor"}},{"word":"nefroptoză","pos":"noun","definitions":["nephroptosis"],"forms":{"plural":"nefroptoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nefroptoză","accusative-definite-nominative-singular":"nefroptoza","accusative-indefinite-nominative-plural":"nefroptoze","accusative-definite-nominative-plural":"nefroptozele","dative-genitive-indefinite-singular":"nefroptoze","dative-definite-genitive-singular":"nefroptozei","dative-genitive-indefinite-plural":"nefroptoze","dative-definite-genitive-plural":"nefroptozelor","singular-vocative":"nefroptoză","plural-vocative":"nefroptozelor"}},{"word":"nefrorafie","pos":"noun","definitions":["nephrorrhaphy"],"forms":{"plural":"nefrorafii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nefrorafie","accusative-definite-nominative-singular":"nefrorafia","accusative-indefinite-nominative-plural":"nefrorafii","accusative-definite-nominative-plural":"nefrorafiile","dative-genitive-indefinite-singular":"nefrorafii","dative-definite-genitive-singular":"nefrorafiei","dative-genitive-indefinite-plural":"nefrorafii","dative-definite-genitive-plural":"nefrorafiilor","singular-vocative":"nefrorafie","plural-vocative":"nefrorafiilor"}},{"word":"nefrosclerotic","pos":"adj","definitions":["nephrosclerotic"],"forms":{"feminine-singular":"nefrosclerotică","masculine-plural":"nefrosclerotici","feminine-neuter-plural":"nefrosclerotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefrosclerotic","error-unrecognized-form-feminine-indefinite-singular":"nefrosclerotică","error-unrecognized-form-indefinite-masculine-plural":"nefrosclerotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefrosclerotice","definite-error-unrecognized-form-masculine-neuter-singular":"nefroscleroticul","definite-error-unrecognized-form-feminine-singular":"nefrosclerotica","definite-error-unrecognized-form-masculine-plural":"nefroscleroticii","definite-error-unrecognized-form-feminine-neuter-plural":"nefroscleroticele"}},{"word":"nefroscleroză","pos":"noun","definitions":["nephrosclerosis"],"forms":{"plural":"nefroscleroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nefroscleroză","accusative-definite-nominative-singular":"nefroscleroza","accusative-indefinite-nominative-plural":"nefroscleroze","accusative-definite-nominative-plural":"nefrosclerozele","dative-genitive-indefinite-singular":"nefroscleroze","dative-definite-genitive-singular":"nefrosclerozei","dative-genitive-indefinite-plural":"nefroscleroze","dative-definite-genitive-plural":"nefrosclerozelor","singular-vocative":"nefroscleroză","plural-vocative":"nefrosclerozelor"}},{"word":"nefrostomie","pos":"noun","definitions":["nephrostomy"],"forms":{"plural":"nefrostomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nefrostomie","accusative-definite-nominative-singular":"nefrostomia","accusative-indefinite-nominative-plural":"nefrostomii","accusative-definite-nominative-plural":"nefrostomiile","dative-genitive-indefinite-singular":"nefrostomii","dative-definite-genitive-singular":"nefrostomiei","dative-genitive-indefinite-plural":"nefrostomii","dative-definite-genitive-plural":"nefrostomiilor","singular-vocative":"nefrostomie","plural-vocative":"nefrostomiilor"}},{"word":"nefrotic","pos":"adj","definitions":["nephrotic"],"forms":{"feminine-singular":"nefrotică","masculine-plural":"nefrotici","feminine-neuter-plural":"nefrotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefrotic","error-unrecognized-form-feminine-indefinite-singular":"nefrotică","error-unrecognized-form-indefinite-masculine-plural":"nefrotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefrotice","definite-error-unrecognized-form-masculine-neuter-singular":"nefroticul","definite-error-unrecognized-form-feminine-singular":"nefrotica","definite-error-unrecognized-form-masculine-plural":"nefroticii","definite-error-unrecognized-form-feminine-neuter-plural":"nefroticele"}},{"word":"nefrotomie","pos":"noun","definitions":["nephrotomy"],"forms":{"plural":"nefrotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nefrotomie","accusative-definite-nominative-singular":"nefrotomia","accusative-indefinite-nominative-plural":"nefrotomii","accusative-definite-nominative-plural":"nefrotomiile","dative-genitive-indefinite-singular":"nefrotomii","dative-definite-genitive-singular":"nefrotomiei","dative-genitive-indefinite-plural":"nefrotomii","dative-definite-genitive-plural":"nefrotomiilor","singular-vocative":"nefrotomie","plural-vocative":"nefrotomiilor"}},{"word":"nefroză","pos":"noun","definitions":["nephrosis"],"pronunciation":"/neˈfro.zə/","forms":{"plural":"nefroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nefroză","accusative-definite-nominative-singular":"nefroza","accusative-indefinite-nominative-plural":"nefroze","accusative-definite-nominative-plural":"nefrozele","dative-genitive-indefinite-singular":"nefroze","dative-definite-genitive-singular":"nefrozei","dative-genitive-indefinite-plural":"nefroze","dative-definite-genitive-plural":"nefrozelor","singular-vocative":"nefroză","plural-vocative":"nefrozelor"}},{"word":"nefructuos","pos":"adj","definitions":["unfruitful"],"forms":{"feminine-singular":"nefructuoasă","masculine-plural":"nefructuoși","feminine-neuter-plural":"nefructuoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefructuos","error-unrecognized-form-feminine-indefinite-singular":"nefructuoasă","error-unrecognized-form-indefinite-masculine-plural":"nefructuoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefructuoase","definite-error-unrecognized-form-masculine-neuter-singular":"nefructuosul","definite-error-unrecognized-form-feminine-singular":"nefructuoasa","definite-error-unrecognized-form-masculine-plural":"nefructuoșii","definite-error-unrecognized-form-feminine-neuter-plural":"nefructuoasele"}},{"word":"nefuncțional","pos":"adj","definitions":["nonfunctional"],"forms":{"feminine-singular":"nefuncțională","masculine-plural":"nefuncționali","feminine-neuter-plural":"nefuncționale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefuncțional","error-unrecognized-form-feminine-indefinite-singular":"nefuncțională","error-unrecognized-form-indefinite-masculine-plural":"nefuncționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefuncționale","definite-error-unrecognized-form-masculine-neuter-singular":"nefuncționalul","definite-error-unrecognized-form-feminine-singular":"nefuncționala","definite-error-unrecognized-form-masculine-plural":"nefuncționalii","definite-error-unrecognized-form-feminine-neuter-plural":"nefuncționalele"}},{"word":"nefundat","pos":"adj","definitions":["alternative form of nefondat"],"forms":{"feminine-singular":"nefundată","masculine-plural":"nefundați","feminine-neuter-plural":"nefundate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefundat","error-unrecognized-form-feminine-indefinite-singular":"nefundată","error-unrecognized-form-indefinite-masculine-plural":"nefundați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefundate","definite-error-unrecognized-form-masculine-neuter-singular":"nefundatul","definite-error-unrecognized-form-feminine-singular":"nefundata","definite-error-unrecognized-form-masculine-plural":"nefundații","definite-error-unrecognized-form-feminine-neuter-plural":"nefundatele"}},{"word":"nefutut","pos":"adj","definitions":["unfucked"],"forms":{"feminine-singular":"nefutută","masculine-plural":"nefutuți","feminine-neuter-plural":"nefutute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nefutut","error-unrecognized-form-feminine-indefinite-singular":"nefutută","error-unrecognized-form-indefinite-masculine-plural":"nefutuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nefutute","definite-error-unrecognized-form-masculine-neuter-singular":"nefututul","definite-error-unrecognized-form-feminine-singular":"nefututa","definite-error-unrecognized-form-masculine-plural":"nefutuții","definite-error-unrecognized-form-feminine-neuter-plural":"nefututele"}},{"word":"neg","pos":"noun","definitions":["wart, verruca"],"forms":{"plural":"negi"}},{"word":"nega","pos":"verb","definitions":["to deny"],"forms":{"canonical":"a nega 1st conjugation","present-singular-third-person":"neagă","participle-past":"negat","subjunctive-third-person":"nege","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a nega","gerund":"negând","first-person-indicative-present-singular":"neg","indicative-present-second-person-singular":"negi","indicative-present-singular-third-person":"neagă","first-person-indicative-plural-present":"negăm","indicative-plural-present-second-person":"negați","indicative-plural-present-third-person":"neagă","first-person-imperfect-indicative-singular":"negam","imperfect-indicative-second-person-singular":"negai","imperfect-indicative-singular-third-person":"nega","first-person-imperfect-indicative-plural":"negam","imperfect-indicative-plural-second-person":"negați","imperfect-indicative-plural-third-person":"negau","first-person-indicative-perfect-singular":"negai","indicative-perfect-second-person-singular":"negași","indicative-perfect-singular-third-person":"negă","first-person-indicative-perfect-plural":"negarăm","indicative-perfect-plural-second-person":"negarăți","indicative-perfect-plural-third-person":"negară","first-person-indicative-pluperfect-singular":"negasem","indicative-pluperfect-second-person-singular":"negaseși","indicative-pluperfect-singular-third-person":"negase","first-person-indicative-pluperfect-plural":"negaserăm","indicative-pluperfect-plural-second-person":"negaserăți","indicative-pluperfect-plural-third-person":"negaseră","first-person-present-singular-subjunctive":"să neg","present-second-person-singular-subjunctive":"să negi","present-singular-subjunctive-third-person":"să nege","first-person-plural-present-subjunctive":"să negăm","plural-present-second-person-subjunctive":"să negați","plural-present-subjunctive-third-person":"să nege","imperative-second-person-singular":"neagă","imperative-plural-second-person":"negați","imperative-negative-second-person-singular":"nu nega","imperative-negative-plural-second-person":"nu negați"}},{"word":"negai","pos":"verb","definitions":["inflection of nega:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[neˈɡaj]"},{"word":"negam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of nega"],"pronunciation":"[neˈɡam]"},{"word":"negândire","pos":"noun","definitions":["thoughtlessness"],"forms":{"plural":"negândiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"negândire","accusative-definite-nominative-singular":"negândirea","accusative-indefinite-nominative-plural":"negândiri","accusative-definite-nominative-plural":"negândirile","dative-genitive-indefinite-singular":"negândiri","dative-definite-genitive-singular":"negândirii","dative-genitive-indefinite-plural":"negândiri","dative-definite-genitive-plural":"negândirilor","singular-vocative":"negândire","plural-vocative":"negândirilor"}},{"word":"negândit","pos":"noun","definitions":["unthinking"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"negândit","accusative-definite-nominative":"negânditul","dative-genitive-indefinite":"negândit","dative-definite-genitive":"negânditului","vocative":"negânditule"}},{"word":"negară","pos":"noun","definitions":["alternative form of năgară"],"forms":{"plural":"negară","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"negară","accusative-definite-nominative-singular":"negara","accusative-indefinite-nominative-plural":"negare","accusative-definite-nominative-plural":"negarele","dative-genitive-indefinite-singular":"negare","dative-definite-genitive-singular":"negarei","dative-genitive-indefinite-plural":"negare","dative-definite-genitive-plural":"negarelor","singular-vocative":"negară","plural-vocative":"negarelor"}},{"word":"negare","pos":"noun","definitions":["negation"],"forms":{"plural":"negări"}},{"word":"negase","pos":"verb","definitions":["third-person singular pluperfect indicative of nega"],"pronunciation":"[neˈɡase]"},{"word":"negat","pos":"verb","definitions":["past participle of nega"],"pronunciation":"[neˈɡat]"},{"word":"negata","pos":"adj","definitions":["unready"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"negata","error-unrecognized-form-feminine-indefinite-singular":"negata","error-unrecognized-form-indefinite-masculine-plural":"negata","error-unrecognized-form-feminine-indefinite-neuter-plural":"negata","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"negație","pos":"noun","definitions":["negation"],"forms":{"plural":"negații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"negație","accusative-definite-nominative-singular":"negația","accusative-indefinite-nominative-plural":"negații","accusative-definite-nominative-plural":"negațiile","dative-genitive-indefinite-singular":"negații","dative-definite-genitive-singular":"negației","dative-genitive-indefinite-plural":"negații","dative-definite-genitive-plural":"negațiilor","singular-vocative":"negație","plural-vocative":"negațiilor"}},{"word":"negațiune","pos":"noun","definitions":["obsolete form of negație"],"forms":{"plural":"negațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"negațiune","accusative-definite-nominative-singular":"negațiunea","accusative-indefinite-nominative-plural":"negațiuni","accusative-definite-nominative-plural":"negațiunile","dative-genitive-indefinite-singular":"negațiuni","dative-definite-genitive-singular":"negațiunii","dative-genitive-indefinite-plural":"negațiuni","dative-definite-genitive-plural":"negațiunilor","singular-vocative":"negațiune","plural-vocative":"negațiunilor"}},{"word":"negativ","pos":"adj","definitions":["negative"],"forms":{"feminine-singular":"negativă","masculine-plural":"negativi","feminine-neuter-plural":"negative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"negativ","error-unrecognized-form-feminine-indefinite-singular":"negativă","error-unrecognized-form-indefinite-masculine-plural":"negativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"negative","definite-error-unrecognized-form-masculine-neuter-singular":"negativul","definite-error-unrecognized-form-feminine-singular":"negativa","definite-error-unrecognized-form-masculine-plural":"negativii","definite-error-unrecognized-form-feminine-neuter-plural":"negativele"}},{"word":"negativ","pos":"noun","definitions":["negative"],"forms":{"plural":"negative","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"negativ","accusative-definite-nominative-singular":"negativul","accusative-indefinite-nominative-plural":"negative","accusative-definite-nominative-plural":"negativele","dative-genitive-indefinite-singular":"negativ","dative-definite-genitive-singular":"negativului","dative-genitive-indefinite-plural":"negative","dative-definite-genitive-plural":"negativelor","singular-vocative":"negativule","plural-vocative":"negativelor"}},{"word":"negativa","pos":"verb","definitions":["to negativize"],"forms":{"canonical":"a negativa 1st conjugation","present-singular-third-person":"negativează","participle-past":"negativat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a negativa","gerund":"negativând","first-person-indicative-present-singular":"negativez","indicative-present-second-person-singular":"negativezi","indicative-present-singular-third-person":"negativează","first-person-indicative-plural-present":"negativăm","indicative-plural-present-second-person":"negativați","indicative-plural-present-third-person":"negativează","first-person-imperfect-indicative-singular":"negativam","imperfect-indicative-second-person-singular":"negativai","imperfect-indicative-singular-third-person":"negativa","first-person-imperfect-indicative-plural":"negativam","imperfect-indicative-plural-second-person":"negativați","imperfect-indicative-plural-third-person":"negativau","first-person-indicative-perfect-singular":"negativai","indicative-perfect-second-person-singular":"negativași","indicative-perfect-singular-third-person":"negativă","first-person-indicative-perfect-plural":"negativarăm","indicative-perfect-plural-second-person":"negativarăți","indicative-perfect-plural-third-person":"negativară","first-person-indicative-pluperfect-singular":"negativasem","indicative-pluperfect-second-person-singular":"negativaseși","indicative-pluperfect-singular-third-person":"negativase","first-person-indicative-pluperfect-plural":"negativaserăm","indicative-pluperfect-plural-second-person":"negativaserăți","indicative-pluperfect-plural-third-person":"negativaseră","first-person-present-singular-subjunctive":"să negativez","present-second-person-singular-subjunctive":"să negativezi","present-singular-subjunctive-third-person":"să negativeze","first-person-plural-present-subjunctive":"să negativăm","plural-present-second-person-subjunctive":"să negativați","plural-present-subjunctive-third-person":"să negativeze","imperative-second-person-singular":"negativează","imperative-plural-second-person":"negativați","imperative-negative-second-person-singular":"nu negativa","imperative-negative-plural-second-person":"nu negativați"}},{"word":"negativare","pos":"noun","definitions":["negativation"],"forms":{"plural":"negativări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"negativare","accusative-definite-nominative-singular":"negativarea","accusative-indefinite-nominative-plural":"negativări","accusative-definite-nominative-plural":"negativările","dative-genitive-indefinite-singular":"negativări","dative-definite-genitive-singular":"negativării","dative-genitive-indefinite-plural":"negativări","dative-definite-genitive-plural":"negativărilor","singular-vocative":"negativare","plural-vocative":"negativărilor"}},{"word":"negativat","pos":"adj","definitions":["negativated"],"forms":{"feminine-singular":"negativată","masculine-plural":"negativați","feminine-neuter-plural":"negativate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"negativat","error-unrecognized-form-feminine-indefinite-singular":"negativată","error-unrecognized-form-indefinite-masculine-plural":"negativați","error-unrecognized-form-feminine-indefinite-neuter-plural":"negativate","definite-error-unrecognized-form-masculine-neuter-singular":"negativatul","definite-error-unrecognized-form-feminine-singular":"negativata","definite-error-unrecognized-form-masculine-plural":"negativații","definite-error-unrecognized-form-feminine-neuter-plural":"negativatele"}},{"word":"negativat","pos":"verb","definitions":["past participle of negativa"],"forms":{"participle-past":"of negativa"}},{"word":"negativism","pos":"noun","definitions":["negativism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"negativism","accusative-definite-nominative":"negativismul","dative-genitive-indefinite":"negativism","dative-definite-genitive":"negativismului","vocative":"negativismule"}},{"word":"negativist","pos":"noun","definitions":["negativist"],"forms":{"plural":"negativiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"negativist","accusative-definite-nominative-singular":"negativistul","accusative-indefinite-nominative-plural":"negativiști","accusative-definite-nominative-plural":"negativiștii","dative-genitive-indefinite-singular":"negativist","dative-definite-genitive-singular":"negativistului","dative-genitive-indefinite-plural":"negativiști","dative-definite-genitive-plural":"negativiștilor","singular-vocative":"negativistule","plural-vocative":"negativiștilor"}},{"word":"negativistă","pos":"noun","definitions":["female equivalent of negativist"],"forms":{"plural":"negativiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"negativistă","accusative-definite-nominative-singular":"negativista","accusative-indefinite-nominative-plural":"negativiste","accusative-definite-nominative-plural":"negativistele","dative-genitive-indefinite-singular":"negativiste","dative-definite-genitive-singular":"negativistei","dative-genitive-indefinite-plural":"negativiste","dative-definite-genitive-plural":"negativistelor","singular-vocative":"negativistă","plural-vocative":"negativistelor"}},{"word":"negativitate","pos":"noun","definitions":["negativity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"negativitate","accusative-definite-nominative-singular":"negativitatea","accusative-indefinite-nominative-plural":"negativități","accusative-definite-nominative-plural":"negativitățile","dative-genitive-indefinite-singular":"negativități","dative-definite-genitive-singular":"negativității","dative-genitive-indefinite-plural":"negativități","dative-definite-genitive-plural":"negativităților","singular-vocative":"negativitate","plural-vocative":"negativităților"}},{"word":"negativiza","pos":"verb","definitions":["to negativize"],"forms":{"canonical":"a negativiza 1st conjugation","present-singular-third-person":"negativizează","participle-past":"negativizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a negativiza","gerund":"negativizând","first-person-indicative-present-singular":"negativizez","indicative-present-second-person-singular":"negativizezi","indicative-present-singular-third-person":"negativizează","first-person-indicative-plural-present":"negativizăm","indicative-plural-present-second-person":"negativizați","indicative-plural-present-third-person":"negativizează","first-person-imperfect-indicative-singular":"negativizam","imperfect-indicative-second-person-singular":"negativizai","imperfect-indicative-singular-third-person":"negativiza","first-person-imperfect-indicative-plural":"negativizam","imperfect-indicative-plural-second-person":"negativizați","imperfect-indicative-plural-third-person":"negativizau","first-person-indicative-perfect-singular":"negativizai","indicative-perfect-second-person-singular":"negativizași","indicative-perfect-singular-third-person":"negativiză","first-person-indicative-perfect-plural":"negativizarăm","indicative-perfect-plural-second-person":"negativizarăți","indicative-perfect-plural-third-person":"negativizară","first-person-indicative-pluperfect-singular":"negativizasem","indicative-pluperfect-second-person-singular":"negativizaseși","indicative-pluperfect-singular-third-person":"negativizase","first-person-indicative-pluperfect-plural":"negativizaserăm","indicative-pluperfect-plural-second-person":"negativizaserăți","indicative-pluperfect-plural-third-person":"negativizaseră","first-person-present-singular-subjunctive":"să negativizez","present-second-person-singular-subjunctive":"să negativizezi","present-singular-subjunctive-third-person":"să negativizeze","first-person-plural-present-subjunctive":"să negativizăm","plural-present-second-person-subjunctive":"să negativizați","plural-present-subjunctive-third-person":"să negativizeze","imperative-second-person-singular":"negativizează","imperative-plural-second-person":"negativizați","imperative-negative-second-person-singular":"nu negativiza","imperative-negative-plural-second-person":"nu negativizați"}},{"word":"negativizare","pos":"noun","definitions":["negativization"],"forms":{"plural":"negativizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"negativizare","accusative-definite-nominative-singular":"negativizarea","accusative-indefinite-nominative-plural":"negativizări","accusative-definite-nominative-plural":"negativizările","dative-genitive-indefinite-singular":"negativizări","dative-definite-genitive-singular":"negativizării","dative-genitive-indefinite-plural":"negativizări","dative-definite-genitive-plural":"negativizărilor","singular-vocative":"negativizare","plural-vocative":"negativizărilor"}},{"word":"negatoare","pos":"noun","definitions":["female equivalent of negator"],"forms":{"plural":"negatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"negatoare","accusative-definite-nominative-singular":"negatoarea","accusative-indefinite-nominative-plural":"negatoare","accusative-definite-nominative-plural":"negatoarele","dative-genitive-indefinite-singular":"negatoare","dative-definite-genitive-singular":"negatoarei","dative-genitive-indefinite-plural":"negatoare","dative-definite-genitive-plural":"negatoarelor","singular-vocative":"negatoare","plural-vocative":"negatoarelor"}},{"word":"negaton","pos":"noun","definitions":["negaton"],"pronunciation":"/ne.ɡaˈton/","forms":{"plural":"negatoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"negaton","accusative-definite-nominative-singular":"negatonul","accusative-indefinite-nominative-plural":"negatoni","accusative-definite-nominative-plural":"negatonii","dative-genitive-indefinite-singular":"negaton","dative-definite-genitive-singular":"negatonului","dative-genitive-indefinite-plural":"negatoni","dative-definite-genitive-plural":"negatonilor","singular-vocative":"negatonule","plural-vocative":"negatonilor"}},{"word":"negator","pos":"noun","definitions":["negator, denier detractor"],"forms":{"plural":"negatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"negator","accusative-definite-nominative-singular":"negatorul","accusative-indefinite-nominative-plural":"negatori","accusative-definite-nominative-plural":"negatorii","dative-genitive-indefinite-singular":"negator","dative-definite-genitive-singular":"negatorului","dative-genitive-indefinite-plural":"negatori","dative-definite-genitive-plural":"negatorilor","singular-vocative":"negatorule","plural-vocative":"negatorilor"}},{"word":"negatoscop","pos":"noun","definitions":["negatoscope"],"forms":{"plural":"negatoscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"negatoscop","accusative-definite-nominative-singular":"negatoscopul","accusative-indefinite-nominative-plural":"negatoscoape","accusative-definite-nominative-plural":"negatoscoapele","dative-genitive-indefinite-singular":"negatoscop","dative-definite-genitive-singular":"negatoscopului","dative-genitive-indefinite-plural":"negatoscoape","dative-definite-genitive-plural":"negatoscoapelor","singular-vocative":"negatoscopule","plural-vocative":"negatoscoapelor"}},{"word":"negatron","pos":"noun","definitions":["negatron"],"forms":{"plural":"negatroni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"negatron","accusative-definite-nominative-singular":"negatronul","accusative-indefinite-nominative-plural":"negatroni","accusative-definite-nominative-plural":"negatronii","dative-genitive-indefinite-singular":"negatron","dative-definite-genitive-singular":"negatronului","dative-genitive-indefinite-plural":"negatroni","dative-definite-genitive-plural":"negatronilor","singular-vocative":"negatronule","plural-vocative":"negatronilor"}},{"word":"negau","pos":"verb","definitions":["third-person plural imperfect indicative of nega"],"pronunciation":"[neˈɡaw]"},{"word":"nege","pos":"verb","definitions":["third-person singular/plural present subjunctive of nega"],"pronunciation":"[ˈned͡ʒe]"},{"word":"Negel","pos":"name","definitions":["a river in Bacău, Romania, tributary to the Trebiș"],"gender":"m"},{"word":"negel","pos":"noun","definitions":["small wart"],"forms":{"plural":"negei"}},{"word":"negelariță","pos":"noun","definitions":["greater celandine (Chelidonium majus)"],"forms":{"plural":"negelarițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"negelariță","accusative-definite-nominative-singular":"negelarița","accusative-indefinite-nominative-plural":"negelarițe","accusative-definite-nominative-plural":"negelarițele","dative-genitive-indefinite-singular":"negelarițe","dative-definite-genitive-singular":"negelariței","dative-genitive-indefinite-plural":"negelarițe","dative-definite-genitive-plural":"negelarițelor","singular-vocative":"negelariță","plural-vocative":"negelarițelor"}},{"word":"negelăriță","pos":"noun","definitions":["greater celandine (Chelidonium majus)"],"forms":{"plural":"negelărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"negelăriță","accusative-definite-nominative-singular":"negelărița","accusative-indefinite-nominative-plural":"negelărițe","accusative-definite-nominative-plural":"negelărițele","dative-genitive-indefinite-singular":"negelărițe","dative-definite-genitive-singular":"negelăriței","dative-genitive-indefinite-plural":"negelărițe","dative-definite-genitive-plural":"negelărițelor","singular-vocative":"negelăriță","plural-vocative":"negelărițelor"}},{"word":"negelos","pos":"adj","definitions":["warty"],"forms":{"feminine-singular":"negeloasă","masculine-plural":"negeloși","feminine-neuter-plural":"negeloase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"negelos","error-unrecognized-form-feminine-indefinite-singular":"negeloasă","error-unrecognized-form-indefinite-masculine-plural":"negeloși","error-unrecognized-form-feminine-indefinite-neuter-plural":"negeloase","definite-error-unrecognized-form-masculine-neuter-singular":"negelosul","definite-error-unrecognized-form-feminine-singular":"negeloasa","definite-error-unrecognized-form-masculine-plural":"negeloșii","definite-error-unrecognized-form-feminine-neuter-plural":"negeloasele"}},{"word":"Negescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Negescu"}},{"word":"Negești","pos":"name","definitions":["a village in Scărișoara, Alba County, Romania","a village in Cotmeana, Argeș County, Romania"],"gender":"m"},{"word":"neghina","pos":"noun","definitions":["definite singular nominative/accusative of neghină"],"gender":"f"},{"word":"Neghină","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Neghină"}},{"word":"neghină","pos":"noun","definitions":["corncockle (Agrostemma githago)"],"forms":{"plural":"neghine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neghină","accusative-definite-nominative-singular":"neghina","accusative-indefinite-nominative-plural":"neghine","accusative-definite-nominative-plural":"neghinele","dative-genitive-indefinite-singular":"neghine","dative-definite-genitive-singular":"neghinei","dative-genitive-indefinite-plural":"neghine","dative-definite-genitive-plural":"neghinelor","singular-vocative":"neghină","plural-vocative":"neghinelor"}},{"word":"Neghinești","pos":"name","definitions":["a village in Stoenești, Vâlcea County, Romania"],"gender":"m"},{"word":"neghiniță","pos":"noun","definitions":["diminutive of neghină; small cockle"],"forms":{"plural":"neghinițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neghiniță","accusative-definite-nominative-singular":"neghinița","accusative-indefinite-nominative-plural":"neghinițe","accusative-definite-nominative-plural":"neghinițele","dative-genitive-indefinite-singular":"neghinițe","dative-definite-genitive-singular":"neghiniței","dative-genitive-indefinite-plural":"neghinițe","dative-definite-genitive-plural":"neghinițelor","singular-vocative":"neghiniță","plural-vocative":"neghinițelor"}},{"word":"neghinos","pos":"adj","definitions":["containing corncockle"],"forms":{"feminine-singular":"neghinoasă","masculine-plural":"neghinoși","feminine-neuter-plural":"neghinoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neghinos","error-unrecognized-form-feminine-indefinite-singular":"neghinoasă","error-unrecognized-form-indefinite-masculine-plural":"neghinoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"neghinoase","definite-error-unrecognized-form-masculine-neuter-singular":"neghinosul","definite-error-unrecognized-form-feminine-singular":"neghinoasa","definite-error-unrecognized-form-masculine-plural":"neghinoșii","definite-error-unrecognized-form-feminine-neuter-plural":"neghinoasele"}},{"word":"neghinuță","pos":"noun","definitions":["diminutive of neghină; small cockle"],"forms":{"plural":"neghinuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neghinuță","accusative-definite-nominative-singular":"neghinuța","accusative-indefinite-nominative-plural":"neghinuțe","accusative-definite-nominative-plural":"neghinuțele","dative-genitive-indefinite-singular":"neghinuțe","dative-definite-genitive-singular":"neghinuței","dative-genitive-indefinite-plural":"neghinuțe","dative-definite-genitive-plural":"neghinuțelor","singular-vocative":"neghinuță","plural-vocative":"neghinuțelor"}},{"word":"neghioabă","pos":"noun","definitions":["female equivalent of neghiob"],"forms":{"plural":"neghioabe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neghioabă","accusative-definite-nominative-singular":"neghioaba","accusative-indefinite-nominative-plural":"neghioabe","accusative-definite-nominative-plural":"neghioabele","dative-genitive-indefinite-singular":"neghioabe","dative-definite-genitive-singular":"neghioabei","dative-genitive-indefinite-plural":"neghioabe","dative-definite-genitive-plural":"neghioabelor","singular-vocative":"neghioabă","plural-vocative":"neghioabelor"}},{"word":"neghiob","pos":"adj","definitions":["silly, stupid, foolish, thoughtless, clumsy, blockheaded"],"pronunciation":"/neˈɡjob/","forms":{"feminine-singular":"neghioabă","masculine-plural":"neghiobi","feminine-neuter-plural":"neghioabe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neghiob","error-unrecognized-form-feminine-indefinite-singular":"neghioabă","error-unrecognized-form-indefinite-masculine-plural":"neghiobi","error-unrecognized-form-feminine-indefinite-neuter-plural":"neghioabe","definite-error-unrecognized-form-masculine-neuter-singular":"neghiobul","definite-error-unrecognized-form-feminine-singular":"neghioaba","definite-error-unrecognized-form-masculine-plural":"neghiobii","definite-error-unrecognized-form-feminine-neuter-plural":"neghioabele"}},{"word":"neghiobesc","pos":"adj","definitions":["silly, foolish"],"forms":{"feminine-singular":"neghiobească","plural":"neghiobești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neghiobesc","error-unrecognized-form-feminine-indefinite-singular":"neghiobească","error-unrecognized-form-indefinite-masculine-plural":"neghiobești","error-unrecognized-form-feminine-indefinite-neuter-plural":"neghiobești","definite-error-unrecognized-form-masculine-neuter-singular":"neghiobescul","definite-error-unrecognized-form-feminine-singular":"neghiobeasca","definite-error-unrecognized-form-masculine-plural":"neghiobeștii","definite-error-unrecognized-form-feminine-neuter-plural":"neghiobeștile"}},{"word":"neghiobește","pos":"adv","definitions":["foolishly"]},{"word":"neghiobie","pos":"noun","definitions":["foolishness"],"forms":{"plural":"neghiobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neghiobie","accusative-definite-nominative-singular":"neghiobia","accusative-indefinite-nominative-plural":"neghiobii","accusative-definite-nominative-plural":"neghiobiile","dative-genitive-indefinite-singular":"neghiobii","dative-definite-genitive-singular":"neghiobiei","dative-genitive-indefinite-plural":"neghiobii","dative-definite-genitive-plural":"neghiobiilor","singular-vocative":"neghiobie","plural-vocative":"neghiobiilor"}},{"word":"neghiobire","pos":"noun","definitions":["stupidification"],"forms":{"plural":"neghiobiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neghiobire","accusative-definite-nominative-singular":"neghiobirea","accusative-indefinite-nominative-plural":"neghiobiri","accusative-definite-nominative-plural":"neghiobirile","dative-genitive-indefinite-singular":"neghiobiri","dative-definite-genitive-singular":"neghiobirii","dative-genitive-indefinite-plural":"neghiobiri","dative-definite-genitive-plural":"neghiobirilor","singular-vocative":"neghiobire","plural-vocative":"neghiobirilor"}},{"word":"negi","pos":"verb","definitions":["second-person singular present indicative/subjunctive of nega"],"pronunciation":"[ned͡ʒʲ]"},{"word":"neginea","pos":"noun","definitions":["carnation (Dianthus caryophyllus)"],"forms":{"plural":"neginele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"neginea","accusative-definite-nominative-singular":"negineaua","accusative-indefinite-nominative-plural":"neginele","accusative-definite-nominative-plural":"neginelele","dative-genitive-indefinite-singular":"neginele","dative-definite-genitive-singular":"neginelei","dative-genitive-indefinite-plural":"neginele","dative-definite-genitive-plural":"neginelelor","singular-vocative":"neginea","plural-vocative":"neginelelor"}},{"word":"Negiudin","pos":"name","definitions":["a village in Cornereva, Caraș-Severin County, Romania"],"gender":"m"},{"word":"neglasnică","pos":"noun","definitions":["consonant"],"forms":{"plural":"neglasnice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neglasnică","accusative-definite-nominative-singular":"neglasnica","accusative-indefinite-nominative-plural":"neglasnice","accusative-definite-nominative-plural":"neglasnicele","dative-genitive-indefinite-singular":"neglasnice","dative-definite-genitive-singular":"neglasnicei","dative-genitive-indefinite-plural":"neglasnice","dative-definite-genitive-plural":"neglasnicelor","singular-vocative":"neglasnică","plural-vocative":"neglasnicelor"}},{"word":"negles","pos":"adj","definitions":["obsolete form of neglijat"],"forms":{"feminine-singular":"neglesă","masculine-plural":"negleși","feminine-neuter-plural":"neglese","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"negles","error-unrecognized-form-feminine-indefinite-singular":"neglesă","error-unrecognized-form-indefinite-masculine-plural":"negleși","error-unrecognized-form-feminine-indefinite-neuter-plural":"neglese","definite-error-unrecognized-form-masculine-neuter-singular":"neglesul","definite-error-unrecognized-form-feminine-singular":"neglesa","definite-error-unrecognized-form-masculine-plural":"negleșii","definite-error-unrecognized-form-feminine-neuter-plural":"neglesele"}},{"word":"negligent","pos":"adj","definitions":["obsolete form of neglijent"],"forms":{"feminine-singular":"negligentă","masculine-plural":"negligenți","feminine-neuter-plural":"negligente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"negligent","error-unrecognized-form-feminine-indefinite-singular":"negligentă","error-unrecognized-form-indefinite-masculine-plural":"negligenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"negligente","definite-error-unrecognized-form-masculine-neuter-singular":"negligentul","definite-error-unrecognized-form-feminine-singular":"negligenta","definite-error-unrecognized-form-masculine-plural":"negligenții","definite-error-unrecognized-form-feminine-neuter-plural":"negligentele"}},{"word":"neglija","pos":"verb","definitions":["to neglect"],"forms":{"canonical":"a neglija 1st conjugation","present-singular-third-person":"neglijează","participle-past":"neglijat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a neglija","gerund":"neglijând","first-person-indicative-present-singular":"neglijez","indicative-present-second-person-singular":"neglijezi","indicative-present-singular-third-person":"neglijează","first-person-indicative-plural-present":"neglijăm","indicative-plural-present-second-person":"neglijați","indicative-plural-present-third-person":"neglijează","first-person-imperfect-indicative-singular":"neglijam","imperfect-indicative-second-person-singular":"neglijai","imperfect-indicative-singular-third-person":"neglija","first-person-imperfect-indicative-plural":"neglijam","imperfect-indicative-plural-second-person":"neglijați","imperfect-indicative-plural-third-person":"neglijau","first-person-indicative-perfect-singular":"neglijai","indicative-perfect-second-person-singular":"neglijași","indicative-perfect-singular-third-person":"neglijă","first-person-indicative-perfect-plural":"neglijarăm","indicative-perfect-plural-second-person":"neglijarăți","indicative-perfect-plural-third-person":"neglijară","first-person-indicative-pluperfect-singular":"neglijasem","indicative-pluperfect-second-person-singular":"neglijaseși","indicative-pluperfect-singular-third-person":"neglijase","first-person-indicative-pluperfect-plural":"neglijaserăm","indicative-pluperfect-plural-second-person":"neglijaserăți","indicative-pluperfect-plural-third-person":"neglijaseră","first-person-present-singular-subjunctive":"să neglijez","present-second-person-singular-subjunctive":"să neglijezi","present-singular-subjunctive-third-person":"să neglijeze","first-person-plural-present-subjunctive":"să neglijăm","plural-present-second-person-subjunctive":"să neglijați","plural-present-subjunctive-third-person":"să neglijeze","imperative-second-person-singular":"neglijează","imperative-plural-second-person":"neglijați","imperative-negative-second-person-singular":"nu neglija","imperative-negative-plural-second-person":"nu neglijați"}},{"word":"neglijabil","pos":"adj","definitions":["negligible"],"forms":{"feminine-singular":"neglijabilă","masculine-plural":"neglijabili","feminine-neuter-plural":"neglijabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neglijabil","error-unrecognized-form-feminine-indefinite-singular":"neglijabilă","error-unrecognized-form-indefinite-masculine-plural":"neglijabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neglijabile","definite-error-unrecognized-form-masculine-neuter-singular":"neglijabilul","definite-error-unrecognized-form-feminine-singular":"neglijabila","definite-error-unrecognized-form-masculine-plural":"neglijabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neglijabilele"}},{"word":"neglijare","pos":"noun","definitions":["neglect"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"neglijare","accusative-definite-nominative":"neglijarea","dative-genitive-indefinite":"neglijare","dative-definite-genitive":"neglijarei","vocative":"neglijare"}},{"word":"neglijarisi","pos":"verb","definitions":["to neglect"],"forms":{"canonical":"a neglijarisi 4th conjugation","present-singular-third-person":"neglijarisește","participle-past":"neglijarisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a neglijarisi","gerund":"neglijarisind","first-person-indicative-present-singular":"neglijarisesc","indicative-present-second-person-singular":"neglijarisești","indicative-present-singular-third-person":"neglijarisește","first-person-indicative-plural-present":"neglijarisim","indicative-plural-present-second-person":"neglijarisiți","indicative-plural-present-third-person":"neglijarisesc","first-person-imperfect-indicative-singular":"neglijariseam","imperfect-indicative-second-person-singular":"neglijariseai","imperfect-indicative-singular-third-person":"neglijarisea","first-person-imperfect-indicative-plural":"neglijariseam","imperfect-indicative-plural-second-person":"neglijariseați","imperfect-indicative-plural-third-person":"neglijariseau","first-person-indicative-perfect-singular":"neglijarisii","indicative-perfect-second-person-singular":"neglijarisiși","indicative-perfect-singular-third-person":"neglijarisi","first-person-indicative-perfect-plural":"neglijarisirăm","indicative-perfect-plural-second-person":"neglijarisirăți","indicative-perfect-plural-third-person":"neglijarisiră","first-person-indicative-pluperfect-singular":"neglijarisisem","indicative-pluperfect-second-person-singular":"neglijarisiseși","indicative-pluperfect-singular-third-person":"neglijarisise","first-person-indicative-pluperfect-plural":"neglijarisiserăm","indicative-pluperfect-plural-second-person":"neglijarisiserăți","indicative-pluperfect-plural-third-person":"neglijarisiseră","first-person-present-singular-subjunctive":"să neglijarisesc","present-second-person-singular-subjunctive":"să neglijarisești","present-singular-subjunctive-third-person":"să neglijarisească","first-person-plural-present-subjunctive":"să neglijarisim","plural-present-second-person-subjunctive":"să neglijarisiți","plural-present-subjunctive-third-person":"să neglijarisească","imperative-second-person-singular":"neglijarisește","imperative-plural-second-person":"neglijarisiți","imperative-negative-second-person-singular":"nu neglijarisi","imperative-negative-plural-second-person":"nu neglijarisiți"}},{"word":"neglijat","pos":"adj","definitions":["neglected"],"forms":{"feminine-singular":"neglijată","masculine-plural":"neglijați","feminine-neuter-plural":"neglijate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neglijat","error-unrecognized-form-feminine-indefinite-singular":"neglijată","error-unrecognized-form-indefinite-masculine-plural":"neglijați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neglijate","definite-error-unrecognized-form-masculine-neuter-singular":"neglijatul","definite-error-unrecognized-form-feminine-singular":"neglijata","definite-error-unrecognized-form-masculine-plural":"neglijații","definite-error-unrecognized-form-feminine-neuter-plural":"neglijatele"}},{"word":"neglije","pos":"noun","definitions":["obsolete form of neglijeu"],"forms":{"plural":"neglijeuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"neglije","accusative-definite-nominative-singular":"neglijeul","accusative-indefinite-nominative-plural":"neglijeuri","accusative-definite-nominative-plural":"neglijeurile","dative-genitive-indefinite-singular":"neglije","dative-definite-genitive-singular":"neglijeului","dative-genitive-indefinite-plural":"neglijeuri","dative-definite-genitive-plural":"neglijeurilor","singular-vocative":"neglijeule","plural-vocative":"neglijeurilor"}},{"word":"neglijent","pos":"adj","definitions":["negligent"],"pronunciation":"/ne.ɡliˈʒent/","forms":{"feminine-singular":"neglijentă","masculine-plural":"neglijenți","feminine-neuter-plural":"neglijente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neglijent","error-unrecognized-form-feminine-indefinite-singular":"neglijentă","error-unrecognized-form-indefinite-masculine-plural":"neglijenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neglijente","definite-error-unrecognized-form-masculine-neuter-singular":"neglijentul","definite-error-unrecognized-form-feminine-singular":"neglijenta","definite-error-unrecognized-form-masculine-plural":"neglijenții","definite-error-unrecognized-form-feminine-neuter-plural":"neglijentele"}},{"word":"neglijență","pos":"noun","definitions":["negligence"]},{"word":"neglijeu","pos":"noun","definitions":["négligée, peignoir"],"forms":{"plural":"neglijeuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neglijeu","accusative-definite-nominative-singular":"neglijeul","accusative-indefinite-nominative-plural":"neglijeuri","accusative-definite-nominative-plural":"neglijeurile","dative-genitive-indefinite-singular":"neglijeu","dative-definite-genitive-singular":"neglijeului","dative-genitive-indefinite-plural":"neglijeuri","dative-definite-genitive-plural":"neglijeurilor","singular-vocative":"neglijeule","plural-vocative":"neglijeurilor"}},{"word":"neglijez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of neglija"],"pronunciation":"[neɡliˈʒez]"},{"word":"negoci","pos":"noun","definitions":["stye (bacterial infection of the eyelash or eyelid)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"negoci","accusative-definite-nominative":"negociul","dative-genitive-indefinite":"negoci","dative-definite-genitive":"negociului","vocative":"negociule"}},{"word":"negocia","pos":"verb","definitions":["to negotiate"],"forms":{"canonical":"a negocia 1st conjugation","present-singular-third-person":"negociază","participle-past":"negociat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a negocia","gerund":"negociind","first-person-indicative-present-singular":"negociez","indicative-present-second-person-singular":"negociezi","indicative-present-singular-third-person":"negociază","first-person-indicative-plural-present":"negociem","indicative-plural-present-second-person":"negociați","indicative-plural-present-third-person":"negociază","first-person-imperfect-indicative-singular":"negociam","imperfect-indicative-second-person-singular":"negociai","imperfect-indicative-singular-third-person":"negocia","first-person-imperfect-indicative-plural":"negociam","imperfect-indicative-plural-second-person":"negociați","imperfect-indicative-plural-third-person":"negociau","first-person-indicative-perfect-singular":"negociai","indicative-perfect-second-person-singular":"negociași","indicative-perfect-singular-third-person":"negocie","first-person-indicative-perfect-plural":"negociarăm","indicative-perfect-plural-second-person":"negociarăți","indicative-perfect-plural-third-person":"negociară","first-person-indicative-pluperfect-singular":"negociasem","indicative-pluperfect-second-person-singular":"negociaseși","indicative-pluperfect-singular-third-person":"negociase","first-person-indicative-pluperfect-plural":"negociaserăm","indicative-pluperfect-plural-second-person":"negociaserăți","indicative-pluperfect-plural-third-person":"negociaseră","first-person-present-singular-subjunctive":"să negociez","present-second-person-singular-subjunctive":"să negociezi","present-singular-subjunctive-third-person":"să negocieze","first-person-plural-present-subjunctive":"să negociem","plural-present-second-person-subjunctive":"să negociați","plural-present-subjunctive-third-person":"să negocieze","imperative-second-person-singular":"negociază","imperative-plural-second-person":"negociați","imperative-negative-second-person-singular":"nu negocia","imperative-negative-plural-second-person":"nu negociați"}},{"word":"negociabil","pos":"adj","definitions":["negotiable"],"forms":{"feminine-singular":"negociabilă","masculine-plural":"negociabili","feminine-neuter-plural":"negociabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"negociabil","error-unrecognized-form-feminine-indefinite-singular":"negociabilă","error-unrecognized-form-indefinite-masculine-plural":"negociabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"negociabile","definite-error-unrecognized-form-masculine-neuter-singular":"negociabilul","definite-error-unrecognized-form-feminine-singular":"negociabila","definite-error-unrecognized-form-masculine-plural":"negociabilii","definite-error-unrecognized-form-feminine-neuter-plural":"negociabilele"}},{"word":"negociabilitate","pos":"noun","definitions":["negotiability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"negociabilitate","accusative-definite-nominative-singular":"negociabilitatea","accusative-indefinite-nominative-plural":"negociabilități","accusative-definite-nominative-plural":"negociabilitățile","dative-genitive-indefinite-singular":"negociabilități","dative-definite-genitive-singular":"negociabilității","dative-genitive-indefinite-plural":"negociabilități","dative-definite-genitive-plural":"negociabilităților","singular-vocative":"negociabilitate","plural-vocative":"negociabilităților"}},{"word":"negociai","pos":"verb","definitions":["inflection of negocia:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[neɡot͡ʃiˈaj]"},{"word":"negociam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of negocia"],"pronunciation":"[neɡot͡ʃiˈam]"},{"word":"negociant","pos":"noun","definitions":["merchant, dealer"],"forms":{"plural":"negocianți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"negociant","accusative-definite-nominative-singular":"negociantul","accusative-indefinite-nominative-plural":"negocianți","accusative-definite-nominative-plural":"negocianții","dative-genitive-indefinite-singular":"negociant","dative-definite-genitive-singular":"negociantului","dative-genitive-indefinite-plural":"negocianți","dative-definite-genitive-plural":"negocianților","singular-vocative":"negociantule","plural-vocative":"negocianților"}},{"word":"negociase","pos":"verb","definitions":["third-person singular pluperfect indicative of negocia"],"pronunciation":"[neɡot͡ʃiˈase]"},{"word":"negociat","pos":"verb","definitions":["past participle of negocia"],"pronunciation":"[neɡot͡ʃiˈat]"},{"word":"negociație","pos":"noun","definitions":["negotiation"],"forms":{"plural":"negociații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"negociație","accusative-definite-nominative-singular":"negociația","accusative-indefinite-nominative-plural":"negociații","accusative-definite-nominative-plural":"negociațiile","dative-genitive-indefinite-singular":"negociații","dative-definite-genitive-singular":"negociației","dative-genitive-indefinite-plural":"negociații","dative-definite-genitive-plural":"negociațiilor","singular-vocative":"negociație","plural-vocative":"negociațiilor"}},{"word":"negociațiune","pos":"noun","definitions":["obsolete form of negociație"],"forms":{"plural":"negociațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"negociațiune","accusative-definite-nominative-singular":"negociațiunea","accusative-indefinite-nominative-plural":"negociațiuni","accusative-definite-nominative-plural":"negociațiunile","dative-genitive-indefinite-singular":"negociațiuni","dative-definite-genitive-singular":"negociațiunii","dative-genitive-indefinite-plural":"negociațiuni","dative-definite-genitive-plural":"negociațiunilor","singular-vocative":"negociațiune","plural-vocative":"negociațiunilor"}},{"word":"negociatoare","pos":"noun","definitions":["female equivalent of negociator"],"forms":{"plural":"negociatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"negociatoare","accusative-definite-nominative-singular":"negociatoarea","accusative-indefinite-nominative-plural":"negociatoare","accusative-definite-nominative-plural":"negociatoarele","dative-genitive-indefinite-singular":"negociatoare","dative-definite-genitive-singular":"negociatoarei","dative-genitive-indefinite-plural":"negociatoare","dative-definite-genitive-plural":"negociatoarelor","singular-vocative":"negociatoare","plural-vocative":"negociatoarelor"}},{"word":"negociator","pos":"noun","definitions":["negotiator"],"forms":{"plural":"negociatori","feminine":"equivalent negociatoare"}},{"word":"negocie","pos":"verb","definitions":["third-person singular simple perfect indicative of negocia"],"pronunciation":"[neɡot͡ʃiˈe]"},{"word":"negociem","pos":"verb","definitions":["second-person plural present indicative/subjunctive of negocia"],"pronunciation":"[neɡot͡ʃiˈem]"},{"word":"negociere","pos":"noun","definitions":["negotiation"],"forms":{"plural":"negocieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"negociere","accusative-definite-nominative-singular":"negocierea","accusative-indefinite-nominative-plural":"negocieri","accusative-definite-nominative-plural":"negocierile","dative-genitive-indefinite-singular":"negocieri","dative-definite-genitive-singular":"negocierii","dative-genitive-indefinite-plural":"negocieri","dative-definite-genitive-plural":"negocierilor","singular-vocative":"negociere","plural-vocative":"negocierilor"}},{"word":"Negoescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Negoescu"}},{"word":"Negoescu Mare","pos":"name","definitions":["a river in Maramureș County, Romania, tributary to the Vișeu"],"gender":"m"},{"word":"Negoeșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Negoeșteanu"}},{"word":"Negoești","pos":"name","definitions":["a village in Șoldanu, Călărași County, Romania","a village in Baia de Aramă, Mehedinți County, Romania"],"gender":"m"},{"word":"Negoi","pos":"name","definitions":["a commune of Dolj County, Romania","a village in Negoi, Dolj County, Romania"],"gender":"m"},{"word":"Negoiaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Negoiaș"}},{"word":"Negoiescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Negoiescu"}},{"word":"Negoiești","pos":"name","definitions":["a village in Ștefan cel Mare, Bacău County, Romania","a village in Melinești, Dolj County, Romania","a village in Prigoria, Gorj County, Romania","a village in Brazi, Prahova County, Romania"],"gender":"m"},{"word":"Negoiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Negoiță"}},{"word":"Negoițescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Negoițescu"}},{"word":"Negoiu","pos":"name","definitions":["a village in Lunca Cernii de Jos, Hunedoara County, Romania"],"gender":"m"},{"word":"Negomir","pos":"name","definitions":["a commune of Gorj County, Romania","a village in Negomir, Gorj County, Romania"],"gender":"m"},{"word":"Negomireanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Negomireanu"}},{"word":"Negomiru","pos":"name","definitions":["a river in Gorj, Romania, tributary to the Jilț"],"gender":"m"},{"word":"negorie","pos":"noun","definitions":["anthrax"],"forms":{"plural":"negorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"negorie","accusative-definite-nominative-singular":"negoria","accusative-indefinite-nominative-plural":"negorii","accusative-definite-nominative-plural":"negoriile","dative-genitive-indefinite-singular":"negorii","dative-definite-genitive-singular":"negoriei","dative-genitive-indefinite-plural":"negorii","dative-definite-genitive-plural":"negoriilor","singular-vocative":"negorie","plural-vocative":"negoriilor"}},{"word":"negos","pos":"adj","definitions":["warty"],"forms":{"feminine-singular":"negoasă","masculine-plural":"negoși","feminine-neuter-plural":"negoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"negos","error-unrecognized-form-feminine-indefinite-singular":"negoasă","error-unrecognized-form-indefinite-masculine-plural":"negoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"negoase","definite-error-unrecognized-form-masculine-neuter-singular":"negosul","definite-error-unrecognized-form-feminine-singular":"negoasa","definite-error-unrecognized-form-masculine-plural":"negoșii","definite-error-unrecognized-form-feminine-neuter-plural":"negoasele"}},{"word":"Negoșina","pos":"name","definitions":["a village in Cănești, Buzău County, Romania"],"gender":"f"},{"word":"Negostina","pos":"name","definitions":["a river in Suceava County, Romania, tributary to the Siret","a village in Bălcăuți, Suceava County, Romania"],"gender":"f"},{"word":"Negoț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Negoț"}},{"word":"negoț","pos":"noun","definitions":["trade, commerce, business"],"forms":{"plural":"negoțuri"}},{"word":"negoțiere","pos":"noun","definitions":["obsolete form of negociere"],"forms":{"plural":"negoțieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"negoțiere","accusative-definite-nominative-singular":"negoțierea","accusative-indefinite-nominative-plural":"negoțieri","accusative-definite-nominative-plural":"negoțierile","dative-genitive-indefinite-singular":"negoțieri","dative-definite-genitive-singular":"negoțierii","dative-genitive-indefinite-plural":"negoțieri","dative-definite-genitive-plural":"negoțierilor","singular-vocative":"negoțiere","plural-vocative":"negoțierilor"}},{"word":"Negraia","pos":"name","definitions":["a village in Pesceana, Vâlcea County, Romania"],"gender":"f"},{"word":"negrăit","pos":"adj","definitions":["unspoken"],"forms":{"feminine-singular":"negrăită","masculine-plural":"negrăiți","feminine-neuter-plural":"negrăite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"negrăit","error-unrecognized-form-feminine-indefinite-singular":"negrăită","error-unrecognized-form-indefinite-masculine-plural":"negrăiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"negrăite","definite-error-unrecognized-form-masculine-neuter-singular":"negrăitul","definite-error-unrecognized-form-feminine-singular":"negrăita","definite-error-unrecognized-form-masculine-plural":"negrăiții","definite-error-unrecognized-form-feminine-neuter-plural":"negrăitele"}},{"word":"Negran","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Negran"}},{"word":"Negraș","pos":"name","definitions":["a river in Argeș, Romania, tributary to the Teleorman"],"gender":"m"},{"word":"Negrași","pos":"name","definitions":["a commune of Argeș County, Romania","a village in Negrași, Argeș County, Romania"],"gender":"m"},{"word":"Negrașu","pos":"name","definitions":["a river in Prahova County, Romania, tributary to the Doftana"],"gender":"m"},{"word":"negre","pos":"adj","definitions":["feminine plural of negru"],"pronunciation":"[ˈne.ɡre]"},{"word":"Negrea","pos":"name","definitions":["a village in Schela, Galați County, Romania"],"gender":"f"},{"word":"negreală","pos":"noun","definitions":["blackness, darkness"],"forms":{"plural":"negreli"}},{"word":"Negreanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Negreanu"}},{"word":"Negreasca","pos":"name","definitions":["a river in Buzău, Romania, tributary to the Călmățui"],"gender":"f"},{"word":"negreață","pos":"noun","definitions":["quality or attribute of being the color black; blackness, darkness","a black stain"],"forms":{"plural":"negreți"}},{"word":"Negreia","pos":"name","definitions":["a village in Șisești, Maramureș County, Romania"],"gender":"f"},{"word":"Negrele","pos":"name","definitions":["a river in Hunedoara County, Romania, tributary to the Râușor"],"gender":"m"},{"word":"Negreni","pos":"name","definitions":["a village in Dârmănești, Argeș County, Romania","a village in Poduri, Bacău County, Romania","a village in Știubieni, Botoșani County, Romania","a commune of Cluj County, Romania","a village in Negreni, Cluj County, Romania"],"gender":"m"},{"word":"Negrenii de Câmpie","pos":"name","definitions":["a village in Band, Mureș County, Romania"],"gender":"m"},{"word":"Negrenii de Sus","pos":"name","definitions":["a village in Tătărăștii de Jos, Teleorman County, Romania"],"gender":"m"},{"word":"Negrenii-Osebiți","pos":"name","definitions":["a village in Tătărăștii de Jos, Teleorman County, Romania"],"gender":"m"},{"word":"Negrenilor","pos":"name","definitions":["a river in Vâlcea County, Romania, tributary to the Rudăreasa"],"gender":"m"},{"word":"negresă","pos":"noun","definitions":["black woman","brownie"],"forms":{"plural":"negrese","masculine":"equivalent negru"}},{"word":"Negrescu","pos":"name","definitions":["a surname"],"pronunciation":"/ne.ˈɡres.ku/","gender":"m","forms":{"dative-genitive":"lui Negrescu"}},{"word":"negreșit","pos":"adv","definitions":["certainly"]},{"word":"Negreșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Negreșteanu"}},{"word":"Negrești","pos":"name","definitions":["a village in Mogoș, Alba County, Romania","a village in Beleți-Negrești, Argeș County, Romania","a village in Mihălășeni, Botoșani County, Romania","a village in Cobadin, Constanța County, Romania","a village in Malovăț, Mehedinți County, Romania"],"gender":"m","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"Negrești","accusative-definite-nominative":"Negreștiul","dative-genitive-indefinite":"Negrești","dative-definite-genitive":"Negreștiului","vocative":"Negreștiule"}},{"word":"Negrești-Oaș","pos":"name","definitions":["a city in Satu Mare County, Romania"],"gender":"m"},{"word":"Negri","pos":"name","definitions":["a commune of Bacău County, Romania","a village in Negri, Bacău County, Romania"],"gender":"m"},{"word":"negri","pos":"adj","definitions":["nominative/accusative masculine plural of negru"],"pronunciation":"[ˈneɡri]"},{"word":"negri","pos":"noun","definitions":["masculine plural of negru"],"pronunciation":"[ˈneɡri]","gender":"m-p"},{"word":"negri","pos":"verb","definitions":["to blacken"],"pronunciation":"[ˈneɡri]","forms":{"canonical":"a negri 4th conjugation","present-singular-third-person":"negrește","participle-past":"negrit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a negri","gerund":"negrind","first-person-indicative-present-singular":"negresc","indicative-present-second-person-singular":"negrești","indicative-present-singular-third-person":"negrește","first-person-indicative-plural-present":"negrim","indicative-plural-present-second-person":"negriți","indicative-plural-present-third-person":"negresc","first-person-imperfect-indicative-singular":"negream","imperfect-indicative-second-person-singular":"negreai","imperfect-indicative-singular-third-person":"negrea","first-person-imperfect-indicative-plural":"negream","imperfect-indicative-plural-second-person":"negreați","imperfect-indicative-plural-third-person":"negreau","first-person-indicative-perfect-singular":"negrii","indicative-perfect-second-person-singular":"negriși","indicative-perfect-singular-third-person":"negri","first-person-indicative-perfect-plural":"negrirăm","indicative-perfect-plural-second-person":"negrirăți","indicative-perfect-plural-third-person":"negriră","first-person-indicative-pluperfect-singular":"negrisem","indicative-pluperfect-second-person-singular":"negriseși","indicative-pluperfect-singular-third-person":"negrise","first-person-indicative-pluperfect-plural":"negriserăm","indicative-pluperfect-plural-second-person":"negriserăți","indicative-pluperfect-plural-third-person":"negriseră","first-person-present-singular-subjunctive":"să negresc","present-second-person-singular-subjunctive":"să negrești","present-singular-subjunctive-third-person":"să negrească","first-person-plural-present-subjunctive":"să negrim","plural-present-second-person-subjunctive":"să negriți","plural-present-subjunctive-third-person":"să negrească","imperative-second-person-singular":"negrește","imperative-plural-second-person":"negriți","imperative-negative-second-person-singular":"nu negri","imperative-negative-plural-second-person":"nu negriți"}},{"word":"Negricioiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Negricioiu"}},{"word":"negricios","pos":"adj","definitions":["blackish; somewhat black"],"pronunciation":"/ne.ɡriˈt͡ʃʲos/","forms":{"feminine-singular":"negricioasă","masculine-plural":"negricioși","feminine-neuter-plural":"negricioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"negricios","error-unrecognized-form-feminine-indefinite-singular":"negricioasă","error-unrecognized-form-indefinite-masculine-plural":"negricioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"negricioase","definite-error-unrecognized-form-masculine-neuter-singular":"negriciosul","definite-error-unrecognized-form-feminine-singular":"negricioasa","definite-error-unrecognized-form-masculine-plural":"negricioșii","definite-error-unrecognized-form-feminine-neuter-plural":"negricioasele"}},{"word":"negriciune","pos":"noun","definitions":["blackness"],"forms":{"plural":"negriciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"negriciune","accusative-definite-nominative-singular":"negriciunea","accusative-indefinite-nominative-plural":"negriciuni","accusative-definite-nominative-plural":"negriciunile","dative-genitive-indefinite-singular":"negriciuni","dative-definite-genitive-singular":"negriciunii","dative-genitive-indefinite-plural":"negriciuni","dative-definite-genitive-plural":"negriciunilor","singular-vocative":"negriciune","plural-vocative":"negriciunilor"}},{"word":"negrid","pos":"noun","definitions":["negroid"],"forms":{"plural":"negrizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"negrid","accusative-definite-nominative-singular":"negridul","accusative-indefinite-nominative-plural":"negrizi","accusative-definite-nominative-plural":"negrizii","dative-genitive-indefinite-singular":"negrid","dative-definite-genitive-singular":"negridului","dative-genitive-indefinite-plural":"negrizi","dative-definite-genitive-plural":"negrizilor","singular-vocative":"negridule","plural-vocative":"negrizilor"}},{"word":"negrijă","pos":"noun","definitions":["carelessness"],"forms":{"plural":"negriji","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"negrijă","accusative-definite-nominative-singular":"negrija","accusative-indefinite-nominative-plural":"negriji","accusative-definite-nominative-plural":"negrijile","dative-genitive-indefinite-singular":"negriji","dative-definite-genitive-singular":"negrijii","dative-genitive-indefinite-plural":"negriji","dative-definite-genitive-plural":"negrijilor","singular-vocative":"negrijă","plural-vocative":"negrijilor"}},{"word":"negrijință","pos":"noun","definitions":["negligence; carelessness"],"forms":{"plural":"negrijințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"negrijință","accusative-definite-nominative-singular":"negrijința","accusative-indefinite-nominative-plural":"negrijințe","accusative-definite-nominative-plural":"negrijințele","dative-genitive-indefinite-singular":"negrijințe","dative-definite-genitive-singular":"negrijinței","dative-genitive-indefinite-plural":"negrijințe","dative-definite-genitive-plural":"negrijințelor","singular-vocative":"negrijință","plural-vocative":"negrijințelor"}},{"word":"negrijire","pos":"noun","definitions":["neglect"],"forms":{"plural":"negrijiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"negrijire","accusative-definite-nominative-singular":"negrijirea","accusative-indefinite-nominative-plural":"negrijiri","accusative-definite-nominative-plural":"negrijirile","dative-genitive-indefinite-singular":"negrijiri","dative-definite-genitive-singular":"negrijirii","dative-genitive-indefinite-plural":"negrijiri","dative-definite-genitive-plural":"negrijirilor","singular-vocative":"negrijire","plural-vocative":"negrijirilor"}},{"word":"negrijuire","pos":"noun","definitions":["neglect"],"forms":{"plural":"negrijuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"negrijuire","accusative-definite-nominative-singular":"negrijuirea","accusative-indefinite-nominative-plural":"negrijuiri","accusative-definite-nominative-plural":"negrijuirile","dative-genitive-indefinite-singular":"negrijuiri","dative-definite-genitive-singular":"negrijuirii","dative-genitive-indefinite-plural":"negrijuiri","dative-definite-genitive-plural":"negrijuirilor","singular-vocative":"negrijuire","plural-vocative":"negrijuirilor"}},{"word":"Negrilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Negrilă"}},{"word":"Negrileasa","pos":"name","definitions":["a village in Stulpicani, Suceava County, Romania"],"gender":"f"},{"word":"Negrilești","pos":"name","definitions":["a commune of Bistrița-Năsăud County, Romania","a village in Negrilești, Bistrița-Năsăud County, Romania","a commune of Galați County, Romania","a village in Negrilești, Galați County, Romania","a village in Scurtu Mare, Teleorman County, Romania"],"gender":"m"},{"word":"Negrileștilor","pos":"name","definitions":["a river in Bistrița-Năsăud, Romania, tributary to the Valea Mare"],"gender":"m"},{"word":"negrilică","pos":"noun","definitions":["black cumin, nigella (Nigella sativa)"],"forms":{"plural":"negrilici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"negrilică","accusative-definite-nominative-singular":"negrilica","accusative-indefinite-nominative-plural":"negrilici","accusative-definite-nominative-plural":"negrilicile","dative-genitive-indefinite-singular":"negrilici","dative-definite-genitive-singular":"negrilicii","dative-genitive-indefinite-plural":"negrilici","dative-definite-genitive-plural":"negrilicilor","singular-vocative":"negrilică","plural-vocative":"negrilicilor"}},{"word":"Negriloiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Negriloiu"}},{"word":"negrime","pos":"noun","definitions":["blackness, darkness"],"forms":{"plural":"negrimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"negrime","accusative-definite-nominative-singular":"negrimea","accusative-indefinite-nominative-plural":"negrimi","accusative-definite-nominative-plural":"negrimile","dative-genitive-indefinite-singular":"negrimi","dative-definite-genitive-singular":"negrimii","dative-genitive-indefinite-plural":"negrimi","dative-definite-genitive-plural":"negrimilor","singular-vocative":"negrime","plural-vocative":"negrimilor"}},{"word":"negrior","pos":"adj","definitions":["diminutive of negru"],"forms":{"feminine-singular":"negrioră","masculine-plural":"negriori","feminine-neuter-plural":"negriore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"negrior","error-unrecognized-form-feminine-indefinite-singular":"negrioră","error-unrecognized-form-indefinite-masculine-plural":"negriori","error-unrecognized-form-feminine-indefinite-neuter-plural":"negriore","definite-error-unrecognized-form-masculine-neuter-singular":"negriorul","definite-error-unrecognized-form-feminine-singular":"negriora","definite-error-unrecognized-form-masculine-plural":"negriorii","definite-error-unrecognized-form-feminine-neuter-plural":"negriorele"}},{"word":"Negrișoara","pos":"name","definitions":["a river in Suceava, Romania, tributary to the Dorna","a river in Olt, Romania, tributary to the Plapcea","a river in Arad, Romania, tributary to the Sebiș"],"gender":"f"},{"word":"negrișor","pos":"adj","definitions":["diminutive of negru"],"forms":{"feminine-singular":"negrișoră","masculine-plural":"negrișori","feminine-neuter-plural":"negrișore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"negrișor","error-unrecognized-form-feminine-indefinite-singular":"negrișoră","error-unrecognized-form-indefinite-masculine-plural":"negrișori","error-unrecognized-form-feminine-indefinite-neuter-plural":"negrișore","definite-error-unrecognized-form-masculine-neuter-singular":"negrișorul","definite-error-unrecognized-form-feminine-singular":"negrișora","definite-error-unrecognized-form-masculine-plural":"negrișorii","definite-error-unrecognized-form-feminine-neuter-plural":"negrișorele"}},{"word":"Negrița","pos":"name","definitions":["a river in Dâmbovița County, Romania, tributary to the Ialomicioara"],"gender":"f"},{"word":"negritudine","pos":"noun","definitions":["negritude"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"negritudine","accusative-definite-nominative":"negritudinea","dative-genitive-indefinite":"negritudini","dative-definite-genitive":"negritudinii","vocative":"-"}},{"word":"negritură","pos":"noun","definitions":["blackening"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"negritură","accusative-definite-nominative":"negritura","dative-genitive-indefinite":"negriture","dative-definite-genitive":"negriturei","vocative":"negritură"}},{"word":"negriu","pos":"adj","definitions":["blackish"],"pronunciation":"/neˈɡriw/","forms":{"feminine-singular":"negrie","plural":"negrii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"negriu","error-unrecognized-form-feminine-indefinite-singular":"negrie","error-unrecognized-form-indefinite-masculine-plural":"negrii","error-unrecognized-form-feminine-indefinite-neuter-plural":"negrii","definite-error-unrecognized-form-masculine-neuter-singular":"negriul","definite-error-unrecognized-form-feminine-singular":"negria","definite-error-unrecognized-form-masculine-plural":"negriii","definite-error-unrecognized-form-feminine-neuter-plural":"negriile"}},{"word":"negrizutos","pos":"adj","definitions":["that does not contain firedamp"],"forms":{"feminine-singular":"negrizutoasă","masculine-plural":"negrizutoși","feminine-neuter-plural":"negrizutoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"negrizutos","error-unrecognized-form-feminine-indefinite-singular":"negrizutoasă","error-unrecognized-form-indefinite-masculine-plural":"negrizutoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"negrizutoase","definite-error-unrecognized-form-masculine-neuter-singular":"negrizutosul","definite-error-unrecognized-form-feminine-singular":"negrizutoasa","definite-error-unrecognized-form-masculine-plural":"negrizutoșii","definite-error-unrecognized-form-feminine-neuter-plural":"negrizutoasele"}},{"word":"negroaică","pos":"noun","definitions":["black cumin, nigella (Nigella sativa)"],"forms":{"plural":"negroaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"negroaică","accusative-definite-nominative-singular":"negroaica","accusative-indefinite-nominative-plural":"negroaice","accusative-definite-nominative-plural":"negroaicele","dative-genitive-indefinite-singular":"negroaice","dative-definite-genitive-singular":"negroaicei","dative-genitive-indefinite-plural":"negroaice","dative-definite-genitive-plural":"negroaicelor","singular-vocative":"negroaică","plural-vocative":"negroaicelor"}},{"word":"negrofil","pos":"noun","definitions":["negrophile"],"forms":{"plural":"negrofili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"negrofil","accusative-definite-nominative-singular":"negrofilul","accusative-indefinite-nominative-plural":"negrofili","accusative-definite-nominative-plural":"negrofilii","dative-genitive-indefinite-singular":"negrofil","dative-definite-genitive-singular":"negrofilului","dative-genitive-indefinite-plural":"negrofili","dative-definite-genitive-plural":"negrofililor","singular-vocative":"negrofilule","plural-vocative":"negrofililor"}},{"word":"negroid","pos":"noun","definitions":["negroid"],"forms":{"plural":"negroizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"negroid","accusative-definite-nominative-singular":"negroidul","accusative-indefinite-nominative-plural":"negroizi","accusative-definite-nominative-plural":"negroizii","dative-genitive-indefinite-singular":"negroid","dative-definite-genitive-singular":"negroidului","dative-genitive-indefinite-plural":"negroizi","dative-definite-genitive-plural":"negroizilor","singular-vocative":"negroidule","plural-vocative":"negroizilor"}},{"word":"negroidă","pos":"noun","definitions":["female equivalent of negroid"],"forms":{"plural":"negroide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"negroidă","accusative-definite-nominative-singular":"negroida","accusative-indefinite-nominative-plural":"negroide","accusative-definite-nominative-plural":"negroidele","dative-genitive-indefinite-singular":"negroide","dative-definite-genitive-singular":"negroidei","dative-genitive-indefinite-plural":"negroide","dative-definite-genitive-plural":"negroidelor","singular-vocative":"negroidă","plural-vocative":"negroidelor"}},{"word":"Negroiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Negroiu"}},{"word":"negrotei","pos":"noun","definitions":["nigger, black person, African"],"pronunciation":"/ne.ɡro.ˈtej/","forms":{"plural":"negrotei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"negrotei","accusative-definite-nominative-singular":"negroteiul","accusative-indefinite-nominative-plural":"negrotei","accusative-definite-nominative-plural":"negroteii","dative-genitive-indefinite-singular":"negrotei","dative-definite-genitive-singular":"negroteiului","dative-genitive-indefinite-plural":"negrotei","dative-definite-genitive-plural":"negroteilor","singular-vocative":"negroteiule","plural-vocative":"negroteilor"}},{"word":"Negru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Negru"}},{"word":"negru","pos":"adj","definitions":["black","dirty, grimy"],"pronunciation":"/ˈne.ɡru/","forms":{"feminine-singular":"neagră","masculine-plural":"negri","feminine-neuter-plural":"negre","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"negru","error-unrecognized-form-feminine-indefinite-singular":"neagră","error-unrecognized-form-indefinite-masculine-plural":"negri","error-unrecognized-form-feminine-indefinite-neuter-plural":"negre","definite-error-unrecognized-form-masculine-neuter-singular":"negrul","definite-error-unrecognized-form-feminine-singular":"neagra","definite-error-unrecognized-form-masculine-plural":"negrii","definite-error-unrecognized-form-feminine-neuter-plural":"negrele","alternative":"негру"}},{"word":"negru","pos":"noun","definitions":["black (color)"],"pronunciation":"/ˈne.ɡru/","forms":{"alternative":"негру"}},{"word":"negru","pos":"noun","definitions":["black person; a person of Sub-Saharan African descent"],"pronunciation":"/ˈne.ɡru/","forms":{"plural":"negri","feminine":"equivalent negresă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"negru","accusative-definite-nominative-singular":"negrul","accusative-indefinite-nominative-plural":"negri","accusative-definite-nominative-plural":"negrii","dative-genitive-indefinite-singular":"negru","dative-definite-genitive-singular":"negrului","dative-genitive-indefinite-plural":"negri","dative-definite-genitive-plural":"negrilor","singular-vocative":"negrule","plural-vocative":"negrilor","alternative":"негру"}},{"word":"negru ca tăciunele","pos":"adj","definitions":["black as coal, black as night"],"forms":{"feminine-singular":"neagră ca tăciunele","masculine-plural":"negru ca tăciuneli","feminine-neuter-plural":"neagră ca tăciunele"}},{"word":"negru de fum","pos":"noun","definitions":["carbon black"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-manual","accusative-indefinite-nominative-singular":"negru de fum","accusative-definite-nominative-singular":"negrul de fum","accusative-indefinite-nominative-plural":"-","accusative-definite-nominative-plural":"-","dative-genitive-indefinite-singular":"negru de fum","dative-definite-genitive-singular":"negrului de fum","dative-genitive-indefinite-plural":"-","dative-definite-genitive-plural":"-","singular-vocative":"-","plural-vocative":"-","alternative":"negru-de-fum"}},{"word":"negru de platină","pos":"noun","definitions":["platinum black"]},{"word":"Negru Vodă","pos":"name","definitions":["a city in Constanța County, Romania"],"gender":"m"},{"word":"Negrulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Negrulescu"}},{"word":"Negrulești","pos":"name","definitions":["a village in Bărbătești, Vâlcea County, Romania"],"gender":"m"},{"word":"Negruș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Negruș"}},{"word":"negruș","pos":"adj","definitions":["diminutive of negru"],"forms":{"feminine-singular":"negrușă","masculine-plural":"negruși","feminine-neuter-plural":"negrușe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"negruș","error-unrecognized-form-feminine-indefinite-singular":"negrușă","error-unrecognized-form-indefinite-masculine-plural":"negruși","error-unrecognized-form-feminine-indefinite-neuter-plural":"negrușe","definite-error-unrecognized-form-masculine-neuter-singular":"negrușul","definite-error-unrecognized-form-feminine-singular":"negrușa","definite-error-unrecognized-form-masculine-plural":"negrușii","definite-error-unrecognized-form-feminine-neuter-plural":"negrușele"}},{"word":"negruș","pos":"noun","definitions":["diminutive of negru"],"forms":{"plural":"negruși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"negruș","accusative-definite-nominative-singular":"negrușul","accusative-indefinite-nominative-plural":"negruși","accusative-definite-nominative-plural":"negrușii","dative-genitive-indefinite-singular":"negruș","dative-definite-genitive-singular":"negrușului","dative-genitive-indefinite-plural":"negruși","dative-definite-genitive-plural":"negrușilor","singular-vocative":"negrușule","plural-vocative":"negrușilor"}},{"word":"Negrușa","pos":"name","definitions":["a village in Cireșu, Mehedinți County, Romania"],"gender":"f"},{"word":"negrușcă","pos":"noun","definitions":["black caraway"],"forms":{"plural":"negruște","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"negrușcă","accusative-definite-nominative-singular":"negrușca","accusative-indefinite-nominative-plural":"negruște","accusative-definite-nominative-plural":"negruștele","dative-genitive-indefinite-singular":"negruște","dative-definite-genitive-singular":"negruștei","dative-genitive-indefinite-plural":"negruște","dative-definite-genitive-plural":"negruștelor","singular-vocative":"negrușcă","plural-vocative":"negruștelor"}},{"word":"Negruț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Negruț"}},{"word":"negruț","pos":"adj","definitions":["blackish"],"forms":{"feminine-singular":"negruță","masculine-plural":"negruți","feminine-neuter-plural":"negruțe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"negruț","error-unrecognized-form-feminine-indefinite-singular":"negruță","error-unrecognized-form-indefinite-masculine-plural":"negruți","error-unrecognized-form-feminine-indefinite-neuter-plural":"negruțe","definite-error-unrecognized-form-masculine-neuter-singular":"negruțul","definite-error-unrecognized-form-feminine-singular":"negruța","definite-error-unrecognized-form-masculine-plural":"negruții","definite-error-unrecognized-form-feminine-neuter-plural":"negruțele"}},{"word":"Negruța","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Negruța"}},{"word":"Negruță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Negruță"}},{"word":"negruvodean","pos":"adj","definitions":["from or pertaining to Negru Vodă"],"forms":{"feminine-singular":"negruvodeană","masculine-plural":"negruvodeni","feminine-neuter-plural":"negruvodene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"negruvodean","error-unrecognized-form-feminine-indefinite-singular":"negruvodeană","error-unrecognized-form-indefinite-masculine-plural":"negruvodeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"negruvodene","definite-error-unrecognized-form-masculine-neuter-singular":"negruvodeanul","definite-error-unrecognized-form-feminine-singular":"negruvodeana","definite-error-unrecognized-form-masculine-plural":"negruvodenii","definite-error-unrecognized-form-feminine-neuter-plural":"negruvodenele"}},{"word":"negruvodean","pos":"noun","definitions":["male inhabitant of Negru Vodă"],"forms":{"plural":"negruvodeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"negruvodean","accusative-definite-nominative-singular":"negruvodeanul","accusative-indefinite-nominative-plural":"negruvodeni","accusative-definite-nominative-plural":"negruvodenii","dative-genitive-indefinite-singular":"negruvodean","dative-definite-genitive-singular":"negruvodeanului","dative-genitive-indefinite-plural":"negruvodeni","dative-definite-genitive-plural":"negruvodenilor","singular-vocative":"negruvodeanule","plural-vocative":"negruvodenilor"}},{"word":"negruvodeancă","pos":"noun","definitions":["female equivalent of negruvodean"],"forms":{"plural":"negruvodence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"negruvodeancă","accusative-definite-nominative-singular":"negruvodeanca","accusative-indefinite-nominative-plural":"negruvodence","accusative-definite-nominative-plural":"negruvodencele","dative-genitive-indefinite-singular":"negruvodence","dative-definite-genitive-singular":"negruvodencei","dative-genitive-indefinite-plural":"negruvodence","dative-definite-genitive-plural":"negruvodencelor","singular-vocative":"negruvodeancă","plural-vocative":"negruvodencelor"}},{"word":"Negucioiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Negucioiu"}},{"word":"Negulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Negulescu"}},{"word":"Negulești","pos":"name","definitions":["a village in Dealu Morii, Bacău County, Romania","a village in Piatra Șoimului, Neamț County, Romania"],"gender":"m"},{"word":"Neguleț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Neguleț"}},{"word":"Negura","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Negura"}},{"word":"Negură","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Negură"}},{"word":"negură","pos":"noun","definitions":["fog (cloud that forms at a low altitude and obscures vision)"],"pronunciation":"/ˈne.ɡu.rə/","forms":{"plural":"neguri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"negură","accusative-definite-nominative-singular":"negura","accusative-indefinite-nominative-plural":"neguri","accusative-definite-nominative-plural":"negurile","dative-genitive-indefinite-singular":"neguri","dative-definite-genitive-singular":"negurii","dative-genitive-indefinite-plural":"neguri","dative-definite-genitive-plural":"negurilor","singular-vocative":"negură","plural-vocative":"negurilor"}},{"word":"negurat","pos":"adj","definitions":["gloomy, foggy"],"forms":{"feminine-singular":"negurată","masculine-plural":"negurați","feminine-neuter-plural":"negurate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"negurat","error-unrecognized-form-feminine-indefinite-singular":"negurată","error-unrecognized-form-indefinite-masculine-plural":"negurați","error-unrecognized-form-feminine-indefinite-neuter-plural":"negurate","definite-error-unrecognized-form-masculine-neuter-singular":"neguratul","definite-error-unrecognized-form-feminine-singular":"negurata","definite-error-unrecognized-form-masculine-plural":"negurații","definite-error-unrecognized-form-feminine-neuter-plural":"neguratele"}},{"word":"negureală","pos":"noun","definitions":["fog"],"forms":{"plural":"negureli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"negureală","accusative-definite-nominative-singular":"negureala","accusative-indefinite-nominative-plural":"negureli","accusative-definite-nominative-plural":"negurelile","dative-genitive-indefinite-singular":"negureli","dative-definite-genitive-singular":"negurelii","dative-genitive-indefinite-plural":"negureli","dative-definite-genitive-plural":"negurelilor","singular-vocative":"negureală","plural-vocative":"negurelilor"}},{"word":"Negureni","pos":"name","definitions":["a village in Băneasa, Constanța County, Romania"],"gender":"m"},{"word":"Negurenii Noi","pos":"name","definitions":["a village in Agronomovca, Ungheni Raion, Moldova"],"gender":"m"},{"word":"Negurenii Vechi","pos":"name","definitions":["a village in Negurenii Vechi, Ungheni Raion, Moldova","a commune of Ungheni Raion, Moldova"],"gender":"m"},{"word":"Negurescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Negurescu"}},{"word":"negurică","pos":"noun","definitions":["diminutive of negură"],"forms":{"plural":"negurici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"negurică","accusative-definite-nominative-singular":"negurica","accusative-indefinite-nominative-plural":"negurici","accusative-definite-nominative-plural":"neguricile","dative-genitive-indefinite-singular":"negurici","dative-definite-genitive-singular":"neguricii","dative-genitive-indefinite-plural":"negurici","dative-definite-genitive-plural":"neguricilor","singular-vocative":"negurică","plural-vocative":"neguricilor"}},{"word":"negurii","pos":"noun","definitions":["definite genitive/dative singular of negură"]},{"word":"Negurița","pos":"name","definitions":["a river in Maramureș County, Romania, tributary to the Cicârlău"],"gender":"f"},{"word":"neguriță","pos":"noun","definitions":["diminutive of negură"],"forms":{"plural":"negurițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neguriță","accusative-definite-nominative-singular":"negurița","accusative-indefinite-nominative-plural":"negurițe","accusative-definite-nominative-plural":"negurițele","dative-genitive-indefinite-singular":"negurițe","dative-definite-genitive-singular":"neguriței","dative-genitive-indefinite-plural":"negurițe","dative-definite-genitive-plural":"negurițelor","singular-vocative":"neguriță","plural-vocative":"negurițelor"}},{"word":"neguriu","pos":"adj","definitions":["blackish"],"forms":{"feminine-singular":"negurie","plural":"negurii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neguriu","error-unrecognized-form-feminine-indefinite-singular":"negurie","error-unrecognized-form-indefinite-masculine-plural":"negurii","error-unrecognized-form-feminine-indefinite-neuter-plural":"negurii","definite-error-unrecognized-form-masculine-neuter-singular":"neguriul","definite-error-unrecognized-form-feminine-singular":"neguria","definite-error-unrecognized-form-masculine-plural":"neguriii","definite-error-unrecognized-form-feminine-neuter-plural":"neguriile"}},{"word":"neguros","pos":"adj","definitions":["foggy, nebulous","dark, gloomy"],"pronunciation":"/ˌne.ɡuˈros/","forms":{"feminine-singular":"neguroasă","masculine-plural":"neguroși","feminine-neuter-plural":"neguroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neguros","error-unrecognized-form-feminine-indefinite-singular":"neguroasă","error-unrecognized-form-indefinite-masculine-plural":"neguroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"neguroase","definite-error-unrecognized-form-masculine-neuter-singular":"negurosul","definite-error-unrecognized-form-feminine-singular":"neguroasa","definite-error-unrecognized-form-masculine-plural":"neguroșii","definite-error-unrecognized-form-feminine-neuter-plural":"neguroasele"}},{"word":"negus","pos":"noun","definitions":["negus (ruler of Abyssinia)"],"forms":{"plural":"neguși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"negus","accusative-definite-nominative-singular":"negusul","accusative-indefinite-nominative-plural":"neguși","accusative-definite-nominative-plural":"negușii","dative-genitive-indefinite-singular":"negus","dative-definite-genitive-singular":"negusului","dative-genitive-indefinite-plural":"neguși","dative-definite-genitive-plural":"negușilor","singular-vocative":"negusule","plural-vocative":"negușilor"}},{"word":"Negușeni","pos":"name","definitions":["a village in Roșiori, Bacău County, Romania"],"gender":"m"},{"word":"Negustor","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Negustor"}},{"word":"negustor","pos":"noun","definitions":["merchant, trader, dealer"],"forms":{"plural":"negustori","feminine":"equivalent negustoreasă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"negustor","accusative-definite-nominative-singular":"negustorul","accusative-indefinite-nominative-plural":"negustori","accusative-definite-nominative-plural":"negustorii","dative-genitive-indefinite-singular":"negustor","dative-definite-genitive-singular":"negustorului","dative-genitive-indefinite-plural":"negustori","dative-definite-genitive-plural":"negustorilor","singular-vocative":"negustorule","plural-vocative":"negustorilor","alternative-archaic":"neguțător"}},{"word":"negustor ambulant","pos":"noun","definitions":["peddler"],"forms":{"plural":"negustori ambulanți"}},{"word":"negustoraș","pos":"noun","definitions":["diminutive of negustor; small merchant"],"forms":{"plural":"negustorași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"negustoraș","accusative-definite-nominative-singular":"negustorașul","accusative-indefinite-nominative-plural":"negustorași","accusative-definite-nominative-plural":"negustorașii","dative-genitive-indefinite-singular":"negustoraș","dative-definite-genitive-singular":"negustorașului","dative-genitive-indefinite-plural":"negustorași","dative-definite-genitive-plural":"negustorașilor","singular-vocative":"negustorașule","plural-vocative":"negustorașilor"}},{"word":"negustoreasă","pos":"noun","definitions":["female equivalent of negustor"],"forms":{"plural":"negustorese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"negustoreasă","accusative-definite-nominative-singular":"negustoreasa","accusative-indefinite-nominative-plural":"negustorese","accusative-definite-nominative-plural":"negustoresele","dative-genitive-indefinite-singular":"negustorese","dative-definite-genitive-singular":"negustoresei","dative-genitive-indefinite-plural":"negustorese","dative-definite-genitive-plural":"negustoreselor","singular-vocative":"negustoreasă","plural-vocative":"negustoreselor"}},{"word":"negustorească","pos":"adj","definitions":["feminine singular of negustoresc"],"pronunciation":"/ˌne.ɡus.toˈre̯as.kə/"},{"word":"negustoresc","pos":"adj","definitions":["commercial, merchant's"],"pronunciation":"/ˌne.ɡus.toˈresk/","forms":{"feminine-singular":"negustorească","plural":"negustorești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"negustoresc","error-unrecognized-form-feminine-indefinite-singular":"negustorească","error-unrecognized-form-indefinite-masculine-plural":"negustorești","error-unrecognized-form-feminine-indefinite-neuter-plural":"negustorești","definite-error-unrecognized-form-masculine-neuter-singular":"negustorescul","definite-error-unrecognized-form-feminine-singular":"negustoreasca","definite-error-unrecognized-form-masculine-plural":"negustoreștii","definite-error-unrecognized-form-feminine-neuter-plural":"negustoreștile"}},{"word":"negustorește","pos":"adv","definitions":["merchantly"]},{"word":"negustorești","pos":"adj","definitions":["plural of negustoresc"],"pronunciation":"/ˌne.ɡus.toˈreʃtʲ/"},{"word":"negustori","pos":"verb","definitions":["to trade"],"forms":{"canonical":"a negustori 4th conjugation","present-singular-third-person":"negustorește","participle-past":"negustorit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a negustori","gerund":"negustorind","first-person-indicative-present-singular":"negustoresc","indicative-present-second-person-singular":"negustorești","indicative-present-singular-third-person":"negustorește","first-person-indicative-plural-present":"negustorim","indicative-plural-present-second-person":"negustoriți","indicative-plural-present-third-person":"negustoresc","first-person-imperfect-indicative-singular":"negustoream","imperfect-indicative-second-person-singular":"negustoreai","imperfect-indicative-singular-third-person":"negustorea","first-person-imperfect-indicative-plural":"negustoream","imperfect-indicative-plural-second-person":"negustoreați","imperfect-indicative-plural-third-person":"negustoreau","first-person-indicative-perfect-singular":"negustorii","indicative-perfect-second-person-singular":"negustoriși","indicative-perfect-singular-third-person":"negustori","first-person-indicative-perfect-plural":"negustorirăm","indicative-perfect-plural-second-person":"negustorirăți","indicative-perfect-plural-third-person":"negustoriră","first-person-indicative-pluperfect-singular":"negustorisem","indicative-pluperfect-second-person-singular":"negustoriseși","indicative-pluperfect-singular-third-person":"negustorise","first-person-indicative-pluperfect-plural":"negustoriserăm","indicative-pluperfect-plural-second-person":"negustoriserăți","indicative-pluperfect-plural-third-person":"negustoriseră","first-person-present-singular-subjunctive":"să negustoresc","present-second-person-singular-subjunctive":"să negustorești","present-singular-subjunctive-third-person":"să negustorească","first-person-plural-present-subjunctive":"să negustorim","plural-present-second-person-subjunctive":"să negustoriți","plural-present-subjunctive-third-person":"să negustorească","imperative-second-person-singular":"negustorește","imperative-plural-second-person":"negustoriți","imperative-negative-second-person-singular":"nu negustori","imperative-negative-plural-second-person":"nu negustoriți"}},{"word":"negustorie","pos":"noun","definitions":["trade"],"forms":{"plural":"negustorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"negustorie","accusative-definite-nominative-singular":"negustoria","accusative-indefinite-nominative-plural":"negustorii","accusative-definite-nominative-plural":"negustoriile","dative-genitive-indefinite-singular":"negustorii","dative-definite-genitive-singular":"negustoriei","dative-genitive-indefinite-plural":"negustorii","dative-definite-genitive-plural":"negustoriilor","singular-vocative":"negustorie","plural-vocative":"negustoriilor"}},{"word":"negustorime","pos":"noun","definitions":["merchants"],"pronunciation":"/ne.ɡus.toˈri.me/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"negustorime","accusative-definite-nominative":"negustorimea","dative-genitive-indefinite":"negustorime","dative-definite-genitive":"negustorimei","vocative":"negustorime"}},{"word":"negustorire","pos":"noun","definitions":["trade"],"forms":{"plural":"negustoriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"negustorire","accusative-definite-nominative-singular":"negustorirea","accusative-indefinite-nominative-plural":"negustoriri","accusative-definite-nominative-plural":"negustoririle","dative-genitive-indefinite-singular":"negustoriri","dative-definite-genitive-singular":"negustoririi","dative-genitive-indefinite-plural":"negustoriri","dative-definite-genitive-plural":"negustoririlor","singular-vocative":"negustorire","plural-vocative":"negustoririlor"}},{"word":"negustoriță","pos":"noun","definitions":["female equivalent of negustor"],"forms":{"plural":"negustorițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"negustoriță","accusative-definite-nominative-singular":"negustorița","accusative-indefinite-nominative-plural":"negustorițe","accusative-definite-nominative-plural":"negustorițele","dative-genitive-indefinite-singular":"negustorițe","dative-definite-genitive-singular":"negustoriței","dative-genitive-indefinite-plural":"negustorițe","dative-definite-genitive-plural":"negustorițelor","singular-vocative":"negustoriță","plural-vocative":"negustorițelor"}},{"word":"negustoros","pos":"adj","definitions":["merchant-like"],"forms":{"feminine-singular":"negustoroasă","masculine-plural":"negustoroși","feminine-neuter-plural":"negustoroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"negustoros","error-unrecognized-form-feminine-indefinite-singular":"negustoroasă","error-unrecognized-form-indefinite-masculine-plural":"negustoroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"negustoroase","definite-error-unrecognized-form-masculine-neuter-singular":"negustorosul","definite-error-unrecognized-form-feminine-singular":"negustoroasa","definite-error-unrecognized-form-masculine-plural":"negustoroșii","definite-error-unrecognized-form-feminine-neuter-plural":"negustoroasele"}},{"word":"Negustoru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Negustoru"}},{"word":"negustorului","pos":"noun","definitions":["definite genitive/dative singular of negustor"]},{"word":"Neguț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Neguț"}},{"word":"neguța","pos":"verb","definitions":["to engage in trade, buy and sell","to bargain, haggle, negotiate"],"forms":{"canonical":"a neguța 1st conjugation","present-singular-third-person":"neguțează","participle-past":"neguțat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a neguța","gerund":"neguțând","first-person-indicative-present-singular":"neguțez","indicative-present-second-person-singular":"neguțezi","indicative-present-singular-third-person":"neguțează","first-person-indicative-plural-present":"neguțăm","indicative-plural-present-second-person":"neguțați","indicative-plural-present-third-person":"neguțează","first-person-imperfect-indicative-singular":"neguțam","imperfect-indicative-second-person-singular":"neguțai","imperfect-indicative-singular-third-person":"neguța","first-person-imperfect-indicative-plural":"neguțam","imperfect-indicative-plural-second-person":"neguțați","imperfect-indicative-plural-third-person":"neguțau","first-person-indicative-perfect-singular":"neguțai","indicative-perfect-second-person-singular":"neguțași","indicative-perfect-singular-third-person":"neguță","first-person-indicative-perfect-plural":"neguțarăm","indicative-perfect-plural-second-person":"neguțarăți","indicative-perfect-plural-third-person":"neguțară","first-person-indicative-pluperfect-singular":"neguțasem","indicative-pluperfect-second-person-singular":"neguțaseși","indicative-pluperfect-singular-third-person":"neguțase","first-person-indicative-pluperfect-plural":"neguțaserăm","indicative-pluperfect-plural-second-person":"neguțaserăți","indicative-pluperfect-plural-third-person":"neguțaseră","first-person-present-singular-subjunctive":"să neguțez","present-second-person-singular-subjunctive":"să neguțezi","present-singular-subjunctive-third-person":"să neguțeze","first-person-plural-present-subjunctive":"să neguțăm","plural-present-second-person-subjunctive":"să neguțați","plural-present-subjunctive-third-person":"să neguțeze","imperative-second-person-singular":"neguțează","imperative-plural-second-person":"neguțați","imperative-negative-second-person-singular":"nu neguța","imperative-negative-plural-second-person":"nu neguțați"}},{"word":"Neguță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Neguță"}},{"word":"neguțare","pos":"noun","definitions":["negotiation"],"forms":{"plural":"neguțări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neguțare","accusative-definite-nominative-singular":"neguțarea","accusative-indefinite-nominative-plural":"neguțări","accusative-definite-nominative-plural":"neguțările","dative-genitive-indefinite-singular":"neguțări","dative-definite-genitive-singular":"neguțării","dative-genitive-indefinite-plural":"neguțări","dative-definite-genitive-plural":"neguțărilor","singular-vocative":"neguțare","plural-vocative":"neguțărilor"}},{"word":"neguțător","pos":"noun","definitions":["alternative form of negustor"],"forms":{"plural":"neguțători","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neguțător","accusative-definite-nominative-singular":"neguțătorul","accusative-indefinite-nominative-plural":"neguțători","accusative-definite-nominative-plural":"neguțătorii","dative-genitive-indefinite-singular":"neguțător","dative-definite-genitive-singular":"neguțătorului","dative-genitive-indefinite-plural":"neguțători","dative-definite-genitive-plural":"neguțătorilor","singular-vocative":"neguțătorule","plural-vocative":"neguțătorilor"}},{"word":"neguțătoraș","pos":"noun","definitions":["diminutive of neguțător"],"forms":{"plural":"neguțătorași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neguțătoraș","accusative-definite-nominative-singular":"neguțătorașul","accusative-indefinite-nominative-plural":"neguțătorași","accusative-definite-nominative-plural":"neguțătorașii","dative-genitive-indefinite-singular":"neguțătoraș","dative-definite-genitive-singular":"neguțătorașului","dative-genitive-indefinite-plural":"neguțătorași","dative-definite-genitive-plural":"neguțătorașilor","singular-vocative":"neguțătorașule","plural-vocative":"neguțătorașilor"}},{"word":"neguțătoreasă","pos":"noun","definitions":["alternative form of negustoreasă"],"forms":{"plural":"neguțătorese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neguțătoreasă","accusative-definite-nominative-singular":"neguțătoreasa","accusative-indefinite-nominative-plural":"neguțătorese","accusative-definite-nominative-plural":"neguțătoresele","dative-genitive-indefinite-singular":"neguțătorese","dative-definite-genitive-singular":"neguțătoresei","dative-genitive-indefinite-plural":"neguțătorese","dative-definite-genitive-plural":"neguțătoreselor","singular-vocative":"neguțătoreasă","plural-vocative":"neguțătoreselor"}},{"word":"neguțători","pos":"verb","definitions":["alternative form of negustori"],"forms":{"canonical":"a neguțători 4th conjugation","present-singular-third-person":"neguțătorește","participle-past":"neguțătorit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a neguțători","gerund":"neguțătorind","first-person-indicative-present-singular":"neguțătoresc","indicative-present-second-person-singular":"neguțătorești","indicative-present-singular-third-person":"neguțătorește","first-person-indicative-plural-present":"neguțătorim","indicative-plural-present-second-person":"neguțătoriți","indicative-plural-present-third-person":"neguțătoresc","first-person-imperfect-indicative-singular":"neguțătoream","imperfect-indicative-second-person-singular":"neguțătoreai","imperfect-indicative-singular-third-person":"neguțătorea","first-person-imperfect-indicative-plural":"neguțătoream","imperfect-indicative-plural-second-person":"neguțătoreați","imperfect-indicative-plural-third-person":"neguțătoreau","first-person-indicative-perfect-singular":"neguțătorii","indicative-perfect-second-person-singular":"neguțătoriși","indicative-perfect-singular-third-person":"neguțători","first-person-indicative-perfect-plural":"neguțătorirăm","indicative-perfect-plural-second-person":"neguțătorirăți","indicative-perfect-plural-third-person":"neguțătoriră","first-person-indicative-pluperfect-singular":"neguțătorisem","indicative-pluperfect-second-person-singular":"neguțătoriseși","indicative-pluperfect-singular-third-person":"neguțătorise","first-person-indicative-pluperfect-plural":"neguțătoriserăm","indicative-pluperfect-plural-second-person":"neguțătoriserăți","indicative-pluperfect-plural-third-person":"neguțătoriseră","first-person-present-singular-subjunctive":"să neguțătoresc","present-second-person-singular-subjunctive":"să neguțătorești","present-singular-subjunctive-third-person":"să neguțătorească","first-person-plural-present-subjunctive":"să neguțătorim","plural-present-second-person-subjunctive":"să neguțătoriți","plural-present-subjunctive-third-person":"să neguțătorească","imperative-second-person-singular":"neguțătorește","imperative-plural-second-person":"neguțătoriți","imperative-negative-second-person-singular":"nu neguțători","imperative-negative-plural-second-person":"nu neguțătoriți"}},{"word":"neguțătorie","pos":"noun","definitions":["alternative form of negustorie"],"forms":{"plural":"neguțătorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neguțătorie","accusative-definite-nominative-singular":"neguțătoria","accusative-indefinite-nominative-plural":"neguțătorii","accusative-definite-nominative-plural":"neguțătoriile","dative-genitive-indefinite-singular":"neguțătorii","dative-definite-genitive-singular":"neguțătoriei","dative-genitive-indefinite-plural":"neguțătorii","dative-definite-genitive-plural":"neguțătoriilor","singular-vocative":"neguțătorie","plural-vocative":"neguțătoriilor"}},{"word":"neguțătoriță","pos":"noun","definitions":["female equivalent of neguțător"],"forms":{"plural":"neguțătorițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neguțătoriță","accusative-definite-nominative-singular":"neguțătorița","accusative-indefinite-nominative-plural":"neguțătorițe","accusative-definite-nominative-plural":"neguțătorițele","dative-genitive-indefinite-singular":"neguțătorițe","dative-definite-genitive-singular":"neguțătoriței","dative-genitive-indefinite-plural":"neguțătorițe","dative-definite-genitive-plural":"neguțătorițelor","singular-vocative":"neguțătoriță","plural-vocative":"neguțătorițelor"}},{"word":"Neguțescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Neguțescu"}},{"word":"neguțetorioară","pos":"noun","definitions":["diminutive of neguțătorie"],"forms":{"plural":"neguțetorioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neguțetorioară","accusative-definite-nominative-singular":"neguțetorioara","accusative-indefinite-nominative-plural":"neguțetorioare","accusative-definite-nominative-plural":"neguțetorioarele","dative-genitive-indefinite-singular":"neguțetorioare","dative-definite-genitive-singular":"neguțetorioarei","dative-genitive-indefinite-plural":"neguțetorioare","dative-definite-genitive-plural":"neguțetorioarelor","singular-vocative":"neguțetorioară","plural-vocative":"neguțetorioarelor"}},{"word":"neguțitorie","pos":"noun","definitions":["obsolete form of neguțătorie"],"forms":{"plural":"neguțitorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neguțitorie","accusative-definite-nominative-singular":"neguțitoria","accusative-indefinite-nominative-plural":"neguțitorii","accusative-definite-nominative-plural":"neguțitoriile","dative-genitive-indefinite-singular":"neguțitorii","dative-definite-genitive-singular":"neguțitoriei","dative-genitive-indefinite-plural":"neguțitorii","dative-definite-genitive-plural":"neguțitoriilor","singular-vocative":"neguțitorie","plural-vocative":"neguțitoriilor"}},{"word":"Neguțoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Neguțoiu"}},{"word":"neguvernamental","pos":"adj","definitions":["non-governmental"],"forms":{"feminine-singular":"neguvernamentală","masculine-plural":"neguvernamentali","feminine-neuter-plural":"neguvernamentale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neguvernamental","error-unrecognized-form-feminine-indefinite-singular":"neguvernamentală","error-unrecognized-form-indefinite-masculine-plural":"neguvernamentali","error-unrecognized-form-feminine-indefinite-neuter-plural":"neguvernamentale","definite-error-unrecognized-form-masculine-neuter-singular":"neguvernamentalul","definite-error-unrecognized-form-feminine-singular":"neguvernamentala","definite-error-unrecognized-form-masculine-plural":"neguvernamentalii","definite-error-unrecognized-form-feminine-neuter-plural":"neguvernamentalele"}},{"word":"nehalit","pos":"adj","definitions":["not having eaten, famished","gluttonous"],"pronunciation":"/ne.haˈlit/","examples":[{"ro":"În seara aia m-am culcat nehalit da parcă îmi era mai bine cum nu-mi fusese mie niciodată până atunci, da' nici după aia.","en":"That evening I went to bed not having eaten, but it seemed to me that I was feeling better than I’d ever been before, and also afterwards."},{"ro":"[…]apăru dintr-odată un băiat îmbrăcat cu o geacă englezească, un blond cu o față de nehalit de șapte generații[…]","en":"[…] a boy dressed in an English jacket suddenly appeared, a blond with the look of one famished for seven generations […]"}],"forms":{"feminine-singular":"nehalită","masculine-plural":"nehaliți","feminine-neuter-plural":"nehalite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nehalit","error-unrecognized-form-feminine-indefinite-singular":"nehalită","error-unrecognized-form-indefinite-masculine-plural":"nehaliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nehalite","definite-error-unrecognized-form-masculine-neuter-singular":"nehalitul","definite-error-unrecognized-form-feminine-singular":"nehalita","definite-error-unrecognized-form-masculine-plural":"nehaliții","definite-error-unrecognized-form-feminine-neuter-plural":"nehalitele"}},{"word":"neharnic","pos":"noun","definitions":["lazy person"],"forms":{"plural":"neharnici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neharnic","accusative-definite-nominative-singular":"neharnicul","accusative-indefinite-nominative-plural":"neharnici","accusative-definite-nominative-plural":"neharnicii","dative-genitive-indefinite-singular":"neharnic","dative-definite-genitive-singular":"neharnicului","dative-genitive-indefinite-plural":"neharnici","dative-definite-genitive-plural":"neharnicilor","singular-vocative":"neharnicule","plural-vocative":"neharnicilor"}},{"word":"Nehoiașu","pos":"name","definitions":["a village in Nehoiu, Buzău County, Romania"],"gender":"m"},{"word":"Nehoiu","pos":"name","definitions":["a town in Buzău County, Romania"],"gender":"m"},{"word":"nehotărâre","pos":"noun","definitions":["indecision"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"nehotărâre","accusative-definite-nominative":"nehotărârea","dative-genitive-indefinite":"nehotărâri","dative-definite-genitive":"nehotărârii","vocative":"nehotărâre"}},{"word":"nehotărât","pos":"adj","definitions":["undecided"],"forms":{"feminine-singular":"nehotărâtă","masculine-plural":"nehotărâți","feminine-neuter-plural":"nehotărâte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nehotărât","error-unrecognized-form-feminine-indefinite-singular":"nehotărâtă","error-unrecognized-form-indefinite-masculine-plural":"nehotărâți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nehotărâte","definite-error-unrecognized-form-masculine-neuter-singular":"nehotărâtul","definite-error-unrecognized-form-feminine-singular":"nehotărâta","definite-error-unrecognized-form-masculine-plural":"nehotărâții","definite-error-unrecognized-form-feminine-neuter-plural":"nehotărâtele"}},{"word":"neiasită","pos":"noun","definitions":["pelican"],"forms":{"plural":"neiasite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neiasită","accusative-definite-nominative-singular":"neiasita","accusative-indefinite-nominative-plural":"neiasite","accusative-definite-nominative-plural":"neiasitele","dative-genitive-indefinite-singular":"neiasite","dative-definite-genitive-singular":"neiasitei","dative-genitive-indefinite-plural":"neiasite","dative-definite-genitive-plural":"neiasitelor","singular-vocative":"neiasită","plural-vocative":"neiasitelor"}},{"word":"neica","pos":"noun","definitions":["definite singular nominative/accusative of neică"]},{"word":"Neică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Neică"}},{"word":"neică","pos":"noun","definitions":["Term used by youth to address an older man or uncle.","Term of affection used by girls (in the country) to address their boyfriend."]},{"word":"Neicu","pos":"name","definitions":["a locality in Panciu, Vrancea County, Romania","a surname"],"gender":"m"},{"word":"neiculean","pos":"noun","definitions":["diminutive of neică"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"neiculean","accusative-definite-nominative":"neiculeanul","dative-genitive-indefinite":"neiculean","dative-definite-genitive":"neiculeanului","vocative":"neiculeanule"}},{"word":"Neiculescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Neiculescu"}},{"word":"neiculiță","pos":"noun","definitions":["diminutive of neică"],"forms":{"table-tags":"no-table-tags","accusative-indefinite-nominative":"neiculiță","accusative-definite-nominative":"neiculița","dative-genitive-indefinite":"neiculiță","dative-definite-genitive":"neiculiței","vocative":"neiculiță"}},{"word":"neicușor","pos":"noun","definitions":["diminutive of neică"],"forms":{"plural":"neicușori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neicușor","accusative-definite-nominative-singular":"neicușorul","accusative-indefinite-nominative-plural":"neicușori","accusative-definite-nominative-plural":"neicușorii","dative-genitive-indefinite-singular":"neicușor","dative-definite-genitive-singular":"neicușorului","dative-genitive-indefinite-plural":"neicușori","dative-definite-genitive-plural":"neicușorilor","singular-vocative":"neicușorule","plural-vocative":"neicușorilor"}},{"word":"neicuță","pos":"noun","definitions":["diminutive of neică"],"forms":{"table-tags":"no-table-tags","accusative-indefinite-nominative":"neicuță","accusative-definite-nominative":"neicuța","dative-genitive-indefinite":"neicuță","dative-definite-genitive":"neicuței","vocative":"neicuță"}},{"word":"Neicuțescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Neicuțescu"}},{"word":"neidentificat","pos":"adj","definitions":["unidentified"],"forms":{"feminine-singular":"neidentificată","masculine-plural":"neidentificați","feminine-neuter-plural":"neidentificate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neidentificat","error-unrecognized-form-feminine-indefinite-singular":"neidentificată","error-unrecognized-form-indefinite-masculine-plural":"neidentificați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neidentificate","definite-error-unrecognized-form-masculine-neuter-singular":"neidentificatul","definite-error-unrecognized-form-feminine-singular":"neidentificata","definite-error-unrecognized-form-masculine-plural":"neidentificații","definite-error-unrecognized-form-feminine-neuter-plural":"neidentificatele"}},{"word":"neiertat","pos":"adj","definitions":["unforgiving"],"forms":{"feminine-singular":"neiertată","masculine-plural":"neiertați","feminine-neuter-plural":"neiertate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neiertat","error-unrecognized-form-feminine-indefinite-singular":"neiertată","error-unrecognized-form-indefinite-masculine-plural":"neiertați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neiertate","definite-error-unrecognized-form-masculine-neuter-singular":"neiertatul","definite-error-unrecognized-form-feminine-singular":"neiertata","definite-error-unrecognized-form-masculine-plural":"neiertații","definite-error-unrecognized-form-feminine-neuter-plural":"neiertatele"}},{"word":"neiertător","pos":"adj","definitions":["ruthless"],"forms":{"feminine-singular":"neiertătoare","masculine-plural":"neiertători","feminine-neuter-plural":"neiertătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neiertător","error-unrecognized-form-feminine-indefinite-singular":"neiertătoare","error-unrecognized-form-indefinite-masculine-plural":"neiertători","error-unrecognized-form-feminine-indefinite-neuter-plural":"neiertătoare","definite-error-unrecognized-form-masculine-neuter-singular":"neiertătorul","definite-error-unrecognized-form-feminine-singular":"neiertătoara","definite-error-unrecognized-form-masculine-plural":"neiertătorii","definite-error-unrecognized-form-feminine-neuter-plural":"neiertătoarele"}},{"word":"neimaginabil","pos":"adj","definitions":["unimaginable"],"forms":{"feminine-singular":"neimaginabilă","masculine-plural":"neimaginabili","feminine-neuter-plural":"neimaginabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neimaginabil","error-unrecognized-form-feminine-indefinite-singular":"neimaginabilă","error-unrecognized-form-indefinite-masculine-plural":"neimaginabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neimaginabile","definite-error-unrecognized-form-masculine-neuter-singular":"neimaginabilul","definite-error-unrecognized-form-feminine-singular":"neimaginabila","definite-error-unrecognized-form-masculine-plural":"neimaginabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neimaginabilele"}},{"word":"neîmblânzit","pos":"adj","definitions":["untamed"],"forms":{"feminine-singular":"neîmblânzită","masculine-plural":"neîmblânziți","feminine-neuter-plural":"neîmblânzite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîmblânzit","error-unrecognized-form-feminine-indefinite-singular":"neîmblânzită","error-unrecognized-form-indefinite-masculine-plural":"neîmblânziți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîmblânzite","definite-error-unrecognized-form-masculine-neuter-singular":"neîmblânzitul","definite-error-unrecognized-form-feminine-singular":"neîmblânzita","definite-error-unrecognized-form-masculine-plural":"neîmblânziții","definite-error-unrecognized-form-feminine-neuter-plural":"neîmblânzitele"}},{"word":"neîmbunătățit","pos":"adj","definitions":["unimproved"],"pronunciation":"[ˌne.ɨmˌbu.nə.təˈt͡sit]","forms":{"feminine-singular":"neîmbunătățită","masculine-plural":"neîmbunătățiți","feminine-neuter-plural":"neîmbunătățite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîmbunătățit","error-unrecognized-form-feminine-indefinite-singular":"neîmbunătățită","error-unrecognized-form-indefinite-masculine-plural":"neîmbunătățiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîmbunătățite","definite-error-unrecognized-form-masculine-neuter-singular":"neîmbunătățitul","definite-error-unrecognized-form-feminine-singular":"neîmbunătățita","definite-error-unrecognized-form-masculine-plural":"neîmbunătățiții","definite-error-unrecognized-form-feminine-neuter-plural":"neîmbunătățitele"}},{"word":"neîmbunătățit","pos":"verb","definitions":["negative past participle of îmbunătăți"],"pronunciation":"[ˌne.ɨmˌbu.nə.təˈt͡sit]"},{"word":"neimitabil","pos":"adj","definitions":["inimitable"],"forms":{"feminine-singular":"neimitabilă","masculine-plural":"neimitabili","feminine-neuter-plural":"neimitabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neimitabil","error-unrecognized-form-feminine-indefinite-singular":"neimitabilă","error-unrecognized-form-indefinite-masculine-plural":"neimitabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neimitabile","definite-error-unrecognized-form-masculine-neuter-singular":"neimitabilul","definite-error-unrecognized-form-feminine-singular":"neimitabila","definite-error-unrecognized-form-masculine-plural":"neimitabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neimitabilele"}},{"word":"neîmpăcat","pos":"adj","definitions":["implacable"],"forms":{"feminine-singular":"neîmpăcată","masculine-plural":"neîmpăcați","feminine-neuter-plural":"neîmpăcate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîmpăcat","error-unrecognized-form-feminine-indefinite-singular":"neîmpăcată","error-unrecognized-form-indefinite-masculine-plural":"neîmpăcați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîmpăcate","definite-error-unrecognized-form-masculine-neuter-singular":"neîmpăcatul","definite-error-unrecognized-form-feminine-singular":"neîmpăcata","definite-error-unrecognized-form-masculine-plural":"neîmpăcații","definite-error-unrecognized-form-feminine-neuter-plural":"neîmpăcatele"}},{"word":"neîmpădurit","pos":"adj","definitions":["unforested, free of forests"],"forms":{"feminine-singular":"neîmpădurită","masculine-plural":"neîmpăduriți","feminine-neuter-plural":"neîmpădurite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîmpădurit","error-unrecognized-form-feminine-indefinite-singular":"neîmpădurită","error-unrecognized-form-indefinite-masculine-plural":"neîmpăduriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîmpădurite","definite-error-unrecognized-form-masculine-neuter-singular":"neîmpăduritul","definite-error-unrecognized-form-feminine-singular":"neîmpădurita","definite-error-unrecognized-form-masculine-plural":"neîmpăduriții","definite-error-unrecognized-form-feminine-neuter-plural":"neîmpăduritele"}},{"word":"neîmpiedicat","pos":"adj","definitions":["unimpeded"],"pronunciation":"/ˌne.ɨmˌpje.diˈkat/","forms":{"feminine-singular":"neîmpiedicată","masculine-plural":"neîmpiedicați","feminine-neuter-plural":"neîmpiedicate","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîmpiedicat","error-unrecognized-form-feminine-indefinite-singular":"neîmpiedicată","error-unrecognized-form-indefinite-masculine-plural":"neîmpiedicați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîmpiedicate","definite-error-unrecognized-form-masculine-neuter-singular":"neîmpiedicatul","definite-error-unrecognized-form-feminine-singular":"neîmpiedicata","definite-error-unrecognized-form-masculine-plural":"neîmpiedicații","definite-error-unrecognized-form-feminine-neuter-plural":"neîmpiedicatele"}},{"word":"neimplicat","pos":"adj","definitions":["uninvolved"],"forms":{"feminine-singular":"neimplicată","masculine-plural":"neimplicați","feminine-neuter-plural":"neimplicate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neimplicat","error-unrecognized-form-feminine-indefinite-singular":"neimplicată","error-unrecognized-form-indefinite-masculine-plural":"neimplicați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neimplicate","definite-error-unrecognized-form-masculine-neuter-singular":"neimplicatul","definite-error-unrecognized-form-feminine-singular":"neimplicata","definite-error-unrecognized-form-masculine-plural":"neimplicații","definite-error-unrecognized-form-feminine-neuter-plural":"neimplicatele"}},{"word":"neîmplinit","pos":"adj","definitions":["unfulfilled"],"forms":{"feminine-singular":"neîmplinită","masculine-plural":"neîmpliniți","feminine-neuter-plural":"neîmplinite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîmplinit","error-unrecognized-form-feminine-indefinite-singular":"neîmplinită","error-unrecognized-form-indefinite-masculine-plural":"neîmpliniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîmplinite","definite-error-unrecognized-form-masculine-neuter-singular":"neîmplinitul","definite-error-unrecognized-form-feminine-singular":"neîmplinita","definite-error-unrecognized-form-masculine-plural":"neîmpliniții","definite-error-unrecognized-form-feminine-neuter-plural":"neîmplinitele"}},{"word":"neimportant","pos":"adj","definitions":["unimportant"],"forms":{"feminine-singular":"neimportantă","masculine-plural":"neimportanți","feminine-neuter-plural":"neimportante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neimportant","error-unrecognized-form-feminine-indefinite-singular":"neimportantă","error-unrecognized-form-indefinite-masculine-plural":"neimportanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neimportante","definite-error-unrecognized-form-masculine-neuter-singular":"neimportantul","definite-error-unrecognized-form-feminine-singular":"neimportanta","definite-error-unrecognized-form-masculine-plural":"neimportanții","definite-error-unrecognized-form-feminine-neuter-plural":"neimportantele"}},{"word":"neimpozabil","pos":"adj","definitions":["nontaxable"],"forms":{"feminine-singular":"neimpozabilă","masculine-plural":"neimpozabili","feminine-neuter-plural":"neimpozabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neimpozabil","error-unrecognized-form-feminine-indefinite-singular":"neimpozabilă","error-unrecognized-form-indefinite-masculine-plural":"neimpozabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neimpozabile","definite-error-unrecognized-form-masculine-neuter-singular":"neimpozabilul","definite-error-unrecognized-form-feminine-singular":"neimpozabila","definite-error-unrecognized-form-masculine-plural":"neimpozabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neimpozabilele"}},{"word":"neîmprejmuit","pos":"adj","definitions":["fenceless"],"forms":{"feminine-singular":"neîmprejmuită","masculine-plural":"neîmprejmuiți","feminine-neuter-plural":"neîmprejmuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîmprejmuit","error-unrecognized-form-feminine-indefinite-singular":"neîmprejmuită","error-unrecognized-form-indefinite-masculine-plural":"neîmprejmuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîmprejmuite","definite-error-unrecognized-form-masculine-neuter-singular":"neîmprejmuitul","definite-error-unrecognized-form-feminine-singular":"neîmprejmuita","definite-error-unrecognized-form-masculine-plural":"neîmprejmuiții","definite-error-unrecognized-form-feminine-neuter-plural":"neîmprejmuitele"}},{"word":"neîncăpător","pos":"adj","definitions":["too small"],"forms":{"feminine-singular":"neîncăpătoare","masculine-plural":"neîncăpători","feminine-neuter-plural":"neîncăpătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîncăpător","error-unrecognized-form-feminine-indefinite-singular":"neîncăpătoare","error-unrecognized-form-indefinite-masculine-plural":"neîncăpători","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîncăpătoare","definite-error-unrecognized-form-masculine-neuter-singular":"neîncăpătorul","definite-error-unrecognized-form-feminine-singular":"neîncăpătoarea","definite-error-unrecognized-form-masculine-plural":"neîncăpătorii","definite-error-unrecognized-form-feminine-neuter-plural":"neîncăpătoarele"}},{"word":"neînceput","pos":"adj","definitions":["unstarted"],"forms":{"feminine-singular":"neîncepută","masculine-plural":"neîncepuți","feminine-neuter-plural":"neîncepute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neînceput","error-unrecognized-form-feminine-indefinite-singular":"neîncepută","error-unrecognized-form-indefinite-masculine-plural":"neîncepuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîncepute","definite-error-unrecognized-form-masculine-neuter-singular":"neînceputul","definite-error-unrecognized-form-feminine-singular":"neînceputa","definite-error-unrecognized-form-masculine-plural":"neîncepuții","definite-error-unrecognized-form-feminine-neuter-plural":"neînceputele"}},{"word":"neîncetare","pos":"noun","definitions":["ceaselessness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neîncetare","accusative-definite-nominative":"neîncetarea","dative-genitive-indefinite":"neîncetări","dative-definite-genitive":"neîncetării","vocative":"neîncetare"}},{"word":"neîncetat","pos":"adj","definitions":["ceaseless"],"forms":{"feminine-singular":"neîncetată","masculine-plural":"neîncetați","feminine-neuter-plural":"neîncetate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîncetat","error-unrecognized-form-feminine-indefinite-singular":"neîncetată","error-unrecognized-form-indefinite-masculine-plural":"neîncetați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîncetate","definite-error-unrecognized-form-masculine-neuter-singular":"neîncetatul","definite-error-unrecognized-form-feminine-singular":"neîncetata","definite-error-unrecognized-form-masculine-plural":"neîncetații","definite-error-unrecognized-form-feminine-neuter-plural":"neîncetatele"}},{"word":"neînchipuit","pos":"adj","definitions":["unimaginable"],"forms":{"feminine-singular":"neînchipuită","masculine-plural":"neînchipuiți","feminine-neuter-plural":"neînchipuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neînchipuit","error-unrecognized-form-feminine-indefinite-singular":"neînchipuită","error-unrecognized-form-indefinite-masculine-plural":"neînchipuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neînchipuite","definite-error-unrecognized-form-masculine-neuter-singular":"neînchipuitul","definite-error-unrecognized-form-feminine-singular":"neînchipuita","definite-error-unrecognized-form-masculine-plural":"neînchipuiții","definite-error-unrecognized-form-feminine-neuter-plural":"neînchipuitele"}},{"word":"neîncredere","pos":"noun","definitions":["distrust"],"pronunciation":"/ne.ɨn.ˈkre.de.re/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neîncredere","accusative-definite-nominative":"neîncrederea","dative-genitive-indefinite":"neîncrederi","dative-definite-genitive":"neîncrederii","vocative":"neîncredere"}},{"word":"neîncrezător","pos":"adj","definitions":["incredulous"],"forms":{"feminine-singular":"neîncrezătoare","masculine-plural":"neîncrezători","feminine-neuter-plural":"neîncrezătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîncrezător","error-unrecognized-form-feminine-indefinite-singular":"neîncrezătoare","error-unrecognized-form-indefinite-masculine-plural":"neîncrezători","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîncrezătoare","definite-error-unrecognized-form-masculine-neuter-singular":"neîncrezătorul","definite-error-unrecognized-form-feminine-singular":"neîncrezătoarea","definite-error-unrecognized-form-masculine-plural":"neîncrezătorii","definite-error-unrecognized-form-feminine-neuter-plural":"neîncrezătoarele"}},{"word":"neîndemânare","pos":"noun","definitions":["clumsiness"],"pronunciation":"/ne.ɨn.de.mɨˈna.re/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neîndemânare","accusative-definite-nominative":"neîndemânarea","dative-genitive-indefinite":"neîndemânări","dative-definite-genitive":"neîndemânării","vocative":"neîndemânare"}},{"word":"neîndemânatic","pos":"adj","definitions":["clumsy"],"forms":{"feminine-singular":"neîndemânatică","masculine-plural":"neîndemânatici","feminine-neuter-plural":"neîndemânatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîndemânatic","error-unrecognized-form-feminine-indefinite-singular":"neîndemânatică","error-unrecognized-form-indefinite-masculine-plural":"neîndemânatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîndemânatice","definite-error-unrecognized-form-masculine-neuter-singular":"neîndemânaticul","definite-error-unrecognized-form-feminine-singular":"neîndemânatica","definite-error-unrecognized-form-masculine-plural":"neîndemânaticii","definite-error-unrecognized-form-feminine-neuter-plural":"neîndemânaticele"}},{"word":"neîndeplinit","pos":"adj","definitions":["unfulfilled"],"forms":{"feminine-singular":"neîndeplinită","masculine-plural":"neîndepliniți","feminine-neuter-plural":"neîndeplinite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîndeplinit","error-unrecognized-form-feminine-indefinite-singular":"neîndeplinită","error-unrecognized-form-indefinite-masculine-plural":"neîndepliniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîndeplinite","definite-error-unrecognized-form-masculine-neuter-singular":"neîndeplinitul","definite-error-unrecognized-form-feminine-singular":"neîndeplinita","definite-error-unrecognized-form-masculine-plural":"neîndepliniții","definite-error-unrecognized-form-feminine-neuter-plural":"neîndeplinitele"}},{"word":"neîndestulător","pos":"adj","definitions":["inadequate"],"forms":{"feminine-singular":"neîndestulătoare","masculine-plural":"neîndestulători","feminine-neuter-plural":"neîndestulătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîndestulător","error-unrecognized-form-feminine-indefinite-singular":"neîndestulătoare","error-unrecognized-form-indefinite-masculine-plural":"neîndestulători","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîndestulătoare","definite-error-unrecognized-form-masculine-neuter-singular":"neîndestulătorul","definite-error-unrecognized-form-feminine-singular":"neîndestulătoarea","definite-error-unrecognized-form-masculine-plural":"neîndestulătorii","definite-error-unrecognized-form-feminine-neuter-plural":"neîndestulătoarele"}},{"word":"neîndoielnic","pos":"adj","definitions":["unmistakable"],"forms":{"feminine-singular":"neîndoielnică","masculine-plural":"neîndoielnici","feminine-neuter-plural":"neîndoielnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîndoielnic","error-unrecognized-form-feminine-indefinite-singular":"neîndoielnică","error-unrecognized-form-indefinite-masculine-plural":"neîndoielnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîndoielnice","definite-error-unrecognized-form-masculine-neuter-singular":"neîndoielnicul","definite-error-unrecognized-form-feminine-singular":"neîndoielnica","definite-error-unrecognized-form-masculine-plural":"neîndoielnicii","definite-error-unrecognized-form-feminine-neuter-plural":"neîndoielnicele"}},{"word":"neîndoios","pos":"adj","definitions":["doubtless"],"forms":{"feminine-singular":"neîndoioasă","masculine-plural":"neîndoioși","feminine-neuter-plural":"neîndoioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîndoios","error-unrecognized-form-feminine-indefinite-singular":"neîndoioasă","error-unrecognized-form-indefinite-masculine-plural":"neîndoioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîndoioase","definite-error-unrecognized-form-masculine-neuter-singular":"neîndoiosul","definite-error-unrecognized-form-feminine-singular":"neîndoioasa","definite-error-unrecognized-form-masculine-plural":"neîndoioșii","definite-error-unrecognized-form-feminine-neuter-plural":"neîndoioasele"}},{"word":"neînduplecare","pos":"noun","definitions":["rigidity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neînduplecare","accusative-definite-nominative":"neînduplecarea","dative-genitive-indefinite":"neînduplecari","dative-definite-genitive":"neînduplecarii","vocative":"neînduplecare"}},{"word":"neînduplecat","pos":"adj","definitions":["relentless"],"forms":{"feminine-singular":"neînduplecată","masculine-plural":"neînduplecați","feminine-neuter-plural":"neînduplecate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neînduplecat","error-unrecognized-form-feminine-indefinite-singular":"neînduplecată","error-unrecognized-form-indefinite-masculine-plural":"neînduplecați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neînduplecate","definite-error-unrecognized-form-masculine-neuter-singular":"neînduplecatul","definite-error-unrecognized-form-feminine-singular":"neînduplecata","definite-error-unrecognized-form-masculine-plural":"neînduplecații","definite-error-unrecognized-form-feminine-neuter-plural":"neînduplecatele"}},{"word":"neîndurare","pos":"noun","definitions":["pitilessness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neîndurare","accusative-definite-nominative":"neîndurarea","dative-genitive-indefinite":"neîndurari","dative-definite-genitive":"neîndurarii","vocative":"neîndurare"}},{"word":"neîndurat","pos":"adj","definitions":["unyielding, merciless"],"pronunciation":"/ne.ɨn.duˈrat/","forms":{"feminine-singular":"neîndurată","masculine-plural":"neîndurați","feminine-neuter-plural":"neîndurate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîndurat","error-unrecognized-form-feminine-indefinite-singular":"neîndurată","error-unrecognized-form-indefinite-masculine-plural":"neîndurați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîndurate","definite-error-unrecognized-form-masculine-neuter-singular":"neînduratul","definite-error-unrecognized-form-feminine-singular":"neîndurata","definite-error-unrecognized-form-masculine-plural":"neîndurații","definite-error-unrecognized-form-feminine-neuter-plural":"neînduratele"}},{"word":"neîndurător","pos":"adj","definitions":["ruthless (who does not forgive; without mercy)"],"pronunciation":"/ne.ɨn.du.rəˈtor/","forms":{"feminine-singular":"neîndurătoare","masculine-plural":"neîndurători","feminine-neuter-plural":"neîndurătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîndurător","error-unrecognized-form-feminine-indefinite-singular":"neîndurătoare","error-unrecognized-form-indefinite-masculine-plural":"neîndurători","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîndurătoare","definite-error-unrecognized-form-masculine-neuter-singular":"neîndurătorul","definite-error-unrecognized-form-feminine-singular":"neîndurătoarea","definite-error-unrecognized-form-masculine-plural":"neîndurătorii","definite-error-unrecognized-form-feminine-neuter-plural":"neîndurătoarele"}},{"word":"neîndurătorul","pos":"adj","definitions":["definite nominative/accusative masculine/neuter singular of neîndurător"],"pronunciation":"/ne.ɨn.du.rəˈto.rul/"},{"word":"neîndurătorului","pos":"adj","definitions":["definite genitive/dative masculine/neuter singular of neîndurător"],"pronunciation":"/ne.ɨn.du.rəˈto.ru.luj/"},{"word":"neinflamabil","pos":"adj","definitions":["incombustible"],"forms":{"feminine-singular":"neinflamabilă","masculine-plural":"neinflamabili","feminine-neuter-plural":"neinflamabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neinflamabil","error-unrecognized-form-feminine-indefinite-singular":"neinflamabilă","error-unrecognized-form-indefinite-masculine-plural":"neinflamabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neinflamabile","definite-error-unrecognized-form-masculine-neuter-singular":"neinflamabilul","definite-error-unrecognized-form-feminine-singular":"neinflamabila","definite-error-unrecognized-form-masculine-plural":"neinflamabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neinflamabilele"}},{"word":"neinformat","pos":"adj","definitions":["uninformed"],"forms":{"feminine-singular":"neinformată","masculine-plural":"neinformați","feminine-neuter-plural":"neinformate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neinformat","error-unrecognized-form-feminine-indefinite-singular":"neinformată","error-unrecognized-form-indefinite-masculine-plural":"neinformați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neinformate","definite-error-unrecognized-form-masculine-neuter-singular":"neinformatul","definite-error-unrecognized-form-feminine-singular":"neinformata","definite-error-unrecognized-form-masculine-plural":"neinformații","definite-error-unrecognized-form-feminine-neuter-plural":"neinformatele"}},{"word":"neînfrânat","pos":"adj","definitions":["unbridled"],"forms":{"feminine-singular":"neînfrânată","masculine-plural":"neînfrânați","feminine-neuter-plural":"neînfrânate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neînfrânat","error-unrecognized-form-feminine-indefinite-singular":"neînfrânată","error-unrecognized-form-indefinite-masculine-plural":"neînfrânați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neînfrânate","definite-error-unrecognized-form-masculine-neuter-singular":"neînfrânatul","definite-error-unrecognized-form-feminine-singular":"neînfrânata","definite-error-unrecognized-form-masculine-plural":"neînfrânații","definite-error-unrecognized-form-feminine-neuter-plural":"neînfrânatele"}},{"word":"neînfrânt","pos":"adj","definitions":["unconquered"],"forms":{"feminine-singular":"neînfrântă","masculine-plural":"neînfrânți","feminine-neuter-plural":"neînfrânte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neînfrânt","error-unrecognized-form-feminine-indefinite-singular":"neînfrântă","error-unrecognized-form-indefinite-masculine-plural":"neînfrânți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neînfrânte","definite-error-unrecognized-form-masculine-neuter-singular":"neînfrântul","definite-error-unrecognized-form-feminine-singular":"neînfrânta","definite-error-unrecognized-form-masculine-plural":"neînfrânții","definite-error-unrecognized-form-feminine-neuter-plural":"neînfrântele"}},{"word":"neînfricare","pos":"noun","definitions":["fearlessness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neînfricare","accusative-definite-nominative":"neînfricarea","dative-genitive-indefinite":"neînfricari","dative-definite-genitive":"neînfricarii","vocative":"neînfricare"}},{"word":"neînfricat","pos":"adj","definitions":["fearless"],"forms":{"feminine-singular":"neînfricată","masculine-plural":"neînfricați","feminine-neuter-plural":"neînfricate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neînfricat","error-unrecognized-form-feminine-indefinite-singular":"neînfricată","error-unrecognized-form-indefinite-masculine-plural":"neînfricați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neînfricate","definite-error-unrecognized-form-masculine-neuter-singular":"neînfricatul","definite-error-unrecognized-form-feminine-singular":"neînfricata","definite-error-unrecognized-form-masculine-plural":"neînfricații","definite-error-unrecognized-form-feminine-neuter-plural":"neînfricatele"}},{"word":"neînfricoșare","pos":"noun","definitions":["courage"],"forms":{"plural":"neînfricoșări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neînfricoșare","accusative-definite-nominative-singular":"neînfricoșarea","accusative-indefinite-nominative-plural":"neînfricoșări","accusative-definite-nominative-plural":"neînfricoșările","dative-genitive-indefinite-singular":"neînfricoșări","dative-definite-genitive-singular":"neînfricoșării","dative-genitive-indefinite-plural":"neînfricoșări","dative-definite-genitive-plural":"neînfricoșărilor","singular-vocative":"neînfricoșare","plural-vocative":"neînfricoșărilor"}},{"word":"neînfricoșat","pos":"adj","definitions":["fearless"],"forms":{"feminine-singular":"neînfricoșată","masculine-plural":"neînfricoșați","feminine-neuter-plural":"neînfricoșate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neînfricoșat","error-unrecognized-form-feminine-indefinite-singular":"neînfricoșată","error-unrecognized-form-indefinite-masculine-plural":"neînfricoșați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neînfricoșate","definite-error-unrecognized-form-masculine-neuter-singular":"neînfricoșatul","definite-error-unrecognized-form-feminine-singular":"neînfricoșata","definite-error-unrecognized-form-masculine-plural":"neînfricoșații","definite-error-unrecognized-form-feminine-neuter-plural":"neînfricoșatele"}},{"word":"neîngăduință","pos":"noun","definitions":["intoleranță"],"forms":{"plural":"neîngăduințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neîngăduință","accusative-definite-nominative-singular":"neîngăduința","accusative-indefinite-nominative-plural":"neîngăduințe","accusative-definite-nominative-plural":"neîngăduințele","dative-genitive-indefinite-singular":"neîngăduințe","dative-definite-genitive-singular":"neîngăduinței","dative-genitive-indefinite-plural":"neîngăduințe","dative-definite-genitive-plural":"neîngăduințelor","singular-vocative":"neîngăduință","plural-vocative":"neîngăduințelor"}},{"word":"neîngăduitor","pos":"adj","definitions":["intolerant"],"forms":{"feminine-singular":"neîngăduitoare","masculine-plural":"neîngăduitori","feminine-neuter-plural":"neîngăduitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîngăduitor","error-unrecognized-form-feminine-indefinite-singular":"neîngăduitoare","error-unrecognized-form-indefinite-masculine-plural":"neîngăduitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîngăduitoare","definite-error-unrecognized-form-masculine-neuter-singular":"neîngăduitorul","definite-error-unrecognized-form-feminine-singular":"neîngăduitoarea","definite-error-unrecognized-form-masculine-plural":"neîngăduitorii","definite-error-unrecognized-form-feminine-neuter-plural":"neîngăduitoarele"}},{"word":"neîngrădit","pos":"adj","definitions":["fenceless"],"forms":{"feminine-singular":"neîngrădită","masculine-plural":"neîngrădiți","feminine-neuter-plural":"neîngrădite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîngrădit","error-unrecognized-form-feminine-indefinite-singular":"neîngrădită","error-unrecognized-form-indefinite-masculine-plural":"neîngrădiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîngrădite","definite-error-unrecognized-form-masculine-neuter-singular":"neîngrăditul","definite-error-unrecognized-form-feminine-singular":"neîngrădita","definite-error-unrecognized-form-masculine-plural":"neîngrădiții","definite-error-unrecognized-form-feminine-neuter-plural":"neîngrăditele"}},{"word":"neîngriji","pos":"verb","definitions":["to neglect"],"forms":{"canonical":"a neîngriji 4th conjugation","present-singular-third-person":"neîngrijește","participle-past":"neîngrijit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a neîngriji","gerund":"neîngrijind","first-person-indicative-present-singular":"neîngrijesc","indicative-present-second-person-singular":"neîngrijești","indicative-present-singular-third-person":"neîngrijește","first-person-indicative-plural-present":"neîngrijim","indicative-plural-present-second-person":"neîngrijiți","indicative-plural-present-third-person":"neîngrijesc","first-person-imperfect-indicative-singular":"neîngrijeam","imperfect-indicative-second-person-singular":"neîngrijeai","imperfect-indicative-singular-third-person":"neîngrijea","first-person-imperfect-indicative-plural":"neîngrijeam","imperfect-indicative-plural-second-person":"neîngrijeați","imperfect-indicative-plural-third-person":"neîngrijeau","first-person-indicative-perfect-singular":"neîngrijii","indicative-perfect-second-person-singular":"neîngrijiși","indicative-perfect-singular-third-person":"neîngriji","first-person-indicative-perfect-plural":"neîngrijirăm","indicative-perfect-plural-second-person":"neîngrijirăți","indicative-perfect-plural-third-person":"neîngrijiră","first-person-indicative-pluperfect-singular":"neîngrijisem","indicative-pluperfect-second-person-singular":"neîngrijiseși","indicative-pluperfect-singular-third-person":"neîngrijise","first-person-indicative-pluperfect-plural":"neîngrijiserăm","indicative-pluperfect-plural-second-person":"neîngrijiserăți","indicative-pluperfect-plural-third-person":"neîngrijiseră","first-person-present-singular-subjunctive":"să neîngrijesc","present-second-person-singular-subjunctive":"să neîngrijești","present-singular-subjunctive-third-person":"să neîngrijească","first-person-plural-present-subjunctive":"să neîngrijim","plural-present-second-person-subjunctive":"să neîngrijiți","plural-present-subjunctive-third-person":"să neîngrijească","imperative-second-person-singular":"neîngrijește","imperative-plural-second-person":"neîngrijiți","imperative-negative-second-person-singular":"nu neîngriji","imperative-negative-plural-second-person":"nu neîngrijiți"}},{"word":"neîngrijire","pos":"noun","definitions":["unkempt"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neîngrijire","accusative-definite-nominative":"neîngrijirea","dative-genitive-indefinite":"neîngrijiri","dative-definite-genitive":"neîngrijirii","vocative":"neîngrijire"}},{"word":"neîngrijit","pos":"adj","definitions":["untidy"],"forms":{"feminine-singular":"neîngrijită","masculine-plural":"neîngrijiți","feminine-neuter-plural":"neîngrijite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîngrijit","error-unrecognized-form-feminine-indefinite-singular":"neîngrijită","error-unrecognized-form-indefinite-masculine-plural":"neîngrijiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîngrijite","definite-error-unrecognized-form-masculine-neuter-singular":"neîngrijitul","definite-error-unrecognized-form-feminine-singular":"neîngrijita","definite-error-unrecognized-form-masculine-plural":"neîngrijiții","definite-error-unrecognized-form-feminine-neuter-plural":"neîngrijitele"}},{"word":"neînsemnat","pos":"adj","definitions":["insignificant"],"forms":{"feminine-singular":"neînsemnată","masculine-plural":"neînsemnați","feminine-neuter-plural":"neînsemnate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neînsemnat","error-unrecognized-form-feminine-indefinite-singular":"neînsemnată","error-unrecognized-form-indefinite-masculine-plural":"neînsemnați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neînsemnate","definite-error-unrecognized-form-masculine-neuter-singular":"neînsemnatul","definite-error-unrecognized-form-feminine-singular":"neînsemnata","definite-error-unrecognized-form-masculine-plural":"neînsemnații","definite-error-unrecognized-form-feminine-neuter-plural":"neînsemnatele"}},{"word":"neinspirat","pos":"adj","definitions":["uninspired"],"forms":{"feminine-singular":"neinspirată","masculine-plural":"neinspirați","feminine-neuter-plural":"neinspirate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neinspirat","error-unrecognized-form-feminine-indefinite-singular":"neinspirată","error-unrecognized-form-indefinite-masculine-plural":"neinspirați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neinspirate","definite-error-unrecognized-form-masculine-neuter-singular":"neinspiratul","definite-error-unrecognized-form-feminine-singular":"neinspirata","definite-error-unrecognized-form-masculine-plural":"neinspirații","definite-error-unrecognized-form-feminine-neuter-plural":"neinspiratele"}},{"word":"neinstruit","pos":"adj","definitions":["untrained"],"forms":{"feminine-singular":"neinstruită","masculine-plural":"neinstruiți","feminine-neuter-plural":"neinstruite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neinstruit","error-unrecognized-form-feminine-indefinite-singular":"neinstruită","error-unrecognized-form-indefinite-masculine-plural":"neinstruiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neinstruite","definite-error-unrecognized-form-masculine-neuter-singular":"neinstruitul","definite-error-unrecognized-form-feminine-singular":"neinstruita","definite-error-unrecognized-form-masculine-plural":"neinstruiții","definite-error-unrecognized-form-feminine-neuter-plural":"neinstruitele"}},{"word":"neînsuflețit","pos":"adj","definitions":["inanimate"],"forms":{"feminine-singular":"neînsuflețită","masculine-plural":"neînsuflețiți","feminine-neuter-plural":"neînsuflețite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neînsuflețit","error-unrecognized-form-feminine-indefinite-singular":"neînsuflețită","error-unrecognized-form-indefinite-masculine-plural":"neînsuflețiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neînsuflețite","definite-error-unrecognized-form-masculine-neuter-singular":"neînsuflețitul","definite-error-unrecognized-form-feminine-singular":"neînsuflețita","definite-error-unrecognized-form-masculine-plural":"neînsuflețiții","definite-error-unrecognized-form-feminine-neuter-plural":"neînsuflețitele"}},{"word":"neîntârziat","pos":"adj","definitions":["immediately, without delay"],"forms":{"feminine-singular":"neîntârziată","masculine-plural":"neîntârziați","feminine-neuter-plural":"neîntârziate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîntârziat","error-unrecognized-form-feminine-indefinite-singular":"neîntârziată","error-unrecognized-form-indefinite-masculine-plural":"neîntârziați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîntârziate","definite-error-unrecognized-form-masculine-neuter-singular":"neîntârziatul","definite-error-unrecognized-form-feminine-singular":"neîntârziata","definite-error-unrecognized-form-masculine-plural":"neîntârziații","definite-error-unrecognized-form-feminine-neuter-plural":"neîntârziatele"}},{"word":"neintegrabil","pos":"adj","definitions":["nonintegrable"],"forms":{"feminine-singular":"neintegrabilă","masculine-plural":"neintegrabili","feminine-neuter-plural":"neintegrabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neintegrabil","error-unrecognized-form-feminine-indefinite-singular":"neintegrabilă","error-unrecognized-form-indefinite-masculine-plural":"neintegrabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neintegrabile","definite-error-unrecognized-form-masculine-neuter-singular":"neintegrabilul","definite-error-unrecognized-form-feminine-singular":"neintegrabila","definite-error-unrecognized-form-masculine-plural":"neintegrabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neintegrabilele"}},{"word":"neînțelegător","pos":"adj","definitions":["unreasonable"],"forms":{"feminine-singular":"neînțelegătoare","masculine-plural":"neînțelegători","feminine-neuter-plural":"neînțelegătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neînțelegător","error-unrecognized-form-feminine-indefinite-singular":"neînțelegătoare","error-unrecognized-form-indefinite-masculine-plural":"neînțelegători","error-unrecognized-form-feminine-indefinite-neuter-plural":"neînțelegătoare","definite-error-unrecognized-form-masculine-neuter-singular":"neînțelegătorul","definite-error-unrecognized-form-feminine-singular":"neînțelegătoarea","definite-error-unrecognized-form-masculine-plural":"neînțelegătorii","definite-error-unrecognized-form-feminine-neuter-plural":"neînțelegătoarele"}},{"word":"neînțelegere","pos":"noun","definitions":["misunderstanding"],"forms":{"plural":"neînțelegeri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neînțelegere","accusative-definite-nominative-singular":"neînțelegerea","accusative-indefinite-nominative-plural":"neînțelegeri","accusative-definite-nominative-plural":"neînțelegerile","dative-genitive-indefinite-singular":"neînțelegeri","dative-definite-genitive-singular":"neînțelegerii","dative-genitive-indefinite-plural":"neînțelegeri","dative-definite-genitive-plural":"neînțelegerilor","singular-vocative":"neînțelegere","plural-vocative":"neînțelegerilor"}},{"word":"neînțeles","pos":"adj","definitions":["misunderstood"],"forms":{"feminine-singular":"neînțelesă","masculine-plural":"neînțeleși","feminine-neuter-plural":"neînțelese","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neînțeles","error-unrecognized-form-feminine-indefinite-singular":"neînțelesă","error-unrecognized-form-indefinite-masculine-plural":"neînțeleși","error-unrecognized-form-feminine-indefinite-neuter-plural":"neînțelese","definite-error-unrecognized-form-masculine-neuter-singular":"neînțelesul","definite-error-unrecognized-form-feminine-singular":"neînțelesa","definite-error-unrecognized-form-masculine-plural":"neînțeleșii","definite-error-unrecognized-form-feminine-neuter-plural":"neînțelesele"}},{"word":"neinteligent","pos":"adj","definitions":["unintelligent"],"forms":{"feminine-singular":"neinteligentă","masculine-plural":"neinteligenți","feminine-neuter-plural":"neinteligente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neinteligent","error-unrecognized-form-feminine-indefinite-singular":"neinteligentă","error-unrecognized-form-indefinite-masculine-plural":"neinteligenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neinteligente","definite-error-unrecognized-form-masculine-neuter-singular":"neinteligentul","definite-error-unrecognized-form-feminine-singular":"neinteligenta","definite-error-unrecognized-form-masculine-plural":"neinteligenții","definite-error-unrecognized-form-feminine-neuter-plural":"neinteligentele"}},{"word":"neinteligibil","pos":"adj","definitions":["unintelligible"],"forms":{"feminine-singular":"neinteligibilă","masculine-plural":"neinteligibili","feminine-neuter-plural":"neinteligibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neinteligibil","error-unrecognized-form-feminine-indefinite-singular":"neinteligibilă","error-unrecognized-form-indefinite-masculine-plural":"neinteligibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neinteligibile","definite-error-unrecognized-form-masculine-neuter-singular":"neinteligibilul","definite-error-unrecognized-form-feminine-singular":"neinteligibila","definite-error-unrecognized-form-masculine-plural":"neinteligibilii","definite-error-unrecognized-form-feminine-neuter-plural":"neinteligibilele"}},{"word":"neîntemeiat","pos":"adj","definitions":["unfounded, baseless, groundless"],"pronunciation":"/ne.ɨn.te.meˈjat/","forms":{"feminine-singular":"neîntemeiată","masculine-plural":"neîntemeiați","feminine-neuter-plural":"neîntemeiate","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîntemeiat","error-unrecognized-form-feminine-indefinite-singular":"neîntemeiată","error-unrecognized-form-indefinite-masculine-plural":"neîntemeiați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîntemeiate","definite-error-unrecognized-form-masculine-neuter-singular":"neîntemeiatul","definite-error-unrecognized-form-feminine-singular":"neîntemeiata","definite-error-unrecognized-form-masculine-plural":"neîntemeiații","definite-error-unrecognized-form-feminine-neuter-plural":"neîntemeiatele"}},{"word":"neîntemeiat","pos":"verb","definitions":["negative past participle of întemeia"],"pronunciation":"/ne.ɨn.te.meˈjat/"},{"word":"neintenționat","pos":"adj","definitions":["involuntary"],"forms":{"feminine-singular":"neintenționată","masculine-plural":"neintenționați","feminine-neuter-plural":"neintenționate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neintenționat","error-unrecognized-form-feminine-indefinite-singular":"neintenționată","error-unrecognized-form-indefinite-masculine-plural":"neintenționați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neintenționate","definite-error-unrecognized-form-masculine-neuter-singular":"neintenționatul","definite-error-unrecognized-form-feminine-singular":"neintenționata","definite-error-unrecognized-form-masculine-plural":"neintenționații","definite-error-unrecognized-form-feminine-neuter-plural":"neintenționatele"}},{"word":"neinteresant","pos":"adj","definitions":["dull"],"forms":{"feminine-singular":"neinteresantă","masculine-plural":"neinteresanți","feminine-neuter-plural":"neinteresante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neinteresant","error-unrecognized-form-feminine-indefinite-singular":"neinteresantă","error-unrecognized-form-indefinite-masculine-plural":"neinteresanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neinteresante","definite-error-unrecognized-form-masculine-neuter-singular":"neinteresantul","definite-error-unrecognized-form-feminine-singular":"neinteresanta","definite-error-unrecognized-form-masculine-plural":"neinteresanții","definite-error-unrecognized-form-feminine-neuter-plural":"neinteresantele"}},{"word":"neintervenție","pos":"noun","definitions":["nonintervention"],"forms":{"plural":"neintervenții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neintervenție","accusative-definite-nominative-singular":"neintervenția","accusative-indefinite-nominative-plural":"neintervenții","accusative-definite-nominative-plural":"neintervențiile","dative-genitive-indefinite-singular":"neintervenții","dative-definite-genitive-singular":"neintervenției","dative-genitive-indefinite-plural":"neintervenții","dative-definite-genitive-plural":"neintervențiilor","singular-vocative":"neintervenție","plural-vocative":"neintervențiilor"}},{"word":"neintervenționist","pos":"noun","definitions":["noninterventionist"],"forms":{"plural":"neintervenționiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neintervenționist","accusative-definite-nominative-singular":"neintervenționistul","accusative-indefinite-nominative-plural":"neintervenționiști","accusative-definite-nominative-plural":"neintervenționiștii","dative-genitive-indefinite-singular":"neintervenționist","dative-definite-genitive-singular":"neintervenționistului","dative-genitive-indefinite-plural":"neintervenționiști","dative-definite-genitive-plural":"neintervenționiștilor","singular-vocative":"neintervenționistule","plural-vocative":"neintervenționiștilor"}},{"word":"neintervenționistă","pos":"noun","definitions":["female equivalent of neintervenționist"],"forms":{"plural":"neintervenționiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neintervenționistă","accusative-definite-nominative-singular":"neintervenționista","accusative-indefinite-nominative-plural":"neintervenționiste","accusative-definite-nominative-plural":"neintervenționistele","dative-genitive-indefinite-singular":"neintervenționiste","dative-definite-genitive-singular":"neintervenționistei","dative-genitive-indefinite-plural":"neintervenționiste","dative-definite-genitive-plural":"neintervenționistelor","singular-vocative":"neintervenționistă","plural-vocative":"neintervenționistelor"}},{"word":"neîntinat","pos":"adj","definitions":["unsoiled"],"forms":{"feminine-singular":"neîntinată","masculine-plural":"neîntinați","feminine-neuter-plural":"neîntinate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîntinat","error-unrecognized-form-feminine-indefinite-singular":"neîntinată","error-unrecognized-form-indefinite-masculine-plural":"neîntinați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîntinate","definite-error-unrecognized-form-masculine-neuter-singular":"neîntinatul","definite-error-unrecognized-form-feminine-singular":"neîntinata","definite-error-unrecognized-form-masculine-plural":"neîntinații","definite-error-unrecognized-form-feminine-neuter-plural":"neîntinatele"}},{"word":"neîntors","pos":"adj","definitions":["unmoved"],"forms":{"feminine-singular":"neîntorsă","masculine-plural":"neîntorși","feminine-neuter-plural":"neîntorse","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîntors","error-unrecognized-form-feminine-indefinite-singular":"neîntorsă","error-unrecognized-form-indefinite-masculine-plural":"neîntorși","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîntorse","definite-error-unrecognized-form-masculine-neuter-singular":"neîntorsul","definite-error-unrecognized-form-feminine-singular":"neîntorsa","definite-error-unrecognized-form-masculine-plural":"neîntorșii","definite-error-unrecognized-form-feminine-neuter-plural":"neîntorsele"}},{"word":"neîntrebuințat","pos":"adj","definitions":["unused"],"forms":{"feminine-singular":"neîntrebuințată","masculine-plural":"neîntrebuințați","feminine-neuter-plural":"neîntrebuințate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîntrebuințat","error-unrecognized-form-feminine-indefinite-singular":"neîntrebuințată","error-unrecognized-form-indefinite-masculine-plural":"neîntrebuințați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîntrebuințate","definite-error-unrecognized-form-masculine-neuter-singular":"neîntrebuințatul","definite-error-unrecognized-form-feminine-singular":"neîntrebuințata","definite-error-unrecognized-form-masculine-plural":"neîntrebuințații","definite-error-unrecognized-form-feminine-neuter-plural":"neîntrebuințatele"}},{"word":"neîntrecut","pos":"adj","definitions":["unsurpassed"],"forms":{"feminine-singular":"neîntrecută","masculine-plural":"neîntrecuți","feminine-neuter-plural":"neîntrecute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neîntrecut","error-unrecognized-form-feminine-indefinite-singular":"neîntrecută","error-unrecognized-form-indefinite-masculine-plural":"neîntrecuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neîntrecute","definite-error-unrecognized-form-masculine-neuter-singular":"neîntrecutul","definite-error-unrecognized-form-feminine-singular":"neîntrecuta","definite-error-unrecognized-form-masculine-plural":"neîntrecuții","definite-error-unrecognized-form-feminine-neuter-plural":"neîntrecutele"}},{"word":"neîntrerupt","pos":"adv","definitions":["uninterrupted"]},{"word":"neînvins","pos":"adj","definitions":["unbeaten"],"forms":{"feminine-singular":"neînvinsă","masculine-plural":"neînvinși","feminine-neuter-plural":"neînvinse","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neînvins","error-unrecognized-form-feminine-indefinite-singular":"neînvinsă","error-unrecognized-form-indefinite-masculine-plural":"neînvinși","error-unrecognized-form-feminine-indefinite-neuter-plural":"neînvinse","definite-error-unrecognized-form-masculine-neuter-singular":"neînvinsul","definite-error-unrecognized-form-feminine-singular":"neînvinsa","definite-error-unrecognized-form-masculine-plural":"neînvinșii","definite-error-unrecognized-form-feminine-neuter-plural":"neînvinsele"}},{"word":"neios","pos":"adj","definitions":["covered or full of much snow, snowy"],"pronunciation":"/neˈjos/","forms":{"feminine-singular":"neioasă","masculine-plural":"neioși","feminine-neuter-plural":"neioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neios","error-unrecognized-form-feminine-indefinite-singular":"neioasă","error-unrecognized-form-indefinite-masculine-plural":"neioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"neioase","definite-error-unrecognized-form-masculine-neuter-singular":"neiosul","definite-error-unrecognized-form-feminine-singular":"neioasa","definite-error-unrecognized-form-masculine-plural":"neioșii","definite-error-unrecognized-form-feminine-neuter-plural":"neioasele"}},{"word":"neios","pos":"noun","definitions":["December"],"pronunciation":"/neˈjos/"},{"word":"neirigat","pos":"adj","definitions":["unirrigated"],"forms":{"feminine-singular":"neirigată","masculine-plural":"neirigați","feminine-neuter-plural":"neirigate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neirigat","error-unrecognized-form-feminine-indefinite-singular":"neirigată","error-unrecognized-form-indefinite-masculine-plural":"neirigați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neirigate","definite-error-unrecognized-form-masculine-neuter-singular":"neirigatul","definite-error-unrecognized-form-feminine-singular":"neirigata","definite-error-unrecognized-form-masculine-plural":"neirigații","definite-error-unrecognized-form-feminine-neuter-plural":"neirigatele"}},{"word":"neisan","pos":"noun","definitions":["panpipes player"],"forms":{"plural":"neisani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neisan","accusative-definite-nominative-singular":"neisanul","accusative-indefinite-nominative-plural":"neisani","accusative-definite-nominative-plural":"neisanii","dative-genitive-indefinite-singular":"neisan","dative-definite-genitive-singular":"neisanului","dative-genitive-indefinite-plural":"neisani","dative-definite-genitive-plural":"neisanilor","singular-vocative":"neisanule","plural-vocative":"neisanilor"}},{"word":"neisprăvit","pos":"noun","definitions":["unfinished","incapable person, good-for-nothing"],"forms":{"plural":"neisprăviți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neisprăvit","accusative-definite-nominative-singular":"neisprăvitul","accusative-indefinite-nominative-plural":"neisprăviți","accusative-definite-nominative-plural":"neisprăviții","dative-genitive-indefinite-singular":"neisprăvit","dative-definite-genitive-singular":"neisprăvitului","dative-genitive-indefinite-plural":"neisprăviți","dative-definite-genitive-plural":"neisprăviților","singular-vocative":"neisprăvitule","plural-vocative":"neisprăviților"}},{"word":"neisprăvită","pos":"noun","definitions":["female equivalent of neisprăvit"],"forms":{"plural":"neisprăvite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neisprăvită","accusative-definite-nominative-singular":"neisprăvita","accusative-indefinite-nominative-plural":"neisprăvite","accusative-definite-nominative-plural":"neisprăvitele","dative-genitive-indefinite-singular":"neisprăvite","dative-definite-genitive-singular":"neisprăvitei","dative-genitive-indefinite-plural":"neisprăvite","dative-definite-genitive-plural":"neisprăvitelor","singular-vocative":"neisprăvită","plural-vocative":"neisprăvitelor"}},{"word":"neistov","pos":"noun","definitions":["insanity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neistov","accusative-definite-nominative":"neistovul","dative-genitive-indefinite":"neistov","dative-definite-genitive":"neistovului","vocative":"neistovule"}},{"word":"neistovit","pos":"adj","definitions":["tireless"],"forms":{"feminine-singular":"neistovită","masculine-plural":"neistoviți","feminine-neuter-plural":"neistovite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neistovit","error-unrecognized-form-feminine-indefinite-singular":"neistovită","error-unrecognized-form-indefinite-masculine-plural":"neistoviți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neistovite","definite-error-unrecognized-form-masculine-neuter-singular":"neistovitul","definite-error-unrecognized-form-feminine-singular":"neistovita","definite-error-unrecognized-form-masculine-plural":"neistoviții","definite-error-unrecognized-form-feminine-neuter-plural":"neistovitele"}},{"word":"neiubitură","pos":"noun","definitions":["lack of affection"],"forms":{"plural":"neiubituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"neiubitură","accusative-definite-nominative-singular":"neiubitura","accusative-indefinite-nominative-plural":"neiubituri","accusative-definite-nominative-plural":"neiubiturile","dative-genitive-indefinite-singular":"neiubituri","dative-definite-genitive-singular":"neiubiturii","dative-genitive-indefinite-plural":"neiubituri","dative-definite-genitive-plural":"neiubiturilor","singular-vocative":"neiubitură","plural-vocative":"neiubiturilor"}},{"word":"neizbândă","pos":"noun","definitions":["failure"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"neizbândă","accusative-definite-nominative":"neizbânda","dative-genitive-indefinite":"neizbânde","dative-definite-genitive":"neizbândei","vocative":"neizbândă"}},{"word":"neizbăvit","pos":"adj","definitions":["unsaved"],"forms":{"feminine-singular":"neizbăvită","masculine-plural":"neizbăviți","feminine-neuter-plural":"neizbăvite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neizbăvit","error-unrecognized-form-feminine-indefinite-singular":"neizbăvită","error-unrecognized-form-indefinite-masculine-plural":"neizbăviți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neizbăvite","definite-error-unrecognized-form-masculine-neuter-singular":"neizbăvitul","definite-error-unrecognized-form-feminine-singular":"neizbăvita","definite-error-unrecognized-form-masculine-plural":"neizbăviții","definite-error-unrecognized-form-feminine-neuter-plural":"neizbăvitele"}},{"word":"neizbăvit","pos":"adv","definitions":["ceaselessly"]},{"word":"neizbutit","pos":"adj","definitions":["unsuccessful"],"forms":{"feminine-singular":"neizbutită","masculine-plural":"neizbutiți","feminine-neuter-plural":"neizbutite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neizbutit","error-unrecognized-form-feminine-indefinite-singular":"neizbutită","error-unrecognized-form-indefinite-masculine-plural":"neizbutiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neizbutite","definite-error-unrecognized-form-masculine-neuter-singular":"neizbutitul","definite-error-unrecognized-form-feminine-singular":"neizbutita","definite-error-unrecognized-form-masculine-plural":"neizbutiții","definite-error-unrecognized-form-feminine-neuter-plural":"neizbutitele"}},{"word":"nejelnică","pos":"noun","definitions":["ground ivy (Glechoma hederacea)"],"forms":{"plural":"nejelnice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nejelnică","accusative-definite-nominative-singular":"nejelnica","accusative-indefinite-nominative-plural":"nejelnice","accusative-definite-nominative-plural":"nejelnicele","dative-genitive-indefinite-singular":"nejelnice","dative-definite-genitive-singular":"nejelnicei","dative-genitive-indefinite-plural":"nejelnice","dative-definite-genitive-plural":"nejelnicelor","singular-vocative":"nejelnică","plural-vocative":"nejelnicelor"}},{"word":"Nejloveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Nejloveanu"}},{"word":"Nejlovelu","pos":"name","definitions":["a village in Rătești, Argeș County, Romania"],"gender":"m"},{"word":"nejudecat","pos":"adj","definitions":["thoughtless"],"pronunciation":"/ˌne.ʒu.deˈkat/","forms":{"feminine-singular":"nejudecată","masculine-plural":"nejudecați","feminine-neuter-plural":"nejudecate","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"nejudecat","error-unrecognized-form-feminine-indefinite-singular":"nejudecată","error-unrecognized-form-indefinite-masculine-plural":"nejudecați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nejudecate","definite-error-unrecognized-form-masculine-neuter-singular":"nejudecatul","definite-error-unrecognized-form-feminine-singular":"nejudecata","definite-error-unrecognized-form-masculine-plural":"nejudecații","definite-error-unrecognized-form-feminine-neuter-plural":"nejudecatele"}},{"word":"nejust","pos":"adj","definitions":["wrongful"],"forms":{"feminine-singular":"nejustă","masculine-plural":"nejuști","feminine-neuter-plural":"nejuste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nejust","error-unrecognized-form-feminine-indefinite-singular":"nejustă","error-unrecognized-form-indefinite-masculine-plural":"nejuști","error-unrecognized-form-feminine-indefinite-neuter-plural":"nejuste","definite-error-unrecognized-form-masculine-neuter-singular":"nejustul","definite-error-unrecognized-form-feminine-singular":"nejusta","definite-error-unrecognized-form-masculine-plural":"nejuștii","definite-error-unrecognized-form-feminine-neuter-plural":"nejustele"}},{"word":"nejustificabil","pos":"adj","definitions":["unjustifiable"],"forms":{"feminine-singular":"nejustificabilă","masculine-plural":"nejustificabili","feminine-neuter-plural":"nejustificabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nejustificabil","error-unrecognized-form-feminine-indefinite-singular":"nejustificabilă","error-unrecognized-form-indefinite-masculine-plural":"nejustificabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nejustificabile","definite-error-unrecognized-form-masculine-neuter-singular":"nejustificabilul","definite-error-unrecognized-form-feminine-singular":"nejustificabila","definite-error-unrecognized-form-masculine-plural":"nejustificabilii","definite-error-unrecognized-form-feminine-neuter-plural":"nejustificabilele"}},{"word":"nejustificat","pos":"adj","definitions":["unjustified"],"forms":{"feminine-singular":"nejustificată","masculine-plural":"nejustificați","feminine-neuter-plural":"nejustificate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nejustificat","error-unrecognized-form-feminine-indefinite-singular":"nejustificată","error-unrecognized-form-indefinite-masculine-plural":"nejustificați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nejustificate","definite-error-unrecognized-form-masculine-neuter-singular":"nejustificatul","definite-error-unrecognized-form-feminine-singular":"nejustificata","definite-error-unrecognized-form-masculine-plural":"nejustificații","definite-error-unrecognized-form-feminine-neuter-plural":"nejustificatele"}},{"word":"nelăcomie","pos":"noun","definitions":["moderation, temperance (in eating)"],"forms":{"plural":"nelăcomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nelăcomie","accusative-definite-nominative-singular":"nelăcomia","accusative-indefinite-nominative-plural":"nelăcomii","accusative-definite-nominative-plural":"nelăcomiile","dative-genitive-indefinite-singular":"nelăcomii","dative-definite-genitive-singular":"nelăcomiei","dative-genitive-indefinite-plural":"nelăcomii","dative-definite-genitive-plural":"nelăcomiilor","singular-vocative":"nelăcomie","plural-vocative":"nelăcomiilor"}},{"word":"nelalocul","pos":"adj","definitions":["improper"],"forms":{"feminine-singular":"nelaloculă","masculine-plural":"nelaloculi","feminine-neuter-plural":"nelalocule","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nelalocul","error-unrecognized-form-feminine-indefinite-singular":"nelaloculă","error-unrecognized-form-indefinite-masculine-plural":"nelaloculi","error-unrecognized-form-feminine-indefinite-neuter-plural":"nelalocule","definite-error-unrecognized-form-masculine-neuter-singular":"nelaloculul","definite-error-unrecognized-form-feminine-singular":"nelalocula","definite-error-unrecognized-form-masculine-plural":"nelaloculii","definite-error-unrecognized-form-feminine-neuter-plural":"nelaloculele"}},{"word":"nelămurire","pos":"noun","definitions":["uncertainty"],"forms":{"plural":"nelămuriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nelămurire","accusative-definite-nominative-singular":"nelămurirea","accusative-indefinite-nominative-plural":"nelămuriri","accusative-definite-nominative-plural":"nelămuririle","dative-genitive-indefinite-singular":"nelămuriri","dative-definite-genitive-singular":"nelămuririi","dative-genitive-indefinite-plural":"nelămuriri","dative-definite-genitive-plural":"nelămuririlor","singular-vocative":"nelămurire","plural-vocative":"nelămuririlor"}},{"word":"nelămurit","pos":"adj","definitions":["uncertain"],"forms":{"feminine-singular":"nelămurită","masculine-plural":"nelămuriți","feminine-neuter-plural":"nelămurite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nelămurit","error-unrecognized-form-feminine-indefinite-singular":"nelămurită","error-unrecognized-form-indefinite-masculine-plural":"nelămuriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nelămurite","definite-error-unrecognized-form-masculine-neuter-singular":"nelămuritul","definite-error-unrecognized-form-feminine-singular":"nelămurita","definite-error-unrecognized-form-masculine-plural":"nelămuriții","definite-error-unrecognized-form-feminine-neuter-plural":"nelămuritele"}},{"word":"nelegal","pos":"adj","definitions":["illegal"],"forms":{"feminine-singular":"nelegală","masculine-plural":"nelegali","feminine-neuter-plural":"nelegale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nelegal","error-unrecognized-form-feminine-indefinite-singular":"nelegală","error-unrecognized-form-indefinite-masculine-plural":"nelegali","error-unrecognized-form-feminine-indefinite-neuter-plural":"nelegale","definite-error-unrecognized-form-masculine-neuter-singular":"nelegalul","definite-error-unrecognized-form-feminine-singular":"nelegala","definite-error-unrecognized-form-masculine-plural":"nelegalii","definite-error-unrecognized-form-feminine-neuter-plural":"nelegalele"}},{"word":"Nelegești","pos":"name","definitions":["a village in Sohodol, Alba County, Romania"],"gender":"m"},{"word":"nelegitim","pos":"adj","definitions":["illegitimate"],"forms":{"feminine-singular":"nelegitimă","masculine-plural":"nelegitimi","feminine-neuter-plural":"nelegitime","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nelegitim","error-unrecognized-form-feminine-indefinite-singular":"nelegitimă","error-unrecognized-form-indefinite-masculine-plural":"nelegitimi","error-unrecognized-form-feminine-indefinite-neuter-plural":"nelegitime","definite-error-unrecognized-form-masculine-neuter-singular":"nelegitimul","definite-error-unrecognized-form-feminine-singular":"nelegitima","definite-error-unrecognized-form-masculine-plural":"nelegitimii","definite-error-unrecognized-form-feminine-neuter-plural":"nelegitimele"}},{"word":"nelegiuire","pos":"noun","definitions":["crime"],"forms":{"plural":"nelegiuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nelegiuire","accusative-definite-nominative-singular":"nelegiuirea","accusative-indefinite-nominative-plural":"nelegiuiri","accusative-definite-nominative-plural":"nelegiuirile","dative-genitive-indefinite-singular":"nelegiuiri","dative-definite-genitive-singular":"nelegiuirii","dative-genitive-indefinite-plural":"nelegiuiri","dative-definite-genitive-plural":"nelegiuirilor","singular-vocative":"nelegiuire","plural-vocative":"nelegiuirilor"}},{"word":"nelegiuit","pos":"adj","definitions":["outlawed"],"forms":{"feminine-singular":"nelegiuită","masculine-plural":"nelegiuiți","feminine-neuter-plural":"nelegiuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nelegiuit","error-unrecognized-form-feminine-indefinite-singular":"nelegiuită","error-unrecognized-form-indefinite-masculine-plural":"nelegiuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nelegiuite","definite-error-unrecognized-form-masculine-neuter-singular":"nelegiuitul","definite-error-unrecognized-form-feminine-singular":"nelegiuita","definite-error-unrecognized-form-masculine-plural":"nelegiuiții","definite-error-unrecognized-form-feminine-neuter-plural":"nelegiuitele"}},{"word":"nelepcică","pos":"noun","definitions":["diminutive of nelepcea"],"forms":{"plural":"nelepcici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"nelepcică","accusative-definite-nominative-singular":"nelepcica","accusative-indefinite-nominative-plural":"nelepcici","accusative-definite-nominative-plural":"nelepcicile","dative-genitive-indefinite-singular":"nelepcici","dative-definite-genitive-singular":"nelepcicii","dative-genitive-indefinite-plural":"nelepcici","dative-definite-genitive-plural":"nelepcicilor","singular-vocative":"nelepcică","plural-vocative":"nelepcicilor"}},{"word":"nelepcuță","pos":"noun","definitions":["diminutive of neleapcă"],"forms":{"plural":"nelepcuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nelepcuță","accusative-definite-nominative-singular":"nelepcuța","accusative-indefinite-nominative-plural":"nelepcuțe","accusative-definite-nominative-plural":"nelepcuțele","dative-genitive-indefinite-singular":"nelepcuțe","dative-definite-genitive-singular":"nelepcuței","dative-genitive-indefinite-plural":"nelepcuțe","dative-definite-genitive-plural":"nelepcuțelor","singular-vocative":"nelepcuță","plural-vocative":"nelepcuțelor"}},{"word":"nelesne","pos":"adv","definitions":["uneasily"]},{"word":"nelimitat","pos":"adj","definitions":["unlimited"],"forms":{"feminine-singular":"nelimitată","masculine-plural":"nelimitați","feminine-neuter-plural":"nelimitate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nelimitat","error-unrecognized-form-feminine-indefinite-singular":"nelimitată","error-unrecognized-form-indefinite-masculine-plural":"nelimitați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nelimitate","definite-error-unrecognized-form-masculine-neuter-singular":"nelimitatul","definite-error-unrecognized-form-feminine-singular":"nelimitata","definite-error-unrecognized-form-masculine-plural":"nelimitații","definite-error-unrecognized-form-feminine-neuter-plural":"nelimitatele"}},{"word":"neliniar","pos":"adj","definitions":["nonlinear"],"pronunciation":"/ˌne.li.niˈar/","forms":{"feminine-singular":"neliniară","masculine-plural":"neliniari","feminine-neuter-plural":"neliniare","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"neliniar","error-unrecognized-form-feminine-indefinite-singular":"neliniară","error-unrecognized-form-indefinite-masculine-plural":"neliniari","error-unrecognized-form-feminine-indefinite-neuter-plural":"neliniare","definite-error-unrecognized-form-masculine-neuter-singular":"neliniarul","definite-error-unrecognized-form-feminine-singular":"neliniara","definite-error-unrecognized-form-masculine-plural":"neliniarii","definite-error-unrecognized-form-feminine-neuter-plural":"neliniarele"}},{"word":"neliniște","pos":"noun","definitions":["restlessness"],"forms":{"plural":"neliniști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neliniște","accusative-definite-nominative-singular":"neliniștea","accusative-indefinite-nominative-plural":"neliniști","accusative-definite-nominative-plural":"neliniștile","dative-genitive-indefinite-singular":"neliniști","dative-definite-genitive-singular":"neliniștii","dative-genitive-indefinite-plural":"neliniști","dative-definite-genitive-plural":"neliniștilor","singular-vocative":"neliniște","plural-vocative":"neliniștilor"}},{"word":"neliniști","pos":"verb","definitions":["to worry"],"forms":{"canonical":"a neliniști 4th conjugation","present-singular-third-person":"neliniștește","participle-past":"neliniștit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a neliniști","gerund":"neliniștind","first-person-indicative-present-singular":"neliniștesc","indicative-present-second-person-singular":"neliniștești","indicative-present-singular-third-person":"neliniștește","first-person-indicative-plural-present":"neliniștim","indicative-plural-present-second-person":"neliniștiți","indicative-plural-present-third-person":"neliniștesc","first-person-imperfect-indicative-singular":"nelinișteam","imperfect-indicative-second-person-singular":"nelinișteai","imperfect-indicative-singular-third-person":"neliniștea","first-person-imperfect-indicative-plural":"nelinișteam","imperfect-indicative-plural-second-person":"nelinișteați","imperfect-indicative-plural-third-person":"nelinișteau","first-person-indicative-perfect-singular":"neliniștii","indicative-perfect-second-person-singular":"neliniștiși","indicative-perfect-singular-third-person":"neliniști","first-person-indicative-perfect-plural":"neliniștirăm","indicative-perfect-plural-second-person":"neliniștirăți","indicative-perfect-plural-third-person":"neliniștiră","first-person-indicative-pluperfect-singular":"neliniștisem","indicative-pluperfect-second-person-singular":"neliniștiseși","indicative-pluperfect-singular-third-person":"neliniștise","first-person-indicative-pluperfect-plural":"neliniștiserăm","indicative-pluperfect-plural-second-person":"neliniștiserăți","indicative-pluperfect-plural-third-person":"neliniștiseră","first-person-present-singular-subjunctive":"să neliniștesc","present-second-person-singular-subjunctive":"să neliniștești","present-singular-subjunctive-third-person":"să neliniștească","first-person-plural-present-subjunctive":"să neliniștim","plural-present-second-person-subjunctive":"să neliniștiți","plural-present-subjunctive-third-person":"să neliniștească","imperative-second-person-singular":"neliniștește","imperative-plural-second-person":"neliniștiți","imperative-negative-second-person-singular":"nu neliniști","imperative-negative-plural-second-person":"nu neliniștiți"}},{"word":"neliniștire","pos":"noun","definitions":["worry"],"forms":{"plural":"neliniștiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neliniștire","accusative-definite-nominative-singular":"neliniștirea","accusative-indefinite-nominative-plural":"neliniștiri","accusative-definite-nominative-plural":"neliniștirile","dative-genitive-indefinite-singular":"neliniștiri","dative-definite-genitive-singular":"neliniștirii","dative-genitive-indefinite-plural":"neliniștiri","dative-definite-genitive-plural":"neliniștirilor","singular-vocative":"neliniștire","plural-vocative":"neliniștirilor"}},{"word":"neliniștit","pos":"adj","definitions":["restless"],"forms":{"feminine-singular":"neliniștită","masculine-plural":"neliniștiți","feminine-neuter-plural":"neliniștite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neliniștit","error-unrecognized-form-feminine-indefinite-singular":"neliniștită","error-unrecognized-form-indefinite-masculine-plural":"neliniștiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neliniștite","definite-error-unrecognized-form-masculine-neuter-singular":"neliniștitul","definite-error-unrecognized-form-feminine-singular":"neliniștita","definite-error-unrecognized-form-masculine-plural":"neliniștiții","definite-error-unrecognized-form-feminine-neuter-plural":"neliniștitele"}}];
@@ -0,0 +1 @@
+export default [{"word":"neliniștitor","pos":"adj","definitions":["upsetting"],"forms":{"feminine-singular":"neliniștitoare","masculine-plural":"neliniștitori","feminine-neuter-plural":"neliniștitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neliniștitor","error-unrecognized-form-feminine-indefinite-singular":"neliniștitoare","error-unrecognized-form-indefinite-masculine-plural":"neliniștitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"neliniștitoare","definite-error-unrecognized-form-masculine-neuter-singular":"neliniștitorul","definite-error-unrecognized-form-feminine-singular":"neliniștitoarea","definite-error-unrecognized-form-masculine-plural":"neliniștitorii","definite-error-unrecognized-form-feminine-neuter-plural":"neliniștitoarele"}},{"word":"nelipit","pos":"adj","definitions":["unbonded"],"forms":{"feminine-singular":"nelipită","masculine-plural":"nelipiți","feminine-neuter-plural":"nelipite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nelipit","error-unrecognized-form-feminine-indefinite-singular":"nelipită","error-unrecognized-form-indefinite-masculine-plural":"nelipiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nelipite","definite-error-unrecognized-form-masculine-neuter-singular":"nelipitul","definite-error-unrecognized-form-feminine-singular":"nelipita","definite-error-unrecognized-form-masculine-plural":"nelipiții","definite-error-unrecognized-form-feminine-neuter-plural":"nelipitele"}},{"word":"nelipsit","pos":"adj","definitions":["omnipresent"],"forms":{"feminine-singular":"nelipsită","masculine-plural":"nelipsiți","feminine-neuter-plural":"nelipsite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nelipsit","error-unrecognized-form-feminine-indefinite-singular":"nelipsită","error-unrecognized-form-indefinite-masculine-plural":"nelipsiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nelipsite","definite-error-unrecognized-form-masculine-neuter-singular":"nelipsitul","definite-error-unrecognized-form-feminine-singular":"nelipsita","definite-error-unrecognized-form-masculine-plural":"nelipsiții","definite-error-unrecognized-form-feminine-neuter-plural":"nelipsitele"}},{"word":"nelipsită","pos":"adj","definitions":["nominative/accusative indefinite feminine singular of nelipsit"],"pronunciation":"/ˌne.lipˈsi.tə/"},{"word":"nelipsite","pos":"adj","definitions":["inflection of nelipsit:","feminine/neuter plural","genitive/dative feminine singular"]},{"word":"nelipsiți","pos":"adj","definitions":["masculine plural of nelipsit"]},{"word":"neloaial","pos":"adj","definitions":["alternative form of neloial"],"forms":{"feminine-singular":"neloaială","masculine-plural":"neloaiali","feminine-neuter-plural":"neloaiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neloaial","error-unrecognized-form-feminine-indefinite-singular":"neloaială","error-unrecognized-form-indefinite-masculine-plural":"neloaiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"neloaiale","definite-error-unrecognized-form-masculine-neuter-singular":"neloaialul","definite-error-unrecognized-form-feminine-singular":"neloaiala","definite-error-unrecognized-form-masculine-plural":"neloaialii","definite-error-unrecognized-form-feminine-neuter-plural":"neloaialele"}},{"word":"nelocuibil","pos":"adj","definitions":["uninhabitable"],"forms":{"feminine-singular":"nelocuibilă","masculine-plural":"nelocuibili","feminine-neuter-plural":"nelocuibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nelocuibil","error-unrecognized-form-feminine-indefinite-singular":"nelocuibilă","error-unrecognized-form-indefinite-masculine-plural":"nelocuibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nelocuibile","definite-error-unrecognized-form-masculine-neuter-singular":"nelocuibilul","definite-error-unrecognized-form-feminine-singular":"nelocuibila","definite-error-unrecognized-form-masculine-plural":"nelocuibilii","definite-error-unrecognized-form-feminine-neuter-plural":"nelocuibilele"}},{"word":"nelocuibilitate","pos":"noun","definitions":["uninhabitability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"nelocuibilitate","accusative-definite-nominative":"nelocuibilitatea","dative-genitive-indefinite":"nelocuibilități","dative-definite-genitive":"nelocuibilității","vocative":"-"}},{"word":"neloial","pos":"adj","definitions":["disloyal"],"forms":{"feminine-singular":"neloială","masculine-plural":"neloiali","feminine-neuter-plural":"neloiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neloial","error-unrecognized-form-feminine-indefinite-singular":"neloială","error-unrecognized-form-indefinite-masculine-plural":"neloiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"neloiale","definite-error-unrecognized-form-masculine-neuter-singular":"neloialul","definite-error-unrecognized-form-feminine-singular":"neloiala","definite-error-unrecognized-form-masculine-plural":"neloialii","definite-error-unrecognized-form-feminine-neuter-plural":"neloialele"}},{"word":"Nelu","pos":"name","definitions":["a diminutive of the male given name Ion, equivalent to English Johnny","a surname"],"gender":"m","forms":{"dative-genitive":"lui Nelu"}},{"word":"nelucrare","pos":"noun","definitions":["inactivity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"nelucrare","accusative-definite-nominative":"nelucrarea","dative-genitive-indefinite":"nelucrari","dative-definite-genitive":"nelucrarii","vocative":"nelucrare"}},{"word":"nelucrat","pos":"adj","definitions":["unlaboured"],"pronunciation":"/ˌne.luˈkrat/","forms":{"feminine-singular":"nelucrată","masculine-plural":"nelucrați","feminine-neuter-plural":"nelucrate","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"nelucrat","error-unrecognized-form-feminine-indefinite-singular":"nelucrată","error-unrecognized-form-indefinite-masculine-plural":"nelucrați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nelucrate","definite-error-unrecognized-form-masculine-neuter-singular":"nelucratul","definite-error-unrecognized-form-feminine-singular":"nelucrata","definite-error-unrecognized-form-masculine-plural":"nelucrații","definite-error-unrecognized-form-feminine-neuter-plural":"nelucratele"}},{"word":"nelume","pos":"noun","definitions":["unworldly"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"nelume","accusative-definite-nominative":"nelumea","dative-genitive-indefinite":"nelumi","dative-definite-genitive":"nelumii","vocative":"nelume"}},{"word":"neluminat","pos":"adj","definitions":["unlit"],"forms":{"feminine-singular":"neluminată","masculine-plural":"neluminați","feminine-neuter-plural":"neluminate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neluminat","error-unrecognized-form-feminine-indefinite-singular":"neluminată","error-unrecognized-form-indefinite-masculine-plural":"neluminați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neluminate","definite-error-unrecognized-form-masculine-neuter-singular":"neluminatul","definite-error-unrecognized-form-feminine-singular":"neluminata","definite-error-unrecognized-form-masculine-plural":"neluminații","definite-error-unrecognized-form-feminine-neuter-plural":"neluminatele"}},{"word":"Neluș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Neluș"}},{"word":"Neluțescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Neluțescu"}},{"word":"nemachiat","pos":"adj","definitions":["without makeup"],"forms":{"feminine-singular":"nemachiată","masculine-plural":"nemachiați","feminine-neuter-plural":"nemachiate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemachiat","error-unrecognized-form-feminine-indefinite-singular":"nemachiată","error-unrecognized-form-indefinite-masculine-plural":"nemachiați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemachiate","definite-error-unrecognized-form-masculine-neuter-singular":"nemachiatul","definite-error-unrecognized-form-feminine-singular":"nemachiata","definite-error-unrecognized-form-masculine-plural":"nemachiații","definite-error-unrecognized-form-feminine-neuter-plural":"nemachiatele"}},{"word":"nemaiauzit","pos":"adj","definitions":["unheard of"],"forms":{"feminine-singular":"nemaiauzită","masculine-plural":"nemaiauziți","feminine-neuter-plural":"nemaiauzite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemaiauzit","error-unrecognized-form-feminine-indefinite-singular":"nemaiauzită","error-unrecognized-form-indefinite-masculine-plural":"nemaiauziți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemaiauzite","definite-error-unrecognized-form-masculine-neuter-singular":"nemaiauzitul","definite-error-unrecognized-form-feminine-singular":"nemaiauzita","definite-error-unrecognized-form-masculine-plural":"nemaiauziții","definite-error-unrecognized-form-feminine-neuter-plural":"nemaiauzitele"}},{"word":"nemaicunoscut","pos":"adj","definitions":["no longer known"],"forms":{"feminine-singular":"nemaicunoscută","masculine-plural":"nemaicunoscuți","feminine-neuter-plural":"nemaicunoscute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemaicunoscut","error-unrecognized-form-feminine-indefinite-singular":"nemaicunoscută","error-unrecognized-form-indefinite-masculine-plural":"nemaicunoscuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemaicunoscute","definite-error-unrecognized-form-masculine-neuter-singular":"nemaicunoscutul","definite-error-unrecognized-form-feminine-singular":"nemaicunoscuta","definite-error-unrecognized-form-masculine-plural":"nemaicunoscuții","definite-error-unrecognized-form-feminine-neuter-plural":"nemaicunoscutele"}},{"word":"nemaiîntâlnit","pos":"adj","definitions":["unheard of"],"forms":{"feminine-singular":"nemaiîntâlnită","masculine-plural":"nemaiîntâlniți","feminine-neuter-plural":"nemaiîntâlnite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemaiîntâlnit","error-unrecognized-form-feminine-indefinite-singular":"nemaiîntâlnită","error-unrecognized-form-indefinite-masculine-plural":"nemaiîntâlniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemaiîntâlnite","definite-error-unrecognized-form-masculine-neuter-singular":"nemaiîntâlnitul","definite-error-unrecognized-form-feminine-singular":"nemaiîntâlnita","definite-error-unrecognized-form-masculine-plural":"nemaiîntâlniții","definite-error-unrecognized-form-feminine-neuter-plural":"nemaiîntâlnitele"}},{"word":"nemaipomenit","pos":"adj","definitions":["which has not yet been mentioned; unprecedented","amazing, extraordinary","colossal, huge, formidable"],"forms":{"feminine-singular":"nemaipomenită","masculine-plural":"nemaipomeniți","feminine-neuter-plural":"nemaipomenite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemaipomenit","error-unrecognized-form-feminine-indefinite-singular":"nemaipomenită","error-unrecognized-form-indefinite-masculine-plural":"nemaipomeniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemaipomenite","definite-error-unrecognized-form-masculine-neuter-singular":"nemaipomenitul","definite-error-unrecognized-form-feminine-singular":"nemaipomenita","definite-error-unrecognized-form-masculine-plural":"nemaipomeniții","definite-error-unrecognized-form-feminine-neuter-plural":"nemaipomenitele"}},{"word":"nemaipomenit","pos":"adv","definitions":["extremely"]},{"word":"nemaivăzut","pos":"adj","definitions":["unseen before"],"forms":{"feminine-singular":"nemaivăzută","masculine-plural":"nemaivăzuți","feminine-neuter-plural":"nemaivăzute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemaivăzut","error-unrecognized-form-feminine-indefinite-singular":"nemaivăzută","error-unrecognized-form-indefinite-masculine-plural":"nemaivăzuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemaivăzute","definite-error-unrecognized-form-masculine-neuter-singular":"nemaivăzutul","definite-error-unrecognized-form-feminine-singular":"nemaivăzuta","definite-error-unrecognized-form-masculine-plural":"nemaivăzuții","definite-error-unrecognized-form-feminine-neuter-plural":"nemaivăzutele"}},{"word":"nemâncare","pos":"noun","definitions":["fasting"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"nemâncare","accusative-definite-nominative":"nemâncarea","dative-genitive-indefinite":"nemâncări","dative-definite-genitive":"nemâncării","vocative":"nemâncare"}},{"word":"nemâncat","pos":"adj","definitions":["hungry"],"forms":{"feminine-singular":"nemâncată","masculine-plural":"nemâncați","feminine-neuter-plural":"nemâncate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemâncat","error-unrecognized-form-feminine-indefinite-singular":"nemâncată","error-unrecognized-form-indefinite-masculine-plural":"nemâncați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemâncate","definite-error-unrecognized-form-masculine-neuter-singular":"nemâncatul","definite-error-unrecognized-form-feminine-singular":"nemâncata","definite-error-unrecognized-form-masculine-plural":"nemâncații","definite-error-unrecognized-form-feminine-neuter-plural":"nemâncatele"}},{"word":"nemândru","pos":"adj","definitions":["unwise","modest"],"forms":{"feminine-singular":"nemândră","masculine-plural":"nemândri","feminine-neuter-plural":"nemândre","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemândru","error-unrecognized-form-feminine-indefinite-singular":"nemândră","error-unrecognized-form-indefinite-masculine-plural":"nemândri","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemândre","definite-error-unrecognized-form-masculine-neuter-singular":"nemândrul","definite-error-unrecognized-form-feminine-singular":"nemândra","definite-error-unrecognized-form-masculine-plural":"nemândrii","definite-error-unrecognized-form-feminine-neuter-plural":"nemândrele"}},{"word":"nemângâiat","pos":"adj","definitions":["inconsolable"],"forms":{"feminine-singular":"nemângâiată","masculine-plural":"nemângâiați","feminine-neuter-plural":"nemângâiate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemângâiat","error-unrecognized-form-feminine-indefinite-singular":"nemângâiată","error-unrecognized-form-indefinite-masculine-plural":"nemângâiați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemângâiate","definite-error-unrecognized-form-masculine-neuter-singular":"nemângâiatul","definite-error-unrecognized-form-feminine-singular":"nemângâiata","definite-error-unrecognized-form-masculine-plural":"nemângâiații","definite-error-unrecognized-form-feminine-neuter-plural":"nemângâiatele"}},{"word":"nemângâiere","pos":"noun","definitions":["lack of consolation"],"forms":{"plural":"nemângâieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nemângâiere","accusative-definite-nominative-singular":"nemângâierea","accusative-indefinite-nominative-plural":"nemângâieri","accusative-definite-nominative-plural":"nemângâierile","dative-genitive-indefinite-singular":"nemângâieri","dative-definite-genitive-singular":"nemângâierii","dative-genitive-indefinite-plural":"nemângâieri","dative-definite-genitive-plural":"nemângâierilor","singular-vocative":"nemângâiere","plural-vocative":"nemângâierilor"}},{"word":"nemânie","pos":"noun","definitions":["lack of anger"],"forms":{"plural":"nemânii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nemânie","accusative-definite-nominative-singular":"nemânia","accusative-indefinite-nominative-plural":"nemânii","accusative-definite-nominative-plural":"nemâniile","dative-genitive-indefinite-singular":"nemânii","dative-definite-genitive-singular":"nemâniei","dative-genitive-indefinite-plural":"nemânii","dative-definite-genitive-plural":"nemâniilor","singular-vocative":"nemânie","plural-vocative":"nemâniilor"}},{"word":"nemânios","pos":"noun","definitions":["a calm person"],"forms":{"plural":"nemânioși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nemânios","accusative-definite-nominative-singular":"nemâniosul","accusative-indefinite-nominative-plural":"nemânioși","accusative-definite-nominative-plural":"nemânioșii","dative-genitive-indefinite-singular":"nemânios","dative-definite-genitive-singular":"nemâniosului","dative-genitive-indefinite-plural":"nemânioși","dative-definite-genitive-plural":"nemânioșilor","singular-vocative":"nemâniosule","plural-vocative":"nemânioșilor"}},{"word":"nemargine","pos":"noun","definitions":["boundlessness"],"forms":{"plural":"nemargini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nemargine","accusative-definite-nominative-singular":"nemarginea","accusative-indefinite-nominative-plural":"nemargini","accusative-definite-nominative-plural":"nemarginile","dative-genitive-indefinite-singular":"nemargini","dative-definite-genitive-singular":"nemarginii","dative-genitive-indefinite-plural":"nemargini","dative-definite-genitive-plural":"nemarginilor","singular-vocative":"nemargine","plural-vocative":"nemarginilor"}},{"word":"nemărginire","pos":"noun","definitions":["boundlessness"],"forms":{"plural":"nemărginiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nemărginire","accusative-definite-nominative-singular":"nemărginirea","accusative-indefinite-nominative-plural":"nemărginiri","accusative-definite-nominative-plural":"nemărginirile","dative-genitive-indefinite-singular":"nemărginiri","dative-definite-genitive-singular":"nemărginirii","dative-genitive-indefinite-plural":"nemărginiri","dative-definite-genitive-plural":"nemărginirilor","singular-vocative":"nemărginire","plural-vocative":"nemărginirilor"}},{"word":"nemărginit","pos":"adj","definitions":["unbounded, limitless (having no bounds, limits)","immense, limitless, infinite (very big, numerous, intense, etc.)"],"examples":[{"ro":"Cartea este consacrată studiului unitar al *-algebrelor de operatori nemărginiți acționînd pe un subspațiu invariant dens din spațiul Hilbert și al -reprezentărilor *-algebrelor generale cu ajutorul acestora.","en":null}],"forms":{"feminine-singular":"nemărginită","masculine-plural":"nemărginiți","feminine-neuter-plural":"nemărginite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemărginit","error-unrecognized-form-feminine-indefinite-singular":"nemărginită","error-unrecognized-form-indefinite-masculine-plural":"nemărginiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemărginite","definite-error-unrecognized-form-masculine-neuter-singular":"nemărginitul","definite-error-unrecognized-form-feminine-singular":"nemărginita","definite-error-unrecognized-form-masculine-plural":"nemărginiții","definite-error-unrecognized-form-feminine-neuter-plural":"nemărginitele"}},{"word":"nemărire","pos":"noun","definitions":["modesty"],"forms":{"plural":"nemăriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nemărire","accusative-definite-nominative-singular":"nemărirea","accusative-indefinite-nominative-plural":"nemăriri","accusative-definite-nominative-plural":"nemăririle","dative-genitive-indefinite-singular":"nemăriri","dative-definite-genitive-singular":"nemăririi","dative-genitive-indefinite-plural":"nemăriri","dative-definite-genitive-plural":"nemăririlor","singular-vocative":"nemărire","plural-vocative":"nemăririlor"}},{"word":"nemărturisit","pos":"adj","definitions":["unconfessed"],"forms":{"feminine-singular":"nemărturisită","masculine-plural":"nemărturisiți","feminine-neuter-plural":"nemărturisite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemărturisit","error-unrecognized-form-feminine-indefinite-singular":"nemărturisită","error-unrecognized-form-indefinite-masculine-plural":"nemărturisiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemărturisite","definite-error-unrecognized-form-masculine-neuter-singular":"nemărturisitul","definite-error-unrecognized-form-feminine-singular":"nemărturisita","definite-error-unrecognized-form-masculine-plural":"nemărturisiții","definite-error-unrecognized-form-feminine-neuter-plural":"nemărturisitele"}},{"word":"nemascat","pos":"adj","definitions":["unmasked"],"pronunciation":"/ˌne.masˈkat/","forms":{"feminine-singular":"nemascată","masculine-plural":"nemascați","feminine-neuter-plural":"nemascate","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemascat","error-unrecognized-form-feminine-indefinite-singular":"nemascată","error-unrecognized-form-indefinite-masculine-plural":"nemascați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemascate","definite-error-unrecognized-form-masculine-neuter-singular":"nemascatul","definite-error-unrecognized-form-feminine-singular":"nemascata","definite-error-unrecognized-form-masculine-plural":"nemascații","definite-error-unrecognized-form-feminine-neuter-plural":"nemascatele"}},{"word":"nemăsurare","pos":"noun","definitions":["immensity"],"forms":{"plural":"nemăsurarări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nemăsurare","accusative-definite-nominative-singular":"nemăsurarea","accusative-indefinite-nominative-plural":"nemăsurarări","accusative-definite-nominative-plural":"nemăsurarările","dative-genitive-indefinite-singular":"nemăsurarări","dative-definite-genitive-singular":"nemăsurarării","dative-genitive-indefinite-plural":"nemăsurarări","dative-definite-genitive-plural":"nemăsurarărilor","singular-vocative":"nemăsurare","plural-vocative":"nemăsurarărilor"}},{"word":"nemăsurat","pos":"adj","definitions":["unmeasured"],"forms":{"feminine-singular":"nemăsurată","masculine-plural":"nemăsurați","feminine-neuter-plural":"nemăsurate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemăsurat","error-unrecognized-form-feminine-indefinite-singular":"nemăsurată","error-unrecognized-form-indefinite-masculine-plural":"nemăsurați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemăsurate","definite-error-unrecognized-form-masculine-neuter-singular":"nemăsuratul","definite-error-unrecognized-form-feminine-singular":"nemăsurata","definite-error-unrecognized-form-masculine-plural":"nemăsurații","definite-error-unrecognized-form-feminine-neuter-plural":"nemăsuratele"}},{"word":"nematelmint","pos":"noun","definitions":["nemathelminth"],"forms":{"plural":"nematelminți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nematelmint","accusative-definite-nominative-singular":"nematelmintul","accusative-indefinite-nominative-plural":"nematelminți","accusative-definite-nominative-plural":"nematelminții","dative-genitive-indefinite-singular":"nematelmint","dative-definite-genitive-singular":"nematelmintului","dative-genitive-indefinite-plural":"nematelminți","dative-definite-genitive-plural":"nematelminților","singular-vocative":"nematelmintule","plural-vocative":"nematelminților"}},{"word":"nematocist","pos":"noun","definitions":["nematocyst"],"forms":{"plural":"nematociste","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nematocist","accusative-definite-nominative-singular":"nematocistul","accusative-indefinite-nominative-plural":"nematociste","accusative-definite-nominative-plural":"nematocistele","dative-genitive-indefinite-singular":"nematocist","dative-definite-genitive-singular":"nematocistului","dative-genitive-indefinite-plural":"nematociste","dative-definite-genitive-plural":"nematocistelor","singular-vocative":"nematocistule","plural-vocative":"nematocistelor"}},{"word":"nematod","pos":"noun","definitions":["nematode"],"forms":{"plural":"nematozi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nematod","accusative-definite-nominative-singular":"nematodul","accusative-indefinite-nominative-plural":"nematozi","accusative-definite-nominative-plural":"nematozii","dative-genitive-indefinite-singular":"nematod","dative-definite-genitive-singular":"nematodului","dative-genitive-indefinite-plural":"nematozi","dative-definite-genitive-plural":"nematozilor","singular-vocative":"nematodule","plural-vocative":"nematozilor"}},{"word":"nemenie","pos":"noun","definitions":["relation"],"forms":{"plural":"nemenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nemenie","accusative-definite-nominative-singular":"nemenia","accusative-indefinite-nominative-plural":"nemenii","accusative-definite-nominative-plural":"nemeniile","dative-genitive-indefinite-singular":"nemenii","dative-definite-genitive-singular":"nemeniei","dative-genitive-indefinite-plural":"nemenii","dative-definite-genitive-plural":"nemeniilor","singular-vocative":"nemenie","plural-vocative":"nemeniilor"}},{"word":"nemeri","pos":"verb","definitions":["alternative form of nimeri"],"forms":{"canonical":"a nemeri 4th conjugation","present-singular-third-person":"nemerește","participle-past":"nemerit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nemeri","gerund":"nemerind","first-person-indicative-present-singular":"nemeresc","indicative-present-second-person-singular":"nemerești","indicative-present-singular-third-person":"nemerește","first-person-indicative-plural-present":"nemerim","indicative-plural-present-second-person":"nemeriți","indicative-plural-present-third-person":"nemeresc","first-person-imperfect-indicative-singular":"nemeream","imperfect-indicative-second-person-singular":"nemereai","imperfect-indicative-singular-third-person":"nemerea","first-person-imperfect-indicative-plural":"nemeream","imperfect-indicative-plural-second-person":"nemereați","imperfect-indicative-plural-third-person":"nemereau","first-person-indicative-perfect-singular":"nemerii","indicative-perfect-second-person-singular":"nemeriși","indicative-perfect-singular-third-person":"nemeri","first-person-indicative-perfect-plural":"nemerirăm","indicative-perfect-plural-second-person":"nemerirăți","indicative-perfect-plural-third-person":"nemeriră","first-person-indicative-pluperfect-singular":"nemerisem","indicative-pluperfect-second-person-singular":"nemeriseși","indicative-pluperfect-singular-third-person":"nemerise","first-person-indicative-pluperfect-plural":"nemeriserăm","indicative-pluperfect-plural-second-person":"nemeriserăți","indicative-pluperfect-plural-third-person":"nemeriseră","first-person-present-singular-subjunctive":"să nemeresc","present-second-person-singular-subjunctive":"să nemerești","present-singular-subjunctive-third-person":"să nemerească","first-person-plural-present-subjunctive":"să nemerim","plural-present-second-person-subjunctive":"să nemeriți","plural-present-subjunctive-third-person":"să nemerească","imperative-second-person-singular":"nemerește","imperative-plural-second-person":"nemeriți","imperative-negative-second-person-singular":"nu nemeri","imperative-negative-plural-second-person":"nu nemeriți"}},{"word":"nemerit","pos":"adj","definitions":["alternative form of nimerit"],"forms":{"feminine-singular":"nemerită","masculine-plural":"nemeriți","feminine-neuter-plural":"nemerite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemerit","error-unrecognized-form-feminine-indefinite-singular":"nemerită","error-unrecognized-form-indefinite-masculine-plural":"nemeriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemerite","definite-error-unrecognized-form-masculine-neuter-singular":"nemeritul","definite-error-unrecognized-form-feminine-singular":"nemerita","definite-error-unrecognized-form-masculine-plural":"nemeriții","definite-error-unrecognized-form-feminine-neuter-plural":"nemeritele"}},{"word":"nemeritat","pos":"adj","definitions":["undeserved"],"pronunciation":"/ˌne.me.riˈtat/","forms":{"feminine-singular":"nemeritată","masculine-plural":"nemeritați","feminine-neuter-plural":"nemeritate","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemeritat","error-unrecognized-form-feminine-indefinite-singular":"nemeritată","error-unrecognized-form-indefinite-masculine-plural":"nemeritați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemeritate","definite-error-unrecognized-form-masculine-neuter-singular":"nemeritatul","definite-error-unrecognized-form-feminine-singular":"nemeritata","definite-error-unrecognized-form-masculine-plural":"nemeritații","definite-error-unrecognized-form-feminine-neuter-plural":"nemeritatele"}},{"word":"nemernic","pos":"adj","definitions":["infamous, ignoble, wicked, base, mean, foul, knavish, villainous, wretched"],"pronunciation":"/neˈmer.nik/","forms":{"feminine-singular":"nemernică","masculine-plural":"nemernici","feminine-neuter-plural":"nemernice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemernic","error-unrecognized-form-feminine-indefinite-singular":"nemernică","error-unrecognized-form-indefinite-masculine-plural":"nemernici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemernice","definite-error-unrecognized-form-masculine-neuter-singular":"nemernicul","definite-error-unrecognized-form-feminine-singular":"nemernica","definite-error-unrecognized-form-masculine-plural":"nemernicii","definite-error-unrecognized-form-feminine-neuter-plural":"nemernicele"}},{"word":"nemernic","pos":"noun","definitions":["rascal, knave, scoundrel, villain"],"pronunciation":"/neˈmer.nik/","forms":{"plural":"nemernici"}},{"word":"nemernică","pos":"noun","definitions":["female equivalent of nemernic"],"forms":{"plural":"nemernice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nemernică","accusative-definite-nominative-singular":"nemernica","accusative-indefinite-nominative-plural":"nemernice","accusative-definite-nominative-plural":"nemernicele","dative-genitive-indefinite-singular":"nemernice","dative-definite-genitive-singular":"nemernicei","dative-genitive-indefinite-plural":"nemernice","dative-definite-genitive-plural":"nemernicelor","singular-vocative":"nemernică","plural-vocative":"nemernicelor"}},{"word":"nemernici","pos":"verb","definitions":["to wander around","to sadden"],"forms":{"canonical":"a nemernici 4th conjugation","present-singular-third-person":"nemernicește","participle-past":"nemernicit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nemernici","gerund":"nemernicind","first-person-indicative-present-singular":"nemernicesc","indicative-present-second-person-singular":"nemernicești","indicative-present-singular-third-person":"nemernicește","first-person-indicative-plural-present":"nemernicim","indicative-plural-present-second-person":"nemerniciți","indicative-plural-present-third-person":"nemernicesc","first-person-imperfect-indicative-singular":"nemerniceam","imperfect-indicative-second-person-singular":"nemerniceai","imperfect-indicative-singular-third-person":"nemernicea","first-person-imperfect-indicative-plural":"nemerniceam","imperfect-indicative-plural-second-person":"nemerniceați","imperfect-indicative-plural-third-person":"nemerniceau","first-person-indicative-perfect-singular":"nemernicii","indicative-perfect-second-person-singular":"nemerniciși","indicative-perfect-singular-third-person":"nemernici","first-person-indicative-perfect-plural":"nemernicirăm","indicative-perfect-plural-second-person":"nemernicirăți","indicative-perfect-plural-third-person":"nemerniciră","first-person-indicative-pluperfect-singular":"nemernicisem","indicative-pluperfect-second-person-singular":"nemerniciseși","indicative-pluperfect-singular-third-person":"nemernicise","first-person-indicative-pluperfect-plural":"nemerniciserăm","indicative-pluperfect-plural-second-person":"nemerniciserăți","indicative-pluperfect-plural-third-person":"nemerniciseră","first-person-present-singular-subjunctive":"să nemernicesc","present-second-person-singular-subjunctive":"să nemernicești","present-singular-subjunctive-third-person":"să nemernicească","first-person-plural-present-subjunctive":"să nemernicim","plural-present-second-person-subjunctive":"să nemerniciți","plural-present-subjunctive-third-person":"să nemernicească","imperative-second-person-singular":"nemernicește","imperative-plural-second-person":"nemerniciți","imperative-negative-second-person-singular":"nu nemernici","imperative-negative-plural-second-person":"nu nemerniciți"}},{"word":"nemernicie","pos":"noun","definitions":["villainy"],"forms":{"plural":"nemernicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nemernicie","accusative-definite-nominative-singular":"nemernicia","accusative-indefinite-nominative-plural":"nemernicii","accusative-definite-nominative-plural":"nemerniciile","dative-genitive-indefinite-singular":"nemernicii","dative-definite-genitive-singular":"nemerniciei","dative-genitive-indefinite-plural":"nemernicii","dative-definite-genitive-plural":"nemerniciilor","singular-vocative":"nemernicie","plural-vocative":"nemerniciilor"}},{"word":"Nemeș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nemeș"}},{"word":"nemeș","pos":"noun","definitions":["small landlord who did not held any noble title","noble"],"forms":{"plural":"nemeși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nemeș","accusative-definite-nominative-singular":"nemeșul","accusative-indefinite-nominative-plural":"nemeși","accusative-definite-nominative-plural":"nemeșii","dative-genitive-indefinite-singular":"nemeș","dative-definite-genitive-singular":"nemeșului","dative-genitive-indefinite-plural":"nemeși","dative-definite-genitive-plural":"nemeșilor","singular-vocative":"nemeșule","plural-vocative":"nemeșilor"}},{"word":"nemeșă","pos":"noun","definitions":["female equivalent of nemeș"],"forms":{"plural":"nemeșe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nemeșă","accusative-definite-nominative-singular":"nemeșa","accusative-indefinite-nominative-plural":"nemeșe","accusative-definite-nominative-plural":"nemeșele","dative-genitive-indefinite-singular":"nemeșe","dative-definite-genitive-singular":"nemeșei","dative-genitive-indefinite-plural":"nemeșe","dative-definite-genitive-plural":"nemeșelor","singular-vocative":"nemeșă","plural-vocative":"nemeșelor"}},{"word":"Nemescu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nemescu"}},{"word":"nemeșel","pos":"adj","definitions":["diminutive of nemeș"],"forms":{"feminine-singular":"nemeșelă","masculine-plural":"nemeșeli","feminine-neuter-plural":"nemeșele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemeșel","error-unrecognized-form-feminine-indefinite-singular":"nemeșelă","error-unrecognized-form-indefinite-masculine-plural":"nemeșeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemeșele","definite-error-unrecognized-form-masculine-neuter-singular":"nemeșelul","definite-error-unrecognized-form-feminine-singular":"nemeșela","definite-error-unrecognized-form-masculine-plural":"nemeșelii","definite-error-unrecognized-form-feminine-neuter-plural":"nemeșelele"}},{"word":"nemeșel","pos":"noun","definitions":["diminutive of -el"],"forms":{"plural":"nemeșei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nemeșel","accusative-definite-nominative-singular":"nemeșelul","accusative-indefinite-nominative-plural":"nemeșei","accusative-definite-nominative-plural":"nemeșeii","dative-genitive-indefinite-singular":"nemeșel","dative-definite-genitive-singular":"nemeșelului","dative-genitive-indefinite-plural":"nemeșei","dative-definite-genitive-plural":"nemeșeilor","singular-vocative":"nemeșelule","plural-vocative":"nemeșeilor"}},{"word":"Nemeșești","pos":"name","definitions":["a village in Margina, Timiș County, Romania"],"gender":"m"},{"word":"Nemeși","pos":"name","definitions":["a village in Vidra, Alba County, Romania"],"gender":"m"},{"word":"nemeși","pos":"noun","definitions":["plural of nemeș"]},{"word":"nemeșie","pos":"noun","definitions":["the class of small landlords"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"nemeșie","accusative-definite-nominative":"nemeșia","dative-genitive-indefinite":"nemeșii","dative-definite-genitive":"nemeșiei","vocative":"nemeșie"}},{"word":"nemeșime","pos":"noun","definitions":["yeomanry"],"forms":{"plural":"nemeșimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nemeșime","accusative-definite-nominative-singular":"nemeșimea","accusative-indefinite-nominative-plural":"nemeșimi","accusative-definite-nominative-plural":"nemeșimile","dative-genitive-indefinite-singular":"nemeșimi","dative-definite-genitive-singular":"nemeșimii","dative-genitive-indefinite-plural":"nemeșimi","dative-definite-genitive-plural":"nemeșimilor","singular-vocative":"nemeșime","plural-vocative":"nemeșimilor"}},{"word":"nemeșoaică","pos":"noun","definitions":["female equivalent of nemeș"],"forms":{"plural":"nemeșoaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nemeșoaică","accusative-definite-nominative-singular":"nemeșoaica","accusative-indefinite-nominative-plural":"nemeșoaice","accusative-definite-nominative-plural":"nemeșoaicele","dative-genitive-indefinite-singular":"nemeșoaice","dative-definite-genitive-singular":"nemeșoaicei","dative-genitive-indefinite-plural":"nemeșoaice","dative-definite-genitive-plural":"nemeșoaicelor","singular-vocative":"nemeșoaică","plural-vocative":"nemeșoaicelor"}},{"word":"nemestnicie","pos":"noun","definitions":["inheritance"],"forms":{"plural":"nemestnicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nemestnicie","accusative-definite-nominative-singular":"nemestnicia","accusative-indefinite-nominative-plural":"nemestnicii","accusative-definite-nominative-plural":"nemestniciile","dative-genitive-indefinite-singular":"nemestnicii","dative-definite-genitive-singular":"nemestniciei","dative-genitive-indefinite-plural":"nemestnicii","dative-definite-genitive-plural":"nemestniciilor","singular-vocative":"nemestnicie","plural-vocative":"nemestniciilor"}},{"word":"Nemeșu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nemeșu"}},{"word":"nemeșug","pos":"noun","definitions":["nobility"],"forms":{"plural":"nemeșuguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nemeșug","accusative-definite-nominative-singular":"nemeșugul","accusative-indefinite-nominative-plural":"nemeșuguri","accusative-definite-nominative-plural":"nemeșugurile","dative-genitive-indefinite-singular":"nemeșug","dative-definite-genitive-singular":"nemeșugului","dative-genitive-indefinite-plural":"nemeșuguri","dative-definite-genitive-plural":"nemeșugurilor","singular-vocative":"nemeșugule","plural-vocative":"nemeșugurilor"}},{"word":"nemet","pos":"noun","definitions":["clan, kin"],"forms":{"plural":"nemeturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nemet","accusative-definite-nominative-singular":"nemetul","accusative-indefinite-nominative-plural":"nemeturi","accusative-definite-nominative-plural":"nemeturile","dative-genitive-indefinite-singular":"nemet","dative-definite-genitive-singular":"nemetului","dative-genitive-indefinite-plural":"nemeturi","dative-definite-genitive-plural":"nemeturilor","singular-vocative":"nemetule","plural-vocative":"nemeturilor"}},{"word":"nemetal","pos":"noun","definitions":["nonmetal"],"forms":{"plural":"nemetale","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nemetal","accusative-definite-nominative-singular":"nemetalul","accusative-indefinite-nominative-plural":"nemetale","accusative-definite-nominative-plural":"nemetalele","dative-genitive-indefinite-singular":"nemetal","dative-definite-genitive-singular":"nemetalului","dative-genitive-indefinite-plural":"nemetale","dative-definite-genitive-plural":"nemetalelor","singular-vocative":"nemetalule","plural-vocative":"nemetalelor"}},{"word":"nemete","pos":"noun","definitions":["obsolete form of nămete"],"forms":{"plural":"nemeți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nemete","accusative-definite-nominative-singular":"nemeteul","accusative-indefinite-nominative-plural":"nemeți","accusative-definite-nominative-plural":"nemeții","dative-genitive-indefinite-singular":"nemete","dative-definite-genitive-singular":"nemeteului","dative-genitive-indefinite-plural":"nemeți","dative-definite-genitive-plural":"nemeților","singular-vocative":"nemeteule","plural-vocative":"nemeților"}},{"word":"nemeți","pos":"verb","definitions":["alternative form of nămeți"],"forms":{"canonical":"a nemeți 4th conjugation","present-singular-third-person":"nemețește","participle-past":"nemețit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nemeți","gerund":"nemețind","first-person-indicative-present-singular":"nemețesc","indicative-present-second-person-singular":"nemețești","indicative-present-singular-third-person":"nemețește","first-person-indicative-plural-present":"nemețim","indicative-plural-present-second-person":"nemețiți","indicative-plural-present-third-person":"nemețesc","first-person-imperfect-indicative-singular":"nemețeam","imperfect-indicative-second-person-singular":"nemețeai","imperfect-indicative-singular-third-person":"nemețea","first-person-imperfect-indicative-plural":"nemețeam","imperfect-indicative-plural-second-person":"nemețeați","imperfect-indicative-plural-third-person":"nemețeau","first-person-indicative-perfect-singular":"nemeții","indicative-perfect-second-person-singular":"nemețiși","indicative-perfect-singular-third-person":"nemeți","first-person-indicative-perfect-plural":"nemețirăm","indicative-perfect-plural-second-person":"nemețirăți","indicative-perfect-plural-third-person":"nemețiră","first-person-indicative-pluperfect-singular":"nemețisem","indicative-pluperfect-second-person-singular":"nemețiseși","indicative-pluperfect-singular-third-person":"nemețise","first-person-indicative-pluperfect-plural":"nemețiserăm","indicative-pluperfect-plural-second-person":"nemețiserăți","indicative-pluperfect-plural-third-person":"nemețiseră","first-person-present-singular-subjunctive":"să nemețesc","present-second-person-singular-subjunctive":"să nemețești","present-singular-subjunctive-third-person":"să nemețească","first-person-plural-present-subjunctive":"să nemețim","plural-present-second-person-subjunctive":"să nemețiți","plural-present-subjunctive-third-person":"să nemețească","imperative-second-person-singular":"nemețește","imperative-plural-second-person":"nemețiți","imperative-negative-second-person-singular":"nu nemeți","imperative-negative-plural-second-person":"nu nemețiți"}},{"word":"nemica","pos":"adv","definitions":["alternative form of nimic"]},{"word":"nemică","pos":"adv","definitions":["alternative form of nimic"]},{"word":"nemijlocit","pos":"adj","definitions":["direct"],"forms":{"feminine-singular":"nemijlocită","masculine-plural":"nemijlociți","feminine-neuter-plural":"nemijlocite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemijlocit","error-unrecognized-form-feminine-indefinite-singular":"nemijlocită","error-unrecognized-form-indefinite-masculine-plural":"nemijlociți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemijlocite","definite-error-unrecognized-form-masculine-neuter-singular":"nemijlocitul","definite-error-unrecognized-form-feminine-singular":"nemijlocita","definite-error-unrecognized-form-masculine-plural":"nemijlociții","definite-error-unrecognized-form-feminine-neuter-plural":"nemijlocitele"}},{"word":"nemilă","pos":"noun","definitions":["cruelty, mercilessness, ruthlessness"],"pronunciation":"[neˈmilə]","forms":{"plural":"nemile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nemilă","accusative-definite-nominative-singular":"nemila","accusative-indefinite-nominative-plural":"nemile","accusative-definite-nominative-plural":"nemilele","dative-genitive-indefinite-singular":"nemile","dative-definite-genitive-singular":"nemilei","dative-genitive-indefinite-plural":"nemile","dative-definite-genitive-plural":"nemilelor","singular-vocative":"nemilă","plural-vocative":"nemilelor"}},{"word":"nemilos","pos":"adj","definitions":["compassionless, ruthless, merciless","incurable"],"pronunciation":"/ˌne.miˈlos/","forms":{"feminine-singular":"nemiloasă","masculine-plural":"nemiloși","feminine-neuter-plural":"nemiloase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemilos","error-unrecognized-form-feminine-indefinite-singular":"nemiloasă","error-unrecognized-form-indefinite-masculine-plural":"nemiloși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemiloase","definite-error-unrecognized-form-masculine-neuter-singular":"nemilosul","definite-error-unrecognized-form-feminine-singular":"nemiloasa","definite-error-unrecognized-form-masculine-plural":"nemiloșii","definite-error-unrecognized-form-feminine-neuter-plural":"nemiloasele"}},{"word":"nemilos","pos":"adv","definitions":["ruthlessly, mercilessly"],"pronunciation":"/ˌne.miˈlos/"},{"word":"nemilosârdie","pos":"noun","definitions":["lack of mercy"],"forms":{"plural":"nemilosârdii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nemilosârdie","accusative-definite-nominative-singular":"nemilosârdia","accusative-indefinite-nominative-plural":"nemilosârdii","accusative-definite-nominative-plural":"nemilosârdiile","dative-genitive-indefinite-singular":"nemilosârdii","dative-definite-genitive-singular":"nemilosârdiei","dative-genitive-indefinite-plural":"nemilosârdii","dative-definite-genitive-plural":"nemilosârdiilor","singular-vocative":"nemilosârdie","plural-vocative":"nemilosârdiilor"}},{"word":"nemilostenie","pos":"noun","definitions":["mercilessness"],"forms":{"plural":"nemilostenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nemilostenie","accusative-definite-nominative-singular":"nemilostenia","accusative-indefinite-nominative-plural":"nemilostenii","accusative-definite-nominative-plural":"nemilosteniile","dative-genitive-indefinite-singular":"nemilostenii","dative-definite-genitive-singular":"nemilosteniei","dative-genitive-indefinite-plural":"nemilostenii","dative-definite-genitive-plural":"nemilosteniilor","singular-vocative":"nemilostenie","plural-vocative":"nemilosteniilor"}},{"word":"nemilostiv","pos":"adj","definitions":["unmerciful"],"forms":{"feminine-singular":"nemilostivă","masculine-plural":"nemilostivi","feminine-neuter-plural":"nemilostive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemilostiv","error-unrecognized-form-feminine-indefinite-singular":"nemilostivă","error-unrecognized-form-indefinite-masculine-plural":"nemilostivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemilostive","definite-error-unrecognized-form-masculine-neuter-singular":"nemilostivul","definite-error-unrecognized-form-feminine-singular":"nemilostiva","definite-error-unrecognized-form-masculine-plural":"nemilostivii","definite-error-unrecognized-form-feminine-neuter-plural":"nemilostivele"}},{"word":"nemilostivire","pos":"noun","definitions":["mercilessness"],"forms":{"plural":"nemilostiviri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nemilostivire","accusative-definite-nominative-singular":"nemilostivirea","accusative-indefinite-nominative-plural":"nemilostiviri","accusative-definite-nominative-plural":"nemilostivirile","dative-genitive-indefinite-singular":"nemilostiviri","dative-definite-genitive-singular":"nemilostivirii","dative-genitive-indefinite-plural":"nemilostiviri","dative-definite-genitive-plural":"nemilostivirilor","singular-vocative":"nemilostivire","plural-vocative":"nemilostivirilor"}},{"word":"nemilostivnicie","pos":"noun","definitions":["pitilessness"],"forms":{"plural":"nemilostivnicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nemilostivnicie","accusative-definite-nominative-singular":"nemilostivnicia","accusative-indefinite-nominative-plural":"nemilostivnicii","accusative-definite-nominative-plural":"nemilostivniciile","dative-genitive-indefinite-singular":"nemilostivnicii","dative-definite-genitive-singular":"nemilostivniciei","dative-genitive-indefinite-plural":"nemilostivnicii","dative-definite-genitive-plural":"nemilostivniciilor","singular-vocative":"nemilostivnicie","plural-vocative":"nemilostivniciilor"}},{"word":"nemiluire","pos":"noun","definitions":["pitilessness"],"forms":{"plural":"nemiluiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nemiluire","accusative-definite-nominative-singular":"nemiluirea","accusative-indefinite-nominative-plural":"nemiluiri","accusative-definite-nominative-plural":"nemiluirile","dative-genitive-indefinite-singular":"nemiluiri","dative-definite-genitive-singular":"nemiluirii","dative-genitive-indefinite-plural":"nemiluiri","dative-definite-genitive-plural":"nemiluirilor","singular-vocative":"nemiluire","plural-vocative":"nemiluirilor"}},{"word":"nemiluit","pos":"adj","definitions":["in large quantity"],"forms":{"feminine-singular":"nemiluită","masculine-plural":"nemiluiți","feminine-neuter-plural":"nemiluite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemiluit","error-unrecognized-form-feminine-indefinite-singular":"nemiluită","error-unrecognized-form-indefinite-masculine-plural":"nemiluiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemiluite","definite-error-unrecognized-form-masculine-neuter-singular":"nemiluitul","definite-error-unrecognized-form-feminine-singular":"nemiluita","definite-error-unrecognized-form-masculine-plural":"nemiluiții","definite-error-unrecognized-form-feminine-neuter-plural":"nemiluitele"}},{"word":"nemintos","pos":"adj","definitions":["stupid"],"forms":{"feminine-singular":"nemintoasă","masculine-plural":"nemintoși","feminine-neuter-plural":"nemintoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemintos","error-unrecognized-form-feminine-indefinite-singular":"nemintoasă","error-unrecognized-form-indefinite-masculine-plural":"nemintoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemintoase","definite-error-unrecognized-form-masculine-neuter-singular":"nemintosul","definite-error-unrecognized-form-feminine-singular":"nemintoasa","definite-error-unrecognized-form-masculine-plural":"nemintoșii","definite-error-unrecognized-form-feminine-neuter-plural":"nemintoasele"}},{"word":"nemintos","pos":"noun","definitions":["a stupid person"],"forms":{"plural":"nemintoși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nemintos","accusative-definite-nominative-singular":"nemintosul","accusative-indefinite-nominative-plural":"nemintoși","accusative-definite-nominative-plural":"nemintoșii","dative-genitive-indefinite-singular":"nemintos","dative-definite-genitive-singular":"nemintosului","dative-genitive-indefinite-plural":"nemintoși","dative-definite-genitive-plural":"nemintoșilor","singular-vocative":"nemintosule","plural-vocative":"nemintoșilor"}},{"word":"nemișcare","pos":"noun","definitions":["immobility"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"nemișcare","accusative-definite-nominative":"nemișcarea","dative-genitive-indefinite":"nemișcari","dative-definite-genitive":"nemișcarii","vocative":"nemișcare"}},{"word":"nemișcat","pos":"adj","definitions":["still, unmoved"],"forms":{"feminine-singular":"nemișcată","masculine-plural":"nemișcați","feminine-neuter-plural":"nemișcate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemișcat","error-unrecognized-form-feminine-indefinite-singular":"nemișcată","error-unrecognized-form-indefinite-masculine-plural":"nemișcați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemișcate","definite-error-unrecognized-form-masculine-neuter-singular":"nemișcatul","definite-error-unrecognized-form-feminine-singular":"nemișcata","definite-error-unrecognized-form-masculine-plural":"nemișcații","definite-error-unrecognized-form-feminine-neuter-plural":"nemișcatele"}},{"word":"nemișcător","pos":"adj","definitions":["immobile"],"forms":{"feminine-singular":"nemișcătoare","masculine-plural":"nemișcători","feminine-neuter-plural":"nemișcătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemișcător","error-unrecognized-form-feminine-indefinite-singular":"nemișcătoare","error-unrecognized-form-indefinite-masculine-plural":"nemișcători","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemișcătoare","definite-error-unrecognized-form-masculine-neuter-singular":"nemișcătorul","definite-error-unrecognized-form-feminine-singular":"nemișcătoarea","definite-error-unrecognized-form-masculine-plural":"nemișcătorii","definite-error-unrecognized-form-feminine-neuter-plural":"nemișcătoarele"}},{"word":"nemoarte","pos":"noun","definitions":["immortality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"nemoarte","accusative-definite-nominative":"nemortea","dative-genitive-indefinite":"nemorți","dative-definite-genitive":"nemorții","vocative":"-"}},{"word":"Nemoianu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nemoianu"}},{"word":"Nemoiu","pos":"name","definitions":["a surname","a village in Amărăști, Vâlcea County, Romania"],"gender":"m"},{"word":"nemoralitate","pos":"noun","definitions":["immorality"],"forms":{"plural":"nemoralități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nemoralitate","accusative-definite-nominative-singular":"nemoralitatea","accusative-indefinite-nominative-plural":"nemoralități","accusative-definite-nominative-plural":"nemoralitățile","dative-genitive-indefinite-singular":"nemoralități","dative-definite-genitive-singular":"nemoralității","dative-genitive-indefinite-plural":"nemoralități","dative-definite-genitive-plural":"nemoralităților","singular-vocative":"nemoralitate","plural-vocative":"nemoralităților"}},{"word":"nemort","pos":"adj","definitions":["undead","undying"],"pronunciation":"[ˈne.mort]","forms":{"feminine-singular":"nemoartă","masculine-plural":"nemorți","feminine-neuter-plural":"nemoarte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemort","error-unrecognized-form-feminine-indefinite-singular":"nemortă","error-unrecognized-form-indefinite-masculine-plural":"nemorți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemorte","definite-error-unrecognized-form-masculine-neuter-singular":"nemortul","definite-error-unrecognized-form-feminine-singular":"nemorta","definite-error-unrecognized-form-masculine-plural":"nemorții","definite-error-unrecognized-form-feminine-neuter-plural":"nemortele"}},{"word":"nemotivat","pos":"adj","definitions":["groundless"],"forms":{"feminine-singular":"nemotivată","masculine-plural":"nemotivați","feminine-neuter-plural":"nemotivate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemotivat","error-unrecognized-form-feminine-indefinite-singular":"nemotivată","error-unrecognized-form-indefinite-masculine-plural":"nemotivați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemotivate","definite-error-unrecognized-form-masculine-neuter-singular":"nemotivatul","definite-error-unrecognized-form-feminine-singular":"nemotivata","definite-error-unrecognized-form-masculine-plural":"nemotivații","definite-error-unrecognized-form-feminine-neuter-plural":"nemotivatele"}},{"word":"nemțălău","pos":"noun","definitions":["German"],"forms":{"plural":"nemțălăi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nemțălău","accusative-definite-nominative-singular":"nemțălăul","accusative-indefinite-nominative-plural":"nemțălăi","accusative-definite-nominative-plural":"nemțălăii","dative-genitive-indefinite-singular":"nemțălău","dative-definite-genitive-singular":"nemțălăului","dative-genitive-indefinite-plural":"nemțălăi","dative-definite-genitive-plural":"nemțălăilor","singular-vocative":"nemțălăule","plural-vocative":"nemțălăilor"}},{"word":"nemțean","pos":"noun","definitions":["native or inhabitant of the Neamț County, Romania (usually male)"],"forms":{"plural":"nemțeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nemțean","accusative-definite-nominative-singular":"nemțeanul","accusative-indefinite-nominative-plural":"nemțeni","accusative-definite-nominative-plural":"nemțenii","dative-genitive-indefinite-singular":"nemțean","dative-definite-genitive-singular":"nemțeanului","dative-genitive-indefinite-plural":"nemțeni","dative-definite-genitive-plural":"nemțenilor","singular-vocative":"nemțeanule","plural-vocative":"nemțenilor"}},{"word":"nemțeană","pos":"noun","definitions":["female equivalent of nemțean"],"forms":{"plural":"nemțene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nemțeană","accusative-definite-nominative-singular":"nemțeana","accusative-indefinite-nominative-plural":"nemțene","accusative-definite-nominative-plural":"nemțenele","dative-genitive-indefinite-singular":"nemțene","dative-definite-genitive-singular":"nemțenei","dative-genitive-indefinite-plural":"nemțene","dative-definite-genitive-plural":"nemțenelor","singular-vocative":"nemțeană","plural-vocative":"nemțenelor"}},{"word":"nemțeancă","pos":"noun","definitions":["female equivalent of nemțean"],"forms":{"plural":"nemțence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nemțeancă","accusative-definite-nominative-singular":"nemțeanca","accusative-indefinite-nominative-plural":"nemțence","accusative-definite-nominative-plural":"nemțencele","dative-genitive-indefinite-singular":"nemțence","dative-definite-genitive-singular":"nemțencei","dative-genitive-indefinite-plural":"nemțence","dative-definite-genitive-plural":"nemțencelor","singular-vocative":"nemțeancă","plural-vocative":"nemțencelor"}},{"word":"Nemțeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Nemțeanu"}},{"word":"nemțească","pos":"adj","definitions":["feminine singular of nemțesc"],"pronunciation":"/nemˈt͡se̯as.kə/"},{"word":"Nemțeni","pos":"name","definitions":["a village in Nemțeni, Hîncești Raion, Moldova","a commune of Hîncești Raion, Moldova"],"gender":"m"},{"word":"nemțesc","pos":"adj","definitions":["German"],"pronunciation":"/nemˈt͡sesk/","forms":{"feminine-singular":"nemțească","plural":"nemțești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemțesc","error-unrecognized-form-feminine-indefinite-singular":"nemțească","error-unrecognized-form-indefinite-masculine-plural":"nemțești","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemțești","definite-error-unrecognized-form-masculine-neuter-singular":"nemțescul","definite-error-unrecognized-form-feminine-singular":"nemțeasca","definite-error-unrecognized-form-masculine-plural":"nemțeștii","definite-error-unrecognized-form-feminine-neuter-plural":"nemțeștile"}},{"word":"nemțește","pos":"adv","definitions":["in a German manner, or in the German language"],"pronunciation":"/nemˈt͡seʃ.te/"},{"word":"nemțește","pos":"noun","definitions":["the German language"],"pronunciation":"/nemˈt͡seʃ.te/","examples":[{"ro":"Ea vorbește nemțește?","en":"Does she speak German?"}]},{"word":"nemțești","pos":"adj","definitions":["masculine plural of nemțesc"],"pronunciation":"/nemˈt͡seʃtʲ/","gender":"m-p"},{"word":"nemți","pos":"verb","definitions":["to become German"],"forms":{"canonical":"a nemți 4th conjugation","present-singular-third-person":"nemțește","participle-past":"nemțit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nemți","gerund":"nemțind","first-person-indicative-present-singular":"nemțesc","indicative-present-second-person-singular":"nemțești","indicative-present-singular-third-person":"nemțește","first-person-indicative-plural-present":"nemțim","indicative-plural-present-second-person":"nemțiți","indicative-plural-present-third-person":"nemțesc","first-person-imperfect-indicative-singular":"nemțeam","imperfect-indicative-second-person-singular":"nemțeai","imperfect-indicative-singular-third-person":"nemțea","first-person-imperfect-indicative-plural":"nemțeam","imperfect-indicative-plural-second-person":"nemțeați","imperfect-indicative-plural-third-person":"nemțeau","first-person-indicative-perfect-singular":"nemții","indicative-perfect-second-person-singular":"nemțiși","indicative-perfect-singular-third-person":"nemți","first-person-indicative-perfect-plural":"nemțirăm","indicative-perfect-plural-second-person":"nemțirăți","indicative-perfect-plural-third-person":"nemțiră","first-person-indicative-pluperfect-singular":"nemțisem","indicative-pluperfect-second-person-singular":"nemțiseși","indicative-pluperfect-singular-third-person":"nemțise","first-person-indicative-pluperfect-plural":"nemțiserăm","indicative-pluperfect-plural-second-person":"nemțiserăți","indicative-pluperfect-plural-third-person":"nemțiseră","first-person-present-singular-subjunctive":"să nemțesc","present-second-person-singular-subjunctive":"să nemțești","present-singular-subjunctive-third-person":"să nemțească","first-person-plural-present-subjunctive":"să nemțim","plural-present-second-person-subjunctive":"să nemțiți","plural-present-subjunctive-third-person":"să nemțească","imperative-second-person-singular":"nemțește","imperative-plural-second-person":"nemțiți","imperative-negative-second-person-singular":"nu nemți","imperative-negative-plural-second-person":"nu nemțiți"}},{"word":"nemție","pos":"noun","definitions":["German (language)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"nemție","accusative-definite-nominative":"nemția","dative-genitive-indefinite":"nemții","dative-definite-genitive":"nemției","vocative":"nemție"}},{"word":"nemțime","pos":"noun","definitions":["collective noun for Germans"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"nemțime","accusative-definite-nominative":"nemțimea","dative-genitive-indefinite":"nemțime","dative-definite-genitive":"nemțimei","vocative":"nemțime"}},{"word":"Nemțișor","pos":"name","definitions":["a village in Vânători-Neamț, Neamț County, Romania"],"gender":"m"},{"word":"nemțișor","pos":"noun","definitions":["diminutive of neamț; small German","larkspur"],"forms":{"plural":"nemțisori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nemțișor","accusative-definite-nominative-singular":"nemțișorul","accusative-indefinite-nominative-plural":"nemțișori","accusative-definite-nominative-plural":"nemțișorii","dative-genitive-indefinite-singular":"nemțișor","dative-definite-genitive-singular":"nemțișorului","dative-genitive-indefinite-plural":"nemțișori","dative-definite-genitive-plural":"nemțișorilor","singular-vocative":"nemțișorule","plural-vocative":"nemțișorilor"}},{"word":"nemțoaică","pos":"noun","definitions":["female equivalent of neamț"],"forms":{"plural":"nemțoaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nemțoaică","accusative-definite-nominative-singular":"nemțoaica","accusative-indefinite-nominative-plural":"nemțoaice","accusative-definite-nominative-plural":"nemțoaicele","dative-genitive-indefinite-singular":"nemțoaice","dative-definite-genitive-singular":"nemțoaicei","dative-genitive-indefinite-plural":"nemțoaice","dative-definite-genitive-plural":"nemțoaicelor","singular-vocative":"nemțoaică","plural-vocative":"nemțoaicelor"}},{"word":"nemțoaicelor","pos":"noun","definitions":["definite genitive/dative plural of nemțoaică"]},{"word":"nemțofil","pos":"adj","definitions":["Germanophile"],"forms":{"feminine-singular":"nemțofilă","masculine-plural":"nemțofili","feminine-neuter-plural":"nemțofile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemțofil","error-unrecognized-form-feminine-indefinite-singular":"nemțofilă","error-unrecognized-form-indefinite-masculine-plural":"nemțofili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemțofile","definite-error-unrecognized-form-masculine-neuter-singular":"nemțofilul","definite-error-unrecognized-form-feminine-singular":"nemțofila","definite-error-unrecognized-form-masculine-plural":"nemțofilii","definite-error-unrecognized-form-feminine-neuter-plural":"nemțofilele"}},{"word":"nemțofil","pos":"noun","definitions":["Germanophile"],"forms":{"plural":"nemțofili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nemțofil","accusative-definite-nominative-singular":"nemțofilul","accusative-indefinite-nominative-plural":"nemțofili","accusative-definite-nominative-plural":"nemțofilii","dative-genitive-indefinite-singular":"nemțofil","dative-definite-genitive-singular":"nemțofilului","dative-genitive-indefinite-plural":"nemțofili","dative-definite-genitive-plural":"nemțofililor","singular-vocative":"nemțofilule","plural-vocative":"nemțofililor"}},{"word":"nemțofilă","pos":"noun","definitions":["female equivalent of nemțofil"],"forms":{"plural":"nemțofile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nemțofilă","accusative-definite-nominative-singular":"nemțofila","accusative-indefinite-nominative-plural":"nemțofile","accusative-definite-nominative-plural":"nemțofilele","dative-genitive-indefinite-singular":"nemțofile","dative-definite-genitive-singular":"nemțofilei","dative-genitive-indefinite-plural":"nemțofile","dative-definite-genitive-plural":"nemțofilelor","singular-vocative":"nemțofilă","plural-vocative":"nemțofilelor"}},{"word":"Nemțoi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nemțoi"}},{"word":"nemțoi","pos":"noun","definitions":["augmentative of neamț"],"forms":{"plural":"nemțoi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nemțoi","accusative-definite-nominative-singular":"nemțoiul","accusative-indefinite-nominative-plural":"nemțoi","accusative-definite-nominative-plural":"nemțoii","dative-genitive-indefinite-singular":"nemțoi","dative-definite-genitive-singular":"nemțoiului","dative-genitive-indefinite-plural":"nemțoi","dative-definite-genitive-plural":"nemțoilor","singular-vocative":"nemțoiule","plural-vocative":"nemțoilor"}},{"word":"nemțoicuță","pos":"noun","definitions":["diminutive of nemțoaică; small German woman"],"forms":{"plural":"nemțoicuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nemțoicuță","accusative-definite-nominative-singular":"nemțoicuța","accusative-indefinite-nominative-plural":"nemțoicuțe","accusative-definite-nominative-plural":"nemțoicuțele","dative-genitive-indefinite-singular":"nemțoicuțe","dative-definite-genitive-singular":"nemțoicuței","dative-genitive-indefinite-plural":"nemțoicuțe","dative-definite-genitive-plural":"nemțoicuțelor","singular-vocative":"nemțoicuță","plural-vocative":"nemțoicuțelor"}},{"word":"Nemțoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nemțoiu"}},{"word":"Nemțuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nemțuț"}},{"word":"nemulțămi","pos":"verb","definitions":["alternative form of nemulțumi"],"forms":{"canonical":"a nemulțămi 4th conjugation","present-singular-third-person":"nemulțămește","participle-past":"nemulțămit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nemulțămi","gerund":"nemulțămind","first-person-indicative-present-singular":"nemulțămesc","indicative-present-second-person-singular":"nemulțămești","indicative-present-singular-third-person":"nemulțămește","first-person-indicative-plural-present":"nemulțămim","indicative-plural-present-second-person":"nemulțămiți","indicative-plural-present-third-person":"nemulțămesc","first-person-imperfect-indicative-singular":"nemulțămeam","imperfect-indicative-second-person-singular":"nemulțămeai","imperfect-indicative-singular-third-person":"nemulțămea","first-person-imperfect-indicative-plural":"nemulțămeam","imperfect-indicative-plural-second-person":"nemulțămeați","imperfect-indicative-plural-third-person":"nemulțămeau","first-person-indicative-perfect-singular":"nemulțămii","indicative-perfect-second-person-singular":"nemulțămiși","indicative-perfect-singular-third-person":"nemulțămi","first-person-indicative-perfect-plural":"nemulțămirăm","indicative-perfect-plural-second-person":"nemulțămirăți","indicative-perfect-plural-third-person":"nemulțămiră","first-person-indicative-pluperfect-singular":"nemulțămisem","indicative-pluperfect-second-person-singular":"nemulțămiseși","indicative-pluperfect-singular-third-person":"nemulțămise","first-person-indicative-pluperfect-plural":"nemulțămiserăm","indicative-pluperfect-plural-second-person":"nemulțămiserăți","indicative-pluperfect-plural-third-person":"nemulțămiseră","first-person-present-singular-subjunctive":"să nemulțămesc","present-second-person-singular-subjunctive":"să nemulțămești","present-singular-subjunctive-third-person":"să nemulțămească","first-person-plural-present-subjunctive":"să nemulțămim","plural-present-second-person-subjunctive":"să nemulțămiți","plural-present-subjunctive-third-person":"să nemulțămească","imperative-second-person-singular":"nemulțămește","imperative-plural-second-person":"nemulțămiți","imperative-negative-second-person-singular":"nu nemulțămi","imperative-negative-plural-second-person":"nu nemulțămiți"}},{"word":"nemulțămire","pos":"noun","definitions":["alternative form of nemulțumire"],"forms":{"plural":"nemulțămiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nemulțămire","accusative-definite-nominative-singular":"nemulțămirea","accusative-indefinite-nominative-plural":"nemulțămiri","accusative-definite-nominative-plural":"nemulțămirile","dative-genitive-indefinite-singular":"nemulțămiri","dative-definite-genitive-singular":"nemulțămirii","dative-genitive-indefinite-plural":"nemulțămiri","dative-definite-genitive-plural":"nemulțămirilor","singular-vocative":"nemulțămire","plural-vocative":"nemulțămirilor"}},{"word":"nemulțămit","pos":"adj","definitions":["alternative form of nemulțumit"],"forms":{"feminine-singular":"nemulțămită","masculine-plural":"nemulțămiți","feminine-neuter-plural":"nemulțămite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemulțămit","error-unrecognized-form-feminine-indefinite-singular":"nemulțămită","error-unrecognized-form-indefinite-masculine-plural":"nemulțămiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemulțămite","definite-error-unrecognized-form-masculine-neuter-singular":"nemulțămitul","definite-error-unrecognized-form-feminine-singular":"nemulțămita","definite-error-unrecognized-form-masculine-plural":"nemulțămiții","definite-error-unrecognized-form-feminine-neuter-plural":"nemulțămitele"}},{"word":"nemulțămitor","pos":"adj","definitions":["alternative form of nemulțumitor"],"forms":{"feminine-singular":"nemulțămitoare","masculine-plural":"nemulțămitori","feminine-neuter-plural":"nemulțămitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemulțămitor","error-unrecognized-form-feminine-indefinite-singular":"nemulțămitoare","error-unrecognized-form-indefinite-masculine-plural":"nemulțămitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemulțămitoare","definite-error-unrecognized-form-masculine-neuter-singular":"nemulțămitorul","definite-error-unrecognized-form-feminine-singular":"nemulțămitoarea","definite-error-unrecognized-form-masculine-plural":"nemulțămitorii","definite-error-unrecognized-form-feminine-neuter-plural":"nemulțămitoarele"}},{"word":"nemulțumi","pos":"verb","definitions":["to discontent, to dissatisfy"],"forms":{"canonical":"a nemulțumi 4th conjugation","present-singular-third-person":"nemulțumește","participle-past":"nemulțumit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nemulțumi","gerund":"nemulțumind","first-person-indicative-present-singular":"nemulțumesc","indicative-present-second-person-singular":"nemulțumești","indicative-present-singular-third-person":"nemulțumește","first-person-indicative-plural-present":"nemulțumim","indicative-plural-present-second-person":"nemulțumiți","indicative-plural-present-third-person":"nemulțumesc","first-person-imperfect-indicative-singular":"nemulțumeam","imperfect-indicative-second-person-singular":"nemulțumeai","imperfect-indicative-singular-third-person":"nemulțumea","first-person-imperfect-indicative-plural":"nemulțumeam","imperfect-indicative-plural-second-person":"nemulțumeați","imperfect-indicative-plural-third-person":"nemulțumeau","first-person-indicative-perfect-singular":"nemulțumii","indicative-perfect-second-person-singular":"nemulțumiși","indicative-perfect-singular-third-person":"nemulțumi","first-person-indicative-perfect-plural":"nemulțumirăm","indicative-perfect-plural-second-person":"nemulțumirăți","indicative-perfect-plural-third-person":"nemulțumiră","first-person-indicative-pluperfect-singular":"nemulțumisem","indicative-pluperfect-second-person-singular":"nemulțumiseși","indicative-pluperfect-singular-third-person":"nemulțumise","first-person-indicative-pluperfect-plural":"nemulțumiserăm","indicative-pluperfect-plural-second-person":"nemulțumiserăți","indicative-pluperfect-plural-third-person":"nemulțumiseră","first-person-present-singular-subjunctive":"să nemulțumesc","present-second-person-singular-subjunctive":"să nemulțumești","present-singular-subjunctive-third-person":"să nemulțumească","first-person-plural-present-subjunctive":"să nemulțumim","plural-present-second-person-subjunctive":"să nemulțumiți","plural-present-subjunctive-third-person":"să nemulțumească","imperative-second-person-singular":"nemulțumește","imperative-plural-second-person":"nemulțumiți","imperative-negative-second-person-singular":"nu nemulțumi","imperative-negative-plural-second-person":"nu nemulțumiți"}},{"word":"nemulțumire","pos":"noun","definitions":["dissatisfaction"],"forms":{"plural":"nemulțumiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nemulțumire","accusative-definite-nominative-singular":"nemulțumirea","accusative-indefinite-nominative-plural":"nemulțumiri","accusative-definite-nominative-plural":"nemulțumirile","dative-genitive-indefinite-singular":"nemulțumiri","dative-definite-genitive-singular":"nemulțumirii","dative-genitive-indefinite-plural":"nemulțumiri","dative-definite-genitive-plural":"nemulțumirilor","singular-vocative":"nemulțumire","plural-vocative":"nemulțumirilor"}},{"word":"nemulțumit","pos":"adj","definitions":["unhappy"],"forms":{"feminine-singular":"nemulțumită","masculine-plural":"nemulțumiți","feminine-neuter-plural":"nemulțumite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemulțumit","error-unrecognized-form-feminine-indefinite-singular":"nemulțumită","error-unrecognized-form-indefinite-masculine-plural":"nemulțumiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemulțumite","definite-error-unrecognized-form-masculine-neuter-singular":"nemulțumitul","definite-error-unrecognized-form-feminine-singular":"nemulțumita","definite-error-unrecognized-form-masculine-plural":"nemulțumiții","definite-error-unrecognized-form-feminine-neuter-plural":"nemulțumitele"}},{"word":"nemulțumită","pos":"adj","definitions":["feminine of nemulțumit"],"pronunciation":"/ne.mul.t͡suˈmi.tə/"},{"word":"nemulțumitor","pos":"adj","definitions":["ungrateful"],"forms":{"feminine-singular":"nemulțumitoare","masculine-plural":"nemulțumitori","feminine-neuter-plural":"nemulțumitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemulțumitor","error-unrecognized-form-feminine-indefinite-singular":"nemulțumitoare","error-unrecognized-form-indefinite-masculine-plural":"nemulțumitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemulțumitoare","definite-error-unrecognized-form-masculine-neuter-singular":"nemulțumitorul","definite-error-unrecognized-form-feminine-singular":"nemulțumitoarea","definite-error-unrecognized-form-masculine-plural":"nemulțumitorii","definite-error-unrecognized-form-feminine-neuter-plural":"nemulțumitoarele"}},{"word":"nemulțumitului i se ia darul","pos":"proverb","definitions":["take it or leave it, beggars can't be choosers"]},{"word":"nemuri","pos":"verb","definitions":["to become immortal"],"forms":{"canonical":"a nemuri 4th conjugation","present-singular-third-person":"nemurește","participle-past":"nemurit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nemuri","gerund":"nemurind","first-person-indicative-present-singular":"nemuresc","indicative-present-second-person-singular":"nemurești","indicative-present-singular-third-person":"nemurește","first-person-indicative-plural-present":"nemurim","indicative-plural-present-second-person":"nemuriți","indicative-plural-present-third-person":"nemuresc","first-person-imperfect-indicative-singular":"nemuream","imperfect-indicative-second-person-singular":"nemureai","imperfect-indicative-singular-third-person":"nemurea","first-person-imperfect-indicative-plural":"nemuream","imperfect-indicative-plural-second-person":"nemureați","imperfect-indicative-plural-third-person":"nemureau","first-person-indicative-perfect-singular":"nemurii","indicative-perfect-second-person-singular":"nemuriși","indicative-perfect-singular-third-person":"nemuri","first-person-indicative-perfect-plural":"nemurirăm","indicative-perfect-plural-second-person":"nemurirăți","indicative-perfect-plural-third-person":"nemuriră","first-person-indicative-pluperfect-singular":"nemurisem","indicative-pluperfect-second-person-singular":"nemuriseși","indicative-pluperfect-singular-third-person":"nemurise","first-person-indicative-pluperfect-plural":"nemuriserăm","indicative-pluperfect-plural-second-person":"nemuriserăți","indicative-pluperfect-plural-third-person":"nemuriseră","first-person-present-singular-subjunctive":"să nemuresc","present-second-person-singular-subjunctive":"să nemurești","present-singular-subjunctive-third-person":"să nemurească","first-person-plural-present-subjunctive":"să nemurim","plural-present-second-person-subjunctive":"să nemuriți","plural-present-subjunctive-third-person":"să nemurească","imperative-second-person-singular":"nemurește","imperative-plural-second-person":"nemuriți","imperative-negative-second-person-singular":"nu nemuri","imperative-negative-plural-second-person":"nu nemuriți"}},{"word":"nemurire","pos":"noun","definitions":["immortality"],"forms":{"plural":"nemuriri"}},{"word":"nemuritoare","pos":"noun","definitions":["female equivalent of nemuritor"],"forms":{"plural":"nemuritoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"nemuritoare","accusative-definite-nominative-singular":"nemuritoarea","accusative-indefinite-nominative-plural":"nemuritoare","accusative-definite-nominative-plural":"nemuritoarele","dative-genitive-indefinite-singular":"nemuritoare","dative-definite-genitive-singular":"nemuritoarei","dative-genitive-indefinite-plural":"nemuritoare","dative-definite-genitive-plural":"nemuritoarelor","singular-vocative":"nemuritoare","plural-vocative":"nemuritoarelor"}},{"word":"nemuritor","pos":"adj","definitions":["immortal, deathless, undying, eternal"],"pronunciation":"/ˌne.mu.riˈtor/","forms":{"feminine-singular":"nemuritoare","masculine-plural":"nemuritori","feminine-neuter-plural":"nemuritoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nemuritor","error-unrecognized-form-feminine-indefinite-singular":"nemuritoare","error-unrecognized-form-indefinite-masculine-plural":"nemuritori","error-unrecognized-form-feminine-indefinite-neuter-plural":"nemuritoare","definite-error-unrecognized-form-masculine-neuter-singular":"nemuritorul","definite-error-unrecognized-form-feminine-singular":"nemuritoarea","definite-error-unrecognized-form-masculine-plural":"nemuritorii","definite-error-unrecognized-form-feminine-neuter-plural":"nemuritoarele"}},{"word":"nemuritorie","pos":"noun","definitions":["immortality"],"forms":{"plural":"nemuritorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nemuritorie","accusative-definite-nominative-singular":"nemuritoria","accusative-indefinite-nominative-plural":"nemuritorii","accusative-definite-nominative-plural":"nemuritoriile","dative-genitive-indefinite-singular":"nemuritorii","dative-definite-genitive-singular":"nemuritoriei","dative-genitive-indefinite-plural":"nemuritorii","dative-definite-genitive-plural":"nemuritoriilor","singular-vocative":"nemuritorie","plural-vocative":"nemuritoriilor"}},{"word":"nemuț","pos":"noun","definitions":["diminutive of neam"],"forms":{"plural":"nemuțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nemuț","accusative-definite-nominative-singular":"nemuțul","accusative-indefinite-nominative-plural":"nemuțuri","accusative-definite-nominative-plural":"nemuțurile","dative-genitive-indefinite-singular":"nemuț","dative-definite-genitive-singular":"nemuțului","dative-genitive-indefinite-plural":"nemuțuri","dative-definite-genitive-plural":"nemuțurilor","singular-vocative":"nemuțule","plural-vocative":"nemuțurilor"}},{"word":"nemutat","pos":"noun","definitions":["staying unmoved"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nemutat","accusative-definite-nominative":"nemutatul","dative-genitive-indefinite":"nemutat","dative-definite-genitive":"nemutatului","vocative":"nemutatule"}},{"word":"nemzet","pos":"noun","definitions":["nation"],"forms":{"plural":"nemzeturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nemzet","accusative-definite-nominative-singular":"nemzetul","accusative-indefinite-nominative-plural":"nemzeturi","accusative-definite-nominative-plural":"nemzeturile","dative-genitive-indefinite-singular":"nemzet","dative-definite-genitive-singular":"nemzetului","dative-genitive-indefinite-plural":"nemzeturi","dative-definite-genitive-plural":"nemzeturilor","singular-vocative":"nemzetule","plural-vocative":"nemzeturilor"}},{"word":"nenărăvie","pos":"noun","definitions":["animosity"],"forms":{"plural":"nenărăvii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nenărăvie","accusative-definite-nominative-singular":"nenărăvia","accusative-indefinite-nominative-plural":"nenărăvii","accusative-definite-nominative-plural":"nenărăviile","dative-genitive-indefinite-singular":"nenărăvii","dative-definite-genitive-singular":"nenărăviei","dative-genitive-indefinite-plural":"nenărăvii","dative-definite-genitive-plural":"nenărăviilor","singular-vocative":"nenărăvie","plural-vocative":"nenărăviilor"}},{"word":"nenatural","pos":"adj","definitions":["unnatural"],"forms":{"feminine-singular":"nenaturală","masculine-plural":"nenaturali","feminine-neuter-plural":"nenaturale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nenatural","error-unrecognized-form-feminine-indefinite-singular":"nenaturală","error-unrecognized-form-indefinite-masculine-plural":"nenaturali","error-unrecognized-form-feminine-indefinite-neuter-plural":"nenaturale","definite-error-unrecognized-form-masculine-neuter-singular":"nenaturalul","definite-error-unrecognized-form-feminine-singular":"nenaturala","definite-error-unrecognized-form-masculine-plural":"nenaturalii","definite-error-unrecognized-form-feminine-neuter-plural":"nenaturalele"}},{"word":"nenavigabil","pos":"adj","definitions":["not navigable"],"forms":{"feminine-singular":"nenavigabilă","masculine-plural":"nenavigabili","feminine-neuter-plural":"nenavigabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nenavigabil","error-unrecognized-form-feminine-indefinite-singular":"nenavigabilă","error-unrecognized-form-indefinite-masculine-plural":"nenavigabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nenavigabile","definite-error-unrecognized-form-masculine-neuter-singular":"nenavigabilul","definite-error-unrecognized-form-feminine-singular":"nenavigabila","definite-error-unrecognized-form-masculine-plural":"nenavigabilii","definite-error-unrecognized-form-feminine-neuter-plural":"nenavigabilele"}},{"word":"nenavistie","pos":"noun","definitions":["hate"],"forms":{"plural":"nenavistii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nenavistie","accusative-definite-nominative-singular":"nenavistia","accusative-indefinite-nominative-plural":"nenavistii","accusative-definite-nominative-plural":"nenavistiile","dative-genitive-indefinite-singular":"nenavistii","dative-definite-genitive-singular":"nenavistiei","dative-genitive-indefinite-plural":"nenavistii","dative-definite-genitive-plural":"nenavistiilor","singular-vocative":"nenavistie","plural-vocative":"nenavistiilor"}},{"word":"nencetat","pos":"adj","definitions":["obsolete form of neîncetat"],"forms":{"feminine-singular":"nencetată","masculine-plural":"nencetați","feminine-neuter-plural":"nencetate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nencetat","error-unrecognized-form-feminine-indefinite-singular":"nencetată","error-unrecognized-form-indefinite-masculine-plural":"nencetați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nencetate","definite-error-unrecognized-form-masculine-neuter-singular":"nencetatul","definite-error-unrecognized-form-feminine-singular":"nencetata","definite-error-unrecognized-form-masculine-plural":"nencetații","definite-error-unrecognized-form-feminine-neuter-plural":"nencetatele"}},{"word":"Nenciu","pos":"name","definitions":["a village in Vernești, Buzău County, Romania","a surname"],"gender":"m"},{"word":"Nenciulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nenciulescu"}},{"word":"Nenciulești","pos":"name","definitions":["a village in Merei, Buzău County, Romania","a commune of Teleorman County, Romania","a village in Nenciulești, Teleorman County, Romania","a village in Tetoiu, Vâlcea County, Romania"],"gender":"m"},{"word":"nenduplecat","pos":"adj","definitions":["obsolete form of neînduplecat"],"forms":{"feminine-singular":"nenduplecată","masculine-plural":"nenduplecați","feminine-neuter-plural":"nenduplecate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nenduplecat","error-unrecognized-form-feminine-indefinite-singular":"nenduplecată","error-unrecognized-form-indefinite-masculine-plural":"nenduplecați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nenduplecate","definite-error-unrecognized-form-masculine-neuter-singular":"nenduplecatul","definite-error-unrecognized-form-feminine-singular":"nenduplecata","definite-error-unrecognized-form-masculine-plural":"nenduplecații","definite-error-unrecognized-form-feminine-neuter-plural":"nenduplecatele"}},{"word":"nendurat","pos":"adj","definitions":["obsolete form of neîndurat"],"forms":{"feminine-singular":"nendurată","masculine-plural":"nendurați","feminine-neuter-plural":"nendurate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nendurat","error-unrecognized-form-feminine-indefinite-singular":"nendurată","error-unrecognized-form-indefinite-masculine-plural":"nendurați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nendurate","definite-error-unrecognized-form-masculine-neuter-singular":"nenduratul","definite-error-unrecognized-form-feminine-singular":"nendurata","definite-error-unrecognized-form-masculine-plural":"nendurații","definite-error-unrecognized-form-feminine-neuter-plural":"nenduratele"}},{"word":"nene","pos":"noun","definitions":["Term used by children or young people to address an older man, especially an uncle.","Term to address someone used in general to express disapproval, or surprise, sometimes satisfaction, etc."],"forms":{"alternative":"nea"}},{"word":"neneacă","pos":"noun","definitions":["mother"],"forms":{"plural":"neneci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neneacă","accusative-definite-nominative-singular":"neneaca","accusative-indefinite-nominative-plural":"nenece","accusative-definite-nominative-plural":"nenecele","dative-genitive-indefinite-singular":"nenece","dative-definite-genitive-singular":"nenecei","dative-genitive-indefinite-plural":"nenece","dative-definite-genitive-plural":"nenecelor","singular-vocative":"neneacă","plural-vocative":"nenecelor"}},{"word":"nenecuță","pos":"noun","definitions":["diminutive of neneacă"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nenecuță","accusative-definite-nominative-singular":"nenecuța","accusative-indefinite-nominative-plural":"nenecuțe","accusative-definite-nominative-plural":"nenecuțele","dative-genitive-indefinite-singular":"nenecuțe","dative-definite-genitive-singular":"nenecuței","dative-genitive-indefinite-plural":"nenecuțe","dative-definite-genitive-plural":"nenecuțelor","singular-vocative":"nenecuță","plural-vocative":"nenecuțelor"}},{"word":"nenegativ","pos":"adj","definitions":["nonnegative (both numbers as well as functions)"],"examples":[{"ro":"Fie K(t,s) o funcție nenegativă, definită și integrabilă pe D#61;#91;0,1#93;#92;times#91;0,1#93; cu proprietatea că\n#92;iint#92;limits#95;#123;D#92;#59;#92;#59;#125;K(t,s)dtds#61;1","en":"Let K(t,s) be a nonnegative, definite and integrable function on D=[0,1]×[0,1] with the property that\n∬ limits _(D;;)K(t,s)dtds=1"}],"forms":{"feminine-singular":"nenegativă","masculine-plural":"nenegativi","feminine-neuter-plural":"nenegative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nenegativ","error-unrecognized-form-feminine-indefinite-singular":"nenegativă","error-unrecognized-form-indefinite-masculine-plural":"nenegativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"nenegative","definite-error-unrecognized-form-masculine-neuter-singular":"nenegativul","definite-error-unrecognized-form-feminine-singular":"nenegativa","definite-error-unrecognized-form-masculine-plural":"nenegativii","definite-error-unrecognized-form-feminine-neuter-plural":"nenegativele"}},{"word":"nenemerire","pos":"noun","definitions":["failure"],"forms":{"plural":"nenemeriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nenemerire","accusative-definite-nominative-singular":"nenemerirea","accusative-indefinite-nominative-plural":"nenemeriri","accusative-definite-nominative-plural":"nenemeririle","dative-genitive-indefinite-singular":"nenemeriri","dative-definite-genitive-singular":"nenemeririi","dative-genitive-indefinite-plural":"nenemeriri","dative-definite-genitive-plural":"nenemeririlor","singular-vocative":"nenemerire","plural-vocative":"nenemeririlor"}},{"word":"Neneștean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Neneștean"}},{"word":"nengrijire","pos":"noun","definitions":["obsolete form of neîngrijire"],"forms":{"plural":"nengrijiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nengrijire","accusative-definite-nominative-singular":"nengrijirea","accusative-indefinite-nominative-plural":"nengrijiri","accusative-definite-nominative-plural":"nengrijirile","dative-genitive-indefinite-singular":"nengrijiri","dative-definite-genitive-singular":"nengrijirii","dative-genitive-indefinite-plural":"nengrijiri","dative-definite-genitive-plural":"nengrijirilor","singular-vocative":"nengrijire","plural-vocative":"nengrijirilor"}},{"word":"nenic","pos":"noun","definitions":["diminutive of nene"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"nenic","accusative-definite-nominative":"nenicul","dative-genitive-indefinite":"nenic","dative-definite-genitive":"nenicului","vocative":"nenicule"}},{"word":"Nenică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nenică"}},{"word":"nenimereală","pos":"noun","definitions":["failure"],"forms":{"plural":"nenimereli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nenimereală","accusative-definite-nominative-singular":"nenimereala","accusative-indefinite-nominative-plural":"nenimerele","accusative-definite-nominative-plural":"nenimerelele","dative-genitive-indefinite-singular":"nenimerele","dative-definite-genitive-singular":"nenimerelei","dative-genitive-indefinite-plural":"nenimerele","dative-definite-genitive-plural":"nenimerelelor","singular-vocative":"nenimereală","plural-vocative":"nenimerelelor"}},{"word":"nenișor","pos":"noun","definitions":["diminutive of nene"],"forms":{"plural":"nenișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nenișor","accusative-definite-nominative-singular":"nenișorul","accusative-indefinite-nominative-plural":"nenișori","accusative-definite-nominative-plural":"nenișorii","dative-genitive-indefinite-singular":"nenișor","dative-definite-genitive-singular":"nenișorului","dative-genitive-indefinite-plural":"nenișori","dative-definite-genitive-plural":"nenișorilor","singular-vocative":"nenișorule","plural-vocative":"nenișorilor"}},{"word":"Nenișori","pos":"name","definitions":["a village in Armășești, Ialomița County, Romania"],"gender":"m"},{"word":"nenișori","pos":"noun","definitions":["plural of nenișor"]},{"word":"Neniță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Neniță"}},{"word":"Nenițescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nenițescu"}},{"word":"Nenițoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nenițoiu"}},{"word":"neniuluc","pos":"noun","definitions":["diminutive of nene"],"forms":{"plural":"neniuluci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neniuluc","accusative-definite-nominative-singular":"neniulucul","accusative-indefinite-nominative-plural":"neniuluci","accusative-definite-nominative-plural":"neniulucii","dative-genitive-indefinite-singular":"neniuluc","dative-definite-genitive-singular":"neniulucului","dative-genitive-indefinite-plural":"neniuluci","dative-definite-genitive-plural":"neniulucilor","singular-vocative":"neniulucule","plural-vocative":"neniulucilor"}},{"word":"neniuluț","pos":"noun","definitions":["diminutive of nene"],"forms":{"plural":"neniuluți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neniuluț","accusative-definite-nominative-singular":"neniuluțul","accusative-indefinite-nominative-plural":"neniuluți","accusative-definite-nominative-plural":"neniuluții","dative-genitive-indefinite-singular":"neniuluț","dative-definite-genitive-singular":"neniuluțului","dative-genitive-indefinite-plural":"neniuluți","dative-definite-genitive-plural":"neniuluților","singular-vocative":"neniuluțule","plural-vocative":"neniuluților"}},{"word":"neniuț","pos":"noun","definitions":["diminutive of nene"],"forms":{"plural":"neniuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neniuț","accusative-definite-nominative-singular":"neniuțul","accusative-indefinite-nominative-plural":"neniuți","accusative-definite-nominative-plural":"neniuții","dative-genitive-indefinite-singular":"neniuț","dative-definite-genitive-singular":"neniuțului","dative-genitive-indefinite-plural":"neniuți","dative-definite-genitive-plural":"neniuților","singular-vocative":"neniuțule","plural-vocative":"neniuților"}},{"word":"nenormat","pos":"adj","definitions":["abnormal"],"forms":{"feminine-singular":"nenormată","masculine-plural":"nenormați","feminine-neuter-plural":"nenormate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nenormat","error-unrecognized-form-feminine-indefinite-singular":"nenormată","error-unrecognized-form-indefinite-masculine-plural":"nenormați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nenormate","definite-error-unrecognized-form-masculine-neuter-singular":"nenormatul","definite-error-unrecognized-form-feminine-singular":"nenormata","definite-error-unrecognized-form-masculine-plural":"nenormații","definite-error-unrecognized-form-feminine-neuter-plural":"nenormatele"}},{"word":"nenoroc","pos":"noun","definitions":["bad luck (misfortune)"],"gender":"n"},{"word":"nenoroci","pos":"verb","definitions":["to make unhappy","to ruin","to cripple, maim","to pester, plague"],"forms":{"canonical":"a nenoroci 4th conjugation","present-singular-third-person":"nenorocește","participle-past":"nenorocit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nenoroci","gerund":"nenorocind","first-person-indicative-present-singular":"nenorocesc","indicative-present-second-person-singular":"nenorocești","indicative-present-singular-third-person":"nenorocește","first-person-indicative-plural-present":"nenorocim","indicative-plural-present-second-person":"nenorociți","indicative-plural-present-third-person":"nenorocesc","first-person-imperfect-indicative-singular":"nenoroceam","imperfect-indicative-second-person-singular":"nenoroceai","imperfect-indicative-singular-third-person":"nenorocea","first-person-imperfect-indicative-plural":"nenoroceam","imperfect-indicative-plural-second-person":"nenoroceați","imperfect-indicative-plural-third-person":"nenoroceau","first-person-indicative-perfect-singular":"nenorocii","indicative-perfect-second-person-singular":"nenorociși","indicative-perfect-singular-third-person":"nenoroci","first-person-indicative-perfect-plural":"nenorocirăm","indicative-perfect-plural-second-person":"nenorocirăți","indicative-perfect-plural-third-person":"nenorociră","first-person-indicative-pluperfect-singular":"nenorocisem","indicative-pluperfect-second-person-singular":"nenorociseși","indicative-pluperfect-singular-third-person":"nenorocise","first-person-indicative-pluperfect-plural":"nenorociserăm","indicative-pluperfect-plural-second-person":"nenorociserăți","indicative-pluperfect-plural-third-person":"nenorociseră","first-person-present-singular-subjunctive":"să nenorocesc","present-second-person-singular-subjunctive":"să nenorocești","present-singular-subjunctive-third-person":"să nenorocească","first-person-plural-present-subjunctive":"să nenorocim","plural-present-second-person-subjunctive":"să nenorociți","plural-present-subjunctive-third-person":"să nenorocească","imperative-second-person-singular":"nenorocește","imperative-plural-second-person":"nenorociți","imperative-negative-second-person-singular":"nu nenoroci","imperative-negative-plural-second-person":"nu nenorociți"}},{"word":"nenorocire","pos":"noun","definitions":["disaster, calamity","misfortune, woe"],"forms":{"plural":"nenorociri"}},{"word":"nenorocit","pos":"adj","definitions":["displeased","miserable, deplorable, wretched, unfortunate"],"pronunciation":"/ˌne.no.roˈt͡ʃit/","forms":{"feminine-singular":"nenorocită","masculine-plural":"nenorociți","feminine-neuter-plural":"nenorocite","table-tags":"no-table-tags","inflection-template":"ro-pp-ne","error-unrecognized-form-indefinite-masculine-neuter-singular":"nenorocit","error-unrecognized-form-feminine-indefinite-singular":"nenorocită","error-unrecognized-form-indefinite-masculine-plural":"nenorociți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nenorocite","definite-error-unrecognized-form-masculine-neuter-singular":"nenorocitul","definite-error-unrecognized-form-feminine-singular":"nenorocita","definite-error-unrecognized-form-masculine-plural":"nenorociții","definite-error-unrecognized-form-feminine-neuter-plural":"nenorocitele"}},{"word":"nenorocit","pos":"noun","definitions":["bastard","wretch"],"pronunciation":"/ˌne.no.roˈt͡ʃit/","forms":{"plural":"nenorociți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nenorocit","accusative-definite-nominative-singular":"nenorocitul","accusative-indefinite-nominative-plural":"nenorociți","accusative-definite-nominative-plural":"nenorociții","dative-genitive-indefinite-singular":"nenorocit","dative-definite-genitive-singular":"nenorocitului","dative-genitive-indefinite-plural":"nenorociți","dative-definite-genitive-plural":"nenorociților","singular-vocative":"nenorocitule","plural-vocative":"nenorociților"}},{"word":"nenorocit","pos":"verb","definitions":["past participle of nenoroci","negative past participle of noroci"],"pronunciation":"/ˌne.no.roˈt͡ʃit/"},{"word":"nenorocită","pos":"noun","definitions":["female equivalent of nenorocit"],"forms":{"plural":"nenorocite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nenorocită","accusative-definite-nominative-singular":"nenorocita","accusative-indefinite-nominative-plural":"nenorocite","accusative-definite-nominative-plural":"nenorocitele","dative-genitive-indefinite-singular":"nenorocite","dative-definite-genitive-singular":"nenorocitei","dative-genitive-indefinite-plural":"nenorocite","dative-definite-genitive-plural":"nenorocitelor","singular-vocative":"nenorocită","plural-vocative":"nenorocitelor"}},{"word":"nenorociți","pos":"noun","definitions":["plural of nenorocit"],"gender":"m-p"},{"word":"nenorocitule","pos":"noun","definitions":["definite vocative singular of nenorocit: (you) bastard"],"pronunciation":"[ne.no.ɾoˈt͡ʃi.tu.le]","gender":"m","examples":[{"ro":"du-te dracului, nenorocitule","en":"go to hell, you bastard"}]},{"word":"nenorocos","pos":"adj","definitions":["unlucky"],"forms":{"feminine-singular":"nenorocoasă","masculine-plural":"nenorocoși","feminine-neuter-plural":"nenorocoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nenorocos","error-unrecognized-form-feminine-indefinite-singular":"nenorocoasă","error-unrecognized-form-indefinite-masculine-plural":"nenorocoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nenorocoase","definite-error-unrecognized-form-masculine-neuter-singular":"nenorocosul","definite-error-unrecognized-form-feminine-singular":"nenorocoasa","definite-error-unrecognized-form-masculine-plural":"nenorocoșii","definite-error-unrecognized-form-feminine-neuter-plural":"nenorocoasele"}},{"word":"nentrecut","pos":"adj","definitions":["obsolete form of neîntrecut"],"forms":{"feminine-singular":"nentrecută","masculine-plural":"nentrecuți","feminine-neuter-plural":"nentrecute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nentrecut","error-unrecognized-form-feminine-indefinite-singular":"nentrecută","error-unrecognized-form-indefinite-masculine-plural":"nentrecuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nentrecute","definite-error-unrecognized-form-masculine-neuter-singular":"nentrecutul","definite-error-unrecognized-form-feminine-singular":"nentrecuta","definite-error-unrecognized-form-masculine-plural":"nentrecuții","definite-error-unrecognized-form-feminine-neuter-plural":"nentrecutele"}},{"word":"nentrerupt","pos":"adj","definitions":["obsolete form of neîntrerupt"],"forms":{"feminine-singular":"nentreruptă","masculine-plural":"nentrerupți","feminine-neuter-plural":"nentrerupte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nentrerupt","error-unrecognized-form-feminine-indefinite-singular":"nentreruptă","error-unrecognized-form-indefinite-masculine-plural":"nentrerupți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nentrerupte","definite-error-unrecognized-form-masculine-neuter-singular":"nentreruptul","definite-error-unrecognized-form-feminine-singular":"nentrerupta","definite-error-unrecognized-form-masculine-plural":"nentrerupții","definite-error-unrecognized-form-feminine-neuter-plural":"nentreruptele"}},{"word":"nenufar","pos":"noun","definitions":["water lily"],"pronunciation":"/ne.nuˈfar/","forms":{"plural":"nenufari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nenufar","accusative-definite-nominative-singular":"nenufarul","accusative-indefinite-nominative-plural":"nenufari","accusative-definite-nominative-plural":"nenufarii","dative-genitive-indefinite-singular":"nenufar","dative-definite-genitive-singular":"nenufarului","dative-genitive-indefinite-plural":"nenufari","dative-definite-genitive-plural":"nenufarilor","singular-vocative":"nenufarule","plural-vocative":"nenufarilor"}},{"word":"nenul","pos":"adj","definitions":["nonzero"],"examples":[{"ro":"Însumarea din ecuația (3.39) se aplică doar în cazul vectorilor suport, deoarece doar în acest caz #92;alpha#95;i sunt nenuli. În cazul vectorilor suport nemărginiți, b este dat de ecuația (3.20):\nb#61;y#95;i-#92;mathbf#123;w#125;#92;top#92;mathbf#123;x#125;#95;i pentru i#92;inU (3.41)\nunde U reprezintă setul vectorilor suport nemărginiți.","en":null}],"forms":{"feminine-singular":"nenulă","masculine-plural":"nenuli","feminine-neuter-plural":"nenule","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nenul","error-unrecognized-form-feminine-indefinite-singular":"nenulă","error-unrecognized-form-indefinite-masculine-plural":"nenuli","error-unrecognized-form-feminine-indefinite-neuter-plural":"nenule","definite-error-unrecognized-form-masculine-neuter-singular":"nenulul","definite-error-unrecognized-form-feminine-singular":"nenula","definite-error-unrecognized-form-masculine-plural":"nenulii","definite-error-unrecognized-form-feminine-neuter-plural":"nenulele"}},{"word":"nenumărabil","pos":"adj","definitions":["innumerable","uncountable"],"pronunciation":"/ˌne.nu.məˈra.bil/","forms":{"feminine-singular":"nenumărabilă","masculine-plural":"nenumărabili","feminine-neuter-plural":"nenumărabile","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"nenumărabil","error-unrecognized-form-feminine-indefinite-singular":"nenumărabilă","error-unrecognized-form-indefinite-masculine-plural":"nenumărabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nenumărabile","definite-error-unrecognized-form-masculine-neuter-singular":"nenumărabilul","definite-error-unrecognized-form-feminine-singular":"nenumărabila","definite-error-unrecognized-form-masculine-plural":"nenumărabilii","definite-error-unrecognized-form-feminine-neuter-plural":"nenumărabilele","alternative":"nenumerabil"}},{"word":"nenumărat","pos":"adj","definitions":["countless"],"pronunciation":"/ne.nu.məˈrat/","forms":{"feminine-singular":"nenumărată","masculine-plural":"nenumărați","feminine-neuter-plural":"nenumărate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nenumărat","error-unrecognized-form-feminine-indefinite-singular":"nenumărată","error-unrecognized-form-indefinite-masculine-plural":"nenumărați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nenumărate","definite-error-unrecognized-form-masculine-neuter-singular":"nenumăratul","definite-error-unrecognized-form-feminine-singular":"nenumărata","definite-error-unrecognized-form-masculine-plural":"nenumărații","definite-error-unrecognized-form-feminine-neuter-plural":"nenumăratele"}},{"word":"nenvins","pos":"adj","definitions":["obsolete form of neînvins"],"forms":{"feminine-singular":"nenvinsă","masculine-plural":"nenvinși","feminine-neuter-plural":"nenvinse","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nenvins","error-unrecognized-form-feminine-indefinite-singular":"nenvinsă","error-unrecognized-form-indefinite-masculine-plural":"nenvinși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nenvinse","definite-error-unrecognized-form-masculine-neuter-singular":"nenvinsul","definite-error-unrecognized-form-feminine-singular":"nenvinsa","definite-error-unrecognized-form-masculine-plural":"nenvinșii","definite-error-unrecognized-form-feminine-neuter-plural":"nenvinsele"}},{"word":"neo-imperial","pos":"adj","definitions":["alternative spelling of neoimperial"],"forms":{"feminine-singular":"neo-imperială","masculine-plural":"neo-imperiali","feminine-neuter-plural":"neo-imperiale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"neo-imperial","error-unrecognized-form-feminine-indefinite-singular":"neo-imperială","error-unrecognized-form-indefinite-masculine-plural":"neo-imperiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"neo-imperiale","definite-error-unrecognized-form-masculine-neuter-singular":"neo-imperialul","definite-error-unrecognized-form-feminine-singular":"neo-imperiala","definite-error-unrecognized-form-masculine-plural":"neo-imperialii","definite-error-unrecognized-form-feminine-neuter-plural":"neo-imperialele"}},{"word":"neoantrop","pos":"noun","definitions":["modern man (Homo sapiens)"],"forms":{"plural":"neoantropi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neoantrop","accusative-definite-nominative-singular":"neoantropul","accusative-indefinite-nominative-plural":"neoantropi","accusative-definite-nominative-plural":"neoantropii","dative-genitive-indefinite-singular":"neoantrop","dative-definite-genitive-singular":"neoantropului","dative-genitive-indefinite-plural":"neoantropi","dative-definite-genitive-plural":"neoantropilor","singular-vocative":"neoantropule","plural-vocative":"neoantropilor"}},{"word":"neoartroză","pos":"noun","definitions":["pseudarthrosis"],"forms":{"plural":"neoartroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neoartroză","accusative-definite-nominative-singular":"neoartroza","accusative-indefinite-nominative-plural":"neoartroze","accusative-definite-nominative-plural":"neoartrozele","dative-genitive-indefinite-singular":"neoartroze","dative-definite-genitive-singular":"neoartrozei","dative-genitive-indefinite-plural":"neoartroze","dative-definite-genitive-plural":"neoartrozelor","singular-vocative":"neoartroză","plural-vocative":"neoartrozelor"}},{"word":"neoaspete","pos":"noun","definitions":["enemy"],"forms":{"plural":"neoaspeți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neoaspete","accusative-definite-nominative-singular":"neoaspeteul","accusative-indefinite-nominative-plural":"neoaspeți","accusative-definite-nominative-plural":"neoaspeții","dative-genitive-indefinite-singular":"neoaspete","dative-definite-genitive-singular":"neoaspeteului","dative-genitive-indefinite-plural":"neoaspeți","dative-definite-genitive-plural":"neoaspeților","singular-vocative":"neoaspeteule","plural-vocative":"neoaspeților"}},{"word":"neobaroc","pos":"adj","definitions":["neo-baroque"],"forms":{"feminine-singular":"neobarocă","masculine-plural":"neobaroci","feminine-neuter-plural":"neobaroce","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neobaroc","error-unrecognized-form-feminine-indefinite-singular":"neobarocă","error-unrecognized-form-indefinite-masculine-plural":"neobaroci","error-unrecognized-form-feminine-indefinite-neuter-plural":"neobaroce","definite-error-unrecognized-form-masculine-neuter-singular":"neobarocul","definite-error-unrecognized-form-feminine-singular":"neobaroca","definite-error-unrecognized-form-masculine-plural":"neobarocii","definite-error-unrecognized-form-feminine-neuter-plural":"neobarocele"}},{"word":"neobaroc","pos":"noun","definitions":["neo-baroque"],"forms":{"plural":"neobaroci","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neobaroc","accusative-definite-nominative-singular":"neobarocul","accusative-indefinite-nominative-plural":"neobaroci","accusative-definite-nominative-plural":"neobarocile","dative-genitive-indefinite-singular":"neobaroc","dative-definite-genitive-singular":"neobarocului","dative-genitive-indefinite-plural":"neobaroci","dative-definite-genitive-plural":"neobarocilor","singular-vocative":"neobarocule","plural-vocative":"neobarocilor"}},{"word":"neobedient","pos":"adj","definitions":["disobedient"],"forms":{"feminine-singular":"neobedientă","masculine-plural":"neobedienți","feminine-neuter-plural":"neobediente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neobedient","error-unrecognized-form-feminine-indefinite-singular":"neobedientă","error-unrecognized-form-indefinite-masculine-plural":"neobedienți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neobediente","definite-error-unrecognized-form-masculine-neuter-singular":"neobedientul","definite-error-unrecognized-form-feminine-singular":"neobedienta","definite-error-unrecognized-form-masculine-plural":"neobedienții","definite-error-unrecognized-form-feminine-neuter-plural":"neobedientele"}},{"word":"neobișnuință","pos":"noun","definitions":["unusualness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"neobișnuință","accusative-definite-nominative":"neobișnuința","dative-genitive-indefinite":"neobișnuințe","dative-definite-genitive":"neobișnuinței","vocative":"neobișnuință"}},{"word":"neobișnuit","pos":"adj","definitions":["unusual, strange (not normal)"],"pronunciation":"/ˌne.oˌbiʃ.nuˈit/","forms":{"feminine-singular":"neobișnuită","masculine-plural":"neobișnuiți","feminine-neuter-plural":"neobișnuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neobișnuit","error-unrecognized-form-feminine-indefinite-singular":"neobișnuită","error-unrecognized-form-indefinite-masculine-plural":"neobișnuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neobișnuite","definite-error-unrecognized-form-masculine-neuter-singular":"neobișnuitul","definite-error-unrecognized-form-feminine-singular":"neobișnuita","definite-error-unrecognized-form-masculine-plural":"neobișnuiții","definite-error-unrecognized-form-feminine-neuter-plural":"neobișnuitele"}},{"word":"neobligatoriu","pos":"adj","definitions":["optional"],"forms":{"feminine-singular":"neobligatorie","plural":"neobligatorii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neobligatoriu","error-unrecognized-form-feminine-indefinite-singular":"neobligatorie","error-unrecognized-form-indefinite-masculine-plural":"neobligatorii","error-unrecognized-form-feminine-indefinite-neuter-plural":"neobligatorii","definite-error-unrecognized-form-masculine-neuter-singular":"neobligatoriul","definite-error-unrecognized-form-feminine-singular":"neobligatoria","definite-error-unrecognized-form-masculine-plural":"neobligatoriii","definite-error-unrecognized-form-feminine-neuter-plural":"neobligatoriile"}},{"word":"neobliterat","pos":"adj","definitions":["unused (about stamps)"],"forms":{"feminine-singular":"neobliterată","masculine-plural":"neobliterați","feminine-neuter-plural":"neobliterate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neobliterat","error-unrecognized-form-feminine-indefinite-singular":"neobliterată","error-unrecognized-form-indefinite-masculine-plural":"neobliterați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neobliterate","definite-error-unrecognized-form-masculine-neuter-singular":"neobliteratul","definite-error-unrecognized-form-feminine-singular":"neobliterata","definite-error-unrecognized-form-masculine-plural":"neobliterații","definite-error-unrecognized-form-feminine-neuter-plural":"neobliteratele"}},{"word":"neoboseală","pos":"noun","definitions":["diligence"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"neoboseală","accusative-definite-nominative":"neoboseala","dative-genitive-indefinite":"neobosele","dative-definite-genitive":"neoboselei","vocative":"neoboseală"}},{"word":"neobosit","pos":"adj","definitions":["relentless"],"forms":{"feminine-singular":"neobosită","masculine-plural":"neobosiți","feminine-neuter-plural":"neobosite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neobosit","error-unrecognized-form-feminine-indefinite-singular":"neobosită","error-unrecognized-form-indefinite-masculine-plural":"neobosiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neobosite","definite-error-unrecognized-form-masculine-neuter-singular":"neobositul","definite-error-unrecognized-form-feminine-singular":"neobosita","definite-error-unrecognized-form-masculine-plural":"neobosiții","definite-error-unrecognized-form-feminine-neuter-plural":"neobositele"}},{"word":"neobrăzare","pos":"noun","definitions":["impertinence, insolence"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neobrăzare","accusative-definite-nominative":"neobrăzarea","dative-genitive-indefinite":"neobrăzări","dative-definite-genitive":"neobrăzării","vocative":"neobrăzare"}},{"word":"neobrăzat","pos":"noun","definitions":["shameless"],"forms":{"plural":"neobrăzați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neobrăzat","accusative-definite-nominative-singular":"neobrăzatul","accusative-indefinite-nominative-plural":"neobrăzați","accusative-definite-nominative-plural":"neobrăzații","dative-genitive-indefinite-singular":"neobrăzat","dative-definite-genitive-singular":"neobrăzatului","dative-genitive-indefinite-plural":"neobrăzați","dative-definite-genitive-plural":"neobrăzaților","singular-vocative":"neobrăzatule","plural-vocative":"neobrăzaților"}},{"word":"neobservat","pos":"adj","definitions":["unnoticed"],"forms":{"feminine-singular":"neobservată","masculine-plural":"neobservați","feminine-neuter-plural":"neobservate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neobservat","error-unrecognized-form-feminine-indefinite-singular":"neobservată","error-unrecognized-form-indefinite-masculine-plural":"neobservați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neobservate","definite-error-unrecognized-form-masculine-neuter-singular":"neobservatul","definite-error-unrecognized-form-feminine-singular":"neobservata","definite-error-unrecognized-form-masculine-plural":"neobservații","definite-error-unrecognized-form-feminine-neuter-plural":"neobservatele"}},{"word":"neocapitalism","pos":"noun","definitions":["neocapitalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neocapitalism","accusative-definite-nominative-singular":"neocapitalismul","accusative-indefinite-nominative-plural":"neocapitalisme","accusative-definite-nominative-plural":"neocapitalismele","dative-genitive-indefinite-singular":"neocapitalism","dative-definite-genitive-singular":"neocapitalismului","dative-genitive-indefinite-plural":"neocapitalisme","dative-definite-genitive-plural":"neocapitalismelor","singular-vocative":"neocapitalismule","plural-vocative":"neocapitalismelor"}},{"word":"neocapitalist","pos":"noun","definitions":["neocapitalist"],"forms":{"plural":"neocapitaliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neocapitalist","accusative-definite-nominative-singular":"neocapitalistul","accusative-indefinite-nominative-plural":"neocapitaliști","accusative-definite-nominative-plural":"neocapitaliștii","dative-genitive-indefinite-singular":"neocapitalist","dative-definite-genitive-singular":"neocapitalistului","dative-genitive-indefinite-plural":"neocapitaliști","dative-definite-genitive-plural":"neocapitaliștilor","singular-vocative":"neocapitalistule","plural-vocative":"neocapitaliștilor"}},{"word":"neocapitalistă","pos":"noun","definitions":["female equivalent of neocapitalist"],"forms":{"plural":"neocapitaliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neocapitalistă","accusative-definite-nominative-singular":"neocapitalista","accusative-indefinite-nominative-plural":"neocapitaliste","accusative-definite-nominative-plural":"neocapitalistele","dative-genitive-indefinite-singular":"neocapitaliste","dative-definite-genitive-singular":"neocapitalistei","dative-genitive-indefinite-plural":"neocapitaliste","dative-definite-genitive-plural":"neocapitalistelor","singular-vocative":"neocapitalistă","plural-vocative":"neocapitalistelor"}},{"word":"neocatolic","pos":"adj","definitions":["neo-Catholic"],"forms":{"feminine-singular":"neocatolică","masculine-plural":"neocatolici","feminine-neuter-plural":"neocatolice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neocatolic","error-unrecognized-form-feminine-indefinite-singular":"neocatolică","error-unrecognized-form-indefinite-masculine-plural":"neocatolici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neocatolice","definite-error-unrecognized-form-masculine-neuter-singular":"neocatolicul","definite-error-unrecognized-form-feminine-singular":"neocatolica","definite-error-unrecognized-form-masculine-plural":"neocatolicii","definite-error-unrecognized-form-feminine-neuter-plural":"neocatolicele"}},{"word":"neocatolică","pos":"noun","definitions":["female equivalent of neocatolic"],"forms":{"plural":"neocatolice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neocatolică","accusative-definite-nominative-singular":"neocatolica","accusative-indefinite-nominative-plural":"neocatolice","accusative-definite-nominative-plural":"neocatolicele","dative-genitive-indefinite-singular":"neocatolice","dative-definite-genitive-singular":"neocatolicei","dative-genitive-indefinite-plural":"neocatolice","dative-definite-genitive-plural":"neocatolicelor","singular-vocative":"neocatolică","plural-vocative":"neocatolicelor"}},{"word":"neocatolicism","pos":"noun","definitions":["Neo-Catholicism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neocatolicism","accusative-definite-nominative-singular":"neocatolicismul","accusative-indefinite-nominative-plural":"neocatolicisme","accusative-definite-nominative-plural":"neocatolicismele","dative-genitive-indefinite-singular":"neocatolicism","dative-definite-genitive-singular":"neocatolicismului","dative-genitive-indefinite-plural":"neocatolicisme","dative-definite-genitive-plural":"neocatolicismelor","singular-vocative":"neocatolicismule","plural-vocative":"neocatolicismelor"}},{"word":"neocit","pos":"noun","definitions":["neocyte"],"forms":{"plural":"neocite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neocit","accusative-definite-nominative-singular":"neocitul","accusative-indefinite-nominative-plural":"neocite","accusative-definite-nominative-plural":"neocitele","dative-genitive-indefinite-singular":"neocit","dative-definite-genitive-singular":"neocitului","dative-genitive-indefinite-plural":"neocite","dative-definite-genitive-plural":"neocitelor","singular-vocative":"neocitule","plural-vocative":"neocitelor"}},{"word":"neoclasic","pos":"adj","definitions":["neoclassical"],"forms":{"feminine-singular":"neoclasică","masculine-plural":"neoclasici","feminine-neuter-plural":"neoclasice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neoclasic","error-unrecognized-form-feminine-indefinite-singular":"neoclasică","error-unrecognized-form-indefinite-masculine-plural":"neoclasici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neoclasice","definite-error-unrecognized-form-masculine-neuter-singular":"neoclasicul","definite-error-unrecognized-form-feminine-singular":"neoclasica","definite-error-unrecognized-form-masculine-plural":"neoclasicii","definite-error-unrecognized-form-feminine-neuter-plural":"neoclasicele"}},{"word":"neoclasicism","pos":"noun","definitions":["neoclassicism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neoclasicism","accusative-definite-nominative-singular":"neoclasicismul","accusative-indefinite-nominative-plural":"neoclasicisme","accusative-definite-nominative-plural":"neoclasicismele","dative-genitive-indefinite-singular":"neoclasicism","dative-definite-genitive-singular":"neoclasicismului","dative-genitive-indefinite-plural":"neoclasicisme","dative-definite-genitive-plural":"neoclasicismelor","singular-vocative":"neoclasicismule","plural-vocative":"neoclasicismelor"}},{"word":"neocolonialism","pos":"noun","definitions":["neocolonialism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neocolonialism","accusative-definite-nominative":"neocolonialismul","dative-genitive-indefinite":"neocolonialism","dative-definite-genitive":"neocolonialismului","vocative":"neocolonialismule"}},{"word":"neocolonialist","pos":"adj","definitions":["neocolonialist"],"pronunciation":"/ne.o.ko.lo.ni.jaˈlist/","forms":{"feminine-singular":"neocolonialistă","masculine-plural":"neocolonialiști","feminine-neuter-plural":"neocolonialiste","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"neocolonialist","error-unrecognized-form-feminine-indefinite-singular":"neocolonialistă","error-unrecognized-form-indefinite-masculine-plural":"neocolonialiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"neocolonialiste","definite-error-unrecognized-form-masculine-neuter-singular":"neocolonialistul","definite-error-unrecognized-form-feminine-singular":"neocolonialista","definite-error-unrecognized-form-masculine-plural":"neocolonialiștii","definite-error-unrecognized-form-feminine-neuter-plural":"neocolonialistele"}},{"word":"neocolonialist","pos":"noun","definitions":["neocolonialist"],"pronunciation":"/ne.o.ko.lo.ni.jaˈlist/","forms":{"plural":"neocolonialiști","feminine":"equivalent neocolonialistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neocolonialist","accusative-definite-nominative-singular":"neocolonialistul","accusative-indefinite-nominative-plural":"neocolonialiști","accusative-definite-nominative-plural":"neocolonialiștii","dative-genitive-indefinite-singular":"neocolonialist","dative-definite-genitive-singular":"neocolonialistului","dative-genitive-indefinite-plural":"neocolonialiști","dative-definite-genitive-plural":"neocolonialiștilor","singular-vocative":"neocolonialistule","plural-vocative":"neocolonialiștilor"}},{"word":"neocolonialistă","pos":"noun","definitions":["female equivalent of neocolonialist"],"forms":{"plural":"neocolonialiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neocolonialistă","accusative-definite-nominative-singular":"neocolonialista","accusative-indefinite-nominative-plural":"neocolonialiste","accusative-definite-nominative-plural":"neocolonialistele","dative-genitive-indefinite-singular":"neocolonialiste","dative-definite-genitive-singular":"neocolonialistei","dative-genitive-indefinite-plural":"neocolonialiste","dative-definite-genitive-plural":"neocolonialistelor","singular-vocative":"neocolonialistă","plural-vocative":"neocolonialistelor"}},{"word":"neocomian","pos":"adj","definitions":["Neocomian"],"forms":{"feminine-singular":"neocomiană","masculine-plural":"neocomieni","feminine-neuter-plural":"neocomiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neocomian","error-unrecognized-form-feminine-indefinite-singular":"neocomiană","error-unrecognized-form-indefinite-masculine-plural":"neocomieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"neocomiene","definite-error-unrecognized-form-masculine-neuter-singular":"neocomianul","definite-error-unrecognized-form-feminine-singular":"neocomiana","definite-error-unrecognized-form-masculine-plural":"neocomienii","definite-error-unrecognized-form-feminine-neuter-plural":"neocomienele"}},{"word":"neocomian","pos":"noun","definitions":["Neocomian"],"forms":{"plural":"neocomiani","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neocomian","accusative-definite-nominative-singular":"neocomianul","accusative-indefinite-nominative-plural":"neocomiani","accusative-definite-nominative-plural":"neocomianile","dative-genitive-indefinite-singular":"neocomian","dative-definite-genitive-singular":"neocomianului","dative-genitive-indefinite-plural":"neocomiani","dative-definite-genitive-plural":"neocomianilor","singular-vocative":"neocomianule","plural-vocative":"neocomianilor"}},{"word":"neocomunism","pos":"noun","definitions":["neocommunism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neocomunism","accusative-definite-nominative":"neocomunismul","dative-genitive-indefinite":"neocomunism","dative-definite-genitive":"neocomunismului","vocative":"neocomunismule"}},{"word":"neocomunist","pos":"adj","definitions":["neocommunist"],"forms":{"feminine-singular":"neocomunistă","masculine-plural":"neocomuniști","feminine-neuter-plural":"neocomuniste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neocomunist","error-unrecognized-form-feminine-indefinite-singular":"neocomunistă","error-unrecognized-form-indefinite-masculine-plural":"neocomuniști","error-unrecognized-form-feminine-indefinite-neuter-plural":"neocomuniste","definite-error-unrecognized-form-masculine-neuter-singular":"neocomunistul","definite-error-unrecognized-form-feminine-singular":"neocomunista","definite-error-unrecognized-form-masculine-plural":"neocomuniștii","definite-error-unrecognized-form-feminine-neuter-plural":"neocomunistele"}},{"word":"neocomunist","pos":"noun","definitions":["neocommunist"],"forms":{"plural":"neocomuniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neocomunist","accusative-definite-nominative-singular":"neocomunistul","accusative-indefinite-nominative-plural":"neocomuniști","accusative-definite-nominative-plural":"neocomuniștii","dative-genitive-indefinite-singular":"neocomunist","dative-definite-genitive-singular":"neocomunistului","dative-genitive-indefinite-plural":"neocomuniști","dative-definite-genitive-plural":"neocomuniștilor","singular-vocative":"neocomunistule","plural-vocative":"neocomuniștilor"}},{"word":"neocomunistă","pos":"noun","definitions":["female equivalent of neocomunist"],"forms":{"plural":"neocomuniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neocomunistă","accusative-definite-nominative-singular":"neocomunista","accusative-indefinite-nominative-plural":"neocomuniste","accusative-definite-nominative-plural":"neocomunistele","dative-genitive-indefinite-singular":"neocomuniste","dative-definite-genitive-singular":"neocomunistei","dative-genitive-indefinite-plural":"neocomuniste","dative-definite-genitive-plural":"neocomunistelor","singular-vocative":"neocomunistă","plural-vocative":"neocomunistelor"}},{"word":"neoconfucianism","pos":"noun","definitions":["Neo-Confucianism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neoconfucianism","accusative-definite-nominative":"neoconfucianismul","dative-genitive-indefinite":"neoconfucianism","dative-definite-genitive":"neoconfucianismului","vocative":"neoconfucianismule"}},{"word":"neocortex","pos":"noun","definitions":["neocortex"],"forms":{"plural":"neocortexuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"neocortex","accusative-definite-nominative-singular":"neocortexul","accusative-indefinite-nominative-plural":"neocortexuri","accusative-definite-nominative-plural":"neocortexurile","dative-genitive-indefinite-singular":"neocortex","dative-definite-genitive-singular":"neocortexului","dative-genitive-indefinite-plural":"neocortexuri","dative-definite-genitive-plural":"neocortexurilor","singular-vocative":"neocortexule","plural-vocative":"neocortexurilor"}},{"word":"neocritic","pos":"adj","definitions":["neocritical"],"forms":{"feminine-singular":"neocritică","masculine-plural":"neocritici","feminine-neuter-plural":"neocritice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neocritic","error-unrecognized-form-feminine-indefinite-singular":"neocritică","error-unrecognized-form-indefinite-masculine-plural":"neocritici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neocritice","definite-error-unrecognized-form-masculine-neuter-singular":"neocriticul","definite-error-unrecognized-form-feminine-singular":"neocritica","definite-error-unrecognized-form-masculine-plural":"neocriticii","definite-error-unrecognized-form-feminine-neuter-plural":"neocriticele"}},{"word":"neocritică","pos":"noun","definitions":["neocriticism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"neocritică","accusative-definite-nominative":"neocritica","dative-genitive-indefinite":"neocritice","dative-definite-genitive":"neocriticei","vocative":"neocritică"}},{"word":"neocriticism","pos":"noun","definitions":["neocriticism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neocriticism","accusative-definite-nominative":"neocriticismul","dative-genitive-indefinite":"neocriticism","dative-definite-genitive":"neocriticismului","vocative":"neocriticismule"}},{"word":"neocriticist","pos":"noun","definitions":["neocriticist"],"forms":{"plural":"neocriticiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neocriticist","accusative-definite-nominative-singular":"neocriticistul","accusative-indefinite-nominative-plural":"neocriticiști","accusative-definite-nominative-plural":"neocriticiștii","dative-genitive-indefinite-singular":"neocriticist","dative-definite-genitive-singular":"neocriticistului","dative-genitive-indefinite-plural":"neocriticiști","dative-definite-genitive-plural":"neocriticiștilor","singular-vocative":"neocriticistule","plural-vocative":"neocriticiștilor"}},{"word":"neocriticistă","pos":"noun","definitions":["female equivalent of neocriticist"],"forms":{"plural":"neocriticiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neocriticistă","accusative-definite-nominative-singular":"neocriticista","accusative-indefinite-nominative-plural":"neocriticiste","accusative-definite-nominative-plural":"neocriticistele","dative-genitive-indefinite-singular":"neocriticiste","dative-definite-genitive-singular":"neocriticistei","dative-genitive-indefinite-plural":"neocriticiste","dative-definite-genitive-plural":"neocriticistelor","singular-vocative":"neocriticistă","plural-vocative":"neocriticistelor"}},{"word":"neocupat","pos":"adj","definitions":["unoccupied"],"forms":{"feminine-singular":"neocupată","masculine-plural":"neocupați","feminine-neuter-plural":"neocupate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neocupat","error-unrecognized-form-feminine-indefinite-singular":"neocupată","error-unrecognized-form-indefinite-masculine-plural":"neocupați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neocupate","definite-error-unrecognized-form-masculine-neuter-singular":"neocupatul","definite-error-unrecognized-form-feminine-singular":"neocupata","definite-error-unrecognized-form-masculine-plural":"neocupații","definite-error-unrecognized-form-feminine-neuter-plural":"neocupatele"}},{"word":"neodarwinism","pos":"noun","definitions":["neo-Darwinism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neodarwinism","accusative-definite-nominative-singular":"neodarwinismul","accusative-indefinite-nominative-plural":"neodarwinisme","accusative-definite-nominative-plural":"neodarwinismele","dative-genitive-indefinite-singular":"neodarwinism","dative-definite-genitive-singular":"neodarwinismului","dative-genitive-indefinite-plural":"neodarwinisme","dative-definite-genitive-plural":"neodarwinismelor","singular-vocative":"neodarwinismule","plural-vocative":"neodarwinismelor"}},{"word":"neodarwinist","pos":"noun","definitions":["Neo-Darwinist"],"forms":{"plural":"neodarwiniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neodarwinist","accusative-definite-nominative-singular":"neodarwinistul","accusative-indefinite-nominative-plural":"neodarwiniști","accusative-definite-nominative-plural":"neodarwiniștii","dative-genitive-indefinite-singular":"neodarwinist","dative-definite-genitive-singular":"neodarwinistului","dative-genitive-indefinite-plural":"neodarwiniști","dative-definite-genitive-plural":"neodarwiniștilor","singular-vocative":"neodarwinistule","plural-vocative":"neodarwiniștilor"}},{"word":"neodarwinistă","pos":"noun","definitions":["female equivalent of neodarwinist"],"forms":{"plural":"neodarwiniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neodarwinistă","accusative-definite-nominative-singular":"neodarwinista","accusative-indefinite-nominative-plural":"neodarwiniste","accusative-definite-nominative-plural":"neodarwinistele","dative-genitive-indefinite-singular":"neodarwiniste","dative-definite-genitive-singular":"neodarwinistei","dative-genitive-indefinite-plural":"neodarwiniste","dative-definite-genitive-plural":"neodarwinistelor","singular-vocative":"neodarwinistă","plural-vocative":"neodarwinistelor"}},{"word":"neodihnă","pos":"noun","definitions":["unrest, unease"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"neodihnă","accusative-definite-nominative":"neodihna","dative-genitive-indefinite":"neodihne","dative-definite-genitive":"neodihnei","vocative":"neodihnă"}},{"word":"neodihni","pos":"verb","definitions":["to worry"],"forms":{"canonical":"a neodihni 4th conjugation","present-singular-third-person":"neodihnește","participle-past":"neodihnit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a neodihni","gerund":"neodihnind","first-person-indicative-present-singular":"neodihnesc","indicative-present-second-person-singular":"neodihnești","indicative-present-singular-third-person":"neodihnește","first-person-indicative-plural-present":"neodihnim","indicative-plural-present-second-person":"neodihniți","indicative-plural-present-third-person":"neodihnesc","first-person-imperfect-indicative-singular":"neodihneam","imperfect-indicative-second-person-singular":"neodihneai","imperfect-indicative-singular-third-person":"neodihnea","first-person-imperfect-indicative-plural":"neodihneam","imperfect-indicative-plural-second-person":"neodihneați","imperfect-indicative-plural-third-person":"neodihneau","first-person-indicative-perfect-singular":"neodihnii","indicative-perfect-second-person-singular":"neodihniși","indicative-perfect-singular-third-person":"neodihni","first-person-indicative-perfect-plural":"neodihnirăm","indicative-perfect-plural-second-person":"neodihnirăți","indicative-perfect-plural-third-person":"neodihniră","first-person-indicative-pluperfect-singular":"neodihnisem","indicative-pluperfect-second-person-singular":"neodihniseși","indicative-pluperfect-singular-third-person":"neodihnise","first-person-indicative-pluperfect-plural":"neodihniserăm","indicative-pluperfect-plural-second-person":"neodihniserăți","indicative-pluperfect-plural-third-person":"neodihniseră","first-person-present-singular-subjunctive":"să neodihnesc","present-second-person-singular-subjunctive":"să neodihnești","present-singular-subjunctive-third-person":"să neodihnească","first-person-plural-present-subjunctive":"să neodihnim","plural-present-second-person-subjunctive":"să neodihniți","plural-present-subjunctive-third-person":"să neodihnească","imperative-second-person-singular":"neodihnește","imperative-plural-second-person":"neodihniți","imperative-negative-second-person-singular":"nu neodihni","imperative-negative-plural-second-person":"nu neodihniți"}},{"word":"neodihnire","pos":"noun","definitions":["restlessness"],"forms":{"plural":"neodihniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neodihnire","accusative-definite-nominative-singular":"neodihnirea","accusative-indefinite-nominative-plural":"neodihniri","accusative-definite-nominative-plural":"neodihnirile","dative-genitive-indefinite-singular":"neodihniri","dative-definite-genitive-singular":"neodihnirii","dative-genitive-indefinite-plural":"neodihniri","dative-definite-genitive-plural":"neodihnirilor","singular-vocative":"neodihnire","plural-vocative":"neodihnirilor"}},{"word":"neodihnit","pos":"adj","definitions":["tired"],"forms":{"feminine-singular":"neodihnită","masculine-plural":"neodihniți","feminine-neuter-plural":"neodihnite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neodihnit","error-unrecognized-form-feminine-indefinite-singular":"neodihnită","error-unrecognized-form-indefinite-masculine-plural":"neodihniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neodihnite","definite-error-unrecognized-form-masculine-neuter-singular":"neodihnitul","definite-error-unrecognized-form-feminine-singular":"neodihnita","definite-error-unrecognized-form-masculine-plural":"neodihniții","definite-error-unrecognized-form-feminine-neuter-plural":"neodihnitele"}},{"word":"neodim","pos":"noun","definitions":["neodymium (chemical element)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neodim","accusative-definite-nominative":"neodimul","dative-genitive-indefinite":"neodim","dative-definite-genitive":"neodimului","vocative":"neodimule"}},{"word":"neoecologie","pos":"noun","definitions":["neo-ecology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"neoecologie","accusative-definite-nominative":"neoecologia","dative-genitive-indefinite":"neoecologii","dative-definite-genitive":"neoecologiei","vocative":"neoecologie"}},{"word":"neofalină","pos":"noun","definitions":["neophaline"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neofalină","accusative-definite-nominative-singular":"neofalina","accusative-indefinite-nominative-plural":"neofaline","accusative-definite-nominative-plural":"neofalinele","dative-genitive-indefinite-singular":"neofaline","dative-definite-genitive-singular":"neofalinei","dative-genitive-indefinite-plural":"neofaline","dative-definite-genitive-plural":"neofalinelor","singular-vocative":"neofalină","plural-vocative":"neofalinelor"}},{"word":"neofascism","pos":"noun","definitions":["neofascism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neofascism","accusative-definite-nominative":"neofascismul","dative-genitive-indefinite":"neofascism","dative-definite-genitive":"neofascismului","vocative":"neofascismule"}},{"word":"neofascist","pos":"noun","definitions":["neofascist"],"forms":{"plural":"neofasciști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neofascist","accusative-definite-nominative-singular":"neofascistul","accusative-indefinite-nominative-plural":"neofasciști","accusative-definite-nominative-plural":"neofasciștii","dative-genitive-indefinite-singular":"neofascist","dative-definite-genitive-singular":"neofascistului","dative-genitive-indefinite-plural":"neofasciști","dative-definite-genitive-plural":"neofasciștilor","singular-vocative":"neofascistule","plural-vocative":"neofasciștilor"}},{"word":"neofascistă","pos":"noun","definitions":["female equivalent of neofascist"],"forms":{"plural":"neofasciste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neofascistă","accusative-definite-nominative-singular":"neofascista","accusative-indefinite-nominative-plural":"neofasciste","accusative-definite-nominative-plural":"neofascistele","dative-genitive-indefinite-singular":"neofasciste","dative-definite-genitive-singular":"neofascistei","dative-genitive-indefinite-plural":"neofasciste","dative-definite-genitive-plural":"neofascistelor","singular-vocative":"neofascistă","plural-vocative":"neofascistelor"}},{"word":"neoficial","pos":"adj","definitions":["unofficial"],"forms":{"feminine-singular":"neoficială","masculine-plural":"neoficiali","feminine-neuter-plural":"neoficiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neoficial","error-unrecognized-form-feminine-indefinite-singular":"neoficială","error-unrecognized-form-indefinite-masculine-plural":"neoficiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"neoficiale","definite-error-unrecognized-form-masculine-neuter-singular":"neoficialul","definite-error-unrecognized-form-feminine-singular":"neoficiala","definite-error-unrecognized-form-masculine-plural":"neoficialii","definite-error-unrecognized-form-feminine-neuter-plural":"neoficialele"}},{"word":"neofil","pos":"noun","definitions":["neophile"],"forms":{"plural":"neofili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neofil","accusative-definite-nominative-singular":"neofilul","accusative-indefinite-nominative-plural":"neofili","accusative-definite-nominative-plural":"neofilii","dative-genitive-indefinite-singular":"neofil","dative-definite-genitive-singular":"neofilului","dative-genitive-indefinite-plural":"neofili","dative-definite-genitive-plural":"neofililor","singular-vocative":"neofilule","plural-vocative":"neofililor"}},{"word":"neofilie","pos":"noun","definitions":["neophilia"],"forms":{"plural":"neofilii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neofilie","accusative-definite-nominative-singular":"neofilia","accusative-indefinite-nominative-plural":"neofilii","accusative-definite-nominative-plural":"neofiliile","dative-genitive-indefinite-singular":"neofilii","dative-definite-genitive-singular":"neofiliei","dative-genitive-indefinite-plural":"neofilii","dative-definite-genitive-plural":"neofiliilor","singular-vocative":"neofilie","plural-vocative":"neofiliilor"}},{"word":"Neofit","pos":"name","definitions":["a male given name"],"gender":"m","forms":{"dative-genitive":"lui Neofit"}},{"word":"neofit","pos":"noun","definitions":["neophyte"],"forms":{"plural":"neofiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neofit","accusative-definite-nominative-singular":"neofitul","accusative-indefinite-nominative-plural":"neofiți","accusative-definite-nominative-plural":"neofiții","dative-genitive-indefinite-singular":"neofit","dative-definite-genitive-singular":"neofitului","dative-genitive-indefinite-plural":"neofiți","dative-definite-genitive-plural":"neofiților","singular-vocative":"neofitule","plural-vocative":"neofiților"}},{"word":"neofită","pos":"noun","definitions":["female equivalent of neofit"],"forms":{"plural":"neofite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neofită","accusative-definite-nominative-singular":"neofita","accusative-indefinite-nominative-plural":"neofite","accusative-definite-nominative-plural":"neofitele","dative-genitive-indefinite-singular":"neofite","dative-definite-genitive-singular":"neofitei","dative-genitive-indefinite-plural":"neofite","dative-definite-genitive-plural":"neofitelor","singular-vocative":"neofită","plural-vocative":"neofitelor"}},{"word":"neofobie","pos":"noun","definitions":["neophobia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neofobie","accusative-definite-nominative-singular":"neofobia","accusative-indefinite-nominative-plural":"neofobii","accusative-definite-nominative-plural":"neofobiile","dative-genitive-indefinite-singular":"neofobii","dative-definite-genitive-singular":"neofobiei","dative-genitive-indefinite-plural":"neofobii","dative-definite-genitive-plural":"neofobiilor","singular-vocative":"neofobie","plural-vocative":"neofobiilor"}},{"word":"neoformație","pos":"noun","definitions":["neoformation"],"forms":{"plural":"neoformații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neoformație","accusative-definite-nominative-singular":"neoformația","accusative-indefinite-nominative-plural":"neoformații","accusative-definite-nominative-plural":"neoformațiile","dative-genitive-indefinite-singular":"neoformații","dative-definite-genitive-singular":"neoformației","dative-genitive-indefinite-plural":"neoformații","dative-definite-genitive-plural":"neoformațiilor","singular-vocative":"neoformație","plural-vocative":"neoformațiilor"}},{"word":"neoformațiune","pos":"noun","definitions":["alternative form of neoformație"],"forms":{"plural":"neoformațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neoformațiune","accusative-definite-nominative-singular":"neoformațiunea","accusative-indefinite-nominative-plural":"neoformațiuni","accusative-definite-nominative-plural":"neoformațiunile","dative-genitive-indefinite-singular":"neoformațiuni","dative-definite-genitive-singular":"neoformațiunii","dative-genitive-indefinite-plural":"neoformațiuni","dative-definite-genitive-plural":"neoformațiunilor","singular-vocative":"neoformațiune","plural-vocative":"neoformațiunilor"}},{"word":"neofreudism","pos":"noun","definitions":["neo-freudianism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neofreudism","accusative-definite-nominative-singular":"neofreudismul","accusative-indefinite-nominative-plural":"neofreudisme","accusative-definite-nominative-plural":"neofreudismele","dative-genitive-indefinite-singular":"neofreudism","dative-definite-genitive-singular":"neofreudismului","dative-genitive-indefinite-plural":"neofreudisme","dative-definite-genitive-plural":"neofreudismelor","singular-vocative":"neofreudismule","plural-vocative":"neofreudismelor"}},{"word":"neogam","pos":"noun","definitions":["neogamist"],"pronunciation":"/ne.o.ˈɡam/","forms":{"plural":"neogami","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neogam","accusative-definite-nominative-singular":"neogamul","accusative-indefinite-nominative-plural":"neogami","accusative-definite-nominative-plural":"neogamii","dative-genitive-indefinite-singular":"neogam","dative-definite-genitive-singular":"neogamului","dative-genitive-indefinite-plural":"neogami","dative-definite-genitive-plural":"neogamilor","singular-vocative":"neogamule","plural-vocative":"neogamilor"}},{"word":"neogen","pos":"adj","definitions":["neogenic"],"forms":{"feminine-singular":"neogenă","masculine-plural":"neogeni","feminine-neuter-plural":"neogene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neogen","error-unrecognized-form-feminine-indefinite-singular":"neogenă","error-unrecognized-form-indefinite-masculine-plural":"neogeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"neogene","definite-error-unrecognized-form-masculine-neuter-singular":"neogenul","definite-error-unrecognized-form-feminine-singular":"neogena","definite-error-unrecognized-form-masculine-plural":"neogenii","definite-error-unrecognized-form-feminine-neuter-plural":"neogenele"}},{"word":"neogotic","pos":"adj","definitions":["neogothic"],"forms":{"feminine-singular":"neogotică","masculine-plural":"neogotici","feminine-neuter-plural":"neogotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neogotic","error-unrecognized-form-feminine-indefinite-singular":"neogotică","error-unrecognized-form-indefinite-masculine-plural":"neogotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neogotice","definite-error-unrecognized-form-masculine-neuter-singular":"neogoticul","definite-error-unrecognized-form-feminine-singular":"neogotica","definite-error-unrecognized-form-masculine-plural":"neogoticii","definite-error-unrecognized-form-feminine-neuter-plural":"neogoticele"}},{"word":"neogramatic","pos":"adj","definitions":["neogrammatical"],"forms":{"feminine-singular":"neogramatică","masculine-plural":"neogramatici","feminine-neuter-plural":"neogramatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neogramatic","error-unrecognized-form-feminine-indefinite-singular":"neogramatică","error-unrecognized-form-indefinite-masculine-plural":"neogramatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neogramatice","definite-error-unrecognized-form-masculine-neuter-singular":"neogramaticul","definite-error-unrecognized-form-feminine-singular":"neogramatica","definite-error-unrecognized-form-masculine-plural":"neogramaticii","definite-error-unrecognized-form-feminine-neuter-plural":"neogramaticele"}},{"word":"neogramatic","pos":"noun","definitions":["neogrammatic"],"forms":{"plural":"neogramatici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neogramatic","accusative-definite-nominative-singular":"neogramaticul","accusative-indefinite-nominative-plural":"neogramatici","accusative-definite-nominative-plural":"neogramaticii","dative-genitive-indefinite-singular":"neogramatic","dative-definite-genitive-singular":"neogramaticului","dative-genitive-indefinite-plural":"neogramatici","dative-definite-genitive-plural":"neogramaticilor","singular-vocative":"neogramaticule","plural-vocative":"neogramaticilor"}},{"word":"neogramatică","pos":"noun","definitions":["female equivalent of neogramatic"],"forms":{"plural":"neogramatice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neogramatică","accusative-definite-nominative-singular":"neogramatica","accusative-indefinite-nominative-plural":"neogramatice","accusative-definite-nominative-plural":"neogramaticele","dative-genitive-indefinite-singular":"neogramatice","dative-definite-genitive-singular":"neogramaticei","dative-genitive-indefinite-plural":"neogramatice","dative-definite-genitive-plural":"neogramaticelor","singular-vocative":"neogramatică","plural-vocative":"neogramaticelor"}},{"word":"neogreacă","pos":"noun","definitions":["Modern Greek"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"neogreacă","accusative-definite-nominative":"neogreaca","dative-genitive-indefinite":"neogrece","dative-definite-genitive":"neogrecei","vocative":"neogreacă"}},{"word":"neogrec","pos":"adj","definitions":["neo-Greek, Neo-Greek","Modern Greek, New Greek"],"forms":{"feminine-singular":"neogreacă","masculine-plural":"neogreci","feminine-neuter-plural":"neogrece","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neogrec","error-unrecognized-form-feminine-indefinite-singular":"neogreacă","error-unrecognized-form-indefinite-masculine-plural":"neogreci","error-unrecognized-form-feminine-indefinite-neuter-plural":"neogrece","definite-error-unrecognized-form-masculine-neuter-singular":"neogrecul","definite-error-unrecognized-form-feminine-singular":"neogreaca","definite-error-unrecognized-form-masculine-plural":"neogrecii","definite-error-unrecognized-form-feminine-neuter-plural":"neogrecele"}},{"word":"neogrecesc","pos":"adj","definitions":["Modern Greek"],"forms":{"feminine-singular":"neogrecească","plural":"neogrecești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neogrecesc","error-unrecognized-form-feminine-indefinite-singular":"neogrecească","error-unrecognized-form-indefinite-masculine-plural":"neogrecești","error-unrecognized-form-feminine-indefinite-neuter-plural":"neogrecești","definite-error-unrecognized-form-masculine-neuter-singular":"neogrecescul","definite-error-unrecognized-form-feminine-singular":"neogreceasca","definite-error-unrecognized-form-masculine-plural":"neogreceștii","definite-error-unrecognized-form-feminine-neuter-plural":"neogreceștile"}},{"word":"neoguelfism","pos":"noun","definitions":["neoguelphism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neoguelfism","accusative-definite-nominative":"neoguelfismul","dative-genitive-indefinite":"neoguelfism","dative-definite-genitive":"neoguelfismului","vocative":"neoguelfismule"}},{"word":"neohegelian","pos":"noun","definitions":["neo-Hegelian"],"forms":{"plural":"neohegelieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neohegelian","accusative-definite-nominative-singular":"neohegelianul","accusative-indefinite-nominative-plural":"neohegelieni","accusative-definite-nominative-plural":"neohegelienii","dative-genitive-indefinite-singular":"neohegelian","dative-definite-genitive-singular":"neohegelianului","dative-genitive-indefinite-plural":"neohegelieni","dative-definite-genitive-plural":"neohegelienilor","singular-vocative":"neohegelianule","plural-vocative":"neohegelienilor"}},{"word":"neohegeliană","pos":"noun","definitions":["female equivalent of neohegelian"],"forms":{"plural":"neohegeliene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neohegeliană","accusative-definite-nominative-singular":"neohegeliana","accusative-indefinite-nominative-plural":"neohegeliene","accusative-definite-nominative-plural":"neohegelienele","dative-genitive-indefinite-singular":"neohegeliene","dative-definite-genitive-singular":"neohegelienei","dative-genitive-indefinite-plural":"neohegeliene","dative-definite-genitive-plural":"neohegelienelor","singular-vocative":"neohegeliană","plural-vocative":"neohegelienelor"}},{"word":"neohegelianism","pos":"noun","definitions":["neo-Hegelianism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neohegelianism","accusative-definite-nominative-singular":"neohegelianismul","accusative-indefinite-nominative-plural":"neohegelianisme","accusative-definite-nominative-plural":"neohegelianismele","dative-genitive-indefinite-singular":"neohegelianism","dative-definite-genitive-singular":"neohegelianismului","dative-genitive-indefinite-plural":"neohegelianisme","dative-definite-genitive-plural":"neohegelianismelor","singular-vocative":"neohegelianismule","plural-vocative":"neohegelianismelor"}},{"word":"neoimperial","pos":"adj","definitions":["neoimperial"],"forms":{"feminine-singular":"neoimperială","masculine-plural":"neoimperiali","feminine-neuter-plural":"neoimperiale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"neoimperial","error-unrecognized-form-feminine-indefinite-singular":"neoimperială","error-unrecognized-form-indefinite-masculine-plural":"neoimperiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"neoimperiale","definite-error-unrecognized-form-masculine-neuter-singular":"neoimperialul","definite-error-unrecognized-form-feminine-singular":"neoimperiala","definite-error-unrecognized-form-masculine-plural":"neoimperialii","definite-error-unrecognized-form-feminine-neuter-plural":"neoimperialele","alternative":"neo-imperial"}},{"word":"neoimperialism","pos":"noun","definitions":["neoimperialism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neoimperialism","accusative-definite-nominative":"neoimperialismul","dative-genitive-indefinite":"neoimperialism","dative-definite-genitive":"neoimperialismului","vocative":"neoimperialismule"}},{"word":"neoimpresionism","pos":"noun","definitions":["neo-impressionism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neoimpresionism","accusative-definite-nominative-singular":"neoimpresionismul","accusative-indefinite-nominative-plural":"neoimpresionisme","accusative-definite-nominative-plural":"neoimpresionismele","dative-genitive-indefinite-singular":"neoimpresionism","dative-definite-genitive-singular":"neoimpresionismului","dative-genitive-indefinite-plural":"neoimpresionisme","dative-definite-genitive-plural":"neoimpresionismelor","singular-vocative":"neoimpresionismule","plural-vocative":"neoimpresionismelor"}},{"word":"neoimpresionist","pos":"noun","definitions":["neo-impressionist"],"forms":{"plural":"neoimpresioniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neoimpresionist","accusative-definite-nominative-singular":"neoimpresionistul","accusative-indefinite-nominative-plural":"neoimpresioniști","accusative-definite-nominative-plural":"neoimpresioniștii","dative-genitive-indefinite-singular":"neoimpresionist","dative-definite-genitive-singular":"neoimpresionistului","dative-genitive-indefinite-plural":"neoimpresioniști","dative-definite-genitive-plural":"neoimpresioniștilor","singular-vocative":"neoimpresionistule","plural-vocative":"neoimpresioniștilor"}},{"word":"neoimpresionistă","pos":"noun","definitions":["female equivalent of neoimpresionist"],"forms":{"plural":"neoimpresioniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neoimpresionistă","accusative-definite-nominative-singular":"neoimpresionista","accusative-indefinite-nominative-plural":"neoimpresioniste","accusative-definite-nominative-plural":"neoimpresionistele","dative-genitive-indefinite-singular":"neoimpresioniste","dative-definite-genitive-singular":"neoimpresionistei","dative-genitive-indefinite-plural":"neoimpresioniste","dative-definite-genitive-plural":"neoimpresionistelor","singular-vocative":"neoimpresionistă","plural-vocative":"neoimpresionistelor"}},{"word":"neojunimistă","pos":"noun","definitions":["female equivalent of neojunimist"],"forms":{"plural":"neojunimiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neojunimistă","accusative-definite-nominative-singular":"neojunimista","accusative-indefinite-nominative-plural":"neojunimiste","accusative-definite-nominative-plural":"neojunimistele","dative-genitive-indefinite-singular":"neojunimiste","dative-definite-genitive-singular":"neojunimistei","dative-genitive-indefinite-plural":"neojunimiste","dative-definite-genitive-plural":"neojunimistelor","singular-vocative":"neojunimistă","plural-vocative":"neojunimistelor"}},{"word":"neokantian","pos":"noun","definitions":["neo-Kantian"],"forms":{"plural":"neokantieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neokantian","accusative-definite-nominative-singular":"neokantianul","accusative-indefinite-nominative-plural":"neokantieni","accusative-definite-nominative-plural":"neokantienii","dative-genitive-indefinite-singular":"neokantian","dative-definite-genitive-singular":"neokantianului","dative-genitive-indefinite-plural":"neokantieni","dative-definite-genitive-plural":"neokantienilor","singular-vocative":"neokantianule","plural-vocative":"neokantienilor"}},{"word":"neokantiană","pos":"noun","definitions":["female equivalent of neokantian"],"forms":{"plural":"neokantiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neokantiană","accusative-definite-nominative-singular":"neokantiana","accusative-indefinite-nominative-plural":"neokantiene","accusative-definite-nominative-plural":"neokantienele","dative-genitive-indefinite-singular":"neokantiene","dative-definite-genitive-singular":"neokantienei","dative-genitive-indefinite-plural":"neokantiene","dative-definite-genitive-plural":"neokantienelor","singular-vocative":"neokantiană","plural-vocative":"neokantienelor"}},{"word":"neokantianism","pos":"noun","definitions":["neo-Kantianism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neokantianism","accusative-definite-nominative":"neokantianismul","dative-genitive-indefinite":"neokantianism","dative-definite-genitive":"neokantianismului","vocative":"neokantianismule"}},{"word":"neokeynesism","pos":"noun","definitions":["Neo-Keynesian"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neokeynesism","accusative-definite-nominative":"neokeynesismul","dative-genitive-indefinite":"neokeynesism","dative-definite-genitive":"neokeynesismului","vocative":"neokeynesismule"}},{"word":"neolamarckism","pos":"noun","definitions":["Neo-Lamarckism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neolamarckism","accusative-definite-nominative":"neolamarckismul","dative-genitive-indefinite":"neolamarckism","dative-definite-genitive":"neolamarckismului","vocative":"neolamarckismule"}},{"word":"neolatin","pos":"adj","definitions":["New Latin"],"forms":{"feminine-singular":"neolatină","masculine-plural":"neolatini","feminine-neuter-plural":"neolatine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neolatin","error-unrecognized-form-feminine-indefinite-singular":"neolatină","error-unrecognized-form-indefinite-masculine-plural":"neolatini","error-unrecognized-form-feminine-indefinite-neuter-plural":"neolatine","definite-error-unrecognized-form-masculine-neuter-singular":"neolatinul","definite-error-unrecognized-form-feminine-singular":"neolatina","definite-error-unrecognized-form-masculine-plural":"neolatinii","definite-error-unrecognized-form-feminine-neuter-plural":"neolatinele"}},{"word":"neoliberal","pos":"adj","definitions":["neoliberal"],"forms":{"feminine-singular":"neoliberală","masculine-plural":"neoliberali","feminine-neuter-plural":"neoliberale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neoliberal","error-unrecognized-form-feminine-indefinite-singular":"neoliberală","error-unrecognized-form-indefinite-masculine-plural":"neoliberali","error-unrecognized-form-feminine-indefinite-neuter-plural":"neoliberale","definite-error-unrecognized-form-masculine-neuter-singular":"neoliberalul","definite-error-unrecognized-form-feminine-singular":"neoliberala","definite-error-unrecognized-form-masculine-plural":"neoliberalii","definite-error-unrecognized-form-feminine-neuter-plural":"neoliberalele"}},{"word":"neoliberal","pos":"noun","definitions":["neoliberal"],"forms":{"plural":"neoliberali","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neoliberal","accusative-definite-nominative-singular":"neoliberalul","accusative-indefinite-nominative-plural":"neoliberali","accusative-definite-nominative-plural":"neoliberalii","dative-genitive-indefinite-singular":"neoliberal","dative-definite-genitive-singular":"neoliberalului","dative-genitive-indefinite-plural":"neoliberali","dative-definite-genitive-plural":"neoliberalilor","singular-vocative":"neoliberalule","plural-vocative":"neoliberalilor"}},{"word":"neoliberală","pos":"noun","definitions":["female equivalent of neoliberal"],"forms":{"plural":"neoliberale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neoliberală","accusative-definite-nominative-singular":"neoliberala","accusative-indefinite-nominative-plural":"neoliberale","accusative-definite-nominative-plural":"neoliberalele","dative-genitive-indefinite-singular":"neoliberale","dative-definite-genitive-singular":"neoliberalei","dative-genitive-indefinite-plural":"neoliberale","dative-definite-genitive-plural":"neoliberalelor","singular-vocative":"neoliberală","plural-vocative":"neoliberalelor"}},{"word":"neoliberalism","pos":"noun","definitions":["neoliberalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neoliberalism","accusative-definite-nominative-singular":"neoliberalismul","accusative-indefinite-nominative-plural":"neoliberalisme","accusative-definite-nominative-plural":"neoliberalismele","dative-genitive-indefinite-singular":"neoliberalism","dative-definite-genitive-singular":"neoliberalismului","dative-genitive-indefinite-plural":"neoliberalisme","dative-definite-genitive-plural":"neoliberalismelor","singular-vocative":"neoliberalismule","plural-vocative":"neoliberalismelor"}},{"word":"neolimpic","pos":"adj","definitions":["non-Olympic"],"forms":{"feminine-singular":"neolimpică","masculine-plural":"neolimpici","feminine-neuter-plural":"neolimpice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neolimpic","error-unrecognized-form-feminine-indefinite-singular":"neolimpică","error-unrecognized-form-indefinite-masculine-plural":"neolimpici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neolimpice","definite-error-unrecognized-form-masculine-neuter-singular":"neolimpicul","definite-error-unrecognized-form-feminine-singular":"neolimpica","definite-error-unrecognized-form-masculine-plural":"neolimpicii","definite-error-unrecognized-form-feminine-neuter-plural":"neolimpicele"}},{"word":"neolingvist","pos":"noun","definitions":["neolinguist"],"forms":{"plural":"neolingviști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neolingvist","accusative-definite-nominative-singular":"neolingvistul","accusative-indefinite-nominative-plural":"neolingviști","accusative-definite-nominative-plural":"neolingviștii","dative-genitive-indefinite-singular":"neolingvist","dative-definite-genitive-singular":"neolingvistului","dative-genitive-indefinite-plural":"neolingviști","dative-definite-genitive-plural":"neolingviștilor","singular-vocative":"neolingvistule","plural-vocative":"neolingviștilor"}},{"word":"neolingvistă","pos":"noun","definitions":["female equivalent of neolingvist"],"forms":{"plural":"neolingviste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neolingvistă","accusative-definite-nominative-singular":"neolingvista","accusative-indefinite-nominative-plural":"neolingviste","accusative-definite-nominative-plural":"neolingvistele","dative-genitive-indefinite-singular":"neolingviste","dative-definite-genitive-singular":"neolingvistei","dative-genitive-indefinite-plural":"neolingviste","dative-definite-genitive-plural":"neolingvistelor","singular-vocative":"neolingvistă","plural-vocative":"neolingvistelor"}},{"word":"neolingvistică","pos":"noun","definitions":["neolinguistics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neolingvistică","accusative-definite-nominative-singular":"neolingvistica","accusative-indefinite-nominative-plural":"neolingvistice","accusative-definite-nominative-plural":"neolingvisticele","dative-genitive-indefinite-singular":"neolingvistice","dative-definite-genitive-singular":"neolingvisticei","dative-genitive-indefinite-plural":"neolingvistice","dative-definite-genitive-plural":"neolingvisticelor","singular-vocative":"neolingvistică","plural-vocative":"neolingvisticelor"}},{"word":"neolitic","pos":"noun","definitions":["neolithic"],"forms":{"plural":"neolitici","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neolitic","accusative-definite-nominative-singular":"neoliticul","accusative-indefinite-nominative-plural":"neolitici","accusative-definite-nominative-plural":"neoliticile","dative-genitive-indefinite-singular":"neolitic","dative-definite-genitive-singular":"neoliticului","dative-genitive-indefinite-plural":"neolitici","dative-definite-genitive-plural":"neoliticilor","singular-vocative":"neoliticule","plural-vocative":"neoliticilor"}},{"word":"neolog","pos":"noun","definitions":["neologist"],"forms":{"plural":"neologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neolog","accusative-definite-nominative-singular":"neologul","accusative-indefinite-nominative-plural":"neologi","accusative-definite-nominative-plural":"neologii","dative-genitive-indefinite-singular":"neolog","dative-definite-genitive-singular":"neologului","dative-genitive-indefinite-plural":"neologi","dative-definite-genitive-plural":"neologilor","singular-vocative":"neologule","plural-vocative":"neologilor"}},{"word":"neologic","pos":"adj","definitions":["neological"],"forms":{"feminine-singular":"neologică","masculine-plural":"neologici","feminine-neuter-plural":"neologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neologic","error-unrecognized-form-feminine-indefinite-singular":"neologică","error-unrecognized-form-indefinite-masculine-plural":"neologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neologice","definite-error-unrecognized-form-masculine-neuter-singular":"neologicul","definite-error-unrecognized-form-feminine-singular":"neologica","definite-error-unrecognized-form-masculine-plural":"neologicii","definite-error-unrecognized-form-feminine-neuter-plural":"neologicele"}},{"word":"neologie","pos":"noun","definitions":["neology"],"forms":{"plural":"neologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neologie","accusative-definite-nominative-singular":"neologia","accusative-indefinite-nominative-plural":"neologii","accusative-definite-nominative-plural":"neologiile","dative-genitive-indefinite-singular":"neologii","dative-definite-genitive-singular":"neologiei","dative-genitive-indefinite-plural":"neologii","dative-definite-genitive-plural":"neologiilor","singular-vocative":"neologie","plural-vocative":"neologiilor"}},{"word":"neologism","pos":"noun","definitions":["neologism"],"forms":{"plural":"neologisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neologism","accusative-definite-nominative-singular":"neologismul","accusative-indefinite-nominative-plural":"neologisme","accusative-definite-nominative-plural":"neologismele","dative-genitive-indefinite-singular":"neologism","dative-definite-genitive-singular":"neologismului","dative-genitive-indefinite-plural":"neologisme","dative-definite-genitive-plural":"neologismelor","singular-vocative":"neologismule","plural-vocative":"neologismelor"}},{"word":"neologist","pos":"noun","definitions":["neologist"],"forms":{"plural":"neologiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neologist","accusative-definite-nominative-singular":"neologistul","accusative-indefinite-nominative-plural":"neologiști","accusative-definite-nominative-plural":"neologiștii","dative-genitive-indefinite-singular":"neologist","dative-definite-genitive-singular":"neologistului","dative-genitive-indefinite-plural":"neologiști","dative-definite-genitive-plural":"neologiștilor","singular-vocative":"neologistule","plural-vocative":"neologiștilor"}},{"word":"neologistic","pos":"adj","definitions":["neologistic"],"forms":{"feminine-singular":"neologistică","masculine-plural":"neologistici","feminine-neuter-plural":"neologistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neologistic","error-unrecognized-form-feminine-indefinite-singular":"neologistică","error-unrecognized-form-indefinite-masculine-plural":"neologistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neologistice","definite-error-unrecognized-form-masculine-neuter-singular":"neologisticul","definite-error-unrecognized-form-feminine-singular":"neologistica","definite-error-unrecognized-form-masculine-plural":"neologisticii","definite-error-unrecognized-form-feminine-neuter-plural":"neologisticele"}},{"word":"neologiza","pos":"verb","definitions":["to neologize"],"forms":{"canonical":"a neologiza 1st conjugation","present-singular-third-person":"neologizează","participle-past":"neologizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a neologiza","gerund":"neologizând","first-person-indicative-present-singular":"neologizez","indicative-present-second-person-singular":"neologizezi","indicative-present-singular-third-person":"neologizează","first-person-indicative-plural-present":"neologizăm","indicative-plural-present-second-person":"neologizați","indicative-plural-present-third-person":"neologizează","first-person-imperfect-indicative-singular":"neologizam","imperfect-indicative-second-person-singular":"neologizai","imperfect-indicative-singular-third-person":"neologiza","first-person-imperfect-indicative-plural":"neologizam","imperfect-indicative-plural-second-person":"neologizați","imperfect-indicative-plural-third-person":"neologizau","first-person-indicative-perfect-singular":"neologizai","indicative-perfect-second-person-singular":"neologizași","indicative-perfect-singular-third-person":"neologiză","first-person-indicative-perfect-plural":"neologizarăm","indicative-perfect-plural-second-person":"neologizarăți","indicative-perfect-plural-third-person":"neologizară","first-person-indicative-pluperfect-singular":"neologizasem","indicative-pluperfect-second-person-singular":"neologizaseși","indicative-pluperfect-singular-third-person":"neologizase","first-person-indicative-pluperfect-plural":"neologizaserăm","indicative-pluperfect-plural-second-person":"neologizaserăți","indicative-pluperfect-plural-third-person":"neologizaseră","first-person-present-singular-subjunctive":"să neologizez","present-second-person-singular-subjunctive":"să neologizezi","present-singular-subjunctive-third-person":"să neologizeze","first-person-plural-present-subjunctive":"să neologizăm","plural-present-second-person-subjunctive":"să neologizați","plural-present-subjunctive-third-person":"să neologizeze","imperative-second-person-singular":"neologizează","imperative-plural-second-person":"neologizați","imperative-negative-second-person-singular":"nu neologiza","imperative-negative-plural-second-person":"nu neologizați"}},{"word":"neom","pos":"noun","definitions":["monster, evil or wicked person, person without humanity","nonentity, insane person"],"forms":{"plural":"neoameni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neom","accusative-definite-nominative-singular":"neomul","accusative-indefinite-nominative-plural":"neoameni","accusative-definite-nominative-plural":"neoamenii","dative-genitive-indefinite-singular":"neom","dative-definite-genitive-singular":"neomului","dative-genitive-indefinite-plural":"neoameni","dative-definite-genitive-plural":"neoamenilor","singular-vocative":"neomule","plural-vocative":"neoamenilor"}},{"word":"neomalthusian","pos":"noun","definitions":["neo-Malthusian"],"forms":{"plural":"neomalthusieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neomalthusian","accusative-definite-nominative-singular":"neomalthusianul","accusative-indefinite-nominative-plural":"neomalthusieni","accusative-definite-nominative-plural":"neomalthusienii","dative-genitive-indefinite-singular":"neomalthusian","dative-definite-genitive-singular":"neomalthusianului","dative-genitive-indefinite-plural":"neomalthusieni","dative-definite-genitive-plural":"neomalthusienilor","singular-vocative":"neomalthusianule","plural-vocative":"neomalthusienilor"}},{"word":"neomalthusiană","pos":"noun","definitions":["female equivalent of neomalthusian"],"forms":{"plural":"neomalthusiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neomalthusiană","accusative-definite-nominative-singular":"neomalthusiana","accusative-indefinite-nominative-plural":"neomalthusiene","accusative-definite-nominative-plural":"neomalthusienele","dative-genitive-indefinite-singular":"neomalthusiene","dative-definite-genitive-singular":"neomalthusienei","dative-genitive-indefinite-plural":"neomalthusiene","dative-definite-genitive-plural":"neomalthusienelor","singular-vocative":"neomalthusiană","plural-vocative":"neomalthusienelor"}},{"word":"neomalthusianism","pos":"noun","definitions":["Neo-Malthusianism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neomalthusianism","accusative-definite-nominative-singular":"neomalthusianismul","accusative-indefinite-nominative-plural":"neomalthusianisme","accusative-definite-nominative-plural":"neomalthusianismele","dative-genitive-indefinite-singular":"neomalthusianism","dative-definite-genitive-singular":"neomalthusianismului","dative-genitive-indefinite-plural":"neomalthusianisme","dative-definite-genitive-plural":"neomalthusianismelor","singular-vocative":"neomalthusianismule","plural-vocative":"neomalthusianismelor"}},{"word":"neomalthusianist","pos":"noun","definitions":["new Malthusian"],"forms":{"plural":"neomaltusianiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neomalthusianist","accusative-definite-nominative-singular":"neomalthusianistul","accusative-indefinite-nominative-plural":"neomalthusianisti","accusative-definite-nominative-plural":"neomalthusianistii","dative-genitive-indefinite-singular":"neomalthusianist","dative-definite-genitive-singular":"neomalthusianistului","dative-genitive-indefinite-plural":"neomalthusianisti","dative-definite-genitive-plural":"neomalthusianistilor","singular-vocative":"neomalthusianistule","plural-vocative":"neomalthusianistilor"}},{"word":"neomalthusianistă","pos":"noun","definitions":["female equivalent of neomalthusianist"],"forms":{"plural":"neomalthusianiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neomalthusianistă","accusative-definite-nominative-singular":"neomalthusianista","accusative-indefinite-nominative-plural":"neomalthusianiste","accusative-definite-nominative-plural":"neomalthusianistele","dative-genitive-indefinite-singular":"neomalthusianiste","dative-definite-genitive-singular":"neomalthusianistei","dative-genitive-indefinite-plural":"neomalthusianiste","dative-definite-genitive-plural":"neomalthusianistelor","singular-vocative":"neomalthusianistă","plural-vocative":"neomalthusianistelor"}},{"word":"neomenesc","pos":"adj","definitions":["inhuman, cruel"],"pronunciation":"/ˌne.o.meˈnesk/","forms":{"feminine-singular":"neomenească","plural":"neomenești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neomenesc","error-unrecognized-form-feminine-indefinite-singular":"neomenească","error-unrecognized-form-indefinite-masculine-plural":"neomenești","error-unrecognized-form-feminine-indefinite-neuter-plural":"neomenești","definite-error-unrecognized-form-masculine-neuter-singular":"neomenescul","definite-error-unrecognized-form-feminine-singular":"neomeneasca","definite-error-unrecognized-form-masculine-plural":"neomeneștii","definite-error-unrecognized-form-feminine-neuter-plural":"neomeneștile"}},{"word":"neomenește","pos":"adv","definitions":["inhumanly","indecently, improperly"],"pronunciation":"[ne.o.meˈneʃ.te]"},{"word":"neomenie","pos":"noun","definitions":["brutality"],"forms":{"plural":"neomenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neomenie","accusative-definite-nominative-singular":"neomenia","accusative-indefinite-nominative-plural":"neomenii","accusative-definite-nominative-plural":"neomeniile","dative-genitive-indefinite-singular":"neomenii","dative-definite-genitive-singular":"neomeniei","dative-genitive-indefinite-plural":"neomenii","dative-definite-genitive-plural":"neomeniilor","singular-vocative":"neomenie","plural-vocative":"neomeniilor"}},{"word":"neomenime","pos":"noun","definitions":["ruthlessness"],"forms":{"plural":"neomenimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neomenime","accusative-definite-nominative-singular":"neomenimea","accusative-indefinite-nominative-plural":"neomenimi","accusative-definite-nominative-plural":"neomenimile","dative-genitive-indefinite-singular":"neomenimi","dative-definite-genitive-singular":"neomenimii","dative-genitive-indefinite-plural":"neomenimi","dative-definite-genitive-plural":"neomenimilor","singular-vocative":"neomenime","plural-vocative":"neomenimilor"}},{"word":"neomenire","pos":"noun","definitions":["inhumanity"],"forms":{"plural":"neomeniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neomenire","accusative-definite-nominative-singular":"neomenirea","accusative-indefinite-nominative-plural":"neomeniri","accusative-definite-nominative-plural":"neomenirile","dative-genitive-indefinite-singular":"neomeniri","dative-definite-genitive-singular":"neomenirii","dative-genitive-indefinite-plural":"neomeniri","dative-definite-genitive-plural":"neomenirilor","singular-vocative":"neomenire","plural-vocative":"neomenirilor"}},{"word":"neomenit","pos":"adj","definitions":["ruthless, merciless"],"forms":{"feminine-singular":"neomenită","masculine-plural":"neomeniți","feminine-neuter-plural":"neomenite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neomenit","error-unrecognized-form-feminine-indefinite-singular":"neomenită","error-unrecognized-form-indefinite-masculine-plural":"neomeniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neomenite","definite-error-unrecognized-form-masculine-neuter-singular":"neomenitul","definite-error-unrecognized-form-feminine-singular":"neomenita","definite-error-unrecognized-form-masculine-plural":"neomeniții","definite-error-unrecognized-form-feminine-neuter-plural":"neomenitele"}},{"word":"neomenos","pos":"adj","definitions":["ruthless"],"forms":{"feminine-singular":"neomenoasă","masculine-plural":"neomenoși","feminine-neuter-plural":"neomenoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neomenos","error-unrecognized-form-feminine-indefinite-singular":"neomenoasă","error-unrecognized-form-indefinite-masculine-plural":"neomenoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"neomenoase","definite-error-unrecognized-form-masculine-neuter-singular":"neomenosul","definite-error-unrecognized-form-feminine-singular":"neomenoasa","definite-error-unrecognized-form-masculine-plural":"neomenoșii","definite-error-unrecognized-form-feminine-neuter-plural":"neomenoasele"}},{"word":"neomicină","pos":"noun","definitions":["neomycin"],"forms":{"plural":"neomicine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neomicină","accusative-definite-nominative-singular":"neomicina","accusative-indefinite-nominative-plural":"neomicine","accusative-definite-nominative-plural":"neomicinele","dative-genitive-indefinite-singular":"neomicine","dative-definite-genitive-singular":"neomicinei","dative-genitive-indefinite-plural":"neomicine","dative-definite-genitive-plural":"neomicinelor","singular-vocative":"neomicină","plural-vocative":"neomicinelor"}},{"word":"neon","pos":"noun","definitions":["neon (chemical element)"],"pronunciation":"/neˈon/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neon","accusative-definite-nominative":"neonul","dative-genitive-indefinite":"neon","dative-definite-genitive":"neonului","vocative":"neonule"}},{"word":"neonatologă","pos":"noun","definitions":["female equivalent of neonatolog"],"forms":{"plural":"neonatologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neonatologă","accusative-definite-nominative-singular":"neonatologa","accusative-indefinite-nominative-plural":"neonatologe","accusative-definite-nominative-plural":"neonatologele","dative-genitive-indefinite-singular":"neonatologe","dative-definite-genitive-singular":"neonatologei","dative-genitive-indefinite-plural":"neonatologe","dative-definite-genitive-plural":"neonatologelor","singular-vocative":"neonatologă","plural-vocative":"neonatologelor"}},{"word":"neonatologie","pos":"noun","definitions":["neonatology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"neonatologie","accusative-definite-nominative":"neonatologia","dative-genitive-indefinite":"neonatologii","dative-definite-genitive":"neonatologiei","vocative":"neonatologie"}},{"word":"neonazism","pos":"noun","definitions":["neo-Nazism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neonazism","accusative-definite-nominative":"neonazismul","dative-genitive-indefinite":"neonazism","dative-definite-genitive":"neonazismului","vocative":"neonazismule"}},{"word":"neonazist","pos":"adj","definitions":["neo-Nazi"],"forms":{"feminine-singular":"neonazistă","masculine-plural":"neonaziști","feminine-neuter-plural":"neonaziste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neonazist","error-unrecognized-form-feminine-indefinite-singular":"neonazistă","error-unrecognized-form-indefinite-masculine-plural":"neonaziști","error-unrecognized-form-feminine-indefinite-neuter-plural":"neonaziste","definite-error-unrecognized-form-masculine-neuter-singular":"neonazistul","definite-error-unrecognized-form-feminine-singular":"neonazista","definite-error-unrecognized-form-masculine-plural":"neonaziștii","definite-error-unrecognized-form-feminine-neuter-plural":"neonazistele"}},{"word":"neonazist","pos":"noun","definitions":["neo-Nazi"],"forms":{"plural":"neonaziști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neonazist","accusative-definite-nominative-singular":"neonazistul","accusative-indefinite-nominative-plural":"neonaziști","accusative-definite-nominative-plural":"neonaziștii","dative-genitive-indefinite-singular":"neonazist","dative-definite-genitive-singular":"neonazistului","dative-genitive-indefinite-plural":"neonaziști","dative-definite-genitive-plural":"neonaziștilor","singular-vocative":"neonazistule","plural-vocative":"neonaziștilor"}},{"word":"neonazistă","pos":"noun","definitions":["female equivalent of neonazist"],"forms":{"plural":"neonaziste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neonazistă","accusative-definite-nominative-singular":"neonazista","accusative-indefinite-nominative-plural":"neonaziste","accusative-definite-nominative-plural":"neonazistele","dative-genitive-indefinite-singular":"neonaziste","dative-definite-genitive-singular":"neonazistei","dative-genitive-indefinite-plural":"neonaziste","dative-definite-genitive-plural":"neonazistelor","singular-vocative":"neonazistă","plural-vocative":"neonazistelor"}},{"word":"neopăgânism","pos":"noun","definitions":["neopaganism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neopăgânism","accusative-definite-nominative":"neopăgânismul","dative-genitive-indefinite":"neopăgânism","dative-definite-genitive":"neopăgânismului","vocative":"neopăgânismule"}},{"word":"neoperabil","pos":"adj","definitions":["inoperable"],"forms":{"feminine-singular":"neoperabilă","masculine-plural":"neoperabili","feminine-neuter-plural":"neoperabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neoperabil","error-unrecognized-form-feminine-indefinite-singular":"neoperabilă","error-unrecognized-form-indefinite-masculine-plural":"neoperabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neoperabile","definite-error-unrecognized-form-masculine-neuter-singular":"neoperabilul","definite-error-unrecognized-form-feminine-singular":"neoperabila","definite-error-unrecognized-form-masculine-plural":"neoperabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neoperabilele"}},{"word":"neopitagorician","pos":"adj","definitions":["Neopythagorean"],"forms":{"feminine-singular":"neopitagoriciană","masculine-plural":"neopitagoricieni","feminine-neuter-plural":"neopitagoriciene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neopitagorician","error-unrecognized-form-feminine-indefinite-singular":"neopitagoriciană","error-unrecognized-form-indefinite-masculine-plural":"neopitagoricieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"neopitagoriciene","definite-error-unrecognized-form-masculine-neuter-singular":"neopitagoricianul","definite-error-unrecognized-form-feminine-singular":"neopitagoriciana","definite-error-unrecognized-form-masculine-plural":"neopitagoricienii","definite-error-unrecognized-form-feminine-neuter-plural":"neopitagoricienele"}},{"word":"neopitagorician","pos":"noun","definitions":["Neopythagorean"],"forms":{"plural":"neopitagoricieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neopitagorician","accusative-definite-nominative-singular":"neopitagoricianul","accusative-indefinite-nominative-plural":"neopitagoricieni","accusative-definite-nominative-plural":"neopitagoricienii","dative-genitive-indefinite-singular":"neopitagorician","dative-definite-genitive-singular":"neopitagoricianului","dative-genitive-indefinite-plural":"neopitagoricieni","dative-definite-genitive-plural":"neopitagoricienilor","singular-vocative":"neopitagoricianule","plural-vocative":"neopitagoricienilor"}},{"word":"neopitagorism","pos":"noun","definitions":["Neopythagoreanism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neopitagorism","accusative-definite-nominative":"neopitagorismul","dative-genitive-indefinite":"neopitagorism","dative-definite-genitive":"neopitagorismului","vocative":"neopitagorismule"}},{"word":"neoplasm","pos":"noun","definitions":["neoplasm"],"forms":{"plural":"neoplasme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neoplasm","accusative-definite-nominative-singular":"neoplasmul","accusative-indefinite-nominative-plural":"neoplasme","accusative-definite-nominative-plural":"neoplasmele","dative-genitive-indefinite-singular":"neoplasm","dative-definite-genitive-singular":"neoplasmului","dative-genitive-indefinite-plural":"neoplasme","dative-definite-genitive-plural":"neoplasmelor","singular-vocative":"neoplasmule","plural-vocative":"neoplasmelor"}},{"word":"neoplasticism","pos":"noun","definitions":["neoplasticism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neoplasticism","accusative-definite-nominative":"neoplasticismul","dative-genitive-indefinite":"neoplasticism","dative-definite-genitive":"neoplasticismului","vocative":"neoplasticismule"}},{"word":"neoplatonic","pos":"adj","definitions":["Neoplatonic"],"forms":{"feminine-singular":"neoplatonică","masculine-plural":"neoplatonici","feminine-neuter-plural":"neoplatonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neoplatonic","error-unrecognized-form-feminine-indefinite-singular":"neoplatonică","error-unrecognized-form-indefinite-masculine-plural":"neoplatonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neoplatonice","definite-error-unrecognized-form-masculine-neuter-singular":"neoplatonicul","definite-error-unrecognized-form-feminine-singular":"neoplatonica","definite-error-unrecognized-form-masculine-plural":"neoplatonicii","definite-error-unrecognized-form-feminine-neuter-plural":"neoplatonicele"}},{"word":"neoplatonic","pos":"noun","definitions":["supporter of Neoplatonism"],"forms":{"plural":"neoplatonici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neoplatonic","accusative-definite-nominative-singular":"neoplatonicul","accusative-indefinite-nominative-plural":"neoplatonici","accusative-definite-nominative-plural":"neoplatonicii","dative-genitive-indefinite-singular":"neoplatonic","dative-definite-genitive-singular":"neoplatonicului","dative-genitive-indefinite-plural":"neoplatonici","dative-definite-genitive-plural":"neoplatonicilor","singular-vocative":"neoplatonicule","plural-vocative":"neoplatonicilor"}},{"word":"neoplatonică","pos":"noun","definitions":["female equivalent of neoplatonic"],"forms":{"plural":"neoplatonice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neoplatonică","accusative-definite-nominative-singular":"neoplatonica","accusative-indefinite-nominative-plural":"neoplatonice","accusative-definite-nominative-plural":"neoplatonicele","dative-genitive-indefinite-singular":"neoplatonice","dative-definite-genitive-singular":"neoplatonicei","dative-genitive-indefinite-plural":"neoplatonice","dative-definite-genitive-plural":"neoplatonicelor","singular-vocative":"neoplatonică","plural-vocative":"neoplatonicelor"}},{"word":"neoplatonician","pos":"noun","definitions":["Neoplatonic"],"forms":{"plural":"neoplatonicieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neoplatonician","accusative-definite-nominative-singular":"neoplatonicianul","accusative-indefinite-nominative-plural":"neoplatonicieni","accusative-definite-nominative-plural":"neoplatonicienii","dative-genitive-indefinite-singular":"neoplatonician","dative-definite-genitive-singular":"neoplatonicianului","dative-genitive-indefinite-plural":"neoplatonicieni","dative-definite-genitive-plural":"neoplatonicienilor","singular-vocative":"neoplatonicianule","plural-vocative":"neoplatonicienilor"}},{"word":"neoplatoniciană","pos":"noun","definitions":["female equivalent of neoplatonician"],"forms":{"plural":"neoplatoniciene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neoplatoniciană","accusative-definite-nominative-singular":"neoplatoniciana","accusative-indefinite-nominative-plural":"neoplatoniciene","accusative-definite-nominative-plural":"neoplatonicienele","dative-genitive-indefinite-singular":"neoplatoniciene","dative-definite-genitive-singular":"neoplatonicienei","dative-genitive-indefinite-plural":"neoplatoniciene","dative-definite-genitive-plural":"neoplatonicienelor","singular-vocative":"neoplatoniciană","plural-vocative":"neoplatonicienelor"}},{"word":"neoplatonism","pos":"noun","definitions":["Neoplatonism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neoplatonism","accusative-definite-nominative-singular":"neoplatonismul","accusative-indefinite-nominative-plural":"neoplatonisme","accusative-definite-nominative-plural":"neoplatonismele","dative-genitive-indefinite-singular":"neoplatonism","dative-definite-genitive-singular":"neoplatonismului","dative-genitive-indefinite-plural":"neoplatonisme","dative-definite-genitive-plural":"neoplatonismelor","singular-vocative":"neoplatonismule","plural-vocative":"neoplatonismelor"}},{"word":"neoplazic","pos":"adj","definitions":["neoplastic"],"forms":{"feminine-singular":"neoplazică","masculine-plural":"neoplazici","feminine-neuter-plural":"neoplazice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neoplazic","error-unrecognized-form-feminine-indefinite-singular":"neoplazică","error-unrecognized-form-indefinite-masculine-plural":"neoplazici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neoplazice","definite-error-unrecognized-form-masculine-neuter-singular":"neoplazicul","definite-error-unrecognized-form-feminine-singular":"neoplazica","definite-error-unrecognized-form-masculine-plural":"neoplazicii","definite-error-unrecognized-form-feminine-neuter-plural":"neoplazicele"}},{"word":"neoplazie","pos":"noun","definitions":["neoplasia"],"forms":{"plural":"neoplazii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neoplazie","accusative-definite-nominative-singular":"neoplazia","accusative-indefinite-nominative-plural":"neoplazii","accusative-definite-nominative-plural":"neoplaziile","dative-genitive-indefinite-singular":"neoplazii","dative-definite-genitive-singular":"neoplaziei","dative-genitive-indefinite-plural":"neoplazii","dative-definite-genitive-plural":"neoplaziilor","singular-vocative":"neoplazie","plural-vocative":"neoplaziilor"}},{"word":"neoportun","pos":"adj","definitions":["inopportune"],"forms":{"feminine-singular":"neoportună","masculine-plural":"neoportuni","feminine-neuter-plural":"neoportune","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neoportun","error-unrecognized-form-feminine-indefinite-singular":"neoportună","error-unrecognized-form-indefinite-masculine-plural":"neoportuni","error-unrecognized-form-feminine-indefinite-neuter-plural":"neoportune","definite-error-unrecognized-form-masculine-neuter-singular":"neoportunul","definite-error-unrecognized-form-feminine-singular":"neoportuna","definite-error-unrecognized-form-masculine-plural":"neoportunii","definite-error-unrecognized-form-feminine-neuter-plural":"neoportunele"}},{"word":"neopozabil","pos":"adj","definitions":["nonopposable"],"forms":{"feminine-singular":"neopozabilă","masculine-plural":"neopozabili","feminine-neuter-plural":"neopozabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neopozabil","error-unrecognized-form-feminine-indefinite-singular":"neopozabilă","error-unrecognized-form-indefinite-masculine-plural":"neopozabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neopozabile","definite-error-unrecognized-form-masculine-neuter-singular":"neopozabilul","definite-error-unrecognized-form-feminine-singular":"neopozabila","definite-error-unrecognized-form-masculine-plural":"neopozabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neopozabilele"}},{"word":"neopozitivism","pos":"noun","definitions":["neopositivism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neopozitivism","accusative-definite-nominative-singular":"neopozitivismul","accusative-indefinite-nominative-plural":"neopozitivisme","accusative-definite-nominative-plural":"neopozitivismele","dative-genitive-indefinite-singular":"neopozitivism","dative-definite-genitive-singular":"neopozitivismului","dative-genitive-indefinite-plural":"neopozitivisme","dative-definite-genitive-plural":"neopozitivismelor","singular-vocative":"neopozitivismule","plural-vocative":"neopozitivismelor"}},{"word":"neopozitivist","pos":"noun","definitions":["neo-positivist"],"forms":{"plural":"neopozitiviști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neopozitivist","accusative-definite-nominative-singular":"neopozitivistul","accusative-indefinite-nominative-plural":"neopozitiviști","accusative-definite-nominative-plural":"neopozitiviștii","dative-genitive-indefinite-singular":"neopozitivist","dative-definite-genitive-singular":"neopozitivistului","dative-genitive-indefinite-plural":"neopozitiviști","dative-definite-genitive-plural":"neopozitiviștilor","singular-vocative":"neopozitivistule","plural-vocative":"neopozitiviștilor"}},{"word":"neopozitivistă","pos":"noun","definitions":["female equivalent of neopozitivist"],"forms":{"plural":"neopozitiviste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neopozitivistă","accusative-definite-nominative-singular":"neopozitivista","accusative-indefinite-nominative-plural":"neopozitiviste","accusative-definite-nominative-plural":"neopozitivistele","dative-genitive-indefinite-singular":"neopozitiviste","dative-definite-genitive-singular":"neopozitivistei","dative-genitive-indefinite-plural":"neopozitiviste","dative-definite-genitive-plural":"neopozitivistelor","singular-vocative":"neopozitivistă","plural-vocative":"neopozitivistelor"}},{"word":"neopragmatism","pos":"noun","definitions":["neopragmatism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neopragmatism","accusative-definite-nominative":"neopragmatismul","dative-genitive-indefinite":"neopragmatism","dative-definite-genitive":"neopragmatismului","vocative":"neopragmatismule"}},{"word":"neopren","pos":"noun","definitions":["neoprene"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neopren","accusative-definite-nominative":"neoprenul","dative-genitive-indefinite":"neopren","dative-definite-genitive":"neoprenului","vocative":"neoprenule"}},{"word":"neoprit","pos":"adj","definitions":["unstoppable"],"forms":{"feminine-singular":"neoprită","masculine-plural":"neopriți","feminine-neuter-plural":"neoprite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neoprit","error-unrecognized-form-feminine-indefinite-singular":"neoprită","error-unrecognized-form-indefinite-masculine-plural":"neopriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neoprite","definite-error-unrecognized-form-masculine-neuter-singular":"neopritul","definite-error-unrecognized-form-feminine-singular":"neoprita","definite-error-unrecognized-form-masculine-plural":"neopriții","definite-error-unrecognized-form-feminine-neuter-plural":"neopritele"}},{"word":"neopsihanaliză","pos":"noun","definitions":["neo-freudianism"],"forms":{"plural":"neopsihanalize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neopsihanaliză","accusative-definite-nominative-singular":"neopsihanaliza","accusative-indefinite-nominative-plural":"neopsihanalize","accusative-definite-nominative-plural":"neopsihanalizele","dative-genitive-indefinite-singular":"neopsihanalize","dative-definite-genitive-singular":"neopsihanalizei","dative-genitive-indefinite-plural":"neopsihanalize","dative-definite-genitive-plural":"neopsihanalizelor","singular-vocative":"neopsihanaliză","plural-vocative":"neopsihanalizelor"}},{"word":"neorânduială","pos":"noun","definitions":["disorder"],"forms":{"plural":"neorânduieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"neorânduială","accusative-definite-nominative-singular":"neorânduiala","accusative-indefinite-nominative-plural":"neorânduieli","accusative-definite-nominative-plural":"neorânduielile","dative-genitive-indefinite-singular":"neorânduieli","dative-definite-genitive-singular":"neorânduielii","dative-genitive-indefinite-plural":"neorânduieli","dative-definite-genitive-plural":"neorânduielilor","singular-vocative":"neorânduială","plural-vocative":"neorânduielilor"}},{"word":"neorânduit","pos":"adj","definitions":["disorderly"],"forms":{"feminine-singular":"neorânduită","masculine-plural":"neorânduiți","feminine-neuter-plural":"neorânduite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neorânduit","error-unrecognized-form-feminine-indefinite-singular":"neorânduită","error-unrecognized-form-indefinite-masculine-plural":"neorânduiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neorânduite","definite-error-unrecognized-form-masculine-neuter-singular":"neorânduitul","definite-error-unrecognized-form-feminine-singular":"neorânduita","definite-error-unrecognized-form-masculine-plural":"neorânduiții","definite-error-unrecognized-form-feminine-neuter-plural":"neorânduitele"}},{"word":"neordine","pos":"noun","definitions":["unordained"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neordine","accusative-definite-nominative":"neordinea","dative-genitive-indefinite":"neordini","dative-definite-genitive":"neordinii","vocative":"neordine"}},{"word":"neorealism","pos":"noun","definitions":["neorealism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neorealism","accusative-definite-nominative":"neorealismul","dative-genitive-indefinite":"neorealism","dative-definite-genitive":"neorealismului","vocative":"neorealismule"}},{"word":"neorealist","pos":"noun","definitions":["neorealist"],"forms":{"plural":"neorealiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neorealist","accusative-definite-nominative-singular":"neorealistul","accusative-indefinite-nominative-plural":"neorealiști","accusative-definite-nominative-plural":"neorealiștii","dative-genitive-indefinite-singular":"neorealist","dative-definite-genitive-singular":"neorealistului","dative-genitive-indefinite-plural":"neorealiști","dative-definite-genitive-plural":"neorealiștilor","singular-vocative":"neorealistule","plural-vocative":"neorealiștilor"}},{"word":"neorealistă","pos":"noun","definitions":["female equivalent of neorealist"],"forms":{"plural":"neorealiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neorealistă","accusative-definite-nominative-singular":"neorealista","accusative-indefinite-nominative-plural":"neorealiste","accusative-definite-nominative-plural":"neorealistele","dative-genitive-indefinite-singular":"neorealiste","dative-definite-genitive-singular":"neorealistei","dative-genitive-indefinite-plural":"neorealiste","dative-definite-genitive-plural":"neorealistelor","singular-vocative":"neorealistă","plural-vocative":"neorealistelor"}},{"word":"neorganic","pos":"adj","definitions":["nonorganic"],"forms":{"feminine-singular":"neorganică","masculine-plural":"neorganici","feminine-neuter-plural":"neorganice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neorganic","error-unrecognized-form-feminine-indefinite-singular":"neorganică","error-unrecognized-form-indefinite-masculine-plural":"neorganici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neorganice","definite-error-unrecognized-form-masculine-neuter-singular":"neorganicul","definite-error-unrecognized-form-feminine-singular":"neorganica","definite-error-unrecognized-form-masculine-plural":"neorganicii","definite-error-unrecognized-form-feminine-neuter-plural":"neorganicele"}},{"word":"neorganizat","pos":"adj","definitions":["unorganized"],"forms":{"feminine-singular":"neorganizată","masculine-plural":"neorganizați","feminine-neuter-plural":"neorganizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neorganizat","error-unrecognized-form-feminine-indefinite-singular":"neorganizată","error-unrecognized-form-indefinite-masculine-plural":"neorganizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neorganizate","definite-error-unrecognized-form-masculine-neuter-singular":"neorganizatul","definite-error-unrecognized-form-feminine-singular":"neorganizata","definite-error-unrecognized-form-masculine-plural":"neorganizații","definite-error-unrecognized-form-feminine-neuter-plural":"neorganizatele"}},{"word":"neorientat","pos":"adj","definitions":["undirected"],"forms":{"feminine-singular":"neorientată","masculine-plural":"neorientați","feminine-neuter-plural":"neorientate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neorientat","error-unrecognized-form-feminine-indefinite-singular":"neorientată","error-unrecognized-form-indefinite-masculine-plural":"neorientați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neorientate","definite-error-unrecognized-form-masculine-neuter-singular":"neorientatul","definite-error-unrecognized-form-feminine-singular":"neorientata","definite-error-unrecognized-form-masculine-plural":"neorientații","definite-error-unrecognized-form-feminine-neuter-plural":"neorientatele"}},{"word":"neoromantic","pos":"adj","definitions":["neo-romantic"],"forms":{"feminine-singular":"neoromantică","masculine-plural":"neoromantici","feminine-neuter-plural":"neoromantice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neoromantic","error-unrecognized-form-feminine-indefinite-singular":"neoromantică","error-unrecognized-form-indefinite-masculine-plural":"neoromantici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neoromantice","definite-error-unrecognized-form-masculine-neuter-singular":"neoromanticul","definite-error-unrecognized-form-feminine-singular":"neoromantica","definite-error-unrecognized-form-masculine-plural":"neoromanticii","definite-error-unrecognized-form-feminine-neuter-plural":"neoromanticele"}},{"word":"neoromantică","pos":"noun","definitions":["female equivalent of neoromantic"],"forms":{"plural":"neoromantice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neoromantică","accusative-definite-nominative-singular":"neoromantica","accusative-indefinite-nominative-plural":"neoromantice","accusative-definite-nominative-plural":"neoromanticele","dative-genitive-indefinite-singular":"neoromantice","dative-definite-genitive-singular":"neoromanticei","dative-genitive-indefinite-plural":"neoromantice","dative-definite-genitive-plural":"neoromanticelor","singular-vocative":"neoromantică","plural-vocative":"neoromanticelor"}},{"word":"neoromantism","pos":"noun","definitions":["neo-romanticism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neoromantism","accusative-definite-nominative-singular":"neoromantismul","accusative-indefinite-nominative-plural":"neoromantisme","accusative-definite-nominative-plural":"neoromantismele","dative-genitive-indefinite-singular":"neoromantism","dative-definite-genitive-singular":"neoromantismului","dative-genitive-indefinite-plural":"neoromantisme","dative-definite-genitive-plural":"neoromantismelor","singular-vocative":"neoromantismule","plural-vocative":"neoromantismelor"}},{"word":"neosalvarsan","pos":"noun","definitions":["neosalvarsan"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neosalvarsan","accusative-definite-nominative":"neosalvarsanul","dative-genitive-indefinite":"neosalvarsan","dative-definite-genitive":"neosalvarsanului","vocative":"neosalvarsanule"}},{"word":"neosândit","pos":"adj","definitions":["unconvicted"],"forms":{"feminine-singular":"neosândită","masculine-plural":"neosândiți","feminine-neuter-plural":"neosândite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neosândit","error-unrecognized-form-feminine-indefinite-singular":"neosândită","error-unrecognized-form-indefinite-masculine-plural":"neosândiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neosândite","definite-error-unrecognized-form-masculine-neuter-singular":"neosânditul","definite-error-unrecognized-form-feminine-singular":"neosândita","definite-error-unrecognized-form-masculine-plural":"neosândiții","definite-error-unrecognized-form-feminine-neuter-plural":"neosânditele"}},{"word":"neoscolastic","pos":"adj","definitions":["neoscholastic"],"forms":{"feminine-singular":"neoscolastică","masculine-plural":"neoscolastici","feminine-neuter-plural":"neoscolastice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neoscolastic","error-unrecognized-form-feminine-indefinite-singular":"neoscolastică","error-unrecognized-form-indefinite-masculine-plural":"neoscolastici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neoscolastice","definite-error-unrecognized-form-masculine-neuter-singular":"neoscolasticul","definite-error-unrecognized-form-feminine-singular":"neoscolastica","definite-error-unrecognized-form-masculine-plural":"neoscolasticii","definite-error-unrecognized-form-feminine-neuter-plural":"neoscolasticele"}},{"word":"neoscolastic","pos":"noun","definitions":["a supporter of Neo-Scholasticism"],"forms":{"plural":"neoscolastici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neoscolastic","accusative-definite-nominative-singular":"neoscolasticul","accusative-indefinite-nominative-plural":"neoscolastici","accusative-definite-nominative-plural":"neoscolasticii","dative-genitive-indefinite-singular":"neoscolastic","dative-definite-genitive-singular":"neoscolasticului","dative-genitive-indefinite-plural":"neoscolastici","dative-definite-genitive-plural":"neoscolasticilor","singular-vocative":"neoscolasticule","plural-vocative":"neoscolasticilor"}},{"word":"neosificat","pos":"adj","definitions":["unossified"],"forms":{"feminine-singular":"neosificată","masculine-plural":"neosificați","feminine-neuter-plural":"neosificate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neosificat","error-unrecognized-form-feminine-indefinite-singular":"neosificată","error-unrecognized-form-indefinite-masculine-plural":"neosificați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neosificate","definite-error-unrecognized-form-masculine-neuter-singular":"neosificatul","definite-error-unrecognized-form-feminine-singular":"neosificata","definite-error-unrecognized-form-masculine-plural":"neosificații","definite-error-unrecognized-form-feminine-neuter-plural":"neosificatele"}},{"word":"neostenit","pos":"adj","definitions":["tireless"],"forms":{"feminine-singular":"neostenită","masculine-plural":"neosteniți","feminine-neuter-plural":"neostenite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neostenit","error-unrecognized-form-feminine-indefinite-singular":"neostenită","error-unrecognized-form-indefinite-masculine-plural":"neosteniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neostenite","definite-error-unrecognized-form-masculine-neuter-singular":"neostenitul","definite-error-unrecognized-form-feminine-singular":"neostenita","definite-error-unrecognized-form-masculine-plural":"neosteniții","definite-error-unrecognized-form-feminine-neuter-plural":"neostenitele"}},{"word":"neostoit","pos":"adj","definitions":["tireless"],"forms":{"feminine-singular":"neostoită","masculine-plural":"neostoiți","feminine-neuter-plural":"neostoite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neostoit","error-unrecognized-form-feminine-indefinite-singular":"neostoită","error-unrecognized-form-indefinite-masculine-plural":"neostoiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neostoite","definite-error-unrecognized-form-masculine-neuter-singular":"neostoitul","definite-error-unrecognized-form-feminine-singular":"neostoita","definite-error-unrecognized-form-masculine-plural":"neostoiții","definite-error-unrecognized-form-feminine-neuter-plural":"neostoitele"}},{"word":"neotectonic","pos":"noun","definitions":["neotectonics"],"forms":{"plural":"neotectonici","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"neotectonic","accusative-definite-nominative-singular":"neotectoni","accusative-indefinite-nominative-plural":"neotectonici","accusative-definite-nominative-plural":"neotectonicile","dative-genitive-indefinite-singular":"neotectonici","dative-definite-genitive-singular":"neotectonicii","dative-genitive-indefinite-plural":"neotectonici","dative-definite-genitive-plural":"neotectonicilor","singular-vocative":"-","plural-vocative":"-"}},{"word":"neotectonică","pos":"noun","definitions":["neotectonics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neotectonică","accusative-definite-nominative-singular":"neotectonica","accusative-indefinite-nominative-plural":"neotectonice","accusative-definite-nominative-plural":"neotectonicele","dative-genitive-indefinite-singular":"neotectonice","dative-definite-genitive-singular":"neotectonicei","dative-genitive-indefinite-plural":"neotectonice","dative-definite-genitive-plural":"neotectonicelor","singular-vocative":"neotectonică","plural-vocative":"neotectonicelor"}},{"word":"neotenie","pos":"noun","definitions":["neoteny"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"neotenie","accusative-definite-nominative":"neotenia","dative-genitive-indefinite":"neotenii","dative-definite-genitive":"neoteniei","vocative":"neotenie"}},{"word":"neoterismos","pos":"noun","definitions":["renewal, innovation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"neoterismos","accusative-definite-nominative":"neoterismosul","dative-genitive-indefinite":"neoterismos","dative-definite-genitive":"neoterismosului","vocative":"neoterismosule"}},{"word":"neoțetit","pos":"adj","definitions":["unvinegared"],"forms":{"feminine-singular":"neoțetită","masculine-plural":"neoțetiți","feminine-neuter-plural":"neoțetite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neoțetit","error-unrecognized-form-feminine-indefinite-singular":"neoțetită","error-unrecognized-form-indefinite-masculine-plural":"neoțetiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neoțetite","definite-error-unrecognized-form-masculine-neuter-singular":"neoțetitul","definite-error-unrecognized-form-feminine-singular":"neoțetita","definite-error-unrecognized-form-masculine-plural":"neoțetiții","definite-error-unrecognized-form-feminine-neuter-plural":"neoțetitele"}},{"word":"neotie","pos":"noun","definitions":["twayblade"],"forms":{"plural":"neotii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neotie","accusative-definite-nominative-singular":"neotia","accusative-indefinite-nominative-plural":"neotii","accusative-definite-nominative-plural":"neotiile","dative-genitive-indefinite-singular":"neotii","dative-definite-genitive-singular":"neotiei","dative-genitive-indefinite-plural":"neotii","dative-definite-genitive-plural":"neotiilor","singular-vocative":"neotie","plural-vocative":"neotiilor"}},{"word":"neotomism","pos":"noun","definitions":["neo-Thomism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neotomism","accusative-definite-nominative-singular":"neotomismul","accusative-indefinite-nominative-plural":"neotomisme","accusative-definite-nominative-plural":"neotomismele","dative-genitive-indefinite-singular":"neotomism","dative-definite-genitive-singular":"neotomismului","dative-genitive-indefinite-plural":"neotomisme","dative-definite-genitive-plural":"neotomismelor","singular-vocative":"neotomismule","plural-vocative":"neotomismelor"}},{"word":"neotomist","pos":"noun","definitions":["neo-Thomist"],"forms":{"plural":"neotomiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neotomist","accusative-definite-nominative-singular":"neotomistul","accusative-indefinite-nominative-plural":"neotomiști","accusative-definite-nominative-plural":"neotomiștii","dative-genitive-indefinite-singular":"neotomist","dative-definite-genitive-singular":"neotomistului","dative-genitive-indefinite-plural":"neotomiști","dative-definite-genitive-plural":"neotomiștilor","singular-vocative":"neotomistule","plural-vocative":"neotomiștilor"}},{"word":"neotomistă","pos":"noun","definitions":["female equivalent of neotomist"],"forms":{"plural":"neotomiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neotomistă","accusative-definite-nominative-singular":"neotomista","accusative-indefinite-nominative-plural":"neotomiste","accusative-definite-nominative-plural":"neotomistele","dative-genitive-indefinite-singular":"neotomiste","dative-definite-genitive-singular":"neotomistei","dative-genitive-indefinite-plural":"neotomiste","dative-definite-genitive-plural":"neotomistelor","singular-vocative":"neotomistă","plural-vocative":"neotomistelor"}},{"word":"neoumanism","pos":"noun","definitions":["neohumanism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neoumanism","accusative-definite-nominative":"neoumanismul","dative-genitive-indefinite":"neoumanism","dative-definite-genitive":"neoumanismului","vocative":"neoumanismule"}},{"word":"neoumanist","pos":"adj","definitions":["neohumanistic"],"forms":{"feminine-singular":"neoumanistă","masculine-plural":"neoumaniști","feminine-neuter-plural":"neoumaniste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neoumanist","error-unrecognized-form-feminine-indefinite-singular":"neoumanistă","error-unrecognized-form-indefinite-masculine-plural":"neoumaniști","error-unrecognized-form-feminine-indefinite-neuter-plural":"neoumaniste","definite-error-unrecognized-form-masculine-neuter-singular":"neoumanistul","definite-error-unrecognized-form-feminine-singular":"neoumanista","definite-error-unrecognized-form-masculine-plural":"neoumaniștii","definite-error-unrecognized-form-feminine-neuter-plural":"neoumanistele"}},{"word":"neoumanist","pos":"noun","definitions":["neohumanist"],"forms":{"plural":"neoumaniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neoumanist","accusative-definite-nominative-singular":"neoumanistul","accusative-indefinite-nominative-plural":"neoumaniști","accusative-definite-nominative-plural":"neoumaniștii","dative-genitive-indefinite-singular":"neoumanist","dative-definite-genitive-singular":"neoumanistului","dative-genitive-indefinite-plural":"neoumaniști","dative-definite-genitive-plural":"neoumaniștilor","singular-vocative":"neoumanistule","plural-vocative":"neoumaniștilor"}},{"word":"neovitalism","pos":"noun","definitions":["neovitalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neovitalism","accusative-definite-nominative":"neovitalismul","dative-genitive-indefinite":"neovitalism","dative-definite-genitive":"neovitalismului","vocative":"neovitalismule"}},{"word":"neovitalist","pos":"adj","definitions":["neovitalistic"],"forms":{"feminine-singular":"neovitalistă","masculine-plural":"neovitaliști","feminine-neuter-plural":"neovitaliste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neovitalist","error-unrecognized-form-feminine-indefinite-singular":"neovitalistă","error-unrecognized-form-indefinite-masculine-plural":"neovitaliști","error-unrecognized-form-feminine-indefinite-neuter-plural":"neovitaliste","definite-error-unrecognized-form-masculine-neuter-singular":"neovitalistul","definite-error-unrecognized-form-feminine-singular":"neovitalista","definite-error-unrecognized-form-masculine-plural":"neovitaliștii","definite-error-unrecognized-form-feminine-neuter-plural":"neovitalistele"}},{"word":"neovitalist","pos":"noun","definitions":["neovitalist"],"forms":{"plural":"neovitaliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neovitalist","accusative-definite-nominative-singular":"neovitalistul","accusative-indefinite-nominative-plural":"neovitaliști","accusative-definite-nominative-plural":"neovitaliștii","dative-genitive-indefinite-singular":"neovitalist","dative-definite-genitive-singular":"neovitalistului","dative-genitive-indefinite-plural":"neovitaliști","dative-definite-genitive-plural":"neovitaliștilor","singular-vocative":"neovitalistule","plural-vocative":"neovitaliștilor"}},{"word":"neoxidabil","pos":"adj","definitions":["inoxidizable"],"forms":{"feminine-singular":"neoxidabilă","masculine-plural":"neoxidabili","feminine-neuter-plural":"neoxidabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neoxidabil","error-unrecognized-form-feminine-indefinite-singular":"neoxidabilă","error-unrecognized-form-indefinite-masculine-plural":"neoxidabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neoxidabile","definite-error-unrecognized-form-masculine-neuter-singular":"neoxidabilul","definite-error-unrecognized-form-feminine-singular":"neoxidabila","definite-error-unrecognized-form-masculine-plural":"neoxidabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neoxidabilele"}},{"word":"neoxidat","pos":"adj","definitions":["unoxidized"],"forms":{"feminine-singular":"neoxidată","masculine-plural":"neoxidați","feminine-neuter-plural":"neoxidate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neoxidat","error-unrecognized-form-feminine-indefinite-singular":"neoxidată","error-unrecognized-form-indefinite-masculine-plural":"neoxidați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neoxidate","definite-error-unrecognized-form-masculine-neuter-singular":"neoxidatul","definite-error-unrecognized-form-feminine-singular":"neoxidata","definite-error-unrecognized-form-masculine-plural":"neoxidații","definite-error-unrecognized-form-feminine-neuter-plural":"neoxidatele"}},{"word":"neoxigenat","pos":"adj","definitions":["unoxygenated"],"forms":{"feminine-singular":"neoxigenată","masculine-plural":"neoxigenați","feminine-neuter-plural":"neoxigenate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neoxigenat","error-unrecognized-form-feminine-indefinite-singular":"neoxigenată","error-unrecognized-form-indefinite-masculine-plural":"neoxigenați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neoxigenate","definite-error-unrecognized-form-masculine-neuter-singular":"neoxigenatul","definite-error-unrecognized-form-feminine-singular":"neoxigenata","definite-error-unrecognized-form-masculine-plural":"neoxigenații","definite-error-unrecognized-form-feminine-neuter-plural":"neoxigenatele"}},{"word":"neozeelandez","pos":"noun","definitions":["New Zealander (person from New Zealand)"],"forms":{"plural":"neozeelandezi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neozeelandez","accusative-definite-nominative-singular":"neozeelandezul","accusative-indefinite-nominative-plural":"neozeelandezi","accusative-definite-nominative-plural":"neozeelandezii","dative-genitive-indefinite-singular":"neozeelandez","dative-definite-genitive-singular":"neozeelandezului","dative-genitive-indefinite-plural":"neozeelandezi","dative-definite-genitive-plural":"neozeelandezilor","singular-vocative":"neozeelandezule","plural-vocative":"neozeelandezilor"}},{"word":"neozeelandeză","pos":"noun","definitions":["female equivalent of neozeelandez"],"forms":{"plural":"neozeelandeze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neozeelandeză","accusative-definite-nominative-singular":"neozeelandeza","accusative-indefinite-nominative-plural":"neozeelandeze","accusative-definite-nominative-plural":"neozeelandezele","dative-genitive-indefinite-singular":"neozeelandeze","dative-definite-genitive-singular":"neozeelandezei","dative-genitive-indefinite-plural":"neozeelandeze","dative-definite-genitive-plural":"neozeelandezelor","singular-vocative":"neozeelandeză","plural-vocative":"neozeelandezelor"}},{"word":"neozoic","pos":"adj","definitions":["Neozoic"],"forms":{"feminine-singular":"neozoică","masculine-plural":"neozoici","feminine-neuter-plural":"neozoice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neozoic","error-unrecognized-form-feminine-indefinite-singular":"neozoică","error-unrecognized-form-indefinite-masculine-plural":"neozoici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neozoice","definite-error-unrecognized-form-masculine-neuter-singular":"neozoicul","definite-error-unrecognized-form-feminine-singular":"neozoica","definite-error-unrecognized-form-masculine-plural":"neozoicii","definite-error-unrecognized-form-feminine-neuter-plural":"neozoicele"}},{"word":"neozonizat","pos":"adj","definitions":["not ozonized"],"forms":{"feminine-singular":"neozonizată","masculine-plural":"neozonizați","feminine-neuter-plural":"neozonizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neozonizat","error-unrecognized-form-feminine-indefinite-singular":"neozonizată","error-unrecognized-form-indefinite-masculine-plural":"neozonizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neozonizate","definite-error-unrecognized-form-masculine-neuter-singular":"neozonizatul","definite-error-unrecognized-form-feminine-singular":"neozonizata","definite-error-unrecognized-form-masculine-plural":"neozonizații","definite-error-unrecognized-form-feminine-neuter-plural":"neozonizatele"}},{"word":"nepace","pos":"noun","definitions":["war","restlessness"],"forms":{"plural":"nepăci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nepace","accusative-definite-nominative-singular":"nepacea","accusative-indefinite-nominative-plural":"nepăci","accusative-definite-nominative-plural":"nepăcile","dative-genitive-indefinite-singular":"nepăci","dative-definite-genitive-singular":"nepăcii","dative-genitive-indefinite-plural":"nepăci","dative-definite-genitive-plural":"nepăcilor","singular-vocative":"nepace","plural-vocative":"nepăcilor"}},{"word":"nepăciuire","pos":"noun","definitions":["disunion"],"forms":{"plural":"nepăciuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nepăciuire","accusative-definite-nominative-singular":"nepăciuirea","accusative-indefinite-nominative-plural":"nepăciuiri","accusative-definite-nominative-plural":"nepăciuirile","dative-genitive-indefinite-singular":"nepăciuiri","dative-definite-genitive-singular":"nepăciuirii","dative-genitive-indefinite-plural":"nepăciuiri","dative-definite-genitive-plural":"nepăciuirilor","singular-vocative":"nepăciuire","plural-vocative":"nepăciuirilor"}},{"word":"nepalez","pos":"adj","definitions":["Nepalese"],"forms":{"feminine-singular":"nepaleză","masculine-plural":"nepalezi","feminine-neuter-plural":"nepaleze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepalez","error-unrecognized-form-feminine-indefinite-singular":"nepaleză","error-unrecognized-form-indefinite-masculine-plural":"nepalezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepaleze","definite-error-unrecognized-form-masculine-neuter-singular":"nepalezul","definite-error-unrecognized-form-feminine-singular":"nepaleza","definite-error-unrecognized-form-masculine-plural":"nepalezii","definite-error-unrecognized-form-feminine-neuter-plural":"nepalezele"}},{"word":"nepalez","pos":"noun","definitions":["Nepalese"],"forms":{"plural":"nepalezi","feminine":"equivalent nepaleză","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nepalez","accusative-definite-nominative-singular":"nepalezul","accusative-indefinite-nominative-plural":"nepalezi","accusative-definite-nominative-plural":"nepalezii","dative-genitive-indefinite-singular":"nepalez","dative-definite-genitive-singular":"nepalezului","dative-genitive-indefinite-plural":"nepalezi","dative-definite-genitive-plural":"nepalezilor","singular-vocative":"nepalezule","plural-vocative":"nepalezilor"}},{"word":"nepaleză","pos":"noun","definitions":["female equivalent of nepalez"],"forms":{"plural":"nepaleze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nepaleză","accusative-definite-nominative-singular":"nepaleza","accusative-indefinite-nominative-plural":"nepaleze","accusative-definite-nominative-plural":"nepalezele","dative-genitive-indefinite-singular":"nepaleze","dative-definite-genitive-singular":"nepalezei","dative-genitive-indefinite-plural":"nepaleze","dative-definite-genitive-plural":"nepalezelor","singular-vocative":"nepaleză","plural-vocative":"nepalezelor"}},{"word":"nepământean","pos":"adj","definitions":["otherworldly"],"forms":{"feminine-singular":"nepământeană","masculine-plural":"nepământeni","feminine-neuter-plural":"nepământene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepământean","error-unrecognized-form-feminine-indefinite-singular":"nepământeană","error-unrecognized-form-indefinite-masculine-plural":"nepământeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepământene","definite-error-unrecognized-form-masculine-neuter-singular":"nepământeanul","definite-error-unrecognized-form-feminine-singular":"nepământeana","definite-error-unrecognized-form-masculine-plural":"nepământenii","definite-error-unrecognized-form-feminine-neuter-plural":"nepământenele"}},{"word":"nepământesc","pos":"adj","definitions":["unearthly"],"forms":{"feminine-singular":"nepământească","plural":"nepământești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepământesc","error-unrecognized-form-feminine-indefinite-singular":"nepământească","error-unrecognized-form-indefinite-masculine-plural":"nepământești","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepământești","definite-error-unrecognized-form-masculine-neuter-singular":"nepământescul","definite-error-unrecognized-form-feminine-singular":"nepământeasca","definite-error-unrecognized-form-masculine-plural":"nepământeștii","definite-error-unrecognized-form-feminine-neuter-plural":"nepământeștile"}},{"word":"nepărtinire","pos":"noun","definitions":["impartiality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"nepărtinire","accusative-definite-nominative":"nepărtinirea","dative-genitive-indefinite":"nepărtiniri","dative-definite-genitive":"nepărtinirii","vocative":"nepărtinire"}},{"word":"nepărtinitor","pos":"adj","definitions":["unbiased"],"forms":{"feminine-singular":"nepărtinitoare","masculine-plural":"nepărtinitori","feminine-neuter-plural":"nepărtinitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepărtinitor","error-unrecognized-form-feminine-indefinite-singular":"nepărtinitoare","error-unrecognized-form-indefinite-masculine-plural":"nepărtinitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepărtinitoare","definite-error-unrecognized-form-masculine-neuter-singular":"nepărtinitorul","definite-error-unrecognized-form-feminine-singular":"nepărtinitoarea","definite-error-unrecognized-form-masculine-plural":"nepărtinitorii","definite-error-unrecognized-form-feminine-neuter-plural":"nepărtinitoarele"}},{"word":"nepăsare","pos":"noun","definitions":["indifference"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"nepăsare","accusative-definite-nominative":"nepăsarea","dative-genitive-indefinite":"nepăsari","dative-definite-genitive":"nepăsarii","vocative":"nepăsare"}},{"word":"nepăsător","pos":"adj","definitions":["careless, thoughtless","indifferent, listless","carefree, light-minded","uncaring, apathetic"],"pronunciation":"/ˌne.pə.səˈtor/","forms":{"feminine-singular":"nepăsătoare","masculine-plural":"nepăsători","feminine-neuter-plural":"nepăsătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepăsător","error-unrecognized-form-feminine-indefinite-singular":"nepăsătoare","error-unrecognized-form-indefinite-masculine-plural":"nepăsători","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepăsătoare","definite-error-unrecognized-form-masculine-neuter-singular":"nepăsătorul","definite-error-unrecognized-form-feminine-singular":"nepăsătoarea","definite-error-unrecognized-form-masculine-plural":"nepăsătorii","definite-error-unrecognized-form-feminine-neuter-plural":"nepăsătoarele"}},{"word":"nepătat","pos":"adj","definitions":["unblemished"],"forms":{"feminine-singular":"nepătată","masculine-plural":"nepătați","feminine-neuter-plural":"nepătate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepătat","error-unrecognized-form-feminine-indefinite-singular":"nepătată","error-unrecognized-form-indefinite-masculine-plural":"nepătați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepătate","definite-error-unrecognized-form-masculine-neuter-singular":"nepătatul","definite-error-unrecognized-form-feminine-singular":"nepătata","definite-error-unrecognized-form-masculine-plural":"nepătații","definite-error-unrecognized-form-feminine-neuter-plural":"nepătatele"}},{"word":"nepătrunzime","pos":"noun","definitions":["impenetrability"],"forms":{"plural":"nepătrunzimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nepătrunzime","accusative-definite-nominative-singular":"nepătrunzimea","accusative-indefinite-nominative-plural":"nepătrunzimi","accusative-definite-nominative-plural":"nepătrunzimile","dative-genitive-indefinite-singular":"nepătrunzimi","dative-definite-genitive-singular":"nepătrunzimii","dative-genitive-indefinite-plural":"nepătrunzimi","dative-definite-genitive-plural":"nepătrunzimilor","singular-vocative":"nepătrunzime","plural-vocative":"nepătrunzimilor"}},{"word":"nepază","pos":"noun","definitions":["lack of care"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"nepază","accusative-definite-nominative":"nepaza","dative-genitive-indefinite":"nepaze","dative-definite-genitive":"nepazei","vocative":"nepază"}},{"word":"nepedepsit","pos":"adj","definitions":["unpunished"],"forms":{"feminine-singular":"nepedepsită","masculine-plural":"nepedepsiți","feminine-neuter-plural":"nepedepsite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepedepsit","error-unrecognized-form-feminine-indefinite-singular":"nepedepsită","error-unrecognized-form-indefinite-masculine-plural":"nepedepsiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepedepsite","definite-error-unrecognized-form-masculine-neuter-singular":"nepedepsitul","definite-error-unrecognized-form-feminine-singular":"nepedepsita","definite-error-unrecognized-form-masculine-plural":"nepedepsiții","definite-error-unrecognized-form-feminine-neuter-plural":"nepedepsitele"}},{"word":"nepentens","pos":"noun","definitions":["nepenthes"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nepentens","accusative-definite-nominative":"nepentensul","dative-genitive-indefinite":"nepentens","dative-definite-genitive":"nepentensului","vocative":"nepentensule"}},{"word":"neper","pos":"noun","definitions":["neper"],"forms":{"plural":"neperi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neper","accusative-definite-nominative-singular":"neperul","accusative-indefinite-nominative-plural":"neperi","accusative-definite-nominative-plural":"neperii","dative-genitive-indefinite-singular":"neper","dative-definite-genitive-singular":"neperului","dative-genitive-indefinite-plural":"neperi","dative-definite-genitive-plural":"neperilor","singular-vocative":"neperule","plural-vocative":"neperilor"}},{"word":"nepereche","pos":"adj","definitions":["odd"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepereche","error-unrecognized-form-feminine-indefinite-singular":"nepereche","error-unrecognized-form-indefinite-masculine-plural":"nepereche","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepereche","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"neperisabil","pos":"adj","definitions":["non-perishable"],"forms":{"feminine-singular":"neperisabilă","masculine-plural":"neperisabili","feminine-neuter-plural":"neperisabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neperisabil","error-unrecognized-form-feminine-indefinite-singular":"neperisabilă","error-unrecognized-form-indefinite-masculine-plural":"neperisabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neperisabile","definite-error-unrecognized-form-masculine-neuter-singular":"neperisabilul","definite-error-unrecognized-form-feminine-singular":"neperisabila","definite-error-unrecognized-form-masculine-plural":"neperisabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neperisabilele"}},{"word":"nepermanent","pos":"adj","definitions":["impermanent"],"forms":{"feminine-singular":"nepermanentă","masculine-plural":"nepermanenți","feminine-neuter-plural":"nepermanente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepermanent","error-unrecognized-form-feminine-indefinite-singular":"nepermanentă","error-unrecognized-form-indefinite-masculine-plural":"nepermanenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepermanente","definite-error-unrecognized-form-masculine-neuter-singular":"nepermanentul","definite-error-unrecognized-form-feminine-singular":"nepermanenta","definite-error-unrecognized-form-masculine-plural":"nepermanenții","definite-error-unrecognized-form-feminine-neuter-plural":"nepermanentele"}},{"word":"nepieptănat","pos":"adj","definitions":["uncombed"],"forms":{"feminine-singular":"nepieptănată","masculine-plural":"nepieptănați","feminine-neuter-plural":"nepieptănate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepieptănat","error-unrecognized-form-feminine-indefinite-singular":"nepieptănată","error-unrecognized-form-indefinite-masculine-plural":"nepieptănați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepieptănate","definite-error-unrecognized-form-masculine-neuter-singular":"nepieptănatul","definite-error-unrecognized-form-feminine-singular":"nepieptănata","definite-error-unrecognized-form-masculine-plural":"nepieptănații","definite-error-unrecognized-form-feminine-neuter-plural":"nepieptănatele"}},{"word":"nepieritor","pos":"adj","definitions":["imperishable"],"forms":{"feminine-singular":"nepieritoare","masculine-plural":"nepieritori","feminine-neuter-plural":"nepieritoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepieritor","error-unrecognized-form-feminine-indefinite-singular":"nepieritoare","error-unrecognized-form-indefinite-masculine-plural":"nepieritori","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepieritoare","definite-error-unrecognized-form-masculine-neuter-singular":"nepieritorul","definite-error-unrecognized-form-feminine-singular":"nepieritoarea","definite-error-unrecognized-form-masculine-plural":"nepieritorii","definite-error-unrecognized-form-feminine-neuter-plural":"nepieritoarele"}},{"word":"nepipăit","pos":"adj","definitions":["untouched"],"forms":{"feminine-singular":"nepipăită","masculine-plural":"nepipăiți","feminine-neuter-plural":"nepipăite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepipăit","error-unrecognized-form-feminine-indefinite-singular":"nepipăită","error-unrecognized-form-indefinite-masculine-plural":"nepipăiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepipăite","definite-error-unrecognized-form-masculine-neuter-singular":"nepipăitul","definite-error-unrecognized-form-feminine-singular":"nepipăita","definite-error-unrecognized-form-masculine-plural":"nepipăiții","definite-error-unrecognized-form-feminine-neuter-plural":"nepipăitele"}}];
@@ -0,0 +1 @@
+export default [{"word":"neplăcere","pos":"noun","definitions":["inconvenience"],"forms":{"plural":"neplăceri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neplăcere","accusative-definite-nominative-singular":"neplăcerea","accusative-indefinite-nominative-plural":"neplăceri","accusative-definite-nominative-plural":"neplăcerile","dative-genitive-indefinite-singular":"neplăceri","dative-definite-genitive-singular":"neplăcerii","dative-genitive-indefinite-plural":"neplăceri","dative-definite-genitive-plural":"neplăcerilor","singular-vocative":"neplăcere","plural-vocative":"neplăcerilor"}},{"word":"neplăcut","pos":"adj","definitions":["unpleasant"],"pronunciation":"/ne.pləˈkut/","forms":{"feminine-singular":"neplăcută","masculine-plural":"neplăcuți","feminine-neuter-plural":"neplăcute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neplăcut","error-unrecognized-form-feminine-indefinite-singular":"neplăcută","error-unrecognized-form-indefinite-masculine-plural":"neplăcuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neplăcute","definite-error-unrecognized-form-masculine-neuter-singular":"neplăcutul","definite-error-unrecognized-form-feminine-singular":"neplăcuta","definite-error-unrecognized-form-masculine-plural":"neplăcuții","definite-error-unrecognized-form-feminine-neuter-plural":"neplăcutele"}},{"word":"neplată","pos":"noun","definitions":["nonpayment"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"neplată","accusative-definite-nominative":"neplata","dative-genitive-indefinite":"neplate","dative-definite-genitive":"neplatei","vocative":"neplată"}},{"word":"neplatnic","pos":"noun","definitions":["insolvent"],"forms":{"plural":"neplatnici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neplatnic","accusative-definite-nominative-singular":"neplatnicul","accusative-indefinite-nominative-plural":"neplatnici","accusative-definite-nominative-plural":"neplatnicii","dative-genitive-indefinite-singular":"neplatnic","dative-definite-genitive-singular":"neplatnicului","dative-genitive-indefinite-plural":"neplatnici","dative-definite-genitive-plural":"neplatnicilor","singular-vocative":"neplatnicule","plural-vocative":"neplatnicilor"}},{"word":"neplecare","pos":"noun","definitions":["audacity, chutzpah"],"forms":{"plural":"neplecări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neplecare","accusative-definite-nominative-singular":"neplecarea","accusative-indefinite-nominative-plural":"neplecări","accusative-definite-nominative-plural":"neplecările","dative-genitive-indefinite-singular":"neplecări","dative-definite-genitive-singular":"neplecării","dative-genitive-indefinite-plural":"neplecări","dative-definite-genitive-plural":"neplecărilor","singular-vocative":"neplecare","plural-vocative":"neplecărilor"}},{"word":"neplodire","pos":"noun","definitions":["sterility"],"forms":{"plural":"neplodiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neplodire","accusative-definite-nominative-singular":"neplodirea","accusative-indefinite-nominative-plural":"neplodiri","accusative-definite-nominative-plural":"neplodirile","dative-genitive-indefinite-singular":"neplodiri","dative-definite-genitive-singular":"neplodirii","dative-genitive-indefinite-plural":"neplodiri","dative-definite-genitive-plural":"neplodirilor","singular-vocative":"neplodire","plural-vocative":"neplodirilor"}},{"word":"neplouare","pos":"noun","definitions":["drought"],"forms":{"plural":"neplouări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neplouare","accusative-definite-nominative-singular":"neplouarea","accusative-indefinite-nominative-plural":"neplouări","accusative-definite-nominative-plural":"neplouările","dative-genitive-indefinite-singular":"neplouări","dative-definite-genitive-singular":"neplouării","dative-genitive-indefinite-plural":"neplouări","dative-definite-genitive-plural":"neplouărilor","singular-vocative":"neplouare","plural-vocative":"neplouărilor"}},{"word":"nepoată","pos":"noun","definitions":["granddaughter","niece"],"pronunciation":"/neˈpo̯atə/","forms":{"plural":"nepoate","masculine":"equivalent nepot","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nepoată","accusative-definite-nominative-singular":"nepoata","accusative-indefinite-nominative-plural":"nepoate","accusative-definite-nominative-plural":"nepoatele","dative-genitive-indefinite-singular":"nepoate","dative-definite-genitive-singular":"nepoatei","dative-genitive-indefinite-plural":"nepoate","dative-definite-genitive-plural":"nepoatelor","singular-vocative":"nepoată","plural-vocative":"nepoatelor"}},{"word":"nepoftit","pos":"adj","definitions":["uninvited"],"forms":{"feminine-singular":"nepoftită","masculine-plural":"nepoftiți","feminine-neuter-plural":"nepoftite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepoftit","error-unrecognized-form-feminine-indefinite-singular":"nepoftită","error-unrecognized-form-indefinite-masculine-plural":"nepoftiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepoftite","definite-error-unrecognized-form-masculine-neuter-singular":"nepoftitul","definite-error-unrecognized-form-feminine-singular":"nepoftita","definite-error-unrecognized-form-masculine-plural":"nepoftiții","definite-error-unrecognized-form-feminine-neuter-plural":"nepoftitele"}},{"word":"nepolar","pos":"adj","definitions":["nonpolar"],"forms":{"feminine-singular":"nepolară","masculine-plural":"nepolari","feminine-neuter-plural":"nepolare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepolar","error-unrecognized-form-feminine-indefinite-singular":"nepolară","error-unrecognized-form-indefinite-masculine-plural":"nepolari","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepolare","definite-error-unrecognized-form-masculine-neuter-singular":"nepolarul","definite-error-unrecognized-form-feminine-singular":"nepolara","definite-error-unrecognized-form-masculine-plural":"nepolarii","definite-error-unrecognized-form-feminine-neuter-plural":"nepolarele"}},{"word":"nepolitic","pos":"adj","definitions":["nonpolitical"],"forms":{"feminine-singular":"nepolitică","masculine-plural":"nepolitici","feminine-neuter-plural":"nepolitice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepolitic","error-unrecognized-form-feminine-indefinite-singular":"nepolitică","error-unrecognized-form-indefinite-masculine-plural":"nepolitici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepolitice","definite-error-unrecognized-form-masculine-neuter-singular":"nepoliticul","definite-error-unrecognized-form-feminine-singular":"nepolitica","definite-error-unrecognized-form-masculine-plural":"nepoliticii","definite-error-unrecognized-form-feminine-neuter-plural":"nepoliticele"}},{"word":"nepoliticos","pos":"adj","definitions":["impolite"],"forms":{"feminine-singular":"nepoliticoasă","masculine-plural":"nepoliticoși","feminine-neuter-plural":"nepoliticoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepoliticos","error-unrecognized-form-feminine-indefinite-singular":"nepoliticoasă","error-unrecognized-form-indefinite-masculine-plural":"nepoliticoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepoliticoase","definite-error-unrecognized-form-masculine-neuter-singular":"nepoliticosul","definite-error-unrecognized-form-feminine-singular":"nepoliticoasa","definite-error-unrecognized-form-masculine-plural":"nepoliticoșii","definite-error-unrecognized-form-feminine-neuter-plural":"nepoliticoasele"}},{"word":"nepoluant","pos":"adj","definitions":["nonpollutant"],"forms":{"feminine-singular":"nepoluantă","masculine-plural":"nepoluanți","feminine-neuter-plural":"nepoluante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepoluant","error-unrecognized-form-feminine-indefinite-singular":"nepoluantă","error-unrecognized-form-indefinite-masculine-plural":"nepoluanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepoluante","definite-error-unrecognized-form-masculine-neuter-singular":"nepoluantul","definite-error-unrecognized-form-feminine-singular":"nepoluanta","definite-error-unrecognized-form-masculine-plural":"nepoluanții","definite-error-unrecognized-form-feminine-neuter-plural":"nepoluantele"}},{"word":"nepoluare","pos":"noun","definitions":["nonpollution"],"forms":{"plural":"nepoluări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nepoluare","accusative-definite-nominative-singular":"nepoluarea","accusative-indefinite-nominative-plural":"nepoluări","accusative-definite-nominative-plural":"nepoluările","dative-genitive-indefinite-singular":"nepoluări","dative-definite-genitive-singular":"nepoluării","dative-genitive-indefinite-plural":"nepoluări","dative-definite-genitive-plural":"nepoluărilor","singular-vocative":"nepoluare","plural-vocative":"nepoluărilor"}},{"word":"nepoluat","pos":"adj","definitions":["unpolluted"],"forms":{"feminine-singular":"nepoluată","masculine-plural":"nepoluați","feminine-neuter-plural":"nepoluate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepoluat","error-unrecognized-form-feminine-indefinite-singular":"nepoluată","error-unrecognized-form-indefinite-masculine-plural":"nepoluați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepoluate","definite-error-unrecognized-form-masculine-neuter-singular":"nepoluatul","definite-error-unrecognized-form-feminine-singular":"nepoluata","definite-error-unrecognized-form-masculine-plural":"nepoluații","definite-error-unrecognized-form-feminine-neuter-plural":"nepoluatele"}},{"word":"nepomenit","pos":"adj","definitions":["unmentioned"],"forms":{"feminine-singular":"nepomenită","masculine-plural":"nepomeniți","feminine-neuter-plural":"nepomenite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepomenit","error-unrecognized-form-feminine-indefinite-singular":"nepomenită","error-unrecognized-form-indefinite-masculine-plural":"nepomeniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepomenite","definite-error-unrecognized-form-masculine-neuter-singular":"nepomenitul","definite-error-unrecognized-form-feminine-singular":"nepomenita","definite-error-unrecognized-form-masculine-plural":"nepomeniții","definite-error-unrecognized-form-feminine-neuter-plural":"nepomenitele"}},{"word":"neponderabilitate","pos":"noun","definitions":["imponderability"],"forms":{"plural":"neponderabilitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neponderabilitate","accusative-definite-nominative-singular":"neponderabilitatea","accusative-indefinite-nominative-plural":"neponderabilitatăți","accusative-definite-nominative-plural":"neponderabilitatățile","dative-genitive-indefinite-singular":"neponderabilitatăți","dative-definite-genitive-singular":"neponderabilitatății","dative-genitive-indefinite-plural":"neponderabilitatăți","dative-definite-genitive-plural":"neponderabilitatăților","singular-vocative":"neponderabilitate","plural-vocative":"neponderabilitatăților"}},{"word":"nepopular","pos":"adj","definitions":["unpopular"],"pronunciation":"/ˌne.po.puˈlar/","forms":{"feminine-singular":"nepopulară","masculine-plural":"nepopulari","feminine-neuter-plural":"nepopulare","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepopular","error-unrecognized-form-feminine-indefinite-singular":"nepopulară","error-unrecognized-form-indefinite-masculine-plural":"nepopulari","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepopulare","definite-error-unrecognized-form-masculine-neuter-singular":"nepopularul","definite-error-unrecognized-form-feminine-singular":"nepopulara","definite-error-unrecognized-form-masculine-plural":"nepopularii","definite-error-unrecognized-form-feminine-neuter-plural":"nepopularele"}},{"word":"nepot","pos":"noun","definitions":["grandson","nephew","descendant"],"pronunciation":"/neˈpot/","forms":{"plural":"nepoți","feminine":"equivalent nepoată","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nepot","accusative-definite-nominative-singular":"nepotul","accusative-indefinite-nominative-plural":"nepoți","accusative-definite-nominative-plural":"nepoții","dative-genitive-indefinite-singular":"nepot","dative-definite-genitive-singular":"nepotului","dative-genitive-indefinite-plural":"nepoți","dative-definite-genitive-plural":"nepoților","singular-vocative":"nepotule","plural-vocative":"nepoților"}},{"word":"nepoțel","pos":"noun","definitions":["diminutive of nepot; small grandchild or nephew"],"forms":{"plural":"nepoței","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nepoțel","accusative-definite-nominative-singular":"nepoțelul","accusative-indefinite-nominative-plural":"nepoțeli","accusative-definite-nominative-plural":"nepoțelii","dative-genitive-indefinite-singular":"nepoțel","dative-definite-genitive-singular":"nepoțelului","dative-genitive-indefinite-plural":"nepoțeli","dative-definite-genitive-plural":"nepoțelilor","singular-vocative":"nepoțelule","plural-vocative":"nepoțelilor"}},{"word":"nepoți","pos":"noun","definitions":["plural of nepot"],"pronunciation":"/neˈpot͡sʲ/"},{"word":"nepoțică","pos":"noun","definitions":["diminutive of nepoată"],"forms":{"plural":"nepoțele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nepoțică","accusative-definite-nominative-singular":"nepoțica","accusative-indefinite-nominative-plural":"nepoțele","accusative-definite-nominative-plural":"nepoțelele","dative-genitive-indefinite-singular":"nepoțele","dative-definite-genitive-singular":"nepoțelei","dative-genitive-indefinite-plural":"nepoțele","dative-definite-genitive-plural":"nepoțelelor","singular-vocative":"nepoțică","plural-vocative":"nepoțelelor"}},{"word":"nepoție","pos":"noun","definitions":["nephewship"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"nepoție","accusative-definite-nominative":"nepoția","dative-genitive-indefinite":"nepoții","dative-definite-genitive":"nepoției","vocative":"nepoție"}},{"word":"nepotism","pos":"noun","definitions":["nepotism"]},{"word":"nepotrivire","pos":"noun","definitions":["inadequacy"],"forms":{"plural":"nepotriviri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nepotrivire","accusative-definite-nominative-singular":"nepotrivirea","accusative-indefinite-nominative-plural":"nepotriviri","accusative-definite-nominative-plural":"nepotrivirile","dative-genitive-indefinite-singular":"nepotriviri","dative-definite-genitive-singular":"nepotrivirii","dative-genitive-indefinite-plural":"nepotriviri","dative-definite-genitive-plural":"nepotrivirilor","singular-vocative":"nepotrivire","plural-vocative":"nepotrivirilor"}},{"word":"nepotrivit","pos":"adj","definitions":["inappropriate"],"forms":{"feminine-singular":"nepotrivită","masculine-plural":"nepotriviți","feminine-neuter-plural":"nepotrivite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepotrivit","error-unrecognized-form-feminine-indefinite-singular":"nepotrivită","error-unrecognized-form-indefinite-masculine-plural":"nepotriviți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepotrivite","definite-error-unrecognized-form-masculine-neuter-singular":"nepotrivitul","definite-error-unrecognized-form-feminine-singular":"nepotrivita","definite-error-unrecognized-form-masculine-plural":"nepotriviții","definite-error-unrecognized-form-feminine-neuter-plural":"nepotrivitele"}},{"word":"Nepotu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nepotu"}},{"word":"nepotuc","pos":"noun","definitions":["diminutive of nepot"],"forms":{"plural":"nepotuci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nepotuc","accusative-definite-nominative-singular":"nepotucul","accusative-indefinite-nominative-plural":"nepotuci","accusative-definite-nominative-plural":"nepotucii","dative-genitive-indefinite-singular":"nepotuc","dative-definite-genitive-singular":"nepotucului","dative-genitive-indefinite-plural":"nepotuci","dative-definite-genitive-plural":"nepotucilor","singular-vocative":"nepotucule","plural-vocative":"nepotucilor"}},{"word":"nepotuț","pos":"noun","definitions":["diminutive of nepot"],"forms":{"plural":"nepotuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nepotuț","accusative-definite-nominative-singular":"nepotuțul","accusative-indefinite-nominative-plural":"nepotuți","accusative-definite-nominative-plural":"nepotuții","dative-genitive-indefinite-singular":"nepotuț","dative-definite-genitive-singular":"nepotuțului","dative-genitive-indefinite-plural":"nepotuți","dative-definite-genitive-plural":"nepotuților","singular-vocative":"nepotuțule","plural-vocative":"nepotuților"}},{"word":"nepovestit","pos":"adj","definitions":["untold"],"forms":{"feminine-singular":"nepovestită","masculine-plural":"nepovestiți","feminine-neuter-plural":"nepovestite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepovestit","error-unrecognized-form-feminine-indefinite-singular":"nepovestită","error-unrecognized-form-indefinite-masculine-plural":"nepovestiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepovestite","definite-error-unrecognized-form-masculine-neuter-singular":"nepovestitul","definite-error-unrecognized-form-feminine-singular":"nepovestita","definite-error-unrecognized-form-masculine-plural":"nepovestiții","definite-error-unrecognized-form-feminine-neuter-plural":"nepovestitele"}},{"word":"nepozitiv","pos":"adj","definitions":["nonpositive"],"examples":[{"ro":"Rezumat: Orbitele punctelor vecine unui punct periodic sunt extrem de complicate. În cazul unu-dimensional, presupunând că extremele locale ale derivatei sunt nepozitive se poate descrie comportarea orbitelor monotone. Această ipoteză este o consecință a negativității derivatei Schwartziene, condiție introdusă de Singer și prezentă astăzi atât în analiza […]","en":null}],"forms":{"feminine-singular":"nepozitivă","masculine-plural":"nepozitivi","feminine-neuter-plural":"nepozitive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepozitiv","error-unrecognized-form-feminine-indefinite-singular":"nepozitivă","error-unrecognized-form-indefinite-masculine-plural":"nepozitivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepozitive","definite-error-unrecognized-form-masculine-neuter-singular":"nepozitivul","definite-error-unrecognized-form-feminine-singular":"nepozitiva","definite-error-unrecognized-form-masculine-plural":"nepozitivii","definite-error-unrecognized-form-feminine-neuter-plural":"nepozitivele"}},{"word":"neprecizare","pos":"noun","definitions":["vagueness"],"forms":{"plural":"neprecizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neprecizare","accusative-definite-nominative-singular":"neprecizarea","accusative-indefinite-nominative-plural":"neprecizări","accusative-definite-nominative-plural":"neprecizările","dative-genitive-indefinite-singular":"neprecizări","dative-definite-genitive-singular":"neprecizării","dative-genitive-indefinite-plural":"neprecizări","dative-definite-genitive-plural":"neprecizărilor","singular-vocative":"neprecizare","plural-vocative":"neprecizărilor"}},{"word":"neprecurmat","pos":"adj","definitions":["continuous"],"forms":{"feminine-singular":"neprecurmată","masculine-plural":"neprecurmați","feminine-neuter-plural":"neprecurmate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neprecurmat","error-unrecognized-form-feminine-indefinite-singular":"neprecurmată","error-unrecognized-form-indefinite-masculine-plural":"neprecurmați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neprecurmate","definite-error-unrecognized-form-masculine-neuter-singular":"neprecurmatul","definite-error-unrecognized-form-feminine-singular":"neprecurmata","definite-error-unrecognized-form-masculine-plural":"neprecurmații","definite-error-unrecognized-form-feminine-neuter-plural":"neprecurmatele"}},{"word":"neprecurmat","pos":"adv","definitions":["continuously"]},{"word":"nepredicativ","pos":"adj","definitions":["nonpredicative"],"forms":{"feminine-singular":"nepredicativă","masculine-plural":"nepredicativi","feminine-neuter-plural":"nepredicative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepredicativ","error-unrecognized-form-feminine-indefinite-singular":"nepredicativă","error-unrecognized-form-indefinite-masculine-plural":"nepredicativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepredicative","definite-error-unrecognized-form-masculine-neuter-singular":"nepredicativul","definite-error-unrecognized-form-feminine-singular":"nepredicativa","definite-error-unrecognized-form-masculine-plural":"nepredicativii","definite-error-unrecognized-form-feminine-neuter-plural":"nepredicativele"}},{"word":"nepregândit","pos":"adj","definitions":["impromptu"],"forms":{"feminine-singular":"nepregândită","masculine-plural":"nepregândiți","feminine-neuter-plural":"nepregândite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepregândit","error-unrecognized-form-feminine-indefinite-singular":"nepregândită","error-unrecognized-form-indefinite-masculine-plural":"nepregândiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepregândite","definite-error-unrecognized-form-masculine-neuter-singular":"nepregânditul","definite-error-unrecognized-form-feminine-singular":"nepregândita","definite-error-unrecognized-form-masculine-plural":"nepregândiții","definite-error-unrecognized-form-feminine-neuter-plural":"nepregânditele"}},{"word":"nepregătire","pos":"noun","definitions":["unpreparedness"],"forms":{"plural":"nepregătiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nepregătire","accusative-definite-nominative-singular":"nepregătirea","accusative-indefinite-nominative-plural":"nepregătiri","accusative-definite-nominative-plural":"nepregătirile","dative-genitive-indefinite-singular":"nepregătiri","dative-definite-genitive-singular":"nepregătirii","dative-genitive-indefinite-plural":"nepregătiri","dative-definite-genitive-plural":"nepregătirilor","singular-vocative":"nepregătire","plural-vocative":"nepregătirilor"}},{"word":"nepregătit","pos":"adj","definitions":["unprepared"],"forms":{"feminine-singular":"nepregătită","masculine-plural":"nepregătiți","feminine-neuter-plural":"nepregătite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepregătit","error-unrecognized-form-feminine-indefinite-singular":"nepregătită","error-unrecognized-form-indefinite-masculine-plural":"nepregătiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepregătite","definite-error-unrecognized-form-masculine-neuter-singular":"nepregătitul","definite-error-unrecognized-form-feminine-singular":"nepregătita","definite-error-unrecognized-form-masculine-plural":"nepregătiții","definite-error-unrecognized-form-feminine-neuter-plural":"nepregătitele"}},{"word":"nepreget","pos":"noun","definitions":["ardor"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nepreget","accusative-definite-nominative":"nepregetul","dative-genitive-indefinite":"nepreget","dative-definite-genitive":"nepregetului","vocative":"nepregetule"}},{"word":"nepregetare","pos":"noun","definitions":["ardor"],"forms":{"plural":"nepregetări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nepregetare","accusative-definite-nominative-singular":"nepregetarea","accusative-indefinite-nominative-plural":"nepregetări","accusative-definite-nominative-plural":"nepregetările","dative-genitive-indefinite-singular":"nepregetări","dative-definite-genitive-singular":"nepregetării","dative-genitive-indefinite-plural":"nepregetări","dative-definite-genitive-plural":"nepregetărilor","singular-vocative":"nepregetare","plural-vocative":"nepregetărilor"}},{"word":"nepregetat","pos":"adj","definitions":["hardworking, industrious, diligent, busy"],"forms":{"feminine-singular":"nepregetată","masculine-plural":"nepregetați","feminine-neuter-plural":"nepregetate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepregetat","error-unrecognized-form-feminine-indefinite-singular":"nepregetată","error-unrecognized-form-indefinite-masculine-plural":"nepregetați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepregetate","definite-error-unrecognized-form-masculine-neuter-singular":"nepregetatul","definite-error-unrecognized-form-feminine-singular":"nepregetata","definite-error-unrecognized-form-masculine-plural":"nepregetații","definite-error-unrecognized-form-feminine-neuter-plural":"nepregetatele"}},{"word":"neprelucrat","pos":"adj","definitions":["raw"],"forms":{"feminine-singular":"neprelucrată","masculine-plural":"neprelucrați","feminine-neuter-plural":"neprelucrate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neprelucrat","error-unrecognized-form-feminine-indefinite-singular":"neprelucrată","error-unrecognized-form-indefinite-masculine-plural":"neprelucrați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neprelucrate","definite-error-unrecognized-form-masculine-neuter-singular":"neprelucratul","definite-error-unrecognized-form-feminine-singular":"neprelucrata","definite-error-unrecognized-form-masculine-plural":"neprelucrații","definite-error-unrecognized-form-feminine-neuter-plural":"neprelucratele"}},{"word":"nepretențios","pos":"adj","definitions":["modest"],"forms":{"feminine-singular":"nepretențioasă","masculine-plural":"nepretențioși","feminine-neuter-plural":"nepretențioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepretențios","error-unrecognized-form-feminine-indefinite-singular":"nepretențioasă","error-unrecognized-form-indefinite-masculine-plural":"nepretențioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepretențioase","definite-error-unrecognized-form-masculine-neuter-singular":"nepretențiosul","definite-error-unrecognized-form-feminine-singular":"nepretențioasa","definite-error-unrecognized-form-masculine-plural":"nepretențioșii","definite-error-unrecognized-form-feminine-neuter-plural":"nepretențioasele"}},{"word":"neprețuit","pos":"adj","definitions":["priceless, invaluable"],"pronunciation":"/ne.pre.t͡suˈit/","forms":{"feminine-singular":"neprețuită","masculine-plural":"neprețuiți","feminine-neuter-plural":"neprețuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neprețuit","error-unrecognized-form-feminine-indefinite-singular":"neprețuită","error-unrecognized-form-indefinite-masculine-plural":"neprețuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neprețuite","definite-error-unrecognized-form-masculine-neuter-singular":"neprețuitul","definite-error-unrecognized-form-feminine-singular":"neprețuita","definite-error-unrecognized-form-masculine-plural":"neprețuiții","definite-error-unrecognized-form-feminine-neuter-plural":"neprețuitele"}},{"word":"neprevăzător","pos":"adj","definitions":["incautious"],"forms":{"feminine-singular":"neprevăzătoare","masculine-plural":"neprevăzători","feminine-neuter-plural":"neprevăzătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neprevăzător","error-unrecognized-form-feminine-indefinite-singular":"neprevăzătoare","error-unrecognized-form-indefinite-masculine-plural":"neprevăzători","error-unrecognized-form-feminine-indefinite-neuter-plural":"neprevăzătoare","definite-error-unrecognized-form-masculine-neuter-singular":"neprevăzătorul","definite-error-unrecognized-form-feminine-singular":"neprevăzătoarea","definite-error-unrecognized-form-masculine-plural":"neprevăzătorii","definite-error-unrecognized-form-feminine-neuter-plural":"neprevăzătoarele"}},{"word":"neprevăzut","pos":"adj","definitions":["unforeseen"],"forms":{"feminine-singular":"neprevăzută","masculine-plural":"neprevăzuți","feminine-neuter-plural":"neprevăzute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neprevăzut","error-unrecognized-form-feminine-indefinite-singular":"neprevăzută","error-unrecognized-form-indefinite-masculine-plural":"neprevăzuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neprevăzute","definite-error-unrecognized-form-masculine-neuter-singular":"neprevăzutul","definite-error-unrecognized-form-feminine-singular":"neprevăzuta","definite-error-unrecognized-form-masculine-plural":"neprevăzuții","definite-error-unrecognized-form-feminine-neuter-plural":"neprevăzutele"}},{"word":"neprevizibil","pos":"adj","definitions":["unpredictable"],"pronunciation":"/ˌne.pre.viˈzi.bil/","forms":{"feminine-singular":"neprevizibilă","masculine-plural":"neprevizibili","feminine-neuter-plural":"neprevizibile","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"neprevizibil","error-unrecognized-form-feminine-indefinite-singular":"neprevizibilă","error-unrecognized-form-indefinite-masculine-plural":"neprevizibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neprevizibile","definite-error-unrecognized-form-masculine-neuter-singular":"neprevizibilul","definite-error-unrecognized-form-feminine-singular":"neprevizibila","definite-error-unrecognized-form-masculine-plural":"neprevizibilii","definite-error-unrecognized-form-feminine-neuter-plural":"neprevizibilele"}},{"word":"nepricepere","pos":"noun","definitions":["ignorance"],"forms":{"plural":"nepriceperi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nepricepere","accusative-definite-nominative-singular":"nepriceperea","accusative-indefinite-nominative-plural":"nepriceperi","accusative-definite-nominative-plural":"nepriceperile","dative-genitive-indefinite-singular":"nepriceperi","dative-definite-genitive-singular":"nepriceperii","dative-genitive-indefinite-plural":"nepriceperi","dative-definite-genitive-plural":"nepriceperilor","singular-vocative":"nepricepere","plural-vocative":"nepriceperilor"}},{"word":"nepriceput","pos":"adj","definitions":["clumsy"],"forms":{"feminine-singular":"nepricepută","masculine-plural":"nepricepuți","feminine-neuter-plural":"nepricepute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepriceput","error-unrecognized-form-feminine-indefinite-singular":"nepricepută","error-unrecognized-form-indefinite-masculine-plural":"nepricepuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepricepute","definite-error-unrecognized-form-masculine-neuter-singular":"nepriceputul","definite-error-unrecognized-form-feminine-singular":"nepriceputa","definite-error-unrecognized-form-masculine-plural":"nepricepuții","definite-error-unrecognized-form-feminine-neuter-plural":"nepriceputele"}},{"word":"nepricopsit","pos":"adj","definitions":["poor"],"forms":{"feminine-singular":"nepricopsită","masculine-plural":"nepricopsiți","feminine-neuter-plural":"nepricopsite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepricopsit","error-unrecognized-form-feminine-indefinite-singular":"nepricopsită","error-unrecognized-form-indefinite-masculine-plural":"nepricopsiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepricopsite","definite-error-unrecognized-form-masculine-neuter-singular":"nepricopsitul","definite-error-unrecognized-form-feminine-singular":"nepricopsita","definite-error-unrecognized-form-masculine-plural":"nepricopsiții","definite-error-unrecognized-form-feminine-neuter-plural":"nepricopsitele"}},{"word":"neprielnic","pos":"adj","definitions":["unfavorable"],"forms":{"feminine-singular":"neprielnică","masculine-plural":"neprielnici","feminine-neuter-plural":"neprielnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neprielnic","error-unrecognized-form-feminine-indefinite-singular":"neprielnică","error-unrecognized-form-indefinite-masculine-plural":"neprielnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neprielnice","definite-error-unrecognized-form-masculine-neuter-singular":"neprielnicul","definite-error-unrecognized-form-feminine-singular":"neprielnica","definite-error-unrecognized-form-masculine-plural":"neprielnicii","definite-error-unrecognized-form-feminine-neuter-plural":"neprielnicele"}},{"word":"neprieten","pos":"noun","definitions":["unfriend, foe"],"forms":{"plural":"neprieteni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neprieten","accusative-definite-nominative-singular":"neprietenul","accusative-indefinite-nominative-plural":"neprieteni","accusative-definite-nominative-plural":"neprietenii","dative-genitive-indefinite-singular":"neprieten","dative-definite-genitive-singular":"neprietenului","dative-genitive-indefinite-plural":"neprieteni","dative-definite-genitive-plural":"neprietenilor","singular-vocative":"neprietenule","plural-vocative":"neprietenilor"}},{"word":"neprietenesc","pos":"adj","definitions":["unfriendly"],"forms":{"feminine-singular":"neprietenească","plural":"neprietenești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neprietenesc","error-unrecognized-form-feminine-indefinite-singular":"neprietenească","error-unrecognized-form-indefinite-masculine-plural":"neprietenești","error-unrecognized-form-feminine-indefinite-neuter-plural":"neprietenești","definite-error-unrecognized-form-masculine-neuter-singular":"neprietenescul","definite-error-unrecognized-form-feminine-singular":"neprieteneasca","definite-error-unrecognized-form-masculine-plural":"neprieteneștii","definite-error-unrecognized-form-feminine-neuter-plural":"neprieteneștile"}},{"word":"neprietenos","pos":"adj","definitions":["unfriendly"],"pronunciation":"/ˌne.pri.e.teˈnos/","forms":{"feminine-singular":"neprietenoasă","masculine-plural":"neprietenoși","feminine-neuter-plural":"neprietenoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neprietenos","error-unrecognized-form-feminine-indefinite-singular":"neprietenoasă","error-unrecognized-form-indefinite-masculine-plural":"neprietenoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"neprietenoase","definite-error-unrecognized-form-masculine-neuter-singular":"neprietenosul","definite-error-unrecognized-form-feminine-singular":"neprietenoasa","definite-error-unrecognized-form-masculine-plural":"neprietenoșii","definite-error-unrecognized-form-feminine-neuter-plural":"neprietenoasele"}},{"word":"neprieteșug","pos":"noun","definitions":["unfriendliness"],"forms":{"plural":"neprieteșuguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"neprieteșug","accusative-definite-nominative-singular":"neprieteșugul","accusative-indefinite-nominative-plural":"neprieteșuguri","accusative-definite-nominative-plural":"neprieteșugurile","dative-genitive-indefinite-singular":"neprieteșug","dative-definite-genitive-singular":"neprieteșugului","dative-genitive-indefinite-plural":"neprieteșuguri","dative-definite-genitive-plural":"neprieteșugurilor","singular-vocative":"neprieteșugule","plural-vocative":"neprieteșugurilor"}},{"word":"neprietnic","pos":"noun","definitions":["enemy"],"forms":{"plural":"neprietnici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neprietnic","accusative-definite-nominative-singular":"neprietnicul","accusative-indefinite-nominative-plural":"neprietnici","accusative-definite-nominative-plural":"neprietnicii","dative-genitive-indefinite-singular":"neprietnic","dative-definite-genitive-singular":"neprietnicului","dative-genitive-indefinite-plural":"neprietnici","dative-definite-genitive-plural":"neprietnicilor","singular-vocative":"neprietnicule","plural-vocative":"neprietnicilor"}},{"word":"neprihănire","pos":"noun","definitions":["righteousness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neprihănire","accusative-definite-nominative":"neprihănirea","dative-genitive-indefinite":"neprihăniri","dative-definite-genitive":"neprihănirii","vocative":"neprihănire"}},{"word":"neprihănit","pos":"adj","definitions":["pure"],"forms":{"feminine-singular":"neprihănită","masculine-plural":"neprihăniți","feminine-neuter-plural":"neprihănite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neprihănit","error-unrecognized-form-feminine-indefinite-singular":"neprihănită","error-unrecognized-form-indefinite-masculine-plural":"neprihăniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neprihănite","definite-error-unrecognized-form-masculine-neuter-singular":"neprihănitul","definite-error-unrecognized-form-feminine-singular":"neprihănita","definite-error-unrecognized-form-masculine-plural":"neprihăniții","definite-error-unrecognized-form-feminine-neuter-plural":"neprihănitele"}},{"word":"nepriincios","pos":"adj","definitions":["unfavorable"],"forms":{"feminine-singular":"nepriincioasă","masculine-plural":"nepriincioși","feminine-neuter-plural":"nepriincioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepriincios","error-unrecognized-form-feminine-indefinite-singular":"nepriincioasă","error-unrecognized-form-indefinite-masculine-plural":"nepriincioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepriincioase","definite-error-unrecognized-form-masculine-neuter-singular":"nepriinciosul","definite-error-unrecognized-form-feminine-singular":"nepriincioasa","definite-error-unrecognized-form-masculine-plural":"nepriincioșii","definite-error-unrecognized-form-feminine-neuter-plural":"nepriincioasele"}},{"word":"nepriință","pos":"noun","definitions":["damage"],"forms":{"plural":"nepriințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nepriință","accusative-definite-nominative-singular":"nepriința","accusative-indefinite-nominative-plural":"nepriințe","accusative-definite-nominative-plural":"nepriințele","dative-genitive-indefinite-singular":"nepriințe","dative-definite-genitive-singular":"nepriinței","dative-genitive-indefinite-plural":"nepriințe","dative-definite-genitive-plural":"nepriințelor","singular-vocative":"nepriință","plural-vocative":"nepriințelor"}},{"word":"nepriitor","pos":"adj","definitions":["enemy"],"forms":{"feminine-singular":"nepriitoare","masculine-plural":"nepriitori","feminine-neuter-plural":"nepriitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepriitor","error-unrecognized-form-feminine-indefinite-singular":"nepriitoare","error-unrecognized-form-indefinite-masculine-plural":"nepriitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepriitoare","definite-error-unrecognized-form-masculine-neuter-singular":"nepriitorul","definite-error-unrecognized-form-feminine-singular":"nepriitoarea","definite-error-unrecognized-form-masculine-plural":"nepriitorii","definite-error-unrecognized-form-feminine-neuter-plural":"nepriitoarele"}},{"word":"nepriitor","pos":"noun","definitions":["enemy, wrongdoer"],"forms":{"plural":"nepriitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nepriitor","accusative-definite-nominative-singular":"nepriitorul","accusative-indefinite-nominative-plural":"nepriitori","accusative-definite-nominative-plural":"nepriitorii","dative-genitive-indefinite-singular":"nepriitor","dative-definite-genitive-singular":"nepriitorului","dative-genitive-indefinite-plural":"nepriitori","dative-definite-genitive-plural":"nepriitorilor","singular-vocative":"nepriitorule","plural-vocative":"nepriitorilor"}},{"word":"neprimitor","pos":"adj","definitions":["inhospitable"],"forms":{"feminine-singular":"neprimitoare","masculine-plural":"neprimitori","feminine-neuter-plural":"neprimitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neprimitor","error-unrecognized-form-feminine-indefinite-singular":"neprimitoare","error-unrecognized-form-indefinite-masculine-plural":"neprimitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"neprimitoare","definite-error-unrecognized-form-masculine-neuter-singular":"neprimitorul","definite-error-unrecognized-form-feminine-singular":"neprimitoarea","definite-error-unrecognized-form-masculine-plural":"neprimitorii","definite-error-unrecognized-form-feminine-neuter-plural":"neprimitoarele"}},{"word":"neprincipial","pos":"adj","definitions":["unprincipled"],"forms":{"feminine-singular":"neprincipială","masculine-plural":"neprincipiali","feminine-neuter-plural":"neprincipiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neprincipial","error-unrecognized-form-feminine-indefinite-singular":"neprincipială","error-unrecognized-form-indefinite-masculine-plural":"neprincipiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"neprincipiale","definite-error-unrecognized-form-masculine-neuter-singular":"neprincipialul","definite-error-unrecognized-form-feminine-singular":"neprincipiala","definite-error-unrecognized-form-masculine-plural":"neprincipialii","definite-error-unrecognized-form-feminine-neuter-plural":"neprincipialele"}},{"word":"neprocopsit","pos":"adj","definitions":["alternative form of nepricopsit"],"forms":{"feminine-singular":"neprocopsită","masculine-plural":"neprocopsiți","feminine-neuter-plural":"neprocopsite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neprocopsit","error-unrecognized-form-feminine-indefinite-singular":"neprocopsită","error-unrecognized-form-indefinite-masculine-plural":"neprocopsiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neprocopsite","definite-error-unrecognized-form-masculine-neuter-singular":"neprocopsitul","definite-error-unrecognized-form-feminine-singular":"neprocopsita","definite-error-unrecognized-form-masculine-plural":"neprocopsiții","definite-error-unrecognized-form-feminine-neuter-plural":"neprocopsitele"}},{"word":"neproducător","pos":"adj","definitions":["nonproducing"],"forms":{"feminine-singular":"neproducătoare","masculine-plural":"neproducători","feminine-neuter-plural":"neproducătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neproducător","error-unrecognized-form-feminine-indefinite-singular":"neproducătoare","error-unrecognized-form-indefinite-masculine-plural":"neproducători","error-unrecognized-form-feminine-indefinite-neuter-plural":"neproducătoare","definite-error-unrecognized-form-masculine-neuter-singular":"neproducătorul","definite-error-unrecognized-form-feminine-singular":"neproducătoarea","definite-error-unrecognized-form-masculine-plural":"neproducătorii","definite-error-unrecognized-form-feminine-neuter-plural":"neproducătoarele"}},{"word":"neproductiv","pos":"adj","definitions":["unproductive"],"forms":{"feminine-singular":"neproductivă","masculine-plural":"neproductivi","feminine-neuter-plural":"neproductive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neproductiv","error-unrecognized-form-feminine-indefinite-singular":"neproductivă","error-unrecognized-form-indefinite-masculine-plural":"neproductivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"neproductive","definite-error-unrecognized-form-masculine-neuter-singular":"neproductivul","definite-error-unrecognized-form-feminine-singular":"neproductiva","definite-error-unrecognized-form-masculine-plural":"neproductivii","definite-error-unrecognized-form-feminine-neuter-plural":"neproductivele"}},{"word":"neprofesionist","pos":"adj","definitions":["unprofessional"],"forms":{"feminine-singular":"neprofesionistă","masculine-plural":"neprofesioniști","feminine-neuter-plural":"neprofesioniste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neprofesionist","error-unrecognized-form-feminine-indefinite-singular":"neprofesionistă","error-unrecognized-form-indefinite-masculine-plural":"neprofesioniști","error-unrecognized-form-feminine-indefinite-neuter-plural":"neprofesioniste","definite-error-unrecognized-form-masculine-neuter-singular":"neprofesionistul","definite-error-unrecognized-form-feminine-singular":"neprofesionista","definite-error-unrecognized-form-masculine-plural":"neprofesioniștii","definite-error-unrecognized-form-feminine-neuter-plural":"neprofesionistele"}},{"word":"neprofesionistă","pos":"noun","definitions":["female equivalent of neprofesionist"],"forms":{"plural":"neprofesioniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neprofesionistă","accusative-definite-nominative-singular":"neprofesionista","accusative-indefinite-nominative-plural":"neprofesioniste","accusative-definite-nominative-plural":"neprofesionistele","dative-genitive-indefinite-singular":"neprofesioniste","dative-definite-genitive-singular":"neprofesionistei","dative-genitive-indefinite-plural":"neprofesioniste","dative-definite-genitive-plural":"neprofesionistelor","singular-vocative":"neprofesionistă","plural-vocative":"neprofesionistelor"}},{"word":"neproliferare","pos":"noun","definitions":["non-proliferation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neproliferare","accusative-definite-nominative":"neproliferarea","dative-genitive-indefinite":"neproliferari","dative-definite-genitive":"neproliferarii","vocative":"neproliferare"}},{"word":"neprotejat","pos":"adj","definitions":["unprotected"],"pronunciation":"[ˌne.pro.teˈʒat]","forms":{"feminine-singular":"neprotejată","masculine-plural":"neprotejați","feminine-neuter-plural":"neprotejate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neprotejat","error-unrecognized-form-feminine-indefinite-singular":"neprotejată","error-unrecognized-form-indefinite-masculine-plural":"neprotejați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neprotejate","definite-error-unrecognized-form-masculine-neuter-singular":"neprotejatul","definite-error-unrecognized-form-feminine-singular":"neprotejata","definite-error-unrecognized-form-masculine-plural":"neprotejații","definite-error-unrecognized-form-feminine-neuter-plural":"neprotejatele"}},{"word":"neprotejat","pos":"verb","definitions":["negative past participle of proteja"],"pronunciation":"[ˌne.pro.teˈʒat]"},{"word":"neprudență","pos":"noun","definitions":["imprudence, rashness"],"forms":{"plural":"neprudențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neprudență","accusative-definite-nominative-singular":"neprudența","accusative-indefinite-nominative-plural":"neprudențe","accusative-definite-nominative-plural":"neprudențele","dative-genitive-indefinite-singular":"neprudențe","dative-definite-genitive-singular":"neprudenței","dative-genitive-indefinite-plural":"neprudențe","dative-definite-genitive-plural":"neprudențelor","singular-vocative":"neprudență","plural-vocative":"neprudențelor"}},{"word":"Neptun","pos":"name","definitions":["Neptune (planet)","Neptune (deity)"],"gender":"m"},{"word":"neptunian","pos":"adj","definitions":["Neptunian"],"forms":{"feminine-singular":"neptuniană","masculine-plural":"neptunieni","feminine-neuter-plural":"neptuniene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neptunian","error-unrecognized-form-feminine-indefinite-singular":"neptuniană","error-unrecognized-form-indefinite-masculine-plural":"neptunieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"neptuniene","definite-error-unrecognized-form-masculine-neuter-singular":"neptunianul","definite-error-unrecognized-form-feminine-singular":"neptuniana","definite-error-unrecognized-form-masculine-plural":"neptunienii","definite-error-unrecognized-form-feminine-neuter-plural":"neptunienele"}},{"word":"neptunic","pos":"adj","definitions":["Neptunian"],"forms":{"feminine-singular":"neptunică","masculine-plural":"neptunici","feminine-neuter-plural":"neptunice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neptunic","error-unrecognized-form-feminine-indefinite-singular":"neptunică","error-unrecognized-form-indefinite-masculine-plural":"neptunici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neptunice","definite-error-unrecognized-form-masculine-neuter-singular":"neptunicul","definite-error-unrecognized-form-feminine-singular":"neptunica","definite-error-unrecognized-form-masculine-plural":"neptunicii","definite-error-unrecognized-form-feminine-neuter-plural":"neptunicele"}},{"word":"neptunism","pos":"noun","definitions":["neptunism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neptunism","accusative-definite-nominative-singular":"neptunismul","accusative-indefinite-nominative-plural":"neptunisme","accusative-definite-nominative-plural":"neptunismele","dative-genitive-indefinite-singular":"neptunism","dative-definite-genitive-singular":"neptunismului","dative-genitive-indefinite-plural":"neptunisme","dative-definite-genitive-plural":"neptunismelor","singular-vocative":"neptunismule","plural-vocative":"neptunismelor"}},{"word":"neptuniu","pos":"noun","definitions":["neptunium (element)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neptuniu","accusative-definite-nominative":"neptuniul","dative-genitive-indefinite":"neptuniu","dative-definite-genitive":"neptuniului","vocative":"neptuniule"}},{"word":"nepublicat","pos":"adj","definitions":["unpublished"],"forms":{"feminine-singular":"nepublicată","masculine-plural":"nepublicați","feminine-neuter-plural":"nepublicate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepublicat","error-unrecognized-form-feminine-indefinite-singular":"nepublicată","error-unrecognized-form-indefinite-masculine-plural":"nepublicați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepublicate","definite-error-unrecognized-form-masculine-neuter-singular":"nepublicatul","definite-error-unrecognized-form-feminine-singular":"nepublicata","definite-error-unrecognized-form-masculine-plural":"nepublicații","definite-error-unrecognized-form-feminine-neuter-plural":"nepublicatele"}},{"word":"nepunctual","pos":"adj","definitions":["unpunctual"],"forms":{"feminine-singular":"nepunctuală","masculine-plural":"nepunctuali","feminine-neuter-plural":"nepunctuale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nepunctual","error-unrecognized-form-feminine-indefinite-singular":"nepunctuală","error-unrecognized-form-indefinite-masculine-plural":"nepunctuali","error-unrecognized-form-feminine-indefinite-neuter-plural":"nepunctuale","definite-error-unrecognized-form-masculine-neuter-singular":"nepunctualul","definite-error-unrecognized-form-feminine-singular":"nepunctuala","definite-error-unrecognized-form-masculine-plural":"nepunctualii","definite-error-unrecognized-form-feminine-neuter-plural":"nepunctualele"}},{"word":"nepurtare","pos":"noun","definitions":["negligence"],"forms":{"plural":"nepurtări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nepurtare","accusative-definite-nominative-singular":"nepurtarea","accusative-indefinite-nominative-plural":"nepurtări","accusative-definite-nominative-plural":"nepurtările","dative-genitive-indefinite-singular":"nepurtări","dative-definite-genitive-singular":"nepurtării","dative-genitive-indefinite-plural":"nepurtări","dative-definite-genitive-plural":"nepurtărilor","singular-vocative":"nepurtare","plural-vocative":"nepurtărilor"}},{"word":"neputere","pos":"noun","definitions":["powerlessness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neputere","accusative-definite-nominative":"neputerea","dative-genitive-indefinite":"neputeri","dative-definite-genitive":"neputerii","vocative":"neputere"}},{"word":"neputernic","pos":"adj","definitions":["helpless"],"forms":{"feminine-singular":"neputernică","masculine-plural":"neputernici","feminine-neuter-plural":"neputernice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neputernic","error-unrecognized-form-feminine-indefinite-singular":"neputernică","error-unrecognized-form-indefinite-masculine-plural":"neputernici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neputernice","definite-error-unrecognized-form-masculine-neuter-singular":"neputernicul","definite-error-unrecognized-form-feminine-singular":"neputernica","definite-error-unrecognized-form-masculine-plural":"neputernicii","definite-error-unrecognized-form-feminine-neuter-plural":"neputernicele"}},{"word":"neputincios","pos":"adj","definitions":["helpless"],"forms":{"feminine-singular":"neputincioasă","masculine-plural":"neputincioși","feminine-neuter-plural":"neputincioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neputincios","error-unrecognized-form-feminine-indefinite-singular":"neputincioasă","error-unrecognized-form-indefinite-masculine-plural":"neputincioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"neputincioase","definite-error-unrecognized-form-masculine-neuter-singular":"neputinciosul","definite-error-unrecognized-form-feminine-singular":"neputincioasa","definite-error-unrecognized-form-masculine-plural":"neputincioșii","definite-error-unrecognized-form-feminine-neuter-plural":"neputincioasele"}},{"word":"neputincioșie","pos":"noun","definitions":["helplessness"],"forms":{"plural":"neputincioșii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neputincioșie","accusative-definite-nominative-singular":"neputincioșia","accusative-indefinite-nominative-plural":"neputincioșii","accusative-definite-nominative-plural":"neputincioșiile","dative-genitive-indefinite-singular":"neputincioșii","dative-definite-genitive-singular":"neputincioșiei","dative-genitive-indefinite-plural":"neputincioșii","dative-definite-genitive-plural":"neputincioșiilor","singular-vocative":"neputincioșie","plural-vocative":"neputincioșiilor"}},{"word":"neputință","pos":"noun","definitions":["impotence"],"forms":{"plural":"neputințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neputință","accusative-definite-nominative-singular":"neputința","accusative-indefinite-nominative-plural":"neputințe","accusative-definite-nominative-plural":"neputințele","dative-genitive-indefinite-singular":"neputințe","dative-definite-genitive-singular":"neputinței","dative-genitive-indefinite-plural":"neputințe","dative-definite-genitive-plural":"neputințelor","singular-vocative":"neputință","plural-vocative":"neputințelor"}},{"word":"neputrejune","pos":"noun","definitions":["eternity"],"forms":{"plural":"neputrejuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neputrejune","accusative-definite-nominative-singular":"neputrejunea","accusative-indefinite-nominative-plural":"neputrejuni","accusative-definite-nominative-plural":"neputrejunile","dative-genitive-indefinite-singular":"neputrejuni","dative-definite-genitive-singular":"neputrejunii","dative-genitive-indefinite-plural":"neputrejuni","dative-definite-genitive-plural":"neputrejunilor","singular-vocative":"neputrejune","plural-vocative":"neputrejunilor"}},{"word":"nerăbdare","pos":"noun","definitions":["impatience"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"nerăbdare","accusative-definite-nominative":"nerăbdarea","dative-genitive-indefinite":"nerăbdari","dative-definite-genitive":"nerăbdarii","vocative":"nerăbdare"}},{"word":"nerăbdător","pos":"adj","definitions":["anxious"],"forms":{"feminine-singular":"nerăbdătoare","masculine-plural":"nerăbdători","feminine-neuter-plural":"nerăbdătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nerăbdător","error-unrecognized-form-feminine-indefinite-singular":"nerăbdătoare","error-unrecognized-form-indefinite-masculine-plural":"nerăbdători","error-unrecognized-form-feminine-indefinite-neuter-plural":"nerăbdătoare","definite-error-unrecognized-form-masculine-neuter-singular":"nerăbdătorul","definite-error-unrecognized-form-feminine-singular":"nerăbdătoarea","definite-error-unrecognized-form-masculine-plural":"nerăbdătorii","definite-error-unrecognized-form-feminine-neuter-plural":"nerăbdătoarele"}},{"word":"nerambursabil","pos":"adj","definitions":["non-refundable"],"forms":{"feminine-singular":"nerambursabilă","masculine-plural":"nerambursabili","feminine-neuter-plural":"nerambursabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nerambursabil","error-unrecognized-form-feminine-indefinite-singular":"nerambursabilă","error-unrecognized-form-indefinite-masculine-plural":"nerambursabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nerambursabile","definite-error-unrecognized-form-masculine-neuter-singular":"nerambursabilul","definite-error-unrecognized-form-feminine-singular":"nerambursabila","definite-error-unrecognized-form-masculine-plural":"nerambursabilii","definite-error-unrecognized-form-feminine-neuter-plural":"nerambursabilele"}},{"word":"neramz","pos":"noun","definitions":["alternative form of naramz"],"forms":{"plural":"neramzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neramz","accusative-definite-nominative-singular":"neramzul","accusative-indefinite-nominative-plural":"neramzi","accusative-definite-nominative-plural":"neramzii","dative-genitive-indefinite-singular":"neramz","dative-definite-genitive-singular":"neramzului","dative-genitive-indefinite-plural":"neramzi","dative-definite-genitive-plural":"neramzilor","singular-vocative":"neramzule","plural-vocative":"neramzilor"}},{"word":"nerămzat","pos":"adj","definitions":["alternative form of naramzat"],"forms":{"feminine-singular":"nerămzată","masculine-plural":"nerămzați","feminine-neuter-plural":"nerămzate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nerămzat","error-unrecognized-form-feminine-indefinite-singular":"nerămzată","error-unrecognized-form-indefinite-masculine-plural":"nerămzați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nerămzate","definite-error-unrecognized-form-masculine-neuter-singular":"nerămzatul","definite-error-unrecognized-form-feminine-singular":"nerămzata","definite-error-unrecognized-form-masculine-plural":"nerămzații","definite-error-unrecognized-form-feminine-neuter-plural":"nerămzatele"}},{"word":"nerămziu","pos":"adj","definitions":["alternative form of narangiu"],"forms":{"feminine-singular":"nerămzie","plural":"nerămzii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nerămziu","error-unrecognized-form-feminine-indefinite-singular":"nerămzie","error-unrecognized-form-indefinite-masculine-plural":"nerămzii","error-unrecognized-form-feminine-indefinite-neuter-plural":"nerămzii","definite-error-unrecognized-form-masculine-neuter-singular":"nerămziul","definite-error-unrecognized-form-feminine-singular":"nerămzia","definite-error-unrecognized-form-masculine-plural":"nerămziii","definite-error-unrecognized-form-feminine-neuter-plural":"nerămziile"}},{"word":"nerăpitor","pos":"adj","definitions":["phytophagous"],"forms":{"feminine-singular":"nerăpitoare","masculine-plural":"nerăpitori","feminine-neuter-plural":"nerăpitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nerăpitor","error-unrecognized-form-feminine-indefinite-singular":"nerăpitoare","error-unrecognized-form-indefinite-masculine-plural":"nerăpitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"nerăpitoare","definite-error-unrecognized-form-masculine-neuter-singular":"nerăpitorul","definite-error-unrecognized-form-feminine-singular":"nerăpitoarea","definite-error-unrecognized-form-masculine-plural":"nerăpitorii","definite-error-unrecognized-form-feminine-neuter-plural":"nerăpitoarele"}},{"word":"neras","pos":"adj","definitions":["unshaven"],"pronunciation":"/neˈras/","forms":{"feminine-singular":"nerasă","masculine-plural":"nerași","feminine-neuter-plural":"nerase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neras","error-unrecognized-form-feminine-indefinite-singular":"nerasă","error-unrecognized-form-indefinite-masculine-plural":"nerași","error-unrecognized-form-feminine-indefinite-neuter-plural":"nerase","definite-error-unrecognized-form-masculine-neuter-singular":"nerasul","definite-error-unrecognized-form-feminine-singular":"nerasa","definite-error-unrecognized-form-masculine-plural":"nerașii","definite-error-unrecognized-form-feminine-neuter-plural":"nerasele"}},{"word":"nerațional","pos":"adj","definitions":["unreasonable"],"forms":{"feminine-singular":"nerațională","masculine-plural":"neraționali","feminine-neuter-plural":"neraționale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nerațional","error-unrecognized-form-feminine-indefinite-singular":"nerațională","error-unrecognized-form-indefinite-masculine-plural":"neraționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"neraționale","definite-error-unrecognized-form-masculine-neuter-singular":"neraționalul","definite-error-unrecognized-form-feminine-singular":"neraționala","definite-error-unrecognized-form-masculine-plural":"neraționalii","definite-error-unrecognized-form-feminine-neuter-plural":"neraționalele"}},{"word":"Nerău","pos":"name","definitions":["a village in Teremia Mare, Timiș County, Romania"],"gender":"m"},{"word":"nerăutate","pos":"noun","definitions":["goodness"],"forms":{"plural":"nerăutatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nerăutate","accusative-definite-nominative-singular":"nerăutatea","accusative-indefinite-nominative-plural":"nerăutatăți","accusative-definite-nominative-plural":"nerăutatățile","dative-genitive-indefinite-singular":"nerăutatăți","dative-definite-genitive-singular":"nerăutatății","dative-genitive-indefinite-plural":"nerăutatăți","dative-definite-genitive-plural":"nerăutatăților","singular-vocative":"nerăutate","plural-vocative":"nerăutatăților"}},{"word":"nerăzbit","pos":"adj","definitions":["unconquered"],"forms":{"feminine-singular":"nerăzbită","masculine-plural":"nerăzbiți","feminine-neuter-plural":"nerăzbite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nerăzbit","error-unrecognized-form-feminine-indefinite-singular":"nerăzbită","error-unrecognized-form-indefinite-masculine-plural":"nerăzbiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nerăzbite","definite-error-unrecognized-form-masculine-neuter-singular":"nerăzbitul","definite-error-unrecognized-form-feminine-singular":"nerăzbita","definite-error-unrecognized-form-masculine-plural":"nerăzbiții","definite-error-unrecognized-form-feminine-neuter-plural":"nerăzbitele"}},{"word":"nereal","pos":"adj","definitions":["unreal"],"pronunciation":"[ne.reˈal]","forms":{"feminine-singular":"nereală","masculine-plural":"nereali","feminine-neuter-plural":"nereale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"nereal","error-unrecognized-form-feminine-indefinite-singular":"nereală","error-unrecognized-form-indefinite-masculine-plural":"nereali","error-unrecognized-form-feminine-indefinite-neuter-plural":"nereale","definite-error-unrecognized-form-masculine-neuter-singular":"nerealul","definite-error-unrecognized-form-feminine-singular":"nereala","definite-error-unrecognized-form-masculine-plural":"nerealii","definite-error-unrecognized-form-feminine-neuter-plural":"nerealele"}},{"word":"nerealist","pos":"adj","definitions":["unrealistic"],"forms":{"feminine-singular":"nerealistă","masculine-plural":"nerealiști","feminine-neuter-plural":"nerealiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nerealist","error-unrecognized-form-feminine-indefinite-singular":"nerealistă","error-unrecognized-form-indefinite-masculine-plural":"nerealiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"nerealiste","definite-error-unrecognized-form-masculine-neuter-singular":"nerealistul","definite-error-unrecognized-form-feminine-singular":"nerealista","definite-error-unrecognized-form-masculine-plural":"nerealiștii","definite-error-unrecognized-form-feminine-neuter-plural":"nerealistele"}},{"word":"nerealizabil","pos":"adj","definitions":["unachievable"],"forms":{"feminine-singular":"nerealizabilă","masculine-plural":"nerealizabili","feminine-neuter-plural":"nerealizabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nerealizabil","error-unrecognized-form-feminine-indefinite-singular":"nerealizabilă","error-unrecognized-form-indefinite-masculine-plural":"nerealizabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nerealizabile","definite-error-unrecognized-form-masculine-neuter-singular":"nerealizabilul","definite-error-unrecognized-form-feminine-singular":"nerealizabila","definite-error-unrecognized-form-masculine-plural":"nerealizabilii","definite-error-unrecognized-form-feminine-neuter-plural":"nerealizabilele"}},{"word":"nerecepționat","pos":"adj","definitions":["not received"],"forms":{"feminine-singular":"nerecepționată","masculine-plural":"nerecepționați","feminine-neuter-plural":"nerecepționate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nerecepționat","error-unrecognized-form-feminine-indefinite-singular":"nerecepționată","error-unrecognized-form-indefinite-masculine-plural":"nerecepționați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nerecepționate","definite-error-unrecognized-form-masculine-neuter-singular":"nerecepționatul","definite-error-unrecognized-form-feminine-singular":"nerecepționata","definite-error-unrecognized-form-masculine-plural":"nerecepționații","definite-error-unrecognized-form-feminine-neuter-plural":"nerecepționatele"}},{"word":"nereceptiv","pos":"adj","definitions":["unreceptive"],"forms":{"feminine-singular":"nereceptivă","masculine-plural":"nereceptivi","feminine-neuter-plural":"nereceptive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nereceptiv","error-unrecognized-form-feminine-indefinite-singular":"nereceptivă","error-unrecognized-form-indefinite-masculine-plural":"nereceptivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"nereceptive","definite-error-unrecognized-form-masculine-neuter-singular":"nereceptivul","definite-error-unrecognized-form-feminine-singular":"nereceptiva","definite-error-unrecognized-form-masculine-plural":"nereceptivii","definite-error-unrecognized-form-feminine-neuter-plural":"nereceptivele"}},{"word":"nerecoltat","pos":"adj","definitions":["unharvested"],"forms":{"feminine-singular":"nerecoltată","masculine-plural":"nerecoltați","feminine-neuter-plural":"nerecoltate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nerecoltat","error-unrecognized-form-feminine-indefinite-singular":"nerecoltată","error-unrecognized-form-indefinite-masculine-plural":"nerecoltați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nerecoltate","definite-error-unrecognized-form-masculine-neuter-singular":"nerecoltatul","definite-error-unrecognized-form-feminine-singular":"nerecoltata","definite-error-unrecognized-form-masculine-plural":"nerecoltații","definite-error-unrecognized-form-feminine-neuter-plural":"nerecoltatele"}},{"word":"nereconciliabil","pos":"adj","definitions":["unreconcilable"],"forms":{"feminine-singular":"nereconciliabilă","masculine-plural":"nereconciliabili","feminine-neuter-plural":"nereconciliabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nereconciliabil","error-unrecognized-form-feminine-indefinite-singular":"nereconciliabilă","error-unrecognized-form-indefinite-masculine-plural":"nereconciliabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nereconciliabile","definite-error-unrecognized-form-masculine-neuter-singular":"nereconciliabilul","definite-error-unrecognized-form-feminine-singular":"nereconciliabila","definite-error-unrecognized-form-masculine-plural":"nereconciliabilii","definite-error-unrecognized-form-feminine-neuter-plural":"nereconciliabilele"}},{"word":"nerecunoscătoare","pos":"noun","definitions":["female equivalent of nerecunoscător"],"forms":{"plural":"nerecunoscătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"nerecunoscătoare","accusative-definite-nominative-singular":"nerecunoscătoarea","accusative-indefinite-nominative-plural":"nerecunoscătoare","accusative-definite-nominative-plural":"nerecunoscătoarele","dative-genitive-indefinite-singular":"nerecunoscătoare","dative-definite-genitive-singular":"nerecunoscătoarei","dative-genitive-indefinite-plural":"nerecunoscătoare","dative-definite-genitive-plural":"nerecunoscătoarelor","singular-vocative":"nerecunoscătoare","plural-vocative":"nerecunoscătoarelor"}},{"word":"nerecunoscător","pos":"noun","definitions":["ungrateful"],"forms":{"plural":"nerecunoscători","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nerecunoscător","accusative-definite-nominative-singular":"nerecunoscătorul","accusative-indefinite-nominative-plural":"nerecunoscători","accusative-definite-nominative-plural":"nerecunoscătorii","dative-genitive-indefinite-singular":"nerecunoscător","dative-definite-genitive-singular":"nerecunoscătorului","dative-genitive-indefinite-plural":"nerecunoscători","dative-definite-genitive-plural":"nerecunoscătorilor","singular-vocative":"nerecunoscătorule","plural-vocative":"nerecunoscătorilor"}},{"word":"nerecunoscut","pos":"adj","definitions":["unrecognized"],"pronunciation":"/ˌne.reˌku.nosˈkut/","forms":{"feminine-singular":"nerecunoscută","masculine-plural":"nerecunoscuți","feminine-neuter-plural":"nerecunoscute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nerecunoscut","error-unrecognized-form-feminine-indefinite-singular":"nerecunoscută","error-unrecognized-form-indefinite-masculine-plural":"nerecunoscuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nerecunoscute","definite-error-unrecognized-form-masculine-neuter-singular":"nerecunoscutul","definite-error-unrecognized-form-feminine-singular":"nerecunoscuta","definite-error-unrecognized-form-masculine-plural":"nerecunoscuții","definite-error-unrecognized-form-feminine-neuter-plural":"nerecunoscutele"}},{"word":"nerecunoscut","pos":"verb","definitions":["negative past participle of recunoaște"],"pronunciation":"/ˌne.reˌku.nosˈkut/"},{"word":"nerecunoștință","pos":"noun","definitions":["ingratitude"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"nerecunoștință","accusative-definite-nominative":"nerecunoștința","dative-genitive-indefinite":"nerecunoștințe","dative-definite-genitive":"nerecunoștinței","vocative":"nerecunoștință"}},{"word":"nerecuperabil","pos":"adj","definitions":["irrecoverable"],"forms":{"feminine-singular":"nerecuperabilă","masculine-plural":"nerecuperabili","feminine-neuter-plural":"nerecuperabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nerecuperabil","error-unrecognized-form-feminine-indefinite-singular":"nerecuperabilă","error-unrecognized-form-indefinite-masculine-plural":"nerecuperabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nerecuperabile","definite-error-unrecognized-form-masculine-neuter-singular":"nerecuperabilul","definite-error-unrecognized-form-feminine-singular":"nerecuperabila","definite-error-unrecognized-form-masculine-plural":"nerecuperabilii","definite-error-unrecognized-form-feminine-neuter-plural":"nerecuperabilele"}},{"word":"neregal","pos":"adj","definitions":["unroyal; unregal"],"pronunciation":"/ˌne.reˈɡal/","forms":{"feminine-singular":"neregală","masculine-plural":"neregali","feminine-neuter-plural":"neregale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"neregal","error-unrecognized-form-feminine-indefinite-singular":"neregală","error-unrecognized-form-indefinite-masculine-plural":"neregali","error-unrecognized-form-feminine-indefinite-neuter-plural":"neregale","definite-error-unrecognized-form-masculine-neuter-singular":"neregalul","definite-error-unrecognized-form-feminine-singular":"neregala","definite-error-unrecognized-form-masculine-plural":"neregalii","definite-error-unrecognized-form-feminine-neuter-plural":"neregalele"}},{"word":"neregulă","pos":"noun","definitions":["wrong"],"forms":{"plural":"nereguli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"neregulă","accusative-definite-nominative-singular":"neregula","accusative-indefinite-nominative-plural":"nereguli","accusative-definite-nominative-plural":"neregulile","dative-genitive-indefinite-singular":"nereguli","dative-definite-genitive-singular":"neregulii","dative-genitive-indefinite-plural":"nereguli","dative-definite-genitive-plural":"neregulilor","singular-vocative":"neregulă","plural-vocative":"neregulilor"}},{"word":"neregularitate","pos":"noun","definitions":["irregularity"],"forms":{"plural":"neregularități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neregularitate","accusative-definite-nominative-singular":"neregularitatea","accusative-indefinite-nominative-plural":"neregularități","accusative-definite-nominative-plural":"neregularitățile","dative-genitive-indefinite-singular":"neregularități","dative-definite-genitive-singular":"neregularității","dative-genitive-indefinite-plural":"neregularități","dative-definite-genitive-plural":"neregularităților","singular-vocative":"neregularitate","plural-vocative":"neregularităților"}},{"word":"neregulat","pos":"adj","definitions":["irregular, abnormal","uneven","disorderly"],"pronunciation":"/ˌne.re.ɡuˈlat/","forms":{"feminine-singular":"neregulată","masculine-plural":"neregulați","feminine-neuter-plural":"neregulate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neregulat","error-unrecognized-form-feminine-indefinite-singular":"neregulată","error-unrecognized-form-indefinite-masculine-plural":"neregulați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neregulate","definite-error-unrecognized-form-masculine-neuter-singular":"neregulatul","definite-error-unrecognized-form-feminine-singular":"neregulata","definite-error-unrecognized-form-masculine-plural":"neregulații","definite-error-unrecognized-form-feminine-neuter-plural":"neregulatele"}},{"word":"nereidă","pos":"noun","definitions":["nereid"],"forms":{"plural":"nereide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nereidă","accusative-definite-nominative-singular":"nereida","accusative-indefinite-nominative-plural":"nereide","accusative-definite-nominative-plural":"nereidele","dative-genitive-indefinite-singular":"nereide","dative-definite-genitive-singular":"nereidei","dative-genitive-indefinite-plural":"nereide","dative-definite-genitive-plural":"nereidelor","singular-vocative":"nereidă","plural-vocative":"nereidelor"}},{"word":"Nereju","pos":"name","definitions":["a commune of Vrancea County, Romania","a village in Nereju, Vrancea County, Romania"],"gender":"m"},{"word":"Nereju Mic","pos":"name","definitions":["a village in Nereju, Vrancea County, Romania"],"gender":"m"},{"word":"nereligios","pos":"adj","definitions":["irreligious"],"forms":{"feminine-singular":"nereligioasă","masculine-plural":"nereligioși","feminine-neuter-plural":"nereligioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nereligios","error-unrecognized-form-feminine-indefinite-singular":"nereligioasă","error-unrecognized-form-indefinite-masculine-plural":"nereligioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nereligioase","definite-error-unrecognized-form-masculine-neuter-singular":"nereligiosul","definite-error-unrecognized-form-feminine-singular":"nereligioasa","definite-error-unrecognized-form-masculine-plural":"nereligioșii","definite-error-unrecognized-form-feminine-neuter-plural":"nereligioasele"}},{"word":"nereparabil","pos":"adj","definitions":["unfixable"],"forms":{"feminine-singular":"nereparabilă","masculine-plural":"nereparabili","feminine-neuter-plural":"nereparabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nereparabil","error-unrecognized-form-feminine-indefinite-singular":"nereparabilă","error-unrecognized-form-indefinite-masculine-plural":"nereparabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nereparabile","definite-error-unrecognized-form-masculine-neuter-singular":"nereparabilul","definite-error-unrecognized-form-feminine-singular":"nereparabila","definite-error-unrecognized-form-masculine-plural":"nereparabilii","definite-error-unrecognized-form-feminine-neuter-plural":"nereparabilele"}},{"word":"nereparat","pos":"adj","definitions":["unfixed"],"forms":{"feminine-singular":"nereparată","masculine-plural":"nereparați","feminine-neuter-plural":"nereparate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nereparat","error-unrecognized-form-feminine-indefinite-singular":"nereparată","error-unrecognized-form-indefinite-masculine-plural":"nereparați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nereparate","definite-error-unrecognized-form-masculine-neuter-singular":"nereparatul","definite-error-unrecognized-form-feminine-singular":"nereparata","definite-error-unrecognized-form-masculine-plural":"nereparații","definite-error-unrecognized-form-feminine-neuter-plural":"nereparatele"}},{"word":"nerespectare","pos":"noun","definitions":["disrespect"],"forms":{"plural":"nerespectări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nerespectare","accusative-definite-nominative-singular":"nerespectarea","accusative-indefinite-nominative-plural":"nerespectări","accusative-definite-nominative-plural":"nerespectările","dative-genitive-indefinite-singular":"nerespectări","dative-definite-genitive-singular":"nerespectării","dative-genitive-indefinite-plural":"nerespectări","dative-definite-genitive-plural":"nerespectărilor","singular-vocative":"nerespectare","plural-vocative":"nerespectărilor"}},{"word":"nerespectuos","pos":"adj","definitions":["disrespectful"],"forms":{"feminine-singular":"nerespectuoasă","masculine-plural":"nerespectuoși","feminine-neuter-plural":"nerespectuoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nerespectuos","error-unrecognized-form-feminine-indefinite-singular":"nerespectuoasă","error-unrecognized-form-indefinite-masculine-plural":"nerespectuoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nerespectuoase","definite-error-unrecognized-form-masculine-neuter-singular":"nerespectuosul","definite-error-unrecognized-form-feminine-singular":"nerespectuoasa","definite-error-unrecognized-form-masculine-plural":"nerespectuoșii","definite-error-unrecognized-form-feminine-neuter-plural":"nerespectuoasele"}},{"word":"nereușit","pos":"adj","definitions":["unsuccessful"],"forms":{"feminine-singular":"nereușită","masculine-plural":"nereușiți","feminine-neuter-plural":"nereușite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nereușit","error-unrecognized-form-feminine-indefinite-singular":"nereușită","error-unrecognized-form-indefinite-masculine-plural":"nereușiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nereușite","definite-error-unrecognized-form-masculine-neuter-singular":"nereușitul","definite-error-unrecognized-form-feminine-singular":"nereușita","definite-error-unrecognized-form-masculine-plural":"nereușiții","definite-error-unrecognized-form-feminine-neuter-plural":"nereușitele"}},{"word":"nereușită","pos":"noun","definitions":["failure"],"forms":{"plural":"nereușite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nereușită","accusative-definite-nominative-singular":"nereușita","accusative-indefinite-nominative-plural":"nereușite","accusative-definite-nominative-plural":"nereușitele","dative-genitive-indefinite-singular":"nereușite","dative-definite-genitive-singular":"nereușitei","dative-genitive-indefinite-plural":"nereușite","dative-definite-genitive-plural":"nereușitelor","singular-vocative":"nereușită","plural-vocative":"nereușitelor"}},{"word":"nereverențios","pos":"adj","definitions":["irreverent"],"forms":{"feminine-singular":"nereverențioasă","masculine-plural":"nereverențioși","feminine-neuter-plural":"nereverențioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nereverențios","error-unrecognized-form-feminine-indefinite-singular":"nereverențioasă","error-unrecognized-form-indefinite-masculine-plural":"nereverențioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nereverențioase","definite-error-unrecognized-form-masculine-neuter-singular":"nereverențiosul","definite-error-unrecognized-form-feminine-singular":"nereverențioasa","definite-error-unrecognized-form-masculine-plural":"nereverențioșii","definite-error-unrecognized-form-feminine-neuter-plural":"nereverențioasele"}},{"word":"nerezervat","pos":"adj","definitions":["unreserved"],"pronunciation":"/ˌne.re.zerˈvat/","forms":{"feminine-singular":"nerezervată","masculine-plural":"nerezervați","feminine-neuter-plural":"nerezervate","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"nerezervat","error-unrecognized-form-feminine-indefinite-singular":"nerezervată","error-unrecognized-form-indefinite-masculine-plural":"nerezervați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nerezervate","definite-error-unrecognized-form-masculine-neuter-singular":"nerezervatul","definite-error-unrecognized-form-feminine-singular":"nerezervata","definite-error-unrecognized-form-masculine-plural":"nerezervații","definite-error-unrecognized-form-feminine-neuter-plural":"nerezervatele"}},{"word":"nerezolvat","pos":"adj","definitions":["unsolved"],"forms":{"feminine-singular":"nerezolvată","masculine-plural":"nerezolvați","feminine-neuter-plural":"nerezolvate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nerezolvat","error-unrecognized-form-feminine-indefinite-singular":"nerezolvată","error-unrecognized-form-indefinite-masculine-plural":"nerezolvați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nerezolvate","definite-error-unrecognized-form-masculine-neuter-singular":"nerezolvatul","definite-error-unrecognized-form-feminine-singular":"nerezolvata","definite-error-unrecognized-form-masculine-plural":"nerezolvații","definite-error-unrecognized-form-feminine-neuter-plural":"nerezolvatele"}},{"word":"neritic","pos":"adj","definitions":["neritic"],"forms":{"feminine-singular":"neritică","masculine-plural":"neritici","feminine-neuter-plural":"neritice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neritic","error-unrecognized-form-feminine-indefinite-singular":"neritică","error-unrecognized-form-indefinite-masculine-plural":"neritici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neritice","definite-error-unrecognized-form-masculine-neuter-singular":"neriticul","definite-error-unrecognized-form-feminine-singular":"neritica","definite-error-unrecognized-form-masculine-plural":"neriticii","definite-error-unrecognized-form-feminine-neuter-plural":"neriticele"}},{"word":"neroadă","pos":"noun","definitions":["female equivalent of nerod"],"forms":{"plural":"neroade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neroadă","accusative-definite-nominative-singular":"neroada","accusative-indefinite-nominative-plural":"neroade","accusative-definite-nominative-plural":"neroadele","dative-genitive-indefinite-singular":"neroade","dative-definite-genitive-singular":"neroadei","dative-genitive-indefinite-plural":"neroade","dative-definite-genitive-plural":"neroadelor","singular-vocative":"neroadă","plural-vocative":"neroadelor"}},{"word":"nerod","pos":"adj","definitions":["stupid"],"forms":{"feminine-singular":"nerodă","masculine-plural":"nerozi","feminine-neuter-plural":"nerode","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nerod","error-unrecognized-form-feminine-indefinite-singular":"nerodă","error-unrecognized-form-indefinite-masculine-plural":"nerozi","error-unrecognized-form-feminine-indefinite-neuter-plural":"nerode","definite-error-unrecognized-form-masculine-neuter-singular":"nerodul","definite-error-unrecognized-form-feminine-singular":"neroda","definite-error-unrecognized-form-masculine-plural":"nerozii","definite-error-unrecognized-form-feminine-neuter-plural":"nerodele"}},{"word":"neroditor","pos":"adj","definitions":["fruitless"],"forms":{"feminine-singular":"neroditoare","masculine-plural":"neroditori","feminine-neuter-plural":"neroditoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neroditor","error-unrecognized-form-feminine-indefinite-singular":"neroditoare","error-unrecognized-form-indefinite-masculine-plural":"neroditori","error-unrecognized-form-feminine-indefinite-neuter-plural":"neroditoare","definite-error-unrecognized-form-masculine-neuter-singular":"neroditorul","definite-error-unrecognized-form-feminine-singular":"neroditoarea","definite-error-unrecognized-form-masculine-plural":"neroditorii","definite-error-unrecognized-form-feminine-neuter-plural":"neroditoarele"}},{"word":"neromânesc","pos":"adj","definitions":["non-Romanian"],"forms":{"feminine-singular":"neromânească","plural":"neromânești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neromânesc","error-unrecognized-form-feminine-indefinite-singular":"neromânească","error-unrecognized-form-indefinite-masculine-plural":"neromânești","error-unrecognized-form-feminine-indefinite-neuter-plural":"neromânești","definite-error-unrecognized-form-masculine-neuter-singular":"neromânescul","definite-error-unrecognized-form-feminine-singular":"neromâneasca","definite-error-unrecognized-form-masculine-plural":"neromâneștii","definite-error-unrecognized-form-feminine-neuter-plural":"neromâneștile"}},{"word":"nerotunjit","pos":"adj","definitions":["unrounded"],"forms":{"feminine-singular":"nerotunjită","masculine-plural":"nerotunjiți","feminine-neuter-plural":"nerotunjite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nerotunjit","error-unrecognized-form-feminine-indefinite-singular":"nerotunjită","error-unrecognized-form-indefinite-masculine-plural":"nerotunjiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nerotunjite","definite-error-unrecognized-form-masculine-neuter-singular":"nerotunjitul","definite-error-unrecognized-form-feminine-singular":"nerotunjita","definite-error-unrecognized-form-masculine-plural":"nerotunjiții","definite-error-unrecognized-form-feminine-neuter-plural":"nerotunjitele"}},{"word":"nerozesc","pos":"adj","definitions":["stupidly"],"forms":{"feminine-singular":"nerozească","plural":"nerozești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nerozesc","error-unrecognized-form-feminine-indefinite-singular":"nerozească","error-unrecognized-form-indefinite-masculine-plural":"nerozești","error-unrecognized-form-feminine-indefinite-neuter-plural":"nerozești","definite-error-unrecognized-form-masculine-neuter-singular":"nerozescul","definite-error-unrecognized-form-feminine-singular":"nerozeasca","definite-error-unrecognized-form-masculine-plural":"nerozeștii","definite-error-unrecognized-form-feminine-neuter-plural":"nerozeștile"}},{"word":"nerozește","pos":"adv","definitions":["stupidly"]},{"word":"nerozie","pos":"noun","definitions":["nonsense"],"forms":{"plural":"nerozii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nerozie","accusative-definite-nominative-singular":"nerozia","accusative-indefinite-nominative-plural":"nerozii","accusative-definite-nominative-plural":"neroziile","dative-genitive-indefinite-singular":"nerozii","dative-definite-genitive-singular":"neroziei","dative-genitive-indefinite-plural":"nerozii","dative-definite-genitive-plural":"neroziilor","singular-vocative":"nerozie","plural-vocative":"neroziilor"}},{"word":"nerușinare","pos":"noun","definitions":["shamelessness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"nerușinare","accusative-definite-nominative":"nerușinarea","dative-genitive-indefinite":"nerușinari","dative-definite-genitive":"nerușinarii","vocative":"nerușinare"}},{"word":"nerușinat","pos":"adj","definitions":["shameless, impudent, boldfaced, brassy, insolent"],"pronunciation":"/ˌne.ru.ʃiˈnat/","forms":{"feminine-singular":"nerușinată","masculine-plural":"nerușinați","feminine-neuter-plural":"nerușinate","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"nerușinat","error-unrecognized-form-feminine-indefinite-singular":"nerușinată","error-unrecognized-form-indefinite-masculine-plural":"nerușinați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nerușinate","definite-error-unrecognized-form-masculine-neuter-singular":"nerușinatul","definite-error-unrecognized-form-feminine-singular":"nerușinata","definite-error-unrecognized-form-masculine-plural":"nerușinații","definite-error-unrecognized-form-feminine-neuter-plural":"nerușinatele"}},{"word":"nerușinos","pos":"adj","definitions":["shameless"],"forms":{"feminine-singular":"nerușinoasă","masculine-plural":"nerușinoși","feminine-neuter-plural":"nerușinoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nerușinos","error-unrecognized-form-feminine-indefinite-singular":"nerușinoasă","error-unrecognized-form-indefinite-masculine-plural":"nerușinoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nerușinoase","definite-error-unrecognized-form-masculine-neuter-singular":"nerușinosul","definite-error-unrecognized-form-feminine-singular":"nerușinoasa","definite-error-unrecognized-form-masculine-plural":"nerușinoșii","definite-error-unrecognized-form-feminine-neuter-plural":"nerușinoasele"}},{"word":"nerv","pos":"noun","definitions":["nerve"],"forms":{"plural":"nervi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nerv","accusative-definite-nominative-singular":"nervul","accusative-indefinite-nominative-plural":"nervi","accusative-definite-nominative-plural":"nervii","dative-genitive-indefinite-singular":"nerv","dative-definite-genitive-singular":"nervului","dative-genitive-indefinite-plural":"nervi","dative-definite-genitive-plural":"nervilor","singular-vocative":"nervule","plural-vocative":"nervilor"}},{"word":"nerv frenic","pos":"noun","definitions":["phrenic nerve"],"forms":{"plural":"nervi frenici"}},{"word":"nerv hipoglos","pos":"noun","definitions":["hypoglossal nerve"],"forms":{"plural":"nervi hipoglos"}},{"word":"nerv optic","pos":"noun","definitions":["optic nerve"],"forms":{"plural":"nervi optici"}},{"word":"nerv sciatic","pos":"noun","definitions":["sciatic nerve"],"forms":{"plural":"nervi sciatici"}},{"word":"nerv trigemen","pos":"noun","definitions":["trigeminal nerve"],"forms":{"plural":"nervi trigemeni"}},{"word":"nerv vag","pos":"noun","definitions":["vagus nerve"]},{"word":"nervație","pos":"noun","definitions":["venation"],"forms":{"plural":"nervații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nervație","accusative-definite-nominative-singular":"nervația","accusative-indefinite-nominative-plural":"nervații","accusative-definite-nominative-plural":"nervațiile","dative-genitive-indefinite-singular":"nervații","dative-definite-genitive-singular":"nervației","dative-genitive-indefinite-plural":"nervații","dative-definite-genitive-plural":"nervațiilor","singular-vocative":"nervație","plural-vocative":"nervațiilor"}},{"word":"nervațiune","pos":"noun","definitions":["alternative form of nervație"],"forms":{"plural":"nervațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nervațiune","accusative-definite-nominative-singular":"nervațiunea","accusative-indefinite-nominative-plural":"nervațiuni","accusative-definite-nominative-plural":"nervațiunile","dative-genitive-indefinite-singular":"nervațiuni","dative-definite-genitive-singular":"nervațiunii","dative-genitive-indefinite-plural":"nervațiuni","dative-definite-genitive-plural":"nervațiunilor","singular-vocative":"nervațiune","plural-vocative":"nervațiunilor"}},{"word":"nervatură","pos":"noun","definitions":["nervature"],"forms":{"plural":"nervaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"nervatură","accusative-definite-nominative-singular":"nervatura","accusative-indefinite-nominative-plural":"nervaturi","accusative-definite-nominative-plural":"nervaturile","dative-genitive-indefinite-singular":"nervaturi","dative-definite-genitive-singular":"nervaturii","dative-genitive-indefinite-plural":"nervaturi","dative-definite-genitive-plural":"nervaturilor","singular-vocative":"nervatură","plural-vocative":"nervaturilor"}},{"word":"nervin","pos":"noun","definitions":["nervine"],"forms":{"plural":"nervini","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nervin","accusative-definite-nominative-singular":"nervinul","accusative-indefinite-nominative-plural":"nervini","accusative-definite-nominative-plural":"nervinile","dative-genitive-indefinite-singular":"nervin","dative-definite-genitive-singular":"nervinului","dative-genitive-indefinite-plural":"nervini","dative-definite-genitive-plural":"nervinilor","singular-vocative":"nervinule","plural-vocative":"nervinilor"}},{"word":"nervistă","pos":"noun","definitions":["female equivalent of nervist"],"forms":{"plural":"nerviste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nervistă","accusative-definite-nominative-singular":"nervista","accusative-indefinite-nominative-plural":"nerviste","accusative-definite-nominative-plural":"nervistele","dative-genitive-indefinite-singular":"nerviste","dative-definite-genitive-singular":"nervistei","dative-genitive-indefinite-plural":"nerviste","dative-definite-genitive-plural":"nervistelor","singular-vocative":"nervistă","plural-vocative":"nervistelor"}},{"word":"nervoasă","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of nervos"]},{"word":"nervos","pos":"adj","definitions":["angry"],"pronunciation":"/nerˈvos/","forms":{"feminine-singular":"nervoasă","masculine-plural":"nervoși","feminine-neuter-plural":"nervoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nervos","error-unrecognized-form-feminine-indefinite-singular":"nervoasă","error-unrecognized-form-indefinite-masculine-plural":"nervoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nervoase","definite-error-unrecognized-form-masculine-neuter-singular":"nervosul","definite-error-unrecognized-form-feminine-singular":"nervoasa","definite-error-unrecognized-form-masculine-plural":"nervoșii","definite-error-unrecognized-form-feminine-neuter-plural":"nervoasele","alternative":"нервос"}},{"word":"nervozism","pos":"noun","definitions":["nervosism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nervozism","accusative-definite-nominative":"nervozismul","dative-genitive-indefinite":"nervozism","dative-definite-genitive":"nervozismului","vocative":"nervozismule"}},{"word":"nervozitate","pos":"noun","definitions":["nervousness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nervozitate","accusative-definite-nominative-singular":"nervozitatea","accusative-indefinite-nominative-plural":"nervozități","accusative-definite-nominative-plural":"nervozitățile","dative-genitive-indefinite-singular":"nervozități","dative-definite-genitive-singular":"nervozității","dative-genitive-indefinite-plural":"nervozități","dative-definite-genitive-plural":"nervozităților","singular-vocative":"nervozitate","plural-vocative":"nervozităților"}},{"word":"nervură","pos":"noun","definitions":["rib"],"forms":{"plural":"nervuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"nervură","accusative-definite-nominative-singular":"nervura","accusative-indefinite-nominative-plural":"nervuri","accusative-definite-nominative-plural":"nervurile","dative-genitive-indefinite-singular":"nervuri","dative-definite-genitive-singular":"nervurii","dative-genitive-indefinite-plural":"nervuri","dative-definite-genitive-plural":"nervurilor","singular-vocative":"nervură","plural-vocative":"nervurilor"}},{"word":"nervurație","pos":"noun","definitions":["ribbing"],"forms":{"plural":"nervurații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nervurație","accusative-definite-nominative-singular":"nervurația","accusative-indefinite-nominative-plural":"nervurații","accusative-definite-nominative-plural":"nervurațiile","dative-genitive-indefinite-singular":"nervurații","dative-definite-genitive-singular":"nervurației","dative-genitive-indefinite-plural":"nervurații","dative-definite-genitive-plural":"nervurațiilor","singular-vocative":"nervurație","plural-vocative":"nervurațiilor"}},{"word":"nes","pos":"noun","definitions":["instant coffee"],"forms":{"plural":"nesuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nes","accusative-definite-nominative-singular":"nesul","accusative-indefinite-nominative-plural":"nese","accusative-definite-nominative-plural":"nesele","dative-genitive-indefinite-singular":"nes","dative-definite-genitive-singular":"nesului","dative-genitive-indefinite-plural":"nese","dative-definite-genitive-plural":"neselor","singular-vocative":"nesule","plural-vocative":"neselor"}},{"word":"nesăbuință","pos":"noun","definitions":["imprudence, recklessness"],"examples":[{"ro":"A fost o nesăbuință să avem încredere în acest premier.","en":"It was recklessness to trust this prime minister."}],"forms":{"plural":"nesăbuințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nesăbuință","accusative-definite-nominative-singular":"nesăbuința","accusative-indefinite-nominative-plural":"nesăbuințe","accusative-definite-nominative-plural":"nesăbuințele","dative-genitive-indefinite-singular":"nesăbuințe","dative-definite-genitive-singular":"nesăbuinței","dative-genitive-indefinite-plural":"nesăbuințe","dative-definite-genitive-plural":"nesăbuințelor","singular-vocative":"nesăbuință","plural-vocative":"nesăbuințelor"}},{"word":"nesăbuire","pos":"noun","definitions":["recklessness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"nesăbuire","accusative-definite-nominative":"nesăbuirea","dative-genitive-indefinite":"nesăbuiri","dative-definite-genitive":"nesăbuirii","vocative":"nesăbuire"}},{"word":"nesăbuit","pos":"adj","definitions":["imprudent"],"forms":{"feminine-singular":"nesăbuită","masculine-plural":"nesăbuiți","feminine-neuter-plural":"nesăbuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesăbuit","error-unrecognized-form-feminine-indefinite-singular":"nesăbuită","error-unrecognized-form-indefinite-masculine-plural":"nesăbuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesăbuite","definite-error-unrecognized-form-masculine-neuter-singular":"nesăbuitul","definite-error-unrecognized-form-feminine-singular":"nesăbuita","definite-error-unrecognized-form-masculine-plural":"nesăbuiții","definite-error-unrecognized-form-feminine-neuter-plural":"nesăbuitele"}},{"word":"nesănătate","pos":"noun","definitions":["unhealthiness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"nesănătate","accusative-definite-nominative":"nesănătatea","dative-genitive-indefinite":"nesănătăți","dative-definite-genitive":"nesănătății","vocative":"nesănătate"}},{"word":"nesănătos","pos":"adj","definitions":["unhealthy, unwholesome"],"examples":[{"ro":"Fumarea este nesănătoasă.","en":"Smoking is unhealthy."}],"forms":{"feminine-singular":"nesănătoasă","masculine-plural":"nesănătoși","feminine-neuter-plural":"nesănătoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesănătos","error-unrecognized-form-feminine-indefinite-singular":"nesănătoasă","error-unrecognized-form-indefinite-masculine-plural":"nesănătoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesănătoase","definite-error-unrecognized-form-masculine-neuter-singular":"nesănătosul","definite-error-unrecognized-form-feminine-singular":"nesănătoasa","definite-error-unrecognized-form-masculine-plural":"nesănătoșii","definite-error-unrecognized-form-feminine-neuter-plural":"nesănătoasele"}},{"word":"neșansă","pos":"noun","definitions":["ill luck"],"forms":{"plural":"neșanse","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neșansă","accusative-definite-nominative-singular":"neșansa","accusative-indefinite-nominative-plural":"neșanse","accusative-definite-nominative-plural":"neșansele","dative-genitive-indefinite-singular":"neșanse","dative-definite-genitive-singular":"neșansei","dative-genitive-indefinite-plural":"neșanse","dative-definite-genitive-plural":"neșanselor","singular-vocative":"neșansă","plural-vocative":"neșanselor"}},{"word":"nesărat","pos":"adj","definitions":["unsalted"],"forms":{"feminine-singular":"nesărată","masculine-plural":"nesărați","feminine-neuter-plural":"nesărate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesărat","error-unrecognized-form-feminine-indefinite-singular":"nesărată","error-unrecognized-form-indefinite-masculine-plural":"nesărați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesărate","definite-error-unrecognized-form-masculine-neuter-singular":"nesăratul","definite-error-unrecognized-form-feminine-singular":"nesărata","definite-error-unrecognized-form-masculine-plural":"nesărații","definite-error-unrecognized-form-feminine-neuter-plural":"nesăratele"}},{"word":"nesărătură","pos":"noun","definitions":["unsalted"],"forms":{"plural":"nesărături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"nesărătură","accusative-definite-nominative-singular":"nesărătura","accusative-indefinite-nominative-plural":"nesărături","accusative-definite-nominative-plural":"nesărăturile","dative-genitive-indefinite-singular":"nesărături","dative-definite-genitive-singular":"nesărăturii","dative-genitive-indefinite-plural":"nesărături","dative-definite-genitive-plural":"nesărăturilor","singular-vocative":"nesărătură","plural-vocative":"nesărăturilor"}},{"word":"nesaț","pos":"noun","definitions":["greed"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nesaț","accusative-definite-nominative":"nesațul","dative-genitive-indefinite":"nesaț","dative-definite-genitive":"nesațului","vocative":"nesațule"}},{"word":"nesațietate","pos":"noun","definitions":["insatiate"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"nesațietate","accusative-definite-nominative":"nesațietatea","dative-genitive-indefinite":"nesațietăți","dative-definite-genitive":"nesațietății","vocative":"-"}},{"word":"nesățios","pos":"adj","definitions":["insatiable"],"forms":{"feminine-singular":"nesățioasă","masculine-plural":"nesățioși","feminine-neuter-plural":"nesățioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesățios","error-unrecognized-form-feminine-indefinite-singular":"nesățioasă","error-unrecognized-form-indefinite-masculine-plural":"nesățioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesățioase","definite-error-unrecognized-form-masculine-neuter-singular":"nesățiosul","definite-error-unrecognized-form-feminine-singular":"nesățioasa","definite-error-unrecognized-form-masculine-plural":"nesățioșii","definite-error-unrecognized-form-feminine-neuter-plural":"nesățioasele"}},{"word":"nesatisfăcător","pos":"adj","definitions":["unsatisfactory"],"forms":{"feminine-singular":"nesatisfăcătoare","masculine-plural":"nesatisfăcători","feminine-neuter-plural":"nesatisfăcătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesatisfăcător","error-unrecognized-form-feminine-indefinite-singular":"nesatisfăcătoare","error-unrecognized-form-indefinite-masculine-plural":"nesatisfăcători","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesatisfăcătoare","definite-error-unrecognized-form-masculine-neuter-singular":"nesatisfăcătorul","definite-error-unrecognized-form-feminine-singular":"nesatisfăcătoarea","definite-error-unrecognized-form-masculine-plural":"nesatisfăcătorii","definite-error-unrecognized-form-feminine-neuter-plural":"nesatisfăcătoarele"}},{"word":"nesatisfăcut","pos":"adj","definitions":["unsatisfied"],"forms":{"feminine-singular":"nesatisfăcută","masculine-plural":"nesatisfăcuți","feminine-neuter-plural":"nesatisfăcute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesatisfăcut","error-unrecognized-form-feminine-indefinite-singular":"nesatisfăcută","error-unrecognized-form-indefinite-masculine-plural":"nesatisfăcuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesatisfăcute","definite-error-unrecognized-form-masculine-neuter-singular":"nesatisfăcutul","definite-error-unrecognized-form-feminine-singular":"nesatisfăcuta","definite-error-unrecognized-form-masculine-plural":"nesatisfăcuții","definite-error-unrecognized-form-feminine-neuter-plural":"nesatisfăcutele"}},{"word":"nesațiu","pos":"noun","definitions":["alternative form of nesaț"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nesațiu","accusative-definite-nominative":"nesațiuul","dative-genitive-indefinite":"nesațiu","dative-definite-genitive":"nesațiuului","vocative":"nesațiuule"}},{"word":"nesătul","pos":"adj","definitions":["hungry, not satiated or satisfied","insatiable"],"pronunciation":"/ˌne.səˈtul/","forms":{"feminine-singular":"nesătulă","masculine-plural":"nesătui","feminine-neuter-plural":"nesătule","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesătul","error-unrecognized-form-feminine-indefinite-singular":"nesătulă","error-unrecognized-form-indefinite-masculine-plural":"nesătui","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesătule","definite-error-unrecognized-form-masculine-neuter-singular":"nesătulul","definite-error-unrecognized-form-feminine-singular":"nesătula","definite-error-unrecognized-form-masculine-plural":"nesătuii","definite-error-unrecognized-form-feminine-neuter-plural":"nesătulele"}},{"word":"nesăturare","pos":"noun","definitions":["greed"],"forms":{"plural":"nesăturarări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nesăturare","accusative-definite-nominative-singular":"nesăturarea","accusative-indefinite-nominative-plural":"nesăturarări","accusative-definite-nominative-plural":"nesăturarările","dative-genitive-indefinite-singular":"nesăturarări","dative-definite-genitive-singular":"nesăturarării","dative-genitive-indefinite-plural":"nesăturarări","dative-definite-genitive-plural":"nesăturarărilor","singular-vocative":"nesăturare","plural-vocative":"nesăturarărilor"}},{"word":"nesaturat","pos":"adj","definitions":["unsaturated"],"forms":{"feminine-singular":"nesaturată","masculine-plural":"nesaturați","feminine-neuter-plural":"nesaturate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesaturat","error-unrecognized-form-feminine-indefinite-singular":"nesaturată","error-unrecognized-form-indefinite-masculine-plural":"nesaturați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesaturate","definite-error-unrecognized-form-masculine-neuter-singular":"nesaturatul","definite-error-unrecognized-form-feminine-singular":"nesaturata","definite-error-unrecognized-form-masculine-plural":"nesaturații","definite-error-unrecognized-form-feminine-neuter-plural":"nesaturatele"}},{"word":"nesăturat","pos":"adj","definitions":["greedy"],"forms":{"feminine-singular":"nesăturată","masculine-plural":"nesăturați","feminine-neuter-plural":"nesăturate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesăturat","error-unrecognized-form-feminine-indefinite-singular":"nesăturată","error-unrecognized-form-indefinite-masculine-plural":"nesăturați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesăturate","definite-error-unrecognized-form-masculine-neuter-singular":"nesăturatul","definite-error-unrecognized-form-feminine-singular":"nesăturata","definite-error-unrecognized-form-masculine-plural":"nesăturații","definite-error-unrecognized-form-feminine-neuter-plural":"nesăturatele"}},{"word":"neschimbare","pos":"noun","definitions":["absence of change"],"forms":{"plural":"neschimbări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neschimbare","accusative-definite-nominative-singular":"neschimbarea","accusative-indefinite-nominative-plural":"neschimbări","accusative-definite-nominative-plural":"neschimbările","dative-genitive-indefinite-singular":"neschimbări","dative-definite-genitive-singular":"neschimbării","dative-genitive-indefinite-plural":"neschimbări","dative-definite-genitive-plural":"neschimbărilor","singular-vocative":"neschimbare","plural-vocative":"neschimbărilor"}},{"word":"neschimbat","pos":"adj","definitions":["unchanged"],"forms":{"feminine-singular":"neschimbată","masculine-plural":"neschimbați","feminine-neuter-plural":"neschimbate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neschimbat","error-unrecognized-form-feminine-indefinite-singular":"neschimbată","error-unrecognized-form-indefinite-masculine-plural":"neschimbați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neschimbate","definite-error-unrecognized-form-masculine-neuter-singular":"neschimbatul","definite-error-unrecognized-form-feminine-singular":"neschimbata","definite-error-unrecognized-form-masculine-plural":"neschimbații","definite-error-unrecognized-form-feminine-neuter-plural":"neschimbatele"}},{"word":"neschimbător","pos":"adj","definitions":["immutable"],"forms":{"feminine-singular":"neschimbătoare","masculine-plural":"neschimbători","feminine-neuter-plural":"neschimbătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neschimbător","error-unrecognized-form-feminine-indefinite-singular":"neschimbătoare","error-unrecognized-form-indefinite-masculine-plural":"neschimbători","error-unrecognized-form-feminine-indefinite-neuter-plural":"neschimbătoare","definite-error-unrecognized-form-masculine-neuter-singular":"neschimbătorul","definite-error-unrecognized-form-feminine-singular":"neschimbătoarea","definite-error-unrecognized-form-masculine-plural":"neschimbătorii","definite-error-unrecognized-form-feminine-neuter-plural":"neschimbătoarele"}},{"word":"nescris","pos":"adj","definitions":["unwritten"],"forms":{"feminine-singular":"nescrisă","masculine-plural":"nescriși","feminine-neuter-plural":"nescrise","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nescris","error-unrecognized-form-feminine-indefinite-singular":"nescrisă","error-unrecognized-form-indefinite-masculine-plural":"nescriși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nescrise","definite-error-unrecognized-form-masculine-neuter-singular":"nescrisul","definite-error-unrecognized-form-feminine-singular":"nescrisa","definite-error-unrecognized-form-masculine-plural":"nescrișii","definite-error-unrecognized-form-feminine-neuter-plural":"nescrisele"}},{"word":"nesecat","pos":"adj","definitions":["inexhausted"],"forms":{"feminine-singular":"nesecată","masculine-plural":"nesecați","feminine-neuter-plural":"nesecate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesecat","error-unrecognized-form-feminine-indefinite-singular":"nesecată","error-unrecognized-form-indefinite-masculine-plural":"nesecați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesecate","definite-error-unrecognized-form-masculine-neuter-singular":"nesecatul","definite-error-unrecognized-form-feminine-singular":"nesecata","definite-error-unrecognized-form-masculine-plural":"nesecații","definite-error-unrecognized-form-feminine-neuter-plural":"nesecatele"}},{"word":"nesecătuit","pos":"adj","definitions":["inexhausted"],"forms":{"feminine-singular":"nesecătuită","masculine-plural":"nesecătuiți","feminine-neuter-plural":"nesecătuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesecătuit","error-unrecognized-form-feminine-indefinite-singular":"nesecătuită","error-unrecognized-form-indefinite-masculine-plural":"nesecătuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesecătuite","definite-error-unrecognized-form-masculine-neuter-singular":"nesecătuitul","definite-error-unrecognized-form-feminine-singular":"nesecătuita","definite-error-unrecognized-form-masculine-plural":"nesecătuiții","definite-error-unrecognized-form-feminine-neuter-plural":"nesecătuitele"}},{"word":"nesemnificativ","pos":"adj","definitions":["insignificant"],"forms":{"feminine-singular":"nesemnificativă","masculine-plural":"nesemnificativi","feminine-neuter-plural":"nesemnificative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesemnificativ","error-unrecognized-form-feminine-indefinite-singular":"nesemnificativă","error-unrecognized-form-indefinite-masculine-plural":"nesemnificativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesemnificative","definite-error-unrecognized-form-masculine-neuter-singular":"nesemnificativul","definite-error-unrecognized-form-feminine-singular":"nesemnificativa","definite-error-unrecognized-form-masculine-plural":"nesemnificativii","definite-error-unrecognized-form-feminine-neuter-plural":"nesemnificativele"}},{"word":"nesentimental","pos":"adj","definitions":["nonsentimental, hardheaded"],"forms":{"feminine-singular":"nesentimentală","masculine-plural":"nesentimentali","feminine-neuter-plural":"nesentimentale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesentimental","error-unrecognized-form-feminine-indefinite-singular":"nesentimentală","error-unrecognized-form-indefinite-masculine-plural":"nesentimentali","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesentimentale","definite-error-unrecognized-form-masculine-neuter-singular":"nesentimentalul","definite-error-unrecognized-form-feminine-singular":"nesentimentala","definite-error-unrecognized-form-masculine-plural":"nesentimentalii","definite-error-unrecognized-form-feminine-neuter-plural":"nesentimentalele"}},{"word":"neserios","pos":"adj","definitions":["untrustworthy"],"forms":{"feminine-singular":"neserioasă","masculine-plural":"neserioși","feminine-neuter-plural":"neserioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neserios","error-unrecognized-form-feminine-indefinite-singular":"neserioasă","error-unrecognized-form-indefinite-masculine-plural":"neserioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"neserioase","definite-error-unrecognized-form-masculine-neuter-singular":"neseriosul","definite-error-unrecognized-form-feminine-singular":"neserioasa","definite-error-unrecognized-form-masculine-plural":"neserioșii","definite-error-unrecognized-form-feminine-neuter-plural":"neserioasele"}},{"word":"neseriozitate","pos":"noun","definitions":["frivolity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neseriozitate","accusative-definite-nominative":"neseriozitatea","dative-genitive-indefinite":"neseriozități","dative-definite-genitive":"neseriozității","vocative":"neseriozitate"}},{"word":"neseser","pos":"noun","definitions":["travel kit"],"forms":{"plural":"neseseruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"neseser","accusative-definite-nominative-singular":"neseserul","accusative-indefinite-nominative-plural":"neseseruri","accusative-definite-nominative-plural":"neseserurile","dative-genitive-indefinite-singular":"neseser","dative-definite-genitive-singular":"neseserului","dative-genitive-indefinite-plural":"neseseruri","dative-definite-genitive-plural":"neseserurilor","singular-vocative":"neseserule","plural-vocative":"neseserurilor"}},{"word":"nesfârșire","pos":"noun","definitions":["endless"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"nesfârșire","accusative-definite-nominative":"nesfârșirea","dative-genitive-indefinite":"nesfârșire","dative-definite-genitive":"nesfârșirei","vocative":"nesfârșire"}},{"word":"nesfârșit","pos":"adj","definitions":["endless"],"forms":{"feminine-singular":"nesfârșită","masculine-plural":"nesfârșiți","feminine-neuter-plural":"nesfârșite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesfârșit","error-unrecognized-form-feminine-indefinite-singular":"nesfârșită","error-unrecognized-form-indefinite-masculine-plural":"nesfârșiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesfârșite","definite-error-unrecognized-form-masculine-neuter-singular":"nesfârșitul","definite-error-unrecognized-form-feminine-singular":"nesfârșita","definite-error-unrecognized-form-masculine-plural":"nesfârșiții","definite-error-unrecognized-form-feminine-neuter-plural":"nesfârșitele"}},{"word":"nesfială","pos":"noun","definitions":["audacity, dare"],"forms":{"plural":"nesfieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nesfială","accusative-definite-nominative-singular":"nesfiala","accusative-indefinite-nominative-plural":"nesfiele","accusative-definite-nominative-plural":"nesfielele","dative-genitive-indefinite-singular":"nesfiele","dative-definite-genitive-singular":"nesfielei","dative-genitive-indefinite-plural":"nesfiele","dative-definite-genitive-plural":"nesfielelor","singular-vocative":"nesfială","plural-vocative":"nesfielelor"}},{"word":"nesfie","pos":"noun","definitions":["alternative form of nisfia"],"forms":{"plural":"nesfii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nesfie","accusative-definite-nominative-singular":"nesfia","accusative-indefinite-nominative-plural":"nesfii","accusative-definite-nominative-plural":"nesfiile","dative-genitive-indefinite-singular":"nesfii","dative-definite-genitive-singular":"nesfiei","dative-genitive-indefinite-plural":"nesfii","dative-definite-genitive-plural":"nesfiilor","singular-vocative":"nesfie","plural-vocative":"nesfiilor"}},{"word":"nesigur","pos":"adj","definitions":["unsure, uncertain"],"forms":{"feminine-singular":"nesigură","masculine-plural":"nesiguri","feminine-neuter-plural":"nesigure","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesigur","error-unrecognized-form-feminine-indefinite-singular":"nesigură","error-unrecognized-form-indefinite-masculine-plural":"nesiguri","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesigure","definite-error-unrecognized-form-masculine-neuter-singular":"nesigurul","definite-error-unrecognized-form-feminine-singular":"nesigura","definite-error-unrecognized-form-masculine-plural":"nesigurii","definite-error-unrecognized-form-feminine-neuter-plural":"nesigurele"}},{"word":"nesiguranță","pos":"noun","definitions":["uncertainty"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"nesiguranță","accusative-definite-nominative":"nesiguranța","dative-genitive-indefinite":"nesiguranțe","dative-definite-genitive":"nesiguranței","vocative":"nesiguranță"}},{"word":"nesilință","pos":"noun","definitions":["laziness"],"forms":{"plural":"nesilințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nesilință","accusative-definite-nominative-singular":"nesilința","accusative-indefinite-nominative-plural":"nesilințe","accusative-definite-nominative-plural":"nesilințele","dative-genitive-indefinite-singular":"nesilințe","dative-definite-genitive-singular":"nesilinței","dative-genitive-indefinite-plural":"nesilințe","dative-definite-genitive-plural":"nesilințelor","singular-vocative":"nesilință","plural-vocative":"nesilințelor"}},{"word":"nesilit","pos":"adj","definitions":["unforced"],"forms":{"feminine-singular":"nesilită","masculine-plural":"nesiliți","feminine-neuter-plural":"nesilite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesilit","error-unrecognized-form-feminine-indefinite-singular":"nesilită","error-unrecognized-form-indefinite-masculine-plural":"nesiliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesilite","definite-error-unrecognized-form-masculine-neuter-singular":"nesilitul","definite-error-unrecognized-form-feminine-singular":"nesilita","definite-error-unrecognized-form-masculine-plural":"nesiliții","definite-error-unrecognized-form-feminine-neuter-plural":"nesilitele"}},{"word":"nesimțibilitate","pos":"noun","definitions":["insensitiveness"],"forms":{"plural":"nesimțibilități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nesimțibilitate","accusative-definite-nominative-singular":"nesimțibilitatea","accusative-indefinite-nominative-plural":"nesimțibilități","accusative-definite-nominative-plural":"nesimțibilitățile","dative-genitive-indefinite-singular":"nesimțibilități","dative-definite-genitive-singular":"nesimțibilității","dative-genitive-indefinite-plural":"nesimțibilități","dative-definite-genitive-plural":"nesimțibilităților","singular-vocative":"nesimțibilitate","plural-vocative":"nesimțibilităților"}},{"word":"nesimțire","pos":"noun","definitions":["callousness, insensitiveness, inconsideration"]},{"word":"nesimțit","pos":"adj","definitions":["callous, unfeeling, inconsiderate, insensitive, uncivil, impolite"],"forms":{"feminine-singular":"nesimțită","masculine-plural":"nesimțiți","feminine-neuter-plural":"nesimțite"}},{"word":"nesimțit","pos":"noun","definitions":["asshole, douchebag; someone who behaves in an inconsiderate or offensive manner"],"forms":{"plural":"nesimțiți"}},{"word":"nesimțit","pos":"adv","definitions":["inconsiderately, insensitively, or callously","stealthily (not being perceived or detected)"]},{"word":"nesimțitor","pos":"adj","definitions":["unfeeling"],"forms":{"feminine-singular":"nesimțitoare","masculine-plural":"nesimțitori","feminine-neuter-plural":"nesimțitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesimțitor","error-unrecognized-form-feminine-indefinite-singular":"nesimțitoare","error-unrecognized-form-indefinite-masculine-plural":"nesimțitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesimțitoare","definite-error-unrecognized-form-masculine-neuter-singular":"nesimțitorul","definite-error-unrecognized-form-feminine-singular":"nesimțitoarea","definite-error-unrecognized-form-masculine-plural":"nesimțitorii","definite-error-unrecognized-form-feminine-neuter-plural":"nesimțitoarele"}},{"word":"nesipos","pos":"adj","definitions":["obsolete form of nisipos"],"forms":{"feminine-singular":"nesipoasă","masculine-plural":"nesipoși","feminine-neuter-plural":"nesipoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesipos","error-unrecognized-form-feminine-indefinite-singular":"nesipoasă","error-unrecognized-form-indefinite-masculine-plural":"nesipoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesipoase","definite-error-unrecognized-form-masculine-neuter-singular":"nesiposul","definite-error-unrecognized-form-feminine-singular":"nesipoasa","definite-error-unrecognized-form-masculine-plural":"nesipoșii","definite-error-unrecognized-form-feminine-neuter-plural":"nesipoasele"}},{"word":"nesmintit","pos":"adv","definitions":["certainly"]},{"word":"nesociabil","pos":"adj","definitions":["unsociable"],"forms":{"feminine-singular":"nesociabilă","masculine-plural":"nesociabili","feminine-neuter-plural":"nesociabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesociabil","error-unrecognized-form-feminine-indefinite-singular":"nesociabilă","error-unrecognized-form-indefinite-masculine-plural":"nesociabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesociabile","definite-error-unrecognized-form-masculine-neuter-singular":"nesociabilul","definite-error-unrecognized-form-feminine-singular":"nesociabila","definite-error-unrecognized-form-masculine-plural":"nesociabilii","definite-error-unrecognized-form-feminine-neuter-plural":"nesociabilele"}},{"word":"nesocoteală","pos":"noun","definitions":["recklessness"],"forms":{"plural":"nesocoteli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nesocoteală","accusative-definite-nominative-singular":"nesocoteala","accusative-indefinite-nominative-plural":"nesocotele","accusative-definite-nominative-plural":"nesocotelele","dative-genitive-indefinite-singular":"nesocotele","dative-definite-genitive-singular":"nesocotelei","dative-genitive-indefinite-plural":"nesocotele","dative-definite-genitive-plural":"nesocotelelor","singular-vocative":"nesocoteală","plural-vocative":"nesocotelelor"}},{"word":"nesocoti","pos":"verb","definitions":["to disregard"],"forms":{"canonical":"a nesocoti 4th conjugation","present-singular-third-person":"nesocotește","participle-past":"nesocotit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nesocoti","gerund":"nesocotind","first-person-indicative-present-singular":"nesocotesc","indicative-present-second-person-singular":"nesocotești","indicative-present-singular-third-person":"nesocotește","first-person-indicative-plural-present":"nesocotim","indicative-plural-present-second-person":"nesocotiți","indicative-plural-present-third-person":"nesocotesc","first-person-imperfect-indicative-singular":"nesocoteam","imperfect-indicative-second-person-singular":"nesocoteai","imperfect-indicative-singular-third-person":"nesocotea","first-person-imperfect-indicative-plural":"nesocoteam","imperfect-indicative-plural-second-person":"nesocoteați","imperfect-indicative-plural-third-person":"nesocoteau","first-person-indicative-perfect-singular":"nesocotii","indicative-perfect-second-person-singular":"nesocotiși","indicative-perfect-singular-third-person":"nesocoti","first-person-indicative-perfect-plural":"nesocotirăm","indicative-perfect-plural-second-person":"nesocotirăți","indicative-perfect-plural-third-person":"nesocotiră","first-person-indicative-pluperfect-singular":"nesocotisem","indicative-pluperfect-second-person-singular":"nesocotiseși","indicative-pluperfect-singular-third-person":"nesocotise","first-person-indicative-pluperfect-plural":"nesocotiserăm","indicative-pluperfect-plural-second-person":"nesocotiserăți","indicative-pluperfect-plural-third-person":"nesocotiseră","first-person-present-singular-subjunctive":"să nesocotesc","present-second-person-singular-subjunctive":"să nesocotești","present-singular-subjunctive-third-person":"să nesocotească","first-person-plural-present-subjunctive":"să nesocotim","plural-present-second-person-subjunctive":"să nesocotiți","plural-present-subjunctive-third-person":"să nesocotească","imperative-second-person-singular":"nesocotește","imperative-plural-second-person":"nesocotiți","imperative-negative-second-person-singular":"nu nesocoti","imperative-negative-plural-second-person":"nu nesocotiți"}},{"word":"nesocotință","pos":"noun","definitions":["recklessness"],"forms":{"plural":"nesocotințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nesocotință","accusative-definite-nominative-singular":"nesocotința","accusative-indefinite-nominative-plural":"nesocotințe","accusative-definite-nominative-plural":"nesocotințele","dative-genitive-indefinite-singular":"nesocotințe","dative-definite-genitive-singular":"nesocotinței","dative-genitive-indefinite-plural":"nesocotințe","dative-definite-genitive-plural":"nesocotințelor","singular-vocative":"nesocotință","plural-vocative":"nesocotințelor"}},{"word":"nesocotire","pos":"noun","definitions":["overlooking"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"nesocotire","accusative-definite-nominative":"nesocotirea","dative-genitive-indefinite":"nesocotire","dative-definite-genitive":"nesocotirei","vocative":"nesocotire"}},{"word":"nesocotit","pos":"adj","definitions":["thoughtless, inconsiderate","ignored"],"pronunciation":"/ne.so.koˈtit/","forms":{"feminine-singular":"nesocotită","masculine-plural":"nesocotiți","feminine-neuter-plural":"nesocotite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesocotit","error-unrecognized-form-feminine-indefinite-singular":"nesocotită","error-unrecognized-form-indefinite-masculine-plural":"nesocotiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesocotite","definite-error-unrecognized-form-masculine-neuter-singular":"nesocotitul","definite-error-unrecognized-form-feminine-singular":"nesocotita","definite-error-unrecognized-form-masculine-plural":"nesocotiții","definite-error-unrecognized-form-feminine-neuter-plural":"nesocotitele"}},{"word":"nesofisticat","pos":"adj","definitions":["unsophisticated"],"forms":{"feminine-singular":"nesofisticată","masculine-plural":"nesofisticați","feminine-neuter-plural":"nesofisticate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesofisticat","error-unrecognized-form-feminine-indefinite-singular":"nesofisticată","error-unrecognized-form-indefinite-masculine-plural":"nesofisticați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesofisticate","definite-error-unrecognized-form-masculine-neuter-singular":"nesofisticatul","definite-error-unrecognized-form-feminine-singular":"nesofisticata","definite-error-unrecognized-form-masculine-plural":"nesofisticații","definite-error-unrecognized-form-feminine-neuter-plural":"nesofisticatele"}},{"word":"nesoluționat","pos":"adj","definitions":["unsolved"],"forms":{"feminine-singular":"nesoluționată","masculine-plural":"nesoluționați","feminine-neuter-plural":"nesoluționate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesoluționat","error-unrecognized-form-feminine-indefinite-singular":"nesoluționată","error-unrecognized-form-indefinite-masculine-plural":"nesoluționați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesoluționate","definite-error-unrecognized-form-masculine-neuter-singular":"nesoluționatul","definite-error-unrecognized-form-feminine-singular":"nesoluționata","definite-error-unrecognized-form-masculine-plural":"nesoluționații","definite-error-unrecognized-form-feminine-neuter-plural":"nesoluționatele"}},{"word":"nesomn","pos":"noun","definitions":["insomnia"],"pronunciation":"/neˈsomn/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nesomn","accusative-definite-nominative":"nesomnul","dative-genitive-indefinite":"nesomn","dative-definite-genitive":"nesomnului","vocative":"nesomnule"}},{"word":"nesomnie","pos":"noun","definitions":["insomnia (sleeping disorder)"],"forms":{"plural":"nesomnii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nesomnie","accusative-definite-nominative-singular":"nesomnia","accusative-indefinite-nominative-plural":"nesomnii","accusative-definite-nominative-plural":"nesomniile","dative-genitive-indefinite-singular":"nesomnii","dative-definite-genitive-singular":"nesomniei","dative-genitive-indefinite-plural":"nesomnii","dative-definite-genitive-plural":"nesomniilor","singular-vocative":"nesomnie","plural-vocative":"nesomniilor"}},{"word":"nespăimântare","pos":"noun","definitions":["courage"],"forms":{"plural":"nespăimântări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nespăimântare","accusative-definite-nominative-singular":"nespăimântarea","accusative-indefinite-nominative-plural":"nespăimântări","accusative-definite-nominative-plural":"nespăimântările","dative-genitive-indefinite-singular":"nespăimântări","dative-definite-genitive-singular":"nespăimântării","dative-genitive-indefinite-plural":"nespăimântări","dative-definite-genitive-plural":"nespăimântărilor","singular-vocative":"nespăimântare","plural-vocative":"nespăimântărilor"}},{"word":"nespălat","pos":"adj","definitions":["unwashed, dirty, filthy","boorish"],"pronunciation":"/nespəˈlat/","forms":{"feminine-singular":"nespălată","masculine-plural":"nespălați","feminine-neuter-plural":"nespălate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nespălat","error-unrecognized-form-feminine-indefinite-singular":"nespălată","error-unrecognized-form-indefinite-masculine-plural":"nespălați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nespălate","definite-error-unrecognized-form-masculine-neuter-singular":"nespălatul","definite-error-unrecognized-form-feminine-singular":"nespălata","definite-error-unrecognized-form-masculine-plural":"nespălații","definite-error-unrecognized-form-feminine-neuter-plural":"nespălatele"}},{"word":"nespălat","pos":"noun","definitions":["country bumpkin"],"pronunciation":"/nespəˈlat/","forms":{"plural":"nespălați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nespălat","accusative-definite-nominative-singular":"nespălatul","accusative-indefinite-nominative-plural":"nespălați","accusative-definite-nominative-plural":"nespălații","dative-genitive-indefinite-singular":"nespălat","dative-definite-genitive-singular":"nespălatului","dative-genitive-indefinite-plural":"nespălați","dative-definite-genitive-plural":"nespălaților","singular-vocative":"nespălatule","plural-vocative":"nespălaților"}},{"word":"Nespălatu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nespălatu"}},{"word":"nespectaculos","pos":"adj","definitions":["unspectacular"],"forms":{"feminine-singular":"nespectaculoasă","masculine-plural":"nespectaculoși","feminine-neuter-plural":"nespectaculoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nespectaculos","error-unrecognized-form-feminine-indefinite-singular":"nespectaculoasă","error-unrecognized-form-indefinite-masculine-plural":"nespectaculoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nespectaculoase","definite-error-unrecognized-form-masculine-neuter-singular":"nespectaculosul","definite-error-unrecognized-form-feminine-singular":"nespectaculoasa","definite-error-unrecognized-form-masculine-plural":"nespectaculoșii","definite-error-unrecognized-form-feminine-neuter-plural":"nespectaculoasele"}},{"word":"nesperat","pos":"adj","definitions":["unexpected"],"forms":{"feminine-singular":"nesperată","masculine-plural":"nesperați","feminine-neuter-plural":"nesperate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesperat","error-unrecognized-form-feminine-indefinite-singular":"nesperată","error-unrecognized-form-indefinite-masculine-plural":"nesperați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesperate","definite-error-unrecognized-form-masculine-neuter-singular":"nesperatul","definite-error-unrecognized-form-feminine-singular":"nesperata","definite-error-unrecognized-form-masculine-plural":"nesperații","definite-error-unrecognized-form-feminine-neuter-plural":"nesperatele"}},{"word":"nespornicie","pos":"noun","definitions":["lack of progress or efficiency in a job"],"forms":{"plural":"nespornicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nespornicie","accusative-definite-nominative-singular":"nespornicia","accusative-indefinite-nominative-plural":"nespornicii","accusative-definite-nominative-plural":"nesporniciile","dative-genitive-indefinite-singular":"nespornicii","dative-definite-genitive-singular":"nesporniciei","dative-genitive-indefinite-plural":"nespornicii","dative-definite-genitive-plural":"nesporniciilor","singular-vocative":"nespornicie","plural-vocative":"nesporniciilor"}},{"word":"nesportiv","pos":"adj","definitions":["unsportsmanlike"],"forms":{"feminine-singular":"nesportivă","masculine-plural":"nesportivi","feminine-neuter-plural":"nesportive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesportiv","error-unrecognized-form-feminine-indefinite-singular":"nesportivă","error-unrecognized-form-indefinite-masculine-plural":"nesportivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesportive","definite-error-unrecognized-form-masculine-neuter-singular":"nesportivul","definite-error-unrecognized-form-feminine-singular":"nesportiva","definite-error-unrecognized-form-masculine-plural":"nesportivii","definite-error-unrecognized-form-feminine-neuter-plural":"nesportivele"}},{"word":"nespus","pos":"adj","definitions":["untold"],"forms":{"feminine-singular":"nespusă","masculine-plural":"nespuși","feminine-neuter-plural":"nespuse","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nespus","error-unrecognized-form-feminine-indefinite-singular":"nespusă","error-unrecognized-form-indefinite-masculine-plural":"nespuși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nespuse","definite-error-unrecognized-form-masculine-neuter-singular":"nespusul","definite-error-unrecognized-form-feminine-singular":"nespusa","definite-error-unrecognized-form-masculine-plural":"nespușii","definite-error-unrecognized-form-feminine-neuter-plural":"nespusele"}},{"word":"nestabil","pos":"adj","definitions":["unstable"],"forms":{"feminine-singular":"nestabilă","masculine-plural":"nestabili","feminine-neuter-plural":"nestabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nestabil","error-unrecognized-form-feminine-indefinite-singular":"nestabilă","error-unrecognized-form-indefinite-masculine-plural":"nestabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nestabile","definite-error-unrecognized-form-masculine-neuter-singular":"nestabilul","definite-error-unrecognized-form-feminine-singular":"nestabila","definite-error-unrecognized-form-masculine-plural":"nestabilii","definite-error-unrecognized-form-feminine-neuter-plural":"nestabilele"}},{"word":"nestabilitate","pos":"noun","definitions":["instability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"nestabilitate","accusative-definite-nominative":"nestabilitatea","dative-genitive-indefinite":"nestabilități","dative-definite-genitive":"nestabilității","vocative":"nestabilitate"}},{"word":"neștampilat","pos":"adj","definitions":["unstamped"],"forms":{"feminine-singular":"neștampilată","masculine-plural":"neștampilați","feminine-neuter-plural":"neștampilate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neștampilat","error-unrecognized-form-feminine-indefinite-singular":"neștampilată","error-unrecognized-form-indefinite-masculine-plural":"neștampilați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neștampilate","definite-error-unrecognized-form-masculine-neuter-singular":"neștampilatul","definite-error-unrecognized-form-feminine-singular":"neștampilata","definite-error-unrecognized-form-masculine-plural":"neștampilații","definite-error-unrecognized-form-feminine-neuter-plural":"neștampilatele"}},{"word":"nestăpânire","pos":"noun","definitions":["impulsivity"],"forms":{"plural":"nestăpâniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nestăpânire","accusative-definite-nominative-singular":"nestăpânirea","accusative-indefinite-nominative-plural":"nestăpâniri","accusative-definite-nominative-plural":"nestăpânirile","dative-genitive-indefinite-singular":"nestăpâniri","dative-definite-genitive-singular":"nestăpânirii","dative-genitive-indefinite-plural":"nestăpâniri","dative-definite-genitive-plural":"nestăpânirilor","singular-vocative":"nestăpânire","plural-vocative":"nestăpânirilor"}},{"word":"nestăpânit","pos":"adj","definitions":["irrepressible, uncontrollable"],"forms":{"feminine-singular":"nestăpânită","masculine-plural":"nestăpâniți","feminine-neuter-plural":"nestăpânite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nestăpânit","error-unrecognized-form-feminine-indefinite-singular":"nestăpânită","error-unrecognized-form-indefinite-masculine-plural":"nestăpâniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nestăpânite","definite-error-unrecognized-form-masculine-neuter-singular":"nestăpânitul","definite-error-unrecognized-form-feminine-singular":"nestăpânita","definite-error-unrecognized-form-masculine-plural":"nestăpâniții","definite-error-unrecognized-form-feminine-neuter-plural":"nestăpânitele"}},{"word":"nestare","pos":"noun","definitions":["instability"],"forms":{"plural":"nestări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nestare","accusative-definite-nominative-singular":"nestarea","accusative-indefinite-nominative-plural":"nestări","accusative-definite-nominative-plural":"nestările","dative-genitive-indefinite-singular":"nestări","dative-definite-genitive-singular":"nestării","dative-genitive-indefinite-plural":"nestări","dative-definite-genitive-plural":"nestărilor","singular-vocative":"nestare","plural-vocative":"nestărilor"}},{"word":"nestatornic","pos":"adj","definitions":["fickle"],"forms":{"feminine-singular":"nestatornică","masculine-plural":"nestatornici","feminine-neuter-plural":"nestatornice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nestatornic","error-unrecognized-form-feminine-indefinite-singular":"nestatornică","error-unrecognized-form-indefinite-masculine-plural":"nestatornici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nestatornice","definite-error-unrecognized-form-masculine-neuter-singular":"nestatornicul","definite-error-unrecognized-form-feminine-singular":"nestatornica","definite-error-unrecognized-form-masculine-plural":"nestatornicii","definite-error-unrecognized-form-feminine-neuter-plural":"nestatornicele"}},{"word":"nestatornicie","pos":"noun","definitions":["fickleness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"nestatornicie","accusative-definite-nominative":"nestatornicia","dative-genitive-indefinite":"nestatornicii","dative-definite-genitive":"nestatorniciei","vocative":"nestatornicie"}},{"word":"nestăvilit","pos":"adj","definitions":["uncontrollable"],"forms":{"feminine-singular":"nestăvilită","masculine-plural":"nestăviliți","feminine-neuter-plural":"nestăvilite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nestăvilit","error-unrecognized-form-feminine-indefinite-singular":"nestăvilită","error-unrecognized-form-indefinite-masculine-plural":"nestăviliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nestăvilite","definite-error-unrecognized-form-masculine-neuter-singular":"nestăvilitul","definite-error-unrecognized-form-feminine-singular":"nestăvilita","definite-error-unrecognized-form-masculine-plural":"nestăviliții","definite-error-unrecognized-form-feminine-neuter-plural":"nestăvilitele"}},{"word":"nestemată","pos":"noun","definitions":["gem, gemstone"],"forms":{"plural":"nestemate"}},{"word":"nesterilizat","pos":"adj","definitions":["unsterilized"],"forms":{"feminine-singular":"nesterilizată","masculine-plural":"nesterilizați","feminine-neuter-plural":"nesterilizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesterilizat","error-unrecognized-form-feminine-indefinite-singular":"nesterilizată","error-unrecognized-form-indefinite-masculine-plural":"nesterilizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesterilizate","definite-error-unrecognized-form-masculine-neuter-singular":"nesterilizatul","definite-error-unrecognized-form-feminine-singular":"nesterilizata","definite-error-unrecognized-form-masculine-plural":"nesterilizații","definite-error-unrecognized-form-feminine-neuter-plural":"nesterilizatele"}},{"word":"Nesteriuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Nesteriuc"}},{"word":"neșters","pos":"adj","definitions":["indelible"],"forms":{"feminine-singular":"neștersă","masculine-plural":"neșterși","feminine-neuter-plural":"neșterse","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neșters","error-unrecognized-form-feminine-indefinite-singular":"neștersă","error-unrecognized-form-indefinite-masculine-plural":"neșterși","error-unrecognized-form-feminine-indefinite-neuter-plural":"neșterse","definite-error-unrecognized-form-masculine-neuter-singular":"neștersul","definite-error-unrecognized-form-feminine-singular":"neștersa","definite-error-unrecognized-form-masculine-plural":"neșterșii","definite-error-unrecognized-form-feminine-neuter-plural":"neștersele"}},{"word":"nești","pos":"verb","definitions":["to not know"],"forms":{"canonical":"a nești 4th conjugation","present-singular-third-person":"neștie","participle-past":"neștit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a nești","gerund":"neștind","first-person-indicative-present-singular":"neșt","indicative-present-second-person-singular":"nești","indicative-present-singular-third-person":"nește","first-person-indicative-plural-present":"neștim","indicative-plural-present-second-person":"neștiți","indicative-plural-present-third-person":"neșt","first-person-imperfect-indicative-singular":"neșteam","imperfect-indicative-second-person-singular":"neșteai","imperfect-indicative-singular-third-person":"neștea","first-person-imperfect-indicative-plural":"neșteam","imperfect-indicative-plural-second-person":"neșteați","imperfect-indicative-plural-third-person":"neșteau","first-person-indicative-perfect-singular":"neștii","indicative-perfect-second-person-singular":"neștiși","indicative-perfect-singular-third-person":"nești","first-person-indicative-perfect-plural":"neștirăm","indicative-perfect-plural-second-person":"neștirăți","indicative-perfect-plural-third-person":"neștiră","first-person-indicative-pluperfect-singular":"neștisem","indicative-pluperfect-second-person-singular":"neștiseși","indicative-pluperfect-singular-third-person":"neștise","first-person-indicative-pluperfect-plural":"neștiserăm","indicative-pluperfect-plural-second-person":"neștiserăți","indicative-pluperfect-plural-third-person":"neștiseră","first-person-present-singular-subjunctive":"să neșt","present-second-person-singular-subjunctive":"să nești","present-singular-subjunctive-third-person":"să neștă","first-person-plural-present-subjunctive":"să neștim","plural-present-second-person-subjunctive":"să neștiți","plural-present-subjunctive-third-person":"să neștă","imperative-second-person-singular":"nește","imperative-plural-second-person":"neștiți","imperative-negative-second-person-singular":"nu nești","imperative-negative-plural-second-person":"nu neștiți"}},{"word":"nestidință","pos":"noun","definitions":["shamelessness"],"forms":{"plural":"nestidințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nestidință","accusative-definite-nominative-singular":"nestidința","accusative-indefinite-nominative-plural":"nestidințe","accusative-definite-nominative-plural":"nestidințele","dative-genitive-indefinite-singular":"nestidințe","dative-definite-genitive-singular":"nestidinței","dative-genitive-indefinite-plural":"nestidințe","dative-definite-genitive-plural":"nestidințelor","singular-vocative":"nestidință","plural-vocative":"nestidințelor"}},{"word":"neștiință","pos":"noun","definitions":["ignorance, knowledgelessness, unknowledge"],"pronunciation":"/ne.ʃtiˈin.t͡sə/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"neștiință","accusative-definite-nominative":"neștiința","dative-genitive-indefinite":"neștiințe","dative-definite-genitive":"neștiinței","vocative":"neștiință"}},{"word":"neștiință de carte","pos":"noun","definitions":["illiteracy"]},{"word":"neștiințific","pos":"adj","definitions":["unscientific"],"forms":{"feminine-singular":"neștiințifică","masculine-plural":"neștiințifici","feminine-neuter-plural":"neștiințifice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neștiințific","error-unrecognized-form-feminine-indefinite-singular":"neștiințifică","error-unrecognized-form-indefinite-masculine-plural":"neștiințifici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neștiințifice","definite-error-unrecognized-form-masculine-neuter-singular":"neștiințificul","definite-error-unrecognized-form-feminine-singular":"neștiințifica","definite-error-unrecognized-form-masculine-plural":"neștiințificii","definite-error-unrecognized-form-feminine-neuter-plural":"neștiințificele"}},{"word":"nestimat","pos":"adj","definitions":["precious, invaluable, priceless"],"pronunciation":"/ˌnes.tiˈmat/","forms":{"feminine-singular":"nestimată","masculine-plural":"nestimați","feminine-neuter-plural":"nestimate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nestimat","error-unrecognized-form-feminine-indefinite-singular":"nestimată","error-unrecognized-form-indefinite-masculine-plural":"nestimați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nestimate","definite-error-unrecognized-form-masculine-neuter-singular":"nestimatul","definite-error-unrecognized-form-feminine-singular":"nestimata","definite-error-unrecognized-form-masculine-plural":"nestimații","definite-error-unrecognized-form-feminine-neuter-plural":"nestimatele","alternative":"nestemat"}},{"word":"nestimată","pos":"adj","definitions":["alternative form of nestemată"],"forms":{"plural":"nestimate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-","error-unrecognized-form-feminine-indefinite-singular":"nestimată","error-unrecognized-form-indefinite-masculine-plural":"-","error-unrecognized-form-feminine-indefinite-neuter-plural":"nestimate","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"nestimata","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"nestimatele"}},{"word":"neștine","pos":"pron","definitions":["someone, somebody"]},{"word":"nestingherit","pos":"adj","definitions":["unimpeded"],"forms":{"feminine-singular":"nestingherită","masculine-plural":"nestingheriți","feminine-neuter-plural":"nestingherite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nestingherit","error-unrecognized-form-feminine-indefinite-singular":"nestingherită","error-unrecognized-form-indefinite-masculine-plural":"nestingheriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nestingherite","definite-error-unrecognized-form-masculine-neuter-singular":"nestingheritul","definite-error-unrecognized-form-feminine-singular":"nestingherita","definite-error-unrecognized-form-masculine-plural":"nestingheriții","definite-error-unrecognized-form-feminine-neuter-plural":"nestingheritele"}},{"word":"nestingibil","pos":"adj","definitions":["inextinguishable"],"forms":{"feminine-singular":"nestingibilă","masculine-plural":"nestingibili","feminine-neuter-plural":"nestingibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nestingibil","error-unrecognized-form-feminine-indefinite-singular":"nestingibilă","error-unrecognized-form-indefinite-masculine-plural":"nestingibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nestingibile","definite-error-unrecognized-form-masculine-neuter-singular":"nestingibilul","definite-error-unrecognized-form-feminine-singular":"nestingibila","definite-error-unrecognized-form-masculine-plural":"nestingibilii","definite-error-unrecognized-form-feminine-neuter-plural":"nestingibilele"}},{"word":"nestins","pos":"adj","definitions":["unextinguished"],"forms":{"feminine-singular":"nestinsă","masculine-plural":"nestinși","feminine-neuter-plural":"nestinse","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nestins","error-unrecognized-form-feminine-indefinite-singular":"nestinsă","error-unrecognized-form-indefinite-masculine-plural":"nestinși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nestinse","definite-error-unrecognized-form-masculine-neuter-singular":"nestinsul","definite-error-unrecognized-form-feminine-singular":"nestinsa","definite-error-unrecognized-form-masculine-plural":"nestinșii","definite-error-unrecognized-form-feminine-neuter-plural":"nestinsele"}},{"word":"neștirbit","pos":"adj","definitions":["intact"],"forms":{"feminine-singular":"neștirbită","masculine-plural":"neștirbiți","feminine-neuter-plural":"neștirbite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neștirbit","error-unrecognized-form-feminine-indefinite-singular":"neștirbită","error-unrecognized-form-indefinite-masculine-plural":"neștirbiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neștirbite","definite-error-unrecognized-form-masculine-neuter-singular":"neștirbitul","definite-error-unrecognized-form-feminine-singular":"neștirbita","definite-error-unrecognized-form-masculine-plural":"neștirbiții","definite-error-unrecognized-form-feminine-neuter-plural":"neștirbitele"}},{"word":"neștire","pos":"noun","definitions":["ignorance"],"forms":{"plural":"neștiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neștire","accusative-definite-nominative-singular":"neștirea","accusative-indefinite-nominative-plural":"neștiri","accusative-definite-nominative-plural":"neștirile","dative-genitive-indefinite-singular":"neștiri","dative-definite-genitive-singular":"neștirii","dative-genitive-indefinite-plural":"neștiri","dative-definite-genitive-plural":"neștirilor","singular-vocative":"neștire","plural-vocative":"neștirilor"}},{"word":"neștiut","pos":"adj","definitions":["unknown"],"forms":{"feminine-singular":"neștiută","masculine-plural":"neștiuți","feminine-neuter-plural":"neștiute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neștiut","error-unrecognized-form-feminine-indefinite-singular":"neștiută","error-unrecognized-form-indefinite-masculine-plural":"neștiuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neștiute","definite-error-unrecognized-form-masculine-neuter-singular":"neștiutul","definite-error-unrecognized-form-feminine-singular":"neștiuta","definite-error-unrecognized-form-masculine-plural":"neștiuții","definite-error-unrecognized-form-feminine-neuter-plural":"neștiutele"}},{"word":"neștiutor","pos":"adj","definitions":["unknowledgeable, ignorant"],"pronunciation":"/ne.ʃti.uˈtor/","forms":{"feminine-singular":"neștiutoare","masculine-plural":"neștiutori","feminine-neuter-plural":"neștiutoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neștiutor","error-unrecognized-form-feminine-indefinite-singular":"neștiutoare","error-unrecognized-form-indefinite-masculine-plural":"neștiutori","error-unrecognized-form-feminine-indefinite-neuter-plural":"neștiutoare","definite-error-unrecognized-form-masculine-neuter-singular":"neștiutorul","definite-error-unrecognized-form-feminine-singular":"neștiutoarea","definite-error-unrecognized-form-masculine-plural":"neștiutorii","definite-error-unrecognized-form-feminine-neuter-plural":"neștiutoarele"}},{"word":"neștiutor de carte","pos":"noun","definitions":["illiterate person"],"forms":{"plural":"neștiutori de carte"}},{"word":"neștiutură","pos":"noun","definitions":["ignorance"],"forms":{"plural":"neștiuturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"neștiutură","accusative-definite-nominative-singular":"neștiutura","accusative-indefinite-nominative-plural":"neștiuturi","accusative-definite-nominative-plural":"neștiuturile","dative-genitive-indefinite-singular":"neștiuturi","dative-definite-genitive-singular":"neștiuturii","dative-genitive-indefinite-plural":"neștiuturi","dative-definite-genitive-plural":"neștiuturilor","singular-vocative":"neștiutură","plural-vocative":"neștiuturilor"}},{"word":"Nestorescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nestorescu"}},{"word":"nestorian","pos":"adj","definitions":["Nestorian"],"forms":{"feminine-singular":"nestoriană","masculine-plural":"nestorieni","feminine-neuter-plural":"nestoriene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nestorian","error-unrecognized-form-feminine-indefinite-singular":"nestoriană","error-unrecognized-form-indefinite-masculine-plural":"nestorieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"nestoriene","definite-error-unrecognized-form-masculine-neuter-singular":"nestorianul","definite-error-unrecognized-form-feminine-singular":"nestoriana","definite-error-unrecognized-form-masculine-plural":"nestorienii","definite-error-unrecognized-form-feminine-neuter-plural":"nestorienele"}},{"word":"nestorianism","pos":"noun","definitions":["Nestorianism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nestorianism","accusative-definite-nominative":"nestorianismul","dative-genitive-indefinite":"nestorianism","dative-definite-genitive":"nestorianismului","vocative":"nestorianismule"}},{"word":"nestoterapie","pos":"noun","definitions":["nestitherapy"],"forms":{"plural":"nestoterapii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nestoterapie","accusative-definite-nominative-singular":"nestoterapia","accusative-indefinite-nominative-plural":"nestoterapii","accusative-definite-nominative-plural":"nestoterapiile","dative-genitive-indefinite-singular":"nestoterapii","dative-definite-genitive-singular":"nestoterapiei","dative-genitive-indefinite-plural":"nestoterapii","dative-definite-genitive-plural":"nestoterapiilor","singular-vocative":"nestoterapie","plural-vocative":"nestoterapiilor"}},{"word":"nestrăbătut","pos":"adj","definitions":["not traveled, impenetrable"],"forms":{"feminine-singular":"nestrăbătută","masculine-plural":"nestrăbătuți","feminine-neuter-plural":"nestrăbătute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nestrăbătut","error-unrecognized-form-feminine-indefinite-singular":"nestrăbătută","error-unrecognized-form-indefinite-masculine-plural":"nestrăbătuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nestrăbătute","definite-error-unrecognized-form-masculine-neuter-singular":"nestrăbătutul","definite-error-unrecognized-form-feminine-singular":"nestrăbătuta","definite-error-unrecognized-form-masculine-plural":"nestrăbătuții","definite-error-unrecognized-form-feminine-neuter-plural":"nestrăbătutele"}},{"word":"nestrămutare","pos":"noun","definitions":["durability"],"forms":{"plural":"nestrămutări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nestrămutare","accusative-definite-nominative-singular":"nestrămutarea","accusative-indefinite-nominative-plural":"nestrămutări","accusative-definite-nominative-plural":"nestrămutările","dative-genitive-indefinite-singular":"nestrămutări","dative-definite-genitive-singular":"nestrămutării","dative-genitive-indefinite-plural":"nestrămutări","dative-definite-genitive-plural":"nestrămutărilor","singular-vocative":"nestrămutare","plural-vocative":"nestrămutărilor"}},{"word":"nestrămutat","pos":"adj","definitions":["unmovable"],"forms":{"feminine-singular":"nestrămutată","masculine-plural":"nestrămutați","feminine-neuter-plural":"nestrămutate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nestrămutat","error-unrecognized-form-feminine-indefinite-singular":"nestrămutată","error-unrecognized-form-indefinite-masculine-plural":"nestrămutați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nestrămutate","definite-error-unrecognized-form-masculine-neuter-singular":"nestrămutatul","definite-error-unrecognized-form-feminine-singular":"nestrămutata","definite-error-unrecognized-form-masculine-plural":"nestrămutații","definite-error-unrecognized-form-feminine-neuter-plural":"nestrămutatele"}},{"word":"nestrăvedere","pos":"noun","definitions":["opacity"],"forms":{"plural":"nestrăvederi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nestrăvedere","accusative-definite-nominative-singular":"nestrăvederea","accusative-indefinite-nominative-plural":"nestrăvederi","accusative-definite-nominative-plural":"nestrăvederile","dative-genitive-indefinite-singular":"nestrăvederi","dative-definite-genitive-singular":"nestrăvederii","dative-genitive-indefinite-plural":"nestrăvederi","dative-definite-genitive-plural":"nestrăvederilor","singular-vocative":"nestrăvedere","plural-vocative":"nestrăvederilor"}},{"word":"nestricat","pos":"adj","definitions":["unbroken"],"forms":{"feminine-singular":"nestricată","masculine-plural":"nestricați","feminine-neuter-plural":"nestricate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nestricat","error-unrecognized-form-feminine-indefinite-singular":"nestricată","error-unrecognized-form-indefinite-masculine-plural":"nestricați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nestricate","definite-error-unrecognized-form-masculine-neuter-singular":"nestricatul","definite-error-unrecognized-form-feminine-singular":"nestricata","definite-error-unrecognized-form-masculine-plural":"nestricații","definite-error-unrecognized-form-feminine-neuter-plural":"nestricatele"}},{"word":"nestructurat","pos":"adj","definitions":["unstructured"],"forms":{"feminine-singular":"nestructurată","masculine-plural":"nestructurați","feminine-neuter-plural":"nestructurate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nestructurat","error-unrecognized-form-feminine-indefinite-singular":"nestructurată","error-unrecognized-form-indefinite-masculine-plural":"nestructurați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nestructurate","definite-error-unrecognized-form-masculine-neuter-singular":"nestructuratul","definite-error-unrecognized-form-feminine-singular":"nestructurata","definite-error-unrecognized-form-masculine-plural":"nestructurații","definite-error-unrecognized-form-feminine-neuter-plural":"nestructuratele"}},{"word":"nesuferință","pos":"noun","definitions":["lack of sympathy"],"forms":{"plural":"nesuferințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nesuferință","accusative-definite-nominative-singular":"nesuferința","accusative-indefinite-nominative-plural":"nesuferințe","accusative-definite-nominative-plural":"nesuferințele","dative-genitive-indefinite-singular":"nesuferințe","dative-definite-genitive-singular":"nesuferinței","dative-genitive-indefinite-plural":"nesuferințe","dative-definite-genitive-plural":"nesuferințelor","singular-vocative":"nesuferință","plural-vocative":"nesuferințelor"}},{"word":"nesuferire","pos":"noun","definitions":["unbearable"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"nesuferire","accusative-definite-nominative":"nesuferirea","dative-genitive-indefinite":"nesuferiri","dative-definite-genitive":"nesuferirii","vocative":"nesuferire"}},{"word":"nesuferit","pos":"adj","definitions":["unbearable"],"forms":{"feminine-singular":"nesuferită","masculine-plural":"nesuferiți","feminine-neuter-plural":"nesuferite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesuferit","error-unrecognized-form-feminine-indefinite-singular":"nesuferită","error-unrecognized-form-indefinite-masculine-plural":"nesuferiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesuferite","definite-error-unrecognized-form-masculine-neuter-singular":"nesuferitul","definite-error-unrecognized-form-feminine-singular":"nesuferita","definite-error-unrecognized-form-masculine-plural":"nesuferiții","definite-error-unrecognized-form-feminine-neuter-plural":"nesuferitele"}},{"word":"nesupravegheat","pos":"adj","definitions":["unattended"],"forms":{"feminine-singular":"nesupravegheată","masculine-plural":"nesupravegheați","feminine-neuter-plural":"nesupravegheate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesupravegheat","error-unrecognized-form-feminine-indefinite-singular":"nesupravegheată","error-unrecognized-form-indefinite-masculine-plural":"nesupravegheați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesupravegheate","definite-error-unrecognized-form-masculine-neuter-singular":"nesupravegheatul","definite-error-unrecognized-form-feminine-singular":"nesupravegheata","definite-error-unrecognized-form-masculine-plural":"nesupravegheații","definite-error-unrecognized-form-feminine-neuter-plural":"nesupravegheatele"}},{"word":"nesupraveghere","pos":"noun","definitions":["lack of surveillance"],"forms":{"plural":"nesupravegheri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nesupraveghere","accusative-definite-nominative-singular":"nesupravegherea","accusative-indefinite-nominative-plural":"nesupravegheri","accusative-definite-nominative-plural":"nesupravegherile","dative-genitive-indefinite-singular":"nesupravegheri","dative-definite-genitive-singular":"nesupravegherii","dative-genitive-indefinite-plural":"nesupravegheri","dative-definite-genitive-plural":"nesupravegherilor","singular-vocative":"nesupraveghere","plural-vocative":"nesupravegherilor"}},{"word":"nesupunere","pos":"noun","definitions":["disobedience"],"forms":{"plural":"nesupuneri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nesupunere","accusative-definite-nominative-singular":"nesupunerea","accusative-indefinite-nominative-plural":"nesupuneri","accusative-definite-nominative-plural":"nesupunerile","dative-genitive-indefinite-singular":"nesupuneri","dative-definite-genitive-singular":"nesupunerii","dative-genitive-indefinite-plural":"nesupuneri","dative-definite-genitive-plural":"nesupunerilor","singular-vocative":"nesupunere","plural-vocative":"nesupunerilor"}},{"word":"nesupus","pos":"adj","definitions":["disobedient, unconquered"],"forms":{"feminine-singular":"nesupusă","masculine-plural":"nesupuși","feminine-neuter-plural":"nesupuse","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nesupus","error-unrecognized-form-feminine-indefinite-singular":"nesupusă","error-unrecognized-form-indefinite-masculine-plural":"nesupuși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nesupuse","definite-error-unrecognized-form-masculine-neuter-singular":"nesupusul","definite-error-unrecognized-form-feminine-singular":"nesupusa","definite-error-unrecognized-form-masculine-plural":"nesupușii","definite-error-unrecognized-form-feminine-neuter-plural":"nesupusele"}},{"word":"net","pos":"adj","definitions":["net","clear, clear-cut, plain"],"pronunciation":"/net/","forms":{"feminine-singular":"netă","masculine-plural":"neți","feminine-neuter-plural":"nete","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"net","error-unrecognized-form-feminine-indefinite-singular":"netă","error-unrecognized-form-indefinite-masculine-plural":"neți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nete","definite-error-unrecognized-form-masculine-neuter-singular":"netul","definite-error-unrecognized-form-feminine-singular":"neta","definite-error-unrecognized-form-masculine-plural":"neții","definite-error-unrecognized-form-feminine-neuter-plural":"netele"}},{"word":"net","pos":"adv","definitions":["clearly, distinctly","plainly, flatly","directly, bluntly, point blank, crisply","avowedly"],"pronunciation":"/net/"},{"word":"netăgăduit","pos":"adj","definitions":["undeniable"],"forms":{"feminine-singular":"netăgăduită","masculine-plural":"netăgăduiți","feminine-neuter-plural":"netăgăduite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"netăgăduit","error-unrecognized-form-feminine-indefinite-singular":"netăgăduită","error-unrecognized-form-indefinite-masculine-plural":"netăgăduiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"netăgăduite","definite-error-unrecognized-form-masculine-neuter-singular":"netăgăduitul","definite-error-unrecognized-form-feminine-singular":"netăgăduita","definite-error-unrecognized-form-masculine-plural":"netăgăduiții","definite-error-unrecognized-form-feminine-neuter-plural":"netăgăduitele"}},{"word":"netainic","pos":"adj","definitions":["which does not keep secrets"],"forms":{"feminine-singular":"netainică","masculine-plural":"netainici","feminine-neuter-plural":"netainice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"netainic","error-unrecognized-form-feminine-indefinite-singular":"netainică","error-unrecognized-form-indefinite-masculine-plural":"netainici","error-unrecognized-form-feminine-indefinite-neuter-plural":"netainice","definite-error-unrecognized-form-masculine-neuter-singular":"netainicul","definite-error-unrecognized-form-feminine-singular":"netainica","definite-error-unrecognized-form-masculine-plural":"netainicii","definite-error-unrecognized-form-feminine-neuter-plural":"netainicele"}},{"word":"netalentat","pos":"adj","definitions":["untalented"],"forms":{"feminine-singular":"netalentată","masculine-plural":"netalentați","feminine-neuter-plural":"netalentate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"netalentat","error-unrecognized-form-feminine-indefinite-singular":"netalentată","error-unrecognized-form-indefinite-masculine-plural":"netalentați","error-unrecognized-form-feminine-indefinite-neuter-plural":"netalentate","definite-error-unrecognized-form-masculine-neuter-singular":"netalentatul","definite-error-unrecognized-form-feminine-singular":"netalentata","definite-error-unrecognized-form-masculine-plural":"netalentații","definite-error-unrecognized-form-feminine-neuter-plural":"netalentatele"}},{"word":"netam-nesam","pos":"adv","definitions":["alternative form of nitam-nisam"]},{"word":"netam-nisam","pos":"adv","definitions":["alternative form of nitam-nisam"]},{"word":"netâmplare","pos":"noun","definitions":["absence"],"forms":{"plural":"netâmplări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"netâmplare","accusative-definite-nominative-singular":"netâmplarea","accusative-indefinite-nominative-plural":"netâmplări","accusative-definite-nominative-plural":"netâmplările","dative-genitive-indefinite-singular":"netâmplări","dative-definite-genitive-singular":"netâmplării","dative-genitive-indefinite-plural":"netâmplări","dative-definite-genitive-plural":"netâmplărilor","singular-vocative":"netâmplare","plural-vocative":"netâmplărilor"}},{"word":"netare","pos":"noun","definitions":["a weak person"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"netare","accusative-definite-nominative":"netareul","dative-genitive-indefinite":"netare","dative-definite-genitive":"netareului","vocative":"netareule"}},{"word":"nețărmurit","pos":"adj","definitions":["boundless"],"forms":{"feminine-singular":"nețărmurită","masculine-plural":"nețărmuriți","feminine-neuter-plural":"nețărmurite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nețărmurit","error-unrecognized-form-feminine-indefinite-singular":"nețărmurită","error-unrecognized-form-indefinite-masculine-plural":"nețărmuriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nețărmurite","definite-error-unrecognized-form-masculine-neuter-singular":"nețărmuritul","definite-error-unrecognized-form-feminine-singular":"nețărmurita","definite-error-unrecognized-form-masculine-plural":"nețărmuriții","definite-error-unrecognized-form-feminine-neuter-plural":"nețărmuritele"}},{"word":"neted","pos":"adj","definitions":["smooth, even","clear","precise"],"pronunciation":"/ˈne.ted/","forms":{"feminine-singular":"netedă","masculine-plural":"netezi","feminine-neuter-plural":"netede","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"neted","error-unrecognized-form-feminine-indefinite-singular":"netedă","error-unrecognized-form-indefinite-masculine-plural":"netezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"netede","definite-error-unrecognized-form-masculine-neuter-singular":"netedul","definite-error-unrecognized-form-feminine-singular":"neteda","definite-error-unrecognized-form-masculine-plural":"netezii","definite-error-unrecognized-form-feminine-neuter-plural":"netedele"}},{"word":"Neteda","pos":"name","definitions":["a river in Vâlcea County, Romania, tributary to the Păscoaia"],"gender":"f"},{"word":"Netedu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Netedu"}},{"word":"netemător","pos":"adj","definitions":["fearless"],"forms":{"feminine-singular":"netemătoare","masculine-plural":"netemători","feminine-neuter-plural":"netemătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"netemător","error-unrecognized-form-feminine-indefinite-singular":"netemătoare","error-unrecognized-form-indefinite-masculine-plural":"netemători","error-unrecognized-form-feminine-indefinite-neuter-plural":"netemătoare","definite-error-unrecognized-form-masculine-neuter-singular":"netemătorul","definite-error-unrecognized-form-feminine-singular":"netemătoarea","definite-error-unrecognized-form-masculine-plural":"netemătorii","definite-error-unrecognized-form-feminine-neuter-plural":"netemătoarele"}},{"word":"netemător","pos":"noun","definitions":["a fearless person"],"forms":{"plural":"netemători","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"netemător","accusative-definite-nominative-singular":"netemătorul","accusative-indefinite-nominative-plural":"netemători","accusative-definite-nominative-plural":"netemătorii","dative-genitive-indefinite-singular":"netemător","dative-definite-genitive-singular":"netemătorului","dative-genitive-indefinite-plural":"netemători","dative-definite-genitive-plural":"netemătorilor","singular-vocative":"netemătorule","plural-vocative":"netemătorilor"}},{"word":"netemeinicie","pos":"noun","definitions":["groundlessness"],"forms":{"plural":"netemeinicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"netemeinicie","accusative-definite-nominative-singular":"netemeinicia","accusative-indefinite-nominative-plural":"netemeinicii","accusative-definite-nominative-plural":"netemeiniciile","dative-genitive-indefinite-singular":"netemeinicii","dative-definite-genitive-singular":"netemeiniciei","dative-genitive-indefinite-plural":"netemeinicii","dative-definite-genitive-plural":"netemeiniciilor","singular-vocative":"netemeinicie","plural-vocative":"netemeiniciilor"}},{"word":"netemere","pos":"noun","definitions":["audacity, courage"],"forms":{"plural":"netemeri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"netemere","accusative-definite-nominative-singular":"netemerea","accusative-indefinite-nominative-plural":"netemeri","accusative-definite-nominative-plural":"netemerile","dative-genitive-indefinite-singular":"netemeri","dative-definite-genitive-singular":"netemerii","dative-genitive-indefinite-plural":"netemeri","dative-definite-genitive-plural":"netemerilor","singular-vocative":"netemere","plural-vocative":"netemerilor"}},{"word":"netemperat","pos":"adj","definitions":["untempered"],"forms":{"feminine-singular":"netemperată","masculine-plural":"netemperați","feminine-neuter-plural":"netemperate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"netemperat","error-unrecognized-form-feminine-indefinite-singular":"netemperată","error-unrecognized-form-indefinite-masculine-plural":"netemperați","error-unrecognized-form-feminine-indefinite-neuter-plural":"netemperate","definite-error-unrecognized-form-masculine-neuter-singular":"netemperatul","definite-error-unrecognized-form-feminine-singular":"netemperata","definite-error-unrecognized-form-masculine-plural":"netemperații","definite-error-unrecognized-form-feminine-neuter-plural":"netemperatele"}},{"word":"netemut","pos":"adj","definitions":["bold, daring"],"forms":{"feminine-singular":"netemută","masculine-plural":"netemuți","feminine-neuter-plural":"netemute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"netemut","error-unrecognized-form-feminine-indefinite-singular":"netemută","error-unrecognized-form-indefinite-masculine-plural":"netemuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"netemute","definite-error-unrecognized-form-masculine-neuter-singular":"netemutul","definite-error-unrecognized-form-feminine-singular":"netemuta","definite-error-unrecognized-form-masculine-plural":"netemuții","definite-error-unrecognized-form-feminine-neuter-plural":"netemutele"}},{"word":"netemut","pos":"adv","definitions":["boldly"]},{"word":"Nețeni","pos":"name","definitions":["a village in Mărișelu, Bistrița-Năsăud County, Romania"],"gender":"m"},{"word":"neterminat","pos":"adj","definitions":["unfinished"],"forms":{"feminine-singular":"neterminată","masculine-plural":"neterminați","feminine-neuter-plural":"neterminate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neterminat","error-unrecognized-form-feminine-indefinite-singular":"neterminată","error-unrecognized-form-indefinite-masculine-plural":"neterminați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neterminate","definite-error-unrecognized-form-masculine-neuter-singular":"neterminatul","definite-error-unrecognized-form-feminine-singular":"neterminata","definite-error-unrecognized-form-masculine-plural":"neterminații","definite-error-unrecognized-form-feminine-neuter-plural":"neterminatele"}},{"word":"Nețești","pos":"name","definitions":["a village in Stoilești, Vâlcea County, Romania"],"gender":"m"},{"word":"neteza","pos":"verb","definitions":["obsolete form of netezi"],"forms":{"canonical":"a neteza 1st conjugation","present-singular-third-person":"netează","participle-past":"netezat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a neteza","gerund":"netezând","first-person-indicative-present-singular":"netezez","indicative-present-second-person-singular":"netezezi","indicative-present-singular-third-person":"netezează","first-person-indicative-plural-present":"netezăm","indicative-plural-present-second-person":"netezați","indicative-plural-present-third-person":"netezează","first-person-imperfect-indicative-singular":"netezam","imperfect-indicative-second-person-singular":"netezai","imperfect-indicative-singular-third-person":"neteza","first-person-imperfect-indicative-plural":"netezam","imperfect-indicative-plural-second-person":"netezați","imperfect-indicative-plural-third-person":"netezau","first-person-indicative-perfect-singular":"netezai","indicative-perfect-second-person-singular":"netezași","indicative-perfect-singular-third-person":"neteză","first-person-indicative-perfect-plural":"netezarăm","indicative-perfect-plural-second-person":"netezarăți","indicative-perfect-plural-third-person":"netezară","first-person-indicative-pluperfect-singular":"netezasem","indicative-pluperfect-second-person-singular":"netezaseși","indicative-pluperfect-singular-third-person":"netezase","first-person-indicative-pluperfect-plural":"netezaserăm","indicative-pluperfect-plural-second-person":"netezaserăți","indicative-pluperfect-plural-third-person":"netezaseră","first-person-present-singular-subjunctive":"să netezez","present-second-person-singular-subjunctive":"să netezezi","present-singular-subjunctive-third-person":"să netezeze","first-person-plural-present-subjunctive":"să netezăm","plural-present-second-person-subjunctive":"să netezați","plural-present-subjunctive-third-person":"să netezeze","imperative-second-person-singular":"netezează","imperative-plural-second-person":"netezați","imperative-negative-second-person-singular":"nu neteza","imperative-negative-plural-second-person":"nu netezați"}},{"word":"netezeală","pos":"noun","definitions":["flatness, smoothness"],"forms":{"plural":"netezeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"netezeală","accusative-definite-nominative-singular":"netezeala","accusative-indefinite-nominative-plural":"netezele","accusative-definite-nominative-plural":"netezelele","dative-genitive-indefinite-singular":"netezele","dative-definite-genitive-singular":"netezelei","dative-genitive-indefinite-plural":"netezele","dative-definite-genitive-plural":"netezelelor","singular-vocative":"netezeală","plural-vocative":"netezelelor"}},{"word":"netezel","pos":"adj","definitions":["diminutive of neted"],"forms":{"feminine-singular":"netezelă","masculine-plural":"netezeli","feminine-neuter-plural":"netezele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"netezel","error-unrecognized-form-feminine-indefinite-singular":"netezelă","error-unrecognized-form-indefinite-masculine-plural":"netezeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"netezele","definite-error-unrecognized-form-masculine-neuter-singular":"netezelul","definite-error-unrecognized-form-feminine-singular":"netezela","definite-error-unrecognized-form-masculine-plural":"netezelii","definite-error-unrecognized-form-feminine-neuter-plural":"netezelele"}},{"word":"netezel","pos":"noun","definitions":["diminutive of -el"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"netezel","accusative-definite-nominative":"netezelle","dative-genitive-indefinite":"netezel","dative-definite-genitive":"netezellor","vocative":"-"}},{"word":"Netezi","pos":"name","definitions":["a village in Grumăzești, Neamț County, Romania"],"gender":"m"},{"word":"netezi","pos":"verb","definitions":["to smooth, level","to arrange or make neat; smooth out"],"pronunciation":"/ne.teˈzi/","forms":{"canonical":"a netezi 4th conjugation","present-singular-third-person":"netezește","participle-past":"netezit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a netezi","gerund":"netezind","first-person-indicative-present-singular":"netezesc","indicative-present-second-person-singular":"netezești","indicative-present-singular-third-person":"netezește","first-person-indicative-plural-present":"netezim","indicative-plural-present-second-person":"neteziți","indicative-plural-present-third-person":"netezesc","first-person-imperfect-indicative-singular":"netezeam","imperfect-indicative-second-person-singular":"netezeai","imperfect-indicative-singular-third-person":"netezea","first-person-imperfect-indicative-plural":"netezeam","imperfect-indicative-plural-second-person":"netezeați","imperfect-indicative-plural-third-person":"netezeau","first-person-indicative-perfect-singular":"netezii","indicative-perfect-second-person-singular":"neteziși","indicative-perfect-singular-third-person":"netezi","first-person-indicative-perfect-plural":"netezirăm","indicative-perfect-plural-second-person":"netezirăți","indicative-perfect-plural-third-person":"neteziră","first-person-indicative-pluperfect-singular":"netezisem","indicative-pluperfect-second-person-singular":"neteziseși","indicative-pluperfect-singular-third-person":"netezise","first-person-indicative-pluperfect-plural":"neteziserăm","indicative-pluperfect-plural-second-person":"neteziserăți","indicative-pluperfect-plural-third-person":"neteziseră","first-person-present-singular-subjunctive":"să netezesc","present-second-person-singular-subjunctive":"să netezești","present-singular-subjunctive-third-person":"să netezească","first-person-plural-present-subjunctive":"să netezim","plural-present-second-person-subjunctive":"să neteziți","plural-present-subjunctive-third-person":"să netezească","imperative-second-person-singular":"netezește","imperative-plural-second-person":"neteziți","imperative-negative-second-person-singular":"nu netezi","imperative-negative-plural-second-person":"nu neteziți"}},{"word":"netezime","pos":"noun","definitions":["flatness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"netezime","accusative-definite-nominative-singular":"netezimea","accusative-indefinite-nominative-plural":"netezimi","accusative-definite-nominative-plural":"netezimile","dative-genitive-indefinite-singular":"netezimi","dative-definite-genitive-singular":"netezimii","dative-genitive-indefinite-plural":"netezimi","dative-definite-genitive-plural":"netezimilor","singular-vocative":"netezime","plural-vocative":"netezimilor"}},{"word":"netezire","pos":"noun","definitions":["polishing"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"netezire","accusative-definite-nominative":"netezirea","dative-genitive-indefinite":"netezire","dative-definite-genitive":"netezirei","vocative":"netezire"}},{"word":"neteziș","pos":"noun","definitions":["smoothness"],"forms":{"plural":"netezișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"neteziș","accusative-definite-nominative-singular":"netezișul","accusative-indefinite-nominative-plural":"netezișuri","accusative-definite-nominative-plural":"netezișurile","dative-genitive-indefinite-singular":"neteziș","dative-definite-genitive-singular":"netezișului","dative-genitive-indefinite-plural":"netezișuri","dative-definite-genitive-plural":"netezișurilor","singular-vocative":"netezișule","plural-vocative":"netezișurilor"}},{"word":"netezit","pos":"adj","definitions":["smoothed"],"forms":{"feminine-singular":"netezită","masculine-plural":"neteziți","feminine-neuter-plural":"netezite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"netezit","error-unrecognized-form-feminine-indefinite-singular":"netezită","error-unrecognized-form-indefinite-masculine-plural":"neteziți","error-unrecognized-form-feminine-indefinite-neuter-plural":"netezite","definite-error-unrecognized-form-masculine-neuter-singular":"netezitul","definite-error-unrecognized-form-feminine-singular":"netezita","definite-error-unrecognized-form-masculine-plural":"neteziții","definite-error-unrecognized-form-feminine-neuter-plural":"netezitele"}},{"word":"netezitor","pos":"noun","definitions":["smoother"],"forms":{"plural":"netezitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"netezitor","accusative-definite-nominative-singular":"netezitorul","accusative-indefinite-nominative-plural":"netezitore","accusative-definite-nominative-plural":"netezitorele","dative-genitive-indefinite-singular":"netezitor","dative-definite-genitive-singular":"netezitorului","dative-genitive-indefinite-plural":"netezitore","dative-definite-genitive-plural":"netezitorelor","singular-vocative":"netezitorule","plural-vocative":"netezitorelor"}},{"word":"netezitură","pos":"noun","definitions":["flatness, smoothness"],"forms":{"plural":"netezituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"netezitură","accusative-definite-nominative-singular":"netezitura","accusative-indefinite-nominative-plural":"netezituri","accusative-definite-nominative-plural":"neteziturile","dative-genitive-indefinite-singular":"netezituri","dative-definite-genitive-singular":"neteziturii","dative-genitive-indefinite-plural":"netezituri","dative-definite-genitive-plural":"neteziturilor","singular-vocative":"netezitură","plural-vocative":"neteziturilor"}},{"word":"netihn","pos":"noun","definitions":["restless person, fussing person"],"forms":{"plural":"netihni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"netihn","accusative-definite-nominative-singular":"netihnul","accusative-indefinite-nominative-plural":"netihni","accusative-definite-nominative-plural":"netihnii","dative-genitive-indefinite-singular":"netihn","dative-definite-genitive-singular":"netihnului","dative-genitive-indefinite-plural":"netihni","dative-definite-genitive-plural":"netihnilor","singular-vocative":"netihnule","plural-vocative":"netihnilor"}},{"word":"netocmeală","pos":"noun","definitions":["dissension"],"forms":{"plural":"netocmeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"netocmeală","accusative-definite-nominative-singular":"netocmeala","accusative-indefinite-nominative-plural":"netocmele","accusative-definite-nominative-plural":"netocmelele","dative-genitive-indefinite-singular":"netocmele","dative-definite-genitive-singular":"netocmelei","dative-genitive-indefinite-plural":"netocmele","dative-definite-genitive-plural":"netocmelelor","singular-vocative":"netocmeală","plural-vocative":"netocmelelor"}},{"word":"netocmire","pos":"noun","definitions":["lack of understanding"],"forms":{"plural":"netocmiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"netocmire","accusative-definite-nominative-singular":"netocmirea","accusative-indefinite-nominative-plural":"netocmiri","accusative-definite-nominative-plural":"netocmirile","dative-genitive-indefinite-singular":"netocmiri","dative-definite-genitive-singular":"netocmirii","dative-genitive-indefinite-plural":"netocmiri","dative-definite-genitive-plural":"netocmirilor","singular-vocative":"netocmire","plural-vocative":"netocmirilor"}},{"word":"Nețoi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nețoi"}},{"word":"netot","pos":"noun","definitions":["a stupid, a fool"],"forms":{"plural":"netoți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"netot","accusative-definite-nominative-singular":"netotul","accusative-indefinite-nominative-plural":"netoți","accusative-definite-nominative-plural":"netoții","dative-genitive-indefinite-singular":"netot","dative-definite-genitive-singular":"netotului","dative-genitive-indefinite-plural":"netoți","dative-definite-genitive-plural":"netoților","singular-vocative":"netotule","plural-vocative":"netoților"}},{"word":"Netoți","pos":"name","definitions":["a village in Ialomița County, Romania. Renamed to Păltinișu in 1964."],"gender":"m-p"},{"word":"netoție","pos":"noun","definitions":["stupidity"],"forms":{"plural":"netoții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"netoție","accusative-definite-nominative-singular":"netoția","accusative-indefinite-nominative-plural":"netoții","accusative-definite-nominative-plural":"netoțiile","dative-genitive-indefinite-singular":"netoții","dative-definite-genitive-singular":"netoției","dative-genitive-indefinite-plural":"netoții","dative-definite-genitive-plural":"netoțiilor","singular-vocative":"netoție","plural-vocative":"netoțiilor"}},{"word":"Netotu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Netotu"}},{"word":"netransferabil","pos":"adj","definitions":["non-transferable"],"forms":{"feminine-singular":"netransferabilă","masculine-plural":"netransferabili","feminine-neuter-plural":"netransferabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"netransferabil","error-unrecognized-form-feminine-indefinite-singular":"netransferabilă","error-unrecognized-form-indefinite-masculine-plural":"netransferabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"netransferabile","definite-error-unrecognized-form-masculine-neuter-singular":"netransferabilul","definite-error-unrecognized-form-feminine-singular":"netransferabila","definite-error-unrecognized-form-masculine-plural":"netransferabilii","definite-error-unrecognized-form-feminine-neuter-plural":"netransferabilele"}},{"word":"netreabă","pos":"noun","definitions":["lack of activity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"netreabă","accusative-definite-nominative":"netreaba","dative-genitive-indefinite":"netreabe","dative-definite-genitive":"netreabei","vocative":"netreabă"}},{"word":"netrebnic","pos":"adj","definitions":["wretch, good-for-nothing"],"forms":{"feminine-singular":"netrebnică","masculine-plural":"netrebnici","feminine-neuter-plural":"netrebnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"netrebnic","error-unrecognized-form-feminine-indefinite-singular":"netrebnică","error-unrecognized-form-indefinite-masculine-plural":"netrebnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"netrebnice","definite-error-unrecognized-form-masculine-neuter-singular":"netrebnicul","definite-error-unrecognized-form-feminine-singular":"netrebnica","definite-error-unrecognized-form-masculine-plural":"netrebnicii","definite-error-unrecognized-form-feminine-neuter-plural":"netrebnicele"}},{"word":"netrebnicie","pos":"noun","definitions":["vileness"],"forms":{"plural":"netrebnicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"netrebnicie","accusative-definite-nominative-singular":"netrebnicia","accusative-indefinite-nominative-plural":"netrebnicii","accusative-definite-nominative-plural":"netrebniciile","dative-genitive-indefinite-singular":"netrebnicii","dative-definite-genitive-singular":"netrebniciei","dative-genitive-indefinite-plural":"netrebnicii","dative-definite-genitive-plural":"netrebniciilor","singular-vocative":"netrebnicie","plural-vocative":"netrebniciilor"}},{"word":"netrebuincios","pos":"adj","definitions":["needless"],"forms":{"feminine-singular":"netrebuincioasă","masculine-plural":"netrebuincioși","feminine-neuter-plural":"netrebuincioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"netrebuincios","error-unrecognized-form-feminine-indefinite-singular":"netrebuincioasă","error-unrecognized-form-indefinite-masculine-plural":"netrebuincioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"netrebuincioase","definite-error-unrecognized-form-masculine-neuter-singular":"netrebuinciosul","definite-error-unrecognized-form-feminine-singular":"netrebuincioasa","definite-error-unrecognized-form-masculine-plural":"netrebuincioșii","definite-error-unrecognized-form-feminine-neuter-plural":"netrebuincioasele"}},{"word":"netrebuit","pos":"adj","definitions":["good for nothing, worthless"],"forms":{"feminine-singular":"netrebuită","masculine-plural":"netrebuiți","feminine-neuter-plural":"netrebuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"netrebuit","error-unrecognized-form-feminine-indefinite-singular":"netrebuită","error-unrecognized-form-indefinite-masculine-plural":"netrebuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"netrebuite","definite-error-unrecognized-form-masculine-neuter-singular":"netrebuitul","definite-error-unrecognized-form-feminine-singular":"netrebuita","definite-error-unrecognized-form-masculine-plural":"netrebuiții","definite-error-unrecognized-form-feminine-neuter-plural":"netrebuitele"}},{"word":"netrivial","pos":"adj","definitions":["nontrivial"],"examples":[{"ro":"Să se determine pentru care A reprezentarea de autospații T#95;A este ireductibilă (adică nu are subspații invariante închise netriviale). Autorul studiază aceste probleme pentru cazul spațiilor omogene R², S² și H² (planul neeuclidian). De asemenea, lucrarea conţine note bibliografice, bibliografie și indice de subiecte.","en":null}],"forms":{"feminine-singular":"netrivială","masculine-plural":"netriviali","feminine-neuter-plural":"netriviale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"netrivial","error-unrecognized-form-feminine-indefinite-singular":"netrivială","error-unrecognized-form-indefinite-masculine-plural":"netriviali","error-unrecognized-form-feminine-indefinite-neuter-plural":"netriviale","definite-error-unrecognized-form-masculine-neuter-singular":"netrivialul","definite-error-unrecognized-form-feminine-singular":"netriviala","definite-error-unrecognized-form-masculine-plural":"netrivialii","definite-error-unrecognized-form-feminine-neuter-plural":"netrivialele"}},{"word":"netrucat","pos":"adj","definitions":["real, not using special effects (about movie scenes)"],"forms":{"feminine-singular":"netrucată","masculine-plural":"netrucați","feminine-neuter-plural":"netrucate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"netrucat","error-unrecognized-form-feminine-indefinite-singular":"netrucată","error-unrecognized-form-indefinite-masculine-plural":"netrucați","error-unrecognized-form-feminine-indefinite-neuter-plural":"netrucate","definite-error-unrecognized-form-masculine-neuter-singular":"netrucatul","definite-error-unrecognized-form-feminine-singular":"netrucata","definite-error-unrecognized-form-masculine-plural":"netrucații","definite-error-unrecognized-form-feminine-neuter-plural":"netrucatele"}},{"word":"netrufă","pos":"noun","definitions":["modesty"],"forms":{"plural":"netrufe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"netrufă","accusative-definite-nominative-singular":"netrufa","accusative-indefinite-nominative-plural":"netrufe","accusative-definite-nominative-plural":"netrufele","dative-genitive-indefinite-singular":"netrufe","dative-definite-genitive-singular":"netrufei","dative-genitive-indefinite-plural":"netrufe","dative-definite-genitive-plural":"netrufelor","singular-vocative":"netrufă","plural-vocative":"netrufelor"}},{"word":"netrunchiat","pos":"adj","definitions":["untruncated"],"forms":{"feminine-singular":"netrunchiată","masculine-plural":"netrunchiați","feminine-neuter-plural":"netrunchiate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"netrunchiat","error-unrecognized-form-feminine-indefinite-singular":"netrunchiată","error-unrecognized-form-indefinite-masculine-plural":"netrunchiați","error-unrecognized-form-feminine-indefinite-neuter-plural":"netrunchiate","definite-error-unrecognized-form-masculine-neuter-singular":"netrunchiatul","definite-error-unrecognized-form-feminine-singular":"netrunchiata","definite-error-unrecognized-form-masculine-plural":"netrunchiații","definite-error-unrecognized-form-feminine-neuter-plural":"netrunchiatele"}},{"word":"netulburat","pos":"adj","definitions":["untroubled"],"forms":{"feminine-singular":"netulburată","masculine-plural":"netulburați","feminine-neuter-plural":"netulburate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"netulburat","error-unrecognized-form-feminine-indefinite-singular":"netulburată","error-unrecognized-form-indefinite-masculine-plural":"netulburați","error-unrecognized-form-feminine-indefinite-neuter-plural":"netulburate","definite-error-unrecognized-form-masculine-neuter-singular":"netulburatul","definite-error-unrecognized-form-feminine-singular":"netulburata","definite-error-unrecognized-form-masculine-plural":"netulburații","definite-error-unrecognized-form-feminine-neuter-plural":"netulburatele"}},{"word":"Netuș","pos":"name","definitions":["a village in Iacobeni, Sibiu County, Romania"],"gender":"m"},{"word":"Neudorf","pos":"name","definitions":["a village in Zăbrani, Arad County, Romania"],"gender":"m"},{"word":"neuitabil","pos":"adj","definitions":["unforgettable"],"pronunciation":"/ˌne.ujˈta.bil/","forms":{"feminine-singular":"neuitabilă","masculine-plural":"neuitabili","feminine-neuter-plural":"neuitabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neuitabil","error-unrecognized-form-feminine-indefinite-singular":"neuitabilă","error-unrecognized-form-indefinite-masculine-plural":"neuitabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neuitabile","definite-error-unrecognized-form-masculine-neuter-singular":"neuitabilul","definite-error-unrecognized-form-feminine-singular":"neuitabila","definite-error-unrecognized-form-masculine-plural":"neuitabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neuitabilele"}},{"word":"neuitare","pos":"noun","definitions":["remembrance; inability or unwillingness to forget"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neuitare","accusative-definite-nominative-singular":"neuitarea","accusative-indefinite-nominative-plural":"neuitari","accusative-definite-nominative-plural":"neuitarile","dative-genitive-indefinite-singular":"neuitari","dative-definite-genitive-singular":"neuitarii","dative-genitive-indefinite-plural":"neuitari","dative-definite-genitive-plural":"neuitarilor","singular-vocative":"neuitare","plural-vocative":"neuitarilor"}},{"word":"neuitat","pos":"adj","definitions":["unforgettable"],"forms":{"feminine-singular":"neuitată","masculine-plural":"neuitați","feminine-neuter-plural":"neuitate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neuitat","error-unrecognized-form-feminine-indefinite-singular":"neuitată","error-unrecognized-form-indefinite-masculine-plural":"neuitați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neuitate","definite-error-unrecognized-form-masculine-neuter-singular":"neuitatul","definite-error-unrecognized-form-feminine-singular":"neuitata","definite-error-unrecognized-form-masculine-plural":"neuitații","definite-error-unrecognized-form-feminine-neuter-plural":"neuitatele"}},{"word":"neumă","pos":"noun","definitions":["neume"],"forms":{"plural":"neume","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neumă","accusative-definite-nominative-singular":"neuma","accusative-indefinite-nominative-plural":"neume","accusative-definite-nominative-plural":"neumele","dative-genitive-indefinite-singular":"neume","dative-definite-genitive-singular":"neumei","dative-genitive-indefinite-plural":"neume","dative-definite-genitive-plural":"neumelor","singular-vocative":"neumă","plural-vocative":"neumelor"}},{"word":"neuman","pos":"adj","definitions":["inhuman","inhumane"],"forms":{"feminine-singular":"neumană","masculine-plural":"neumani","feminine-neuter-plural":"neumane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neuman","error-unrecognized-form-feminine-indefinite-singular":"neumană","error-unrecognized-form-indefinite-masculine-plural":"neumani","error-unrecognized-form-feminine-indefinite-neuter-plural":"neumane","definite-error-unrecognized-form-masculine-neuter-singular":"neumanul","definite-error-unrecognized-form-feminine-singular":"neumana","definite-error-unrecognized-form-masculine-plural":"neumanii","definite-error-unrecognized-form-feminine-neuter-plural":"neumanele"}},{"word":"neumblat","pos":"adj","definitions":["pathless, unexplored","person who did not travel much"],"forms":{"feminine-singular":"neumblată","masculine-plural":"neumblați","feminine-neuter-plural":"neumblate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neumblat","error-unrecognized-form-feminine-indefinite-singular":"neumblată","error-unrecognized-form-indefinite-masculine-plural":"neumblați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neumblate","definite-error-unrecognized-form-masculine-neuter-singular":"neumblatul","definite-error-unrecognized-form-feminine-singular":"neumblata","definite-error-unrecognized-form-masculine-plural":"neumblații","definite-error-unrecognized-form-feminine-neuter-plural":"neumblatele"}},{"word":"neunire","pos":"noun","definitions":["disunity"],"forms":{"plural":"neuniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neunire","accusative-definite-nominative-singular":"neunirea","accusative-indefinite-nominative-plural":"neuniri","accusative-definite-nominative-plural":"neunirile","dative-genitive-indefinite-singular":"neuniri","dative-definite-genitive-singular":"neunirii","dative-genitive-indefinite-plural":"neuniri","dative-definite-genitive-plural":"neunirilor","singular-vocative":"neunire","plural-vocative":"neunirilor"}},{"word":"neural","pos":"adj","definitions":["neural"],"forms":{"feminine-singular":"neurală","masculine-plural":"neurali","feminine-neuter-plural":"neurale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neural","error-unrecognized-form-feminine-indefinite-singular":"neurală","error-unrecognized-form-indefinite-masculine-plural":"neurali","error-unrecognized-form-feminine-indefinite-neuter-plural":"neurale","definite-error-unrecognized-form-masculine-neuter-singular":"neuralul","definite-error-unrecognized-form-feminine-singular":"neurala","definite-error-unrecognized-form-masculine-plural":"neuralii","definite-error-unrecognized-form-feminine-neuter-plural":"neuralele"}},{"word":"neurastenic","pos":"adj","definitions":["neurasthenic"],"forms":{"feminine-singular":"neurastenică","masculine-plural":"neurastenici","feminine-neuter-plural":"neurastenice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neurastenic","error-unrecognized-form-feminine-indefinite-singular":"neurastenică","error-unrecognized-form-indefinite-masculine-plural":"neurastenici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neurastenice","definite-error-unrecognized-form-masculine-neuter-singular":"neurastenicul","definite-error-unrecognized-form-feminine-singular":"neurastenica","definite-error-unrecognized-form-masculine-plural":"neurastenicii","definite-error-unrecognized-form-feminine-neuter-plural":"neurastenicele"}},{"word":"neurastenică","pos":"noun","definitions":["female equivalent of neurastenic"],"forms":{"plural":"neurastenice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neurastenică","accusative-definite-nominative-singular":"neurastenica","accusative-indefinite-nominative-plural":"neurastenice","accusative-definite-nominative-plural":"neurastenicele","dative-genitive-indefinite-singular":"neurastenice","dative-definite-genitive-singular":"neurastenicei","dative-genitive-indefinite-plural":"neurastenice","dative-definite-genitive-plural":"neurastenicelor","singular-vocative":"neurastenică","plural-vocative":"neurastenicelor"}},{"word":"neurastenie","pos":"noun","definitions":["neurasthenia"],"forms":{"plural":"neurastenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neurastenie","accusative-definite-nominative-singular":"neurastenia","accusative-indefinite-nominative-plural":"neurastenii","accusative-definite-nominative-plural":"neurasteniile","dative-genitive-indefinite-singular":"neurastenii","dative-definite-genitive-singular":"neurasteniei","dative-genitive-indefinite-plural":"neurastenii","dative-definite-genitive-plural":"neurasteniilor","singular-vocative":"neurastenie","plural-vocative":"neurasteniilor"}},{"word":"neurasteniza","pos":"verb","definitions":["to become a neurasthenic"],"forms":{"canonical":"a neurasteniza 1st conjugation","present-singular-third-person":"neurastenizează","participle-past":"neurastenizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a neurasteniza","gerund":"neurastenizând","first-person-indicative-present-singular":"neurastenizez","indicative-present-second-person-singular":"neurastenizezi","indicative-present-singular-third-person":"neurastenizează","first-person-indicative-plural-present":"neurastenizăm","indicative-plural-present-second-person":"neurastenizați","indicative-plural-present-third-person":"neurastenizează","first-person-imperfect-indicative-singular":"neurastenizam","imperfect-indicative-second-person-singular":"neurastenizai","imperfect-indicative-singular-third-person":"neurasteniza","first-person-imperfect-indicative-plural":"neurastenizam","imperfect-indicative-plural-second-person":"neurastenizați","imperfect-indicative-plural-third-person":"neurastenizau","first-person-indicative-perfect-singular":"neurastenizai","indicative-perfect-second-person-singular":"neurastenizași","indicative-perfect-singular-third-person":"neurasteniză","first-person-indicative-perfect-plural":"neurastenizarăm","indicative-perfect-plural-second-person":"neurastenizarăți","indicative-perfect-plural-third-person":"neurastenizară","first-person-indicative-pluperfect-singular":"neurastenizasem","indicative-pluperfect-second-person-singular":"neurastenizaseși","indicative-pluperfect-singular-third-person":"neurastenizase","first-person-indicative-pluperfect-plural":"neurastenizaserăm","indicative-pluperfect-plural-second-person":"neurastenizaserăți","indicative-pluperfect-plural-third-person":"neurastenizaseră","first-person-present-singular-subjunctive":"să neurastenizez","present-second-person-singular-subjunctive":"să neurastenizezi","present-singular-subjunctive-third-person":"să neurastenizeze","first-person-plural-present-subjunctive":"să neurastenizăm","plural-present-second-person-subjunctive":"să neurastenizați","plural-present-subjunctive-third-person":"să neurastenizeze","imperative-second-person-singular":"neurastenizează","imperative-plural-second-person":"neurastenizați","imperative-negative-second-person-singular":"nu neurasteniza","imperative-negative-plural-second-person":"nu neurastenizați"}},{"word":"neurastenizat","pos":"adj","definitions":["neurasthenic"],"forms":{"feminine-singular":"neurastenizată","masculine-plural":"neurastenizați","feminine-neuter-plural":"neurastenizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neurastenizat","error-unrecognized-form-feminine-indefinite-singular":"neurastenizată","error-unrecognized-form-indefinite-masculine-plural":"neurastenizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neurastenizate","definite-error-unrecognized-form-masculine-neuter-singular":"neurastenizatul","definite-error-unrecognized-form-feminine-singular":"neurastenizata","definite-error-unrecognized-form-masculine-plural":"neurastenizații","definite-error-unrecognized-form-feminine-neuter-plural":"neurastenizatele"}},{"word":"neurină","pos":"noun","definitions":["neurine"],"forms":{"plural":"neurine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neurină","accusative-definite-nominative-singular":"neurina","accusative-indefinite-nominative-plural":"neurine","accusative-definite-nominative-plural":"neurinele","dative-genitive-indefinite-singular":"neurine","dative-definite-genitive-singular":"neurinei","dative-genitive-indefinite-plural":"neurine","dative-definite-genitive-plural":"neurinelor","singular-vocative":"neurină","plural-vocative":"neurinelor"}},{"word":"neurism","pos":"noun","definitions":["neurism"],"forms":{"plural":"neurisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neurism","accusative-definite-nominative-singular":"neurismul","accusative-indefinite-nominative-plural":"neurisme","accusative-definite-nominative-plural":"neurismele","dative-genitive-indefinite-singular":"neurism","dative-definite-genitive-singular":"neurismului","dative-genitive-indefinite-plural":"neurisme","dative-definite-genitive-plural":"neurismelor","singular-vocative":"neurismule","plural-vocative":"neurismelor"}},{"word":"neurit","pos":"noun","definitions":["neurite"],"forms":{"plural":"neurite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neurit","accusative-definite-nominative-singular":"neuritul","accusative-indefinite-nominative-plural":"neurite","accusative-definite-nominative-plural":"neuritele","dative-genitive-indefinite-singular":"neurit","dative-definite-genitive-singular":"neuritului","dative-genitive-indefinite-plural":"neurite","dative-definite-genitive-plural":"neuritelor","singular-vocative":"neuritule","plural-vocative":"neuritelor"}},{"word":"neurobiologie","pos":"noun","definitions":["neurobiology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"neurobiologie","accusative-definite-nominative":"neurobiologia","dative-genitive-indefinite":"neurobiologii","dative-definite-genitive":"neurobiologiei","vocative":"neurobiologie"}},{"word":"neuroblast","pos":"noun","definitions":["neuroblast"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neuroblast","accusative-definite-nominative":"neuroblastul","dative-genitive-indefinite":"neuroblast","dative-definite-genitive":"neuroblastului","vocative":"neuroblastule"}},{"word":"neuroblastom","pos":"noun","definitions":["neuroblastoma"],"forms":{"plural":"neuroblastoame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neuroblastom","accusative-definite-nominative-singular":"neuroblastomul","accusative-indefinite-nominative-plural":"neuroblastoame","accusative-definite-nominative-plural":"neuroblastoamele","dative-genitive-indefinite-singular":"neuroblastom","dative-definite-genitive-singular":"neuroblastomului","dative-genitive-indefinite-plural":"neuroblastoame","dative-definite-genitive-plural":"neuroblastoamelor","singular-vocative":"neuroblastomule","plural-vocative":"neuroblastoamelor"}},{"word":"neurochimistă","pos":"noun","definitions":["female equivalent of neurochimist"],"forms":{"plural":"neurochimiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neurochimistă","accusative-definite-nominative-singular":"neurochimista","accusative-indefinite-nominative-plural":"neurochimiste","accusative-definite-nominative-plural":"neurochimistele","dative-genitive-indefinite-singular":"neurochimiste","dative-definite-genitive-singular":"neurochimistei","dative-genitive-indefinite-plural":"neurochimiste","dative-definite-genitive-plural":"neurochimistelor","singular-vocative":"neurochimistă","plural-vocative":"neurochimistelor"}},{"word":"neurochirurg","pos":"noun","definitions":["neurosurgeon"],"pronunciation":"/ne.u.ro.kiˈrurɡ/","forms":{"plural":"neurochirurgi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neurochirurg","accusative-definite-nominative-singular":"neurochirurgul","accusative-indefinite-nominative-plural":"neurochirurgi","accusative-definite-nominative-plural":"neurochirurgii","dative-genitive-indefinite-singular":"neurochirurg","dative-definite-genitive-singular":"neurochirurgului","dative-genitive-indefinite-plural":"neurochirurgi","dative-definite-genitive-plural":"neurochirurgilor","singular-vocative":"neurochirurgule","plural-vocative":"neurochirurgilor"}},{"word":"neurochirurgi","pos":"noun","definitions":["plural of neurochirurg"],"gender":"m"},{"word":"neurochirurgie","pos":"noun","definitions":["neurosurgery"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"neurochirurgie","accusative-definite-nominative":"neurochirurgia","dative-genitive-indefinite":"neurochirurgii","dative-definite-genitive":"neurochirurgiei","vocative":"neurochirurgie"}},{"word":"neurocibernetic","pos":"adj","definitions":["neurocybernetic"],"forms":{"feminine-singular":"neurocibernetică","masculine-plural":"neurocibernetici","feminine-neuter-plural":"neurocibernetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neurocibernetic","error-unrecognized-form-feminine-indefinite-singular":"neurocibernetică","error-unrecognized-form-indefinite-masculine-plural":"neurocibernetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neurocibernetice","definite-error-unrecognized-form-masculine-neuter-singular":"neurociberneticul","definite-error-unrecognized-form-feminine-singular":"neurocibernetica","definite-error-unrecognized-form-masculine-plural":"neurociberneticii","definite-error-unrecognized-form-feminine-neuter-plural":"neurociberneticele"}},{"word":"neurocibernetică","pos":"noun","definitions":["neurocybernetics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neurocibernetică","accusative-definite-nominative-singular":"neurocibernetica","accusative-indefinite-nominative-plural":"neurocibernetice","accusative-definite-nominative-plural":"neurociberneticele","dative-genitive-indefinite-singular":"neurocibernetice","dative-definite-genitive-singular":"neurociberneticei","dative-genitive-indefinite-plural":"neurocibernetice","dative-definite-genitive-plural":"neurociberneticelor","singular-vocative":"neurocibernetică","plural-vocative":"neurociberneticelor"}},{"word":"neurocit","pos":"noun","definitions":["neurocyte"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neurocit","accusative-definite-nominative":"neurocitul","dative-genitive-indefinite":"neurocit","dative-definite-genitive":"neurocitului","vocative":"neurocitule"}},{"word":"neurocraniu","pos":"noun","definitions":["neurocranium"],"forms":{"plural":"neurocranii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neurocraniu","accusative-definite-nominative-singular":"neurocraniuul","accusative-indefinite-nominative-plural":"neurocranii","accusative-definite-nominative-plural":"neurocraniile","dative-genitive-indefinite-singular":"neurocraniu","dative-definite-genitive-singular":"neurocraniuului","dative-genitive-indefinite-plural":"neurocranii","dative-definite-genitive-plural":"neurocraniilor","singular-vocative":"neurocraniuule","plural-vocative":"neurocraniilor"}},{"word":"neurodermatoză","pos":"noun","definitions":["neurodermatosis"],"forms":{"plural":"neurodermatoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neurodermatoză","accusative-definite-nominative-singular":"neurodermatoza","accusative-indefinite-nominative-plural":"neurodermatoze","accusative-definite-nominative-plural":"neurodermatozele","dative-genitive-indefinite-singular":"neurodermatoze","dative-definite-genitive-singular":"neurodermatozei","dative-genitive-indefinite-plural":"neurodermatoze","dative-definite-genitive-plural":"neurodermatozelor","singular-vocative":"neurodermatoză","plural-vocative":"neurodermatozelor"}},{"word":"neurodermită","pos":"noun","definitions":["neurodermatitis"],"forms":{"plural":"neurodermite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neurodermită","accusative-definite-nominative-singular":"neurodermita","accusative-indefinite-nominative-plural":"neurodermite","accusative-definite-nominative-plural":"neurodermitele","dative-genitive-indefinite-singular":"neurodermite","dative-definite-genitive-singular":"neurodermitei","dative-genitive-indefinite-plural":"neurodermite","dative-definite-genitive-plural":"neurodermitelor","singular-vocative":"neurodermită","plural-vocative":"neurodermitelor"}},{"word":"neuroendocrin","pos":"adj","definitions":["neuroendocrine"],"forms":{"feminine-singular":"neuroendocrină","masculine-plural":"neuroendocrini","feminine-neuter-plural":"neuroendocrine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neuroendocrin","error-unrecognized-form-feminine-indefinite-singular":"neuroendocrină","error-unrecognized-form-indefinite-masculine-plural":"neuroendocrini","error-unrecognized-form-feminine-indefinite-neuter-plural":"neuroendocrine","definite-error-unrecognized-form-masculine-neuter-singular":"neuroendocrinul","definite-error-unrecognized-form-feminine-singular":"neuroendocrina","definite-error-unrecognized-form-masculine-plural":"neuroendocrinii","definite-error-unrecognized-form-feminine-neuter-plural":"neuroendocrinele"}},{"word":"neuroendocrinologie","pos":"noun","definitions":["neuroendocrinology"],"forms":{"plural":"neuroendocrinologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neuroendocrinologie","accusative-definite-nominative-singular":"neuroendocrinologia","accusative-indefinite-nominative-plural":"neuroendocrinologii","accusative-definite-nominative-plural":"neuroendocrinologiile","dative-genitive-indefinite-singular":"neuroendocrinologii","dative-definite-genitive-singular":"neuroendocrinologiei","dative-genitive-indefinite-plural":"neuroendocrinologii","dative-definite-genitive-plural":"neuroendocrinologiilor","singular-vocative":"neuroendocrinologie","plural-vocative":"neuroendocrinologiilor"}},{"word":"neurofibrilă","pos":"noun","definitions":["neurofibril"],"forms":{"plural":"neurofibrile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neurofibrilă","accusative-definite-nominative-singular":"neurofibrila","accusative-indefinite-nominative-plural":"neurofibrile","accusative-definite-nominative-plural":"neurofibrilele","dative-genitive-indefinite-singular":"neurofibrile","dative-definite-genitive-singular":"neurofibrilei","dative-genitive-indefinite-plural":"neurofibrile","dative-definite-genitive-plural":"neurofibrilelor","singular-vocative":"neurofibrilă","plural-vocative":"neurofibrilelor"}},{"word":"neurofibrom","pos":"noun","definitions":["neurofibroma"],"forms":{"plural":"neurofibroame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neurofibrom","accusative-definite-nominative-singular":"neurofibromul","accusative-indefinite-nominative-plural":"neurofibroame","accusative-definite-nominative-plural":"neurofibroamele","dative-genitive-indefinite-singular":"neurofibrom","dative-definite-genitive-singular":"neurofibromului","dative-genitive-indefinite-plural":"neurofibroame","dative-definite-genitive-plural":"neurofibroamelor","singular-vocative":"neurofibromule","plural-vocative":"neurofibroamelor"}},{"word":"neurofibromatoză","pos":"noun","definitions":["neurofibromatosis"],"forms":{"plural":"neurofibromatoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neurofibromatoză","accusative-definite-nominative-singular":"neurofibromatoza","accusative-indefinite-nominative-plural":"neurofibromatoze","accusative-definite-nominative-plural":"neurofibromatozele","dative-genitive-indefinite-singular":"neurofibromatoze","dative-definite-genitive-singular":"neurofibromatozei","dative-genitive-indefinite-plural":"neurofibromatoze","dative-definite-genitive-plural":"neurofibromatozelor","singular-vocative":"neurofibromatoză","plural-vocative":"neurofibromatozelor"}},{"word":"neurofiziolog","pos":"noun","definitions":["neurophysiologist"],"forms":{"plural":"neurofiziologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neurofiziolog","accusative-definite-nominative-singular":"neurofiziologul","accusative-indefinite-nominative-plural":"neurofiziologi","accusative-definite-nominative-plural":"neurofiziologii","dative-genitive-indefinite-singular":"neurofiziolog","dative-definite-genitive-singular":"neurofiziologului","dative-genitive-indefinite-plural":"neurofiziologi","dative-definite-genitive-plural":"neurofiziologilor","singular-vocative":"neurofiziologule","plural-vocative":"neurofiziologilor"}},{"word":"neurofiziologă","pos":"noun","definitions":["female equivalent of neurofiziolog"],"forms":{"plural":"neurofiziologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neurofiziologă","accusative-definite-nominative-singular":"neurofiziologa","accusative-indefinite-nominative-plural":"neurofiziologe","accusative-definite-nominative-plural":"neurofiziologele","dative-genitive-indefinite-singular":"neurofiziologe","dative-definite-genitive-singular":"neurofiziologei","dative-genitive-indefinite-plural":"neurofiziologe","dative-definite-genitive-plural":"neurofiziologelor","singular-vocative":"neurofiziologă","plural-vocative":"neurofiziologelor"}},{"word":"neurofiziologie","pos":"noun","definitions":["neurophysiology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"neurofiziologie","accusative-definite-nominative":"neurofiziologia","dative-genitive-indefinite":"neurofiziologii","dative-definite-genitive":"neurofiziologiei","vocative":"neurofiziologie"}},{"word":"neurogliom","pos":"noun","definitions":["neuroglioma"],"forms":{"plural":"neuroglioame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neurogliom","accusative-definite-nominative-singular":"neurogliomul","accusative-indefinite-nominative-plural":"neuroglioame","accusative-definite-nominative-plural":"neuroglioamele","dative-genitive-indefinite-singular":"neurogliom","dative-definite-genitive-singular":"neurogliomului","dative-genitive-indefinite-plural":"neuroglioame","dative-definite-genitive-plural":"neuroglioamelor","singular-vocative":"neurogliomule","plural-vocative":"neuroglioamelor"}},{"word":"neuroinfecție","pos":"noun","definitions":["neuroinfection"],"forms":{"plural":"neuroinfecții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neuroinfecție","accusative-definite-nominative-singular":"neuroinfecția","accusative-indefinite-nominative-plural":"neuroinfecții","accusative-definite-nominative-plural":"neuroinfecțiile","dative-genitive-indefinite-singular":"neuroinfecții","dative-definite-genitive-singular":"neuroinfecției","dative-genitive-indefinite-plural":"neuroinfecții","dative-definite-genitive-plural":"neuroinfecțiilor","singular-vocative":"neuroinfecție","plural-vocative":"neuroinfecțiilor"}},{"word":"neuroleptic","pos":"adj","definitions":["neuroleptic"],"forms":{"feminine-singular":"neuroleptică","masculine-plural":"neuroleptici","feminine-neuter-plural":"neuroleptice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neuroleptic","error-unrecognized-form-feminine-indefinite-singular":"neuroleptică","error-unrecognized-form-indefinite-masculine-plural":"neuroleptici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neuroleptice","definite-error-unrecognized-form-masculine-neuter-singular":"neurolepticul","definite-error-unrecognized-form-feminine-singular":"neuroleptica","definite-error-unrecognized-form-masculine-plural":"neurolepticii","definite-error-unrecognized-form-feminine-neuter-plural":"neurolepticele"}},{"word":"neurolimfă","pos":"noun","definitions":["neurolymph"],"forms":{"plural":"neurolimfe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neurolimfă","accusative-definite-nominative-singular":"neurolimfa","accusative-indefinite-nominative-plural":"neurolimfe","accusative-definite-nominative-plural":"neurolimfele","dative-genitive-indefinite-singular":"neurolimfe","dative-definite-genitive-singular":"neurolimfei","dative-genitive-indefinite-plural":"neurolimfe","dative-definite-genitive-plural":"neurolimfelor","singular-vocative":"neurolimfă","plural-vocative":"neurolimfelor"}},{"word":"neurolimfomatoză","pos":"noun","definitions":["neurolymphomatosis"],"forms":{"plural":"neurolimfomatoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neurolimfomatoză","accusative-definite-nominative-singular":"neurolimfomatoza","accusative-indefinite-nominative-plural":"neurolimfomatoze","accusative-definite-nominative-plural":"neurolimfomatozele","dative-genitive-indefinite-singular":"neurolimfomatoze","dative-definite-genitive-singular":"neurolimfomatozei","dative-genitive-indefinite-plural":"neurolimfomatoze","dative-definite-genitive-plural":"neurolimfomatozelor","singular-vocative":"neurolimfomatoză","plural-vocative":"neurolimfomatozelor"}},{"word":"neurolingvistică","pos":"noun","definitions":["neurolinguistics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"neurolingvistică","accusative-definite-nominative":"neurolingvistica","dative-genitive-indefinite":"neurolingvistice","dative-definite-genitive":"neurolingvisticei","vocative":"neurolingvistică"}},{"word":"neuroliză","pos":"noun","definitions":["neurolysis"],"forms":{"plural":"neurolize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neuroliză","accusative-definite-nominative-singular":"neuroliza","accusative-indefinite-nominative-plural":"neurolize","accusative-definite-nominative-plural":"neurolizele","dative-genitive-indefinite-singular":"neurolize","dative-definite-genitive-singular":"neurolizei","dative-genitive-indefinite-plural":"neurolize","dative-definite-genitive-plural":"neurolizelor","singular-vocative":"neuroliză","plural-vocative":"neurolizelor"}},{"word":"neurolog","pos":"noun","definitions":["neurologist"],"pronunciation":"/ne.u.roˈloɡ/","forms":{"plural":"neurologi","feminine":"equivalent neurologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neurolog","accusative-definite-nominative-singular":"neurologul","accusative-indefinite-nominative-plural":"neurologi","accusative-definite-nominative-plural":"neurologii","dative-genitive-indefinite-singular":"neurolog","dative-definite-genitive-singular":"neurologului","dative-genitive-indefinite-plural":"neurologi","dative-definite-genitive-plural":"neurologilor","singular-vocative":"neurologule","plural-vocative":"neurologilor"}},{"word":"neurologă","pos":"noun","definitions":["female equivalent of neurolog"],"pronunciation":"/ne.u.roˈlo.ɡə/","forms":{"plural":"neurologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"neurologă","accusative-definite-nominative-singular":"neurologa","accusative-indefinite-nominative-plural":"neurologe","accusative-definite-nominative-plural":"neurologele","dative-genitive-indefinite-singular":"neurologe","dative-definite-genitive-singular":"neurologei","dative-genitive-indefinite-plural":"neurologe","dative-definite-genitive-plural":"neurologelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"neurologe","pos":"noun","definitions":["plural of neurologă"],"gender":"f"},{"word":"neurologi","pos":"noun","definitions":["plural of neurolog"],"gender":"m"},{"word":"neurologic","pos":"adj","definitions":["neurological"],"forms":{"feminine-singular":"neurologică","masculine-plural":"neurologici","feminine-neuter-plural":"neurologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neurologic","error-unrecognized-form-feminine-indefinite-singular":"neurologică","error-unrecognized-form-indefinite-masculine-plural":"neurologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neurologice","definite-error-unrecognized-form-masculine-neuter-singular":"neurologicul","definite-error-unrecognized-form-feminine-singular":"neurologica","definite-error-unrecognized-form-masculine-plural":"neurologicii","definite-error-unrecognized-form-feminine-neuter-plural":"neurologicele"}},{"word":"neurologie","pos":"noun","definitions":["neurology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"neurologie","accusative-definite-nominative":"neurologia","dative-genitive-indefinite":"neurologii","dative-definite-genitive":"neurologiei","vocative":"neurologie"}},{"word":"neurom","pos":"noun","definitions":["alternative form of nevrom"],"forms":{"plural":"neuroame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neurom","accusative-definite-nominative-singular":"neuromul","accusative-indefinite-nominative-plural":"neuroame","accusative-definite-nominative-plural":"neuroamele","dative-genitive-indefinite-singular":"neurom","dative-definite-genitive-singular":"neuromului","dative-genitive-indefinite-plural":"neuroame","dative-definite-genitive-plural":"neuroamelor","singular-vocative":"neuromule","plural-vocative":"neuroamelor"}},{"word":"neuromuscular","pos":"adj","definitions":["neuromuscular"],"forms":{"feminine-singular":"neuromusculară","masculine-plural":"neuromusculari","feminine-neuter-plural":"neuromusculare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neuromuscular","error-unrecognized-form-feminine-indefinite-singular":"neuromusculară","error-unrecognized-form-indefinite-masculine-plural":"neuromusculari","error-unrecognized-form-feminine-indefinite-neuter-plural":"neuromusculare","definite-error-unrecognized-form-masculine-neuter-singular":"neuromuscularul","definite-error-unrecognized-form-feminine-singular":"neuromusculara","definite-error-unrecognized-form-masculine-plural":"neuromuscularii","definite-error-unrecognized-form-feminine-neuter-plural":"neuromuscularele"}},{"word":"neuron","pos":"noun","definitions":["neuron"],"forms":{"plural":"neuroni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neuron","accusative-definite-nominative-singular":"neuronul","accusative-indefinite-nominative-plural":"neuroni","accusative-definite-nominative-plural":"neuronii","dative-genitive-indefinite-singular":"neuron","dative-definite-genitive-singular":"neuronului","dative-genitive-indefinite-plural":"neuroni","dative-definite-genitive-plural":"neuronilor","singular-vocative":"neuronule","plural-vocative":"neuronilor"}},{"word":"neuron piramidal","pos":"noun","definitions":["pyramidal neuron"],"forms":{"plural":"neuroni piramidali"}},{"word":"neuroni piramidali","pos":"noun","definitions":["plural of neuron piramidal"]},{"word":"neuronofagie","pos":"noun","definitions":["neuronophagia"],"forms":{"plural":"neuronofagii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neuronofagie","accusative-definite-nominative-singular":"neuronofagia","accusative-indefinite-nominative-plural":"neuronofagii","accusative-definite-nominative-plural":"neuronofagiile","dative-genitive-indefinite-singular":"neuronofagii","dative-definite-genitive-singular":"neuronofagiei","dative-genitive-indefinite-plural":"neuronofagii","dative-definite-genitive-plural":"neuronofagiilor","singular-vocative":"neuronofagie","plural-vocative":"neuronofagiilor"}},{"word":"neuropatolog","pos":"noun","definitions":["neuropathologist"],"forms":{"plural":"neuropatologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neuropatolog","accusative-definite-nominative-singular":"neuropatologul","accusative-indefinite-nominative-plural":"neuropatologi","accusative-definite-nominative-plural":"neuropatologii","dative-genitive-indefinite-singular":"neuropatolog","dative-definite-genitive-singular":"neuropatologului","dative-genitive-indefinite-plural":"neuropatologi","dative-definite-genitive-plural":"neuropatologilor","singular-vocative":"neuropatologule","plural-vocative":"neuropatologilor"}},{"word":"neuropatologie","pos":"noun","definitions":["neuropathology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"neuropatologie","accusative-definite-nominative":"neuropatologia","dative-genitive-indefinite":"neuropatologii","dative-definite-genitive":"neuropatologiei","vocative":"neuropatologie"}},{"word":"neuroplasmă","pos":"noun","definitions":["neuroplasm"],"forms":{"plural":"neuroplasme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neuroplasmă","accusative-definite-nominative-singular":"neuroplasma","accusative-indefinite-nominative-plural":"neuroplasme","accusative-definite-nominative-plural":"neuroplasmele","dative-genitive-indefinite-singular":"neuroplasme","dative-definite-genitive-singular":"neuroplasmei","dative-genitive-indefinite-plural":"neuroplasme","dative-definite-genitive-plural":"neuroplasmelor","singular-vocative":"neuroplasmă","plural-vocative":"neuroplasmelor"}},{"word":"neuroplegic","pos":"adj","definitions":["neuroplegic"],"forms":{"feminine-singular":"neuroplegică","masculine-plural":"neuroplegici","feminine-neuter-plural":"neuroplegice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neuroplegic","error-unrecognized-form-feminine-indefinite-singular":"neuroplegică","error-unrecognized-form-indefinite-masculine-plural":"neuroplegici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neuroplegice","definite-error-unrecognized-form-masculine-neuter-singular":"neuroplegicul","definite-error-unrecognized-form-feminine-singular":"neuroplegica","definite-error-unrecognized-form-masculine-plural":"neuroplegicii","definite-error-unrecognized-form-feminine-neuter-plural":"neuroplegicele"}},{"word":"neuroplegie","pos":"noun","definitions":["neuroplegia"],"forms":{"plural":"neuroplegii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neuroplegie","accusative-definite-nominative-singular":"neuroplegia","accusative-indefinite-nominative-plural":"neuroplegii","accusative-definite-nominative-plural":"neuroplegiile","dative-genitive-indefinite-singular":"neuroplegii","dative-definite-genitive-singular":"neuroplegiei","dative-genitive-indefinite-plural":"neuroplegii","dative-definite-genitive-plural":"neuroplegiilor","singular-vocative":"neuroplegie","plural-vocative":"neuroplegiilor"}},{"word":"neuropsihiatrie","pos":"noun","definitions":["neuropsychiatry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"neuropsihiatrie","accusative-definite-nominative":"neuropsihiatria","dative-genitive-indefinite":"neuropsihiatrii","dative-definite-genitive":"neuropsihiatriei","vocative":"neuropsihiatrie"}},{"word":"neuropsihiatru","pos":"noun","definitions":["neuropsychiatrist"],"forms":{"plural":"neuropsihiatri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neuropsihiatru","accusative-definite-nominative-singular":"neuropsihiatruul","accusative-indefinite-nominative-plural":"neuropsihiatri","accusative-definite-nominative-plural":"neuropsihiatrii","dative-genitive-indefinite-singular":"neuropsihiatru","dative-definite-genitive-singular":"neuropsihiatruului","dative-genitive-indefinite-plural":"neuropsihiatri","dative-definite-genitive-plural":"neuropsihiatrilor","singular-vocative":"neuropsihiatruule","plural-vocative":"neuropsihiatrilor"}},{"word":"neuropsihic","pos":"adj","definitions":["neuropsychic"],"forms":{"feminine-singular":"neuropsihică","masculine-plural":"neuropsihici","feminine-neuter-plural":"neuropsihice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neuropsihic","error-unrecognized-form-feminine-indefinite-singular":"neuropsihică","error-unrecognized-form-indefinite-masculine-plural":"neuropsihici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neuropsihice","definite-error-unrecognized-form-masculine-neuter-singular":"neuropsihicul","definite-error-unrecognized-form-feminine-singular":"neuropsihica","definite-error-unrecognized-form-masculine-plural":"neuropsihicii","definite-error-unrecognized-form-feminine-neuter-plural":"neuropsihicele"}},{"word":"neuropsiholog","pos":"noun","definitions":["neuropsychologist"],"forms":{"plural":"neuropsihologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neuropsiholog","accusative-definite-nominative-singular":"neuropsihologul","accusative-indefinite-nominative-plural":"neuropsihologi","accusative-definite-nominative-plural":"neuropsihologii","dative-genitive-indefinite-singular":"neuropsiholog","dative-definite-genitive-singular":"neuropsihologului","dative-genitive-indefinite-plural":"neuropsihologi","dative-definite-genitive-plural":"neuropsihologilor","singular-vocative":"neuropsihologule","plural-vocative":"neuropsihologilor"}},{"word":"neuropsihologic","pos":"adj","definitions":["neuropsychological"],"forms":{"feminine-singular":"neuropsihologică","masculine-plural":"neuropsihologici","feminine-neuter-plural":"neuropsihologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neuropsihologic","error-unrecognized-form-feminine-indefinite-singular":"neuropsihologică","error-unrecognized-form-indefinite-masculine-plural":"neuropsihologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neuropsihologice","definite-error-unrecognized-form-masculine-neuter-singular":"neuropsihologicul","definite-error-unrecognized-form-feminine-singular":"neuropsihologica","definite-error-unrecognized-form-masculine-plural":"neuropsihologicii","definite-error-unrecognized-form-feminine-neuter-plural":"neuropsihologicele"}},{"word":"neuropsihologie","pos":"noun","definitions":["neuropsychology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neuropsihologie","accusative-definite-nominative-singular":"neuropsihologia","accusative-indefinite-nominative-plural":"neuropsihologii","accusative-definite-nominative-plural":"neuropsihologiile","dative-genitive-indefinite-singular":"neuropsihologii","dative-definite-genitive-singular":"neuropsihologiei","dative-genitive-indefinite-plural":"neuropsihologii","dative-definite-genitive-plural":"neuropsihologiilor","singular-vocative":"neuropsihologie","plural-vocative":"neuropsihologiilor"}},{"word":"neuroradiologă","pos":"noun","definitions":["female equivalent of neuroradiolog"],"forms":{"plural":"neuroradiologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neuroradiologă","accusative-definite-nominative-singular":"neuroradiologa","accusative-indefinite-nominative-plural":"neuroradiologe","accusative-definite-nominative-plural":"neuroradiologele","dative-genitive-indefinite-singular":"neuroradiologe","dative-definite-genitive-singular":"neuroradiologei","dative-genitive-indefinite-plural":"neuroradiologe","dative-definite-genitive-plural":"neuroradiologelor","singular-vocative":"neuroradiologă","plural-vocative":"neuroradiologelor"}},{"word":"neurosifilis","pos":"noun","definitions":["neurosyphilis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neurosifilis","accusative-definite-nominative":"neurosifilisul","dative-genitive-indefinite":"neurosifilis","dative-definite-genitive":"neurosifilisului","vocative":"neurosifilisule"}},{"word":"neurosimpatic","pos":"adj","definitions":["neurosympathetic"],"forms":{"feminine-singular":"neurosimpatică","masculine-plural":"neurosimpatici","feminine-neuter-plural":"neurosimpatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neurosimpatic","error-unrecognized-form-feminine-indefinite-singular":"neurosimpatică","error-unrecognized-form-indefinite-masculine-plural":"neurosimpatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neurosimpatice","definite-error-unrecognized-form-masculine-neuter-singular":"neurosimpaticul","definite-error-unrecognized-form-feminine-singular":"neurosimpatica","definite-error-unrecognized-form-masculine-plural":"neurosimpaticii","definite-error-unrecognized-form-feminine-neuter-plural":"neurosimpaticele"}},{"word":"neurotom","pos":"noun","definitions":["neurotome"],"forms":{"plural":"neurotoame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neurotom","accusative-definite-nominative-singular":"neurotomul","accusative-indefinite-nominative-plural":"neurotoame","accusative-definite-nominative-plural":"neurotoamele","dative-genitive-indefinite-singular":"neurotom","dative-definite-genitive-singular":"neurotomului","dative-genitive-indefinite-plural":"neurotoame","dative-definite-genitive-plural":"neurotoamelor","singular-vocative":"neurotomule","plural-vocative":"neurotoamelor"}}];
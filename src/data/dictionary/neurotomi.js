@@ -0,0 +1 @@
+export default [{"word":"neurotomie","pos":"noun","definitions":["alternative form of nevrotomie"],"forms":{"plural":"neurotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neurotomie","accusative-definite-nominative-singular":"neurotomia","accusative-indefinite-nominative-plural":"neurotomii","accusative-definite-nominative-plural":"neurotomiile","dative-genitive-indefinite-singular":"neurotomii","dative-definite-genitive-singular":"neurotomiei","dative-genitive-indefinite-plural":"neurotomii","dative-definite-genitive-plural":"neurotomiilor","singular-vocative":"neurotomie","plural-vocative":"neurotomiilor"}},{"word":"neurotonic","pos":"noun","definitions":["neurotonic"],"forms":{"plural":"neurotonici","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neurotonic","accusative-definite-nominative-singular":"neurotonicul","accusative-indefinite-nominative-plural":"neurotonici","accusative-definite-nominative-plural":"neurotonicile","dative-genitive-indefinite-singular":"neurotonic","dative-definite-genitive-singular":"neurotonicului","dative-genitive-indefinite-plural":"neurotonici","dative-definite-genitive-plural":"neurotonicilor","singular-vocative":"neurotonicule","plural-vocative":"neurotonicilor"}},{"word":"neurotoxină","pos":"noun","definitions":["neurotoxin"],"forms":{"plural":"neurotoxine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neurotoxină","accusative-definite-nominative-singular":"neurotoxina","accusative-indefinite-nominative-plural":"neurotoxine","accusative-definite-nominative-plural":"neurotoxinele","dative-genitive-indefinite-singular":"neurotoxine","dative-definite-genitive-singular":"neurotoxinei","dative-genitive-indefinite-plural":"neurotoxine","dative-definite-genitive-plural":"neurotoxinelor","singular-vocative":"neurotoxină","plural-vocative":"neurotoxinelor"}},{"word":"neurotrop","pos":"adj","definitions":["neurotropic"],"forms":{"feminine-singular":"neurotropă","masculine-plural":"neurotropi","feminine-neuter-plural":"neurotrope","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neurotrop","error-unrecognized-form-feminine-indefinite-singular":"neurotropă","error-unrecognized-form-indefinite-masculine-plural":"neurotropi","error-unrecognized-form-feminine-indefinite-neuter-plural":"neurotrope","definite-error-unrecognized-form-masculine-neuter-singular":"neurotropul","definite-error-unrecognized-form-feminine-singular":"neurotropa","definite-error-unrecognized-form-masculine-plural":"neurotropii","definite-error-unrecognized-form-feminine-neuter-plural":"neurotropele"}},{"word":"neurotropism","pos":"noun","definitions":["neurotropism"],"forms":{"plural":"neurotropisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neurotropism","accusative-definite-nominative-singular":"neurotropismul","accusative-indefinite-nominative-plural":"neurotropisme","accusative-definite-nominative-plural":"neurotropismele","dative-genitive-indefinite-singular":"neurotropism","dative-definite-genitive-singular":"neurotropismului","dative-genitive-indefinite-plural":"neurotropisme","dative-definite-genitive-plural":"neurotropismelor","singular-vocative":"neurotropismule","plural-vocative":"neurotropismelor"}},{"word":"neurovegetativ","pos":"adj","definitions":["neurovegetative"],"forms":{"feminine-singular":"neurovegetativă","masculine-plural":"neurovegetativi","feminine-neuter-plural":"neurovegetative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neurovegetativ","error-unrecognized-form-feminine-indefinite-singular":"neurovegetativă","error-unrecognized-form-indefinite-masculine-plural":"neurovegetativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"neurovegetative","definite-error-unrecognized-form-masculine-neuter-singular":"neurovegetativul","definite-error-unrecognized-form-feminine-singular":"neurovegetativa","definite-error-unrecognized-form-masculine-plural":"neurovegetativii","definite-error-unrecognized-form-feminine-neuter-plural":"neurovegetativele"}},{"word":"neurulă","pos":"noun","definitions":["neurula"],"forms":{"plural":"neurule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neurulă","accusative-definite-nominative-singular":"neurula","accusative-indefinite-nominative-plural":"neurule","accusative-definite-nominative-plural":"neurulele","dative-genitive-indefinite-singular":"neurule","dative-definite-genitive-singular":"neurulei","dative-genitive-indefinite-plural":"neurule","dative-definite-genitive-plural":"neurulelor","singular-vocative":"neurulă","plural-vocative":"neurulelor"}},{"word":"neuston","pos":"noun","definitions":["neuston"],"forms":{"plural":"neustoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neuston","accusative-definite-nominative-singular":"neustonul","accusative-indefinite-nominative-plural":"neustoane","accusative-definite-nominative-plural":"neustoanele","dative-genitive-indefinite-singular":"neuston","dative-definite-genitive-singular":"neustonului","dative-genitive-indefinite-plural":"neustoane","dative-definite-genitive-plural":"neustoanelor","singular-vocative":"neustonule","plural-vocative":"neustoanelor"}},{"word":"neutra","pos":"adj","definitions":["definite nominative/accusative feminine singular of neutru"],"pronunciation":"[neˈu.tra]"},{"word":"neutral","pos":"adj","definitions":["neutral"],"forms":{"feminine-singular":"neutrală","masculine-plural":"neutrali","feminine-neuter-plural":"neutrale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neutral","error-unrecognized-form-feminine-indefinite-singular":"neutrală","error-unrecognized-form-indefinite-masculine-plural":"neutrali","error-unrecognized-form-feminine-indefinite-neuter-plural":"neutrale","definite-error-unrecognized-form-masculine-neuter-singular":"neutralul","definite-error-unrecognized-form-feminine-singular":"neutrala","definite-error-unrecognized-form-masculine-plural":"neutralii","definite-error-unrecognized-form-feminine-neuter-plural":"neutralele"}},{"word":"neutralism","pos":"noun","definitions":["neutralism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"neutralism","accusative-definite-nominative":"neutralismul","dative-genitive-indefinite":"neutralism","dative-definite-genitive":"neutralismului","vocative":"neutralismule"}},{"word":"neutralist","pos":"adj","definitions":["neutralist"],"forms":{"feminine-singular":"neutralistă","masculine-plural":"neutraliști","feminine-neuter-plural":"neutraliste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neutralist","error-unrecognized-form-feminine-indefinite-singular":"neutralistă","error-unrecognized-form-indefinite-masculine-plural":"neutraliști","error-unrecognized-form-feminine-indefinite-neuter-plural":"neutraliste","definite-error-unrecognized-form-masculine-neuter-singular":"neutralistul","definite-error-unrecognized-form-feminine-singular":"neutralista","definite-error-unrecognized-form-masculine-plural":"neutraliștii","definite-error-unrecognized-form-feminine-neuter-plural":"neutralistele"}},{"word":"neutralist","pos":"noun","definitions":["neutralist"],"forms":{"plural":"neutraliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neutralist","accusative-definite-nominative-singular":"neutralistul","accusative-indefinite-nominative-plural":"neutraliști","accusative-definite-nominative-plural":"neutraliștii","dative-genitive-indefinite-singular":"neutralist","dative-definite-genitive-singular":"neutralistului","dative-genitive-indefinite-plural":"neutraliști","dative-definite-genitive-plural":"neutraliștilor","singular-vocative":"neutralistule","plural-vocative":"neutraliștilor"}},{"word":"neutralitate","pos":"noun","definitions":["neutrality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"neutralitate","accusative-definite-nominative":"neutralitatea","dative-genitive-indefinite":"neutralități","dative-definite-genitive":"neutralității","vocative":"neutralitate"}},{"word":"neutraliza","pos":"verb","definitions":["to neutralize"],"pronunciation":"/ne.u.tra.liˈza/","forms":{"canonical":"a neutraliza 1st conjugation","present-singular-third-person":"neutralizează","participle-past":"neutralizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a neutraliza","gerund":"neutralizând","first-person-indicative-present-singular":"neutralizez","indicative-present-second-person-singular":"neutralizezi","indicative-present-singular-third-person":"neutralizează","first-person-indicative-plural-present":"neutralizăm","indicative-plural-present-second-person":"neutralizați","indicative-plural-present-third-person":"neutralizează","first-person-imperfect-indicative-singular":"neutralizam","imperfect-indicative-second-person-singular":"neutralizai","imperfect-indicative-singular-third-person":"neutraliza","first-person-imperfect-indicative-plural":"neutralizam","imperfect-indicative-plural-second-person":"neutralizați","imperfect-indicative-plural-third-person":"neutralizau","first-person-indicative-perfect-singular":"neutralizai","indicative-perfect-second-person-singular":"neutralizași","indicative-perfect-singular-third-person":"neutraliză","first-person-indicative-perfect-plural":"neutralizarăm","indicative-perfect-plural-second-person":"neutralizarăți","indicative-perfect-plural-third-person":"neutralizară","first-person-indicative-pluperfect-singular":"neutralizasem","indicative-pluperfect-second-person-singular":"neutralizaseși","indicative-pluperfect-singular-third-person":"neutralizase","first-person-indicative-pluperfect-plural":"neutralizaserăm","indicative-pluperfect-plural-second-person":"neutralizaserăți","indicative-pluperfect-plural-third-person":"neutralizaseră","first-person-present-singular-subjunctive":"să neutralizez","present-second-person-singular-subjunctive":"să neutralizezi","present-singular-subjunctive-third-person":"să neutralizeze","first-person-plural-present-subjunctive":"să neutralizăm","plural-present-second-person-subjunctive":"să neutralizați","plural-present-subjunctive-third-person":"să neutralizeze","imperative-second-person-singular":"neutralizează","imperative-plural-second-person":"neutralizați","imperative-negative-second-person-singular":"nu neutraliza","imperative-negative-plural-second-person":"nu neutralizați"}},{"word":"neutralizant","pos":"adj","definitions":["neutralizing"],"forms":{"feminine-singular":"neutralizantă","masculine-plural":"neutralizanți","feminine-neuter-plural":"neutralizante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neutralizant","error-unrecognized-form-feminine-indefinite-singular":"neutralizantă","error-unrecognized-form-indefinite-masculine-plural":"neutralizanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neutralizante","definite-error-unrecognized-form-masculine-neuter-singular":"neutralizantul","definite-error-unrecognized-form-feminine-singular":"neutralizanta","definite-error-unrecognized-form-masculine-plural":"neutralizanții","definite-error-unrecognized-form-feminine-neuter-plural":"neutralizantele"}},{"word":"neutralizare","pos":"noun","definitions":["neutralization"],"forms":{"plural":"neutralizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"neutralizare","accusative-definite-nominative-singular":"neutralizarea","accusative-indefinite-nominative-plural":"neutralizări","accusative-definite-nominative-plural":"neutralizările","dative-genitive-indefinite-singular":"neutralizări","dative-definite-genitive-singular":"neutralizării","dative-genitive-indefinite-plural":"neutralizări","dative-definite-genitive-plural":"neutralizărilor","singular-vocative":"neutralizare","plural-vocative":"neutralizărilor"}},{"word":"neutralizat","pos":"adj","definitions":["neutralised"],"pronunciation":"/ne.u.tra.li.ˈzat/","forms":{"feminine-singular":"neutralizată","masculine-plural":"neutralizați","feminine-neuter-plural":"neutralizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neutralizat","error-unrecognized-form-feminine-indefinite-singular":"neutralizată","error-unrecognized-form-indefinite-masculine-plural":"neutralizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neutralizate","definite-error-unrecognized-form-masculine-neuter-singular":"neutralizatul","definite-error-unrecognized-form-feminine-singular":"neutralizata","definite-error-unrecognized-form-masculine-plural":"neutralizații","definite-error-unrecognized-form-feminine-neuter-plural":"neutralizatele"}},{"word":"neutralizat","pos":"verb","definitions":["past participle of neutraliza"],"pronunciation":"/ne.u.tra.li.ˈzat/","forms":{"participle-past":"of neutraliza"}},{"word":"neutralizație","pos":"noun","definitions":["neutralization"],"forms":{"plural":"neutralizații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neutralizație","accusative-definite-nominative-singular":"neutralizația","accusative-indefinite-nominative-plural":"neutralizații","accusative-definite-nominative-plural":"neutralizațiile","dative-genitive-indefinite-singular":"neutralizații","dative-definite-genitive-singular":"neutralizației","dative-genitive-indefinite-plural":"neutralizații","dative-definite-genitive-plural":"neutralizațiilor","singular-vocative":"neutralizație","plural-vocative":"neutralizațiilor"}},{"word":"neutre","pos":"adj","definitions":["feminine/neuter plural nominative/accusative of neutru"],"pronunciation":"[neˈu.tre]"},{"word":"neutri","pos":"adj","definitions":["nominative/accusative masculine plural of neutru"],"pronunciation":"[neˈu.tri]"},{"word":"neutrino","pos":"noun","definitions":["neutrino"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"neutrino","accusative-definite-nominative":"neutrinoul","dative-genitive-indefinite":"neutrino","dative-definite-genitive":"neutrinoului","vocative":"neutrinoule"}},{"word":"neutrofil","pos":"adj","definitions":["neutrophile"],"forms":{"feminine-singular":"neutrofilă","masculine-plural":"neutrofili","feminine-neuter-plural":"neutrofile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neutrofil","error-unrecognized-form-feminine-indefinite-singular":"neutrofilă","error-unrecognized-form-indefinite-masculine-plural":"neutrofili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neutrofile","definite-error-unrecognized-form-masculine-neuter-singular":"neutrofilul","definite-error-unrecognized-form-feminine-singular":"neutrofila","definite-error-unrecognized-form-masculine-plural":"neutrofilii","definite-error-unrecognized-form-feminine-neuter-plural":"neutrofilele"}},{"word":"neutrofilie","pos":"noun","definitions":["neutrophilia"],"forms":{"plural":"neutrofilii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"neutrofilie","accusative-definite-nominative-singular":"neutrofilia","accusative-indefinite-nominative-plural":"neutrofilii","accusative-definite-nominative-plural":"neutrofiliile","dative-genitive-indefinite-singular":"neutrofilii","dative-definite-genitive-singular":"neutrofiliei","dative-genitive-indefinite-plural":"neutrofilii","dative-definite-genitive-plural":"neutrofiliilor","singular-vocative":"neutrofilie","plural-vocative":"neutrofiliilor"}},{"word":"neutron","pos":"noun","definitions":["neutron"],"forms":{"plural":"neutroni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"neutron","accusative-definite-nominative-singular":"neutronul","accusative-indefinite-nominative-plural":"neutroni","accusative-definite-nominative-plural":"neutronii","dative-genitive-indefinite-singular":"neutron","dative-definite-genitive-singular":"neutronului","dative-genitive-indefinite-plural":"neutroni","dative-definite-genitive-plural":"neutronilor","singular-vocative":"neutronule","plural-vocative":"neutronilor"}},{"word":"neutronic","pos":"adj","definitions":["neutronic"],"forms":{"feminine-singular":"neutronică","masculine-plural":"neutronici","feminine-neuter-plural":"neutronice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neutronic","error-unrecognized-form-feminine-indefinite-singular":"neutronică","error-unrecognized-form-indefinite-masculine-plural":"neutronici","error-unrecognized-form-feminine-indefinite-neuter-plural":"neutronice","definite-error-unrecognized-form-masculine-neuter-singular":"neutronicul","definite-error-unrecognized-form-feminine-singular":"neutronica","definite-error-unrecognized-form-masculine-plural":"neutronicii","definite-error-unrecognized-form-feminine-neuter-plural":"neutronicele"}},{"word":"neutru","pos":"adj","definitions":["neutral, unaligned","neutral","neuter"],"pronunciation":"/neˈu.tru/","forms":{"feminine-singular":"neutră","masculine-plural":"neutri","feminine-neuter-plural":"neutre","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neutru","error-unrecognized-form-feminine-indefinite-singular":"neutră","error-unrecognized-form-indefinite-masculine-plural":"neutri","error-unrecognized-form-feminine-indefinite-neuter-plural":"neutre","definite-error-unrecognized-form-masculine-neuter-singular":"neutrul","definite-error-unrecognized-form-feminine-singular":"neutra","definite-error-unrecognized-form-masculine-plural":"neutrii","definite-error-unrecognized-form-feminine-neuter-plural":"neutrele"}},{"word":"neuzat","pos":"adj","definitions":["unused"],"forms":{"feminine-singular":"neuzată","masculine-plural":"neuzați","feminine-neuter-plural":"neuzate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neuzat","error-unrecognized-form-feminine-indefinite-singular":"neuzată","error-unrecognized-form-indefinite-masculine-plural":"neuzați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neuzate","definite-error-unrecognized-form-masculine-neuter-singular":"neuzatul","definite-error-unrecognized-form-feminine-singular":"neuzata","definite-error-unrecognized-form-masculine-plural":"neuzații","definite-error-unrecognized-form-feminine-neuter-plural":"neuzatele"}},{"word":"neuzitat","pos":"adj","definitions":["unusual"],"forms":{"feminine-singular":"neuzitată","masculine-plural":"neuzitați","feminine-neuter-plural":"neuzitate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neuzitat","error-unrecognized-form-feminine-indefinite-singular":"neuzitată","error-unrecognized-form-indefinite-masculine-plural":"neuzitați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neuzitate","definite-error-unrecognized-form-masculine-neuter-singular":"neuzitatul","definite-error-unrecognized-form-feminine-singular":"neuzitata","definite-error-unrecognized-form-masculine-plural":"neuzitații","definite-error-unrecognized-form-feminine-neuter-plural":"neuzitatele"}},{"word":"nev","pos":"noun","definitions":["naevus"],"forms":{"plural":"nevi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nev","accusative-definite-nominative-singular":"nevul","accusative-indefinite-nominative-plural":"nevi","accusative-definite-nominative-plural":"nevii","dative-genitive-indefinite-singular":"nev","dative-definite-genitive-singular":"nevului","dative-genitive-indefinite-plural":"nevi","dative-definite-genitive-plural":"nevilor","singular-vocative":"nevule","plural-vocative":"nevilor"}},{"word":"nevaccinat","pos":"adj","definitions":["unvaccinated"],"forms":{"feminine-singular":"nevaccinată","masculine-plural":"nevaccinați","feminine-neuter-plural":"nevaccinate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevaccinat","error-unrecognized-form-feminine-indefinite-singular":"nevaccinată","error-unrecognized-form-indefinite-masculine-plural":"nevaccinați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevaccinate","definite-error-unrecognized-form-masculine-neuter-singular":"nevaccinatul","definite-error-unrecognized-form-feminine-singular":"nevaccinata","definite-error-unrecognized-form-masculine-plural":"nevaccinații","definite-error-unrecognized-form-feminine-neuter-plural":"nevaccinatele"}},{"word":"nevalorificat","pos":"adj","definitions":["untapped (resource)"],"forms":{"feminine-singular":"nevalorificată","masculine-plural":"nevalorificați","feminine-neuter-plural":"nevalorificate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevalorificat","error-unrecognized-form-feminine-indefinite-singular":"nevalorificată","error-unrecognized-form-indefinite-masculine-plural":"nevalorificați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevalorificate","definite-error-unrecognized-form-masculine-neuter-singular":"nevalorificatul","definite-error-unrecognized-form-feminine-singular":"nevalorificata","definite-error-unrecognized-form-masculine-plural":"nevalorificații","definite-error-unrecognized-form-feminine-neuter-plural":"nevalorificatele"}},{"word":"nevârstnic","pos":"adj","definitions":["young"],"forms":{"feminine-singular":"nevârstnică","masculine-plural":"nevârstnici","feminine-neuter-plural":"nevârstnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevârstnic","error-unrecognized-form-feminine-indefinite-singular":"nevârstnică","error-unrecognized-form-indefinite-masculine-plural":"nevârstnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevârstnice","definite-error-unrecognized-form-masculine-neuter-singular":"nevârstnicul","definite-error-unrecognized-form-feminine-singular":"nevârstnica","definite-error-unrecognized-form-masculine-plural":"nevârstnicii","definite-error-unrecognized-form-feminine-neuter-plural":"nevârstnicele"}},{"word":"nevârstnicie","pos":"noun","definitions":["younghood, youth"],"forms":{"plural":"nevârstnicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nevârstnicie","accusative-definite-nominative-singular":"nevârstnicia","accusative-indefinite-nominative-plural":"nevârstnicii","accusative-definite-nominative-plural":"nevârstniciile","dative-genitive-indefinite-singular":"nevârstnicii","dative-definite-genitive-singular":"nevârstniciei","dative-genitive-indefinite-plural":"nevârstnicii","dative-definite-genitive-plural":"nevârstniciilor","singular-vocative":"nevârstnicie","plural-vocative":"nevârstniciilor"}},{"word":"nevasta","pos":"noun","definitions":["definite nominative/accusative singular of nevastă"],"gender":"f"},{"word":"nevastă","pos":"noun","definitions":["bride","wife"],"pronunciation":"/neˈva.stə/","forms":{"plural":"neveste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nevastă","accusative-definite-nominative-singular":"nevasta","accusative-indefinite-nominative-plural":"neveste","accusative-definite-nominative-plural":"nevestele","dative-genitive-indefinite-singular":"neveste","dative-definite-genitive-singular":"nevestei","dative-genitive-indefinite-plural":"neveste","dative-definite-genitive-plural":"nevestelor","singular-vocative":"nevastă","plural-vocative":"nevestelor"}},{"word":"nevăstucă","pos":"noun","definitions":["diminutive of nevastă"],"forms":{"plural":"nevăstuci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"nevăstucă","accusative-definite-nominative-singular":"nevăstuca","accusative-indefinite-nominative-plural":"nevăstuci","accusative-definite-nominative-plural":"nevăstucile","dative-genitive-indefinite-singular":"nevăstuci","dative-definite-genitive-singular":"nevăstucii","dative-genitive-indefinite-plural":"nevăstuci","dative-definite-genitive-plural":"nevăstucilor","singular-vocative":"nevăstucă","plural-vocative":"nevăstucilor"}},{"word":"nevăstuică","pos":"noun","definitions":["weasel","ferret"],"pronunciation":"/ne.vəsˈtuj.kə/","forms":{"plural":"nevăstuici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"nevăstuică","accusative-definite-nominative-singular":"nevăstuica","accusative-indefinite-nominative-plural":"nevăstuici","accusative-definite-nominative-plural":"nevăstuicile","dative-genitive-indefinite-singular":"nevăstuici","dative-definite-genitive-singular":"nevăstuicii","dative-genitive-indefinite-plural":"nevăstuici","dative-definite-genitive-plural":"nevăstuicilor","singular-vocative":"nevăstuică","plural-vocative":"nevăstuicilor"}},{"word":"nevăstuie","pos":"noun","definitions":["diminutive of nevastă"],"forms":{"plural":"nevăstui","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"nevăstuie","accusative-definite-nominative-singular":"nevăstuia","accusative-indefinite-nominative-plural":"nevăstui","accusative-definite-nominative-plural":"nevăstuile","dative-genitive-indefinite-singular":"nevăstui","dative-definite-genitive-singular":"nevăstuii","dative-genitive-indefinite-plural":"nevăstui","dative-definite-genitive-plural":"nevăstuilor","singular-vocative":"nevăstuie","plural-vocative":"nevăstuilor"}},{"word":"nevăstuță","pos":"noun","definitions":["diminutive of nevastă"],"forms":{"plural":"nevăstuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nevăstuță","accusative-definite-nominative-singular":"nevăstuța","accusative-indefinite-nominative-plural":"nevăstuțe","accusative-definite-nominative-plural":"nevăstuțele","dative-genitive-indefinite-singular":"nevăstuțe","dative-definite-genitive-singular":"nevăstuței","dative-genitive-indefinite-plural":"nevăstuțe","dative-definite-genitive-plural":"nevăstuțelor","singular-vocative":"nevăstuță","plural-vocative":"nevăstuțelor"}},{"word":"nevătămat","pos":"adj","definitions":["unharmed"],"forms":{"feminine-singular":"nevătămată","masculine-plural":"nevătămați","feminine-neuter-plural":"nevătămate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevătămat","error-unrecognized-form-feminine-indefinite-singular":"nevătămată","error-unrecognized-form-indefinite-masculine-plural":"nevătămați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevătămate","definite-error-unrecognized-form-masculine-neuter-singular":"nevătămatul","definite-error-unrecognized-form-feminine-singular":"nevătămata","definite-error-unrecognized-form-masculine-plural":"nevătămații","definite-error-unrecognized-form-feminine-neuter-plural":"nevătămatele"}},{"word":"nevătămător","pos":"adj","definitions":["harmless, innocuous"],"forms":{"feminine-singular":"nevătămătoare","masculine-plural":"nevătămători","feminine-neuter-plural":"nevătămătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevătămător","error-unrecognized-form-feminine-indefinite-singular":"nevătămătoare","error-unrecognized-form-indefinite-masculine-plural":"nevătămători","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevătămătoare","definite-error-unrecognized-form-masculine-neuter-singular":"nevătămătorul","definite-error-unrecognized-form-feminine-singular":"nevătămătoarea","definite-error-unrecognized-form-masculine-plural":"nevătămătorii","definite-error-unrecognized-form-feminine-neuter-plural":"nevătămătoarele"}},{"word":"Nevățu","pos":"name","definitions":["a village in Balta, Mehedinți County, Romania"],"gender":"m"},{"word":"nevăzătoare","pos":"noun","definitions":["female equivalent of nevăzător"],"forms":{"plural":"nevăzătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"nevăzătoare","accusative-definite-nominative-singular":"nevăzătoarea","accusative-indefinite-nominative-plural":"nevăzătoare","accusative-definite-nominative-plural":"nevăzătoarele","dative-genitive-indefinite-singular":"nevăzătoare","dative-definite-genitive-singular":"nevăzătoarei","dative-genitive-indefinite-plural":"nevăzătoare","dative-definite-genitive-plural":"nevăzătoarelor","singular-vocative":"nevăzătoare","plural-vocative":"nevăzătoarelor"}},{"word":"nevăzător","pos":"adj","definitions":["blind"],"pronunciation":"/ne.və.zəˈtor/","forms":{"feminine-singular":"nevăzătoare","masculine-plural":"nevăzători","feminine-neuter-plural":"nevăzătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevăzător","error-unrecognized-form-feminine-indefinite-singular":"nevăzătoare","error-unrecognized-form-indefinite-masculine-plural":"nevăzători","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevăzătoare","definite-error-unrecognized-form-masculine-neuter-singular":"nevăzătorul","definite-error-unrecognized-form-feminine-singular":"nevăzătoarea","definite-error-unrecognized-form-masculine-plural":"nevăzătorii","definite-error-unrecognized-form-feminine-neuter-plural":"nevăzătoarele"}},{"word":"nevăzător","pos":"noun","definitions":["blind man"],"pronunciation":"/ne.və.zəˈtor/","forms":{"plural":"nevăzători","feminine":"equivalent nevăzătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nevăzător","accusative-definite-nominative-singular":"nevăzătorul","accusative-indefinite-nominative-plural":"nevăzători","accusative-definite-nominative-plural":"nevăzătorii","dative-genitive-indefinite-singular":"nevăzător","dative-definite-genitive-singular":"nevăzătorului","dative-genitive-indefinite-plural":"nevăzători","dative-definite-genitive-plural":"nevăzătorilor","singular-vocative":"nevăzătorule","plural-vocative":"nevăzătorilor"}},{"word":"nevăzut","pos":"adj","definitions":["unseen"],"pronunciation":"[ne.vəˈzut]","examples":[{"ro":"o audiție pe nevăzute","en":"a blind audition"}],"forms":{"feminine-singular":"nevăzută","masculine-plural":"nevăzuți","feminine-neuter-plural":"nevăzute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevăzut","error-unrecognized-form-feminine-indefinite-singular":"nevăzută","error-unrecognized-form-indefinite-masculine-plural":"nevăzuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevăzute","definite-error-unrecognized-form-masculine-neuter-singular":"nevăzutul","definite-error-unrecognized-form-feminine-singular":"nevăzuta","definite-error-unrecognized-form-masculine-plural":"nevăzuții","definite-error-unrecognized-form-feminine-neuter-plural":"nevăzutele"}},{"word":"nevăzut","pos":"verb","definitions":["negative past participle of vedea"],"pronunciation":"[ne.vəˈzut]"},{"word":"Nevăzutu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nevăzutu"}},{"word":"nevedenie","pos":"noun","definitions":["envy"],"forms":{"plural":"nevedenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nevedenie","accusative-definite-nominative-singular":"nevedenia","accusative-indefinite-nominative-plural":"nevedenii","accusative-definite-nominative-plural":"nevedeniile","dative-genitive-indefinite-singular":"nevedenii","dative-definite-genitive-singular":"nevedeniei","dative-genitive-indefinite-plural":"nevedenii","dative-definite-genitive-plural":"nevedeniilor","singular-vocative":"nevedenie","plural-vocative":"nevedeniilor"}},{"word":"nevedere","pos":"noun","definitions":["blindness"],"forms":{"plural":"nevederi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nevedere","accusative-definite-nominative-singular":"nevederea","accusative-indefinite-nominative-plural":"nevederi","accusative-definite-nominative-plural":"nevederile","dative-genitive-indefinite-singular":"nevederi","dative-definite-genitive-singular":"nevederii","dative-genitive-indefinite-plural":"nevederi","dative-definite-genitive-plural":"nevederilor","singular-vocative":"nevedere","plural-vocative":"nevederilor"}},{"word":"nevedi","pos":"verb","definitions":["alternative form of năvădi"],"forms":{"canonical":"a nevedi 4th conjugation","present-singular-third-person":"nevedește","participle-past":"nevedit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nevedi","gerund":"nevedind","first-person-indicative-present-singular":"nevedesc","indicative-present-second-person-singular":"nevedești","indicative-present-singular-third-person":"nevedește","first-person-indicative-plural-present":"nevedim","indicative-plural-present-second-person":"nevediți","indicative-plural-present-third-person":"nevedesc","first-person-imperfect-indicative-singular":"nevedeam","imperfect-indicative-second-person-singular":"nevedeai","imperfect-indicative-singular-third-person":"nevedea","first-person-imperfect-indicative-plural":"nevedeam","imperfect-indicative-plural-second-person":"nevedeați","imperfect-indicative-plural-third-person":"nevedeau","first-person-indicative-perfect-singular":"nevedii","indicative-perfect-second-person-singular":"nevediși","indicative-perfect-singular-third-person":"nevedi","first-person-indicative-perfect-plural":"nevedirăm","indicative-perfect-plural-second-person":"nevedirăți","indicative-perfect-plural-third-person":"nevediră","first-person-indicative-pluperfect-singular":"nevedisem","indicative-pluperfect-second-person-singular":"nevediseși","indicative-pluperfect-singular-third-person":"nevedise","first-person-indicative-pluperfect-plural":"nevediserăm","indicative-pluperfect-plural-second-person":"nevediserăți","indicative-pluperfect-plural-third-person":"nevediseră","first-person-present-singular-subjunctive":"să nevedesc","present-second-person-singular-subjunctive":"să nevedești","present-singular-subjunctive-third-person":"să nevedească","first-person-plural-present-subjunctive":"să nevedim","plural-present-second-person-subjunctive":"să nevediți","plural-present-subjunctive-third-person":"să nevedească","imperative-second-person-singular":"nevedește","imperative-plural-second-person":"nevediți","imperative-negative-second-person-singular":"nu nevedi","imperative-negative-plural-second-person":"nu nevediți"}},{"word":"nevenovenie","pos":"noun","definitions":["innocence"],"forms":{"plural":"nevenovenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nevenovenie","accusative-definite-nominative-singular":"nevenovenia","accusative-indefinite-nominative-plural":"nevenovenii","accusative-definite-nominative-plural":"nevenoveniile","dative-genitive-indefinite-singular":"nevenovenii","dative-definite-genitive-singular":"nevenoveniei","dative-genitive-indefinite-plural":"nevenovenii","dative-definite-genitive-plural":"nevenoveniilor","singular-vocative":"nevenovenie","plural-vocative":"nevenoveniilor"}},{"word":"neverde","pos":"adj","definitions":["nongreen"],"forms":{"masculine-plural":"neverzi","feminine-neuter-plural":"neverde","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neverde","error-unrecognized-form-feminine-indefinite-singular":"neverde","error-unrecognized-form-indefinite-masculine-plural":"neverzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"neverde","definite-error-unrecognized-form-masculine-neuter-singular":"neverdele","definite-error-unrecognized-form-feminine-singular":"neverdea","definite-error-unrecognized-form-masculine-plural":"neverzii","definite-error-unrecognized-form-feminine-neuter-plural":"neverdele"}},{"word":"neverosimil","pos":"adj","definitions":["improbable"],"forms":{"feminine-singular":"neverosimilă","masculine-plural":"neverosimili","feminine-neuter-plural":"neverosimile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neverosimil","error-unrecognized-form-feminine-indefinite-singular":"neverosimilă","error-unrecognized-form-indefinite-masculine-plural":"neverosimili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neverosimile","definite-error-unrecognized-form-masculine-neuter-singular":"neverosimilul","definite-error-unrecognized-form-feminine-singular":"neverosimila","definite-error-unrecognized-form-masculine-plural":"neverosimilii","definite-error-unrecognized-form-feminine-neuter-plural":"neverosimilele"}},{"word":"nevertebrat","pos":"noun","definitions":["invertebrate"],"forms":{"plural":"nevertebrați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nevertebrat","accusative-definite-nominative-singular":"nevertebratul","accusative-indefinite-nominative-plural":"nevertebrați","accusative-definite-nominative-plural":"nevertebrații","dative-genitive-indefinite-singular":"nevertebrat","dative-definite-genitive-singular":"nevertebratului","dative-genitive-indefinite-plural":"nevertebrați","dative-definite-genitive-plural":"nevertebraților","singular-vocative":"nevertebratule","plural-vocative":"nevertebraților"}},{"word":"nevertebrată","pos":"noun","definitions":["female equivalent of nevertebrat"],"forms":{"plural":"nevertebrate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nevertebrată","accusative-definite-nominative-singular":"nevertebrata","accusative-indefinite-nominative-plural":"nevertebrate","accusative-definite-nominative-plural":"nevertebratele","dative-genitive-indefinite-singular":"nevertebrate","dative-definite-genitive-singular":"nevertebratei","dative-genitive-indefinite-plural":"nevertebrate","dative-definite-genitive-plural":"nevertebratelor","singular-vocative":"nevertebrată","plural-vocative":"nevertebratelor"}},{"word":"neveste","pos":"noun","definitions":["plural of nevastă"]},{"word":"nevestea","pos":"noun","definitions":["diminutive of nevastă"],"forms":{"plural":"nevestele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"nevestea","accusative-definite-nominative-singular":"nevesteaua","accusative-indefinite-nominative-plural":"nevestele","accusative-definite-nominative-plural":"nevestelele","dative-genitive-indefinite-singular":"nevestele","dative-definite-genitive-singular":"nevestelei","dative-genitive-indefinite-plural":"nevestele","dative-definite-genitive-plural":"nevestelelor","singular-vocative":"nevestea","plural-vocative":"nevestelelor"}},{"word":"Nevesteasca","pos":"name","definitions":["a village in Podenii Noi, Prahova County, Romania"],"gender":"f"},{"word":"neveștejit","pos":"adj","definitions":["unwithered"],"forms":{"feminine-singular":"neveștejită","masculine-plural":"neveștejiți","feminine-neuter-plural":"neveștejite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neveștejit","error-unrecognized-form-feminine-indefinite-singular":"neveștejită","error-unrecognized-form-indefinite-masculine-plural":"neveștejiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"neveștejite","definite-error-unrecognized-form-masculine-neuter-singular":"neveștejitul","definite-error-unrecognized-form-feminine-singular":"neveștejita","definite-error-unrecognized-form-masculine-plural":"neveștejiții","definite-error-unrecognized-form-feminine-neuter-plural":"neveștejitele"}},{"word":"nevestesc","pos":"adj","definitions":["wifely"],"forms":{"feminine-singular":"nevestească","plural":"nevestești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevestesc","error-unrecognized-form-feminine-indefinite-singular":"nevestească","error-unrecognized-form-indefinite-masculine-plural":"nevestești","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevestești","definite-error-unrecognized-form-masculine-neuter-singular":"nevestescul","definite-error-unrecognized-form-feminine-singular":"nevesteasca","definite-error-unrecognized-form-masculine-plural":"nevesteștii","definite-error-unrecognized-form-feminine-neuter-plural":"nevesteștile"}},{"word":"nevesti","pos":"verb","definitions":["to marry"],"forms":{"canonical":"a nevesti 4th conjugation","present-singular-third-person":"nevestește","participle-past":"nevestit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nevesti","gerund":"nevestind","first-person-indicative-present-singular":"nevestesc","indicative-present-second-person-singular":"nevestești","indicative-present-singular-third-person":"nevestește","first-person-indicative-plural-present":"nevestim","indicative-plural-present-second-person":"nevestiți","indicative-plural-present-third-person":"nevestesc","first-person-imperfect-indicative-singular":"nevesteam","imperfect-indicative-second-person-singular":"nevesteai","imperfect-indicative-singular-third-person":"nevestea","first-person-imperfect-indicative-plural":"nevesteam","imperfect-indicative-plural-second-person":"nevesteați","imperfect-indicative-plural-third-person":"nevesteau","first-person-indicative-perfect-singular":"nevestii","indicative-perfect-second-person-singular":"nevestiși","indicative-perfect-singular-third-person":"nevesti","first-person-indicative-perfect-plural":"nevestirăm","indicative-perfect-plural-second-person":"nevestirăți","indicative-perfect-plural-third-person":"nevestiră","first-person-indicative-pluperfect-singular":"nevestisem","indicative-pluperfect-second-person-singular":"nevestiseși","indicative-pluperfect-singular-third-person":"nevestise","first-person-indicative-pluperfect-plural":"nevestiserăm","indicative-pluperfect-plural-second-person":"nevestiserăți","indicative-pluperfect-plural-third-person":"nevestiseră","first-person-present-singular-subjunctive":"să nevestesc","present-second-person-singular-subjunctive":"să nevestești","present-singular-subjunctive-third-person":"să nevestească","first-person-plural-present-subjunctive":"să nevestim","plural-present-second-person-subjunctive":"să nevestiți","plural-present-subjunctive-third-person":"să nevestească","imperative-second-person-singular":"nevestește","imperative-plural-second-person":"nevestiți","imperative-negative-second-person-singular":"nu nevesti","imperative-negative-plural-second-person":"nu nevestiți"}},{"word":"nevestică","pos":"noun","definitions":["diminutive of nevastă; small wife"],"forms":{"plural":"nevestici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nevestică","accusative-definite-nominative-singular":"nevestica","accusative-indefinite-nominative-plural":"nevestice","accusative-definite-nominative-plural":"nevesticele","dative-genitive-indefinite-singular":"nevestice","dative-definite-genitive-singular":"nevesticei","dative-genitive-indefinite-plural":"nevestice","dative-definite-genitive-plural":"nevesticelor","singular-vocative":"nevestică","plural-vocative":"nevesticelor"}},{"word":"nevestie","pos":"noun","definitions":["wifedom"],"forms":{"plural":"nevestii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nevestie","accusative-definite-nominative-singular":"nevestia","accusative-indefinite-nominative-plural":"nevestii","accusative-definite-nominative-plural":"nevestiile","dative-genitive-indefinite-singular":"nevestii","dative-definite-genitive-singular":"nevestiei","dative-genitive-indefinite-plural":"nevestii","dative-definite-genitive-plural":"nevestiilor","singular-vocative":"nevestie","plural-vocative":"nevestiilor"}},{"word":"nevestioară","pos":"noun","definitions":["diminutive of nevastă"],"forms":{"plural":"nevestioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nevestioară","accusative-definite-nominative-singular":"nevestioara","accusative-indefinite-nominative-plural":"nevestioare","accusative-definite-nominative-plural":"nevestioarele","dative-genitive-indefinite-singular":"nevestioare","dative-definite-genitive-singular":"nevestioarei","dative-genitive-indefinite-plural":"nevestioare","dative-definite-genitive-plural":"nevestioarelor","singular-vocative":"nevestioară","plural-vocative":"nevestioarelor"}},{"word":"nevestire","pos":"noun","definitions":["marriage"],"forms":{"plural":"nevestiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nevestire","accusative-definite-nominative-singular":"nevestirea","accusative-indefinite-nominative-plural":"nevestiri","accusative-definite-nominative-plural":"nevestirile","dative-genitive-indefinite-singular":"nevestiri","dative-definite-genitive-singular":"nevestirii","dative-genitive-indefinite-plural":"nevestiri","dative-definite-genitive-plural":"nevestirilor","singular-vocative":"nevestire","plural-vocative":"nevestirilor"}},{"word":"nevestit","pos":"noun","definitions":["engagement","marriage"],"forms":{"plural":"nevestituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nevestit","accusative-definite-nominative-singular":"nevestitul","accusative-indefinite-nominative-plural":"nevestituri","accusative-definite-nominative-plural":"nevestiturile","dative-genitive-indefinite-singular":"nevestit","dative-definite-genitive-singular":"nevestitului","dative-genitive-indefinite-plural":"nevestituri","dative-definite-genitive-plural":"nevestiturilor","singular-vocative":"nevestitule","plural-vocative":"nevestiturilor"}},{"word":"nevestit","pos":"verb","definitions":["past participle of nevesti"],"forms":{"participle-past":"of nevesti"}},{"word":"neveu","pos":"noun","definitions":["névé"],"forms":{"plural":"neveuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"neveu","accusative-definite-nominative-singular":"neveul","accusative-indefinite-nominative-plural":"neveuri","accusative-definite-nominative-plural":"neveurile","dative-genitive-indefinite-singular":"neveu","dative-definite-genitive-singular":"neveului","dative-genitive-indefinite-plural":"neveuri","dative-definite-genitive-plural":"neveurilor","singular-vocative":"neveule","plural-vocative":"neveurilor"}},{"word":"nevezie","pos":"noun","definitions":["envy"],"forms":{"plural":"nevezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nevezie","accusative-definite-nominative-singular":"nevezia","accusative-indefinite-nominative-plural":"nevezii","accusative-definite-nominative-plural":"neveziile","dative-genitive-indefinite-singular":"nevezii","dative-definite-genitive-singular":"neveziei","dative-genitive-indefinite-plural":"nevezii","dative-definite-genitive-plural":"neveziilor","singular-vocative":"nevezie","plural-vocative":"neveziilor"}},{"word":"neviabil","pos":"adj","definitions":["inviable"],"forms":{"feminine-singular":"neviabilă","masculine-plural":"neviabili","feminine-neuter-plural":"neviabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neviabil","error-unrecognized-form-feminine-indefinite-singular":"neviabilă","error-unrecognized-form-indefinite-masculine-plural":"neviabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neviabile","definite-error-unrecognized-form-masculine-neuter-singular":"neviabilul","definite-error-unrecognized-form-feminine-singular":"neviabila","definite-error-unrecognized-form-masculine-plural":"neviabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neviabilele"}},{"word":"neviață","pos":"noun","definitions":["death"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"neviață","accusative-definite-nominative":"neviața","dative-genitive-indefinite":"neviațe","dative-definite-genitive":"neviaței","vocative":"neviață"}},{"word":"neviciat","pos":"adj","definitions":["uncorrupted"],"forms":{"feminine-singular":"neviciată","masculine-plural":"neviciați","feminine-neuter-plural":"neviciate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neviciat","error-unrecognized-form-feminine-indefinite-singular":"neviciată","error-unrecognized-form-indefinite-masculine-plural":"neviciați","error-unrecognized-form-feminine-indefinite-neuter-plural":"neviciate","definite-error-unrecognized-form-masculine-neuter-singular":"neviciatul","definite-error-unrecognized-form-feminine-singular":"neviciata","definite-error-unrecognized-form-masculine-plural":"neviciații","definite-error-unrecognized-form-feminine-neuter-plural":"neviciatele"}},{"word":"nevindecabil","pos":"adj","definitions":["incurable"],"forms":{"feminine-singular":"nevindecabilă","masculine-plural":"nevindecabili","feminine-neuter-plural":"nevindecabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevindecabil","error-unrecognized-form-feminine-indefinite-singular":"nevindecabilă","error-unrecognized-form-indefinite-masculine-plural":"nevindecabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevindecabile","definite-error-unrecognized-form-masculine-neuter-singular":"nevindecabilul","definite-error-unrecognized-form-feminine-singular":"nevindecabila","definite-error-unrecognized-form-masculine-plural":"nevindecabilii","definite-error-unrecognized-form-feminine-neuter-plural":"nevindecabilele"}},{"word":"nevindecat","pos":"adj","definitions":["unhealed"],"forms":{"feminine-singular":"nevindecată","masculine-plural":"nevindecați","feminine-neuter-plural":"nevindecate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevindecat","error-unrecognized-form-feminine-indefinite-singular":"nevindecată","error-unrecognized-form-indefinite-masculine-plural":"nevindecați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevindecate","definite-error-unrecognized-form-masculine-neuter-singular":"nevindecatul","definite-error-unrecognized-form-feminine-singular":"nevindecata","definite-error-unrecognized-form-masculine-plural":"nevindecații","definite-error-unrecognized-form-feminine-neuter-plural":"nevindecatele"}},{"word":"nevinovat","pos":"adj","definitions":["innocent"],"forms":{"feminine-singular":"nevinovată","masculine-plural":"nevinovați","feminine-neuter-plural":"nevinovate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevinovat","error-unrecognized-form-feminine-indefinite-singular":"nevinovată","error-unrecognized-form-indefinite-masculine-plural":"nevinovați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevinovate","definite-error-unrecognized-form-masculine-neuter-singular":"nevinovatul","definite-error-unrecognized-form-feminine-singular":"nevinovata","definite-error-unrecognized-form-masculine-plural":"nevinovații","definite-error-unrecognized-form-feminine-neuter-plural":"nevinovatele"}},{"word":"nevinovată","pos":"noun","definitions":["female equivalent of nevinovat"],"forms":{"plural":"nevinovate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nevinovată","accusative-definite-nominative-singular":"nevinovata","accusative-indefinite-nominative-plural":"nevinovate","accusative-definite-nominative-plural":"nevinovatele","dative-genitive-indefinite-singular":"nevinovate","dative-definite-genitive-singular":"nevinovatei","dative-genitive-indefinite-plural":"nevinovate","dative-definite-genitive-plural":"nevinovatelor","singular-vocative":"nevinovată","plural-vocative":"nevinovatelor"}},{"word":"nevinovăție","pos":"noun","definitions":["innocence"],"forms":{"plural":"nevinovății","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nevinovăție","accusative-definite-nominative-singular":"nevinovăția","accusative-indefinite-nominative-plural":"nevinovății","accusative-definite-nominative-plural":"nevinovățiile","dative-genitive-indefinite-singular":"nevinovății","dative-definite-genitive-singular":"nevinovăției","dative-genitive-indefinite-plural":"nevinovății","dative-definite-genitive-plural":"nevinovățiilor","singular-vocative":"nevinovăție","plural-vocative":"nevinovățiilor"}},{"word":"neviolabil","pos":"adj","definitions":["inviolable"],"forms":{"feminine-singular":"neviolabilă","masculine-plural":"neviolabili","feminine-neuter-plural":"neviolabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"neviolabil","error-unrecognized-form-feminine-indefinite-singular":"neviolabilă","error-unrecognized-form-indefinite-masculine-plural":"neviolabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"neviolabile","definite-error-unrecognized-form-masculine-neuter-singular":"neviolabilul","definite-error-unrecognized-form-feminine-singular":"neviolabila","definite-error-unrecognized-form-masculine-plural":"neviolabilii","definite-error-unrecognized-form-feminine-neuter-plural":"neviolabilele"}},{"word":"neviolabilitate","pos":"noun","definitions":["inviolability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"neviolabilitate","accusative-definite-nominative":"neviolabilitatea","dative-genitive-indefinite":"neviolabilități","dative-definite-genitive":"neviolabilității","vocative":"-"}},{"word":"neviscuță","pos":"noun","definitions":["diminutive of neviscă"],"forms":{"plural":"neviscuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"neviscuță","accusative-definite-nominative-singular":"neviscuța","accusative-indefinite-nominative-plural":"neviscuțe","accusative-definite-nominative-plural":"neviscuțele","dative-genitive-indefinite-singular":"neviscuțe","dative-definite-genitive-singular":"neviscuței","dative-genitive-indefinite-plural":"neviscuțe","dative-definite-genitive-plural":"neviscuțelor","singular-vocative":"neviscuță","plural-vocative":"neviscuțelor"}},{"word":"nevizibil","pos":"adj","definitions":["invisible"],"forms":{"feminine-singular":"nevizibilă","masculine-plural":"nevizibili","feminine-neuter-plural":"nevizibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevizibil","error-unrecognized-form-feminine-indefinite-singular":"nevizibilă","error-unrecognized-form-indefinite-masculine-plural":"nevizibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevizibile","definite-error-unrecognized-form-masculine-neuter-singular":"nevizibilul","definite-error-unrecognized-form-feminine-singular":"nevizibila","definite-error-unrecognized-form-masculine-plural":"nevizibilii","definite-error-unrecognized-form-feminine-neuter-plural":"nevizibilele"}},{"word":"nevizibilitate","pos":"noun","definitions":["invisibility"],"forms":{"plural":"nevizibilități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nevizibilitate","accusative-definite-nominative-singular":"nevizibilitatea","accusative-indefinite-nominative-plural":"nevizibilități","accusative-definite-nominative-plural":"nevizibilitățile","dative-genitive-indefinite-singular":"nevizibilități","dative-definite-genitive-singular":"nevizibilității","dative-genitive-indefinite-plural":"nevizibilități","dative-definite-genitive-plural":"nevizibilităților","singular-vocative":"nevizibilitate","plural-vocative":"nevizibilităților"}},{"word":"nevod","pos":"noun","definitions":["alternative form of năvod"],"forms":{"plural":"nevoade","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nevod","accusative-definite-nominative-singular":"nevodul","accusative-indefinite-nominative-plural":"nevoade","accusative-definite-nominative-plural":"nevoadele","dative-genitive-indefinite-singular":"nevod","dative-definite-genitive-singular":"nevodului","dative-genitive-indefinite-plural":"nevoade","dative-definite-genitive-plural":"nevoadelor","singular-vocative":"nevodule","plural-vocative":"nevoadelor"}},{"word":"nevoi","pos":"verb","definitions":["to leave no choice, to require, to force (someone)","to necessitate (something)","to take pains, suffer for something","to do one’s best, strive","to get used"],"pronunciation":"/ne.voˈi/","examples":[{"ro":"Suntem nevoiți să creștem prețul abonamentelor.","en":"We are left with no choice but to raise the price of subscriptions."},{"ro":"Prefer un loc de muncă apropiat de casă, ca să nu fiu nevoit să pierd timp pe drum.","en":"I prefer a job close to home, so that I’m not forced to waste time on the commute."},{"ro":"[…]până ce creșterea faptelor și descoperirilor ne va nevoi să maĭ restrângem specialitatea.","en":"[…] until the growth of facts and discoveries will force us to narrow the domain again."}],"forms":{"canonical":"a nevoi 4th conjugation","present-singular-third-person":"nevoiește","participle-past":"nevoit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nevoi","gerund":"nevoind","first-person-indicative-present-singular":"nevoiesc","indicative-present-second-person-singular":"nevoiești","indicative-present-singular-third-person":"nevoiește","first-person-indicative-plural-present":"nevoim","indicative-plural-present-second-person":"nevoiți","indicative-plural-present-third-person":"nevoiesc","first-person-imperfect-indicative-singular":"nevoiam","imperfect-indicative-second-person-singular":"nevoiai","imperfect-indicative-singular-third-person":"nevoia","first-person-imperfect-indicative-plural":"nevoiam","imperfect-indicative-plural-second-person":"nevoiați","imperfect-indicative-plural-third-person":"nevoiau","first-person-indicative-perfect-singular":"nevoii","indicative-perfect-second-person-singular":"nevoiși","indicative-perfect-singular-third-person":"nevoi","first-person-indicative-perfect-plural":"nevoirăm","indicative-perfect-plural-second-person":"nevoirăți","indicative-perfect-plural-third-person":"nevoiră","first-person-indicative-pluperfect-singular":"nevoisem","indicative-pluperfect-second-person-singular":"nevoiseși","indicative-pluperfect-singular-third-person":"nevoise","first-person-indicative-pluperfect-plural":"nevoiserăm","indicative-pluperfect-plural-second-person":"nevoiserăți","indicative-pluperfect-plural-third-person":"nevoiseră","first-person-present-singular-subjunctive":"să nevoiesc","present-second-person-singular-subjunctive":"să nevoiești","present-singular-subjunctive-third-person":"să nevoiască","first-person-plural-present-subjunctive":"să nevoim","plural-present-second-person-subjunctive":"să nevoiți","plural-present-subjunctive-third-person":"să nevoiască","imperative-second-person-singular":"nevoiește","imperative-plural-second-person":"nevoiți","imperative-negative-second-person-singular":"nu nevoi","imperative-negative-plural-second-person":"nu nevoiți"}},{"word":"nevoi","pos":"noun","definitions":["inflection of nevoie (“need”):","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"/neˈvoj/"},{"word":"nevoiaș","pos":"adj","definitions":["destitute"],"forms":{"feminine-singular":"nevoiașă","masculine-plural":"nevoiași","feminine-neuter-plural":"nevoiașe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevoiaș","error-unrecognized-form-feminine-indefinite-singular":"nevoiașă","error-unrecognized-form-indefinite-masculine-plural":"nevoiași","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevoiașe","definite-error-unrecognized-form-masculine-neuter-singular":"nevoiașul","definite-error-unrecognized-form-feminine-singular":"nevoiașa","definite-error-unrecognized-form-masculine-plural":"nevoiașii","definite-error-unrecognized-form-feminine-neuter-plural":"nevoiașele"}},{"word":"nevoiașă","pos":"noun","definitions":["female equivalent of nevoiaș"],"forms":{"plural":"nevoiașe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nevoiașă","accusative-definite-nominative-singular":"nevoiașa","accusative-indefinite-nominative-plural":"nevoiașe","accusative-definite-nominative-plural":"nevoiașele","dative-genitive-indefinite-singular":"nevoiașe","dative-definite-genitive-singular":"nevoiașei","dative-genitive-indefinite-plural":"nevoiașe","dative-definite-genitive-plural":"nevoiașelor","singular-vocative":"nevoiașă","plural-vocative":"nevoiașelor"}},{"word":"nevoiași","pos":"noun","definitions":["plural of nevoiaș"]},{"word":"Nevoie","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nevoie"}},{"word":"nevoie","pos":"noun","definitions":["need, necessity","want, demand"],"pronunciation":"/neˈvo.je/","examples":[{"ro":"Am nevoie de ajutor.","en":"I need help."}],"forms":{"plural":"nevoi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"nevoie","accusative-definite-nominative-singular":"nevoia","accusative-indefinite-nominative-plural":"nevoi","accusative-definite-nominative-plural":"nevoile","dative-genitive-indefinite-singular":"nevoi","dative-definite-genitive-singular":"nevoii","dative-genitive-indefinite-plural":"nevoi","dative-definite-genitive-plural":"nevoilor","singular-vocative":"nevoie","plural-vocative":"nevoilor"}},{"word":"nevoinic","pos":"adj","definitions":["weak, feeble"],"forms":{"feminine-singular":"nevoinică","masculine-plural":"nevoinici","feminine-neuter-plural":"nevoinice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevoinic","error-unrecognized-form-feminine-indefinite-singular":"nevoinică","error-unrecognized-form-indefinite-masculine-plural":"nevoinici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevoinice","definite-error-unrecognized-form-masculine-neuter-singular":"nevoinicul","definite-error-unrecognized-form-feminine-singular":"nevoinica","definite-error-unrecognized-form-masculine-plural":"nevoinicii","definite-error-unrecognized-form-feminine-neuter-plural":"nevoinicele"}},{"word":"nevoinicie","pos":"noun","definitions":["feebleness"],"forms":{"plural":"nevoinicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nevoinicie","accusative-definite-nominative-singular":"nevoinicia","accusative-indefinite-nominative-plural":"nevoinicii","accusative-definite-nominative-plural":"nevoiniciile","dative-genitive-indefinite-singular":"nevoinicii","dative-definite-genitive-singular":"nevoiniciei","dative-genitive-indefinite-plural":"nevoinicii","dative-definite-genitive-plural":"nevoiniciilor","singular-vocative":"nevoinicie","plural-vocative":"nevoiniciilor"}},{"word":"nevoință","pos":"noun","definitions":["need","hardship"],"forms":{"plural":"nevoințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nevoință","accusative-definite-nominative-singular":"nevoința","accusative-indefinite-nominative-plural":"nevoințe","accusative-definite-nominative-plural":"nevoințele","dative-genitive-indefinite-singular":"nevoințe","dative-definite-genitive-singular":"nevoinței","dative-genitive-indefinite-plural":"nevoințe","dative-definite-genitive-plural":"nevoințelor","singular-vocative":"nevoință","plural-vocative":"nevoințelor"}},{"word":"nevointaș","pos":"noun","definitions":["a poor person"],"forms":{"plural":"nevointași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nevointaș","accusative-definite-nominative-singular":"nevointașul","accusative-indefinite-nominative-plural":"nevointași","accusative-definite-nominative-plural":"nevointașii","dative-genitive-indefinite-singular":"nevointaș","dative-definite-genitive-singular":"nevointașului","dative-genitive-indefinite-plural":"nevointași","dative-definite-genitive-plural":"nevointașilor","singular-vocative":"nevointașule","plural-vocative":"nevointașilor"}},{"word":"nevoios","pos":"adj","definitions":["difficult"],"forms":{"feminine-singular":"nevoioasă","masculine-plural":"nevoioși","feminine-neuter-plural":"nevoioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevoios","error-unrecognized-form-feminine-indefinite-singular":"nevoioasă","error-unrecognized-form-indefinite-masculine-plural":"nevoioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevoioase","definite-error-unrecognized-form-masculine-neuter-singular":"nevoiosul","definite-error-unrecognized-form-feminine-singular":"nevoioasa","definite-error-unrecognized-form-masculine-plural":"nevoioșii","definite-error-unrecognized-form-feminine-neuter-plural":"nevoioasele"}},{"word":"nevoit","pos":"adj","definitions":["constrained"],"forms":{"feminine-singular":"nevoită","masculine-plural":"nevoiți","feminine-neuter-plural":"nevoite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevoit","error-unrecognized-form-feminine-indefinite-singular":"nevoită","error-unrecognized-form-indefinite-masculine-plural":"nevoiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevoite","definite-error-unrecognized-form-masculine-neuter-singular":"nevoitul","definite-error-unrecognized-form-feminine-singular":"nevoita","definite-error-unrecognized-form-masculine-plural":"nevoiții","definite-error-unrecognized-form-feminine-neuter-plural":"nevoitele"}},{"word":"nevoit","pos":"verb","definitions":["past participle of nevoi"],"forms":{"participle-past":"of nevoi"}},{"word":"nevoitor","pos":"adj","definitions":["perseverant"],"forms":{"feminine-singular":"nevoitoare","masculine-plural":"nevoitori","feminine-neuter-plural":"nevoitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevoitor","error-unrecognized-form-feminine-indefinite-singular":"nevoitoare","error-unrecognized-form-indefinite-masculine-plural":"nevoitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevoitoare","definite-error-unrecognized-form-masculine-neuter-singular":"nevoitorul","definite-error-unrecognized-form-feminine-singular":"nevoitoarea","definite-error-unrecognized-form-masculine-plural":"nevoitorii","definite-error-unrecognized-form-feminine-neuter-plural":"nevoitoarele"}},{"word":"nevolnic","pos":"adj","definitions":["feeble, weak","helpless"],"forms":{"feminine-singular":"nevolnică","masculine-plural":"nevolnici","feminine-neuter-plural":"nevolnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevolnic","error-unrecognized-form-feminine-indefinite-singular":"nevolnică","error-unrecognized-form-indefinite-masculine-plural":"nevolnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevolnice","definite-error-unrecognized-form-masculine-neuter-singular":"nevolnicul","definite-error-unrecognized-form-feminine-singular":"nevolnica","definite-error-unrecognized-form-masculine-plural":"nevolnicii","definite-error-unrecognized-form-feminine-neuter-plural":"nevolnicele"}},{"word":"nevolnică","pos":"noun","definitions":["female equivalent of nevolnic"],"forms":{"plural":"nevolnice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nevolnică","accusative-definite-nominative-singular":"nevolnica","accusative-indefinite-nominative-plural":"nevolnice","accusative-definite-nominative-plural":"nevolnicele","dative-genitive-indefinite-singular":"nevolnice","dative-definite-genitive-singular":"nevolnicei","dative-genitive-indefinite-plural":"nevolnice","dative-definite-genitive-plural":"nevolnicelor","singular-vocative":"nevolnică","plural-vocative":"nevolnicelor"}},{"word":"nevolnicie","pos":"noun","definitions":["feebleness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"nevolnicie","accusative-definite-nominative":"nevolnicia","dative-genitive-indefinite":"nevolnicii","dative-definite-genitive":"nevolniciei","vocative":"nevolnicie"}},{"word":"nevralgic","pos":"adj","definitions":["neuralgic"],"forms":{"feminine-singular":"nevralgică","masculine-plural":"nevralgici","feminine-neuter-plural":"nevralgice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevralgic","error-unrecognized-form-feminine-indefinite-singular":"nevralgică","error-unrecognized-form-indefinite-masculine-plural":"nevralgici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevralgice","definite-error-unrecognized-form-masculine-neuter-singular":"nevralgicul","definite-error-unrecognized-form-feminine-singular":"nevralgica","definite-error-unrecognized-form-masculine-plural":"nevralgicii","definite-error-unrecognized-form-feminine-neuter-plural":"nevralgicele"}},{"word":"nevralgie","pos":"noun","definitions":["neuralgia"],"forms":{"plural":"nevralgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nevralgie","accusative-definite-nominative-singular":"nevralgia","accusative-indefinite-nominative-plural":"nevralgii","accusative-definite-nominative-plural":"nevralgiile","dative-genitive-indefinite-singular":"nevralgii","dative-definite-genitive-singular":"nevralgiei","dative-genitive-indefinite-plural":"nevralgii","dative-definite-genitive-plural":"nevralgiilor","singular-vocative":"nevralgie","plural-vocative":"nevralgiilor"}},{"word":"nevrâstnic","pos":"adj","definitions":["obsolete form of nevârstnic"],"forms":{"feminine-singular":"nevrâstnică","masculine-plural":"nevrâstnici","feminine-neuter-plural":"nevrâstnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevrâstnic","error-unrecognized-form-feminine-indefinite-singular":"nevrâstnică","error-unrecognized-form-indefinite-masculine-plural":"nevrâstnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevrâstnice","definite-error-unrecognized-form-masculine-neuter-singular":"nevrâstnicul","definite-error-unrecognized-form-feminine-singular":"nevrâstnica","definite-error-unrecognized-form-masculine-plural":"nevrâstnicii","definite-error-unrecognized-form-feminine-neuter-plural":"nevrâstnicele"}},{"word":"nevrax","pos":"noun","definitions":["neuraxis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nevrax","accusative-definite-nominative":"nevraxul","dative-genitive-indefinite":"nevrax","dative-definite-genitive":"nevraxului","vocative":"nevraxule"}},{"word":"nevrectomie","pos":"noun","definitions":["neurectomy"],"forms":{"plural":"nevrectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nevrectomie","accusative-definite-nominative-singular":"nevrectomia","accusative-indefinite-nominative-plural":"nevrectomii","accusative-definite-nominative-plural":"nevrectomiile","dative-genitive-indefinite-singular":"nevrectomii","dative-definite-genitive-singular":"nevrectomiei","dative-genitive-indefinite-plural":"nevrectomii","dative-definite-genitive-plural":"nevrectomiilor","singular-vocative":"nevrectomie","plural-vocative":"nevrectomiilor"}},{"word":"nevrednic","pos":"adj","definitions":["unworthy"],"forms":{"feminine-singular":"nevrednică","masculine-plural":"nevrednici","feminine-neuter-plural":"nevrednice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevrednic","error-unrecognized-form-feminine-indefinite-singular":"nevrednică","error-unrecognized-form-indefinite-masculine-plural":"nevrednici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevrednice","definite-error-unrecognized-form-masculine-neuter-singular":"nevrednicul","definite-error-unrecognized-form-feminine-singular":"nevrednica","definite-error-unrecognized-form-masculine-plural":"nevrednicii","definite-error-unrecognized-form-feminine-neuter-plural":"nevrednicele"}},{"word":"nevrednicie","pos":"noun","definitions":["unworthiness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"nevrednicie","accusative-definite-nominative":"nevrednicia","dative-genitive-indefinite":"nevrednicii","dative-definite-genitive":"nevredniciei","vocative":"nevrednicie"}},{"word":"nevrica","pos":"noun","definitions":["hysteria"],"forms":{"plural":"nevricale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-a","accusative-indefinite-nominative-singular":"nevrica","accusative-definite-nominative-singular":"nevricaua","accusative-indefinite-nominative-plural":"nevricale","accusative-definite-nominative-plural":"nevricalele","dative-genitive-indefinite-singular":"nevricale","dative-definite-genitive-singular":"nevricalei","dative-genitive-indefinite-plural":"nevricale","dative-definite-genitive-plural":"nevricalelor","singular-vocative":"nevrica","plural-vocative":"nevricalelor"}},{"word":"nevricos","pos":"adj","definitions":["neurotic, irritated, hysterical"],"forms":{"feminine-singular":"nevricoasă","masculine-plural":"nevricoși","feminine-neuter-plural":"nevricoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevricos","error-unrecognized-form-feminine-indefinite-singular":"nevricoasă","error-unrecognized-form-indefinite-masculine-plural":"nevricoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevricoase","definite-error-unrecognized-form-masculine-neuter-singular":"nevricosul","definite-error-unrecognized-form-feminine-singular":"nevricoasa","definite-error-unrecognized-form-masculine-plural":"nevricoșii","definite-error-unrecognized-form-feminine-neuter-plural":"nevricoasele"}},{"word":"nevrită","pos":"noun","definitions":["neuritis"],"forms":{"plural":"nevrite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nevrită","accusative-definite-nominative-singular":"nevrita","accusative-indefinite-nominative-plural":"nevrite","accusative-definite-nominative-plural":"nevritele","dative-genitive-indefinite-singular":"nevrite","dative-definite-genitive-singular":"nevritei","dative-genitive-indefinite-plural":"nevrite","dative-definite-genitive-plural":"nevritelor","singular-vocative":"nevrită","plural-vocative":"nevritelor"}},{"word":"nevroglie","pos":"noun","definitions":["neuroglia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"nevroglie","accusative-definite-nominative":"nevroglia","dative-genitive-indefinite":"nevroglii","dative-definite-genitive":"nevrogliei","vocative":"nevroglie"}},{"word":"nevrograf","pos":"noun","definitions":["neurographer"],"forms":{"plural":"nevrografi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nevrograf","accusative-definite-nominative-singular":"nevrograful","accusative-indefinite-nominative-plural":"nevrografi","accusative-definite-nominative-plural":"nevrografii","dative-genitive-indefinite-singular":"nevrograf","dative-definite-genitive-singular":"nevrografului","dative-genitive-indefinite-plural":"nevrografi","dative-definite-genitive-plural":"nevrografilor","singular-vocative":"nevrografule","plural-vocative":"nevrografilor"}},{"word":"nevrografie","pos":"noun","definitions":["neurography"],"forms":{"plural":"nevrografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nevrografie","accusative-definite-nominative-singular":"nevrografia","accusative-indefinite-nominative-plural":"nevrografii","accusative-definite-nominative-plural":"nevrografiile","dative-genitive-indefinite-singular":"nevrografii","dative-definite-genitive-singular":"nevrografiei","dative-genitive-indefinite-plural":"nevrografii","dative-definite-genitive-plural":"nevrografiilor","singular-vocative":"nevrografie","plural-vocative":"nevrografiilor"}},{"word":"nevrom","pos":"noun","definitions":["neuroma"],"forms":{"plural":"nevroame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nevrom","accusative-definite-nominative-singular":"nevromul","accusative-indefinite-nominative-plural":"nevroame","accusative-definite-nominative-plural":"nevroamele","dative-genitive-indefinite-singular":"nevrom","dative-definite-genitive-singular":"nevromului","dative-genitive-indefinite-plural":"nevroame","dative-definite-genitive-plural":"nevroamelor","singular-vocative":"nevromule","plural-vocative":"nevroamelor"}},{"word":"nevropat","pos":"noun","definitions":["neuropath"],"forms":{"plural":"nevropați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nevropat","accusative-definite-nominative-singular":"nevropatul","accusative-indefinite-nominative-plural":"nevropați","accusative-definite-nominative-plural":"nevropații","dative-genitive-indefinite-singular":"nevropat","dative-definite-genitive-singular":"nevropatului","dative-genitive-indefinite-plural":"nevropați","dative-definite-genitive-plural":"nevropaților","singular-vocative":"nevropatule","plural-vocative":"nevropaților"}},{"word":"nevropată","pos":"noun","definitions":["female equivalent of nevropat"],"forms":{"plural":"nevropate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nevropată","accusative-definite-nominative-singular":"nevropata","accusative-indefinite-nominative-plural":"nevropate","accusative-definite-nominative-plural":"nevropatele","dative-genitive-indefinite-singular":"nevropate","dative-definite-genitive-singular":"nevropatei","dative-genitive-indefinite-plural":"nevropate","dative-definite-genitive-plural":"nevropatelor","singular-vocative":"nevropată","plural-vocative":"nevropatelor"}},{"word":"nevropatic","pos":"adj","definitions":["neuropathic"],"forms":{"feminine-singular":"nevropatică","masculine-plural":"nevropatici","feminine-neuter-plural":"nevropatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevropatic","error-unrecognized-form-feminine-indefinite-singular":"nevropatică","error-unrecognized-form-indefinite-masculine-plural":"nevropatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevropatice","definite-error-unrecognized-form-masculine-neuter-singular":"nevropaticul","definite-error-unrecognized-form-feminine-singular":"nevropatica","definite-error-unrecognized-form-masculine-plural":"nevropaticii","definite-error-unrecognized-form-feminine-neuter-plural":"nevropaticele"}},{"word":"nevropatie","pos":"noun","definitions":["neuropathy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"nevropatie","accusative-definite-nominative":"nevropatia","dative-genitive-indefinite":"nevropatii","dative-definite-genitive":"nevropatiei","vocative":"nevropatie"}},{"word":"nevropter","pos":"noun","definitions":["neuroptera"],"forms":{"plural":"nevroptere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nevropter","accusative-definite-nominative-singular":"nevropterul","accusative-indefinite-nominative-plural":"nevroptere","accusative-definite-nominative-plural":"nevropterele","dative-genitive-indefinite-singular":"nevropter","dative-definite-genitive-singular":"nevropterului","dative-genitive-indefinite-plural":"nevroptere","dative-definite-genitive-plural":"nevropterelor","singular-vocative":"nevropterule","plural-vocative":"nevropterelor"}},{"word":"nevrotic","pos":"adj","definitions":["neurotic"],"forms":{"feminine-singular":"nevrotică","masculine-plural":"nevrotici","feminine-neuter-plural":"nevrotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevrotic","error-unrecognized-form-feminine-indefinite-singular":"nevrotică","error-unrecognized-form-indefinite-masculine-plural":"nevrotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevrotice","definite-error-unrecognized-form-masculine-neuter-singular":"nevroticul","definite-error-unrecognized-form-feminine-singular":"nevrotica","definite-error-unrecognized-form-masculine-plural":"nevroticii","definite-error-unrecognized-form-feminine-neuter-plural":"nevroticele"}},{"word":"nevrotic","pos":"noun","definitions":["neurotic"],"forms":{"plural":"nevrotici","feminine":"equivalent nevrotică","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nevrotic","accusative-definite-nominative-singular":"nevroticul","accusative-indefinite-nominative-plural":"nevrotici","accusative-definite-nominative-plural":"nevroticii","dative-genitive-indefinite-singular":"nevrotic","dative-definite-genitive-singular":"nevroticului","dative-genitive-indefinite-plural":"nevrotici","dative-definite-genitive-plural":"nevroticilor","singular-vocative":"nevroticule","plural-vocative":"nevroticilor"}},{"word":"nevrotică","pos":"noun","definitions":["female equivalent of nevrotic"],"forms":{"plural":"nevrotice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nevrotică","accusative-definite-nominative-singular":"nevrotica","accusative-indefinite-nominative-plural":"nevrotice","accusative-definite-nominative-plural":"nevroticele","dative-genitive-indefinite-singular":"nevrotice","dative-definite-genitive-singular":"nevroticei","dative-genitive-indefinite-plural":"nevrotice","dative-definite-genitive-plural":"nevroticelor","singular-vocative":"nevrotică","plural-vocative":"nevroticelor"}},{"word":"nevrotomie","pos":"noun","definitions":["neurotomy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nevrotomie","accusative-definite-nominative-singular":"nevrotomia","accusative-indefinite-nominative-plural":"nevrotomii","accusative-definite-nominative-plural":"nevrotomiile","dative-genitive-indefinite-singular":"nevrotomii","dative-definite-genitive-singular":"nevrotomiei","dative-genitive-indefinite-plural":"nevrotomii","dative-definite-genitive-plural":"nevrotomiilor","singular-vocative":"nevrotomie","plural-vocative":"nevrotomiilor"}},{"word":"nevroză","pos":"noun","definitions":["neurosis"],"forms":{"plural":"nevroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nevroză","accusative-definite-nominative-singular":"nevroza","accusative-indefinite-nominative-plural":"nevroze","accusative-definite-nominative-plural":"nevrozele","dative-genitive-indefinite-singular":"nevroze","dative-definite-genitive-singular":"nevrozei","dative-genitive-indefinite-plural":"nevroze","dative-definite-genitive-plural":"nevrozelor","singular-vocative":"nevroză","plural-vocative":"nevrozelor"}},{"word":"nevrozat","pos":"adj","definitions":["neurotic"],"forms":{"feminine-singular":"nevrozată","masculine-plural":"nevrozați","feminine-neuter-plural":"nevrozate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevrozat","error-unrecognized-form-feminine-indefinite-singular":"nevrozată","error-unrecognized-form-indefinite-masculine-plural":"nevrozați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevrozate","definite-error-unrecognized-form-masculine-neuter-singular":"nevrozatul","definite-error-unrecognized-form-feminine-singular":"nevrozata","definite-error-unrecognized-form-masculine-plural":"nevrozații","definite-error-unrecognized-form-feminine-neuter-plural":"nevrozatele"}},{"word":"nevrut","pos":"adj","definitions":["unaccepted"],"forms":{"feminine-singular":"nevrută","masculine-plural":"nevruți","feminine-neuter-plural":"nevrute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nevrut","error-unrecognized-form-feminine-indefinite-singular":"nevrută","error-unrecognized-form-indefinite-masculine-plural":"nevruți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nevrute","definite-error-unrecognized-form-masculine-neuter-singular":"nevrutul","definite-error-unrecognized-form-feminine-singular":"nevruta","definite-error-unrecognized-form-masculine-plural":"nevruții","definite-error-unrecognized-form-feminine-neuter-plural":"nevrutele"}},{"word":"New York","pos":"name","definitions":["New York, New York City (the largest city in the state of New York, and the largest city in the United States, a metropolis extending into neighboring New Jersey)","New York (a state of the United States)"],"gender":"n","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative":"New York","accusative-definite-nominative":"New Yorkul","dative-genitive-indefinite":"New York","dative-definite-genitive":"New Yorkului","vocative":"New Yorkule"}},{"word":"newton","pos":"noun","definitions":["newton (unit of measure)"],"forms":{"plural":"newtoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"newton","accusative-definite-nominative-singular":"newtonul","accusative-indefinite-nominative-plural":"newtoni","accusative-definite-nominative-plural":"newtonii","dative-genitive-indefinite-singular":"newton","dative-definite-genitive-singular":"newtonului","dative-genitive-indefinite-plural":"newtoni","dative-definite-genitive-plural":"newtonilor","singular-vocative":"newtonule","plural-vocative":"newtonilor"}},{"word":"newtonian","pos":"adj","definitions":["Newtonian"],"forms":{"feminine-singular":"newtoniană","masculine-plural":"newtonieni","feminine-neuter-plural":"newtoniene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"newtonian","error-unrecognized-form-feminine-indefinite-singular":"newtoniană","error-unrecognized-form-indefinite-masculine-plural":"newtonieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"newtoniene","definite-error-unrecognized-form-masculine-neuter-singular":"newtonianul","definite-error-unrecognized-form-feminine-singular":"newtoniana","definite-error-unrecognized-form-masculine-plural":"newtonienii","definite-error-unrecognized-form-feminine-neuter-plural":"newtonienele"}},{"word":"newtoniană","pos":"noun","definitions":["female equivalent of newtonian"],"forms":{"plural":"newtoniene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"newtoniană","accusative-definite-nominative-singular":"newtoniana","accusative-indefinite-nominative-plural":"newtoniene","accusative-definite-nominative-plural":"newtonienele","dative-genitive-indefinite-singular":"newtoniene","dative-definite-genitive-singular":"newtonienei","dative-genitive-indefinite-plural":"newtoniene","dative-definite-genitive-plural":"newtonienelor","singular-vocative":"newtoniană","plural-vocative":"newtonienelor"}},{"word":"newtonianism","pos":"noun","definitions":["Newtonianism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"newtonianism","accusative-definite-nominative":"newtonianismul","dative-genitive-indefinite":"newtonianism","dative-definite-genitive":"newtonianismului","vocative":"newtonianismule"}},{"word":"nex","pos":"noun","definitions":["nexus"],"forms":{"plural":"nexuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nex","accusative-definite-nominative-singular":"nexul","accusative-indefinite-nominative-plural":"nexuri","accusative-definite-nominative-plural":"nexurile","dative-genitive-indefinite-singular":"nex","dative-definite-genitive-singular":"nexului","dative-genitive-indefinite-plural":"nexuri","dative-definite-genitive-plural":"nexurilor","singular-vocative":"nexule","plural-vocative":"nexurilor"}},{"word":"Nezavertailovca","pos":"name","definitions":["a village in Nezavertailovca, Transnistria, Moldova","a commune of Transnistria, Moldova"],"gender":"f"},{"word":"nezdravăn","pos":"adj","definitions":["alternative form of năzdrăvan"],"forms":{"feminine-singular":"nezdravănă","masculine-plural":"nezdravăni","feminine-neuter-plural":"nezdravăne","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nezdravăn","error-unrecognized-form-feminine-indefinite-singular":"nezdravănă","error-unrecognized-form-indefinite-masculine-plural":"nezdravăni","error-unrecognized-form-feminine-indefinite-neuter-plural":"nezdravăne","definite-error-unrecognized-form-masculine-neuter-singular":"nezdravănul","definite-error-unrecognized-form-feminine-singular":"nezdravăna","definite-error-unrecognized-form-masculine-plural":"nezdravănii","definite-error-unrecognized-form-feminine-neuter-plural":"nezdravănele"}},{"word":"nezdruncinat","pos":"adj","definitions":["unshaken"],"forms":{"feminine-singular":"nezdruncinată","masculine-plural":"nezdruncinați","feminine-neuter-plural":"nezdruncinate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nezdruncinat","error-unrecognized-form-feminine-indefinite-singular":"nezdruncinată","error-unrecognized-form-indefinite-masculine-plural":"nezdruncinați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nezdruncinate","definite-error-unrecognized-form-masculine-neuter-singular":"nezdruncinatul","definite-error-unrecognized-form-feminine-singular":"nezdruncinata","definite-error-unrecognized-form-masculine-plural":"nezdruncinații","definite-error-unrecognized-form-feminine-neuter-plural":"nezdruncinatele"}},{"word":"ni","pos":"pron","definitions":["alternative form of ne (dative of noi): to us"]},{"word":"ni","pos":"intj","definitions":["lo!, look!, behold!"],"examples":[{"ro":"Ni la el!","en":"Look at him!"}]},{"word":"ni-i","pos":"contraction","definitions":["contraction of ni + îi"],"pronunciation":"/nij/"},{"word":"ni-l","pos":"contraction","definitions":["contraction of ne and îl"],"pronunciation":"/nil/"},{"word":"ni-s","pos":"contraction","definitions":["contraction of ni + sunt"],"pronunciation":"/nis/"},{"word":"Nică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nică"}},{"word":"nicăierea","pos":"adv","definitions":["alternative form of nicăieri"]},{"word":"nicăieri","pos":"adv","definitions":["nowhere"]},{"word":"nicăirea","pos":"adv","definitions":["alternative form of nicăieri"]},{"word":"nicairi","pos":"adv","definitions":["obsolete form of nicăieri"]},{"word":"nicăiri","pos":"adv","definitions":["alternative form of nicăieri"]},{"word":"nicăiure","pos":"adv","definitions":["obsolete form of nicăieri"]},{"word":"nicăiurea","pos":"adv","definitions":["alternative form of nicăieri"]},{"word":"nicăiuri","pos":"adv","definitions":["obsolete form of nicăieri"]},{"word":"Nicani","pos":"name","definitions":["a village in Zamostea, Suceava County, Romania"],"gender":"m"},{"word":"nicaraguan","pos":"noun","definitions":["Nicaraguan"],"pronunciation":"/ˌni.ka.ra.ɡuˈan/","forms":{"plural":"nicaraguani","feminine":"equivalent nicaraguană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nicaraguan","accusative-definite-nominative-singular":"nicaraguanul","accusative-indefinite-nominative-plural":"nicaraguani","accusative-definite-nominative-plural":"nicaraguanii","dative-genitive-indefinite-singular":"nicaraguan","dative-definite-genitive-singular":"nicaraguanului","dative-genitive-indefinite-plural":"nicaraguani","dative-definite-genitive-plural":"nicaraguanilor","singular-vocative":"nicaraguanule","plural-vocative":"nicaraguanilor"}},{"word":"nicaraguan","pos":"adj","definitions":["Nicaraguan"],"pronunciation":"/ˌni.ka.ra.ɡuˈan/","forms":{"feminine-singular":"nicaraguană","masculine-plural":"nicaraguani","feminine-neuter-plural":"nicaraguane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nicaraguan","error-unrecognized-form-feminine-indefinite-singular":"nicaraguană","error-unrecognized-form-indefinite-masculine-plural":"nicaraguani","error-unrecognized-form-feminine-indefinite-neuter-plural":"nicaraguane","definite-error-unrecognized-form-masculine-neuter-singular":"nicaraguanul","definite-error-unrecognized-form-feminine-singular":"nicaraguana","definite-error-unrecognized-form-masculine-plural":"nicaraguanii","definite-error-unrecognized-form-feminine-neuter-plural":"nicaraguanele"}},{"word":"nicaraguană","pos":"noun","definitions":["female equivalent of nicaraguan"],"forms":{"plural":"nicaraguane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nicaraguană","accusative-definite-nominative-singular":"nicaraguana","accusative-indefinite-nominative-plural":"nicaraguane","accusative-definite-nominative-plural":"nicaraguanele","dative-genitive-indefinite-singular":"nicaraguane","dative-definite-genitive-singular":"nicaraguanei","dative-genitive-indefinite-plural":"nicaraguane","dative-definite-genitive-plural":"nicaraguanelor","singular-vocative":"nicaraguană","plural-vocative":"nicaraguanelor"}},{"word":"nicări","pos":"adv","definitions":["obsolete form of nicăieri"]},{"word":"nicecum","pos":"adv","definitions":["obsolete form of nicicum"]},{"word":"nicedănăoară","pos":"adv","definitions":["obsolete form of niciodinioară"]},{"word":"niceodinioară","pos":"adv","definitions":["obsolete form of niciodinioară"]},{"word":"nichel","pos":"noun","definitions":["nickel (chemical element)"],"pronunciation":"/ˈnikel/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nichel","accusative-definite-nominative":"nichelul","dative-genitive-indefinite":"nichel","dative-definite-genitive":"nichelului","vocative":"nichelule"}},{"word":"nichela","pos":"verb","definitions":["to nickel"],"forms":{"canonical":"a nichela 1st conjugation","present-singular-third-person":"nichelează","participle-past":"nichelat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a nichela","gerund":"nichelând","first-person-indicative-present-singular":"nichelez","indicative-present-second-person-singular":"nichelezi","indicative-present-singular-third-person":"nichelează","first-person-indicative-plural-present":"nichelăm","indicative-plural-present-second-person":"nichelați","indicative-plural-present-third-person":"nichelează","first-person-imperfect-indicative-singular":"nichelam","imperfect-indicative-second-person-singular":"nichelai","imperfect-indicative-singular-third-person":"nichela","first-person-imperfect-indicative-plural":"nichelam","imperfect-indicative-plural-second-person":"nichelați","imperfect-indicative-plural-third-person":"nichelau","first-person-indicative-perfect-singular":"nichelai","indicative-perfect-second-person-singular":"nichelași","indicative-perfect-singular-third-person":"nichelă","first-person-indicative-perfect-plural":"nichelarăm","indicative-perfect-plural-second-person":"nichelarăți","indicative-perfect-plural-third-person":"nichelară","first-person-indicative-pluperfect-singular":"nichelasem","indicative-pluperfect-second-person-singular":"nichelaseși","indicative-pluperfect-singular-third-person":"nichelase","first-person-indicative-pluperfect-plural":"nichelaserăm","indicative-pluperfect-plural-second-person":"nichelaserăți","indicative-pluperfect-plural-third-person":"nichelaseră","first-person-present-singular-subjunctive":"să nichelez","present-second-person-singular-subjunctive":"să nichelezi","present-singular-subjunctive-third-person":"să nicheleze","first-person-plural-present-subjunctive":"să nichelăm","plural-present-second-person-subjunctive":"să nichelați","plural-present-subjunctive-third-person":"să nicheleze","imperative-second-person-singular":"nichelează","imperative-plural-second-person":"nichelați","imperative-negative-second-person-singular":"nu nichela","imperative-negative-plural-second-person":"nu nichelați"}},{"word":"nichelaj","pos":"noun","definitions":["nickel plating"],"forms":{"plural":"nichelajuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nichelaj","accusative-definite-nominative-singular":"nichelajul","accusative-indefinite-nominative-plural":"nichelajuri","accusative-definite-nominative-plural":"nichelajurile","dative-genitive-indefinite-singular":"nichelaj","dative-definite-genitive-singular":"nichelajului","dative-genitive-indefinite-plural":"nichelajuri","dative-definite-genitive-plural":"nichelajurilor","singular-vocative":"nichelajule","plural-vocative":"nichelajurilor"}},{"word":"nichelar","pos":"noun","definitions":["nickel plater"],"forms":{"plural":"nichelari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nichelar","accusative-definite-nominative-singular":"nichelarul","accusative-indefinite-nominative-plural":"nichelari","accusative-definite-nominative-plural":"nichelarii","dative-genitive-indefinite-singular":"nichelar","dative-definite-genitive-singular":"nichelarului","dative-genitive-indefinite-plural":"nichelari","dative-definite-genitive-plural":"nichelarilor","singular-vocative":"nichelarule","plural-vocative":"nichelarilor"}},{"word":"nichelare","pos":"noun","definitions":["nickelling"],"forms":{"plural":"nichelări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nichelare","accusative-definite-nominative-singular":"nichelarea","accusative-indefinite-nominative-plural":"nichelări","accusative-definite-nominative-plural":"nichelările","dative-genitive-indefinite-singular":"nichelări","dative-definite-genitive-singular":"nichelării","dative-genitive-indefinite-plural":"nichelări","dative-definite-genitive-plural":"nichelărilor","singular-vocative":"nichelare","plural-vocative":"nichelărilor"}},{"word":"nichelat","pos":"adj","definitions":["nickelized"],"forms":{"feminine-singular":"nichelată","masculine-plural":"nichelați","feminine-neuter-plural":"nichelate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nichelat","error-unrecognized-form-feminine-indefinite-singular":"nichelată","error-unrecognized-form-indefinite-masculine-plural":"nichelați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nichelate","definite-error-unrecognized-form-masculine-neuter-singular":"nichelatul","definite-error-unrecognized-form-feminine-singular":"nichelata","definite-error-unrecognized-form-masculine-plural":"nichelații","definite-error-unrecognized-form-feminine-neuter-plural":"nichelatele"}},{"word":"nichelator","pos":"noun","definitions":["nickel plater"],"forms":{"plural":"nichelatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nichelator","accusative-definite-nominative-singular":"nichelatorul","accusative-indefinite-nominative-plural":"nichelatori","accusative-definite-nominative-plural":"nichelatorii","dative-genitive-indefinite-singular":"nichelator","dative-definite-genitive-singular":"nichelatorului","dative-genitive-indefinite-plural":"nichelatori","dative-definite-genitive-plural":"nichelatorilor","singular-vocative":"nichelatorule","plural-vocative":"nichelatorilor"}},{"word":"nichelină","pos":"noun","definitions":["nickeline"],"forms":{"plural":"nicheline","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nichelină","accusative-definite-nominative-singular":"nichelina","accusative-indefinite-nominative-plural":"nicheline","accusative-definite-nominative-plural":"nichelinele","dative-genitive-indefinite-singular":"nicheline","dative-definite-genitive-singular":"nichelinei","dative-genitive-indefinite-plural":"nicheline","dative-definite-genitive-plural":"nichelinelor","singular-vocative":"nichelină","plural-vocative":"nichelinelor"}},{"word":"Nichescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nichescu"}},{"word":"Nichifor","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Nichifor"}},{"word":"Nichiforel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nichiforel"}},{"word":"Nichiforescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nichiforescu"}},{"word":"Nichiforiuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Nichiforiuc"}},{"word":"Nichiforov","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Nichiforov"}},{"word":"nichipercea","pos":"noun","definitions":["devil"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"nichipercea","accusative-definite-nominative":"nichiperceaul","dative-genitive-indefinite":"nichipercea","dative-definite-genitive":"nichiperceaului","vocative":"nichiperceaule"}},{"word":"Nichitaș","pos":"name","definitions":["a river in Bistrița-Năsăud County, Romania, tributary to the Someșul Mare"],"gender":"m"},{"word":"Nichiteni","pos":"name","definitions":["a village in Coțușca, Botoșani County, Romania"],"gender":"m"},{"word":"Nichitoaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Nichitoaia"}},{"word":"Nichitoi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nichitoi"}},{"word":"Nichitoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nichitoiu"}},{"word":"Nichițoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nichițoiu"}},{"word":"Nichituș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nichituș"}},{"word":"Nichituț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nichituț"}},{"word":"nici","pos":"adv","definitions":["not even"],"pronunciation":"[nitʃʲ]","examples":[{"ro":"Nu-mi place nici unul dintre ei","en":"I don't like even one of them."},{"ro":"N-o să vii cu mine, nici pentru a mânca cea mai delicioasă mâncare din toată lumea?","en":"You won't come with me, not even to eat the best food in the world?"}],"forms":{"alternative-archaic":"nece"}},{"word":"nici","pos":"conj","definitions":["neither... nor"],"pronunciation":"[nitʃʲ]","examples":[{"ro":"Nu vreau nici lapte nici apă","en":"I want neither milk nor water"}],"forms":{"alternative-archaic":"nece"}},{"word":"nici cal nici măgar","pos":"phrase","definitions":["neither fish nor fowl (not easily categorised)"]},{"word":"nicicacum","pos":"adv","definitions":["not at all"]},{"word":"nicicând","pos":"adv","definitions":["synonym of niciodată (“never”)"],"pronunciation":"/nit͡ʃʲˈkɨnd/"},{"word":"nicicare","pos":"adj","definitions":["neither"]},{"word":"nicicare","pos":"pron","definitions":["neither"]},{"word":"nicicum","pos":"adv","definitions":["not at all"]},{"word":"nicidecât","pos":"adv","definitions":["not at all"]},{"word":"nicidecum","pos":"adv","definitions":["not in the least, not at all"],"pronunciation":"[nitʃʲdeˈkum]"},{"word":"nicio","pos":"det","definitions":["feminine singular of niciun"],"pronunciation":"/ˈni.t͡ʃʲo/","examples":[{"ro":"Nu am nicio idee.","en":"I have no idea."}]},{"word":"niciodată","pos":"adv","definitions":["never"],"pronunciation":"[ni.t͡ʃoˈda.tə]"},{"word":"niciodinioară","pos":"adv","definitions":["never"]},{"word":"niciun","pos":"det","definitions":["no, none of, not any"],"pronunciation":"/ˈni.t͡ʃʲun/","forms":{"feminine":"nicio","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"niciun","error-unrecognized-form-feminine-indefinite-singular":"nicio","error-unrecognized-form-indefinite-masculine-plural":"-","error-unrecognized-form-feminine-indefinite-neuter-plural":"-","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-","alternative":"nici un"}},{"word":"niciunde","pos":"adv","definitions":["nowhere"]},{"word":"niciunul","pos":"pron","definitions":["none; no-one, nobody"],"forms":{"feminine-singular":"niciuna","masculine-plural":"niciunii","feminine-neuter-plural":"niciunele","alternative":"nici unul"}},{"word":"Nicoară","pos":"name","definitions":["alternative form of Sânicoară","a surname","a male given name"]},{"word":"nicochera","pos":"noun","definitions":["mistress of the house, lady"],"forms":{"plural":"nicocherale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-a","accusative-indefinite-nominative-singular":"nicochera","accusative-definite-nominative-singular":"nicocheraua","accusative-indefinite-nominative-plural":"nicocherale","accusative-definite-nominative-plural":"nicocheralele","dative-genitive-indefinite-singular":"nicocherale","dative-definite-genitive-singular":"nicocheralei","dative-genitive-indefinite-plural":"nicocherale","dative-definite-genitive-plural":"nicocheralelor","singular-vocative":"nicochera","plural-vocative":"nicocheralelor"}},{"word":"Nicodinescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nicodinescu"}},{"word":"Nicogosian","pos":"name","definitions":["a surname from Armenian"],"gender":"m","forms":{"dative-genitive":"lui Nicogosian"}},{"word":"Nicolae","pos":"name","definitions":["a male given name from Ancient Greek, equivalent to English Nicholas"],"pronunciation":"/ni.koˈla.e/","gender":"m","forms":{"dative-genitive":"lui Nicolae"}},{"word":"Nicolae Bălcescu","pos":"name","definitions":["a village in Vărădia de Mureș, Arad County, Romania","a commune of Bacău County, Romania","a village in Nicolae Bălcescu, Bacău County, Romania","a locality in Flămânzi, Botoșani County, Romania","a village in Coțușca, Botoșani County, Romania"],"gender":"m"},{"word":"Nicolae Titulescu","pos":"name","definitions":["a commune of Olt County, Romania","a village in Nicolae Titulescu, Olt County, Romania"],"gender":"m"},{"word":"Nicolaescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nicolaescu"}},{"word":"Nicolăescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nicolăescu"}},{"word":"Nicolaești","pos":"name","definitions":["a village in Vulcana-Băi, Dâmbovița County, Romania"],"gender":"m"},{"word":"Nicolaevca","pos":"name","definitions":["a village in Chișcăreni, Sîngerei Raion, Moldova","a village in Cuhureștii de Sus, Florești Raion, Moldova","a village in Danu, Glodeni Raion, Moldova","a village in Găvănoasa, Cahul Raion, Moldova","a village in Hănășenii Noi, Leova Raion, Moldova"],"gender":"f"},{"word":"Nicolaică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nicolaică"}},{"word":"Nicolaiciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Nicolaiciuc"}},{"word":"Nicolaide","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Nicolaide"}},{"word":"Nicolăiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nicolăiță"}},{"word":"Nicolaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nicolaș"}},{"word":"Nicolau","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Nicolau"}},{"word":"Nicolcescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nicolcescu"}},{"word":"Nicolcioiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nicolcioiu"}},{"word":"Nicoleni","pos":"name","definitions":["a village in Șimonești, Harghita County, Romania"],"gender":"m"},{"word":"Nicolescu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nicolescu"}},{"word":"Nicolești","pos":"name","definitions":["a village in Berteștii de Jos, Brăila County, Romania","a village in Puiești, Buzău County, Romania","a village in Frumoasa, Harghita County, Romania","a village in Ulieș, Harghita County, Romania","a village in Miloșești, Ialomița County, Romania"],"gender":"m"},{"word":"Nicoleta","pos":"name","definitions":["a female given name"],"gender":"f"},{"word":"Nicolică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nicolică"}},{"word":"Nicolicescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nicolicescu"}},{"word":"Nicolicioiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nicolicioiu"}},{"word":"Nicolina","pos":"name","definitions":["a female given name","a river in Iași County, Romania, tributary to the Bahlui"],"gender":"f"},{"word":"Nicolinț","pos":"name","definitions":["a village in Ciuchici, Caraș-Severin County, Romania"],"gender":"m"},{"word":"Nicoliță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nicoliță"}},{"word":"Nicolițoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nicolițoiu"}},{"word":"Nicolschi","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Nicolschi"}},{"word":"Nicolscoe","pos":"name","definitions":["a village in Vladimirovca, Transnistria, Moldova"],"gender":"m"},{"word":"Nicopol","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Nicopol"}},{"word":"Nicopole","pos":"name","definitions":["a village in Drăgușeni, Galați County, Romania"],"gender":"m"},{"word":"Nicoraș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nicoraș"}},{"word":"Nicoreni","pos":"name","definitions":["a village in Nicoreni, Drochia Raion, Moldova","a commune of Drochia Raion, Moldova"],"gender":"m"},{"word":"Nicorescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nicorescu"}},{"word":"Nicorești","pos":"name","definitions":["a village in Sohodol, Alba County, Romania","a village in Pârgărești, Bacău County, Romania","a commune of Galați County, Romania","a village in Nicorești, Galați County, Romania"],"gender":"m"},{"word":"nicorete","pos":"noun","definitions":["St. George's mushroom (Tricholoma georgii)","miller (Clitopilus prunulus)"],"forms":{"plural":"nicoreți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nicorete","accusative-definite-nominative-singular":"nicoreteul","accusative-indefinite-nominative-plural":"nicoreți","accusative-definite-nominative-plural":"nicoreții","dative-genitive-indefinite-singular":"nicorete","dative-definite-genitive-singular":"nicoreteului","dative-genitive-indefinite-plural":"nicoreți","dative-definite-genitive-plural":"nicoreților","singular-vocative":"nicoreteule","plural-vocative":"nicoreților"}},{"word":"Nicoruț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nicoruț"}},{"word":"nicotină","pos":"noun","definitions":["nicotine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nicotină","accusative-definite-nominative-singular":"nicotina","accusative-indefinite-nominative-plural":"nicotine","accusative-definite-nominative-plural":"nicotinele","dative-genitive-indefinite-singular":"nicotine","dative-definite-genitive-singular":"nicotinei","dative-genitive-indefinite-plural":"nicotine","dative-definite-genitive-plural":"nicotinelor","singular-vocative":"nicotină","plural-vocative":"nicotinelor"}},{"word":"nicotinic","pos":"adj","definitions":["nicotinic"],"forms":{"feminine-singular":"nicotinică","masculine-plural":"nicotinici","feminine-neuter-plural":"nicotinice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nicotinic","error-unrecognized-form-feminine-indefinite-singular":"nicotinică","error-unrecognized-form-indefinite-masculine-plural":"nicotinici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nicotinice","definite-error-unrecognized-form-masculine-neuter-singular":"nicotinicul","definite-error-unrecognized-form-feminine-singular":"nicotinica","definite-error-unrecognized-form-masculine-plural":"nicotinicii","definite-error-unrecognized-form-feminine-neuter-plural":"nicotinicele"}},{"word":"nicotinică","pos":"noun","definitions":["nicotinic"],"forms":{"plural":"nicotinice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nicotinică","accusative-definite-nominative-singular":"nicotinica","accusative-indefinite-nominative-plural":"nicotinice","accusative-definite-nominative-plural":"nicotinicele","dative-genitive-indefinite-singular":"nicotinice","dative-definite-genitive-singular":"nicotinicei","dative-genitive-indefinite-plural":"nicotinice","dative-definite-genitive-plural":"nicotinicelor","singular-vocative":"nicotinică","plural-vocative":"nicotinicelor"}},{"word":"nicotinism","pos":"noun","definitions":["nicotinism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nicotinism","accusative-definite-nominative":"nicotinismul","dative-genitive-indefinite":"nicotinism","dative-definite-genitive":"nicotinismului","vocative":"nicotinismule"}},{"word":"nicotiniza","pos":"verb","definitions":["to nicotinize"],"forms":{"canonical":"a nicotiniza 1st conjugation","present-singular-third-person":"nicotinizează","participle-past":"nicotinizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a nicotiniza","gerund":"nicotinizând","first-person-indicative-present-singular":"nicotinizez","indicative-present-second-person-singular":"nicotinizezi","indicative-present-singular-third-person":"nicotinizează","first-person-indicative-plural-present":"nicotinizăm","indicative-plural-present-second-person":"nicotinizați","indicative-plural-present-third-person":"nicotinizează","first-person-imperfect-indicative-singular":"nicotinizam","imperfect-indicative-second-person-singular":"nicotinizai","imperfect-indicative-singular-third-person":"nicotiniza","first-person-imperfect-indicative-plural":"nicotinizam","imperfect-indicative-plural-second-person":"nicotinizați","imperfect-indicative-plural-third-person":"nicotinizau","first-person-indicative-perfect-singular":"nicotinizai","indicative-perfect-second-person-singular":"nicotinizași","indicative-perfect-singular-third-person":"nicotiniză","first-person-indicative-perfect-plural":"nicotinizarăm","indicative-perfect-plural-second-person":"nicotinizarăți","indicative-perfect-plural-third-person":"nicotinizară","first-person-indicative-pluperfect-singular":"nicotinizasem","indicative-pluperfect-second-person-singular":"nicotinizaseși","indicative-pluperfect-singular-third-person":"nicotinizase","first-person-indicative-pluperfect-plural":"nicotinizaserăm","indicative-pluperfect-plural-second-person":"nicotinizaserăți","indicative-pluperfect-plural-third-person":"nicotinizaseră","first-person-present-singular-subjunctive":"să nicotinizez","present-second-person-singular-subjunctive":"să nicotinizezi","present-singular-subjunctive-third-person":"să nicotinizeze","first-person-plural-present-subjunctive":"să nicotinizăm","plural-present-second-person-subjunctive":"să nicotinizați","plural-present-subjunctive-third-person":"să nicotinizeze","imperative-second-person-singular":"nicotinizează","imperative-plural-second-person":"nicotinizați","imperative-negative-second-person-singular":"nu nicotiniza","imperative-negative-plural-second-person":"nu nicotinizați"}},{"word":"nicotinizat","pos":"adj","definitions":["nicotinized"],"forms":{"feminine-singular":"nicotinizată","masculine-plural":"nicotinizați","feminine-neuter-plural":"nicotinizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nicotinizat","error-unrecognized-form-feminine-indefinite-singular":"nicotinizată","error-unrecognized-form-indefinite-masculine-plural":"nicotinizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nicotinizate","definite-error-unrecognized-form-masculine-neuter-singular":"nicotinizatul","definite-error-unrecognized-form-feminine-singular":"nicotinizata","definite-error-unrecognized-form-masculine-plural":"nicotinizații","definite-error-unrecognized-form-feminine-neuter-plural":"nicotinizatele"}},{"word":"Nicovală","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nicovală"}},{"word":"nicovală","pos":"noun","definitions":["anvil"],"forms":{"plural":"nicovale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nicovală","accusative-definite-nominative-singular":"nicovala","accusative-indefinite-nominative-plural":"nicovale","accusative-definite-nominative-plural":"nicovalele","dative-genitive-indefinite-singular":"nicovale","dative-definite-genitive-singular":"nicovalei","dative-genitive-indefinite-plural":"nicovale","dative-definite-genitive-plural":"nicovalelor","singular-vocative":"nicovală","plural-vocative":"nicovalelor"}},{"word":"nicrom","pos":"noun","definitions":["nichrome"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nicrom","accusative-definite-nominative":"nicromul","dative-genitive-indefinite":"nicrom","dative-definite-genitive":"nicromului","vocative":"nicromule"}},{"word":"Nicșeni","pos":"name","definitions":["a commune of Botoșani County, Romania","a village in Nicșeni, Botoșani County, Romania"],"gender":"m"},{"word":"nictalfobie","pos":"noun","definitions":["nyctophobia"],"forms":{"plural":"nictalfobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nictalfobie","accusative-definite-nominative-singular":"nictalfobia","accusative-indefinite-nominative-plural":"nictalfobii","accusative-definite-nominative-plural":"nictalfobiile","dative-genitive-indefinite-singular":"nictalfobii","dative-definite-genitive-singular":"nictalfobiei","dative-genitive-indefinite-plural":"nictalfobii","dative-definite-genitive-plural":"nictalfobiilor","singular-vocative":"nictalfobie","plural-vocative":"nictalfobiilor"}},{"word":"nictalgie","pos":"noun","definitions":["nyctalgia"],"forms":{"plural":"nictalgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nictalgie","accusative-definite-nominative-singular":"nictalgia","accusative-indefinite-nominative-plural":"nictalgii","accusative-definite-nominative-plural":"nictalgiile","dative-genitive-indefinite-singular":"nictalgii","dative-definite-genitive-singular":"nictalgiei","dative-genitive-indefinite-plural":"nictalgii","dative-definite-genitive-plural":"nictalgiilor","singular-vocative":"nictalgie","plural-vocative":"nictalgiilor"}},{"word":"nictalop","pos":"noun","definitions":["nyctalope"],"forms":{"plural":"nictalopi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nictalop","accusative-definite-nominative-singular":"nictalopul","accusative-indefinite-nominative-plural":"nictalopi","accusative-definite-nominative-plural":"nictalopii","dative-genitive-indefinite-singular":"nictalop","dative-definite-genitive-singular":"nictalopului","dative-genitive-indefinite-plural":"nictalopi","dative-definite-genitive-plural":"nictalopilor","singular-vocative":"nictalopule","plural-vocative":"nictalopilor"}},{"word":"nictalopă","pos":"noun","definitions":["female equivalent of nictalop"],"forms":{"plural":"nictalope","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nictalopă","accusative-definite-nominative-singular":"nictalopa","accusative-indefinite-nominative-plural":"nictalope","accusative-definite-nominative-plural":"nictalopele","dative-genitive-indefinite-singular":"nictalope","dative-definite-genitive-singular":"nictalopei","dative-genitive-indefinite-plural":"nictalope","dative-definite-genitive-plural":"nictalopelor","singular-vocative":"nictalopă","plural-vocative":"nictalopelor"}},{"word":"nictalopie","pos":"noun","definitions":["night vision"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"nictalopie","accusative-definite-nominative":"nictalopia","dative-genitive-indefinite":"nictalopii","dative-definite-genitive":"nictalopiei","vocative":"nictalopie"}},{"word":"nictație","pos":"noun","definitions":["nictation"],"forms":{"plural":"nictații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nictație","accusative-definite-nominative-singular":"nictația","accusative-indefinite-nominative-plural":"nictații","accusative-definite-nominative-plural":"nictațiile","dative-genitive-indefinite-singular":"nictații","dative-definite-genitive-singular":"nictației","dative-genitive-indefinite-plural":"nictații","dative-definite-genitive-plural":"nictațiilor","singular-vocative":"nictație","plural-vocative":"nictațiilor"}},{"word":"nictemer","pos":"noun","definitions":["nychthemeron"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nictemer","accusative-definite-nominative":"nictemerul","dative-genitive-indefinite":"nictemer","dative-definite-genitive":"nictemerului","vocative":"nictemerule"}},{"word":"nictinastie","pos":"noun","definitions":["nyctinasty"],"forms":{"plural":"nictinastii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nictinastie","accusative-definite-nominative-singular":"nictinastia","accusative-indefinite-nominative-plural":"nictinastii","accusative-definite-nominative-plural":"nictinastiile","dative-genitive-indefinite-singular":"nictinastii","dative-definite-genitive-singular":"nictinastiei","dative-genitive-indefinite-plural":"nictinastii","dative-definite-genitive-plural":"nictinastiilor","singular-vocative":"nictinastie","plural-vocative":"nictinastiilor"}},{"word":"nictitație","pos":"noun","definitions":["nictitation"],"forms":{"plural":"nictitații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nictitație","accusative-definite-nominative-singular":"nictitația","accusative-indefinite-nominative-plural":"nictitații","accusative-definite-nominative-plural":"nictitațiile","dative-genitive-indefinite-singular":"nictitații","dative-definite-genitive-singular":"nictitației","dative-genitive-indefinite-plural":"nictitații","dative-definite-genitive-plural":"nictitațiilor","singular-vocative":"nictitație","plural-vocative":"nictitațiilor"}},{"word":"nictitropism","pos":"noun","definitions":["nyctitropism"],"forms":{"plural":"nictitropisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nictitropism","accusative-definite-nominative-singular":"nictitropismul","accusative-indefinite-nominative-plural":"nictitropisme","accusative-definite-nominative-plural":"nictitropismele","dative-genitive-indefinite-singular":"nictitropism","dative-definite-genitive-singular":"nictitropismului","dative-genitive-indefinite-plural":"nictitropisme","dative-definite-genitive-plural":"nictitropismelor","singular-vocative":"nictitropismule","plural-vocative":"nictitropismelor"}},{"word":"nictofobie","pos":"noun","definitions":["nyctophobia"],"forms":{"plural":"nictofobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nictofobie","accusative-definite-nominative-singular":"nictofobia","accusative-indefinite-nominative-plural":"nictofobii","accusative-definite-nominative-plural":"nictofobiile","dative-genitive-indefinite-singular":"nictofobii","dative-definite-genitive-singular":"nictofobiei","dative-genitive-indefinite-plural":"nictofobii","dative-definite-genitive-plural":"nictofobiilor","singular-vocative":"nictofobie","plural-vocative":"nictofobiilor"}},{"word":"nicturezis","pos":"noun","definitions":["nocturia"],"forms":{"plural":"nicturezisuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nicturezis","accusative-definite-nominative-singular":"nicturezisul","accusative-indefinite-nominative-plural":"nicturezisuri","accusative-definite-nominative-plural":"nicturezisurile","dative-genitive-indefinite-singular":"nicturezis","dative-definite-genitive-singular":"nicturezisului","dative-genitive-indefinite-plural":"nicturezisuri","dative-definite-genitive-plural":"nicturezisurilor","singular-vocative":"nicturezisule","plural-vocative":"nicturezisurilor"}},{"word":"nicturie","pos":"noun","definitions":["nocturia"],"forms":{"plural":"nicturii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nicturie","accusative-definite-nominative-singular":"nicturia","accusative-indefinite-nominative-plural":"nicturii","accusative-definite-nominative-plural":"nicturiile","dative-genitive-indefinite-singular":"nicturii","dative-definite-genitive-singular":"nicturiei","dative-genitive-indefinite-plural":"nicturii","dative-definite-genitive-plural":"nicturiilor","singular-vocative":"nicturie","plural-vocative":"nicturiilor"}},{"word":"Nicu","pos":"name","definitions":["a diminutive of the male given name Nicolae, equivalent to English Nick","a surname"],"gender":"m","forms":{"dative-genitive":"lui Nicu"}},{"word":"Nicula","pos":"name","definitions":["a village in Fizeșu Gherlii, Cluj County, Romania"],"gender":"f"},{"word":"Niculaescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Niculaescu"}},{"word":"Niculăescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Niculăescu"}},{"word":"Niculaiciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Niculaiciuc"}},{"word":"Niculaide","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Niculaide"}},{"word":"Niculăiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Niculăiță"}},{"word":"Niculaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Niculaș"}},{"word":"Niculcea","pos":"name","definitions":["a village in Havârna, Botoșani County, Romania"],"gender":"f"},{"word":"Niculeasa","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"f"},{"word":"Niculescu","pos":"name","definitions":["a surname"],"pronunciation":"[nikuˈlesku]","gender":"m","forms":{"dative-genitive":"lui Niculescu"}},{"word":"Niculești","pos":"name","definitions":["a village in Horea, Alba County, Romania","a village in Vintilă Vodă, Buzău County, Romania","a commune of Dâmbovița County, Romania","a village in Niculești, Dâmbovița County, Romania"],"gender":"m"},{"word":"Niculeț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Niculeț"}},{"word":"Niculete","pos":"name","definitions":["a surname originating as a patronymic"],"pronunciation":"/ni.kuˈle.te/","gender":"m","forms":{"dative-genitive":"lui Niculete"}},{"word":"Niculică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Niculică"}},{"word":"Niculicioiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Niculicioiu"}},{"word":"Niculiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Niculiță"}},{"word":"Niculițel","pos":"name","definitions":["a commune of Tulcea County, Romania","a village in Niculițel, Tulcea County, Romania"],"gender":"m"},{"word":"Niculuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Niculuț"}},{"word":"Niculuță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Niculuță"}},{"word":"Nicuruț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nicuruț"}},{"word":"Nicușor","pos":"name","definitions":["a diminutive of the male given name Nicolae, equivalent to English Nick","a surname"],"gender":"m","forms":{"dative-genitive":"lui Nicușor"}},{"word":"Nicuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nicuț"}},{"word":"Nicuță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nicuță"}},{"word":"nidație","pos":"noun","definitions":["nidation, implantation"],"forms":{"plural":"nidații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nidație","accusative-definite-nominative-singular":"nidația","accusative-indefinite-nominative-plural":"nidații","accusative-definite-nominative-plural":"nidațiile","dative-genitive-indefinite-singular":"nidații","dative-definite-genitive-singular":"nidației","dative-genitive-indefinite-plural":"nidații","dative-definite-genitive-plural":"nidațiilor","singular-vocative":"nidație","plural-vocative":"nidațiilor"}},{"word":"Nieregiș","pos":"name","definitions":["a river in Timiș, Romania, tributary to the Bega"],"gender":"m"},{"word":"nietzschean","pos":"adj","definitions":["Nietzschean"],"forms":{"feminine-singular":"nietzscheană","masculine-plural":"nietzscheni","feminine-neuter-plural":"nietzschene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nietzschean","error-unrecognized-form-feminine-indefinite-singular":"nietzscheană","error-unrecognized-form-indefinite-masculine-plural":"nietzscheni","error-unrecognized-form-feminine-indefinite-neuter-plural":"nietzschene","definite-error-unrecognized-form-masculine-neuter-singular":"nietzscheanul","definite-error-unrecognized-form-feminine-singular":"nietzscheana","definite-error-unrecognized-form-masculine-plural":"nietzschenii","definite-error-unrecognized-form-feminine-neuter-plural":"nietzschenele"}},{"word":"nietzschean","pos":"noun","definitions":["Nietzschean"],"forms":{"plural":"nietzscheeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nietzschean","accusative-definite-nominative-singular":"nietzscheanul","accusative-indefinite-nominative-plural":"nietzscheeni","accusative-definite-nominative-plural":"nietzscheenii","dative-genitive-indefinite-singular":"nietzschean","dative-definite-genitive-singular":"nietzscheanului","dative-genitive-indefinite-plural":"nietzscheeni","dative-definite-genitive-plural":"nietzscheenilor","singular-vocative":"nietzscheanule","plural-vocative":"nietzscheenilor"}},{"word":"nietzscheanism","pos":"noun","definitions":["Nietzscheanism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nietzscheanism","accusative-definite-nominative":"nietzscheanismul","dative-genitive-indefinite":"nietzscheanism","dative-definite-genitive":"nietzscheanismului","vocative":"nietzscheanismule"}},{"word":"nife","pos":"noun","definitions":["barysphere"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nife","accusative-definite-nominative":"nifeul","dative-genitive-indefinite":"nife","dative-definite-genitive":"nifeului","vocative":"nifeule"}},{"word":"nifoblepsie","pos":"noun","definitions":["niphablepsia, snow blindness"],"forms":{"plural":"nifoblepsii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nifoblepsie","accusative-definite-nominative-singular":"nifoblepsia","accusative-indefinite-nominative-plural":"nifoblepsii","accusative-definite-nominative-plural":"nifoblepsiile","dative-genitive-indefinite-singular":"nifoblepsii","dative-definite-genitive-singular":"nifoblepsiei","dative-genitive-indefinite-plural":"nifoblepsii","dative-definite-genitive-plural":"nifoblepsiilor","singular-vocative":"nifoblepsie","plural-vocative":"nifoblepsiilor"}},{"word":"Nifon","pos":"name","definitions":["a village in Hamcearca, Tulcea County, Romania","a surname"],"gender":"m"},{"word":"nigeluță","pos":"noun","definitions":["love-in-a-mist"],"forms":{"plural":"nigeluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nigeluță","accusative-definite-nominative-singular":"nigeluța","accusative-indefinite-nominative-plural":"nigeluțe","accusative-definite-nominative-plural":"nigeluțele","dative-genitive-indefinite-singular":"nigeluțe","dative-definite-genitive-singular":"nigeluței","dative-genitive-indefinite-plural":"nigeluțe","dative-definite-genitive-plural":"nigeluțelor","singular-vocative":"nigeluță","plural-vocative":"nigeluțelor"}},{"word":"nigerian","pos":"noun","definitions":["Nigerian"],"pronunciation":"/ˌni.d͡ʒe.riˈan/","forms":{"plural":"nigerieni","feminine":"equivalent nigeriană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nigerian","accusative-definite-nominative-singular":"nigerianul","accusative-indefinite-nominative-plural":"nigerieni","accusative-definite-nominative-plural":"nigerienii","dative-genitive-indefinite-singular":"nigerian","dative-definite-genitive-singular":"nigerianului","dative-genitive-indefinite-plural":"nigerieni","dative-definite-genitive-plural":"nigerienilor","singular-vocative":"nigerianule","plural-vocative":"nigerienilor"}},{"word":"nigerian","pos":"adj","definitions":["Nigerian"],"pronunciation":"/ˌni.d͡ʒe.riˈan/","forms":{"feminine-singular":"nigeriană","masculine-plural":"nigerieni","feminine-neuter-plural":"nigeriene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nigerian","error-unrecognized-form-feminine-indefinite-singular":"nigeriană","error-unrecognized-form-indefinite-masculine-plural":"nigerieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"nigeriene","definite-error-unrecognized-form-masculine-neuter-singular":"nigerianul","definite-error-unrecognized-form-feminine-singular":"nigeriana","definite-error-unrecognized-form-masculine-plural":"nigerienii","definite-error-unrecognized-form-feminine-neuter-plural":"nigerienele"}},{"word":"nigeriană","pos":"noun","definitions":["female equivalent of nigerian"],"forms":{"plural":"nigeriene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nigeriană","accusative-definite-nominative-singular":"nigeriana","accusative-indefinite-nominative-plural":"nigeriene","accusative-definite-nominative-plural":"nigerienele","dative-genitive-indefinite-singular":"nigeriene","dative-definite-genitive-singular":"nigerienei","dative-genitive-indefinite-plural":"nigeriene","dative-definite-genitive-plural":"nigerienelor","singular-vocative":"nigeriană","plural-vocative":"nigerienelor"}},{"word":"Nigrișoara","pos":"name","definitions":["a village in Slobozia, Argeș County, Romania"],"gender":"f"},{"word":"nigrozină","pos":"noun","definitions":["nigrosine"],"forms":{"plural":"nigrozine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nigrozină","accusative-definite-nominative-singular":"nigrozina","accusative-indefinite-nominative-plural":"nigrozine","accusative-definite-nominative-plural":"nigrozinele","dative-genitive-indefinite-singular":"nigrozine","dative-definite-genitive-singular":"nigrozinei","dative-genitive-indefinite-plural":"nigrozine","dative-definite-genitive-plural":"nigrozinelor","singular-vocative":"nigrozină","plural-vocative":"nigrozinelor"}},{"word":"nihilism","pos":"noun","definitions":["nihilism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nihilism","accusative-definite-nominative":"nihilismul","dative-genitive-indefinite":"nihilism","dative-definite-genitive":"nihilismului","vocative":"nihilismule"}},{"word":"nihilist","pos":"noun","definitions":["nihilist"],"forms":{"plural":"nihiliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nihilist","accusative-definite-nominative-singular":"nihilistul","accusative-indefinite-nominative-plural":"nihiliști","accusative-definite-nominative-plural":"nihiliștii","dative-genitive-indefinite-singular":"nihilist","dative-definite-genitive-singular":"nihilistului","dative-genitive-indefinite-plural":"nihiliști","dative-definite-genitive-plural":"nihiliștilor","singular-vocative":"nihilistule","plural-vocative":"nihiliștilor"}},{"word":"nihilistă","pos":"noun","definitions":["female equivalent of nihilist"],"forms":{"plural":"nihiliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nihilistă","accusative-definite-nominative-singular":"nihilista","accusative-indefinite-nominative-plural":"nihiliste","accusative-definite-nominative-plural":"nihilistele","dative-genitive-indefinite-singular":"nihiliste","dative-definite-genitive-singular":"nihilistei","dative-genitive-indefinite-plural":"nihiliste","dative-definite-genitive-plural":"nihilistelor","singular-vocative":"nihilistă","plural-vocative":"nihilistelor"}},{"word":"Nijni Novgorod","pos":"name","definitions":["Nizhny Novgorod (an oblast and federal subject of Russia)","Nizhny Novgorod (the capital city of Nizhny Novgorod Oblast, Russia; the fourth-largest in the country by population)"],"gender":"m"},{"word":"nil","pos":"noun","definitions":["sling"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nil","accusative-definite-nominative":"nilul","dative-genitive-indefinite":"nil","dative-definite-genitive":"nilului","vocative":"nilule"}},{"word":"Nilescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nilescu"}},{"word":"nilgau","pos":"noun","definitions":["nilgai"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"nilgau","accusative-definite-nominative":"nilgaul","dative-genitive-indefinite":"nilgau","dative-definite-genitive":"nilgaului","vocative":"nilgaule"}},{"word":"Nima Milășelului","pos":"name","definitions":["a village in Crăiești, Mureș County, Romania"],"gender":"f"},{"word":"Nima Râciului","pos":"name","definitions":["a village in Râciu, Mureș County, Romania"],"gender":"f"},{"word":"nimănui","pos":"pron","definitions":["genitive/dative of nimeni"],"pronunciation":"[niməˈnuj]","examples":[{"ro":"Te rog să nu spui nimănui că m-ai văzut azi.","en":"Please don't tell anyone that you saw me today."}],"forms":{"alternative":"nimănuia"}},{"word":"Nimară","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nimară"}},{"word":"nimb","pos":"noun","definitions":["halo, nimbus, aureola","glory"],"forms":{"plural":"nimburi"}},{"word":"nimbostratus","pos":"noun","definitions":["nimbostratus"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"nimbostratus","accusative-definite-nominative":"nimbostratusul","dative-genitive-indefinite":"nimbostratus","dative-definite-genitive":"nimbostratusului","vocative":"nimbostratusule"}},{"word":"nimbus","pos":"noun","definitions":["nimbus"],"forms":{"plural":"nimbuși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nimbus","accusative-definite-nominative-singular":"nimbusul","accusative-indefinite-nominative-plural":"nimbuși","accusative-definite-nominative-plural":"nimbușii","dative-genitive-indefinite-singular":"nimbus","dative-definite-genitive-singular":"nimbusului","dative-genitive-indefinite-plural":"nimbuși","dative-definite-genitive-plural":"nimbușilor","singular-vocative":"nimbusule","plural-vocative":"nimbușilor"}},{"word":"nimeni","pos":"pron","definitions":["no one, nobody"],"pronunciation":"[ˈnimenʲ]","examples":[{"ro":"Aici nu este nimeni.","en":"There isn't anyone here."}],"forms":{"dative-genitive":"nimănui","alternative":"nimenea"}},{"word":"Nimereală","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nimereală"}},{"word":"nimereală","pos":"noun","definitions":["random"],"forms":{"plural":"nimereli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"nimereală","accusative-definite-nominative-singular":"nimereala","accusative-indefinite-nominative-plural":"nimereli","accusative-definite-nominative-plural":"nimerelile","dative-genitive-indefinite-singular":"nimereli","dative-definite-genitive-singular":"nimerelii","dative-genitive-indefinite-plural":"nimereli","dative-definite-genitive-plural":"nimerelilor","singular-vocative":"nimereală","plural-vocative":"nimerelilor"}},{"word":"nimeri","pos":"verb","definitions":["to happen (a certain way), find oneself somewhere","to hit (a mark, target), to guess (correctly), succeed"],"forms":{"canonical":"a nimeri 4th conjugation","present-singular-third-person":"nimerește","participle-past":"nimerit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nimeri","gerund":"nimerind","first-person-indicative-present-singular":"nimeresc","indicative-present-second-person-singular":"nimerești","indicative-present-singular-third-person":"nimerește","first-person-indicative-plural-present":"nimerim","indicative-plural-present-second-person":"nimeriți","indicative-plural-present-third-person":"nimeresc","first-person-imperfect-indicative-singular":"nimeream","imperfect-indicative-second-person-singular":"nimereai","imperfect-indicative-singular-third-person":"nimerea","first-person-imperfect-indicative-plural":"nimeream","imperfect-indicative-plural-second-person":"nimereați","imperfect-indicative-plural-third-person":"nimereau","first-person-indicative-perfect-singular":"nimerii","indicative-perfect-second-person-singular":"nimeriși","indicative-perfect-singular-third-person":"nimeri","first-person-indicative-perfect-plural":"nimerirăm","indicative-perfect-plural-second-person":"nimerirăți","indicative-perfect-plural-third-person":"nimeriră","first-person-indicative-pluperfect-singular":"nimerisem","indicative-pluperfect-second-person-singular":"nimeriseși","indicative-pluperfect-singular-third-person":"nimerise","first-person-indicative-pluperfect-plural":"nimeriserăm","indicative-pluperfect-plural-second-person":"nimeriserăți","indicative-pluperfect-plural-third-person":"nimeriseră","first-person-present-singular-subjunctive":"să nimeresc","present-second-person-singular-subjunctive":"să nimerești","present-singular-subjunctive-third-person":"să nimerească","first-person-plural-present-subjunctive":"să nimerim","plural-present-second-person-subjunctive":"să nimeriți","plural-present-subjunctive-third-person":"să nimerească","imperative-second-person-singular":"nimerește","imperative-plural-second-person":"nimeriți","imperative-negative-second-person-singular":"nu nimeri","imperative-negative-plural-second-person":"nu nimeriți"}},{"word":"nimerire","pos":"noun","definitions":["hit"],"forms":{"plural":"nimeriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nimerire","accusative-definite-nominative-singular":"nimerirea","accusative-indefinite-nominative-plural":"nimeriri","accusative-definite-nominative-plural":"nimeririle","dative-genitive-indefinite-singular":"nimeriri","dative-definite-genitive-singular":"nimeririi","dative-genitive-indefinite-plural":"nimeriri","dative-definite-genitive-plural":"nimeririlor","singular-vocative":"nimerire","plural-vocative":"nimeririlor"}},{"word":"nimerit","pos":"adj","definitions":["fit for the purpose"],"forms":{"feminine-singular":"nimerită","masculine-plural":"nimeriți","feminine-neuter-plural":"nimerite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nimerit","error-unrecognized-form-feminine-indefinite-singular":"nimerită","error-unrecognized-form-indefinite-masculine-plural":"nimeriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nimerite","definite-error-unrecognized-form-masculine-neuter-singular":"nimeritul","definite-error-unrecognized-form-feminine-singular":"nimerita","definite-error-unrecognized-form-masculine-plural":"nimeriții","definite-error-unrecognized-form-feminine-neuter-plural":"nimeritele"}},{"word":"nimerit","pos":"verb","definitions":["past participle of nimeri"],"forms":{"participle-past":"of nimeri"}},{"word":"nimfă","pos":"noun","definitions":["nymph","larva of certain insects"],"pronunciation":"/ˈnim.fə/","forms":{"plural":"nimfe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nimfă","accusative-definite-nominative-singular":"nimfa","accusative-indefinite-nominative-plural":"nimfe","accusative-definite-nominative-plural":"nimfele","dative-genitive-indefinite-singular":"nimfe","dative-definite-genitive-singular":"nimfei","dative-genitive-indefinite-plural":"nimfe","dative-definite-genitive-plural":"nimfelor","singular-vocative":"nimfă","plural-vocative":"nimfelor"}},{"word":"nimfomană","pos":"noun","definitions":["nympho"],"forms":{"plural":"nimfomane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nimfomană","accusative-definite-nominative-singular":"nimfomana","accusative-indefinite-nominative-plural":"nimfomane","accusative-definite-nominative-plural":"nimfomanele","dative-genitive-indefinite-singular":"nimfomane","dative-definite-genitive-singular":"nimfomanei","dative-genitive-indefinite-plural":"nimfomane","dative-definite-genitive-plural":"nimfomanelor","singular-vocative":"nimfomană","plural-vocative":"nimfomanelor"}},{"word":"nimfomanie","pos":"noun","definitions":["nymphomania"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nimfomanie","accusative-definite-nominative-singular":"nimfomania","accusative-indefinite-nominative-plural":"nimfomanii","accusative-definite-nominative-plural":"nimfomaniile","dative-genitive-indefinite-singular":"nimfomanii","dative-definite-genitive-singular":"nimfomaniei","dative-genitive-indefinite-plural":"nimfomanii","dative-definite-genitive-plural":"nimfomaniilor","singular-vocative":"nimfomanie","plural-vocative":"nimfomaniilor"}},{"word":"nimfotomie","pos":"noun","definitions":["nymphotomy"],"forms":{"plural":"nimfotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nimfotomie","accusative-definite-nominative-singular":"nimfotomia","accusative-indefinite-nominative-plural":"nimfotomii","accusative-definite-nominative-plural":"nimfotomiile","dative-genitive-indefinite-singular":"nimfotomii","dative-definite-genitive-singular":"nimfotomiei","dative-genitive-indefinite-plural":"nimfotomii","dative-definite-genitive-plural":"nimfotomiilor","singular-vocative":"nimfotomie","plural-vocative":"nimfotomiilor"}},{"word":"nimic","pos":"pron","definitions":["nothing","anything"],"pronunciation":"/niˈmik/","examples":[{"ro":"E ușor a scrie versuri, / Când nimic nu ai a spune [...]","en":"It is easy to write verses, / When you have nothing to say …"}],"forms":{"alternative":"nimica","alternative-regional":"nemică"}},{"word":"nimica","pos":"pron","definitions":["Paragogic form of nimic (“nothing”)"]},{"word":"nimică","pos":"adv","definitions":["alternative form of nimic"]},{"word":"nimici","pos":"verb","definitions":["to destroy, annihilate, exterminate, ruin, reduce to nothing"],"forms":{"canonical":"a nimici 4th conjugation","present-singular-third-person":"nimicește","participle-past":"nimicit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nimici","gerund":"nimicind","first-person-indicative-present-singular":"nimicesc","indicative-present-second-person-singular":"nimicești","indicative-present-singular-third-person":"nimicește","first-person-indicative-plural-present":"nimicim","indicative-plural-present-second-person":"nimiciți","indicative-plural-present-third-person":"nimicesc","first-person-imperfect-indicative-singular":"nimiceam","imperfect-indicative-second-person-singular":"nimiceai","imperfect-indicative-singular-third-person":"nimicea","first-person-imperfect-indicative-plural":"nimiceam","imperfect-indicative-plural-second-person":"nimiceați","imperfect-indicative-plural-third-person":"nimiceau","first-person-indicative-perfect-singular":"nimicii","indicative-perfect-second-person-singular":"nimiciși","indicative-perfect-singular-third-person":"nimici","first-person-indicative-perfect-plural":"nimicirăm","indicative-perfect-plural-second-person":"nimicirăți","indicative-perfect-plural-third-person":"nimiciră","first-person-indicative-pluperfect-singular":"nimicisem","indicative-pluperfect-second-person-singular":"nimiciseși","indicative-pluperfect-singular-third-person":"nimicise","first-person-indicative-pluperfect-plural":"nimiciserăm","indicative-pluperfect-plural-second-person":"nimiciserăți","indicative-pluperfect-plural-third-person":"nimiciseră","first-person-present-singular-subjunctive":"să nimicesc","present-second-person-singular-subjunctive":"să nimicești","present-singular-subjunctive-third-person":"să nimicească","first-person-plural-present-subjunctive":"să nimicim","plural-present-second-person-subjunctive":"să nimiciți","plural-present-subjunctive-third-person":"să nimicească","imperative-second-person-singular":"nimicește","imperative-plural-second-person":"nimiciți","imperative-negative-second-person-singular":"nu nimici","imperative-negative-plural-second-person":"nu nimiciți"}},{"word":"nimicie","pos":"noun","definitions":["nothingness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"nimicie","accusative-definite-nominative":"nimicia","dative-genitive-indefinite":"nimicii","dative-definite-genitive":"nimiciei","vocative":"nimicie"}},{"word":"nimicire","pos":"noun","definitions":["annihilation"],"forms":{"plural":"nimiciri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nimicire","accusative-definite-nominative-singular":"nimicirea","accusative-indefinite-nominative-plural":"nimiciri","accusative-definite-nominative-plural":"nimicirile","dative-genitive-indefinite-singular":"nimiciri","dative-definite-genitive-singular":"nimicirii","dative-genitive-indefinite-plural":"nimiciri","dative-definite-genitive-plural":"nimicirilor","singular-vocative":"nimicire","plural-vocative":"nimicirilor"}},{"word":"nimicit","pos":"adj","definitions":["destroyed"],"forms":{"feminine-singular":"nimicită","masculine-plural":"nimiciți","feminine-neuter-plural":"nimicite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nimicit","error-unrecognized-form-feminine-indefinite-singular":"nimicită","error-unrecognized-form-indefinite-masculine-plural":"nimiciți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nimicite","definite-error-unrecognized-form-masculine-neuter-singular":"nimicitul","definite-error-unrecognized-form-feminine-singular":"nimicita","definite-error-unrecognized-form-masculine-plural":"nimiciții","definite-error-unrecognized-form-feminine-neuter-plural":"nimicitele"}},{"word":"nimicitor","pos":"adj","definitions":["destructive"],"pronunciation":"/nimit͡ʃiˈtor/","forms":{"feminine-singular":"nimicitoare","masculine-plural":"nimicitori","feminine-neuter-plural":"nimicitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nimicitor","error-unrecognized-form-feminine-indefinite-singular":"nimicitoare","error-unrecognized-form-indefinite-masculine-plural":"nimicitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"nimicitoare","definite-error-unrecognized-form-masculine-neuter-singular":"nimicitorul","definite-error-unrecognized-form-feminine-singular":"nimicitoarea","definite-error-unrecognized-form-masculine-plural":"nimicitorii","definite-error-unrecognized-form-feminine-neuter-plural":"nimicitoarele"}},{"word":"nimicnici","pos":"verb","definitions":["to destroy, to annihilate, to reduce to nothing"],"forms":{"canonical":"a nimicnici 4th conjugation","present-singular-third-person":"nimicnicește","participle-past":"nimicnicit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nimicnici","gerund":"nimicnicind","first-person-indicative-present-singular":"nimicnicesc","indicative-present-second-person-singular":"nimicnicești","indicative-present-singular-third-person":"nimicnicește","first-person-indicative-plural-present":"nimicnicim","indicative-plural-present-second-person":"nimicniciți","indicative-plural-present-third-person":"nimicnicesc","first-person-imperfect-indicative-singular":"nimicniceam","imperfect-indicative-second-person-singular":"nimicniceai","imperfect-indicative-singular-third-person":"nimicnicea","first-person-imperfect-indicative-plural":"nimicniceam","imperfect-indicative-plural-second-person":"nimicniceați","imperfect-indicative-plural-third-person":"nimicniceau","first-person-indicative-perfect-singular":"nimicnicii","indicative-perfect-second-person-singular":"nimicniciși","indicative-perfect-singular-third-person":"nimicnici","first-person-indicative-perfect-plural":"nimicnicirăm","indicative-perfect-plural-second-person":"nimicnicirăți","indicative-perfect-plural-third-person":"nimicniciră","first-person-indicative-pluperfect-singular":"nimicnicisem","indicative-pluperfect-second-person-singular":"nimicniciseși","indicative-pluperfect-singular-third-person":"nimicnicise","first-person-indicative-pluperfect-plural":"nimicniciserăm","indicative-pluperfect-plural-second-person":"nimicniciserăți","indicative-pluperfect-plural-third-person":"nimicniciseră","first-person-present-singular-subjunctive":"să nimicnicesc","present-second-person-singular-subjunctive":"să nimicnicești","present-singular-subjunctive-third-person":"să nimicnicească","first-person-plural-present-subjunctive":"să nimicnicim","plural-present-second-person-subjunctive":"să nimicniciți","plural-present-subjunctive-third-person":"să nimicnicească","imperative-second-person-singular":"nimicnicește","imperative-plural-second-person":"nimicniciți","imperative-negative-second-person-singular":"nu nimicnici","imperative-negative-plural-second-person":"nu nimicniciți"}},{"word":"nimicnicie","pos":"noun","definitions":["nothingness"],"forms":{"plural":"nimicnicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nimicnicie","accusative-definite-nominative-singular":"nimicnicia","accusative-indefinite-nominative-plural":"nimicnicii","accusative-definite-nominative-plural":"nimicniciile","dative-genitive-indefinite-singular":"nimicnicii","dative-definite-genitive-singular":"nimicniciei","dative-genitive-indefinite-plural":"nimicnicii","dative-definite-genitive-plural":"nimicniciilor","singular-vocative":"nimicnicie","plural-vocative":"nimicniciilor"}},{"word":"nimicnicire","pos":"noun","definitions":["destruction"],"forms":{"plural":"nimicniciri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nimicnicire","accusative-definite-nominative-singular":"nimicnicirea","accusative-indefinite-nominative-plural":"nimicniciri","accusative-definite-nominative-plural":"nimicnicirile","dative-genitive-indefinite-singular":"nimicniciri","dative-definite-genitive-singular":"nimicnicirii","dative-genitive-indefinite-plural":"nimicniciri","dative-definite-genitive-plural":"nimicnicirilor","singular-vocative":"nimicnicire","plural-vocative":"nimicnicirilor"}},{"word":"Nimigea","pos":"name","definitions":["a commune of Bistrița-Năsăud County, Romania"],"gender":"f"},{"word":"Nimigea de Jos","pos":"name","definitions":["a village in Nimigea, Bistrița-Năsăud County, Romania"],"gender":"f"},{"word":"Nimigea de Sus","pos":"name","definitions":["a village in Nimigea, Bistrița-Năsăud County, Romania"],"gender":"f"},{"word":"Nimigean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Nimigean"}},{"word":"Nimigeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Nimigeanu"}},{"word":"Nimingeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Nimingeanu"}},{"word":"nimuric","pos":"noun","definitions":["a weak person"],"forms":{"plural":"nimurici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nimuric","accusative-definite-nominative-singular":"nimuricul","accusative-indefinite-nominative-plural":"nimurici","accusative-definite-nominative-plural":"nimuricii","dative-genitive-indefinite-singular":"nimuric","dative-definite-genitive-singular":"nimuricului","dative-genitive-indefinite-plural":"nimurici","dative-definite-genitive-plural":"nimuricilor","singular-vocative":"nimuricule","plural-vocative":"nimuricilor"}},{"word":"nineacă","pos":"noun","definitions":["alternative form of neneacă"],"forms":{"plural":"nineci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nineacă","accusative-definite-nominative-singular":"nineaca","accusative-indefinite-nominative-plural":"ninece","accusative-definite-nominative-plural":"ninecele","dative-genitive-indefinite-singular":"ninece","dative-definite-genitive-singular":"ninecei","dative-genitive-indefinite-plural":"ninece","dative-definite-genitive-plural":"ninecelor","singular-vocative":"nineacă","plural-vocative":"ninecelor"}},{"word":"ninerare","pos":"noun","definitions":["caress"],"forms":{"plural":"ninerări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ninerare","accusative-definite-nominative-singular":"ninerarea","accusative-indefinite-nominative-plural":"ninerări","accusative-definite-nominative-plural":"ninerările","dative-genitive-indefinite-singular":"ninerări","dative-definite-genitive-singular":"ninerării","dative-genitive-indefinite-plural":"ninerări","dative-definite-genitive-plural":"ninerărilor","singular-vocative":"ninerare","plural-vocative":"ninerărilor"}},{"word":"ningău","pos":"noun","definitions":["a major snow, large snowfall","December"],"pronunciation":"/niŋˈɡəw/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ningău","accusative-definite-nominative":"ningăul","dative-genitive-indefinite":"ningău","dative-definite-genitive":"ningăului","vocative":"ningăule"}},{"word":"ninge","pos":"verb","definitions":["to snow"],"pronunciation":"/ˈnindʒe/","examples":[{"ro":"În această țară, iarna ninge foarte rar.","en":"In that country, it rarely snows in winter."}],"forms":{"canonical":"a ninge 3rd conjugation","present-singular-third-person":"ninge","participle-past":"nins","subjunctive-third-person":"ningă","table-tags":"conjugation-3","inflection-template":"ro-conj-e-s","infinitive":"a ninge","gerund":"ningând","first-person-indicative-present-singular":"-","indicative-present-second-person-singular":"-","indicative-present-singular-third-person":"ninge","first-person-indicative-plural-present":"-","indicative-plural-present-second-person":"-","indicative-plural-present-third-person":"-","first-person-imperfect-indicative-singular":"-","imperfect-indicative-second-person-singular":"-","imperfect-indicative-singular-third-person":"ningea","first-person-imperfect-indicative-plural":"-","imperfect-indicative-plural-second-person":"-","imperfect-indicative-plural-third-person":"-","first-person-indicative-perfect-singular":"-","indicative-perfect-second-person-singular":"-","indicative-perfect-singular-third-person":"ninse","first-person-indicative-perfect-plural":"-","indicative-perfect-plural-second-person":"-","indicative-perfect-plural-third-person":"-","first-person-indicative-pluperfect-singular":"-","indicative-pluperfect-second-person-singular":"-","indicative-pluperfect-singular-third-person":"ninsese","first-person-indicative-pluperfect-plural":"-","indicative-pluperfect-plural-second-person":"-","indicative-pluperfect-plural-third-person":"-","first-person-present-singular-subjunctive":"-","present-second-person-singular-subjunctive":"-","present-singular-subjunctive-third-person":"să ningă","first-person-plural-present-subjunctive":"-","plural-present-second-person-subjunctive":"-","plural-present-subjunctive-third-person":"-","imperative-second-person-singular":"-","imperative-plural-second-person":"-","imperative-negative-second-person-singular":"-","imperative-negative-plural-second-person":"-"}},{"word":"ningere","pos":"noun","definitions":["snowfall"],"forms":{"plural":"ningeri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ningere","accusative-definite-nominative-singular":"ningerea","accusative-indefinite-nominative-plural":"ningeri","accusative-definite-nominative-plural":"ningerile","dative-genitive-indefinite-singular":"ningeri","dative-definite-genitive-singular":"ningerii","dative-genitive-indefinite-plural":"ningeri","dative-definite-genitive-plural":"ningerilor","singular-vocative":"ningere","plural-vocative":"ningerilor"}},{"word":"Ninoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ninoiu"}},{"word":"nins","pos":"verb","definitions":["past participle of ninge: snowed"],"pronunciation":"/nins/"},{"word":"nins","pos":"adj","definitions":["snowy, covered with snow","white, hoary, gray"],"pronunciation":"/nins/","forms":{"feminine-singular":"ninsă","masculine-plural":"ninși","feminine-neuter-plural":"ninse","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nins","error-unrecognized-form-feminine-indefinite-singular":"ninsă","error-unrecognized-form-indefinite-masculine-plural":"ninși","error-unrecognized-form-feminine-indefinite-neuter-plural":"ninse","definite-error-unrecognized-form-masculine-neuter-singular":"ninsul","definite-error-unrecognized-form-feminine-singular":"ninsa","definite-error-unrecognized-form-masculine-plural":"ninșii","definite-error-unrecognized-form-feminine-neuter-plural":"ninsele"}},{"word":"ninsătură","pos":"noun","definitions":["snowfall"],"forms":{"plural":"ninsături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ninsătură","accusative-definite-nominative-singular":"ninsătura","accusative-indefinite-nominative-plural":"ninsături","accusative-definite-nominative-plural":"ninsăturile","dative-genitive-indefinite-singular":"ninsături","dative-definite-genitive-singular":"ninsăturii","dative-genitive-indefinite-plural":"ninsături","dative-definite-genitive-plural":"ninsăturilor","singular-vocative":"ninsătură","plural-vocative":"ninsăturilor"}},{"word":"ninsoare","pos":"noun","definitions":["snowfall (instance of falling of snow)","snow"],"forms":{"plural":"ninsori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ninsoare","accusative-definite-nominative-singular":"ninsoarea","accusative-indefinite-nominative-plural":"ninsori","accusative-definite-nominative-plural":"ninsorile","dative-genitive-indefinite-singular":"ninsori","dative-definite-genitive-singular":"ninsorii","dative-genitive-indefinite-plural":"ninsori","dative-definite-genitive-plural":"ninsorilor","singular-vocative":"ninsoare","plural-vocative":"ninsorilor"}},{"word":"ninsoriu","pos":"adj","definitions":["snowy"],"forms":{"feminine-singular":"ninsorie","plural":"ninsorii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ninsoriu","error-unrecognized-form-feminine-indefinite-singular":"ninsorie","error-unrecognized-form-indefinite-masculine-plural":"ninsorii","error-unrecognized-form-feminine-indefinite-neuter-plural":"ninsorii","definite-error-unrecognized-form-masculine-neuter-singular":"ninsoriul","definite-error-unrecognized-form-feminine-singular":"ninsoria","definite-error-unrecognized-form-masculine-plural":"ninsoriii","definite-error-unrecognized-form-feminine-neuter-plural":"ninsoriile"}},{"word":"ninsuriu","pos":"adj","definitions":["alternative form of ninsoriu"],"forms":{"feminine-singular":"ninsurie","plural":"ninsurii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ninsuriu","error-unrecognized-form-feminine-indefinite-singular":"ninsurie","error-unrecognized-form-indefinite-masculine-plural":"ninsurii","error-unrecognized-form-feminine-indefinite-neuter-plural":"ninsurii","definite-error-unrecognized-form-masculine-neuter-singular":"ninsuriul","definite-error-unrecognized-form-feminine-singular":"ninsuria","definite-error-unrecognized-form-masculine-plural":"ninsuriii","definite-error-unrecognized-form-feminine-neuter-plural":"ninsuriile"}},{"word":"niobit","pos":"noun","definitions":["niobite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"niobit","accusative-definite-nominative":"niobitul","dative-genitive-indefinite":"niobit","dative-definite-genitive":"niobitului","vocative":"niobitule"}},{"word":"niobiu","pos":"noun","definitions":["niobium (chemical element)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"niobiu","accusative-definite-nominative":"niobiul","dative-genitive-indefinite":"niobiu","dative-definite-genitive":"niobiului","vocative":"niobiule"}},{"word":"Niorcani","pos":"name","definitions":["a village in Tătărăuca Veche, Soroca Raion, Moldova"],"gender":"m"},{"word":"nip","pos":"noun","definitions":["people (as a large group)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nip","accusative-definite-nominative":"nipul","dative-genitive-indefinite":"nip","dative-definite-genitive":"nipului","vocative":"nipule"}},{"word":"niplu","pos":"noun","definitions":["nipple (tube)"],"forms":{"plural":"nipluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"niplu","accusative-definite-nominative-singular":"niplul","accusative-indefinite-nominative-plural":"nipluri","accusative-definite-nominative-plural":"niplurile","dative-genitive-indefinite-singular":"niplu","dative-definite-genitive-singular":"niplului","dative-genitive-indefinite-plural":"nipluri","dative-definite-genitive-plural":"niplurilor","singular-vocative":"niplule","plural-vocative":"niplurilor"}},{"word":"nipon","pos":"noun","definitions":["Japanese person"],"forms":{"plural":"niponi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nipon","accusative-definite-nominative-singular":"niponul","accusative-indefinite-nominative-plural":"niponi","accusative-definite-nominative-plural":"niponii","dative-genitive-indefinite-singular":"nipon","dative-definite-genitive-singular":"niponului","dative-genitive-indefinite-plural":"niponi","dative-definite-genitive-plural":"niponilor","singular-vocative":"niponule","plural-vocative":"niponilor"}},{"word":"niponă","pos":"noun","definitions":["female equivalent of nipon"],"forms":{"plural":"nipone","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"niponă","accusative-definite-nominative-singular":"nipona","accusative-indefinite-nominative-plural":"nipone","accusative-definite-nominative-plural":"niponele","dative-genitive-indefinite-singular":"nipone","dative-definite-genitive-singular":"niponei","dative-genitive-indefinite-plural":"nipone","dative-definite-genitive-plural":"niponelor","singular-vocative":"niponă","plural-vocative":"niponelor"}},{"word":"niprală","pos":"noun","definitions":["European yellow lupine (Lupinus luteus)"],"forms":{"plural":"niprale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"niprală","accusative-definite-nominative-singular":"niprala","accusative-indefinite-nominative-plural":"niprale","accusative-definite-nominative-plural":"nipralele","dative-genitive-indefinite-singular":"niprale","dative-definite-genitive-singular":"nipralei","dative-genitive-indefinite-plural":"niprale","dative-definite-genitive-plural":"nipralelor","singular-vocative":"niprală","plural-vocative":"nipralelor"}},{"word":"Nipru","pos":"name","definitions":["Dnieper (a river in Ukraine, Belarus, Russia)"],"gender":"m"},{"word":"Niraj","pos":"name","definitions":["a river in Mureș, Romania, tributary to the Mureș"],"gender":"m"},{"word":"Nirajul Mare","pos":"name","definitions":["a river in Mureș, Romania, tributary to the Niraj"],"gender":"m"},{"word":"Nirajul Mic","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Niraj","a river in Mureș, Romania, tributary to the Niraj"],"gender":"m"},{"word":"Nireș","pos":"name","definitions":["a village in Mica, Cluj County, Romania"],"gender":"m"},{"word":"Nireșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Nireșteanu"}},{"word":"niriște","pos":"noun","definitions":["ruined building"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"niriște","accusative-definite-nominative":"niriștea","dative-genitive-indefinite":"niriști","dative-definite-genitive":"niriștii","vocative":"niriște"}},{"word":"nirvana","pos":"noun","definitions":["nirvana"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"nirvana","accusative-definite-nominative":"nirvanaua","dative-genitive-indefinite":"-","dative-definite-genitive":"-i","vocative":"-"}},{"word":"Nisa","pos":"name","definitions":["Nice (a coastal city, the capital of Alpes-Maritimes department in the Provence-Alpes-Côte d'Azur region in southeast France)"],"gender":"f"},{"word":"nișă","pos":"noun","definitions":["niche"],"forms":{"plural":"nișe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nișă","accusative-definite-nominative-singular":"nișa","accusative-indefinite-nominative-plural":"nișe","accusative-definite-nominative-plural":"nișele","dative-genitive-indefinite-singular":"nișe","dative-definite-genitive-singular":"nișei","dative-genitive-indefinite-plural":"nișe","dative-definite-genitive-plural":"nișelor","singular-vocative":"nișă","plural-vocative":"nișelor"}},{"word":"nișadâr","pos":"noun","definitions":["ammonium chloride"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nișadâr","accusative-definite-nominative":"nișadârul","dative-genitive-indefinite":"nișadâr","dative-definite-genitive":"nișadârului","vocative":"nișadârule"}},{"word":"nișam","pos":"noun","definitions":["Ottoman decoration"],"forms":{"plural":"nișamuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nișam","accusative-definite-nominative-singular":"nișamul","accusative-indefinite-nominative-plural":"nișamuri","accusative-definite-nominative-plural":"nișamurile","dative-genitive-indefinite-singular":"nișam","dative-definite-genitive-singular":"nișamului","dative-genitive-indefinite-plural":"nișamuri","dative-definite-genitive-plural":"nișamurilor","singular-vocative":"nișamule","plural-vocative":"nișamurilor"}},{"word":"nișangiu","pos":"noun","definitions":["Ottoman court calligrapher"],"forms":{"plural":"nișangii","table-tags":"no-table-tags","inflection-template":"ro-noun-m-u","accusative-indefinite-nominative-singular":"nișangiu","accusative-definite-nominative-singular":"nișangiul","accusative-indefinite-nominative-plural":"nișangii","accusative-definite-nominative-plural":"nișangiii","dative-genitive-indefinite-singular":"nișangiu","dative-definite-genitive-singular":"nișangiului","dative-genitive-indefinite-plural":"nișangii","dative-definite-genitive-plural":"nișangiilor","singular-vocative":"nișangiule","plural-vocative":"nișangiilor"}},{"word":"nișastea","pos":"noun","definitions":["top quality wheat flour"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"nișastea","accusative-definite-nominative":"nișasteaua","dative-genitive-indefinite":"nișastele","dative-definite-genitive":"nișastelei","vocative":"-"}},{"word":"niscai","pos":"det","definitions":["something, some (of an undetermined quantity)"],"pronunciation":"/ˈnis.kaj/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"niscai","error-unrecognized-form-feminine-indefinite-singular":"niscai","error-unrecognized-form-indefinite-masculine-plural":"niscai","error-unrecognized-form-feminine-indefinite-neuter-plural":"niscai","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-","alternative-obsolete":"niscare","alternative-common":"nescaiva"}},{"word":"niscaiva","pos":"adj","definitions":["a little, few, little","some"],"pronunciation":"/nis.kajˈva/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"niscaiva","error-unrecognized-form-feminine-indefinite-singular":"niscaiva","error-unrecognized-form-indefinite-masculine-plural":"niscaiva","error-unrecognized-form-feminine-indefinite-neuter-plural":"niscaiva","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"Nișcani","pos":"name","definitions":["a village in Nișcani, Călărași Raion, Moldova","a commune of Călărași Raion, Moldova"],"gender":"m"},{"word":"Nișcov","pos":"name","definitions":["a river in Buzău, Romania, tributary to the Buzău","a village in Vernești, Buzău County, Romania"],"gender":"m"},{"word":"Nișcoveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Nișcoveanu"}},{"word":"nisetru","pos":"noun","definitions":["Russian sturgeon (Acipenser gueldenstaedtii)"],"forms":{"plural":"nisetri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nisetru","accusative-definite-nominative-singular":"nisetrul","accusative-indefinite-nominative-plural":"nisetri","accusative-definite-nominative-plural":"nisetrii","dative-genitive-indefinite-singular":"nisetru","dative-definite-genitive-singular":"nisetrului","dative-genitive-indefinite-plural":"nisetri","dative-definite-genitive-plural":"nisetrilor","singular-vocative":"nisetrule","plural-vocative":"nisetrilor"}},{"word":"nisfea","pos":"noun","definitions":["alternative form of nisfia"],"forms":{"plural":"nisfele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"nisfea","accusative-definite-nominative-singular":"nisfeaua","accusative-indefinite-nominative-plural":"nisfele","accusative-definite-nominative-plural":"nisfelele","dative-genitive-indefinite-singular":"nisfele","dative-definite-genitive-singular":"nisfelei","dative-genitive-indefinite-plural":"nisfele","dative-definite-genitive-plural":"nisfelelor","singular-vocative":"nisfea","plural-vocative":"nisfelelor"}},{"word":"Nisip","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nisip"}},{"word":"nisip","pos":"noun","definitions":["sand"],"pronunciation":"/niˈsip/","forms":{"plural":"nisipuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nisip","accusative-definite-nominative-singular":"nisipul","accusative-indefinite-nominative-plural":"nisipuri","accusative-definite-nominative-plural":"nisipurile","dative-genitive-indefinite-singular":"nisip","dative-definite-genitive-singular":"nisipului","dative-genitive-indefinite-plural":"nisipuri","dative-definite-genitive-plural":"nisipurilor","singular-vocative":"nisipule","plural-vocative":"nisipurilor"}},{"word":"nisipar","pos":"noun","definitions":["sanderling (Calidris alba)"],"forms":{"plural":"nisipari"}},{"word":"Nisipari","pos":"name","definitions":["a village in Castelu, Constanța County, Romania"],"gender":"m"},{"word":"nisipari","pos":"noun","definitions":["plural of nisipar"]},{"word":"nisipărie","pos":"noun","definitions":["gravel pit"],"forms":{"plural":"nisipării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nisipărie","accusative-definite-nominative-singular":"nisipăria","accusative-indefinite-nominative-plural":"nisipării","accusative-definite-nominative-plural":"nisipăriile","dative-genitive-indefinite-singular":"nisipării","dative-definite-genitive-singular":"nisipăriei","dative-genitive-indefinite-plural":"nisipării","dative-definite-genitive-plural":"nisipăriilor","singular-vocative":"nisipărie","plural-vocative":"nisipăriilor"}},{"word":"nisiparniță","pos":"noun","definitions":["hourglass"],"forms":{"plural":"nisiparnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nisiparniță","accusative-definite-nominative-singular":"nisiparnița","accusative-indefinite-nominative-plural":"nisiparnițe","accusative-definite-nominative-plural":"nisiparnițele","dative-genitive-indefinite-singular":"nisiparnițe","dative-definite-genitive-singular":"nisiparniței","dative-genitive-indefinite-plural":"nisiparnițe","dative-definite-genitive-plural":"nisiparnițelor","singular-vocative":"nisiparniță","plural-vocative":"nisiparnițelor"}},{"word":"Nisiparu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Nisiparu"}},{"word":"nisipeală","pos":"noun","definitions":["filling with sand"],"forms":{"plural":"nisipeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nisipeală","accusative-definite-nominative-singular":"nisipeala","accusative-indefinite-nominative-plural":"nisipele","accusative-definite-nominative-plural":"nisipelele","dative-genitive-indefinite-singular":"nisipele","dative-definite-genitive-singular":"nisipelei","dative-genitive-indefinite-plural":"nisipele","dative-definite-genitive-plural":"nisipelelor","singular-vocative":"nisipeală","plural-vocative":"nisipelelor"}},{"word":"Nisipeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Nisipeanu"}},{"word":"Nisipeni","pos":"name","definitions":["a village in Lazuri, Satu Mare County, Romania"],"gender":"m"},{"word":"nisiperniță","pos":"noun","definitions":["alternative form of nisiparniță"],"forms":{"plural":"nisipernițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nisiperniță","accusative-definite-nominative-singular":"nisipernița","accusative-indefinite-nominative-plural":"nisipernițe","accusative-definite-nominative-plural":"nisipernițele","dative-genitive-indefinite-singular":"nisipernițe","dative-definite-genitive-singular":"nisiperniței","dative-genitive-indefinite-plural":"nisipernițe","dative-definite-genitive-plural":"nisipernițelor","singular-vocative":"nisiperniță","plural-vocative":"nisipernițelor"}},{"word":"Nisipi","pos":"name","definitions":["a village in Fârtățești, Vâlcea County, Romania"],"gender":"m"},{"word":"nisipire","pos":"noun","definitions":["covering with sand"],"forms":{"plural":"nisipiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nisipire","accusative-definite-nominative-singular":"nisipirea","accusative-indefinite-nominative-plural":"nisipiri","accusative-definite-nominative-plural":"nisipirile","dative-genitive-indefinite-singular":"nisipiri","dative-definite-genitive-singular":"nisipirii","dative-genitive-indefinite-plural":"nisipiri","dative-definite-genitive-plural":"nisipirilor","singular-vocative":"nisipire","plural-vocative":"nisipirilor"}},{"word":"nisipiș","pos":"noun","definitions":["sandy place"],"forms":{"plural":"nisipișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nisipiș","accusative-definite-nominative-singular":"nisipișul","accusative-indefinite-nominative-plural":"nisipișuri","accusative-definite-nominative-plural":"nisipișurile","dative-genitive-indefinite-singular":"nisipiș","dative-definite-genitive-singular":"nisipișului","dative-genitive-indefinite-plural":"nisipișuri","dative-definite-genitive-plural":"nisipișurilor","singular-vocative":"nisipișule","plural-vocative":"nisipișurilor"}},{"word":"nisipiște","pos":"noun","definitions":["sandy place"],"forms":{"plural":"nisipiști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nisipiște","accusative-definite-nominative-singular":"nisipiștea","accusative-indefinite-nominative-plural":"nisipiști","accusative-definite-nominative-plural":"nisipiștile","dative-genitive-indefinite-singular":"nisipiști","dative-definite-genitive-singular":"nisipiștii","dative-genitive-indefinite-plural":"nisipiști","dative-definite-genitive-plural":"nisipiștilor","singular-vocative":"nisipiște","plural-vocative":"nisipiștilor"}},{"word":"nisipit","pos":"adj","definitions":["sandy"],"forms":{"feminine-singular":"nisipită","masculine-plural":"nisipiți","feminine-neuter-plural":"nisipite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nisipit","error-unrecognized-form-feminine-indefinite-singular":"nisipită","error-unrecognized-form-indefinite-masculine-plural":"nisipiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nisipite","definite-error-unrecognized-form-masculine-neuter-singular":"nisipitul","definite-error-unrecognized-form-feminine-singular":"nisipita","definite-error-unrecognized-form-masculine-plural":"nisipiții","definite-error-unrecognized-form-feminine-neuter-plural":"nisipitele"}},{"word":"Nisipitu","pos":"name","definitions":["a village in Ulma, Suceava County, Romania"],"gender":"m"},{"word":"nisipiu","pos":"adj","definitions":["sand-colored"],"forms":{"feminine-singular":"nisipie","plural":"nisipii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nisipiu","error-unrecognized-form-feminine-indefinite-singular":"nisipie","error-unrecognized-form-indefinite-masculine-plural":"nisipii","error-unrecognized-form-feminine-indefinite-neuter-plural":"nisipii","definite-error-unrecognized-form-masculine-neuter-singular":"nisipiul","definite-error-unrecognized-form-feminine-singular":"nisipia","definite-error-unrecognized-form-masculine-plural":"nisipiii","definite-error-unrecognized-form-feminine-neuter-plural":"nisipiile"}},{"word":"Nisipoasa","pos":"name","definitions":["a village in Plopu, Prahova County, Romania"],"gender":"f"},{"word":"nisipos","pos":"adj","definitions":["sandy"],"pronunciation":"/ni.siˈpos/","forms":{"feminine-singular":"nisipoasă","masculine-plural":"nisipoși","feminine-neuter-plural":"nisipoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nisipos","error-unrecognized-form-feminine-indefinite-singular":"nisipoasă","error-unrecognized-form-indefinite-masculine-plural":"nisipoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nisipoase","definite-error-unrecognized-form-masculine-neuter-singular":"nisiposul","definite-error-unrecognized-form-feminine-singular":"nisipoasa","definite-error-unrecognized-form-masculine-plural":"nisipoșii","definite-error-unrecognized-form-feminine-neuter-plural":"nisipoasele"}},{"word":"Nisipu","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Valea Glăjăriei"],"gender":"m"},{"word":"nisipului","pos":"noun","definitions":["definite genitive/dative singular of nisip"]},{"word":"Nisipuri","pos":"name","definitions":["a village in Dobrotești, Dolj County, Romania"],"gender":"m"},{"word":"nisipuri","pos":"noun","definitions":["plural of nisip"]},{"word":"Nisipurile","pos":"name","definitions":["a village in Ulmi, Dâmbovița County, Romania"],"gender":"n"},{"word":"Nisporeni","pos":"name","definitions":["a raion of Moldova","a town in Nisporeni Raion, Moldova"],"gender":"m"},{"word":"nistagmus","pos":"noun","definitions":["nystagmus"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nistagmus","accusative-definite-nominative":"nistagmusul","dative-genitive-indefinite":"nistagmus","dative-definite-genitive":"nistagmusului","vocative":"nistagmusule"}},{"word":"niște","pos":"article","definitions":["some","any"],"pronunciation":"/ˈniʃ.te/","examples":[{"ro":"ei sunt niște bărbați","en":"they are some men"},{"ro":"ai niște mere?","en":"do you have any apples?"}],"forms":{"alternative":"ниште"}},{"word":"nișter","pos":"noun","definitions":["lancet"],"forms":{"plural":"niștere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nișter","accusative-definite-nominative-singular":"nișterul","accusative-indefinite-nominative-plural":"niștere","accusative-definite-nominative-plural":"nișterele","dative-genitive-indefinite-singular":"nișter","dative-definite-genitive-singular":"nișterului","dative-genitive-indefinite-plural":"niștere","dative-definite-genitive-plural":"nișterelor","singular-vocative":"nișterule","plural-vocative":"nișterelor"}},{"word":"Nistoi","pos":"name","definitions":["a village in Tălpaș, Dolj County, Romania"],"gender":"m"},{"word":"Nistor","pos":"name","definitions":["a male given name","a surname"],"gender":"m"},{"word":"Nistora","pos":"name","definitions":["a river in Neamț County, Romania, tributary to the Culeșa"],"gender":"f"},{"word":"Nistoran","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Nistoran"}},{"word":"Nistoraș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nistoraș"}},{"word":"Nistoreasa","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"f"},{"word":"Nistorel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nistorel"}},{"word":"Nistorescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nistorescu"}},{"word":"Nistorești","pos":"name","definitions":["a village in Cozieni, Buzău County, Romania","a village in Pantelimon, Constanța County, Romania","a village in Alimpești, Gorj County, Romania","a locality in Breaza, Prahova County, Romania","a commune of Vrancea County, Romania"],"gender":"m"},{"word":"Nistorică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nistorică"}},{"word":"Nistoroaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Nistoroaia"}},{"word":"Nistoroi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nistoroi"}},{"word":"Nistoroiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nistoroiu"}},{"word":"niștotă","pos":"noun","definitions":["poverty"],"forms":{"plural":"niștote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"niștotă","accusative-definite-nominative-singular":"niștota","accusative-indefinite-nominative-plural":"niștote","accusative-definite-nominative-plural":"niștotele","dative-genitive-indefinite-singular":"niștote","dative-definite-genitive-singular":"niștotei","dative-genitive-indefinite-plural":"niștote","dative-definite-genitive-plural":"niștotelor","singular-vocative":"niștotă","plural-vocative":"niștotelor"}},{"word":"Nistrean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Nistrean"}},{"word":"nistreană","pos":"noun","definitions":["female equivalent of nistrean"],"forms":{"plural":"nistrene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nistreană","accusative-definite-nominative-singular":"nistreana","accusative-indefinite-nominative-plural":"nistrene","accusative-definite-nominative-plural":"nistrenele","dative-genitive-indefinite-singular":"nistrene","dative-definite-genitive-singular":"nistrenei","dative-genitive-indefinite-plural":"nistrene","dative-definite-genitive-plural":"nistrenelor","singular-vocative":"nistreană","plural-vocative":"nistrenelor"}},{"word":"Nistreanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Nistreanu"}},{"word":"Nistreni","pos":"name","definitions":["a village in Lalova, Rezina Raion, Moldova"],"gender":"m"},{"word":"Nistrian","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Nistrian","alternative":"Нистрян"}},{"word":"Nistru","pos":"name","definitions":["Dniester (a river in Ukraine and Moldova)"],"pronunciation":"/ˈnis.tru/","gender":"m","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m-u","accusative-indefinite-nominative":"Nistru","accusative-definite-nominative":"Nistrul","dative-genitive-indefinite":"Nistru","dative-definite-genitive":"Nistrului","vocative":"Nistrule","alternative":"Нистру"}},{"word":"Nistrule","pos":"noun","definitions":["vocative of Nistru"],"pronunciation":"/ˈnis.tru.le/","gender":"m"},{"word":"Nișulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nișulescu"}},{"word":"nit","pos":"noun","definitions":["rivet"],"forms":{"plural":"nituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nit","accusative-definite-nominative-singular":"nitul","accusative-indefinite-nominative-plural":"nituri","accusative-definite-nominative-plural":"niturile","dative-genitive-indefinite-singular":"nit","dative-definite-genitive-singular":"nitului","dative-genitive-indefinite-plural":"nituri","dative-definite-genitive-plural":"niturilor","singular-vocative":"nitule","plural-vocative":"niturilor"}},{"word":"Nița","pos":"name","definitions":["a surname"],"gender":"f"},{"word":"Niță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Niță"}},{"word":"nitam-nisam","pos":"adv","definitions":["unexpectedly, inappropriately"]},{"word":"Nițaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nițaș"}},{"word":"Nițchidorf","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Nițchidorf, Timiș County, Romania"],"gender":"m"},{"word":"Nițel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nițel"}},{"word":"nițel","pos":"adv","definitions":["a little"]},{"word":"nițel","pos":"adj","definitions":["little, few, small amount of"],"forms":{"feminine-singular":"nițică","masculine-plural":"niței","feminine-plural":"nițele"}},{"word":"nițeluș","pos":"adj","definitions":["diminutive of nițel"],"forms":{"feminine-singular":"nițelușă","masculine-plural":"nițeluși","feminine-neuter-plural":"nițelușe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nițeluș","error-unrecognized-form-feminine-indefinite-singular":"nițelușă","error-unrecognized-form-indefinite-masculine-plural":"nițeluși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nițelușe","definite-error-unrecognized-form-masculine-neuter-singular":"nițelușul","definite-error-unrecognized-form-feminine-singular":"nițelușa","definite-error-unrecognized-form-masculine-plural":"nițelușii","definite-error-unrecognized-form-feminine-neuter-plural":"nițelușele"}},{"word":"Nițescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nițescu"}},{"word":"nithamer","pos":"noun","definitions":["riveting hammer"],"forms":{"plural":"nithamere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nithamer","accusative-definite-nominative-singular":"nithamerul","accusative-indefinite-nominative-plural":"nithamere","accusative-definite-nominative-plural":"nithamerele","dative-genitive-indefinite-singular":"nithamer","dative-definite-genitive-singular":"nithamerului","dative-genitive-indefinite-plural":"nithamere","dative-definite-genitive-plural":"nithamerelor","singular-vocative":"nithamerule","plural-vocative":"nithamerelor"}},{"word":"Nițică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nițică"}},{"word":"Nițoae","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Nițoae"}},{"word":"Nițoaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Nițoaia"}},{"word":"Nițoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nițoiu"}},{"word":"nitra","pos":"verb","definitions":["to nitrate"],"forms":{"canonical":"a nitra 1st conjugation","present-singular-third-person":"nitrează","participle-past":"nitrat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a nitra","gerund":"nitrând","first-person-indicative-present-singular":"nitrez","indicative-present-second-person-singular":"nitrezi","indicative-present-singular-third-person":"nitrează","first-person-indicative-plural-present":"nitrăm","indicative-plural-present-second-person":"nitrați","indicative-plural-present-third-person":"nitrează","first-person-imperfect-indicative-singular":"nitram","imperfect-indicative-second-person-singular":"nitrai","imperfect-indicative-singular-third-person":"nitra","first-person-imperfect-indicative-plural":"nitram","imperfect-indicative-plural-second-person":"nitrați","imperfect-indicative-plural-third-person":"nitrau","first-person-indicative-perfect-singular":"nitrai","indicative-perfect-second-person-singular":"nitrași","indicative-perfect-singular-third-person":"nitră","first-person-indicative-perfect-plural":"nitrarăm","indicative-perfect-plural-second-person":"nitrarăți","indicative-perfect-plural-third-person":"nitrară","first-person-indicative-pluperfect-singular":"nitrasem","indicative-pluperfect-second-person-singular":"nitraseși","indicative-pluperfect-singular-third-person":"nitrase","first-person-indicative-pluperfect-plural":"nitraserăm","indicative-pluperfect-plural-second-person":"nitraserăți","indicative-pluperfect-plural-third-person":"nitraseră","first-person-present-singular-subjunctive":"să nitrez","present-second-person-singular-subjunctive":"să nitrezi","present-singular-subjunctive-third-person":"să nitreze","first-person-plural-present-subjunctive":"să nitrăm","plural-present-second-person-subjunctive":"să nitrați","plural-present-subjunctive-third-person":"să nitreze","imperative-second-person-singular":"nitrează","imperative-plural-second-person":"nitrați","imperative-negative-second-person-singular":"nu nitra","imperative-negative-plural-second-person":"nu nitrați"}},{"word":"nitrare","pos":"noun","definitions":["nitration"],"forms":{"plural":"nitrări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nitrare","accusative-definite-nominative-singular":"nitrarea","accusative-indefinite-nominative-plural":"nitrări","accusative-definite-nominative-plural":"nitrările","dative-genitive-indefinite-singular":"nitrări","dative-definite-genitive-singular":"nitrării","dative-genitive-indefinite-plural":"nitrări","dative-definite-genitive-plural":"nitrărilor","singular-vocative":"nitrare","plural-vocative":"nitrărilor"}},{"word":"nitrărie","pos":"noun","definitions":["nitrary"],"forms":{"plural":"nitrării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nitrărie","accusative-definite-nominative-singular":"nitrăria","accusative-indefinite-nominative-plural":"nitrării","accusative-definite-nominative-plural":"nitrăriile","dative-genitive-indefinite-singular":"nitrării","dative-definite-genitive-singular":"nitrăriei","dative-genitive-indefinite-plural":"nitrării","dative-definite-genitive-plural":"nitrăriilor","singular-vocative":"nitrărie","plural-vocative":"nitrăriilor"}},{"word":"nitrat","pos":"noun","definitions":["nitrate"],"forms":{"plural":"nitrați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nitrat","accusative-definite-nominative-singular":"nitratul","accusative-indefinite-nominative-plural":"nitrați","accusative-definite-nominative-plural":"nitrații","dative-genitive-indefinite-singular":"nitrat","dative-definite-genitive-singular":"nitratului","dative-genitive-indefinite-plural":"nitrați","dative-definite-genitive-plural":"nitraților","singular-vocative":"nitratule","plural-vocative":"nitraților"}},{"word":"nitrat de amoniu","pos":"noun","definitions":["ammonium nitrate"]},{"word":"nitrat de argint","pos":"noun","definitions":["silver nitrate"]},{"word":"nitrat de celuloză","pos":"noun","definitions":["cellulose nitrate"]},{"word":"nitrați","pos":"noun","definitions":["plural of nitrat"]},{"word":"nitrație","pos":"noun","definitions":["nitration"],"forms":{"plural":"nitrații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nitrație","accusative-definite-nominative-singular":"nitrația","accusative-indefinite-nominative-plural":"nitrații","accusative-definite-nominative-plural":"nitrațiile","dative-genitive-indefinite-singular":"nitrații","dative-definite-genitive-singular":"nitrației","dative-genitive-indefinite-plural":"nitrații","dative-definite-genitive-plural":"nitrațiilor","singular-vocative":"nitrație","plural-vocative":"nitrațiilor"}},{"word":"nitric","pos":"adj","definitions":["nitric"],"forms":{"feminine-singular":"nitrică","masculine-plural":"nitrici","feminine-neuter-plural":"nitrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nitric","error-unrecognized-form-feminine-indefinite-singular":"nitrică","error-unrecognized-form-indefinite-masculine-plural":"nitrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nitrice","definite-error-unrecognized-form-masculine-neuter-singular":"nitricul","definite-error-unrecognized-form-feminine-singular":"nitrica","definite-error-unrecognized-form-masculine-plural":"nitricii","definite-error-unrecognized-form-feminine-neuter-plural":"nitricele"}},{"word":"nitrieră","pos":"noun","definitions":["nitrary"],"forms":{"plural":"nitriere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nitrieră","accusative-definite-nominative-singular":"nitriera","accusative-indefinite-nominative-plural":"nitriere","accusative-definite-nominative-plural":"nitrierele","dative-genitive-indefinite-singular":"nitriere","dative-definite-genitive-singular":"nitrierei","dative-genitive-indefinite-plural":"nitriere","dative-definite-genitive-plural":"nitrierelor","singular-vocative":"nitrieră","plural-vocative":"nitrierelor"}},{"word":"nitrifica","pos":"verb","definitions":["to nitrify"],"forms":{"canonical":"a nitrifica 1st conjugation","present-singular-third-person":"nitrifică","participle-past":"nitrificat","subjunctive-third-person":"nitrifice","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a nitrifica","gerund":"nitrificând","first-person-indicative-present-singular":"nitrific","indicative-present-second-person-singular":"nitrifici","indicative-present-singular-third-person":"nitrifică","first-person-indicative-plural-present":"nitrificăm","indicative-plural-present-second-person":"nitrificați","indicative-plural-present-third-person":"nitrifică","first-person-imperfect-indicative-singular":"nitrificam","imperfect-indicative-second-person-singular":"nitrificai","imperfect-indicative-singular-third-person":"nitrifica","first-person-imperfect-indicative-plural":"nitrificam","imperfect-indicative-plural-second-person":"nitrificați","imperfect-indicative-plural-third-person":"nitrificau","first-person-indicative-perfect-singular":"nitrificai","indicative-perfect-second-person-singular":"nitrificași","indicative-perfect-singular-third-person":"nitrifică","first-person-indicative-perfect-plural":"nitrificarăm","indicative-perfect-plural-second-person":"nitrificarăți","indicative-perfect-plural-third-person":"nitrificară","first-person-indicative-pluperfect-singular":"nitrificasem","indicative-pluperfect-second-person-singular":"nitrificaseși","indicative-pluperfect-singular-third-person":"nitrificase","first-person-indicative-pluperfect-plural":"nitrificaserăm","indicative-pluperfect-plural-second-person":"nitrificaserăți","indicative-pluperfect-plural-third-person":"nitrificaseră","first-person-present-singular-subjunctive":"să nitrific","present-second-person-singular-subjunctive":"să nitrifici","present-singular-subjunctive-third-person":"să nitrifice","first-person-plural-present-subjunctive":"să nitrificăm","plural-present-second-person-subjunctive":"să nitrificați","plural-present-subjunctive-third-person":"să nitrifice","imperative-second-person-singular":"nitrifică","imperative-plural-second-person":"nitrificați","imperative-negative-second-person-singular":"nu nitrifica","imperative-negative-plural-second-person":"nu nitrificați"}},{"word":"nitrificare","pos":"noun","definitions":["nitrification"],"forms":{"plural":"nitrificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nitrificare","accusative-definite-nominative-singular":"nitrificarea","accusative-indefinite-nominative-plural":"nitrificări","accusative-definite-nominative-plural":"nitrificările","dative-genitive-indefinite-singular":"nitrificări","dative-definite-genitive-singular":"nitrificării","dative-genitive-indefinite-plural":"nitrificări","dative-definite-genitive-plural":"nitrificărilor","singular-vocative":"nitrificare","plural-vocative":"nitrificărilor"}},{"word":"nitrificație","pos":"noun","definitions":["nitrification"],"forms":{"plural":"nitrifîcații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nitrificație","accusative-definite-nominative-singular":"nitrificația","accusative-indefinite-nominative-plural":"nitrificații","accusative-definite-nominative-plural":"nitrificațiile","dative-genitive-indefinite-singular":"nitrificații","dative-definite-genitive-singular":"nitrificației","dative-genitive-indefinite-plural":"nitrificații","dative-definite-genitive-plural":"nitrificațiilor","singular-vocative":"nitrificație","plural-vocative":"nitrificațiilor"}},{"word":"nitrificator","pos":"adj","definitions":["nitrifier"],"forms":{"feminine-singular":"nitrificatoare","masculine-plural":"nitrificatori","feminine-neuter-plural":"nitrificatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nitrificator","error-unrecognized-form-feminine-indefinite-singular":"nitrificatoare","error-unrecognized-form-indefinite-masculine-plural":"nitrificatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"nitrificatoare","definite-error-unrecognized-form-masculine-neuter-singular":"nitrificatorul","definite-error-unrecognized-form-feminine-singular":"nitrificatoarea","definite-error-unrecognized-form-masculine-plural":"nitrificatorii","definite-error-unrecognized-form-feminine-neuter-plural":"nitrificatoarele"}},{"word":"nitril","pos":"noun","definitions":["nitrile"],"forms":{"plural":"nitrili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nitril","accusative-definite-nominative-singular":"nitrilul","accusative-indefinite-nominative-plural":"nitrili","accusative-definite-nominative-plural":"nitrilii","dative-genitive-indefinite-singular":"nitril","dative-definite-genitive-singular":"nitrilului","dative-genitive-indefinite-plural":"nitrili","dative-definite-genitive-plural":"nitrililor","singular-vocative":"nitrilule","plural-vocative":"nitrililor"}},{"word":"nitrit","pos":"noun","definitions":["nitrite"],"forms":{"plural":"nitriți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nitrit","accusative-definite-nominative-singular":"nitritul","accusative-indefinite-nominative-plural":"nitriți","accusative-definite-nominative-plural":"nitriții","dative-genitive-indefinite-singular":"nitrit","dative-definite-genitive-singular":"nitritului","dative-genitive-indefinite-plural":"nitriți","dative-definite-genitive-plural":"nitriților","singular-vocative":"nitritule","plural-vocative":"nitriților"}},{"word":"nitrobacterie","pos":"noun","definitions":["nitrobacteria"],"forms":{"plural":"nitrobacterii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nitrobacterie","accusative-definite-nominative-singular":"nitrobacteria","accusative-indefinite-nominative-plural":"nitrobacterii","accusative-definite-nominative-plural":"nitrobacteriile","dative-genitive-indefinite-singular":"nitrobacterii","dative-definite-genitive-singular":"nitrobacteriei","dative-genitive-indefinite-plural":"nitrobacterii","dative-definite-genitive-plural":"nitrobacteriilor","singular-vocative":"nitrobacterie","plural-vocative":"nitrobacteriilor"}},{"word":"nitrobenzen","pos":"noun","definitions":["nitrobenzene"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"nitrobenzen","accusative-definite-nominative":"nitrobenzenul","dative-genitive-indefinite":"nitrobenzen","dative-definite-genitive":"nitrobenzenului","vocative":"nitrobenzenule"}},{"word":"nitroceluloză","pos":"noun","definitions":["nitrocellulose"],"forms":{"plural":"nitroceluloze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nitroceluloză","accusative-definite-nominative-singular":"nitroceluloza","accusative-indefinite-nominative-plural":"nitroceluloze","accusative-definite-nominative-plural":"nitrocelulozele","dative-genitive-indefinite-singular":"nitroceluloze","dative-definite-genitive-singular":"nitrocelulozei","dative-genitive-indefinite-plural":"nitroceluloze","dative-definite-genitive-plural":"nitrocelulozelor","singular-vocative":"nitroceluloză","plural-vocative":"nitrocelulozelor"}},{"word":"nitroderivat","pos":"noun","definitions":["nitro compound"],"forms":{"plural":"nitroderivați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nitroderivat","accusative-definite-nominative-singular":"nitroderivatul","accusative-indefinite-nominative-plural":"nitroderivați","accusative-definite-nominative-plural":"nitroderivații","dative-genitive-indefinite-singular":"nitroderivat","dative-definite-genitive-singular":"nitroderivatului","dative-genitive-indefinite-plural":"nitroderivați","dative-definite-genitive-plural":"nitroderivaților","singular-vocative":"nitroderivatule","plural-vocative":"nitroderivaților"}},{"word":"nitrogen","pos":"noun","definitions":["nitrogen (chemical element)"],"pronunciation":"/ˌni.troˈd͡ʒen/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"nitrogen","accusative-definite-nominative":"nitrogenul","dative-genitive-indefinite":"nitrogen","dative-definite-genitive":"nitrogenului","vocative":"nitrogenule"}},{"word":"nitrogen lichid","pos":"noun","definitions":["liquid nitrogen"]},{"word":"nitroglicerină","pos":"noun","definitions":["nitroglycerine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nitroglicerină","accusative-definite-nominative-singular":"nitroglicerina","accusative-indefinite-nominative-plural":"nitroglicerine","accusative-definite-nominative-plural":"nitroglicerinele","dative-genitive-indefinite-singular":"nitroglicerine","dative-definite-genitive-singular":"nitroglicerinei","dative-genitive-indefinite-plural":"nitroglicerine","dative-definite-genitive-plural":"nitroglicerinelor","singular-vocative":"nitroglicerină","plural-vocative":"nitroglicerinelor"}},{"word":"nitrometan","pos":"noun","definitions":["nitromethane"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nitrometan","accusative-definite-nominative":"nitrometanul","dative-genitive-indefinite":"nitrometan","dative-definite-genitive":"nitrometanului","vocative":"nitrometanule"}},{"word":"nitrometru","pos":"noun","definitions":["nitrometer"],"forms":{"plural":"nitrometri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nitrometru","accusative-definite-nominative-singular":"nitrometruul","accusative-indefinite-nominative-plural":"nitrometri","accusative-definite-nominative-plural":"nitrometrii","dative-genitive-indefinite-singular":"nitrometru","dative-definite-genitive-singular":"nitrometruului","dative-genitive-indefinite-plural":"nitrometri","dative-definite-genitive-plural":"nitrometrilor","singular-vocative":"nitrometruule","plural-vocative":"nitrometrilor"}},{"word":"nitronatrit","pos":"noun","definitions":["nitratine"],"forms":{"plural":"nitronatriți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nitronatrit","accusative-definite-nominative-singular":"nitronatritul","accusative-indefinite-nominative-plural":"nitronatriți","accusative-definite-nominative-plural":"nitronatriții","dative-genitive-indefinite-singular":"nitronatrit","dative-definite-genitive-singular":"nitronatritului","dative-genitive-indefinite-plural":"nitronatriți","dative-definite-genitive-plural":"nitronatriților","singular-vocative":"nitronatritule","plural-vocative":"nitronatriților"}},{"word":"nitros","pos":"adj","definitions":["nitrous"],"forms":{"feminine-singular":"nitroasă","masculine-plural":"nitroși","feminine-neuter-plural":"nitroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nitros","error-unrecognized-form-feminine-indefinite-singular":"nitroasă","error-unrecognized-form-indefinite-masculine-plural":"nitroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nitroase","definite-error-unrecognized-form-masculine-neuter-singular":"nitrosul","definite-error-unrecognized-form-feminine-singular":"nitroasa","definite-error-unrecognized-form-masculine-plural":"nitroșii","definite-error-unrecognized-form-feminine-neuter-plural":"nitroasele"}},{"word":"nitrotoluen","pos":"noun","definitions":["nitrotoluene"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nitrotoluen","accusative-definite-nominative-singular":"nitrotoluenul","accusative-indefinite-nominative-plural":"nitrotoluene","accusative-definite-nominative-plural":"nitrotoluenele","dative-genitive-indefinite-singular":"nitrotoluen","dative-definite-genitive-singular":"nitrotoluenului","dative-genitive-indefinite-plural":"nitrotoluene","dative-definite-genitive-plural":"nitrotoluenelor","singular-vocative":"nitrotoluenule","plural-vocative":"nitrotoluenelor"}},{"word":"nitrozare","pos":"noun","definitions":["nitrosation"],"forms":{"plural":"nitrozări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nitrozare","accusative-definite-nominative-singular":"nitrozarea","accusative-indefinite-nominative-plural":"nitrozări","accusative-definite-nominative-plural":"nitrozările","dative-genitive-indefinite-singular":"nitrozări","dative-definite-genitive-singular":"nitrozării","dative-genitive-indefinite-plural":"nitrozări","dative-definite-genitive-plural":"nitrozărilor","singular-vocative":"nitrozare","plural-vocative":"nitrozărilor"}},{"word":"nitrura","pos":"verb","definitions":["to nitride"],"forms":{"canonical":"a nitrura 1st conjugation","present-singular-third-person":"nitrurează","participle-past":"nitrurat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a nitrura","gerund":"nitrurând","first-person-indicative-present-singular":"nitrurez","indicative-present-second-person-singular":"nitrurezi","indicative-present-singular-third-person":"nitrurează","first-person-indicative-plural-present":"nitrurăm","indicative-plural-present-second-person":"nitrurați","indicative-plural-present-third-person":"nitrurează","first-person-imperfect-indicative-singular":"nitruram","imperfect-indicative-second-person-singular":"nitrurai","imperfect-indicative-singular-third-person":"nitrura","first-person-imperfect-indicative-plural":"nitruram","imperfect-indicative-plural-second-person":"nitrurați","imperfect-indicative-plural-third-person":"nitrurau","first-person-indicative-perfect-singular":"nitrurai","indicative-perfect-second-person-singular":"nitrurași","indicative-perfect-singular-third-person":"nitrură","first-person-indicative-perfect-plural":"nitrurarăm","indicative-perfect-plural-second-person":"nitrurarăți","indicative-perfect-plural-third-person":"nitrurară","first-person-indicative-pluperfect-singular":"nitrurasem","indicative-pluperfect-second-person-singular":"nitruraseși","indicative-pluperfect-singular-third-person":"nitrurase","first-person-indicative-pluperfect-plural":"nitruraserăm","indicative-pluperfect-plural-second-person":"nitruraserăți","indicative-pluperfect-plural-third-person":"nitruraseră","first-person-present-singular-subjunctive":"să nitrurez","present-second-person-singular-subjunctive":"să nitrurezi","present-singular-subjunctive-third-person":"să nitrureze","first-person-plural-present-subjunctive":"să nitrurăm","plural-present-second-person-subjunctive":"să nitrurați","plural-present-subjunctive-third-person":"să nitrureze","imperative-second-person-singular":"nitrurează","imperative-plural-second-person":"nitrurați","imperative-negative-second-person-singular":"nu nitrura","imperative-negative-plural-second-person":"nu nitrurați"}},{"word":"nitrură","pos":"noun","definitions":["nitride"],"forms":{"plural":"nitruri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"nitrură","accusative-definite-nominative-singular":"nitrura","accusative-indefinite-nominative-plural":"nitruri","accusative-definite-nominative-plural":"nitrurile","dative-genitive-indefinite-singular":"nitruri","dative-definite-genitive-singular":"nitrurii","dative-genitive-indefinite-plural":"nitruri","dative-definite-genitive-plural":"nitrurilor","singular-vocative":"nitrură","plural-vocative":"nitrurilor"}},{"word":"nitrurare","pos":"noun","definitions":["nitriding"],"forms":{"plural":"nitrurări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nitrurare","accusative-definite-nominative-singular":"nitrurarea","accusative-indefinite-nominative-plural":"nitrurări","accusative-definite-nominative-plural":"nitrurările","dative-genitive-indefinite-singular":"nitrurări","dative-definite-genitive-singular":"nitrurării","dative-genitive-indefinite-plural":"nitrurări","dative-definite-genitive-plural":"nitrurărilor","singular-vocative":"nitrurare","plural-vocative":"nitrurărilor"}},{"word":"Nițucă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nițucă"}},{"word":"nitui","pos":"verb","definitions":["to rivet"],"forms":{"canonical":"a nitui 4th conjugation","present-singular-third-person":"nituiește","participle-past":"nituit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nitui","gerund":"nituind","first-person-indicative-present-singular":"nituiesc","indicative-present-second-person-singular":"nituiești","indicative-present-singular-third-person":"nituiește","first-person-indicative-plural-present":"nituim","indicative-plural-present-second-person":"nituiți","indicative-plural-present-third-person":"nituiesc","first-person-imperfect-indicative-singular":"nituiam","imperfect-indicative-second-person-singular":"nituiai","imperfect-indicative-singular-third-person":"nituia","first-person-imperfect-indicative-plural":"nituiam","imperfect-indicative-plural-second-person":"nituiați","imperfect-indicative-plural-third-person":"nituiau","first-person-indicative-perfect-singular":"nituii","indicative-perfect-second-person-singular":"nituiși","indicative-perfect-singular-third-person":"nitui","first-person-indicative-perfect-plural":"nituirăm","indicative-perfect-plural-second-person":"nituirăți","indicative-perfect-plural-third-person":"nituiră","first-person-indicative-pluperfect-singular":"nituisem","indicative-pluperfect-second-person-singular":"nituiseși","indicative-pluperfect-singular-third-person":"nituise","first-person-indicative-pluperfect-plural":"nituiserăm","indicative-pluperfect-plural-second-person":"nituiserăți","indicative-pluperfect-plural-third-person":"nituiseră","first-person-present-singular-subjunctive":"să nituiesc","present-second-person-singular-subjunctive":"să nituiești","present-singular-subjunctive-third-person":"să nituiască","first-person-plural-present-subjunctive":"să nituim","plural-present-second-person-subjunctive":"să nituiți","plural-present-subjunctive-third-person":"să nituiască","imperative-second-person-singular":"nituiește","imperative-plural-second-person":"nituiți","imperative-negative-second-person-singular":"nu nitui","imperative-negative-plural-second-person":"nu nituiți"}},{"word":"Nițuică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nițuică"}},{"word":"nituire","pos":"noun","definitions":["riveting"],"forms":{"plural":"nituiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nituire","accusative-definite-nominative-singular":"nituirea","accusative-indefinite-nominative-plural":"nituiri","accusative-definite-nominative-plural":"nituirile","dative-genitive-indefinite-singular":"nituiri","dative-definite-genitive-singular":"nituirii","dative-genitive-indefinite-plural":"nituiri","dative-definite-genitive-plural":"nituirilor","singular-vocative":"nituire","plural-vocative":"nituirilor"}},{"word":"nituit","pos":"noun","definitions":["riveting"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nituit","accusative-definite-nominative":"nituitul","dative-genitive-indefinite":"nituit","dative-definite-genitive":"nituitului","vocative":"nituitule"}},{"word":"nituit","pos":"verb","definitions":["past participle of nitui"],"forms":{"participle-past":"of nitui"}},{"word":"nituitoare","pos":"noun","definitions":["female equivalent of nituitor"],"forms":{"plural":"nituitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"nituitoare","accusative-definite-nominative-singular":"nituitoarea","accusative-indefinite-nominative-plural":"nituitoare","accusative-definite-nominative-plural":"nituitoarele","dative-genitive-indefinite-singular":"nituitoare","dative-definite-genitive-singular":"nituitoarei","dative-genitive-indefinite-plural":"nituitoare","dative-definite-genitive-plural":"nituitoarelor","singular-vocative":"nituitoare","plural-vocative":"nituitoarelor"}},{"word":"nituitor","pos":"noun","definitions":["rivetter"],"forms":{"plural":"nituitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nituitor","accusative-definite-nominative-singular":"nituitorul","accusative-indefinite-nominative-plural":"nituitori","accusative-definite-nominative-plural":"nituitorii","dative-genitive-indefinite-singular":"nituitor","dative-definite-genitive-singular":"nituitorului","dative-genitive-indefinite-plural":"nituitori","dative-definite-genitive-plural":"nituitorilor","singular-vocative":"nituitorule","plural-vocative":"nituitorilor"}},{"word":"nituitură","pos":"noun","definitions":["riveting"],"forms":{"plural":"nituituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nituitură","accusative-definite-nominative-singular":"nituitura","accusative-indefinite-nominative-plural":"nituiture","accusative-definite-nominative-plural":"nituiturele","dative-genitive-indefinite-singular":"nituiture","dative-definite-genitive-singular":"nituiturei","dative-genitive-indefinite-plural":"nituiture","dative-definite-genitive-plural":"nituiturelor","singular-vocative":"nituitură","plural-vocative":"nituiturelor"}},{"word":"Nițuleasa","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"f"},{"word":"Nițulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nițulescu"}},{"word":"Nițulică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nițulică"}},{"word":"nițuvară","pos":"noun","definitions":["autumn crocus (Colchicum autumnale)"],"forms":{"plural":"nițuvere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nițuvară","accusative-definite-nominative-singular":"nițuvara","accusative-indefinite-nominative-plural":"nițuvere","accusative-definite-nominative-plural":"nițuverele","dative-genitive-indefinite-singular":"nițuvere","dative-definite-genitive-singular":"nițuverei","dative-genitive-indefinite-plural":"nițuvere","dative-definite-genitive-plural":"nițuverelor","singular-vocative":"nițuvară","plural-vocative":"nițuverelor"}},{"word":"niu","pos":"noun","definitions":["nu (Greek letter)"],"forms":{"plural":"niu","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"niu","accusative-definite-nominative-singular":"niuul","accusative-indefinite-nominative-plural":"niu","accusative-definite-nominative-plural":"niui","dative-genitive-indefinite-singular":"niu","dative-definite-genitive-singular":"niuului","dative-genitive-indefinite-plural":"niu","dative-definite-genitive-plural":"niulor","singular-vocative":"niuule","plural-vocative":"niulor"}},{"word":"niuean","pos":"noun","definitions":["Niuean"],"pronunciation":"/ˌnju.eˈan/","forms":{"plural":"niueni","feminine":"equivalent niueană"}},{"word":"niuean","pos":"adj","definitions":["Niuean"],"pronunciation":"/ˌnju.eˈan/","forms":{"feminine-singular":"niueană","masculine-plural":"niueni","feminine-neuter-plural":"niuene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"niuean","error-unrecognized-form-feminine-indefinite-singular":"niueană","error-unrecognized-form-indefinite-masculine-plural":"niueni","error-unrecognized-form-feminine-indefinite-neuter-plural":"niuene","definite-error-unrecognized-form-masculine-neuter-singular":"niueanul","definite-error-unrecognized-form-feminine-singular":"niueana","definite-error-unrecognized-form-masculine-plural":"niuenii","definite-error-unrecognized-form-feminine-neuter-plural":"niuenele"}},{"word":"niueană","pos":"noun","definitions":["female equivalent of niuean"],"forms":{"plural":"niueane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"niueană","accusative-definite-nominative-singular":"niueana","accusative-indefinite-nominative-plural":"niueane","accusative-definite-nominative-plural":"niueanele","dative-genitive-indefinite-singular":"niueane","dative-definite-genitive-singular":"niueanei","dative-genitive-indefinite-plural":"niueane","dative-definite-genitive-plural":"niueanelor","singular-vocative":"niueană","plural-vocative":"niueanelor"}},{"word":"niueni","pos":"noun","definitions":["plural of niuean"]},{"word":"Niuved","pos":"name","definitions":["a village in Tămășeu, Bihor County, Romania"],"gender":"m"},{"word":"nivație","pos":"noun","definitions":["nivation"],"forms":{"plural":"nivații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nivație","accusative-definite-nominative-singular":"nivația","accusative-indefinite-nominative-plural":"nivații","accusative-definite-nominative-plural":"nivațiile","dative-genitive-indefinite-singular":"nivații","dative-definite-genitive-singular":"nivației","dative-genitive-indefinite-plural":"nivații","dative-definite-genitive-plural":"nivațiilor","singular-vocative":"nivație","plural-vocative":"nivațiilor"}},{"word":"nivel","pos":"noun","definitions":["level","height","spirit level"],"pronunciation":"/niˈvel/","forms":{"plural":"niveluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nivel","accusative-definite-nominative-singular":"nivelul","accusative-indefinite-nominative-plural":"niveluri","accusative-definite-nominative-plural":"nivelurile","dative-genitive-indefinite-singular":"nivel","dative-definite-genitive-singular":"nivelului","dative-genitive-indefinite-plural":"niveluri","dative-definite-genitive-plural":"nivelurilor","singular-vocative":"nivelule","plural-vocative":"nivelurilor"}},{"word":"nivel cu apă","pos":"noun","definitions":["water level"]},{"word":"nivel de apă","pos":"noun","definitions":["water level"]},{"word":"nivel de semnificanță","pos":"noun","definitions":["significance level"],"forms":{"plural":"nivele de semnificanță"}},{"word":"nivel de trai","pos":"noun","definitions":["standard of living"]},{"word":"nivela","pos":"verb","definitions":["to level, level out","to even, even out"],"forms":{"canonical":"a nivela 1st conjugation","present-singular-third-person":"nivelează","participle-past":"nivelat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a nivela","gerund":"nivelând","first-person-indicative-present-singular":"nivelez","indicative-present-second-person-singular":"nivelezi","indicative-present-singular-third-person":"nivelează","first-person-indicative-plural-present":"nivelăm","indicative-plural-present-second-person":"nivelați","indicative-plural-present-third-person":"nivelează","first-person-imperfect-indicative-singular":"nivelam","imperfect-indicative-second-person-singular":"nivelai","imperfect-indicative-singular-third-person":"nivela","first-person-imperfect-indicative-plural":"nivelam","imperfect-indicative-plural-second-person":"nivelați","imperfect-indicative-plural-third-person":"nivelau","first-person-indicative-perfect-singular":"nivelai","indicative-perfect-second-person-singular":"nivelași","indicative-perfect-singular-third-person":"nivelă","first-person-indicative-perfect-plural":"nivelarăm","indicative-perfect-plural-second-person":"nivelarăți","indicative-perfect-plural-third-person":"nivelară","first-person-indicative-pluperfect-singular":"nivelasem","indicative-pluperfect-second-person-singular":"nivelaseși","indicative-pluperfect-singular-third-person":"nivelase","first-person-indicative-pluperfect-plural":"nivelaserăm","indicative-pluperfect-plural-second-person":"nivelaserăți","indicative-pluperfect-plural-third-person":"nivelaseră","first-person-present-singular-subjunctive":"să nivelez","present-second-person-singular-subjunctive":"să nivelezi","present-singular-subjunctive-third-person":"să niveleze","first-person-plural-present-subjunctive":"să nivelăm","plural-present-second-person-subjunctive":"să nivelați","plural-present-subjunctive-third-person":"să niveleze","imperative-second-person-singular":"nivelează","imperative-plural-second-person":"nivelați","imperative-negative-second-person-singular":"nu nivela","imperative-negative-plural-second-person":"nu nivelați"}},{"word":"nivelă","pos":"noun","definitions":["spirit level"],"pronunciation":"/niˈve.lə/","forms":{"plural":"nivele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nivelă","accusative-definite-nominative-singular":"nivela","accusative-indefinite-nominative-plural":"nivele","accusative-definite-nominative-plural":"nivelele","dative-genitive-indefinite-singular":"nivele","dative-definite-genitive-singular":"nivelei","dative-genitive-indefinite-plural":"nivele","dative-definite-genitive-plural":"nivelelor","singular-vocative":"nivelă","plural-vocative":"nivelelor"}},{"word":"nivelă","pos":"verb","definitions":["third-person singular perfect indicative of nivela"]},{"word":"nivelă cu bulă de aer","pos":"noun","definitions":["spirit level"],"forms":{"plural":"nivele cu bulă de aer"}},{"word":"nivelai","pos":"verb","definitions":["inflection of nivela:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[niveˈlaj]"},{"word":"nivelam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of nivela"],"pronunciation":"[niveˈlam]"},{"word":"nivelare","pos":"noun","definitions":["leveling"],"forms":{"plural":"nivelări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nivelare","accusative-definite-nominative-singular":"nivelarea","accusative-indefinite-nominative-plural":"nivelări","accusative-definite-nominative-plural":"nivelările","dative-genitive-indefinite-singular":"nivelări","dative-definite-genitive-singular":"nivelării","dative-genitive-indefinite-plural":"nivelări","dative-definite-genitive-plural":"nivelărilor","singular-vocative":"nivelare","plural-vocative":"nivelărilor"}},{"word":"nivelase","pos":"verb","definitions":["third-person singular pluperfect indicative of nivela"],"pronunciation":"[niveˈlase]"},{"word":"nivelat","pos":"adj","definitions":["leveled"],"forms":{"feminine-singular":"nivelată","masculine-plural":"nivelați","feminine-neuter-plural":"nivelate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nivelat","error-unrecognized-form-feminine-indefinite-singular":"nivelată","error-unrecognized-form-indefinite-masculine-plural":"nivelați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nivelate","definite-error-unrecognized-form-masculine-neuter-singular":"nivelatul","definite-error-unrecognized-form-feminine-singular":"nivelata","definite-error-unrecognized-form-masculine-plural":"nivelații","definite-error-unrecognized-form-feminine-neuter-plural":"nivelatele"}},{"word":"nivelație","pos":"noun","definitions":["levelling, flattening"],"forms":{"plural":"nivelații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nivelație","accusative-definite-nominative-singular":"nivelația","accusative-indefinite-nominative-plural":"nivelații","accusative-definite-nominative-plural":"nivelațiile","dative-genitive-indefinite-singular":"nivelații","dative-definite-genitive-singular":"nivelației","dative-genitive-indefinite-plural":"nivelații","dative-definite-genitive-plural":"nivelațiilor","singular-vocative":"nivelație","plural-vocative":"nivelațiilor"}},{"word":"nivelator","pos":"adj","definitions":["leveling"],"forms":{"feminine-singular":"nivelatoare","masculine-plural":"nivelatori","feminine-neuter-plural":"nivelatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nivelator","error-unrecognized-form-feminine-indefinite-singular":"nivelatoare","error-unrecognized-form-indefinite-masculine-plural":"nivelatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"nivelatoare","definite-error-unrecognized-form-masculine-neuter-singular":"nivelatorul","definite-error-unrecognized-form-feminine-singular":"nivelatoarea","definite-error-unrecognized-form-masculine-plural":"nivelatorii","definite-error-unrecognized-form-feminine-neuter-plural":"nivelatoarele"}},{"word":"nivelator","pos":"noun","definitions":["leveler"],"forms":{"plural":"nivelatori","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nivelator","accusative-definite-nominative-singular":"nivelatorul","accusative-indefinite-nominative-plural":"nivelatori","accusative-definite-nominative-plural":"nivelatorile","dative-genitive-indefinite-singular":"nivelator","dative-definite-genitive-singular":"nivelatorului","dative-genitive-indefinite-plural":"nivelatori","dative-definite-genitive-plural":"nivelatorilor","singular-vocative":"nivelatorule","plural-vocative":"nivelatorilor"}},{"word":"nivele","pos":"noun","definitions":["plural of nivel"],"gender":"n-p"},{"word":"nivele de semnificanță","pos":"noun","definitions":["plural of nivel de semnificanță"]},{"word":"nivelez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of nivela"],"pronunciation":"[niveˈlez]"},{"word":"niveli","pos":"verb","definitions":["to level out"],"forms":{"canonical":"a niveli 4th conjugation","present-singular-third-person":"nivelește","participle-past":"nivelit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a niveli","gerund":"nivelind","first-person-indicative-present-singular":"nivelesc","indicative-present-second-person-singular":"nivelești","indicative-present-singular-third-person":"nivelește","first-person-indicative-plural-present":"nivelim","indicative-plural-present-second-person":"niveliți","indicative-plural-present-third-person":"nivelesc","first-person-imperfect-indicative-singular":"niveleam","imperfect-indicative-second-person-singular":"niveleai","imperfect-indicative-singular-third-person":"nivelea","first-person-imperfect-indicative-plural":"niveleam","imperfect-indicative-plural-second-person":"niveleați","imperfect-indicative-plural-third-person":"niveleau","first-person-indicative-perfect-singular":"nivelii","indicative-perfect-second-person-singular":"niveliși","indicative-perfect-singular-third-person":"niveli","first-person-indicative-perfect-plural":"nivelirăm","indicative-perfect-plural-second-person":"nivelirăți","indicative-perfect-plural-third-person":"niveliră","first-person-indicative-pluperfect-singular":"nivelisem","indicative-pluperfect-second-person-singular":"niveliseși","indicative-pluperfect-singular-third-person":"nivelise","first-person-indicative-pluperfect-plural":"niveliserăm","indicative-pluperfect-plural-second-person":"niveliserăți","indicative-pluperfect-plural-third-person":"niveliseră","first-person-present-singular-subjunctive":"să nivelesc","present-second-person-singular-subjunctive":"să nivelești","present-singular-subjunctive-third-person":"să nivelească","first-person-plural-present-subjunctive":"să nivelim","plural-present-second-person-subjunctive":"să niveliți","plural-present-subjunctive-third-person":"să nivelească","imperative-second-person-singular":"nivelește","imperative-plural-second-person":"niveliți","imperative-negative-second-person-singular":"nu niveli","imperative-negative-plural-second-person":"nu niveliți"}},{"word":"nivelment","pos":"noun","definitions":["leveling"],"forms":{"plural":"nivelmente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nivelment","accusative-definite-nominative-singular":"nivelmentul","accusative-indefinite-nominative-plural":"nivelmente","accusative-definite-nominative-plural":"nivelmentele","dative-genitive-indefinite-singular":"nivelment","dative-definite-genitive-singular":"nivelmentului","dative-genitive-indefinite-plural":"nivelmente","dative-definite-genitive-plural":"nivelmentelor","singular-vocative":"nivelmentule","plural-vocative":"nivelmentelor"}},{"word":"nivelul mării","pos":"noun","definitions":["sea level"]},{"word":"nividi","pos":"verb","definitions":["alternative form of năvădi"],"forms":{"canonical":"a nividi 4th conjugation","present-singular-third-person":"nividește","participle-past":"nividit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nividi","gerund":"nividind","first-person-indicative-present-singular":"nividesc","indicative-present-second-person-singular":"nividești","indicative-present-singular-third-person":"nividește","first-person-indicative-plural-present":"nividim","indicative-plural-present-second-person":"nividiți","indicative-plural-present-third-person":"nividesc","first-person-imperfect-indicative-singular":"nivideam","imperfect-indicative-second-person-singular":"nivideai","imperfect-indicative-singular-third-person":"nividea","first-person-imperfect-indicative-plural":"nivideam","imperfect-indicative-plural-second-person":"nivideați","imperfect-indicative-plural-third-person":"nivideau","first-person-indicative-perfect-singular":"nividii","indicative-perfect-second-person-singular":"nividiși","indicative-perfect-singular-third-person":"nividi","first-person-indicative-perfect-plural":"nividirăm","indicative-perfect-plural-second-person":"nividirăți","indicative-perfect-plural-third-person":"nividiră","first-person-indicative-pluperfect-singular":"nividisem","indicative-pluperfect-second-person-singular":"nividiseși","indicative-pluperfect-singular-third-person":"nividise","first-person-indicative-pluperfect-plural":"nividiserăm","indicative-pluperfect-plural-second-person":"nividiserăți","indicative-pluperfect-plural-third-person":"nividiseră","first-person-present-singular-subjunctive":"să nividesc","present-second-person-singular-subjunctive":"să nividești","present-singular-subjunctive-third-person":"să nividească","first-person-plural-present-subjunctive":"să nividim","plural-present-second-person-subjunctive":"să nividiți","plural-present-subjunctive-third-person":"să nividească","imperative-second-person-singular":"nividește","imperative-plural-second-person":"nividiți","imperative-negative-second-person-singular":"nu nividi","imperative-negative-plural-second-person":"nu nividiți"}},{"word":"nivometric","pos":"adj","definitions":["nivometric"],"forms":{"feminine-singular":"nivometrică","masculine-plural":"nivometrici","feminine-neuter-plural":"nivometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nivometric","error-unrecognized-form-feminine-indefinite-singular":"nivometrică","error-unrecognized-form-indefinite-masculine-plural":"nivometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nivometrice","definite-error-unrecognized-form-masculine-neuter-singular":"nivometricul","definite-error-unrecognized-form-feminine-singular":"nivometrica","definite-error-unrecognized-form-masculine-plural":"nivometricii","definite-error-unrecognized-form-feminine-neuter-plural":"nivometricele"}},{"word":"nivometru","pos":"noun","definitions":["snow-gauge"],"forms":{"plural":"nivometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nivometru","accusative-definite-nominative-singular":"nivometrul","accusative-indefinite-nominative-plural":"nivometre","accusative-definite-nominative-plural":"nivometrele","dative-genitive-indefinite-singular":"nivometru","dative-definite-genitive-singular":"nivometrului","dative-genitive-indefinite-plural":"nivometre","dative-definite-genitive-plural":"nivometrelor","singular-vocative":"nivometrule","plural-vocative":"nivometrelor"}},{"word":"nivopluvial","pos":"adj","definitions":["related to snow and rain"],"forms":{"feminine-singular":"nivopluvială","masculine-plural":"nivopluviali","feminine-neuter-plural":"nivopluviale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nivopluvial","error-unrecognized-form-feminine-indefinite-singular":"nivopluvială","error-unrecognized-form-indefinite-masculine-plural":"nivopluviali","error-unrecognized-form-feminine-indefinite-neuter-plural":"nivopluviale","definite-error-unrecognized-form-masculine-neuter-singular":"nivopluvialul","definite-error-unrecognized-form-feminine-singular":"nivopluviala","definite-error-unrecognized-form-masculine-plural":"nivopluvialii","definite-error-unrecognized-form-feminine-neuter-plural":"nivopluvialele"}},{"word":"nivoză","pos":"noun","definitions":["Nivôse"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"nivoză","accusative-definite-nominative":"nivoza","dative-genitive-indefinite":"nivoze","dative-definite-genitive":"nivozei","vocative":"nivoză"}},{"word":"nix","pos":"noun","definitions":["nixie"],"forms":{"plural":"nicși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nix","accusative-definite-nominative-singular":"nixul","accusative-indefinite-nominative-plural":"nicși","accusative-definite-nominative-plural":"nicșii","dative-genitive-indefinite-singular":"nix","dative-definite-genitive-singular":"nixului","dative-genitive-indefinite-plural":"nicși","dative-definite-genitive-plural":"nicșilor","singular-vocative":"nixule","plural-vocative":"nicșilor"}},{"word":"nixis","pos":"noun","definitions":["boredom"],"forms":{"plural":"nixisuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nixis","accusative-definite-nominative-singular":"nixisul","accusative-indefinite-nominative-plural":"nixisuri","accusative-definite-nominative-plural":"nixisurile","dative-genitive-indefinite-singular":"nixis","dative-definite-genitive-singular":"nixisului","dative-genitive-indefinite-plural":"nixisuri","dative-definite-genitive-plural":"nixisurilor","singular-vocative":"nixisule","plural-vocative":"nixisurilor"}},{"word":"nizam","pos":"noun","definitions":["nizam"],"forms":{"plural":"nizami","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nizam","accusative-definite-nominative-singular":"nizamul","accusative-indefinite-nominative-plural":"nizami","accusative-definite-nominative-plural":"nizamii","dative-genitive-indefinite-singular":"nizam","dative-definite-genitive-singular":"nizamului","dative-genitive-indefinite-plural":"nizami","dative-definite-genitive-plural":"nizamilor","singular-vocative":"nizamule","plural-vocative":"nizamilor"}},{"word":"nizguială","pos":"noun","definitions":["light snow"],"forms":{"plural":"nizguieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nizguială","accusative-definite-nominative-singular":"nizguiala","accusative-indefinite-nominative-plural":"nizguiele","accusative-definite-nominative-plural":"nizguielele","dative-genitive-indefinite-singular":"nizguiele","dative-definite-genitive-singular":"nizguielei","dative-genitive-indefinite-plural":"nizguiele","dative-definite-genitive-plural":"nizguielelor","singular-vocative":"nizguială","plural-vocative":"nizguielelor"}},{"word":"niznai","pos":"adv","definitions":["carelessly"]},{"word":"nizui","pos":"verb","definitions":["obsolete form of năzui"],"forms":{"canonical":"a nizui 4th conjugation","present-singular-third-person":"nizuiește","participle-past":"nizuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nizui","gerund":"nizuind","first-person-indicative-present-singular":"nizuiesc","indicative-present-second-person-singular":"nizuiești","indicative-present-singular-third-person":"nizuiește","first-person-indicative-plural-present":"nizuim","indicative-plural-present-second-person":"nizuiți","indicative-plural-present-third-person":"nizuiesc","first-person-imperfect-indicative-singular":"nizuiam","imperfect-indicative-second-person-singular":"nizuiai","imperfect-indicative-singular-third-person":"nizuia","first-person-imperfect-indicative-plural":"nizuiam","imperfect-indicative-plural-second-person":"nizuiați","imperfect-indicative-plural-third-person":"nizuiau","first-person-indicative-perfect-singular":"nizuii","indicative-perfect-second-person-singular":"nizuiși","indicative-perfect-singular-third-person":"nizui","first-person-indicative-perfect-plural":"nizuirăm","indicative-perfect-plural-second-person":"nizuirăți","indicative-perfect-plural-third-person":"nizuiră","first-person-indicative-pluperfect-singular":"nizuisem","indicative-pluperfect-second-person-singular":"nizuiseși","indicative-pluperfect-singular-third-person":"nizuise","first-person-indicative-pluperfect-plural":"nizuiserăm","indicative-pluperfect-plural-second-person":"nizuiserăți","indicative-pluperfect-plural-third-person":"nizuiseră","first-person-present-singular-subjunctive":"să nizuiesc","present-second-person-singular-subjunctive":"să nizuiești","present-singular-subjunctive-third-person":"să nizuiască","first-person-plural-present-subjunctive":"să nizuim","plural-present-second-person-subjunctive":"să nizuiți","plural-present-subjunctive-third-person":"să nizuiască","imperative-second-person-singular":"nizuiește","imperative-plural-second-person":"nizuiți","imperative-negative-second-person-singular":"nu nizui","imperative-negative-plural-second-person":"nu nizuiți"}},{"word":"nj","pos":"phrase","definitions":["abbreviation of nu știu (“I don't know”)"]},{"word":"NMS","pos":"noun","definitions":["HMS (“His/Her Majesty's Ship”): abbreviation of Nava Majestăţii Sale (“Her/His Majesty's Ship”); the generic ship prefix used for military ships of a royal kingdom, or generic translation of a country's HMS ship prefix without specification of which kingdom.","NMS, HRMS (“His/Her Romanian Majesty's Ship”): the ship prefix used for the Royal Romanian Navy ships, of the defunct Kingdom of Romania."],"gender":"mf"},{"word":"no","pos":"intj","definitions":["well, so"],"pronunciation":"/nɔ(ː)/"},{"word":"noadă","pos":"noun","definitions":["coccyx"],"forms":{"plural":"noade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"noadă","accusative-definite-nominative-singular":"noada","accusative-indefinite-nominative-plural":"noade","accusative-definite-nominative-plural":"noadele","dative-genitive-indefinite-singular":"noade","dative-definite-genitive-singular":"noadei","dative-genitive-indefinite-plural":"noade","dative-definite-genitive-plural":"noadelor","singular-vocative":"noadă","plural-vocative":"noadelor"}},{"word":"Noaghi","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Noaghi"}},{"word":"Noapte","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Noapte"}},{"word":"noapte","pos":"noun","definitions":["night"],"pronunciation":"/ˈno̯ap.te/","forms":{"plural":"nopți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"noapte","accusative-definite-nominative-singular":"noaptea","accusative-indefinite-nominative-plural":"nopți","accusative-definite-nominative-plural":"nopțile","dative-genitive-indefinite-singular":"nopți","dative-definite-genitive-singular":"nopții","dative-genitive-indefinite-plural":"nopți","dative-definite-genitive-plural":"nopților","singular-vocative":"noapte","plural-vocative":"nopților","alternative":"ноапте"}},{"word":"noapte albă","pos":"noun","definitions":["white night, a sleepless night"],"pronunciation":"/ˈno̯ap.te ˈal.bə/","forms":{"plural":"nopți albe"}},{"word":"noapte bună","pos":"intj","definitions":["good night"],"pronunciation":"/ˌno̯ap.te ˈbu.nə/"},{"word":"noapte polară","pos":"noun","definitions":["polar night"],"forms":{"plural":"nopți polare"}},{"word":"noaptea","pos":"adv","definitions":["at night"],"pronunciation":"/ˈno̯ap.te̯a/"},{"word":"noaptea","pos":"noun","definitions":["definite nominative/accusative singular of noapte"],"pronunciation":"/ˈno̯ap.te̯a/"},{"word":"noaptea de Anul Nou","pos":"name","definitions":["New Year's Eve"],"gender":"f-p"},{"word":"noaptea de Revelion","pos":"noun","definitions":["New Year's Eve"],"forms":{"plural":"nopțile de Revelion"}},{"word":"Noapteș","pos":"name","definitions":["a locality in Curtea de Argeș, Argeș County, Romania"],"gender":"m"},{"word":"Noapteșa","pos":"name","definitions":["a village in Șișești, Mehedinți County, Romania"],"gender":"f"},{"word":"noastră","pos":"det","definitions":["feminine singular of nostru; our"],"pronunciation":"/ˈno̯as.trə/","examples":[{"ro":"Țara noastră este țara noastră.","en":"Our country is our country."}],"forms":{"alternative-obsolete":"nóstră","alternative":"ноастрэ"}},{"word":"noastră","pos":"pron","definitions":["feminine singular of nostru"],"pronunciation":"/ˈno̯as.trə/","forms":{"alternative-obsolete":"nóstră","alternative":"ноастрэ"}},{"word":"noastre","pos":"adj","definitions":["feminine plural of nostru; our"],"pronunciation":"/ˈno̯astre/"},{"word":"noaten","pos":"noun","definitions":["hogget, yearling"],"forms":{"plural":"noateni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"noaten","accusative-definite-nominative-singular":"noatenul","accusative-indefinite-nominative-plural":"noateni","accusative-definite-nominative-plural":"noatenii","dative-genitive-indefinite-singular":"noaten","dative-definite-genitive-singular":"noatenului","dative-genitive-indefinite-plural":"noateni","dative-definite-genitive-plural":"noatenilor","singular-vocative":"noatenule","plural-vocative":"noatenilor","alternative":"noatin"}},{"word":"noatenaș","pos":"noun","definitions":["diminutive of noaten"],"forms":{"plural":"noatenași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"noatenaș","accusative-definite-nominative-singular":"noatenașul","accusative-indefinite-nominative-plural":"noatenași","accusative-definite-nominative-plural":"noatenașii","dative-genitive-indefinite-singular":"noatenaș","dative-definite-genitive-singular":"noatenașului","dative-genitive-indefinite-plural":"noatenași","dative-definite-genitive-plural":"noatenașilor","singular-vocative":"noatenașule","plural-vocative":"noatenașilor"}},{"word":"noatin","pos":"noun","definitions":["alternative form of noaten"],"forms":{"plural":"noatini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"noatin","accusative-definite-nominative-singular":"noatinul","accusative-indefinite-nominative-plural":"noatini","accusative-definite-nominative-plural":"noatinii","dative-genitive-indefinite-singular":"noatin","dative-definite-genitive-singular":"noatinului","dative-genitive-indefinite-plural":"noatini","dative-definite-genitive-plural":"noatinilor","singular-vocative":"noatinule","plural-vocative":"noatinilor"}},{"word":"noatior","pos":"noun","definitions":["diminutive of noaten"],"forms":{"plural":"noatiori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"noatior","accusative-definite-nominative-singular":"noatiorul","accusative-indefinite-nominative-plural":"noatiori","accusative-definite-nominative-plural":"noatiorii","dative-genitive-indefinite-singular":"noatior","dative-definite-genitive-singular":"noatiorului","dative-genitive-indefinite-plural":"noatiori","dative-definite-genitive-plural":"noatiorilor","singular-vocative":"noatiorule","plural-vocative":"noatiorilor"}},{"word":"nobeliu","pos":"noun","definitions":["nobelium (chemical element)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nobeliu","accusative-definite-nominative":"nobeliul","dative-genitive-indefinite":"nobeliu","dative-definite-genitive":"nobeliului","vocative":"nobeliule"}},{"word":"nobet","pos":"noun","definitions":["changing of the guard music"],"forms":{"plural":"nobeturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nobet","accusative-definite-nominative-singular":"nobetul","accusative-indefinite-nominative-plural":"nobeturi","accusative-definite-nominative-plural":"nobeturile","dative-genitive-indefinite-singular":"nobet","dative-definite-genitive-singular":"nobetului","dative-genitive-indefinite-plural":"nobeturi","dative-definite-genitive-plural":"nobeturilor","singular-vocative":"nobetule","plural-vocative":"nobeturilor"}}];
@@ -0,0 +1 @@
+export default [{"word":"nobil","pos":"adj","definitions":["noble"],"pronunciation":"/ˈno.bil/","forms":{"feminine-singular":"nobilă","masculine-plural":"nobili","feminine-neuter-plural":"nobile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nobil","error-unrecognized-form-feminine-indefinite-singular":"nobilă","error-unrecognized-form-indefinite-masculine-plural":"nobili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nobile","definite-error-unrecognized-form-masculine-neuter-singular":"nobilul","definite-error-unrecognized-form-feminine-singular":"nobila","definite-error-unrecognized-form-masculine-plural":"nobilii","definite-error-unrecognized-form-feminine-neuter-plural":"nobilele"}},{"word":"nobil","pos":"noun","definitions":["noble"],"pronunciation":"/ˈno.bil/","forms":{"plural":"nobili"}},{"word":"nobila","pos":"verb","definitions":["to ennoble"],"forms":{"canonical":"a nobila 1st conjugation","present-singular-third-person":"nobilează","participle-past":"nobilat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a nobila","gerund":"nobilând","first-person-indicative-present-singular":"nobilez","indicative-present-second-person-singular":"nobilezi","indicative-present-singular-third-person":"nobilează","first-person-indicative-plural-present":"nobilăm","indicative-plural-present-second-person":"nobilați","indicative-plural-present-third-person":"nobilează","first-person-imperfect-indicative-singular":"nobilam","imperfect-indicative-second-person-singular":"nobilai","imperfect-indicative-singular-third-person":"nobila","first-person-imperfect-indicative-plural":"nobilam","imperfect-indicative-plural-second-person":"nobilați","imperfect-indicative-plural-third-person":"nobilau","first-person-indicative-perfect-singular":"nobilai","indicative-perfect-second-person-singular":"nobilași","indicative-perfect-singular-third-person":"nobilă","first-person-indicative-perfect-plural":"nobilarăm","indicative-perfect-plural-second-person":"nobilarăți","indicative-perfect-plural-third-person":"nobilară","first-person-indicative-pluperfect-singular":"nobilasem","indicative-pluperfect-second-person-singular":"nobilaseși","indicative-pluperfect-singular-third-person":"nobilase","first-person-indicative-pluperfect-plural":"nobilaserăm","indicative-pluperfect-plural-second-person":"nobilaserăți","indicative-pluperfect-plural-third-person":"nobilaseră","first-person-present-singular-subjunctive":"să nobilez","present-second-person-singular-subjunctive":"să nobilezi","present-singular-subjunctive-third-person":"să nobileze","first-person-plural-present-subjunctive":"să nobilăm","plural-present-second-person-subjunctive":"să nobilați","plural-present-subjunctive-third-person":"să nobileze","imperative-second-person-singular":"nobilează","imperative-plural-second-person":"nobilați","imperative-negative-second-person-singular":"nu nobila","imperative-negative-plural-second-person":"nu nobilați"}},{"word":"nobilă","pos":"noun","definitions":["female equivalent of nobil"],"forms":{"plural":"nobile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nobilă","accusative-definite-nominative-singular":"nobila","accusative-indefinite-nominative-plural":"nobile","accusative-definite-nominative-plural":"nobilele","dative-genitive-indefinite-singular":"nobile","dative-definite-genitive-singular":"nobilei","dative-genitive-indefinite-plural":"nobile","dative-definite-genitive-plural":"nobilelor","singular-vocative":"nobilă","plural-vocative":"nobilelor"}},{"word":"nobilare","pos":"noun","definitions":["ennoblement"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"nobilare","accusative-definite-nominative":"nobilarea","dative-genitive-indefinite":"nobilări","dative-definite-genitive":"nobilării","vocative":"nobilare"}},{"word":"nobiliar","pos":"adj","definitions":["nobiliary"],"forms":{"feminine-singular":"nobiliară","masculine-plural":"nobiliari","feminine-neuter-plural":"nobiliare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nobiliar","error-unrecognized-form-feminine-indefinite-singular":"nobiliară","error-unrecognized-form-indefinite-masculine-plural":"nobiliari","error-unrecognized-form-feminine-indefinite-neuter-plural":"nobiliare","definite-error-unrecognized-form-masculine-neuter-singular":"nobiliarul","definite-error-unrecognized-form-feminine-singular":"nobiliara","definite-error-unrecognized-form-masculine-plural":"nobiliarii","definite-error-unrecognized-form-feminine-neuter-plural":"nobiliarele"}},{"word":"nobilime","pos":"noun","definitions":["nobility"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nobilime","accusative-definite-nominative-singular":"nobilimea","accusative-indefinite-nominative-plural":"nobilimi","accusative-definite-nominative-plural":"nobilimile","dative-genitive-indefinite-singular":"nobilimi","dative-definite-genitive-singular":"nobilimii","dative-genitive-indefinite-plural":"nobilimi","dative-definite-genitive-plural":"nobilimilor","singular-vocative":"nobilime","plural-vocative":"nobilimilor"}},{"word":"nobilissim","pos":"noun","definitions":["nobilissimus"],"forms":{"plural":"nobilissimi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nobilissim","accusative-definite-nominative-singular":"nobilissimul","accusative-indefinite-nominative-plural":"nobilissimi","accusative-definite-nominative-plural":"nobilissimii","dative-genitive-indefinite-singular":"nobilissim","dative-definite-genitive-singular":"nobilissimului","dative-genitive-indefinite-plural":"nobilissimi","dative-definite-genitive-plural":"nobilissimilor","singular-vocative":"nobilissimule","plural-vocative":"nobilissimilor"}},{"word":"nobilita","pos":"verb","definitions":["ennoble"],"forms":{"canonical":"a nobilita 1st conjugation","present-singular-third-person":"nobilitează","participle-past":"nobilitat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a nobilita","gerund":"nobilitând","first-person-indicative-present-singular":"nobilitez","indicative-present-second-person-singular":"nobilitezi","indicative-present-singular-third-person":"nobilitează","first-person-indicative-plural-present":"nobilităm","indicative-plural-present-second-person":"nobilitați","indicative-plural-present-third-person":"nobilitează","first-person-imperfect-indicative-singular":"nobilitam","imperfect-indicative-second-person-singular":"nobilitai","imperfect-indicative-singular-third-person":"nobilita","first-person-imperfect-indicative-plural":"nobilitam","imperfect-indicative-plural-second-person":"nobilitați","imperfect-indicative-plural-third-person":"nobilitau","first-person-indicative-perfect-singular":"nobilitai","indicative-perfect-second-person-singular":"nobilitași","indicative-perfect-singular-third-person":"nobilită","first-person-indicative-perfect-plural":"nobilitarăm","indicative-perfect-plural-second-person":"nobilitarăți","indicative-perfect-plural-third-person":"nobilitară","first-person-indicative-pluperfect-singular":"nobilitasem","indicative-pluperfect-second-person-singular":"nobilitaseși","indicative-pluperfect-singular-third-person":"nobilitase","first-person-indicative-pluperfect-plural":"nobilitaserăm","indicative-pluperfect-plural-second-person":"nobilitaserăți","indicative-pluperfect-plural-third-person":"nobilitaseră","first-person-present-singular-subjunctive":"să nobilitez","present-second-person-singular-subjunctive":"să nobilitezi","present-singular-subjunctive-third-person":"să nobiliteze","first-person-plural-present-subjunctive":"să nobilităm","plural-present-second-person-subjunctive":"să nobilitați","plural-present-subjunctive-third-person":"să nobiliteze","imperative-second-person-singular":"nobilitează","imperative-plural-second-person":"nobilitați","imperative-negative-second-person-singular":"nu nobilita","imperative-negative-plural-second-person":"nu nobilitați"}},{"word":"nobilitar","pos":"adj","definitions":["nobiliary"],"forms":{"feminine-singular":"nobilitară","masculine-plural":"nobilitari","feminine-neuter-plural":"nobilitare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nobilitar","error-unrecognized-form-feminine-indefinite-singular":"nobilitară","error-unrecognized-form-indefinite-masculine-plural":"nobilitari","error-unrecognized-form-feminine-indefinite-neuter-plural":"nobilitare","definite-error-unrecognized-form-masculine-neuter-singular":"nobilitarul","definite-error-unrecognized-form-feminine-singular":"nobilitara","definite-error-unrecognized-form-masculine-plural":"nobilitarii","definite-error-unrecognized-form-feminine-neuter-plural":"nobilitarele"}},{"word":"nobilitare","pos":"noun","definitions":["ennoblement"],"forms":{"plural":"nobilitări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nobilitare","accusative-definite-nominative-singular":"nobilitarea","accusative-indefinite-nominative-plural":"nobilitări","accusative-definite-nominative-plural":"nobilitările","dative-genitive-indefinite-singular":"nobilitări","dative-definite-genitive-singular":"nobilitării","dative-genitive-indefinite-plural":"nobilitări","dative-definite-genitive-plural":"nobilitărilor","singular-vocative":"nobilitare","plural-vocative":"nobilitărilor"}},{"word":"nobilitate","pos":"noun","definitions":["noble"],"forms":{"plural":"nobilități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nobilitate","accusative-definite-nominative-singular":"nobilitatea","accusative-indefinite-nominative-plural":"nobilități","accusative-definite-nominative-plural":"nobilitățile","dative-genitive-indefinite-singular":"nobilități","dative-definite-genitive-singular":"nobilității","dative-genitive-indefinite-plural":"nobilități","dative-definite-genitive-plural":"nobilităților","singular-vocative":"nobilitate","plural-vocative":"nobilităților"}},{"word":"noble","pos":"adj","definitions":["obsolete form of nobil"],"forms":{"masculine-plural":"nobli","feminine-neuter-plural":"noble","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"noble","error-unrecognized-form-feminine-indefinite-singular":"noble","error-unrecognized-form-indefinite-masculine-plural":"nobli","error-unrecognized-form-feminine-indefinite-neuter-plural":"noble","definite-error-unrecognized-form-masculine-neuter-singular":"noblele","definite-error-unrecognized-form-feminine-singular":"noblea","definite-error-unrecognized-form-masculine-plural":"noblii","definite-error-unrecognized-form-feminine-neuter-plural":"noblele"}},{"word":"nobleță","pos":"noun","definitions":["alternative form of noblețe"],"forms":{"plural":"noblețe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nobleță","accusative-definite-nominative-singular":"nobleța","accusative-indefinite-nominative-plural":"noblețe","accusative-definite-nominative-plural":"noblețele","dative-genitive-indefinite-singular":"noblețe","dative-definite-genitive-singular":"nobleței","dative-genitive-indefinite-plural":"noblețe","dative-definite-genitive-plural":"noblețelor","singular-vocative":"nobleță","plural-vocative":"noblețelor"}},{"word":"noblețe","pos":"noun","definitions":["nobility"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"noblețe","accusative-definite-nominative":"noblețea","dative-genitive-indefinite":"nobleți","dative-definite-genitive":"nobleții","vocative":"noblețe"}},{"word":"nociv","pos":"adj","definitions":["noxious, harmful"],"forms":{"feminine-singular":"nocivă","masculine-plural":"nocivi","feminine-neuter-plural":"nocive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nociv","error-unrecognized-form-feminine-indefinite-singular":"nocivă","error-unrecognized-form-indefinite-masculine-plural":"nocivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"nocive","definite-error-unrecognized-form-masculine-neuter-singular":"nocivul","definite-error-unrecognized-form-feminine-singular":"nociva","definite-error-unrecognized-form-masculine-plural":"nocivii","definite-error-unrecognized-form-feminine-neuter-plural":"nocivele"}},{"word":"nocivitate","pos":"noun","definitions":["harmfulness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nocivitate","accusative-definite-nominative-singular":"nocivitatea","accusative-indefinite-nominative-plural":"nocivități","accusative-definite-nominative-plural":"nocivitățile","dative-genitive-indefinite-singular":"nocivități","dative-definite-genitive-singular":"nocivității","dative-genitive-indefinite-plural":"nocivități","dative-definite-genitive-plural":"nocivităților","singular-vocative":"nocivitate","plural-vocative":"nocivităților"}},{"word":"Nocrich","pos":"name","definitions":["a commune of Sibiu County, Romania","a village in Nocrich, Sibiu County, Romania"],"gender":"m"},{"word":"noctambul","pos":"noun","definitions":["somnambulist","night owl"],"forms":{"plural":"noctambuli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"noctambul","accusative-definite-nominative-singular":"noctambulul","accusative-indefinite-nominative-plural":"noctambuli","accusative-definite-nominative-plural":"noctambulii","dative-genitive-indefinite-singular":"noctambul","dative-definite-genitive-singular":"noctambulului","dative-genitive-indefinite-plural":"noctambuli","dative-definite-genitive-plural":"noctambulilor","singular-vocative":"noctambulule","plural-vocative":"noctambulilor"}},{"word":"noctambulă","pos":"noun","definitions":["female equivalent of noctambul"],"forms":{"plural":"noctambule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"noctambulă","accusative-definite-nominative-singular":"noctambula","accusative-indefinite-nominative-plural":"noctambule","accusative-definite-nominative-plural":"noctambulele","dative-genitive-indefinite-singular":"noctambule","dative-definite-genitive-singular":"noctambulei","dative-genitive-indefinite-plural":"noctambule","dative-definite-genitive-plural":"noctambulelor","singular-vocative":"noctambulă","plural-vocative":"noctambulelor"}},{"word":"noctambulațiune","pos":"noun","definitions":["sleepwalking"],"forms":{"plural":"noctambulațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"noctambulațiune","accusative-definite-nominative-singular":"noctambulațiunea","accusative-indefinite-nominative-plural":"noctambulațiuni","accusative-definite-nominative-plural":"noctambulațiunile","dative-genitive-indefinite-singular":"noctambulațiuni","dative-definite-genitive-singular":"noctambulațiunii","dative-genitive-indefinite-plural":"noctambulațiuni","dative-definite-genitive-plural":"noctambulațiunilor","singular-vocative":"noctambulațiune","plural-vocative":"noctambulațiunilor"}},{"word":"noctambulism","pos":"noun","definitions":["noctambulism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"noctambulism","accusative-definite-nominative":"noctambulismul","dative-genitive-indefinite":"noctambulism","dative-definite-genitive":"noctambulismului","vocative":"noctambulismule"}},{"word":"nocturn","pos":"adj","definitions":["nocturnal"],"pronunciation":"/nokˈturn/","forms":{"feminine-singular":"nocturnă","masculine-plural":"nocturni","feminine-neuter-plural":"nocturne","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"nocturn","error-unrecognized-form-feminine-indefinite-singular":"nocturnă","error-unrecognized-form-indefinite-masculine-plural":"nocturni","error-unrecognized-form-feminine-indefinite-neuter-plural":"nocturne","definite-error-unrecognized-form-masculine-neuter-singular":"nocturnul","definite-error-unrecognized-form-feminine-singular":"nocturna","definite-error-unrecognized-form-masculine-plural":"nocturnii","definite-error-unrecognized-form-feminine-neuter-plural":"nocturnele"}},{"word":"nocturnă","pos":"noun","definitions":["nocturne","night game"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nocturnă","accusative-definite-nominative-singular":"nocturna","accusative-indefinite-nominative-plural":"nocturne","accusative-definite-nominative-plural":"nocturnele","dative-genitive-indefinite-singular":"nocturne","dative-definite-genitive-singular":"nocturnei","dative-genitive-indefinite-plural":"nocturne","dative-definite-genitive-plural":"nocturnelor","singular-vocative":"nocturnă","plural-vocative":"nocturnelor"}},{"word":"nod","pos":"noun","definitions":["knot"],"pronunciation":"/nod/","forms":{"plural":"noduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nod","accusative-definite-nominative-singular":"nodul","accusative-indefinite-nominative-plural":"noduri","accusative-definite-nominative-plural":"nodurile","dative-genitive-indefinite-singular":"nod","dative-definite-genitive-singular":"nodului","dative-genitive-indefinite-plural":"noduri","dative-definite-genitive-plural":"nodurilor","singular-vocative":"nodule","plural-vocative":"nodurilor"}},{"word":"nod gordian","pos":"noun","definitions":["Gordian knot"]},{"word":"nodal","pos":"adj","definitions":["nodal"],"forms":{"feminine-singular":"nodală","masculine-plural":"nodali","feminine-neuter-plural":"nodale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nodal","error-unrecognized-form-feminine-indefinite-singular":"nodală","error-unrecognized-form-indefinite-masculine-plural":"nodali","error-unrecognized-form-feminine-indefinite-neuter-plural":"nodale","definite-error-unrecognized-form-masculine-neuter-singular":"nodalul","definite-error-unrecognized-form-feminine-singular":"nodala","definite-error-unrecognized-form-masculine-plural":"nodalii","definite-error-unrecognized-form-feminine-neuter-plural":"nodalele"}},{"word":"nodătură","pos":"noun","definitions":["joint"],"forms":{"plural":"nodături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"nodătură","accusative-definite-nominative-singular":"nodătura","accusative-indefinite-nominative-plural":"nodături","accusative-definite-nominative-plural":"nodăturile","dative-genitive-indefinite-singular":"nodături","dative-definite-genitive-singular":"nodăturii","dative-genitive-indefinite-plural":"nodături","dative-definite-genitive-plural":"nodăturilor","singular-vocative":"nodătură","plural-vocative":"nodăturilor"}},{"word":"nodișor","pos":"noun","definitions":["diminutive of nod"],"forms":{"plural":"nodișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nodișor","accusative-definite-nominative-singular":"nodișorul","accusative-indefinite-nominative-plural":"nodișoare","accusative-definite-nominative-plural":"nodișoarele","dative-genitive-indefinite-singular":"nodișor","dative-definite-genitive-singular":"nodișorului","dative-genitive-indefinite-plural":"nodișoare","dative-definite-genitive-plural":"nodișoarelor","singular-vocative":"nodișorule","plural-vocative":"nodișoarelor"}},{"word":"nodoros","pos":"adj","definitions":["alternative form of noduros"],"forms":{"feminine-singular":"nodoroasă","masculine-plural":"nodoroși","feminine-neuter-plural":"nodoroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nodoros","error-unrecognized-form-feminine-indefinite-singular":"nodoroasă","error-unrecognized-form-indefinite-masculine-plural":"nodoroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nodoroase","definite-error-unrecognized-form-masculine-neuter-singular":"nodorosul","definite-error-unrecognized-form-feminine-singular":"nodoroasa","definite-error-unrecognized-form-masculine-plural":"nodoroșii","definite-error-unrecognized-form-feminine-neuter-plural":"nodoroasele"}},{"word":"nodos","pos":"adj","definitions":["nubbed, nubby, knobby","knotty"],"pronunciation":"/noˈdos/","forms":{"feminine-singular":"nodoasă","masculine-plural":"nodoși","feminine-neuter-plural":"nodoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nodos","error-unrecognized-form-feminine-indefinite-singular":"nodoasă","error-unrecognized-form-indefinite-masculine-plural":"nodoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nodoase","definite-error-unrecognized-form-masculine-neuter-singular":"nodosul","definite-error-unrecognized-form-feminine-singular":"nodoasa","definite-error-unrecognized-form-masculine-plural":"nodoșii","definite-error-unrecognized-form-feminine-neuter-plural":"nodoasele"}},{"word":"nodozitate","pos":"noun","definitions":["nodosity"],"forms":{"plural":"nodozități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nodozitate","accusative-definite-nominative-singular":"nodozitatea","accusative-indefinite-nominative-plural":"nodozități","accusative-definite-nominative-plural":"nodozitățile","dative-genitive-indefinite-singular":"nodozități","dative-definite-genitive-singular":"nodozității","dative-genitive-indefinite-plural":"nodozități","dative-definite-genitive-plural":"nodozităților","singular-vocative":"nodozitate","plural-vocative":"nodozităților"}},{"word":"nodul","pos":"noun","definitions":["nodule"],"forms":{"plural":"noduli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nodul","accusative-definite-nominative-singular":"nodulul","accusative-indefinite-nominative-plural":"noduli","accusative-definite-nominative-plural":"nodulii","dative-genitive-indefinite-singular":"nodul","dative-definite-genitive-singular":"nodulului","dative-genitive-indefinite-plural":"noduli","dative-definite-genitive-plural":"nodulilor","singular-vocative":"nodulule","plural-vocative":"nodulilor"}},{"word":"noduleț","pos":"noun","definitions":["diminutive of nod; small knot"],"forms":{"plural":"nodulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"noduleț","accusative-definite-nominative-singular":"nodulețul","accusative-indefinite-nominative-plural":"nodulețe","accusative-definite-nominative-plural":"nodulețele","dative-genitive-indefinite-singular":"noduleț","dative-definite-genitive-singular":"nodulețului","dative-genitive-indefinite-plural":"nodulețe","dative-definite-genitive-plural":"nodulețelor","singular-vocative":"nodulețule","plural-vocative":"nodulețelor"}},{"word":"nodulizare","pos":"noun","definitions":["nodulizing"],"forms":{"plural":"nodulizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nodulizare","accusative-definite-nominative-singular":"nodulizarea","accusative-indefinite-nominative-plural":"nodulizări","accusative-definite-nominative-plural":"nodulizările","dative-genitive-indefinite-singular":"nodulizări","dative-definite-genitive-singular":"nodulizării","dative-genitive-indefinite-plural":"nodulizări","dative-definite-genitive-plural":"nodulizărilor","singular-vocative":"nodulizare","plural-vocative":"nodulizărilor"}},{"word":"noduri","pos":"noun","definitions":["plural of nod"]},{"word":"noduros","pos":"adj","definitions":["gnarly"],"forms":{"feminine-singular":"noduroasă","masculine-plural":"noduroși","feminine-neuter-plural":"noduroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"noduros","error-unrecognized-form-feminine-indefinite-singular":"noduroasă","error-unrecognized-form-indefinite-masculine-plural":"noduroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"noduroase","definite-error-unrecognized-form-masculine-neuter-singular":"nodurosul","definite-error-unrecognized-form-feminine-singular":"noduroasa","definite-error-unrecognized-form-masculine-plural":"noduroșii","definite-error-unrecognized-form-feminine-neuter-plural":"noduroasele"}},{"word":"noduț","pos":"noun","definitions":["diminutive of nod"],"forms":{"plural":"noduțe","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"noduț","accusative-definite-nominative-singular":"noduțul","accusative-indefinite-nominative-plural":"noduțe","accusative-definite-nominative-plural":"noduței","dative-genitive-indefinite-singular":"noduț","dative-definite-genitive-singular":"noduțului","dative-genitive-indefinite-plural":"noduțe","dative-definite-genitive-plural":"noduțelor","singular-vocative":"noduțule","plural-vocative":"noduțelor"}},{"word":"noemă","pos":"noun","definitions":["noema"],"forms":{"plural":"noeme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"noemă","accusative-definite-nominative-singular":"noema","accusative-indefinite-nominative-plural":"noeme","accusative-definite-nominative-plural":"noemele","dative-genitive-indefinite-singular":"noeme","dative-definite-genitive-singular":"noemei","dative-genitive-indefinite-plural":"noeme","dative-definite-genitive-plural":"noemelor","singular-vocative":"noemă","plural-vocative":"noemelor"}},{"word":"noetic","pos":"adj","definitions":["noetic"],"forms":{"feminine-singular":"noetică","masculine-plural":"noetici","feminine-neuter-plural":"noetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"noetic","error-unrecognized-form-feminine-indefinite-singular":"noetică","error-unrecognized-form-indefinite-masculine-plural":"noetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"noetice","definite-error-unrecognized-form-masculine-neuter-singular":"noeticul","definite-error-unrecognized-form-feminine-singular":"noetica","definite-error-unrecognized-form-masculine-plural":"noeticii","definite-error-unrecognized-form-feminine-neuter-plural":"noeticele"}},{"word":"nogai","pos":"adj","definitions":["Nogai"],"forms":{"feminine-singular":"nogaie","masculine-plural":"nogai","feminine-neuter-plural":"nogaie","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nogai","error-unrecognized-form-feminine-indefinite-singular":"nogaie","error-unrecognized-form-indefinite-masculine-plural":"nogai","error-unrecognized-form-feminine-indefinite-neuter-plural":"nogaie","definite-error-unrecognized-form-masculine-neuter-singular":"nogaiul","definite-error-unrecognized-form-feminine-singular":"nogaia","definite-error-unrecognized-form-masculine-plural":"nogaii","definite-error-unrecognized-form-feminine-neuter-plural":"nogaiele"}},{"word":"nogai","pos":"noun","definitions":["Nogai"],"forms":{"plural":"nogai","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nogai","accusative-definite-nominative-singular":"nogaiul","accusative-indefinite-nominative-plural":"nogai","accusative-definite-nominative-plural":"nogaii","dative-genitive-indefinite-singular":"nogai","dative-definite-genitive-singular":"nogaiului","dative-genitive-indefinite-plural":"nogai","dative-definite-genitive-plural":"nogailor","singular-vocative":"nogaiule","plural-vocative":"nogailor"}},{"word":"Nohai","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Nohai"}},{"word":"nohutiu","pos":"adj","definitions":["alternative form of năutiu"],"forms":{"feminine-singular":"nohutie","plural":"nohutii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nohutiu","error-unrecognized-form-feminine-indefinite-singular":"nohutie","error-unrecognized-form-indefinite-masculine-plural":"nohutii","error-unrecognized-form-feminine-indefinite-neuter-plural":"nohutii","definite-error-unrecognized-form-masculine-neuter-singular":"nohutiul","definite-error-unrecognized-form-feminine-singular":"nohutia","definite-error-unrecognized-form-masculine-plural":"nohutiii","definite-error-unrecognized-form-feminine-neuter-plural":"nohutiile"}},{"word":"noi","pos":"pron","definitions":["we"],"pronunciation":"/noj/","forms":{"table-tags":"no-table-tags","inflection-template":"l-self","nominative":"noi","accusative-stressed":"noi","accusative-error-unrecognized-form":"ne","dative-stressed":"nouă","dative-error-unrecognized-form":"ne","masculine-possessive-singular":"nostru","masculine-plural-possessive":"noștri","neuter-possessive-singular":"nostru","neuter-plural-possessive":"noastre","feminine-possessive-singular":"noastră","feminine-plural-possessive":"noastre"}},{"word":"noi","pos":"pron","definitions":["us"],"pronunciation":"/noj/"},{"word":"noi","pos":"adj","definitions":["masculine/feminine/neuter plural nominative/accusative of nou (“new”)"],"pronunciation":"/noj/"},{"word":"noian","pos":"noun","definitions":["great quantity","large expanse of water, ocean"],"pronunciation":"/noˈjan/","forms":{"plural":"noiane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"noian","accusative-definite-nominative-singular":"noianul","accusative-indefinite-nominative-plural":"noiane","accusative-definite-nominative-plural":"noianele","dative-genitive-indefinite-singular":"noian","dative-definite-genitive-singular":"noianului","dative-genitive-indefinite-plural":"noiane","dative-definite-genitive-plural":"noianelor","singular-vocative":"noianule","plural-vocative":"noianelor"}},{"word":"noiembrie","pos":"noun","definitions":["November"],"pronunciation":"/noˈjembrije/"},{"word":"noiemvrie","pos":"noun","definitions":["alternative form of noiembrie"],"forms":{"plural":"noiemvrii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"noiemvrie","accusative-definite-nominative-singular":"noiemvrieul","accusative-indefinite-nominative-plural":"noiemvrii","accusative-definite-nominative-plural":"noiemvriii","dative-genitive-indefinite-singular":"noiemvrie","dative-definite-genitive-singular":"noiemvrieului","dative-genitive-indefinite-plural":"noiemvrii","dative-definite-genitive-plural":"noiemvriilor","singular-vocative":"noiemvrieule","plural-vocative":"noiemvriilor"}},{"word":"noimă","pos":"noun","definitions":["sense, meaning"],"forms":{"plural":"noime","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"noimă","accusative-definite-nominative-singular":"noima","accusative-indefinite-nominative-plural":"noime","accusative-definite-nominative-plural":"noimele","dative-genitive-indefinite-singular":"noime","dative-definite-genitive-singular":"noimei","dative-genitive-indefinite-plural":"noime","dative-definite-genitive-plural":"noimelor","singular-vocative":"noimă","plural-vocative":"noimelor"}},{"word":"noime","pos":"noun","definitions":["a ninth (one of nine equal parts of a whole)"],"pronunciation":"/noˈi.me/","forms":{"plural":"noimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"noime","accusative-definite-nominative-singular":"noimea","accusative-indefinite-nominative-plural":"noimi","accusative-definite-nominative-plural":"noimile","dative-genitive-indefinite-singular":"noimi","dative-definite-genitive-singular":"noimii","dative-genitive-indefinite-plural":"noimi","dative-definite-genitive-plural":"noimilor","singular-vocative":"noime","plural-vocative":"noimilor"}},{"word":"Noiștat","pos":"name","definitions":["a village in Iacobeni, Sibiu County, Romania"],"gender":"m"},{"word":"Nojag","pos":"name","definitions":["a village in Certeju de Sus, Hunedoara County, Romania"],"gender":"m"},{"word":"nojeală","pos":"noun","definitions":["leather straps for sandals"],"forms":{"plural":"nojeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nojeală","accusative-definite-nominative-singular":"nojeala","accusative-indefinite-nominative-plural":"nojele","accusative-definite-nominative-plural":"nojelele","dative-genitive-indefinite-singular":"nojele","dative-definite-genitive-singular":"nojelei","dative-genitive-indefinite-plural":"nojele","dative-definite-genitive-plural":"nojelelor","singular-vocative":"nojeală","plural-vocative":"nojelelor"}},{"word":"nojiță","pos":"noun","definitions":["leather straps for sandals"],"forms":{"plural":"nojițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nojiță","accusative-definite-nominative-singular":"nojița","accusative-indefinite-nominative-plural":"nojițe","accusative-definite-nominative-plural":"nojițele","dative-genitive-indefinite-singular":"nojițe","dative-definite-genitive-singular":"nojiței","dative-genitive-indefinite-plural":"nojițe","dative-definite-genitive-plural":"nojițelor","singular-vocative":"nojiță","plural-vocative":"nojițelor"}},{"word":"Nojogan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Nojogan"}},{"word":"Nojorid","pos":"name","definitions":["a commune of Bihor County, Romania","a village in Nojorid, Bihor County, Romania"],"gender":"m"},{"word":"nomă","pos":"noun","definitions":["noma"],"forms":{"plural":"nome","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nomă","accusative-definite-nominative-singular":"noma","accusative-indefinite-nominative-plural":"nome","accusative-definite-nominative-plural":"nomele","dative-genitive-indefinite-singular":"nome","dative-definite-genitive-singular":"nomei","dative-genitive-indefinite-plural":"nome","dative-definite-genitive-plural":"nomelor","singular-vocative":"nomă","plural-vocative":"nomelor"}},{"word":"nomad","pos":"noun","definitions":["nomad"],"pronunciation":"/noˈmad/","forms":{"plural":"nomazi","feminine":"equivalent nomadă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nomad","accusative-definite-nominative-singular":"nomadul","accusative-indefinite-nominative-plural":"nomazi","accusative-definite-nominative-plural":"nomazii","dative-genitive-indefinite-singular":"nomad","dative-definite-genitive-singular":"nomadului","dative-genitive-indefinite-plural":"nomazi","dative-definite-genitive-plural":"nomazilor","singular-vocative":"nomadule","plural-vocative":"nomazilor"}},{"word":"nomadă","pos":"noun","definitions":["female equivalent of nomad"],"forms":{"plural":"nomade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nomadă","accusative-definite-nominative-singular":"nomada","accusative-indefinite-nominative-plural":"nomade","accusative-definite-nominative-plural":"nomadele","dative-genitive-indefinite-singular":"nomade","dative-definite-genitive-singular":"nomadei","dative-genitive-indefinite-plural":"nomade","dative-definite-genitive-plural":"nomadelor","singular-vocative":"nomadă","plural-vocative":"nomadelor"}},{"word":"nomadism","pos":"noun","definitions":["nomadism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nomadism","accusative-definite-nominative":"nomadismul","dative-genitive-indefinite":"nomadism","dative-definite-genitive":"nomadismului","vocative":"nomadismule"}},{"word":"nomarh","pos":"noun","definitions":["nomarch"],"forms":{"plural":"nomarhi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nomarh","accusative-definite-nominative-singular":"nomarhul","accusative-indefinite-nominative-plural":"nomarhi","accusative-definite-nominative-plural":"nomarhii","dative-genitive-indefinite-singular":"nomarh","dative-definite-genitive-singular":"nomarhului","dative-genitive-indefinite-plural":"nomarhi","dative-definite-genitive-plural":"nomarhilor","singular-vocative":"nomarhule","plural-vocative":"nomarhilor"}},{"word":"nomenclator","pos":"noun","definitions":["nomenclator"],"forms":{"plural":"nomenclatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nomenclator","accusative-definite-nominative-singular":"nomenclatorul","accusative-indefinite-nominative-plural":"nomenclatoare","accusative-definite-nominative-plural":"nomenclatoarele","dative-genitive-indefinite-singular":"nomenclator","dative-definite-genitive-singular":"nomenclatorului","dative-genitive-indefinite-plural":"nomenclatoare","dative-definite-genitive-plural":"nomenclatoarelor","singular-vocative":"nomenclatorule","plural-vocative":"nomenclatoarelor"}},{"word":"nomenclatură","pos":"noun","definitions":["nomenclature"],"forms":{"plural":"nomenclaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nomenclatură","accusative-definite-nominative-singular":"nomenclatura","accusative-indefinite-nominative-plural":"nomenclature","accusative-definite-nominative-plural":"nomenclaturele","dative-genitive-indefinite-singular":"nomenclature","dative-definite-genitive-singular":"nomenclaturei","dative-genitive-indefinite-plural":"nomenclature","dative-definite-genitive-plural":"nomenclaturelor","singular-vocative":"nomenclatură","plural-vocative":"nomenclaturelor"}},{"word":"nomenclaturist","pos":"noun","definitions":["member of the nomenklatura"],"forms":{"plural":"nomenclaturiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nomenclaturist","accusative-definite-nominative-singular":"nomenclaturistul","accusative-indefinite-nominative-plural":"nomenclaturiști","accusative-definite-nominative-plural":"nomenclaturiștii","dative-genitive-indefinite-singular":"nomenclaturist","dative-definite-genitive-singular":"nomenclaturistului","dative-genitive-indefinite-plural":"nomenclaturiști","dative-definite-genitive-plural":"nomenclaturiștilor","singular-vocative":"nomenclaturistule","plural-vocative":"nomenclaturiștilor"}},{"word":"nomenclaturistă","pos":"noun","definitions":["female equivalent of nomenclaturist"],"forms":{"plural":"nomenclaturiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nomenclaturistă","accusative-definite-nominative-singular":"nomenclaturista","accusative-indefinite-nominative-plural":"nomenclaturiste","accusative-definite-nominative-plural":"nomenclaturistele","dative-genitive-indefinite-singular":"nomenclaturiste","dative-definite-genitive-singular":"nomenclaturistei","dative-genitive-indefinite-plural":"nomenclaturiste","dative-definite-genitive-plural":"nomenclaturistelor","singular-vocative":"nomenclaturistă","plural-vocative":"nomenclaturistelor"}},{"word":"nomicos","pos":"noun","definitions":["jurist"],"forms":{"plural":"nomicoși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nomicos","accusative-definite-nominative-singular":"nomicosul","accusative-indefinite-nominative-plural":"nomicoși","accusative-definite-nominative-plural":"nomicoșii","dative-genitive-indefinite-singular":"nomicos","dative-definite-genitive-singular":"nomicosului","dative-genitive-indefinite-plural":"nomicoși","dative-definite-genitive-plural":"nomicoșilor","singular-vocative":"nomicosule","plural-vocative":"nomicoșilor"}},{"word":"nominal","pos":"adj","definitions":["nominal"],"pronunciation":"/nomiˈnal/","forms":{"feminine-singular":"nominală","masculine-plural":"nominali","feminine-neuter-plural":"nominale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"nominal","error-unrecognized-form-feminine-indefinite-singular":"nominală","error-unrecognized-form-indefinite-masculine-plural":"nominali","error-unrecognized-form-feminine-indefinite-neuter-plural":"nominale","definite-error-unrecognized-form-masculine-neuter-singular":"nominalul","definite-error-unrecognized-form-feminine-singular":"nominala","definite-error-unrecognized-form-masculine-plural":"nominalii","definite-error-unrecognized-form-feminine-neuter-plural":"nominalele"}},{"word":"nominale","pos":"adj","definitions":["feminine/neuter plural of nominal"],"pronunciation":"[nomiˈnale]"},{"word":"nominali","pos":"adj","definitions":["masculine plural of nominal"],"pronunciation":"[nomiˈnalʲ]"},{"word":"nominalism","pos":"noun","definitions":["nominalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nominalism","accusative-definite-nominative":"nominalismul","dative-genitive-indefinite":"nominalism","dative-definite-genitive":"nominalismului","vocative":"nominalismule"}},{"word":"nominalist","pos":"noun","definitions":["nominalist"],"forms":{"plural":"nominaliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nominalist","accusative-definite-nominative-singular":"nominalistul","accusative-indefinite-nominative-plural":"nominaliști","accusative-definite-nominative-plural":"nominaliștii","dative-genitive-indefinite-singular":"nominalist","dative-definite-genitive-singular":"nominalistului","dative-genitive-indefinite-plural":"nominaliști","dative-definite-genitive-plural":"nominaliștilor","singular-vocative":"nominalistule","plural-vocative":"nominaliștilor"}},{"word":"nominalistă","pos":"noun","definitions":["female equivalent of nominalist"],"forms":{"plural":"nominaliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nominalistă","accusative-definite-nominative-singular":"nominalista","accusative-indefinite-nominative-plural":"nominaliste","accusative-definite-nominative-plural":"nominalistele","dative-genitive-indefinite-singular":"nominaliste","dative-definite-genitive-singular":"nominalistei","dative-genitive-indefinite-plural":"nominaliste","dative-definite-genitive-plural":"nominalistelor","singular-vocative":"nominalistă","plural-vocative":"nominalistelor"}},{"word":"nominaliza","pos":"verb","definitions":["to nominate, to appoint"],"forms":{"canonical":"a nominaliza 1st conjugation","present-singular-third-person":"nominalizează","participle-past":"nominalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a nominaliza","gerund":"nominalizând","first-person-indicative-present-singular":"nominalizez","indicative-present-second-person-singular":"nominalizezi","indicative-present-singular-third-person":"nominalizează","first-person-indicative-plural-present":"nominalizăm","indicative-plural-present-second-person":"nominalizați","indicative-plural-present-third-person":"nominalizează","first-person-imperfect-indicative-singular":"nominalizam","imperfect-indicative-second-person-singular":"nominalizai","imperfect-indicative-singular-third-person":"nominaliza","first-person-imperfect-indicative-plural":"nominalizam","imperfect-indicative-plural-second-person":"nominalizați","imperfect-indicative-plural-third-person":"nominalizau","first-person-indicative-perfect-singular":"nominalizai","indicative-perfect-second-person-singular":"nominalizași","indicative-perfect-singular-third-person":"nominaliză","first-person-indicative-perfect-plural":"nominalizarăm","indicative-perfect-plural-second-person":"nominalizarăți","indicative-perfect-plural-third-person":"nominalizară","first-person-indicative-pluperfect-singular":"nominalizasem","indicative-pluperfect-second-person-singular":"nominalizaseși","indicative-pluperfect-singular-third-person":"nominalizase","first-person-indicative-pluperfect-plural":"nominalizaserăm","indicative-pluperfect-plural-second-person":"nominalizaserăți","indicative-pluperfect-plural-third-person":"nominalizaseră","first-person-present-singular-subjunctive":"să nominalizez","present-second-person-singular-subjunctive":"să nominalizezi","present-singular-subjunctive-third-person":"să nominalizeze","first-person-plural-present-subjunctive":"să nominalizăm","plural-present-second-person-subjunctive":"să nominalizați","plural-present-subjunctive-third-person":"să nominalizeze","imperative-second-person-singular":"nominalizează","imperative-plural-second-person":"nominalizați","imperative-negative-second-person-singular":"nu nominaliza","imperative-negative-plural-second-person":"nu nominalizați"}},{"word":"nominalizare","pos":"noun","definitions":["nomination"],"forms":{"plural":"nominalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nominalizare","accusative-definite-nominative-singular":"nominalizarea","accusative-indefinite-nominative-plural":"nominalizări","accusative-definite-nominative-plural":"nominalizările","dative-genitive-indefinite-singular":"nominalizări","dative-definite-genitive-singular":"nominalizării","dative-genitive-indefinite-plural":"nominalizări","dative-definite-genitive-plural":"nominalizărilor","singular-vocative":"nominalizare","plural-vocative":"nominalizărilor"}},{"word":"nominalizase","pos":"verb","definitions":["third-person singular pluperfect indicative of nominaliza"],"pronunciation":"[nominaliˈzase]"},{"word":"nominație","pos":"noun","definitions":["nomination"],"forms":{"plural":"nominații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nominație","accusative-definite-nominative-singular":"nominația","accusative-indefinite-nominative-plural":"nominații","accusative-definite-nominative-plural":"nominațiile","dative-genitive-indefinite-singular":"nominații","dative-definite-genitive-singular":"nominației","dative-genitive-indefinite-plural":"nominații","dative-definite-genitive-plural":"nominațiilor","singular-vocative":"nominație","plural-vocative":"nominațiilor"}},{"word":"nominațiune","pos":"noun","definitions":["obsolete form of nominație"],"forms":{"plural":"nominațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nominațiune","accusative-definite-nominative-singular":"nominațiunea","accusative-indefinite-nominative-plural":"nominațiuni","accusative-definite-nominative-plural":"nominațiunile","dative-genitive-indefinite-singular":"nominațiuni","dative-definite-genitive-singular":"nominațiunii","dative-genitive-indefinite-plural":"nominațiuni","dative-definite-genitive-plural":"nominațiunilor","singular-vocative":"nominațiune","plural-vocative":"nominațiunilor"}},{"word":"nominativ","pos":"noun","definitions":["the nominative case"],"pronunciation":"/ˌnominaˈtiv/","forms":{"plural":"nominative","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nominativ","accusative-definite-nominative-singular":"nominativul","accusative-indefinite-nominative-plural":"nominative","accusative-definite-nominative-plural":"nominativele","dative-genitive-indefinite-singular":"nominativ","dative-definite-genitive-singular":"nominativului","dative-genitive-indefinite-plural":"nominative","dative-definite-genitive-plural":"nominativelor","singular-vocative":"nominativule","plural-vocative":"nominativelor"}},{"word":"nominative","pos":"adj","definitions":["feminine/neuter plural nominative/accusative of nominativ"],"pronunciation":"/ˌnominaˈtive/"},{"word":"nominative","pos":"noun","definitions":["plural of nominativ"],"pronunciation":"/ˌnominaˈtive/","gender":"n-p"},{"word":"nominativiza","pos":"verb","definitions":["to make something nominative"],"forms":{"canonical":"a nominativiza 1st conjugation","present-singular-third-person":"normativizează","participle-past":"nominativizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a nominativiza","gerund":"nominativizând","first-person-indicative-present-singular":"nominativizez","indicative-present-second-person-singular":"nominativizezi","indicative-present-singular-third-person":"nominativizează","first-person-indicative-plural-present":"nominativizăm","indicative-plural-present-second-person":"nominativizați","indicative-plural-present-third-person":"nominativizează","first-person-imperfect-indicative-singular":"nominativizam","imperfect-indicative-second-person-singular":"nominativizai","imperfect-indicative-singular-third-person":"nominativiza","first-person-imperfect-indicative-plural":"nominativizam","imperfect-indicative-plural-second-person":"nominativizați","imperfect-indicative-plural-third-person":"nominativizau","first-person-indicative-perfect-singular":"nominativizai","indicative-perfect-second-person-singular":"nominativizași","indicative-perfect-singular-third-person":"nominativiză","first-person-indicative-perfect-plural":"nominativizarăm","indicative-perfect-plural-second-person":"nominativizarăți","indicative-perfect-plural-third-person":"nominativizară","first-person-indicative-pluperfect-singular":"nominativizasem","indicative-pluperfect-second-person-singular":"nominativizaseși","indicative-pluperfect-singular-third-person":"nominativizase","first-person-indicative-pluperfect-plural":"nominativizaserăm","indicative-pluperfect-plural-second-person":"nominativizaserăți","indicative-pluperfect-plural-third-person":"nominativizaseră","first-person-present-singular-subjunctive":"să nominativizez","present-second-person-singular-subjunctive":"să nominativizezi","present-singular-subjunctive-third-person":"să nominativizeze","first-person-plural-present-subjunctive":"să nominativizăm","plural-present-second-person-subjunctive":"să nominativizați","plural-present-subjunctive-third-person":"să nominativizeze","imperative-second-person-singular":"nominativizează","imperative-plural-second-person":"nominativizați","imperative-negative-second-person-singular":"nu nominativiza","imperative-negative-plural-second-person":"nu nominativizați"}},{"word":"nomizmă","pos":"noun","definitions":["a coin"],"forms":{"plural":"nomizme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nomizmă","accusative-definite-nominative-singular":"nomizma","accusative-indefinite-nominative-plural":"nomizme","accusative-definite-nominative-plural":"nomizmele","dative-genitive-indefinite-singular":"nomizme","dative-definite-genitive-singular":"nomizmei","dative-genitive-indefinite-plural":"nomizme","dative-definite-genitive-plural":"nomizmelor","singular-vocative":"nomizmă","plural-vocative":"nomizmelor"}},{"word":"nomocanon","pos":"noun","definitions":["a collection of imperial Byzantine laws and church canons"],"forms":{"plural":"nomocanoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nomocanon","accusative-definite-nominative-singular":"nomocanonul","accusative-indefinite-nominative-plural":"nomocanoane","accusative-definite-nominative-plural":"nomocanoanele","dative-genitive-indefinite-singular":"nomocanon","dative-definite-genitive-singular":"nomocanonului","dative-genitive-indefinite-plural":"nomocanoane","dative-definite-genitive-plural":"nomocanoanelor","singular-vocative":"nomocanonule","plural-vocative":"nomocanoanelor"}},{"word":"nomofilax","pos":"noun","definitions":["nomophylax"],"forms":{"plural":"nomofilacși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nomofilax","accusative-definite-nominative-singular":"nomofilaxul","accusative-indefinite-nominative-plural":"nomofilacși","accusative-definite-nominative-plural":"nomofilacșii","dative-genitive-indefinite-singular":"nomofilax","dative-definite-genitive-singular":"nomofilaxului","dative-genitive-indefinite-plural":"nomofilacși","dative-definite-genitive-plural":"nomofilacșilor","singular-vocative":"nomofilaxule","plural-vocative":"nomofilacșilor"}},{"word":"nomograf","pos":"noun","definitions":["nomograph"],"forms":{"plural":"nomografi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nomograf","accusative-definite-nominative-singular":"nomograful","accusative-indefinite-nominative-plural":"nomografe","accusative-definite-nominative-plural":"nomografele","dative-genitive-indefinite-singular":"nomograf","dative-definite-genitive-singular":"nomografului","dative-genitive-indefinite-plural":"nomografe","dative-definite-genitive-plural":"nomografelor","singular-vocative":"nomografule","plural-vocative":"nomografelor"}},{"word":"nomografic","pos":"adj","definitions":["nomographic"],"forms":{"feminine-singular":"nomografică","masculine-plural":"nomografici","feminine-neuter-plural":"nomografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nomografic","error-unrecognized-form-feminine-indefinite-singular":"nomografică","error-unrecognized-form-indefinite-masculine-plural":"nomografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nomografice","definite-error-unrecognized-form-masculine-neuter-singular":"nomograficul","definite-error-unrecognized-form-feminine-singular":"nomografica","definite-error-unrecognized-form-masculine-plural":"nomograficii","definite-error-unrecognized-form-feminine-neuter-plural":"nomograficele"}},{"word":"nomografie","pos":"noun","definitions":["nomography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"nomografie","accusative-definite-nominative":"nomografia","dative-genitive-indefinite":"nomografii","dative-definite-genitive":"nomografiei","vocative":"nomografie"}},{"word":"nomogramă","pos":"noun","definitions":["nomogram"],"forms":{"plural":"nomograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nomogramă","accusative-definite-nominative-singular":"nomograma","accusative-indefinite-nominative-plural":"nomograme","accusative-definite-nominative-plural":"nomogramele","dative-genitive-indefinite-singular":"nomograme","dative-definite-genitive-singular":"nomogramei","dative-genitive-indefinite-plural":"nomograme","dative-definite-genitive-plural":"nomogramelor","singular-vocative":"nomogramă","plural-vocative":"nomogramelor"}},{"word":"nomol","pos":"noun","definitions":["alternative form of nămol"],"forms":{"plural":"nomoluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nomol","accusative-definite-nominative-singular":"nomolul","accusative-indefinite-nominative-plural":"nomoluri","accusative-definite-nominative-plural":"nomolurile","dative-genitive-indefinite-singular":"nomol","dative-definite-genitive-singular":"nomolului","dative-genitive-indefinite-plural":"nomoluri","dative-definite-genitive-plural":"nomolurilor","singular-vocative":"nomolule","plural-vocative":"nomolurilor"}},{"word":"nomoli","pos":"verb","definitions":["alternative form of nămoli"],"forms":{"canonical":"a nomoli 4th conjugation","present-singular-third-person":"nomolește","participle-past":"nomolit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nomoli","gerund":"nomolind","first-person-indicative-present-singular":"nomolesc","indicative-present-second-person-singular":"nomolești","indicative-present-singular-third-person":"nomolește","first-person-indicative-plural-present":"nomolim","indicative-plural-present-second-person":"nomoliți","indicative-plural-present-third-person":"nomolesc","first-person-imperfect-indicative-singular":"nomoleam","imperfect-indicative-second-person-singular":"nomoleai","imperfect-indicative-singular-third-person":"nomolea","first-person-imperfect-indicative-plural":"nomoleam","imperfect-indicative-plural-second-person":"nomoleați","imperfect-indicative-plural-third-person":"nomoleau","first-person-indicative-perfect-singular":"nomolii","indicative-perfect-second-person-singular":"nomoliși","indicative-perfect-singular-third-person":"nomoli","first-person-indicative-perfect-plural":"nomolirăm","indicative-perfect-plural-second-person":"nomolirăți","indicative-perfect-plural-third-person":"nomoliră","first-person-indicative-pluperfect-singular":"nomolisem","indicative-pluperfect-second-person-singular":"nomoliseși","indicative-pluperfect-singular-third-person":"nomolise","first-person-indicative-pluperfect-plural":"nomoliserăm","indicative-pluperfect-plural-second-person":"nomoliserăți","indicative-pluperfect-plural-third-person":"nomoliseră","first-person-present-singular-subjunctive":"să nomolesc","present-second-person-singular-subjunctive":"să nomolești","present-singular-subjunctive-third-person":"să nomolească","first-person-plural-present-subjunctive":"să nomolim","plural-present-second-person-subjunctive":"să nomoliți","plural-present-subjunctive-third-person":"să nomolească","imperative-second-person-singular":"nomolește","imperative-plural-second-person":"nomoliți","imperative-negative-second-person-singular":"nu nomoli","imperative-negative-plural-second-person":"nu nomoliți"}},{"word":"nomolit","pos":"adj","definitions":["alternative form of nămolit"],"forms":{"feminine-singular":"nomolită","masculine-plural":"nomoliți","feminine-neuter-plural":"nomolite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nomolit","error-unrecognized-form-feminine-indefinite-singular":"nomolită","error-unrecognized-form-indefinite-masculine-plural":"nomoliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nomolite","definite-error-unrecognized-form-masculine-neuter-singular":"nomolitul","definite-error-unrecognized-form-feminine-singular":"nomolita","definite-error-unrecognized-form-masculine-plural":"nomoliții","definite-error-unrecognized-form-feminine-neuter-plural":"nomolitele"}},{"word":"nomolos","pos":"adj","definitions":["alternative form of nămolos"],"forms":{"feminine-singular":"nomoloasă","masculine-plural":"nomoloși","feminine-neuter-plural":"nomoloase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nomolos","error-unrecognized-form-feminine-indefinite-singular":"nomoloasă","error-unrecognized-form-indefinite-masculine-plural":"nomoloși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nomoloase","definite-error-unrecognized-form-masculine-neuter-singular":"nomolosul","definite-error-unrecognized-form-feminine-singular":"nomoloasa","definite-error-unrecognized-form-masculine-plural":"nomoloșii","definite-error-unrecognized-form-feminine-neuter-plural":"nomoloasele"}},{"word":"nomotemisi","pos":"verb","definitions":["to legislate"],"forms":{"canonical":"a nomotemisi 4th conjugation","present-singular-third-person":"nomotemisește","participle-past":"nomotemisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nomotemisi","gerund":"nomotemisind","first-person-indicative-present-singular":"nomotemisesc","indicative-present-second-person-singular":"nomotemisești","indicative-present-singular-third-person":"nomotemisește","first-person-indicative-plural-present":"nomotemisim","indicative-plural-present-second-person":"nomotemisiți","indicative-plural-present-third-person":"nomotemisesc","first-person-imperfect-indicative-singular":"nomotemiseam","imperfect-indicative-second-person-singular":"nomotemiseai","imperfect-indicative-singular-third-person":"nomotemisea","first-person-imperfect-indicative-plural":"nomotemiseam","imperfect-indicative-plural-second-person":"nomotemiseați","imperfect-indicative-plural-third-person":"nomotemiseau","first-person-indicative-perfect-singular":"nomotemisii","indicative-perfect-second-person-singular":"nomotemisiși","indicative-perfect-singular-third-person":"nomotemisi","first-person-indicative-perfect-plural":"nomotemisirăm","indicative-perfect-plural-second-person":"nomotemisirăți","indicative-perfect-plural-third-person":"nomotemisiră","first-person-indicative-pluperfect-singular":"nomotemisisem","indicative-pluperfect-second-person-singular":"nomotemisiseși","indicative-pluperfect-singular-third-person":"nomotemisise","first-person-indicative-pluperfect-plural":"nomotemisiserăm","indicative-pluperfect-plural-second-person":"nomotemisiserăți","indicative-pluperfect-plural-third-person":"nomotemisiseră","first-person-present-singular-subjunctive":"să nomotemisesc","present-second-person-singular-subjunctive":"să nomotemisești","present-singular-subjunctive-third-person":"să nomotemisească","first-person-plural-present-subjunctive":"să nomotemisim","plural-present-second-person-subjunctive":"să nomotemisiți","plural-present-subjunctive-third-person":"să nomotemisească","imperative-second-person-singular":"nomotemisește","imperative-plural-second-person":"nomotemisiți","imperative-negative-second-person-singular":"nu nomotemisi","imperative-negative-plural-second-person":"nu nomotemisiți"}},{"word":"nomotesie","pos":"noun","definitions":["legislature, legislation"],"forms":{"plural":"nomotesii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nomotesie","accusative-definite-nominative-singular":"nomotesia","accusative-indefinite-nominative-plural":"nomotesii","accusative-definite-nominative-plural":"nomotesiile","dative-genitive-indefinite-singular":"nomotesii","dative-definite-genitive-singular":"nomotesiei","dative-genitive-indefinite-plural":"nomotesii","dative-definite-genitive-plural":"nomotesiilor","singular-vocative":"nomotesie","plural-vocative":"nomotesiilor"}},{"word":"nomotet","pos":"noun","definitions":["nomothete"],"forms":{"plural":"nomoteți","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nomotet","accusative-definite-nominative-singular":"nomotetul","accusative-indefinite-nominative-plural":"nomoteți","accusative-definite-nominative-plural":"nomotețile","dative-genitive-indefinite-singular":"nomotet","dative-definite-genitive-singular":"nomotetului","dative-genitive-indefinite-plural":"nomoteți","dative-definite-genitive-plural":"nomoteților","singular-vocative":"nomotetule","plural-vocative":"nomoteților"}},{"word":"nomotetis","pos":"noun","definitions":["legislator"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"nomotetis","accusative-definite-nominative":"nomotetisul","dative-genitive-indefinite":"nomotetis","dative-definite-genitive":"nomotetisului","vocative":"nomotetisule"}},{"word":"non-stop","pos":"adj","definitions":["nonstop"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"non-stop","error-unrecognized-form-feminine-indefinite-singular":"non-stop","error-unrecognized-form-indefinite-masculine-plural":"non-stop","error-unrecognized-form-feminine-indefinite-neuter-plural":"non-stop","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"non-stop","pos":"adv","definitions":["nonstop"]},{"word":"nonă","pos":"noun","definitions":["the nones"],"forms":{"plural":"none","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nonă","accusative-definite-nominative-singular":"nona","accusative-indefinite-nominative-plural":"none","accusative-definite-nominative-plural":"nonele","dative-genitive-indefinite-singular":"none","dative-definite-genitive-singular":"nonei","dative-genitive-indefinite-plural":"none","dative-definite-genitive-plural":"nonelor","singular-vocative":"nonă","plural-vocative":"nonelor"}},{"word":"nonagenar","pos":"noun","definitions":["nonagenarian"],"forms":{"plural":"nonagenari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nonagenar","accusative-definite-nominative-singular":"nonagenarul","accusative-indefinite-nominative-plural":"nonagenari","accusative-definite-nominative-plural":"nonagenarii","dative-genitive-indefinite-singular":"nonagenar","dative-definite-genitive-singular":"nonagenarului","dative-genitive-indefinite-plural":"nonagenari","dative-definite-genitive-plural":"nonagenarilor","singular-vocative":"nonagenarule","plural-vocative":"nonagenarilor"}},{"word":"nonagenară","pos":"noun","definitions":["female equivalent of nonagenar"],"forms":{"plural":"nonagenare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nonagenară","accusative-definite-nominative-singular":"nonagenara","accusative-indefinite-nominative-plural":"nonagenare","accusative-definite-nominative-plural":"nonagenarele","dative-genitive-indefinite-singular":"nonagenare","dative-definite-genitive-singular":"nonagenarei","dative-genitive-indefinite-plural":"nonagenare","dative-definite-genitive-plural":"nonagenarelor","singular-vocative":"nonagenară","plural-vocative":"nonagenarelor"}},{"word":"nonbeligerant","pos":"noun","definitions":["nonbelligerent"],"forms":{"plural":"nonbeligeranți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nonbeligerant","accusative-definite-nominative-singular":"nonbeligerantul","accusative-indefinite-nominative-plural":"nonbeligeranți","accusative-definite-nominative-plural":"nonbeligeranții","dative-genitive-indefinite-singular":"nonbeligerant","dative-definite-genitive-singular":"nonbeligerantului","dative-genitive-indefinite-plural":"nonbeligeranți","dative-definite-genitive-plural":"nonbeligeranților","singular-vocative":"nonbeligerantule","plural-vocative":"nonbeligeranților"}},{"word":"nonconformism","pos":"noun","definitions":["nonconformism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nonconformism","accusative-definite-nominative":"nonconformismul","dative-genitive-indefinite":"nonconformism","dative-definite-genitive":"nonconformismului","vocative":"nonconformismule"}},{"word":"nonconformist","pos":"noun","definitions":["nonconformist, maverick"],"forms":{"plural":"nonconformiști","feminine":"equivalent nonconformistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nonconformist","accusative-definite-nominative-singular":"nonconformistul","accusative-indefinite-nominative-plural":"nonconformiști","accusative-definite-nominative-plural":"nonconformiștii","dative-genitive-indefinite-singular":"nonconformist","dative-definite-genitive-singular":"nonconformistului","dative-genitive-indefinite-plural":"nonconformiști","dative-definite-genitive-plural":"nonconformiștilor","singular-vocative":"nonconformistule","plural-vocative":"nonconformiștilor"}},{"word":"nonconformistă","pos":"noun","definitions":["female equivalent of nonconformist"],"forms":{"plural":"nonconformiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nonconformistă","accusative-definite-nominative-singular":"nonconformista","accusative-indefinite-nominative-plural":"nonconformiste","accusative-definite-nominative-plural":"nonconformistele","dative-genitive-indefinite-singular":"nonconformiste","dative-definite-genitive-singular":"nonconformistei","dative-genitive-indefinite-plural":"nonconformiste","dative-definite-genitive-plural":"nonconformistelor","singular-vocative":"nonconformistă","plural-vocative":"nonconformistelor"}},{"word":"noncontradicție","pos":"noun","definitions":["non-contradiction"],"forms":{"plural":"noncontradicții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"noncontradicție","accusative-definite-nominative-singular":"noncontradicția","accusative-indefinite-nominative-plural":"noncontradicții","accusative-definite-nominative-plural":"noncontradicțiile","dative-genitive-indefinite-singular":"noncontradicții","dative-definite-genitive-singular":"noncontradicției","dative-genitive-indefinite-plural":"noncontradicții","dative-definite-genitive-plural":"noncontradicțiilor","singular-vocative":"noncontradicție","plural-vocative":"noncontradicțiilor"}},{"word":"nonet","pos":"noun","definitions":["nonet"],"forms":{"plural":"nonete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nonet","accusative-definite-nominative-singular":"nonetul","accusative-indefinite-nominative-plural":"nonete","accusative-definite-nominative-plural":"nonetele","dative-genitive-indefinite-singular":"nonet","dative-definite-genitive-singular":"nonetului","dative-genitive-indefinite-plural":"nonete","dative-definite-genitive-plural":"nonetelor","singular-vocative":"nonetule","plural-vocative":"nonetelor"}},{"word":"nonexistență","pos":"noun","definitions":["nonexistence"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"nonexistență","accusative-definite-nominative":"nonexistența","dative-genitive-indefinite":"nonexistențe","dative-definite-genitive":"nonexistenței","vocative":"nonexistență"}},{"word":"nonfigurativ","pos":"adj","definitions":["nonfigurative"],"forms":{"feminine-singular":"nonfigurativă","masculine-plural":"nonfigurativi","feminine-neuter-plural":"nonfigurative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nonfigurativ","error-unrecognized-form-feminine-indefinite-singular":"nonfigurativă","error-unrecognized-form-indefinite-masculine-plural":"nonfigurativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"nonfigurative","definite-error-unrecognized-form-masculine-neuter-singular":"nonfigurativul","definite-error-unrecognized-form-feminine-singular":"nonfigurativa","definite-error-unrecognized-form-masculine-plural":"nonfigurativii","definite-error-unrecognized-form-feminine-neuter-plural":"nonfigurativele"}},{"word":"nonintervenție","pos":"noun","definitions":["non-intervention"],"forms":{"plural":"nonintervenții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nonintervenție","accusative-definite-nominative-singular":"nonintervenția","accusative-indefinite-nominative-plural":"nonintervenții","accusative-definite-nominative-plural":"nonintervențiile","dative-genitive-indefinite-singular":"nonintervenții","dative-definite-genitive-singular":"nonintervenției","dative-genitive-indefinite-plural":"nonintervenții","dative-definite-genitive-plural":"nonintervențiilor","singular-vocative":"nonintervenție","plural-vocative":"nonintervențiilor"}},{"word":"nonpareil","pos":"noun","definitions":["nonpareil"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nonpareil","accusative-definite-nominative":"nonpareilul","dative-genitive-indefinite":"nonpareil","dative-definite-genitive":"nonpareilului","vocative":"nonpareilule"}},{"word":"nonparel","pos":"noun","definitions":["alternative form of nonpareil"],"forms":{"plural":"nonparele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nonparel","accusative-definite-nominative-singular":"nonparelul","accusative-indefinite-nominative-plural":"nonparele","accusative-definite-nominative-plural":"nonparelele","dative-genitive-indefinite-singular":"nonparel","dative-definite-genitive-singular":"nonparelului","dative-genitive-indefinite-plural":"nonparele","dative-definite-genitive-plural":"nonparelelor","singular-vocative":"nonparelule","plural-vocative":"nonparelelor"}},{"word":"nonprofit","pos":"adj","definitions":["non-profit"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nonprofit","error-unrecognized-form-feminine-indefinite-singular":"nonprofit","error-unrecognized-form-indefinite-masculine-plural":"nonprofit","error-unrecognized-form-feminine-indefinite-neuter-plural":"nonprofit","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"nonșalant","pos":"adj","definitions":["nonchalant"],"forms":{"feminine-singular":"nonșalantă","masculine-plural":"nonșalanți","feminine-neuter-plural":"nonșalante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nonșalant","error-unrecognized-form-feminine-indefinite-singular":"nonșalantă","error-unrecognized-form-indefinite-masculine-plural":"nonșalanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nonșalante","definite-error-unrecognized-form-masculine-neuter-singular":"nonșalantul","definite-error-unrecognized-form-feminine-singular":"nonșalanta","definite-error-unrecognized-form-masculine-plural":"nonșalanții","definite-error-unrecognized-form-feminine-neuter-plural":"nonșalantele"}},{"word":"nonșalanță","pos":"noun","definitions":["nonchalance"]},{"word":"nonsens","pos":"noun","definitions":["nonsense"],"forms":{"plural":"nonsensuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nonsens","accusative-definite-nominative-singular":"nonsensul","accusative-indefinite-nominative-plural":"nonsensuri","accusative-definite-nominative-plural":"nonsensurile","dative-genitive-indefinite-singular":"nonsens","dative-definite-genitive-singular":"nonsensului","dative-genitive-indefinite-plural":"nonsensuri","dative-definite-genitive-plural":"nonsensurilor","singular-vocative":"nonsensule","plural-vocative":"nonsensurilor"}},{"word":"nonstop","pos":"adj","definitions":["nonstop (without stopping or interruption)"],"pronunciation":"/nonˈstop/"},{"word":"nonstop","pos":"noun","definitions":["nonstop (convenience store open 24 hours a day)"],"pronunciation":"/nonˈstop/","examples":[{"ro":"Într-o seară pe la zece, am intrat într-un nonstop să-mi cumpăr ţigări. Magazin mic, aglomeraţie mare. Doamna vânzătoare abia se mişca, scotea lucrurile solicitate din vitrină ca-ntr-o scenă din Matrix: […]","en":"One evening at around 10 o'clock, I've entered a nonstop to buy myself cigarettes. Small store, big agglomeration. The saleswoman hardly moved and took the requested items out of the display case as though in a scene of Matrix: […]"}],"forms":{"plural":"nonstopuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nonstop","accusative-definite-nominative-singular":"nonstopul","accusative-indefinite-nominative-plural":"nonstopuri","accusative-definite-nominative-plural":"nonstopurile","dative-genitive-indefinite-singular":"nonstop","dative-definite-genitive-singular":"nonstopului","dative-genitive-indefinite-plural":"nonstopuri","dative-definite-genitive-plural":"nonstopurilor","singular-vocative":"nonstopule","plural-vocative":"nonstopurilor"}},{"word":"nonvaloare","pos":"noun","definitions":["nonvalue"],"forms":{"plural":"nonvalori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nonvaloare","accusative-definite-nominative-singular":"nonvaloarea","accusative-indefinite-nominative-plural":"nonvaloari","accusative-definite-nominative-plural":"nonvaloarile","dative-genitive-indefinite-singular":"nonvaloari","dative-definite-genitive-singular":"nonvaloarii","dative-genitive-indefinite-plural":"nonvaloari","dative-definite-genitive-plural":"nonvaloarilor","singular-vocative":"nonvaloare","plural-vocative":"nonvaloarilor"}},{"word":"nonviolent","pos":"adj","definitions":["non-violent"],"forms":{"feminine-singular":"nonviolentă","masculine-plural":"nonviolenți","feminine-neuter-plural":"nonviolente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nonviolent","error-unrecognized-form-feminine-indefinite-singular":"nonviolentă","error-unrecognized-form-indefinite-masculine-plural":"nonviolenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nonviolente","definite-error-unrecognized-form-masculine-neuter-singular":"nonviolentul","definite-error-unrecognized-form-feminine-singular":"nonviolenta","definite-error-unrecognized-form-masculine-plural":"nonviolenții","definite-error-unrecognized-form-feminine-neuter-plural":"nonviolentele"}},{"word":"nonviolență","pos":"noun","definitions":["nonviolence"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nonviolență","accusative-definite-nominative-singular":"nonviolența","accusative-indefinite-nominative-plural":"nonviolențe","accusative-definite-nominative-plural":"nonviolențele","dative-genitive-indefinite-singular":"nonviolențe","dative-definite-genitive-singular":"nonviolenței","dative-genitive-indefinite-plural":"nonviolențe","dative-definite-genitive-plural":"nonviolențelor","singular-vocative":"nonviolență","plural-vocative":"nonviolențelor"}},{"word":"noocrat","pos":"noun","definitions":["a supporter of noocracy"],"forms":{"plural":"noocrați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"noocrat","accusative-definite-nominative-singular":"noocratul","accusative-indefinite-nominative-plural":"noocrați","accusative-definite-nominative-plural":"noocrații","dative-genitive-indefinite-singular":"noocrat","dative-definite-genitive-singular":"noocratului","dative-genitive-indefinite-plural":"noocrați","dative-definite-genitive-plural":"noocraților","singular-vocative":"noocratule","plural-vocative":"noocraților"}},{"word":"noocrație","pos":"noun","definitions":["noocracy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"noocrație","accusative-definite-nominative":"noocrația","dative-genitive-indefinite":"noocrații","dative-definite-genitive":"noocrației","vocative":"noocrație"}},{"word":"noologie","pos":"noun","definitions":["noology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"noologie","accusative-definite-nominative":"noologia","dative-genitive-indefinite":"noologii","dative-definite-genitive":"noologiei","vocative":"noologie"}},{"word":"noosferă","pos":"noun","definitions":["noosphere"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"noosferă","accusative-definite-nominative-singular":"noosfera","accusative-indefinite-nominative-plural":"noosfere","accusative-definite-nominative-plural":"noosferele","dative-genitive-indefinite-singular":"noosfere","dative-definite-genitive-singular":"noosferei","dative-genitive-indefinite-plural":"noosfere","dative-definite-genitive-plural":"noosferelor","singular-vocative":"noosferă","plural-vocative":"noosferelor"}},{"word":"nopal","pos":"noun","definitions":["nopal"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"nopal","accusative-definite-nominative":"nopalul","dative-genitive-indefinite":"nopal","dative-definite-genitive":"nopalului","vocative":"nopalule"}},{"word":"nopta","pos":"verb","definitions":["to darken","to spend the night"],"forms":{"canonical":"a nopta 1st conjugation","present-singular-third-person":"noptează","participle-past":"noptat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a nopta","gerund":"noptând","first-person-indicative-present-singular":"noptez","indicative-present-second-person-singular":"noptezi","indicative-present-singular-third-person":"noptează","first-person-indicative-plural-present":"noptăm","indicative-plural-present-second-person":"noptați","indicative-plural-present-third-person":"noptează","first-person-imperfect-indicative-singular":"noptam","imperfect-indicative-second-person-singular":"noptai","imperfect-indicative-singular-third-person":"nopta","first-person-imperfect-indicative-plural":"noptam","imperfect-indicative-plural-second-person":"noptați","imperfect-indicative-plural-third-person":"noptau","first-person-indicative-perfect-singular":"noptai","indicative-perfect-second-person-singular":"noptași","indicative-perfect-singular-third-person":"noptă","first-person-indicative-perfect-plural":"noptarăm","indicative-perfect-plural-second-person":"noptarăți","indicative-perfect-plural-third-person":"noptară","first-person-indicative-pluperfect-singular":"noptasem","indicative-pluperfect-second-person-singular":"noptaseși","indicative-pluperfect-singular-third-person":"noptase","first-person-indicative-pluperfect-plural":"noptaserăm","indicative-pluperfect-plural-second-person":"noptaserăți","indicative-pluperfect-plural-third-person":"noptaseră","first-person-present-singular-subjunctive":"să noptez","present-second-person-singular-subjunctive":"să noptezi","present-singular-subjunctive-third-person":"să nopteze","first-person-plural-present-subjunctive":"să noptăm","plural-present-second-person-subjunctive":"să noptați","plural-present-subjunctive-third-person":"să nopteze","imperative-second-person-singular":"noptează","imperative-plural-second-person":"noptați","imperative-negative-second-person-singular":"nu nopta","imperative-negative-plural-second-person":"nu noptați"}},{"word":"noptare","pos":"noun","definitions":["nightfall"],"forms":{"plural":"noptări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"noptare","accusative-definite-nominative-singular":"noptarea","accusative-indefinite-nominative-plural":"noptări","accusative-definite-nominative-plural":"noptările","dative-genitive-indefinite-singular":"noptări","dative-definite-genitive-singular":"noptării","dative-genitive-indefinite-plural":"noptări","dative-definite-genitive-plural":"noptărilor","singular-vocative":"noptare","plural-vocative":"noptărilor"}},{"word":"noptatec","pos":"adj","definitions":["alternative form of noptatic"],"forms":{"feminine-singular":"noptatecă","masculine-plural":"noptateci","feminine-neuter-plural":"noptatece","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"noptatec","error-unrecognized-form-feminine-indefinite-singular":"noptatecă","error-unrecognized-form-indefinite-masculine-plural":"noptateci","error-unrecognized-form-feminine-indefinite-neuter-plural":"noptatece","definite-error-unrecognized-form-masculine-neuter-singular":"noptatecul","definite-error-unrecognized-form-feminine-singular":"noptateca","definite-error-unrecognized-form-masculine-plural":"noptatecii","definite-error-unrecognized-form-feminine-neuter-plural":"noptatecele"}},{"word":"noptatic","pos":"adj","definitions":["nocturnal; of the night","dark"],"pronunciation":"/nopˈta.tik/","forms":{"feminine-singular":"noptatică","masculine-plural":"noptatici","feminine-neuter-plural":"noptatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"noptatic","error-unrecognized-form-feminine-indefinite-singular":"noptatică","error-unrecognized-form-indefinite-masculine-plural":"noptatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"noptatice","definite-error-unrecognized-form-masculine-neuter-singular":"noptaticul","definite-error-unrecognized-form-feminine-singular":"noptatica","definite-error-unrecognized-form-masculine-plural":"noptaticii","definite-error-unrecognized-form-feminine-neuter-plural":"noptaticele","alternative":"noptatec"}},{"word":"Nopteasa","pos":"name","definitions":["a river in Vâlcea County, Romania, tributary to the Mânăileasa"],"gender":"f"},{"word":"nopți","pos":"noun","definitions":["inflection of noapte:","plural","genitive/dative singular"],"pronunciation":"[nopt͡sʲ]"},{"word":"nopți albe","pos":"noun","definitions":["plural of noapte albă"]},{"word":"nopțică","pos":"noun","definitions":["diminutive of noapte"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"nopțică","accusative-definite-nominative":"nopțica","dative-genitive-indefinite":"nopțice","dative-definite-genitive":"nopțicei","vocative":"nopțică"}},{"word":"nopticică","pos":"noun","definitions":["diminutive of noapte; small night"],"forms":{"plural":"nopticele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nopticică","accusative-definite-nominative-singular":"nopticica","accusative-indefinite-nominative-plural":"nopticice","accusative-definite-nominative-plural":"nopticicele","dative-genitive-indefinite-singular":"nopticice","dative-definite-genitive-singular":"nopticicei","dative-genitive-indefinite-plural":"nopticice","dative-definite-genitive-plural":"nopticicelor","singular-vocative":"nopticică","plural-vocative":"nopticicelor"}},{"word":"nopticoasă","pos":"noun","definitions":["dame's rocket, dame's violet (Hesperis matronalis)"],"forms":{"plural":"nopticoase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nopticoasă","accusative-definite-nominative-singular":"nopticoasa","accusative-indefinite-nominative-plural":"nopticoase","accusative-definite-nominative-plural":"nopticoasele","dative-genitive-indefinite-singular":"nopticoase","dative-definite-genitive-singular":"nopticoasei","dative-genitive-indefinite-plural":"nopticoase","dative-definite-genitive-plural":"nopticoaselor","singular-vocative":"nopticoasă","plural-vocative":"nopticoaselor"}},{"word":"noptieră","pos":"noun","definitions":["nightstand"],"pronunciation":"/nop.tiˈe.rə/","forms":{"plural":"noptiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"noptieră","accusative-definite-nominative-singular":"noptiera","accusative-indefinite-nominative-plural":"noptiere","accusative-definite-nominative-plural":"noptierele","dative-genitive-indefinite-singular":"noptiere","dative-definite-genitive-singular":"noptierei","dative-genitive-indefinite-plural":"noptiere","dative-definite-genitive-plural":"noptierelor","singular-vocative":"noptieră","plural-vocative":"noptierelor"}},{"word":"nopții","pos":"noun","definitions":["definite dative/genitive singular of noapte"]},{"word":"nopțile","pos":"noun","definitions":["definite nominative/accusative plural of noapte"]},{"word":"nopților","pos":"noun","definitions":["inflection of noapte:","definite genitive/dative plural","vocative plural"]},{"word":"noptiță","pos":"noun","definitions":["diminutive of noapte","marvel of Peru (Mirabilis jalapa)"],"forms":{"plural":"noptițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"noptiță","accusative-definite-nominative-singular":"noptița","accusative-indefinite-nominative-plural":"noptițe","accusative-definite-nominative-plural":"noptițele","dative-genitive-indefinite-singular":"noptițe","dative-definite-genitive-singular":"noptiței","dative-genitive-indefinite-plural":"noptițe","dative-definite-genitive-plural":"noptițelor","singular-vocative":"noptiță","plural-vocative":"noptițelor"}},{"word":"noptos","pos":"adj","definitions":["dark"],"forms":{"feminine-singular":"noptoasă","masculine-plural":"noptoși","feminine-neuter-plural":"noptoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"noptos","error-unrecognized-form-feminine-indefinite-singular":"noptoasă","error-unrecognized-form-indefinite-masculine-plural":"noptoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"noptoase","definite-error-unrecognized-form-masculine-neuter-singular":"noptosul","definite-error-unrecognized-form-feminine-singular":"noptoasa","definite-error-unrecognized-form-masculine-plural":"noptoșii","definite-error-unrecognized-form-feminine-neuter-plural":"noptoasele"}},{"word":"Nor","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nor"}},{"word":"nor","pos":"noun","definitions":["cloud"],"pronunciation":"[nor]","forms":{"plural":"nori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nor","accusative-definite-nominative-singular":"norul","accusative-indefinite-nominative-plural":"nori","accusative-definite-nominative-plural":"norii","dative-genitive-indefinite-singular":"nor","dative-definite-genitive-singular":"norului","dative-genitive-indefinite-plural":"nori","dative-definite-genitive-plural":"norilor","singular-vocative":"norule","plural-vocative":"norilor","alternative":"nour","alternative-archaic-obsolete":"nuar"}},{"word":"nor de stele","pos":"noun","definitions":["star cloud"],"forms":{"plural":"nori de stele"}},{"word":"Nora","pos":"name","definitions":["a female given name"],"gender":"f"},{"word":"noră","pos":"noun","definitions":["daughter-in-law"],"pronunciation":"/ˈnorə/","forms":{"plural":"nurori","masculine":"equivalent ginere","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"noră","accusative-definite-nominative-singular":"nora","accusative-indefinite-nominative-plural":"nurori","accusative-definite-nominative-plural":"nurorile","dative-genitive-indefinite-singular":"nurori","dative-definite-genitive-singular":"nurorii","dative-genitive-indefinite-plural":"nurori","dative-definite-genitive-plural":"nurorilor","singular-vocative":"-","plural-vocative":"-","alternative-dated":"nor"}},{"word":"noradrenalină","pos":"noun","definitions":["noradrenaline"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"noradrenalină","accusative-definite-nominative-singular":"noradrenalina","accusative-indefinite-nominative-plural":"noradrenaline","accusative-definite-nominative-plural":"noradrenalinele","dative-genitive-indefinite-singular":"noradrenaline","dative-definite-genitive-singular":"noradrenalinei","dative-genitive-indefinite-plural":"noradrenaline","dative-definite-genitive-plural":"noradrenalinelor","singular-vocative":"noradrenalină","plural-vocative":"noradrenalinelor"}},{"word":"nord","pos":"noun","definitions":["north"],"pronunciation":"/nord/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nord","accusative-definite-nominative":"nordul","dative-genitive-indefinite":"nord","dative-definite-genitive":"nordului","vocative":"nordule"}},{"word":"nord magnetic","pos":"noun","definitions":["magnetic north"]},{"word":"nord-american","pos":"noun","definitions":["North American"],"forms":{"plural":"nord-americani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nord-american","accusative-definite-nominative-singular":"nord-americanul","accusative-indefinite-nominative-plural":"nord-americani","accusative-definite-nominative-plural":"nord-americanii","dative-genitive-indefinite-singular":"nord-american","dative-definite-genitive-singular":"nord-americanului","dative-genitive-indefinite-plural":"nord-americani","dative-definite-genitive-plural":"nord-americanilor","singular-vocative":"nord-americanule","plural-vocative":"nord-americanilor"}},{"word":"nord-americană","pos":"noun","definitions":["female equivalent of nord-american"],"forms":{"plural":"nord-americane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nord-americană","accusative-definite-nominative-singular":"nord-americana","accusative-indefinite-nominative-plural":"nord-americane","accusative-definite-nominative-plural":"nord-americanele","dative-genitive-indefinite-singular":"nord-americane","dative-definite-genitive-singular":"nord-americanei","dative-genitive-indefinite-plural":"nord-americane","dative-definite-genitive-plural":"nord-americanelor","singular-vocative":"nord-americană","plural-vocative":"nord-americanelor"}},{"word":"nord-americancă","pos":"noun","definitions":["female equivalent of nord-american"],"forms":{"plural":"nord-americance","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nord-americancă","accusative-definite-nominative-singular":"nord-americanca","accusative-indefinite-nominative-plural":"nord-americance","accusative-definite-nominative-plural":"nord-americancele","dative-genitive-indefinite-singular":"nord-americance","dative-definite-genitive-singular":"nord-americancei","dative-genitive-indefinite-plural":"nord-americance","dative-definite-genitive-plural":"nord-americancelor","singular-vocative":"nord-americancă","plural-vocative":"nord-americancelor"}},{"word":"nord-coreean","pos":"noun","definitions":["North Korean"],"forms":{"plural":"nord-coreeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nord-coreean","accusative-definite-nominative-singular":"nord-coreeanul","accusative-indefinite-nominative-plural":"nord-coreeni","accusative-definite-nominative-plural":"nord-coreenii","dative-genitive-indefinite-singular":"nord-coreean","dative-definite-genitive-singular":"nord-coreeanului","dative-genitive-indefinite-plural":"nord-coreeni","dative-definite-genitive-plural":"nord-coreenilor","singular-vocative":"nord-coreeanule","plural-vocative":"nord-coreenilor"}},{"word":"nord-coreeană","pos":"noun","definitions":["female equivalent of nord-coreean"],"forms":{"plural":"nord-coreene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nord-coreeană","accusative-definite-nominative-singular":"nord-coreeana","accusative-indefinite-nominative-plural":"nord-coreene","accusative-definite-nominative-plural":"nord-coreenele","dative-genitive-indefinite-singular":"nord-coreene","dative-definite-genitive-singular":"nord-coreenei","dative-genitive-indefinite-plural":"nord-coreene","dative-definite-genitive-plural":"nord-coreenelor","singular-vocative":"nord-coreeană","plural-vocative":"nord-coreenelor"}},{"word":"nord-coreeancă","pos":"noun","definitions":["female equivalent of nord-coreean"],"forms":{"plural":"nord-coreence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nord-coreeancă","accusative-definite-nominative-singular":"nord-coreeanca","accusative-indefinite-nominative-plural":"nord-coreence","accusative-definite-nominative-plural":"nord-coreencele","dative-genitive-indefinite-singular":"nord-coreence","dative-definite-genitive-singular":"nord-coreencei","dative-genitive-indefinite-plural":"nord-coreence","dative-definite-genitive-plural":"nord-coreencelor","singular-vocative":"nord-coreeancă","plural-vocative":"nord-coreencelor"}},{"word":"nord-dunărean","pos":"adj","definitions":["north of the Danube"],"forms":{"feminine-singular":"nord-dunăreană","masculine-plural":"nord-dunăreni","feminine-neuter-plural":"nord-dunărene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nord-dunărean","error-unrecognized-form-feminine-indefinite-singular":"nord-dunăreană","error-unrecognized-form-indefinite-masculine-plural":"nord-dunăreni","error-unrecognized-form-feminine-indefinite-neuter-plural":"nord-dunărene","definite-error-unrecognized-form-masculine-neuter-singular":"nord-dunăreanul","definite-error-unrecognized-form-feminine-singular":"nord-dunăreana","definite-error-unrecognized-form-masculine-plural":"nord-dunărenii","definite-error-unrecognized-form-feminine-neuter-plural":"nord-dunărenele"}},{"word":"nord-est","pos":"noun","definitions":["northeast"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nord-est","accusative-definite-nominative":"nord-estul","dative-genitive-indefinite":"nord-est","dative-definite-genitive":"nord-estului","vocative":"nord-estule"}},{"word":"nord-estic","pos":"adj","definitions":["north-eastern"],"forms":{"feminine-singular":"nord-estică","masculine-plural":"nord-estici","feminine-neuter-plural":"nord-estice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nord-estic","error-unrecognized-form-feminine-indefinite-singular":"nord-estică","error-unrecognized-form-indefinite-masculine-plural":"nord-estici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nord-estice","definite-error-unrecognized-form-masculine-neuter-singular":"nord-esticul","definite-error-unrecognized-form-feminine-singular":"nord-estica","definite-error-unrecognized-form-masculine-plural":"nord-esticii","definite-error-unrecognized-form-feminine-neuter-plural":"nord-esticele"}},{"word":"nord-european","pos":"adj","definitions":["Northern European"],"forms":{"feminine-singular":"nord-europeană","masculine-plural":"nord-europeni","feminine-neuter-plural":"nord-europene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nord-european","error-unrecognized-form-feminine-indefinite-singular":"nord-europeană","error-unrecognized-form-indefinite-masculine-plural":"nord-europeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"nord-europene","definite-error-unrecognized-form-masculine-neuter-singular":"nord-europeanul","definite-error-unrecognized-form-feminine-singular":"nord-europeana","definite-error-unrecognized-form-masculine-plural":"nord-europenii","definite-error-unrecognized-form-feminine-neuter-plural":"nord-europenele"}},{"word":"nord-european","pos":"noun","definitions":["Northern European"],"forms":{"plural":"nord-europeni","feminine":"equivalent nord-europeană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nord-european","accusative-definite-nominative-singular":"nord-europeanul","accusative-indefinite-nominative-plural":"nord-europeni","accusative-definite-nominative-plural":"nord-europenii","dative-genitive-indefinite-singular":"nord-european","dative-definite-genitive-singular":"nord-europeanului","dative-genitive-indefinite-plural":"nord-europeni","dative-definite-genitive-plural":"nord-europenilor","singular-vocative":"nord-europeanule","plural-vocative":"nord-europenilor"}},{"word":"nord-europeană","pos":"noun","definitions":["female equivalent of nord-european"],"forms":{"plural":"nord-europeane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nord-europeană","accusative-definite-nominative-singular":"nord-europeana","accusative-indefinite-nominative-plural":"nord-europeane","accusative-definite-nominative-plural":"nord-europeanele","dative-genitive-indefinite-singular":"nord-europeane","dative-definite-genitive-singular":"nord-europeanei","dative-genitive-indefinite-plural":"nord-europeane","dative-definite-genitive-plural":"nord-europeanelor","singular-vocative":"nord-europeană","plural-vocative":"nord-europeanelor"}},{"word":"nord-europeane","pos":"noun","definitions":["plural of nord-europeană"],"gender":"f-p"},{"word":"nord-europeni","pos":"noun","definitions":["plural of nord-european"],"gender":"m-p"},{"word":"nord-vest","pos":"noun","definitions":["northwest"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nord-vest","accusative-definite-nominative":"nord-vestul","dative-genitive-indefinite":"nord-vest","dative-definite-genitive":"nord-vestului","vocative":"nord-vestule"}},{"word":"nord-vestic","pos":"adj","definitions":["northwest"],"forms":{"feminine-singular":"nord-vestică","masculine-plural":"nord-vestici","feminine-neuter-plural":"nord-vestice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nord-vestic","error-unrecognized-form-feminine-indefinite-singular":"nord-vestică","error-unrecognized-form-indefinite-masculine-plural":"nord-vestici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nord-vestice","definite-error-unrecognized-form-masculine-neuter-singular":"nord-vesticul","definite-error-unrecognized-form-feminine-singular":"nord-vestica","definite-error-unrecognized-form-masculine-plural":"nord-vesticii","definite-error-unrecognized-form-feminine-neuter-plural":"nord-vesticele"}},{"word":"nord-vietnamez","pos":"noun","definitions":["North Vietnamese"],"forms":{"plural":"nord-vietnamezi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nord-vietnamez","accusative-definite-nominative-singular":"nord-vietnamezul","accusative-indefinite-nominative-plural":"nord-vietnamezi","accusative-definite-nominative-plural":"nord-vietnamezii","dative-genitive-indefinite-singular":"nord-vietnamez","dative-definite-genitive-singular":"nord-vietnamezului","dative-genitive-indefinite-plural":"nord-vietnamezi","dative-definite-genitive-plural":"nord-vietnamezilor","singular-vocative":"nord-vietnamezule","plural-vocative":"nord-vietnamezilor"}},{"word":"nord-vietnameză","pos":"noun","definitions":["female equivalent of nord-vietnamez"],"forms":{"plural":"nord-vietnameze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nord-vietnameză","accusative-definite-nominative-singular":"nord-vietnameza","accusative-indefinite-nominative-plural":"nord-vietnameze","accusative-definite-nominative-plural":"nord-vietnamezele","dative-genitive-indefinite-singular":"nord-vietnameze","dative-definite-genitive-singular":"nord-vietnamezei","dative-genitive-indefinite-plural":"nord-vietnameze","dative-definite-genitive-plural":"nord-vietnamezelor","singular-vocative":"nord-vietnameză","plural-vocative":"nord-vietnamezelor"}},{"word":"nordic","pos":"adj","definitions":["nordic","northern"],"pronunciation":"/ˈnor.dik/","forms":{"feminine-singular":"nordică","masculine-plural":"nordici","feminine-neuter-plural":"nordice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nordic","error-unrecognized-form-feminine-indefinite-singular":"nordică","error-unrecognized-form-indefinite-masculine-plural":"nordici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nordice","definite-error-unrecognized-form-masculine-neuter-singular":"nordicul","definite-error-unrecognized-form-feminine-singular":"nordica","definite-error-unrecognized-form-masculine-plural":"nordicii","definite-error-unrecognized-form-feminine-neuter-plural":"nordicele"}},{"word":"nordist","pos":"adj","definitions":["northerner"],"forms":{"feminine-singular":"nordistă","masculine-plural":"nordiști","feminine-neuter-plural":"nordiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nordist","error-unrecognized-form-feminine-indefinite-singular":"nordistă","error-unrecognized-form-indefinite-masculine-plural":"nordiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"nordiste","definite-error-unrecognized-form-masculine-neuter-singular":"nordistul","definite-error-unrecognized-form-feminine-singular":"nordista","definite-error-unrecognized-form-masculine-plural":"nordiștii","definite-error-unrecognized-form-feminine-neuter-plural":"nordistele"}},{"word":"nordului","pos":"noun","definitions":["definite genitive/dative singular of nord"]},{"word":"norea","pos":"noun","definitions":["marvel of Peru (Mirabilis jalapa)"],"forms":{"plural":"norele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"norea","accusative-definite-nominative-singular":"noreaua","accusative-indefinite-nominative-plural":"norele","accusative-definite-nominative-plural":"norelele","dative-genitive-indefinite-singular":"norele","dative-definite-genitive-singular":"norelei","dative-genitive-indefinite-plural":"norele","dative-definite-genitive-plural":"norelelor","singular-vocative":"norea","plural-vocative":"norelelor"}},{"word":"noreală","pos":"noun","definitions":["rain clouds"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"noreală","accusative-definite-nominative":"noreala","dative-genitive-indefinite":"noreale","dative-definite-genitive":"norealei","vocative":"noreală"}},{"word":"Norescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Norescu"}},{"word":"nori","pos":"noun","definitions":["plural of nor"],"pronunciation":"[norʲ]","gender":"m-p"},{"word":"noric","pos":"noun","definitions":["Norian"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"noric","accusative-definite-nominative":"noricul","dative-genitive-indefinite":"noric","dative-definite-genitive":"noricului","vocative":"noricule"}},{"word":"noricean","pos":"noun","definitions":["Slovene, Slovenian"],"forms":{"plural":"noriceni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"noricean","accusative-definite-nominative-singular":"noriceanul","accusative-indefinite-nominative-plural":"noriceni","accusative-definite-nominative-plural":"noricenii","dative-genitive-indefinite-singular":"noricean","dative-definite-genitive-singular":"noriceanului","dative-genitive-indefinite-plural":"noriceni","dative-definite-genitive-plural":"noricenilor","singular-vocative":"noriceanule","plural-vocative":"noricenilor"}},{"word":"noricel","pos":"noun","definitions":["diminutive of nor"],"forms":{"plural":"noricei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"noricel","accusative-definite-nominative-singular":"noricelul","accusative-indefinite-nominative-plural":"noricei","accusative-definite-nominative-plural":"noriceii","dative-genitive-indefinite-singular":"noricel","dative-definite-genitive-singular":"noricelului","dative-genitive-indefinite-plural":"noricei","dative-definite-genitive-plural":"noriceilor","singular-vocative":"noricelule","plural-vocative":"noriceilor"}},{"word":"norii","pos":"noun","definitions":["definite nominative plural of nor: the clouds","definite accusative plural of nor: the clouds"],"pronunciation":"[ˈno.ri]","gender":"m-p"},{"word":"norii lui Magellan","pos":"noun","definitions":["Magellanic Cloud"]},{"word":"norilor","pos":"noun","definitions":["definite genitive plural of nor: of the clouds","definite dative plural of nor: to the clouds"],"pronunciation":"[ˈno.ri.lor]","gender":"m-p"},{"word":"norioară","pos":"noun","definitions":["diminutive of noră"],"forms":{"plural":"norioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"norioară","accusative-definite-nominative-singular":"norioara","accusative-indefinite-nominative-plural":"norioare","accusative-definite-nominative-plural":"norioarele","dative-genitive-indefinite-singular":"norioare","dative-definite-genitive-singular":"norioarei","dative-genitive-indefinite-plural":"norioare","dative-definite-genitive-plural":"norioarelor","singular-vocative":"norioară","plural-vocative":"norioarelor"}},{"word":"Norișor","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Norișor"}},{"word":"norișor","pos":"noun","definitions":["diminutive of nor; small cloud"],"forms":{"plural":"norișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"norișor","accusative-definite-nominative-singular":"norișorul","accusative-indefinite-nominative-plural":"norișori","accusative-definite-nominative-plural":"norișorii","dative-genitive-indefinite-singular":"norișor","dative-definite-genitive-singular":"norișorului","dative-genitive-indefinite-plural":"norișori","dative-definite-genitive-plural":"norișorilor","singular-vocative":"norișorule","plural-vocative":"norișorilor"}},{"word":"norit","pos":"noun","definitions":["norite"],"forms":{"plural":"norite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"norit","accusative-definite-nominative-singular":"noritul","accusative-indefinite-nominative-plural":"norite","accusative-definite-nominative-plural":"noritele","dative-genitive-indefinite-singular":"norit","dative-definite-genitive-singular":"noritului","dative-genitive-indefinite-plural":"norite","dative-definite-genitive-plural":"noritelor","singular-vocative":"noritule","plural-vocative":"noritelor"}},{"word":"noriță","pos":"noun","definitions":["mink"],"forms":{"plural":"norițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"noriță","accusative-definite-nominative-singular":"norița","accusative-indefinite-nominative-plural":"norițe","accusative-definite-nominative-plural":"norițele","dative-genitive-indefinite-singular":"norițe","dative-definite-genitive-singular":"noriței","dative-genitive-indefinite-plural":"norițe","dative-definite-genitive-plural":"norițelor","singular-vocative":"noriță","plural-vocative":"norițelor"}},{"word":"norma","pos":"verb","definitions":["to set a norm"],"forms":{"canonical":"a norma 1st conjugation","present-singular-third-person":"normează","participle-past":"normat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a norma","gerund":"normând","first-person-indicative-present-singular":"normez","indicative-present-second-person-singular":"normezi","indicative-present-singular-third-person":"normează","first-person-indicative-plural-present":"normăm","indicative-plural-present-second-person":"normați","indicative-plural-present-third-person":"normează","first-person-imperfect-indicative-singular":"normam","imperfect-indicative-second-person-singular":"normai","imperfect-indicative-singular-third-person":"norma","first-person-imperfect-indicative-plural":"normam","imperfect-indicative-plural-second-person":"normați","imperfect-indicative-plural-third-person":"normau","first-person-indicative-perfect-singular":"normai","indicative-perfect-second-person-singular":"normași","indicative-perfect-singular-third-person":"normă","first-person-indicative-perfect-plural":"normarăm","indicative-perfect-plural-second-person":"normarăți","indicative-perfect-plural-third-person":"normară","first-person-indicative-pluperfect-singular":"normasem","indicative-pluperfect-second-person-singular":"normaseși","indicative-pluperfect-singular-third-person":"normase","first-person-indicative-pluperfect-plural":"normaserăm","indicative-pluperfect-plural-second-person":"normaserăți","indicative-pluperfect-plural-third-person":"normaseră","first-person-present-singular-subjunctive":"să normez","present-second-person-singular-subjunctive":"să normezi","present-singular-subjunctive-third-person":"să normeze","first-person-plural-present-subjunctive":"să normăm","plural-present-second-person-subjunctive":"să normați","plural-present-subjunctive-third-person":"să normeze","imperative-second-person-singular":"normează","imperative-plural-second-person":"normați","imperative-negative-second-person-singular":"nu norma","imperative-negative-plural-second-person":"nu normați"}},{"word":"normă","pos":"noun","definitions":["norm"],"forms":{"plural":"norme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"normă","accusative-definite-nominative-singular":"norma","accusative-indefinite-nominative-plural":"norme","accusative-definite-nominative-plural":"normele","dative-genitive-indefinite-singular":"norme","dative-definite-genitive-singular":"normei","dative-genitive-indefinite-plural":"norme","dative-definite-genitive-plural":"normelor","singular-vocative":"normă","plural-vocative":"normelor"}},{"word":"normă tehnică","pos":"noun","definitions":["technical standard"],"forms":{"plural":"norme tehnice"}},{"word":"normal","pos":"adj","definitions":["normal"],"pronunciation":"/norˈmal/","forms":{"feminine-singular":"normală","masculine-plural":"normali","feminine-neuter-plural":"normale"}},{"word":"normal","pos":"adv","definitions":["normally","of course, obviously"],"pronunciation":"/norˈmal/","examples":[{"ro":"Normal că mi-e foame.","en":"Of course I'm hungry."}]},{"word":"normală","pos":"noun","definitions":["pedagogical school"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"normală","accusative-definite-nominative-singular":"normala","accusative-indefinite-nominative-plural":"normale","accusative-definite-nominative-plural":"normalele","dative-genitive-indefinite-singular":"normale","dative-definite-genitive-singular":"normalei","dative-genitive-indefinite-plural":"normale","dative-definite-genitive-plural":"normalelor","singular-vocative":"normală","plural-vocative":"normalelor"}},{"word":"normalistă","pos":"noun","definitions":["female equivalent of normalist"],"forms":{"plural":"normaliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"normalistă","accusative-definite-nominative-singular":"normalista","accusative-indefinite-nominative-plural":"normaliste","accusative-definite-nominative-plural":"normalistele","dative-genitive-indefinite-singular":"normaliste","dative-definite-genitive-singular":"normalistei","dative-genitive-indefinite-plural":"normaliste","dative-definite-genitive-plural":"normalistelor","singular-vocative":"normalistă","plural-vocative":"normalistelor"}},{"word":"normalitate","pos":"noun","definitions":["normality"],"pronunciation":"[nor.ma.liˈta.te]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"normalitate","accusative-definite-nominative":"normalitatea","dative-genitive-indefinite":"normalități","dative-definite-genitive":"normalității","vocative":"normalitate"}},{"word":"normaliza","pos":"verb","definitions":["to normalize"],"forms":{"canonical":"a normaliza 1st conjugation","present-singular-third-person":"normalizează","participle-past":"normalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a normaliza","gerund":"normalizând","first-person-indicative-present-singular":"normalizez","indicative-present-second-person-singular":"normalizezi","indicative-present-singular-third-person":"normalizează","first-person-indicative-plural-present":"normalizăm","indicative-plural-present-second-person":"normalizați","indicative-plural-present-third-person":"normalizează","first-person-imperfect-indicative-singular":"normalizam","imperfect-indicative-second-person-singular":"normalizai","imperfect-indicative-singular-third-person":"normaliza","first-person-imperfect-indicative-plural":"normalizam","imperfect-indicative-plural-second-person":"normalizați","imperfect-indicative-plural-third-person":"normalizau","first-person-indicative-perfect-singular":"normalizai","indicative-perfect-second-person-singular":"normalizași","indicative-perfect-singular-third-person":"normaliză","first-person-indicative-perfect-plural":"normalizarăm","indicative-perfect-plural-second-person":"normalizarăți","indicative-perfect-plural-third-person":"normalizară","first-person-indicative-pluperfect-singular":"normalizasem","indicative-pluperfect-second-person-singular":"normalizaseși","indicative-pluperfect-singular-third-person":"normalizase","first-person-indicative-pluperfect-plural":"normalizaserăm","indicative-pluperfect-plural-second-person":"normalizaserăți","indicative-pluperfect-plural-third-person":"normalizaseră","first-person-present-singular-subjunctive":"să normalizez","present-second-person-singular-subjunctive":"să normalizezi","present-singular-subjunctive-third-person":"să normalizeze","first-person-plural-present-subjunctive":"să normalizăm","plural-present-second-person-subjunctive":"să normalizați","plural-present-subjunctive-third-person":"să normalizeze","imperative-second-person-singular":"normalizează","imperative-plural-second-person":"normalizați","imperative-negative-second-person-singular":"nu normaliza","imperative-negative-plural-second-person":"nu normalizați"}},{"word":"normalizare","pos":"noun","definitions":["normalization"],"forms":{"plural":"normalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"normalizare","accusative-definite-nominative-singular":"normalizarea","accusative-indefinite-nominative-plural":"normalizări","accusative-definite-nominative-plural":"normalizările","dative-genitive-indefinite-singular":"normalizări","dative-definite-genitive-singular":"normalizării","dative-genitive-indefinite-plural":"normalizări","dative-definite-genitive-plural":"normalizărilor","singular-vocative":"normalizare","plural-vocative":"normalizărilor"}},{"word":"normalizau","pos":"verb","definitions":["third-person plural imperfect indicative of normaliza"]},{"word":"normand","pos":"noun","definitions":["Norman (native or inhabitant of the region of Normandy, France) (usually male)"],"forms":{"plural":"normanzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"normand","accusative-definite-nominative-singular":"normandul","accusative-indefinite-nominative-plural":"normanzi","accusative-definite-nominative-plural":"normanzii","dative-genitive-indefinite-singular":"normand","dative-definite-genitive-singular":"normandului","dative-genitive-indefinite-plural":"normanzi","dative-definite-genitive-plural":"normanzilor","singular-vocative":"normandule","plural-vocative":"normanzilor"}},{"word":"normandă","pos":"noun","definitions":["female equivalent of normand"],"forms":{"plural":"normande","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"normandă","accusative-definite-nominative-singular":"normanda","accusative-indefinite-nominative-plural":"normande","accusative-definite-nominative-plural":"normandele","dative-genitive-indefinite-singular":"normande","dative-definite-genitive-singular":"normandei","dative-genitive-indefinite-plural":"normande","dative-definite-genitive-plural":"normandelor","singular-vocative":"normandă","plural-vocative":"normandelor"}},{"word":"Normandia","pos":"name","definitions":["Normandy (an administrative region, historical province, and medieval kingdom in northwest France, on the English Channel)"],"gender":"f"},{"word":"normare","pos":"noun","definitions":["norming"],"forms":{"plural":"normări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"normare","accusative-definite-nominative-singular":"normarea","accusative-indefinite-nominative-plural":"normări","accusative-definite-nominative-plural":"normările","dative-genitive-indefinite-singular":"normări","dative-definite-genitive-singular":"normării","dative-genitive-indefinite-plural":"normări","dative-definite-genitive-plural":"normărilor","singular-vocative":"normare","plural-vocative":"normărilor"}},{"word":"normat","pos":"adj","definitions":["normalized"],"forms":{"feminine-singular":"normată","masculine-plural":"normați","feminine-neuter-plural":"normate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"normat","error-unrecognized-form-feminine-indefinite-singular":"normată","error-unrecognized-form-indefinite-masculine-plural":"normați","error-unrecognized-form-feminine-indefinite-neuter-plural":"normate","definite-error-unrecognized-form-masculine-neuter-singular":"normatul","definite-error-unrecognized-form-feminine-singular":"normata","definite-error-unrecognized-form-masculine-plural":"normații","definite-error-unrecognized-form-feminine-neuter-plural":"normatele"}},{"word":"normat","pos":"verb","definitions":["past participle of norma"],"forms":{"participle-past":"of norma"}},{"word":"normativ","pos":"adj","definitions":["normative"],"forms":{"feminine-singular":"normativă","masculine-plural":"normativi","feminine-neuter-plural":"normative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"normativ","error-unrecognized-form-feminine-indefinite-singular":"normativă","error-unrecognized-form-indefinite-masculine-plural":"normativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"normative","definite-error-unrecognized-form-masculine-neuter-singular":"normativul","definite-error-unrecognized-form-feminine-singular":"normativa","definite-error-unrecognized-form-masculine-plural":"normativii","definite-error-unrecognized-form-feminine-neuter-plural":"normativele"}},{"word":"normativ","pos":"noun","definitions":["normative"],"forms":{"plural":"normativi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"normativ","accusative-definite-nominative-singular":"normativul","accusative-indefinite-nominative-plural":"normativi","accusative-definite-nominative-plural":"normativile","dative-genitive-indefinite-singular":"normativ","dative-definite-genitive-singular":"normativului","dative-genitive-indefinite-plural":"normativi","dative-definite-genitive-plural":"normativilor","singular-vocative":"normativule","plural-vocative":"normativilor"}},{"word":"normativism","pos":"noun","definitions":["normativism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"normativism","accusative-definite-nominative":"normativismul","dative-genitive-indefinite":"normativism","dative-definite-genitive":"normativismului","vocative":"normativismule"}},{"word":"normatoare","pos":"noun","definitions":["female equivalent of normator"],"forms":{"plural":"normatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"normatoare","accusative-definite-nominative-singular":"normatoarea","accusative-indefinite-nominative-plural":"normatoare","accusative-definite-nominative-plural":"normatoarele","dative-genitive-indefinite-singular":"normatoare","dative-definite-genitive-singular":"normatoarei","dative-genitive-indefinite-plural":"normatoare","dative-definite-genitive-plural":"normatoarelor","singular-vocative":"normatoare","plural-vocative":"normatoarelor"}},{"word":"normoblast","pos":"noun","definitions":["normoblast"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"normoblast","accusative-definite-nominative":"normoblastul","dative-genitive-indefinite":"normoblast","dative-definite-genitive":"normoblastului","vocative":"normoblastule"}},{"word":"normoblastoză","pos":"noun","definitions":["normoblastosis"],"forms":{"plural":"normoblastoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"normoblastoză","accusative-definite-nominative-singular":"normoblastoza","accusative-indefinite-nominative-plural":"normoblastoze","accusative-definite-nominative-plural":"normoblastozele","dative-genitive-indefinite-singular":"normoblastoze","dative-definite-genitive-singular":"normoblastozei","dative-genitive-indefinite-plural":"normoblastoze","dative-definite-genitive-plural":"normoblastozelor","singular-vocative":"normoblastoză","plural-vocative":"normoblastozelor"}},{"word":"normocit","pos":"noun","definitions":["normocyte"],"forms":{"plural":"normocite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"normocit","accusative-definite-nominative-singular":"normocitul","accusative-indefinite-nominative-plural":"normocite","accusative-definite-nominative-plural":"normocitele","dative-genitive-indefinite-singular":"normocit","dative-definite-genitive-singular":"normocitului","dative-genitive-indefinite-plural":"normocite","dative-definite-genitive-plural":"normocitelor","singular-vocative":"normocitule","plural-vocative":"normocitelor"}},{"word":"normocitoză","pos":"noun","definitions":["normocytosis"],"forms":{"plural":"normocitoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"normocitoză","accusative-definite-nominative-singular":"normocitoza","accusative-indefinite-nominative-plural":"normocitoze","accusative-definite-nominative-plural":"normocitozele","dative-genitive-indefinite-singular":"normocitoze","dative-definite-genitive-singular":"normocitozei","dative-genitive-indefinite-plural":"normocitoze","dative-definite-genitive-plural":"normocitozelor","singular-vocative":"normocitoză","plural-vocative":"normocitozelor"}},{"word":"noroace","pos":"noun","definitions":["plural of noroc"]},{"word":"noroacele","pos":"noun","definitions":["definite nominative/accusative plural of noroc"]},{"word":"noroacelor","pos":"noun","definitions":["inflection of noroc:","definite genitive/dative plural","vocative plural"]},{"word":"noroaie","pos":"noun","definitions":["plural of noroi"]},{"word":"Noroaiele","pos":"name","definitions":["a river in Vâlcea County, Romania, tributary to the Păușa"],"gender":"m"},{"word":"noroancă","pos":"noun","definitions":["orange (fruit)"],"forms":{"plural":"noroance","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"noroancă","accusative-definite-nominative-singular":"noroancăul","accusative-indefinite-nominative-plural":"noroance","accusative-definite-nominative-plural":"noroancele","dative-genitive-indefinite-singular":"noroancă","dative-definite-genitive-singular":"noroancăului","dative-genitive-indefinite-plural":"noroance","dative-definite-genitive-plural":"noroancelor","singular-vocative":"noroancăule","plural-vocative":"noroancelor"}},{"word":"Noroc","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Noroc"}},{"word":"noroc","pos":"noun","definitions":["luck; good fortune"],"pronunciation":"[noˈrok]","forms":{"plural":"noroace","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"noroc","accusative-definite-nominative-singular":"norocul","accusative-indefinite-nominative-plural":"noroace","accusative-definite-nominative-plural":"noroacele","dative-genitive-indefinite-singular":"noroc","dative-definite-genitive-singular":"norocului","dative-genitive-indefinite-plural":"noroace","dative-definite-genitive-plural":"noroacelor","singular-vocative":"norocule","plural-vocative":"noroacelor"}},{"word":"noroc","pos":"intj","definitions":["cheers!","good luck!","bless you!"],"pronunciation":"[noˈrok]"},{"word":"noroceală","pos":"noun","definitions":["luck"],"forms":{"plural":"noroceli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"noroceală","accusative-definite-nominative-singular":"noroceala","accusative-indefinite-nominative-plural":"norocele","accusative-definite-nominative-plural":"norocelele","dative-genitive-indefinite-singular":"norocele","dative-definite-genitive-singular":"norocelei","dative-genitive-indefinite-plural":"norocele","dative-definite-genitive-plural":"norocelelor","singular-vocative":"noroceală","plural-vocative":"norocelelor"}},{"word":"Norocel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Norocel"}},{"word":"norocel","pos":"noun","definitions":["diminutive of noroc; small luck"],"forms":{"plural":"norocele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"norocel","accusative-definite-nominative-singular":"norocelul","accusative-indefinite-nominative-plural":"norocele","accusative-definite-nominative-plural":"norocelele","dative-genitive-indefinite-singular":"norocel","dative-definite-genitive-singular":"norocelului","dative-genitive-indefinite-plural":"norocele","dative-definite-genitive-plural":"norocelelor","singular-vocative":"norocelule","plural-vocative":"norocelelor"}},{"word":"Noroceni","pos":"name","definitions":["a village in Ghetlova, Orhei Raion, Moldova"],"gender":"m"},{"word":"noroci","pos":"verb","definitions":["to make someone happy"],"forms":{"canonical":"a noroci 4th conjugation","present-singular-third-person":"norocește","participle-past":"norocit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a noroci","gerund":"norocind","first-person-indicative-present-singular":"norocesc","indicative-present-second-person-singular":"norocești","indicative-present-singular-third-person":"norocește","first-person-indicative-plural-present":"norocim","indicative-plural-present-second-person":"norociți","indicative-plural-present-third-person":"norocesc","first-person-imperfect-indicative-singular":"noroceam","imperfect-indicative-second-person-singular":"noroceai","imperfect-indicative-singular-third-person":"norocea","first-person-imperfect-indicative-plural":"noroceam","imperfect-indicative-plural-second-person":"noroceați","imperfect-indicative-plural-third-person":"noroceau","first-person-indicative-perfect-singular":"norocii","indicative-perfect-second-person-singular":"norociși","indicative-perfect-singular-third-person":"noroci","first-person-indicative-perfect-plural":"norocirăm","indicative-perfect-plural-second-person":"norocirăți","indicative-perfect-plural-third-person":"norociră","first-person-indicative-pluperfect-singular":"norocisem","indicative-pluperfect-second-person-singular":"norociseși","indicative-pluperfect-singular-third-person":"norocise","first-person-indicative-pluperfect-plural":"norociserăm","indicative-pluperfect-plural-second-person":"norociserăți","indicative-pluperfect-plural-third-person":"norociseră","first-person-present-singular-subjunctive":"să norocesc","present-second-person-singular-subjunctive":"să norocești","present-singular-subjunctive-third-person":"să norocească","first-person-plural-present-subjunctive":"să norocim","plural-present-second-person-subjunctive":"să norociți","plural-present-subjunctive-third-person":"să norocească","imperative-second-person-singular":"norocește","imperative-plural-second-person":"norociți","imperative-negative-second-person-singular":"nu noroci","imperative-negative-plural-second-person":"nu norociți"}},{"word":"norocire","pos":"noun","definitions":["success"],"forms":{"plural":"norociri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"norocire","accusative-definite-nominative-singular":"norocirea","accusative-indefinite-nominative-plural":"norociri","accusative-definite-nominative-plural":"norocirile","dative-genitive-indefinite-singular":"norociri","dative-definite-genitive-singular":"norocirii","dative-genitive-indefinite-plural":"norociri","dative-definite-genitive-plural":"norocirilor","singular-vocative":"norocire","plural-vocative":"norocirilor"}},{"word":"norocit","pos":"adj","definitions":["lucky"],"forms":{"feminine-singular":"norocită","masculine-plural":"norociți","feminine-neuter-plural":"norocite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"norocit","error-unrecognized-form-feminine-indefinite-singular":"norocită","error-unrecognized-form-indefinite-masculine-plural":"norociți","error-unrecognized-form-feminine-indefinite-neuter-plural":"norocite","definite-error-unrecognized-form-masculine-neuter-singular":"norocitul","definite-error-unrecognized-form-feminine-singular":"norocita","definite-error-unrecognized-form-masculine-plural":"norociții","definite-error-unrecognized-form-feminine-neuter-plural":"norocitele"}},{"word":"norocos","pos":"adj","definitions":["lucky, fortunate"],"pronunciation":"/no.roˈkos/","forms":{"feminine-singular":"norocoasă","masculine-plural":"norocoși","feminine-neuter-plural":"norocoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"norocos","error-unrecognized-form-feminine-indefinite-singular":"norocoasă","error-unrecognized-form-indefinite-masculine-plural":"norocoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"norocoase","definite-error-unrecognized-form-masculine-neuter-singular":"norocosul","definite-error-unrecognized-form-feminine-singular":"norocoasa","definite-error-unrecognized-form-masculine-plural":"norocoșii","definite-error-unrecognized-form-feminine-neuter-plural":"norocoasele"}},{"word":"Norocu","pos":"name","definitions":["a village in Brodina, Suceava County, Romania"],"gender":"m"},{"word":"norocul","pos":"noun","definitions":["definite nominative/accusative singular of noroc"]},{"word":"norocului","pos":"noun","definitions":["definite dative/genitive singular of noroc"]},{"word":"norod","pos":"noun","definitions":["people, nation","crowd, multitude"],"pronunciation":"/noˈrod/","forms":{"plural":"noroade","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"norod","accusative-definite-nominative-singular":"norodul","accusative-indefinite-nominative-plural":"noroade","accusative-definite-nominative-plural":"noroadele","dative-genitive-indefinite-singular":"norod","dative-definite-genitive-singular":"norodului","dative-genitive-indefinite-plural":"noroade","dative-definite-genitive-plural":"noroadelor","singular-vocative":"norodule","plural-vocative":"noroadelor"}},{"word":"Noroi","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Noroi"}},{"word":"noroi","pos":"noun","definitions":["mud"],"forms":{"plural":"noroaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"noroi","accusative-definite-nominative-singular":"noroiul","accusative-indefinite-nominative-plural":"noroaie","accusative-definite-nominative-plural":"noroaiele","dative-genitive-indefinite-singular":"noroi","dative-definite-genitive-singular":"noroiului","dative-genitive-indefinite-plural":"noroaie","dative-definite-genitive-plural":"noroaielor","singular-vocative":"noroiule","plural-vocative":"noroaielor"}},{"word":"noroială","pos":"noun","definitions":["mud"],"forms":{"plural":"noroieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"noroială","accusative-definite-nominative-singular":"noroiala","accusative-indefinite-nominative-plural":"noroiele","accusative-definite-nominative-plural":"noroielele","dative-genitive-indefinite-singular":"noroiele","dative-definite-genitive-singular":"noroielei","dative-genitive-indefinite-plural":"noroiele","dative-definite-genitive-plural":"noroielelor","singular-vocative":"noroială","plural-vocative":"noroielelor"}},{"word":"Noroieni","pos":"name","definitions":["a village in Lazuri, Satu Mare County, Romania"],"gender":"m"},{"word":"noroios","pos":"adj","definitions":["muddy"],"forms":{"feminine-singular":"noroioasă","masculine-plural":"noroioși","feminine-neuter-plural":"noroioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"noroios","error-unrecognized-form-feminine-indefinite-singular":"noroioasă","error-unrecognized-form-indefinite-masculine-plural":"noroioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"noroioase","definite-error-unrecognized-form-masculine-neuter-singular":"noroiosul","definite-error-unrecognized-form-feminine-singular":"noroioasa","definite-error-unrecognized-form-masculine-plural":"noroioșii","definite-error-unrecognized-form-feminine-neuter-plural":"noroioasele"}},{"word":"noroit","pos":"adj","definitions":["mudded"],"forms":{"feminine-singular":"noroită","masculine-plural":"noroiți","feminine-neuter-plural":"noroite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"noroit","error-unrecognized-form-feminine-indefinite-singular":"noroită","error-unrecognized-form-indefinite-masculine-plural":"noroiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"noroite","definite-error-unrecognized-form-masculine-neuter-singular":"noroitul","definite-error-unrecognized-form-feminine-singular":"noroita","definite-error-unrecognized-form-masculine-plural":"noroiții","definite-error-unrecognized-form-feminine-neuter-plural":"noroitele"}},{"word":"noroitură","pos":"noun","definitions":["muddy place"],"forms":{"plural":"noroituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"noroitură","accusative-definite-nominative-singular":"noroitura","accusative-indefinite-nominative-plural":"noroituri","accusative-definite-nominative-plural":"noroiturile","dative-genitive-indefinite-singular":"noroituri","dative-definite-genitive-singular":"noroiturii","dative-genitive-indefinite-plural":"noroituri","dative-definite-genitive-plural":"noroiturilor","singular-vocative":"noroitură","plural-vocative":"noroiturilor"}},{"word":"noros","pos":"adj","definitions":["cloudy"],"forms":{"feminine-singular":"noroasă","masculine-plural":"noroși","feminine-neuter-plural":"noroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"noros","error-unrecognized-form-feminine-indefinite-singular":"noroasă","error-unrecognized-form-indefinite-masculine-plural":"noroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"noroase","definite-error-unrecognized-form-masculine-neuter-singular":"norosul","definite-error-unrecognized-form-feminine-singular":"noroasa","definite-error-unrecognized-form-masculine-plural":"noroșii","definite-error-unrecognized-form-feminine-neuter-plural":"noroasele","alternative-regional":"nouros"}},{"word":"norucă","pos":"noun","definitions":["diminutive of noră"],"forms":{"plural":"noruci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"norucă","accusative-definite-nominative-singular":"noruca","accusative-indefinite-nominative-plural":"noruci","accusative-definite-nominative-plural":"norucile","dative-genitive-indefinite-singular":"noruci","dative-definite-genitive-singular":"norucii","dative-genitive-indefinite-plural":"noruci","dative-definite-genitive-plural":"norucilor","singular-vocative":"norucă","plural-vocative":"norucilor"}},{"word":"norul","pos":"noun","definitions":["definite nominative singular of nor: the cloud","definite accusative singular of nor: the cloud"],"pronunciation":"[ˈno.rul]","gender":"m"},{"word":"noruleț","pos":"noun","definitions":["diminutive of nor; small cloud"],"forms":{"plural":"noruleți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"noruleț","accusative-definite-nominative-singular":"norulețul","accusative-indefinite-nominative-plural":"noruleți","accusative-definite-nominative-plural":"noruleții","dative-genitive-indefinite-singular":"noruleț","dative-definite-genitive-singular":"norulețului","dative-genitive-indefinite-plural":"noruleți","dative-definite-genitive-plural":"noruleților","singular-vocative":"norulețule","plural-vocative":"noruleților"}},{"word":"noruliță","pos":"noun","definitions":["diminutive of noră"],"forms":{"plural":"norulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"noruliță","accusative-definite-nominative-singular":"norulița","accusative-indefinite-nominative-plural":"norulițe","accusative-definite-nominative-plural":"norulițele","dative-genitive-indefinite-singular":"norulițe","dative-definite-genitive-singular":"noruliței","dative-genitive-indefinite-plural":"norulițe","dative-definite-genitive-plural":"norulițelor","singular-vocative":"noruliță","plural-vocative":"norulițelor"}},{"word":"norului","pos":"noun","definitions":["definite genitive singular of nor: of the cloud","definite dative singular of nor: to the cloud"],"pronunciation":"[ˈno.ru.luj]","gender":"m"},{"word":"noruț","pos":"noun","definitions":["diminutive of nor; small cloud"],"forms":{"plural":"noruți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"noruț","accusative-definite-nominative-singular":"noruțul","accusative-indefinite-nominative-plural":"noruți","accusative-definite-nominative-plural":"noruții","dative-genitive-indefinite-singular":"noruț","dative-definite-genitive-singular":"noruțului","dative-genitive-indefinite-plural":"noruți","dative-definite-genitive-plural":"noruților","singular-vocative":"noruțule","plural-vocative":"noruților"}},{"word":"noruță","pos":"noun","definitions":["diminutive of noră"],"forms":{"plural":"noruțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"noruță","accusative-definite-nominative-singular":"noruța","accusative-indefinite-nominative-plural":"noruțe","accusative-definite-nominative-plural":"noruțele","dative-genitive-indefinite-singular":"noruțe","dative-definite-genitive-singular":"noruței","dative-genitive-indefinite-plural":"noruțe","dative-definite-genitive-plural":"noruțelor","singular-vocative":"noruță","plural-vocative":"noruțelor"}},{"word":"norveg","pos":"noun","definitions":["Norwegian"],"forms":{"plural":"norvegi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"norveg","accusative-definite-nominative-singular":"norvegul","accusative-indefinite-nominative-plural":"norvegi","accusative-definite-nominative-plural":"norvegii","dative-genitive-indefinite-singular":"norveg","dative-definite-genitive-singular":"norvegului","dative-genitive-indefinite-plural":"norvegi","dative-definite-genitive-plural":"norvegilor","singular-vocative":"norvegule","plural-vocative":"norvegilor"}},{"word":"Norvegia","pos":"name","definitions":["Norway (a country in Scandinavia in Northern Europe)"],"pronunciation":"/norˈve.d͡ʒi.(j)a/","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"Norvegie","accusative-definite-nominative":"Norvegia","dative-genitive-indefinite":"Norvegii","dative-definite-genitive":"Norvegiei","vocative":"Norvegie"}},{"word":"norvegian","pos":"adj","definitions":["Norwegian"],"pronunciation":"/ˌnor.ve.d͡ʒiˈan/","forms":{"feminine-singular":"norvegiană","masculine-plural":"norvegieni","feminine-neuter-plural":"norvegiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"norvegian","error-unrecognized-form-feminine-indefinite-singular":"norvegiană","error-unrecognized-form-indefinite-masculine-plural":"norvegieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"norvegiene","definite-error-unrecognized-form-masculine-neuter-singular":"norvegianul","definite-error-unrecognized-form-feminine-singular":"norvegiana","definite-error-unrecognized-form-masculine-plural":"norvegienii","definite-error-unrecognized-form-feminine-neuter-plural":"norvegienele"}},{"word":"norvegian","pos":"noun","definitions":["Norwegian"],"pronunciation":"/ˌnor.ve.d͡ʒiˈan/","forms":{"plural":"norvegiani","feminine":"equivalent norvegiană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"norvegian","accusative-definite-nominative-singular":"norvegianul","accusative-indefinite-nominative-plural":"norvegiani","accusative-definite-nominative-plural":"norvegianii","dative-genitive-indefinite-singular":"norvegian","dative-definite-genitive-singular":"norvegianului","dative-genitive-indefinite-plural":"norvegiani","dative-definite-genitive-plural":"norvegianilor","singular-vocative":"norvegianule","plural-vocative":"norvegianilor"}},{"word":"norvegiană","pos":"noun","definitions":["Norwegian woman"],"forms":{"plural":"norvegiene"}},{"word":"norvegiană","pos":"noun","definitions":["Norwegian language"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"norvegiană","accusative-definite-nominative-singular":"norvegiana","accusative-indefinite-nominative-plural":"norvegiene","accusative-definite-nominative-plural":"norvegienele","dative-genitive-indefinite-singular":"norvegiene","dative-definite-genitive-singular":"norvegienei","dative-genitive-indefinite-plural":"norvegiene","dative-definite-genitive-plural":"norvegienelor","singular-vocative":"norvegiană","plural-vocative":"norvegienelor"}},{"word":"norvegiancă","pos":"noun","definitions":["Norwegian woman"],"forms":{"plural":"norvegience","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"norvegiancă","accusative-definite-nominative-singular":"norvegianca","accusative-indefinite-nominative-plural":"norvegience","accusative-definite-nominative-plural":"norvegiencele","dative-genitive-indefinite-singular":"norvegience","dative-definite-genitive-singular":"norvegiencei","dative-genitive-indefinite-plural":"norvegience","dative-definite-genitive-plural":"norvegiencelor","singular-vocative":"norvegiancă","plural-vocative":"norvegiencelor"}},{"word":"nosema","pos":"noun","definitions":["nosema"]},{"word":"nosemoză","pos":"noun","definitions":["nosema"],"forms":{"plural":"nosemoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nosemoză","accusative-definite-nominative-singular":"nosemoza","accusative-indefinite-nominative-plural":"nosemoze","accusative-definite-nominative-plural":"nosemozele","dative-genitive-indefinite-singular":"nosemoze","dative-definite-genitive-singular":"nosemozei","dative-genitive-indefinite-plural":"nosemoze","dative-definite-genitive-plural":"nosemozelor","singular-vocative":"nosemoză","plural-vocative":"nosemozelor"}},{"word":"nosfiță","pos":"noun","definitions":["alternative form of nostiță"],"forms":{"plural":"nosfițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nosfiță","accusative-definite-nominative-singular":"nosfița","accusative-indefinite-nominative-plural":"nosfițe","accusative-definite-nominative-plural":"nosfițele","dative-genitive-indefinite-singular":"nosfițe","dative-definite-genitive-singular":"nosfiței","dative-genitive-indefinite-plural":"nosfițe","dative-definite-genitive-plural":"nosfițelor","singular-vocative":"nosfiță","plural-vocative":"nosfițelor"}},{"word":"Noșlac","pos":"name","definitions":["a commune of Alba County, Romania","a village in Noșlac, Alba County, Romania"],"gender":"f"},{"word":"Noșlăcan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Noșlăcan"}},{"word":"nosoconioză","pos":"noun","definitions":["pneumoconiosis"],"forms":{"plural":"nosoconioze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nosoconioză","accusative-definite-nominative-singular":"nosoconioza","accusative-indefinite-nominative-plural":"nosoconioze","accusative-definite-nominative-plural":"nosoconiozele","dative-genitive-indefinite-singular":"nosoconioze","dative-definite-genitive-singular":"nosoconiozei","dative-genitive-indefinite-plural":"nosoconioze","dative-definite-genitive-plural":"nosoconiozelor","singular-vocative":"nosoconioză","plural-vocative":"nosoconiozelor"}},{"word":"nosofobie","pos":"noun","definitions":["nosophobia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"nosofobie","accusative-definite-nominative":"nosofobia","dative-genitive-indefinite":"nosofobii","dative-definite-genitive":"nosofobiei","vocative":"nosofobie"}},{"word":"nosograf","pos":"noun","definitions":["nosologist"],"forms":{"plural":"nosografi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nosograf","accusative-definite-nominative-singular":"nosograful","accusative-indefinite-nominative-plural":"nosografi","accusative-definite-nominative-plural":"nosografii","dative-genitive-indefinite-singular":"nosograf","dative-definite-genitive-singular":"nosografului","dative-genitive-indefinite-plural":"nosografi","dative-definite-genitive-plural":"nosografilor","singular-vocative":"nosografule","plural-vocative":"nosografilor"}},{"word":"nosografie","pos":"noun","definitions":["nosology"],"forms":{"plural":"nosografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nosografie","accusative-definite-nominative-singular":"nosografia","accusative-indefinite-nominative-plural":"nosografii","accusative-definite-nominative-plural":"nosografiile","dative-genitive-indefinite-singular":"nosografii","dative-definite-genitive-singular":"nosografiei","dative-genitive-indefinite-plural":"nosografii","dative-definite-genitive-plural":"nosografiilor","singular-vocative":"nosografie","plural-vocative":"nosografiilor"}},{"word":"nosologie","pos":"noun","definitions":["nosology"],"forms":{"plural":"nosologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nosologie","accusative-definite-nominative-singular":"nosologia","accusative-indefinite-nominative-plural":"nosologii","accusative-definite-nominative-plural":"nosologiile","dative-genitive-indefinite-singular":"nosologii","dative-definite-genitive-singular":"nosologiei","dative-genitive-indefinite-plural":"nosologii","dative-definite-genitive-plural":"nosologiilor","singular-vocative":"nosologie","plural-vocative":"nosologiilor"}},{"word":"nosomanie","pos":"noun","definitions":["nosomania"],"forms":{"plural":"nosomanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nosomanie","accusative-definite-nominative-singular":"nosomania","accusative-indefinite-nominative-plural":"nosomanii","accusative-definite-nominative-plural":"nosomaniile","dative-genitive-indefinite-singular":"nosomanii","dative-definite-genitive-singular":"nosomaniei","dative-genitive-indefinite-plural":"nosomanii","dative-definite-genitive-plural":"nosomaniilor","singular-vocative":"nosomanie","plural-vocative":"nosomaniilor"}},{"word":"nostalgic","pos":"adj","definitions":["nostalgic"],"pronunciation":"/nosˈtal.d͡ʒik/","forms":{"feminine-singular":"nostalgică","masculine-plural":"nostalgici","feminine-neuter-plural":"nostalgice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"nostalgic","error-unrecognized-form-feminine-indefinite-singular":"nostalgică","error-unrecognized-form-indefinite-masculine-plural":"nostalgici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nostalgice","definite-error-unrecognized-form-masculine-neuter-singular":"nostalgicul","definite-error-unrecognized-form-feminine-singular":"nostalgica","definite-error-unrecognized-form-masculine-plural":"nostalgicii","definite-error-unrecognized-form-feminine-neuter-plural":"nostalgicele"}},{"word":"nostalgie","pos":"noun","definitions":["nostalgia"],"forms":{"plural":"nostalgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nostalgie","accusative-definite-nominative-singular":"nostalgia","accusative-indefinite-nominative-plural":"nostalgii","accusative-definite-nominative-plural":"nostalgiile","dative-genitive-indefinite-singular":"nostalgii","dative-definite-genitive-singular":"nostalgiei","dative-genitive-indefinite-plural":"nostalgii","dative-definite-genitive-plural":"nostalgiilor","singular-vocative":"nostalgie","plural-vocative":"nostalgiilor"}},{"word":"nostalgii","pos":"noun","definitions":["plural of nostalgie"]},{"word":"nostim","pos":"adj","definitions":["funny"],"forms":{"feminine-singular":"nostimă","masculine-plural":"nostimi","feminine-neuter-plural":"nostime","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nostim","error-unrecognized-form-feminine-indefinite-singular":"nostimă","error-unrecognized-form-indefinite-masculine-plural":"nostimi","error-unrecognized-form-feminine-indefinite-neuter-plural":"nostime","definite-error-unrecognized-form-masculine-neuter-singular":"nostimul","definite-error-unrecognized-form-feminine-singular":"nostima","definite-error-unrecognized-form-masculine-plural":"nostimii","definite-error-unrecognized-form-feminine-neuter-plural":"nostimele"}},{"word":"nostimadă","pos":"noun","definitions":["drollery"],"forms":{"plural":"nostimade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nostimadă","accusative-definite-nominative-singular":"nostimada","accusative-indefinite-nominative-plural":"nostimade","accusative-definite-nominative-plural":"nostimadele","dative-genitive-indefinite-singular":"nostimade","dative-definite-genitive-singular":"nostimadei","dative-genitive-indefinite-plural":"nostimade","dative-definite-genitive-plural":"nostimadelor","singular-vocative":"nostimadă","plural-vocative":"nostimadelor"}},{"word":"nostimior","pos":"adj","definitions":["diminutive of nostim"],"pronunciation":"/nos.tiˈmjor/","forms":{"feminine-singular":"nostimioară","masculine-plural":"nostimiori","feminine-neuter-plural":"nostimioare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nostimior","error-unrecognized-form-feminine-indefinite-singular":"nostimioară","error-unrecognized-form-indefinite-masculine-plural":"nostimiori","error-unrecognized-form-feminine-indefinite-neuter-plural":"nostimioare","definite-error-unrecognized-form-masculine-neuter-singular":"nostimiorul","definite-error-unrecognized-form-feminine-singular":"nostimioara","definite-error-unrecognized-form-masculine-plural":"nostimiorii","definite-error-unrecognized-form-feminine-neuter-plural":"nostimioarele"}},{"word":"nostimivisi","pos":"verb","definitions":["to fancy"],"forms":{"canonical":"a nostimivisi 4th conjugation","present-singular-third-person":"nostimivisie","participle-past":"nostimivisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a nostimivisi","gerund":"nostimivisind","first-person-indicative-present-singular":"nostimivis","indicative-present-second-person-singular":"nostimiviși","indicative-present-singular-third-person":"nostimivise","first-person-indicative-plural-present":"nostimivisim","indicative-plural-present-second-person":"nostimivisiți","indicative-plural-present-third-person":"nostimivis","first-person-imperfect-indicative-singular":"nostimiviseam","imperfect-indicative-second-person-singular":"nostimiviseai","imperfect-indicative-singular-third-person":"nostimivisea","first-person-imperfect-indicative-plural":"nostimiviseam","imperfect-indicative-plural-second-person":"nostimiviseați","imperfect-indicative-plural-third-person":"nostimiviseau","first-person-indicative-perfect-singular":"nostimivisii","indicative-perfect-second-person-singular":"nostimivisiși","indicative-perfect-singular-third-person":"nostimivisi","first-person-indicative-perfect-plural":"nostimivisirăm","indicative-perfect-plural-second-person":"nostimivisirăți","indicative-perfect-plural-third-person":"nostimivisiră","first-person-indicative-pluperfect-singular":"nostimivisisem","indicative-pluperfect-second-person-singular":"nostimivisiseși","indicative-pluperfect-singular-third-person":"nostimivisise","first-person-indicative-pluperfect-plural":"nostimivisiserăm","indicative-pluperfect-plural-second-person":"nostimivisiserăți","indicative-pluperfect-plural-third-person":"nostimivisiseră","first-person-present-singular-subjunctive":"să nostimivis","present-second-person-singular-subjunctive":"să nostimiviși","present-singular-subjunctive-third-person":"să nostimivisă","first-person-plural-present-subjunctive":"să nostimivisim","plural-present-second-person-subjunctive":"să nostimivisiți","plural-present-subjunctive-third-person":"să nostimivisă","imperative-second-person-singular":"nostimivise","imperative-plural-second-person":"nostimivisiți","imperative-negative-second-person-singular":"nu nostimivisi","imperative-negative-plural-second-person":"nu nostimivisiți"}},{"word":"nostiță","pos":"noun","definitions":["a small sterlet"],"forms":{"plural":"nostițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nostiță","accusative-definite-nominative-singular":"nostița","accusative-indefinite-nominative-plural":"nostițe","accusative-definite-nominative-plural":"nostițele","dative-genitive-indefinite-singular":"nostițe","dative-definite-genitive-singular":"nostiței","dative-genitive-indefinite-plural":"nostițe","dative-definite-genitive-plural":"nostițelor","singular-vocative":"nostiță","plural-vocative":"nostițelor"}},{"word":"noștri","pos":"adj","definitions":["masculine plural of nostru; our"],"pronunciation":"/ˈnoʃtri/"},{"word":"nostrifica","pos":"verb","definitions":["to nostrificate"],"forms":{"canonical":"a nostrifica 1st conjugation","present-singular-third-person":"nostrifică","participle-past":"nostrificat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a nostrifica","gerund":"nostrificând","first-person-indicative-present-singular":"nostrific","indicative-present-second-person-singular":"nostrifici","indicative-present-singular-third-person":"nostrifică","first-person-indicative-plural-present":"nostrificăm","indicative-plural-present-second-person":"nostrificați","indicative-plural-present-third-person":"nostrifică","first-person-imperfect-indicative-singular":"nostrificam","imperfect-indicative-second-person-singular":"nostrificai","imperfect-indicative-singular-third-person":"nostrifica","first-person-imperfect-indicative-plural":"nostrificam","imperfect-indicative-plural-second-person":"nostrificați","imperfect-indicative-plural-third-person":"nostrificau","first-person-indicative-perfect-singular":"nostrificai","indicative-perfect-second-person-singular":"nostrificași","indicative-perfect-singular-third-person":"nostrifică","first-person-indicative-perfect-plural":"nostrificarăm","indicative-perfect-plural-second-person":"nostrificarăți","indicative-perfect-plural-third-person":"nostrificară","first-person-indicative-pluperfect-singular":"nostrificasem","indicative-pluperfect-second-person-singular":"nostrificaseși","indicative-pluperfect-singular-third-person":"nostrificase","first-person-indicative-pluperfect-plural":"nostrificaserăm","indicative-pluperfect-plural-second-person":"nostrificaserăți","indicative-pluperfect-plural-third-person":"nostrificaseră","first-person-present-singular-subjunctive":"să nostrific","present-second-person-singular-subjunctive":"să nostrifici","present-singular-subjunctive-third-person":"să nostrifice","first-person-plural-present-subjunctive":"să nostrificăm","plural-present-second-person-subjunctive":"să nostrificați","plural-present-subjunctive-third-person":"să nostrifice","imperative-second-person-singular":"nostrifică","imperative-plural-second-person":"nostrificați","imperative-negative-second-person-singular":"nu nostrifica","imperative-negative-plural-second-person":"nu nostrificați"}},{"word":"nostrificare","pos":"noun","definitions":["nostrification"],"forms":{"plural":"nostrificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nostrificare","accusative-definite-nominative-singular":"nostrificarea","accusative-indefinite-nominative-plural":"nostrificări","accusative-definite-nominative-plural":"nostrificările","dative-genitive-indefinite-singular":"nostrificări","dative-definite-genitive-singular":"nostrificării","dative-genitive-indefinite-plural":"nostrificări","dative-definite-genitive-plural":"nostrificărilor","singular-vocative":"nostrificare","plural-vocative":"nostrificărilor"}},{"word":"nostrom","pos":"noun","definitions":["petty officer"],"forms":{"plural":"nostromi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nostrom","accusative-definite-nominative-singular":"nostromul","accusative-indefinite-nominative-plural":"nostromi","accusative-definite-nominative-plural":"nostromii","dative-genitive-indefinite-singular":"nostrom","dative-definite-genitive-singular":"nostromului","dative-genitive-indefinite-plural":"nostromi","dative-definite-genitive-plural":"nostromilor","singular-vocative":"nostromule","plural-vocative":"nostromilor"}},{"word":"nostru","pos":"det","definitions":["our"],"pronunciation":"/ˈnos.tru/","forms":{"feminine-singular":"noastră","masculine-plural":"noștri","feminine-neuter-plural":"noastre","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nostru","error-unrecognized-form-feminine-indefinite-singular":"noastră","error-unrecognized-form-indefinite-masculine-plural":"noștri","error-unrecognized-form-feminine-indefinite-neuter-plural":"noastre","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"nostru","pos":"pron","definitions":["ours"],"pronunciation":"/ˈnos.tru/","gender":"m"},{"word":"nota","pos":"verb","definitions":["to make a note of, note down in writing","to note (identify with a designation)","to note (bring attention to something)","to grade"],"pronunciation":"/noˈta/","examples":[{"ro":"Notez indicațiile supraveghetorului meu.","en":"I note down my supervisor’s indications."},{"ro":"Vom nota variabila cu a.","en":"We shall note the variable by a."},{"ro":"Să notăm în treacăt unele aspecte din ce era Oborul cu ani în urmă:[…]","en":"Let’s note in passing a few aspects of what Obor used to be years ago: […]"}],"forms":{"canonical":"a nota 1st conjugation","present-singular-third-person":"notează","participle-past":"notat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a nota","gerund":"notând","first-person-indicative-present-singular":"notez","indicative-present-second-person-singular":"notezi","indicative-present-singular-third-person":"notează","first-person-indicative-plural-present":"notăm","indicative-plural-present-second-person":"notați","indicative-plural-present-third-person":"notează","first-person-imperfect-indicative-singular":"notam","imperfect-indicative-second-person-singular":"notai","imperfect-indicative-singular-third-person":"nota","first-person-imperfect-indicative-plural":"notam","imperfect-indicative-plural-second-person":"notați","imperfect-indicative-plural-third-person":"notau","first-person-indicative-perfect-singular":"notai","indicative-perfect-second-person-singular":"notași","indicative-perfect-singular-third-person":"notă","first-person-indicative-perfect-plural":"notarăm","indicative-perfect-plural-second-person":"notarăți","indicative-perfect-plural-third-person":"notară","first-person-indicative-pluperfect-singular":"notasem","indicative-pluperfect-second-person-singular":"notaseși","indicative-pluperfect-singular-third-person":"notase","first-person-indicative-pluperfect-plural":"notaserăm","indicative-pluperfect-plural-second-person":"notaserăți","indicative-pluperfect-plural-third-person":"notaseră","first-person-present-singular-subjunctive":"să notez","present-second-person-singular-subjunctive":"să notezi","present-singular-subjunctive-third-person":"să noteze","first-person-plural-present-subjunctive":"să notăm","plural-present-second-person-subjunctive":"să notați","plural-present-subjunctive-third-person":"să noteze","imperative-second-person-singular":"notează","imperative-plural-second-person":"notați","imperative-negative-second-person-singular":"nu nota","imperative-negative-plural-second-person":"nu notați"}},{"word":"nota","pos":"verb","definitions":["obsolete form of înota (“to swim”)"],"forms":{"canonical":"a nota 1st conjugation","present-singular-third-person":"noată","participle-past":"notat"}},{"word":"nota","pos":"noun","definitions":["definite nominative/accusative singular of notă (“note”)"],"pronunciation":"/ˈno.ta/"},{"word":"notă","pos":"noun","definitions":["note (written or spoken), annotation","mark (UK), grade (US)","bill (UK, US), check (US)","note","touch, hint, note"],"forms":{"plural":"note","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"notă","accusative-definite-nominative-singular":"nota","accusative-indefinite-nominative-plural":"note","accusative-definite-nominative-plural":"notele","dative-genitive-indefinite-singular":"note","dative-definite-genitive-singular":"notei","dative-genitive-indefinite-plural":"note","dative-definite-genitive-plural":"notelor","singular-vocative":"notă","plural-vocative":"notelor"}},{"word":"nota bene","pos":"noun","definitions":["nota bene"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nota bene","accusative-definite-nominative":"nota beneul","dative-genitive-indefinite":"nota bene","dative-definite-genitive":"nota beneului","vocative":"nota beneule"}},{"word":"notă de plată","pos":"noun","definitions":["bill, check"],"forms":{"plural":"note de plată"}},{"word":"notabil","pos":"adj","definitions":["notable"],"forms":{"feminine-singular":"notabilă","masculine-plural":"notabili","feminine-neuter-plural":"notabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"notabil","error-unrecognized-form-feminine-indefinite-singular":"notabilă","error-unrecognized-form-indefinite-masculine-plural":"notabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"notabile","definite-error-unrecognized-form-masculine-neuter-singular":"notabilul","definite-error-unrecognized-form-feminine-singular":"notabila","definite-error-unrecognized-form-masculine-plural":"notabilii","definite-error-unrecognized-form-feminine-neuter-plural":"notabilele"}},{"word":"notabilitate","pos":"noun","definitions":["notability"],"forms":{"plural":"notabilități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"notabilitate","accusative-definite-nominative-singular":"notabilitatea","accusative-indefinite-nominative-plural":"notabilități","accusative-definite-nominative-plural":"notabilitățile","dative-genitive-indefinite-singular":"notabilități","dative-definite-genitive-singular":"notabilității","dative-genitive-indefinite-plural":"notabilități","dative-definite-genitive-plural":"notabilităților","singular-vocative":"notabilitate","plural-vocative":"notabilităților"}},{"word":"notalgie","pos":"noun","definitions":["notalgia"],"forms":{"plural":"notalgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"notalgie","accusative-definite-nominative-singular":"notalgia","accusative-indefinite-nominative-plural":"notalgii","accusative-definite-nominative-plural":"notalgiile","dative-genitive-indefinite-singular":"notalgii","dative-definite-genitive-singular":"notalgiei","dative-genitive-indefinite-plural":"notalgii","dative-definite-genitive-plural":"notalgiilor","singular-vocative":"notalgie","plural-vocative":"notalgiilor"}},{"word":"Notar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Notar"}},{"word":"notar","pos":"noun","definitions":["notary"],"forms":{"plural":"notari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"notar","accusative-definite-nominative-singular":"notarul","accusative-indefinite-nominative-plural":"notari","accusative-definite-nominative-plural":"notarii","dative-genitive-indefinite-singular":"notar","dative-definite-genitive-singular":"notarului","dative-genitive-indefinite-plural":"notari","dative-definite-genitive-plural":"notarilor","singular-vocative":"notarule","plural-vocative":"notarilor"}},{"word":"notarăș","pos":"noun","definitions":["notary"],"forms":{"plural":"notarăși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"notarăș","accusative-definite-nominative-singular":"notarășul","accusative-indefinite-nominative-plural":"notarăși","accusative-definite-nominative-plural":"notarășii","dative-genitive-indefinite-singular":"notarăș","dative-definite-genitive-singular":"notarășului","dative-genitive-indefinite-plural":"notarăși","dative-definite-genitive-plural":"notarășilor","singular-vocative":"notarășule","plural-vocative":"notarășilor"}},{"word":"notăraș","pos":"noun","definitions":["obsolete form of notarăș"],"forms":{"plural":"notărași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"notăraș","accusative-definite-nominative-singular":"notărașul","accusative-indefinite-nominative-plural":"notărași","accusative-definite-nominative-plural":"notărașii","dative-genitive-indefinite-singular":"notăraș","dative-definite-genitive-singular":"notărașului","dative-genitive-indefinite-plural":"notărași","dative-definite-genitive-plural":"notărașilor","singular-vocative":"notărașule","plural-vocative":"notărașilor"}},{"word":"notărășie","pos":"noun","definitions":["notaryship"],"forms":{"plural":"notărășii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"notărășie","accusative-definite-nominative-singular":"notărășia","accusative-indefinite-nominative-plural":"notărășii","accusative-definite-nominative-plural":"notărășiile","dative-genitive-indefinite-singular":"notărășii","dative-definite-genitive-singular":"notărășiei","dative-genitive-indefinite-plural":"notărășii","dative-definite-genitive-plural":"notărășiilor","singular-vocative":"notărășie","plural-vocative":"notărășiilor"}},{"word":"notărășiță","pos":"noun","definitions":["a notary's wife"],"forms":{"plural":"notărășițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"notărășiță","accusative-definite-nominative-singular":"notărășița","accusative-indefinite-nominative-plural":"notărășițe","accusative-definite-nominative-plural":"notărășițele","dative-genitive-indefinite-singular":"notărășițe","dative-definite-genitive-singular":"notărășiței","dative-genitive-indefinite-plural":"notărășițe","dative-definite-genitive-plural":"notărășițelor","singular-vocative":"notărășiță","plural-vocative":"notărășițelor"}},{"word":"notare","pos":"noun","definitions":["scoring"],"forms":{"plural":"notări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"notare","accusative-definite-nominative-singular":"notarea","accusative-indefinite-nominative-plural":"notări","accusative-definite-nominative-plural":"notările","dative-genitive-indefinite-singular":"notări","dative-definite-genitive-singular":"notării","dative-genitive-indefinite-plural":"notări","dative-definite-genitive-plural":"notărilor","singular-vocative":"notare","plural-vocative":"notărilor"}},{"word":"notăreasă","pos":"noun","definitions":["female equivalent of notar"],"forms":{"plural":"notărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"notăreasă","accusative-definite-nominative-singular":"notăreasa","accusative-indefinite-nominative-plural":"notărese","accusative-definite-nominative-plural":"notăresele","dative-genitive-indefinite-singular":"notărese","dative-definite-genitive-singular":"notăresei","dative-genitive-indefinite-plural":"notărese","dative-definite-genitive-plural":"notăreselor","singular-vocative":"notăreasă","plural-vocative":"notăreselor"}},{"word":"notarial","pos":"adj","definitions":["notarial"],"forms":{"feminine-singular":"notarială","masculine-plural":"notariali","feminine-neuter-plural":"notariale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"notarial","error-unrecognized-form-feminine-indefinite-singular":"notarială","error-unrecognized-form-indefinite-masculine-plural":"notariali","error-unrecognized-form-feminine-indefinite-neuter-plural":"notariale","definite-error-unrecognized-form-masculine-neuter-singular":"notarialul","definite-error-unrecognized-form-feminine-singular":"notariala","definite-error-unrecognized-form-masculine-plural":"notarialii","definite-error-unrecognized-form-feminine-neuter-plural":"notarialele"}},{"word":"notariat","pos":"noun","definitions":["notary public office"],"forms":{"plural":"notariate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"notariat","accusative-definite-nominative-singular":"notariatul","accusative-indefinite-nominative-plural":"notariate","accusative-definite-nominative-plural":"notariatele","dative-genitive-indefinite-singular":"notariat","dative-definite-genitive-singular":"notariatului","dative-genitive-indefinite-plural":"notariate","dative-definite-genitive-plural":"notariatelor","singular-vocative":"notariatule","plural-vocative":"notariatelor"}},{"word":"notăriță","pos":"noun","definitions":["female notary"],"forms":{"plural":"notărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"notăriță","accusative-definite-nominative-singular":"notărița","accusative-indefinite-nominative-plural":"notărițe","accusative-definite-nominative-plural":"notărițele","dative-genitive-indefinite-singular":"notărițe","dative-definite-genitive-singular":"notăriței","dative-genitive-indefinite-plural":"notărițe","dative-definite-genitive-plural":"notărițelor","singular-vocative":"notăriță","plural-vocative":"notărițelor"}},{"word":"notație","pos":"noun","definitions":["notation"],"pronunciation":"/noˈtat͡si.e/","forms":{"plural":"notații","alternative":"нотацие"}},{"word":"notație algebrică","pos":"noun","definitions":["algebraic notation"],"pronunciation":"/noˌtat͡si.e alˈd͡ʒebrikə/","forms":{"plural":"notații algebrice"}},{"word":"notație poloneză","pos":"noun","definitions":["Polish notation"]},{"word":"notație postfixă","pos":"noun","definitions":["postfix notation"]},{"word":"notatiță","pos":"noun","definitions":["red-necked phalarope (Phalaropus lobatus)"],"forms":{"plural":"notatițe"}},{"word":"notătiță","pos":"noun","definitions":["phalarope"],"forms":{"plural":"notătițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"notătiță","accusative-definite-nominative-singular":"notătița","accusative-indefinite-nominative-plural":"notătițe","accusative-definite-nominative-plural":"notătițele","dative-genitive-indefinite-singular":"notătițe","dative-definite-genitive-singular":"notătiței","dative-genitive-indefinite-plural":"notătițe","dative-definite-genitive-plural":"notătițelor","singular-vocative":"notătiță","plural-vocative":"notătițelor"}},{"word":"notatiță americană","pos":"noun","definitions":["Wilson's phalarope (Phalaropus tricolor)"],"forms":{"plural":"notatițe americane"}},{"word":"notatiță cu cioc lat","pos":"noun","definitions":["red phalarope (Phalaropus fulicarius)"],"forms":{"plural":"notatițe cu cioc lat"}},{"word":"notațiune","pos":"noun","definitions":["alternative form of notație"],"forms":{"plural":"notațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"notațiune","accusative-definite-nominative-singular":"notațiunea","accusative-indefinite-nominative-plural":"notațiuni","accusative-definite-nominative-plural":"notațiunile","dative-genitive-indefinite-singular":"notațiuni","dative-definite-genitive-singular":"notațiunii","dative-genitive-indefinite-plural":"notațiuni","dative-definite-genitive-plural":"notațiunilor","singular-vocative":"notațiune","plural-vocative":"notațiunilor"}},{"word":"notătoare","pos":"noun","definitions":["marsh arrowgrass (Triglochin palustris)"],"forms":{"plural":"notătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"notătoare","accusative-definite-nominative-singular":"notătoarea","accusative-indefinite-nominative-plural":"notătoare","accusative-definite-nominative-plural":"notătoarele","dative-genitive-indefinite-singular":"notătoare","dative-definite-genitive-singular":"notătoarei","dative-genitive-indefinite-plural":"notătoare","dative-definite-genitive-plural":"notătoarelor","singular-vocative":"notătoare","plural-vocative":"notătoarelor"}},{"word":"note","pos":"noun","definitions":["plural of notă"],"pronunciation":"[ˈnote]","gender":"f-p"},{"word":"notifica","pos":"verb","definitions":["to notify"],"forms":{"canonical":"a notifica 1st conjugation","present-singular-third-person":"notifică","participle-past":"notificat","subjunctive-third-person":"modifice","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a notifica","gerund":"notificând","first-person-indicative-present-singular":"notific","indicative-present-second-person-singular":"notifici","indicative-present-singular-third-person":"notifică","first-person-indicative-plural-present":"notificăm","indicative-plural-present-second-person":"notificați","indicative-plural-present-third-person":"notifică","first-person-imperfect-indicative-singular":"notificam","imperfect-indicative-second-person-singular":"notificai","imperfect-indicative-singular-third-person":"notifica","first-person-imperfect-indicative-plural":"notificam","imperfect-indicative-plural-second-person":"notificați","imperfect-indicative-plural-third-person":"notificau","first-person-indicative-perfect-singular":"notificai","indicative-perfect-second-person-singular":"notificași","indicative-perfect-singular-third-person":"notifică","first-person-indicative-perfect-plural":"notificarăm","indicative-perfect-plural-second-person":"notificarăți","indicative-perfect-plural-third-person":"notificară","first-person-indicative-pluperfect-singular":"notificasem","indicative-pluperfect-second-person-singular":"notificaseși","indicative-pluperfect-singular-third-person":"notificase","first-person-indicative-pluperfect-plural":"notificaserăm","indicative-pluperfect-plural-second-person":"notificaserăți","indicative-pluperfect-plural-third-person":"notificaseră","first-person-present-singular-subjunctive":"să notific","present-second-person-singular-subjunctive":"să notifici","present-singular-subjunctive-third-person":"să notifice","first-person-plural-present-subjunctive":"să notificăm","plural-present-second-person-subjunctive":"să notificați","plural-present-subjunctive-third-person":"să notifice","imperative-second-person-singular":"notifică","imperative-plural-second-person":"notificați","imperative-negative-second-person-singular":"nu notifica","imperative-negative-plural-second-person":"nu notificați"}},{"word":"notificare","pos":"noun","definitions":["notification"],"forms":{"plural":"notificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"notificare","accusative-definite-nominative-singular":"notificarea","accusative-indefinite-nominative-plural":"notificări","accusative-definite-nominative-plural":"notificările","dative-genitive-indefinite-singular":"notificări","dative-definite-genitive-singular":"notificării","dative-genitive-indefinite-plural":"notificări","dative-definite-genitive-plural":"notificărilor","singular-vocative":"notificare","plural-vocative":"notificărilor"}},{"word":"notificație","pos":"noun","definitions":["notification"],"forms":{"plural":"notificații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"notificație","accusative-definite-nominative-singular":"notificația","accusative-indefinite-nominative-plural":"notificații","accusative-definite-nominative-plural":"notificațiile","dative-genitive-indefinite-singular":"notificații","dative-definite-genitive-singular":"notificației","dative-genitive-indefinite-plural":"notificații","dative-definite-genitive-plural":"notificațiilor","singular-vocative":"notificație","plural-vocative":"notificațiilor"}},{"word":"notificațiune","pos":"noun","definitions":["alternative form of notificație"],"forms":{"plural":"notificațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"notificațiune","accusative-definite-nominative-singular":"notificațiunea","accusative-indefinite-nominative-plural":"notificațiuni","accusative-definite-nominative-plural":"notificațiunile","dative-genitive-indefinite-singular":"notificațiuni","dative-definite-genitive-singular":"notificațiunii","dative-genitive-indefinite-plural":"notificațiuni","dative-definite-genitive-plural":"notificațiunilor","singular-vocative":"notificațiune","plural-vocative":"notificațiunilor"}},{"word":"Noțig","pos":"name","definitions":["a village in Sălățig, Sălaj County, Romania"],"gender":"m"},{"word":"noțional","pos":"adj","definitions":["notional"],"forms":{"feminine-singular":"noțională","masculine-plural":"noționali","feminine-neuter-plural":"noționale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"noțional","error-unrecognized-form-feminine-indefinite-singular":"noțională","error-unrecognized-form-indefinite-masculine-plural":"noționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"noționale","definite-error-unrecognized-form-masculine-neuter-singular":"noționalul","definite-error-unrecognized-form-feminine-singular":"noționala","definite-error-unrecognized-form-masculine-plural":"noționalii","definite-error-unrecognized-form-feminine-neuter-plural":"noționalele"}},{"word":"notistă","pos":"noun","definitions":["female equivalent of notist"],"forms":{"plural":"notiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"notistă","accusative-definite-nominative-singular":"notista","accusative-indefinite-nominative-plural":"notiste","accusative-definite-nominative-plural":"notistele","dative-genitive-indefinite-singular":"notiste","dative-definite-genitive-singular":"notistei","dative-genitive-indefinite-plural":"notiste","dative-definite-genitive-plural":"notistelor","singular-vocative":"notistă","plural-vocative":"notistelor"}},{"word":"notiță","pos":"noun","definitions":["note"],"forms":{"plural":"notițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"notiță","accusative-definite-nominative-singular":"notița","accusative-indefinite-nominative-plural":"notițe","accusative-definite-nominative-plural":"notițele","dative-genitive-indefinite-singular":"notițe","dative-definite-genitive-singular":"notiței","dative-genitive-indefinite-plural":"notițe","dative-definite-genitive-plural":"notițelor","singular-vocative":"notiță","plural-vocative":"notițelor"}},{"word":"notiție","pos":"noun","definitions":["news"],"forms":{"plural":"notiții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"notiție","accusative-definite-nominative-singular":"notiția","accusative-indefinite-nominative-plural":"notiții","accusative-definite-nominative-plural":"notițiile","dative-genitive-indefinite-singular":"notiții","dative-definite-genitive-singular":"notiției","dative-genitive-indefinite-plural":"notiții","dative-definite-genitive-plural":"notițiilor","singular-vocative":"notiție","plural-vocative":"notițiilor"}},{"word":"noțiune","pos":"noun","definitions":["notion"],"forms":{"plural":"noțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"noțiune","accusative-definite-nominative-singular":"noțiunea","accusative-indefinite-nominative-plural":"noțiuni","accusative-definite-nominative-plural":"noțiunile","dative-genitive-indefinite-singular":"noțiuni","dative-definite-genitive-singular":"noțiunii","dative-genitive-indefinite-plural":"noțiuni","dative-definite-genitive-plural":"noțiunilor","singular-vocative":"noțiune","plural-vocative":"noțiunilor"}},{"word":"notocord","pos":"noun","definitions":["notochord"],"forms":{"plural":"notocorde"}},{"word":"notocordă","pos":"noun","definitions":["notochord"],"forms":{"plural":"notocorde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"notocordă","accusative-definite-nominative-singular":"notocorda","accusative-indefinite-nominative-plural":"notocorde","accusative-definite-nominative-plural":"notocordele","dative-genitive-indefinite-singular":"notocorde","dative-definite-genitive-singular":"notocordei","dative-genitive-indefinite-plural":"notocorde","dative-definite-genitive-plural":"notocordelor","singular-vocative":"notocordă","plural-vocative":"notocordelor"}},{"word":"notorietate","pos":"noun","definitions":["notoriety"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"notorietate","accusative-definite-nominative-singular":"notorietatea","accusative-indefinite-nominative-plural":"notorietăți","accusative-definite-nominative-plural":"notorietățile","dative-genitive-indefinite-singular":"notorietăți","dative-definite-genitive-singular":"notorietății","dative-genitive-indefinite-plural":"notorietăți","dative-definite-genitive-plural":"notorietăților","singular-vocative":"notorietate","plural-vocative":"notorietăților"}},{"word":"notoriu","pos":"adj","definitions":["notorious"],"forms":{"feminine-singular":"notorie","plural":"notorii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"notoriu","error-unrecognized-form-feminine-indefinite-singular":"notorie","error-unrecognized-form-indefinite-masculine-plural":"notorii","error-unrecognized-form-feminine-indefinite-neuter-plural":"notorii","definite-error-unrecognized-form-masculine-neuter-singular":"notoriul","definite-error-unrecognized-form-feminine-singular":"notoria","definite-error-unrecognized-form-masculine-plural":"notoriii","definite-error-unrecognized-form-feminine-neuter-plural":"notoriile"}},{"word":"Nou","pos":"name","definitions":["a village in Roșia, Sibiu County, Romania"],"gender":"m"},{"word":"nou","pos":"adj","definitions":["new"],"pronunciation":"/now/","forms":{"feminine-singular":"nouă","plural":"noi","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nou","error-unrecognized-form-feminine-indefinite-singular":"nouă","error-unrecognized-form-indefinite-masculine-plural":"noi","error-unrecognized-form-feminine-indefinite-neuter-plural":"noi","definite-error-unrecognized-form-masculine-neuter-singular":"noul","definite-error-unrecognized-form-feminine-singular":"noua","definite-error-unrecognized-form-masculine-plural":"noii","definite-error-unrecognized-form-feminine-neuter-plural":"noile","alternative":"ноу"}},{"word":"Nou Săsesc","pos":"name","definitions":["a village in Laslea, Sibiu County, Romania"],"gender":"m"},{"word":"nou venit","pos":"noun","definitions":["new comer"],"forms":{"plural":"noi veniți"}},{"word":"nou-născut","pos":"noun","definitions":["newborn"],"forms":{"plural":"nou-născuți"}},{"word":"noua","pos":"adj","definitions":["ninth","definite nominative/accusative feminine singular of nou"],"pronunciation":"/ˈno.wa/","gender":"f","forms":{"canonical-feminine":"a noua","masculine":"al nouălea"}},{"word":"nouă","pos":"num","definitions":["nine"],"pronunciation":"/ˈno.wə/"},{"word":"nouă","pos":"adj","definitions":["indefinite nominative/accusative feminine singular of nou"],"pronunciation":"/ˈno.wə/"},{"word":"nouă","pos":"pron","definitions":["(to) us"],"pronunciation":"/ˈno.wə/"},{"word":"Noua Anglie","pos":"name","definitions":["New England (a geographic region of the northeastern United States, consisting of Connecticut, Maine, Massachusetts, New Hampshire, Rhode Island and Vermont)"],"gender":"f"},{"word":"Noua Caledonie","pos":"name","definitions":["New Caledonia (an archipelago and overseas territory of France in Oceania)"],"gender":"f"},{"word":"Noua Guinee","pos":"name","definitions":["New Guinea"],"gender":"f"},{"word":"Noua Scoție","pos":"name","definitions":["Nova Scotia (a province in eastern Canada)"],"gender":"f"},{"word":"Noua Spanie","pos":"name","definitions":["New Spain (a former viceroyalty (a type of colony) in North America and Central America that existed from 1521 to 1821. It comprised of Spain's territorial possessions in the New World including the southwestern United States, Mexico, Central America, and the Philippines, established following the Spanish conquest of the Aztec Empire in 1521)"],"gender":"f"},{"word":"Noua Zeelandă","pos":"name","definitions":["New Zealand (a country and archipelago of Oceania, to the east of Australia)"],"gender":"f"},{"word":"nouălea","pos":"adj","definitions":["ninth"],"pronunciation":"/ˈno.wə.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al nouălea","feminine":"a noua"}},{"word":"nouar","pos":"noun","definitions":["nine (playing card)"],"forms":{"plural":"nouari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nouar","accusative-definite-nominative-singular":"nouarul","accusative-indefinite-nominative-plural":"nouari","accusative-definite-nominative-plural":"nouarii","dative-genitive-indefinite-singular":"nouar","dative-definite-genitive-singular":"nouarului","dative-genitive-indefinite-plural":"nouari","dative-definite-genitive-plural":"nouarilor","singular-vocative":"nouarule","plural-vocative":"nouarilor"}},{"word":"nouășpe","pos":"num","definitions":["clipping of nouăsprezece (“nineteen”)"],"pronunciation":"/ˈno.wə.ʃpe/"},{"word":"nouășpea","pos":"adj","definitions":["nineteenth"],"pronunciation":"/ˈno.wə.ʃpe̯a/","gender":"f","forms":{"canonical-feminine":"a nouășpea","masculine":"al nouășpelea"}},{"word":"nouășpelea","pos":"adj","definitions":["nineteenth"],"pronunciation":"/ˈno.wəʃˌpe.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al nouășpelea","feminine":"a nouășpea"}},{"word":"nouăsprezece","pos":"num","definitions":["nineteen"],"pronunciation":"/ˈno.wə.spreˌze.t͡ʃe/","forms":{"alternative-informal":"nouășpe"}},{"word":"nouăsprezecea","pos":"adj","definitions":["nineteenth"],"pronunciation":"/ˈno.wə.spreˌze.t͡ʃe̯a/","gender":"f","forms":{"canonical-feminine":"a nouăsprezecea","masculine":"al nouăsprezecelea"}},{"word":"nouăsprezecelea","pos":"adj","definitions":["nineteenth"],"pronunciation":"/ˈno.wə.spreˌze.t͡ʃe.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al nouăsprezecelea","feminine":"a nouăsprezecea"}},{"word":"nouăzecea","pos":"adj","definitions":["ninetieth"],"pronunciation":"/no.wəˈze.t͡ʃe̯a/","gender":"f","forms":{"canonical-feminine":"a nouăzecea","masculine":"al nouăzecilea"}},{"word":"nouăzeci","pos":"num","definitions":["ninety"],"pronunciation":"/no.wəˈzet͡ʃʲ/"},{"word":"nouăzeci și cincea","pos":"adj","definitions":["ninety-fifth"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈt͡ʃin.t͡ʃe̯a/","gender":"f","forms":{"canonical-feminine":"a nouăzeci și cincea","masculine":"al nouăzeci și cincilea"}},{"word":"nouăzeci și cinci","pos":"num","definitions":["ninety-five"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈt͡ʃint͡ʃʲ/"},{"word":"nouăzeci și cincilea","pos":"adj","definitions":["ninety-fifth"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈt͡ʃint͡ʃi.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al nouăzeci și cincilea","feminine":"a nouăzeci și cincea"}},{"word":"nouăzeci și doi","pos":"num","definitions":["ninety-two"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈdoj/","gender":"m"},{"word":"nouăzeci și doilea","pos":"adj","definitions":["ninety-second"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈdoj.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al nouăzeci și doilea","feminine":"a nouăzeci și doua"}},{"word":"nouăzeci și doua","pos":"adj","definitions":["ninety-second"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈdo.wa/","gender":"f","forms":{"canonical-feminine":"a nouăzeci și doua","masculine":"al nouăzeci și doilea"}},{"word":"nouăzeci și două","pos":"num","definitions":["ninety-two"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈdo.wə/","gender":"f","forms":{"canonical-neuter":"nouăzeci și două f &"}},{"word":"nouăzeci și noua","pos":"adj","definitions":["ninety-ninth"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈno.wa/","gender":"f","forms":{"canonical-feminine":"a nouăzeci și noua","masculine":"al nouăzeci și nouălea"}},{"word":"nouăzeci și nouă","pos":"num","definitions":["ninety-nine"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈno.wə/"},{"word":"nouăzeci și nouălea","pos":"adj","definitions":["ninety-ninth"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈno.wə.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al nouăzeci și nouălea","feminine":"a nouăzeci și noua"}},{"word":"nouăzeci și opt","pos":"num","definitions":["ninety-eight"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈopt/"},{"word":"nouăzeci și opta","pos":"adj","definitions":["ninety-eighth"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈop.ta/","gender":"f","forms":{"canonical-feminine":"a nouăzeci și opta","masculine":"al nouăzeci și optulea"}},{"word":"nouăzeci și optulea","pos":"adj","definitions":["ninety-eighth"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈop.tu.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al nouăzeci și optulea","feminine":"a nouăzeci și opta"}},{"word":"nouăzeci și patra","pos":"adj","definitions":["ninety-fourth"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈpa.tra/","gender":"f","forms":{"canonical-feminine":"a nouăzeci și patra","masculine":"al nouăzeci și patrulea"}},{"word":"nouăzeci și patru","pos":"num","definitions":["ninety-four"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈpa.tru/"},{"word":"nouăzeci și patrulea","pos":"adj","definitions":["ninety-fourth"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈpa.tru.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al nouăzeci și patrulea","feminine":"a nouăzeci și patra"}},{"word":"nouăzeci și șapte","pos":"num","definitions":["ninety-seven"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈʃap.te/"},{"word":"nouăzeci și șaptea","pos":"adj","definitions":["ninety-seventh"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈʃap.te̯a/","gender":"f","forms":{"canonical-feminine":"a nouăzeci și șaptea","masculine":"al nouăzeci și șaptelea"}},{"word":"nouăzeci și șaptelea","pos":"adj","definitions":["ninety-seventh"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈʃap.te.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al nouăzeci și șaptelea","feminine":"a nouăzeci și șaptea"}},{"word":"nouăzeci și șase","pos":"num","definitions":["ninety-six"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈʃa.se/"},{"word":"nouăzeci și șasea","pos":"adj","definitions":["ninety-sixth"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈʃa.se̯a/","gender":"f","forms":{"canonical-feminine":"a nouăzeci și șasea","masculine":"al nouăzeci și șaselea"}},{"word":"nouăzeci și șaselea","pos":"adj","definitions":["ninety-sixth"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈʃa.se.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al nouăzeci și șaselea","feminine":"a nouăzeci și șasea"}},{"word":"nouăzeci și trei","pos":"num","definitions":["ninety-three"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈtrej/"},{"word":"nouăzeci și treia","pos":"adj","definitions":["ninety-third"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈtre.ja/","gender":"f","forms":{"canonical-feminine":"a nouăzeci și treia","masculine":"al nouăzeci și treilea"}},{"word":"nouăzeci și treilea","pos":"adj","definitions":["ninety-third"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈtrej.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al nouăzeci și treilea","feminine":"a nouăzeci și treia"}},{"word":"nouăzeci și una","pos":"num","definitions":["ninety-one"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈu.na/","forms":{"canonical-neuter":"nouăzeci și una f &"}},{"word":"nouăzeci și una","pos":"adj","definitions":["ninety-first"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈu.na/","gender":"f","forms":{"canonical-feminine":"a nouăzeci și una","masculine":"al nouăzeci și unulea"}},{"word":"nouăzeci și unu","pos":"num","definitions":["ninety-one"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈu.nu/","gender":"m"},{"word":"nouăzeci și unulea","pos":"adj","definitions":["ninety-first"],"pronunciation":"/ˌno.wə.zet͡ʃʲ ʃi ˈu.nu.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al nouăzeci și unulea","feminine":"a nouăzeci și una"}},{"word":"nouăzecilea","pos":"adj","definitions":["ninetieth"],"pronunciation":"/ˌno.wəˈze.t͡ʃi.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al nouăzecilea","feminine":"a nouăzecea"}},{"word":"noul","pos":"adj","definitions":["definite feminine nominative/accusative singular of nou"]},{"word":"Noul Român","pos":"name","definitions":["a village in Arpașu de Jos, Sibiu County, Romania"],"gender":"m"},{"word":"Noul Testament","pos":"name","definitions":["New Testament"],"gender":"n"},{"word":"Nour","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nour"}},{"word":"nour","pos":"noun","definitions":["alternative form of nor"],"forms":{"plural":"nouri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nour","accusative-definite-nominative-singular":"nourul","accusative-indefinite-nominative-plural":"nouri","accusative-definite-nominative-plural":"nourii","dative-genitive-indefinite-singular":"nour","dative-definite-genitive-singular":"nourului","dative-genitive-indefinite-plural":"nouri","dative-definite-genitive-plural":"nourilor","singular-vocative":"nourule","plural-vocative":"nourilor"}},{"word":"nouraș","pos":"noun","definitions":["diminutive of nour; small cloud"],"forms":{"plural":"nourași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nouraș","accusative-definite-nominative-singular":"nourașul","accusative-indefinite-nominative-plural":"nourași","accusative-definite-nominative-plural":"nourașii","dative-genitive-indefinite-singular":"nouraș","dative-definite-genitive-singular":"nourașului","dative-genitive-indefinite-plural":"nourași","dative-definite-genitive-plural":"nourașilor","singular-vocative":"nourașule","plural-vocative":"nourașilor"}},{"word":"nourel","pos":"noun","definitions":["diminutive of nour"],"forms":{"plural":"nourei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nourel","accusative-definite-nominative-singular":"nourelul","accusative-indefinite-nominative-plural":"nourei","accusative-definite-nominative-plural":"noureii","dative-genitive-indefinite-singular":"nourel","dative-definite-genitive-singular":"nourelului","dative-genitive-indefinite-plural":"nourei","dative-definite-genitive-plural":"noureilor","singular-vocative":"nourelule","plural-vocative":"noureilor"}},{"word":"Nourescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nourescu"}},{"word":"noureț","pos":"noun","definitions":["diminutive of nour"],"forms":{"plural":"nourețuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"noureț","accusative-definite-nominative-singular":"nourețul","accusative-indefinite-nominative-plural":"nourețuri","accusative-definite-nominative-plural":"nourețurile","dative-genitive-indefinite-singular":"noureț","dative-definite-genitive-singular":"nourețului","dative-genitive-indefinite-plural":"nourețuri","dative-definite-genitive-plural":"nourețurilor","singular-vocative":"nourețule","plural-vocative":"nourețurilor"}},{"word":"nouros","pos":"adj","definitions":["alternative form of noros"],"forms":{"feminine-singular":"nouroasă","masculine-plural":"nouroși","feminine-neuter-plural":"nouroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nouros","error-unrecognized-form-feminine-indefinite-singular":"nouroasă","error-unrecognized-form-indefinite-masculine-plural":"nouroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"nouroase","definite-error-unrecognized-form-masculine-neuter-singular":"nourosul","definite-error-unrecognized-form-feminine-singular":"nouroasa","definite-error-unrecognized-form-masculine-plural":"nouroșii","definite-error-unrecognized-form-feminine-neuter-plural":"nouroasele"}},{"word":"nouț","pos":"adj","definitions":["diminutive of nou"],"forms":{"feminine-singular":"nouță","masculine-plural":"nouți","feminine-neuter-plural":"nouțe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nouț","error-unrecognized-form-feminine-indefinite-singular":"nouță","error-unrecognized-form-indefinite-masculine-plural":"nouți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nouțe","definite-error-unrecognized-form-masculine-neuter-singular":"nouțul","definite-error-unrecognized-form-feminine-singular":"nouța","definite-error-unrecognized-form-masculine-plural":"nouții","definite-error-unrecognized-form-feminine-neuter-plural":"nouțele"}},{"word":"noutate","pos":"noun","definitions":["item of news, tidings","novelty, innovation, newness"],"forms":{"plural":"noutăți"}},{"word":"nova","pos":"verb","definitions":["to novate"],"forms":{"canonical":"a nova 1st conjugation","present-singular-third-person":"novează","participle-past":"novat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a nova","gerund":"novând","first-person-indicative-present-singular":"novez","indicative-present-second-person-singular":"novezi","indicative-present-singular-third-person":"novează","first-person-indicative-plural-present":"novăm","indicative-plural-present-second-person":"novați","indicative-plural-present-third-person":"novează","first-person-imperfect-indicative-singular":"novam","imperfect-indicative-second-person-singular":"novai","imperfect-indicative-singular-third-person":"nova","first-person-imperfect-indicative-plural":"novam","imperfect-indicative-plural-second-person":"novați","imperfect-indicative-plural-third-person":"novau","first-person-indicative-perfect-singular":"novai","indicative-perfect-second-person-singular":"novași","indicative-perfect-singular-third-person":"novă","first-person-indicative-perfect-plural":"novarăm","indicative-perfect-plural-second-person":"novarăți","indicative-perfect-plural-third-person":"novară","first-person-indicative-pluperfect-singular":"novasem","indicative-pluperfect-second-person-singular":"novaseși","indicative-pluperfect-singular-third-person":"novase","first-person-indicative-pluperfect-plural":"novaserăm","indicative-pluperfect-plural-second-person":"novaserăți","indicative-pluperfect-plural-third-person":"novaseră","first-person-present-singular-subjunctive":"să novez","present-second-person-singular-subjunctive":"să novezi","present-singular-subjunctive-third-person":"să noveze","first-person-plural-present-subjunctive":"să novăm","plural-present-second-person-subjunctive":"să novați","plural-present-subjunctive-third-person":"să noveze","imperative-second-person-singular":"novează","imperative-plural-second-person":"novați","imperative-negative-second-person-singular":"nu nova","imperative-negative-plural-second-person":"nu novați"}},{"word":"novă","pos":"noun","definitions":["nova"],"forms":{"plural":"nove","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"novă","accusative-definite-nominative-singular":"nova","accusative-indefinite-nominative-plural":"nove","accusative-definite-nominative-plural":"novele","dative-genitive-indefinite-singular":"nove","dative-definite-genitive-singular":"novei","dative-genitive-indefinite-plural":"nove","dative-definite-genitive-plural":"novelor","singular-vocative":"novă","plural-vocative":"novelor"}},{"word":"Novac","pos":"name","definitions":["a village in Argetoaia, Dolj County, Romania","a surname from Serbo-Croatian"],"gender":"m"},{"word":"Novăceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Novăceanu"}},{"word":"Novăcel","pos":"name","definitions":["a river in Gorj, Romania, tributary to the Gilort"],"gender":"m"},{"word":"Novăcescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Novăcescu"}},{"word":"Novăcești","pos":"name","definitions":["a village in Bistra, Alba County, Romania","a village in Florești, Prahova County, Romania"],"gender":"m"},{"word":"Novaci","pos":"name","definitions":["a village in Mihăilești, Giurgiu County, Romania","a city in Gorj County, Romania"],"gender":"m"},{"word":"Novacovschi","pos":"name","definitions":["a surname from Polish"],"gender":"m","forms":{"dative-genitive":"lui Novacovschi"}},{"word":"Novaia Jizni","pos":"name","definitions":["a village in Ofatinți, Transnistria, Moldova"],"gender":"f"},{"word":"Novaia Nicolaevca","pos":"name","definitions":["a village in Mănoilești, Ungheni Raion, Moldova"],"gender":"f"},{"word":"Novăț","pos":"name","definitions":["a river in Maramureș, Romania, tributary to the Vaser"],"gender":"m"},{"word":"novație","pos":"noun","definitions":["novation"],"forms":{"plural":"novații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"novație","accusative-definite-nominative-singular":"novația","accusative-indefinite-nominative-plural":"novații","accusative-definite-nominative-plural":"novațiile","dative-genitive-indefinite-singular":"novații","dative-definite-genitive-singular":"novației","dative-genitive-indefinite-plural":"novații","dative-definite-genitive-plural":"novațiilor","singular-vocative":"novație","plural-vocative":"novațiilor"}},{"word":"novațiune","pos":"noun","definitions":["obsolete form of novație"],"forms":{"plural":"novațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"novațiune","accusative-definite-nominative-singular":"novațiunea","accusative-indefinite-nominative-plural":"novațiuni","accusative-definite-nominative-plural":"novațiunile","dative-genitive-indefinite-singular":"novațiuni","dative-definite-genitive-singular":"novațiunii","dative-genitive-indefinite-plural":"novațiuni","dative-definite-genitive-plural":"novațiunilor","singular-vocative":"novațiune","plural-vocative":"novațiunilor"}},{"word":"novatoare","pos":"noun","definitions":["female equivalent of novator"],"forms":{"plural":"novatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"novatoare","accusative-definite-nominative-singular":"novatoarea","accusative-indefinite-nominative-plural":"novatoare","accusative-definite-nominative-plural":"novatoarele","dative-genitive-indefinite-singular":"novatoare","dative-definite-genitive-singular":"novatoarei","dative-genitive-indefinite-plural":"novatoare","dative-definite-genitive-plural":"novatoarelor","singular-vocative":"novatoare","plural-vocative":"novatoarelor"}},{"word":"novator","pos":"adj","definitions":["innovative"],"forms":{"feminine-singular":"novatoare","masculine-plural":"novatori","feminine-neuter-plural":"novatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"novator","error-unrecognized-form-feminine-indefinite-singular":"novatoare","error-unrecognized-form-indefinite-masculine-plural":"novatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"novatoare","definite-error-unrecognized-form-masculine-neuter-singular":"novatorul","definite-error-unrecognized-form-feminine-singular":"novatoarea","definite-error-unrecognized-form-masculine-plural":"novatorii","definite-error-unrecognized-form-feminine-neuter-plural":"novatoarele"}},{"word":"novelă","pos":"noun","definitions":["novelette"],"forms":{"plural":"novele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"novelă","accusative-definite-nominative-singular":"novela","accusative-indefinite-nominative-plural":"novele","accusative-definite-nominative-plural":"novelele","dative-genitive-indefinite-singular":"novele","dative-definite-genitive-singular":"novelei","dative-genitive-indefinite-plural":"novele","dative-definite-genitive-plural":"novelelor","singular-vocative":"novelă","plural-vocative":"novelelor"}},{"word":"noveletă","pos":"noun","definitions":["alternative form of nuveletă"],"forms":{"plural":"novelete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"noveletă","accusative-definite-nominative-singular":"noveleta","accusative-indefinite-nominative-plural":"novelete","accusative-definite-nominative-plural":"noveletele","dative-genitive-indefinite-singular":"novelete","dative-definite-genitive-singular":"noveletei","dative-genitive-indefinite-plural":"novelete","dative-definite-genitive-plural":"noveletelor","singular-vocative":"noveletă","plural-vocative":"noveletelor"}},{"word":"novembre","pos":"noun","definitions":["alternative form of noiembrie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"novembre","accusative-definite-nominative":"novembreul","dative-genitive-indefinite":"novembre","dative-definite-genitive":"novembreului","vocative":"novembreule"}},{"word":"novice","pos":"noun","definitions":["novice"],"forms":{"plural":"novici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"novice","accusative-definite-nominative-singular":"noviceul","accusative-indefinite-nominative-plural":"novici","accusative-definite-nominative-plural":"novicii","dative-genitive-indefinite-singular":"novice","dative-definite-genitive-singular":"noviceului","dative-genitive-indefinite-plural":"novici","dative-definite-genitive-plural":"novicilor","singular-vocative":"noviceule","plural-vocative":"novicilor"}},{"word":"noviciat","pos":"noun","definitions":["novitiate"],"forms":{"plural":"noviciate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"noviciat","accusative-definite-nominative-singular":"noviciatul","accusative-indefinite-nominative-plural":"noviciate","accusative-definite-nominative-plural":"noviciatele","dative-genitive-indefinite-singular":"noviciat","dative-definite-genitive-singular":"noviciatului","dative-genitive-indefinite-plural":"noviciate","dative-definite-genitive-plural":"noviciatelor","singular-vocative":"noviciatule","plural-vocative":"noviciatelor"}},{"word":"novicism","pos":"noun","definitions":["neologism"],"forms":{"plural":"novicisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"novicism","accusative-definite-nominative-singular":"novicismul","accusative-indefinite-nominative-plural":"novicisme","accusative-definite-nominative-plural":"novicismele","dative-genitive-indefinite-singular":"novicism","dative-definite-genitive-singular":"novicismului","dative-genitive-indefinite-plural":"novicisme","dative-definite-genitive-plural":"novicismelor","singular-vocative":"novicismule","plural-vocative":"novicismelor"}},{"word":"novita","pos":"noun","definitions":["novelty"],"forms":{"plural":"novitale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-a","accusative-indefinite-nominative-singular":"novita","accusative-definite-nominative-singular":"novitaua","accusative-indefinite-nominative-plural":"novitale","accusative-definite-nominative-plural":"novitalele","dative-genitive-indefinite-singular":"novitale","dative-definite-genitive-singular":"novitalei","dative-genitive-indefinite-plural":"novitale","dative-definite-genitive-plural":"novitalelor","singular-vocative":"novita","plural-vocative":"novitalelor"}},{"word":"Novițchi","pos":"name","definitions":["a surname from Polish"],"gender":"m","forms":{"dative-genitive":"lui Novițchi"}},{"word":"novocaină","pos":"noun","definitions":["novocaine"],"forms":{"plural":"novocaine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"novocaină","accusative-definite-nominative-singular":"novocaina","accusative-indefinite-nominative-plural":"novocaine","accusative-definite-nominative-plural":"novocainele","dative-genitive-indefinite-singular":"novocaine","dative-definite-genitive-singular":"novocainei","dative-genitive-indefinite-plural":"novocaine","dative-definite-genitive-plural":"novocainelor","singular-vocative":"novocaină","plural-vocative":"novocainelor"}},{"word":"novocilină","pos":"noun","definitions":["mix of novocaine and penicillin"],"forms":{"plural":"novociline","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"novocilină","accusative-definite-nominative-singular":"novocilina","accusative-indefinite-nominative-plural":"novociline","accusative-definite-nominative-plural":"novocilinele","dative-genitive-indefinite-singular":"novociline","dative-definite-genitive-singular":"novocilinei","dative-genitive-indefinite-plural":"novociline","dative-definite-genitive-plural":"novocilinelor","singular-vocative":"novocilină","plural-vocative":"novocilinelor"}},{"word":"Novocotovsc","pos":"name","definitions":["a village in Frunză, Transnistria, Moldova"],"gender":"m"},{"word":"novolac","pos":"noun","definitions":["novolac"],"forms":{"plural":"novolacuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"novolac","accusative-definite-nominative-singular":"novolacul","accusative-indefinite-nominative-plural":"novolacuri","accusative-definite-nominative-plural":"novolacurile","dative-genitive-indefinite-singular":"novolac","dative-definite-genitive-singular":"novolacului","dative-genitive-indefinite-plural":"novolacuri","dative-definite-genitive-plural":"novolacurilor","singular-vocative":"novolacule","plural-vocative":"novolacurilor"}},{"word":"Novosavițcaia","pos":"name","definitions":["a village in Frunză, Transnistria, Moldova"],"gender":"f"},{"word":"Novosiolovca","pos":"name","definitions":["a village in Novosiolovca, Taraclia Raion, Moldova","a commune of Taraclia Raion, Moldova"],"gender":"f"},{"word":"Novovladimirovca","pos":"name","definitions":["a village in Bîcioc, Transnistria, Moldova"],"gender":"f"},{"word":"noxă","pos":"noun","definitions":["noxa"],"forms":{"plural":"noxe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"noxă","accusative-definite-nominative-singular":"noxa","accusative-indefinite-nominative-plural":"noxe","accusative-definite-nominative-plural":"noxele","dative-genitive-indefinite-singular":"noxe","dative-definite-genitive-singular":"noxei","dative-genitive-indefinite-plural":"noxe","dative-definite-genitive-plural":"noxelor","singular-vocative":"noxă","plural-vocative":"noxelor"}},{"word":"nr.","pos":"noun","definitions":["abbreviation of număr (“number”)"]},{"word":"NSDAP","pos":"name","definitions":["NSDAP"],"gender":"n","forms":{"alternative":"N.S.D.A.P."}},{"word":"nsh","pos":"phrase","definitions":["abbreviation of nu știu (“I don't know”)"]},{"word":"NT","pos":"name","definitions":["abbreviation of Neamț: a county of Romania"]},{"word":"nu","pos":"adv","definitions":["no","not"],"pronunciation":"/nu/","forms":{"alternative":"ну"}},{"word":"nu ai pentru ce","pos":"intj","definitions":["you're welcome"],"forms":{"alternative":"n-ai pentru ce"}},{"word":"nu aveți pentru ce","pos":"intj","definitions":["you're welcome (polite singular, familiar plural, or polite plural)"],"forms":{"alternative":"n-aveți pentru ce"}},{"word":"nu că","pos":"particle","definitions":["isn’t it that…?","it’s not that…"],"examples":[{"ro":"Nu că nu mă simțeam bine în oraș, dar tot aș fi vrut acasă.","en":"It’s not that I wasn’t feeling good out on the town, but I still would’ve rather gone home."}]},{"word":"nu da vrabia din mână pe cioara de pe gard","pos":"proverb","definitions":["a bird in the hand is worth two in the bush"]},{"word":"nu haina îl face pe om","pos":"proverb","definitions":["clothes don't make the man; you can't judge a book by its cover"]},{"word":"nu iese fum fără foc","pos":"proverb","definitions":["no smoke without fire"]},{"word":"nu înțeleg","pos":"phrase","definitions":["I don't understand"],"pronunciation":"/ˌnu ɨn.t͡seˈleɡ/","forms":{"alternative":"nu-nțeleg"}},{"word":"nu lăsa pe mâine ce poți face azi","pos":"proverb","definitions":["never put off until tomorrow what you can do today; there's no time like the present"]},{"word":"nu știu","pos":"phrase","definitions":["I don't know"],"pronunciation":"/ˈnu.ʃtiw/","forms":{"alternative-Internet":"nush"}},{"word":"nu tot ce zboară se mănâncă","pos":"proverb","definitions":["one should not believe everything one hears."]},{"word":"nu vinde blana ursului din pădure","pos":"proverb","definitions":["don't sell the skin till you have caught the bear"]},{"word":"nu-i","pos":"contraction","definitions":["contraction of nu + e, literally “is not”: isn't"],"pronunciation":"/ˈnuj/","examples":[{"ro":"Nu-i aici acum. Poți încerca să revii mai târziu.","en":"He isn't here right now. You can try to come back later."}]},{"word":"nu-i dracul chiar atât de negru","pos":"phrase","definitions":["the devil is not so black as he is painted, things aren't as bad as they seem"]},{"word":"nu-i nimic","pos":"phrase","definitions":["no problem, no worries, don't worry (about it)"],"pronunciation":"/ˌnuj niˈmik/"},{"word":"nu-l","pos":"contraction","definitions":["contraction of nu + îl"],"pronunciation":"/nul/"},{"word":"nu-mă-uita","pos":"noun","definitions":["forget-me-not (plant)"]},{"word":"nu-s","pos":"contraction","definitions":["Contraction of nu and îs."],"pronunciation":"[nus]","examples":[{"ro":"(Eu) nu-s acasă.","en":"I'm not home."},{"ro":"(Ei) nu-s cu mine.","en":"They aren't with me."}]},{"word":"nu-și","pos":"contraction","definitions":["contraction of nu + își"],"pronunciation":"/nuʃʲ/"},{"word":"nuanța","pos":"verb","definitions":["to tone down"],"forms":{"canonical":"a nuanța 1st conjugation","present-singular-third-person":"nuanțează","participle-past":"nuanțat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a nuanța","gerund":"nuanțând","first-person-indicative-present-singular":"nuanțez","indicative-present-second-person-singular":"nuanțezi","indicative-present-singular-third-person":"nuanțează","first-person-indicative-plural-present":"nuanțăm","indicative-plural-present-second-person":"nuanțați","indicative-plural-present-third-person":"nuanțează","first-person-imperfect-indicative-singular":"nuanțam","imperfect-indicative-second-person-singular":"nuanțai","imperfect-indicative-singular-third-person":"nuanța","first-person-imperfect-indicative-plural":"nuanțam","imperfect-indicative-plural-second-person":"nuanțați","imperfect-indicative-plural-third-person":"nuanțau","first-person-indicative-perfect-singular":"nuanțai","indicative-perfect-second-person-singular":"nuanțași","indicative-perfect-singular-third-person":"nuanță","first-person-indicative-perfect-plural":"nuanțarăm","indicative-perfect-plural-second-person":"nuanțarăți","indicative-perfect-plural-third-person":"nuanțară","first-person-indicative-pluperfect-singular":"nuanțasem","indicative-pluperfect-second-person-singular":"nuanțaseși","indicative-pluperfect-singular-third-person":"nuanțase","first-person-indicative-pluperfect-plural":"nuanțaserăm","indicative-pluperfect-plural-second-person":"nuanțaserăți","indicative-pluperfect-plural-third-person":"nuanțaseră","first-person-present-singular-subjunctive":"să nuanțez","present-second-person-singular-subjunctive":"să nuanțezi","present-singular-subjunctive-third-person":"să nuanțeze","first-person-plural-present-subjunctive":"să nuanțăm","plural-present-second-person-subjunctive":"să nuanțați","plural-present-subjunctive-third-person":"să nuanțeze","imperative-second-person-singular":"nuanțează","imperative-plural-second-person":"nuanțați","imperative-negative-second-person-singular":"nu nuanța","imperative-negative-plural-second-person":"nu nuanțați"}},{"word":"nuanță","pos":"noun","definitions":["nuance, shade"],"forms":{"plural":"nuanțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nuanță","accusative-definite-nominative-singular":"nuanța","accusative-indefinite-nominative-plural":"nuanțe","accusative-definite-nominative-plural":"nuanțele","dative-genitive-indefinite-singular":"nuanțe","dative-definite-genitive-singular":"nuanței","dative-genitive-indefinite-plural":"nuanțe","dative-definite-genitive-plural":"nuanțelor","singular-vocative":"nuanță","plural-vocative":"nuanțelor"}},{"word":"nuanțare","pos":"noun","definitions":["adding nuance","tinting"],"forms":{"plural":"nuanțări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nuanțare","accusative-definite-nominative-singular":"nuanțarea","accusative-indefinite-nominative-plural":"nuanțări","accusative-definite-nominative-plural":"nuanțările","dative-genitive-indefinite-singular":"nuanțări","dative-definite-genitive-singular":"nuanțării","dative-genitive-indefinite-plural":"nuanțări","dative-definite-genitive-plural":"nuanțărilor","singular-vocative":"nuanțare","plural-vocative":"nuanțărilor"}},{"word":"nuanțat","pos":"adj","definitions":["nuanced","shaded"],"forms":{"feminine-singular":"nuanțată","masculine-plural":"nuanțați","feminine-neuter-plural":"nuanțate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nuanțat","error-unrecognized-form-feminine-indefinite-singular":"nuanțată","error-unrecognized-form-indefinite-masculine-plural":"nuanțați","error-unrecognized-form-feminine-indefinite-neuter-plural":"nuanțate","definite-error-unrecognized-form-masculine-neuter-singular":"nuanțatul","definite-error-unrecognized-form-feminine-singular":"nuanțata","definite-error-unrecognized-form-masculine-plural":"nuanțații","definite-error-unrecognized-form-feminine-neuter-plural":"nuanțatele"}},{"word":"nubil","pos":"adj","definitions":["nubile"],"forms":{"feminine-singular":"nubilă","masculine-plural":"nubili","feminine-neuter-plural":"nubile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nubil","error-unrecognized-form-feminine-indefinite-singular":"nubilă","error-unrecognized-form-indefinite-masculine-plural":"nubili","error-unrecognized-form-feminine-indefinite-neuter-plural":"nubile","definite-error-unrecognized-form-masculine-neuter-singular":"nubilul","definite-error-unrecognized-form-feminine-singular":"nubila","definite-error-unrecognized-form-masculine-plural":"nubilii","definite-error-unrecognized-form-feminine-neuter-plural":"nubilele"}},{"word":"nubilitate","pos":"noun","definitions":["nobility"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nubilitate","accusative-definite-nominative-singular":"nubilitatea","accusative-indefinite-nominative-plural":"nubilități","accusative-definite-nominative-plural":"nubilitățile","dative-genitive-indefinite-singular":"nubilități","dative-definite-genitive-singular":"nubilității","dative-genitive-indefinite-plural":"nubilități","dative-definite-genitive-plural":"nubilităților","singular-vocative":"nubilitate","plural-vocative":"nubilităților"}},{"word":"nubuc","pos":"noun","definitions":["alternative form of năbuc"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nubuc","accusative-definite-nominative":"nubucul","dative-genitive-indefinite":"nubuc","dative-definite-genitive":"nubucului","vocative":"nubucule"}},{"word":"nuc","pos":"noun","definitions":["walnut (tree)"],"pronunciation":"/nuk/","forms":{"plural":"nuci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nuc","accusative-definite-nominative-singular":"nucul","accusative-indefinite-nominative-plural":"nuci","accusative-definite-nominative-plural":"nucii","dative-genitive-indefinite-singular":"nuc","dative-definite-genitive-singular":"nucului","dative-genitive-indefinite-plural":"nuci","dative-definite-genitive-plural":"nucilor","singular-vocative":"nucule","plural-vocative":"nucilor"}},{"word":"nuc pecan","pos":"noun","definitions":["pecan tree (Carya illinoinensis)"],"forms":{"plural":"nuci pecan"}},{"word":"Nucă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nucă"}},{"word":"nucă","pos":"noun","definitions":["walnut","nut"],"pronunciation":"/ˈnukə/","forms":{"plural":"nuci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"nucă","accusative-definite-nominative-singular":"nuca","accusative-indefinite-nominative-plural":"nuci","accusative-definite-nominative-plural":"nucile","dative-genitive-indefinite-singular":"nuci","dative-definite-genitive-singular":"nucii","dative-genitive-indefinite-plural":"nuci","dative-definite-genitive-plural":"nucilor","singular-vocative":"nucă","plural-vocative":"nucilor"}},{"word":"nucă braziliană","pos":"noun","definitions":["brazil nut (fruit)"],"forms":{"plural":"nuci braziliene"}},{"word":"nucă de cocos","pos":"noun","definitions":["coconut (fruit of coco palm)"],"pronunciation":"/ˈnu.kə de ˈko.kos/","forms":{"plural":"nuci de cocos"}},{"word":"nucă pecan","pos":"noun","definitions":["pecan (nut)"],"forms":{"plural":"nuci pecan"}},{"word":"nucă vomică","pos":"noun","definitions":["nux vomica"]},{"word":"Nucăreni","pos":"name","definitions":["a village in Nucăreni, Telenești Raion, Moldova","a commune of Telenești Raion, Moldova"],"gender":"m"},{"word":"nucărie","pos":"noun","definitions":["many walnuts"],"forms":{"plural":"nucării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nucărie","accusative-definite-nominative-singular":"nucăria","accusative-indefinite-nominative-plural":"nucării","accusative-definite-nominative-plural":"nucăriile","dative-genitive-indefinite-singular":"nucării","dative-definite-genitive-singular":"nucăriei","dative-genitive-indefinite-plural":"nucării","dative-definite-genitive-plural":"nucăriilor","singular-vocative":"nucărie","plural-vocative":"nucăriilor"}},{"word":"nucariște","pos":"noun","definitions":["walnut grove"],"forms":{"plural":"nucariști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nucariște","accusative-definite-nominative-singular":"nucariștea","accusative-indefinite-nominative-plural":"nucariști","accusative-definite-nominative-plural":"nucariștile","dative-genitive-indefinite-singular":"nucariști","dative-definite-genitive-singular":"nucariștii","dative-genitive-indefinite-plural":"nucariști","dative-definite-genitive-plural":"nucariștilor","singular-vocative":"nucariște","plural-vocative":"nucariștilor"}},{"word":"nucelă","pos":"noun","definitions":["nucellus"],"forms":{"plural":"nucele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nucelă","accusative-definite-nominative-singular":"nucela","accusative-indefinite-nominative-plural":"nucele","accusative-definite-nominative-plural":"nucelele","dative-genitive-indefinite-singular":"nucele","dative-definite-genitive-singular":"nucelei","dative-genitive-indefinite-plural":"nucele","dative-definite-genitive-plural":"nucelelor","singular-vocative":"nucelă","plural-vocative":"nucelelor"}},{"word":"Nucet","pos":"name","definitions":["a city in Bihor County, Romania","a commune of Dâmbovița County, Romania","a village in Nucet, Dâmbovița County, Romania","a village in Chiojdeanca, Prahova County, Romania","a village in Gornet, Prahova County, Romania"],"gender":"m"},{"word":"nucet","pos":"noun","definitions":["walnut orchard or grove"],"forms":{"plural":"nuceturi"}},{"word":"Nucetu","pos":"name","definitions":["a village in Lupșanu, Călărași County, Romania","a village in Negomir, Gorj County, Romania"],"gender":"m"},{"word":"nucetul","pos":"noun","definitions":["definite nominative/accusative singular of nucet"]},{"word":"nuchiță","pos":"noun","definitions":["diminutive of nucă"],"forms":{"plural":"nuchițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nuchiță","accusative-definite-nominative-singular":"nuchița","accusative-indefinite-nominative-plural":"nuchițe","accusative-definite-nominative-plural":"nuchițele","dative-genitive-indefinite-singular":"nuchițe","dative-definite-genitive-singular":"nuchiței","dative-genitive-indefinite-plural":"nuchițe","dative-definite-genitive-plural":"nuchițelor","singular-vocative":"nuchiță","plural-vocative":"nuchițelor"}},{"word":"Nuci","pos":"name","definitions":["a village in Vasilați, Călărași County, Romania","a commune of Ilfov County, Romania","a village in Nuci, Ilfov County, Romania"],"gender":"m"},{"word":"nuci","pos":"noun","definitions":["plural of nuc (“walnut tree”)"],"pronunciation":"/nut͡ʃʲ/","gender":"m-p"},{"word":"nuci","pos":"noun","definitions":["plural of nucă (“walnut”)"],"pronunciation":"/nut͡ʃʲ/","gender":"f-p"},{"word":"nucifer","pos":"adj","definitions":["nuciferous"],"forms":{"feminine-singular":"nuciferă","masculine-plural":"nuciferi","feminine-neuter-plural":"nucifere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nucifer","error-unrecognized-form-feminine-indefinite-singular":"nuciferă","error-unrecognized-form-indefinite-masculine-plural":"nuciferi","error-unrecognized-form-feminine-indefinite-neuter-plural":"nucifere","definite-error-unrecognized-form-masculine-neuter-singular":"nuciferul","definite-error-unrecognized-form-feminine-singular":"nucifera","definite-error-unrecognized-form-masculine-plural":"nuciferii","definite-error-unrecognized-form-feminine-neuter-plural":"nuciferele"}},{"word":"nuciform","pos":"adj","definitions":["nuciform"],"forms":{"feminine-singular":"nuciformă","masculine-plural":"nuciformi","feminine-neuter-plural":"nuciforme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nuciform","error-unrecognized-form-feminine-indefinite-singular":"nuciformă","error-unrecognized-form-indefinite-masculine-plural":"nuciformi","error-unrecognized-form-feminine-indefinite-neuter-plural":"nuciforme","definite-error-unrecognized-form-masculine-neuter-singular":"nuciformul","definite-error-unrecognized-form-feminine-singular":"nuciforma","definite-error-unrecognized-form-masculine-plural":"nuciformii","definite-error-unrecognized-form-feminine-neuter-plural":"nuciformele"}},{"word":"nucilor","pos":"noun","definitions":["definite genitive/dative plural of nuc"]},{"word":"nucime","pos":"noun","definitions":["walnut orchard or grove"],"forms":{"plural":"nucimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nucime","accusative-definite-nominative-singular":"nucimea","accusative-indefinite-nominative-plural":"nucimi","accusative-definite-nominative-plural":"nucimile","dative-genitive-indefinite-singular":"nucimi","dative-definite-genitive-singular":"nucimii","dative-genitive-indefinite-plural":"nucimi","dative-definite-genitive-plural":"nucimilor","singular-vocative":"nucime","plural-vocative":"nucimilor"}},{"word":"nuciște","pos":"noun","definitions":["walnut grove"],"forms":{"plural":"nuciști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nuciște","accusative-definite-nominative-singular":"nuciștea","accusative-indefinite-nominative-plural":"nuciști","accusative-definite-nominative-plural":"nuciștile","dative-genitive-indefinite-singular":"nuciști","dative-definite-genitive-singular":"nuciștii","dative-genitive-indefinite-plural":"nuciști","dative-definite-genitive-plural":"nuciștilor","singular-vocative":"nuciște","plural-vocative":"nuciștilor"}},{"word":"nuclear","pos":"adj","definitions":["nuclear"],"forms":{"feminine-singular":"nucleară","masculine-plural":"nucleari","feminine-neuter-plural":"nucleare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nuclear","error-unrecognized-form-feminine-indefinite-singular":"nucleară","error-unrecognized-form-indefinite-masculine-plural":"nucleari","error-unrecognized-form-feminine-indefinite-neuter-plural":"nucleare","definite-error-unrecognized-form-masculine-neuter-singular":"nuclearul","definite-error-unrecognized-form-feminine-singular":"nucleara","definite-error-unrecognized-form-masculine-plural":"nuclearii","definite-error-unrecognized-form-feminine-neuter-plural":"nuclearele"}},{"word":"nucleară","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of nuclear"]},{"word":"nucleariza","pos":"verb","definitions":["to nuclearize"],"forms":{"canonical":"a nucleariza 1st conjugation","present-singular-third-person":"nuclearizează","participle-past":"nuclearizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a nucleariza","gerund":"nuclearizând","first-person-indicative-present-singular":"nuclearizez","indicative-present-second-person-singular":"nuclearizezi","indicative-present-singular-third-person":"nuclearizează","first-person-indicative-plural-present":"nuclearizăm","indicative-plural-present-second-person":"nuclearizați","indicative-plural-present-third-person":"nuclearizează","first-person-imperfect-indicative-singular":"nuclearizam","imperfect-indicative-second-person-singular":"nuclearizai","imperfect-indicative-singular-third-person":"nucleariza","first-person-imperfect-indicative-plural":"nuclearizam","imperfect-indicative-plural-second-person":"nuclearizați","imperfect-indicative-plural-third-person":"nuclearizau","first-person-indicative-perfect-singular":"nuclearizai","indicative-perfect-second-person-singular":"nuclearizași","indicative-perfect-singular-third-person":"nucleariză","first-person-indicative-perfect-plural":"nuclearizarăm","indicative-perfect-plural-second-person":"nuclearizarăți","indicative-perfect-plural-third-person":"nuclearizară","first-person-indicative-pluperfect-singular":"nuclearizasem","indicative-pluperfect-second-person-singular":"nuclearizaseși","indicative-pluperfect-singular-third-person":"nuclearizase","first-person-indicative-pluperfect-plural":"nuclearizaserăm","indicative-pluperfect-plural-second-person":"nuclearizaserăți","indicative-pluperfect-plural-third-person":"nuclearizaseră","first-person-present-singular-subjunctive":"să nuclearizez","present-second-person-singular-subjunctive":"să nuclearizezi","present-singular-subjunctive-third-person":"să nuclearizeze","first-person-plural-present-subjunctive":"să nuclearizăm","plural-present-second-person-subjunctive":"să nuclearizați","plural-present-subjunctive-third-person":"să nuclearizeze","imperative-second-person-singular":"nuclearizează","imperative-plural-second-person":"nuclearizați","imperative-negative-second-person-singular":"nu nucleariza","imperative-negative-plural-second-person":"nu nuclearizați"}},{"word":"nuclearizare","pos":"noun","definitions":["nuclearization"],"forms":{"plural":"nuclearizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nuclearizare","accusative-definite-nominative-singular":"nuclearizarea","accusative-indefinite-nominative-plural":"nuclearizări","accusative-definite-nominative-plural":"nuclearizările","dative-genitive-indefinite-singular":"nuclearizări","dative-definite-genitive-singular":"nuclearizării","dative-genitive-indefinite-plural":"nuclearizări","dative-definite-genitive-plural":"nuclearizărilor","singular-vocative":"nuclearizare","plural-vocative":"nuclearizărilor"}},{"word":"nucleație","pos":"noun","definitions":["nucleation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"nucleație","accusative-definite-nominative":"nucleația","dative-genitive-indefinite":"nucleații","dative-definite-genitive":"nucleației","vocative":"nucleație"}},{"word":"nuclează","pos":"noun","definitions":["nuclease"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"nuclează","accusative-definite-nominative":"nucleaza","dative-genitive-indefinite":"nucleaze","dative-definite-genitive":"nucleazei","vocative":"nuclează"}},{"word":"nuclee","pos":"noun","definitions":["plural of nucleu"]},{"word":"nucleic","pos":"adj","definitions":["nucleic"],"forms":{"feminine-singular":"nucleică","masculine-plural":"nucleici","feminine-neuter-plural":"nucleice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nucleic","error-unrecognized-form-feminine-indefinite-singular":"nucleică","error-unrecognized-form-indefinite-masculine-plural":"nucleici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nucleice","definite-error-unrecognized-form-masculine-neuter-singular":"nucleicul","definite-error-unrecognized-form-feminine-singular":"nucleica","definite-error-unrecognized-form-masculine-plural":"nucleicii","definite-error-unrecognized-form-feminine-neuter-plural":"nucleicele"}},{"word":"nucleină","pos":"noun","definitions":["nuclein"],"forms":{"plural":"nucleine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nucleină","accusative-definite-nominative-singular":"nucleina","accusative-indefinite-nominative-plural":"nucleine","accusative-definite-nominative-plural":"nucleinele","dative-genitive-indefinite-singular":"nucleine","dative-definite-genitive-singular":"nucleinei","dative-genitive-indefinite-plural":"nucleine","dative-definite-genitive-plural":"nucleinelor","singular-vocative":"nucleină","plural-vocative":"nucleinelor"}},{"word":"nucleoid","pos":"noun","definitions":["nucleoid"],"forms":{"plural":"nucleoizi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nucleoid","accusative-definite-nominative-singular":"nucleoidul","accusative-indefinite-nominative-plural":"nucleoizi","accusative-definite-nominative-plural":"nucleoizile","dative-genitive-indefinite-singular":"nucleoid","dative-definite-genitive-singular":"nucleoidului","dative-genitive-indefinite-plural":"nucleoizi","dative-definite-genitive-plural":"nucleoizilor","singular-vocative":"nucleoidule","plural-vocative":"nucleoizilor"}},{"word":"nucleol","pos":"noun","definitions":["nucleolus"],"forms":{"plural":"nucleoli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nucleol","accusative-definite-nominative-singular":"nucleolul","accusative-indefinite-nominative-plural":"nucleoli","accusative-definite-nominative-plural":"nucleolii","dative-genitive-indefinite-singular":"nucleol","dative-definite-genitive-singular":"nucleolului","dative-genitive-indefinite-plural":"nucleoli","dative-definite-genitive-plural":"nucleolilor","singular-vocative":"nucleolule","plural-vocative":"nucleolilor"}},{"word":"nucleon","pos":"noun","definitions":["nucleon"],"forms":{"plural":"nucleoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nucleon","accusative-definite-nominative-singular":"nucleonul","accusative-indefinite-nominative-plural":"nucleoni","accusative-definite-nominative-plural":"nucleonii","dative-genitive-indefinite-singular":"nucleon","dative-definite-genitive-singular":"nucleonului","dative-genitive-indefinite-plural":"nucleoni","dative-definite-genitive-plural":"nucleonilor","singular-vocative":"nucleonule","plural-vocative":"nucleonilor"}},{"word":"nucleoni","pos":"noun","definitions":["plural of nucleon"]},{"word":"nucleonic","pos":"adj","definitions":["nucleonic"],"forms":{"feminine-singular":"nucleonică","masculine-plural":"nucleonici","feminine-neuter-plural":"nucleonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nucleonic","error-unrecognized-form-feminine-indefinite-singular":"nucleonică","error-unrecognized-form-indefinite-masculine-plural":"nucleonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nucleonice","definite-error-unrecognized-form-masculine-neuter-singular":"nucleonicul","definite-error-unrecognized-form-feminine-singular":"nucleonica","definite-error-unrecognized-form-masculine-plural":"nucleonicii","definite-error-unrecognized-form-feminine-neuter-plural":"nucleonicele"}},{"word":"nucleonică","pos":"noun","definitions":["subnucleonic"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nucleonică","accusative-definite-nominative-singular":"nucleonica","accusative-indefinite-nominative-plural":"nucleonice","accusative-definite-nominative-plural":"nucleonicele","dative-genitive-indefinite-singular":"nucleonice","dative-definite-genitive-singular":"nucleonicei","dative-genitive-indefinite-plural":"nucleonice","dative-definite-genitive-plural":"nucleonicelor","singular-vocative":"nucleonică","plural-vocative":"nucleonicelor"}},{"word":"nucleoplasmă","pos":"noun","definitions":["nucleoplasm"],"forms":{"plural":"nucleoplasme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nucleoplasmă","accusative-definite-nominative-singular":"nucleoplasma","accusative-indefinite-nominative-plural":"nucleoplasme","accusative-definite-nominative-plural":"nucleoplasmele","dative-genitive-indefinite-singular":"nucleoplasme","dative-definite-genitive-singular":"nucleoplasmei","dative-genitive-indefinite-plural":"nucleoplasme","dative-definite-genitive-plural":"nucleoplasmelor","singular-vocative":"nucleoplasmă","plural-vocative":"nucleoplasmelor"}},{"word":"nucleoproteidă","pos":"noun","definitions":["nucleoproteide"],"forms":{"plural":"nucleoproteide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nucleoproteidă","accusative-definite-nominative-singular":"nucleoproteida","accusative-indefinite-nominative-plural":"nucleoproteide","accusative-definite-nominative-plural":"nucleoproteidele","dative-genitive-indefinite-singular":"nucleoproteide","dative-definite-genitive-singular":"nucleoproteidei","dative-genitive-indefinite-plural":"nucleoproteide","dative-definite-genitive-plural":"nucleoproteidelor","singular-vocative":"nucleoproteidă","plural-vocative":"nucleoproteidelor"}},{"word":"nucleoproteină","pos":"noun","definitions":["nucleoprotein"],"forms":{"plural":"nucleoproteine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nucleoproteină","accusative-definite-nominative-singular":"nucleoproteina","accusative-indefinite-nominative-plural":"nucleoproteine","accusative-definite-nominative-plural":"nucleoproteinele","dative-genitive-indefinite-singular":"nucleoproteine","dative-definite-genitive-singular":"nucleoproteinei","dative-genitive-indefinite-plural":"nucleoproteine","dative-definite-genitive-plural":"nucleoproteinelor","singular-vocative":"nucleoproteină","plural-vocative":"nucleoproteinelor"}},{"word":"nucleosinteză","pos":"noun","definitions":["nucleosynthesis"],"forms":{"plural":"nucleosinteze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nucleosinteză","accusative-definite-nominative-singular":"nucleosinteza","accusative-indefinite-nominative-plural":"nucleosinteze","accusative-definite-nominative-plural":"nucleosintezele","dative-genitive-indefinite-singular":"nucleosinteze","dative-definite-genitive-singular":"nucleosintezei","dative-genitive-indefinite-plural":"nucleosinteze","dative-definite-genitive-plural":"nucleosintezelor","singular-vocative":"nucleosinteză","plural-vocative":"nucleosintezelor"}},{"word":"nucleotidă","pos":"noun","definitions":["nucleotide"],"forms":{"plural":"nucleotide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nucleotidă","accusative-definite-nominative-singular":"nucleotida","accusative-indefinite-nominative-plural":"nucleotide","accusative-definite-nominative-plural":"nucleotidele","dative-genitive-indefinite-singular":"nucleotide","dative-definite-genitive-singular":"nucleotidei","dative-genitive-indefinite-plural":"nucleotide","dative-definite-genitive-plural":"nucleotidelor","singular-vocative":"nucleotidă","plural-vocative":"nucleotidelor"}},{"word":"nucleu","pos":"noun","definitions":["nucleus","core, kernel"],"forms":{"plural":"nuclee","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nucleu","accusative-definite-nominative-singular":"nucleul","accusative-indefinite-nominative-plural":"nuclee","accusative-definite-nominative-plural":"nucleele","dative-genitive-indefinite-singular":"nucleu","dative-definite-genitive-singular":"nucleului","dative-genitive-indefinite-plural":"nuclee","dative-definite-genitive-plural":"nucleelor","singular-vocative":"nucleule","plural-vocative":"nucleelor"}},{"word":"nucleu atomic","pos":"noun","definitions":["atomic nucleus"],"forms":{"plural":"nuclee atomice"}},{"word":"nucleul","pos":"noun","definitions":["nominative/accusative definite singular articulation of nucleu"]},{"word":"nuclid","pos":"noun","definitions":["nuclide"],"forms":{"plural":"nuclizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nuclid","accusative-definite-nominative-singular":"nuclidul","accusative-indefinite-nominative-plural":"nuclizi","accusative-definite-nominative-plural":"nuclizii","dative-genitive-indefinite-singular":"nuclid","dative-definite-genitive-singular":"nuclidului","dative-genitive-indefinite-plural":"nuclizi","dative-definite-genitive-plural":"nuclizilor","singular-vocative":"nuclidule","plural-vocative":"nuclizilor"}},{"word":"Nucșoara","pos":"name","definitions":["a commune of Argeș County, Romania","a village in Nucșoara, Argeș County, Romania","a village in Sălașu de Sus, Hunedoara County, Romania"],"gender":"f"},{"word":"nucșoara","pos":"noun","definitions":["definite nominative/accusative singular of nucșoară"]},{"word":"nucșoară","pos":"noun","definitions":["diminutive of nucă","nutmeg (seed)"],"pronunciation":"/nukˈʃo̯a.rə/","forms":{"plural":"nucșoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nucșoară","accusative-definite-nominative-singular":"nucșoara","accusative-indefinite-nominative-plural":"nucșoare","accusative-definite-nominative-plural":"nucșoarele","dative-genitive-indefinite-singular":"nucșoare","dative-definite-genitive-singular":"nucșoarei","dative-genitive-indefinite-plural":"nucșoare","dative-definite-genitive-plural":"nucșoarelor","singular-vocative":"nucșoară","plural-vocative":"nucșoarelor"}},{"word":"Nucșoara de Jos","pos":"name","definitions":["a village in Posești, Prahova County, Romania"],"gender":"f"},{"word":"Nucșoara de Sus","pos":"name","definitions":["a village in Posești, Prahova County, Romania"],"gender":"f"},{"word":"nucșor","pos":"noun","definitions":["nutmeg"],"forms":{"plural":"nucșori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nucșor","accusative-definite-nominative-singular":"nucșorul","accusative-indefinite-nominative-plural":"nucșori","accusative-definite-nominative-plural":"nucșorii","dative-genitive-indefinite-singular":"nucșor","dative-definite-genitive-singular":"nucșorului","dative-genitive-indefinite-plural":"nucșori","dative-definite-genitive-plural":"nucșorilor","singular-vocative":"nucșorule","plural-vocative":"nucșorilor"}},{"word":"Nucșoreanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Nucșoreanu"}},{"word":"Nucu","pos":"name","definitions":["a village in Bozioru, Buzău County, Romania"],"gender":"m"},{"word":"nucul","pos":"noun","definitions":["definite nominative/accusative singular of nuc"]},{"word":"nuculă","pos":"noun","definitions":["nucule"],"forms":{"plural":"nucule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nuculă","accusative-definite-nominative-singular":"nucula","accusative-indefinite-nominative-plural":"nucule","accusative-definite-nominative-plural":"nuculele","dative-genitive-indefinite-singular":"nucule","dative-definite-genitive-singular":"nuculei","dative-genitive-indefinite-plural":"nucule","dative-definite-genitive-plural":"nuculelor","singular-vocative":"nuculă","plural-vocative":"nuculelor"}},{"word":"nuculeț","pos":"noun","definitions":["diminutive of nuc; small walnut tree"],"forms":{"plural":"nuculeți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nuculeț","accusative-definite-nominative-singular":"nuculețul","accusative-indefinite-nominative-plural":"nuculeți","accusative-definite-nominative-plural":"nuculeții","dative-genitive-indefinite-singular":"nuculeț","dative-definite-genitive-singular":"nuculețului","dative-genitive-indefinite-plural":"nuculeți","dative-definite-genitive-plural":"nuculeților","singular-vocative":"nuculețule","plural-vocative":"nuculeților"}},{"word":"nuculiță","pos":"noun","definitions":["diminutive of nucă"],"forms":{"plural":"nuculițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nuculiță","accusative-definite-nominative-singular":"nuculița","accusative-indefinite-nominative-plural":"nuculițe","accusative-definite-nominative-plural":"nuculițele","dative-genitive-indefinite-singular":"nuculițe","dative-definite-genitive-singular":"nuculiței","dative-genitive-indefinite-plural":"nuculițe","dative-definite-genitive-plural":"nuculițelor","singular-vocative":"nuculiță","plural-vocative":"nuculițelor"}},{"word":"nucului","pos":"noun","definitions":["definite genitive/dative singular of nuc"]},{"word":"nucușoară","pos":"noun","definitions":["alternative form of nucșoară"]},{"word":"nucuț","pos":"noun","definitions":["diminutive of nuc; small walnut tree"],"forms":{"plural":"nucuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nucuț","accusative-definite-nominative-singular":"nucuțul","accusative-indefinite-nominative-plural":"nucuți","accusative-definite-nominative-plural":"nucuții","dative-genitive-indefinite-singular":"nucuț","dative-definite-genitive-singular":"nucuțului","dative-genitive-indefinite-plural":"nucuți","dative-definite-genitive-plural":"nucuților","singular-vocative":"nucuțule","plural-vocative":"nucuților"}},{"word":"nucuță","pos":"noun","definitions":["diminutive of nucă"],"forms":{"plural":"nucuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nucuță","accusative-definite-nominative-singular":"nucuța","accusative-indefinite-nominative-plural":"nucuțe","accusative-definite-nominative-plural":"nucuțele","dative-genitive-indefinite-singular":"nucuțe","dative-definite-genitive-singular":"nucuței","dative-genitive-indefinite-plural":"nucuțe","dative-definite-genitive-plural":"nucuțelor","singular-vocative":"nucuță","plural-vocative":"nucuțelor"}},{"word":"nud","pos":"adj","definitions":["nude, naked"],"pronunciation":"[nud]","forms":{"feminine-singular":"nudă","masculine-plural":"nuzi","feminine-neuter-plural":"nude","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"nud","error-unrecognized-form-feminine-indefinite-singular":"nudă","error-unrecognized-form-indefinite-masculine-plural":"nuzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"nude","definite-error-unrecognized-form-masculine-neuter-singular":"nudul","definite-error-unrecognized-form-feminine-singular":"nuda","definite-error-unrecognized-form-masculine-plural":"nuzii","definite-error-unrecognized-form-feminine-neuter-plural":"nudele"}},{"word":"nuda","pos":"adj","definitions":["definite feminine singular of nud"],"pronunciation":"[ˈnu.da]"},{"word":"nude","pos":"adj","definitions":["feminine/neuter plural of nud"],"pronunciation":"[ˈnu.de]"},{"word":"nudism","pos":"noun","definitions":["nudism"],"pronunciation":"/nuˈdism/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nudism","accusative-definite-nominative":"nudismul","dative-genitive-indefinite":"nudism","dative-definite-genitive":"nudismului","vocative":"nudismule"}},{"word":"nudist","pos":"adj","definitions":["nudist"],"pronunciation":"/nuˈdist/","forms":{"feminine-singular":"nudistă","masculine-plural":"nudiști","feminine-neuter-plural":"nudiste","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"nudist","error-unrecognized-form-feminine-indefinite-singular":"nudistă","error-unrecognized-form-indefinite-masculine-plural":"nudiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"nudiste","definite-error-unrecognized-form-masculine-neuter-singular":"nudistul","definite-error-unrecognized-form-feminine-singular":"nudista","definite-error-unrecognized-form-masculine-plural":"nudiștii","definite-error-unrecognized-form-feminine-neuter-plural":"nudistele"}},{"word":"nudist","pos":"noun","definitions":["nudist"],"pronunciation":"/nuˈdist/","forms":{"plural":"nudiști","feminine":"equivalent nudistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nudist","accusative-definite-nominative-singular":"nudistul","accusative-indefinite-nominative-plural":"nudiști","accusative-definite-nominative-plural":"nudiștii","dative-genitive-indefinite-singular":"nudist","dative-definite-genitive-singular":"nudistului","dative-genitive-indefinite-plural":"nudiști","dative-definite-genitive-plural":"nudiștilor","singular-vocative":"nudistule","plural-vocative":"nudiștilor"}}];
@@ -0,0 +1 @@
+export default [{"word":"nudistă","pos":"noun","definitions":["female equivalent of nudist"],"forms":{"plural":"nudiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nudistă","accusative-definite-nominative-singular":"nudista","accusative-indefinite-nominative-plural":"nudiste","accusative-definite-nominative-plural":"nudistele","dative-genitive-indefinite-singular":"nudiste","dative-definite-genitive-singular":"nudistei","dative-genitive-indefinite-plural":"nudiste","dative-definite-genitive-plural":"nudistelor","singular-vocative":"nudistă","plural-vocative":"nudistelor"}},{"word":"nudiști","pos":"noun","definitions":["plural of nudist"],"gender":"m"},{"word":"nuditate","pos":"noun","definitions":["nudity"],"forms":{"plural":"nudități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nuditate","accusative-definite-nominative-singular":"nuditatea","accusative-indefinite-nominative-plural":"nudități","accusative-definite-nominative-plural":"nuditățile","dative-genitive-indefinite-singular":"nudități","dative-definite-genitive-singular":"nudității","dative-genitive-indefinite-plural":"nudități","dative-definite-genitive-plural":"nudităților","singular-vocative":"nuditate","plural-vocative":"nudităților"}},{"word":"nufăr","pos":"noun","definitions":["water lily (Any member of Nymphaeaceae)"],"pronunciation":"/ˈnu.fər/","forms":{"plural":"nuferi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nufăr","accusative-definite-nominative-singular":"nufărul","accusative-indefinite-nominative-plural":"nuferi","accusative-definite-nominative-plural":"nuferii","dative-genitive-indefinite-singular":"nufăr","dative-definite-genitive-singular":"nufărului","dative-genitive-indefinite-plural":"nuferi","dative-definite-genitive-plural":"nuferilor","singular-vocative":"nufărule","plural-vocative":"nuferilor"}},{"word":"nufăriș","pos":"noun","definitions":["place with many water lilies"],"forms":{"plural":"nufărișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nufăriș","accusative-definite-nominative-singular":"nufărișul","accusative-indefinite-nominative-plural":"nufărișuri","accusative-definite-nominative-plural":"nufărișurile","dative-genitive-indefinite-singular":"nufăriș","dative-definite-genitive-singular":"nufărișului","dative-genitive-indefinite-plural":"nufărișuri","dative-definite-genitive-plural":"nufărișurilor","singular-vocative":"nufărișule","plural-vocative":"nufărișurilor"}},{"word":"Nufăru","pos":"name","definitions":["a commune of Tulcea County, Romania","a village in Nufăru, Tulcea County, Romania"],"gender":"m"},{"word":"nufărul","pos":"noun","definitions":["definite nominative/accusative singular of nufăr"]},{"word":"nuferi","pos":"noun","definitions":["plural of nufăr"],"pronunciation":"/ˈnu.ferʲ/","gender":"m-p"},{"word":"nuga","pos":"noun","definitions":["nougat"],"pronunciation":"/ˈnu.ɡa/","forms":{"plural":"nugale","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"nuga","accusative-definite-nominative-singular":"nugaua","accusative-indefinite-nominative-plural":"nugale","accusative-definite-nominative-plural":"nugalele","dative-genitive-indefinite-singular":"nugale","dative-definite-genitive-singular":"nugalei","dative-genitive-indefinite-plural":"nugale","dative-definite-genitive-plural":"nugalelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"nuia","pos":"noun","definitions":["stick, rod, twig"],"pronunciation":"[nuˈja]","forms":{"plural":"nuiele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ia","accusative-indefinite-nominative-singular":"nuia","accusative-definite-nominative-singular":"nuiaua","accusative-indefinite-nominative-plural":"nuiele","accusative-definite-nominative-plural":"nuielele","dative-genitive-indefinite-singular":"nuiele","dative-definite-genitive-singular":"nuielei","dative-genitive-indefinite-plural":"nuiele","dative-definite-genitive-plural":"nuielelor","singular-vocative":"nuia","plural-vocative":"nuielelor"}},{"word":"nuielărie","pos":"noun","definitions":["young forest"],"forms":{"plural":"nuielării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nuielărie","accusative-definite-nominative-singular":"nuielăria","accusative-indefinite-nominative-plural":"nuielării","accusative-definite-nominative-plural":"nuielăriile","dative-genitive-indefinite-singular":"nuielării","dative-definite-genitive-singular":"nuielăriei","dative-genitive-indefinite-plural":"nuielării","dative-definite-genitive-plural":"nuielăriilor","singular-vocative":"nuielărie","plural-vocative":"nuielăriilor"}},{"word":"nuiele","pos":"noun","definitions":["plural of nuia"],"pronunciation":"/nuˈje.le/","gender":"f-p"},{"word":"nuieliș","pos":"noun","definitions":["young forest"],"forms":{"plural":"nuielișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nuieliș","accusative-definite-nominative-singular":"nuielișul","accusative-indefinite-nominative-plural":"nuielișuri","accusative-definite-nominative-plural":"nuielișurile","dative-genitive-indefinite-singular":"nuieliș","dative-definite-genitive-singular":"nuielișului","dative-genitive-indefinite-plural":"nuielișuri","dative-definite-genitive-plural":"nuielișurilor","singular-vocative":"nuielișule","plural-vocative":"nuielișurilor"}},{"word":"nuielușă","pos":"noun","definitions":["diminutive of nuia; small stick"],"forms":{"plural":"nuielușe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nuielușă","accusative-definite-nominative-singular":"nuielușa","accusative-indefinite-nominative-plural":"nuielușe","accusative-definite-nominative-plural":"nuielușele","dative-genitive-indefinite-singular":"nuielușe","dative-definite-genitive-singular":"nuielușei","dative-genitive-indefinite-plural":"nuielușe","dative-definite-genitive-plural":"nuielușelor","singular-vocative":"nuielușă","plural-vocative":"nuielușelor"}},{"word":"nuielușcă","pos":"noun","definitions":["diminutive of nuia"],"forms":{"plural":"nuieluște","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nuielușcă","accusative-definite-nominative-singular":"nuielușca","accusative-indefinite-nominative-plural":"nuieluște","accusative-definite-nominative-plural":"nuieluștele","dative-genitive-indefinite-singular":"nuieluște","dative-definite-genitive-singular":"nuieluștei","dative-genitive-indefinite-plural":"nuieluște","dative-definite-genitive-plural":"nuieluștelor","singular-vocative":"nuielușcă","plural-vocative":"nuieluștelor"}},{"word":"nuieluță","pos":"noun","definitions":["diminutive of nuia; small stick"],"forms":{"plural":"nuieluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nuieluță","accusative-definite-nominative-singular":"nuieluța","accusative-indefinite-nominative-plural":"nuieluțe","accusative-definite-nominative-plural":"nuieluțele","dative-genitive-indefinite-singular":"nuieluțe","dative-definite-genitive-singular":"nuieluței","dative-genitive-indefinite-plural":"nuieluțe","dative-definite-genitive-plural":"nuieluțelor","singular-vocative":"nuieluță","plural-vocative":"nuieluțelor"}},{"word":"nul","pos":"adj","definitions":["null, insignificant","worthless, incompetent (of people or actions)","null, zero","null, void (holding no legal power)"],"examples":[{"ro":"Este nul la matematica.","en":"He/she is a zilch at mathematics."}],"forms":{"feminine-singular":"nulă","masculine-plural":"nuli","feminine-neuter-plural":"nule","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nul","error-unrecognized-form-feminine-indefinite-singular":"nulă","error-unrecognized-form-indefinite-masculine-plural":"nuli","error-unrecognized-form-feminine-indefinite-neuter-plural":"nule","definite-error-unrecognized-form-masculine-neuter-singular":"nulul","definite-error-unrecognized-form-feminine-singular":"nula","definite-error-unrecognized-form-masculine-plural":"nulii","definite-error-unrecognized-form-feminine-neuter-plural":"nulele"}},{"word":"nul și neavenit","pos":"adj","definitions":["null and void"],"forms":{"feminine-singular":"nulă și neavenită","masculine-plural":"nuli și neaveniți","feminine-neuter-plural":"nule și neavenite"}},{"word":"nulifica","pos":"verb","definitions":["to nullify"],"forms":{"canonical":"a nulifica 1st conjugation","present-singular-third-person":"nulifică","participle-past":"nulificat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a nulifica","gerund":"nulificând","first-person-indicative-present-singular":"nulific","indicative-present-second-person-singular":"nulifici","indicative-present-singular-third-person":"nulifică","first-person-indicative-plural-present":"nulificăm","indicative-plural-present-second-person":"nulificați","indicative-plural-present-third-person":"nulifică","first-person-imperfect-indicative-singular":"nulificam","imperfect-indicative-second-person-singular":"nulificai","imperfect-indicative-singular-third-person":"nulifica","first-person-imperfect-indicative-plural":"nulificam","imperfect-indicative-plural-second-person":"nulificați","imperfect-indicative-plural-third-person":"nulificau","first-person-indicative-perfect-singular":"nulificai","indicative-perfect-second-person-singular":"nulificași","indicative-perfect-singular-third-person":"nulifică","first-person-indicative-perfect-plural":"nulificarăm","indicative-perfect-plural-second-person":"nulificarăți","indicative-perfect-plural-third-person":"nulificară","first-person-indicative-pluperfect-singular":"nulificasem","indicative-pluperfect-second-person-singular":"nulificaseși","indicative-pluperfect-singular-third-person":"nulificase","first-person-indicative-pluperfect-plural":"nulificaserăm","indicative-pluperfect-plural-second-person":"nulificaserăți","indicative-pluperfect-plural-third-person":"nulificaseră","first-person-present-singular-subjunctive":"să nulific","present-second-person-singular-subjunctive":"să nulifici","present-singular-subjunctive-third-person":"să nulifice","first-person-plural-present-subjunctive":"să nulificăm","plural-present-second-person-subjunctive":"să nulificați","plural-present-subjunctive-third-person":"să nulifice","imperative-second-person-singular":"nulifică","imperative-plural-second-person":"nulificați","imperative-negative-second-person-singular":"nu nulifica","imperative-negative-plural-second-person":"nu nulificați"}},{"word":"nulificare","pos":"noun","definitions":["nullifying"],"forms":{"plural":"nulificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nulificare","accusative-definite-nominative-singular":"nulificarea","accusative-indefinite-nominative-plural":"nulificări","accusative-definite-nominative-plural":"nulificările","dative-genitive-indefinite-singular":"nulificări","dative-definite-genitive-singular":"nulificării","dative-genitive-indefinite-plural":"nulificări","dative-definite-genitive-plural":"nulificărilor","singular-vocative":"nulificare","plural-vocative":"nulificărilor"}},{"word":"nuligestă","pos":"noun","definitions":["nulligravid"],"forms":{"plural":"nuligeste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nuligestă","accusative-definite-nominative-singular":"nuligesta","accusative-indefinite-nominative-plural":"nuligeste","accusative-definite-nominative-plural":"nuligestele","dative-genitive-indefinite-singular":"nuligeste","dative-definite-genitive-singular":"nuligestei","dative-genitive-indefinite-plural":"nuligeste","dative-definite-genitive-plural":"nuligestelor","singular-vocative":"nuligestă","plural-vocative":"nuligestelor"}},{"word":"nulipară","pos":"noun","definitions":["nulliparous"],"forms":{"plural":"nulipare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nulipară","accusative-definite-nominative-singular":"nulipara","accusative-indefinite-nominative-plural":"nulipare","accusative-definite-nominative-plural":"nuliparele","dative-genitive-indefinite-singular":"nulipare","dative-definite-genitive-singular":"nuliparei","dative-genitive-indefinite-plural":"nulipare","dative-definite-genitive-plural":"nuliparelor","singular-vocative":"nulipară","plural-vocative":"nuliparelor"}},{"word":"nulitate","pos":"noun","definitions":["nullity"],"forms":{"plural":"nulități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nulitate","accusative-definite-nominative-singular":"nulitatea","accusative-indefinite-nominative-plural":"nulități","accusative-definite-nominative-plural":"nulitățile","dative-genitive-indefinite-singular":"nulități","dative-definite-genitive-singular":"nulității","dative-genitive-indefinite-plural":"nulități","dative-definite-genitive-plural":"nulităților","singular-vocative":"nulitate","plural-vocative":"nulităților"}},{"word":"numa","pos":"adv","definitions":["alternative typography of numa’"]},{"word":"numa'","pos":"adv","definitions":["apocopic form of numai"],"pronunciation":"/ˈnu.ma/"},{"word":"numai","pos":"adv","definitions":["only (no more than)","only (exclusively)","Indicates the subject to be characterised by an abundance of the respective noun: all","almost, nearly, just about (of an event that was close to happening)","suddenly, unexpectedly"],"pronunciation":"/ˈnu.maj/","examples":[{"ro":"și nu numai","en":"and more"},{"ro":"numai că","en":"however, it’s just that"},{"ro":"Trenul merge cu numai 60 km/h.","en":"The train is only going 60 km/h."}],"forms":{"alternative-apocopic-colloquial":"numa'","alternative":"нумай"}},{"word":"numai","pos":"conj","definitions":["but"],"pronunciation":"/ˈnu.maj/","forms":{"alternative-apocopic-colloquial":"numa'","alternative":"нумай"}},{"word":"numai piele și os","pos":"adj","definitions":["skin and bones"]},{"word":"numaidecât","pos":"adv","definitions":["immediately"]},{"word":"număr","pos":"noun","definitions":["number"],"pronunciation":"/ˈnu.mər/","forms":{"plural":"numere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"număr","accusative-definite-nominative-singular":"numărul","accusative-indefinite-nominative-plural":"numere","accusative-definite-nominative-plural":"numerele","dative-genitive-indefinite-singular":"număr","dative-definite-genitive-singular":"numărului","dative-genitive-indefinite-plural":"numere","dative-definite-genitive-plural":"numerelor","singular-vocative":"numărule","plural-vocative":"numerelor"}},{"word":"număr","pos":"verb","definitions":["first-person singular present indicative/subjunctive of număra"],"pronunciation":"/ˈnu.mər/"},{"word":"număr algebric","pos":"noun","definitions":["algebraic number"],"forms":{"plural":"numere algebrice"}},{"word":"număr atomic","pos":"noun","definitions":["atomic number"],"forms":{"plural":"numere atomice"}},{"word":"număr cardinal","pos":"noun","definitions":["cardinal number"],"forms":{"plural":"numere cardinale"}},{"word":"număr complex","pos":"noun","definitions":["complex number"],"forms":{"plural":"numere complexe"}},{"word":"număr cuantic","pos":"noun","definitions":["quantum number"],"forms":{"plural":"numere cuantice"}},{"word":"număr de serie","pos":"noun","definitions":["serial number"],"forms":{"plural":"numere de serie"}},{"word":"număr de telefon","pos":"noun","definitions":["telephone number"],"forms":{"plural":"numere de telefon"}},{"word":"număr fracționar","pos":"noun","definitions":["fractional number"],"forms":{"plural":"numere fracționare"}},{"word":"număr întreg","pos":"noun","definitions":["integer, whole number"],"forms":{"plural":"numere întregi"}},{"word":"număr irațional","pos":"noun","definitions":["irrational number"],"forms":{"plural":"numere iraționale"}},{"word":"număr mixt","pos":"noun","definitions":["mixed number"],"forms":{"plural":"numere mixte"}},{"word":"număr ordinal","pos":"noun","definitions":["ordinal number"],"forms":{"plural":"numere ordinale"}},{"word":"număr perfect","pos":"noun","definitions":["perfect number"],"forms":{"plural":"numere perfecte"}},{"word":"număr prim","pos":"noun","definitions":["prime number"],"forms":{"plural":"numere prime"}},{"word":"număr rațional","pos":"noun","definitions":["rational number"],"forms":{"plural":"numere raționale"}},{"word":"număr real","pos":"noun","definitions":["real number"],"forms":{"plural":"numere reale"}},{"word":"număr telefonic","pos":"noun","definitions":["telephone number"],"forms":{"plural":"numere telefonice"}},{"word":"număr zecimal","pos":"noun","definitions":["decimal number"],"forms":{"plural":"numere zecimale"}},{"word":"număra","pos":"verb","definitions":["to count (say numbers in order)","to count (determine the number of)","to number among, be one of","to number (amount to, have a certain quantity)","to count among, count as (put in a certain category)"],"pronunciation":"/nu.məˈra/","examples":[{"ro":"Ana Corea s-a numărat însă printre cei mai norocoși.","en":"Ana Corea, however, counted among the luckier."},{"ro":"Ѫn Валахіа mікъ, Тᲈnсᲈл а черᲈт dе ла боерюл че тръеа ѫn сатᲈл Коzіа апроапе dе mᲈnці̆ ка съ’і̆ nᲈmере dоъ сᲈте галбеnі̆, ѫnсъ nᲈ Аᲈстріеnі̆ че олаndеzі̆ nоі̆;[…]","en":"In Lesser Wallachia, the Shorn One asked of the boyar who lived in the village of Cozia near the mountains to pay him two hundred guilders, but not Austrian, but new Dutch ones; […]"}],"forms":{"canonical":"a număra 1st conjugation","present-singular-third-person":"numără","participle-past":"numărat","subjunctive-third-person":"numere","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a număra","gerund":"numărând","first-person-indicative-present-singular":"număr","indicative-present-second-person-singular":"numeri","indicative-present-singular-third-person":"numără","first-person-indicative-plural-present":"numărăm","indicative-plural-present-second-person":"numărați","indicative-plural-present-third-person":"numără","first-person-imperfect-indicative-singular":"număram","imperfect-indicative-second-person-singular":"numărai","imperfect-indicative-singular-third-person":"număra","first-person-imperfect-indicative-plural":"număram","imperfect-indicative-plural-second-person":"numărați","imperfect-indicative-plural-third-person":"numărau","first-person-indicative-perfect-singular":"numărai","indicative-perfect-second-person-singular":"numărași","indicative-perfect-singular-third-person":"numără","first-person-indicative-perfect-plural":"numărarăm","indicative-perfect-plural-second-person":"numărarăți","indicative-perfect-plural-third-person":"numărară","first-person-indicative-pluperfect-singular":"numărasem","indicative-pluperfect-second-person-singular":"număraseși","indicative-pluperfect-singular-third-person":"numărase","first-person-indicative-pluperfect-plural":"număraserăm","indicative-pluperfect-plural-second-person":"număraserăți","indicative-pluperfect-plural-third-person":"număraseră","first-person-present-singular-subjunctive":"să număr","present-second-person-singular-subjunctive":"să numeri","present-singular-subjunctive-third-person":"să numere","first-person-plural-present-subjunctive":"să numărăm","plural-present-second-person-subjunctive":"să numărați","plural-present-subjunctive-third-person":"să numere","imperative-second-person-singular":"numără","imperative-plural-second-person":"numărați","imperative-negative-second-person-singular":"nu număra","imperative-negative-plural-second-person":"nu numărați"}},{"word":"număra","pos":"verb","definitions":["to call, name","to read"],"pronunciation":"/nu.məˈra/","examples":[{"ro":"дѣчинᲂумъръгїемонꙋкаσᲅѧ.[…]","en":"So the governor read the letter […] (Acts 23:18)"},{"ro":"Númer. Numero. Lego.","en":null}],"forms":{"canonical":"a număra 1st conjugation","present-singular-third-person":"numără","participle-past":"numărat","subjunctive-third-person":"numere"}},{"word":"numărabil","pos":"adj","definitions":["countable"],"forms":{"feminine-singular":"numărabilă","masculine-plural":"numărabili","feminine-neuter-plural":"numărabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"numărabil","error-unrecognized-form-feminine-indefinite-singular":"numărabilă","error-unrecognized-form-indefinite-masculine-plural":"numărabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"numărabile","definite-error-unrecognized-form-masculine-neuter-singular":"numărabilul","definite-error-unrecognized-form-feminine-singular":"numărabila","definite-error-unrecognized-form-masculine-plural":"numărabilii","definite-error-unrecognized-form-feminine-neuter-plural":"numărabilele"}},{"word":"numărare","pos":"noun","definitions":["counting, count"],"forms":{"plural":"numărări"}},{"word":"numărat","pos":"adj","definitions":["counted"],"forms":{"feminine-singular":"numărată","masculine-plural":"numărați","feminine-neuter-plural":"numărate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"numărat","error-unrecognized-form-feminine-indefinite-singular":"numărată","error-unrecognized-form-indefinite-masculine-plural":"numărați","error-unrecognized-form-feminine-indefinite-neuter-plural":"numărate","definite-error-unrecognized-form-masculine-neuter-singular":"număratul","definite-error-unrecognized-form-feminine-singular":"numărata","definite-error-unrecognized-form-masculine-plural":"numărații","definite-error-unrecognized-form-feminine-neuter-plural":"număratele"}},{"word":"numărătoare","pos":"noun","definitions":["counting, count","abacus"],"forms":{"plural":"numărători"}},{"word":"numărătoare inversă","pos":"noun","definitions":["countdown"],"forms":{"plural":"numărători inverse"}},{"word":"numărător","pos":"noun","definitions":["numerator"],"forms":{"plural":"numărători","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"numărător","accusative-definite-nominative-singular":"numărătorul","accusative-indefinite-nominative-plural":"numărători","accusative-definite-nominative-plural":"numărătorii","dative-genitive-indefinite-singular":"numărător","dative-definite-genitive-singular":"numărătorului","dative-genitive-indefinite-plural":"numărători","dative-definite-genitive-plural":"numărătorilor","singular-vocative":"numărătorule","plural-vocative":"numărătorilor"}},{"word":"numărătură","pos":"noun","definitions":["count"],"forms":{"plural":"numărături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"numărătură","accusative-definite-nominative-singular":"numărătura","accusative-indefinite-nominative-plural":"numărături","accusative-definite-nominative-plural":"numărăturile","dative-genitive-indefinite-singular":"numărături","dative-definite-genitive-singular":"numărăturii","dative-genitive-indefinite-plural":"numărături","dative-definite-genitive-plural":"numărăturilor","singular-vocative":"numărătură","plural-vocative":"numărăturilor"}},{"word":"numărul","pos":"noun","definitions":["definite nominative/accusative singular of număr"],"pronunciation":"/ˈnumərul/"},{"word":"numărul lui Avogadro","pos":"noun","definitions":["Avogadro's number"]},{"word":"numărul lui Mach","pos":"noun","definitions":["Mach number"]},{"word":"numărului","pos":"noun","definitions":["definite genitive/dative singular of număr"],"pronunciation":"[ˈnuməruluj]"},{"word":"număruș","pos":"noun","definitions":["number"],"forms":{"plural":"numărușe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"număruș","accusative-definite-nominative-singular":"numărușul","accusative-indefinite-nominative-plural":"numărușe","accusative-definite-nominative-plural":"numărușele","dative-genitive-indefinite-singular":"număruș","dative-definite-genitive-singular":"numărușului","dative-genitive-indefinite-plural":"numărușe","dative-definite-genitive-plural":"numărușelor","singular-vocative":"numărușule","plural-vocative":"numărușelor"}},{"word":"nume","pos":"noun","definitions":["name"],"pronunciation":"/ˈnu.me/","forms":{"plural":"nume","table-tags":"no-table-tags","inflection-template":"ro-noun-n-e","accusative-indefinite-nominative-singular":"nume","accusative-definite-nominative-singular":"numele","accusative-indefinite-nominative-plural":"nume","accusative-definite-nominative-plural":"numele","dative-genitive-indefinite-singular":"nume","dative-definite-genitive-singular":"numelui","dative-genitive-indefinite-plural":"nume","dative-definite-genitive-plural":"numelor","singular-vocative":"nume","plural-vocative":"numelor"}},{"word":"nume de botez","pos":"noun","definitions":["baptismal name"],"forms":{"plural":"nume de botez"}},{"word":"nume de familie","pos":"noun","definitions":["family name"],"forms":{"plural":"nume de familie"}},{"word":"nume de fată","pos":"noun","definitions":["maiden name"]},{"word":"nume mic","pos":"noun","definitions":["first name"],"forms":{"plural":"nume mici"}},{"word":"numea","pos":"verb","definitions":["third-person singular imperfect indicative of numi"],"pronunciation":"[nuˈme̯a]"},{"word":"numeai","pos":"verb","definitions":["second-person singular imperfect indicative of numi"],"pronunciation":"[nuˈme̯aj]"},{"word":"numeam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of numi"],"pronunciation":"[nuˈme̯am]"},{"word":"numească","pos":"verb","definitions":["third-person singular/plural present subjunctive of numi"],"pronunciation":"[nuˈme̯askə]"},{"word":"numeați","pos":"verb","definitions":["second-person plural imperfect indicative of numi"],"pronunciation":"[nuˈme̯at͡sʲ]"},{"word":"numeau","pos":"verb","definitions":["third-person plural imperfect indicative of numi"],"pronunciation":"[nuˈme̯aw]"},{"word":"numeit","pos":"adj","definitions":["obsolete form of numit"],"forms":{"feminine-singular":"numeită","masculine-plural":"numeiți","feminine-neuter-plural":"numeite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"numeit","error-unrecognized-form-feminine-indefinite-singular":"numeită","error-unrecognized-form-indefinite-masculine-plural":"numeiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"numeite","definite-error-unrecognized-form-masculine-neuter-singular":"numeitul","definite-error-unrecognized-form-feminine-singular":"numeita","definite-error-unrecognized-form-masculine-plural":"numeiții","definite-error-unrecognized-form-feminine-neuter-plural":"numeitele"}},{"word":"numele","pos":"noun","definitions":["definite nominative singular of nume: the name","definite accusative singular of nume: the name","definite nominative plural of nume: the names","definite accusative plural of nume: the names"],"pronunciation":"[ˈnumele]"},{"word":"numelor","pos":"noun","definitions":["definite genitive plural of nume: of the names","definite dative plural of nume: to the names"],"pronunciation":"[ˈnumelor]"},{"word":"numelui","pos":"noun","definitions":["definite genitive singular of nume: of the name","definite dative singular of nume: to the name"],"pronunciation":"[ˈnumeluj]"},{"word":"numen","pos":"noun","definitions":["noumenon"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"numen","accusative-definite-nominative":"numenul","dative-genitive-indefinite":"numen","dative-definite-genitive":"numenului","vocative":"numenule"}},{"word":"numenal","pos":"adj","definitions":["noumenal"],"forms":{"feminine-singular":"numenală","masculine-plural":"numenali","feminine-neuter-plural":"numenale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"numenal","error-unrecognized-form-feminine-indefinite-singular":"numenală","error-unrecognized-form-indefinite-masculine-plural":"numenali","error-unrecognized-form-feminine-indefinite-neuter-plural":"numenale","definite-error-unrecognized-form-masculine-neuter-singular":"numenalul","definite-error-unrecognized-form-feminine-singular":"numenala","definite-error-unrecognized-form-masculine-plural":"numenalii","definite-error-unrecognized-form-feminine-neuter-plural":"numenalele"}},{"word":"numerabil","pos":"adj","definitions":["alternative form of numărabil"],"forms":{"feminine-singular":"numerabilă","masculine-plural":"numerabili","feminine-neuter-plural":"numerabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"numerabil","error-unrecognized-form-feminine-indefinite-singular":"numerabilă","error-unrecognized-form-indefinite-masculine-plural":"numerabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"numerabile","definite-error-unrecognized-form-masculine-neuter-singular":"numerabilul","definite-error-unrecognized-form-feminine-singular":"numerabila","definite-error-unrecognized-form-masculine-plural":"numerabilii","definite-error-unrecognized-form-feminine-neuter-plural":"numerabilele"}},{"word":"numerabilitate","pos":"noun","definitions":["countability"],"pronunciation":"/nu.me.ra.bi.liˈta.te/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"numerabilitate","accusative-definite-nominative":"numerabilitatea","dative-genitive-indefinite":"numerabilități","dative-definite-genitive":"numerabilității","vocative":"numerabilitate"}},{"word":"numeral","pos":"adj","definitions":["numeral"],"forms":{"feminine-singular":"numerală","masculine-plural":"numerali","feminine-neuter-plural":"numerale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"numeral","error-unrecognized-form-feminine-indefinite-singular":"numerală","error-unrecognized-form-indefinite-masculine-plural":"numerali","error-unrecognized-form-feminine-indefinite-neuter-plural":"numerale","definite-error-unrecognized-form-masculine-neuter-singular":"numeralul","definite-error-unrecognized-form-feminine-singular":"numerala","definite-error-unrecognized-form-masculine-plural":"numeralii","definite-error-unrecognized-form-feminine-neuter-plural":"numeralele"}},{"word":"numeral cardinal","pos":"noun","definitions":["cardinal numeral"],"forms":{"plural":"numerale cardinale"}},{"word":"numeral distributiv","pos":"noun","definitions":["distributive number"]},{"word":"numeral multiplicativ","pos":"noun","definitions":["multiplicative numeral"],"forms":{"plural":"numerale multiplicative"}},{"word":"numeral ordinal","pos":"noun","definitions":["ordinal numeral"],"forms":{"plural":"numerale ordinale"}},{"word":"numerar","pos":"noun","definitions":["cash"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"numerar","accusative-definite-nominative-singular":"numerarul","accusative-indefinite-nominative-plural":"numerare","accusative-definite-nominative-plural":"numerarele","dative-genitive-indefinite-singular":"numerar","dative-definite-genitive-singular":"numerarului","dative-genitive-indefinite-plural":"numerare","dative-definite-genitive-plural":"numerarelor","singular-vocative":"numerarule","plural-vocative":"numerarelor"}},{"word":"numerație","pos":"noun","definitions":["numeration"],"forms":{"plural":"numerații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"numerație","accusative-definite-nominative-singular":"numerația","accusative-indefinite-nominative-plural":"numerații","accusative-definite-nominative-plural":"numerațiile","dative-genitive-indefinite-singular":"numerații","dative-definite-genitive-singular":"numerației","dative-genitive-indefinite-plural":"numerații","dative-definite-genitive-plural":"numerațiilor","singular-vocative":"numerație","plural-vocative":"numerațiilor"}},{"word":"numerațiune","pos":"noun","definitions":["obsolete form of numerație"],"forms":{"plural":"numerațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"numerațiune","accusative-definite-nominative-singular":"numerațiunea","accusative-indefinite-nominative-plural":"numerațiuni","accusative-definite-nominative-plural":"numerațiunile","dative-genitive-indefinite-singular":"numerațiuni","dative-definite-genitive-singular":"numerațiunii","dative-genitive-indefinite-plural":"numerațiuni","dative-definite-genitive-plural":"numerațiunilor","singular-vocative":"numerațiune","plural-vocative":"numerațiunilor"}},{"word":"numere","pos":"noun","definitions":["plural of număr: numbers"],"pronunciation":"[ˈnumere]"},{"word":"numere","pos":"verb","definitions":["third-person singular/plural present subjunctive of număra"],"pronunciation":"[ˈnumere]"},{"word":"numere de serie","pos":"noun","definitions":["plural of număr de serie"]},{"word":"numere întregi","pos":"noun","definitions":["plural of număr întreg"]},{"word":"numerele","pos":"noun","definitions":["definite nominative/accusative plural of număr"],"pronunciation":"[ˈnumerele]"},{"word":"numerelor","pos":"noun","definitions":["inflection of număr:","definite genitive/dative plural","vocative plural"],"pronunciation":"[ˈnumerelor]"},{"word":"numeri","pos":"verb","definitions":["second-person singular present indicative/subjunctive of număra"],"pronunciation":"[ˈnumerʲ]"},{"word":"numeric","pos":"adj","definitions":["numerical"],"pronunciation":"/nuˈme.rik/","forms":{"feminine-singular":"numerică","masculine-plural":"numerici","feminine-neuter-plural":"numerice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"numeric","error-unrecognized-form-feminine-indefinite-singular":"numerică","error-unrecognized-form-indefinite-masculine-plural":"numerici","error-unrecognized-form-feminine-indefinite-neuter-plural":"numerice","definite-error-unrecognized-form-masculine-neuter-singular":"numericul","definite-error-unrecognized-form-feminine-singular":"numerica","definite-error-unrecognized-form-masculine-plural":"numericii","definite-error-unrecognized-form-feminine-neuter-plural":"numericele"}},{"word":"numericesc","pos":"adj","definitions":["numerical"],"forms":{"feminine-singular":"numericească","plural":"numericești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"numericesc","error-unrecognized-form-feminine-indefinite-singular":"numericească","error-unrecognized-form-indefinite-masculine-plural":"numericești","error-unrecognized-form-feminine-indefinite-neuter-plural":"numericești","definite-error-unrecognized-form-masculine-neuter-singular":"numericescul","definite-error-unrecognized-form-feminine-singular":"numericeasca","definite-error-unrecognized-form-masculine-plural":"numericeștii","definite-error-unrecognized-form-feminine-neuter-plural":"numericeștile"}},{"word":"numericește","pos":"adv","definitions":["numerically"]},{"word":"numeriza","pos":"verb","definitions":["to number"],"forms":{"canonical":"a numeriza 1st conjugation","present-singular-third-person":"numerizează","participle-past":"numerizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a numeriza","gerund":"numerizând","first-person-indicative-present-singular":"numerizez","indicative-present-second-person-singular":"numerizezi","indicative-present-singular-third-person":"numerizează","first-person-indicative-plural-present":"numerizăm","indicative-plural-present-second-person":"numerizați","indicative-plural-present-third-person":"numerizează","first-person-imperfect-indicative-singular":"numerizam","imperfect-indicative-second-person-singular":"numerizai","imperfect-indicative-singular-third-person":"numeriza","first-person-imperfect-indicative-plural":"numerizam","imperfect-indicative-plural-second-person":"numerizați","imperfect-indicative-plural-third-person":"numerizau","first-person-indicative-perfect-singular":"numerizai","indicative-perfect-second-person-singular":"numerizași","indicative-perfect-singular-third-person":"numeriză","first-person-indicative-perfect-plural":"numerizarăm","indicative-perfect-plural-second-person":"numerizarăți","indicative-perfect-plural-third-person":"numerizară","first-person-indicative-pluperfect-singular":"numerizasem","indicative-pluperfect-second-person-singular":"numerizaseși","indicative-pluperfect-singular-third-person":"numerizase","first-person-indicative-pluperfect-plural":"numerizaserăm","indicative-pluperfect-plural-second-person":"numerizaserăți","indicative-pluperfect-plural-third-person":"numerizaseră","first-person-present-singular-subjunctive":"să numerizez","present-second-person-singular-subjunctive":"să numerizezi","present-singular-subjunctive-third-person":"să numerizeze","first-person-plural-present-subjunctive":"să numerizăm","plural-present-second-person-subjunctive":"să numerizați","plural-present-subjunctive-third-person":"să numerizeze","imperative-second-person-singular":"numerizează","imperative-plural-second-person":"numerizați","imperative-negative-second-person-singular":"nu numeriza","imperative-negative-plural-second-person":"nu numerizați"}},{"word":"numeros","pos":"adj","definitions":["numerous"],"forms":{"feminine-singular":"numeroasă","masculine-plural":"numeroși","feminine-neuter-plural":"numeroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"numeros","error-unrecognized-form-feminine-indefinite-singular":"numeroasă","error-unrecognized-form-indefinite-masculine-plural":"numeroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"numeroase","definite-error-unrecognized-form-masculine-neuter-singular":"numerosul","definite-error-unrecognized-form-feminine-singular":"numeroasa","definite-error-unrecognized-form-masculine-plural":"numeroșii","definite-error-unrecognized-form-feminine-neuter-plural":"numeroasele"}},{"word":"numerota","pos":"verb","definitions":["to number (assign a number to)"],"forms":{"canonical":"a numerota 1st conjugation","present-singular-third-person":"numerotează","participle-past":"numerotat","subjunctive-third-person":"numeroteze","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a numerota","gerund":"numerotând","first-person-indicative-present-singular":"numerotez","indicative-present-second-person-singular":"numerotezi","indicative-present-singular-third-person":"numerotează","first-person-indicative-plural-present":"numerotăm","indicative-plural-present-second-person":"numerotați","indicative-plural-present-third-person":"numerotează","first-person-imperfect-indicative-singular":"numerotam","imperfect-indicative-second-person-singular":"numerotai","imperfect-indicative-singular-third-person":"numerota","first-person-imperfect-indicative-plural":"numerotam","imperfect-indicative-plural-second-person":"numerotați","imperfect-indicative-plural-third-person":"numerotau","first-person-indicative-perfect-singular":"numerotai","indicative-perfect-second-person-singular":"numerotași","indicative-perfect-singular-third-person":"numerotă","first-person-indicative-perfect-plural":"numerotarăm","indicative-perfect-plural-second-person":"numerotarăți","indicative-perfect-plural-third-person":"numerotară","first-person-indicative-pluperfect-singular":"numerotasem","indicative-pluperfect-second-person-singular":"numerotaseși","indicative-pluperfect-singular-third-person":"numerotase","first-person-indicative-pluperfect-plural":"numerotaserăm","indicative-pluperfect-plural-second-person":"numerotaserăți","indicative-pluperfect-plural-third-person":"numerotaseră","first-person-present-singular-subjunctive":"să numerotez","present-second-person-singular-subjunctive":"să numerotezi","present-singular-subjunctive-third-person":"să numeroteze","first-person-plural-present-subjunctive":"să numerotăm","plural-present-second-person-subjunctive":"să numerotați","plural-present-subjunctive-third-person":"să numeroteze","imperative-second-person-singular":"numerotează","imperative-plural-second-person":"numerotați","imperative-negative-second-person-singular":"nu numerota","imperative-negative-plural-second-person":"nu numerotați"}},{"word":"numerotare","pos":"noun","definitions":["numbering"],"forms":{"plural":"numerotări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"numerotare","accusative-definite-nominative-singular":"numerotarea","accusative-indefinite-nominative-plural":"numerotări","accusative-definite-nominative-plural":"numerotările","dative-genitive-indefinite-singular":"numerotări","dative-definite-genitive-singular":"numerotării","dative-genitive-indefinite-plural":"numerotări","dative-definite-genitive-plural":"numerotărilor","singular-vocative":"numerotare","plural-vocative":"numerotărilor"}},{"word":"numerotat","pos":"adj","definitions":["numbered"],"forms":{"feminine-singular":"numerotată","masculine-plural":"numerotați","feminine-neuter-plural":"numerotate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"numerotat","error-unrecognized-form-feminine-indefinite-singular":"numerotată","error-unrecognized-form-indefinite-masculine-plural":"numerotați","error-unrecognized-form-feminine-indefinite-neuter-plural":"numerotate","definite-error-unrecognized-form-masculine-neuter-singular":"numerotatul","definite-error-unrecognized-form-feminine-singular":"numerotata","definite-error-unrecognized-form-masculine-plural":"numerotații","definite-error-unrecognized-form-feminine-neuter-plural":"numerotatele"}},{"word":"numerotație","pos":"noun","definitions":["numbering"],"forms":{"plural":"numerotații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"numerotație","accusative-definite-nominative-singular":"numerotația","accusative-indefinite-nominative-plural":"numerotații","accusative-definite-nominative-plural":"numerotațiile","dative-genitive-indefinite-singular":"numerotații","dative-definite-genitive-singular":"numerotației","dative-genitive-indefinite-plural":"numerotații","dative-definite-genitive-plural":"numerotațiilor","singular-vocative":"numerotație","plural-vocative":"numerotațiilor"}},{"word":"numerozitate","pos":"noun","definitions":["multitude"],"forms":{"plural":"numerozitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"numerozitate","accusative-definite-nominative-singular":"numerozitatea","accusative-indefinite-nominative-plural":"numerozitatăți","accusative-definite-nominative-plural":"numerozitatățile","dative-genitive-indefinite-singular":"numerozitatăți","dative-definite-genitive-singular":"numerozitatății","dative-genitive-indefinite-plural":"numerozitatăți","dative-definite-genitive-plural":"numerozitatăților","singular-vocative":"numerozitate","plural-vocative":"numerozitatăților"}},{"word":"numesc","pos":"verb","definitions":["inflection of numi:","first-person singular present indicative/subjunctive","third-person plural present indicative"],"pronunciation":"[nuˈmesk]"},{"word":"numește","pos":"verb","definitions":["inflection of numi:","third-person singular present indicative","second-person singular imperative"],"pronunciation":"[nuˈmeʃte]"},{"word":"numești","pos":"verb","definitions":["second-person singular present indicative/subjunctive of numi"],"pronunciation":"[nuˈmeʃtʲ]"},{"word":"numi","pos":"verb","definitions":["to name","to be called"],"pronunciation":"[nuˈmi]","examples":[{"ro":"Mă numesc Florina.","en":"My name is Florina."}],"forms":{"canonical":"a numi 4th conjugation","present-singular-third-person":"numește","participle-past":"numit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a numi","gerund":"numind","first-person-indicative-present-singular":"numesc","indicative-present-second-person-singular":"numești","indicative-present-singular-third-person":"numește","first-person-indicative-plural-present":"numim","indicative-plural-present-second-person":"numiți","indicative-plural-present-third-person":"numesc","first-person-imperfect-indicative-singular":"numeam","imperfect-indicative-second-person-singular":"numeai","imperfect-indicative-singular-third-person":"numea","first-person-imperfect-indicative-plural":"numeam","imperfect-indicative-plural-second-person":"numeați","imperfect-indicative-plural-third-person":"numeau","first-person-indicative-perfect-singular":"numii","indicative-perfect-second-person-singular":"numiși","indicative-perfect-singular-third-person":"numi","first-person-indicative-perfect-plural":"numirăm","indicative-perfect-plural-second-person":"numirăți","indicative-perfect-plural-third-person":"numiră","first-person-indicative-pluperfect-singular":"numisem","indicative-pluperfect-second-person-singular":"numiseși","indicative-pluperfect-singular-third-person":"numise","first-person-indicative-pluperfect-plural":"numiserăm","indicative-pluperfect-plural-second-person":"numiserăți","indicative-pluperfect-plural-third-person":"numiseră","first-person-present-singular-subjunctive":"să numesc","present-second-person-singular-subjunctive":"să numești","present-singular-subjunctive-third-person":"să numească","first-person-plural-present-subjunctive":"să numim","plural-present-second-person-subjunctive":"să numiți","plural-present-subjunctive-third-person":"să numească","imperative-second-person-singular":"numește","imperative-plural-second-person":"numiți","imperative-negative-second-person-singular":"nu numi","imperative-negative-plural-second-person":"nu numiți"}},{"word":"numii","pos":"verb","definitions":["first-person singular simple perfect indicative of numi"],"pronunciation":"[nuˈmiː]","forms":{"canonical":"numíi"}},{"word":"numim","pos":"verb","definitions":["first-person plural present indicative/subjunctive of numi"],"pronunciation":"[nuˈmim]","forms":{"canonical":"numím"}},{"word":"numind","pos":"verb","definitions":["gerund of numi"],"pronunciation":"[nuˈmind]"},{"word":"numiră","pos":"verb","definitions":["third-person plural simple perfect indicative of numi"],"pronunciation":"[nuˈmirə]","forms":{"canonical":"numíră"}},{"word":"numirăm","pos":"verb","definitions":["first-person plural simple perfect indicative of numi"],"pronunciation":"[nuˈmirəm]","forms":{"canonical":"numírăm"}},{"word":"numirăți","pos":"verb","definitions":["second-person plural simple perfect indicative of numi"],"pronunciation":"[nuˈmirət͡sʲ]","forms":{"canonical":"numírăți"}},{"word":"numire","pos":"noun","definitions":["appointment"],"forms":{"plural":"numiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"numire","accusative-definite-nominative-singular":"numirea","accusative-indefinite-nominative-plural":"numiri","accusative-definite-nominative-plural":"numirile","dative-genitive-indefinite-singular":"numiri","dative-definite-genitive-singular":"numirii","dative-genitive-indefinite-plural":"numiri","dative-definite-genitive-plural":"numirilor","singular-vocative":"numire","plural-vocative":"numirilor"}},{"word":"numise","pos":"verb","definitions":["third-person singular pluperfect indicative of numi"],"pronunciation":"[nuˈmise]","forms":{"canonical":"numíse"}},{"word":"numisem","pos":"verb","definitions":["first-person singular pluperfect indicative of numi"],"pronunciation":"[nuˈmisem]","forms":{"canonical":"numísem"}},{"word":"numiseră","pos":"verb","definitions":["third-person plural pluperfect indicative of numi"],"pronunciation":"[nuˈmiserə]","forms":{"canonical":"numíseră"}},{"word":"numiserăm","pos":"verb","definitions":["first-person plural pluperfect indicative of numi"],"pronunciation":"[nuˈmiserəm]","forms":{"canonical":"numíserăm"}},{"word":"numiserăți","pos":"verb","definitions":["second-person plural pluperfect indicative of numi"],"pronunciation":"[nuˈmiserət͡sʲ]","forms":{"canonical":"numíserăți"}},{"word":"numiseși","pos":"verb","definitions":["second-person singular pluperfect indicative of numi"],"pronunciation":"[nuˈmiseʃʲ]","forms":{"canonical":"numíseși"}},{"word":"numiși","pos":"verb","definitions":["second-person singular simple perfect indicative of numi"],"pronunciation":"[nuˈmiʃʲ]","forms":{"canonical":"numíși"}},{"word":"numismat","pos":"noun","definitions":["numismatist"],"forms":{"plural":"numismați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"numismat","accusative-definite-nominative-singular":"numismatul","accusative-indefinite-nominative-plural":"numismați","accusative-definite-nominative-plural":"numismații","dative-genitive-indefinite-singular":"numismat","dative-definite-genitive-singular":"numismatului","dative-genitive-indefinite-plural":"numismați","dative-definite-genitive-plural":"numismaților","singular-vocative":"numismatule","plural-vocative":"numismaților"}},{"word":"numismată","pos":"noun","definitions":["female equivalent of numismat"],"forms":{"plural":"numismate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"numismată","accusative-definite-nominative-singular":"numismata","accusative-indefinite-nominative-plural":"numismate","accusative-definite-nominative-plural":"numismatele","dative-genitive-indefinite-singular":"numismate","dative-definite-genitive-singular":"numismatei","dative-genitive-indefinite-plural":"numismate","dative-definite-genitive-plural":"numismatelor","singular-vocative":"numismată","plural-vocative":"numismatelor"}},{"word":"numismatic","pos":"adj","definitions":["numismatic"],"forms":{"feminine-singular":"numismatică","masculine-plural":"numismatici","feminine-neuter-plural":"numismatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"numismatic","error-unrecognized-form-feminine-indefinite-singular":"numismatică","error-unrecognized-form-indefinite-masculine-plural":"numismatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"numismatice","definite-error-unrecognized-form-masculine-neuter-singular":"numismaticul","definite-error-unrecognized-form-feminine-singular":"numismatica","definite-error-unrecognized-form-masculine-plural":"numismaticii","definite-error-unrecognized-form-feminine-neuter-plural":"numismaticele"}},{"word":"numismatică","pos":"noun","definitions":["numismatics"],"forms":{"plural":"numismatici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"numismatică","accusative-definite-nominative-singular":"numismatica","accusative-indefinite-nominative-plural":"numismatici","accusative-definite-nominative-plural":"numismaticile","dative-genitive-indefinite-singular":"numismatici","dative-definite-genitive-singular":"numismaticii","dative-genitive-indefinite-plural":"numismatici","dative-definite-genitive-plural":"numismaticilor","singular-vocative":"numismatică","plural-vocative":"numismaticilor"}},{"word":"numit","pos":"adj","definitions":["known as"],"pronunciation":"[nuˈmit]","forms":{"feminine-singular":"numită","masculine-plural":"numiți","feminine-neuter-plural":"numite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"numit","error-unrecognized-form-feminine-indefinite-singular":"numită","error-unrecognized-form-indefinite-masculine-plural":"numiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"numite","definite-error-unrecognized-form-masculine-neuter-singular":"numitul","definite-error-unrecognized-form-feminine-singular":"numita","definite-error-unrecognized-form-masculine-plural":"numiții","definite-error-unrecognized-form-feminine-neuter-plural":"numitele"}},{"word":"numit","pos":"verb","definitions":["past participle of numi"],"pronunciation":"[nuˈmit]","forms":{"participle-past":"of numi"}},{"word":"numita","pos":"adj","definitions":["definite nominative/accusative feminine singular of numit"],"pronunciation":"[nuˈmita]"},{"word":"numită","pos":"adj","definitions":["feminine singular of numit"],"pronunciation":"[nuˈmitə]"},{"word":"numite","pos":"adj","definitions":["feminine/neuter plural of numit"],"pronunciation":"[nuˈmite]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"numíte"}},{"word":"numitei","pos":"adj","definitions":["definite genitive/dative feminine singular of numit"],"pronunciation":"[nuˈmitej]"},{"word":"numitele","pos":"adj","definitions":["definite nominative/accusative feminine/neuter plural of numit"],"pronunciation":"[nuˈmitele]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"numítele"}},{"word":"numitelor","pos":"adj","definitions":["definite genitive/dative feminine/neuter plural of numit"],"pronunciation":"[nuˈmitelor]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"numítelor"}},{"word":"numiți","pos":"adj","definitions":["masculine plural of numit"],"pronunciation":"[nuˈmit͡sʲ]","forms":{"canonical":"numíți"}},{"word":"numiți","pos":"verb","definitions":["inflection of numi:","second-person plural present indicative/subjunctive","second-person plural imperative"],"pronunciation":"[nuˈmit͡sʲ]","forms":{"canonical":"numíți"}},{"word":"numiții","pos":"adj","definitions":["definite nominative/accusative masculine plural of numit"],"pronunciation":"[nuˈmit͡siː]","gender":"m-p","forms":{"canonical-masculine-plural":"numíții"}},{"word":"numiților","pos":"adj","definitions":["definite genitive/dative masculine plural of numit"],"pronunciation":"[nuˈmit͡silor]","gender":"m-p","forms":{"canonical-masculine-plural":"numíților"}},{"word":"numitor","pos":"noun","definitions":["denominator"],"forms":{"plural":"numitori"}},{"word":"numitor comun","pos":"noun","definitions":["common denominator"]},{"word":"numitul","pos":"adj","definitions":["definite nominative/accusative masculine/neuter singular of numit"],"pronunciation":"[nuˈmitul]","gender":"m","forms":{"canonical-masculine-neuter":"numítul"}},{"word":"numitului","pos":"adj","definitions":["definite genitive/dative masculine/neuter singular of numit"],"pronunciation":"[nuˈmituluj]","gender":"m","forms":{"canonical-masculine-neuter":"numítului"}},{"word":"numulit","pos":"noun","definitions":["nummulite"],"forms":{"plural":"numuliți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"numulit","accusative-definite-nominative-singular":"numulitul","accusative-indefinite-nominative-plural":"numuliți","accusative-definite-nominative-plural":"numuliții","dative-genitive-indefinite-singular":"numulit","dative-definite-genitive-singular":"numulitului","dative-genitive-indefinite-plural":"numuliți","dative-definite-genitive-plural":"numuliților","singular-vocative":"numulitule","plural-vocative":"numuliților"}},{"word":"numulitic","pos":"adj","definitions":["nummulitic"],"forms":{"feminine-singular":"numulitică","masculine-plural":"numulitici","feminine-neuter-plural":"numulitice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"numulitic","error-unrecognized-form-feminine-indefinite-singular":"numulitică","error-unrecognized-form-indefinite-masculine-plural":"numulitici","error-unrecognized-form-feminine-indefinite-neuter-plural":"numulitice","definite-error-unrecognized-form-masculine-neuter-singular":"numuliticul","definite-error-unrecognized-form-feminine-singular":"numulitica","definite-error-unrecognized-form-masculine-plural":"numuliticii","definite-error-unrecognized-form-feminine-neuter-plural":"numuliticele"}},{"word":"nun","pos":"noun","definitions":["the godfather at a wedding"],"forms":{"plural":"nuni","feminine":"equivalent nună","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nun","accusative-definite-nominative-singular":"nunul","accusative-indefinite-nominative-plural":"nuni","accusative-definite-nominative-plural":"nunii","dative-genitive-indefinite-singular":"nun","dative-definite-genitive-singular":"nunului","dative-genitive-indefinite-plural":"nuni","dative-definite-genitive-plural":"nunilor","singular-vocative":"nunule","plural-vocative":"nunilor"}},{"word":"nună","pos":"noun","definitions":["female equivalent of nun"],"forms":{"plural":"nune","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nună","accusative-definite-nominative-singular":"nuna","accusative-indefinite-nominative-plural":"nune","accusative-definite-nominative-plural":"nunele","dative-genitive-indefinite-singular":"nune","dative-definite-genitive-singular":"nunei","dative-genitive-indefinite-plural":"nune","dative-definite-genitive-plural":"nunelor","singular-vocative":"nună","plural-vocative":"nunelor"}},{"word":"nunatak","pos":"noun","definitions":["nunatak"],"forms":{"plural":"nunatakuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"nunatak","accusative-definite-nominative-singular":"nunatakul","accusative-indefinite-nominative-plural":"nunatakuri","accusative-definite-nominative-plural":"nunatakurile","dative-genitive-indefinite-singular":"nunatak","dative-definite-genitive-singular":"nunatakului","dative-genitive-indefinite-plural":"nunatakuri","dative-definite-genitive-plural":"nunatakurilor","singular-vocative":"nunatakule","plural-vocative":"nunatakurilor"}},{"word":"nunciatură","pos":"noun","definitions":["alternative form of nunțiatură"],"forms":{"plural":"nunciaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"nunciatură","accusative-definite-nominative-singular":"nunciatura","accusative-indefinite-nominative-plural":"nunciaturi","accusative-definite-nominative-plural":"nunciaturile","dative-genitive-indefinite-singular":"nunciaturi","dative-definite-genitive-singular":"nunciaturii","dative-genitive-indefinite-plural":"nunciaturi","dative-definite-genitive-plural":"nunciaturilor","singular-vocative":"nunciatură","plural-vocative":"nunciaturilor"}},{"word":"nunciu","pos":"noun","definitions":["alternative form of nunțiu"],"forms":{"plural":"nuncii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nunciu","accusative-definite-nominative-singular":"nunciul","accusative-indefinite-nominative-plural":"nuncii","accusative-definite-nominative-plural":"nunciii","dative-genitive-indefinite-singular":"nunciu","dative-definite-genitive-singular":"nunciului","dative-genitive-indefinite-plural":"nuncii","dative-definite-genitive-plural":"nunciilor","singular-vocative":"nunciule","plural-vocative":"nunciilor"}},{"word":"nuncupație","pos":"noun","definitions":["nuncupation"],"forms":{"plural":"nuncupații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nuncupație","accusative-definite-nominative-singular":"nuncupația","accusative-indefinite-nominative-plural":"nuncupații","accusative-definite-nominative-plural":"nuncupațiile","dative-genitive-indefinite-singular":"nuncupații","dative-definite-genitive-singular":"nuncupației","dative-genitive-indefinite-plural":"nuncupații","dative-definite-genitive-plural":"nuncupațiilor","singular-vocative":"nuncupație","plural-vocative":"nuncupațiilor"}},{"word":"nuneasca","pos":"noun","definitions":["a Romanian folk dance"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"nuneasca","accusative-definite-nominative":"nuneasca","dative-genitive-indefinite":"nunești","dative-definite-genitive":"nuneștii","vocative":"-"}},{"word":"Nunescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nunescu"}},{"word":"nunișoară","pos":"noun","definitions":["diminutive of nun"],"forms":{"plural":"nunișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nunișoară","accusative-definite-nominative-singular":"nunișoara","accusative-indefinite-nominative-plural":"nunișoare","accusative-definite-nominative-plural":"nunișoarele","dative-genitive-indefinite-singular":"nunișoare","dative-definite-genitive-singular":"nunișoarei","dative-genitive-indefinite-plural":"nunișoare","dative-definite-genitive-plural":"nunișoarelor","singular-vocative":"nunișoară","plural-vocative":"nunișoarelor"}},{"word":"nuniță","pos":"noun","definitions":["diminutive of nună"],"forms":{"plural":"nunițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nuniță","accusative-definite-nominative-singular":"nunița","accusative-indefinite-nominative-plural":"nunițe","accusative-definite-nominative-plural":"nunițele","dative-genitive-indefinite-singular":"nunițe","dative-definite-genitive-singular":"nuniței","dative-genitive-indefinite-plural":"nunițe","dative-definite-genitive-plural":"nunițelor","singular-vocative":"nuniță","plural-vocative":"nunițelor"}},{"word":"nunta","pos":"noun","definitions":["definite nominative/accusative singular of nuntă"],"pronunciation":"/ˈnun.ta/","gender":"f"},{"word":"nuntă","pos":"noun","definitions":["wedding (marriage ceremony)"],"pronunciation":"/ˈnun.tə/","forms":{"plural":"nunți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"nuntă","accusative-definite-nominative-singular":"nunta","accusative-indefinite-nominative-plural":"nunți","accusative-definite-nominative-plural":"nunțile","dative-genitive-indefinite-singular":"nunți","dative-definite-genitive-singular":"nunții","dative-genitive-indefinite-plural":"nunți","dative-definite-genitive-plural":"nunților","singular-vocative":"nuntă","plural-vocative":"nunților"}},{"word":"nuntă de argint","pos":"noun","definitions":["silver wedding"],"forms":{"plural":"nunți de argint"}},{"word":"nuntălaș","pos":"noun","definitions":["wedding-goer"],"forms":{"plural":"nuntălași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nuntălaș","accusative-definite-nominative-singular":"nuntălașul","accusative-indefinite-nominative-plural":"nuntălași","accusative-definite-nominative-plural":"nuntălașii","dative-genitive-indefinite-singular":"nuntălaș","dative-definite-genitive-singular":"nuntălașului","dative-genitive-indefinite-plural":"nuntălași","dative-definite-genitive-plural":"nuntălașilor","singular-vocative":"nuntălașule","plural-vocative":"nuntălașilor"}},{"word":"nuntariu","pos":"adj","definitions":["nuptial"],"forms":{"feminine-singular":"nuntarie","plural":"nuntarii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nuntariu","error-unrecognized-form-feminine-indefinite-singular":"nuntarie","error-unrecognized-form-indefinite-masculine-plural":"nuntarii","error-unrecognized-form-feminine-indefinite-neuter-plural":"nuntarii","definite-error-unrecognized-form-masculine-neuter-singular":"nuntariul","definite-error-unrecognized-form-feminine-singular":"nuntaria","definite-error-unrecognized-form-masculine-plural":"nuntariii","definite-error-unrecognized-form-feminine-neuter-plural":"nuntariile"}},{"word":"nuntariu","pos":"noun","definitions":["wedding-goer"],"forms":{"plural":"nuntarii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nuntariu","accusative-definite-nominative-singular":"nuntariuul","accusative-indefinite-nominative-plural":"nuntarii","accusative-definite-nominative-plural":"nuntariii","dative-genitive-indefinite-singular":"nuntariu","dative-definite-genitive-singular":"nuntariuului","dative-genitive-indefinite-plural":"nuntarii","dative-definite-genitive-plural":"nuntariilor","singular-vocative":"nuntariuule","plural-vocative":"nuntariilor"}},{"word":"nuntaș","pos":"noun","definitions":["wedding-goer"],"forms":{"plural":"nuntași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nuntaș","accusative-definite-nominative-singular":"nuntașul","accusative-indefinite-nominative-plural":"nuntași","accusative-definite-nominative-plural":"nuntașii","dative-genitive-indefinite-singular":"nuntaș","dative-definite-genitive-singular":"nuntașului","dative-genitive-indefinite-plural":"nuntași","dative-definite-genitive-plural":"nuntașilor","singular-vocative":"nuntașule","plural-vocative":"nuntașilor"}},{"word":"nuntașă","pos":"noun","definitions":["female equivalent of nuntaș"],"forms":{"plural":"nuntașe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nuntașă","accusative-definite-nominative-singular":"nuntașa","accusative-indefinite-nominative-plural":"nuntașe","accusative-definite-nominative-plural":"nuntașele","dative-genitive-indefinite-singular":"nuntașe","dative-definite-genitive-singular":"nuntașei","dative-genitive-indefinite-plural":"nuntașe","dative-definite-genitive-plural":"nuntașelor","singular-vocative":"nuntașă","plural-vocative":"nuntașelor"}},{"word":"nuntășel","pos":"noun","definitions":["diminutive of nuntaș"],"forms":{"plural":"nuntășei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nuntășel","accusative-definite-nominative-singular":"nuntășelul","accusative-indefinite-nominative-plural":"nuntășei","accusative-definite-nominative-plural":"nuntășeii","dative-genitive-indefinite-singular":"nuntășel","dative-definite-genitive-singular":"nuntășelului","dative-genitive-indefinite-plural":"nuntășei","dative-definite-genitive-plural":"nuntășeilor","singular-vocative":"nuntășelule","plural-vocative":"nuntășeilor"}},{"word":"Nuntași","pos":"name","definitions":["a village in Istria, Constanța County, Romania"],"gender":"m","examples":[{"ro":".","en":null}]},{"word":"nuntași","pos":"noun","definitions":["plural of nuntaș"]},{"word":"nunti","pos":"verb","definitions":["to organize a wedding, to marry"],"forms":{"canonical":"a nunti 4th conjugation","present-singular-third-person":"nuntește","participle-past":"nuntit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nunti","gerund":"nuntind","first-person-indicative-present-singular":"nuntesc","indicative-present-second-person-singular":"nuntești","indicative-present-singular-third-person":"nuntește","first-person-indicative-plural-present":"nuntim","indicative-plural-present-second-person":"nuntiți","indicative-plural-present-third-person":"nuntesc","first-person-imperfect-indicative-singular":"nunteam","imperfect-indicative-second-person-singular":"nunteai","imperfect-indicative-singular-third-person":"nuntea","first-person-imperfect-indicative-plural":"nunteam","imperfect-indicative-plural-second-person":"nunteați","imperfect-indicative-plural-third-person":"nunteau","first-person-indicative-perfect-singular":"nuntii","indicative-perfect-second-person-singular":"nuntiși","indicative-perfect-singular-third-person":"nunti","first-person-indicative-perfect-plural":"nuntirăm","indicative-perfect-plural-second-person":"nuntirăți","indicative-perfect-plural-third-person":"nuntiră","first-person-indicative-pluperfect-singular":"nuntisem","indicative-pluperfect-second-person-singular":"nuntiseși","indicative-pluperfect-singular-third-person":"nuntise","first-person-indicative-pluperfect-plural":"nuntiserăm","indicative-pluperfect-plural-second-person":"nuntiserăți","indicative-pluperfect-plural-third-person":"nuntiseră","first-person-present-singular-subjunctive":"să nuntesc","present-second-person-singular-subjunctive":"să nuntești","present-singular-subjunctive-third-person":"să nuntească","first-person-plural-present-subjunctive":"să nuntim","plural-present-second-person-subjunctive":"să nuntiți","plural-present-subjunctive-third-person":"să nuntească","imperative-second-person-singular":"nuntește","imperative-plural-second-person":"nuntiți","imperative-negative-second-person-singular":"nu nunti","imperative-negative-plural-second-person":"nu nuntiți"}},{"word":"nunțial","pos":"adj","definitions":["nuptial"],"forms":{"feminine-singular":"nunțială","masculine-plural":"nunțiali","feminine-neuter-plural":"nunțiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nunțial","error-unrecognized-form-feminine-indefinite-singular":"nunțială","error-unrecognized-form-indefinite-masculine-plural":"nunțiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"nunțiale","definite-error-unrecognized-form-masculine-neuter-singular":"nunțialul","definite-error-unrecognized-form-feminine-singular":"nunțiala","definite-error-unrecognized-form-masculine-plural":"nunțialii","definite-error-unrecognized-form-feminine-neuter-plural":"nunțialele"}},{"word":"nunțiatură","pos":"noun","definitions":["nunciature"],"forms":{"plural":"nunțiaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"nunțiatură","accusative-definite-nominative-singular":"nunțiatura","accusative-indefinite-nominative-plural":"nunțiaturi","accusative-definite-nominative-plural":"nunțiaturile","dative-genitive-indefinite-singular":"nunțiaturi","dative-definite-genitive-singular":"nunțiaturii","dative-genitive-indefinite-plural":"nunțiaturi","dative-definite-genitive-plural":"nunțiaturilor","singular-vocative":"nunțiatură","plural-vocative":"nunțiaturilor"}},{"word":"nuntie","pos":"noun","definitions":["marriage"],"forms":{"plural":"nuntii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nuntie","accusative-definite-nominative-singular":"nuntia","accusative-indefinite-nominative-plural":"nuntii","accusative-definite-nominative-plural":"nuntiile","dative-genitive-indefinite-singular":"nuntii","dative-definite-genitive-singular":"nuntiei","dative-genitive-indefinite-plural":"nuntii","dative-definite-genitive-plural":"nuntiilor","singular-vocative":"nuntie","plural-vocative":"nuntiilor"}},{"word":"nuntire","pos":"noun","definitions":["wedding"],"forms":{"plural":"nuntiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nuntire","accusative-definite-nominative-singular":"nuntirea","accusative-indefinite-nominative-plural":"nuntiri","accusative-definite-nominative-plural":"nuntirile","dative-genitive-indefinite-singular":"nuntiri","dative-definite-genitive-singular":"nuntirii","dative-genitive-indefinite-plural":"nuntiri","dative-definite-genitive-plural":"nuntirilor","singular-vocative":"nuntire","plural-vocative":"nuntirilor"}},{"word":"nuntișoară","pos":"noun","definitions":["diminutive of nuntă"],"forms":{"plural":"nuntișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nuntișoară","accusative-definite-nominative-singular":"nuntișoara","accusative-indefinite-nominative-plural":"nuntișoare","accusative-definite-nominative-plural":"nuntișoarele","dative-genitive-indefinite-singular":"nuntișoare","dative-definite-genitive-singular":"nuntișoarei","dative-genitive-indefinite-plural":"nuntișoare","dative-definite-genitive-plural":"nuntișoarelor","singular-vocative":"nuntișoară","plural-vocative":"nuntișoarelor"}},{"word":"nuntit","pos":"adj","definitions":["married"],"forms":{"feminine-singular":"nuntită","masculine-plural":"nuntiți","feminine-neuter-plural":"nuntite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nuntit","error-unrecognized-form-feminine-indefinite-singular":"nuntită","error-unrecognized-form-indefinite-masculine-plural":"nuntiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nuntite","definite-error-unrecognized-form-masculine-neuter-singular":"nuntitul","definite-error-unrecognized-form-feminine-singular":"nuntita","definite-error-unrecognized-form-masculine-plural":"nuntiții","definite-error-unrecognized-form-feminine-neuter-plural":"nuntitele"}},{"word":"nuntit","pos":"verb","definitions":["past participle of nunti"],"forms":{"participle-past":"of nunti"}},{"word":"nuntiță","pos":"noun","definitions":["diminutive of nuntă"],"forms":{"plural":"nuntițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nuntiță","accusative-definite-nominative-singular":"nuntița","accusative-indefinite-nominative-plural":"nuntițe","accusative-definite-nominative-plural":"nuntițele","dative-genitive-indefinite-singular":"nuntițe","dative-definite-genitive-singular":"nuntiței","dative-genitive-indefinite-plural":"nuntițe","dative-definite-genitive-plural":"nuntițelor","singular-vocative":"nuntiță","plural-vocative":"nuntițelor"}},{"word":"nuntitor","pos":"adj","definitions":["nuptial"],"forms":{"feminine-singular":"nuntitoare","masculine-plural":"nuntitori","feminine-neuter-plural":"nuntitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nuntitor","error-unrecognized-form-feminine-indefinite-singular":"nuntitoare","error-unrecognized-form-indefinite-masculine-plural":"nuntitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"nuntitoare","definite-error-unrecognized-form-masculine-neuter-singular":"nuntitorul","definite-error-unrecognized-form-feminine-singular":"nuntitoarea","definite-error-unrecognized-form-masculine-plural":"nuntitorii","definite-error-unrecognized-form-feminine-neuter-plural":"nuntitoarele"}},{"word":"nunțiu","pos":"noun","definitions":["nuncio"],"forms":{"plural":"nunții","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nunțiu","accusative-definite-nominative-singular":"nunțiuul","accusative-indefinite-nominative-plural":"nunții","accusative-definite-nominative-plural":"nunțiii","dative-genitive-indefinite-singular":"nunțiu","dative-definite-genitive-singular":"nunțiuului","dative-genitive-indefinite-plural":"nunții","dative-definite-genitive-plural":"nunțiilor","singular-vocative":"nunțiuule","plural-vocative":"nunțiilor"}},{"word":"nunuț","pos":"noun","definitions":["diminutive of nun"],"forms":{"plural":"nunuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nunuț","accusative-definite-nominative-singular":"nunuțul","accusative-indefinite-nominative-plural":"nunuți","accusative-definite-nominative-plural":"nunuții","dative-genitive-indefinite-singular":"nunuț","dative-definite-genitive-singular":"nunuțului","dative-genitive-indefinite-plural":"nunuți","dative-definite-genitive-plural":"nunuților","singular-vocative":"nunuțule","plural-vocative":"nunuților"}},{"word":"nuor","pos":"noun","definitions":["alternative form of nor"],"forms":{"plural":"nuori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nuor","accusative-definite-nominative-singular":"nuorul","accusative-indefinite-nominative-plural":"nuori","accusative-definite-nominative-plural":"nuorii","dative-genitive-indefinite-singular":"nuor","dative-definite-genitive-singular":"nuorului","dative-genitive-indefinite-plural":"nuori","dative-definite-genitive-plural":"nuorilor","singular-vocative":"nuorule","plural-vocative":"nuorilor"}},{"word":"nuou","pos":"adj","definitions":["obsolete form of nou"],"forms":{"feminine-singular":"nuoă","masculine-plural":"nuoi","feminine-neuter-plural":"nuoe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nuou","error-unrecognized-form-feminine-indefinite-singular":"nuoă","error-unrecognized-form-indefinite-masculine-plural":"nuoi","error-unrecognized-form-feminine-indefinite-neuter-plural":"nuoe","definite-error-unrecognized-form-masculine-neuter-singular":"nuoul","definite-error-unrecognized-form-feminine-singular":"nuoa","definite-error-unrecognized-form-masculine-plural":"nuoii","definite-error-unrecognized-form-feminine-neuter-plural":"nuoele"}},{"word":"nup","pos":"intj","definitions":["informal form of nu"],"pronunciation":"[nup]"},{"word":"nupțial","pos":"adj","definitions":["nuptial"],"pronunciation":"/nup.t͡siˈal/","forms":{"feminine-singular":"nupțială","masculine-plural":"nupțiali","feminine-neuter-plural":"nupțiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nupțial","error-unrecognized-form-feminine-indefinite-singular":"nupțială","error-unrecognized-form-indefinite-masculine-plural":"nupțiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"nupțiale","definite-error-unrecognized-form-masculine-neuter-singular":"nupțialul","definite-error-unrecognized-form-feminine-singular":"nupțiala","definite-error-unrecognized-form-masculine-plural":"nupțialii","definite-error-unrecognized-form-feminine-neuter-plural":"nupțialele"}},{"word":"nupțialitate","pos":"noun","definitions":["nuptiality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nupțialitate","accusative-definite-nominative-singular":"nupțialitatea","accusative-indefinite-nominative-plural":"nupțialități","accusative-definite-nominative-plural":"nupțialitățile","dative-genitive-indefinite-singular":"nupțialități","dative-definite-genitive-singular":"nupțialității","dative-genitive-indefinite-plural":"nupțialități","dative-definite-genitive-plural":"nupțialităților","singular-vocative":"nupțialitate","plural-vocative":"nupțialităților"}},{"word":"nur","pos":"noun","definitions":["sex appeal"],"forms":{"plural":"nuri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nur","accusative-definite-nominative-singular":"nurul","accusative-indefinite-nominative-plural":"nuri","accusative-definite-nominative-plural":"nurii","dative-genitive-indefinite-singular":"nur","dative-definite-genitive-singular":"nurului","dative-genitive-indefinite-plural":"nuri","dative-definite-genitive-plural":"nurilor","singular-vocative":"nurule","plural-vocative":"nurilor"}},{"word":"nurca","pos":"noun","definitions":["definite nominative/accusative singular of nurcă"]},{"word":"nurcă","pos":"noun","definitions":["mink; specifically, the European mink, Mustela lutreola, but also applied to other species of the genus Mustela","fur of the mink"],"pronunciation":"/ˈnurkə/","forms":{"plural":"nurci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"nurcă","accusative-definite-nominative-singular":"nurca","accusative-indefinite-nominative-plural":"nurci","accusative-definite-nominative-plural":"nurcile","dative-genitive-indefinite-singular":"nurci","dative-definite-genitive-singular":"nurcii","dative-genitive-indefinite-plural":"nurci","dative-definite-genitive-plural":"nurcilor","singular-vocative":"nurcă","plural-vocative":"nurcilor"}},{"word":"nurci","pos":"noun","definitions":["plural of nurcă"]},{"word":"nuriță","pos":"noun","definitions":["diminutive of nur"],"forms":{"plural":"nurițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nuriță","accusative-definite-nominative-singular":"nurița","accusative-indefinite-nominative-plural":"nurițe","accusative-definite-nominative-plural":"nurițele","dative-genitive-indefinite-singular":"nurițe","dative-definite-genitive-singular":"nuriței","dative-genitive-indefinite-plural":"nurițe","dative-definite-genitive-plural":"nurițelor","singular-vocative":"nuriță","plural-vocative":"nurițelor"}},{"word":"nurliu","pos":"adj","definitions":["charming, attractive"],"forms":{"feminine-singular":"nurlie","plural":"nurlii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nurliu","error-unrecognized-form-feminine-indefinite-singular":"nurlie","error-unrecognized-form-indefinite-masculine-plural":"nurlii","error-unrecognized-form-feminine-indefinite-neuter-plural":"nurlii","definite-error-unrecognized-form-masculine-neuter-singular":"nurliul","definite-error-unrecognized-form-feminine-singular":"nurlia","definite-error-unrecognized-form-masculine-plural":"nurliii","definite-error-unrecognized-form-feminine-neuter-plural":"nurliile"}},{"word":"nuroră","pos":"noun","definitions":["obsolete form of noră"],"forms":{"plural":"nurori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"nuroră","accusative-definite-nominative-singular":"nurora","accusative-indefinite-nominative-plural":"nurori","accusative-definite-nominative-plural":"nurorile","dative-genitive-indefinite-singular":"nurori","dative-definite-genitive-singular":"nurorii","dative-genitive-indefinite-plural":"nurori","dative-definite-genitive-plural":"nurorilor","singular-vocative":"nuroră","plural-vocative":"nurorilor"}},{"word":"nursă","pos":"noun","definitions":["nanny"],"forms":{"plural":"nurse","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nursă","accusative-definite-nominative-singular":"nursa","accusative-indefinite-nominative-plural":"nurse","accusative-definite-nominative-plural":"nursele","dative-genitive-indefinite-singular":"nurse","dative-definite-genitive-singular":"nursei","dative-genitive-indefinite-plural":"nurse","dative-definite-genitive-plural":"nurselor","singular-vocative":"nursă","plural-vocative":"nurselor"}},{"word":"nursing","pos":"noun","definitions":["nursing"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nursing","accusative-definite-nominative":"nursingul","dative-genitive-indefinite":"nursing","dative-definite-genitive":"nursingului","vocative":"nursingule"}},{"word":"Nușeni","pos":"name","definitions":["a commune of Bistrița-Năsăud County, Romania","a village in Nușeni, Bistrița-Năsăud County, Romania"],"gender":"m"},{"word":"Nușfalău","pos":"name","definitions":["a commune of Sălaj County, Romania","a village in Nușfalău, Sălaj County, Romania"],"gender":"m"},{"word":"Nușfelean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Nușfelean"}},{"word":"nush","pos":"phrase","definitions":["abbreviation of nu știu (“I don't know”)"]},{"word":"nust","pos":"noun","definitions":["pine marten (Martes martes)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"nust","accusative-definite-nominative":"nustul","dative-genitive-indefinite":"nust","dative-definite-genitive":"nustului","vocative":"nustule"}},{"word":"nutație","pos":"noun","definitions":["nutation"],"forms":{"plural":"nutații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nutație","accusative-definite-nominative-singular":"nutația","accusative-indefinite-nominative-plural":"nutații","accusative-definite-nominative-plural":"nutațiile","dative-genitive-indefinite-singular":"nutații","dative-definite-genitive-singular":"nutației","dative-genitive-indefinite-plural":"nutații","dative-definite-genitive-plural":"nutațiilor","singular-vocative":"nutație","plural-vocative":"nutațiilor"}},{"word":"nutațiune","pos":"noun","definitions":["obsolete form of nutație"],"forms":{"plural":"nutațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nutațiune","accusative-definite-nominative-singular":"nutațiunea","accusative-indefinite-nominative-plural":"nutațiuni","accusative-definite-nominative-plural":"nutațiunile","dative-genitive-indefinite-singular":"nutațiuni","dative-definite-genitive-singular":"nutațiunii","dative-genitive-indefinite-plural":"nutațiuni","dative-definite-genitive-plural":"nutațiunilor","singular-vocative":"nutațiune","plural-vocative":"nutațiunilor"}},{"word":"Nuțeni","pos":"name","definitions":["a village in Gălăuțaș, Harghita County, Romania"],"gender":"m"},{"word":"Nuțescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nuțescu"}},{"word":"Nuțică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Nuțică"}},{"word":"Nuțoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nuțoiu"}},{"word":"nutrecior","pos":"noun","definitions":["diminutive of nutreț"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"nutrecior","accusative-definite-nominative":"nutreciorul","dative-genitive-indefinite":"nutrecior","dative-definite-genitive":"nutreciorului","vocative":"nutreciorule"}},{"word":"nutreț","pos":"noun","definitions":["fodder, feed","forage"],"forms":{"plural":"nutrețuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nutreț","accusative-definite-nominative-singular":"nutrețul","accusative-indefinite-nominative-plural":"nutrețuri","accusative-definite-nominative-plural":"nutrețurile","dative-genitive-indefinite-singular":"nutreț","dative-definite-genitive-singular":"nutrețului","dative-genitive-indefinite-plural":"nutrețuri","dative-definite-genitive-plural":"nutrețurilor","singular-vocative":"nutrețule","plural-vocative":"nutrețurilor"}},{"word":"nutri","pos":"verb","definitions":["to feed, nourish","to eat","to indulge","to harbour, foster, cultivate (a thought, idea), entertain or cherish (a hope)"],"forms":{"canonical":"a nutri 4th conjugation","present-singular-third-person":"nutrește","participle-past":"nutrit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a nutri","gerund":"nutrind","first-person-indicative-present-singular":"nutresc","indicative-present-second-person-singular":"nutrești","indicative-present-singular-third-person":"nutrește","first-person-indicative-plural-present":"nutrim","indicative-plural-present-second-person":"nutriți","indicative-plural-present-third-person":"nutresc","first-person-imperfect-indicative-singular":"nutream","imperfect-indicative-second-person-singular":"nutreai","imperfect-indicative-singular-third-person":"nutrea","first-person-imperfect-indicative-plural":"nutream","imperfect-indicative-plural-second-person":"nutreați","imperfect-indicative-plural-third-person":"nutreau","first-person-indicative-perfect-singular":"nutrii","indicative-perfect-second-person-singular":"nutriși","indicative-perfect-singular-third-person":"nutri","first-person-indicative-perfect-plural":"nutrirăm","indicative-perfect-plural-second-person":"nutrirăți","indicative-perfect-plural-third-person":"nutriră","first-person-indicative-pluperfect-singular":"nutrisem","indicative-pluperfect-second-person-singular":"nutriseși","indicative-pluperfect-singular-third-person":"nutrise","first-person-indicative-pluperfect-plural":"nutriserăm","indicative-pluperfect-plural-second-person":"nutriserăți","indicative-pluperfect-plural-third-person":"nutriseră","first-person-present-singular-subjunctive":"să nutresc","present-second-person-singular-subjunctive":"să nutrești","present-singular-subjunctive-third-person":"să nutrească","first-person-plural-present-subjunctive":"să nutrim","plural-present-second-person-subjunctive":"să nutriți","plural-present-subjunctive-third-person":"să nutrească","imperative-second-person-singular":"nutrește","imperative-plural-second-person":"nutriți","imperative-negative-second-person-singular":"nu nutri","imperative-negative-plural-second-person":"nu nutriți"}},{"word":"nutric","pos":"verb","definitions":["first-person singular present indicative/subjunctive of nutrica"],"pronunciation":"[ˈnutrik]"},{"word":"nutrica","pos":"verb","definitions":["to sustain, feed","to spend on food"],"forms":{"canonical":"a nutrica 1st conjugation","present-singular-third-person":"nutrică","participle-past":"nutricat","subjunctive-third-person":"nutrice","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a nutrica","gerund":"nutricând","first-person-indicative-present-singular":"nutric","indicative-present-second-person-singular":"nutrici","indicative-present-singular-third-person":"nutrică","first-person-indicative-plural-present":"nutricăm","indicative-plural-present-second-person":"nutricați","indicative-plural-present-third-person":"nutrică","first-person-imperfect-indicative-singular":"nutricam","imperfect-indicative-second-person-singular":"nutricai","imperfect-indicative-singular-third-person":"nutrica","first-person-imperfect-indicative-plural":"nutricam","imperfect-indicative-plural-second-person":"nutricați","imperfect-indicative-plural-third-person":"nutricau","first-person-indicative-perfect-singular":"nutricai","indicative-perfect-second-person-singular":"nutricași","indicative-perfect-singular-third-person":"nutrică","first-person-indicative-perfect-plural":"nutricarăm","indicative-perfect-plural-second-person":"nutricarăți","indicative-perfect-plural-third-person":"nutricară","first-person-indicative-pluperfect-singular":"nutricasem","indicative-pluperfect-second-person-singular":"nutricaseși","indicative-pluperfect-singular-third-person":"nutricase","first-person-indicative-pluperfect-plural":"nutricaserăm","indicative-pluperfect-plural-second-person":"nutricaserăți","indicative-pluperfect-plural-third-person":"nutricaseră","first-person-present-singular-subjunctive":"să nutric","present-second-person-singular-subjunctive":"să nutrici","present-singular-subjunctive-third-person":"să nutrice","first-person-plural-present-subjunctive":"să nutricăm","plural-present-second-person-subjunctive":"să nutricați","plural-present-subjunctive-third-person":"să nutrice","imperative-second-person-singular":"nutrică","imperative-plural-second-person":"nutricați","imperative-negative-second-person-singular":"nu nutrica","imperative-negative-plural-second-person":"nu nutricați"}},{"word":"nutricat","pos":"verb","definitions":["past participle of nutrica"],"pronunciation":"[nutriˈkat]"},{"word":"nutrice","pos":"verb","definitions":["third-person singular/plural present subjunctive of nutrica"],"pronunciation":"[ˈnutrit͡ʃe]"},{"word":"nutrici","pos":"verb","definitions":["second-person singular present indicative/subjunctive of nutrica"],"pronunciation":"[ˈnutrit͡ʃʲ]"},{"word":"nutrie","pos":"noun","definitions":["coypu"],"forms":{"plural":"nutrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nutrie","accusative-definite-nominative-singular":"nutria","accusative-indefinite-nominative-plural":"nutrii","accusative-definite-nominative-plural":"nutriile","dative-genitive-indefinite-singular":"nutrii","dative-definite-genitive-singular":"nutriei","dative-genitive-indefinite-plural":"nutrii","dative-definite-genitive-plural":"nutriilor","singular-vocative":"nutrie","plural-vocative":"nutriilor"}},{"word":"nutriment","pos":"noun","definitions":["nutrient"],"forms":{"plural":"nutrimente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"nutriment","accusative-definite-nominative-singular":"nutrimentul","accusative-indefinite-nominative-plural":"nutrimente","accusative-definite-nominative-plural":"nutrimentele","dative-genitive-indefinite-singular":"nutriment","dative-definite-genitive-singular":"nutrimentului","dative-genitive-indefinite-plural":"nutrimente","dative-definite-genitive-plural":"nutrimentelor","singular-vocative":"nutrimentule","plural-vocative":"nutrimentelor"}},{"word":"nutrire","pos":"noun","definitions":["nutrition"],"forms":{"plural":"nutriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nutrire","accusative-definite-nominative-singular":"nutrirea","accusative-indefinite-nominative-plural":"nutriri","accusative-definite-nominative-plural":"nutririle","dative-genitive-indefinite-singular":"nutriri","dative-definite-genitive-singular":"nutririi","dative-genitive-indefinite-plural":"nutriri","dative-definite-genitive-plural":"nutririlor","singular-vocative":"nutrire","plural-vocative":"nutririlor"}},{"word":"nutrit","pos":"adj","definitions":["nurtured"],"forms":{"feminine-singular":"nutrită","masculine-plural":"nutriți","feminine-neuter-plural":"nutrite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nutrit","error-unrecognized-form-feminine-indefinite-singular":"nutrită","error-unrecognized-form-indefinite-masculine-plural":"nutriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"nutrite","definite-error-unrecognized-form-masculine-neuter-singular":"nutritul","definite-error-unrecognized-form-feminine-singular":"nutrita","definite-error-unrecognized-form-masculine-plural":"nutriții","definite-error-unrecognized-form-feminine-neuter-plural":"nutritele"}},{"word":"nutriție","pos":"noun","definitions":["nutrition"],"forms":{"plural":"nutriții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"nutriție","accusative-definite-nominative-singular":"nutriția","accusative-indefinite-nominative-plural":"nutriții","accusative-definite-nominative-plural":"nutrițiile","dative-genitive-indefinite-singular":"nutriții","dative-definite-genitive-singular":"nutriției","dative-genitive-indefinite-plural":"nutriții","dative-definite-genitive-plural":"nutrițiilor","singular-vocative":"nutriție","plural-vocative":"nutrițiilor"}},{"word":"nutriționist","pos":"noun","definitions":["nutritionist"],"pronunciation":"/nu.tri.t͡si.oˈnist/","forms":{"plural":"nutriționiști","feminine":"equivalent nutriționistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nutriționist","accusative-definite-nominative-singular":"nutriționistul","accusative-indefinite-nominative-plural":"nutriționiști","accusative-definite-nominative-plural":"nutriționiștii","dative-genitive-indefinite-singular":"nutriționist","dative-definite-genitive-singular":"nutriționistului","dative-genitive-indefinite-plural":"nutriționiști","dative-definite-genitive-plural":"nutriționiștilor","singular-vocative":"nutriționistule","plural-vocative":"nutriționiștilor"}},{"word":"nutriționistă","pos":"noun","definitions":["female equivalent of nutriționist"],"pronunciation":"/nu.tri.t͡si.oˈnis.tə/","forms":{"plural":"nutriționiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"nutriționistă","accusative-definite-nominative-singular":"nutriționista","accusative-indefinite-nominative-plural":"nutriționiste","accusative-definite-nominative-plural":"nutriționistele","dative-genitive-indefinite-singular":"nutriționiste","dative-definite-genitive-singular":"nutriționistei","dative-genitive-indefinite-plural":"nutriționiste","dative-definite-genitive-plural":"nutriționistelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"nutriționiste","pos":"noun","definitions":["plural of nutriționistă"],"gender":"f"},{"word":"nutriționiști","pos":"noun","definitions":["plural of nutriționist"],"gender":"m"},{"word":"nutrițiune","pos":"noun","definitions":["obsolete form of nutriție"],"forms":{"plural":"nutrițiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"nutrițiune","accusative-definite-nominative-singular":"nutrițiunea","accusative-indefinite-nominative-plural":"nutrițiuni","accusative-definite-nominative-plural":"nutrițiunile","dative-genitive-indefinite-singular":"nutrițiuni","dative-definite-genitive-singular":"nutrițiunii","dative-genitive-indefinite-plural":"nutrițiuni","dative-definite-genitive-plural":"nutrițiunilor","singular-vocative":"nutrițiune","plural-vocative":"nutrițiunilor"}},{"word":"nutritiv","pos":"adj","definitions":["nutritive"],"forms":{"feminine-singular":"nutritivă","masculine-plural":"nutritivi","feminine-neuter-plural":"nutritive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nutritiv","error-unrecognized-form-feminine-indefinite-singular":"nutritivă","error-unrecognized-form-indefinite-masculine-plural":"nutritivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"nutritive","definite-error-unrecognized-form-masculine-neuter-singular":"nutritivul","definite-error-unrecognized-form-feminine-singular":"nutritiva","definite-error-unrecognized-form-masculine-plural":"nutritivii","definite-error-unrecognized-form-feminine-neuter-plural":"nutritivele"}},{"word":"nutritură","pos":"noun","definitions":["nourishment"],"forms":{"plural":"nutrituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"nutritură","accusative-definite-nominative-singular":"nutritura","accusative-indefinite-nominative-plural":"nutrituri","accusative-definite-nominative-plural":"nutriturile","dative-genitive-indefinite-singular":"nutrituri","dative-definite-genitive-singular":"nutriturii","dative-genitive-indefinite-plural":"nutrituri","dative-definite-genitive-plural":"nutriturilor","singular-vocative":"nutritură","plural-vocative":"nutriturilor"}},{"word":"Nuțulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nuțulescu"}},{"word":"Nuțuloiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Nuțuloiu"}},{"word":"nuvelă","pos":"noun","definitions":["novella, short story"],"forms":{"plural":"nuvele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nuvelă","accusative-definite-nominative-singular":"nuvela","accusative-indefinite-nominative-plural":"nuvele","accusative-definite-nominative-plural":"nuvelele","dative-genitive-indefinite-singular":"nuvele","dative-definite-genitive-singular":"nuvelei","dative-genitive-indefinite-plural":"nuvele","dative-definite-genitive-plural":"nuvelelor","singular-vocative":"nuvelă","plural-vocative":"nuvelelor"}},{"word":"nuveletă","pos":"noun","definitions":["short story"],"forms":{"plural":"nuvelete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nuveletă","accusative-definite-nominative-singular":"nuveleta","accusative-indefinite-nominative-plural":"nuvelete","accusative-definite-nominative-plural":"nuveletele","dative-genitive-indefinite-singular":"nuvelete","dative-definite-genitive-singular":"nuveletei","dative-genitive-indefinite-plural":"nuvelete","dative-definite-genitive-plural":"nuveletelor","singular-vocative":"nuveletă","plural-vocative":"nuveletelor"}},{"word":"nuvelică","pos":"noun","definitions":["diminutive of nuvelă; small novella"],"forms":{"plural":"nuvelici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nuvelică","accusative-definite-nominative-singular":"nuvelica","accusative-indefinite-nominative-plural":"nuvelice","accusative-definite-nominative-plural":"nuvelicele","dative-genitive-indefinite-singular":"nuvelice","dative-definite-genitive-singular":"nuvelicei","dative-genitive-indefinite-plural":"nuvelice","dative-definite-genitive-plural":"nuvelicelor","singular-vocative":"nuvelică","plural-vocative":"nuvelicelor"}},{"word":"nuvelist","pos":"noun","definitions":["short story writer"],"forms":{"plural":"nuveliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"nuvelist","accusative-definite-nominative-singular":"nuvelistul","accusative-indefinite-nominative-plural":"nuveliști","accusative-definite-nominative-plural":"nuveliștii","dative-genitive-indefinite-singular":"nuvelist","dative-definite-genitive-singular":"nuvelistului","dative-genitive-indefinite-plural":"nuveliști","dative-definite-genitive-plural":"nuveliștilor","singular-vocative":"nuvelistule","plural-vocative":"nuveliștilor"}},{"word":"nuvelistă","pos":"noun","definitions":["female equivalent of nuvelist"],"forms":{"plural":"nuveliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"nuvelistă","accusative-definite-nominative-singular":"nuvelista","accusative-indefinite-nominative-plural":"nuveliste","accusative-definite-nominative-plural":"nuvelistele","dative-genitive-indefinite-singular":"nuveliste","dative-definite-genitive-singular":"nuvelistei","dative-genitive-indefinite-plural":"nuveliste","dative-definite-genitive-plural":"nuvelistelor","singular-vocative":"nuvelistă","plural-vocative":"nuvelistelor"}},{"word":"nuvelistic","pos":"adj","definitions":["short story"],"forms":{"feminine-singular":"nuvelistică","masculine-plural":"nuvelistici","feminine-neuter-plural":"nuvelistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"nuvelistic","error-unrecognized-form-feminine-indefinite-singular":"nuvelistică","error-unrecognized-form-indefinite-masculine-plural":"nuvelistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"nuvelistice","definite-error-unrecognized-form-masculine-neuter-singular":"nuvelisticul","definite-error-unrecognized-form-feminine-singular":"nuvelistica","definite-error-unrecognized-form-masculine-plural":"nuvelisticii","definite-error-unrecognized-form-feminine-neuter-plural":"nuvelisticele"}},{"word":"nuzi","pos":"adj","definitions":["masculine plural of nud"]}];
@@ -0,0 +1 @@
+export default [{"word":"obține","pos":"verb","definitions":["to obtain"],"pronunciation":"/obˈt͡si.ne/","forms":{"canonical":"a obține 3rd conjugation","present-singular-third-person":"obține","participle-past":"obținut","subjunctive-third-person":"obțină","table-tags":"conjugation-3","inflection-template":"ro-conj-e-ut","infinitive":"a obține","gerund":"obținând","first-person-indicative-present-singular":"obțin","indicative-present-second-person-singular":"obții","indicative-present-singular-third-person":"obține","first-person-indicative-plural-present":"obținem","indicative-plural-present-second-person":"obțineți","indicative-plural-present-third-person":"obțin","first-person-imperfect-indicative-singular":"obțineam","imperfect-indicative-second-person-singular":"obțineai","imperfect-indicative-singular-third-person":"obținea","first-person-imperfect-indicative-plural":"obțineam","imperfect-indicative-plural-second-person":"obțineați","imperfect-indicative-plural-third-person":"obțineau","first-person-indicative-perfect-singular":"obținui","indicative-perfect-second-person-singular":"obținuși","indicative-perfect-singular-third-person":"obținu","first-person-indicative-perfect-plural":"obținurăm","indicative-perfect-plural-second-person":"obținurăți","indicative-perfect-plural-third-person":"obținură","first-person-indicative-pluperfect-singular":"obținusem","indicative-pluperfect-second-person-singular":"obținuseși","indicative-pluperfect-singular-third-person":"obținuse","first-person-indicative-pluperfect-plural":"obținuserăm","indicative-pluperfect-plural-second-person":"obținuserăți","indicative-pluperfect-plural-third-person":"obținuseră","first-person-present-singular-subjunctive":"să obțin","present-second-person-singular-subjunctive":"să obții","present-singular-subjunctive-third-person":"să obțină","first-person-plural-present-subjunctive":"să obținem","plural-present-second-person-subjunctive":"să obțineți","plural-present-subjunctive-third-person":"să obțină","imperative-second-person-singular":"obține","imperative-plural-second-person":"obțineți","imperative-negative-second-person-singular":"nu obține","imperative-negative-plural-second-person":"nu obțineți"}},{"word":"obținere","pos":"noun","definitions":["attainment"],"pronunciation":"/obˈt͡si.ne.re/","forms":{"plural":"obțineri","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"obținere","accusative-definite-nominative-singular":"obținerea","accusative-indefinite-nominative-plural":"obțineri","accusative-definite-nominative-plural":"obținerile","dative-genitive-indefinite-singular":"obțineri","dative-definite-genitive-singular":"obținerii","dative-genitive-indefinite-plural":"obțineri","dative-definite-genitive-plural":"obținerilor","singular-vocative":"-","plural-vocative":"-"}},{"word":"obtura","pos":"verb","definitions":["to clog"],"forms":{"canonical":"a obtura 1st conjugation","present-singular-third-person":"obturează","participle-past":"obturat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a obtura","gerund":"obturând","first-person-indicative-present-singular":"obturez","indicative-present-second-person-singular":"obturezi","indicative-present-singular-third-person":"obturează","first-person-indicative-plural-present":"obturăm","indicative-plural-present-second-person":"obturați","indicative-plural-present-third-person":"obturează","first-person-imperfect-indicative-singular":"obturam","imperfect-indicative-second-person-singular":"obturai","imperfect-indicative-singular-third-person":"obtura","first-person-imperfect-indicative-plural":"obturam","imperfect-indicative-plural-second-person":"obturați","imperfect-indicative-plural-third-person":"obturau","first-person-indicative-perfect-singular":"obturai","indicative-perfect-second-person-singular":"obturași","indicative-perfect-singular-third-person":"obtură","first-person-indicative-perfect-plural":"obturarăm","indicative-perfect-plural-second-person":"obturarăți","indicative-perfect-plural-third-person":"obturară","first-person-indicative-pluperfect-singular":"obturasem","indicative-pluperfect-second-person-singular":"obturaseși","indicative-pluperfect-singular-third-person":"obturase","first-person-indicative-pluperfect-plural":"obturaserăm","indicative-pluperfect-plural-second-person":"obturaserăți","indicative-pluperfect-plural-third-person":"obturaseră","first-person-present-singular-subjunctive":"să obturez","present-second-person-singular-subjunctive":"să obturezi","present-singular-subjunctive-third-person":"să obtureze","first-person-plural-present-subjunctive":"să obturăm","plural-present-second-person-subjunctive":"să obturați","plural-present-subjunctive-third-person":"să obtureze","imperative-second-person-singular":"obturează","imperative-plural-second-person":"obturați","imperative-negative-second-person-singular":"nu obtura","imperative-negative-plural-second-person":"nu obturați"}},{"word":"obturant","pos":"adj","definitions":["clogging"],"forms":{"feminine-singular":"obturantă","masculine-plural":"obturanți","feminine-neuter-plural":"obturante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"obturant","error-unrecognized-form-feminine-indefinite-singular":"obturantă","error-unrecognized-form-indefinite-masculine-plural":"obturanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"obturante","definite-error-unrecognized-form-masculine-neuter-singular":"obturantul","definite-error-unrecognized-form-feminine-singular":"obturanta","definite-error-unrecognized-form-masculine-plural":"obturanții","definite-error-unrecognized-form-feminine-neuter-plural":"obturantele"}},{"word":"obturare","pos":"noun","definitions":["obturation"],"forms":{"plural":"obturări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"obturare","accusative-definite-nominative-singular":"obturarea","accusative-indefinite-nominative-plural":"obturări","accusative-definite-nominative-plural":"obturările","dative-genitive-indefinite-singular":"obturări","dative-definite-genitive-singular":"obturării","dative-genitive-indefinite-plural":"obturări","dative-definite-genitive-plural":"obturărilor","singular-vocative":"obturare","plural-vocative":"obturărilor"}},{"word":"obturat","pos":"adj","definitions":["blocked, clogged"],"forms":{"feminine-singular":"obturată","masculine-plural":"obturați","feminine-neuter-plural":"obturate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"obturat","error-unrecognized-form-feminine-indefinite-singular":"obturată","error-unrecognized-form-indefinite-masculine-plural":"obturați","error-unrecognized-form-feminine-indefinite-neuter-plural":"obturate","definite-error-unrecognized-form-masculine-neuter-singular":"obturatul","definite-error-unrecognized-form-feminine-singular":"obturata","definite-error-unrecognized-form-masculine-plural":"obturații","definite-error-unrecognized-form-feminine-neuter-plural":"obturatele"}},{"word":"obturat","pos":"verb","definitions":["past participle of obtura"],"forms":{"participle-past":"of obtura"}},{"word":"obturație","pos":"noun","definitions":["obturation","filling"],"forms":{"plural":"obturații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"obturație","accusative-definite-nominative-singular":"obturația","accusative-indefinite-nominative-plural":"obturații","accusative-definite-nominative-plural":"obturațiile","dative-genitive-indefinite-singular":"obturații","dative-definite-genitive-singular":"obturației","dative-genitive-indefinite-plural":"obturații","dative-definite-genitive-plural":"obturațiilor","singular-vocative":"obturație","plural-vocative":"obturațiilor"}},{"word":"obturațiune","pos":"noun","definitions":["obsolete form of obturație"],"forms":{"plural":"obturațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"obturațiune","accusative-definite-nominative-singular":"obturațiunea","accusative-indefinite-nominative-plural":"obturațiuni","accusative-definite-nominative-plural":"obturațiunile","dative-genitive-indefinite-singular":"obturațiuni","dative-definite-genitive-singular":"obturațiunii","dative-genitive-indefinite-plural":"obturațiuni","dative-definite-genitive-plural":"obturațiunilor","singular-vocative":"obturațiune","plural-vocative":"obturațiunilor"}},{"word":"obturator","pos":"noun","definitions":["shutter"],"forms":{"plural":"obturatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"obturator","accusative-definite-nominative-singular":"obturatorul","accusative-indefinite-nominative-plural":"obturatoare","accusative-definite-nominative-plural":"obturatoarele","dative-genitive-indefinite-singular":"obturator","dative-definite-genitive-singular":"obturatorului","dative-genitive-indefinite-plural":"obturatoare","dative-definite-genitive-plural":"obturatoarelor","singular-vocative":"obturatorule","plural-vocative":"obturatoarelor"}},{"word":"obtuz","pos":"adj","definitions":["obtuse"],"forms":{"feminine-singular":"obtuză","masculine-plural":"obtuzi","feminine-neuter-plural":"obtuze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"obtuz","error-unrecognized-form-feminine-indefinite-singular":"obtuză","error-unrecognized-form-indefinite-masculine-plural":"obtuzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"obtuze","definite-error-unrecognized-form-masculine-neuter-singular":"obtuzul","definite-error-unrecognized-form-feminine-singular":"obtuza","definite-error-unrecognized-form-masculine-plural":"obtuzii","definite-error-unrecognized-form-feminine-neuter-plural":"obtuzele"}},{"word":"obtuzitate","pos":"noun","definitions":["obtuseness"],"forms":{"plural":"obtuzități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"obtuzitate","accusative-definite-nominative-singular":"obtuzitatea","accusative-indefinite-nominative-plural":"obtuzități","accusative-definite-nominative-plural":"obtuzitățile","dative-genitive-indefinite-singular":"obtuzități","dative-definite-genitive-singular":"obtuzității","dative-genitive-indefinite-plural":"obtuzități","dative-definite-genitive-plural":"obtuzităților","singular-vocative":"obtuzitate","plural-vocative":"obtuzităților"}},{"word":"obtuziune","pos":"noun","definitions":["obtuseness"],"forms":{"plural":"obtuziuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"obtuziune","accusative-definite-nominative-singular":"obtuziunea","accusative-indefinite-nominative-plural":"obtuziune","accusative-definite-nominative-plural":"obtuziunele","dative-genitive-indefinite-singular":"obtuziune","dative-definite-genitive-singular":"obtuziunei","dative-genitive-indefinite-plural":"obtuziune","dative-definite-genitive-plural":"obtuziunelor","singular-vocative":"obtuziune","plural-vocative":"obtuziunelor"}},{"word":"obtuzunghi","pos":"adj","definitions":["alternative form of obtuzunghic"],"forms":{"feminine-singular":"obtuzunghe","masculine-plural":"obtuzunghi","feminine-neuter-plural":"obtuzunghe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"obtuzunghi","error-unrecognized-form-feminine-indefinite-singular":"obtuzunghe","error-unrecognized-form-indefinite-masculine-plural":"obtuzunghi","error-unrecognized-form-feminine-indefinite-neuter-plural":"obtuzunghe","definite-error-unrecognized-form-masculine-neuter-singular":"obtuzunghiul","definite-error-unrecognized-form-feminine-singular":"obtuzunghea","definite-error-unrecognized-form-masculine-plural":"obtuzunghii","definite-error-unrecognized-form-feminine-neuter-plural":"obtuzunghele"}},{"word":"obtuzunghic","pos":"adj","definitions":["obtuse"],"forms":{"feminine-singular":"obtuzunghică","masculine-plural":"obtuzunghici","feminine-neuter-plural":"obtuzunghice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"obtuzunghic","error-unrecognized-form-feminine-indefinite-singular":"obtuzunghică","error-unrecognized-form-indefinite-masculine-plural":"obtuzunghici","error-unrecognized-form-feminine-indefinite-neuter-plural":"obtuzunghice","definite-error-unrecognized-form-masculine-neuter-singular":"obtuzunghicul","definite-error-unrecognized-form-feminine-singular":"obtuzunghica","definite-error-unrecognized-form-masculine-plural":"obtuzunghicii","definite-error-unrecognized-form-feminine-neuter-plural":"obtuzunghicele"}},{"word":"obuduet","pos":"noun","definitions":["a gift to the Sultan"],"forms":{"plural":"obudueturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"obuduet","accusative-definite-nominative-singular":"obuduetul","accusative-indefinite-nominative-plural":"obudueturi","accusative-definite-nominative-plural":"obudueturile","dative-genitive-indefinite-singular":"obuduet","dative-definite-genitive-singular":"obuduetului","dative-genitive-indefinite-plural":"obudueturi","dative-definite-genitive-plural":"obudueturilor","singular-vocative":"obuduetule","plural-vocative":"obudueturilor"}},{"word":"obuz","pos":"noun","definitions":["shell (projectile)"],"forms":{"plural":"obuze","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"obuz","accusative-definite-nominative-singular":"obuzul","accusative-indefinite-nominative-plural":"obuze","accusative-definite-nominative-plural":"obuzele","dative-genitive-indefinite-singular":"obuz","dative-definite-genitive-singular":"obuzului","dative-genitive-indefinite-plural":"obuze","dative-definite-genitive-plural":"obuzelor","singular-vocative":"obuzule","plural-vocative":"obuzelor"}},{"word":"obuzier","pos":"noun","definitions":["howitzer"],"forms":{"plural":"obuziere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"obuzier","accusative-definite-nominative-singular":"obuzierul","accusative-indefinite-nominative-plural":"obuziere","accusative-definite-nominative-plural":"obuzierele","dative-genitive-indefinite-singular":"obuzier","dative-definite-genitive-singular":"obuzierului","dative-genitive-indefinite-plural":"obuziere","dative-definite-genitive-plural":"obuzierelor","singular-vocative":"obuzierule","plural-vocative":"obuzierelor"}},{"word":"obvers","pos":"adj","definitions":["obverse"],"forms":{"feminine-singular":"obversă","masculine-plural":"obverși","feminine-neuter-plural":"obverse","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"obvers","error-unrecognized-form-feminine-indefinite-singular":"obversă","error-unrecognized-form-indefinite-masculine-plural":"obverși","error-unrecognized-form-feminine-indefinite-neuter-plural":"obverse","definite-error-unrecognized-form-masculine-neuter-singular":"obversul","definite-error-unrecognized-form-feminine-singular":"obversa","definite-error-unrecognized-form-masculine-plural":"obverșii","definite-error-unrecognized-form-feminine-neuter-plural":"obversele"}},{"word":"obversiune","pos":"noun","definitions":["obversion"],"forms":{"plural":"obversiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"obversiune","accusative-definite-nominative-singular":"obversiunea","accusative-indefinite-nominative-plural":"obversiune","accusative-definite-nominative-plural":"obversiunele","dative-genitive-indefinite-singular":"obversiune","dative-definite-genitive-singular":"obversiunei","dative-genitive-indefinite-plural":"obversiune","dative-definite-genitive-plural":"obversiunelor","singular-vocative":"obversiune","plural-vocative":"obversiunelor"}},{"word":"oca","pos":"noun","definitions":["weight of about three pounds","liquid measure of about three pints"],"pronunciation":"/oˈka/","forms":{"plural":"ocale","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oca","accusative-definite-nominative-singular":"ocaua","accusative-indefinite-nominative-plural":"ocale","accusative-definite-nominative-plural":"ocalele","dative-genitive-indefinite-singular":"oca","dative-definite-genitive-singular":"ocauaui","dative-genitive-indefinite-plural":"ocale","dative-definite-genitive-plural":"ocalelor","singular-vocative":"ocauae","plural-vocative":"ocalelor"}},{"word":"ocă","pos":"noun","definitions":["alternative form of oca"],"forms":{"plural":"oci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ocă","accusative-definite-nominative-singular":"oca","accusative-indefinite-nominative-plural":"oci","accusative-definite-nominative-plural":"ocile","dative-genitive-indefinite-singular":"oci","dative-definite-genitive-singular":"ocii","dative-genitive-indefinite-plural":"oci","dative-definite-genitive-plural":"ocilor","singular-vocative":"ocă","plural-vocative":"ocilor"}},{"word":"ocăcăi","pos":"verb","definitions":["to croak"],"forms":{"canonical":"a ocăcăi 4th conjugation","present-singular-third-person":"ocăcăie","participle-past":"ocăcăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a ocăcăi","gerund":"ocăcăind","first-person-indicative-present-singular":"ocăcăi","indicative-present-second-person-singular":"ocăcăi","indicative-present-singular-third-person":"ocăcăie","first-person-indicative-plural-present":"ocăcăim","indicative-plural-present-second-person":"ocăcăiți","indicative-plural-present-third-person":"ocăcăie","first-person-imperfect-indicative-singular":"ocăcăiam","imperfect-indicative-second-person-singular":"ocăcăiai","imperfect-indicative-singular-third-person":"ocăcăia","first-person-imperfect-indicative-plural":"ocăcăiam","imperfect-indicative-plural-second-person":"ocăcăiați","imperfect-indicative-plural-third-person":"ocăcăiau","first-person-indicative-perfect-singular":"ocăcăii","indicative-perfect-second-person-singular":"ocăcăiși","indicative-perfect-singular-third-person":"ocăcăi","first-person-indicative-perfect-plural":"ocăcăirăm","indicative-perfect-plural-second-person":"ocăcăirăți","indicative-perfect-plural-third-person":"ocăcăiră","first-person-indicative-pluperfect-singular":"ocăcăisem","indicative-pluperfect-second-person-singular":"ocăcăiseși","indicative-pluperfect-singular-third-person":"ocăcăise","first-person-indicative-pluperfect-plural":"ocăcăiserăm","indicative-pluperfect-plural-second-person":"ocăcăiserăți","indicative-pluperfect-plural-third-person":"ocăcăiseră","first-person-present-singular-subjunctive":"să ocăcăi","present-second-person-singular-subjunctive":"să ocăcăi","present-singular-subjunctive-third-person":"să ocăcăie","first-person-plural-present-subjunctive":"să ocăcăim","plural-present-second-person-subjunctive":"să ocăcăiți","plural-present-subjunctive-third-person":"să ocăcăie","imperative-second-person-singular":"ocăcăie","imperative-plural-second-person":"ocăcăiți","imperative-negative-second-person-singular":"nu ocăcăi","imperative-negative-plural-second-person":"nu ocăcăiți"}},{"word":"ocăcăială","pos":"noun","definitions":["croaking"],"forms":{"plural":"ocăcăieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ocăcăială","accusative-definite-nominative-singular":"ocăcăiala","accusative-indefinite-nominative-plural":"ocăcăiele","accusative-definite-nominative-plural":"ocăcăielele","dative-genitive-indefinite-singular":"ocăcăiele","dative-definite-genitive-singular":"ocăcăielei","dative-genitive-indefinite-plural":"ocăcăiele","dative-definite-genitive-plural":"ocăcăielelor","singular-vocative":"ocăcăială","plural-vocative":"ocăcăielelor"}},{"word":"ocaianic","pos":"noun","definitions":["deplorable"],"forms":{"plural":"ocaianici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ocaianic","accusative-definite-nominative-singular":"ocaianicul","accusative-indefinite-nominative-plural":"ocaianici","accusative-definite-nominative-plural":"ocaianicii","dative-genitive-indefinite-singular":"ocaianic","dative-definite-genitive-singular":"ocaianicului","dative-genitive-indefinite-plural":"ocaianici","dative-definite-genitive-plural":"ocaianicilor","singular-vocative":"ocaianicule","plural-vocative":"ocaianicilor"}},{"word":"ocăinicie","pos":"noun","definitions":["despair"],"forms":{"plural":"ocăinicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ocăinicie","accusative-definite-nominative-singular":"ocăinicia","accusative-indefinite-nominative-plural":"ocăinicii","accusative-definite-nominative-plural":"ocăiniciile","dative-genitive-indefinite-singular":"ocăinicii","dative-definite-genitive-singular":"ocăiniciei","dative-genitive-indefinite-plural":"ocăinicii","dative-definite-genitive-plural":"ocăiniciilor","singular-vocative":"ocăinicie","plural-vocative":"ocăiniciilor"}},{"word":"ocăit","pos":"noun","definitions":["quack (of a duck)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ocăit","accusative-definite-nominative":"ocăitul","dative-genitive-indefinite":"ocăit","dative-definite-genitive":"ocăitului","vocative":"ocăitule"}},{"word":"ocăit","pos":"verb","definitions":["past participle of ocăi"],"forms":{"participle-past":"of ocăi"}},{"word":"ocale","pos":"noun","definitions":["plural of oca"],"gender":"f"},{"word":"ocăluță","pos":"noun","definitions":["diminutive of oca"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"ocăluță","accusative-definite-nominative":"ocăluța","dative-genitive-indefinite":"ocăluțe","dative-definite-genitive":"ocăluței","vocative":"ocăluță"}},{"word":"ocară","pos":"noun","definitions":["shame, disgrace","insult, abuse"],"forms":{"plural":"ocări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ocară","accusative-definite-nominative-singular":"ocara","accusative-indefinite-nominative-plural":"ocări","accusative-definite-nominative-plural":"ocările","dative-genitive-indefinite-singular":"ocări","dative-definite-genitive-singular":"ocării","dative-genitive-indefinite-plural":"ocări","dative-definite-genitive-plural":"ocărilor","singular-vocative":"ocară","plural-vocative":"ocărilor"}},{"word":"ocărâre","pos":"noun","definitions":["rebuke"],"forms":{"plural":"ocărâri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ocărâre","accusative-definite-nominative-singular":"ocărârea","accusative-indefinite-nominative-plural":"ocărâri","accusative-definite-nominative-plural":"ocărârile","dative-genitive-indefinite-singular":"ocărâri","dative-definite-genitive-singular":"ocărârii","dative-genitive-indefinite-plural":"ocărâri","dative-definite-genitive-plural":"ocărârilor","singular-vocative":"ocărâre","plural-vocative":"ocărârilor"}},{"word":"ocărâtor","pos":"adj","definitions":["insulting"],"forms":{"feminine-singular":"ocărâtoare","masculine-plural":"ocărâtori","feminine-neuter-plural":"ocărâtoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ocărâtor","error-unrecognized-form-feminine-indefinite-singular":"ocărâtoare","error-unrecognized-form-indefinite-masculine-plural":"ocărâtori","error-unrecognized-form-feminine-indefinite-neuter-plural":"ocărâtoare","definite-error-unrecognized-form-masculine-neuter-singular":"ocărâtorul","definite-error-unrecognized-form-feminine-singular":"ocărâtoarea","definite-error-unrecognized-form-masculine-plural":"ocărâtorii","definite-error-unrecognized-form-feminine-neuter-plural":"ocărâtoarele"}},{"word":"ocări","pos":"verb","definitions":["alternative form of ocărî"],"forms":{"canonical":"a ocări 4th conjugation","present-singular-third-person":"ocărește","participle-past":"ocărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ocări","gerund":"ocărind","first-person-indicative-present-singular":"ocăresc","indicative-present-second-person-singular":"ocărești","indicative-present-singular-third-person":"ocărește","first-person-indicative-plural-present":"ocărim","indicative-plural-present-second-person":"ocăriți","indicative-plural-present-third-person":"ocăresc","first-person-imperfect-indicative-singular":"ocăream","imperfect-indicative-second-person-singular":"ocăreai","imperfect-indicative-singular-third-person":"ocărea","first-person-imperfect-indicative-plural":"ocăream","imperfect-indicative-plural-second-person":"ocăreați","imperfect-indicative-plural-third-person":"ocăreau","first-person-indicative-perfect-singular":"ocării","indicative-perfect-second-person-singular":"ocăriși","indicative-perfect-singular-third-person":"ocări","first-person-indicative-perfect-plural":"ocărirăm","indicative-perfect-plural-second-person":"ocărirăți","indicative-perfect-plural-third-person":"ocăriră","first-person-indicative-pluperfect-singular":"ocărisem","indicative-pluperfect-second-person-singular":"ocăriseși","indicative-pluperfect-singular-third-person":"ocărise","first-person-indicative-pluperfect-plural":"ocăriserăm","indicative-pluperfect-plural-second-person":"ocăriserăți","indicative-pluperfect-plural-third-person":"ocăriseră","first-person-present-singular-subjunctive":"să ocăresc","present-second-person-singular-subjunctive":"să ocărești","present-singular-subjunctive-third-person":"să ocărească","first-person-plural-present-subjunctive":"să ocărim","plural-present-second-person-subjunctive":"să ocăriți","plural-present-subjunctive-third-person":"să ocărească","imperative-second-person-singular":"ocărește","imperative-plural-second-person":"ocăriți","imperative-negative-second-person-singular":"nu ocări","imperative-negative-plural-second-person":"nu ocăriți"}},{"word":"ocărî","pos":"verb","definitions":["to insult, abuse, curse, speak ill of"],"examples":[{"ro":"Să faci toată viața parte dintr-un partid și deodată să te superi și să începi a-l ocărî pentru că unii dintre mulțimea membrilor lui nu-ți mai plac d-tale, sau nu corespund vederilor d-tale etice, asta nu va să zică a face politică.","en":"To be a member of a party your entire life and to get suddenly offended and start to speak ill of it because you don't like a few of its members anymore, or because they don't align with your ethical views—that you cannot call doing politics."}],"forms":{"canonical":"a ocărî 4th conjugation","present-singular-third-person":"ocărăște","participle-past":"ocărât","table-tags":"conjugation-4","inflection-template":"ro-conj-î-ăsc","infinitive":"a ocărî","gerund":"ocărând","first-person-indicative-present-singular":"ocărăsc","indicative-present-second-person-singular":"ocărăști","indicative-present-singular-third-person":"ocărăște","first-person-indicative-plural-present":"ocărâm","indicative-plural-present-second-person":"ocărâți","indicative-plural-present-third-person":"ocărăsc","first-person-imperfect-indicative-singular":"ocăram","imperfect-indicative-second-person-singular":"ocărai","imperfect-indicative-singular-third-person":"ocăra","first-person-imperfect-indicative-plural":"ocăram","imperfect-indicative-plural-second-person":"ocărați","imperfect-indicative-plural-third-person":"ocărau","first-person-indicative-perfect-singular":"ocărâi","indicative-perfect-second-person-singular":"ocărâși","indicative-perfect-singular-third-person":"ocărî","first-person-indicative-perfect-plural":"ocărârăm","indicative-perfect-plural-second-person":"ocărârăți","indicative-perfect-plural-third-person":"ocărâră","first-person-indicative-pluperfect-singular":"ocărâsem","indicative-pluperfect-second-person-singular":"ocărâseși","indicative-pluperfect-singular-third-person":"ocărâse","first-person-indicative-pluperfect-plural":"ocărâserăm","indicative-pluperfect-plural-second-person":"ocărâserăți","indicative-pluperfect-plural-third-person":"ocărâseră","first-person-present-singular-subjunctive":"să ocărăsc","present-second-person-singular-subjunctive":"să ocărăști","present-singular-subjunctive-third-person":"să ocărască","first-person-plural-present-subjunctive":"să ocărâm","plural-present-second-person-subjunctive":"să ocărâți","plural-present-subjunctive-third-person":"să ocărască","imperative-second-person-singular":"ocărăște","imperative-plural-second-person":"ocărâți","imperative-negative-second-person-singular":"nu ocărî","imperative-negative-plural-second-person":"nu ocărâți"}},{"word":"ocarină","pos":"noun","definitions":["ocarina"],"forms":{"plural":"ocarine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ocarină","accusative-definite-nominative-singular":"ocarina","accusative-indefinite-nominative-plural":"ocarine","accusative-definite-nominative-plural":"ocarinele","dative-genitive-indefinite-singular":"ocarine","dative-definite-genitive-singular":"ocarinei","dative-genitive-indefinite-plural":"ocarine","dative-definite-genitive-plural":"ocarinelor","singular-vocative":"ocarină","plural-vocative":"ocarinelor"}},{"word":"ocârmi","pos":"verb","definitions":["to feed"],"forms":{"canonical":"a ocârmi 4th conjugation","present-singular-third-person":"ocârmie","participle-past":"ocârmit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a ocârmi","gerund":"ocârmind","first-person-indicative-present-singular":"ocârm","indicative-present-second-person-singular":"ocârmi","indicative-present-singular-third-person":"ocârme","first-person-indicative-plural-present":"ocârmim","indicative-plural-present-second-person":"ocârmiți","indicative-plural-present-third-person":"ocârm","first-person-imperfect-indicative-singular":"ocârmeam","imperfect-indicative-second-person-singular":"ocârmeai","imperfect-indicative-singular-third-person":"ocârmea","first-person-imperfect-indicative-plural":"ocârmeam","imperfect-indicative-plural-second-person":"ocârmeați","imperfect-indicative-plural-third-person":"ocârmeau","first-person-indicative-perfect-singular":"ocârmii","indicative-perfect-second-person-singular":"ocârmiși","indicative-perfect-singular-third-person":"ocârmi","first-person-indicative-perfect-plural":"ocârmirăm","indicative-perfect-plural-second-person":"ocârmirăți","indicative-perfect-plural-third-person":"ocârmiră","first-person-indicative-pluperfect-singular":"ocârmisem","indicative-pluperfect-second-person-singular":"ocârmiseși","indicative-pluperfect-singular-third-person":"ocârmise","first-person-indicative-pluperfect-plural":"ocârmiserăm","indicative-pluperfect-plural-second-person":"ocârmiserăți","indicative-pluperfect-plural-third-person":"ocârmiseră","first-person-present-singular-subjunctive":"să ocârm","present-second-person-singular-subjunctive":"să ocârmi","present-singular-subjunctive-third-person":"să ocârmă","first-person-plural-present-subjunctive":"să ocârmim","plural-present-second-person-subjunctive":"să ocârmiți","plural-present-subjunctive-third-person":"să ocârmă","imperative-second-person-singular":"ocârme","imperative-plural-second-person":"ocârmiți","imperative-negative-second-person-singular":"nu ocârmi","imperative-negative-plural-second-person":"nu ocârmiți"}},{"word":"ocârmui","pos":"verb","definitions":["to rule"],"forms":{"canonical":"a ocârmui 4th conjugation","present-singular-third-person":"ocârmuiește","participle-past":"ocârmuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ocârmui","gerund":"ocârmuind","first-person-indicative-present-singular":"ocârmuiesc","indicative-present-second-person-singular":"ocârmuiești","indicative-present-singular-third-person":"ocârmuiește","first-person-indicative-plural-present":"ocârmuim","indicative-plural-present-second-person":"ocârmuiți","indicative-plural-present-third-person":"ocârmuiesc","first-person-imperfect-indicative-singular":"ocârmuiam","imperfect-indicative-second-person-singular":"ocârmuiai","imperfect-indicative-singular-third-person":"ocârmuia","first-person-imperfect-indicative-plural":"ocârmuiam","imperfect-indicative-plural-second-person":"ocârmuiați","imperfect-indicative-plural-third-person":"ocârmuiau","first-person-indicative-perfect-singular":"ocârmuii","indicative-perfect-second-person-singular":"ocârmuiși","indicative-perfect-singular-third-person":"ocârmui","first-person-indicative-perfect-plural":"ocârmuirăm","indicative-perfect-plural-second-person":"ocârmuirăți","indicative-perfect-plural-third-person":"ocârmuiră","first-person-indicative-pluperfect-singular":"ocârmuisem","indicative-pluperfect-second-person-singular":"ocârmuiseși","indicative-pluperfect-singular-third-person":"ocârmuise","first-person-indicative-pluperfect-plural":"ocârmuiserăm","indicative-pluperfect-plural-second-person":"ocârmuiserăți","indicative-pluperfect-plural-third-person":"ocârmuiseră","first-person-present-singular-subjunctive":"să ocârmuiesc","present-second-person-singular-subjunctive":"să ocârmuiești","present-singular-subjunctive-third-person":"să ocârmuiască","first-person-plural-present-subjunctive":"să ocârmuim","plural-present-second-person-subjunctive":"să ocârmuiți","plural-present-subjunctive-third-person":"să ocârmuiască","imperative-second-person-singular":"ocârmuiește","imperative-plural-second-person":"ocârmuiți","imperative-negative-second-person-singular":"nu ocârmui","imperative-negative-plural-second-person":"nu ocârmuiți"}},{"word":"ocârmuire","pos":"noun","definitions":["leadership, government"],"forms":{"plural":"ocărmuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ocârmuire","accusative-definite-nominative-singular":"ocârmuirea","accusative-indefinite-nominative-plural":"ocărmuiri","accusative-definite-nominative-plural":"ocărmuirile","dative-genitive-indefinite-singular":"ocărmuiri","dative-definite-genitive-singular":"ocărmuirii","dative-genitive-indefinite-plural":"ocărmuiri","dative-definite-genitive-plural":"ocărmuirilor","singular-vocative":"ocârmuire","plural-vocative":"ocărmuirilor"}},{"word":"ocârmuit","pos":"adj","definitions":["administrated"],"forms":{"feminine-singular":"ocârmuită","masculine-plural":"ocârmuiți","feminine-neuter-plural":"ocârmuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ocârmuit","error-unrecognized-form-feminine-indefinite-singular":"ocârmuită","error-unrecognized-form-indefinite-masculine-plural":"ocârmuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ocârmuite","definite-error-unrecognized-form-masculine-neuter-singular":"ocârmuitul","definite-error-unrecognized-form-feminine-singular":"ocârmuita","definite-error-unrecognized-form-masculine-plural":"ocârmuiții","definite-error-unrecognized-form-feminine-neuter-plural":"ocârmuitele"}},{"word":"ocârmuit","pos":"verb","definitions":["past participle of ocârmui"],"forms":{"participle-past":"of ocârmui"}},{"word":"ocârmuitoare","pos":"noun","definitions":["female equivalent of ocârmuitor"],"forms":{"plural":"ocârmuitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"ocârmuitoare","accusative-definite-nominative-singular":"ocârmuitoarea","accusative-indefinite-nominative-plural":"ocârmuitoare","accusative-definite-nominative-plural":"ocârmuitoarele","dative-genitive-indefinite-singular":"ocârmuitoare","dative-definite-genitive-singular":"ocârmuitoarei","dative-genitive-indefinite-plural":"ocârmuitoare","dative-definite-genitive-plural":"ocârmuitoarelor","singular-vocative":"ocârmuitoare","plural-vocative":"ocârmuitoarelor"}},{"word":"ocârmuitor","pos":"adj","definitions":["ruler"],"forms":{"feminine-singular":"ocârmuitoare","masculine-plural":"ocârmuitori","feminine-neuter-plural":"ocârmuitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ocârmuitor","error-unrecognized-form-feminine-indefinite-singular":"ocârmuitoare","error-unrecognized-form-indefinite-masculine-plural":"ocârmuitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"ocârmuitoare","definite-error-unrecognized-form-masculine-neuter-singular":"ocârmuitorul","definite-error-unrecognized-form-feminine-singular":"ocârmuitoarea","definite-error-unrecognized-form-masculine-plural":"ocârmuitorii","definite-error-unrecognized-form-feminine-neuter-plural":"ocârmuitoarele"}},{"word":"ocârmuitor","pos":"noun","definitions":["ruler"],"forms":{"plural":"ocârmuitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ocârmuitor","accusative-definite-nominative-singular":"ocârmuitorul","accusative-indefinite-nominative-plural":"ocârmuitori","accusative-definite-nominative-plural":"ocârmuitorii","dative-genitive-indefinite-singular":"ocârmuitor","dative-definite-genitive-singular":"ocârmuitorului","dative-genitive-indefinite-plural":"ocârmuitori","dative-definite-genitive-plural":"ocârmuitorilor","singular-vocative":"ocârmuitorule","plural-vocative":"ocârmuitorilor"}},{"word":"ocarnic","pos":"adj","definitions":["disgraceful"],"forms":{"feminine-singular":"ocarnică","masculine-plural":"ocarnici","feminine-neuter-plural":"ocarnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ocarnic","error-unrecognized-form-feminine-indefinite-singular":"ocarnică","error-unrecognized-form-indefinite-masculine-plural":"ocarnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ocarnice","definite-error-unrecognized-form-masculine-neuter-singular":"ocarnicul","definite-error-unrecognized-form-feminine-singular":"ocarnica","definite-error-unrecognized-form-masculine-plural":"ocarnicii","definite-error-unrecognized-form-feminine-neuter-plural":"ocarnicele"}},{"word":"ocazie","pos":"noun","definitions":["occasion"],"forms":{"plural":"ocazii"}},{"word":"ocaziona","pos":"verb","definitions":["to provoke, to cause"],"forms":{"canonical":"a ocaziona 1st conjugation","present-singular-third-person":"ocazionează","participle-past":"ocazionat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ocaziona","gerund":"ocazionând","first-person-indicative-present-singular":"ocazionez","indicative-present-second-person-singular":"ocazionezi","indicative-present-singular-third-person":"ocazionează","first-person-indicative-plural-present":"ocazionăm","indicative-plural-present-second-person":"ocazionați","indicative-plural-present-third-person":"ocazionează","first-person-imperfect-indicative-singular":"ocazionam","imperfect-indicative-second-person-singular":"ocazionai","imperfect-indicative-singular-third-person":"ocaziona","first-person-imperfect-indicative-plural":"ocazionam","imperfect-indicative-plural-second-person":"ocazionați","imperfect-indicative-plural-third-person":"ocazionau","first-person-indicative-perfect-singular":"ocazionai","indicative-perfect-second-person-singular":"ocazionași","indicative-perfect-singular-third-person":"ocazionă","first-person-indicative-perfect-plural":"ocazionarăm","indicative-perfect-plural-second-person":"ocazionarăți","indicative-perfect-plural-third-person":"ocazionară","first-person-indicative-pluperfect-singular":"ocazionasem","indicative-pluperfect-second-person-singular":"ocazionaseși","indicative-pluperfect-singular-third-person":"ocazionase","first-person-indicative-pluperfect-plural":"ocazionaserăm","indicative-pluperfect-plural-second-person":"ocazionaserăți","indicative-pluperfect-plural-third-person":"ocazionaseră","first-person-present-singular-subjunctive":"să ocazionez","present-second-person-singular-subjunctive":"să ocazionezi","present-singular-subjunctive-third-person":"să ocazioneze","first-person-plural-present-subjunctive":"să ocazionăm","plural-present-second-person-subjunctive":"să ocazionați","plural-present-subjunctive-third-person":"să ocazioneze","imperative-second-person-singular":"ocazionează","imperative-plural-second-person":"ocazionați","imperative-negative-second-person-singular":"nu ocaziona","imperative-negative-plural-second-person":"nu ocazionați"}},{"word":"ocazional","pos":"adj","definitions":["occasional"],"forms":{"feminine-singular":"ocazională","masculine-plural":"ocazionali","feminine-neuter-plural":"ocazionale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ocazional","error-unrecognized-form-feminine-indefinite-singular":"ocazională","error-unrecognized-form-indefinite-masculine-plural":"ocazionali","error-unrecognized-form-feminine-indefinite-neuter-plural":"ocazionale","definite-error-unrecognized-form-masculine-neuter-singular":"ocazionalul","definite-error-unrecognized-form-feminine-singular":"ocazionala","definite-error-unrecognized-form-masculine-plural":"ocazionalii","definite-error-unrecognized-form-feminine-neuter-plural":"ocazionalele"}},{"word":"ocazional","pos":"adv","definitions":["occasionally, sometimes"]},{"word":"ocazionalism","pos":"noun","definitions":["occasionalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ocazionalism","accusative-definite-nominative-singular":"ocazionalismul","accusative-indefinite-nominative-plural":"ocazionalisme","accusative-definite-nominative-plural":"ocazionalismele","dative-genitive-indefinite-singular":"ocazionalism","dative-definite-genitive-singular":"ocazionalismului","dative-genitive-indefinite-plural":"ocazionalisme","dative-definite-genitive-plural":"ocazionalismelor","singular-vocative":"ocazionalismule","plural-vocative":"ocazionalismelor"}},{"word":"ocazionalitate","pos":"noun","definitions":["occasionality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"ocazionalitate","accusative-definite-nominative":"ocazionalitatea","dative-genitive-indefinite":"ocazionalități","dative-definite-genitive":"ocazionalității","vocative":"-"}},{"word":"ocaziune","pos":"noun","definitions":["alternative form of ocazie"],"forms":{"plural":"ocaziuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ocaziune","accusative-definite-nominative-singular":"ocaziunea","accusative-indefinite-nominative-plural":"ocaziuni","accusative-definite-nominative-plural":"ocaziunile","dative-genitive-indefinite-singular":"ocaziuni","dative-definite-genitive-singular":"ocaziunii","dative-genitive-indefinite-plural":"ocaziuni","dative-definite-genitive-plural":"ocaziunilor","singular-vocative":"ocaziune","plural-vocative":"ocaziunilor"}},{"word":"occident","pos":"noun","definitions":["west, Occident"],"pronunciation":"/ok.t͡ʃiˈdent/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"occident","accusative-definite-nominative":"occidentul","dative-genitive-indefinite":"occident","dative-definite-genitive":"occidentului","vocative":"occidentule"}},{"word":"occidental","pos":"adj","definitions":["western"],"forms":{"feminine-singular":"occidentală","masculine-plural":"occidentali","feminine-neuter-plural":"occidentale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"occidental","error-unrecognized-form-feminine-indefinite-singular":"occidentală","error-unrecognized-form-indefinite-masculine-plural":"occidentali","error-unrecognized-form-feminine-indefinite-neuter-plural":"occidentale","definite-error-unrecognized-form-masculine-neuter-singular":"occidentalul","definite-error-unrecognized-form-feminine-singular":"occidentala","definite-error-unrecognized-form-masculine-plural":"occidentalii","definite-error-unrecognized-form-feminine-neuter-plural":"occidentalele"}},{"word":"occidentaliza","pos":"verb","definitions":["to westernize"],"forms":{"canonical":"a occidentaliza 1st conjugation","present-singular-third-person":"occidentalizează","participle-past":"occidentalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a occidentaliza","gerund":"occidentalizând","first-person-indicative-present-singular":"occidentalizez","indicative-present-second-person-singular":"occidentalizezi","indicative-present-singular-third-person":"occidentalizează","first-person-indicative-plural-present":"occidentalizăm","indicative-plural-present-second-person":"occidentalizați","indicative-plural-present-third-person":"occidentalizează","first-person-imperfect-indicative-singular":"occidentalizam","imperfect-indicative-second-person-singular":"occidentalizai","imperfect-indicative-singular-third-person":"occidentaliza","first-person-imperfect-indicative-plural":"occidentalizam","imperfect-indicative-plural-second-person":"occidentalizați","imperfect-indicative-plural-third-person":"occidentalizau","first-person-indicative-perfect-singular":"occidentalizai","indicative-perfect-second-person-singular":"occidentalizași","indicative-perfect-singular-third-person":"occidentaliză","first-person-indicative-perfect-plural":"occidentalizarăm","indicative-perfect-plural-second-person":"occidentalizarăți","indicative-perfect-plural-third-person":"occidentalizară","first-person-indicative-pluperfect-singular":"occidentalizasem","indicative-pluperfect-second-person-singular":"occidentalizaseși","indicative-pluperfect-singular-third-person":"occidentalizase","first-person-indicative-pluperfect-plural":"occidentalizaserăm","indicative-pluperfect-plural-second-person":"occidentalizaserăți","indicative-pluperfect-plural-third-person":"occidentalizaseră","first-person-present-singular-subjunctive":"să occidentalizez","present-second-person-singular-subjunctive":"să occidentalizezi","present-singular-subjunctive-third-person":"să occidentalizeze","first-person-plural-present-subjunctive":"să occidentalizăm","plural-present-second-person-subjunctive":"să occidentalizați","plural-present-subjunctive-third-person":"să occidentalizeze","imperative-second-person-singular":"occidentalizează","imperative-plural-second-person":"occidentalizați","imperative-negative-second-person-singular":"nu occidentaliza","imperative-negative-plural-second-person":"nu occidentalizați"}},{"word":"occidentalizare","pos":"noun","definitions":["westernization"],"forms":{"plural":"occidentalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"occidentalizare","accusative-definite-nominative-singular":"occidentalizarea","accusative-indefinite-nominative-plural":"occidentalizări","accusative-definite-nominative-plural":"occidentalizările","dative-genitive-indefinite-singular":"occidentalizări","dative-definite-genitive-singular":"occidentalizării","dative-genitive-indefinite-plural":"occidentalizări","dative-definite-genitive-plural":"occidentalizărilor","singular-vocative":"occidentalizare","plural-vocative":"occidentalizărilor"}},{"word":"occidentalizat","pos":"adj","definitions":["westernized"],"forms":{"feminine-singular":"occidentalizată","masculine-plural":"occidentalizați","feminine-neuter-plural":"occidentalizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"occidentalizat","error-unrecognized-form-feminine-indefinite-singular":"occidentalizată","error-unrecognized-form-indefinite-masculine-plural":"occidentalizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"occidentalizate","definite-error-unrecognized-form-masculine-neuter-singular":"occidentalizatul","definite-error-unrecognized-form-feminine-singular":"occidentalizata","definite-error-unrecognized-form-masculine-plural":"occidentalizații","definite-error-unrecognized-form-feminine-neuter-plural":"occidentalizatele"}},{"word":"occipital","pos":"adj","definitions":["occipital"],"forms":{"feminine-singular":"occipitală","masculine-plural":"occipitali","feminine-neuter-plural":"occipitale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"occipital","error-unrecognized-form-feminine-indefinite-singular":"occipitală","error-unrecognized-form-indefinite-masculine-plural":"occipitali","error-unrecognized-form-feminine-indefinite-neuter-plural":"occipitale","definite-error-unrecognized-form-masculine-neuter-singular":"occipitalul","definite-error-unrecognized-form-feminine-singular":"occipitala","definite-error-unrecognized-form-masculine-plural":"occipitalii","definite-error-unrecognized-form-feminine-neuter-plural":"occipitalele"}},{"word":"occiput","pos":"noun","definitions":["occiput"],"forms":{"plural":"occiputuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"occiput","accusative-definite-nominative-singular":"occiputul","accusative-indefinite-nominative-plural":"occiputuri","accusative-definite-nominative-plural":"occiputurile","dative-genitive-indefinite-singular":"occiput","dative-definite-genitive-singular":"occiputului","dative-genitive-indefinite-plural":"occiputuri","dative-definite-genitive-plural":"occiputurilor","singular-vocative":"occiputule","plural-vocative":"occiputurilor"}},{"word":"occitan","pos":"adj","definitions":["Occitan"],"forms":{"feminine-singular":"occitană","masculine-plural":"occitani","feminine-neuter-plural":"occitane","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"occitan","error-unrecognized-form-feminine-indefinite-singular":"occitană","error-unrecognized-form-indefinite-masculine-plural":"occitani","error-unrecognized-form-feminine-indefinite-neuter-plural":"occitane","definite-error-unrecognized-form-masculine-neuter-singular":"occitanul","definite-error-unrecognized-form-feminine-singular":"occitana","definite-error-unrecognized-form-masculine-plural":"occitanii","definite-error-unrecognized-form-feminine-neuter-plural":"occitanele"}},{"word":"occitană","pos":"noun","definitions":["female equivalent of occitan","Occitan language"],"forms":{"plural":"occitane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"occitană","accusative-definite-nominative-singular":"occitana","accusative-indefinite-nominative-plural":"occitane","accusative-definite-nominative-plural":"occitanele","dative-genitive-indefinite-singular":"occitane","dative-definite-genitive-singular":"occitanei","dative-genitive-indefinite-plural":"occitane","dative-definite-genitive-plural":"occitanelor","singular-vocative":"occitană","plural-vocative":"occitanelor"}},{"word":"Occitania","pos":"name","definitions":["Occitania (a cultural region in southwestern Europe where Occitan has historically been spoken, consisting of southern France, parts of Catalonia in Spain, and some valleys in northwestern Italy)","Occitania (an administrative region in southern France)"],"gender":"f"},{"word":"oceaianie","pos":"noun","definitions":["discouragement"],"forms":{"plural":"oceaianii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oceaianie","accusative-definite-nominative-singular":"oceaiania","accusative-indefinite-nominative-plural":"oceaianii","accusative-definite-nominative-plural":"oceaianiile","dative-genitive-indefinite-singular":"oceaianii","dative-definite-genitive-singular":"oceaianiei","dative-genitive-indefinite-plural":"oceaianii","dative-definite-genitive-plural":"oceaianiilor","singular-vocative":"oceaianie","plural-vocative":"oceaianiilor"}},{"word":"ocean","pos":"noun","definitions":["ocean"],"pronunciation":"/oˈt͡ʃe̯an/","forms":{"plural":"oceane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ocean","accusative-definite-nominative-singular":"oceanul","accusative-indefinite-nominative-plural":"oceane","accusative-definite-nominative-plural":"oceanele","dative-genitive-indefinite-singular":"ocean","dative-definite-genitive-singular":"oceanului","dative-genitive-indefinite-plural":"oceane","dative-definite-genitive-plural":"oceanelor","singular-vocative":"oceanule","plural-vocative":"oceanelor"}},{"word":"Oceania","pos":"name","definitions":["Oceania (a continent or continental region composed of Australia, New Zealand and the islands of Melanesia, Micronesia and Polynesia)"],"pronunciation":"[o.tʃe̯a.ni.a]","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"l","accusative-definite-nominative":"Oceania","dative-definite-genitive":"Oceaniei"}},{"word":"oceanic","pos":"adj","definitions":["oceanic"],"forms":{"feminine-singular":"oceanică","masculine-plural":"oceanici","feminine-neuter-plural":"oceanice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oceanic","error-unrecognized-form-feminine-indefinite-singular":"oceanică","error-unrecognized-form-indefinite-masculine-plural":"oceanici","error-unrecognized-form-feminine-indefinite-neuter-plural":"oceanice","definite-error-unrecognized-form-masculine-neuter-singular":"oceanicul","definite-error-unrecognized-form-feminine-singular":"oceanica","definite-error-unrecognized-form-masculine-plural":"oceanicii","definite-error-unrecognized-form-feminine-neuter-plural":"oceanicele"}},{"word":"oceanicultură","pos":"noun","definitions":["mariculture"],"forms":{"plural":"oceaniculturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"oceanicultură","accusative-definite-nominative-singular":"oceanicultura","accusative-indefinite-nominative-plural":"oceaniculturi","accusative-definite-nominative-plural":"oceaniculturile","dative-genitive-indefinite-singular":"oceaniculturi","dative-definite-genitive-singular":"oceaniculturii","dative-genitive-indefinite-plural":"oceaniculturi","dative-definite-genitive-plural":"oceaniculturilor","singular-vocative":"oceanicultură","plural-vocative":"oceaniculturilor"}},{"word":"oceanidă","pos":"noun","definitions":["Oceanid"],"forms":{"plural":"oceanide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oceanidă","accusative-definite-nominative-singular":"oceanida","accusative-indefinite-nominative-plural":"oceanide","accusative-definite-nominative-plural":"oceanidele","dative-genitive-indefinite-singular":"oceanide","dative-definite-genitive-singular":"oceanidei","dative-genitive-indefinite-plural":"oceanide","dative-definite-genitive-plural":"oceanidelor","singular-vocative":"oceanidă","plural-vocative":"oceanidelor"}},{"word":"oceanograf","pos":"noun","definitions":["oceanographer"],"pronunciation":"/o.t͡ʃe̯a.noˈɡraf/","forms":{"plural":"oceanografi","feminine":"equivalent oceanografă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oceanograf","accusative-definite-nominative-singular":"oceanograful","accusative-indefinite-nominative-plural":"oceanografi","accusative-definite-nominative-plural":"oceanografii","dative-genitive-indefinite-singular":"oceanograf","dative-definite-genitive-singular":"oceanografului","dative-genitive-indefinite-plural":"oceanografi","dative-definite-genitive-plural":"oceanografilor","singular-vocative":"oceanografule","plural-vocative":"oceanografilor"}},{"word":"oceanografa","pos":"noun","definitions":["definite nominative/accusative singular of oceanografă"]},{"word":"oceanografă","pos":"noun","definitions":["female equivalent of oceanograf"],"pronunciation":"/o.t͡ʃe̯a.noˈɡra.fə/","forms":{"plural":"oceanografe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"oceanografă","accusative-definite-nominative-singular":"oceanografa","accusative-indefinite-nominative-plural":"oceanografe","accusative-definite-nominative-plural":"oceanografele","dative-genitive-indefinite-singular":"oceanografe","dative-definite-genitive-singular":"oceanografei","dative-genitive-indefinite-plural":"oceanografe","dative-definite-genitive-plural":"oceanografelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"oceanografe","pos":"noun","definitions":["plural of oceanografă"],"gender":"f"},{"word":"oceanografi","pos":"noun","definitions":["plural of oceanograf"],"gender":"m"},{"word":"oceanografic","pos":"adj","definitions":["oceanographic"],"forms":{"feminine-singular":"oceanografică","masculine-plural":"oceanografici","feminine-neuter-plural":"oceanografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oceanografic","error-unrecognized-form-feminine-indefinite-singular":"oceanografică","error-unrecognized-form-indefinite-masculine-plural":"oceanografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"oceanografice","definite-error-unrecognized-form-masculine-neuter-singular":"oceanograficul","definite-error-unrecognized-form-feminine-singular":"oceanografica","definite-error-unrecognized-form-masculine-plural":"oceanograficii","definite-error-unrecognized-form-feminine-neuter-plural":"oceanograficele"}},{"word":"oceanografie","pos":"noun","definitions":["oceanography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"oceanografie","accusative-definite-nominative":"oceanografia","dative-genitive-indefinite":"oceanografii","dative-definite-genitive":"oceanografiei","vocative":"oceanografie"}},{"word":"oceanolog","pos":"noun","definitions":["oceanologist"],"forms":{"plural":"oceanologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oceanolog","accusative-definite-nominative-singular":"oceanologul","accusative-indefinite-nominative-plural":"oceanologi","accusative-definite-nominative-plural":"oceanologii","dative-genitive-indefinite-singular":"oceanolog","dative-definite-genitive-singular":"oceanologului","dative-genitive-indefinite-plural":"oceanologi","dative-definite-genitive-plural":"oceanologilor","singular-vocative":"oceanologule","plural-vocative":"oceanologilor"}},{"word":"oceanologă","pos":"noun","definitions":["female equivalent of oceanolog"],"forms":{"plural":"oceanologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oceanologă","accusative-definite-nominative-singular":"oceanologa","accusative-indefinite-nominative-plural":"oceanologe","accusative-definite-nominative-plural":"oceanologele","dative-genitive-indefinite-singular":"oceanologe","dative-definite-genitive-singular":"oceanologei","dative-genitive-indefinite-plural":"oceanologe","dative-definite-genitive-plural":"oceanologelor","singular-vocative":"oceanologă","plural-vocative":"oceanologelor"}},{"word":"oceanologic","pos":"adj","definitions":["oceanological"],"forms":{"feminine-singular":"oceanologică","masculine-plural":"oceanologici","feminine-neuter-plural":"oceanologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oceanologic","error-unrecognized-form-feminine-indefinite-singular":"oceanologică","error-unrecognized-form-indefinite-masculine-plural":"oceanologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"oceanologice","definite-error-unrecognized-form-masculine-neuter-singular":"oceanologicul","definite-error-unrecognized-form-feminine-singular":"oceanologica","definite-error-unrecognized-form-masculine-plural":"oceanologicii","definite-error-unrecognized-form-feminine-neuter-plural":"oceanologicele"}},{"word":"oceanologie","pos":"noun","definitions":["oceanography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"oceanologie","accusative-definite-nominative":"oceanologia","dative-genitive-indefinite":"oceanologii","dative-definite-genitive":"oceanologiei","vocative":"oceanologie"}},{"word":"Oceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Oceanu"}},{"word":"oceanul","pos":"noun","definitions":["nominative/accusative definite singular of ocean"],"pronunciation":"/oˈt͡ʃe̯a.nul/","gender":"n"},{"word":"Oceanul Antarctic","pos":"name","definitions":["Southern Ocean (the portion of the World Ocean surrounding Antarctica, variously taken as the waters south of the Antarctic Circle, the waters south of 60° S, or the waters bounded by the Antarctic Convergence)"],"pronunciation":"/oˈt͡ʃe̯a.nul antˈark.tik/","gender":"n"},{"word":"Oceanul Arctic","pos":"name","definitions":["Arctic Ocean (the smallest of the five oceans of the Earth, on and around the North Pole, bordered by the three continents of Asia, Europe and North America)"],"pronunciation":"/oˈt͡ʃe̯a.nul ˈark.tik/","gender":"n"},{"word":"Oceanul Atlantic","pos":"name","definitions":["Atlantic Ocean (the ocean lying between the Americas to the west and Europe and Africa to the east)"],"pronunciation":"/oˈt͡ʃe̯a.nul atˈlan.tik/","gender":"n"},{"word":"Oceanul Indian","pos":"noun","definitions":["Indian Ocean (the ocean separating Africa, southern Asia, Australia and Antarctica)"],"pronunciation":"/oˈt͡ʃe̯a.nul in.diˈan/"},{"word":"Oceanul Pacific","pos":"name","definitions":["Pacific Ocean (an ocean, the world's largest body of water, to the east of Asia and Australasia and to the west of the Americas)"],"pronunciation":"/oˈt͡ʃe̯a.nul paˈt͡ʃi.fik/","gender":"n"},{"word":"oceință","pos":"noun","definitions":["despair"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"oceință","accusative-definite-nominative":"oceința","dative-genitive-indefinite":"oceințe","dative-definite-genitive":"oceinței","vocative":"oceință"}},{"word":"ocel","pos":"noun","definitions":["ocellus"],"forms":{"plural":"oceli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ocel","accusative-definite-nominative-singular":"ocelul","accusative-indefinite-nominative-plural":"oceli","accusative-definite-nominative-plural":"ocelii","dative-genitive-indefinite-singular":"ocel","dative-definite-genitive-singular":"ocelului","dative-genitive-indefinite-plural":"oceli","dative-definite-genitive-plural":"ocelilor","singular-vocative":"ocelule","plural-vocative":"ocelilor"}},{"word":"ocelot","pos":"noun","definitions":["ocelot"],"forms":{"plural":"oceloți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ocelot","accusative-definite-nominative-singular":"ocelotul","accusative-indefinite-nominative-plural":"oceloți","accusative-definite-nominative-plural":"oceloții","dative-genitive-indefinite-singular":"ocelot","dative-definite-genitive-singular":"ocelotului","dative-genitive-indefinite-plural":"oceloți","dative-definite-genitive-plural":"oceloților","singular-vocative":"ocelotule","plural-vocative":"oceloților"}},{"word":"ocenaș","pos":"noun","definitions":["alternative form of ocinaș"],"forms":{"plural":"ocenașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ocenaș","accusative-definite-nominative-singular":"ocenașul","accusative-indefinite-nominative-plural":"ocenașe","accusative-definite-nominative-plural":"ocenașele","dative-genitive-indefinite-singular":"ocenaș","dative-definite-genitive-singular":"ocenașului","dative-genitive-indefinite-plural":"ocenașe","dative-definite-genitive-plural":"ocenașelor","singular-vocative":"ocenașule","plural-vocative":"ocenașelor"}},{"word":"ocheadă","pos":"noun","definitions":["glance"],"forms":{"plural":"ocheade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ocheadă","accusative-definite-nominative-singular":"ocheada","accusative-indefinite-nominative-plural":"ocheade","accusative-definite-nominative-plural":"ocheadele","dative-genitive-indefinite-singular":"ocheade","dative-definite-genitive-singular":"ocheadei","dative-genitive-indefinite-plural":"ocheade","dative-definite-genitive-plural":"ocheadelor","singular-vocative":"ocheadă","plural-vocative":"ocheadelor"}},{"word":"ocheală","pos":"noun","definitions":["glance"],"forms":{"plural":"ocheli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ocheală","accusative-definite-nominative-singular":"ocheala","accusative-indefinite-nominative-plural":"ochele","accusative-definite-nominative-plural":"ochelele","dative-genitive-indefinite-singular":"ochele","dative-definite-genitive-singular":"ochelei","dative-genitive-indefinite-plural":"ochele","dative-definite-genitive-plural":"ochelelor","singular-vocative":"ocheală","plural-vocative":"ochelelor"}},{"word":"Ochean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ochean"}},{"word":"ochean","pos":"noun","definitions":["spyglass (portable telescope)"],"pronunciation":"/oˈke̯an/","forms":{"plural":"ocheane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ochean","accusative-definite-nominative-singular":"ocheanul","accusative-indefinite-nominative-plural":"ocheane","accusative-definite-nominative-plural":"ocheanele","dative-genitive-indefinite-singular":"ochean","dative-definite-genitive-singular":"ocheanului","dative-genitive-indefinite-plural":"ocheane","dative-definite-genitive-plural":"ocheanelor","singular-vocative":"ocheanule","plural-vocative":"ocheanelor"}},{"word":"ocheană","pos":"noun","definitions":["common roach (Rutilus rutilus)"],"forms":{"plural":"ochene","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ocheană","accusative-definite-nominative-singular":"ocheanăul","accusative-indefinite-nominative-plural":"ochene","accusative-definite-nominative-plural":"ochenei","dative-genitive-indefinite-singular":"ocheană","dative-definite-genitive-singular":"ocheanăului","dative-genitive-indefinite-plural":"ochene","dative-definite-genitive-plural":"ochenelor","singular-vocative":"ocheanăule","plural-vocative":"ochenelor"}},{"word":"ocheane","pos":"noun","definitions":["plural of ochean"],"pronunciation":"/oˈke̯a.ne/","gender":"n-p"},{"word":"Ocheanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ocheanu"}},{"word":"ochelari","pos":"noun","definitions":["glasses, spectacles","goggles"],"pronunciation":"/o.keˈlarʲ/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"ochelari","accusative-definite-nominative":"ochelarii","dative-genitive-indefinite":"ochelari","dative-definite-genitive":"ochelarilor","vocative":"ochelarilor"}},{"word":"ochelari de citit","pos":"noun","definitions":["reading glasses"]},{"word":"ochelari de soare","pos":"noun","definitions":["sunglasses"]},{"word":"ochelarist","pos":"noun","definitions":["a person wearing glasses"],"forms":{"plural":"ochelariști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ochelarist","accusative-definite-nominative-singular":"ochelaristul","accusative-indefinite-nominative-plural":"ochelaristi","accusative-definite-nominative-plural":"ochelaristii","dative-genitive-indefinite-singular":"ochelarist","dative-definite-genitive-singular":"ochelaristului","dative-genitive-indefinite-plural":"ochelaristi","dative-definite-genitive-plural":"ochelaristilor","singular-vocative":"ochelaristule","plural-vocative":"ochelaristilor"}},{"word":"ochelaristă","pos":"noun","definitions":["female equivalent of ochelarist"],"forms":{"plural":"ochelariste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ochelaristă","accusative-definite-nominative-singular":"ochelarista","accusative-indefinite-nominative-plural":"ochelariste","accusative-definite-nominative-plural":"ochelaristele","dative-genitive-indefinite-singular":"ochelariste","dative-definite-genitive-singular":"ochelaristei","dative-genitive-indefinite-plural":"ochelariste","dative-definite-genitive-plural":"ochelaristelor","singular-vocative":"ochelaristă","plural-vocative":"ochelaristelor"}},{"word":"ochelariță","pos":"noun","definitions":["buckler-mustard (Biscutella laevigata)"],"forms":{"plural":"ochelarițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ochelariță","accusative-definite-nominative-singular":"ochelarița","accusative-indefinite-nominative-plural":"ochelarițe","accusative-definite-nominative-plural":"ochelarițele","dative-genitive-indefinite-singular":"ochelarițe","dative-definite-genitive-singular":"ochelariței","dative-genitive-indefinite-plural":"ochelarițe","dative-definite-genitive-plural":"ochelarițelor","singular-vocative":"ochelariță","plural-vocative":"ochelarițelor"}},{"word":"Ochenatu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ochenatu"}},{"word":"Ocheni","pos":"name","definitions":["a village in Huruiești, Bacău County, Romania"],"gender":"m"},{"word":"ocheniță","pos":"noun","definitions":["diminutive of ocheană"],"forms":{"plural":"ochenițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ocheniță","accusative-definite-nominative-singular":"ochenița","accusative-indefinite-nominative-plural":"ochenițe","accusative-definite-nominative-plural":"ochenițele","dative-genitive-indefinite-singular":"ochenițe","dative-definite-genitive-singular":"ocheniței","dative-genitive-indefinite-plural":"ochenițe","dative-definite-genitive-plural":"ochenițelor","singular-vocative":"ocheniță","plural-vocative":"ochenițelor"}},{"word":"ochenuță","pos":"noun","definitions":["European bitterling (Rhodeus amarus)"],"forms":{"plural":"ochenuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ochenuță","accusative-definite-nominative-singular":"ochenuța","accusative-indefinite-nominative-plural":"ochenuțe","accusative-definite-nominative-plural":"ochenuțele","dative-genitive-indefinite-singular":"ochenuțe","dative-definite-genitive-singular":"ochenuței","dative-genitive-indefinite-plural":"ochenuțe","dative-definite-genitive-plural":"ochenuțelor","singular-vocative":"ochenuță","plural-vocative":"ochenuțelor"}},{"word":"Ocheșel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ocheșel"}},{"word":"ocheșel","pos":"adj","definitions":["diminutive of oacheș"],"forms":{"feminine-singular":"ocheșelă","masculine-plural":"ocheșeli","feminine-neuter-plural":"ocheșele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ocheșel","error-unrecognized-form-feminine-indefinite-singular":"ocheșelă","error-unrecognized-form-indefinite-masculine-plural":"ocheșeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"ocheșele","definite-error-unrecognized-form-masculine-neuter-singular":"ocheșelul","definite-error-unrecognized-form-feminine-singular":"ocheșela","definite-error-unrecognized-form-masculine-plural":"ocheșelii","definite-error-unrecognized-form-feminine-neuter-plural":"ocheșelele"}},{"word":"Ocheșești","pos":"name","definitions":["a village in Corbița, Vrancea County, Romania"],"gender":"m"},{"word":"ocheț","pos":"noun","definitions":["alternative form of ochet"],"forms":{"plural":"ocheți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ocheț","accusative-definite-nominative-singular":"ochețul","accusative-indefinite-nominative-plural":"ocheți","accusative-definite-nominative-plural":"ocheții","dative-genitive-indefinite-singular":"ocheț","dative-definite-genitive-singular":"ochețului","dative-genitive-indefinite-plural":"ocheți","dative-definite-genitive-plural":"ocheților","singular-vocative":"ochețule","plural-vocative":"ocheților"}},{"word":"ochete","pos":"noun","definitions":["alternative form of ochet"],"forms":{"plural":"ocheți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ochete","accusative-definite-nominative-singular":"ocheteul","accusative-indefinite-nominative-plural":"ocheți","accusative-definite-nominative-plural":"ocheții","dative-genitive-indefinite-singular":"ochete","dative-definite-genitive-singular":"ocheteului","dative-genitive-indefinite-plural":"ocheți","dative-definite-genitive-plural":"ocheților","singular-vocative":"ocheteule","plural-vocative":"ocheților"}},{"word":"ochi","pos":"noun","definitions":["eye","loop","ring in a hob"],"pronunciation":"/okʲ/","examples":[{"ro":"Mă ustură ochii.","en":"My eyes burn/itch."}],"forms":{"plural":"ochi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ochi","accusative-definite-nominative-singular":"ochiul","accusative-indefinite-nominative-plural":"ochi","accusative-definite-nominative-plural":"ochii","dative-genitive-indefinite-singular":"ochi","dative-definite-genitive-singular":"ochiului","dative-genitive-indefinite-plural":"ochi","dative-definite-genitive-plural":"ochilor","singular-vocative":"ochiule","plural-vocative":"ochilor"}},{"word":"ochi","pos":"verb","definitions":["to aim, take aim","to set eyes on, set sights on","to look intently at, stare at","to scan, look about for","to perceive, notice, detect"],"pronunciation":"/oˈki/","forms":{"canonical":"a ochi 4th conjugation","present-singular-third-person":"ochește","participle-past":"ochit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ochi","gerund":"ochind","first-person-indicative-present-singular":"ochesc","indicative-present-second-person-singular":"ochești","indicative-present-singular-third-person":"ochește","first-person-indicative-plural-present":"ochim","indicative-plural-present-second-person":"ochiți","indicative-plural-present-third-person":"ochesc","first-person-imperfect-indicative-singular":"ocheam","imperfect-indicative-second-person-singular":"ocheai","imperfect-indicative-singular-third-person":"ochea","first-person-imperfect-indicative-plural":"ocheam","imperfect-indicative-plural-second-person":"ocheați","imperfect-indicative-plural-third-person":"ocheau","first-person-indicative-perfect-singular":"ochii","indicative-perfect-second-person-singular":"ochiși","indicative-perfect-singular-third-person":"ochi","first-person-indicative-perfect-plural":"ochirăm","indicative-perfect-plural-second-person":"ochirăți","indicative-perfect-plural-third-person":"ochiră","first-person-indicative-pluperfect-singular":"ochisem","indicative-pluperfect-second-person-singular":"ochiseși","indicative-pluperfect-singular-third-person":"ochise","first-person-indicative-pluperfect-plural":"ochiserăm","indicative-pluperfect-plural-second-person":"ochiserăți","indicative-pluperfect-plural-third-person":"ochiseră","first-person-present-singular-subjunctive":"să ochesc","present-second-person-singular-subjunctive":"să ochești","present-singular-subjunctive-third-person":"să ochească","first-person-plural-present-subjunctive":"să ochim","plural-present-second-person-subjunctive":"să ochiți","plural-present-subjunctive-third-person":"să ochească","imperative-second-person-singular":"ochește","imperative-plural-second-person":"ochiți","imperative-negative-second-person-singular":"nu ochi","imperative-negative-plural-second-person":"nu ochiți"}},{"word":"ochi de bou","pos":"noun","definitions":["bull's eye"]},{"word":"ochi de vultur","pos":"noun","definitions":["eagle eye"]},{"word":"ochi magic","pos":"noun","definitions":["magic eye"]},{"word":"ochi maro","pos":"noun","definitions":["brown eye (anus)"],"pronunciation":"/ˈokʲ maˈro/","forms":{"plural":"ochi maro","table-tags":"no-table-tags","inflection-template":"ro-noun-manual","accusative-indefinite-nominative-singular":"ochi maro","accusative-definite-nominative-singular":"ochiul maro","accusative-indefinite-nominative-plural":"ochi maro","accusative-definite-nominative-plural":"ochii maro","dative-genitive-indefinite-singular":"ochi maro","dative-definite-genitive-singular":"ochiului maro","dative-genitive-indefinite-plural":"ochi maro","dative-definite-genitive-plural":"ochilor maro","singular-vocative":"-","plural-vocative":"-"}},{"word":"ochi sec","pos":"noun","definitions":["dry eye"]},{"word":"ochi vânăt","pos":"noun","definitions":["black eye"],"forms":{"plural":"ochi vineți"}},{"word":"Ochialb","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ochialb"}},{"word":"Ochialbi","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ochialbi"}},{"word":"ochii","pos":"noun","definitions":["definite nominative/accusative plural of ochi"]},{"word":"ochii care nu se văd se uită","pos":"proverb","definitions":["long absent, soon forgotten"]},{"word":"ochilor","pos":"noun","definitions":["inflection of ochi:","definite genitive/dative plural","vocative plural"]},{"word":"ochios","pos":"adj","definitions":["having big and beautiful eyes","big-eyed, as a negative trait","pretty, beautiful"],"forms":{"feminine-singular":"ochioasă","masculine-plural":"ochioși","feminine-neuter-plural":"ochioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ochios","error-unrecognized-form-feminine-indefinite-singular":"ochioasă","error-unrecognized-form-indefinite-masculine-plural":"ochioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"ochioase","definite-error-unrecognized-form-masculine-neuter-singular":"ochiosul","definite-error-unrecognized-form-feminine-singular":"ochioasa","definite-error-unrecognized-form-masculine-plural":"ochioșii","definite-error-unrecognized-form-feminine-neuter-plural":"ochioasele"}},{"word":"Ochiosu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ochiosu"}},{"word":"ochire","pos":"noun","definitions":["glance"],"forms":{"plural":"ochiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ochire","accusative-definite-nominative-singular":"ochirea","accusative-indefinite-nominative-plural":"ochiri","accusative-definite-nominative-plural":"ochirile","dative-genitive-indefinite-singular":"ochiri","dative-definite-genitive-singular":"ochirii","dative-genitive-indefinite-plural":"ochiri","dative-definite-genitive-plural":"ochirilor","singular-vocative":"ochire","plural-vocative":"ochirilor"}},{"word":"Ochiroși","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ochiroși"}},{"word":"Ochiroșii","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ochiroșii"}},{"word":"ochișel","pos":"adj","definitions":["alternative form of ocheșel"],"forms":{"feminine-singular":"ochișelă","masculine-plural":"ochișeli","feminine-neuter-plural":"ochișele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ochișel","error-unrecognized-form-feminine-indefinite-singular":"ochișelă","error-unrecognized-form-indefinite-masculine-plural":"ochișeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"ochișele","definite-error-unrecognized-form-masculine-neuter-singular":"ochișelul","definite-error-unrecognized-form-feminine-singular":"ochișela","definite-error-unrecognized-form-masculine-plural":"ochișelii","definite-error-unrecognized-form-feminine-neuter-plural":"ochișelele"}},{"word":"Ochișor","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ochișor"}},{"word":"ochișor","pos":"noun","definitions":["diminutive of ochi; small eye"],"forms":{"plural":"ochișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ochișor","accusative-definite-nominative-singular":"ochișorul","accusative-indefinite-nominative-plural":"ochișori","accusative-definite-nominative-plural":"ochișorii","dative-genitive-indefinite-singular":"ochișor","dative-definite-genitive-singular":"ochișorului","dative-genitive-indefinite-plural":"ochișori","dative-definite-genitive-plural":"ochișorilor","singular-vocative":"ochișorule","plural-vocative":"ochișorilor"}},{"word":"ochit","pos":"noun","definitions":["glance"],"forms":{"plural":"ochituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ochit","accusative-definite-nominative-singular":"ochitul","accusative-indefinite-nominative-plural":"ochituri","accusative-definite-nominative-plural":"ochiturile","dative-genitive-indefinite-singular":"ochit","dative-definite-genitive-singular":"ochitului","dative-genitive-indefinite-plural":"ochituri","dative-definite-genitive-plural":"ochiturilor","singular-vocative":"ochitule","plural-vocative":"ochiturilor"}},{"word":"ochit","pos":"verb","definitions":["past participle of ochi"],"forms":{"participle-past":"of ochi"}},{"word":"ochiți","pos":"noun","definitions":["diminutive of ochi"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"ochiți","accusative-definite-nominative":"ochiții","dative-genitive-indefinite":"ochiți","dative-definite-genitive":"ochiților","vocative":"ochiților"}},{"word":"ochitor","pos":"noun","definitions":["shooter"],"forms":{"plural":"ochitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ochitor","accusative-definite-nominative-singular":"ochitorul","accusative-indefinite-nominative-plural":"ochitori","accusative-definite-nominative-plural":"ochitorii","dative-genitive-indefinite-singular":"ochitor","dative-definite-genitive-singular":"ochitorului","dative-genitive-indefinite-plural":"ochitori","dative-definite-genitive-plural":"ochitorilor","singular-vocative":"ochitorule","plural-vocative":"ochitorilor"}},{"word":"ochitură","pos":"noun","definitions":["look"],"forms":{"plural":"ochituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ochitură","accusative-definite-nominative-singular":"ochitura","accusative-indefinite-nominative-plural":"ochituri","accusative-definite-nominative-plural":"ochiturile","dative-genitive-indefinite-singular":"ochituri","dative-definite-genitive-singular":"ochiturii","dative-genitive-indefinite-plural":"ochituri","dative-definite-genitive-plural":"ochiturilor","singular-vocative":"ochitură","plural-vocative":"ochiturilor"}},{"word":"Ochiu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ochiu"}},{"word":"ochiuboului","pos":"noun","definitions":["Eurasian wren (Troglodytes troglodytes)"]},{"word":"ochiul","pos":"noun","definitions":["definite nominative/accusative singular of ochi"]},{"word":"Ochiul Alb","pos":"name","definitions":["a village in Ochiul Alb, Drochia Raion, Moldova","a commune of Drochia Raion, Moldova"],"gender":"m"},{"word":"ochiul boului","pos":"noun","definitions":["Callistephus"]},{"word":"Ochiul Roș","pos":"name","definitions":["a village in Ochiul Roș, Anenii Noi Raion, Moldova","a commune of Anenii Noi Raion, Moldova"],"gender":"m"},{"word":"ochiul-boului","pos":"noun","definitions":["China aster (decorative plants, Callistephus chinensis of the family Asteraceae, with variously colored flowers)","wren (bird of family Troglodytidae)"]},{"word":"ochiule","pos":"noun","definitions":["vocative singular of ochi"]},{"word":"Ochiuleț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ochiuleț"}},{"word":"ochiuleț","pos":"noun","definitions":["diminutive of ochi; small eye"],"forms":{"plural":"ochiulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ochiuleț","accusative-definite-nominative-singular":"ochiulețul","accusative-indefinite-nominative-plural":"ochiulețe","accusative-definite-nominative-plural":"ochiulețele","dative-genitive-indefinite-singular":"ochiuleț","dative-definite-genitive-singular":"ochiulețului","dative-genitive-indefinite-plural":"ochiulețe","dative-definite-genitive-plural":"ochiulețelor","singular-vocative":"ochiulețule","plural-vocative":"ochiulețelor"}},{"word":"ochiului","pos":"noun","definitions":["definite dative/genitive singular of ochi"]},{"word":"Ochiuri","pos":"name","definitions":["a village in Gura Ocniței, Dâmbovița County, Romania"],"gender":"m"},{"word":"ochiuri","pos":"noun","definitions":["plural of ochi"]},{"word":"ochiuț","pos":"noun","definitions":["diminutive of ochi"],"forms":{"plural":"ochiuleți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ochiuț","accusative-definite-nominative-singular":"ochiuțul","accusative-indefinite-nominative-plural":"ochiuți","accusative-definite-nominative-plural":"ochiuții","dative-genitive-indefinite-singular":"ochiuț","dative-definite-genitive-singular":"ochiuțului","dative-genitive-indefinite-plural":"ochiuți","dative-definite-genitive-plural":"ochiuților","singular-vocative":"ochiuțule","plural-vocative":"ochiuților"}},{"word":"ocina","pos":"verb","definitions":["to inherit"],"forms":{"canonical":"a ocina 1st conjugation","present-singular-third-person":"ocinează","participle-past":"ocinat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ocina","gerund":"ocinând","first-person-indicative-present-singular":"ocinez","indicative-present-second-person-singular":"ocinezi","indicative-present-singular-third-person":"ocinează","first-person-indicative-plural-present":"ocinăm","indicative-plural-present-second-person":"ocinați","indicative-plural-present-third-person":"ocinează","first-person-imperfect-indicative-singular":"ocinam","imperfect-indicative-second-person-singular":"ocinai","imperfect-indicative-singular-third-person":"ocina","first-person-imperfect-indicative-plural":"ocinam","imperfect-indicative-plural-second-person":"ocinați","imperfect-indicative-plural-third-person":"ocinau","first-person-indicative-perfect-singular":"ocinai","indicative-perfect-second-person-singular":"ocinași","indicative-perfect-singular-third-person":"ocină","first-person-indicative-perfect-plural":"ocinarăm","indicative-perfect-plural-second-person":"ocinarăți","indicative-perfect-plural-third-person":"ocinară","first-person-indicative-pluperfect-singular":"ocinasem","indicative-pluperfect-second-person-singular":"ocinaseși","indicative-pluperfect-singular-third-person":"ocinase","first-person-indicative-pluperfect-plural":"ocinaserăm","indicative-pluperfect-plural-second-person":"ocinaserăți","indicative-pluperfect-plural-third-person":"ocinaseră","first-person-present-singular-subjunctive":"să ocinez","present-second-person-singular-subjunctive":"să ocinezi","present-singular-subjunctive-third-person":"să ocineze","first-person-plural-present-subjunctive":"să ocinăm","plural-present-second-person-subjunctive":"să ocinați","plural-present-subjunctive-third-person":"să ocineze","imperative-second-person-singular":"ocinează","imperative-plural-second-person":"ocinați","imperative-negative-second-person-singular":"nu ocina","imperative-negative-plural-second-person":"nu ocinați"}},{"word":"ocină","pos":"noun","definitions":["a piece of land with hereditary property rights"],"forms":{"plural":"ocini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ocină","accusative-definite-nominative-singular":"ocina","accusative-indefinite-nominative-plural":"ocini","accusative-definite-nominative-plural":"ocinile","dative-genitive-indefinite-singular":"ocini","dative-definite-genitive-singular":"ocinii","dative-genitive-indefinite-plural":"ocini","dative-definite-genitive-plural":"ocinilor","singular-vocative":"ocină","plural-vocative":"ocinilor"}},{"word":"Ocina de Jos","pos":"name","definitions":["a village in Adunați, Prahova County, Romania"],"gender":"f"},{"word":"Ocina de Sus","pos":"name","definitions":["a village in Adunați, Prahova County, Romania"],"gender":"f"},{"word":"Ocinaș","pos":"noun","definitions":["Lord's Prayer"],"forms":{"plural":"Ocinașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"Ocinaș","accusative-definite-nominative-singular":"Ocinașul","accusative-indefinite-nominative-plural":"Ocinașe","accusative-definite-nominative-plural":"Ocinașele","dative-genitive-indefinite-singular":"Ocinaș","dative-definite-genitive-singular":"Ocinașului","dative-genitive-indefinite-plural":"Ocinașe","dative-definite-genitive-plural":"Ocinașelor","singular-vocative":"Ocinașule","plural-vocative":"Ocinașelor"}},{"word":"ocinaș","pos":"noun","definitions":["alternative letter-case form of Ocinaș"],"forms":{"plural":"ocinașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ocinaș","accusative-definite-nominative-singular":"ocinașul","accusative-indefinite-nominative-plural":"ocinașe","accusative-definite-nominative-plural":"ocinașele","dative-genitive-indefinite-singular":"ocinaș","dative-definite-genitive-singular":"ocinașului","dative-genitive-indefinite-plural":"ocinașe","dative-definite-genitive-plural":"ocinașelor","singular-vocative":"ocinașule","plural-vocative":"ocinașelor"}},{"word":"ocinat","pos":"noun","definitions":["inheritance"],"forms":{"plural":"ocinate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ocinat","accusative-definite-nominative-singular":"ocinatul","accusative-indefinite-nominative-plural":"ocinate","accusative-definite-nominative-plural":"ocinatele","dative-genitive-indefinite-singular":"ocinat","dative-definite-genitive-singular":"ocinatului","dative-genitive-indefinite-plural":"ocinate","dative-definite-genitive-plural":"ocinatelor","singular-vocative":"ocinatule","plural-vocative":"ocinatelor"}},{"word":"ocinat","pos":"verb","definitions":["past participle of ocina"],"forms":{"participle-past":"of ocina"}},{"word":"ocinătoriu","pos":"noun","definitions":["inheritor"],"forms":{"plural":"ocinătorii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ocinătoriu","accusative-definite-nominative-singular":"ocinătoriuul","accusative-indefinite-nominative-plural":"ocinătorii","accusative-definite-nominative-plural":"ocinătoriii","dative-genitive-indefinite-singular":"ocinătoriu","dative-definite-genitive-singular":"ocinătoriuului","dative-genitive-indefinite-plural":"ocinătorii","dative-definite-genitive-plural":"ocinătoriilor","singular-vocative":"ocinătoriuule","plural-vocative":"ocinătoriilor"}},{"word":"Ociogi","pos":"name","definitions":["a village in Brâncoveni, Olt County, Romania"],"gender":"m"},{"word":"Ocișor","pos":"name","definitions":["a village in Vața de Jos, Hunedoara County, Romania"],"gender":"m"},{"word":"ocitocic","pos":"adj","definitions":["oxytocic"],"forms":{"feminine-singular":"ocitocică","masculine-plural":"ocitocici","feminine-neuter-plural":"ocitocice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ocitocic","error-unrecognized-form-feminine-indefinite-singular":"ocitocică","error-unrecognized-form-indefinite-masculine-plural":"ocitocici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ocitocice","definite-error-unrecognized-form-masculine-neuter-singular":"ocitocicul","definite-error-unrecognized-form-feminine-singular":"ocitocica","definite-error-unrecognized-form-masculine-plural":"ocitocicii","definite-error-unrecognized-form-feminine-neuter-plural":"ocitocicele"}},{"word":"ocitocină","pos":"noun","definitions":["oxytocin"],"forms":{"plural":"ocitocine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ocitocină","accusative-definite-nominative-singular":"ocitocina","accusative-indefinite-nominative-plural":"ocitocine","accusative-definite-nominative-plural":"ocitocinele","dative-genitive-indefinite-singular":"ocitocine","dative-definite-genitive-singular":"ocitocinei","dative-genitive-indefinite-plural":"ocitocine","dative-definite-genitive-plural":"ocitocinelor","singular-vocative":"ocitocină","plural-vocative":"ocitocinelor"}},{"word":"Ociu","pos":"name","definitions":["a river in Romania, tributary to the Crișul Alb","a village in Vața de Jos, Hunedoara County, Romania"],"gender":"m"},{"word":"Ocland","pos":"name","definitions":["a commune of Harghita County, Romania","a village in Ocland, Harghita County, Romania"],"gender":"m"},{"word":"Oclanda","pos":"name","definitions":["a village in Oclanda, Soroca Raion, Moldova","a commune of Soroca Raion, Moldova"],"gender":"f"},{"word":"oclocrație","pos":"noun","definitions":["ochlocracy"],"forms":{"plural":"oclocrații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oclocrație","accusative-definite-nominative-singular":"oclocrațiea","accusative-indefinite-nominative-plural":"oclocrații","accusative-definite-nominative-plural":"oclocrațiile","dative-genitive-indefinite-singular":"oclocrații","dative-definite-genitive-singular":"oclocrațiii","dative-genitive-indefinite-plural":"oclocrații","dative-definite-genitive-plural":"oclocrațiilor","singular-vocative":"oclocrație","plural-vocative":"oclocrațiilor","alternative":"ohlocrație"}},{"word":"oclusiv","pos":"adj","definitions":["occlusive"],"forms":{"feminine-singular":"oclusivă","masculine-plural":"oclusivi","feminine-neuter-plural":"oclusive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oclusiv","error-unrecognized-form-feminine-indefinite-singular":"oclusivă","error-unrecognized-form-indefinite-masculine-plural":"oclusivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"oclusive","definite-error-unrecognized-form-masculine-neuter-singular":"oclusivul","definite-error-unrecognized-form-feminine-singular":"oclusiva","definite-error-unrecognized-form-masculine-plural":"oclusivii","definite-error-unrecognized-form-feminine-neuter-plural":"oclusivele"}},{"word":"oclusivă","pos":"noun","definitions":["plosive"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"oclusivă","accusative-definite-nominative":"oclusiva","dative-genitive-indefinite":"oclusive","dative-definite-genitive":"oclusivei","vocative":"oclusivă"}},{"word":"ocluzie","pos":"noun","definitions":["alternative form of ocluziune"],"forms":{"plural":"ocluzii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ocluzie","accusative-definite-nominative-singular":"ocluzia","accusative-indefinite-nominative-plural":"ocluzii","accusative-definite-nominative-plural":"ocluziile","dative-genitive-indefinite-singular":"ocluzii","dative-definite-genitive-singular":"ocluziei","dative-genitive-indefinite-plural":"ocluzii","dative-definite-genitive-plural":"ocluziilor","singular-vocative":"ocluzie","plural-vocative":"ocluziilor"}},{"word":"ocluzie intestinală","pos":"noun","definitions":["bowel obstruction"],"forms":{"plural":"ocluzii intestinale"}},{"word":"ocluziune","pos":"noun","definitions":["occlusion"],"forms":{"plural":"ocluziuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"ocluziune","accusative-definite-nominative-singular":"ocluziunea","accusative-indefinite-nominative-plural":"ocluziune","accusative-definite-nominative-plural":"ocluziunele","dative-genitive-indefinite-singular":"ocluziune","dative-definite-genitive-singular":"ocluziunei","dative-genitive-indefinite-plural":"ocluziune","dative-definite-genitive-plural":"ocluziunelor","singular-vocative":"ocluziune","plural-vocative":"ocluziunelor"}},{"word":"ocluziune glotală","pos":"noun","definitions":["glottal stop"],"forms":{"plural":"ocluziuni glotale"}},{"word":"ocluziv","pos":"adj","definitions":["occlusive"],"forms":{"feminine-singular":"ocluzivă","masculine-plural":"ocluzivi","feminine-neuter-plural":"ocluzive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ocluziv","error-unrecognized-form-feminine-indefinite-singular":"ocluzivă","error-unrecognized-form-indefinite-masculine-plural":"ocluzivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"ocluzive","definite-error-unrecognized-form-masculine-neuter-singular":"ocluzivul","definite-error-unrecognized-form-feminine-singular":"ocluziva","definite-error-unrecognized-form-masculine-plural":"ocluzivii","definite-error-unrecognized-form-feminine-neuter-plural":"ocluzivele"}},{"word":"ocluzivă","pos":"adj","definitions":["alternative form of oclusivă"],"forms":{"plural":"ocluzive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-","error-unrecognized-form-feminine-indefinite-singular":"ocluzivă","error-unrecognized-form-indefinite-masculine-plural":"-","error-unrecognized-form-feminine-indefinite-neuter-plural":"ocluzive","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"ocluziva","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"ocluzivele"}},{"word":"ocna","pos":"noun","definitions":["definite nominative/accusative singular of ocnă"]},{"word":"ocnă","pos":"noun","definitions":["mine, especially salt mine","prison, especially one in which prisoners were forced to mine salt"],"forms":{"plural":"ocne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ocnă","accusative-definite-nominative-singular":"ocna","accusative-indefinite-nominative-plural":"ocne","accusative-definite-nominative-plural":"ocnele","dative-genitive-indefinite-singular":"ocne","dative-definite-genitive-singular":"ocnei","dative-genitive-indefinite-plural":"ocne","dative-definite-genitive-plural":"ocnelor","singular-vocative":"ocnă","plural-vocative":"ocnelor"}},{"word":"Ocna de Fier","pos":"name","definitions":["a commune of Caraș-Severin County, Romania","a village in Ocna de Fier, Caraș-Severin County, Romania"],"gender":"f"},{"word":"Ocna de Jos","pos":"name","definitions":["a village in Praid, Harghita County, Romania"],"gender":"f"},{"word":"Ocna de Sus","pos":"name","definitions":["a village in Praid, Harghita County, Romania"],"gender":"f"},{"word":"Ocna Dejului","pos":"name","definitions":["a locality in Dej, Cluj County, Romania"],"gender":"f"},{"word":"Ocna Mureș","pos":"name","definitions":["a city in Alba County, Romania"],"gender":"f"},{"word":"Ocna Sibiului","pos":"name","definitions":["a city in Sibiu County, Romania"],"gender":"f"},{"word":"Ocna Șugatag","pos":"name","definitions":["a commune of Maramureș County, Romania","a village in Ocna Șugatag, Maramureș County, Romania"],"gender":"f"},{"word":"ocnar","pos":"noun","definitions":["convict"],"forms":{"plural":"ocnari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ocnar","accusative-definite-nominative-singular":"ocnarul","accusative-indefinite-nominative-plural":"ocnari","accusative-definite-nominative-plural":"ocnarii","dative-genitive-indefinite-singular":"ocnar","dative-definite-genitive-singular":"ocnarului","dative-genitive-indefinite-plural":"ocnari","dative-definite-genitive-plural":"ocnarilor","singular-vocative":"ocnarule","plural-vocative":"ocnarilor"}},{"word":"Ocnăreasa","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"f"},{"word":"Ocnărescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ocnărescu"}},{"word":"ocnaș","pos":"noun","definitions":["convict"],"forms":{"plural":"ocnași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ocnaș","accusative-definite-nominative-singular":"ocnașul","accusative-indefinite-nominative-plural":"ocnași","accusative-definite-nominative-plural":"ocnașii","dative-genitive-indefinite-singular":"ocnaș","dative-definite-genitive-singular":"ocnașului","dative-genitive-indefinite-plural":"ocnași","dative-definite-genitive-plural":"ocnașilor","singular-vocative":"ocnașule","plural-vocative":"ocnașilor"}},{"word":"Ocnașu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ocnașu"}},{"word":"ocnean","pos":"noun","definitions":["convict"],"forms":{"plural":"ocneni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ocnean","accusative-definite-nominative-singular":"ocneanul","accusative-indefinite-nominative-plural":"ocneni","accusative-definite-nominative-plural":"ocnenii","dative-genitive-indefinite-singular":"ocnean","dative-definite-genitive-singular":"ocneanului","dative-genitive-indefinite-plural":"ocneni","dative-definite-genitive-plural":"ocnenilor","singular-vocative":"ocneanule","plural-vocative":"ocnenilor"}},{"word":"ocnele","pos":"noun","definitions":["definite nominative/accusative plural of ocnă"]},{"word":"Ocnele Mari","pos":"name","definitions":["a town in Vâlcea County, Romania"],"gender":"m"},{"word":"ocni","pos":"verb","definitions":["to work in a mine"],"forms":{"canonical":"a ocni 4th conjugation","present-singular-third-person":"ocnește","participle-past":"ocnit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ocni","gerund":"ocnind","first-person-indicative-present-singular":"ocnesc","indicative-present-second-person-singular":"ocnești","indicative-present-singular-third-person":"ocnește","first-person-indicative-plural-present":"ocnim","indicative-plural-present-second-person":"ocniți","indicative-plural-present-third-person":"ocnesc","first-person-imperfect-indicative-singular":"ocneam","imperfect-indicative-second-person-singular":"ocneai","imperfect-indicative-singular-third-person":"ocnea","first-person-imperfect-indicative-plural":"ocneam","imperfect-indicative-plural-second-person":"ocneați","imperfect-indicative-plural-third-person":"ocneau","first-person-indicative-perfect-singular":"ocnii","indicative-perfect-second-person-singular":"ocniși","indicative-perfect-singular-third-person":"ocni","first-person-indicative-perfect-plural":"ocnirăm","indicative-perfect-plural-second-person":"ocnirăți","indicative-perfect-plural-third-person":"ocniră","first-person-indicative-pluperfect-singular":"ocnisem","indicative-pluperfect-second-person-singular":"ocniseși","indicative-pluperfect-singular-third-person":"ocnise","first-person-indicative-pluperfect-plural":"ocniserăm","indicative-pluperfect-plural-second-person":"ocniserăți","indicative-pluperfect-plural-third-person":"ocniseră","first-person-present-singular-subjunctive":"să ocnesc","present-second-person-singular-subjunctive":"să ocnești","present-singular-subjunctive-third-person":"să ocnească","first-person-plural-present-subjunctive":"să ocnim","plural-present-second-person-subjunctive":"să ocniți","plural-present-subjunctive-third-person":"să ocnească","imperative-second-person-singular":"ocnește","imperative-plural-second-person":"ocniți","imperative-negative-second-person-singular":"nu ocni","imperative-negative-plural-second-person":"nu ocniți"}},{"word":"Ocnișoara","pos":"name","definitions":["a village in Lopadea Nouă, Alba County, Romania"],"gender":"f"},{"word":"Ocnița","pos":"name","definitions":["a village in Teaca, Bistrița-Năsăud County, Romania","a commune of Dâmbovița County, Romania","a village in Ocnița, Dâmbovița County, Romania","a locality in Ocnele Mari, Vâlcea County, Romania"],"gender":"f"},{"word":"ocnița","pos":"noun","definitions":["definite nominative/accusative singular of ocniță"]},{"word":"ocniță","pos":"noun","definitions":["diminutive of ocnă; small mine"],"forms":{"plural":"ocnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ocniță","accusative-definite-nominative-singular":"ocnița","accusative-indefinite-nominative-plural":"ocnițe","accusative-definite-nominative-plural":"ocnițele","dative-genitive-indefinite-singular":"ocnițe","dative-definite-genitive-singular":"ocniței","dative-genitive-indefinite-plural":"ocnițe","dative-definite-genitive-plural":"ocnițelor","singular-vocative":"ocniță","plural-vocative":"ocnițelor"}},{"word":"Ocnița-Răzeși","pos":"name","definitions":["a village in Cucuruzeni, Orhei Raion, Moldova"],"gender":"f"},{"word":"Ocnița-Țărani","pos":"name","definitions":["a village in Zorile, Orhei Raion, Moldova"],"gender":"f"},{"word":"ocniței","pos":"noun","definitions":["definite genitive/dative singular of ocniță"]},{"word":"Ocoale","pos":"name","definitions":["a village in Gârda de Sus, Alba County, Romania"],"gender":"m"},{"word":"ocol","pos":"noun","definitions":["detour, roundabout way","circuit","enclosure, pen","deviation"],"forms":{"plural":"ocoluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ocol","accusative-definite-nominative-singular":"ocolul","accusative-indefinite-nominative-plural":"ocoluri","accusative-definite-nominative-plural":"ocolurile","dative-genitive-indefinite-singular":"ocol","dative-definite-genitive-singular":"ocolului","dative-genitive-indefinite-plural":"ocoluri","dative-definite-genitive-plural":"ocolurilor","singular-vocative":"ocolule","plural-vocative":"ocolurilor"}},{"word":"ocolaș","pos":"noun","definitions":["diminutive of ocol"],"forms":{"plural":"ocolașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ocolaș","accusative-definite-nominative-singular":"ocolașul","accusative-indefinite-nominative-plural":"ocolașe","accusative-definite-nominative-plural":"ocolașele","dative-genitive-indefinite-singular":"ocolaș","dative-definite-genitive-singular":"ocolașului","dative-genitive-indefinite-plural":"ocolașe","dative-definite-genitive-plural":"ocolașelor","singular-vocative":"ocolașule","plural-vocative":"ocolașelor"}},{"word":"ocoleală","pos":"noun","definitions":["detour"],"forms":{"plural":"ocoleli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ocoleală","accusative-definite-nominative-singular":"ocoleala","accusative-indefinite-nominative-plural":"ocoleli","accusative-definite-nominative-plural":"ocolelile","dative-genitive-indefinite-singular":"ocoleli","dative-definite-genitive-singular":"ocolelii","dative-genitive-indefinite-plural":"ocoleli","dative-definite-genitive-plural":"ocolelilor","singular-vocative":"ocoleală","plural-vocative":"ocolelilor"}},{"word":"Ocoleanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ocoleanu"}},{"word":"ocoli","pos":"verb","definitions":["to go around, make a detour, take a roundabout way","to avoid, bypass, circumvent, sidestep","to shirk","to surround with, enclose"],"forms":{"canonical":"a ocoli 4th conjugation","present-singular-third-person":"ocolește","participle-past":"ocolit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ocoli","gerund":"ocolind","first-person-indicative-present-singular":"ocolesc","indicative-present-second-person-singular":"ocolești","indicative-present-singular-third-person":"ocolește","first-person-indicative-plural-present":"ocolim","indicative-plural-present-second-person":"ocoliți","indicative-plural-present-third-person":"ocolesc","first-person-imperfect-indicative-singular":"ocoleam","imperfect-indicative-second-person-singular":"ocoleai","imperfect-indicative-singular-third-person":"ocolea","first-person-imperfect-indicative-plural":"ocoleam","imperfect-indicative-plural-second-person":"ocoleați","imperfect-indicative-plural-third-person":"ocoleau","first-person-indicative-perfect-singular":"ocolii","indicative-perfect-second-person-singular":"ocoliși","indicative-perfect-singular-third-person":"ocoli","first-person-indicative-perfect-plural":"ocolirăm","indicative-perfect-plural-second-person":"ocolirăți","indicative-perfect-plural-third-person":"ocoliră","first-person-indicative-pluperfect-singular":"ocolisem","indicative-pluperfect-second-person-singular":"ocoliseși","indicative-pluperfect-singular-third-person":"ocolise","first-person-indicative-pluperfect-plural":"ocoliserăm","indicative-pluperfect-plural-second-person":"ocoliserăți","indicative-pluperfect-plural-third-person":"ocoliseră","first-person-present-singular-subjunctive":"să ocolesc","present-second-person-singular-subjunctive":"să ocolești","present-singular-subjunctive-third-person":"să ocolească","first-person-plural-present-subjunctive":"să ocolim","plural-present-second-person-subjunctive":"să ocoliți","plural-present-subjunctive-third-person":"să ocolească","imperative-second-person-singular":"ocolește","imperative-plural-second-person":"ocoliți","imperative-negative-second-person-singular":"nu ocoli","imperative-negative-plural-second-person":"nu ocoliți"}},{"word":"ocolire","pos":"noun","definitions":["detour"],"forms":{"plural":"ocoliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ocolire","accusative-definite-nominative-singular":"ocolirea","accusative-indefinite-nominative-plural":"ocoliri","accusative-definite-nominative-plural":"ocolirile","dative-genitive-indefinite-singular":"ocoliri","dative-definite-genitive-singular":"ocolirii","dative-genitive-indefinite-plural":"ocoliri","dative-definite-genitive-plural":"ocolirilor","singular-vocative":"ocolire","plural-vocative":"ocolirilor"}},{"word":"Ocoliș","pos":"name","definitions":["a commune of Alba County, Romania","a village in Ocoliș, Alba County, Romania","a village in Groși, Maramureș County, Romania"],"gender":"m"},{"word":"ocoliș","pos":"noun","definitions":["roundabout way"],"forms":{"plural":"ocolișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ocoliș","accusative-definite-nominative-singular":"ocolișul","accusative-indefinite-nominative-plural":"ocolișuri","accusative-definite-nominative-plural":"ocolișurile","dative-genitive-indefinite-singular":"ocoliș","dative-definite-genitive-singular":"ocolișului","dative-genitive-indefinite-plural":"ocolișuri","dative-definite-genitive-plural":"ocolișurilor","singular-vocative":"ocolișule","plural-vocative":"ocolișurilor"}},{"word":"Ocolișel","pos":"name","definitions":["a village in Iara, Cluj County, Romania"],"gender":"m"},{"word":"Ocolișu Mare","pos":"name","definitions":["a village in Bretea Română, Hunedoara County, Romania"],"gender":"m"},{"word":"Ocolișu Mic","pos":"name","definitions":["a village in Orăștioara de Sus, Hunedoara County, Romania"],"gender":"m"},{"word":"ocolit","pos":"adj","definitions":["making a detour, going around"],"forms":{"feminine-singular":"ocolită","masculine-plural":"ocoliți","feminine-neuter-plural":"ocolite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ocolit","error-unrecognized-form-feminine-indefinite-singular":"ocolită","error-unrecognized-form-indefinite-masculine-plural":"ocoliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ocolite","definite-error-unrecognized-form-masculine-neuter-singular":"ocolitul","definite-error-unrecognized-form-feminine-singular":"ocolita","definite-error-unrecognized-form-masculine-plural":"ocoliții","definite-error-unrecognized-form-feminine-neuter-plural":"ocolitele"}},{"word":"ocolitor","pos":"adj","definitions":["detouring, bypassing"],"forms":{"feminine-singular":"ocolitoare","masculine-plural":"ocolitori","feminine-neuter-plural":"ocolitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ocolitor","error-unrecognized-form-feminine-indefinite-singular":"ocolitoare","error-unrecognized-form-indefinite-masculine-plural":"ocolitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"ocolitoare","definite-error-unrecognized-form-masculine-neuter-singular":"ocolitorul","definite-error-unrecognized-form-feminine-singular":"ocolitoarea","definite-error-unrecognized-form-masculine-plural":"ocolitorii","definite-error-unrecognized-form-feminine-neuter-plural":"ocolitoarele"}},{"word":"ocolitură","pos":"noun","definitions":["detour"],"forms":{"plural":"ocolituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ocolitură","accusative-definite-nominative-singular":"ocolitura","accusative-indefinite-nominative-plural":"ocolituri","accusative-definite-nominative-plural":"ocoliturile","dative-genitive-indefinite-singular":"ocolituri","dative-definite-genitive-singular":"ocoliturii","dative-genitive-indefinite-plural":"ocolituri","dative-definite-genitive-plural":"ocoliturilor","singular-vocative":"ocolitură","plural-vocative":"ocoliturilor"}},{"word":"Ocolna","pos":"name","definitions":["a village in Amărăștii de Jos, Dolj County, Romania"],"gender":"f"},{"word":"ocop","pos":"noun","definitions":["trench"],"forms":{"plural":"ocopuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ocop","accusative-definite-nominative-singular":"ocopul","accusative-indefinite-nominative-plural":"ocopuri","accusative-definite-nominative-plural":"ocopurile","dative-genitive-indefinite-singular":"ocop","dative-definite-genitive-singular":"ocopului","dative-genitive-indefinite-plural":"ocopuri","dative-definite-genitive-plural":"ocopurilor","singular-vocative":"ocopule","plural-vocative":"ocopurilor"}},{"word":"ocoșag","pos":"noun","definitions":["smartness, smarts, brains"],"forms":{"plural":"ocoșaguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ocoșag","accusative-definite-nominative-singular":"ocoșagul","accusative-indefinite-nominative-plural":"ocoșaguri","accusative-definite-nominative-plural":"ocoșagurile","dative-genitive-indefinite-singular":"ocoșag","dative-definite-genitive-singular":"ocoșagului","dative-genitive-indefinite-plural":"ocoșaguri","dative-definite-genitive-plural":"ocoșagurilor","singular-vocative":"ocoșagule","plural-vocative":"ocoșagurilor"}},{"word":"ocoșeală","pos":"noun","definitions":["boasting"],"forms":{"plural":"ocoșeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ocoșeală","accusative-definite-nominative-singular":"ocoșeala","accusative-indefinite-nominative-plural":"ocoșele","accusative-definite-nominative-plural":"ocoșelele","dative-genitive-indefinite-singular":"ocoșele","dative-definite-genitive-singular":"ocoșelei","dative-genitive-indefinite-plural":"ocoșele","dative-definite-genitive-plural":"ocoșelelor","singular-vocative":"ocoșeală","plural-vocative":"ocoșelelor"}},{"word":"ocropi","pos":"verb","definitions":["to wet, to water"],"forms":{"canonical":"a ocropi 4th conjugation","present-singular-third-person":"ocropește","participle-past":"ocropit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ocropi","gerund":"ocropind","first-person-indicative-present-singular":"ocropesc","indicative-present-second-person-singular":"ocropești","indicative-present-singular-third-person":"ocropește","first-person-indicative-plural-present":"ocropim","indicative-plural-present-second-person":"ocropiți","indicative-plural-present-third-person":"ocropesc","first-person-imperfect-indicative-singular":"ocropeam","imperfect-indicative-second-person-singular":"ocropeai","imperfect-indicative-singular-third-person":"ocropea","first-person-imperfect-indicative-plural":"ocropeam","imperfect-indicative-plural-second-person":"ocropeați","imperfect-indicative-plural-third-person":"ocropeau","first-person-indicative-perfect-singular":"ocropii","indicative-perfect-second-person-singular":"ocropiși","indicative-perfect-singular-third-person":"ocropi","first-person-indicative-perfect-plural":"ocropirăm","indicative-perfect-plural-second-person":"ocropirăți","indicative-perfect-plural-third-person":"ocropiră","first-person-indicative-pluperfect-singular":"ocropisem","indicative-pluperfect-second-person-singular":"ocropiseși","indicative-pluperfect-singular-third-person":"ocropise","first-person-indicative-pluperfect-plural":"ocropiserăm","indicative-pluperfect-plural-second-person":"ocropiserăți","indicative-pluperfect-plural-third-person":"ocropiseră","first-person-present-singular-subjunctive":"să ocropesc","present-second-person-singular-subjunctive":"să ocropești","present-singular-subjunctive-third-person":"să ocropească","first-person-plural-present-subjunctive":"să ocropim","plural-present-second-person-subjunctive":"să ocropiți","plural-present-subjunctive-third-person":"să ocropească","imperative-second-person-singular":"ocropește","imperative-plural-second-person":"ocropiți","imperative-negative-second-person-singular":"nu ocropi","imperative-negative-plural-second-person":"nu ocropiți"}},{"word":"ocroplenie","pos":"noun","definitions":["sprinkling"],"forms":{"plural":"ocroplenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ocroplenie","accusative-definite-nominative-singular":"ocroplenia","accusative-indefinite-nominative-plural":"ocroplenii","accusative-definite-nominative-plural":"ocropleniile","dative-genitive-indefinite-singular":"ocroplenii","dative-definite-genitive-singular":"ocropleniei","dative-genitive-indefinite-plural":"ocroplenii","dative-definite-genitive-plural":"ocropleniilor","singular-vocative":"ocroplenie","plural-vocative":"ocropleniilor"}},{"word":"ocroteală","pos":"noun","definitions":["protection"],"forms":{"plural":"ocroteli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ocroteală","accusative-definite-nominative-singular":"ocroteala","accusative-indefinite-nominative-plural":"ocrotele","accusative-definite-nominative-plural":"ocrotelele","dative-genitive-indefinite-singular":"ocrotele","dative-definite-genitive-singular":"ocrotelei","dative-genitive-indefinite-plural":"ocrotele","dative-definite-genitive-plural":"ocrotelelor","singular-vocative":"ocroteală","plural-vocative":"ocrotelelor"}},{"word":"ocroti","pos":"verb","definitions":["to protect, defend, shield"],"forms":{"canonical":"a ocroti 4th conjugation","present-singular-third-person":"ocrotește","participle-past":"ocrotit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ocroti","gerund":"ocrotind","first-person-indicative-present-singular":"ocrotesc","indicative-present-second-person-singular":"ocrotești","indicative-present-singular-third-person":"ocrotește","first-person-indicative-plural-present":"ocrotim","indicative-plural-present-second-person":"ocrotiți","indicative-plural-present-third-person":"ocrotesc","first-person-imperfect-indicative-singular":"ocroteam","imperfect-indicative-second-person-singular":"ocroteai","imperfect-indicative-singular-third-person":"ocrotea","first-person-imperfect-indicative-plural":"ocroteam","imperfect-indicative-plural-second-person":"ocroteați","imperfect-indicative-plural-third-person":"ocroteau","first-person-indicative-perfect-singular":"ocrotii","indicative-perfect-second-person-singular":"ocrotiși","indicative-perfect-singular-third-person":"ocroti","first-person-indicative-perfect-plural":"ocrotirăm","indicative-perfect-plural-second-person":"ocrotirăți","indicative-perfect-plural-third-person":"ocrotiră","first-person-indicative-pluperfect-singular":"ocrotisem","indicative-pluperfect-second-person-singular":"ocrotiseși","indicative-pluperfect-singular-third-person":"ocrotise","first-person-indicative-pluperfect-plural":"ocrotiserăm","indicative-pluperfect-plural-second-person":"ocrotiserăți","indicative-pluperfect-plural-third-person":"ocrotiseră","first-person-present-singular-subjunctive":"să ocrotesc","present-second-person-singular-subjunctive":"să ocrotești","present-singular-subjunctive-third-person":"să ocrotească","first-person-plural-present-subjunctive":"să ocrotim","plural-present-second-person-subjunctive":"să ocrotiți","plural-present-subjunctive-third-person":"să ocrotească","imperative-second-person-singular":"ocrotește","imperative-plural-second-person":"ocrotiți","imperative-negative-second-person-singular":"nu ocroti","imperative-negative-plural-second-person":"nu ocrotiți"}},{"word":"ocrotire","pos":"noun","definitions":["protection, sheltering"],"forms":{"plural":"ocrotiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ocrotire","accusative-definite-nominative-singular":"ocrotirea","accusative-indefinite-nominative-plural":"ocrotiri","accusative-definite-nominative-plural":"ocrotirile","dative-genitive-indefinite-singular":"ocrotiri","dative-definite-genitive-singular":"ocrotirii","dative-genitive-indefinite-plural":"ocrotiri","dative-definite-genitive-plural":"ocrotirilor","singular-vocative":"ocrotire","plural-vocative":"ocrotirilor"}},{"word":"ocrotirea sănătății","pos":"noun","definitions":["health care"]},{"word":"ocrotitor","pos":"adj","definitions":["shielding"],"forms":{"feminine-singular":"ocrotitoare","masculine-plural":"ocrotitori","feminine-neuter-plural":"ocrotitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ocrotitor","error-unrecognized-form-feminine-indefinite-singular":"ocrotitoare","error-unrecognized-form-indefinite-masculine-plural":"ocrotitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"ocrotitoare","definite-error-unrecognized-form-masculine-neuter-singular":"ocrotitorul","definite-error-unrecognized-form-feminine-singular":"ocrotitoarea","definite-error-unrecognized-form-masculine-plural":"ocrotitorii","definite-error-unrecognized-form-feminine-neuter-plural":"ocrotitoarele"}},{"word":"ocru","pos":"noun","definitions":["ocher"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ocru","accusative-definite-nominative-singular":"ocrul","accusative-indefinite-nominative-plural":"ocrue","accusative-definite-nominative-plural":"ocruele","dative-genitive-indefinite-singular":"ocru","dative-definite-genitive-singular":"ocrului","dative-genitive-indefinite-plural":"ocrue","dative-definite-genitive-plural":"ocruelor","singular-vocative":"ocrule","plural-vocative":"ocruelor"}},{"word":"ocrug","pos":"noun","definitions":["district, okrug"],"forms":{"plural":"ocruguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ocrug","accusative-definite-nominative-singular":"ocrugul","accusative-indefinite-nominative-plural":"ocruguri","accusative-definite-nominative-plural":"ocrugurile","dative-genitive-indefinite-singular":"ocrug","dative-definite-genitive-singular":"ocrugului","dative-genitive-indefinite-plural":"ocruguri","dative-definite-genitive-plural":"ocrugurilor","singular-vocative":"ocrugule","plural-vocative":"ocrugurilor"}},{"word":"octacord","pos":"adj","definitions":["having eight strings"],"forms":{"feminine-singular":"octacordă","masculine-plural":"octacorzi","feminine-neuter-plural":"octacorde","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"octacord","error-unrecognized-form-feminine-indefinite-singular":"octacordă","error-unrecognized-form-indefinite-masculine-plural":"octacorzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"octacorde","definite-error-unrecognized-form-masculine-neuter-singular":"octacordul","definite-error-unrecognized-form-feminine-singular":"octacorda","definite-error-unrecognized-form-masculine-plural":"octacorzii","definite-error-unrecognized-form-feminine-neuter-plural":"octacordele"}},{"word":"octacord","pos":"noun","definitions":["octachord"],"forms":{"plural":"octacorzi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"octacord","accusative-definite-nominative-singular":"octacordul","accusative-indefinite-nominative-plural":"octacorzi","accusative-definite-nominative-plural":"octacorzile","dative-genitive-indefinite-singular":"octacord","dative-definite-genitive-singular":"octacordului","dative-genitive-indefinite-plural":"octacorzi","dative-definite-genitive-plural":"octacorzilor","singular-vocative":"octacordule","plural-vocative":"octacorzilor"}},{"word":"octaedric","pos":"adj","definitions":["octahedral"],"forms":{"feminine-singular":"octaedrică","masculine-plural":"octaedrici","feminine-neuter-plural":"octaedrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"octaedric","error-unrecognized-form-feminine-indefinite-singular":"octaedrică","error-unrecognized-form-indefinite-masculine-plural":"octaedrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"octaedrice","definite-error-unrecognized-form-masculine-neuter-singular":"octaedricul","definite-error-unrecognized-form-feminine-singular":"octaedrica","definite-error-unrecognized-form-masculine-plural":"octaedricii","definite-error-unrecognized-form-feminine-neuter-plural":"octaedricele"}},{"word":"octaedru","pos":"noun","definitions":["octahedron"],"forms":{"plural":"octaedre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"octaedru","accusative-definite-nominative-singular":"octaedrul","accusative-indefinite-nominative-plural":"octaedre","accusative-definite-nominative-plural":"octaedrele","dative-genitive-indefinite-singular":"octaedru","dative-definite-genitive-singular":"octaedrului","dative-genitive-indefinite-plural":"octaedre","dative-definite-genitive-plural":"octaedrelor","singular-vocative":"octaedrule","plural-vocative":"octaedrelor"}},{"word":"octal","pos":"adj","definitions":["octal"],"pronunciation":"/okˈtal/","forms":{"feminine-singular":"octală","masculine-plural":"octali","feminine-neuter-plural":"octale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"octal","error-unrecognized-form-feminine-indefinite-singular":"octală","error-unrecognized-form-indefinite-masculine-plural":"octali","error-unrecognized-form-feminine-indefinite-neuter-plural":"octale","definite-error-unrecognized-form-masculine-neuter-singular":"octalul","definite-error-unrecognized-form-feminine-singular":"octala","definite-error-unrecognized-form-masculine-plural":"octalii","definite-error-unrecognized-form-feminine-neuter-plural":"octalele"}},{"word":"octan","pos":"noun","definitions":["octane"],"forms":{"plural":"octani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"octan","accusative-definite-nominative-singular":"octanul","accusative-indefinite-nominative-plural":"octani","accusative-definite-nominative-plural":"octanii","dative-genitive-indefinite-singular":"octan","dative-definite-genitive-singular":"octanului","dative-genitive-indefinite-plural":"octani","dative-definite-genitive-plural":"octanilor","singular-vocative":"octanule","plural-vocative":"octanilor"}},{"word":"octanic","pos":"adj","definitions":["octane"],"forms":{"feminine-singular":"octanică","masculine-plural":"octanici","feminine-neuter-plural":"octanice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"octanic","error-unrecognized-form-feminine-indefinite-singular":"octanică","error-unrecognized-form-indefinite-masculine-plural":"octanici","error-unrecognized-form-feminine-indefinite-neuter-plural":"octanice","definite-error-unrecognized-form-masculine-neuter-singular":"octanicul","definite-error-unrecognized-form-feminine-singular":"octanica","definite-error-unrecognized-form-masculine-plural":"octanicii","definite-error-unrecognized-form-feminine-neuter-plural":"octanicele"}},{"word":"octant","pos":"noun","definitions":["octant"],"pronunciation":"/okˈtant/","forms":{"plural":"octante","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"octant","accusative-definite-nominative-singular":"octantul","accusative-indefinite-nominative-plural":"octante","accusative-definite-nominative-plural":"octantele","dative-genitive-indefinite-singular":"octant","dative-definite-genitive-singular":"octantului","dative-genitive-indefinite-plural":"octante","dative-definite-genitive-plural":"octantelor","singular-vocative":"octantule","plural-vocative":"octantelor"}},{"word":"octatlon","pos":"noun","definitions":["octathlon"],"forms":{"plural":"octatloane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"octatlon","accusative-definite-nominative-singular":"octatlonul","accusative-indefinite-nominative-plural":"octatloane","accusative-definite-nominative-plural":"octatloanele","dative-genitive-indefinite-singular":"octatlon","dative-definite-genitive-singular":"octatlonului","dative-genitive-indefinite-plural":"octatloane","dative-definite-genitive-plural":"octatloanelor","singular-vocative":"octatlonule","plural-vocative":"octatloanelor"}},{"word":"octatlonist","pos":"noun","definitions":["octathlete"],"forms":{"plural":"octatloniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"octatlonist","accusative-definite-nominative-singular":"octatlonistul","accusative-indefinite-nominative-plural":"octatloniști","accusative-definite-nominative-plural":"octatloniștii","dative-genitive-indefinite-singular":"octatlonist","dative-definite-genitive-singular":"octatlonistului","dative-genitive-indefinite-plural":"octatloniști","dative-definite-genitive-plural":"octatloniștilor","singular-vocative":"octatlonistule","plural-vocative":"octatloniștilor"}},{"word":"octatlonistă","pos":"noun","definitions":["female equivalent of octatlonist"],"forms":{"plural":"octatloniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"octatlonistă","accusative-definite-nominative-singular":"octatlonista","accusative-indefinite-nominative-plural":"octatloniste","accusative-definite-nominative-plural":"octatlonistele","dative-genitive-indefinite-singular":"octatloniste","dative-definite-genitive-singular":"octatlonistei","dative-genitive-indefinite-plural":"octatloniste","dative-definite-genitive-plural":"octatlonistelor","singular-vocative":"octatlonistă","plural-vocative":"octatlonistelor"}},{"word":"Octav","pos":"name","definitions":["a male given name from Latin"],"pronunciation":"/okˈtav/","gender":"m"},{"word":"octavă","pos":"noun","definitions":["octave"],"forms":{"plural":"octave","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"octavă","accusative-definite-nominative-singular":"octava","accusative-indefinite-nominative-plural":"octave","accusative-definite-nominative-plural":"octavele","dative-genitive-indefinite-singular":"octave","dative-definite-genitive-singular":"octavei","dative-genitive-indefinite-plural":"octave","dative-definite-genitive-plural":"octavelor","singular-vocative":"octavă","plural-vocative":"octavelor"}},{"word":"octavin","pos":"noun","definitions":["octavin"],"forms":{"plural":"octavine","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"octavin","accusative-definite-nominative-singular":"octavinul","accusative-indefinite-nominative-plural":"octavine","accusative-definite-nominative-plural":"octavinele","dative-genitive-indefinite-singular":"octavin","dative-definite-genitive-singular":"octavinului","dative-genitive-indefinite-plural":"octavine","dative-definite-genitive-plural":"octavinelor","singular-vocative":"octavinule","plural-vocative":"octavinelor"}},{"word":"Octeabriscoe","pos":"name","definitions":["a village in Moșana, Dondușeni Raion, Moldova","a village in Văscăuți, Florești Raion, Moldova","a village in Țambula, Sîngerei Raion, Moldova"],"gender":"m"},{"word":"octet","pos":"noun","definitions":["byte (of eight bits)"],"pronunciation":"/okˈtet/","forms":{"plural":"octeți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"octet","accusative-definite-nominative-singular":"octetul","accusative-indefinite-nominative-plural":"octeți","accusative-definite-nominative-plural":"octeții","dative-genitive-indefinite-singular":"octet","dative-definite-genitive-singular":"octetului","dative-genitive-indefinite-plural":"octeți","dative-definite-genitive-plural":"octeților","singular-vocative":"octetule","plural-vocative":"octeților"}},{"word":"octocoralier","pos":"noun","definitions":["octocoral"],"forms":{"plural":"octocoralieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"octocoralier","accusative-definite-nominative-singular":"octocoralierul","accusative-indefinite-nominative-plural":"octocoralieri","accusative-definite-nominative-plural":"octocoralierii","dative-genitive-indefinite-singular":"octocoralier","dative-definite-genitive-singular":"octocoralierului","dative-genitive-indefinite-plural":"octocoralieri","dative-definite-genitive-plural":"octocoralierilor","singular-vocative":"octocoralierule","plural-vocative":"octocoralierilor"}},{"word":"octodă","pos":"noun","definitions":["octode"],"forms":{"plural":"octode","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"octodă","accusative-definite-nominative-singular":"octoda","accusative-indefinite-nominative-plural":"octode","accusative-definite-nominative-plural":"octodele","dative-genitive-indefinite-singular":"octode","dative-definite-genitive-singular":"octodei","dative-genitive-indefinite-plural":"octode","dative-definite-genitive-plural":"octodelor","singular-vocative":"octodă","plural-vocative":"octodelor"}},{"word":"octogenar","pos":"noun","definitions":["octogenarian"],"forms":{"plural":"octogenari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"octogenar","accusative-definite-nominative-singular":"octogenarul","accusative-indefinite-nominative-plural":"octogenari","accusative-definite-nominative-plural":"octogenarii","dative-genitive-indefinite-singular":"octogenar","dative-definite-genitive-singular":"octogenarului","dative-genitive-indefinite-plural":"octogenari","dative-definite-genitive-plural":"octogenarilor","singular-vocative":"octogenarule","plural-vocative":"octogenarilor"}},{"word":"octogenară","pos":"noun","definitions":["female equivalent of octogenar"],"forms":{"plural":"octogenare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"octogenară","accusative-definite-nominative-singular":"octogenara","accusative-indefinite-nominative-plural":"octogenare","accusative-definite-nominative-plural":"octogenarele","dative-genitive-indefinite-singular":"octogenare","dative-definite-genitive-singular":"octogenarei","dative-genitive-indefinite-plural":"octogenare","dative-definite-genitive-plural":"octogenarelor","singular-vocative":"octogenară","plural-vocative":"octogenarelor"}},{"word":"octogon","pos":"noun","definitions":["octagon"],"forms":{"plural":"octogoni","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"octogon","accusative-definite-nominative-singular":"octogonul","accusative-indefinite-nominative-plural":"octogoni","accusative-definite-nominative-plural":"octogonile","dative-genitive-indefinite-singular":"octogon","dative-definite-genitive-singular":"octogonului","dative-genitive-indefinite-plural":"octogoni","dative-definite-genitive-plural":"octogonilor","singular-vocative":"octogonule","plural-vocative":"octogonilor"}},{"word":"octogonal","pos":"adj","definitions":["octagonal"],"forms":{"feminine-singular":"octogonală","masculine-plural":"octogonali","feminine-neuter-plural":"octogonale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"octogonal","error-unrecognized-form-feminine-indefinite-singular":"octogonală","error-unrecognized-form-indefinite-masculine-plural":"octogonali","error-unrecognized-form-feminine-indefinite-neuter-plural":"octogonale","definite-error-unrecognized-form-masculine-neuter-singular":"octogonalul","definite-error-unrecognized-form-feminine-singular":"octogonala","definite-error-unrecognized-form-masculine-plural":"octogonalii","definite-error-unrecognized-form-feminine-neuter-plural":"octogonalele"}},{"word":"octoih","pos":"noun","definitions":["Octoechos"],"forms":{"plural":"octoihuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"octoih","accusative-definite-nominative-singular":"octoihul","accusative-indefinite-nominative-plural":"octoihuri","accusative-definite-nominative-plural":"octoihurile","dative-genitive-indefinite-singular":"octoih","dative-definite-genitive-singular":"octoihului","dative-genitive-indefinite-plural":"octoihuri","dative-definite-genitive-plural":"octoihurilor","singular-vocative":"octoihule","plural-vocative":"octoihurilor"}},{"word":"octombrie","pos":"noun","definitions":["October"],"pronunciation":"/okˈtombrije/","forms":{"alternative-common":"octomvrie"}},{"word":"octometre","pos":"noun","definitions":["plural of octometru"]},{"word":"octometru","pos":"noun","definitions":["octameter"],"pronunciation":"/ok.toˈme.tru/","forms":{"plural":"octometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"octometru","accusative-definite-nominative-singular":"octometrul","accusative-indefinite-nominative-plural":"octometre","accusative-definite-nominative-plural":"octometrele","dative-genitive-indefinite-singular":"octometru","dative-definite-genitive-singular":"octometrului","dative-genitive-indefinite-plural":"octometre","dative-definite-genitive-plural":"octometrelor","singular-vocative":"octometrule","plural-vocative":"octometrelor"}},{"word":"octomvre","pos":"noun","definitions":["alternative form of octombrie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"octomvre","accusative-definite-nominative":"octomvreul","dative-genitive-indefinite":"octomvre","dative-definite-genitive":"octomvreului","vocative":"octomvreule"}},{"word":"octomvrie","pos":"noun","definitions":["alternative form of octombrie"],"forms":{"plural":"octomvrii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"octomvrie","accusative-definite-nominative-singular":"octomvrieul","accusative-indefinite-nominative-plural":"octomvrii","accusative-definite-nominative-plural":"octomvriii","dative-genitive-indefinite-singular":"octomvrie","dative-definite-genitive-singular":"octomvrieului","dative-genitive-indefinite-plural":"octomvrii","dative-definite-genitive-plural":"octomvriilor","singular-vocative":"octomvrieule","plural-vocative":"octomvriilor"}},{"word":"octopod","pos":"noun","definitions":["octopod"],"forms":{"plural":"octopozi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"octopod","accusative-definite-nominative-singular":"octopodul","accusative-indefinite-nominative-plural":"octopozi","accusative-definite-nominative-plural":"octopozile","dative-genitive-indefinite-singular":"octopod","dative-definite-genitive-singular":"octopodului","dative-genitive-indefinite-plural":"octopozi","dative-definite-genitive-plural":"octopozilor","singular-vocative":"octopodule","plural-vocative":"octopozilor"}},{"word":"octosilab","pos":"noun","definitions":["octosyllable"],"forms":{"plural":"octosilabe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"octosilab","accusative-definite-nominative-singular":"octosilabul","accusative-indefinite-nominative-plural":"octosilabe","accusative-definite-nominative-plural":"octosilabele","dative-genitive-indefinite-singular":"octosilab","dative-definite-genitive-singular":"octosilabului","dative-genitive-indefinite-plural":"octosilabe","dative-definite-genitive-plural":"octosilabelor","singular-vocative":"octosilabule","plural-vocative":"octosilabelor"}},{"word":"octosilabic","pos":"adj","definitions":["octosyllabic"],"forms":{"feminine-singular":"octosilabică","masculine-plural":"octosilabici","feminine-neuter-plural":"octosilabice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"octosilabic","error-unrecognized-form-feminine-indefinite-singular":"octosilabică","error-unrecognized-form-indefinite-masculine-plural":"octosilabici","error-unrecognized-form-feminine-indefinite-neuter-plural":"octosilabice","definite-error-unrecognized-form-masculine-neuter-singular":"octosilabicul","definite-error-unrecognized-form-feminine-singular":"octosilabica","definite-error-unrecognized-form-masculine-plural":"octosilabicii","definite-error-unrecognized-form-feminine-neuter-plural":"octosilabicele"}},{"word":"octostil","pos":"noun","definitions":["octostyle"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"octostil","accusative-definite-nominative":"octostilul","dative-genitive-indefinite":"octostil","dative-definite-genitive":"octostilului","vocative":"octostilule"}},{"word":"octroia","pos":"verb","definitions":["to grant"],"forms":{"canonical":"a octroia 1st conjugation","present-singular-third-person":"octroiază","participle-past":"octroiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a octroia","gerund":"octroind","first-person-indicative-present-singular":"octroi","indicative-present-second-person-singular":"octroi","indicative-present-singular-third-person":"octroie","first-person-indicative-plural-present":"octroiem","indicative-plural-present-second-person":"octroiați","indicative-plural-present-third-person":"octroie","first-person-imperfect-indicative-singular":"octroiam","imperfect-indicative-second-person-singular":"octroiai","imperfect-indicative-singular-third-person":"octroia","first-person-imperfect-indicative-plural":"octroiam","imperfect-indicative-plural-second-person":"octroiați","imperfect-indicative-plural-third-person":"octroiau","first-person-indicative-perfect-singular":"octroiai","indicative-perfect-second-person-singular":"octroiași","indicative-perfect-singular-third-person":"octroie","first-person-indicative-perfect-plural":"octroiarăm","indicative-perfect-plural-second-person":"octroiarăți","indicative-perfect-plural-third-person":"octroiară","first-person-indicative-pluperfect-singular":"octroiasem","indicative-pluperfect-second-person-singular":"octroiaseși","indicative-pluperfect-singular-third-person":"octroiase","first-person-indicative-pluperfect-plural":"octroiaserăm","indicative-pluperfect-plural-second-person":"octroiaserăți","indicative-pluperfect-plural-third-person":"octroiaseră","first-person-present-singular-subjunctive":"să octroi","present-second-person-singular-subjunctive":"să octroi","present-singular-subjunctive-third-person":"să octroie","first-person-plural-present-subjunctive":"să octroiem","plural-present-second-person-subjunctive":"să octroiați","plural-present-subjunctive-third-person":"să octroie","imperative-second-person-singular":"octroie","imperative-plural-second-person":"octroiați","imperative-negative-second-person-singular":"nu octroia","imperative-negative-plural-second-person":"nu octroiați"}},{"word":"octuplet","pos":"noun","definitions":["octuplet"],"forms":{"plural":"octupleți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"octuplet","accusative-definite-nominative-singular":"octupletul","accusative-indefinite-nominative-plural":"octupleți","accusative-definite-nominative-plural":"octupleții","dative-genitive-indefinite-singular":"octuplet","dative-definite-genitive-singular":"octupletului","dative-genitive-indefinite-plural":"octupleți","dative-definite-genitive-plural":"octupleților","singular-vocative":"octupletule","plural-vocative":"octupleților"}},{"word":"octupleți","pos":"noun","definitions":["plural of octuplet"]},{"word":"octupli","pos":"noun","definitions":["plural of octuplu"]},{"word":"octuplu","pos":"noun","definitions":["eightfold"],"forms":{"plural":"octupli","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"octuplu","accusative-definite-nominative-singular":"octuplul","accusative-indefinite-nominative-plural":"octupli","accusative-definite-nominative-plural":"octuplile","dative-genitive-indefinite-singular":"octuplu","dative-definite-genitive-singular":"octuplului","dative-genitive-indefinite-plural":"octupli","dative-definite-genitive-plural":"octuplilor","singular-vocative":"octuplule","plural-vocative":"octuplilor"}},{"word":"ocular","pos":"adj","definitions":["ocular"],"forms":{"feminine-singular":"oculară","masculine-plural":"oculari","feminine-neuter-plural":"oculare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ocular","error-unrecognized-form-feminine-indefinite-singular":"oculară","error-unrecognized-form-indefinite-masculine-plural":"oculari","error-unrecognized-form-feminine-indefinite-neuter-plural":"oculare","definite-error-unrecognized-form-masculine-neuter-singular":"ocularul","definite-error-unrecognized-form-feminine-singular":"oculara","definite-error-unrecognized-form-masculine-plural":"ocularii","definite-error-unrecognized-form-feminine-neuter-plural":"ocularele"}},{"word":"oculist","pos":"noun","definitions":["oculist"],"forms":{"plural":"oculiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oculist","accusative-definite-nominative-singular":"oculistul","accusative-indefinite-nominative-plural":"oculiști","accusative-definite-nominative-plural":"oculiștii","dative-genitive-indefinite-singular":"oculist","dative-definite-genitive-singular":"oculistului","dative-genitive-indefinite-plural":"oculiști","dative-definite-genitive-plural":"oculiștilor","singular-vocative":"oculistule","plural-vocative":"oculiștilor"}},{"word":"oculistă","pos":"noun","definitions":["female equivalent of oculist"],"forms":{"plural":"oculiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oculistă","accusative-definite-nominative-singular":"oculista","accusative-indefinite-nominative-plural":"oculiste","accusative-definite-nominative-plural":"oculistele","dative-genitive-indefinite-singular":"oculiste","dative-definite-genitive-singular":"oculistei","dative-genitive-indefinite-plural":"oculiste","dative-definite-genitive-plural":"oculistelor","singular-vocative":"oculistă","plural-vocative":"oculistelor"}},{"word":"oculistic","pos":"adj","definitions":["oculistic, ophthalmological"],"forms":{"feminine-singular":"oculistică","masculine-plural":"oculistici","feminine-neuter-plural":"oculistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oculistic","error-unrecognized-form-feminine-indefinite-singular":"oculistică","error-unrecognized-form-indefinite-masculine-plural":"oculistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"oculistice","definite-error-unrecognized-form-masculine-neuter-singular":"oculisticul","definite-error-unrecognized-form-feminine-singular":"oculistica","definite-error-unrecognized-form-masculine-plural":"oculisticii","definite-error-unrecognized-form-feminine-neuter-plural":"oculisticele"}},{"word":"oculistică","pos":"noun","definitions":["ophthalmology"],"forms":{"plural":"oculistici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"oculistică","accusative-definite-nominative-singular":"oculistica","accusative-indefinite-nominative-plural":"oculistici","accusative-definite-nominative-plural":"oculisticile","dative-genitive-indefinite-singular":"oculistici","dative-definite-genitive-singular":"oculisticii","dative-genitive-indefinite-plural":"oculistici","dative-definite-genitive-plural":"oculisticilor","singular-vocative":"oculistică","plural-vocative":"oculisticilor"}},{"word":"oculometru","pos":"noun","definitions":["oculometer"],"forms":{"plural":"oculometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oculometru","accusative-definite-nominative-singular":"oculometruul","accusative-indefinite-nominative-plural":"oculometre","accusative-definite-nominative-plural":"oculometrele","dative-genitive-indefinite-singular":"oculometru","dative-definite-genitive-singular":"oculometruului","dative-genitive-indefinite-plural":"oculometre","dative-definite-genitive-plural":"oculometrelor","singular-vocative":"oculometruule","plural-vocative":"oculometrelor"}},{"word":"oculomotor","pos":"adj","definitions":["oculomotor"],"forms":{"feminine-singular":"oculomotoare","masculine-plural":"oculomotori","feminine-neuter-plural":"oculomotoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oculomotor","error-unrecognized-form-feminine-indefinite-singular":"oculomotoare","error-unrecognized-form-indefinite-masculine-plural":"oculomotori","error-unrecognized-form-feminine-indefinite-neuter-plural":"oculomotoare","definite-error-unrecognized-form-masculine-neuter-singular":"oculomotorul","definite-error-unrecognized-form-feminine-singular":"oculomotoarea","definite-error-unrecognized-form-masculine-plural":"oculomotorii","definite-error-unrecognized-form-feminine-neuter-plural":"oculomotoarele"}},{"word":"ocult","pos":"adj","definitions":["occult"],"forms":{"feminine-singular":"ocultă","masculine-plural":"oculți","feminine-neuter-plural":"oculte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ocult","error-unrecognized-form-feminine-indefinite-singular":"ocultă","error-unrecognized-form-indefinite-masculine-plural":"oculți","error-unrecognized-form-feminine-indefinite-neuter-plural":"oculte","definite-error-unrecognized-form-masculine-neuter-singular":"ocultul","definite-error-unrecognized-form-feminine-singular":"oculta","definite-error-unrecognized-form-masculine-plural":"oculții","definite-error-unrecognized-form-feminine-neuter-plural":"ocultele"}},{"word":"oculta","pos":"verb","definitions":["to occult"],"forms":{"canonical":"a oculta 1st conjugation","present-singular-third-person":"ocultează","participle-past":"ocultat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a oculta","gerund":"ocultând","first-person-indicative-present-singular":"ocultez","indicative-present-second-person-singular":"ocultezi","indicative-present-singular-third-person":"ocultează","first-person-indicative-plural-present":"ocultăm","indicative-plural-present-second-person":"ocultați","indicative-plural-present-third-person":"ocultează","first-person-imperfect-indicative-singular":"ocultam","imperfect-indicative-second-person-singular":"ocultai","imperfect-indicative-singular-third-person":"oculta","first-person-imperfect-indicative-plural":"ocultam","imperfect-indicative-plural-second-person":"ocultați","imperfect-indicative-plural-third-person":"ocultau","first-person-indicative-perfect-singular":"ocultai","indicative-perfect-second-person-singular":"ocultași","indicative-perfect-singular-third-person":"ocultă","first-person-indicative-perfect-plural":"ocultarăm","indicative-perfect-plural-second-person":"ocultarăți","indicative-perfect-plural-third-person":"ocultară","first-person-indicative-pluperfect-singular":"ocultasem","indicative-pluperfect-second-person-singular":"ocultaseși","indicative-pluperfect-singular-third-person":"ocultase","first-person-indicative-pluperfect-plural":"ocultaserăm","indicative-pluperfect-plural-second-person":"ocultaserăți","indicative-pluperfect-plural-third-person":"ocultaseră","first-person-present-singular-subjunctive":"să ocultez","present-second-person-singular-subjunctive":"să ocultezi","present-singular-subjunctive-third-person":"să oculteze","first-person-plural-present-subjunctive":"să ocultăm","plural-present-second-person-subjunctive":"să ocultați","plural-present-subjunctive-third-person":"să oculteze","imperative-second-person-singular":"ocultează","imperative-plural-second-person":"ocultați","imperative-negative-second-person-singular":"nu oculta","imperative-negative-plural-second-person":"nu ocultați"}},{"word":"ocultație","pos":"noun","definitions":["occultation"],"forms":{"plural":"ocultații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ocultație","accusative-definite-nominative-singular":"ocultația","accusative-indefinite-nominative-plural":"ocultații","accusative-definite-nominative-plural":"ocultațiile","dative-genitive-indefinite-singular":"ocultații","dative-definite-genitive-singular":"ocultației","dative-genitive-indefinite-plural":"ocultații","dative-definite-genitive-plural":"ocultațiilor","singular-vocative":"ocultație","plural-vocative":"ocultațiilor"}},{"word":"ocultațiune","pos":"noun","definitions":["obsolete form of ocultație"],"forms":{"plural":"ocultațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ocultațiune","accusative-definite-nominative-singular":"ocultațiunea","accusative-indefinite-nominative-plural":"ocultațiuni","accusative-definite-nominative-plural":"ocultațiunile","dative-genitive-indefinite-singular":"ocultațiuni","dative-definite-genitive-singular":"ocultațiunii","dative-genitive-indefinite-plural":"ocultațiuni","dative-definite-genitive-plural":"ocultațiunilor","singular-vocative":"ocultațiune","plural-vocative":"ocultațiunilor"}},{"word":"ocultism","pos":"noun","definitions":["occultism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ocultism","accusative-definite-nominative-singular":"ocultismul","accusative-indefinite-nominative-plural":"ocultisme","accusative-definite-nominative-plural":"ocultismele","dative-genitive-indefinite-singular":"ocultism","dative-definite-genitive-singular":"ocultismului","dative-genitive-indefinite-plural":"ocultisme","dative-definite-genitive-plural":"ocultismelor","singular-vocative":"ocultismule","plural-vocative":"ocultismelor"}},{"word":"ocultist","pos":"noun","definitions":["occultist"],"forms":{"plural":"ocultiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ocultist","accusative-definite-nominative-singular":"ocultistul","accusative-indefinite-nominative-plural":"ocultiști","accusative-definite-nominative-plural":"ocultiștii","dative-genitive-indefinite-singular":"ocultist","dative-definite-genitive-singular":"ocultistului","dative-genitive-indefinite-plural":"ocultiști","dative-definite-genitive-plural":"ocultiștilor","singular-vocative":"ocultistule","plural-vocative":"ocultiștilor"}},{"word":"ocultistă","pos":"noun","definitions":["female equivalent of ocultist"],"forms":{"plural":"ocultiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ocultistă","accusative-definite-nominative-singular":"ocultista","accusative-indefinite-nominative-plural":"ocultiste","accusative-definite-nominative-plural":"ocultistele","dative-genitive-indefinite-singular":"ocultiste","dative-definite-genitive-singular":"ocultistei","dative-genitive-indefinite-plural":"ocultiste","dative-definite-genitive-plural":"ocultistelor","singular-vocative":"ocultistă","plural-vocative":"ocultistelor"}},{"word":"ocultistic","pos":"adj","definitions":["occultistic"],"forms":{"feminine-singular":"ocultistică","masculine-plural":"ocultistici","feminine-neuter-plural":"ocultistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ocultistic","error-unrecognized-form-feminine-indefinite-singular":"ocultistică","error-unrecognized-form-indefinite-masculine-plural":"ocultistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ocultistice","definite-error-unrecognized-form-masculine-neuter-singular":"ocultisticul","definite-error-unrecognized-form-feminine-singular":"ocultistica","definite-error-unrecognized-form-masculine-plural":"ocultisticii","definite-error-unrecognized-form-feminine-neuter-plural":"ocultisticele"}},{"word":"ocultistică","pos":"noun","definitions":["occultism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ocultistică","accusative-definite-nominative-singular":"ocultistica","accusative-indefinite-nominative-plural":"ocultistice","accusative-definite-nominative-plural":"ocultisticele","dative-genitive-indefinite-singular":"ocultistice","dative-definite-genitive-singular":"ocultisticei","dative-genitive-indefinite-plural":"ocultistice","dative-definite-genitive-plural":"ocultisticelor","singular-vocative":"ocultistică","plural-vocative":"ocultisticelor"}},{"word":"ocupa","pos":"verb","definitions":["to occupy, take up","to take care of, deal with"],"pronunciation":"/o.kuˈpa/","forms":{"canonical":"a ocupa 1st conjugation","present-singular-third-person":"ocupă","participle-past":"ocupat","subjunctive-third-person":"ocupe","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a ocupa","gerund":"ocupând","first-person-indicative-present-singular":"ocup","indicative-present-second-person-singular":"ocupi","indicative-present-singular-third-person":"ocupă","first-person-indicative-plural-present":"ocupăm","indicative-plural-present-second-person":"ocupați","indicative-plural-present-third-person":"ocupă","first-person-imperfect-indicative-singular":"ocupam","imperfect-indicative-second-person-singular":"ocupai","imperfect-indicative-singular-third-person":"ocupa","first-person-imperfect-indicative-plural":"ocupam","imperfect-indicative-plural-second-person":"ocupați","imperfect-indicative-plural-third-person":"ocupau","first-person-indicative-perfect-singular":"ocupai","indicative-perfect-second-person-singular":"ocupași","indicative-perfect-singular-third-person":"ocupă","first-person-indicative-perfect-plural":"ocuparăm","indicative-perfect-plural-second-person":"ocuparăți","indicative-perfect-plural-third-person":"ocupară","first-person-indicative-pluperfect-singular":"ocupasem","indicative-pluperfect-second-person-singular":"ocupaseși","indicative-pluperfect-singular-third-person":"ocupase","first-person-indicative-pluperfect-plural":"ocupaserăm","indicative-pluperfect-plural-second-person":"ocupaserăți","indicative-pluperfect-plural-third-person":"ocupaseră","first-person-present-singular-subjunctive":"să ocup","present-second-person-singular-subjunctive":"să ocupi","present-singular-subjunctive-third-person":"să ocupe","first-person-plural-present-subjunctive":"să ocupăm","plural-present-second-person-subjunctive":"să ocupați","plural-present-subjunctive-third-person":"să ocupe","imperative-second-person-singular":"ocupă","imperative-plural-second-person":"ocupați","imperative-negative-second-person-singular":"nu ocupa","imperative-negative-plural-second-person":"nu ocupați"}},{"word":"ocupai","pos":"verb","definitions":["inflection of ocupa:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[okuˈpaj]"},{"word":"ocupam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of ocupa"],"pronunciation":"[okuˈpam]"},{"word":"ocupant","pos":"noun","definitions":["occupant"],"forms":{"plural":"ocupanți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ocupant","accusative-definite-nominative-singular":"ocupantul","accusative-indefinite-nominative-plural":"ocupanți","accusative-definite-nominative-plural":"ocupanții","dative-genitive-indefinite-singular":"ocupant","dative-definite-genitive-singular":"ocupantului","dative-genitive-indefinite-plural":"ocupanți","dative-definite-genitive-plural":"ocupanților","singular-vocative":"ocupantule","plural-vocative":"ocupanților"}},{"word":"ocupantă","pos":"noun","definitions":["female equivalent of ocupant"],"forms":{"plural":"ocupante","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ocupantă","accusative-definite-nominative-singular":"ocupanta","accusative-indefinite-nominative-plural":"ocupante","accusative-definite-nominative-plural":"ocupantele","dative-genitive-indefinite-singular":"ocupante","dative-definite-genitive-singular":"ocupantei","dative-genitive-indefinite-plural":"ocupante","dative-definite-genitive-plural":"ocupantelor","singular-vocative":"ocupantă","plural-vocative":"ocupantelor"}},{"word":"ocupanți","pos":"noun","definitions":["plural of ocupant"]},{"word":"ocupare","pos":"noun","definitions":["occupation"],"forms":{"plural":"ocupări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ocupare","accusative-definite-nominative-singular":"ocuparea","accusative-indefinite-nominative-plural":"ocupări","accusative-definite-nominative-plural":"ocupările","dative-genitive-indefinite-singular":"ocupări","dative-definite-genitive-singular":"ocupării","dative-genitive-indefinite-plural":"ocupări","dative-definite-genitive-plural":"ocupărilor","singular-vocative":"ocupare","plural-vocative":"ocupărilor"}},{"word":"ocuparisi","pos":"verb","definitions":["to deal with"],"forms":{"canonical":"a ocuparisi 4th conjugation","present-singular-third-person":"ocuparisește","participle-past":"ocuparisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ocuparisi","gerund":"ocuparisind","first-person-indicative-present-singular":"ocuparisesc","indicative-present-second-person-singular":"ocuparisești","indicative-present-singular-third-person":"ocuparisește","first-person-indicative-plural-present":"ocuparisim","indicative-plural-present-second-person":"ocuparisiți","indicative-plural-present-third-person":"ocuparisesc","first-person-imperfect-indicative-singular":"ocupariseam","imperfect-indicative-second-person-singular":"ocupariseai","imperfect-indicative-singular-third-person":"ocuparisea","first-person-imperfect-indicative-plural":"ocupariseam","imperfect-indicative-plural-second-person":"ocupariseați","imperfect-indicative-plural-third-person":"ocupariseau","first-person-indicative-perfect-singular":"ocuparisii","indicative-perfect-second-person-singular":"ocuparisiși","indicative-perfect-singular-third-person":"ocuparisi","first-person-indicative-perfect-plural":"ocuparisirăm","indicative-perfect-plural-second-person":"ocuparisirăți","indicative-perfect-plural-third-person":"ocuparisiră","first-person-indicative-pluperfect-singular":"ocuparisisem","indicative-pluperfect-second-person-singular":"ocuparisiseși","indicative-pluperfect-singular-third-person":"ocuparisise","first-person-indicative-pluperfect-plural":"ocuparisiserăm","indicative-pluperfect-plural-second-person":"ocuparisiserăți","indicative-pluperfect-plural-third-person":"ocuparisiseră","first-person-present-singular-subjunctive":"să ocuparisesc","present-second-person-singular-subjunctive":"să ocuparisești","present-singular-subjunctive-third-person":"să ocuparisească","first-person-plural-present-subjunctive":"să ocuparisim","plural-present-second-person-subjunctive":"să ocuparisiți","plural-present-subjunctive-third-person":"să ocuparisească","imperative-second-person-singular":"ocuparisește","imperative-plural-second-person":"ocuparisiți","imperative-negative-second-person-singular":"nu ocuparisi","imperative-negative-plural-second-person":"nu ocuparisiți"}},{"word":"ocupase","pos":"verb","definitions":["third-person singular pluperfect indicative of ocupa"],"pronunciation":"[okuˈpase]"},{"word":"ocupat","pos":"adj","definitions":["occupied","busy"],"pronunciation":"[okuˈpat]","forms":{"feminine-singular":"ocupată","masculine-plural":"ocupați","feminine-neuter-plural":"ocupate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ocupat","error-unrecognized-form-feminine-indefinite-singular":"ocupată","error-unrecognized-form-indefinite-masculine-plural":"ocupați","error-unrecognized-form-feminine-indefinite-neuter-plural":"ocupate","definite-error-unrecognized-form-masculine-neuter-singular":"ocupatul","definite-error-unrecognized-form-feminine-singular":"ocupata","definite-error-unrecognized-form-masculine-plural":"ocupații","definite-error-unrecognized-form-feminine-neuter-plural":"ocupatele"}},{"word":"ocupat","pos":"verb","definitions":["past participle of ocupa"],"pronunciation":"[okuˈpat]"},{"word":"ocupație","pos":"noun","definitions":["occupation"],"pronunciation":"/o.kuˈpa.t͡si.e/","forms":{"plural":"ocupații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ocupație","accusative-definite-nominative-singular":"ocupația","accusative-indefinite-nominative-plural":"ocupații","accusative-definite-nominative-plural":"ocupațiile","dative-genitive-indefinite-singular":"ocupații","dative-definite-genitive-singular":"ocupației","dative-genitive-indefinite-plural":"ocupații","dative-definite-genitive-plural":"ocupațiilor","singular-vocative":"ocupație","plural-vocative":"ocupațiilor"}},{"word":"ocupațional","pos":"adj","definitions":["occupational"],"forms":{"feminine-singular":"ocupațională","masculine-plural":"ocupaționali","feminine-neuter-plural":"ocupaționale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ocupațional","error-unrecognized-form-feminine-indefinite-singular":"ocupațională","error-unrecognized-form-indefinite-masculine-plural":"ocupaționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"ocupaționale","definite-error-unrecognized-form-masculine-neuter-singular":"ocupaționalul","definite-error-unrecognized-form-feminine-singular":"ocupaționala","definite-error-unrecognized-form-masculine-plural":"ocupaționalii","definite-error-unrecognized-form-feminine-neuter-plural":"ocupaționalele"}},{"word":"ocupațiune","pos":"noun","definitions":["alternative form of ocupație"],"forms":{"plural":"ocupațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ocupațiune","accusative-definite-nominative-singular":"ocupațiunea","accusative-indefinite-nominative-plural":"ocupațiuni","accusative-definite-nominative-plural":"ocupațiunile","dative-genitive-indefinite-singular":"ocupațiuni","dative-definite-genitive-singular":"ocupațiunii","dative-genitive-indefinite-plural":"ocupațiuni","dative-definite-genitive-plural":"ocupațiunilor","singular-vocative":"ocupațiune","plural-vocative":"ocupațiunilor"}},{"word":"ocupatoare","pos":"noun","definitions":["female equivalent of ocupator"],"forms":{"plural":"ocupatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"ocupatoare","accusative-definite-nominative-singular":"ocupatoarea","accusative-indefinite-nominative-plural":"ocupatoare","accusative-definite-nominative-plural":"ocupatoarele","dative-genitive-indefinite-singular":"ocupatoare","dative-definite-genitive-singular":"ocupatoarei","dative-genitive-indefinite-plural":"ocupatoare","dative-definite-genitive-plural":"ocupatoarelor","singular-vocative":"ocupatoare","plural-vocative":"ocupatoarelor"}},{"word":"ocupator","pos":"noun","definitions":["occupier"],"pronunciation":"/o.ku.paˈtor/","forms":{"plural":"ocupatori","feminine":"equivalent ocupatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ocupator","accusative-definite-nominative-singular":"ocupatorul","accusative-indefinite-nominative-plural":"ocupatori","accusative-definite-nominative-plural":"ocupatorii","dative-genitive-indefinite-singular":"ocupator","dative-definite-genitive-singular":"ocupatorului","dative-genitive-indefinite-plural":"ocupatori","dative-definite-genitive-plural":"ocupatorilor","singular-vocative":"ocupatorule","plural-vocative":"ocupatorilor"}},{"word":"ocupe","pos":"verb","definitions":["third-person singular/plural present subjunctive of ocupa"],"pronunciation":"[oˈkupe]"},{"word":"ocupi","pos":"verb","definitions":["second-person singular present indicative/subjunctive of ocupa"],"pronunciation":"[oˈkupʲ]"},{"word":"ocurent","pos":"adj","definitions":["occurrent"],"forms":{"feminine-singular":"ocurentă","masculine-plural":"ocurenți","feminine-neuter-plural":"ocurente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ocurent","error-unrecognized-form-feminine-indefinite-singular":"ocurentă","error-unrecognized-form-indefinite-masculine-plural":"ocurenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ocurente","definite-error-unrecognized-form-masculine-neuter-singular":"ocurentul","definite-error-unrecognized-form-feminine-singular":"ocurenta","definite-error-unrecognized-form-masculine-plural":"ocurenții","definite-error-unrecognized-form-feminine-neuter-plural":"ocurentele"}},{"word":"ocurență","pos":"noun","definitions":["occurrence"],"forms":{"plural":"ocurențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ocurență","accusative-definite-nominative-singular":"ocurența","accusative-indefinite-nominative-plural":"ocurențe","accusative-definite-nominative-plural":"ocurențele","dative-genitive-indefinite-singular":"ocurențe","dative-definite-genitive-singular":"ocurenței","dative-genitive-indefinite-plural":"ocurențe","dative-definite-genitive-plural":"ocurențelor","singular-vocative":"ocurență","plural-vocative":"ocurențelor"}},{"word":"odă","pos":"noun","definitions":["ode"],"forms":{"plural":"ode","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"odă","accusative-definite-nominative-singular":"oda","accusative-indefinite-nominative-plural":"ode","accusative-definite-nominative-plural":"odele","dative-genitive-indefinite-singular":"ode","dative-definite-genitive-singular":"odei","dative-genitive-indefinite-plural":"ode","dative-definite-genitive-plural":"odelor","singular-vocative":"odă","plural-vocative":"odelor"}},{"word":"odabaș","pos":"noun","definitions":["the officer in command of an oda (barracks) among the janissaries"],"forms":{"plural":"odabași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"odabaș","accusative-definite-nominative-singular":"odabașul","accusative-indefinite-nominative-plural":"odabași","accusative-definite-nominative-plural":"odabașii","dative-genitive-indefinite-singular":"odabaș","dative-definite-genitive-singular":"odabașului","dative-genitive-indefinite-plural":"odabași","dative-definite-genitive-plural":"odabașilor","singular-vocative":"odabașule","plural-vocative":"odabașilor"}},{"word":"Odae","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Odae"}},{"word":"Odăeni","pos":"name","definitions":["a village in Suseni, Argeș County, Romania"],"gender":"m"},{"word":"odagaci","pos":"noun","definitions":["soapwort (Saponaria officinalis)","cascarilla (Croton eleutheria)"],"forms":{"plural":"odagaci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"odagaci","accusative-definite-nominative-singular":"odagaciul","accusative-indefinite-nominative-plural":"odagaci","accusative-definite-nominative-plural":"odagacii","dative-genitive-indefinite-singular":"odagaci","dative-definite-genitive-singular":"odagaciului","dative-genitive-indefinite-plural":"odagaci","dative-definite-genitive-plural":"odagacilor","singular-vocative":"odagaciule","plural-vocative":"odagacilor"}},{"word":"Odăgescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Odăgescu"}},{"word":"Odagiu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Odagiu"}},{"word":"odagiu","pos":"noun","definitions":["servant"],"forms":{"plural":"odagii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"odagiu","accusative-definite-nominative-singular":"odagiuul","accusative-indefinite-nominative-plural":"odagii","accusative-definite-nominative-plural":"odagiii","dative-genitive-indefinite-singular":"odagiu","dative-definite-genitive-singular":"odagiuului","dative-genitive-indefinite-plural":"odagii","dative-definite-genitive-plural":"odagiilor","singular-vocative":"odagiuule","plural-vocative":"odagiilor"}},{"word":"Odaia","pos":"name","definitions":["a village in Alcedar, Șoldănești Raion, Moldova","a village in Șișcani, Nisporeni Raion, Moldova"],"gender":"f"},{"word":"odaia","pos":"noun","definitions":["definite nominative/accusative singular of odaie"]},{"word":"Odaia Banului","pos":"name","definitions":["a village in Țintești, Buzău County, Romania"],"gender":"f"},{"word":"Odaia Bogdana","pos":"name","definitions":["a village in Fălciu, Vaslui County, Romania"],"gender":"f"},{"word":"Odaia Bursucani","pos":"name","definitions":["a village in Grivița, Vaslui County, Romania"],"gender":"f"},{"word":"Odaia Manolache","pos":"name","definitions":["a village in Vânători, Galați County, Romania"],"gender":"f"},{"word":"Odaia Turcului","pos":"name","definitions":["a village in Mătăsaru, Dâmbovița County, Romania"],"gender":"f"},{"word":"Odăianu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Odăianu"}},{"word":"odăiaș","pos":"noun","definitions":["janitor"],"forms":{"plural":"odăiași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"odăiaș","accusative-definite-nominative-singular":"odăiașul","accusative-indefinite-nominative-plural":"odăiași","accusative-definite-nominative-plural":"odăiașii","dative-genitive-indefinite-singular":"odăiaș","dative-definite-genitive-singular":"odăiașului","dative-genitive-indefinite-plural":"odăiași","dative-definite-genitive-plural":"odăiașilor","singular-vocative":"odăiașule","plural-vocative":"odăiașilor"}},{"word":"odaie","pos":"noun","definitions":["room","house","barracks"],"pronunciation":"/oˈda.je/","forms":{"plural":"odăi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"odaie","accusative-definite-nominative-singular":"odaia","accusative-indefinite-nominative-plural":"odăi","accusative-definite-nominative-plural":"odăile","dative-genitive-indefinite-singular":"odăi","dative-definite-genitive-singular":"odăii","dative-genitive-indefinite-plural":"odăi","dative-definite-genitive-plural":"odăilor","singular-vocative":"odaie","plural-vocative":"odăilor"}},{"word":"Odăieni","pos":"name","definitions":["a village in Ciocile, Brăila County, Romania"],"gender":"m"},{"word":"Odăile","pos":"name","definitions":["a commune of Buzău County, Romania","a village in Odăile, Buzău County, Romania","a village in Otopeni, Ilfov County, Romania","a village in Puchenii Mari, Prahova County, Romania"],"gender":"f"},{"word":"odăilor","pos":"noun","definitions":["definite genitive/dative plural of odaie"]},{"word":"odăiță","pos":"noun","definitions":["diminutive of odaie; small room"],"forms":{"plural":"odăițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"odăiță","accusative-definite-nominative-singular":"odăița","accusative-indefinite-nominative-plural":"odăițe","accusative-definite-nominative-plural":"odăițele","dative-genitive-indefinite-singular":"odăițe","dative-definite-genitive-singular":"odăiței","dative-genitive-indefinite-plural":"odăițe","dative-definite-genitive-plural":"odăițelor","singular-vocative":"odăiță","plural-vocative":"odăițelor"}},{"word":"odăjdii","pos":"noun","definitions":["priest's vestments"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"odăjdii","accusative-definite-nominative":"odăjdiile","dative-genitive-indefinite":"odăjdii","dative-definite-genitive":"odăjdiilor","vocative":"odăjdiilor"}},{"word":"odaliscă","pos":"noun","definitions":["odalisque"],"forms":{"plural":"odalisce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"odaliscă","accusative-definite-nominative-singular":"odalisca","accusative-indefinite-nominative-plural":"odalisce","accusative-definite-nominative-plural":"odaliscele","dative-genitive-indefinite-singular":"odalisce","dative-definite-genitive-singular":"odaliscei","dative-genitive-indefinite-plural":"odalisce","dative-definite-genitive-plural":"odaliscelor","singular-vocative":"odaliscă","plural-vocative":"odaliscelor"}},{"word":"odânăoar","pos":"adv","definitions":["obsolete form of odinioară"]},{"word":"odată și-odată","pos":"adv","definitions":["sooner or later"],"forms":{"alternative":"odată și odată"}},{"word":"odeletă","pos":"noun","definitions":["odelet"],"forms":{"plural":"odelete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"odeletă","accusative-definite-nominative-singular":"odeleta","accusative-indefinite-nominative-plural":"odelete","accusative-definite-nominative-plural":"odeletele","dative-genitive-indefinite-singular":"odelete","dative-definite-genitive-singular":"odeletei","dative-genitive-indefinite-plural":"odelete","dative-definite-genitive-plural":"odeletelor","singular-vocative":"odeletă","plural-vocative":"odeletelor"}},{"word":"odeon","pos":"noun","definitions":["odeon"],"forms":{"plural":"odeoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"odeon","accusative-definite-nominative-singular":"odeonul","accusative-indefinite-nominative-plural":"odeoane","accusative-definite-nominative-plural":"odeoanele","dative-genitive-indefinite-singular":"odeon","dative-definite-genitive-singular":"odeonului","dative-genitive-indefinite-plural":"odeoane","dative-definite-genitive-plural":"odeoanelor","singular-vocative":"odeonule","plural-vocative":"odeoanelor"}},{"word":"Odești","pos":"name","definitions":["a village in Băsești, Maramureș County, Romania"],"gender":"m"},{"word":"odgon","pos":"noun","definitions":["rope, hawser"],"forms":{"plural":"odgoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"odgon","accusative-definite-nominative-singular":"odgonul","accusative-indefinite-nominative-plural":"odgoane","accusative-definite-nominative-plural":"odgoanele","dative-genitive-indefinite-singular":"odgon","dative-definite-genitive-singular":"odgonului","dative-genitive-indefinite-plural":"odgoane","dative-definite-genitive-plural":"odgoanelor","singular-vocative":"odgonule","plural-vocative":"odgoanelor"}},{"word":"odgoni","pos":"verb","definitions":["to moor a ship"],"forms":{"canonical":"a odgoni 4th conjugation","present-singular-third-person":"odgonie","participle-past":"odgonit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a odgoni","gerund":"odgonind","first-person-indicative-present-singular":"odgon","indicative-present-second-person-singular":"odgoni","indicative-present-singular-third-person":"odgone","first-person-indicative-plural-present":"odgonim","indicative-plural-present-second-person":"odgoniți","indicative-plural-present-third-person":"odgon","first-person-imperfect-indicative-singular":"odgoneam","imperfect-indicative-second-person-singular":"odgoneai","imperfect-indicative-singular-third-person":"odgonea","first-person-imperfect-indicative-plural":"odgoneam","imperfect-indicative-plural-second-person":"odgoneați","imperfect-indicative-plural-third-person":"odgoneau","first-person-indicative-perfect-singular":"odgonii","indicative-perfect-second-person-singular":"odgoniși","indicative-perfect-singular-third-person":"odgoni","first-person-indicative-perfect-plural":"odgonirăm","indicative-perfect-plural-second-person":"odgonirăți","indicative-perfect-plural-third-person":"odgoniră","first-person-indicative-pluperfect-singular":"odgonisem","indicative-pluperfect-second-person-singular":"odgoniseși","indicative-pluperfect-singular-third-person":"odgonise","first-person-indicative-pluperfect-plural":"odgoniserăm","indicative-pluperfect-plural-second-person":"odgoniserăți","indicative-pluperfect-plural-third-person":"odgoniseră","first-person-present-singular-subjunctive":"să odgon","present-second-person-singular-subjunctive":"să odgoni","present-singular-subjunctive-third-person":"să odgonă","first-person-plural-present-subjunctive":"să odgonim","plural-present-second-person-subjunctive":"să odgoniți","plural-present-subjunctive-third-person":"să odgonă","imperative-second-person-singular":"odgone","imperative-plural-second-person":"odgoniți","imperative-negative-second-person-singular":"nu odgoni","imperative-negative-plural-second-person":"nu odgoniți"}},{"word":"odicolon","pos":"noun","definitions":["cologne"],"forms":{"plural":"odicolonuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"odicolon","accusative-definite-nominative-singular":"odicolonul","accusative-indefinite-nominative-plural":"odicolonuri","accusative-definite-nominative-plural":"odicolonurile","dative-genitive-indefinite-singular":"odicolon","dative-definite-genitive-singular":"odicolonului","dative-genitive-indefinite-plural":"odicolonuri","dative-definite-genitive-plural":"odicolonurilor","singular-vocative":"odicolonule","plural-vocative":"odicolonurilor"}},{"word":"odihnă","pos":"noun","definitions":["rest, repose","peace, calm, restfulness","leisure","ease","eternal rest; death"],"forms":{"plural":"odihne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"odihnă","accusative-definite-nominative-singular":"odihna","accusative-indefinite-nominative-plural":"odihne","accusative-definite-nominative-plural":"odihnele","dative-genitive-indefinite-singular":"odihne","dative-definite-genitive-singular":"odihnei","dative-genitive-indefinite-plural":"odihne","dative-definite-genitive-plural":"odihnelor","singular-vocative":"odihnă","plural-vocative":"odihnelor"}},{"word":"odihneală","pos":"noun","definitions":["rest"],"forms":{"plural":"odihneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"odihneală","accusative-definite-nominative-singular":"odihneala","accusative-indefinite-nominative-plural":"odihnele","accusative-definite-nominative-plural":"odihnelele","dative-genitive-indefinite-singular":"odihnele","dative-definite-genitive-singular":"odihnelei","dative-genitive-indefinite-plural":"odihnele","dative-definite-genitive-plural":"odihnelelor","singular-vocative":"odihneală","plural-vocative":"odihnelelor"}},{"word":"odihni","pos":"verb","definitions":["to rest, relax","to repose, lie down","to sleep","to give rest to","to die, go to rest, pass away"],"forms":{"canonical":"a odihni 4th conjugation","present-singular-third-person":"odihnește","participle-past":"odihnit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a odihni","gerund":"odihnind","first-person-indicative-present-singular":"odihnesc","indicative-present-second-person-singular":"odihnești","indicative-present-singular-third-person":"odihnește","first-person-indicative-plural-present":"odihnim","indicative-plural-present-second-person":"odihniți","indicative-plural-present-third-person":"odihnesc","first-person-imperfect-indicative-singular":"odihneam","imperfect-indicative-second-person-singular":"odihneai","imperfect-indicative-singular-third-person":"odihnea","first-person-imperfect-indicative-plural":"odihneam","imperfect-indicative-plural-second-person":"odihneați","imperfect-indicative-plural-third-person":"odihneau","first-person-indicative-perfect-singular":"odihnii","indicative-perfect-second-person-singular":"odihniși","indicative-perfect-singular-third-person":"odihni","first-person-indicative-perfect-plural":"odihnirăm","indicative-perfect-plural-second-person":"odihnirăți","indicative-perfect-plural-third-person":"odihniră","first-person-indicative-pluperfect-singular":"odihnisem","indicative-pluperfect-second-person-singular":"odihniseși","indicative-pluperfect-singular-third-person":"odihnise","first-person-indicative-pluperfect-plural":"odihniserăm","indicative-pluperfect-plural-second-person":"odihniserăți","indicative-pluperfect-plural-third-person":"odihniseră","first-person-present-singular-subjunctive":"să odihnesc","present-second-person-singular-subjunctive":"să odihnești","present-singular-subjunctive-third-person":"să odihnească","first-person-plural-present-subjunctive":"să odihnim","plural-present-second-person-subjunctive":"să odihniți","plural-present-subjunctive-third-person":"să odihnească","imperative-second-person-singular":"odihnește","imperative-plural-second-person":"odihniți","imperative-negative-second-person-singular":"nu odihni","imperative-negative-plural-second-person":"nu odihniți","alternative":"hodini"}},{"word":"odihnire","pos":"noun","definitions":["resting"],"forms":{"plural":"odihniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"odihnire","accusative-definite-nominative-singular":"odihnirea","accusative-indefinite-nominative-plural":"odihniri","accusative-definite-nominative-plural":"odihnirile","dative-genitive-indefinite-singular":"odihniri","dative-definite-genitive-singular":"odihnirii","dative-genitive-indefinite-plural":"odihniri","dative-definite-genitive-plural":"odihnirilor","singular-vocative":"odihnire","plural-vocative":"odihnirilor"}},{"word":"odihnit","pos":"adj","definitions":["rested"],"forms":{"feminine-singular":"odihnită","masculine-plural":"odihniți","feminine-neuter-plural":"odihnite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"odihnit","error-unrecognized-form-feminine-indefinite-singular":"odihnită","error-unrecognized-form-indefinite-masculine-plural":"odihniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"odihnite","definite-error-unrecognized-form-masculine-neuter-singular":"odihnitul","definite-error-unrecognized-form-feminine-singular":"odihnita","definite-error-unrecognized-form-masculine-plural":"odihniții","definite-error-unrecognized-form-feminine-neuter-plural":"odihnitele"}},{"word":"odihnitor","pos":"adj","definitions":["restful"],"forms":{"feminine-singular":"odihnitoare","masculine-plural":"odihnitori","feminine-neuter-plural":"odihnitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"odihnitor","error-unrecognized-form-feminine-indefinite-singular":"odihnitoare","error-unrecognized-form-indefinite-masculine-plural":"odihnitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"odihnitoare","definite-error-unrecognized-form-masculine-neuter-singular":"odihnitorul","definite-error-unrecognized-form-feminine-singular":"odihnitoarea","definite-error-unrecognized-form-masculine-plural":"odihnitorii","definite-error-unrecognized-form-feminine-neuter-plural":"odihnitoarele"}},{"word":"odină","pos":"noun","definitions":["alternative form of odihnă"],"forms":{"plural":"odine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"odină","accusative-definite-nominative-singular":"odina","accusative-indefinite-nominative-plural":"odine","accusative-definite-nominative-plural":"odinele","dative-genitive-indefinite-singular":"odine","dative-definite-genitive-singular":"odinei","dative-genitive-indefinite-plural":"odine","dative-definite-genitive-plural":"odinelor","singular-vocative":"odină","plural-vocative":"odinelor"}},{"word":"odineoară","pos":"adv","definitions":["obsolete form of odinioară"]},{"word":"odini","pos":"verb","definitions":["alternative form of odihni"],"forms":{"canonical":"a odini 4th conjugation","present-singular-third-person":"odinește","participle-past":"odinit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a odini","gerund":"odinind","first-person-indicative-present-singular":"odinesc","indicative-present-second-person-singular":"odinești","indicative-present-singular-third-person":"odinește","first-person-indicative-plural-present":"odinim","indicative-plural-present-second-person":"odiniți","indicative-plural-present-third-person":"odinesc","first-person-imperfect-indicative-singular":"odineam","imperfect-indicative-second-person-singular":"odineai","imperfect-indicative-singular-third-person":"odinea","first-person-imperfect-indicative-plural":"odineam","imperfect-indicative-plural-second-person":"odineați","imperfect-indicative-plural-third-person":"odineau","first-person-indicative-perfect-singular":"odinii","indicative-perfect-second-person-singular":"odiniși","indicative-perfect-singular-third-person":"odini","first-person-indicative-perfect-plural":"odinirăm","indicative-perfect-plural-second-person":"odinirăți","indicative-perfect-plural-third-person":"odiniră","first-person-indicative-pluperfect-singular":"odinisem","indicative-pluperfect-second-person-singular":"odiniseși","indicative-pluperfect-singular-third-person":"odinise","first-person-indicative-pluperfect-plural":"odiniserăm","indicative-pluperfect-plural-second-person":"odiniserăți","indicative-pluperfect-plural-third-person":"odiniseră","first-person-present-singular-subjunctive":"să odinesc","present-second-person-singular-subjunctive":"să odinești","present-singular-subjunctive-third-person":"să odinească","first-person-plural-present-subjunctive":"să odinim","plural-present-second-person-subjunctive":"să odiniți","plural-present-subjunctive-third-person":"să odinească","imperative-second-person-singular":"odinește","imperative-plural-second-person":"odiniți","imperative-negative-second-person-singular":"nu odini","imperative-negative-plural-second-person":"nu odiniți"}},{"word":"odinioară","pos":"adv","definitions":["in the old days, olden times, once, formerly"]},{"word":"odios","pos":"adj","definitions":["odious, obnoxious"],"forms":{"feminine-singular":"odioasă","masculine-plural":"odioși","feminine-neuter-plural":"odioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"odios","error-unrecognized-form-feminine-indefinite-singular":"odioasă","error-unrecognized-form-indefinite-masculine-plural":"odioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"odioase","definite-error-unrecognized-form-masculine-neuter-singular":"odiosul","definite-error-unrecognized-form-feminine-singular":"odioasa","definite-error-unrecognized-form-masculine-plural":"odioșii","definite-error-unrecognized-form-feminine-neuter-plural":"odioasele"}},{"word":"odiozitate","pos":"noun","definitions":["odiousness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"odiozitate","accusative-definite-nominative-singular":"odiozitatea","accusative-indefinite-nominative-plural":"odiozități","accusative-definite-nominative-plural":"odiozitățile","dative-genitive-indefinite-singular":"odiozități","dative-definite-genitive-singular":"odiozității","dative-genitive-indefinite-plural":"odiozități","dative-definite-genitive-plural":"odiozităților","singular-vocative":"odiozitate","plural-vocative":"odiozităților"}},{"word":"odisee","pos":"noun","definitions":["odyssey"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"odisee","accusative-definite-nominative-singular":"odiseea","accusative-indefinite-nominative-plural":"odisee","accusative-definite-nominative-plural":"odiseele","dative-genitive-indefinite-singular":"odisee","dative-definite-genitive-singular":"odiseei","dative-genitive-indefinite-plural":"odisee","dative-definite-genitive-plural":"odiseelor","singular-vocative":"odisee","plural-vocative":"odiseelor"}},{"word":"Odiseu","pos":"name","definitions":["Odysseus (Greek leader during Trojan War)"],"gender":"m"},{"word":"odiu","pos":"noun","definitions":["hatred, disgust, detestation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"odiu","accusative-definite-nominative":"odiuul","dative-genitive-indefinite":"odiu","dative-definite-genitive":"odiuului","vocative":"odiuule"}},{"word":"odivoi","pos":"noun","definitions":["infantryman"],"forms":{"plural":"odivoi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"odivoi","accusative-definite-nominative-singular":"odivoiul","accusative-indefinite-nominative-plural":"odivoi","accusative-definite-nominative-plural":"odivoii","dative-genitive-indefinite-singular":"odivoi","dative-definite-genitive-singular":"odivoiului","dative-genitive-indefinite-plural":"odivoi","dative-definite-genitive-plural":"odivoilor","singular-vocative":"odivoiule","plural-vocative":"odivoilor"}},{"word":"Odnostalco","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Odnostalco"}},{"word":"odoare","pos":"noun","definitions":["alternative form of odor"],"forms":{"plural":"odori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"odoare","accusative-definite-nominative-singular":"odoarea","accusative-indefinite-nominative-plural":"odoari","accusative-definite-nominative-plural":"odoarile","dative-genitive-indefinite-singular":"odoari","dative-definite-genitive-singular":"odoarii","dative-genitive-indefinite-plural":"odoari","dative-definite-genitive-plural":"odoarilor","singular-vocative":"odoare","plural-vocative":"odoarilor"}},{"word":"odobâncă","pos":"noun","definitions":["hole, pit"],"forms":{"plural":"odobânci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"odobâncă","accusative-definite-nominative-singular":"odobânca","accusative-indefinite-nominative-plural":"odobânci","accusative-definite-nominative-plural":"odobâncile","dative-genitive-indefinite-singular":"odobânci","dative-definite-genitive-singular":"odobâncii","dative-genitive-indefinite-plural":"odobânci","dative-definite-genitive-plural":"odobâncilor","singular-vocative":"odobâncă","plural-vocative":"odobâncilor"}},{"word":"Odobasca","pos":"name","definitions":["a village in Poiana Cristei, Vrancea County, Romania"],"gender":"f"},{"word":"Odobeasca","pos":"name","definitions":["a village in Drăcșenei, Teleorman County, Romania"],"gender":"f"},{"word":"Odobescu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Odobescu"}},{"word":"Odobeșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Odobeșteanu"}},{"word":"Odobești","pos":"name","definitions":["a commune of Bacău County, Romania","a village in Odobești, Bacău County, Romania","a commune of Dâmbovița County, Romania","a village in Odobești, Dâmbovița County, Romania","a city in Vrancea County, Romania"],"gender":"m"},{"word":"Odobeștianu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Odobeștianu"}},{"word":"Odobișteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Odobișteanu"}},{"word":"odogaci","pos":"noun","definitions":["alternative form of odagaci"],"forms":{"plural":"odogaci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"odogaci","accusative-definite-nominative-singular":"odogaciul","accusative-indefinite-nominative-plural":"odogaci","accusative-definite-nominative-plural":"odogacii","dative-genitive-indefinite-singular":"odogaci","dative-definite-genitive-singular":"odogaciului","dative-genitive-indefinite-plural":"odogaci","dative-definite-genitive-plural":"odogacilor","singular-vocative":"odogaciule","plural-vocative":"odogacilor"}},{"word":"odograf","pos":"noun","definitions":["odograph"],"forms":{"plural":"odografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"odograf","accusative-definite-nominative-singular":"odograful","accusative-indefinite-nominative-plural":"odografe","accusative-definite-nominative-plural":"odografele","dative-genitive-indefinite-singular":"odograf","dative-definite-genitive-singular":"odografului","dative-genitive-indefinite-plural":"odografe","dative-definite-genitive-plural":"odografelor","singular-vocative":"odografule","plural-vocative":"odografelor"}},{"word":"odografie","pos":"noun","definitions":["odography"],"forms":{"plural":"odografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"odografie","accusative-definite-nominative-singular":"odografia","accusative-indefinite-nominative-plural":"odografii","accusative-definite-nominative-plural":"odografiile","dative-genitive-indefinite-singular":"odografii","dative-definite-genitive-singular":"odografiei","dative-genitive-indefinite-plural":"odografii","dative-definite-genitive-plural":"odografiilor","singular-vocative":"odografie","plural-vocative":"odografiilor"}},{"word":"odolean","pos":"noun","definitions":["allheal (Valeriana officinalis)"],"forms":{"plural":"odoleni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"odolean","accusative-definite-nominative-singular":"odoleanul","accusative-indefinite-nominative-plural":"odoleni","accusative-definite-nominative-plural":"odolenii","dative-genitive-indefinite-singular":"odolean","dative-definite-genitive-singular":"odoleanului","dative-genitive-indefinite-plural":"odoleni","dative-definite-genitive-plural":"odolenilor","singular-vocative":"odoleanule","plural-vocative":"odolenilor"}},{"word":"odoleană","pos":"noun","definitions":["alternative form of odolean"],"forms":{"plural":"odolene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"odoleană","accusative-definite-nominative-singular":"odoleana","accusative-indefinite-nominative-plural":"odolene","accusative-definite-nominative-plural":"odolenele","dative-genitive-indefinite-singular":"odolene","dative-definite-genitive-singular":"odolenei","dative-genitive-indefinite-plural":"odolene","dative-definite-genitive-plural":"odolenelor","singular-vocative":"odoleană","plural-vocative":"odolenelor"}},{"word":"odometric","pos":"adj","definitions":["odometrical"],"forms":{"feminine-singular":"odometrică","masculine-plural":"odometrici","feminine-neuter-plural":"odometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"odometric","error-unrecognized-form-feminine-indefinite-singular":"odometrică","error-unrecognized-form-indefinite-masculine-plural":"odometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"odometrice","definite-error-unrecognized-form-masculine-neuter-singular":"odometricul","definite-error-unrecognized-form-feminine-singular":"odometrica","definite-error-unrecognized-form-masculine-plural":"odometricii","definite-error-unrecognized-form-feminine-neuter-plural":"odometricele"}},{"word":"odometrie","pos":"noun","definitions":["odometry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"odometrie","accusative-definite-nominative-singular":"odometria","accusative-indefinite-nominative-plural":"odometrii","accusative-definite-nominative-plural":"odometriile","dative-genitive-indefinite-singular":"odometrii","dative-definite-genitive-singular":"odometriei","dative-genitive-indefinite-plural":"odometrii","dative-definite-genitive-plural":"odometriilor","singular-vocative":"odometrie","plural-vocative":"odometriilor"}},{"word":"odometru","pos":"noun","definitions":["odometer"],"forms":{"plural":"odometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"odometru","accusative-definite-nominative-singular":"odometrul","accusative-indefinite-nominative-plural":"odometre","accusative-definite-nominative-plural":"odometrele","dative-genitive-indefinite-singular":"odometru","dative-definite-genitive-singular":"odometrului","dative-genitive-indefinite-plural":"odometre","dative-definite-genitive-plural":"odometrelor","singular-vocative":"odometrule","plural-vocative":"odometrelor"}},{"word":"odonat","pos":"noun","definitions":["odonate"],"forms":{"plural":"odonate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"odonat","accusative-definite-nominative-singular":"odonatul","accusative-indefinite-nominative-plural":"odonate","accusative-definite-nominative-plural":"odonatele","dative-genitive-indefinite-singular":"odonat","dative-definite-genitive-singular":"odonatului","dative-genitive-indefinite-plural":"odonate","dative-definite-genitive-plural":"odonatelor","singular-vocative":"odonatule","plural-vocative":"odonatelor"}},{"word":"odontalgic","pos":"adj","definitions":["odontalgic"],"forms":{"feminine-singular":"odontalgică","masculine-plural":"odontalgici","feminine-neuter-plural":"odontalgice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"odontalgic","error-unrecognized-form-feminine-indefinite-singular":"odontalgică","error-unrecognized-form-indefinite-masculine-plural":"odontalgici","error-unrecognized-form-feminine-indefinite-neuter-plural":"odontalgice","definite-error-unrecognized-form-masculine-neuter-singular":"odontalgicul","definite-error-unrecognized-form-feminine-singular":"odontalgica","definite-error-unrecognized-form-masculine-plural":"odontalgicii","definite-error-unrecognized-form-feminine-neuter-plural":"odontalgicele"}},{"word":"odontalgie","pos":"noun","definitions":["odontalgia"],"forms":{"plural":"odontalgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"odontalgie","accusative-definite-nominative-singular":"odontalgia","accusative-indefinite-nominative-plural":"odontalgii","accusative-definite-nominative-plural":"odontalgiile","dative-genitive-indefinite-singular":"odontalgii","dative-definite-genitive-singular":"odontalgiei","dative-genitive-indefinite-plural":"odontalgii","dative-definite-genitive-plural":"odontalgiilor","singular-vocative":"odontalgie","plural-vocative":"odontalgiilor"}},{"word":"odontoblast","pos":"noun","definitions":["odontoblast"],"forms":{"plural":"odontoblaste","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"odontoblast","accusative-definite-nominative-singular":"odontoblastul","accusative-indefinite-nominative-plural":"odontoblaste","accusative-definite-nominative-plural":"odontoblastele","dative-genitive-indefinite-singular":"odontoblast","dative-definite-genitive-singular":"odontoblastului","dative-genitive-indefinite-plural":"odontoblaste","dative-definite-genitive-plural":"odontoblastelor","singular-vocative":"odontoblastule","plural-vocative":"odontoblastelor"}},{"word":"odontocie","pos":"noun","definitions":["demineralization, decalcification (of teeth)"],"forms":{"plural":"odontocii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"odontocie","accusative-definite-nominative-singular":"odontocia","accusative-indefinite-nominative-plural":"odontocii","accusative-definite-nominative-plural":"odontociile","dative-genitive-indefinite-singular":"odontocii","dative-definite-genitive-singular":"odontociei","dative-genitive-indefinite-plural":"odontocii","dative-definite-genitive-plural":"odontociilor","singular-vocative":"odontocie","plural-vocative":"odontociilor"}},{"word":"odontogenie","pos":"noun","definitions":["odontogeny"],"forms":{"plural":"odontogenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"odontogenie","accusative-definite-nominative-singular":"odontogenia","accusative-indefinite-nominative-plural":"odontogenii","accusative-definite-nominative-plural":"odontogeniile","dative-genitive-indefinite-singular":"odontogenii","dative-definite-genitive-singular":"odontogeniei","dative-genitive-indefinite-plural":"odontogenii","dative-definite-genitive-plural":"odontogeniilor","singular-vocative":"odontogenie","plural-vocative":"odontogeniilor"}},{"word":"odontografie","pos":"noun","definitions":["odontography"],"forms":{"plural":"odontografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"odontografie","accusative-definite-nominative-singular":"odontografia","accusative-indefinite-nominative-plural":"odontografii","accusative-definite-nominative-plural":"odontografiile","dative-genitive-indefinite-singular":"odontografii","dative-definite-genitive-singular":"odontografiei","dative-genitive-indefinite-plural":"odontografii","dative-definite-genitive-plural":"odontografiilor","singular-vocative":"odontografie","plural-vocative":"odontografiilor"}},{"word":"odontoiatrie","pos":"noun","definitions":["dentistry"],"forms":{"plural":"odontoiatrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"odontoiatrie","accusative-definite-nominative-singular":"odontoiatria","accusative-indefinite-nominative-plural":"odontoiatrii","accusative-definite-nominative-plural":"odontoiatriile","dative-genitive-indefinite-singular":"odontoiatrii","dative-definite-genitive-singular":"odontoiatriei","dative-genitive-indefinite-plural":"odontoiatrii","dative-definite-genitive-plural":"odontoiatriilor","singular-vocative":"odontoiatrie","plural-vocative":"odontoiatriilor"}},{"word":"odontoiatru","pos":"noun","definitions":["dentist"],"forms":{"plural":"odontoiatri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"odontoiatru","accusative-definite-nominative-singular":"odontoiatruul","accusative-indefinite-nominative-plural":"odontoiatri","accusative-definite-nominative-plural":"odontoiatrii","dative-genitive-indefinite-singular":"odontoiatru","dative-definite-genitive-singular":"odontoiatruului","dative-genitive-indefinite-plural":"odontoiatri","dative-definite-genitive-plural":"odontoiatrilor","singular-vocative":"odontoiatruule","plural-vocative":"odontoiatrilor"}},{"word":"odontolit","pos":"noun","definitions":["odontolith"],"forms":{"plural":"odontolite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"odontolit","accusative-definite-nominative-singular":"odontolitul","accusative-indefinite-nominative-plural":"odontolite","accusative-definite-nominative-plural":"odontolitele","dative-genitive-indefinite-singular":"odontolit","dative-definite-genitive-singular":"odontolitului","dative-genitive-indefinite-plural":"odontolite","dative-definite-genitive-plural":"odontolitelor","singular-vocative":"odontolitule","plural-vocative":"odontolitelor"}},{"word":"odontolog","pos":"noun","definitions":["odontologist"],"forms":{"plural":"odontologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"odontolog","accusative-definite-nominative-singular":"odontologul","accusative-indefinite-nominative-plural":"odontologi","accusative-definite-nominative-plural":"odontologii","dative-genitive-indefinite-singular":"odontolog","dative-definite-genitive-singular":"odontologului","dative-genitive-indefinite-plural":"odontologi","dative-definite-genitive-plural":"odontologilor","singular-vocative":"odontologule","plural-vocative":"odontologilor"}},{"word":"odontologă","pos":"noun","definitions":["female equivalent of odontolog"],"forms":{"plural":"odontologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"odontologă","accusative-definite-nominative-singular":"odontologa","accusative-indefinite-nominative-plural":"odontologe","accusative-definite-nominative-plural":"odontologele","dative-genitive-indefinite-singular":"odontologe","dative-definite-genitive-singular":"odontologei","dative-genitive-indefinite-plural":"odontologe","dative-definite-genitive-plural":"odontologelor","singular-vocative":"odontologă","plural-vocative":"odontologelor"}},{"word":"odontologic","pos":"adj","definitions":["odontological"],"forms":{"feminine-singular":"odontologică","masculine-plural":"odontologici","feminine-neuter-plural":"odontologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"odontologic","error-unrecognized-form-feminine-indefinite-singular":"odontologică","error-unrecognized-form-indefinite-masculine-plural":"odontologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"odontologice","definite-error-unrecognized-form-masculine-neuter-singular":"odontologicul","definite-error-unrecognized-form-feminine-singular":"odontologica","definite-error-unrecognized-form-masculine-plural":"odontologicii","definite-error-unrecognized-form-feminine-neuter-plural":"odontologicele"}},{"word":"odontologie","pos":"noun","definitions":["odontology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"odontologie","accusative-definite-nominative":"odontologia","dative-genitive-indefinite":"odontologii","dative-definite-genitive":"odontologiei","vocative":"odontologie"}},{"word":"odontom","pos":"noun","definitions":["odontoma"],"forms":{"plural":"odontoame","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"odontom","accusative-definite-nominative-singular":"odontomul","accusative-indefinite-nominative-plural":"odontoame","accusative-definite-nominative-plural":"odontoamei","dative-genitive-indefinite-singular":"odontom","dative-definite-genitive-singular":"odontomului","dative-genitive-indefinite-plural":"odontoame","dative-definite-genitive-plural":"odontoamelor","singular-vocative":"odontomule","plural-vocative":"odontoamelor"}},{"word":"odontometru","pos":"noun","definitions":["odontometer"],"forms":{"plural":"odontometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"odontometru","accusative-definite-nominative-singular":"odontometrul","accusative-indefinite-nominative-plural":"odontometre","accusative-definite-nominative-plural":"odontometrele","dative-genitive-indefinite-singular":"odontometru","dative-definite-genitive-singular":"odontometrului","dative-genitive-indefinite-plural":"odontometre","dative-definite-genitive-plural":"odontometrelor","singular-vocative":"odontometrule","plural-vocative":"odontometrelor"}},{"word":"odontoragie","pos":"noun","definitions":["odontorrhagia"],"forms":{"plural":"odontoragii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"odontoragie","accusative-definite-nominative-singular":"odontoragia","accusative-indefinite-nominative-plural":"odontoragii","accusative-definite-nominative-plural":"odontoragiile","dative-genitive-indefinite-singular":"odontoragii","dative-definite-genitive-singular":"odontoragiei","dative-genitive-indefinite-plural":"odontoragii","dative-definite-genitive-plural":"odontoragiilor","singular-vocative":"odontoragie","plural-vocative":"odontoragiilor"}},{"word":"Odor","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Odor"}},{"word":"odor","pos":"noun","definitions":["smell"],"forms":{"plural":"odoruri","table-tags":"no-table-tags","accusative-indefinite-nominative-singular":"odor","accusative-definite-nominative-singular":"odorul","accusative-indefinite-nominative-plural":"odoruri","accusative-definite-nominative-plural":"odorurile","dative-genitive-indefinite-singular":"odor","dative-definite-genitive-singular":"odorului","dative-genitive-indefinite-plural":"odoruri","dative-definite-genitive-plural":"odorurilor","singular-vocative":"-","plural-vocative":"-","alternative":"odoare"}},{"word":"odor","pos":"noun","definitions":["treasure"],"forms":{"plural":"odoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"odor","accusative-definite-nominative-singular":"odorul","accusative-indefinite-nominative-plural":"odoare","accusative-definite-nominative-plural":"odoarele","dative-genitive-indefinite-singular":"odor","dative-definite-genitive-singular":"odorului","dative-genitive-indefinite-plural":"odoare","dative-definite-genitive-plural":"odoarelor","singular-vocative":"odorule","plural-vocative":"odoarelor","alternative":"odoare"}},{"word":"odora","pos":"verb","definitions":["to smell"],"pronunciation":"/o.doˈra/","forms":{"canonical":"a odora 1st conjugation","present-singular-third-person":"odorează","participle-past":"odorat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a odora","gerund":"odorând","first-person-indicative-present-singular":"odorez","indicative-present-second-person-singular":"odorezi","indicative-present-singular-third-person":"odorează","first-person-indicative-plural-present":"odorăm","indicative-plural-present-second-person":"odorați","indicative-plural-present-third-person":"odorează","first-person-imperfect-indicative-singular":"odoram","imperfect-indicative-second-person-singular":"odorai","imperfect-indicative-singular-third-person":"odora","first-person-imperfect-indicative-plural":"odoram","imperfect-indicative-plural-second-person":"odorați","imperfect-indicative-plural-third-person":"odorau","first-person-indicative-perfect-singular":"odorai","indicative-perfect-second-person-singular":"odorași","indicative-perfect-singular-third-person":"odoră","first-person-indicative-perfect-plural":"odorarăm","indicative-perfect-plural-second-person":"odorarăți","indicative-perfect-plural-third-person":"odorară","first-person-indicative-pluperfect-singular":"odorasem","indicative-pluperfect-second-person-singular":"odoraseși","indicative-pluperfect-singular-third-person":"odorase","first-person-indicative-pluperfect-plural":"odoraserăm","indicative-pluperfect-plural-second-person":"odoraserăți","indicative-pluperfect-plural-third-person":"odoraseră","first-person-present-singular-subjunctive":"să odorez","present-second-person-singular-subjunctive":"să odorezi","present-singular-subjunctive-third-person":"să odoreze","first-person-plural-present-subjunctive":"să odorăm","plural-present-second-person-subjunctive":"să odorați","plural-present-subjunctive-third-person":"să odoreze","imperative-second-person-singular":"odorează","imperative-plural-second-person":"odorați","imperative-negative-second-person-singular":"nu odora","imperative-negative-plural-second-person":"nu odorați"}},{"word":"odorai","pos":"verb","definitions":["second-person singular imperfect indicative of odora","first-person singular perfect indicative of odora"],"pronunciation":"[odoˈraj]"},{"word":"odorant","pos":"adj","definitions":["odorous, odoriferous"],"forms":{"feminine-singular":"odorantă","masculine-plural":"odoranți","feminine-neuter-plural":"odorante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"odorant","error-unrecognized-form-feminine-indefinite-singular":"odorantă","error-unrecognized-form-indefinite-masculine-plural":"odoranți","error-unrecognized-form-feminine-indefinite-neuter-plural":"odorante","definite-error-unrecognized-form-masculine-neuter-singular":"odorantul","definite-error-unrecognized-form-feminine-singular":"odoranta","definite-error-unrecognized-form-masculine-plural":"odoranții","definite-error-unrecognized-form-feminine-neuter-plural":"odorantele"}},{"word":"odoraș","pos":"noun","definitions":["diminutive of odor; small treasure"],"forms":{"plural":"odorașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"odoraș","accusative-definite-nominative-singular":"odorașul","accusative-indefinite-nominative-plural":"odorașe","accusative-definite-nominative-plural":"odorașele","dative-genitive-indefinite-singular":"odoraș","dative-definite-genitive-singular":"odorașului","dative-genitive-indefinite-plural":"odorașe","dative-definite-genitive-plural":"odorașelor","singular-vocative":"odorașule","plural-vocative":"odorașelor"}},{"word":"odorat","pos":"noun","definitions":["smell"],"forms":{"plural":"odoraturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"odorat","accusative-definite-nominative-singular":"odoratul","accusative-indefinite-nominative-plural":"odoraturi","accusative-definite-nominative-plural":"odoraturile","dative-genitive-indefinite-singular":"odorat","dative-definite-genitive-singular":"odoratului","dative-genitive-indefinite-plural":"odoraturi","dative-definite-genitive-plural":"odoraturilor","singular-vocative":"odoratule","plural-vocative":"odoraturilor"}},{"word":"odoreală","pos":"noun","definitions":["smell"],"forms":{"plural":"odorele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"odoreală","accusative-definite-nominative-singular":"odoreala","accusative-indefinite-nominative-plural":"odorele","accusative-definite-nominative-plural":"odorelele","dative-genitive-indefinite-singular":"odorele","dative-definite-genitive-singular":"odorelei","dative-genitive-indefinite-plural":"odorele","dative-definite-genitive-plural":"odorelelor","singular-vocative":"odoreală","plural-vocative":"odorelelor"}},{"word":"Odoreu","pos":"name","definitions":["a commune of Satu Mare County, Romania","a village in Odoreu, Satu Mare County, Romania"],"gender":"m"},{"word":"Odorhean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Odorhean"}},{"word":"Odorhei","pos":"name","definitions":["a county of Romania"],"gender":"m"},{"word":"Odorheiu Secuiesc","pos":"name","definitions":["a city in Harghita County, Romania"],"pronunciation":"/odorˌheju sekuˈjesk/","gender":"m"},{"word":"Odorhelean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Odorhelean"}},{"word":"odorifer","pos":"adj","definitions":["odoriferous, odorous"],"forms":{"feminine-singular":"odoriferă","masculine-plural":"odoriferi","feminine-neuter-plural":"odorifere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"odorifer","error-unrecognized-form-feminine-indefinite-singular":"odoriferă","error-unrecognized-form-indefinite-masculine-plural":"odoriferi","error-unrecognized-form-feminine-indefinite-neuter-plural":"odorifere","definite-error-unrecognized-form-masculine-neuter-singular":"odoriferul","definite-error-unrecognized-form-feminine-singular":"odorifera","definite-error-unrecognized-form-masculine-plural":"odoriferii","definite-error-unrecognized-form-feminine-neuter-plural":"odoriferele"}},{"word":"odoriferant","pos":"adj","definitions":["sweet-smelling"],"forms":{"feminine-singular":"odoriferantă","masculine-plural":"odoriferanți","feminine-neuter-plural":"odoriferante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"odoriferant","error-unrecognized-form-feminine-indefinite-singular":"odoriferantă","error-unrecognized-form-indefinite-masculine-plural":"odoriferanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"odoriferante","definite-error-unrecognized-form-masculine-neuter-singular":"odoriferantul","definite-error-unrecognized-form-feminine-singular":"odoriferanta","definite-error-unrecognized-form-masculine-plural":"odoriferanții","definite-error-unrecognized-form-feminine-neuter-plural":"odoriferantele"}},{"word":"odorific","pos":"adj","definitions":["fragrant"],"forms":{"feminine-singular":"odorifică","masculine-plural":"odorifici","feminine-neuter-plural":"odorifice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"odorific","error-unrecognized-form-feminine-indefinite-singular":"odorifică","error-unrecognized-form-indefinite-masculine-plural":"odorifici","error-unrecognized-form-feminine-indefinite-neuter-plural":"odorifice","definite-error-unrecognized-form-masculine-neuter-singular":"odorificul","definite-error-unrecognized-form-feminine-singular":"odorifica","definite-error-unrecognized-form-masculine-plural":"odorificii","definite-error-unrecognized-form-feminine-neuter-plural":"odorificele"}},{"word":"odoriza","pos":"verb","definitions":["to odorize"],"forms":{"canonical":"a odoriza 1st conjugation","present-singular-third-person":"odorizează","participle-past":"odorizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a odoriza","gerund":"odorizând","first-person-indicative-present-singular":"odorizez","indicative-present-second-person-singular":"odorizezi","indicative-present-singular-third-person":"odorizează","first-person-indicative-plural-present":"odorizăm","indicative-plural-present-second-person":"odorizați","indicative-plural-present-third-person":"odorizează","first-person-imperfect-indicative-singular":"odorizam","imperfect-indicative-second-person-singular":"odorizai","imperfect-indicative-singular-third-person":"odoriza","first-person-imperfect-indicative-plural":"odorizam","imperfect-indicative-plural-second-person":"odorizați","imperfect-indicative-plural-third-person":"odorizau","first-person-indicative-perfect-singular":"odorizai","indicative-perfect-second-person-singular":"odorizași","indicative-perfect-singular-third-person":"odoriză","first-person-indicative-perfect-plural":"odorizarăm","indicative-perfect-plural-second-person":"odorizarăți","indicative-perfect-plural-third-person":"odorizară","first-person-indicative-pluperfect-singular":"odorizasem","indicative-pluperfect-second-person-singular":"odorizaseși","indicative-pluperfect-singular-third-person":"odorizase","first-person-indicative-pluperfect-plural":"odorizaserăm","indicative-pluperfect-plural-second-person":"odorizaserăți","indicative-pluperfect-plural-third-person":"odorizaseră","first-person-present-singular-subjunctive":"să odorizez","present-second-person-singular-subjunctive":"să odorizezi","present-singular-subjunctive-third-person":"să odorizeze","first-person-plural-present-subjunctive":"să odorizăm","plural-present-second-person-subjunctive":"să odorizați","plural-present-subjunctive-third-person":"să odorizeze","imperative-second-person-singular":"odorizează","imperative-plural-second-person":"odorizați","imperative-negative-second-person-singular":"nu odoriza","imperative-negative-plural-second-person":"nu odorizați"}},{"word":"odorizant","pos":"noun","definitions":["freshener"],"forms":{"plural":"odorizanți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"odorizant","accusative-definite-nominative-singular":"odorizantul","accusative-indefinite-nominative-plural":"odorizanți","accusative-definite-nominative-plural":"odorizanții","dative-genitive-indefinite-singular":"odorizant","dative-definite-genitive-singular":"odorizantului","dative-genitive-indefinite-plural":"odorizanți","dative-definite-genitive-plural":"odorizanților","singular-vocative":"odorizantule","plural-vocative":"odorizanților"}},{"word":"odorizare","pos":"noun","definitions":["odorization"],"forms":{"plural":"odorizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"odorizare","accusative-definite-nominative-singular":"odorizarea","accusative-indefinite-nominative-plural":"odorizări","accusative-definite-nominative-plural":"odorizările","dative-genitive-indefinite-singular":"odorizări","dative-definite-genitive-singular":"odorizării","dative-genitive-indefinite-plural":"odorizări","dative-definite-genitive-plural":"odorizărilor","singular-vocative":"odorizare","plural-vocative":"odorizărilor"}},{"word":"odorogit","pos":"adj","definitions":["alternative form of hodorogit"],"forms":{"feminine-singular":"odorogită","masculine-plural":"odorogiți","feminine-neuter-plural":"odorogite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"odorogit","error-unrecognized-form-feminine-indefinite-singular":"odorogită","error-unrecognized-form-indefinite-masculine-plural":"odorogiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"odorogite","definite-error-unrecognized-form-masculine-neuter-singular":"odorogitul","definite-error-unrecognized-form-feminine-singular":"odorogita","definite-error-unrecognized-form-masculine-plural":"odorogiții","definite-error-unrecognized-form-feminine-neuter-plural":"odorogitele"}},{"word":"odorologie","pos":"noun","definitions":["odorology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"odorologie","accusative-definite-nominative-singular":"odorologia","accusative-indefinite-nominative-plural":"odorologii","accusative-definite-nominative-plural":"odorologiile","dative-genitive-indefinite-singular":"odorologii","dative-definite-genitive-singular":"odorologiei","dative-genitive-indefinite-plural":"odorologii","dative-definite-genitive-plural":"odorologiilor","singular-vocative":"odorologie","plural-vocative":"odorologiilor"}},{"word":"odoruri","pos":"noun","definitions":["plural of odor"]},{"word":"odos","pos":"noun","definitions":["spring wild oat (Avena fatua)","lopsided oat (Avena strigosa)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"odos","accusative-definite-nominative":"odosul","dative-genitive-indefinite":"odos","dative-definite-genitive":"odosului","vocative":"odosule"}},{"word":"odovanie","pos":"noun","definitions":["the week after one of the Great Feasts"],"forms":{"plural":"odovanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"odovanie","accusative-definite-nominative-singular":"odovania","accusative-indefinite-nominative-plural":"odovanii","accusative-definite-nominative-plural":"odovaniile","dative-genitive-indefinite-singular":"odovanii","dative-definite-genitive-singular":"odovaniei","dative-genitive-indefinite-plural":"odovanii","dative-definite-genitive-plural":"odovaniilor","singular-vocative":"odovanie","plural-vocative":"odovaniilor"}},{"word":"odoviță","pos":"noun","definitions":["ide (Leuciscus idus)"],"forms":{"plural":"odovițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"odoviță","accusative-definite-nominative-singular":"odovița","accusative-indefinite-nominative-plural":"odovițe","accusative-definite-nominative-plural":"odovițele","dative-genitive-indefinite-singular":"odovițe","dative-definite-genitive-singular":"odoviței","dative-genitive-indefinite-plural":"odovițe","dative-definite-genitive-plural":"odovițelor","singular-vocative":"odoviță","plural-vocative":"odovițelor"}},{"word":"odraslă","pos":"noun","definitions":["child, descendant","sprout, stolon"],"forms":{"plural":"odrasle","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"odraslă","accusative-definite-nominative-singular":"odrasla","accusative-indefinite-nominative-plural":"odrasle","accusative-definite-nominative-plural":"odraslele","dative-genitive-indefinite-singular":"odrasle","dative-definite-genitive-singular":"odraslei","dative-genitive-indefinite-plural":"odrasle","dative-definite-genitive-plural":"odraslelor","singular-vocative":"odraslă","plural-vocative":"odraslelor"}},{"word":"odrăsli","pos":"verb","definitions":["to be born"],"forms":{"canonical":"a odrăsli 4th conjugation","present-singular-third-person":"odrăslește","participle-past":"odrăslit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a odrăsli","gerund":"odrăslind","first-person-indicative-present-singular":"odrăslesc","indicative-present-second-person-singular":"odrăslești","indicative-present-singular-third-person":"odrăslește","first-person-indicative-plural-present":"odrăslim","indicative-plural-present-second-person":"odrăsliți","indicative-plural-present-third-person":"odrăslesc","first-person-imperfect-indicative-singular":"odrăsleam","imperfect-indicative-second-person-singular":"odrăsleai","imperfect-indicative-singular-third-person":"odrăslea","first-person-imperfect-indicative-plural":"odrăsleam","imperfect-indicative-plural-second-person":"odrăsleați","imperfect-indicative-plural-third-person":"odrăsleau","first-person-indicative-perfect-singular":"odrăslii","indicative-perfect-second-person-singular":"odrăsliși","indicative-perfect-singular-third-person":"odrăsli","first-person-indicative-perfect-plural":"odrăslirăm","indicative-perfect-plural-second-person":"odrăslirăți","indicative-perfect-plural-third-person":"odrăsliră","first-person-indicative-pluperfect-singular":"odrăslisem","indicative-pluperfect-second-person-singular":"odrăsliseși","indicative-pluperfect-singular-third-person":"odrăslise","first-person-indicative-pluperfect-plural":"odrăsliserăm","indicative-pluperfect-plural-second-person":"odrăsliserăți","indicative-pluperfect-plural-third-person":"odrăsliseră","first-person-present-singular-subjunctive":"să odrăslesc","present-second-person-singular-subjunctive":"să odrăslești","present-singular-subjunctive-third-person":"să odrăslească","first-person-plural-present-subjunctive":"să odrăslim","plural-present-second-person-subjunctive":"să odrăsliți","plural-present-subjunctive-third-person":"să odrăslească","imperative-second-person-singular":"odrăslește","imperative-plural-second-person":"odrăsliți","imperative-negative-second-person-singular":"nu odrăsli","imperative-negative-plural-second-person":"nu odrăsliți"}},{"word":"odrăslire","pos":"noun","definitions":["birth, conception"],"forms":{"plural":"odrăsliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"odrăslire","accusative-definite-nominative-singular":"odrăslirea","accusative-indefinite-nominative-plural":"odrăsliri","accusative-definite-nominative-plural":"odrăslirile","dative-genitive-indefinite-singular":"odrăsliri","dative-definite-genitive-singular":"odrăslirii","dative-genitive-indefinite-plural":"odrăsliri","dative-definite-genitive-plural":"odrăslirilor","singular-vocative":"odrăslire","plural-vocative":"odrăslirilor"}},{"word":"odrăslit","pos":"adj","definitions":["begotten"],"forms":{"feminine-singular":"odrăslită","masculine-plural":"odrăsliți","feminine-neuter-plural":"odrăslite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"odrăslit","error-unrecognized-form-feminine-indefinite-singular":"odrăslită","error-unrecognized-form-indefinite-masculine-plural":"odrăsliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"odrăslite","definite-error-unrecognized-form-masculine-neuter-singular":"odrăslitul","definite-error-unrecognized-form-feminine-singular":"odrăslita","definite-error-unrecognized-form-masculine-plural":"odrăsliții","definite-error-unrecognized-form-feminine-neuter-plural":"odrăslitele"}},{"word":"odrăslitor","pos":"adj","definitions":["sprouting"],"forms":{"feminine-singular":"odrăslitoare","masculine-plural":"odrăslitori","feminine-neuter-plural":"odrăslitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"odrăslitor","error-unrecognized-form-feminine-indefinite-singular":"odrăslitoare","error-unrecognized-form-indefinite-masculine-plural":"odrăslitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"odrăslitoare","definite-error-unrecognized-form-masculine-neuter-singular":"odrăslitorul","definite-error-unrecognized-form-feminine-singular":"odrăslitoarea","definite-error-unrecognized-form-masculine-plural":"odrăslitorii","definite-error-unrecognized-form-feminine-neuter-plural":"odrăslitoarele"}},{"word":"odrăsluță","pos":"noun","definitions":["diminutive of odraslă; small child"],"forms":{"plural":"odrăsluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"odrăsluță","accusative-definite-nominative-singular":"odrăsluța","accusative-indefinite-nominative-plural":"odrăsluțe","accusative-definite-nominative-plural":"odrăsluțele","dative-genitive-indefinite-singular":"odrăsluțe","dative-definite-genitive-singular":"odrăsluței","dative-genitive-indefinite-plural":"odrăsluțe","dative-definite-genitive-plural":"odrăsluțelor","singular-vocative":"odrăsluță","plural-vocative":"odrăsluțelor"}},{"word":"Odrihei","pos":"name","definitions":["a village in Coroisânmărtin, Mureș County, Romania"],"gender":"m"},{"word":"Odverem","pos":"name","definitions":["a village in Lopadea Nouă, Alba County, Romania"],"gender":"m"},{"word":"Odvoș","pos":"name","definitions":["a village in Conop, Arad County, Romania"],"gender":"m"},{"word":"oecologie","pos":"noun","definitions":["alternative form of ecologie"],"forms":{"plural":"oecologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oecologie","accusative-definite-nominative-singular":"oecologia","accusative-indefinite-nominative-plural":"oecologii","accusative-definite-nominative-plural":"oecologiile","dative-genitive-indefinite-singular":"oecologii","dative-definite-genitive-singular":"oecologiei","dative-genitive-indefinite-plural":"oecologii","dative-definite-genitive-plural":"oecologiilor","singular-vocative":"oecologie","plural-vocative":"oecologiilor"}},{"word":"Oedip","pos":"name","definitions":["Oedipus"],"gender":"m"},{"word":"Oejdean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Oejdean"}},{"word":"oenofil","pos":"adj","definitions":["alternative form of enofil"],"examples":[{"ro":"„...Laudă, recunoștință și sfiiciune de oenofil pentru unul din puținele lăcașuri din țară (vinoteca națională a Liceului viticol din Huși — n.n.), în care vinul e zeul slujit cu atîta pasiune și cu credință nedezmințită de către […]“","en":null},{"ro":"Deși vinul are multe beneficii dovedite pentru sănătate dacă este consumat cu moderație ([…]), oenofilii nu sunt singurii beneficiari ai uimitoarelor avantaje pentru sănătate reprezentate de băuturile fermentate.","en":null},{"ro":"În timpul acestor patru zile în care Gorenflot făcea experiențele sale oenofile, Chicot nu ieșise deloc din cameră și îl pândise de seara până dimineața pe avocatul Nicolae David.","en":null}],"forms":{"feminine-singular":"oenofilă","masculine-plural":"oenofili","feminine-neuter-plural":"oenofile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oenofil","error-unrecognized-form-feminine-indefinite-singular":"oenofilă","error-unrecognized-form-indefinite-masculine-plural":"oenofili","error-unrecognized-form-feminine-indefinite-neuter-plural":"oenofile","definite-error-unrecognized-form-masculine-neuter-singular":"oenofilul","definite-error-unrecognized-form-feminine-singular":"oenofila","definite-error-unrecognized-form-masculine-plural":"oenofilii","definite-error-unrecognized-form-feminine-neuter-plural":"oenofilele"}},{"word":"oenologie","pos":"noun","definitions":["alternative form of enologie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"oenologie","accusative-definite-nominative":"oenologia","dative-genitive-indefinite":"oenologii","dative-definite-genitive":"oenologiei","vocative":"oenologie"}},{"word":"oerstedmetru","pos":"noun","definitions":["magnetometer"],"forms":{"plural":"oerstedmetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oerstedmetru","accusative-definite-nominative-singular":"oerstedmetrul","accusative-indefinite-nominative-plural":"oerstedmetre","accusative-definite-nominative-plural":"oerstedmetrele","dative-genitive-indefinite-singular":"oerstedmetru","dative-definite-genitive-singular":"oerstedmetrului","dative-genitive-indefinite-plural":"oerstedmetre","dative-definite-genitive-plural":"oerstedmetrelor","singular-vocative":"oerstedmetrule","plural-vocative":"oerstedmetrelor"}},{"word":"Oeru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Oeru"}},{"word":"Oeștii Pamânteni","pos":"name","definitions":["a village in Corbeni, Argeș County, Romania"],"gender":"m"},{"word":"Oeștii Ungureni","pos":"name","definitions":["a village in Corbeni, Argeș County, Romania"],"gender":"m"},{"word":"of","pos":"intj","definitions":["ugh, tsk, sigh"],"pronunciation":"/of/","examples":[{"ro":"used for expressing pain, bitterness, regret; despair; abhorrence, disgust; admiration, enthusiasm; wonder, surprise","en":null}]},{"word":"Ofatinți","pos":"name","definitions":["a village in Ofatinți, Transnistria, Moldova","a commune of Transnistria, Moldova"],"gender":"m"},{"word":"ofensa","pos":"verb","definitions":["to offend"],"forms":{"canonical":"a ofensa 1st conjugation","present-singular-third-person":"ofensează","participle-past":"ofensat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ofensa","gerund":"ofensând","first-person-indicative-present-singular":"ofensez","indicative-present-second-person-singular":"ofensezi","indicative-present-singular-third-person":"ofensează","first-person-indicative-plural-present":"ofensăm","indicative-plural-present-second-person":"ofensați","indicative-plural-present-third-person":"ofensează","first-person-imperfect-indicative-singular":"ofensam","imperfect-indicative-second-person-singular":"ofensai","imperfect-indicative-singular-third-person":"ofensa","first-person-imperfect-indicative-plural":"ofensam","imperfect-indicative-plural-second-person":"ofensați","imperfect-indicative-plural-third-person":"ofensau","first-person-indicative-perfect-singular":"ofensai","indicative-perfect-second-person-singular":"ofensași","indicative-perfect-singular-third-person":"ofensă","first-person-indicative-perfect-plural":"ofensarăm","indicative-perfect-plural-second-person":"ofensarăți","indicative-perfect-plural-third-person":"ofensară","first-person-indicative-pluperfect-singular":"ofensasem","indicative-pluperfect-second-person-singular":"ofensaseși","indicative-pluperfect-singular-third-person":"ofensase","first-person-indicative-pluperfect-plural":"ofensaserăm","indicative-pluperfect-plural-second-person":"ofensaserăți","indicative-pluperfect-plural-third-person":"ofensaseră","first-person-present-singular-subjunctive":"să ofensez","present-second-person-singular-subjunctive":"să ofensezi","present-singular-subjunctive-third-person":"să ofenseze","first-person-plural-present-subjunctive":"să ofensăm","plural-present-second-person-subjunctive":"să ofensați","plural-present-subjunctive-third-person":"să ofenseze","imperative-second-person-singular":"ofensează","imperative-plural-second-person":"ofensați","imperative-negative-second-person-singular":"nu ofensa","imperative-negative-plural-second-person":"nu ofensați"}},{"word":"ofensă","pos":"noun","definitions":["offence, insult"],"forms":{"plural":"ofense","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ofensă","accusative-definite-nominative-singular":"ofensa","accusative-indefinite-nominative-plural":"ofense","accusative-definite-nominative-plural":"ofensele","dative-genitive-indefinite-singular":"ofense","dative-definite-genitive-singular":"ofensei","dative-genitive-indefinite-plural":"ofense","dative-definite-genitive-plural":"ofenselor","singular-vocative":"ofensă","plural-vocative":"ofenselor"}},{"word":"ofensant","pos":"adj","definitions":["offensive"],"forms":{"feminine-singular":"ofensantă","masculine-plural":"ofensanți","feminine-neuter-plural":"ofensante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ofensant","error-unrecognized-form-feminine-indefinite-singular":"ofensantă","error-unrecognized-form-indefinite-masculine-plural":"ofensanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ofensante","definite-error-unrecognized-form-masculine-neuter-singular":"ofensantul","definite-error-unrecognized-form-feminine-singular":"ofensanta","definite-error-unrecognized-form-masculine-plural":"ofensanții","definite-error-unrecognized-form-feminine-neuter-plural":"ofensantele"}},{"word":"ofensare","pos":"noun","definitions":["offence"],"forms":{"plural":"ofensări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ofensare","accusative-definite-nominative-singular":"ofensarea","accusative-indefinite-nominative-plural":"ofensări","accusative-definite-nominative-plural":"ofensările","dative-genitive-indefinite-singular":"ofensări","dative-definite-genitive-singular":"ofensării","dative-genitive-indefinite-plural":"ofensări","dative-definite-genitive-plural":"ofensărilor","singular-vocative":"ofensare","plural-vocative":"ofensărilor"}},{"word":"ofensat","pos":"adj","definitions":["offended"],"forms":{"feminine-singular":"ofensată","masculine-plural":"ofensați","feminine-neuter-plural":"ofensate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ofensat","error-unrecognized-form-feminine-indefinite-singular":"ofensată","error-unrecognized-form-indefinite-masculine-plural":"ofensați","error-unrecognized-form-feminine-indefinite-neuter-plural":"ofensate","definite-error-unrecognized-form-masculine-neuter-singular":"ofensatul","definite-error-unrecognized-form-feminine-singular":"ofensata","definite-error-unrecognized-form-masculine-plural":"ofensații","definite-error-unrecognized-form-feminine-neuter-plural":"ofensatele"}},{"word":"ofensator","pos":"adj","definitions":["offensive, insulting"],"pronunciation":"/ofensaˈtor/","forms":{"feminine-singular":"ofensatoare","masculine-plural":"ofensatori","feminine-neuter-plural":"ofensatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ofensator","error-unrecognized-form-feminine-indefinite-singular":"ofensatoare","error-unrecognized-form-indefinite-masculine-plural":"ofensatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"ofensatoare","definite-error-unrecognized-form-masculine-neuter-singular":"ofensatorul","definite-error-unrecognized-form-feminine-singular":"ofensatoarea","definite-error-unrecognized-form-masculine-plural":"ofensatorii","definite-error-unrecognized-form-feminine-neuter-plural":"ofensatoarele"}},{"word":"ofensiv","pos":"adj","definitions":["offensive"],"forms":{"feminine-singular":"ofensivă","masculine-plural":"ofensivi","feminine-neuter-plural":"ofensive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ofensiv","error-unrecognized-form-feminine-indefinite-singular":"ofensivă","error-unrecognized-form-indefinite-masculine-plural":"ofensivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"ofensive","definite-error-unrecognized-form-masculine-neuter-singular":"ofensivul","definite-error-unrecognized-form-feminine-singular":"ofensiva","definite-error-unrecognized-form-masculine-plural":"ofensivii","definite-error-unrecognized-form-feminine-neuter-plural":"ofensivele"}},{"word":"ofensivă","pos":"noun","definitions":["offensive"],"forms":{"plural":"ofensive","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ofensivă","accusative-definite-nominative-singular":"ofensiva","accusative-indefinite-nominative-plural":"ofensive","accusative-definite-nominative-plural":"ofensivele","dative-genitive-indefinite-singular":"ofensive","dative-definite-genitive-singular":"ofensivei","dative-genitive-indefinite-plural":"ofensive","dative-definite-genitive-plural":"ofensivelor","singular-vocative":"ofensivă","plural-vocative":"ofensivelor"}},{"word":"ofer","pos":"verb","definitions":["first-person singular present indicative/subjunctive of oferi"],"pronunciation":"[oˈfer]"},{"word":"oferi","pos":"verb","definitions":["to offer"],"pronunciation":"/o.feˈri/","forms":{"canonical":"a oferi 4th conjugation","present-singular-third-person":"oferă","participle-past":"oferit","subjunctive-third-person":"ofere","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a oferi","gerund":"oferind","first-person-indicative-present-singular":"ofer","indicative-present-second-person-singular":"oferi","indicative-present-singular-third-person":"ofere","first-person-indicative-plural-present":"oferim","indicative-plural-present-second-person":"oferiți","indicative-plural-present-third-person":"ofer","first-person-imperfect-indicative-singular":"ofeream","imperfect-indicative-second-person-singular":"ofereai","imperfect-indicative-singular-third-person":"oferea","first-person-imperfect-indicative-plural":"ofeream","imperfect-indicative-plural-second-person":"ofereați","imperfect-indicative-plural-third-person":"ofereau","first-person-indicative-perfect-singular":"oferii","indicative-perfect-second-person-singular":"oferiși","indicative-perfect-singular-third-person":"oferi","first-person-indicative-perfect-plural":"oferirăm","indicative-perfect-plural-second-person":"oferirăți","indicative-perfect-plural-third-person":"oferiră","first-person-indicative-pluperfect-singular":"oferisem","indicative-pluperfect-second-person-singular":"oferiseși","indicative-pluperfect-singular-third-person":"oferise","first-person-indicative-pluperfect-plural":"oferiserăm","indicative-pluperfect-plural-second-person":"oferiserăți","indicative-pluperfect-plural-third-person":"oferiseră","first-person-present-singular-subjunctive":"să ofer","present-second-person-singular-subjunctive":"să oferi","present-singular-subjunctive-third-person":"să oferă","first-person-plural-present-subjunctive":"să oferim","plural-present-second-person-subjunctive":"să oferiți","plural-present-subjunctive-third-person":"să oferă","imperative-second-person-singular":"ofere","imperative-plural-second-person":"oferiți","imperative-negative-second-person-singular":"nu oferi","imperative-negative-plural-second-person":"nu oferiți"}},{"word":"oferi","pos":"verb","definitions":["second-person singular present indicative/subjunctive of oferi"],"pronunciation":"/oˈferʲ/"},{"word":"oferim","pos":"verb","definitions":["first-person plural present indicative/subjunctive of oferi"],"pronunciation":"[ofeˈrim]"},{"word":"oferire","pos":"noun","definitions":["offering"],"forms":{"plural":"oferiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oferire","accusative-definite-nominative-singular":"oferirea","accusative-indefinite-nominative-plural":"oferiri","accusative-definite-nominative-plural":"oferirile","dative-genitive-indefinite-singular":"oferiri","dative-definite-genitive-singular":"oferirii","dative-genitive-indefinite-plural":"oferiri","dative-definite-genitive-plural":"oferirilor","singular-vocative":"oferire","plural-vocative":"oferirilor"}},{"word":"oferta","pos":"verb","definitions":["to offer"],"forms":{"canonical":"a oferta 1st conjugation","present-singular-third-person":"ofertează","participle-past":"ofertat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a oferta","gerund":"ofertând","first-person-indicative-present-singular":"ofertez","indicative-present-second-person-singular":"ofertezi","indicative-present-singular-third-person":"ofertează","first-person-indicative-plural-present":"ofertăm","indicative-plural-present-second-person":"ofertați","indicative-plural-present-third-person":"ofertează","first-person-imperfect-indicative-singular":"ofertam","imperfect-indicative-second-person-singular":"ofertai","imperfect-indicative-singular-third-person":"oferta","first-person-imperfect-indicative-plural":"ofertam","imperfect-indicative-plural-second-person":"ofertați","imperfect-indicative-plural-third-person":"ofertau","first-person-indicative-perfect-singular":"ofertai","indicative-perfect-second-person-singular":"ofertași","indicative-perfect-singular-third-person":"ofertă","first-person-indicative-perfect-plural":"ofertarăm","indicative-perfect-plural-second-person":"ofertarăți","indicative-perfect-plural-third-person":"ofertară","first-person-indicative-pluperfect-singular":"ofertasem","indicative-pluperfect-second-person-singular":"ofertaseși","indicative-pluperfect-singular-third-person":"ofertase","first-person-indicative-pluperfect-plural":"ofertaserăm","indicative-pluperfect-plural-second-person":"ofertaserăți","indicative-pluperfect-plural-third-person":"ofertaseră","first-person-present-singular-subjunctive":"să ofertez","present-second-person-singular-subjunctive":"să ofertezi","present-singular-subjunctive-third-person":"să oferteze","first-person-plural-present-subjunctive":"să ofertăm","plural-present-second-person-subjunctive":"să ofertați","plural-present-subjunctive-third-person":"să oferteze","imperative-second-person-singular":"ofertează","imperative-plural-second-person":"ofertați","imperative-negative-second-person-singular":"nu oferta","imperative-negative-plural-second-person":"nu ofertați"}},{"word":"ofertă","pos":"noun","definitions":["offer"],"forms":{"plural":"oferte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ofertă","accusative-definite-nominative-singular":"oferta","accusative-indefinite-nominative-plural":"oferte","accusative-definite-nominative-plural":"ofertele","dative-genitive-indefinite-singular":"oferte","dative-definite-genitive-singular":"ofertei","dative-genitive-indefinite-plural":"oferte","dative-definite-genitive-plural":"ofertelor","singular-vocative":"ofertă","plural-vocative":"ofertelor"}},{"word":"ofertant","pos":"noun","definitions":["bidder"],"forms":{"plural":"ofertanți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ofertant","accusative-definite-nominative-singular":"ofertantul","accusative-indefinite-nominative-plural":"ofertanți","accusative-definite-nominative-plural":"ofertanții","dative-genitive-indefinite-singular":"ofertant","dative-definite-genitive-singular":"ofertantului","dative-genitive-indefinite-plural":"ofertanți","dative-definite-genitive-plural":"ofertanților","singular-vocative":"ofertantule","plural-vocative":"ofertanților"}},{"word":"ofertantă","pos":"noun","definitions":["female equivalent of ofertant"],"forms":{"plural":"ofertante","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ofertantă","accusative-definite-nominative-singular":"ofertanta","accusative-indefinite-nominative-plural":"ofertante","accusative-definite-nominative-plural":"ofertantele","dative-genitive-indefinite-singular":"ofertante","dative-definite-genitive-singular":"ofertantei","dative-genitive-indefinite-plural":"ofertante","dative-definite-genitive-plural":"ofertantelor","singular-vocative":"ofertantă","plural-vocative":"ofertantelor"}},{"word":"oficia","pos":"verb","definitions":["to officiate"],"forms":{"canonical":"a oficia 1st conjugation","present-singular-third-person":"oficiează","participle-past":"oficiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a oficia","gerund":"oficiind","first-person-indicative-present-singular":"oficiez","indicative-present-second-person-singular":"oficiezi","indicative-present-singular-third-person":"oficiază","first-person-indicative-plural-present":"oficiem","indicative-plural-present-second-person":"oficiați","indicative-plural-present-third-person":"oficiază","first-person-imperfect-indicative-singular":"oficiam","imperfect-indicative-second-person-singular":"oficiai","imperfect-indicative-singular-third-person":"oficia","first-person-imperfect-indicative-plural":"oficiam","imperfect-indicative-plural-second-person":"oficiați","imperfect-indicative-plural-third-person":"oficiau","first-person-indicative-perfect-singular":"oficiai","indicative-perfect-second-person-singular":"oficiași","indicative-perfect-singular-third-person":"oficie","first-person-indicative-perfect-plural":"oficiarăm","indicative-perfect-plural-second-person":"oficiarăți","indicative-perfect-plural-third-person":"oficiară","first-person-indicative-pluperfect-singular":"oficiasem","indicative-pluperfect-second-person-singular":"oficiaseși","indicative-pluperfect-singular-third-person":"oficiase","first-person-indicative-pluperfect-plural":"oficiaserăm","indicative-pluperfect-plural-second-person":"oficiaserăți","indicative-pluperfect-plural-third-person":"oficiaseră","first-person-present-singular-subjunctive":"să oficiez","present-second-person-singular-subjunctive":"să oficiezi","present-singular-subjunctive-third-person":"să oficieze","first-person-plural-present-subjunctive":"să oficiem","plural-present-second-person-subjunctive":"să oficiați","plural-present-subjunctive-third-person":"să oficieze","imperative-second-person-singular":"oficiază","imperative-plural-second-person":"oficiați","imperative-negative-second-person-singular":"nu oficia","imperative-negative-plural-second-person":"nu oficiați"}}];
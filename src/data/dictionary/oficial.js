@@ -0,0 +1 @@
+export default [{"word":"oficial","pos":"adj","definitions":["official"],"pronunciation":"[o.fi.tʃiˈal]","forms":{"feminine-singular":"oficială","masculine-plural":"oficiali","feminine-neuter-plural":"oficiale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"oficial","error-unrecognized-form-feminine-indefinite-singular":"oficială","error-unrecognized-form-indefinite-masculine-plural":"oficiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"oficiale","definite-error-unrecognized-form-masculine-neuter-singular":"oficialul","definite-error-unrecognized-form-feminine-singular":"oficiala","definite-error-unrecognized-form-masculine-plural":"oficialii","definite-error-unrecognized-form-feminine-neuter-plural":"oficialele"}},{"word":"oficială","pos":"adj","definitions":["feminine singular of oficial"],"pronunciation":"/ˌofit͡ʃiˈalə/"},{"word":"oficialitate","pos":"noun","definitions":["formality"],"forms":{"plural":"oficialități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oficialitate","accusative-definite-nominative-singular":"oficialitatea","accusative-indefinite-nominative-plural":"oficialități","accusative-definite-nominative-plural":"oficialitățile","dative-genitive-indefinite-singular":"oficialități","dative-definite-genitive-singular":"oficialității","dative-genitive-indefinite-plural":"oficialități","dative-definite-genitive-plural":"oficialităților","singular-vocative":"oficialitate","plural-vocative":"oficialităților"}},{"word":"oficializa","pos":"verb","definitions":["to formalize"],"pronunciation":"/o.fi.t͡ʃi.a.liˈza/","forms":{"canonical":"a oficializa 1st conjugation","present-singular-third-person":"oficializează","participle-past":"oficializat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a oficializa","gerund":"oficializând","first-person-indicative-present-singular":"oficializez","indicative-present-second-person-singular":"oficializezi","indicative-present-singular-third-person":"oficializează","first-person-indicative-plural-present":"oficializăm","indicative-plural-present-second-person":"oficializați","indicative-plural-present-third-person":"oficializează","first-person-imperfect-indicative-singular":"oficializam","imperfect-indicative-second-person-singular":"oficializai","imperfect-indicative-singular-third-person":"oficializa","first-person-imperfect-indicative-plural":"oficializam","imperfect-indicative-plural-second-person":"oficializați","imperfect-indicative-plural-third-person":"oficializau","first-person-indicative-perfect-singular":"oficializai","indicative-perfect-second-person-singular":"oficializași","indicative-perfect-singular-third-person":"oficializă","first-person-indicative-perfect-plural":"oficializarăm","indicative-perfect-plural-second-person":"oficializarăți","indicative-perfect-plural-third-person":"oficializară","first-person-indicative-pluperfect-singular":"oficializasem","indicative-pluperfect-second-person-singular":"oficializaseși","indicative-pluperfect-singular-third-person":"oficializase","first-person-indicative-pluperfect-plural":"oficializaserăm","indicative-pluperfect-plural-second-person":"oficializaserăți","indicative-pluperfect-plural-third-person":"oficializaseră","first-person-present-singular-subjunctive":"să oficializez","present-second-person-singular-subjunctive":"să oficializezi","present-singular-subjunctive-third-person":"să oficializeze","first-person-plural-present-subjunctive":"să oficializăm","plural-present-second-person-subjunctive":"să oficializați","plural-present-subjunctive-third-person":"să oficializeze","imperative-second-person-singular":"oficializează","imperative-plural-second-person":"oficializați","imperative-negative-second-person-singular":"nu oficializa","imperative-negative-plural-second-person":"nu oficializați"}},{"word":"oficializare","pos":"noun","definitions":["formalization"],"forms":{"plural":"oficializări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oficializare","accusative-definite-nominative-singular":"oficializarea","accusative-indefinite-nominative-plural":"oficializări","accusative-definite-nominative-plural":"oficializările","dative-genitive-indefinite-singular":"oficializări","dative-definite-genitive-singular":"oficializării","dative-genitive-indefinite-plural":"oficializări","dative-definite-genitive-plural":"oficializărilor","singular-vocative":"oficializare","plural-vocative":"oficializărilor"}},{"word":"oficializat","pos":"noun","definitions":["officialization"],"forms":{"plural":"oficializaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"oficializat","accusative-definite-nominative-singular":"oficializatul","accusative-indefinite-nominative-plural":"oficializaturi","accusative-definite-nominative-plural":"oficializaturile","dative-genitive-indefinite-singular":"oficializat","dative-definite-genitive-singular":"oficializatului","dative-genitive-indefinite-plural":"oficializaturi","dative-definite-genitive-plural":"oficializaturilor","singular-vocative":"oficializatule","plural-vocative":"oficializaturilor"}},{"word":"oficializat","pos":"verb","definitions":["past participle of oficializa"],"forms":{"participle-past":"of oficializa"}},{"word":"oficializau","pos":"verb","definitions":["third-person plural imperfect indicative of oficializa"]},{"word":"oficialmente","pos":"adv","definitions":["officially"]},{"word":"oficiant","pos":"noun","definitions":["official"],"forms":{"plural":"oficianți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oficiant","accusative-definite-nominative-singular":"oficiantul","accusative-indefinite-nominative-plural":"oficianți","accusative-definite-nominative-plural":"oficianții","dative-genitive-indefinite-singular":"oficiant","dative-definite-genitive-singular":"oficiantului","dative-genitive-indefinite-plural":"oficianți","dative-definite-genitive-plural":"oficianților","singular-vocative":"oficiantule","plural-vocative":"oficianților"}},{"word":"oficiantă","pos":"noun","definitions":["female equivalent of oficiant"],"forms":{"plural":"oficiante","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oficiantă","accusative-definite-nominative-singular":"oficianta","accusative-indefinite-nominative-plural":"oficiante","accusative-definite-nominative-plural":"oficiantele","dative-genitive-indefinite-singular":"oficiante","dative-definite-genitive-singular":"oficiantei","dative-genitive-indefinite-plural":"oficiante","dative-definite-genitive-plural":"oficiantelor","singular-vocative":"oficiantă","plural-vocative":"oficiantelor"}},{"word":"oficie","pos":"noun","definitions":["obsolete form of oficiu"],"forms":{"plural":"oficii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oficie","accusative-definite-nominative-singular":"oficia","accusative-indefinite-nominative-plural":"oficii","accusative-definite-nominative-plural":"oficiile","dative-genitive-indefinite-singular":"oficii","dative-definite-genitive-singular":"oficiei","dative-genitive-indefinite-plural":"oficii","dative-definite-genitive-plural":"oficiilor","singular-vocative":"oficie","plural-vocative":"oficiilor"}},{"word":"oficiere","pos":"noun","definitions":["officiation"],"forms":{"plural":"oficieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oficiere","accusative-definite-nominative-singular":"oficierea","accusative-indefinite-nominative-plural":"oficieri","accusative-definite-nominative-plural":"oficierile","dative-genitive-indefinite-singular":"oficieri","dative-definite-genitive-singular":"oficierii","dative-genitive-indefinite-plural":"oficieri","dative-definite-genitive-plural":"oficierilor","singular-vocative":"oficiere","plural-vocative":"oficierilor"}},{"word":"oficii","pos":"noun","definitions":["plural of oficiu"],"pronunciation":"/oˈfi.t͡ʃiː/"},{"word":"oficină","pos":"noun","definitions":["pharmacy laboratory"],"forms":{"plural":"oficine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oficină","accusative-definite-nominative-singular":"oficina","accusative-indefinite-nominative-plural":"oficine","accusative-definite-nominative-plural":"oficinele","dative-genitive-indefinite-singular":"oficine","dative-definite-genitive-singular":"oficinei","dative-genitive-indefinite-plural":"oficine","dative-definite-genitive-plural":"oficinelor","singular-vocative":"oficină","plural-vocative":"oficinelor"}},{"word":"oficinal","pos":"adj","definitions":["officinal, medicinal"],"forms":{"feminine-singular":"oficinală","masculine-plural":"oficinali","feminine-neuter-plural":"oficinale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oficinal","error-unrecognized-form-feminine-indefinite-singular":"oficinală","error-unrecognized-form-indefinite-masculine-plural":"oficinali","error-unrecognized-form-feminine-indefinite-neuter-plural":"oficinale","definite-error-unrecognized-form-masculine-neuter-singular":"oficinalul","definite-error-unrecognized-form-feminine-singular":"oficinala","definite-error-unrecognized-form-masculine-plural":"oficinalii","definite-error-unrecognized-form-feminine-neuter-plural":"oficinalele"}},{"word":"oficiolat","pos":"noun","definitions":["territory"],"forms":{"plural":"oficiolate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oficiolat","accusative-definite-nominative-singular":"oficiolatul","accusative-indefinite-nominative-plural":"oficiolate","accusative-definite-nominative-plural":"oficiolatele","dative-genitive-indefinite-singular":"oficiolat","dative-definite-genitive-singular":"oficiolatului","dative-genitive-indefinite-plural":"oficiolate","dative-definite-genitive-plural":"oficiolatelor","singular-vocative":"oficiolatule","plural-vocative":"oficiolatelor"}},{"word":"oficios","pos":"adj","definitions":["unofficial, but which supports the point of view of a government, party, etc."],"forms":{"feminine-singular":"oficioasă","masculine-plural":"oficioși","feminine-neuter-plural":"oficioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oficios","error-unrecognized-form-feminine-indefinite-singular":"oficioasă","error-unrecognized-form-indefinite-masculine-plural":"oficioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"oficioase","definite-error-unrecognized-form-masculine-neuter-singular":"oficiosul","definite-error-unrecognized-form-feminine-singular":"oficioasa","definite-error-unrecognized-form-masculine-plural":"oficioșii","definite-error-unrecognized-form-feminine-neuter-plural":"oficioasele"}},{"word":"oficios","pos":"noun","definitions":["unofficial (not official)"],"forms":{"plural":"oficioși","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oficios","accusative-definite-nominative-singular":"oficiosul","accusative-indefinite-nominative-plural":"oficioși","accusative-definite-nominative-plural":"oficioșile","dative-genitive-indefinite-singular":"oficios","dative-definite-genitive-singular":"oficiosului","dative-genitive-indefinite-plural":"oficioși","dative-definite-genitive-plural":"oficioșilor","singular-vocative":"oficiosule","plural-vocative":"oficioșilor"}},{"word":"oficiu","pos":"noun","definitions":["office"],"pronunciation":"/oˈfi.t͡ʃju/","forms":{"plural":"oficii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oficiu","accusative-definite-nominative-singular":"oficiul","accusative-indefinite-nominative-plural":"oficii","accusative-definite-nominative-plural":"oficiile","dative-genitive-indefinite-singular":"oficiu","dative-definite-genitive-singular":"oficiului","dative-genitive-indefinite-plural":"oficii","dative-definite-genitive-plural":"oficiilor","singular-vocative":"oficiule","plural-vocative":"oficiilor"}},{"word":"oficiu de turism","pos":"noun","definitions":["tourist office"],"forms":{"plural":"oficii de turism"}},{"word":"oficiu poștal","pos":"noun","definitions":["post office"],"forms":{"plural":"oficii poștale"}},{"word":"oficiu turistic","pos":"noun","definitions":["tourist office"],"forms":{"plural":"oficii turistice"}},{"word":"oficleid","pos":"noun","definitions":["ophicleide"],"forms":{"plural":"oficleide","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oficleid","accusative-definite-nominative-singular":"oficleidul","accusative-indefinite-nominative-plural":"oficleide","accusative-definite-nominative-plural":"oficleidele","dative-genitive-indefinite-singular":"oficleid","dative-definite-genitive-singular":"oficleidului","dative-genitive-indefinite-plural":"oficleide","dative-definite-genitive-plural":"oficleidelor","singular-vocative":"oficleidule","plural-vocative":"oficleidelor"}},{"word":"ofidian","pos":"noun","definitions":["ophidian"],"forms":{"plural":"ofidieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ofidian","accusative-definite-nominative-singular":"ofidianul","accusative-indefinite-nominative-plural":"ofidieni","accusative-definite-nominative-plural":"ofidienii","dative-genitive-indefinite-singular":"ofidian","dative-definite-genitive-singular":"ofidianului","dative-genitive-indefinite-plural":"ofidieni","dative-definite-genitive-plural":"ofidienilor","singular-vocative":"ofidianule","plural-vocative":"ofidienilor"}},{"word":"ofidism","pos":"noun","definitions":["ophidism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ofidism","accusative-definite-nominative-singular":"ofidismul","accusative-indefinite-nominative-plural":"ofidisme","accusative-definite-nominative-plural":"ofidismele","dative-genitive-indefinite-singular":"ofidism","dative-definite-genitive-singular":"ofidismului","dative-genitive-indefinite-plural":"ofidisme","dative-definite-genitive-plural":"ofidismelor","singular-vocative":"ofidismule","plural-vocative":"ofidismelor"}},{"word":"ofili","pos":"verb","definitions":["to wither","to fade, languish"],"forms":{"canonical":"a ofili 4th conjugation","present-singular-third-person":"ofilește","participle-past":"ofilit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ofili","gerund":"ofilind","first-person-indicative-present-singular":"ofilesc","indicative-present-second-person-singular":"ofilești","indicative-present-singular-third-person":"ofilește","first-person-indicative-plural-present":"ofilim","indicative-plural-present-second-person":"ofiliți","indicative-plural-present-third-person":"ofilesc","first-person-imperfect-indicative-singular":"ofileam","imperfect-indicative-second-person-singular":"ofileai","imperfect-indicative-singular-third-person":"ofilea","first-person-imperfect-indicative-plural":"ofileam","imperfect-indicative-plural-second-person":"ofileați","imperfect-indicative-plural-third-person":"ofileau","first-person-indicative-perfect-singular":"ofilii","indicative-perfect-second-person-singular":"ofiliși","indicative-perfect-singular-third-person":"ofili","first-person-indicative-perfect-plural":"ofilirăm","indicative-perfect-plural-second-person":"ofilirăți","indicative-perfect-plural-third-person":"ofiliră","first-person-indicative-pluperfect-singular":"ofilisem","indicative-pluperfect-second-person-singular":"ofiliseși","indicative-pluperfect-singular-third-person":"ofilise","first-person-indicative-pluperfect-plural":"ofiliserăm","indicative-pluperfect-plural-second-person":"ofiliserăți","indicative-pluperfect-plural-third-person":"ofiliseră","first-person-present-singular-subjunctive":"să ofilesc","present-second-person-singular-subjunctive":"să ofilești","present-singular-subjunctive-third-person":"să ofilească","first-person-plural-present-subjunctive":"să ofilim","plural-present-second-person-subjunctive":"să ofiliți","plural-present-subjunctive-third-person":"să ofilească","imperative-second-person-singular":"ofilește","imperative-plural-second-person":"ofiliți","imperative-negative-second-person-singular":"nu ofili","imperative-negative-plural-second-person":"nu ofiliți"}},{"word":"ofilire","pos":"noun","definitions":["fading"],"forms":{"plural":"ofiliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ofilire","accusative-definite-nominative-singular":"ofilirea","accusative-indefinite-nominative-plural":"ofiliri","accusative-definite-nominative-plural":"ofilirile","dative-genitive-indefinite-singular":"ofiliri","dative-definite-genitive-singular":"ofilirii","dative-genitive-indefinite-plural":"ofiliri","dative-definite-genitive-plural":"ofilirilor","singular-vocative":"ofilire","plural-vocative":"ofilirilor"}},{"word":"ofilit","pos":"verb","definitions":["past participle of ofili"],"pronunciation":"/o.fiˈlit/"},{"word":"ofilit","pos":"adj","definitions":["withered","sad","abased, humbled"],"pronunciation":"/o.fiˈlit/","forms":{"feminine-singular":"ofilită","masculine-plural":"ofiliți","feminine-neuter-plural":"ofilite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ofilit","error-unrecognized-form-feminine-indefinite-singular":"ofilită","error-unrecognized-form-indefinite-masculine-plural":"ofiliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ofilite","definite-error-unrecognized-form-masculine-neuter-singular":"ofilitul","definite-error-unrecognized-form-feminine-singular":"ofilita","definite-error-unrecognized-form-masculine-plural":"ofiliții","definite-error-unrecognized-form-feminine-neuter-plural":"ofilitele"}},{"word":"ofiofag","pos":"adj","definitions":["ophiophagous"],"forms":{"feminine-singular":"ofiofagă","masculine-plural":"ofiofagi","feminine-neuter-plural":"ofiofage","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ofiofag","error-unrecognized-form-feminine-indefinite-singular":"ofiofagă","error-unrecognized-form-indefinite-masculine-plural":"ofiofagi","error-unrecognized-form-feminine-indefinite-neuter-plural":"ofiofage","definite-error-unrecognized-form-masculine-neuter-singular":"ofiofagul","definite-error-unrecognized-form-feminine-singular":"ofiofaga","definite-error-unrecognized-form-masculine-plural":"ofiofagii","definite-error-unrecognized-form-feminine-neuter-plural":"ofiofagele"}},{"word":"ofiofagie","pos":"noun","definitions":["ophiophagy"],"forms":{"plural":"ofiofagii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ofiofagie","accusative-definite-nominative-singular":"ofiofagia","accusative-indefinite-nominative-plural":"ofiofagii","accusative-definite-nominative-plural":"ofiofagiile","dative-genitive-indefinite-singular":"ofiofagii","dative-definite-genitive-singular":"ofiofagiei","dative-genitive-indefinite-plural":"ofiofagii","dative-definite-genitive-plural":"ofiofagiilor","singular-vocative":"ofiofagie","plural-vocative":"ofiofagiilor"}},{"word":"ofiografie","pos":"noun","definitions":["ophiography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ofiografie","accusative-definite-nominative-singular":"ofiografia","accusative-indefinite-nominative-plural":"ofiografii","accusative-definite-nominative-plural":"ofiografiile","dative-genitive-indefinite-singular":"ofiografii","dative-definite-genitive-singular":"ofiografiei","dative-genitive-indefinite-plural":"ofiografii","dative-definite-genitive-plural":"ofiografiilor","singular-vocative":"ofiografie","plural-vocative":"ofiografiilor"}},{"word":"ofiolatră","pos":"noun","definitions":["female equivalent of ofiolatru"],"forms":{"plural":"ofiolatre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ofiolatră","accusative-definite-nominative-singular":"ofiolatra","accusative-indefinite-nominative-plural":"ofiolatre","accusative-definite-nominative-plural":"ofiolatrele","dative-genitive-indefinite-singular":"ofiolatre","dative-definite-genitive-singular":"ofiolatrei","dative-genitive-indefinite-plural":"ofiolatre","dative-definite-genitive-plural":"ofiolatrelor","singular-vocative":"ofiolatră","plural-vocative":"ofiolatrelor"}},{"word":"ofiolatrie","pos":"noun","definitions":["ophiolatry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"ofiolatrie","accusative-definite-nominative":"ofiolatria","dative-genitive-indefinite":"ofiolatrii","dative-definite-genitive":"ofiolatriei","vocative":"ofiolatrie"}},{"word":"ofiolatru","pos":"noun","definitions":["ophiolater"],"forms":{"plural":"ofiolatri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ofiolatru","accusative-definite-nominative-singular":"ofiolatruul","accusative-indefinite-nominative-plural":"ofiolatri","accusative-definite-nominative-plural":"ofiolatrii","dative-genitive-indefinite-singular":"ofiolatru","dative-definite-genitive-singular":"ofiolatruului","dative-genitive-indefinite-plural":"ofiolatri","dative-definite-genitive-plural":"ofiolatrilor","singular-vocative":"ofiolatruule","plural-vocative":"ofiolatrilor"}},{"word":"ofiolit","pos":"noun","definitions":["ophiolite"],"forms":{"plural":"ofiolite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ofiolit","accusative-definite-nominative-singular":"ofiolitul","accusative-indefinite-nominative-plural":"ofiolite","accusative-definite-nominative-plural":"ofiolitele","dative-genitive-indefinite-singular":"ofiolit","dative-definite-genitive-singular":"ofiolitului","dative-genitive-indefinite-plural":"ofiolite","dative-definite-genitive-plural":"ofiolitelor","singular-vocative":"ofiolitule","plural-vocative":"ofiolitelor"}},{"word":"ofiologic","pos":"adj","definitions":["ophiological"],"forms":{"feminine-singular":"ofiologică","masculine-plural":"ofiologici","feminine-neuter-plural":"ofiologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ofiologic","error-unrecognized-form-feminine-indefinite-singular":"ofiologică","error-unrecognized-form-indefinite-masculine-plural":"ofiologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ofiologice","definite-error-unrecognized-form-masculine-neuter-singular":"ofiologicul","definite-error-unrecognized-form-feminine-singular":"ofiologica","definite-error-unrecognized-form-masculine-plural":"ofiologicii","definite-error-unrecognized-form-feminine-neuter-plural":"ofiologicele"}},{"word":"ofiologie","pos":"noun","definitions":["ophiology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"ofiologie","accusative-definite-nominative":"ofiologia","dative-genitive-indefinite":"ofiologii","dative-definite-genitive":"ofiologiei","vocative":"ofiologie"}},{"word":"ofis","pos":"noun","definitions":["alternative form of oficiu"],"forms":{"plural":"ofisuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ofis","accusative-definite-nominative-singular":"ofisul","accusative-indefinite-nominative-plural":"ofisuri","accusative-definite-nominative-plural":"ofisurile","dative-genitive-indefinite-singular":"ofis","dative-definite-genitive-singular":"ofisului","dative-genitive-indefinite-plural":"ofisuri","dative-definite-genitive-plural":"ofisurilor","singular-vocative":"ofisule","plural-vocative":"ofisurilor"}},{"word":"ofit","pos":"noun","definitions":["ophite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ofit","accusative-definite-nominative-singular":"ofitul","accusative-indefinite-nominative-plural":"ofite","accusative-definite-nominative-plural":"ofitele","dative-genitive-indefinite-singular":"ofit","dative-definite-genitive-singular":"ofitului","dative-genitive-indefinite-plural":"ofite","dative-definite-genitive-plural":"ofitelor","singular-vocative":"ofitule","plural-vocative":"ofitelor"}},{"word":"ofițer","pos":"noun","definitions":["officer"],"forms":{"plural":"ofițeri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ofițer","accusative-definite-nominative-singular":"ofițerul","accusative-indefinite-nominative-plural":"ofițeri","accusative-definite-nominative-plural":"ofițerii","dative-genitive-indefinite-singular":"ofițer","dative-definite-genitive-singular":"ofițerului","dative-genitive-indefinite-plural":"ofițeri","dative-definite-genitive-plural":"ofițerilor","singular-vocative":"ofițerule","plural-vocative":"ofițerilor"}},{"word":"ofițer secund","pos":"noun","definitions":["second officer"],"forms":{"plural":"ofițeri secunzi"}},{"word":"ofițeraș","pos":"noun","definitions":["diminutive of ofițer; small officer"],"forms":{"plural":"ofițerași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ofițeraș","accusative-definite-nominative-singular":"ofițerașul","accusative-indefinite-nominative-plural":"ofițerași","accusative-definite-nominative-plural":"ofițerașii","dative-genitive-indefinite-singular":"ofițeraș","dative-definite-genitive-singular":"ofițerașului","dative-genitive-indefinite-plural":"ofițerași","dative-definite-genitive-plural":"ofițerașilor","singular-vocative":"ofițerașule","plural-vocative":"ofițerașilor"}},{"word":"ofițereasă","pos":"noun","definitions":["female equivalent of ofițer"],"forms":{"plural":"ofițerese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ofițereasă","accusative-definite-nominative-singular":"ofițereasa","accusative-indefinite-nominative-plural":"ofițerese","accusative-definite-nominative-plural":"ofițeresele","dative-genitive-indefinite-singular":"ofițerese","dative-definite-genitive-singular":"ofițeresei","dative-genitive-indefinite-plural":"ofițerese","dative-definite-genitive-plural":"ofițereselor","singular-vocative":"ofițereasă","plural-vocative":"ofițereselor"}},{"word":"ofițeresc","pos":"adj","definitions":["officer's"],"forms":{"feminine-singular":"ofițerească","plural":"ofițerești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ofițeresc","error-unrecognized-form-feminine-indefinite-singular":"ofițerească","error-unrecognized-form-indefinite-masculine-plural":"ofițerești","error-unrecognized-form-feminine-indefinite-neuter-plural":"ofițerești","definite-error-unrecognized-form-masculine-neuter-singular":"ofițerescul","definite-error-unrecognized-form-feminine-singular":"ofițereasca","definite-error-unrecognized-form-masculine-plural":"ofițereștii","definite-error-unrecognized-form-feminine-neuter-plural":"ofițereștile"}},{"word":"Ofițerescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ofițerescu"}},{"word":"ofițerește","pos":"adv","definitions":["officerly"]},{"word":"ofițeri","pos":"noun","definitions":["plural of ofițer"]},{"word":"ofițerime","pos":"noun","definitions":["collective noun for officers"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"ofițerime","accusative-definite-nominative":"ofițerimea","dative-genitive-indefinite":"ofițerime","dative-definite-genitive":"ofițerimei","vocative":"ofițerime"}},{"word":"ofițeroi","pos":"noun","definitions":["augmentative of ofițer"],"forms":{"plural":"ofițeroi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ofițeroi","accusative-definite-nominative-singular":"ofițeroiul","accusative-indefinite-nominative-plural":"ofițeroi","accusative-definite-nominative-plural":"ofițeroii","dative-genitive-indefinite-singular":"ofițeroi","dative-definite-genitive-singular":"ofițeroiului","dative-genitive-indefinite-plural":"ofițeroi","dative-definite-genitive-plural":"ofițeroilor","singular-vocative":"ofițeroiule","plural-vocative":"ofițeroilor"}},{"word":"Ofițeru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Ofițeru"}},{"word":"ofițial","pos":"adj","definitions":["obsolete form of oficial"],"forms":{"feminine-singular":"ofițială","masculine-plural":"ofițiali","feminine-neuter-plural":"ofițiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ofițial","error-unrecognized-form-feminine-indefinite-singular":"ofițială","error-unrecognized-form-indefinite-masculine-plural":"ofițiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"ofițiale","definite-error-unrecognized-form-masculine-neuter-singular":"ofițialul","definite-error-unrecognized-form-feminine-singular":"ofițiala","definite-error-unrecognized-form-masculine-plural":"ofițialii","definite-error-unrecognized-form-feminine-neuter-plural":"ofițialele"}},{"word":"ofitic","pos":"adj","definitions":["ophitic"],"forms":{"feminine-singular":"ofitică","masculine-plural":"ofitici","feminine-neuter-plural":"ofitice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ofitic","error-unrecognized-form-feminine-indefinite-singular":"ofitică","error-unrecognized-form-indefinite-masculine-plural":"ofitici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ofitice","definite-error-unrecognized-form-masculine-neuter-singular":"ofiticul","definite-error-unrecognized-form-feminine-singular":"ofitica","definite-error-unrecognized-form-masculine-plural":"ofiticii","definite-error-unrecognized-form-feminine-neuter-plural":"ofiticele"}},{"word":"ofiur","pos":"noun","definitions":["ophiuroid, brittle star"],"forms":{"plural":"ofiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ofiur","accusative-definite-nominative-singular":"ofiurul","accusative-indefinite-nominative-plural":"ofiuri","accusative-definite-nominative-plural":"ofiurii","dative-genitive-indefinite-singular":"ofiur","dative-definite-genitive-singular":"ofiurului","dative-genitive-indefinite-plural":"ofiuri","dative-definite-genitive-plural":"ofiurilor","singular-vocative":"ofiurule","plural-vocative":"ofiurilor"}},{"word":"ofiurid","pos":"noun","definitions":["alternative form of ofiuridă"],"forms":{"plural":"ofiurizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ofiurid","accusative-definite-nominative-singular":"ofiuridul","accusative-indefinite-nominative-plural":"ofiurizi","accusative-definite-nominative-plural":"ofiurizii","dative-genitive-indefinite-singular":"ofiurid","dative-definite-genitive-singular":"ofiuridului","dative-genitive-indefinite-plural":"ofiurizi","dative-definite-genitive-plural":"ofiurizilor","singular-vocative":"ofiuridule","plural-vocative":"ofiurizilor"}},{"word":"ofrandă","pos":"noun","definitions":["offering"],"forms":{"plural":"ofrande","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ofrandă","accusative-definite-nominative-singular":"ofranda","accusative-indefinite-nominative-plural":"ofrande","accusative-definite-nominative-plural":"ofrandele","dative-genitive-indefinite-singular":"ofrande","dative-definite-genitive-singular":"ofrandei","dative-genitive-indefinite-plural":"ofrande","dative-definite-genitive-plural":"ofrandelor","singular-vocative":"ofrandă","plural-vocative":"ofrandelor"}},{"word":"ofsaid","pos":"noun","definitions":["offside"],"forms":{"plural":"ofsaiduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ofsaid","accusative-definite-nominative-singular":"ofsaidul","accusative-indefinite-nominative-plural":"ofsaiduri","accusative-definite-nominative-plural":"ofsaidurile","dative-genitive-indefinite-singular":"ofsaid","dative-definite-genitive-singular":"ofsaidului","dative-genitive-indefinite-plural":"ofsaiduri","dative-definite-genitive-plural":"ofsaidurilor","singular-vocative":"ofsaidule","plural-vocative":"ofsaidurilor"}},{"word":"Ofsenița","pos":"name","definitions":["a village in Banloc, Timiș County, Romania"],"gender":"f"},{"word":"ofset","pos":"noun","definitions":["offset"],"forms":{"plural":"ofseturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ofset","accusative-definite-nominative-singular":"ofsetul","accusative-indefinite-nominative-plural":"ofseturi","accusative-definite-nominative-plural":"ofseturile","dative-genitive-indefinite-singular":"ofset","dative-definite-genitive-singular":"ofsetului","dative-genitive-indefinite-plural":"ofseturi","dative-definite-genitive-plural":"ofseturilor","singular-vocative":"ofsetule","plural-vocative":"ofseturilor"}},{"word":"oft","pos":"noun","definitions":["sigh"],"forms":{"plural":"ofturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"oft","accusative-definite-nominative-singular":"oftul","accusative-indefinite-nominative-plural":"ofturi","accusative-definite-nominative-plural":"ofturile","dative-genitive-indefinite-singular":"oft","dative-definite-genitive-singular":"oftului","dative-genitive-indefinite-plural":"ofturi","dative-definite-genitive-plural":"ofturilor","singular-vocative":"oftule","plural-vocative":"ofturilor"}},{"word":"ofta","pos":"verb","definitions":["to sigh"],"pronunciation":"/ofˈta/","forms":{"canonical":"a ofta 1st conjugation","present-singular-third-person":"oftează","participle-past":"oftat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ofta","gerund":"oftând","first-person-indicative-present-singular":"oftez","indicative-present-second-person-singular":"oftezi","indicative-present-singular-third-person":"oftează","first-person-indicative-plural-present":"oftăm","indicative-plural-present-second-person":"oftați","indicative-plural-present-third-person":"oftează","first-person-imperfect-indicative-singular":"oftam","imperfect-indicative-second-person-singular":"oftai","imperfect-indicative-singular-third-person":"ofta","first-person-imperfect-indicative-plural":"oftam","imperfect-indicative-plural-second-person":"oftați","imperfect-indicative-plural-third-person":"oftau","first-person-indicative-perfect-singular":"oftai","indicative-perfect-second-person-singular":"oftași","indicative-perfect-singular-third-person":"oftă","first-person-indicative-perfect-plural":"oftarăm","indicative-perfect-plural-second-person":"oftarăți","indicative-perfect-plural-third-person":"oftară","first-person-indicative-pluperfect-singular":"oftasem","indicative-pluperfect-second-person-singular":"oftaseși","indicative-pluperfect-singular-third-person":"oftase","first-person-indicative-pluperfect-plural":"oftaserăm","indicative-pluperfect-plural-second-person":"oftaserăți","indicative-pluperfect-plural-third-person":"oftaseră","first-person-present-singular-subjunctive":"să oftez","present-second-person-singular-subjunctive":"să oftezi","present-singular-subjunctive-third-person":"să ofteze","first-person-plural-present-subjunctive":"să oftăm","plural-present-second-person-subjunctive":"să oftați","plural-present-subjunctive-third-person":"să ofteze","imperative-second-person-singular":"oftează","imperative-plural-second-person":"oftați","imperative-negative-second-person-singular":"nu ofta","imperative-negative-plural-second-person":"nu oftați","alternative":"офта"}},{"word":"oftalmic","pos":"adj","definitions":["ophthalmic"],"forms":{"feminine-singular":"oftalmică","masculine-plural":"oftalmici","feminine-neuter-plural":"oftalmice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oftalmic","error-unrecognized-form-feminine-indefinite-singular":"oftalmică","error-unrecognized-form-indefinite-masculine-plural":"oftalmici","error-unrecognized-form-feminine-indefinite-neuter-plural":"oftalmice","definite-error-unrecognized-form-masculine-neuter-singular":"oftalmicul","definite-error-unrecognized-form-feminine-singular":"oftalmica","definite-error-unrecognized-form-masculine-plural":"oftalmicii","definite-error-unrecognized-form-feminine-neuter-plural":"oftalmicele"}},{"word":"oftalmie","pos":"noun","definitions":["ophthalmia"],"forms":{"plural":"oftalmii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oftalmie","accusative-definite-nominative-singular":"oftalmia","accusative-indefinite-nominative-plural":"oftalmii","accusative-definite-nominative-plural":"oftalmiile","dative-genitive-indefinite-singular":"oftalmii","dative-definite-genitive-singular":"oftalmiei","dative-genitive-indefinite-plural":"oftalmii","dative-definite-genitive-plural":"oftalmiilor","singular-vocative":"oftalmie","plural-vocative":"oftalmiilor"}},{"word":"oftalmodinie","pos":"noun","definitions":["ophthalmodynia"],"forms":{"plural":"oftalmodinii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oftalmodinie","accusative-definite-nominative-singular":"oftalmodinia","accusative-indefinite-nominative-plural":"oftalmodinii","accusative-definite-nominative-plural":"oftalmodiniile","dative-genitive-indefinite-singular":"oftalmodinii","dative-definite-genitive-singular":"oftalmodiniei","dative-genitive-indefinite-plural":"oftalmodinii","dative-definite-genitive-plural":"oftalmodiniilor","singular-vocative":"oftalmodinie","plural-vocative":"oftalmodiniilor"}},{"word":"oftalmografie","pos":"noun","definitions":["ophthalmography"],"forms":{"plural":"oftalmografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oftalmografie","accusative-definite-nominative-singular":"oftalmografia","accusative-indefinite-nominative-plural":"oftalmografii","accusative-definite-nominative-plural":"oftalmografiile","dative-genitive-indefinite-singular":"oftalmografii","dative-definite-genitive-singular":"oftalmografiei","dative-genitive-indefinite-plural":"oftalmografii","dative-definite-genitive-plural":"oftalmografiilor","singular-vocative":"oftalmografie","plural-vocative":"oftalmografiilor"}},{"word":"oftalmolog","pos":"noun","definitions":["ophthalmologist"],"forms":{"plural":"oftalmologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oftalmolog","accusative-definite-nominative-singular":"oftalmologul","accusative-indefinite-nominative-plural":"oftalmologi","accusative-definite-nominative-plural":"oftalmologii","dative-genitive-indefinite-singular":"oftalmolog","dative-definite-genitive-singular":"oftalmologului","dative-genitive-indefinite-plural":"oftalmologi","dative-definite-genitive-plural":"oftalmologilor","singular-vocative":"oftalmologule","plural-vocative":"oftalmologilor"}},{"word":"oftalmologă","pos":"noun","definitions":["female equivalent of oftalmolog"],"forms":{"plural":"oftalmologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oftalmologă","accusative-definite-nominative-singular":"oftalmologa","accusative-indefinite-nominative-plural":"oftalmologe","accusative-definite-nominative-plural":"oftalmologele","dative-genitive-indefinite-singular":"oftalmologe","dative-definite-genitive-singular":"oftalmologei","dative-genitive-indefinite-plural":"oftalmologe","dative-definite-genitive-plural":"oftalmologelor","singular-vocative":"oftalmologă","plural-vocative":"oftalmologelor"}},{"word":"oftalmologic","pos":"adj","definitions":["ophthalmologic"],"forms":{"feminine-singular":"oftalmologică","masculine-plural":"oftalmologici","feminine-neuter-plural":"oftalmologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oftalmologic","error-unrecognized-form-feminine-indefinite-singular":"oftalmologică","error-unrecognized-form-indefinite-masculine-plural":"oftalmologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"oftalmologice","definite-error-unrecognized-form-masculine-neuter-singular":"oftalmologicul","definite-error-unrecognized-form-feminine-singular":"oftalmologica","definite-error-unrecognized-form-masculine-plural":"oftalmologicii","definite-error-unrecognized-form-feminine-neuter-plural":"oftalmologicele"}},{"word":"oftalmologie","pos":"noun","definitions":["ophthalmology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"oftalmologie","accusative-definite-nominative":"oftalmologia","dative-genitive-indefinite":"oftalmologii","dative-definite-genitive":"oftalmologiei","vocative":"oftalmologie"}},{"word":"oftalmometric","pos":"adj","definitions":["ophthalmometric"],"forms":{"feminine-singular":"oftalmometrică","masculine-plural":"oftalmometrici","feminine-neuter-plural":"oftalmometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oftalmometric","error-unrecognized-form-feminine-indefinite-singular":"oftalmometrică","error-unrecognized-form-indefinite-masculine-plural":"oftalmometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"oftalmometrice","definite-error-unrecognized-form-masculine-neuter-singular":"oftalmometricul","definite-error-unrecognized-form-feminine-singular":"oftalmometrica","definite-error-unrecognized-form-masculine-plural":"oftalmometricii","definite-error-unrecognized-form-feminine-neuter-plural":"oftalmometricele"}},{"word":"oftalmometrie","pos":"noun","definitions":["ophthalmometry"],"forms":{"plural":"oftalmometrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oftalmometrie","accusative-definite-nominative-singular":"oftalmometria","accusative-indefinite-nominative-plural":"oftalmometrii","accusative-definite-nominative-plural":"oftalmometriile","dative-genitive-indefinite-singular":"oftalmometrii","dative-definite-genitive-singular":"oftalmometriei","dative-genitive-indefinite-plural":"oftalmometrii","dative-definite-genitive-plural":"oftalmometriilor","singular-vocative":"oftalmometrie","plural-vocative":"oftalmometriilor"}},{"word":"oftalmometru","pos":"noun","definitions":["ophthalmometer"],"forms":{"plural":"oftalmometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oftalmometru","accusative-definite-nominative-singular":"oftalmometrul","accusative-indefinite-nominative-plural":"oftalmometre","accusative-definite-nominative-plural":"oftalmometrele","dative-genitive-indefinite-singular":"oftalmometru","dative-definite-genitive-singular":"oftalmometrului","dative-genitive-indefinite-plural":"oftalmometre","dative-definite-genitive-plural":"oftalmometrelor","singular-vocative":"oftalmometrule","plural-vocative":"oftalmometrelor"}},{"word":"oftalmopatie","pos":"noun","definitions":["ophthalmopathy"],"forms":{"plural":"oftalmopatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oftalmopatie","accusative-definite-nominative-singular":"oftalmopatia","accusative-indefinite-nominative-plural":"oftalmopatii","accusative-definite-nominative-plural":"oftalmopatiile","dative-genitive-indefinite-singular":"oftalmopatii","dative-definite-genitive-singular":"oftalmopatiei","dative-genitive-indefinite-plural":"oftalmopatii","dative-definite-genitive-plural":"oftalmopatiilor","singular-vocative":"oftalmopatie","plural-vocative":"oftalmopatiilor"}},{"word":"oftalmoplegie","pos":"noun","definitions":["ophthalmoplegia"],"forms":{"plural":"oftalmoplegii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oftalmoplegie","accusative-definite-nominative-singular":"oftalmoplegia","accusative-indefinite-nominative-plural":"oftalmoplegii","accusative-definite-nominative-plural":"oftalmoplegiile","dative-genitive-indefinite-singular":"oftalmoplegii","dative-definite-genitive-singular":"oftalmoplegiei","dative-genitive-indefinite-plural":"oftalmoplegii","dative-definite-genitive-plural":"oftalmoplegiilor","singular-vocative":"oftalmoplegie","plural-vocative":"oftalmoplegiilor"}},{"word":"oftalmoragie","pos":"noun","definitions":["ophthalmorrhagia"],"forms":{"plural":"oftalmoragii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oftalmoragie","accusative-definite-nominative-singular":"oftalmoragia","accusative-indefinite-nominative-plural":"oftalmoragii","accusative-definite-nominative-plural":"oftalmoragiile","dative-genitive-indefinite-singular":"oftalmoragii","dative-definite-genitive-singular":"oftalmoragiei","dative-genitive-indefinite-plural":"oftalmoragii","dative-definite-genitive-plural":"oftalmoragiilor","singular-vocative":"oftalmoragie","plural-vocative":"oftalmoragiilor"}},{"word":"oftalmoscop","pos":"noun","definitions":["ophthalmoscope"],"forms":{"plural":"oftalmoscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oftalmoscop","accusative-definite-nominative-singular":"oftalmoscopul","accusative-indefinite-nominative-plural":"oftalmoscoape","accusative-definite-nominative-plural":"oftalmoscoapele","dative-genitive-indefinite-singular":"oftalmoscop","dative-definite-genitive-singular":"oftalmoscopului","dative-genitive-indefinite-plural":"oftalmoscoape","dative-definite-genitive-plural":"oftalmoscoapelor","singular-vocative":"oftalmoscopule","plural-vocative":"oftalmoscoapelor"}},{"word":"oftalmoscopic","pos":"adj","definitions":["ophthalmoscopic"],"forms":{"feminine-singular":"oftalmoscopică","masculine-plural":"oftalmoscopici","feminine-neuter-plural":"oftalmoscopice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oftalmoscopic","error-unrecognized-form-feminine-indefinite-singular":"oftalmoscopică","error-unrecognized-form-indefinite-masculine-plural":"oftalmoscopici","error-unrecognized-form-feminine-indefinite-neuter-plural":"oftalmoscopice","definite-error-unrecognized-form-masculine-neuter-singular":"oftalmoscopicul","definite-error-unrecognized-form-feminine-singular":"oftalmoscopica","definite-error-unrecognized-form-masculine-plural":"oftalmoscopicii","definite-error-unrecognized-form-feminine-neuter-plural":"oftalmoscopicele"}},{"word":"oftalmoscopie","pos":"noun","definitions":["ophthalmoscopy"],"forms":{"plural":"oftalmoscopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oftalmoscopie","accusative-definite-nominative-singular":"oftalmoscopia","accusative-indefinite-nominative-plural":"oftalmoscopii","accusative-definite-nominative-plural":"oftalmoscopiile","dative-genitive-indefinite-singular":"oftalmoscopii","dative-definite-genitive-singular":"oftalmoscopiei","dative-genitive-indefinite-plural":"oftalmoscopii","dative-definite-genitive-plural":"oftalmoscopiilor","singular-vocative":"oftalmoscopie","plural-vocative":"oftalmoscopiilor"}},{"word":"oftalmotomie","pos":"noun","definitions":["ophthalmotomy"],"forms":{"plural":"oftalmotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oftalmotomie","accusative-definite-nominative-singular":"oftalmotomia","accusative-indefinite-nominative-plural":"oftalmotomii","accusative-definite-nominative-plural":"oftalmotomiile","dative-genitive-indefinite-singular":"oftalmotomii","dative-definite-genitive-singular":"oftalmotomiei","dative-genitive-indefinite-plural":"oftalmotomii","dative-definite-genitive-plural":"oftalmotomiilor","singular-vocative":"oftalmotomie","plural-vocative":"oftalmotomiilor"}},{"word":"oftare","pos":"noun","definitions":["sighing"],"forms":{"plural":"oftări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oftare","accusative-definite-nominative-singular":"oftarea","accusative-indefinite-nominative-plural":"oftări","accusative-definite-nominative-plural":"oftările","dative-genitive-indefinite-singular":"oftări","dative-definite-genitive-singular":"oftării","dative-genitive-indefinite-plural":"oftări","dative-definite-genitive-plural":"oftărilor","singular-vocative":"oftare","plural-vocative":"oftărilor"}},{"word":"oftat","pos":"noun","definitions":["sigh, sob"],"forms":{"plural":"oftaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oftat","accusative-definite-nominative-singular":"oftatul","accusative-indefinite-nominative-plural":"oftaturi","accusative-definite-nominative-plural":"oftaturile","dative-genitive-indefinite-singular":"oftat","dative-definite-genitive-singular":"oftatului","dative-genitive-indefinite-plural":"oftaturi","dative-definite-genitive-plural":"oftaturilor","singular-vocative":"oftatule","plural-vocative":"oftaturilor"}},{"word":"oftat","pos":"verb","definitions":["past participle of ofta"],"forms":{"participle-past":"of ofta","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"oftat","error-unrecognized-form-feminine-indefinite-singular":"oftată","error-unrecognized-form-indefinite-masculine-plural":"oftați","error-unrecognized-form-feminine-indefinite-neuter-plural":"oftate","definite-error-unrecognized-form-masculine-neuter-singular":"oftatul","definite-error-unrecognized-form-feminine-singular":"oftata","definite-error-unrecognized-form-masculine-plural":"oftații","definite-error-unrecognized-form-feminine-neuter-plural":"oftatele"}},{"word":"oftătură","pos":"noun","definitions":["sigh"],"forms":{"plural":"oftături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"oftătură","accusative-definite-nominative-singular":"oftătura","accusative-indefinite-nominative-plural":"oftături","accusative-definite-nominative-plural":"oftăturile","dative-genitive-indefinite-singular":"oftături","dative-definite-genitive-singular":"oftăturii","dative-genitive-indefinite-plural":"oftături","dative-definite-genitive-plural":"oftăturilor","singular-vocative":"oftătură","plural-vocative":"oftăturilor"}},{"word":"oftica","pos":"verb","definitions":["to be consumptive, phthisical","to be consumed with grief, become embittered"],"forms":{"canonical":"a oftica 1st conjugation","present-singular-third-person":"oftică","participle-past":"ofticat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a oftica","gerund":"ofticând","first-person-indicative-present-singular":"oftic","indicative-present-second-person-singular":"oftici","indicative-present-singular-third-person":"oftică","first-person-indicative-plural-present":"ofticăm","indicative-plural-present-second-person":"ofticați","indicative-plural-present-third-person":"oftică","first-person-imperfect-indicative-singular":"ofticam","imperfect-indicative-second-person-singular":"ofticai","imperfect-indicative-singular-third-person":"oftica","first-person-imperfect-indicative-plural":"ofticam","imperfect-indicative-plural-second-person":"ofticați","imperfect-indicative-plural-third-person":"ofticau","first-person-indicative-perfect-singular":"ofticai","indicative-perfect-second-person-singular":"ofticași","indicative-perfect-singular-third-person":"oftică","first-person-indicative-perfect-plural":"ofticarăm","indicative-perfect-plural-second-person":"ofticarăți","indicative-perfect-plural-third-person":"ofticară","first-person-indicative-pluperfect-singular":"ofticasem","indicative-pluperfect-second-person-singular":"ofticaseși","indicative-pluperfect-singular-third-person":"ofticase","first-person-indicative-pluperfect-plural":"ofticaserăm","indicative-pluperfect-plural-second-person":"ofticaserăți","indicative-pluperfect-plural-third-person":"ofticaseră","first-person-present-singular-subjunctive":"să oftic","present-second-person-singular-subjunctive":"să oftici","present-singular-subjunctive-third-person":"să oftice","first-person-plural-present-subjunctive":"să ofticăm","plural-present-second-person-subjunctive":"să ofticați","plural-present-subjunctive-third-person":"să oftice","imperative-second-person-singular":"oftică","imperative-plural-second-person":"ofticați","imperative-negative-second-person-singular":"nu oftica","imperative-negative-plural-second-person":"nu ofticați"}},{"word":"oftică","pos":"noun","definitions":["pulmonary tuberculosis, consumption","annoyance, envy, bitterness, grudge"],"forms":{"plural":"oftici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"oftică","accusative-definite-nominative-singular":"oftica","accusative-indefinite-nominative-plural":"oftici","accusative-definite-nominative-plural":"ofticile","dative-genitive-indefinite-singular":"oftici","dative-definite-genitive-singular":"ofticii","dative-genitive-indefinite-plural":"oftici","dative-definite-genitive-plural":"ofticilor","singular-vocative":"oftică","plural-vocative":"ofticilor"}},{"word":"ofticare","pos":"noun","definitions":["tuberculization","embitterment"],"forms":{"plural":"ofticări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ofticare","accusative-definite-nominative-singular":"ofticarea","accusative-indefinite-nominative-plural":"ofticări","accusative-definite-nominative-plural":"ofticările","dative-genitive-indefinite-singular":"ofticări","dative-definite-genitive-singular":"ofticării","dative-genitive-indefinite-plural":"ofticări","dative-definite-genitive-plural":"ofticărilor","singular-vocative":"ofticare","plural-vocative":"ofticărilor"}},{"word":"ofticat","pos":"adj","definitions":["pissed, furious"],"forms":{"feminine-singular":"ofticată","masculine-plural":"ofticați","feminine-neuter-plural":"ofticate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ofticat","error-unrecognized-form-feminine-indefinite-singular":"ofticată","error-unrecognized-form-indefinite-masculine-plural":"ofticați","error-unrecognized-form-feminine-indefinite-neuter-plural":"ofticate","definite-error-unrecognized-form-masculine-neuter-singular":"ofticatul","definite-error-unrecognized-form-feminine-singular":"ofticata","definite-error-unrecognized-form-masculine-plural":"ofticații","definite-error-unrecognized-form-feminine-neuter-plural":"ofticatele"}},{"word":"ofticos","pos":"adj","definitions":["envious"],"forms":{"feminine-singular":"ofticoasă","masculine-plural":"ofticoși","feminine-neuter-plural":"ofticoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ofticos","error-unrecognized-form-feminine-indefinite-singular":"ofticoasă","error-unrecognized-form-indefinite-masculine-plural":"ofticoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"ofticoase","definite-error-unrecognized-form-masculine-neuter-singular":"ofticosul","definite-error-unrecognized-form-feminine-singular":"ofticoasa","definite-error-unrecognized-form-masculine-plural":"ofticoșii","definite-error-unrecognized-form-feminine-neuter-plural":"ofticoasele"}},{"word":"oftigă","pos":"noun","definitions":["alternative form of oftică"],"forms":{"plural":"oftigi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"oftigă","accusative-definite-nominative-singular":"oftiga","accusative-indefinite-nominative-plural":"oftigi","accusative-definite-nominative-plural":"oftigile","dative-genitive-indefinite-singular":"oftigi","dative-definite-genitive-singular":"oftigii","dative-genitive-indefinite-plural":"oftigi","dative-definite-genitive-plural":"oftigilor","singular-vocative":"oftigă","plural-vocative":"oftigilor"}},{"word":"oftigos","pos":"adj","definitions":["alternative form of ofticos"],"forms":{"feminine-singular":"oftigoasă","masculine-plural":"oftigoși","feminine-neuter-plural":"oftigoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oftigos","error-unrecognized-form-feminine-indefinite-singular":"oftigoasă","error-unrecognized-form-indefinite-masculine-plural":"oftigoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"oftigoase","definite-error-unrecognized-form-masculine-neuter-singular":"oftigosul","definite-error-unrecognized-form-feminine-singular":"oftigoasa","definite-error-unrecognized-form-masculine-plural":"oftigoșii","definite-error-unrecognized-form-feminine-neuter-plural":"oftigoasele"}},{"word":"ofusca","pos":"verb","definitions":["to offend"],"forms":{"canonical":"a ofusca 1st conjugation","present-singular-third-person":"ofuschează","participle-past":"ofuscat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ofusca","gerund":"ofuscând","first-person-indicative-present-singular":"ofuschez","indicative-present-second-person-singular":"ofuschezi","indicative-present-singular-third-person":"ofuschează","first-person-indicative-plural-present":"ofuscăm","indicative-plural-present-second-person":"ofuscați","indicative-plural-present-third-person":"ofuschează","first-person-imperfect-indicative-singular":"ofuscam","imperfect-indicative-second-person-singular":"ofuscai","imperfect-indicative-singular-third-person":"ofusca","first-person-imperfect-indicative-plural":"ofuscam","imperfect-indicative-plural-second-person":"ofuscați","imperfect-indicative-plural-third-person":"ofuscau","first-person-indicative-perfect-singular":"ofuscai","indicative-perfect-second-person-singular":"ofuscași","indicative-perfect-singular-third-person":"ofuscă","first-person-indicative-perfect-plural":"ofuscarăm","indicative-perfect-plural-second-person":"ofuscarăți","indicative-perfect-plural-third-person":"ofuscară","first-person-indicative-pluperfect-singular":"ofuscasem","indicative-pluperfect-second-person-singular":"ofuscaseși","indicative-pluperfect-singular-third-person":"ofuscase","first-person-indicative-pluperfect-plural":"ofuscaserăm","indicative-pluperfect-plural-second-person":"ofuscaserăți","indicative-pluperfect-plural-third-person":"ofuscaseră","first-person-present-singular-subjunctive":"să ofuschez","present-second-person-singular-subjunctive":"să ofuschezi","present-singular-subjunctive-third-person":"să ofuscheze","first-person-plural-present-subjunctive":"să ofuscăm","plural-present-second-person-subjunctive":"să ofuscați","plural-present-subjunctive-third-person":"să ofuscheze","imperative-second-person-singular":"ofuschează","imperative-plural-second-person":"ofuscați","imperative-negative-second-person-singular":"nu ofusca","imperative-negative-plural-second-person":"nu ofuscați"}},{"word":"ofuscat","pos":"adj","definitions":["offended"],"forms":{"feminine-singular":"ofuscată","masculine-plural":"ofuscați","feminine-neuter-plural":"ofuscate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ofuscat","error-unrecognized-form-feminine-indefinite-singular":"ofuscată","error-unrecognized-form-indefinite-masculine-plural":"ofuscați","error-unrecognized-form-feminine-indefinite-neuter-plural":"ofuscate","definite-error-unrecognized-form-masculine-neuter-singular":"ofuscatul","definite-error-unrecognized-form-feminine-singular":"ofuscata","definite-error-unrecognized-form-masculine-plural":"ofuscații","definite-error-unrecognized-form-feminine-neuter-plural":"ofuscatele"}},{"word":"ogam","pos":"noun","definitions":["Ogham"],"forms":{"plural":"ogamuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ogam","accusative-definite-nominative-singular":"ogamul","accusative-indefinite-nominative-plural":"ogamuri","accusative-definite-nominative-plural":"ogamurile","dative-genitive-indefinite-singular":"ogam","dative-definite-genitive-singular":"ogamului","dative-genitive-indefinite-plural":"ogamuri","dative-definite-genitive-plural":"ogamurilor","singular-vocative":"ogamule","plural-vocative":"ogamurilor"}},{"word":"ogar","pos":"noun","definitions":["greyhound; hunting dog"],"forms":{"plural":"ogari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ogar","accusative-definite-nominative-singular":"ogarul","accusative-indefinite-nominative-plural":"ogari","accusative-definite-nominative-plural":"ogarii","dative-genitive-indefinite-singular":"ogar","dative-definite-genitive-singular":"ogarului","dative-genitive-indefinite-plural":"ogari","dative-definite-genitive-plural":"ogarilor","singular-vocative":"ogarule","plural-vocative":"ogarilor"}},{"word":"ogar afgan","pos":"noun","definitions":["Afghan Hound"],"forms":{"plural":"ogari afgani"}},{"word":"ogar de Ibiza","pos":"noun","definitions":["Ibizan Hound"],"forms":{"plural":"ogari de Ibiza"}},{"word":"ogăratic","pos":"adj","definitions":["skinny"],"forms":{"feminine-singular":"ogăratică","masculine-plural":"ogăratici","feminine-neuter-plural":"ogăratice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ogăratic","error-unrecognized-form-feminine-indefinite-singular":"ogăratică","error-unrecognized-form-indefinite-masculine-plural":"ogăratici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ogăratice","definite-error-unrecognized-form-masculine-neuter-singular":"ogăraticul","definite-error-unrecognized-form-feminine-singular":"ogăratica","definite-error-unrecognized-form-masculine-plural":"ogăraticii","definite-error-unrecognized-form-feminine-neuter-plural":"ogăraticele"}},{"word":"ogărătoare","pos":"noun","definitions":["hoe"],"forms":{"plural":"ogărători","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ogărătoare","accusative-definite-nominative-singular":"ogărătoarea","accusative-indefinite-nominative-plural":"ogărători","accusative-definite-nominative-plural":"ogărătorile","dative-genitive-indefinite-singular":"ogărători","dative-definite-genitive-singular":"ogărătorii","dative-genitive-indefinite-plural":"ogărători","dative-definite-genitive-plural":"ogărătorilor","singular-vocative":"ogărătoare","plural-vocative":"ogărătorilor"}},{"word":"ogarcă","pos":"noun","definitions":["female hound"],"forms":{"plural":"ogarce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ogarcă","accusative-definite-nominative-singular":"ogarca","accusative-indefinite-nominative-plural":"ogarce","accusative-definite-nominative-plural":"ogarcele","dative-genitive-indefinite-singular":"ogarce","dative-definite-genitive-singular":"ogarcei","dative-genitive-indefinite-plural":"ogarce","dative-definite-genitive-plural":"ogarcelor","singular-vocative":"ogarcă","plural-vocative":"ogarcelor"}},{"word":"ogârcău","pos":"noun","definitions":["cucumber"],"forms":{"plural":"ogârcăi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ogârcău","accusative-definite-nominative-singular":"ogârcăuul","accusative-indefinite-nominative-plural":"ogârcăi","accusative-definite-nominative-plural":"ogârcăii","dative-genitive-indefinite-singular":"ogârcău","dative-definite-genitive-singular":"ogârcăuului","dative-genitive-indefinite-plural":"ogârcăi","dative-definite-genitive-plural":"ogârcăilor","singular-vocative":"ogârcăuule","plural-vocative":"ogârcăilor"}},{"word":"ogărcuță","pos":"noun","definitions":["diminutive of ogarcă"],"forms":{"plural":"ogărcuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ogărcuță","accusative-definite-nominative-singular":"ogărcuța","accusative-indefinite-nominative-plural":"ogărcuțe","accusative-definite-nominative-plural":"ogărcuțele","dative-genitive-indefinite-singular":"ogărcuțe","dative-definite-genitive-singular":"ogărcuței","dative-genitive-indefinite-plural":"ogărcuțe","dative-definite-genitive-plural":"ogărcuțelor","singular-vocative":"ogărcuță","plural-vocative":"ogărcuțelor"}},{"word":"ogărel","pos":"noun","definitions":["diminutive of ogar"],"forms":{"plural":"ogărei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ogărel","accusative-definite-nominative-singular":"ogărelul","accusative-indefinite-nominative-plural":"ogărei","accusative-definite-nominative-plural":"ogăreii","dative-genitive-indefinite-singular":"ogărel","dative-definite-genitive-singular":"ogărelului","dative-genitive-indefinite-plural":"ogărei","dative-definite-genitive-plural":"ogăreilor","singular-vocative":"ogărelule","plural-vocative":"ogăreilor"}},{"word":"ogărește","pos":"adv","definitions":["like a greyhound"]},{"word":"ogari","pos":"noun","definitions":["indefinite nominative/accusative/genitive/dative plural of ogar"]},{"word":"ogarii","pos":"noun","definitions":["definite nominative/accusative plural of ogar"]},{"word":"ogarilor","pos":"noun","definitions":["definite genitive/dative plural of ogar"]},{"word":"ogărime","pos":"noun","definitions":["collective noun for greyhounds"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"ogărime","accusative-definite-nominative":"ogărimea","dative-genitive-indefinite":"ogărime","dative-definite-genitive":"ogărimei","vocative":"ogărime"}},{"word":"ogârjit","pos":"adj","definitions":["skinny, stunted, emaciated"],"forms":{"feminine-singular":"ogârjită","masculine-plural":"ogârjiți","feminine-neuter-plural":"ogârjite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ogârjit","error-unrecognized-form-feminine-indefinite-singular":"ogârjită","error-unrecognized-form-indefinite-masculine-plural":"ogârjiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ogârjite","definite-error-unrecognized-form-masculine-neuter-singular":"ogârjitul","definite-error-unrecognized-form-feminine-singular":"ogârjita","definite-error-unrecognized-form-masculine-plural":"ogârjiții","definite-error-unrecognized-form-feminine-neuter-plural":"ogârjitele"}},{"word":"ogârjit","pos":"verb","definitions":["past participle of ogârji"],"forms":{"participle-past":"of ogârji"}},{"word":"ogarnic","pos":"adj","definitions":["houndish"],"forms":{"feminine-singular":"ogarnică","masculine-plural":"ogarnici","feminine-neuter-plural":"ogarnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ogarnic","error-unrecognized-form-feminine-indefinite-singular":"ogarnică","error-unrecognized-form-indefinite-masculine-plural":"ogarnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ogarnice","definite-error-unrecognized-form-masculine-neuter-singular":"ogarnicul","definite-error-unrecognized-form-feminine-singular":"ogarnica","definite-error-unrecognized-form-masculine-plural":"ogarnicii","definite-error-unrecognized-form-feminine-neuter-plural":"ogarnicele"}},{"word":"Ogaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Ogaru"}},{"word":"ogarul","pos":"noun","definitions":["definite nominative/accusative singular of ogar"]},{"word":"ogarului","pos":"noun","definitions":["definite genitive/dative singular of ogar"]},{"word":"ogăruș","pos":"noun","definitions":["diminutive of ogar"],"forms":{"plural":"ogăruși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ogăruș","accusative-definite-nominative-singular":"ogărușul","accusative-indefinite-nominative-plural":"ogăruși","accusative-definite-nominative-plural":"ogărușii","dative-genitive-indefinite-singular":"ogăruș","dative-definite-genitive-singular":"ogărușului","dative-genitive-indefinite-plural":"ogăruși","dative-definite-genitive-plural":"ogărușilor","singular-vocative":"ogărușule","plural-vocative":"ogărușilor"}},{"word":"ogăruț","pos":"noun","definitions":["diminutive of ogar"],"forms":{"plural":"ogăruți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ogăruț","accusative-definite-nominative-singular":"ogăruțul","accusative-indefinite-nominative-plural":"ogăruți","accusative-definite-nominative-plural":"ogăruții","dative-genitive-indefinite-singular":"ogăruț","dative-definite-genitive-singular":"ogăruțului","dative-genitive-indefinite-plural":"ogăruți","dative-definite-genitive-plural":"ogăruților","singular-vocative":"ogăruțule","plural-vocative":"ogăruților"}},{"word":"Ogașu Alunilor","pos":"name","definitions":["a river in Caraș-Severin County, Romania, tributary to the Nera"],"gender":"m"},{"word":"Ogașu Babei","pos":"name","definitions":["a river in Caraș-Severin County, Romania, tributary to the Miniș","a river in Caraș-Severin County, Romania, tributary to the Nera"],"gender":"m"},{"word":"Ogașu Bologhii","pos":"name","definitions":["a river in Caraș-Severin County, Romania, tributary to the Poneasca"],"gender":"m"},{"word":"Ogașu cu Raci","pos":"name","definitions":["a river in Caraș-Severin County, Romania, tributary to the Gusec"],"gender":"m"},{"word":"Ogașu Greci","pos":"name","definitions":["a river in Caraș-Severin County, Romania, tributary to the Valea Mare"],"gender":"m"},{"word":"Ogașu Hobiței","pos":"name","definitions":["a river in Gorj County, Romania, tributary to the Bistrița"],"gender":"m"},{"word":"Ogașu lui Roșeț","pos":"name","definitions":["a river in Caraș-Severin County, Romania, tributary to the Cerna"],"gender":"m"},{"word":"Ogașu Mare","pos":"name","definitions":["a river in Caraș-Severin County, Romania, tributary to the Miniș","a river in Caraș-Severin County, Romania, tributary to the Nera"],"gender":"m"},{"word":"Ogașu Pepinierii","pos":"name","definitions":["a river in Hunedoara County, Romania, tributary to the Sohodol"],"gender":"m"},{"word":"Ogașu Pietros","pos":"name","definitions":["a river in Caraș-Severin County, Romania, tributary to the Cremenița"],"gender":"m"},{"word":"Ogașu Podului","pos":"name","definitions":["a village in Sichevița, Caraș-Severin County, Romania"],"gender":"m"},{"word":"Ogașu Porcariului","pos":"name","definitions":["a river in Caraș-Severin County, Romania, tributary to the Nera"],"gender":"m"},{"word":"Ogașu Porcului","pos":"name","definitions":["a river in Caraș-Severin County, Romania, tributary to the Nera"],"gender":"m"},{"word":"Ogașu Rău","pos":"name","definitions":["a river in Caraș-Severin County, Romania, tributary to the Valea Mare"],"gender":"m"},{"word":"Ogașu Rogozului","pos":"name","definitions":["a river in Caraș-Severin County, Romania, tributary to the Nera"],"gender":"m"},{"word":"Ogașu Tătarului","pos":"name","definitions":["a river in Caraș-Severin County, Romania, tributary to the Ogașu Baranului"],"gender":"m"},{"word":"Ogașu Tisa","pos":"name","definitions":["a river in Caraș-Severin County, Romania, tributary to the Valea Mare"],"gender":"f"},{"word":"Ogașu Ursului","pos":"name","definitions":["a river in Caraș-Severin County, Romania, tributary to the Cerna"],"gender":"m"},{"word":"Ogașu Vulpii","pos":"name","definitions":["a river in Caraș-Severin County, Romania, tributary to the Cremenița"],"gender":"m"},{"word":"ogeac","pos":"noun","definitions":["chimney","name of a military unit and the place where it stayed"],"forms":{"plural":"ogeacuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ogeac","accusative-definite-nominative-singular":"ogeacul","accusative-indefinite-nominative-plural":"ogeacuri","accusative-definite-nominative-plural":"ogeacurile","dative-genitive-indefinite-singular":"ogeac","dative-definite-genitive-singular":"ogeacului","dative-genitive-indefinite-plural":"ogeacuri","dative-definite-genitive-plural":"ogeacurilor","singular-vocative":"ogeacule","plural-vocative":"ogeacurilor","alternative":"hogeac"}},{"word":"ogeacliu","pos":"noun","definitions":["an Ottoman soldier"],"forms":{"plural":"ogeaclii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ogeacliu","accusative-definite-nominative-singular":"ogeacliuul","accusative-indefinite-nominative-plural":"ogeaclii","accusative-definite-nominative-plural":"ogeacliii","dative-genitive-indefinite-singular":"ogeacliu","dative-definite-genitive-singular":"ogeacliuului","dative-genitive-indefinite-plural":"ogeaclii","dative-definite-genitive-plural":"ogeacliilor","singular-vocative":"ogeacliuule","plural-vocative":"ogeacliilor"}},{"word":"Ogești","pos":"name","definitions":["a village in Sâmbăta, Bihor County, Romania"],"gender":"m"},{"word":"ogheal","pos":"noun","definitions":["coverlet, quilt"],"forms":{"plural":"oghealuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ogheal","accusative-definite-nominative-singular":"oghealul","accusative-indefinite-nominative-plural":"oghealuri","accusative-definite-nominative-plural":"oghealurile","dative-genitive-indefinite-singular":"ogheal","dative-definite-genitive-singular":"oghealului","dative-genitive-indefinite-plural":"oghealuri","dative-definite-genitive-plural":"oghealurilor","singular-vocative":"oghealule","plural-vocative":"oghealurilor"}},{"word":"oghelaș","pos":"noun","definitions":["diminutive of ogheal"],"forms":{"plural":"oghelașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oghelaș","accusative-definite-nominative-singular":"oghelașul","accusative-indefinite-nominative-plural":"oghelașe","accusative-definite-nominative-plural":"oghelașele","dative-genitive-indefinite-singular":"oghelaș","dative-definite-genitive-singular":"oghelașului","dative-genitive-indefinite-plural":"oghelașe","dative-definite-genitive-plural":"oghelașelor","singular-vocative":"oghelașule","plural-vocative":"oghelașelor"}},{"word":"ogivă","pos":"noun","definitions":["ogive"],"forms":{"plural":"ogive","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ogivă","accusative-definite-nominative-singular":"ogiva","accusative-indefinite-nominative-plural":"ogive","accusative-definite-nominative-plural":"ogivele","dative-genitive-indefinite-singular":"ogive","dative-definite-genitive-singular":"ogivei","dative-genitive-indefinite-plural":"ogive","dative-definite-genitive-plural":"ogivelor","singular-vocative":"ogivă","plural-vocative":"ogivelor"}},{"word":"ogival","pos":"adj","definitions":["ogival"],"forms":{"feminine-singular":"ogivală","masculine-plural":"ogivali","feminine-neuter-plural":"ogivale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ogival","error-unrecognized-form-feminine-indefinite-singular":"ogivală","error-unrecognized-form-indefinite-masculine-plural":"ogivali","error-unrecognized-form-feminine-indefinite-neuter-plural":"ogivale","definite-error-unrecognized-form-masculine-neuter-singular":"ogivalul","definite-error-unrecognized-form-feminine-singular":"ogivala","definite-error-unrecognized-form-masculine-plural":"ogivalii","definite-error-unrecognized-form-feminine-neuter-plural":"ogivalele"}},{"word":"oglașenic","pos":"noun","definitions":["catechumen"],"forms":{"plural":"oglașenici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oglașenic","accusative-definite-nominative-singular":"oglașenicul","accusative-indefinite-nominative-plural":"oglașenici","accusative-definite-nominative-plural":"oglașenicii","dative-genitive-indefinite-singular":"oglașenic","dative-definite-genitive-singular":"oglașenicului","dative-genitive-indefinite-plural":"oglașenici","dative-definite-genitive-plural":"oglașenicilor","singular-vocative":"oglașenicule","plural-vocative":"oglașenicilor"}},{"word":"oglașenie","pos":"noun","definitions":["catechization"],"forms":{"plural":"oglașenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oglașenie","accusative-definite-nominative-singular":"oglașenia","accusative-indefinite-nominative-plural":"oglașenii","accusative-definite-nominative-plural":"oglașeniile","dative-genitive-indefinite-singular":"oglașenii","dative-definite-genitive-singular":"oglașeniei","dative-genitive-indefinite-plural":"oglașenii","dative-definite-genitive-plural":"oglașeniilor","singular-vocative":"oglașenie","plural-vocative":"oglașeniilor"}},{"word":"oglinda","pos":"verb","definitions":["alternative form of oglindi"],"forms":{"canonical":"a oglinda 1st conjugation","present-singular-third-person":"oglindează","participle-past":"oglindat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a oglinda","gerund":"oglindând","first-person-indicative-present-singular":"oglindez","indicative-present-second-person-singular":"oglindezi","indicative-present-singular-third-person":"oglindează","first-person-indicative-plural-present":"oglindăm","indicative-plural-present-second-person":"oglindați","indicative-plural-present-third-person":"oglindează","first-person-imperfect-indicative-singular":"oglindam","imperfect-indicative-second-person-singular":"oglindai","imperfect-indicative-singular-third-person":"oglinda","first-person-imperfect-indicative-plural":"oglindam","imperfect-indicative-plural-second-person":"oglindați","imperfect-indicative-plural-third-person":"oglindau","first-person-indicative-perfect-singular":"oglindai","indicative-perfect-second-person-singular":"oglindași","indicative-perfect-singular-third-person":"oglindă","first-person-indicative-perfect-plural":"oglindarăm","indicative-perfect-plural-second-person":"oglindarăți","indicative-perfect-plural-third-person":"oglindară","first-person-indicative-pluperfect-singular":"oglindasem","indicative-pluperfect-second-person-singular":"oglindaseși","indicative-pluperfect-singular-third-person":"oglindase","first-person-indicative-pluperfect-plural":"oglindaserăm","indicative-pluperfect-plural-second-person":"oglindaserăți","indicative-pluperfect-plural-third-person":"oglindaseră","first-person-present-singular-subjunctive":"să oglindez","present-second-person-singular-subjunctive":"să oglindezi","present-singular-subjunctive-third-person":"să oglindeze","first-person-plural-present-subjunctive":"să oglindăm","plural-present-second-person-subjunctive":"să oglindați","plural-present-subjunctive-third-person":"să oglindeze","imperative-second-person-singular":"oglindează","imperative-plural-second-person":"oglindați","imperative-negative-second-person-singular":"nu oglinda","imperative-negative-plural-second-person":"nu oglindați"}},{"word":"Oglindă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Oglindă"}},{"word":"oglindă","pos":"noun","definitions":["mirror"],"pronunciation":"/oˈɡlin.də/","forms":{"plural":"oglinzi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"oglindă","accusative-definite-nominative-singular":"oglinda","accusative-indefinite-nominative-plural":"oglinzi","accusative-definite-nominative-plural":"oglinzile","dative-genitive-indefinite-singular":"oglinzi","dative-definite-genitive-singular":"oglinzii","dative-genitive-indefinite-plural":"oglinzi","dative-definite-genitive-plural":"oglinzilor","singular-vocative":"oglindă","plural-vocative":"oglinzilor"}},{"word":"oglindar","pos":"noun","definitions":["mirror maker"],"forms":{"plural":"oglindari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oglindar","accusative-definite-nominative-singular":"oglindarul","accusative-indefinite-nominative-plural":"oglindari","accusative-definite-nominative-plural":"oglindarii","dative-genitive-indefinite-singular":"oglindar","dative-definite-genitive-singular":"oglindarului","dative-genitive-indefinite-plural":"oglindari","dative-definite-genitive-plural":"oglindarilor","singular-vocative":"oglindarule","plural-vocative":"oglindarilor"}},{"word":"oglindărie","pos":"noun","definitions":["mirror workshop"],"forms":{"plural":"oglindării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oglindărie","accusative-definite-nominative-singular":"oglindăria","accusative-indefinite-nominative-plural":"oglindării","accusative-definite-nominative-plural":"oglindăriile","dative-genitive-indefinite-singular":"oglindării","dative-definite-genitive-singular":"oglindăriei","dative-genitive-indefinite-plural":"oglindării","dative-definite-genitive-plural":"oglindăriilor","singular-vocative":"oglindărie","plural-vocative":"oglindăriilor"}},{"word":"Oglindaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Oglindaru"}},{"word":"oglindeală","pos":"noun","definitions":["examination in detail"],"forms":{"plural":"oglindeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oglindeală","accusative-definite-nominative-singular":"oglindeala","accusative-indefinite-nominative-plural":"oglindele","accusative-definite-nominative-plural":"oglindelele","dative-genitive-indefinite-singular":"oglindele","dative-definite-genitive-singular":"oglindelei","dative-genitive-indefinite-plural":"oglindele","dative-definite-genitive-plural":"oglindelelor","singular-vocative":"oglindeală","plural-vocative":"oglindelelor"}},{"word":"oglindi","pos":"verb","definitions":["to reflect","to mirror","to depict"],"pronunciation":"[o.ɡlinˈdi]","forms":{"canonical":"a oglindi 4th conjugation","present-singular-third-person":"oglindește","participle-past":"oglindit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a oglindi","gerund":"oglindind","first-person-indicative-present-singular":"oglindesc","indicative-present-second-person-singular":"oglindești","indicative-present-singular-third-person":"oglindește","first-person-indicative-plural-present":"oglindim","indicative-plural-present-second-person":"oglindiți","indicative-plural-present-third-person":"oglindesc","first-person-imperfect-indicative-singular":"oglindeam","imperfect-indicative-second-person-singular":"oglindeai","imperfect-indicative-singular-third-person":"oglindea","first-person-imperfect-indicative-plural":"oglindeam","imperfect-indicative-plural-second-person":"oglindeați","imperfect-indicative-plural-third-person":"oglindeau","first-person-indicative-perfect-singular":"oglindii","indicative-perfect-second-person-singular":"oglindiși","indicative-perfect-singular-third-person":"oglindi","first-person-indicative-perfect-plural":"oglindirăm","indicative-perfect-plural-second-person":"oglindirăți","indicative-perfect-plural-third-person":"oglindiră","first-person-indicative-pluperfect-singular":"oglindisem","indicative-pluperfect-second-person-singular":"oglindiseși","indicative-pluperfect-singular-third-person":"oglindise","first-person-indicative-pluperfect-plural":"oglindiserăm","indicative-pluperfect-plural-second-person":"oglindiserăți","indicative-pluperfect-plural-third-person":"oglindiseră","first-person-present-singular-subjunctive":"să oglindesc","present-second-person-singular-subjunctive":"să oglindești","present-singular-subjunctive-third-person":"să oglindească","first-person-plural-present-subjunctive":"să oglindim","plural-present-second-person-subjunctive":"să oglindiți","plural-present-subjunctive-third-person":"să oglindească","imperative-second-person-singular":"oglindește","imperative-plural-second-person":"oglindiți","imperative-negative-second-person-singular":"nu oglindi","imperative-negative-plural-second-person":"nu oglindiți"}},{"word":"oglindioară","pos":"noun","definitions":["obsolete form of oglinjoară"],"forms":{"plural":"oglindioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oglindioară","accusative-definite-nominative-singular":"oglindioara","accusative-indefinite-nominative-plural":"oglindioare","accusative-definite-nominative-plural":"oglindioarele","dative-genitive-indefinite-singular":"oglindioare","dative-definite-genitive-singular":"oglindioarei","dative-genitive-indefinite-plural":"oglindioare","dative-definite-genitive-plural":"oglindioarelor","singular-vocative":"oglindioară","plural-vocative":"oglindioarelor"}},{"word":"oglindire","pos":"noun","definitions":["mirroring","reflection"],"forms":{"plural":"oglindiri"}},{"word":"oglinditor","pos":"adj","definitions":["mirrorlike"],"forms":{"feminine-singular":"oglinditoare","masculine-plural":"oglinditori","feminine-neuter-plural":"oglinditoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oglinditor","error-unrecognized-form-feminine-indefinite-singular":"oglinditoare","error-unrecognized-form-indefinite-masculine-plural":"oglinditori","error-unrecognized-form-feminine-indefinite-neuter-plural":"oglinditoare","definite-error-unrecognized-form-masculine-neuter-singular":"oglinditorul","definite-error-unrecognized-form-feminine-singular":"oglinditoarea","definite-error-unrecognized-form-masculine-plural":"oglinditorii","definite-error-unrecognized-form-feminine-neuter-plural":"oglinditoarele"}},{"word":"Oglindoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Oglindoiu"}},{"word":"oglindos","pos":"adj","definitions":["mirrorlike"],"forms":{"feminine-singular":"oglindoasă","masculine-plural":"oglindoși","feminine-neuter-plural":"oglindoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oglindos","error-unrecognized-form-feminine-indefinite-singular":"oglindoasă","error-unrecognized-form-indefinite-masculine-plural":"oglindoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"oglindoase","definite-error-unrecognized-form-masculine-neuter-singular":"oglindosul","definite-error-unrecognized-form-feminine-singular":"oglindoasa","definite-error-unrecognized-form-masculine-plural":"oglindoșii","definite-error-unrecognized-form-feminine-neuter-plural":"oglindoasele"}},{"word":"oglinduță","pos":"noun","definitions":["diminutive of oglindă; small mirror"],"forms":{"plural":"oglinduțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oglinduță","accusative-definite-nominative-singular":"oglinduța","accusative-indefinite-nominative-plural":"oglinduțe","accusative-definite-nominative-plural":"oglinduțele","dative-genitive-indefinite-singular":"oglinduțe","dative-definite-genitive-singular":"oglinduței","dative-genitive-indefinite-plural":"oglinduțe","dative-definite-genitive-plural":"oglinduțelor","singular-vocative":"oglinduță","plural-vocative":"oglinduțelor"}},{"word":"oglingioară","pos":"noun","definitions":["alternative form of oglinjoară"],"forms":{"plural":"oglingioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oglingioară","accusative-definite-nominative-singular":"oglingioara","accusative-indefinite-nominative-plural":"oglingioare","accusative-definite-nominative-plural":"oglingioarele","dative-genitive-indefinite-singular":"oglingioare","dative-definite-genitive-singular":"oglingioarei","dative-genitive-indefinite-plural":"oglingioare","dative-definite-genitive-plural":"oglingioarelor","singular-vocative":"oglingioară","plural-vocative":"oglingioarelor"}},{"word":"oglinjoară","pos":"noun","definitions":["diminutive of oglindă; small mirror"],"pronunciation":"/o.ɡlinˈʒo̯a.rə/","forms":{"plural":"oglinjoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oglinjoară","accusative-definite-nominative-singular":"oglinjoara","accusative-indefinite-nominative-plural":"oglinjoare","accusative-definite-nominative-plural":"oglinjoarele","dative-genitive-indefinite-singular":"oglinjoare","dative-definite-genitive-singular":"oglinjoarei","dative-genitive-indefinite-plural":"oglinjoare","dative-definite-genitive-plural":"oglinjoarelor","singular-vocative":"oglinjoară","plural-vocative":"oglinjoarelor"}},{"word":"Oglinzi","pos":"name","definitions":["a village in Răucești, Neamț County, Romania"],"gender":"m"},{"word":"ogniță","pos":"noun","definitions":["fever"],"forms":{"plural":"ognițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ogniță","accusative-definite-nominative-singular":"ognița","accusative-indefinite-nominative-plural":"ognițe","accusative-definite-nominative-plural":"ognițele","dative-genitive-indefinite-singular":"ognițe","dative-definite-genitive-singular":"ogniței","dative-genitive-indefinite-plural":"ognițe","dative-definite-genitive-plural":"ognițelor","singular-vocative":"ogniță","plural-vocative":"ognițelor"}},{"word":"ogoare","pos":"noun","definitions":["indefinite nominative/accusative/genitive/dative plural of ogor"]},{"word":"ogodi","pos":"verb","definitions":["to be liked"],"forms":{"canonical":"a ogodi 4th conjugation","present-singular-third-person":"ogodește","participle-past":"ogodit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ogodi","gerund":"ogodind","first-person-indicative-present-singular":"ogodesc","indicative-present-second-person-singular":"ogodești","indicative-present-singular-third-person":"ogodește","first-person-indicative-plural-present":"ogodim","indicative-plural-present-second-person":"ogodiți","indicative-plural-present-third-person":"ogodesc","first-person-imperfect-indicative-singular":"ogodeam","imperfect-indicative-second-person-singular":"ogodeai","imperfect-indicative-singular-third-person":"ogodea","first-person-imperfect-indicative-plural":"ogodeam","imperfect-indicative-plural-second-person":"ogodeați","imperfect-indicative-plural-third-person":"ogodeau","first-person-indicative-perfect-singular":"ogodii","indicative-perfect-second-person-singular":"ogodiși","indicative-perfect-singular-third-person":"ogodi","first-person-indicative-perfect-plural":"ogodirăm","indicative-perfect-plural-second-person":"ogodirăți","indicative-perfect-plural-third-person":"ogodiră","first-person-indicative-pluperfect-singular":"ogodisem","indicative-pluperfect-second-person-singular":"ogodiseși","indicative-pluperfect-singular-third-person":"ogodise","first-person-indicative-pluperfect-plural":"ogodiserăm","indicative-pluperfect-plural-second-person":"ogodiserăți","indicative-pluperfect-plural-third-person":"ogodiseră","first-person-present-singular-subjunctive":"să ogodesc","present-second-person-singular-subjunctive":"să ogodești","present-singular-subjunctive-third-person":"să ogodească","first-person-plural-present-subjunctive":"să ogodim","plural-present-second-person-subjunctive":"să ogodiți","plural-present-subjunctive-third-person":"să ogodească","imperative-second-person-singular":"ogodește","imperative-plural-second-person":"ogodiți","imperative-negative-second-person-singular":"nu ogodi","imperative-negative-plural-second-person":"nu ogodiți"}},{"word":"ogodință","pos":"noun","definitions":["pleasure"],"forms":{"plural":"ogodințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ogodință","accusative-definite-nominative-singular":"ogodința","accusative-indefinite-nominative-plural":"ogodințe","accusative-definite-nominative-plural":"ogodințele","dative-genitive-indefinite-singular":"ogodințe","dative-definite-genitive-singular":"ogodinței","dative-genitive-indefinite-plural":"ogodințe","dative-definite-genitive-plural":"ogodințelor","singular-vocative":"ogodință","plural-vocative":"ogodințelor"}},{"word":"ogodnă","pos":"noun","definitions":["pleasure"],"forms":{"plural":"ogodne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ogodnă","accusative-definite-nominative-singular":"ogodna","accusative-indefinite-nominative-plural":"ogodne","accusative-definite-nominative-plural":"ogodnele","dative-genitive-indefinite-singular":"ogodne","dative-definite-genitive-singular":"ogodnei","dative-genitive-indefinite-plural":"ogodne","dative-definite-genitive-plural":"ogodnelor","singular-vocative":"ogodnă","plural-vocative":"ogodnelor"}},{"word":"ogodniță","pos":"noun","definitions":["pleasure"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"ogodniță","accusative-definite-nominative":"ogodnița","dative-genitive-indefinite":"ogodnițe","dative-definite-genitive":"ogodniței","vocative":"ogodniță"}},{"word":"ogoia","pos":"verb","definitions":["alternative form of ogoi"],"forms":{"canonical":"a ogoia 1st conjugation","present-singular-third-person":"ogoaie","participle-past":"ogoiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a ogoia","gerund":"ogoind","first-person-indicative-present-singular":"ogoi","indicative-present-second-person-singular":"ogoi","indicative-present-singular-third-person":"ogoaie","first-person-indicative-plural-present":"ogoiem","indicative-plural-present-second-person":"ogoiați","indicative-plural-present-third-person":"ogoaie","first-person-imperfect-indicative-singular":"ogoiam","imperfect-indicative-second-person-singular":"ogoiai","imperfect-indicative-singular-third-person":"ogoia","first-person-imperfect-indicative-plural":"ogoiam","imperfect-indicative-plural-second-person":"ogoiați","imperfect-indicative-plural-third-person":"ogoiau","first-person-indicative-perfect-singular":"ogoiai","indicative-perfect-second-person-singular":"ogoiași","indicative-perfect-singular-third-person":"ogoie","first-person-indicative-perfect-plural":"ogoiarăm","indicative-perfect-plural-second-person":"ogoiarăți","indicative-perfect-plural-third-person":"ogoiară","first-person-indicative-pluperfect-singular":"ogoiasem","indicative-pluperfect-second-person-singular":"ogoiaseși","indicative-pluperfect-singular-third-person":"ogoiase","first-person-indicative-pluperfect-plural":"ogoiaserăm","indicative-pluperfect-plural-second-person":"ogoiaserăți","indicative-pluperfect-plural-third-person":"ogoiaseră","first-person-present-singular-subjunctive":"să ogoi","present-second-person-singular-subjunctive":"să ogoi","present-singular-subjunctive-third-person":"să ogoaie","first-person-plural-present-subjunctive":"să ogoiem","plural-present-second-person-subjunctive":"să ogoiați","plural-present-subjunctive-third-person":"să ogoaie","imperative-second-person-singular":"ogoaie","imperative-plural-second-person":"ogoiați","imperative-negative-second-person-singular":"nu ogoia","imperative-negative-plural-second-person":"nu ogoiați"}},{"word":"ogoiat","pos":"adj","definitions":["obsolete form of ogoit"],"forms":{"feminine-singular":"ogoiată","masculine-plural":"ogoiați","feminine-neuter-plural":"ogoiate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ogoiat","error-unrecognized-form-feminine-indefinite-singular":"ogoiată","error-unrecognized-form-indefinite-masculine-plural":"ogoiați","error-unrecognized-form-feminine-indefinite-neuter-plural":"ogoiate","definite-error-unrecognized-form-masculine-neuter-singular":"ogoiatul","definite-error-unrecognized-form-feminine-singular":"ogoiata","definite-error-unrecognized-form-masculine-plural":"ogoiații","definite-error-unrecognized-form-feminine-neuter-plural":"ogoiatele"}},{"word":"ogoire","pos":"noun","definitions":["soothing"],"forms":{"plural":"ogoiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ogoire","accusative-definite-nominative-singular":"ogoirea","accusative-indefinite-nominative-plural":"ogoiri","accusative-definite-nominative-plural":"ogoirile","dative-genitive-indefinite-singular":"ogoiri","dative-definite-genitive-singular":"ogoirii","dative-genitive-indefinite-plural":"ogoiri","dative-definite-genitive-plural":"ogoirilor","singular-vocative":"ogoire","plural-vocative":"ogoirilor"}},{"word":"ogoit","pos":"adj","definitions":["soothed"],"forms":{"feminine-singular":"ogoită","masculine-plural":"ogoiți","feminine-neuter-plural":"ogoite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ogoit","error-unrecognized-form-feminine-indefinite-singular":"ogoită","error-unrecognized-form-indefinite-masculine-plural":"ogoiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ogoite","definite-error-unrecognized-form-masculine-neuter-singular":"ogoitul","definite-error-unrecognized-form-feminine-singular":"ogoita","definite-error-unrecognized-form-masculine-plural":"ogoiții","definite-error-unrecognized-form-feminine-neuter-plural":"ogoitele"}},{"word":"ogoit","pos":"verb","definitions":["past participle of ogoi"],"forms":{"participle-past":"of ogoi"}},{"word":"Ogor","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ogor"}},{"word":"ogor","pos":"noun","definitions":["field","fallow (land)"],"forms":{"plural":"ogoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ogor","accusative-definite-nominative-singular":"ogorul","accusative-indefinite-nominative-plural":"ogoare","accusative-definite-nominative-plural":"ogoarele","dative-genitive-indefinite-singular":"ogor","dative-definite-genitive-singular":"ogorului","dative-genitive-indefinite-plural":"ogoare","dative-definite-genitive-plural":"ogoarelor","singular-vocative":"ogorule","plural-vocative":"ogoarelor"}},{"word":"ogoraș","pos":"noun","definitions":["diminutive of ogor; small field"],"forms":{"plural":"ogorașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ogoraș","accusative-definite-nominative-singular":"ogorașul","accusative-indefinite-nominative-plural":"ogorașe","accusative-definite-nominative-plural":"ogorașele","dative-genitive-indefinite-singular":"ogoraș","dative-definite-genitive-singular":"ogorașului","dative-genitive-indefinite-plural":"ogorașe","dative-definite-genitive-plural":"ogorașelor","singular-vocative":"ogorașule","plural-vocative":"ogorașelor"}},{"word":"ogorâște","pos":"noun","definitions":["cultivated field"],"forms":{"plural":"ogorâști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ogorâște","accusative-definite-nominative-singular":"ogorâștea","accusative-indefinite-nominative-plural":"ogorâști","accusative-definite-nominative-plural":"ogorâștile","dative-genitive-indefinite-singular":"ogorâști","dative-definite-genitive-singular":"ogorâștii","dative-genitive-indefinite-plural":"ogorâști","dative-definite-genitive-plural":"ogorâștilor","singular-vocative":"ogorâște","plural-vocative":"ogorâștilor"}},{"word":"ogorî","pos":"verb","definitions":["to plough"],"forms":{"canonical":"a ogorî 4th conjugation","present-singular-third-person":"ogorăște","participle-past":"ogorît","table-tags":"conjugation-4","inflection-template":"ro-conj-î-ăsc","infinitive":"a ogorî","gerund":"ogorând","first-person-indicative-present-singular":"ogorăsc","indicative-present-second-person-singular":"ogorăști","indicative-present-singular-third-person":"ogorăște","first-person-indicative-plural-present":"ogorâm","indicative-plural-present-second-person":"ogorâți","indicative-plural-present-third-person":"ogorăsc","first-person-imperfect-indicative-singular":"ogoram","imperfect-indicative-second-person-singular":"ogorai","imperfect-indicative-singular-third-person":"ogora","first-person-imperfect-indicative-plural":"ogoram","imperfect-indicative-plural-second-person":"ogorați","imperfect-indicative-plural-third-person":"ogorau","first-person-indicative-perfect-singular":"ogorâi","indicative-perfect-second-person-singular":"ogorâși","indicative-perfect-singular-third-person":"ogorî","first-person-indicative-perfect-plural":"ogorârăm","indicative-perfect-plural-second-person":"ogorârăți","indicative-perfect-plural-third-person":"ogorâră","first-person-indicative-pluperfect-singular":"ogorâsem","indicative-pluperfect-second-person-singular":"ogorâseși","indicative-pluperfect-singular-third-person":"ogorâse","first-person-indicative-pluperfect-plural":"ogorâserăm","indicative-pluperfect-plural-second-person":"ogorâserăți","indicative-pluperfect-plural-third-person":"ogorâseră","first-person-present-singular-subjunctive":"să ogorăsc","present-second-person-singular-subjunctive":"să ogorăști","present-singular-subjunctive-third-person":"să ogorască","first-person-plural-present-subjunctive":"să ogorâm","plural-present-second-person-subjunctive":"să ogorâți","plural-present-subjunctive-third-person":"să ogorască","imperative-second-person-singular":"ogorăște","imperative-plural-second-person":"ogorâți","imperative-negative-second-person-singular":"nu ogorî","imperative-negative-plural-second-person":"nu ogorâți"}},{"word":"ogorit","pos":"noun","definitions":["alternative form of ogorât"],"forms":{"plural":"ogorituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ogorit","accusative-definite-nominative-singular":"ogoritul","accusative-indefinite-nominative-plural":"ogorituri","accusative-definite-nominative-plural":"ogoriturile","dative-genitive-indefinite-singular":"ogorit","dative-definite-genitive-singular":"ogoritului","dative-genitive-indefinite-plural":"ogorituri","dative-definite-genitive-plural":"ogoriturilor","singular-vocative":"ogoritule","plural-vocative":"ogoriturilor"}},{"word":"Ogoru","pos":"name","definitions":["a village in Dor Mărunt, Călărași County, Romania"],"gender":"m"},{"word":"ogorul","pos":"noun","definitions":["definite nominative/accusative singular of ogor"]},{"word":"Ogra","pos":"name","definitions":["a commune of Mureș County, Romania","a village in Ogra, Mureș County, Romania"],"gender":"f"},{"word":"Ograda","pos":"name","definitions":["a commune of Ialomița County, Romania","a village in Ograda, Ialomița County, Romania"],"gender":"f"},{"word":"ograda","pos":"noun","definitions":["definite nominative/accusative singular of ogradă"]},{"word":"Ogradă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ogradă"}},{"word":"ogradă","pos":"noun","definitions":["yard","orchard"],"forms":{"plural":"ogrăzi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ogradă","accusative-definite-nominative-singular":"ograda","accusative-indefinite-nominative-plural":"ogrăzi","accusative-definite-nominative-plural":"ogrăzile","dative-genitive-indefinite-singular":"ogrăzi","dative-definite-genitive-singular":"ogrăzii","dative-genitive-indefinite-plural":"ogrăzi","dative-definite-genitive-plural":"ogrăzilor","singular-vocative":"ogradă","plural-vocative":"ogrăzilor"}},{"word":"ogrădaș","pos":"noun","definitions":["servant"],"forms":{"plural":"ogrădași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ogrădaș","accusative-definite-nominative-singular":"ogrădașul","accusative-indefinite-nominative-plural":"ogrădași","accusative-definite-nominative-plural":"ogrădașii","dative-genitive-indefinite-singular":"ogrădaș","dative-definite-genitive-singular":"ogrădașului","dative-genitive-indefinite-plural":"ogrădași","dative-definite-genitive-plural":"ogrădașilor","singular-vocative":"ogrădașule","plural-vocative":"ogrădașilor"}},{"word":"ogrădean","pos":"noun","definitions":["servant"],"forms":{"plural":"ogrădeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ogrădean","accusative-definite-nominative-singular":"ogrădeanul","accusative-indefinite-nominative-plural":"ogrădeni","accusative-definite-nominative-plural":"ogrădenii","dative-genitive-indefinite-singular":"ogrădean","dative-definite-genitive-singular":"ogrădeanului","dative-genitive-indefinite-plural":"ogrădeni","dative-definite-genitive-plural":"ogrădenilor","singular-vocative":"ogrădeanule","plural-vocative":"ogrădenilor"}},{"word":"ogrăjoară","pos":"noun","definitions":["diminutive of ogradă; small yard"],"forms":{"plural":"ogrăjoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ogrăjoară","accusative-definite-nominative-singular":"ogrăjoara","accusative-indefinite-nominative-plural":"ogrăjoare","accusative-definite-nominative-plural":"ogrăjoarele","dative-genitive-indefinite-singular":"ogrăjoare","dative-definite-genitive-singular":"ogrăjoarei","dative-genitive-indefinite-plural":"ogrăjoare","dative-definite-genitive-plural":"ogrăjoarelor","singular-vocative":"ogrăjoară","plural-vocative":"ogrăjoarelor"}},{"word":"Ogrăzile","pos":"name","definitions":["a village in Merei, Buzău County, Romania"],"gender":"m"},{"word":"Ogrezeni","pos":"name","definitions":["a commune of Giurgiu County, Romania","a village in Ogrezeni, Giurgiu County, Romania"],"gender":"m"},{"word":"ogur","pos":"noun","definitions":["prediction, augury, luck"],"forms":{"plural":"ogururi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ogur","accusative-definite-nominative-singular":"ogurul","accusative-indefinite-nominative-plural":"ogururi","accusative-definite-nominative-plural":"ogururile","dative-genitive-indefinite-singular":"ogur","dative-definite-genitive-singular":"ogurului","dative-genitive-indefinite-plural":"ogururi","dative-definite-genitive-plural":"ogururilor","singular-vocative":"ogurule","plural-vocative":"ogururilor"}},{"word":"ogurliu","pos":"adj","definitions":["auspicious, bringing good luck"],"forms":{"feminine-singular":"ogurlie","plural":"ogurlii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ogurliu","error-unrecognized-form-feminine-indefinite-singular":"ogurlie","error-unrecognized-form-indefinite-masculine-plural":"ogurlii","error-unrecognized-form-feminine-indefinite-neuter-plural":"ogurlii","definite-error-unrecognized-form-masculine-neuter-singular":"ogurliul","definite-error-unrecognized-form-feminine-singular":"ogurlia","definite-error-unrecognized-form-masculine-plural":"ogurliii","definite-error-unrecognized-form-feminine-neuter-plural":"ogurliile"}},{"word":"oh","pos":"intj","definitions":["alternative form of of"]},{"word":"Ohaba","pos":"name","definitions":["a commune of Alba County, Romania","a village in Ohaba, Alba County, Romania","a village in Șinca, Brașov County, Romania","a village in Melinești, Dolj County, Romania","a village in Bălănești, Gorj County, Romania"],"gender":"f"},{"word":"ohaba","pos":"noun","definitions":["definite nominative/accusative singular of ohabă"]},{"word":"ohabă","pos":"noun","definitions":["tax-exempt hereditary property"],"forms":{"plural":"ohabe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ohabă","accusative-definite-nominative-singular":"ohaba","accusative-indefinite-nominative-plural":"ohabe","accusative-definite-nominative-plural":"ohabele","dative-genitive-indefinite-singular":"ohabe","dative-definite-genitive-singular":"ohabei","dative-genitive-indefinite-plural":"ohabe","dative-definite-genitive-plural":"ohabelor","singular-vocative":"ohabă","plural-vocative":"ohabelor"}},{"word":"Ohaba de sub Piatră","pos":"name","definitions":["a village in Sălașu de Sus, Hunedoara County, Romania"],"gender":"f"},{"word":"Ohaba Jiu","pos":"name","definitions":["a village in Bolboși, Gorj County, Romania"],"gender":"f"},{"word":"Ohaba Lungă","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Ohaba Lungă, Timiș County, Romania"],"gender":"f"},{"word":"Ohaba Română","pos":"name","definitions":["a village in Ohaba Lungă, Timiș County, Romania"],"gender":"f"},{"word":"Ohaba Streiului","pos":"name","definitions":["a village in Călan, Hunedoara County, Romania"],"gender":"f"},{"word":"Ohaba-Forgaci","pos":"name","definitions":["a village in Boldur, Timiș County, Romania"],"gender":"f"},{"word":"Ohaba-Mâtnic","pos":"name","definitions":["a village in Copăcele, Caraș-Severin County, Romania"],"gender":"f"},{"word":"Ohaba-Ponor","pos":"name","definitions":["a village in Pui, Hunedoara County, Romania"],"gender":"f"},{"word":"Ohaba-Sibișel","pos":"name","definitions":["a village in Râu de Mori, Hunedoara County, Romania"],"gender":"m"},{"word":"Ohabița","pos":"name","definitions":["a village in Păltiniș, Caraș-Severin County, Romania"],"gender":"f"},{"word":"ohabnic","pos":"adj","definitions":["tax-exempt hereditary property"],"forms":{"feminine-singular":"ohabnică","masculine-plural":"ohabnici","feminine-neuter-plural":"ohabnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ohabnic","error-unrecognized-form-feminine-indefinite-singular":"ohabnică","error-unrecognized-form-indefinite-masculine-plural":"ohabnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ohabnice","definite-error-unrecognized-form-masculine-neuter-singular":"ohabnicul","definite-error-unrecognized-form-feminine-singular":"ohabnica","definite-error-unrecognized-form-masculine-plural":"ohabnicii","definite-error-unrecognized-form-feminine-neuter-plural":"ohabnicele"}},{"word":"Ohanesian","pos":"name","definitions":["a surname from Armenian"],"gender":"m","forms":{"dative-genitive":"lui Ohanesian"}},{"word":"ohavnic","pos":"adj","definitions":["alternative form of ohabnic"],"forms":{"feminine-singular":"ohavnică","masculine-plural":"ohavnici","feminine-neuter-plural":"ohavnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ohavnic","error-unrecognized-form-feminine-indefinite-singular":"ohavnică","error-unrecognized-form-indefinite-masculine-plural":"ohavnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ohavnice","definite-error-unrecognized-form-masculine-neuter-singular":"ohavnicul","definite-error-unrecognized-form-feminine-singular":"ohavnica","definite-error-unrecognized-form-masculine-plural":"ohavnicii","definite-error-unrecognized-form-feminine-neuter-plural":"ohavnicele"}},{"word":"Ohio","pos":"name","definitions":["Ohio (a state of the United States)"],"gender":"n"},{"word":"ohlocrație","pos":"noun","definitions":["alternative form of oclocrație"],"forms":{"plural":"ohlocrații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ohlocrație","accusative-definite-nominative-singular":"ohlocrațiea","accusative-indefinite-nominative-plural":"ohlocrații","accusative-definite-nominative-plural":"ohlocrațiile","dative-genitive-indefinite-singular":"ohlocrații","dative-definite-genitive-singular":"ohlocrațiii","dative-genitive-indefinite-plural":"ohlocrații","dative-definite-genitive-plural":"ohlocrațiilor","singular-vocative":"ohlocrație","plural-vocative":"ohlocrațiilor"}},{"word":"ohm","pos":"noun","definitions":["ohm"],"forms":{"plural":"ohmi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ohm","accusative-definite-nominative-singular":"ohmul","accusative-indefinite-nominative-plural":"ohmi","accusative-definite-nominative-plural":"ohmii","dative-genitive-indefinite-singular":"ohm","dative-definite-genitive-singular":"ohmului","dative-genitive-indefinite-plural":"ohmi","dative-definite-genitive-plural":"ohmilor","singular-vocative":"ohmule","plural-vocative":"ohmilor"}},{"word":"ohmic","pos":"adj","definitions":["ohmic"],"forms":{"feminine-singular":"ohmică","masculine-plural":"ohmici","feminine-neuter-plural":"ohmice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ohmic","error-unrecognized-form-feminine-indefinite-singular":"ohmică","error-unrecognized-form-indefinite-masculine-plural":"ohmici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ohmice","definite-error-unrecognized-form-masculine-neuter-singular":"ohmicul","definite-error-unrecognized-form-feminine-singular":"ohmica","definite-error-unrecognized-form-masculine-plural":"ohmicii","definite-error-unrecognized-form-feminine-neuter-plural":"ohmicele"}},{"word":"ohmmetru","pos":"noun","definitions":["ohmmeter"],"forms":{"plural":"ohmmetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ohmmetru","accusative-definite-nominative-singular":"ohmmetrul","accusative-indefinite-nominative-plural":"ohmmetre","accusative-definite-nominative-plural":"ohmmetrele","dative-genitive-indefinite-singular":"ohmmetru","dative-definite-genitive-singular":"ohmmetrului","dative-genitive-indefinite-plural":"ohmmetre","dative-definite-genitive-plural":"ohmmetrelor","singular-vocative":"ohmmetrule","plural-vocative":"ohmmetrelor"}},{"word":"ohrană","pos":"noun","definitions":["secret police in Tsarist Russia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"ohrană","accusative-definite-nominative":"ohrana","dative-genitive-indefinite":"ohrane","dative-definite-genitive":"ohranei","vocative":"ohrană"}},{"word":"ohtoic","pos":"noun","definitions":["alternative form of octoih"],"forms":{"plural":"ohtoicuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ohtoic","accusative-definite-nominative-singular":"ohtoicul","accusative-indefinite-nominative-plural":"ohtoicuri","accusative-definite-nominative-plural":"ohtoicurile","dative-genitive-indefinite-singular":"ohtoic","dative-definite-genitive-singular":"ohtoicului","dative-genitive-indefinite-plural":"ohtoicuri","dative-definite-genitive-plural":"ohtoicurilor","singular-vocative":"ohtoicule","plural-vocative":"ohtoicurilor"}},{"word":"oi","pos":"noun","definitions":["inflection of oaie:","indefinite genitive/dative singular","indefinite nominative/accusative/genitive/dative plural"],"pronunciation":"/oj/","gender":"f","forms":{"alternative":"ой"}},{"word":"oi","pos":"verb","definitions":["might"],"pronunciation":"/oj/","examples":[{"ro":"Oi merge-n București mâine.","en":"I might go to Bucharest tomorrow."}],"forms":{"alternative":"ой"}},{"word":"oi","pos":"verb","definitions":["might"],"pronunciation":"/oj/","examples":[{"ro":"Crezi că oi vrea ceva de băut mai târziu?","en":"Do you think that you might want something to drink later?"}],"forms":{"alternative":"ой"}},{"word":"oică","pos":"noun","definitions":["diminutive of oaie"],"forms":{"plural":"oici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"oică","accusative-definite-nominative-singular":"oica","accusative-indefinite-nominative-plural":"oici","accusative-definite-nominative-plural":"oicile","dative-genitive-indefinite-singular":"oici","dative-definite-genitive-singular":"oicii","dative-genitive-indefinite-plural":"oici","dative-definite-genitive-plural":"oicilor","singular-vocative":"oică","plural-vocative":"oicilor"}},{"word":"oiconim","pos":"noun","definitions":["oikonym"],"forms":{"plural":"oiconime","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oiconim","accusative-definite-nominative-singular":"oiconimul","accusative-indefinite-nominative-plural":"oiconime","accusative-definite-nominative-plural":"oiconimele","dative-genitive-indefinite-singular":"oiconim","dative-definite-genitive-singular":"oiconimului","dative-genitive-indefinite-plural":"oiconime","dative-definite-genitive-plural":"oiconimelor","singular-vocative":"oiconimule","plural-vocative":"oiconimelor"}},{"word":"oicumena","pos":"noun","definitions":["oikumene"]},{"word":"Oidești","pos":"name","definitions":["a village in Vidra, Alba County, Romania"],"gender":"m"},{"word":"oidium","pos":"noun","definitions":["powdery mildew"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"oidium","accusative-definite-nominative":"oidiumul","dative-genitive-indefinite":"oidium","dative-definite-genitive":"oidiumului","vocative":"oidiumule"}},{"word":"Oiejdea","pos":"name","definitions":["a village in Galda de Jos, Alba County, Romania"],"gender":"f"},{"word":"oier","pos":"noun","definitions":["shepherd, sheepherder"],"pronunciation":"[oˈjer]","forms":{"plural":"oieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oier","accusative-definite-nominative-singular":"oierul","accusative-indefinite-nominative-plural":"oieri","accusative-definite-nominative-plural":"oierii","dative-genitive-indefinite-singular":"oier","dative-definite-genitive-singular":"oierului","dative-genitive-indefinite-plural":"oieri","dative-definite-genitive-plural":"oierilor","singular-vocative":"oierule","plural-vocative":"oierilor"}},{"word":"oierie","pos":"noun","definitions":["shepherdship"],"forms":{"plural":"oierii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oierie","accusative-definite-nominative-singular":"oieria","accusative-indefinite-nominative-plural":"oierii","accusative-definite-nominative-plural":"oieriile","dative-genitive-indefinite-singular":"oierii","dative-definite-genitive-singular":"oieriei","dative-genitive-indefinite-plural":"oierii","dative-definite-genitive-plural":"oieriilor","singular-vocative":"oierie","plural-vocative":"oieriilor"}},{"word":"Oierii","pos":"name","definitions":["a river in Brașov County, Romania, tributary to the Valea Mare"],"gender":"m"},{"word":"oierit","pos":"noun","definitions":["shepherdship"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"oierit","accusative-definite-nominative":"oieritul","dative-genitive-indefinite":"oierit","dative-definite-genitive":"oieritului","vocative":"oieritule"}},{"word":"Oieru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Oieru"}},{"word":"oiesc","pos":"adj","definitions":["sheepish"],"forms":{"feminine-singular":"oiască","plural":"oiești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oiesc","error-unrecognized-form-feminine-indefinite-singular":"oiască","error-unrecognized-form-indefinite-masculine-plural":"oiești","error-unrecognized-form-feminine-indefinite-neuter-plural":"oiești","definite-error-unrecognized-form-masculine-neuter-singular":"oiescul","definite-error-unrecognized-form-feminine-singular":"oiasca","definite-error-unrecognized-form-masculine-plural":"oieștii","definite-error-unrecognized-form-feminine-neuter-plural":"oieștile"}},{"word":"Oii","pos":"name","definitions":["a river in Iași County, Romania, tributary to the Bahluieț"],"gender":"m"},{"word":"oile","pos":"noun","definitions":["definite nominative/accusative plural of oaie"],"pronunciation":"[ˈojle]"},{"word":"oilor","pos":"noun","definitions":["definite genitive/dative plural of oaie"]},{"word":"oime","pos":"noun","definitions":["sheepdom"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"oime","accusative-definite-nominative":"oimea","dative-genitive-indefinite":"oimi","dative-definite-genitive":"oimii","vocative":"oime"}},{"word":"oină","pos":"noun","definitions":["a game with balls played by children, similar to rounders"],"forms":{"plural":"oine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oină","accusative-definite-nominative-singular":"oina","accusative-indefinite-nominative-plural":"oine","accusative-definite-nominative-plural":"oinele","dative-genitive-indefinite-singular":"oine","dative-definite-genitive-singular":"oinei","dative-genitive-indefinite-plural":"oine","dative-definite-genitive-plural":"oinelor","singular-vocative":"oină","plural-vocative":"oinelor"}},{"word":"oină","pos":"noun","definitions":["ram meat"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"oină","accusative-definite-nominative":"oina","dative-genitive-indefinite":"oine","dative-definite-genitive":"oinei","vocative":"oină"}},{"word":"Oinăcaru","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Oinăcaru"}},{"word":"oinist","pos":"noun","definitions":["oină player"],"forms":{"plural":"oiniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oinist","accusative-definite-nominative-singular":"oinistul","accusative-indefinite-nominative-plural":"oinisti","accusative-definite-nominative-plural":"oinistii","dative-genitive-indefinite-singular":"oinist","dative-definite-genitive-singular":"oinistului","dative-genitive-indefinite-plural":"oinisti","dative-definite-genitive-plural":"oinistilor","singular-vocative":"oinistule","plural-vocative":"oinistilor"}},{"word":"oișoară","pos":"noun","definitions":["diminutive of oaie; small sheep"],"forms":{"plural":"oișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oișoară","accusative-definite-nominative-singular":"oișoara","accusative-indefinite-nominative-plural":"oișoare","accusative-definite-nominative-plural":"oișoarele","dative-genitive-indefinite-singular":"oișoare","dative-definite-genitive-singular":"oișoarei","dative-genitive-indefinite-plural":"oișoare","dative-definite-genitive-plural":"oișoarelor","singular-vocative":"oișoară","plural-vocative":"oișoarelor"}},{"word":"Oiște","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Oiște"}},{"word":"oiște","pos":"noun","definitions":["a wooden pole, shaft, or beam attached to a cart or carriage, to which two horses are harnessed or two oxen yoked","the main post of a windmill"],"forms":{"plural":"oiști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oiște","accusative-definite-nominative-singular":"oiștea","accusative-indefinite-nominative-plural":"oiști","accusative-definite-nominative-plural":"oiștile","dative-genitive-indefinite-singular":"oiști","dative-definite-genitive-singular":"oiștii","dative-genitive-indefinite-plural":"oiști","dative-definite-genitive-plural":"oiștilor","singular-vocative":"oiște","plural-vocative":"oiștilor"}},{"word":"Oișteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Oișteanu"}},{"word":"Oița","pos":"name","definitions":["a river in Suceava County, Romania, tributary to the Bistrița Aurie"],"gender":"f"},{"word":"Oiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Oiță"}},{"word":"oiță","pos":"noun","definitions":["diminutive of oaie (“sheep”)"],"pronunciation":"/oˈi.t͡sə/","forms":{"plural":"oițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oiță","accusative-definite-nominative-singular":"oița","accusative-indefinite-nominative-plural":"oițe","accusative-definite-nominative-plural":"oițele","dative-genitive-indefinite-singular":"oițe","dative-definite-genitive-singular":"oiței","dative-genitive-indefinite-plural":"oițe","dative-definite-genitive-plural":"oițelor","singular-vocative":"oiță","plural-vocative":"oițelor"}},{"word":"oiței","pos":"noun","definitions":["definite genitive/dative singular of oiță"]},{"word":"oițică","pos":"noun","definitions":["diminutive of oiță; small sheep"],"forms":{"plural":"oițici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oițică","accusative-definite-nominative-singular":"oițica","accusative-indefinite-nominative-plural":"oițice","accusative-definite-nominative-plural":"oițicele","dative-genitive-indefinite-singular":"oițice","dative-definite-genitive-singular":"oițicei","dative-genitive-indefinite-plural":"oițice","dative-definite-genitive-plural":"oițicelor","singular-vocative":"oițică","plural-vocative":"oițicelor"}},{"word":"Oituz","pos":"name","definitions":["a commune of Bacău County, Romania","a village in Oituz, Bacău County, Romania","a village in Lumina, Constanța County, Romania","a village in Brețcu, Covasna County, Romania"],"gender":"m"},{"word":"ojă","pos":"noun","definitions":["nail polish"],"forms":{"plural":"oje","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ojă","accusative-definite-nominative-singular":"oja","accusative-indefinite-nominative-plural":"oje","accusative-definite-nominative-plural":"ojele","dative-genitive-indefinite-singular":"oje","dative-definite-genitive-singular":"ojei","dative-genitive-indefinite-plural":"oje","dative-definite-genitive-plural":"ojelor","singular-vocative":"ojă","plural-vocative":"ojelor"}},{"word":"Ojasca","pos":"name","definitions":["a village in Unguriu, Buzău County, Romania"],"gender":"f"},{"word":"Ojdula","pos":"name","definitions":["a commune of Covasna County, Romania","a village in Ojdula, Covasna County, Romania"],"gender":"f"},{"word":"ojivoi","pos":"verb","definitions":["to live"],"forms":{"canonical":"a ojivoi 4th conjugation","present-singular-third-person":"ojivoie","participle-past":"ojivoit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a ojivoi","gerund":"ojivoind","first-person-indicative-present-singular":"ojivoi","indicative-present-second-person-singular":"ojivoi","indicative-present-singular-third-person":"ojivoie","first-person-indicative-plural-present":"ojivoim","indicative-plural-present-second-person":"ojivoiți","indicative-plural-present-third-person":"ojivoie","first-person-imperfect-indicative-singular":"ojivoiam","imperfect-indicative-second-person-singular":"ojivoiai","imperfect-indicative-singular-third-person":"ojivoia","first-person-imperfect-indicative-plural":"ojivoiam","imperfect-indicative-plural-second-person":"ojivoiați","imperfect-indicative-plural-third-person":"ojivoiau","first-person-indicative-perfect-singular":"ojivoii","indicative-perfect-second-person-singular":"ojivoiși","indicative-perfect-singular-third-person":"ojivoi","first-person-indicative-perfect-plural":"ojivoirăm","indicative-perfect-plural-second-person":"ojivoirăți","indicative-perfect-plural-third-person":"ojivoiră","first-person-indicative-pluperfect-singular":"ojivoisem","indicative-pluperfect-second-person-singular":"ojivoiseși","indicative-pluperfect-singular-third-person":"ojivoise","first-person-indicative-pluperfect-plural":"ojivoiserăm","indicative-pluperfect-plural-second-person":"ojivoiserăți","indicative-pluperfect-plural-third-person":"ojivoiseră","first-person-present-singular-subjunctive":"să ojivoi","present-second-person-singular-subjunctive":"să ojivoi","present-singular-subjunctive-third-person":"să ojivoie","first-person-plural-present-subjunctive":"să ojivoim","plural-present-second-person-subjunctive":"să ojivoiți","plural-present-subjunctive-third-person":"să ojivoie","imperative-second-person-singular":"ojivoie","imperative-plural-second-person":"ojivoiți","imperative-negative-second-person-singular":"nu ojivoi","imperative-negative-plural-second-person":"nu ojivoiți"}},{"word":"ojoc","pos":"noun","definitions":["alternative form of ojog"],"forms":{"plural":"ojoace","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ojoc","accusative-definite-nominative-singular":"ojocul","accusative-indefinite-nominative-plural":"ojoace","accusative-definite-nominative-plural":"ojoacele","dative-genitive-indefinite-singular":"ojoc","dative-definite-genitive-singular":"ojocului","dative-genitive-indefinite-plural":"ojoace","dative-definite-genitive-plural":"ojoacelor","singular-vocative":"ojocule","plural-vocative":"ojoacelor"}},{"word":"ol","pos":"noun","definitions":["alternative form of oală"],"forms":{"plural":"oale","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ol","accusative-definite-nominative-singular":"olul","accusative-indefinite-nominative-plural":"oale","accusative-definite-nominative-plural":"oalele","dative-genitive-indefinite-singular":"ol","dative-definite-genitive-singular":"olului","dative-genitive-indefinite-plural":"oale","dative-definite-genitive-plural":"oalelor","singular-vocative":"olule","plural-vocative":"oalelor"}},{"word":"olac","pos":"noun","definitions":["messenger"],"forms":{"plural":"olaci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"olac","accusative-definite-nominative-singular":"olacul","accusative-indefinite-nominative-plural":"olaci","accusative-definite-nominative-plural":"olacii","dative-genitive-indefinite-singular":"olac","dative-definite-genitive-singular":"olacului","dative-genitive-indefinite-plural":"olaci","dative-definite-genitive-plural":"olacilor","singular-vocative":"olacule","plural-vocative":"olacilor"}},{"word":"olăcăi","pos":"verb","definitions":["alternative form of olecăi"],"forms":{"canonical":"a olăcăi 4th conjugation","present-singular-third-person":"olăcăie","participle-past":"olăcăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a olăcăi","gerund":"olăcăind","first-person-indicative-present-singular":"olăcăi","indicative-present-second-person-singular":"olăcăi","indicative-present-singular-third-person":"olăcăie","first-person-indicative-plural-present":"olăcăim","indicative-plural-present-second-person":"olăcăiți","indicative-plural-present-third-person":"olăcăie","first-person-imperfect-indicative-singular":"olăcăiam","imperfect-indicative-second-person-singular":"olăcăiai","imperfect-indicative-singular-third-person":"olăcăia","first-person-imperfect-indicative-plural":"olăcăiam","imperfect-indicative-plural-second-person":"olăcăiați","imperfect-indicative-plural-third-person":"olăcăiau","first-person-indicative-perfect-singular":"olăcăii","indicative-perfect-second-person-singular":"olăcăiși","indicative-perfect-singular-third-person":"olăcăi","first-person-indicative-perfect-plural":"olăcăirăm","indicative-perfect-plural-second-person":"olăcăirăți","indicative-perfect-plural-third-person":"olăcăiră","first-person-indicative-pluperfect-singular":"olăcăisem","indicative-pluperfect-second-person-singular":"olăcăiseși","indicative-pluperfect-singular-third-person":"olăcăise","first-person-indicative-pluperfect-plural":"olăcăiserăm","indicative-pluperfect-plural-second-person":"olăcăiserăți","indicative-pluperfect-plural-third-person":"olăcăiseră","first-person-present-singular-subjunctive":"să olăcăi","present-second-person-singular-subjunctive":"să olăcăi","present-singular-subjunctive-third-person":"să olăcăie","first-person-plural-present-subjunctive":"să olăcăim","plural-present-second-person-subjunctive":"să olăcăiți","plural-present-subjunctive-third-person":"să olăcăie","imperative-second-person-singular":"olăcăie","imperative-plural-second-person":"olăcăiți","imperative-negative-second-person-singular":"nu olăcăi","imperative-negative-plural-second-person":"nu olăcăiți"}},{"word":"olăcar","pos":"noun","definitions":["potter"],"forms":{"plural":"olăcari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"olăcar","accusative-definite-nominative-singular":"olăcarul","accusative-indefinite-nominative-plural":"olăcari","accusative-definite-nominative-plural":"olăcarii","dative-genitive-indefinite-singular":"olăcar","dative-definite-genitive-singular":"olăcarului","dative-genitive-indefinite-plural":"olăcari","dative-definite-genitive-plural":"olăcarilor","singular-vocative":"olăcarule","plural-vocative":"olăcarilor"}},{"word":"olăcaș","pos":"noun","definitions":["potter"],"forms":{"plural":"olăcași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"olăcaș","accusative-definite-nominative-singular":"olăcașul","accusative-indefinite-nominative-plural":"olăcași","accusative-definite-nominative-plural":"olăcașii","dative-genitive-indefinite-singular":"olăcaș","dative-definite-genitive-singular":"olăcașului","dative-genitive-indefinite-plural":"olăcași","dative-definite-genitive-plural":"olăcașilor","singular-vocative":"olăcașule","plural-vocative":"olăcașilor"}},{"word":"olăcește","pos":"adv","definitions":["messengerly"]},{"word":"Olah","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Olah"}},{"word":"olah","pos":"noun","definitions":["Vlach, Romanian","Wallachian"],"forms":{"plural":"olahi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"olah","accusative-definite-nominative-singular":"olahul","accusative-indefinite-nominative-plural":"olahi","accusative-definite-nominative-plural":"olahii","dative-genitive-indefinite-singular":"olah","dative-definite-genitive-singular":"olahului","dative-genitive-indefinite-plural":"olahi","dative-definite-genitive-plural":"olahilor","singular-vocative":"olahule","plural-vocative":"olahilor"}},{"word":"olah","pos":"adj","definitions":["Vlach, Romanian","Wallachian"],"forms":{"feminine-singular":"olahă","masculine-plural":"olahi","feminine-neuter-plural":"olahe","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"olah","error-unrecognized-form-feminine-indefinite-singular":"olahă","error-unrecognized-form-indefinite-masculine-plural":"olahi","error-unrecognized-form-feminine-indefinite-neuter-plural":"olahe","definite-error-unrecognized-form-masculine-neuter-singular":"olahul","definite-error-unrecognized-form-feminine-singular":"olaha","definite-error-unrecognized-form-masculine-plural":"olahii","definite-error-unrecognized-form-feminine-neuter-plural":"olahele"}},{"word":"Olăhuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Olăhuț"}},{"word":"olaltă","pos":"adv","definitions":["together"]},{"word":"Olan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Olan"}},{"word":"olan","pos":"noun","definitions":["semi-cylindrical terracotta roof tile"],"forms":{"plural":"olane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"olan","accusative-definite-nominative-singular":"olanul","accusative-indefinite-nominative-plural":"olane","accusative-definite-nominative-plural":"olanele","dative-genitive-indefinite-singular":"olan","dative-definite-genitive-singular":"olanului","dative-genitive-indefinite-plural":"olane","dative-definite-genitive-plural":"olanelor","singular-vocative":"olanule","plural-vocative":"olanelor"}},{"word":"olană","pos":"noun","definitions":["alternative form of olan"],"forms":{"plural":"olane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"olană","accusative-definite-nominative-singular":"olana","accusative-indefinite-nominative-plural":"olene","accusative-definite-nominative-plural":"olenele","dative-genitive-indefinite-singular":"olene","dative-definite-genitive-singular":"olenei","dative-genitive-indefinite-plural":"olene","dative-definite-genitive-plural":"olenelor","singular-vocative":"olană","plural-vocative":"olenelor"}},{"word":"olandă","pos":"noun","definitions":["holland (cloth)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"olandă","accusative-definite-nominative":"olanda","dative-genitive-indefinite":"e","dative-definite-genitive":"ei","vocative":"olandă"}},{"word":"olandez","pos":"adj","definitions":["of the Netherlands; Dutch"],"pronunciation":"[o.lanˈdez]","forms":{"feminine-singular":"olandeză","masculine-plural":"olandezi","feminine-neuter-plural":"olandeze","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"olandez","error-unrecognized-form-feminine-indefinite-singular":"olandeză","error-unrecognized-form-indefinite-masculine-plural":"olandezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"olandeze","definite-error-unrecognized-form-masculine-neuter-singular":"olandezul","definite-error-unrecognized-form-feminine-singular":"olandeza","definite-error-unrecognized-form-masculine-plural":"olandezii","definite-error-unrecognized-form-feminine-neuter-plural":"olandezele"}},{"word":"olandez","pos":"noun","definitions":["Dutch man"],"pronunciation":"[o.lanˈdez]","forms":{"plural":"olandezi","feminine":"equivalent olandeză","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"olandez","accusative-definite-nominative-singular":"olandezul","accusative-indefinite-nominative-plural":"olandezi","accusative-definite-nominative-plural":"olandezii","dative-genitive-indefinite-singular":"olandez","dative-definite-genitive-singular":"olandezului","dative-genitive-indefinite-plural":"olandezi","dative-definite-genitive-plural":"olandezilor","singular-vocative":"olandezule","plural-vocative":"olandezilor"}},{"word":"olandeză","pos":"adj","definitions":["nominative/accusative feminine singular of olandez"],"pronunciation":"/olanˈdezə/"},{"word":"olandeză","pos":"noun","definitions":["female equivalent of olandez"],"pronunciation":"/olanˈdezə/","forms":{"plural":"olandeze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"olandeză","accusative-definite-nominative-singular":"olandeza","accusative-indefinite-nominative-plural":"olandeze","accusative-definite-nominative-plural":"olandezele","dative-genitive-indefinite-singular":"olandeze","dative-definite-genitive-singular":"olandezei","dative-genitive-indefinite-plural":"olandeze","dative-definite-genitive-plural":"olandezelor","singular-vocative":"olandeză","plural-vocative":"olandezelor"}},{"word":"olandeze","pos":"noun","definitions":["inflection of olandeză:","indefinite genitive/dative singular","indefinite nominative/accusative/genitive/dative plural"],"gender":"f"},{"word":"olandezi","pos":"noun","definitions":["indefinite nominative/accusative/genitive/dative plural of olandez"],"gender":"m"},{"word":"Olandezul Zburător","pos":"name","definitions":["Flying Dutchman"],"gender":"m"},{"word":"Olăneanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Olăneanu"}},{"word":"Olăneasca","pos":"name","definitions":["a village in Salcia Tudor, Brăila County, Romania"],"gender":"f"},{"word":"olanelor","pos":"noun","definitions":["definite genitive/dative plural of olan"]},{"word":"Olănelul","pos":"name","definitions":["a river in Gorj, Romania, tributary to the Olanu"],"gender":"m"},{"word":"Olănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Olănescu"}},{"word":"Olănești","pos":"name","definitions":["a village in Olănești, Ștefan Vodă Raion, Moldova","a commune of Ștefan Vodă Raion, Moldova","a river in Vâlcea, Romania, tributary to the Olt","a locality in Băile Olănești, Vâlcea County, Romania"],"gender":"m"},{"word":"Olangiu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Olangiu"}},{"word":"olangiu","pos":"noun","definitions":["rooftile maker"],"forms":{"plural":"olangii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"olangiu","accusative-definite-nominative-singular":"olangiuul","accusative-indefinite-nominative-plural":"olangii","accusative-definite-nominative-plural":"olangiii","dative-genitive-indefinite-singular":"olangiu","dative-definite-genitive-singular":"olangiuului","dative-genitive-indefinite-plural":"olangii","dative-definite-genitive-plural":"olangiilor","singular-vocative":"olangiuule","plural-vocative":"olangiilor"}},{"word":"Olanu","pos":"name","definitions":["a commune of Vâlcea County, Romania","a village in Olanu, Vâlcea County, Romania"],"gender":"m"},{"word":"olanul","pos":"noun","definitions":["definite nominative/accusative singular of olan"]},{"word":"olanului","pos":"noun","definitions":["definite genitive/dative singular of olan"]},{"word":"Olar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Olar"}},{"word":"olar","pos":"noun","definitions":["potter"],"forms":{"plural":"olari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"olar","accusative-definite-nominative-singular":"olarul","accusative-indefinite-nominative-plural":"olari","accusative-definite-nominative-plural":"olarii","dative-genitive-indefinite-singular":"olar","dative-definite-genitive-singular":"olarului","dative-genitive-indefinite-plural":"olari","dative-definite-genitive-plural":"olarilor","singular-vocative":"olarule","plural-vocative":"olarilor"}},{"word":"Olăraș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Olăraș"}},{"word":"Olarașu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Olarașu"}},{"word":"Olărașu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Olărașu"}},{"word":"Olărean","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Olărean"}},{"word":"Olăreanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Olăreanu"}},{"word":"Olăreasa","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Prahova"],"gender":"f"},{"word":"olăreasă","pos":"noun","definitions":["female equivalent of olar"],"forms":{"plural":"olărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"olăreasă","accusative-definite-nominative-singular":"olăreasa","accusative-indefinite-nominative-plural":"olărese","accusative-definite-nominative-plural":"olăresele","dative-genitive-indefinite-singular":"olărese","dative-definite-genitive-singular":"olăresei","dative-genitive-indefinite-plural":"olărese","dative-definite-genitive-plural":"olăreselor","singular-vocative":"olăreasă","plural-vocative":"olăreselor"}},{"word":"Olăreni","pos":"name","definitions":["a village in Slobozia Bradului, Vrancea County, Romania"],"gender":"m"},{"word":"Olărescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Olărescu"}},{"word":"Olari","pos":"name","definitions":["a commune of Arad County, Romania","a village in Olari, Arad County, Romania","a village in Calvini, Buzău County, Romania","a village in Plopșoru, Gorj County, Romania","a village in Pârșcoveni, Olt County, Romania"],"gender":"m"},{"word":"olari","pos":"noun","definitions":["plural of olar"]},{"word":"olărie","pos":"noun","definitions":["pottery"],"forms":{"plural":"olării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"olărie","accusative-definite-nominative-singular":"olăria","accusative-indefinite-nominative-plural":"olării","accusative-definite-nominative-plural":"olăriile","dative-genitive-indefinite-singular":"olării","dative-definite-genitive-singular":"olăriei","dative-genitive-indefinite-plural":"olării","dative-definite-genitive-plural":"olăriilor","singular-vocative":"olărie","plural-vocative":"olăriilor"}},{"word":"Olarii Vechi","pos":"name","definitions":["a village in Olari, Prahova County, Romania"],"gender":"m","forms":{"canonical-masculine":"Olari Vechi"}},{"word":"olărit","pos":"noun","definitions":["pottery"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"olărit","accusative-definite-nominative":"olăritul","dative-genitive-indefinite":"olărit","dative-definite-genitive":"olăritului","vocative":"olăritule"}},{"word":"olăriță","pos":"noun","definitions":["female equivalent of olar"],"forms":{"plural":"olărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"olăriță","accusative-definite-nominative-singular":"olărița","accusative-indefinite-nominative-plural":"olărițe","accusative-definite-nominative-plural":"olărițele","dative-genitive-indefinite-singular":"olărițe","dative-definite-genitive-singular":"olăriței","dative-genitive-indefinite-plural":"olărițe","dative-definite-genitive-plural":"olărițelor","singular-vocative":"olăriță","plural-vocative":"olărițelor"}},{"word":"Olariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Olariu"}},{"word":"Olăriu","pos":"name","definitions":["a village in Frata, Cluj County, Romania"],"gender":"m"},{"word":"Olăroiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Olăroiu"}},{"word":"Olaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Olaru"}},{"word":"olarul","pos":"noun","definitions":["definite nominative/accusative singular of olar"]},{"word":"olarului","pos":"noun","definitions":["definite genitive/dative singular of olar"]},{"word":"olastiseală","pos":"noun","definitions":["flattery"],"forms":{"plural":"olastiseli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"olastiseală","accusative-definite-nominative-singular":"olastiseala","accusative-indefinite-nominative-plural":"olastisele","accusative-definite-nominative-plural":"olastiselele","dative-genitive-indefinite-singular":"olastisele","dative-definite-genitive-singular":"olastiselei","dative-genitive-indefinite-plural":"olastisele","dative-definite-genitive-plural":"olastiselelor","singular-vocative":"olastiseală","plural-vocative":"olastiselelor"}},{"word":"olat","pos":"noun","definitions":["region, territory"],"forms":{"plural":"olaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"olat","accusative-definite-nominative-singular":"olatul","accusative-indefinite-nominative-plural":"olaturi","accusative-definite-nominative-plural":"olaturile","dative-genitive-indefinite-singular":"olat","dative-definite-genitive-singular":"olatului","dative-genitive-indefinite-plural":"olaturi","dative-definite-genitive-plural":"olaturilor","singular-vocative":"olatule","plural-vocative":"olaturilor"}},{"word":"olătaș","pos":"noun","definitions":["landlord, owner"],"forms":{"plural":"olătași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"olătaș","accusative-definite-nominative-singular":"olătașul","accusative-indefinite-nominative-plural":"olătași","accusative-definite-nominative-plural":"olătașii","dative-genitive-indefinite-singular":"olătaș","dative-definite-genitive-singular":"olătașului","dative-genitive-indefinite-plural":"olătași","dative-definite-genitive-plural":"olătașilor","singular-vocative":"olătașule","plural-vocative":"olătașilor"}},{"word":"Olcean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Olcean"}},{"word":"olcuță","pos":"noun","definitions":["diminutive of oală; small pot","potty"],"forms":{"plural":"olcuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"olcuță","accusative-definite-nominative-singular":"olcuța","accusative-indefinite-nominative-plural":"olcuțe","accusative-definite-nominative-plural":"olcuțele","dative-genitive-indefinite-singular":"olcuțe","dative-definite-genitive-singular":"olcuței","dative-genitive-indefinite-plural":"olcuțe","dative-definite-genitive-plural":"olcuțelor","singular-vocative":"olcuță","plural-vocative":"olcuțelor"}},{"word":"ole","pos":"intj","definitions":["ole"]},{"word":"oleac","pos":"noun","definitions":["devil"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"oleac","accusative-definite-nominative":"oleacul","dative-genitive-indefinite":"oleac","dative-definite-genitive":"oleacului","vocative":"oleacule"}},{"word":"oleacă","pos":"adv","definitions":["a little"]},{"word":"oleaginos","pos":"adj","definitions":["oleaginous"],"forms":{"feminine-singular":"oleaginoasă","masculine-plural":"oleaginoși","feminine-neuter-plural":"oleaginoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oleaginos","error-unrecognized-form-feminine-indefinite-singular":"oleaginoasă","error-unrecognized-form-indefinite-masculine-plural":"oleaginoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"oleaginoase","definite-error-unrecognized-form-masculine-neuter-singular":"oleaginosul","definite-error-unrecognized-form-feminine-singular":"oleaginoasa","definite-error-unrecognized-form-masculine-plural":"oleaginoșii","definite-error-unrecognized-form-feminine-neuter-plural":"oleaginoasele"}},{"word":"oleandru","pos":"noun","definitions":["alternative form of leandru"],"forms":{"plural":"oleandri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oleandru","accusative-definite-nominative-singular":"oleandruul","accusative-indefinite-nominative-plural":"oleandri","accusative-definite-nominative-plural":"oleandrii","dative-genitive-indefinite-singular":"oleandru","dative-definite-genitive-singular":"oleandruului","dative-genitive-indefinite-plural":"oleandri","dative-definite-genitive-plural":"oleandrilor","singular-vocative":"oleandruule","plural-vocative":"oleandrilor"}},{"word":"oleastru","pos":"noun","definitions":["wild olive tree"],"forms":{"plural":"oleastri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oleastru","accusative-definite-nominative-singular":"oleastruul","accusative-indefinite-nominative-plural":"oleastri","accusative-definite-nominative-plural":"oleastrii","dative-genitive-indefinite-singular":"oleastru","dative-definite-genitive-singular":"oleastruului","dative-genitive-indefinite-plural":"oleastri","dative-definite-genitive-plural":"oleastrilor","singular-vocative":"oleastruule","plural-vocative":"oleastrilor"}},{"word":"oleat","pos":"noun","definitions":["oleate"],"forms":{"plural":"oleați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oleat","accusative-definite-nominative-singular":"oleatul","accusative-indefinite-nominative-plural":"oleați","accusative-definite-nominative-plural":"oleații","dative-genitive-indefinite-singular":"oleat","dative-definite-genitive-singular":"oleatului","dative-genitive-indefinite-plural":"oleați","dative-definite-genitive-plural":"oleaților","singular-vocative":"oleatule","plural-vocative":"oleaților"}},{"word":"olecăi","pos":"verb","definitions":["to whine, to weep"],"forms":{"canonical":"a olecăi 4th conjugation","present-singular-third-person":"olecăie","participle-past":"olecăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a olecăi","gerund":"olecăind","first-person-indicative-present-singular":"olecăi","indicative-present-second-person-singular":"olecăi","indicative-present-singular-third-person":"olecăie","first-person-indicative-plural-present":"olecăim","indicative-plural-present-second-person":"olecăiți","indicative-plural-present-third-person":"olecăie","first-person-imperfect-indicative-singular":"olecăiam","imperfect-indicative-second-person-singular":"olecăiai","imperfect-indicative-singular-third-person":"olecăia","first-person-imperfect-indicative-plural":"olecăiam","imperfect-indicative-plural-second-person":"olecăiați","imperfect-indicative-plural-third-person":"olecăiau","first-person-indicative-perfect-singular":"olecăii","indicative-perfect-second-person-singular":"olecăiși","indicative-perfect-singular-third-person":"olecăi","first-person-indicative-perfect-plural":"olecăirăm","indicative-perfect-plural-second-person":"olecăirăți","indicative-perfect-plural-third-person":"olecăiră","first-person-indicative-pluperfect-singular":"olecăisem","indicative-pluperfect-second-person-singular":"olecăiseși","indicative-pluperfect-singular-third-person":"olecăise","first-person-indicative-pluperfect-plural":"olecăiserăm","indicative-pluperfect-plural-second-person":"olecăiserăți","indicative-pluperfect-plural-third-person":"olecăiseră","first-person-present-singular-subjunctive":"să olecăi","present-second-person-singular-subjunctive":"să olecăi","present-singular-subjunctive-third-person":"să olecăie","first-person-plural-present-subjunctive":"să olecăim","plural-present-second-person-subjunctive":"să olecăiți","plural-present-subjunctive-third-person":"să olecăie","imperative-second-person-singular":"olecăie","imperative-plural-second-person":"olecăiți","imperative-negative-second-person-singular":"nu olecăi","imperative-negative-plural-second-person":"nu olecăiți"}},{"word":"olecăire","pos":"noun","definitions":["wail"],"forms":{"plural":"olecăiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"olecăire","accusative-definite-nominative-singular":"olecăirea","accusative-indefinite-nominative-plural":"olecăiri","accusative-definite-nominative-plural":"olecăirile","dative-genitive-indefinite-singular":"olecăiri","dative-definite-genitive-singular":"olecăirii","dative-genitive-indefinite-plural":"olecăiri","dative-definite-genitive-plural":"olecăirilor","singular-vocative":"olecăire","plural-vocative":"olecăirilor"}},{"word":"olecăit","pos":"noun","definitions":["wail"],"forms":{"plural":"olecăituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"olecăit","accusative-definite-nominative-singular":"olecăitul","accusative-indefinite-nominative-plural":"olecăituri","accusative-definite-nominative-plural":"olecăiturile","dative-genitive-indefinite-singular":"olecăit","dative-definite-genitive-singular":"olecăitului","dative-genitive-indefinite-plural":"olecăituri","dative-definite-genitive-plural":"olecăiturilor","singular-vocative":"olecăitule","plural-vocative":"olecăiturilor"}},{"word":"olecăit","pos":"verb","definitions":["past participle of olecăi"],"forms":{"participle-past":"of olecăi"}},{"word":"olecăitură","pos":"noun","definitions":["a wail"],"forms":{"plural":"olecăituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"olecăitură","accusative-definite-nominative-singular":"olecăitura","accusative-indefinite-nominative-plural":"olecăituri","accusative-definite-nominative-plural":"olecăiturile","dative-genitive-indefinite-singular":"olecăituri","dative-definite-genitive-singular":"olecăiturii","dative-genitive-indefinite-plural":"olecăituri","dative-definite-genitive-plural":"olecăiturilor","singular-vocative":"olecăitură","plural-vocative":"olecăiturilor"}},{"word":"olecran","pos":"noun","definitions":["olecranon"],"forms":{"plural":"olecranuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"olecran","accusative-definite-nominative-singular":"olecranul","accusative-indefinite-nominative-plural":"olecranuri","accusative-definite-nominative-plural":"olecranurile","dative-genitive-indefinite-singular":"olecran","dative-definite-genitive-singular":"olecranului","dative-genitive-indefinite-plural":"olecranuri","dative-definite-genitive-plural":"olecranurilor","singular-vocative":"olecranule","plural-vocative":"olecranurilor"}},{"word":"olecșoară","pos":"adv","definitions":["alternative form of olecușoară"]},{"word":"olecușoară","pos":"adv","definitions":["diminutive of oleacă"]},{"word":"olecuță","pos":"adv","definitions":["diminutive of oleacă"]},{"word":"olecuțică","pos":"adv","definitions":["diminutive of oleacă"]},{"word":"olefină","pos":"noun","definitions":["olefin"],"forms":{"plural":"olefine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"olefină","accusative-definite-nominative-singular":"olefina","accusative-indefinite-nominative-plural":"olefine","accusative-definite-nominative-plural":"olefinele","dative-genitive-indefinite-singular":"olefine","dative-definite-genitive-singular":"olefinei","dative-genitive-indefinite-plural":"olefine","dative-definite-genitive-plural":"olefinelor","singular-vocative":"olefină","plural-vocative":"olefinelor"}},{"word":"olefinic","pos":"adj","definitions":["olefinic"],"forms":{"feminine-singular":"olefinică","masculine-plural":"olefinici","feminine-neuter-plural":"olefinice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"olefinic","error-unrecognized-form-feminine-indefinite-singular":"olefinică","error-unrecognized-form-indefinite-masculine-plural":"olefinici","error-unrecognized-form-feminine-indefinite-neuter-plural":"olefinice","definite-error-unrecognized-form-masculine-neuter-singular":"olefinicul","definite-error-unrecognized-form-feminine-singular":"olefinica","definite-error-unrecognized-form-masculine-plural":"olefinicii","definite-error-unrecognized-form-feminine-neuter-plural":"olefinicele"}},{"word":"oleia","pos":"verb","definitions":["alternative form of uleia"],"forms":{"canonical":"a oleia 1st conjugation","present-singular-third-person":"oleiază","participle-past":"oleiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a oleia","gerund":"oleind","first-person-indicative-present-singular":"oleiez","indicative-present-second-person-singular":"oleiezi","indicative-present-singular-third-person":"oleiază","first-person-indicative-plural-present":"oleiem","indicative-plural-present-second-person":"oleiați","indicative-plural-present-third-person":"oleiază","first-person-imperfect-indicative-singular":"oleiam","imperfect-indicative-second-person-singular":"oleiai","imperfect-indicative-singular-third-person":"oleia","first-person-imperfect-indicative-plural":"oleiam","imperfect-indicative-plural-second-person":"oleiați","imperfect-indicative-plural-third-person":"oleiau","first-person-indicative-perfect-singular":"oleiai","indicative-perfect-second-person-singular":"oleiași","indicative-perfect-singular-third-person":"oleie","first-person-indicative-perfect-plural":"oleiarăm","indicative-perfect-plural-second-person":"oleiarăți","indicative-perfect-plural-third-person":"oleiară","first-person-indicative-pluperfect-singular":"oleiasem","indicative-pluperfect-second-person-singular":"oleiaseși","indicative-pluperfect-singular-third-person":"oleiase","first-person-indicative-pluperfect-plural":"oleiaserăm","indicative-pluperfect-plural-second-person":"oleiaserăți","indicative-pluperfect-plural-third-person":"oleiaseră","first-person-present-singular-subjunctive":"să oleiez","present-second-person-singular-subjunctive":"să oleiezi","present-singular-subjunctive-third-person":"să oleieze","first-person-plural-present-subjunctive":"să oleiem","plural-present-second-person-subjunctive":"să oleiați","plural-present-subjunctive-third-person":"să oleieze","imperative-second-person-singular":"oleiază","imperative-plural-second-person":"oleiați","imperative-negative-second-person-singular":"nu oleia","imperative-negative-plural-second-person":"nu oleiați"}},{"word":"oleiat","pos":"adj","definitions":["alternative form of uleiat"],"forms":{"feminine-singular":"oleiată","masculine-plural":"oleiați","feminine-neuter-plural":"oleiate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oleiat","error-unrecognized-form-feminine-indefinite-singular":"oleiată","error-unrecognized-form-indefinite-masculine-plural":"oleiați","error-unrecognized-form-feminine-indefinite-neuter-plural":"oleiate","definite-error-unrecognized-form-masculine-neuter-singular":"oleiatul","definite-error-unrecognized-form-feminine-singular":"oleiata","definite-error-unrecognized-form-masculine-plural":"oleiații","definite-error-unrecognized-form-feminine-neuter-plural":"oleiatele"}},{"word":"oleic","pos":"adj","definitions":["oleic"],"forms":{"feminine-singular":"oleică","masculine-plural":"oleici","feminine-neuter-plural":"oleice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oleic","error-unrecognized-form-feminine-indefinite-singular":"oleică","error-unrecognized-form-indefinite-masculine-plural":"oleici","error-unrecognized-form-feminine-indefinite-neuter-plural":"oleice","definite-error-unrecognized-form-masculine-neuter-singular":"oleicul","definite-error-unrecognized-form-feminine-singular":"oleica","definite-error-unrecognized-form-masculine-plural":"oleicii","definite-error-unrecognized-form-feminine-neuter-plural":"oleicele"}},{"word":"oleifer","pos":"adj","definitions":["oleiferous"],"forms":{"feminine-singular":"oleiferă","masculine-plural":"oleiferi","feminine-neuter-plural":"oleifere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oleifer","error-unrecognized-form-feminine-indefinite-singular":"oleiferă","error-unrecognized-form-indefinite-masculine-plural":"oleiferi","error-unrecognized-form-feminine-indefinite-neuter-plural":"oleifere","definite-error-unrecognized-form-masculine-neuter-singular":"oleiferul","definite-error-unrecognized-form-feminine-singular":"oleifera","definite-error-unrecognized-form-masculine-plural":"oleiferii","definite-error-unrecognized-form-feminine-neuter-plural":"oleiferele"}},{"word":"oleiform","pos":"adj","definitions":["oil-like"],"forms":{"feminine-singular":"oleiformă","masculine-plural":"oleiformi","feminine-neuter-plural":"oleiforme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oleiform","error-unrecognized-form-feminine-indefinite-singular":"oleiformă","error-unrecognized-form-indefinite-masculine-plural":"oleiformi","error-unrecognized-form-feminine-indefinite-neuter-plural":"oleiforme","definite-error-unrecognized-form-masculine-neuter-singular":"oleiformul","definite-error-unrecognized-form-feminine-singular":"oleiforma","definite-error-unrecognized-form-masculine-plural":"oleiformii","definite-error-unrecognized-form-feminine-neuter-plural":"oleiformele"}},{"word":"oleină","pos":"noun","definitions":["olein"],"forms":{"plural":"oleine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oleină","accusative-definite-nominative-singular":"oleina","accusative-indefinite-nominative-plural":"oleine","accusative-definite-nominative-plural":"oleinele","dative-genitive-indefinite-singular":"oleine","dative-definite-genitive-singular":"oleinei","dative-genitive-indefinite-plural":"oleine","dative-definite-genitive-plural":"oleinelor","singular-vocative":"oleină","plural-vocative":"oleinelor"}},{"word":"oleios","pos":"adj","definitions":["alternative form of uleios"],"forms":{"feminine-singular":"oleioasă","masculine-plural":"oleioși","feminine-neuter-plural":"oleioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oleios","error-unrecognized-form-feminine-indefinite-singular":"oleioasă","error-unrecognized-form-indefinite-masculine-plural":"oleioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"oleioase","definite-error-unrecognized-form-masculine-neuter-singular":"oleiosul","definite-error-unrecognized-form-feminine-singular":"oleioasa","definite-error-unrecognized-form-masculine-plural":"oleioșii","definite-error-unrecognized-form-feminine-neuter-plural":"oleioasele"}},{"word":"Oleniuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Oleniuc"}},{"word":"oleo","pos":"intj","definitions":["alternative form of aoleu"]},{"word":"oleoduc","pos":"noun","definitions":["oil pipeline"],"forms":{"plural":"oleoducuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"oleoduc","accusative-definite-nominative-singular":"oleoducul","accusative-indefinite-nominative-plural":"oleoducuri","accusative-definite-nominative-plural":"oleoducurile","dative-genitive-indefinite-singular":"oleoduc","dative-definite-genitive-singular":"oleoducului","dative-genitive-indefinite-plural":"oleoducuri","dative-definite-genitive-plural":"oleoducurilor","singular-vocative":"oleoducule","plural-vocative":"oleoducurilor"}},{"word":"oleoduct","pos":"noun","definitions":["oil pipeline"],"forms":{"plural":"oleoducte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oleoduct","accusative-definite-nominative-singular":"oleoductul","accusative-indefinite-nominative-plural":"oleoducte","accusative-definite-nominative-plural":"oleoductele","dative-genitive-indefinite-singular":"oleoduct","dative-definite-genitive-singular":"oleoductului","dative-genitive-indefinite-plural":"oleoducte","dative-definite-genitive-plural":"oleoductelor","singular-vocative":"oleoductule","plural-vocative":"oleoductelor"}},{"word":"oleofil","pos":"adj","definitions":["oleophilic"],"forms":{"feminine-singular":"oleofilă","masculine-plural":"oleofili","feminine-neuter-plural":"oleofile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oleofil","error-unrecognized-form-feminine-indefinite-singular":"oleofilă","error-unrecognized-form-indefinite-masculine-plural":"oleofili","error-unrecognized-form-feminine-indefinite-neuter-plural":"oleofile","definite-error-unrecognized-form-masculine-neuter-singular":"oleofilul","definite-error-unrecognized-form-feminine-singular":"oleofila","definite-error-unrecognized-form-masculine-plural":"oleofilii","definite-error-unrecognized-form-feminine-neuter-plural":"oleofilele"}},{"word":"oleografie","pos":"noun","definitions":["oleography"],"forms":{"plural":"oleografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oleografie","accusative-definite-nominative-singular":"oleografia","accusative-indefinite-nominative-plural":"oleografii","accusative-definite-nominative-plural":"oleografiile","dative-genitive-indefinite-singular":"oleografii","dative-definite-genitive-singular":"oleografiei","dative-genitive-indefinite-plural":"oleografii","dative-definite-genitive-plural":"oleografiilor","singular-vocative":"oleografie","plural-vocative":"oleografiilor"}},{"word":"oleoleo","pos":"intj","definitions":["alternative form of aoleu"]},{"word":"oleoleu","pos":"intj","definitions":["obsolete form of aoleu"]},{"word":"oleomargarină","pos":"noun","definitions":["oleomargarine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oleomargarină","accusative-definite-nominative-singular":"oleomargarina","accusative-indefinite-nominative-plural":"oleomargarine","accusative-definite-nominative-plural":"oleomargarinele","dative-genitive-indefinite-singular":"oleomargarine","dative-definite-genitive-singular":"oleomargarinei","dative-genitive-indefinite-plural":"oleomargarine","dative-definite-genitive-plural":"oleomargarinelor","singular-vocative":"oleomargarină","plural-vocative":"oleomargarinelor"}},{"word":"oleometru","pos":"noun","definitions":["oleometer"],"forms":{"plural":"oleometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oleometru","accusative-definite-nominative-singular":"oleometrul","accusative-indefinite-nominative-plural":"oleometre","accusative-definite-nominative-plural":"oleometrele","dative-genitive-indefinite-singular":"oleometru","dative-definite-genitive-singular":"oleometrului","dative-genitive-indefinite-plural":"oleometre","dative-definite-genitive-plural":"oleometrelor","singular-vocative":"oleometrule","plural-vocative":"oleometrelor"}},{"word":"Olescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Olescu"}},{"word":"Oleșești","pos":"name","definitions":["a village in Pârscov, Buzău County, Romania","a village in Țifești, Vrancea County, Romania"],"gender":"m"},{"word":"oleu","pos":"noun","definitions":["vegetable oil"],"forms":{"plural":"oleuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oleu","accusative-definite-nominative-singular":"oleul","accusative-indefinite-nominative-plural":"oleuri","accusative-definite-nominative-plural":"oleurile","dative-genitive-indefinite-singular":"oleu","dative-definite-genitive-singular":"oleului","dative-genitive-indefinite-plural":"oleuri","dative-definite-genitive-plural":"oleurilor","singular-vocative":"oleule","plural-vocative":"oleurilor"}},{"word":"oleum","pos":"noun","definitions":["oleum"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"oleum","accusative-definite-nominative":"oleumul","dative-genitive-indefinite":"oleum","dative-definite-genitive":"oleumului","vocative":"oleumule"}},{"word":"olfacție","pos":"noun","definitions":["olfaction"],"forms":{"plural":"olfacții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"olfacție","accusative-definite-nominative-singular":"olfacția","accusative-indefinite-nominative-plural":"olfacții","accusative-definite-nominative-plural":"olfacțiile","dative-genitive-indefinite-singular":"olfacții","dative-definite-genitive-singular":"olfacției","dative-genitive-indefinite-plural":"olfacții","dative-definite-genitive-plural":"olfacțiilor","singular-vocative":"olfacție","plural-vocative":"olfacțiilor"}},{"word":"olfacțiune","pos":"noun","definitions":["alternative form of olfacție"],"forms":{"plural":"olfacțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"olfacțiune","accusative-definite-nominative-singular":"olfacțiunea","accusative-indefinite-nominative-plural":"olfacțiuni","accusative-definite-nominative-plural":"olfacțiunile","dative-genitive-indefinite-singular":"olfacțiuni","dative-definite-genitive-singular":"olfacțiunii","dative-genitive-indefinite-plural":"olfacțiuni","dative-definite-genitive-plural":"olfacțiunilor","singular-vocative":"olfacțiune","plural-vocative":"olfacțiunilor"}},{"word":"olfactiv","pos":"adj","definitions":["olfactory"],"forms":{"feminine-singular":"olfactivă","masculine-plural":"olfactivi","feminine-neuter-plural":"olfactive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"olfactiv","error-unrecognized-form-feminine-indefinite-singular":"olfactivă","error-unrecognized-form-indefinite-masculine-plural":"olfactivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"olfactive","definite-error-unrecognized-form-masculine-neuter-singular":"olfactivul","definite-error-unrecognized-form-feminine-singular":"olfactiva","definite-error-unrecognized-form-masculine-plural":"olfactivii","definite-error-unrecognized-form-feminine-neuter-plural":"olfactivele"}},{"word":"olfactometrie","pos":"noun","definitions":["olfactometry"],"forms":{"plural":"olfactometrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"olfactometrie","accusative-definite-nominative-singular":"olfactometria","accusative-indefinite-nominative-plural":"olfactometrii","accusative-definite-nominative-plural":"olfactometriile","dative-genitive-indefinite-singular":"olfactometrii","dative-definite-genitive-singular":"olfactometriei","dative-genitive-indefinite-plural":"olfactometrii","dative-definite-genitive-plural":"olfactometriilor","singular-vocative":"olfactometrie","plural-vocative":"olfactometriilor"}},{"word":"olfactometru","pos":"noun","definitions":["olfactometer"],"forms":{"plural":"olfactometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"olfactometru","accusative-definite-nominative-singular":"olfactometrul","accusative-indefinite-nominative-plural":"olfactometre","accusative-definite-nominative-plural":"olfactometrele","dative-genitive-indefinite-singular":"olfactometru","dative-definite-genitive-singular":"olfactometrului","dative-genitive-indefinite-plural":"olfactometre","dative-definite-genitive-plural":"olfactometrelor","singular-vocative":"olfactometrule","plural-vocative":"olfactometrelor"}},{"word":"olfactronică","pos":"noun","definitions":["olfactronics"],"forms":{"plural":"olfactronici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"olfactronică","accusative-definite-nominative-singular":"olfactronica","accusative-indefinite-nominative-plural":"olfactronici","accusative-definite-nominative-plural":"olfactronicile","dative-genitive-indefinite-singular":"olfactronici","dative-definite-genitive-singular":"olfactronicii","dative-genitive-indefinite-plural":"olfactronici","dative-definite-genitive-plural":"olfactronicilor","singular-vocative":"olfactronică","plural-vocative":"olfactronicilor"}},{"word":"Olga","pos":"name","definitions":["a female given name, equivalent to English Olga or Russian О́льга (Ólʹga)"],"pronunciation":"/ˈol.ɡa/","gender":"f","forms":{"dative-genitive":"Olgăi","alternative":"Олга"}},{"word":"olicăi","pos":"verb","definitions":["alternative form of olecăi"],"forms":{"canonical":"a olicăi 4th conjugation","present-singular-third-person":"olicăie","participle-past":"olicăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a olicăi","gerund":"olicăind","first-person-indicative-present-singular":"olicăi","indicative-present-second-person-singular":"olicăi","indicative-present-singular-third-person":"olicăie","first-person-indicative-plural-present":"olicăim","indicative-plural-present-second-person":"olicăiți","indicative-plural-present-third-person":"olicăie","first-person-imperfect-indicative-singular":"olicăiam","imperfect-indicative-second-person-singular":"olicăiai","imperfect-indicative-singular-third-person":"olicăia","first-person-imperfect-indicative-plural":"olicăiam","imperfect-indicative-plural-second-person":"olicăiați","imperfect-indicative-plural-third-person":"olicăiau","first-person-indicative-perfect-singular":"olicăii","indicative-perfect-second-person-singular":"olicăiși","indicative-perfect-singular-third-person":"olicăi","first-person-indicative-perfect-plural":"olicăirăm","indicative-perfect-plural-second-person":"olicăirăți","indicative-perfect-plural-third-person":"olicăiră","first-person-indicative-pluperfect-singular":"olicăisem","indicative-pluperfect-second-person-singular":"olicăiseși","indicative-pluperfect-singular-third-person":"olicăise","first-person-indicative-pluperfect-plural":"olicăiserăm","indicative-pluperfect-plural-second-person":"olicăiserăți","indicative-pluperfect-plural-third-person":"olicăiseră","first-person-present-singular-subjunctive":"să olicăi","present-second-person-singular-subjunctive":"să olicăi","present-singular-subjunctive-third-person":"să olicăie","first-person-plural-present-subjunctive":"să olicăim","plural-present-second-person-subjunctive":"să olicăiți","plural-present-subjunctive-third-person":"să olicăie","imperative-second-person-singular":"olicăie","imperative-plural-second-person":"olicăiți","imperative-negative-second-person-singular":"nu olicăi","imperative-negative-plural-second-person":"nu olicăiți"}},{"word":"olicică","pos":"noun","definitions":["potty"],"forms":{"plural":"olicele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"olicică","accusative-definite-nominative-singular":"olicica","accusative-indefinite-nominative-plural":"olicele","accusative-definite-nominative-plural":"olicelele","dative-genitive-indefinite-singular":"olicele","dative-definite-genitive-singular":"olicelei","dative-genitive-indefinite-plural":"olicele","dative-definite-genitive-plural":"olicelelor","singular-vocative":"olicică","plural-vocative":"olicelelor"}},{"word":"oligant","pos":"adj","definitions":["oliganthous"],"forms":{"feminine-singular":"oligantă","masculine-plural":"oliganți","feminine-neuter-plural":"oligante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oligant","error-unrecognized-form-feminine-indefinite-singular":"oligantă","error-unrecognized-form-indefinite-masculine-plural":"oliganți","error-unrecognized-form-feminine-indefinite-neuter-plural":"oligante","definite-error-unrecognized-form-masculine-neuter-singular":"oligantul","definite-error-unrecognized-form-feminine-singular":"oliganta","definite-error-unrecognized-form-masculine-plural":"oliganții","definite-error-unrecognized-form-feminine-neuter-plural":"oligantele"}},{"word":"oligarh","pos":"noun","definitions":["oligarch"],"forms":{"plural":"oligarhi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oligarh","accusative-definite-nominative-singular":"oligarhul","accusative-indefinite-nominative-plural":"oligarhi","accusative-definite-nominative-plural":"oligarhii","dative-genitive-indefinite-singular":"oligarh","dative-definite-genitive-singular":"oligarhului","dative-genitive-indefinite-plural":"oligarhi","dative-definite-genitive-plural":"oligarhilor","singular-vocative":"oligarhule","plural-vocative":"oligarhilor"}},{"word":"oligarhic","pos":"adj","definitions":["oligarchic"],"forms":{"feminine-singular":"oligarhică","masculine-plural":"oligarhici","feminine-neuter-plural":"oligarhice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oligarhic","error-unrecognized-form-feminine-indefinite-singular":"oligarhică","error-unrecognized-form-indefinite-masculine-plural":"oligarhici","error-unrecognized-form-feminine-indefinite-neuter-plural":"oligarhice","definite-error-unrecognized-form-masculine-neuter-singular":"oligarhicul","definite-error-unrecognized-form-feminine-singular":"oligarhica","definite-error-unrecognized-form-masculine-plural":"oligarhicii","definite-error-unrecognized-form-feminine-neuter-plural":"oligarhicele"}},{"word":"oligarhie","pos":"noun","definitions":["oligarchy"],"forms":{"plural":"oligarhii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oligarhie","accusative-definite-nominative-singular":"oligarhia","accusative-indefinite-nominative-plural":"oligarhii","accusative-definite-nominative-plural":"oligarhiile","dative-genitive-indefinite-singular":"oligarhii","dative-definite-genitive-singular":"oligarhiei","dative-genitive-indefinite-plural":"oligarhii","dative-definite-genitive-plural":"oligarhiilor","singular-vocative":"oligarhie","plural-vocative":"oligarhiilor"}},{"word":"oligist","pos":"noun","definitions":["oligist"],"forms":{"plural":"oligisturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"oligist","accusative-definite-nominative-singular":"oligistul","accusative-indefinite-nominative-plural":"oligisturi","accusative-definite-nominative-plural":"oligisturile","dative-genitive-indefinite-singular":"oligist","dative-definite-genitive-singular":"oligistului","dative-genitive-indefinite-plural":"oligisturi","dative-definite-genitive-plural":"oligisturilor","singular-vocative":"oligistule","plural-vocative":"oligisturilor"}},{"word":"oligneală","pos":"noun","definitions":["dislocation"],"forms":{"plural":"oligneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oligneală","accusative-definite-nominative-singular":"oligneala","accusative-indefinite-nominative-plural":"olignele","accusative-definite-nominative-plural":"olignelele","dative-genitive-indefinite-singular":"olignele","dative-definite-genitive-singular":"olignelei","dative-genitive-indefinite-plural":"olignele","dative-definite-genitive-plural":"olignelelor","singular-vocative":"oligneală","plural-vocative":"olignelelor"}},{"word":"oligocen","pos":"noun","definitions":["Oligocene"],"forms":{"plural":"oligoceni","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oligocen","accusative-definite-nominative-singular":"oligocenul","accusative-indefinite-nominative-plural":"oligoceni","accusative-definite-nominative-plural":"oligocenile","dative-genitive-indefinite-singular":"oligocen","dative-definite-genitive-singular":"oligocenului","dative-genitive-indefinite-plural":"oligoceni","dative-definite-genitive-plural":"oligocenilor","singular-vocative":"oligocenule","plural-vocative":"oligocenilor"}},{"word":"oligochet","pos":"noun","definitions":["oligochaete"],"forms":{"plural":"oligochete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oligochet","accusative-definite-nominative-singular":"oligochetul","accusative-indefinite-nominative-plural":"oligochete","accusative-definite-nominative-plural":"oligochetele","dative-genitive-indefinite-singular":"oligochet","dative-definite-genitive-singular":"oligochetului","dative-genitive-indefinite-plural":"oligochete","dative-definite-genitive-plural":"oligochetelor","singular-vocative":"oligochetule","plural-vocative":"oligochetelor"}},{"word":"oligocitemie","pos":"noun","definitions":["oligocythemia"],"forms":{"plural":"oligocitemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oligocitemie","accusative-definite-nominative-singular":"oligocitemia","accusative-indefinite-nominative-plural":"oligocitemii","accusative-definite-nominative-plural":"oligocitemiile","dative-genitive-indefinite-singular":"oligocitemii","dative-definite-genitive-singular":"oligocitemiei","dative-genitive-indefinite-plural":"oligocitemii","dative-definite-genitive-plural":"oligocitemiilor","singular-vocative":"oligocitemie","plural-vocative":"oligocitemiilor"}},{"word":"oligocrație","pos":"noun","definitions":["oligocracy"],"forms":{"plural":"oligocrații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oligocrație","accusative-definite-nominative-singular":"oligocrația","accusative-indefinite-nominative-plural":"oligocrații","accusative-definite-nominative-plural":"oligocrațiile","dative-genitive-indefinite-singular":"oligocrații","dative-definite-genitive-singular":"oligocrației","dative-genitive-indefinite-plural":"oligocrații","dative-definite-genitive-plural":"oligocrațiilor","singular-vocative":"oligocrație","plural-vocative":"oligocrațiilor"}},{"word":"oligodipsie","pos":"noun","definitions":["oligodipsia"],"forms":{"plural":"oligodipsii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oligodipsie","accusative-definite-nominative-singular":"oligodipsia","accusative-indefinite-nominative-plural":"oligodipsii","accusative-definite-nominative-plural":"oligodipsiile","dative-genitive-indefinite-singular":"oligodipsii","dative-definite-genitive-singular":"oligodipsiei","dative-genitive-indefinite-plural":"oligodipsii","dative-definite-genitive-plural":"oligodipsiilor","singular-vocative":"oligodipsie","plural-vocative":"oligodipsiilor"}},{"word":"oligoelement","pos":"noun","definitions":["trace element"],"forms":{"plural":"oligoelemente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oligoelement","accusative-definite-nominative-singular":"oligoelementul","accusative-indefinite-nominative-plural":"oligoelemente","accusative-definite-nominative-plural":"oligoelementele","dative-genitive-indefinite-singular":"oligoelement","dative-definite-genitive-singular":"oligoelementului","dative-genitive-indefinite-plural":"oligoelemente","dative-definite-genitive-plural":"oligoelementelor","singular-vocative":"oligoelementule","plural-vocative":"oligoelementelor"}},{"word":"oligofagie","pos":"noun","definitions":["oligophagy"],"forms":{"plural":"oligofagii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oligofagie","accusative-definite-nominative-singular":"oligofagia","accusative-indefinite-nominative-plural":"oligofagii","accusative-definite-nominative-plural":"oligofagiile","dative-genitive-indefinite-singular":"oligofagii","dative-definite-genitive-singular":"oligofagiei","dative-genitive-indefinite-plural":"oligofagii","dative-definite-genitive-plural":"oligofagiilor","singular-vocative":"oligofagie","plural-vocative":"oligofagiilor"}},{"word":"oligofren","pos":"noun","definitions":["oligophrenic","idiot"],"forms":{"plural":"oligofreni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oligofren","accusative-definite-nominative-singular":"oligofrenul","accusative-indefinite-nominative-plural":"oligofreni","accusative-definite-nominative-plural":"oligofrenii","dative-genitive-indefinite-singular":"oligofren","dative-definite-genitive-singular":"oligofrenului","dative-genitive-indefinite-plural":"oligofreni","dative-definite-genitive-plural":"oligofrenilor","singular-vocative":"oligofrenule","plural-vocative":"oligofrenilor"}},{"word":"oligofrenă","pos":"noun","definitions":["female equivalent of oligofren"],"forms":{"plural":"oligofrene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oligofrenă","accusative-definite-nominative-singular":"oligofrena","accusative-indefinite-nominative-plural":"oligofrene","accusative-definite-nominative-plural":"oligofrenele","dative-genitive-indefinite-singular":"oligofrene","dative-definite-genitive-singular":"oligofrenei","dative-genitive-indefinite-plural":"oligofrene","dative-definite-genitive-plural":"oligofrenelor","singular-vocative":"oligofrenă","plural-vocative":"oligofrenelor"}},{"word":"oligofrenie","pos":"noun","definitions":["oligophrenia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"oligofrenie","accusative-definite-nominative":"oligofrenia","dative-genitive-indefinite":"oligofrenii","dative-definite-genitive":"oligofreniei","vocative":"oligofrenie"}},{"word":"oligomenoree","pos":"noun","definitions":["oligomenorrhea"],"forms":{"plural":"oligomenoree","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"oligomenoree","accusative-definite-nominative-singular":"oligomenoreea","accusative-indefinite-nominative-plural":"oligomenoree","accusative-definite-nominative-plural":"oligomenoreele","dative-genitive-indefinite-singular":"oligomenoree","dative-definite-genitive-singular":"oligomenoreei","dative-genitive-indefinite-plural":"oligomenoree","dative-definite-genitive-plural":"oligomenoreelor","singular-vocative":"oligomenoree","plural-vocative":"oligomenoreelor"}},{"word":"oligomer","pos":"adj","definitions":["oligomer"],"forms":{"feminine-singular":"oligomeră","masculine-plural":"oligomeri","feminine-neuter-plural":"oligomere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oligomer","error-unrecognized-form-feminine-indefinite-singular":"oligomeră","error-unrecognized-form-indefinite-masculine-plural":"oligomeri","error-unrecognized-form-feminine-indefinite-neuter-plural":"oligomere","definite-error-unrecognized-form-masculine-neuter-singular":"oligomerul","definite-error-unrecognized-form-feminine-singular":"oligomera","definite-error-unrecognized-form-masculine-plural":"oligomerii","definite-error-unrecognized-form-feminine-neuter-plural":"oligomerele"}},{"word":"oligopol","pos":"noun","definitions":["oligopoly"],"forms":{"plural":"oligopoluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"oligopol","accusative-definite-nominative-singular":"oligopolul","accusative-indefinite-nominative-plural":"oligopoluri","accusative-definite-nominative-plural":"oligopolurile","dative-genitive-indefinite-singular":"oligopol","dative-definite-genitive-singular":"oligopolului","dative-genitive-indefinite-plural":"oligopoluri","dative-definite-genitive-plural":"oligopolurilor","singular-vocative":"oligopolule","plural-vocative":"oligopolurilor"}},{"word":"oligopotă","pos":"noun","definitions":["female equivalent of oligopot"],"forms":{"plural":"oligopote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oligopotă","accusative-definite-nominative-singular":"oligopota","accusative-indefinite-nominative-plural":"oligopote","accusative-definite-nominative-plural":"oligopotele","dative-genitive-indefinite-singular":"oligopote","dative-definite-genitive-singular":"oligopotei","dative-genitive-indefinite-plural":"oligopote","dative-definite-genitive-plural":"oligopotelor","singular-vocative":"oligopotă","plural-vocative":"oligopotelor"}},{"word":"oligosperm","pos":"noun","definitions":["oligospermic"],"forms":{"plural":"oligosperme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oligosperm","accusative-definite-nominative-singular":"oligospermul","accusative-indefinite-nominative-plural":"oligosperme","accusative-definite-nominative-plural":"oligospermele","dative-genitive-indefinite-singular":"oligosperm","dative-definite-genitive-singular":"oligospermului","dative-genitive-indefinite-plural":"oligosperme","dative-definite-genitive-plural":"oligospermelor","singular-vocative":"oligospermule","plural-vocative":"oligospermelor"}},{"word":"oligospermie","pos":"noun","definitions":["oligospermia"],"forms":{"plural":"oligospermii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oligospermie","accusative-definite-nominative-singular":"oligospermia","accusative-indefinite-nominative-plural":"oligospermii","accusative-definite-nominative-plural":"oligospermiile","dative-genitive-indefinite-singular":"oligospermii","dative-definite-genitive-singular":"oligospermiei","dative-genitive-indefinite-plural":"oligospermii","dative-definite-genitive-plural":"oligospermiilor","singular-vocative":"oligospermie","plural-vocative":"oligospermiilor"}},{"word":"oligoterapie","pos":"noun","definitions":["oligotherapy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"oligoterapie","accusative-definite-nominative":"oligoterapia","dative-genitive-indefinite":"oligoterapii","dative-definite-genitive":"oligoterapiei","vocative":"oligoterapie"}},{"word":"oligotrof","pos":"adj","definitions":["oligotrophic"],"forms":{"feminine-singular":"oligotrofă","masculine-plural":"oligotrofi","feminine-neuter-plural":"oligotrofe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oligotrof","error-unrecognized-form-feminine-indefinite-singular":"oligotrofă","error-unrecognized-form-indefinite-masculine-plural":"oligotrofi","error-unrecognized-form-feminine-indefinite-neuter-plural":"oligotrofe","definite-error-unrecognized-form-masculine-neuter-singular":"oligotroful","definite-error-unrecognized-form-feminine-singular":"oligotrofa","definite-error-unrecognized-form-masculine-plural":"oligotrofii","definite-error-unrecognized-form-feminine-neuter-plural":"oligotrofele"}},{"word":"oligotrofie","pos":"noun","definitions":["oligotrophy"],"forms":{"plural":"oligotrofii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oligotrofie","accusative-definite-nominative-singular":"oligotrofia","accusative-indefinite-nominative-plural":"oligotrofii","accusative-definite-nominative-plural":"oligotrofiile","dative-genitive-indefinite-singular":"oligotrofii","dative-definite-genitive-singular":"oligotrofiei","dative-genitive-indefinite-plural":"oligotrofii","dative-definite-genitive-plural":"oligotrofiilor","singular-vocative":"oligotrofie","plural-vocative":"oligotrofiilor"}},{"word":"oligozaharidă","pos":"noun","definitions":["oligosaccharide"],"forms":{"plural":"oligozaharide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oligozaharidă","accusative-definite-nominative-singular":"oligozaharida","accusative-indefinite-nominative-plural":"oligozaharide","accusative-definite-nominative-plural":"oligozaharidele","dative-genitive-indefinite-singular":"oligozaharide","dative-definite-genitive-singular":"oligozaharidei","dative-genitive-indefinite-plural":"oligozaharide","dative-definite-genitive-plural":"oligozaharidelor","singular-vocative":"oligozaharidă","plural-vocative":"oligozaharidelor"}},{"word":"oligurie","pos":"noun","definitions":["oliguria"],"forms":{"plural":"oligurii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oligurie","accusative-definite-nominative-singular":"oliguria","accusative-indefinite-nominative-plural":"oligurii","accusative-definite-nominative-plural":"oliguriile","dative-genitive-indefinite-singular":"oligurii","dative-definite-genitive-singular":"oliguriei","dative-genitive-indefinite-plural":"oligurii","dative-definite-genitive-plural":"oliguriilor","singular-vocative":"oligurie","plural-vocative":"oliguriilor"}},{"word":"Olimp","pos":"name","definitions":["a locality in Mangalia, Constanța County, Romania"],"gender":"m"},{"word":"olimpiadă","pos":"noun","definitions":["olympiad"],"forms":{"plural":"olimpiade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"olimpiadă","accusative-definite-nominative-singular":"olimpiada","accusative-indefinite-nominative-plural":"olimpiade","accusative-definite-nominative-plural":"olimpiadele","dative-genitive-indefinite-singular":"olimpiade","dative-definite-genitive-singular":"olimpiadei","dative-genitive-indefinite-plural":"olimpiade","dative-definite-genitive-plural":"olimpiadelor","singular-vocative":"olimpiadă","plural-vocative":"olimpiadelor"}},{"word":"olimpian","pos":"adj","definitions":["Olympian"],"forms":{"feminine-singular":"olimpiană","masculine-plural":"olimpieni","feminine-neuter-plural":"olimpiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"olimpian","error-unrecognized-form-feminine-indefinite-singular":"olimpiană","error-unrecognized-form-indefinite-masculine-plural":"olimpieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"olimpiene","definite-error-unrecognized-form-masculine-neuter-singular":"olimpianul","definite-error-unrecognized-form-feminine-singular":"olimpiana","definite-error-unrecognized-form-masculine-plural":"olimpienii","definite-error-unrecognized-form-feminine-neuter-plural":"olimpienele"}},{"word":"olimpiană","pos":"noun","definitions":["female equivalent of olimpian"],"forms":{"plural":"olimpiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"olimpiană","accusative-definite-nominative-singular":"olimpiana","accusative-indefinite-nominative-plural":"olimpiene","accusative-definite-nominative-plural":"olimpienele","dative-genitive-indefinite-singular":"olimpiene","dative-definite-genitive-singular":"olimpienei","dative-genitive-indefinite-plural":"olimpiene","dative-definite-genitive-plural":"olimpienelor","singular-vocative":"olimpiană","plural-vocative":"olimpienelor"}},{"word":"olimpianism","pos":"noun","definitions":["Olympianism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"olimpianism","accusative-definite-nominative":"olimpianismul","dative-genitive-indefinite":"olimpianism","dative-definite-genitive":"olimpianismului","vocative":"olimpianismule"}},{"word":"olimpic","pos":"adj","definitions":["Olympic"],"pronunciation":"/oˈlim.pik/","forms":{"feminine-singular":"olimpică","masculine-plural":"olimpici","feminine-neuter-plural":"olimpice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"olimpic","error-unrecognized-form-feminine-indefinite-singular":"olimpică","error-unrecognized-form-indefinite-masculine-plural":"olimpici","error-unrecognized-form-feminine-indefinite-neuter-plural":"olimpice","definite-error-unrecognized-form-masculine-neuter-singular":"olimpicul","definite-error-unrecognized-form-feminine-singular":"olimpica","definite-error-unrecognized-form-masculine-plural":"olimpicii","definite-error-unrecognized-form-feminine-neuter-plural":"olimpicele"}},{"word":"olimpică","pos":"noun","definitions":["female equivalent of olimpic"],"forms":{"plural":"olimpice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"olimpică","accusative-definite-nominative-singular":"olimpica","accusative-indefinite-nominative-plural":"olimpice","accusative-definite-nominative-plural":"olimpicele","dative-genitive-indefinite-singular":"olimpice","dative-definite-genitive-singular":"olimpicei","dative-genitive-indefinite-plural":"olimpice","dative-definite-genitive-plural":"olimpicelor","singular-vocative":"olimpică","plural-vocative":"olimpicelor"}},{"word":"Olinescu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Olinescu"}},{"word":"Oliniuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Oliniuc"}},{"word":"Olișcani","pos":"name","definitions":["a village in Olișcani, Șoldănești Raion, Moldova","a commune of Șoldănești Raion, Moldova"],"gender":"m"},{"word":"olișoară","pos":"noun","definitions":["diminutive of oală"],"forms":{"plural":"olișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"olișoară","accusative-definite-nominative-singular":"olișoara","accusative-indefinite-nominative-plural":"olișoare","accusative-definite-nominative-plural":"olișoarele","dative-genitive-indefinite-singular":"olișoare","dative-definite-genitive-singular":"olișoarei","dative-genitive-indefinite-plural":"olișoare","dative-definite-genitive-plural":"olișoarelor","singular-vocative":"olișoară","plural-vocative":"olișoarelor"}},{"word":"Oliță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Oliță"}},{"word":"oliță","pos":"noun","definitions":["diminutive of oală; small pot","potty"],"forms":{"plural":"olițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oliță","accusative-definite-nominative-singular":"olița","accusative-indefinite-nominative-plural":"olițe","accusative-definite-nominative-plural":"olițele","dative-genitive-indefinite-singular":"olițe","dative-definite-genitive-singular":"oliței","dative-genitive-indefinite-plural":"olițe","dative-definite-genitive-plural":"olițelor","singular-vocative":"oliță","plural-vocative":"olițelor"}},{"word":"oliv","pos":"adj","definitions":["olive (color)"],"pronunciation":"/oˈliv/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oliv","error-unrecognized-form-feminine-indefinite-singular":"oliv","error-unrecognized-form-indefinite-masculine-plural":"oliv","error-unrecognized-form-feminine-indefinite-neuter-plural":"oliv","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"oliv","pos":"noun","definitions":["olive (color)"],"pronunciation":"/oˈliv/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"oliv","accusative-definite-nominative":"olivul","dative-genitive-indefinite":"oliv","dative-definite-genitive":"olivului","vocative":"olivule"}},{"word":"oliv","pos":"noun","definitions":["olive tree"],"pronunciation":"/oˈliv/","forms":{"plural":"olivi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oliv","accusative-definite-nominative-singular":"olivul","accusative-indefinite-nominative-plural":"olivi","accusative-definite-nominative-plural":"olivii","dative-genitive-indefinite-singular":"oliv","dative-definite-genitive-singular":"olivului","dative-genitive-indefinite-plural":"olivi","dative-definite-genitive-plural":"olivilor","singular-vocative":"olivule","plural-vocative":"olivilor"}},{"word":"olivă","pos":"noun","definitions":["olive (fruit)"],"pronunciation":"/oˈli.və/","forms":{"plural":"olive","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"olivă","accusative-definite-nominative-singular":"oliva","accusative-indefinite-nominative-plural":"olive","accusative-definite-nominative-plural":"olivele","dative-genitive-indefinite-singular":"olive","dative-definite-genitive-singular":"olivei","dative-genitive-indefinite-plural":"olive","dative-definite-genitive-plural":"olivelor","singular-vocative":"olivă","plural-vocative":"olivelor"}},{"word":"olivieră","pos":"noun","definitions":["olive press"],"forms":{"plural":"oliviere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"olivieră","accusative-definite-nominative-singular":"oliviera","accusative-indefinite-nominative-plural":"oliviere","accusative-definite-nominative-plural":"olivierele","dative-genitive-indefinite-singular":"oliviere","dative-definite-genitive-singular":"olivierei","dative-genitive-indefinite-plural":"oliviere","dative-definite-genitive-plural":"olivierelor","singular-vocative":"olivieră","plural-vocative":"olivierelor"}},{"word":"olivină","pos":"noun","definitions":["olivine"],"forms":{"plural":"olivine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"olivină","accusative-definite-nominative-singular":"olivina","accusative-indefinite-nominative-plural":"olivine","accusative-definite-nominative-plural":"olivinele","dative-genitive-indefinite-singular":"olivine","dative-definite-genitive-singular":"olivinei","dative-genitive-indefinite-plural":"olivine","dative-definite-genitive-plural":"olivinelor","singular-vocative":"olivină","plural-vocative":"olivinelor"}},{"word":"Oliviu","pos":"name","definitions":["a male given name, equivalent to English Olivio"],"gender":"m"},{"word":"olm","pos":"noun","definitions":["perfume, fragrance"],"forms":{"plural":"olmuri"}},{"word":"olocaust","pos":"noun","definitions":["alternative form of holocaust"],"forms":{"plural":"olocausturi"}},{"word":"olog","pos":"adj","definitions":["lame, crippled"],"pronunciation":"/oˈloɡ/","forms":{"feminine-singular":"oloagă","masculine-plural":"ologi","feminine-neuter-plural":"oloage","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"olog","error-unrecognized-form-feminine-indefinite-singular":"oloagă","error-unrecognized-form-indefinite-masculine-plural":"ologi","error-unrecognized-form-feminine-indefinite-neuter-plural":"oloage","definite-error-unrecognized-form-masculine-neuter-singular":"ologul","definite-error-unrecognized-form-feminine-singular":"oloaga","definite-error-unrecognized-form-masculine-plural":"ologii","definite-error-unrecognized-form-feminine-neuter-plural":"oloagele"}},{"word":"ologeală","pos":"noun","definitions":["lameness"],"forms":{"plural":"ologeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ologeală","accusative-definite-nominative-singular":"ologeala","accusative-indefinite-nominative-plural":"ologeli","accusative-definite-nominative-plural":"ologelile","dative-genitive-indefinite-singular":"ologeli","dative-definite-genitive-singular":"ologelii","dative-genitive-indefinite-plural":"ologeli","dative-definite-genitive-plural":"ologelilor","singular-vocative":"ologeală","plural-vocative":"ologelilor"}},{"word":"Ologeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ologeanu"}},{"word":"ologel","pos":"adj","definitions":["diminutive of olog"],"forms":{"feminine-singular":"ologelă","masculine-plural":"ologeli","feminine-neuter-plural":"ologele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ologel","error-unrecognized-form-feminine-indefinite-singular":"ologelă","error-unrecognized-form-indefinite-masculine-plural":"ologeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"ologele","definite-error-unrecognized-form-masculine-neuter-singular":"ologelul","definite-error-unrecognized-form-feminine-singular":"ologela","definite-error-unrecognized-form-masculine-plural":"ologelii","definite-error-unrecognized-form-feminine-neuter-plural":"ologelele"}},{"word":"Ologeni","pos":"name","definitions":["a village in Poienarii Burchii, Prahova County, Romania"],"gender":"m"},{"word":"Ologi","pos":"name","definitions":["a village in Vâlcea County, Romania. Renamed to Crângu in 1964."],"gender":"m-p"},{"word":"ologi","pos":"verb","definitions":["to lame"],"forms":{"canonical":"a ologi 4th conjugation","present-singular-third-person":"ologește","participle-past":"ologit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ologi","gerund":"ologind","first-person-indicative-present-singular":"ologesc","indicative-present-second-person-singular":"ologești","indicative-present-singular-third-person":"ologește","first-person-indicative-plural-present":"ologim","indicative-plural-present-second-person":"ologiți","indicative-plural-present-third-person":"ologesc","first-person-imperfect-indicative-singular":"ologeam","imperfect-indicative-second-person-singular":"ologeai","imperfect-indicative-singular-third-person":"ologea","first-person-imperfect-indicative-plural":"ologeam","imperfect-indicative-plural-second-person":"ologeați","imperfect-indicative-plural-third-person":"ologeau","first-person-indicative-perfect-singular":"ologii","indicative-perfect-second-person-singular":"ologiși","indicative-perfect-singular-third-person":"ologi","first-person-indicative-perfect-plural":"ologirăm","indicative-perfect-plural-second-person":"ologirăți","indicative-perfect-plural-third-person":"ologiră","first-person-indicative-pluperfect-singular":"ologisem","indicative-pluperfect-second-person-singular":"ologiseși","indicative-pluperfect-singular-third-person":"ologise","first-person-indicative-pluperfect-plural":"ologiserăm","indicative-pluperfect-plural-second-person":"ologiserăți","indicative-pluperfect-plural-third-person":"ologiseră","first-person-present-singular-subjunctive":"să ologesc","present-second-person-singular-subjunctive":"să ologești","present-singular-subjunctive-third-person":"să ologească","first-person-plural-present-subjunctive":"să ologim","plural-present-second-person-subjunctive":"să ologiți","plural-present-subjunctive-third-person":"să ologească","imperative-second-person-singular":"ologește","imperative-plural-second-person":"ologiți","imperative-negative-second-person-singular":"nu ologi","imperative-negative-plural-second-person":"nu ologiți"}},{"word":"ologie","pos":"noun","definitions":["laming"],"forms":{"plural":"ologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ologie","accusative-definite-nominative-singular":"ologia","accusative-indefinite-nominative-plural":"ologii","accusative-definite-nominative-plural":"ologiile","dative-genitive-indefinite-singular":"ologii","dative-definite-genitive-singular":"ologiei","dative-genitive-indefinite-plural":"ologii","dative-definite-genitive-plural":"ologiilor","singular-vocative":"ologie","plural-vocative":"ologiilor"}},{"word":"ologire","pos":"noun","definitions":["laming"],"forms":{"plural":"ologiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ologire","accusative-definite-nominative-singular":"ologirea","accusative-indefinite-nominative-plural":"ologiri","accusative-definite-nominative-plural":"ologirile","dative-genitive-indefinite-singular":"ologiri","dative-definite-genitive-singular":"ologirii","dative-genitive-indefinite-plural":"ologiri","dative-definite-genitive-plural":"ologirilor","singular-vocative":"ologire","plural-vocative":"ologirilor"}},{"word":"ologit","pos":"adj","definitions":["crippled"],"forms":{"feminine-singular":"ologită","masculine-plural":"ologiți","feminine-neuter-plural":"ologite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ologit","error-unrecognized-form-feminine-indefinite-singular":"ologită","error-unrecognized-form-indefinite-masculine-plural":"ologiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ologite","definite-error-unrecognized-form-masculine-neuter-singular":"ologitul","definite-error-unrecognized-form-feminine-singular":"ologita","definite-error-unrecognized-form-masculine-plural":"ologiții","definite-error-unrecognized-form-feminine-neuter-plural":"ologitele"}},{"word":"olograf","pos":"adj","definitions":["holograph"],"forms":{"feminine-singular":"olografă","masculine-plural":"olografi","feminine-neuter-plural":"olografe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"olograf","error-unrecognized-form-feminine-indefinite-singular":"olografă","error-unrecognized-form-indefinite-masculine-plural":"olografi","error-unrecognized-form-feminine-indefinite-neuter-plural":"olografe","definite-error-unrecognized-form-masculine-neuter-singular":"olograful","definite-error-unrecognized-form-feminine-singular":"olografa","definite-error-unrecognized-form-masculine-plural":"olografii","definite-error-unrecognized-form-feminine-neuter-plural":"olografele"}},{"word":"olografie","pos":"noun","definitions":["holography"],"forms":{"plural":"olografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"olografie","accusative-definite-nominative-singular":"olografia","accusative-indefinite-nominative-plural":"olografii","accusative-definite-nominative-plural":"olografiile","dative-genitive-indefinite-singular":"olografii","dative-definite-genitive-singular":"olografiei","dative-genitive-indefinite-plural":"olografii","dative-definite-genitive-plural":"olografiilor","singular-vocative":"olografie","plural-vocative":"olografiilor"}},{"word":"Ologu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ologu"}},{"word":"oloi","pos":"noun","definitions":["augmentative of oală"],"forms":{"plural":"oloaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oloi","accusative-definite-nominative-singular":"oloiul","accusative-indefinite-nominative-plural":"oloaie","accusative-definite-nominative-plural":"oloaiele","dative-genitive-indefinite-singular":"oloi","dative-definite-genitive-singular":"oloiului","dative-genitive-indefinite-plural":"oloaie","dative-definite-genitive-plural":"oloaielor","singular-vocative":"oloiule","plural-vocative":"oloaielor"}},{"word":"oloierniță","pos":"noun","definitions":["oil press"],"forms":{"plural":"oloiernițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oloierniță","accusative-definite-nominative-singular":"oloiernița","accusative-indefinite-nominative-plural":"oloiernițe","accusative-definite-nominative-plural":"oloiernițele","dative-genitive-indefinite-singular":"oloiernițe","dative-definite-genitive-singular":"oloierniței","dative-genitive-indefinite-plural":"oloiernițe","dative-definite-genitive-plural":"oloiernițelor","singular-vocative":"oloierniță","plural-vocative":"oloiernițelor"}},{"word":"oloiniță","pos":"noun","definitions":["oil press"],"forms":{"plural":"oloinițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oloiniță","accusative-definite-nominative-singular":"oloinița","accusative-indefinite-nominative-plural":"oloinițe","accusative-definite-nominative-plural":"oloinițele","dative-genitive-indefinite-singular":"oloinițe","dative-definite-genitive-singular":"oloiniței","dative-genitive-indefinite-plural":"oloinițe","dative-definite-genitive-plural":"oloinițelor","singular-vocative":"oloiniță","plural-vocative":"oloinițelor"}},{"word":"oloios","pos":"adj","definitions":["oily"],"forms":{"feminine-singular":"oloioasă","masculine-plural":"oloioși","feminine-neuter-plural":"oloioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oloios","error-unrecognized-form-feminine-indefinite-singular":"oloioasă","error-unrecognized-form-indefinite-masculine-plural":"oloioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"oloioase","definite-error-unrecognized-form-masculine-neuter-singular":"oloiosul","definite-error-unrecognized-form-feminine-singular":"oloioasa","definite-error-unrecognized-form-masculine-plural":"oloioșii","definite-error-unrecognized-form-feminine-neuter-plural":"oloioasele"}},{"word":"oloisă","pos":"noun","definitions":["stonecrop (Sedum genus)"],"forms":{"plural":"oloise","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oloisă","accusative-definite-nominative-singular":"oloisa","accusative-indefinite-nominative-plural":"oloise","accusative-definite-nominative-plural":"oloisele","dative-genitive-indefinite-singular":"oloise","dative-definite-genitive-singular":"oloisei","dative-genitive-indefinite-plural":"oloise","dative-definite-genitive-plural":"oloiselor","singular-vocative":"oloisă","plural-vocative":"oloiselor"}},{"word":"oloiște","pos":"noun","definitions":["oil press"],"forms":{"plural":"oloiști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oloiște","accusative-definite-nominative-singular":"oloiștea","accusative-indefinite-nominative-plural":"oloiști","accusative-definite-nominative-plural":"oloiștile","dative-genitive-indefinite-singular":"oloiști","dative-definite-genitive-singular":"oloiștii","dative-genitive-indefinite-plural":"oloiști","dative-definite-genitive-plural":"oloiștilor","singular-vocative":"oloiște","plural-vocative":"oloiștilor"}},{"word":"olonomie","pos":"noun","definitions":["holonomy"],"forms":{"plural":"olonomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"olonomie","accusative-definite-nominative-singular":"olonomia","accusative-indefinite-nominative-plural":"olonomii","accusative-definite-nominative-plural":"olonomiile","dative-genitive-indefinite-singular":"olonomii","dative-definite-genitive-singular":"olonomiei","dative-genitive-indefinite-plural":"olonomii","dative-definite-genitive-plural":"olonomiilor","singular-vocative":"olonomie","plural-vocative":"olonomiilor"}},{"word":"oloreală","pos":"noun","definitions":["breeze"],"forms":{"plural":"oloreli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oloreală","accusative-definite-nominative-singular":"oloreala","accusative-indefinite-nominative-plural":"olorele","accusative-definite-nominative-plural":"olorelele","dative-genitive-indefinite-singular":"olorele","dative-definite-genitive-singular":"olorelei","dative-genitive-indefinite-plural":"olorele","dative-definite-genitive-plural":"olorelelor","singular-vocative":"oloreală","plural-vocative":"olorelelor"}},{"word":"oloș","pos":"noun","definitions":["dwarf"],"forms":{"plural":"oloși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oloș","accusative-definite-nominative-singular":"oloșul","accusative-indefinite-nominative-plural":"oloși","accusative-definite-nominative-plural":"oloșii","dative-genitive-indefinite-singular":"oloș","dative-definite-genitive-singular":"oloșului","dative-genitive-indefinite-plural":"oloși","dative-definite-genitive-plural":"oloșilor","singular-vocative":"oloșule","plural-vocative":"oloșilor"}},{"word":"Oloșag","pos":"name","definitions":["a village in Știuca, Timiș County, Romania"],"gender":"f"},{"word":"Olosig","pos":"name","definitions":["a locality in Săcueni, Bihor County, Romania"],"gender":"m"},{"word":"olovină","pos":"noun","definitions":["beer"],"forms":{"plural":"olovine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"olovină","accusative-definite-nominative-singular":"olovina","accusative-indefinite-nominative-plural":"olovine","accusative-definite-nominative-plural":"olovinele","dative-genitive-indefinite-singular":"olovine","dative-definite-genitive-singular":"olovinei","dative-genitive-indefinite-plural":"olovine","dative-definite-genitive-plural":"olovinelor","singular-vocative":"olovină","plural-vocative":"olovinelor"}},{"word":"olpă","pos":"noun","definitions":["olpe"],"forms":{"plural":"olpe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"olpă","accusative-definite-nominative-singular":"olpa","accusative-indefinite-nominative-plural":"olpe","accusative-definite-nominative-plural":"olpele","dative-genitive-indefinite-singular":"olpe","dative-definite-genitive-singular":"olpei","dative-genitive-indefinite-plural":"olpe","dative-definite-genitive-plural":"olpelor","singular-vocative":"olpă","plural-vocative":"olpelor"}},{"word":"Olt","pos":"name","definitions":["Olt (a river in Romania) (the longest flowing exclusively through it)","Olt (a county of Romania)"],"pronunciation":"/olt/","gender":"n","forms":{"dative-genitive":"Oltului","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"Olt","accusative-definite-nominative":"Oltul","dative-genitive-indefinite":"Olt","dative-definite-genitive":"Oltului","vocative":"Oltule"}},{"word":"oltar","pos":"noun","definitions":["altar"],"forms":{"plural":"oltare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oltar","accusative-definite-nominative-singular":"oltarul","accusative-indefinite-nominative-plural":"oltare","accusative-definite-nominative-plural":"oltarele","dative-genitive-indefinite-singular":"oltar","dative-definite-genitive-singular":"oltarului","dative-genitive-indefinite-plural":"oltare","dative-definite-genitive-plural":"oltarelor","singular-vocative":"oltarule","plural-vocative":"oltarelor"}},{"word":"oltarnic","pos":"noun","definitions":["priest"],"forms":{"plural":"oltarnici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oltarnic","accusative-definite-nominative-singular":"oltarnicul","accusative-indefinite-nominative-plural":"oltarnici","accusative-definite-nominative-plural":"oltarnicii","dative-genitive-indefinite-singular":"oltarnic","dative-definite-genitive-singular":"oltarnicului","dative-genitive-indefinite-plural":"oltarnici","dative-definite-genitive-plural":"oltarnicilor","singular-vocative":"oltarnicule","plural-vocative":"oltarnicilor"}},{"word":"Oltean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Oltean"}},{"word":"oltean","pos":"noun","definitions":["native or inhabitant of the geographic region of Oltenia, including modern Gorj County and Dolj County and parts of modern Mehedinți County, Vâlcea County, Olt County and Teleorman County, Romania (usually male)"],"forms":{"plural":"olteni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oltean","accusative-definite-nominative-singular":"olteanul","accusative-indefinite-nominative-plural":"olteni","accusative-definite-nominative-plural":"oltenii","dative-genitive-indefinite-singular":"oltean","dative-definite-genitive-singular":"olteanului","dative-genitive-indefinite-plural":"olteni","dative-definite-genitive-plural":"oltenilor","singular-vocative":"olteanule","plural-vocative":"oltenilor"}},{"word":"Olteana","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Șucu"],"gender":"f"},{"word":"olteană","pos":"noun","definitions":["female equivalent of oltean"],"forms":{"plural":"oltene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"olteană","accusative-definite-nominative-singular":"olteana","accusative-indefinite-nominative-plural":"oltene","accusative-definite-nominative-plural":"oltenele","dative-genitive-indefinite-singular":"oltene","dative-definite-genitive-singular":"oltenei","dative-genitive-indefinite-plural":"oltene","dative-definite-genitive-plural":"oltenelor","singular-vocative":"olteană","plural-vocative":"oltenelor"}},{"word":"Olteanca","pos":"name","definitions":["a village in Pădina, Mehedinți County, Romania","a village in Segarcea-Vale, Teleorman County, Romania","a village in Glăvile, Vâlcea County, Romania","a village in Lădești, Vâlcea County, Romania"],"gender":"f"},{"word":"olteanca","pos":"noun","definitions":["definite nominative/accusative singular of olteancă"]},{"word":"olteancă","pos":"noun","definitions":["female equivalent of oltean"],"forms":{"plural":"oltence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"olteancă","accusative-definite-nominative-singular":"olteanca","accusative-indefinite-nominative-plural":"oltence","accusative-definite-nominative-plural":"oltencele","dative-genitive-indefinite-singular":"oltence","dative-definite-genitive-singular":"oltencei","dative-genitive-indefinite-plural":"oltence","dative-definite-genitive-plural":"oltencelor","singular-vocative":"olteancă","plural-vocative":"oltencelor"}},{"word":"Olteanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Olteanu"}},{"word":"Oltenaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Oltenaș"}},{"word":"oltenaș","pos":"noun","definitions":["diminutive of oltean"],"forms":{"plural":"oltenași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oltenaș","accusative-definite-nominative-singular":"oltenașul","accusative-indefinite-nominative-plural":"oltenași","accusative-definite-nominative-plural":"oltenașii","dative-genitive-indefinite-singular":"oltenaș","dative-definite-genitive-singular":"oltenașului","dative-genitive-indefinite-plural":"oltenași","dative-definite-genitive-plural":"oltenașilor","singular-vocative":"oltenașule","plural-vocative":"oltenașilor"}},{"word":"Olteneasa","pos":"name","definitions":["a river in Maramureș, Romania, tributary to the Suciu"],"gender":"f"},{"word":"oltenesc","pos":"adj","definitions":["Oltenian"],"forms":{"feminine-singular":"oltenească","plural":"oltenești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oltenesc","error-unrecognized-form-feminine-indefinite-singular":"oltenească","error-unrecognized-form-indefinite-masculine-plural":"oltenești","error-unrecognized-form-feminine-indefinite-neuter-plural":"oltenești","definite-error-unrecognized-form-masculine-neuter-singular":"oltenescul","definite-error-unrecognized-form-feminine-singular":"olteneasca","definite-error-unrecognized-form-masculine-plural":"olteneștii","definite-error-unrecognized-form-feminine-neuter-plural":"olteneștile"}},{"word":"Oltenescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Oltenescu"}},{"word":"oltenește","pos":"adv","definitions":["like an Oltenian"]},{"word":"Oltenești","pos":"name","definitions":["a commune of Vaslui County, Romania","a village in Oltenești, Vaslui County, Romania"],"gender":"m"},{"word":"Olteni","pos":"name","definitions":["a village in Râmeț, Alba County, Romania","a village in Independența, Constanța County, Romania","a village in Bodoc, Covasna County, Romania","a village in Lucieni, Dâmbovița County, Romania","a village in Uliești, Dâmbovița County, Romania"],"gender":"m"},{"word":"Oltenia","pos":"name","definitions":["Oltenia (a region of Romania)"],"pronunciation":"[olˈte.ni.a]","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"Oltenie","accusative-definite-nominative":"Oltenia","dative-genitive-indefinite":"Oltenii","dative-definite-genitive":"Olteniei","vocative":"Oltenie"}},{"word":"Olteniceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Olteniceanu"}},{"word":"Oltenița","pos":"name","definitions":["a city in Călărași County, Romania"],"pronunciation":"/olˈtenitsa/","gender":"f"},{"word":"Olteț","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Olt","a river in Romania, tributary to the Olt","a village in Viștea, Brașov County, Romania"],"gender":"m"},{"word":"Oltețani","pos":"name","definitions":["a village in Laloșu, Vâlcea County, Romania"],"gender":"m"},{"word":"Oltețeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Oltețeanu"}},{"word":"Oltețu","pos":"name","definitions":["a village in Zătreni, Vâlcea County, Romania"],"gender":"m"},{"word":"Oltianu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Oltianu"}},{"word":"Oltișor","pos":"name","definitions":["a river in Olt, Romania, tributary to the Dascălu"],"gender":"m"},{"word":"Oltișoru","pos":"name","definitions":["a village in Găneasa, Olt County, Romania"],"gender":"m"},{"word":"Oltul","pos":"name","definitions":["definite nominative/accusative singular of Olt"],"pronunciation":"/ˈol.tul/","gender":"n"},{"word":"oluț","pos":"noun","definitions":["diminutive of ol; small pot"],"forms":{"plural":"oluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oluț","accusative-definite-nominative-singular":"oluțul","accusative-indefinite-nominative-plural":"oluțe","accusative-definite-nominative-plural":"oluțele","dative-genitive-indefinite-singular":"oluț","dative-definite-genitive-singular":"oluțului","dative-genitive-indefinite-plural":"oluțe","dative-definite-genitive-plural":"oluțelor","singular-vocative":"oluțule","plural-vocative":"oluțelor"}},{"word":"oluță","pos":"noun","definitions":["diminutive of oală"],"forms":{"plural":"oluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oluță","accusative-definite-nominative-singular":"oluța","accusative-indefinite-nominative-plural":"oluțe","accusative-definite-nominative-plural":"oluțele","dative-genitive-indefinite-singular":"oluțe","dative-definite-genitive-singular":"oluței","dative-genitive-indefinite-plural":"oluțe","dative-definite-genitive-plural":"oluțelor","singular-vocative":"oluță","plural-vocative":"oluțelor"}},{"word":"om","pos":"noun","definitions":["man (male)","human"],"pronunciation":"/ˈom/","forms":{"plural":"oameni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"om","accusative-definite-nominative-singular":"omul","accusative-indefinite-nominative-plural":"oameni","accusative-definite-nominative-plural":"oamenii","dative-genitive-indefinite-singular":"om","dative-definite-genitive-singular":"omului","dative-genitive-indefinite-plural":"oameni","dative-definite-genitive-plural":"oamenilor","singular-vocative":"omule","plural-vocative":"oamenilor","alternative-archaic":"omu"}},{"word":"om","pos":"verb","definitions":["might"],"pronunciation":"/ˈom/","examples":[{"ro":"om merge mâine undeva","en":"we might go somewhere tomorrow"}],"forms":{"alternative-archaic":"omu"}},{"word":"om de acțiune","pos":"noun","definitions":["action man"],"forms":{"plural":"oameni de acțiune"}},{"word":"om de afaceri","pos":"noun","definitions":["businessman"],"forms":{"plural":"oameni de afaceri"}},{"word":"om de finanțe","pos":"noun","definitions":["financier"],"forms":{"plural":"oameni de finanțe"}},{"word":"om de legătură","pos":"noun","definitions":["liaison"],"forms":{"plural":"oameni de legătură"}},{"word":"om de lege","pos":"noun","definitions":["man of law"]},{"word":"om de litere","pos":"noun","definitions":["man of letters"]},{"word":"om de lume","pos":"noun","definitions":["man of the world"],"forms":{"plural":"oameni de lume"}},{"word":"om de stat","pos":"noun","definitions":["statesman"],"forms":{"plural":"oameni de stat"}},{"word":"om de știință","pos":"noun","definitions":["scientist"],"forms":{"plural":"oameni de știință"}},{"word":"om de zăpadă","pos":"noun","definitions":["snowman"],"forms":{"plural":"oameni de zăpadă"}},{"word":"om mare","pos":"noun","definitions":["adult"],"forms":{"plural":"oameni mari"}},{"word":"om politic","pos":"noun","definitions":["politician"],"forms":{"plural":"oameni politici"}},{"word":"omag","pos":"noun","definitions":["aconite"],"forms":{"plural":"omagi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"omag","accusative-definite-nominative-singular":"omagul","accusative-indefinite-nominative-plural":"omagi","accusative-definite-nominative-plural":"omagii","dative-genitive-indefinite-singular":"omag","dative-definite-genitive-singular":"omagului","dative-genitive-indefinite-plural":"omagi","dative-definite-genitive-plural":"omagilor","singular-vocative":"omagule","plural-vocative":"omagilor"}},{"word":"omagia","pos":"verb","definitions":["to render homage"],"forms":{"canonical":"a omagia 1st conjugation","present-singular-third-person":"omagiează","participle-past":"omagiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a omagia","gerund":"omagiind","first-person-indicative-present-singular":"omagiez","indicative-present-second-person-singular":"omagiezi","indicative-present-singular-third-person":"omagiază","first-person-indicative-plural-present":"omagiem","indicative-plural-present-second-person":"omagiați","indicative-plural-present-third-person":"omagiază","first-person-imperfect-indicative-singular":"omagiam","imperfect-indicative-second-person-singular":"omagiai","imperfect-indicative-singular-third-person":"omagia","first-person-imperfect-indicative-plural":"omagiam","imperfect-indicative-plural-second-person":"omagiați","imperfect-indicative-plural-third-person":"omagiau","first-person-indicative-perfect-singular":"omagiai","indicative-perfect-second-person-singular":"omagiași","indicative-perfect-singular-third-person":"omagie","first-person-indicative-perfect-plural":"omagiarăm","indicative-perfect-plural-second-person":"omagiarăți","indicative-perfect-plural-third-person":"omagiară","first-person-indicative-pluperfect-singular":"omagiasem","indicative-pluperfect-second-person-singular":"omagiaseși","indicative-pluperfect-singular-third-person":"omagiase","first-person-indicative-pluperfect-plural":"omagiaserăm","indicative-pluperfect-plural-second-person":"omagiaserăți","indicative-pluperfect-plural-third-person":"omagiaseră","first-person-present-singular-subjunctive":"să omagiez","present-second-person-singular-subjunctive":"să omagiezi","present-singular-subjunctive-third-person":"să omagieze","first-person-plural-present-subjunctive":"să omagiem","plural-present-second-person-subjunctive":"să omagiați","plural-present-subjunctive-third-person":"să omagieze","imperative-second-person-singular":"omagiază","imperative-plural-second-person":"omagiați","imperative-negative-second-person-singular":"nu omagia","imperative-negative-plural-second-person":"nu omagiați"}},{"word":"omagial","pos":"adj","definitions":["reverential"],"forms":{"feminine-singular":"omagială","masculine-plural":"omagiali","feminine-neuter-plural":"omagiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omagial","error-unrecognized-form-feminine-indefinite-singular":"omagială","error-unrecognized-form-indefinite-masculine-plural":"omagiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"omagiale","definite-error-unrecognized-form-masculine-neuter-singular":"omagialul","definite-error-unrecognized-form-feminine-singular":"omagiala","definite-error-unrecognized-form-masculine-plural":"omagialii","definite-error-unrecognized-form-feminine-neuter-plural":"omagialele"}},{"word":"omagiere","pos":"noun","definitions":["homage"],"forms":{"plural":"omagieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"omagiere","accusative-definite-nominative-singular":"omagierea","accusative-indefinite-nominative-plural":"omagieri","accusative-definite-nominative-plural":"omagierile","dative-genitive-indefinite-singular":"omagieri","dative-definite-genitive-singular":"omagierii","dative-genitive-indefinite-plural":"omagieri","dative-definite-genitive-plural":"omagierilor","singular-vocative":"omagiere","plural-vocative":"omagierilor"}},{"word":"omagiu","pos":"noun","definitions":["homage (in feudalism, the formal oath of a vassal to his or her lord)","homage (a token of respect, trust, admiration)"],"forms":{"plural":"omagii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"omagiu","accusative-definite-nominative-singular":"omagiul","accusative-indefinite-nominative-plural":"omagii","accusative-definite-nominative-plural":"omagiile","dative-genitive-indefinite-singular":"omagiu","dative-definite-genitive-singular":"omagiului","dative-genitive-indefinite-plural":"omagii","dative-definite-genitive-plural":"omagiilor","singular-vocative":"omagiule","plural-vocative":"omagiilor"}},{"word":"omaj","pos":"noun","definitions":["obsolete form of omagiu"],"forms":{"plural":"omajii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"omaj","accusative-definite-nominative-singular":"omajul","accusative-indefinite-nominative-plural":"omajii","accusative-definite-nominative-plural":"omajiile","dative-genitive-indefinite-singular":"omaj","dative-definite-genitive-singular":"omajului","dative-genitive-indefinite-plural":"omajii","dative-definite-genitive-plural":"omajiilor","singular-vocative":"omajule","plural-vocative":"omajiilor"}},{"word":"omalgie","pos":"noun","definitions":["omalgia"],"forms":{"plural":"omalgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"omalgie","accusative-definite-nominative-singular":"omalgia","accusative-indefinite-nominative-plural":"omalgii","accusative-definite-nominative-plural":"omalgiile","dative-genitive-indefinite-singular":"omalgii","dative-definite-genitive-singular":"omalgiei","dative-genitive-indefinite-plural":"omalgii","dative-definite-genitive-plural":"omalgiilor","singular-vocative":"omalgie","plural-vocative":"omalgiilor"}},{"word":"oman","pos":"noun","definitions":["inula, elecampane (Inula spp., especially Inula helenium)"],"pronunciation":"/oˈman/","forms":{"plural":"omani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oman","accusative-definite-nominative-singular":"omanul","accusative-indefinite-nominative-plural":"omani","accusative-definite-nominative-plural":"omanii","dative-genitive-indefinite-singular":"oman","dative-definite-genitive-singular":"omanului","dative-genitive-indefinite-plural":"omani","dative-definite-genitive-plural":"omanilor","singular-vocative":"omanule","plural-vocative":"omanilor"}},{"word":"omanez","pos":"adj","definitions":["Omani"],"forms":{"feminine-singular":"omaneză","masculine-plural":"omanezi","feminine-neuter-plural":"omaneze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omanez","error-unrecognized-form-feminine-indefinite-singular":"omaneză","error-unrecognized-form-indefinite-masculine-plural":"omanezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"omaneze","definite-error-unrecognized-form-masculine-neuter-singular":"omanezul","definite-error-unrecognized-form-feminine-singular":"omaneza","definite-error-unrecognized-form-masculine-plural":"omanezii","definite-error-unrecognized-form-feminine-neuter-plural":"omanezele"}},{"word":"omanez","pos":"noun","definitions":["Omani"],"forms":{"plural":"omanezi","feminine":"equivalent omaneză","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"omanez","accusative-definite-nominative-singular":"omanezul","accusative-indefinite-nominative-plural":"omanezi","accusative-definite-nominative-plural":"omanezii","dative-genitive-indefinite-singular":"omanez","dative-definite-genitive-singular":"omanezului","dative-genitive-indefinite-plural":"omanezi","dative-definite-genitive-plural":"omanezilor","singular-vocative":"omanezule","plural-vocative":"omanezilor"}},{"word":"omaneză","pos":"noun","definitions":["female equivalent of omanez"],"forms":{"plural":"omaneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"omaneză","accusative-definite-nominative-singular":"omaneza","accusative-indefinite-nominative-plural":"omaneze","accusative-definite-nominative-plural":"omanezele","dative-genitive-indefinite-singular":"omaneze","dative-definite-genitive-singular":"omanezei","dative-genitive-indefinite-plural":"omaneze","dative-definite-genitive-plural":"omanezelor","singular-vocative":"omaneză","plural-vocative":"omanezelor"}},{"word":"omăt","pos":"noun","definitions":["snow (precipitation)"],"forms":{"plural":"omeți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"omăt","accusative-definite-nominative-singular":"omătul","accusative-indefinite-nominative-plural":"omeți","accusative-definite-nominative-plural":"omeții","dative-genitive-indefinite-singular":"omăt","dative-definite-genitive-singular":"omătului","dative-genitive-indefinite-plural":"omeți","dative-definite-genitive-plural":"omeților","singular-vocative":"omătule","plural-vocative":"omeților"}},{"word":"omatidie","pos":"noun","definitions":["ommatidia"],"forms":{"plural":"omatidii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"omatidie","accusative-definite-nominative-singular":"omatidia","accusative-indefinite-nominative-plural":"omatidii","accusative-definite-nominative-plural":"omatidiile","dative-genitive-indefinite-singular":"omatidii","dative-definite-genitive-singular":"omatidiei","dative-genitive-indefinite-plural":"omatidii","dative-definite-genitive-plural":"omatidiilor","singular-vocative":"omatidie","plural-vocative":"omatidiilor"}},{"word":"ombilic","pos":"noun","definitions":["umbilicus"],"forms":{"plural":"ombilicuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ombilic","accusative-definite-nominative-singular":"ombilicul","accusative-indefinite-nominative-plural":"ombilicuri","accusative-definite-nominative-plural":"ombilicurile","dative-genitive-indefinite-singular":"ombilic","dative-definite-genitive-singular":"ombilicului","dative-genitive-indefinite-plural":"ombilicuri","dative-definite-genitive-plural":"ombilicurilor","singular-vocative":"ombilicule","plural-vocative":"ombilicurilor"}},{"word":"ombilical","pos":"adj","definitions":["umbilical"],"forms":{"feminine-singular":"ombilicală","masculine-plural":"ombilicali","feminine-neuter-plural":"ombilicale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ombilical","error-unrecognized-form-feminine-indefinite-singular":"ombilicală","error-unrecognized-form-indefinite-masculine-plural":"ombilicali","error-unrecognized-form-feminine-indefinite-neuter-plural":"ombilicale","definite-error-unrecognized-form-masculine-neuter-singular":"ombilicalul","definite-error-unrecognized-form-feminine-singular":"ombilicala","definite-error-unrecognized-form-masculine-plural":"ombilicalii","definite-error-unrecognized-form-feminine-neuter-plural":"ombilicalele"}},{"word":"omblă","pos":"noun","definitions":["char (fish)"],"forms":{"plural":"omble","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"omblă","accusative-definite-nominative-singular":"ombla","accusative-indefinite-nominative-plural":"omble","accusative-definite-nominative-plural":"omblele","dative-genitive-indefinite-singular":"omble","dative-definite-genitive-singular":"omblei","dative-genitive-indefinite-plural":"omble","dative-definite-genitive-plural":"omblelor","singular-vocative":"omblă","plural-vocative":"omblelor"}},{"word":"ombrometru","pos":"noun","definitions":["ombrometer"],"forms":{"plural":"ombrometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ombrometru","accusative-definite-nominative-singular":"ombrometruul","accusative-indefinite-nominative-plural":"ombrometre","accusative-definite-nominative-plural":"ombrometrele","dative-genitive-indefinite-singular":"ombrometru","dative-definite-genitive-singular":"ombrometruului","dative-genitive-indefinite-plural":"ombrometre","dative-definite-genitive-plural":"ombrometrelor","singular-vocative":"ombrometruule","plural-vocative":"ombrometrelor"}},{"word":"ombudsman","pos":"noun","definitions":["ombudsman"],"forms":{"plural":"ombudsmani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ombudsman","accusative-definite-nominative-singular":"ombudsmanul","accusative-indefinite-nominative-plural":"ombudsmani","accusative-definite-nominative-plural":"ombudsmanii","dative-genitive-indefinite-singular":"ombudsman","dative-definite-genitive-singular":"ombudsmanului","dative-genitive-indefinite-plural":"ombudsmani","dative-definite-genitive-plural":"ombudsmanilor","singular-vocative":"ombudsmanule","plural-vocative":"ombudsmanilor"}},{"word":"omdragoste","pos":"noun","definitions":["philanthropy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"omdragoste","accusative-definite-nominative":"omdragostea","dative-genitive-indefinite":"omdragoste","dative-definite-genitive":"omdragostei","vocative":"omdragoste"}},{"word":"omega","pos":"noun","definitions":["omega"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"omega","accusative-definite-nominative":"omegaul","dative-genitive-indefinite":"omega","dative-definite-genitive":"omegaului","vocative":"omegaule"}},{"word":"omegatron","pos":"noun","definitions":["omegatron"],"forms":{"plural":"omegatroane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"omegatron","accusative-definite-nominative-singular":"omegatronul","accusative-indefinite-nominative-plural":"omegatroane","accusative-definite-nominative-plural":"omegatroanele","dative-genitive-indefinite-singular":"omegatron","dative-definite-genitive-singular":"omegatronului","dative-genitive-indefinite-plural":"omegatroane","dative-definite-genitive-plural":"omegatroanelor","singular-vocative":"omegatronule","plural-vocative":"omegatroanelor"}},{"word":"omenească","pos":"adj","definitions":["feminine singular of omenesc"],"pronunciation":"[o.meˈne̯as.kə]","gender":"f"},{"word":"omenesc","pos":"adj","definitions":["human"],"pronunciation":"[o.meˈnesk]","forms":{"feminine-singular":"omenească","plural":"omenești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omenesc","error-unrecognized-form-feminine-indefinite-singular":"omenească","error-unrecognized-form-indefinite-masculine-plural":"omenești","error-unrecognized-form-feminine-indefinite-neuter-plural":"omenești","definite-error-unrecognized-form-masculine-neuter-singular":"omenescul","definite-error-unrecognized-form-feminine-singular":"omeneasca","definite-error-unrecognized-form-masculine-plural":"omeneștii","definite-error-unrecognized-form-feminine-neuter-plural":"omeneștile"}},{"word":"omenește","pos":"adv","definitions":["humanly","decently, properly"],"pronunciation":"[o.meˈneʃ.te]"},{"word":"omenești","pos":"adj","definitions":["plural of omenesc"],"pronunciation":"[o.meˈneʃtʲ]"},{"word":"omenet","pos":"noun","definitions":["crowd"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"omenet","accusative-definite-nominative":"omenetul","dative-genitive-indefinite":"omenet","dative-definite-genitive":"omenetului","vocative":"omenetule"}},{"word":"omeni","pos":"verb","definitions":["to treat with hospitality, welcome; to feed or treat someone"],"pronunciation":"/o.meˈni/","forms":{"canonical":"a omeni 4th conjugation","present-singular-third-person":"omenește","participle-past":"omenit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a omeni","gerund":"omenind","first-person-indicative-present-singular":"omenesc","indicative-present-second-person-singular":"omenești","indicative-present-singular-third-person":"omenește","first-person-indicative-plural-present":"omenim","indicative-plural-present-second-person":"omeniți","indicative-plural-present-third-person":"omenesc","first-person-imperfect-indicative-singular":"omeneam","imperfect-indicative-second-person-singular":"omeneai","imperfect-indicative-singular-third-person":"omenea","first-person-imperfect-indicative-plural":"omeneam","imperfect-indicative-plural-second-person":"omeneați","imperfect-indicative-plural-third-person":"omeneau","first-person-indicative-perfect-singular":"omenii","indicative-perfect-second-person-singular":"omeniși","indicative-perfect-singular-third-person":"omeni","first-person-indicative-perfect-plural":"omenirăm","indicative-perfect-plural-second-person":"omenirăți","indicative-perfect-plural-third-person":"omeniră","first-person-indicative-pluperfect-singular":"omenisem","indicative-pluperfect-second-person-singular":"omeniseși","indicative-pluperfect-singular-third-person":"omenise","first-person-indicative-pluperfect-plural":"omeniserăm","indicative-pluperfect-plural-second-person":"omeniserăți","indicative-pluperfect-plural-third-person":"omeniseră","first-person-present-singular-subjunctive":"să omenesc","present-second-person-singular-subjunctive":"să omenești","present-singular-subjunctive-third-person":"să omenească","first-person-plural-present-subjunctive":"să omenim","plural-present-second-person-subjunctive":"să omeniți","plural-present-subjunctive-third-person":"să omenească","imperative-second-person-singular":"omenește","imperative-plural-second-person":"omeniți","imperative-negative-second-person-singular":"nu omeni","imperative-negative-plural-second-person":"nu omeniți"}},{"word":"omenie","pos":"noun","definitions":["humaneness, kindness, sympathy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"omenie","accusative-definite-nominative":"omenia","dative-genitive-indefinite":"omenii","dative-definite-genitive":"omeniei","vocative":"omenie"}},{"word":"omenime","pos":"noun","definitions":["humanity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"omenime","accusative-definite-nominative":"omenimea","dative-genitive-indefinite":"omenime","dative-definite-genitive":"omenimei","vocative":"omenime"}},{"word":"omenire","pos":"noun","definitions":["humanity, mankind"],"forms":{"plural":"omeniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"omenire","accusative-definite-nominative-singular":"omenirea","accusative-indefinite-nominative-plural":"omeniri","accusative-definite-nominative-plural":"omenirile","dative-genitive-indefinite-singular":"omeniri","dative-definite-genitive-singular":"omenirii","dative-genitive-indefinite-plural":"omeniri","dative-definite-genitive-plural":"omenirilor","singular-vocative":"omenire","plural-vocative":"omenirilor"}},{"word":"omenit","pos":"adj","definitions":["gentle, friendly"],"forms":{"feminine-singular":"omenită","masculine-plural":"omeniți","feminine-neuter-plural":"omenite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omenit","error-unrecognized-form-feminine-indefinite-singular":"omenită","error-unrecognized-form-indefinite-masculine-plural":"omeniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"omenite","definite-error-unrecognized-form-masculine-neuter-singular":"omenitul","definite-error-unrecognized-form-feminine-singular":"omenita","definite-error-unrecognized-form-masculine-plural":"omeniții","definite-error-unrecognized-form-feminine-neuter-plural":"omenitele"}},{"word":"omenos","pos":"adj","definitions":["humane"],"pronunciation":"/o.meˈnos/","forms":{"feminine-singular":"omenoasă","masculine-plural":"omenoși","feminine-neuter-plural":"omenoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omenos","error-unrecognized-form-feminine-indefinite-singular":"omenoasă","error-unrecognized-form-indefinite-masculine-plural":"omenoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"omenoase","definite-error-unrecognized-form-masculine-neuter-singular":"omenosul","definite-error-unrecognized-form-feminine-singular":"omenoasa","definite-error-unrecognized-form-masculine-plural":"omenoșii","definite-error-unrecognized-form-feminine-neuter-plural":"omenoasele"}},{"word":"omentectomie","pos":"noun","definitions":["omentectomy"],"forms":{"plural":"omentectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"omentectomie","accusative-definite-nominative-singular":"omentectomia","accusative-indefinite-nominative-plural":"omentectomii","accusative-definite-nominative-plural":"omentectomiile","dative-genitive-indefinite-singular":"omentectomii","dative-definite-genitive-singular":"omentectomiei","dative-genitive-indefinite-plural":"omentectomii","dative-definite-genitive-plural":"omentectomiilor","singular-vocative":"omentectomie","plural-vocative":"omentectomiilor"}},{"word":"omentopexie","pos":"noun","definitions":["omentopexy"],"forms":{"plural":"omentopexii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"omentopexie","accusative-definite-nominative-singular":"omentopexia","accusative-indefinite-nominative-plural":"omentopexii","accusative-definite-nominative-plural":"omentopexiile","dative-genitive-indefinite-singular":"omentopexii","dative-definite-genitive-singular":"omentopexiei","dative-genitive-indefinite-plural":"omentopexii","dative-definite-genitive-plural":"omentopexiilor","singular-vocative":"omentopexie","plural-vocative":"omentopexiilor"}},{"word":"omentum","pos":"noun","definitions":["omentum"],"forms":{"plural":"omentumuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"omentum","accusative-definite-nominative-singular":"omentumul","accusative-indefinite-nominative-plural":"omentumuri","accusative-definite-nominative-plural":"omentumurile","dative-genitive-indefinite-singular":"omentum","dative-definite-genitive-singular":"omentumului","dative-genitive-indefinite-plural":"omentumuri","dative-definite-genitive-plural":"omentumurilor","singular-vocative":"omentumule","plural-vocative":"omentumurilor"}},{"word":"omeomorfism","pos":"noun","definitions":["alternative form of homeomorfism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"omeomorfism","accusative-definite-nominative":"omeomorfismul","dative-genitive-indefinite":"omeomorfism","dative-definite-genitive":"omeomorfismului","vocative":"omeomorfismule"}},{"word":"omeopat","pos":"adj","definitions":["obsolete form of homeopat"],"forms":{"feminine-singular":"omeopată","masculine-plural":"omeopați","feminine-neuter-plural":"omeopate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omeopat","error-unrecognized-form-feminine-indefinite-singular":"omeopată","error-unrecognized-form-indefinite-masculine-plural":"omeopați","error-unrecognized-form-feminine-indefinite-neuter-plural":"omeopate","definite-error-unrecognized-form-masculine-neuter-singular":"omeopatul","definite-error-unrecognized-form-feminine-singular":"omeopata","definite-error-unrecognized-form-masculine-plural":"omeopații","definite-error-unrecognized-form-feminine-neuter-plural":"omeopatele"}},{"word":"omeopatic","pos":"adj","definitions":["obsolete form of homeopatic"],"forms":{"feminine-singular":"omeopatică","masculine-plural":"omeopatici","feminine-neuter-plural":"omeopatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omeopatic","error-unrecognized-form-feminine-indefinite-singular":"omeopatică","error-unrecognized-form-indefinite-masculine-plural":"omeopatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"omeopatice","definite-error-unrecognized-form-masculine-neuter-singular":"omeopaticul","definite-error-unrecognized-form-feminine-singular":"omeopatica","definite-error-unrecognized-form-masculine-plural":"omeopaticii","definite-error-unrecognized-form-feminine-neuter-plural":"omeopaticele"}}];
@@ -0,0 +1 @@
+export default [{"word":"omeoză","pos":"noun","definitions":["homeosis, homoiosis"],"forms":{"plural":"omeoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"omeoză","accusative-definite-nominative-singular":"omeoza","accusative-indefinite-nominative-plural":"omeoze","accusative-definite-nominative-plural":"omeozele","dative-genitive-indefinite-singular":"omeoze","dative-definite-genitive-singular":"omeozei","dative-genitive-indefinite-plural":"omeoze","dative-definite-genitive-plural":"omeozelor","singular-vocative":"omeoză","plural-vocative":"omeozelor"}},{"word":"omeric","pos":"adj","definitions":["alternative form of homeric"],"forms":{"feminine-singular":"omerică","masculine-plural":"omerici","feminine-neuter-plural":"omerice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omeric","error-unrecognized-form-feminine-indefinite-singular":"omerică","error-unrecognized-form-indefinite-masculine-plural":"omerici","error-unrecognized-form-feminine-indefinite-neuter-plural":"omerice","definite-error-unrecognized-form-masculine-neuter-singular":"omericul","definite-error-unrecognized-form-feminine-singular":"omerica","definite-error-unrecognized-form-masculine-plural":"omericii","definite-error-unrecognized-form-feminine-neuter-plural":"omericele"}},{"word":"Omescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Omescu"}},{"word":"omesti","pos":"verb","definitions":["to digest"],"forms":{"canonical":"a omesti 4th conjugation","present-singular-third-person":"omestește","participle-past":"omestit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a omesti","gerund":"omestind","first-person-indicative-present-singular":"omestesc","indicative-present-second-person-singular":"omestești","indicative-present-singular-third-person":"omestește","first-person-indicative-plural-present":"omestim","indicative-plural-present-second-person":"omestiți","indicative-plural-present-third-person":"omestesc","first-person-imperfect-indicative-singular":"omesteam","imperfect-indicative-second-person-singular":"omesteai","imperfect-indicative-singular-third-person":"omestea","first-person-imperfect-indicative-plural":"omesteam","imperfect-indicative-plural-second-person":"omesteați","imperfect-indicative-plural-third-person":"omesteau","first-person-indicative-perfect-singular":"omestii","indicative-perfect-second-person-singular":"omestiși","indicative-perfect-singular-third-person":"omesti","first-person-indicative-perfect-plural":"omestirăm","indicative-perfect-plural-second-person":"omestirăți","indicative-perfect-plural-third-person":"omestiră","first-person-indicative-pluperfect-singular":"omestisem","indicative-pluperfect-second-person-singular":"omestiseși","indicative-pluperfect-singular-third-person":"omestise","first-person-indicative-pluperfect-plural":"omestiserăm","indicative-pluperfect-plural-second-person":"omestiserăți","indicative-pluperfect-plural-third-person":"omestiseră","first-person-present-singular-subjunctive":"să omestesc","present-second-person-singular-subjunctive":"să omestești","present-singular-subjunctive-third-person":"să omestească","first-person-plural-present-subjunctive":"să omestim","plural-present-second-person-subjunctive":"să omestiți","plural-present-subjunctive-third-person":"să omestească","imperative-second-person-singular":"omestește","imperative-plural-second-person":"omestiți","imperative-negative-second-person-singular":"nu omesti","imperative-negative-plural-second-person":"nu omestiți"}},{"word":"omestitură","pos":"noun","definitions":["digestion"],"forms":{"plural":"omestituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"omestitură","accusative-definite-nominative-singular":"omestitura","accusative-indefinite-nominative-plural":"omestituri","accusative-definite-nominative-plural":"omestiturile","dative-genitive-indefinite-singular":"omestituri","dative-definite-genitive-singular":"omestiturii","dative-genitive-indefinite-plural":"omestituri","dative-definite-genitive-plural":"omestiturilor","singular-vocative":"omestitură","plural-vocative":"omestiturilor"}},{"word":"omet","pos":"noun","definitions":["crowd"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"omet","accusative-definite-nominative":"ometul","dative-genitive-indefinite":"omet","dative-definite-genitive":"ometului","vocative":"ometule"}},{"word":"ometeu","pos":"noun","definitions":["augmentative of om"],"forms":{"plural":"ometei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ometeu","accusative-definite-nominative-singular":"ometeuul","accusative-indefinite-nominative-plural":"ometei","accusative-definite-nominative-plural":"ometeii","dative-genitive-indefinite-singular":"ometeu","dative-definite-genitive-singular":"ometeuului","dative-genitive-indefinite-plural":"ometei","dative-definite-genitive-plural":"ometeilor","singular-vocative":"ometeuule","plural-vocative":"ometeilor"}},{"word":"Ometiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ometiță"}},{"word":"omfalectomie","pos":"noun","definitions":["omphalectomy"],"forms":{"plural":"omfalectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"omfalectomie","accusative-definite-nominative-singular":"omfalectomia","accusative-indefinite-nominative-plural":"omfalectomii","accusative-definite-nominative-plural":"omfalectomiile","dative-genitive-indefinite-singular":"omfalectomii","dative-definite-genitive-singular":"omfalectomiei","dative-genitive-indefinite-plural":"omfalectomii","dative-definite-genitive-plural":"omfalectomiilor","singular-vocative":"omfalectomie","plural-vocative":"omfalectomiilor"}},{"word":"omfalită","pos":"noun","definitions":["omphalitis"],"forms":{"plural":"omfalite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"omfalită","accusative-definite-nominative-singular":"omfalita","accusative-indefinite-nominative-plural":"omfalite","accusative-definite-nominative-plural":"omfalitele","dative-genitive-indefinite-singular":"omfalite","dative-definite-genitive-singular":"omfalitei","dative-genitive-indefinite-plural":"omfalite","dative-definite-genitive-plural":"omfalitelor","singular-vocative":"omfalită","plural-vocative":"omfalitelor"}},{"word":"omfalocel","pos":"noun","definitions":["omphalocele"],"forms":{"plural":"omfalocele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"omfalocel","accusative-definite-nominative-singular":"omfalocelul","accusative-indefinite-nominative-plural":"omfalocele","accusative-definite-nominative-plural":"omfalocelele","dative-genitive-indefinite-singular":"omfalocel","dative-definite-genitive-singular":"omfalocelului","dative-genitive-indefinite-plural":"omfalocele","dative-definite-genitive-plural":"omfalocelelor","singular-vocative":"omfalocelule","plural-vocative":"omfalocelelor"}},{"word":"omfalotomie","pos":"noun","definitions":["omphalotomy"],"forms":{"plural":"omfalotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"omfalotomie","accusative-definite-nominative-singular":"omfalotomia","accusative-indefinite-nominative-plural":"omfalotomii","accusative-definite-nominative-plural":"omfalotomiile","dative-genitive-indefinite-singular":"omfalotomii","dative-definite-genitive-singular":"omfalotomiei","dative-genitive-indefinite-plural":"omfalotomii","dative-definite-genitive-plural":"omfalotomiilor","singular-vocative":"omfalotomie","plural-vocative":"omfalotomiilor"}},{"word":"omicron","pos":"noun","definitions":["omicron (Greek letter)"],"forms":{"plural":"omicron","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"omicron","accusative-definite-nominative-singular":"omicronul","accusative-indefinite-nominative-plural":"omicron","accusative-definite-nominative-plural":"omicroni","dative-genitive-indefinite-singular":"omicron","dative-definite-genitive-singular":"omicronului","dative-genitive-indefinite-plural":"omicron","dative-definite-genitive-plural":"omicronlor","singular-vocative":"omicronule","plural-vocative":"omicronlor"}},{"word":"omidă","pos":"noun","definitions":["caterpillar (the larva of a butterfly)"],"forms":{"plural":"omizi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"omidă","accusative-definite-nominative-singular":"omida","accusative-indefinite-nominative-plural":"omizi","accusative-definite-nominative-plural":"omizile","dative-genitive-indefinite-singular":"omizi","dative-definite-genitive-singular":"omizii","dative-genitive-indefinite-plural":"omizi","dative-definite-genitive-plural":"omizilor","singular-vocative":"omidă","plural-vocative":"omizilor"}},{"word":"omidărie","pos":"noun","definitions":["caterpillar nest"],"forms":{"plural":"omidării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"omidărie","accusative-definite-nominative-singular":"omidăria","accusative-indefinite-nominative-plural":"omidării","accusative-definite-nominative-plural":"omidăriile","dative-genitive-indefinite-singular":"omidării","dative-definite-genitive-singular":"omidăriei","dative-genitive-indefinite-plural":"omidării","dative-definite-genitive-plural":"omidăriilor","singular-vocative":"omidărie","plural-vocative":"omidăriilor"}},{"word":"omiduță","pos":"noun","definitions":["diminutive of omidă"],"forms":{"plural":"omiduțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"omiduță","accusative-definite-nominative-singular":"omiduța","accusative-indefinite-nominative-plural":"omiduțe","accusative-definite-nominative-plural":"omiduțele","dative-genitive-indefinite-singular":"omiduțe","dative-definite-genitive-singular":"omiduței","dative-genitive-indefinite-plural":"omiduțe","dative-definite-genitive-plural":"omiduțelor","singular-vocative":"omiduță","plural-vocative":"omiduțelor"}},{"word":"omiletic","pos":"adj","definitions":["homiletic"],"forms":{"feminine-singular":"omiletică","masculine-plural":"omiletici","feminine-neuter-plural":"omiletice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omiletic","error-unrecognized-form-feminine-indefinite-singular":"omiletică","error-unrecognized-form-indefinite-masculine-plural":"omiletici","error-unrecognized-form-feminine-indefinite-neuter-plural":"omiletice","definite-error-unrecognized-form-masculine-neuter-singular":"omileticul","definite-error-unrecognized-form-feminine-singular":"omiletica","definite-error-unrecognized-form-masculine-plural":"omileticii","definite-error-unrecognized-form-feminine-neuter-plural":"omileticele"}},{"word":"omiletică","pos":"noun","definitions":["homiletics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"omiletică","accusative-definite-nominative-singular":"omiletica","accusative-indefinite-nominative-plural":"omiletice","accusative-definite-nominative-plural":"omileticele","dative-genitive-indefinite-singular":"omiletice","dative-definite-genitive-singular":"omileticei","dative-genitive-indefinite-plural":"omiletice","dative-definite-genitive-plural":"omileticelor","singular-vocative":"omiletică","plural-vocative":"omileticelor"}},{"word":"omiliar","pos":"noun","definitions":["homiliary"],"forms":{"plural":"omiliare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"omiliar","accusative-definite-nominative-singular":"omiliarul","accusative-indefinite-nominative-plural":"omiliare","accusative-definite-nominative-plural":"omiliarele","dative-genitive-indefinite-singular":"omiliar","dative-definite-genitive-singular":"omiliarului","dative-genitive-indefinite-plural":"omiliare","dative-definite-genitive-plural":"omiliarelor","singular-vocative":"omiliarule","plural-vocative":"omiliarelor"}},{"word":"omilie","pos":"noun","definitions":["homily"],"forms":{"plural":"omilii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"omilie","accusative-definite-nominative-singular":"omilia","accusative-indefinite-nominative-plural":"omilii","accusative-definite-nominative-plural":"omiliile","dative-genitive-indefinite-singular":"omilii","dative-definite-genitive-singular":"omiliei","dative-genitive-indefinite-plural":"omilii","dative-definite-genitive-plural":"omiliilor","singular-vocative":"omilie","plural-vocative":"omiliilor"}},{"word":"ominesc","pos":"adj","definitions":["obsolete form of omenesc"],"forms":{"feminine-singular":"ominească","plural":"ominești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ominesc","error-unrecognized-form-feminine-indefinite-singular":"ominească","error-unrecognized-form-indefinite-masculine-plural":"ominești","error-unrecognized-form-feminine-indefinite-neuter-plural":"ominești","definite-error-unrecognized-form-masculine-neuter-singular":"ominescul","definite-error-unrecognized-form-feminine-singular":"omineasca","definite-error-unrecognized-form-masculine-plural":"omineștii","definite-error-unrecognized-form-feminine-neuter-plural":"omineștile"}},{"word":"omis","pos":"adj","definitions":["omitted"],"forms":{"feminine-singular":"omisă","masculine-plural":"omiși","feminine-neuter-plural":"omise","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omis","error-unrecognized-form-feminine-indefinite-singular":"omisă","error-unrecognized-form-indefinite-masculine-plural":"omiși","error-unrecognized-form-feminine-indefinite-neuter-plural":"omise","definite-error-unrecognized-form-masculine-neuter-singular":"omisul","definite-error-unrecognized-form-feminine-singular":"omisa","definite-error-unrecognized-form-masculine-plural":"omișii","definite-error-unrecognized-form-feminine-neuter-plural":"omisele"}},{"word":"omisiune","pos":"noun","definitions":["omission"],"forms":{"plural":"omisiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"omisiune","accusative-definite-nominative-singular":"omisiunea","accusative-indefinite-nominative-plural":"omisiune","accusative-definite-nominative-plural":"omisiunele","dative-genitive-indefinite-singular":"omisiune","dative-definite-genitive-singular":"omisiunei","dative-genitive-indefinite-plural":"omisiune","dative-definite-genitive-plural":"omisiunelor","singular-vocative":"omisiune","plural-vocative":"omisiunelor"}},{"word":"omisiv","pos":"adj","definitions":["omissive"],"forms":{"feminine-singular":"omisivă","masculine-plural":"omisivi","feminine-neuter-plural":"omisive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omisiv","error-unrecognized-form-feminine-indefinite-singular":"omisivă","error-unrecognized-form-indefinite-masculine-plural":"omisivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"omisive","definite-error-unrecognized-form-masculine-neuter-singular":"omisivul","definite-error-unrecognized-form-feminine-singular":"omisiva","definite-error-unrecognized-form-masculine-plural":"omisivii","definite-error-unrecognized-form-feminine-neuter-plural":"omisivele"}},{"word":"omite","pos":"verb","definitions":["to omit"],"forms":{"canonical":"a omite 3rd conjugation","present-singular-third-person":"omite","participle-past":"omis","subjunctive-third-person":"omită","table-tags":"conjugation-3","inflection-template":"ro-conj-e-s","infinitive":"a omite","gerund":"omițând","first-person-indicative-present-singular":"omit","indicative-present-second-person-singular":"omiți","indicative-present-singular-third-person":"omite","first-person-indicative-plural-present":"omitem","indicative-plural-present-second-person":"omiteți","indicative-plural-present-third-person":"omit","first-person-imperfect-indicative-singular":"omiteam","imperfect-indicative-second-person-singular":"omiteai","imperfect-indicative-singular-third-person":"omitea","first-person-imperfect-indicative-plural":"omiteam","imperfect-indicative-plural-second-person":"omiteați","imperfect-indicative-plural-third-person":"omiteau","first-person-indicative-perfect-singular":"omisei","indicative-perfect-second-person-singular":"omiseși","indicative-perfect-singular-third-person":"omise","first-person-indicative-perfect-plural":"omiserăm","indicative-perfect-plural-second-person":"omiserăți","indicative-perfect-plural-third-person":"omiseră","first-person-indicative-pluperfect-singular":"omisesem","indicative-pluperfect-second-person-singular":"omiseseși","indicative-pluperfect-singular-third-person":"omisese","first-person-indicative-pluperfect-plural":"omiseserăm","indicative-pluperfect-plural-second-person":"omiseserăți","indicative-pluperfect-plural-third-person":"omiseseră","first-person-present-singular-subjunctive":"să omit","present-second-person-singular-subjunctive":"să omiți","present-singular-subjunctive-third-person":"să omită","first-person-plural-present-subjunctive":"să omitem","plural-present-second-person-subjunctive":"să omiteți","plural-present-subjunctive-third-person":"să omită","imperative-second-person-singular":"omite","imperative-plural-second-person":"omiteți","imperative-negative-second-person-singular":"nu omite","imperative-negative-plural-second-person":"nu omiteți"}},{"word":"omitere","pos":"noun","definitions":["omission"],"forms":{"plural":"omiteri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"omitere","accusative-definite-nominative-singular":"omiterea","accusative-indefinite-nominative-plural":"omiteri","accusative-definite-nominative-plural":"omiterile","dative-genitive-indefinite-singular":"omiteri","dative-definite-genitive-singular":"omiterii","dative-genitive-indefinite-plural":"omiteri","dative-definite-genitive-plural":"omiterilor","singular-vocative":"omitere","plural-vocative":"omiterilor"}},{"word":"omiubire","pos":"noun","definitions":["philanthropy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"omiubire","accusative-definite-nominative":"omiubirea","dative-genitive-indefinite":"omiubiri","dative-definite-genitive":"omiubirii","vocative":"omiubire"}},{"word":"omizi","pos":"noun","definitions":["plural of omidă"]},{"word":"omletă","pos":"noun","definitions":["omelette"],"pronunciation":"/omˈletə/","forms":{"plural":"omlete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"omletă","accusative-definite-nominative-singular":"omleta","accusative-indefinite-nominative-plural":"omlete","accusative-definite-nominative-plural":"omletele","dative-genitive-indefinite-singular":"omlete","dative-definite-genitive-singular":"omletei","dative-genitive-indefinite-plural":"omlete","dative-definite-genitive-plural":"omletelor","singular-vocative":"omletă","plural-vocative":"omletelor"}},{"word":"omlete","pos":"noun","definitions":["plural of omletă"]},{"word":"omlituit","pos":"noun","definitions":["marcottage"],"forms":{"plural":"omlituituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"omlituit","accusative-definite-nominative-singular":"omlituitul","accusative-indefinite-nominative-plural":"omlituituri","accusative-definite-nominative-plural":"omlituiturile","dative-genitive-indefinite-singular":"omlituit","dative-definite-genitive-singular":"omlituitului","dative-genitive-indefinite-plural":"omlituituri","dative-definite-genitive-plural":"omlituiturilor","singular-vocative":"omlituitule","plural-vocative":"omlituiturilor"}},{"word":"omlituit","pos":"verb","definitions":["past participle of omlitui"],"forms":{"participle-past":"of omlitui"}},{"word":"omneputință","pos":"noun","definitions":["alternative form of omnipotență"],"forms":{"plural":"omneputințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"omneputință","accusative-definite-nominative-singular":"omneputința","accusative-indefinite-nominative-plural":"omneputințe","accusative-definite-nominative-plural":"omneputințele","dative-genitive-indefinite-singular":"omneputințe","dative-definite-genitive-singular":"omneputinței","dative-genitive-indefinite-plural":"omneputințe","dative-definite-genitive-plural":"omneputințelor","singular-vocative":"omneputință","plural-vocative":"omneputințelor"}},{"word":"omnibuz","pos":"noun","definitions":["omnibus"],"forms":{"plural":"omnibuze","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"omnibuz","accusative-definite-nominative-singular":"omnibuzul","accusative-indefinite-nominative-plural":"omnibuze","accusative-definite-nominative-plural":"omnibuzele","dative-genitive-indefinite-singular":"omnibuz","dative-definite-genitive-singular":"omnibuzului","dative-genitive-indefinite-plural":"omnibuze","dative-definite-genitive-plural":"omnibuzelor","singular-vocative":"omnibuzule","plural-vocative":"omnibuzelor"}},{"word":"omnidirecțional","pos":"adj","definitions":["omnidirectional"],"forms":{"feminine-singular":"omnidirecțională","masculine-plural":"omnidirecționali","feminine-neuter-plural":"omnidirecționale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omnidirecțional","error-unrecognized-form-feminine-indefinite-singular":"omnidirecțională","error-unrecognized-form-indefinite-masculine-plural":"omnidirecționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"omnidirecționale","definite-error-unrecognized-form-masculine-neuter-singular":"omnidirecționalul","definite-error-unrecognized-form-feminine-singular":"omnidirecționala","definite-error-unrecognized-form-masculine-plural":"omnidirecționalii","definite-error-unrecognized-form-feminine-neuter-plural":"omnidirecționalele"}},{"word":"omnilateral","pos":"adj","definitions":["omnilateral"],"forms":{"feminine-singular":"omnilaterală","masculine-plural":"omnilaterali","feminine-neuter-plural":"omnilaterale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omnilateral","error-unrecognized-form-feminine-indefinite-singular":"omnilaterală","error-unrecognized-form-indefinite-masculine-plural":"omnilaterali","error-unrecognized-form-feminine-indefinite-neuter-plural":"omnilaterale","definite-error-unrecognized-form-masculine-neuter-singular":"omnilateralul","definite-error-unrecognized-form-feminine-singular":"omnilaterala","definite-error-unrecognized-form-masculine-plural":"omnilateralii","definite-error-unrecognized-form-feminine-neuter-plural":"omnilateralele"}},{"word":"omnilateralitate","pos":"noun","definitions":["omnilaterality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"omnilateralitate","accusative-definite-nominative-singular":"omnilateralitatea","accusative-indefinite-nominative-plural":"omnilateralități","accusative-definite-nominative-plural":"omnilateralitățile","dative-genitive-indefinite-singular":"omnilateralități","dative-definite-genitive-singular":"omnilateralității","dative-genitive-indefinite-plural":"omnilateralități","dative-definite-genitive-plural":"omnilateralităților","singular-vocative":"omnilateralitate","plural-vocative":"omnilateralităților"}},{"word":"omnipotent","pos":"adj","definitions":["omnipotent"],"pronunciation":"/ˌom.ni.poˈtent/","forms":{"feminine-singular":"omnipotentă","masculine-plural":"omnipotenți","feminine-neuter-plural":"omnipotente","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"omnipotent","error-unrecognized-form-feminine-indefinite-singular":"omnipotentă","error-unrecognized-form-indefinite-masculine-plural":"omnipotenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"omnipotente","definite-error-unrecognized-form-masculine-neuter-singular":"omnipotentul","definite-error-unrecognized-form-feminine-singular":"omnipotenta","definite-error-unrecognized-form-masculine-plural":"omnipotenții","definite-error-unrecognized-form-feminine-neuter-plural":"omnipotentele"}},{"word":"omnipotență","pos":"noun","definitions":["omnipotence"],"pronunciation":"/om.ni.poˈten.t͡sə/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"omnipotență","accusative-definite-nominative":"omnipotența","dative-genitive-indefinite":"omnipotențe","dative-definite-genitive":"omnipotenței","vocative":"omnipotență","alternative-dated":"omneputință"}},{"word":"omniprezent","pos":"adj","definitions":["omnipresent, ubiquitous"],"pronunciation":"/ˌom.ni.preˈzent/","forms":{"feminine-singular":"omniprezentă","masculine-plural":"omniprezenți","feminine-neuter-plural":"omniprezente","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"omniprezent","error-unrecognized-form-feminine-indefinite-singular":"omniprezentă","error-unrecognized-form-indefinite-masculine-plural":"omniprezenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"omniprezente","definite-error-unrecognized-form-masculine-neuter-singular":"omniprezentul","definite-error-unrecognized-form-feminine-singular":"omniprezenta","definite-error-unrecognized-form-masculine-plural":"omniprezenții","definite-error-unrecognized-form-feminine-neuter-plural":"omniprezentele"}},{"word":"omniprezenta","pos":"adj","definitions":["definite nominative/accusative feminine singular of omniprezent"],"pronunciation":"[omnipreˈzenta]"},{"word":"omniprezentă","pos":"adj","definitions":["feminine singular of omniprezent"],"pronunciation":"[omnipreˈzentə]"},{"word":"omniprezența","pos":"noun","definitions":["definite nominative/accusative singular of omniprezență"],"pronunciation":"/om.ni.preˈzen.t͡sa/","gender":"f"},{"word":"omniprezență","pos":"noun","definitions":["omnipresence, ubiquity"],"pronunciation":"[omnipreˈzentsə]","forms":{"plural":"omniprezențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"omniprezență","accusative-definite-nominative-singular":"omniprezența","accusative-indefinite-nominative-plural":"omniprezențe","accusative-definite-nominative-plural":"omniprezențele","dative-genitive-indefinite-singular":"omniprezențe","dative-definite-genitive-singular":"omniprezenței","dative-genitive-indefinite-plural":"omniprezențe","dative-definite-genitive-plural":"omniprezențelor","singular-vocative":"omniprezență","plural-vocative":"omniprezențelor"}},{"word":"omniprezente","pos":"adj","definitions":["feminine/neuter plural of omniprezent"],"pronunciation":"[omnipreˈzente]"},{"word":"omniprezențe","pos":"noun","definitions":["plural of omniprezență"],"pronunciation":"/om.ni.preˈzen.t͡se/","gender":"f-p"},{"word":"omniprezentei","pos":"adj","definitions":["definite genitive/dative feminine singular of omniprezent"],"pronunciation":"[omnipreˈzentej]"},{"word":"omniprezenței","pos":"noun","definitions":["definite genitive/dative singular of omniprezență"],"pronunciation":"/om.ni.preˈzen.t͡sej/","gender":"f"},{"word":"omniprezentele","pos":"adj","definitions":["definite nominative/accusative feminine/neuter plural of omniprezent"],"pronunciation":"[omnipreˈzentele]"},{"word":"omniprezențele","pos":"noun","definitions":["definite nominative/accusative plural of omniprezență"],"pronunciation":"[omnipreˈzentsele]","gender":"f-p"},{"word":"omniprezentelor","pos":"adj","definitions":["definite genitive/dative feminine/neuter plural of omniprezent"],"pronunciation":"[omnipreˈzentelor]"},{"word":"omniprezențelor","pos":"noun","definitions":["definite genitive/dative plural of omniprezență"],"pronunciation":"[omnipreˈzentselor]","gender":"f-p"},{"word":"omniprezenți","pos":"adj","definitions":["masculine plural of omniprezent"],"pronunciation":"[omnipreˈzent͡sʲ]"},{"word":"omniprezenții","pos":"adj","definitions":["definite nominative/accusative masculine plural of omniprezent"],"pronunciation":"[omnipreˈzent͡siː]"},{"word":"omniprezenților","pos":"adj","definitions":["definite genitive/dative masculine plural of omniprezent"],"pronunciation":"[omnipreˈzent͡silor]"},{"word":"omniprezentul","pos":"adj","definitions":["definite nominative/accusative masculine/neuter singular of omniprezent"],"pronunciation":"/omnipreˈzentul/"},{"word":"omniprezentului","pos":"adj","definitions":["definite genitive/dative masculine/neuter singular of omniprezent"],"pronunciation":"[omnipreˈzentuluj]"},{"word":"omniscient","pos":"adj","definitions":["omniscient"],"pronunciation":"/ˌom.ni.st͡ʃiˈent/","forms":{"feminine-singular":"omniscientă","masculine-plural":"omniscienți","feminine-neuter-plural":"omnisciente","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"omniscient","error-unrecognized-form-feminine-indefinite-singular":"omniscientă","error-unrecognized-form-indefinite-masculine-plural":"omniscienți","error-unrecognized-form-feminine-indefinite-neuter-plural":"omnisciente","definite-error-unrecognized-form-masculine-neuter-singular":"omniscientul","definite-error-unrecognized-form-feminine-singular":"omniscienta","definite-error-unrecognized-form-masculine-plural":"omniscienții","definite-error-unrecognized-form-feminine-neuter-plural":"omniscientele"}},{"word":"omnisciență","pos":"noun","definitions":["omniscience"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"omnisciență","accusative-definite-nominative":"omnisciența","dative-genitive-indefinite":"omnisciențe","dative-definite-genitive":"omniscienței","vocative":"omnisciență"}},{"word":"omniștient","pos":"adj","definitions":["alternative form of omniscient"],"examples":[{"ro":"Tatăl nostru ceresc omniștient ne invită să primim înțelepciunea Lui, pentru a lua decizii corecte în fiecare privință.","en":null},{"ro":"Un alt atribut divin al Duhului Sfânt este acela că el este omniștient sau atotștiutor.","en":null},{"ro":"Și totuși, în imaginația noastră, prin atributele sale absolute, Dumnezeu sfidează orice lege! Acesta este cel mai pur ateism. Un nonsens. Atotputernic, omniprezent, omniștient, infinit de bun, dar infinit de drept etc. Fiecare dintre atributele acestea absolute se anulează reciproc.","en":null}],"forms":{"feminine-singular":"omniștientă","masculine-plural":"omniștienți","feminine-neuter-plural":"omniștiente","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"omniștient","error-unrecognized-form-feminine-indefinite-singular":"omniștientă","error-unrecognized-form-indefinite-masculine-plural":"omniștienți","error-unrecognized-form-feminine-indefinite-neuter-plural":"omniștiente","definite-error-unrecognized-form-masculine-neuter-singular":"omniștientul","definite-error-unrecognized-form-feminine-singular":"omniștienta","definite-error-unrecognized-form-masculine-plural":"omniștienții","definite-error-unrecognized-form-feminine-neuter-plural":"omniștientele"}},{"word":"omniștiință","pos":"noun","definitions":["alternative form of omnisciență"],"examples":[{"ro":"Cei care o practică pretind că dețin o curioasă omniștiință despre viața interioară a copilului, despre percepțiile, sentimentele și modurile lui de a structura lumea.","en":null},{"ro":"Omniștiință, Omnipotență, Omniprezență, se rezumă într-o singură Conștiință universalizată de Viață și de lubire. Toate puterile sunt cuprinse într-o singură capacitate universalizată de a trezi și fecunda energia latentă din sânul Tăcerii eterne a Spațiului fără hotar.","en":null},{"ro":"Felul meu de muncă este însă o activitate în care nu știu să stăpânesc materialul pe care-l posed... Joyce, ca artist, tindea spre omniștiință și omnipotență.","en":null}],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"omniștiință","accusative-definite-nominative":"omniștiința","dative-genitive-indefinite":"omniștiințe","dative-definite-genitive":"omniștiinței","vocative":"omniștiință"}},{"word":"omnivor","pos":"noun","definitions":["omnivore"],"forms":{"plural":"omnivori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"omnivor","accusative-definite-nominative-singular":"omnivorul","accusative-indefinite-nominative-plural":"omnivori","accusative-definite-nominative-plural":"omnivorii","dative-genitive-indefinite-singular":"omnivor","dative-definite-genitive-singular":"omnivorului","dative-genitive-indefinite-plural":"omnivori","dative-definite-genitive-plural":"omnivorilor","singular-vocative":"omnivorule","plural-vocative":"omnivorilor"}},{"word":"omnivoră","pos":"noun","definitions":["female equivalent of omnivor"],"forms":{"plural":"omnivore","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"omnivoră","accusative-definite-nominative-singular":"omnivora","accusative-indefinite-nominative-plural":"omnivore","accusative-definite-nominative-plural":"omnivorele","dative-genitive-indefinite-singular":"omnivore","dative-definite-genitive-singular":"omnivorei","dative-genitive-indefinite-plural":"omnivore","dative-definite-genitive-plural":"omnivorelor","singular-vocative":"omnivoră","plural-vocative":"omnivorelor"}},{"word":"omoaie","pos":"noun","definitions":["female equivalent of omoi"],"forms":{"plural":"omoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"omoaiă","accusative-definite-nominative-singular":"omoaia","accusative-indefinite-nominative-plural":"omoaie","accusative-definite-nominative-plural":"omoaiele","dative-genitive-indefinite-singular":"omoaie","dative-definite-genitive-singular":"omoaiei","dative-genitive-indefinite-plural":"omoaie","dative-definite-genitive-plural":"omoaielor","singular-vocative":"omoaiă","plural-vocative":"omoaielor"}},{"word":"omocentric","pos":"adj","definitions":["alternative form of homocentric"],"forms":{"feminine-singular":"omocentrică","masculine-plural":"omocentrici","feminine-neuter-plural":"omocentrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omocentric","error-unrecognized-form-feminine-indefinite-singular":"omocentrică","error-unrecognized-form-indefinite-masculine-plural":"omocentrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"omocentrice","definite-error-unrecognized-form-masculine-neuter-singular":"omocentricul","definite-error-unrecognized-form-feminine-singular":"omocentrica","definite-error-unrecognized-form-masculine-plural":"omocentricii","definite-error-unrecognized-form-feminine-neuter-plural":"omocentricele"}},{"word":"omocentru","pos":"noun","definitions":["alternative form of homocentru"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"omocentru","accusative-definite-nominative":"omocentruul","dative-genitive-indefinite":"omocentru","dative-definite-genitive":"omocentruului","vocative":"omocentruule"}},{"word":"omofag","pos":"adj","definitions":["omophagous"],"forms":{"feminine-singular":"omofagă","masculine-plural":"omofagi","feminine-neuter-plural":"omofage","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omofag","error-unrecognized-form-feminine-indefinite-singular":"omofagă","error-unrecognized-form-indefinite-masculine-plural":"omofagi","error-unrecognized-form-feminine-indefinite-neuter-plural":"omofage","definite-error-unrecognized-form-masculine-neuter-singular":"omofagul","definite-error-unrecognized-form-feminine-singular":"omofaga","definite-error-unrecognized-form-masculine-plural":"omofagii","definite-error-unrecognized-form-feminine-neuter-plural":"omofagele"}},{"word":"omofagie","pos":"noun","definitions":["omophagy"],"forms":{"plural":"omofagii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"omofagie","accusative-definite-nominative-singular":"omofagia","accusative-indefinite-nominative-plural":"omofagii","accusative-definite-nominative-plural":"omofagiile","dative-genitive-indefinite-singular":"omofagii","dative-definite-genitive-singular":"omofagiei","dative-genitive-indefinite-plural":"omofagii","dative-definite-genitive-plural":"omofagiilor","singular-vocative":"omofagie","plural-vocative":"omofagiilor"}},{"word":"omofilie","pos":"noun","definitions":["kinship"],"forms":{"plural":"omofilii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"omofilie","accusative-definite-nominative-singular":"omofilia","accusative-indefinite-nominative-plural":"omofilii","accusative-definite-nominative-plural":"omofiliile","dative-genitive-indefinite-singular":"omofilii","dative-definite-genitive-singular":"omofiliei","dative-genitive-indefinite-plural":"omofilii","dative-definite-genitive-plural":"omofiliilor","singular-vocative":"omofilie","plural-vocative":"omofiliilor"}},{"word":"omofon","pos":"adj","definitions":["homophonous"],"forms":{"feminine-singular":"omofonă","masculine-plural":"omofoni","feminine-neuter-plural":"omofone","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omofon","error-unrecognized-form-feminine-indefinite-singular":"omofonă","error-unrecognized-form-indefinite-masculine-plural":"omofoni","error-unrecognized-form-feminine-indefinite-neuter-plural":"omofone","definite-error-unrecognized-form-masculine-neuter-singular":"omofonul","definite-error-unrecognized-form-feminine-singular":"omofona","definite-error-unrecognized-form-masculine-plural":"omofonii","definite-error-unrecognized-form-feminine-neuter-plural":"omofonele"}},{"word":"omofonic","pos":"adj","definitions":["homophonic"],"forms":{"feminine-singular":"omofonică","masculine-plural":"omofonici","feminine-neuter-plural":"omofonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omofonic","error-unrecognized-form-feminine-indefinite-singular":"omofonică","error-unrecognized-form-indefinite-masculine-plural":"omofonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"omofonice","definite-error-unrecognized-form-masculine-neuter-singular":"omofonicul","definite-error-unrecognized-form-feminine-singular":"omofonica","definite-error-unrecognized-form-masculine-plural":"omofonicii","definite-error-unrecognized-form-feminine-neuter-plural":"omofonicele"}},{"word":"omofonie","pos":"noun","definitions":["homophony"],"forms":{"plural":"omofonii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"omofonie","accusative-definite-nominative-singular":"omofonia","accusative-indefinite-nominative-plural":"omofonii","accusative-definite-nominative-plural":"omofoniile","dative-genitive-indefinite-singular":"omofonii","dative-definite-genitive-singular":"omofoniei","dative-genitive-indefinite-plural":"omofonii","dative-definite-genitive-plural":"omofoniilor","singular-vocative":"omofonie","plural-vocative":"omofoniilor"}},{"word":"omofor","pos":"noun","definitions":["omophorion"],"forms":{"plural":"omofoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"omofor","accusative-definite-nominative-singular":"omoforul","accusative-indefinite-nominative-plural":"omofoare","accusative-definite-nominative-plural":"omofoarele","dative-genitive-indefinite-singular":"omofor","dative-definite-genitive-singular":"omoforului","dative-genitive-indefinite-plural":"omofoare","dative-definite-genitive-plural":"omofoarelor","singular-vocative":"omoforule","plural-vocative":"omofoarelor"}},{"word":"omoform","pos":"adj","definitions":["homoform"],"forms":{"feminine-singular":"omoformă","masculine-plural":"omoformi","feminine-neuter-plural":"omoforme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omoform","error-unrecognized-form-feminine-indefinite-singular":"omoformă","error-unrecognized-form-indefinite-masculine-plural":"omoformi","error-unrecognized-form-feminine-indefinite-neuter-plural":"omoforme","definite-error-unrecognized-form-masculine-neuter-singular":"omoformul","definite-error-unrecognized-form-feminine-singular":"omoforma","definite-error-unrecognized-form-masculine-plural":"omoformii","definite-error-unrecognized-form-feminine-neuter-plural":"omoformele"}},{"word":"omogen","pos":"adj","definitions":["homogeneous"],"pronunciation":"/o.moˈd͡ʒen/","forms":{"feminine-singular":"omogenă","masculine-plural":"omogeni","feminine-neuter-plural":"omogene","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"omogen","error-unrecognized-form-feminine-indefinite-singular":"omogenă","error-unrecognized-form-indefinite-masculine-plural":"omogeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"omogene","definite-error-unrecognized-form-masculine-neuter-singular":"omogenul","definite-error-unrecognized-form-feminine-singular":"omogena","definite-error-unrecognized-form-masculine-plural":"omogenii","definite-error-unrecognized-form-feminine-neuter-plural":"omogenele"}},{"word":"omogeneitate","pos":"noun","definitions":["alternative form of omogenitate"]},{"word":"omogeneiza","pos":"verb","definitions":["alternative form of omogeniza"],"forms":{"canonical":"a omogeneiza 1st conjugation","present-singular-third-person":"omogeneizează","participle-past":"omogeneizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a omogeneiza","gerund":"omogeneizând","first-person-indicative-present-singular":"omogeneizez","indicative-present-second-person-singular":"omogeneizezi","indicative-present-singular-third-person":"omogeneizează","first-person-indicative-plural-present":"omogeneizăm","indicative-plural-present-second-person":"omogeneizați","indicative-plural-present-third-person":"omogeneizează","first-person-imperfect-indicative-singular":"omogeneizam","imperfect-indicative-second-person-singular":"omogeneizai","imperfect-indicative-singular-third-person":"omogeneiza","first-person-imperfect-indicative-plural":"omogeneizam","imperfect-indicative-plural-second-person":"omogeneizați","imperfect-indicative-plural-third-person":"omogeneizau","first-person-indicative-perfect-singular":"omogeneizai","indicative-perfect-second-person-singular":"omogeneizași","indicative-perfect-singular-third-person":"omogeneiză","first-person-indicative-perfect-plural":"omogeneizarăm","indicative-perfect-plural-second-person":"omogeneizarăți","indicative-perfect-plural-third-person":"omogeneizară","first-person-indicative-pluperfect-singular":"omogeneizasem","indicative-pluperfect-second-person-singular":"omogeneizaseși","indicative-pluperfect-singular-third-person":"omogeneizase","first-person-indicative-pluperfect-plural":"omogeneizaserăm","indicative-pluperfect-plural-second-person":"omogeneizaserăți","indicative-pluperfect-plural-third-person":"omogeneizaseră","first-person-present-singular-subjunctive":"să omogeneizez","present-second-person-singular-subjunctive":"să omogeneizezi","present-singular-subjunctive-third-person":"să omogeneizeze","first-person-plural-present-subjunctive":"să omogeneizăm","plural-present-second-person-subjunctive":"să omogeneizați","plural-present-subjunctive-third-person":"să omogeneizeze","imperative-second-person-singular":"omogeneizează","imperative-plural-second-person":"omogeneizați","imperative-negative-second-person-singular":"nu omogeneiza","imperative-negative-plural-second-person":"nu omogeneizați"}},{"word":"omogeneizare","pos":"noun","definitions":["alternative form of omogenizare"],"forms":{"plural":"omogeneizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"omogeneizare","accusative-definite-nominative-singular":"omogeneizarea","accusative-indefinite-nominative-plural":"omogeneizări","accusative-definite-nominative-plural":"omogeneizările","dative-genitive-indefinite-singular":"omogeneizări","dative-definite-genitive-singular":"omogeneizării","dative-genitive-indefinite-plural":"omogeneizări","dative-definite-genitive-plural":"omogeneizărilor","singular-vocative":"omogeneizare","plural-vocative":"omogeneizărilor"}},{"word":"omogeneizator","pos":"noun","definitions":["alternative form of omogenizator"],"forms":{"plural":"omogeneizatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"omogeneizator","accusative-definite-nominative-singular":"omogeneizatorul","accusative-indefinite-nominative-plural":"omogeneizatoare","accusative-definite-nominative-plural":"omogeneizatoarele","dative-genitive-indefinite-singular":"omogeneizator","dative-definite-genitive-singular":"omogeneizatorului","dative-genitive-indefinite-plural":"omogeneizatoare","dative-definite-genitive-plural":"omogeneizatoarelor","singular-vocative":"omogeneizatorule","plural-vocative":"omogeneizatoarelor"}},{"word":"omogenitate","pos":"noun","definitions":["homogeneity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"omogenitate","accusative-definite-nominative-singular":"omogenitatea","accusative-indefinite-nominative-plural":"omogenități","accusative-definite-nominative-plural":"omogenitățile","dative-genitive-indefinite-singular":"omogenități","dative-definite-genitive-singular":"omogenității","dative-genitive-indefinite-plural":"omogenități","dative-definite-genitive-plural":"omogenităților","singular-vocative":"omogenitate","plural-vocative":"omogenităților"}},{"word":"omogeniza","pos":"verb","definitions":["to homogenize"],"forms":{"canonical":"a omogeniza 1st conjugation","present-singular-third-person":"omogenizează","participle-past":"omogenizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a omogeniza","gerund":"omogenizând","first-person-indicative-present-singular":"omogenizez","indicative-present-second-person-singular":"omogenizezi","indicative-present-singular-third-person":"omogenizează","first-person-indicative-plural-present":"omogenizăm","indicative-plural-present-second-person":"omogenizați","indicative-plural-present-third-person":"omogenizează","first-person-imperfect-indicative-singular":"omogenizam","imperfect-indicative-second-person-singular":"omogenizai","imperfect-indicative-singular-third-person":"omogeniza","first-person-imperfect-indicative-plural":"omogenizam","imperfect-indicative-plural-second-person":"omogenizați","imperfect-indicative-plural-third-person":"omogenizau","first-person-indicative-perfect-singular":"omogenizai","indicative-perfect-second-person-singular":"omogenizași","indicative-perfect-singular-third-person":"omogeniză","first-person-indicative-perfect-plural":"omogenizarăm","indicative-perfect-plural-second-person":"omogenizarăți","indicative-perfect-plural-third-person":"omogenizară","first-person-indicative-pluperfect-singular":"omogenizasem","indicative-pluperfect-second-person-singular":"omogenizaseși","indicative-pluperfect-singular-third-person":"omogenizase","first-person-indicative-pluperfect-plural":"omogenizaserăm","indicative-pluperfect-plural-second-person":"omogenizaserăți","indicative-pluperfect-plural-third-person":"omogenizaseră","first-person-present-singular-subjunctive":"să omogenizez","present-second-person-singular-subjunctive":"să omogenizezi","present-singular-subjunctive-third-person":"să omogenizeze","first-person-plural-present-subjunctive":"să omogenizăm","plural-present-second-person-subjunctive":"să omogenizați","plural-present-subjunctive-third-person":"să omogenizeze","imperative-second-person-singular":"omogenizează","imperative-plural-second-person":"omogenizați","imperative-negative-second-person-singular":"nu omogeniza","imperative-negative-plural-second-person":"nu omogenizați"}},{"word":"omogenizare","pos":"noun","definitions":["homogenization"],"forms":{"plural":"omogenizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"omogenizare","accusative-definite-nominative-singular":"omogenizarea","accusative-indefinite-nominative-plural":"omogenizări","accusative-definite-nominative-plural":"omogenizările","dative-genitive-indefinite-singular":"omogenizări","dative-definite-genitive-singular":"omogenizării","dative-genitive-indefinite-plural":"omogenizări","dative-definite-genitive-plural":"omogenizărilor","singular-vocative":"omogenizare","plural-vocative":"omogenizărilor"}},{"word":"omogenizator","pos":"noun","definitions":["homogenizer"],"forms":{"plural":"omogenizatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"omogenizator","accusative-definite-nominative-singular":"omogenizatorul","accusative-indefinite-nominative-plural":"omogenizatore","accusative-definite-nominative-plural":"omogenizatorele","dative-genitive-indefinite-singular":"omogenizator","dative-definite-genitive-singular":"omogenizatorului","dative-genitive-indefinite-plural":"omogenizatore","dative-definite-genitive-plural":"omogenizatorelor","singular-vocative":"omogenizatorule","plural-vocative":"omogenizatorelor"}},{"word":"omoghenie","pos":"noun","definitions":["kinship"],"forms":{"plural":"omoghenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"omoghenie","accusative-definite-nominative-singular":"omoghenia","accusative-indefinite-nominative-plural":"omoghenii","accusative-definite-nominative-plural":"omogheniile","dative-genitive-indefinite-singular":"omoghenii","dative-definite-genitive-singular":"omogheniei","dative-genitive-indefinite-plural":"omoghenii","dative-definite-genitive-plural":"omogheniilor","singular-vocative":"omoghenie","plural-vocative":"omogheniilor"}},{"word":"omograf","pos":"noun","definitions":["homograph"],"forms":{"plural":"omografi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"omograf","accusative-definite-nominative-singular":"omograful","accusative-indefinite-nominative-plural":"omografi","accusative-definite-nominative-plural":"omografile","dative-genitive-indefinite-singular":"omograf","dative-definite-genitive-singular":"omografului","dative-genitive-indefinite-plural":"omografi","dative-definite-genitive-plural":"omografilor","singular-vocative":"omografule","plural-vocative":"omografilor"}},{"word":"omografic","pos":"adj","definitions":["homographic"],"forms":{"feminine-singular":"omografică","masculine-plural":"omografici","feminine-neuter-plural":"omografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omografic","error-unrecognized-form-feminine-indefinite-singular":"omografică","error-unrecognized-form-indefinite-masculine-plural":"omografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"omografice","definite-error-unrecognized-form-masculine-neuter-singular":"omograficul","definite-error-unrecognized-form-feminine-singular":"omografica","definite-error-unrecognized-form-masculine-plural":"omograficii","definite-error-unrecognized-form-feminine-neuter-plural":"omograficele"}},{"word":"omografie","pos":"noun","definitions":["homography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"omografie","accusative-definite-nominative":"omografia","dative-genitive-indefinite":"omografii","dative-definite-genitive":"omografiei","vocative":"omografie"}},{"word":"omogramă","pos":"noun","definitions":["homograph"],"forms":{"plural":"omograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"omogramă","accusative-definite-nominative-singular":"omograma","accusative-indefinite-nominative-plural":"omograme","accusative-definite-nominative-plural":"omogramele","dative-genitive-indefinite-singular":"omograme","dative-definite-genitive-singular":"omogramei","dative-genitive-indefinite-plural":"omograme","dative-definite-genitive-plural":"omogramelor","singular-vocative":"omogramă","plural-vocative":"omogramelor"}},{"word":"omoi","pos":"noun","definitions":["augmentative of om"],"forms":{"plural":"omoi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"omoi","accusative-definite-nominative-singular":"omoiul","accusative-indefinite-nominative-plural":"omoi","accusative-definite-nominative-plural":"omoii","dative-genitive-indefinite-singular":"omoi","dative-definite-genitive-singular":"omoiului","dative-genitive-indefinite-plural":"omoi","dative-definite-genitive-plural":"omoilor","singular-vocative":"omoiule","plural-vocative":"omoilor"}},{"word":"omoloagă","pos":"noun","definitions":["female equivalent of omolog"],"forms":{"plural":"omoloage","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"omoloagă","accusative-definite-nominative-singular":"omoloaga","accusative-indefinite-nominative-plural":"omoloage","accusative-definite-nominative-plural":"omoloagele","dative-genitive-indefinite-singular":"omoloage","dative-definite-genitive-singular":"omoloagei","dative-genitive-indefinite-plural":"omoloage","dative-definite-genitive-plural":"omoloagelor","singular-vocative":"omoloagă","plural-vocative":"omoloagelor"}},{"word":"omolog","pos":"noun","definitions":["homologous"],"forms":{"plural":"omologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"omolog","accusative-definite-nominative-singular":"omologul","accusative-indefinite-nominative-plural":"omologi","accusative-definite-nominative-plural":"omologii","dative-genitive-indefinite-singular":"omolog","dative-definite-genitive-singular":"omologului","dative-genitive-indefinite-plural":"omologi","dative-definite-genitive-plural":"omologilor","singular-vocative":"omologule","plural-vocative":"omologilor"}},{"word":"omologa","pos":"verb","definitions":["to officially recognize"],"forms":{"canonical":"a omologa 1st conjugation","present-singular-third-person":"omologhează","participle-past":"omologat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a omologa","gerund":"omologând","first-person-indicative-present-singular":"omologhez","indicative-present-second-person-singular":"omologhezi","indicative-present-singular-third-person":"omologhează","first-person-indicative-plural-present":"omologăm","indicative-plural-present-second-person":"omologați","indicative-plural-present-third-person":"omologhează","first-person-imperfect-indicative-singular":"omologam","imperfect-indicative-second-person-singular":"omologai","imperfect-indicative-singular-third-person":"omologa","first-person-imperfect-indicative-plural":"omologam","imperfect-indicative-plural-second-person":"omologați","imperfect-indicative-plural-third-person":"omologau","first-person-indicative-perfect-singular":"omologai","indicative-perfect-second-person-singular":"omologași","indicative-perfect-singular-third-person":"omologă","first-person-indicative-perfect-plural":"omologarăm","indicative-perfect-plural-second-person":"omologarăți","indicative-perfect-plural-third-person":"omologară","first-person-indicative-pluperfect-singular":"omologasem","indicative-pluperfect-second-person-singular":"omologaseși","indicative-pluperfect-singular-third-person":"omologase","first-person-indicative-pluperfect-plural":"omologaserăm","indicative-pluperfect-plural-second-person":"omologaserăți","indicative-pluperfect-plural-third-person":"omologaseră","first-person-present-singular-subjunctive":"să omologhez","present-second-person-singular-subjunctive":"să omologhezi","present-singular-subjunctive-third-person":"să omologheze","first-person-plural-present-subjunctive":"să omologăm","plural-present-second-person-subjunctive":"să omologați","plural-present-subjunctive-third-person":"să omologheze","imperative-second-person-singular":"omologhează","imperative-plural-second-person":"omologați","imperative-negative-second-person-singular":"nu omologa","imperative-negative-plural-second-person":"nu omologați"}},{"word":"omologă","pos":"noun","definitions":["female equivalent of omolog"],"forms":{"plural":"omologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"omologă","accusative-definite-nominative-singular":"omologa","accusative-indefinite-nominative-plural":"omologe","accusative-definite-nominative-plural":"omologele","dative-genitive-indefinite-singular":"omologe","dative-definite-genitive-singular":"omologei","dative-genitive-indefinite-plural":"omologe","dative-definite-genitive-plural":"omologelor","singular-vocative":"omologă","plural-vocative":"omologelor"}},{"word":"omologare","pos":"noun","definitions":["homologation, certification"],"forms":{"plural":"omologări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"omologare","accusative-definite-nominative-singular":"omologarea","accusative-indefinite-nominative-plural":"omologări","accusative-definite-nominative-plural":"omologările","dative-genitive-indefinite-singular":"omologări","dative-definite-genitive-singular":"omologării","dative-genitive-indefinite-plural":"omologări","dative-definite-genitive-plural":"omologărilor","singular-vocative":"omologare","plural-vocative":"omologărilor"}},{"word":"omologație","pos":"noun","definitions":["homologation"],"forms":{"plural":"omologații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"omologație","accusative-definite-nominative-singular":"omologația","accusative-indefinite-nominative-plural":"omologații","accusative-definite-nominative-plural":"omologațiile","dative-genitive-indefinite-singular":"omologații","dative-definite-genitive-singular":"omologației","dative-genitive-indefinite-plural":"omologații","dative-definite-genitive-plural":"omologațiilor","singular-vocative":"omologație","plural-vocative":"omologațiilor"}},{"word":"omologie","pos":"noun","definitions":["homology"],"forms":{"plural":"omologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"omologie","accusative-definite-nominative-singular":"omologia","accusative-indefinite-nominative-plural":"omologii","accusative-definite-nominative-plural":"omologiile","dative-genitive-indefinite-singular":"omologii","dative-definite-genitive-singular":"omologiei","dative-genitive-indefinite-plural":"omologii","dative-definite-genitive-plural":"omologiilor","singular-vocative":"omologie","plural-vocative":"omologiilor"}},{"word":"omomorfism","pos":"noun","definitions":["alternative form of homomorfism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"omomorfism","accusative-definite-nominative":"omomorfismul","dative-genitive-indefinite":"omomorfism","dative-definite-genitive":"omomorfismului","vocative":"omomorfismule"}},{"word":"omonie","pos":"noun","definitions":["harmony"],"forms":{"plural":"omonii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"omonie","accusative-definite-nominative-singular":"omonia","accusative-indefinite-nominative-plural":"omonii","accusative-definite-nominative-plural":"omoniile","dative-genitive-indefinite-singular":"omonii","dative-definite-genitive-singular":"omoniei","dative-genitive-indefinite-plural":"omonii","dative-definite-genitive-plural":"omoniilor","singular-vocative":"omonie","plural-vocative":"omoniilor"}},{"word":"omonim","pos":"noun","definitions":["namesake"],"forms":{"plural":"omonime","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"omonim","accusative-definite-nominative-singular":"omonimul","accusative-indefinite-nominative-plural":"omonime","accusative-definite-nominative-plural":"omonimele","dative-genitive-indefinite-singular":"omonim","dative-definite-genitive-singular":"omonimului","dative-genitive-indefinite-plural":"omonime","dative-definite-genitive-plural":"omonimelor","singular-vocative":"omonimule","plural-vocative":"omonimelor"}},{"word":"omonimic","pos":"adj","definitions":["homonymic"],"forms":{"feminine-singular":"omonimică","masculine-plural":"omonimici","feminine-neuter-plural":"omonimice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omonimic","error-unrecognized-form-feminine-indefinite-singular":"omonimică","error-unrecognized-form-indefinite-masculine-plural":"omonimici","error-unrecognized-form-feminine-indefinite-neuter-plural":"omonimice","definite-error-unrecognized-form-masculine-neuter-singular":"omonimicul","definite-error-unrecognized-form-feminine-singular":"omonimica","definite-error-unrecognized-form-masculine-plural":"omonimicii","definite-error-unrecognized-form-feminine-neuter-plural":"omonimicele"}},{"word":"omonimie","pos":"noun","definitions":["homonymy"],"forms":{"plural":"omonimii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"omonimie","accusative-definite-nominative-singular":"omonimia","accusative-indefinite-nominative-plural":"omonimii","accusative-definite-nominative-plural":"omonimiile","dative-genitive-indefinite-singular":"omonimii","dative-definite-genitive-singular":"omonimiei","dative-genitive-indefinite-plural":"omonimii","dative-definite-genitive-plural":"omonimiilor","singular-vocative":"omonimie","plural-vocative":"omonimiilor"}},{"word":"omonimitate","pos":"noun","definitions":["homonymity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"omonimitate","accusative-definite-nominative":"omonimitatea","dative-genitive-indefinite":"omonimități","dative-definite-genitive":"omonimității","vocative":"-"}},{"word":"omoplat","pos":"noun","definitions":["shoulder bone, scapula"],"forms":{"plural":"omoplați"}},{"word":"omor","pos":"noun","definitions":["murder"],"pronunciation":"/oˈmor/","forms":{"plural":"omoruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"omor","accusative-definite-nominative-singular":"omorul","accusative-indefinite-nominative-plural":"omoruri","accusative-definite-nominative-plural":"omorurile","dative-genitive-indefinite-singular":"omor","dative-definite-genitive-singular":"omorului","dative-genitive-indefinite-plural":"omoruri","dative-definite-genitive-plural":"omorurilor","singular-vocative":"omorule","plural-vocative":"omorurilor"}},{"word":"omorâciune","pos":"noun","definitions":["killing"],"forms":{"plural":"omorâciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"omorâciune","accusative-definite-nominative-singular":"omorâciunea","accusative-indefinite-nominative-plural":"omorâciuni","accusative-definite-nominative-plural":"omorâciunile","dative-genitive-indefinite-singular":"omorâciuni","dative-definite-genitive-singular":"omorâciunii","dative-genitive-indefinite-plural":"omorâciuni","dative-definite-genitive-plural":"omorâciunilor","singular-vocative":"omorâciune","plural-vocative":"omorâciunilor"}},{"word":"omorâre","pos":"noun","definitions":["killing"],"forms":{"plural":"omorâri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"omorâre","accusative-definite-nominative-singular":"omorârea","accusative-indefinite-nominative-plural":"omorâri","accusative-definite-nominative-plural":"omorârile","dative-genitive-indefinite-singular":"omorâri","dative-definite-genitive-singular":"omorârii","dative-genitive-indefinite-plural":"omorâri","dative-definite-genitive-plural":"omorârilor","singular-vocative":"omorâre","plural-vocative":"omorârilor"}},{"word":"omorât","pos":"adj","definitions":["killed"],"forms":{"feminine-singular":"omorâtă","masculine-plural":"omorâți","feminine-neuter-plural":"omorâte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omorât","error-unrecognized-form-feminine-indefinite-singular":"omorâtă","error-unrecognized-form-indefinite-masculine-plural":"omorâți","error-unrecognized-form-feminine-indefinite-neuter-plural":"omorâte","definite-error-unrecognized-form-masculine-neuter-singular":"omorâtul","definite-error-unrecognized-form-feminine-singular":"omorâta","definite-error-unrecognized-form-masculine-plural":"omorâții","definite-error-unrecognized-form-feminine-neuter-plural":"omorâtele"}},{"word":"omorâtoare","pos":"noun","definitions":["female equivalent of omorâtor"],"forms":{"plural":"omorâtoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"omorâtoare","accusative-definite-nominative-singular":"omorâtoarea","accusative-indefinite-nominative-plural":"omorâtoare","accusative-definite-nominative-plural":"omorâtoarele","dative-genitive-indefinite-singular":"omorâtoare","dative-definite-genitive-singular":"omorâtoarei","dative-genitive-indefinite-plural":"omorâtoare","dative-definite-genitive-plural":"omorâtoarelor","singular-vocative":"omorâtoare","plural-vocative":"omorâtoarelor"}},{"word":"omorâtor","pos":"adj","definitions":["killing"],"forms":{"feminine-singular":"omorâtoare","masculine-plural":"omorâtori","feminine-neuter-plural":"omorâtoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omorâtor","error-unrecognized-form-feminine-indefinite-singular":"omorâtoare","error-unrecognized-form-indefinite-masculine-plural":"omorâtori","error-unrecognized-form-feminine-indefinite-neuter-plural":"omorâtoare","definite-error-unrecognized-form-masculine-neuter-singular":"omorâtorul","definite-error-unrecognized-form-feminine-singular":"omorâtoarea","definite-error-unrecognized-form-masculine-plural":"omorâtorii","definite-error-unrecognized-form-feminine-neuter-plural":"omorâtoarele"}},{"word":"omorâtură","pos":"noun","definitions":["synonym of omorâre (“killing”)"],"pronunciation":"/o.mo.rɨˈtu.rə/","forms":{"plural":"omorâturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"omorâtură","accusative-definite-nominative-singular":"omorâtura","accusative-indefinite-nominative-plural":"omorâturi","accusative-definite-nominative-plural":"omorâturile","dative-genitive-indefinite-singular":"omorâturi","dative-definite-genitive-singular":"omorâturii","dative-genitive-indefinite-plural":"omorâturi","dative-definite-genitive-plural":"omorâturilor","singular-vocative":"omorâtură","plural-vocative":"omorâturilor","alternative":"omorîtură"}},{"word":"omorganic","pos":"adj","definitions":["homorganic"],"forms":{"feminine-singular":"omorganică","masculine-plural":"omorganici","feminine-neuter-plural":"omorganice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omorganic","error-unrecognized-form-feminine-indefinite-singular":"omorganică","error-unrecognized-form-indefinite-masculine-plural":"omorganici","error-unrecognized-form-feminine-indefinite-neuter-plural":"omorganice","definite-error-unrecognized-form-masculine-neuter-singular":"omorganicul","definite-error-unrecognized-form-feminine-singular":"omorganica","definite-error-unrecognized-form-masculine-plural":"omorganicii","definite-error-unrecognized-form-feminine-neuter-plural":"omorganicele"}},{"word":"omori","pos":"verb","definitions":["second-person singular present indicative/subjunctive of omorî"],"pronunciation":"[oˈmorʲ]"},{"word":"omorî","pos":"verb","definitions":["to kill","to kill (cause to experience distress)","to enthusiastically exert oneself","to mortify (practice discipline on oneself)"],"pronunciation":"/o.moˈrɨ/","examples":[{"ro":"Angajații la stat nu se omoară cu munca.","en":"State employees aren’t busting their chops working."}],"forms":{"canonical":"a omorî 4th conjugation","present-singular-third-person":"omoară","participle-past":"omorât","subjunctive-third-person":"omoare","table-tags":"conjugation-4","inflection-template":"ro-conj-î","infinitive":"a omorî","gerund":"omorând","first-person-indicative-present-singular":"omor","indicative-present-second-person-singular":"omori","indicative-present-singular-third-person":"omoară","first-person-indicative-plural-present":"omorâm","indicative-plural-present-second-person":"omorâți","indicative-plural-present-third-person":"omoară","first-person-imperfect-indicative-singular":"omoram","imperfect-indicative-second-person-singular":"omorai","imperfect-indicative-singular-third-person":"omora","first-person-imperfect-indicative-plural":"omoram","imperfect-indicative-plural-second-person":"omorați","imperfect-indicative-plural-third-person":"omorau","first-person-indicative-perfect-singular":"omorâi","indicative-perfect-second-person-singular":"omorâși","indicative-perfect-singular-third-person":"omorî","first-person-indicative-perfect-plural":"omorârăm","indicative-perfect-plural-second-person":"omorârăți","indicative-perfect-plural-third-person":"omorâră","first-person-indicative-pluperfect-singular":"omorâsem","indicative-pluperfect-second-person-singular":"omorâseși","indicative-pluperfect-singular-third-person":"omorâse","first-person-indicative-pluperfect-plural":"omorâserăm","indicative-pluperfect-plural-second-person":"omorâserăți","indicative-pluperfect-plural-third-person":"omorâseră","first-person-present-singular-subjunctive":"să omor","present-second-person-singular-subjunctive":"să omori","present-singular-subjunctive-third-person":"să omoare","first-person-plural-present-subjunctive":"să omorâm","plural-present-second-person-subjunctive":"să omorâți","plural-present-subjunctive-third-person":"să omoare","imperative-second-person-singular":"omoară","imperative-plural-second-person":"omorâți","imperative-negative-second-person-singular":"nu omorî","imperative-negative-plural-second-person":"nu omorâți","alternative-regional":"omărî"}},{"word":"omorit","pos":"adj","definitions":["obsolete form of omorât"],"forms":{"feminine-singular":"omorită","masculine-plural":"omoriți","feminine-neuter-plural":"omorite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omorit","error-unrecognized-form-feminine-indefinite-singular":"omorită","error-unrecognized-form-indefinite-masculine-plural":"omoriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"omorite","definite-error-unrecognized-form-masculine-neuter-singular":"omoritul","definite-error-unrecognized-form-feminine-singular":"omorita","definite-error-unrecognized-form-masculine-plural":"omoriții","definite-error-unrecognized-form-feminine-neuter-plural":"omoritele"}},{"word":"omoruri","pos":"noun","definitions":["plural of omor"],"gender":"m-p"},{"word":"omos","pos":"adv","definitions":["nevertheless"]},{"word":"omosferă","pos":"noun","definitions":["alternative form of homosferă"],"forms":{"plural":"omosfere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"omosferă","accusative-definite-nominative-singular":"omosfera","accusative-indefinite-nominative-plural":"omosfere","accusative-definite-nominative-plural":"omosferele","dative-genitive-indefinite-singular":"omosfere","dative-definite-genitive-singular":"omosferei","dative-genitive-indefinite-plural":"omosfere","dative-definite-genitive-plural":"omosferelor","singular-vocative":"omosferă","plural-vocative":"omosferelor"}},{"word":"omotetic","pos":"adj","definitions":["homothetic"],"forms":{"feminine-singular":"omotetică","masculine-plural":"omotetici","feminine-neuter-plural":"omotetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"omotetic","error-unrecognized-form-feminine-indefinite-singular":"omotetică","error-unrecognized-form-indefinite-masculine-plural":"omotetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"omotetice","definite-error-unrecognized-form-masculine-neuter-singular":"omoteticul","definite-error-unrecognized-form-feminine-singular":"omotetica","definite-error-unrecognized-form-masculine-plural":"omoteticii","definite-error-unrecognized-form-feminine-neuter-plural":"omoteticele"}},{"word":"omotetie","pos":"noun","definitions":["homothety"],"forms":{"plural":"omotetii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"omotetie","accusative-definite-nominative-singular":"omotetia","accusative-indefinite-nominative-plural":"omotetii","accusative-definite-nominative-plural":"omotetiile","dative-genitive-indefinite-singular":"omotetii","dative-definite-genitive-singular":"omotetiei","dative-genitive-indefinite-plural":"omotetii","dative-definite-genitive-plural":"omotetiilor","singular-vocative":"omotetie","plural-vocative":"omotetiilor"}},{"word":"omotopie","pos":"noun","definitions":["homotopy"],"forms":{"plural":"omotopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"omotopie","accusative-definite-nominative-singular":"omotopia","accusative-indefinite-nominative-plural":"omotopii","accusative-definite-nominative-plural":"omotopiile","dative-genitive-indefinite-singular":"omotopii","dative-definite-genitive-singular":"omotopiei","dative-genitive-indefinite-plural":"omotopii","dative-definite-genitive-plural":"omotopiilor","singular-vocative":"omotopie","plural-vocative":"omotopiilor"}},{"word":"omrăzi","pos":"verb","definitions":["to detest"],"forms":{"canonical":"a omrăzi 4th conjugation","present-singular-third-person":"omrăzește","participle-past":"omrăzit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a omrăzi","gerund":"omrăzind","first-person-indicative-present-singular":"omrăzesc","indicative-present-second-person-singular":"omrăzești","indicative-present-singular-third-person":"omrăzește","first-person-indicative-plural-present":"omrăzim","indicative-plural-present-second-person":"omrăziți","indicative-plural-present-third-person":"omrăzesc","first-person-imperfect-indicative-singular":"omrăzeam","imperfect-indicative-second-person-singular":"omrăzeai","imperfect-indicative-singular-third-person":"omrăzea","first-person-imperfect-indicative-plural":"omrăzeam","imperfect-indicative-plural-second-person":"omrăzeați","imperfect-indicative-plural-third-person":"omrăzeau","first-person-indicative-perfect-singular":"omrăzii","indicative-perfect-second-person-singular":"omrăziși","indicative-perfect-singular-third-person":"omrăzi","first-person-indicative-perfect-plural":"omrăzirăm","indicative-perfect-plural-second-person":"omrăzirăți","indicative-perfect-plural-third-person":"omrăziră","first-person-indicative-pluperfect-singular":"omrăzisem","indicative-pluperfect-second-person-singular":"omrăziseși","indicative-pluperfect-singular-third-person":"omrăzise","first-person-indicative-pluperfect-plural":"omrăziserăm","indicative-pluperfect-plural-second-person":"omrăziserăți","indicative-pluperfect-plural-third-person":"omrăziseră","first-person-present-singular-subjunctive":"să omrăzesc","present-second-person-singular-subjunctive":"să omrăzești","present-singular-subjunctive-third-person":"să omrăzească","first-person-plural-present-subjunctive":"să omrăzim","plural-present-second-person-subjunctive":"să omrăziți","plural-present-subjunctive-third-person":"să omrăzească","imperative-second-person-singular":"omrăzește","imperative-plural-second-person":"omrăziți","imperative-negative-second-person-singular":"nu omrăzi","imperative-negative-plural-second-person":"nu omrăziți"}},{"word":"omucid","pos":"noun","definitions":["homicide"],"forms":{"plural":"omucizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"omucid","accusative-definite-nominative-singular":"omucidul","accusative-indefinite-nominative-plural":"omucizi","accusative-definite-nominative-plural":"omucizii","dative-genitive-indefinite-singular":"omucid","dative-definite-genitive-singular":"omucidului","dative-genitive-indefinite-plural":"omucizi","dative-definite-genitive-plural":"omucizilor","singular-vocative":"omucidule","plural-vocative":"omucizilor"}},{"word":"omucidere","pos":"noun","definitions":["homicide"],"forms":{"plural":"omucideri"}},{"word":"omucigaș","pos":"noun","definitions":["killer"],"forms":{"plural":"omucigași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"omucigaș","accusative-definite-nominative-singular":"omucigașul","accusative-indefinite-nominative-plural":"omucigași","accusative-definite-nominative-plural":"omucigașii","dative-genitive-indefinite-singular":"omucigaș","dative-definite-genitive-singular":"omucigașului","dative-genitive-indefinite-plural":"omucigași","dative-definite-genitive-plural":"omucigașilor","singular-vocative":"omucigașule","plural-vocative":"omucigașilor"}},{"word":"omucigașă","pos":"noun","definitions":["female equivalent of omucigaș"],"forms":{"plural":"omucigașe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"omucigașă","accusative-definite-nominative-singular":"omucigașa","accusative-indefinite-nominative-plural":"omucigașe","accusative-definite-nominative-plural":"omucigașele","dative-genitive-indefinite-singular":"omucigașe","dative-definite-genitive-singular":"omucigașei","dative-genitive-indefinite-plural":"omucigașe","dative-definite-genitive-plural":"omucigașelor","singular-vocative":"omucigașă","plural-vocative":"omucigașelor"}},{"word":"omul","pos":"noun","definitions":["definite nominative/accusative singular of om"],"pronunciation":"/ˈo.mul/"},{"word":"omul sfințește locul","pos":"proverb","definitions":["it matters who inhabits a place to improve it"]},{"word":"omul zăpezilor","pos":"noun","definitions":["abominable snowman"]},{"word":"omule","pos":"noun","definitions":["vocative singular of om"]},{"word":"omuleț","pos":"noun","definitions":["diminutive of om (“human”)"],"forms":{"plural":"omuleți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"omuleț","accusative-definite-nominative-singular":"omulețul","accusative-indefinite-nominative-plural":"omuleți","accusative-definite-nominative-plural":"omuleții","dative-genitive-indefinite-singular":"omuleț","dative-definite-genitive-singular":"omulețului","dative-genitive-indefinite-plural":"omuleți","dative-definite-genitive-plural":"omuleților","singular-vocative":"omulețule","plural-vocative":"omuleților"}},{"word":"omului","pos":"noun","definitions":["definite dative/genitive singular of om"]},{"word":"Omurcea","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed to Valea Seacă, later merged with Valu lui Traian."],"gender":"f"},{"word":"Omurlar","pos":"name","definitions":["a town in Tulcea County, Dobruja, in eastern Romania. Renamed to General Dragalina."],"gender":"m"},{"word":"omușor","pos":"noun","definitions":["uvula"],"forms":{"plural":"omușori","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"omușor","accusative-definite-nominative-singular":"omușorul","accusative-indefinite-nominative-plural":"omușori","accusative-definite-nominative-plural":"omușorile","dative-genitive-indefinite-singular":"omușor","dative-definite-genitive-singular":"omușorului","dative-genitive-indefinite-plural":"omușori","dative-definite-genitive-plural":"omușorilor","singular-vocative":"omușorule","plural-vocative":"omușorilor"}},{"word":"Omușoru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Omușoru"}},{"word":"omuț","pos":"noun","definitions":["diminutive of om"],"forms":{"plural":"omuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"omuț","accusative-definite-nominative-singular":"omuțul","accusative-indefinite-nominative-plural":"omuți","accusative-definite-nominative-plural":"omuții","dative-genitive-indefinite-singular":"omuț","dative-definite-genitive-singular":"omuțului","dative-genitive-indefinite-plural":"omuți","dative-definite-genitive-plural":"omuților","singular-vocative":"omuțule","plural-vocative":"omuților"}},{"word":"onagru","pos":"noun","definitions":["onager"],"forms":{"plural":"onagri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"onagru","accusative-definite-nominative-singular":"onagruul","accusative-indefinite-nominative-plural":"onagri","accusative-definite-nominative-plural":"onagrii","dative-genitive-indefinite-singular":"onagru","dative-definite-genitive-singular":"onagruului","dative-genitive-indefinite-plural":"onagri","dative-definite-genitive-plural":"onagrilor","singular-vocative":"onagruule","plural-vocative":"onagrilor"}},{"word":"Onanie","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Onanie"}},{"word":"onanie","pos":"noun","definitions":["onanism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"onanie","accusative-definite-nominative":"onania","dative-genitive-indefinite":"onanii","dative-definite-genitive":"onaniei","vocative":"onanie"}},{"word":"onanism","pos":"noun","definitions":["onanism, masturbation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"onanism","accusative-definite-nominative":"onanismul","dative-genitive-indefinite":"onanism","dative-definite-genitive":"onanismului","vocative":"onanismule"}},{"word":"onanist","pos":"noun","definitions":["onanist, masturbator (someone who masturbates)"],"forms":{"plural":"onaniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"onanist","accusative-definite-nominative-singular":"onanistul","accusative-indefinite-nominative-plural":"onaniști","accusative-definite-nominative-plural":"onaniștii","dative-genitive-indefinite-singular":"onanist","dative-definite-genitive-singular":"onanistului","dative-genitive-indefinite-plural":"onaniști","dative-definite-genitive-plural":"onaniștilor","singular-vocative":"onanistule","plural-vocative":"onaniștilor"}},{"word":"onanistă","pos":"noun","definitions":["female equivalent of onanist"],"forms":{"plural":"onaniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"onanistă","accusative-definite-nominative-singular":"onanista","accusative-indefinite-nominative-plural":"onaniste","accusative-definite-nominative-plural":"onanistele","dative-genitive-indefinite-singular":"onaniste","dative-definite-genitive-singular":"onanistei","dative-genitive-indefinite-plural":"onaniste","dative-definite-genitive-plural":"onanistelor","singular-vocative":"onanistă","plural-vocative":"onanistelor"}},{"word":"Oncel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Oncel"}},{"word":"Oncescu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Oncescu"}},{"word":"Oncești","pos":"name","definitions":["a village in Mogoș, Alba County, Romania","a commune of Bacău County, Romania","a village in Oncești, Bacău County, Romania","a village in Voinești, Dâmbovița County, Romania","a village in Stănești, Giurgiu County, Romania"],"gender":"m"},{"word":"Onceștii Vechi","pos":"name","definitions":["a village in Oncești, Bacău County, Romania"],"gender":"m"},{"word":"Oncică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Oncică"}},{"word":"Oncioiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Oncioiu"}},{"word":"Onciu","pos":"name","definitions":["a village in Berești-Meria, Galați County, Romania"],"gender":"m"},{"word":"Onciulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Onciulescu"}},{"word":"oncogen","pos":"noun","definitions":["oncogene"],"forms":{"plural":"oncogeni","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"oncogen","accusative-definite-nominative-singular":"oncoge","accusative-indefinite-nominative-plural":"oncogeni","accusative-definite-nominative-plural":"oncogenile","dative-genitive-indefinite-singular":"oncogeni","dative-definite-genitive-singular":"oncogenii","dative-genitive-indefinite-plural":"oncogeni","dative-definite-genitive-plural":"oncogenilor","singular-vocative":"-","plural-vocative":"-"}},{"word":"oncogenă","pos":"noun","definitions":["oncogene"],"forms":{"plural":"oncogene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oncogenă","accusative-definite-nominative-singular":"oncogena","accusative-indefinite-nominative-plural":"oncogene","accusative-definite-nominative-plural":"oncogenele","dative-genitive-indefinite-singular":"oncogene","dative-definite-genitive-singular":"oncogenei","dative-genitive-indefinite-plural":"oncogene","dative-definite-genitive-plural":"oncogenelor","singular-vocative":"oncogenă","plural-vocative":"oncogenelor"}},{"word":"oncograf","pos":"noun","definitions":["oncograph"],"forms":{"plural":"oncografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oncograf","accusative-definite-nominative-singular":"oncograful","accusative-indefinite-nominative-plural":"oncografe","accusative-definite-nominative-plural":"oncografele","dative-genitive-indefinite-singular":"oncograf","dative-definite-genitive-singular":"oncografului","dative-genitive-indefinite-plural":"oncografe","dative-definite-genitive-plural":"oncografelor","singular-vocative":"oncografule","plural-vocative":"oncografelor"}},{"word":"oncolog","pos":"noun","definitions":["oncologist"],"pronunciation":"/on.koˈloɡ/","forms":{"plural":"oncologi","feminine":"equivalent oncologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oncolog","accusative-definite-nominative-singular":"oncologul","accusative-indefinite-nominative-plural":"oncologi","accusative-definite-nominative-plural":"oncologii","dative-genitive-indefinite-singular":"oncolog","dative-definite-genitive-singular":"oncologului","dative-genitive-indefinite-plural":"oncologi","dative-definite-genitive-plural":"oncologilor","singular-vocative":"oncologule","plural-vocative":"oncologilor"}},{"word":"oncologă","pos":"noun","definitions":["female equivalent of oncolog"],"pronunciation":"/on.koˈlo.ɡə/","forms":{"plural":"oncologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"oncologă","accusative-definite-nominative-singular":"oncologa","accusative-indefinite-nominative-plural":"oncologe","accusative-definite-nominative-plural":"oncologele","dative-genitive-indefinite-singular":"oncologe","dative-definite-genitive-singular":"oncologei","dative-genitive-indefinite-plural":"oncologe","dative-definite-genitive-plural":"oncologelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"oncologe","pos":"noun","definitions":["plural of oncologă"],"gender":"f"},{"word":"oncologi","pos":"noun","definitions":["plural of oncolog"],"gender":"m"},{"word":"oncologic","pos":"adj","definitions":["oncologic, oncological"],"forms":{"feminine-singular":"oncologică","masculine-plural":"oncologici","feminine-neuter-plural":"oncologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oncologic","error-unrecognized-form-feminine-indefinite-singular":"oncologică","error-unrecognized-form-indefinite-masculine-plural":"oncologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"oncologice","definite-error-unrecognized-form-masculine-neuter-singular":"oncologicul","definite-error-unrecognized-form-feminine-singular":"oncologica","definite-error-unrecognized-form-masculine-plural":"oncologicii","definite-error-unrecognized-form-feminine-neuter-plural":"oncologicele"}},{"word":"oncologie","pos":"noun","definitions":["oncology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"oncologie","accusative-definite-nominative":"oncologia","dative-genitive-indefinite":"oncologii","dative-definite-genitive":"oncologiei","vocative":"oncologie"}},{"word":"oncometru","pos":"noun","definitions":["oncometer"],"forms":{"plural":"oncometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oncometru","accusative-definite-nominative-singular":"oncometruul","accusative-indefinite-nominative-plural":"oncometre","accusative-definite-nominative-plural":"oncometrele","dative-genitive-indefinite-singular":"oncometru","dative-definite-genitive-singular":"oncometruului","dative-genitive-indefinite-plural":"oncometre","dative-definite-genitive-plural":"oncometrelor","singular-vocative":"oncometruule","plural-vocative":"oncometrelor"}},{"word":"oncotomie","pos":"noun","definitions":["oncotomy"],"forms":{"plural":"oncotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oncotomie","accusative-definite-nominative-singular":"oncotomia","accusative-indefinite-nominative-plural":"oncotomii","accusative-definite-nominative-plural":"oncotomiile","dative-genitive-indefinite-singular":"oncotomii","dative-definite-genitive-singular":"oncotomiei","dative-genitive-indefinite-plural":"oncotomii","dative-definite-genitive-plural":"oncotomiilor","singular-vocative":"oncotomie","plural-vocative":"oncotomiilor"}},{"word":"oncțiune","pos":"noun","definitions":["unction"],"forms":{"plural":"oncțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oncțiune","accusative-definite-nominative-singular":"oncțiunea","accusative-indefinite-nominative-plural":"oncțiuni","accusative-definite-nominative-plural":"oncțiunile","dative-genitive-indefinite-singular":"oncțiuni","dative-definite-genitive-singular":"oncțiunii","dative-genitive-indefinite-plural":"oncțiuni","dative-definite-genitive-plural":"oncțiunilor","singular-vocative":"oncțiune","plural-vocative":"oncțiunilor"}},{"word":"onctuos","pos":"adj","definitions":["unctuous"],"forms":{"feminine-singular":"onctuoasă","masculine-plural":"onctuoși","feminine-neuter-plural":"onctuoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"onctuos","error-unrecognized-form-feminine-indefinite-singular":"onctuoasă","error-unrecognized-form-indefinite-masculine-plural":"onctuoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"onctuoase","definite-error-unrecognized-form-masculine-neuter-singular":"onctuosul","definite-error-unrecognized-form-feminine-singular":"onctuoasa","definite-error-unrecognized-form-masculine-plural":"onctuoșii","definite-error-unrecognized-form-feminine-neuter-plural":"onctuoasele"}},{"word":"onctuozitate","pos":"noun","definitions":["lubricity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"onctuozitate","accusative-definite-nominative-singular":"onctuozitatea","accusative-indefinite-nominative-plural":"onctuozități","accusative-definite-nominative-plural":"onctuozitățile","dative-genitive-indefinite-singular":"onctuozități","dative-definite-genitive-singular":"onctuozității","dative-genitive-indefinite-plural":"onctuozități","dative-definite-genitive-plural":"onctuozităților","singular-vocative":"onctuozitate","plural-vocative":"onctuozităților"}},{"word":"ondină","pos":"noun","definitions":["undine"],"forms":{"plural":"ondine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ondină","accusative-definite-nominative-singular":"ondina","accusative-indefinite-nominative-plural":"ondine","accusative-definite-nominative-plural":"ondinele","dative-genitive-indefinite-singular":"ondine","dative-definite-genitive-singular":"ondinei","dative-genitive-indefinite-plural":"ondine","dative-definite-genitive-plural":"ondinelor","singular-vocative":"ondină","plural-vocative":"ondinelor"}},{"word":"ondograf","pos":"noun","definitions":["ondograph"],"forms":{"plural":"ondografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ondograf","accusative-definite-nominative-singular":"ondograful","accusative-indefinite-nominative-plural":"ondografe","accusative-definite-nominative-plural":"ondografele","dative-genitive-indefinite-singular":"ondograf","dative-definite-genitive-singular":"ondografului","dative-genitive-indefinite-plural":"ondografe","dative-definite-genitive-plural":"ondografelor","singular-vocative":"ondografule","plural-vocative":"ondografelor"}},{"word":"ondometru","pos":"noun","definitions":["ondometer"],"forms":{"plural":"ondometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ondometru","accusative-definite-nominative-singular":"ondometruul","accusative-indefinite-nominative-plural":"ondometre","accusative-definite-nominative-plural":"ondometrele","dative-genitive-indefinite-singular":"ondometru","dative-definite-genitive-singular":"ondometruului","dative-genitive-indefinite-plural":"ondometre","dative-definite-genitive-plural":"ondometrelor","singular-vocative":"ondometruule","plural-vocative":"ondometrelor"}},{"word":"ondula","pos":"verb","definitions":["to wave"],"forms":{"canonical":"a ondula 1st conjugation","present-singular-third-person":"ondulează","participle-past":"ondulat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ondula","gerund":"ondulând","first-person-indicative-present-singular":"ondulez","indicative-present-second-person-singular":"ondulezi","indicative-present-singular-third-person":"ondulează","first-person-indicative-plural-present":"ondulăm","indicative-plural-present-second-person":"ondulați","indicative-plural-present-third-person":"ondulează","first-person-imperfect-indicative-singular":"ondulam","imperfect-indicative-second-person-singular":"ondulai","imperfect-indicative-singular-third-person":"ondula","first-person-imperfect-indicative-plural":"ondulam","imperfect-indicative-plural-second-person":"ondulați","imperfect-indicative-plural-third-person":"ondulau","first-person-indicative-perfect-singular":"ondulai","indicative-perfect-second-person-singular":"ondulași","indicative-perfect-singular-third-person":"ondulă","first-person-indicative-perfect-plural":"ondularăm","indicative-perfect-plural-second-person":"ondularăți","indicative-perfect-plural-third-person":"ondulară","first-person-indicative-pluperfect-singular":"ondulasem","indicative-pluperfect-second-person-singular":"ondulaseși","indicative-pluperfect-singular-third-person":"ondulase","first-person-indicative-pluperfect-plural":"ondulaserăm","indicative-pluperfect-plural-second-person":"ondulaserăți","indicative-pluperfect-plural-third-person":"ondulaseră","first-person-present-singular-subjunctive":"să ondulez","present-second-person-singular-subjunctive":"să ondulezi","present-singular-subjunctive-third-person":"să onduleze","first-person-plural-present-subjunctive":"să ondulăm","plural-present-second-person-subjunctive":"să ondulați","plural-present-subjunctive-third-person":"să onduleze","imperative-second-person-singular":"ondulează","imperative-plural-second-person":"ondulați","imperative-negative-second-person-singular":"nu ondula","imperative-negative-plural-second-person":"nu ondulați"}},{"word":"ondulare","pos":"noun","definitions":["curling"],"forms":{"plural":"ondulări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ondulare","accusative-definite-nominative-singular":"ondularea","accusative-indefinite-nominative-plural":"ondulări","accusative-definite-nominative-plural":"ondulările","dative-genitive-indefinite-singular":"ondulări","dative-definite-genitive-singular":"ondulării","dative-genitive-indefinite-plural":"ondulări","dative-definite-genitive-plural":"ondulărilor","singular-vocative":"ondulare","plural-vocative":"ondulărilor"}},{"word":"ondulat","pos":"adj","definitions":["waved"],"pronunciation":"/on.duˈlat/","forms":{"feminine-singular":"ondulată","masculine-plural":"ondulați","feminine-neuter-plural":"ondulate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ondulat","error-unrecognized-form-feminine-indefinite-singular":"ondulată","error-unrecognized-form-indefinite-masculine-plural":"ondulați","error-unrecognized-form-feminine-indefinite-neuter-plural":"ondulate","definite-error-unrecognized-form-masculine-neuter-singular":"ondulatul","definite-error-unrecognized-form-feminine-singular":"ondulata","definite-error-unrecognized-form-masculine-plural":"ondulații","definite-error-unrecognized-form-feminine-neuter-plural":"ondulatele"}},{"word":"ondulație","pos":"noun","definitions":["undulation"],"forms":{"plural":"ondulații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ondulație","accusative-definite-nominative-singular":"ondulația","accusative-indefinite-nominative-plural":"ondulații","accusative-definite-nominative-plural":"ondulațiile","dative-genitive-indefinite-singular":"ondulații","dative-definite-genitive-singular":"ondulației","dative-genitive-indefinite-plural":"ondulații","dative-definite-genitive-plural":"ondulațiilor","singular-vocative":"ondulație","plural-vocative":"ondulațiilor"}},{"word":"ondulație permanentă","pos":"noun","definitions":["permanent wave"]},{"word":"ondulațiune","pos":"noun","definitions":["obsolete form of ondulație"],"forms":{"plural":"ondulațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ondulațiune","accusative-definite-nominative-singular":"ondulațiunea","accusative-indefinite-nominative-plural":"ondulațiuni","accusative-definite-nominative-plural":"ondulațiunile","dative-genitive-indefinite-singular":"ondulațiuni","dative-definite-genitive-singular":"ondulațiunii","dative-genitive-indefinite-plural":"ondulațiuni","dative-definite-genitive-plural":"ondulațiunilor","singular-vocative":"ondulațiune","plural-vocative":"ondulațiunilor"}},{"word":"ondulator","pos":"noun","definitions":["inverter","hair curler"],"forms":{"plural":"ondulatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ondulator","accusative-definite-nominative-singular":"ondulatorul","accusative-indefinite-nominative-plural":"ondulatoare","accusative-definite-nominative-plural":"ondulatoarele","dative-genitive-indefinite-singular":"ondulator","dative-definite-genitive-singular":"ondulatorului","dative-genitive-indefinite-plural":"ondulatoare","dative-definite-genitive-plural":"ondulatoarelor","singular-vocative":"ondulatorule","plural-vocative":"ondulatoarelor"}},{"word":"ondulător","pos":"adj","definitions":["alternative form of ondulator"],"forms":{"feminine-singular":"ondulătoare","masculine-plural":"ondulători","feminine-neuter-plural":"ondulătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ondulător","error-unrecognized-form-feminine-indefinite-singular":"ondulătoare","error-unrecognized-form-indefinite-masculine-plural":"ondulători","error-unrecognized-form-feminine-indefinite-neuter-plural":"ondulătoare","definite-error-unrecognized-form-masculine-neuter-singular":"ondulătorul","definite-error-unrecognized-form-feminine-singular":"ondulătoarea","definite-error-unrecognized-form-masculine-plural":"ondulătorii","definite-error-unrecognized-form-feminine-neuter-plural":"ondulătoarele"}},{"word":"ondulatoriu","pos":"adj","definitions":["undulating"],"forms":{"feminine-singular":"ondulatorie","plural":"ondulatorii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ondulatoriu","error-unrecognized-form-feminine-indefinite-singular":"ondulatorie","error-unrecognized-form-indefinite-masculine-plural":"ondulatorii","error-unrecognized-form-feminine-indefinite-neuter-plural":"ondulatorii","definite-error-unrecognized-form-masculine-neuter-singular":"ondulatoriul","definite-error-unrecognized-form-feminine-singular":"ondulatoria","definite-error-unrecognized-form-masculine-plural":"ondulatoriii","definite-error-unrecognized-form-feminine-neuter-plural":"ondulatoriile"}},{"word":"onduleu","pos":"noun","definitions":["lock of hair"],"forms":{"plural":"onduleuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"onduleu","accusative-definite-nominative-singular":"onduleuul","accusative-indefinite-nominative-plural":"onduleuri","accusative-definite-nominative-plural":"onduleurile","dative-genitive-indefinite-singular":"onduleu","dative-definite-genitive-singular":"onduleuului","dative-genitive-indefinite-plural":"onduleuri","dative-definite-genitive-plural":"onduleurilor","singular-vocative":"onduleuule","plural-vocative":"onduleurilor"}},{"word":"ondulor","pos":"noun","definitions":["inverter"],"forms":{"plural":"onduloare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ondulor","accusative-definite-nominative-singular":"ondulorul","accusative-indefinite-nominative-plural":"onduloare","accusative-definite-nominative-plural":"onduloarele","dative-genitive-indefinite-singular":"ondulor","dative-definite-genitive-singular":"ondulorului","dative-genitive-indefinite-plural":"onduloare","dative-definite-genitive-plural":"onduloarelor","singular-vocative":"ondulorule","plural-vocative":"onduloarelor"}},{"word":"ondulos","pos":"adj","definitions":["billowy"],"forms":{"feminine-singular":"onduloasă","masculine-plural":"onduloși","feminine-neuter-plural":"onduloase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ondulos","error-unrecognized-form-feminine-indefinite-singular":"onduloasă","error-unrecognized-form-indefinite-masculine-plural":"onduloși","error-unrecognized-form-feminine-indefinite-neuter-plural":"onduloase","definite-error-unrecognized-form-masculine-neuter-singular":"ondulosul","definite-error-unrecognized-form-feminine-singular":"onduloasa","definite-error-unrecognized-form-masculine-plural":"onduloșii","definite-error-unrecognized-form-feminine-neuter-plural":"onduloasele"}},{"word":"ondulozitate","pos":"noun","definitions":["billowiness"],"forms":{"plural":"ondulozități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ondulozitate","accusative-definite-nominative-singular":"ondulozitatea","accusative-indefinite-nominative-plural":"ondulozități","accusative-definite-nominative-plural":"ondulozitățile","dative-genitive-indefinite-singular":"ondulozități","dative-definite-genitive-singular":"ondulozității","dative-genitive-indefinite-plural":"ondulozități","dative-definite-genitive-plural":"ondulozităților","singular-vocative":"ondulozitate","plural-vocative":"ondulozităților"}},{"word":"Onel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Onel"}},{"word":"oneros","pos":"adj","definitions":["onerous"],"forms":{"feminine-singular":"oneroasă","masculine-plural":"oneroși","feminine-neuter-plural":"oneroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oneros","error-unrecognized-form-feminine-indefinite-singular":"oneroasă","error-unrecognized-form-indefinite-masculine-plural":"oneroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"oneroase","definite-error-unrecognized-form-masculine-neuter-singular":"onerosul","definite-error-unrecognized-form-feminine-singular":"oneroasa","definite-error-unrecognized-form-masculine-plural":"oneroșii","definite-error-unrecognized-form-feminine-neuter-plural":"oneroasele"}},{"word":"onerozitate","pos":"noun","definitions":["onerosity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"onerozitate","accusative-definite-nominative-singular":"onerozitatea","accusative-indefinite-nominative-plural":"onerozități","accusative-definite-nominative-plural":"onerozitățile","dative-genitive-indefinite-singular":"onerozități","dative-definite-genitive-singular":"onerozității","dative-genitive-indefinite-plural":"onerozități","dative-definite-genitive-plural":"onerozităților","singular-vocative":"onerozitate","plural-vocative":"onerozităților"}},{"word":"Onescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Onescu"}},{"word":"onest","pos":"adj","definitions":["honest"],"pronunciation":"/oˈnest/","forms":{"feminine-singular":"onestă","masculine-plural":"onești","feminine-neuter-plural":"oneste","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"onest","error-unrecognized-form-feminine-indefinite-singular":"onestă","error-unrecognized-form-indefinite-masculine-plural":"onești","error-unrecognized-form-feminine-indefinite-neuter-plural":"oneste","definite-error-unrecognized-form-masculine-neuter-singular":"onestul","definite-error-unrecognized-form-feminine-singular":"onesta","definite-error-unrecognized-form-masculine-plural":"oneștii","definite-error-unrecognized-form-feminine-neuter-plural":"onestele"}},{"word":"onestate","pos":"noun","definitions":["honesty"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"onestate","accusative-definite-nominative":"onestatea","dative-genitive-indefinite":"onestăți","dative-definite-genitive":"onestății","vocative":"-"}},{"word":"Onești","pos":"name","definitions":["a city in Bacău County, Romania","a village in Plugari, Iași County, Romania"],"pronunciation":"/oˈneʃtʲ/","gender":"m"},{"word":"onestie","pos":"noun","definitions":["honor, integrity, honesty"],"forms":{"plural":"onestii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"onestie","accusative-definite-nominative-singular":"onestia","accusative-indefinite-nominative-plural":"onestii","accusative-definite-nominative-plural":"onestiile","dative-genitive-indefinite-singular":"onestii","dative-definite-genitive-singular":"onestiei","dative-genitive-indefinite-plural":"onestii","dative-definite-genitive-plural":"onestiilor","singular-vocative":"onestie","plural-vocative":"onestiilor"}},{"word":"onestitate","pos":"noun","definitions":["honesty"],"pronunciation":"[o.nes.tiˈta.te]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"onestitate","accusative-definite-nominative":"onestitatea","dative-genitive-indefinite":"onestități","dative-definite-genitive":"onestității","vocative":"onestitate"}},{"word":"Oneț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Oneț"}},{"word":"Onete","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Onete"}},{"word":"ONG","pos":"noun","definitions":["NGO"],"forms":{"plural":"ONG-uri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ONG","accusative-definite-nominative-singular":"ONG-ul","accusative-indefinite-nominative-plural":"ONG-uri","accusative-definite-nominative-plural":"ONG-urile","dative-genitive-indefinite-singular":"ONG","dative-definite-genitive-singular":"ONG-ului","dative-genitive-indefinite-plural":"ONG-uri","dative-definite-genitive-plural":"ONG-urilor","singular-vocative":"ONG-ule","plural-vocative":"ONG-urilor"}},{"word":"ONG-uri","pos":"noun","definitions":["plural of ONG"]},{"word":"Onică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Onică"}},{"word":"onicalgie","pos":"noun","definitions":["onychalgia"],"forms":{"plural":"onicalgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"onicalgie","accusative-definite-nominative-singular":"onicalgia","accusative-indefinite-nominative-plural":"onicalgii","accusative-definite-nominative-plural":"onicalgiile","dative-genitive-indefinite-singular":"onicalgii","dative-definite-genitive-singular":"onicalgiei","dative-genitive-indefinite-plural":"onicalgii","dative-definite-genitive-plural":"onicalgiilor","singular-vocative":"onicalgie","plural-vocative":"onicalgiilor"}},{"word":"Oniceni","pos":"name","definitions":["a commune of Neamț County, Romania","a village in Oniceni, Neamț County, Romania","a village in Forăști, Suceava County, Romania"],"gender":"m"},{"word":"onichie","pos":"noun","definitions":["onychia"],"forms":{"plural":"onichii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"onichie","accusative-definite-nominative-singular":"onichia","accusative-indefinite-nominative-plural":"onichii","accusative-definite-nominative-plural":"onichiile","dative-genitive-indefinite-singular":"onichii","dative-definite-genitive-singular":"onichiei","dative-genitive-indefinite-plural":"onichii","dative-definite-genitive-plural":"onichiilor","singular-vocative":"onichie","plural-vocative":"onichiilor"}},{"word":"Onicioiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Onicioiu"}},{"word":"onicofagie","pos":"noun","definitions":["onychophagy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"onicofagie","accusative-definite-nominative":"onicofagia","dative-genitive-indefinite":"onicofagii","dative-definite-genitive":"onicofagiei","vocative":"onicofagie"}},{"word":"onicomicoză","pos":"noun","definitions":["onychomycosis"],"forms":{"plural":"onicomicoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"onicomicoză","accusative-definite-nominative-singular":"onicomicoza","accusative-indefinite-nominative-plural":"onicomicoze","accusative-definite-nominative-plural":"onicomicozele","dative-genitive-indefinite-singular":"onicomicoze","dative-definite-genitive-singular":"onicomicozei","dative-genitive-indefinite-plural":"onicomicoze","dative-definite-genitive-plural":"onicomicozelor","singular-vocative":"onicomicoză","plural-vocative":"onicomicozelor"}},{"word":"onicoză","pos":"noun","definitions":["onychosis"],"forms":{"plural":"onicoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"onicoză","accusative-definite-nominative-singular":"onicoza","accusative-indefinite-nominative-plural":"onicoze","accusative-definite-nominative-plural":"onicozele","dative-genitive-indefinite-singular":"onicoze","dative-definite-genitive-singular":"onicozei","dative-genitive-indefinite-plural":"onicoze","dative-definite-genitive-plural":"onicozelor","singular-vocative":"onicoză","plural-vocative":"onicozelor"}},{"word":"oniomanie","pos":"noun","definitions":["oniomania"],"forms":{"plural":"oniomanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oniomanie","accusative-definite-nominative-singular":"oniomania","accusative-indefinite-nominative-plural":"oniomanii","accusative-definite-nominative-plural":"oniomaniile","dative-genitive-indefinite-singular":"oniomanii","dative-definite-genitive-singular":"oniomaniei","dative-genitive-indefinite-plural":"oniomanii","dative-definite-genitive-plural":"oniomaniilor","singular-vocative":"oniomanie","plural-vocative":"oniomaniilor"}},{"word":"oniric","pos":"adj","definitions":["oneiric"],"pronunciation":"/oˈni.rik/","forms":{"feminine-singular":"onirică","masculine-plural":"onirici","feminine-neuter-plural":"onirice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"oniric","error-unrecognized-form-feminine-indefinite-singular":"onirică","error-unrecognized-form-indefinite-masculine-plural":"onirici","error-unrecognized-form-feminine-indefinite-neuter-plural":"onirice","definite-error-unrecognized-form-masculine-neuter-singular":"oniricul","definite-error-unrecognized-form-feminine-singular":"onirica","definite-error-unrecognized-form-masculine-plural":"oniricii","definite-error-unrecognized-form-feminine-neuter-plural":"oniricele"}},{"word":"onirism","pos":"noun","definitions":["oneirism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"onirism","accusative-definite-nominative":"onirismul","dative-genitive-indefinite":"onirism","dative-definite-genitive":"onirismului","vocative":"onirismule"}},{"word":"oniristă","pos":"noun","definitions":["female equivalent of onirist"],"forms":{"plural":"oniriste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oniristă","accusative-definite-nominative-singular":"onirista","accusative-indefinite-nominative-plural":"oniriste","accusative-definite-nominative-plural":"oniristele","dative-genitive-indefinite-singular":"oniriste","dative-definite-genitive-singular":"oniristei","dative-genitive-indefinite-plural":"oniriste","dative-definite-genitive-plural":"oniristelor","singular-vocative":"oniristă","plural-vocative":"oniristelor"}},{"word":"onirocrit","pos":"noun","definitions":["oneiromancer"],"forms":{"plural":"onirocriți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"onirocrit","accusative-definite-nominative-singular":"onirocritul","accusative-indefinite-nominative-plural":"onirocriți","accusative-definite-nominative-plural":"onirocriții","dative-genitive-indefinite-singular":"onirocrit","dative-definite-genitive-singular":"onirocritului","dative-genitive-indefinite-plural":"onirocriți","dative-definite-genitive-plural":"onirocriților","singular-vocative":"onirocritule","plural-vocative":"onirocriților"}},{"word":"oniromanție","pos":"noun","definitions":["oneiromancy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oniromanție","accusative-definite-nominative-singular":"oniromanția","accusative-indefinite-nominative-plural":"oniromanții","accusative-definite-nominative-plural":"oniromanțiile","dative-genitive-indefinite-singular":"oniromanții","dative-definite-genitive-singular":"oniromanției","dative-genitive-indefinite-plural":"oniromanții","dative-definite-genitive-plural":"oniromanțiilor","singular-vocative":"oniromanție","plural-vocative":"oniromanțiilor"}},{"word":"Onișcani","pos":"name","definitions":["a village in Onișcani, Călărași Raion, Moldova","a commune of Călărași Raion, Moldova","a village in Filipești, Bacău County, Romania"],"gender":"m"},{"word":"Oniță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Oniță"}},{"word":"Onițcani","pos":"name","definitions":["a village in Onițcani, Criuleni Raion, Moldova","a commune of Criuleni Raion, Moldova"],"gender":"m"},{"word":"Onițescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Onițescu"}},{"word":"Onițoaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Onițoaia"}},{"word":"Onițoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Onițoiu"}},{"word":"onix","pos":"noun","definitions":["onyx"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"onix","accusative-definite-nominative":"onixul","dative-genitive-indefinite":"onix","dative-definite-genitive":"onixului","vocative":"onixule"}},{"word":"onixis","pos":"noun","definitions":["onychia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"onixis","accusative-definite-nominative":"onixisul","dative-genitive-indefinite":"onixis","dative-definite-genitive":"onixisului","vocative":"onixisule"}},{"word":"onoare","pos":"noun","definitions":["honor","integrity, glory, esteem, repute","respect, esteem"],"forms":{"plural":"onoruri","table-tags":"no-table-tags","accusative-indefinite-nominative-singular":"onoare","accusative-definite-nominative-singular":"onoarea","accusative-indefinite-nominative-plural":"onoruri","accusative-definite-nominative-plural":"onorurile","dative-genitive-indefinite-singular":"onori","dative-definite-genitive-singular":"onoarei","dative-genitive-indefinite-plural":"onoruri","dative-definite-genitive-plural":"onorurilor","singular-vocative":"-","plural-vocative":"-","alternative":"onor"}},{"word":"Onofraș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Onofraș"}},{"word":"Onofreciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Onofreciuc","alternative":"Onofreiciuc"}},{"word":"Onofriciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Onofriciuc"}},{"word":"Onoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Onoiu"}},{"word":"onomanție","pos":"noun","definitions":["onomancy"],"forms":{"plural":"onomanții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"onomanție","accusative-definite-nominative-singular":"onomanția","accusative-indefinite-nominative-plural":"onomanții","accusative-definite-nominative-plural":"onomanțiile","dative-genitive-indefinite-singular":"onomanții","dative-definite-genitive-singular":"onomanției","dative-genitive-indefinite-plural":"onomanții","dative-definite-genitive-plural":"onomanțiilor","singular-vocative":"onomanție","plural-vocative":"onomanțiilor"}},{"word":"onomasiologic","pos":"adj","definitions":["onomasiological"],"forms":{"feminine-singular":"onomasiologică","masculine-plural":"onomasiologici","feminine-neuter-plural":"onomasiologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"onomasiologic","error-unrecognized-form-feminine-indefinite-singular":"onomasiologică","error-unrecognized-form-indefinite-masculine-plural":"onomasiologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"onomasiologice","definite-error-unrecognized-form-masculine-neuter-singular":"onomasiologicul","definite-error-unrecognized-form-feminine-singular":"onomasiologica","definite-error-unrecognized-form-masculine-plural":"onomasiologicii","definite-error-unrecognized-form-feminine-neuter-plural":"onomasiologicele"}},{"word":"onomasiologie","pos":"noun","definitions":["onomasiology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"onomasiologie","accusative-definite-nominative":"onomasiologia","dative-genitive-indefinite":"onomasiologii","dative-definite-genitive":"onomasiologiei","vocative":"onomasiologie"}},{"word":"onomastic","pos":"adj","definitions":["onomastic"],"forms":{"feminine-singular":"onomastică","masculine-plural":"onomastici","feminine-neuter-plural":"onomastice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"onomastic","error-unrecognized-form-feminine-indefinite-singular":"onomastică","error-unrecognized-form-indefinite-masculine-plural":"onomastici","error-unrecognized-form-feminine-indefinite-neuter-plural":"onomastice","definite-error-unrecognized-form-masculine-neuter-singular":"onomasticul","definite-error-unrecognized-form-feminine-singular":"onomastica","definite-error-unrecognized-form-masculine-plural":"onomasticii","definite-error-unrecognized-form-feminine-neuter-plural":"onomasticele"}},{"word":"onomastică","pos":"noun","definitions":["onomastics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"onomastică","accusative-definite-nominative":"onomastica","dative-genitive-indefinite":"onomastice","dative-definite-genitive":"onomasticei","vocative":"onomastică"}},{"word":"onomasticon","pos":"noun","definitions":["onomasticon"],"forms":{"plural":"onomasticoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"onomasticon","accusative-definite-nominative-singular":"onomasticonul","accusative-indefinite-nominative-plural":"onomasticoane","accusative-definite-nominative-plural":"onomasticoanele","dative-genitive-indefinite-singular":"onomasticon","dative-definite-genitive-singular":"onomasticonului","dative-genitive-indefinite-plural":"onomasticoane","dative-definite-genitive-plural":"onomasticoanelor","singular-vocative":"onomasticonule","plural-vocative":"onomasticoanelor"}},{"word":"onomatologie","pos":"noun","definitions":["onomastics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"onomatologie","accusative-definite-nominative":"onomatologia","dative-genitive-indefinite":"onomatologii","dative-definite-genitive":"onomatologiei","vocative":"onomatologie"}},{"word":"onomatomanie","pos":"noun","definitions":["onomatomania"],"forms":{"plural":"onomatomanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"onomatomanie","accusative-definite-nominative-singular":"onomatomania","accusative-indefinite-nominative-plural":"onomatomanii","accusative-definite-nominative-plural":"onomatomaniile","dative-genitive-indefinite-singular":"onomatomanii","dative-definite-genitive-singular":"onomatomaniei","dative-genitive-indefinite-plural":"onomatomanii","dative-definite-genitive-plural":"onomatomaniilor","singular-vocative":"onomatomanie","plural-vocative":"onomatomaniilor"}},{"word":"onomatopee","pos":"noun","definitions":["onomatopoeia"],"forms":{"plural":"onomatopee","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"onomatopee","accusative-definite-nominative-singular":"onomatopeea","accusative-indefinite-nominative-plural":"onomatopee","accusative-definite-nominative-plural":"onomatopeele","dative-genitive-indefinite-singular":"onomatopee","dative-definite-genitive-singular":"onomatopeei","dative-genitive-indefinite-plural":"onomatopee","dative-definite-genitive-plural":"onomatopeelor","singular-vocative":"onomatopee","plural-vocative":"onomatopeelor"}},{"word":"onomatopeic","pos":"adj","definitions":["onomatopoeic"],"pronunciation":"/ˌo.no.ma.toˈpe.ik/","forms":{"feminine-singular":"onomatopeică","masculine-plural":"onomatopeici","feminine-neuter-plural":"onomatopeice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"onomatopeic","error-unrecognized-form-feminine-indefinite-singular":"onomatopeică","error-unrecognized-form-indefinite-masculine-plural":"onomatopeici","error-unrecognized-form-feminine-indefinite-neuter-plural":"onomatopeice","definite-error-unrecognized-form-masculine-neuter-singular":"onomatopeicul","definite-error-unrecognized-form-feminine-singular":"onomatopeica","definite-error-unrecognized-form-masculine-plural":"onomatopeicii","definite-error-unrecognized-form-feminine-neuter-plural":"onomatopeicele"}},{"word":"onomatopoetic","pos":"adj","definitions":["onomatopoeic"],"forms":{"feminine-singular":"onomatopoetică","masculine-plural":"onomatopoetici","feminine-neuter-plural":"onomatopoetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"onomatopoetic","error-unrecognized-form-feminine-indefinite-singular":"onomatopoetică","error-unrecognized-form-indefinite-masculine-plural":"onomatopoetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"onomatopoetice","definite-error-unrecognized-form-masculine-neuter-singular":"onomatopoeticul","definite-error-unrecognized-form-feminine-singular":"onomatopoetica","definite-error-unrecognized-form-masculine-plural":"onomatopoeticii","definite-error-unrecognized-form-feminine-neuter-plural":"onomatopoeticele"}},{"word":"onor","pos":"noun","definitions":["alternative form of onoare"],"forms":{"plural":"onoruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"onor","accusative-definite-nominative-singular":"onorul","accusative-indefinite-nominative-plural":"onoruri","accusative-definite-nominative-plural":"onorurile","dative-genitive-indefinite-singular":"onor","dative-definite-genitive-singular":"onorului","dative-genitive-indefinite-plural":"onoruri","dative-definite-genitive-plural":"onorurilor","singular-vocative":"onorule","plural-vocative":"onorurilor"}},{"word":"onora","pos":"verb","definitions":["to honor"],"forms":{"canonical":"a onora 1st conjugation","present-singular-third-person":"onorează","participle-past":"onorat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a onora","gerund":"onorând","first-person-indicative-present-singular":"onorez","indicative-present-second-person-singular":"onorezi","indicative-present-singular-third-person":"onorează","first-person-indicative-plural-present":"onorăm","indicative-plural-present-second-person":"onorați","indicative-plural-present-third-person":"onorează","first-person-imperfect-indicative-singular":"onoram","imperfect-indicative-second-person-singular":"onorai","imperfect-indicative-singular-third-person":"onora","first-person-imperfect-indicative-plural":"onoram","imperfect-indicative-plural-second-person":"onorați","imperfect-indicative-plural-third-person":"onorau","first-person-indicative-perfect-singular":"onorai","indicative-perfect-second-person-singular":"onorași","indicative-perfect-singular-third-person":"onoră","first-person-indicative-perfect-plural":"onorarăm","indicative-perfect-plural-second-person":"onorarăți","indicative-perfect-plural-third-person":"onorară","first-person-indicative-pluperfect-singular":"onorasem","indicative-pluperfect-second-person-singular":"onoraseși","indicative-pluperfect-singular-third-person":"onorase","first-person-indicative-pluperfect-plural":"onoraserăm","indicative-pluperfect-plural-second-person":"onoraserăți","indicative-pluperfect-plural-third-person":"onoraseră","first-person-present-singular-subjunctive":"să onorez","present-second-person-singular-subjunctive":"să onorezi","present-singular-subjunctive-third-person":"să onoreze","first-person-plural-present-subjunctive":"să onorăm","plural-present-second-person-subjunctive":"să onorați","plural-present-subjunctive-third-person":"să onoreze","imperative-second-person-singular":"onorează","imperative-plural-second-person":"onorați","imperative-negative-second-person-singular":"nu onora","imperative-negative-plural-second-person":"nu onorați"}},{"word":"onorabil","pos":"adj","definitions":["honorable"],"forms":{"feminine-singular":"onorabilă","masculine-plural":"onorabili","feminine-neuter-plural":"onorabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"onorabil","error-unrecognized-form-feminine-indefinite-singular":"onorabilă","error-unrecognized-form-indefinite-masculine-plural":"onorabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"onorabile","definite-error-unrecognized-form-masculine-neuter-singular":"onorabilul","definite-error-unrecognized-form-feminine-singular":"onorabila","definite-error-unrecognized-form-masculine-plural":"onorabilii","definite-error-unrecognized-form-feminine-neuter-plural":"onorabilele"}},{"word":"onorabilitate","pos":"noun","definitions":["honorability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"onorabilitate","accusative-definite-nominative-singular":"onorabilitatea","accusative-indefinite-nominative-plural":"onorabilități","accusative-definite-nominative-plural":"onorabilitățile","dative-genitive-indefinite-singular":"onorabilități","dative-definite-genitive-singular":"onorabilității","dative-genitive-indefinite-plural":"onorabilități","dative-definite-genitive-plural":"onorabilităților","singular-vocative":"onorabilitate","plural-vocative":"onorabilităților"}},{"word":"onorai","pos":"verb","definitions":["inflection of onora:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[onoˈraj]"},{"word":"onorant","pos":"adj","definitions":["honoring"],"forms":{"feminine-singular":"onorantă","masculine-plural":"onoranți","feminine-neuter-plural":"onorante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"onorant","error-unrecognized-form-feminine-indefinite-singular":"onorantă","error-unrecognized-form-indefinite-masculine-plural":"onoranți","error-unrecognized-form-feminine-indefinite-neuter-plural":"onorante","definite-error-unrecognized-form-masculine-neuter-singular":"onorantul","definite-error-unrecognized-form-feminine-singular":"onoranta","definite-error-unrecognized-form-masculine-plural":"onoranții","definite-error-unrecognized-form-feminine-neuter-plural":"onorantele"}},{"word":"onorar","pos":"adj","definitions":["honorarium"],"forms":{"feminine-singular":"onorară","masculine-plural":"onorari","feminine-neuter-plural":"onorare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"onorar","error-unrecognized-form-feminine-indefinite-singular":"onorară","error-unrecognized-form-indefinite-masculine-plural":"onorari","error-unrecognized-form-feminine-indefinite-neuter-plural":"onorare","definite-error-unrecognized-form-masculine-neuter-singular":"onorarul","definite-error-unrecognized-form-feminine-singular":"onorara","definite-error-unrecognized-form-masculine-plural":"onorarii","definite-error-unrecognized-form-feminine-neuter-plural":"onorarele"}},{"word":"onorare","pos":"noun","definitions":["honoring"],"forms":{"plural":"onorări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"onorare","accusative-definite-nominative-singular":"onorarea","accusative-indefinite-nominative-plural":"onorări","accusative-definite-nominative-plural":"onorările","dative-genitive-indefinite-singular":"onorări","dative-definite-genitive-singular":"onorării","dative-genitive-indefinite-plural":"onorări","dative-definite-genitive-plural":"onorărilor","singular-vocative":"onorare","plural-vocative":"onorărilor"}},{"word":"onorariu","pos":"noun","definitions":["fee, honorarium"],"forms":{"plural":"onorarii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"onorariu","accusative-definite-nominative-singular":"onorariul","accusative-indefinite-nominative-plural":"onorarii","accusative-definite-nominative-plural":"onorariile","dative-genitive-indefinite-singular":"onorariu","dative-definite-genitive-singular":"onorariului","dative-genitive-indefinite-plural":"onorarii","dative-definite-genitive-plural":"onorariilor","singular-vocative":"onorariule","plural-vocative":"onorariilor"}},{"word":"onorat","pos":"adj","definitions":["honored"],"forms":{"feminine-singular":"onorată","masculine-plural":"onorați","feminine-neuter-plural":"onorate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"onorat","error-unrecognized-form-feminine-indefinite-singular":"onorată","error-unrecognized-form-indefinite-masculine-plural":"onorați","error-unrecognized-form-feminine-indefinite-neuter-plural":"onorate","definite-error-unrecognized-form-masculine-neuter-singular":"onoratul","definite-error-unrecognized-form-feminine-singular":"onorata","definite-error-unrecognized-form-masculine-plural":"onorații","definite-error-unrecognized-form-feminine-neuter-plural":"onoratele"}},{"word":"onorific","pos":"adj","definitions":["honorary"],"forms":{"feminine-singular":"onorifică","masculine-plural":"onorifici","feminine-neuter-plural":"onorifice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"onorific","error-unrecognized-form-feminine-indefinite-singular":"onorifică","error-unrecognized-form-indefinite-masculine-plural":"onorifici","error-unrecognized-form-feminine-indefinite-neuter-plural":"onorifice","definite-error-unrecognized-form-masculine-neuter-singular":"onorificul","definite-error-unrecognized-form-feminine-singular":"onorifica","definite-error-unrecognized-form-masculine-plural":"onorificii","definite-error-unrecognized-form-feminine-neuter-plural":"onorificele"}},{"word":"onoruri","pos":"noun","definitions":["plural of onoare"]},{"word":"Ontario","pos":"name","definitions":["Ontario (a province in eastern Canada)","Ontario, Lake Ontario (a large lake in North America, one of the Great Lakes)"],"gender":"?"},{"word":"ontic","pos":"adj","definitions":["octic"],"forms":{"feminine-singular":"ontică","masculine-plural":"ontici","feminine-neuter-plural":"ontice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ontic","error-unrecognized-form-feminine-indefinite-singular":"ontică","error-unrecognized-form-indefinite-masculine-plural":"ontici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ontice","definite-error-unrecognized-form-masculine-neuter-singular":"onticul","definite-error-unrecognized-form-feminine-singular":"ontica","definite-error-unrecognized-form-masculine-plural":"onticii","definite-error-unrecognized-form-feminine-neuter-plural":"onticele"}},{"word":"ontogenetic","pos":"adj","definitions":["ontogenetic"],"forms":{"feminine-singular":"ontogenetică","masculine-plural":"ontogenetici","feminine-neuter-plural":"ontogenetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ontogenetic","error-unrecognized-form-feminine-indefinite-singular":"ontogenetică","error-unrecognized-form-indefinite-masculine-plural":"ontogenetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ontogenetice","definite-error-unrecognized-form-masculine-neuter-singular":"ontogeneticul","definite-error-unrecognized-form-feminine-singular":"ontogenetica","definite-error-unrecognized-form-masculine-plural":"ontogeneticii","definite-error-unrecognized-form-feminine-neuter-plural":"ontogeneticele"}},{"word":"ontogeneza","pos":"noun","definitions":["nominative/accusative definite singular of ontogeneză"],"gender":"f"},{"word":"ontogeneză","pos":"noun","definitions":["ontogeny"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ontogeneză","accusative-definite-nominative-singular":"ontogeneza","accusative-indefinite-nominative-plural":"ontogeneze","accusative-definite-nominative-plural":"ontogenezele","dative-genitive-indefinite-singular":"ontogeneze","dative-definite-genitive-singular":"ontogenezei","dative-genitive-indefinite-plural":"ontogeneze","dative-definite-genitive-plural":"ontogenezelor","singular-vocative":"ontogeneză","plural-vocative":"ontogenezelor"}},{"word":"ontogeneze","pos":"noun","definitions":["genitive/dative indefinite singular of ontogeneză"],"gender":"f"},{"word":"ontogenezo","pos":"noun","definitions":["vocative singular of ontogeneză"],"gender":"f"},{"word":"ontogenia","pos":"noun","definitions":["nominative/accusative definite singular of ontogenie"],"gender":"f"},{"word":"ontogenic","pos":"adj","definitions":["ontogenetic"],"forms":{"feminine-singular":"ontogenică","masculine-plural":"ontogenici","feminine-neuter-plural":"ontogenice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ontogenic","error-unrecognized-form-feminine-indefinite-singular":"ontogenică","error-unrecognized-form-indefinite-masculine-plural":"ontogenici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ontogenice","definite-error-unrecognized-form-masculine-neuter-singular":"ontogenicul","definite-error-unrecognized-form-feminine-singular":"ontogenica","definite-error-unrecognized-form-masculine-plural":"ontogenicii","definite-error-unrecognized-form-feminine-neuter-plural":"ontogenicele"}},{"word":"ontogenie","pos":"noun","definitions":["ontogeny"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ontogenie","accusative-definite-nominative-singular":"ontogenia","accusative-indefinite-nominative-plural":"ontogenii","accusative-definite-nominative-plural":"ontogeniile","dative-genitive-indefinite-singular":"ontogenii","dative-definite-genitive-singular":"ontogeniei","dative-genitive-indefinite-plural":"ontogenii","dative-definite-genitive-plural":"ontogeniilor","singular-vocative":"ontogenie","plural-vocative":"ontogeniilor"}},{"word":"ontogenio","pos":"noun","definitions":["vocative singular of ontogenie"],"gender":"f"},{"word":"ontogenist","pos":"noun","definitions":["ontogenist"],"forms":{"plural":"ontogeniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ontogenist","accusative-definite-nominative-singular":"ontogenistul","accusative-indefinite-nominative-plural":"ontogeniști","accusative-definite-nominative-plural":"ontogeniștii","dative-genitive-indefinite-singular":"ontogenist","dative-definite-genitive-singular":"ontogenistului","dative-genitive-indefinite-plural":"ontogeniști","dative-definite-genitive-plural":"ontogeniștilor","singular-vocative":"ontogenistule","plural-vocative":"ontogeniștilor"}},{"word":"ontogenistă","pos":"noun","definitions":["female equivalent of ontogenist"],"forms":{"plural":"ontogeniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ontogenistă","accusative-definite-nominative-singular":"ontogenista","accusative-indefinite-nominative-plural":"ontogeniste","accusative-definite-nominative-plural":"ontogenistele","dative-genitive-indefinite-singular":"ontogeniste","dative-definite-genitive-singular":"ontogenistei","dative-genitive-indefinite-plural":"ontogeniste","dative-definite-genitive-plural":"ontogenistelor","singular-vocative":"ontogenistă","plural-vocative":"ontogenistelor"}},{"word":"ontogonie","pos":"noun","definitions":["ontogony"],"forms":{"plural":"ontogonii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ontogonie","accusative-definite-nominative-singular":"ontogonia","accusative-indefinite-nominative-plural":"ontogonii","accusative-definite-nominative-plural":"ontogoniile","dative-genitive-indefinite-singular":"ontogonii","dative-definite-genitive-singular":"ontogoniei","dative-genitive-indefinite-plural":"ontogonii","dative-definite-genitive-plural":"ontogoniilor","singular-vocative":"ontogonie","plural-vocative":"ontogoniilor"}},{"word":"Onțoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Onțoiu"}},{"word":"ontolog","pos":"noun","definitions":["ontologist"],"forms":{"plural":"ontologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ontolog","accusative-definite-nominative-singular":"ontologul","accusative-indefinite-nominative-plural":"ontologi","accusative-definite-nominative-plural":"ontologii","dative-genitive-indefinite-singular":"ontolog","dative-definite-genitive-singular":"ontologului","dative-genitive-indefinite-plural":"ontologi","dative-definite-genitive-plural":"ontologilor","singular-vocative":"ontologule","plural-vocative":"ontologilor"}},{"word":"ontologă","pos":"noun","definitions":["female equivalent of ontolog"],"forms":{"plural":"ontologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ontologă","accusative-definite-nominative-singular":"ontologa","accusative-indefinite-nominative-plural":"ontologe","accusative-definite-nominative-plural":"ontologele","dative-genitive-indefinite-singular":"ontologe","dative-definite-genitive-singular":"ontologei","dative-genitive-indefinite-plural":"ontologe","dative-definite-genitive-plural":"ontologelor","singular-vocative":"ontologă","plural-vocative":"ontologelor"}},{"word":"ontologic","pos":"adj","definitions":["ontological"],"forms":{"feminine-singular":"ontologică","masculine-plural":"ontologici","feminine-neuter-plural":"ontologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ontologic","error-unrecognized-form-feminine-indefinite-singular":"ontologică","error-unrecognized-form-indefinite-masculine-plural":"ontologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ontologice","definite-error-unrecognized-form-masculine-neuter-singular":"ontologicul","definite-error-unrecognized-form-feminine-singular":"ontologica","definite-error-unrecognized-form-masculine-plural":"ontologicii","definite-error-unrecognized-form-feminine-neuter-plural":"ontologicele"}},{"word":"ontologie","pos":"noun","definitions":["ontology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"ontologie","accusative-definite-nominative":"ontologia","dative-genitive-indefinite":"ontologii","dative-definite-genitive":"ontologiei","vocative":"ontologie"}},{"word":"ontologist","pos":"noun","definitions":["ontologist"],"forms":{"plural":"ontologiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ontologist","accusative-definite-nominative-singular":"ontologistul","accusative-indefinite-nominative-plural":"ontologiști","accusative-definite-nominative-plural":"ontologiștii","dative-genitive-indefinite-singular":"ontologist","dative-definite-genitive-singular":"ontologistului","dative-genitive-indefinite-plural":"ontologiști","dative-definite-genitive-plural":"ontologiștilor","singular-vocative":"ontologistule","plural-vocative":"ontologiștilor"}},{"word":"ontologistă","pos":"noun","definitions":["female equivalent of ontologist"],"forms":{"plural":"ontologiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ontologistă","accusative-definite-nominative-singular":"ontologista","accusative-indefinite-nominative-plural":"ontologiste","accusative-definite-nominative-plural":"ontologistele","dative-genitive-indefinite-singular":"ontologiste","dative-definite-genitive-singular":"ontologistei","dative-genitive-indefinite-plural":"ontologiste","dative-definite-genitive-plural":"ontologistelor","singular-vocative":"ontologistă","plural-vocative":"ontologistelor"}},{"word":"ONU","pos":"name","definitions":["initialism of Organizația Națiunilor Unite (UN (United Nations))"]},{"word":"onuc","pos":"noun","definitions":["grandson"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"onuc","accusative-definite-nominative":"onucul","dative-genitive-indefinite":"onuc","dative-definite-genitive":"onucului","vocative":"onucule"}},{"word":"Onuca","pos":"name","definitions":["a village in Fărăgău, Mureș County, Romania"],"gender":"f"},{"word":"Onufreiciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Onufreiciuc"}},{"word":"Onufriciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Onufriciuc"}},{"word":"Onufrie","pos":"name","definitions":["a male given name"],"gender":"m","forms":{"dative-genitive":"lui Onufrie"}},{"word":"Onulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Onulescu"}},{"word":"oocit","pos":"noun","definitions":["oocyte"],"forms":{"plural":"oocite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oocit","accusative-definite-nominative-singular":"oocitul","accusative-indefinite-nominative-plural":"oocite","accusative-definite-nominative-plural":"oocitele","dative-genitive-indefinite-singular":"oocit","dative-definite-genitive-singular":"oocitului","dative-genitive-indefinite-plural":"oocite","dative-definite-genitive-plural":"oocitelor","singular-vocative":"oocitule","plural-vocative":"oocitelor"}},{"word":"oofit","pos":"noun","definitions":["oophyte"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"oofit","accusative-definite-nominative":"oofitul","dative-genitive-indefinite":"oofit","dative-definite-genitive":"oofitului","vocative":"oofitule"}},{"word":"oofor","pos":"noun","definitions":["ovary"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"oofor","accusative-definite-nominative":"ooforul","dative-genitive-indefinite":"oofor","dative-definite-genitive":"ooforului","vocative":"ooforule"}},{"word":"ooforectomie","pos":"noun","definitions":["oophorectomy"],"forms":{"plural":"ooforectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ooforectomie","accusative-definite-nominative-singular":"ooforectomia","accusative-indefinite-nominative-plural":"ooforectomii","accusative-definite-nominative-plural":"ooforectomiile","dative-genitive-indefinite-singular":"ooforectomii","dative-definite-genitive-singular":"ooforectomiei","dative-genitive-indefinite-plural":"ooforectomii","dative-definite-genitive-plural":"ooforectomiilor","singular-vocative":"ooforectomie","plural-vocative":"ooforectomiilor"}},{"word":"ooforită","pos":"noun","definitions":["oophoritis"],"forms":{"plural":"ooforite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ooforită","accusative-definite-nominative-singular":"ooforita","accusative-indefinite-nominative-plural":"ooforite","accusative-definite-nominative-plural":"ooforitele","dative-genitive-indefinite-singular":"ooforite","dative-definite-genitive-singular":"ooforitei","dative-genitive-indefinite-plural":"ooforite","dative-definite-genitive-plural":"ooforitelor","singular-vocative":"ooforită","plural-vocative":"ooforitelor"}},{"word":"oogamie","pos":"noun","definitions":["oogamy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"oogamie","accusative-definite-nominative":"oogamia","dative-genitive-indefinite":"oogamii","dative-definite-genitive":"oogamiei","vocative":"oogamie"}},{"word":"oogeneză","pos":"noun","definitions":["oogenesis"],"forms":{"plural":"oogeneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oogeneză","accusative-definite-nominative-singular":"oogeneza","accusative-indefinite-nominative-plural":"oogeneze","accusative-definite-nominative-plural":"oogenezele","dative-genitive-indefinite-singular":"oogeneze","dative-definite-genitive-singular":"oogenezei","dative-genitive-indefinite-plural":"oogeneze","dative-definite-genitive-plural":"oogenezelor","singular-vocative":"oogeneză","plural-vocative":"oogenezelor"}},{"word":"oogon","pos":"noun","definitions":["oogonium"],"forms":{"plural":"oogoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oogon","accusative-definite-nominative-singular":"oogonul","accusative-indefinite-nominative-plural":"oogoane","accusative-definite-nominative-plural":"oogoanele","dative-genitive-indefinite-singular":"oogon","dative-definite-genitive-singular":"oogonului","dative-genitive-indefinite-plural":"oogoane","dative-definite-genitive-plural":"oogoanelor","singular-vocative":"oogonule","plural-vocative":"oogoanelor"}},{"word":"oolit","pos":"noun","definitions":["oolite"],"forms":{"plural":"oolite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oolit","accusative-definite-nominative-singular":"oolitul","accusative-indefinite-nominative-plural":"oolite","accusative-definite-nominative-plural":"oolitele","dative-genitive-indefinite-singular":"oolit","dative-definite-genitive-singular":"oolitului","dative-genitive-indefinite-plural":"oolite","dative-definite-genitive-plural":"oolitelor","singular-vocative":"oolitule","plural-vocative":"oolitelor"}},{"word":"oolitic","pos":"adj","definitions":["oolitic"],"forms":{"feminine-singular":"oolitică","masculine-plural":"oolitici","feminine-neuter-plural":"oolitice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oolitic","error-unrecognized-form-feminine-indefinite-singular":"oolitică","error-unrecognized-form-indefinite-masculine-plural":"oolitici","error-unrecognized-form-feminine-indefinite-neuter-plural":"oolitice","definite-error-unrecognized-form-masculine-neuter-singular":"ooliticul","definite-error-unrecognized-form-feminine-singular":"oolitica","definite-error-unrecognized-form-masculine-plural":"ooliticii","definite-error-unrecognized-form-feminine-neuter-plural":"ooliticele"}},{"word":"oologic","pos":"adj","definitions":["oological"],"forms":{"feminine-singular":"oologică","masculine-plural":"oologici","feminine-neuter-plural":"oologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oologic","error-unrecognized-form-feminine-indefinite-singular":"oologică","error-unrecognized-form-indefinite-masculine-plural":"oologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"oologice","definite-error-unrecognized-form-masculine-neuter-singular":"oologicul","definite-error-unrecognized-form-feminine-singular":"oologica","definite-error-unrecognized-form-masculine-plural":"oologicii","definite-error-unrecognized-form-feminine-neuter-plural":"oologicele"}},{"word":"oologie","pos":"noun","definitions":["oology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"oologie","accusative-definite-nominative":"oologia","dative-genitive-indefinite":"oologii","dative-definite-genitive":"oologiei","vocative":"oologie"}},{"word":"ooplasmă","pos":"noun","definitions":["ooplasm"],"forms":{"plural":"ooplasme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ooplasmă","accusative-definite-nominative-singular":"ooplasma","accusative-indefinite-nominative-plural":"ooplasme","accusative-definite-nominative-plural":"ooplasmele","dative-genitive-indefinite-singular":"ooplasme","dative-definite-genitive-singular":"ooplasmei","dative-genitive-indefinite-plural":"ooplasme","dative-definite-genitive-plural":"ooplasmelor","singular-vocative":"ooplasmă","plural-vocative":"ooplasmelor"}},{"word":"oosferă","pos":"noun","definitions":["oosphere"],"forms":{"plural":"oosfere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oosferă","accusative-definite-nominative-singular":"oosfera","accusative-indefinite-nominative-plural":"oosfere","accusative-definite-nominative-plural":"oosferele","dative-genitive-indefinite-singular":"oosfere","dative-definite-genitive-singular":"oosferei","dative-genitive-indefinite-plural":"oosfere","dative-definite-genitive-plural":"oosferelor","singular-vocative":"oosferă","plural-vocative":"oosferelor"}},{"word":"oospor","pos":"noun","definitions":["oospore"],"forms":{"plural":"oospori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oospor","accusative-definite-nominative-singular":"oosporul","accusative-indefinite-nominative-plural":"oospori","accusative-definite-nominative-plural":"oosporii","dative-genitive-indefinite-singular":"oospor","dative-definite-genitive-singular":"oosporului","dative-genitive-indefinite-plural":"oospori","dative-definite-genitive-plural":"oosporilor","singular-vocative":"oosporule","plural-vocative":"oosporilor"}},{"word":"ootecă","pos":"noun","definitions":["ootheca"],"forms":{"plural":"ooteci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ootecă","accusative-definite-nominative-singular":"ooteca","accusative-indefinite-nominative-plural":"ooteci","accusative-definite-nominative-plural":"ootecile","dative-genitive-indefinite-singular":"ooteci","dative-definite-genitive-singular":"ootecii","dative-genitive-indefinite-plural":"ooteci","dative-definite-genitive-plural":"ootecilor","singular-vocative":"ootecă","plural-vocative":"ootecilor"}},{"word":"op","pos":"noun","definitions":["need, necessity"],"forms":{"plural":"opuri"}},{"word":"op","pos":"noun","definitions":["work (usually artistic or literary), writing"],"forms":{"plural":"opuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"op","accusative-definite-nominative-singular":"opul","accusative-indefinite-nominative-plural":"opuri","accusative-definite-nominative-plural":"opurile","dative-genitive-indefinite-singular":"op","dative-definite-genitive-singular":"opului","dative-genitive-indefinite-plural":"opuri","dative-definite-genitive-plural":"opurilor","singular-vocative":"opule","plural-vocative":"opurilor"}},{"word":"opac","pos":"adj","definitions":["opaque"],"forms":{"feminine-singular":"opacă","masculine-plural":"opaci","feminine-neuter-plural":"opace","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"opac","error-unrecognized-form-feminine-indefinite-singular":"opacă","error-unrecognized-form-indefinite-masculine-plural":"opaci","error-unrecognized-form-feminine-indefinite-neuter-plural":"opace","definite-error-unrecognized-form-masculine-neuter-singular":"opacul","definite-error-unrecognized-form-feminine-singular":"opaca","definite-error-unrecognized-form-masculine-plural":"opacii","definite-error-unrecognized-form-feminine-neuter-plural":"opacele"}},{"word":"opăcea","pos":"noun","definitions":["diminutive of opacă"],"forms":{"plural":"opăcele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"opăcea","accusative-definite-nominative-singular":"opăceaua","accusative-indefinite-nominative-plural":"opăcele","accusative-definite-nominative-plural":"opăcelele","dative-genitive-indefinite-singular":"opăcele","dative-definite-genitive-singular":"opăcelei","dative-genitive-indefinite-plural":"opăcele","dative-definite-genitive-plural":"opăcelelor","singular-vocative":"opăcea","plural-vocative":"opăcelelor"}},{"word":"opăceală","pos":"noun","definitions":["confusion"],"forms":{"plural":"opăceli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"opăceală","accusative-definite-nominative-singular":"opăceala","accusative-indefinite-nominative-plural":"opăcele","accusative-definite-nominative-plural":"opăcelele","dative-genitive-indefinite-singular":"opăcele","dative-definite-genitive-singular":"opăcelei","dative-genitive-indefinite-plural":"opăcele","dative-definite-genitive-plural":"opăcelelor","singular-vocative":"opăceală","plural-vocative":"opăcelelor"}},{"word":"opăci","pos":"verb","definitions":["to stop","to confuse"],"forms":{"canonical":"a opăci 4th conjugation","present-singular-third-person":"opăcește","participle-past":"opăcit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a opăci","gerund":"opăcind","first-person-indicative-present-singular":"opăcesc","indicative-present-second-person-singular":"opăcești","indicative-present-singular-third-person":"opăcește","first-person-indicative-plural-present":"opăcim","indicative-plural-present-second-person":"opăciți","indicative-plural-present-third-person":"opăcesc","first-person-imperfect-indicative-singular":"opăceam","imperfect-indicative-second-person-singular":"opăceai","imperfect-indicative-singular-third-person":"opăcea","first-person-imperfect-indicative-plural":"opăceam","imperfect-indicative-plural-second-person":"opăceați","imperfect-indicative-plural-third-person":"opăceau","first-person-indicative-perfect-singular":"opăcii","indicative-perfect-second-person-singular":"opăciși","indicative-perfect-singular-third-person":"opăci","first-person-indicative-perfect-plural":"opăcirăm","indicative-perfect-plural-second-person":"opăcirăți","indicative-perfect-plural-third-person":"opăciră","first-person-indicative-pluperfect-singular":"opăcisem","indicative-pluperfect-second-person-singular":"opăciseși","indicative-pluperfect-singular-third-person":"opăcise","first-person-indicative-pluperfect-plural":"opăciserăm","indicative-pluperfect-plural-second-person":"opăciserăți","indicative-pluperfect-plural-third-person":"opăciseră","first-person-present-singular-subjunctive":"să opăcesc","present-second-person-singular-subjunctive":"să opăcești","present-singular-subjunctive-third-person":"să opăcească","first-person-plural-present-subjunctive":"să opăcim","plural-present-second-person-subjunctive":"să opăciți","plural-present-subjunctive-third-person":"să opăcească","imperative-second-person-singular":"opăcește","imperative-plural-second-person":"opăciți","imperative-negative-second-person-singular":"nu opăci","imperative-negative-plural-second-person":"nu opăciți"}},{"word":"opacifia","pos":"verb","definitions":["to opacify"],"forms":{"canonical":"a opacifia 1st conjugation","present-singular-third-person":"opacifiează","participle-past":"opacifiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a opacifia","gerund":"opacifiind","first-person-indicative-present-singular":"opacifiez","indicative-present-second-person-singular":"opacifiezi","indicative-present-singular-third-person":"opacifiază","first-person-indicative-plural-present":"opacifiem","indicative-plural-present-second-person":"opacifiați","indicative-plural-present-third-person":"opacifiază","first-person-imperfect-indicative-singular":"opacifiam","imperfect-indicative-second-person-singular":"opacifiai","imperfect-indicative-singular-third-person":"opacifia","first-person-imperfect-indicative-plural":"opacifiam","imperfect-indicative-plural-second-person":"opacifiați","imperfect-indicative-plural-third-person":"opacifiau","first-person-indicative-perfect-singular":"opacifiai","indicative-perfect-second-person-singular":"opacifiași","indicative-perfect-singular-third-person":"opacifie","first-person-indicative-perfect-plural":"opacifiarăm","indicative-perfect-plural-second-person":"opacifiarăți","indicative-perfect-plural-third-person":"opacifiară","first-person-indicative-pluperfect-singular":"opacifiasem","indicative-pluperfect-second-person-singular":"opacifiaseși","indicative-pluperfect-singular-third-person":"opacifiase","first-person-indicative-pluperfect-plural":"opacifiaserăm","indicative-pluperfect-plural-second-person":"opacifiaserăți","indicative-pluperfect-plural-third-person":"opacifiaseră","first-person-present-singular-subjunctive":"să opacifiez","present-second-person-singular-subjunctive":"să opacifiezi","present-singular-subjunctive-third-person":"să opacifieze","first-person-plural-present-subjunctive":"să opacifiem","plural-present-second-person-subjunctive":"să opacifiați","plural-present-subjunctive-third-person":"să opacifieze","imperative-second-person-singular":"opacifiază","imperative-plural-second-person":"opacifiați","imperative-negative-second-person-singular":"nu opacifia","imperative-negative-plural-second-person":"nu opacifiați"}},{"word":"opacifiat","pos":"adj","definitions":["opacified"],"forms":{"feminine-singular":"opacifiată","masculine-plural":"opacifiați","feminine-neuter-plural":"opacifiate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"opacifiat","error-unrecognized-form-feminine-indefinite-singular":"opacifiată","error-unrecognized-form-indefinite-masculine-plural":"opacifiați","error-unrecognized-form-feminine-indefinite-neuter-plural":"opacifiate","definite-error-unrecognized-form-masculine-neuter-singular":"opacifiatul","definite-error-unrecognized-form-feminine-singular":"opacifiata","definite-error-unrecognized-form-masculine-plural":"opacifiații","definite-error-unrecognized-form-feminine-neuter-plural":"opacifiatele"}},{"word":"opacifiere","pos":"noun","definitions":["opacification"],"forms":{"plural":"opacifieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"opacifiere","accusative-definite-nominative-singular":"opacifierea","accusative-indefinite-nominative-plural":"opacifieri","accusative-definite-nominative-plural":"opacifierile","dative-genitive-indefinite-singular":"opacifieri","dative-definite-genitive-singular":"opacifierii","dative-genitive-indefinite-plural":"opacifieri","dative-definite-genitive-plural":"opacifierilor","singular-vocative":"opacifiere","plural-vocative":"opacifierilor"}},{"word":"opacimetrie","pos":"noun","definitions":["opacimetry"],"forms":{"plural":"opacimetrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"opacimetrie","accusative-definite-nominative-singular":"opacimetria","accusative-indefinite-nominative-plural":"opacimetrii","accusative-definite-nominative-plural":"opacimetriile","dative-genitive-indefinite-singular":"opacimetrii","dative-definite-genitive-singular":"opacimetriei","dative-genitive-indefinite-plural":"opacimetrii","dative-definite-genitive-plural":"opacimetriilor","singular-vocative":"opacimetrie","plural-vocative":"opacimetriilor"}},{"word":"opacimetru","pos":"noun","definitions":["opacimeter"],"forms":{"plural":"opacimetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"opacimetru","accusative-definite-nominative-singular":"opacimetrul","accusative-indefinite-nominative-plural":"opacimetre","accusative-definite-nominative-plural":"opacimetrele","dative-genitive-indefinite-singular":"opacimetru","dative-definite-genitive-singular":"opacimetrului","dative-genitive-indefinite-plural":"opacimetre","dative-definite-genitive-plural":"opacimetrelor","singular-vocative":"opacimetrule","plural-vocative":"opacimetrelor"}},{"word":"opăcinariu","pos":"noun","definitions":["rower"],"forms":{"plural":"opăcinari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"opăcinariu","accusative-definite-nominative-singular":"opăcinariuul","accusative-indefinite-nominative-plural":"opăcinari","accusative-definite-nominative-plural":"opăcinarii","dative-genitive-indefinite-singular":"opăcinariu","dative-definite-genitive-singular":"opăcinariuului","dative-genitive-indefinite-plural":"opăcinari","dative-definite-genitive-plural":"opăcinarilor","singular-vocative":"opăcinariuule","plural-vocative":"opăcinarilor"}},{"word":"opăcinaș","pos":"noun","definitions":["rower"],"forms":{"plural":"opăcinași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"opăcinaș","accusative-definite-nominative-singular":"opăcinașul","accusative-indefinite-nominative-plural":"opăcinași","accusative-definite-nominative-plural":"opăcinașii","dative-genitive-indefinite-singular":"opăcinaș","dative-definite-genitive-singular":"opăcinașului","dative-genitive-indefinite-plural":"opăcinași","dative-definite-genitive-plural":"opăcinașilor","singular-vocative":"opăcinașule","plural-vocative":"opăcinașilor"}},{"word":"opăcire","pos":"noun","definitions":["stop"],"forms":{"plural":"opăciri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"opăcire","accusative-definite-nominative-singular":"opăcirea","accusative-indefinite-nominative-plural":"opăciri","accusative-definite-nominative-plural":"opăcirile","dative-genitive-indefinite-singular":"opăciri","dative-definite-genitive-singular":"opăcirii","dative-genitive-indefinite-plural":"opăciri","dative-definite-genitive-plural":"opăcirilor","singular-vocative":"opăcire","plural-vocative":"opăcirilor"}},{"word":"opăcit","pos":"adj","definitions":["confused"],"forms":{"feminine-singular":"opăcită","masculine-plural":"opăciți","feminine-neuter-plural":"opăcite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"opăcit","error-unrecognized-form-feminine-indefinite-singular":"opăcită","error-unrecognized-form-indefinite-masculine-plural":"opăciți","error-unrecognized-form-feminine-indefinite-neuter-plural":"opăcite","definite-error-unrecognized-form-masculine-neuter-singular":"opăcitul","definite-error-unrecognized-form-feminine-singular":"opăcita","definite-error-unrecognized-form-masculine-plural":"opăciții","definite-error-unrecognized-form-feminine-neuter-plural":"opăcitele"}},{"word":"opăcit","pos":"verb","definitions":["past participle of opăci"],"forms":{"participle-past":"of opăci"}},{"word":"opacitate","pos":"noun","definitions":["opacity"],"forms":{"plural":"opacități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"opacitate","accusative-definite-nominative-singular":"opacitatea","accusative-indefinite-nominative-plural":"opacități","accusative-definite-nominative-plural":"opacitățile","dative-genitive-indefinite-singular":"opacități","dative-definite-genitive-singular":"opacității","dative-genitive-indefinite-plural":"opacități","dative-definite-genitive-plural":"opacităților","singular-vocative":"opacitate","plural-vocative":"opacităților"}},{"word":"opaciza","pos":"verb","definitions":["to make opaque"],"forms":{"canonical":"a opaciza 1st conjugation","present-singular-third-person":"opacizează","participle-past":"opacizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a opaciza","gerund":"opacizând","first-person-indicative-present-singular":"opacizez","indicative-present-second-person-singular":"opacizezi","indicative-present-singular-third-person":"opacizează","first-person-indicative-plural-present":"opacizăm","indicative-plural-present-second-person":"opacizați","indicative-plural-present-third-person":"opacizează","first-person-imperfect-indicative-singular":"opacizam","imperfect-indicative-second-person-singular":"opacizai","imperfect-indicative-singular-third-person":"opaciza","first-person-imperfect-indicative-plural":"opacizam","imperfect-indicative-plural-second-person":"opacizați","imperfect-indicative-plural-third-person":"opacizau","first-person-indicative-perfect-singular":"opacizai","indicative-perfect-second-person-singular":"opacizași","indicative-perfect-singular-third-person":"opaciză","first-person-indicative-perfect-plural":"opacizarăm","indicative-perfect-plural-second-person":"opacizarăți","indicative-perfect-plural-third-person":"opacizară","first-person-indicative-pluperfect-singular":"opacizasem","indicative-pluperfect-second-person-singular":"opacizaseși","indicative-pluperfect-singular-third-person":"opacizase","first-person-indicative-pluperfect-plural":"opacizaserăm","indicative-pluperfect-plural-second-person":"opacizaserăți","indicative-pluperfect-plural-third-person":"opacizaseră","first-person-present-singular-subjunctive":"să opacizez","present-second-person-singular-subjunctive":"să opacizezi","present-singular-subjunctive-third-person":"să opacizeze","first-person-plural-present-subjunctive":"să opacizăm","plural-present-second-person-subjunctive":"să opacizați","plural-present-subjunctive-third-person":"să opacizeze","imperative-second-person-singular":"opacizează","imperative-plural-second-person":"opacizați","imperative-negative-second-person-singular":"nu opaciza","imperative-negative-plural-second-person":"nu opacizați"}},{"word":"opacizant","pos":"adj","definitions":["opacifying"],"forms":{"feminine-singular":"opacizantă","masculine-plural":"opacizanți","feminine-neuter-plural":"opacizante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"opacizant","error-unrecognized-form-feminine-indefinite-singular":"opacizantă","error-unrecognized-form-indefinite-masculine-plural":"opacizanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"opacizante","definite-error-unrecognized-form-masculine-neuter-singular":"opacizantul","definite-error-unrecognized-form-feminine-singular":"opacizanta","definite-error-unrecognized-form-masculine-plural":"opacizanții","definite-error-unrecognized-form-feminine-neuter-plural":"opacizantele"}},{"word":"opacizare","pos":"noun","definitions":["opacification"],"forms":{"plural":"opacizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"opacizare","accusative-definite-nominative-singular":"opacizarea","accusative-indefinite-nominative-plural":"opacizări","accusative-definite-nominative-plural":"opacizările","dative-genitive-indefinite-singular":"opacizări","dative-definite-genitive-singular":"opacizării","dative-genitive-indefinite-plural":"opacizări","dative-definite-genitive-plural":"opacizărilor","singular-vocative":"opacizare","plural-vocative":"opacizărilor"}},{"word":"opăicior","pos":"noun","definitions":["diminutive of opaiț"],"forms":{"plural":"opăicioare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"opăicior","accusative-definite-nominative-singular":"opăiciorul","accusative-indefinite-nominative-plural":"opăicioare","accusative-definite-nominative-plural":"opăicioarele","dative-genitive-indefinite-singular":"opăicior","dative-definite-genitive-singular":"opăiciorului","dative-genitive-indefinite-plural":"opăicioare","dative-definite-genitive-plural":"opăicioarelor","singular-vocative":"opăiciorule","plural-vocative":"opăicioarelor"}},{"word":"opaieț","pos":"noun","definitions":["alternative form of opaiț"],"forms":{"plural":"opaiețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"opaieț","accusative-definite-nominative-singular":"opaiețul","accusative-indefinite-nominative-plural":"opaiețe","accusative-definite-nominative-plural":"opaiețele","dative-genitive-indefinite-singular":"opaieț","dative-definite-genitive-singular":"opaiețului","dative-genitive-indefinite-plural":"opaiețe","dative-definite-genitive-plural":"opaiețelor","singular-vocative":"opaiețule","plural-vocative":"opaiețelor"}},{"word":"Opaiț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Opaiț"}},{"word":"opaiț","pos":"noun","definitions":["oil lamp"],"forms":{"plural":"opaițe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"opaiț","accusative-definite-nominative-singular":"opaițul","accusative-indefinite-nominative-plural":"opaițe","accusative-definite-nominative-plural":"opaițele","dative-genitive-indefinite-singular":"opaiț","dative-definite-genitive-singular":"opaițului","dative-genitive-indefinite-plural":"opaițe","dative-definite-genitive-plural":"opaițelor","singular-vocative":"opaițule","plural-vocative":"opaițelor"}},{"word":"opaiță","pos":"noun","definitions":["alternative form of opaiț"],"forms":{"plural":"opaițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"opaiță","accusative-definite-nominative-singular":"opaița","accusative-indefinite-nominative-plural":"opaițe","accusative-definite-nominative-plural":"opaițele","dative-genitive-indefinite-singular":"opaițe","dative-definite-genitive-singular":"opaiței","dative-genitive-indefinite-plural":"opaițe","dative-definite-genitive-plural":"opaițelor","singular-vocative":"opaiță","plural-vocative":"opaițelor"}},{"word":"opăițel","pos":"noun","definitions":["diminutive of opaiț"],"forms":{"plural":"opăiței","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"opăițel","accusative-definite-nominative-singular":"opăițelul","accusative-indefinite-nominative-plural":"opăiței","accusative-definite-nominative-plural":"opăițeii","dative-genitive-indefinite-singular":"opăițel","dative-definite-genitive-singular":"opăițelului","dative-genitive-indefinite-plural":"opăiței","dative-definite-genitive-plural":"opăițeilor","singular-vocative":"opăițelule","plural-vocative":"opăițeilor"}},{"word":"opal","pos":"noun","definitions":["opal"],"forms":{"plural":"opale","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"opal","accusative-definite-nominative-singular":"opalul","accusative-indefinite-nominative-plural":"opale","accusative-definite-nominative-plural":"opalele","dative-genitive-indefinite-singular":"opal","dative-definite-genitive-singular":"opalului","dative-genitive-indefinite-plural":"opale","dative-definite-genitive-plural":"opalelor","singular-vocative":"opalule","plural-vocative":"opalelor"}},{"word":"opalescent","pos":"adj","definitions":["opalescent"],"forms":{"feminine-singular":"opalescentă","masculine-plural":"opalescenți","feminine-neuter-plural":"opalescente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"opalescent","error-unrecognized-form-feminine-indefinite-singular":"opalescentă","error-unrecognized-form-indefinite-masculine-plural":"opalescenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"opalescente","definite-error-unrecognized-form-masculine-neuter-singular":"opalescentul","definite-error-unrecognized-form-feminine-singular":"opalescenta","definite-error-unrecognized-form-masculine-plural":"opalescenții","definite-error-unrecognized-form-feminine-neuter-plural":"opalescentele"}},{"word":"opalescență","pos":"noun","definitions":["opalescence"],"forms":{"plural":"opalescențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"opalescență","accusative-definite-nominative-singular":"opalescența","accusative-indefinite-nominative-plural":"opalescențe","accusative-definite-nominative-plural":"opalescențele","dative-genitive-indefinite-singular":"opalescențe","dative-definite-genitive-singular":"opalescenței","dative-genitive-indefinite-plural":"opalescențe","dative-definite-genitive-plural":"opalescențelor","singular-vocative":"opalescență","plural-vocative":"opalescențelor"}},{"word":"opalin","pos":"adj","definitions":["opal (colored)"],"forms":{"feminine-singular":"opalină","masculine-plural":"opalini","feminine-neuter-plural":"opaline","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"opalin","error-unrecognized-form-feminine-indefinite-singular":"opalină","error-unrecognized-form-indefinite-masculine-plural":"opalini","error-unrecognized-form-feminine-indefinite-neuter-plural":"opaline","definite-error-unrecognized-form-masculine-neuter-singular":"opalinul","definite-error-unrecognized-form-feminine-singular":"opalina","definite-error-unrecognized-form-masculine-plural":"opalinii","definite-error-unrecognized-form-feminine-neuter-plural":"opalinele"}},{"word":"opaliza","pos":"verb","definitions":["to opalize"],"forms":{"canonical":"a opaliza 1st conjugation","present-singular-third-person":"opalizează","participle-past":"opalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a opaliza","gerund":"opalizând","first-person-indicative-present-singular":"opalizez","indicative-present-second-person-singular":"opalizezi","indicative-present-singular-third-person":"opalizează","first-person-indicative-plural-present":"opalizăm","indicative-plural-present-second-person":"opalizați","indicative-plural-present-third-person":"opalizează","first-person-imperfect-indicative-singular":"opalizam","imperfect-indicative-second-person-singular":"opalizai","imperfect-indicative-singular-third-person":"opaliza","first-person-imperfect-indicative-plural":"opalizam","imperfect-indicative-plural-second-person":"opalizați","imperfect-indicative-plural-third-person":"opalizau","first-person-indicative-perfect-singular":"opalizai","indicative-perfect-second-person-singular":"opalizași","indicative-perfect-singular-third-person":"opaliză","first-person-indicative-perfect-plural":"opalizarăm","indicative-perfect-plural-second-person":"opalizarăți","indicative-perfect-plural-third-person":"opalizară","first-person-indicative-pluperfect-singular":"opalizasem","indicative-pluperfect-second-person-singular":"opalizaseși","indicative-pluperfect-singular-third-person":"opalizase","first-person-indicative-pluperfect-plural":"opalizaserăm","indicative-pluperfect-plural-second-person":"opalizaserăți","indicative-pluperfect-plural-third-person":"opalizaseră","first-person-present-singular-subjunctive":"să opalizez","present-second-person-singular-subjunctive":"să opalizezi","present-singular-subjunctive-third-person":"să opalizeze","first-person-plural-present-subjunctive":"să opalizăm","plural-present-second-person-subjunctive":"să opalizați","plural-present-subjunctive-third-person":"să opalizeze","imperative-second-person-singular":"opalizează","imperative-plural-second-person":"opalizați","imperative-negative-second-person-singular":"nu opaliza","imperative-negative-plural-second-person":"nu opalizați"}},{"word":"opalizare","pos":"noun","definitions":["opalization"],"forms":{"plural":"opalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"opalizare","accusative-definite-nominative-singular":"opalizarea","accusative-indefinite-nominative-plural":"opalizări","accusative-definite-nominative-plural":"opalizările","dative-genitive-indefinite-singular":"opalizări","dative-definite-genitive-singular":"opalizării","dative-genitive-indefinite-plural":"opalizări","dative-definite-genitive-plural":"opalizărilor","singular-vocative":"opalizare","plural-vocative":"opalizărilor"}},{"word":"opalizat","pos":"adj","definitions":["opalized"],"forms":{"feminine-singular":"opalizată","masculine-plural":"opalizați","feminine-neuter-plural":"opalizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"opalizat","error-unrecognized-form-feminine-indefinite-singular":"opalizată","error-unrecognized-form-indefinite-masculine-plural":"opalizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"opalizate","definite-error-unrecognized-form-masculine-neuter-singular":"opalizatul","definite-error-unrecognized-form-feminine-singular":"opalizata","definite-error-unrecognized-form-masculine-plural":"opalizații","definite-error-unrecognized-form-feminine-neuter-plural":"opalizatele"}},{"word":"opăreală","pos":"noun","definitions":["scald"],"forms":{"plural":"opăreli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"opăreală","accusative-definite-nominative-singular":"opăreala","accusative-indefinite-nominative-plural":"opăreli","accusative-definite-nominative-plural":"opărelile","dative-genitive-indefinite-singular":"opăreli","dative-definite-genitive-singular":"opărelii","dative-genitive-indefinite-plural":"opăreli","dative-definite-genitive-plural":"opărelilor","singular-vocative":"opăreală","plural-vocative":"opărelilor"}},{"word":"opări","pos":"verb","definitions":["to soak in boiling water, blanch","to scald","to develop diaper rash"],"forms":{"canonical":"a opări 4th conjugation","present-singular-third-person":"opărește","participle-past":"opărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a opări","gerund":"opărind","first-person-indicative-present-singular":"opăresc","indicative-present-second-person-singular":"opărești","indicative-present-singular-third-person":"opărește","first-person-indicative-plural-present":"opărim","indicative-plural-present-second-person":"opăriți","indicative-plural-present-third-person":"opăresc","first-person-imperfect-indicative-singular":"opăream","imperfect-indicative-second-person-singular":"opăreai","imperfect-indicative-singular-third-person":"opărea","first-person-imperfect-indicative-plural":"opăream","imperfect-indicative-plural-second-person":"opăreați","imperfect-indicative-plural-third-person":"opăreau","first-person-indicative-perfect-singular":"opării","indicative-perfect-second-person-singular":"opăriși","indicative-perfect-singular-third-person":"opări","first-person-indicative-perfect-plural":"opărirăm","indicative-perfect-plural-second-person":"opărirăți","indicative-perfect-plural-third-person":"opăriră","first-person-indicative-pluperfect-singular":"opărisem","indicative-pluperfect-second-person-singular":"opăriseși","indicative-pluperfect-singular-third-person":"opărise","first-person-indicative-pluperfect-plural":"opăriserăm","indicative-pluperfect-plural-second-person":"opăriserăți","indicative-pluperfect-plural-third-person":"opăriseră","first-person-present-singular-subjunctive":"să opăresc","present-second-person-singular-subjunctive":"să opărești","present-singular-subjunctive-third-person":"să opărească","first-person-plural-present-subjunctive":"să opărim","plural-present-second-person-subjunctive":"să opăriți","plural-present-subjunctive-third-person":"să opărească","imperative-second-person-singular":"opărește","imperative-plural-second-person":"opăriți","imperative-negative-second-person-singular":"nu opări","imperative-negative-plural-second-person":"nu opăriți"}},{"word":"opărire","pos":"noun","definitions":["scalding"],"forms":{"plural":"opăriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"opărire","accusative-definite-nominative-singular":"opărirea","accusative-indefinite-nominative-plural":"opăriri","accusative-definite-nominative-plural":"opăririle","dative-genitive-indefinite-singular":"opăriri","dative-definite-genitive-singular":"opăririi","dative-genitive-indefinite-plural":"opăriri","dative-definite-genitive-plural":"opăririlor","singular-vocative":"opărire","plural-vocative":"opăririlor"}},{"word":"Opărit","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Opărit"}},{"word":"opărit","pos":"adj","definitions":["burnt, scalded","suffering from eczema, usually in the joints (especially of children)","sad, blue, down in the dumps"],"pronunciation":"/o.pəˈrit/","forms":{"feminine-singular":"opărită","masculine-plural":"opăriți","feminine-neuter-plural":"opărite","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"opărit","error-unrecognized-form-feminine-indefinite-singular":"opărită","error-unrecognized-form-indefinite-masculine-plural":"opăriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"opărite","definite-error-unrecognized-form-masculine-neuter-singular":"opăritul","definite-error-unrecognized-form-feminine-singular":"opărita","definite-error-unrecognized-form-masculine-plural":"opăriții","definite-error-unrecognized-form-feminine-neuter-plural":"opăritele"}},{"word":"opărit","pos":"verb","definitions":["past participle of opări"],"pronunciation":"/o.pəˈrit/"},{"word":"opăritor","pos":"adj","definitions":["scalding"],"forms":{"feminine-singular":"opăritoare","masculine-plural":"opăritori","feminine-neuter-plural":"opăritoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"opăritor","error-unrecognized-form-feminine-indefinite-singular":"opăritoare","error-unrecognized-form-indefinite-masculine-plural":"opăritori","error-unrecognized-form-feminine-indefinite-neuter-plural":"opăritoare","definite-error-unrecognized-form-masculine-neuter-singular":"opăritorul","definite-error-unrecognized-form-feminine-singular":"opăritoarea","definite-error-unrecognized-form-masculine-plural":"opăritorii","definite-error-unrecognized-form-feminine-neuter-plural":"opăritoarele"}},{"word":"opăritură","pos":"noun","definitions":["scalding"],"forms":{"plural":"opărituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"opăritură","accusative-definite-nominative-singular":"opăritura","accusative-indefinite-nominative-plural":"opăriture","accusative-definite-nominative-plural":"opăriturele","dative-genitive-indefinite-singular":"opăriture","dative-definite-genitive-singular":"opăriturei","dative-genitive-indefinite-plural":"opăriture","dative-definite-genitive-plural":"opăriturelor","singular-vocative":"opăritură","plural-vocative":"opăriturelor"}},{"word":"Opătești","pos":"name","definitions":["a village in Golești, Vâlcea County, Romania"],"gender":"m"},{"word":"Opatița","pos":"name","definitions":["a village in Deta, Timiș County, Romania"],"gender":"f"},{"word":"opaxită","pos":"noun","definitions":["alternative form of opaxit"],"forms":{"plural":"opaxite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"opaxită","accusative-definite-nominative-singular":"opaxita","accusative-indefinite-nominative-plural":"opaxite","accusative-definite-nominative-plural":"opaxitele","dative-genitive-indefinite-singular":"opaxite","dative-definite-genitive-singular":"opaxitei","dative-genitive-indefinite-plural":"opaxite","dative-definite-genitive-plural":"opaxitelor","singular-vocative":"opaxită","plural-vocative":"opaxitelor"}},{"word":"open","pos":"noun","definitions":["open (sports event)"],"forms":{"plural":"openuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"open","accusative-definite-nominative-singular":"openul","accusative-indefinite-nominative-plural":"openuri","accusative-definite-nominative-plural":"openurile","dative-genitive-indefinite-singular":"open","dative-definite-genitive-singular":"openului","dative-genitive-indefinite-plural":"openuri","dative-definite-genitive-plural":"openurilor","singular-vocative":"openule","plural-vocative":"openurilor"}},{"word":"opera","pos":"verb","definitions":["to operate"],"forms":{"canonical":"a opera 1st conjugation","present-singular-third-person":"operează","participle-past":"operat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a opera","gerund":"operând","first-person-indicative-present-singular":"operez","indicative-present-second-person-singular":"operezi","indicative-present-singular-third-person":"operează","first-person-indicative-plural-present":"operăm","indicative-plural-present-second-person":"operați","indicative-plural-present-third-person":"operează","first-person-imperfect-indicative-singular":"operam","imperfect-indicative-second-person-singular":"operai","imperfect-indicative-singular-third-person":"opera","first-person-imperfect-indicative-plural":"operam","imperfect-indicative-plural-second-person":"operați","imperfect-indicative-plural-third-person":"operau","first-person-indicative-perfect-singular":"operai","indicative-perfect-second-person-singular":"operași","indicative-perfect-singular-third-person":"operă","first-person-indicative-perfect-plural":"operarăm","indicative-perfect-plural-second-person":"operarăți","indicative-perfect-plural-third-person":"operară","first-person-indicative-pluperfect-singular":"operasem","indicative-pluperfect-second-person-singular":"operaseși","indicative-pluperfect-singular-third-person":"operase","first-person-indicative-pluperfect-plural":"operaserăm","indicative-pluperfect-plural-second-person":"operaserăți","indicative-pluperfect-plural-third-person":"operaseră","first-person-present-singular-subjunctive":"să operez","present-second-person-singular-subjunctive":"să operezi","present-singular-subjunctive-third-person":"să opereze","first-person-plural-present-subjunctive":"să operăm","plural-present-second-person-subjunctive":"să operați","plural-present-subjunctive-third-person":"să opereze","imperative-second-person-singular":"operează","imperative-plural-second-person":"operați","imperative-negative-second-person-singular":"nu opera","imperative-negative-plural-second-person":"nu operați"}},{"word":"operă","pos":"noun","definitions":["a work","opera"],"forms":{"plural":"opere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"operă","accusative-definite-nominative-singular":"opera","accusative-indefinite-nominative-plural":"opere","accusative-definite-nominative-plural":"operele","dative-genitive-indefinite-singular":"opere","dative-definite-genitive-singular":"operei","dative-genitive-indefinite-plural":"opere","dative-definite-genitive-plural":"operelor","singular-vocative":"operă","plural-vocative":"operelor"}},{"word":"operă de artă","pos":"noun","definitions":["work of art"],"forms":{"plural":"opere de artă"}},{"word":"operă spațială","pos":"noun","definitions":["space opera"]},{"word":"operabil","pos":"adj","definitions":["operable"],"forms":{"feminine-singular":"operabilă","masculine-plural":"operabili","feminine-neuter-plural":"operabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"operabil","error-unrecognized-form-feminine-indefinite-singular":"operabilă","error-unrecognized-form-indefinite-masculine-plural":"operabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"operabile","definite-error-unrecognized-form-masculine-neuter-singular":"operabilul","definite-error-unrecognized-form-feminine-singular":"operabila","definite-error-unrecognized-form-masculine-plural":"operabilii","definite-error-unrecognized-form-feminine-neuter-plural":"operabilele"}},{"word":"operabilitate","pos":"noun","definitions":["operability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"operabilitate","accusative-definite-nominative":"operabilitatea","dative-genitive-indefinite":"operabilități","dative-definite-genitive":"operabilității","vocative":"operabilitate"}},{"word":"operant","pos":"adj","definitions":["operant"],"forms":{"feminine-singular":"operantă","masculine-plural":"operanți","feminine-neuter-plural":"operante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"operant","error-unrecognized-form-feminine-indefinite-singular":"operantă","error-unrecognized-form-indefinite-masculine-plural":"operanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"operante","definite-error-unrecognized-form-masculine-neuter-singular":"operantul","definite-error-unrecognized-form-feminine-singular":"operanta","definite-error-unrecognized-form-masculine-plural":"operanții","definite-error-unrecognized-form-feminine-neuter-plural":"operantele"}},{"word":"operare","pos":"noun","definitions":["operation (the act of operating something)"],"pronunciation":"/o.peˈra.re/","examples":[{"ro":"Unele medicamente pot afecta operarea utilajelor grele.","en":"Some drugs can affect operation of heavy machinery."}],"forms":{"plural":"operări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"operare","accusative-definite-nominative-singular":"operarea","accusative-indefinite-nominative-plural":"operări","accusative-definite-nominative-plural":"operările","dative-genitive-indefinite-singular":"operări","dative-definite-genitive-singular":"operării","dative-genitive-indefinite-plural":"operări","dative-definite-genitive-plural":"operărilor","singular-vocative":"operare","plural-vocative":"operărilor"}},{"word":"operat","pos":"adj","definitions":["operated"],"forms":{"feminine-singular":"operată","masculine-plural":"operați","feminine-neuter-plural":"operate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"operat","error-unrecognized-form-feminine-indefinite-singular":"operată","error-unrecognized-form-indefinite-masculine-plural":"operați","error-unrecognized-form-feminine-indefinite-neuter-plural":"operate","definite-error-unrecognized-form-masculine-neuter-singular":"operatul","definite-error-unrecognized-form-feminine-singular":"operata","definite-error-unrecognized-form-masculine-plural":"operații","definite-error-unrecognized-form-feminine-neuter-plural":"operatele","alternative":"операт"}},{"word":"operat","pos":"verb","definitions":["past participle of opera"],"forms":{"participle-past":"of opera","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"operat","error-unrecognized-form-feminine-indefinite-singular":"operată","error-unrecognized-form-indefinite-masculine-plural":"operați","error-unrecognized-form-feminine-indefinite-neuter-plural":"operate","definite-error-unrecognized-form-masculine-neuter-singular":"operatul","definite-error-unrecognized-form-feminine-singular":"operata","definite-error-unrecognized-form-masculine-plural":"operații","definite-error-unrecognized-form-feminine-neuter-plural":"operatele","alternative":"операт"}},{"word":"operata","pos":"adj","definitions":["definite nominative/accusative feminine singular of operat"],"gender":"f-s","forms":{"alternative":"операта"}},{"word":"operata","pos":"verb","definitions":["definite nominative/accusative feminine singular of operat"],"gender":"f-s","forms":{"alternative":"операта"}},{"word":"operată","pos":"noun","definitions":["female equivalent of operat"],"forms":{"plural":"operate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"operată","accusative-definite-nominative-singular":"operata","accusative-indefinite-nominative-plural":"operate","accusative-definite-nominative-plural":"operatele","dative-genitive-indefinite-singular":"operate","dative-definite-genitive-singular":"operatei","dative-genitive-indefinite-plural":"operate","dative-definite-genitive-plural":"operatelor","singular-vocative":"operată","plural-vocative":"operatelor"}},{"word":"operație","pos":"noun","definitions":["operation","operation (the state of being operational)","synonym of operațiune (“undertaking”)","synonym of operațiune (“operation”)"],"pronunciation":"/o.peˈra.t͡si.e/","examples":[{"ro":"în operație","en":"in operation"}],"forms":{"plural":"operații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"operație","accusative-definite-nominative-singular":"operația","accusative-indefinite-nominative-plural":"operații","accusative-definite-nominative-plural":"operațiile","dative-genitive-indefinite-singular":"operații","dative-definite-genitive-singular":"operației","dative-genitive-indefinite-plural":"operații","dative-definite-genitive-plural":"operațiilor","singular-vocative":"operație","plural-vocative":"operațiilor","alternative":"operațiune"}},{"word":"operație aritmetică","pos":"noun","definitions":["arithmetic operation"],"forms":{"plural":"operații aritmetice"}},{"word":"operație binară","pos":"noun","definitions":["binary operation"],"forms":{"plural":"operații binare"}},{"word":"operație de schimbare a sexului","pos":"noun","definitions":["sex reassignment surgery"],"forms":{"plural":"operații de schimbare a sexului"}},{"word":"operație de schimbare de sex","pos":"noun","definitions":["sex reassignment surgery"],"forms":{"plural":"operații de schimbare de sex"}},{"word":"operațional","pos":"adj","definitions":["operational"],"pronunciation":"/ˌo.peˌra.t͡si.oˈnal/","forms":{"feminine-singular":"operațională","masculine-plural":"operaționali","feminine-neuter-plural":"operaționale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"operațional","error-unrecognized-form-feminine-indefinite-singular":"operațională","error-unrecognized-form-indefinite-masculine-plural":"operaționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"operaționale","definite-error-unrecognized-form-masculine-neuter-singular":"operaționalul","definite-error-unrecognized-form-feminine-singular":"operaționala","definite-error-unrecognized-form-masculine-plural":"operaționalii","definite-error-unrecognized-form-feminine-neuter-plural":"operaționalele"}},{"word":"operaționalitate","pos":"noun","definitions":["operationality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"operaționalitate","accusative-definite-nominative":"operaționalitatea","dative-genitive-indefinite":"operaționalități","dative-definite-genitive":"operaționalității","vocative":"operaționalitate"}},{"word":"operaționism","pos":"noun","definitions":["operationism"],"forms":{"plural":"operaționisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"operaționism","accusative-definite-nominative-singular":"operaționismul","accusative-indefinite-nominative-plural":"operaționisme","accusative-definite-nominative-plural":"operaționismele","dative-genitive-indefinite-singular":"operaționism","dative-definite-genitive-singular":"operaționismului","dative-genitive-indefinite-plural":"operaționisme","dative-definite-genitive-plural":"operaționismelor","singular-vocative":"operaționismule","plural-vocative":"operaționismelor"}},{"word":"operațiune","pos":"noun","definitions":["alternative form of operație"],"forms":{"plural":"operațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"operațiune","accusative-definite-nominative-singular":"operațiunea","accusative-indefinite-nominative-plural":"operațiuni","accusative-definite-nominative-plural":"operațiunile","dative-genitive-indefinite-singular":"operațiuni","dative-definite-genitive-singular":"operațiunii","dative-genitive-indefinite-plural":"operațiuni","dative-definite-genitive-plural":"operațiunilor","singular-vocative":"operațiune","plural-vocative":"operațiunilor"}},{"word":"operativ","pos":"adj","definitions":["operative"],"forms":{"feminine-singular":"operativă","masculine-plural":"operativi","feminine-neuter-plural":"operative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"operativ","error-unrecognized-form-feminine-indefinite-singular":"operativă","error-unrecognized-form-indefinite-masculine-plural":"operativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"operative","definite-error-unrecognized-form-masculine-neuter-singular":"operativul","definite-error-unrecognized-form-feminine-singular":"operativa","definite-error-unrecognized-form-masculine-plural":"operativii","definite-error-unrecognized-form-feminine-neuter-plural":"operativele"}},{"word":"operativitate","pos":"noun","definitions":["promptness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"operativitate","accusative-definite-nominative-singular":"operativitatea","accusative-indefinite-nominative-plural":"operativități","accusative-definite-nominative-plural":"operativitățile","dative-genitive-indefinite-singular":"operativități","dative-definite-genitive-singular":"operativității","dative-genitive-indefinite-plural":"operativități","dative-definite-genitive-plural":"operativităților","singular-vocative":"operativitate","plural-vocative":"operativităților"}},{"word":"operatoare","pos":"noun","definitions":["female equivalent of operator"],"forms":{"plural":"operatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"operatoare","accusative-definite-nominative-singular":"operatoarea","accusative-indefinite-nominative-plural":"operatoare","accusative-definite-nominative-plural":"operatoarele","dative-genitive-indefinite-singular":"operatoare","dative-definite-genitive-singular":"operatoarei","dative-genitive-indefinite-plural":"operatoare","dative-definite-genitive-plural":"operatoarelor","singular-vocative":"operatoare","plural-vocative":"operatoarelor"}},{"word":"operator","pos":"adj","definitions":["operating"],"forms":{"feminine-singular":"operatoare","masculine-plural":"operatori","feminine-neuter-plural":"operatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"operator","error-unrecognized-form-feminine-indefinite-singular":"operatoare","error-unrecognized-form-indefinite-masculine-plural":"operatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"operatoare","definite-error-unrecognized-form-masculine-neuter-singular":"operatorul","definite-error-unrecognized-form-feminine-singular":"operatoarea","definite-error-unrecognized-form-masculine-plural":"operatorii","definite-error-unrecognized-form-feminine-neuter-plural":"operatoarele"}},{"word":"operator","pos":"noun","definitions":["worker, operator"],"forms":{"plural":"operatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"operator","accusative-definite-nominative-singular":"operatorul","accusative-indefinite-nominative-plural":"operatori","accusative-definite-nominative-plural":"operatorii","dative-genitive-indefinite-singular":"operator","dative-definite-genitive-singular":"operatorului","dative-genitive-indefinite-plural":"operatori","dative-definite-genitive-plural":"operatorilor","singular-vocative":"operatorule","plural-vocative":"operatorilor"}},{"word":"operator aritmetic","pos":"noun","definitions":["arithmetic operator"],"forms":{"plural":"operatori aritmetici"}},{"word":"operator binar","pos":"noun","definitions":["binary operator"],"forms":{"plural":"operatori binari"}},{"word":"operatoriu","pos":"adj","definitions":["operative"],"forms":{"feminine-singular":"operatorie","plural":"operatorii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"operatoriu","error-unrecognized-form-feminine-indefinite-singular":"operatorie","error-unrecognized-form-indefinite-masculine-plural":"operatorii","error-unrecognized-form-feminine-indefinite-neuter-plural":"operatorii","definite-error-unrecognized-form-masculine-neuter-singular":"operatoriul","definite-error-unrecognized-form-feminine-singular":"operatoria","definite-error-unrecognized-form-masculine-plural":"operatoriii","definite-error-unrecognized-form-feminine-neuter-plural":"operatoriile"}},{"word":"opercul","pos":"noun","definitions":["operculum"],"forms":{"plural":"opercule","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"opercul","accusative-definite-nominative-singular":"operculul","accusative-indefinite-nominative-plural":"opercule","accusative-definite-nominative-plural":"operculele","dative-genitive-indefinite-singular":"opercul","dative-definite-genitive-singular":"operculului","dative-genitive-indefinite-plural":"opercule","dative-definite-genitive-plural":"operculelor","singular-vocative":"operculule","plural-vocative":"operculelor"}},{"word":"operetă","pos":"noun","definitions":["operetta, light opera"],"forms":{"plural":"operete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"operetă","accusative-definite-nominative-singular":"opereta","accusative-indefinite-nominative-plural":"operete","accusative-definite-nominative-plural":"operetele","dative-genitive-indefinite-singular":"operete","dative-definite-genitive-singular":"operetei","dative-genitive-indefinite-plural":"operete","dative-definite-genitive-plural":"operetelor","singular-vocative":"operetă","plural-vocative":"operetelor"}},{"word":"operetistic","pos":"adj","definitions":["operetta"],"forms":{"feminine-singular":"operetistică","masculine-plural":"operetistici","feminine-neuter-plural":"operetistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"operetistic","error-unrecognized-form-feminine-indefinite-singular":"operetistică","error-unrecognized-form-indefinite-masculine-plural":"operetistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"operetistice","definite-error-unrecognized-form-masculine-neuter-singular":"operetisticul","definite-error-unrecognized-form-feminine-singular":"operetistica","definite-error-unrecognized-form-masculine-plural":"operetisticii","definite-error-unrecognized-form-feminine-neuter-plural":"operetisticele"}},{"word":"operon","pos":"noun","definitions":["operon"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"operon","accusative-definite-nominative":"operonul","dative-genitive-indefinite":"operon","dative-definite-genitive":"operonului","vocative":"operonule"}},{"word":"opiaceu","pos":"adj","definitions":["opiate"],"forms":{"feminine-singular":"opiacee","masculine-plural":"opiacei","feminine-neuter-plural":"opiacee","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"opiaceu","error-unrecognized-form-feminine-indefinite-singular":"opiacee","error-unrecognized-form-indefinite-masculine-plural":"opiacei","error-unrecognized-form-feminine-indefinite-neuter-plural":"opiacee","definite-error-unrecognized-form-masculine-neuter-singular":"opiaceul","definite-error-unrecognized-form-feminine-singular":"opiaceea","definite-error-unrecognized-form-masculine-plural":"opiaceii","definite-error-unrecognized-form-feminine-neuter-plural":"opiaceele"}},{"word":"opiat","pos":"noun","definitions":["opiate"],"forms":{"plural":"opiate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"opiat","accusative-definite-nominative-singular":"opiatul","accusative-indefinite-nominative-plural":"opiate","accusative-definite-nominative-plural":"opiatele","dative-genitive-indefinite-singular":"opiat","dative-definite-genitive-singular":"opiatului","dative-genitive-indefinite-plural":"opiate","dative-definite-genitive-plural":"opiatelor","singular-vocative":"opiatule","plural-vocative":"opiatelor"}},{"word":"opid","pos":"noun","definitions":["oppidum"],"forms":{"plural":"opide","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"opid","accusative-definite-nominative-singular":"opidul","accusative-indefinite-nominative-plural":"opide","accusative-definite-nominative-plural":"opidele","dative-genitive-indefinite-singular":"opid","dative-definite-genitive-singular":"opidului","dative-genitive-indefinite-plural":"opide","dative-definite-genitive-plural":"opidelor","singular-vocative":"opidule","plural-vocative":"opidelor"}},{"word":"opilație","pos":"noun","definitions":["obstruction"],"forms":{"plural":"opilații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"opilație","accusative-definite-nominative-singular":"opilația","accusative-indefinite-nominative-plural":"opilații","accusative-definite-nominative-plural":"opilațiile","dative-genitive-indefinite-singular":"opilații","dative-definite-genitive-singular":"opilației","dative-genitive-indefinite-plural":"opilații","dative-definite-genitive-plural":"opilațiilor","singular-vocative":"opilație","plural-vocative":"opilațiilor"}},{"word":"opina","pos":"verb","definitions":["to opinate"],"forms":{"canonical":"a opina 1st conjugation","present-singular-third-person":"opinează","participle-past":"opinat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a opina","gerund":"opinând","first-person-indicative-present-singular":"opinez","indicative-present-second-person-singular":"opinezi","indicative-present-singular-third-person":"opinează","first-person-indicative-plural-present":"opinăm","indicative-plural-present-second-person":"opinați","indicative-plural-present-third-person":"opinează","first-person-imperfect-indicative-singular":"opinam","imperfect-indicative-second-person-singular":"opinai","imperfect-indicative-singular-third-person":"opina","first-person-imperfect-indicative-plural":"opinam","imperfect-indicative-plural-second-person":"opinați","imperfect-indicative-plural-third-person":"opinau","first-person-indicative-perfect-singular":"opinai","indicative-perfect-second-person-singular":"opinași","indicative-perfect-singular-third-person":"opină","first-person-indicative-perfect-plural":"opinarăm","indicative-perfect-plural-second-person":"opinarăți","indicative-perfect-plural-third-person":"opinară","first-person-indicative-pluperfect-singular":"opinasem","indicative-pluperfect-second-person-singular":"opinaseși","indicative-pluperfect-singular-third-person":"opinase","first-person-indicative-pluperfect-plural":"opinaserăm","indicative-pluperfect-plural-second-person":"opinaserăți","indicative-pluperfect-plural-third-person":"opinaseră","first-person-present-singular-subjunctive":"să opinez","present-second-person-singular-subjunctive":"să opinezi","present-singular-subjunctive-third-person":"să opineze","first-person-plural-present-subjunctive":"să opinăm","plural-present-second-person-subjunctive":"să opinați","plural-present-subjunctive-third-person":"să opineze","imperative-second-person-singular":"opinează","imperative-plural-second-person":"opinați","imperative-negative-second-person-singular":"nu opina","imperative-negative-plural-second-person":"nu opinați"}},{"word":"opinat","pos":"verb","definitions":["past participle of opina"],"forms":{"participle-past":"of opina"}},{"word":"Opincă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Opincă"}},{"word":"opincă","pos":"noun","definitions":["a type of traditional peasant's or shepherd's laced sandal or moccasin worn in the country"],"forms":{"plural":"opinci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"opincă","accusative-definite-nominative-singular":"opinca","accusative-indefinite-nominative-plural":"opinci","accusative-definite-nominative-plural":"opincile","dative-genitive-indefinite-singular":"opinci","dative-definite-genitive-singular":"opincii","dative-genitive-indefinite-plural":"opinci","dative-definite-genitive-plural":"opincilor","singular-vocative":"opincă","plural-vocative":"opincilor"}},{"word":"Opincar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Opincar"}},{"word":"opincar","pos":"noun","definitions":["peasant","mocassin maker"],"forms":{"plural":"opincari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"opincar","accusative-definite-nominative-singular":"opincarul","accusative-indefinite-nominative-plural":"opincari","accusative-definite-nominative-plural":"opincarii","dative-genitive-indefinite-singular":"opincar","dative-definite-genitive-singular":"opincarului","dative-genitive-indefinite-plural":"opincari","dative-definite-genitive-plural":"opincarilor","singular-vocative":"opincarule","plural-vocative":"opincarilor"}},{"word":"opincăraș","pos":"noun","definitions":["tanner"],"forms":{"plural":"opincarăși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"opincăraș","accusative-definite-nominative-singular":"opincărașul","accusative-indefinite-nominative-plural":"opincărași","accusative-definite-nominative-plural":"opincărașii","dative-genitive-indefinite-singular":"opincăraș","dative-definite-genitive-singular":"opincărașului","dative-genitive-indefinite-plural":"opincărași","dative-definite-genitive-plural":"opincărașilor","singular-vocative":"opincărașule","plural-vocative":"opincărașilor"}},{"word":"opincăreasă","pos":"noun","definitions":["female equivalent of opincar"],"forms":{"plural":"opincărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"opincăreasă","accusative-definite-nominative-singular":"opincăreasa","accusative-indefinite-nominative-plural":"opincărese","accusative-definite-nominative-plural":"opincăresele","dative-genitive-indefinite-singular":"opincărese","dative-definite-genitive-singular":"opincăresei","dative-genitive-indefinite-plural":"opincărese","dative-definite-genitive-plural":"opincăreselor","singular-vocative":"opincăreasă","plural-vocative":"opincăreselor"}},{"word":"opincărie","pos":"noun","definitions":["shop where opincă mocassins are made or sold"],"forms":{"plural":"opincării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"opincărie","accusative-definite-nominative-singular":"opincăria","accusative-indefinite-nominative-plural":"opincării","accusative-definite-nominative-plural":"opincăriile","dative-genitive-indefinite-singular":"opincării","dative-definite-genitive-singular":"opincăriei","dative-genitive-indefinite-plural":"opincării","dative-definite-genitive-plural":"opincăriilor","singular-vocative":"opincărie","plural-vocative":"opincăriilor"}},{"word":"opincărime","pos":"noun","definitions":["peasantry; the totality of peasants"],"forms":{"plural":"opincărimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"opincărime","accusative-definite-nominative-singular":"opincărimea","accusative-indefinite-nominative-plural":"opincărimi","accusative-definite-nominative-plural":"opincărimile","dative-genitive-indefinite-singular":"opincărimi","dative-definite-genitive-singular":"opincărimii","dative-genitive-indefinite-plural":"opincărimi","dative-definite-genitive-plural":"opincărimilor","singular-vocative":"opincărime","plural-vocative":"opincărimilor"}},{"word":"Opincariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Opincariu"}},{"word":"Opincaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Opincaru"}},{"word":"opincuță","pos":"noun","definitions":["diminutive of opincă; small moccasin"],"forms":{"plural":"opincuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"opincuță","accusative-definite-nominative-singular":"opincuța","accusative-indefinite-nominative-plural":"opincuțe","accusative-definite-nominative-plural":"opincuțele","dative-genitive-indefinite-singular":"opincuțe","dative-definite-genitive-singular":"opincuței","dative-genitive-indefinite-plural":"opincuțe","dative-definite-genitive-plural":"opincuțelor","singular-vocative":"opincuță","plural-vocative":"opincuțelor"}},{"word":"opinia","pos":"noun","definitions":["definite nominative/accusative singular of opinie"]},{"word":"opinie","pos":"noun","definitions":["opinion"],"forms":{"plural":"opinii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"opinie","accusative-definite-nominative-singular":"opinia","accusative-indefinite-nominative-plural":"opinii","accusative-definite-nominative-plural":"opiniile","dative-genitive-indefinite-singular":"opinii","dative-definite-genitive-singular":"opiniei","dative-genitive-indefinite-plural":"opinii","dative-definite-genitive-plural":"opiniilor","singular-vocative":"opinie","plural-vocative":"opiniilor"}},{"word":"opinie publică","pos":"noun","definitions":["public opinion"]},{"word":"opiniune","pos":"noun","definitions":["alternative form of opinie"],"forms":{"plural":"opiniuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"opiniune","accusative-definite-nominative-singular":"opiniunea","accusative-indefinite-nominative-plural":"opiniuni","accusative-definite-nominative-plural":"opiniunile","dative-genitive-indefinite-singular":"opiniuni","dative-definite-genitive-singular":"opiniunii","dative-genitive-indefinite-plural":"opiniuni","dative-definite-genitive-plural":"opiniunilor","singular-vocative":"opiniune","plural-vocative":"opiniunilor"}},{"word":"opinteală","pos":"noun","definitions":["exertion"],"forms":{"plural":"opinteli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"opinteală","accusative-definite-nominative-singular":"opinteala","accusative-indefinite-nominative-plural":"opintele","accusative-definite-nominative-plural":"opintelele","dative-genitive-indefinite-singular":"opintele","dative-definite-genitive-singular":"opintelei","dative-genitive-indefinite-plural":"opintele","dative-definite-genitive-plural":"opintelelor","singular-vocative":"opinteală","plural-vocative":"opintelelor"}},{"word":"opinti","pos":"verb","definitions":["to shove, to push forcefully"],"forms":{"canonical":"a opinti 4th conjugation","present-singular-third-person":"opintește","participle-past":"opintit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a opinti","gerund":"opintind","first-person-indicative-present-singular":"opintesc","indicative-present-second-person-singular":"opintești","indicative-present-singular-third-person":"opintește","first-person-indicative-plural-present":"opintim","indicative-plural-present-second-person":"opintiți","indicative-plural-present-third-person":"opintesc","first-person-imperfect-indicative-singular":"opinteam","imperfect-indicative-second-person-singular":"opinteai","imperfect-indicative-singular-third-person":"opintea","first-person-imperfect-indicative-plural":"opinteam","imperfect-indicative-plural-second-person":"opinteați","imperfect-indicative-plural-third-person":"opinteau","first-person-indicative-perfect-singular":"opintii","indicative-perfect-second-person-singular":"opintiși","indicative-perfect-singular-third-person":"opinti","first-person-indicative-perfect-plural":"opintirăm","indicative-perfect-plural-second-person":"opintirăți","indicative-perfect-plural-third-person":"opintiră","first-person-indicative-pluperfect-singular":"opintisem","indicative-pluperfect-second-person-singular":"opintiseși","indicative-pluperfect-singular-third-person":"opintise","first-person-indicative-pluperfect-plural":"opintiserăm","indicative-pluperfect-plural-second-person":"opintiserăți","indicative-pluperfect-plural-third-person":"opintiseră","first-person-present-singular-subjunctive":"să opintesc","present-second-person-singular-subjunctive":"să opintești","present-singular-subjunctive-third-person":"să opintească","first-person-plural-present-subjunctive":"să opintim","plural-present-second-person-subjunctive":"să opintiți","plural-present-subjunctive-third-person":"să opintească","imperative-second-person-singular":"opintește","imperative-plural-second-person":"opintiți","imperative-negative-second-person-singular":"nu opinti","imperative-negative-plural-second-person":"nu opintiți"}},{"word":"opintic","pos":"noun","definitions":["European hawkweed (Pilosella lactucella)"],"forms":{"plural":"opintici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"opintic","accusative-definite-nominative-singular":"opinticul","accusative-indefinite-nominative-plural":"opintici","accusative-definite-nominative-plural":"opinticii","dative-genitive-indefinite-singular":"opintic","dative-definite-genitive-singular":"opinticului","dative-genitive-indefinite-plural":"opintici","dative-definite-genitive-plural":"opinticilor","singular-vocative":"opinticule","plural-vocative":"opinticilor"}},{"word":"opintire","pos":"noun","definitions":["effort"],"forms":{"plural":"opintiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"opintire","accusative-definite-nominative-singular":"opintirea","accusative-indefinite-nominative-plural":"opintiri","accusative-definite-nominative-plural":"opintirile","dative-genitive-indefinite-singular":"opintiri","dative-definite-genitive-singular":"opintirii","dative-genitive-indefinite-plural":"opintiri","dative-definite-genitive-plural":"opintirilor","singular-vocative":"opintire","plural-vocative":"opintirilor"}},{"word":"opintitură","pos":"noun","definitions":["effort"],"forms":{"plural":"opintituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"opintitură","accusative-definite-nominative-singular":"opintitura","accusative-indefinite-nominative-plural":"opintituri","accusative-definite-nominative-plural":"opintiturile","dative-genitive-indefinite-singular":"opintituri","dative-definite-genitive-singular":"opintiturii","dative-genitive-indefinite-plural":"opintituri","dative-definite-genitive-plural":"opintiturilor","singular-vocative":"opintitură","plural-vocative":"opintiturilor"}},{"word":"opiofagie","pos":"noun","definitions":["opiophagism"],"forms":{"plural":"opiofagii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"opiofagie","accusative-definite-nominative-singular":"opiofagia","accusative-indefinite-nominative-plural":"opiofagii","accusative-definite-nominative-plural":"opiofagiile","dative-genitive-indefinite-singular":"opiofagii","dative-definite-genitive-singular":"opiofagiei","dative-genitive-indefinite-plural":"opiofagii","dative-definite-genitive-plural":"opiofagiilor","singular-vocative":"opiofagie","plural-vocative":"opiofagiilor"}},{"word":"opioman","pos":"noun","definitions":["opium addict"],"forms":{"plural":"opiomani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"opioman","accusative-definite-nominative-singular":"opiomanul","accusative-indefinite-nominative-plural":"opiomani","accusative-definite-nominative-plural":"opiomanii","dative-genitive-indefinite-singular":"opioman","dative-definite-genitive-singular":"opiomanului","dative-genitive-indefinite-plural":"opiomani","dative-definite-genitive-plural":"opiomanilor","singular-vocative":"opiomanule","plural-vocative":"opiomanilor"}},{"word":"opiomană","pos":"noun","definitions":["female equivalent of opioman"],"forms":{"plural":"opiomane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"opiomană","accusative-definite-nominative-singular":"opiomana","accusative-indefinite-nominative-plural":"opiomane","accusative-definite-nominative-plural":"opiomanele","dative-genitive-indefinite-singular":"opiomane","dative-definite-genitive-singular":"opiomanei","dative-genitive-indefinite-plural":"opiomane","dative-definite-genitive-plural":"opiomanelor","singular-vocative":"opiomană","plural-vocative":"opiomanelor"}},{"word":"opiomanie","pos":"noun","definitions":["opium addiction, opiomania"],"forms":{"plural":"opiomanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"opiomanie","accusative-definite-nominative-singular":"opiomania","accusative-indefinite-nominative-plural":"opiomanii","accusative-definite-nominative-plural":"opiomaniile","dative-genitive-indefinite-singular":"opiomanii","dative-definite-genitive-singular":"opiomaniei","dative-genitive-indefinite-plural":"opiomanii","dative-definite-genitive-plural":"opiomaniilor","singular-vocative":"opiomanie","plural-vocative":"opiomaniilor"}},{"word":"opis","pos":"noun","definitions":["inventory"],"forms":{"plural":"opise","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"opis","accusative-definite-nominative-singular":"opisul","accusative-indefinite-nominative-plural":"opise","accusative-definite-nominative-plural":"opisele","dative-genitive-indefinite-singular":"opis","dative-definite-genitive-singular":"opisului","dative-genitive-indefinite-plural":"opise","dative-definite-genitive-plural":"opiselor","singular-vocative":"opisule","plural-vocative":"opiselor"}},{"word":"opistodom","pos":"noun","definitions":["opisthodome"],"forms":{"plural":"opistodomuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"opistodom","accusative-definite-nominative-singular":"opistodomul","accusative-indefinite-nominative-plural":"opistodomuri","accusative-definite-nominative-plural":"opistodomurile","dative-genitive-indefinite-singular":"opistodom","dative-definite-genitive-singular":"opistodomului","dative-genitive-indefinite-plural":"opistodomuri","dative-definite-genitive-plural":"opistodomurilor","singular-vocative":"opistodomule","plural-vocative":"opistodomurilor"}},{"word":"opistotonus","pos":"noun","definitions":["opisthotonus"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"opistotonus","accusative-definite-nominative":"opistotonusul","dative-genitive-indefinite":"opistotonus","dative-definite-genitive":"opistotonusului","vocative":"opistotonusule"}},{"word":"opiu","pos":"noun","definitions":["opium"],"pronunciation":"[ˈo.pju]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"opiu","accusative-definite-nominative":"opiul","dative-genitive-indefinite":"opiu","dative-definite-genitive":"opiului","vocative":"opiule"}},{"word":"opium","pos":"noun","definitions":["alternative form of opiu"]},{"word":"oploșeală","pos":"noun","definitions":["shelter"],"forms":{"plural":"oploșeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oploșeală","accusative-definite-nominative-singular":"oploșeala","accusative-indefinite-nominative-plural":"oploșele","accusative-definite-nominative-plural":"oploșelele","dative-genitive-indefinite-singular":"oploșele","dative-definite-genitive-singular":"oploșelei","dative-genitive-indefinite-plural":"oploșele","dative-definite-genitive-plural":"oploșelelor","singular-vocative":"oploșeală","plural-vocative":"oploșelelor"}},{"word":"oploși","pos":"verb","definitions":["to find refuge, to shelter"],"forms":{"canonical":"a oploși 4th conjugation","present-singular-third-person":"oploșește","participle-past":"oploșit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a oploși","gerund":"oploșind","first-person-indicative-present-singular":"oploșesc","indicative-present-second-person-singular":"oploșești","indicative-present-singular-third-person":"oploșește","first-person-indicative-plural-present":"oploșim","indicative-plural-present-second-person":"oploșiți","indicative-plural-present-third-person":"oploșesc","first-person-imperfect-indicative-singular":"oploșeam","imperfect-indicative-second-person-singular":"oploșeai","imperfect-indicative-singular-third-person":"oploșea","first-person-imperfect-indicative-plural":"oploșeam","imperfect-indicative-plural-second-person":"oploșeați","imperfect-indicative-plural-third-person":"oploșeau","first-person-indicative-perfect-singular":"oploșii","indicative-perfect-second-person-singular":"oploșiși","indicative-perfect-singular-third-person":"oploși","first-person-indicative-perfect-plural":"oploșirăm","indicative-perfect-plural-second-person":"oploșirăți","indicative-perfect-plural-third-person":"oploșiră","first-person-indicative-pluperfect-singular":"oploșisem","indicative-pluperfect-second-person-singular":"oploșiseși","indicative-pluperfect-singular-third-person":"oploșise","first-person-indicative-pluperfect-plural":"oploșiserăm","indicative-pluperfect-plural-second-person":"oploșiserăți","indicative-pluperfect-plural-third-person":"oploșiseră","first-person-present-singular-subjunctive":"să oploșesc","present-second-person-singular-subjunctive":"să oploșești","present-singular-subjunctive-third-person":"să oploșească","first-person-plural-present-subjunctive":"să oploșim","plural-present-second-person-subjunctive":"să oploșiți","plural-present-subjunctive-third-person":"să oploșească","imperative-second-person-singular":"oploșește","imperative-plural-second-person":"oploșiți","imperative-negative-second-person-singular":"nu oploși","imperative-negative-plural-second-person":"nu oploșiți"}},{"word":"oploșire","pos":"noun","definitions":["refuge"],"forms":{"plural":"oploșiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oploșire","accusative-definite-nominative-singular":"oploșirea","accusative-indefinite-nominative-plural":"oploșiri","accusative-definite-nominative-plural":"oploșirile","dative-genitive-indefinite-singular":"oploșiri","dative-definite-genitive-singular":"oploșirii","dative-genitive-indefinite-plural":"oploșiri","dative-definite-genitive-plural":"oploșirilor","singular-vocative":"oploșire","plural-vocative":"oploșirilor"}},{"word":"oploșit","pos":"adj","definitions":["sheltered"],"forms":{"feminine-singular":"oploșită","masculine-plural":"oploșiți","feminine-neuter-plural":"oploșite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oploșit","error-unrecognized-form-feminine-indefinite-singular":"oploșită","error-unrecognized-form-indefinite-masculine-plural":"oploșiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"oploșite","definite-error-unrecognized-form-masculine-neuter-singular":"oploșitul","definite-error-unrecognized-form-feminine-singular":"oploșita","definite-error-unrecognized-form-masculine-plural":"oploșiții","definite-error-unrecognized-form-feminine-neuter-plural":"oploșitele"}},{"word":"oploșit","pos":"verb","definitions":["past participle of oploși"],"forms":{"participle-past":"of oploși"}},{"word":"oponent","pos":"noun","definitions":["opponent"],"forms":{"plural":"oponenți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oponent","accusative-definite-nominative-singular":"oponentul","accusative-indefinite-nominative-plural":"oponenți","accusative-definite-nominative-plural":"oponenții","dative-genitive-indefinite-singular":"oponent","dative-definite-genitive-singular":"oponentului","dative-genitive-indefinite-plural":"oponenți","dative-definite-genitive-plural":"oponenților","singular-vocative":"oponentule","plural-vocative":"oponenților"}},{"word":"oponentă","pos":"noun","definitions":["female equivalent of oponent"],"forms":{"plural":"oponente","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oponentă","accusative-definite-nominative-singular":"oponenta","accusative-indefinite-nominative-plural":"oponente","accusative-definite-nominative-plural":"oponentele","dative-genitive-indefinite-singular":"oponente","dative-definite-genitive-singular":"oponentei","dative-genitive-indefinite-plural":"oponente","dative-definite-genitive-plural":"oponentelor","singular-vocative":"oponentă","plural-vocative":"oponentelor"}},{"word":"oponență","pos":"noun","definitions":["opposition"],"forms":{"plural":"oponențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oponență","accusative-definite-nominative-singular":"oponența","accusative-indefinite-nominative-plural":"oponențe","accusative-definite-nominative-plural":"oponențele","dative-genitive-indefinite-singular":"oponențe","dative-definite-genitive-singular":"oponenței","dative-genitive-indefinite-plural":"oponențe","dative-definite-genitive-plural":"oponențelor","singular-vocative":"oponență","plural-vocative":"oponențelor"}},{"word":"opoponax","pos":"noun","definitions":["opopanax"],"forms":{"plural":"opoponacși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"opoponax","accusative-definite-nominative-singular":"opoponaxul","accusative-indefinite-nominative-plural":"opoponacși","accusative-definite-nominative-plural":"opoponacșii","dative-genitive-indefinite-singular":"opoponax","dative-definite-genitive-singular":"opoponaxului","dative-genitive-indefinite-plural":"opoponacși","dative-definite-genitive-plural":"opoponacșilor","singular-vocative":"opoponaxule","plural-vocative":"opoponacșilor"}},{"word":"oportun","pos":"adj","definitions":["appropriate"],"forms":{"feminine-singular":"oportună","masculine-plural":"oportuni","feminine-neuter-plural":"oportune","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oportun","error-unrecognized-form-feminine-indefinite-singular":"oportună","error-unrecognized-form-indefinite-masculine-plural":"oportuni","error-unrecognized-form-feminine-indefinite-neuter-plural":"oportune","definite-error-unrecognized-form-masculine-neuter-singular":"oportunul","definite-error-unrecognized-form-feminine-singular":"oportuna","definite-error-unrecognized-form-masculine-plural":"oportunii","definite-error-unrecognized-form-feminine-neuter-plural":"oportunele"}},{"word":"oportunism","pos":"noun","definitions":["opportunism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"oportunism","accusative-definite-nominative":"oportunismul","dative-genitive-indefinite":"oportunism","dative-definite-genitive":"oportunismului","vocative":"oportunismule"}},{"word":"oportunist","pos":"noun","definitions":["opportunist"],"forms":{"plural":"oportuniști","feminine":"equivalent oportunistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oportunist","accusative-definite-nominative-singular":"oportunistul","accusative-indefinite-nominative-plural":"oportuniști","accusative-definite-nominative-plural":"oportuniștii","dative-genitive-indefinite-singular":"oportunist","dative-definite-genitive-singular":"oportunistului","dative-genitive-indefinite-plural":"oportuniști","dative-definite-genitive-plural":"oportuniștilor","singular-vocative":"oportunistule","plural-vocative":"oportuniștilor"}},{"word":"oportunistă","pos":"noun","definitions":["female equivalent of oportunist"],"forms":{"plural":"oportuniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oportunistă","accusative-definite-nominative-singular":"oportunista","accusative-indefinite-nominative-plural":"oportuniste","accusative-definite-nominative-plural":"oportunistele","dative-genitive-indefinite-singular":"oportuniste","dative-definite-genitive-singular":"oportunistei","dative-genitive-indefinite-plural":"oportuniste","dative-definite-genitive-plural":"oportunistelor","singular-vocative":"oportunistă","plural-vocative":"oportunistelor"}},{"word":"oportunitate","pos":"noun","definitions":["opportunity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"oportunitate","accusative-definite-nominative":"oportunitatea","dative-genitive-indefinite":"oportunități","dative-definite-genitive":"oportunității","vocative":"oportunitate"}},{"word":"oposum","pos":"noun","definitions":["opossum (marsupial of the family Didelphidae)"],"pronunciation":"/oˈposum/","forms":{"plural":"oposumi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oposum","accusative-definite-nominative-singular":"oposumul","accusative-indefinite-nominative-plural":"oposumi","accusative-definite-nominative-plural":"oposumii","dative-genitive-indefinite-singular":"oposum","dative-definite-genitive-singular":"oposumului","dative-genitive-indefinite-plural":"oposumi","dative-definite-genitive-plural":"oposumilor","singular-vocative":"oposumule","plural-vocative":"oposumilor"}},{"word":"opoterapic","pos":"adj","definitions":["opotherapeutic"],"forms":{"feminine-singular":"opoterapică","masculine-plural":"opoterapici","feminine-neuter-plural":"opoterapice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"opoterapic","error-unrecognized-form-feminine-indefinite-singular":"opoterapică","error-unrecognized-form-indefinite-masculine-plural":"opoterapici","error-unrecognized-form-feminine-indefinite-neuter-plural":"opoterapice","definite-error-unrecognized-form-masculine-neuter-singular":"opoterapicul","definite-error-unrecognized-form-feminine-singular":"opoterapica","definite-error-unrecognized-form-masculine-plural":"opoterapicii","definite-error-unrecognized-form-feminine-neuter-plural":"opoterapicele"}},{"word":"opoterapie","pos":"noun","definitions":["opotherapy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"opoterapie","accusative-definite-nominative":"opoterapia","dative-genitive-indefinite":"opoterapii","dative-definite-genitive":"opoterapiei","vocative":"opoterapie"}},{"word":"opotreblenie","pos":"noun","definitions":["use"],"forms":{"plural":"opotreblenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"opotreblenie","accusative-definite-nominative-singular":"opotreblenia","accusative-indefinite-nominative-plural":"opotreblenii","accusative-definite-nominative-plural":"opotrebleniile","dative-genitive-indefinite-singular":"opotreblenii","dative-definite-genitive-singular":"opotrebleniei","dative-genitive-indefinite-plural":"opotreblenii","dative-definite-genitive-plural":"opotrebleniilor","singular-vocative":"opotreblenie","plural-vocative":"opotrebleniilor"}},{"word":"opozabil","pos":"adj","definitions":["opposable"],"forms":{"feminine-singular":"opozabilă","masculine-plural":"opozabili","feminine-neuter-plural":"opozabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"opozabil","error-unrecognized-form-feminine-indefinite-singular":"opozabilă","error-unrecognized-form-indefinite-masculine-plural":"opozabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"opozabile","definite-error-unrecognized-form-masculine-neuter-singular":"opozabilul","definite-error-unrecognized-form-feminine-singular":"opozabila","definite-error-unrecognized-form-masculine-plural":"opozabilii","definite-error-unrecognized-form-feminine-neuter-plural":"opozabilele"}},{"word":"opozabilitate","pos":"noun","definitions":["opposability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"opozabilitate","accusative-definite-nominative-singular":"opozabilitatea","accusative-indefinite-nominative-plural":"opozabilități","accusative-definite-nominative-plural":"opozabilitățile","dative-genitive-indefinite-singular":"opozabilități","dative-definite-genitive-singular":"opozabilității","dative-genitive-indefinite-plural":"opozabilități","dative-definite-genitive-plural":"opozabilităților","singular-vocative":"opozabilitate","plural-vocative":"opozabilităților"}},{"word":"opozant","pos":"noun","definitions":["opponent"],"forms":{"plural":"opozanți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"opozant","accusative-definite-nominative-singular":"opozantul","accusative-indefinite-nominative-plural":"opozanți","accusative-definite-nominative-plural":"opozanții","dative-genitive-indefinite-singular":"opozant","dative-definite-genitive-singular":"opozantului","dative-genitive-indefinite-plural":"opozanți","dative-definite-genitive-plural":"opozanților","singular-vocative":"opozantule","plural-vocative":"opozanților"}},{"word":"opozantă","pos":"noun","definitions":["female equivalent of opozant"],"forms":{"plural":"opozante","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"opozantă","accusative-definite-nominative-singular":"opozanta","accusative-indefinite-nominative-plural":"opozante","accusative-definite-nominative-plural":"opozantele","dative-genitive-indefinite-singular":"opozante","dative-definite-genitive-singular":"opozantei","dative-genitive-indefinite-plural":"opozante","dative-definite-genitive-plural":"opozantelor","singular-vocative":"opozantă","plural-vocative":"opozantelor"}},{"word":"opozit","pos":"adj","definitions":["opposite"],"forms":{"feminine-singular":"opozită","masculine-plural":"opoziți","feminine-neuter-plural":"opozite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"opozit","error-unrecognized-form-feminine-indefinite-singular":"opozită","error-unrecognized-form-indefinite-masculine-plural":"opoziți","error-unrecognized-form-feminine-indefinite-neuter-plural":"opozite","definite-error-unrecognized-form-masculine-neuter-singular":"opozitul","definite-error-unrecognized-form-feminine-singular":"opozita","definite-error-unrecognized-form-masculine-plural":"opoziții","definite-error-unrecognized-form-feminine-neuter-plural":"opozitele"}},{"word":"opoziție","pos":"noun","definitions":["opposition"],"pronunciation":"/opoˈzit͡si.e/","forms":{"plural":"opoziții"}},{"word":"opoziție politică","pos":"noun","definitions":["political opposition"],"pronunciation":"/opoˌzit͡si.e poˈlitikə/","forms":{"plural":"opoziții politice"}},{"word":"opoziției","pos":"noun","definitions":["definite genitive/dative singular of opoziție"],"gender":"f"},{"word":"opozițional","pos":"adj","definitions":["oppositional"],"forms":{"feminine-singular":"opozițională","masculine-plural":"opoziționali","feminine-neuter-plural":"opoziționale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"opozițional","error-unrecognized-form-feminine-indefinite-singular":"opozițională","error-unrecognized-form-indefinite-masculine-plural":"opoziționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"opoziționale","definite-error-unrecognized-form-masculine-neuter-singular":"opoziționalul","definite-error-unrecognized-form-feminine-singular":"opoziționala","definite-error-unrecognized-form-masculine-plural":"opoziționalii","definite-error-unrecognized-form-feminine-neuter-plural":"opoziționalele"}},{"word":"opoziționist","pos":"adj","definitions":["oppositionist"],"forms":{"feminine-singular":"opoziționistă","masculine-plural":"opoziționiști","feminine-neuter-plural":"opoziționiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"opoziționist","error-unrecognized-form-feminine-indefinite-singular":"opoziționistă","error-unrecognized-form-indefinite-masculine-plural":"opoziționiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"opoziționiste","definite-error-unrecognized-form-masculine-neuter-singular":"opoziționistul","definite-error-unrecognized-form-feminine-singular":"opoziționista","definite-error-unrecognized-form-masculine-plural":"opoziționiștii","definite-error-unrecognized-form-feminine-neuter-plural":"opoziționistele"}},{"word":"opozițiune","pos":"noun","definitions":["alternative form of opoziție"],"forms":{"plural":"opozițiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"opozițiune","accusative-definite-nominative-singular":"opozițiunea","accusative-indefinite-nominative-plural":"opozițiuni","accusative-definite-nominative-plural":"opozițiunile","dative-genitive-indefinite-singular":"opozițiuni","dative-definite-genitive-singular":"opozițiunii","dative-genitive-indefinite-plural":"opozițiuni","dative-definite-genitive-plural":"opozițiunilor","singular-vocative":"opozițiune","plural-vocative":"opozițiunilor"}},{"word":"oprac","pos":"noun","definitions":["place, location"],"forms":{"plural":"opracuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"oprac","accusative-definite-nominative-singular":"opracul","accusative-indefinite-nominative-plural":"opracuri","accusative-definite-nominative-plural":"opracurile","dative-genitive-indefinite-singular":"oprac","dative-definite-genitive-singular":"opracului","dative-genitive-indefinite-plural":"opracuri","dative-definite-genitive-plural":"opracurilor","singular-vocative":"opracule","plural-vocative":"opracurilor"}},{"word":"Oprănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Oprănescu"}},{"word":"Oprănești","pos":"name","definitions":["a village in Husnicioara, Mehedinți County, Romania"],"gender":"m"},{"word":"oprăvuire","pos":"noun","definitions":["raise"],"forms":{"plural":"oprăvuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oprăvuire","accusative-definite-nominative-singular":"oprăvuirea","accusative-indefinite-nominative-plural":"oprăvuiri","accusative-definite-nominative-plural":"oprăvuirile","dative-genitive-indefinite-singular":"oprăvuiri","dative-definite-genitive-singular":"oprăvuirii","dative-genitive-indefinite-plural":"oprăvuiri","dative-definite-genitive-plural":"oprăvuirilor","singular-vocative":"oprăvuire","plural-vocative":"oprăvuirilor"}},{"word":"oprea","pos":"verb","definitions":["third-person singular imperfect indicative of opri"],"pronunciation":"[oˈpre̯a]"},{"word":"oprea","pos":"noun","definitions":["alternative form of opreală"],"pronunciation":"[oˈpre̯a]","forms":{"plural":"oprele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"oprea","accusative-definite-nominative-singular":"opreaua","accusative-indefinite-nominative-plural":"oprele","accusative-definite-nominative-plural":"oprelele","dative-genitive-indefinite-singular":"oprele","dative-definite-genitive-singular":"oprelei","dative-genitive-indefinite-plural":"oprele","dative-definite-genitive-plural":"oprelelor","singular-vocative":"oprea","plural-vocative":"oprelelor"}},{"word":"opreai","pos":"verb","definitions":["second-person singular imperfect indicative of opri"],"pronunciation":"[oˈpre̯aj]"},{"word":"opreală","pos":"noun","definitions":["stop","brake","detention"],"forms":{"plural":"opreli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"opreală","accusative-definite-nominative-singular":"opreala","accusative-indefinite-nominative-plural":"oprele","accusative-definite-nominative-plural":"oprelele","dative-genitive-indefinite-singular":"oprele","dative-definite-genitive-singular":"oprelei","dative-genitive-indefinite-plural":"oprele","dative-definite-genitive-plural":"oprelelor","singular-vocative":"opreală","plural-vocative":"oprelelor"}},{"word":"opream","pos":"verb","definitions":["first-person singular/plural imperfect indicative of opri"],"pronunciation":"[oˈpre̯am]"},{"word":"oprească","pos":"verb","definitions":["third-person singular/plural present subjunctive of opri"],"pronunciation":"[oˈpre̯as.kə]"},{"word":"opreați","pos":"verb","definitions":["second-person plural imperfect indicative of opri"],"pronunciation":"[oˈpre̯at͡sʲ]"},{"word":"opreau","pos":"verb","definitions":["third-person plural imperfect indicative of opri"],"pronunciation":"[oˈpre̯aw]"},{"word":"opredelenie","pos":"noun","definitions":["decision"],"forms":{"plural":"opredelenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"opredelenie","accusative-definite-nominative-singular":"opredelenia","accusative-indefinite-nominative-plural":"opredelenii","accusative-definite-nominative-plural":"opredeleniile","dative-genitive-indefinite-singular":"opredelenii","dative-definite-genitive-singular":"opredeleniei","dative-genitive-indefinite-plural":"opredelenii","dative-definite-genitive-plural":"opredeleniilor","singular-vocative":"opredelenie","plural-vocative":"opredeleniilor"}},{"word":"opreliște","pos":"noun","definitions":["forbiddance"],"forms":{"plural":"opreliști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"opreliște","accusative-definite-nominative-singular":"opreliștea","accusative-indefinite-nominative-plural":"opreliști","accusative-definite-nominative-plural":"opreliștile","dative-genitive-indefinite-singular":"opreliști","dative-definite-genitive-singular":"opreliștii","dative-genitive-indefinite-plural":"opreliști","dative-definite-genitive-plural":"opreliștilor","singular-vocative":"opreliște","plural-vocative":"opreliștilor"}},{"word":"opresc","pos":"verb","definitions":["inflection of opri:","first-person singular present indicative/subjunctive","third-person plural present indicative"],"pronunciation":"[oˈpresk]"},{"word":"Oprescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Oprescu"}},{"word":"opresie","pos":"noun","definitions":["alternative form of opresiune"],"forms":{"plural":"opresii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"opresie","accusative-definite-nominative-singular":"opresia","accusative-indefinite-nominative-plural":"opresii","accusative-definite-nominative-plural":"opresiile","dative-genitive-indefinite-singular":"opresii","dative-definite-genitive-singular":"opresiei","dative-genitive-indefinite-plural":"opresii","dative-definite-genitive-plural":"opresiilor","singular-vocative":"opresie","plural-vocative":"opresiilor"}},{"word":"opresiune","pos":"noun","definitions":["oppression"],"forms":{"plural":"opresiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"opresiune","accusative-definite-nominative-singular":"opresiunea","accusative-indefinite-nominative-plural":"opresiune","accusative-definite-nominative-plural":"opresiunele","dative-genitive-indefinite-singular":"opresiune","dative-definite-genitive-singular":"opresiunei","dative-genitive-indefinite-plural":"opresiune","dative-definite-genitive-plural":"opresiunelor","singular-vocative":"opresiune","plural-vocative":"opresiunelor"}},{"word":"opresiv","pos":"adj","definitions":["oppressive"],"forms":{"feminine-singular":"opresivă","masculine-plural":"opresivi","feminine-neuter-plural":"opresive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"opresiv","error-unrecognized-form-feminine-indefinite-singular":"opresivă","error-unrecognized-form-indefinite-masculine-plural":"opresivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"opresive","definite-error-unrecognized-form-masculine-neuter-singular":"opresivul","definite-error-unrecognized-form-feminine-singular":"opresiva","definite-error-unrecognized-form-masculine-plural":"opresivii","definite-error-unrecognized-form-feminine-neuter-plural":"opresivele"}},{"word":"opresoare","pos":"noun","definitions":["female equivalent of opresor"],"forms":{"plural":"opresoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"opresoare","accusative-definite-nominative-singular":"opresoarea","accusative-indefinite-nominative-plural":"opresoare","accusative-definite-nominative-plural":"opresoarele","dative-genitive-indefinite-singular":"opresoare","dative-definite-genitive-singular":"opresoarei","dative-genitive-indefinite-plural":"opresoare","dative-definite-genitive-plural":"opresoarelor","singular-vocative":"opresoare","plural-vocative":"opresoarelor"}},{"word":"opresor","pos":"noun","definitions":["oppressor"],"forms":{"plural":"opresori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"opresor","accusative-definite-nominative-singular":"opresorul","accusative-indefinite-nominative-plural":"opresori","accusative-definite-nominative-plural":"opresorii","dative-genitive-indefinite-singular":"opresor","dative-definite-genitive-singular":"opresorului","dative-genitive-indefinite-plural":"opresori","dative-definite-genitive-plural":"opresorilor","singular-vocative":"opresorule","plural-vocative":"opresorilor"}},{"word":"oprește","pos":"verb","definitions":["inflection of opri:","third-person singular present indicative","second-person singular imperative"],"pronunciation":"[oˈpreʃ.te]"},{"word":"Oprești","pos":"name","definitions":["a village in Stâlpeni, Argeș County, Romania"],"gender":"m"},{"word":"oprești","pos":"verb","definitions":["second-person singular present indicative/subjunctive of opri"],"pronunciation":"[oˈpreʃtʲ]"}];
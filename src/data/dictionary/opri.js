@@ -0,0 +1 @@
+export default [{"word":"opri","pos":"verb","definitions":["to stop the movement of something","to stop one’s own movement","to voluntarily stop a vehicle for less than 5 minutes","to stop, put an end to the progress of something or the actions of someone","to stop an activity of oneself"],"pronunciation":"/oˈpri/","examples":[{"ro":"Tramvaiul a oprit în stație, iar mașinile au trebuit să oprească și ele în spatele lui.","en":"The tram stopped in the station, and the cars also had to stop behind it."},{"ro":"Nu mă pot opri din alunecat.","en":"I can’t stop myself from sliding."},{"ro":"Nu am vândut toate biletele—ți-am oprit unul și ție.","en":"I haven’t sold all the tickets—I kept one for you."}],"forms":{"canonical":"a opri 4th conjugation","present-singular-third-person":"oprește","participle-past":"oprit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a opri","gerund":"oprind","first-person-indicative-present-singular":"opresc","indicative-present-second-person-singular":"oprești","indicative-present-singular-third-person":"oprește","first-person-indicative-plural-present":"oprim","indicative-plural-present-second-person":"opriți","indicative-plural-present-third-person":"opresc","first-person-imperfect-indicative-singular":"opream","imperfect-indicative-second-person-singular":"opreai","imperfect-indicative-singular-third-person":"oprea","first-person-imperfect-indicative-plural":"opream","imperfect-indicative-plural-second-person":"opreați","imperfect-indicative-plural-third-person":"opreau","first-person-indicative-perfect-singular":"oprii","indicative-perfect-second-person-singular":"opriși","indicative-perfect-singular-third-person":"opri","first-person-indicative-perfect-plural":"oprirăm","indicative-perfect-plural-second-person":"oprirăți","indicative-perfect-plural-third-person":"opriră","first-person-indicative-pluperfect-singular":"oprisem","indicative-pluperfect-second-person-singular":"opriseși","indicative-pluperfect-singular-third-person":"oprise","first-person-indicative-pluperfect-plural":"opriserăm","indicative-pluperfect-plural-second-person":"opriserăți","indicative-pluperfect-plural-third-person":"opriseră","first-person-present-singular-subjunctive":"să opresc","present-second-person-singular-subjunctive":"să oprești","present-singular-subjunctive-third-person":"să oprească","first-person-plural-present-subjunctive":"să oprim","plural-present-second-person-subjunctive":"să opriți","plural-present-subjunctive-third-person":"să oprească","imperative-second-person-singular":"oprește","imperative-plural-second-person":"opriți","imperative-negative-second-person-singular":"nu opri","imperative-negative-plural-second-person":"nu opriți"}},{"word":"Oprică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Oprică"}},{"word":"oprii","pos":"verb","definitions":["first-person singular simple perfect indicative of opri"],"pronunciation":"[oˈpriː]","forms":{"canonical":"opríi"}},{"word":"oprim","pos":"verb","definitions":["first-person plural present indicative/subjunctive of opri"],"pronunciation":"[oˈprim]","forms":{"canonical":"oprím"}},{"word":"oprima","pos":"verb","definitions":["to oppress"],"forms":{"canonical":"a oprima 1st conjugation","present-singular-third-person":"oprimă","participle-past":"oprimat","subjunctive-third-person":"oprime","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a oprima","gerund":"oprimând","first-person-indicative-present-singular":"oprim","indicative-present-second-person-singular":"oprimi","indicative-present-singular-third-person":"oprimă","first-person-indicative-plural-present":"oprimăm","indicative-plural-present-second-person":"oprimați","indicative-plural-present-third-person":"oprimă","first-person-imperfect-indicative-singular":"oprimam","imperfect-indicative-second-person-singular":"oprimai","imperfect-indicative-singular-third-person":"oprima","first-person-imperfect-indicative-plural":"oprimam","imperfect-indicative-plural-second-person":"oprimați","imperfect-indicative-plural-third-person":"oprimau","first-person-indicative-perfect-singular":"oprimai","indicative-perfect-second-person-singular":"oprimași","indicative-perfect-singular-third-person":"oprimă","first-person-indicative-perfect-plural":"oprimarăm","indicative-perfect-plural-second-person":"oprimarăți","indicative-perfect-plural-third-person":"oprimară","first-person-indicative-pluperfect-singular":"oprimasem","indicative-pluperfect-second-person-singular":"oprimaseși","indicative-pluperfect-singular-third-person":"oprimase","first-person-indicative-pluperfect-plural":"oprimaserăm","indicative-pluperfect-plural-second-person":"oprimaserăți","indicative-pluperfect-plural-third-person":"oprimaseră","first-person-present-singular-subjunctive":"să oprim","present-second-person-singular-subjunctive":"să oprimi","present-singular-subjunctive-third-person":"să oprime","first-person-plural-present-subjunctive":"să oprimăm","plural-present-second-person-subjunctive":"să oprimați","plural-present-subjunctive-third-person":"să oprime","imperative-second-person-singular":"oprimă","imperative-plural-second-person":"oprimați","imperative-negative-second-person-singular":"nu oprima","imperative-negative-plural-second-person":"nu oprimați"}},{"word":"oprimant","pos":"adj","definitions":["oppressive"],"forms":{"feminine-singular":"oprimantă","masculine-plural":"oprimanți","feminine-neuter-plural":"oprimante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oprimant","error-unrecognized-form-feminine-indefinite-singular":"oprimantă","error-unrecognized-form-indefinite-masculine-plural":"oprimanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"oprimante","definite-error-unrecognized-form-masculine-neuter-singular":"oprimantul","definite-error-unrecognized-form-feminine-singular":"oprimanta","definite-error-unrecognized-form-masculine-plural":"oprimanții","definite-error-unrecognized-form-feminine-neuter-plural":"oprimantele"}},{"word":"oprimare","pos":"noun","definitions":["oppression"],"forms":{"plural":"oprimări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oprimare","accusative-definite-nominative-singular":"oprimarea","accusative-indefinite-nominative-plural":"oprimări","accusative-definite-nominative-plural":"oprimările","dative-genitive-indefinite-singular":"oprimări","dative-definite-genitive-singular":"oprimării","dative-genitive-indefinite-plural":"oprimări","dative-definite-genitive-plural":"oprimărilor","singular-vocative":"oprimare","plural-vocative":"oprimărilor"}},{"word":"oprimat","pos":"adj","definitions":["oppressed"],"forms":{"feminine-singular":"oprimată","masculine-plural":"oprimați","feminine-neuter-plural":"oprimate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oprimat","error-unrecognized-form-feminine-indefinite-singular":"oprimată","error-unrecognized-form-indefinite-masculine-plural":"oprimați","error-unrecognized-form-feminine-indefinite-neuter-plural":"oprimate","definite-error-unrecognized-form-masculine-neuter-singular":"oprimatul","definite-error-unrecognized-form-feminine-singular":"oprimata","definite-error-unrecognized-form-masculine-plural":"oprimații","definite-error-unrecognized-form-feminine-neuter-plural":"oprimatele"}},{"word":"oprind","pos":"verb","definitions":["gerund of opri"],"pronunciation":"[oˈprind]"},{"word":"Oprinescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Oprinescu"}},{"word":"Oprinoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Oprinoiu"}},{"word":"opriră","pos":"verb","definitions":["third-person plural simple perfect indicative of opri"],"pronunciation":"[oˈpri.rə]","forms":{"canonical":"opríră"}},{"word":"oprirăm","pos":"verb","definitions":["first-person plural simple perfect indicative of opri"],"pronunciation":"[oˈpri.rəm]","forms":{"canonical":"oprírăm"}},{"word":"oprirăți","pos":"verb","definitions":["second-person plural simple perfect indicative of opri"],"pronunciation":"[oˈpri.rət͡sʲ]","forms":{"canonical":"oprírăți"}},{"word":"oprire","pos":"noun","definitions":["stop, halt","station"],"forms":{"plural":"opriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oprire","accusative-definite-nominative-singular":"oprirea","accusative-indefinite-nominative-plural":"opriri","accusative-definite-nominative-plural":"opririle","dative-genitive-indefinite-singular":"opriri","dative-definite-genitive-singular":"opririi","dative-genitive-indefinite-plural":"opriri","dative-definite-genitive-plural":"opririlor","singular-vocative":"oprire","plural-vocative":"opririlor"}},{"word":"Oprișănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Oprișănescu"}},{"word":"oprise","pos":"verb","definitions":["third-person singular pluperfect indicative of opri"],"pronunciation":"[oˈpri.se]","forms":{"canonical":"opríse"}},{"word":"oprisem","pos":"verb","definitions":["first-person singular pluperfect indicative of opri"],"pronunciation":"[oˈpri.sem]","forms":{"canonical":"oprísem"}},{"word":"Oprișenescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Oprișenescu"}},{"word":"Oprișenești","pos":"name","definitions":["a village in Ianca, Brăila County, Romania"],"gender":"m"},{"word":"Oprișeni","pos":"name","definitions":["a village in Țuțora, Iași County, Romania"],"gender":"m"},{"word":"opriseră","pos":"verb","definitions":["third-person plural pluperfect indicative of opri"],"pronunciation":"[oˈpri.se.rə]","forms":{"canonical":"opríseră"}},{"word":"opriserăm","pos":"verb","definitions":["first-person plural pluperfect indicative of opri"],"pronunciation":"[oˈpri.se.rəm]","forms":{"canonical":"opríserăm"}},{"word":"opriserăți","pos":"verb","definitions":["second-person plural pluperfect indicative of opri"],"pronunciation":"[oˈpri.se.rət͡sʲ]","forms":{"canonical":"opríserăți"}},{"word":"Oprișescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Oprișescu"}},{"word":"opriseși","pos":"verb","definitions":["second-person singular pluperfect indicative of opri"],"pronunciation":"[oˈpri.seʃʲ]","forms":{"canonical":"opríseși"}},{"word":"Oprișești","pos":"name","definitions":["a village in Răchitoasa, Bacău County, Romania","a village in Balșa, Hunedoara County, Romania"],"gender":"m"},{"word":"opriși","pos":"verb","definitions":["second-person singular simple perfect indicative of opri"],"pronunciation":"[oˈpriʃʲ]"},{"word":"Oprișița","pos":"name","definitions":["a village in Poienești, Vaslui County, Romania"],"gender":"f"},{"word":"Oprișoi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Oprișoi"}},{"word":"Oprișoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Oprișoiu"}},{"word":"Oprișor","pos":"name","definitions":["a commune of Mehedinți County, Romania","a village in Oprișor, Mehedinți County, Romania"],"gender":"m"},{"word":"Oprișoreanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Oprișoreanu"}},{"word":"Oprișul","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Poarta"],"gender":"m"},{"word":"oprit","pos":"adj","definitions":["stopped","forbidden"],"pronunciation":"[oˈprit]","forms":{"feminine-singular":"oprită","masculine-plural":"opriți","feminine-neuter-plural":"oprite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oprit","error-unrecognized-form-feminine-indefinite-singular":"oprită","error-unrecognized-form-indefinite-masculine-plural":"opriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"oprite","definite-error-unrecognized-form-masculine-neuter-singular":"opritul","definite-error-unrecognized-form-feminine-singular":"oprita","definite-error-unrecognized-form-masculine-plural":"opriții","definite-error-unrecognized-form-feminine-neuter-plural":"opritele"}},{"word":"oprit","pos":"verb","definitions":["past participle of opri"],"pronunciation":"[oˈprit]","forms":{"canonical":"oprít","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"oprit","error-unrecognized-form-feminine-indefinite-singular":"oprită","error-unrecognized-form-indefinite-masculine-plural":"opriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"oprite","definite-error-unrecognized-form-masculine-neuter-singular":"opritul","definite-error-unrecognized-form-feminine-singular":"oprita","definite-error-unrecognized-form-masculine-plural":"opriții","definite-error-unrecognized-form-feminine-neuter-plural":"opritele"}},{"word":"oprita","pos":"adj","definitions":["definite nominative/accusative feminine singular of oprit"],"pronunciation":"[oˈprita]"},{"word":"oprită","pos":"adj","definitions":["feminine singular of oprit"],"pronunciation":"[oˈpritə]"},{"word":"oprite","pos":"adj","definitions":["feminine/neuter plural of oprit"],"pronunciation":"[oˈprite]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"opríte"}},{"word":"opritei","pos":"adj","definitions":["definite genitive/dative feminine singular of oprit"],"pronunciation":"[oˈpritej]"},{"word":"opritele","pos":"adj","definitions":["definite nominative/accusative feminine/neuter plural of oprit"],"pronunciation":"[oˈpritele]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"oprítele"}},{"word":"opritelor","pos":"adj","definitions":["definite genitive/dative feminine/neuter plural of oprit"],"pronunciation":"[oˈpritelor]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"oprítelor"}},{"word":"Oprițescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Oprițescu"}},{"word":"opriți","pos":"adj","definitions":["masculine plural of oprit"],"pronunciation":"[oˈprit͡sʲ]","forms":{"canonical":"opríți"}},{"word":"opriți","pos":"verb","definitions":["inflection of opri:","second-person plural present indicative/subjunctive","second-person plural imperative"],"pronunciation":"[oˈprit͡sʲ]","forms":{"canonical":"opríți"}},{"word":"opriții","pos":"adj","definitions":["definite nominative/accusative masculine plural of oprit"],"pronunciation":"[oˈprit͡siː]","gender":"m-p","forms":{"canonical-masculine-plural":"opríții"}},{"word":"opriților","pos":"adj","definitions":["definite genitive/dative masculine plural of oprit"],"pronunciation":"[oˈprit͡silor]","gender":"m-p","forms":{"canonical-masculine-plural":"opríților"}},{"word":"Oprițoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Oprițoiu"}},{"word":"opritor","pos":"noun","definitions":["stopper"],"forms":{"plural":"opritoare"}},{"word":"opritul","pos":"adj","definitions":["definite nominative/accusative masculine/neuter singular of oprit"],"pronunciation":"[oˈpritul]","gender":"m","forms":{"canonical-masculine-neuter":"oprítul"}},{"word":"opritului","pos":"adj","definitions":["definite genitive/dative masculine/neuter singular of oprit"],"pronunciation":"[oˈprituluj]","gender":"m","forms":{"canonical-masculine-neuter":"oprítului"}},{"word":"opritură","pos":"noun","definitions":["preserve (forest from which it is forbidden to cut trees)"],"forms":{"plural":"oprituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"opritură","accusative-definite-nominative-singular":"opritura","accusative-indefinite-nominative-plural":"oprituri","accusative-definite-nominative-plural":"opriturile","dative-genitive-indefinite-singular":"oprituri","dative-definite-genitive-singular":"opriturii","dative-genitive-indefinite-plural":"oprituri","dative-definite-genitive-plural":"opriturilor","singular-vocative":"opritură","plural-vocative":"opriturilor"}},{"word":"Oproaia","pos":"name","definitions":["a village in Țibana, Iași County, Romania"],"gender":"f"},{"word":"oprobriu","pos":"noun","definitions":["opprobrium"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oprobriu","accusative-definite-nominative-singular":"oprobriul","accusative-indefinite-nominative-plural":"-","accusative-definite-nominative-plural":"-le","dative-genitive-indefinite-singular":"oprobriu","dative-definite-genitive-singular":"oprobriului","dative-genitive-indefinite-plural":"-","dative-definite-genitive-plural":"-lor","singular-vocative":"oprobriule","plural-vocative":"-lor"}},{"word":"Oproiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Oproiu"}},{"word":"Opruț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Opruț"}},{"word":"opsas","pos":"noun","definitions":["heel (part of a shoe)"],"forms":{"plural":"opsasuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"opsas","accusative-definite-nominative-singular":"opsasul","accusative-indefinite-nominative-plural":"opsasuri","accusative-definite-nominative-plural":"opsasurile","dative-genitive-indefinite-singular":"opsas","dative-definite-genitive-singular":"opsasului","dative-genitive-indefinite-plural":"opsasuri","dative-definite-genitive-plural":"opsasurilor","singular-vocative":"opsasule","plural-vocative":"opsasurilor"}},{"word":"opsoman","pos":"noun","definitions":["a person who has opsomania"],"forms":{"plural":"opsomani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"opsoman","accusative-definite-nominative-singular":"opsomanul","accusative-indefinite-nominative-plural":"opsomani","accusative-definite-nominative-plural":"opsomanii","dative-genitive-indefinite-singular":"opsoman","dative-definite-genitive-singular":"opsomanului","dative-genitive-indefinite-plural":"opsomani","dative-definite-genitive-plural":"opsomanilor","singular-vocative":"opsomanule","plural-vocative":"opsomanilor"}},{"word":"opsomanie","pos":"noun","definitions":["opsomania"],"forms":{"plural":"opsomanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"opsomanie","accusative-definite-nominative-singular":"opsomania","accusative-indefinite-nominative-plural":"opsomanii","accusative-definite-nominative-plural":"opsomaniile","dative-genitive-indefinite-singular":"opsomanii","dative-definite-genitive-singular":"opsomaniei","dative-genitive-indefinite-plural":"opsomanii","dative-definite-genitive-plural":"opsomaniilor","singular-vocative":"opsomanie","plural-vocative":"opsomaniilor"}},{"word":"opsonină","pos":"noun","definitions":["opsonin"],"forms":{"plural":"opsonine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"opsonină","accusative-definite-nominative-singular":"opsonina","accusative-indefinite-nominative-plural":"opsonine","accusative-definite-nominative-plural":"opsoninele","dative-genitive-indefinite-singular":"opsonine","dative-definite-genitive-singular":"opsoninei","dative-genitive-indefinite-plural":"opsonine","dative-definite-genitive-plural":"opsoninelor","singular-vocative":"opsonină","plural-vocative":"opsoninelor"}},{"word":"opt","pos":"num","definitions":["eight"],"pronunciation":"/opt/"},{"word":"opta","pos":"adj","definitions":["eighth"],"pronunciation":"/ˈop.ta/","gender":"f","forms":{"canonical-feminine":"a opta","masculine":"al optulea"}},{"word":"opta","pos":"verb","definitions":["to opt"],"pronunciation":"/opˈta/","forms":{"canonical":"a opta 1st conjugation","present-singular-third-person":"optează","participle-past":"optat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a opta","gerund":"optând","first-person-indicative-present-singular":"optez","indicative-present-second-person-singular":"optezi","indicative-present-singular-third-person":"optează","first-person-indicative-plural-present":"optăm","indicative-plural-present-second-person":"optați","indicative-plural-present-third-person":"optează","first-person-imperfect-indicative-singular":"optam","imperfect-indicative-second-person-singular":"optai","imperfect-indicative-singular-third-person":"opta","first-person-imperfect-indicative-plural":"optam","imperfect-indicative-plural-second-person":"optați","imperfect-indicative-plural-third-person":"optau","first-person-indicative-perfect-singular":"optai","indicative-perfect-second-person-singular":"optași","indicative-perfect-singular-third-person":"optă","first-person-indicative-perfect-plural":"optarăm","indicative-perfect-plural-second-person":"optarăți","indicative-perfect-plural-third-person":"optară","first-person-indicative-pluperfect-singular":"optasem","indicative-pluperfect-second-person-singular":"optaseși","indicative-pluperfect-singular-third-person":"optase","first-person-indicative-pluperfect-plural":"optaserăm","indicative-pluperfect-plural-second-person":"optaserăți","indicative-pluperfect-plural-third-person":"optaseră","first-person-present-singular-subjunctive":"să optez","present-second-person-singular-subjunctive":"să optezi","present-singular-subjunctive-third-person":"să opteze","first-person-plural-present-subjunctive":"să optăm","plural-present-second-person-subjunctive":"să optați","plural-present-subjunctive-third-person":"să opteze","imperative-second-person-singular":"optează","imperative-plural-second-person":"optați","imperative-negative-second-person-singular":"nu opta","imperative-negative-plural-second-person":"nu optați"}},{"word":"optare","pos":"noun","definitions":["option"],"forms":{"plural":"optări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"optare","accusative-definite-nominative-singular":"optarea","accusative-indefinite-nominative-plural":"optări","accusative-definite-nominative-plural":"optările","dative-genitive-indefinite-singular":"optări","dative-definite-genitive-singular":"optării","dative-genitive-indefinite-plural":"optări","dative-definite-genitive-plural":"optărilor","singular-vocative":"optare","plural-vocative":"optărilor"}},{"word":"Optășani","pos":"name","definitions":["a village in Spineni, Olt County, Romania"],"gender":"m"},{"word":"Optași","pos":"name","definitions":["a village in Optași-Măgura, Olt County, Romania"],"gender":"m"},{"word":"Optași-Măgura","pos":"name","definitions":["a commune of Olt County, Romania"],"gender":"f"},{"word":"optație","pos":"noun","definitions":["wishing, a wish"],"forms":{"plural":"optații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"optație","accusative-definite-nominative-singular":"optația","accusative-indefinite-nominative-plural":"optații","accusative-definite-nominative-plural":"optațiile","dative-genitive-indefinite-singular":"optații","dative-definite-genitive-singular":"optației","dative-genitive-indefinite-plural":"optații","dative-definite-genitive-plural":"optațiilor","singular-vocative":"optație","plural-vocative":"optațiilor"}},{"word":"optativ","pos":"adj","definitions":["optative"],"forms":{"feminine-singular":"optativă","masculine-plural":"optativi","feminine-neuter-plural":"optative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"optativ","error-unrecognized-form-feminine-indefinite-singular":"optativă","error-unrecognized-form-indefinite-masculine-plural":"optativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"optative","definite-error-unrecognized-form-masculine-neuter-singular":"optativul","definite-error-unrecognized-form-feminine-singular":"optativa","definite-error-unrecognized-form-masculine-plural":"optativii","definite-error-unrecognized-form-feminine-neuter-plural":"optativele"}},{"word":"optativă","pos":"adj","definitions":["indefinite feminine singular nominative of optativ (“optative”)"],"pronunciation":"/op.taˈti.və/"},{"word":"optic","pos":"adj","definitions":["optic"],"forms":{"feminine-singular":"optică","masculine-plural":"optici","feminine-neuter-plural":"optice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"optic","error-unrecognized-form-feminine-indefinite-singular":"optică","error-unrecognized-form-indefinite-masculine-plural":"optici","error-unrecognized-form-feminine-indefinite-neuter-plural":"optice","definite-error-unrecognized-form-masculine-neuter-singular":"opticul","definite-error-unrecognized-form-feminine-singular":"optica","definite-error-unrecognized-form-masculine-plural":"opticii","definite-error-unrecognized-form-feminine-neuter-plural":"opticele"}},{"word":"optică","pos":"noun","definitions":["optics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"optică","accusative-definite-nominative":"optica","dative-genitive-indefinite":"optici","dative-definite-genitive":"opticii","vocative":"optică"}},{"word":"optician","pos":"noun","definitions":["optician"],"pronunciation":"/op.ti.t͡ʃiˈan/","forms":{"plural":"opticieni","feminine":"equivalent opticiană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"optician","accusative-definite-nominative-singular":"opticianul","accusative-indefinite-nominative-plural":"opticieni","accusative-definite-nominative-plural":"opticienii","dative-genitive-indefinite-singular":"optician","dative-definite-genitive-singular":"opticianului","dative-genitive-indefinite-plural":"opticieni","dative-definite-genitive-plural":"opticienilor","singular-vocative":"opticianule","plural-vocative":"opticienilor"}},{"word":"opticiană","pos":"noun","definitions":["female equivalent of optician"],"forms":{"plural":"opticiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"opticiană","accusative-definite-nominative-singular":"opticiana","accusative-indefinite-nominative-plural":"opticiene","accusative-definite-nominative-plural":"opticienele","dative-genitive-indefinite-singular":"opticiene","dative-definite-genitive-singular":"opticienei","dative-genitive-indefinite-plural":"opticiene","dative-definite-genitive-plural":"opticienelor","singular-vocative":"opticiană","plural-vocative":"opticienelor"}},{"word":"opticitate","pos":"noun","definitions":["opticity"],"forms":{"plural":"opticitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"opticitate","accusative-definite-nominative-singular":"opticitatea","accusative-indefinite-nominative-plural":"opticitatăți","accusative-definite-nominative-plural":"opticitatățile","dative-genitive-indefinite-singular":"opticitatăți","dative-definite-genitive-singular":"opticitatății","dative-genitive-indefinite-plural":"opticitatăți","dative-definite-genitive-plural":"opticitatăților","singular-vocative":"opticitate","plural-vocative":"opticitatăților"}},{"word":"optim","pos":"adj","definitions":["optimum"],"pronunciation":"/ˈop.tim/","forms":{"feminine-singular":"optimă","masculine-plural":"optimi","feminine-neuter-plural":"optime","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"optim","error-unrecognized-form-feminine-indefinite-singular":"optimă","error-unrecognized-form-indefinite-masculine-plural":"optimi","error-unrecognized-form-feminine-indefinite-neuter-plural":"optime","definite-error-unrecognized-form-masculine-neuter-singular":"optimul","definite-error-unrecognized-form-feminine-singular":"optima","definite-error-unrecognized-form-masculine-plural":"optimii","definite-error-unrecognized-form-feminine-neuter-plural":"optimele"}},{"word":"optimal","pos":"adj","definitions":["optimal"],"pronunciation":"/op.tiˈmal/","forms":{"feminine-singular":"optimală","masculine-plural":"optimali","feminine-neuter-plural":"optimale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"optimal","error-unrecognized-form-feminine-indefinite-singular":"optimală","error-unrecognized-form-indefinite-masculine-plural":"optimali","error-unrecognized-form-feminine-indefinite-neuter-plural":"optimale","definite-error-unrecognized-form-masculine-neuter-singular":"optimalul","definite-error-unrecognized-form-feminine-singular":"optimala","definite-error-unrecognized-form-masculine-plural":"optimalii","definite-error-unrecognized-form-feminine-neuter-plural":"optimalele"}},{"word":"optimat","pos":"noun","definitions":["optimate, Ancient Roman aristocrat"],"forms":{"plural":"optimați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"optimat","accusative-definite-nominative-singular":"optimatul","accusative-indefinite-nominative-plural":"optimați","accusative-definite-nominative-plural":"optimații","dative-genitive-indefinite-singular":"optimat","dative-definite-genitive-singular":"optimatului","dative-genitive-indefinite-plural":"optimați","dative-definite-genitive-plural":"optimaților","singular-vocative":"optimatule","plural-vocative":"optimaților"}},{"word":"optime","pos":"noun","definitions":["an eighth (one of eight equal parts of a whole)"],"pronunciation":"/opˈti.me/","forms":{"plural":"optimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"optime","accusative-definite-nominative-singular":"optimea","accusative-indefinite-nominative-plural":"optimi","accusative-definite-nominative-plural":"optimile","dative-genitive-indefinite-singular":"optimi","dative-definite-genitive-singular":"optimii","dative-genitive-indefinite-plural":"optimi","dative-definite-genitive-plural":"optimilor","singular-vocative":"optime","plural-vocative":"optimilor"}},{"word":"optimetru","pos":"noun","definitions":["optimeter"],"forms":{"plural":"optimetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"optimetru","accusative-definite-nominative-singular":"optimetrul","accusative-indefinite-nominative-plural":"optimetre","accusative-definite-nominative-plural":"optimetrele","dative-genitive-indefinite-singular":"optimetru","dative-definite-genitive-singular":"optimetrului","dative-genitive-indefinite-plural":"optimetre","dative-definite-genitive-plural":"optimetrelor","singular-vocative":"optimetrule","plural-vocative":"optimetrelor"}},{"word":"optimism","pos":"noun","definitions":["optimism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"optimism","accusative-definite-nominative":"optimismul","dative-genitive-indefinite":"optimism","dative-definite-genitive":"optimismului","vocative":"optimismule"}},{"word":"optimist","pos":"adj","definitions":["optimistic"],"pronunciation":"/op.tiˈmist/","forms":{"feminine-singular":"optimistă","masculine-plural":"optimiști","feminine-neuter-plural":"optimiste","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"optimist","error-unrecognized-form-feminine-indefinite-singular":"optimistă","error-unrecognized-form-indefinite-masculine-plural":"optimiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"optimiste","definite-error-unrecognized-form-masculine-neuter-singular":"optimistul","definite-error-unrecognized-form-feminine-singular":"optimista","definite-error-unrecognized-form-masculine-plural":"optimiștii","definite-error-unrecognized-form-feminine-neuter-plural":"optimistele"}},{"word":"optimist","pos":"noun","definitions":["optimist"],"pronunciation":"/op.tiˈmist/","forms":{"plural":"optimiști","feminine":"equivalent optimistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"optimist","accusative-definite-nominative-singular":"optimistul","accusative-indefinite-nominative-plural":"optimiști","accusative-definite-nominative-plural":"optimiștii","dative-genitive-indefinite-singular":"optimist","dative-definite-genitive-singular":"optimistului","dative-genitive-indefinite-plural":"optimiști","dative-definite-genitive-plural":"optimiștilor","singular-vocative":"optimistule","plural-vocative":"optimiștilor"}},{"word":"optimistă","pos":"noun","definitions":["female equivalent of optimist"],"forms":{"plural":"optimiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"optimistă","accusative-definite-nominative-singular":"optimista","accusative-indefinite-nominative-plural":"optimiste","accusative-definite-nominative-plural":"optimistele","dative-genitive-indefinite-singular":"optimiste","dative-definite-genitive-singular":"optimistei","dative-genitive-indefinite-plural":"optimiste","dative-definite-genitive-plural":"optimistelor","singular-vocative":"optimistă","plural-vocative":"optimistelor"}},{"word":"optimiza","pos":"verb","definitions":["to optimize"],"pronunciation":"/op.ti.miˈza/","forms":{"canonical":"a optimiza 1st conjugation","present-singular-third-person":"optimizează","participle-past":"optimizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a optimiza","gerund":"optimizând","first-person-indicative-present-singular":"optimizez","indicative-present-second-person-singular":"optimizezi","indicative-present-singular-third-person":"optimizează","first-person-indicative-plural-present":"optimizăm","indicative-plural-present-second-person":"optimizați","indicative-plural-present-third-person":"optimizează","first-person-imperfect-indicative-singular":"optimizam","imperfect-indicative-second-person-singular":"optimizai","imperfect-indicative-singular-third-person":"optimiza","first-person-imperfect-indicative-plural":"optimizam","imperfect-indicative-plural-second-person":"optimizați","imperfect-indicative-plural-third-person":"optimizau","first-person-indicative-perfect-singular":"optimizai","indicative-perfect-second-person-singular":"optimizași","indicative-perfect-singular-third-person":"optimiză","first-person-indicative-perfect-plural":"optimizarăm","indicative-perfect-plural-second-person":"optimizarăți","indicative-perfect-plural-third-person":"optimizară","first-person-indicative-pluperfect-singular":"optimizasem","indicative-pluperfect-second-person-singular":"optimizaseși","indicative-pluperfect-singular-third-person":"optimizase","first-person-indicative-pluperfect-plural":"optimizaserăm","indicative-pluperfect-plural-second-person":"optimizaserăți","indicative-pluperfect-plural-third-person":"optimizaseră","first-person-present-singular-subjunctive":"să optimizez","present-second-person-singular-subjunctive":"să optimizezi","present-singular-subjunctive-third-person":"să optimizeze","first-person-plural-present-subjunctive":"să optimizăm","plural-present-second-person-subjunctive":"să optimizați","plural-present-subjunctive-third-person":"să optimizeze","imperative-second-person-singular":"optimizează","imperative-plural-second-person":"optimizați","imperative-negative-second-person-singular":"nu optimiza","imperative-negative-plural-second-person":"nu optimizați"}},{"word":"optimizare","pos":"noun","definitions":["optimization"],"forms":{"plural":"optimizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"optimizare","accusative-definite-nominative-singular":"optimizarea","accusative-indefinite-nominative-plural":"optimizări","accusative-definite-nominative-plural":"optimizările","dative-genitive-indefinite-singular":"optimizări","dative-definite-genitive-singular":"optimizării","dative-genitive-indefinite-plural":"optimizări","dative-definite-genitive-plural":"optimizărilor","singular-vocative":"optimizare","plural-vocative":"optimizărilor"}},{"word":"optimizat","pos":"adj","definitions":["optimized"],"forms":{"feminine-singular":"optimizată","masculine-plural":"optimizați","feminine-neuter-plural":"optimizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"optimizat","error-unrecognized-form-feminine-indefinite-singular":"optimizată","error-unrecognized-form-indefinite-masculine-plural":"optimizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"optimizate","definite-error-unrecognized-form-masculine-neuter-singular":"optimizatul","definite-error-unrecognized-form-feminine-singular":"optimizata","definite-error-unrecognized-form-masculine-plural":"optimizații","definite-error-unrecognized-form-feminine-neuter-plural":"optimizatele"}},{"word":"opțional","pos":"adj","definitions":["optional"],"forms":{"feminine-singular":"opțională","masculine-plural":"opționali","feminine-neuter-plural":"opționale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"opțional","error-unrecognized-form-feminine-indefinite-singular":"opțională","error-unrecognized-form-indefinite-masculine-plural":"opționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"opționale","definite-error-unrecognized-form-masculine-neuter-singular":"opționalul","definite-error-unrecognized-form-feminine-singular":"opționala","definite-error-unrecognized-form-masculine-plural":"opționalii","definite-error-unrecognized-form-feminine-neuter-plural":"opționalele"}},{"word":"opțiune","pos":"noun","definitions":["option"],"forms":{"plural":"opțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"opțiune","accusative-definite-nominative-singular":"opțiunea","accusative-indefinite-nominative-plural":"opțiuni","accusative-definite-nominative-plural":"opțiunile","dative-genitive-indefinite-singular":"opțiuni","dative-definite-genitive-singular":"opțiunii","dative-genitive-indefinite-plural":"opțiuni","dative-definite-genitive-plural":"opțiunilor","singular-vocative":"opțiune","plural-vocative":"opțiunilor"}},{"word":"optocuplor","pos":"noun","definitions":["optocoupler"],"forms":{"plural":"optocuploare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"optocuplor","accusative-definite-nominative-singular":"optocuplorul","accusative-indefinite-nominative-plural":"optocuplore","accusative-definite-nominative-plural":"optocuplorele","dative-genitive-indefinite-singular":"optocuplor","dative-definite-genitive-singular":"optocuplorului","dative-genitive-indefinite-plural":"optocuplore","dative-definite-genitive-plural":"optocuplorelor","singular-vocative":"optocuplorule","plural-vocative":"optocuplorelor"}},{"word":"optoelectronică","pos":"noun","definitions":["optoelectronics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"optoelectronică","accusative-definite-nominative-singular":"optoelectronica","accusative-indefinite-nominative-plural":"optoelectronice","accusative-definite-nominative-plural":"optoelectronicele","dative-genitive-indefinite-singular":"optoelectronice","dative-definite-genitive-singular":"optoelectronicei","dative-genitive-indefinite-plural":"optoelectronice","dative-definite-genitive-plural":"optoelectronicelor","singular-vocative":"optoelectronică","plural-vocative":"optoelectronicelor"}},{"word":"optoizolator","pos":"noun","definitions":["optoisolator"],"forms":{"plural":"optoizolatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"optoizolator","accusative-definite-nominative-singular":"optoizolatorul","accusative-indefinite-nominative-plural":"optoizolatoare","accusative-definite-nominative-plural":"optoizolatoarele","dative-genitive-indefinite-singular":"optoizolator","dative-definite-genitive-singular":"optoizolatorului","dative-genitive-indefinite-plural":"optoizolatoare","dative-definite-genitive-plural":"optoizolatoarelor","singular-vocative":"optoizolatorule","plural-vocative":"optoizolatoarelor"}},{"word":"optometric","pos":"adj","definitions":["optometric"],"forms":{"feminine-singular":"optometrică","masculine-plural":"optometrici","feminine-neuter-plural":"optometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"optometric","error-unrecognized-form-feminine-indefinite-singular":"optometrică","error-unrecognized-form-indefinite-masculine-plural":"optometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"optometrice","definite-error-unrecognized-form-masculine-neuter-singular":"optometricul","definite-error-unrecognized-form-feminine-singular":"optometrica","definite-error-unrecognized-form-masculine-plural":"optometricii","definite-error-unrecognized-form-feminine-neuter-plural":"optometricele"}},{"word":"optometrie","pos":"noun","definitions":["optometry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"optometrie","accusative-definite-nominative":"optometria","dative-genitive-indefinite":"optometrii","dative-definite-genitive":"optometriei","vocative":"optometrie"}},{"word":"optometru","pos":"noun","definitions":["optometer"],"forms":{"plural":"optometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"optometru","accusative-definite-nominative-singular":"optometrul","accusative-indefinite-nominative-plural":"optometre","accusative-definite-nominative-plural":"optometrele","dative-genitive-indefinite-singular":"optometru","dative-definite-genitive-singular":"optometrului","dative-genitive-indefinite-plural":"optometre","dative-definite-genitive-plural":"optometrelor","singular-vocative":"optometrule","plural-vocative":"optometrelor"}},{"word":"optșpe","pos":"num","definitions":["clipping of optsprezece (“eighteen”)"],"pronunciation":"/ˈopt.ʃpe/"},{"word":"optșpea","pos":"adj","definitions":["eighteenth"],"pronunciation":"/ˈopt.ʃpe̯a/","gender":"f","forms":{"canonical-feminine":"a optșpea","masculine":"al optșpelea"}},{"word":"optșpelea","pos":"adj","definitions":["eighteenth"],"pronunciation":"/ˈopt.ʃpe.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al optșpelea","feminine":"a optșpea"}},{"word":"optsprezece","pos":"num","definitions":["eighteen"],"pronunciation":"/ˈopt.spreˌze.t͡ʃe/","forms":{"alternative-informal":"optșpe"}},{"word":"optsprezecea","pos":"adj","definitions":["eighteenth"],"pronunciation":"/ˈopt.spreˌze.t͡ʃe̯a/","gender":"f","forms":{"canonical-feminine":"a optsprezecea","masculine":"al optsprezecelea"}},{"word":"optsprezecelea","pos":"adj","definitions":["eighteenth"],"pronunciation":"/ˈopt.spreˌze.t͡ʃe.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al optsprezecelea","feminine":"a optsprezecea"}},{"word":"optulea","pos":"adj","definitions":["eighth"],"pronunciation":"/ˈop.tu.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al optulea","feminine":"a opta"}},{"word":"optzecea","pos":"adj","definitions":["eightieth"],"pronunciation":"/optˈze.t͡ʃe̯a/","gender":"f","forms":{"canonical-feminine":"a optzecea","masculine":"al optzecilea"}},{"word":"optzeci","pos":"num","definitions":["eighty"],"pronunciation":"/optˈzet͡ʃʲ/"},{"word":"optzeci și cincea","pos":"adj","definitions":["eighty-fifth"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈt͡ʃin.t͡ʃe̯a/","gender":"f","forms":{"canonical-feminine":"a optzeci și cincea","masculine":"al optzeci și cincilea"}},{"word":"optzeci și cinci","pos":"num","definitions":["eighty-five"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈt͡ʃint͡ʃʲ/"},{"word":"optzeci și cincilea","pos":"adj","definitions":["eighty-fifth"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈt͡ʃin.t͡ʃi.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al optzeci și cincilea","feminine":"a optzeci și cincea"}},{"word":"optzeci și doi","pos":"num","definitions":["eighty-two"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈdoj/","gender":"m"},{"word":"optzeci și doilea","pos":"adj","definitions":["eighty-second"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈdoj.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al optzeci și doilea","feminine":"a optzeci și doua"}},{"word":"optzeci și doua","pos":"adj","definitions":["eighty-second"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈdo.wa/","gender":"f","forms":{"canonical-feminine":"a optzeci și doua","masculine":"al optzeci și doilea"}},{"word":"optzeci și două","pos":"num","definitions":["eighty-two"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈdo.wə/","gender":"f","forms":{"canonical-neuter":"optzeci și două f &"}},{"word":"optzeci și noua","pos":"adj","definitions":["eighty-ninth"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈno.wa/","gender":"f","forms":{"canonical-feminine":"a optzeci și noua","masculine":"al optzeci și nouălea"}},{"word":"optzeci și nouă","pos":"num","definitions":["eighty-nine"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈno.wə/"},{"word":"optzeci și nouălea","pos":"adj","definitions":["eighty-ninth"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈno.wə.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al optzeci și nouălea","feminine":"a optzeci și noua"}},{"word":"optzeci și opt","pos":"num","definitions":["eighty-eight"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈopt/"},{"word":"optzeci și opta","pos":"adj","definitions":["eighty-eighth"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈop.ta/","gender":"f","forms":{"canonical-feminine":"a optzeci și opta","masculine":"al optzeci și optulea"}},{"word":"optzeci și optulea","pos":"adj","definitions":["eighty-eighth"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈop.tu.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al optzeci și optulea","feminine":"a optzeci și opta"}},{"word":"optzeci și patra","pos":"adj","definitions":["eighty-fourth"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈpa.tra/","gender":"f","forms":{"canonical-feminine":"a optzeci și patra","masculine":"al optzeci și patrulea"}},{"word":"optzeci și patru","pos":"num","definitions":["eighty-four"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈpa.tru/"},{"word":"optzeci și patrulea","pos":"adj","definitions":["eighty-fourth"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈpa.tru.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al optzeci și patrulea","feminine":"a optzeci și patra"}},{"word":"optzeci și șapte","pos":"num","definitions":["eighty-seven"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈʃap.te/"},{"word":"optzeci și șaptea","pos":"adj","definitions":["eighty-seventh"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈʃap.te̯a/","gender":"f","forms":{"canonical-feminine":"a optzeci și șaptea","masculine":"al optzeci și șaptelea"}},{"word":"optzeci și șaptelea","pos":"adj","definitions":["eighty-seventh"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈʃap.te.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al optzeci și șaptelea","feminine":"a optzeci și șaptea"}},{"word":"optzeci și șase","pos":"num","definitions":["eighty-six"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈʃa.se/"},{"word":"optzeci și șasea","pos":"adj","definitions":["eighty-sixth"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈʃa.se̯a/","gender":"f","forms":{"canonical-feminine":"a optzeci și șasea","masculine":"al optzeci și șaselea"}},{"word":"optzeci și șaselea","pos":"adj","definitions":["eighty-sixth"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈʃa.se.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al optzeci și șaselea","feminine":"a optzeci și șasea"}},{"word":"optzeci și trei","pos":"num","definitions":["eighty-three"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈtrej/"},{"word":"optzeci și treia","pos":"adj","definitions":["eighty-third"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈtreja/","gender":"f","forms":{"canonical-feminine":"a optzeci și treia","masculine":"al optzeci și treilea"}},{"word":"optzeci și treilea","pos":"adj","definitions":["eighty-third"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈtrej.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al optzeci și treilea","feminine":"a optzeci și treia"}},{"word":"optzeci și una","pos":"num","definitions":["eighty-one"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈu.na/","forms":{"canonical-neuter":"optzeci și una f &"}},{"word":"optzeci și una","pos":"adj","definitions":["eighty-first"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈu.na/","gender":"f","forms":{"canonical-feminine":"a optzeci și una","masculine":"al optzeci și unulea"}},{"word":"optzeci și unu","pos":"num","definitions":["eighty-one"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈu.nu/","gender":"m"},{"word":"optzeci și unulea","pos":"adj","definitions":["eighty-first"],"pronunciation":"/ˌopt.zet͡ʃʲ ʃi ˈu.nu.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al optzeci și unulea","feminine":"a optzeci și una"}},{"word":"optzecilea","pos":"adj","definitions":["eightieth"],"pronunciation":"/optˈze.t͡ʃi.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al optzecilea","feminine":"a optzecea"}},{"word":"optzecist","pos":"adj","definitions":["related to the literature of the 1980s"],"forms":{"feminine-singular":"optzecistă","masculine-plural":"optzeciști","feminine-neuter-plural":"optzeciste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"optzecist","error-unrecognized-form-feminine-indefinite-singular":"optzecistă","error-unrecognized-form-indefinite-masculine-plural":"optzeciști","error-unrecognized-form-feminine-indefinite-neuter-plural":"optzeciste","definite-error-unrecognized-form-masculine-neuter-singular":"optzecistul","definite-error-unrecognized-form-feminine-singular":"optzecista","definite-error-unrecognized-form-masculine-plural":"optzeciștii","definite-error-unrecognized-form-feminine-neuter-plural":"optzecistele"}},{"word":"optzecist","pos":"noun","definitions":["writer of the 1980s generation"],"forms":{"plural":"optzeciști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"optzecist","accusative-definite-nominative-singular":"optzecistul","accusative-indefinite-nominative-plural":"optzeciști","accusative-definite-nominative-plural":"optzeciștii","dative-genitive-indefinite-singular":"optzecist","dative-definite-genitive-singular":"optzecistului","dative-genitive-indefinite-plural":"optzeciști","dative-definite-genitive-plural":"optzeciștilor","singular-vocative":"optzecistule","plural-vocative":"optzeciștilor"}},{"word":"optzecistă","pos":"noun","definitions":["female equivalent of optzecist"],"forms":{"plural":"optzeciste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"optzecistă","accusative-definite-nominative-singular":"optzecista","accusative-indefinite-nominative-plural":"optzeciste","accusative-definite-nominative-plural":"optzecistele","dative-genitive-indefinite-singular":"optzeciste","dative-definite-genitive-singular":"optzecistei","dative-genitive-indefinite-plural":"optzeciste","dative-definite-genitive-plural":"optzecistelor","singular-vocative":"optzecistă","plural-vocative":"optzecistelor"}},{"word":"opulent","pos":"adj","definitions":["opulent"],"forms":{"feminine-singular":"opulentă","masculine-plural":"opulenți","feminine-neuter-plural":"opulente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"opulent","error-unrecognized-form-feminine-indefinite-singular":"opulentă","error-unrecognized-form-indefinite-masculine-plural":"opulenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"opulente","definite-error-unrecognized-form-masculine-neuter-singular":"opulentul","definite-error-unrecognized-form-feminine-singular":"opulenta","definite-error-unrecognized-form-masculine-plural":"opulenții","definite-error-unrecognized-form-feminine-neuter-plural":"opulentele"}},{"word":"opulență","pos":"noun","definitions":["opulence"],"forms":{"plural":"opulențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"opulență","accusative-definite-nominative-singular":"opulența","accusative-indefinite-nominative-plural":"opulențe","accusative-definite-nominative-plural":"opulențele","dative-genitive-indefinite-singular":"opulențe","dative-definite-genitive-singular":"opulenței","dative-genitive-indefinite-plural":"opulențe","dative-definite-genitive-plural":"opulențelor","singular-vocative":"opulență","plural-vocative":"opulențelor"}},{"word":"opune","pos":"verb","definitions":["to oppose"],"forms":{"canonical":"a opune 3rd conjugation","present-singular-third-person":"opune","participle-past":"opus","subjunctive-third-person":"opună"}},{"word":"opunere","pos":"noun","definitions":["opposition"],"forms":{"plural":"opuneri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"opunere","accusative-definite-nominative-singular":"opunerea","accusative-indefinite-nominative-plural":"opuneri","accusative-definite-nominative-plural":"opunerile","dative-genitive-indefinite-singular":"opuneri","dative-definite-genitive-singular":"opunerii","dative-genitive-indefinite-plural":"opuneri","dative-definite-genitive-plural":"opunerilor","singular-vocative":"opunere","plural-vocative":"opunerilor"}},{"word":"opunția","pos":"noun","definitions":["opuntia (flower)"],"forms":{"plural":"opunția"}},{"word":"opus","pos":"adj","definitions":["opposite, contrary","reverse"],"pronunciation":"/oˈpus/","forms":{"feminine-singular":"opusă","masculine-plural":"opuși","feminine-neuter-plural":"opuse","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"opus","error-unrecognized-form-feminine-indefinite-singular":"opusă","error-unrecognized-form-indefinite-masculine-plural":"opuși","error-unrecognized-form-feminine-indefinite-neuter-plural":"opuse","definite-error-unrecognized-form-masculine-neuter-singular":"opusul","definite-error-unrecognized-form-feminine-singular":"opusa","definite-error-unrecognized-form-masculine-plural":"opușii","definite-error-unrecognized-form-feminine-neuter-plural":"opusele"}},{"word":"opus","pos":"noun","definitions":["the opposite, contrary","reverse"],"pronunciation":"/oˈpus/"},{"word":"opus","pos":"verb","definitions":["past participle of opune"],"pronunciation":"/oˈpus/"},{"word":"opus","pos":"noun","definitions":["opus, musical composition or work"],"pronunciation":"/ˈo.pus/","forms":{"plural":"opusuri"}},{"word":"opuscul","pos":"noun","definitions":["opusculum"],"forms":{"plural":"opuscule","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"opuscul","accusative-definite-nominative-singular":"opusculul","accusative-indefinite-nominative-plural":"opuscule","accusative-definite-nominative-plural":"opusculele","dative-genitive-indefinite-singular":"opuscul","dative-definite-genitive-singular":"opusculului","dative-genitive-indefinite-plural":"opuscule","dative-definite-genitive-plural":"opusculelor","singular-vocative":"opusculule","plural-vocative":"opusculelor"}},{"word":"opust","pos":"noun","definitions":["dam"],"forms":{"plural":"opusturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"opust","accusative-definite-nominative-singular":"opustul","accusative-indefinite-nominative-plural":"opusturi","accusative-definite-nominative-plural":"opusturile","dative-genitive-indefinite-singular":"opust","dative-definite-genitive-singular":"opustului","dative-genitive-indefinite-plural":"opusturi","dative-definite-genitive-plural":"opusturilor","singular-vocative":"opustule","plural-vocative":"opusturilor"}},{"word":"or","pos":"verb","definitions":["might"],"pronunciation":"[or]","examples":[{"ro":"fiindcă or avea ceva pe care noi nu-l avem, va trebui să așteptăm puțin","en":"being that they might have something that we don't, we will need to wait a bit"}]},{"word":"or","pos":"verb","definitions":["Variation of o in the third person plural."],"pronunciation":"[or]","examples":[{"ro":"Or să vină într-un minut.","en":"They will come in a minute."}]},{"word":"or","pos":"adv","definitions":["alternative form of ori"],"pronunciation":"[or]"},{"word":"ora","pos":"noun","definitions":["definite nominative/accusative singular of oră"],"pronunciation":"/ˈo.ra/"},{"word":"oră","pos":"noun","definitions":["hour","class"],"examples":[{"ro":"În fiecare zi orele încep la nouă.","en":"Classes start at nine o'clock every day."}],"forms":{"plural":"ore","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oră","accusative-definite-nominative-singular":"ora","accusative-indefinite-nominative-plural":"ore","accusative-definite-nominative-plural":"orele","dative-genitive-indefinite-singular":"ore","dative-definite-genitive-singular":"orei","dative-genitive-indefinite-plural":"ore","dative-definite-genitive-plural":"orelor","singular-vocative":"oră","plural-vocative":"orelor"}},{"word":"oră de închidere","pos":"noun","definitions":["closing time"]},{"word":"oră de vară","pos":"noun","definitions":["summer time, daylight saving time"]},{"word":"oră de vârf","pos":"noun","definitions":["rush hour, peak hour"],"forms":{"plural":"ore de vârf"}},{"word":"ora H","pos":"noun","definitions":["H-hour"]},{"word":"oră siderală","pos":"noun","definitions":["sidereal time"]},{"word":"Orac","pos":"name","definitions":["a village in Orac, Leova Raion, Moldova","a commune of Leova Raion, Moldova"],"gender":"m"},{"word":"orac","pos":"intj","definitions":["ribbit; a sound of a frog"]},{"word":"orăcăi","pos":"verb","definitions":["to croak"],"forms":{"canonical":"a orăcăi 4th conjugation","present-singular-third-person":"orăcăie","participle-past":"orăcăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a orăcăi","gerund":"orăcăind","first-person-indicative-present-singular":"orăcăi","indicative-present-second-person-singular":"orăcăi","indicative-present-singular-third-person":"orăcăie","first-person-indicative-plural-present":"orăcăim","indicative-plural-present-second-person":"orăcăiți","indicative-plural-present-third-person":"orăcăie","first-person-imperfect-indicative-singular":"orăcăiam","imperfect-indicative-second-person-singular":"orăcăiai","imperfect-indicative-singular-third-person":"orăcăia","first-person-imperfect-indicative-plural":"orăcăiam","imperfect-indicative-plural-second-person":"orăcăiați","imperfect-indicative-plural-third-person":"orăcăiau","first-person-indicative-perfect-singular":"orăcăii","indicative-perfect-second-person-singular":"orăcăiși","indicative-perfect-singular-third-person":"orăcăi","first-person-indicative-perfect-plural":"orăcăirăm","indicative-perfect-plural-second-person":"orăcăirăți","indicative-perfect-plural-third-person":"orăcăiră","first-person-indicative-pluperfect-singular":"orăcăisem","indicative-pluperfect-second-person-singular":"orăcăiseși","indicative-pluperfect-singular-third-person":"orăcăise","first-person-indicative-pluperfect-plural":"orăcăiserăm","indicative-pluperfect-plural-second-person":"orăcăiserăți","indicative-pluperfect-plural-third-person":"orăcăiseră","first-person-present-singular-subjunctive":"să orăcăi","present-second-person-singular-subjunctive":"să orăcăi","present-singular-subjunctive-third-person":"să orăcăie","first-person-plural-present-subjunctive":"să orăcăim","plural-present-second-person-subjunctive":"să orăcăiți","plural-present-subjunctive-third-person":"să orăcăie","imperative-second-person-singular":"orăcăie","imperative-plural-second-person":"orăcăiți","imperative-negative-second-person-singular":"nu orăcăi","imperative-negative-plural-second-person":"nu orăcăiți"}},{"word":"orăcăială","pos":"noun","definitions":["croaking"],"forms":{"plural":"orăcăieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orăcăială","accusative-definite-nominative-singular":"orăcăiala","accusative-indefinite-nominative-plural":"orăcăiele","accusative-definite-nominative-plural":"orăcăielele","dative-genitive-indefinite-singular":"orăcăiele","dative-definite-genitive-singular":"orăcăielei","dative-genitive-indefinite-plural":"orăcăiele","dative-definite-genitive-plural":"orăcăielelor","singular-vocative":"orăcăială","plural-vocative":"orăcăielelor"}},{"word":"orăcăire","pos":"noun","definitions":["croaking"],"forms":{"plural":"orăcăiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"orăcăire","accusative-definite-nominative-singular":"orăcăirea","accusative-indefinite-nominative-plural":"orăcăiri","accusative-definite-nominative-plural":"orăcăirile","dative-genitive-indefinite-singular":"orăcăiri","dative-definite-genitive-singular":"orăcăirii","dative-genitive-indefinite-plural":"orăcăiri","dative-definite-genitive-plural":"orăcăirilor","singular-vocative":"orăcăire","plural-vocative":"orăcăirilor"}},{"word":"orăcăit","pos":"noun","definitions":["croaking"],"forms":{"plural":"orăcăituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"orăcăit","accusative-definite-nominative-singular":"orăcăitul","accusative-indefinite-nominative-plural":"orăcăituri","accusative-definite-nominative-plural":"orăcăiturile","dative-genitive-indefinite-singular":"orăcăit","dative-definite-genitive-singular":"orăcăitului","dative-genitive-indefinite-plural":"orăcăituri","dative-definite-genitive-plural":"orăcăiturilor","singular-vocative":"orăcăitule","plural-vocative":"orăcăiturilor"}},{"word":"orăcăit","pos":"verb","definitions":["past participle of orăcăi"],"forms":{"participle-past":"of orăcăi"}},{"word":"oracciu","pos":"noun","definitions":["reaper"],"forms":{"plural":"oraccii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oracciu","accusative-definite-nominative-singular":"oracciuul","accusative-indefinite-nominative-plural":"oraccii","accusative-definite-nominative-plural":"oracciii","dative-genitive-indefinite-singular":"oracciu","dative-definite-genitive-singular":"oracciuului","dative-genitive-indefinite-plural":"oraccii","dative-definite-genitive-plural":"oracciilor","singular-vocative":"oracciuule","plural-vocative":"oracciilor"}},{"word":"oracol","pos":"noun","definitions":["oracle"],"forms":{"plural":"oracole","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oracol","accusative-definite-nominative-singular":"oracolul","accusative-indefinite-nominative-plural":"oracole","accusative-definite-nominative-plural":"oracolele","dative-genitive-indefinite-singular":"oracol","dative-definite-genitive-singular":"oracolului","dative-genitive-indefinite-plural":"oracole","dative-definite-genitive-plural":"oracolelor","singular-vocative":"oracolule","plural-vocative":"oracolelor"}},{"word":"oracul","pos":"noun","definitions":["alternative form of oracol"],"forms":{"plural":"oracule","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oracul","accusative-definite-nominative-singular":"oraculul","accusative-indefinite-nominative-plural":"oracule","accusative-definite-nominative-plural":"oraculele","dative-genitive-indefinite-singular":"oracul","dative-definite-genitive-singular":"oraculului","dative-genitive-indefinite-plural":"oracule","dative-definite-genitive-plural":"oraculelor","singular-vocative":"oraculule","plural-vocative":"oraculelor"}},{"word":"oracular","pos":"adj","definitions":["oracular"],"forms":{"feminine-singular":"oraculară","masculine-plural":"oraculari","feminine-neuter-plural":"oraculare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oracular","error-unrecognized-form-feminine-indefinite-singular":"oraculară","error-unrecognized-form-indefinite-masculine-plural":"oraculari","error-unrecognized-form-feminine-indefinite-neuter-plural":"oraculare","definite-error-unrecognized-form-masculine-neuter-singular":"oracularul","definite-error-unrecognized-form-feminine-singular":"oraculara","definite-error-unrecognized-form-masculine-plural":"oracularii","definite-error-unrecognized-form-feminine-neuter-plural":"oracularele"}},{"word":"Oradea","pos":"name","definitions":["a city in Bihor County, Romania"],"pronunciation":"/oˈrade̯a/","gender":"f"},{"word":"orădean","pos":"noun","definitions":["native or inhabitant of the city of Oradea, Bihor County, Romania (usually male)"],"forms":{"plural":"orădeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orădean","accusative-definite-nominative-singular":"orădeanul","accusative-indefinite-nominative-plural":"orădeni","accusative-definite-nominative-plural":"orădenii","dative-genitive-indefinite-singular":"orădean","dative-definite-genitive-singular":"orădeanului","dative-genitive-indefinite-plural":"orădeni","dative-definite-genitive-plural":"orădenilor","singular-vocative":"orădeanule","plural-vocative":"orădenilor"}},{"word":"orădeană","pos":"noun","definitions":["female equivalent of orădean"],"forms":{"plural":"orădene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orădeană","accusative-definite-nominative-singular":"orădeana","accusative-indefinite-nominative-plural":"orădene","accusative-definite-nominative-plural":"orădenele","dative-genitive-indefinite-singular":"orădene","dative-definite-genitive-singular":"orădenei","dative-genitive-indefinite-plural":"orădene","dative-definite-genitive-plural":"orădenelor","singular-vocative":"orădeană","plural-vocative":"orădenelor"}},{"word":"orădeancă","pos":"noun","definitions":["female equivalent of orădean"],"forms":{"plural":"orădence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orădeancă","accusative-definite-nominative-singular":"orădeanca","accusative-indefinite-nominative-plural":"orădence","accusative-definite-nominative-plural":"orădencele","dative-genitive-indefinite-singular":"orădence","dative-definite-genitive-singular":"orădencei","dative-genitive-indefinite-plural":"orădence","dative-definite-genitive-plural":"orădencelor","singular-vocative":"orădeancă","plural-vocative":"orădencelor"}},{"word":"oraj","pos":"noun","definitions":["thunderstorm"],"forms":{"plural":"oraje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oraj","accusative-definite-nominative-singular":"orajul","accusative-indefinite-nominative-plural":"oraje","accusative-definite-nominative-plural":"orajele","dative-genitive-indefinite-singular":"oraj","dative-definite-genitive-singular":"orajului","dative-genitive-indefinite-plural":"oraje","dative-definite-genitive-plural":"orajelor","singular-vocative":"orajule","plural-vocative":"orajelor"}},{"word":"orajos","pos":"adj","definitions":["stormy"],"forms":{"feminine-singular":"orajoasă","masculine-plural":"orajoși","feminine-neuter-plural":"orajoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orajos","error-unrecognized-form-feminine-indefinite-singular":"orajoasă","error-unrecognized-form-indefinite-masculine-plural":"orajoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"orajoase","definite-error-unrecognized-form-masculine-neuter-singular":"orajosul","definite-error-unrecognized-form-feminine-singular":"orajoasa","definite-error-unrecognized-form-masculine-plural":"orajoșii","definite-error-unrecognized-form-feminine-neuter-plural":"orajoasele"}},{"word":"oral","pos":"adj","definitions":["oral"],"forms":{"feminine-singular":"orală","masculine-plural":"orali","feminine-neuter-plural":"orale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oral","error-unrecognized-form-feminine-indefinite-singular":"orală","error-unrecognized-form-indefinite-masculine-plural":"orali","error-unrecognized-form-feminine-indefinite-neuter-plural":"orale","definite-error-unrecognized-form-masculine-neuter-singular":"oralul","definite-error-unrecognized-form-feminine-singular":"orala","definite-error-unrecognized-form-masculine-plural":"oralii","definite-error-unrecognized-form-feminine-neuter-plural":"oralele"}},{"word":"oralitate","pos":"noun","definitions":["orality"],"pronunciation":"/o.ra.liˈta.te/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"oralitate","accusative-definite-nominative":"oralitatea","dative-genitive-indefinite":"oralități","dative-definite-genitive":"oralității","vocative":"oralitate"}},{"word":"orând","pos":"noun","definitions":["alternative form of orândă"],"forms":{"plural":"orânzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orând","accusative-definite-nominative-singular":"orândul","accusative-indefinite-nominative-plural":"orânzi","accusative-definite-nominative-plural":"orânzii","dative-genitive-indefinite-singular":"orând","dative-definite-genitive-singular":"orândului","dative-genitive-indefinite-plural":"orânzi","dative-definite-genitive-plural":"orânzilor","singular-vocative":"orândule","plural-vocative":"orânzilor"}},{"word":"orândă","pos":"noun","definitions":["rural tavern leased from the owner of the estate","lease"],"forms":{"plural":"orânzi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orândă","accusative-definite-nominative-singular":"orânda","accusative-indefinite-nominative-plural":"orânze","accusative-definite-nominative-plural":"orânzele","dative-genitive-indefinite-singular":"orânze","dative-definite-genitive-singular":"orânzei","dative-genitive-indefinite-plural":"orânze","dative-definite-genitive-plural":"orânzelor","singular-vocative":"orândă","plural-vocative":"orânzelor"}},{"word":"orândăluire","pos":"noun","definitions":["lease"],"forms":{"plural":"orândăluiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"orândăluire","accusative-definite-nominative-singular":"orândăluirea","accusative-indefinite-nominative-plural":"orândăluiri","accusative-definite-nominative-plural":"orândăluirile","dative-genitive-indefinite-singular":"orândăluiri","dative-definite-genitive-singular":"orândăluirii","dative-genitive-indefinite-plural":"orândăluiri","dative-definite-genitive-plural":"orândăluirilor","singular-vocative":"orândăluire","plural-vocative":"orândăluirilor"}},{"word":"orândar","pos":"noun","definitions":["tavernkeeper"],"forms":{"plural":"orândari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orândar","accusative-definite-nominative-singular":"orândarul","accusative-indefinite-nominative-plural":"orândari","accusative-definite-nominative-plural":"orândarii","dative-genitive-indefinite-singular":"orândar","dative-definite-genitive-singular":"orândarului","dative-genitive-indefinite-plural":"orândari","dative-definite-genitive-plural":"orândarilor","singular-vocative":"orândarule","plural-vocative":"orândarilor"}},{"word":"orândaș","pos":"noun","definitions":["tenant"],"forms":{"plural":"orândași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orândaș","accusative-definite-nominative-singular":"orândașul","accusative-indefinite-nominative-plural":"orândași","accusative-definite-nominative-plural":"orândașii","dative-genitive-indefinite-singular":"orândaș","dative-definite-genitive-singular":"orândașului","dative-genitive-indefinite-plural":"orândași","dative-definite-genitive-plural":"orândașilor","singular-vocative":"orândașule","plural-vocative":"orândașilor"}},{"word":"orândui","pos":"verb","definitions":["to establish"],"forms":{"canonical":"a orândui 4th conjugation","present-singular-third-person":"orânduiește","participle-past":"orânduit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a orândui","gerund":"orânduind","first-person-indicative-present-singular":"orânduiesc","indicative-present-second-person-singular":"orânduiești","indicative-present-singular-third-person":"orânduiește","first-person-indicative-plural-present":"orânduim","indicative-plural-present-second-person":"orânduiți","indicative-plural-present-third-person":"orânduiesc","first-person-imperfect-indicative-singular":"orânduiam","imperfect-indicative-second-person-singular":"orânduiai","imperfect-indicative-singular-third-person":"orânduia","first-person-imperfect-indicative-plural":"orânduiam","imperfect-indicative-plural-second-person":"orânduiați","imperfect-indicative-plural-third-person":"orânduiau","first-person-indicative-perfect-singular":"orânduii","indicative-perfect-second-person-singular":"orânduiși","indicative-perfect-singular-third-person":"orândui","first-person-indicative-perfect-plural":"orânduirăm","indicative-perfect-plural-second-person":"orânduirăți","indicative-perfect-plural-third-person":"orânduiră","first-person-indicative-pluperfect-singular":"orânduisem","indicative-pluperfect-second-person-singular":"orânduiseși","indicative-pluperfect-singular-third-person":"orânduise","first-person-indicative-pluperfect-plural":"orânduiserăm","indicative-pluperfect-plural-second-person":"orânduiserăți","indicative-pluperfect-plural-third-person":"orânduiseră","first-person-present-singular-subjunctive":"să orânduiesc","present-second-person-singular-subjunctive":"să orânduiești","present-singular-subjunctive-third-person":"să orânduiască","first-person-plural-present-subjunctive":"să orânduim","plural-present-second-person-subjunctive":"să orânduiți","plural-present-subjunctive-third-person":"să orânduiască","imperative-second-person-singular":"orânduiește","imperative-plural-second-person":"orânduiți","imperative-negative-second-person-singular":"nu orândui","imperative-negative-plural-second-person":"nu orânduiți"}},{"word":"orânduială","pos":"noun","definitions":["social order"],"forms":{"plural":"orânduieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orânduială","accusative-definite-nominative-singular":"orânduiala","accusative-indefinite-nominative-plural":"orânduiele","accusative-definite-nominative-plural":"orânduielele","dative-genitive-indefinite-singular":"orânduiele","dative-definite-genitive-singular":"orânduielei","dative-genitive-indefinite-plural":"orânduiele","dative-definite-genitive-plural":"orânduielelor","singular-vocative":"orânduială","plural-vocative":"orânduielelor"}},{"word":"orânduire","pos":"noun","definitions":["organization of the society"],"forms":{"plural":"orânduiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"orânduire","accusative-definite-nominative-singular":"orânduirea","accusative-indefinite-nominative-plural":"orânduiri","accusative-definite-nominative-plural":"orânduirile","dative-genitive-indefinite-singular":"orânduiri","dative-definite-genitive-singular":"orânduirii","dative-genitive-indefinite-plural":"orânduiri","dative-definite-genitive-plural":"orânduirilor","singular-vocative":"orânduire","plural-vocative":"orânduirilor"}},{"word":"orânduire feudală","pos":"noun","definitions":["feudal system"]},{"word":"orânduit","pos":"adj","definitions":["ordered"],"forms":{"feminine-singular":"orânduită","masculine-plural":"orânduiți","feminine-neuter-plural":"orânduite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orânduit","error-unrecognized-form-feminine-indefinite-singular":"orânduită","error-unrecognized-form-indefinite-masculine-plural":"orânduiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"orânduite","definite-error-unrecognized-form-masculine-neuter-singular":"orânduitul","definite-error-unrecognized-form-feminine-singular":"orânduita","definite-error-unrecognized-form-masculine-plural":"orânduiții","definite-error-unrecognized-form-feminine-neuter-plural":"orânduitele"}},{"word":"orânduit","pos":"verb","definitions":["past participle of orândui"],"forms":{"participle-past":"of orândui"}},{"word":"orânduitoare","pos":"noun","definitions":["female equivalent of orânduitor"],"forms":{"plural":"orânduitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"orânduitoare","accusative-definite-nominative-singular":"orânduitoarea","accusative-indefinite-nominative-plural":"orânduitoare","accusative-definite-nominative-plural":"orânduitoarele","dative-genitive-indefinite-singular":"orânduitoare","dative-definite-genitive-singular":"orânduitoarei","dative-genitive-indefinite-plural":"orânduitoare","dative-definite-genitive-plural":"orânduitoarelor","singular-vocative":"orânduitoare","plural-vocative":"orânduitoarelor"}},{"word":"orânduitor","pos":"noun","definitions":["organizer"],"forms":{"plural":"orânduitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orânduitor","accusative-definite-nominative-singular":"orânduitorul","accusative-indefinite-nominative-plural":"orânduitori","accusative-definite-nominative-plural":"orânduitorii","dative-genitive-indefinite-singular":"orânduitor","dative-definite-genitive-singular":"orânduitorului","dative-genitive-indefinite-plural":"orânduitori","dative-definite-genitive-plural":"orânduitorilor","singular-vocative":"orânduitorule","plural-vocative":"orânduitorilor"}},{"word":"orangerie","pos":"noun","definitions":["alternative form of oranjerie"],"forms":{"plural":"orangerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"orangerie","accusative-definite-nominative-singular":"orangeria","accusative-indefinite-nominative-plural":"orangerii","accusative-definite-nominative-plural":"orangeriile","dative-genitive-indefinite-singular":"orangerii","dative-definite-genitive-singular":"orangeriei","dative-genitive-indefinite-plural":"orangerii","dative-definite-genitive-plural":"orangeriilor","singular-vocative":"orangerie","plural-vocative":"orangeriilor"}},{"word":"orangutan","pos":"noun","definitions":["alternative form of urangutan"],"forms":{"plural":"orangutani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orangutan","accusative-definite-nominative-singular":"orangutanul","accusative-indefinite-nominative-plural":"orangutani","accusative-definite-nominative-plural":"orangutanii","dative-genitive-indefinite-singular":"orangutan","dative-definite-genitive-singular":"orangutanului","dative-genitive-indefinite-plural":"orangutani","dative-definite-genitive-plural":"orangutanilor","singular-vocative":"orangutanule","plural-vocative":"orangutanilor"}},{"word":"oranist","pos":"noun","definitions":["alternative form of uranisc"],"forms":{"plural":"oranisturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"oranist","accusative-definite-nominative-singular":"oranistul","accusative-indefinite-nominative-plural":"oranisturi","accusative-definite-nominative-plural":"oranisturile","dative-genitive-indefinite-singular":"oranist","dative-definite-genitive-singular":"oranistului","dative-genitive-indefinite-plural":"oranisturi","dative-definite-genitive-plural":"oranisturilor","singular-vocative":"oranistule","plural-vocative":"oranisturilor"}},{"word":"oranj","pos":"adj","definitions":["orange"],"pronunciation":"/oˈranʒ/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oranj","error-unrecognized-form-feminine-indefinite-singular":"oranj","error-unrecognized-form-indefinite-masculine-plural":"oranj","error-unrecognized-form-feminine-indefinite-neuter-plural":"oranj","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"oranjadă","pos":"noun","definitions":["orange juice"],"forms":{"plural":"oranjade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oranjadă","accusative-definite-nominative-singular":"oranjada","accusative-indefinite-nominative-plural":"oranjade","accusative-definite-nominative-plural":"oranjadele","dative-genitive-indefinite-singular":"oranjade","dative-definite-genitive-singular":"oranjadei","dative-genitive-indefinite-plural":"oranjade","dative-definite-genitive-plural":"oranjadelor","singular-vocative":"oranjadă","plural-vocative":"oranjadelor"}},{"word":"oranjerie","pos":"noun","definitions":["orangery"],"forms":{"plural":"oranjerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oranjerie","accusative-definite-nominative-singular":"oranjeria","accusative-indefinite-nominative-plural":"oranjerii","accusative-definite-nominative-plural":"oranjeriile","dative-genitive-indefinite-singular":"oranjerii","dative-definite-genitive-singular":"oranjeriei","dative-genitive-indefinite-plural":"oranjerii","dative-definite-genitive-plural":"oranjeriilor","singular-vocative":"oranjerie","plural-vocative":"oranjeriilor"}},{"word":"oranz","pos":"noun","definitions":["orange tree"],"forms":{"plural":"oranzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oranz","accusative-definite-nominative-singular":"oranzul","accusative-indefinite-nominative-plural":"oranzi","accusative-definite-nominative-plural":"oranzii","dative-genitive-indefinite-singular":"oranz","dative-definite-genitive-singular":"oranzului","dative-genitive-indefinite-plural":"oranzi","dative-definite-genitive-plural":"oranzilor","singular-vocative":"oranzule","plural-vocative":"oranzilor"}},{"word":"orar","pos":"adj","definitions":["hourly"],"forms":{"feminine-singular":"orară","masculine-plural":"orari","feminine-neuter-plural":"orare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orar","error-unrecognized-form-feminine-indefinite-singular":"orară","error-unrecognized-form-indefinite-masculine-plural":"orari","error-unrecognized-form-feminine-indefinite-neuter-plural":"orare","definite-error-unrecognized-form-masculine-neuter-singular":"orarul","definite-error-unrecognized-form-feminine-singular":"orara","definite-error-unrecognized-form-masculine-plural":"orarii","definite-error-unrecognized-form-feminine-neuter-plural":"orarele"}},{"word":"oraș","pos":"noun","definitions":["city, town"],"pronunciation":"/oˈraʃ/","forms":{"plural":"orașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oraș","accusative-definite-nominative-singular":"orașul","accusative-indefinite-nominative-plural":"orașe","accusative-definite-nominative-plural":"orașele","dative-genitive-indefinite-singular":"oraș","dative-definite-genitive-singular":"orașului","dative-genitive-indefinite-plural":"orașe","dative-definite-genitive-plural":"orașelor","singular-vocative":"orașule","plural-vocative":"orașelor","alternative":"ораш"}},{"word":"oraș deschis","pos":"noun","definitions":["open city"],"forms":{"plural":"orașe deschise"}},{"word":"oraș universitar","pos":"noun","definitions":["college town"],"forms":{"plural":"orașe universitare"}},{"word":"Orășa","pos":"name","definitions":["a village in Livezi, Bacău County, Romania"],"gender":"f"},{"word":"Orășanul","pos":"name","definitions":["a river in Neamț County, Romania, tributary to the Sasca"],"gender":"m"},{"word":"orașe","pos":"noun","definitions":["plural of oraș"],"pronunciation":"/oˈra.ʃe/"},{"word":"Orășean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Orășean"}},{"word":"orășean","pos":"noun","definitions":["townsman"],"forms":{"plural":"orășeni","feminine":"equivalent orășeană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orășean","accusative-definite-nominative-singular":"orășeanul","accusative-indefinite-nominative-plural":"orășeni","accusative-definite-nominative-plural":"orășenii","dative-genitive-indefinite-singular":"orășean","dative-definite-genitive-singular":"orășeanului","dative-genitive-indefinite-plural":"orășeni","dative-definite-genitive-plural":"orășenilor","singular-vocative":"orășeanule","plural-vocative":"orășenilor"}},{"word":"orășeană","pos":"noun","definitions":["female equivalent of orășean"],"forms":{"plural":"orășene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orășeană","accusative-definite-nominative-singular":"orășeana","accusative-indefinite-nominative-plural":"orășene","accusative-definite-nominative-plural":"orășenele","dative-genitive-indefinite-singular":"orășene","dative-definite-genitive-singular":"orășenei","dative-genitive-indefinite-plural":"orășene","dative-definite-genitive-plural":"orășenelor","singular-vocative":"orășeană","plural-vocative":"orășenelor"}},{"word":"orășeancă","pos":"noun","definitions":["female equivalent of orășean"],"forms":{"plural":"orășence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orășeancă","accusative-definite-nominative-singular":"orășeanca","accusative-indefinite-nominative-plural":"orășeance","accusative-definite-nominative-plural":"orășeancele","dative-genitive-indefinite-singular":"orășeance","dative-definite-genitive-singular":"orășeancei","dative-genitive-indefinite-plural":"orășeance","dative-definite-genitive-plural":"orășeancelor","singular-vocative":"orășeancă","plural-vocative":"orășeancelor"}},{"word":"Orășeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Orășeanu"}},{"word":"Orășel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Orășel"}},{"word":"orășel","pos":"noun","definitions":["diminutive of oraș; small city"],"forms":{"plural":"orășele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"orășel","accusative-definite-nominative-singular":"orășelul","accusative-indefinite-nominative-plural":"orășele","accusative-definite-nominative-plural":"orășelele","dative-genitive-indefinite-singular":"orășel","dative-definite-genitive-singular":"orășelului","dative-genitive-indefinite-plural":"orășele","dative-definite-genitive-plural":"orășelelor","singular-vocative":"orășelule","plural-vocative":"orășelelor"}},{"word":"orașele","pos":"noun","definitions":["definite nominative/accusative plural of oraș"]},{"word":"orașelor","pos":"noun","definitions":["inflection of oraș:","definite genitive/dative plural","vocative plural"]},{"word":"orășenesc","pos":"adj","definitions":["urban"],"forms":{"feminine-singular":"orășenească","plural":"orășenești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orășenesc","error-unrecognized-form-feminine-indefinite-singular":"orășenească","error-unrecognized-form-indefinite-masculine-plural":"orășenești","error-unrecognized-form-feminine-indefinite-neuter-plural":"orășenești","definite-error-unrecognized-form-masculine-neuter-singular":"orășenescul","definite-error-unrecognized-form-feminine-singular":"orășeneasca","definite-error-unrecognized-form-masculine-plural":"orășeneștii","definite-error-unrecognized-form-feminine-neuter-plural":"orășeneștile"}},{"word":"orășenește","pos":"adv","definitions":["like a city dweller"]},{"word":"Orășeni","pos":"name","definitions":["a village in Mărtiniș, Harghita County, Romania"],"gender":"m"},{"word":"orășeni","pos":"noun","definitions":["plural of orășean"]},{"word":"Orășeni-Deal","pos":"name","definitions":["a village in Curtești, Botoșani County, Romania"],"gender":"m"},{"word":"Orășeni-Vale","pos":"name","definitions":["a village in Curtești, Botoșani County, Romania"],"gender":"m"},{"word":"orășenie","pos":"noun","definitions":["the attitude of a urbanite"],"forms":{"plural":"orășenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"orășenie","accusative-definite-nominative-singular":"orășenia","accusative-indefinite-nominative-plural":"orășenii","accusative-definite-nominative-plural":"orășeniile","dative-genitive-indefinite-singular":"orășenii","dative-definite-genitive-singular":"orășeniei","dative-genitive-indefinite-plural":"orășenii","dative-definite-genitive-plural":"orășeniilor","singular-vocative":"orășenie","plural-vocative":"orășeniilor"}},{"word":"orășenilor","pos":"noun","definitions":["definite genitive/dative plural of orășean"]},{"word":"orășenime","pos":"noun","definitions":["townsfolk"],"pronunciation":"/o.rə.ʃeˈni.me/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"orășenime","accusative-definite-nominative":"orășenimea","dative-genitive-indefinite":"orășenimi","dative-definite-genitive":"orășenimii","vocative":"orășenime"}},{"word":"orășenism","pos":"noun","definitions":["urbanism"],"forms":{"plural":"orășenisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"orășenism","accusative-definite-nominative-singular":"orășenismul","accusative-indefinite-nominative-plural":"orășenisme","accusative-definite-nominative-plural":"orășenismele","dative-genitive-indefinite-singular":"orășenism","dative-definite-genitive-singular":"orășenismului","dative-genitive-indefinite-plural":"orășenisme","dative-definite-genitive-plural":"orășenismelor","singular-vocative":"orășenismule","plural-vocative":"orășenismelor"}},{"word":"orășeniza","pos":"verb","definitions":["to urbanize"],"forms":{"canonical":"a orășeniza 1st conjugation","present-singular-third-person":"orășenizează","participle-past":"orășenizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a orășeniza","gerund":"orășenizând","first-person-indicative-present-singular":"orășenizez","indicative-present-second-person-singular":"orășenizezi","indicative-present-singular-third-person":"orășenizează","first-person-indicative-plural-present":"orășenizăm","indicative-plural-present-second-person":"orășenizați","indicative-plural-present-third-person":"orășenizează","first-person-imperfect-indicative-singular":"orășenizam","imperfect-indicative-second-person-singular":"orășenizai","imperfect-indicative-singular-third-person":"orășeniza","first-person-imperfect-indicative-plural":"orășenizam","imperfect-indicative-plural-second-person":"orășenizați","imperfect-indicative-plural-third-person":"orășenizau","first-person-indicative-perfect-singular":"orășenizai","indicative-perfect-second-person-singular":"orășenizași","indicative-perfect-singular-third-person":"orășeniză","first-person-indicative-perfect-plural":"orășenizarăm","indicative-perfect-plural-second-person":"orășenizarăți","indicative-perfect-plural-third-person":"orășenizară","first-person-indicative-pluperfect-singular":"orășenizasem","indicative-pluperfect-second-person-singular":"orășenizaseși","indicative-pluperfect-singular-third-person":"orășenizase","first-person-indicative-pluperfect-plural":"orășenizaserăm","indicative-pluperfect-plural-second-person":"orășenizaserăți","indicative-pluperfect-plural-third-person":"orășenizaseră","first-person-present-singular-subjunctive":"să orășenizez","present-second-person-singular-subjunctive":"să orășenizezi","present-singular-subjunctive-third-person":"să orășenizeze","first-person-plural-present-subjunctive":"să orășenizăm","plural-present-second-person-subjunctive":"să orășenizați","plural-present-subjunctive-third-person":"să orășenizeze","imperative-second-person-singular":"orășenizează","imperative-plural-second-person":"orășenizați","imperative-negative-second-person-singular":"nu orășeniza","imperative-negative-plural-second-person":"nu orășenizați"}},{"word":"orășior","pos":"noun","definitions":["diminutive of oraș"],"forms":{"plural":"orășioare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"orășior","accusative-definite-nominative-singular":"orășiorul","accusative-indefinite-nominative-plural":"orășioare","accusative-definite-nominative-plural":"orășioarele","dative-genitive-indefinite-singular":"orășior","dative-definite-genitive-singular":"orășiorului","dative-genitive-indefinite-plural":"orășioare","dative-definite-genitive-plural":"orășioarelor","singular-vocative":"orășiorule","plural-vocative":"orășioarelor"}},{"word":"Orăștean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Orăștean"}},{"word":"Orășteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Orășteanu"}},{"word":"orăstică","pos":"noun","definitions":["black bitter vetch (Lathyrus niger)","spring vetchling (Lathyrus vernus)"],"forms":{"plural":"orăstici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"orăstică","accusative-definite-nominative-singular":"orăstica","accusative-indefinite-nominative-plural":"orăstici","accusative-definite-nominative-plural":"orăsticile","dative-genitive-indefinite-singular":"orăstici","dative-definite-genitive-singular":"orăsticii","dative-genitive-indefinite-plural":"orăstici","dative-definite-genitive-plural":"orăsticilor","singular-vocative":"orăstică","plural-vocative":"orăsticilor"}},{"word":"orăștică","pos":"noun","definitions":["alternative form of orăstică"],"forms":{"plural":"orăștici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"orăștică","accusative-definite-nominative-singular":"orăștica","accusative-indefinite-nominative-plural":"orăștici","accusative-definite-nominative-plural":"orășticile","dative-genitive-indefinite-singular":"orăștici","dative-definite-genitive-singular":"orășticii","dative-genitive-indefinite-plural":"orăștici","dative-definite-genitive-plural":"orășticilor","singular-vocative":"orăștică","plural-vocative":"orășticilor"}},{"word":"Orăștie","pos":"name","definitions":["a city in Hunedoara County, Romania"],"pronunciation":"/orəʃˈti.e/","gender":"m"},{"word":"Orăștioara de Jos","pos":"name","definitions":["a village in Beriu, Hunedoara County, Romania"],"gender":"f"},{"word":"Orăștioara de Sus","pos":"name","definitions":["a commune of Hunedoara County, Romania","a village in Orăștioara de Sus, Hunedoara County, Romania"],"gender":"f"},{"word":"Orașu Nou","pos":"name","definitions":["a commune of Satu Mare County, Romania","a village in Orașu Nou, Satu Mare County, Romania"],"gender":"m"},{"word":"Orașu Nou-Vii","pos":"name","definitions":["a village in Orașu Nou, Satu Mare County, Romania"],"gender":"m"},{"word":"orașul","pos":"noun","definitions":["definite nominative/accusative singular of oraș"]},{"word":"orașule","pos":"noun","definitions":["vocative singular of oraș"]},{"word":"orașului","pos":"noun","definitions":["definite dative/genitive singular of oraș"]},{"word":"orășuț","pos":"noun","definitions":["diminutive of oraș"],"forms":{"plural":"orășuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"orășuț","accusative-definite-nominative-singular":"orășuțul","accusative-indefinite-nominative-plural":"orășuțe","accusative-definite-nominative-plural":"orășuțele","dative-genitive-indefinite-singular":"orășuț","dative-definite-genitive-singular":"orășuțului","dative-genitive-indefinite-plural":"orășuțe","dative-definite-genitive-plural":"orășuțelor","singular-vocative":"orășuțule","plural-vocative":"orășuțelor"}},{"word":"orătanie","pos":"noun","definitions":["poultry, domesticated bird"],"pronunciation":"/orəˈtani.e/","forms":{"plural":"orătanii"}},{"word":"orătănie","pos":"noun","definitions":["alternative form of orătanie"],"forms":{"plural":"orătănii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"orătănie","accusative-definite-nominative-singular":"orătănia","accusative-indefinite-nominative-plural":"orătănii","accusative-definite-nominative-plural":"orătăniile","dative-genitive-indefinite-singular":"orătănii","dative-definite-genitive-singular":"orătăniei","dative-genitive-indefinite-plural":"orătănii","dative-definite-genitive-plural":"orătăniilor","singular-vocative":"orătănie","plural-vocative":"orătăniilor"}},{"word":"orătenie","pos":"noun","definitions":["alternative form of orătanie"],"forms":{"plural":"orătenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"orătenie","accusative-definite-nominative-singular":"orătenia","accusative-indefinite-nominative-plural":"orătenii","accusative-definite-nominative-plural":"orăteniile","dative-genitive-indefinite-singular":"orătenii","dative-definite-genitive-singular":"orăteniei","dative-genitive-indefinite-plural":"orătenii","dative-definite-genitive-plural":"orăteniilor","singular-vocative":"orătenie","plural-vocative":"orăteniilor"}},{"word":"orație","pos":"noun","definitions":["epithalamium, nuptial poem","oration"],"pronunciation":"/oˈrat͡si.e/","forms":{"plural":"orații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"orație","accusative-definite-nominative-singular":"orația","accusative-indefinite-nominative-plural":"orații","accusative-definite-nominative-plural":"orațiile","dative-genitive-indefinite-singular":"orații","dative-definite-genitive-singular":"orației","dative-genitive-indefinite-plural":"orații","dative-definite-genitive-plural":"orațiilor","singular-vocative":"orație","plural-vocative":"orațiilor","alternative":"orațiune"}},{"word":"orații","pos":"noun","definitions":["plural of orație"]},{"word":"orațiune","pos":"noun","definitions":["alternative form of orație"],"forms":{"plural":"orațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"orațiune","accusative-definite-nominative-singular":"orațiunea","accusative-indefinite-nominative-plural":"orațiuni","accusative-definite-nominative-plural":"orațiunile","dative-genitive-indefinite-singular":"orațiuni","dative-definite-genitive-singular":"orațiunii","dative-genitive-indefinite-plural":"orațiuni","dative-definite-genitive-plural":"orațiunilor","singular-vocative":"orațiune","plural-vocative":"orațiunilor"}},{"word":"oratoare","pos":"noun","definitions":["female equivalent of orator"],"forms":{"plural":"oratoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"oratoare","accusative-definite-nominative-singular":"oratoarea","accusative-indefinite-nominative-plural":"oratoare","accusative-definite-nominative-plural":"oratoarele","dative-genitive-indefinite-singular":"oratoare","dative-definite-genitive-singular":"oratoarei","dative-genitive-indefinite-plural":"oratoare","dative-definite-genitive-plural":"oratoarelor","singular-vocative":"oratoare","plural-vocative":"oratoarelor"}},{"word":"orator","pos":"noun","definitions":["orator, speaker"],"forms":{"plural":"oratori","feminine":"equivalent oratoare","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orator","accusative-definite-nominative-singular":"oratorul","accusative-indefinite-nominative-plural":"oratori","accusative-definite-nominative-plural":"oratorii","dative-genitive-indefinite-singular":"orator","dative-definite-genitive-singular":"oratorului","dative-genitive-indefinite-plural":"oratori","dative-definite-genitive-plural":"oratorilor","singular-vocative":"oratorule","plural-vocative":"oratorilor"}},{"word":"oratoric","pos":"adj","definitions":["oratorical"],"forms":{"feminine-singular":"oratorică","masculine-plural":"oratorici","feminine-neuter-plural":"oratorice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oratoric","error-unrecognized-form-feminine-indefinite-singular":"oratorică","error-unrecognized-form-indefinite-masculine-plural":"oratorici","error-unrecognized-form-feminine-indefinite-neuter-plural":"oratorice","definite-error-unrecognized-form-masculine-neuter-singular":"oratoricul","definite-error-unrecognized-form-feminine-singular":"oratorica","definite-error-unrecognized-form-masculine-plural":"oratoricii","definite-error-unrecognized-form-feminine-neuter-plural":"oratoricele"}},{"word":"oratorie","pos":"noun","definitions":["elocution"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"oratorie","accusative-definite-nominative":"oratoria","dative-genitive-indefinite":"oratorii","dative-definite-genitive":"oratoriei","vocative":"oratorie"}},{"word":"oratorism","pos":"noun","definitions":["oratory"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oratorism","accusative-definite-nominative-singular":"oratorismul","accusative-indefinite-nominative-plural":"oratorisme","accusative-definite-nominative-plural":"oratorismele","dative-genitive-indefinite-singular":"oratorism","dative-definite-genitive-singular":"oratorismului","dative-genitive-indefinite-plural":"oratorisme","dative-definite-genitive-plural":"oratorismelor","singular-vocative":"oratorismule","plural-vocative":"oratorismelor"}},{"word":"oratoriu","pos":"adj","definitions":["oratory"],"forms":{"feminine-singular":"oratorie","plural":"oratorii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oratoriu","error-unrecognized-form-feminine-indefinite-singular":"oratorie","error-unrecognized-form-indefinite-masculine-plural":"oratorii","error-unrecognized-form-feminine-indefinite-neuter-plural":"oratorii","definite-error-unrecognized-form-masculine-neuter-singular":"oratoriul","definite-error-unrecognized-form-feminine-singular":"oratoria","definite-error-unrecognized-form-masculine-plural":"oratoriii","definite-error-unrecognized-form-feminine-neuter-plural":"oratoriile"}},{"word":"Orăviceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Orăviceanu"}},{"word":"Oravița","pos":"name","definitions":["Oravița (a city in Banat, in western Romania)"],"gender":"f"},{"word":"Orăvițan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Orăvițan"}},{"word":"Orb","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Orb"}},{"word":"orb","pos":"adj","definitions":["blind"],"pronunciation":"/orb/","forms":{"feminine-singular":"oarbă","masculine-plural":"orbi","feminine-neuter-plural":"oarbe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orb","error-unrecognized-form-feminine-indefinite-singular":"oarbă","error-unrecognized-form-indefinite-masculine-plural":"orbi","error-unrecognized-form-feminine-indefinite-neuter-plural":"oarbe","definite-error-unrecognized-form-masculine-neuter-singular":"orbul","definite-error-unrecognized-form-feminine-singular":"oarba","definite-error-unrecognized-form-masculine-plural":"orbii","definite-error-unrecognized-form-feminine-neuter-plural":"oarbele"}},{"word":"orb","pos":"noun","definitions":["blind man"],"pronunciation":"/orb/","forms":{"plural":"orbi","feminine":"equivalent oarbă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orb","accusative-definite-nominative-singular":"orbul","accusative-indefinite-nominative-plural":"orbi","accusative-definite-nominative-plural":"orbii","dative-genitive-indefinite-singular":"orb","dative-definite-genitive-singular":"orbului","dative-genitive-indefinite-plural":"orbi","dative-definite-genitive-plural":"orbilor","singular-vocative":"orbule","plural-vocative":"orbilor"}},{"word":"orbăcăciune","pos":"noun","definitions":["fumbling"],"forms":{"plural":"orbăcăciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"orbăcăciune","accusative-definite-nominative-singular":"orbăcăciunea","accusative-indefinite-nominative-plural":"orbăcăciuni","accusative-definite-nominative-plural":"orbăcăciunile","dative-genitive-indefinite-singular":"orbăcăciuni","dative-definite-genitive-singular":"orbăcăciunii","dative-genitive-indefinite-plural":"orbăcăciuni","dative-definite-genitive-plural":"orbăcăciunilor","singular-vocative":"orbăcăciune","plural-vocative":"orbăcăciunilor"}},{"word":"orbăcăi","pos":"verb","definitions":["alternative form of orbecăi"],"forms":{"canonical":"a orbăcăi 4th conjugation","present-singular-third-person":"orbăcăie","participle-past":"orbăcăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a orbăcăi","gerund":"orbăcăind","first-person-indicative-present-singular":"orbăcăi","indicative-present-second-person-singular":"orbăcăi","indicative-present-singular-third-person":"orbăcăie","first-person-indicative-plural-present":"orbăcăim","indicative-plural-present-second-person":"orbăcăiți","indicative-plural-present-third-person":"orbăcăie","first-person-imperfect-indicative-singular":"orbăcăiam","imperfect-indicative-second-person-singular":"orbăcăiai","imperfect-indicative-singular-third-person":"orbăcăia","first-person-imperfect-indicative-plural":"orbăcăiam","imperfect-indicative-plural-second-person":"orbăcăiați","imperfect-indicative-plural-third-person":"orbăcăiau","first-person-indicative-perfect-singular":"orbăcăii","indicative-perfect-second-person-singular":"orbăcăiși","indicative-perfect-singular-third-person":"orbăcăi","first-person-indicative-perfect-plural":"orbăcăirăm","indicative-perfect-plural-second-person":"orbăcăirăți","indicative-perfect-plural-third-person":"orbăcăiră","first-person-indicative-pluperfect-singular":"orbăcăisem","indicative-pluperfect-second-person-singular":"orbăcăiseși","indicative-pluperfect-singular-third-person":"orbăcăise","first-person-indicative-pluperfect-plural":"orbăcăiserăm","indicative-pluperfect-plural-second-person":"orbăcăiserăți","indicative-pluperfect-plural-third-person":"orbăcăiseră","first-person-present-singular-subjunctive":"să orbăcăi","present-second-person-singular-subjunctive":"să orbăcăi","present-singular-subjunctive-third-person":"să orbăcăie","first-person-plural-present-subjunctive":"să orbăcăim","plural-present-second-person-subjunctive":"să orbăcăiți","plural-present-subjunctive-third-person":"să orbăcăie","imperative-second-person-singular":"orbăcăie","imperative-plural-second-person":"orbăcăiți","imperative-negative-second-person-singular":"nu orbăcăi","imperative-negative-plural-second-person":"nu orbăcăiți"}},{"word":"orbălțătură","pos":"noun","definitions":["alternative form of orbălțitură"],"forms":{"plural":"orbălțături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"orbălțătură","accusative-definite-nominative-singular":"orbălțătura","accusative-indefinite-nominative-plural":"orbălțături","accusative-definite-nominative-plural":"orbălțăturile","dative-genitive-indefinite-singular":"orbălțături","dative-definite-genitive-singular":"orbălțăturii","dative-genitive-indefinite-plural":"orbălțături","dative-definite-genitive-plural":"orbălțăturilor","singular-vocative":"orbălțătură","plural-vocative":"orbălțăturilor"}},{"word":"Orban","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Orban"}},{"word":"Orbău","pos":"name","definitions":["a village in Cehal, Satu Mare County, Romania"],"gender":"m"},{"word":"orbeală","pos":"noun","definitions":["blindness"],"forms":{"plural":"orbeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"orbeală","accusative-definite-nominative-singular":"orbeala","accusative-indefinite-nominative-plural":"orbeli","accusative-definite-nominative-plural":"orbelile","dative-genitive-indefinite-singular":"orbeli","dative-definite-genitive-singular":"orbelii","dative-genitive-indefinite-plural":"orbeli","dative-definite-genitive-plural":"orbelilor","singular-vocative":"orbeală","plural-vocative":"orbelilor"}},{"word":"Orbeasca","pos":"name","definitions":["a commune of Teleorman County, Romania"],"gender":"f"},{"word":"Orbeasca de Jos","pos":"name","definitions":["a village in Orbeasca, Teleorman County, Romania"],"gender":"f"},{"word":"Orbeasca de Sus","pos":"name","definitions":["a village in Orbeasca, Teleorman County, Romania"],"gender":"f"},{"word":"orbeca","pos":"verb","definitions":["synonym of orbecăi"],"forms":{"canonical":"a orbeca 1st conjugation","present-singular-third-person":"orbecă","participle-past":"orbecat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a orbeca","gerund":"orbecând","first-person-indicative-present-singular":"orbec","indicative-present-second-person-singular":"orbeci","indicative-present-singular-third-person":"orbecă","first-person-indicative-plural-present":"orbecăm","indicative-plural-present-second-person":"orbecați","indicative-plural-present-third-person":"orbecă","first-person-imperfect-indicative-singular":"orbecam","imperfect-indicative-second-person-singular":"orbecai","imperfect-indicative-singular-third-person":"orbeca","first-person-imperfect-indicative-plural":"orbecam","imperfect-indicative-plural-second-person":"orbecați","imperfect-indicative-plural-third-person":"orbecau","first-person-indicative-perfect-singular":"orbecai","indicative-perfect-second-person-singular":"orbecași","indicative-perfect-singular-third-person":"orbecă","first-person-indicative-perfect-plural":"orbecarăm","indicative-perfect-plural-second-person":"orbecarăți","indicative-perfect-plural-third-person":"orbecară","first-person-indicative-pluperfect-singular":"orbecasem","indicative-pluperfect-second-person-singular":"orbecaseși","indicative-pluperfect-singular-third-person":"orbecase","first-person-indicative-pluperfect-plural":"orbecaserăm","indicative-pluperfect-plural-second-person":"orbecaserăți","indicative-pluperfect-plural-third-person":"orbecaseră","first-person-present-singular-subjunctive":"să orbec","present-second-person-singular-subjunctive":"să orbeci","present-singular-subjunctive-third-person":"să orbece","first-person-plural-present-subjunctive":"să orbecăm","plural-present-second-person-subjunctive":"să orbecați","plural-present-subjunctive-third-person":"să orbece","imperative-second-person-singular":"orbecă","imperative-plural-second-person":"orbecați","imperative-negative-second-person-singular":"nu orbeca","imperative-negative-plural-second-person":"nu orbecați"}},{"word":"orbecăi","pos":"verb","definitions":["to grope/poke/fumble about, feel one's way about"],"forms":{"canonical":"a orbecăi 4th conjugation","present-singular-third-person":"orbecăiește","participle-past":"orbecăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a orbecăi","gerund":"orbecăind","first-person-indicative-present-singular":"orbecăiesc","indicative-present-second-person-singular":"orbecăiești","indicative-present-singular-third-person":"orbecăiește","first-person-indicative-plural-present":"orbecăim","indicative-plural-present-second-person":"orbecăiți","indicative-plural-present-third-person":"orbecăiesc","first-person-imperfect-indicative-singular":"orbecăiam","imperfect-indicative-second-person-singular":"orbecăiai","imperfect-indicative-singular-third-person":"orbecăia","first-person-imperfect-indicative-plural":"orbecăiam","imperfect-indicative-plural-second-person":"orbecăiați","imperfect-indicative-plural-third-person":"orbecăiau","first-person-indicative-perfect-singular":"orbecăii","indicative-perfect-second-person-singular":"orbecăiși","indicative-perfect-singular-third-person":"orbecăi","first-person-indicative-perfect-plural":"orbecăirăm","indicative-perfect-plural-second-person":"orbecăirăți","indicative-perfect-plural-third-person":"orbecăiră","first-person-indicative-pluperfect-singular":"orbecăisem","indicative-pluperfect-second-person-singular":"orbecăiseși","indicative-pluperfect-singular-third-person":"orbecăise","first-person-indicative-pluperfect-plural":"orbecăiserăm","indicative-pluperfect-plural-second-person":"orbecăiserăți","indicative-pluperfect-plural-third-person":"orbecăiseră","first-person-present-singular-subjunctive":"să orbecăiesc","present-second-person-singular-subjunctive":"să orbecăiești","present-singular-subjunctive-third-person":"să orbecăiască","first-person-plural-present-subjunctive":"să orbecăim","plural-present-second-person-subjunctive":"să orbecăiți","plural-present-subjunctive-third-person":"să orbecăiască","imperative-second-person-singular":"orbecăiește","imperative-plural-second-person":"orbecăiți","imperative-negative-second-person-singular":"nu orbecăi","imperative-negative-plural-second-person":"nu orbecăiți","alternative-dated":"orbeca","alternative":"orbăcăi"}},{"word":"orbecăială","pos":"noun","definitions":["fumble"],"forms":{"plural":"orbecăieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orbecăială","accusative-definite-nominative-singular":"orbecăiala","accusative-indefinite-nominative-plural":"orbecăiele","accusative-definite-nominative-plural":"orbecăielele","dative-genitive-indefinite-singular":"orbecăiele","dative-definite-genitive-singular":"orbecăielei","dative-genitive-indefinite-plural":"orbecăiele","dative-definite-genitive-plural":"orbecăielelor","singular-vocative":"orbecăială","plural-vocative":"orbecăielelor"}},{"word":"orbecăire","pos":"noun","definitions":["fumbling"],"forms":{"plural":"orbecăiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"orbecăire","accusative-definite-nominative-singular":"orbecăirea","accusative-indefinite-nominative-plural":"orbecăiri","accusative-definite-nominative-plural":"orbecăirile","dative-genitive-indefinite-singular":"orbecăiri","dative-definite-genitive-singular":"orbecăirii","dative-genitive-indefinite-plural":"orbecăiri","dative-definite-genitive-plural":"orbecăirilor","singular-vocative":"orbecăire","plural-vocative":"orbecăirilor"}},{"word":"orbecare","pos":"noun","definitions":["stumbling"],"forms":{"plural":"orbecări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"orbecare","accusative-definite-nominative-singular":"orbecarea","accusative-indefinite-nominative-plural":"orbecări","accusative-definite-nominative-plural":"orbecările","dative-genitive-indefinite-singular":"orbecări","dative-definite-genitive-singular":"orbecării","dative-genitive-indefinite-plural":"orbecări","dative-definite-genitive-plural":"orbecărilor","singular-vocative":"orbecare","plural-vocative":"orbecărilor"}},{"word":"orbecat","pos":"adj","definitions":["fascinated"],"forms":{"feminine-singular":"orbecată","masculine-plural":"orbecați","feminine-neuter-plural":"orbecate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orbecat","error-unrecognized-form-feminine-indefinite-singular":"orbecată","error-unrecognized-form-indefinite-masculine-plural":"orbecați","error-unrecognized-form-feminine-indefinite-neuter-plural":"orbecate","definite-error-unrecognized-form-masculine-neuter-singular":"orbecatul","definite-error-unrecognized-form-feminine-singular":"orbecata","definite-error-unrecognized-form-masculine-plural":"orbecații","definite-error-unrecognized-form-feminine-neuter-plural":"orbecatele"}},{"word":"orbecat","pos":"verb","definitions":["past participle of orbeca"],"forms":{"participle-past":"of orbeca"}},{"word":"Orbeni","pos":"name","definitions":["a commune of Bacău County, Romania","a village in Orbeni, Bacău County, Romania"],"gender":"m"},{"word":"orbesc","pos":"adj","definitions":["blindly"],"forms":{"feminine-singular":"orbească","plural":"orbești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orbesc","error-unrecognized-form-feminine-indefinite-singular":"orbească","error-unrecognized-form-indefinite-masculine-plural":"orbești","error-unrecognized-form-feminine-indefinite-neuter-plural":"orbești","definite-error-unrecognized-form-masculine-neuter-singular":"orbescul","definite-error-unrecognized-form-feminine-singular":"orbeasca","definite-error-unrecognized-form-masculine-plural":"orbeștii","definite-error-unrecognized-form-feminine-neuter-plural":"orbeștile"}},{"word":"orbește","pos":"adv","definitions":["blindly"]},{"word":"orbeț","pos":"adj","definitions":["blind or unable to see well"],"pronunciation":"/orˈbet͡s/","forms":{"feminine-singular":"orbeață","masculine-plural":"orbeți","feminine-neuter-plural":"orbețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orbeț","error-unrecognized-form-feminine-indefinite-singular":"orbeață","error-unrecognized-form-indefinite-masculine-plural":"orbeți","error-unrecognized-form-feminine-indefinite-neuter-plural":"orbețe","definite-error-unrecognized-form-masculine-neuter-singular":"orbețul","definite-error-unrecognized-form-feminine-singular":"orbeața","definite-error-unrecognized-form-masculine-plural":"orbeții","definite-error-unrecognized-form-feminine-neuter-plural":"orbețele"}},{"word":"orbeț","pos":"noun","definitions":["person or creature that is blind or unable to see well","mole rat"],"pronunciation":"/orˈbet͡s/","forms":{"plural":"orbeți","feminine":"equivalent orbeață","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orbeț","accusative-definite-nominative-singular":"orbețul","accusative-indefinite-nominative-plural":"orbeți","accusative-definite-nominative-plural":"orbeții","dative-genitive-indefinite-singular":"orbeț","dative-definite-genitive-singular":"orbețului","dative-genitive-indefinite-plural":"orbeți","dative-definite-genitive-plural":"orbeților","singular-vocative":"orbețule","plural-vocative":"orbeților"}},{"word":"orbete","pos":"noun","definitions":["alternative form of orbeț"],"forms":{"plural":"orbeți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orbete","accusative-definite-nominative-singular":"orbeteul","accusative-indefinite-nominative-plural":"orbeți","accusative-definite-nominative-plural":"orbeții","dative-genitive-indefinite-singular":"orbete","dative-definite-genitive-singular":"orbeteului","dative-genitive-indefinite-plural":"orbeți","dative-definite-genitive-plural":"orbeților","singular-vocative":"orbeteule","plural-vocative":"orbeților"}},{"word":"orbi","pos":"verb","definitions":["to blind, deprive of sight","to go blind, lose one's eyesight","to blindfold","to dazzle, bewilder; to deceive, delude"],"forms":{"canonical":"a orbi 4th conjugation","present-singular-third-person":"orbește","participle-past":"orbit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a orbi","gerund":"orbind","first-person-indicative-present-singular":"orbesc","indicative-present-second-person-singular":"orbești","indicative-present-singular-third-person":"orbește","first-person-indicative-plural-present":"orbim","indicative-plural-present-second-person":"orbiți","indicative-plural-present-third-person":"orbesc","first-person-imperfect-indicative-singular":"orbeam","imperfect-indicative-second-person-singular":"orbeai","imperfect-indicative-singular-third-person":"orbea","first-person-imperfect-indicative-plural":"orbeam","imperfect-indicative-plural-second-person":"orbeați","imperfect-indicative-plural-third-person":"orbeau","first-person-indicative-perfect-singular":"orbii","indicative-perfect-second-person-singular":"orbiși","indicative-perfect-singular-third-person":"orbi","first-person-indicative-perfect-plural":"orbirăm","indicative-perfect-plural-second-person":"orbirăți","indicative-perfect-plural-third-person":"orbiră","first-person-indicative-pluperfect-singular":"orbisem","indicative-pluperfect-second-person-singular":"orbiseși","indicative-pluperfect-singular-third-person":"orbise","first-person-indicative-pluperfect-plural":"orbiserăm","indicative-pluperfect-plural-second-person":"orbiserăți","indicative-pluperfect-plural-third-person":"orbiseră","first-person-present-singular-subjunctive":"să orbesc","present-second-person-singular-subjunctive":"să orbești","present-singular-subjunctive-third-person":"să orbească","first-person-plural-present-subjunctive":"să orbim","plural-present-second-person-subjunctive":"să orbiți","plural-present-subjunctive-third-person":"să orbească","imperative-second-person-singular":"orbește","imperative-plural-second-person":"orbiți","imperative-negative-second-person-singular":"nu orbi","imperative-negative-plural-second-person":"nu orbiți"}},{"word":"orbiciune","pos":"noun","definitions":["blindness"],"forms":{"plural":"orbiciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"orbiciune","accusative-definite-nominative-singular":"orbiciunea","accusative-indefinite-nominative-plural":"orbiciuni","accusative-definite-nominative-plural":"orbiciunile","dative-genitive-indefinite-singular":"orbiciuni","dative-definite-genitive-singular":"orbiciunii","dative-genitive-indefinite-plural":"orbiciuni","dative-definite-genitive-plural":"orbiciunilor","singular-vocative":"orbiciune","plural-vocative":"orbiciunilor"}},{"word":"orbicular","pos":"adj","definitions":["orbicular"],"forms":{"feminine-singular":"orbiculară","masculine-plural":"orbiculari","feminine-neuter-plural":"orbiculare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orbicular","error-unrecognized-form-feminine-indefinite-singular":"orbiculară","error-unrecognized-form-indefinite-masculine-plural":"orbiculari","error-unrecognized-form-feminine-indefinite-neuter-plural":"orbiculare","definite-error-unrecognized-form-masculine-neuter-singular":"orbicularul","definite-error-unrecognized-form-feminine-singular":"orbiculara","definite-error-unrecognized-form-masculine-plural":"orbicularii","definite-error-unrecognized-form-feminine-neuter-plural":"orbicularele"}},{"word":"orbiculat","pos":"adj","definitions":["orbiculate"],"forms":{"feminine-singular":"orbiculată","masculine-plural":"orbiculați","feminine-neuter-plural":"orbiculate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orbiculat","error-unrecognized-form-feminine-indefinite-singular":"orbiculată","error-unrecognized-form-indefinite-masculine-plural":"orbiculați","error-unrecognized-form-feminine-indefinite-neuter-plural":"orbiculate","definite-error-unrecognized-form-masculine-neuter-singular":"orbiculatul","definite-error-unrecognized-form-feminine-singular":"orbiculata","definite-error-unrecognized-form-masculine-plural":"orbiculații","definite-error-unrecognized-form-feminine-neuter-plural":"orbiculatele"}},{"word":"orbie","pos":"noun","definitions":["blindness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"orbie","accusative-definite-nominative":"orbia","dative-genitive-indefinite":"orbii","dative-definite-genitive":"orbiei","vocative":"orbie"}},{"word":"orbilă","pos":"noun","definitions":["blind"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"orbilă","accusative-definite-nominative":"orbilăul","dative-genitive-indefinite":"orbilă","dative-definite-genitive":"orbilăului","vocative":"orbilăule"}},{"word":"orbime","pos":"noun","definitions":["blindness"],"forms":{"plural":"orbimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"orbime","accusative-definite-nominative-singular":"orbimea","accusative-indefinite-nominative-plural":"orbimi","accusative-definite-nominative-plural":"orbimile","dative-genitive-indefinite-singular":"orbimi","dative-definite-genitive-singular":"orbimii","dative-genitive-indefinite-plural":"orbimi","dative-definite-genitive-plural":"orbimilor","singular-vocative":"orbime","plural-vocative":"orbimilor"}},{"word":"orbire","pos":"noun","definitions":["blindness","ignorance, delusion"]},{"word":"orbiș","pos":"adv","definitions":["blindly"]},{"word":"Orbișor","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Orbișor"}},{"word":"orbit","pos":"adj","definitions":["blinded"],"pronunciation":"[orˈbit]","forms":{"feminine-singular":"orbită","masculine-plural":"orbiți","feminine-neuter-plural":"orbite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orbit","error-unrecognized-form-feminine-indefinite-singular":"orbită","error-unrecognized-form-indefinite-masculine-plural":"orbiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"orbite","definite-error-unrecognized-form-masculine-neuter-singular":"orbitul","definite-error-unrecognized-form-feminine-singular":"orbita","definite-error-unrecognized-form-masculine-plural":"orbiții","definite-error-unrecognized-form-feminine-neuter-plural":"orbitele"}},{"word":"orbit","pos":"verb","definitions":["past participle of orbi"],"pronunciation":"[orˈbit]","forms":{"participle-past":"of orbi"}},{"word":"orbită","pos":"noun","definitions":["orbit (circular or elliptical path of one object around another)","eye socket, orbit"],"forms":{"plural":"orbite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orbită","accusative-definite-nominative-singular":"orbita","accusative-indefinite-nominative-plural":"orbite","accusative-definite-nominative-plural":"orbitele","dative-genitive-indefinite-singular":"orbite","dative-definite-genitive-singular":"orbitei","dative-genitive-indefinite-plural":"orbite","dative-definite-genitive-plural":"orbitelor","singular-vocative":"orbită","plural-vocative":"orbitelor"}},{"word":"orbital","pos":"adj","definitions":["orbital"],"forms":{"feminine-singular":"orbitală","masculine-plural":"orbitali","feminine-neuter-plural":"orbitale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orbital","error-unrecognized-form-feminine-indefinite-singular":"orbitală","error-unrecognized-form-indefinite-masculine-plural":"orbitali","error-unrecognized-form-feminine-indefinite-neuter-plural":"orbitale","definite-error-unrecognized-form-masculine-neuter-singular":"orbitalul","definite-error-unrecognized-form-feminine-singular":"orbitala","definite-error-unrecognized-form-masculine-plural":"orbitalii","definite-error-unrecognized-form-feminine-neuter-plural":"orbitalele"}},{"word":"orbitografie","pos":"noun","definitions":["orbitography"],"forms":{"plural":"orbitografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"orbitografie","accusative-definite-nominative":"orbitografia","dative-genitive-indefinite":"orbitografii","dative-definite-genitive":"orbitografiei","vocative":"orbitografie"}},{"word":"orbitografii","pos":"noun","definitions":["plural of orbitografie"]},{"word":"orbitor","pos":"adj","definitions":["dazzling"],"forms":{"feminine-singular":"orbitoare","masculine-plural":"orbitori","feminine-neuter-plural":"orbitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orbitor","error-unrecognized-form-feminine-indefinite-singular":"orbitoare","error-unrecognized-form-indefinite-masculine-plural":"orbitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"orbitoare","definite-error-unrecognized-form-masculine-neuter-singular":"orbitorul","definite-error-unrecognized-form-feminine-singular":"orbitoarea","definite-error-unrecognized-form-masculine-plural":"orbitorii","definite-error-unrecognized-form-feminine-neuter-plural":"orbitoarele"}},{"word":"orbitură","pos":"noun","definitions":["blinding"],"forms":{"plural":"orbituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"orbitură","accusative-definite-nominative-singular":"orbitura","accusative-indefinite-nominative-plural":"orbituri","accusative-definite-nominative-plural":"orbiturile","dative-genitive-indefinite-singular":"orbituri","dative-definite-genitive-singular":"orbiturii","dative-genitive-indefinite-plural":"orbituri","dative-definite-genitive-plural":"orbiturilor","singular-vocative":"orbitură","plural-vocative":"orbiturilor"}},{"word":"Orboești","pos":"name","definitions":["a village in Andrășești, Ialomița County, Romania"],"gender":"m"},{"word":"Orboiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Orboiu"}},{"word":"orbotă","pos":"noun","definitions":["alternative form of horbotă"],"forms":{"plural":"orbote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orbotă","accusative-definite-nominative-singular":"orbota","accusative-indefinite-nominative-plural":"orbote","accusative-definite-nominative-plural":"orbotele","dative-genitive-indefinite-singular":"orbote","dative-definite-genitive-singular":"orbotei","dative-genitive-indefinite-plural":"orbote","dative-definite-genitive-plural":"orbotelor","singular-vocative":"orbotă","plural-vocative":"orbotelor"}},{"word":"Orbu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Orbu"}},{"word":"orbul găinilor","pos":"noun","definitions":["nyctalopia (inability to see at night)"]},{"word":"Orbulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Orbulescu"}},{"word":"Orbuleț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Orbuleț"}},{"word":"orbului","pos":"noun","definitions":["definite genitive/dative singular of orb"]},{"word":"orc","pos":"adv","definitions":["abbreviation of oricum (“either way, anyway, anyhow”)"]},{"word":"orcan","pos":"noun","definitions":["taifun, hurricane"],"forms":{"plural":"orcane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"orcan","accusative-definite-nominative-singular":"orcanul","accusative-indefinite-nominative-plural":"orcane","accusative-definite-nominative-plural":"orcanele","dative-genitive-indefinite-singular":"orcan","dative-definite-genitive-singular":"orcanului","dative-genitive-indefinite-plural":"orcane","dative-definite-genitive-plural":"orcanelor","singular-vocative":"orcanule","plural-vocative":"orcanelor"}},{"word":"orchestra","pos":"verb","definitions":["to orchestrate"],"forms":{"canonical":"a orchestra 1st conjugation","present-singular-third-person":"orchestrează","participle-past":"orchestrat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a orchestra","gerund":"orchestrând","first-person-indicative-present-singular":"orchestrez","indicative-present-second-person-singular":"orchestrezi","indicative-present-singular-third-person":"orchestrează","first-person-indicative-plural-present":"orchestrăm","indicative-plural-present-second-person":"orchestrați","indicative-plural-present-third-person":"orchestrează","first-person-imperfect-indicative-singular":"orchestram","imperfect-indicative-second-person-singular":"orchestrai","imperfect-indicative-singular-third-person":"orchestra","first-person-imperfect-indicative-plural":"orchestram","imperfect-indicative-plural-second-person":"orchestrați","imperfect-indicative-plural-third-person":"orchestrau","first-person-indicative-perfect-singular":"orchestrai","indicative-perfect-second-person-singular":"orchestrași","indicative-perfect-singular-third-person":"orchestră","first-person-indicative-perfect-plural":"orchestrarăm","indicative-perfect-plural-second-person":"orchestrarăți","indicative-perfect-plural-third-person":"orchestrară","first-person-indicative-pluperfect-singular":"orchestrasem","indicative-pluperfect-second-person-singular":"orchestraseși","indicative-pluperfect-singular-third-person":"orchestrase","first-person-indicative-pluperfect-plural":"orchestraserăm","indicative-pluperfect-plural-second-person":"orchestraserăți","indicative-pluperfect-plural-third-person":"orchestraseră","first-person-present-singular-subjunctive":"să orchestrez","present-second-person-singular-subjunctive":"să orchestrezi","present-singular-subjunctive-third-person":"să orchestreze","first-person-plural-present-subjunctive":"să orchestrăm","plural-present-second-person-subjunctive":"să orchestrați","plural-present-subjunctive-third-person":"să orchestreze","imperative-second-person-singular":"orchestrează","imperative-plural-second-person":"orchestrați","imperative-negative-second-person-singular":"nu orchestra","imperative-negative-plural-second-person":"nu orchestrați"}},{"word":"orchestra","pos":"noun","definitions":["definite nominative/accusative singular of orchestră"],"gender":"f"},{"word":"orchestră","pos":"noun","definitions":["orchestra"],"forms":{"plural":"orchestre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orchestră","accusative-definite-nominative-singular":"orchestra","accusative-indefinite-nominative-plural":"orchestre","accusative-definite-nominative-plural":"orchestrele","dative-genitive-indefinite-singular":"orchestre","dative-definite-genitive-singular":"orchestrei","dative-genitive-indefinite-plural":"orchestre","dative-definite-genitive-plural":"orchestrelor","singular-vocative":"orchestră","plural-vocative":"orchestrelor"}},{"word":"orchestră de alămuri","pos":"noun","definitions":["brass band"],"forms":{"plural":"orchestre de alămuri"}},{"word":"orchestră simfonică","pos":"noun","definitions":["symphony orchestra"],"forms":{"plural":"orchestre simfonice"}},{"word":"orchestral","pos":"adj","definitions":["orchestral"],"pronunciation":"/ˌor.cesˈtral/","forms":{"feminine-singular":"orchestrală","masculine-plural":"orchestrali","feminine-neuter-plural":"orchestrale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"orchestral","error-unrecognized-form-feminine-indefinite-singular":"orchestrală","error-unrecognized-form-indefinite-masculine-plural":"orchestrali","error-unrecognized-form-feminine-indefinite-neuter-plural":"orchestrale","definite-error-unrecognized-form-masculine-neuter-singular":"orchestralul","definite-error-unrecognized-form-feminine-singular":"orchestrala","definite-error-unrecognized-form-masculine-plural":"orchestralii","definite-error-unrecognized-form-feminine-neuter-plural":"orchestralele"}},{"word":"orchestrant","pos":"noun","definitions":["bandsman"],"forms":{"plural":"orchestranți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orchestrant","accusative-definite-nominative-singular":"orchestrantul","accusative-indefinite-nominative-plural":"orchestranți","accusative-definite-nominative-plural":"orchestranții","dative-genitive-indefinite-singular":"orchestrant","dative-definite-genitive-singular":"orchestrantului","dative-genitive-indefinite-plural":"orchestranți","dative-definite-genitive-plural":"orchestranților","singular-vocative":"orchestrantule","plural-vocative":"orchestranților"}},{"word":"orchestrantă","pos":"noun","definitions":["female equivalent of orchestrant"],"forms":{"plural":"orchestrante","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orchestrantă","accusative-definite-nominative-singular":"orchestranta","accusative-indefinite-nominative-plural":"orchestrante","accusative-definite-nominative-plural":"orchestrantele","dative-genitive-indefinite-singular":"orchestrante","dative-definite-genitive-singular":"orchestrantei","dative-genitive-indefinite-plural":"orchestrante","dative-definite-genitive-plural":"orchestrantelor","singular-vocative":"orchestrantă","plural-vocative":"orchestrantelor"}},{"word":"orchestrare","pos":"noun","definitions":["orchestration"],"forms":{"plural":"orchestrări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"orchestrare","accusative-definite-nominative-singular":"orchestrarea","accusative-indefinite-nominative-plural":"orchestrări","accusative-definite-nominative-plural":"orchestrările","dative-genitive-indefinite-singular":"orchestrări","dative-definite-genitive-singular":"orchestrării","dative-genitive-indefinite-plural":"orchestrări","dative-definite-genitive-plural":"orchestrărilor","singular-vocative":"orchestrare","plural-vocative":"orchestrărilor"}},{"word":"orchestrație","pos":"noun","definitions":["orchestration"],"forms":{"plural":"orchestrații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"orchestrație","accusative-definite-nominative-singular":"orchestrația","accusative-indefinite-nominative-plural":"orchestrații","accusative-definite-nominative-plural":"orchestrațiile","dative-genitive-indefinite-singular":"orchestrații","dative-definite-genitive-singular":"orchestrației","dative-genitive-indefinite-plural":"orchestrații","dative-definite-genitive-plural":"orchestrațiilor","singular-vocative":"orchestrație","plural-vocative":"orchestrațiilor"}},{"word":"orchestrațiune","pos":"noun","definitions":["obsolete form of orchestrație"],"forms":{"plural":"orchestrațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"orchestrațiune","accusative-definite-nominative-singular":"orchestrațiunea","accusative-indefinite-nominative-plural":"orchestrațiuni","accusative-definite-nominative-plural":"orchestrațiunile","dative-genitive-indefinite-singular":"orchestrațiuni","dative-definite-genitive-singular":"orchestrațiunii","dative-genitive-indefinite-plural":"orchestrațiuni","dative-definite-genitive-plural":"orchestrațiunilor","singular-vocative":"orchestrațiune","plural-vocative":"orchestrațiunilor"}},{"word":"orchestrator","pos":"noun","definitions":["orchestrator"],"forms":{"plural":"orchestratori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orchestrator","accusative-definite-nominative-singular":"orchestratorul","accusative-indefinite-nominative-plural":"orchestratori","accusative-definite-nominative-plural":"orchestratorii","dative-genitive-indefinite-singular":"orchestrator","dative-definite-genitive-singular":"orchestratorului","dative-genitive-indefinite-plural":"orchestratori","dative-definite-genitive-plural":"orchestratorilor","singular-vocative":"orchestratorule","plural-vocative":"orchestratorilor"}},{"word":"orchestre","pos":"noun","definitions":["plural of orchestră"],"gender":"f-p"},{"word":"orchestrion","pos":"noun","definitions":["orchestrion"],"pronunciation":"/or.kes.triˈon/","forms":{"plural":"orchestrioane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"orchestrion","accusative-definite-nominative-singular":"orchestrionul","accusative-indefinite-nominative-plural":"orchestrioane","accusative-definite-nominative-plural":"orchestrioanele","dative-genitive-indefinite-singular":"orchestrion","dative-definite-genitive-singular":"orchestrionului","dative-genitive-indefinite-plural":"orchestrioane","dative-definite-genitive-plural":"orchestrioanelor","singular-vocative":"orchestrionule","plural-vocative":"orchestrioanelor"}},{"word":"orchestru","pos":"noun","definitions":["alternative form of orchestră"],"forms":{"plural":"orchestre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"orchestru","accusative-definite-nominative-singular":"orchestruul","accusative-indefinite-nominative-plural":"orchestre","accusative-definite-nominative-plural":"orchestrele","dative-genitive-indefinite-singular":"orchestru","dative-definite-genitive-singular":"orchestruului","dative-genitive-indefinite-plural":"orchestre","dative-definite-genitive-plural":"orchestrelor","singular-vocative":"orchestruule","plural-vocative":"orchestrelor"}},{"word":"ordalie","pos":"noun","definitions":["ordalium, ordeal"],"forms":{"plural":"ordalii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ordalie","accusative-definite-nominative-singular":"ordalia","accusative-indefinite-nominative-plural":"ordalii","accusative-definite-nominative-plural":"ordaliile","dative-genitive-indefinite-singular":"ordalii","dative-definite-genitive-singular":"ordaliei","dative-genitive-indefinite-plural":"ordalii","dative-definite-genitive-plural":"ordaliilor","singular-vocative":"ordalie","plural-vocative":"ordaliilor"}},{"word":"Ordâncușa","pos":"name","definitions":["a river in Alba, Romania, tributary to the Gârda Seacă"],"gender":"f"},{"word":"ordeolum","pos":"noun","definitions":["a stye in the eye"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ordeolum","accusative-definite-nominative":"ordeolumul","dative-genitive-indefinite":"ordeolum","dative-definite-genitive":"ordeolumului","vocative":"ordeolumule"}},{"word":"order","pos":"noun","definitions":["order"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"order","accusative-definite-nominative":"orderul","dative-genitive-indefinite":"order","dative-definite-genitive":"orderului","vocative":"orderule"}},{"word":"ordie","pos":"noun","definitions":["Turkish or Tatar army"],"forms":{"plural":"ordii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ordie","accusative-definite-nominative-singular":"ordia","accusative-indefinite-nominative-plural":"ordii","accusative-definite-nominative-plural":"ordiile","dative-genitive-indefinite-singular":"ordii","dative-definite-genitive-singular":"ordiei","dative-genitive-indefinite-plural":"ordii","dative-definite-genitive-plural":"ordiilor","singular-vocative":"ordie","plural-vocative":"ordiilor"}},{"word":"ordin","pos":"noun","definitions":["order, command","order (rank below class and above family)","order (group of religious adherents)"],"pronunciation":"/ˈor.din/","forms":{"plural":"ordine","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ordin","accusative-definite-nominative-singular":"ordinul","accusative-indefinite-nominative-plural":"ordine","accusative-definite-nominative-plural":"ordinele","dative-genitive-indefinite-singular":"ordin","dative-definite-genitive-singular":"ordinului","dative-genitive-indefinite-plural":"ordine","dative-definite-genitive-plural":"ordinelor","singular-vocative":"ordinule","plural-vocative":"ordinelor","alternative":"ордин"}},{"word":"ordin corintic","pos":"noun","definitions":["Corinthian order"]},{"word":"ordin de plată","pos":"noun","definitions":["payment order"],"forms":{"plural":"ordine de plată"}},{"word":"ordin doric","pos":"noun","definitions":["Doric order"]},{"word":"ordina","pos":"verb","definitions":["alternative form of ordona"],"forms":{"canonical":"a ordina 1st conjugation","present-singular-third-person":"ordinează","participle-past":"ordinat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ordina","gerund":"ordinând","first-person-indicative-present-singular":"ordinez","indicative-present-second-person-singular":"ordinezi","indicative-present-singular-third-person":"ordinează","first-person-indicative-plural-present":"ordinăm","indicative-plural-present-second-person":"ordinați","indicative-plural-present-third-person":"ordinează","first-person-imperfect-indicative-singular":"ordinam","imperfect-indicative-second-person-singular":"ordinai","imperfect-indicative-singular-third-person":"ordina","first-person-imperfect-indicative-plural":"ordinam","imperfect-indicative-plural-second-person":"ordinați","imperfect-indicative-plural-third-person":"ordinau","first-person-indicative-perfect-singular":"ordinai","indicative-perfect-second-person-singular":"ordinași","indicative-perfect-singular-third-person":"ordină","first-person-indicative-perfect-plural":"ordinarăm","indicative-perfect-plural-second-person":"ordinarăți","indicative-perfect-plural-third-person":"ordinară","first-person-indicative-pluperfect-singular":"ordinasem","indicative-pluperfect-second-person-singular":"ordinaseși","indicative-pluperfect-singular-third-person":"ordinase","first-person-indicative-pluperfect-plural":"ordinaserăm","indicative-pluperfect-plural-second-person":"ordinaserăți","indicative-pluperfect-plural-third-person":"ordinaseră","first-person-present-singular-subjunctive":"să ordinez","present-second-person-singular-subjunctive":"să ordinezi","present-singular-subjunctive-third-person":"să ordineze","first-person-plural-present-subjunctive":"să ordinăm","plural-present-second-person-subjunctive":"să ordinați","plural-present-subjunctive-third-person":"să ordineze","imperative-second-person-singular":"ordinează","imperative-plural-second-person":"ordinați","imperative-negative-second-person-singular":"nu ordina","imperative-negative-plural-second-person":"nu ordinați"}},{"word":"ordinal","pos":"adj","definitions":["ordinal"],"forms":{"feminine-singular":"ordinală","masculine-plural":"ordinali","feminine-neuter-plural":"ordinale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ordinal","error-unrecognized-form-feminine-indefinite-singular":"ordinală","error-unrecognized-form-indefinite-masculine-plural":"ordinali","error-unrecognized-form-feminine-indefinite-neuter-plural":"ordinale","definite-error-unrecognized-form-masculine-neuter-singular":"ordinalul","definite-error-unrecognized-form-feminine-singular":"ordinala","definite-error-unrecognized-form-masculine-plural":"ordinalii","definite-error-unrecognized-form-feminine-neuter-plural":"ordinalele"}},{"word":"ordinar","pos":"adj","definitions":["ordinary"],"forms":{"feminine-singular":"ordinară","masculine-plural":"ordinari","feminine-neuter-plural":"ordinare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ordinar","error-unrecognized-form-feminine-indefinite-singular":"ordinară","error-unrecognized-form-indefinite-masculine-plural":"ordinari","error-unrecognized-form-feminine-indefinite-neuter-plural":"ordinare","definite-error-unrecognized-form-masculine-neuter-singular":"ordinarul","definite-error-unrecognized-form-feminine-singular":"ordinara","definite-error-unrecognized-form-masculine-plural":"ordinarii","definite-error-unrecognized-form-feminine-neuter-plural":"ordinarele"}},{"word":"ordinare","pos":"noun","definitions":["obsolete form of ordonare"],"forms":{"plural":"ordinări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ordinare","accusative-definite-nominative-singular":"ordinarea","accusative-indefinite-nominative-plural":"ordinări","accusative-definite-nominative-plural":"ordinările","dative-genitive-indefinite-singular":"ordinări","dative-definite-genitive-singular":"ordinării","dative-genitive-indefinite-plural":"ordinări","dative-definite-genitive-plural":"ordinărilor","singular-vocative":"ordinare","plural-vocative":"ordinărilor"}},{"word":"ordinariat","pos":"noun","definitions":["ordinariate"],"forms":{"plural":"ordinariate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ordinariat","accusative-definite-nominative-singular":"ordinariatul","accusative-indefinite-nominative-plural":"ordinariate","accusative-definite-nominative-plural":"ordinariatele","dative-genitive-indefinite-singular":"ordinariat","dative-definite-genitive-singular":"ordinariatului","dative-genitive-indefinite-plural":"ordinariate","dative-definite-genitive-plural":"ordinariatelor","singular-vocative":"ordinariatule","plural-vocative":"ordinariatelor"}},{"word":"ordinație","pos":"noun","definitions":["ordination"],"forms":{"plural":"ordinații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ordinație","accusative-definite-nominative-singular":"ordinația","accusative-indefinite-nominative-plural":"ordinații","accusative-definite-nominative-plural":"ordinațiile","dative-genitive-indefinite-singular":"ordinații","dative-definite-genitive-singular":"ordinației","dative-genitive-indefinite-plural":"ordinații","dative-definite-genitive-plural":"ordinațiilor","singular-vocative":"ordinație","plural-vocative":"ordinațiilor"}},{"word":"ordinator","pos":"noun","definitions":["computer"],"forms":{"plural":"ordinatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ordinator","accusative-definite-nominative-singular":"ordinatorul","accusative-indefinite-nominative-plural":"ordinatore","accusative-definite-nominative-plural":"ordinatorele","dative-genitive-indefinite-singular":"ordinator","dative-definite-genitive-singular":"ordinatorului","dative-genitive-indefinite-plural":"ordinatore","dative-definite-genitive-plural":"ordinatorelor","singular-vocative":"ordinatorule","plural-vocative":"ordinatorelor"}},{"word":"ordine","pos":"noun","definitions":["order (sequence, succession)","order (things being where they should be)","order (conformity, peace, discipline)","synonym of ordin (“order, category”)","synonym of ordin (“order, command”)"],"pronunciation":"/ˈor.di.ne/","examples":[{"ro":"ordine crescătoare","en":"ascending order"},{"ro":"ordine descrescătoare","en":"descending order"},{"ro":"a face ordine","en":"to tidy up, put everything in its place"}],"forms":{"plural":"ordini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ordine","accusative-definite-nominative-singular":"ordinea","accusative-indefinite-nominative-plural":"ordini","accusative-definite-nominative-plural":"ordinile","dative-genitive-indefinite-singular":"ordini","dative-definite-genitive-singular":"ordinii","dative-genitive-indefinite-plural":"ordini","dative-definite-genitive-plural":"ordinilor","singular-vocative":"ordine","plural-vocative":"ordinilor","alternative":"ордине"}},{"word":"ordine","pos":"noun","definitions":["indefinite plural of ordin (“order, command”)"],"pronunciation":"/ˈor.di.ne/","forms":{"alternative":"ордине"}},{"word":"ordine alfabetică","pos":"noun","definitions":["alphabetical order"]},{"word":"ordine de zi","pos":"noun","definitions":["order of the day, agenda"]},{"word":"ordon","pos":"verb","definitions":["first-person singular present indicative/subjunctive of ordona"],"pronunciation":"[orˈdon]"},{"word":"ordona","pos":"verb","definitions":["to give an order or command"],"pronunciation":"/or.doˈna/","forms":{"canonical":"a ordona 1st conjugation","present-singular-third-person":"ordonă","participle-past":"ordonat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a ordona","gerund":"ordonând","first-person-indicative-present-singular":"ordon","indicative-present-second-person-singular":"ordoni","indicative-present-singular-third-person":"ordonă","first-person-indicative-plural-present":"ordonăm","indicative-plural-present-second-person":"ordonați","indicative-plural-present-third-person":"ordonă","first-person-imperfect-indicative-singular":"ordonam","imperfect-indicative-second-person-singular":"ordonai","imperfect-indicative-singular-third-person":"ordona","first-person-imperfect-indicative-plural":"ordonam","imperfect-indicative-plural-second-person":"ordonați","imperfect-indicative-plural-third-person":"ordonau","first-person-indicative-perfect-singular":"ordonai","indicative-perfect-second-person-singular":"ordonași","indicative-perfect-singular-third-person":"ordonă","first-person-indicative-perfect-plural":"ordonarăm","indicative-perfect-plural-second-person":"ordonarăți","indicative-perfect-plural-third-person":"ordonară","first-person-indicative-pluperfect-singular":"ordonasem","indicative-pluperfect-second-person-singular":"ordonaseși","indicative-pluperfect-singular-third-person":"ordonase","first-person-indicative-pluperfect-plural":"ordonaserăm","indicative-pluperfect-plural-second-person":"ordonaserăți","indicative-pluperfect-plural-third-person":"ordonaseră","first-person-present-singular-subjunctive":"să ordon","present-second-person-singular-subjunctive":"să ordoni","present-singular-subjunctive-third-person":"să ordone","first-person-plural-present-subjunctive":"să ordonăm","plural-present-second-person-subjunctive":"să ordonați","plural-present-subjunctive-third-person":"să ordone","imperative-second-person-singular":"ordonă","imperative-plural-second-person":"ordonați","imperative-negative-second-person-singular":"nu ordona","imperative-negative-plural-second-person":"nu ordonați","alternative-dated":"ordina","alternative":"ордона"}},{"word":"ordona","pos":"verb","definitions":["to arrange, put in order"],"pronunciation":"/or.doˈna/","forms":{"canonical":"a ordona 1st conjugation","present-singular-third-person":"ordonează","participle-past":"ordonat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ordona","gerund":"ordonând","first-person-indicative-present-singular":"ordonez","indicative-present-second-person-singular":"ordonezi","indicative-present-singular-third-person":"ordonează","first-person-indicative-plural-present":"ordonăm","indicative-plural-present-second-person":"ordonați","indicative-plural-present-third-person":"ordonează","first-person-imperfect-indicative-singular":"ordonam","imperfect-indicative-second-person-singular":"ordonai","imperfect-indicative-singular-third-person":"ordona","first-person-imperfect-indicative-plural":"ordonam","imperfect-indicative-plural-second-person":"ordonați","imperfect-indicative-plural-third-person":"ordonau","first-person-indicative-perfect-singular":"ordonai","indicative-perfect-second-person-singular":"ordonași","indicative-perfect-singular-third-person":"ordonă","first-person-indicative-perfect-plural":"ordonarăm","indicative-perfect-plural-second-person":"ordonarăți","indicative-perfect-plural-third-person":"ordonară","first-person-indicative-pluperfect-singular":"ordonasem","indicative-pluperfect-second-person-singular":"ordonaseși","indicative-pluperfect-singular-third-person":"ordonase","first-person-indicative-pluperfect-plural":"ordonaserăm","indicative-pluperfect-plural-second-person":"ordonaserăți","indicative-pluperfect-plural-third-person":"ordonaseră","first-person-present-singular-subjunctive":"să ordonez","present-second-person-singular-subjunctive":"să ordonezi","present-singular-subjunctive-third-person":"să ordoneze","first-person-plural-present-subjunctive":"să ordonăm","plural-present-second-person-subjunctive":"să ordonați","plural-present-subjunctive-third-person":"să ordoneze","imperative-second-person-singular":"ordonează","imperative-plural-second-person":"ordonați","imperative-negative-second-person-singular":"nu ordona","imperative-negative-plural-second-person":"nu ordonați","alternative-dated":"ordina","alternative":"ордона"}},{"word":"ordonanța","pos":"verb","definitions":["to authorize (a payment)"],"forms":{"canonical":"a ordonanța 1st conjugation","present-singular-third-person":"ordonanțează","participle-past":"ordonanțat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ordonanța","gerund":"ordonanțând","first-person-indicative-present-singular":"ordonanțez","indicative-present-second-person-singular":"ordonanțezi","indicative-present-singular-third-person":"ordonanțează","first-person-indicative-plural-present":"ordonanțăm","indicative-plural-present-second-person":"ordonanțați","indicative-plural-present-third-person":"ordonanțează","first-person-imperfect-indicative-singular":"ordonanțam","imperfect-indicative-second-person-singular":"ordonanțai","imperfect-indicative-singular-third-person":"ordonanța","first-person-imperfect-indicative-plural":"ordonanțam","imperfect-indicative-plural-second-person":"ordonanțați","imperfect-indicative-plural-third-person":"ordonanțau","first-person-indicative-perfect-singular":"ordonanțai","indicative-perfect-second-person-singular":"ordonanțași","indicative-perfect-singular-third-person":"ordonanță","first-person-indicative-perfect-plural":"ordonanțarăm","indicative-perfect-plural-second-person":"ordonanțarăți","indicative-perfect-plural-third-person":"ordonanțară","first-person-indicative-pluperfect-singular":"ordonanțasem","indicative-pluperfect-second-person-singular":"ordonanțaseși","indicative-pluperfect-singular-third-person":"ordonanțase","first-person-indicative-pluperfect-plural":"ordonanțaserăm","indicative-pluperfect-plural-second-person":"ordonanțaserăți","indicative-pluperfect-plural-third-person":"ordonanțaseră","first-person-present-singular-subjunctive":"să ordonanțez","present-second-person-singular-subjunctive":"să ordonanțezi","present-singular-subjunctive-third-person":"să ordonanțeze","first-person-plural-present-subjunctive":"să ordonanțăm","plural-present-second-person-subjunctive":"să ordonanțați","plural-present-subjunctive-third-person":"să ordonanțeze","imperative-second-person-singular":"ordonanțează","imperative-plural-second-person":"ordonanțați","imperative-negative-second-person-singular":"nu ordonanța","imperative-negative-plural-second-person":"nu ordonanțați"}},{"word":"ordonanță","pos":"noun","definitions":["ordinance"],"forms":{"plural":"ordonanțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ordonanță","accusative-definite-nominative-singular":"ordonanța","accusative-indefinite-nominative-plural":"ordonanțe","accusative-definite-nominative-plural":"ordonanțele","dative-genitive-indefinite-singular":"ordonanțe","dative-definite-genitive-singular":"ordonanței","dative-genitive-indefinite-plural":"ordonanțe","dative-definite-genitive-plural":"ordonanțelor","singular-vocative":"ordonanță","plural-vocative":"ordonanțelor"}},{"word":"ordonanță de plată","pos":"noun","definitions":["payment order"],"forms":{"plural":"ordonanțe de plată"}},{"word":"ordonare","pos":"noun","definitions":["ordering"],"forms":{"plural":"ordonări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ordonare","accusative-definite-nominative-singular":"ordonarea","accusative-indefinite-nominative-plural":"ordonări","accusative-definite-nominative-plural":"ordonările","dative-genitive-indefinite-singular":"ordonări","dative-definite-genitive-singular":"ordonării","dative-genitive-indefinite-plural":"ordonări","dative-definite-genitive-plural":"ordonărilor","singular-vocative":"ordonare","plural-vocative":"ordonărilor"}},{"word":"ordonare alfabetică","pos":"noun","definitions":["alphabetical order"],"forms":{"plural":"ordonări alfabetice"}},{"word":"ordonat","pos":"adj","definitions":["orderly"],"forms":{"feminine-singular":"ordonată","masculine-plural":"ordonați","feminine-neuter-plural":"ordonate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ordonat","error-unrecognized-form-feminine-indefinite-singular":"ordonată","error-unrecognized-form-indefinite-masculine-plural":"ordonați","error-unrecognized-form-feminine-indefinite-neuter-plural":"ordonate","definite-error-unrecognized-form-masculine-neuter-singular":"ordonatul","definite-error-unrecognized-form-feminine-singular":"ordonata","definite-error-unrecognized-form-masculine-plural":"ordonații","definite-error-unrecognized-form-feminine-neuter-plural":"ordonatele"}},{"word":"ordonată","pos":"noun","definitions":["ordinate"],"forms":{"plural":"ordonate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ordonată","accusative-definite-nominative-singular":"ordonata","accusative-indefinite-nominative-plural":"ordonate","accusative-definite-nominative-plural":"ordonatele","dative-genitive-indefinite-singular":"ordonate","dative-definite-genitive-singular":"ordonatei","dative-genitive-indefinite-plural":"ordonate","dative-definite-genitive-plural":"ordonatelor","singular-vocative":"ordonată","plural-vocative":"ordonatelor"}},{"word":"ordonatoare","pos":"noun","definitions":["female equivalent of ordonator"],"forms":{"plural":"ordonatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"ordonatoare","accusative-definite-nominative-singular":"ordonatoarea","accusative-indefinite-nominative-plural":"ordonatoare","accusative-definite-nominative-plural":"ordonatoarele","dative-genitive-indefinite-singular":"ordonatoare","dative-definite-genitive-singular":"ordonatoarei","dative-genitive-indefinite-plural":"ordonatoare","dative-definite-genitive-plural":"ordonatoarelor","singular-vocative":"ordonatoare","plural-vocative":"ordonatoarelor"}},{"word":"ordonator","pos":"noun","definitions":["organizer"],"forms":{"plural":"ordonatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ordonator","accusative-definite-nominative-singular":"ordonatorul","accusative-indefinite-nominative-plural":"ordonatori","accusative-definite-nominative-plural":"ordonatorii","dative-genitive-indefinite-singular":"ordonator","dative-definite-genitive-singular":"ordonatorului","dative-genitive-indefinite-plural":"ordonatori","dative-definite-genitive-plural":"ordonatorilor","singular-vocative":"ordonatorule","plural-vocative":"ordonatorilor"}},{"word":"ordoni","pos":"verb","definitions":["second-person singular present indicative/subjunctive of ordona"],"pronunciation":"[orˈdonʲ]"},{"word":"ordovician","pos":"noun","definitions":["Ordovician"],"forms":{"plural":"ordovicieni","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ordovician","accusative-definite-nominative-singular":"ordovicianul","accusative-indefinite-nominative-plural":"ordovicieni","accusative-definite-nominative-plural":"ordovicienile","dative-genitive-indefinite-singular":"ordovician","dative-definite-genitive-singular":"ordovicianului","dative-genitive-indefinite-plural":"ordovicieni","dative-definite-genitive-plural":"ordovicienilor","singular-vocative":"ordovicianule","plural-vocative":"ordovicienilor"}},{"word":"ordură","pos":"noun","definitions":["garbage"],"forms":{"plural":"orduri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ordură","accusative-definite-nominative-singular":"ordura","accusative-indefinite-nominative-plural":"orduri","accusative-definite-nominative-plural":"ordurile","dative-genitive-indefinite-singular":"orduri","dative-definite-genitive-singular":"ordurii","dative-genitive-indefinite-plural":"orduri","dative-definite-genitive-plural":"ordurilor","singular-vocative":"ordură","plural-vocative":"ordurilor"}},{"word":"ordurier","pos":"adj","definitions":["foul, filthy","obscene"],"forms":{"feminine-singular":"ordurieră","masculine-plural":"ordurieri","feminine-neuter-plural":"orduriere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ordurier","error-unrecognized-form-feminine-indefinite-singular":"ordurieră","error-unrecognized-form-indefinite-masculine-plural":"ordurieri","error-unrecognized-form-feminine-indefinite-neuter-plural":"orduriere","definite-error-unrecognized-form-masculine-neuter-singular":"ordurierul","definite-error-unrecognized-form-feminine-singular":"orduriera","definite-error-unrecognized-form-masculine-plural":"ordurierii","definite-error-unrecognized-form-feminine-neuter-plural":"ordurierele"}},{"word":"ore","pos":"noun","definitions":["inflection of oră:","plural","genitive/dative singular"]},{"word":"ore suplimentare","pos":"noun","definitions":["overtime"]},{"word":"oreadă","pos":"noun","definitions":["oread"],"forms":{"plural":"oreade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oreadă","accusative-definite-nominative-singular":"oreada","accusative-indefinite-nominative-plural":"oreade","accusative-definite-nominative-plural":"oreadele","dative-genitive-indefinite-singular":"oreade","dative-definite-genitive-singular":"oreadei","dative-genitive-indefinite-plural":"oreade","dative-definite-genitive-plural":"oreadelor","singular-vocative":"oreadă","plural-vocative":"oreadelor"}},{"word":"Oreasca","pos":"name","definitions":["a village in Lungulețu, Dâmbovița County, Romania"],"gender":"f"},{"word":"oreav","pos":"noun","definitions":["valley through which water is flowing only when raining"],"forms":{"plural":"oreave","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oreav","accusative-definite-nominative-singular":"oreavul","accusative-indefinite-nominative-plural":"oreave","accusative-definite-nominative-plural":"oreavele","dative-genitive-indefinite-singular":"oreav","dative-definite-genitive-singular":"oreavului","dative-genitive-indefinite-plural":"oreave","dative-definite-genitive-plural":"oreavelor","singular-vocative":"oreavule","plural-vocative":"oreavelor"}},{"word":"Oreavu","pos":"name","definitions":["a village in Gugești, Vrancea County, Romania"],"gender":"m"},{"word":"Oreavul","pos":"name","definitions":["a village in Valea Râmnicului, Buzău County, Romania"],"gender":"m"},{"word":"orednic","pos":"noun","definitions":["ruler, leader"],"forms":{"plural":"orednici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orednic","accusative-definite-nominative-singular":"orednicul","accusative-indefinite-nominative-plural":"orednici","accusative-definite-nominative-plural":"orednicii","dative-genitive-indefinite-singular":"orednic","dative-definite-genitive-singular":"orednicului","dative-genitive-indefinite-plural":"orednici","dative-definite-genitive-plural":"orednicilor","singular-vocative":"orednicule","plural-vocative":"orednicilor"}},{"word":"Oregon","pos":"name","definitions":["Oregon (a state in the Pacific Northwest region of the United States)"],"gender":"n"},{"word":"Orehovca","pos":"name","definitions":["a village in Salcia, Taraclia Raion, Moldova"],"gender":"f"},{"word":"orei","pos":"noun","definitions":["definite dative/genitive singular of oră"]},{"word":"oreion","pos":"noun","definitions":["mumps"],"forms":{"plural":"oreioane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oreion","accusative-definite-nominative-singular":"oreionul","accusative-indefinite-nominative-plural":"oreioane","accusative-definite-nominative-plural":"oreioanele","dative-genitive-indefinite-singular":"oreion","dative-definite-genitive-singular":"oreionului","dative-genitive-indefinite-plural":"oreioane","dative-definite-genitive-plural":"oreioanelor","singular-vocative":"oreionule","plural-vocative":"oreioanelor"}},{"word":"orelist","pos":"adj","definitions":["otorhinolaryngologist"],"forms":{"feminine-singular":"orelistă","masculine-plural":"oreliști","feminine-neuter-plural":"oreliste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orelist","error-unrecognized-form-feminine-indefinite-singular":"orelistă","error-unrecognized-form-indefinite-masculine-plural":"oreliști","error-unrecognized-form-feminine-indefinite-neuter-plural":"oreliste","definite-error-unrecognized-form-masculine-neuter-singular":"orelistul","definite-error-unrecognized-form-feminine-singular":"orelista","definite-error-unrecognized-form-masculine-plural":"oreliștii","definite-error-unrecognized-form-feminine-neuter-plural":"orelistele"}},{"word":"orelor","pos":"noun","definitions":["inflection of oră:","definite genitive/dative plural","vocative plural"]},{"word":"Orescu","pos":"name","definitions":["a surname"],"gender":"m"},{"word":"oreșniță","pos":"noun","definitions":["earthnut pea, tuberous pea, tuberous vetchling (Lathyrus tuberosus)"],"forms":{"plural":"oreșnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oreșniță","accusative-definite-nominative-singular":"oreșnița","accusative-indefinite-nominative-plural":"oreșnițe","accusative-definite-nominative-plural":"oreșnițele","dative-genitive-indefinite-singular":"oreșnițe","dative-definite-genitive-singular":"oreșniței","dative-genitive-indefinite-plural":"oreșnițe","dative-definite-genitive-plural":"oreșnițelor","singular-vocative":"oreșniță","plural-vocative":"oreșnițelor"}},{"word":"Oreviceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Oreviceanu"}},{"word":"Orevița Mare","pos":"name","definitions":["a village in Vânju Mare, Mehedinți County, Romania"],"gender":"f"},{"word":"orez","pos":"noun","definitions":["rice"],"pronunciation":"/oˈrez/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"orez","accusative-definite-nominative":"orezul","dative-genitive-indefinite":"orez","dative-definite-genitive":"orezului","vocative":"orezule"}},{"word":"orezar","pos":"noun","definitions":["rice grower","man of East Asian descent"],"forms":{"plural":"orezari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orezar","accusative-definite-nominative-singular":"orezarul","accusative-indefinite-nominative-plural":"orezari","accusative-definite-nominative-plural":"orezarii","dative-genitive-indefinite-singular":"orezar","dative-definite-genitive-singular":"orezarului","dative-genitive-indefinite-plural":"orezari","dative-definite-genitive-plural":"orezarilor","singular-vocative":"orezarule","plural-vocative":"orezarilor"}},{"word":"orezărie","pos":"noun","definitions":["rice paddy"],"forms":{"plural":"orezării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"orezărie","accusative-definite-nominative-singular":"orezăria","accusative-indefinite-nominative-plural":"orezării","accusative-definite-nominative-plural":"orezăriile","dative-genitive-indefinite-singular":"orezării","dative-definite-genitive-singular":"orezăriei","dative-genitive-indefinite-plural":"orezării","dative-definite-genitive-plural":"orezăriilor","singular-vocative":"orezărie","plural-vocative":"orezăriilor"}},{"word":"Orezu","pos":"name","definitions":["a village in Ciochina, Ialomița County, Romania"],"gender":"m"},{"word":"orezul","pos":"noun","definitions":["definite nominative/accusative singular of orez"]},{"word":"orfan","pos":"adj","definitions":["orphan, orphaned","deficient, destitute, deprived"],"pronunciation":"/orˈfan/","forms":{"feminine-singular":"orfană","masculine-plural":"orfani","feminine-neuter-plural":"orfane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orfan","error-unrecognized-form-feminine-indefinite-singular":"orfană","error-unrecognized-form-indefinite-masculine-plural":"orfani","error-unrecognized-form-feminine-indefinite-neuter-plural":"orfane","definite-error-unrecognized-form-masculine-neuter-singular":"orfanul","definite-error-unrecognized-form-feminine-singular":"orfana","definite-error-unrecognized-form-masculine-plural":"orfanii","definite-error-unrecognized-form-feminine-neuter-plural":"orfanele","alternative-archaic":"oarfăn"}},{"word":"orfan","pos":"noun","definitions":["orphan (child without parents)"],"pronunciation":"/orˈfan/","forms":{"plural":"orfani","feminine":"equivalent orfană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orfan","accusative-definite-nominative-singular":"orfanul","accusative-indefinite-nominative-plural":"orfani","accusative-definite-nominative-plural":"orfanii","dative-genitive-indefinite-singular":"orfan","dative-definite-genitive-singular":"orfanului","dative-genitive-indefinite-plural":"orfani","dative-definite-genitive-plural":"orfanilor","singular-vocative":"orfanule","plural-vocative":"orfanilor","alternative-archaic":"oarfăn"}},{"word":"orfană","pos":"noun","definitions":["female equivalent of orfan"],"forms":{"plural":"orfane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orfană","accusative-definite-nominative-singular":"orfana","accusative-indefinite-nominative-plural":"orfane","accusative-definite-nominative-plural":"orfanele","dative-genitive-indefinite-singular":"orfane","dative-definite-genitive-singular":"orfanei","dative-genitive-indefinite-plural":"orfane","dative-definite-genitive-plural":"orfanelor","singular-vocative":"orfană","plural-vocative":"orfanelor"}},{"word":"orfanotrofie","pos":"noun","definitions":["orphanage"],"forms":{"plural":"orfanotrofii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"orfanotrofie","accusative-definite-nominative-singular":"orfanotrofia","accusative-indefinite-nominative-plural":"orfanotrofii","accusative-definite-nominative-plural":"orfanotrofiile","dative-genitive-indefinite-singular":"orfanotrofii","dative-definite-genitive-singular":"orfanotrofiei","dative-genitive-indefinite-plural":"orfanotrofii","dative-definite-genitive-plural":"orfanotrofiilor","singular-vocative":"orfanotrofie","plural-vocative":"orfanotrofiilor"}},{"word":"Orfanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Orfanu"}},{"word":"orfăurar","pos":"noun","definitions":["goldsmith, silversmith"],"forms":{"plural":"orfăurari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orfăurar","accusative-definite-nominative-singular":"orfăurarul","accusative-indefinite-nominative-plural":"orfăurari","accusative-definite-nominative-plural":"orfăurarii","dative-genitive-indefinite-singular":"orfăurar","dative-definite-genitive-singular":"orfăurarului","dative-genitive-indefinite-plural":"orfăurari","dative-definite-genitive-plural":"orfăurarilor","singular-vocative":"orfăurarule","plural-vocative":"orfăurarilor"}},{"word":"orfăurărie","pos":"noun","definitions":["alternative form of orfevrărie"],"forms":{"plural":"orfăurării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"orfăurărie","accusative-definite-nominative-singular":"orfăurăria","accusative-indefinite-nominative-plural":"orfăurării","accusative-definite-nominative-plural":"orfăurăriile","dative-genitive-indefinite-singular":"orfăurării","dative-definite-genitive-singular":"orfăurăriei","dative-genitive-indefinite-plural":"orfăurării","dative-definite-genitive-plural":"orfăurăriilor","singular-vocative":"orfăurărie","plural-vocative":"orfăurăriilor"}},{"word":"orfelin","pos":"noun","definitions":["orphan"],"forms":{"plural":"orfelini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orfelin","accusative-definite-nominative-singular":"orfelinul","accusative-indefinite-nominative-plural":"orfelini","accusative-definite-nominative-plural":"orfelinii","dative-genitive-indefinite-singular":"orfelin","dative-definite-genitive-singular":"orfelinului","dative-genitive-indefinite-plural":"orfelini","dative-definite-genitive-plural":"orfelinilor","singular-vocative":"orfelinule","plural-vocative":"orfelinilor"}},{"word":"orfelină","pos":"noun","definitions":["female equivalent of orfelin"],"forms":{"plural":"orfeline","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orfelină","accusative-definite-nominative-singular":"orfelina","accusative-indefinite-nominative-plural":"orfeline","accusative-definite-nominative-plural":"orfelinele","dative-genitive-indefinite-singular":"orfeline","dative-definite-genitive-singular":"orfelinei","dative-genitive-indefinite-plural":"orfeline","dative-definite-genitive-plural":"orfelinelor","singular-vocative":"orfelină","plural-vocative":"orfelinelor"}},{"word":"orfelinat","pos":"noun","definitions":["orphanage"],"forms":{"plural":"orfelinate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"orfelinat","accusative-definite-nominative-singular":"orfelinatul","accusative-indefinite-nominative-plural":"orfelinate","accusative-definite-nominative-plural":"orfelinatele","dative-genitive-indefinite-singular":"orfelinat","dative-definite-genitive-singular":"orfelinatului","dative-genitive-indefinite-plural":"orfelinate","dative-definite-genitive-plural":"orfelinatelor","singular-vocative":"orfelinatule","plural-vocative":"orfelinatelor"}},{"word":"orfeonist","pos":"noun","definitions":["a member of a choral society"],"forms":{"plural":"orfeoniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orfeonist","accusative-definite-nominative-singular":"orfeonistul","accusative-indefinite-nominative-plural":"orfeoniști","accusative-definite-nominative-plural":"orfeoniștii","dative-genitive-indefinite-singular":"orfeonist","dative-definite-genitive-singular":"orfeonistului","dative-genitive-indefinite-plural":"orfeoniști","dative-definite-genitive-plural":"orfeoniștilor","singular-vocative":"orfeonistule","plural-vocative":"orfeoniștilor"}},{"word":"Orfeu","pos":"name","definitions":["Orpheus (musician who failed to retrieve his wife from Hades)"],"gender":"m"},{"word":"orfevrărie","pos":"noun","definitions":["goldsmithing"],"forms":{"plural":"orfevrării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"orfevrărie","accusative-definite-nominative-singular":"orfevrăria","accusative-indefinite-nominative-plural":"orfevrării","accusative-definite-nominative-plural":"orfevrăriile","dative-genitive-indefinite-singular":"orfevrării","dative-definite-genitive-singular":"orfevrăriei","dative-genitive-indefinite-plural":"orfevrării","dative-definite-genitive-plural":"orfevrăriilor","singular-vocative":"orfevrărie","plural-vocative":"orfevrăriilor"}},{"word":"orfevrerie","pos":"noun","definitions":["alternative form of orfevrărie"],"forms":{"plural":"orfevrerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"orfevrerie","accusative-definite-nominative-singular":"orfevreria","accusative-indefinite-nominative-plural":"orfevrerii","accusative-definite-nominative-plural":"orfevreriile","dative-genitive-indefinite-singular":"orfevrerii","dative-definite-genitive-singular":"orfevreriei","dative-genitive-indefinite-plural":"orfevrerii","dative-definite-genitive-plural":"orfevreriilor","singular-vocative":"orfevrerie","plural-vocative":"orfevreriilor"}},{"word":"orfevrier","pos":"adj","definitions":["goldsmith"],"forms":{"feminine-singular":"orfevrieră","masculine-plural":"orfevrieri","feminine-neuter-plural":"orfevriere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orfevrier","error-unrecognized-form-feminine-indefinite-singular":"orfevrieră","error-unrecognized-form-indefinite-masculine-plural":"orfevrieri","error-unrecognized-form-feminine-indefinite-neuter-plural":"orfevriere","definite-error-unrecognized-form-masculine-neuter-singular":"orfevrierul","definite-error-unrecognized-form-feminine-singular":"orfevriera","definite-error-unrecognized-form-masculine-plural":"orfevrierii","definite-error-unrecognized-form-feminine-neuter-plural":"orfevrierele"}},{"word":"orfevru","pos":"noun","definitions":["goldsmith"],"forms":{"plural":"orfevri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orfevru","accusative-definite-nominative-singular":"orfevruul","accusative-indefinite-nominative-plural":"orfevri","accusative-definite-nominative-plural":"orfevrii","dative-genitive-indefinite-singular":"orfevru","dative-definite-genitive-singular":"orfevruului","dative-genitive-indefinite-plural":"orfevri","dative-definite-genitive-plural":"orfevrilor","singular-vocative":"orfevruule","plural-vocative":"orfevrilor"}},{"word":"orfic","pos":"adj","definitions":["Orphic"],"pronunciation":"/ˈor.fik/","forms":{"feminine-singular":"orfică","masculine-plural":"orfici","feminine-neuter-plural":"orfice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orfic","error-unrecognized-form-feminine-indefinite-singular":"orfică","error-unrecognized-form-indefinite-masculine-plural":"orfici","error-unrecognized-form-feminine-indefinite-neuter-plural":"orfice","definite-error-unrecognized-form-masculine-neuter-singular":"orficul","definite-error-unrecognized-form-feminine-singular":"orfica","definite-error-unrecognized-form-masculine-plural":"orficii","definite-error-unrecognized-form-feminine-neuter-plural":"orficele"}},{"word":"orfism","pos":"noun","definitions":["Orphism"],"pronunciation":"/orˈfism/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"orfism","accusative-definite-nominative-singular":"orfismul","accusative-indefinite-nominative-plural":"orfisme","accusative-definite-nominative-plural":"orfismele","dative-genitive-indefinite-singular":"orfism","dative-definite-genitive-singular":"orfismului","dative-genitive-indefinite-plural":"orfisme","dative-definite-genitive-plural":"orfismelor","singular-vocative":"orfismule","plural-vocative":"orfismelor"}},{"word":"orgă","pos":"noun","definitions":["organ (instrument)"],"forms":{"plural":"orgi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orgă","accusative-definite-nominative-singular":"orga","accusative-indefinite-nominative-plural":"orge","accusative-definite-nominative-plural":"orgele","dative-genitive-indefinite-singular":"orge","dative-definite-genitive-singular":"orgei","dative-genitive-indefinite-plural":"orge","dative-definite-genitive-plural":"orgelor","singular-vocative":"orgă","plural-vocative":"orgelor"}},{"word":"organ","pos":"noun","definitions":["organ (part of organism)","organ (musical instrument)"],"forms":{"plural":"organe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"organ","accusative-definite-nominative-singular":"organul","accusative-indefinite-nominative-plural":"organe","accusative-definite-nominative-plural":"organele","dative-genitive-indefinite-singular":"organ","dative-definite-genitive-singular":"organului","dative-genitive-indefinite-plural":"organe","dative-definite-genitive-plural":"organelor","singular-vocative":"organule","plural-vocative":"organelor"}},{"word":"organ legislativ","pos":"noun","definitions":["legislative body"],"forms":{"plural":"organe legislative"}},{"word":"organ sexual","pos":"noun","definitions":["sex organ"],"forms":{"plural":"organe sexuale"}},{"word":"orgănaș","pos":"noun","definitions":["organist"],"forms":{"plural":"orgănași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orgănaș","accusative-definite-nominative-singular":"orgănașul","accusative-indefinite-nominative-plural":"orgănași","accusative-definite-nominative-plural":"orgănașii","dative-genitive-indefinite-singular":"orgănaș","dative-definite-genitive-singular":"orgănașului","dative-genitive-indefinite-plural":"orgănași","dative-definite-genitive-plural":"orgănașilor","singular-vocative":"orgănașule","plural-vocative":"orgănașilor"}},{"word":"organdi","pos":"noun","definitions":["organdy"],"forms":{"plural":"organdiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"organdi","accusative-definite-nominative-singular":"organdiul","accusative-indefinite-nominative-plural":"organdiuri","accusative-definite-nominative-plural":"organdiurile","dative-genitive-indefinite-singular":"organdi","dative-definite-genitive-singular":"organdiului","dative-genitive-indefinite-plural":"organdiuri","dative-definite-genitive-plural":"organdiurilor","singular-vocative":"organdiule","plural-vocative":"organdiurilor"}},{"word":"organdin","pos":"noun","definitions":["alternative form of organdi"],"forms":{"plural":"organdinuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"organdin","accusative-definite-nominative-singular":"organdinul","accusative-indefinite-nominative-plural":"organdinuri","accusative-definite-nominative-plural":"organdinurile","dative-genitive-indefinite-singular":"organdin","dative-definite-genitive-singular":"organdinului","dative-genitive-indefinite-plural":"organdinuri","dative-definite-genitive-plural":"organdinurilor","singular-vocative":"organdinule","plural-vocative":"organdinurilor"}},{"word":"organic","pos":"adj","definitions":["organic (all meanings)"],"forms":{"feminine-singular":"organică","masculine-plural":"organici","feminine-neuter-plural":"organice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"organic","error-unrecognized-form-feminine-indefinite-singular":"organică","error-unrecognized-form-indefinite-masculine-plural":"organici","error-unrecognized-form-feminine-indefinite-neuter-plural":"organice","definite-error-unrecognized-form-masculine-neuter-singular":"organicul","definite-error-unrecognized-form-feminine-singular":"organica","definite-error-unrecognized-form-masculine-plural":"organicii","definite-error-unrecognized-form-feminine-neuter-plural":"organicele"}},{"word":"organicism","pos":"noun","definitions":["organicism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"organicism","accusative-definite-nominative":"organicismul","dative-genitive-indefinite":"organicism","dative-definite-genitive":"organicismului","vocative":"organicismule"}},{"word":"organicist","pos":"noun","definitions":["organicist"],"forms":{"plural":"organiciști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"organicist","accusative-definite-nominative-singular":"organicistul","accusative-indefinite-nominative-plural":"organiciști","accusative-definite-nominative-plural":"organiciștii","dative-genitive-indefinite-singular":"organicist","dative-definite-genitive-singular":"organicistului","dative-genitive-indefinite-plural":"organiciști","dative-definite-genitive-plural":"organiciștilor","singular-vocative":"organicistule","plural-vocative":"organiciștilor"}},{"word":"organicistă","pos":"noun","definitions":["female equivalent of organicist"],"forms":{"plural":"organiciste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"organicistă","accusative-definite-nominative-singular":"organicista","accusative-indefinite-nominative-plural":"organiciste","accusative-definite-nominative-plural":"organicistele","dative-genitive-indefinite-singular":"organiciste","dative-definite-genitive-singular":"organicistei","dative-genitive-indefinite-plural":"organiciste","dative-definite-genitive-plural":"organicistelor","singular-vocative":"organicistă","plural-vocative":"organicistelor"}},{"word":"organicitate","pos":"noun","definitions":["organicity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"organicitate","accusative-definite-nominative":"organicitatea","dative-genitive-indefinite":"organicități","dative-definite-genitive":"organicității","vocative":"-"}},{"word":"organigramă","pos":"noun","definitions":["organization chart"],"forms":{"plural":"organigrame","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"organigramă","accusative-definite-nominative-singular":"organigrama","accusative-indefinite-nominative-plural":"organigrame","accusative-definite-nominative-plural":"organigramele","dative-genitive-indefinite-singular":"organigrame","dative-definite-genitive-singular":"organigramei","dative-genitive-indefinite-plural":"organigrame","dative-definite-genitive-plural":"organigramelor","singular-vocative":"organigramă","plural-vocative":"organigramelor"}},{"word":"organisi","pos":"verb","definitions":["to organize"],"forms":{"canonical":"a organisi 4th conjugation","present-singular-third-person":"organisește","participle-past":"organisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a organisi","gerund":"organisind","first-person-indicative-present-singular":"organisesc","indicative-present-second-person-singular":"organisești","indicative-present-singular-third-person":"organisește","first-person-indicative-plural-present":"organisim","indicative-plural-present-second-person":"organisiți","indicative-plural-present-third-person":"organisesc","first-person-imperfect-indicative-singular":"organiseam","imperfect-indicative-second-person-singular":"organiseai","imperfect-indicative-singular-third-person":"organisea","first-person-imperfect-indicative-plural":"organiseam","imperfect-indicative-plural-second-person":"organiseați","imperfect-indicative-plural-third-person":"organiseau","first-person-indicative-perfect-singular":"organisii","indicative-perfect-second-person-singular":"organisiși","indicative-perfect-singular-third-person":"organisi","first-person-indicative-perfect-plural":"organisirăm","indicative-perfect-plural-second-person":"organisirăți","indicative-perfect-plural-third-person":"organisiră","first-person-indicative-pluperfect-singular":"organisisem","indicative-pluperfect-second-person-singular":"organisiseși","indicative-pluperfect-singular-third-person":"organisise","first-person-indicative-pluperfect-plural":"organisiserăm","indicative-pluperfect-plural-second-person":"organisiserăți","indicative-pluperfect-plural-third-person":"organisiseră","first-person-present-singular-subjunctive":"să organisesc","present-second-person-singular-subjunctive":"să organisești","present-singular-subjunctive-third-person":"să organisească","first-person-plural-present-subjunctive":"să organisim","plural-present-second-person-subjunctive":"să organisiți","plural-present-subjunctive-third-person":"să organisească","imperative-second-person-singular":"organisește","imperative-plural-second-person":"organisiți","imperative-negative-second-person-singular":"nu organisi","imperative-negative-plural-second-person":"nu organisiți"}},{"word":"organisire","pos":"noun","definitions":["organization"],"forms":{"plural":"organisiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"organisire","accusative-definite-nominative-singular":"organisirea","accusative-indefinite-nominative-plural":"organisiri","accusative-definite-nominative-plural":"organisirile","dative-genitive-indefinite-singular":"organisiri","dative-definite-genitive-singular":"organisirii","dative-genitive-indefinite-plural":"organisiri","dative-definite-genitive-plural":"organisirilor","singular-vocative":"organisire","plural-vocative":"organisirilor"}},{"word":"organism","pos":"noun","definitions":["organism"],"forms":{"plural":"organisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"organism","accusative-definite-nominative-singular":"organismul","accusative-indefinite-nominative-plural":"organisme","accusative-definite-nominative-plural":"organismele","dative-genitive-indefinite-singular":"organism","dative-definite-genitive-singular":"organismului","dative-genitive-indefinite-plural":"organisme","dative-definite-genitive-plural":"organismelor","singular-vocative":"organismule","plural-vocative":"organismelor"}},{"word":"organist","pos":"noun","definitions":["organist"],"forms":{"plural":"organiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"organist","accusative-definite-nominative-singular":"organistul","accusative-indefinite-nominative-plural":"organiști","accusative-definite-nominative-plural":"organiștii","dative-genitive-indefinite-singular":"organist","dative-definite-genitive-singular":"organistului","dative-genitive-indefinite-plural":"organiști","dative-definite-genitive-plural":"organiștilor","singular-vocative":"organistule","plural-vocative":"organiștilor"}},{"word":"organistă","pos":"noun","definitions":["female equivalent of organist: female organist"],"forms":{"plural":"organiste"}},{"word":"organiste","pos":"noun","definitions":["plural of organistă"],"gender":"f-p"},{"word":"organit","pos":"noun","definitions":["organelle"],"forms":{"plural":"organite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"organit","accusative-definite-nominative-singular":"organitul","accusative-indefinite-nominative-plural":"organite","accusative-definite-nominative-plural":"organitele","dative-genitive-indefinite-singular":"organit","dative-definite-genitive-singular":"organitului","dative-genitive-indefinite-plural":"organite","dative-definite-genitive-plural":"organitelor","singular-vocative":"organitule","plural-vocative":"organitelor"}},{"word":"organiza","pos":"verb","definitions":["to organise, to arrange"],"pronunciation":"/or.ɡa.niˈza/","forms":{"canonical":"a organiza 1st conjugation","present-singular-third-person":"organizează","participle-past":"organizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a organiza","gerund":"organizând","first-person-indicative-present-singular":"organizez","indicative-present-second-person-singular":"organizezi","indicative-present-singular-third-person":"organizează","first-person-indicative-plural-present":"organizăm","indicative-plural-present-second-person":"organizați","indicative-plural-present-third-person":"organizează","first-person-imperfect-indicative-singular":"organizam","imperfect-indicative-second-person-singular":"organizai","imperfect-indicative-singular-third-person":"organiza","first-person-imperfect-indicative-plural":"organizam","imperfect-indicative-plural-second-person":"organizați","imperfect-indicative-plural-third-person":"organizau","first-person-indicative-perfect-singular":"organizai","indicative-perfect-second-person-singular":"organizași","indicative-perfect-singular-third-person":"organiză","first-person-indicative-perfect-plural":"organizarăm","indicative-perfect-plural-second-person":"organizarăți","indicative-perfect-plural-third-person":"organizară","first-person-indicative-pluperfect-singular":"organizasem","indicative-pluperfect-second-person-singular":"organizaseși","indicative-pluperfect-singular-third-person":"organizase","first-person-indicative-pluperfect-plural":"organizaserăm","indicative-pluperfect-plural-second-person":"organizaserăți","indicative-pluperfect-plural-third-person":"organizaseră","first-person-present-singular-subjunctive":"să organizez","present-second-person-singular-subjunctive":"să organizezi","present-singular-subjunctive-third-person":"să organizeze","first-person-plural-present-subjunctive":"să organizăm","plural-present-second-person-subjunctive":"să organizați","plural-present-subjunctive-third-person":"să organizeze","imperative-second-person-singular":"organizează","imperative-plural-second-person":"organizați","imperative-negative-second-person-singular":"nu organiza","imperative-negative-plural-second-person":"nu organizați","alternative":"организа"}},{"word":"organizai","pos":"verb","definitions":["inflection of organiza:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[orɡaniˈzaj]"},{"word":"organizam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of organiza"],"pronunciation":"[orɡaniˈzam]"},{"word":"organizare","pos":"noun","definitions":["organization (action of organizing something or the way something is organized)"],"pronunciation":"/or.ɡa.niˈza.re/","forms":{"plural":"organizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"organizare","accusative-definite-nominative-singular":"organizarea","accusative-indefinite-nominative-plural":"organizări","accusative-definite-nominative-plural":"organizările","dative-genitive-indefinite-singular":"organizări","dative-definite-genitive-singular":"organizării","dative-genitive-indefinite-plural":"organizări","dative-definite-genitive-plural":"organizărilor","singular-vocative":"organizare","plural-vocative":"organizărilor","alternative":"организаре"}},{"word":"organizări","pos":"noun","definitions":["plural of organizare"],"pronunciation":"/or.ɡa.niˈzərʲ/"},{"word":"organizase","pos":"verb","definitions":["third-person singular pluperfect indicative of organiza"],"pronunciation":"[orɡaniˈzase]"},{"word":"organizat","pos":"adj","definitions":["organised"],"pronunciation":"/or.ɡa.niˈzat/","forms":{"feminine-singular":"organizată","masculine-plural":"organizați","feminine-neuter-plural":"organizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"organizat","error-unrecognized-form-feminine-indefinite-singular":"organizată","error-unrecognized-form-indefinite-masculine-plural":"organizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"organizate","definite-error-unrecognized-form-masculine-neuter-singular":"organizatul","definite-error-unrecognized-form-feminine-singular":"organizata","definite-error-unrecognized-form-masculine-plural":"organizații","definite-error-unrecognized-form-feminine-neuter-plural":"organizatele","alternative":"организат"}},{"word":"organizația","pos":"noun","definitions":["definite nominative/accusative singular of organizație"],"gender":"f","forms":{"alternative":"организация"}},{"word":"Organizația Mondială a Comerțului","pos":"name","definitions":["World Trade Organization"],"gender":"f"},{"word":"Organizația Națiunilor Unite","pos":"name","definitions":["United Nations"],"gender":"f","forms":{"alternative":"Организация Нациунилор Уните"}},{"word":"organizație","pos":"noun","definitions":["organization"],"pronunciation":"[ˌorɡaniˈzat͡si.e]","forms":{"plural":"organizații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"organizație","accusative-definite-nominative-singular":"organizația","accusative-indefinite-nominative-plural":"organizații","accusative-definite-nominative-plural":"organizațiile","dative-genitive-indefinite-singular":"organizații","dative-definite-genitive-singular":"organizației","dative-genitive-indefinite-plural":"organizații","dative-definite-genitive-plural":"organizațiilor","singular-vocative":"organizație","plural-vocative":"organizațiilor","alternative":"организацие"}},{"word":"organizație neguvernamentală","pos":"noun","definitions":["non-governmental organization"],"forms":{"plural":"organizații neguvernamentale"}},{"word":"organizație non-guvernamentală","pos":"noun","definitions":["alternative form of organizație neguvernamentală"],"forms":{"plural":"organizații non-guvernamentale"}},{"word":"organizație secretă","pos":"noun","definitions":["secret society"],"forms":{"plural":"organizații secrete"}},{"word":"organizații","pos":"noun","definitions":["plural of organizație"]},{"word":"organizații neguvernamentale","pos":"noun","definitions":["plural of organizație neguvernamentală"]},{"word":"organizațional","pos":"adj","definitions":["organizational"],"forms":{"feminine-singular":"organizațională","masculine-plural":"organizaționali","feminine-neuter-plural":"organizaționale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"organizațional","error-unrecognized-form-feminine-indefinite-singular":"organizațională","error-unrecognized-form-indefinite-masculine-plural":"organizaționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"organizaționale","definite-error-unrecognized-form-masculine-neuter-singular":"organizaționalul","definite-error-unrecognized-form-feminine-singular":"organizaționala","definite-error-unrecognized-form-masculine-plural":"organizaționalii","definite-error-unrecognized-form-feminine-neuter-plural":"organizaționalele"}},{"word":"organizațiune","pos":"noun","definitions":["obsolete form of organizație"],"forms":{"plural":"organizațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"organizațiune","accusative-definite-nominative-singular":"organizațiunea","accusative-indefinite-nominative-plural":"organizațiuni","accusative-definite-nominative-plural":"organizațiunile","dative-genitive-indefinite-singular":"organizațiuni","dative-definite-genitive-singular":"organizațiunii","dative-genitive-indefinite-plural":"organizațiuni","dative-definite-genitive-plural":"organizațiunilor","singular-vocative":"organizațiune","plural-vocative":"organizațiunilor"}},{"word":"organizator","pos":"adj","definitions":["organizing"],"pronunciation":"/or.ɡa.ni.zaˈtor/","forms":{"feminine-singular":"organizatoare","masculine-plural":"organizatori","feminine-neuter-plural":"organizatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"organizator","error-unrecognized-form-feminine-indefinite-singular":"organizatoare","error-unrecognized-form-indefinite-masculine-plural":"organizatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"organizatoare","definite-error-unrecognized-form-masculine-neuter-singular":"organizatorul","definite-error-unrecognized-form-feminine-singular":"organizatoarea","definite-error-unrecognized-form-masculine-plural":"organizatorii","definite-error-unrecognized-form-feminine-neuter-plural":"organizatoarele"}},{"word":"organizator","pos":"noun","definitions":["organizer (person who organizes)"],"pronunciation":"/or.ɡa.ni.zaˈtor/","forms":{"plural":"organizatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"organizator","accusative-definite-nominative-singular":"organizatorul","accusative-indefinite-nominative-plural":"organizatori","accusative-definite-nominative-plural":"organizatorii","dative-genitive-indefinite-singular":"organizator","dative-definite-genitive-singular":"organizatorului","dative-genitive-indefinite-plural":"organizatori","dative-definite-genitive-plural":"organizatorilor","singular-vocative":"organizatorule","plural-vocative":"organizatorilor"}},{"word":"organizatori","pos":"noun","definitions":["plural of organizator"],"pronunciation":"/or.ɡa.ni.zaˈtorʲ/"},{"word":"organizatoric","pos":"adj","definitions":["organizational"],"pronunciation":"/or.ɡa.ni.zaˈto.rik/","forms":{"feminine-singular":"organizatorică","masculine-plural":"organizatorici","feminine-neuter-plural":"organizatorice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"organizatoric","error-unrecognized-form-feminine-indefinite-singular":"organizatorică","error-unrecognized-form-indefinite-masculine-plural":"organizatorici","error-unrecognized-form-feminine-indefinite-neuter-plural":"organizatorice","definite-error-unrecognized-form-masculine-neuter-singular":"organizatoricul","definite-error-unrecognized-form-feminine-singular":"organizatorica","definite-error-unrecognized-form-masculine-plural":"organizatoricii","definite-error-unrecognized-form-feminine-neuter-plural":"organizatoricele"}},{"word":"organizau","pos":"verb","definitions":["third-person plural imperfect indicative of organiza"]},{"word":"organizez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of organiza"],"pronunciation":"[orɡaniˈzez]"},{"word":"organogen","pos":"adj","definitions":["organogenic"],"forms":{"feminine-singular":"organogenă","masculine-plural":"organogeni","feminine-neuter-plural":"organogene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"organogen","error-unrecognized-form-feminine-indefinite-singular":"organogenă","error-unrecognized-form-indefinite-masculine-plural":"organogeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"organogene","definite-error-unrecognized-form-masculine-neuter-singular":"organogenul","definite-error-unrecognized-form-feminine-singular":"organogena","definite-error-unrecognized-form-masculine-plural":"organogenii","definite-error-unrecognized-form-feminine-neuter-plural":"organogenele"}},{"word":"organogeneză","pos":"noun","definitions":["organogenesis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"organogeneză","accusative-definite-nominative-singular":"organogeneza","accusative-indefinite-nominative-plural":"organogeneze","accusative-definite-nominative-plural":"organogenezele","dative-genitive-indefinite-singular":"organogeneze","dative-definite-genitive-singular":"organogenezei","dative-genitive-indefinite-plural":"organogeneze","dative-definite-genitive-plural":"organogenezelor","singular-vocative":"organogeneză","plural-vocative":"organogenezelor"}},{"word":"organogenie","pos":"noun","definitions":["organogeny"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"organogenie","accusative-definite-nominative":"organogenia","dative-genitive-indefinite":"organogenii","dative-definite-genitive":"organogeniei","vocative":"organogenie"}},{"word":"organografic","pos":"adj","definitions":["organographic"],"forms":{"feminine-singular":"organografică","masculine-plural":"organografici","feminine-neuter-plural":"organografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"organografic","error-unrecognized-form-feminine-indefinite-singular":"organografică","error-unrecognized-form-indefinite-masculine-plural":"organografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"organografice","definite-error-unrecognized-form-masculine-neuter-singular":"organograficul","definite-error-unrecognized-form-feminine-singular":"organografica","definite-error-unrecognized-form-masculine-plural":"organograficii","definite-error-unrecognized-form-feminine-neuter-plural":"organograficele"}},{"word":"organografie","pos":"noun","definitions":["organography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"organografie","accusative-definite-nominative":"organografia","dative-genitive-indefinite":"organografii","dative-definite-genitive":"organografiei","vocative":"organografie"}},{"word":"organoleptic","pos":"adj","definitions":["organoleptic"],"forms":{"feminine-singular":"organoleptică","masculine-plural":"organoleptici","feminine-neuter-plural":"organoleptice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"organoleptic","error-unrecognized-form-feminine-indefinite-singular":"organoleptică","error-unrecognized-form-indefinite-masculine-plural":"organoleptici","error-unrecognized-form-feminine-indefinite-neuter-plural":"organoleptice","definite-error-unrecognized-form-masculine-neuter-singular":"organolepticul","definite-error-unrecognized-form-feminine-singular":"organoleptica","definite-error-unrecognized-form-masculine-plural":"organolepticii","definite-error-unrecognized-form-feminine-neuter-plural":"organolepticele"}},{"word":"organon","pos":"noun","definitions":["tool"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"organon","accusative-definite-nominative":"organonul","dative-genitive-indefinite":"organon","dative-definite-genitive":"organonului","vocative":"organonule"}},{"word":"organosol","pos":"noun","definitions":["organosol"],"forms":{"plural":"organosoli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"organosol","accusative-definite-nominative-singular":"organosolul","accusative-indefinite-nominative-plural":"organosoli","accusative-definite-nominative-plural":"organosolii","dative-genitive-indefinite-singular":"organosol","dative-definite-genitive-singular":"organosolului","dative-genitive-indefinite-plural":"organosoli","dative-definite-genitive-plural":"organosolilor","singular-vocative":"organosolule","plural-vocative":"organosolilor"}},{"word":"organoterapie","pos":"noun","definitions":["organotherapy"],"forms":{"plural":"organoterapii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"organoterapie","accusative-definite-nominative-singular":"organoterapia","accusative-indefinite-nominative-plural":"organoterapii","accusative-definite-nominative-plural":"organoterapiile","dative-genitive-indefinite-singular":"organoterapii","dative-definite-genitive-singular":"organoterapiei","dative-genitive-indefinite-plural":"organoterapii","dative-definite-genitive-plural":"organoterapiilor","singular-vocative":"organoterapie","plural-vocative":"organoterapiilor"}},{"word":"organotrop","pos":"adj","definitions":["organotropic"],"forms":{"feminine-singular":"organotropă","masculine-plural":"organotropi","feminine-neuter-plural":"organotrope","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"organotrop","error-unrecognized-form-feminine-indefinite-singular":"organotropă","error-unrecognized-form-indefinite-masculine-plural":"organotropi","error-unrecognized-form-feminine-indefinite-neuter-plural":"organotrope","definite-error-unrecognized-form-masculine-neuter-singular":"organotropul","definite-error-unrecognized-form-feminine-singular":"organotropa","definite-error-unrecognized-form-masculine-plural":"organotropii","definite-error-unrecognized-form-feminine-neuter-plural":"organotropele"}},{"word":"organotropism","pos":"noun","definitions":["organotropism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"organotropism","accusative-definite-nominative":"organotropismul","dative-genitive-indefinite":"organotropism","dative-definite-genitive":"organotropismului","vocative":"organotropismule"}},{"word":"organtin","pos":"noun","definitions":["alternative form of organdi"],"forms":{"plural":"organtinuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"organtin","accusative-definite-nominative-singular":"organtinul","accusative-indefinite-nominative-plural":"organtinuri","accusative-definite-nominative-plural":"organtinurile","dative-genitive-indefinite-singular":"organtin","dative-definite-genitive-singular":"organtinului","dative-genitive-indefinite-plural":"organtinuri","dative-definite-genitive-plural":"organtinurilor","singular-vocative":"organtinule","plural-vocative":"organtinurilor"}},{"word":"organum","pos":"noun","definitions":["organum"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"organum","accusative-definite-nominative":"organumul","dative-genitive-indefinite":"organum","dative-definite-genitive":"organumului","vocative":"organumule"}},{"word":"organzin","pos":"noun","definitions":["organzine"],"forms":{"plural":"organzine","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"organzin","accusative-definite-nominative-singular":"organzinul","accusative-indefinite-nominative-plural":"organzine","accusative-definite-nominative-plural":"organzinele","dative-genitive-indefinite-singular":"organzin","dative-definite-genitive-singular":"organzinului","dative-genitive-indefinite-plural":"organzine","dative-definite-genitive-plural":"organzinelor","singular-vocative":"organzinule","plural-vocative":"organzinelor"}},{"word":"orgar","pos":"noun","definitions":["tanner"],"forms":{"plural":"orgari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orgar","accusative-definite-nominative-singular":"orgarul","accusative-indefinite-nominative-plural":"orgari","accusative-definite-nominative-plural":"orgarii","dative-genitive-indefinite-singular":"orgar","dative-definite-genitive-singular":"orgarului","dative-genitive-indefinite-plural":"orgari","dative-definite-genitive-plural":"orgarilor","singular-vocative":"orgarule","plural-vocative":"orgarilor"}},{"word":"orgasm","pos":"noun","definitions":["orgasm"],"pronunciation":"[orˈɡasm]","forms":{"plural":"orgasme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"orgasm","accusative-definite-nominative-singular":"orgasmul","accusative-indefinite-nominative-plural":"orgasme","accusative-definite-nominative-plural":"orgasmele","dative-genitive-indefinite-singular":"orgasm","dative-definite-genitive-singular":"orgasmului","dative-genitive-indefinite-plural":"orgasme","dative-definite-genitive-plural":"orgasmelor","singular-vocative":"orgasmule","plural-vocative":"orgasmelor"}},{"word":"orgasme","pos":"noun","definitions":["plural of orgasm"],"pronunciation":"[orˈɡas.me]","gender":"n-p"},{"word":"orgasmic","pos":"adj","definitions":["orgasmic"],"pronunciation":"[orˈɡasmik]","forms":{"feminine-singular":"orgasmică","masculine-plural":"orgasmici","feminine-neuter-plural":"orgasmice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"orgasmic","error-unrecognized-form-feminine-indefinite-singular":"orgasmică","error-unrecognized-form-indefinite-masculine-plural":"orgasmici","error-unrecognized-form-feminine-indefinite-neuter-plural":"orgasmice","definite-error-unrecognized-form-masculine-neuter-singular":"orgasmicul","definite-error-unrecognized-form-feminine-singular":"orgasmica","definite-error-unrecognized-form-masculine-plural":"orgasmicii","definite-error-unrecognized-form-feminine-neuter-plural":"orgasmicele"}},{"word":"orgastic","pos":"adj","definitions":["orgastic"],"pronunciation":"[orˈɡastik]","forms":{"feminine-singular":"orgastică","masculine-plural":"orgastici","feminine-neuter-plural":"orgastice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"orgastic","error-unrecognized-form-feminine-indefinite-singular":"orgastică","error-unrecognized-form-indefinite-masculine-plural":"orgastici","error-unrecognized-form-feminine-indefinite-neuter-plural":"orgastice","definite-error-unrecognized-form-masculine-neuter-singular":"orgasticul","definite-error-unrecognized-form-feminine-singular":"orgastica","definite-error-unrecognized-form-masculine-plural":"orgasticii","definite-error-unrecognized-form-feminine-neuter-plural":"orgasticele"}},{"word":"orgelet","pos":"noun","definitions":["stye"],"forms":{"plural":"orgelete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"orgelet","accusative-definite-nominative-singular":"orgeletul","accusative-indefinite-nominative-plural":"orgelete","accusative-definite-nominative-plural":"orgeletele","dative-genitive-indefinite-singular":"orgelet","dative-definite-genitive-singular":"orgeletului","dative-genitive-indefinite-plural":"orgelete","dative-definite-genitive-plural":"orgeletelor","singular-vocative":"orgeletule","plural-vocative":"orgeletelor"}},{"word":"Orgești","pos":"name","definitions":["a village in Avram Iancu, Alba County, Romania"],"gender":"m"},{"word":"Orghidan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Orghidan"}},{"word":"orgiac","pos":"adj","definitions":["orgiastic"],"forms":{"feminine-singular":"orgiacă","masculine-plural":"orgiaci","feminine-neuter-plural":"orgiace","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orgiac","error-unrecognized-form-feminine-indefinite-singular":"orgiacă","error-unrecognized-form-indefinite-masculine-plural":"orgiaci","error-unrecognized-form-feminine-indefinite-neuter-plural":"orgiace","definite-error-unrecognized-form-masculine-neuter-singular":"orgiacul","definite-error-unrecognized-form-feminine-singular":"orgiaca","definite-error-unrecognized-form-masculine-plural":"orgiacii","definite-error-unrecognized-form-feminine-neuter-plural":"orgiacele"}},{"word":"orgiastic","pos":"adj","definitions":["orgiastic"],"forms":{"feminine-singular":"orgiastică","masculine-plural":"orgiastici","feminine-neuter-plural":"orgiastice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orgiastic","error-unrecognized-form-feminine-indefinite-singular":"orgiastică","error-unrecognized-form-indefinite-masculine-plural":"orgiastici","error-unrecognized-form-feminine-indefinite-neuter-plural":"orgiastice","definite-error-unrecognized-form-masculine-neuter-singular":"orgiasticul","definite-error-unrecognized-form-feminine-singular":"orgiastica","definite-error-unrecognized-form-masculine-plural":"orgiasticii","definite-error-unrecognized-form-feminine-neuter-plural":"orgiasticele"}},{"word":"orgie","pos":"noun","definitions":["orgy"],"forms":{"plural":"orgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"orgie","accusative-definite-nominative-singular":"orgia","accusative-indefinite-nominative-plural":"orgii","accusative-definite-nominative-plural":"orgiile","dative-genitive-indefinite-singular":"orgii","dative-definite-genitive-singular":"orgiei","dative-genitive-indefinite-plural":"orgii","dative-definite-genitive-plural":"orgiilor","singular-vocative":"orgie","plural-vocative":"orgiilor"}},{"word":"Orgoiești","pos":"name","definitions":["a village in Bogdănești, Vaslui County, Romania"],"gender":"m"},{"word":"orgolios","pos":"adj","definitions":["proud","conceited"],"pronunciation":"/ˌor.ɡo.liˈos/","forms":{"feminine-singular":"orgolioasă","masculine-plural":"orgolioși","feminine-neuter-plural":"orgolioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orgolios","error-unrecognized-form-feminine-indefinite-singular":"orgolioasă","error-unrecognized-form-indefinite-masculine-plural":"orgolioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"orgolioase","definite-error-unrecognized-form-masculine-neuter-singular":"orgoliosul","definite-error-unrecognized-form-feminine-singular":"orgolioasa","definite-error-unrecognized-form-masculine-plural":"orgolioșii","definite-error-unrecognized-form-feminine-neuter-plural":"orgolioasele"}},{"word":"orgoliu","pos":"noun","definitions":["pride (sense of one's own worth, and abhorrence of what is beneath or unworthy of one)"],"forms":{"plural":"orgolii"}},{"word":"orguliu","pos":"adj","definitions":["obsolete form of ogurliu"],"forms":{"feminine-singular":"orgulie","plural":"orgulii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orguliu","error-unrecognized-form-feminine-indefinite-singular":"orgulie","error-unrecognized-form-indefinite-masculine-plural":"orgulii","error-unrecognized-form-feminine-indefinite-neuter-plural":"orgulii","definite-error-unrecognized-form-masculine-neuter-singular":"orguliul","definite-error-unrecognized-form-feminine-singular":"orgulia","definite-error-unrecognized-form-masculine-plural":"orguliii","definite-error-unrecognized-form-feminine-neuter-plural":"orguliile"}},{"word":"Orhean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Orhean"}},{"word":"Orheanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Orheanu"}},{"word":"Orhei","pos":"name","definitions":["a city, municipality, and district of Moldova","a county of Romania"],"pronunciation":"/orˈhej/","gender":"m"},{"word":"Orheian","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Orheian"}},{"word":"Orheiu Bistriței","pos":"name","definitions":["a village in Cetate, Bistrița-Năsăud County, Romania"],"gender":"m"},{"word":"orhestră","pos":"noun","definitions":["alternative form of orchestră"],"forms":{"plural":"orhestre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orhestră","accusative-definite-nominative-singular":"orhestra","accusative-indefinite-nominative-plural":"orhestre","accusative-definite-nominative-plural":"orhestrele","dative-genitive-indefinite-singular":"orhestre","dative-definite-genitive-singular":"orhestrei","dative-genitive-indefinite-plural":"orhestre","dative-definite-genitive-plural":"orhestrelor","singular-vocative":"orhestră","plural-vocative":"orhestrelor"}},{"word":"orhestrație","pos":"noun","definitions":["obsolete form of orchestrație"],"forms":{"plural":"orhestrații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"orhestrație","accusative-definite-nominative-singular":"orhestrația","accusative-indefinite-nominative-plural":"orhestrații","accusative-definite-nominative-plural":"orhestrațiile","dative-genitive-indefinite-singular":"orhestrații","dative-definite-genitive-singular":"orhestrației","dative-genitive-indefinite-plural":"orhestrații","dative-definite-genitive-plural":"orhestrațiilor","singular-vocative":"orhestrație","plural-vocative":"orhestrațiilor"}},{"word":"orhestrațiune","pos":"noun","definitions":["obsolete form of orchestrație"],"forms":{"plural":"orhestrațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"orhestrațiune","accusative-definite-nominative-singular":"orhestrațiunea","accusative-indefinite-nominative-plural":"orhestrațiuni","accusative-definite-nominative-plural":"orhestrațiunile","dative-genitive-indefinite-singular":"orhestrațiuni","dative-definite-genitive-singular":"orhestrațiunii","dative-genitive-indefinite-plural":"orhestrațiuni","dative-definite-genitive-plural":"orhestrațiunilor","singular-vocative":"orhestrațiune","plural-vocative":"orhestrațiunilor"}},{"word":"orhestrină","pos":"noun","definitions":["small orchestra"],"forms":{"plural":"orhestrine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orhestrină","accusative-definite-nominative-singular":"orhestrina","accusative-indefinite-nominative-plural":"orhestrine","accusative-definite-nominative-plural":"orhestrinele","dative-genitive-indefinite-singular":"orhestrine","dative-definite-genitive-singular":"orhestrinei","dative-genitive-indefinite-plural":"orhestrine","dative-definite-genitive-plural":"orhestrinelor","singular-vocative":"orhestrină","plural-vocative":"orhestrinelor"}},{"word":"orhialgie","pos":"noun","definitions":["orchialgia"],"forms":{"plural":"orhialgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"orhialgie","accusative-definite-nominative-singular":"orhialgia","accusative-indefinite-nominative-plural":"orhialgii","accusative-definite-nominative-plural":"orhialgiile","dative-genitive-indefinite-singular":"orhialgii","dative-definite-genitive-singular":"orhialgiei","dative-genitive-indefinite-plural":"orhialgii","dative-definite-genitive-plural":"orhialgiilor","singular-vocative":"orhialgie","plural-vocative":"orhialgiilor"}},{"word":"Orhian","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Orhian"}},{"word":"orhidectomie","pos":"noun","definitions":["orchidectomy"],"forms":{"plural":"orhidectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"orhidectomie","accusative-definite-nominative-singular":"orhidectomia","accusative-indefinite-nominative-plural":"orhidectomii","accusative-definite-nominative-plural":"orhidectomiile","dative-genitive-indefinite-singular":"orhidectomii","dative-definite-genitive-singular":"orhidectomiei","dative-genitive-indefinite-plural":"orhidectomii","dative-definite-genitive-plural":"orhidectomiilor","singular-vocative":"orhidectomie","plural-vocative":"orhidectomiilor"}},{"word":"orhidee","pos":"noun","definitions":["orchid"],"forms":{"plural":"orhidee","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"orhidee","accusative-definite-nominative-singular":"orhideea","accusative-indefinite-nominative-plural":"orhidee","accusative-definite-nominative-plural":"orhideele","dative-genitive-indefinite-singular":"orhidee","dative-definite-genitive-singular":"orhideei","dative-genitive-indefinite-plural":"orhidee","dative-definite-genitive-plural":"orhideelor","singular-vocative":"orhidee","plural-vocative":"orhideelor"}},{"word":"orhidopexie","pos":"noun","definitions":["orchidopexy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"orhidopexie","accusative-definite-nominative":"orhidopexia","dative-genitive-indefinite":"orhidopexii","dative-definite-genitive":"orhidopexiei","vocative":"orhidopexie"}},{"word":"orhidotomie","pos":"noun","definitions":["orchidotomy"],"forms":{"plural":"orhidotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"orhidotomie","accusative-definite-nominative-singular":"orhidotomia","accusative-indefinite-nominative-plural":"orhidotomii","accusative-definite-nominative-plural":"orhidotomiile","dative-genitive-indefinite-singular":"orhidotomii","dative-definite-genitive-singular":"orhidotomiei","dative-genitive-indefinite-plural":"orhidotomii","dative-definite-genitive-plural":"orhidotomiilor","singular-vocative":"orhidotomie","plural-vocative":"orhidotomiilor"}},{"word":"orhiectomie","pos":"noun","definitions":["orchiectomy"],"forms":{"plural":"orhiectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"orhiectomie","accusative-definite-nominative-singular":"orhiectomia","accusative-indefinite-nominative-plural":"orhiectomii","accusative-definite-nominative-plural":"orhiectomiile","dative-genitive-indefinite-singular":"orhiectomii","dative-definite-genitive-singular":"orhiectomiei","dative-genitive-indefinite-plural":"orhiectomii","dative-definite-genitive-plural":"orhiectomiilor","singular-vocative":"orhiectomie","plural-vocative":"orhiectomiilor"}},{"word":"orhiotomie","pos":"noun","definitions":["orchiotomy"],"forms":{"plural":"orhiotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"orhiotomie","accusative-definite-nominative-singular":"orhiotomia","accusative-indefinite-nominative-plural":"orhiotomii","accusative-definite-nominative-plural":"orhiotomiile","dative-genitive-indefinite-singular":"orhiotomii","dative-definite-genitive-singular":"orhiotomiei","dative-genitive-indefinite-plural":"orhiotomii","dative-definite-genitive-plural":"orhiotomiilor","singular-vocative":"orhiotomie","plural-vocative":"orhiotomiilor"}},{"word":"orhită","pos":"noun","definitions":["orchitis"],"forms":{"plural":"orhite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orhită","accusative-definite-nominative-singular":"orhita","accusative-indefinite-nominative-plural":"orhite","accusative-definite-nominative-plural":"orhitele","dative-genitive-indefinite-singular":"orhite","dative-definite-genitive-singular":"orhitei","dative-genitive-indefinite-plural":"orhite","dative-definite-genitive-plural":"orhitelor","singular-vocative":"orhită","plural-vocative":"orhitelor"}},{"word":"orhitic","pos":"adj","definitions":["orchitic"],"forms":{"feminine-singular":"orhitică","masculine-plural":"orhitici","feminine-neuter-plural":"orhitice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orhitic","error-unrecognized-form-feminine-indefinite-singular":"orhitică","error-unrecognized-form-indefinite-masculine-plural":"orhitici","error-unrecognized-form-feminine-indefinite-neuter-plural":"orhitice","definite-error-unrecognized-form-masculine-neuter-singular":"orhiticul","definite-error-unrecognized-form-feminine-singular":"orhitica","definite-error-unrecognized-form-masculine-plural":"orhiticii","definite-error-unrecognized-form-feminine-neuter-plural":"orhiticele"}},{"word":"ori","pos":"conj","definitions":["or","either"],"pronunciation":"/orʲ/","examples":[{"ro":"\"Viață-n libertate ori moarte\" strigă toți.","en":"\"Life in liberty or death,\" shout all.\n—Deșteaptă-te, române!, the Romanian national anthem"},{"ro":"vreau o banană ori un măr","en":"I want either a banana or an apple."}],"forms":{"alternative":"орь"}},{"word":"ori","pos":"conj","definitions":["while, whereas, on the other hand"],"pronunciation":"/orʲ/","forms":{"alternative":"орь"}},{"word":"ori","pos":"noun","definitions":["plural of oară"],"pronunciation":"/orʲ/","forms":{"alternative":"орь"}},{"word":"ori-","pos":"prefix","definitions":["prefixed to question words, meaning \"any\""],"pronunciation":"/orʲ/","examples":[{"ro":"oricând","en":"anytime"},{"ro":"oricine","en":"anyone"},{"ro":"oriunde","en":"anywhere"}]},{"word":"oribil","pos":"adj","definitions":["horrible"],"forms":{"feminine-singular":"oribilă","masculine-plural":"oribili","feminine-neuter-plural":"oribile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oribil","error-unrecognized-form-feminine-indefinite-singular":"oribilă","error-unrecognized-form-indefinite-masculine-plural":"oribili","error-unrecognized-form-feminine-indefinite-neuter-plural":"oribile","definite-error-unrecognized-form-masculine-neuter-singular":"oribilul","definite-error-unrecognized-form-feminine-singular":"oribila","definite-error-unrecognized-form-masculine-plural":"oribilii","definite-error-unrecognized-form-feminine-neuter-plural":"oribilele"}},{"word":"oricalc","pos":"noun","definitions":["orichalcum"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"oricalc","accusative-definite-nominative":"oricalcul","dative-genitive-indefinite":"oricalc","dative-definite-genitive":"oricalcului","vocative":"oricalcule"}},{"word":"oricând","pos":"adv","definitions":["anytime"],"pronunciation":"/ˌorʲˈkɨnd/","examples":[{"ro":"ca oricând","en":"than ever"}],"forms":{"alternative":"oricînd"}},{"word":"oricare","pos":"det","definitions":["any, every"],"pronunciation":"/orʲˈka.re/","forms":{"table-tags":"no-table-tags","inflection-template":"l-self","accusative-masculine-neuter-nominative-singular":"oricare","accusative-feminine-nominative-singular":"oricare","accusative-masculine-nominative-plural":"oricare","accusative-feminine-neuter-nominative-plural":"oricare","dative-genitive-masculine-neuter-singular":"oricărui","dative-feminine-genitive-singular":"oricărei","dative-genitive-masculine-plural":"oricăror","dative-feminine-genitive-neuter-plural":"oricăror","alternative":"орькаре"}},{"word":"oricare","pos":"pron","definitions":["anyone, everyone"],"pronunciation":"/orʲˈka.re/","forms":{"table-tags":"no-table-tags","inflection-template":"l-self","accusative-masculine-neuter-nominative-singular":"oricare","accusative-feminine-nominative-singular":"oricare","accusative-masculine-nominative-plural":"oricare","accusative-feminine-neuter-nominative-plural":"oricare","dative-genitive-masculine-neuter-singular":"oricăruia","dative-feminine-genitive-singular":"oricăreia","dative-genitive-masculine-plural":"oricărora","dative-feminine-genitive-neuter-plural":"oricărora","alternative":"орькаре"}},{"word":"oricărei","pos":"det","definitions":["genitive/dative feminine singular of oricare"]},{"word":"oricăreia","pos":"pron","definitions":["genitive/dative feminine singular of oricare"]},{"word":"oricăror","pos":"det","definitions":["genitive/dative plural of oricare"]},{"word":"oricărora","pos":"pron","definitions":["genitive/dative plural of oricare"]},{"word":"oricărui","pos":"det","definitions":["genitive/dative masculine/neuter singular of oricare"]},{"word":"oricăruia","pos":"pron","definitions":["genitive/dative masculine/neuter singular of oricare"]},{"word":"oricât","pos":"adv","definitions":["however much"],"pronunciation":"/orʲ.ˈkɨt/"},{"word":"orice","pos":"det","definitions":["any"],"pronunciation":"/orʲ.ˈt͡ʃe/","examples":[{"ro":"Vorbești destul de bine românește. Orice român te-ar înțelege.","en":"You speak in Romanian quite well. Any Romanian would understand you."}]},{"word":"orice","pos":"pron","definitions":["anything"],"pronunciation":"/orʲ.ˈt͡ʃe/","examples":[{"ro":"Un băiat prost ar face orice pentru o fată frumoasă.","en":"A stupid boy would do anything for a pretty girl."},{"ro":"orice altceva","en":"anything else"}]},{"word":"oricine","pos":"pron","definitions":["anyone, anybody"],"pronunciation":"/orʲˈt͡ʃi.ne/","examples":[{"ro":"Oricine ar înțelege.","en":"Anyone would understand."}],"forms":{"table-tags":"no-table-tags","inflection-template":"l-self","accusative-masculine-neuter-nominative-singular":"oricine","accusative-feminine-nominative-singular":"-","accusative-masculine-nominative-plural":"-","accusative-feminine-neuter-nominative-plural":"-","dative-genitive-masculine-neuter-singular":"oricui","dative-feminine-genitive-singular":"-","dative-genitive-masculine-plural":"-","dative-feminine-genitive-neuter-plural":"-"}},{"word":"oricui","pos":"pron","definitions":["genitive/dative singular of oricine"]},{"word":"oricum","pos":"adv","definitions":["anyhow, no matter how, in any way, however","either way, even so, still"],"pronunciation":"/orʲˈkum/","examples":[{"ro":"―Să fac proiectul pe hârtie sau la calculator?\n―Oricum.","en":"“Should I do the project on paper or on the computer?”\n“Either way”."},{"ro":"Oricum ar părea, Pământul este rotund.","en":"No matter how it might seem, the Earth is round."}],"forms":{"alternative-Internet":"orc"}},{"word":"orient","pos":"noun","definitions":["east, Orient"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"orient","accusative-definite-nominative":"orientul","dative-genitive-indefinite":"orient","dative-definite-genitive":"orientului","vocative":"orientule"}},{"word":"orienta","pos":"verb","definitions":["to orientate; to direct"],"pronunciation":"[o.ri.enˈta]","forms":{"canonical":"a orienta 1st conjugation","present-singular-third-person":"orientează","participle-past":"orientat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a orienta","gerund":"orientând","first-person-indicative-present-singular":"orientez","indicative-present-second-person-singular":"orientezi","indicative-present-singular-third-person":"orientează","first-person-indicative-plural-present":"orientăm","indicative-plural-present-second-person":"orientați","indicative-plural-present-third-person":"orientează","first-person-imperfect-indicative-singular":"orientam","imperfect-indicative-second-person-singular":"orientai","imperfect-indicative-singular-third-person":"orienta","first-person-imperfect-indicative-plural":"orientam","imperfect-indicative-plural-second-person":"orientați","imperfect-indicative-plural-third-person":"orientau","first-person-indicative-perfect-singular":"orientai","indicative-perfect-second-person-singular":"orientași","indicative-perfect-singular-third-person":"orientă","first-person-indicative-perfect-plural":"orientarăm","indicative-perfect-plural-second-person":"orientarăți","indicative-perfect-plural-third-person":"orientară","first-person-indicative-pluperfect-singular":"orientasem","indicative-pluperfect-second-person-singular":"orientaseși","indicative-pluperfect-singular-third-person":"orientase","first-person-indicative-pluperfect-plural":"orientaserăm","indicative-pluperfect-plural-second-person":"orientaserăți","indicative-pluperfect-plural-third-person":"orientaseră","first-person-present-singular-subjunctive":"să orientez","present-second-person-singular-subjunctive":"să orientezi","present-singular-subjunctive-third-person":"să orienteze","first-person-plural-present-subjunctive":"să orientăm","plural-present-second-person-subjunctive":"să orientați","plural-present-subjunctive-third-person":"să orienteze","imperative-second-person-singular":"orientează","imperative-plural-second-person":"orientați","imperative-negative-second-person-singular":"nu orienta","imperative-negative-plural-second-person":"nu orientați"}},{"word":"orientă","pos":"verb","definitions":["third-person singular simple perfect indicative of orienta"],"pronunciation":"[o.ri.enˈtə]"},{"word":"orientabil","pos":"adj","definitions":["orientable"],"forms":{"feminine-singular":"orientabilă","masculine-plural":"orientabili","feminine-neuter-plural":"orientabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orientabil","error-unrecognized-form-feminine-indefinite-singular":"orientabilă","error-unrecognized-form-indefinite-masculine-plural":"orientabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"orientabile","definite-error-unrecognized-form-masculine-neuter-singular":"orientabilul","definite-error-unrecognized-form-feminine-singular":"orientabila","definite-error-unrecognized-form-masculine-plural":"orientabilii","definite-error-unrecognized-form-feminine-neuter-plural":"orientabilele"}},{"word":"orientabilitate","pos":"noun","definitions":["orientability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"orientabilitate","accusative-definite-nominative":"orientabilitatea","dative-genitive-indefinite":"orientabilități","dative-definite-genitive":"orientabilității","vocative":"-"}},{"word":"orientai","pos":"verb","definitions":["inflection of orienta:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[o.ri.enˈtaj]"},{"word":"oriental","pos":"adj","definitions":["eastern"],"forms":{"feminine-singular":"orientală","masculine-plural":"orientali","feminine-neuter-plural":"orientale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oriental","error-unrecognized-form-feminine-indefinite-singular":"orientală","error-unrecognized-form-indefinite-masculine-plural":"orientali","error-unrecognized-form-feminine-indefinite-neuter-plural":"orientale","definite-error-unrecognized-form-masculine-neuter-singular":"orientalul","definite-error-unrecognized-form-feminine-singular":"orientala","definite-error-unrecognized-form-masculine-plural":"orientalii","definite-error-unrecognized-form-feminine-neuter-plural":"orientalele"}},{"word":"orientală","pos":"noun","definitions":["female equivalent of oriental"],"forms":{"plural":"orientale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orientală","accusative-definite-nominative-singular":"orientala","accusative-indefinite-nominative-plural":"orientale","accusative-definite-nominative-plural":"orientalele","dative-genitive-indefinite-singular":"orientale","dative-definite-genitive-singular":"orientalei","dative-genitive-indefinite-plural":"orientale","dative-definite-genitive-plural":"orientalelor","singular-vocative":"orientală","plural-vocative":"orientalelor"}},{"word":"orientalism","pos":"noun","definitions":["orientalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"orientalism","accusative-definite-nominative":"orientalismul","dative-genitive-indefinite":"orientalism","dative-definite-genitive":"orientalismului","vocative":"orientalismule"}},{"word":"orientalist","pos":"noun","definitions":["orientalist"],"forms":{"plural":"orientaliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orientalist","accusative-definite-nominative-singular":"orientalistul","accusative-indefinite-nominative-plural":"orientaliști","accusative-definite-nominative-plural":"orientaliștii","dative-genitive-indefinite-singular":"orientalist","dative-definite-genitive-singular":"orientalistului","dative-genitive-indefinite-plural":"orientaliști","dative-definite-genitive-plural":"orientaliștilor","singular-vocative":"orientalistule","plural-vocative":"orientaliștilor"}},{"word":"orientalistă","pos":"noun","definitions":["female equivalent of orientalist"],"forms":{"plural":"orientaliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orientalistă","accusative-definite-nominative-singular":"orientalista","accusative-indefinite-nominative-plural":"orientaliste","accusative-definite-nominative-plural":"orientalistele","dative-genitive-indefinite-singular":"orientaliste","dative-definite-genitive-singular":"orientalistei","dative-genitive-indefinite-plural":"orientaliste","dative-definite-genitive-plural":"orientalistelor","singular-vocative":"orientalistă","plural-vocative":"orientalistelor"}},{"word":"orientalistică","pos":"noun","definitions":["Oriental studies"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"orientalistică","accusative-definite-nominative":"orientalistica","dative-genitive-indefinite":"orientalistici","dative-definite-genitive":"orientalisticii","vocative":"orientalistică"}},{"word":"orientaliza","pos":"verb","definitions":["to easternize"],"forms":{"canonical":"a orientaliza 1st conjugation","present-singular-third-person":"orientalizează","participle-past":"orientalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a orientaliza","gerund":"orientalizând","first-person-indicative-present-singular":"orientalizez","indicative-present-second-person-singular":"orientalizezi","indicative-present-singular-third-person":"orientalizează","first-person-indicative-plural-present":"orientalizăm","indicative-plural-present-second-person":"orientalizați","indicative-plural-present-third-person":"orientalizează","first-person-imperfect-indicative-singular":"orientalizam","imperfect-indicative-second-person-singular":"orientalizai","imperfect-indicative-singular-third-person":"orientaliza","first-person-imperfect-indicative-plural":"orientalizam","imperfect-indicative-plural-second-person":"orientalizați","imperfect-indicative-plural-third-person":"orientalizau","first-person-indicative-perfect-singular":"orientalizai","indicative-perfect-second-person-singular":"orientalizași","indicative-perfect-singular-third-person":"orientaliză","first-person-indicative-perfect-plural":"orientalizarăm","indicative-perfect-plural-second-person":"orientalizarăți","indicative-perfect-plural-third-person":"orientalizară","first-person-indicative-pluperfect-singular":"orientalizasem","indicative-pluperfect-second-person-singular":"orientalizaseși","indicative-pluperfect-singular-third-person":"orientalizase","first-person-indicative-pluperfect-plural":"orientalizaserăm","indicative-pluperfect-plural-second-person":"orientalizaserăți","indicative-pluperfect-plural-third-person":"orientalizaseră","first-person-present-singular-subjunctive":"să orientalizez","present-second-person-singular-subjunctive":"să orientalizezi","present-singular-subjunctive-third-person":"să orientalizeze","first-person-plural-present-subjunctive":"să orientalizăm","plural-present-second-person-subjunctive":"să orientalizați","plural-present-subjunctive-third-person":"să orientalizeze","imperative-second-person-singular":"orientalizează","imperative-plural-second-person":"orientalizați","imperative-negative-second-person-singular":"nu orientaliza","imperative-negative-plural-second-person":"nu orientalizați"}},{"word":"orientam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of orienta"],"pronunciation":"[o.ri.enˈtam]"},{"word":"orientăm","pos":"verb","definitions":["first-person plural present indicative/subjunctive of orienta"],"pronunciation":"[o.ri.enˈtəm]"},{"word":"orientând","pos":"verb","definitions":["gerund of orienta"],"pronunciation":"[o.ri.enˈtɨnd]"},{"word":"orientară","pos":"verb","definitions":["third-person plural simple perfect indicative of orienta"],"pronunciation":"[o.ri.enˈtarə]"},{"word":"orientarăm","pos":"verb","definitions":["first-person plural simple perfect indicative of orienta"],"pronunciation":"[o.ri.enˈtarəm]"},{"word":"orientarăți","pos":"verb","definitions":["second-person plural simple perfect indicative of orienta"],"pronunciation":"[o.ri.enˈtarət͡sʲ]"},{"word":"orientare","pos":"noun","definitions":["orientation"],"pronunciation":"/o.ri.enˈta.re/","forms":{"plural":"orientări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"orientare","accusative-definite-nominative-singular":"orientarea","accusative-indefinite-nominative-plural":"orientări","accusative-definite-nominative-plural":"orientările","dative-genitive-indefinite-singular":"orientări","dative-definite-genitive-singular":"orientării","dative-genitive-indefinite-plural":"orientări","dative-definite-genitive-plural":"orientărilor","singular-vocative":"orientare","plural-vocative":"orientărilor"}},{"word":"orientare sexuală","pos":"noun","definitions":["sexual orientation"],"pronunciation":"[o.ri.enˈta.re.sek.suˈa.lə]","forms":{"plural":"orientări sexuale","table-tags":"no-table-tags","inflection-template":"ro-noun-manual","accusative-indefinite-nominative-singular":"orientare sexuală","accusative-definite-nominative-singular":"orientarea sexuală","accusative-indefinite-nominative-plural":"orientări sexuale","accusative-definite-nominative-plural":"orientările sexuale","dative-genitive-indefinite-singular":"orientări sexuale","dative-definite-genitive-singular":"orientării sexuale","dative-genitive-indefinite-plural":"orientări sexuale","dative-definite-genitive-plural":"orientărilor sexuale","singular-vocative":"-","plural-vocative":"-"}},{"word":"orientări","pos":"noun","definitions":["plural of orientare"],"pronunciation":"[o.ri.enˈtərʲ]","gender":"f"},{"word":"orientări sexuale","pos":"noun","definitions":["plural of orientare sexuală sexual orientations"],"pronunciation":"[o.ri.enˈtərʲ.sek.suˈa.le]","gender":"f-p"},{"word":"orientase","pos":"verb","definitions":["third-person singular pluperfect indicative of orienta"],"pronunciation":"[o.ri.enˈtase]"},{"word":"orientasem","pos":"verb","definitions":["first-person singular pluperfect indicative of orienta"],"pronunciation":"[o.ri.enˈtasem]"},{"word":"orientaseră","pos":"verb","definitions":["third-person plural pluperfect indicative of orienta"],"pronunciation":"[o.ri.enˈtaserə]"},{"word":"orientaserăm","pos":"verb","definitions":["first-person plural pluperfect indicative of orienta"],"pronunciation":"[o.ri.enˈtaserəm]"},{"word":"orientaserăți","pos":"verb","definitions":["second-person plural pluperfect indicative of orienta"],"pronunciation":"[o.ri.enˈtaserət͡sʲ]"},{"word":"orientaseși","pos":"verb","definitions":["second-person singular pluperfect indicative of orienta"],"pronunciation":"[o.ri.enˈtaseʃʲ]"},{"word":"orientași","pos":"verb","definitions":["second-person singular simple perfect indicative of orienta"],"pronunciation":"[o.ri.enˈtaʃʲ]"},{"word":"orientat","pos":"adj","definitions":["targeted"],"pronunciation":"[o.ri.enˈtat]","forms":{"feminine-singular":"orientată","masculine-plural":"orientați","feminine-neuter-plural":"orientate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orientat","error-unrecognized-form-feminine-indefinite-singular":"orientată","error-unrecognized-form-indefinite-masculine-plural":"orientați","error-unrecognized-form-feminine-indefinite-neuter-plural":"orientate","definite-error-unrecognized-form-masculine-neuter-singular":"orientatul","definite-error-unrecognized-form-feminine-singular":"orientata","definite-error-unrecognized-form-masculine-plural":"orientații","definite-error-unrecognized-form-feminine-neuter-plural":"orientatele"}},{"word":"orientat","pos":"verb","definitions":["past participle of orienta"],"pronunciation":"[o.ri.enˈtat]","forms":{"participle-past":"of orienta"}},{"word":"orientat pe obiecte","pos":"adj","definitions":["object-oriented"],"forms":{"feminine-singular":"orientată pe obiecte","masculine-plural":"orientați pe obiecte","feminine-neuter-plural":"orientate pe obiecte"}},{"word":"orientați","pos":"adj","definitions":["masculine plural of orientat"],"pronunciation":"[o.ri.enˈtat͡sʲ]"},{"word":"orientați","pos":"verb","definitions":["inflection of orienta:","second-person plural present/imperfect indicative","second-person plural present subjunctive","second-person plural imperative"],"pronunciation":"[o.ri.enˈtat͡sʲ]"},{"word":"orientație","pos":"noun","definitions":["orientation"],"forms":{"plural":"orientații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"orientație","accusative-definite-nominative-singular":"orientația","accusative-indefinite-nominative-plural":"orientații","accusative-definite-nominative-plural":"orientațiile","dative-genitive-indefinite-singular":"orientații","dative-definite-genitive-singular":"orientației","dative-genitive-indefinite-plural":"orientații","dative-definite-genitive-plural":"orientațiilor","singular-vocative":"orientație","plural-vocative":"orientațiilor"}},{"word":"orientațiune","pos":"noun","definitions":["obsolete form of orientație"],"forms":{"plural":"orientațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"orientațiune","accusative-definite-nominative-singular":"orientațiunea","accusative-indefinite-nominative-plural":"orientațiuni","accusative-definite-nominative-plural":"orientațiunile","dative-genitive-indefinite-singular":"orientațiuni","dative-definite-genitive-singular":"orientațiunii","dative-genitive-indefinite-plural":"orientațiuni","dative-definite-genitive-plural":"orientațiunilor","singular-vocative":"orientațiune","plural-vocative":"orientațiunilor"}},{"word":"orientativ","pos":"adj","definitions":["indicative"],"forms":{"feminine-singular":"orientativă","masculine-plural":"orientativi","feminine-neuter-plural":"orientative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orientativ","error-unrecognized-form-feminine-indefinite-singular":"orientativă","error-unrecognized-form-indefinite-masculine-plural":"orientativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"orientative","definite-error-unrecognized-form-masculine-neuter-singular":"orientativul","definite-error-unrecognized-form-feminine-singular":"orientativa","definite-error-unrecognized-form-masculine-plural":"orientativii","definite-error-unrecognized-form-feminine-neuter-plural":"orientativele"}},{"word":"orientator","pos":"adj","definitions":["orientational"],"forms":{"feminine-singular":"orientatoare","masculine-plural":"orientatori","feminine-neuter-plural":"orientatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orientator","error-unrecognized-form-feminine-indefinite-singular":"orientatoare","error-unrecognized-form-indefinite-masculine-plural":"orientatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"orientatoare","definite-error-unrecognized-form-masculine-neuter-singular":"orientatorul","definite-error-unrecognized-form-feminine-singular":"orientatoarea","definite-error-unrecognized-form-masculine-plural":"orientatorii","definite-error-unrecognized-form-feminine-neuter-plural":"orientatoarele"}},{"word":"orientau","pos":"verb","definitions":["third-person plural imperfect indicative of orienta"],"pronunciation":"[o.ri.enˈtaw]"},{"word":"orientează","pos":"verb","definitions":["inflection of orienta:","third-person singular/plural present indicative","second-person singular imperative"],"pronunciation":"[o.ri.enˈte̯a.zə]"},{"word":"orientez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of orienta"],"pronunciation":"[o.ri.enˈtez]"},{"word":"orienteze","pos":"verb","definitions":["third-person singular/plural present subjunctive of orienta"],"pronunciation":"[o.ri.enˈteze]"},{"word":"orientezi","pos":"verb","definitions":["second-person singular present indicative/subjunctive of orienta"],"pronunciation":"[o.ri.enˈtezʲ]"},{"word":"Orientul Îndepărtat","pos":"name","definitions":["Far East (a geographical region of Asia, consisting of East Asia (Korea, Japan, China, the Russian Far East, etc.) and Southeast Asia, taken as a whole)"],"gender":"n"}];
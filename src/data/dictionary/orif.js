@@ -0,0 +1 @@
+export default [{"word":"orificiu","pos":"noun","definitions":["hole"],"forms":{"plural":"orificii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"orificiu","accusative-definite-nominative-singular":"orificiul","accusative-indefinite-nominative-plural":"orificii","accusative-definite-nominative-plural":"orificiile","dative-genitive-indefinite-singular":"orificiu","dative-definite-genitive-singular":"orificiului","dative-genitive-indefinite-plural":"orificii","dative-definite-genitive-plural":"orificiilor","singular-vocative":"orificiule","plural-vocative":"orificiilor"}},{"word":"oriflamă","pos":"noun","definitions":["oriflamme"],"forms":{"plural":"oriflame","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oriflamă","accusative-definite-nominative-singular":"oriflama","accusative-indefinite-nominative-plural":"oriflame","accusative-definite-nominative-plural":"oriflamele","dative-genitive-indefinite-singular":"oriflame","dative-definite-genitive-singular":"oriflamei","dative-genitive-indefinite-plural":"oriflame","dative-definite-genitive-plural":"oriflamelor","singular-vocative":"oriflamă","plural-vocative":"oriflamelor"}},{"word":"origină","pos":"noun","definitions":["alternative form of origine"],"forms":{"plural":"origine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"origină","accusative-definite-nominative-singular":"origina","accusative-indefinite-nominative-plural":"origine","accusative-definite-nominative-plural":"originele","dative-genitive-indefinite-singular":"origine","dative-definite-genitive-singular":"originei","dative-genitive-indefinite-plural":"origine","dative-definite-genitive-plural":"originelor","singular-vocative":"origină","plural-vocative":"originelor"}},{"word":"original","pos":"adj","definitions":["original"],"forms":{"feminine-singular":"originală","masculine-plural":"originali","feminine-neuter-plural":"originale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"original","error-unrecognized-form-feminine-indefinite-singular":"originală","error-unrecognized-form-indefinite-masculine-plural":"originali","error-unrecognized-form-feminine-indefinite-neuter-plural":"originale","definite-error-unrecognized-form-masculine-neuter-singular":"originalul","definite-error-unrecognized-form-feminine-singular":"originala","definite-error-unrecognized-form-masculine-plural":"originalii","definite-error-unrecognized-form-feminine-neuter-plural":"originalele"}},{"word":"originalitate","pos":"noun","definitions":["originality","eccentricity"],"forms":{"plural":"originalități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative-singular":"originalitate","accusative-definite-nominative-singular":"originalitatea","accusative-indefinite-nominative-plural":"originalități","accusative-definite-nominative-plural":"originalitățile","dative-genitive-indefinite-singular":"originalități","dative-definite-genitive-singular":"originalității","dative-genitive-indefinite-plural":"originalități","dative-definite-genitive-plural":"originalităților","singular-vocative":"originalitate","plural-vocative":"originalităților"}},{"word":"originar","pos":"adj","definitions":["originating (from)"],"forms":{"feminine-singular":"originară","masculine-plural":"originari","feminine-neuter-plural":"originare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"originar","error-unrecognized-form-feminine-indefinite-singular":"originară","error-unrecognized-form-indefinite-masculine-plural":"originari","error-unrecognized-form-feminine-indefinite-neuter-plural":"originare","definite-error-unrecognized-form-masculine-neuter-singular":"originarul","definite-error-unrecognized-form-feminine-singular":"originara","definite-error-unrecognized-form-masculine-plural":"originarii","definite-error-unrecognized-form-feminine-neuter-plural":"originarele"}},{"word":"origine","pos":"noun","definitions":["origin"],"forms":{"plural":"origini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"origine","accusative-definite-nominative-singular":"originea","accusative-indefinite-nominative-plural":"origini","accusative-definite-nominative-plural":"originile","dative-genitive-indefinite-singular":"origini","dative-definite-genitive-singular":"originii","dative-genitive-indefinite-plural":"origini","dative-definite-genitive-plural":"originilor","singular-vocative":"origine","plural-vocative":"originilor","alternative-dated":"origină"}},{"word":"origini","pos":"noun","definitions":["plural of origine"],"gender":"f-p"},{"word":"oriîncotro","pos":"adv","definitions":["whithersoever, wherever"]},{"word":"oripila","pos":"verb","definitions":["to horrify (to cause to feel extreme apprehension or unease)"],"forms":{"canonical":"a oripila 1st conjugation","present-singular-third-person":"oripilează","participle-past":"oripilat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a oripila","gerund":"oripilând","first-person-indicative-present-singular":"oripilez","indicative-present-second-person-singular":"oripilezi","indicative-present-singular-third-person":"oripilează","first-person-indicative-plural-present":"oripilăm","indicative-plural-present-second-person":"oripilați","indicative-plural-present-third-person":"oripilează","first-person-imperfect-indicative-singular":"oripilam","imperfect-indicative-second-person-singular":"oripilai","imperfect-indicative-singular-third-person":"oripila","first-person-imperfect-indicative-plural":"oripilam","imperfect-indicative-plural-second-person":"oripilați","imperfect-indicative-plural-third-person":"oripilau","first-person-indicative-perfect-singular":"oripilai","indicative-perfect-second-person-singular":"oripilași","indicative-perfect-singular-third-person":"oripilă","first-person-indicative-perfect-plural":"oripilarăm","indicative-perfect-plural-second-person":"oripilarăți","indicative-perfect-plural-third-person":"oripilară","first-person-indicative-pluperfect-singular":"oripilasem","indicative-pluperfect-second-person-singular":"oripilaseși","indicative-pluperfect-singular-third-person":"oripilase","first-person-indicative-pluperfect-plural":"oripilaserăm","indicative-pluperfect-plural-second-person":"oripilaserăți","indicative-pluperfect-plural-third-person":"oripilaseră","first-person-present-singular-subjunctive":"să oripilez","present-second-person-singular-subjunctive":"să oripilezi","present-singular-subjunctive-third-person":"să oripileze","first-person-plural-present-subjunctive":"să oripilăm","plural-present-second-person-subjunctive":"să oripilați","plural-present-subjunctive-third-person":"să oripileze","imperative-second-person-singular":"oripilează","imperative-plural-second-person":"oripilați","imperative-negative-second-person-singular":"nu oripila","imperative-negative-plural-second-person":"nu oripilați"}},{"word":"oripilant","pos":"adj","definitions":["horrifying"],"forms":{"feminine-singular":"oripilantă","masculine-plural":"oripilanți","feminine-neuter-plural":"oripilante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oripilant","error-unrecognized-form-feminine-indefinite-singular":"oripilantă","error-unrecognized-form-indefinite-masculine-plural":"oripilanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"oripilante","definite-error-unrecognized-form-masculine-neuter-singular":"oripilantul","definite-error-unrecognized-form-feminine-singular":"oripilanta","definite-error-unrecognized-form-masculine-plural":"oripilanții","definite-error-unrecognized-form-feminine-neuter-plural":"oripilantele"}},{"word":"oripilare","pos":"noun","definitions":["horrification"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"oripilare","accusative-definite-nominative":"oripilarea","dative-genitive-indefinite":"oripilare","dative-definite-genitive":"oripilarei","vocative":"oripilare"}},{"word":"oripilație","pos":"noun","definitions":["horrification"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oripilație","accusative-definite-nominative-singular":"oripilația","accusative-indefinite-nominative-plural":"oripilații","accusative-definite-nominative-plural":"oripilațiile","dative-genitive-indefinite-singular":"oripilații","dative-definite-genitive-singular":"oripilației","dative-genitive-indefinite-plural":"oripilații","dative-definite-genitive-plural":"oripilațiilor","singular-vocative":"oripilație","plural-vocative":"oripilațiilor"}},{"word":"oripilațiune","pos":"noun","definitions":["obsolete form of oripilație"],"forms":{"plural":"oripilațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oripilațiune","accusative-definite-nominative-singular":"oripilațiunea","accusative-indefinite-nominative-plural":"oripilațiuni","accusative-definite-nominative-plural":"oripilațiunile","dative-genitive-indefinite-singular":"oripilațiuni","dative-definite-genitive-singular":"oripilațiunii","dative-genitive-indefinite-plural":"oripilațiuni","dative-definite-genitive-plural":"oripilațiunilor","singular-vocative":"oripilațiune","plural-vocative":"oripilațiunilor"}},{"word":"orișicând","pos":"adv","definitions":["synonym of oricând (“any time”)"],"pronunciation":"/orʲ.ʃi.ˈkɨnd/"},{"word":"orișicât","pos":"adv","definitions":["however"]},{"word":"orișicine","pos":"pron","definitions":["anyone, anybody"],"forms":{"table-tags":"no-table-tags","inflection-template":"l-self","accusative-masculine-neuter-nominative-singular":"orișicine","accusative-feminine-nominative-singular":"-","accusative-masculine-nominative-plural":"-","accusative-feminine-neuter-nominative-plural":"-","dative-genitive-masculine-neuter-singular":"orișicui","dative-feminine-genitive-singular":"-","dative-genitive-masculine-plural":"-","dative-feminine-genitive-neuter-plural":"-"}},{"word":"orișicum","pos":"adv","definitions":["however"]},{"word":"orișiunde","pos":"adv","definitions":["wheresoever"]},{"word":"oriunde","pos":"adv","definitions":["anywhere"],"pronunciation":"/orʲˈun.de/"},{"word":"orizon","pos":"noun","definitions":["alternative form of orizont"],"forms":{"plural":"orizoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"orizon","accusative-definite-nominative-singular":"orizonul","accusative-indefinite-nominative-plural":"orizoane","accusative-definite-nominative-plural":"orizoanele","dative-genitive-indefinite-singular":"orizon","dative-definite-genitive-singular":"orizonului","dative-genitive-indefinite-plural":"orizoane","dative-definite-genitive-plural":"orizoanelor","singular-vocative":"orizonule","plural-vocative":"orizoanelor"}},{"word":"orizont","pos":"noun","definitions":["horizon, skyline"],"forms":{"plural":"orizonturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"orizont","accusative-definite-nominative-singular":"orizontul","accusative-indefinite-nominative-plural":"orizonturi","accusative-definite-nominative-plural":"orizonturile","dative-genitive-indefinite-singular":"orizont","dative-definite-genitive-singular":"orizontului","dative-genitive-indefinite-plural":"orizonturi","dative-definite-genitive-plural":"orizonturilor","singular-vocative":"orizontule","plural-vocative":"orizonturilor","alternative":"orizon"}},{"word":"orizontal","pos":"adj","definitions":["horizontal"],"forms":{"feminine-singular":"orizontală","masculine-plural":"orizontali","feminine-neuter-plural":"orizontale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orizontal","error-unrecognized-form-feminine-indefinite-singular":"orizontală","error-unrecognized-form-indefinite-masculine-plural":"orizontali","error-unrecognized-form-feminine-indefinite-neuter-plural":"orizontale","definite-error-unrecognized-form-masculine-neuter-singular":"orizontalul","definite-error-unrecognized-form-feminine-singular":"orizontala","definite-error-unrecognized-form-masculine-plural":"orizontalii","definite-error-unrecognized-form-feminine-neuter-plural":"orizontalele"}},{"word":"orizontală","pos":"noun","definitions":["horizontal line"],"forms":{"plural":"orizontale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orizontală","accusative-definite-nominative-singular":"orizontala","accusative-indefinite-nominative-plural":"orizontale","accusative-definite-nominative-plural":"orizontalele","dative-genitive-indefinite-singular":"orizontale","dative-definite-genitive-singular":"orizontalei","dative-genitive-indefinite-plural":"orizontale","dative-definite-genitive-plural":"orizontalelor","singular-vocative":"orizontală","plural-vocative":"orizontalelor"}},{"word":"orizontalitate","pos":"noun","definitions":["horizontality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"orizontalitate","accusative-definite-nominative-singular":"orizontalitatea","accusative-indefinite-nominative-plural":"orizontalități","accusative-definite-nominative-plural":"orizontalitățile","dative-genitive-indefinite-singular":"orizontalități","dative-definite-genitive-singular":"orizontalității","dative-genitive-indefinite-plural":"orizontalități","dative-definite-genitive-plural":"orizontalităților","singular-vocative":"orizontalitate","plural-vocative":"orizontalităților"}},{"word":"orizontaliza","pos":"verb","definitions":["to horizontalize"],"forms":{"canonical":"a orizontaliza 1st conjugation","present-singular-third-person":"orizontalizează","participle-past":"orizontalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a orizontaliza","gerund":"orizontalizând","first-person-indicative-present-singular":"orizontalizez","indicative-present-second-person-singular":"orizontalizezi","indicative-present-singular-third-person":"orizontalizează","first-person-indicative-plural-present":"orizontalizăm","indicative-plural-present-second-person":"orizontalizați","indicative-plural-present-third-person":"orizontalizează","first-person-imperfect-indicative-singular":"orizontalizam","imperfect-indicative-second-person-singular":"orizontalizai","imperfect-indicative-singular-third-person":"orizontaliza","first-person-imperfect-indicative-plural":"orizontalizam","imperfect-indicative-plural-second-person":"orizontalizați","imperfect-indicative-plural-third-person":"orizontalizau","first-person-indicative-perfect-singular":"orizontalizai","indicative-perfect-second-person-singular":"orizontalizași","indicative-perfect-singular-third-person":"orizontaliză","first-person-indicative-perfect-plural":"orizontalizarăm","indicative-perfect-plural-second-person":"orizontalizarăți","indicative-perfect-plural-third-person":"orizontalizară","first-person-indicative-pluperfect-singular":"orizontalizasem","indicative-pluperfect-second-person-singular":"orizontalizaseși","indicative-pluperfect-singular-third-person":"orizontalizase","first-person-indicative-pluperfect-plural":"orizontalizaserăm","indicative-pluperfect-plural-second-person":"orizontalizaserăți","indicative-pluperfect-plural-third-person":"orizontalizaseră","first-person-present-singular-subjunctive":"să orizontalizez","present-second-person-singular-subjunctive":"să orizontalizezi","present-singular-subjunctive-third-person":"să orizontalizeze","first-person-plural-present-subjunctive":"să orizontalizăm","plural-present-second-person-subjunctive":"să orizontalizați","plural-present-subjunctive-third-person":"să orizontalizeze","imperative-second-person-singular":"orizontalizează","imperative-plural-second-person":"orizontalizați","imperative-negative-second-person-singular":"nu orizontaliza","imperative-negative-plural-second-person":"nu orizontalizați"}},{"word":"orizontalizare","pos":"noun","definitions":["leveling"],"forms":{"plural":"orizontalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"orizontalizare","accusative-definite-nominative-singular":"orizontalizarea","accusative-indefinite-nominative-plural":"orizontalizări","accusative-definite-nominative-plural":"orizontalizările","dative-genitive-indefinite-singular":"orizontalizări","dative-definite-genitive-singular":"orizontalizării","dative-genitive-indefinite-plural":"orizontalizări","dative-definite-genitive-plural":"orizontalizărilor","singular-vocative":"orizontalizare","plural-vocative":"orizontalizărilor"}},{"word":"orizonte","pos":"noun","definitions":["dated form of orizont (“horizon”)"],"pronunciation":"/o.riˈzon.te/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"orizonte","accusative-definite-nominative":"orizonteul","dative-genitive-indefinite":"orizonte","dative-definite-genitive":"orizonteului","vocative":"orizonteule"}},{"word":"orjad","pos":"noun","definitions":["orgeat"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"orjad","accusative-definite-nominative":"orjadul","dative-genitive-indefinite":"orjad","dative-definite-genitive":"orjadului","vocative":"orjadule"}},{"word":"Orlat","pos":"name","definitions":["a commune of Sibiu County, Romania","a village in Orlat, Sibiu County, Romania"],"gender":"m"},{"word":"Orlățel","pos":"name","definitions":["a river in Sibiu County, Romania"],"gender":"m"},{"word":"Orlea","pos":"name","definitions":["a commune of Olt County, Romania","a village in Orlea, Olt County, Romania"],"gender":"f"},{"word":"Orlea Nouă","pos":"name","definitions":["a village in Orlea, Olt County, Romania"],"gender":"f"},{"word":"Orleanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Orleanu"}},{"word":"Orlești","pos":"name","definitions":["a commune of Vâlcea County, Romania","a village in Orlești, Vâlcea County, Romania"],"gender":"m"},{"word":"orlon","pos":"noun","definitions":["Orlon"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"orlon","accusative-definite-nominative":"orlonul","dative-genitive-indefinite":"orlon","dative-definite-genitive":"orlonului","vocative":"orlonule"}},{"word":"Orman","pos":"name","definitions":["a village in Iclod, Cluj County, Romania"],"gender":"m"},{"word":"Ormeniș","pos":"name","definitions":["a commune of Brașov County, Romania","a village in Ormeniș, Brașov County, Romania"],"pronunciation":"/or.meˈniʃ/","gender":"m"},{"word":"Ormeniș","pos":"name","definitions":["a village in Mirăslău, Alba County, Romania","a village in Viișoara, Mureș County, Romania"],"pronunciation":"/or.meˈniʃ/","gender":"m"},{"word":"Ormenișan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ormenișan"}},{"word":"Ormindean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ormindean"}},{"word":"Ormindeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ormindeanu"}},{"word":"orna","pos":"verb","definitions":["to adorn"],"pronunciation":"/orˈna/","forms":{"canonical":"a orna 1st conjugation","present-singular-third-person":"ornează","participle-past":"ornat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a orna","gerund":"ornând","first-person-indicative-present-singular":"ornez","indicative-present-second-person-singular":"ornezi","indicative-present-singular-third-person":"ornează","first-person-indicative-plural-present":"ornăm","indicative-plural-present-second-person":"ornați","indicative-plural-present-third-person":"ornează","first-person-imperfect-indicative-singular":"ornam","imperfect-indicative-second-person-singular":"ornai","imperfect-indicative-singular-third-person":"orna","first-person-imperfect-indicative-plural":"ornam","imperfect-indicative-plural-second-person":"ornați","imperfect-indicative-plural-third-person":"ornau","first-person-indicative-perfect-singular":"ornai","indicative-perfect-second-person-singular":"ornași","indicative-perfect-singular-third-person":"ornă","first-person-indicative-perfect-plural":"ornarăm","indicative-perfect-plural-second-person":"ornarăți","indicative-perfect-plural-third-person":"ornară","first-person-indicative-pluperfect-singular":"ornasem","indicative-pluperfect-second-person-singular":"ornaseși","indicative-pluperfect-singular-third-person":"ornase","first-person-indicative-pluperfect-plural":"ornaserăm","indicative-pluperfect-plural-second-person":"ornaserăți","indicative-pluperfect-plural-third-person":"ornaseră","first-person-present-singular-subjunctive":"să ornez","present-second-person-singular-subjunctive":"să ornezi","present-singular-subjunctive-third-person":"să orneze","first-person-plural-present-subjunctive":"să ornăm","plural-present-second-person-subjunctive":"să ornați","plural-present-subjunctive-third-person":"să orneze","imperative-second-person-singular":"ornează","imperative-plural-second-person":"ornați","imperative-negative-second-person-singular":"nu orna","imperative-negative-plural-second-person":"nu ornați"}},{"word":"ornament","pos":"noun","definitions":["ornament"],"forms":{"plural":"ornamente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ornament","accusative-definite-nominative-singular":"ornamentul","accusative-indefinite-nominative-plural":"ornamente","accusative-definite-nominative-plural":"ornamentele","dative-genitive-indefinite-singular":"ornament","dative-definite-genitive-singular":"ornamentului","dative-genitive-indefinite-plural":"ornamente","dative-definite-genitive-plural":"ornamentelor","singular-vocative":"ornamentule","plural-vocative":"ornamentelor"}},{"word":"ornamenta","pos":"verb","definitions":["to ornament, to decorate"],"forms":{"canonical":"a ornamenta 1st conjugation","present-singular-third-person":"ornamentează","participle-past":"ornamentat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ornamenta","gerund":"ornamentând","first-person-indicative-present-singular":"ornamentez","indicative-present-second-person-singular":"ornamentezi","indicative-present-singular-third-person":"ornamentează","first-person-indicative-plural-present":"ornamentăm","indicative-plural-present-second-person":"ornamentați","indicative-plural-present-third-person":"ornamentează","first-person-imperfect-indicative-singular":"ornamentam","imperfect-indicative-second-person-singular":"ornamentai","imperfect-indicative-singular-third-person":"ornamenta","first-person-imperfect-indicative-plural":"ornamentam","imperfect-indicative-plural-second-person":"ornamentați","imperfect-indicative-plural-third-person":"ornamentau","first-person-indicative-perfect-singular":"ornamentai","indicative-perfect-second-person-singular":"ornamentași","indicative-perfect-singular-third-person":"ornamentă","first-person-indicative-perfect-plural":"ornamentarăm","indicative-perfect-plural-second-person":"ornamentarăți","indicative-perfect-plural-third-person":"ornamentară","first-person-indicative-pluperfect-singular":"ornamentasem","indicative-pluperfect-second-person-singular":"ornamentaseși","indicative-pluperfect-singular-third-person":"ornamentase","first-person-indicative-pluperfect-plural":"ornamentaserăm","indicative-pluperfect-plural-second-person":"ornamentaserăți","indicative-pluperfect-plural-third-person":"ornamentaseră","first-person-present-singular-subjunctive":"să ornamentez","present-second-person-singular-subjunctive":"să ornamentezi","present-singular-subjunctive-third-person":"să ornamenteze","first-person-plural-present-subjunctive":"să ornamentăm","plural-present-second-person-subjunctive":"să ornamentați","plural-present-subjunctive-third-person":"să ornamenteze","imperative-second-person-singular":"ornamentează","imperative-plural-second-person":"ornamentați","imperative-negative-second-person-singular":"nu ornamenta","imperative-negative-plural-second-person":"nu ornamentați"}},{"word":"ornamental","pos":"adj","definitions":["ornamental"],"forms":{"feminine-singular":"ornamentală","masculine-plural":"ornamentali","feminine-neuter-plural":"ornamentale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ornamental","error-unrecognized-form-feminine-indefinite-singular":"ornamentală","error-unrecognized-form-indefinite-masculine-plural":"ornamentali","error-unrecognized-form-feminine-indefinite-neuter-plural":"ornamentale","definite-error-unrecognized-form-masculine-neuter-singular":"ornamentalul","definite-error-unrecognized-form-feminine-singular":"ornamentala","definite-error-unrecognized-form-masculine-plural":"ornamentalii","definite-error-unrecognized-form-feminine-neuter-plural":"ornamentalele"}},{"word":"ornamentare","pos":"noun","definitions":["ornamentation"],"forms":{"plural":"ornamentări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ornamentare","accusative-definite-nominative-singular":"ornamentarea","accusative-indefinite-nominative-plural":"ornamentări","accusative-definite-nominative-plural":"ornamentările","dative-genitive-indefinite-singular":"ornamentări","dative-definite-genitive-singular":"ornamentării","dative-genitive-indefinite-plural":"ornamentări","dative-definite-genitive-plural":"ornamentărilor","singular-vocative":"ornamentare","plural-vocative":"ornamentărilor"}},{"word":"ornamentație","pos":"noun","definitions":["ornamentation"],"forms":{"plural":"ornamentații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ornamentație","accusative-definite-nominative-singular":"ornamentația","accusative-indefinite-nominative-plural":"ornamentații","accusative-definite-nominative-plural":"ornamentațiile","dative-genitive-indefinite-singular":"ornamentații","dative-definite-genitive-singular":"ornamentației","dative-genitive-indefinite-plural":"ornamentații","dative-definite-genitive-plural":"ornamentațiilor","singular-vocative":"ornamentație","plural-vocative":"ornamentațiilor"}},{"word":"ornamentațiune","pos":"noun","definitions":["obsolete form of ornamentație"],"forms":{"plural":"ornamentațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ornamentațiune","accusative-definite-nominative-singular":"ornamentațiunea","accusative-indefinite-nominative-plural":"ornamentațiuni","accusative-definite-nominative-plural":"ornamentațiunile","dative-genitive-indefinite-singular":"ornamentațiuni","dative-definite-genitive-singular":"ornamentațiunii","dative-genitive-indefinite-plural":"ornamentațiuni","dative-definite-genitive-plural":"ornamentațiunilor","singular-vocative":"ornamentațiune","plural-vocative":"ornamentațiunilor"}},{"word":"ornamentică","pos":"noun","definitions":["ornamentation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"ornamentică","accusative-definite-nominative":"ornamentica","dative-genitive-indefinite":"ornamentice","dative-definite-genitive":"ornamenticei","vocative":"ornamentică"}},{"word":"ornamentist","pos":"noun","definitions":["ornamentist"],"forms":{"plural":"ornamentiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ornamentist","accusative-definite-nominative-singular":"ornamentistul","accusative-indefinite-nominative-plural":"ornamentiști","accusative-definite-nominative-plural":"ornamentiștii","dative-genitive-indefinite-singular":"ornamentist","dative-definite-genitive-singular":"ornamentistului","dative-genitive-indefinite-plural":"ornamentiști","dative-definite-genitive-plural":"ornamentiștilor","singular-vocative":"ornamentistule","plural-vocative":"ornamentiștilor"}},{"word":"ornamentistă","pos":"noun","definitions":["female equivalent of ornamentist"],"forms":{"plural":"ornamentiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ornamentistă","accusative-definite-nominative-singular":"ornamentista","accusative-indefinite-nominative-plural":"ornamentiste","accusative-definite-nominative-plural":"ornamentistele","dative-genitive-indefinite-singular":"ornamentiste","dative-definite-genitive-singular":"ornamentistei","dative-genitive-indefinite-plural":"ornamentiste","dative-definite-genitive-plural":"ornamentistelor","singular-vocative":"ornamentistă","plural-vocative":"ornamentistelor"}},{"word":"ornare","pos":"noun","definitions":["adornment"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"ornare","accusative-definite-nominative":"ornarea","dative-genitive-indefinite":"ornare","dative-definite-genitive":"ornarei","vocative":"ornare"}},{"word":"ornat","pos":"noun","definitions":["ceremonial clerical robe"],"pronunciation":"/orˈnat/","forms":{"plural":"ornate"}},{"word":"ornat","pos":"adj","definitions":["ornate, adorned, decorated"],"pronunciation":"/orˈnat/","forms":{"feminine-singular":"ornată","masculine-plural":"ornați","feminine-neuter-plural":"ornate","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"ornat","error-unrecognized-form-feminine-indefinite-singular":"ornată","error-unrecognized-form-indefinite-masculine-plural":"ornați","error-unrecognized-form-feminine-indefinite-neuter-plural":"ornate","definite-error-unrecognized-form-masculine-neuter-singular":"ornatul","definite-error-unrecognized-form-feminine-singular":"ornata","definite-error-unrecognized-form-masculine-plural":"ornații","definite-error-unrecognized-form-feminine-neuter-plural":"ornatele"}},{"word":"ornat","pos":"verb","definitions":["past participle of orna"],"pronunciation":"/orˈnat/"},{"word":"ornic","pos":"noun","definitions":["wall clock, grandfather clock"],"forms":{"plural":"ornice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ornic","accusative-definite-nominative-singular":"ornicul","accusative-indefinite-nominative-plural":"ornice","accusative-definite-nominative-plural":"ornicele","dative-genitive-indefinite-singular":"ornic","dative-definite-genitive-singular":"ornicului","dative-genitive-indefinite-plural":"ornice","dative-definite-genitive-plural":"ornicelor","singular-vocative":"ornicule","plural-vocative":"ornicelor"}},{"word":"ornicărie","pos":"noun","definitions":["watchmaker's shop","watchmaking"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"ornicărie","accusative-definite-nominative":"ornicăria","dative-genitive-indefinite":"ornicării","dative-definite-genitive":"ornicăriei","vocative":"ornicărie"}},{"word":"ornito-","pos":"prefix","definitions":["ornitho-"]},{"word":"ornitofaună","pos":"noun","definitions":["avifauna"],"forms":{"plural":"ornitofaune","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ornitofaună","accusative-definite-nominative-singular":"ornitofauna","accusative-indefinite-nominative-plural":"ornitofaune","accusative-definite-nominative-plural":"ornitofaunele","dative-genitive-indefinite-singular":"ornitofaune","dative-definite-genitive-singular":"ornitofaunei","dative-genitive-indefinite-plural":"ornitofaune","dative-definite-genitive-plural":"ornitofaunelor","singular-vocative":"ornitofaună","plural-vocative":"ornitofaunelor"}},{"word":"ornitofil","pos":"noun","definitions":["ornithophile"],"forms":{"plural":"orinitofili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ornitofil","accusative-definite-nominative-singular":"ornitofilul","accusative-indefinite-nominative-plural":"orinitofili","accusative-definite-nominative-plural":"orinitofilii","dative-genitive-indefinite-singular":"ornitofil","dative-definite-genitive-singular":"ornitofilului","dative-genitive-indefinite-plural":"orinitofili","dative-definite-genitive-plural":"orinitofililor","singular-vocative":"ornitofilule","plural-vocative":"orinitofililor"}},{"word":"ornitofilă","pos":"noun","definitions":["female equivalent of ornitofil"],"forms":{"plural":"ornitofile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ornitofilă","accusative-definite-nominative-singular":"ornitofila","accusative-indefinite-nominative-plural":"ornitofile","accusative-definite-nominative-plural":"ornitofilele","dative-genitive-indefinite-singular":"ornitofile","dative-definite-genitive-singular":"ornitofilei","dative-genitive-indefinite-plural":"ornitofile","dative-definite-genitive-plural":"ornitofilelor","singular-vocative":"ornitofilă","plural-vocative":"ornitofilelor"}},{"word":"ornitofilie","pos":"noun","definitions":["ornithophilia"],"forms":{"plural":"ornitofilii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ornitofilie","accusative-definite-nominative-singular":"ornitofilia","accusative-indefinite-nominative-plural":"ornitofilii","accusative-definite-nominative-plural":"ornitofiliile","dative-genitive-indefinite-singular":"ornitofilii","dative-definite-genitive-singular":"ornitofiliei","dative-genitive-indefinite-plural":"ornitofilii","dative-definite-genitive-plural":"ornitofiliilor","singular-vocative":"ornitofilie","plural-vocative":"ornitofiliilor"}},{"word":"ornitogeografie","pos":"noun","definitions":["ornithogeography"],"forms":{"plural":"ornitogeografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ornitogeografie","accusative-definite-nominative-singular":"ornitogeografia","accusative-indefinite-nominative-plural":"ornitogeografii","accusative-definite-nominative-plural":"ornitogeografiile","dative-genitive-indefinite-singular":"ornitogeografii","dative-definite-genitive-singular":"ornitogeografiei","dative-genitive-indefinite-plural":"ornitogeografii","dative-definite-genitive-plural":"ornitogeografiilor","singular-vocative":"ornitogeografie","plural-vocative":"ornitogeografiilor"}},{"word":"ornitolog","pos":"noun","definitions":["ornithologist"],"pronunciation":"/or.ni.toˈloɡ/","forms":{"plural":"ornitologi","feminine":"equivalent ornitologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ornitolog","accusative-definite-nominative-singular":"ornitologul","accusative-indefinite-nominative-plural":"ornitologi","accusative-definite-nominative-plural":"ornitologii","dative-genitive-indefinite-singular":"ornitolog","dative-definite-genitive-singular":"ornitologului","dative-genitive-indefinite-plural":"ornitologi","dative-definite-genitive-plural":"ornitologilor","singular-vocative":"ornitologule","plural-vocative":"ornitologilor"}},{"word":"ornitologa","pos":"noun","definitions":["definite nominative/accusative singular of ornitologă"]},{"word":"ornitologă","pos":"noun","definitions":["female equivalent of ornitolog"],"pronunciation":"/or.ni.toˈlo.ɡə/","forms":{"plural":"ornitologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"ornitologă","accusative-definite-nominative-singular":"ornitologa","accusative-indefinite-nominative-plural":"ornitologe","accusative-definite-nominative-plural":"ornitologele","dative-genitive-indefinite-singular":"ornitologe","dative-definite-genitive-singular":"ornitologei","dative-genitive-indefinite-plural":"ornitologe","dative-definite-genitive-plural":"ornitologelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"ornitologe","pos":"noun","definitions":["plural of ornitologă"],"gender":"f"},{"word":"ornitologi","pos":"noun","definitions":["plural of ornitolog"],"gender":"m"},{"word":"ornitologic","pos":"adj","definitions":["ornithological"],"forms":{"feminine-singular":"ornitologică","masculine-plural":"ornitologici","feminine-neuter-plural":"ornitologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ornitologic","error-unrecognized-form-feminine-indefinite-singular":"ornitologică","error-unrecognized-form-indefinite-masculine-plural":"ornitologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ornitologice","definite-error-unrecognized-form-masculine-neuter-singular":"ornitologicul","definite-error-unrecognized-form-feminine-singular":"ornitologica","definite-error-unrecognized-form-masculine-plural":"ornitologicii","definite-error-unrecognized-form-feminine-neuter-plural":"ornitologicele"}},{"word":"ornitologie","pos":"noun","definitions":["ornithology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"ornitologie","accusative-definite-nominative":"ornitologia","dative-genitive-indefinite":"ornitologii","dative-definite-genitive":"ornitologiei","vocative":"ornitologie"}},{"word":"ornitologist","pos":"noun","definitions":["ornithologist"],"forms":{"plural":"ornitologiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ornitologist","accusative-definite-nominative-singular":"ornitologistul","accusative-indefinite-nominative-plural":"ornitologiști","accusative-definite-nominative-plural":"ornitologiștii","dative-genitive-indefinite-singular":"ornitologist","dative-definite-genitive-singular":"ornitologistului","dative-genitive-indefinite-plural":"ornitologiști","dative-definite-genitive-plural":"ornitologiștilor","singular-vocative":"ornitologistule","plural-vocative":"ornitologiștilor"}},{"word":"ornitologistă","pos":"noun","definitions":["female equivalent of ornitologist"],"forms":{"plural":"ornitologiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ornitologistă","accusative-definite-nominative-singular":"ornitologista","accusative-indefinite-nominative-plural":"ornitologiste","accusative-definite-nominative-plural":"ornitologistele","dative-genitive-indefinite-singular":"ornitologiste","dative-definite-genitive-singular":"ornitologistei","dative-genitive-indefinite-plural":"ornitologiste","dative-definite-genitive-plural":"ornitologistelor","singular-vocative":"ornitologistă","plural-vocative":"ornitologistelor"}},{"word":"ornitomanție","pos":"noun","definitions":["ornithomancy"],"forms":{"plural":"ornitomanții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ornitomanție","accusative-definite-nominative-singular":"ornitomanția","accusative-indefinite-nominative-plural":"ornitomanții","accusative-definite-nominative-plural":"ornitomanțiile","dative-genitive-indefinite-singular":"ornitomanții","dative-definite-genitive-singular":"ornitomanției","dative-genitive-indefinite-plural":"ornitomanții","dative-definite-genitive-plural":"ornitomanțiilor","singular-vocative":"ornitomanție","plural-vocative":"ornitomanțiilor"}},{"word":"ornitopter","pos":"noun","definitions":["ornithopter"],"forms":{"plural":"ornitoptere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ornitopter","accusative-definite-nominative-singular":"ornitopterul","accusative-indefinite-nominative-plural":"ornitoptere","accusative-definite-nominative-plural":"ornitopterele","dative-genitive-indefinite-singular":"ornitopter","dative-definite-genitive-singular":"ornitopterului","dative-genitive-indefinite-plural":"ornitoptere","dative-definite-genitive-plural":"ornitopterelor","singular-vocative":"ornitopterule","plural-vocative":"ornitopterelor"}},{"word":"ornitorinc","pos":"noun","definitions":["platypus (ornithorhynchus anatinus)"],"pronunciation":"/ornitoˈrink/","forms":{"plural":"ornitorinci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ornitorinc","accusative-definite-nominative-singular":"ornitorincul","accusative-indefinite-nominative-plural":"ornitorinci","accusative-definite-nominative-plural":"ornitorincii","dative-genitive-indefinite-singular":"ornitorinc","dative-definite-genitive-singular":"ornitorincului","dative-genitive-indefinite-plural":"ornitorinci","dative-definite-genitive-plural":"ornitorincilor","singular-vocative":"ornitorincule","plural-vocative":"ornitorincilor"}},{"word":"ornitorinci","pos":"noun","definitions":["plural of ornitorinc"]},{"word":"ornitoză","pos":"noun","definitions":["ornithosis"],"forms":{"plural":"ornitoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ornitoză","accusative-definite-nominative-singular":"ornitoza","accusative-indefinite-nominative-plural":"ornitoze","accusative-definite-nominative-plural":"ornitozele","dative-genitive-indefinite-singular":"ornitoze","dative-definite-genitive-singular":"ornitozei","dative-genitive-indefinite-plural":"ornitoze","dative-definite-genitive-plural":"ornitozelor","singular-vocative":"ornitoză","plural-vocative":"ornitozelor"}},{"word":"oroare","pos":"noun","definitions":["horror"],"forms":{"plural":"orori"}},{"word":"orofit","pos":"adj","definitions":["orophyte"],"forms":{"feminine-singular":"orofită","masculine-plural":"orofiți","feminine-neuter-plural":"orofite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orofit","error-unrecognized-form-feminine-indefinite-singular":"orofită","error-unrecognized-form-indefinite-masculine-plural":"orofiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"orofite","definite-error-unrecognized-form-masculine-neuter-singular":"orofitul","definite-error-unrecognized-form-feminine-singular":"orofita","definite-error-unrecognized-form-masculine-plural":"orofiții","definite-error-unrecognized-form-feminine-neuter-plural":"orofitele"}},{"word":"orogen","pos":"noun","definitions":["orogen"],"forms":{"plural":"orogene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"orogen","accusative-definite-nominative-singular":"orogenul","accusative-indefinite-nominative-plural":"orogene","accusative-definite-nominative-plural":"orogenele","dative-genitive-indefinite-singular":"orogen","dative-definite-genitive-singular":"orogenului","dative-genitive-indefinite-plural":"orogene","dative-definite-genitive-plural":"orogenelor","singular-vocative":"orogenule","plural-vocative":"orogenelor"}},{"word":"orogenetic","pos":"adj","definitions":["orogenetic"],"forms":{"feminine-singular":"orogenetică","masculine-plural":"orogenetici","feminine-neuter-plural":"orogenetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orogenetic","error-unrecognized-form-feminine-indefinite-singular":"orogenetică","error-unrecognized-form-indefinite-masculine-plural":"orogenetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"orogenetice","definite-error-unrecognized-form-masculine-neuter-singular":"orogeneticul","definite-error-unrecognized-form-feminine-singular":"orogenetica","definite-error-unrecognized-form-masculine-plural":"orogeneticii","definite-error-unrecognized-form-feminine-neuter-plural":"orogeneticele"}},{"word":"orogeneza","pos":"noun","definitions":["nominative/accusative definite singular of orogeneză"],"gender":"f"},{"word":"orogeneză","pos":"noun","definitions":["orogeny"],"forms":{"plural":"orogeneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orogeneză","accusative-definite-nominative-singular":"orogeneza","accusative-indefinite-nominative-plural":"orogeneze","accusative-definite-nominative-plural":"orogenezele","dative-genitive-indefinite-singular":"orogeneze","dative-definite-genitive-singular":"orogenezei","dative-genitive-indefinite-plural":"orogeneze","dative-definite-genitive-plural":"orogenezelor","singular-vocative":"orogeneză","plural-vocative":"orogenezelor"}},{"word":"orogeneze","pos":"noun","definitions":["inflection of orogeneză:","genitive/dative indefinite singular","nominative/accusative/genitive/dative indefinite plural"],"gender":"f"},{"word":"orogenezo","pos":"noun","definitions":["vocative singular of orogeneză"],"gender":"f"},{"word":"orogenic","pos":"adj","definitions":["orogenic"],"forms":{"feminine-singular":"orogenică","masculine-plural":"orogenici","feminine-neuter-plural":"orogenice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orogenic","error-unrecognized-form-feminine-indefinite-singular":"orogenică","error-unrecognized-form-indefinite-masculine-plural":"orogenici","error-unrecognized-form-feminine-indefinite-neuter-plural":"orogenice","definite-error-unrecognized-form-masculine-neuter-singular":"orogenicul","definite-error-unrecognized-form-feminine-singular":"orogenica","definite-error-unrecognized-form-masculine-plural":"orogenicii","definite-error-unrecognized-form-feminine-neuter-plural":"orogenicele"}},{"word":"orogenie","pos":"noun","definitions":["orogeny"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"orogenie","accusative-definite-nominative":"orogenia","dative-genitive-indefinite":"orogenii","dative-definite-genitive":"orogeniei","vocative":"orogenie"}},{"word":"orograf","pos":"noun","definitions":["orograph"],"forms":{"plural":"orografi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orograf","accusative-definite-nominative-singular":"orograful","accusative-indefinite-nominative-plural":"orografi","accusative-definite-nominative-plural":"orografii","dative-genitive-indefinite-singular":"orograf","dative-definite-genitive-singular":"orografului","dative-genitive-indefinite-plural":"orografi","dative-definite-genitive-plural":"orografilor","singular-vocative":"orografule","plural-vocative":"orografilor"}},{"word":"orografă","pos":"noun","definitions":["female equivalent of orograf"],"forms":{"plural":"orografe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orografă","accusative-definite-nominative-singular":"orografa","accusative-indefinite-nominative-plural":"orografe","accusative-definite-nominative-plural":"orografele","dative-genitive-indefinite-singular":"orografe","dative-definite-genitive-singular":"orografei","dative-genitive-indefinite-plural":"orografe","dative-definite-genitive-plural":"orografelor","singular-vocative":"orografă","plural-vocative":"orografelor"}},{"word":"orografic","pos":"adj","definitions":["orographic"],"forms":{"feminine-singular":"orografică","masculine-plural":"orografici","feminine-neuter-plural":"orografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orografic","error-unrecognized-form-feminine-indefinite-singular":"orografică","error-unrecognized-form-indefinite-masculine-plural":"orografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"orografice","definite-error-unrecognized-form-masculine-neuter-singular":"orograficul","definite-error-unrecognized-form-feminine-singular":"orografica","definite-error-unrecognized-form-masculine-plural":"orograficii","definite-error-unrecognized-form-feminine-neuter-plural":"orograficele"}},{"word":"orografici","pos":"adj","definitions":["masculine plural of orografic"]},{"word":"orografie","pos":"noun","definitions":["orography"],"pronunciation":"/o.ro.ɡraˈfi.e/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"orografie","accusative-definite-nominative":"orografia","dative-genitive-indefinite":"orografii","dative-definite-genitive":"orografiei","vocative":"orografie"}},{"word":"orologerie","pos":"noun","definitions":["watchmaking, clockmaking","watch shop, watchmaker's"],"forms":{"plural":"orologerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"orologerie","accusative-definite-nominative-singular":"orologeria","accusative-indefinite-nominative-plural":"orologerii","accusative-definite-nominative-plural":"orologeriile","dative-genitive-indefinite-singular":"orologerii","dative-definite-genitive-singular":"orologeriei","dative-genitive-indefinite-plural":"orologerii","dative-definite-genitive-plural":"orologeriilor","singular-vocative":"orologerie","plural-vocative":"orologeriilor"}},{"word":"orologhion","pos":"noun","definitions":["timepiece"],"forms":{"plural":"orologhioane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"orologhion","accusative-definite-nominative-singular":"orologhionul","accusative-indefinite-nominative-plural":"orologhioane","accusative-definite-nominative-plural":"orologhioanele","dative-genitive-indefinite-singular":"orologhion","dative-definite-genitive-singular":"orologhionului","dative-genitive-indefinite-plural":"orologhioane","dative-definite-genitive-plural":"orologhioanelor","singular-vocative":"orologhionule","plural-vocative":"orologhioanelor"}},{"word":"orologier","pos":"noun","definitions":["horologist, watchmaker"],"forms":{"plural":"orologieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orologier","accusative-definite-nominative-singular":"orologierul","accusative-indefinite-nominative-plural":"orologieri","accusative-definite-nominative-plural":"orologierii","dative-genitive-indefinite-singular":"orologier","dative-definite-genitive-singular":"orologierului","dative-genitive-indefinite-plural":"orologieri","dative-definite-genitive-plural":"orologierilor","singular-vocative":"orologierule","plural-vocative":"orologierilor"}},{"word":"orologiu","pos":"noun","definitions":["clock"],"forms":{"plural":"orologii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"orologiu","accusative-definite-nominative-singular":"orologiul","accusative-indefinite-nominative-plural":"orologii","accusative-definite-nominative-plural":"orologiile","dative-genitive-indefinite-singular":"orologiu","dative-definite-genitive-singular":"orologiului","dative-genitive-indefinite-plural":"orologii","dative-definite-genitive-plural":"orologiilor","singular-vocative":"orologiule","plural-vocative":"orologiilor"}},{"word":"orometrie","pos":"noun","definitions":["hypsometry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"orometrie","accusative-definite-nominative":"orometria","dative-genitive-indefinite":"orometrii","dative-definite-genitive":"orometriei","vocative":"orometrie"}},{"word":"oronimie","pos":"noun","definitions":["oronymy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"oronimie","accusative-definite-nominative":"oronimia","dative-genitive-indefinite":"oronimii","dative-definite-genitive":"oronimiei","vocative":"oronimie"}},{"word":"oropseală","pos":"noun","definitions":["oppression, persecution"],"forms":{"plural":"oropseli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oropseală","accusative-definite-nominative-singular":"oropseala","accusative-indefinite-nominative-plural":"oropsele","accusative-definite-nominative-plural":"oropselele","dative-genitive-indefinite-singular":"oropsele","dative-definite-genitive-singular":"oropselei","dative-genitive-indefinite-plural":"oropsele","dative-definite-genitive-plural":"oropselelor","singular-vocative":"oropseală","plural-vocative":"oropselelor"}},{"word":"oropsi","pos":"verb","definitions":["to oppress"],"forms":{"canonical":"a oropsi 4th conjugation","present-singular-third-person":"oropsește","participle-past":"oropsit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a oropsi","gerund":"oropsind","first-person-indicative-present-singular":"oropsesc","indicative-present-second-person-singular":"oropsești","indicative-present-singular-third-person":"oropsește","first-person-indicative-plural-present":"oropsim","indicative-plural-present-second-person":"oropsiți","indicative-plural-present-third-person":"oropsesc","first-person-imperfect-indicative-singular":"oropseam","imperfect-indicative-second-person-singular":"oropseai","imperfect-indicative-singular-third-person":"oropsea","first-person-imperfect-indicative-plural":"oropseam","imperfect-indicative-plural-second-person":"oropseați","imperfect-indicative-plural-third-person":"oropseau","first-person-indicative-perfect-singular":"oropsii","indicative-perfect-second-person-singular":"oropsiși","indicative-perfect-singular-third-person":"oropsi","first-person-indicative-perfect-plural":"oropsirăm","indicative-perfect-plural-second-person":"oropsirăți","indicative-perfect-plural-third-person":"oropsiră","first-person-indicative-pluperfect-singular":"oropsisem","indicative-pluperfect-second-person-singular":"oropsiseși","indicative-pluperfect-singular-third-person":"oropsise","first-person-indicative-pluperfect-plural":"oropsiserăm","indicative-pluperfect-plural-second-person":"oropsiserăți","indicative-pluperfect-plural-third-person":"oropsiseră","first-person-present-singular-subjunctive":"să oropsesc","present-second-person-singular-subjunctive":"să oropsești","present-singular-subjunctive-third-person":"să oropsească","first-person-plural-present-subjunctive":"să oropsim","plural-present-second-person-subjunctive":"să oropsiți","plural-present-subjunctive-third-person":"să oropsească","imperative-second-person-singular":"oropsește","imperative-plural-second-person":"oropsiți","imperative-negative-second-person-singular":"nu oropsi","imperative-negative-plural-second-person":"nu oropsiți"}},{"word":"oropsire","pos":"noun","definitions":["oppression, persecution"],"forms":{"plural":"oropsiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oropsire","accusative-definite-nominative-singular":"oropsirea","accusative-indefinite-nominative-plural":"oropsiri","accusative-definite-nominative-plural":"oropsirile","dative-genitive-indefinite-singular":"oropsiri","dative-definite-genitive-singular":"oropsirii","dative-genitive-indefinite-plural":"oropsiri","dative-definite-genitive-plural":"oropsirilor","singular-vocative":"oropsire","plural-vocative":"oropsirilor"}},{"word":"oropsit","pos":"adj","definitions":["forsaken"],"forms":{"feminine-singular":"oropsită","masculine-plural":"oropsiți","feminine-neuter-plural":"oropsite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oropsit","error-unrecognized-form-feminine-indefinite-singular":"oropsită","error-unrecognized-form-indefinite-masculine-plural":"oropsiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"oropsite","definite-error-unrecognized-form-masculine-neuter-singular":"oropsitul","definite-error-unrecognized-form-feminine-singular":"oropsita","definite-error-unrecognized-form-masculine-plural":"oropsiții","definite-error-unrecognized-form-feminine-neuter-plural":"oropsitele"}},{"word":"Orosfaia","pos":"name","definitions":["a village in Milaș, Bistrița-Năsăud County, Romania"],"gender":"f"},{"word":"Orosia","pos":"name","definitions":["a village in Cuci, Mureș County, Romania"],"gender":"f"},{"word":"Oroviceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Oroviceanu"}},{"word":"orpiment","pos":"noun","definitions":["orpiment"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"orpiment","accusative-definite-nominative":"orpimentul","dative-genitive-indefinite":"orpiment","dative-definite-genitive":"orpimentului","vocative":"orpimentule"}},{"word":"Orșova","pos":"name","definitions":["a city in Mehedinți County, Romania","a village in Gurghiu, Mureș County, Romania"],"pronunciation":"/ˈorʃova/","gender":"f"},{"word":"Orșova-Pădure","pos":"name","definitions":["a village in Gurghiu, Mureș County, Romania"],"gender":"m"},{"word":"orșovean","pos":"adj","definitions":["from or pertaining to Orșova"],"forms":{"feminine-singular":"orșoveană","masculine-plural":"orșoveni","feminine-neuter-plural":"orșovene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"orșovean","error-unrecognized-form-feminine-indefinite-singular":"orșoveană","error-unrecognized-form-indefinite-masculine-plural":"orșoveni","error-unrecognized-form-feminine-indefinite-neuter-plural":"orșovene","definite-error-unrecognized-form-masculine-neuter-singular":"orșoveanul","definite-error-unrecognized-form-feminine-singular":"orșoveana","definite-error-unrecognized-form-masculine-plural":"orșovenii","definite-error-unrecognized-form-feminine-neuter-plural":"orșovenele"}},{"word":"orșovean","pos":"noun","definitions":["a male inhabitant of Orșova"],"forms":{"plural":"orșoveni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orșovean","accusative-definite-nominative-singular":"orșoveanul","accusative-indefinite-nominative-plural":"orșoveni","accusative-definite-nominative-plural":"orșovenii","dative-genitive-indefinite-singular":"orșovean","dative-definite-genitive-singular":"orșoveanului","dative-genitive-indefinite-plural":"orșoveni","dative-definite-genitive-plural":"orșovenilor","singular-vocative":"orșoveanule","plural-vocative":"orșovenilor"}},{"word":"orșoveancă","pos":"noun","definitions":["female equivalent of orșovean"],"forms":{"plural":"orșovence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"orșoveancă","accusative-definite-nominative-singular":"orșoveanca","accusative-indefinite-nominative-plural":"orșovence","accusative-definite-nominative-plural":"orșovencele","dative-genitive-indefinite-singular":"orșovence","dative-definite-genitive-singular":"orșovencei","dative-genitive-indefinite-plural":"orșovence","dative-definite-genitive-plural":"orșovencelor","singular-vocative":"orșoveancă","plural-vocative":"orșovencelor"}},{"word":"ort","pos":"noun","definitions":["a quarter thaler coin"],"forms":{"plural":"orți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ort","accusative-definite-nominative-singular":"ortul","accusative-indefinite-nominative-plural":"orți","accusative-definite-nominative-plural":"orții","dative-genitive-indefinite-singular":"ort","dative-definite-genitive-singular":"ortului","dative-genitive-indefinite-plural":"orți","dative-definite-genitive-plural":"orților","singular-vocative":"ortule","plural-vocative":"orților"}},{"word":"ortac","pos":"noun","definitions":["comrade"],"forms":{"plural":"ortaci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ortac","accusative-definite-nominative-singular":"ortacul","accusative-indefinite-nominative-plural":"ortaci","accusative-definite-nominative-plural":"ortacii","dative-genitive-indefinite-singular":"ortac","dative-definite-genitive-singular":"ortacului","dative-genitive-indefinite-plural":"ortaci","dative-definite-genitive-plural":"ortacilor","singular-vocative":"ortacule","plural-vocative":"ortacilor"}},{"word":"Ortachioi","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed to Horia."],"gender":"m"},{"word":"ortăci","pos":"verb","definitions":["to associate, to make friends"],"forms":{"canonical":"a ortăci 4th conjugation","present-singular-third-person":"ortăcește","participle-past":"ortăcit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ortăci","gerund":"ortăcind","first-person-indicative-present-singular":"ortăcesc","indicative-present-second-person-singular":"ortăcești","indicative-present-singular-third-person":"ortăcește","first-person-indicative-plural-present":"ortăcim","indicative-plural-present-second-person":"ortăciți","indicative-plural-present-third-person":"ortăcesc","first-person-imperfect-indicative-singular":"ortăceam","imperfect-indicative-second-person-singular":"ortăceai","imperfect-indicative-singular-third-person":"ortăcea","first-person-imperfect-indicative-plural":"ortăceam","imperfect-indicative-plural-second-person":"ortăceați","imperfect-indicative-plural-third-person":"ortăceau","first-person-indicative-perfect-singular":"ortăcii","indicative-perfect-second-person-singular":"ortăciși","indicative-perfect-singular-third-person":"ortăci","first-person-indicative-perfect-plural":"ortăcirăm","indicative-perfect-plural-second-person":"ortăcirăți","indicative-perfect-plural-third-person":"ortăciră","first-person-indicative-pluperfect-singular":"ortăcisem","indicative-pluperfect-second-person-singular":"ortăciseși","indicative-pluperfect-singular-third-person":"ortăcise","first-person-indicative-pluperfect-plural":"ortăciserăm","indicative-pluperfect-plural-second-person":"ortăciserăți","indicative-pluperfect-plural-third-person":"ortăciseră","first-person-present-singular-subjunctive":"să ortăcesc","present-second-person-singular-subjunctive":"să ortăcești","present-singular-subjunctive-third-person":"să ortăcească","first-person-plural-present-subjunctive":"să ortăcim","plural-present-second-person-subjunctive":"să ortăciți","plural-present-subjunctive-third-person":"să ortăcească","imperative-second-person-singular":"ortăcește","imperative-plural-second-person":"ortăciți","imperative-negative-second-person-singular":"nu ortăci","imperative-negative-plural-second-person":"nu ortăciți"}},{"word":"ortăcie","pos":"noun","definitions":["camaraderie"],"forms":{"plural":"ortăcii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ortăcie","accusative-definite-nominative-singular":"ortăcia","accusative-indefinite-nominative-plural":"ortăcii","accusative-definite-nominative-plural":"ortăciile","dative-genitive-indefinite-singular":"ortăcii","dative-definite-genitive-singular":"ortăciei","dative-genitive-indefinite-plural":"ortăcii","dative-definite-genitive-plural":"ortăciilor","singular-vocative":"ortăcie","plural-vocative":"ortăciilor"}},{"word":"ortaș","pos":"noun","definitions":["comrade"],"forms":{"plural":"ortași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ortaș","accusative-definite-nominative-singular":"ortașul","accusative-indefinite-nominative-plural":"ortași","accusative-definite-nominative-plural":"ortașii","dative-genitive-indefinite-singular":"ortaș","dative-definite-genitive-singular":"ortașului","dative-genitive-indefinite-plural":"ortași","dative-definite-genitive-plural":"ortașilor","singular-vocative":"ortașule","plural-vocative":"ortașilor"}},{"word":"Orțăști","pos":"name","definitions":["a village in Drăgănești, Neamț County, Romania"],"gender":"m"},{"word":"Ortelec","pos":"name","definitions":["a river in Sălaj, Romania, tributary to the Agrij"],"gender":"m"},{"word":"Ortelecan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ortelecan"}},{"word":"ortic","pos":"adj","definitions":["orthic"],"forms":{"feminine-singular":"ortică","masculine-plural":"ortici","feminine-neuter-plural":"ortice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ortic","error-unrecognized-form-feminine-indefinite-singular":"ortică","error-unrecognized-form-indefinite-masculine-plural":"ortici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ortice","definite-error-unrecognized-form-masculine-neuter-singular":"orticul","definite-error-unrecognized-form-feminine-singular":"ortica","definite-error-unrecognized-form-masculine-plural":"orticii","definite-error-unrecognized-form-feminine-neuter-plural":"orticele"}},{"word":"orticonoscop","pos":"noun","definitions":["orthiconoscope"],"forms":{"plural":"orticonoscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"orticonoscop","accusative-definite-nominative-singular":"orticonoscopul","accusative-indefinite-nominative-plural":"orticonoscoape","accusative-definite-nominative-plural":"orticonoscoapele","dative-genitive-indefinite-singular":"orticonoscop","dative-definite-genitive-singular":"orticonoscopului","dative-genitive-indefinite-plural":"orticonoscoape","dative-definite-genitive-plural":"orticonoscoapelor","singular-vocative":"orticonoscopule","plural-vocative":"orticonoscoapelor"}},{"word":"Orțișoara","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Orțișoara, Timiș County, Romania"],"gender":"f"},{"word":"Orțița","pos":"name","definitions":["a village in Oarța de Jos, Maramureș County, Romania"],"gender":"f"},{"word":"Ortiteag","pos":"name","definitions":["a village in Măgești, Bihor County, Romania"],"gender":"m"},{"word":"ortocentric","pos":"adj","definitions":["orthocentric"],"forms":{"feminine-singular":"ortocentrică","masculine-plural":"ortocentrici","feminine-neuter-plural":"ortocentrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ortocentric","error-unrecognized-form-feminine-indefinite-singular":"ortocentrică","error-unrecognized-form-indefinite-masculine-plural":"ortocentrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ortocentrice","definite-error-unrecognized-form-masculine-neuter-singular":"ortocentricul","definite-error-unrecognized-form-feminine-singular":"ortocentrica","definite-error-unrecognized-form-masculine-plural":"ortocentricii","definite-error-unrecognized-form-feminine-neuter-plural":"ortocentricele"}},{"word":"ortocentru","pos":"noun","definitions":["orthocenter"],"forms":{"plural":"ortocentre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ortocentru","accusative-definite-nominative-singular":"ortocentrul","accusative-indefinite-nominative-plural":"ortocentre","accusative-definite-nominative-plural":"ortocentrele","dative-genitive-indefinite-singular":"ortocentru","dative-definite-genitive-singular":"ortocentrului","dative-genitive-indefinite-plural":"ortocentre","dative-definite-genitive-plural":"ortocentrelor","singular-vocative":"ortocentrule","plural-vocative":"ortocentrelor"}},{"word":"ortoceras","pos":"noun","definitions":["orthoceras"],"forms":{"plural":"ortocerași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ortoceras","accusative-definite-nominative-singular":"ortocerasul","accusative-indefinite-nominative-plural":"ortocerași","accusative-definite-nominative-plural":"ortocerașii","dative-genitive-indefinite-singular":"ortoceras","dative-definite-genitive-singular":"ortocerasului","dative-genitive-indefinite-plural":"ortocerași","dative-definite-genitive-plural":"ortocerașilor","singular-vocative":"ortocerasule","plural-vocative":"ortocerașilor"}},{"word":"ortoclaz","pos":"noun","definitions":["orthoclase"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ortoclaz","accusative-definite-nominative":"ortoclazul","dative-genitive-indefinite":"ortoclaz","dative-definite-genitive":"ortoclazului","vocative":"ortoclazule"}},{"word":"ortocromatic","pos":"adj","definitions":["orthochromatic"],"forms":{"feminine-singular":"ortocromatică","masculine-plural":"ortocromatici","feminine-neuter-plural":"ortocromatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ortocromatic","error-unrecognized-form-feminine-indefinite-singular":"ortocromatică","error-unrecognized-form-indefinite-masculine-plural":"ortocromatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ortocromatice","definite-error-unrecognized-form-masculine-neuter-singular":"ortocromaticul","definite-error-unrecognized-form-feminine-singular":"ortocromatica","definite-error-unrecognized-form-masculine-plural":"ortocromaticii","definite-error-unrecognized-form-feminine-neuter-plural":"ortocromaticele"}},{"word":"ortocromatism","pos":"noun","definitions":["orthochromatism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ortocromatism","accusative-definite-nominative-singular":"ortocromatismul","accusative-indefinite-nominative-plural":"ortocromatisme","accusative-definite-nominative-plural":"ortocromatismele","dative-genitive-indefinite-singular":"ortocromatism","dative-definite-genitive-singular":"ortocromatismului","dative-genitive-indefinite-plural":"ortocromatisme","dative-definite-genitive-plural":"ortocromatismelor","singular-vocative":"ortocromatismule","plural-vocative":"ortocromatismelor"}},{"word":"ortodiagonal","pos":"adj","definitions":["orthodiagonal"],"forms":{"feminine-singular":"ortodiagonală","masculine-plural":"ortodiagonali","feminine-neuter-plural":"ortodiagonale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ortodiagonal","error-unrecognized-form-feminine-indefinite-singular":"ortodiagonală","error-unrecognized-form-indefinite-masculine-plural":"ortodiagonali","error-unrecognized-form-feminine-indefinite-neuter-plural":"ortodiagonale","definite-error-unrecognized-form-masculine-neuter-singular":"ortodiagonalul","definite-error-unrecognized-form-feminine-singular":"ortodiagonala","definite-error-unrecognized-form-masculine-plural":"ortodiagonalii","definite-error-unrecognized-form-feminine-neuter-plural":"ortodiagonalele"}},{"word":"ortodiagrafie","pos":"noun","definitions":["orthodiagraphy"],"forms":{"plural":"ortodiagrafii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ortodiagrafie","accusative-definite-nominative-singular":"ortodiagrafia","accusative-indefinite-nominative-plural":"ortodiagrafii","accusative-definite-nominative-plural":"ortodiagrafiile","dative-genitive-indefinite-singular":"ortodiagrafii","dative-definite-genitive-singular":"ortodiagrafiei","dative-genitive-indefinite-plural":"ortodiagrafii","dative-definite-genitive-plural":"ortodiagrafiilor","singular-vocative":"ortodiagrafie","plural-vocative":"ortodiagrafiilor"}},{"word":"ortodiagramă","pos":"noun","definitions":["orthodiagram"],"forms":{"plural":"ortodiagrame","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ortodiagramă","accusative-definite-nominative-singular":"ortodiagrama","accusative-indefinite-nominative-plural":"ortodiagrame","accusative-definite-nominative-plural":"ortodiagramele","dative-genitive-indefinite-singular":"ortodiagrame","dative-definite-genitive-singular":"ortodiagramei","dative-genitive-indefinite-plural":"ortodiagrame","dative-definite-genitive-plural":"ortodiagramelor","singular-vocative":"ortodiagramă","plural-vocative":"ortodiagramelor"}},{"word":"ortodontic","pos":"adj","definitions":["orthodontic"],"forms":{"feminine-singular":"ortodontică","masculine-plural":"ortodontici","feminine-neuter-plural":"ortodontice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ortodontic","error-unrecognized-form-feminine-indefinite-singular":"ortodontică","error-unrecognized-form-indefinite-masculine-plural":"ortodontici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ortodontice","definite-error-unrecognized-form-masculine-neuter-singular":"ortodonticul","definite-error-unrecognized-form-feminine-singular":"ortodontica","definite-error-unrecognized-form-masculine-plural":"ortodonticii","definite-error-unrecognized-form-feminine-neuter-plural":"ortodonticele"}},{"word":"ortodonție","pos":"noun","definitions":["orthodontics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ortodonție","accusative-definite-nominative-singular":"ortodonția","accusative-indefinite-nominative-plural":"ortodonții","accusative-definite-nominative-plural":"ortodonțiile","dative-genitive-indefinite-singular":"ortodonții","dative-definite-genitive-singular":"ortodonției","dative-genitive-indefinite-plural":"ortodonții","dative-definite-genitive-plural":"ortodonțiilor","singular-vocative":"ortodonție","plural-vocative":"ortodonțiilor"}},{"word":"ortodontologie","pos":"noun","definitions":["orthodontology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ortodontologie","accusative-definite-nominative-singular":"ortodontologia","accusative-indefinite-nominative-plural":"ortodontologii","accusative-definite-nominative-plural":"ortodontologiile","dative-genitive-indefinite-singular":"ortodontologii","dative-definite-genitive-singular":"ortodontologiei","dative-genitive-indefinite-plural":"ortodontologii","dative-definite-genitive-plural":"ortodontologiilor","singular-vocative":"ortodontologie","plural-vocative":"ortodontologiilor"}},{"word":"ortodox","pos":"adj","definitions":["Orthodox"],"pronunciation":"/or.toˈdoks/","forms":{"feminine-singular":"ortodoxă","masculine-plural":"ortodocși","feminine-neuter-plural":"ortodoxe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ortodox","error-unrecognized-form-feminine-indefinite-singular":"ortodoxă","error-unrecognized-form-indefinite-masculine-plural":"ortodocși","error-unrecognized-form-feminine-indefinite-neuter-plural":"ortodoxe","definite-error-unrecognized-form-masculine-neuter-singular":"ortodoxul","definite-error-unrecognized-form-feminine-singular":"ortodoxa","definite-error-unrecognized-form-masculine-plural":"ortodocșii","definite-error-unrecognized-form-feminine-neuter-plural":"ortodoxele"}},{"word":"ortodox","pos":"noun","definitions":["Orthodox"],"pronunciation":"/or.toˈdoks/","forms":{"plural":"ortodocși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ortodox","accusative-definite-nominative-singular":"ortodoxul","accusative-indefinite-nominative-plural":"ortodocși","accusative-definite-nominative-plural":"ortodocșii","dative-genitive-indefinite-singular":"ortodox","dative-definite-genitive-singular":"ortodoxului","dative-genitive-indefinite-plural":"ortodocși","dative-definite-genitive-plural":"ortodocșilor","singular-vocative":"ortodoxule","plural-vocative":"ortodocșilor"}},{"word":"ortodoxă","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of ortodox"]},{"word":"ortodoxie","pos":"noun","definitions":["orthodoxy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"ortodoxie","accusative-definite-nominative":"ortodoxia","dative-genitive-indefinite":"ortodoxii","dative-definite-genitive":"ortodoxiei","vocative":"ortodoxie"}},{"word":"ortodoxism","pos":"noun","definitions":["orthodoxy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ortodoxism","accusative-definite-nominative-singular":"ortodoxismul","accusative-indefinite-nominative-plural":"ortodoxisme","accusative-definite-nominative-plural":"ortodoxismele","dative-genitive-indefinite-singular":"ortodoxism","dative-definite-genitive-singular":"ortodoxismului","dative-genitive-indefinite-plural":"ortodoxisme","dative-definite-genitive-plural":"ortodoxismelor","singular-vocative":"ortodoxismule","plural-vocative":"ortodoxismelor"}},{"word":"ortodoxist","pos":"adj","definitions":["orthodoxist"],"forms":{"feminine-singular":"ortodoxistă","masculine-plural":"ortodoxiști","feminine-neuter-plural":"ortodoxiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ortodoxist","error-unrecognized-form-feminine-indefinite-singular":"ortodoxistă","error-unrecognized-form-indefinite-masculine-plural":"ortodoxiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"ortodoxiste","definite-error-unrecognized-form-masculine-neuter-singular":"ortodoxistul","definite-error-unrecognized-form-feminine-singular":"ortodoxista","definite-error-unrecognized-form-masculine-plural":"ortodoxiștii","definite-error-unrecognized-form-feminine-neuter-plural":"ortodoxistele"}},{"word":"ortodoxist","pos":"noun","definitions":["orthodoxist"],"forms":{"plural":"ortodoxiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ortodoxist","accusative-definite-nominative-singular":"ortodoxistul","accusative-indefinite-nominative-plural":"ortodoxiști","accusative-definite-nominative-plural":"ortodoxiștii","dative-genitive-indefinite-singular":"ortodoxist","dative-definite-genitive-singular":"ortodoxistului","dative-genitive-indefinite-plural":"ortodoxiști","dative-definite-genitive-plural":"ortodoxiștilor","singular-vocative":"ortodoxistule","plural-vocative":"ortodoxiștilor"}},{"word":"ortodoxistă","pos":"noun","definitions":["female equivalent of ortodoxist"],"forms":{"plural":"ortodoxiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ortodoxistă","accusative-definite-nominative-singular":"ortodoxista","accusative-indefinite-nominative-plural":"ortodoxiste","accusative-definite-nominative-plural":"ortodoxistele","dative-genitive-indefinite-singular":"ortodoxiste","dative-definite-genitive-singular":"ortodoxistei","dative-genitive-indefinite-plural":"ortodoxiste","dative-definite-genitive-plural":"ortodoxistelor","singular-vocative":"ortodoxistă","plural-vocative":"ortodoxistelor"}},{"word":"ortodromic","pos":"adj","definitions":["orthodromic"],"forms":{"feminine-singular":"ortodromică","masculine-plural":"ortodromici","feminine-neuter-plural":"ortodromice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ortodromic","error-unrecognized-form-feminine-indefinite-singular":"ortodromică","error-unrecognized-form-indefinite-masculine-plural":"ortodromici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ortodromice","definite-error-unrecognized-form-masculine-neuter-singular":"ortodromicul","definite-error-unrecognized-form-feminine-singular":"ortodromica","definite-error-unrecognized-form-masculine-plural":"ortodromicii","definite-error-unrecognized-form-feminine-neuter-plural":"ortodromicele"}},{"word":"ortoedric","pos":"adj","definitions":["orthoedric"],"forms":{"feminine-singular":"ortoedrică","masculine-plural":"ortoedrici","feminine-neuter-plural":"ortoedrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ortoedric","error-unrecognized-form-feminine-indefinite-singular":"ortoedrică","error-unrecognized-form-indefinite-masculine-plural":"ortoedrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ortoedrice","definite-error-unrecognized-form-masculine-neuter-singular":"ortoedricul","definite-error-unrecognized-form-feminine-singular":"ortoedrica","definite-error-unrecognized-form-masculine-plural":"ortoedricii","definite-error-unrecognized-form-feminine-neuter-plural":"ortoedricele"}},{"word":"ortoepic","pos":"adj","definitions":["orthoepic"],"forms":{"feminine-singular":"ortoepică","masculine-plural":"ortoepici","feminine-neuter-plural":"ortoepice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ortoepic","error-unrecognized-form-feminine-indefinite-singular":"ortoepică","error-unrecognized-form-indefinite-masculine-plural":"ortoepici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ortoepice","definite-error-unrecognized-form-masculine-neuter-singular":"ortoepicul","definite-error-unrecognized-form-feminine-singular":"ortoepica","definite-error-unrecognized-form-masculine-plural":"ortoepicii","definite-error-unrecognized-form-feminine-neuter-plural":"ortoepicele"}},{"word":"ortoepie","pos":"noun","definitions":["orthoepy"]},{"word":"ortofonie","pos":"noun","definitions":["orthophony"],"forms":{"plural":"ortofonii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ortofonie","accusative-definite-nominative-singular":"ortofonia","accusative-indefinite-nominative-plural":"ortofonii","accusative-definite-nominative-plural":"ortofoniile","dative-genitive-indefinite-singular":"ortofonii","dative-definite-genitive-singular":"ortofoniei","dative-genitive-indefinite-plural":"ortofonii","dative-definite-genitive-plural":"ortofoniilor","singular-vocative":"ortofonie","plural-vocative":"ortofoniilor"}},{"word":"ortoforie","pos":"noun","definitions":["orthophoria"],"forms":{"plural":"ortoforii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ortoforie","accusative-definite-nominative-singular":"ortoforia","accusative-indefinite-nominative-plural":"ortoforii","accusative-definite-nominative-plural":"ortoforiile","dative-genitive-indefinite-singular":"ortoforii","dative-definite-genitive-singular":"ortoforiei","dative-genitive-indefinite-plural":"ortoforii","dative-definite-genitive-plural":"ortoforiilor","singular-vocative":"ortoforie","plural-vocative":"ortoforiilor"}},{"word":"ortofosforic","pos":"adj","definitions":["orthophosphoric"],"forms":{"feminine-singular":"ortofosforică","masculine-plural":"ortofosforici","feminine-neuter-plural":"ortofosforice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ortofosforic","error-unrecognized-form-feminine-indefinite-singular":"ortofosforică","error-unrecognized-form-indefinite-masculine-plural":"ortofosforici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ortofosforice","definite-error-unrecognized-form-masculine-neuter-singular":"ortofosforicul","definite-error-unrecognized-form-feminine-singular":"ortofosforica","definite-error-unrecognized-form-masculine-plural":"ortofosforicii","definite-error-unrecognized-form-feminine-neuter-plural":"ortofosforicele"}},{"word":"ortogeneză","pos":"noun","definitions":["orthogenesis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ortogeneză","accusative-definite-nominative-singular":"ortogeneza","accusative-indefinite-nominative-plural":"ortogeneze","accusative-definite-nominative-plural":"ortogenezele","dative-genitive-indefinite-singular":"ortogeneze","dative-definite-genitive-singular":"ortogenezei","dative-genitive-indefinite-plural":"ortogeneze","dative-definite-genitive-plural":"ortogenezelor","singular-vocative":"ortogeneză","plural-vocative":"ortogenezelor"}},{"word":"ortogenie","pos":"noun","definitions":["family planning"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ortogenie","accusative-definite-nominative-singular":"ortogenia","accusative-indefinite-nominative-plural":"ortogenii","accusative-definite-nominative-plural":"ortogeniile","dative-genitive-indefinite-singular":"ortogenii","dative-definite-genitive-singular":"ortogeniei","dative-genitive-indefinite-plural":"ortogenii","dative-definite-genitive-plural":"ortogeniilor","singular-vocative":"ortogenie","plural-vocative":"ortogeniilor"}},{"word":"ortogonal","pos":"adj","definitions":["orthogonal"],"forms":{"feminine-singular":"ortogonală","masculine-plural":"ortogonali","feminine-neuter-plural":"ortogonale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ortogonal","error-unrecognized-form-feminine-indefinite-singular":"ortogonală","error-unrecognized-form-indefinite-masculine-plural":"ortogonali","error-unrecognized-form-feminine-indefinite-neuter-plural":"ortogonale","definite-error-unrecognized-form-masculine-neuter-singular":"ortogonalul","definite-error-unrecognized-form-feminine-singular":"ortogonala","definite-error-unrecognized-form-masculine-plural":"ortogonalii","definite-error-unrecognized-form-feminine-neuter-plural":"ortogonalele"}},{"word":"ortogonalitate","pos":"noun","definitions":["orthogonality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ortogonalitate","accusative-definite-nominative-singular":"ortogonalitatea","accusative-indefinite-nominative-plural":"ortogonalități","accusative-definite-nominative-plural":"ortogonalitățile","dative-genitive-indefinite-singular":"ortogonalități","dative-definite-genitive-singular":"ortogonalității","dative-genitive-indefinite-plural":"ortogonalități","dative-definite-genitive-plural":"ortogonalităților","singular-vocative":"ortogonalitate","plural-vocative":"ortogonalităților"}},{"word":"ortogonalizare","pos":"noun","definitions":["orthogonalization"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"ortogonalizare","accusative-definite-nominative":"ortogonalizarea","dative-genitive-indefinite":"ortogonalizări","dative-definite-genitive":"ortogonalizării","vocative":"ortogonalizare"}},{"word":"ortograf","pos":"noun","definitions":["orthographer"],"forms":{"plural":"ortografi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ortograf","accusative-definite-nominative-singular":"ortograful","accusative-indefinite-nominative-plural":"ortografi","accusative-definite-nominative-plural":"ortografii","dative-genitive-indefinite-singular":"ortograf","dative-definite-genitive-singular":"ortografului","dative-genitive-indefinite-plural":"ortografi","dative-definite-genitive-plural":"ortografilor","singular-vocative":"ortografule","plural-vocative":"ortografilor"}},{"word":"ortografia","pos":"verb","definitions":["to spell (a word)"],"pronunciation":"/or.to.ɡra.fiˈa/","forms":{"canonical":"a ortografia 1st conjugation","present-singular-third-person":"ortografiează","participle-past":"ortografiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ortografia","gerund":"ortografiind","first-person-indicative-present-singular":"ortografiez","indicative-present-second-person-singular":"ortografiezi","indicative-present-singular-third-person":"ortografiază","first-person-indicative-plural-present":"ortografiem","indicative-plural-present-second-person":"ortografiați","indicative-plural-present-third-person":"ortografiază","first-person-imperfect-indicative-singular":"ortografiam","imperfect-indicative-second-person-singular":"ortografiai","imperfect-indicative-singular-third-person":"ortografia","first-person-imperfect-indicative-plural":"ortografiam","imperfect-indicative-plural-second-person":"ortografiați","imperfect-indicative-plural-third-person":"ortografiau","first-person-indicative-perfect-singular":"ortografiai","indicative-perfect-second-person-singular":"ortografiași","indicative-perfect-singular-third-person":"ortografie","first-person-indicative-perfect-plural":"ortografiarăm","indicative-perfect-plural-second-person":"ortografiarăți","indicative-perfect-plural-third-person":"ortografiară","first-person-indicative-pluperfect-singular":"ortografiasem","indicative-pluperfect-second-person-singular":"ortografiaseși","indicative-pluperfect-singular-third-person":"ortografiase","first-person-indicative-pluperfect-plural":"ortografiaserăm","indicative-pluperfect-plural-second-person":"ortografiaserăți","indicative-pluperfect-plural-third-person":"ortografiaseră","first-person-present-singular-subjunctive":"să ortografiez","present-second-person-singular-subjunctive":"să ortografiezi","present-singular-subjunctive-third-person":"să ortografieze","first-person-plural-present-subjunctive":"să ortografiem","plural-present-second-person-subjunctive":"să ortografiați","plural-present-subjunctive-third-person":"să ortografieze","imperative-second-person-singular":"ortografiază","imperative-plural-second-person":"ortografiați","imperative-negative-second-person-singular":"nu ortografia","imperative-negative-plural-second-person":"nu ortografiați"}},{"word":"ortografic","pos":"adj","definitions":["orthographic, orthographical"],"forms":{"feminine-singular":"ortografică","masculine-plural":"ortografici","feminine-neuter-plural":"ortografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ortografic","error-unrecognized-form-feminine-indefinite-singular":"ortografică","error-unrecognized-form-indefinite-masculine-plural":"ortografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ortografice","definite-error-unrecognized-form-masculine-neuter-singular":"ortograficul","definite-error-unrecognized-form-feminine-singular":"ortografica","definite-error-unrecognized-form-masculine-plural":"ortograficii","definite-error-unrecognized-form-feminine-neuter-plural":"ortograficele"}},{"word":"ortografici","pos":"adj","definitions":["nominative/accusative masculine plural of ortografic"],"gender":"m-p"},{"word":"ortografie","pos":"noun","definitions":["spelling"],"pronunciation":"/or.to.ɡraˈfi.e/","forms":{"plural":"ortografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ortografie","accusative-definite-nominative-singular":"ortografia","accusative-indefinite-nominative-plural":"ortografii","accusative-definite-nominative-plural":"ortografiile","dative-genitive-indefinite-singular":"ortografii","dative-definite-genitive-singular":"ortografiei","dative-genitive-indefinite-plural":"ortografii","dative-definite-genitive-plural":"ortografiilor","singular-vocative":"ortografie","plural-vocative":"ortografiilor"}},{"word":"ortografiere","pos":"noun","definitions":["spelling"],"forms":{"plural":"ortografieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ortografiere","accusative-definite-nominative-singular":"ortografierea","accusative-indefinite-nominative-plural":"ortografieri","accusative-definite-nominative-plural":"ortografierile","dative-genitive-indefinite-singular":"ortografieri","dative-definite-genitive-singular":"ortografierii","dative-genitive-indefinite-plural":"ortografieri","dative-definite-genitive-plural":"ortografierilor","singular-vocative":"ortografiere","plural-vocative":"ortografierilor"}},{"word":"ortohidrogen","pos":"noun","definitions":["orthohydrogen"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ortohidrogen","accusative-definite-nominative":"ortohidrogenul","dative-genitive-indefinite":"ortohidrogen","dative-definite-genitive":"ortohidrogenului","vocative":"ortohidrogenule"}},{"word":"ortolan","pos":"noun","definitions":["ortolan"],"forms":{"plural":"ortolani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ortolan","accusative-definite-nominative-singular":"ortolanul","accusative-indefinite-nominative-plural":"ortolani","accusative-definite-nominative-plural":"ortolanii","dative-genitive-indefinite-singular":"ortolan","dative-definite-genitive-singular":"ortolanului","dative-genitive-indefinite-plural":"ortolani","dative-definite-genitive-plural":"ortolanilor","singular-vocative":"ortolanule","plural-vocative":"ortolanilor"}},{"word":"ortologie","pos":"noun","definitions":["orthology"],"forms":{"plural":"ortologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ortologie","accusative-definite-nominative-singular":"ortologia","accusative-indefinite-nominative-plural":"ortologii","accusative-definite-nominative-plural":"ortologiile","dative-genitive-indefinite-singular":"ortologii","dative-definite-genitive-singular":"ortologiei","dative-genitive-indefinite-plural":"ortologii","dative-definite-genitive-plural":"ortologiilor","singular-vocative":"ortologie","plural-vocative":"ortologiilor"}},{"word":"ortoman","pos":"adj","definitions":["rich in sheep (about a shepherd)"],"forms":{"feminine-singular":"ortomană","masculine-plural":"ortomani","feminine-neuter-plural":"ortomane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ortoman","error-unrecognized-form-feminine-indefinite-singular":"ortomană","error-unrecognized-form-indefinite-masculine-plural":"ortomani","error-unrecognized-form-feminine-indefinite-neuter-plural":"ortomane","definite-error-unrecognized-form-masculine-neuter-singular":"ortomanul","definite-error-unrecognized-form-feminine-singular":"ortomana","definite-error-unrecognized-form-masculine-plural":"ortomanii","definite-error-unrecognized-form-feminine-neuter-plural":"ortomanele"}},{"word":"ortomănește","pos":"adv","definitions":["heroically"]},{"word":"ortoped","pos":"noun","definitions":["orthopedist"],"pronunciation":"/or.toˈped/","forms":{"plural":"ortopezi","feminine":"equivalent ortopedă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ortoped","accusative-definite-nominative-singular":"ortopedul","accusative-indefinite-nominative-plural":"ortopezi","accusative-definite-nominative-plural":"ortopezii","dative-genitive-indefinite-singular":"ortoped","dative-definite-genitive-singular":"ortopedului","dative-genitive-indefinite-plural":"ortopezi","dative-definite-genitive-plural":"ortopezilor","singular-vocative":"ortopedule","plural-vocative":"ortopezilor"}},{"word":"ortopedă","pos":"noun","definitions":["female equivalent of ortoped"],"pronunciation":"/or.toˈpe.də/","forms":{"plural":"ortopede","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"ortopedă","accusative-definite-nominative-singular":"ortopeda","accusative-indefinite-nominative-plural":"ortopede","accusative-definite-nominative-plural":"ortopedele","dative-genitive-indefinite-singular":"ortopede","dative-definite-genitive-singular":"ortopedei","dative-genitive-indefinite-plural":"ortopede","dative-definite-genitive-plural":"ortopedelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"ortopedagogie","pos":"noun","definitions":["orthopedagogy"],"forms":{"plural":"ortopedagogii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ortopedagogie","accusative-definite-nominative-singular":"ortopedagogia","accusative-indefinite-nominative-plural":"ortopedagogii","accusative-definite-nominative-plural":"ortopedagogiile","dative-genitive-indefinite-singular":"ortopedagogii","dative-definite-genitive-singular":"ortopedagogiei","dative-genitive-indefinite-plural":"ortopedagogii","dative-definite-genitive-plural":"ortopedagogiilor","singular-vocative":"ortopedagogie","plural-vocative":"ortopedagogiilor"}},{"word":"ortopede","pos":"noun","definitions":["plural of ortopedă"],"gender":"f"},{"word":"ortopedic","pos":"adj","definitions":["orthopaedic"],"forms":{"feminine-singular":"ortopedică","masculine-plural":"ortopedici","feminine-neuter-plural":"ortopedice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ortopedic","error-unrecognized-form-feminine-indefinite-singular":"ortopedică","error-unrecognized-form-indefinite-masculine-plural":"ortopedici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ortopedice","definite-error-unrecognized-form-masculine-neuter-singular":"ortopedicul","definite-error-unrecognized-form-feminine-singular":"ortopedica","definite-error-unrecognized-form-masculine-plural":"ortopedicii","definite-error-unrecognized-form-feminine-neuter-plural":"ortopedicele"}},{"word":"ortopedie","pos":"noun","definitions":["orthopedics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"ortopedie","accusative-definite-nominative":"ortopedia","dative-genitive-indefinite":"ortopedii","dative-definite-genitive":"ortopediei","vocative":"ortopedie"}},{"word":"ortopedist","pos":"noun","definitions":["orthopedist"],"pronunciation":"/or.to.peˈdist/","forms":{"plural":"ortopediști","feminine":"equivalent ortopedistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ortopedist","accusative-definite-nominative-singular":"ortopedistul","accusative-indefinite-nominative-plural":"ortopediști","accusative-definite-nominative-plural":"ortopediștii","dative-genitive-indefinite-singular":"ortopedist","dative-definite-genitive-singular":"ortopedistului","dative-genitive-indefinite-plural":"ortopediști","dative-definite-genitive-plural":"ortopediștilor","singular-vocative":"ortopedistule","plural-vocative":"ortopediștilor"}},{"word":"ortopedista","pos":"noun","definitions":["definite nominative/accusative singular of ortopedistă"],"gender":"f"},{"word":"ortopedistă","pos":"noun","definitions":["female equivalent of ortopedist"],"pronunciation":"/or.to.peˈdis.tə/","forms":{"plural":"ortopediste","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"ortopedistă","accusative-definite-nominative-singular":"ortopedista","accusative-indefinite-nominative-plural":"ortopediste","accusative-definite-nominative-plural":"ortopedistele","dative-genitive-indefinite-singular":"ortopediste","dative-definite-genitive-singular":"ortopedistei","dative-genitive-indefinite-plural":"ortopediste","dative-definite-genitive-plural":"ortopedistelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"ortopediste","pos":"noun","definitions":["plural of ortopedistă"],"gender":"f"},{"word":"ortopediști","pos":"noun","definitions":["plural of ortopedist"],"gender":"m"},{"word":"ortopezi","pos":"noun","definitions":["plural of ortoped"],"gender":"m"},{"word":"ortopnee","pos":"noun","definitions":["orthopnoea"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"ortopnee","accusative-definite-nominative":"ortopneea","dative-genitive-indefinite":"ortopnee","dative-definite-genitive":"ortopneei","vocative":"ortopnee"}},{"word":"ortopter","pos":"noun","definitions":["orthopteran"],"forms":{"plural":"ortoptere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ortopter","accusative-definite-nominative-singular":"ortopterul","accusative-indefinite-nominative-plural":"ortoptere","accusative-definite-nominative-plural":"ortopterele","dative-genitive-indefinite-singular":"ortopter","dative-definite-genitive-singular":"ortopterului","dative-genitive-indefinite-plural":"ortoptere","dative-definite-genitive-plural":"ortopterelor","singular-vocative":"ortopterule","plural-vocative":"ortopterelor"}},{"word":"ortoptic","pos":"adj","definitions":["orthoptic"],"forms":{"feminine-singular":"ortoptică","masculine-plural":"ortoptici","feminine-neuter-plural":"ortoptice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ortoptic","error-unrecognized-form-feminine-indefinite-singular":"ortoptică","error-unrecognized-form-indefinite-masculine-plural":"ortoptici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ortoptice","definite-error-unrecognized-form-masculine-neuter-singular":"ortopticul","definite-error-unrecognized-form-feminine-singular":"ortoptica","definite-error-unrecognized-form-masculine-plural":"ortopticii","definite-error-unrecognized-form-feminine-neuter-plural":"ortopticele"}},{"word":"ortoptică","pos":"noun","definitions":["orthoptics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ortoptică","accusative-definite-nominative-singular":"ortoptica","accusative-indefinite-nominative-plural":"ortoptice","accusative-definite-nominative-plural":"ortopticele","dative-genitive-indefinite-singular":"ortoptice","dative-definite-genitive-singular":"ortopticei","dative-genitive-indefinite-plural":"ortoptice","dative-definite-genitive-plural":"ortopticelor","singular-vocative":"ortoptică","plural-vocative":"ortopticelor"}},{"word":"ortorombic","pos":"adj","definitions":["orthorhombic"],"forms":{"feminine-singular":"ortorombică","masculine-plural":"ortorombici","feminine-neuter-plural":"ortorombice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ortorombic","error-unrecognized-form-feminine-indefinite-singular":"ortorombică","error-unrecognized-form-indefinite-masculine-plural":"ortorombici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ortorombice","definite-error-unrecognized-form-masculine-neuter-singular":"ortorombicul","definite-error-unrecognized-form-feminine-singular":"ortorombica","definite-error-unrecognized-form-masculine-plural":"ortorombicii","definite-error-unrecognized-form-feminine-neuter-plural":"ortorombicele"}},{"word":"ortoscopic","pos":"adj","definitions":["orthoscopic"],"forms":{"feminine-singular":"ortoscopică","masculine-plural":"ortoscopici","feminine-neuter-plural":"ortoscopice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ortoscopic","error-unrecognized-form-feminine-indefinite-singular":"ortoscopică","error-unrecognized-form-indefinite-masculine-plural":"ortoscopici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ortoscopice","definite-error-unrecognized-form-masculine-neuter-singular":"ortoscopicul","definite-error-unrecognized-form-feminine-singular":"ortoscopica","definite-error-unrecognized-form-masculine-plural":"ortoscopicii","definite-error-unrecognized-form-feminine-neuter-plural":"ortoscopicele"}},{"word":"ortoscopie","pos":"noun","definitions":["orthoscopy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"ortoscopie","accusative-definite-nominative":"ortoscopia","dative-genitive-indefinite":"ortoscopii","dative-definite-genitive":"ortoscopiei","vocative":"ortoscopie"}},{"word":"ortosimpatic","pos":"adj","definitions":["orthosympathetic"],"forms":{"feminine-singular":"ortosimpatică","masculine-plural":"ortosimpatici","feminine-neuter-plural":"ortosimpatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ortosimpatic","error-unrecognized-form-feminine-indefinite-singular":"ortosimpatică","error-unrecognized-form-indefinite-masculine-plural":"ortosimpatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ortosimpatice","definite-error-unrecognized-form-masculine-neuter-singular":"ortosimpaticul","definite-error-unrecognized-form-feminine-singular":"ortosimpatica","definite-error-unrecognized-form-masculine-plural":"ortosimpaticii","definite-error-unrecognized-form-feminine-neuter-plural":"ortosimpaticele"}},{"word":"ortostatic","pos":"adj","definitions":["orthostatic"],"forms":{"feminine-singular":"ortostatică","masculine-plural":"ortostatici","feminine-neuter-plural":"ortostatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ortostatic","error-unrecognized-form-feminine-indefinite-singular":"ortostatică","error-unrecognized-form-indefinite-masculine-plural":"ortostatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ortostatice","definite-error-unrecognized-form-masculine-neuter-singular":"ortostaticul","definite-error-unrecognized-form-feminine-singular":"ortostatica","definite-error-unrecognized-form-masculine-plural":"ortostaticii","definite-error-unrecognized-form-feminine-neuter-plural":"ortostaticele"}},{"word":"ortostatism","pos":"noun","definitions":["orthostatism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ortostatism","accusative-definite-nominative-singular":"ortostatismul","accusative-indefinite-nominative-plural":"ortostatisme","accusative-definite-nominative-plural":"ortostatismele","dative-genitive-indefinite-singular":"ortostatism","dative-definite-genitive-singular":"ortostatismului","dative-genitive-indefinite-plural":"ortostatisme","dative-definite-genitive-plural":"ortostatismelor","singular-vocative":"ortostatismule","plural-vocative":"ortostatismelor"}},{"word":"ortotonus","pos":"noun","definitions":["orthotonos"],"forms":{"plural":"ortotonusuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ortotonus","accusative-definite-nominative-singular":"ortotonusul","accusative-indefinite-nominative-plural":"ortotonusuri","accusative-definite-nominative-plural":"ortotonusurile","dative-genitive-indefinite-singular":"ortotonus","dative-definite-genitive-singular":"ortotonusului","dative-genitive-indefinite-plural":"ortotonusuri","dative-definite-genitive-plural":"ortotonusurilor","singular-vocative":"ortotonusule","plural-vocative":"ortotonusurilor"}},{"word":"ortotropic","pos":"adj","definitions":["orthotropic"],"forms":{"feminine-singular":"ortotropică","masculine-plural":"ortotropici","feminine-neuter-plural":"ortotropice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ortotropic","error-unrecognized-form-feminine-indefinite-singular":"ortotropică","error-unrecognized-form-indefinite-masculine-plural":"ortotropici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ortotropice","definite-error-unrecognized-form-masculine-neuter-singular":"ortotropicul","definite-error-unrecognized-form-feminine-singular":"ortotropica","definite-error-unrecognized-form-masculine-plural":"ortotropicii","definite-error-unrecognized-form-feminine-neuter-plural":"ortotropicele"}},{"word":"ortotropie","pos":"noun","definitions":["orthotropy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"ortotropie","accusative-definite-nominative":"ortotropia","dative-genitive-indefinite":"ortotropii","dative-definite-genitive":"ortotropiei","vocative":"ortotropie"}},{"word":"ortoză","pos":"noun","definitions":["orthoclase"],"forms":{"plural":"ortoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ortoză","accusative-definite-nominative-singular":"ortoza","accusative-indefinite-nominative-plural":"ortoze","accusative-definite-nominative-plural":"ortozele","dative-genitive-indefinite-singular":"ortoze","dative-definite-genitive-singular":"ortozei","dative-genitive-indefinite-plural":"ortoze","dative-definite-genitive-plural":"ortozelor","singular-vocative":"ortoză","plural-vocative":"ortozelor"}},{"word":"Orvișele","pos":"name","definitions":["a village in Brusturi, Bihor County, Romania"],"gender":"n-p"},{"word":"orvosag","pos":"noun","definitions":["medicine"],"forms":{"plural":"orvosaguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"orvosag","accusative-definite-nominative-singular":"orvosagul","accusative-indefinite-nominative-plural":"orvosaguri","accusative-definite-nominative-plural":"orvosagurile","dative-genitive-indefinite-singular":"orvosag","dative-definite-genitive-singular":"orvosagului","dative-genitive-indefinite-plural":"orvosaguri","dative-definite-genitive-plural":"orvosagurilor","singular-vocative":"orvosagule","plural-vocative":"orvosagurilor"}},{"word":"Orz","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Orz"}},{"word":"orz","pos":"noun","definitions":["barley"],"pronunciation":"/orz/","forms":{"plural":"orzuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"orz","accusative-definite-nominative-singular":"orzul","accusative-indefinite-nominative-plural":"orzuri","accusative-definite-nominative-plural":"orzurile","dative-genitive-indefinite-singular":"orz","dative-definite-genitive-singular":"orzului","dative-genitive-indefinite-plural":"orzuri","dative-definite-genitive-plural":"orzurilor","singular-vocative":"orzule","plural-vocative":"orzurilor"}},{"word":"orz","pos":"noun","definitions":["barley field"],"pronunciation":"/orz/","forms":{"plural":"oarze","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"orz","accusative-definite-nominative-singular":"orzul","accusative-indefinite-nominative-plural":"oarze","accusative-definite-nominative-plural":"oarzele","dative-genitive-indefinite-singular":"orz","dative-definite-genitive-singular":"orzului","dative-genitive-indefinite-plural":"oarze","dative-definite-genitive-plural":"oarzelor","singular-vocative":"orzule","plural-vocative":"oarzelor"}},{"word":"Orzan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Orzan"}},{"word":"orzar","pos":"noun","definitions":["barley merchant"],"forms":{"plural":"orzare","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"orzar","accusative-definite-nominative-singular":"orzarul","accusative-indefinite-nominative-plural":"orzare","accusative-definite-nominative-plural":"orzarei","dative-genitive-indefinite-singular":"orzar","dative-definite-genitive-singular":"orzarului","dative-genitive-indefinite-plural":"orzare","dative-definite-genitive-plural":"orzarelor","singular-vocative":"orzarule","plural-vocative":"orzarelor"}},{"word":"orzărie","pos":"noun","definitions":["barley field","barley barn"],"forms":{"plural":"orzării"}},{"word":"Orzaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Orzaru"}},{"word":"Orzea","pos":"name","definitions":["a river in Argeș County, Romania, tributary to the Râușorul","a river in Dâmbovița County, Romania, tributary to the Ialomița"],"gender":"f"},{"word":"Orzeni","pos":"name","definitions":["a village in Holboca, Iași County, Romania"],"gender":"m"},{"word":"Orzescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Orzescu"}},{"word":"Orzești","pos":"name","definitions":["a village in Padeș, Gorj County, Romania"],"gender":"m"},{"word":"orzișor","pos":"noun","definitions":["diminutive of orz; small barley"],"forms":{"plural":"orzulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"orzișor","accusative-definite-nominative-singular":"orzișorul","accusative-indefinite-nominative-plural":"orzișore","accusative-definite-nominative-plural":"orzișorele","dative-genitive-indefinite-singular":"orzișor","dative-definite-genitive-singular":"orzișorului","dative-genitive-indefinite-plural":"orzișore","dative-definite-genitive-plural":"orzișorelor","singular-vocative":"orzișorule","plural-vocative":"orzișorelor"}},{"word":"orziște","pos":"noun","definitions":["barley field"],"forms":{"plural":"orziști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"orziște","accusative-definite-nominative-singular":"orziștea","accusative-indefinite-nominative-plural":"orziști","accusative-definite-nominative-plural":"orziștile","dative-genitive-indefinite-singular":"orziști","dative-definite-genitive-singular":"orziștii","dative-genitive-indefinite-plural":"orziști","dative-definite-genitive-plural":"orziștilor","singular-vocative":"orziște","plural-vocative":"orziștilor"}},{"word":"Orzoaia de Jos","pos":"name","definitions":["a locality in Urlați, Prahova County, Romania"],"gender":"f"},{"word":"Orzoaia de Sus","pos":"name","definitions":["a locality in Urlați, Prahova County, Romania"],"gender":"f"},{"word":"orzoaică","pos":"noun","definitions":["two-rowed barley (Hordeum distichon)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"orzoaică","accusative-definite-nominative":"orzoaica","dative-genitive-indefinite":"orzoaice","dative-definite-genitive":"orzoaicei","vocative":"orzoaică"}},{"word":"orzoaie","pos":"noun","definitions":["two-rowed barley (Hordeum distichon)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"orzoaie","accusative-definite-nominative":"orzoaia","dative-genitive-indefinite":"orzoaii","dative-definite-genitive":"orzoaiei","vocative":"orzoaie"}},{"word":"Orzu","pos":"name","definitions":["a village in Negomir, Gorj County, Romania"],"gender":"m"},{"word":"orzul","pos":"noun","definitions":["definite nominative/accusative singular of orz"]},{"word":"orzuleț","pos":"noun","definitions":["diminutive of orz"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"orzuleț","accusative-definite-nominative":"orzulețul","dative-genitive-indefinite":"orzuleț","dative-definite-genitive":"orzulețului","vocative":"orzulețule"}},{"word":"orzuri","pos":"noun","definitions":["plural of orz"]},{"word":"os","pos":"noun","definitions":["bone"],"pronunciation":"/ˈos/","forms":{"plural":"oase","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"os","accusative-definite-nominative-singular":"osul","accusative-indefinite-nominative-plural":"oase","accusative-definite-nominative-plural":"oasele","dative-genitive-indefinite-singular":"os","dative-definite-genitive-singular":"osului","dative-genitive-indefinite-plural":"oase","dative-definite-genitive-plural":"oaselor","singular-vocative":"osule","plural-vocative":"oaselor"}},{"word":"os alveolar","pos":"noun","definitions":["alveolar bone"],"forms":{"plural":"oase alveolare"}},{"word":"os coxal","pos":"noun","definitions":["hip bone"],"forms":{"plural":"oase coxale"}},{"word":"os hioid","pos":"noun","definitions":["hyoid bone"]},{"word":"os iliac","pos":"noun","definitions":["ilium"],"forms":{"plural":"oase iliace"}},{"word":"os malar","pos":"noun","definitions":["malar bone"]},{"word":"os parietal","pos":"noun","definitions":["parietal bone"]},{"word":"os zigomatic","pos":"noun","definitions":["zygomatic bone"]},{"word":"osamă","pos":"noun","definitions":["bones"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"osamă","accusative-definite-nominative":"osama","dative-genitive-indefinite":"osame","dative-definite-genitive":"osamei","vocative":"osamă"}},{"word":"osâmbri","pos":"verb","definitions":["to remunerate"],"forms":{"canonical":"a osâmbri 4th conjugation","present-singular-third-person":"osâmbrie","participle-past":"osâmbrit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a osâmbri","gerund":"osâmbrind","first-person-indicative-present-singular":"osâmbru","indicative-present-second-person-singular":"osâmbri","indicative-present-singular-third-person":"osâmbre","first-person-indicative-plural-present":"osâmbrim","indicative-plural-present-second-person":"osâmbriți","indicative-plural-present-third-person":"osâmbru","first-person-imperfect-indicative-singular":"osâmbream","imperfect-indicative-second-person-singular":"osâmbreai","imperfect-indicative-singular-third-person":"osâmbrea","first-person-imperfect-indicative-plural":"osâmbream","imperfect-indicative-plural-second-person":"osâmbreați","imperfect-indicative-plural-third-person":"osâmbreau","first-person-indicative-perfect-singular":"osâmbrii","indicative-perfect-second-person-singular":"osâmbriși","indicative-perfect-singular-third-person":"osâmbri","first-person-indicative-perfect-plural":"osâmbrirăm","indicative-perfect-plural-second-person":"osâmbrirăți","indicative-perfect-plural-third-person":"osâmbriră","first-person-indicative-pluperfect-singular":"osâmbrisem","indicative-pluperfect-second-person-singular":"osâmbriseși","indicative-pluperfect-singular-third-person":"osâmbrise","first-person-indicative-pluperfect-plural":"osâmbriserăm","indicative-pluperfect-plural-second-person":"osâmbriserăți","indicative-pluperfect-plural-third-person":"osâmbriseră","first-person-present-singular-subjunctive":"să osâmbru","present-second-person-singular-subjunctive":"să osâmbri","present-singular-subjunctive-third-person":"să osâmbră","first-person-plural-present-subjunctive":"să osâmbrim","plural-present-second-person-subjunctive":"să osâmbriți","plural-present-subjunctive-third-person":"să osâmbră","imperative-second-person-singular":"osâmbre","imperative-plural-second-person":"osâmbriți","imperative-negative-second-person-singular":"nu osâmbri","imperative-negative-plural-second-person":"nu osâmbriți"}},{"word":"osana","pos":"intj","definitions":["hosanna"]},{"word":"osana","pos":"noun","definitions":["praise"],"forms":{"plural":"osanale","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"osana","accusative-definite-nominative-singular":"osanaua","accusative-indefinite-nominative-plural":"osanale","accusative-definite-nominative-plural":"osanalele","dative-genitive-indefinite-singular":"osanale","dative-definite-genitive-singular":"osanalei","dative-genitive-indefinite-plural":"osanale","dative-definite-genitive-plural":"osanalelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"Oșand","pos":"name","definitions":["a village in Husasău de Tinca, Bihor County, Romania"],"gender":"m"},{"word":"osândă","pos":"noun","definitions":["sentence","doom"],"forms":{"plural":"osânde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osândă","accusative-definite-nominative-singular":"osânda","accusative-indefinite-nominative-plural":"osânde","accusative-definite-nominative-plural":"osândele","dative-genitive-indefinite-singular":"osânde","dative-definite-genitive-singular":"osândei","dative-genitive-indefinite-plural":"osânde","dative-definite-genitive-plural":"osândelor","singular-vocative":"osândă","plural-vocative":"osândelor"}},{"word":"osândi","pos":"verb","definitions":["to sentence"],"forms":{"canonical":"a osândi 4th conjugation","present-singular-third-person":"osândește","participle-past":"osândit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a osândi","gerund":"osândind","first-person-indicative-present-singular":"osândesc","indicative-present-second-person-singular":"osândești","indicative-present-singular-third-person":"osândește","first-person-indicative-plural-present":"osândim","indicative-plural-present-second-person":"osândiți","indicative-plural-present-third-person":"osândesc","first-person-imperfect-indicative-singular":"osândeam","imperfect-indicative-second-person-singular":"osândeai","imperfect-indicative-singular-third-person":"osândea","first-person-imperfect-indicative-plural":"osândeam","imperfect-indicative-plural-second-person":"osândeați","imperfect-indicative-plural-third-person":"osândeau","first-person-indicative-perfect-singular":"osândii","indicative-perfect-second-person-singular":"osândiși","indicative-perfect-singular-third-person":"osândi","first-person-indicative-perfect-plural":"osândirăm","indicative-perfect-plural-second-person":"osândirăți","indicative-perfect-plural-third-person":"osândiră","first-person-indicative-pluperfect-singular":"osândisem","indicative-pluperfect-second-person-singular":"osândiseși","indicative-pluperfect-singular-third-person":"osândise","first-person-indicative-pluperfect-plural":"osândiserăm","indicative-pluperfect-plural-second-person":"osândiserăți","indicative-pluperfect-plural-third-person":"osândiseră","first-person-present-singular-subjunctive":"să osândesc","present-second-person-singular-subjunctive":"să osândești","present-singular-subjunctive-third-person":"să osândească","first-person-plural-present-subjunctive":"să osândim","plural-present-second-person-subjunctive":"să osândiți","plural-present-subjunctive-third-person":"să osândească","imperative-second-person-singular":"osândește","imperative-plural-second-person":"osândiți","imperative-negative-second-person-singular":"nu osândi","imperative-negative-plural-second-person":"nu osândiți"}},{"word":"osândire","pos":"noun","definitions":["condemnation"],"forms":{"plural":"osândiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"osândire","accusative-definite-nominative-singular":"osândirea","accusative-indefinite-nominative-plural":"osândiri","accusative-definite-nominative-plural":"osândirile","dative-genitive-indefinite-singular":"osândiri","dative-definite-genitive-singular":"osândirii","dative-genitive-indefinite-plural":"osândiri","dative-definite-genitive-plural":"osândirilor","singular-vocative":"osândire","plural-vocative":"osândirilor"}},{"word":"osândit","pos":"adj","definitions":["sentenced","doomed"],"forms":{"feminine-singular":"osândită","masculine-plural":"osândiți","feminine-neuter-plural":"osândite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"osândit","error-unrecognized-form-feminine-indefinite-singular":"osândită","error-unrecognized-form-indefinite-masculine-plural":"osândiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"osândite","definite-error-unrecognized-form-masculine-neuter-singular":"osânditul","definite-error-unrecognized-form-feminine-singular":"osândita","definite-error-unrecognized-form-masculine-plural":"osândiții","definite-error-unrecognized-form-feminine-neuter-plural":"osânditele"}},{"word":"osânditor","pos":"adj","definitions":["condemnatory"],"forms":{"feminine-singular":"osânditoare","masculine-plural":"osânditori","feminine-neuter-plural":"osânditoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"osânditor","error-unrecognized-form-feminine-indefinite-singular":"osânditoare","error-unrecognized-form-indefinite-masculine-plural":"osânditori","error-unrecognized-form-feminine-indefinite-neuter-plural":"osânditoare","definite-error-unrecognized-form-masculine-neuter-singular":"osânditorul","definite-error-unrecognized-form-feminine-singular":"osânditoarea","definite-error-unrecognized-form-masculine-plural":"osânditorii","definite-error-unrecognized-form-feminine-neuter-plural":"osânditoarele"}},{"word":"osânză","pos":"noun","definitions":["raw pork fat, especially from the abdominal region; lard","a state of good material wealth, richness, well-being"],"forms":{"plural":"osânze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osânză","accusative-definite-nominative-singular":"osânza","accusative-indefinite-nominative-plural":"osânze","accusative-definite-nominative-plural":"osânzele","dative-genitive-indefinite-singular":"osânze","dative-definite-genitive-singular":"osânzei","dative-genitive-indefinite-plural":"osânze","dative-definite-genitive-plural":"osânzelor","singular-vocative":"osânză","plural-vocative":"osânzelor"}},{"word":"osârdie","pos":"noun","definitions":["zeal, fervor (in regards to work or an endeavor); industry"],"forms":{"plural":"osârdii"}},{"word":"osârdii","pos":"noun","definitions":["plural of osârdie"]},{"word":"osârdnic","pos":"adj","definitions":["diligent"],"forms":{"feminine-singular":"osârdnică","masculine-plural":"osârdnici","feminine-neuter-plural":"osârdnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"osârdnic","error-unrecognized-form-feminine-indefinite-singular":"osârdnică","error-unrecognized-form-indefinite-masculine-plural":"osârdnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"osârdnice","definite-error-unrecognized-form-masculine-neuter-singular":"osârdnicul","definite-error-unrecognized-form-feminine-singular":"osârdnica","definite-error-unrecognized-form-masculine-plural":"osârdnicii","definite-error-unrecognized-form-feminine-neuter-plural":"osârdnicele"}},{"word":"osârdnici","pos":"verb","definitions":["to do one's best"],"forms":{"canonical":"a osârdnici 4th conjugation","present-singular-third-person":"osârdnicește","participle-past":"osârdnicit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a osârdnici","gerund":"osârdnicind","first-person-indicative-present-singular":"osârdnicesc","indicative-present-second-person-singular":"osârdnicești","indicative-present-singular-third-person":"osârdnicește","first-person-indicative-plural-present":"osârdnicim","indicative-plural-present-second-person":"osârdniciți","indicative-plural-present-third-person":"osârdnicesc","first-person-imperfect-indicative-singular":"osârdniceam","imperfect-indicative-second-person-singular":"osârdniceai","imperfect-indicative-singular-third-person":"osârdnicea","first-person-imperfect-indicative-plural":"osârdniceam","imperfect-indicative-plural-second-person":"osârdniceați","imperfect-indicative-plural-third-person":"osârdniceau","first-person-indicative-perfect-singular":"osârdnicii","indicative-perfect-second-person-singular":"osârdniciși","indicative-perfect-singular-third-person":"osârdnici","first-person-indicative-perfect-plural":"osârdnicirăm","indicative-perfect-plural-second-person":"osârdnicirăți","indicative-perfect-plural-third-person":"osârdniciră","first-person-indicative-pluperfect-singular":"osârdnicisem","indicative-pluperfect-second-person-singular":"osârdniciseși","indicative-pluperfect-singular-third-person":"osârdnicise","first-person-indicative-pluperfect-plural":"osârdniciserăm","indicative-pluperfect-plural-second-person":"osârdniciserăți","indicative-pluperfect-plural-third-person":"osârdniciseră","first-person-present-singular-subjunctive":"să osârdnicesc","present-second-person-singular-subjunctive":"să osârdnicești","present-singular-subjunctive-third-person":"să osârdnicească","first-person-plural-present-subjunctive":"să osârdnicim","plural-present-second-person-subjunctive":"să osârdniciți","plural-present-subjunctive-third-person":"să osârdnicească","imperative-second-person-singular":"osârdnicește","imperative-plural-second-person":"osârdniciți","imperative-negative-second-person-singular":"nu osârdnici","imperative-negative-plural-second-person":"nu osârdniciți"}},{"word":"osârdnicie","pos":"noun","definitions":["ardor"],"forms":{"plural":"osârdnicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"osârdnicie","accusative-definite-nominative-singular":"osârdnicia","accusative-indefinite-nominative-plural":"osârdnicii","accusative-definite-nominative-plural":"osârdniciile","dative-genitive-indefinite-singular":"osârdnicii","dative-definite-genitive-singular":"osârdniciei","dative-genitive-indefinite-plural":"osârdnicii","dative-definite-genitive-plural":"osârdniciilor","singular-vocative":"osârdnicie","plural-vocative":"osârdniciilor"}},{"word":"osârduință","pos":"noun","definitions":["ardor"],"forms":{"plural":"osârduințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osârduință","accusative-definite-nominative-singular":"osârduința","accusative-indefinite-nominative-plural":"osârduințe","accusative-definite-nominative-plural":"osârduințele","dative-genitive-indefinite-singular":"osârduințe","dative-definite-genitive-singular":"osârduinței","dative-genitive-indefinite-plural":"osârduințe","dative-definite-genitive-plural":"osârduințelor","singular-vocative":"osârduință","plural-vocative":"osârduințelor"}},{"word":"osârduire","pos":"noun","definitions":["industry"],"forms":{"plural":"osârduiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"osârduire","accusative-definite-nominative-singular":"osârduirea","accusative-indefinite-nominative-plural":"osârduiri","accusative-definite-nominative-plural":"osârduirile","dative-genitive-indefinite-singular":"osârduiri","dative-definite-genitive-singular":"osârduirii","dative-genitive-indefinite-plural":"osârduiri","dative-definite-genitive-plural":"osârduirilor","singular-vocative":"osârduire","plural-vocative":"osârduirilor"}},{"word":"osărie","pos":"noun","definitions":["skeleton"],"forms":{"plural":"osării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"osărie","accusative-definite-nominative-singular":"osăria","accusative-indefinite-nominative-plural":"osării","accusative-definite-nominative-plural":"osăriile","dative-genitive-indefinite-singular":"osării","dative-definite-genitive-singular":"osăriei","dative-genitive-indefinite-plural":"osării","dative-definite-genitive-plural":"osăriilor","singular-vocative":"osărie","plural-vocative":"osăriilor"}},{"word":"osatură","pos":"noun","definitions":["skeleton"],"forms":{"plural":"osaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osatură","accusative-definite-nominative-singular":"osatura","accusative-indefinite-nominative-plural":"osature","accusative-definite-nominative-plural":"osaturele","dative-genitive-indefinite-singular":"osature","dative-definite-genitive-singular":"osaturei","dative-genitive-indefinite-plural":"osature","dative-definite-genitive-plural":"osaturelor","singular-vocative":"osatură","plural-vocative":"osaturelor"}},{"word":"osc","pos":"noun","definitions":["Oscan"],"forms":{"plural":"osci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"osc","accusative-definite-nominative-singular":"oscul","accusative-indefinite-nominative-plural":"osci","accusative-definite-nominative-plural":"oscii","dative-genitive-indefinite-singular":"osc","dative-definite-genitive-singular":"oscului","dative-genitive-indefinite-plural":"osci","dative-definite-genitive-plural":"oscilor","singular-vocative":"oscule","plural-vocative":"oscilor"}},{"word":"oscă","pos":"noun","definitions":["female equivalent of osc"],"forms":{"plural":"osce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oscă","accusative-definite-nominative-singular":"osca","accusative-indefinite-nominative-plural":"osce","accusative-definite-nominative-plural":"oscele","dative-genitive-indefinite-singular":"osce","dative-definite-genitive-singular":"oscei","dative-genitive-indefinite-plural":"osce","dative-definite-genitive-plural":"oscelor","singular-vocative":"oscă","plural-vocative":"oscelor"}},{"word":"oscila","pos":"verb","definitions":["to oscillate"],"forms":{"canonical":"a oscila 1st conjugation","present-singular-third-person":"oscilează","participle-past":"oscilat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a oscila","gerund":"oscilând","first-person-indicative-present-singular":"oscilez","indicative-present-second-person-singular":"oscilezi","indicative-present-singular-third-person":"oscilează","first-person-indicative-plural-present":"oscilăm","indicative-plural-present-second-person":"oscilați","indicative-plural-present-third-person":"oscilează","first-person-imperfect-indicative-singular":"oscilam","imperfect-indicative-second-person-singular":"oscilai","imperfect-indicative-singular-third-person":"oscila","first-person-imperfect-indicative-plural":"oscilam","imperfect-indicative-plural-second-person":"oscilați","imperfect-indicative-plural-third-person":"oscilau","first-person-indicative-perfect-singular":"oscilai","indicative-perfect-second-person-singular":"oscilași","indicative-perfect-singular-third-person":"oscilă","first-person-indicative-perfect-plural":"oscilarăm","indicative-perfect-plural-second-person":"oscilarăți","indicative-perfect-plural-third-person":"oscilară","first-person-indicative-pluperfect-singular":"oscilasem","indicative-pluperfect-second-person-singular":"oscilaseși","indicative-pluperfect-singular-third-person":"oscilase","first-person-indicative-pluperfect-plural":"oscilaserăm","indicative-pluperfect-plural-second-person":"oscilaserăți","indicative-pluperfect-plural-third-person":"oscilaseră","first-person-present-singular-subjunctive":"să oscilez","present-second-person-singular-subjunctive":"să oscilezi","present-singular-subjunctive-third-person":"să oscileze","first-person-plural-present-subjunctive":"să oscilăm","plural-present-second-person-subjunctive":"să oscilați","plural-present-subjunctive-third-person":"să oscileze","imperative-second-person-singular":"oscilează","imperative-plural-second-person":"oscilați","imperative-negative-second-person-singular":"nu oscila","imperative-negative-plural-second-person":"nu oscilați"}},{"word":"oscilant","pos":"adj","definitions":["oscillating"],"forms":{"feminine-singular":"oscilantă","masculine-plural":"oscilanți","feminine-neuter-plural":"oscilante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oscilant","error-unrecognized-form-feminine-indefinite-singular":"oscilantă","error-unrecognized-form-indefinite-masculine-plural":"oscilanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"oscilante","definite-error-unrecognized-form-masculine-neuter-singular":"oscilantul","definite-error-unrecognized-form-feminine-singular":"oscilanta","definite-error-unrecognized-form-masculine-plural":"oscilanții","definite-error-unrecognized-form-feminine-neuter-plural":"oscilantele"}},{"word":"oscilare","pos":"noun","definitions":["oscillation"],"forms":{"plural":"oscilări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oscilare","accusative-definite-nominative-singular":"oscilarea","accusative-indefinite-nominative-plural":"oscilări","accusative-definite-nominative-plural":"oscilările","dative-genitive-indefinite-singular":"oscilări","dative-definite-genitive-singular":"oscilării","dative-genitive-indefinite-plural":"oscilări","dative-definite-genitive-plural":"oscilărilor","singular-vocative":"oscilare","plural-vocative":"oscilărilor"}},{"word":"oscilație","pos":"noun","definitions":["oscillation"],"forms":{"plural":"oscilații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oscilație","accusative-definite-nominative-singular":"oscilația","accusative-indefinite-nominative-plural":"oscilații","accusative-definite-nominative-plural":"oscilațiile","dative-genitive-indefinite-singular":"oscilații","dative-definite-genitive-singular":"oscilației","dative-genitive-indefinite-plural":"oscilații","dative-definite-genitive-plural":"oscilațiilor","singular-vocative":"oscilație","plural-vocative":"oscilațiilor"}},{"word":"oscilațiune","pos":"noun","definitions":["obsolete form of oscilație"],"forms":{"plural":"oscilațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oscilațiune","accusative-definite-nominative-singular":"oscilațiunea","accusative-indefinite-nominative-plural":"oscilațiuni","accusative-definite-nominative-plural":"oscilațiunile","dative-genitive-indefinite-singular":"oscilațiuni","dative-definite-genitive-singular":"oscilațiunii","dative-genitive-indefinite-plural":"oscilațiuni","dative-definite-genitive-plural":"oscilațiunilor","singular-vocative":"oscilațiune","plural-vocative":"oscilațiunilor"}},{"word":"oscilator","pos":"noun","definitions":["oscillator"],"forms":{"plural":"oscilatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oscilator","accusative-definite-nominative-singular":"oscilatorul","accusative-indefinite-nominative-plural":"oscilatoare","accusative-definite-nominative-plural":"oscilatoarele","dative-genitive-indefinite-singular":"oscilator","dative-definite-genitive-singular":"oscilatorului","dative-genitive-indefinite-plural":"oscilatoare","dative-definite-genitive-plural":"oscilatoarelor","singular-vocative":"oscilatorule","plural-vocative":"oscilatoarelor"}},{"word":"oscilator armonic","pos":"noun","definitions":["harmonic oscillator"],"forms":{"plural":"oscilatoare armonice"}},{"word":"oscilatoriu","pos":"adj","definitions":["oscillating"],"forms":{"feminine-singular":"oscilatorie","plural":"oscilatorii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oscilatoriu","error-unrecognized-form-feminine-indefinite-singular":"oscilatorie","error-unrecognized-form-indefinite-masculine-plural":"oscilatorii","error-unrecognized-form-feminine-indefinite-neuter-plural":"oscilatorii","definite-error-unrecognized-form-masculine-neuter-singular":"oscilatoriul","definite-error-unrecognized-form-feminine-singular":"oscilatoria","definite-error-unrecognized-form-masculine-plural":"oscilatoriii","definite-error-unrecognized-form-feminine-neuter-plural":"oscilatoriile"}},{"word":"oscilograf","pos":"noun","definitions":["oscillograph"],"forms":{"plural":"oscilografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oscilograf","accusative-definite-nominative-singular":"oscilograful","accusative-indefinite-nominative-plural":"oscilografe","accusative-definite-nominative-plural":"oscilografele","dative-genitive-indefinite-singular":"oscilograf","dative-definite-genitive-singular":"oscilografului","dative-genitive-indefinite-plural":"oscilografe","dative-definite-genitive-plural":"oscilografelor","singular-vocative":"oscilografule","plural-vocative":"oscilografelor"}},{"word":"oscilografie","pos":"noun","definitions":["oscillography"],"forms":{"plural":"oscilografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oscilografie","accusative-definite-nominative-singular":"oscilografia","accusative-indefinite-nominative-plural":"oscilografii","accusative-definite-nominative-plural":"oscilografiile","dative-genitive-indefinite-singular":"oscilografii","dative-definite-genitive-singular":"oscilografiei","dative-genitive-indefinite-plural":"oscilografii","dative-definite-genitive-plural":"oscilografiilor","singular-vocative":"oscilografie","plural-vocative":"oscilografiilor"}},{"word":"oscilogramă","pos":"noun","definitions":["oscillogram"],"forms":{"plural":"oscilograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oscilogramă","accusative-definite-nominative-singular":"oscilograma","accusative-indefinite-nominative-plural":"oscilograme","accusative-definite-nominative-plural":"oscilogramele","dative-genitive-indefinite-singular":"oscilograme","dative-definite-genitive-singular":"oscilogramei","dative-genitive-indefinite-plural":"oscilograme","dative-definite-genitive-plural":"oscilogramelor","singular-vocative":"oscilogramă","plural-vocative":"oscilogramelor"}},{"word":"oscilometrie","pos":"noun","definitions":["oscillometry"],"forms":{"plural":"oscilometrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oscilometrie","accusative-definite-nominative-singular":"oscilometria","accusative-indefinite-nominative-plural":"oscilometrii","accusative-definite-nominative-plural":"oscilometriile","dative-genitive-indefinite-singular":"oscilometrii","dative-definite-genitive-singular":"oscilometriei","dative-genitive-indefinite-plural":"oscilometrii","dative-definite-genitive-plural":"oscilometriilor","singular-vocative":"oscilometrie","plural-vocative":"oscilometriilor"}},{"word":"oscilometru","pos":"noun","definitions":["oscillometer"],"forms":{"plural":"oscilometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oscilometru","accusative-definite-nominative-singular":"oscilometrul","accusative-indefinite-nominative-plural":"oscilometre","accusative-definite-nominative-plural":"oscilometrele","dative-genitive-indefinite-singular":"oscilometru","dative-definite-genitive-singular":"oscilometrului","dative-genitive-indefinite-plural":"oscilometre","dative-definite-genitive-plural":"oscilometrelor","singular-vocative":"oscilometrule","plural-vocative":"oscilometrelor"}},{"word":"osciloscop","pos":"noun","definitions":["oscilloscope"],"forms":{"plural":"osciloscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"osciloscop","accusative-definite-nominative-singular":"osciloscopul","accusative-indefinite-nominative-plural":"osciloscoape","accusative-definite-nominative-plural":"osciloscoapele","dative-genitive-indefinite-singular":"osciloscop","dative-definite-genitive-singular":"osciloscopului","dative-genitive-indefinite-plural":"osciloscoape","dative-definite-genitive-plural":"osciloscoapelor","singular-vocative":"osciloscopule","plural-vocative":"osciloscoapelor"}},{"word":"oscior","pos":"noun","definitions":["diminutive of os; little bone"],"pronunciation":"/osˈt͡ʃjor/","forms":{"plural":"oscioare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oscior","accusative-definite-nominative-singular":"osciorul","accusative-indefinite-nominative-plural":"oscioare","accusative-definite-nominative-plural":"oscioarele","dative-genitive-indefinite-singular":"oscior","dative-definite-genitive-singular":"osciorului","dative-genitive-indefinite-plural":"oscioare","dative-definite-genitive-plural":"oscioarelor","singular-vocative":"osciorule","plural-vocative":"oscioarelor"}},{"word":"oscitanță","pos":"noun","definitions":["negligence"],"forms":{"plural":"oscitanțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oscitanță","accusative-definite-nominative-singular":"oscitanța","accusative-indefinite-nominative-plural":"oscitanțe","accusative-definite-nominative-plural":"oscitanțele","dative-genitive-indefinite-singular":"oscitanțe","dative-definite-genitive-singular":"oscitanței","dative-genitive-indefinite-plural":"oscitanțe","dative-definite-genitive-plural":"oscitanțelor","singular-vocative":"oscitanță","plural-vocative":"oscitanțelor"}},{"word":"oscul","pos":"noun","definitions":["osculum"],"forms":{"plural":"osculi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oscul","accusative-definite-nominative-singular":"osculul","accusative-indefinite-nominative-plural":"osculi","accusative-definite-nominative-plural":"osculii","dative-genitive-indefinite-singular":"oscul","dative-definite-genitive-singular":"osculului","dative-genitive-indefinite-plural":"osculi","dative-definite-genitive-plural":"osculilor","singular-vocative":"osculule","plural-vocative":"osculilor"}},{"word":"osculație","pos":"noun","definitions":["osculation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"osculație","accusative-definite-nominative-singular":"osculația","accusative-indefinite-nominative-plural":"osculații","accusative-definite-nominative-plural":"osculațiile","dative-genitive-indefinite-singular":"osculații","dative-definite-genitive-singular":"osculației","dative-genitive-indefinite-plural":"osculații","dative-definite-genitive-plural":"osculațiilor","singular-vocative":"osculație","plural-vocative":"osculațiilor"}},{"word":"osculațiune","pos":"noun","definitions":["obsolete form of osculație"],"forms":{"plural":"osculațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"osculațiune","accusative-definite-nominative-singular":"osculațiunea","accusative-indefinite-nominative-plural":"osculațiuni","accusative-definite-nominative-plural":"osculațiunile","dative-genitive-indefinite-singular":"osculațiuni","dative-definite-genitive-singular":"osculațiunii","dative-genitive-indefinite-plural":"osculațiuni","dative-definite-genitive-plural":"osculațiunilor","singular-vocative":"osculațiune","plural-vocative":"osculațiunilor"}},{"word":"osculator","pos":"adj","definitions":["osculating"],"forms":{"feminine-singular":"osculatoare","masculine-plural":"osculatori","feminine-neuter-plural":"osculatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"osculator","error-unrecognized-form-feminine-indefinite-singular":"osculatoare","error-unrecognized-form-indefinite-masculine-plural":"osculatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"osculatoare","definite-error-unrecognized-form-masculine-neuter-singular":"osculatorul","definite-error-unrecognized-form-feminine-singular":"osculatoarea","definite-error-unrecognized-form-masculine-plural":"osculatorii","definite-error-unrecognized-form-feminine-neuter-plural":"osculatoarele"}},{"word":"oșean","pos":"noun","definitions":["native or inhabitant of the cultural region of Țara Oașului in northeastern Satu Mare County, Romania (usually male)"],"forms":{"plural":"oșeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oșean","accusative-definite-nominative-singular":"oșeanul","accusative-indefinite-nominative-plural":"oșeni","accusative-definite-nominative-plural":"oșenii","dative-genitive-indefinite-singular":"oșean","dative-definite-genitive-singular":"oșeanului","dative-genitive-indefinite-plural":"oșeni","dative-definite-genitive-plural":"oșenilor","singular-vocative":"oșeanule","plural-vocative":"oșenilor"}},{"word":"oșeană","pos":"noun","definitions":["female equivalent of oșean"],"forms":{"plural":"oșene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oșeană","accusative-definite-nominative-singular":"oșeana","accusative-indefinite-nominative-plural":"oșene","accusative-definite-nominative-plural":"oșenele","dative-genitive-indefinite-singular":"oșene","dative-definite-genitive-singular":"oșenei","dative-genitive-indefinite-plural":"oșene","dative-definite-genitive-plural":"oșenelor","singular-vocative":"oșeană","plural-vocative":"oșenelor"}},{"word":"oșeancă","pos":"noun","definitions":["female equivalent of oșean"],"forms":{"plural":"oșence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oșeancă","accusative-definite-nominative-singular":"oșeanca","accusative-indefinite-nominative-plural":"oșence","accusative-definite-nominative-plural":"oșencele","dative-genitive-indefinite-singular":"oșence","dative-definite-genitive-singular":"oșencei","dative-genitive-indefinite-plural":"oșence","dative-definite-genitive-plural":"oșencelor","singular-vocative":"oșeancă","plural-vocative":"oșencelor"}},{"word":"osebi","pos":"verb","definitions":["to tell apart","to differ","to separate (make separated)","to separate (become separated)","to deny access, particularly from the church"],"pronunciation":"/o.seˈbi/","forms":{"canonical":"a osebi 4th conjugation","present-singular-third-person":"osebește","participle-past":"osebit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a osebi","gerund":"osebind","first-person-indicative-present-singular":"osebesc","indicative-present-second-person-singular":"osebești","indicative-present-singular-third-person":"osebește","first-person-indicative-plural-present":"osebim","indicative-plural-present-second-person":"osebiți","indicative-plural-present-third-person":"osebesc","first-person-imperfect-indicative-singular":"osebeam","imperfect-indicative-second-person-singular":"osebeai","imperfect-indicative-singular-third-person":"osebea","first-person-imperfect-indicative-plural":"osebeam","imperfect-indicative-plural-second-person":"osebeați","imperfect-indicative-plural-third-person":"osebeau","first-person-indicative-perfect-singular":"osebii","indicative-perfect-second-person-singular":"osebiși","indicative-perfect-singular-third-person":"osebi","first-person-indicative-perfect-plural":"osebirăm","indicative-perfect-plural-second-person":"osebirăți","indicative-perfect-plural-third-person":"osebiră","first-person-indicative-pluperfect-singular":"osebisem","indicative-pluperfect-second-person-singular":"osebiseși","indicative-pluperfect-singular-third-person":"osebise","first-person-indicative-pluperfect-plural":"osebiserăm","indicative-pluperfect-plural-second-person":"osebiserăți","indicative-pluperfect-plural-third-person":"osebiseră","first-person-present-singular-subjunctive":"să osebesc","present-second-person-singular-subjunctive":"să osebești","present-singular-subjunctive-third-person":"să osebească","first-person-plural-present-subjunctive":"să osebim","plural-present-second-person-subjunctive":"să osebiți","plural-present-subjunctive-third-person":"să osebească","imperative-second-person-singular":"osebește","imperative-plural-second-person":"osebiți","imperative-negative-second-person-singular":"nu osebi","imperative-negative-plural-second-person":"nu osebiți"}},{"word":"osebi","pos":"adv","definitions":["apart, separately","besides, in addition to"],"pronunciation":"/oˈsebʲ/","forms":{"alternative":"usebi"}},{"word":"osebiciune","pos":"noun","definitions":["isolation"],"forms":{"plural":"osebiciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"osebiciune","accusative-definite-nominative-singular":"osebiciunea","accusative-indefinite-nominative-plural":"osebiciuni","accusative-definite-nominative-plural":"osebiciunile","dative-genitive-indefinite-singular":"osebiciuni","dative-definite-genitive-singular":"osebiciunii","dative-genitive-indefinite-plural":"osebiciuni","dative-definite-genitive-plural":"osebiciunilor","singular-vocative":"osebiciune","plural-vocative":"osebiciunilor"}},{"word":"osebire","pos":"noun","definitions":["difference"],"forms":{"plural":"osebiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"osebire","accusative-definite-nominative-singular":"osebirea","accusative-indefinite-nominative-plural":"osebiri","accusative-definite-nominative-plural":"osebirile","dative-genitive-indefinite-singular":"osebiri","dative-definite-genitive-singular":"osebirii","dative-genitive-indefinite-plural":"osebiri","dative-definite-genitive-plural":"osebirilor","singular-vocative":"osebire","plural-vocative":"osebirilor"}},{"word":"osebit","pos":"adj","definitions":["different"],"forms":{"feminine-singular":"osebită","masculine-plural":"osebiți","feminine-neuter-plural":"osebite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"osebit","error-unrecognized-form-feminine-indefinite-singular":"osebită","error-unrecognized-form-indefinite-masculine-plural":"osebiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"osebite","definite-error-unrecognized-form-masculine-neuter-singular":"osebitul","definite-error-unrecognized-form-feminine-singular":"osebita","definite-error-unrecognized-form-masculine-plural":"osebiții","definite-error-unrecognized-form-feminine-neuter-plural":"osebitele"}},{"word":"osebit","pos":"verb","definitions":["past participle of osebi"],"forms":{"participle-past":"of osebi"}},{"word":"Osebiți","pos":"name","definitions":["a village in Luizi-Călugăra, Bacău County, Romania"],"gender":"m"},{"word":"osebitor","pos":"adj","definitions":["separating"],"forms":{"feminine-singular":"osebitoare","masculine-plural":"osebitori","feminine-neuter-plural":"osebitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"osebitor","error-unrecognized-form-feminine-indefinite-singular":"osebitoare","error-unrecognized-form-indefinite-masculine-plural":"osebitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"osebitoare","definite-error-unrecognized-form-masculine-neuter-singular":"osebitorul","definite-error-unrecognized-form-feminine-singular":"osebitoarea","definite-error-unrecognized-form-masculine-plural":"osebitorii","definite-error-unrecognized-form-feminine-neuter-plural":"osebitoarele"}},{"word":"osebitură","pos":"noun","definitions":["difference"],"forms":{"plural":"osebituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"osebitură","accusative-definite-nominative-singular":"osebitura","accusative-indefinite-nominative-plural":"osebituri","accusative-definite-nominative-plural":"osebiturile","dative-genitive-indefinite-singular":"osebituri","dative-definite-genitive-singular":"osebiturii","dative-genitive-indefinite-plural":"osebituri","dative-definite-genitive-plural":"osebiturilor","singular-vocative":"osebitură","plural-vocative":"osebiturilor"}},{"word":"oseină","pos":"noun","definitions":["ossein"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oseină","accusative-definite-nominative-singular":"oseina","accusative-indefinite-nominative-plural":"oseine","accusative-definite-nominative-plural":"oseinele","dative-genitive-indefinite-singular":"oseine","dative-definite-genitive-singular":"oseinei","dative-genitive-indefinite-plural":"oseine","dative-definite-genitive-plural":"oseinelor","singular-vocative":"oseină","plural-vocative":"oseinelor"}},{"word":"oșelnic","pos":"noun","definitions":["hermit"],"forms":{"plural":"oșelnici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oșelnic","accusative-definite-nominative-singular":"oșelnicul","accusative-indefinite-nominative-plural":"oșelnici","accusative-definite-nominative-plural":"oșelnicii","dative-genitive-indefinite-singular":"oșelnic","dative-definite-genitive-singular":"oșelnicului","dative-genitive-indefinite-plural":"oșelnici","dative-definite-genitive-plural":"oșelnicilor","singular-vocative":"oșelnicule","plural-vocative":"oșelnicilor"}},{"word":"oseminte","pos":"noun","definitions":["bones, denuded of flesh"]},{"word":"oșenesc","pos":"adj","definitions":["related to the Oaș region of Romania"],"forms":{"feminine-singular":"oșenească","plural":"oșenești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oșenesc","error-unrecognized-form-feminine-indefinite-singular":"oșenească","error-unrecognized-form-indefinite-masculine-plural":"oșenești","error-unrecognized-form-feminine-indefinite-neuter-plural":"oșenești","definite-error-unrecognized-form-masculine-neuter-singular":"oșenescul","definite-error-unrecognized-form-feminine-singular":"oșeneasca","definite-error-unrecognized-form-masculine-plural":"oșeneștii","definite-error-unrecognized-form-feminine-neuter-plural":"oșeneștile"}},{"word":"Oșești","pos":"name","definitions":["a commune of Vaslui County, Romania","a village in Oșești, Vaslui County, Romania"],"gender":"m"},{"word":"Osetia de Sud","pos":"name","definitions":["South Ossetia (a geographic region and de-facto independent but largely unrecognized country in the South Caucasus on the border of Europe and Asia; considered part of Georgia's territory by the vast majority of the international community)"],"gender":"f"},{"word":"osfeștanie","pos":"noun","definitions":["consecration, sanctification"],"forms":{"plural":"osfeștanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"osfeștanie","accusative-definite-nominative-singular":"osfeștania","accusative-indefinite-nominative-plural":"osfeștanii","accusative-definite-nominative-plural":"osfeștaniile","dative-genitive-indefinite-singular":"osfeștanii","dative-definite-genitive-singular":"osfeștaniei","dative-genitive-indefinite-plural":"osfeștanii","dative-definite-genitive-plural":"osfeștaniilor","singular-vocative":"osfeștanie","plural-vocative":"osfeștaniilor"}},{"word":"osfeștui","pos":"verb","definitions":["to consecrate"],"forms":{"canonical":"a osfeștui 4th conjugation","present-singular-third-person":"osfeștuiește","participle-past":"osfeștuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a osfeștui","gerund":"osfeștuind","first-person-indicative-present-singular":"osfeștuiesc","indicative-present-second-person-singular":"osfeștuiești","indicative-present-singular-third-person":"osfeștuiește","first-person-indicative-plural-present":"osfeștuim","indicative-plural-present-second-person":"osfeștuiți","indicative-plural-present-third-person":"osfeștuiesc","first-person-imperfect-indicative-singular":"osfeștuiam","imperfect-indicative-second-person-singular":"osfeștuiai","imperfect-indicative-singular-third-person":"osfeștuia","first-person-imperfect-indicative-plural":"osfeștuiam","imperfect-indicative-plural-second-person":"osfeștuiați","imperfect-indicative-plural-third-person":"osfeștuiau","first-person-indicative-perfect-singular":"osfeștuii","indicative-perfect-second-person-singular":"osfeștuiși","indicative-perfect-singular-third-person":"osfeștui","first-person-indicative-perfect-plural":"osfeștuirăm","indicative-perfect-plural-second-person":"osfeștuirăți","indicative-perfect-plural-third-person":"osfeștuiră","first-person-indicative-pluperfect-singular":"osfeștuisem","indicative-pluperfect-second-person-singular":"osfeștuiseși","indicative-pluperfect-singular-third-person":"osfeștuise","first-person-indicative-pluperfect-plural":"osfeștuiserăm","indicative-pluperfect-plural-second-person":"osfeștuiserăți","indicative-pluperfect-plural-third-person":"osfeștuiseră","first-person-present-singular-subjunctive":"să osfeștuiesc","present-second-person-singular-subjunctive":"să osfeștuiești","present-singular-subjunctive-third-person":"să osfeștuiască","first-person-plural-present-subjunctive":"să osfeștuim","plural-present-second-person-subjunctive":"să osfeștuiți","plural-present-subjunctive-third-person":"să osfeștuiască","imperative-second-person-singular":"osfeștuiește","imperative-plural-second-person":"osfeștuiți","imperative-negative-second-person-singular":"nu osfeștui","imperative-negative-plural-second-person":"nu osfeștuiți"}},{"word":"osfinteală","pos":"noun","definitions":["defense","help"],"forms":{"plural":"osfinteli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osfinteală","accusative-definite-nominative-singular":"osfinteala","accusative-indefinite-nominative-plural":"osfintele","accusative-definite-nominative-plural":"osfintelele","dative-genitive-indefinite-singular":"osfintele","dative-definite-genitive-singular":"osfintelei","dative-genitive-indefinite-plural":"osfintele","dative-definite-genitive-plural":"osfintelelor","singular-vocative":"osfinteală","plural-vocative":"osfintelelor"}},{"word":"osfinti","pos":"verb","definitions":["to protect, to help","to bless"],"forms":{"canonical":"a osfinti 4th conjugation","present-singular-third-person":"osfintește","participle-past":"osfintit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a osfinti","gerund":"osfintind","first-person-indicative-present-singular":"osfintesc","indicative-present-second-person-singular":"osfintești","indicative-present-singular-third-person":"osfintește","first-person-indicative-plural-present":"osfintim","indicative-plural-present-second-person":"osfintiți","indicative-plural-present-third-person":"osfintesc","first-person-imperfect-indicative-singular":"osfinteam","imperfect-indicative-second-person-singular":"osfinteai","imperfect-indicative-singular-third-person":"osfintea","first-person-imperfect-indicative-plural":"osfinteam","imperfect-indicative-plural-second-person":"osfinteați","imperfect-indicative-plural-third-person":"osfinteau","first-person-indicative-perfect-singular":"osfintii","indicative-perfect-second-person-singular":"osfintiși","indicative-perfect-singular-third-person":"osfinti","first-person-indicative-perfect-plural":"osfintirăm","indicative-perfect-plural-second-person":"osfintirăți","indicative-perfect-plural-third-person":"osfintiră","first-person-indicative-pluperfect-singular":"osfintisem","indicative-pluperfect-second-person-singular":"osfintiseși","indicative-pluperfect-singular-third-person":"osfintise","first-person-indicative-pluperfect-plural":"osfintiserăm","indicative-pluperfect-plural-second-person":"osfintiserăți","indicative-pluperfect-plural-third-person":"osfintiseră","first-person-present-singular-subjunctive":"să osfintesc","present-second-person-singular-subjunctive":"să osfintești","present-singular-subjunctive-third-person":"să osfintească","first-person-plural-present-subjunctive":"să osfintim","plural-present-second-person-subjunctive":"să osfintiți","plural-present-subjunctive-third-person":"să osfintească","imperative-second-person-singular":"osfintește","imperative-plural-second-person":"osfintiți","imperative-negative-second-person-singular":"nu osfinti","imperative-negative-plural-second-person":"nu osfintiți"}},{"word":"osianesc","pos":"adj","definitions":["Ossianic"],"forms":{"feminine-singular":"osianească","plural":"osianești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"osianesc","error-unrecognized-form-feminine-indefinite-singular":"osianească","error-unrecognized-form-indefinite-masculine-plural":"osianești","error-unrecognized-form-feminine-indefinite-neuter-plural":"osianești","definite-error-unrecognized-form-masculine-neuter-singular":"osianescul","definite-error-unrecognized-form-feminine-singular":"osianeasca","definite-error-unrecognized-form-masculine-plural":"osianeștii","definite-error-unrecognized-form-feminine-neuter-plural":"osianeștile"}},{"word":"osianic","pos":"adj","definitions":["Ossianic"],"forms":{"feminine-singular":"osianică","masculine-plural":"osianici","feminine-neuter-plural":"osianice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"osianic","error-unrecognized-form-feminine-indefinite-singular":"osianică","error-unrecognized-form-indefinite-masculine-plural":"osianici","error-unrecognized-form-feminine-indefinite-neuter-plural":"osianice","definite-error-unrecognized-form-masculine-neuter-singular":"osianicul","definite-error-unrecognized-form-feminine-singular":"osianica","definite-error-unrecognized-form-masculine-plural":"osianicii","definite-error-unrecognized-form-feminine-neuter-plural":"osianicele"}},{"word":"osianism","pos":"noun","definitions":["Ossianism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"osianism","accusative-definite-nominative-singular":"osianismul","accusative-indefinite-nominative-plural":"osianisme","accusative-definite-nominative-plural":"osianismele","dative-genitive-indefinite-singular":"osianism","dative-definite-genitive-singular":"osianismului","dative-genitive-indefinite-plural":"osianisme","dative-definite-genitive-plural":"osianismelor","singular-vocative":"osianismule","plural-vocative":"osianismelor"}},{"word":"Osica","pos":"name","definitions":["a river in Olt County, Romania, tributary to the Plapcea"],"gender":"f"},{"word":"Osica de Jos","pos":"name","definitions":["a commune of Olt County, Romania","a village in Osica de Jos, Olt County, Romania"],"gender":"f"},{"word":"Osica de Sus","pos":"name","definitions":["a commune of Olt County, Romania","a village in Osica de Sus, Olt County, Romania"],"gender":"f"},{"word":"Osiceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Osiceanu"}},{"word":"osie","pos":"noun","definitions":["axle"],"forms":{"plural":"osii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"osie","accusative-definite-nominative-singular":"osia","accusative-indefinite-nominative-plural":"osii","accusative-definite-nominative-plural":"osiile","dative-genitive-indefinite-singular":"osii","dative-definite-genitive-singular":"osiei","dative-genitive-indefinite-plural":"osii","dative-definite-genitive-plural":"osiilor","singular-vocative":"osie","plural-vocative":"osiilor"}},{"word":"osifica","pos":"verb","definitions":["to ossify"],"pronunciation":"/o.si.fiˈka/","forms":{"canonical":"a osifica 1st conjugation","present-singular-third-person":"osifică","participle-past":"osificat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a osifica","gerund":"osificând","first-person-indicative-present-singular":"osific","indicative-present-second-person-singular":"osifici","indicative-present-singular-third-person":"osifică","first-person-indicative-plural-present":"osificăm","indicative-plural-present-second-person":"osificați","indicative-plural-present-third-person":"osifică","first-person-imperfect-indicative-singular":"osificam","imperfect-indicative-second-person-singular":"osificai","imperfect-indicative-singular-third-person":"osifica","first-person-imperfect-indicative-plural":"osificam","imperfect-indicative-plural-second-person":"osificați","imperfect-indicative-plural-third-person":"osificau","first-person-indicative-perfect-singular":"osificai","indicative-perfect-second-person-singular":"osificași","indicative-perfect-singular-third-person":"osifică","first-person-indicative-perfect-plural":"osificarăm","indicative-perfect-plural-second-person":"osificarăți","indicative-perfect-plural-third-person":"osificară","first-person-indicative-pluperfect-singular":"osificasem","indicative-pluperfect-second-person-singular":"osificaseși","indicative-pluperfect-singular-third-person":"osificase","first-person-indicative-pluperfect-plural":"osificaserăm","indicative-pluperfect-plural-second-person":"osificaserăți","indicative-pluperfect-plural-third-person":"osificaseră","first-person-present-singular-subjunctive":"să osific","present-second-person-singular-subjunctive":"să osifici","present-singular-subjunctive-third-person":"să osifice","first-person-plural-present-subjunctive":"să osificăm","plural-present-second-person-subjunctive":"să osificați","plural-present-subjunctive-third-person":"să osifice","imperative-second-person-singular":"osifică","imperative-plural-second-person":"osificați","imperative-negative-second-person-singular":"nu osifica","imperative-negative-plural-second-person":"nu osificați"}},{"word":"osificare","pos":"noun","definitions":["ossification"],"forms":{"plural":"osificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"osificare","accusative-definite-nominative-singular":"osificarea","accusative-indefinite-nominative-plural":"osificări","accusative-definite-nominative-plural":"osificările","dative-genitive-indefinite-singular":"osificări","dative-definite-genitive-singular":"osificării","dative-genitive-indefinite-plural":"osificări","dative-definite-genitive-plural":"osificărilor","singular-vocative":"osificare","plural-vocative":"osificărilor"}},{"word":"osificat","pos":"adj","definitions":["ossified"],"forms":{"feminine-singular":"osificată","masculine-plural":"osificați","feminine-neuter-plural":"osificate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"osificat","error-unrecognized-form-feminine-indefinite-singular":"osificată","error-unrecognized-form-indefinite-masculine-plural":"osificați","error-unrecognized-form-feminine-indefinite-neuter-plural":"osificate","definite-error-unrecognized-form-masculine-neuter-singular":"osificatul","definite-error-unrecognized-form-feminine-singular":"osificata","definite-error-unrecognized-form-masculine-plural":"osificații","definite-error-unrecognized-form-feminine-neuter-plural":"osificatele"}},{"word":"osificație","pos":"noun","definitions":["ossification"],"forms":{"plural":"osificații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"osificație","accusative-definite-nominative-singular":"osificația","accusative-indefinite-nominative-plural":"osificații","accusative-definite-nominative-plural":"osificațiile","dative-genitive-indefinite-singular":"osificații","dative-definite-genitive-singular":"osificației","dative-genitive-indefinite-plural":"osificații","dative-definite-genitive-plural":"osificațiilor","singular-vocative":"osificație","plural-vocative":"osificațiilor"}},{"word":"osificațiune","pos":"noun","definitions":["obsolete form of osificație"],"forms":{"plural":"osificațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"osificațiune","accusative-definite-nominative-singular":"osificațiunea","accusative-indefinite-nominative-plural":"osificațiuni","accusative-definite-nominative-plural":"osificațiunile","dative-genitive-indefinite-singular":"osificațiuni","dative-definite-genitive-singular":"osificațiunii","dative-genitive-indefinite-plural":"osificațiuni","dative-definite-genitive-plural":"osificațiunilor","singular-vocative":"osificațiune","plural-vocative":"osificațiunilor"}},{"word":"osișor","pos":"noun","definitions":["diminutive of os"],"forms":{"plural":"osișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"osișor","accusative-definite-nominative-singular":"osișorul","accusative-indefinite-nominative-plural":"osișoare","accusative-definite-nominative-plural":"osișoarele","dative-genitive-indefinite-singular":"osișor","dative-definite-genitive-singular":"osișorului","dative-genitive-indefinite-plural":"osișoare","dative-definite-genitive-plural":"osișoarelor","singular-vocative":"osișorule","plural-vocative":"osișoarelor"}},{"word":"Oșlobeni","pos":"name","definitions":["a village in Bodești, Neamț County, Romania"],"gender":"m"},{"word":"osman","pos":"noun","definitions":["Turk"],"forms":{"plural":"osmani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"osman","accusative-definite-nominative-singular":"osmanul","accusative-indefinite-nominative-plural":"osmani","accusative-definite-nominative-plural":"osmanii","dative-genitive-indefinite-singular":"osman","dative-definite-genitive-singular":"osmanului","dative-genitive-indefinite-plural":"osmani","dative-definite-genitive-plural":"osmanilor","singular-vocative":"osmanule","plural-vocative":"osmanilor"}},{"word":"osmană","pos":"noun","definitions":["female equivalent of osmanlâu"],"forms":{"plural":"osmane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osmană","accusative-definite-nominative-singular":"osmana","accusative-indefinite-nominative-plural":"osmane","accusative-definite-nominative-plural":"osmanele","dative-genitive-indefinite-singular":"osmane","dative-definite-genitive-singular":"osmanei","dative-genitive-indefinite-plural":"osmane","dative-definite-genitive-plural":"osmanelor","singular-vocative":"osmană","plural-vocative":"osmanelor"}},{"word":"Osmancea","pos":"name","definitions":["a village in Constanța County, Dobruja, in eastern Romania"],"gender":"f"},{"word":"osmănesc","pos":"adj","definitions":["Ottoman"],"forms":{"feminine-singular":"osmănească","plural":"osmănești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"osmănesc","error-unrecognized-form-feminine-indefinite-singular":"osmănească","error-unrecognized-form-indefinite-masculine-plural":"osmănești","error-unrecognized-form-feminine-indefinite-neuter-plural":"osmănești","definite-error-unrecognized-form-masculine-neuter-singular":"osmănescul","definite-error-unrecognized-form-feminine-singular":"osmăneasca","definite-error-unrecognized-form-masculine-plural":"osmăneștii","definite-error-unrecognized-form-feminine-neuter-plural":"osmăneștile"}},{"word":"Osmanfacâ","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed as Bărăganu."],"gender":"m"},{"word":"osmanic","pos":"adj","definitions":["Ottoman"],"forms":{"feminine-singular":"osmanică","masculine-plural":"osmanici","feminine-neuter-plural":"osmanice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"osmanic","error-unrecognized-form-feminine-indefinite-singular":"osmanică","error-unrecognized-form-indefinite-masculine-plural":"osmanici","error-unrecognized-form-feminine-indefinite-neuter-plural":"osmanice","definite-error-unrecognized-form-masculine-neuter-singular":"osmanicul","definite-error-unrecognized-form-feminine-singular":"osmanica","definite-error-unrecognized-form-masculine-plural":"osmanicii","definite-error-unrecognized-form-feminine-neuter-plural":"osmanicele"}},{"word":"osmanlâu","pos":"adj","definitions":["Ottoman, Turkish"],"forms":{"feminine-singular":"osmanlâe","masculine-plural":"osmanlâi","feminine-neuter-plural":"osmanlâe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"osmanlâu","error-unrecognized-form-feminine-indefinite-singular":"osmanlâe","error-unrecognized-form-indefinite-masculine-plural":"osmanlâi","error-unrecognized-form-feminine-indefinite-neuter-plural":"osmanlâe","definite-error-unrecognized-form-masculine-neuter-singular":"osmanlâul","definite-error-unrecognized-form-feminine-singular":"osmanlâea","definite-error-unrecognized-form-masculine-plural":"osmanlâii","definite-error-unrecognized-form-feminine-neuter-plural":"osmanlâele"}},{"word":"osmanliu","pos":"adj","definitions":["Ottoman"],"forms":{"feminine-singular":"osmanlie","plural":"osmanlii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"osmanliu","error-unrecognized-form-feminine-indefinite-singular":"osmanlie","error-unrecognized-form-indefinite-masculine-plural":"osmanlii","error-unrecognized-form-feminine-indefinite-neuter-plural":"osmanlii","definite-error-unrecognized-form-masculine-neuter-singular":"osmanliul","definite-error-unrecognized-form-feminine-singular":"osmanlia","definite-error-unrecognized-form-masculine-plural":"osmanliii","definite-error-unrecognized-form-feminine-neuter-plural":"osmanliile"}},{"word":"osmanliu","pos":"noun","definitions":["Ottoman"],"forms":{"plural":"osmanlii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"osmanliu","accusative-definite-nominative-singular":"osmanliuul","accusative-indefinite-nominative-plural":"osmanlii","accusative-definite-nominative-plural":"osmanliii","dative-genitive-indefinite-singular":"osmanliu","dative-definite-genitive-singular":"osmanliuului","dative-genitive-indefinite-plural":"osmanlii","dative-definite-genitive-plural":"osmanliilor","singular-vocative":"osmanliuule","plural-vocative":"osmanliilor"}},{"word":"Osmanu","pos":"name","definitions":["a village in Brăila County, Romania. Renamed to Unirea."],"gender":"f"},{"word":"osmhidroză","pos":"noun","definitions":["osmidrosis"],"forms":{"plural":"osmhidroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osmhidroză","accusative-definite-nominative-singular":"osmhidroza","accusative-indefinite-nominative-plural":"osmhidroze","accusative-definite-nominative-plural":"osmhidrozele","dative-genitive-indefinite-singular":"osmhidroze","dative-definite-genitive-singular":"osmhidrozei","dative-genitive-indefinite-plural":"osmhidroze","dative-definite-genitive-plural":"osmhidrozelor","singular-vocative":"osmhidroză","plural-vocative":"osmhidrozelor"}},{"word":"osmiridiu","pos":"noun","definitions":["osmiridium"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"osmiridiu","accusative-definite-nominative":"osmiridiul","dative-genitive-indefinite":"osmiridiu","dative-definite-genitive":"osmiridiului","vocative":"osmiridiule"}},{"word":"osmiu","pos":"noun","definitions":["osmium (chemical element)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"osmiu","accusative-definite-nominative":"osmiul","dative-genitive-indefinite":"osmiu","dative-definite-genitive":"osmiului","vocative":"osmiule"}},{"word":"osmoglasnic","pos":"noun","definitions":["Octoechos"],"forms":{"plural":"osmoglasnice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"osmoglasnic","accusative-definite-nominative-singular":"osmoglasnicul","accusative-indefinite-nominative-plural":"osmoglasnice","accusative-definite-nominative-plural":"osmoglasnicele","dative-genitive-indefinite-singular":"osmoglasnic","dative-definite-genitive-singular":"osmoglasnicului","dative-genitive-indefinite-plural":"osmoglasnice","dative-definite-genitive-plural":"osmoglasnicelor","singular-vocative":"osmoglasnicule","plural-vocative":"osmoglasnicelor"}},{"word":"osmologie","pos":"noun","definitions":["osmology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"osmologie","accusative-definite-nominative-singular":"osmologia","accusative-indefinite-nominative-plural":"osmologii","accusative-definite-nominative-plural":"osmologiile","dative-genitive-indefinite-singular":"osmologii","dative-definite-genitive-singular":"osmologiei","dative-genitive-indefinite-plural":"osmologii","dative-definite-genitive-plural":"osmologiilor","singular-vocative":"osmologie","plural-vocative":"osmologiilor"}},{"word":"osmometric","pos":"adj","definitions":["osmometric"],"forms":{"feminine-singular":"osmometrică","masculine-plural":"osmometrici","feminine-neuter-plural":"osmometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"osmometric","error-unrecognized-form-feminine-indefinite-singular":"osmometrică","error-unrecognized-form-indefinite-masculine-plural":"osmometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"osmometrice","definite-error-unrecognized-form-masculine-neuter-singular":"osmometricul","definite-error-unrecognized-form-feminine-singular":"osmometrica","definite-error-unrecognized-form-masculine-plural":"osmometricii","definite-error-unrecognized-form-feminine-neuter-plural":"osmometricele"}},{"word":"osmometrie","pos":"noun","definitions":["osmometry"],"forms":{"plural":"osmometrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"osmometrie","accusative-definite-nominative-singular":"osmometria","accusative-indefinite-nominative-plural":"osmometrii","accusative-definite-nominative-plural":"osmometriile","dative-genitive-indefinite-singular":"osmometrii","dative-definite-genitive-singular":"osmometriei","dative-genitive-indefinite-plural":"osmometrii","dative-definite-genitive-plural":"osmometriilor","singular-vocative":"osmometrie","plural-vocative":"osmometriilor"}},{"word":"osmometru","pos":"noun","definitions":["osmometer"],"forms":{"plural":"osmometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"osmometru","accusative-definite-nominative-singular":"osmometrul","accusative-indefinite-nominative-plural":"osmometre","accusative-definite-nominative-plural":"osmometrele","dative-genitive-indefinite-singular":"osmometru","dative-definite-genitive-singular":"osmometrului","dative-genitive-indefinite-plural":"osmometre","dative-definite-genitive-plural":"osmometrelor","singular-vocative":"osmometrule","plural-vocative":"osmometrelor"}},{"word":"osmoreceptor","pos":"noun","definitions":["osmoreceptor"],"forms":{"plural":"osmoreceptori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"osmoreceptor","accusative-definite-nominative-singular":"osmoreceptorul","accusative-indefinite-nominative-plural":"osmoreceptori","accusative-definite-nominative-plural":"osmoreceptorii","dative-genitive-indefinite-singular":"osmoreceptor","dative-definite-genitive-singular":"osmoreceptorului","dative-genitive-indefinite-plural":"osmoreceptori","dative-definite-genitive-plural":"osmoreceptorilor","singular-vocative":"osmoreceptorule","plural-vocative":"osmoreceptorilor"}},{"word":"osmoreglare","pos":"noun","definitions":["osmoregulation"],"forms":{"plural":"osmoreglări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"osmoreglare","accusative-definite-nominative-singular":"osmoreglarea","accusative-indefinite-nominative-plural":"osmoreglări","accusative-definite-nominative-plural":"osmoreglările","dative-genitive-indefinite-singular":"osmoreglări","dative-definite-genitive-singular":"osmoreglării","dative-genitive-indefinite-plural":"osmoreglări","dative-definite-genitive-plural":"osmoreglărilor","singular-vocative":"osmoreglare","plural-vocative":"osmoreglărilor"}},{"word":"osmotic","pos":"adj","definitions":["osmotic"],"forms":{"feminine-singular":"osmotică","masculine-plural":"osmotici","feminine-neuter-plural":"osmotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"osmotic","error-unrecognized-form-feminine-indefinite-singular":"osmotică","error-unrecognized-form-indefinite-masculine-plural":"osmotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"osmotice","definite-error-unrecognized-form-masculine-neuter-singular":"osmoticul","definite-error-unrecognized-form-feminine-singular":"osmotica","definite-error-unrecognized-form-masculine-plural":"osmoticii","definite-error-unrecognized-form-feminine-neuter-plural":"osmoticele"}},{"word":"osmoză","pos":"noun","definitions":["osmosis"],"forms":{"plural":"osmoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osmoză","accusative-definite-nominative-singular":"osmoza","accusative-indefinite-nominative-plural":"osmoze","accusative-definite-nominative-plural":"osmozele","dative-genitive-indefinite-singular":"osmoze","dative-definite-genitive-singular":"osmozei","dative-genitive-indefinite-plural":"osmoze","dative-definite-genitive-plural":"osmozelor","singular-vocative":"osmoză","plural-vocative":"osmozelor"}},{"word":"Osoi","pos":"name","definitions":["a village in Recea-Cristur, Cluj County, Romania","a village in Comarna, Iași County, Romania","a village in Sinești, Iași County, Romania","a village in Vulturești, Suceava County, Romania"],"gender":"m"},{"word":"Osoianu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Osoianu"}},{"word":"Oșorhean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Oșorhean"}},{"word":"Oșorhei","pos":"name","definitions":["a commune of Bihor County, Romania","a village in Oșorhei, Bihor County, Romania"],"gender":"m"},{"word":"Oșorheian","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Oșorheian"}},{"word":"Oșorhel","pos":"name","definitions":["a village in Bobâlna, Cluj County, Romania"],"gender":"m"},{"word":"osos","pos":"adj","definitions":["bony, gaunt","big-boned","osseous"],"pronunciation":"/oˈsos/","forms":{"feminine-singular":"osoasă","masculine-plural":"osoși","feminine-neuter-plural":"osoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"osos","error-unrecognized-form-feminine-indefinite-singular":"osoasă","error-unrecognized-form-indefinite-masculine-plural":"osoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"osoase","definite-error-unrecognized-form-masculine-neuter-singular":"ososul","definite-error-unrecognized-form-feminine-singular":"osoasa","definite-error-unrecognized-form-masculine-plural":"osoșii","definite-error-unrecognized-form-feminine-neuter-plural":"osoasele"}},{"word":"ospăț","pos":"noun","definitions":["feast, banquet, repast"],"forms":{"plural":"ospețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ospăț","accusative-definite-nominative-singular":"ospățul","accusative-indefinite-nominative-plural":"ospețe","accusative-definite-nominative-plural":"ospețele","dative-genitive-indefinite-singular":"ospăț","dative-definite-genitive-singular":"ospățului","dative-genitive-indefinite-plural":"ospețe","dative-definite-genitive-plural":"ospețelor","singular-vocative":"ospățule","plural-vocative":"ospețelor"}},{"word":"ospăta","pos":"verb","definitions":["to welcome, treat, receive hospitably","to feast, banquet, regale"],"forms":{"canonical":"a ospăta 1st conjugation","present-singular-third-person":"ospătează","participle-past":"ospătat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ospăta","gerund":"ospătând","first-person-indicative-present-singular":"ospătez","indicative-present-second-person-singular":"ospătezi","indicative-present-singular-third-person":"ospătează","first-person-indicative-plural-present":"ospătăm","indicative-plural-present-second-person":"ospătați","indicative-plural-present-third-person":"ospătează","first-person-imperfect-indicative-singular":"ospătam","imperfect-indicative-second-person-singular":"ospătai","imperfect-indicative-singular-third-person":"ospăta","first-person-imperfect-indicative-plural":"ospătam","imperfect-indicative-plural-second-person":"ospătați","imperfect-indicative-plural-third-person":"ospătau","first-person-indicative-perfect-singular":"ospătai","indicative-perfect-second-person-singular":"ospătași","indicative-perfect-singular-third-person":"ospătă","first-person-indicative-perfect-plural":"ospătarăm","indicative-perfect-plural-second-person":"ospătarăți","indicative-perfect-plural-third-person":"ospătară","first-person-indicative-pluperfect-singular":"ospătasem","indicative-pluperfect-second-person-singular":"ospătaseși","indicative-pluperfect-singular-third-person":"ospătase","first-person-indicative-pluperfect-plural":"ospătaserăm","indicative-pluperfect-plural-second-person":"ospătaserăți","indicative-pluperfect-plural-third-person":"ospătaseră","first-person-present-singular-subjunctive":"să ospătez","present-second-person-singular-subjunctive":"să ospătezi","present-singular-subjunctive-third-person":"să ospăteze","first-person-plural-present-subjunctive":"să ospătăm","plural-present-second-person-subjunctive":"să ospătați","plural-present-subjunctive-third-person":"să ospăteze","imperative-second-person-singular":"ospătează","imperative-plural-second-person":"ospătați","imperative-negative-second-person-singular":"nu ospăta","imperative-negative-plural-second-person":"nu ospătați"}},{"word":"ospătar","pos":"noun","definitions":["waiter (a server in a restaurant or similar)"],"forms":{"plural":"ospătari","feminine":"equivalent ospătăriță","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ospătar","accusative-definite-nominative-singular":"ospătarul","accusative-indefinite-nominative-plural":"ospătari","accusative-definite-nominative-plural":"ospătarii","dative-genitive-indefinite-singular":"ospătar","dative-definite-genitive-singular":"ospătarului","dative-genitive-indefinite-plural":"ospătari","dative-definite-genitive-plural":"ospătarilor","singular-vocative":"ospătarule","plural-vocative":"ospătarilor"}},{"word":"ospătară","pos":"noun","definitions":["female equivalent of ospătar"],"forms":{"plural":"ospătare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ospătară","accusative-definite-nominative-singular":"ospătara","accusative-indefinite-nominative-plural":"ospătare","accusative-definite-nominative-plural":"ospătarele","dative-genitive-indefinite-singular":"ospătare","dative-definite-genitive-singular":"ospătarei","dative-genitive-indefinite-plural":"ospătare","dative-definite-genitive-plural":"ospătarelor","singular-vocative":"ospătară","plural-vocative":"ospătarelor"}},{"word":"ospătare","pos":"noun","definitions":["feasting"],"forms":{"plural":"ospătări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ospătare","accusative-definite-nominative-singular":"ospătarea","accusative-indefinite-nominative-plural":"ospătări","accusative-definite-nominative-plural":"ospătările","dative-genitive-indefinite-singular":"ospătări","dative-definite-genitive-singular":"ospătării","dative-genitive-indefinite-plural":"ospătări","dative-definite-genitive-plural":"ospătărilor","singular-vocative":"ospătare","plural-vocative":"ospătărilor"}},{"word":"ospătăreasă","pos":"noun","definitions":["female equivalent of ospătar"],"forms":{"plural":"ospătărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ospătăreasă","accusative-definite-nominative-singular":"ospătăreasa","accusative-indefinite-nominative-plural":"ospătărese","accusative-definite-nominative-plural":"ospătăresele","dative-genitive-indefinite-singular":"ospătărese","dative-definite-genitive-singular":"ospătăresei","dative-genitive-indefinite-plural":"ospătărese","dative-definite-genitive-plural":"ospătăreselor","singular-vocative":"ospătăreasă","plural-vocative":"ospătăreselor"}},{"word":"ospătăreț","pos":"adj","definitions":["hospitable"],"forms":{"feminine-singular":"ospătăreață","masculine-plural":"ospătăreți","feminine-neuter-plural":"ospătărețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ospătăreț","error-unrecognized-form-feminine-indefinite-singular":"ospătăreață","error-unrecognized-form-indefinite-masculine-plural":"ospătăreți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ospătărețe","definite-error-unrecognized-form-masculine-neuter-singular":"ospătărețul","definite-error-unrecognized-form-feminine-singular":"ospătăreața","definite-error-unrecognized-form-masculine-plural":"ospătăreții","definite-error-unrecognized-form-feminine-neuter-plural":"ospătărețele"}},{"word":"ospătari","pos":"noun","definitions":["indefinite nominative/accusative/genitive/dative plural of ospătar"]},{"word":"ospătărie","pos":"noun","definitions":["hostelry"],"forms":{"plural":"ospătării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ospătărie","accusative-definite-nominative-singular":"ospătăria","accusative-indefinite-nominative-plural":"ospătării","accusative-definite-nominative-plural":"ospătăriile","dative-genitive-indefinite-singular":"ospătării","dative-definite-genitive-singular":"ospătăriei","dative-genitive-indefinite-plural":"ospătării","dative-definite-genitive-plural":"ospătăriilor","singular-vocative":"ospătărie","plural-vocative":"ospătăriilor"}},{"word":"ospătăriță","pos":"noun","definitions":["waitress (female waiter)"],"forms":{"plural":"ospătărițe","masculine":"equivalent ospătar","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ospătăriță","accusative-definite-nominative-singular":"ospătărița","accusative-indefinite-nominative-plural":"ospătărițe","accusative-definite-nominative-plural":"ospătărițele","dative-genitive-indefinite-singular":"ospătărițe","dative-definite-genitive-singular":"ospătăriței","dative-genitive-indefinite-plural":"ospătărițe","dative-definite-genitive-plural":"ospătărițelor","singular-vocative":"ospătăriță","plural-vocative":"ospătărițelor"}},{"word":"ospătărițe","pos":"noun","definitions":["inflection of ospătăriță:","indefinite nominative/accusative/genitive/dative plural","indefinite genitive/dative singular"]},{"word":"ospătarnic","pos":"adj","definitions":["hospitable"],"forms":{"feminine-singular":"ospătarnică","masculine-plural":"ospătarnici","feminine-neuter-plural":"ospătarnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ospătarnic","error-unrecognized-form-feminine-indefinite-singular":"ospătarnică","error-unrecognized-form-indefinite-masculine-plural":"ospătarnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ospătarnice","definite-error-unrecognized-form-masculine-neuter-singular":"ospătarnicul","definite-error-unrecognized-form-feminine-singular":"ospătarnica","definite-error-unrecognized-form-masculine-plural":"ospătarnicii","definite-error-unrecognized-form-feminine-neuter-plural":"ospătarnicele"}},{"word":"ospătat","pos":"noun","definitions":["feasted"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ospătat","accusative-definite-nominative":"ospătatul","dative-genitive-indefinite":"ospătat","dative-definite-genitive":"ospătatului","vocative":"ospătatule"}},{"word":"ospătat","pos":"verb","definitions":["past participle of ospăta"],"forms":{"participle-past":"of ospăta"}},{"word":"ospătătoare","pos":"noun","definitions":["female equivalent of ospătător"],"forms":{"plural":"ospătătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"ospătătoare","accusative-definite-nominative-singular":"ospătătoarea","accusative-indefinite-nominative-plural":"ospătătoare","accusative-definite-nominative-plural":"ospătătoarele","dative-genitive-indefinite-singular":"ospătătoare","dative-definite-genitive-singular":"ospătătoarei","dative-genitive-indefinite-plural":"ospătătoare","dative-definite-genitive-plural":"ospătătoarelor","singular-vocative":"ospătătoare","plural-vocative":"ospătătoarelor"}},{"word":"ospătător","pos":"adj","definitions":["hospitable"],"forms":{"feminine-singular":"ospătătoare","masculine-plural":"ospătători","feminine-neuter-plural":"ospătătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ospătător","error-unrecognized-form-feminine-indefinite-singular":"ospătătoare","error-unrecognized-form-indefinite-masculine-plural":"ospătători","error-unrecognized-form-feminine-indefinite-neuter-plural":"ospătătoare","definite-error-unrecognized-form-masculine-neuter-singular":"ospătătorul","definite-error-unrecognized-form-feminine-singular":"ospătătoarea","definite-error-unrecognized-form-masculine-plural":"ospătătorii","definite-error-unrecognized-form-feminine-neuter-plural":"ospătătoarele"}},{"word":"ospătătură","pos":"noun","definitions":["hospitality"],"forms":{"plural":"ospătături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ospătătură","accusative-definite-nominative-singular":"ospătătura","accusative-indefinite-nominative-plural":"ospătături","accusative-definite-nominative-plural":"ospătăturile","dative-genitive-indefinite-singular":"ospătături","dative-definite-genitive-singular":"ospătăturii","dative-genitive-indefinite-plural":"ospătături","dative-definite-genitive-plural":"ospătăturilor","singular-vocative":"ospătătură","plural-vocative":"ospătăturilor"}},{"word":"ospătos","pos":"adj","definitions":["hospitable"],"forms":{"feminine-singular":"ospătoasă","masculine-plural":"ospătoși","feminine-neuter-plural":"ospătoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ospătos","error-unrecognized-form-feminine-indefinite-singular":"ospătoasă","error-unrecognized-form-indefinite-masculine-plural":"ospătoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"ospătoase","definite-error-unrecognized-form-masculine-neuter-singular":"ospătosul","definite-error-unrecognized-form-feminine-singular":"ospătoasa","definite-error-unrecognized-form-masculine-plural":"ospătoșii","definite-error-unrecognized-form-feminine-neuter-plural":"ospătoasele"}},{"word":"ospecioi","pos":"noun","definitions":["guest"],"forms":{"plural":"ospecioi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ospecioi","accusative-definite-nominative-singular":"ospecioiul","accusative-indefinite-nominative-plural":"ospecioi","accusative-definite-nominative-plural":"ospecioii","dative-genitive-indefinite-singular":"ospecioi","dative-definite-genitive-singular":"ospecioiului","dative-genitive-indefinite-plural":"ospecioi","dative-definite-genitive-plural":"ospecioilor","singular-vocative":"ospecioiule","plural-vocative":"ospecioilor"}},{"word":"ospecior","pos":"noun","definitions":["diminutive of oaspete; small guest"],"forms":{"plural":"ospeciori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ospecior","accusative-definite-nominative-singular":"ospeciorul","accusative-indefinite-nominative-plural":"ospeciori","accusative-definite-nominative-plural":"ospeciorii","dative-genitive-indefinite-singular":"ospecior","dative-definite-genitive-singular":"ospeciorului","dative-genitive-indefinite-plural":"ospeciori","dative-definite-genitive-plural":"ospeciorilor","singular-vocative":"ospeciorule","plural-vocative":"ospeciorilor"}},{"word":"ospel","pos":"noun","definitions":["hostel, inn"],"forms":{"plural":"ospele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ospel","accusative-definite-nominative-singular":"ospelul","accusative-indefinite-nominative-plural":"ospele","accusative-definite-nominative-plural":"ospelele","dative-genitive-indefinite-singular":"ospel","dative-definite-genitive-singular":"ospelului","dative-genitive-indefinite-plural":"ospele","dative-definite-genitive-plural":"ospelelor","singular-vocative":"ospelule","plural-vocative":"ospelelor"}},{"word":"ospelărie","pos":"noun","definitions":["eatery"],"forms":{"plural":"ospelării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ospelărie","accusative-definite-nominative-singular":"ospelăria","accusative-indefinite-nominative-plural":"ospelării","accusative-definite-nominative-plural":"ospelăriile","dative-genitive-indefinite-singular":"ospelării","dative-definite-genitive-singular":"ospelăriei","dative-genitive-indefinite-plural":"ospelării","dative-definite-genitive-plural":"ospelăriilor","singular-vocative":"ospelărie","plural-vocative":"ospelăriilor"}},{"word":"ospeta","pos":"verb","definitions":["obsolete form of ospăta"],"forms":{"canonical":"a ospeta 1st conjugation","present-singular-third-person":"ospetează","participle-past":"ospetat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ospeta","gerund":"ospetând","first-person-indicative-present-singular":"ospetez","indicative-present-second-person-singular":"ospetezi","indicative-present-singular-third-person":"ospetează","first-person-indicative-plural-present":"ospetăm","indicative-plural-present-second-person":"ospetați","indicative-plural-present-third-person":"ospetează","first-person-imperfect-indicative-singular":"ospetam","imperfect-indicative-second-person-singular":"ospetai","imperfect-indicative-singular-third-person":"ospeta","first-person-imperfect-indicative-plural":"ospetam","imperfect-indicative-plural-second-person":"ospetați","imperfect-indicative-plural-third-person":"ospetau","first-person-indicative-perfect-singular":"ospetai","indicative-perfect-second-person-singular":"ospetași","indicative-perfect-singular-third-person":"ospetă","first-person-indicative-perfect-plural":"ospetarăm","indicative-perfect-plural-second-person":"ospetarăți","indicative-perfect-plural-third-person":"ospetară","first-person-indicative-pluperfect-singular":"ospetasem","indicative-pluperfect-second-person-singular":"ospetaseși","indicative-pluperfect-singular-third-person":"ospetase","first-person-indicative-pluperfect-plural":"ospetaserăm","indicative-pluperfect-plural-second-person":"ospetaserăți","indicative-pluperfect-plural-third-person":"ospetaseră","first-person-present-singular-subjunctive":"să ospetez","present-second-person-singular-subjunctive":"să ospetezi","present-singular-subjunctive-third-person":"să ospeteze","first-person-plural-present-subjunctive":"să ospetăm","plural-present-second-person-subjunctive":"să ospetați","plural-present-subjunctive-third-person":"să ospeteze","imperative-second-person-singular":"ospetează","imperative-plural-second-person":"ospetați","imperative-negative-second-person-singular":"nu ospeta","imperative-negative-plural-second-person":"nu ospetați"}},{"word":"ospețărie","pos":"noun","definitions":["hostelry"],"forms":{"plural":"ospețării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ospețărie","accusative-definite-nominative-singular":"ospețăria","accusative-indefinite-nominative-plural":"ospețării","accusative-definite-nominative-plural":"ospețăriile","dative-genitive-indefinite-singular":"ospețării","dative-definite-genitive-singular":"ospețăriei","dative-genitive-indefinite-plural":"ospețării","dative-definite-genitive-plural":"ospețăriilor","singular-vocative":"ospețărie","plural-vocative":"ospețăriilor"}},{"word":"ospețean","pos":"noun","definitions":["wedding-goer"],"forms":{"plural":"ospețeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ospețean","accusative-definite-nominative-singular":"ospețeanul","accusative-indefinite-nominative-plural":"ospețeni","accusative-definite-nominative-plural":"ospețenii","dative-genitive-indefinite-singular":"ospețean","dative-definite-genitive-singular":"ospețeanului","dative-genitive-indefinite-plural":"ospețeni","dative-definite-genitive-plural":"ospețenilor","singular-vocative":"ospețeanule","plural-vocative":"ospețenilor"}},{"word":"ospeție","pos":"noun","definitions":["hospitality"],"forms":{"plural":"ospeții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ospeție","accusative-definite-nominative-singular":"ospeția","accusative-indefinite-nominative-plural":"ospeții","accusative-definite-nominative-plural":"ospețiile","dative-genitive-indefinite-singular":"ospeții","dative-definite-genitive-singular":"ospeției","dative-genitive-indefinite-plural":"ospeții","dative-definite-genitive-plural":"ospețiilor","singular-vocative":"ospeție","plural-vocative":"ospețiilor"}},{"word":"ospețime","pos":"noun","definitions":["guests"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"ospețime","accusative-definite-nominative":"ospețimea","dative-genitive-indefinite":"ospețimi","dative-definite-genitive":"ospețimii","vocative":"ospețime"}},{"word":"ospețire","pos":"noun","definitions":["hospitality"],"forms":{"plural":"ospețiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ospețire","accusative-definite-nominative-singular":"ospețirea","accusative-indefinite-nominative-plural":"ospețiri","accusative-definite-nominative-plural":"ospețirile","dative-genitive-indefinite-singular":"ospețiri","dative-definite-genitive-singular":"ospețirii","dative-genitive-indefinite-plural":"ospețiri","dative-definite-genitive-plural":"ospețirilor","singular-vocative":"ospețire","plural-vocative":"ospețirilor"}},{"word":"ospiciu","pos":"noun","definitions":["mental hospital, insane asylum"],"forms":{"plural":"ospicii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ospiciu","accusative-definite-nominative-singular":"ospiciul","accusative-indefinite-nominative-plural":"ospicii","accusative-definite-nominative-plural":"ospiciile","dative-genitive-indefinite-singular":"ospiciu","dative-definite-genitive-singular":"ospiciului","dative-genitive-indefinite-plural":"ospicii","dative-definite-genitive-plural":"ospiciilor","singular-vocative":"ospiciule","plural-vocative":"ospiciilor"}},{"word":"ospita","pos":"verb","definitions":["obsolete form of ospăta"],"forms":{"canonical":"a ospita 1st conjugation","present-singular-third-person":"ospitează","participle-past":"ospitat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ospita","gerund":"ospitând","first-person-indicative-present-singular":"ospitez","indicative-present-second-person-singular":"ospitezi","indicative-present-singular-third-person":"ospitează","first-person-indicative-plural-present":"ospităm","indicative-plural-present-second-person":"ospitați","indicative-plural-present-third-person":"ospitează","first-person-imperfect-indicative-singular":"ospitam","imperfect-indicative-second-person-singular":"ospitai","imperfect-indicative-singular-third-person":"ospita","first-person-imperfect-indicative-plural":"ospitam","imperfect-indicative-plural-second-person":"ospitați","imperfect-indicative-plural-third-person":"ospitau","first-person-indicative-perfect-singular":"ospitai","indicative-perfect-second-person-singular":"ospitași","indicative-perfect-singular-third-person":"ospită","first-person-indicative-perfect-plural":"ospitarăm","indicative-perfect-plural-second-person":"ospitarăți","indicative-perfect-plural-third-person":"ospitară","first-person-indicative-pluperfect-singular":"ospitasem","indicative-pluperfect-second-person-singular":"ospitaseși","indicative-pluperfect-singular-third-person":"ospitase","first-person-indicative-pluperfect-plural":"ospitaserăm","indicative-pluperfect-plural-second-person":"ospitaserăți","indicative-pluperfect-plural-third-person":"ospitaseră","first-person-present-singular-subjunctive":"să ospitez","present-second-person-singular-subjunctive":"să ospitezi","present-singular-subjunctive-third-person":"să ospiteze","first-person-plural-present-subjunctive":"să ospităm","plural-present-second-person-subjunctive":"să ospitați","plural-present-subjunctive-third-person":"să ospiteze","imperative-second-person-singular":"ospitează","imperative-plural-second-person":"ospitați","imperative-negative-second-person-singular":"nu ospita","imperative-negative-plural-second-person":"nu ospitați"}},{"word":"ospital","pos":"adj","definitions":["hospital"],"forms":{"feminine-singular":"ospitală","masculine-plural":"ospitali","feminine-neuter-plural":"ospitale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ospital","error-unrecognized-form-feminine-indefinite-singular":"ospitală","error-unrecognized-form-indefinite-masculine-plural":"ospitali","error-unrecognized-form-feminine-indefinite-neuter-plural":"ospitale","definite-error-unrecognized-form-masculine-neuter-singular":"ospitalul","definite-error-unrecognized-form-feminine-singular":"ospitala","definite-error-unrecognized-form-masculine-plural":"ospitalii","definite-error-unrecognized-form-feminine-neuter-plural":"ospitalele"}},{"word":"ospitalier","pos":"adj","definitions":["hospitable"],"forms":{"feminine-singular":"ospitalieră","masculine-plural":"ospitalieri","feminine-neuter-plural":"ospitaliere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ospitalier","error-unrecognized-form-feminine-indefinite-singular":"ospitalieră","error-unrecognized-form-indefinite-masculine-plural":"ospitalieri","error-unrecognized-form-feminine-indefinite-neuter-plural":"ospitaliere","definite-error-unrecognized-form-masculine-neuter-singular":"ospitalierul","definite-error-unrecognized-form-feminine-singular":"ospitaliera","definite-error-unrecognized-form-masculine-plural":"ospitalierii","definite-error-unrecognized-form-feminine-neuter-plural":"ospitalierele"}},{"word":"ospitalitate","pos":"noun","definitions":["hospitality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ospitalitate","accusative-definite-nominative-singular":"ospitalitatea","accusative-indefinite-nominative-plural":"ospitalități","accusative-definite-nominative-plural":"ospitalitățile","dative-genitive-indefinite-singular":"ospitalități","dative-definite-genitive-singular":"ospitalității","dative-genitive-indefinite-plural":"ospitalități","dative-definite-genitive-plural":"ospitalităților","singular-vocative":"ospitalitate","plural-vocative":"ospitalităților"}},{"word":"ospitalizat","pos":"adj","definitions":["hosted"],"forms":{"feminine-singular":"ospitalizată","masculine-plural":"ospitalizați","feminine-neuter-plural":"ospitalizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ospitalizat","error-unrecognized-form-feminine-indefinite-singular":"ospitalizată","error-unrecognized-form-indefinite-masculine-plural":"ospitalizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"ospitalizate","definite-error-unrecognized-form-masculine-neuter-singular":"ospitalizatul","definite-error-unrecognized-form-feminine-singular":"ospitalizata","definite-error-unrecognized-form-masculine-plural":"ospitalizații","definite-error-unrecognized-form-feminine-neuter-plural":"ospitalizatele"}},{"word":"ospitalizat","pos":"verb","definitions":["past participle of ospitaliza"],"forms":{"participle-past":"of ospitaliza"}},{"word":"ost","pos":"noun","definitions":["east"],"forms":{"plural":"osturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ost","accusative-definite-nominative-singular":"ostul","accusative-indefinite-nominative-plural":"osturi","accusative-definite-nominative-plural":"osturile","dative-genitive-indefinite-singular":"ost","dative-definite-genitive-singular":"ostului","dative-genitive-indefinite-plural":"osturi","dative-definite-genitive-plural":"osturilor","singular-vocative":"ostule","plural-vocative":"osturilor"}},{"word":"ostafcă","pos":"noun","definitions":["resignation, retirement"],"forms":{"plural":"ostafce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ostafcă","accusative-definite-nominative-singular":"ostafca","accusative-indefinite-nominative-plural":"ostafce","accusative-definite-nominative-plural":"ostafcele","dative-genitive-indefinite-singular":"ostafce","dative-definite-genitive-singular":"ostafcei","dative-genitive-indefinite-plural":"ostafce","dative-definite-genitive-plural":"ostafcelor","singular-vocative":"ostafcă","plural-vocative":"ostafcelor"}},{"word":"ostâmpi","pos":"verb","definitions":["to leave"],"forms":{"canonical":"a ostâmpi 4th conjugation","present-singular-third-person":"ostâmpește","participle-past":"ostâmpit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ostâmpi","gerund":"ostâmpind","first-person-indicative-present-singular":"ostâmpesc","indicative-present-second-person-singular":"ostâmpești","indicative-present-singular-third-person":"ostâmpește","first-person-indicative-plural-present":"ostâmpim","indicative-plural-present-second-person":"ostâmpiți","indicative-plural-present-third-person":"ostâmpesc","first-person-imperfect-indicative-singular":"ostâmpeam","imperfect-indicative-second-person-singular":"ostâmpeai","imperfect-indicative-singular-third-person":"ostâmpea","first-person-imperfect-indicative-plural":"ostâmpeam","imperfect-indicative-plural-second-person":"ostâmpeați","imperfect-indicative-plural-third-person":"ostâmpeau","first-person-indicative-perfect-singular":"ostâmpii","indicative-perfect-second-person-singular":"ostâmpiși","indicative-perfect-singular-third-person":"ostâmpi","first-person-indicative-perfect-plural":"ostâmpirăm","indicative-perfect-plural-second-person":"ostâmpirăți","indicative-perfect-plural-third-person":"ostâmpiră","first-person-indicative-pluperfect-singular":"ostâmpisem","indicative-pluperfect-second-person-singular":"ostâmpiseși","indicative-pluperfect-singular-third-person":"ostâmpise","first-person-indicative-pluperfect-plural":"ostâmpiserăm","indicative-pluperfect-plural-second-person":"ostâmpiserăți","indicative-pluperfect-plural-third-person":"ostâmpiseră","first-person-present-singular-subjunctive":"să ostâmpesc","present-second-person-singular-subjunctive":"să ostâmpești","present-singular-subjunctive-third-person":"să ostâmpească","first-person-plural-present-subjunctive":"să ostâmpim","plural-present-second-person-subjunctive":"să ostâmpiți","plural-present-subjunctive-third-person":"să ostâmpească","imperative-second-person-singular":"ostâmpește","imperative-plural-second-person":"ostâmpiți","imperative-negative-second-person-singular":"nu ostâmpi","imperative-negative-plural-second-person":"nu ostâmpiți"}},{"word":"Ostaș","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Ostaș"}},{"word":"ostaș","pos":"noun","definitions":["soldier"],"pronunciation":"[osˈtaʃ]","forms":{"plural":"ostași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ostaș","accusative-definite-nominative-singular":"ostașul","accusative-indefinite-nominative-plural":"ostași","accusative-definite-nominative-plural":"ostașii","dative-genitive-indefinite-singular":"ostaș","dative-definite-genitive-singular":"ostașului","dative-genitive-indefinite-plural":"ostași","dative-definite-genitive-plural":"ostașilor","singular-vocative":"ostașule","plural-vocative":"ostașilor"}},{"word":"ostășesc","pos":"adj","definitions":["soldierly"],"forms":{"feminine-singular":"ostășească","plural":"ostășești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ostășesc","error-unrecognized-form-feminine-indefinite-singular":"ostășească","error-unrecognized-form-indefinite-masculine-plural":"ostășești","error-unrecognized-form-feminine-indefinite-neuter-plural":"ostășești","definite-error-unrecognized-form-masculine-neuter-singular":"ostășescul","definite-error-unrecognized-form-feminine-singular":"ostășeasca","definite-error-unrecognized-form-masculine-plural":"ostășeștii","definite-error-unrecognized-form-feminine-neuter-plural":"ostășeștile"}},{"word":"ostășește","pos":"adv","definitions":["soldierly"]},{"word":"ostășie","pos":"noun","definitions":["soldiering"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"ostășie","accusative-definite-nominative":"ostășia","dative-genitive-indefinite":"ostășii","dative-definite-genitive":"ostășiei","vocative":"ostășie"}},{"word":"ostășime","pos":"noun","definitions":["collective noun for soldiers"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"ostășime","accusative-definite-nominative":"ostășimea","dative-genitive-indefinite":"ostășime","dative-definite-genitive":"ostășimei","vocative":"ostășime"}},{"word":"ostatec","pos":"noun","definitions":["alternative form of ostatic"],"forms":{"plural":"ostateci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ostatec","accusative-definite-nominative-singular":"ostatecul","accusative-indefinite-nominative-plural":"ostateci","accusative-definite-nominative-plural":"ostatecii","dative-genitive-indefinite-singular":"ostatec","dative-definite-genitive-singular":"ostatecului","dative-genitive-indefinite-plural":"ostateci","dative-definite-genitive-plural":"ostatecilor","singular-vocative":"ostatecule","plural-vocative":"ostatecilor"}},{"word":"ostatic","pos":"noun","definitions":["hostage"],"forms":{"plural":"ostatici"}},{"word":"ostatică","pos":"noun","definitions":["female equivalent of ostatic"],"forms":{"plural":"ostatice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ostatică","accusative-definite-nominative-singular":"ostatica","accusative-indefinite-nominative-plural":"ostatice","accusative-definite-nominative-plural":"ostaticele","dative-genitive-indefinite-singular":"ostatice","dative-definite-genitive-singular":"ostaticei","dative-genitive-indefinite-plural":"ostatice","dative-definite-genitive-plural":"ostaticelor","singular-vocative":"ostatică","plural-vocative":"ostaticelor"}},{"word":"ostealgie","pos":"noun","definitions":["ostealgia"],"forms":{"plural":"ostealgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ostealgie","accusative-definite-nominative-singular":"ostealgia","accusative-indefinite-nominative-plural":"ostealgii","accusative-definite-nominative-plural":"ostealgiile","dative-genitive-indefinite-singular":"ostealgii","dative-definite-genitive-singular":"ostealgiei","dative-genitive-indefinite-plural":"ostealgii","dative-definite-genitive-plural":"ostealgiilor","singular-vocative":"ostealgie","plural-vocative":"ostealgiilor"}},{"word":"oștean","pos":"noun","definitions":["soldier"],"forms":{"plural":"oșteni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oștean","accusative-definite-nominative-singular":"oșteanul","accusative-indefinite-nominative-plural":"oșteni","accusative-definite-nominative-plural":"oștenii","dative-genitive-indefinite-singular":"oștean","dative-definite-genitive-singular":"oșteanului","dative-genitive-indefinite-plural":"oșteni","dative-definite-genitive-plural":"oștenilor","singular-vocative":"oșteanule","plural-vocative":"oștenilor"}},{"word":"osteită","pos":"noun","definitions":["osteitis"],"forms":{"plural":"osteite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osteită","accusative-definite-nominative-singular":"osteita","accusative-indefinite-nominative-plural":"osteite","accusative-definite-nominative-plural":"osteitele","dative-genitive-indefinite-singular":"osteite","dative-definite-genitive-singular":"osteitei","dative-genitive-indefinite-plural":"osteite","dative-definite-genitive-plural":"osteitelor","singular-vocative":"osteită","plural-vocative":"osteitelor"}},{"word":"osteneală","pos":"noun","definitions":["fatigue, tiredness, weariness, exhaustion","exertion, pains, toil, trouble, effort, hassle","diligence"]},{"word":"oștenesc","pos":"adj","definitions":["military"],"forms":{"feminine-singular":"oștenească","plural":"oștenești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oștenesc","error-unrecognized-form-feminine-indefinite-singular":"oștenească","error-unrecognized-form-indefinite-masculine-plural":"oștenești","error-unrecognized-form-feminine-indefinite-neuter-plural":"oștenești","definite-error-unrecognized-form-masculine-neuter-singular":"oștenescul","definite-error-unrecognized-form-feminine-singular":"oșteneasca","definite-error-unrecognized-form-masculine-plural":"oșteneștii","definite-error-unrecognized-form-feminine-neuter-plural":"oșteneștile"}},{"word":"oștenește","pos":"adv","definitions":["soldierly"]},{"word":"osteni","pos":"verb","definitions":["to tire, tire out, become tired, weary, worn out, fatigued, etc.","to toil, exert oneself"],"forms":{"canonical":"a osteni 4th conjugation","present-singular-third-person":"ostenește","participle-past":"ostenit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a osteni","gerund":"ostenind","first-person-indicative-present-singular":"ostenesc","indicative-present-second-person-singular":"ostenești","indicative-present-singular-third-person":"ostenește","first-person-indicative-plural-present":"ostenim","indicative-plural-present-second-person":"osteniți","indicative-plural-present-third-person":"ostenesc","first-person-imperfect-indicative-singular":"osteneam","imperfect-indicative-second-person-singular":"osteneai","imperfect-indicative-singular-third-person":"ostenea","first-person-imperfect-indicative-plural":"osteneam","imperfect-indicative-plural-second-person":"osteneați","imperfect-indicative-plural-third-person":"osteneau","first-person-indicative-perfect-singular":"ostenii","indicative-perfect-second-person-singular":"osteniși","indicative-perfect-singular-third-person":"osteni","first-person-indicative-perfect-plural":"ostenirăm","indicative-perfect-plural-second-person":"ostenirăți","indicative-perfect-plural-third-person":"osteniră","first-person-indicative-pluperfect-singular":"ostenisem","indicative-pluperfect-second-person-singular":"osteniseși","indicative-pluperfect-singular-third-person":"ostenise","first-person-indicative-pluperfect-plural":"osteniserăm","indicative-pluperfect-plural-second-person":"osteniserăți","indicative-pluperfect-plural-third-person":"osteniseră","first-person-present-singular-subjunctive":"să ostenesc","present-second-person-singular-subjunctive":"să ostenești","present-singular-subjunctive-third-person":"să ostenească","first-person-plural-present-subjunctive":"să ostenim","plural-present-second-person-subjunctive":"să osteniți","plural-present-subjunctive-third-person":"să ostenească","imperative-second-person-singular":"ostenește","imperative-plural-second-person":"osteniți","imperative-negative-second-person-singular":"nu osteni","imperative-negative-plural-second-person":"nu osteniți"}},{"word":"ostenicios","pos":"adj","definitions":["tiring"],"forms":{"feminine-singular":"ostenicioasă","masculine-plural":"ostenicioși","feminine-neuter-plural":"ostenicioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ostenicios","error-unrecognized-form-feminine-indefinite-singular":"ostenicioasă","error-unrecognized-form-indefinite-masculine-plural":"ostenicioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"ostenicioase","definite-error-unrecognized-form-masculine-neuter-singular":"osteniciosul","definite-error-unrecognized-form-feminine-singular":"ostenicioasa","definite-error-unrecognized-form-masculine-plural":"ostenicioșii","definite-error-unrecognized-form-feminine-neuter-plural":"ostenicioasele"}},{"word":"oștenie","pos":"noun","definitions":["military service"],"forms":{"plural":"oștenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oștenie","accusative-definite-nominative-singular":"oștenia","accusative-indefinite-nominative-plural":"oștenii","accusative-definite-nominative-plural":"oșteniile","dative-genitive-indefinite-singular":"oștenii","dative-definite-genitive-singular":"oșteniei","dative-genitive-indefinite-plural":"oștenii","dative-definite-genitive-plural":"oșteniilor","singular-vocative":"oștenie","plural-vocative":"oșteniilor"}},{"word":"oștenii","pos":"noun","definitions":["plural of oștenie"]},{"word":"ostenință","pos":"noun","definitions":["trorture","effort"],"forms":{"plural":"ostenințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ostenință","accusative-definite-nominative-singular":"ostenința","accusative-indefinite-nominative-plural":"ostenințe","accusative-definite-nominative-plural":"ostenințele","dative-genitive-indefinite-singular":"ostenințe","dative-definite-genitive-singular":"osteninței","dative-genitive-indefinite-plural":"ostenințe","dative-definite-genitive-plural":"ostenințelor","singular-vocative":"ostenință","plural-vocative":"ostenințelor"}},{"word":"ostenire","pos":"noun","definitions":["tiring"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"ostenire","accusative-definite-nominative":"ostenirea","dative-genitive-indefinite":"osteniri","dative-definite-genitive":"ostenirii","vocative":"ostenire"}},{"word":"oștenire","pos":"noun","definitions":["soldiering","fight"],"forms":{"plural":"oșteniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oștenire","accusative-definite-nominative-singular":"oștenirea","accusative-indefinite-nominative-plural":"oșteniri","accusative-definite-nominative-plural":"oștenirile","dative-genitive-indefinite-singular":"oșteniri","dative-definite-genitive-singular":"oștenirii","dative-genitive-indefinite-plural":"oșteniri","dative-definite-genitive-plural":"oștenirilor","singular-vocative":"oștenire","plural-vocative":"oștenirilor"}},{"word":"ostenit","pos":"adj","definitions":["tired, weary, fatigued, exhausted, worn out"],"pronunciation":"/os.teˈnit/","forms":{"feminine-singular":"ostenită","masculine-plural":"osteniți","feminine-neuter-plural":"ostenite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ostenit","error-unrecognized-form-feminine-indefinite-singular":"ostenită","error-unrecognized-form-indefinite-masculine-plural":"osteniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ostenite","definite-error-unrecognized-form-masculine-neuter-singular":"ostenitul","definite-error-unrecognized-form-feminine-singular":"ostenita","definite-error-unrecognized-form-masculine-plural":"osteniții","definite-error-unrecognized-form-feminine-neuter-plural":"ostenitele"}},{"word":"ostenit","pos":"verb","definitions":["past participle of osteni"],"pronunciation":"/os.teˈnit/"},{"word":"ostenitor","pos":"adj","definitions":["exhausting"],"forms":{"feminine-singular":"ostenitoare","masculine-plural":"ostenitori","feminine-neuter-plural":"ostenitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ostenitor","error-unrecognized-form-feminine-indefinite-singular":"ostenitoare","error-unrecognized-form-indefinite-masculine-plural":"ostenitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"ostenitoare","definite-error-unrecognized-form-masculine-neuter-singular":"ostenitorul","definite-error-unrecognized-form-feminine-singular":"ostenitoarea","definite-error-unrecognized-form-masculine-plural":"ostenitorii","definite-error-unrecognized-form-feminine-neuter-plural":"ostenitoarele"}},{"word":"ostenitură","pos":"noun","definitions":["fatigue"],"forms":{"plural":"ostenituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ostenitură","accusative-definite-nominative-singular":"ostenitura","accusative-indefinite-nominative-plural":"ostenituri","accusative-definite-nominative-plural":"osteniturile","dative-genitive-indefinite-singular":"ostenituri","dative-definite-genitive-singular":"osteniturii","dative-genitive-indefinite-plural":"ostenituri","dative-definite-genitive-plural":"osteniturilor","singular-vocative":"ostenitură","plural-vocative":"osteniturilor"}},{"word":"ostensibil","pos":"adj","definitions":["conspicuous"],"forms":{"feminine-singular":"ostensibilă","masculine-plural":"ostensibili","feminine-neuter-plural":"ostensibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ostensibil","error-unrecognized-form-feminine-indefinite-singular":"ostensibilă","error-unrecognized-form-indefinite-masculine-plural":"ostensibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"ostensibile","definite-error-unrecognized-form-masculine-neuter-singular":"ostensibilul","definite-error-unrecognized-form-feminine-singular":"ostensibila","definite-error-unrecognized-form-masculine-plural":"ostensibilii","definite-error-unrecognized-form-feminine-neuter-plural":"ostensibilele"}},{"word":"ostensoriu","pos":"noun","definitions":["monstrance, ostensory (ornamental in which the sacramental bread is placed for veneration)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ostensoriu","accusative-definite-nominative":"ostensoriuul","dative-genitive-indefinite":"ostensoriu","dative-definite-genitive":"ostensoriuului","vocative":"ostensoriuule"}},{"word":"ostentație","pos":"noun","definitions":["ostentation"],"forms":{"plural":"ostentații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ostentație","accusative-definite-nominative-singular":"ostentația","accusative-indefinite-nominative-plural":"ostentații","accusative-definite-nominative-plural":"ostentațiile","dative-genitive-indefinite-singular":"ostentații","dative-definite-genitive-singular":"ostentației","dative-genitive-indefinite-plural":"ostentații","dative-definite-genitive-plural":"ostentațiilor","singular-vocative":"ostentație","plural-vocative":"ostentațiilor"}},{"word":"ostentațiune","pos":"noun","definitions":["alternative form of ostentație"],"forms":{"plural":"ostentațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ostentațiune","accusative-definite-nominative-singular":"ostentațiunea","accusative-indefinite-nominative-plural":"ostentațiuni","accusative-definite-nominative-plural":"ostentațiunile","dative-genitive-indefinite-singular":"ostentațiuni","dative-definite-genitive-singular":"ostentațiunii","dative-genitive-indefinite-plural":"ostentațiuni","dative-definite-genitive-plural":"ostentațiunilor","singular-vocative":"ostentațiune","plural-vocative":"ostentațiunilor"}},{"word":"ostentativ","pos":"adj","definitions":["ostentatious"],"forms":{"feminine-singular":"ostentativă","masculine-plural":"ostentativi","feminine-neuter-plural":"ostentative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ostentativ","error-unrecognized-form-feminine-indefinite-singular":"ostentativă","error-unrecognized-form-indefinite-masculine-plural":"ostentativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"ostentative","definite-error-unrecognized-form-masculine-neuter-singular":"ostentativul","definite-error-unrecognized-form-feminine-singular":"ostentativa","definite-error-unrecognized-form-masculine-plural":"ostentativii","definite-error-unrecognized-form-feminine-neuter-plural":"ostentativele"}},{"word":"ostentatoriu","pos":"adj","definitions":["ostentatious"],"forms":{"feminine-singular":"ostentatorie","plural":"ostentatorii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ostentatoriu","error-unrecognized-form-feminine-indefinite-singular":"ostentatorie","error-unrecognized-form-indefinite-masculine-plural":"ostentatorii","error-unrecognized-form-feminine-indefinite-neuter-plural":"ostentatorii","definite-error-unrecognized-form-masculine-neuter-singular":"ostentatoriul","definite-error-unrecognized-form-feminine-singular":"ostentatoria","definite-error-unrecognized-form-masculine-plural":"ostentatoriii","definite-error-unrecognized-form-feminine-neuter-plural":"ostentatoriile"}},{"word":"osteoartrită","pos":"noun","definitions":["osteoarthritis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osteoartrită","accusative-definite-nominative-singular":"osteoartrita","accusative-indefinite-nominative-plural":"osteoartrite","accusative-definite-nominative-plural":"osteoartritele","dative-genitive-indefinite-singular":"osteoartrite","dative-definite-genitive-singular":"osteoartritei","dative-genitive-indefinite-plural":"osteoartrite","dative-definite-genitive-plural":"osteoartritelor","singular-vocative":"osteoartrită","plural-vocative":"osteoartritelor"}},{"word":"osteoblast","pos":"noun","definitions":["osteoblast"],"forms":{"plural":"osteoblaste","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"osteoblast","accusative-definite-nominative-singular":"osteoblastul","accusative-indefinite-nominative-plural":"osteoblaste","accusative-definite-nominative-plural":"osteoblastele","dative-genitive-indefinite-singular":"osteoblast","dative-definite-genitive-singular":"osteoblastului","dative-genitive-indefinite-plural":"osteoblaste","dative-definite-genitive-plural":"osteoblastelor","singular-vocative":"osteoblastule","plural-vocative":"osteoblastelor"}},{"word":"osteocit","pos":"noun","definitions":["osteocyte"],"forms":{"plural":"osteocite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"osteocit","accusative-definite-nominative-singular":"osteocitul","accusative-indefinite-nominative-plural":"osteocite","accusative-definite-nominative-plural":"osteocitele","dative-genitive-indefinite-singular":"osteocit","dative-definite-genitive-singular":"osteocitului","dative-genitive-indefinite-plural":"osteocite","dative-definite-genitive-plural":"osteocitelor","singular-vocative":"osteocitule","plural-vocative":"osteocitelor"}},{"word":"osteoclast","pos":"noun","definitions":["osteoclast"],"forms":{"plural":"osteoclaste","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"osteoclast","accusative-definite-nominative-singular":"osteoclastul","accusative-indefinite-nominative-plural":"osteoclaste","accusative-definite-nominative-plural":"osteoclastele","dative-genitive-indefinite-singular":"osteoclast","dative-definite-genitive-singular":"osteoclastului","dative-genitive-indefinite-plural":"osteoclaste","dative-definite-genitive-plural":"osteoclastelor","singular-vocative":"osteoclastule","plural-vocative":"osteoclastelor"}},{"word":"osteoclazie","pos":"noun","definitions":["osteoclasia"],"forms":{"plural":"osteoclazii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"osteoclazie","accusative-definite-nominative-singular":"osteoclazia","accusative-indefinite-nominative-plural":"osteoclazii","accusative-definite-nominative-plural":"osteoclaziile","dative-genitive-indefinite-singular":"osteoclazii","dative-definite-genitive-singular":"osteoclaziei","dative-genitive-indefinite-plural":"osteoclazii","dative-definite-genitive-plural":"osteoclaziilor","singular-vocative":"osteoclazie","plural-vocative":"osteoclaziilor"}},{"word":"osteocondrită","pos":"noun","definitions":["osteochondritis"],"forms":{"plural":"osteocondrite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osteocondrită","accusative-definite-nominative-singular":"osteocondrita","accusative-indefinite-nominative-plural":"osteocondrite","accusative-definite-nominative-plural":"osteocondritele","dative-genitive-indefinite-singular":"osteocondrite","dative-definite-genitive-singular":"osteocondritei","dative-genitive-indefinite-plural":"osteocondrite","dative-definite-genitive-plural":"osteocondritelor","singular-vocative":"osteocondrită","plural-vocative":"osteocondritelor"}},{"word":"osteocondrom","pos":"noun","definitions":["osteochondroma"],"forms":{"plural":"osteocondroame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"osteocondrom","accusative-definite-nominative-singular":"osteocondromul","accusative-indefinite-nominative-plural":"osteocondroame","accusative-definite-nominative-plural":"osteocondroamele","dative-genitive-indefinite-singular":"osteocondrom","dative-definite-genitive-singular":"osteocondromului","dative-genitive-indefinite-plural":"osteocondroame","dative-definite-genitive-plural":"osteocondroamelor","singular-vocative":"osteocondromule","plural-vocative":"osteocondroamelor"}},{"word":"osteodinie","pos":"noun","definitions":["osteodynia"],"forms":{"plural":"osteodinii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"osteodinie","accusative-definite-nominative-singular":"osteodinia","accusative-indefinite-nominative-plural":"osteodinii","accusative-definite-nominative-plural":"osteodiniile","dative-genitive-indefinite-singular":"osteodinii","dative-definite-genitive-singular":"osteodiniei","dative-genitive-indefinite-plural":"osteodinii","dative-definite-genitive-plural":"osteodiniilor","singular-vocative":"osteodinie","plural-vocative":"osteodiniilor"}},{"word":"osteofibrom","pos":"noun","definitions":["osteofibroma"],"forms":{"plural":"osteofibroame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"osteofibrom","accusative-definite-nominative-singular":"osteofibromul","accusative-indefinite-nominative-plural":"osteofibroame","accusative-definite-nominative-plural":"osteofibroamele","dative-genitive-indefinite-singular":"osteofibrom","dative-definite-genitive-singular":"osteofibromului","dative-genitive-indefinite-plural":"osteofibroame","dative-definite-genitive-plural":"osteofibroamelor","singular-vocative":"osteofibromule","plural-vocative":"osteofibroamelor"}},{"word":"osteofibroză","pos":"noun","definitions":["osteofibrosis"],"forms":{"plural":"osteofibroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osteofibroză","accusative-definite-nominative-singular":"osteofibroza","accusative-indefinite-nominative-plural":"osteofibroze","accusative-definite-nominative-plural":"osteofibrozele","dative-genitive-indefinite-singular":"osteofibroze","dative-definite-genitive-singular":"osteofibrozei","dative-genitive-indefinite-plural":"osteofibroze","dative-definite-genitive-plural":"osteofibrozelor","singular-vocative":"osteofibroză","plural-vocative":"osteofibrozelor"}},{"word":"osteofit","pos":"noun","definitions":["osteophyte"],"forms":{"plural":"osteofite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"osteofit","accusative-definite-nominative-singular":"osteofitul","accusative-indefinite-nominative-plural":"osteofite","accusative-definite-nominative-plural":"osteofitele","dative-genitive-indefinite-singular":"osteofit","dative-definite-genitive-singular":"osteofitului","dative-genitive-indefinite-plural":"osteofite","dative-definite-genitive-plural":"osteofitelor","singular-vocative":"osteofitule","plural-vocative":"osteofitelor"}},{"word":"osteoflebită","pos":"noun","definitions":["osteophlebitis"],"forms":{"plural":"osteoflebite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osteoflebită","accusative-definite-nominative-singular":"osteoflebita","accusative-indefinite-nominative-plural":"osteoflebite","accusative-definite-nominative-plural":"osteoflebitele","dative-genitive-indefinite-singular":"osteoflebite","dative-definite-genitive-singular":"osteoflebitei","dative-genitive-indefinite-plural":"osteoflebite","dative-definite-genitive-plural":"osteoflebitelor","singular-vocative":"osteoflebită","plural-vocative":"osteoflebitelor"}},{"word":"osteofon","pos":"noun","definitions":["osteophone"],"forms":{"plural":"osteofoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"osteofon","accusative-definite-nominative-singular":"osteofonul","accusative-indefinite-nominative-plural":"osteofoane","accusative-definite-nominative-plural":"osteofoanele","dative-genitive-indefinite-singular":"osteofon","dative-definite-genitive-singular":"osteofonului","dative-genitive-indefinite-plural":"osteofoane","dative-definite-genitive-plural":"osteofoanelor","singular-vocative":"osteofonule","plural-vocative":"osteofoanelor"}},{"word":"osteogen","pos":"adj","definitions":["osteogenic"],"forms":{"feminine-singular":"osteogenă","masculine-plural":"osteogeni","feminine-neuter-plural":"osteogene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"osteogen","error-unrecognized-form-feminine-indefinite-singular":"osteogenă","error-unrecognized-form-indefinite-masculine-plural":"osteogeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"osteogene","definite-error-unrecognized-form-masculine-neuter-singular":"osteogenul","definite-error-unrecognized-form-feminine-singular":"osteogena","definite-error-unrecognized-form-masculine-plural":"osteogenii","definite-error-unrecognized-form-feminine-neuter-plural":"osteogenele"}},{"word":"osteogeneză","pos":"noun","definitions":["osteogenesis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osteogeneză","accusative-definite-nominative-singular":"osteogeneza","accusative-indefinite-nominative-plural":"osteogeneze","accusative-definite-nominative-plural":"osteogenezele","dative-genitive-indefinite-singular":"osteogeneze","dative-definite-genitive-singular":"osteogenezei","dative-genitive-indefinite-plural":"osteogeneze","dative-definite-genitive-plural":"osteogenezelor","singular-vocative":"osteogeneză","plural-vocative":"osteogenezelor"}},{"word":"osteogenic","pos":"adj","definitions":["osteogenic"],"forms":{"feminine-singular":"osteogenică","masculine-plural":"osteogenici","feminine-neuter-plural":"osteogenice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"osteogenic","error-unrecognized-form-feminine-indefinite-singular":"osteogenică","error-unrecognized-form-indefinite-masculine-plural":"osteogenici","error-unrecognized-form-feminine-indefinite-neuter-plural":"osteogenice","definite-error-unrecognized-form-masculine-neuter-singular":"osteogenicul","definite-error-unrecognized-form-feminine-singular":"osteogenica","definite-error-unrecognized-form-masculine-plural":"osteogenicii","definite-error-unrecognized-form-feminine-neuter-plural":"osteogenicele"}},{"word":"osteogenie","pos":"noun","definitions":["osteogeny"],"forms":{"plural":"osteogenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"osteogenie","accusative-definite-nominative-singular":"osteogenia","accusative-indefinite-nominative-plural":"osteogenii","accusative-definite-nominative-plural":"osteogeniile","dative-genitive-indefinite-singular":"osteogenii","dative-definite-genitive-singular":"osteogeniei","dative-genitive-indefinite-plural":"osteogenii","dative-definite-genitive-plural":"osteogeniilor","singular-vocative":"osteogenie","plural-vocative":"osteogeniilor"}},{"word":"osteoid","pos":"adj","definitions":["osteoid"],"forms":{"feminine-singular":"osteoidă","masculine-plural":"osteoizi","feminine-neuter-plural":"osteoide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"osteoid","error-unrecognized-form-feminine-indefinite-singular":"osteoidă","error-unrecognized-form-indefinite-masculine-plural":"osteoizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"osteoide","definite-error-unrecognized-form-masculine-neuter-singular":"osteoidul","definite-error-unrecognized-form-feminine-singular":"osteoida","definite-error-unrecognized-form-masculine-plural":"osteoizii","definite-error-unrecognized-form-feminine-neuter-plural":"osteoidele"}},{"word":"osteolit","pos":"noun","definitions":["osteolite"],"forms":{"plural":"osteoliți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"osteolit","accusative-definite-nominative-singular":"osteolitul","accusative-indefinite-nominative-plural":"osteoliți","accusative-definite-nominative-plural":"osteoliții","dative-genitive-indefinite-singular":"osteolit","dative-definite-genitive-singular":"osteolitului","dative-genitive-indefinite-plural":"osteoliți","dative-definite-genitive-plural":"osteoliților","singular-vocative":"osteolitule","plural-vocative":"osteoliților"}},{"word":"osteolog","pos":"noun","definitions":["osteologist"],"forms":{"plural":"osteologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"osteolog","accusative-definite-nominative-singular":"osteologul","accusative-indefinite-nominative-plural":"osteologi","accusative-definite-nominative-plural":"osteologii","dative-genitive-indefinite-singular":"osteolog","dative-definite-genitive-singular":"osteologului","dative-genitive-indefinite-plural":"osteologi","dative-definite-genitive-plural":"osteologilor","singular-vocative":"osteologule","plural-vocative":"osteologilor"}},{"word":"osteologă","pos":"noun","definitions":["female equivalent of osteolog"],"forms":{"plural":"osteologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osteologă","accusative-definite-nominative-singular":"osteologa","accusative-indefinite-nominative-plural":"osteologe","accusative-definite-nominative-plural":"osteologele","dative-genitive-indefinite-singular":"osteologe","dative-definite-genitive-singular":"osteologei","dative-genitive-indefinite-plural":"osteologe","dative-definite-genitive-plural":"osteologelor","singular-vocative":"osteologă","plural-vocative":"osteologelor"}},{"word":"osteologic","pos":"adj","definitions":["osteological"],"forms":{"feminine-singular":"osteologică","masculine-plural":"osteologici","feminine-neuter-plural":"osteologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"osteologic","error-unrecognized-form-feminine-indefinite-singular":"osteologică","error-unrecognized-form-indefinite-masculine-plural":"osteologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"osteologice","definite-error-unrecognized-form-masculine-neuter-singular":"osteologicul","definite-error-unrecognized-form-feminine-singular":"osteologica","definite-error-unrecognized-form-masculine-plural":"osteologicii","definite-error-unrecognized-form-feminine-neuter-plural":"osteologicele"}},{"word":"osteologie","pos":"noun","definitions":["osteology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"osteologie","accusative-definite-nominative":"osteologia","dative-genitive-indefinite":"osteologii","dative-definite-genitive":"osteologiei","vocative":"osteologie"}},{"word":"osteom","pos":"noun","definitions":["osteoma"],"forms":{"plural":"osteoame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"osteom","accusative-definite-nominative-singular":"osteomul","accusative-indefinite-nominative-plural":"osteoame","accusative-definite-nominative-plural":"osteoamele","dative-genitive-indefinite-singular":"osteom","dative-definite-genitive-singular":"osteomului","dative-genitive-indefinite-plural":"osteoame","dative-definite-genitive-plural":"osteoamelor","singular-vocative":"osteomule","plural-vocative":"osteoamelor"}},{"word":"osteomalacie","pos":"noun","definitions":["osteomalacia"],"forms":{"plural":"osteomalacii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"osteomalacie","accusative-definite-nominative-singular":"osteomalacia","accusative-indefinite-nominative-plural":"osteomalacii","accusative-definite-nominative-plural":"osteomalaciile","dative-genitive-indefinite-singular":"osteomalacii","dative-definite-genitive-singular":"osteomalaciei","dative-genitive-indefinite-plural":"osteomalacii","dative-definite-genitive-plural":"osteomalaciilor","singular-vocative":"osteomalacie","plural-vocative":"osteomalaciilor"}},{"word":"osteomielită","pos":"noun","definitions":["osteomyelitis"],"forms":{"plural":"osteomielite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osteomielită","accusative-definite-nominative-singular":"osteomielita","accusative-indefinite-nominative-plural":"osteomielite","accusative-definite-nominative-plural":"osteomielitele","dative-genitive-indefinite-singular":"osteomielite","dative-definite-genitive-singular":"osteomielitei","dative-genitive-indefinite-plural":"osteomielite","dative-definite-genitive-plural":"osteomielitelor","singular-vocative":"osteomielită","plural-vocative":"osteomielitelor"}},{"word":"osteonecroză","pos":"noun","definitions":["osteonecrosis"],"forms":{"plural":"osteonecroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osteonecroză","accusative-definite-nominative-singular":"osteonecroza","accusative-indefinite-nominative-plural":"osteonecroze","accusative-definite-nominative-plural":"osteonecrozele","dative-genitive-indefinite-singular":"osteonecroze","dative-definite-genitive-singular":"osteonecrozei","dative-genitive-indefinite-plural":"osteonecroze","dative-definite-genitive-plural":"osteonecrozelor","singular-vocative":"osteonecroză","plural-vocative":"osteonecrozelor"}},{"word":"osteopatie","pos":"noun","definitions":["osteopathy"],"forms":{"plural":"osteopatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"osteopatie","accusative-definite-nominative-singular":"osteopatia","accusative-indefinite-nominative-plural":"osteopatii","accusative-definite-nominative-plural":"osteopatiile","dative-genitive-indefinite-singular":"osteopatii","dative-definite-genitive-singular":"osteopatiei","dative-genitive-indefinite-plural":"osteopatii","dative-definite-genitive-plural":"osteopatiilor","singular-vocative":"osteopatie","plural-vocative":"osteopatiilor"}},{"word":"osteoperiostită","pos":"noun","definitions":["osteoperiostitis"],"forms":{"plural":"osteoperiostite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osteoperiostită","accusative-definite-nominative-singular":"osteoperiostita","accusative-indefinite-nominative-plural":"osteoperiostite","accusative-definite-nominative-plural":"osteoperiostitele","dative-genitive-indefinite-singular":"osteoperiostite","dative-definite-genitive-singular":"osteoperiostitei","dative-genitive-indefinite-plural":"osteoperiostite","dative-definite-genitive-plural":"osteoperiostitelor","singular-vocative":"osteoperiostită","plural-vocative":"osteoperiostitelor"}},{"word":"osteoplastie","pos":"noun","definitions":["osteoplasty"],"forms":{"plural":"osteoplastii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"osteoplastie","accusative-definite-nominative-singular":"osteoplastia","accusative-indefinite-nominative-plural":"osteoplastii","accusative-definite-nominative-plural":"osteoplastiile","dative-genitive-indefinite-singular":"osteoplastii","dative-definite-genitive-singular":"osteoplastiei","dative-genitive-indefinite-plural":"osteoplastii","dative-definite-genitive-plural":"osteoplastiilor","singular-vocative":"osteoplastie","plural-vocative":"osteoplastiilor"}},{"word":"osteoporoză","pos":"noun","definitions":["osteoporosis"],"forms":{"plural":"osteoporoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osteoporoză","accusative-definite-nominative-singular":"osteoporoza","accusative-indefinite-nominative-plural":"osteoporoze","accusative-definite-nominative-plural":"osteoporozele","dative-genitive-indefinite-singular":"osteoporoze","dative-definite-genitive-singular":"osteoporozei","dative-genitive-indefinite-plural":"osteoporoze","dative-definite-genitive-plural":"osteoporozelor","singular-vocative":"osteoporoză","plural-vocative":"osteoporozelor"}},{"word":"osteosarcom","pos":"noun","definitions":["osteosarcoma"],"forms":{"plural":"osteosarcoame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"osteosarcom","accusative-definite-nominative-singular":"osteosarcomul","accusative-indefinite-nominative-plural":"osteosarcoame","accusative-definite-nominative-plural":"osteosarcoamele","dative-genitive-indefinite-singular":"osteosarcom","dative-definite-genitive-singular":"osteosarcomului","dative-genitive-indefinite-plural":"osteosarcoame","dative-definite-genitive-plural":"osteosarcoamelor","singular-vocative":"osteosarcomule","plural-vocative":"osteosarcoamelor"}},{"word":"osteoscleroză","pos":"noun","definitions":["osteosclerosis"],"forms":{"plural":"osteoscleroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osteoscleroză","accusative-definite-nominative-singular":"osteoscleroza","accusative-indefinite-nominative-plural":"osteoscleroze","accusative-definite-nominative-plural":"osteosclerozele","dative-genitive-indefinite-singular":"osteoscleroze","dative-definite-genitive-singular":"osteosclerozei","dative-genitive-indefinite-plural":"osteoscleroze","dative-definite-genitive-plural":"osteosclerozelor","singular-vocative":"osteoscleroză","plural-vocative":"osteosclerozelor"}},{"word":"osteosinteză","pos":"noun","definitions":["osteosynthesis"],"forms":{"plural":"osteosinteze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osteosinteză","accusative-definite-nominative-singular":"osteosinteza","accusative-indefinite-nominative-plural":"osteosinteze","accusative-definite-nominative-plural":"osteosintezele","dative-genitive-indefinite-singular":"osteosinteze","dative-definite-genitive-singular":"osteosintezei","dative-genitive-indefinite-plural":"osteosinteze","dative-definite-genitive-plural":"osteosintezelor","singular-vocative":"osteosinteză","plural-vocative":"osteosintezelor"}},{"word":"osteotom","pos":"noun","definitions":["osteotome"],"forms":{"plural":"osteotomuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"osteotom","accusative-definite-nominative-singular":"osteotomul","accusative-indefinite-nominative-plural":"osteotomuri","accusative-definite-nominative-plural":"osteotomurile","dative-genitive-indefinite-singular":"osteotom","dative-definite-genitive-singular":"osteotomului","dative-genitive-indefinite-plural":"osteotomuri","dative-definite-genitive-plural":"osteotomurilor","singular-vocative":"osteotomule","plural-vocative":"osteotomurilor"}},{"word":"osteotomie","pos":"noun","definitions":["osteotomy"],"forms":{"plural":"osteotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"osteotomie","accusative-definite-nominative-singular":"osteotomia","accusative-indefinite-nominative-plural":"osteotomii","accusative-definite-nominative-plural":"osteotomiile","dative-genitive-indefinite-singular":"osteotomii","dative-definite-genitive-singular":"osteotomiei","dative-genitive-indefinite-plural":"osteotomii","dative-definite-genitive-plural":"osteotomiilor","singular-vocative":"osteotomie","plural-vocative":"osteotomiilor"}}];
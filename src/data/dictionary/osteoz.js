@@ -0,0 +1 @@
+export default [{"word":"osteoză","pos":"noun","definitions":["osteosis"],"forms":{"plural":"osteoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"osteoză","accusative-definite-nominative-singular":"osteoza","accusative-indefinite-nominative-plural":"osteoze","accusative-definite-nominative-plural":"osteozele","dative-genitive-indefinite-singular":"osteoze","dative-definite-genitive-singular":"osteozei","dative-genitive-indefinite-plural":"osteoze","dative-definite-genitive-plural":"osteozelor","singular-vocative":"osteoză","plural-vocative":"osteozelor"}},{"word":"osterie","pos":"noun","definitions":["inn, bistro"],"forms":{"plural":"osterii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"osterie","accusative-definite-nominative-singular":"osteria","accusative-indefinite-nominative-plural":"osterii","accusative-definite-nominative-plural":"osteriile","dative-genitive-indefinite-singular":"osterii","dative-definite-genitive-singular":"osteriei","dative-genitive-indefinite-plural":"osterii","dative-definite-genitive-plural":"osteriilor","singular-vocative":"osterie","plural-vocative":"osteriilor"}},{"word":"oștesc","pos":"adj","definitions":["military"],"forms":{"feminine-singular":"oștească","plural":"oștești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oștesc","error-unrecognized-form-feminine-indefinite-singular":"oștească","error-unrecognized-form-indefinite-masculine-plural":"oștești","error-unrecognized-form-feminine-indefinite-neuter-plural":"oștești","definite-error-unrecognized-form-masculine-neuter-singular":"oștescul","definite-error-unrecognized-form-feminine-singular":"oșteasca","definite-error-unrecognized-form-masculine-plural":"oșteștii","definite-error-unrecognized-form-feminine-neuter-plural":"oșteștile"}},{"word":"oști","pos":"noun","definitions":["plural of oaste"],"gender":"n-p"},{"word":"oști","pos":"verb","definitions":["to fight in a war"],"forms":{"canonical":"a oști 4th conjugation","present-singular-third-person":"oștește","participle-past":"oștit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a oști","gerund":"oștind","first-person-indicative-present-singular":"oștesc","indicative-present-second-person-singular":"oștești","indicative-present-singular-third-person":"oștește","first-person-indicative-plural-present":"oștim","indicative-plural-present-second-person":"oștiți","indicative-plural-present-third-person":"oștesc","first-person-imperfect-indicative-singular":"oșteam","imperfect-indicative-second-person-singular":"oșteai","imperfect-indicative-singular-third-person":"oștea","first-person-imperfect-indicative-plural":"oșteam","imperfect-indicative-plural-second-person":"oșteați","imperfect-indicative-plural-third-person":"oșteau","first-person-indicative-perfect-singular":"oștii","indicative-perfect-second-person-singular":"oștiși","indicative-perfect-singular-third-person":"oști","first-person-indicative-perfect-plural":"oștirăm","indicative-perfect-plural-second-person":"oștirăți","indicative-perfect-plural-third-person":"oștiră","first-person-indicative-pluperfect-singular":"oștisem","indicative-pluperfect-second-person-singular":"oștiseși","indicative-pluperfect-singular-third-person":"oștise","first-person-indicative-pluperfect-plural":"oștiserăm","indicative-pluperfect-plural-second-person":"oștiserăți","indicative-pluperfect-plural-third-person":"oștiseră","first-person-present-singular-subjunctive":"să oștesc","present-second-person-singular-subjunctive":"să oștești","present-singular-subjunctive-third-person":"să oștească","first-person-plural-present-subjunctive":"să oștim","plural-present-second-person-subjunctive":"să oștiți","plural-present-subjunctive-third-person":"să oștească","imperative-second-person-singular":"oștește","imperative-plural-second-person":"oștiți","imperative-negative-second-person-singular":"nu oști","imperative-negative-plural-second-person":"nu oștiți"}},{"word":"ostic","pos":"adj","definitions":["eastern"],"forms":{"feminine-singular":"ostică","masculine-plural":"ostici","feminine-neuter-plural":"ostice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ostic","error-unrecognized-form-feminine-indefinite-singular":"ostică","error-unrecognized-form-indefinite-masculine-plural":"ostici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ostice","definite-error-unrecognized-form-masculine-neuter-singular":"osticul","definite-error-unrecognized-form-feminine-singular":"ostica","definite-error-unrecognized-form-masculine-plural":"osticii","definite-error-unrecognized-form-feminine-neuter-plural":"osticele"}},{"word":"ostie","pos":"noun","definitions":["obsolete form of osie"],"forms":{"plural":"ostii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ostie","accusative-definite-nominative-singular":"ostia","accusative-indefinite-nominative-plural":"ostii","accusative-definite-nominative-plural":"ostiile","dative-genitive-indefinite-singular":"ostii","dative-definite-genitive-singular":"ostiei","dative-genitive-indefinite-plural":"ostii","dative-definite-genitive-plural":"ostiilor","singular-vocative":"ostie","plural-vocative":"ostiilor"}},{"word":"ostil","pos":"adj","definitions":["hostile"],"forms":{"feminine-singular":"ostilă","masculine-plural":"ostili","feminine-neuter-plural":"ostile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ostil","error-unrecognized-form-feminine-indefinite-singular":"ostilă","error-unrecognized-form-indefinite-masculine-plural":"ostili","error-unrecognized-form-feminine-indefinite-neuter-plural":"ostile","definite-error-unrecognized-form-masculine-neuter-singular":"ostilul","definite-error-unrecognized-form-feminine-singular":"ostila","definite-error-unrecognized-form-masculine-plural":"ostilii","definite-error-unrecognized-form-feminine-neuter-plural":"ostilele"}},{"word":"ostilitate","pos":"noun","definitions":["hostility"],"forms":{"plural":"ostilități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative-singular":"ostilitate","accusative-definite-nominative-singular":"ostilitatea","accusative-indefinite-nominative-plural":"ostilități","accusative-definite-nominative-plural":"ostilitățile","dative-genitive-indefinite-singular":"ostilități","dative-definite-genitive-singular":"ostilității","dative-genitive-indefinite-plural":"ostilități","dative-definite-genitive-plural":"ostilităților","singular-vocative":"ostilitate","plural-vocative":"ostilităților"}},{"word":"oștime","pos":"noun","definitions":["army","crowd"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"oștime","accusative-definite-nominative":"oștimea","dative-genitive-indefinite":"oștimi","dative-definite-genitive":"oștimii","vocative":"oștime"}},{"word":"ostinato","pos":"adv","definitions":["ostinato"]},{"word":"ostinato","pos":"noun","definitions":["ostinato"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ostinato","accusative-definite-nominative":"ostinatoul","dative-genitive-indefinite":"ostinato","dative-definite-genitive":"ostinatoului","vocative":"ostinatoule"}},{"word":"oștinesc","pos":"adj","definitions":["alternative form of oștenesc"],"forms":{"feminine-singular":"oștinească","plural":"oștinești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oștinesc","error-unrecognized-form-feminine-indefinite-singular":"oștinească","error-unrecognized-form-indefinite-masculine-plural":"oștinești","error-unrecognized-form-feminine-indefinite-neuter-plural":"oștinești","definite-error-unrecognized-form-masculine-neuter-singular":"oștinescul","definite-error-unrecognized-form-feminine-singular":"oștineasca","definite-error-unrecognized-form-masculine-plural":"oștineștii","definite-error-unrecognized-form-feminine-neuter-plural":"oștineștile"}},{"word":"ostiolă","pos":"noun","definitions":["ostiola"],"forms":{"plural":"ostiole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ostiolă","accusative-definite-nominative-singular":"ostiola","accusative-indefinite-nominative-plural":"ostiole","accusative-definite-nominative-plural":"ostiolele","dative-genitive-indefinite-singular":"ostiole","dative-definite-genitive-singular":"ostiolei","dative-genitive-indefinite-plural":"ostiole","dative-definite-genitive-plural":"ostiolelor","singular-vocative":"ostiolă","plural-vocative":"ostiolelor"}},{"word":"oștire","pos":"noun","definitions":["army"],"forms":{"plural":"oștiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oștire","accusative-definite-nominative-singular":"oștirea","accusative-indefinite-nominative-plural":"oștiri","accusative-definite-nominative-plural":"oștirile","dative-genitive-indefinite-singular":"oștiri","dative-definite-genitive-singular":"oștirii","dative-genitive-indefinite-plural":"oștiri","dative-definite-genitive-plural":"oștirilor","singular-vocative":"oștire","plural-vocative":"oștirilor"}},{"word":"oștiri","pos":"noun","definitions":["plural of oștire"],"gender":"f-p"},{"word":"oștișoară","pos":"noun","definitions":["diminutive of oaste"],"forms":{"plural":"oștișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oștișoară","accusative-definite-nominative-singular":"oștișoara","accusative-indefinite-nominative-plural":"oștișoare","accusative-definite-nominative-plural":"oștișoarele","dative-genitive-indefinite-singular":"oștișoare","dative-definite-genitive-singular":"oștișoarei","dative-genitive-indefinite-plural":"oștișoare","dative-definite-genitive-plural":"oștișoarelor","singular-vocative":"oștișoară","plural-vocative":"oștișoarelor"}},{"word":"oștitură","pos":"noun","definitions":["army"],"forms":{"plural":"oștituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"oștitură","accusative-definite-nominative-singular":"oștitura","accusative-indefinite-nominative-plural":"oștituri","accusative-definite-nominative-plural":"oștiturile","dative-genitive-indefinite-singular":"oștituri","dative-definite-genitive-singular":"oștiturii","dative-genitive-indefinite-plural":"oștituri","dative-definite-genitive-plural":"oștiturilor","singular-vocative":"oștitură","plural-vocative":"oștiturilor"}},{"word":"ostoi","pos":"verb","definitions":["to soothe","to stop"],"forms":{"canonical":"a ostoi 4th conjugation","present-singular-third-person":"ostoește","participle-past":"ostoit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ostoi","gerund":"ostoind","first-person-indicative-present-singular":"ostoiesc","indicative-present-second-person-singular":"ostoiești","indicative-present-singular-third-person":"ostoiește","first-person-indicative-plural-present":"ostoim","indicative-plural-present-second-person":"ostoiți","indicative-plural-present-third-person":"ostoiesc","first-person-imperfect-indicative-singular":"ostoiam","imperfect-indicative-second-person-singular":"ostoiai","imperfect-indicative-singular-third-person":"ostoia","first-person-imperfect-indicative-plural":"ostoiam","imperfect-indicative-plural-second-person":"ostoiați","imperfect-indicative-plural-third-person":"ostoiau","first-person-indicative-perfect-singular":"ostoii","indicative-perfect-second-person-singular":"ostoiși","indicative-perfect-singular-third-person":"ostoi","first-person-indicative-perfect-plural":"ostoirăm","indicative-perfect-plural-second-person":"ostoirăți","indicative-perfect-plural-third-person":"ostoiră","first-person-indicative-pluperfect-singular":"ostoisem","indicative-pluperfect-second-person-singular":"ostoiseși","indicative-pluperfect-singular-third-person":"ostoise","first-person-indicative-pluperfect-plural":"ostoiserăm","indicative-pluperfect-plural-second-person":"ostoiserăți","indicative-pluperfect-plural-third-person":"ostoiseră","first-person-present-singular-subjunctive":"să ostoiesc","present-second-person-singular-subjunctive":"să ostoiești","present-singular-subjunctive-third-person":"să ostoiască","first-person-plural-present-subjunctive":"să ostoim","plural-present-second-person-subjunctive":"să ostoiți","plural-present-subjunctive-third-person":"să ostoiască","imperative-second-person-singular":"ostoiește","imperative-plural-second-person":"ostoiți","imperative-negative-second-person-singular":"nu ostoi","imperative-negative-plural-second-person":"nu ostoiți"}},{"word":"ostoia","pos":"verb","definitions":["alternative form of ostoi"],"forms":{"canonical":"a ostoia 1st conjugation","present-singular-third-person":"ostoiază","participle-past":"ostoiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ostoia","gerund":"ostoind","first-person-indicative-present-singular":"ostoiez","indicative-present-second-person-singular":"ostoiezi","indicative-present-singular-third-person":"ostoiază","first-person-indicative-plural-present":"ostoiem","indicative-plural-present-second-person":"ostoiați","indicative-plural-present-third-person":"ostoiază","first-person-imperfect-indicative-singular":"ostoiam","imperfect-indicative-second-person-singular":"ostoiai","imperfect-indicative-singular-third-person":"ostoia","first-person-imperfect-indicative-plural":"ostoiam","imperfect-indicative-plural-second-person":"ostoiați","imperfect-indicative-plural-third-person":"ostoiau","first-person-indicative-perfect-singular":"ostoiai","indicative-perfect-second-person-singular":"ostoiași","indicative-perfect-singular-third-person":"ostoie","first-person-indicative-perfect-plural":"ostoiarăm","indicative-perfect-plural-second-person":"ostoiarăți","indicative-perfect-plural-third-person":"ostoiară","first-person-indicative-pluperfect-singular":"ostoiasem","indicative-pluperfect-second-person-singular":"ostoiaseși","indicative-pluperfect-singular-third-person":"ostoiase","first-person-indicative-pluperfect-plural":"ostoiaserăm","indicative-pluperfect-plural-second-person":"ostoiaserăți","indicative-pluperfect-plural-third-person":"ostoiaseră","first-person-present-singular-subjunctive":"să ostoiez","present-second-person-singular-subjunctive":"să ostoiezi","present-singular-subjunctive-third-person":"să ostoieze","first-person-plural-present-subjunctive":"să ostoiem","plural-present-second-person-subjunctive":"să ostoiați","plural-present-subjunctive-third-person":"să ostoieze","imperative-second-person-singular":"ostoiază","imperative-plural-second-person":"ostoiați","imperative-negative-second-person-singular":"nu ostoia","imperative-negative-plural-second-person":"nu ostoiați"}},{"word":"ostoire","pos":"noun","definitions":["soothing, calming"],"forms":{"plural":"ostoiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ostoire","accusative-definite-nominative-singular":"ostoirea","accusative-indefinite-nominative-plural":"ostoiri","accusative-definite-nominative-plural":"ostoirile","dative-genitive-indefinite-singular":"ostoiri","dative-definite-genitive-singular":"ostoirii","dative-genitive-indefinite-plural":"ostoiri","dative-definite-genitive-plural":"ostoirilor","singular-vocative":"ostoire","plural-vocative":"ostoirilor"}},{"word":"ostoit","pos":"adj","definitions":["attenuated"],"forms":{"feminine-singular":"ostoită","masculine-plural":"ostoiți","feminine-neuter-plural":"ostoite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ostoit","error-unrecognized-form-feminine-indefinite-singular":"ostoită","error-unrecognized-form-indefinite-masculine-plural":"ostoiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ostoite","definite-error-unrecognized-form-masculine-neuter-singular":"ostoitul","definite-error-unrecognized-form-feminine-singular":"ostoita","definite-error-unrecognized-form-masculine-plural":"ostoiții","definite-error-unrecognized-form-feminine-neuter-plural":"ostoitele"}},{"word":"ostoit","pos":"verb","definitions":["past participle of ostoi"],"forms":{"participle-past":"of ostoi"}},{"word":"ostoitor","pos":"adj","definitions":["calming"],"forms":{"feminine-singular":"ostoitoare","masculine-plural":"ostoitori","feminine-neuter-plural":"ostoitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ostoitor","error-unrecognized-form-feminine-indefinite-singular":"ostoitoare","error-unrecognized-form-indefinite-masculine-plural":"ostoitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"ostoitoare","definite-error-unrecognized-form-masculine-neuter-singular":"ostoitorul","definite-error-unrecognized-form-feminine-singular":"ostoitoarea","definite-error-unrecognized-form-masculine-plural":"ostoitorii","definite-error-unrecognized-form-feminine-neuter-plural":"ostoitoarele"}},{"word":"Ostra","pos":"name","definitions":["a commune of Suceava County, Romania","a village in Ostra, Suceava County, Romania"],"gender":"f"},{"word":"ostrac","pos":"noun","definitions":["shell","shard"],"forms":{"plural":"ostrace","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ostrac","accusative-definite-nominative-singular":"ostracul","accusative-indefinite-nominative-plural":"ostrace","accusative-definite-nominative-plural":"ostracele","dative-genitive-indefinite-singular":"ostrac","dative-definite-genitive-singular":"ostracului","dative-genitive-indefinite-plural":"ostrace","dative-definite-genitive-plural":"ostracelor","singular-vocative":"ostracule","plural-vocative":"ostracelor"}},{"word":"ostracă","pos":"noun","definitions":["oyster"],"forms":{"plural":"ostrace","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ostracă","accusative-definite-nominative-singular":"ostraca","accusative-indefinite-nominative-plural":"ostrace","accusative-definite-nominative-plural":"ostracele","dative-genitive-indefinite-singular":"ostrace","dative-definite-genitive-singular":"ostracei","dative-genitive-indefinite-plural":"ostrace","dative-definite-genitive-plural":"ostracelor","singular-vocative":"ostracă","plural-vocative":"ostracelor"}},{"word":"ostracism","pos":"noun","definitions":["ostracism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ostracism","accusative-definite-nominative":"ostracismul","dative-genitive-indefinite":"ostracism","dative-definite-genitive":"ostracismului","vocative":"ostracismule"}},{"word":"ostracită","pos":"noun","definitions":["ostracite"],"forms":{"plural":"ostracite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ostracită","accusative-definite-nominative-singular":"ostracita","accusative-indefinite-nominative-plural":"ostracite","accusative-definite-nominative-plural":"ostracitele","dative-genitive-indefinite-singular":"ostracite","dative-definite-genitive-singular":"ostracitei","dative-genitive-indefinite-plural":"ostracite","dative-definite-genitive-plural":"ostracitelor","singular-vocative":"ostracită","plural-vocative":"ostracitelor"}},{"word":"ostraciza","pos":"verb","definitions":["to ostracize"],"forms":{"canonical":"a ostraciza 1st conjugation","present-singular-third-person":"ostracizează","participle-past":"ostracizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ostraciza","gerund":"ostracizând","first-person-indicative-present-singular":"ostracizez","indicative-present-second-person-singular":"ostracizezi","indicative-present-singular-third-person":"ostracizează","first-person-indicative-plural-present":"ostracizăm","indicative-plural-present-second-person":"ostracizați","indicative-plural-present-third-person":"ostracizează","first-person-imperfect-indicative-singular":"ostracizam","imperfect-indicative-second-person-singular":"ostracizai","imperfect-indicative-singular-third-person":"ostraciza","first-person-imperfect-indicative-plural":"ostracizam","imperfect-indicative-plural-second-person":"ostracizați","imperfect-indicative-plural-third-person":"ostracizau","first-person-indicative-perfect-singular":"ostracizai","indicative-perfect-second-person-singular":"ostracizași","indicative-perfect-singular-third-person":"ostraciză","first-person-indicative-perfect-plural":"ostracizarăm","indicative-perfect-plural-second-person":"ostracizarăți","indicative-perfect-plural-third-person":"ostracizară","first-person-indicative-pluperfect-singular":"ostracizasem","indicative-pluperfect-second-person-singular":"ostracizaseși","indicative-pluperfect-singular-third-person":"ostracizase","first-person-indicative-pluperfect-plural":"ostracizaserăm","indicative-pluperfect-plural-second-person":"ostracizaserăți","indicative-pluperfect-plural-third-person":"ostracizaseră","first-person-present-singular-subjunctive":"să ostracizez","present-second-person-singular-subjunctive":"să ostracizezi","present-singular-subjunctive-third-person":"să ostracizeze","first-person-plural-present-subjunctive":"să ostracizăm","plural-present-second-person-subjunctive":"să ostracizați","plural-present-subjunctive-third-person":"să ostracizeze","imperative-second-person-singular":"ostracizează","imperative-plural-second-person":"ostracizați","imperative-negative-second-person-singular":"nu ostraciza","imperative-negative-plural-second-person":"nu ostracizați"}},{"word":"ostracizare","pos":"noun","definitions":["ostracization"],"forms":{"plural":"ostracizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ostracizare","accusative-definite-nominative-singular":"ostracizarea","accusative-indefinite-nominative-plural":"ostracizări","accusative-definite-nominative-plural":"ostracizările","dative-genitive-indefinite-singular":"ostracizări","dative-definite-genitive-singular":"ostracizării","dative-genitive-indefinite-plural":"ostracizări","dative-definite-genitive-plural":"ostracizărilor","singular-vocative":"ostracizare","plural-vocative":"ostracizărilor"}},{"word":"ostracod","pos":"noun","definitions":["ostracod"],"forms":{"plural":"ostracode","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ostracod","accusative-definite-nominative-singular":"ostracodul","accusative-indefinite-nominative-plural":"ostracode","accusative-definite-nominative-plural":"ostracodele","dative-genitive-indefinite-singular":"ostracod","dative-definite-genitive-singular":"ostracodului","dative-genitive-indefinite-plural":"ostracode","dative-definite-genitive-plural":"ostracodelor","singular-vocative":"ostracodule","plural-vocative":"ostracodelor"}},{"word":"ostracoderm","pos":"noun","definitions":["ostracoderm"],"forms":{"plural":"ostracodermi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ostracoderm","accusative-definite-nominative-singular":"ostracodermul","accusative-indefinite-nominative-plural":"ostracodermi","accusative-definite-nominative-plural":"ostracodermii","dative-genitive-indefinite-singular":"ostracoderm","dative-definite-genitive-singular":"ostracodermului","dative-genitive-indefinite-plural":"ostracodermi","dative-definite-genitive-plural":"ostracodermilor","singular-vocative":"ostracodermule","plural-vocative":"ostracodermilor"}},{"word":"ostracon","pos":"noun","definitions":["ostracon"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ostracon","accusative-definite-nominative":"ostraconul","dative-genitive-indefinite":"ostracon","dative-definite-genitive":"ostraconului","vocative":"ostraconule"}},{"word":"Ostratu","pos":"name","definitions":["a village in Corbeanca, Ilfov County, Romania"],"gender":"m"},{"word":"ostreicol","pos":"adj","definitions":["oyster"],"forms":{"feminine-singular":"ostreicolă","masculine-plural":"ostreicoli","feminine-neuter-plural":"ostreicole","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ostreicol","error-unrecognized-form-feminine-indefinite-singular":"ostreicolă","error-unrecognized-form-indefinite-masculine-plural":"ostreicoli","error-unrecognized-form-feminine-indefinite-neuter-plural":"ostreicole","definite-error-unrecognized-form-masculine-neuter-singular":"ostreicolul","definite-error-unrecognized-form-feminine-singular":"ostreicola","definite-error-unrecognized-form-masculine-plural":"ostreicolii","definite-error-unrecognized-form-feminine-neuter-plural":"ostreicolele"}},{"word":"ostreicultor","pos":"noun","definitions":["oyster farmer"],"forms":{"plural":"ostreicultori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ostreicultor","accusative-definite-nominative-singular":"ostreicultorul","accusative-indefinite-nominative-plural":"ostreicultori","accusative-definite-nominative-plural":"ostreicultorii","dative-genitive-indefinite-singular":"ostreicultor","dative-definite-genitive-singular":"ostreicultorului","dative-genitive-indefinite-plural":"ostreicultori","dative-definite-genitive-plural":"ostreicultorilor","singular-vocative":"ostreicultorule","plural-vocative":"ostreicultorilor"}},{"word":"ostreicultură","pos":"noun","definitions":["oyster farming"],"forms":{"plural":"ostreiculturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ostreicultură","accusative-definite-nominative-singular":"ostreicultura","accusative-indefinite-nominative-plural":"ostreiculturi","accusative-definite-nominative-plural":"ostreiculturile","dative-genitive-indefinite-singular":"ostreiculturi","dative-definite-genitive-singular":"ostreiculturii","dative-genitive-indefinite-plural":"ostreiculturi","dative-definite-genitive-plural":"ostreiculturilor","singular-vocative":"ostreicultură","plural-vocative":"ostreiculturilor"}},{"word":"ostrică","pos":"noun","definitions":["oyster"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"ostrică","accusative-definite-nominative":"ostrica","dative-genitive-indefinite":"ostrice","dative-definite-genitive":"ostricei","vocative":"ostrică"}},{"word":"Ostriceanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ostriceanu"}},{"word":"ostrogot","pos":"noun","definitions":["Ostrogoth"],"pronunciation":"/os.troˈɡot/","forms":{"plural":"ostrogoți","feminine":"equivalent ostrogotă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ostrogot","accusative-definite-nominative-singular":"ostrogotul","accusative-indefinite-nominative-plural":"ostrogoți","accusative-definite-nominative-plural":"ostrogoții","dative-genitive-indefinite-singular":"ostrogot","dative-definite-genitive-singular":"ostrogotului","dative-genitive-indefinite-plural":"ostrogoți","dative-definite-genitive-plural":"ostrogoților","singular-vocative":"ostrogotule","plural-vocative":"ostrogoților"}},{"word":"ostrogot","pos":"adj","definitions":["Ostrogothic"],"pronunciation":"/os.troˈɡot/","forms":{"feminine-singular":"ostrogotă","masculine-plural":"ostrogoți","feminine-neuter-plural":"ostrogote","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ostrogot","error-unrecognized-form-feminine-indefinite-singular":"ostrogotă","error-unrecognized-form-indefinite-masculine-plural":"ostrogoți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ostrogote","definite-error-unrecognized-form-masculine-neuter-singular":"ostrogotul","definite-error-unrecognized-form-feminine-singular":"ostrogota","definite-error-unrecognized-form-masculine-plural":"ostrogoții","definite-error-unrecognized-form-feminine-neuter-plural":"ostrogotele"}},{"word":"ostrogotă","pos":"noun","definitions":["female equivalent of ostrogot"],"forms":{"plural":"ostrogote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ostrogotă","accusative-definite-nominative-singular":"ostrogota","accusative-indefinite-nominative-plural":"ostrogote","accusative-definite-nominative-plural":"ostrogotele","dative-genitive-indefinite-singular":"ostrogote","dative-definite-genitive-singular":"ostrogotei","dative-genitive-indefinite-plural":"ostrogote","dative-definite-genitive-plural":"ostrogotelor","singular-vocative":"ostrogotă","plural-vocative":"ostrogotelor"}},{"word":"ostrogotic","pos":"adj","definitions":["Ostrogothic"],"forms":{"feminine-singular":"ostrogotică","masculine-plural":"ostrogotici","feminine-neuter-plural":"ostrogotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ostrogotic","error-unrecognized-form-feminine-indefinite-singular":"ostrogotică","error-unrecognized-form-indefinite-masculine-plural":"ostrogotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ostrogotice","definite-error-unrecognized-form-masculine-neuter-singular":"ostrogoticul","definite-error-unrecognized-form-feminine-singular":"ostrogotica","definite-error-unrecognized-form-masculine-plural":"ostrogoticii","definite-error-unrecognized-form-feminine-neuter-plural":"ostrogoticele"}},{"word":"ostrogotic","pos":"noun","definitions":["Ostrogoth"],"forms":{"plural":"ostrogotici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ostrogotic","accusative-definite-nominative-singular":"ostrogoticul","accusative-indefinite-nominative-plural":"ostrogotici","accusative-definite-nominative-plural":"ostrogoticii","dative-genitive-indefinite-singular":"ostrogotic","dative-definite-genitive-singular":"ostrogoticului","dative-genitive-indefinite-plural":"ostrogotici","dative-definite-genitive-plural":"ostrogoticilor","singular-vocative":"ostrogoticule","plural-vocative":"ostrogoticilor"}},{"word":"ostropăț","pos":"noun","definitions":["alternative form of ostropeț"],"forms":{"plural":"ostropățuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ostropăț","accusative-definite-nominative-singular":"ostropățul","accusative-indefinite-nominative-plural":"ostropățuri","accusative-definite-nominative-plural":"ostropățurile","dative-genitive-indefinite-singular":"ostropăț","dative-definite-genitive-singular":"ostropățului","dative-genitive-indefinite-plural":"ostropățuri","dative-definite-genitive-plural":"ostropățurilor","singular-vocative":"ostropățule","plural-vocative":"ostropățurilor"}},{"word":"ostropel","pos":"noun","definitions":["a kind of a meat stew with sauce"],"forms":{"plural":"ostropeluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ostropel","accusative-definite-nominative-singular":"ostropelul","accusative-indefinite-nominative-plural":"ostropeluri","accusative-definite-nominative-plural":"ostropelurile","dative-genitive-indefinite-singular":"ostropel","dative-definite-genitive-singular":"ostropelului","dative-genitive-indefinite-plural":"ostropeluri","dative-definite-genitive-plural":"ostropelurilor","singular-vocative":"ostropelule","plural-vocative":"ostropelurilor"}},{"word":"Ostrov","pos":"name","definitions":["a village in Birchiș, Arad County, Romania","a commune of Constanța County, Romania","a village in Ostrov, Constanța County, Romania","a village in Râu de Mori, Hunedoara County, Romania","a village in Osica de Sus, Olt County, Romania"],"gender":"m"},{"word":"ostrov","pos":"noun","definitions":["ait (island in a river)","island (in general)"],"forms":{"plural":"ostroave","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ostrov","accusative-definite-nominative-singular":"ostrovul","accusative-indefinite-nominative-plural":"ostroave","accusative-definite-nominative-plural":"ostroavele","dative-genitive-indefinite-singular":"ostrov","dative-definite-genitive-singular":"ostrovului","dative-genitive-indefinite-plural":"ostroave","dative-definite-genitive-plural":"ostroavelor","singular-vocative":"ostrovule","plural-vocative":"ostroavelor"}},{"word":"ostrov plutitor","pos":"noun","definitions":["floating island"]},{"word":"Ostrovanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ostrovanu"}},{"word":"ostrovaș","pos":"noun","definitions":["diminutive of ostrov"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ostrovaș","accusative-definite-nominative":"ostrovașul","dative-genitive-indefinite":"ostrovaș","dative-definite-genitive":"ostrovașului","vocative":"ostrovașule"}},{"word":"ostrovean","pos":"adj","definitions":["related to an island"],"forms":{"feminine-singular":"ostroveană","masculine-plural":"ostroveni","feminine-neuter-plural":"ostrovene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ostrovean","error-unrecognized-form-feminine-indefinite-singular":"ostroveană","error-unrecognized-form-indefinite-masculine-plural":"ostroveni","error-unrecognized-form-feminine-indefinite-neuter-plural":"ostrovene","definite-error-unrecognized-form-masculine-neuter-singular":"ostroveanul","definite-error-unrecognized-form-feminine-singular":"ostroveana","definite-error-unrecognized-form-masculine-plural":"ostrovenii","definite-error-unrecognized-form-feminine-neuter-plural":"ostrovenele"}},{"word":"ostrovean","pos":"noun","definitions":["islander"],"forms":{"plural":"ostroveni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ostrovean","accusative-definite-nominative-singular":"ostroveanul","accusative-indefinite-nominative-plural":"ostroveni","accusative-definite-nominative-plural":"ostrovenii","dative-genitive-indefinite-singular":"ostrovean","dative-definite-genitive-singular":"ostroveanului","dative-genitive-indefinite-plural":"ostroveni","dative-definite-genitive-plural":"ostrovenilor","singular-vocative":"ostroveanule","plural-vocative":"ostrovenilor"}},{"word":"ostroveană","pos":"noun","definitions":["female equivalent of ostrovean"],"forms":{"plural":"ostrovene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ostroveană","accusative-definite-nominative-singular":"ostroveana","accusative-indefinite-nominative-plural":"ostrovene","accusative-definite-nominative-plural":"ostrovenele","dative-genitive-indefinite-singular":"ostrovene","dative-definite-genitive-singular":"ostrovenei","dative-genitive-indefinite-plural":"ostrovene","dative-definite-genitive-plural":"ostrovenelor","singular-vocative":"ostroveană","plural-vocative":"ostrovenelor"}},{"word":"ostroveancă","pos":"noun","definitions":["female equivalent of ostrovean"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"ostroveancă","accusative-definite-nominative":"ostroveanca","dative-genitive-indefinite":"ostrovence","dative-definite-genitive":"ostrovencei","vocative":"ostroveancă"}},{"word":"Ostroveanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ostroveanu"}},{"word":"Ostrovel","pos":"name","definitions":["a village in Râu de Mori, Hunedoara County, Romania"],"gender":"m"},{"word":"ostrovel","pos":"noun","definitions":["diminutive of ostrov; small island"],"forms":{"plural":"ostrovele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ostrovel","accusative-definite-nominative-singular":"ostrovelul","accusative-indefinite-nominative-plural":"ostrovele","accusative-definite-nominative-plural":"ostrovelele","dative-genitive-indefinite-singular":"ostrovel","dative-definite-genitive-singular":"ostrovelului","dative-genitive-indefinite-plural":"ostrovele","dative-definite-genitive-plural":"ostrovelelor","singular-vocative":"ostrovelule","plural-vocative":"ostrovelelor"}},{"word":"Ostroveni","pos":"name","definitions":["a commune of Dolj County, Romania","a village in Ostroveni, Dolj County, Romania","a village in Galicea, Vâlcea County, Romania"],"gender":"m"},{"word":"Ostrovu","pos":"name","definitions":["a village in Valea Argovei, Călărași County, Romania","a village in Aluniș, Prahova County, Romania"],"gender":"m"},{"word":"Ostrovu Corbului","pos":"name","definitions":["a village in Hinova, Mehedinți County, Romania"],"gender":"m"},{"word":"Ostrovu Mare","pos":"name","definitions":["a village in Gogoșu, Mehedinți County, Romania"],"gender":"m"},{"word":"Ostrovu Mic","pos":"name","definitions":["a village in Râu de Mori, Hunedoara County, Romania"],"gender":"m"},{"word":"Ostrovu Tătaru","pos":"name","definitions":["a village in Chilia Veche, Tulcea County, Romania"],"gender":"m"},{"word":"ostrovul","pos":"noun","definitions":["definite nominative/accusative singular of ostrov"]},{"word":"ostrovuleț","pos":"noun","definitions":["diminutive of ostrov"],"forms":{"plural":"ostrovulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ostrovuleț","accusative-definite-nominative-singular":"ostrovulețul","accusative-indefinite-nominative-plural":"ostrovulețe","accusative-definite-nominative-plural":"ostrovulețele","dative-genitive-indefinite-singular":"ostrovuleț","dative-definite-genitive-singular":"ostrovulețului","dative-genitive-indefinite-plural":"ostrovulețe","dative-definite-genitive-plural":"ostrovulețelor","singular-vocative":"ostrovulețule","plural-vocative":"ostrovulețelor"}},{"word":"ostrovuț","pos":"noun","definitions":["diminutive of ostrov; small island"],"forms":{"plural":"ostrovuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ostrovuț","accusative-definite-nominative-singular":"ostrovuțul","accusative-indefinite-nominative-plural":"ostrovuțe","accusative-definite-nominative-plural":"ostrovuțele","dative-genitive-indefinite-singular":"ostrovuț","dative-definite-genitive-singular":"ostrovuțului","dative-genitive-indefinite-plural":"ostrovuțe","dative-definite-genitive-plural":"ostrovuțelor","singular-vocative":"ostrovuțule","plural-vocative":"ostrovuțelor"}},{"word":"osu","pos":"noun","definitions":["eye dialect spelling of osul","archaic spelling of osul","nonstandard spelling of osul"],"pronunciation":"/ˈo.su/","gender":"n"},{"word":"osuar","pos":"noun","definitions":["ossuary"],"pronunciation":"/o.suˈar/","forms":{"plural":"osuare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"osuar","accusative-definite-nominative-singular":"osuarul","accusative-indefinite-nominative-plural":"osuare","accusative-definite-nominative-plural":"osuarele","dative-genitive-indefinite-singular":"osuar","dative-definite-genitive-singular":"osuarului","dative-genitive-indefinite-plural":"osuare","dative-definite-genitive-plural":"osuarelor","singular-vocative":"osuarule","plural-vocative":"osuarelor","alternative":"osuariu"}},{"word":"osuariu","pos":"noun","definitions":["alternative form of osuar"],"forms":{"plural":"osuarii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"osuariu","accusative-definite-nominative-singular":"osuariuul","accusative-indefinite-nominative-plural":"osuarii","accusative-definite-nominative-plural":"osuariile","dative-genitive-indefinite-singular":"osuariu","dative-definite-genitive-singular":"osuariuului","dative-genitive-indefinite-plural":"osuarii","dative-definite-genitive-plural":"osuariilor","singular-vocative":"osuariuule","plural-vocative":"osuariilor"}},{"word":"osuc","pos":"noun","definitions":["diminutive of os"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"osuc","accusative-definite-nominative":"osucul","dative-genitive-indefinite":"osuc","dative-definite-genitive":"osucului","vocative":"osucule"}},{"word":"osul","pos":"noun","definitions":["definite nominative/accusative singular of os"],"gender":"n"},{"word":"osul iepurelui","pos":"noun","definitions":["spiny restharrow (Ononis spinosa)"]},{"word":"osușor","pos":"noun","definitions":["diminutive of os"],"forms":{"plural":"osușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"osușor","accusative-definite-nominative-singular":"osușorul","accusative-indefinite-nominative-plural":"osușoare","accusative-definite-nominative-plural":"osușoarele","dative-genitive-indefinite-singular":"osușor","dative-definite-genitive-singular":"osușorului","dative-genitive-indefinite-plural":"osușoare","dative-definite-genitive-plural":"osușoarelor","singular-vocative":"osușorule","plural-vocative":"osușoarelor"}},{"word":"osuț","pos":"noun","definitions":["diminutive of os; small bone"],"forms":{"plural":"osuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"osuț","accusative-definite-nominative-singular":"osuțul","accusative-indefinite-nominative-plural":"osuțe","accusative-definite-nominative-plural":"osuțele","dative-genitive-indefinite-singular":"osuț","dative-definite-genitive-singular":"osuțului","dative-genitive-indefinite-plural":"osuțe","dative-definite-genitive-plural":"osuțelor","singular-vocative":"osuțule","plural-vocative":"osuțelor"}},{"word":"osveti","pos":"verb","definitions":["to sanctify"],"forms":{"canonical":"a osveti 4th conjugation","present-singular-third-person":"osvetește","participle-past":"osvetit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a osveti","gerund":"osvetind","first-person-indicative-present-singular":"osvetesc","indicative-present-second-person-singular":"osvetești","indicative-present-singular-third-person":"osvetește","first-person-indicative-plural-present":"osvetim","indicative-plural-present-second-person":"osvetiți","indicative-plural-present-third-person":"osvetesc","first-person-imperfect-indicative-singular":"osveteam","imperfect-indicative-second-person-singular":"osveteai","imperfect-indicative-singular-third-person":"osvetea","first-person-imperfect-indicative-plural":"osveteam","imperfect-indicative-plural-second-person":"osveteați","imperfect-indicative-plural-third-person":"osveteau","first-person-indicative-perfect-singular":"osvetii","indicative-perfect-second-person-singular":"osvetiși","indicative-perfect-singular-third-person":"osveti","first-person-indicative-perfect-plural":"osvetirăm","indicative-perfect-plural-second-person":"osvetirăți","indicative-perfect-plural-third-person":"osvetiră","first-person-indicative-pluperfect-singular":"osvetisem","indicative-pluperfect-second-person-singular":"osvetiseși","indicative-pluperfect-singular-third-person":"osvetise","first-person-indicative-pluperfect-plural":"osvetiserăm","indicative-pluperfect-plural-second-person":"osvetiserăți","indicative-pluperfect-plural-third-person":"osvetiseră","first-person-present-singular-subjunctive":"să osvetesc","present-second-person-singular-subjunctive":"să osvetești","present-singular-subjunctive-third-person":"să osvetească","first-person-plural-present-subjunctive":"să osvetim","plural-present-second-person-subjunctive":"să osvetiți","plural-present-subjunctive-third-person":"să osvetească","imperative-second-person-singular":"osvetește","imperative-plural-second-person":"osvetiți","imperative-negative-second-person-singular":"nu osveti","imperative-negative-plural-second-person":"nu osvetiți"}},{"word":"OT","pos":"name","definitions":["abbreviation of Olt: a county of Romania"]},{"word":"Otac","pos":"name","definitions":["a village in Otac, Rezina Raion, Moldova","a commune of Rezina Raion, Moldova"],"gender":"m"},{"word":"otac","pos":"noun","definitions":["fenced area for animals","temporary hut for agricultural workers, fishers, animal herders"],"forms":{"plural":"otace","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"otac","accusative-definite-nominative-singular":"otacul","accusative-indefinite-nominative-plural":"otace","accusative-definite-nominative-plural":"otacele","dative-genitive-indefinite-singular":"otac","dative-definite-genitive-singular":"otacului","dative-genitive-indefinite-plural":"otace","dative-definite-genitive-plural":"otacelor","singular-vocative":"otacule","plural-vocative":"otacelor"}},{"word":"Otaci","pos":"name","definitions":["a town in Ocnița Raion, Moldova"],"gender":"m"},{"word":"otagiu","pos":"noun","definitions":["alternative form of otaj"],"forms":{"plural":"otagiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"otagiu","accusative-definite-nominative-singular":"otagiul","accusative-indefinite-nominative-plural":"otagiuri","accusative-definite-nominative-plural":"otagiurile","dative-genitive-indefinite-singular":"otagiu","dative-definite-genitive-singular":"otagiului","dative-genitive-indefinite-plural":"otagiuri","dative-definite-genitive-plural":"otagiurilor","singular-vocative":"otagiule","plural-vocative":"otagiurilor"}},{"word":"otaj","pos":"noun","definitions":["hostage"],"forms":{"plural":"otaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"otaj","accusative-definite-nominative-singular":"otajul","accusative-indefinite-nominative-plural":"otaje","accusative-definite-nominative-plural":"otajele","dative-genitive-indefinite-singular":"otaj","dative-definite-genitive-singular":"otajului","dative-genitive-indefinite-plural":"otaje","dative-definite-genitive-plural":"otajelor","singular-vocative":"otajule","plural-vocative":"otajelor"}},{"word":"otalgic","pos":"adj","definitions":["otalgic"],"forms":{"feminine-singular":"otalgică","masculine-plural":"otalgici","feminine-neuter-plural":"otalgice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"otalgic","error-unrecognized-form-feminine-indefinite-singular":"otalgică","error-unrecognized-form-indefinite-masculine-plural":"otalgici","error-unrecognized-form-feminine-indefinite-neuter-plural":"otalgice","definite-error-unrecognized-form-masculine-neuter-singular":"otalgicul","definite-error-unrecognized-form-feminine-singular":"otalgica","definite-error-unrecognized-form-masculine-plural":"otalgicii","definite-error-unrecognized-form-feminine-neuter-plural":"otalgicele"}},{"word":"otalgie","pos":"noun","definitions":["otalgia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"otalgie","accusative-definite-nominative":"otalgia","dative-genitive-indefinite":"otalgii","dative-definite-genitive":"otalgiei","vocative":"otalgie"}},{"word":"otalm","pos":"noun","definitions":["protection, shelter, safeguard"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"otalm","accusative-definite-nominative":"otalmul","dative-genitive-indefinite":"otalm","dative-definite-genitive":"otalmului","vocative":"otalmule"}},{"word":"otânjeală","pos":"noun","definitions":["a beating"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"otânjeală","accusative-definite-nominative":"otânjeala","dative-genitive-indefinite":"otânjeale","dative-definite-genitive":"otânjealei","vocative":"otânjeală"}},{"word":"otânji","pos":"verb","definitions":["to hit someone"],"forms":{"canonical":"a otânji 4th conjugation","present-singular-third-person":"otânjește","participle-past":"otânjit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a otânji","gerund":"otânjind","first-person-indicative-present-singular":"otânjesc","indicative-present-second-person-singular":"otânjești","indicative-present-singular-third-person":"otânjește","first-person-indicative-plural-present":"otânjim","indicative-plural-present-second-person":"otânjiți","indicative-plural-present-third-person":"otânjesc","first-person-imperfect-indicative-singular":"otânjeam","imperfect-indicative-second-person-singular":"otânjeai","imperfect-indicative-singular-third-person":"otânjea","first-person-imperfect-indicative-plural":"otânjeam","imperfect-indicative-plural-second-person":"otânjeați","imperfect-indicative-plural-third-person":"otânjeau","first-person-indicative-perfect-singular":"otânjii","indicative-perfect-second-person-singular":"otânjiși","indicative-perfect-singular-third-person":"otânji","first-person-indicative-perfect-plural":"otânjirăm","indicative-perfect-plural-second-person":"otânjirăți","indicative-perfect-plural-third-person":"otânjiră","first-person-indicative-pluperfect-singular":"otânjisem","indicative-pluperfect-second-person-singular":"otânjiseși","indicative-pluperfect-singular-third-person":"otânjise","first-person-indicative-pluperfect-plural":"otânjiserăm","indicative-pluperfect-plural-second-person":"otânjiserăți","indicative-pluperfect-plural-third-person":"otânjiseră","first-person-present-singular-subjunctive":"să otânjesc","present-second-person-singular-subjunctive":"să otânjești","present-singular-subjunctive-third-person":"să otânjească","first-person-plural-present-subjunctive":"să otânjim","plural-present-second-person-subjunctive":"să otânjiți","plural-present-subjunctive-third-person":"să otânjească","imperative-second-person-singular":"otânjește","imperative-plural-second-person":"otânjiți","imperative-negative-second-person-singular":"nu otânji","imperative-negative-plural-second-person":"nu otânjiți"}},{"word":"oțărâre","pos":"noun","definitions":["fury"],"forms":{"plural":"oțărâri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oțărâre","accusative-definite-nominative-singular":"oțărârea","accusative-indefinite-nominative-plural":"oțărâri","accusative-definite-nominative-plural":"oțărârile","dative-genitive-indefinite-singular":"oțărâri","dative-definite-genitive-singular":"oțărârii","dative-genitive-indefinite-plural":"oțărâri","dative-definite-genitive-plural":"oțărârilor","singular-vocative":"oțărâre","plural-vocative":"oțărârilor"}},{"word":"oțărât","pos":"adj","definitions":["angry"],"forms":{"feminine-singular":"oțărâtă","masculine-plural":"oțărâți","feminine-neuter-plural":"oțărâte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oțărât","error-unrecognized-form-feminine-indefinite-singular":"oțărâtă","error-unrecognized-form-indefinite-masculine-plural":"oțărâți","error-unrecognized-form-feminine-indefinite-neuter-plural":"oțărâte","definite-error-unrecognized-form-masculine-neuter-singular":"oțărâtul","definite-error-unrecognized-form-feminine-singular":"oțărâta","definite-error-unrecognized-form-masculine-plural":"oțărâții","definite-error-unrecognized-form-feminine-neuter-plural":"oțărâtele"}},{"word":"oțărât","pos":"verb","definitions":["past participle of oțărî"],"forms":{"participle-past":"of oțărî"}},{"word":"oțărâtură","pos":"noun","definitions":["enmity"],"forms":{"plural":"oțărâturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"oțărâtură","accusative-definite-nominative-singular":"oțărâtura","accusative-indefinite-nominative-plural":"oțărâturi","accusative-definite-nominative-plural":"oțărâturile","dative-genitive-indefinite-singular":"oțărâturi","dative-definite-genitive-singular":"oțărâturii","dative-genitive-indefinite-plural":"oțărâturi","dative-definite-genitive-plural":"oțărâturilor","singular-vocative":"oțărâtură","plural-vocative":"oțărâturilor"}},{"word":"oțăreală","pos":"noun","definitions":["fury"],"forms":{"plural":"oțăreli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oțăreală","accusative-definite-nominative-singular":"oțăreala","accusative-indefinite-nominative-plural":"oțărele","accusative-definite-nominative-plural":"oțărelele","dative-genitive-indefinite-singular":"oțărele","dative-definite-genitive-singular":"oțărelei","dative-genitive-indefinite-plural":"oțărele","dative-definite-genitive-plural":"oțărelelor","singular-vocative":"oțăreală","plural-vocative":"oțărelelor"}},{"word":"oțări","pos":"verb","definitions":["alternative form of oțărî"],"forms":{"canonical":"a oțări 4th conjugation","present-singular-third-person":"oțărește","participle-past":"oțărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a oțări","gerund":"oțărind","first-person-indicative-present-singular":"oțăresc","indicative-present-second-person-singular":"oțărești","indicative-present-singular-third-person":"oțărește","first-person-indicative-plural-present":"oțărim","indicative-plural-present-second-person":"oțăriți","indicative-plural-present-third-person":"oțăresc","first-person-imperfect-indicative-singular":"oțăream","imperfect-indicative-second-person-singular":"oțăreai","imperfect-indicative-singular-third-person":"oțărea","first-person-imperfect-indicative-plural":"oțăream","imperfect-indicative-plural-second-person":"oțăreați","imperfect-indicative-plural-third-person":"oțăreau","first-person-indicative-perfect-singular":"oțării","indicative-perfect-second-person-singular":"oțăriși","indicative-perfect-singular-third-person":"oțări","first-person-indicative-perfect-plural":"oțărirăm","indicative-perfect-plural-second-person":"oțărirăți","indicative-perfect-plural-third-person":"oțăriră","first-person-indicative-pluperfect-singular":"oțărisem","indicative-pluperfect-second-person-singular":"oțăriseși","indicative-pluperfect-singular-third-person":"oțărise","first-person-indicative-pluperfect-plural":"oțăriserăm","indicative-pluperfect-plural-second-person":"oțăriserăți","indicative-pluperfect-plural-third-person":"oțăriseră","first-person-present-singular-subjunctive":"să oțăresc","present-second-person-singular-subjunctive":"să oțărești","present-singular-subjunctive-third-person":"să oțărească","first-person-plural-present-subjunctive":"să oțărim","plural-present-second-person-subjunctive":"să oțăriți","plural-present-subjunctive-third-person":"să oțărească","imperative-second-person-singular":"oțărește","imperative-plural-second-person":"oțăriți","imperative-negative-second-person-singular":"nu oțări","imperative-negative-plural-second-person":"nu oțăriți"}},{"word":"oțărî","pos":"verb","definitions":["to infuriate, to enrage","to become upset"],"forms":{"canonical":"a oțărî 4th conjugation","present-singular-third-person":"oțărăște","participle-past":"oțărît","table-tags":"conjugation-4","inflection-template":"ro-conj-î-ăsc","infinitive":"a oțărî","gerund":"oțărând","first-person-indicative-present-singular":"oțărăsc","indicative-present-second-person-singular":"oțărăști","indicative-present-singular-third-person":"oțărăște","first-person-indicative-plural-present":"oțărâm","indicative-plural-present-second-person":"oțărâți","indicative-plural-present-third-person":"oțărăsc","first-person-imperfect-indicative-singular":"oțăram","imperfect-indicative-second-person-singular":"oțărai","imperfect-indicative-singular-third-person":"oțăra","first-person-imperfect-indicative-plural":"oțăram","imperfect-indicative-plural-second-person":"oțărați","imperfect-indicative-plural-third-person":"oțărau","first-person-indicative-perfect-singular":"oțărâi","indicative-perfect-second-person-singular":"oțărâși","indicative-perfect-singular-third-person":"oțărî","first-person-indicative-perfect-plural":"oțărârăm","indicative-perfect-plural-second-person":"oțărârăți","indicative-perfect-plural-third-person":"oțărâră","first-person-indicative-pluperfect-singular":"oțărâsem","indicative-pluperfect-second-person-singular":"oțărâseși","indicative-pluperfect-singular-third-person":"oțărâse","first-person-indicative-pluperfect-plural":"oțărâserăm","indicative-pluperfect-plural-second-person":"oțărâserăți","indicative-pluperfect-plural-third-person":"oțărâseră","first-person-present-singular-subjunctive":"să oțărăsc","present-second-person-singular-subjunctive":"să oțărăști","present-singular-subjunctive-third-person":"să oțărască","first-person-plural-present-subjunctive":"să oțărâm","plural-present-second-person-subjunctive":"să oțărâți","plural-present-subjunctive-third-person":"să oțărască","imperative-second-person-singular":"oțărăște","imperative-plural-second-person":"oțărâți","imperative-negative-second-person-singular":"nu oțărî","imperative-negative-plural-second-person":"nu oțărâți"}},{"word":"otarie","pos":"noun","definitions":["sea lion"],"forms":{"plural":"otarii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"otarie","accusative-definite-nominative-singular":"otaria","accusative-indefinite-nominative-plural":"otarii","accusative-definite-nominative-plural":"otariile","dative-genitive-indefinite-singular":"otarii","dative-definite-genitive-singular":"otariei","dative-genitive-indefinite-plural":"otarii","dative-definite-genitive-plural":"otariilor","singular-vocative":"otarie","plural-vocative":"otariilor"}},{"word":"oțărime","pos":"noun","definitions":["bitterness, resentment"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"oțărime","accusative-definite-nominative":"oțărimea","dative-genitive-indefinite":"oțărimi","dative-definite-genitive":"oțărimii","vocative":"oțărime"}},{"word":"oțărire","pos":"noun","definitions":["obsolete form of oțărâre"],"forms":{"plural":"oțăriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oțărire","accusative-definite-nominative-singular":"oțărirea","accusative-indefinite-nominative-plural":"oțăriri","accusative-definite-nominative-plural":"oțăririle","dative-genitive-indefinite-singular":"oțăriri","dative-definite-genitive-singular":"oțăririi","dative-genitive-indefinite-plural":"oțăriri","dative-definite-genitive-plural":"oțăririlor","singular-vocative":"oțărire","plural-vocative":"oțăririlor"}},{"word":"oțărit","pos":"adj","definitions":["alternative form of oțărât"],"forms":{"feminine-singular":"oțărită","masculine-plural":"oțăriți","feminine-neuter-plural":"oțărite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oțărit","error-unrecognized-form-feminine-indefinite-singular":"oțărită","error-unrecognized-form-indefinite-masculine-plural":"oțăriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"oțărite","definite-error-unrecognized-form-masculine-neuter-singular":"oțăritul","definite-error-unrecognized-form-feminine-singular":"oțărita","definite-error-unrecognized-form-masculine-plural":"oțăriții","definite-error-unrecognized-form-feminine-neuter-plural":"oțăritele"}},{"word":"otârnie","pos":"noun","definitions":["obsolete form of utrenie"],"forms":{"plural":"otârnii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"otârnie","accusative-definite-nominative-singular":"otârnia","accusative-indefinite-nominative-plural":"otârnii","accusative-definite-nominative-plural":"otârniile","dative-genitive-indefinite-singular":"otârnii","dative-definite-genitive-singular":"otârniei","dative-genitive-indefinite-plural":"otârnii","dative-definite-genitive-plural":"otârniilor","singular-vocative":"otârnie","plural-vocative":"otârniilor"}},{"word":"Otăsău","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Bistrița"],"gender":"m"},{"word":"Otavă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Otavă"}},{"word":"otavă","pos":"noun","definitions":["aftergrass"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"otavă","accusative-definite-nominative":"otava","dative-genitive-indefinite":"otave","dative-definite-genitive":"otavei","vocative":"otavă"}},{"word":"otcârmui","pos":"verb","definitions":["alternative form of ocârmui"],"forms":{"canonical":"a otcârmui 4th conjugation","present-singular-third-person":"otcârmuiește","participle-past":"otcârmuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a otcârmui","gerund":"otcârmuind","first-person-indicative-present-singular":"otcârmuiesc","indicative-present-second-person-singular":"otcârmuiești","indicative-present-singular-third-person":"otcârmuiește","first-person-indicative-plural-present":"otcârmuim","indicative-plural-present-second-person":"otcârmuiți","indicative-plural-present-third-person":"otcârmuiesc","first-person-imperfect-indicative-singular":"otcârmuiam","imperfect-indicative-second-person-singular":"otcârmuiai","imperfect-indicative-singular-third-person":"otcârmuia","first-person-imperfect-indicative-plural":"otcârmuiam","imperfect-indicative-plural-second-person":"otcârmuiați","imperfect-indicative-plural-third-person":"otcârmuiau","first-person-indicative-perfect-singular":"otcârmuii","indicative-perfect-second-person-singular":"otcârmuiși","indicative-perfect-singular-third-person":"otcârmui","first-person-indicative-perfect-plural":"otcârmuirăm","indicative-perfect-plural-second-person":"otcârmuirăți","indicative-perfect-plural-third-person":"otcârmuiră","first-person-indicative-pluperfect-singular":"otcârmuisem","indicative-pluperfect-second-person-singular":"otcârmuiseși","indicative-pluperfect-singular-third-person":"otcârmuise","first-person-indicative-pluperfect-plural":"otcârmuiserăm","indicative-pluperfect-plural-second-person":"otcârmuiserăți","indicative-pluperfect-plural-third-person":"otcârmuiseră","first-person-present-singular-subjunctive":"să otcârmuiesc","present-second-person-singular-subjunctive":"să otcârmuiești","present-singular-subjunctive-third-person":"să otcârmuiască","first-person-plural-present-subjunctive":"să otcârmuim","plural-present-second-person-subjunctive":"să otcârmuiți","plural-present-subjunctive-third-person":"să otcârmuiască","imperative-second-person-singular":"otcârmuiește","imperative-plural-second-person":"otcârmuiți","imperative-negative-second-person-singular":"nu otcârmui","imperative-negative-plural-second-person":"nu otcârmuiți"}},{"word":"otcârvenie","pos":"noun","definitions":["revelation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"otcârvenie","accusative-definite-nominative":"otcârvenia","dative-genitive-indefinite":"otcârvenii","dative-definite-genitive":"otcârveniei","vocative":"otcârvenie"}},{"word":"otcupcic","pos":"noun","definitions":["tenant"],"forms":{"plural":"otcupcici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"otcupcic","accusative-definite-nominative-singular":"otcupcicul","accusative-indefinite-nominative-plural":"otcupcici","accusative-definite-nominative-plural":"otcupcicii","dative-genitive-indefinite-singular":"otcupcic","dative-definite-genitive-singular":"otcupcicului","dative-genitive-indefinite-plural":"otcupcici","dative-definite-genitive-plural":"otcupcicilor","singular-vocative":"otcupcicule","plural-vocative":"otcupcicilor"}},{"word":"otcupciu","pos":"noun","definitions":["tenant"],"forms":{"plural":"otcupcii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"otcupciu","accusative-definite-nominative-singular":"otcupciuul","accusative-indefinite-nominative-plural":"otcupcii","accusative-definite-nominative-plural":"otcupciii","dative-genitive-indefinite-singular":"otcupciu","dative-definite-genitive-singular":"otcupciuului","dative-genitive-indefinite-plural":"otcupcii","dative-definite-genitive-plural":"otcupciilor","singular-vocative":"otcupciuule","plural-vocative":"otcupciilor"}},{"word":"otecinic","pos":"noun","definitions":["patericon"],"forms":{"plural":"otecinice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"otecinic","accusative-definite-nominative-singular":"otecinicul","accusative-indefinite-nominative-plural":"otecinice","accusative-definite-nominative-plural":"otecinicele","dative-genitive-indefinite-singular":"otecinic","dative-definite-genitive-singular":"otecinicului","dative-genitive-indefinite-plural":"otecinice","dative-definite-genitive-plural":"otecinicelor","singular-vocative":"otecinicule","plural-vocative":"otecinicelor"}},{"word":"otel","pos":"noun","definitions":["alternative form of hotel"],"forms":{"plural":"oteluri"}},{"word":"Oțel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Oțel"}},{"word":"oțel","pos":"noun","definitions":["steel (a metal alloy)"],"pronunciation":"/oˈt͡sel/","forms":{"plural":"oțeluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"oțel","accusative-definite-nominative-singular":"oțelul","accusative-indefinite-nominative-plural":"oțeluri","accusative-definite-nominative-plural":"oțelurile","dative-genitive-indefinite-singular":"oțel","dative-definite-genitive-singular":"oțelului","dative-genitive-indefinite-plural":"oțeluri","dative-definite-genitive-plural":"oțelurilor","singular-vocative":"oțelule","plural-vocative":"oțelurilor","alternative":"оцел"}},{"word":"oțelar","pos":"noun","definitions":["steel worker"],"forms":{"plural":"oțelari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oțelar","accusative-definite-nominative-singular":"oțelarul","accusative-indefinite-nominative-plural":"oțelari","accusative-definite-nominative-plural":"oțelarii","dative-genitive-indefinite-singular":"oțelar","dative-definite-genitive-singular":"oțelarului","dative-genitive-indefinite-plural":"oțelari","dative-definite-genitive-plural":"oțelarilor","singular-vocative":"oțelarule","plural-vocative":"oțelarilor"}},{"word":"oțelărie","pos":"noun","definitions":["steelworks"],"forms":{"plural":"oțelării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oțelărie","accusative-definite-nominative-singular":"oțelăria","accusative-indefinite-nominative-plural":"oțelării","accusative-definite-nominative-plural":"oțelăriile","dative-genitive-indefinite-singular":"oțelării","dative-definite-genitive-singular":"oțelăriei","dative-genitive-indefinite-plural":"oțelării","dative-definite-genitive-plural":"oțelăriilor","singular-vocative":"oțelărie","plural-vocative":"oțelăriilor"}},{"word":"Oțelariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Oțelariu"}},{"word":"Oțeleanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Oțeleanu"}},{"word":"Otelec","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Otelec, Timiș County, Romania"],"gender":"m"},{"word":"Oțeleni","pos":"name","definitions":["a commune of Iași County, Romania","a village in Oțeleni, Iași County, Romania","a village in Hoceni, Vaslui County, Romania"],"gender":"m"},{"word":"Oțelescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Oțelescu"}},{"word":"Oțelești","pos":"name","definitions":["a village in Izvoru Berheciului, Bacău County, Romania"],"gender":"m"},{"word":"oțeli","pos":"verb","definitions":["to steel, to harden"],"forms":{"canonical":"a oțeli 4th conjugation","present-singular-third-person":"oțelește","participle-past":"oțelit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a oțeli","gerund":"oțelind","first-person-indicative-present-singular":"oțelesc","indicative-present-second-person-singular":"oțelești","indicative-present-singular-third-person":"oțelește","first-person-indicative-plural-present":"oțelim","indicative-plural-present-second-person":"oțeliți","indicative-plural-present-third-person":"oțelesc","first-person-imperfect-indicative-singular":"oțeleam","imperfect-indicative-second-person-singular":"oțeleai","imperfect-indicative-singular-third-person":"oțelea","first-person-imperfect-indicative-plural":"oțeleam","imperfect-indicative-plural-second-person":"oțeleați","imperfect-indicative-plural-third-person":"oțeleau","first-person-indicative-perfect-singular":"oțelii","indicative-perfect-second-person-singular":"oțeliși","indicative-perfect-singular-third-person":"oțeli","first-person-indicative-perfect-plural":"oțelirăm","indicative-perfect-plural-second-person":"oțelirăți","indicative-perfect-plural-third-person":"oțeliră","first-person-indicative-pluperfect-singular":"oțelisem","indicative-pluperfect-second-person-singular":"oțeliseși","indicative-pluperfect-singular-third-person":"oțelise","first-person-indicative-pluperfect-plural":"oțeliserăm","indicative-pluperfect-plural-second-person":"oțeliserăți","indicative-pluperfect-plural-third-person":"oțeliseră","first-person-present-singular-subjunctive":"să oțelesc","present-second-person-singular-subjunctive":"să oțelești","present-singular-subjunctive-third-person":"să oțelească","first-person-plural-present-subjunctive":"să oțelim","plural-present-second-person-subjunctive":"să oțeliți","plural-present-subjunctive-third-person":"să oțelească","imperative-second-person-singular":"oțelește","imperative-plural-second-person":"oțeliți","imperative-negative-second-person-singular":"nu oțeli","imperative-negative-plural-second-person":"nu oțeliți"}},{"word":"otelier","pos":"noun","definitions":["obsolete form of hotelier"],"forms":{"plural":"otelieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"otelier","accusative-definite-nominative-singular":"otelierul","accusative-indefinite-nominative-plural":"otelieri","accusative-definite-nominative-plural":"otelierii","dative-genitive-indefinite-singular":"otelier","dative-definite-genitive-singular":"otelierului","dative-genitive-indefinite-plural":"otelieri","dative-definite-genitive-plural":"otelierilor","singular-vocative":"otelierule","plural-vocative":"otelierilor"}},{"word":"oțelire","pos":"noun","definitions":["steeling, hardening"],"forms":{"plural":"oțeliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oțelire","accusative-definite-nominative-singular":"oțelirea","accusative-indefinite-nominative-plural":"oțeliri","accusative-definite-nominative-plural":"oțelirile","dative-genitive-indefinite-singular":"oțeliri","dative-definite-genitive-singular":"oțelirii","dative-genitive-indefinite-plural":"oțeliri","dative-definite-genitive-plural":"oțelirilor","singular-vocative":"oțelire","plural-vocative":"oțelirilor"}},{"word":"oțelit","pos":"verb","definitions":["past participle of oțeli"],"forms":{"participle-past":"of oțeli"}},{"word":"oțelit","pos":"adj","definitions":["hardened"],"forms":{"feminine-singular":"oțelită","masculine-plural":"oțeliți","feminine-neuter-plural":"oțelite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oțelit","error-unrecognized-form-feminine-indefinite-singular":"oțelită","error-unrecognized-form-indefinite-masculine-plural":"oțeliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"oțelite","definite-error-unrecognized-form-masculine-neuter-singular":"oțelitul","definite-error-unrecognized-form-feminine-singular":"oțelita","definite-error-unrecognized-form-masculine-plural":"oțeliții","definite-error-unrecognized-form-feminine-neuter-plural":"oțelitele"}},{"word":"oțeliu","pos":"adj","definitions":["steel-colored"],"forms":{"feminine-singular":"oțelie","plural":"oțelii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oțeliu","error-unrecognized-form-feminine-indefinite-singular":"oțelie","error-unrecognized-form-indefinite-masculine-plural":"oțelii","error-unrecognized-form-feminine-indefinite-neuter-plural":"oțelii","definite-error-unrecognized-form-masculine-neuter-singular":"oțeliul","definite-error-unrecognized-form-feminine-singular":"oțelia","definite-error-unrecognized-form-masculine-plural":"oțeliii","definite-error-unrecognized-form-feminine-neuter-plural":"oțeliile"}},{"word":"Oțelu","pos":"name","definitions":["a village in Berevoești, Argeș County, Romania"],"gender":"m"},{"word":"Oțelu Roșu","pos":"name","definitions":["a town in Caraș-Severin County, Romania"],"gender":"m"},{"word":"oțelul","pos":"noun","definitions":["definite nominative/accusative singular of oțel"]},{"word":"Oțeni","pos":"name","definitions":["a village in Feliceni, Harghita County, Romania"],"gender":"m"},{"word":"oțeri","pos":"verb","definitions":["alternative form of oțărî"],"forms":{"canonical":"a oțeri 4th conjugation","present-singular-third-person":"oțerește","participle-past":"oțerit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a oțeri","gerund":"oțerind","first-person-indicative-present-singular":"oțeresc","indicative-present-second-person-singular":"oțerești","indicative-present-singular-third-person":"oțerește","first-person-indicative-plural-present":"oțerim","indicative-plural-present-second-person":"oțeriți","indicative-plural-present-third-person":"oțeresc","first-person-imperfect-indicative-singular":"oțeream","imperfect-indicative-second-person-singular":"oțereai","imperfect-indicative-singular-third-person":"oțerea","first-person-imperfect-indicative-plural":"oțeream","imperfect-indicative-plural-second-person":"oțereați","imperfect-indicative-plural-third-person":"oțereau","first-person-indicative-perfect-singular":"oțerii","indicative-perfect-second-person-singular":"oțeriși","indicative-perfect-singular-third-person":"oțeri","first-person-indicative-perfect-plural":"oțerirăm","indicative-perfect-plural-second-person":"oțerirăți","indicative-perfect-plural-third-person":"oțeriră","first-person-indicative-pluperfect-singular":"oțerisem","indicative-pluperfect-second-person-singular":"oțeriseși","indicative-pluperfect-singular-third-person":"oțerise","first-person-indicative-pluperfect-plural":"oțeriserăm","indicative-pluperfect-plural-second-person":"oțeriserăți","indicative-pluperfect-plural-third-person":"oțeriseră","first-person-present-singular-subjunctive":"să oțeresc","present-second-person-singular-subjunctive":"să oțerești","present-singular-subjunctive-third-person":"să oțerească","first-person-plural-present-subjunctive":"să oțerim","plural-present-second-person-subjunctive":"să oțeriți","plural-present-subjunctive-third-person":"să oțerească","imperative-second-person-singular":"oțerește","imperative-plural-second-person":"oțeriți","imperative-negative-second-person-singular":"nu oțeri","imperative-negative-plural-second-person":"nu oțeriți"}},{"word":"oțerî","pos":"verb","definitions":["alternative form of oțărî"],"forms":{"canonical":"a oțerî 4th conjugation","present-singular-third-person":"oțerăște","participle-past":"oțerît","table-tags":"conjugation-4","inflection-template":"ro-conj-î-ăsc","infinitive":"a oțerî","gerund":"oțerând","first-person-indicative-present-singular":"oțerăsc","indicative-present-second-person-singular":"oțerăști","indicative-present-singular-third-person":"oțerăște","first-person-indicative-plural-present":"oțerâm","indicative-plural-present-second-person":"oțerâți","indicative-plural-present-third-person":"oțerăsc","first-person-imperfect-indicative-singular":"oțeram","imperfect-indicative-second-person-singular":"oțerai","imperfect-indicative-singular-third-person":"oțera","first-person-imperfect-indicative-plural":"oțeram","imperfect-indicative-plural-second-person":"oțerați","imperfect-indicative-plural-third-person":"oțerau","first-person-indicative-perfect-singular":"oțerâi","indicative-perfect-second-person-singular":"oțerâși","indicative-perfect-singular-third-person":"oțerî","first-person-indicative-perfect-plural":"oțerârăm","indicative-perfect-plural-second-person":"oțerârăți","indicative-perfect-plural-third-person":"oțerâră","first-person-indicative-pluperfect-singular":"oțerâsem","indicative-pluperfect-second-person-singular":"oțerâseși","indicative-pluperfect-singular-third-person":"oțerâse","first-person-indicative-pluperfect-plural":"oțerâserăm","indicative-pluperfect-plural-second-person":"oțerâserăți","indicative-pluperfect-plural-third-person":"oțerâseră","first-person-present-singular-subjunctive":"să oțerăsc","present-second-person-singular-subjunctive":"să oțerăști","present-singular-subjunctive-third-person":"să oțerască","first-person-plural-present-subjunctive":"să oțerâm","plural-present-second-person-subjunctive":"să oțerâți","plural-present-subjunctive-third-person":"să oțerască","imperative-second-person-singular":"oțerăște","imperative-plural-second-person":"oțerâți","imperative-negative-second-person-singular":"nu oțerî","imperative-negative-plural-second-person":"nu oțerâți"}},{"word":"oțerire","pos":"noun","definitions":["alternative form of oțărâre"],"forms":{"plural":"oțeriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oțerire","accusative-definite-nominative-singular":"oțerirea","accusative-indefinite-nominative-plural":"oțeriri","accusative-definite-nominative-plural":"oțeririle","dative-genitive-indefinite-singular":"oțeriri","dative-definite-genitive-singular":"oțeririi","dative-genitive-indefinite-plural":"oțeriri","dative-definite-genitive-plural":"oțeririlor","singular-vocative":"oțerire","plural-vocative":"oțeririlor"}},{"word":"oțerit","pos":"adj","definitions":["alternative form of oțărât"],"forms":{"feminine-singular":"oțerită","masculine-plural":"oțeriți","feminine-neuter-plural":"oțerite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oțerit","error-unrecognized-form-feminine-indefinite-singular":"oțerită","error-unrecognized-form-indefinite-masculine-plural":"oțeriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"oțerite","definite-error-unrecognized-form-masculine-neuter-singular":"oțeritul","definite-error-unrecognized-form-feminine-singular":"oțerita","definite-error-unrecognized-form-masculine-plural":"oțeriții","definite-error-unrecognized-form-feminine-neuter-plural":"oțeritele"}},{"word":"oțeros","pos":"adj","definitions":["awful"],"forms":{"feminine-singular":"oțeroasă","masculine-plural":"oțeroși","feminine-neuter-plural":"oțeroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oțeros","error-unrecognized-form-feminine-indefinite-singular":"oțeroasă","error-unrecognized-form-indefinite-masculine-plural":"oțeroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"oțeroase","definite-error-unrecognized-form-masculine-neuter-singular":"oțerosul","definite-error-unrecognized-form-feminine-singular":"oțeroasa","definite-error-unrecognized-form-masculine-plural":"oțeroșii","definite-error-unrecognized-form-feminine-neuter-plural":"oțeroasele"}},{"word":"Otescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Otescu"}},{"word":"oteșire","pos":"noun","definitions":["reassurance"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"oteșire","accusative-definite-nominative":"oteșirea","dative-genitive-indefinite":"oteșiri","dative-definite-genitive":"oteșirii","vocative":"oteșire"}},{"word":"Oteșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Oteșteanu"}},{"word":"Oteștii de Jos","pos":"name","definitions":["a village in Cungrea, Olt County, Romania"],"gender":"m"},{"word":"Oteștii de Sus","pos":"name","definitions":["a village in Cungrea, Olt County, Romania"],"gender":"m"},{"word":"oteț","pos":"noun","definitions":["Church Father"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"oteț","accusative-definite-nominative":"otețul","dative-genitive-indefinite":"oteț","dative-definite-genitive":"otețului","vocative":"otețule"}},{"word":"Oțet","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Oțet"}},{"word":"oțet","pos":"noun","definitions":["vinegar (condiment)"],"forms":{"plural":"oțeturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"oțet","accusative-definite-nominative-singular":"oțetul","accusative-indefinite-nominative-plural":"oțeturi","accusative-definite-nominative-plural":"oțeturile","dative-genitive-indefinite-singular":"oțet","dative-definite-genitive-singular":"oțetului","dative-genitive-indefinite-plural":"oțeturi","dative-definite-genitive-plural":"oțeturilor","singular-vocative":"oțetule","plural-vocative":"oțeturilor"}},{"word":"oțet de orez","pos":"noun","definitions":["rice vinegar"]},{"word":"oțetar","pos":"noun","definitions":["staghorn sumac"],"forms":{"plural":"oțetari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oțetar","accusative-definite-nominative-singular":"oțetarul","accusative-indefinite-nominative-plural":"oțetari","accusative-definite-nominative-plural":"oțetarii","dative-genitive-indefinite-singular":"oțetar","dative-definite-genitive-singular":"oțetarului","dative-genitive-indefinite-plural":"oțetari","dative-definite-genitive-plural":"oțetarilor","singular-vocative":"oțetarule","plural-vocative":"oțetarilor"}},{"word":"oțetărie","pos":"noun","definitions":["vinegar shop"],"forms":{"plural":"oțetării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oțetărie","accusative-definite-nominative-singular":"oțetăria","accusative-indefinite-nominative-plural":"oțetării","accusative-definite-nominative-plural":"oțetăriile","dative-genitive-indefinite-singular":"oțetării","dative-definite-genitive-singular":"oțetăriei","dative-genitive-indefinite-plural":"oțetării","dative-definite-genitive-plural":"oțetăriilor","singular-vocative":"oțetărie","plural-vocative":"oțetăriilor"}},{"word":"oțetarniță","pos":"noun","definitions":["vinegar container"],"forms":{"plural":"oțetarnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oțetarniță","accusative-definite-nominative-singular":"oțetarnița","accusative-indefinite-nominative-plural":"oțetarnițe","accusative-definite-nominative-plural":"oțetarnițele","dative-genitive-indefinite-singular":"oțetarnițe","dative-definite-genitive-singular":"oțetarniței","dative-genitive-indefinite-plural":"oțetarnițe","dative-definite-genitive-plural":"oțetarnițelor","singular-vocative":"oțetarniță","plural-vocative":"oțetarnițelor"}},{"word":"Otetelișu","pos":"name","definitions":["a village in Bălcești, Vâlcea County, Romania"],"gender":"m"},{"word":"oțeti","pos":"verb","definitions":["to turn into vinegar"],"forms":{"canonical":"a oțeti 4th conjugation","present-singular-third-person":"oțetește","participle-past":"oțetit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a oțeti","gerund":"oțetind","first-person-indicative-present-singular":"oțetesc","indicative-present-second-person-singular":"oțetești","indicative-present-singular-third-person":"oțetește","first-person-indicative-plural-present":"oțetim","indicative-plural-present-second-person":"oțetiți","indicative-plural-present-third-person":"oțetesc","first-person-imperfect-indicative-singular":"oțeteam","imperfect-indicative-second-person-singular":"oțeteai","imperfect-indicative-singular-third-person":"oțetea","first-person-imperfect-indicative-plural":"oțeteam","imperfect-indicative-plural-second-person":"oțeteați","imperfect-indicative-plural-third-person":"oțeteau","first-person-indicative-perfect-singular":"oțetii","indicative-perfect-second-person-singular":"oțetiși","indicative-perfect-singular-third-person":"oțeti","first-person-indicative-perfect-plural":"oțetirăm","indicative-perfect-plural-second-person":"oțetirăți","indicative-perfect-plural-third-person":"oțetiră","first-person-indicative-pluperfect-singular":"oțetisem","indicative-pluperfect-second-person-singular":"oțetiseși","indicative-pluperfect-singular-third-person":"oțetise","first-person-indicative-pluperfect-plural":"oțetiserăm","indicative-pluperfect-plural-second-person":"oțetiserăți","indicative-pluperfect-plural-third-person":"oțetiseră","first-person-present-singular-subjunctive":"să oțetesc","present-second-person-singular-subjunctive":"să oțetești","present-singular-subjunctive-third-person":"să oțetească","first-person-plural-present-subjunctive":"să oțetim","plural-present-second-person-subjunctive":"să oțetiți","plural-present-subjunctive-third-person":"să oțetească","imperative-second-person-singular":"oțetește","imperative-plural-second-person":"oțetiți","imperative-negative-second-person-singular":"nu oțeti","imperative-negative-plural-second-person":"nu oțetiți"}},{"word":"oțeți","pos":"verb","definitions":["alternative form of oțeti"],"forms":{"canonical":"a oțeți 4th conjugation","present-singular-third-person":"oțețește","participle-past":"oțețit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a oțeți","gerund":"oțețind","first-person-indicative-present-singular":"oțețesc","indicative-present-second-person-singular":"oțețești","indicative-present-singular-third-person":"oțețește","first-person-indicative-plural-present":"oțețim","indicative-plural-present-second-person":"oțețiți","indicative-plural-present-third-person":"oțețesc","first-person-imperfect-indicative-singular":"oțețeam","imperfect-indicative-second-person-singular":"oțețeai","imperfect-indicative-singular-third-person":"oțețea","first-person-imperfect-indicative-plural":"oțețeam","imperfect-indicative-plural-second-person":"oțețeați","imperfect-indicative-plural-third-person":"oțețeau","first-person-indicative-perfect-singular":"oțeții","indicative-perfect-second-person-singular":"oțețiși","indicative-perfect-singular-third-person":"oțeți","first-person-indicative-perfect-plural":"oțețirăm","indicative-perfect-plural-second-person":"oțețirăți","indicative-perfect-plural-third-person":"oțețiră","first-person-indicative-pluperfect-singular":"oțețisem","indicative-pluperfect-second-person-singular":"oțețiseși","indicative-pluperfect-singular-third-person":"oțețise","first-person-indicative-pluperfect-plural":"oțețiserăm","indicative-pluperfect-plural-second-person":"oțețiserăți","indicative-pluperfect-plural-third-person":"oțețiseră","first-person-present-singular-subjunctive":"să oțețesc","present-second-person-singular-subjunctive":"să oțețești","present-singular-subjunctive-third-person":"să oțețească","first-person-plural-present-subjunctive":"să oțețim","plural-present-second-person-subjunctive":"să oțețiți","plural-present-subjunctive-third-person":"să oțețească","imperative-second-person-singular":"oțețește","imperative-plural-second-person":"oțețiți","imperative-negative-second-person-singular":"nu oțeți","imperative-negative-plural-second-person":"nu oțețiți"}},{"word":"oțetire","pos":"noun","definitions":["vinegaring, souring"],"forms":{"plural":"oțetiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oțetire","accusative-definite-nominative-singular":"oțetirea","accusative-indefinite-nominative-plural":"oțetiri","accusative-definite-nominative-plural":"oțetirile","dative-genitive-indefinite-singular":"oțetiri","dative-definite-genitive-singular":"oțetirii","dative-genitive-indefinite-plural":"oțetiri","dative-definite-genitive-plural":"oțetirilor","singular-vocative":"oțetire","plural-vocative":"oțetirilor"}},{"word":"oțetit","pos":"adj","definitions":["soured"],"forms":{"feminine-singular":"oțetită","masculine-plural":"oțetiți","feminine-neuter-plural":"oțetite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oțetit","error-unrecognized-form-feminine-indefinite-singular":"oțetită","error-unrecognized-form-indefinite-masculine-plural":"oțetiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"oțetite","definite-error-unrecognized-form-masculine-neuter-singular":"oțetitul","definite-error-unrecognized-form-feminine-singular":"oțetita","definite-error-unrecognized-form-masculine-plural":"oțetiții","definite-error-unrecognized-form-feminine-neuter-plural":"oțetitele"}},{"word":"oțețit","pos":"adj","definitions":["obsolete form of oțetit"],"forms":{"feminine-singular":"oțețită","masculine-plural":"oțețiți","feminine-neuter-plural":"oțețite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oțețit","error-unrecognized-form-feminine-indefinite-singular":"oțețită","error-unrecognized-form-indefinite-masculine-plural":"oțețiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"oțețite","definite-error-unrecognized-form-masculine-neuter-singular":"oțețitul","definite-error-unrecognized-form-feminine-singular":"oțețita","definite-error-unrecognized-form-masculine-plural":"oțețiții","definite-error-unrecognized-form-feminine-neuter-plural":"oțețitele"}},{"word":"Oțetoaia","pos":"name","definitions":["a village in Lunca Banului, Vaslui County, Romania"],"gender":"f"},{"word":"oțetos","pos":"adj","definitions":["vinegary"],"forms":{"feminine-singular":"oțetoasă","masculine-plural":"oțetoși","feminine-neuter-plural":"oțetoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oțetos","error-unrecognized-form-feminine-indefinite-singular":"oțetoasă","error-unrecognized-form-indefinite-masculine-plural":"oțetoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"oțetoase","definite-error-unrecognized-form-masculine-neuter-singular":"oțetosul","definite-error-unrecognized-form-feminine-singular":"oțetoasa","definite-error-unrecognized-form-masculine-plural":"oțetoșii","definite-error-unrecognized-form-feminine-neuter-plural":"oțetoasele"}},{"word":"otgon","pos":"noun","definitions":["alternative form of odgon"],"forms":{"plural":"otgoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"otgon","accusative-definite-nominative-singular":"otgonul","accusative-indefinite-nominative-plural":"otgoane","accusative-definite-nominative-plural":"otgoanele","dative-genitive-indefinite-singular":"otgon","dative-definite-genitive-singular":"otgonului","dative-genitive-indefinite-plural":"otgoane","dative-definite-genitive-plural":"otgoanelor","singular-vocative":"otgonule","plural-vocative":"otgoanelor"}},{"word":"othematom","pos":"noun","definitions":["othematoma"],"forms":{"plural":"othematoame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"othematom","accusative-definite-nominative-singular":"othematomul","accusative-indefinite-nominative-plural":"othematoame","accusative-definite-nominative-plural":"othematoamele","dative-genitive-indefinite-singular":"othematom","dative-definite-genitive-singular":"othematomului","dative-genitive-indefinite-plural":"othematoame","dative-definite-genitive-plural":"othematoamelor","singular-vocative":"othematomule","plural-vocative":"othematoamelor"}},{"word":"oți","pos":"verb","definitions":["might"],"pronunciation":"[ot͡sʲ]"},{"word":"otiatrie","pos":"noun","definitions":["otiatry"],"forms":{"plural":"otiatrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"otiatrie","accusative-definite-nominative-singular":"otiatria","accusative-indefinite-nominative-plural":"otiatrii","accusative-definite-nominative-plural":"otiatriile","dative-genitive-indefinite-singular":"otiatrii","dative-definite-genitive-singular":"otiatriei","dative-genitive-indefinite-plural":"otiatrii","dative-definite-genitive-plural":"otiatriilor","singular-vocative":"otiatrie","plural-vocative":"otiatriilor"}},{"word":"otingaș","pos":"noun","definitions":["chain"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"otingaș","accusative-definite-nominative":"otingașul","dative-genitive-indefinite":"otingaș","dative-definite-genitive":"otingașului","vocative":"otingașule"}},{"word":"oțios","pos":"adj","definitions":["useless"],"forms":{"feminine-singular":"oțioasă","masculine-plural":"oțioși","feminine-neuter-plural":"oțioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oțios","error-unrecognized-form-feminine-indefinite-singular":"oțioasă","error-unrecognized-form-indefinite-masculine-plural":"oțioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"oțioase","definite-error-unrecognized-form-masculine-neuter-singular":"oțiosul","definite-error-unrecognized-form-feminine-singular":"oțioasa","definite-error-unrecognized-form-masculine-plural":"oțioșii","definite-error-unrecognized-form-feminine-neuter-plural":"oțioasele"}},{"word":"otită","pos":"noun","definitions":["otitis"],"forms":{"plural":"otite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"otită","accusative-definite-nominative-singular":"otita","accusative-indefinite-nominative-plural":"otite","accusative-definite-nominative-plural":"otitele","dative-genitive-indefinite-singular":"otite","dative-definite-genitive-singular":"otitei","dative-genitive-indefinite-plural":"otite","dative-definite-genitive-plural":"otitelor","singular-vocative":"otită","plural-vocative":"otitelor"}},{"word":"Otlaca","pos":"name","definitions":["a village in Arad County, Romania. Renamed to Grăniceri in 1925."],"gender":"f"},{"word":"otnoșenie","pos":"noun","definitions":["communiqué, official letter"],"forms":{"plural":"otnoșenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"otnoșenie","accusative-definite-nominative-singular":"otnoșenia","accusative-indefinite-nominative-plural":"otnoșenii","accusative-definite-nominative-plural":"otnoșeniile","dative-genitive-indefinite-singular":"otnoșenii","dative-definite-genitive-singular":"otnoșeniei","dative-genitive-indefinite-plural":"otnoșenii","dative-definite-genitive-plural":"otnoșeniilor","singular-vocative":"otnoșenie","plural-vocative":"otnoșeniilor"}},{"word":"otocist","pos":"noun","definitions":["otocyst"],"forms":{"plural":"otociste","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"otocist","accusative-definite-nominative-singular":"otocistul","accusative-indefinite-nominative-plural":"otociste","accusative-definite-nominative-plural":"otocistele","dative-genitive-indefinite-singular":"otocist","dative-definite-genitive-singular":"otocistului","dative-genitive-indefinite-plural":"otociste","dative-definite-genitive-plural":"otocistelor","singular-vocative":"otocistule","plural-vocative":"otocistelor"}},{"word":"otolit","pos":"noun","definitions":["otolith"],"forms":{"plural":"otolite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"otolit","accusative-definite-nominative-singular":"otolitul","accusative-indefinite-nominative-plural":"otolite","accusative-definite-nominative-plural":"otolitele","dative-genitive-indefinite-singular":"otolit","dative-definite-genitive-singular":"otolitului","dative-genitive-indefinite-plural":"otolite","dative-definite-genitive-plural":"otolitelor","singular-vocative":"otolitule","plural-vocative":"otolitelor"}},{"word":"otolog","pos":"noun","definitions":["otologist"],"forms":{"plural":"otologi","feminine":"equivalent otologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"otolog","accusative-definite-nominative-singular":"otologul","accusative-indefinite-nominative-plural":"otologi","accusative-definite-nominative-plural":"otologii","dative-genitive-indefinite-singular":"otolog","dative-definite-genitive-singular":"otologului","dative-genitive-indefinite-plural":"otologi","dative-definite-genitive-plural":"otologilor","singular-vocative":"otologule","plural-vocative":"otologilor"}},{"word":"otologă","pos":"noun","definitions":["female equivalent of otolog"],"forms":{"plural":"otologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"otologă","accusative-definite-nominative-singular":"otologa","accusative-indefinite-nominative-plural":"otologe","accusative-definite-nominative-plural":"otologele","dative-genitive-indefinite-singular":"otologe","dative-definite-genitive-singular":"otologei","dative-genitive-indefinite-plural":"otologe","dative-definite-genitive-plural":"otologelor","singular-vocative":"otologă","plural-vocative":"otologelor"}},{"word":"otologic","pos":"adj","definitions":["otological"],"forms":{"feminine-singular":"otologică","masculine-plural":"otologici","feminine-neuter-plural":"otologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"otologic","error-unrecognized-form-feminine-indefinite-singular":"otologică","error-unrecognized-form-indefinite-masculine-plural":"otologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"otologice","definite-error-unrecognized-form-masculine-neuter-singular":"otologicul","definite-error-unrecognized-form-feminine-singular":"otologica","definite-error-unrecognized-form-masculine-plural":"otologicii","definite-error-unrecognized-form-feminine-neuter-plural":"otologicele"}},{"word":"otologie","pos":"noun","definitions":["otology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"otologie","accusative-definite-nominative":"otologia","dative-genitive-indefinite":"otologii","dative-definite-genitive":"otologiei","vocative":"otologie"}},{"word":"otoman","pos":"adj","definitions":["Ottoman"],"pronunciation":"/o.toˈman/","forms":{"feminine-singular":"otomană","masculine-plural":"otomani","feminine-neuter-plural":"otomane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"otoman","error-unrecognized-form-feminine-indefinite-singular":"otomană","error-unrecognized-form-indefinite-masculine-plural":"otomani","error-unrecognized-form-feminine-indefinite-neuter-plural":"otomane","definite-error-unrecognized-form-masculine-neuter-singular":"otomanul","definite-error-unrecognized-form-feminine-singular":"otomana","definite-error-unrecognized-form-masculine-plural":"otomanii","definite-error-unrecognized-form-feminine-neuter-plural":"otomanele"}},{"word":"otoman","pos":"noun","definitions":["Ottoman"],"pronunciation":"/o.toˈman/","forms":{"plural":"otomani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"otoman","accusative-definite-nominative-singular":"otomanul","accusative-indefinite-nominative-plural":"otomani","accusative-definite-nominative-plural":"otomanii","dative-genitive-indefinite-singular":"otoman","dative-definite-genitive-singular":"otomanului","dative-genitive-indefinite-plural":"otomani","dative-definite-genitive-plural":"otomanilor","singular-vocative":"otomanule","plural-vocative":"otomanilor"}},{"word":"otomană","pos":"noun","definitions":["female equivalent of otoman"],"forms":{"plural":"otomane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"otomană","accusative-definite-nominative-singular":"otomana","accusative-indefinite-nominative-plural":"otomane","accusative-definite-nominative-plural":"otomanele","dative-genitive-indefinite-singular":"otomane","dative-definite-genitive-singular":"otomanei","dative-genitive-indefinite-plural":"otomane","dative-definite-genitive-plural":"otomanelor","singular-vocative":"otomană","plural-vocative":"otomanelor"}},{"word":"otomănesc","pos":"adj","definitions":["Ottoman"],"forms":{"feminine-singular":"otomănească","plural":"otomănești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"otomănesc","error-unrecognized-form-feminine-indefinite-singular":"otomănească","error-unrecognized-form-indefinite-masculine-plural":"otomănești","error-unrecognized-form-feminine-indefinite-neuter-plural":"otomănești","definite-error-unrecognized-form-masculine-neuter-singular":"otomănescul","definite-error-unrecognized-form-feminine-singular":"otomăneasca","definite-error-unrecognized-form-masculine-plural":"otomăneștii","definite-error-unrecognized-form-feminine-neuter-plural":"otomăneștile"}},{"word":"Otomani","pos":"name","definitions":["a village in Sălacea, Bihor County, Romania"],"gender":"m"},{"word":"otomicoză","pos":"noun","definitions":["otomycosis"],"forms":{"plural":"otomicoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"otomicoză","accusative-definite-nominative-singular":"otomicoza","accusative-indefinite-nominative-plural":"otomicoze","accusative-definite-nominative-plural":"otomicozele","dative-genitive-indefinite-singular":"otomicoze","dative-definite-genitive-singular":"otomicozei","dative-genitive-indefinite-plural":"otomicoze","dative-definite-genitive-plural":"otomicozelor","singular-vocative":"otomicoză","plural-vocative":"otomicozelor"}},{"word":"otopatie","pos":"noun","definitions":["otopathy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"otopatie","accusative-definite-nominative":"otopatia","dative-genitive-indefinite":"otopatii","dative-definite-genitive":"otopatiei","vocative":"otopatie"}},{"word":"Otopeni","pos":"name","definitions":["a city in Ilfov County, Romania"],"gender":"m"},{"word":"otoplastie","pos":"noun","definitions":["otoplasty"],"forms":{"plural":"otoplastii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"otoplastie","accusative-definite-nominative-singular":"otoplastia","accusative-indefinite-nominative-plural":"otoplastii","accusative-definite-nominative-plural":"otoplastiile","dative-genitive-indefinite-singular":"otoplastii","dative-definite-genitive-singular":"otoplastiei","dative-genitive-indefinite-plural":"otoplastii","dative-definite-genitive-plural":"otoplastiilor","singular-vocative":"otoplastie","plural-vocative":"otoplastiilor"}},{"word":"otoragie","pos":"noun","definitions":["otorrhagia"],"forms":{"plural":"otoragii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"otoragie","accusative-definite-nominative-singular":"otoragia","accusative-indefinite-nominative-plural":"otoragii","accusative-definite-nominative-plural":"otoragiile","dative-genitive-indefinite-singular":"otoragii","dative-definite-genitive-singular":"otoragiei","dative-genitive-indefinite-plural":"otoragii","dative-definite-genitive-plural":"otoragiilor","singular-vocative":"otoragie","plural-vocative":"otoragiilor"}},{"word":"otoree","pos":"noun","definitions":["otorrhea"],"forms":{"plural":"otoree","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"otoree","accusative-definite-nominative-singular":"otoreea","accusative-indefinite-nominative-plural":"otoree","accusative-definite-nominative-plural":"otoreele","dative-genitive-indefinite-singular":"otoree","dative-definite-genitive-singular":"otoreei","dative-genitive-indefinite-plural":"otoree","dative-definite-genitive-plural":"otoreelor","singular-vocative":"otoree","plural-vocative":"otoreelor"}},{"word":"otorinolaringolog","pos":"noun","definitions":["otorhinolaryngologist"],"forms":{"plural":"otorinolaringologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"otorinolaringolog","accusative-definite-nominative-singular":"otorinolaringologul","accusative-indefinite-nominative-plural":"otorinolaringologi","accusative-definite-nominative-plural":"otorinolaringologii","dative-genitive-indefinite-singular":"otorinolaringolog","dative-definite-genitive-singular":"otorinolaringologului","dative-genitive-indefinite-plural":"otorinolaringologi","dative-definite-genitive-plural":"otorinolaringologilor","singular-vocative":"otorinolaringologule","plural-vocative":"otorinolaringologilor"}},{"word":"otorinolaringologă","pos":"noun","definitions":["female equivalent of otorinolaringolog"],"forms":{"plural":"otorinolaringologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"otorinolaringologă","accusative-definite-nominative-singular":"otorinolaringologa","accusative-indefinite-nominative-plural":"otorinolaringologe","accusative-definite-nominative-plural":"otorinolaringologele","dative-genitive-indefinite-singular":"otorinolaringologe","dative-definite-genitive-singular":"otorinolaringologei","dative-genitive-indefinite-plural":"otorinolaringologe","dative-definite-genitive-plural":"otorinolaringologelor","singular-vocative":"otorinolaringologă","plural-vocative":"otorinolaringologelor"}},{"word":"otorinolaringologic","pos":"adj","definitions":["otorhinolaryngological"],"forms":{"feminine-singular":"otorinolaringologică","masculine-plural":"otorinolaringologici","feminine-neuter-plural":"otorinolaringologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"otorinolaringologic","error-unrecognized-form-feminine-indefinite-singular":"otorinolaringologică","error-unrecognized-form-indefinite-masculine-plural":"otorinolaringologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"otorinolaringologice","definite-error-unrecognized-form-masculine-neuter-singular":"otorinolaringologicul","definite-error-unrecognized-form-feminine-singular":"otorinolaringologica","definite-error-unrecognized-form-masculine-plural":"otorinolaringologicii","definite-error-unrecognized-form-feminine-neuter-plural":"otorinolaringologicele"}},{"word":"otorinolaringologie","pos":"noun","definitions":["otorhinolaryngology (medical study of ear, nose and throat)"],"forms":{"plural":"otorinolaringologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"otorinolaringologie","accusative-definite-nominative":"otorinolaringologia","dative-genitive-indefinite":"otorinolaringologii","dative-definite-genitive":"otorinolaringologiei","vocative":"otorinolaringologie"}},{"word":"otosclerotic","pos":"noun","definitions":["otosclerotic"],"forms":{"plural":"otosclerotici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"otosclerotic","accusative-definite-nominative-singular":"otoscleroticul","accusative-indefinite-nominative-plural":"otosclerotici","accusative-definite-nominative-plural":"otoscleroticii","dative-genitive-indefinite-singular":"otosclerotic","dative-definite-genitive-singular":"otoscleroticului","dative-genitive-indefinite-plural":"otosclerotici","dative-definite-genitive-plural":"otoscleroticilor","singular-vocative":"otoscleroticule","plural-vocative":"otoscleroticilor"}},{"word":"otoscleroză","pos":"noun","definitions":["otosclerosis"],"forms":{"plural":"otoscleroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"otoscleroză","accusative-definite-nominative-singular":"otoscleroza","accusative-indefinite-nominative-plural":"otoscleroze","accusative-definite-nominative-plural":"otosclerozele","dative-genitive-indefinite-singular":"otoscleroze","dative-definite-genitive-singular":"otosclerozei","dative-genitive-indefinite-plural":"otoscleroze","dative-definite-genitive-plural":"otosclerozelor","singular-vocative":"otoscleroză","plural-vocative":"otosclerozelor"}},{"word":"otoscop","pos":"noun","definitions":["otoscope"],"forms":{"plural":"otoscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"otoscop","accusative-definite-nominative-singular":"otoscopul","accusative-indefinite-nominative-plural":"otoscoape","accusative-definite-nominative-plural":"otoscoapele","dative-genitive-indefinite-singular":"otoscop","dative-definite-genitive-singular":"otoscopului","dative-genitive-indefinite-plural":"otoscoape","dative-definite-genitive-plural":"otoscoapelor","singular-vocative":"otoscopule","plural-vocative":"otoscoapelor"}},{"word":"otoscopie","pos":"noun","definitions":["otoscopy"],"forms":{"plural":"otoscopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"otoscopie","accusative-definite-nominative-singular":"otoscopia","accusative-indefinite-nominative-plural":"otoscopii","accusative-definite-nominative-plural":"otoscopiile","dative-genitive-indefinite-singular":"otoscopii","dative-definite-genitive-singular":"otoscopiei","dative-genitive-indefinite-plural":"otoscopii","dative-definite-genitive-plural":"otoscopiilor","singular-vocative":"otoscopie","plural-vocative":"otoscopiilor"}},{"word":"otospongioză","pos":"noun","definitions":["otospongiosis, otosclerosis"],"forms":{"plural":"otospongioze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"otospongioză","accusative-definite-nominative-singular":"otospongioza","accusative-indefinite-nominative-plural":"otospongioze","accusative-definite-nominative-plural":"otospongiozele","dative-genitive-indefinite-singular":"otospongioze","dative-definite-genitive-singular":"otospongiozei","dative-genitive-indefinite-plural":"otospongioze","dative-definite-genitive-plural":"otospongiozelor","singular-vocative":"otospongioză","plural-vocative":"otospongiozelor"}},{"word":"otova","pos":"adj","definitions":["uniform; clear, egal, straight; (about humans) which doesn't have the weist marked; without form.","monotone, uniform."],"pronunciation":"/ˈo.to.va/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"otova","error-unrecognized-form-feminine-indefinite-singular":"otova","error-unrecognized-form-indefinite-masculine-plural":"otova","error-unrecognized-form-feminine-indefinite-neuter-plural":"otova","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"otprăvuire","pos":"noun","definitions":["sending"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"otprăvuire","accusative-definite-nominative":"otprăvuirea","dative-genitive-indefinite":"otprăvuiri","dative-definite-genitive":"otprăvuirii","vocative":"otprăvuire"}},{"word":"otpust","pos":"noun","definitions":["dismissal"],"forms":{"plural":"otpusturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"otpust","accusative-definite-nominative-singular":"otpustul","accusative-indefinite-nominative-plural":"otpusturi","accusative-definite-nominative-plural":"otpusturile","dative-genitive-indefinite-singular":"otpust","dative-definite-genitive-singular":"otpustului","dative-genitive-indefinite-plural":"otpusturi","dative-definite-genitive-plural":"otpusturilor","singular-vocative":"otpustule","plural-vocative":"otpusturilor"}},{"word":"otrățel","pos":"noun","definitions":["common bladderwort (Utricularia vulgaris)","hound's tongue (Cynoglossum officinale)"],"forms":{"plural":"otrăței","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"otrățel","accusative-definite-nominative-singular":"otrățelul","accusative-indefinite-nominative-plural":"otrăței","accusative-definite-nominative-plural":"otrățeii","dative-genitive-indefinite-singular":"otrățel","dative-definite-genitive-singular":"otrățelului","dative-genitive-indefinite-plural":"otrăței","dative-definite-genitive-plural":"otrățeilor","singular-vocative":"otrățelule","plural-vocative":"otrățeilor"}},{"word":"otrava","pos":"noun","definitions":["definite nominative/accusative singular of otravă"],"pronunciation":"/o.ˈtra.va/","gender":"f-s"},{"word":"Otravă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Otravă"}},{"word":"otravă","pos":"noun","definitions":["poison, venom","bane","bitterness, malice"],"pronunciation":"/o.ˈtra.və/","forms":{"plural":"otrăvuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-uri","accusative-indefinite-nominative-singular":"otravă","accusative-definite-nominative-singular":"otrava","accusative-indefinite-nominative-plural":"otrăvuri","accusative-definite-nominative-plural":"otrăvurile","dative-genitive-indefinite-singular":"otrăvi","dative-definite-genitive-singular":"otrăvii","dative-genitive-indefinite-plural":"otrăvuri","dative-definite-genitive-plural":"otrăvurilor","singular-vocative":"otravă","plural-vocative":"otrăvurilor"}},{"word":"otrăvi","pos":"verb","definitions":["to poison","to ruin"],"examples":[{"ro":"Martina a încercat de două ori să și-otrăvească soțul.","en":"Martina has tried to poison her husband twice."},{"ro":"Mi-ai otrăvit viața!","en":"You've ruined my life!"}],"forms":{"canonical":"a otrăvi 4th conjugation","present-singular-third-person":"otrăvește","participle-past":"otrăvit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a otrăvi","gerund":"otrăvind","first-person-indicative-present-singular":"otrăvesc","indicative-present-second-person-singular":"otrăvești","indicative-present-singular-third-person":"otrăvește","first-person-indicative-plural-present":"otrăvim","indicative-plural-present-second-person":"otrăviți","indicative-plural-present-third-person":"otrăvesc","first-person-imperfect-indicative-singular":"otrăveam","imperfect-indicative-second-person-singular":"otrăveai","imperfect-indicative-singular-third-person":"otrăvea","first-person-imperfect-indicative-plural":"otrăveam","imperfect-indicative-plural-second-person":"otrăveați","imperfect-indicative-plural-third-person":"otrăveau","first-person-indicative-perfect-singular":"otrăvii","indicative-perfect-second-person-singular":"otrăviși","indicative-perfect-singular-third-person":"otrăvi","first-person-indicative-perfect-plural":"otrăvirăm","indicative-perfect-plural-second-person":"otrăvirăți","indicative-perfect-plural-third-person":"otrăviră","first-person-indicative-pluperfect-singular":"otrăvisem","indicative-pluperfect-second-person-singular":"otrăviseși","indicative-pluperfect-singular-third-person":"otrăvise","first-person-indicative-pluperfect-plural":"otrăviserăm","indicative-pluperfect-plural-second-person":"otrăviserăți","indicative-pluperfect-plural-third-person":"otrăviseră","first-person-present-singular-subjunctive":"să otrăvesc","present-second-person-singular-subjunctive":"să otrăvești","present-singular-subjunctive-third-person":"să otrăvească","first-person-plural-present-subjunctive":"să otrăvim","plural-present-second-person-subjunctive":"să otrăviți","plural-present-subjunctive-third-person":"să otrăvească","imperative-second-person-singular":"otrăvește","imperative-plural-second-person":"otrăviți","imperative-negative-second-person-singular":"nu otrăvi","imperative-negative-plural-second-person":"nu otrăviți"}},{"word":"otrăvicios","pos":"adj","definitions":["poisonous"],"forms":{"feminine-singular":"otrăvicioasă","masculine-plural":"otrăvicioși","feminine-neuter-plural":"otrăvicioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"otrăvicios","error-unrecognized-form-feminine-indefinite-singular":"otrăvicioasă","error-unrecognized-form-indefinite-masculine-plural":"otrăvicioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"otrăvicioase","definite-error-unrecognized-form-masculine-neuter-singular":"otrăviciosul","definite-error-unrecognized-form-feminine-singular":"otrăvicioasa","definite-error-unrecognized-form-masculine-plural":"otrăvicioșii","definite-error-unrecognized-form-feminine-neuter-plural":"otrăvicioasele"}},{"word":"otrăvire","pos":"noun","definitions":["poisoning"],"forms":{"plural":"otrăviri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"otrăvire","accusative-definite-nominative-singular":"otrăvirea","accusative-indefinite-nominative-plural":"otrăviri","accusative-definite-nominative-plural":"otrăvirile","dative-genitive-indefinite-singular":"otrăviri","dative-definite-genitive-singular":"otrăvirii","dative-genitive-indefinite-plural":"otrăviri","dative-definite-genitive-plural":"otrăvirilor","singular-vocative":"otrăvire","plural-vocative":"otrăvirilor"}},{"word":"otrăvit","pos":"adj","definitions":["poisoned"],"forms":{"feminine-singular":"otrăvită","masculine-plural":"otrăviți","feminine-neuter-plural":"otrăvite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"otrăvit","error-unrecognized-form-feminine-indefinite-singular":"otrăvită","error-unrecognized-form-indefinite-masculine-plural":"otrăviți","error-unrecognized-form-feminine-indefinite-neuter-plural":"otrăvite","definite-error-unrecognized-form-masculine-neuter-singular":"otrăvitul","definite-error-unrecognized-form-feminine-singular":"otrăvita","definite-error-unrecognized-form-masculine-plural":"otrăviții","definite-error-unrecognized-form-feminine-neuter-plural":"otrăvitele"}},{"word":"otrăvitor","pos":"adj","definitions":["poisonous, toxic"],"pronunciation":"/ˌo.trə.viˈtor/","examples":[{"ro":"Plumbul este otrăvitor pentru oameni.","en":"Lead is poisonous to humans."},{"ro":"Multe ciuperci sunt otrăvitoare.","en":"Many mushrooms are poisonous."}],"forms":{"feminine-singular":"otrăvitoare","masculine-plural":"otrăvitori","feminine-neuter-plural":"otrăvitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"otrăvitor","error-unrecognized-form-feminine-indefinite-singular":"otrăvitoare","error-unrecognized-form-indefinite-masculine-plural":"otrăvitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"otrăvitoare","definite-error-unrecognized-form-masculine-neuter-singular":"otrăvitorul","definite-error-unrecognized-form-feminine-singular":"otrăvitoarea","definite-error-unrecognized-form-masculine-plural":"otrăvitorii","definite-error-unrecognized-form-feminine-neuter-plural":"otrăvitoarele"}},{"word":"otravnic","pos":"noun","definitions":["poisoner"],"forms":{"plural":"otravnici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"otravnic","accusative-definite-nominative-singular":"otravnicul","accusative-indefinite-nominative-plural":"otravnici","accusative-definite-nominative-plural":"otravnicii","dative-genitive-indefinite-singular":"otravnic","dative-definite-genitive-singular":"otravnicului","dative-genitive-indefinite-plural":"otravnici","dative-definite-genitive-plural":"otravnicilor","singular-vocative":"otravnicule","plural-vocative":"otravnicilor"}},{"word":"otreapă","pos":"noun","definitions":["rag"],"forms":{"plural":"otrepe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"otreapă","accusative-definite-nominative-singular":"otreapa","accusative-indefinite-nominative-plural":"otrepe","accusative-definite-nominative-plural":"otrepele","dative-genitive-indefinite-singular":"otrepe","dative-definite-genitive-singular":"otrepei","dative-genitive-indefinite-plural":"otrepe","dative-definite-genitive-plural":"otrepelor","singular-vocative":"otreapă","plural-vocative":"otrepelor"}},{"word":"otrepioară","pos":"noun","definitions":["diminutive of otreapă"],"forms":{"plural":"otrepioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"otrepioară","accusative-definite-nominative-singular":"otrepioara","accusative-indefinite-nominative-plural":"otrepioare","accusative-definite-nominative-plural":"otrepioarele","dative-genitive-indefinite-singular":"otrepioare","dative-definite-genitive-singular":"otrepioarei","dative-genitive-indefinite-plural":"otrepioare","dative-definite-genitive-plural":"otrepioarelor","singular-vocative":"otrepioară","plural-vocative":"otrepioarelor"}},{"word":"otrițanie","pos":"noun","definitions":["rejecting Satan during the baptismal vows"],"forms":{"plural":"otrițanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"otrițanie","accusative-definite-nominative-singular":"otrițania","accusative-indefinite-nominative-plural":"otrițanii","accusative-definite-nominative-plural":"otrițaniile","dative-genitive-indefinite-singular":"otrițanii","dative-definite-genitive-singular":"otrițaniei","dative-genitive-indefinite-plural":"otrițanii","dative-definite-genitive-plural":"otrițaniilor","singular-vocative":"otrițanie","plural-vocative":"otrițaniilor"}},{"word":"otroc","pos":"noun","definitions":["martyr"],"forms":{"plural":"otroci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"otroc","accusative-definite-nominative-singular":"otrocul","accusative-indefinite-nominative-plural":"otroci","accusative-definite-nominative-plural":"otrocii","dative-genitive-indefinite-singular":"otroc","dative-definite-genitive-singular":"otrocului","dative-genitive-indefinite-plural":"otroci","dative-definite-genitive-plural":"otrocilor","singular-vocative":"otrocule","plural-vocative":"otrocilor"}},{"word":"Otrocol","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Otrocol"}},{"word":"otstâpnic","pos":"noun","definitions":["apostate"],"forms":{"plural":"otstâpnici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"otstâpnic","accusative-definite-nominative-singular":"otstâpnicul","accusative-indefinite-nominative-plural":"otstâpnici","accusative-definite-nominative-plural":"otstâpnicii","dative-genitive-indefinite-singular":"otstâpnic","dative-definite-genitive-singular":"otstâpnicului","dative-genitive-indefinite-plural":"otstâpnici","dative-definite-genitive-plural":"otstâpnicilor","singular-vocative":"otstâpnicule","plural-vocative":"otstâpnicilor"}},{"word":"oturac","pos":"noun","definitions":["rest"],"forms":{"plural":"oturace","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oturac","accusative-definite-nominative-singular":"oturacul","accusative-indefinite-nominative-plural":"oturace","accusative-definite-nominative-plural":"oturacele","dative-genitive-indefinite-singular":"oturac","dative-definite-genitive-singular":"oturacului","dative-genitive-indefinite-plural":"oturace","dative-definite-genitive-plural":"oturacelor","singular-vocative":"oturacule","plural-vocative":"oturacelor"}},{"word":"oturacliu","pos":"adj","definitions":["stable"],"forms":{"feminine-singular":"oturaclie","plural":"oturaclii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oturacliu","error-unrecognized-form-feminine-indefinite-singular":"oturaclie","error-unrecognized-form-indefinite-masculine-plural":"oturaclii","error-unrecognized-form-feminine-indefinite-neuter-plural":"oturaclii","definite-error-unrecognized-form-masculine-neuter-singular":"oturacliul","definite-error-unrecognized-form-feminine-singular":"oturaclia","definite-error-unrecognized-form-masculine-plural":"oturacliii","definite-error-unrecognized-form-feminine-neuter-plural":"oturacliile"}},{"word":"otuzbir","pos":"noun","definitions":["a card game in which the one who totals thirty-one points wins the game. Expressions"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"otuzbir","accusative-definite-nominative":"otuzbirul","dative-genitive-indefinite":"otuzbir","dative-definite-genitive":"otuzbirului","vocative":"otuzbirule"}},{"word":"otveat","pos":"noun","definitions":["answer"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"otveat","accusative-definite-nominative":"otveatul","dative-genitive-indefinite":"otveat","dative-definite-genitive":"otveatului","vocative":"otveatule"}},{"word":"Otveș","pos":"name","definitions":["a river in Harghita County, Romania, tributary to the Mureș"],"gender":"m"},{"word":"Otvești","pos":"name","definitions":["a village in Sacoșu Turcesc, Timiș County, Romania"],"gender":"m"},{"word":"otzovist","pos":"adj","definitions":["otzovist"],"forms":{"feminine-singular":"otzovistă","masculine-plural":"otzoviști","feminine-neuter-plural":"otzoviste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"otzovist","error-unrecognized-form-feminine-indefinite-singular":"otzovistă","error-unrecognized-form-indefinite-masculine-plural":"otzoviști","error-unrecognized-form-feminine-indefinite-neuter-plural":"otzoviste","definite-error-unrecognized-form-masculine-neuter-singular":"otzovistul","definite-error-unrecognized-form-feminine-singular":"otzovista","definite-error-unrecognized-form-masculine-plural":"otzoviștii","definite-error-unrecognized-form-feminine-neuter-plural":"otzovistele"}},{"word":"otzovist","pos":"noun","definitions":["otzovist"],"forms":{"plural":"otzoviști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"otzovist","accusative-definite-nominative-singular":"otzovistul","accusative-indefinite-nominative-plural":"otzoviști","accusative-definite-nominative-plural":"otzoviștii","dative-genitive-indefinite-singular":"otzovist","dative-definite-genitive-singular":"otzovistului","dative-genitive-indefinite-plural":"otzoviști","dative-definite-genitive-plural":"otzoviștilor","singular-vocative":"otzovistule","plural-vocative":"otzoviștilor"}},{"word":"Ou","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ou"}},{"word":"ou","pos":"noun","definitions":["egg","ball (testicle)"],"pronunciation":"/ow/","forms":{"plural":"ouă","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ou","accusative-definite-nominative-singular":"oul","accusative-indefinite-nominative-plural":"ouă","accusative-definite-nominative-plural":"ouăle","dative-genitive-indefinite-singular":"ou","dative-definite-genitive-singular":"oului","dative-genitive-indefinite-plural":"ouă","dative-definite-genitive-plural":"ouălor","singular-vocative":"oule","plural-vocative":"ouălor","alternative":"оу"}},{"word":"ou de Paști","pos":"noun","definitions":["Easter egg"],"forms":{"plural":"ouă de Paști"}},{"word":"ou fiert","pos":"noun","definitions":["boiled egg"],"forms":{"plural":"ouă fierte"}},{"word":"ou ochi","pos":"noun","definitions":["sunny side up, fried egg"],"forms":{"plural":"ouă ochi"}},{"word":"oua","pos":"verb","definitions":["to lay eggs"],"pronunciation":"/oˈwa/","forms":{"canonical":"a oua 1st conjugation","present-singular-third-person":"ouă","participle-past":"ouat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a oua","gerund":"ouând","first-person-indicative-present-singular":"-","indicative-present-second-person-singular":"-","indicative-present-singular-third-person":"ouă","first-person-indicative-plural-present":"-","indicative-plural-present-second-person":"-","indicative-plural-present-third-person":"ouă","first-person-imperfect-indicative-singular":"-","imperfect-indicative-second-person-singular":"-","imperfect-indicative-singular-third-person":"oua","first-person-imperfect-indicative-plural":"-","imperfect-indicative-plural-second-person":"-","imperfect-indicative-plural-third-person":"ouau","first-person-indicative-perfect-singular":"-","indicative-perfect-second-person-singular":"-","indicative-perfect-singular-third-person":"ouă","first-person-indicative-perfect-plural":"-","indicative-perfect-plural-second-person":"-","indicative-perfect-plural-third-person":"ouară","first-person-indicative-pluperfect-singular":"-","indicative-pluperfect-second-person-singular":"-","indicative-pluperfect-singular-third-person":"ouase","first-person-indicative-pluperfect-plural":"-","indicative-pluperfect-plural-second-person":"-","indicative-pluperfect-plural-third-person":"ouaseră","first-person-present-singular-subjunctive":"-","present-second-person-singular-subjunctive":"-","present-singular-subjunctive-third-person":"să ouă","first-person-plural-present-subjunctive":"-","plural-present-second-person-subjunctive":"-","plural-present-subjunctive-third-person":"să ouă","imperative-second-person-singular":"-","imperative-plural-second-person":"-","imperative-negative-second-person-singular":"-","imperative-negative-plural-second-person":"-","alternative":"оуа"}},{"word":"ouă","pos":"noun","definitions":["plural of ou"],"pronunciation":"/ˈo.wə/","gender":"n"},{"word":"ouă roșii","pos":"noun","definitions":["Easter eggs"]},{"word":"ouabaină","pos":"noun","definitions":["ouabain"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"ouabaină","accusative-definite-nominative":"ouabaina","dative-genitive-indefinite":"ouabaine","dative-definite-genitive":"ouabainei","vocative":"ouabaină"}},{"word":"ouat","pos":"noun","definitions":["the season when birds lay eggs","laying of eggs"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ouat","accusative-definite-nominative":"ouatul","dative-genitive-indefinite":"ouat","dative-definite-genitive":"ouatului","vocative":"ouatule"}},{"word":"ouat","pos":"verb","definitions":["past participle of oua"],"forms":{"participle-past":"of oua"}},{"word":"ouătoare","pos":"noun","definitions":["hen laying eggs"],"forms":{"plural":"ouătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"ouătoare","accusative-definite-nominative-singular":"ouătoarea","accusative-indefinite-nominative-plural":"ouătoare","accusative-definite-nominative-plural":"ouătoarele","dative-genitive-indefinite-singular":"ouătoare","dative-definite-genitive-singular":"ouătoarei","dative-genitive-indefinite-plural":"ouătoare","dative-definite-genitive-plural":"ouătoarelor","singular-vocative":"ouătoare","plural-vocative":"ouătoarelor"}},{"word":"ouleț","pos":"noun","definitions":["diminutive of ou; small egg"],"forms":{"plural":"oulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ouleț","accusative-definite-nominative-singular":"oulețul","accusative-indefinite-nominative-plural":"oulețe","accusative-definite-nominative-plural":"oulețele","dative-genitive-indefinite-singular":"ouleț","dative-definite-genitive-singular":"oulețului","dative-genitive-indefinite-plural":"oulețe","dative-definite-genitive-plural":"oulețelor","singular-vocative":"oulețule","plural-vocative":"oulețelor"}},{"word":"oușor","pos":"noun","definitions":["diminutive of ou; small egg"],"forms":{"plural":"oușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oușor","accusative-definite-nominative-singular":"oușorul","accusative-indefinite-nominative-plural":"oușore","accusative-definite-nominative-plural":"oușorele","dative-genitive-indefinite-singular":"oușor","dative-definite-genitive-singular":"oușorului","dative-genitive-indefinite-plural":"oușore","dative-definite-genitive-plural":"oușorelor","singular-vocative":"oușorule","plural-vocative":"oușorelor"}},{"word":"ouț","pos":"noun","definitions":["diminutive of ou; small egg"],"forms":{"plural":"ouțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ouț","accusative-definite-nominative-singular":"ouțul","accusative-indefinite-nominative-plural":"ouțe","accusative-definite-nominative-plural":"ouțele","dative-genitive-indefinite-singular":"ouț","dative-definite-genitive-singular":"ouțului","dative-genitive-indefinite-plural":"ouțe","dative-definite-genitive-plural":"ouțelor","singular-vocative":"ouțule","plural-vocative":"ouțelor"}},{"word":"output","pos":"noun","definitions":["output"],"forms":{"plural":"outputuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"output","accusative-definite-nominative-singular":"outputul","accusative-indefinite-nominative-plural":"outputuri","accusative-definite-nominative-plural":"outputurile","dative-genitive-indefinite-singular":"output","dative-definite-genitive-singular":"outputului","dative-genitive-indefinite-plural":"outputuri","dative-definite-genitive-plural":"outputurilor","singular-vocative":"outputule","plural-vocative":"outputurilor"}},{"word":"outputuri","pos":"noun","definitions":["plural of output"]},{"word":"outsider","pos":"noun","definitions":["outsider"],"pronunciation":"/ˈawt.saj.dər/","forms":{"plural":"outsideri"}},{"word":"outsideri","pos":"noun","definitions":["plural of outsider"],"gender":"m-p"},{"word":"Ouțul","pos":"name","definitions":["a river in Maramureș County, Romania, tributary to the Cicârlău"],"gender":"m"},{"word":"ovă","pos":"noun","definitions":["egg"],"forms":{"plural":"ove","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ovă","accusative-definite-nominative-singular":"ova","accusative-indefinite-nominative-plural":"ove","accusative-definite-nominative-plural":"ovele","dative-genitive-indefinite-singular":"ove","dative-definite-genitive-singular":"ovei","dative-genitive-indefinite-plural":"ove","dative-definite-genitive-plural":"ovelor","singular-vocative":"ovă","plural-vocative":"ovelor"}},{"word":"ovajenie","pos":"noun","definitions":["honor","favour"],"forms":{"plural":"ovajenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ovajenie","accusative-definite-nominative-singular":"ovajenia","accusative-indefinite-nominative-plural":"ovajenii","accusative-definite-nominative-plural":"ovajeniile","dative-genitive-indefinite-singular":"ovajenii","dative-definite-genitive-singular":"ovajeniei","dative-genitive-indefinite-plural":"ovajenii","dative-definite-genitive-plural":"ovajeniilor","singular-vocative":"ovajenie","plural-vocative":"ovajeniilor"}},{"word":"oval","pos":"adj","definitions":["oval"],"forms":{"feminine-singular":"ovală","masculine-plural":"ovali","feminine-neuter-plural":"ovale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oval","error-unrecognized-form-feminine-indefinite-singular":"ovală","error-unrecognized-form-indefinite-masculine-plural":"ovali","error-unrecognized-form-feminine-indefinite-neuter-plural":"ovale","definite-error-unrecognized-form-masculine-neuter-singular":"ovalul","definite-error-unrecognized-form-feminine-singular":"ovala","definite-error-unrecognized-form-masculine-plural":"ovalii","definite-error-unrecognized-form-feminine-neuter-plural":"ovalele"}},{"word":"ovală","pos":"noun","definitions":["obsolete form of oval"],"forms":{"plural":"ovale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ovală","accusative-definite-nominative-singular":"ovala","accusative-indefinite-nominative-plural":"ovale","accusative-definite-nominative-plural":"ovalele","dative-genitive-indefinite-singular":"ovale","dative-definite-genitive-singular":"ovalei","dative-genitive-indefinite-plural":"ovale","dative-definite-genitive-plural":"ovalelor","singular-vocative":"ovală","plural-vocative":"ovalelor"}},{"word":"ovalbumină","pos":"noun","definitions":["ovalbumin"],"forms":{"plural":"ovalbumine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ovalbumină","accusative-definite-nominative-singular":"ovalbumina","accusative-indefinite-nominative-plural":"ovalbumine","accusative-definite-nominative-plural":"ovalbuminele","dative-genitive-indefinite-singular":"ovalbumine","dative-definite-genitive-singular":"ovalbuminei","dative-genitive-indefinite-plural":"ovalbumine","dative-definite-genitive-plural":"ovalbuminelor","singular-vocative":"ovalbumină","plural-vocative":"ovalbuminelor"}},{"word":"ovalitate","pos":"noun","definitions":["ovality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"ovalitate","accusative-definite-nominative":"ovalitatea","dative-genitive-indefinite":"ovalități","dative-definite-genitive":"ovalității","vocative":"-"}},{"word":"ovaliza","pos":"verb","definitions":["to ovalize"],"forms":{"canonical":"a ovaliza 1st conjugation","present-singular-third-person":"ovalizează","participle-past":"ovalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a ovaliza","gerund":"ovalizând","first-person-indicative-present-singular":"ovaliz","indicative-present-second-person-singular":"ovalizi","indicative-present-singular-third-person":"ovaliză","first-person-indicative-plural-present":"ovalizăm","indicative-plural-present-second-person":"ovalizați","indicative-plural-present-third-person":"ovaliză","first-person-imperfect-indicative-singular":"ovalizam","imperfect-indicative-second-person-singular":"ovalizai","imperfect-indicative-singular-third-person":"ovaliza","first-person-imperfect-indicative-plural":"ovalizam","imperfect-indicative-plural-second-person":"ovalizați","imperfect-indicative-plural-third-person":"ovalizau","first-person-indicative-perfect-singular":"ovalizai","indicative-perfect-second-person-singular":"ovalizași","indicative-perfect-singular-third-person":"ovaliză","first-person-indicative-perfect-plural":"ovalizarăm","indicative-perfect-plural-second-person":"ovalizarăți","indicative-perfect-plural-third-person":"ovalizară","first-person-indicative-pluperfect-singular":"ovalizasem","indicative-pluperfect-second-person-singular":"ovalizaseși","indicative-pluperfect-singular-third-person":"ovalizase","first-person-indicative-pluperfect-plural":"ovalizaserăm","indicative-pluperfect-plural-second-person":"ovalizaserăți","indicative-pluperfect-plural-third-person":"ovalizaseră","first-person-present-singular-subjunctive":"să ovaliz","present-second-person-singular-subjunctive":"să ovalizi","present-singular-subjunctive-third-person":"să ovalize","first-person-plural-present-subjunctive":"să ovalizăm","plural-present-second-person-subjunctive":"să ovalizați","plural-present-subjunctive-third-person":"să ovalize","imperative-second-person-singular":"ovaliză","imperative-plural-second-person":"ovalizați","imperative-negative-second-person-singular":"nu ovaliza","imperative-negative-plural-second-person":"nu ovalizați"}},{"word":"ovalizare","pos":"noun","definitions":["ovalization"],"forms":{"plural":"ovalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ovalizare","accusative-definite-nominative-singular":"ovalizarea","accusative-indefinite-nominative-plural":"ovalizări","accusative-definite-nominative-plural":"ovalizările","dative-genitive-indefinite-singular":"ovalizări","dative-definite-genitive-singular":"ovalizării","dative-genitive-indefinite-plural":"ovalizări","dative-definite-genitive-plural":"ovalizărilor","singular-vocative":"ovalizare","plural-vocative":"ovalizărilor"}},{"word":"ovalizație","pos":"noun","definitions":["ovalization"],"forms":{"plural":"ovalizații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ovalizație","accusative-definite-nominative-singular":"ovalizația","accusative-indefinite-nominative-plural":"ovalizații","accusative-definite-nominative-plural":"ovalizațiile","dative-genitive-indefinite-singular":"ovalizații","dative-definite-genitive-singular":"ovalizației","dative-genitive-indefinite-plural":"ovalizații","dative-definite-genitive-plural":"ovalizațiilor","singular-vocative":"ovalizație","plural-vocative":"ovalizațiilor"}},{"word":"ovar","pos":"noun","definitions":["ovary"],"forms":{"plural":"ovare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ovar","accusative-definite-nominative-singular":"ovarul","accusative-indefinite-nominative-plural":"ovare","accusative-definite-nominative-plural":"ovarele","dative-genitive-indefinite-singular":"ovar","dative-definite-genitive-singular":"ovarului","dative-genitive-indefinite-plural":"ovare","dative-definite-genitive-plural":"ovarelor","singular-vocative":"ovarule","plural-vocative":"ovarelor"}},{"word":"ovarian","pos":"adj","definitions":["ovarian"],"forms":{"feminine-singular":"ovariană","masculine-plural":"ovarieni","feminine-neuter-plural":"ovariene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ovarian","error-unrecognized-form-feminine-indefinite-singular":"ovariană","error-unrecognized-form-indefinite-masculine-plural":"ovarieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"ovariene","definite-error-unrecognized-form-masculine-neuter-singular":"ovarianul","definite-error-unrecognized-form-feminine-singular":"ovariana","definite-error-unrecognized-form-masculine-plural":"ovarienii","definite-error-unrecognized-form-feminine-neuter-plural":"ovarienele"}},{"word":"ovariectomie","pos":"noun","definitions":["oophorectomy"],"forms":{"plural":"ovariectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ovariectomie","accusative-definite-nominative-singular":"ovariectomia","accusative-indefinite-nominative-plural":"ovariectomii","accusative-definite-nominative-plural":"ovariectomiile","dative-genitive-indefinite-singular":"ovariectomii","dative-definite-genitive-singular":"ovariectomiei","dative-genitive-indefinite-plural":"ovariectomii","dative-definite-genitive-plural":"ovariectomiilor","singular-vocative":"ovariectomie","plural-vocative":"ovariectomiilor"}},{"word":"ovariocel","pos":"noun","definitions":["ovariocele"],"forms":{"plural":"ovariocele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ovariocel","accusative-definite-nominative-singular":"ovariocelul","accusative-indefinite-nominative-plural":"ovariocele","accusative-definite-nominative-plural":"ovariocelele","dative-genitive-indefinite-singular":"ovariocel","dative-definite-genitive-singular":"ovariocelului","dative-genitive-indefinite-plural":"ovariocele","dative-definite-genitive-plural":"ovariocelelor","singular-vocative":"ovariocelule","plural-vocative":"ovariocelelor"}},{"word":"ovariopatie","pos":"noun","definitions":["oophoropathy"],"forms":{"plural":"ovariopatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ovariopatie","accusative-definite-nominative-singular":"ovariopatia","accusative-indefinite-nominative-plural":"ovariopatii","accusative-definite-nominative-plural":"ovariopatiile","dative-genitive-indefinite-singular":"ovariopatii","dative-definite-genitive-singular":"ovariopatiei","dative-genitive-indefinite-plural":"ovariopatii","dative-definite-genitive-plural":"ovariopatiilor","singular-vocative":"ovariopatie","plural-vocative":"ovariopatiilor"}},{"word":"ovariotomie","pos":"noun","definitions":["ovariotomy"],"forms":{"plural":"ovariotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ovariotomie","accusative-definite-nominative-singular":"ovariotomia","accusative-indefinite-nominative-plural":"ovariotomii","accusative-definite-nominative-plural":"ovariotomiile","dative-genitive-indefinite-singular":"ovariotomii","dative-definite-genitive-singular":"ovariotomiei","dative-genitive-indefinite-plural":"ovariotomii","dative-definite-genitive-plural":"ovariotomiilor","singular-vocative":"ovariotomie","plural-vocative":"ovariotomiilor"}},{"word":"ovarită","pos":"noun","definitions":["ovaritis"],"forms":{"plural":"ovarite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ovarită","accusative-definite-nominative-singular":"ovarita","accusative-indefinite-nominative-plural":"ovarite","accusative-definite-nominative-plural":"ovaritele","dative-genitive-indefinite-singular":"ovarite","dative-definite-genitive-singular":"ovaritei","dative-genitive-indefinite-plural":"ovarite","dative-definite-genitive-plural":"ovaritelor","singular-vocative":"ovarită","plural-vocative":"ovaritelor"}},{"word":"ovăs","pos":"noun","definitions":["alternative form of ovăz"],"pronunciation":"/oˈvəs/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"ovăs","accusative-definite-nominative":"ovăsul","dative-genitive-indefinite":"ovăs","dative-definite-genitive":"ovăsului","vocative":"ovăsule"}},{"word":"ovat","pos":"adj","definitions":["ovate, egg-shaped"],"forms":{"feminine-singular":"ovată","masculine-plural":"ovați","feminine-neuter-plural":"ovate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ovat","error-unrecognized-form-feminine-indefinite-singular":"ovată","error-unrecognized-form-indefinite-masculine-plural":"ovați","error-unrecognized-form-feminine-indefinite-neuter-plural":"ovate","definite-error-unrecognized-form-masculine-neuter-singular":"ovatul","definite-error-unrecognized-form-feminine-singular":"ovata","definite-error-unrecognized-form-masculine-plural":"ovații","definite-error-unrecognized-form-feminine-neuter-plural":"ovatele"}},{"word":"ovație","pos":"noun","definitions":["acclamation"],"forms":{"plural":"ovații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ovație","accusative-definite-nominative-singular":"ovația","accusative-indefinite-nominative-plural":"ovații","accusative-definite-nominative-plural":"ovațiile","dative-genitive-indefinite-singular":"ovații","dative-definite-genitive-singular":"ovației","dative-genitive-indefinite-plural":"ovații","dative-definite-genitive-plural":"ovațiilor","singular-vocative":"ovație","plural-vocative":"ovațiilor"}},{"word":"ovaționa","pos":"verb","definitions":["to cheer"],"pronunciation":"/o.va.t͡sjoˈna/","forms":{"canonical":"a ovaționa 1st conjugation","present-singular-third-person":"ovaționează","participle-past":"ovaționat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ovaționa","gerund":"ovaționând","first-person-indicative-present-singular":"ovaționez","indicative-present-second-person-singular":"ovaționezi","indicative-present-singular-third-person":"ovaționează","first-person-indicative-plural-present":"ovaționăm","indicative-plural-present-second-person":"ovaționați","indicative-plural-present-third-person":"ovaționează","first-person-imperfect-indicative-singular":"ovaționam","imperfect-indicative-second-person-singular":"ovaționai","imperfect-indicative-singular-third-person":"ovaționa","first-person-imperfect-indicative-plural":"ovaționam","imperfect-indicative-plural-second-person":"ovaționați","imperfect-indicative-plural-third-person":"ovaționau","first-person-indicative-perfect-singular":"ovaționai","indicative-perfect-second-person-singular":"ovaționași","indicative-perfect-singular-third-person":"ovaționă","first-person-indicative-perfect-plural":"ovaționarăm","indicative-perfect-plural-second-person":"ovaționarăți","indicative-perfect-plural-third-person":"ovaționară","first-person-indicative-pluperfect-singular":"ovaționasem","indicative-pluperfect-second-person-singular":"ovaționaseși","indicative-pluperfect-singular-third-person":"ovaționase","first-person-indicative-pluperfect-plural":"ovaționaserăm","indicative-pluperfect-plural-second-person":"ovaționaserăți","indicative-pluperfect-plural-third-person":"ovaționaseră","first-person-present-singular-subjunctive":"să ovaționez","present-second-person-singular-subjunctive":"să ovaționezi","present-singular-subjunctive-third-person":"să ovaționeze","first-person-plural-present-subjunctive":"să ovaționăm","plural-present-second-person-subjunctive":"să ovaționați","plural-present-subjunctive-third-person":"să ovaționeze","imperative-second-person-singular":"ovaționează","imperative-plural-second-person":"ovaționați","imperative-negative-second-person-singular":"nu ovaționa","imperative-negative-plural-second-person":"nu ovaționați"}},{"word":"ovaționare","pos":"noun","definitions":["ovation"],"forms":{"plural":"ovaționări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ovaționare","accusative-definite-nominative-singular":"ovaționarea","accusative-indefinite-nominative-plural":"ovaționări","accusative-definite-nominative-plural":"ovaționările","dative-genitive-indefinite-singular":"ovaționări","dative-definite-genitive-singular":"ovaționării","dative-genitive-indefinite-plural":"ovaționări","dative-definite-genitive-plural":"ovaționărilor","singular-vocative":"ovaționare","plural-vocative":"ovaționărilor"}},{"word":"ovațiune","pos":"noun","definitions":["obsolete form of ovație"],"forms":{"plural":"ovațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ovațiune","accusative-definite-nominative-singular":"ovațiunea","accusative-indefinite-nominative-plural":"ovațiuni","accusative-definite-nominative-plural":"ovațiunile","dative-genitive-indefinite-singular":"ovațiuni","dative-definite-genitive-singular":"ovațiunii","dative-genitive-indefinite-plural":"ovațiuni","dative-definite-genitive-plural":"ovațiunilor","singular-vocative":"ovațiune","plural-vocative":"ovațiunilor"}},{"word":"ovăz","pos":"noun","definitions":["oat, oats"],"pronunciation":"/oˈvəz/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ovăz","accusative-definite-nominative":"ovăzul","dative-genitive-indefinite":"ovăz","dative-definite-genitive":"ovăzului","vocative":"ovăzule","alternative":"ovăs"}},{"word":"ovăzcior","pos":"noun","definitions":["bulbous oat grass (Arrhenatherum elatius)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ovăzcior","accusative-definite-nominative":"ovăzciorul","dative-genitive-indefinite":"ovăzcior","dative-definite-genitive":"ovăzciorului","vocative":"ovăzciorule"}},{"word":"ovăziște","pos":"noun","definitions":["oats field"],"forms":{"plural":"ovăziști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ovăziște","accusative-definite-nominative-singular":"ovăziștea","accusative-indefinite-nominative-plural":"ovăziști","accusative-definite-nominative-plural":"ovăziștile","dative-genitive-indefinite-singular":"ovăziști","dative-definite-genitive-singular":"ovăziștii","dative-genitive-indefinite-plural":"ovăziști","dative-definite-genitive-plural":"ovăziștilor","singular-vocative":"ovăziște","plural-vocative":"ovăziștilor"}},{"word":"ovelit","pos":"adj","definitions":["obsolete form of ofilit"],"forms":{"feminine-singular":"ovelită","masculine-plural":"oveliți","feminine-neuter-plural":"ovelite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ovelit","error-unrecognized-form-feminine-indefinite-singular":"ovelită","error-unrecognized-form-indefinite-masculine-plural":"oveliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ovelite","definite-error-unrecognized-form-masculine-neuter-singular":"ovelitul","definite-error-unrecognized-form-feminine-singular":"ovelita","definite-error-unrecognized-form-masculine-plural":"oveliții","definite-error-unrecognized-form-feminine-neuter-plural":"ovelitele"}},{"word":"ovelitoriu","pos":"adj","definitions":["humiliating"],"forms":{"feminine-singular":"ovelitorie","plural":"ovelitorii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ovelitoriu","error-unrecognized-form-feminine-indefinite-singular":"ovelitorie","error-unrecognized-form-indefinite-masculine-plural":"ovelitorii","error-unrecognized-form-feminine-indefinite-neuter-plural":"ovelitorii","definite-error-unrecognized-form-masculine-neuter-singular":"ovelitoriul","definite-error-unrecognized-form-feminine-singular":"ovelitoria","definite-error-unrecognized-form-masculine-plural":"ovelitoriii","definite-error-unrecognized-form-feminine-neuter-plural":"ovelitoriile"}},{"word":"Oveselu","pos":"name","definitions":["a village in Măciuca, Vâlcea County, Romania"],"gender":"m"},{"word":"oveșer","pos":"noun","definitions":["oats farmer"],"forms":{"plural":"oveșeri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oveșer","accusative-definite-nominative-singular":"oveșerul","accusative-indefinite-nominative-plural":"oveșeri","accusative-definite-nominative-plural":"oveșerii","dative-genitive-indefinite-singular":"oveșer","dative-definite-genitive-singular":"oveșerului","dative-genitive-indefinite-plural":"oveșeri","dative-definite-genitive-plural":"oveșerilor","singular-vocative":"oveșerule","plural-vocative":"oveșerilor"}},{"word":"ovibos","pos":"noun","definitions":["musk ox"],"forms":{"plural":"oviboși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ovibos","accusative-definite-nominative-singular":"ovibosul","accusative-indefinite-nominative-plural":"oviboși","accusative-definite-nominative-plural":"oviboșii","dative-genitive-indefinite-singular":"ovibos","dative-definite-genitive-singular":"ovibosului","dative-genitive-indefinite-plural":"oviboși","dative-definite-genitive-plural":"oviboșilor","singular-vocative":"ovibosule","plural-vocative":"oviboșilor"}},{"word":"ovicid","pos":"noun","definitions":["ovicide"],"forms":{"plural":"ovicide","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ovicid","accusative-definite-nominative-singular":"ovicidul","accusative-indefinite-nominative-plural":"ovicide","accusative-definite-nominative-plural":"ovicidele","dative-genitive-indefinite-singular":"ovicid","dative-definite-genitive-singular":"ovicidului","dative-genitive-indefinite-plural":"ovicide","dative-definite-genitive-plural":"ovicidelor","singular-vocative":"ovicidule","plural-vocative":"ovicidelor"}},{"word":"Ovidiu","pos":"name","definitions":["a city in Constanța County, Romania"],"gender":"m"},{"word":"oviduct","pos":"noun","definitions":["oviduct"],"forms":{"plural":"oviducte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oviduct","accusative-definite-nominative-singular":"oviductul","accusative-indefinite-nominative-plural":"oviducte","accusative-definite-nominative-plural":"oviductele","dative-genitive-indefinite-singular":"oviduct","dative-definite-genitive-singular":"oviductului","dative-genitive-indefinite-plural":"oviducte","dative-definite-genitive-plural":"oviductelor","singular-vocative":"oviductule","plural-vocative":"oviductelor"}},{"word":"oviform","pos":"adj","definitions":["oviform"],"pronunciation":"/o.viˈform/","forms":{"feminine-singular":"oviformă","masculine-plural":"oviformi","feminine-neuter-plural":"oviforme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oviform","error-unrecognized-form-feminine-indefinite-singular":"oviformă","error-unrecognized-form-indefinite-masculine-plural":"oviformi","error-unrecognized-form-feminine-indefinite-neuter-plural":"oviforme","definite-error-unrecognized-form-masculine-neuter-singular":"oviformul","definite-error-unrecognized-form-feminine-singular":"oviforma","definite-error-unrecognized-form-masculine-plural":"oviformii","definite-error-unrecognized-form-feminine-neuter-plural":"oviformele"}},{"word":"ovili","pos":"verb","definitions":["alternative form of ofili"],"forms":{"canonical":"a ovili 4th conjugation","present-singular-third-person":"ovilește","participle-past":"ovilit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ovili","gerund":"ovilind","first-person-indicative-present-singular":"ovilesc","indicative-present-second-person-singular":"ovilești","indicative-present-singular-third-person":"ovilește","first-person-indicative-plural-present":"ovilim","indicative-plural-present-second-person":"oviliți","indicative-plural-present-third-person":"ovilesc","first-person-imperfect-indicative-singular":"ovileam","imperfect-indicative-second-person-singular":"ovileai","imperfect-indicative-singular-third-person":"ovilea","first-person-imperfect-indicative-plural":"ovileam","imperfect-indicative-plural-second-person":"ovileați","imperfect-indicative-plural-third-person":"ovileau","first-person-indicative-perfect-singular":"ovilii","indicative-perfect-second-person-singular":"oviliși","indicative-perfect-singular-third-person":"ovili","first-person-indicative-perfect-plural":"ovilirăm","indicative-perfect-plural-second-person":"ovilirăți","indicative-perfect-plural-third-person":"oviliră","first-person-indicative-pluperfect-singular":"ovilisem","indicative-pluperfect-second-person-singular":"oviliseși","indicative-pluperfect-singular-third-person":"ovilise","first-person-indicative-pluperfect-plural":"oviliserăm","indicative-pluperfect-plural-second-person":"oviliserăți","indicative-pluperfect-plural-third-person":"oviliseră","first-person-present-singular-subjunctive":"să ovilesc","present-second-person-singular-subjunctive":"să ovilești","present-singular-subjunctive-third-person":"să ovilească","first-person-plural-present-subjunctive":"să ovilim","plural-present-second-person-subjunctive":"să oviliți","plural-present-subjunctive-third-person":"să ovilească","imperative-second-person-singular":"ovilește","imperative-plural-second-person":"oviliți","imperative-negative-second-person-singular":"nu ovili","imperative-negative-plural-second-person":"nu oviliți"}},{"word":"oviliciune","pos":"noun","definitions":["humility"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"oviliciune","accusative-definite-nominative":"oviliciunea","dative-genitive-indefinite":"oviliciuni","dative-definite-genitive":"oviliciunii","vocative":"-"}},{"word":"ovilit","pos":"adj","definitions":["alternative form of ofilit"],"forms":{"feminine-singular":"ovilită","masculine-plural":"oviliți","feminine-neuter-plural":"ovilite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ovilit","error-unrecognized-form-feminine-indefinite-singular":"ovilită","error-unrecognized-form-indefinite-masculine-plural":"oviliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ovilite","definite-error-unrecognized-form-masculine-neuter-singular":"ovilitul","definite-error-unrecognized-form-feminine-singular":"ovilita","definite-error-unrecognized-form-masculine-plural":"oviliții","definite-error-unrecognized-form-feminine-neuter-plural":"ovilitele"}},{"word":"ovin","pos":"adj","definitions":["ovine"],"forms":{"feminine-singular":"ovină","masculine-plural":"ovini","feminine-neuter-plural":"ovine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ovin","error-unrecognized-form-feminine-indefinite-singular":"ovină","error-unrecognized-form-indefinite-masculine-plural":"ovini","error-unrecognized-form-feminine-indefinite-neuter-plural":"ovine","definite-error-unrecognized-form-masculine-neuter-singular":"ovinul","definite-error-unrecognized-form-feminine-singular":"ovina","definite-error-unrecognized-form-masculine-plural":"ovinii","definite-error-unrecognized-form-feminine-neuter-plural":"ovinele"}},{"word":"ovină","pos":"noun","definitions":["ovine"],"forms":{"plural":"ovine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ovină","accusative-definite-nominative-singular":"ovina","accusative-indefinite-nominative-plural":"ovine","accusative-definite-nominative-plural":"ovinele","dative-genitive-indefinite-singular":"ovine","dative-definite-genitive-singular":"ovinei","dative-genitive-indefinite-plural":"ovine","dative-definite-genitive-plural":"ovinelor","singular-vocative":"ovină","plural-vocative":"ovinelor"}},{"word":"ovipar","pos":"adj","definitions":["oviparous"],"forms":{"feminine-singular":"ovipară","masculine-plural":"ovipari","feminine-neuter-plural":"ovipare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ovipar","error-unrecognized-form-feminine-indefinite-singular":"ovipară","error-unrecognized-form-indefinite-masculine-plural":"ovipari","error-unrecognized-form-feminine-indefinite-neuter-plural":"ovipare","definite-error-unrecognized-form-masculine-neuter-singular":"oviparul","definite-error-unrecognized-form-feminine-singular":"ovipara","definite-error-unrecognized-form-masculine-plural":"oviparii","definite-error-unrecognized-form-feminine-neuter-plural":"oviparele"}},{"word":"oviparitate","pos":"noun","definitions":["oviparity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oviparitate","accusative-definite-nominative-singular":"oviparitatea","accusative-indefinite-nominative-plural":"oviparități","accusative-definite-nominative-plural":"oviparitățile","dative-genitive-indefinite-singular":"oviparități","dative-definite-genitive-singular":"oviparității","dative-genitive-indefinite-plural":"oviparități","dative-definite-genitive-plural":"oviparităților","singular-vocative":"oviparitate","plural-vocative":"oviparităților"}},{"word":"ovipozitor","pos":"noun","definitions":["ovipositor"],"forms":{"plural":"ovipozitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ovipozitor","accusative-definite-nominative-singular":"ovipozitorul","accusative-indefinite-nominative-plural":"ovipozitore","accusative-definite-nominative-plural":"ovipozitorele","dative-genitive-indefinite-singular":"ovipozitor","dative-definite-genitive-singular":"ovipozitorului","dative-genitive-indefinite-plural":"ovipozitore","dative-definite-genitive-plural":"ovipozitorelor","singular-vocative":"ovipozitorule","plural-vocative":"ovipozitorelor"}},{"word":"oviscapt","pos":"noun","definitions":["oviscapte"],"forms":{"plural":"oviscapte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oviscapt","accusative-definite-nominative-singular":"oviscaptul","accusative-indefinite-nominative-plural":"oviscapte","accusative-definite-nominative-plural":"oviscaptele","dative-genitive-indefinite-singular":"oviscapt","dative-definite-genitive-singular":"oviscaptului","dative-genitive-indefinite-plural":"oviscapte","dative-definite-genitive-plural":"oviscaptelor","singular-vocative":"oviscaptule","plural-vocative":"oviscaptelor"}},{"word":"ovism","pos":"noun","definitions":["ovism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ovism","accusative-definite-nominative":"ovismul","dative-genitive-indefinite":"ovism","dative-definite-genitive":"ovismului","vocative":"ovismule"}},{"word":"ovocit","pos":"noun","definitions":["oocyte"],"forms":{"plural":"ovocite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ovocit","accusative-definite-nominative-singular":"ovocitul","accusative-indefinite-nominative-plural":"ovocite","accusative-definite-nominative-plural":"ovocitele","dative-genitive-indefinite-singular":"ovocit","dative-definite-genitive-singular":"ovocitului","dative-genitive-indefinite-plural":"ovocite","dative-definite-genitive-plural":"ovocitelor","singular-vocative":"ovocitule","plural-vocative":"ovocitelor"}},{"word":"ovodă","pos":"noun","definitions":["kindergarten, preschool"],"forms":{"plural":"ovode","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ovodă","accusative-definite-nominative-singular":"ovoda","accusative-indefinite-nominative-plural":"ovode","accusative-definite-nominative-plural":"ovodele","dative-genitive-indefinite-singular":"ovode","dative-definite-genitive-singular":"ovodei","dative-genitive-indefinite-plural":"ovode","dative-definite-genitive-plural":"ovodelor","singular-vocative":"ovodă","plural-vocative":"ovodelor"}},{"word":"ovogeneză","pos":"noun","definitions":["oogenesis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ovogeneză","accusative-definite-nominative-singular":"ovogeneza","accusative-indefinite-nominative-plural":"ovogeneze","accusative-definite-nominative-plural":"ovogenezele","dative-genitive-indefinite-singular":"ovogeneze","dative-definite-genitive-singular":"ovogenezei","dative-genitive-indefinite-plural":"ovogeneze","dative-definite-genitive-plural":"ovogenezelor","singular-vocative":"ovogeneză","plural-vocative":"ovogenezelor"}},{"word":"ovoglobulină","pos":"noun","definitions":["ovoglobulin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ovoglobulină","accusative-definite-nominative-singular":"ovoglobulina","accusative-indefinite-nominative-plural":"ovoglobuline","accusative-definite-nominative-plural":"ovoglobulinele","dative-genitive-indefinite-singular":"ovoglobuline","dative-definite-genitive-singular":"ovoglobulinei","dative-genitive-indefinite-plural":"ovoglobuline","dative-definite-genitive-plural":"ovoglobulinelor","singular-vocative":"ovoglobulină","plural-vocative":"ovoglobulinelor"}},{"word":"ovogon","pos":"noun","definitions":["oogonium"],"forms":{"plural":"ovogoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ovogon","accusative-definite-nominative-singular":"ovogonul","accusative-indefinite-nominative-plural":"ovogoane","accusative-definite-nominative-plural":"ovogoanele","dative-genitive-indefinite-singular":"ovogon","dative-definite-genitive-singular":"ovogonului","dative-genitive-indefinite-plural":"ovogoane","dative-definite-genitive-plural":"ovogoanelor","singular-vocative":"ovogonule","plural-vocative":"ovogoanelor"}},{"word":"ovoid","pos":"adj","definitions":["ovoid"],"forms":{"feminine-singular":"ovoidă","masculine-plural":"ovoizi","feminine-neuter-plural":"ovoide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ovoid","error-unrecognized-form-feminine-indefinite-singular":"ovoidă","error-unrecognized-form-indefinite-masculine-plural":"ovoizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"ovoide","definite-error-unrecognized-form-masculine-neuter-singular":"ovoidul","definite-error-unrecognized-form-feminine-singular":"ovoida","definite-error-unrecognized-form-masculine-plural":"ovoizii","definite-error-unrecognized-form-feminine-neuter-plural":"ovoidele"}},{"word":"ovoidal","pos":"adj","definitions":["ovoid"],"forms":{"feminine-singular":"ovoidală","masculine-plural":"ovoidali","feminine-neuter-plural":"ovoidale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ovoidal","error-unrecognized-form-feminine-indefinite-singular":"ovoidală","error-unrecognized-form-indefinite-masculine-plural":"ovoidali","error-unrecognized-form-feminine-indefinite-neuter-plural":"ovoidale","definite-error-unrecognized-form-masculine-neuter-singular":"ovoidalul","definite-error-unrecognized-form-feminine-singular":"ovoidala","definite-error-unrecognized-form-masculine-plural":"ovoidalii","definite-error-unrecognized-form-feminine-neuter-plural":"ovoidalele"}},{"word":"ovoplasmă","pos":"noun","definitions":["ovoplasma"],"forms":{"plural":"ovoplasme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ovoplasmă","accusative-definite-nominative-singular":"ovoplasma","accusative-indefinite-nominative-plural":"ovoplasme","accusative-definite-nominative-plural":"ovoplasmele","dative-genitive-indefinite-singular":"ovoplasme","dative-definite-genitive-singular":"ovoplasmei","dative-genitive-indefinite-plural":"ovoplasme","dative-definite-genitive-plural":"ovoplasmelor","singular-vocative":"ovoplasmă","plural-vocative":"ovoplasmelor"}},{"word":"ovovivipar","pos":"adj","definitions":["ovoviviparous"],"forms":{"feminine-singular":"ovovivipară","masculine-plural":"ovovivipari","feminine-neuter-plural":"ovovivipare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ovovivipar","error-unrecognized-form-feminine-indefinite-singular":"ovovivipară","error-unrecognized-form-indefinite-masculine-plural":"ovovivipari","error-unrecognized-form-feminine-indefinite-neuter-plural":"ovovivipare","definite-error-unrecognized-form-masculine-neuter-singular":"ovoviviparul","definite-error-unrecognized-form-feminine-singular":"ovovivipara","definite-error-unrecognized-form-masculine-plural":"ovoviviparii","definite-error-unrecognized-form-feminine-neuter-plural":"ovoviviparele"}},{"word":"ovovivipară","pos":"noun","definitions":["ovoviviparous animal"],"forms":{"plural":"ovovivipare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ovovivipară","accusative-definite-nominative-singular":"ovovivipara","accusative-indefinite-nominative-plural":"ovovivipare","accusative-definite-nominative-plural":"ovoviviparele","dative-genitive-indefinite-singular":"ovovivipare","dative-definite-genitive-singular":"ovoviviparei","dative-genitive-indefinite-plural":"ovovivipare","dative-definite-genitive-plural":"ovoviviparelor","singular-vocative":"ovovivipară","plural-vocative":"ovoviviparelor"}},{"word":"ovoviviparitate","pos":"noun","definitions":["ovoviviparity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"ovoviviparitate","accusative-definite-nominative":"ovoviviparitatea","dative-genitive-indefinite":"ovoviviparități","dative-definite-genitive":"ovoviviparității","vocative":"ovoviviparitate"}},{"word":"Ovrei","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Ovrei"}},{"word":"ovrei","pos":"noun","definitions":["Jew"],"forms":{"plural":"ovrei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ovrei","accusative-definite-nominative-singular":"ovreiul","accusative-indefinite-nominative-plural":"ovrei","accusative-definite-nominative-plural":"ovreii","dative-genitive-indefinite-singular":"ovrei","dative-definite-genitive-singular":"ovreiului","dative-genitive-indefinite-plural":"ovrei","dative-definite-genitive-plural":"ovreilor","singular-vocative":"ovreiule","plural-vocative":"ovreilor"}},{"word":"ovreică","pos":"noun","definitions":["Jewish woman"],"forms":{"plural":"ovreice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ovreică","accusative-definite-nominative-singular":"ovreica","accusative-indefinite-nominative-plural":"ovreice","accusative-definite-nominative-plural":"ovreicele","dative-genitive-indefinite-singular":"ovreice","dative-definite-genitive-singular":"ovreicei","dative-genitive-indefinite-plural":"ovreice","dative-definite-genitive-plural":"ovreicelor","singular-vocative":"ovreică","plural-vocative":"ovreicelor"}},{"word":"ovreicuță","pos":"noun","definitions":["diminutive of ovreică"],"forms":{"plural":"ovreicuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ovreicuță","accusative-definite-nominative-singular":"ovreicuța","accusative-indefinite-nominative-plural":"ovreicuțe","accusative-definite-nominative-plural":"ovreicuțele","dative-genitive-indefinite-singular":"ovreicuțe","dative-definite-genitive-singular":"ovreicuței","dative-genitive-indefinite-plural":"ovreicuțe","dative-definite-genitive-plural":"ovreicuțelor","singular-vocative":"ovreicuță","plural-vocative":"ovreicuțelor"}},{"word":"ovreiesc","pos":"adj","definitions":["Jewish"],"forms":{"feminine-singular":"ovreiască","plural":"ovreiești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ovreiesc","error-unrecognized-form-feminine-indefinite-singular":"ovreiască","error-unrecognized-form-indefinite-masculine-plural":"ovreiești","error-unrecognized-form-feminine-indefinite-neuter-plural":"ovreiești","definite-error-unrecognized-form-masculine-neuter-singular":"ovreiescul","definite-error-unrecognized-form-feminine-singular":"ovreiasca","definite-error-unrecognized-form-masculine-plural":"ovreieștii","definite-error-unrecognized-form-feminine-neuter-plural":"ovreieștile"}},{"word":"ovreiește","pos":"adv","definitions":["Jewishly"]},{"word":"Ovreiești","pos":"name","definitions":["a village in Vâlcea County, Romania. Renamed to Deleni in 1964."],"gender":"m"},{"word":"Ovreiu","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Ovreiu"}},{"word":"ovreu","pos":"noun","definitions":["alternative form of ovrei"],"forms":{"plural":"ovrei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ovreu","accusative-definite-nominative-singular":"ovreul","accusative-indefinite-nominative-plural":"ovrei","accusative-definite-nominative-plural":"ovreii","dative-genitive-indefinite-singular":"ovreu","dative-definite-genitive-singular":"ovreului","dative-genitive-indefinite-plural":"ovrei","dative-definite-genitive-plural":"ovreilor","singular-vocative":"ovreule","plural-vocative":"ovreilor"}},{"word":"Ovreuță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ovreuță"}},{"word":"ovul","pos":"noun","definitions":["ovule"],"forms":{"plural":"ovule","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ovul","accusative-definite-nominative-singular":"ovulul","accusative-indefinite-nominative-plural":"ovule","accusative-definite-nominative-plural":"ovulele","dative-genitive-indefinite-singular":"ovul","dative-definite-genitive-singular":"ovulului","dative-genitive-indefinite-plural":"ovule","dative-definite-genitive-plural":"ovulelor","singular-vocative":"ovulule","plural-vocative":"ovulelor"}},{"word":"ovular","pos":"adj","definitions":["ovular"],"forms":{"feminine-singular":"ovulară","masculine-plural":"ovulari","feminine-neuter-plural":"ovulare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ovular","error-unrecognized-form-feminine-indefinite-singular":"ovulară","error-unrecognized-form-indefinite-masculine-plural":"ovulari","error-unrecognized-form-feminine-indefinite-neuter-plural":"ovulare","definite-error-unrecognized-form-masculine-neuter-singular":"ovularul","definite-error-unrecognized-form-feminine-singular":"ovulara","definite-error-unrecognized-form-masculine-plural":"ovularii","definite-error-unrecognized-form-feminine-neuter-plural":"ovularele"}},{"word":"ovulație","pos":"noun","definitions":["ovulation"],"forms":{"plural":"ovulații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ovulație","accusative-definite-nominative-singular":"ovulația","accusative-indefinite-nominative-plural":"ovulații","accusative-definite-nominative-plural":"ovulațiile","dative-genitive-indefinite-singular":"ovulații","dative-definite-genitive-singular":"ovulației","dative-genitive-indefinite-plural":"ovulații","dative-definite-genitive-plural":"ovulațiilor","singular-vocative":"ovulație","plural-vocative":"ovulațiilor"}},{"word":"ovulațiune","pos":"noun","definitions":["obsolete form of ovulație"],"forms":{"plural":"ovulațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ovulațiune","accusative-definite-nominative-singular":"ovulațiunea","accusative-indefinite-nominative-plural":"ovulațiuni","accusative-definite-nominative-plural":"ovulațiunile","dative-genitive-indefinite-singular":"ovulațiuni","dative-definite-genitive-singular":"ovulațiunii","dative-genitive-indefinite-plural":"ovulațiuni","dative-definite-genitive-plural":"ovulațiunilor","singular-vocative":"ovulațiune","plural-vocative":"ovulațiunilor"}},{"word":"ovulist","pos":"noun","definitions":["ovulist"],"forms":{"plural":"ovuliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ovulist","accusative-definite-nominative-singular":"ovulistul","accusative-indefinite-nominative-plural":"ovuliști","accusative-definite-nominative-plural":"ovuliștii","dative-genitive-indefinite-singular":"ovulist","dative-definite-genitive-singular":"ovulistului","dative-genitive-indefinite-plural":"ovuliști","dative-definite-genitive-plural":"ovuliștilor","singular-vocative":"ovulistule","plural-vocative":"ovuliștilor"}},{"word":"owenism","pos":"noun","definitions":["Owenism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"owenism","accusative-definite-nominative":"owenismul","dative-genitive-indefinite":"owenism","dative-definite-genitive":"owenismului","vocative":"owenismule"}},{"word":"owenist","pos":"noun","definitions":["Owenist"],"forms":{"plural":"oweniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"owenist","accusative-definite-nominative-singular":"owenistul","accusative-indefinite-nominative-plural":"oweniști","accusative-definite-nominative-plural":"oweniștii","dative-genitive-indefinite-singular":"owenist","dative-definite-genitive-singular":"owenistului","dative-genitive-indefinite-plural":"oweniști","dative-definite-genitive-plural":"oweniștilor","singular-vocative":"owenistule","plural-vocative":"oweniștilor"}},{"word":"oxalat","pos":"noun","definitions":["oxalate"],"forms":{"plural":"oxalați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oxalat","accusative-definite-nominative-singular":"oxalatul","accusative-indefinite-nominative-plural":"oxalați","accusative-definite-nominative-plural":"oxalații","dative-genitive-indefinite-singular":"oxalat","dative-definite-genitive-singular":"oxalatului","dative-genitive-indefinite-plural":"oxalați","dative-definite-genitive-plural":"oxalaților","singular-vocative":"oxalatule","plural-vocative":"oxalaților"}},{"word":"oxalemie","pos":"noun","definitions":["oxalemia"],"forms":{"plural":"oxalemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oxalemie","accusative-definite-nominative-singular":"oxalemia","accusative-indefinite-nominative-plural":"oxalemii","accusative-definite-nominative-plural":"oxalemiile","dative-genitive-indefinite-singular":"oxalemii","dative-definite-genitive-singular":"oxalemiei","dative-genitive-indefinite-plural":"oxalemii","dative-definite-genitive-plural":"oxalemiilor","singular-vocative":"oxalemie","plural-vocative":"oxalemiilor"}},{"word":"oxalic","pos":"adj","definitions":["oxalic"],"forms":{"feminine-singular":"oxalică","masculine-plural":"oxalici","feminine-neuter-plural":"oxalice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oxalic","error-unrecognized-form-feminine-indefinite-singular":"oxalică","error-unrecognized-form-indefinite-masculine-plural":"oxalici","error-unrecognized-form-feminine-indefinite-neuter-plural":"oxalice","definite-error-unrecognized-form-masculine-neuter-singular":"oxalicul","definite-error-unrecognized-form-feminine-singular":"oxalica","definite-error-unrecognized-form-masculine-plural":"oxalicii","definite-error-unrecognized-form-feminine-neuter-plural":"oxalicele"}},{"word":"oxalurie","pos":"noun","definitions":["oxaluria"],"forms":{"plural":"oxalurii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oxalurie","accusative-definite-nominative-singular":"oxaluria","accusative-indefinite-nominative-plural":"oxalurii","accusative-definite-nominative-plural":"oxaluriile","dative-genitive-indefinite-singular":"oxalurii","dative-definite-genitive-singular":"oxaluriei","dative-genitive-indefinite-plural":"oxalurii","dative-definite-genitive-plural":"oxaluriilor","singular-vocative":"oxalurie","plural-vocative":"oxaluriilor"}},{"word":"Oxentea","pos":"name","definitions":["a village in Oxentea, Dubăsari Raion, Moldova","a commune of Dubăsari Raion, Moldova"],"gender":"f"},{"word":"oxfordian","pos":"noun","definitions":["Oxfordian"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"oxfordian","accusative-definite-nominative":"oxfordianul","dative-genitive-indefinite":"oxfordian","dative-definite-genitive":"oxfordianului","vocative":"oxfordianule"}},{"word":"oxhidric","pos":"adj","definitions":["oxyhydrogen"],"forms":{"feminine-singular":"oxhidrică","masculine-plural":"oxhidrici","feminine-neuter-plural":"oxhidrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oxhidric","error-unrecognized-form-feminine-indefinite-singular":"oxhidrică","error-unrecognized-form-indefinite-masculine-plural":"oxhidrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"oxhidrice","definite-error-unrecognized-form-masculine-neuter-singular":"oxhidricul","definite-error-unrecognized-form-feminine-singular":"oxhidrica","definite-error-unrecognized-form-masculine-plural":"oxhidricii","definite-error-unrecognized-form-feminine-neuter-plural":"oxhidricele"}},{"word":"oxiacetilenă","pos":"noun","definitions":["oxyacetylene"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oxiacetilenă","accusative-definite-nominative-singular":"oxiacetilena","accusative-indefinite-nominative-plural":"oxiacetilene","accusative-definite-nominative-plural":"oxiacetilenele","dative-genitive-indefinite-singular":"oxiacetilene","dative-definite-genitive-singular":"oxiacetilenei","dative-genitive-indefinite-plural":"oxiacetilene","dative-definite-genitive-plural":"oxiacetilenelor","singular-vocative":"oxiacetilenă","plural-vocative":"oxiacetilenelor"}},{"word":"oxiacetilenic","pos":"adj","definitions":["oxyacetylenic"],"forms":{"feminine-singular":"oxiacetilenică","masculine-plural":"oxiacetilenici","feminine-neuter-plural":"oxiacetilenice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oxiacetilenic","error-unrecognized-form-feminine-indefinite-singular":"oxiacetilenică","error-unrecognized-form-indefinite-masculine-plural":"oxiacetilenici","error-unrecognized-form-feminine-indefinite-neuter-plural":"oxiacetilenice","definite-error-unrecognized-form-masculine-neuter-singular":"oxiacetilenicul","definite-error-unrecognized-form-feminine-singular":"oxiacetilenica","definite-error-unrecognized-form-masculine-plural":"oxiacetilenicii","definite-error-unrecognized-form-feminine-neuter-plural":"oxiacetilenicele"}},{"word":"oxiacid","pos":"noun","definitions":["oxyacid"],"forms":{"plural":"oxiacizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oxiacid","accusative-definite-nominative-singular":"oxiacidul","accusative-indefinite-nominative-plural":"oxiacizi","accusative-definite-nominative-plural":"oxiacizii","dative-genitive-indefinite-singular":"oxiacid","dative-definite-genitive-singular":"oxiacidului","dative-genitive-indefinite-plural":"oxiacizi","dative-definite-genitive-plural":"oxiacizilor","singular-vocative":"oxiacidule","plural-vocative":"oxiacizilor"}},{"word":"oxibiotic","pos":"adj","definitions":["oxybiotic"],"forms":{"feminine-singular":"oxibiotică","masculine-plural":"oxibiotici","feminine-neuter-plural":"oxibiotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oxibiotic","error-unrecognized-form-feminine-indefinite-singular":"oxibiotică","error-unrecognized-form-indefinite-masculine-plural":"oxibiotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"oxibiotice","definite-error-unrecognized-form-masculine-neuter-singular":"oxibioticul","definite-error-unrecognized-form-feminine-singular":"oxibiotica","definite-error-unrecognized-form-masculine-plural":"oxibioticii","definite-error-unrecognized-form-feminine-neuter-plural":"oxibioticele"}},{"word":"oxicefal","pos":"noun","definitions":["oxycephalic"],"forms":{"plural":"oxicefali","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oxicefal","accusative-definite-nominative-singular":"oxicefalul","accusative-indefinite-nominative-plural":"oxicefali","accusative-definite-nominative-plural":"oxicefalii","dative-genitive-indefinite-singular":"oxicefal","dative-definite-genitive-singular":"oxicefalului","dative-genitive-indefinite-plural":"oxicefali","dative-definite-genitive-plural":"oxicefalilor","singular-vocative":"oxicefalule","plural-vocative":"oxicefalilor"}},{"word":"oxicefală","pos":"noun","definitions":["female equivalent of oxicefal"],"forms":{"plural":"oxicefale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oxicefală","accusative-definite-nominative-singular":"oxicefala","accusative-indefinite-nominative-plural":"oxicefale","accusative-definite-nominative-plural":"oxicefalele","dative-genitive-indefinite-singular":"oxicefale","dative-definite-genitive-singular":"oxicefalei","dative-genitive-indefinite-plural":"oxicefale","dative-definite-genitive-plural":"oxicefalelor","singular-vocative":"oxicefală","plural-vocative":"oxicefalelor"}},{"word":"oxicefalie","pos":"noun","definitions":["oxycephaly"],"forms":{"plural":"oxicefalii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oxicefalie","accusative-definite-nominative-singular":"oxicefalia","accusative-indefinite-nominative-plural":"oxicefalii","accusative-definite-nominative-plural":"oxicefaliile","dative-genitive-indefinite-singular":"oxicefalii","dative-definite-genitive-singular":"oxicefaliei","dative-genitive-indefinite-plural":"oxicefalii","dative-definite-genitive-plural":"oxicefaliilor","singular-vocative":"oxicefalie","plural-vocative":"oxicefaliilor"}},{"word":"oxiclorură","pos":"noun","definitions":["oxychloride"],"forms":{"plural":"oxicloruri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"oxiclorură","accusative-definite-nominative-singular":"oxiclorura","accusative-indefinite-nominative-plural":"oxicloruri","accusative-definite-nominative-plural":"oxiclorurile","dative-genitive-indefinite-singular":"oxicloruri","dative-definite-genitive-singular":"oxiclorurii","dative-genitive-indefinite-plural":"oxicloruri","dative-definite-genitive-plural":"oxiclorurilor","singular-vocative":"oxiclorură","plural-vocative":"oxiclorurilor"}},{"word":"oxiclorură de carbon","pos":"noun","definitions":["carbon oxychloride"]},{"word":"oxid","pos":"noun","definitions":["oxide"],"forms":{"plural":"oxizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oxid","accusative-definite-nominative-singular":"oxidul","accusative-indefinite-nominative-plural":"oxizi","accusative-definite-nominative-plural":"oxizii","dative-genitive-indefinite-singular":"oxid","dative-definite-genitive-singular":"oxidului","dative-genitive-indefinite-plural":"oxizi","dative-definite-genitive-plural":"oxizilor","singular-vocative":"oxidule","plural-vocative":"oxizilor"}},{"word":"oxid de azot","pos":"noun","definitions":["nitric oxide"]},{"word":"oxid de calciu","pos":"noun","definitions":["calcium oxide, lime"]},{"word":"oxid feric","pos":"noun","definitions":["ferric oxide"]},{"word":"oxida","pos":"verb","definitions":["to oxidize"],"forms":{"canonical":"a oxida 1st conjugation","present-singular-third-person":"oxidează","participle-past":"oxidat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a oxida","gerund":"oxidând","first-person-indicative-present-singular":"oxidez","indicative-present-second-person-singular":"oxidezi","indicative-present-singular-third-person":"oxidează","first-person-indicative-plural-present":"oxidăm","indicative-plural-present-second-person":"oxidați","indicative-plural-present-third-person":"oxidează","first-person-imperfect-indicative-singular":"oxidam","imperfect-indicative-second-person-singular":"oxidai","imperfect-indicative-singular-third-person":"oxida","first-person-imperfect-indicative-plural":"oxidam","imperfect-indicative-plural-second-person":"oxidați","imperfect-indicative-plural-third-person":"oxidau","first-person-indicative-perfect-singular":"oxidai","indicative-perfect-second-person-singular":"oxidași","indicative-perfect-singular-third-person":"oxidă","first-person-indicative-perfect-plural":"oxidarăm","indicative-perfect-plural-second-person":"oxidarăți","indicative-perfect-plural-third-person":"oxidară","first-person-indicative-pluperfect-singular":"oxidasem","indicative-pluperfect-second-person-singular":"oxidaseși","indicative-pluperfect-singular-third-person":"oxidase","first-person-indicative-pluperfect-plural":"oxidaserăm","indicative-pluperfect-plural-second-person":"oxidaserăți","indicative-pluperfect-plural-third-person":"oxidaseră","first-person-present-singular-subjunctive":"să oxidez","present-second-person-singular-subjunctive":"să oxidezi","present-singular-subjunctive-third-person":"să oxideze","first-person-plural-present-subjunctive":"să oxidăm","plural-present-second-person-subjunctive":"să oxidați","plural-present-subjunctive-third-person":"să oxideze","imperative-second-person-singular":"oxidează","imperative-plural-second-person":"oxidați","imperative-negative-second-person-singular":"nu oxida","imperative-negative-plural-second-person":"nu oxidați"}},{"word":"oxidabil","pos":"adj","definitions":["oxidable"],"forms":{"feminine-singular":"oxidabilă","masculine-plural":"oxidabili","feminine-neuter-plural":"oxidabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oxidabil","error-unrecognized-form-feminine-indefinite-singular":"oxidabilă","error-unrecognized-form-indefinite-masculine-plural":"oxidabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"oxidabile","definite-error-unrecognized-form-masculine-neuter-singular":"oxidabilul","definite-error-unrecognized-form-feminine-singular":"oxidabila","definite-error-unrecognized-form-masculine-plural":"oxidabilii","definite-error-unrecognized-form-feminine-neuter-plural":"oxidabilele"}},{"word":"oxidant","pos":"adj","definitions":["oxidant"],"forms":{"feminine-singular":"oxidantă","masculine-plural":"oxidanți","feminine-neuter-plural":"oxidante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oxidant","error-unrecognized-form-feminine-indefinite-singular":"oxidantă","error-unrecognized-form-indefinite-masculine-plural":"oxidanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"oxidante","definite-error-unrecognized-form-masculine-neuter-singular":"oxidantul","definite-error-unrecognized-form-feminine-singular":"oxidanta","definite-error-unrecognized-form-masculine-plural":"oxidanții","definite-error-unrecognized-form-feminine-neuter-plural":"oxidantele"}},{"word":"oxidare","pos":"noun","definitions":["oxidation"],"forms":{"plural":"oxidări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oxidare","accusative-definite-nominative-singular":"oxidarea","accusative-indefinite-nominative-plural":"oxidări","accusative-definite-nominative-plural":"oxidările","dative-genitive-indefinite-singular":"oxidări","dative-definite-genitive-singular":"oxidării","dative-genitive-indefinite-plural":"oxidări","dative-definite-genitive-plural":"oxidărilor","singular-vocative":"oxidare","plural-vocative":"oxidărilor"}},{"word":"oxidat","pos":"adj","definitions":["rusty"],"forms":{"feminine-singular":"oxidată","masculine-plural":"oxidați","feminine-neuter-plural":"oxidate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oxidat","error-unrecognized-form-feminine-indefinite-singular":"oxidată","error-unrecognized-form-indefinite-masculine-plural":"oxidați","error-unrecognized-form-feminine-indefinite-neuter-plural":"oxidate","definite-error-unrecognized-form-masculine-neuter-singular":"oxidatul","definite-error-unrecognized-form-feminine-singular":"oxidata","definite-error-unrecognized-form-masculine-plural":"oxidații","definite-error-unrecognized-form-feminine-neuter-plural":"oxidatele"}},{"word":"oxidație","pos":"noun","definitions":["oxidation"],"forms":{"plural":"oxidații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oxidație","accusative-definite-nominative-singular":"oxidația","accusative-indefinite-nominative-plural":"oxidații","accusative-definite-nominative-plural":"oxidațiile","dative-genitive-indefinite-singular":"oxidații","dative-definite-genitive-singular":"oxidației","dative-genitive-indefinite-plural":"oxidații","dative-definite-genitive-plural":"oxidațiilor","singular-vocative":"oxidație","plural-vocative":"oxidațiilor"}},{"word":"oxidațiune","pos":"noun","definitions":["obsolete form of oxidație"],"forms":{"plural":"oxidațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oxidațiune","accusative-definite-nominative-singular":"oxidațiunea","accusative-indefinite-nominative-plural":"oxidațiuni","accusative-definite-nominative-plural":"oxidațiunile","dative-genitive-indefinite-singular":"oxidațiuni","dative-definite-genitive-singular":"oxidațiunii","dative-genitive-indefinite-plural":"oxidațiuni","dative-definite-genitive-plural":"oxidațiunilor","singular-vocative":"oxidațiune","plural-vocative":"oxidațiunilor"}},{"word":"oxidativ","pos":"adj","definitions":["oxidative"],"forms":{"feminine-singular":"oxidativă","masculine-plural":"oxidativi","feminine-neuter-plural":"oxidative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oxidativ","error-unrecognized-form-feminine-indefinite-singular":"oxidativă","error-unrecognized-form-indefinite-masculine-plural":"oxidativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"oxidative","definite-error-unrecognized-form-masculine-neuter-singular":"oxidativul","definite-error-unrecognized-form-feminine-singular":"oxidativa","definite-error-unrecognized-form-masculine-plural":"oxidativii","definite-error-unrecognized-form-feminine-neuter-plural":"oxidativele"}},{"word":"oxidază","pos":"noun","definitions":["oxidase"],"forms":{"plural":"oxidaze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oxidază","accusative-definite-nominative-singular":"oxidaza","accusative-indefinite-nominative-plural":"oxidaze","accusative-definite-nominative-plural":"oxidazele","dative-genitive-indefinite-singular":"oxidaze","dative-definite-genitive-singular":"oxidazei","dative-genitive-indefinite-plural":"oxidaze","dative-definite-genitive-plural":"oxidazelor","singular-vocative":"oxidază","plural-vocative":"oxidazelor"}},{"word":"oxidimetric","pos":"adj","definitions":["oxidimetric"],"forms":{"feminine-singular":"oxidimetrică","masculine-plural":"oxidimetrici","feminine-neuter-plural":"oxidimetrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oxidimetric","error-unrecognized-form-feminine-indefinite-singular":"oxidimetrică","error-unrecognized-form-indefinite-masculine-plural":"oxidimetrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"oxidimetrice","definite-error-unrecognized-form-masculine-neuter-singular":"oxidimetricul","definite-error-unrecognized-form-feminine-singular":"oxidimetrica","definite-error-unrecognized-form-masculine-plural":"oxidimetricii","definite-error-unrecognized-form-feminine-neuter-plural":"oxidimetricele"}},{"word":"oxidimetrie","pos":"noun","definitions":["oxidimetry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"oxidimetrie","accusative-definite-nominative":"oxidimetria","dative-genitive-indefinite":"oxidimetrii","dative-definite-genitive":"oxidimetriei","vocative":"oxidimetrie"}},{"word":"oxidimetru","pos":"noun","definitions":["oxidimeter"],"forms":{"plural":"oxidimetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oxidimetru","accusative-definite-nominative-singular":"oxidimetrul","accusative-indefinite-nominative-plural":"oxidimetre","accusative-definite-nominative-plural":"oxidimetrele","dative-genitive-indefinite-singular":"oxidimetru","dative-definite-genitive-singular":"oxidimetrului","dative-genitive-indefinite-plural":"oxidimetre","dative-definite-genitive-plural":"oxidimetrelor","singular-vocative":"oxidimetrule","plural-vocative":"oxidimetrelor"}},{"word":"oxidoreducere","pos":"noun","definitions":["redox"],"forms":{"plural":"oxidoreduceri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oxidoreducere","accusative-definite-nominative-singular":"oxidoreducerea","accusative-indefinite-nominative-plural":"oxidoreduceri","accusative-definite-nominative-plural":"oxidoreducerile","dative-genitive-indefinite-singular":"oxidoreduceri","dative-definite-genitive-singular":"oxidoreducerii","dative-genitive-indefinite-plural":"oxidoreduceri","dative-definite-genitive-plural":"oxidoreducerilor","singular-vocative":"oxidoreducere","plural-vocative":"oxidoreducerilor"}},{"word":"oxidril","pos":"noun","definitions":["hydroxyl"],"forms":{"plural":"oxidrili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oxidril","accusative-definite-nominative-singular":"oxidrilul","accusative-indefinite-nominative-plural":"oxidrili","accusative-definite-nominative-plural":"oxidrilii","dative-genitive-indefinite-singular":"oxidril","dative-definite-genitive-singular":"oxidrilului","dative-genitive-indefinite-plural":"oxidrili","dative-definite-genitive-plural":"oxidrililor","singular-vocative":"oxidrilule","plural-vocative":"oxidrililor"}},{"word":"oxie","pos":"noun","definitions":["oxia"],"forms":{"plural":"oxii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oxie","accusative-definite-nominative-singular":"oxia","accusative-indefinite-nominative-plural":"oxii","accusative-definite-nominative-plural":"oxiile","dative-genitive-indefinite-singular":"oxii","dative-definite-genitive-singular":"oxiei","dative-genitive-indefinite-plural":"oxii","dative-definite-genitive-plural":"oxiilor","singular-vocative":"oxie","plural-vocative":"oxiilor"}},{"word":"oxifil","pos":"adj","definitions":["oxyphilic"],"forms":{"feminine-singular":"oxifilă","masculine-plural":"oxifili","feminine-neuter-plural":"oxifile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oxifil","error-unrecognized-form-feminine-indefinite-singular":"oxifilă","error-unrecognized-form-indefinite-masculine-plural":"oxifili","error-unrecognized-form-feminine-indefinite-neuter-plural":"oxifile","definite-error-unrecognized-form-masculine-neuter-singular":"oxifilul","definite-error-unrecognized-form-feminine-singular":"oxifila","definite-error-unrecognized-form-masculine-plural":"oxifilii","definite-error-unrecognized-form-feminine-neuter-plural":"oxifilele"}},{"word":"oxifilie","pos":"noun","definitions":["acidophilia"],"forms":{"plural":"oxifilii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oxifilie","accusative-definite-nominative-singular":"oxifilia","accusative-indefinite-nominative-plural":"oxifilii","accusative-definite-nominative-plural":"oxifiliile","dative-genitive-indefinite-singular":"oxifilii","dative-definite-genitive-singular":"oxifiliei","dative-genitive-indefinite-plural":"oxifilii","dative-definite-genitive-plural":"oxifiliilor","singular-vocative":"oxifilie","plural-vocative":"oxifiliilor"}},{"word":"oxigen","pos":"noun","definitions":["oxygen (chemical element)"],"pronunciation":"/ˌoksiˈd͡ʒen/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"oxigen","accusative-definite-nominative":"oxigenul","dative-genitive-indefinite":"oxigen","dative-definite-genitive":"oxigenului","vocative":"oxigenule"}},{"word":"oxigena","pos":"verb","definitions":["to oxygenate"],"forms":{"canonical":"a oxigena 1st conjugation","present-singular-third-person":"oxigenează","participle-past":"oxigenat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a oxigena","gerund":"oxigenând","first-person-indicative-present-singular":"oxigenez","indicative-present-second-person-singular":"oxigenezi","indicative-present-singular-third-person":"oxigenează","first-person-indicative-plural-present":"oxigenăm","indicative-plural-present-second-person":"oxigenați","indicative-plural-present-third-person":"oxigenează","first-person-imperfect-indicative-singular":"oxigenam","imperfect-indicative-second-person-singular":"oxigenai","imperfect-indicative-singular-third-person":"oxigena","first-person-imperfect-indicative-plural":"oxigenam","imperfect-indicative-plural-second-person":"oxigenați","imperfect-indicative-plural-third-person":"oxigenau","first-person-indicative-perfect-singular":"oxigenai","indicative-perfect-second-person-singular":"oxigenași","indicative-perfect-singular-third-person":"oxigenă","first-person-indicative-perfect-plural":"oxigenarăm","indicative-perfect-plural-second-person":"oxigenarăți","indicative-perfect-plural-third-person":"oxigenară","first-person-indicative-pluperfect-singular":"oxigenasem","indicative-pluperfect-second-person-singular":"oxigenaseși","indicative-pluperfect-singular-third-person":"oxigenase","first-person-indicative-pluperfect-plural":"oxigenaserăm","indicative-pluperfect-plural-second-person":"oxigenaserăți","indicative-pluperfect-plural-third-person":"oxigenaseră","first-person-present-singular-subjunctive":"să oxigenez","present-second-person-singular-subjunctive":"să oxigenezi","present-singular-subjunctive-third-person":"să oxigeneze","first-person-plural-present-subjunctive":"să oxigenăm","plural-present-second-person-subjunctive":"să oxigenați","plural-present-subjunctive-third-person":"să oxigeneze","imperative-second-person-singular":"oxigenează","imperative-plural-second-person":"oxigenați","imperative-negative-second-person-singular":"nu oxigena","imperative-negative-plural-second-person":"nu oxigenați"}},{"word":"oxigenare","pos":"noun","definitions":["oxygenation"],"forms":{"plural":"oxigenări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"oxigenare","accusative-definite-nominative-singular":"oxigenarea","accusative-indefinite-nominative-plural":"oxigenări","accusative-definite-nominative-plural":"oxigenările","dative-genitive-indefinite-singular":"oxigenări","dative-definite-genitive-singular":"oxigenării","dative-genitive-indefinite-plural":"oxigenări","dative-definite-genitive-plural":"oxigenărilor","singular-vocative":"oxigenare","plural-vocative":"oxigenărilor"}},{"word":"oxigenat","pos":"adj","definitions":["oxygenated"],"forms":{"feminine-singular":"oxigenată","masculine-plural":"oxigenați","feminine-neuter-plural":"oxigenate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oxigenat","error-unrecognized-form-feminine-indefinite-singular":"oxigenată","error-unrecognized-form-indefinite-masculine-plural":"oxigenați","error-unrecognized-form-feminine-indefinite-neuter-plural":"oxigenate","definite-error-unrecognized-form-masculine-neuter-singular":"oxigenatul","definite-error-unrecognized-form-feminine-singular":"oxigenata","definite-error-unrecognized-form-masculine-plural":"oxigenații","definite-error-unrecognized-form-feminine-neuter-plural":"oxigenatele"}},{"word":"oxigenat","pos":"verb","definitions":["past participle of oxigena"],"forms":{"participle-past":"of oxigena"}},{"word":"oxigenoterapie","pos":"noun","definitions":["oxygen therapy"],"forms":{"plural":"oxigenoterapii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oxigenoterapie","accusative-definite-nominative-singular":"oxigenoterapia","accusative-indefinite-nominative-plural":"oxigenoterapii","accusative-definite-nominative-plural":"oxigenoterapiile","dative-genitive-indefinite-singular":"oxigenoterapii","dative-definite-genitive-singular":"oxigenoterapiei","dative-genitive-indefinite-plural":"oxigenoterapii","dative-definite-genitive-plural":"oxigenoterapiilor","singular-vocative":"oxigenoterapie","plural-vocative":"oxigenoterapiilor"}},{"word":"oxihemoglobină","pos":"noun","definitions":["oxyhemoglobin"],"forms":{"plural":"oxihemoglobine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oxihemoglobină","accusative-definite-nominative-singular":"oxihemoglobina","accusative-indefinite-nominative-plural":"oxihemoglobine","accusative-definite-nominative-plural":"oxihemoglobinele","dative-genitive-indefinite-singular":"oxihemoglobine","dative-definite-genitive-singular":"oxihemoglobinei","dative-genitive-indefinite-plural":"oxihemoglobine","dative-definite-genitive-plural":"oxihemoglobinelor","singular-vocative":"oxihemoglobină","plural-vocative":"oxihemoglobinelor"}},{"word":"oxilit","pos":"noun","definitions":["oxylith"],"forms":{"plural":"oxiliți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oxilit","accusative-definite-nominative-singular":"oxilitul","accusative-indefinite-nominative-plural":"oxiliți","accusative-definite-nominative-plural":"oxiliții","dative-genitive-indefinite-singular":"oxilit","dative-definite-genitive-singular":"oxilitului","dative-genitive-indefinite-plural":"oxiliți","dative-definite-genitive-plural":"oxiliților","singular-vocative":"oxilitule","plural-vocative":"oxiliților"}},{"word":"oximetrie","pos":"noun","definitions":["oximetry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"oximetrie","accusative-definite-nominative":"oximetria","dative-genitive-indefinite":"oximetrii","dative-definite-genitive":"oximetriei","vocative":"oximetrie"}},{"word":"oximetru","pos":"noun","definitions":["oximeter"],"forms":{"plural":"oximetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oximetru","accusative-definite-nominative-singular":"oximetrul","accusative-indefinite-nominative-plural":"oximetre","accusative-definite-nominative-plural":"oximetrele","dative-genitive-indefinite-singular":"oximetru","dative-definite-genitive-singular":"oximetrului","dative-genitive-indefinite-plural":"oximetre","dative-definite-genitive-plural":"oximetrelor","singular-vocative":"oximetrule","plural-vocative":"oximetrelor"}},{"word":"oximoron","pos":"noun","definitions":["oxymoron"],"forms":{"plural":"oximorone","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oximoron","accusative-definite-nominative-singular":"oximoronul","accusative-indefinite-nominative-plural":"oximorone","accusative-definite-nominative-plural":"oximoronele","dative-genitive-indefinite-singular":"oximoron","dative-definite-genitive-singular":"oximoronului","dative-genitive-indefinite-plural":"oximorone","dative-definite-genitive-plural":"oximoronelor","singular-vocative":"oximoronule","plural-vocative":"oximoronelor"}},{"word":"oxiton","pos":"adj","definitions":["oxytone (having the stress or an acute accent on the last syllable)"],"forms":{"feminine-singular":"oxitonă","masculine-plural":"oxitoni","feminine-neuter-plural":"oxitone","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"oxiton","error-unrecognized-form-feminine-indefinite-singular":"oxitonă","error-unrecognized-form-indefinite-masculine-plural":"oxitoni","error-unrecognized-form-feminine-indefinite-neuter-plural":"oxitone","definite-error-unrecognized-form-masculine-neuter-singular":"oxitonul","definite-error-unrecognized-form-feminine-singular":"oxitona","definite-error-unrecognized-form-masculine-plural":"oxitonii","definite-error-unrecognized-form-feminine-neuter-plural":"oxitonele"}},{"word":"oxiton","pos":"noun","definitions":["oxytone (having the stress or an acute accent on the last syllable)"],"forms":{"plural":"oxitoni","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"oxiton","accusative-definite-nominative-singular":"oxitonul","accusative-indefinite-nominative-plural":"oxitoni","accusative-definite-nominative-plural":"oxitonile","dative-genitive-indefinite-singular":"oxiton","dative-definite-genitive-singular":"oxitonului","dative-genitive-indefinite-plural":"oxitoni","dative-definite-genitive-plural":"oxitonilor","singular-vocative":"oxitonule","plural-vocative":"oxitonilor"}},{"word":"oxitonie","pos":"noun","definitions":["oxytonesis"],"forms":{"plural":"oxitonii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"oxitonie","accusative-definite-nominative-singular":"oxitonia","accusative-indefinite-nominative-plural":"oxitonii","accusative-definite-nominative-plural":"oxitoniile","dative-genitive-indefinite-singular":"oxitonii","dative-definite-genitive-singular":"oxitoniei","dative-genitive-indefinite-plural":"oxitonii","dative-definite-genitive-plural":"oxitoniilor","singular-vocative":"oxitonie","plural-vocative":"oxitoniilor"}},{"word":"oxiur","pos":"noun","definitions":["pinworm"],"forms":{"plural":"oxiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"oxiur","accusative-definite-nominative-singular":"oxiurul","accusative-indefinite-nominative-plural":"oxiuri","accusative-definite-nominative-plural":"oxiurii","dative-genitive-indefinite-singular":"oxiur","dative-definite-genitive-singular":"oxiurului","dative-genitive-indefinite-plural":"oxiuri","dative-definite-genitive-plural":"oxiurilor","singular-vocative":"oxiurule","plural-vocative":"oxiurilor"}},{"word":"oxiuriază","pos":"noun","definitions":["oxyuriasis"],"forms":{"plural":"oxiuriaze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oxiuriază","accusative-definite-nominative-singular":"oxiuriaza","accusative-indefinite-nominative-plural":"oxiuriaze","accusative-definite-nominative-plural":"oxiuriazele","dative-genitive-indefinite-singular":"oxiuriaze","dative-definite-genitive-singular":"oxiuriazei","dative-genitive-indefinite-plural":"oxiuriaze","dative-definite-genitive-plural":"oxiuriazelor","singular-vocative":"oxiuriază","plural-vocative":"oxiuriazelor"}},{"word":"oxosinteză","pos":"noun","definitions":["oxosynthesis, hydroformylation"],"forms":{"plural":"oxosinteze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"oxosinteză","accusative-definite-nominative-singular":"oxosinteza","accusative-indefinite-nominative-plural":"oxosinteze","accusative-definite-nominative-plural":"oxosintezele","dative-genitive-indefinite-singular":"oxosinteze","dative-definite-genitive-singular":"oxosintezei","dative-genitive-indefinite-plural":"oxosinteze","dative-definite-genitive-plural":"oxosintezelor","singular-vocative":"oxosinteză","plural-vocative":"oxosintezelor"}},{"word":"ozalid","pos":"noun","definitions":["blueprint (paper)"],"forms":{"plural":"ozaliduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ozalid","accusative-definite-nominative-singular":"ozalidul","accusative-indefinite-nominative-plural":"ozaliduri","accusative-definite-nominative-plural":"ozalidurile","dative-genitive-indefinite-singular":"ozalid","dative-definite-genitive-singular":"ozalidului","dative-genitive-indefinite-plural":"ozaliduri","dative-definite-genitive-plural":"ozalidurilor","singular-vocative":"ozalidule","plural-vocative":"ozalidurilor"}},{"word":"Ozd","pos":"name","definitions":["a village in Bichiș, Mureș County, Romania"],"gender":"m"},{"word":"ozenă","pos":"noun","definitions":["ozene"],"forms":{"plural":"ozene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ozenă","accusative-definite-nominative-singular":"ozena","accusative-indefinite-nominative-plural":"ozene","accusative-definite-nominative-plural":"ozenele","dative-genitive-indefinite-singular":"ozene","dative-definite-genitive-singular":"ozenei","dative-genitive-indefinite-plural":"ozene","dative-definite-genitive-plural":"ozenelor","singular-vocative":"ozenă","plural-vocative":"ozenelor"}},{"word":"ozeneu","pos":"noun","definitions":["UFO, unidentified flying object"],"forms":{"plural":"ozeneuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ozeneu","accusative-definite-nominative-singular":"ozeneuul","accusative-indefinite-nominative-plural":"ozeneuri","accusative-definite-nominative-plural":"ozeneurile","dative-genitive-indefinite-singular":"ozeneu","dative-definite-genitive-singular":"ozeneuului","dative-genitive-indefinite-plural":"ozeneuri","dative-definite-genitive-plural":"ozeneurilor","singular-vocative":"ozeneuule","plural-vocative":"ozeneurilor"}},{"word":"OZN","pos":"noun","definitions":["UFO: abbreviation of obiect zburător neidentificat"]},{"word":"ozocherită","pos":"noun","definitions":["ozokerite"],"forms":{"plural":"ozocherite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ozocherită","accusative-definite-nominative-singular":"ozocherita","accusative-indefinite-nominative-plural":"ozocherite","accusative-definite-nominative-plural":"ozocheritele","dative-genitive-indefinite-singular":"ozocherite","dative-definite-genitive-singular":"ozocheritei","dative-genitive-indefinite-plural":"ozocherite","dative-definite-genitive-plural":"ozocheritelor","singular-vocative":"ozocherită","plural-vocative":"ozocheritelor"}},{"word":"ozon","pos":"noun","definitions":["ozone"],"pronunciation":"/oˈzon/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ozon","accusative-definite-nominative":"ozonul","dative-genitive-indefinite":"ozon","dative-definite-genitive":"ozonului","vocative":"ozonule"}},{"word":"ozona","pos":"verb","definitions":["to ozonate"],"forms":{"canonical":"a ozona 1st conjugation","present-singular-third-person":"ozonează","participle-past":"ozonat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ozona","gerund":"ozonând","first-person-indicative-present-singular":"ozonez","indicative-present-second-person-singular":"ozonezi","indicative-present-singular-third-person":"ozonează","first-person-indicative-plural-present":"ozonăm","indicative-plural-present-second-person":"ozonați","indicative-plural-present-third-person":"ozonează","first-person-imperfect-indicative-singular":"ozonam","imperfect-indicative-second-person-singular":"ozonai","imperfect-indicative-singular-third-person":"ozona","first-person-imperfect-indicative-plural":"ozonam","imperfect-indicative-plural-second-person":"ozonați","imperfect-indicative-plural-third-person":"ozonau","first-person-indicative-perfect-singular":"ozonai","indicative-perfect-second-person-singular":"ozonași","indicative-perfect-singular-third-person":"ozonă","first-person-indicative-perfect-plural":"ozonarăm","indicative-perfect-plural-second-person":"ozonarăți","indicative-perfect-plural-third-person":"ozonară","first-person-indicative-pluperfect-singular":"ozonasem","indicative-pluperfect-second-person-singular":"ozonaseși","indicative-pluperfect-singular-third-person":"ozonase","first-person-indicative-pluperfect-plural":"ozonaserăm","indicative-pluperfect-plural-second-person":"ozonaserăți","indicative-pluperfect-plural-third-person":"ozonaseră","first-person-present-singular-subjunctive":"să ozonez","present-second-person-singular-subjunctive":"să ozonezi","present-singular-subjunctive-third-person":"să ozoneze","first-person-plural-present-subjunctive":"să ozonăm","plural-present-second-person-subjunctive":"să ozonați","plural-present-subjunctive-third-person":"să ozoneze","imperative-second-person-singular":"ozonează","imperative-plural-second-person":"ozonați","imperative-negative-second-person-singular":"nu ozona","imperative-negative-plural-second-person":"nu ozonați"}},{"word":"ozonat","pos":"adj","definitions":["ozonated"],"forms":{"feminine-singular":"ozonată","masculine-plural":"ozonați","feminine-neuter-plural":"ozonate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ozonat","error-unrecognized-form-feminine-indefinite-singular":"ozonată","error-unrecognized-form-indefinite-masculine-plural":"ozonați","error-unrecognized-form-feminine-indefinite-neuter-plural":"ozonate","definite-error-unrecognized-form-masculine-neuter-singular":"ozonatul","definite-error-unrecognized-form-feminine-singular":"ozonata","definite-error-unrecognized-form-masculine-plural":"ozonații","definite-error-unrecognized-form-feminine-neuter-plural":"ozonatele"}},{"word":"ozonat","pos":"verb","definitions":["past participle of ozona"],"forms":{"participle-past":"of ozona"}},{"word":"ozonidă","pos":"noun","definitions":["ozonide"],"forms":{"plural":"ozonide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ozonidă","accusative-definite-nominative-singular":"ozonida","accusative-indefinite-nominative-plural":"ozonide","accusative-definite-nominative-plural":"ozonidele","dative-genitive-indefinite-singular":"ozonide","dative-definite-genitive-singular":"ozonidei","dative-genitive-indefinite-plural":"ozonide","dative-definite-genitive-plural":"ozonidelor","singular-vocative":"ozonidă","plural-vocative":"ozonidelor"}},{"word":"ozonifica","pos":"verb","definitions":["to ozonify"],"forms":{"canonical":"a ozonifica 1st conjugation","present-singular-third-person":"ozonifică","participle-past":"ozonificat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a ozonifica","gerund":"ozonificând","first-person-indicative-present-singular":"ozonific","indicative-present-second-person-singular":"ozonifici","indicative-present-singular-third-person":"ozonifică","first-person-indicative-plural-present":"ozonificăm","indicative-plural-present-second-person":"ozonificați","indicative-plural-present-third-person":"ozonifică","first-person-imperfect-indicative-singular":"ozonificam","imperfect-indicative-second-person-singular":"ozonificai","imperfect-indicative-singular-third-person":"ozonifica","first-person-imperfect-indicative-plural":"ozonificam","imperfect-indicative-plural-second-person":"ozonificați","imperfect-indicative-plural-third-person":"ozonificau","first-person-indicative-perfect-singular":"ozonificai","indicative-perfect-second-person-singular":"ozonificași","indicative-perfect-singular-third-person":"ozonifică","first-person-indicative-perfect-plural":"ozonificarăm","indicative-perfect-plural-second-person":"ozonificarăți","indicative-perfect-plural-third-person":"ozonificară","first-person-indicative-pluperfect-singular":"ozonificasem","indicative-pluperfect-second-person-singular":"ozonificaseși","indicative-pluperfect-singular-third-person":"ozonificase","first-person-indicative-pluperfect-plural":"ozonificaserăm","indicative-pluperfect-plural-second-person":"ozonificaserăți","indicative-pluperfect-plural-third-person":"ozonificaseră","first-person-present-singular-subjunctive":"să ozonific","present-second-person-singular-subjunctive":"să ozonifici","present-singular-subjunctive-third-person":"să ozonifice","first-person-plural-present-subjunctive":"să ozonificăm","plural-present-second-person-subjunctive":"să ozonificați","plural-present-subjunctive-third-person":"să ozonifice","imperative-second-person-singular":"ozonifică","imperative-plural-second-person":"ozonificați","imperative-negative-second-person-singular":"nu ozonifica","imperative-negative-plural-second-person":"nu ozonificați"}},{"word":"ozoniza","pos":"verb","definitions":["to ozonize"],"forms":{"canonical":"a ozoniza 1st conjugation","present-singular-third-person":"ozonizează","participle-past":"ozonizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ozoniza","gerund":"ozonizând","first-person-indicative-present-singular":"ozonizez","indicative-present-second-person-singular":"ozonizezi","indicative-present-singular-third-person":"ozonizează","first-person-indicative-plural-present":"ozonizăm","indicative-plural-present-second-person":"ozonizați","indicative-plural-present-third-person":"ozonizează","first-person-imperfect-indicative-singular":"ozonizam","imperfect-indicative-second-person-singular":"ozonizai","imperfect-indicative-singular-third-person":"ozoniza","first-person-imperfect-indicative-plural":"ozonizam","imperfect-indicative-plural-second-person":"ozonizați","imperfect-indicative-plural-third-person":"ozonizau","first-person-indicative-perfect-singular":"ozonizai","indicative-perfect-second-person-singular":"ozonizași","indicative-perfect-singular-third-person":"ozoniză","first-person-indicative-perfect-plural":"ozonizarăm","indicative-perfect-plural-second-person":"ozonizarăți","indicative-perfect-plural-third-person":"ozonizară","first-person-indicative-pluperfect-singular":"ozonizasem","indicative-pluperfect-second-person-singular":"ozonizaseși","indicative-pluperfect-singular-third-person":"ozonizase","first-person-indicative-pluperfect-plural":"ozonizaserăm","indicative-pluperfect-plural-second-person":"ozonizaserăți","indicative-pluperfect-plural-third-person":"ozonizaseră","first-person-present-singular-subjunctive":"să ozonizez","present-second-person-singular-subjunctive":"să ozonizezi","present-singular-subjunctive-third-person":"să ozonizeze","first-person-plural-present-subjunctive":"să ozonizăm","plural-present-second-person-subjunctive":"să ozonizați","plural-present-subjunctive-third-person":"să ozonizeze","imperative-second-person-singular":"ozonizează","imperative-plural-second-person":"ozonizați","imperative-negative-second-person-singular":"nu ozoniza","imperative-negative-plural-second-person":"nu ozonizați"}},{"word":"ozonizare","pos":"noun","definitions":["ozonation"],"forms":{"plural":"ozonizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ozonizare","accusative-definite-nominative-singular":"ozonizarea","accusative-indefinite-nominative-plural":"ozonizări","accusative-definite-nominative-plural":"ozonizările","dative-genitive-indefinite-singular":"ozonizări","dative-definite-genitive-singular":"ozonizării","dative-genitive-indefinite-plural":"ozonizări","dative-definite-genitive-plural":"ozonizărilor","singular-vocative":"ozonizare","plural-vocative":"ozonizărilor"}},{"word":"ozonizat","pos":"adj","definitions":["ozonated"],"forms":{"feminine-singular":"ozonizată","masculine-plural":"ozonizați","feminine-neuter-plural":"ozonizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ozonizat","error-unrecognized-form-feminine-indefinite-singular":"ozonizată","error-unrecognized-form-indefinite-masculine-plural":"ozonizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"ozonizate","definite-error-unrecognized-form-masculine-neuter-singular":"ozonizatul","definite-error-unrecognized-form-feminine-singular":"ozonizata","definite-error-unrecognized-form-masculine-plural":"ozonizații","definite-error-unrecognized-form-feminine-neuter-plural":"ozonizatele"}},{"word":"ozonizator","pos":"noun","definitions":["ozonizer"],"forms":{"plural":"ozonizatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ozonizator","accusative-definite-nominative-singular":"ozonizatorul","accusative-indefinite-nominative-plural":"ozonizatore","accusative-definite-nominative-plural":"ozonizatorele","dative-genitive-indefinite-singular":"ozonizator","dative-definite-genitive-singular":"ozonizatorului","dative-genitive-indefinite-plural":"ozonizatore","dative-definite-genitive-plural":"ozonizatorelor","singular-vocative":"ozonizatorule","plural-vocative":"ozonizatorelor"}},{"word":"ozonizor","pos":"noun","definitions":["ozonizer"],"forms":{"plural":"ozonizoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ozonizor","accusative-definite-nominative-singular":"ozonizorul","accusative-indefinite-nominative-plural":"ozonizore","accusative-definite-nominative-plural":"ozonizorele","dative-genitive-indefinite-singular":"ozonizor","dative-definite-genitive-singular":"ozonizorului","dative-genitive-indefinite-plural":"ozonizore","dative-definite-genitive-plural":"ozonizorelor","singular-vocative":"ozonizorule","plural-vocative":"ozonizorelor"}},{"word":"ozonometric","pos":"adj","definitions":["ozonometric"],"forms":{"feminine-singular":"ozonometrică","masculine-plural":"ozonometrici","feminine-neuter-plural":"ozonometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ozonometric","error-unrecognized-form-feminine-indefinite-singular":"ozonometrică","error-unrecognized-form-indefinite-masculine-plural":"ozonometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ozonometrice","definite-error-unrecognized-form-masculine-neuter-singular":"ozonometricul","definite-error-unrecognized-form-feminine-singular":"ozonometrica","definite-error-unrecognized-form-masculine-plural":"ozonometricii","definite-error-unrecognized-form-feminine-neuter-plural":"ozonometricele"}},{"word":"ozonometrie","pos":"noun","definitions":["ozonometry"],"forms":{"plural":"ozonometrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ozonometrie","accusative-definite-nominative-singular":"ozonometria","accusative-indefinite-nominative-plural":"ozonometrii","accusative-definite-nominative-plural":"ozonometriile","dative-genitive-indefinite-singular":"ozonometrii","dative-definite-genitive-singular":"ozonometriei","dative-genitive-indefinite-plural":"ozonometrii","dative-definite-genitive-plural":"ozonometriilor","singular-vocative":"ozonometrie","plural-vocative":"ozonometriilor"}},{"word":"ozonometru","pos":"noun","definitions":["ozonometer"],"forms":{"plural":"ozonometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ozonometru","accusative-definite-nominative-singular":"ozonometrul","accusative-indefinite-nominative-plural":"ozonometre","accusative-definite-nominative-plural":"ozonometrele","dative-genitive-indefinite-singular":"ozonometru","dative-definite-genitive-singular":"ozonometrului","dative-genitive-indefinite-plural":"ozonometre","dative-definite-genitive-plural":"ozonometrelor","singular-vocative":"ozonometrule","plural-vocative":"ozonometrelor"}},{"word":"ozonoscop","pos":"noun","definitions":["ozonoscope"],"forms":{"plural":"ozonoscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ozonoscop","accusative-definite-nominative-singular":"ozonoscopul","accusative-indefinite-nominative-plural":"ozonoscoape","accusative-definite-nominative-plural":"ozonoscoapele","dative-genitive-indefinite-singular":"ozonoscop","dative-definite-genitive-singular":"ozonoscopului","dative-genitive-indefinite-plural":"ozonoscoape","dative-definite-genitive-plural":"ozonoscoapelor","singular-vocative":"ozonoscopule","plural-vocative":"ozonoscoapelor"}},{"word":"ozonosferă","pos":"noun","definitions":["ozonosphere"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ozonosferă","accusative-definite-nominative-singular":"ozonosfera","accusative-indefinite-nominative-plural":"ozonosfere","accusative-definite-nominative-plural":"ozonosferele","dative-genitive-indefinite-singular":"ozonosfere","dative-definite-genitive-singular":"ozonosferei","dative-genitive-indefinite-plural":"ozonosfere","dative-definite-genitive-plural":"ozonosferelor","singular-vocative":"ozonosferă","plural-vocative":"ozonosferelor"}},{"word":"ozonoterapie","pos":"noun","definitions":["ozone therapy"],"forms":{"plural":"ozonoterapii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ozonoterapie","accusative-definite-nominative-singular":"ozonoterapia","accusative-indefinite-nominative-plural":"ozonoterapii","accusative-definite-nominative-plural":"ozonoterapiile","dative-genitive-indefinite-singular":"ozonoterapii","dative-definite-genitive-singular":"ozonoterapiei","dative-genitive-indefinite-plural":"ozonoterapii","dative-definite-genitive-plural":"ozonoterapiilor","singular-vocative":"ozonoterapie","plural-vocative":"ozonoterapiilor"}},{"word":"Ozun","pos":"name","definitions":["a commune of Covasna County, Romania","a village in Ozun, Covasna County, Romania"],"gender":"m"},{"word":"Ozunca","pos":"name","definitions":["a river in Covasna County, Romania, tributary to the Baraolt"],"gender":"f"},{"word":"Ozunca-Băi","pos":"name","definitions":["a village in Bățani, Covasna County, Romania"],"gender":"f"}];
@@ -1 +1 @@
-export default [{"word":"-a","pos":"suffix","definitions":["the (feminine singular, nominative and accusative)"],"pronunciation":"/a/","gender":"f","forms":{"alternative":"-ua"}},{"word":"-a","pos":"suffix","definitions":["A suffix forming infinitives of first conjugation verbs."],"pronunciation":"/a/","forms":{"table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a -a","gerund":"-ând","participle-past":"-at","error-unrecognized-form-indicative-present-singular":"-","indicative-present-second-person-singular":"-i","first-person-indicative-plural-present":"-ăm","indicative-plural-present-second-person":"-ați","error-unrecognized-form-indicative-plural-present":"-ă","error-unrecognized-form-imperfect-indicative-singular":"-am","imperfect-indicative-second-person-singular":"-ai","first-person-imperfect-indicative-plural":"-am","imperfect-indicative-plural-second-person":"-ați","error-unrecognized-form-imperfect-indicative-plural":"-au","error-unrecognized-form-indicative-perfect-singular":"-ai","indicative-perfect-second-person-singular":"-ași","first-person-indicative-perfect-plural":"-arăm","indicative-perfect-plural-second-person":"-arăți","error-unrecognized-form-indicative-perfect-plural":"-ară","error-unrecognized-form-indicative-pluperfect-singular":"-asem","indicative-pluperfect-second-person-singular":"-aseși","first-person-indicative-pluperfect-plural":"-aserăm","indicative-pluperfect-plural-second-person":"-aserăți","error-unrecognized-form-indicative-pluperfect-plural":"-aseră","error-unrecognized-form-present-singular-subjunctive":"să -","present-second-person-singular-subjunctive":"să -i","first-person-plural-present-subjunctive":"să -ăm","plural-present-second-person-subjunctive":"să -ați","error-unrecognized-form-plural-present-subjunctive":"să -e","imperative-positive-second-person-singular":"-ă","imperative-plural-positive-second-person":"-ați","imperative-negative-second-person-singular":"nu -a","imperative-negative-plural-second-person":"nu -ați"}},{"word":"-abilitate","pos":"suffix","definitions":["-ability"],"pronunciation":"/abiliˈtate/","forms":{"plural":"-abilități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-abilitate","accusative-definite-nominative-singular":"-abilitatea","accusative-indefinite-nominative-plural":"-abilități","accusative-definite-nominative-plural":"-abilitățile","dative-genitive-indefinite-singular":"-abilități","dative-definite-genitive-singular":"-abilității","dative-genitive-indefinite-plural":"-abilități","dative-definite-genitive-plural":"-abilităților","singular-vocative":"-abilitate","plural-vocative":"-abilităților","alternative":"-ibilitate"}},{"word":"-abilitatea","pos":"suffix","definitions":["definite nominative/accusative singular of -abilitate"],"pronunciation":"/abiliˈtate̯a/"},{"word":"-abilitateo","pos":"suffix","definitions":["vocative singular of -abilitate"],"pronunciation":"/abiliˈtate̯o/"},{"word":"-abilități","pos":"suffix","definitions":["inflection of -abilitate:","indefinite nominative/accusative/genitive/dative plural","indefinite genitive/dative singular"],"pronunciation":"/abiliˈtət͡sʲ/"},{"word":"-abilității","pos":"suffix","definitions":["definite genitive/dative singular of -abilitate"],"pronunciation":"/abiliˈtət͡sij/"},{"word":"-abilitățile","pos":"suffix","definitions":["definite nominative/accusative plural of -abilitate"],"pronunciation":"/abiliˈtət͡sile/"},{"word":"-abilităților","pos":"suffix","definitions":["inflection of -abilitate:","definite genitive/dative plural","vocative plural"],"pronunciation":"/abiliˈtət͡silor/"},{"word":"-aie","pos":"suffix","definitions":["used to form collective nouns with some words"],"pronunciation":"/ˈa.je/","forms":{"plural":"-ăi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"-aie","accusative-definite-nominative-singular":"-aia","accusative-indefinite-nominative-plural":"-ăi","accusative-definite-nominative-plural":"-ăile","dative-genitive-indefinite-singular":"-ăi","dative-definite-genitive-singular":"-ăii","dative-genitive-indefinite-plural":"-ăi","dative-definite-genitive-plural":"-ăilor","singular-vocative":"-aie","plural-vocative":"-ăilor"}},{"word":"-aj","pos":"suffix","definitions":["-age"],"pronunciation":"/aʒ/","forms":{"plural":"-aje"}},{"word":"-al","pos":"suffix","definitions":["-al; of or pertaining to, forms adjectives from nouns."],"pronunciation":"/al/","examples":[{"ro":"săptămână (“week”) + -al → săptămânal (“weekly”)","en":null}],"forms":{"feminine-singular":"-ală","masculine-plural":"-ali","feminine-neuter-plural":"-ale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-al","error-unrecognized-form-feminine-indefinite-singular":"-ală","error-unrecognized-form-indefinite-masculine-plural":"-ali","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ale","definite-error-unrecognized-form-masculine-neuter-singular":"-alul","definite-error-unrecognized-form-feminine-singular":"-ala","definite-error-unrecognized-form-masculine-plural":"-alii","definite-error-unrecognized-form-feminine-neuter-plural":"-alele"}},{"word":"-ală","pos":"suffix","definitions":["indefinite feminine nominative/accusative singular of -al"]},{"word":"-ame","pos":"suffix","definitions":["used to form collective nouns with some words"],"examples":[{"ro":"haiduc (“outlaw”) + -ame → haiducame (“band of outlaws”)","en":null},{"ro":"voinic (“soldier”) + -ame → voinicame (“army”)","en":null},{"ro":"copil (“child”) + -ame → copilame (“group of children”)","en":null}]},{"word":"-an","pos":"suffix","definitions":["Forms adjectives and nouns describing things and characteristics of a city, region, or country; -an"],"pronunciation":"/an/","examples":[{"ro":"Australia (“Australia”) + -an → australian (“Australian”)","en":null},{"ro":"America (“America”) + -an → american (“American”)","en":null}],"forms":{"feminine-singular":"-ană","masculine-plural":"-ani","feminine-neuter-plural":"-ane"}},{"word":"-an","pos":"suffix","definitions":["Added to nouns and adjectives as an augmentative suffix.","Forms names of male animals."],"pronunciation":"/an/","examples":[{"ro":"gras (“fat”) + -an → grăsan (“fatso”)","en":null},{"ro":"gâscă (“goose”) + -an → gâscan (“gander”)","en":null}],"forms":{"feminine-singular":"-ană","masculine-plural":"-ani","feminine-neuter-plural":"-ane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-an","error-unrecognized-form-feminine-indefinite-singular":"-ană","error-unrecognized-form-indefinite-masculine-plural":"-ani","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ane","definite-error-unrecognized-form-masculine-neuter-singular":"-anul","definite-error-unrecognized-form-feminine-singular":"-ana","definite-error-unrecognized-form-masculine-plural":"-anii","definite-error-unrecognized-form-feminine-neuter-plural":"-anele"}},{"word":"-anță","pos":"suffix","definitions":["-ance"],"pronunciation":"/ˈan.t͡sə/","forms":{"plural":"-anțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-anță","accusative-definite-nominative-singular":"-anța","accusative-indefinite-nominative-plural":"-anțe","accusative-definite-nominative-plural":"-anțele","dative-genitive-indefinite-singular":"-anțe","dative-definite-genitive-singular":"-anței","dative-genitive-indefinite-plural":"-anțe","dative-definite-genitive-plural":"-anțelor","singular-vocative":"-anță","plural-vocative":"-anțelor","alternative":"-ință"}},{"word":"-ar","pos":"suffix","definitions":["Added to a word to denote a profession or craft; -er"],"pronunciation":"/ar/","examples":[{"ro":"roată (“wheel”) + -ar → rotar (“wheeler”)","en":null},{"ro":"oală (“pot”) + -ar → olar (“potter”)","en":null},{"ro":"fier (“iron”) + -ar → fierar (“blacksmith”)","en":null}],"forms":{"plural":"-ari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"-ar","accusative-definite-nominative-singular":"-arul","accusative-indefinite-nominative-plural":"-ari","accusative-definite-nominative-plural":"-arii","dative-genitive-indefinite-singular":"-ar","dative-definite-genitive-singular":"-arului","dative-genitive-indefinite-plural":"-ari","dative-definite-genitive-plural":"-arilor","singular-vocative":"-arule","plural-vocative":"-arilor","alternative":"-ariu"}},{"word":"-arilor","pos":"suffix","definitions":["definite genitive/dative plural of -ar"]},{"word":"-arul","pos":"suffix","definitions":["definite nominative/accusative singular of -ar"]},{"word":"-arului","pos":"suffix","definitions":["definite genitive/dative singular of -ar"]},{"word":"-aș","pos":"suffix","definitions":["diminutive suffix (e.g. copil (“child”) + -aș → copilaș (“little child”))","used with a noun to make words related to profession"],"pronunciation":"/aʃ/","examples":[{"ro":"meserie (“handcraft”) + -aș → meseriaș (“handicraftsman”)","en":null},{"ro":"poștă (“mail”) + -aș → poștaș (“postman”)","en":null}],"forms":{"plural":"-ași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"-aș","accusative-definite-nominative-singular":"-așul","accusative-indefinite-nominative-plural":"-ași","accusative-definite-nominative-plural":"-așii","dative-genitive-indefinite-singular":"-aș","dative-definite-genitive-singular":"-așului","dative-genitive-indefinite-plural":"-ași","dative-definite-genitive-plural":"-așilor","singular-vocative":"-așule","plural-vocative":"-așilor"}},{"word":"-at","pos":"suffix","definitions":["Used with a stem to form the masculine singular past participle of regular -a (first conjugation) verbs."],"pronunciation":"/at/","examples":[{"ro":"arunca (“to throw”) + -at → aruncat (“thrown”)","en":null},{"ro":"cânta (“to sing”) + -at → cântat (“sung”)","en":null}],"forms":{"feminine-singular":"-ată","masculine-plural":"-ați","feminine-neuter-plural":"-ate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-at","error-unrecognized-form-feminine-indefinite-singular":"-ată","error-unrecognized-form-indefinite-masculine-plural":"-ați","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ate","definite-error-unrecognized-form-masculine-neuter-singular":"-atul","definite-error-unrecognized-form-feminine-singular":"-ata","definite-error-unrecognized-form-masculine-plural":"-ații","definite-error-unrecognized-form-feminine-neuter-plural":"-atele"}},{"word":"-ată","pos":"suffix","definitions":["used with a stem to form the feminine singular past participle of -a (first conjugation) verbs. (e.g. botezată, înghețată, etc.)"],"pronunciation":"/ˈa.tə/","forms":{"masculine":"-at","masculine-plural":"-ați","feminine-plural":"-ate"}},{"word":"-ate","pos":"suffix","definitions":["used with a stem to form the feminine plural past participle of regular -a (first conjugation) verbs. (e.g. lăsate, măsurate, etc.)"],"pronunciation":"/ˈa.te/","forms":{"masculine-singular":"-at","feminine-singular":"-ată","masculine-plural":"-ați"}},{"word":"-atic","pos":"suffix","definitions":["Used to form some adjectives (and sometimes nouns derived from them) meaning \"of\", \"like\", \"characteristic of\", etc."],"pronunciation":"/ˈa.tik/","examples":[{"ro":"iarnă (“winter”) + -atic → iernatic (“of the winter, hibernal”)","en":null},{"ro":"toamnă (“autumn”) + -atic → tomnatic (“of the autumn, autumnal”)","en":null},{"ro":"zână (“fairy”) + -atic → zănatic (“crazy”)","en":null}],"forms":{"feminine-singular":"-atică","masculine-plural":"-atici","feminine-neuter-plural":"-atice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-atic","error-unrecognized-form-feminine-indefinite-singular":"-atică","error-unrecognized-form-indefinite-masculine-plural":"-atici","error-unrecognized-form-feminine-indefinite-neuter-plural":"-atice","definite-error-unrecognized-form-masculine-neuter-singular":"-aticul","definite-error-unrecognized-form-feminine-singular":"-atica","definite-error-unrecognized-form-masculine-plural":"-aticii","definite-error-unrecognized-form-feminine-neuter-plural":"-aticele","alternative":"-atec"}},{"word":"-ați","pos":"suffix","definitions":["used with a stem to form the masculine plural past participle of regular -a (first conjugation) verbs. (e.g. adunați, spurcați, etc.)"],"pronunciation":"/at͡sʲ/","forms":{"masculine-singular":"-at","feminine-singular":"-ată","feminine-plural":"-ate"}},{"word":"-ă","pos":"suffix","definitions":["Forms certain female equivalent nouns."],"gender":"f","examples":[{"ro":"student + -ă → studentă","en":null}],"forms":{"plural":"-e","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-ă","accusative-definite-nominative-singular":"-a","accusative-indefinite-nominative-plural":"-e","accusative-definite-nominative-plural":"-ele","dative-genitive-indefinite-singular":"-e","dative-definite-genitive-singular":"-ei","dative-genitive-indefinite-plural":"-e","dative-definite-genitive-plural":"-elor","singular-vocative":"-ă","plural-vocative":"-elor"}},{"word":"-ăciune","pos":"suffix","definitions":["alternative form of -ciune"],"pronunciation":"/əˈt͡ʃʲune/","forms":{"plural":"-ăciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-ăciune","accusative-definite-nominative-singular":"-ăciunea","accusative-indefinite-nominative-plural":"ăciuni","accusative-definite-nominative-plural":"ăciunile","dative-genitive-indefinite-singular":"ăciuni","dative-definite-genitive-singular":"ăciunii","dative-genitive-indefinite-plural":"ăciuni","dative-definite-genitive-plural":"ăciunilor","singular-vocative":"-ăciune","plural-vocative":"ăciunilor"}},{"word":"-ăreață","pos":"suffix","definitions":["feminine counterpart of -ăreț"]},{"word":"-ăreț","pos":"suffix","definitions":["Forms nouns or adjectives indicating propensity or likeness, being inclined toward, or having the quality of; can be roughly comparable to English -y or -ish in some cases; see also -eț, with a similar function"],"pronunciation":"/əˈret͡s/","forms":{"feminine-singular":"-ăreață","masculine-plural":"-ăreți","feminine-neuter-plural":"-ărețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-ăreț","error-unrecognized-form-feminine-indefinite-singular":"-ăreață","error-unrecognized-form-indefinite-masculine-plural":"-ăreți","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ărețe","definite-error-unrecognized-form-masculine-neuter-singular":"-ărețul","definite-error-unrecognized-form-feminine-singular":"-ăreața","definite-error-unrecognized-form-masculine-plural":"-ăreții","definite-error-unrecognized-form-feminine-neuter-plural":"-ărețele"}},{"word":"-ărie","pos":"suffix","definitions":["Added to nouns to form other nouns meaning \"place of\" (an art, craft, or practice).","Added to nouns to form a class, group, or classification of objects"],"gender":"f","examples":[{"ro":"floare (“flower”) + -ărie → florărie (“flower shop”)","en":null},{"ro":"benzină (“gasoline”) + -ărie → benzinărie (“gas station”)","en":null},{"ro":"oțel (“steel”) + -ărie → oțelărie (“steelworks”)","en":null}],"forms":{"alternative":"-erie"}},{"word":"-ăt","pos":"suffix","definitions":["alternative form of -et"],"pronunciation":"/ət/","forms":{"plural":"-ete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"-ăt","accusative-definite-nominative-singular":"-ătul","accusative-indefinite-nominative-plural":"-ete","accusative-definite-nominative-plural":"-etele","dative-genitive-indefinite-singular":"-ăt","dative-definite-genitive-singular":"-ătului","dative-genitive-indefinite-plural":"-ete","dative-definite-genitive-plural":"-etelor","singular-vocative":"-ătule","plural-vocative":"-etelor"}},{"word":"-ătate","pos":"suffix","definitions":["alternative form of -tate (“-ity”)"],"pronunciation":"/əˈta.te/","forms":{"plural":"-ătăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-ătate","accusative-definite-nominative-singular":"-ătatea","accusative-indefinite-nominative-plural":"-ătăți","accusative-definite-nominative-plural":"-ătățile","dative-genitive-indefinite-singular":"-ătăți","dative-definite-genitive-singular":"-ătății","dative-genitive-indefinite-plural":"-ătăți","dative-definite-genitive-plural":"-ătăților","singular-vocative":"-ătate","plural-vocative":"-ătăților","alternative":"-tate"}},{"word":"-ător","pos":"suffix","definitions":["alternative form of -tor"],"forms":{"feminine-singular":"-ătoare","masculine-plural":"-ători","feminine-neuter-plural":"-ătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-ător","error-unrecognized-form-feminine-indefinite-singular":"-ătoare","error-unrecognized-form-indefinite-masculine-plural":"-ători","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ătoare","definite-error-unrecognized-form-masculine-neuter-singular":"-ătorul","definite-error-unrecognized-form-feminine-singular":"-ătoarea","definite-error-unrecognized-form-masculine-plural":"-ătorii","definite-error-unrecognized-form-feminine-neuter-plural":"-ătoarele"}},{"word":"-ătură","pos":"suffix","definitions":["alternative form of -tură"],"forms":{"plural":"-ături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"-ătură","accusative-definite-nominative-singular":"-ătura","accusative-indefinite-nominative-plural":"-ături","accusative-definite-nominative-plural":"-ăturile","dative-genitive-indefinite-singular":"-ături","dative-definite-genitive-singular":"-ăturii","dative-genitive-indefinite-plural":"-ături","dative-definite-genitive-plural":"-ăturilor","singular-vocative":"-ătură","plural-vocative":"-ăturilor"}},{"word":"-ând","pos":"suffix","definitions":["Used with a stem to form the gerund in -a (first conjugation), -ea (second conjugation), and -e (third conjugation) verbs, as well as -î verbs (a minority of fourth conjugation verbs)."],"pronunciation":"/ɨnd/","examples":[{"ro":"cânta + -ând → cântând","en":null},{"ro":"putea + -ând → putând","en":null},{"ro":"face + -ând → făcând","en":null}],"forms":{"alternative":"-înd"}},{"word":"-bil","pos":"suffix","definitions":["-able, -ible (forms adjectives with the meaning \"able to be\" from verbs)"],"pronunciation":"/bil/","examples":[{"ro":"gonfla + -bil → gonflabil","en":null},{"ro":"substitui + -bil → substituibil","en":null},{"ro":"bea + -bil → băubil","en":null}],"forms":{"feminine-singular":"-bilă","masculine-plural":"-bili","feminine-neuter-plural":"-bile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-bil","error-unrecognized-form-feminine-indefinite-singular":"-bilă","error-unrecognized-form-indefinite-masculine-plural":"-bili","error-unrecognized-form-feminine-indefinite-neuter-plural":"-bile","definite-error-unrecognized-form-masculine-neuter-singular":"-bilul","definite-error-unrecognized-form-feminine-singular":"-bila","definite-error-unrecognized-form-masculine-plural":"-bilii","definite-error-unrecognized-form-feminine-neuter-plural":"-bilele"}},{"word":"-că","pos":"suffix","definitions":["Forms feminine nouns from masculine nouns."],"examples":[{"ro":"român (“Romanian”) + -că → româncă (“Romanian woman”)","en":null},{"ro":"cetățean (“citizen”) + -că → cetățeancă (“female citizen”)","en":null}],"forms":{"plural":"-ce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-că","accusative-definite-nominative-singular":"-ca","accusative-indefinite-nominative-plural":"-ce","accusative-definite-nominative-plural":"-cele","dative-genitive-indefinite-singular":"-ce","dative-definite-genitive-singular":"-cei","dative-genitive-indefinite-plural":"-ce","dative-definite-genitive-plural":"-celor","singular-vocative":"-că","plural-vocative":"-celor"}},{"word":"-ciune","pos":"suffix","definitions":["roughly equivalent to -tion; was used to form a noun when added to a verb root, describing that action or state related to the verb (also used with adjective roots sometimes)"],"pronunciation":"/ˈt͡ʃʲune/","examples":[{"ro":"a înșela (“to deceive”) + -ciune → înșelăciune (“fraud”)","en":null},{"ro":"a ruga (“to ask for; to pray”) + -ciune → rugăciune (“prayer”)","en":null}],"forms":{"plural":"-ciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-ciune","accusative-definite-nominative-singular":"-ciunea","accusative-indefinite-nominative-plural":"-ciuni","accusative-definite-nominative-plural":"-ciunile","dative-genitive-indefinite-singular":"-ciuni","dative-definite-genitive-singular":"-ciunii","dative-genitive-indefinite-plural":"-ciuni","dative-definite-genitive-plural":"-ciunilor","singular-vocative":"-ciune","plural-vocative":"-ciunilor","alternative":"-ăciune"}},{"word":"-ciuni","pos":"suffix","definitions":["plural of -ciune"]},{"word":"-coc","pos":"suffix","definitions":["-coccus"]},{"word":"-crație","pos":"suffix","definitions":["-cracy"],"forms":{"plural":"-crații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"-crație","accusative-definite-nominative-singular":"-crația","accusative-indefinite-nominative-plural":"-crații","accusative-definite-nominative-plural":"-crațiile","dative-genitive-indefinite-singular":"-crații","dative-definite-genitive-singular":"-crației","dative-genitive-indefinite-plural":"-crații","dative-definite-genitive-plural":"-crațiilor","singular-vocative":"-crație","plural-vocative":"-crațiilor","alternative":"-крацие"}},{"word":"-e","pos":"suffix","definitions":["-s (feminine/neuter)"],"pronunciation":"/e/","forms":{"alternative":"-le"}},{"word":"-e","pos":"suffix","definitions":["Vocative singular (masculine/neuter)"],"pronunciation":"/e/","examples":[{"ro":"Oh!","en":null}]},{"word":"-e","pos":"suffix","definitions":["A suffix forming infinitives of many verbs."],"pronunciation":"/e/","forms":{"table-tags":"conjugation-3","inflection-template":"ro-conj-e","infinitive":"a -e","gerund":"-ând","participle-past":"s","error-unrecognized-form-indicative-present-singular":"-","indicative-present-second-person-singular":"-i","first-person-indicative-plural-present":"-em","indicative-plural-present-second-person":"-eți","error-unrecognized-form-indicative-plural-present":"-","error-unrecognized-form-imperfect-indicative-singular":"-eam","imperfect-indicative-second-person-singular":"-eai","first-person-imperfect-indicative-plural":"-eam","imperfect-indicative-plural-second-person":"-eați","error-unrecognized-form-imperfect-indicative-plural":"-eau","error-unrecognized-form-indicative-perfect-singular":"sei","indicative-perfect-second-person-singular":"seși","first-person-indicative-perfect-plural":"serăm","indicative-perfect-plural-second-person":"serăți","error-unrecognized-form-indicative-perfect-plural":"seră","error-unrecognized-form-indicative-pluperfect-singular":"sesem","indicative-pluperfect-second-person-singular":"seseși","first-person-indicative-pluperfect-plural":"seserăm","indicative-pluperfect-plural-second-person":"seserăți","error-unrecognized-form-indicative-pluperfect-plural":"seseră","error-unrecognized-form-present-singular-subjunctive":"să -","present-second-person-singular-subjunctive":"să -i","first-person-plural-present-subjunctive":"să -em","plural-present-second-person-subjunctive":"să -eți","error-unrecognized-form-plural-present-subjunctive":"să -ă","imperative-positive-second-person-singular":"-e","imperative-plural-positive-second-person":"-eți","imperative-negative-second-person-singular":"nu -e","imperative-negative-plural-second-person":"nu -eți"}},{"word":"-ea","pos":"suffix","definitions":["A suffix forming infinitives of many verbs."],"pronunciation":"/e̯a/","forms":{"table-tags":"conjugation-2","inflection-template":"ro-conj-ea","infinitive":"a -ea","gerund":"-ând","participle-past":"-ut","error-unrecognized-form-indicative-present-singular":"-","indicative-present-second-person-singular":"-i","first-person-indicative-plural-present":"-em","indicative-plural-present-second-person":"-eți","error-unrecognized-form-indicative-plural-present":"-","error-unrecognized-form-imperfect-indicative-singular":"-eam","imperfect-indicative-second-person-singular":"-eai","first-person-imperfect-indicative-plural":"-eam","imperfect-indicative-plural-second-person":"-eați","error-unrecognized-form-imperfect-indicative-plural":"-eau","error-unrecognized-form-indicative-perfect-singular":"-ui","indicative-perfect-second-person-singular":"-uși","first-person-indicative-perfect-plural":"-urăm","indicative-perfect-plural-second-person":"-urăți","error-unrecognized-form-indicative-perfect-plural":"-ură","error-unrecognized-form-indicative-pluperfect-singular":"-usem","indicative-pluperfect-second-person-singular":"-useși","first-person-indicative-pluperfect-plural":"-userăm","indicative-pluperfect-plural-second-person":"-userăți","error-unrecognized-form-indicative-pluperfect-plural":"-useră","error-unrecognized-form-present-singular-subjunctive":"să -","present-second-person-singular-subjunctive":"să -i","first-person-plural-present-subjunctive":"să -em","plural-present-second-person-subjunctive":"să -eți","error-unrecognized-form-plural-present-subjunctive":"să -ă","imperative-positive-second-person-singular":"-e","imperative-plural-positive-second-person":"-eți","imperative-negative-second-person-singular":"nu -ea","imperative-negative-plural-second-person":"nu -eți"}},{"word":"-ea","pos":"suffix","definitions":["Used to form the feminine diminutive of a word"],"gender":"f","forms":{"plural":"-ele","masculine":"-el","masculine-plural":"-ei","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"-ea","accusative-definite-nominative-singular":"-eaua","accusative-indefinite-nominative-plural":"-ele","accusative-definite-nominative-plural":"-elele","dative-genitive-indefinite-singular":"-ele","dative-definite-genitive-singular":"-elei","dative-genitive-indefinite-plural":"-ele","dative-definite-genitive-plural":"-elelor","singular-vocative":"-ea","plural-vocative":"-elelor"}},{"word":"-eala","pos":"suffix","definitions":["definite singular nominative/accusative of -eală"]},{"word":"-eală","pos":"suffix","definitions":["Forms nouns that indicate the action or result of a verb"],"examples":[{"ro":"cheltui (“to spend”) + -eală → cheltuială (“expense”)","en":null},{"ro":"greși (“to err”) + -eală → greșeală (“mistake”)","en":null},{"ro":"momi (“to lure”) + -eală → momeală (“bait”)","en":null}],"forms":{"plural":"-eli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"-eală","accusative-definite-nominative-singular":"-eala","accusative-indefinite-nominative-plural":"-eli","accusative-definite-nominative-plural":"-elile","dative-genitive-indefinite-singular":"-eli","dative-definite-genitive-singular":"-elii","dative-genitive-indefinite-plural":"-eli","dative-definite-genitive-plural":"-elilor","singular-vocative":"-eală","plural-vocative":"-elilor"}},{"word":"-ean","pos":"suffix","definitions":["Forms adjectives and nouns indicating origin or place of birth (such as from a certain city or region), or occasionally nationality."],"pronunciation":"/e̯an/","examples":[{"ro":"Ardeal (“Transylvania”) + -ean → ardelean (“Transylvanian”)","en":null},{"ro":"București (“Bucharest”) + -ean → bucureștean (“Bucharestian”)","en":null}],"forms":{"feminine-singular":"-eană","masculine-plural":"-eni","feminine-neuter-plural":"-ene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-ean","error-unrecognized-form-feminine-indefinite-singular":"-eană","error-unrecognized-form-indefinite-masculine-plural":"-eni","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ene","definite-error-unrecognized-form-masculine-neuter-singular":"-eanul","definite-error-unrecognized-form-feminine-singular":"-eana","definite-error-unrecognized-form-masculine-plural":"-enii","definite-error-unrecognized-form-feminine-neuter-plural":"-enele"}},{"word":"-eană","pos":"suffix","definitions":["female equivalent of -ean"],"gender":"f","forms":{"plural":"-ene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-eană","accusative-definite-nominative-singular":"-eana","accusative-indefinite-nominative-plural":"-ene","accusative-definite-nominative-plural":"-enele","dative-genitive-indefinite-singular":"-ene","dative-definite-genitive-singular":"-enei","dative-genitive-indefinite-plural":"-ene","dative-definite-genitive-plural":"-enelor","singular-vocative":"-eană","plural-vocative":"-enelor"}},{"word":"-eancă","pos":"suffix","definitions":["female equivalent of -ean"],"pronunciation":"/ˈe̯aŋ.kə/","gender":"f","forms":{"plural":"-ence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-eancă","accusative-definite-nominative-singular":"-eanca","accusative-indefinite-nominative-plural":"-ence","accusative-definite-nominative-plural":"-encele","dative-genitive-indefinite-singular":"-ence","dative-definite-genitive-singular":"-encei","dative-genitive-indefinite-plural":"-ence","dative-definite-genitive-plural":"-encelor","singular-vocative":"-eancă","plural-vocative":"-encelor"}},{"word":"-eanu","pos":"suffix","definitions":["Forms demonymic surnames."]},{"word":"-easa","pos":"suffix","definitions":["suffix forming placenames and feminine surnames"],"examples":[{"ro":"Voinea + -easa → Voineasa","en":null},{"ro":"Bucur + -easa → Bucureasa","en":null}],"forms":{"plural":"-ese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-easa","accusative-definite-nominative-singular":"-easa","accusative-indefinite-nominative-plural":"-ese","accusative-definite-nominative-plural":"-esele","dative-genitive-indefinite-singular":"-ese","dative-definite-genitive-singular":"-esei","dative-genitive-indefinite-plural":"-ese","dative-definite-genitive-plural":"-eselor","singular-vocative":"-easa","plural-vocative":"-eselor"}},{"word":"-easă","pos":"suffix","definitions":["Used to make feminine forms of some masculine nouns, or to indicate the wife of a man with a certain profession; -ess"],"pronunciation":"/ˈe̯a.sə/","forms":{"plural":"-ese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-easă","accusative-definite-nominative-singular":"-easa","accusative-indefinite-nominative-plural":"-ese","accusative-definite-nominative-plural":"-esele","dative-genitive-indefinite-singular":"-ese","dative-definite-genitive-singular":"-esei","dative-genitive-indefinite-plural":"-ese","dative-definite-genitive-plural":"-eselor","singular-vocative":"-easă","plural-vocative":"-eselor"}},{"word":"-ească","pos":"suffix","definitions":["feminine singular of -esc"],"pronunciation":"/ˈe̯as.kə/","gender":"f"},{"word":"-eață","pos":"suffix","definitions":["-ness, -ity; used to form nouns from adjectives"],"pronunciation":"/ˈe̯a.t͡sə/","forms":{"plural":"-ețe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-eață","accusative-definite-nominative-singular":"-eața","accusative-indefinite-nominative-plural":"-ețe","accusative-definite-nominative-plural":"-ețele","dative-genitive-indefinite-singular":"-ețe","dative-definite-genitive-singular":"-eței","dative-genitive-indefinite-plural":"-ețe","dative-definite-genitive-plural":"-ețelor","singular-vocative":"-eață","plural-vocative":"-ețelor","alternative":"-ețe"}},{"word":"-ează","pos":"suffix","definitions":["used with a stem to form the third-person singular present and third-person plural present indicatives of some -a (first conjugation) verbs. E.g. lucrează from lucra, durează from dura, frânează from frâna, vânează from vâna."],"pronunciation":"/ˈe̯azə/"},{"word":"-ectomie","pos":"suffix","definitions":["-ectomy"]},{"word":"-ei","pos":"suffix","definitions":["the (feminine singular, genitive and dative)"],"pronunciation":"/ej/","gender":"f","forms":{"alternative":"-lei"}},{"word":"-el","pos":"suffix","definitions":["used to form a masculine diminutive of a word (e.g. băiat (“boy”) + -el → băiețel (“little boy”)"],"pronunciation":"/el/","gender":"m","forms":{"plural":"-ei","feminine":"-ea","feminine-plural":"-ele","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"-el","accusative-definite-nominative-singular":"-elul","accusative-indefinite-nominative-plural":"-ei","accusative-definite-nominative-plural":"-eii","dative-genitive-indefinite-singular":"-el","dative-definite-genitive-singular":"-elului","dative-genitive-indefinite-plural":"-ei","dative-definite-genitive-plural":"-eilor","singular-vocative":"-elule","plural-vocative":"-eilor"}},{"word":"-eni","pos":"suffix","definitions":["Used to form a name of an inhabited place, a town or city."],"gender":"m","examples":[{"ro":"Paltinu + -eni → Păltineni","en":null},{"ro":"Gheorghe + -eni → Gheorgheni","en":null},{"ro":"urzică + -eni → Urziceni","en":null}]},{"word":"-ență","pos":"suffix","definitions":["-ence"],"pronunciation":"/ˈen.t͡sə/","forms":{"plural":"-ențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-ență","accusative-definite-nominative-singular":"-ența","accusative-indefinite-nominative-plural":"-ențe","accusative-definite-nominative-plural":"-ențele","dative-genitive-indefinite-singular":"-ențe","dative-definite-genitive-singular":"-enței","dative-genitive-indefinite-plural":"-ențe","dative-definite-genitive-plural":"-ențelor","singular-vocative":"-ență","plural-vocative":"-ențelor","alternative":"-ință"}},{"word":"-erie","pos":"suffix","definitions":["alternative form of -ărie"],"gender":"f"},{"word":"-esc","pos":"suffix","definitions":["-esque, -ish (used with a root to form adjectives)"],"pronunciation":"/-esk/","gender":"m","forms":{"feminine-singular":"-ească","plural":"-ești","adverbial":"-ește","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-esc","error-unrecognized-form-feminine-indefinite-singular":"-ească","error-unrecognized-form-indefinite-masculine-plural":"-ești","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ești","definite-error-unrecognized-form-masculine-neuter-singular":"-escul","definite-error-unrecognized-form-feminine-singular":"-easca","definite-error-unrecognized-form-masculine-plural":"-eștii","definite-error-unrecognized-form-feminine-neuter-plural":"-eștile"}},{"word":"-esc","pos":"suffix","definitions":["Used with a stem to form the first-person singular and third-person plural present of most regular -i (fourth conjugation) verbs. E.g. unesc, tușesc, feresc, pățesc, urăsc."],"pronunciation":"/-esk/","forms":{"alternative":"-ăsc"}},{"word":"-escu","pos":"suffix","definitions":["suffix forming many Romanian surnames, e.g. Ionescu, Petrescu, Popescu, Georgescu, Marinescu, Niculescu, Constantinescu, Văcărescu, Lucescu, Lupescu, Albulescu, Ceaușescu, etc."],"pronunciation":"/ˈes.ku/"},{"word":"-ește","pos":"suffix","definitions":["adverbial form of -esc"],"pronunciation":"/ˈeʃ.te/"},{"word":"-ește","pos":"suffix","definitions":["Used with a stem to form the third-person singular present of most regular -i (fourth conjugation) verbs. E.g. unește, tușește, ferește, pățește, urăște."],"pronunciation":"/ˈeʃ.te/","forms":{"alternative":"-ăște"}},{"word":"-ești","pos":"suffix","definitions":["plural of -esc."],"pronunciation":"/eʃtʲ/"},{"word":"-ești","pos":"suffix","definitions":["Used with a stem to form the second-person singular present of most regular -i (fourth conjugation) verbs. E.g. unești, tușești, ferești, pățești, urăști."],"pronunciation":"/eʃtʲ/","forms":{"alternative":"-ăști"}},{"word":"-et","pos":"suffix","definitions":["Used with plant or tree names to form names of orchards, woods, forests, or groves."],"pronunciation":"/ˈet/","examples":[{"ro":"brad (“fir tree”) → brădet (“fir-tree forest”)","en":null},{"ro":"ulm (“elm”) → ulmet (“elm forest”)","en":null},{"ro":"fag (“beech”) → făget (“beech forest”)","en":null}],"forms":{"plural":"-eturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"-et","accusative-definite-nominative-singular":"-etul","accusative-indefinite-nominative-plural":"-eturi","accusative-definite-nominative-plural":"-eturile","dative-genitive-indefinite-singular":"-et","dative-definite-genitive-singular":"-etului","dative-genitive-indefinite-plural":"-eturi","dative-definite-genitive-plural":"-eturilor","singular-vocative":"-etule","plural-vocative":"-eturilor"}},{"word":"-et","pos":"suffix","definitions":["Used to form nouns derived from the action of some verbs."],"pronunciation":"/et/","examples":[{"ro":"zâmbi (“to smile”) → zâmbet (“a smile”)","en":null},{"ro":"zbiera (“to scream”) → zbieret (“a scream”)","en":null}],"forms":{"plural":"-ete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"-et","accusative-definite-nominative-singular":"-etul","accusative-indefinite-nominative-plural":"-ete","accusative-definite-nominative-plural":"-etele","dative-genitive-indefinite-singular":"-et","dative-definite-genitive-singular":"-etului","dative-genitive-indefinite-plural":"-ete","dative-definite-genitive-plural":"-etelor","singular-vocative":"-etule","plural-vocative":"-etelor","alternative":"-ăt"}},{"word":"-ete","pos":"suffix","definitions":["plural of -et"]},{"word":"-eturi","pos":"suffix","definitions":["plural of -et"]},{"word":"-eț","pos":"suffix","definitions":["used to form adjectives from nouns or verbs denoting propensity or likeness, being inclined toward, or having the quality of (e.g. orb > orbeț, pădure (“woods, forest”) > pădureț (“wild”), îndrăzni (“to dare, venture”) > îndrăzneț (“bold, daring, courageous”), lume (“world, people”) > lumeț (“social; liking people; cheerful, chirpy”)); may be roughly compared to -y or -ish in some cases; see also -ăreț, with a similar function","used to form nouns relating to another noun or action (e.g. drum (“road”) > drumeț (“voyager, traveler, hiker”))","used to form diminutives of some nouns (e.g. pod (“bridge”) > podeț (“footbridge”))"],"pronunciation":"/et͡s/","forms":{"feminine-singular":"-eață","masculine-plural":"-eți","feminine-neuter-plural":"-ețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-eț","error-unrecognized-form-feminine-indefinite-singular":"-eață","error-unrecognized-form-indefinite-masculine-plural":"-eți","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ețe","definite-error-unrecognized-form-masculine-neuter-singular":"-ețul","definite-error-unrecognized-form-feminine-singular":"-eața","definite-error-unrecognized-form-masculine-plural":"-eții","definite-error-unrecognized-form-feminine-neuter-plural":"-ețele"}},{"word":"-ețe","pos":"suffix","definitions":["alternative form of -eață"],"pronunciation":"/ˈe.t͡se/","forms":{"plural":"-ețe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"-ețe","accusative-definite-nominative-singular":"-ețea","accusative-indefinite-nominative-plural":"-ețe","accusative-definite-nominative-plural":"-ețele","dative-genitive-indefinite-singular":"-ețe","dative-definite-genitive-singular":"-eței","dative-genitive-indefinite-plural":"-ețe","dative-definite-genitive-plural":"-ețelor","singular-vocative":"-ețe","plural-vocative":"-ețelor"}},{"word":"-eți","pos":"suffix","definitions":["inflection of -eață:","indefinite nominative/accusative/genitive/dative plural","indefinite genitive/dative singular"]},{"word":"-ez","pos":"suffix","definitions":["Forms nouns and adjectives of nationality","Examples"],"pronunciation":"/ez/","examples":[{"ro":"-ish, -an","en":null},{"ro":"englez, olandez, francez, etc.","en":null}],"forms":{"feminine-singular":"-eză","masculine-plural":"-ezi","feminine-neuter-plural":"-eze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-ez","error-unrecognized-form-feminine-indefinite-singular":"-eză","error-unrecognized-form-indefinite-masculine-plural":"-ezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"-eze","definite-error-unrecognized-form-masculine-neuter-singular":"-ezul","definite-error-unrecognized-form-feminine-singular":"-eza","definite-error-unrecognized-form-masculine-plural":"-ezii","definite-error-unrecognized-form-feminine-neuter-plural":"-ezele"}},{"word":"-ez","pos":"suffix","definitions":["used with a stem to form the first-person singular present of some -a (first conjugation) verbs."],"pronunciation":"/ez/","examples":[{"ro":"lucra → lucrez","en":null},{"ro":"dura → durez","en":null},{"ro":"frâna → frânez","en":null}]},{"word":"-ezi","pos":"suffix","definitions":["used with a stem to form the second-person singular present of some -a (first conjugation) verbs. E.g. lucrezi from lucra, durezi from dura, frânezi from frâna, vânezi from vâna."],"pronunciation":"/ezʲ/"},{"word":"-fag","pos":"suffix","definitions":["-phage."]},{"word":"-filie","pos":"suffix","definitions":["-philia"]},{"word":"-fobie","pos":"suffix","definitions":["-phobia"]},{"word":"-grafie","pos":"suffix","definitions":["-graphy"]},{"word":"-i","pos":"suffix","definitions":["Used to form plurals"],"pronunciation":"/ʲ/"},{"word":"-i","pos":"suffix","definitions":["the (masculine plural, nominative and accusative)"],"pronunciation":"/j/","gender":"m"},{"word":"-i","pos":"suffix","definitions":["A suffix forming infinitives of many verbs."],"pronunciation":"/i/","forms":{"table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a -i","gerund":"-ind","participle-past":"-it","error-unrecognized-form-indicative-present-singular":"-","indicative-present-second-person-singular":"-i","first-person-indicative-plural-present":"-im","indicative-plural-present-second-person":"-iți","error-unrecognized-form-indicative-plural-present":"-","error-unrecognized-form-imperfect-indicative-singular":"-eam","imperfect-indicative-second-person-singular":"-eai","first-person-imperfect-indicative-plural":"-eam","imperfect-indicative-plural-second-person":"-eați","error-unrecognized-form-imperfect-indicative-plural":"-eau","error-unrecognized-form-indicative-perfect-singular":"-ii","indicative-perfect-second-person-singular":"-iși","first-person-indicative-perfect-plural":"-irăm","indicative-perfect-plural-second-person":"-irăți","error-unrecognized-form-indicative-perfect-plural":"-iră","error-unrecognized-form-indicative-pluperfect-singular":"-isem","indicative-pluperfect-second-person-singular":"-iseși","first-person-indicative-pluperfect-plural":"-iserăm","indicative-pluperfect-plural-second-person":"-iserăți","error-unrecognized-form-indicative-pluperfect-plural":"-iseră","error-unrecognized-form-present-singular-subjunctive":"să -","present-second-person-singular-subjunctive":"să -i","first-person-plural-present-subjunctive":"să -im","plural-present-second-person-subjunctive":"să -iți","error-unrecognized-form-plural-present-subjunctive":"să -ă","imperative-positive-second-person-singular":"-e","imperative-plural-positive-second-person":"-iți","imperative-negative-second-person-singular":"nu -i","imperative-negative-plural-second-person":"nu -iți"}},{"word":"-i","pos":"suffix","definitions":["is"]},{"word":"-ia","pos":"suffix","definitions":["definite singular of -ie, usually applied to place names."]},{"word":"-ic","pos":"suffix","definitions":["forms adjectives with the meaning \"of or pertaining to\""],"pronunciation":"/ik/","forms":{"feminine-singular":"-ică","masculine-plural":"-ici","feminine-neuter-plural":"-ice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-ic","error-unrecognized-form-feminine-indefinite-singular":"-ică","error-unrecognized-form-indefinite-masculine-plural":"-ici","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ice","definite-error-unrecognized-form-masculine-neuter-singular":"-icul","definite-error-unrecognized-form-feminine-singular":"-ica","definite-error-unrecognized-form-masculine-plural":"-icii","definite-error-unrecognized-form-feminine-neuter-plural":"-icele"}},{"word":"-ică","pos":"suffix","definitions":["forms diminutives","forms female equivalents"],"examples":[{"ro":"frunză (“leaf”) + -ică → frunzică (“small leaf”)","en":null},{"ro":"copil (“boy”) + -ică → copilică (“girl”)","en":null}],"forms":{"plural":"-ici"}},{"word":"-ică","pos":"suffix","definitions":["forms abstact nouns for fields of knowledge. -ics, -istics"],"examples":[{"ro":"dentist (“dentist”) + -ică → dentistică (“dentistry”)","en":null}]},{"word":"-icesc","pos":"suffix","definitions":["used with a root to form adjectives."],"gender":"m","forms":{"feminine-singular":"-icească","plural":"-icești","adverbial":"-icește","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-icesc","error-unrecognized-form-feminine-indefinite-singular":"-icească","error-unrecognized-form-indefinite-masculine-plural":"-icești","error-unrecognized-form-feminine-indefinite-neuter-plural":"-icești","definite-error-unrecognized-form-masculine-neuter-singular":"-icescul","definite-error-unrecognized-form-feminine-singular":"-iceasca","definite-error-unrecognized-form-masculine-plural":"-iceștii","definite-error-unrecognized-form-feminine-neuter-plural":"-iceștile"}},{"word":"-icios","pos":"suffix","definitions":["Adjectival suffix roughly equivalent to -ous or -ish."],"pronunciation":"/iˈt͡ʃʲos/","forms":{"feminine-singular":"-icioasă","masculine-plural":"-icioși","feminine-neuter-plural":"-icioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-icios","error-unrecognized-form-feminine-indefinite-singular":"-icioasă","error-unrecognized-form-indefinite-masculine-plural":"-icioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"-icioase","definite-error-unrecognized-form-masculine-neuter-singular":"-iciosul","definite-error-unrecognized-form-feminine-singular":"-icioasa","definite-error-unrecognized-form-masculine-plural":"-icioșii","definite-error-unrecognized-form-feminine-neuter-plural":"-icioasele","alternative":"-cios"}},{"word":"-ie","pos":"suffix","definitions":["Used with a stem to create a (usually abstract) noun relating to it; can be compared to -ship, -hood, -ness, -ity, etc."],"pronunciation":"/ˈi.e/","forms":{"plural":"-ii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"-ie","accusative-definite-nominative-singular":"-ia","accusative-indefinite-nominative-plural":"-ii","accusative-definite-nominative-plural":"-iile","dative-genitive-indefinite-singular":"-ii","dative-definite-genitive-singular":"-iei","dative-genitive-indefinite-plural":"-ii","dative-definite-genitive-plural":"-iilor","singular-vocative":"-ie","plural-vocative":"-iilor"}},{"word":"-iei","pos":"suffix","definitions":["definite genitive/dative singular of -ie"]},{"word":"-ifica","pos":"suffix","definitions":["-ify"]},{"word":"-ime","pos":"suffix","definitions":["from adjectives forms nouns denoting quality or state of. -ness, -ity, -hood, -ship, -dom","forms collective nouns, often indicating a multitude or totality of. -ry (class or group, collection of)","from numerals forms nouns meaning a part of a fraction. -th"],"pronunciation":"/ˈi.me/","examples":[{"ro":"țăran (“peasant”) + -ime → țărănime (“peasantry”)","en":null},{"ro":"opt (“eight”) + -ime → optime (“eighth”)","en":null}],"forms":{"plural":"-imi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-ime","accusative-definite-nominative-singular":"-imea","accusative-indefinite-nominative-plural":"-imi","accusative-definite-nominative-plural":"-imile","dative-genitive-indefinite-singular":"-imi","dative-definite-genitive-singular":"-imii","dative-genitive-indefinite-plural":"-imi","dative-definite-genitive-plural":"-imilor","singular-vocative":"-ime","plural-vocative":"-imilor"}},{"word":"-ind","pos":"suffix","definitions":["Used with a stem to form the gerund of -i (fourth conjugation) verbs, as well as a minority of -a (first conjugation) and -e (third conjugation) verbs."],"pronunciation":"/ind/","examples":[{"ro":"feri + -ind → ferind","en":null},{"ro":"ieși + -ind → ieșind","en":null},{"ro":"tăia + -ind → tăind","en":null}]},{"word":"-ință","pos":"suffix","definitions":["Having the state or condition of; -ence, -ance."],"pronunciation":"/ˈin.t͡sə/","examples":[{"ro":"a crede → credință","en":"to believe → belief"},{"ro":"a folosi → folosință","en":"to use → use"},{"ro":"a suferi → suferință","en":"to suffer → suffering"}],"forms":{"plural":"-ințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-ință","accusative-definite-nominative-singular":"-ința","accusative-indefinite-nominative-plural":"-ințe","accusative-definite-nominative-plural":"-ințele","dative-genitive-indefinite-singular":"-ințe","dative-definite-genitive-singular":"-inței","dative-genitive-indefinite-plural":"-ințe","dative-definite-genitive-plural":"-ințelor","singular-vocative":"-ință","plural-vocative":"-ințelor","alternative":"-ență"}},{"word":"-ioară","pos":"suffix","definitions":["Forms diminutives of feminine nouns."],"gender":"m","examples":[{"ro":"pălărie (“hat”) + -ioară → pălărioară","en":null},{"ro":"jucărie (“toy”) + -ioară → jucărioară","en":null}],"forms":{"plural":"-ioare","masculine":"-ior","masculine-plural":"-iori"}},{"word":"-ior","pos":"suffix","definitions":["Forms diminutives of nouns."],"gender":"m","examples":[{"ro":"frate (“brother”) + -ior → frățior","en":null},{"ro":"mia (“ewe”) + -ior → mioară","en":null}],"forms":{"plural":"-iori","feminine":"-ioară","feminine-plural":"-ioare"}},{"word":"-ism","pos":"suffix","definitions":["-ism (indicates a belief or principle)"],"pronunciation":"/ism/","examples":[{"ro":"creștin (“Christian”) + -ism → creștinism (“Christianity”)","en":null},{"ro":"anarhie (“anarchy”) + -ism → anarhism (“anarchism”)","en":null}],"forms":{"plural":"-isme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"-ism","accusative-definite-nominative-singular":"-ismul","accusative-indefinite-nominative-plural":"-isme","accusative-definite-nominative-plural":"-ismele","dative-genitive-indefinite-singular":"-ism","dative-definite-genitive-singular":"-ismului","dative-genitive-indefinite-plural":"-isme","dative-definite-genitive-plural":"-ismelor","singular-vocative":"-ismule","plural-vocative":"-ismelor","alternative":"-исм"}},{"word":"-ist","pos":"suffix","definitions":["-ist"],"pronunciation":"[ist]","examples":[{"ro":"pian + -ist","en":"pianist (pianist)"},{"ro":"anarhie + -ist","en":"anarhist (anarchist)"},{"ro":"rasă + -ist","en":"rasist (racist)"}],"forms":{"feminine-singular":"-istă","masculine-plural":"-iști","feminine-neuter-plural":"-iste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-ist","error-unrecognized-form-feminine-indefinite-singular":"-istă","error-unrecognized-form-indefinite-masculine-plural":"-iști","error-unrecognized-form-feminine-indefinite-neuter-plural":"-iste","definite-error-unrecognized-form-masculine-neuter-singular":"-istul","definite-error-unrecognized-form-feminine-singular":"-ista","definite-error-unrecognized-form-masculine-plural":"-iștii","definite-error-unrecognized-form-feminine-neuter-plural":"-istele"}},{"word":"-ișoară","pos":"suffix","definitions":["feminine of -ișor"],"gender":"f"},{"word":"-ișor","pos":"suffix","definitions":["Diminutive suffix."],"pronunciation":"/iʃor/","examples":[{"ro":"lapte (“milk”) + -ișor → lăptișor (“bit of milk”)","en":null},{"ro":"somn (“sleep”) + -ișor → somnișor (“nap”)","en":null},{"ro":"poamă (“fruit”) + -ișor → pomișoară (“blueberry”)","en":null}],"forms":{"feminine-singular":"-ișoară","masculine-plural":"-ișori","feminine-neuter-plural":"-ișoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-ișor","error-unrecognized-form-feminine-indefinite-singular":"-ișoară","error-unrecognized-form-indefinite-masculine-plural":"-ișori","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ișoare","definite-error-unrecognized-form-masculine-neuter-singular":"-ișorul","definite-error-unrecognized-form-feminine-singular":"-ișoara","definite-error-unrecognized-form-masculine-plural":"-ișorii","definite-error-unrecognized-form-feminine-neuter-plural":"-ișoarele"}},{"word":"-iște","pos":"suffix","definitions":["noun suffix used to denote a place"],"pronunciation":"/ˈiʃ.te/","examples":[{"ro":"izbeală (“crash”) + -iște → izbeliște (“desolate, unorderly place”)","en":null}],"forms":{"plural":"-iști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-iște","accusative-definite-nominative-singular":"-iștea","accusative-indefinite-nominative-plural":"-iști","accusative-definite-nominative-plural":"-iștile","dative-genitive-indefinite-singular":"-iști","dative-definite-genitive-singular":"-iștii","dative-genitive-indefinite-plural":"-iști","dative-definite-genitive-plural":"-iștilor","singular-vocative":"-iște","plural-vocative":"-iștilor"}},{"word":"-itate","pos":"suffix","definitions":["-ity"],"pronunciation":"[iˈta.te]","gender":"f","forms":{"plural":"-ități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative-singular":"-itate","accusative-definite-nominative-singular":"-itatea","accusative-indefinite-nominative-plural":"-ități","accusative-definite-nominative-plural":"-itățile","dative-genitive-indefinite-singular":"-ități","dative-definite-genitive-singular":"-ității","dative-genitive-indefinite-plural":"-ități","dative-definite-genitive-plural":"-ităților","singular-vocative":"-itate","plural-vocative":"-ităților","alternative":"-tate"}},{"word":"-itudine","pos":"suffix","definitions":["-itude"]},{"word":"-iță","pos":"suffix","definitions":["Forms diminutives of some feminine nouns"],"pronunciation":"/ˈi.t͡sə/","examples":[{"ro":"fată (“girl”) + -iță → fetiță (“little girl”)","en":null},{"ro":"capră (“goat”) + -iță → căpriță (“little goat”)","en":null}],"forms":{"plural":"-ițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-iță","accusative-definite-nominative-singular":"-ița","accusative-indefinite-nominative-plural":"-ițe","accusative-definite-nominative-plural":"-ițele","dative-genitive-indefinite-singular":"-ițe","dative-definite-genitive-singular":"-iței","dative-genitive-indefinite-plural":"-ițe","dative-definite-genitive-plural":"-ițelor","singular-vocative":"-iță","plural-vocative":"-ițelor"}},{"word":"-iță","pos":"suffix","definitions":["Used to make feminine forms of some masculine nouns, e.g. professions; -ess"],"pronunciation":"/ˈi.t͡sə/","examples":[{"ro":"doctor (“doctor”) + -iță → doctoriță (“female doctor”), actor (“actor”) + -iță → actriță (“actress”)","en":null}],"forms":{"plural":"-ițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-iță","accusative-definite-nominative-singular":"-ița","accusative-indefinite-nominative-plural":"-ițe","accusative-definite-nominative-plural":"-ițele","dative-genitive-indefinite-singular":"-ițe","dative-definite-genitive-singular":"-iței","dative-genitive-indefinite-plural":"-ițe","dative-definite-genitive-plural":"-ițelor","singular-vocative":"-iță","plural-vocative":"-ițelor"}},{"word":"-iu","pos":"suffix","definitions":["Forms adjectives denoting characteristics or qualities, especially relating to color; roughly equivalent to -ive or sometimes -ish."],"pronunciation":"/iw/","forms":{"feminine-singular":"-ie","plural":"-ii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-iu","error-unrecognized-form-feminine-indefinite-singular":"-ie","error-unrecognized-form-indefinite-masculine-plural":"-ii","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ii","definite-error-unrecognized-form-masculine-neuter-singular":"-iul","definite-error-unrecognized-form-feminine-singular":"-ia","definite-error-unrecognized-form-masculine-plural":"-iii","definite-error-unrecognized-form-feminine-neuter-plural":"-iile"}},{"word":"-iune","pos":"suffix","definitions":["-ion"],"forms":{"plural":"-iuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-iune","accusative-definite-nominative-singular":"-iunea","accusative-indefinite-nominative-plural":"-iuni","accusative-definite-nominative-plural":"-iunile","dative-genitive-indefinite-singular":"-iuni","dative-definite-genitive-singular":"-iunii","dative-genitive-indefinite-plural":"-iuni","dative-definite-genitive-plural":"-iunilor","singular-vocative":"-iune","plural-vocative":"-iunilor"}},{"word":"-iv","pos":"suffix","definitions":["-ive"],"pronunciation":"/iv/","forms":{"feminine-singular":"-ivă","masculine-plural":"-ivi","feminine-neuter-plural":"-ive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-iv","error-unrecognized-form-feminine-indefinite-singular":"-ivă","error-unrecognized-form-indefinite-masculine-plural":"-ivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ive","definite-error-unrecognized-form-masculine-neuter-singular":"-ivul","definite-error-unrecognized-form-feminine-singular":"-iva","definite-error-unrecognized-form-masculine-plural":"-ivii","definite-error-unrecognized-form-feminine-neuter-plural":"-ivele"}},{"word":"-iza","pos":"suffix","definitions":["-ise/-ize"],"pronunciation":"/iˈza/"},{"word":"-î","pos":"suffix","definitions":["A suffix forming infinitives of many verbs."],"pronunciation":"/ɨ/","forms":{"table-tags":"conjugation-4","inflection-template":"ro-conj-î","infinitive":"a -î","gerund":"-ând","participle-past":"-ât","error-unrecognized-form-indicative-present-singular":"-","indicative-present-second-person-singular":"-i","first-person-indicative-plural-present":"-âm","indicative-plural-present-second-person":"-âți","error-unrecognized-form-indicative-plural-present":"-ă","error-unrecognized-form-imperfect-indicative-singular":"-am","imperfect-indicative-second-person-singular":"-ai","first-person-imperfect-indicative-plural":"-am","imperfect-indicative-plural-second-person":"-ați","error-unrecognized-form-imperfect-indicative-plural":"-au","error-unrecognized-form-indicative-perfect-singular":"-âi","indicative-perfect-second-person-singular":"-âși","first-person-indicative-perfect-plural":"-ârăm","indicative-perfect-plural-second-person":"-ârăți","error-unrecognized-form-indicative-perfect-plural":"-âră","error-unrecognized-form-indicative-pluperfect-singular":"-âsem","indicative-pluperfect-second-person-singular":"-âseși","first-person-indicative-pluperfect-plural":"-âserăm","indicative-pluperfect-plural-second-person":"-âserăți","error-unrecognized-form-indicative-pluperfect-plural":"-âseră","error-unrecognized-form-present-singular-subjunctive":"să -","present-second-person-singular-subjunctive":"să -i","first-person-plural-present-subjunctive":"să -âm","plural-present-second-person-subjunctive":"să -âți","error-unrecognized-form-plural-present-subjunctive":"să -e","imperative-positive-second-person-singular":"-ă","imperative-plural-positive-second-person":"-âți","imperative-negative-second-person-singular":"nu -î","imperative-negative-plural-second-person":"nu -âți"}},{"word":"-l","pos":"suffix","definitions":["the (masculine/neuter singular, nominative and accusative)"],"pronunciation":"/l/","gender":"m","forms":{"alternative":"-ul"}},{"word":"-le","pos":"suffix","definitions":["-s (feminine/neuter)"],"pronunciation":"/le/","forms":{"alternative":"-e"}},{"word":"-le","pos":"suffix","definitions":["variant of -l: the (definite article)"],"pronunciation":"/le/"},{"word":"-le","pos":"suffix","definitions":["the (feminine/neuter plural, nominative and accusative)"],"pronunciation":"/le/"},{"word":"-lei","pos":"suffix","definitions":["variant of -a"],"pronunciation":"/lej/","examples":[{"ro":"the (definite article)","en":null}],"forms":{"alternative":"-ei"}},{"word":"-logic","pos":"suffix","definitions":["-logical"],"forms":{"feminine-singular":"-logică","masculine-plural":"-logici","feminine-neuter-plural":"-logice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-logic","error-unrecognized-form-feminine-indefinite-singular":"-logică","error-unrecognized-form-indefinite-masculine-plural":"-logici","error-unrecognized-form-feminine-indefinite-neuter-plural":"-logice","definite-error-unrecognized-form-masculine-neuter-singular":"-logicul","definite-error-unrecognized-form-feminine-singular":"-logica","definite-error-unrecognized-form-masculine-plural":"-logicii","definite-error-unrecognized-form-feminine-neuter-plural":"-logicele"}},{"word":"-logie","pos":"suffix","definitions":["-logy"],"gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"-logie","accusative-definite-nominative":"-logia","dative-genitive-indefinite":"-logii","dative-definite-genitive":"-logiei","vocative":"-logie"}},{"word":"-lor","pos":"suffix","definitions":["the (plural, genitive and dative)"],"pronunciation":"/lor/","gender":"p"},{"word":"-lui","pos":"suffix","definitions":["the (masculine/neuter singular, genitive and dative)"],"pronunciation":"/luj/","gender":"m","forms":{"alternative":"-ului"}},{"word":"-manie","pos":"suffix","definitions":["-mania"]},{"word":"-manție","pos":"suffix","definitions":["-mancy"]},{"word":"-mânt","pos":"suffix","definitions":["Forms nouns that indicate the action or result of a verb; -ment"],"pronunciation":"/mɨnt/","examples":[{"ro":"jura (“to vow”) + -mânt → jurământ (“vow”)","en":null},{"ro":"lega (“to bind”) + -mânt → legământ (“pledge, promise; vow”)","en":null},{"ro":"crede (“to trust”) + -mânt → crezământ (“trust”)","en":null}],"forms":{"plural":"-minte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"-mânt","accusative-definite-nominative-singular":"-mântul","accusative-indefinite-nominative-plural":"-minte","accusative-definite-nominative-plural":"-mintele","dative-genitive-indefinite-singular":"-mânt","dative-definite-genitive-singular":"-mântului","dative-genitive-indefinite-plural":"-minte","dative-definite-genitive-plural":"-mintelor","singular-vocative":"-mântule","plural-vocative":"-mintelor","alternative":"-ământ","alternative-archaic":"-mînt"}},{"word":"-metru","pos":"suffix","definitions":["-meter (used to form a measuring device)"],"gender":"n"},{"word":"-n","pos":"prep","definitions":["Contracted form of în \"in\" used after vowel."]},{"word":"-nomie","pos":"suffix","definitions":["-nomy"]},{"word":"-o","pos":"suffix","definitions":["Vocative singular (feminine)"],"examples":[{"ro":"mamă (“mother”) + -o → mamo","en":null},{"ro":"focă (“seal”) + -o → foco","en":null}]},{"word":"-o-","pos":"interfix","definitions":["-o-"]},{"word":"-oaia","pos":"suffix","definitions":["suffix forming many feminine Romanian surnames"],"examples":[{"ro":"Ioaniță + -oaia → Ioanițoaia","en":null},{"ro":"Gavrilă + -oaia → Gavriloaia","en":null},{"ro":"Călin + -oaia → Călinoaia","en":null}],"forms":{"plural":"-oaie","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-oaia","accusative-definite-nominative-singular":"-oaia","accusative-indefinite-nominative-plural":"-oaie","accusative-definite-nominative-plural":"-oaiele","dative-genitive-indefinite-singular":"-oaie","dative-definite-genitive-singular":"-oaiei","dative-genitive-indefinite-plural":"-oaie","dative-definite-genitive-plural":"-oaielor","singular-vocative":"-oaia","plural-vocative":"-oaielor"}},{"word":"-oaică","pos":"suffix","definitions":["used to form the feminine of a masculine noun indicating nationality or ethnicity","used to form the feminine of some animals"],"pronunciation":"/ˈo̯aj.kə/","examples":[{"ro":"rus (“Russian”) + -oaică → rusoaică (“Russian woman”)","en":null},{"ro":"grec (“Greek”) + -oaică → grecoaică (“Greek woman”)","en":null},{"ro":"lup (“wolf”) + -oaică → lupoaică (“she-wolf”)","en":null}],"forms":{"plural":"-oaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-oaică","accusative-definite-nominative-singular":"-oaica","accusative-indefinite-nominative-plural":"-oaice","accusative-definite-nominative-plural":"-oaicele","dative-genitive-indefinite-singular":"-oaice","dative-definite-genitive-singular":"-oaicei","dative-genitive-indefinite-plural":"-oaice","dative-definite-genitive-plural":"-oaicelor","singular-vocative":"-oaică","plural-vocative":"-oaicelor"}},{"word":"-oaie","pos":"suffix","definitions":["augmentative suffix for some feminine nouns (e.g. casă (“house”) + -oaie → căsoaie (“big house, pantry, larder, lumber room”))"],"pronunciation":"/ˈo̯a.je/","forms":{"plural":"-oaie","masculine":"equivalent -oi","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"-oaie","accusative-definite-nominative-singular":"-oaia","accusative-indefinite-nominative-plural":"-oaie","accusative-definite-nominative-plural":"-oaiele","dative-genitive-indefinite-singular":"-oaie","dative-definite-genitive-singular":"-oaiei","dative-genitive-indefinite-plural":"-oaie","dative-definite-genitive-plural":"-oaielor","singular-vocative":"-oaie","plural-vocative":"-oaielor"}},{"word":"-oaie","pos":"suffix","definitions":["used to form the feminine of certain masculine nouns, especially animals (e.g. lup (“wolf”) + -oaie → lupoaie (“she-wolf”), urs (“bear”) + -oaie → ursoaie (“she-bear”))"],"pronunciation":"/ˈo̯a.je/","forms":{"plural":"-oaie","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"-oaie","accusative-definite-nominative-singular":"-oaia","accusative-indefinite-nominative-plural":"-oaie","accusative-definite-nominative-plural":"-oaiele","dative-genitive-indefinite-singular":"-oaie","dative-definite-genitive-singular":"-oaiei","dative-genitive-indefinite-plural":"-oaie","dative-definite-genitive-plural":"-oaielor","singular-vocative":"-oaie","plural-vocative":"-oaielor"}},{"word":"-oare","pos":"suffix","definitions":["Used to form abstract nouns from adjectives, including past participles; -ness."],"pronunciation":"/ˈo̯a.re/","examples":[{"ro":"alb (“white”) + -oare → alboare (“whiteness”)","en":null},{"ro":"rece (“cold”) + -oare → răcoare (“coolness”)","en":null}],"forms":{"plural":"-ori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-oare","accusative-definite-nominative-singular":"-oarea","accusative-indefinite-nominative-plural":"-ori","accusative-definite-nominative-plural":"-orile","dative-genitive-indefinite-singular":"-ori","dative-definite-genitive-singular":"-orii","dative-genitive-indefinite-plural":"-ori","dative-definite-genitive-plural":"-orilor","singular-vocative":"-oare","plural-vocative":"-orilor"}},{"word":"-oi","pos":"suffix","definitions":["augmentative suffix, used to indicate a larger version of (e.g. piatră (“rock”) + -oi → pietroi (“boulder”), furcă (“pitchfork”) + -oi → furcoi (“big pitchfork”))"],"pronunciation":"/oj/","forms":{"plural":"-oaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"-oi","accusative-definite-nominative-singular":"-oiul","accusative-indefinite-nominative-plural":"-oaie","accusative-definite-nominative-plural":"-oaiele","dative-genitive-indefinite-singular":"-oi","dative-definite-genitive-singular":"-oiului","dative-genitive-indefinite-plural":"-oaie","dative-definite-genitive-plural":"-oaielor","singular-vocative":"-oiule","plural-vocative":"-oaielor"}},{"word":"-oi","pos":"suffix","definitions":["used to make a masculine version of (e.g. pasăre (“bird”) + -oi → păsăroi (“male bird”), vulpe (“fox”) + -oi → vulpoi (“male fox”))","in a few cases, used as a deprecative or slightly derogatory suffix, especially relating to people (e.g. bulgar + -oi → bulgăroi, chinez + -oi → chinezoi)"],"pronunciation":"/oj/","forms":{"plural":"-oi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"-oi","accusative-definite-nominative-singular":"-oiul","accusative-indefinite-nominative-plural":"-oi","accusative-definite-nominative-plural":"-oii","dative-genitive-indefinite-singular":"-oi","dative-definite-genitive-singular":"-oiului","dative-genitive-indefinite-plural":"-oi","dative-definite-genitive-plural":"-oilor","singular-vocative":"-oiule","plural-vocative":"-oilor"}},{"word":"-oiu","pos":"suffix","definitions":["suffix forming many Romanian surnames"],"examples":[{"ro":"Enache + -oiu → Enăchioiu","en":null},{"ro":"Gavrilă + -oiu → Gavriloiu","en":null},{"ro":"Chiriță + -oiu → Chirițoiu","en":null}],"forms":{"plural":"-oi","feminine":"equivalent -oaia","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"-oiu","accusative-definite-nominative":"-oiul","dative-genitive-indefinite":"-oiu","dative-definite-genitive":"-oiului","vocative":"-oiule"}},{"word":"-oman","pos":"suffix","definitions":["Forms derogatory nouns describing people."]},{"word":"-os","pos":"suffix","definitions":["Forms adjectives; -ous"],"pronunciation":"/os/","forms":{"feminine-singular":"-oasă","masculine-plural":"-oși","feminine-neuter-plural":"-oase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-os","error-unrecognized-form-feminine-indefinite-singular":"-oasă","error-unrecognized-form-indefinite-masculine-plural":"-oși","error-unrecognized-form-feminine-indefinite-neuter-plural":"-oase","definite-error-unrecognized-form-masculine-neuter-singular":"-osul","definite-error-unrecognized-form-feminine-singular":"-oasa","definite-error-unrecognized-form-masculine-plural":"-oșii","definite-error-unrecognized-form-feminine-neuter-plural":"-oasele"}},{"word":"-re","pos":"suffix","definitions":["Attached to the ends of verb infinitives to form nouns, meaning \"the action or result of\"; -ing, -ation"],"pronunciation":"/re/","examples":[{"ro":"traduce (“to translate”) + -re → traducere","en":"translating, translation (the action or result of translation)"},{"ro":"conjuga (“to conjugate”) + -re → conjugare","en":"conjugating, conjugation (the action or result of conjugation)"},{"ro":"vorbi (“to speak”) + -re → vorbire","en":"speech, speaking (the action or result of speech)"}],"forms":{"plural":"-ri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-re","accusative-definite-nominative-singular":"-rea","accusative-indefinite-nominative-plural":"-ri","accusative-definite-nominative-plural":"-rile","dative-genitive-indefinite-singular":"-ri","dative-definite-genitive-singular":"-rii","dative-genitive-indefinite-plural":"-ri","dative-definite-genitive-plural":"-rilor","singular-vocative":"-re","plural-vocative":"-rilor"}},{"word":"-ri","pos":"suffix","definitions":["plural of -re"]},{"word":"-scopie","pos":"suffix","definitions":["-scopy (relating to observation)"]},{"word":"-sprezece","pos":"suffix","definitions":["-teen (+10)"],"examples":[{"ro":"un (“one”) + -sprezece → unsprezece (“eleven”)","en":null},{"ro":"cinci (“five”) + -sprezece → cincisprezece (“fifteen”)","en":null}],"forms":{"alternative-informal":"-sprece"}},{"word":"-șor","pos":"suffix","definitions":["Diminutive suffix."],"pronunciation":"/ʃor/","examples":[{"ro":"pui (“chick”) + -șor → puișor (“little chick”)","en":null}],"forms":{"feminine-singular":"-șoară","masculine-plural":"-șori","feminine-neuter-plural":"-șoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-șor","error-unrecognized-form-feminine-indefinite-singular":"-șoară","error-unrecognized-form-indefinite-masculine-plural":"-șori","error-unrecognized-form-feminine-indefinite-neuter-plural":"-șoare","definite-error-unrecognized-form-masculine-neuter-singular":"-șorul","definite-error-unrecognized-form-feminine-singular":"-șoara","definite-error-unrecognized-form-masculine-plural":"-șorii","definite-error-unrecognized-form-feminine-neuter-plural":"-șoarele","alternative":"-ișor"}},{"word":"-tate","pos":"suffix","definitions":["-ty, -ness","greutate","demnitate","vecinătate","ieftinătate"],"pronunciation":"/ˈta.te/","forms":{"plural":"-tăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative-singular":"-tate","accusative-definite-nominative-singular":"-tatea","accusative-indefinite-nominative-plural":"-tăți","accusative-definite-nominative-plural":"-tățile","dative-genitive-indefinite-singular":"-tăți","dative-definite-genitive-singular":"-tății","dative-genitive-indefinite-plural":"-tăți","dative-definite-genitive-plural":"-tăților","singular-vocative":"-tate","plural-vocative":"-tăților","alternative":"-ătate"}},{"word":"-tăți","pos":"suffix","definitions":["genitive/dative indefinite singular of -tate"],"pronunciation":"/tə.t͡si/","gender":"f","examples":[{"ro":"extremitǎţi","en":null}]},{"word":"-tăți","pos":"suffix","definitions":["nominative/accusative indefinite plural of -tate"],"pronunciation":"/tə.t͡si/","gender":"f","examples":[{"ro":"extremitǎţi","en":"extremities"}]},{"word":"-tăți","pos":"suffix","definitions":["genitive/dative indefinite plural of -tate"],"pronunciation":"/tə.t͡si/","gender":"f","examples":[{"ro":"extremitǎţi","en":null}]},{"word":"-tecă","pos":"suffix","definitions":["used for any kind of collection"]},{"word":"-toare","pos":"suffix","definitions":["female equivalent of -tor: -er (suffix used to form nouns from verbs)"],"pronunciation":"/ˈto̯a.re/","forms":{"plural":"-toare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"-toare","accusative-definite-nominative-singular":"-toarea","accusative-indefinite-nominative-plural":"-toare","accusative-definite-nominative-plural":"-toarele","dative-genitive-indefinite-singular":"-toare","dative-definite-genitive-singular":"-toarei","dative-genitive-indefinite-plural":"-toare","dative-definite-genitive-plural":"-toarelor","singular-vocative":"-toare","plural-vocative":"-toarelor"}},{"word":"-toare","pos":"suffix","definitions":["feminine singular of -tor: -ing (suffix used to form adjectives from verbs)"],"pronunciation":"/ˈto̯a.re/"},{"word":"-tor","pos":"suffix","definitions":["-er (used to form nouns from verbs)"],"pronunciation":"/tor/","examples":[{"ro":"băutor","en":"drinker"},{"ro":"călător","en":"traveler"},{"ro":"făcător","en":"maker"}],"forms":{"feminine-singular":"-toare","masculine-plural":"-tori","feminine-neuter-plural":"-toare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-tor","error-unrecognized-form-feminine-indefinite-singular":"-toare","error-unrecognized-form-indefinite-masculine-plural":"-tori","error-unrecognized-form-feminine-indefinite-neuter-plural":"-toare","definite-error-unrecognized-form-masculine-neuter-singular":"-torul","definite-error-unrecognized-form-feminine-singular":"-toarea","definite-error-unrecognized-form-masculine-plural":"-torii","definite-error-unrecognized-form-feminine-neuter-plural":"-toarele","alternative":"-ător"}},{"word":"-tor","pos":"suffix","definitions":["-ing (used to form adjectives from verbs)"],"pronunciation":"/tor/","examples":[{"ro":"uimitor","en":"amazing"},{"ro":"strălucitor","en":"shining"}],"forms":{"feminine-singular":"-toare","masculine-plural":"-tori","feminine-neuter-plural":"-toare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-tor","error-unrecognized-form-feminine-indefinite-singular":"-toare","error-unrecognized-form-indefinite-masculine-plural":"-tori","error-unrecognized-form-feminine-indefinite-neuter-plural":"-toare","definite-error-unrecognized-form-masculine-neuter-singular":"-torul","definite-error-unrecognized-form-feminine-singular":"-toarea","definite-error-unrecognized-form-masculine-plural":"-torii","definite-error-unrecognized-form-feminine-neuter-plural":"-toarele","alternative":"-ător"}},{"word":"-tură","pos":"suffix","definitions":["Used to form nouns relating to some action; -ure, -ing"],"pronunciation":"/ˈtu.rə/","examples":[{"ro":"lega (“to bind”) + -tură → legătură (“connection; bunch”)","en":null},{"ro":"lovi (“to hit”) + -tură → lovitură (“hit”)","en":null},{"ro":"săpa (“to dig”) + -tură → săpătură (“digging”)","en":null}],"forms":{"plural":"-turi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"-tură","accusative-definite-nominative-singular":"-tura","accusative-indefinite-nominative-plural":"-turi","accusative-definite-nominative-plural":"-turile","dative-genitive-indefinite-singular":"-turi","dative-definite-genitive-singular":"-turii","dative-genitive-indefinite-plural":"-turi","dative-definite-genitive-plural":"-turilor","singular-vocative":"-tură","plural-vocative":"-turilor","alternative":"-ură"}},{"word":"-ție","pos":"suffix","definitions":["-tion"],"pronunciation":"/t͡si.e/","forms":{"plural":"-ții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"-ție","accusative-definite-nominative-singular":"-ția","accusative-indefinite-nominative-plural":"-ții","accusative-definite-nominative-plural":"-țiile","dative-genitive-indefinite-singular":"-ții","dative-definite-genitive-singular":"-ției","dative-genitive-indefinite-plural":"-ții","dative-definite-genitive-plural":"-țiilor","singular-vocative":"-ție","plural-vocative":"-țiilor","alternative":"-țiune"}},{"word":"-țiune","pos":"suffix","definitions":["-tion"],"pronunciation":"/t͡siˈune/","forms":{"plural":"-țiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-țiune","accusative-definite-nominative-singular":"-țiunea","accusative-indefinite-nominative-plural":"-țiuni","accusative-definite-nominative-plural":"-țiunile","dative-genitive-indefinite-singular":"-țiuni","dative-definite-genitive-singular":"-țiunii","dative-genitive-indefinite-plural":"-țiuni","dative-definite-genitive-plural":"-țiunilor","singular-vocative":"-țiune","plural-vocative":"-țiunilor","alternative-common":"-ție","alternative":"-tiune"}},{"word":"-ua","pos":"suffix","definitions":["variant of -a"],"pronunciation":"/wa/","gender":"f","examples":[{"ro":"the (definite article)","en":null}],"forms":{"alternative":"-a"}},{"word":"-ui","pos":"suffix","definitions":["Forms adjectives denoting characteristics or qualities, especially relating to color, and often with the meaning of -ish."],"pronunciation":"/uj/","forms":{"feminine-singular":"-uie","plural":"-ui","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-ui","error-unrecognized-form-feminine-indefinite-singular":"-uie","error-unrecognized-form-indefinite-masculine-plural":"-ui","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ui","definite-error-unrecognized-form-masculine-neuter-singular":"-uiul","definite-error-unrecognized-form-feminine-singular":"-uia","definite-error-unrecognized-form-masculine-plural":"-uii","definite-error-unrecognized-form-feminine-neuter-plural":"-uile"}},{"word":"-ui","pos":"suffix","definitions":["Forms verbs."],"pronunciation":"/uˈi/"},{"word":"-uica","pos":"suffix","definitions":["definite singular nominative/accusative of -uică"]},{"word":"-ul","pos":"suffix","definitions":["variant of -l"],"pronunciation":"/ul/","gender":"m","examples":[{"ro":"the (definite article)","en":null}],"forms":{"alternative":"-l"}},{"word":"-uleț","pos":"suffix","definitions":["Forms masculine diminutives of nouns."],"gender":"m","examples":[{"ro":"urs (“bear”) + -uleț → ursuleț (“little bear”)","en":null},{"ro":"coș (“basket”) + -uleț → coșuleț (“little basket”)","en":null}]},{"word":"-uliță","pos":"suffix","definitions":["Forms diminutives of some feminine nouns"],"examples":[{"ro":"frunză (“leaf”) + -uliță → frunzuliță (“little leaf”)","en":null},{"ro":"gâscă (“goose”) + -uliță → gâsculiță (“little goose”)","en":null}],"forms":{"plural":"-ulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-uliță","accusative-definite-nominative-singular":"-ulița","accusative-indefinite-nominative-plural":"-ulițe","accusative-definite-nominative-plural":"-ulițele","dative-genitive-indefinite-singular":"-ulițe","dative-definite-genitive-singular":"-uliței","dative-genitive-indefinite-plural":"-ulițe","dative-definite-genitive-plural":"-ulițelor","singular-vocative":"-uliță","plural-vocative":"-ulițelor"}},{"word":"-ului","pos":"suffix","definitions":["variant of -lui: the (definite article)"],"pronunciation":"/u.luj/","gender":"m","forms":{"alternative":"-lui"}},{"word":"-ură","pos":"suffix","definitions":["Suffix forming abstract nouns from adjectives."],"examples":[{"ro":"frânt (“broken”) + -ură → frântură (“fragment”)","en":null},{"ro":"ars (“burnt”) + -ură → arsură (“burnt thing”)","en":null},{"ro":"întors (“curved”) + -ură → întorsură (“bend, turn”)","en":null}],"forms":{"plural":"-uri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-ură","accusative-definite-nominative-singular":"-ura","accusative-indefinite-nominative-plural":"-ure","accusative-definite-nominative-plural":"-urele","dative-genitive-indefinite-singular":"-ure","dative-definite-genitive-singular":"-urei","dative-genitive-indefinite-plural":"-ure","dative-definite-genitive-plural":"-urelor","singular-vocative":"-ură","plural-vocative":"-urelor"}},{"word":"-uri","pos":"suffix","definitions":["Marks the plural of certain neuter (and more rarely feminine) nouns."],"pronunciation":"/urʲ/","gender":"n-p","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"-uri","accusative-definite-nominative":"-urile","dative-genitive-indefinite":"-uri","dative-definite-genitive":"-urilor","vocative":"-urilor"}},{"word":"-urie","pos":"suffix","definitions":["-uria"]},{"word":"-uș","pos":"suffix","definitions":["diminutive suffix (e.g. măgar (“donkey”) + -uș → măgăruș (“little donkey”))"],"pronunciation":"/uʃ/","forms":{"plural":"-uși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"-uș","accusative-definite-nominative-singular":"-ușul","accusative-indefinite-nominative-plural":"-uși","accusative-definite-nominative-plural":"-ușii","dative-genitive-indefinite-singular":"-uș","dative-definite-genitive-singular":"-ușului","dative-genitive-indefinite-plural":"-uși","dative-definite-genitive-plural":"-ușilor","singular-vocative":"-ușule","plural-vocative":"-ușilor"}},{"word":"-ușcă","pos":"suffix","definitions":["Forms feminine diminutives of nouns."],"examples":[{"ro":"muiere (“woman”) + -ușcă → muierușcă (“little woman”)","en":null},{"ro":"rață (“duck”) + -ușcă → rățușcă (“ducky”)","en":null},{"ro":"mierlă (“blackbird”) + -ușcă → mierlușcă (“small blackbird”)","en":null}],"forms":{"plural":"-uște"}},{"word":"-ușor","pos":"suffix","definitions":["alternative form of -șor"],"forms":{"plural":"-șori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"-ușor","accusative-definite-nominative-singular":"-ușorul","accusative-indefinite-nominative-plural":"-ușori","accusative-definite-nominative-plural":"-ușorii","dative-genitive-indefinite-singular":"-ușor","dative-definite-genitive-singular":"-ușorului","dative-genitive-indefinite-plural":"-ușori","dative-definite-genitive-plural":"-ușorilor","singular-vocative":"-ușorule","plural-vocative":"-ușorilor"}},{"word":"-ut","pos":"suffix","definitions":["Used with a stem to mark the past participle of second-conjugation verbs and regular third-conjugation verbs."],"examples":[{"ro":"pierde (“lose”) + -ut → pierdut (“lost”)","en":null}]},{"word":"-uț","pos":"suffix","definitions":["Forms masculine diminutives of nouns and adjectives."],"pronunciation":"/ut͡s/","examples":[{"ro":"mic (“small”) + -uț → micuț (“tiny”)","en":null},{"ro":"gras (“fat”) + -uț → grăsuț (“chubby”)","en":null},{"ro":"drag (“dear”) + -uț → drăguț (“cute, pretty, nice”)","en":null}],"forms":{"feminine-singular":"-uță","masculine-plural":"-uți","feminine-neuter-plural":"-uțe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-uț","error-unrecognized-form-feminine-indefinite-singular":"-uță","error-unrecognized-form-indefinite-masculine-plural":"-uți","error-unrecognized-form-feminine-indefinite-neuter-plural":"-uțe","definite-error-unrecognized-form-masculine-neuter-singular":"-uțul","definite-error-unrecognized-form-feminine-singular":"-uța","definite-error-unrecognized-form-masculine-plural":"-uții","definite-error-unrecognized-form-feminine-neuter-plural":"-uțele"}},{"word":"-uța","pos":"suffix","definitions":["Forms diminutives of feminine proper names."],"gender":"f","examples":[{"ro":"Anca + -uța → Ancuța","en":null},{"ro":"Ileana + -uța → Ilenuța","en":null},{"ro":"Maria + -uța → Măriuța","en":null}]},{"word":"-uță","pos":"suffix","definitions":["female equivalent of -uț"],"pronunciation":"/ˈu.t͡sə/","forms":{"plural":"-uțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-uță","accusative-definite-nominative-singular":"-uța","accusative-indefinite-nominative-plural":"-uțe","accusative-definite-nominative-plural":"-uțele","dative-genitive-indefinite-singular":"-uțe","dative-definite-genitive-singular":"-uței","dative-genitive-indefinite-plural":"-uțe","dative-definite-genitive-plural":"-uțelor","singular-vocative":"-uță","plural-vocative":"-uțelor"}},{"word":"-va","pos":"suffix","definitions":["suffixed to some adverbs and preopositions, meaning \"some\""],"pronunciation":"/va/","examples":[{"ro":"ce (“what”) + -va → ceva (“something”)","en":null},{"ro":"cine (“who”) + -va → cineva (“someone”)","en":null},{"ro":"unde (“where”) + -va → undeva (“somewhere”)","en":null}]},{"word":"◌̆","pos":"character","definitions":["A diacritical mark of the Latin script, called căciulă (“fur hat”) in Romanian, and found on Ă/ă."]},{"word":"◌̂","pos":"character","definitions":["A diacritical mark of the Latin script, called accent circumflex (“circumflex accent”) in Romanian, and found on Â/â and Î/î."]},{"word":"◌̦","pos":"character","definitions":["A diacritical mark of the Latin script, called virgulă (“comma”) in Romanian, and found on Ș/ș and Ț/ț."]},{"word":"1 Decembrie","pos":"name","definitions":["a commune of Ilfov County, Romania","a village in 1 Decembrie, Ilfov County, Romania","a village in Banca, Vaslui County, Romania"],"pronunciation":"/ɨnˈtɨj deˈt͡ʃembrije/","gender":"m"},{"word":"1-a","pos":"adj","definitions":["abbreviation of prima"]},{"word":"1-ul","pos":"adj","definitions":["abbreviation of primul: 1st"]},{"word":"10-a","pos":"adj","definitions":["abbreviation of zecea"]},{"word":"10-lea","pos":"adj","definitions":["abbreviation of zecelea: 10th"],"pronunciation":"/ˈze.t͡ʃe.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al 10-lea","feminine":"a 10-a"}},{"word":"100 metri","pos":"noun","definitions":["100 meters"],"pronunciation":"/o ˈsu.tə(de)ˈme.tri/"},{"word":"1000 metri","pos":"noun","definitions":["1000 meters"]},{"word":"10000 metri","pos":"noun","definitions":["10000 meters"]},{"word":"1500 metri","pos":"noun","definitions":["1500 meters"],"pronunciation":"/o ˈmi.e t͡ʃint͡ʃʲ ˈsu.te(de)ˈme.tri/"},{"word":"2 Mai","pos":"name","definitions":["a village in Limanu, Constanța County, Romania"],"pronunciation":"/doj maj/","gender":"m"},{"word":"2-a","pos":"adj","definitions":["abbreviation of doua"]},{"word":"200 metri","pos":"noun","definitions":["200 meters"]},{"word":"23 August","pos":"name","definitions":["a village in Zăvoi, Caraș-Severin County, Romania","a commune of Constanța County, Romania","a village in 23 August, Constanța County, Romania","a village in Malovăț, Mehedinți County, Romania"],"pronunciation":"/ˌdowəˈzet͡ʃʲ ʃi trej ˈawɡust/","gender":"m"},{"word":"3-a","pos":"adj","definitions":["abbreviation of treia"]},{"word":"3-lea","pos":"adj","definitions":["abbreviation of treilea: 3rd"],"gender":"m","forms":{"canonical-masculine-neuter":"al 3-lea","feminine":"a 3-a"}},{"word":"400 metri","pos":"noun","definitions":["400 meters"]},{"word":"5000 metri","pos":"noun","definitions":["5000 meters"]},{"word":"6-lea","pos":"adj","definitions":["abbreviation of șaselea: 6th"],"gender":"m","forms":{"canonical-masculine-neuter":"al 6-lea","feminine":"a 6-a"}},{"word":"7-a","pos":"adj","definitions":["abbreviation of șaptea"]},{"word":"800 metri","pos":"noun","definitions":["800 meters"]},{"word":"а","pos":"character","definitions":["The first letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"a","uppercase":"А"}},{"word":"А","pos":"character","definitions":["The first letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"canonical":"А (A)","lowercase":"а"}},{"word":"Азербайӂан","pos":"name","definitions":["Cyrillic spelling of Azerbaidjan.: Azerbaijan (a country in the South Caucasus in Asia and Europe)"],"gender":"f","forms":{"romanization":"Azerbaidjan","table-tags":"no-table-tags","inflection-template":"l","accusative-definite-nominative":"Азербайӂан","dative-definite-genitive":"Азербайӂан"}},{"word":"алгэ","pos":"noun","definitions":["Post-1930s Cyrillic spelling of algă."],"gender":"f","forms":{"romanization":"algă","plural":"алӂe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-Cyrl","accusative-indefinite-nominative-singular":"алгэ","accusative-definite-nominative-singular":"алга","accusative-indefinite-nominative-plural":"алӂe","accusative-definite-nominative-plural":"алӂeле","dative-genitive-indefinite-singular":"алӂe","dative-definite-genitive-singular":"алӂeй","dative-genitive-indefinite-plural":"алӂe","dative-definite-genitive-plural":"алӂeлор","singular-vocative":"алго","plural-vocative":"алӂeлор"}},{"word":"аменинца","pos":"verb","definitions":["Post-1930s Cyrillic spelling of amenința."],"forms":{"canonical":"а аменинца 1st conjugation","romanization":"a amenința","present-singular-third-person":"аменинцэ","participle-past":"аменинцат","table-tags":"no-table-tags","inflection-template":"l","infinitive":"а аменинца","gerund":"аменинцынд","first-person-indicative-present-singular":"аменинц","indicative-present-second-person-singular":"аменинць","indicative-present-singular-third-person":"аменинцэ","error-unrecognized-form-indicative-plural-present":"аменинцэм","first-person-imperfect-indicative-singular":"аменинцам","imperfect-indicative-second-person-singular":"аменинцай","imperfect-indicative-singular-third-person":"аменинца","error-unrecognized-form-imperfect-indicative-plural":"аменинцам","first-person-indicative-perfect-singular":"аменинцай","indicative-perfect-second-person-singular":"аменинцашь","indicative-perfect-singular-third-person":"аменинцэ","error-unrecognized-form-indicative-perfect-plural":"аменинцарам","first-person-indicative-pluperfect-singular":"аменинцасем","indicative-pluperfect-second-person-singular":"аменинцасешь","indicative-pluperfect-singular-third-person":"аменинцасе","error-unrecognized-form-indicative-pluperfect-plural":"аменинцасерэм","first-person-present-singular-subjunctive":"сэ аменинц","present-second-person-singular-subjunctive":"сэ аменинць","present-singular-subjunctive-third-person":"сэ аменинце","error-unrecognized-form-plural-present-subjunctive":"сэ аменинцэм","first-person-imperative-singular":"-","second-person-singular-subjunctive-third-person":"-","error-unrecognized-form-second-person-singular":"-","error-unrecognized-form-plural":"-","imperative-second-person-singular":"аменинцэ","error-unrecognized-form-imperative-plural":"аменинцаць","imperative-negative-second-person-singular":"ну аменинца","error-unrecognized-form-imperative-negative-plural":"ну аменинцаць"}},{"word":"анархист","pos":"noun","definitions":["Post-1930s Cyrillic spelling of anarhist."],"forms":{"romanization":"anarhist","plural":"анархишть","feminine":"equivalent анархистэ","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун анархист","accusative-definite-nominative-singular":"анархистул","accusative-indefinite-nominative-plural":"ниште анархишть","accusative-definite-nominative-plural":"анархиштий","dative-genitive-indefinite-singular":"унуй анархист","dative-definite-genitive-singular":"анархистулуй","dative-genitive-indefinite-plural":"унор анархишть","dative-definite-genitive-plural":"анархиштилор"}},{"word":"археолог","pos":"noun","definitions":["Cyrillic spelling of arheolog."],"gender":"m","forms":{"romanization":"arheolog","plural":"археолоӂь","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун археолог","accusative-definite-nominative-singular":"археологул","accusative-indefinite-nominative-plural":"ниште археолоӂь","accusative-definite-nominative-plural":"археолоӂий","dative-genitive-indefinite-singular":"унуй археолог","dative-definite-genitive-singular":"археологулуй","dative-genitive-indefinite-plural":"унор археолоӂь","dative-definite-genitive-plural":"археолоӂилор"}},{"word":"б","pos":"character","definitions":["The second letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"b","uppercase":"Б"}},{"word":"Б","pos":"character","definitions":["The second letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"B","lowercase":"б"}},{"word":"букура","pos":"verb","definitions":["Post-1930s Cyrillic spelling of bucura."],"forms":{"canonical":"а букура 1st conjugation","romanization":"a bucura","present-singular-third-person":"букурэ","participle-past":"букурат","table-tags":"no-table-tags","inflection-template":"l","infinitive":"а букура","gerund":"букурынд","first-person-indicative-present-singular":"букур","indicative-present-second-person-singular":"букурь","indicative-present-singular-third-person":"букурэ","error-unrecognized-form-indicative-plural-present":"букурэм","first-person-imperfect-indicative-singular":"букурам","imperfect-indicative-second-person-singular":"букурай","imperfect-indicative-singular-third-person":"букура","error-unrecognized-form-imperfect-indicative-plural":"букурам","first-person-indicative-perfect-singular":"букурай","indicative-perfect-second-person-singular":"букурашь","indicative-perfect-singular-third-person":"букурэ","error-unrecognized-form-indicative-perfect-plural":"букурарам","first-person-indicative-pluperfect-singular":"букурасем","indicative-pluperfect-second-person-singular":"букурасешь","indicative-pluperfect-singular-third-person":"букурасе","error-unrecognized-form-indicative-pluperfect-plural":"букурасерэм","first-person-present-singular-subjunctive":"сэ букур","present-second-person-singular-subjunctive":"сэ букурь","present-singular-subjunctive-third-person":"сэ букуре","error-unrecognized-form-plural-present-subjunctive":"сэ букурэм","first-person-imperative-singular":"-","second-person-singular-subjunctive-third-person":"-","error-unrecognized-form-second-person-singular":"-","error-unrecognized-form-plural":"-","imperative-second-person-singular":"букурэ","error-unrecognized-form-imperative-plural":"букураць","imperative-negative-second-person-singular":"ну букура","error-unrecognized-form-imperative-negative-plural":"ну букураць"}},{"word":"Букурешть","pos":"name","definitions":["Post-1930s Cyrillic spelling of București."],"pronunciation":"/bu.kuˈreʃtʲ/","gender":"m","forms":{"romanization":"București","accusative-definite-nominative":"Букурештюл","dative-definite-genitive":"Букурештюлуй","vocative":"Букурештюле"}},{"word":"Бэлць","pos":"name","definitions":["Post-1930s Cyrillic spelling of Bălți.: Bălți (a city and municipality of Moldova)"],"pronunciation":"/ˈbəltsʲ/","gender":"m","forms":{"romanization":"Bălți","accusative-definite-nominative":"Бэлць"}},{"word":"бэрбат","pos":"noun","definitions":["Post-1930s Cyrillic spelling of bărbat."],"gender":"m","forms":{"romanization":"bărbat","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун бэрбат","accusative-definite-nominative-singular":"бэрбатул","accusative-indefinite-nominative-plural":"ниште бэрбаць","accusative-definite-nominative-plural":"бэрбаций","dative-genitive-indefinite-singular":"унуй бэрбат","dative-definite-genitive-singular":"бэрбатулуй","dative-genitive-indefinite-plural":"унор бэрбаць","dative-definite-genitive-plural":"бэрбацилор"}},{"word":"бэят","pos":"noun","definitions":["Post-1930s Cyrillic spelling of băiat."],"pronunciation":"[bəˈjat]","gender":"m","forms":{"romanization":"băiat","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун бэят","accusative-definite-nominative-singular":"бэятул","accusative-indefinite-nominative-plural":"ниште бэець","accusative-definite-nominative-plural":"бэеций","dative-genitive-indefinite-singular":"унуй бэят","dative-definite-genitive-singular":"бэятулуй","dative-genitive-indefinite-plural":"унор бэець","dative-definite-genitive-plural":"бэецилор"}},{"word":"в","pos":"character","definitions":["The third letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"v","uppercase":"В"}},{"word":"В","pos":"character","definitions":["The third letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"V","lowercase":"в"}},{"word":"вис","pos":"noun","definitions":["Post-1930s Cyrillic spelling of vis."],"pronunciation":"[vis]","gender":"n","forms":{"romanization":"vis","table-tags":"no-table-tags","inflection-template":"ro-noun-n-Cyrl","accusative-indefinite-nominative-singular":"ун вис","accusative-definite-nominative-singular":"висул","accusative-indefinite-nominative-plural":"ниште висе","accusative-definite-nominative-plural":"виселе","dative-genitive-indefinite-singular":"унуи вис","dative-definite-genitive-singular":"висулуй","dative-genitive-indefinite-plural":"унор висе","dative-definite-genitive-plural":"виселор"}},{"word":"г","pos":"character","definitions":["The fourth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"g","uppercase":"Г"}},{"word":"Г","pos":"character","definitions":["The fourth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"canonical":"Г (G)","lowercase":"г"}},{"word":"д","pos":"character","definitions":["The fifth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"d","uppercase":"Д"}},{"word":"Д","pos":"character","definitions":["The fifth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"D","lowercase":"д"}},{"word":"делир","pos":"noun","definitions":["Post-1930s Cyrillic spelling of delir."],"pronunciation":"[deˈlir]","gender":"n","forms":{"romanization":"delir","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri-Cyrl","accusative-indefinite-nominative-singular":"ун делир","accusative-definite-nominative-singular":"делирул","accusative-indefinite-nominative-plural":"ниште делирурь","accusative-definite-nominative-plural":"делируриле","dative-genitive-indefinite-singular":"унуи делир","dative-definite-genitive-singular":"делирулуй","dative-genitive-indefinite-plural":"унор делирурь","dative-definite-genitive-plural":"делирурилор"}},{"word":"демокрация","pos":"noun","definitions":["definite nominative/accusative singular of демокрацие (democrație) Cyrillic spelling of democrația."],"gender":"f","forms":{"romanization":"democrația"}},{"word":"дипломация","pos":"noun","definitions":["definite nominative/accusative singular of дипломацие (diplomație) Cyrillic spelling of diplomația."],"gender":"f","forms":{"romanization":"diplomația"}},{"word":"доктор","pos":"noun","definitions":["Post-1930s Cyrillic spelling of doctor."],"pronunciation":"[ˈdok.tor]","gender":"m","forms":{"romanization":"doctor","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун доктор","accusative-definite-nominative-singular":"докторул","accusative-indefinite-nominative-plural":"ниште докторь","accusative-definite-nominative-plural":"докторий","dative-genitive-indefinite-singular":"унуй доктор","dative-definite-genitive-singular":"докторулуй","dative-genitive-indefinite-plural":"унор докторь","dative-definite-genitive-plural":"докторилор"}},{"word":"е","pos":"character","definitions":["The sixth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"e","uppercase":"Е"}},{"word":"Е","pos":"character","definitions":["The sixth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"E","lowercase":"е"}},{"word":"есте","pos":"verb","definitions":["Post-1930s Cyrillic spelling of este."],"pronunciation":"[ˈjeste]","forms":{"romanization":"este"}},{"word":"Еуропа","pos":"name","definitions":["Cyrillic spelling of Europa.: Europe (a continent located west of Asia and north of Africa)"],"pronunciation":"/e.uˈro.pa/","gender":"f","forms":{"romanization":"Europa"}},{"word":"ж","pos":"character","definitions":["The seventh letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"j","uppercase":"Ж"}},{"word":"Ж","pos":"character","definitions":["The seventh letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"J","lowercase":"ж"}},{"word":"ӂ","pos":"character","definitions":["The eighth letter of the Moldovan alphabet, written in the Cyrillic script."],"pronunciation":"/d͡ʒ/","forms":{"romanization":"gi","uppercase":"Ӂ"}},{"word":"Ӂ","pos":"character","definitions":["The eighth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"Gi","lowercase":"ӂ"}},{"word":"з","pos":"character","definitions":["The ninth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"z","uppercase":"З"}},{"word":"З","pos":"character","definitions":["The ninth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"Z","lowercase":"з"}},{"word":"зи","pos":"noun","definitions":["Post-1930s Cyrillic spelling of zi."],"forms":{"romanization":"zi","plural":"зиле","table-tags":"no-table-tags","inflection-template":"ro-noun-f-Cyrl","accusative-indefinite-nominative-singular":"зи","accusative-definite-nominative-singular":"зиуа","accusative-indefinite-nominative-plural":"зиле","accusative-definite-nominative-plural":"зилеле","dative-genitive-indefinite-singular":"зиле","dative-definite-genitive-singular":"зилей","dative-genitive-indefinite-plural":"зиле","dative-definite-genitive-plural":"зилелор","singular-vocative":"-","plural-vocative":"-"}},{"word":"зиче","pos":"verb","definitions":["Post-1930s Cyrillic spelling of zice."],"forms":{"canonical":"а зиче 3rd conjugation","romanization":"a zice","present-singular-third-person":"зиче","participle-past":"зис","subjunctive-third-person":"зикэ","table-tags":"no-table-tags","inflection-template":"l","infinitive":"а зиче","gerund":"зикынд","first-person-indicative-present-singular":"зик","indicative-present-second-person-singular":"зичь","indicative-present-singular-third-person":"зиче","error-unrecognized-form-indicative-plural-present":"зичем","first-person-imperfect-indicative-singular":"зичам","imperfect-indicative-second-person-singular":"зичай","imperfect-indicative-singular-third-person":"зича","error-unrecognized-form-imperfect-indicative-plural":"зичам","first-person-indicative-perfect-singular":"зисей","indicative-perfect-second-person-singular":"зисешь","indicative-perfect-singular-third-person":"зисе","error-unrecognized-form-indicative-perfect-plural":"зисерэм","first-person-indicative-pluperfect-singular":"зисесем","indicative-pluperfect-second-person-singular":"зисесешь","indicative-pluperfect-singular-third-person":"зисесе","error-unrecognized-form-indicative-pluperfect-plural":"зисесерэм","first-person-present-singular-subjunctive":"сэ зик","present-second-person-singular-subjunctive":"сэ зичь","present-singular-subjunctive-third-person":"сэ зикэ","error-unrecognized-form-plural-present-subjunctive":"сэ зичем","first-person-imperative-singular":"-","second-person-singular-subjunctive-third-person":"-","error-unrecognized-form-second-person-singular":"-","error-unrecognized-form-plural":"-","imperative-second-person-singular":"зи","error-unrecognized-form-imperative-plural":"зичець","imperative-negative-second-person-singular":"ну зиче","error-unrecognized-form-imperative-negative-plural":"ну зичець"}},{"word":"и","pos":"character","definitions":["The tenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"i","uppercase":"И"}},{"word":"И","pos":"character","definitions":["The tenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"I","lowercase":"и"}},{"word":"империалист","pos":"noun","definitions":["Post-1930s Cyrillic spelling of imperialist."],"forms":{"romanization":"imperialist","plural":"империалишть","feminine":"equivalent империалистэ","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун империалист","accusative-definite-nominative-singular":"империалистул","accusative-indefinite-nominative-plural":"ниште империалишть","accusative-definite-nominative-plural":"империалиштий","dative-genitive-indefinite-singular":"унуй империалист","dative-definite-genitive-singular":"империалистулуй","dative-genitive-indefinite-plural":"унор империалишть","dative-definite-genitive-plural":"империалиштилор"}},{"word":"институция","pos":"noun","definitions":["definite nominative/accusative singular of институцие (instituție) Cyrillic spelling of instituția."],"gender":"f","forms":{"romanization":"instituția"}},{"word":"информация","pos":"noun","definitions":["definite nominative/accusative singular of информацие (informație) Cyrillic spelling of informația."],"gender":"f","forms":{"romanization":"informația"}},{"word":"Италия","pos":"name","definitions":["Cyrillic spelling of Italia.: Italy (a country in Southern Europe)"],"pronunciation":"[iˈta.li.a]","gender":"f","forms":{"romanization":"Italia","table-tags":"no-table-tags","inflection-template":"l","accusative-definite-nominative":"Италия","dative-definite-genitive":"Италией"}},{"word":"й","pos":"character","definitions":["The eleventh letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"i","uppercase":"Й"}},{"word":"Й","pos":"character","definitions":["The eleventh letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"I","lowercase":"й"}},{"word":"к","pos":"character","definitions":["The twelfth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"c","uppercase":"К"}},{"word":"К","pos":"character","definitions":["The twelfth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"canonical":"К (C)","lowercase":"к"}},{"word":"капиталист","pos":"noun","definitions":["Post-1930s Cyrillic spelling of capitalist."],"forms":{"romanization":"capitalist","plural":"капиталишть","feminine":"equivalent капиталистэ","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун капиталист","accusative-definite-nominative-singular":"капиталистул","accusative-indefinite-nominative-plural":"ниште капиталишть","accusative-definite-nominative-plural":"капиталиштий","dative-genitive-indefinite-singular":"унуй капиталист","dative-definite-genitive-singular":"капиталистулуй","dative-genitive-indefinite-plural":"унор капиталишть","dative-definite-genitive-plural":"капиталиштилор"}},{"word":"Кишинэу","pos":"name","definitions":["Post-1930s Cyrillic spelling of Chișinău.: Chișinău (the capital city of Moldova)"],"gender":"n","forms":{"romanization":"Chișinău","accusative-definite-nominative":"Кишинэул","dative-definite-genitive":"Кишинэулуи"}},{"word":"комунист","pos":"noun","definitions":["Post-1930s Cyrillic spelling of comunist."],"forms":{"romanization":"comunist","plural":"комуништь","feminine":"equivalent комунистэ","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун комунист","accusative-definite-nominative-singular":"комунистул","accusative-indefinite-nominative-plural":"ниште комуништь","accusative-definite-nominative-plural":"комуништий","dative-genitive-indefinite-singular":"унуй комунист","dative-definite-genitive-singular":"комунистулуй","dative-genitive-indefinite-plural":"унор комуништь","dative-definite-genitive-plural":"комуништилор"}},{"word":"конституция","pos":"noun","definitions":["definite nominative/accusative singular of конституцие (constituție) Cyrillic spelling of constituția."],"gender":"f","forms":{"romanization":"constituția"}},{"word":"копейкэ","pos":"noun","definitions":["Post-1930s Cyrillic spelling of copeică."],"gender":"f","forms":{"romanization":"copeică","plural":"копейчи"}},{"word":"космонаут","pos":"noun","definitions":["Post-1930s Cyrillic spelling of cosmonaut."],"forms":{"romanization":"cosmonaut","plural":"космонауць","feminine":"equivalent космонаутэ","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун космонаут","accusative-definite-nominative-singular":"космонаутул","accusative-indefinite-nominative-plural":"ниште космонауць","accusative-definite-nominative-plural":"космонауций","dative-genitive-indefinite-singular":"унуй космонаут","dative-definite-genitive-singular":"космонаутулуй","dative-genitive-indefinite-plural":"унор космонауць","dative-definite-genitive-plural":"космонауцилор"}},{"word":"космонауць","pos":"noun","definitions":["plural of космонаут (cosmonaut) Post-1930s Cyrillic spelling of cosmonauți."],"gender":"m-p","forms":{"romanization":"cosmonauți"}},{"word":"култура","pos":"noun","definitions":["definite nominative/accusative singular of културэ (cultură) Cyrillic spelling of cultura."],"pronunciation":"[kulˈtura]","gender":"f","forms":{"romanization":"cultura"}},{"word":"кынтэрец","pos":"noun","definitions":["Post-1930s Cyrillic spelling of cântăreț."],"pronunciation":"[kɨn.təˈrets]","gender":"m","forms":{"romanization":"cîntăreț","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун кынтэрец","accusative-definite-nominative-singular":"кынтэрецул","accusative-indefinite-nominative-plural":"ниште кынтэрець","accusative-definite-nominative-plural":"кынтэреций","dative-genitive-indefinite-singular":"унуй кынтэрец","dative-definite-genitive-singular":"кынтэрецулуй","dative-genitive-indefinite-plural":"унор кынтэрець","dative-definite-genitive-plural":"кынтэрецилор"}},{"word":"л","pos":"character","definitions":["The thirteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"l","uppercase":"Л"}},{"word":"Л","pos":"character","definitions":["The thirteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"L","lowercase":"л"}},{"word":"ла","pos":"prep","definitions":["Post-1930s Cyrillic spelling of la."],"pronunciation":"/la/","forms":{"romanization":"la"}},{"word":"леу","pos":"noun","definitions":["Post-1930s Cyrillic spelling of leu."],"pronunciation":"/lew/","gender":"m","forms":{"romanization":"leu"}},{"word":"м","pos":"character","definitions":["The fourteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"uppercase":"М"}},{"word":"М","pos":"character","definitions":["The fourteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"M","lowercase":"м"}},{"word":"марий","pos":"adj","definitions":["Post-1930s Cyrillic spelling of marii."],"forms":{"romanization":"marii"}},{"word":"машинэ","pos":"noun","definitions":["Post-1930s Cyrillic spelling of mașină."],"gender":"f","forms":{"romanization":"mașină","plural":"машине","table-tags":"no-table-tags","inflection-template":"ro-noun-f-Cyrl","accusative-indefinite-nominative-singular":"машинэ","accusative-definite-nominative-singular":"машина","accusative-indefinite-nominative-plural":"машине","accusative-definite-nominative-plural":"машинеле","dative-genitive-indefinite-singular":"машине","dative-definite-genitive-singular":"машиней","dative-genitive-indefinite-plural":"машине","dative-definite-genitive-plural":"машинелор","singular-vocative":"-","plural-vocative":"-"}},{"word":"милиция","pos":"noun","definitions":["definite nominative/accusative singular of милицие (miliție) Cyrillic spelling of miliția."],"gender":"f","forms":{"romanization":"miliția"}},{"word":"Молдова","pos":"name","definitions":["Post-1930s Cyrillic spelling of Moldova. Moldova (a country in Eastern Europe)"],"pronunciation":"[mol.do.va]","gender":"f","forms":{"romanization":"Moldova","table-tags":"no-table-tags","inflection-template":"l","accusative-definite-nominative":"Молдова","dative-definite-genitive":"Молдовей"}},{"word":"Молдовей","pos":"name","definitions":["definite genitive/dative singular of Молдова (Moldova)"],"forms":{"romanization":"Moldovei"}},{"word":"молдовенеск","pos":"adj","definitions":["Post-1930s Cyrillic spelling of moldovenesc."],"pronunciation":"/mol.do.veˈnesk/","gender":"m","forms":{"romanization":"moldovenesc","feminine-singular":"молдовеняскэ","plural":"молдовенешть","table-tags":"no-table-tags","inflection-template":"ro-adj-3-esc-Cyrl","error-unrecognized-form-indefinite-masculine-neuter-singular":"молдовенеск","error-unrecognized-form-feminine-indefinite-singular":"молдовеняскэ","error-unrecognized-form-indefinite-masculine-plural":"молдовенешть","error-unrecognized-form-feminine-indefinite-neuter-plural":"молдовенешть","definite-error-unrecognized-form-masculine-neuter-singular":"молдовенескул","definite-error-unrecognized-form-feminine-singular":"молдовеняска","definite-error-unrecognized-form-masculine-plural":"молдовенештий","definite-error-unrecognized-form-feminine-neuter-plural":"молдовенештиле"}},{"word":"молдовенеште","pos":"adv","definitions":["Post-1930s Cyrillic spelling of moldovenește."],"pronunciation":"[mol.do.veˈne.ʃte]","examples":[{"ro":"финдкэ ворбеск ромынеште, ворбеск ши молдовенеште","en":"being that I speak Romanian, I also speak Moldavian."}],"forms":{"romanization":"moldovenește"}},{"word":"молдовеняскэ","pos":"adj","definitions":["feminine singular of молдовенеск (moldovenesc)"],"pronunciation":"/mol.do.veˈne̯as.kə/","forms":{"romanization":"moldovenească"}},{"word":"морков","pos":"noun","definitions":["Post-1930s Cyrillic spelling of morcov."],"gender":"m","forms":{"romanization":"morcov","plural":"морковь","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун морков","accusative-definite-nominative-singular":"морковул","accusative-indefinite-nominative-plural":"ниште морковь","accusative-definite-nominative-plural":"морковий","dative-genitive-indefinite-singular":"унуй морков","dative-definite-genitive-singular":"морковулуй","dative-genitive-indefinite-plural":"унор морковь","dative-definite-genitive-plural":"морковилор"}},{"word":"морковь","pos":"noun","definitions":["plural of морков (morcov) Post-1930s Cyrillic spelling of morcovi."],"pronunciation":"[ˈmoɾ.kovʲ]","gender":"m-p","forms":{"romanization":"morcovi"}},{"word":"Москова","pos":"name","definitions":["Post-1930s Cyrillic spelling of Moscova."],"pronunciation":"/ˈmos.ko.va/","gender":"f","forms":{"romanization":"Moscova","table-tags":"no-table-tags","inflection-template":"l","accusative-definite-nominative":"Москова","dative-definite-genitive":"Московей"}},{"word":"н","pos":"character","definitions":["The fifteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"canonical":"н (n)","uppercase":"Н"}},{"word":"Н","pos":"character","definitions":["The fifteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"N","lowercase":"н"}},{"word":"навигатор","pos":"noun","definitions":["Post-1930s Cyrillic spelling of navigator."],"gender":"m","forms":{"romanization":"navigator","plural":"навигаторь","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун навигатор","accusative-definite-nominative-singular":"навигаторул","accusative-indefinite-nominative-plural":"ниште навигаторь","accusative-definite-nominative-plural":"навигаторий","dative-genitive-indefinite-singular":"унуй навигатор","dative-definite-genitive-singular":"навигаторулуй","dative-genitive-indefinite-plural":"унор навигаторь","dative-definite-genitive-plural":"навигаторилор"}},{"word":"националист","pos":"noun","definitions":["Post-1930s Cyrillic spelling of naționalist."],"forms":{"romanization":"naționalist","plural":"националишть","feminine":"equivalent националистэ","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун националист","accusative-definite-nominative-singular":"националистул","accusative-indefinite-nominative-plural":"ниште националишть","accusative-definite-nominative-plural":"националиштий","dative-genitive-indefinite-singular":"унуй националист","dative-definite-genitive-singular":"националистулуй","dative-genitive-indefinite-plural":"унор националишть","dative-definite-genitive-plural":"националиштилор"}},{"word":"Нистрян","pos":"name","definitions":["Post-1930s Cyrillic spelling of Nistrean."],"gender":"m","forms":{"romanization":"Nistrean"}},{"word":"ниште","pos":"article","definitions":["Cyrillic spelling of niște."],"forms":{"romanization":"niște"}},{"word":"ноапте","pos":"noun","definitions":["Post-1930s Cyrillic spelling of noapte."],"forms":{"romanization":"noapte","plural":"нопць","table-tags":"no-table-tags","accusative-indefinite-nominative-singular":"ноапте","accusative-definite-nominative-singular":"ноаптя","accusative-indefinite-nominative-plural":"нопць","accusative-definite-nominative-plural":"нопциле","dative-genitive-indefinite-singular":"нопць","dative-definite-genitive-singular":"нопций","dative-genitive-indefinite-plural":"нопць","dative-definite-genitive-plural":"нопцилор","singular-vocative":"ноапте","plural-vocative":"нопцилор"}},{"word":"о","pos":"character","definitions":["The sixteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"o","uppercase":"О"}},{"word":"о","pos":"article","definitions":["Cyrillic spelling of o."],"forms":{"romanization":"o"}},{"word":"о","pos":"intj","definitions":["Cyrillic spelling of o."],"forms":{"romanization":"o"}},{"word":"о","pos":"pron","definitions":["Cyrillic spelling of o."],"forms":{"romanization":"o"}},{"word":"о","pos":"verb","definitions":["Cyrillic spelling of o."],"forms":{"romanization":"o"}},{"word":"о","pos":"verb","definitions":["Cyrillic spelling of o."],"forms":{"romanization":"o"}},{"word":"О","pos":"character","definitions":["The sixteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"O","lowercase":"о"}},{"word":"ображь","pos":"noun","definitions":["plural of образ (obraz) Cyrillic spelling of obraji."],"gender":"m-p","forms":{"romanization":"obraji"}},{"word":"образ","pos":"noun","definitions":["Cyrillic spelling of obraz."],"forms":{"romanization":"obraz","plural":"ображь","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун образ","accusative-definite-nominative-singular":"образул","accusative-indefinite-nominative-plural":"ниште ображь","accusative-definite-nominative-plural":"ображий","dative-genitive-indefinite-singular":"унуй образ","dative-definite-genitive-singular":"образулуй","dative-genitive-indefinite-plural":"унор ображь","dative-definite-genitive-plural":"ображилор"}},{"word":"организация","pos":"noun","definitions":["definite nominative/accusative singular of организацие (organizație) Cyrillic spelling of organizația."],"gender":"f","forms":{"romanization":"organizația"}},{"word":"п","pos":"character","definitions":["The seventeenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"p","uppercase":"П","lowercase":"о"}},{"word":"П","pos":"character","definitions":["The seventeenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"P","lowercase":"о"}},{"word":"партид","pos":"noun","definitions":["Post-1930s Cyrillic spelling of partid."],"gender":"n","forms":{"romanization":"partid","plural":"партиде","table-tags":"no-table-tags","inflection-template":"ro-noun-n-Cyrl","accusative-indefinite-nominative-singular":"ун партид","accusative-definite-nominative-singular":"партидул","accusative-indefinite-nominative-plural":"ниште партиде","accusative-definite-nominative-plural":"партиделе","dative-genitive-indefinite-singular":"унуи партид","dative-definite-genitive-singular":"партидулуй","dative-genitive-indefinite-plural":"унор партиде","dative-definite-genitive-plural":"партиделор"}},{"word":"патру","pos":"num","definitions":["Post-1930s Cyrillic spelling of patru. (four)"],"pronunciation":"/ˈpa.tru/","forms":{"romanization":"patru"}},{"word":"пенис","pos":"noun","definitions":["Post-1930s Cyrillic spelling of penis."],"pronunciation":"[ˈpe.nis]","gender":"n","forms":{"romanization":"penis","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri-Cyrl","accusative-indefinite-nominative-singular":"ун пенис","accusative-definite-nominative-singular":"пенисул","accusative-indefinite-nominative-plural":"ниште пенисурь","accusative-definite-nominative-plural":"пенисуриле","dative-genitive-indefinite-singular":"унуи пенис","dative-definite-genitive-singular":"пенисулуй","dative-genitive-indefinite-plural":"унор пенисурь","dative-definite-genitive-plural":"пенисурилор"}},{"word":"политика","pos":"noun","definitions":["definite nominative/accusative singular of политикэ (politică) Cyrillic spelling of politica."],"gender":"f","forms":{"romanization":"politica"}},{"word":"полиция","pos":"noun","definitions":["definite nominative/accusative singular of полицие (poliție) Cyrillic spelling of poliția."],"gender":"f","forms":{"romanization":"poliția"}},{"word":"популация","pos":"noun","definitions":["definite nominative/accusative singular of популацие (populație) Cyrillic spelling of populația."],"gender":"f","forms":{"romanization":"populația"}},{"word":"пролетарь дин тоате цэриле, уници-вэ","pos":"phrase","definitions":["Post-1930s Cyrillic spelling of proletari din toate țările, uniți-vă."],"forms":{"romanization":"proletari din toate țările"}},{"word":"психолог","pos":"noun","definitions":["Cyrillic spelling of psiholog."],"gender":"m","forms":{"romanization":"psiholog","plural":"психолоӂь","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун психолог","accusative-definite-nominative-singular":"психологул","accusative-indefinite-nominative-plural":"ниште психолоӂь","accusative-definite-nominative-plural":"психолоӂий","dative-genitive-indefinite-singular":"унуй психолог","dative-definite-genitive-singular":"психологулуй","dative-genitive-indefinite-plural":"унор психолоӂь","dative-definite-genitive-plural":"психолоӂилор"}},{"word":"р","pos":"character","definitions":["The eighteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"r","uppercase":"Р"}},{"word":"Р","pos":"character","definitions":["The eighteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"R","lowercase":"р"}},{"word":"република","pos":"noun","definitions":["definite nominative/accusative singular of републикэ (republică) Cyrillic spelling of republica."],"gender":"f","forms":{"romanization":"republica"}},{"word":"републикэ","pos":"noun","definitions":["Cyrillic spelling of republică."],"pronunciation":"[reˈpublikə]","gender":"f","forms":{"romanization":"republică","plural":"републичи","table-tags":"no-table-tags","inflection-template":"ro-noun-f-Cyrl","accusative-indefinite-nominative-singular":"републикэ","accusative-definite-nominative-singular":"република","accusative-indefinite-nominative-plural":"републичи","accusative-definite-nominative-plural":"републичиле","dative-genitive-indefinite-singular":"републичи","dative-definite-genitive-singular":"републичий","dative-genitive-indefinite-plural":"републичи","dative-definite-genitive-plural":"републичилор","singular-vocative":"-","plural-vocative":"-"}},{"word":"Ромыниа","pos":"name","definitions":["Post-1930s Cyrillic spelling of România."],"gender":"f","forms":{"romanization":"Romînia"}},{"word":"Ромыния","pos":"name","definitions":["Post-1930s Cyrillic spelling of România.: Romania (a country in Southeast Europe)"],"pronunciation":"[romɨˈnia]","gender":"f","forms":{"romanization":"Romînia","table-tags":"no-table-tags","inflection-template":"l","accusative-definite-nominative":"Ромыния","dative-definite-genitive":"Ромынией"}},{"word":"рублэ","pos":"noun","definitions":["Post-1930s Cyrillic spelling of rublă."],"gender":"f","forms":{"romanization":"rublă","plural":"рубле","table-tags":"no-table-tags","inflection-template":"ro-noun-f-Cyrl","accusative-indefinite-nominative-singular":"рублэ","accusative-definite-nominative-singular":"рубла","accusative-indefinite-nominative-plural":"рубле","accusative-definite-nominative-plural":"рублеле","dative-genitive-indefinite-singular":"рубле","dative-definite-genitive-singular":"рублей","dative-genitive-indefinite-plural":"рубле","dative-definite-genitive-plural":"рублелор","singular-vocative":"-","plural-vocative":"-"}},{"word":"Русия","pos":"name","definitions":["Post-1930s Cyrillic spelling of Rusia.: Russia (a transcontinental country in Eastern Europe and North Asia)"],"pronunciation":"[ˈru.si.a]","gender":"f","forms":{"romanization":"Rusia","table-tags":"no-table-tags","inflection-template":"l","accusative-definite-nominative":"Русия","dative-definite-genitive":"Русией"}},{"word":"с","pos":"character","definitions":["The nineteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"canonical":"с (s)","uppercase":"С"}},{"word":"С","pos":"character","definitions":["The nineteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"S","lowercase":"с"}},{"word":"сепаратист","pos":"noun","definitions":["Post-1930s Cyrillic spelling of separatist."],"forms":{"romanization":"separatist","plural":"сепаратишть","feminine":"equivalent сепаратистэ","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун сепаратист","accusative-definite-nominative-singular":"сепаратистул","accusative-indefinite-nominative-plural":"ниште сепаратишть","accusative-definite-nominative-plural":"сепаратиштий","dative-genitive-indefinite-singular":"унуй сепаратист","dative-definite-genitive-singular":"сепаратистулуй","dative-genitive-indefinite-plural":"унор сепаратишть","dative-definite-genitive-plural":"сепаратиштилор"}},{"word":"собэ","pos":"noun","definitions":["Post-1930s Cyrillic spelling of sobă."],"pronunciation":"[ˈso.bə]","gender":"f","forms":{"romanization":"sobă","plural":"собе","table-tags":"no-table-tags","inflection-template":"ro-noun-f-Cyrl","accusative-indefinite-nominative-singular":"собэ","accusative-definite-nominative-singular":"соба","accusative-indefinite-nominative-plural":"собе","accusative-definite-nominative-plural":"собеле","dative-genitive-indefinite-singular":"собе","dative-definite-genitive-singular":"собей","dative-genitive-indefinite-plural":"собе","dative-definite-genitive-plural":"собелор","singular-vocative":"-","plural-vocative":"-"}},{"word":"совет","pos":"noun","definitions":["Post-1930s Cyrillic spelling of soviet."],"gender":"n","forms":{"romanization":"sovet","plural":"совете","table-tags":"no-table-tags","inflection-template":"ro-noun-n-Cyrl","accusative-indefinite-nominative-singular":"ун совет","accusative-definite-nominative-singular":"советул","accusative-indefinite-nominative-plural":"ниште совете","accusative-definite-nominative-plural":"советеле","dative-genitive-indefinite-singular":"унуи совет","dative-definite-genitive-singular":"советулуй","dative-genitive-indefinite-plural":"унор совете","dative-definite-genitive-plural":"советелор"}},{"word":"советик","pos":"noun","definitions":["Post-1930s Cyrillic spelling of sovietic."],"gender":"m","forms":{"romanization":"sovetic","plural":"советичи","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун советик","accusative-definite-nominative-singular":"советикул","accusative-indefinite-nominative-plural":"ниште советичь","accusative-definite-nominative-plural":"советичий","dative-genitive-indefinite-singular":"унуй советик","dative-definite-genitive-singular":"советикулуй","dative-genitive-indefinite-plural":"унор советичь","dative-definite-genitive-plural":"советичилор"}},{"word":"советикэ","pos":"noun","definitions":["Post-1930s Cyrillic spelling of sovietică."],"gender":"f","forms":{"romanization":"sovetică","plural":"советиче","table-tags":"no-table-tags","inflection-template":"ro-noun-f-Cyrl","accusative-indefinite-nominative-singular":"советикэ","accusative-definite-nominative-singular":"советика","accusative-indefinite-nominative-plural":"советиче","accusative-definite-nominative-plural":"советичеле","dative-genitive-indefinite-singular":"советиче","dative-definite-genitive-singular":"советичей","dative-genitive-indefinite-plural":"советиче","dative-definite-genitive-plural":"советичелор","singular-vocative":"-","plural-vocative":"-"}},{"word":"советиче","pos":"noun","definitions":["plural of советикэ (sovetică)"],"gender":"f","forms":{"romanization":"sovetice"}},{"word":"солдат","pos":"noun","definitions":["Post-1930s Cyrillic spelling of soldat."],"forms":{"romanization":"soldat","plural":"солдаць","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун солдат","accusative-definite-nominative-singular":"солдатул","accusative-indefinite-nominative-plural":"ниште солдаць","accusative-definite-nominative-plural":"солдаций","dative-genitive-indefinite-singular":"унуй солдат","dative-definite-genitive-singular":"солдатулуй","dative-genitive-indefinite-plural":"унор солдаць","dative-definite-genitive-plural":"солдацилор"}},{"word":"солдаць","pos":"noun","definitions":["plural of солдат (soldat) Post-1930s Cyrillic spelling of soldați."],"gender":"m-p","forms":{"romanization":"soldați"}},{"word":"т","pos":"character","definitions":["The twentieth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"t","uppercase":"Т"}},{"word":"Т","pos":"character","definitions":["The twentieth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"T","lowercase":"т"}},{"word":"терорист","pos":"noun","definitions":["Post-1930s Cyrillic spelling of terorist."],"forms":{"romanization":"terorist","plural":"тероришть","feminine":"equivalent терористэ","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун терорист","accusative-definite-nominative-singular":"терористул","accusative-indefinite-nominative-plural":"ниште тероришть","accusative-definite-nominative-plural":"терориштий","dative-genitive-indefinite-singular":"унуй терорист","dative-definite-genitive-singular":"терористулуй","dative-genitive-indefinite-plural":"унор тероришть","dative-definite-genitive-plural":"терориштилор"}},{"word":"у","pos":"character","definitions":["The twenty-first letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"u","uppercase":"У"}},{"word":"У","pos":"character","definitions":["The twenty-first letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"canonical":"У (U)","lowercase":"у"}},{"word":"ун","pos":"article","definitions":["Cyrillic spelling of un."],"forms":{"romanization":"un"}},{"word":"уней","pos":"article","definitions":["Cyrillic spelling of unei."],"forms":{"romanization":"unei"}},{"word":"Униуня Еуропянэ","pos":"name","definitions":["Post-1930s Cyrillic spelling of Uniunea Europeană."],"gender":"f","forms":{"canonical-feminine":"Униуния Еуропянэ","romanization":"Uniunia Europiană"}},{"word":"Униуня Совиетикэ","pos":"name","definitions":["Post-1930s Cyrillic spelling of Uniunea Sovietică."],"gender":"f","forms":{"romanization":"Uniunea Sovietică"}},{"word":"унор","pos":"article","definitions":["Cyrillic spelling of unor."],"forms":{"romanization":"unor"}},{"word":"унуй","pos":"article","definitions":["Cyrillic spelling of unui."],"forms":{"romanization":"unui"}},{"word":"УРСС","pos":"name","definitions":["Post-1930s Cyrillic spelling of URSS.: (historical) USSR (a former transcontinental country in Europe and Asia (1922–1991), now split into Russia and 14 other countries; the Soviet Union; in full, Union of Soviet Socialist Republics)"],"pronunciation":"/u.ɛr.ɛs.ˈɛs/","forms":{"romanization":"URSS"}},{"word":"ф","pos":"character","definitions":["The twenty-second letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"uppercase":"Ф"}},{"word":"Ф","pos":"character","definitions":["The twenty-second letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"F","lowercase":"ф"}},{"word":"федерация","pos":"noun","definitions":["definite nominative/accusative singular of федерацие (federație) Cyrillic spelling of federația."],"gender":"f","forms":{"romanization":"federația"}},{"word":"фи","pos":"verb","definitions":["Post-1930s Cyrillic spelling of fi."],"forms":{"canonical":"а фи [conj]","romanization":"a fi","present-singular-third-person":"есте","participle-past":"фост","subjunctive-third-person":"фие","table-tags":"no-table-tags","inflection-template":"l","infinitive-present":"а фи","infinitive-past":"а фи фост","gerund":"фиинд","first-person-present-singular":"сынт","present-second-person-singular":"ешть","error-unrecognized-form-present-singular":"есте","error-unrecognized-form-plural-present":"сынтем","first-person-perfect-singular":"фусей","perfect-second-person-singular":"фусешь","error-unrecognized-form-perfect-singular":"фусе","error-unrecognized-form-perfect-plural":"фусерэм","first-person-imperfect-singular":"ерам","imperfect-second-person-singular":"ерай","error-unrecognized-form-imperfect-singular":"ера","error-unrecognized-form-imperfect-plural":"ерам","first-person-pluperfect-singular":"фусесем","pluperfect-second-person-singular":"фусесешь","error-unrecognized-form-pluperfect-singular":"фусесе","error-unrecognized-form-pluperfect-plural":"фусесерэм","first-person-present-singular-subjunctive":"сэ фиу","present-second-person-singular-subjunctive":"сэ фий","error-unrecognized-form-present-singular-subjunctive":"сэ фие","error-unrecognized-form-plural-present-subjunctive":"сэ фим","first-person-past-singular-subjunctive":"сэ фи фост","past-second-person-singular-subjunctive":"сэ фи фост","error-unrecognized-form-past-singular-subjunctive":"сэ фи фост","error-unrecognized-form-past-plural-subjunctive":"сэ фи фост","first-person-imperative-present-singular":"-","imperative-present-second-person-singular":"фий","error-unrecognized-form-imperative-present-singular":"-","error-unrecognized-form-imperative-plural-present":"-"}},{"word":"фонолог","pos":"noun","definitions":["Cyrillic spelling of fonolog."],"gender":"m","forms":{"romanization":"fonolog","plural":"фонолоӂь","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун фонолог","accusative-definite-nominative-singular":"фонологул","accusative-indefinite-nominative-plural":"ниште фонолоӂь","accusative-definite-nominative-plural":"фонолоӂий","dative-genitive-indefinite-singular":"унуй фонолог","dative-definite-genitive-singular":"фонологулуй","dative-genitive-indefinite-plural":"унор фонолоӂь","dative-definite-genitive-plural":"фонолоӂилор"}},{"word":"фотография","pos":"noun","definitions":["definite nominative/accusative singular of фотографие (fotografie) Cyrillic spelling of fotografia."],"gender":"f","forms":{"romanization":"fotografia"}},{"word":"фу","pos":"verb","definitions":["Cyrillic spelling of fu."],"pronunciation":"[fu]","forms":{"romanization":"fu"}},{"word":"х","pos":"character","definitions":["The twenty-third letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"h","uppercase":"Х"}},{"word":"Х","pos":"character","definitions":["The twenty-third letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"H","lowercase":"х"}},{"word":"хомосексуалитате","pos":"noun","definitions":["Post-1930s Cyrillic spelling of homosexualitate."],"forms":{"romanization":"homosexualitate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-Cyrl","accusative-indefinite-nominative":"хомосексуалитате","accusative-definite-nominative":"хомосексуалитатя","dative-genitive-indefinite":"хомосексуалитэци","dative-definite-genitive":"хомосексуалитэций","vocative":"-"}},{"word":"хухура","pos":"verb","definitions":["Post-1930s Cyrillic spelling of huhura."],"forms":{"canonical":"а хухура 1st conjugation","romanization":"a huhura","present-singular-third-person":"хухурэ","participle-past":"хухурат","table-tags":"no-table-tags","inflection-template":"l","infinitive":"а хухура","gerund":"хухурынд","first-person-indicative-present-singular":"хухур","indicative-present-second-person-singular":"хухурь","indicative-present-singular-third-person":"хухурэ","error-unrecognized-form-indicative-plural-present":"хухурэм","first-person-imperfect-indicative-singular":"хухурам","imperfect-indicative-second-person-singular":"хухурай","imperfect-indicative-singular-third-person":"хухура","error-unrecognized-form-imperfect-indicative-plural":"хухурам","first-person-indicative-perfect-singular":"хухурай","indicative-perfect-second-person-singular":"хухурашь","indicative-perfect-singular-third-person":"хухурэ","error-unrecognized-form-indicative-perfect-plural":"хухурэм","first-person-indicative-pluperfect-singular":"хухурасем","indicative-pluperfect-second-person-singular":"хухурасешь","indicative-pluperfect-singular-third-person":"хухурасе","error-unrecognized-form-indicative-pluperfect-plural":"хухурасерэм","first-person-present-singular-subjunctive":"сэ хухур","present-second-person-singular-subjunctive":"сэ хухурь","present-singular-subjunctive-third-person":"сэ хухуре","error-unrecognized-form-plural-present-subjunctive":"сэ хухурэм","first-person-imperative-singular":"-","second-person-singular-subjunctive-third-person":"-","error-unrecognized-form-second-person-singular":"-","error-unrecognized-form-plural":"-","imperative-second-person-singular":"хухурэ","error-unrecognized-form-imperative-plural":"хухураць","imperative-negative-second-person-singular":"ну хухура","error-unrecognized-form-imperative-negative-plural":"ну хухураць"}},{"word":"ц","pos":"character","definitions":["The twenty-fourth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"ț","uppercase":"Ц"}},{"word":"Ц","pos":"character","definitions":["The twenty-fourth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"Ț","lowercase":"ц"}},{"word":"ч","pos":"character","definitions":["The twenty-fifth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"ci","uppercase":"Ч"}},{"word":"Ч","pos":"character","definitions":["The twenty-fifth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"Ci","lowercase":"ч"}},{"word":"чивилизация","pos":"noun","definitions":["definite nominative/accusative singular of чивилизацие (civilizație) Cyrillic spelling of civilizația."],"gender":"f","forms":{"romanization":"civilizația"}},{"word":"ш","pos":"character","definitions":["The twenty-sixth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"ș","uppercase":"Ш"}},{"word":"Ш","pos":"character","definitions":["The twenty-sixth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"Ș","lowercase":"ш"}},{"word":"ши","pos":"conj","definitions":["Post-1930s Cyrillic spelling of și."],"forms":{"romanization":"și","alternative":"шѝ"}},{"word":"шѝ","pos":"conj","definitions":["Pre-1860s Cyrillic spelling of și."],"forms":{"romanization":"sì","alternative":"ши"}},{"word":"ы","pos":"character","definitions":["The twenty-seventh letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"î","uppercase":"Ы"}},{"word":"Ы","pos":"character","definitions":["The twenty-seventh letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"Î","lowercase":"ы"}},{"word":"ынвэцэмынт","pos":"noun","definitions":["Post-1930s Cyrillic spelling of învățământ."],"forms":{"romanization":"învățămînt","plural":"ынвэцэминте"}},{"word":"ь","pos":"character","definitions":["The twenty-eighth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"i","uppercase":"Ь"}},{"word":"Ь","pos":"character","definitions":["The twenty-eighth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"I","lowercase":"ь"}},{"word":"э","pos":"character","definitions":["The twenty-ninth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"ă","uppercase":"Э"}},{"word":"Э","pos":"character","definitions":["The twenty-ninth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"Ă","lowercase":"э"}},{"word":"ю","pos":"character","definitions":["The thirtieth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"iu","uppercase":"Ю"}},{"word":"Ю","pos":"character","definitions":["The thirtieth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"Iu","lowercase":"ю"}},{"word":"юби","pos":"verb","definitions":["Post-1930s Cyrillic spelling of iubi."],"forms":{"canonical":"а юби 4th conjugation","romanization":"a iubi","present-singular-third-person":"юбеште","participle-past":"юбит","subjunctive-third-person":"юбяскэ","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc-Cyrl","infinitive":"а юби","gerund":"юбинд","first-person-indicative-present-singular":"юбеск","indicative-present-second-person-singular":"юбешть","error-unrecognized-form-indicative-present-singular":"юбеште","error-unrecognized-form-indicative-plural-present":"юбим","first-person-imperfect-indicative-singular":"юбям","imperfect-indicative-second-person-singular":"юбяи","error-unrecognized-form-imperfect-indicative-singular":"юбя","error-unrecognized-form-imperfect-indicative-plural":"юбям","first-person-indicative-perfect-singular":"юбий","indicative-perfect-second-person-singular":"юбишь","error-unrecognized-form-indicative-perfect-singular":"юби","error-unrecognized-form-indicative-perfect-plural":"юбирэм","first-person-indicative-pluperfect-singular":"юбисем","indicative-pluperfect-second-person-singular":"юбисешь","error-unrecognized-form-indicative-pluperfect-singular":"юбисе","error-unrecognized-form-indicative-pluperfect-plural":"юбисерэм","first-person-present-singular-subjunctive":"сэ юбеск","present-second-person-singular-subjunctive":"сэ юбешть","error-unrecognized-form-present-singular-subjunctive":"сэ юбяскэ","error-unrecognized-form-plural-present-subjunctive":"сэ юбим","imperative-second-person-singular":"юбеште","error-unrecognized-form-imperative-plural":"юбиць","imperative-negative-second-person-singular":"ну юби","error-unrecognized-form-imperative-negative-plural":"ну юбиць"}},{"word":"я","pos":"character","definitions":["The thirty-first letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"ia","uppercase":"Я"}},{"word":"Я","pos":"character","definitions":["The thirty-first letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"Ia","lowercase":"я"}},{"word":"ꙟ","pos":"character","definitions":["A letter of the Romanian Cyrillic alphabet, representing the prefix în-."],"forms":{"uppercase":"Ꙟ"}},{"word":"Ꙟ","pos":"character","definitions":["A letter of the Romanian Cyrillic alphabet, representing the prefix în-."],"forms":{"lowercase":"ꙟ"}}];
+export default [{"word":"-a","pos":"suffix","definitions":["the (feminine singular, nominative and accusative)"],"pronunciation":"/a/","gender":"f","forms":{"alternative":"-ua"}},{"word":"-a","pos":"suffix","definitions":["A suffix forming infinitives of first conjugation verbs."],"pronunciation":"/a/","forms":{"table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a -a","gerund":"-ând","participle-past":"-at","error-unrecognized-form-indicative-present-singular":"-","indicative-present-second-person-singular":"-i","first-person-indicative-plural-present":"-ăm","indicative-plural-present-second-person":"-ați","error-unrecognized-form-indicative-plural-present":"-ă","error-unrecognized-form-imperfect-indicative-singular":"-am","imperfect-indicative-second-person-singular":"-ai","first-person-imperfect-indicative-plural":"-am","imperfect-indicative-plural-second-person":"-ați","error-unrecognized-form-imperfect-indicative-plural":"-au","error-unrecognized-form-indicative-perfect-singular":"-ai","indicative-perfect-second-person-singular":"-ași","first-person-indicative-perfect-plural":"-arăm","indicative-perfect-plural-second-person":"-arăți","error-unrecognized-form-indicative-perfect-plural":"-ară","error-unrecognized-form-indicative-pluperfect-singular":"-asem","indicative-pluperfect-second-person-singular":"-aseși","first-person-indicative-pluperfect-plural":"-aserăm","indicative-pluperfect-plural-second-person":"-aserăți","error-unrecognized-form-indicative-pluperfect-plural":"-aseră","error-unrecognized-form-present-singular-subjunctive":"să -","present-second-person-singular-subjunctive":"să -i","first-person-plural-present-subjunctive":"să -ăm","plural-present-second-person-subjunctive":"să -ați","error-unrecognized-form-plural-present-subjunctive":"să -e","imperative-positive-second-person-singular":"-ă","imperative-plural-positive-second-person":"-ați","imperative-negative-second-person-singular":"nu -a","imperative-negative-plural-second-person":"nu -ați"}},{"word":"-ă","pos":"suffix","definitions":["Forms certain female equivalent nouns."],"gender":"f","examples":[{"ro":"student + -ă → studentă","en":null}],"forms":{"plural":"-e","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-ă","accusative-definite-nominative-singular":"-a","accusative-indefinite-nominative-plural":"-e","accusative-definite-nominative-plural":"-ele","dative-genitive-indefinite-singular":"-e","dative-definite-genitive-singular":"-ei","dative-genitive-indefinite-plural":"-e","dative-definite-genitive-plural":"-elor","singular-vocative":"-ă","plural-vocative":"-elor"}},{"word":"-abilitate","pos":"suffix","definitions":["-ability"],"pronunciation":"/abiliˈtate/","forms":{"plural":"-abilități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-abilitate","accusative-definite-nominative-singular":"-abilitatea","accusative-indefinite-nominative-plural":"-abilități","accusative-definite-nominative-plural":"-abilitățile","dative-genitive-indefinite-singular":"-abilități","dative-definite-genitive-singular":"-abilității","dative-genitive-indefinite-plural":"-abilități","dative-definite-genitive-plural":"-abilităților","singular-vocative":"-abilitate","plural-vocative":"-abilităților","alternative":"-ibilitate"}},{"word":"-abilitatea","pos":"suffix","definitions":["definite nominative/accusative singular of -abilitate"],"pronunciation":"/abiliˈtate̯a/"},{"word":"-abilitateo","pos":"suffix","definitions":["vocative singular of -abilitate"],"pronunciation":"/abiliˈtate̯o/"},{"word":"-abilități","pos":"suffix","definitions":["inflection of -abilitate:","indefinite nominative/accusative/genitive/dative plural","indefinite genitive/dative singular"],"pronunciation":"/abiliˈtət͡sʲ/"},{"word":"-abilității","pos":"suffix","definitions":["definite genitive/dative singular of -abilitate"],"pronunciation":"/abiliˈtət͡sij/"},{"word":"-abilitățile","pos":"suffix","definitions":["definite nominative/accusative plural of -abilitate"],"pronunciation":"/abiliˈtət͡sile/"},{"word":"-abilităților","pos":"suffix","definitions":["inflection of -abilitate:","definite genitive/dative plural","vocative plural"],"pronunciation":"/abiliˈtət͡silor/"},{"word":"-ăciune","pos":"suffix","definitions":["alternative form of -ciune"],"pronunciation":"/əˈt͡ʃʲune/","forms":{"plural":"-ăciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-ăciune","accusative-definite-nominative-singular":"-ăciunea","accusative-indefinite-nominative-plural":"ăciuni","accusative-definite-nominative-plural":"ăciunile","dative-genitive-indefinite-singular":"ăciuni","dative-definite-genitive-singular":"ăciunii","dative-genitive-indefinite-plural":"ăciuni","dative-definite-genitive-plural":"ăciunilor","singular-vocative":"-ăciune","plural-vocative":"ăciunilor"}},{"word":"-aie","pos":"suffix","definitions":["used to form collective nouns with some words"],"pronunciation":"/ˈa.je/","forms":{"plural":"-ăi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"-aie","accusative-definite-nominative-singular":"-aia","accusative-indefinite-nominative-plural":"-ăi","accusative-definite-nominative-plural":"-ăile","dative-genitive-indefinite-singular":"-ăi","dative-definite-genitive-singular":"-ăii","dative-genitive-indefinite-plural":"-ăi","dative-definite-genitive-plural":"-ăilor","singular-vocative":"-aie","plural-vocative":"-ăilor"}},{"word":"-aj","pos":"suffix","definitions":["-age"],"pronunciation":"/aʒ/","forms":{"plural":"-aje"}},{"word":"-al","pos":"suffix","definitions":["-al; of or pertaining to, forms adjectives from nouns."],"pronunciation":"/al/","examples":[{"ro":"săptămână (“week”) + -al → săptămânal (“weekly”)","en":null}],"forms":{"feminine-singular":"-ală","masculine-plural":"-ali","feminine-neuter-plural":"-ale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-al","error-unrecognized-form-feminine-indefinite-singular":"-ală","error-unrecognized-form-indefinite-masculine-plural":"-ali","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ale","definite-error-unrecognized-form-masculine-neuter-singular":"-alul","definite-error-unrecognized-form-feminine-singular":"-ala","definite-error-unrecognized-form-masculine-plural":"-alii","definite-error-unrecognized-form-feminine-neuter-plural":"-alele"}},{"word":"-ală","pos":"suffix","definitions":["indefinite feminine nominative/accusative singular of -al"]},{"word":"-ame","pos":"suffix","definitions":["used to form collective nouns with some words"],"examples":[{"ro":"haiduc (“outlaw”) + -ame → haiducame (“band of outlaws”)","en":null},{"ro":"voinic (“soldier”) + -ame → voinicame (“army”)","en":null},{"ro":"copil (“child”) + -ame → copilame (“group of children”)","en":null}]},{"word":"-an","pos":"suffix","definitions":["Forms adjectives and nouns describing things and characteristics of a city, region, or country; -an"],"pronunciation":"/an/","examples":[{"ro":"Australia (“Australia”) + -an → australian (“Australian”)","en":null},{"ro":"America (“America”) + -an → american (“American”)","en":null}],"forms":{"feminine-singular":"-ană","masculine-plural":"-ani","feminine-neuter-plural":"-ane"}},{"word":"-an","pos":"suffix","definitions":["Added to nouns and adjectives as an augmentative suffix.","Forms names of male animals."],"pronunciation":"/an/","examples":[{"ro":"gras (“fat”) + -an → grăsan (“fatso”)","en":null},{"ro":"gâscă (“goose”) + -an → gâscan (“gander”)","en":null}],"forms":{"feminine-singular":"-ană","masculine-plural":"-ani","feminine-neuter-plural":"-ane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-an","error-unrecognized-form-feminine-indefinite-singular":"-ană","error-unrecognized-form-indefinite-masculine-plural":"-ani","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ane","definite-error-unrecognized-form-masculine-neuter-singular":"-anul","definite-error-unrecognized-form-feminine-singular":"-ana","definite-error-unrecognized-form-masculine-plural":"-anii","definite-error-unrecognized-form-feminine-neuter-plural":"-anele"}},{"word":"-ând","pos":"suffix","definitions":["Used with a stem to form the gerund in -a (first conjugation), -ea (second conjugation), and -e (third conjugation) verbs, as well as -î verbs (a minority of fourth conjugation verbs)."],"pronunciation":"/ɨnd/","examples":[{"ro":"cânta + -ând → cântând","en":null},{"ro":"putea + -ând → putând","en":null},{"ro":"face + -ând → făcând","en":null}],"forms":{"alternative":"-înd"}},{"word":"-anță","pos":"suffix","definitions":["-ance"],"pronunciation":"/ˈan.t͡sə/","forms":{"plural":"-anțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-anță","accusative-definite-nominative-singular":"-anța","accusative-indefinite-nominative-plural":"-anțe","accusative-definite-nominative-plural":"-anțele","dative-genitive-indefinite-singular":"-anțe","dative-definite-genitive-singular":"-anței","dative-genitive-indefinite-plural":"-anțe","dative-definite-genitive-plural":"-anțelor","singular-vocative":"-anță","plural-vocative":"-anțelor","alternative":"-ință"}},{"word":"-ar","pos":"suffix","definitions":["Added to a word to denote a profession or craft; -er"],"pronunciation":"/ar/","examples":[{"ro":"roată (“wheel”) + -ar → rotar (“wheeler”)","en":null},{"ro":"oală (“pot”) + -ar → olar (“potter”)","en":null},{"ro":"fier (“iron”) + -ar → fierar (“blacksmith”)","en":null}],"forms":{"plural":"-ari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"-ar","accusative-definite-nominative-singular":"-arul","accusative-indefinite-nominative-plural":"-ari","accusative-definite-nominative-plural":"-arii","dative-genitive-indefinite-singular":"-ar","dative-definite-genitive-singular":"-arului","dative-genitive-indefinite-plural":"-ari","dative-definite-genitive-plural":"-arilor","singular-vocative":"-arule","plural-vocative":"-arilor","alternative":"-ariu"}},{"word":"-ăreață","pos":"suffix","definitions":["feminine counterpart of -ăreț"]},{"word":"-ăreț","pos":"suffix","definitions":["Forms nouns or adjectives indicating propensity or likeness, being inclined toward, or having the quality of; can be roughly comparable to English -y or -ish in some cases; see also -eț, with a similar function"],"pronunciation":"/əˈret͡s/","forms":{"feminine-singular":"-ăreață","masculine-plural":"-ăreți","feminine-neuter-plural":"-ărețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-ăreț","error-unrecognized-form-feminine-indefinite-singular":"-ăreață","error-unrecognized-form-indefinite-masculine-plural":"-ăreți","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ărețe","definite-error-unrecognized-form-masculine-neuter-singular":"-ărețul","definite-error-unrecognized-form-feminine-singular":"-ăreața","definite-error-unrecognized-form-masculine-plural":"-ăreții","definite-error-unrecognized-form-feminine-neuter-plural":"-ărețele"}},{"word":"-ărie","pos":"suffix","definitions":["Added to nouns to form other nouns meaning \"place of\" (an art, craft, or practice).","Added to nouns to form a class, group, or classification of objects"],"gender":"f","examples":[{"ro":"floare (“flower”) + -ărie → florărie (“flower shop”)","en":null},{"ro":"benzină (“gasoline”) + -ărie → benzinărie (“gas station”)","en":null},{"ro":"oțel (“steel”) + -ărie → oțelărie (“steelworks”)","en":null}],"forms":{"alternative":"-erie"}},{"word":"-arilor","pos":"suffix","definitions":["definite genitive/dative plural of -ar"]},{"word":"-arul","pos":"suffix","definitions":["definite nominative/accusative singular of -ar"]},{"word":"-arului","pos":"suffix","definitions":["definite genitive/dative singular of -ar"]},{"word":"-aș","pos":"suffix","definitions":["diminutive suffix (e.g. copil (“child”) + -aș → copilaș (“little child”))","used with a noun to make words related to profession"],"pronunciation":"/aʃ/","examples":[{"ro":"meserie (“handcraft”) + -aș → meseriaș (“handicraftsman”)","en":null},{"ro":"poștă (“mail”) + -aș → poștaș (“postman”)","en":null}],"forms":{"plural":"-ași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"-aș","accusative-definite-nominative-singular":"-așul","accusative-indefinite-nominative-plural":"-ași","accusative-definite-nominative-plural":"-așii","dative-genitive-indefinite-singular":"-aș","dative-definite-genitive-singular":"-așului","dative-genitive-indefinite-plural":"-ași","dative-definite-genitive-plural":"-așilor","singular-vocative":"-așule","plural-vocative":"-așilor"}},{"word":"-at","pos":"suffix","definitions":["Used with a stem to form the masculine singular past participle of regular -a (first conjugation) verbs."],"pronunciation":"/at/","examples":[{"ro":"arunca (“to throw”) + -at → aruncat (“thrown”)","en":null},{"ro":"cânta (“to sing”) + -at → cântat (“sung”)","en":null}],"forms":{"feminine-singular":"-ată","masculine-plural":"-ați","feminine-neuter-plural":"-ate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-at","error-unrecognized-form-feminine-indefinite-singular":"-ată","error-unrecognized-form-indefinite-masculine-plural":"-ați","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ate","definite-error-unrecognized-form-masculine-neuter-singular":"-atul","definite-error-unrecognized-form-feminine-singular":"-ata","definite-error-unrecognized-form-masculine-plural":"-ații","definite-error-unrecognized-form-feminine-neuter-plural":"-atele"}},{"word":"-ăt","pos":"suffix","definitions":["alternative form of -et"],"pronunciation":"/ət/","forms":{"plural":"-ete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"-ăt","accusative-definite-nominative-singular":"-ătul","accusative-indefinite-nominative-plural":"-ete","accusative-definite-nominative-plural":"-etele","dative-genitive-indefinite-singular":"-ăt","dative-definite-genitive-singular":"-ătului","dative-genitive-indefinite-plural":"-ete","dative-definite-genitive-plural":"-etelor","singular-vocative":"-ătule","plural-vocative":"-etelor"}},{"word":"-ată","pos":"suffix","definitions":["used with a stem to form the feminine singular past participle of -a (first conjugation) verbs. (e.g. botezată, înghețată, etc.)"],"pronunciation":"/ˈa.tə/","forms":{"masculine":"-at","masculine-plural":"-ați","feminine-plural":"-ate"}},{"word":"-ătate","pos":"suffix","definitions":["alternative form of -tate (“-ity”)"],"pronunciation":"/əˈta.te/","forms":{"plural":"-ătăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-ătate","accusative-definite-nominative-singular":"-ătatea","accusative-indefinite-nominative-plural":"-ătăți","accusative-definite-nominative-plural":"-ătățile","dative-genitive-indefinite-singular":"-ătăți","dative-definite-genitive-singular":"-ătății","dative-genitive-indefinite-plural":"-ătăți","dative-definite-genitive-plural":"-ătăților","singular-vocative":"-ătate","plural-vocative":"-ătăților","alternative":"-tate"}},{"word":"-ate","pos":"suffix","definitions":["used with a stem to form the feminine plural past participle of regular -a (first conjugation) verbs. (e.g. lăsate, măsurate, etc.)"],"pronunciation":"/ˈa.te/","forms":{"masculine-singular":"-at","feminine-singular":"-ată","masculine-plural":"-ați"}},{"word":"-ați","pos":"suffix","definitions":["used with a stem to form the masculine plural past participle of regular -a (first conjugation) verbs. (e.g. adunați, spurcați, etc.)"],"pronunciation":"/at͡sʲ/","forms":{"masculine-singular":"-at","feminine-singular":"-ată","feminine-plural":"-ate"}},{"word":"-atic","pos":"suffix","definitions":["Used to form some adjectives (and sometimes nouns derived from them) meaning \"of\", \"like\", \"characteristic of\", etc."],"pronunciation":"/ˈa.tik/","examples":[{"ro":"iarnă (“winter”) + -atic → iernatic (“of the winter, hibernal”)","en":null},{"ro":"toamnă (“autumn”) + -atic → tomnatic (“of the autumn, autumnal”)","en":null},{"ro":"zână (“fairy”) + -atic → zănatic (“crazy”)","en":null}],"forms":{"feminine-singular":"-atică","masculine-plural":"-atici","feminine-neuter-plural":"-atice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-atic","error-unrecognized-form-feminine-indefinite-singular":"-atică","error-unrecognized-form-indefinite-masculine-plural":"-atici","error-unrecognized-form-feminine-indefinite-neuter-plural":"-atice","definite-error-unrecognized-form-masculine-neuter-singular":"-aticul","definite-error-unrecognized-form-feminine-singular":"-atica","definite-error-unrecognized-form-masculine-plural":"-aticii","definite-error-unrecognized-form-feminine-neuter-plural":"-aticele","alternative":"-atec"}},{"word":"-ător","pos":"suffix","definitions":["alternative form of -tor"],"forms":{"feminine-singular":"-ătoare","masculine-plural":"-ători","feminine-neuter-plural":"-ătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-ător","error-unrecognized-form-feminine-indefinite-singular":"-ătoare","error-unrecognized-form-indefinite-masculine-plural":"-ători","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ătoare","definite-error-unrecognized-form-masculine-neuter-singular":"-ătorul","definite-error-unrecognized-form-feminine-singular":"-ătoarea","definite-error-unrecognized-form-masculine-plural":"-ătorii","definite-error-unrecognized-form-feminine-neuter-plural":"-ătoarele"}},{"word":"-ătură","pos":"suffix","definitions":["alternative form of -tură"],"forms":{"plural":"-ături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"-ătură","accusative-definite-nominative-singular":"-ătura","accusative-indefinite-nominative-plural":"-ături","accusative-definite-nominative-plural":"-ăturile","dative-genitive-indefinite-singular":"-ături","dative-definite-genitive-singular":"-ăturii","dative-genitive-indefinite-plural":"-ături","dative-definite-genitive-plural":"-ăturilor","singular-vocative":"-ătură","plural-vocative":"-ăturilor"}},{"word":"-bil","pos":"suffix","definitions":["-able, -ible (forms adjectives with the meaning \"able to be\" from verbs)"],"pronunciation":"/bil/","examples":[{"ro":"gonfla + -bil → gonflabil","en":null},{"ro":"substitui + -bil → substituibil","en":null},{"ro":"bea + -bil → băubil","en":null}],"forms":{"feminine-singular":"-bilă","masculine-plural":"-bili","feminine-neuter-plural":"-bile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-bil","error-unrecognized-form-feminine-indefinite-singular":"-bilă","error-unrecognized-form-indefinite-masculine-plural":"-bili","error-unrecognized-form-feminine-indefinite-neuter-plural":"-bile","definite-error-unrecognized-form-masculine-neuter-singular":"-bilul","definite-error-unrecognized-form-feminine-singular":"-bila","definite-error-unrecognized-form-masculine-plural":"-bilii","definite-error-unrecognized-form-feminine-neuter-plural":"-bilele"}},{"word":"-că","pos":"suffix","definitions":["Forms feminine nouns from masculine nouns."],"examples":[{"ro":"român (“Romanian”) + -că → româncă (“Romanian woman”)","en":null},{"ro":"cetățean (“citizen”) + -că → cetățeancă (“female citizen”)","en":null}],"forms":{"plural":"-ce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-că","accusative-definite-nominative-singular":"-ca","accusative-indefinite-nominative-plural":"-ce","accusative-definite-nominative-plural":"-cele","dative-genitive-indefinite-singular":"-ce","dative-definite-genitive-singular":"-cei","dative-genitive-indefinite-plural":"-ce","dative-definite-genitive-plural":"-celor","singular-vocative":"-că","plural-vocative":"-celor"}},{"word":"-ciune","pos":"suffix","definitions":["roughly equivalent to -tion; was used to form a noun when added to a verb root, describing that action or state related to the verb (also used with adjective roots sometimes)"],"pronunciation":"/ˈt͡ʃʲune/","examples":[{"ro":"a înșela (“to deceive”) + -ciune → înșelăciune (“fraud”)","en":null},{"ro":"a ruga (“to ask for; to pray”) + -ciune → rugăciune (“prayer”)","en":null}],"forms":{"plural":"-ciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-ciune","accusative-definite-nominative-singular":"-ciunea","accusative-indefinite-nominative-plural":"-ciuni","accusative-definite-nominative-plural":"-ciunile","dative-genitive-indefinite-singular":"-ciuni","dative-definite-genitive-singular":"-ciunii","dative-genitive-indefinite-plural":"-ciuni","dative-definite-genitive-plural":"-ciunilor","singular-vocative":"-ciune","plural-vocative":"-ciunilor","alternative":"-ăciune"}},{"word":"-ciuni","pos":"suffix","definitions":["plural of -ciune"]},{"word":"-coc","pos":"suffix","definitions":["-coccus"]},{"word":"-crație","pos":"suffix","definitions":["-cracy"],"forms":{"plural":"-crații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"-crație","accusative-definite-nominative-singular":"-crația","accusative-indefinite-nominative-plural":"-crații","accusative-definite-nominative-plural":"-crațiile","dative-genitive-indefinite-singular":"-crații","dative-definite-genitive-singular":"-crației","dative-genitive-indefinite-plural":"-crații","dative-definite-genitive-plural":"-crațiilor","singular-vocative":"-crație","plural-vocative":"-crațiilor","alternative":"-крацие"}},{"word":"-e","pos":"suffix","definitions":["-s (feminine/neuter)"],"pronunciation":"/e/","forms":{"alternative":"-le"}},{"word":"-e","pos":"suffix","definitions":["Vocative singular (masculine/neuter)"],"pronunciation":"/e/","examples":[{"ro":"Oh!","en":null}]},{"word":"-e","pos":"suffix","definitions":["A suffix forming infinitives of many verbs."],"pronunciation":"/e/","forms":{"table-tags":"conjugation-3","inflection-template":"ro-conj-e","infinitive":"a -e","gerund":"-ând","participle-past":"s","error-unrecognized-form-indicative-present-singular":"-","indicative-present-second-person-singular":"-i","first-person-indicative-plural-present":"-em","indicative-plural-present-second-person":"-eți","error-unrecognized-form-indicative-plural-present":"-","error-unrecognized-form-imperfect-indicative-singular":"-eam","imperfect-indicative-second-person-singular":"-eai","first-person-imperfect-indicative-plural":"-eam","imperfect-indicative-plural-second-person":"-eați","error-unrecognized-form-imperfect-indicative-plural":"-eau","error-unrecognized-form-indicative-perfect-singular":"sei","indicative-perfect-second-person-singular":"seși","first-person-indicative-perfect-plural":"serăm","indicative-perfect-plural-second-person":"serăți","error-unrecognized-form-indicative-perfect-plural":"seră","error-unrecognized-form-indicative-pluperfect-singular":"sesem","indicative-pluperfect-second-person-singular":"seseși","first-person-indicative-pluperfect-plural":"seserăm","indicative-pluperfect-plural-second-person":"seserăți","error-unrecognized-form-indicative-pluperfect-plural":"seseră","error-unrecognized-form-present-singular-subjunctive":"să -","present-second-person-singular-subjunctive":"să -i","first-person-plural-present-subjunctive":"să -em","plural-present-second-person-subjunctive":"să -eți","error-unrecognized-form-plural-present-subjunctive":"să -ă","imperative-positive-second-person-singular":"-e","imperative-plural-positive-second-person":"-eți","imperative-negative-second-person-singular":"nu -e","imperative-negative-plural-second-person":"nu -eți"}},{"word":"-ea","pos":"suffix","definitions":["A suffix forming infinitives of many verbs."],"pronunciation":"/e̯a/","forms":{"table-tags":"conjugation-2","inflection-template":"ro-conj-ea","infinitive":"a -ea","gerund":"-ând","participle-past":"-ut","error-unrecognized-form-indicative-present-singular":"-","indicative-present-second-person-singular":"-i","first-person-indicative-plural-present":"-em","indicative-plural-present-second-person":"-eți","error-unrecognized-form-indicative-plural-present":"-","error-unrecognized-form-imperfect-indicative-singular":"-eam","imperfect-indicative-second-person-singular":"-eai","first-person-imperfect-indicative-plural":"-eam","imperfect-indicative-plural-second-person":"-eați","error-unrecognized-form-imperfect-indicative-plural":"-eau","error-unrecognized-form-indicative-perfect-singular":"-ui","indicative-perfect-second-person-singular":"-uși","first-person-indicative-perfect-plural":"-urăm","indicative-perfect-plural-second-person":"-urăți","error-unrecognized-form-indicative-perfect-plural":"-ură","error-unrecognized-form-indicative-pluperfect-singular":"-usem","indicative-pluperfect-second-person-singular":"-useși","first-person-indicative-pluperfect-plural":"-userăm","indicative-pluperfect-plural-second-person":"-userăți","error-unrecognized-form-indicative-pluperfect-plural":"-useră","error-unrecognized-form-present-singular-subjunctive":"să -","present-second-person-singular-subjunctive":"să -i","first-person-plural-present-subjunctive":"să -em","plural-present-second-person-subjunctive":"să -eți","error-unrecognized-form-plural-present-subjunctive":"să -ă","imperative-positive-second-person-singular":"-e","imperative-plural-positive-second-person":"-eți","imperative-negative-second-person-singular":"nu -ea","imperative-negative-plural-second-person":"nu -eți"}},{"word":"-ea","pos":"suffix","definitions":["Used to form the feminine diminutive of a word"],"gender":"f","forms":{"plural":"-ele","masculine":"-el","masculine-plural":"-ei","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"-ea","accusative-definite-nominative-singular":"-eaua","accusative-indefinite-nominative-plural":"-ele","accusative-definite-nominative-plural":"-elele","dative-genitive-indefinite-singular":"-ele","dative-definite-genitive-singular":"-elei","dative-genitive-indefinite-plural":"-ele","dative-definite-genitive-plural":"-elelor","singular-vocative":"-ea","plural-vocative":"-elelor"}},{"word":"-eala","pos":"suffix","definitions":["definite singular nominative/accusative of -eală"]},{"word":"-eală","pos":"suffix","definitions":["Forms nouns that indicate the action or result of a verb"],"examples":[{"ro":"cheltui (“to spend”) + -eală → cheltuială (“expense”)","en":null},{"ro":"greși (“to err”) + -eală → greșeală (“mistake”)","en":null},{"ro":"momi (“to lure”) + -eală → momeală (“bait”)","en":null}],"forms":{"plural":"-eli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"-eală","accusative-definite-nominative-singular":"-eala","accusative-indefinite-nominative-plural":"-eli","accusative-definite-nominative-plural":"-elile","dative-genitive-indefinite-singular":"-eli","dative-definite-genitive-singular":"-elii","dative-genitive-indefinite-plural":"-eli","dative-definite-genitive-plural":"-elilor","singular-vocative":"-eală","plural-vocative":"-elilor"}},{"word":"-ean","pos":"suffix","definitions":["Forms adjectives and nouns indicating origin or place of birth (such as from a certain city or region), or occasionally nationality."],"pronunciation":"/e̯an/","examples":[{"ro":"Ardeal (“Transylvania”) + -ean → ardelean (“Transylvanian”)","en":null},{"ro":"București (“Bucharest”) + -ean → bucureștean (“Bucharestian”)","en":null}],"forms":{"feminine-singular":"-eană","masculine-plural":"-eni","feminine-neuter-plural":"-ene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-ean","error-unrecognized-form-feminine-indefinite-singular":"-eană","error-unrecognized-form-indefinite-masculine-plural":"-eni","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ene","definite-error-unrecognized-form-masculine-neuter-singular":"-eanul","definite-error-unrecognized-form-feminine-singular":"-eana","definite-error-unrecognized-form-masculine-plural":"-enii","definite-error-unrecognized-form-feminine-neuter-plural":"-enele"}},{"word":"-eană","pos":"suffix","definitions":["female equivalent of -ean"],"gender":"f","forms":{"plural":"-ene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-eană","accusative-definite-nominative-singular":"-eana","accusative-indefinite-nominative-plural":"-ene","accusative-definite-nominative-plural":"-enele","dative-genitive-indefinite-singular":"-ene","dative-definite-genitive-singular":"-enei","dative-genitive-indefinite-plural":"-ene","dative-definite-genitive-plural":"-enelor","singular-vocative":"-eană","plural-vocative":"-enelor"}},{"word":"-eancă","pos":"suffix","definitions":["female equivalent of -ean"],"pronunciation":"/ˈe̯aŋ.kə/","gender":"f","forms":{"plural":"-ence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-eancă","accusative-definite-nominative-singular":"-eanca","accusative-indefinite-nominative-plural":"-ence","accusative-definite-nominative-plural":"-encele","dative-genitive-indefinite-singular":"-ence","dative-definite-genitive-singular":"-encei","dative-genitive-indefinite-plural":"-ence","dative-definite-genitive-plural":"-encelor","singular-vocative":"-eancă","plural-vocative":"-encelor"}},{"word":"-eanu","pos":"suffix","definitions":["Forms demonymic surnames."]},{"word":"-easa","pos":"suffix","definitions":["suffix forming placenames and feminine surnames"],"examples":[{"ro":"Voinea + -easa → Voineasa","en":null},{"ro":"Bucur + -easa → Bucureasa","en":null}],"forms":{"plural":"-ese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-easa","accusative-definite-nominative-singular":"-easa","accusative-indefinite-nominative-plural":"-ese","accusative-definite-nominative-plural":"-esele","dative-genitive-indefinite-singular":"-ese","dative-definite-genitive-singular":"-esei","dative-genitive-indefinite-plural":"-ese","dative-definite-genitive-plural":"-eselor","singular-vocative":"-easa","plural-vocative":"-eselor"}},{"word":"-easă","pos":"suffix","definitions":["Used to make feminine forms of some masculine nouns, or to indicate the wife of a man with a certain profession; -ess"],"pronunciation":"/ˈe̯a.sə/","forms":{"plural":"-ese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-easă","accusative-definite-nominative-singular":"-easa","accusative-indefinite-nominative-plural":"-ese","accusative-definite-nominative-plural":"-esele","dative-genitive-indefinite-singular":"-ese","dative-definite-genitive-singular":"-esei","dative-genitive-indefinite-plural":"-ese","dative-definite-genitive-plural":"-eselor","singular-vocative":"-easă","plural-vocative":"-eselor"}},{"word":"-ească","pos":"suffix","definitions":["feminine singular of -esc"],"pronunciation":"/ˈe̯as.kə/","gender":"f"},{"word":"-eață","pos":"suffix","definitions":["-ness, -ity; used to form nouns from adjectives"],"pronunciation":"/ˈe̯a.t͡sə/","forms":{"plural":"-ețe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-eață","accusative-definite-nominative-singular":"-eața","accusative-indefinite-nominative-plural":"-ețe","accusative-definite-nominative-plural":"-ețele","dative-genitive-indefinite-singular":"-ețe","dative-definite-genitive-singular":"-eței","dative-genitive-indefinite-plural":"-ețe","dative-definite-genitive-plural":"-ețelor","singular-vocative":"-eață","plural-vocative":"-ețelor","alternative":"-ețe"}},{"word":"-ează","pos":"suffix","definitions":["used with a stem to form the third-person singular present and third-person plural present indicatives of some -a (first conjugation) verbs. E.g. lucrează from lucra, durează from dura, frânează from frâna, vânează from vâna."],"pronunciation":"/ˈe̯azə/"},{"word":"-ectomie","pos":"suffix","definitions":["-ectomy"]},{"word":"-ei","pos":"suffix","definitions":["the (feminine singular, genitive and dative)"],"pronunciation":"/ej/","gender":"f","forms":{"alternative":"-lei"}},{"word":"-el","pos":"suffix","definitions":["used to form a masculine diminutive of a word (e.g. băiat (“boy”) + -el → băiețel (“little boy”)"],"pronunciation":"/el/","gender":"m","forms":{"plural":"-ei","feminine":"-ea","feminine-plural":"-ele","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"-el","accusative-definite-nominative-singular":"-elul","accusative-indefinite-nominative-plural":"-ei","accusative-definite-nominative-plural":"-eii","dative-genitive-indefinite-singular":"-el","dative-definite-genitive-singular":"-elului","dative-genitive-indefinite-plural":"-ei","dative-definite-genitive-plural":"-eilor","singular-vocative":"-elule","plural-vocative":"-eilor"}},{"word":"-eni","pos":"suffix","definitions":["Used to form a name of an inhabited place, a town or city."],"gender":"m","examples":[{"ro":"Paltinu + -eni → Păltineni","en":null},{"ro":"Gheorghe + -eni → Gheorgheni","en":null},{"ro":"urzică + -eni → Urziceni","en":null}]},{"word":"-ență","pos":"suffix","definitions":["-ence"],"pronunciation":"/ˈen.t͡sə/","forms":{"plural":"-ențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-ență","accusative-definite-nominative-singular":"-ența","accusative-indefinite-nominative-plural":"-ențe","accusative-definite-nominative-plural":"-ențele","dative-genitive-indefinite-singular":"-ențe","dative-definite-genitive-singular":"-enței","dative-genitive-indefinite-plural":"-ențe","dative-definite-genitive-plural":"-ențelor","singular-vocative":"-ență","plural-vocative":"-ențelor","alternative":"-ință"}},{"word":"-erie","pos":"suffix","definitions":["alternative form of -ărie"],"gender":"f"},{"word":"-esc","pos":"suffix","definitions":["-esque, -ish (used with a root to form adjectives)"],"pronunciation":"/-esk/","gender":"m","forms":{"feminine-singular":"-ească","plural":"-ești","adverbial":"-ește","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-esc","error-unrecognized-form-feminine-indefinite-singular":"-ească","error-unrecognized-form-indefinite-masculine-plural":"-ești","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ești","definite-error-unrecognized-form-masculine-neuter-singular":"-escul","definite-error-unrecognized-form-feminine-singular":"-easca","definite-error-unrecognized-form-masculine-plural":"-eștii","definite-error-unrecognized-form-feminine-neuter-plural":"-eștile"}},{"word":"-esc","pos":"suffix","definitions":["Used with a stem to form the first-person singular and third-person plural present of most regular -i (fourth conjugation) verbs. E.g. unesc, tușesc, feresc, pățesc, urăsc."],"pronunciation":"/-esk/","forms":{"alternative":"-ăsc"}},{"word":"-escu","pos":"suffix","definitions":["suffix forming many Romanian surnames, e.g. Ionescu, Petrescu, Popescu, Georgescu, Marinescu, Niculescu, Constantinescu, Văcărescu, Lucescu, Lupescu, Albulescu, Ceaușescu, etc."],"pronunciation":"/ˈes.ku/"},{"word":"-ește","pos":"suffix","definitions":["adverbial form of -esc"],"pronunciation":"/ˈeʃ.te/"},{"word":"-ește","pos":"suffix","definitions":["Used with a stem to form the third-person singular present of most regular -i (fourth conjugation) verbs. E.g. unește, tușește, ferește, pățește, urăște."],"pronunciation":"/ˈeʃ.te/","forms":{"alternative":"-ăște"}},{"word":"-ești","pos":"suffix","definitions":["plural of -esc."],"pronunciation":"/eʃtʲ/"},{"word":"-ești","pos":"suffix","definitions":["Used with a stem to form the second-person singular present of most regular -i (fourth conjugation) verbs. E.g. unești, tușești, ferești, pățești, urăști."],"pronunciation":"/eʃtʲ/","forms":{"alternative":"-ăști"}},{"word":"-et","pos":"suffix","definitions":["Used with plant or tree names to form names of orchards, woods, forests, or groves."],"pronunciation":"/ˈet/","examples":[{"ro":"brad (“fir tree”) → brădet (“fir-tree forest”)","en":null},{"ro":"ulm (“elm”) → ulmet (“elm forest”)","en":null},{"ro":"fag (“beech”) → făget (“beech forest”)","en":null}],"forms":{"plural":"-eturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"-et","accusative-definite-nominative-singular":"-etul","accusative-indefinite-nominative-plural":"-eturi","accusative-definite-nominative-plural":"-eturile","dative-genitive-indefinite-singular":"-et","dative-definite-genitive-singular":"-etului","dative-genitive-indefinite-plural":"-eturi","dative-definite-genitive-plural":"-eturilor","singular-vocative":"-etule","plural-vocative":"-eturilor"}},{"word":"-et","pos":"suffix","definitions":["Used to form nouns derived from the action of some verbs."],"pronunciation":"/et/","examples":[{"ro":"zâmbi (“to smile”) → zâmbet (“a smile”)","en":null},{"ro":"zbiera (“to scream”) → zbieret (“a scream”)","en":null}],"forms":{"plural":"-ete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"-et","accusative-definite-nominative-singular":"-etul","accusative-indefinite-nominative-plural":"-ete","accusative-definite-nominative-plural":"-etele","dative-genitive-indefinite-singular":"-et","dative-definite-genitive-singular":"-etului","dative-genitive-indefinite-plural":"-ete","dative-definite-genitive-plural":"-etelor","singular-vocative":"-etule","plural-vocative":"-etelor","alternative":"-ăt"}},{"word":"-eț","pos":"suffix","definitions":["used to form adjectives from nouns or verbs denoting propensity or likeness, being inclined toward, or having the quality of (e.g. orb > orbeț, pădure (“woods, forest”) > pădureț (“wild”), îndrăzni (“to dare, venture”) > îndrăzneț (“bold, daring, courageous”), lume (“world, people”) > lumeț (“social; liking people; cheerful, chirpy”)); may be roughly compared to -y or -ish in some cases; see also -ăreț, with a similar function","used to form nouns relating to another noun or action (e.g. drum (“road”) > drumeț (“voyager, traveler, hiker”))","used to form diminutives of some nouns (e.g. pod (“bridge”) > podeț (“footbridge”))"],"pronunciation":"/et͡s/","forms":{"feminine-singular":"-eață","masculine-plural":"-eți","feminine-neuter-plural":"-ețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-eț","error-unrecognized-form-feminine-indefinite-singular":"-eață","error-unrecognized-form-indefinite-masculine-plural":"-eți","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ețe","definite-error-unrecognized-form-masculine-neuter-singular":"-ețul","definite-error-unrecognized-form-feminine-singular":"-eața","definite-error-unrecognized-form-masculine-plural":"-eții","definite-error-unrecognized-form-feminine-neuter-plural":"-ețele"}},{"word":"-ete","pos":"suffix","definitions":["plural of -et"]},{"word":"-ețe","pos":"suffix","definitions":["alternative form of -eață"],"pronunciation":"/ˈe.t͡se/","forms":{"plural":"-ețe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"-ețe","accusative-definite-nominative-singular":"-ețea","accusative-indefinite-nominative-plural":"-ețe","accusative-definite-nominative-plural":"-ețele","dative-genitive-indefinite-singular":"-ețe","dative-definite-genitive-singular":"-eței","dative-genitive-indefinite-plural":"-ețe","dative-definite-genitive-plural":"-ețelor","singular-vocative":"-ețe","plural-vocative":"-ețelor"}},{"word":"-eți","pos":"suffix","definitions":["inflection of -eață:","indefinite nominative/accusative/genitive/dative plural","indefinite genitive/dative singular"]},{"word":"-eturi","pos":"suffix","definitions":["plural of -et"]},{"word":"-ez","pos":"suffix","definitions":["Forms nouns and adjectives of nationality","Examples"],"pronunciation":"/ez/","examples":[{"ro":"-ish, -an","en":null},{"ro":"englez, olandez, francez, etc.","en":null}],"forms":{"feminine-singular":"-eză","masculine-plural":"-ezi","feminine-neuter-plural":"-eze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-ez","error-unrecognized-form-feminine-indefinite-singular":"-eză","error-unrecognized-form-indefinite-masculine-plural":"-ezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"-eze","definite-error-unrecognized-form-masculine-neuter-singular":"-ezul","definite-error-unrecognized-form-feminine-singular":"-eza","definite-error-unrecognized-form-masculine-plural":"-ezii","definite-error-unrecognized-form-feminine-neuter-plural":"-ezele"}},{"word":"-ez","pos":"suffix","definitions":["used with a stem to form the first-person singular present of some -a (first conjugation) verbs."],"pronunciation":"/ez/","examples":[{"ro":"lucra → lucrez","en":null},{"ro":"dura → durez","en":null},{"ro":"frâna → frânez","en":null}]},{"word":"-ezi","pos":"suffix","definitions":["used with a stem to form the second-person singular present of some -a (first conjugation) verbs. E.g. lucrezi from lucra, durezi from dura, frânezi from frâna, vânezi from vâna."],"pronunciation":"/ezʲ/"},{"word":"-fag","pos":"suffix","definitions":["-phage."]},{"word":"-filie","pos":"suffix","definitions":["-philia"]},{"word":"-fobie","pos":"suffix","definitions":["-phobia"]},{"word":"-grafie","pos":"suffix","definitions":["-graphy"]},{"word":"-i","pos":"suffix","definitions":["Used to form plurals"],"pronunciation":"/ʲ/"},{"word":"-i","pos":"suffix","definitions":["the (masculine plural, nominative and accusative)"],"pronunciation":"/j/","gender":"m"},{"word":"-i","pos":"suffix","definitions":["A suffix forming infinitives of many verbs."],"pronunciation":"/i/","forms":{"table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a -i","gerund":"-ind","participle-past":"-it","error-unrecognized-form-indicative-present-singular":"-","indicative-present-second-person-singular":"-i","first-person-indicative-plural-present":"-im","indicative-plural-present-second-person":"-iți","error-unrecognized-form-indicative-plural-present":"-","error-unrecognized-form-imperfect-indicative-singular":"-eam","imperfect-indicative-second-person-singular":"-eai","first-person-imperfect-indicative-plural":"-eam","imperfect-indicative-plural-second-person":"-eați","error-unrecognized-form-imperfect-indicative-plural":"-eau","error-unrecognized-form-indicative-perfect-singular":"-ii","indicative-perfect-second-person-singular":"-iși","first-person-indicative-perfect-plural":"-irăm","indicative-perfect-plural-second-person":"-irăți","error-unrecognized-form-indicative-perfect-plural":"-iră","error-unrecognized-form-indicative-pluperfect-singular":"-isem","indicative-pluperfect-second-person-singular":"-iseși","first-person-indicative-pluperfect-plural":"-iserăm","indicative-pluperfect-plural-second-person":"-iserăți","error-unrecognized-form-indicative-pluperfect-plural":"-iseră","error-unrecognized-form-present-singular-subjunctive":"să -","present-second-person-singular-subjunctive":"să -i","first-person-plural-present-subjunctive":"să -im","plural-present-second-person-subjunctive":"să -iți","error-unrecognized-form-plural-present-subjunctive":"să -ă","imperative-positive-second-person-singular":"-e","imperative-plural-positive-second-person":"-iți","imperative-negative-second-person-singular":"nu -i","imperative-negative-plural-second-person":"nu -iți"}},{"word":"-i","pos":"suffix","definitions":["is"]},{"word":"-î","pos":"suffix","definitions":["A suffix forming infinitives of many verbs."],"pronunciation":"/ɨ/","forms":{"table-tags":"conjugation-4","inflection-template":"ro-conj-î","infinitive":"a -î","gerund":"-ând","participle-past":"-ât","error-unrecognized-form-indicative-present-singular":"-","indicative-present-second-person-singular":"-i","first-person-indicative-plural-present":"-âm","indicative-plural-present-second-person":"-âți","error-unrecognized-form-indicative-plural-present":"-ă","error-unrecognized-form-imperfect-indicative-singular":"-am","imperfect-indicative-second-person-singular":"-ai","first-person-imperfect-indicative-plural":"-am","imperfect-indicative-plural-second-person":"-ați","error-unrecognized-form-imperfect-indicative-plural":"-au","error-unrecognized-form-indicative-perfect-singular":"-âi","indicative-perfect-second-person-singular":"-âși","first-person-indicative-perfect-plural":"-ârăm","indicative-perfect-plural-second-person":"-ârăți","error-unrecognized-form-indicative-perfect-plural":"-âră","error-unrecognized-form-indicative-pluperfect-singular":"-âsem","indicative-pluperfect-second-person-singular":"-âseși","first-person-indicative-pluperfect-plural":"-âserăm","indicative-pluperfect-plural-second-person":"-âserăți","error-unrecognized-form-indicative-pluperfect-plural":"-âseră","error-unrecognized-form-present-singular-subjunctive":"să -","present-second-person-singular-subjunctive":"să -i","first-person-plural-present-subjunctive":"să -âm","plural-present-second-person-subjunctive":"să -âți","error-unrecognized-form-plural-present-subjunctive":"să -e","imperative-positive-second-person-singular":"-ă","imperative-plural-positive-second-person":"-âți","imperative-negative-second-person-singular":"nu -î","imperative-negative-plural-second-person":"nu -âți"}},{"word":"-ia","pos":"suffix","definitions":["definite singular of -ie, usually applied to place names."]},{"word":"-ic","pos":"suffix","definitions":["forms adjectives with the meaning \"of or pertaining to\""],"pronunciation":"/ik/","forms":{"feminine-singular":"-ică","masculine-plural":"-ici","feminine-neuter-plural":"-ice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-ic","error-unrecognized-form-feminine-indefinite-singular":"-ică","error-unrecognized-form-indefinite-masculine-plural":"-ici","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ice","definite-error-unrecognized-form-masculine-neuter-singular":"-icul","definite-error-unrecognized-form-feminine-singular":"-ica","definite-error-unrecognized-form-masculine-plural":"-icii","definite-error-unrecognized-form-feminine-neuter-plural":"-icele"}},{"word":"-ică","pos":"suffix","definitions":["forms diminutives","forms female equivalents"],"examples":[{"ro":"frunză (“leaf”) + -ică → frunzică (“small leaf”)","en":null},{"ro":"copil (“boy”) + -ică → copilică (“girl”)","en":null}],"forms":{"plural":"-ici"}},{"word":"-ică","pos":"suffix","definitions":["forms abstact nouns for fields of knowledge. -ics, -istics"],"examples":[{"ro":"dentist (“dentist”) + -ică → dentistică (“dentistry”)","en":null}]},{"word":"-icesc","pos":"suffix","definitions":["used with a root to form adjectives."],"gender":"m","forms":{"feminine-singular":"-icească","plural":"-icești","adverbial":"-icește","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-icesc","error-unrecognized-form-feminine-indefinite-singular":"-icească","error-unrecognized-form-indefinite-masculine-plural":"-icești","error-unrecognized-form-feminine-indefinite-neuter-plural":"-icești","definite-error-unrecognized-form-masculine-neuter-singular":"-icescul","definite-error-unrecognized-form-feminine-singular":"-iceasca","definite-error-unrecognized-form-masculine-plural":"-iceștii","definite-error-unrecognized-form-feminine-neuter-plural":"-iceștile"}},{"word":"-icios","pos":"suffix","definitions":["Adjectival suffix roughly equivalent to -ous or -ish."],"pronunciation":"/iˈt͡ʃʲos/","forms":{"feminine-singular":"-icioasă","masculine-plural":"-icioși","feminine-neuter-plural":"-icioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-icios","error-unrecognized-form-feminine-indefinite-singular":"-icioasă","error-unrecognized-form-indefinite-masculine-plural":"-icioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"-icioase","definite-error-unrecognized-form-masculine-neuter-singular":"-iciosul","definite-error-unrecognized-form-feminine-singular":"-icioasa","definite-error-unrecognized-form-masculine-plural":"-icioșii","definite-error-unrecognized-form-feminine-neuter-plural":"-icioasele","alternative":"-cios"}},{"word":"-ie","pos":"suffix","definitions":["Used with a stem to create a (usually abstract) noun relating to it; can be compared to -ship, -hood, -ness, -ity, etc."],"pronunciation":"/ˈi.e/","forms":{"plural":"-ii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"-ie","accusative-definite-nominative-singular":"-ia","accusative-indefinite-nominative-plural":"-ii","accusative-definite-nominative-plural":"-iile","dative-genitive-indefinite-singular":"-ii","dative-definite-genitive-singular":"-iei","dative-genitive-indefinite-plural":"-ii","dative-definite-genitive-plural":"-iilor","singular-vocative":"-ie","plural-vocative":"-iilor"}},{"word":"-iei","pos":"suffix","definitions":["definite genitive/dative singular of -ie"]},{"word":"-ifica","pos":"suffix","definitions":["-ify"]},{"word":"-ime","pos":"suffix","definitions":["from adjectives forms nouns denoting quality or state of. -ness, -ity, -hood, -ship, -dom","forms collective nouns, often indicating a multitude or totality of. -ry (class or group, collection of)","from numerals forms nouns meaning a part of a fraction. -th"],"pronunciation":"/ˈi.me/","examples":[{"ro":"țăran (“peasant”) + -ime → țărănime (“peasantry”)","en":null},{"ro":"opt (“eight”) + -ime → optime (“eighth”)","en":null}],"forms":{"plural":"-imi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-ime","accusative-definite-nominative-singular":"-imea","accusative-indefinite-nominative-plural":"-imi","accusative-definite-nominative-plural":"-imile","dative-genitive-indefinite-singular":"-imi","dative-definite-genitive-singular":"-imii","dative-genitive-indefinite-plural":"-imi","dative-definite-genitive-plural":"-imilor","singular-vocative":"-ime","plural-vocative":"-imilor"}},{"word":"-ind","pos":"suffix","definitions":["Used with a stem to form the gerund of -i (fourth conjugation) verbs, as well as a minority of -a (first conjugation) and -e (third conjugation) verbs."],"pronunciation":"/ind/","examples":[{"ro":"feri + -ind → ferind","en":null},{"ro":"ieși + -ind → ieșind","en":null},{"ro":"tăia + -ind → tăind","en":null}]},{"word":"-ință","pos":"suffix","definitions":["Having the state or condition of; -ence, -ance."],"pronunciation":"/ˈin.t͡sə/","examples":[{"ro":"a crede → credință","en":"to believe → belief"},{"ro":"a folosi → folosință","en":"to use → use"},{"ro":"a suferi → suferință","en":"to suffer → suffering"}],"forms":{"plural":"-ințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-ință","accusative-definite-nominative-singular":"-ința","accusative-indefinite-nominative-plural":"-ințe","accusative-definite-nominative-plural":"-ințele","dative-genitive-indefinite-singular":"-ințe","dative-definite-genitive-singular":"-inței","dative-genitive-indefinite-plural":"-ințe","dative-definite-genitive-plural":"-ințelor","singular-vocative":"-ință","plural-vocative":"-ințelor","alternative":"-ență"}},{"word":"-ioară","pos":"suffix","definitions":["Forms diminutives of feminine nouns."],"gender":"m","examples":[{"ro":"pălărie (“hat”) + -ioară → pălărioară","en":null},{"ro":"jucărie (“toy”) + -ioară → jucărioară","en":null}],"forms":{"plural":"-ioare","masculine":"-ior","masculine-plural":"-iori"}},{"word":"-ior","pos":"suffix","definitions":["Forms diminutives of nouns."],"gender":"m","examples":[{"ro":"frate (“brother”) + -ior → frățior","en":null},{"ro":"mia (“ewe”) + -ior → mioară","en":null}],"forms":{"plural":"-iori","feminine":"-ioară","feminine-plural":"-ioare"}},{"word":"-ism","pos":"suffix","definitions":["-ism (indicates a belief or principle)"],"pronunciation":"/ism/","examples":[{"ro":"creștin (“Christian”) + -ism → creștinism (“Christianity”)","en":null},{"ro":"anarhie (“anarchy”) + -ism → anarhism (“anarchism”)","en":null}],"forms":{"plural":"-isme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"-ism","accusative-definite-nominative-singular":"-ismul","accusative-indefinite-nominative-plural":"-isme","accusative-definite-nominative-plural":"-ismele","dative-genitive-indefinite-singular":"-ism","dative-definite-genitive-singular":"-ismului","dative-genitive-indefinite-plural":"-isme","dative-definite-genitive-plural":"-ismelor","singular-vocative":"-ismule","plural-vocative":"-ismelor","alternative":"-исм"}},{"word":"-ișoară","pos":"suffix","definitions":["feminine of -ișor"],"gender":"f"},{"word":"-ișor","pos":"suffix","definitions":["Diminutive suffix."],"pronunciation":"/iʃor/","examples":[{"ro":"lapte (“milk”) + -ișor → lăptișor (“bit of milk”)","en":null},{"ro":"somn (“sleep”) + -ișor → somnișor (“nap”)","en":null},{"ro":"poamă (“fruit”) + -ișor → pomișoară (“blueberry”)","en":null}],"forms":{"feminine-singular":"-ișoară","masculine-plural":"-ișori","feminine-neuter-plural":"-ișoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-ișor","error-unrecognized-form-feminine-indefinite-singular":"-ișoară","error-unrecognized-form-indefinite-masculine-plural":"-ișori","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ișoare","definite-error-unrecognized-form-masculine-neuter-singular":"-ișorul","definite-error-unrecognized-form-feminine-singular":"-ișoara","definite-error-unrecognized-form-masculine-plural":"-ișorii","definite-error-unrecognized-form-feminine-neuter-plural":"-ișoarele"}},{"word":"-ist","pos":"suffix","definitions":["-ist"],"pronunciation":"[ist]","examples":[{"ro":"pian + -ist","en":"pianist (pianist)"},{"ro":"anarhie + -ist","en":"anarhist (anarchist)"},{"ro":"rasă + -ist","en":"rasist (racist)"}],"forms":{"feminine-singular":"-istă","masculine-plural":"-iști","feminine-neuter-plural":"-iste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-ist","error-unrecognized-form-feminine-indefinite-singular":"-istă","error-unrecognized-form-indefinite-masculine-plural":"-iști","error-unrecognized-form-feminine-indefinite-neuter-plural":"-iste","definite-error-unrecognized-form-masculine-neuter-singular":"-istul","definite-error-unrecognized-form-feminine-singular":"-ista","definite-error-unrecognized-form-masculine-plural":"-iștii","definite-error-unrecognized-form-feminine-neuter-plural":"-istele"}},{"word":"-iște","pos":"suffix","definitions":["noun suffix used to denote a place"],"pronunciation":"/ˈiʃ.te/","examples":[{"ro":"izbeală (“crash”) + -iște → izbeliște (“desolate, unorderly place”)","en":null}],"forms":{"plural":"-iști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-iște","accusative-definite-nominative-singular":"-iștea","accusative-indefinite-nominative-plural":"-iști","accusative-definite-nominative-plural":"-iștile","dative-genitive-indefinite-singular":"-iști","dative-definite-genitive-singular":"-iștii","dative-genitive-indefinite-plural":"-iști","dative-definite-genitive-plural":"-iștilor","singular-vocative":"-iște","plural-vocative":"-iștilor"}},{"word":"-iță","pos":"suffix","definitions":["Forms diminutives of some feminine nouns"],"pronunciation":"/ˈi.t͡sə/","examples":[{"ro":"fată (“girl”) + -iță → fetiță (“little girl”)","en":null},{"ro":"capră (“goat”) + -iță → căpriță (“little goat”)","en":null}],"forms":{"plural":"-ițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-iță","accusative-definite-nominative-singular":"-ița","accusative-indefinite-nominative-plural":"-ițe","accusative-definite-nominative-plural":"-ițele","dative-genitive-indefinite-singular":"-ițe","dative-definite-genitive-singular":"-iței","dative-genitive-indefinite-plural":"-ițe","dative-definite-genitive-plural":"-ițelor","singular-vocative":"-iță","plural-vocative":"-ițelor"}},{"word":"-iță","pos":"suffix","definitions":["Used to make feminine forms of some masculine nouns, e.g. professions; -ess"],"pronunciation":"/ˈi.t͡sə/","examples":[{"ro":"doctor (“doctor”) + -iță → doctoriță (“female doctor”), actor (“actor”) + -iță → actriță (“actress”)","en":null}],"forms":{"plural":"-ițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-iță","accusative-definite-nominative-singular":"-ița","accusative-indefinite-nominative-plural":"-ițe","accusative-definite-nominative-plural":"-ițele","dative-genitive-indefinite-singular":"-ițe","dative-definite-genitive-singular":"-iței","dative-genitive-indefinite-plural":"-ițe","dative-definite-genitive-plural":"-ițelor","singular-vocative":"-iță","plural-vocative":"-ițelor"}},{"word":"-itate","pos":"suffix","definitions":["-ity"],"pronunciation":"[iˈta.te]","gender":"f","forms":{"plural":"-ități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative-singular":"-itate","accusative-definite-nominative-singular":"-itatea","accusative-indefinite-nominative-plural":"-ități","accusative-definite-nominative-plural":"-itățile","dative-genitive-indefinite-singular":"-ități","dative-definite-genitive-singular":"-ității","dative-genitive-indefinite-plural":"-ități","dative-definite-genitive-plural":"-ităților","singular-vocative":"-itate","plural-vocative":"-ităților","alternative":"-tate"}},{"word":"-itudine","pos":"suffix","definitions":["-itude"]},{"word":"-iu","pos":"suffix","definitions":["Forms adjectives denoting characteristics or qualities, especially relating to color; roughly equivalent to -ive or sometimes -ish."],"pronunciation":"/iw/","forms":{"feminine-singular":"-ie","plural":"-ii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-iu","error-unrecognized-form-feminine-indefinite-singular":"-ie","error-unrecognized-form-indefinite-masculine-plural":"-ii","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ii","definite-error-unrecognized-form-masculine-neuter-singular":"-iul","definite-error-unrecognized-form-feminine-singular":"-ia","definite-error-unrecognized-form-masculine-plural":"-iii","definite-error-unrecognized-form-feminine-neuter-plural":"-iile"}},{"word":"-iune","pos":"suffix","definitions":["-ion"],"forms":{"plural":"-iuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-iune","accusative-definite-nominative-singular":"-iunea","accusative-indefinite-nominative-plural":"-iuni","accusative-definite-nominative-plural":"-iunile","dative-genitive-indefinite-singular":"-iuni","dative-definite-genitive-singular":"-iunii","dative-genitive-indefinite-plural":"-iuni","dative-definite-genitive-plural":"-iunilor","singular-vocative":"-iune","plural-vocative":"-iunilor"}},{"word":"-iv","pos":"suffix","definitions":["-ive"],"pronunciation":"/iv/","forms":{"feminine-singular":"-ivă","masculine-plural":"-ivi","feminine-neuter-plural":"-ive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-iv","error-unrecognized-form-feminine-indefinite-singular":"-ivă","error-unrecognized-form-indefinite-masculine-plural":"-ivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ive","definite-error-unrecognized-form-masculine-neuter-singular":"-ivul","definite-error-unrecognized-form-feminine-singular":"-iva","definite-error-unrecognized-form-masculine-plural":"-ivii","definite-error-unrecognized-form-feminine-neuter-plural":"-ivele"}},{"word":"-iza","pos":"suffix","definitions":["-ise/-ize"],"pronunciation":"/iˈza/"},{"word":"-l","pos":"suffix","definitions":["the (masculine/neuter singular, nominative and accusative)"],"pronunciation":"/l/","gender":"m","forms":{"alternative":"-ul"}},{"word":"-le","pos":"suffix","definitions":["-s (feminine/neuter)"],"pronunciation":"/le/","forms":{"alternative":"-e"}},{"word":"-le","pos":"suffix","definitions":["variant of -l: the (definite article)"],"pronunciation":"/le/"},{"word":"-le","pos":"suffix","definitions":["the (feminine/neuter plural, nominative and accusative)"],"pronunciation":"/le/"},{"word":"-lei","pos":"suffix","definitions":["variant of -a"],"pronunciation":"/lej/","examples":[{"ro":"the (definite article)","en":null}],"forms":{"alternative":"-ei"}},{"word":"-logic","pos":"suffix","definitions":["-logical"],"forms":{"feminine-singular":"-logică","masculine-plural":"-logici","feminine-neuter-plural":"-logice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-logic","error-unrecognized-form-feminine-indefinite-singular":"-logică","error-unrecognized-form-indefinite-masculine-plural":"-logici","error-unrecognized-form-feminine-indefinite-neuter-plural":"-logice","definite-error-unrecognized-form-masculine-neuter-singular":"-logicul","definite-error-unrecognized-form-feminine-singular":"-logica","definite-error-unrecognized-form-masculine-plural":"-logicii","definite-error-unrecognized-form-feminine-neuter-plural":"-logicele"}},{"word":"-logie","pos":"suffix","definitions":["-logy"],"gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"-logie","accusative-definite-nominative":"-logia","dative-genitive-indefinite":"-logii","dative-definite-genitive":"-logiei","vocative":"-logie"}},{"word":"-lor","pos":"suffix","definitions":["the (plural, genitive and dative)"],"pronunciation":"/lor/","gender":"p"},{"word":"-lui","pos":"suffix","definitions":["the (masculine/neuter singular, genitive and dative)"],"pronunciation":"/luj/","gender":"m","forms":{"alternative":"-ului"}},{"word":"-manie","pos":"suffix","definitions":["-mania"]},{"word":"-mânt","pos":"suffix","definitions":["Forms nouns that indicate the action or result of a verb; -ment"],"pronunciation":"/mɨnt/","examples":[{"ro":"jura (“to vow”) + -mânt → jurământ (“vow”)","en":null},{"ro":"lega (“to bind”) + -mânt → legământ (“pledge, promise; vow”)","en":null},{"ro":"crede (“to trust”) + -mânt → crezământ (“trust”)","en":null}],"forms":{"plural":"-minte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"-mânt","accusative-definite-nominative-singular":"-mântul","accusative-indefinite-nominative-plural":"-minte","accusative-definite-nominative-plural":"-mintele","dative-genitive-indefinite-singular":"-mânt","dative-definite-genitive-singular":"-mântului","dative-genitive-indefinite-plural":"-minte","dative-definite-genitive-plural":"-mintelor","singular-vocative":"-mântule","plural-vocative":"-mintelor","alternative":"-ământ","alternative-archaic":"-mînt"}},{"word":"-manție","pos":"suffix","definitions":["-mancy"]},{"word":"-metru","pos":"suffix","definitions":["-meter (used to form a measuring device)"],"gender":"n"},{"word":"-n","pos":"prep","definitions":["Contracted form of în \"in\" used after vowel."]},{"word":"-nomie","pos":"suffix","definitions":["-nomy"]},{"word":"-o","pos":"suffix","definitions":["Vocative singular (feminine)"],"examples":[{"ro":"mamă (“mother”) + -o → mamo","en":null},{"ro":"focă (“seal”) + -o → foco","en":null}]},{"word":"-o-","pos":"interfix","definitions":["-o-"]},{"word":"-oaia","pos":"suffix","definitions":["suffix forming many feminine Romanian surnames"],"examples":[{"ro":"Ioaniță + -oaia → Ioanițoaia","en":null},{"ro":"Gavrilă + -oaia → Gavriloaia","en":null},{"ro":"Călin + -oaia → Călinoaia","en":null}],"forms":{"plural":"-oaie","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-oaia","accusative-definite-nominative-singular":"-oaia","accusative-indefinite-nominative-plural":"-oaie","accusative-definite-nominative-plural":"-oaiele","dative-genitive-indefinite-singular":"-oaie","dative-definite-genitive-singular":"-oaiei","dative-genitive-indefinite-plural":"-oaie","dative-definite-genitive-plural":"-oaielor","singular-vocative":"-oaia","plural-vocative":"-oaielor"}},{"word":"-oaică","pos":"suffix","definitions":["used to form the feminine of a masculine noun indicating nationality or ethnicity","used to form the feminine of some animals"],"pronunciation":"/ˈo̯aj.kə/","examples":[{"ro":"rus (“Russian”) + -oaică → rusoaică (“Russian woman”)","en":null},{"ro":"grec (“Greek”) + -oaică → grecoaică (“Greek woman”)","en":null},{"ro":"lup (“wolf”) + -oaică → lupoaică (“she-wolf”)","en":null}],"forms":{"plural":"-oaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-oaică","accusative-definite-nominative-singular":"-oaica","accusative-indefinite-nominative-plural":"-oaice","accusative-definite-nominative-plural":"-oaicele","dative-genitive-indefinite-singular":"-oaice","dative-definite-genitive-singular":"-oaicei","dative-genitive-indefinite-plural":"-oaice","dative-definite-genitive-plural":"-oaicelor","singular-vocative":"-oaică","plural-vocative":"-oaicelor"}},{"word":"-oaie","pos":"suffix","definitions":["augmentative suffix for some feminine nouns (e.g. casă (“house”) + -oaie → căsoaie (“big house, pantry, larder, lumber room”))"],"pronunciation":"/ˈo̯a.je/","forms":{"plural":"-oaie","masculine":"equivalent -oi","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"-oaie","accusative-definite-nominative-singular":"-oaia","accusative-indefinite-nominative-plural":"-oaie","accusative-definite-nominative-plural":"-oaiele","dative-genitive-indefinite-singular":"-oaie","dative-definite-genitive-singular":"-oaiei","dative-genitive-indefinite-plural":"-oaie","dative-definite-genitive-plural":"-oaielor","singular-vocative":"-oaie","plural-vocative":"-oaielor"}},{"word":"-oaie","pos":"suffix","definitions":["used to form the feminine of certain masculine nouns, especially animals (e.g. lup (“wolf”) + -oaie → lupoaie (“she-wolf”), urs (“bear”) + -oaie → ursoaie (“she-bear”))"],"pronunciation":"/ˈo̯a.je/","forms":{"plural":"-oaie","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"-oaie","accusative-definite-nominative-singular":"-oaia","accusative-indefinite-nominative-plural":"-oaie","accusative-definite-nominative-plural":"-oaiele","dative-genitive-indefinite-singular":"-oaie","dative-definite-genitive-singular":"-oaiei","dative-genitive-indefinite-plural":"-oaie","dative-definite-genitive-plural":"-oaielor","singular-vocative":"-oaie","plural-vocative":"-oaielor"}},{"word":"-oare","pos":"suffix","definitions":["Used to form abstract nouns from adjectives, including past participles; -ness."],"pronunciation":"/ˈo̯a.re/","examples":[{"ro":"alb (“white”) + -oare → alboare (“whiteness”)","en":null},{"ro":"rece (“cold”) + -oare → răcoare (“coolness”)","en":null}],"forms":{"plural":"-ori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-oare","accusative-definite-nominative-singular":"-oarea","accusative-indefinite-nominative-plural":"-ori","accusative-definite-nominative-plural":"-orile","dative-genitive-indefinite-singular":"-ori","dative-definite-genitive-singular":"-orii","dative-genitive-indefinite-plural":"-ori","dative-definite-genitive-plural":"-orilor","singular-vocative":"-oare","plural-vocative":"-orilor"}},{"word":"-oi","pos":"suffix","definitions":["augmentative suffix, used to indicate a larger version of (e.g. piatră (“rock”) + -oi → pietroi (“boulder”), furcă (“pitchfork”) + -oi → furcoi (“big pitchfork”))"],"pronunciation":"/oj/","forms":{"plural":"-oaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"-oi","accusative-definite-nominative-singular":"-oiul","accusative-indefinite-nominative-plural":"-oaie","accusative-definite-nominative-plural":"-oaiele","dative-genitive-indefinite-singular":"-oi","dative-definite-genitive-singular":"-oiului","dative-genitive-indefinite-plural":"-oaie","dative-definite-genitive-plural":"-oaielor","singular-vocative":"-oiule","plural-vocative":"-oaielor"}},{"word":"-oi","pos":"suffix","definitions":["used to make a masculine version of (e.g. pasăre (“bird”) + -oi → păsăroi (“male bird”), vulpe (“fox”) + -oi → vulpoi (“male fox”))","in a few cases, used as a deprecative or slightly derogatory suffix, especially relating to people (e.g. bulgar + -oi → bulgăroi, chinez + -oi → chinezoi)"],"pronunciation":"/oj/","forms":{"plural":"-oi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"-oi","accusative-definite-nominative-singular":"-oiul","accusative-indefinite-nominative-plural":"-oi","accusative-definite-nominative-plural":"-oii","dative-genitive-indefinite-singular":"-oi","dative-definite-genitive-singular":"-oiului","dative-genitive-indefinite-plural":"-oi","dative-definite-genitive-plural":"-oilor","singular-vocative":"-oiule","plural-vocative":"-oilor"}},{"word":"-oiu","pos":"suffix","definitions":["suffix forming many Romanian surnames"],"examples":[{"ro":"Enache + -oiu → Enăchioiu","en":null},{"ro":"Gavrilă + -oiu → Gavriloiu","en":null},{"ro":"Chiriță + -oiu → Chirițoiu","en":null}],"forms":{"plural":"-oi","feminine":"equivalent -oaia","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"-oiu","accusative-definite-nominative":"-oiul","dative-genitive-indefinite":"-oiu","dative-definite-genitive":"-oiului","vocative":"-oiule"}},{"word":"-oman","pos":"suffix","definitions":["Forms derogatory nouns describing people."]},{"word":"-os","pos":"suffix","definitions":["Forms adjectives; -ous"],"pronunciation":"/os/","forms":{"feminine-singular":"-oasă","masculine-plural":"-oși","feminine-neuter-plural":"-oase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-os","error-unrecognized-form-feminine-indefinite-singular":"-oasă","error-unrecognized-form-indefinite-masculine-plural":"-oși","error-unrecognized-form-feminine-indefinite-neuter-plural":"-oase","definite-error-unrecognized-form-masculine-neuter-singular":"-osul","definite-error-unrecognized-form-feminine-singular":"-oasa","definite-error-unrecognized-form-masculine-plural":"-oșii","definite-error-unrecognized-form-feminine-neuter-plural":"-oasele"}},{"word":"-re","pos":"suffix","definitions":["Attached to the ends of verb infinitives to form nouns, meaning \"the action or result of\"; -ing, -ation"],"pronunciation":"/re/","examples":[{"ro":"traduce (“to translate”) + -re → traducere","en":"translating, translation (the action or result of translation)"},{"ro":"conjuga (“to conjugate”) + -re → conjugare","en":"conjugating, conjugation (the action or result of conjugation)"},{"ro":"vorbi (“to speak”) + -re → vorbire","en":"speech, speaking (the action or result of speech)"}],"forms":{"plural":"-ri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-re","accusative-definite-nominative-singular":"-rea","accusative-indefinite-nominative-plural":"-ri","accusative-definite-nominative-plural":"-rile","dative-genitive-indefinite-singular":"-ri","dative-definite-genitive-singular":"-rii","dative-genitive-indefinite-plural":"-ri","dative-definite-genitive-plural":"-rilor","singular-vocative":"-re","plural-vocative":"-rilor"}},{"word":"-ri","pos":"suffix","definitions":["plural of -re"]},{"word":"-scopie","pos":"suffix","definitions":["-scopy (relating to observation)"]},{"word":"-șor","pos":"suffix","definitions":["Diminutive suffix."],"pronunciation":"/ʃor/","examples":[{"ro":"pui (“chick”) + -șor → puișor (“little chick”)","en":null}],"forms":{"feminine-singular":"-șoară","masculine-plural":"-șori","feminine-neuter-plural":"-șoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-șor","error-unrecognized-form-feminine-indefinite-singular":"-șoară","error-unrecognized-form-indefinite-masculine-plural":"-șori","error-unrecognized-form-feminine-indefinite-neuter-plural":"-șoare","definite-error-unrecognized-form-masculine-neuter-singular":"-șorul","definite-error-unrecognized-form-feminine-singular":"-șoara","definite-error-unrecognized-form-masculine-plural":"-șorii","definite-error-unrecognized-form-feminine-neuter-plural":"-șoarele","alternative":"-ișor"}},{"word":"-sprezece","pos":"suffix","definitions":["-teen (+10)"],"examples":[{"ro":"un (“one”) + -sprezece → unsprezece (“eleven”)","en":null},{"ro":"cinci (“five”) + -sprezece → cincisprezece (“fifteen”)","en":null}],"forms":{"alternative-informal":"-sprece"}},{"word":"-tate","pos":"suffix","definitions":["-ty, -ness","greutate","demnitate","vecinătate","ieftinătate"],"pronunciation":"/ˈta.te/","forms":{"plural":"-tăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative-singular":"-tate","accusative-definite-nominative-singular":"-tatea","accusative-indefinite-nominative-plural":"-tăți","accusative-definite-nominative-plural":"-tățile","dative-genitive-indefinite-singular":"-tăți","dative-definite-genitive-singular":"-tății","dative-genitive-indefinite-plural":"-tăți","dative-definite-genitive-plural":"-tăților","singular-vocative":"-tate","plural-vocative":"-tăților","alternative":"-ătate"}},{"word":"-tăți","pos":"suffix","definitions":["genitive/dative indefinite singular of -tate"],"pronunciation":"/tə.t͡si/","gender":"f","examples":[{"ro":"extremitǎţi","en":null}]},{"word":"-tăți","pos":"suffix","definitions":["nominative/accusative indefinite plural of -tate"],"pronunciation":"/tə.t͡si/","gender":"f","examples":[{"ro":"extremitǎţi","en":"extremities"}]},{"word":"-tăți","pos":"suffix","definitions":["genitive/dative indefinite plural of -tate"],"pronunciation":"/tə.t͡si/","gender":"f","examples":[{"ro":"extremitǎţi","en":null}]},{"word":"-tecă","pos":"suffix","definitions":["used for any kind of collection"]},{"word":"-ție","pos":"suffix","definitions":["-tion"],"pronunciation":"/t͡si.e/","forms":{"plural":"-ții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"-ție","accusative-definite-nominative-singular":"-ția","accusative-indefinite-nominative-plural":"-ții","accusative-definite-nominative-plural":"-țiile","dative-genitive-indefinite-singular":"-ții","dative-definite-genitive-singular":"-ției","dative-genitive-indefinite-plural":"-ții","dative-definite-genitive-plural":"-țiilor","singular-vocative":"-ție","plural-vocative":"-țiilor","alternative":"-țiune"}},{"word":"-țiune","pos":"suffix","definitions":["-tion"],"pronunciation":"/t͡siˈune/","forms":{"plural":"-țiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"-țiune","accusative-definite-nominative-singular":"-țiunea","accusative-indefinite-nominative-plural":"-țiuni","accusative-definite-nominative-plural":"-țiunile","dative-genitive-indefinite-singular":"-țiuni","dative-definite-genitive-singular":"-țiunii","dative-genitive-indefinite-plural":"-țiuni","dative-definite-genitive-plural":"-țiunilor","singular-vocative":"-țiune","plural-vocative":"-țiunilor","alternative-common":"-ție","alternative":"-tiune"}},{"word":"-toare","pos":"suffix","definitions":["female equivalent of -tor: -er (suffix used to form nouns from verbs)"],"pronunciation":"/ˈto̯a.re/","forms":{"plural":"-toare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"-toare","accusative-definite-nominative-singular":"-toarea","accusative-indefinite-nominative-plural":"-toare","accusative-definite-nominative-plural":"-toarele","dative-genitive-indefinite-singular":"-toare","dative-definite-genitive-singular":"-toarei","dative-genitive-indefinite-plural":"-toare","dative-definite-genitive-plural":"-toarelor","singular-vocative":"-toare","plural-vocative":"-toarelor"}},{"word":"-toare","pos":"suffix","definitions":["feminine singular of -tor: -ing (suffix used to form adjectives from verbs)"],"pronunciation":"/ˈto̯a.re/"},{"word":"-tor","pos":"suffix","definitions":["-er (used to form nouns from verbs)"],"pronunciation":"/tor/","examples":[{"ro":"băutor","en":"drinker"},{"ro":"călător","en":"traveler"},{"ro":"făcător","en":"maker"}],"forms":{"feminine-singular":"-toare","masculine-plural":"-tori","feminine-neuter-plural":"-toare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-tor","error-unrecognized-form-feminine-indefinite-singular":"-toare","error-unrecognized-form-indefinite-masculine-plural":"-tori","error-unrecognized-form-feminine-indefinite-neuter-plural":"-toare","definite-error-unrecognized-form-masculine-neuter-singular":"-torul","definite-error-unrecognized-form-feminine-singular":"-toarea","definite-error-unrecognized-form-masculine-plural":"-torii","definite-error-unrecognized-form-feminine-neuter-plural":"-toarele","alternative":"-ător"}},{"word":"-tor","pos":"suffix","definitions":["-ing (used to form adjectives from verbs)"],"pronunciation":"/tor/","examples":[{"ro":"uimitor","en":"amazing"},{"ro":"strălucitor","en":"shining"}],"forms":{"feminine-singular":"-toare","masculine-plural":"-tori","feminine-neuter-plural":"-toare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-tor","error-unrecognized-form-feminine-indefinite-singular":"-toare","error-unrecognized-form-indefinite-masculine-plural":"-tori","error-unrecognized-form-feminine-indefinite-neuter-plural":"-toare","definite-error-unrecognized-form-masculine-neuter-singular":"-torul","definite-error-unrecognized-form-feminine-singular":"-toarea","definite-error-unrecognized-form-masculine-plural":"-torii","definite-error-unrecognized-form-feminine-neuter-plural":"-toarele","alternative":"-ător"}},{"word":"-tură","pos":"suffix","definitions":["Used to form nouns relating to some action; -ure, -ing"],"pronunciation":"/ˈtu.rə/","examples":[{"ro":"lega (“to bind”) + -tură → legătură (“connection; bunch”)","en":null},{"ro":"lovi (“to hit”) + -tură → lovitură (“hit”)","en":null},{"ro":"săpa (“to dig”) + -tură → săpătură (“digging”)","en":null}],"forms":{"plural":"-turi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"-tură","accusative-definite-nominative-singular":"-tura","accusative-indefinite-nominative-plural":"-turi","accusative-definite-nominative-plural":"-turile","dative-genitive-indefinite-singular":"-turi","dative-definite-genitive-singular":"-turii","dative-genitive-indefinite-plural":"-turi","dative-definite-genitive-plural":"-turilor","singular-vocative":"-tură","plural-vocative":"-turilor","alternative":"-ură"}},{"word":"-ua","pos":"suffix","definitions":["variant of -a"],"pronunciation":"/wa/","gender":"f","examples":[{"ro":"the (definite article)","en":null}],"forms":{"alternative":"-a"}},{"word":"-ui","pos":"suffix","definitions":["Forms adjectives denoting characteristics or qualities, especially relating to color, and often with the meaning of -ish."],"pronunciation":"/uj/","forms":{"feminine-singular":"-uie","plural":"-ui","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-ui","error-unrecognized-form-feminine-indefinite-singular":"-uie","error-unrecognized-form-indefinite-masculine-plural":"-ui","error-unrecognized-form-feminine-indefinite-neuter-plural":"-ui","definite-error-unrecognized-form-masculine-neuter-singular":"-uiul","definite-error-unrecognized-form-feminine-singular":"-uia","definite-error-unrecognized-form-masculine-plural":"-uii","definite-error-unrecognized-form-feminine-neuter-plural":"-uile"}},{"word":"-ui","pos":"suffix","definitions":["Forms verbs."],"pronunciation":"/uˈi/"},{"word":"-uica","pos":"suffix","definitions":["definite singular nominative/accusative of -uică"]},{"word":"-ul","pos":"suffix","definitions":["variant of -l"],"pronunciation":"/ul/","gender":"m","examples":[{"ro":"the (definite article)","en":null}],"forms":{"alternative":"-l"}},{"word":"-uleț","pos":"suffix","definitions":["Forms masculine diminutives of nouns."],"gender":"m","examples":[{"ro":"urs (“bear”) + -uleț → ursuleț (“little bear”)","en":null},{"ro":"coș (“basket”) + -uleț → coșuleț (“little basket”)","en":null}]},{"word":"-uliță","pos":"suffix","definitions":["Forms diminutives of some feminine nouns"],"examples":[{"ro":"frunză (“leaf”) + -uliță → frunzuliță (“little leaf”)","en":null},{"ro":"gâscă (“goose”) + -uliță → gâsculiță (“little goose”)","en":null}],"forms":{"plural":"-ulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-uliță","accusative-definite-nominative-singular":"-ulița","accusative-indefinite-nominative-plural":"-ulițe","accusative-definite-nominative-plural":"-ulițele","dative-genitive-indefinite-singular":"-ulițe","dative-definite-genitive-singular":"-uliței","dative-genitive-indefinite-plural":"-ulițe","dative-definite-genitive-plural":"-ulițelor","singular-vocative":"-uliță","plural-vocative":"-ulițelor"}},{"word":"-ului","pos":"suffix","definitions":["variant of -lui: the (definite article)"],"pronunciation":"/u.luj/","gender":"m","forms":{"alternative":"-lui"}},{"word":"-ură","pos":"suffix","definitions":["Suffix forming abstract nouns from adjectives."],"examples":[{"ro":"frânt (“broken”) + -ură → frântură (“fragment”)","en":null},{"ro":"ars (“burnt”) + -ură → arsură (“burnt thing”)","en":null},{"ro":"întors (“curved”) + -ură → întorsură (“bend, turn”)","en":null}],"forms":{"plural":"-uri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-ură","accusative-definite-nominative-singular":"-ura","accusative-indefinite-nominative-plural":"-ure","accusative-definite-nominative-plural":"-urele","dative-genitive-indefinite-singular":"-ure","dative-definite-genitive-singular":"-urei","dative-genitive-indefinite-plural":"-ure","dative-definite-genitive-plural":"-urelor","singular-vocative":"-ură","plural-vocative":"-urelor"}},{"word":"-uri","pos":"suffix","definitions":["Marks the plural of certain neuter (and more rarely feminine) nouns."],"pronunciation":"/urʲ/","gender":"n-p","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"-uri","accusative-definite-nominative":"-urile","dative-genitive-indefinite":"-uri","dative-definite-genitive":"-urilor","vocative":"-urilor"}},{"word":"-urie","pos":"suffix","definitions":["-uria"]},{"word":"-uș","pos":"suffix","definitions":["diminutive suffix (e.g. măgar (“donkey”) + -uș → măgăruș (“little donkey”))"],"pronunciation":"/uʃ/","forms":{"plural":"-uși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"-uș","accusative-definite-nominative-singular":"-ușul","accusative-indefinite-nominative-plural":"-uși","accusative-definite-nominative-plural":"-ușii","dative-genitive-indefinite-singular":"-uș","dative-definite-genitive-singular":"-ușului","dative-genitive-indefinite-plural":"-uși","dative-definite-genitive-plural":"-ușilor","singular-vocative":"-ușule","plural-vocative":"-ușilor"}},{"word":"-ușcă","pos":"suffix","definitions":["Forms feminine diminutives of nouns."],"examples":[{"ro":"muiere (“woman”) + -ușcă → muierușcă (“little woman”)","en":null},{"ro":"rață (“duck”) + -ușcă → rățușcă (“ducky”)","en":null},{"ro":"mierlă (“blackbird”) + -ușcă → mierlușcă (“small blackbird”)","en":null}],"forms":{"plural":"-uște"}},{"word":"-ușor","pos":"suffix","definitions":["alternative form of -șor"],"forms":{"plural":"-șori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"-ușor","accusative-definite-nominative-singular":"-ușorul","accusative-indefinite-nominative-plural":"-ușori","accusative-definite-nominative-plural":"-ușorii","dative-genitive-indefinite-singular":"-ușor","dative-definite-genitive-singular":"-ușorului","dative-genitive-indefinite-plural":"-ușori","dative-definite-genitive-plural":"-ușorilor","singular-vocative":"-ușorule","plural-vocative":"-ușorilor"}},{"word":"-ut","pos":"suffix","definitions":["Used with a stem to mark the past participle of second-conjugation verbs and regular third-conjugation verbs."],"examples":[{"ro":"pierde (“lose”) + -ut → pierdut (“lost”)","en":null}]},{"word":"-uț","pos":"suffix","definitions":["Forms masculine diminutives of nouns and adjectives."],"pronunciation":"/ut͡s/","examples":[{"ro":"mic (“small”) + -uț → micuț (“tiny”)","en":null},{"ro":"gras (“fat”) + -uț → grăsuț (“chubby”)","en":null},{"ro":"drag (“dear”) + -uț → drăguț (“cute, pretty, nice”)","en":null}],"forms":{"feminine-singular":"-uță","masculine-plural":"-uți","feminine-neuter-plural":"-uțe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-uț","error-unrecognized-form-feminine-indefinite-singular":"-uță","error-unrecognized-form-indefinite-masculine-plural":"-uți","error-unrecognized-form-feminine-indefinite-neuter-plural":"-uțe","definite-error-unrecognized-form-masculine-neuter-singular":"-uțul","definite-error-unrecognized-form-feminine-singular":"-uța","definite-error-unrecognized-form-masculine-plural":"-uții","definite-error-unrecognized-form-feminine-neuter-plural":"-uțele"}},{"word":"-uța","pos":"suffix","definitions":["Forms diminutives of feminine proper names."],"gender":"f","examples":[{"ro":"Anca + -uța → Ancuța","en":null},{"ro":"Ileana + -uța → Ilenuța","en":null},{"ro":"Maria + -uța → Măriuța","en":null}]},{"word":"-uță","pos":"suffix","definitions":["female equivalent of -uț"],"pronunciation":"/ˈu.t͡sə/","forms":{"plural":"-uțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"-uță","accusative-definite-nominative-singular":"-uța","accusative-indefinite-nominative-plural":"-uțe","accusative-definite-nominative-plural":"-uțele","dative-genitive-indefinite-singular":"-uțe","dative-definite-genitive-singular":"-uței","dative-genitive-indefinite-plural":"-uțe","dative-definite-genitive-plural":"-uțelor","singular-vocative":"-uță","plural-vocative":"-uțelor"}},{"word":"-va","pos":"suffix","definitions":["suffixed to some adverbs and preopositions, meaning \"some\""],"pronunciation":"/va/","examples":[{"ro":"ce (“what”) + -va → ceva (“something”)","en":null},{"ro":"cine (“who”) + -va → cineva (“someone”)","en":null},{"ro":"unde (“where”) + -va → undeva (“somewhere”)","en":null}]},{"word":"1 Decembrie","pos":"name","definitions":["a commune of Ilfov County, Romania","a village in 1 Decembrie, Ilfov County, Romania","a village in Banca, Vaslui County, Romania"],"pronunciation":"/ɨnˈtɨj deˈt͡ʃembrije/","gender":"m"},{"word":"1-a","pos":"adj","definitions":["abbreviation of prima"]},{"word":"1-ul","pos":"adj","definitions":["abbreviation of primul: 1st"]},{"word":"10-a","pos":"adj","definitions":["abbreviation of zecea"]},{"word":"10-lea","pos":"adj","definitions":["abbreviation of zecelea: 10th"],"pronunciation":"/ˈze.t͡ʃe.le̯a/","gender":"m","forms":{"canonical-masculine-neuter":"al 10-lea","feminine":"a 10-a"}},{"word":"100 metri","pos":"noun","definitions":["100 meters"],"pronunciation":"/o ˈsu.tə(de)ˈme.tri/"},{"word":"1000 metri","pos":"noun","definitions":["1000 meters"]},{"word":"10000 metri","pos":"noun","definitions":["10000 meters"]},{"word":"1500 metri","pos":"noun","definitions":["1500 meters"],"pronunciation":"/o ˈmi.e t͡ʃint͡ʃʲ ˈsu.te(de)ˈme.tri/"},{"word":"2 Mai","pos":"name","definitions":["a village in Limanu, Constanța County, Romania"],"pronunciation":"/doj maj/","gender":"m"},{"word":"2-a","pos":"adj","definitions":["abbreviation of doua"]},{"word":"200 metri","pos":"noun","definitions":["200 meters"]},{"word":"23 August","pos":"name","definitions":["a village in Zăvoi, Caraș-Severin County, Romania","a commune of Constanța County, Romania","a village in 23 August, Constanța County, Romania","a village in Malovăț, Mehedinți County, Romania"],"pronunciation":"/ˌdowəˈzet͡ʃʲ ʃi trej ˈawɡust/","gender":"m"},{"word":"3-a","pos":"adj","definitions":["abbreviation of treia"]},{"word":"3-lea","pos":"adj","definitions":["abbreviation of treilea: 3rd"],"gender":"m","forms":{"canonical-masculine-neuter":"al 3-lea","feminine":"a 3-a"}},{"word":"400 metri","pos":"noun","definitions":["400 meters"]},{"word":"5000 metri","pos":"noun","definitions":["5000 meters"]},{"word":"6-lea","pos":"adj","definitions":["abbreviation of șaselea: 6th"],"gender":"m","forms":{"canonical-masculine-neuter":"al 6-lea","feminine":"a 6-a"}},{"word":"7-a","pos":"adj","definitions":["abbreviation of șaptea"]},{"word":"800 metri","pos":"noun","definitions":["800 meters"]},{"word":"А","pos":"character","definitions":["The first letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"canonical":"А (A)","lowercase":"а"}},{"word":"а","pos":"character","definitions":["The first letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"a","uppercase":"А"}},{"word":"Азербайӂан","pos":"name","definitions":["Cyrillic spelling of Azerbaidjan.: Azerbaijan (a country in the South Caucasus in Asia and Europe)"],"gender":"f","forms":{"romanization":"Azerbaidjan","table-tags":"no-table-tags","inflection-template":"l","accusative-definite-nominative":"Азербайӂан","dative-definite-genitive":"Азербайӂан"}},{"word":"алгэ","pos":"noun","definitions":["Post-1930s Cyrillic spelling of algă."],"gender":"f","forms":{"romanization":"algă","plural":"алӂe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-Cyrl","accusative-indefinite-nominative-singular":"алгэ","accusative-definite-nominative-singular":"алга","accusative-indefinite-nominative-plural":"алӂe","accusative-definite-nominative-plural":"алӂeле","dative-genitive-indefinite-singular":"алӂe","dative-definite-genitive-singular":"алӂeй","dative-genitive-indefinite-plural":"алӂe","dative-definite-genitive-plural":"алӂeлор","singular-vocative":"алго","plural-vocative":"алӂeлор"}},{"word":"аменинца","pos":"verb","definitions":["Post-1930s Cyrillic spelling of amenința."],"forms":{"canonical":"а аменинца 1st conjugation","romanization":"a amenința","present-singular-third-person":"аменинцэ","participle-past":"аменинцат","table-tags":"no-table-tags","inflection-template":"l","infinitive":"а аменинца","gerund":"аменинцынд","first-person-indicative-present-singular":"аменинц","indicative-present-second-person-singular":"аменинць","indicative-present-singular-third-person":"аменинцэ","error-unrecognized-form-indicative-plural-present":"аменинцэм","first-person-imperfect-indicative-singular":"аменинцам","imperfect-indicative-second-person-singular":"аменинцай","imperfect-indicative-singular-third-person":"аменинца","error-unrecognized-form-imperfect-indicative-plural":"аменинцам","first-person-indicative-perfect-singular":"аменинцай","indicative-perfect-second-person-singular":"аменинцашь","indicative-perfect-singular-third-person":"аменинцэ","error-unrecognized-form-indicative-perfect-plural":"аменинцарам","first-person-indicative-pluperfect-singular":"аменинцасем","indicative-pluperfect-second-person-singular":"аменинцасешь","indicative-pluperfect-singular-third-person":"аменинцасе","error-unrecognized-form-indicative-pluperfect-plural":"аменинцасерэм","first-person-present-singular-subjunctive":"сэ аменинц","present-second-person-singular-subjunctive":"сэ аменинць","present-singular-subjunctive-third-person":"сэ аменинце","error-unrecognized-form-plural-present-subjunctive":"сэ аменинцэм","first-person-imperative-singular":"-","second-person-singular-subjunctive-third-person":"-","error-unrecognized-form-second-person-singular":"-","error-unrecognized-form-plural":"-","imperative-second-person-singular":"аменинцэ","error-unrecognized-form-imperative-plural":"аменинцаць","imperative-negative-second-person-singular":"ну аменинца","error-unrecognized-form-imperative-negative-plural":"ну аменинцаць"}},{"word":"анархист","pos":"noun","definitions":["Post-1930s Cyrillic spelling of anarhist."],"forms":{"romanization":"anarhist","plural":"анархишть","feminine":"equivalent анархистэ","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун анархист","accusative-definite-nominative-singular":"анархистул","accusative-indefinite-nominative-plural":"ниште анархишть","accusative-definite-nominative-plural":"анархиштий","dative-genitive-indefinite-singular":"унуй анархист","dative-definite-genitive-singular":"анархистулуй","dative-genitive-indefinite-plural":"унор анархишть","dative-definite-genitive-plural":"анархиштилор"}},{"word":"археолог","pos":"noun","definitions":["Cyrillic spelling of arheolog."],"gender":"m","forms":{"romanization":"arheolog","plural":"археолоӂь","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун археолог","accusative-definite-nominative-singular":"археологул","accusative-indefinite-nominative-plural":"ниште археолоӂь","accusative-definite-nominative-plural":"археолоӂий","dative-genitive-indefinite-singular":"унуй археолог","dative-definite-genitive-singular":"археологулуй","dative-genitive-indefinite-plural":"унор археолоӂь","dative-definite-genitive-plural":"археолоӂилор"}},{"word":"Б","pos":"character","definitions":["The second letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"B","lowercase":"б"}},{"word":"б","pos":"character","definitions":["The second letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"b","uppercase":"Б"}},{"word":"букура","pos":"verb","definitions":["Post-1930s Cyrillic spelling of bucura."],"forms":{"canonical":"а букура 1st conjugation","romanization":"a bucura","present-singular-third-person":"букурэ","participle-past":"букурат","table-tags":"no-table-tags","inflection-template":"l","infinitive":"а букура","gerund":"букурынд","first-person-indicative-present-singular":"букур","indicative-present-second-person-singular":"букурь","indicative-present-singular-third-person":"букурэ","error-unrecognized-form-indicative-plural-present":"букурэм","first-person-imperfect-indicative-singular":"букурам","imperfect-indicative-second-person-singular":"букурай","imperfect-indicative-singular-third-person":"букура","error-unrecognized-form-imperfect-indicative-plural":"букурам","first-person-indicative-perfect-singular":"букурай","indicative-perfect-second-person-singular":"букурашь","indicative-perfect-singular-third-person":"букурэ","error-unrecognized-form-indicative-perfect-plural":"букурарам","first-person-indicative-pluperfect-singular":"букурасем","indicative-pluperfect-second-person-singular":"букурасешь","indicative-pluperfect-singular-third-person":"букурасе","error-unrecognized-form-indicative-pluperfect-plural":"букурасерэм","first-person-present-singular-subjunctive":"сэ букур","present-second-person-singular-subjunctive":"сэ букурь","present-singular-subjunctive-third-person":"сэ букуре","error-unrecognized-form-plural-present-subjunctive":"сэ букурэм","first-person-imperative-singular":"-","second-person-singular-subjunctive-third-person":"-","error-unrecognized-form-second-person-singular":"-","error-unrecognized-form-plural":"-","imperative-second-person-singular":"букурэ","error-unrecognized-form-imperative-plural":"букураць","imperative-negative-second-person-singular":"ну букура","error-unrecognized-form-imperative-negative-plural":"ну букураць"}},{"word":"Букурешть","pos":"name","definitions":["Post-1930s Cyrillic spelling of București."],"pronunciation":"/bu.kuˈreʃtʲ/","gender":"m","forms":{"romanization":"București","accusative-definite-nominative":"Букурештюл","dative-definite-genitive":"Букурештюлуй","vocative":"Букурештюле"}},{"word":"Бэлць","pos":"name","definitions":["Post-1930s Cyrillic spelling of Bălți.: Bălți (a city and municipality of Moldova)"],"pronunciation":"/ˈbəltsʲ/","gender":"m","forms":{"romanization":"Bălți","accusative-definite-nominative":"Бэлць"}},{"word":"бэрбат","pos":"noun","definitions":["Post-1930s Cyrillic spelling of bărbat."],"gender":"m","forms":{"romanization":"bărbat","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун бэрбат","accusative-definite-nominative-singular":"бэрбатул","accusative-indefinite-nominative-plural":"ниште бэрбаць","accusative-definite-nominative-plural":"бэрбаций","dative-genitive-indefinite-singular":"унуй бэрбат","dative-definite-genitive-singular":"бэрбатулуй","dative-genitive-indefinite-plural":"унор бэрбаць","dative-definite-genitive-plural":"бэрбацилор"}},{"word":"бэят","pos":"noun","definitions":["Post-1930s Cyrillic spelling of băiat."],"pronunciation":"[bəˈjat]","gender":"m","forms":{"romanization":"băiat","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун бэят","accusative-definite-nominative-singular":"бэятул","accusative-indefinite-nominative-plural":"ниште бэець","accusative-definite-nominative-plural":"бэеций","dative-genitive-indefinite-singular":"унуй бэят","dative-definite-genitive-singular":"бэятулуй","dative-genitive-indefinite-plural":"унор бэець","dative-definite-genitive-plural":"бэецилор"}},{"word":"В","pos":"character","definitions":["The third letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"V","lowercase":"в"}},{"word":"в","pos":"character","definitions":["The third letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"v","uppercase":"В"}},{"word":"вис","pos":"noun","definitions":["Post-1930s Cyrillic spelling of vis."],"pronunciation":"[vis]","gender":"n","forms":{"romanization":"vis","table-tags":"no-table-tags","inflection-template":"ro-noun-n-Cyrl","accusative-indefinite-nominative-singular":"ун вис","accusative-definite-nominative-singular":"висул","accusative-indefinite-nominative-plural":"ниште висе","accusative-definite-nominative-plural":"виселе","dative-genitive-indefinite-singular":"унуи вис","dative-definite-genitive-singular":"висулуй","dative-genitive-indefinite-plural":"унор висе","dative-definite-genitive-plural":"виселор"}},{"word":"Г","pos":"character","definitions":["The fourth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"canonical":"Г (G)","lowercase":"г"}},{"word":"г","pos":"character","definitions":["The fourth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"g","uppercase":"Г"}},{"word":"Д","pos":"character","definitions":["The fifth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"D","lowercase":"д"}},{"word":"д","pos":"character","definitions":["The fifth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"d","uppercase":"Д"}},{"word":"делир","pos":"noun","definitions":["Post-1930s Cyrillic spelling of delir."],"pronunciation":"[deˈlir]","gender":"n","forms":{"romanization":"delir","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri-Cyrl","accusative-indefinite-nominative-singular":"ун делир","accusative-definite-nominative-singular":"делирул","accusative-indefinite-nominative-plural":"ниште делирурь","accusative-definite-nominative-plural":"делируриле","dative-genitive-indefinite-singular":"унуи делир","dative-definite-genitive-singular":"делирулуй","dative-genitive-indefinite-plural":"унор делирурь","dative-definite-genitive-plural":"делирурилор"}},{"word":"демокрация","pos":"noun","definitions":["definite nominative/accusative singular of демокрацие (democrație) Cyrillic spelling of democrația."],"gender":"f","forms":{"romanization":"democrația"}},{"word":"дипломация","pos":"noun","definitions":["definite nominative/accusative singular of дипломацие (diplomație) Cyrillic spelling of diplomația."],"gender":"f","forms":{"romanization":"diplomația"}},{"word":"доктор","pos":"noun","definitions":["Post-1930s Cyrillic spelling of doctor."],"pronunciation":"[ˈdok.tor]","gender":"m","forms":{"romanization":"doctor","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун доктор","accusative-definite-nominative-singular":"докторул","accusative-indefinite-nominative-plural":"ниште докторь","accusative-definite-nominative-plural":"докторий","dative-genitive-indefinite-singular":"унуй доктор","dative-definite-genitive-singular":"докторулуй","dative-genitive-indefinite-plural":"унор докторь","dative-definite-genitive-plural":"докторилор"}},{"word":"Е","pos":"character","definitions":["The sixth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"E","lowercase":"е"}},{"word":"е","pos":"character","definitions":["The sixth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"e","uppercase":"Е"}},{"word":"есте","pos":"verb","definitions":["Post-1930s Cyrillic spelling of este."],"pronunciation":"[ˈjeste]","forms":{"romanization":"este"}},{"word":"Еуропа","pos":"name","definitions":["Cyrillic spelling of Europa.: Europe (a continent located west of Asia and north of Africa)"],"pronunciation":"/e.uˈro.pa/","gender":"f","forms":{"romanization":"Europa"}},{"word":"Ж","pos":"character","definitions":["The seventh letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"J","lowercase":"ж"}},{"word":"ж","pos":"character","definitions":["The seventh letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"j","uppercase":"Ж"}},{"word":"Ӂ","pos":"character","definitions":["The eighth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"Gi","lowercase":"ӂ"}},{"word":"ӂ","pos":"character","definitions":["The eighth letter of the Moldovan alphabet, written in the Cyrillic script."],"pronunciation":"/d͡ʒ/","forms":{"romanization":"gi","uppercase":"Ӂ"}},{"word":"З","pos":"character","definitions":["The ninth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"Z","lowercase":"з"}},{"word":"з","pos":"character","definitions":["The ninth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"z","uppercase":"З"}},{"word":"зи","pos":"noun","definitions":["Post-1930s Cyrillic spelling of zi."],"forms":{"romanization":"zi","plural":"зиле","table-tags":"no-table-tags","inflection-template":"ro-noun-f-Cyrl","accusative-indefinite-nominative-singular":"зи","accusative-definite-nominative-singular":"зиуа","accusative-indefinite-nominative-plural":"зиле","accusative-definite-nominative-plural":"зилеле","dative-genitive-indefinite-singular":"зиле","dative-definite-genitive-singular":"зилей","dative-genitive-indefinite-plural":"зиле","dative-definite-genitive-plural":"зилелор","singular-vocative":"-","plural-vocative":"-"}},{"word":"зиче","pos":"verb","definitions":["Post-1930s Cyrillic spelling of zice."],"forms":{"canonical":"а зиче 3rd conjugation","romanization":"a zice","present-singular-third-person":"зиче","participle-past":"зис","subjunctive-third-person":"зикэ","table-tags":"no-table-tags","inflection-template":"l","infinitive":"а зиче","gerund":"зикынд","first-person-indicative-present-singular":"зик","indicative-present-second-person-singular":"зичь","indicative-present-singular-third-person":"зиче","error-unrecognized-form-indicative-plural-present":"зичем","first-person-imperfect-indicative-singular":"зичам","imperfect-indicative-second-person-singular":"зичай","imperfect-indicative-singular-third-person":"зича","error-unrecognized-form-imperfect-indicative-plural":"зичам","first-person-indicative-perfect-singular":"зисей","indicative-perfect-second-person-singular":"зисешь","indicative-perfect-singular-third-person":"зисе","error-unrecognized-form-indicative-perfect-plural":"зисерэм","first-person-indicative-pluperfect-singular":"зисесем","indicative-pluperfect-second-person-singular":"зисесешь","indicative-pluperfect-singular-third-person":"зисесе","error-unrecognized-form-indicative-pluperfect-plural":"зисесерэм","first-person-present-singular-subjunctive":"сэ зик","present-second-person-singular-subjunctive":"сэ зичь","present-singular-subjunctive-third-person":"сэ зикэ","error-unrecognized-form-plural-present-subjunctive":"сэ зичем","first-person-imperative-singular":"-","second-person-singular-subjunctive-third-person":"-","error-unrecognized-form-second-person-singular":"-","error-unrecognized-form-plural":"-","imperative-second-person-singular":"зи","error-unrecognized-form-imperative-plural":"зичець","imperative-negative-second-person-singular":"ну зиче","error-unrecognized-form-imperative-negative-plural":"ну зичець"}},{"word":"И","pos":"character","definitions":["The tenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"I","lowercase":"и"}},{"word":"и","pos":"character","definitions":["The tenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"i","uppercase":"И"}},{"word":"Й","pos":"character","definitions":["The eleventh letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"I","lowercase":"й"}},{"word":"й","pos":"character","definitions":["The eleventh letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"i","uppercase":"Й"}},{"word":"империалист","pos":"noun","definitions":["Post-1930s Cyrillic spelling of imperialist."],"forms":{"romanization":"imperialist","plural":"империалишть","feminine":"equivalent империалистэ","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун империалист","accusative-definite-nominative-singular":"империалистул","accusative-indefinite-nominative-plural":"ниште империалишть","accusative-definite-nominative-plural":"империалиштий","dative-genitive-indefinite-singular":"унуй империалист","dative-definite-genitive-singular":"империалистулуй","dative-genitive-indefinite-plural":"унор империалишть","dative-definite-genitive-plural":"империалиштилор"}},{"word":"институция","pos":"noun","definitions":["definite nominative/accusative singular of институцие (instituție) Cyrillic spelling of instituția."],"gender":"f","forms":{"romanization":"instituția"}},{"word":"информация","pos":"noun","definitions":["definite nominative/accusative singular of информацие (informație) Cyrillic spelling of informația."],"gender":"f","forms":{"romanization":"informația"}},{"word":"Италия","pos":"name","definitions":["Cyrillic spelling of Italia.: Italy (a country in Southern Europe)"],"pronunciation":"[iˈta.li.a]","gender":"f","forms":{"romanization":"Italia","table-tags":"no-table-tags","inflection-template":"l","accusative-definite-nominative":"Италия","dative-definite-genitive":"Италией"}},{"word":"К","pos":"character","definitions":["The twelfth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"canonical":"К (C)","lowercase":"к"}},{"word":"к","pos":"character","definitions":["The twelfth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"c","uppercase":"К"}},{"word":"капиталист","pos":"noun","definitions":["Post-1930s Cyrillic spelling of capitalist."],"forms":{"romanization":"capitalist","plural":"капиталишть","feminine":"equivalent капиталистэ","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун капиталист","accusative-definite-nominative-singular":"капиталистул","accusative-indefinite-nominative-plural":"ниште капиталишть","accusative-definite-nominative-plural":"капиталиштий","dative-genitive-indefinite-singular":"унуй капиталист","dative-definite-genitive-singular":"капиталистулуй","dative-genitive-indefinite-plural":"унор капиталишть","dative-definite-genitive-plural":"капиталиштилор"}},{"word":"Кишинэу","pos":"name","definitions":["Post-1930s Cyrillic spelling of Chișinău.: Chișinău (the capital city of Moldova)"],"gender":"n","forms":{"romanization":"Chișinău","accusative-definite-nominative":"Кишинэул","dative-definite-genitive":"Кишинэулуи"}},{"word":"комунист","pos":"noun","definitions":["Post-1930s Cyrillic spelling of comunist."],"forms":{"romanization":"comunist","plural":"комуништь","feminine":"equivalent комунистэ","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун комунист","accusative-definite-nominative-singular":"комунистул","accusative-indefinite-nominative-plural":"ниште комуништь","accusative-definite-nominative-plural":"комуништий","dative-genitive-indefinite-singular":"унуй комунист","dative-definite-genitive-singular":"комунистулуй","dative-genitive-indefinite-plural":"унор комуништь","dative-definite-genitive-plural":"комуништилор"}},{"word":"конституция","pos":"noun","definitions":["definite nominative/accusative singular of конституцие (constituție) Cyrillic spelling of constituția."],"gender":"f","forms":{"romanization":"constituția"}},{"word":"копейкэ","pos":"noun","definitions":["Post-1930s Cyrillic spelling of copeică."],"gender":"f","forms":{"romanization":"copeică","plural":"копейчи"}},{"word":"космонаут","pos":"noun","definitions":["Post-1930s Cyrillic spelling of cosmonaut."],"forms":{"romanization":"cosmonaut","plural":"космонауць","feminine":"equivalent космонаутэ","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун космонаут","accusative-definite-nominative-singular":"космонаутул","accusative-indefinite-nominative-plural":"ниште космонауць","accusative-definite-nominative-plural":"космонауций","dative-genitive-indefinite-singular":"унуй космонаут","dative-definite-genitive-singular":"космонаутулуй","dative-genitive-indefinite-plural":"унор космонауць","dative-definite-genitive-plural":"космонауцилор"}},{"word":"космонауць","pos":"noun","definitions":["plural of космонаут (cosmonaut) Post-1930s Cyrillic spelling of cosmonauți."],"gender":"m-p","forms":{"romanization":"cosmonauți"}},{"word":"култура","pos":"noun","definitions":["definite nominative/accusative singular of културэ (cultură) Cyrillic spelling of cultura."],"pronunciation":"[kulˈtura]","gender":"f","forms":{"romanization":"cultura"}},{"word":"кынтэрец","pos":"noun","definitions":["Post-1930s Cyrillic spelling of cântăreț."],"pronunciation":"[kɨn.təˈrets]","gender":"m","forms":{"romanization":"cîntăreț","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун кынтэрец","accusative-definite-nominative-singular":"кынтэрецул","accusative-indefinite-nominative-plural":"ниште кынтэрець","accusative-definite-nominative-plural":"кынтэреций","dative-genitive-indefinite-singular":"унуй кынтэрец","dative-definite-genitive-singular":"кынтэрецулуй","dative-genitive-indefinite-plural":"унор кынтэрець","dative-definite-genitive-plural":"кынтэрецилор"}},{"word":"Л","pos":"character","definitions":["The thirteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"L","lowercase":"л"}},{"word":"л","pos":"character","definitions":["The thirteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"l","uppercase":"Л"}},{"word":"ла","pos":"prep","definitions":["Post-1930s Cyrillic spelling of la."],"pronunciation":"/la/","forms":{"romanization":"la"}},{"word":"леу","pos":"noun","definitions":["Post-1930s Cyrillic spelling of leu."],"pronunciation":"/lew/","gender":"m","forms":{"romanization":"leu"}},{"word":"М","pos":"character","definitions":["The fourteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"M","lowercase":"м"}},{"word":"м","pos":"character","definitions":["The fourteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"uppercase":"М"}},{"word":"марий","pos":"adj","definitions":["Post-1930s Cyrillic spelling of marii."],"forms":{"romanization":"marii"}},{"word":"машинэ","pos":"noun","definitions":["Post-1930s Cyrillic spelling of mașină."],"gender":"f","forms":{"romanization":"mașină","plural":"машине","table-tags":"no-table-tags","inflection-template":"ro-noun-f-Cyrl","accusative-indefinite-nominative-singular":"машинэ","accusative-definite-nominative-singular":"машина","accusative-indefinite-nominative-plural":"машине","accusative-definite-nominative-plural":"машинеле","dative-genitive-indefinite-singular":"машине","dative-definite-genitive-singular":"машиней","dative-genitive-indefinite-plural":"машине","dative-definite-genitive-plural":"машинелор","singular-vocative":"-","plural-vocative":"-"}},{"word":"милиция","pos":"noun","definitions":["definite nominative/accusative singular of милицие (miliție) Cyrillic spelling of miliția."],"gender":"f","forms":{"romanization":"miliția"}},{"word":"Молдова","pos":"name","definitions":["Post-1930s Cyrillic spelling of Moldova. Moldova (a country in Eastern Europe)"],"pronunciation":"[mol.do.va]","gender":"f","forms":{"romanization":"Moldova","table-tags":"no-table-tags","inflection-template":"l","accusative-definite-nominative":"Молдова","dative-definite-genitive":"Молдовей"}},{"word":"Молдовей","pos":"name","definitions":["definite genitive/dative singular of Молдова (Moldova)"],"forms":{"romanization":"Moldovei"}},{"word":"молдовенеск","pos":"adj","definitions":["Post-1930s Cyrillic spelling of moldovenesc."],"pronunciation":"/mol.do.veˈnesk/","gender":"m","forms":{"romanization":"moldovenesc","feminine-singular":"молдовеняскэ","plural":"молдовенешть","table-tags":"no-table-tags","inflection-template":"ro-adj-3-esc-Cyrl","error-unrecognized-form-indefinite-masculine-neuter-singular":"молдовенеск","error-unrecognized-form-feminine-indefinite-singular":"молдовеняскэ","error-unrecognized-form-indefinite-masculine-plural":"молдовенешть","error-unrecognized-form-feminine-indefinite-neuter-plural":"молдовенешть","definite-error-unrecognized-form-masculine-neuter-singular":"молдовенескул","definite-error-unrecognized-form-feminine-singular":"молдовеняска","definite-error-unrecognized-form-masculine-plural":"молдовенештий","definite-error-unrecognized-form-feminine-neuter-plural":"молдовенештиле"}},{"word":"молдовенеште","pos":"adv","definitions":["Post-1930s Cyrillic spelling of moldovenește."],"pronunciation":"[mol.do.veˈne.ʃte]","examples":[{"ro":"финдкэ ворбеск ромынеште, ворбеск ши молдовенеште","en":"being that I speak Romanian, I also speak Moldavian."}],"forms":{"romanization":"moldovenește"}},{"word":"молдовеняскэ","pos":"adj","definitions":["feminine singular of молдовенеск (moldovenesc)"],"pronunciation":"/mol.do.veˈne̯as.kə/","forms":{"romanization":"moldovenească"}},{"word":"морков","pos":"noun","definitions":["Post-1930s Cyrillic spelling of morcov."],"gender":"m","forms":{"romanization":"morcov","plural":"морковь","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун морков","accusative-definite-nominative-singular":"морковул","accusative-indefinite-nominative-plural":"ниште морковь","accusative-definite-nominative-plural":"морковий","dative-genitive-indefinite-singular":"унуй морков","dative-definite-genitive-singular":"морковулуй","dative-genitive-indefinite-plural":"унор морковь","dative-definite-genitive-plural":"морковилор"}},{"word":"морковь","pos":"noun","definitions":["plural of морков (morcov) Post-1930s Cyrillic spelling of morcovi."],"pronunciation":"[ˈmoɾ.kovʲ]","gender":"m-p","forms":{"romanization":"morcovi"}},{"word":"Москова","pos":"name","definitions":["Post-1930s Cyrillic spelling of Moscova."],"pronunciation":"/ˈmos.ko.va/","gender":"f","forms":{"romanization":"Moscova","table-tags":"no-table-tags","inflection-template":"l","accusative-definite-nominative":"Москова","dative-definite-genitive":"Московей"}},{"word":"Н","pos":"character","definitions":["The fifteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"N","lowercase":"н"}},{"word":"н","pos":"character","definitions":["The fifteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"canonical":"н (n)","uppercase":"Н"}},{"word":"навигатор","pos":"noun","definitions":["Post-1930s Cyrillic spelling of navigator."],"gender":"m","forms":{"romanization":"navigator","plural":"навигаторь","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун навигатор","accusative-definite-nominative-singular":"навигаторул","accusative-indefinite-nominative-plural":"ниште навигаторь","accusative-definite-nominative-plural":"навигаторий","dative-genitive-indefinite-singular":"унуй навигатор","dative-definite-genitive-singular":"навигаторулуй","dative-genitive-indefinite-plural":"унор навигаторь","dative-definite-genitive-plural":"навигаторилор"}},{"word":"националист","pos":"noun","definitions":["Post-1930s Cyrillic spelling of naționalist."],"forms":{"romanization":"naționalist","plural":"националишть","feminine":"equivalent националистэ","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун националист","accusative-definite-nominative-singular":"националистул","accusative-indefinite-nominative-plural":"ниште националишть","accusative-definite-nominative-plural":"националиштий","dative-genitive-indefinite-singular":"унуй националист","dative-definite-genitive-singular":"националистулуй","dative-genitive-indefinite-plural":"унор националишть","dative-definite-genitive-plural":"националиштилор"}},{"word":"Нистрян","pos":"name","definitions":["Post-1930s Cyrillic spelling of Nistrean."],"gender":"m","forms":{"romanization":"Nistrean"}},{"word":"ниште","pos":"article","definitions":["Cyrillic spelling of niște."],"forms":{"romanization":"niște"}},{"word":"ноапте","pos":"noun","definitions":["Post-1930s Cyrillic spelling of noapte."],"forms":{"romanization":"noapte","plural":"нопць","table-tags":"no-table-tags","accusative-indefinite-nominative-singular":"ноапте","accusative-definite-nominative-singular":"ноаптя","accusative-indefinite-nominative-plural":"нопць","accusative-definite-nominative-plural":"нопциле","dative-genitive-indefinite-singular":"нопць","dative-definite-genitive-singular":"нопций","dative-genitive-indefinite-plural":"нопць","dative-definite-genitive-plural":"нопцилор","singular-vocative":"ноапте","plural-vocative":"нопцилор"}},{"word":"О","pos":"character","definitions":["The sixteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"O","lowercase":"о"}},{"word":"о","pos":"character","definitions":["The sixteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"o","uppercase":"О"}},{"word":"о","pos":"article","definitions":["Cyrillic spelling of o."],"forms":{"romanization":"o"}},{"word":"о","pos":"intj","definitions":["Cyrillic spelling of o."],"forms":{"romanization":"o"}},{"word":"о","pos":"pron","definitions":["Cyrillic spelling of o."],"forms":{"romanization":"o"}},{"word":"о","pos":"verb","definitions":["Cyrillic spelling of o."],"forms":{"romanization":"o"}},{"word":"о","pos":"verb","definitions":["Cyrillic spelling of o."],"forms":{"romanization":"o"}},{"word":"ображь","pos":"noun","definitions":["plural of образ (obraz) Cyrillic spelling of obraji."],"gender":"m-p","forms":{"romanization":"obraji"}},{"word":"образ","pos":"noun","definitions":["Cyrillic spelling of obraz."],"forms":{"romanization":"obraz","plural":"ображь","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун образ","accusative-definite-nominative-singular":"образул","accusative-indefinite-nominative-plural":"ниште ображь","accusative-definite-nominative-plural":"ображий","dative-genitive-indefinite-singular":"унуй образ","dative-definite-genitive-singular":"образулуй","dative-genitive-indefinite-plural":"унор ображь","dative-definite-genitive-plural":"ображилор"}},{"word":"организация","pos":"noun","definitions":["definite nominative/accusative singular of организацие (organizație) Cyrillic spelling of organizația."],"gender":"f","forms":{"romanization":"organizația"}},{"word":"П","pos":"character","definitions":["The seventeenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"P","lowercase":"о"}},{"word":"п","pos":"character","definitions":["The seventeenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"p","uppercase":"П","lowercase":"о"}},{"word":"партид","pos":"noun","definitions":["Post-1930s Cyrillic spelling of partid."],"gender":"n","forms":{"romanization":"partid","plural":"партиде","table-tags":"no-table-tags","inflection-template":"ro-noun-n-Cyrl","accusative-indefinite-nominative-singular":"ун партид","accusative-definite-nominative-singular":"партидул","accusative-indefinite-nominative-plural":"ниште партиде","accusative-definite-nominative-plural":"партиделе","dative-genitive-indefinite-singular":"унуи партид","dative-definite-genitive-singular":"партидулуй","dative-genitive-indefinite-plural":"унор партиде","dative-definite-genitive-plural":"партиделор"}},{"word":"патру","pos":"num","definitions":["Post-1930s Cyrillic spelling of patru. (four)"],"pronunciation":"/ˈpa.tru/","forms":{"romanization":"patru"}},{"word":"пенис","pos":"noun","definitions":["Post-1930s Cyrillic spelling of penis."],"pronunciation":"[ˈpe.nis]","gender":"n","forms":{"romanization":"penis","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri-Cyrl","accusative-indefinite-nominative-singular":"ун пенис","accusative-definite-nominative-singular":"пенисул","accusative-indefinite-nominative-plural":"ниште пенисурь","accusative-definite-nominative-plural":"пенисуриле","dative-genitive-indefinite-singular":"унуи пенис","dative-definite-genitive-singular":"пенисулуй","dative-genitive-indefinite-plural":"унор пенисурь","dative-definite-genitive-plural":"пенисурилор"}},{"word":"политика","pos":"noun","definitions":["definite nominative/accusative singular of политикэ (politică) Cyrillic spelling of politica."],"gender":"f","forms":{"romanization":"politica"}},{"word":"полиция","pos":"noun","definitions":["definite nominative/accusative singular of полицие (poliție) Cyrillic spelling of poliția."],"gender":"f","forms":{"romanization":"poliția"}},{"word":"популация","pos":"noun","definitions":["definite nominative/accusative singular of популацие (populație) Cyrillic spelling of populația."],"gender":"f","forms":{"romanization":"populația"}},{"word":"пролетарь дин тоате цэриле, уници-вэ","pos":"phrase","definitions":["Post-1930s Cyrillic spelling of proletari din toate țările, uniți-vă."],"forms":{"romanization":"proletari din toate țările"}},{"word":"психолог","pos":"noun","definitions":["Cyrillic spelling of psiholog."],"gender":"m","forms":{"romanization":"psiholog","plural":"психолоӂь","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун психолог","accusative-definite-nominative-singular":"психологул","accusative-indefinite-nominative-plural":"ниште психолоӂь","accusative-definite-nominative-plural":"психолоӂий","dative-genitive-indefinite-singular":"унуй психолог","dative-definite-genitive-singular":"психологулуй","dative-genitive-indefinite-plural":"унор психолоӂь","dative-definite-genitive-plural":"психолоӂилор"}},{"word":"Р","pos":"character","definitions":["The eighteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"R","lowercase":"р"}},{"word":"р","pos":"character","definitions":["The eighteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"r","uppercase":"Р"}},{"word":"република","pos":"noun","definitions":["definite nominative/accusative singular of републикэ (republică) Cyrillic spelling of republica."],"gender":"f","forms":{"romanization":"republica"}},{"word":"републикэ","pos":"noun","definitions":["Cyrillic spelling of republică."],"pronunciation":"[reˈpublikə]","gender":"f","forms":{"romanization":"republică","plural":"републичи","table-tags":"no-table-tags","inflection-template":"ro-noun-f-Cyrl","accusative-indefinite-nominative-singular":"републикэ","accusative-definite-nominative-singular":"република","accusative-indefinite-nominative-plural":"републичи","accusative-definite-nominative-plural":"републичиле","dative-genitive-indefinite-singular":"републичи","dative-definite-genitive-singular":"републичий","dative-genitive-indefinite-plural":"републичи","dative-definite-genitive-plural":"републичилор","singular-vocative":"-","plural-vocative":"-"}},{"word":"Ромыниа","pos":"name","definitions":["Post-1930s Cyrillic spelling of România."],"gender":"f","forms":{"romanization":"Romînia"}},{"word":"Ромыния","pos":"name","definitions":["Post-1930s Cyrillic spelling of România.: Romania (a country in Southeast Europe)"],"pronunciation":"[romɨˈnia]","gender":"f","forms":{"romanization":"Romînia","table-tags":"no-table-tags","inflection-template":"l","accusative-definite-nominative":"Ромыния","dative-definite-genitive":"Ромынией"}},{"word":"рублэ","pos":"noun","definitions":["Post-1930s Cyrillic spelling of rublă."],"gender":"f","forms":{"romanization":"rublă","plural":"рубле","table-tags":"no-table-tags","inflection-template":"ro-noun-f-Cyrl","accusative-indefinite-nominative-singular":"рублэ","accusative-definite-nominative-singular":"рубла","accusative-indefinite-nominative-plural":"рубле","accusative-definite-nominative-plural":"рублеле","dative-genitive-indefinite-singular":"рубле","dative-definite-genitive-singular":"рублей","dative-genitive-indefinite-plural":"рубле","dative-definite-genitive-plural":"рублелор","singular-vocative":"-","plural-vocative":"-"}},{"word":"Русия","pos":"name","definitions":["Post-1930s Cyrillic spelling of Rusia.: Russia (a transcontinental country in Eastern Europe and North Asia)"],"pronunciation":"[ˈru.si.a]","gender":"f","forms":{"romanization":"Rusia","table-tags":"no-table-tags","inflection-template":"l","accusative-definite-nominative":"Русия","dative-definite-genitive":"Русией"}},{"word":"С","pos":"character","definitions":["The nineteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"S","lowercase":"с"}},{"word":"с","pos":"character","definitions":["The nineteenth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"canonical":"с (s)","uppercase":"С"}},{"word":"сепаратист","pos":"noun","definitions":["Post-1930s Cyrillic spelling of separatist."],"forms":{"romanization":"separatist","plural":"сепаратишть","feminine":"equivalent сепаратистэ","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун сепаратист","accusative-definite-nominative-singular":"сепаратистул","accusative-indefinite-nominative-plural":"ниште сепаратишть","accusative-definite-nominative-plural":"сепаратиштий","dative-genitive-indefinite-singular":"унуй сепаратист","dative-definite-genitive-singular":"сепаратистулуй","dative-genitive-indefinite-plural":"унор сепаратишть","dative-definite-genitive-plural":"сепаратиштилор"}},{"word":"собэ","pos":"noun","definitions":["Post-1930s Cyrillic spelling of sobă."],"pronunciation":"[ˈso.bə]","gender":"f","forms":{"romanization":"sobă","plural":"собе","table-tags":"no-table-tags","inflection-template":"ro-noun-f-Cyrl","accusative-indefinite-nominative-singular":"собэ","accusative-definite-nominative-singular":"соба","accusative-indefinite-nominative-plural":"собе","accusative-definite-nominative-plural":"собеле","dative-genitive-indefinite-singular":"собе","dative-definite-genitive-singular":"собей","dative-genitive-indefinite-plural":"собе","dative-definite-genitive-plural":"собелор","singular-vocative":"-","plural-vocative":"-"}},{"word":"совет","pos":"noun","definitions":["Post-1930s Cyrillic spelling of soviet."],"gender":"n","forms":{"romanization":"sovet","plural":"совете","table-tags":"no-table-tags","inflection-template":"ro-noun-n-Cyrl","accusative-indefinite-nominative-singular":"ун совет","accusative-definite-nominative-singular":"советул","accusative-indefinite-nominative-plural":"ниште совете","accusative-definite-nominative-plural":"советеле","dative-genitive-indefinite-singular":"унуи совет","dative-definite-genitive-singular":"советулуй","dative-genitive-indefinite-plural":"унор совете","dative-definite-genitive-plural":"советелор"}},{"word":"советик","pos":"noun","definitions":["Post-1930s Cyrillic spelling of sovietic."],"gender":"m","forms":{"romanization":"sovetic","plural":"советичи","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун советик","accusative-definite-nominative-singular":"советикул","accusative-indefinite-nominative-plural":"ниште советичь","accusative-definite-nominative-plural":"советичий","dative-genitive-indefinite-singular":"унуй советик","dative-definite-genitive-singular":"советикулуй","dative-genitive-indefinite-plural":"унор советичь","dative-definite-genitive-plural":"советичилор"}},{"word":"советикэ","pos":"noun","definitions":["Post-1930s Cyrillic spelling of sovietică."],"gender":"f","forms":{"romanization":"sovetică","plural":"советиче","table-tags":"no-table-tags","inflection-template":"ro-noun-f-Cyrl","accusative-indefinite-nominative-singular":"советикэ","accusative-definite-nominative-singular":"советика","accusative-indefinite-nominative-plural":"советиче","accusative-definite-nominative-plural":"советичеле","dative-genitive-indefinite-singular":"советиче","dative-definite-genitive-singular":"советичей","dative-genitive-indefinite-plural":"советиче","dative-definite-genitive-plural":"советичелор","singular-vocative":"-","plural-vocative":"-"}},{"word":"советиче","pos":"noun","definitions":["plural of советикэ (sovetică)"],"gender":"f","forms":{"romanization":"sovetice"}},{"word":"солдат","pos":"noun","definitions":["Post-1930s Cyrillic spelling of soldat."],"forms":{"romanization":"soldat","plural":"солдаць","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун солдат","accusative-definite-nominative-singular":"солдатул","accusative-indefinite-nominative-plural":"ниште солдаць","accusative-definite-nominative-plural":"солдаций","dative-genitive-indefinite-singular":"унуй солдат","dative-definite-genitive-singular":"солдатулуй","dative-genitive-indefinite-plural":"унор солдаць","dative-definite-genitive-plural":"солдацилор"}},{"word":"солдаць","pos":"noun","definitions":["plural of солдат (soldat) Post-1930s Cyrillic spelling of soldați."],"gender":"m-p","forms":{"romanization":"soldați"}},{"word":"Т","pos":"character","definitions":["The twentieth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"T","lowercase":"т"}},{"word":"т","pos":"character","definitions":["The twentieth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"t","uppercase":"Т"}},{"word":"терорист","pos":"noun","definitions":["Post-1930s Cyrillic spelling of terorist."],"forms":{"romanization":"terorist","plural":"тероришть","feminine":"equivalent терористэ","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун терорист","accusative-definite-nominative-singular":"терористул","accusative-indefinite-nominative-plural":"ниште тероришть","accusative-definite-nominative-plural":"терориштий","dative-genitive-indefinite-singular":"унуй терорист","dative-definite-genitive-singular":"терористулуй","dative-genitive-indefinite-plural":"унор тероришть","dative-definite-genitive-plural":"терориштилор"}},{"word":"У","pos":"character","definitions":["The twenty-first letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"canonical":"У (U)","lowercase":"у"}},{"word":"у","pos":"character","definitions":["The twenty-first letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"u","uppercase":"У"}},{"word":"ун","pos":"article","definitions":["Cyrillic spelling of un."],"forms":{"romanization":"un"}},{"word":"уней","pos":"article","definitions":["Cyrillic spelling of unei."],"forms":{"romanization":"unei"}},{"word":"Униуня Еуропянэ","pos":"name","definitions":["Post-1930s Cyrillic spelling of Uniunea Europeană."],"gender":"f","forms":{"canonical-feminine":"Униуния Еуропянэ","romanization":"Uniunia Europiană"}},{"word":"Униуня Совиетикэ","pos":"name","definitions":["Post-1930s Cyrillic spelling of Uniunea Sovietică."],"gender":"f","forms":{"romanization":"Uniunea Sovietică"}},{"word":"унор","pos":"article","definitions":["Cyrillic spelling of unor."],"forms":{"romanization":"unor"}},{"word":"унуй","pos":"article","definitions":["Cyrillic spelling of unui."],"forms":{"romanization":"unui"}},{"word":"УРСС","pos":"name","definitions":["Post-1930s Cyrillic spelling of URSS.: (historical) USSR (a former transcontinental country in Europe and Asia (1922–1991), now split into Russia and 14 other countries; the Soviet Union; in full, Union of Soviet Socialist Republics)"],"pronunciation":"/u.ɛr.ɛs.ˈɛs/","forms":{"romanization":"URSS"}},{"word":"Ф","pos":"character","definitions":["The twenty-second letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"F","lowercase":"ф"}},{"word":"ф","pos":"character","definitions":["The twenty-second letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"uppercase":"Ф"}},{"word":"федерация","pos":"noun","definitions":["definite nominative/accusative singular of федерацие (federație) Cyrillic spelling of federația."],"gender":"f","forms":{"romanization":"federația"}},{"word":"фи","pos":"verb","definitions":["Post-1930s Cyrillic spelling of fi."],"forms":{"canonical":"а фи [conj]","romanization":"a fi","present-singular-third-person":"есте","participle-past":"фост","subjunctive-third-person":"фие","table-tags":"no-table-tags","inflection-template":"l","infinitive-present":"а фи","infinitive-past":"а фи фост","gerund":"фиинд","first-person-present-singular":"сынт","present-second-person-singular":"ешть","error-unrecognized-form-present-singular":"есте","error-unrecognized-form-plural-present":"сынтем","first-person-perfect-singular":"фусей","perfect-second-person-singular":"фусешь","error-unrecognized-form-perfect-singular":"фусе","error-unrecognized-form-perfect-plural":"фусерэм","first-person-imperfect-singular":"ерам","imperfect-second-person-singular":"ерай","error-unrecognized-form-imperfect-singular":"ера","error-unrecognized-form-imperfect-plural":"ерам","first-person-pluperfect-singular":"фусесем","pluperfect-second-person-singular":"фусесешь","error-unrecognized-form-pluperfect-singular":"фусесе","error-unrecognized-form-pluperfect-plural":"фусесерэм","first-person-present-singular-subjunctive":"сэ фиу","present-second-person-singular-subjunctive":"сэ фий","error-unrecognized-form-present-singular-subjunctive":"сэ фие","error-unrecognized-form-plural-present-subjunctive":"сэ фим","first-person-past-singular-subjunctive":"сэ фи фост","past-second-person-singular-subjunctive":"сэ фи фост","error-unrecognized-form-past-singular-subjunctive":"сэ фи фост","error-unrecognized-form-past-plural-subjunctive":"сэ фи фост","first-person-imperative-present-singular":"-","imperative-present-second-person-singular":"фий","error-unrecognized-form-imperative-present-singular":"-","error-unrecognized-form-imperative-plural-present":"-"}},{"word":"фонолог","pos":"noun","definitions":["Cyrillic spelling of fonolog."],"gender":"m","forms":{"romanization":"fonolog","plural":"фонолоӂь","table-tags":"no-table-tags","inflection-template":"ro-noun-m-Cyrl","accusative-indefinite-nominative-singular":"ун фонолог","accusative-definite-nominative-singular":"фонологул","accusative-indefinite-nominative-plural":"ниште фонолоӂь","accusative-definite-nominative-plural":"фонолоӂий","dative-genitive-indefinite-singular":"унуй фонолог","dative-definite-genitive-singular":"фонологулуй","dative-genitive-indefinite-plural":"унор фонолоӂь","dative-definite-genitive-plural":"фонолоӂилор"}},{"word":"фотография","pos":"noun","definitions":["definite nominative/accusative singular of фотографие (fotografie) Cyrillic spelling of fotografia."],"gender":"f","forms":{"romanization":"fotografia"}},{"word":"фу","pos":"verb","definitions":["Cyrillic spelling of fu."],"pronunciation":"[fu]","forms":{"romanization":"fu"}},{"word":"Х","pos":"character","definitions":["The twenty-third letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"H","lowercase":"х"}},{"word":"х","pos":"character","definitions":["The twenty-third letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"h","uppercase":"Х"}},{"word":"хомосексуалитате","pos":"noun","definitions":["Post-1930s Cyrillic spelling of homosexualitate."],"forms":{"romanization":"homosexualitate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-Cyrl","accusative-indefinite-nominative":"хомосексуалитате","accusative-definite-nominative":"хомосексуалитатя","dative-genitive-indefinite":"хомосексуалитэци","dative-definite-genitive":"хомосексуалитэций","vocative":"-"}},{"word":"хухура","pos":"verb","definitions":["Post-1930s Cyrillic spelling of huhura."],"forms":{"canonical":"а хухура 1st conjugation","romanization":"a huhura","present-singular-third-person":"хухурэ","participle-past":"хухурат","table-tags":"no-table-tags","inflection-template":"l","infinitive":"а хухура","gerund":"хухурынд","first-person-indicative-present-singular":"хухур","indicative-present-second-person-singular":"хухурь","indicative-present-singular-third-person":"хухурэ","error-unrecognized-form-indicative-plural-present":"хухурэм","first-person-imperfect-indicative-singular":"хухурам","imperfect-indicative-second-person-singular":"хухурай","imperfect-indicative-singular-third-person":"хухура","error-unrecognized-form-imperfect-indicative-plural":"хухурам","first-person-indicative-perfect-singular":"хухурай","indicative-perfect-second-person-singular":"хухурашь","indicative-perfect-singular-third-person":"хухурэ","error-unrecognized-form-indicative-perfect-plural":"хухурэм","first-person-indicative-pluperfect-singular":"хухурасем","indicative-pluperfect-second-person-singular":"хухурасешь","indicative-pluperfect-singular-third-person":"хухурасе","error-unrecognized-form-indicative-pluperfect-plural":"хухурасерэм","first-person-present-singular-subjunctive":"сэ хухур","present-second-person-singular-subjunctive":"сэ хухурь","present-singular-subjunctive-third-person":"сэ хухуре","error-unrecognized-form-plural-present-subjunctive":"сэ хухурэм","first-person-imperative-singular":"-","second-person-singular-subjunctive-third-person":"-","error-unrecognized-form-second-person-singular":"-","error-unrecognized-form-plural":"-","imperative-second-person-singular":"хухурэ","error-unrecognized-form-imperative-plural":"хухураць","imperative-negative-second-person-singular":"ну хухура","error-unrecognized-form-imperative-negative-plural":"ну хухураць"}},{"word":"Ц","pos":"character","definitions":["The twenty-fourth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"Ț","lowercase":"ц"}},{"word":"ц","pos":"character","definitions":["The twenty-fourth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"ț","uppercase":"Ц"}},{"word":"Ч","pos":"character","definitions":["The twenty-fifth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"Ci","lowercase":"ч"}},{"word":"ч","pos":"character","definitions":["The twenty-fifth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"ci","uppercase":"Ч"}},{"word":"чивилизация","pos":"noun","definitions":["definite nominative/accusative singular of чивилизацие (civilizație) Cyrillic spelling of civilizația."],"gender":"f","forms":{"romanization":"civilizația"}},{"word":"Ш","pos":"character","definitions":["The twenty-sixth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"Ș","lowercase":"ш"}},{"word":"ш","pos":"character","definitions":["The twenty-sixth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"ș","uppercase":"Ш"}},{"word":"ши","pos":"conj","definitions":["Post-1930s Cyrillic spelling of și."],"forms":{"romanization":"și","alternative":"шѝ"}},{"word":"шѝ","pos":"conj","definitions":["Pre-1860s Cyrillic spelling of și."],"forms":{"romanization":"sì","alternative":"ши"}},{"word":"Ы","pos":"character","definitions":["The twenty-seventh letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"Î","lowercase":"ы"}},{"word":"ы","pos":"character","definitions":["The twenty-seventh letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"î","uppercase":"Ы"}},{"word":"ынвэцэмынт","pos":"noun","definitions":["Post-1930s Cyrillic spelling of învățământ."],"forms":{"romanization":"învățămînt","plural":"ынвэцэминте"}},{"word":"Ь","pos":"character","definitions":["The twenty-eighth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"I","lowercase":"ь"}},{"word":"ь","pos":"character","definitions":["The twenty-eighth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"i","uppercase":"Ь"}},{"word":"Э","pos":"character","definitions":["The twenty-ninth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"Ă","lowercase":"э"}},{"word":"э","pos":"character","definitions":["The twenty-ninth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"ă","uppercase":"Э"}},{"word":"Ю","pos":"character","definitions":["The thirtieth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"Iu","lowercase":"ю"}},{"word":"ю","pos":"character","definitions":["The thirtieth letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"iu","uppercase":"Ю"}},{"word":"юби","pos":"verb","definitions":["Post-1930s Cyrillic spelling of iubi."],"forms":{"canonical":"а юби 4th conjugation","romanization":"a iubi","present-singular-third-person":"юбеште","participle-past":"юбит","subjunctive-third-person":"юбяскэ","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc-Cyrl","infinitive":"а юби","gerund":"юбинд","first-person-indicative-present-singular":"юбеск","indicative-present-second-person-singular":"юбешть","error-unrecognized-form-indicative-present-singular":"юбеште","error-unrecognized-form-indicative-plural-present":"юбим","first-person-imperfect-indicative-singular":"юбям","imperfect-indicative-second-person-singular":"юбяи","error-unrecognized-form-imperfect-indicative-singular":"юбя","error-unrecognized-form-imperfect-indicative-plural":"юбям","first-person-indicative-perfect-singular":"юбий","indicative-perfect-second-person-singular":"юбишь","error-unrecognized-form-indicative-perfect-singular":"юби","error-unrecognized-form-indicative-perfect-plural":"юбирэм","first-person-indicative-pluperfect-singular":"юбисем","indicative-pluperfect-second-person-singular":"юбисешь","error-unrecognized-form-indicative-pluperfect-singular":"юбисе","error-unrecognized-form-indicative-pluperfect-plural":"юбисерэм","first-person-present-singular-subjunctive":"сэ юбеск","present-second-person-singular-subjunctive":"сэ юбешть","error-unrecognized-form-present-singular-subjunctive":"сэ юбяскэ","error-unrecognized-form-plural-present-subjunctive":"сэ юбим","imperative-second-person-singular":"юбеште","error-unrecognized-form-imperative-plural":"юбиць","imperative-negative-second-person-singular":"ну юби","error-unrecognized-form-imperative-negative-plural":"ну юбиць"}},{"word":"Я","pos":"character","definitions":["The thirty-first letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"Ia","lowercase":"я"}},{"word":"я","pos":"character","definitions":["The thirty-first letter of the Moldovan alphabet, written in the Cyrillic script."],"forms":{"romanization":"ia","uppercase":"Я"}},{"word":"◌̂","pos":"character","definitions":["A diacritical mark of the Latin script, called accent circumflex (“circumflex accent”) in Romanian, and found on Â/â and Î/î."]},{"word":"◌̆","pos":"character","definitions":["A diacritical mark of the Latin script, called căciulă (“fur hat”) in Romanian, and found on Ă/ă."]},{"word":"◌̦","pos":"character","definitions":["A diacritical mark of the Latin script, called virgulă (“comma”) in Romanian, and found on Ș/ș and Ț/ț."]},{"word":"Ꙟ","pos":"character","definitions":["A letter of the Romanian Cyrillic alphabet, representing the prefix în-."],"forms":{"lowercase":"ꙟ"}},{"word":"ꙟ","pos":"character","definitions":["A letter of the Romanian Cyrillic alphabet, representing the prefix în-."],"forms":{"uppercase":"Ꙟ"}}];
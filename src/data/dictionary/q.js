@@ -1 +1 @@
-export default [{"word":"q","pos":"character","definitions":["The twentieth letter of the Romanian alphabet, called chiu and written in the Latin script."],"pronunciation":"/k/","forms":{"uppercase":"Q"}},{"word":"Q","pos":"character","definitions":["The twentieth letter of the Romanian alphabet, called chiu and written in the Latin script."],"pronunciation":"/k/","forms":{"lowercase":"q"}},{"word":"qatariană","pos":"noun","definitions":["female equivalent of qatarian"],"forms":{"plural":"qatariene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"qatariană","accusative-definite-nominative-singular":"qatariana","accusative-indefinite-nominative-plural":"qatariene","accusative-definite-nominative-plural":"qatarienele","dative-genitive-indefinite-singular":"qatariene","dative-definite-genitive-singular":"qatarienei","dative-genitive-indefinite-plural":"qatariene","dative-definite-genitive-plural":"qatarienelor","singular-vocative":"qatariană","plural-vocative":"qatarienelor"}},{"word":"quadrivium","pos":"noun","definitions":["alternative spelling of cvadrivium"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"quadrivium","accusative-definite-nominative":"quadriviumul","dative-genitive-indefinite":"quadrivium","dative-definite-genitive":"quadriviumului","vocative":"quadriviumule"}},{"word":"quaker","pos":"noun","definitions":["Quaker"],"forms":{"plural":"quakeri","feminine":"equivalent quakeră","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"quaker","accusative-definite-nominative-singular":"quakerul","accusative-indefinite-nominative-plural":"quakeri","accusative-definite-nominative-plural":"quakerii","dative-genitive-indefinite-singular":"quaker","dative-definite-genitive-singular":"quakerului","dative-genitive-indefinite-plural":"quakeri","dative-definite-genitive-plural":"quakerilor","singular-vocative":"quakerule","plural-vocative":"quakerilor"}},{"word":"quakeră","pos":"noun","definitions":["female equivalent of quaker"],"forms":{"plural":"quakere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"quakeră","accusative-definite-nominative-singular":"quakera","accusative-indefinite-nominative-plural":"quakere","accusative-definite-nominative-plural":"quakerele","dative-genitive-indefinite-singular":"quakere","dative-definite-genitive-singular":"quakerei","dative-genitive-indefinite-plural":"quakere","dative-definite-genitive-plural":"quakerelor","singular-vocative":"quakeră","plural-vocative":"quakerelor"}},{"word":"quakerism","pos":"noun","definitions":["Quakerism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"quakerism","accusative-definite-nominative":"quakerismul","dative-genitive-indefinite":"quakerism","dative-definite-genitive":"quakerismului","vocative":"quakerismule"}},{"word":"quarc","pos":"noun","definitions":["quark"],"forms":{"plural":"quarcuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"quarc","accusative-definite-nominative-singular":"quarcul","accusative-indefinite-nominative-plural":"quarcuri","accusative-definite-nominative-plural":"quarcurile","dative-genitive-indefinite-singular":"quarc","dative-definite-genitive-singular":"quarcului","dative-genitive-indefinite-plural":"quarcuri","dative-definite-genitive-plural":"quarcurilor","singular-vocative":"quarcule","plural-vocative":"quarcurilor"}},{"word":"quartet","pos":"noun","definitions":["alternative form of cvartet"],"forms":{"plural":"quartete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"quartet","accusative-definite-nominative-singular":"quartetul","accusative-indefinite-nominative-plural":"quartete","accusative-definite-nominative-plural":"quartetele","dative-genitive-indefinite-singular":"quartet","dative-definite-genitive-singular":"quartetului","dative-genitive-indefinite-plural":"quartete","dative-definite-genitive-plural":"quartetelor","singular-vocative":"quartetule","plural-vocative":"quartetelor"}},{"word":"quasar","pos":"noun","definitions":["quasar"],"forms":{"plural":"quasari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"quasar","accusative-definite-nominative-singular":"quasarul","accusative-indefinite-nominative-plural":"quasari","accusative-definite-nominative-plural":"quasarii","dative-genitive-indefinite-singular":"quasar","dative-definite-genitive-singular":"quasarului","dative-genitive-indefinite-plural":"quasari","dative-definite-genitive-plural":"quasarilor","singular-vocative":"quasarule","plural-vocative":"quasarilor"}},{"word":"quattrocentistă","pos":"noun","definitions":["female equivalent of quattrocentist"],"forms":{"plural":"quattrocentiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"quattrocentistă","accusative-definite-nominative-singular":"quattrocentista","accusative-indefinite-nominative-plural":"quattrocentiste","accusative-definite-nominative-plural":"quattrocentistele","dative-genitive-indefinite-singular":"quattrocentiste","dative-definite-genitive-singular":"quattrocentistei","dative-genitive-indefinite-plural":"quattrocentiste","dative-definite-genitive-plural":"quattrocentistelor","singular-vocative":"quattrocentistă","plural-vocative":"quattrocentistelor"}},{"word":"Québec","pos":"name","definitions":["alternative form of Quebec:","Quebec (a province in eastern Canada)","Quebec, Quebec City (the capital city of the province of Quebec, Canada)"],"gender":"n"},{"word":"quebracho","pos":"noun","definitions":["quebracho"],"forms":{"plural":"quebracho","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"quebracho","accusative-definite-nominative-singular":"quebrachoul","accusative-indefinite-nominative-plural":"quebracho","accusative-definite-nominative-plural":"quebrachoi","dative-genitive-indefinite-singular":"quebracho","dative-definite-genitive-singular":"quebrachoului","dative-genitive-indefinite-plural":"quebracho","dative-definite-genitive-plural":"quebracholor","singular-vocative":"quebrachoule","plural-vocative":"quebracholor"}},{"word":"quechua","pos":"adj","definitions":["Quechua"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"quechua","error-unrecognized-form-feminine-indefinite-singular":"quechua","error-unrecognized-form-indefinite-masculine-plural":"quechua","error-unrecognized-form-feminine-indefinite-neuter-plural":"quechua","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"quechua","pos":"noun","definitions":["Quechua"],"forms":{"plural":"quechua","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"quechua","accusative-definite-nominative-singular":"quechuaul","accusative-indefinite-nominative-plural":"quechua","accusative-definite-nominative-plural":"quechuai","dative-genitive-indefinite-singular":"quechua","dative-definite-genitive-singular":"quechuaului","dative-genitive-indefinite-plural":"quechua","dative-definite-genitive-plural":"quechualor","singular-vocative":"quechuaule","plural-vocative":"quechualor"}},{"word":"quetzal","pos":"noun","definitions":["quetzal"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"quetzal","accusative-definite-nominative":"quetzalul","dative-genitive-indefinite":"quetzal","dative-definite-genitive":"quetzalului","vocative":"quetzalule"}},{"word":"quidditate","pos":"noun","definitions":["quiddity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"quidditate","accusative-definite-nominative":"quidditatea","dative-genitive-indefinite":"quiddități","dative-definite-genitive":"quiddității","vocative":"-"}},{"word":"quiproquo","pos":"noun","definitions":["misunderstanding"],"forms":{"plural":"quiproquo-uri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"quiproquo","accusative-definite-nominative-singular":"quiproquoul","accusative-indefinite-nominative-plural":"quiproquouri","accusative-definite-nominative-plural":"quiproquourile","dative-genitive-indefinite-singular":"quiproquo","dative-definite-genitive-singular":"quiproquoului","dative-genitive-indefinite-plural":"quiproquouri","dative-definite-genitive-plural":"quiproquourilor","singular-vocative":"quiproquoule","plural-vocative":"quiproquourilor"}},{"word":"quipu","pos":"noun","definitions":["quipu"],"forms":{"plural":"quipu","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"quipu","accusative-definite-nominative-singular":"quipuul","accusative-indefinite-nominative-plural":"quipu","accusative-definite-nominative-plural":"quipule","dative-genitive-indefinite-singular":"quipu","dative-definite-genitive-singular":"quipuului","dative-genitive-indefinite-plural":"quipu","dative-definite-genitive-plural":"quipulor","singular-vocative":"quipuule","plural-vocative":"quipulor"}},{"word":"quisling","pos":"noun","definitions":["quisling"],"forms":{"plural":"quislingi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"quisling","accusative-definite-nominative-singular":"quislingul","accusative-indefinite-nominative-plural":"quislingi","accusative-definite-nominative-plural":"quislingii","dative-genitive-indefinite-singular":"quisling","dative-definite-genitive-singular":"quislingului","dative-genitive-indefinite-plural":"quislingi","dative-definite-genitive-plural":"quislingilor","singular-vocative":"quislingule","plural-vocative":"quislingilor"}},{"word":"quolibet","pos":"noun","definitions":["quip, gibe, taunt"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"quolibet","accusative-definite-nominative":"quolibetul","dative-genitive-indefinite":"quolibet","dative-definite-genitive":"quolibetului","vocative":"quolibetule"}},{"word":"quruch","pos":"noun","definitions":["qurush"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"quruch","accusative-definite-nominative":"quruchul","dative-genitive-indefinite":"quruch","dative-definite-genitive":"quruchului","vocative":"quruchule"}}];
+export default [{"word":"Q","pos":"character","definitions":["The twentieth letter of the Romanian alphabet, called chiu and written in the Latin script."],"pronunciation":"/k/","forms":{"lowercase":"q"}},{"word":"q","pos":"character","definitions":["The twentieth letter of the Romanian alphabet, called chiu and written in the Latin script."],"pronunciation":"/k/","forms":{"uppercase":"Q"}},{"word":"qatariană","pos":"noun","definitions":["female equivalent of qatarian"],"forms":{"plural":"qatariene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"qatariană","accusative-definite-nominative-singular":"qatariana","accusative-indefinite-nominative-plural":"qatariene","accusative-definite-nominative-plural":"qatarienele","dative-genitive-indefinite-singular":"qatariene","dative-definite-genitive-singular":"qatarienei","dative-genitive-indefinite-plural":"qatariene","dative-definite-genitive-plural":"qatarienelor","singular-vocative":"qatariană","plural-vocative":"qatarienelor"}},{"word":"quadrivium","pos":"noun","definitions":["alternative spelling of cvadrivium"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"quadrivium","accusative-definite-nominative":"quadriviumul","dative-genitive-indefinite":"quadrivium","dative-definite-genitive":"quadriviumului","vocative":"quadriviumule"}},{"word":"quaker","pos":"noun","definitions":["Quaker"],"forms":{"plural":"quakeri","feminine":"equivalent quakeră","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"quaker","accusative-definite-nominative-singular":"quakerul","accusative-indefinite-nominative-plural":"quakeri","accusative-definite-nominative-plural":"quakerii","dative-genitive-indefinite-singular":"quaker","dative-definite-genitive-singular":"quakerului","dative-genitive-indefinite-plural":"quakeri","dative-definite-genitive-plural":"quakerilor","singular-vocative":"quakerule","plural-vocative":"quakerilor"}},{"word":"quakeră","pos":"noun","definitions":["female equivalent of quaker"],"forms":{"plural":"quakere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"quakeră","accusative-definite-nominative-singular":"quakera","accusative-indefinite-nominative-plural":"quakere","accusative-definite-nominative-plural":"quakerele","dative-genitive-indefinite-singular":"quakere","dative-definite-genitive-singular":"quakerei","dative-genitive-indefinite-plural":"quakere","dative-definite-genitive-plural":"quakerelor","singular-vocative":"quakeră","plural-vocative":"quakerelor"}},{"word":"quakerism","pos":"noun","definitions":["Quakerism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"quakerism","accusative-definite-nominative":"quakerismul","dative-genitive-indefinite":"quakerism","dative-definite-genitive":"quakerismului","vocative":"quakerismule"}},{"word":"quarc","pos":"noun","definitions":["quark"],"forms":{"plural":"quarcuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"quarc","accusative-definite-nominative-singular":"quarcul","accusative-indefinite-nominative-plural":"quarcuri","accusative-definite-nominative-plural":"quarcurile","dative-genitive-indefinite-singular":"quarc","dative-definite-genitive-singular":"quarcului","dative-genitive-indefinite-plural":"quarcuri","dative-definite-genitive-plural":"quarcurilor","singular-vocative":"quarcule","plural-vocative":"quarcurilor"}},{"word":"quartet","pos":"noun","definitions":["alternative form of cvartet"],"forms":{"plural":"quartete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"quartet","accusative-definite-nominative-singular":"quartetul","accusative-indefinite-nominative-plural":"quartete","accusative-definite-nominative-plural":"quartetele","dative-genitive-indefinite-singular":"quartet","dative-definite-genitive-singular":"quartetului","dative-genitive-indefinite-plural":"quartete","dative-definite-genitive-plural":"quartetelor","singular-vocative":"quartetule","plural-vocative":"quartetelor"}},{"word":"quasar","pos":"noun","definitions":["quasar"],"forms":{"plural":"quasari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"quasar","accusative-definite-nominative-singular":"quasarul","accusative-indefinite-nominative-plural":"quasari","accusative-definite-nominative-plural":"quasarii","dative-genitive-indefinite-singular":"quasar","dative-definite-genitive-singular":"quasarului","dative-genitive-indefinite-plural":"quasari","dative-definite-genitive-plural":"quasarilor","singular-vocative":"quasarule","plural-vocative":"quasarilor"}},{"word":"quattrocentistă","pos":"noun","definitions":["female equivalent of quattrocentist"],"forms":{"plural":"quattrocentiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"quattrocentistă","accusative-definite-nominative-singular":"quattrocentista","accusative-indefinite-nominative-plural":"quattrocentiste","accusative-definite-nominative-plural":"quattrocentistele","dative-genitive-indefinite-singular":"quattrocentiste","dative-definite-genitive-singular":"quattrocentistei","dative-genitive-indefinite-plural":"quattrocentiste","dative-definite-genitive-plural":"quattrocentistelor","singular-vocative":"quattrocentistă","plural-vocative":"quattrocentistelor"}},{"word":"Québec","pos":"name","definitions":["alternative form of Quebec:","Quebec (a province in eastern Canada)","Quebec, Quebec City (the capital city of the province of Quebec, Canada)"],"gender":"n"},{"word":"quebracho","pos":"noun","definitions":["quebracho"],"forms":{"plural":"quebracho","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"quebracho","accusative-definite-nominative-singular":"quebrachoul","accusative-indefinite-nominative-plural":"quebracho","accusative-definite-nominative-plural":"quebrachoi","dative-genitive-indefinite-singular":"quebracho","dative-definite-genitive-singular":"quebrachoului","dative-genitive-indefinite-plural":"quebracho","dative-definite-genitive-plural":"quebracholor","singular-vocative":"quebrachoule","plural-vocative":"quebracholor"}},{"word":"quechua","pos":"adj","definitions":["Quechua"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"quechua","error-unrecognized-form-feminine-indefinite-singular":"quechua","error-unrecognized-form-indefinite-masculine-plural":"quechua","error-unrecognized-form-feminine-indefinite-neuter-plural":"quechua","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"quechua","pos":"noun","definitions":["Quechua"],"forms":{"plural":"quechua","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"quechua","accusative-definite-nominative-singular":"quechuaul","accusative-indefinite-nominative-plural":"quechua","accusative-definite-nominative-plural":"quechuai","dative-genitive-indefinite-singular":"quechua","dative-definite-genitive-singular":"quechuaului","dative-genitive-indefinite-plural":"quechua","dative-definite-genitive-plural":"quechualor","singular-vocative":"quechuaule","plural-vocative":"quechualor"}},{"word":"quetzal","pos":"noun","definitions":["quetzal"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"quetzal","accusative-definite-nominative":"quetzalul","dative-genitive-indefinite":"quetzal","dative-definite-genitive":"quetzalului","vocative":"quetzalule"}},{"word":"quidditate","pos":"noun","definitions":["quiddity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"quidditate","accusative-definite-nominative":"quidditatea","dative-genitive-indefinite":"quiddități","dative-definite-genitive":"quiddității","vocative":"-"}},{"word":"quiproquo","pos":"noun","definitions":["misunderstanding"],"forms":{"plural":"quiproquo-uri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"quiproquo","accusative-definite-nominative-singular":"quiproquoul","accusative-indefinite-nominative-plural":"quiproquouri","accusative-definite-nominative-plural":"quiproquourile","dative-genitive-indefinite-singular":"quiproquo","dative-definite-genitive-singular":"quiproquoului","dative-genitive-indefinite-plural":"quiproquouri","dative-definite-genitive-plural":"quiproquourilor","singular-vocative":"quiproquoule","plural-vocative":"quiproquourilor"}},{"word":"quipu","pos":"noun","definitions":["quipu"],"forms":{"plural":"quipu","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"quipu","accusative-definite-nominative-singular":"quipuul","accusative-indefinite-nominative-plural":"quipu","accusative-definite-nominative-plural":"quipule","dative-genitive-indefinite-singular":"quipu","dative-definite-genitive-singular":"quipuului","dative-genitive-indefinite-plural":"quipu","dative-definite-genitive-plural":"quipulor","singular-vocative":"quipuule","plural-vocative":"quipulor"}},{"word":"quisling","pos":"noun","definitions":["quisling"],"forms":{"plural":"quislingi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"quisling","accusative-definite-nominative-singular":"quislingul","accusative-indefinite-nominative-plural":"quislingi","accusative-definite-nominative-plural":"quislingii","dative-genitive-indefinite-singular":"quisling","dative-definite-genitive-singular":"quislingului","dative-genitive-indefinite-plural":"quislingi","dative-definite-genitive-plural":"quislingilor","singular-vocative":"quislingule","plural-vocative":"quislingilor"}},{"word":"quolibet","pos":"noun","definitions":["quip, gibe, taunt"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"quolibet","accusative-definite-nominative":"quolibetul","dative-genitive-indefinite":"quolibet","dative-definite-genitive":"quolibetului","vocative":"quolibetule"}},{"word":"quruch","pos":"noun","definitions":["qurush"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"quruch","accusative-definite-nominative":"quruchul","dative-genitive-indefinite":"quruch","dative-definite-genitive":"quruchului","vocative":"quruchule"}}];